@@ -0,0 +1,241 @@
+(function registerReadingExamChunkIndex(global) {
+  'use strict';
+  global.__READING_EXAM_CHUNKS__ = {
+    "base": "./chunks/",
+    "parts": {
+      "meta": ["schemaVersion", "examId", "meta", "sourceRefs", "audit"],
+      "passage": ["passage"],
+      "questions": ["questionGroups", "questionOrder", "questionDisplayMap"],
+      "answers": ["answerKey"]
+    },
+    "bytes": {
+      "p1-high-01": [1372, 7753, 4610, 499],
+      "p1-low-02": [1254, 6988, 9351, 511],
+      "p3-high-03": [1397, 6429, 8664, 521],
+      "p3-high-04": [1222, 6777, 8472, 511],
+      "p1-high-05": [1280, 6070, 5786, 566],
+      "p2-low-06": [1168, 6070, 6695, 499],
+      "p3-low-07": [1257, 6540, 7339, 535],
+      "p2-low-08": [1464, 6117, 7516, 548],
+      "p2-high-09": [1555, 7084, 7422, 489],
+      "p2-medium-10": [1440, 7315, 5480, 525],
+      "p1-low-11": [1160, 5171, 5382, 538],
+      "p3-low-12": [1411, 6671, 9552, 512],
+      "p1-low-13": [1535, 5323, 5998, 569],
+      "p2-high-14": [1662, 7569, 4802, 552],
+      "p3-high-15": [1314, 6128, 7864, 540],
+      "p2-high-16": [1404, 7402, 4469, 533],
+      "p2-high-17": [1356, 6511, 6257, 502],
+      "p3-medium-18": [1427, 6537, 8677, 501],
+      "p2-high-19": [1438, 6344, 6799, 520],
+      "p1-medium-20": [1691, 5272, 5533, 579],
+      "p2-high-21": [1287, 6191, 6110, 518],
+      "p3-medium-22": [1536, 7351, 5652, 534],
+      "p2-high-23": [1599, 6552, 6039, 528],
+      "p1-high-24": [1187, 5998, 5389, 601],
+      "p2-high-25": [1545, 6573, 7856, 508],
+      "p1-high-27": [1377, 6080, 5342, 588],
+      "p3-low-28": [1299, 8190, 6395, 504],
+      "p1-medium-29": [1495, 6077, 6011, 562],
+      "p1-low-30": [1296, 6018, 5915, 556],
+      "p1-high-31": [1434, 6046, 5645, 551],
+      "p3-high-32": [1428, 6022, 9373, 518],
+      "p1-medium-33": [1416, 5631, 5584, 562],
+      "p1-low-34": [1404, 6113, 5550, 558],
+      "p1-low-35": [1252, 6454, 7337, 515],
+      "p3-low-36": [1696, 6728, 8915, 520],
+      "p2-low-37": [1329, 6090, 6525, 539],
+      "p3-low-38": [1651, 6781, 7892, 498],
+      "p2-low-39": [1305, 6587, 6488, 517],
+      "p1-low-40": [1344, 5561, 5953, 565],
+      "p2-low-41": [1428, 7356, 5683, 509],
+      "p3-low-42": [1486, 6341, 9459, 510],
+      "p3-low-43": [1291, 6734, 8948, 510],
+      "p3-low-44": [1203, 5818, 5357, 582],
+      "p1-low-45": [1755, 5189, 4916, 570],
+      "p1-low-46": [1301, 6077, 5654, 555],
+      "p1-low-47": [1357, 5587, 5755, 556],
+      "p1-low-48": [1247, 6422, 5647, 553],
+      "p2-low-49": [1154, 7691, 6247, 534],
+      "p2-low-50": [1588, 6358, 6610, 523],
+      "p2-low-51": [1824, 6131, 6799, 510],
+      "p1-low-52": [1421, 5966, 5419, 548],
+      "p1-low-53": [1437, 5180, 6049, 556],
+      "p3-low-54": [1284, 6476, 6378, 609],
+      "p3-low-55": [1381, 6593, 7149, 572],
+      "p3-low-56": [1281, 6859, 9953, 517],
+      "p1-medium-57": [1466, 6505, 7281, 537],
+      "p2-medium-58": [1354, 7501, 5100, 518],
+      "p3-low-59": [1306, 6031, 8764, 512],
+      "p1-medium-60": [1338, 6320, 6108, 563],
+      "p1-low-61": [1281, 6665, 6705, 552],
+      "p2-low-62": [1376, 6234, 6785, 501],
+      "p1-medium-63": [1569, 5665, 5276, 560],
+      "p2-low-64": [1509, 5970, 6368, 550],
+      "p2-low-65": [1240, 6691, 6598, 507],
+      "p3-medium-66": [1433, 6130, 6413, 607],
+      "p1-low-67": [1216, 6333, 9241, 507],
+      "p1-low-68": [1268, 5663, 5669, 551],
+      "p1-low-69": [1416, 5289, 5403, 556],
+      "p1-low-70": [1445, 6270, 5563, 559],
+      "p3-low-71": [1288, 6122, 10658, 498],
+      "p1-low-72": [1536, 6465, 5736, 564],
+      "p2-low-73": [1308, 6309, 7070, 512],
+      "p3-low-74": [1263, 6087, 9473, 521],
+      "p2-low-75": [1314, 8135, 4103, 583],
+      "p3-low-76": [1243, 3808, 8740, 535],
+      "p2-low-77": [1272, 5377, 4414, 577],
+      "p3-low-78": [1405, 5854, 9035, 518],
+      "p1-high-79": [1553, 6215, 5491, 544],
+      "p1-low-80": [1311, 5881, 5892, 547],
+      "p1-low-81": [1149, 5482, 5798, 558],
+      "p1-high-82": [1248, 5841, 5723, 564],
+      "p3-low-83": [1366, 6209, 6631, 581],
+      "p1-low-84": [1229, 6507, 5660, 581],
+      "p3-low-85": [1265, 5835, 8008, 513],
+      "p2-medium-86": [1371, 7226, 5408, 513],
+      "p2-low-87": [1442, 8353, 5935, 554],
+      "p3-low-88": [1591, 6535, 7646, 537],
+      "p3-high-89": [1518, 6013, 8944, 521],
+      "p1-high-90": [1339, 6537, 5260, 553],
+      "p2-high-91": [1513, 6573, 7142, 504],
+      "p1-high-92": [1431, 5849, 5986, 569],
+      "p2-medium-93": [1320, 6181, 6329, 524],
+      "p2-low-94": [1457, 6604, 7096, 504],
+      "p3-low-95": [1405, 5979, 9129, 520],
+      "p2-low-96": [1365, 6397, 7895, 553],
+      "p3-low-97": [1283, 8146, 6393, 506],
+      "p3-low-98": [1419, 6539, 8869, 512],
+      "p1-low-99": [1410, 5991, 5605, 569],
+      "p3-low-100": [1139, 6270, 9054, 518],
+      "p1-high-101": [1423, 6984, 5122, 560],
+      "p2-low-102": [1310, 6601, 7364, 526],
+      "p2-low-103": [1484, 7272, 4011, 569],
+      "p2-low-104": [1486, 6223, 7289, 522],
+      "p1-high-105": [1404, 5472, 5450, 557],
+      "p1-low-106": [1453, 5789, 5166, 563],
+      "p1-low-107": [1375, 5237, 5485, 561],
+      "p1-low-108": [1323, 6281, 6317, 507],
+      "p1-low-109": [1312, 5883, 5523, 554],
+      "p1-high-110": [1220, 6726, 7101, 505],
+      "p1-low-111": [1483, 5927, 6446, 565],
+      "p1-low-112": [1339, 5696, 5132, 555],
+      "p1-low-113": [1538, 6434, 5160, 591],
+      "p1-low-114": [1283, 5300, 5079, 569],
+      "p1-medium-115": [1486, 6843, 6243, 564],
+      "p1-low-116": [1364, 6316, 5782, 622],
+      "p1-medium-117": [1360, 5484, 5182, 553],
+      "p1-high-118": [1477, 7818, 4808, 508],
+      "p1-medium-119": [1274, 6267, 5518, 627],
+      "p2-high-120": [1357, 8116, 6665, 516],
+      "p2-medium-121": [1366, 6606, 5073, 512],
+      "p2-low-122": [1268, 6206, 7424, 518],
+      "p2-high-123": [1280, 8155, 4636, 518],
+      "p2-high-124": [1518, 10327, 5193, 528],
+      "p2-low-125": [1379, 6263, 6052, 515],
+      "p2-medium-126": [1382, 5744, 8270, 514],
+      "p1-low-127": [1167, 5959, 5817, 531],
+      "p2-high-128": [1421, 6703, 6325, 529],
+      "p2-medium-129": [1496, 8445, 4292, 502],
+      "p2-high-130": [1711, 8441, 4702, 515],
+      "p2-high-131": [1432, 6700, 7191, 512],
+      "p2-low-132": [1339, 6142, 6832, 552],
+      "p2-high-133": [1318, 6293, 7582, 508],
+      "p2-high-134": [1285, 5436, 5523, 548],
+      "p2-low-135": [1322, 6429, 5311, 526],
+      "p2-high-136": [1510, 6399, 6166, 520],
+      "p2-high-137": [1396, 7687, 5130, 522],
+      "p1-low-138": [1444, 6126, 5629, 555],
+      "p2-high-139": [1543, 6225, 7658, 539],
+      "p2-low-140": [1261, 6589, 7501, 522],
+      "p2-high-141": [1478, 6506, 8406, 490],
+      "p2-low-142": [1306, 6675, 7887, 542],
+      "p2-low-143": [1428, 6860, 7608, 514],
+      "p2-medium-144": [1555, 7776, 6514, 516],
+      "p2-high-145": [1408, 6510, 7034, 516],
+      "p2-medium-146": [1312, 6222, 6855, 536],
+      "p2-low-147": [1378, 6652, 8665, 519],
+      "p2-low-148": [1332, 6189, 7094, 513],
+      "p1-low-149": [1284, 6397, 5568, 580],
+      "p3-high-150": [1811, 6177, 8722, 520],
+      "p3-low-151": [1557, 6320, 10333, 537],
+      "p3-medium-152": [1586, 6271, 8700, 514],
+      "p3-low-153": [1331, 6835, 8688, 513],
+      "p3-medium-154": [1342, 7264, 8774, 517],
+      "p3-medium-155": [1261, 6662, 6223, 502],
+      "p3-high-156": [1381, 5416, 5371, 601],
+      "p3-high-157": [1403, 7973, 5540, 525],
+      "p3-low-158": [1166, 6513, 9907, 518],
+      "p3-high-159": [1336, 7359, 10214, 522],
+      "p1-low-160": [1228, 6218, 5532, 564],
+      "p3-high-161": [1405, 6594, 8111, 602],
+      "p3-medium-162": [10202, 6550, 9578, 548],
+      "p3-low-163": [1395, 7694, 5350, 588],
+      "p3-high-164": [1621, 7008, 6343, 581],
+      "p3-low-165": [1427, 6869, 8706, 513],
+      "p3-low-166": [1283, 6672, 7399, 513],
+      "p3-high-167": [1291, 7681, 5531, 530],
+      "p3-medium-168": [1534, 6689, 8405, 577],
+      "p3-medium-169": [1720, 10184, 6256, 507],
+      "p3-high-170": [1445, 6507, 8335, 515],
+      "p1-high-171": [1383, 5773, 5292, 594],
+      "p3-low-172": [1387, 6424, 7797, 519],
+      "p3-high-173": [1405, 6064, 7953, 513],
+      "p3-high-174": [1498, 6311, 8555, 521],
+      "p3-low-175": [1219, 7182, 5475, 537],
+      "p3-medium-176": [1417, 6280, 7425, 553],
+      "p3-medium-177": [1393, 6108, 7794, 521],
+      "p3-high-178": [1573, 6142, 8677, 519],
+      "p3-medium-179": [10799, 7169, 10261, 525],
+      "p3-high-180": [1421, 6738, 8365, 513],
+      "p3-high-181": [1309, 8517, 6220, 656],
+      "p1-medium-182": [1380, 6529, 6985, 510],
+      "p3-medium-183": [7399, 6232, 6800, 548],
+      "p3-high-184": [9559, 6273, 8822, 520],
+      "p3-medium-185": [9934, 6480, 9184, 544],
+      "p3-low-186": [1398, 5946, 5657, 604],
+      "p3-low-187": [1299, 6129, 5822, 585],
+      "p3-medium-188": [1634, 6728, 8801, 523],
+      "p3-high-189": [1481, 6359, 8241, 561],
+      "p3-low-190": [1398, 6280, 8971, 520],
+      "p3-medium-191": [9846, 6526, 8968, 520],
+      "p3-high-192": [1369, 7102, 9352, 561],
+      "p1-high-200": [518, 5749, 4609, 577],
+      "p1-high-211": [501, 5337, 6124, 576],
+      "p1-high-216": [521, 5534, 5629, 559],
+      "p1-high-194": [536, 6226, 4270, 557],
+      "p2-low-222": [489, 7140, 9680, 508],
+      "p1-low-223": [500, 5732, 6733, 560],
+      "p2-high-201": [520, 5540, 6474, 519],
+      "p2-medium-217": [540, 6210, 6459, 514],
+      "p2-high-192": [530, 6313, 6993, 523],
+      "p2-medium-209": [503, 6844, 6777, 511],
+      "p2-medium-213": [508, 6573, 5141, 546],
+      "p2-low-051": [507, 6799, 11472, 522],
+      "p2-medium-058": [516, 6811, 10566, 522],
+      "p3-high-204": [522, 6111, 9147, 519],
+      "p3-high-206": [558, 6651, 9847, 514],
+      "p3-high-212": [527, 6261, 9709, 520],
+      "p3-high-218": [1005, 7138, 6417, 575],
+      "p3-low-219": [503, 6500, 10120, 489],
+      "p3-low-999": [476, 5584, 11843, 499],
+      "p3-medium-197": [531, 6822, 8682, 515],
+      "p3-low-198": [518, 6076, 8278, 520],
+      "p3-low-078": [527, 8822, 13478, 756],
+      "p1-high-227": [1275, 5443, 5661, 558],
+      "p2-high-225": [1138, 6144, 6233, 527],
+      "p3-high-228": [1135, 5673, 6107, 533],
+      "p1-high-229": [1214, 6053, 5269, 554],
+      "p1-high-230": [1171, 5629, 5401, 545],
+      "p1-high-231": [1243, 5458, 5158, 559],
+      "p2-high-232": [1223, 6453, 5659, 521],
+      "p2-high-233": [1151, 6576, 5587, 528],
+      "p2-high-234": [995, 6561, 6055, 517],
+      "p3-high-221": [1091, 6399, 8197, 514],
+      "p2-high-235": [1134, 6553, 5717, 520],
+      "p2-high-236": [952, 6443, 6158, 509],
+      "p3-high-229": [1102, 6313, 8205, 519],
+      "p2-high-239": [1183, 5843, 6552, 510]
+    }
+  };
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-01", "answers", {"answerKey":{"q1":"viii","q2":"iv","q3":"ix","q4":"vi","q5":"v","q6":"vii","q7":"iii","q8":"x","q9":"D","q10":"E","q11":"B","q12":"G","q13":"A"}});
+})(typeof window !== "undefined" ? window : globalThis);
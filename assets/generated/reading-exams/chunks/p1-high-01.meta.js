@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-01", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-high-01","meta":{"title":"A Brief History of Tea 茶叶简史","category":"P1","frequency":"high","pdfFilename":"1. P1 - A Brief History of Tea 茶叶简史【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/1. P1 - A Brief History of Tea 茶叶简史【高】/","legacyFilename":"1. P1 - A Brief History of Tea 茶叶简史【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/1. P1 - A Brief History of Tea 茶叶简史【高】/1. P1 - A Brief History of Tea 茶叶简史【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/1. P1 - A Brief History of Tea 茶叶简史【高】/1. P1 - A Brief History of Tea 茶叶简史【高】.pdf","ieltsHtml":"IELTS/P1/A Brief History of Tea.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:21.982Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
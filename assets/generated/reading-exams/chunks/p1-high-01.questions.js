@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-01", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-8-anchor-right\">\n<h4>Questions 1–8</h4>\n<p>Reading Passage 1 has eight paragraphs <strong>A–H</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. Not enough tea to meet demand</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. Religious objections</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. In - and sometimes out – of fashion</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. A connection between tea and religion</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. A luxury item</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. News of tea reaches another continent</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. Is tea a good or a bad thing?</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. A chance discovery</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix. Tea-making as a ritual</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"x\">x. Difficulties in importing tea</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 9–13</h4>\n<p>Look at the following statements (Questions 9–13) and the list of countries below.</p>\n<p>Match each statement with the correct country, <strong>A–G</strong>.</p>\n<div class=\"question-item\" id=\"q9-anchor\">\n<div class=\"match-question-item\">\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n<p><strong>9</strong> Claims that tea might be harmful failed to affect its popularity.</p>\n</div>\n</div>\n<div class=\"question-item\" id=\"q10-anchor\">\n<div class=\"match-question-item\">\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n<p><strong>10</strong> Tea lost favour to other drinks.</p>\n</div>\n</div>\n<div class=\"question-item\" id=\"q11-anchor\">\n<div class=\"match-question-item\">\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n<p><strong>11</strong> Special buildings were constructed in which to drink tea.</p>\n</div>\n</div>\n<div class=\"question-item\" id=\"q12-anchor\">\n<div class=\"match-question-item\">\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n<p><strong>12</strong> Animals were involved in importing tea.</p>\n</div>\n</div>\n<div class=\"question-item\" id=\"q13-anchor\">\n<div class=\"match-question-item\">\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n<p><strong>13</strong> A ruler's specialist knowledge led to an interest in tea.</p>\n</div>\n</div>\n<div class=\"options-pool\" id=\"country-options-pool\">\n<strong>List of Countries</strong>\n<div class=\"pool-items\" style=\"flex-direction: column; align-items: flex-start;\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A China</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Japan</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Portugal</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Holland</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E France</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F England</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G Russia</div>\n</div>\n</div>\n</div>","allowOptionReuse":true}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-05", "answers", {"answerKey":{"q1":"FALSE","q2":"NOT GIVEN","q3":"TRUE","q4":"FALSE","q5":"FALSE","q6":"NOT GIVEN","q7":"1906","q8":"Australia","q9":"family","q10":"bankruptcy","q11":"writers","q12":"reputation","q13":"husband"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-05", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-high-05","meta":{"title":"Katherine Mansfield 新西兰作家","category":"P1","frequency":"high","pdfFilename":"102. P1 - Katherine Mansfield 新西兰作家.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/102. P1 - Katherine Mansfield 新西兰作家【高】/","legacyFilename":"102. P1 - Katherine Mansfield 新西兰作家【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/102. P1 - Katherine Mansfield 新西兰作家【高】/102. P1 - Katherine Mansfield 新西兰作家【高】.html","shuiPdf":"ReadingPractice/PDF/102. P1 - Katherine Mansfield 新西兰作家.pdf","ieltsHtml":"IELTS/P1/Katherine Mansfield.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.515Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
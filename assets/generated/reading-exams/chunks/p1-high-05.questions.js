@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-05", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 1–6</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 1–6 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\" id=\"q1-anchor\">\n<p>1. The name Katherine Mansfield, which appears on the writer’s books, was exactly the same as her original name.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q2-anchor\">\n<p>2. Mansfield won a prize for a story she wrote for the High School Reporter.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q3-anchor\">\n<p>3. How Pearl Button Was Kidnapped portrayed Maori people in a favourable way.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q4-anchor\">\n<p>4. When Mansfield was at Queen’s College, she planned to be a professional writer.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q5-anchor\">\n<p>5. Mansfield was unpopular with the other students at Queen’s College.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q6-anchor\">\n<p>6. In London, Mansfield showed little interest in politics.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"short_answer","questionIds":["q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 7–13</h4>\n<p>Complete the notes below</p>\n<p>Choose <strong>ONE WORD AND/OR A NUMBER</strong> from the passage for each answer</p>\n<p>Write your answers in boxes 7–13 on your answer sheet</p>\n<div class=\"notes-section\">\n<h4 style=\"text-align: center; margin-bottom: 20px;\">Katherine Mansfield’s adult years</h4>\n<p class=\"bullet-point\">• <input name=\"q7\" class=\"blank\" data-answer=\"1906\" style=\"width: 80px; text-align: center;\"><br>– moved from England back to New Zealand</p>\n<p class=\"bullet-point\" style=\"margin-left: 20px;\">– first paid writing work was in a publication based in 8 <input name=\"q8\" class=\"blank\" data-answer=\"Australia\"></p>\n<p class=\"bullet-point\" style=\"margin-left: 20px;\">– her 9 <input name=\"q9\" class=\"blank\" data-answer=\"family\"> and the New Zealand way of life made her feel dissatisfied</p>\n<p class=\"bullet-point\">• 1908<br>– returned to London</p>\n<p class=\"bullet-point\">• 1911–1919<br>– Met John Middleton Murry in 1911</p>\n<p class=\"bullet-point\" style=\"margin-left: 20px;\">– 10 <input name=\"q10\" class=\"blank\" data-answer=\"bankruptcy\"> prevented Mansfield and Murry from staying together in Paris</p>\n<p class=\"bullet-point\" style=\"margin-left: 20px;\">– spent time with distinguished 11 <input name=\"q11\" class=\"blank\" data-answer=\"writers\"></p>\n<p class=\"bullet-point\" style=\"margin-left: 20px;\">– from 1916, tuberculosis restricted the time she spent in London</p>\n<p class=\"bullet-point\">• 1920<br>– her 12 <input name=\"q12\" class=\"blank\" data-answer=\"reputation\"> was consolidated when <em>Bliss and Other Stories</em> was published</p>\n<p class=\"bullet-point\" style=\"margin-left: 20px;\">– wrote several stories at “Villa Isola Bella”</p>\n<p class=\"bullet-point\">• 1923–1924<br>– Mansfield’s 13 <input name=\"q13\" class=\"blank\" data-answer=\"husband\"> published more of her works after her death</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
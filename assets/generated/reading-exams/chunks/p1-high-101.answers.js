@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-101", "answers", {"answerKey":{"q1":"FALSE","q2":"FALSE","q3":"NOT GIVEN","q4":"TRUE","q5":"TRUE","q6":"flower","q7":"prejudice","q8":"reverse","q9":"meat","q10":"crops","q11":"soil","q12":"cultivation","q13":"investment"}});
+})(typeof window !== "undefined" ? window : globalThis);
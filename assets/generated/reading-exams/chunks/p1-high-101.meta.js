@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-101", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-high-101","meta":{"title":"The Impact of the Potato 土豆的影响","category":"P1","frequency":"high","pdfFilename":"19. P1 - The Impact of the Potato 土豆的影响【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/19. P1 - The Impact of the Potato 土豆的影响【高】/","legacyFilename":"19. P1 - The Impact of the Potato 土豆的影响【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/19. P1 - The Impact of the Potato 土豆的影响【高】/19. P1 - The Impact of the Potato 土豆的影响【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/19. P1 - The Impact of the Potato 土豆的影响【高】/19. P1 - The Impact of the Potato 土豆的影响【高】.pdf","ieltsHtml":"IELTS/P1/The Impact of the Potato.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.680Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-101", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 1–5</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 1?</p>\n<p>\n<strong>TRUE</strong> if the statement agrees with the information<br>\n<strong>FALSE</strong> if the statement contradicts the information<br>\n<strong>NOT GIVEN</strong> if there is no information on this\n</p>\n<div class=\"question-item\">\n<p><strong>1</strong> Early Spanish chroniclers called the potato by the Incan name ‘chuño’.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q1\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q1\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q1\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> The purpose of the Spanish coming to Peru was to find potatoes.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q2\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q2\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q2\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> The Spanish believed that the potato had the same nutrients as other vegetables.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q3\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q3\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q3\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> Peasants at that time did not like to eat potatoes because they were ugly.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q4\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q4\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q4\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> The popularity of potatoes in the UK was due to food shortages during the war.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q5\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q5\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q5\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"short_answer","questionIds":["q6","q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-10-11-12-13-anchor\">\n<h4>Questions 6–13</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"question-item\">\n<p><strong>6</strong> In France, people began to overcome their disgust towards potatoes because the King put a potato <input name=\"q6\" class=\"blank\" id=\"q6_input\"> in his buttonhole.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>7</strong> Frederick realised the potential of the potato, but he had to handle the <input name=\"q7\" class=\"blank\" id=\"q7_input\"> from ordinary people.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>8</strong> The King of Prussia adopted a form of <input name=\"q8\" class=\"blank\" id=\"q8_input\"> psychology to make people accept potatoes.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>9</strong> Before 1800, English people preferred eating <input name=\"q9\" class=\"blank\" id=\"q9_input\"> with bread, butter and cheese.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>10</strong> The obvious way to deal with England's food problems was high-yielding potato <input name=\"q10\" class=\"blank\" id=\"q10_input\">.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>11</strong> The Irish <input name=\"q11\" class=\"blank\" id=\"q11_input\"> and climate suited potatoes well.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>12</strong> Between 1780 and 1841, thanks to the <input name=\"q12\" class=\"blank\" id=\"q12_input\"> of the potato, the Irish population doubled to eight million.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>13</strong> The potato's high yields helped the poorest farmers to produce more healthy food almost without <input name=\"q13\" class=\"blank\" id=\"q13_input\">.</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-105", "answers", {"answerKey":{"q1":"NOT GIVEN","q2":"FALSE","q3":"TRUE","q4":"TRUE","q5":"FALSE","q6":"NOT GIVEN","q7":"FALSE","q8":"29 centimetres","q9":"rocks","q10":"bill","q11":"day","q12":"plovers","q13":"poison"}});
+})(typeof window !== "undefined" ? window : globalThis);
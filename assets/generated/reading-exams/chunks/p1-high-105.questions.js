@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-105", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 1–7</h4>\n<p>Do the following statements agree with the information in Reading Passage 1?</p>\n<p>In boxes 1–7 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> Early European settlers made detailed studies of the morepork.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> The Polynesian rat had a negative effect on the number of laughing owls.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> The laughing owl was larger than the morepork.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> Rats pose a risk to young moreporks.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> The New Zealand Department of Conservation is hoping to limit the population of moreporks.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> Other bird species are frightened away when they hear the morepork's cry.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>7</strong> In Māori tradition, the low call of the morepork had negative associations.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Questions 8–13</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>The Morepork</h4>\n<ul>\n<li>\n<strong>Appearance</strong>\n<ul>\n<li>approximately <strong>8</strong> <input type=\"text\" id=\"q8_input\" name=\"q8\"> in length</li>\n<li>feathers with fringes to enable quiet flight</li>\n</ul>\n</li>\n<li>\n<strong>Nesting</strong>\n<ul>\n<li>nests in trees, plants or spaces in roots and <strong>9</strong> <input type=\"text\" id=\"q9_input\" name=\"q9\">\n</li>\n<li>after about 35 days, baby moreporks are capable of leaving the nest</li>\n</ul>\n</li>\n<li>\n<strong>Hunting</strong>\n<ul>\n<li>transports its prey using its <strong>10</strong> <input type=\"text\" id=\"q10_input\" name=\"q10\"></li>\n<li>can be chased away by other birds during the <strong>11</strong> <input type=\"text\" id=\"q11_input\" name=\"q11\">\n</li>\n<li>attacked <strong>12</strong> <input type=\"text\" id=\"q12_input\" name=\"q12\"> that had been introduced to Motuora Island</li>\n</ul>\n</li>\n<li>\n<strong>Threats</strong>\n<ul>\n<li>may be exposed to <strong>13</strong> <input type=\"text\" id=\"q13_input\" name=\"q13\"> in their prey</li>\n</ul>\n</li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
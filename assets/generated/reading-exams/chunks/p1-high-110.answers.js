@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-110", "answers", {"answerKey":{"q1":"C","q2":"D","q3":"A","q4":"B","q5":"J","q6":"K","q7":"C","q8":"F","q9":"D","q10":"G","q11":"TRUE","q12":"FALSE","q13":"NOT GIVEN"}});
+})(typeof window !== "undefined" ? window : globalThis);
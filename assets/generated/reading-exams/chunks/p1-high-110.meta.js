@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-110", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-high-110","meta":{"title":"The Pearls 珍珠","category":"P1","frequency":"high","pdfFilename":"24. P1 - The Pearls 珍珠【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/24. P1 - The Pearls 珍珠【高】/","legacyFilename":"24. P1 - The Pearls 珍珠【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/24. P1 - The Pearls 珍珠【高】/24. P1 - The Pearls 珍珠【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/24. P1 - The Pearls 珍珠【高】/24. P1 - The Pearls 珍珠【高】.pdf","ieltsHtml":"IELTS/P1/The Pearls.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.230Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-110", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 1–4</h4>\n<p>Reading Passage 1 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>1</strong> difficulties in the cultivation process</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>2</strong> causes affecting the size of natural pearls</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>3</strong> ancient customs around pearls</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>4</strong> distinctions between cultured pearls and natural ones</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q5","q6","q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-9-10-anchor\">\n<h4>Questions 5–10</h4>\n<p>Complete the summary using the list of words, <strong>A–K</strong>, below.</p>\n<div class=\"summary-completion\">\n<p>\nThroughout history, people in <span id=\"q5-target\" class=\"drop-target-summary\" data-question=\"q5\"></span> used pearls for medicine and philtres. There are essentially three types of pearls: natural, cultured and imitation. Natural and cultured pearls share a similar growing process, while imitation pearls are different. And <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> owns the reputation for its imitation pearl industry. The country <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> usually produces the larger pearls due to the favourable environment along the coastline, while the nation of <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> manufactures some of the most glistening cultured pearls. In the past, the country <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span> in the Persian Gulf produced the world's best pearls. At present, the major remaining suppliers of natural pearls are in <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span>.\n</p>\n</div>\n<div class=\"options-pool\">\n<div class=\"pool-items\" id=\"word-pool\">\n<div class=\"drag-item\" id=\"word-A\" draggable=\"true\" data-word=\"A\">A America</div>\n<div class=\"drag-item\" id=\"word-B\" draggable=\"true\" data-word=\"B\">B Philippines</div>\n<div class=\"drag-item\" id=\"word-C\" draggable=\"true\" data-word=\"C\">C Australia</div>\n<div class=\"drag-item\" id=\"word-D\" draggable=\"true\" data-word=\"D\">D Bahrain</div>\n<div class=\"drag-item\" id=\"word-E\" draggable=\"true\" data-word=\"E\">E China</div>\n<div class=\"drag-item\" id=\"word-F\" draggable=\"true\" data-word=\"F\">F Japan</div>\n<div class=\"drag-item\" id=\"word-G\" draggable=\"true\" data-word=\"G\">G India</div>\n<div class=\"drag-item\" id=\"word-H\" draggable=\"true\" data-word=\"H\">H Egypt</div>\n<div class=\"drag-item\" id=\"word-I\" draggable=\"true\" data-word=\"I\">I Myanmar</div>\n<div class=\"drag-item\" id=\"word-J\" draggable=\"true\" data-word=\"J\">J Persia</div>\n<div class=\"drag-item\" id=\"word-K\" draggable=\"true\" data-word=\"K\">K Mallorca</div>\n</div>\n</div>\n</div>","allowOptionReuse":false},{"groupId":"group-3","kind":"true_false_not_given","questionIds":["q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 11–13</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<div class=\"tfng-item\">\n<p><strong>11</strong> A cultured pearl's centre is often significantly larger than that in a natural pearl.</p>\n<div class=\"tfng-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q11\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"tfng-item\">\n<p><strong>12</strong> Imitation pearls are usually the same price as natural ones.</p>\n<div class=\"tfng-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q12\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"tfng-item\">\n<p><strong>13</strong> Akoya pearls from Japan glow more deeply than South Sea pearls from Australia.</p>\n<div class=\"tfng-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q13\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
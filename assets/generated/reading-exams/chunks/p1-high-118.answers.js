@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-118", "answers", {"answerKey":{"q1":"v","q2":"i","q3":"vi","q4":"x","q5":"ix","q6":"iv","q7":"ii","q8":"TRUE","q9":"TRUE","q10":"NOT GIVEN","q11":"C","q12":"D","q13":"E"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-118", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-high-118","meta":{"title":"William Gilbert and Magnetism 电磁学之父","category":"P1","frequency":"high","pdfFilename":"31. P1 - William Gilbert and Magnetism 电磁学之父【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/31. P1 - William Gilbert and Magnetism 电磁学之父【高】/","legacyFilename":"31. P1 - William Gilbert and Magnetism 电磁学之父【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/31. P1 - William Gilbert and Magnetism 电磁学之父【高】/31. P1 - William Gilbert and Magnetism 电磁学之父【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/31. P1 - William Gilbert and Magnetism 电磁学之父【高】/31. P1 - William Gilbert and Magnetism 电磁学之父【高】.pdf","ieltsHtml":"IELTS/P1/William Gilbert and Magnetism.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.248Z","notes":"signature:radio,checkbox,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
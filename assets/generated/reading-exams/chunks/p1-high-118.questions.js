@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-118", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 1–7</h4>\n<p>Reading Passage 1 has seven paragraphs <strong>A–G</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. Early years of Gilbert</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. What was new about his scientific research method</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. The development of chemistry</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. Questioning traditional astronomy</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. Pioneers of early science</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. Professional and social recognition</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. Becoming the president of the Royal Society</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. The great works of Gilbert</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix. His discovery about magnetism</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"x\">x. His change of focus</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"true_false_not_given","questionIds":["q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-anchor\">\n<h4>Questions 8–10</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<div class=\"question-item\">\n<p><strong>8</strong> Gilbert is less famous than he should be.</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q8\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q8\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q8\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>9</strong> Gilbert was famous as a doctor before he was employed by the Queen.</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q9\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q9\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q9\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>10</strong> Gilbert lost faith in the medical theories of his time.</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q10\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q10\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q10\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"multi_choice","questionIds":["q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 11–13</h4>\n<p>Choose <strong>THREE</strong> letters, <strong>A–F</strong>.</p>\n<p>Which <strong>THREE</strong> of the following are parts of Gilbert's discovery?</p>\n<div class=\"question-item\">\n<div class=\"options\">\n<label><input type=\"checkbox\" name=\"q11-12-13\" value=\"A\"> A. Metal can be transformed into another.</label> <label><input type=\"checkbox\" name=\"q11-12-13\" value=\"B\"> B. Garlic can remove magnetism.</label> <label><input type=\"checkbox\" name=\"q11-12-13\" value=\"C\"> C. Metals can be magnetised.</label> <label><input type=\"checkbox\" name=\"q11-12-13\" value=\"D\"> D. Stars are at different distances from the Earth.</label> <label><input type=\"checkbox\" name=\"q11-12-13\" value=\"E\"> E. The Earth wobbles on its axis.</label> <label><input type=\"checkbox\" name=\"q11-12-13\" value=\"F\"> F. There are two charges of electricity.</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-171", "answers", {"answerKey":{"q1":"FALSE","q2":"TRUE","q3":"FALSE","q4":"TRUE","q5":"FALSE","q6":"NOT GIVEN","q7":"Roman army","q8":"formal gardens","q9":"mosaic floors","q10":"wall","q11":"93","q12":["ring","gold ring"],"q13":["museum","modern museum"]}});
+})(typeof window !== "undefined" ? window : globalThis);
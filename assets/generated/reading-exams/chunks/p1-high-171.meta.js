@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-171", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-high-171","meta":{"title":"Fishbourne Roman Palace 罗马宫殿","category":"P1","frequency":"high","pdfFilename":"8. P1 - Fishbourne Roman Palace 罗马宫殿【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/8. P1 - Fishbourne Roman Palace 罗马宫殿【高】/","legacyFilename":"8. P1 - Fishbourne Roman Palace 罗马宫殿【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/8. P1 - Fishbourne Roman Palace 罗马宫殿【高】/8. P1 - Fishbourne Roman Palace 罗马宫殿【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/8. P1 - Fishbourne Roman Palace 罗马宫殿【高】/8. P1 - Fishbourne Roman Palace 罗马宫殿【高】.pdf","ieltsHtml":"IELTS/P1/Fishbourne Roman Palace.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.797Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-171", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 1–6</h4>\n<p>Do the following statements agree with the information in Reading Passage 1?</p>\n<p>In boxes 1–6 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information about this</li>\n</ul>\n<div class=\"question-item\" id=\"q1-anchor\">\n<p>1. Fishbourne Palace was the first structure to be built on its site.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q2-anchor\">\n<p>2. Fishbourne Palace was renovated more than once.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q3-anchor\">\n<p>3. Fishbourne Palace was large in comparison with Roman palaces in Italy.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q4-anchor\">\n<p>4. Research is continuing in the area close to Fishbourne Palace.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q5-anchor\">\n<p>5. Researchers agree on the identity of the person for whom Fishbourne Palace was constructed.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q6-anchor\">\n<p>6. Fishbourne Palace was burnt down by local people.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"short_answer","questionIds":["q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 7–13</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"notes-section\">\n<h4 style=\"text-align: center; margin-bottom: 20px;\">Fishbourne Palace</h4>\n<h5>Construction</h5>\n<p class=\"bullet-point\">• The first buildings on the site contained food for the 7 <input name=\"q7\" class=\"blank\" data-question-id=\"q7\"></p>\n<p class=\"bullet-point\">• The palace building surrounded 8 <input name=\"q8\" class=\"blank\" data-question-id=\"q8\"></p>\n<p class=\"bullet-point\">• In the 2nd and 3rd centuries colour was added to the 9 <input name=\"q9\" class=\"blank\" data-question-id=\"q9\"> of the palace.</p>\n<h5>Discovery</h5>\n<p class=\"bullet-point\">• The first part of the palace to be found was part of a 10 <input name=\"q10\" class=\"blank\" data-question-id=\"q10\"></p>\n<h5>Possible inhabitants</h5>\n<p class=\"bullet-point\">• Cogidubnus - he is named in several writings.</p>\n<p class=\"bullet-point\">• Sallustius Lucullus - he may have lived there until approximately 11 <input name=\"q11\" class=\"blank\" data-question-id=\"q11\" style=\"width: 80px;\"> AD.</p>\n<p class=\"bullet-point\">• Verica - a British king.</p>\n<p class=\"bullet-point\">• Catuarus - his 12 <input name=\"q12\" class=\"blank\" data-question-id=\"q12\"> was found there.</p>\n<h5>Present Day</h5>\n<p class=\"bullet-point\">• A 13 <input name=\"q13\" class=\"blank\" data-question-id=\"q13\"> has been built on the site to help protect it.</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-194", "answers", {"answerKey":{"q1":"false","q2":"true","q3":"true","q4":"false","q5":"not given","q6":"weavers","q7":"exports","q8":"towns","q9":"cotton","q10":"destruction","q11":"coal","q12":"tweeds","q13":"carpets"}});
+})(typeof window !== "undefined" ? window : globalThis);
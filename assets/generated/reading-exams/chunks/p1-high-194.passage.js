@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-194", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"text","bodyHtml":"<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>The history of the British wool industry</h3>\n<p>Wool is part of Britain's history and heritage, more so than any other commodity ever produced in that country. It was made into cloth there in the Bronze Age, which began about 1900 BC. By the time the Romans invaded in 55 BC the Britons had developed a wool industry, and this was encouraged by their new masters. Roman emperors appreciated the fineness of British woollen cloth. Although Saxon invasions in the fifth century nearly destroyed the industry, it is known that in the eighth century Britain was exporting woollen fabrics to continental Europe, and after the arrival of the Norman conquerors in 1066 the industry expanded. By the twelfth century, wool was becoming England's greatest national asset. Cloth making was widespread, particularly in the large towns of southern and eastern England, nearest to France. But the greatest wealth came from exports of raw wool.</p>\n<p>Kings and their ministers welcomed the revenue that resulted from exports and export taxes – and also the power it gave to the king, who could grant or withdraw permits for the wool towns and for the industry. Trade associations, known as 'guilds', were founded to guarantee good work by experienced weavers (people who produce cloth from woollen threads), and were powerful for hundreds of years. The peak of cloth production was reached in the thirteenth century. Then the wool trade declined for a long period because of political conflict.</p>\n<p>In 1331, King Edward III encouraged master weavers from Flanders (an area of present-day Belgium) to settle in England. These Flemish weavers and their descendants were to play a part in the final development of English cloth. The export trade in raw wool recovered and the first half of the fourteenth century was a time of prosperity for English wool farmers. But it was overshadowed by a long war with France (export taxes on wool were one of the principal means of financing the war) and by bubonic plague (the Black Death), which in 1349 caused devastation: in many villages as much as three-quarters of the population died. This led to an increase of the sheep flocks, for there were not enough people left to cultivate the land for arable crops.</p>\n<p>Despite setbacks, raw wool exporting expanded, and so also did manufacturing of wool fabrics. This was becoming both specialised and localised. The area of England known as the West Country had three advantages – extensive sheep pastures, a supply of soft water for washing, scouring and dyeing wool, and water-power to drive machinery. Similarly, the hills of Yorkshire and Lancashire in the north of England had soft water and fast running streams. Water from the latter could be used to drive mills for 'fulling', a shrinking process which makes the fabric firmer and its surface more compact.</p>\n<p>In East Anglia there was soft water, but no hills or fast-running streams to provide power for fulling mills. Instead, East Anglia used the long, fine wool from its native sheep breeds to produce a cloth which did not require the fulling process. This was the type of cloth which is now called 'worsted', after the village of Worstead. For four hundred years East Anglia dominated the worsted trade, with skills inherited from the Flemish settlers of 1331.</p>\n<p>English cloth quickly achieved an international reputation. From being primarily a raw wool exporter, the country became in the fourteenth and fifteenth centuries a manufacturer and exporter of cloth. At the end of the fifteenth century, it was said that England was largely a nation of sheep farmers and cloth manufacturers. The next two centuries saw continued expansion of the industry despite conflicts at home and abroad. In the sixteenth century, French weavers, persecuted for their Protestant religion, sought refuge in England and took their skills with them. England began to surpass Flanders in woollen manufacture; by the end of the seventeenth century it comprised two-thirds of the value of its exports. Radical changes lay ahead, in the geographical location of the industry, in labour use and in manufacturing processes. By 1770, output of worsted from Yorkshire equalled that of East Anglia, and its cloth manufacturing district began to take shape with the expansion of major towns: Leeds, Bradford, Halifax, Huddersfield, and Wakefield.</p>\n<p>The Industrial Revolution of 1750–1850 also brought change. It led the way for new inventions stemming from the Lancashire cotton industry, to mechanize and speed dramatically the processes of spinning and weaving. Manufacturing methods, unchanged since the revival of the trade in the fourteenth century, were now superseded. Mechanization had been opposed in the past and it was again. The widespread unrest of 1812 led to the destruction of equipment by bands of rioters, who feared they would lose employment. But machinery won the day.</p>\n<p>Over the course of the nineteenth century, the older industries in areas such as East Anglia, where opposition had been most bitter, permanently declined. They were overtaken by Yorkshire, where machinery was more readily accepted. The younger industry jumped ahead and never lost its lead, supported by abundant supplies of inexpensive coal to generate steam and, later, electrical power. Other specialised types of manufacturing developed in Scotland, famed for its tweeds (a range of coloured woollen cloth with characteristic designs), and in the West Country, which focused on the production of high-quality, woven carpets.</p>\n<p>&nbsp;</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-194", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\">\n<a id=\"q1-anchor\"></a>\n<h4>Questions 1–5</h4>\n<p>Do the following statements agree with the information in Reading Passage 1?</p>\n<div class=\"q-block\"><p><strong>1</strong> The process of making cloth from wool was introduced to Britain by the Romans.</p><div class=\"options\"><label><input type=\"radio\" name=\"q1\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q1\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q1\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>2</strong> In the twelfth century, exporting woollen cloth was less profitable than exporting raw wool.</p><div class=\"options\"><label><input type=\"radio\" name=\"q2\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q2\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q2\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>3</strong> Rulers had a financial interest in the success of the wool industry.</p><div class=\"options\"><label><input type=\"radio\" name=\"q3\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q3\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q3\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>4</strong> An outbreak of bubonic plague led to a sharp fall in sheep numbers.</p><div class=\"options\"><label><input type=\"radio\" name=\"q4\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q4\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q4\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>5</strong> Worsted cloth was cheaper to produce than other types of woollen fabric.</p><div class=\"options\"><label><input type=\"radio\" name=\"q5\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q5\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q5\" value=\"not given\"> NOT GIVEN</label></div></div>\n</div>"},{"groupId":"group-2","kind":"short_answer","questionIds":["q6","q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\">\n<a id=\"q6-anchor\"></a>\n<h4>Questions 6–13</h4>\n<p>Complete the notes below. Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<h5>Woollen cloth manufacture</h5>\n<p><strong>Growing importance of the cloth industry:</strong></p>\n<ul>\n<li>16th century: skilled <strong>6</strong> <input class=\"blank\" name=\"q6\"> emigrated to England</li>\n<li>end 17th century: majority of English <strong>7</strong> <input class=\"blank\" name=\"q7\"> were wool products</li>\n<li>18th century: production of worsted cloth increased in Yorkshire – growth of five key manufacturing <strong>8</strong> <input class=\"blank\" name=\"q8\"></li>\n<li>1750–1850: new machinery was developed – initially for the production of <strong>9</strong> <input class=\"blank\" name=\"q9\"></li>\n<li>1812: protests resulted in the <strong>10</strong> <input class=\"blank\" name=\"q10\"> of machinery</li>\n<li>19th century: in Yorkshire mechanisation increased, aided by the availability of cheap <strong>11</strong> <input class=\"blank\" name=\"q11\"></li>\n</ul>\n<p><strong>Growth of specialisation:</strong></p>\n<ul>\n<li>Scotland – specialised in <strong>12</strong> <input class=\"blank\" name=\"q12\"></li>\n<li>West Country – specialised in <strong>13</strong> <input class=\"blank\" name=\"q13\"></li>\n</ul>\n</div>"}],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"},"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"]});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-200", "answers", {"answerKey":{"q1":"not given","q2":"false","q3":"not given","q4":"true","q5":"false","q6":"not given","q7":"true","q8":"computers","q9":"space","q10":"dentures","q11":"toothpaste","q12":"toothbrushes","q13":"mouthguards"}});
+})(typeof window !== "undefined" ? window : globalThis);
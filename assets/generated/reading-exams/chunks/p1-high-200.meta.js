@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-200", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-high-200","meta":{"title":"Australia’s Airborne Dentists 澳洲飞行牙医","category":"P1","frequency":"high"}});
+})(typeof window !== "undefined" ? window : globalThis);
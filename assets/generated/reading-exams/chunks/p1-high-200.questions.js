@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-200", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\">\n<a id=\"q1-anchor\"></a>\n<h4>Questions 1–7</h4>\n<p>Do the following statements agree with the information in Reading Passage 1?</p>\n<div class=\"q-block\"><p><strong>1</strong> Many of the RFDS doctors work as volunteers.</p><div class=\"options\"><label><input type=\"radio\" name=\"q1\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q1\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q1\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>2</strong> RFDS dentists make trips to outback communities each month.</p><div class=\"options\"><label><input type=\"radio\" name=\"q2\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q2\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q2\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>3</strong> RFDS dentists are accompanied on their journeys to remote areas by a dental nurse.</p><div class=\"options\"><label><input type=\"radio\" name=\"q3\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q3\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q3\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>4</strong> RFDS dentists must provide a wide range of dental services.</p><div class=\"options\"><label><input type=\"radio\" name=\"q4\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q4\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q4\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>5</strong> Rural dental patients are more informed about oral hygiene than urban patients.</p><div class=\"options\"><label><input type=\"radio\" name=\"q5\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q5\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q5\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>6</strong> RFDS dentists educate patients about good eating habits.</p><div class=\"options\"><label><input type=\"radio\" name=\"q6\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q6\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q6\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>7</strong> Urban Australians generally have better teeth because their water is treated.</p><div class=\"options\"><label><input type=\"radio\" name=\"q7\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q7\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q7\" value=\"not given\"> NOT GIVEN</label></div></div>\n</div>"},{"groupId":"group-2","kind":"short_answer","questionIds":["q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\">\n<a id=\"q8-anchor\"></a>\n<h4>Questions 8–13</h4>\n<p>Complete the notes below. Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<h5>Challenges faced by RFDS dentists</h5>\n<ul>\n<li>need to bring equipment including <strong>8</strong> <input class=\"blank\" name=\"q8\"> for records</li>\n<li>aircraft used to carry equipment have restricted <strong>9</strong> <input class=\"blank\" name=\"q9\"></li>\n<li>problems offering some services, e.g. fitting <strong>10</strong> <input class=\"blank\" name=\"q10\"></li>\n<li>people in remote areas are more likely to have infection in their mouth</li>\n</ul>\n<h5>Products supplied by RFDS dentists</h5>\n<p>If necessary RFDS provides:</p>\n<ul>\n<li><strong>11</strong> <input class=\"blank\" name=\"q11\"> and <strong>12</strong> <input class=\"blank\" name=\"q12\"> for regular use</li>\n<li><strong>13</strong> <input class=\"blank\" name=\"q13\"> to limit dental accidents on the sports field</li>\n</ul>\n</div>"}],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"},"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"]});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-211", "answers", {"answerKey":{"q1":"true","q2":"true","q3":"false","q4":"not given","q5":"police","q6":"european","q7":"radiocarbon dating","q8":"sample","q9":"296","q10":"race","q11":"archaeologists","q12":"australia","q13":"shipwreck"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-211", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-high-211","meta":{"title":"Ahead of its time 新西兰头骨","category":"P1","frequency":"high"}});
+})(typeof window !== "undefined" ? window : globalThis);
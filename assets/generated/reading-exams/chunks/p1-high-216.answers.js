@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-216", "answers", {"answerKey":{"q1":"beetle","q2":"roots","q3":"expensive","q4":"gardeners","q5":"moth","q6":"hawaii","q7":"failure","q8":"false","q9":"not given","q10":"true","q11":"not given","q12":"false","q13":"true"}});
+})(typeof window !== "undefined" ? window : globalThis);
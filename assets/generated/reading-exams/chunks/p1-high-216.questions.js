@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-216", "questions", {"questionGroups":[{"groupId":"group-1","kind":"sentence_completion","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 1–7</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<h3>Pest control</h3>\n<h5>Early 20th-century problems in Australia</h5>\n<ul class=\"notes-list\">\n<li>The larvae of a type of <a id=\"q1-anchor\"></a><b>1</b> <input class=\"blank\" type=\"text\" name=\"q1\"> were a serious pest in sugar cane fields.</li>\n<li>Its larvae ate the <a id=\"q2-anchor\"></a><b>2</b> <input class=\"blank\" type=\"text\" name=\"q2\"> of the plant.</li>\n<li>Chemical pesticides were unsatisfactory because they were:\n<ul>\n<li>– poisonous</li>\n<li>– <a id=\"q3-anchor\"></a><b>3</b> <input class=\"blank\" type=\"text\" name=\"q3\"></li>\n<li>– difficult to remove from the ground</li>\n</ul>\n</li>\n</ul>\n<h5>Experiences with biological pest control</h5>\n<ul class=\"notes-list\">\n<li>The use of insects, plants and birds was widespread.</li>\n<li>In the 19th century French <a id=\"q4-anchor\"></a><b>4</b> <input class=\"blank\" type=\"text\" name=\"q4\"> used toads.</li>\n<li>In Australia a <a id=\"q5-anchor\"></a><b>5</b> <input class=\"blank\" type=\"text\" name=\"q5\"> stopped the spread of prickly-pear cactus.</li>\n<li>Cane toads were brought to Australia from <a id=\"q6-anchor\"></a><b>6</b> <input class=\"blank\" type=\"text\" name=\"q6\">.</li>\n<li>Cane toads proved to be a <a id=\"q7-anchor\"></a><b>7</b> <input class=\"blank\" type=\"text\" name=\"q7\"> as pest control.</li>\n</ul>\n</div>"},{"groupId":"group-2","kind":"true_false_not_given","questionIds":["q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 8–13</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p><em>In boxes 8–13 on your answer sheet, write</em></p>\n<ul style=\"list-style:none; padding-left:0; font-weight:bold; font-size:0.9em;\">\n<li>TRUE <span style=\"font-weight:normal; margin-left:45px;\">if the statement agrees with the information</span></li>\n<li>FALSE <span style=\"font-weight:normal; margin-left:38px;\">if the statement contradicts the information</span></li>\n<li>NOT GIVEN <span style=\"font-weight:normal; margin-left:8px;\">if there is no information on this</span></li>\n</ul>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q8-anchor\"></a><b>8</b> The outcome of the introduction of cane toads was immediately obvious.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q8\" value=\"true\"> True</label> <label><input type=\"radio\" name=\"q8\" value=\"false\"> False</label> <label><input type=\"radio\" name=\"q8\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q9-anchor\"></a><b>9</b> Rabbits were introduced to Australia to control weeds.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q9\" value=\"true\"> True</label> <label><input type=\"radio\" name=\"q9\" value=\"false\"> False</label> <label><input type=\"radio\" name=\"q9\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q10-anchor\"></a><b>10</b> Walter Froggatt was criticised for his efforts to stop the introduction of the cane toad to Australia.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q10\" value=\"true\"> True</label> <label><input type=\"radio\" name=\"q10\" value=\"false\"> False</label> <label><input type=\"radio\" name=\"q10\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q11-anchor\"></a><b>11</b> The average size of cane toads has increased since their introduction.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q11\" value=\"true\"> True</label> <label><input type=\"radio\" name=\"q11\" value=\"false\"> False</label> <label><input type=\"radio\" name=\"q11\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q12-anchor\"></a><b>12</b> Australian animals can eat cane toads safely.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q12\" value=\"true\"> True</label> <label><input type=\"radio\" name=\"q12\" value=\"false\"> False</label> <label><input type=\"radio\" name=\"q12\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q13-anchor\"></a><b>13</b> In many places cane toads are gaining control of the habitats of Australian fauna.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q13\" value=\"true\"> True</label> <label><input type=\"radio\" name=\"q13\" value=\"false\"> False</label> <label><input type=\"radio\" name=\"q13\" value=\"not given\"> NG</label>\n</div>\n</div>\n</div>"}],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"},"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"]});
+})(typeof window !== "undefined" ? window : globalThis);
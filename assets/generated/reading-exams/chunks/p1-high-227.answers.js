@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-227", "answers", {"answerKey":{"q1":"FALSE","q2":"TRUE","q3":"NOT GIVEN","q4":"TRUE","q5":"TRUE","q6":"NOT GIVEN","q7":"FALSE","q8":"lecturer","q9":"whalers","q10":"Europe","q11":"merchants","q12":"fuel","q13":"climate"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-227", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-high-227","meta":{"title":"The Whale Goes to Court 鲸鱼油","category":"P1","frequency":"high","pdfFilename":"227. P1 - The Whale Goes to Court 鲸鱼油.pdf","legacyPath":"ReadingPractice/PDF/","legacyFilename":"227. P1 - The Whale Goes to Court 鲸鱼油.pdf","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/227. P1 - The Whale Goes to Court 鲸鱼油/227. P1 - The Whale Goes to Court 鲸鱼油.html","shuiPdf":"ReadingPractice/PDF/227. P1 - The Whale Goes to Court 鲸鱼油.pdf","ieltsHtml":null},"audit":{"matchStatus":"word_docx_visual_answer_verified","matchConfidence":0.98,"verifiedAt":"2026-05-09T00:00:00.000+08:00","notes":"Rebuilt from May Word DOCX source; restored missing Samuel Mitchill lecturer paragraph and verified answer key from embedded answer images by visual inspection."}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-227", "questions", {"questionGroups":[{"groupId":"group-1","kind":"yes_no_not_given","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 1-7</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 1-7 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> An inspection fee on fish oil was introduced in New York in 1818.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> Samuel Judd argued that the inspection fee should exclude whale oil.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> Judd had been in trouble with city officials before the inspection fee disagreement.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> Many New Yorkers were interested in the court case at the time.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> Traditionally, non-human creatures had been classified in one of three groups.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> Generally speaking, ordinary people thought fish were the lowest form of life.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>7</strong> Whales were excluded from the Linnaean system in 1818.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"short_answer","questionIds":["q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Questions 8-13</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<p>Write your answer in boxes 8-13 on your answer sheet.</p>\n<div class=\"summary-text\">\n<h5>The Trial of December 1818</h5>\n<p><strong>The Personalities</strong></p>\n<ul>\n<li>Samuel Mitchill worked as a congressman and a <input name=\"q8\" class=\"blank\" data-answer=\"lecturer\">.</li>\n<li>The defence wanted Mitchill to present the biology of the case.</li>\n<li>William Sampson called <input name=\"q9\" class=\"blank\" data-answer=\"whalers\"> as witnesses in order to appeal to the common sense of the jury.</li>\n</ul>\n<p><strong>The Arguments</strong></p>\n<ul>\n<li>Sampson's case was based on the consequences for humans if Judd won.</li>\n<li>Mitchill admitted that scientists had disputes about classification.</li>\n<li>New Yorkers disliked Mitchill because his ideas came from <input name=\"q10\" class=\"blank\" data-answer=\"Europe\">.</li>\n</ul>\n<p><strong>Conclusions</strong></p>\n<ul>\n<li>In the end it was statements from local <input name=\"q11\" class=\"blank\" data-answer=\"merchants\">, not Mitchill's testimony which helped Judd win.</li>\n<li>Whale oil made a good <input name=\"q12\" class=\"blank\" data-answer=\"fuel\"> because it was clean.</li>\n<li>Judd's case is relevant today, e.g. in the debate about Earth's <input name=\"q13\" class=\"blank\" data-answer=\"climate\">.</li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-229", "answers", {"answerKey":{"q1":"TRUE","q2":"NOT GIVEN","q3":"FALSE","q4":"NOT GIVEN","q5":"TRUE","q6":"FALSE","q7":"TRUE","q8":"camouflage","q9":"hands","q10":"birth","q11":"veins","q12":"heart","q13":"signals"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-229", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-high-229","meta":{"title":"New Understanding of Giraffes in the Wild 野生长颈鹿","category":"P1","frequency":"high","pdfFilename":"229. P1 - New Understanding of Giraffes in the Wild 野生长颈鹿.pdf","legacyPath":"ReadingPractice/PDF/","legacyFilename":"229. P1 - New Understanding of Giraffes in the Wild 野生长颈鹿.pdf","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":null,"shuiPdf":"ReadingPractice/PDF/229. P1 - New Understanding of Giraffes in the Wild 野生长颈鹿.pdf","ieltsHtml":null},"audit":{"matchStatus":"pdf_text_rebuilt","matchConfidence":0.96,"verifiedAt":"2026-05-08T00:00:00.000+08:00","notes":"Rebuilt from source PDF text extraction after detecting missing opening passage paragraphs; answer key retained after checking against source passage evidence."}});
+})(typeof window !== "undefined" ? window : globalThis);
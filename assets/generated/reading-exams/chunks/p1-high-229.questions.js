@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-229", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 1-7</h4><p>Do the following statements agree with the information given in Reading Passage 1?</p><p>In boxes 1-7 on your answer sheet, write TRUE, FALSE or NOT GIVEN.</p>\n<div class=\"question-item\" id=\"q1-anchor\">\n<p><strong>1</strong> The amount of research on giraffes in their natural environment has increased lately.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q2-anchor\">\n<p><strong>2</strong> Megan Strauss disapproves of keeping giraffes in zoos.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q3-anchor\">\n<p><strong>3</strong> The number of giraffes in Africa has nearly doubled.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q4-anchor\">\n<p><strong>4</strong> Female giraffes tend to live longer than males.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q5-anchor\">\n<p><strong>5</strong> Mother giraffes sometimes use their legs to defend their young.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q6-anchor\">\n<p><strong>6</strong> Younger bulls hold their necks higher in the presence of more powerful males.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q7-anchor\">\n<p><strong>7</strong> Male giraffes have been observed fighting.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div></div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"table_completion","questionIds":["q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\"><h4>Questions 8-13</h4><p>Complete the table below.</p><p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<table><thead><tr><th>Physical features</th><th>Study findings</th></tr></thead><tbody>\n<tr><td>Skin/coat</td><td>provides <strong>8</strong> <input class=\"blank\" name=\"q8\" type=\"text\"> when standing near trees</td></tr>\n<tr><td>Eyes</td><td>allow them to look out for lions</td></tr>\n<tr><td>Mouth</td><td>can be used like <strong>9</strong> <input class=\"blank\" name=\"q9\" type=\"text\"> to get leaves</td></tr>\n<tr><td>Neck</td><td>about equal in length to the legs; length develops in childhood to provide an easier <strong>10</strong> <input class=\"blank\" name=\"q10\" type=\"text\"> for mothers</td></tr>\n<tr><td>Cardiovascular system</td><td>extra-strong <strong>11</strong> <input class=\"blank\" name=\"q11\" type=\"text\"> keep blood from spilling into other tissues</td></tr>\n<tr><td><strong>12</strong> <input class=\"blank\" name=\"q12\" type=\"text\"></td><td>normal size for such a large animal</td></tr>\n<tr><td>Nerves</td><td>slower reaction time because <strong>13</strong> <input class=\"blank\" name=\"q13\" type=\"text\"> need to go farther to the brain</td></tr>\n</tbody></table></div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
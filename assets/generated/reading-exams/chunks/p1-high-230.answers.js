@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-230", "answers", {"answerKey":{"q1":"tree","q2":"sheep","q3":"soft","q4":"rope","q5":"mines","q6":"steal","q7":"TRUE","q8":"NOT GIVEN","q9":"FALSE","q10":"NOT GIVEN","q11":"FALSE","q12":"TRUE","q13":"FALSE"}});
+})(typeof window !== "undefined" ? window : globalThis);
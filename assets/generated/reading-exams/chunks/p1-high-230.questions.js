@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-230", "questions", {"questionGroups":[{"groupId":"group-1","kind":"notes_completion","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\"><h4>Questions 1-6</h4><p>Complete the notes below.</p><p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p><p>Write your answers in boxes 1-6 on your answer sheet.</p><div class=\"notes-completion\"><h5>The early history of graphite in Britain</h5><ul><li>Graphite was first found below a <strong>1</strong> <input class=\"blank\" name=\"q1\" type=\"text\"> blown down in a storm.</li><li>The first use of graphite was to make marks on <strong>2</strong> <input class=\"blank\" name=\"q2\" type=\"text\">.</li><li>The characteristics of raw graphite:<ul><li>dirty to use because it is so <strong>3</strong> <input class=\"blank\" name=\"q3\" type=\"text\">.</li><li>originally wrapped in <strong>4</strong> <input class=\"blank\" name=\"q4\" type=\"text\"> or animal skin to make it useable as a pencil.</li></ul></li><li>Graphite came to the notice of the government for military and commercial purposes.</li><li>The government completely took over the <strong>5</strong> <input class=\"blank\" name=\"q5\" type=\"text\"> at Borrowdale.</li><li>They employed guards to protect the graphite on its journey south.</li><li>Local people began to <strong>6</strong> <input class=\"blank\" name=\"q6\" type=\"text\"> graphite for the money involved.</li><li>The government passed a law to protect the graphite industry.</li></ul></div></div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"true_false_not_given","questionIds":["q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-11-12-13-anchor\"><h4>Questions 7-13</h4><p>Do the following statements agree with the information given in Reading Passage 1?</p><p>In boxes 7-13 on your answer sheet, write TRUE, FALSE or NOT GIVEN.</p><div class=\"question-item\" id=\"q7-anchor\">\n<p><strong>7</strong> The Italians were the first to make pencils out of wood.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q8-anchor\">\n<p><strong>8</strong> The Germans used different types of wood to produce pencils.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q9-anchor\">\n<p><strong>9</strong> More clay in a pencil makes it write more darkly.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q9\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q10-anchor\">\n<p><strong>10</strong> After the HB code was introduced, it very quickly became used by all manufacturers.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q10\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q11-anchor\">\n<p><strong>11</strong> English pencil factories have now all closed down.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q11\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q12-anchor\">\n<p><strong>12</strong> American astronauts used pencils on their early journeys into space.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q12\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q13-anchor\">\n<p><strong>13</strong> The use of graphite pencils is unlikely to continue into the future.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q13\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div></div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
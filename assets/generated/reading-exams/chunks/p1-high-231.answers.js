@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-231", "answers", {"answerKey":{"q1":"sheep","q2":"lead","q3":"government","q4":"TRUE","q5":"FALSE","q6":"NOT GIVEN","q7":"TRUE","q8":"NOT GIVEN","q9":"cleaned","q10":"heated","q11":"wax","q12":"grooves","q13":"varnished"}});
+})(typeof window !== "undefined" ? window : globalThis);
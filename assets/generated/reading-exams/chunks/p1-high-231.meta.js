@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-231", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-high-231","meta":{"title":"The History of the Pencil 铅笔的历史（流程图版）","category":"P1","frequency":"high","pdfFilename":"231. P1 - The History of the Pencil 铅笔的历史（流程图版）.pdf","legacyPath":"ReadingPractice/PDF/","legacyFilename":"231. P1 - The History of the Pencil 铅笔的历史（流程图版）.pdf","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":null,"shuiPdf":"ReadingPractice/PDF/231. P1 - The History of the Pencil 铅笔的历史（流程图版）.pdf","ieltsHtml":null},"audit":{"matchStatus":"word_docx_visual_answer_verified","matchConfidence":0.98,"verifiedAt":"2026-05-08T00:00:00.000+08:00","notes":"Rebuilt from May Word DOCX source; passage text and paragraphing extracted from Word Markdown; answer key verified from embedded answer images by visual inspection."}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-231", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1-13, which are based on Reading Passage 1 below.</p>\n<h3>The History of the Pencil</h3>\n<p>Pencils have existed for millennia. It is known that the ancient Egyptians, Greeks and Romans all used small pieces of metal as writing instruments, and that 14th-century European artists made pale grey drawings with thin rods of lead, silver or zinc. It is, however, generally accepted that the history of the modern pencil began in the 16th century, in the hilly, rural county of Cumberland in north-west England.</p>\n<p>Some time before 1565, an enormous deposit of the soft, dark grey mineral now known as graphite was discovered in the Borrowdale district of the county. Then, as now, Cumberland was a farming area, and the locals found the mineral useful for marking their sheep so they could identify the ones that belonged to them. It was thought to be a form of lead, and so was referred to as <em>plumbago</em>, a term deriving from the Latin name for that element. However, the mineral was later identified as a form of carbon, and in 1789 the German geologist Abraham Gottlob Werner renamed it <em>graphite</em>, a word based on the ancient Greek <em>grapho</em>, meaning ‘draw’ or ‘write’.</p>\n<p>The graphite found at Borrowdale was extremely dense and it could easily be sawn into sticks to be used for marking, writing or drawing. But because graphite is also soft, it requires some form of encasement around it, and so the sticks were initially wrapped in string for stability and ease of use. The news of the usefulness of these early pencils spread far and wide, attracting the attention of artists throughout Europe.</p>\n<p>In England, the government soon realised the value of the Borrowdale find, particularly for national defence purposes, because graphite proved ideal for lining the moulds used in the making of cannon balls. The mines were therefore taken over by the government, which guarded and periodically flooded them to prevent theft. Because of this, there were occasions when supplies for use in pencils had to be smuggled out in secret. Nevertheless, England still became the centre of a thriving pencil-making industry.</p>\n<p>Although deposits of graphite existed in other parts of the world, they were not of the same exceptional purity and quality as Borrowdale graphite, and had to be crushed to a powder to get rid of the impurities. England therefore continued to enjoy a monopoly on the production of pencils until a method of reconstituting the graphite powder could be found. English pencils continued to be made with sticks cut from pure Borrowdale graphite into the 1860s, after which the design was modified. The town of Keswick, close to the Cumberland graphite find, still manufactures pencils today, the factory also being the location of the Cumberland pencil museum.</p>\n<p>Experimentation in pencil production was widespread across Europe during the 16th and 17th centuries. Around 1560, an Italian couple named Simonio and Lyndiana Bernacotti made what are probably the first blueprints for the modern, wood-encased pencil. Their concept involved the hollowing out of a stick of juniper wood, and placing a stick of graphite inside. Shortly thereafter, a superior technique to that of the Bernacottis was adopted: two wooden halves were carved, a graphite stick inserted, and the halves then glued together — essentially the same method in use to this day.</p>\n<p>The first attempt to manufacture graphite sticks from powdered graphite was in Nuremberg, Germany, in 1662, using a mixture of graphite together with the elements sulphur and antimony.</p>\n<p>Today, pencils are manufactured around the world, using graphite from a number of sources. Most manufacturers use a mix of graphite and clay as the core of their pencils. Each of these substances is ground into a fine powder, which goes on to be cleaned in order to remove any impurities. After the two types of powders have been dried, they are mixed together using water. The amount of clay added to the mixture depends on how hard the pencil is intended to be — higher proportions of clay will make the pencil harder — and the amount of time spent grinding the mixture determines the quality of the core. The graphite-clay mixture is then shaped into long sticks, and after drying these are heated in a kiln to 1,200°C. In the next step in the process, the graphite-clay sticks are immersed in melted wax, which is absorbed into the mixture and helps to make it write more smoothly. In the next stage, the manufacturers use thin planks of cedar wood or juniper wood. Several long parallel grooves are cut into the planks, and the graphite-clay sticks are inserted into these. A second plank which has been prepared in the same way is then glued on top. The whole assembly is then cut into separate pencils. The outside may then be varnished, retaining the natural colour of the wood, or painted in different colours.</p>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-231", "questions", {"questionGroups":[{"groupId":"group-1","kind":"notes_completion","questionIds":["q1","q2","q3"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-anchor\"><h4>Questions 1-3</h4><p>Complete the notes below.</p><p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p><div class=\"notes-completion\"><h5>In the 1500s, Borrowdale graphite</h5><ul><li>was used by farmers in the area to indicate which <strong>1</strong> <input class=\"blank\" name=\"q1\" type=\"text\"> they owned</li><li>was first believed to be a type of <strong>2</strong> <input class=\"blank\" name=\"q2\" type=\"text\"></li><li>was encased in string to produce early pencils</li><li>was recognised by the English <strong>3</strong> <input class=\"blank\" name=\"q3\" type=\"text\"> as important in the manufacture of cannon balls</li></ul></div></div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"true_false_not_given","questionIds":["q4","q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q4-5-6-7-8-anchor\"><h4>Questions 4-8</h4><p>Do the following statements agree with the information given in Reading Passage 1?</p><p>In boxes 4-8 on your answer sheet, write TRUE, FALSE or NOT GIVEN.</p><div class=\"question-item\" id=\"q4-anchor\">\n<p><strong>4</strong> Borrowdale graphite was superior to all other forms of graphite.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q5-anchor\">\n<p><strong>5</strong> Pencil production in the Borrowdale area only lasted until the 1860s.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q6-anchor\">\n<p><strong>6</strong> The Cumberland pencil museum contains examples of pencils from different European countries.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q7-anchor\">\n<p><strong>7</strong> A technique which improved on the Bernacottis’ method of making pencils is still used now.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q8-anchor\">\n<p><strong>8</strong> In 1662, manufacturers in Nuremberg made pencils with graphite imported from England.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div></div>"},{"groupId":"group-3","kind":"flow_chart_completion","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\"><h4>Questions 9-13</h4><p>Complete the flow-chart below.</p><p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p><p>Write your answers in boxes 9-13 on your answer sheet.</p><div class=\"flow-chart\"><h5>How pencils are manufactured today</h5><p>Graphite and clay are separately crushed to form powders, then <strong>9</strong> <input class=\"blank\" name=\"q9\" type=\"text\"> and dried.</p><p>The graphite and clay powders are combined with water.</p><p>The mixture is shaped into long sticks; then, the sticks are dried, and <strong>10</strong> <input class=\"blank\" name=\"q10\" type=\"text\">.</p><p>The sticks are dipped into <strong>11</strong> <input class=\"blank\" name=\"q11\" type=\"text\">.</p><p>The sticks are put into <strong>12</strong> <input class=\"blank\" name=\"q12\" type=\"text\"> in a wooden plank and another plank is fixed on top.</p><p>The whole thing is cut into individual pencils.</p><p>The pencils are <strong>13</strong> <input class=\"blank\" name=\"q13\" type=\"text\"> or painted.</p></div></div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
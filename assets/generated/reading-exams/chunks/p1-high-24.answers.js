@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-24", "answers", {"answerKey":{"q1":"FALSE","q2":"NOT GIVEN","q3":"NOT GIVEN","q4":"TRUE","q5":"NOT GIVEN","q6":"FALSE","q7":"waterproof cloth","q8":"waste strips","q9":"rigid","q10":"stabilise","q11":"steam engines","q12":"pneumatic tyre","q13":"mass production"}});
+})(typeof window !== "undefined" ? window : globalThis);
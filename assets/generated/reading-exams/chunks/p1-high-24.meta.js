@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-24", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-high-24","meta":{"title":"Rubber 橡胶","category":"P1","frequency":"high","pdfFilename":"12. P1 - Rubber 橡胶【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/12. P1 - Rubber 橡胶【高】/","legacyFilename":"12. P1 - Rubber 橡胶【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/12. P1 - Rubber 橡胶【高】/12. P1 - Rubber 橡胶【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/12. P1 - Rubber 橡胶【高】/12. P1 - Rubber 橡胶【高】.pdf","ieltsHtml":"IELTS/P1/Rubber.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.551Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-24", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 1–6</h4>\n<p>Do the following statements agree with the information in Reading Passage 1?</p>\n<p>In boxes 1–6 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information about this</li>\n</ul>\n<div class=\"question-item\" id=\"q1-anchor\">\n<p>1. Rubber plants grow only in certain regions of the world.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q2-anchor\">\n<p>2. Rubber was extracted in Mexico as early as the sixth century.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q3-anchor\">\n<p>3. Rubber from the Castilla elastica plant is of poorer quality than that from the Para plant.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q4-anchor\">\n<p>4. A French mathematician inspired real interest in rubber amongst Europeans.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q5-anchor\">\n<p>5. The process of vulcanisation was discovered by accident.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q6-anchor\">\n<p>6. Imports of crude rubber into Britain fell during the nineteenth century.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 7–13</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN THREE WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-section\">\n<h4 style=\"text-align: center; margin-bottom: 20px;\">The Commercial Development of Rubber</h4>\n<p>\nEarly European travellers gave accounts of various rubber objects in use in Central and South America, and these accounts created interest in the commercial exploitation of rubber. In 1818, 7 <input name=\"q7\" class=\"blank\" data-answer=\"waterproof cloth\" id=\"q7-anchor\"> was produced using rubber, and in 1820 a machine was invented for recycling 8 <input name=\"q8\" class=\"blank\" data-answer=\"waste strips\" id=\"q8-anchor\"> of rubber. Over the next few years, other attempts were made to improve rubber, but some problems remained. For example, rubber products smelt bad when they were dissolved, and could turn either soft or 9 <input name=\"q9\" class=\"blank\" data-answer=\"rigid\" id=\"q9-anchor\"> depending on the temperature. However, in 1839 a new process to 10 <input name=\"q10\" class=\"blank\" data-answer=\"stabilise\" id=\"q10-anchor\"> the substance greatly increased its potential. For example, rubber was used in the creation of the 11 <input name=\"q11\" class=\"blank\" data-answer=\"steam engines\" id=\"q11-anchor\"> industry during the Industrial Revolution. Then in 1888 the 12 <input name=\"q12\" class=\"blank\" data-answer=\"pneumatic tyre\" id=\"q12-anchor\"> was developed, and a few years later the 13 <input name=\"q13\" class=\"blank\" data-answer=\"mass production\" id=\"q13-anchor\"> of the motor car began.\n</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-27", "answers", {"answerKey":{"q1":"FALSE","q2":"FALSE","q3":"NOT GIVEN","q4":"TRUE","q5":"FALSE","q6":"TRUE","q7":"ecological release","q8":"dragons","q9":"competitors","q10":"overlooked","q11":"vanished","q12":"tectonic processes","q13":"misdated"}});
+})(typeof window !== "undefined" ? window : globalThis);
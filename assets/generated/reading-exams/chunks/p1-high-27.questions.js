@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-27", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 1–6</h4>\n<p>Do the following statements agree with the information in Reading Passage 1?</p>\n<p>In boxes 1–6 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information about this</li>\n</ul>\n<div class=\"question-item\" id=\"q1-anchor\">\n<p>1. There is still doubt about the theory that an asteroid strike killed the dinosaurs.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q2-anchor\">\n<p>2. Books and the cinema have exaggerated the size of dinosaurs.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q3-anchor\">\n<p>3. Other scientists have rejected Olsen's idea of a sudden dinosaur occupation of the Earth.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q4-anchor\">\n<p>4. Dinosaur footprints are found more frequently than dinosaur skeletons.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q5-anchor\">\n<p>5. Ichnotaxa offer an exact identification of a dinosaur species.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q6-anchor\">\n<p>6. There is evidence that some groups of dinosaurs survived from the Triassic period into the Jurassic period.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 7–13</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN THREE WORDS</strong> from the passage for each answer.</p>\n<div class=\"gap-fill-section\">\n<p>Dr Olsen's group believe that the sudden increase in the size of dinosaurs may have been due to something known as 7 <input name=\"q7\" class=\"blank\" data-answer=\"ecological release\">. A current example of this can be found on Komodo Island in Indonesia, where some of the lizards are commonly called 8 <input name=\"q8\" class=\"blank\" data-answer=\"dragons\"> because of their size. Apparently, they have grown this big because they do not have any 9 <input name=\"q9\" class=\"blank\" data-answer=\"competitors\">. The asteroid strike that may have cleared the way for dinosaurs to become the dominant group probably occurred 202 million years ago.</p>\n<p>According to the writer, there are three possible reasons why we have not found a large hole in the Earth's crust dating back 202 million years. First, it may have been 10 <input name=\"q10\" class=\"blank\" data-answer=\"overlooked\"> by scientists, because craters are easily covered up. Or, it could have 11 <input name=\"q11\" class=\"blank\" data-answer=\"vanished\">; for example, if the hole had been in the ocean, it would no longer exist because of the 12 <input name=\"q12\" class=\"blank\" data-answer=\"tectonic processes\"> that produce continental drift. Thirdly, the hole could still exist but have been 13 <input name=\"q13\" class=\"blank\" data-answer=\"misdated\">.</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
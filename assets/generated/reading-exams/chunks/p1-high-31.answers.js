@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-31", "answers", {"answerKey":{"q1":"clay","q2":"goddesses","q3":"limbs","q4":"wax","q5":"plaster","q6":"composition","q7":"FALSE","q8":"TRUE","q9":"FALSE","q10":"TRUE","q11":"TRUE","q12":"FALSE","q13":"NOT GIVEN"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-31", "questions", {"questionGroups":[{"groupId":"group-1","kind":"short_answer","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 1–6</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"gap-fill-section\">\n<h4>Dolls</h4>\n<ul style=\"list-style-type: none; padding-left: 0;\">\n<li id=\"q1-anchor\"><strong>Earliest known dolls</strong>\n<ul>\n<li>represented religious figures</li>\n<li>used as toys</li>\n</ul>\n</li>\n<li id=\"q2-anchor\"><strong>Egypt, 2000 BC</strong>\n<ul>\n<li>bodies were made of wood</li>\n<li>1 <input name=\"q1\" class=\"blank\" data-answer=\"clay\"> was used for the hair</li>\n</ul>\n</li>\n<li id=\"q3-anchor\"><strong>Ancient Greece and Rome</strong>\n<ul>\n<li>dolls were given to 2 <input name=\"q2\" class=\"blank\" data-answer=\"goddesses\"> by older girls</li>\n</ul>\n</li>\n<li id=\"q4-anchor\"><strong>600 BC</strong>\n<ul>\n<li>realistic dolls had separate clothes and 3 <input name=\"q3\" class=\"blank\" data-answer=\"limbs\"> that could be put in different positions</li>\n</ul>\n</li>\n<li id=\"q5-anchor\"><strong>17th and 18th centuries</strong>\n<ul>\n<li>dolls made of 4 <input name=\"q4\" class=\"blank\" data-answer=\"wax\"> became more common</li>\n<li>moulds made of 5 <input name=\"q5\" class=\"blank\" data-answer=\"plaster\"></li>\n</ul>\n</li>\n<li id=\"q6-anchor\"><strong>1800s</strong>\n<ul>\n<li>new manufacturing process developed</li>\n<li>new group of mixtures known as 6 <input name=\"q6\" class=\"blank\" data-answer=\"composition\"></li>\n<li>recipes for these mixtures kept secret</li>\n</ul>\n</li>\n</ul>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"true_false_not_given","questionIds":["q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 7–13</h4>\n<p>Do the following statements agree with the information in Reading Passage 1?</p>\n<p>In boxes 7–13 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information about this</li>\n</ul>\n<div class=\"question-item\" id=\"q7-anchor\">\n<p>7. Bisque dolls appear less realistic than dolls made of china.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q8-anchor\">\n<p>8. French dolls tended to cost more than German bisque dolls.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q9-anchor\">\n<p>9. The first rag dolls were made in the 1850s.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q9\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q10-anchor\">\n<p>10. Only dolls made of cotton or linen are classified as cloth dolls.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q10\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q11-anchor\">\n<p>11. Dolls made of celluloid tended to lose their colour.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q11\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q12-anchor\">\n<p>12. Composition dolls lasted longer than the plastic dolls that were made in the 1940s.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q12\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q13-anchor\">\n<p>13. Doll collectors prefer a doll to be dressed in its original clothing.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q13\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-79", "answers", {"answerKey":{"q1":"white","q2":"paper","q3":"taxes","q4":"gold","q5":"foreign","q6":"mummy","q7":"caves","q8":"TRUE","q9":"NOT GIVEN","q10":"FALSE","q11":"FALSE","q12":"TRUE","q13":"FALSE"}});
+})(typeof window !== "undefined" ? window : globalThis);
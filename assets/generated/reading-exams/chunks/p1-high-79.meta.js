@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-79", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-high-79","meta":{"title":"The Development of The Silk Industry 丝绸产业发展","category":"P1","frequency":"high","pdfFilename":"17. P1 - The Development of The Silk Industry 丝绸产业发展【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/17. P1 - The Development of The Silk Industry 丝绸产业发展【高】/","legacyFilename":"17. P1 - The Development of The Silk Industry 丝绸产业发展【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/17. P1 - The Development of The Silk Industry 丝绸产业发展【高】/17. P1 - The Development of The Silk Industry 丝绸产业发展【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/17. P1 - The Development of The Silk Industry 丝绸产业发展【高】/17. P1 - The Development of The Silk Industry 丝绸产业发展【高】.pdf","ieltsHtml":"IELTS/P1/The Development of The Silk Industry.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.647Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
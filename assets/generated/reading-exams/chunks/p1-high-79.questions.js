@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-79", "questions", {"questionGroups":[{"groupId":"group-1","kind":"sentence_completion","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 1–7</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>Chinese silk</h4>\n<ul>\n<li><strong>Early uses</strong>\n<ul>\n<li>Clothing\n<ul>\n<li>at first, silk only available to Chinese of high rank</li>\n<li>emperor wore <strong>1</strong> <input name=\"q1\" type=\"text\" class=\"blank\" id=\"q1_input\"> silk indoors</li>\n</ul>\n</li>\n<li>In industry\n<ul>\n<li>silk items included parts of musical instruments, fishing string and <strong>2</strong> <input name=\"q2\" type=\"text\" class=\"blank\" id=\"q2_input\"></li>\n</ul>\n</li>\n</ul>\n</li>\n<li><strong>Currency</strong>\n<ul>\n<li>silk was used as payment of <strong>3</strong> <input name=\"q3\" type=\"text\" class=\"blank\" id=\"q3_input\"> as well as for wages and rewards</li>\n<li>silk replaced <strong>4</strong> <input name=\"q4\" type=\"text\" class=\"blank\" id=\"q4_input\"> as a unit of value</li>\n<li>silk soon used as payment in <strong>5</strong> <input name=\"q5\" type=\"text\" class=\"blank\" id=\"q5_input\"> trade</li>\n</ul>\n</li>\n<li><strong>Evidence of silk trade</strong>\n<ul>\n<li>1070 BC, Egypt:\n<ul>\n<li>hair of a <strong>6</strong> <input name=\"q6\" type=\"text\" class=\"blank\" id=\"q6_input\"> contained silk</li>\n</ul>\n</li>\n<li>2nd century BC, Persia and Mesopotamia:\n<ul>\n<li>gifts of silk were presented by Chinese ambassadors</li>\n</ul>\n</li>\n<li>1015 AD, north-west China:\n<ul>\n<li>silk objects were hidden inside <strong>7</strong> <input name=\"q7\" type=\"text\" class=\"blank\" id=\"q7_input\"></li>\n</ul>\n</li>\n</ul>\n</li>\n</ul>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"true_false_not_given","questionIds":["q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Questions 8–13</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 8–13 on your answer sheet, write</p>\n<p>\n<strong>TRUE</strong> if the statement agrees with the information<br>\n<strong>FALSE</strong> if the statement contradicts the information<br>\n<strong>NOT GIVEN</strong> if there is no information on this\n</p>\n<div class=\"question-item\">\n<p><strong>8</strong> Their first sight of silk created fear among Roman soldiers.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q8\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q8\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q8\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>9</strong> The quality of Chinese silk imported by the early Romans varied widely.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q9\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q9\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q9\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>10</strong> The Byzantine emperor first acquired silkworm eggs from the Chinese emperor.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q10\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q10\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q10\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>11</strong> The price of high-grade Chinese silk fell due to competition from Middle-Eastern producers.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q11\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q11\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q11\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>12</strong> Silk was produced in the Middle East several centuries before it was produced in Europe.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q12\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q12\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q12\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>13</strong> Global silk production has declined in recent years.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q13\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q13\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q13\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-82", "answers", {"answerKey":{"q1":"TRUE","q2":"NOT GIVEN","q3":"FALSE","q4":"FALSE","q5":"NOT GIVEN","q6":"TRUE","q7":"TRUE","q8":"investment","q9":"engineering","q10":"articles","q11":"teacher","q12":"test","q13":"training"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-82", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-high-82","meta":{"title":"Think Small 微观科学","category":"P1","frequency":"high","pdfFilename":"172. P1 - Think Small 微观科学.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/172. P1 - Think Small 微观科学【高】/","legacyFilename":"172. P1 - Think Small 微观科学.html","questionIntroHtml":"<h3>Questions 1–7</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/172. P1 - Think Small 微观科学【高】/172. P1 - Think Small 微观科学.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/172. P1 - Think Small 微观科学【高】/172. P1 - Think Small 微观科学.pdf","ieltsHtml":"IELTS/P1/Think Small.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.650Z","notes":"signature:radio,text,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-82", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Do the following statements agree with the information given in Reading Passage 1?</h4>\n<p>In boxes 1–7 on your answer sheet, write:</p>\n<ul style=\"list-style-position: inside; padding-left: 0; margin-bottom: 1rem;\">\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> Izon's new US headquarters are located in an area popular with other science businesses.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> Izon's growth in the last three years has been faster than the company predicted.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> Since 2004, Izon has developed a range of equipment for use in scientific research.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> One advantage of the qNano is that it is cheaper than its competitors.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> Drug delivery analysis will be the most profitable application of the qNano.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> Kristoffer Bolen is still completing his studies.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>7</strong> Bolen's job requires him to fully understand how the qNano works.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions 1–7</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Complete the notes below.</h4>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>The Izon Story</h4>\n<p><strong>Hans van der Voorn</strong></p>\n<ul>\n<li>He made the <strong>8</strong> <input type=\"text\" id=\"q8_input\" maxlength=\"20\" name=\"q8\"> which enabled the prototype to be created.</li>\n<li>His background in <strong>9</strong> <input type=\"text\" id=\"q9_input\" maxlength=\"20\" name=\"q9\"> as well as business gave him the skills to run Izon.</li>\n</ul>\n<p><strong>Izon in the United States</strong></p>\n<ul>\n<li>It is unable to form partnerships in the US because it's not registered there.</li>\n<li>The company's marketing relies on <strong>10</strong> <input type=\"text\" id=\"q10_input\" maxlength=\"20\" name=\"q10\"> about its customers' research.</li>\n<li>Yaniv Gaynor was formerly a <strong>11</strong> <input type=\"text\" id=\"q11_input\" maxlength=\"20\" name=\"q11\"> with no experience in sales.</li>\n<li>Development of the product is influenced by customers' questions.</li>\n</ul>\n<p><strong>Plans for the future</strong></p>\n<ul>\n<li>To diagnose thrombosis, a <strong>12</strong> <input type=\"text\" id=\"q12_input\" maxlength=\"20\" name=\"q12\"> may be developed.</li>\n<li><strong>13</strong> <input type=\"text\" id=\"q13_input\" maxlength=\"20\" name=\"q13\"> will be done at Izon's US headquarters.</li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-90", "answers", {"answerKey":{"q1":"tombs","q2":"book","q3":"monks","q4":"dutch","q5":"smuggling","q6":"india","q7":"clippers","q8":"FALSE","q9":"NOT GIVEN","q10":"FALSE","q11":"TRUE","q12":"TRUE","q13":"NOT GIVEN"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-90", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-high-90","meta":{"title":"The History of Tea 茶叶的历史","category":"P1","frequency":"high","pdfFilename":"18. P1 - The History of Tea 茶叶的历史【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/18. P1 - The History of Tea 茶叶的历史【高】/","legacyFilename":"18. P1 - The History of Tea 茶叶的历史【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/18. P1 - The History of Tea 茶叶的历史【高】/18. P1 - The History of Tea 茶叶的历史【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/18. P1 - The History of Tea 茶叶的历史【高】/18. P1 - The History of Tea 茶叶的历史【高】.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.662Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
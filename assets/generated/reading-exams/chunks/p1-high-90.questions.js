@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-90", "questions", {"questionGroups":[{"groupId":"group-1","kind":"short_answer","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 1–7</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"question-item\">\n<p><strong>1</strong> Researchers believe the tea containers detected in <input name=\"q1\" class=\"blank\" id=\"q1_input\"> from the Han Dynasty were the first evidence of the use of tea.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> Lu Yu wrote a <input name=\"q2\" class=\"blank\" id=\"q2_input\"> about tea before anyone else in the eighth century.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> It was <input name=\"q3\" class=\"blank\" id=\"q3_input\"> from Japan who brought tea to their native country from China.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> Tea was carried from China to Europe by the <input name=\"q4\" class=\"blank\" id=\"q4_input\">.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> The British government had to cut the taxation on tea because of the serious crime of <input name=\"q5\" class=\"blank\" id=\"q5_input\">.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> Tea was planted in <input name=\"q6\" class=\"blank\" id=\"q6_input\"> besides China in the 19th century.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>7</strong> In order to compete in shipping speed, traders used <input name=\"q7\" class=\"blank\" id=\"q7_input\"> for the race.</p>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"true_false_not_given","questionIds":["q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Questions 8–13</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 8–13 on your answer sheet, write</p>\n<p>\n<strong>TRUE</strong> if the statement agrees with the information<br>\n<strong>FALSE</strong> if the statement contradicts the information<br>\n<strong>NOT GIVEN</strong> if there is no information on this\n</p>\n<div class=\"question-item\">\n<p><strong>8</strong> Tea was popular in Britain in the 16th century.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q8\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q8\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q8\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>9</strong> Tea was more fashionable than coffee in Europe in the late 16th century.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q9\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q9\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q9\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>10</strong> Tea was enjoyed by all classes in Britain in the 17th century.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q10\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q10\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q10\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>11</strong> The adulteration of tea also prompted William Pitt the Younger to reduce the tax.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q11\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q11\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q11\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>12</strong> Initial problems occurred when tea was planted outside China by the East India Company.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q12\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q12\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q12\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>13</strong> The fastest vessels were owned by America during the 19th-century clipper races.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q13\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q13\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q13\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-92", "answers", {"answerKey":{"q1":"TRUE","q2":"FALSE","q3":"FALSE","q4":"NOT GIVEN","q5":"NOT GIVEN","q6":"FALSE","q7":"TRUE","q8":"cattle herds","q9":"winds","q10":"lake sediments","q11":"size","q12":"nutrients","q13":"glaciers"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-92", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-high-92","meta":{"title":"Dust and the American West 美国西部尘埃","category":"P1","frequency":"high","pdfFilename":"181. P1 - Dust and the American West 美国西部尘埃.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/181. P1 - Dust and the American West 美国西部尘埃【高】/","legacyFilename":"181. P1 - Dust and the American West 美国西部尘埃.html","questionIntroHtml":"<h3>Questions 1–7</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/181. P1 - Dust and the American West 美国西部尘埃【高】/181. P1 - Dust and the American West 美国西部尘埃.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/181. P1 - Dust and the American West 美国西部尘埃【高】/181. P1 - Dust and the American West 美国西部尘埃.pdf","ieltsHtml":"IELTS/P1/Dust and the American West.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.665Z","notes":"signature:radio,text,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-high-92", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Do the following statements agree with the information given in Reading Passage 1?</h4>\n<p>In boxes 1–7 on your answer sheet, write:</p>\n<ul style=\"list-style-position: inside; padding-left: 0; margin-bottom: 1rem;\">\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> Jason Neff discovered there had been a dramatic rise in dust levels in the second half of the nineteenth century.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> The Anasazi civilization disappeared due to the impact of dust in the atmosphere.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> Before cattle were introduced to the American Southwest, large numbers of bison occupied the area.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> The bison population in the Great Plains diminished because European settlers found it easy to hunt them.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> The development of railroads across the US was more expensive than originally expected.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> The Aztec Land and Cattle Company worked hard to take care of the grazing land it owned.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>7</strong> Most of the land once owned by the Aztec Land and Cattle Company remains infertile today.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions 1–7</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Complete the notes below.</h4>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>American Southwest: 1860s to present day</h4>\n<p><strong>1862</strong> — Homestead Act was passed to encourage settlement in the West.</p>\n<p><strong>1930s</strong> — Laws were passed to control the size of <strong>8</strong> <input type=\"text\" id=\"q8_input\" maxlength=\"20\" name=\"q8\">.</p>\n<p><strong>Today Jayne Belnap believes:</strong></p>\n<ul>\n<li>soil was not affected by high <strong>9</strong> <input type=\"text\" id=\"q9_input\" maxlength=\"20\" name=\"q9\">.</li>\n<li>soil was seriously affected by cattle hooves.</li>\n</ul>\n<p><strong>Jason Neff:</strong></p>\n<ul>\n<li>found that <strong>10</strong> <input type=\"text\" id=\"q10_input\" maxlength=\"20\" name=\"q10\"> in the Colorado region contained dust.</li>\n<li>examined the dust for its chemical content as well as its <strong>11</strong> <input type=\"text\" id=\"q11_input\" maxlength=\"20\" name=\"q11\">.</li>\n<li>concluded that the dust was from the American Southwest.</li>\n<li>found that dust affects mountain environments by bringing in <strong>12</strong> <input type=\"text\" id=\"q12_input\" maxlength=\"20\" name=\"q12\"> that are not normally found there, causing faster seasonal snowmelt.</li>\n<li>argues that dust is partly to blame for the gradual disappearance of some <strong>13</strong> <input type=\"text\" id=\"q13_input\" maxlength=\"20\" name=\"q13\"> and snow.</li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-02", "answers", {"answerKey":{"q1":"I","q2":"F","q3":"J","q4":"D","q5":"H","q6":"B","q7":"E","q8":"G","q9":"FALSE","q10":"FALSE","q11":"NOT GIVEN","q12":"TRUE","q13":"FALSE"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-02", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-02","meta":{"title":"Maori Fish Hooks 毛利鱼钩","category":"P1","frequency":"low","pdfFilename":"10. P1 - Maori Fish Hooks 毛利鱼钩.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/10. P1 - Maori Fish Hooks 毛利鱼钩/","legacyFilename":"10. P1 - Maori Fish Hooks 毛利鱼钩.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/10. P1 - Maori Fish Hooks 毛利鱼钩/10. P1 - Maori Fish Hooks 毛利鱼钩.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/10. P1 - Maori Fish Hooks 毛利鱼钩/10. P1 - Maori Fish Hooks 毛利鱼钩.pdf","ieltsHtml":"IELTS/P1/Maori Fish Hooks.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.510Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-02", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-8-anchor\">\n<h4>Questions 1–8</h4>\n<p>The reading passage has ten paragraphs labelled <strong>A–J</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter <strong>A–J</strong> in boxes 1–8 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 250px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th><th>I</th><th>J</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>1</strong> Instruction on how to recognise authentic Maori hooks from counterfeit ones</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td><td><input type=\"radio\" name=\"q1\" value=\"I\"></td><td><input type=\"radio\" name=\"q1\" value=\"J\"></td>\n</tr>\n<tr>\n<td><strong>2</strong> A description of a different type of hooks that are not used to catch fish</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td><td><input type=\"radio\" name=\"q2\" value=\"I\"></td><td><input type=\"radio\" name=\"q2\" value=\"J\"></td>\n</tr>\n<tr>\n<td><strong>3</strong> An acknowledgement that Maori design and craftsmanship are still relevant in the modern world</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td><td><input type=\"radio\" name=\"q3\" value=\"I\"></td><td><input type=\"radio\" name=\"q3\" value=\"J\"></td>\n</tr>\n<tr>\n<td><strong>4</strong> An investigation into how the hooks functioned so effectively</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td><td><input type=\"radio\" name=\"q4\" value=\"I\"></td><td><input type=\"radio\" name=\"q4\" value=\"J\"></td>\n</tr>\n<tr>\n<td><strong>5</strong> A description of how modern technology began to dominate and eventually took over from traditional hook construction</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td><td><input type=\"radio\" name=\"q5\" value=\"I\"></td><td><input type=\"radio\" name=\"q5\" value=\"J\"></td>\n</tr>\n<tr>\n<td><strong>6</strong> A list of raw materials used to construct hooks</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td><td><input type=\"radio\" name=\"q6\" value=\"H\"></td><td><input type=\"radio\" name=\"q6\" value=\"I\"></td><td><input type=\"radio\" name=\"q6\" value=\"J\"></td>\n</tr>\n<tr>\n<td><strong>7</strong> An outline of how different styles of hooks and types of materials were employed to catch larger fish</td>\n<td><input type=\"radio\" name=\"q7\" value=\"A\"></td><td><input type=\"radio\" name=\"q7\" value=\"B\"></td><td><input type=\"radio\" name=\"q7\" value=\"C\"></td><td><input type=\"radio\" name=\"q7\" value=\"D\"></td><td><input type=\"radio\" name=\"q7\" value=\"E\"></td><td><input type=\"radio\" name=\"q7\" value=\"F\"></td><td><input type=\"radio\" name=\"q7\" value=\"G\"></td><td><input type=\"radio\" name=\"q7\" value=\"H\"></td><td><input type=\"radio\" name=\"q7\" value=\"I\"></td><td><input type=\"radio\" name=\"q7\" value=\"J\"></td>\n</tr>\n<tr>\n<td><strong>8</strong> An account of how the Maori employed new technology and adapted it</td>\n<td><input type=\"radio\" name=\"q8\" value=\"A\"></td><td><input type=\"radio\" name=\"q8\" value=\"B\"></td><td><input type=\"radio\" name=\"q8\" value=\"C\"></td><td><input type=\"radio\" name=\"q8\" value=\"D\"></td><td><input type=\"radio\" name=\"q8\" value=\"E\"></td><td><input type=\"radio\" name=\"q8\" value=\"F\"></td><td><input type=\"radio\" name=\"q8\" value=\"G\"></td><td><input type=\"radio\" name=\"q8\" value=\"H\"></td><td><input type=\"radio\" name=\"q8\" value=\"I\"></td><td><input type=\"radio\" name=\"q8\" value=\"J\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"true_false_not_given","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 9–13</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 9–13 on your answer sheet, write</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"tfng-item\">\n<p><strong>9</strong> The early European settlers quickly understood how the Maori fish hook worked.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q9\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q9\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q9\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"tfng-item\">\n<p><strong>10</strong> The hook works by making a hole and embedding itself in the mouth of the fish.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q10\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q10\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q10\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"tfng-item\">\n<p><strong>11</strong> The Maoris catch seabirds by their feet.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q11\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q11\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q11\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"tfng-item\">\n<p><strong>12</strong> There used to be a demand for Maori fish hooks and many counterfeit ones were produced.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q12\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q12\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q12\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"tfng-item\">\n<p><strong>13</strong> Today European-style hooks have completely replaced the traditional styles used by the Maoris.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q13\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q13\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q13\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
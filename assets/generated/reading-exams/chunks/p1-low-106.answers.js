@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-106", "answers", {"answerKey":{"q1":"TRUE","q2":"FALSE","q3":"TRUE","q4":"NOT GIVEN","q5":"TRUE","q6":"trust","q7":"computers","q8":"language","q9":"travel","q10":"memory","q11":"status","q12":"conversation","q13":"tradition"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-106", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-106","meta":{"title":"The Importance of Business Cards 名片的重要性","category":"P1","frequency":"low","pdfFilename":"20. P1 - The Importance of Business Cards 名片的重要性.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/20. P1 - The Importance of Business Cards 名片的重要性/","legacyFilename":"20. P1 - The Importance of Business Cards 名片的重要性.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/20. P1 - The Importance of Business Cards 名片的重要性/20. P1 - The Importance of Business Cards 名片的重要性.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/20. P1 - The Importance of Business Cards 名片的重要性/20. P1 - The Importance of Business Cards 名片的重要性.pdf","ieltsHtml":"IELTS/P1/The Importance of Business Cards.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.688Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-106", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 1–5</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>\n<strong>TRUE</strong> if the statement agrees with the information<br>\n<strong>FALSE</strong> if the statement contradicts the information<br>\n<strong>NOT GIVEN</strong> if there is no information on this\n</p>\n<div class=\"question-item\">\n<p><strong>1</strong> Children's business cards have been banned in some kindergartens.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q1\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q1\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q1\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> It was the Chinese who first began the practice of using business cards.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q2\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q2\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q2\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> Designing business cards can be a controversial process for some companies.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q3\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q3\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q3\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> A famous toy company has boosted its sales by using one type of unusual business card.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q4\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q4\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q4\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> Some business commentators predict a decline in the use of paper business cards.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q5\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q5\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q5\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q6","q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-10-11-12-13-anchor\">\n<h4>Questions 6–13</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>How business works</h4>\n<ul>\n<li><strong>Kate Jones's research</strong>\n<ul>\n<li>The most important aspect of business is having <strong>6</strong> <input name=\"q6\" type=\"text\" class=\"blank\" id=\"q6_input\"> in others.</li>\n<li><strong>7</strong> <input name=\"q7\" type=\"text\" class=\"blank\" id=\"q7_input\"> do not have the ability to establish the good relationships essential to business.</li>\n</ul>\n</li>\n<li><strong>Business and globalisation</strong>\n<ul>\n<li>Managers must work harder when they don't share the same <strong>8</strong> <input name=\"q8\" type=\"text\" class=\"blank\" id=\"q8_input\"> with their contacts.</li>\n<li>A UK survey indicates that <strong>9</strong> <input name=\"q9\" type=\"text\" class=\"blank\" id=\"q9_input\"> takes up the largest part of business leaders' time.</li>\n<li>A business person's <strong>10</strong> <input name=\"q10\" type=\"text\" class=\"blank\" id=\"q10_input\"> of a meeting can be improved by looking at business cards.</li>\n</ul>\n</li>\n<li><strong>Janet McIntyre</strong>\n<ul>\n<li>Business cards clearly show the <strong>11</strong> <input name=\"q11\" type=\"text\" class=\"blank\" id=\"q11_input\"> of each person in a large company.</li>\n<li>The ritual of swapping business cards is a good way of starting a <strong>12</strong> <input name=\"q12\" type=\"text\" class=\"blank\" id=\"q12_input\"> at the beginning of a business relationship.</li>\n<li>Janet feels that in the business world, <strong>13</strong> <input name=\"q13\" type=\"text\" class=\"blank\" id=\"q13_input\"> is just as important as innovation.</li>\n</ul>\n</li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-107", "answers", {"answerKey":{"q1":"governess","q2":"diary","q3":"artists","q4":"museums","q5":"ambition","q6":"mycology","q7":"FALSE","q8":"NOT GIVEN","q9":"TRUE","q10":"FALSE","q11":"TRUE","q12":"FALSE","q13":"NOT GIVEN"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-107", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-107","meta":{"title":"The life of Beatrix Potter 彼得兔作家","category":"P1","frequency":"low","pdfFilename":"21. P1 - The life of Beatrix Potter 彼得兔作家.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/21. P1 - The life of Beatrix Potter 彼得兔作家/","legacyFilename":"21. P1 - The life of Beatrix Potter 彼得兔作家.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/21. P1 - The life of Beatrix Potter 彼得兔作家/21. P1 - The life of Beatrix Potter 彼得兔作家.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/21. P1 - The life of Beatrix Potter 彼得兔作家/21. P1 - The life of Beatrix Potter 彼得兔作家.pdf","ieltsHtml":"IELTS/P1/The life of Beatrix Potter.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.689Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
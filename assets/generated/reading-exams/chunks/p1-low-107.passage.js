@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-107", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>The life of Beatrix Potter</h3>\n<h4>The children's author and illustrator who created Peter Rabbit</h4>\n<p>Beatrix Potter is one of the best-selling children's authors of all time. Her popular series of books that includes The Tale of Peter Rabbit was first published over one hundred years ago and has never been out of print. Generations of children have enjoyed her many stories and illustrations, all of which celebrate the English way of life and rural landscape through the adventures of animals.</p>\n<p>Born into a comfortable middle-class family in London in 1866, Potter spent much of her early life in her own company. She was educated at home by a governess and rarely saw her brother, Bertram, who was sent to boarding school. Having little social contact with children of her own age, Potter was drawn into a private world of writing. When she was 15, she began to keep a diary written in a secret code of her own invention. Even Beatrix herself, when she read back over it in later life, found it difficult to understand. It was not until 15 years after her death that the code was cracked. To the outside world Beatrix seemed shy and reserved, but in her diary she expressed herself freely and was critical of the work of several contemporary artists.</p>\n<p>Potter was a naturally gifted artist, and with the aid of some art lessons she also learned the technical side of drawing. Throughout her childhood she looked after many animals—rabbits, frogs and even bats—and sketched them constantly, gradually improving her work by sketching in museums. She was also interested in natural history. She would spend many hours drawing wildlife such as fungi and flowers, and at one time she had an ambition to develop this scientific interest. An uncle tried to help her enrol at the Royal Botanic Gardens at Kew in London, but she was rejected because of her gender. Nevertheless, she won respect from the scientific establishment for her illustrations and her contribution to mycology, the study of fungi.</p>\n<p>When Potter was in her early twenties, her parents tried to arrange a husband for her. Many suitable suitors were found; however, Potter turned them all down. Fiercely independent, she disliked the idea of being tied to a domestic life that, at that time, consisted mostly of staying at home and raising children. Thus—unusually for British women of the period—she remained single and lived in her parents' home.</p>\n<p>For several years Potter tried to get her first children's book, The Tale of Peter Rabbit, published. Her initial attempts were unsuccessful, but she persevered, and eventually Frederick Warne & Co. accepted the book. It was finally published in 1902, when Potter was 36, though the publishers did not expect it to sell many copies. The project was given to the youngest brother in the firm, Norman Warne, as his first assignment—essentially a test. Luckily, he warmed to both the book and its author. Determined to make it a success, he worked closely with Potter, poring over every detail. It was Norman who insisted that each illustration should be in colour, while Potter insisted the book remain small enough for children to hold easily. By the end of the year, 28,000 copies were in print.</p>\n<p>The relationship between Warne and Potter blossomed, and they eventually became engaged. However, Potter's parents disapproved because of his occupation. They relented only on condition that the couple live apart for six months to give Potter time to reconsider. Tragically, before the wedding could take place, Warne developed pernicious anaemia, a blood disease, and passed away. Potter was devastated and wrote to his sister, Millie, “He did not live long, but he fulfilled a useful, happy life. I must try to make a fresh beginning next year.”</p>\n<p>After Warne's death, Potter moved to the Lake District in northern England. In 1905 she bought a small farm there, and for the next eight years she busied herself writing more books, some set in or around the area. She remained there for the rest of her life, but failing eyesight eventually forced her to stop writing children's books. Instead, she devoted herself to breeding sheep and helping to conserve farms in the district. Thanks to the proceeds from her successful books and a later inheritance, Potter was able to buy many working farms. On her death she left more than 4,000 acres to the National Trust, an organisation that protects historic buildings and countryside in England. As a result, her beloved landscape is now accessible to countless visitors.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-107", "questions", {"questionGroups":[{"groupId":"group-1","kind":"sentence_completion","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 1–6</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4 style=\"text-align: center;\">Beatrix Potter</h4>\n<p><strong>Success as an author</strong></p>\n<ul>\n<li>Her books have been in print for more than 100 years.</li>\n</ul>\n<p><strong>Childhood</strong></p>\n<ul>\n<li>She received lessons at home from a <strong>1</strong> <input type=\"text\" id=\"q1_input\" name=\"q1\">.</li>\n<li>She wrote in her <strong>2</strong> <input type=\"text\" id=\"q2_input\" name=\"q2\"> in code.</li>\n<li>She disliked the work of some <strong>3</strong> <input type=\"text\" id=\"q3_input\" name=\"q3\"> of the time.</li>\n<li>She took lessons in drawing.</li>\n<li>She practised drawing things she saw when she visited <strong>4</strong> <input type=\"text\" id=\"q4_input\" name=\"q4\">.</li>\n</ul>\n<p><strong>Life as a young adult</strong></p>\n<ul>\n<li>Her <strong>5</strong> <input type=\"text\" id=\"q5_input\" name=\"q5\"> to have a career in natural history was not realised.</li>\n<li>Her illustrations were recognised as assisting research into <strong>6</strong> <input type=\"text\" id=\"q6_input\" name=\"q6\">.</li>\n</ul>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"true_false_not_given","questionIds":["q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-11-12-13-anchor\">\n<h4>Questions 7–13</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 7–13 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>7</strong> The life of a typical married woman at that time appealed to Potter.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>8</strong> Potter's publishers insisted on changing the title of her first book.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>9</strong> The publishers doubted whether Potter's first book would be successful.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q9\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>10</strong> Norman Warne suggested Potter include black-and-white illustrations in her first book.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q10\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>11</strong> At first, Potter's parents disapproved of Norman Warne as a potential husband.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q11\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>12</strong> Potter continued writing children's books until her death.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q12\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>13</strong> Potter's gift to the National Trust was the largest in recent times.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q13\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
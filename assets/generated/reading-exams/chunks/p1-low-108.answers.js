@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-108", "answers", {"answerKey":{"q1":"C","q2":"D","q3":"A","q4":"B","q5":"B","q6":"B","q7":"C","q8":"A","q9":"B","q10":"bonding","q11":"danger","q12":"rest","q13":"alert"}});
+})(typeof window !== "undefined" ? window : globalThis);
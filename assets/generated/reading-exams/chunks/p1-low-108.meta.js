@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-108", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-108","meta":{"title":"The nature of Yawning 打哈欠的本质","category":"P1","frequency":"low","pdfFilename":"22. P1 - The nature of Yawning 打哈欠的本质.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/22. P1 - The nature of Yawning 打哈欠的本质/","legacyFilename":"22. P1 - The nature of Yawning 打哈欠的本质.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/22. P1 - The nature of Yawning 打哈欠的本质/22. P1 - The nature of Yawning 打哈欠的本质.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/22. P1 - The nature of Yawning 打哈欠的本质/22. P1 - The nature of Yawning 打哈欠的本质.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.691Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-108", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 1–5</h4>\n<p>Reading Passage 1 has six paragraphs, <strong>A–F</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–F</strong>, in boxes 1–5 on your answer sheet. You may use any letter more than once.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>1</strong> Humans' imaginations can cause yawning.</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>2</strong> Research shows that yawning is closely related to occupations.</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>3</strong> An overview of the latest research on yawning.</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>4</strong> Yawning is used to regulate brain temperature.</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>5</strong> Scientists discovered some evidence disproving the earlier understanding of yawning.</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"table_completion","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 6–9</h4>\n<p>Match each of the following research results with the university from which it comes.</p>\n<p><em>You may use any letter more than once.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A. University at Albany</th>\n<th>B. University of Leeds</th>\n<th>C. University of London</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>6</strong> There is no gender difference in the cause of yawning.</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td>\n</tr>\n<tr>\n<td><strong>7</strong> People with certain disorders are less likely to be affected by other people yawning.</td>\n<td><input type=\"radio\" name=\"q7\" value=\"A\"></td><td><input type=\"radio\" name=\"q7\" value=\"B\"></td><td><input type=\"radio\" name=\"q7\" value=\"C\"></td>\n</tr>\n<tr>\n<td><strong>8</strong> Yawning is associated with the way people breathe.</td>\n<td><input type=\"radio\" name=\"q8\" value=\"A\"></td><td><input type=\"radio\" name=\"q8\" value=\"B\"></td><td><input type=\"radio\" name=\"q8\" value=\"C\"></td>\n</tr>\n<tr>\n<td><strong>9</strong> People who are trained to feel empathy for others are more likely to yawn than those who are untrained.</td>\n<td><input type=\"radio\" name=\"q9\" value=\"A\"></td><td><input type=\"radio\" name=\"q9\" value=\"B\"></td><td><input type=\"radio\" name=\"q9\" value=\"C\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<h4>Questions 10–13</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<p>\nAnother theory shows that yawning is used for <strong>10</strong> <input type=\"text\" id=\"q10_input\" maxlength=\"15\" name=\"q10\"> individuals into a tighter social unit. Alternatively, yawning can help increase alertness of group members in case <strong>11</strong> <input type=\"text\" id=\"q11_input\" maxlength=\"15\" name=\"q11\"> is close. For example, yawning signals that a member of the group needs some <strong>12</strong> <input type=\"text\" id=\"q12_input\" maxlength=\"15\" name=\"q12\"> and requires the others to stay aware of the surrounding situation. This theory proves that yawning is only a spontaneous behaviour resulting from some part of a simple <strong>13</strong> <input type=\"text\" id=\"q13_input\" maxlength=\"15\" name=\"q13\"> system in early humans.\n</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
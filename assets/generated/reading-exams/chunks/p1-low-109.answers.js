@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-109", "answers", {"answerKey":{"q1":"TRUE","q2":"NOT GIVEN","q3":"FALSE","q4":"TRUE","q5":"TRUE","q6":"NOT GIVEN","q7":"FALSE","q8":"strips","q9":"sheep","q10":"stretched","q11":"bark","q12":"Samarkand","q13":"stone"}});
+})(typeof window !== "undefined" ? window : globalThis);
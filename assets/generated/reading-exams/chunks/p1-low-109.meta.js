@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-109", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-109","meta":{"title":"The Origin of Paper 造纸术起源","category":"P1","frequency":"low","pdfFilename":"23. P1 - The Origin of Paper 造纸术起源.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/23. P1 - The Origin of Paper 造纸术起源/","legacyFilename":"23. P1 - The Origin of Paper 造纸术起源.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/23. P1 - The Origin of Paper 造纸术起源/23. P1 - The Origin of Paper 造纸术起源.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/23. P1 - The Origin of Paper 造纸术起源/23. P1 - The Origin of Paper 造纸术起源.pdf","ieltsHtml":"IELTS/P1/The Origin of Paper.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.692Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-109", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1-13, which are based on Reading Passage 1.</p>\n<h3>The Origin of Paper</h3>\n<p>The word paper derives from the Greek term for the ancient Egyptian writing material called papyrus. In about 2400 BC, the Egyptians discovered how to make a writing surface out of papyrus, a type of reed that grows along waterways in southern Europe and North Africa. The Egyptians cut the plant into strips which they softened in water. Papyrus was cross-woven into a mat and then pounded into a hard, thin sheet.</p>\n<p>As the papyrus plant requires subtropical conditions to grow, papyrus was not much used in Europe at that time; instead, the main material used for writing was parchment. This was made from animal skin and was extremely expensive. In fact, it has been estimated that a single book written on parchment required the skins of 300 sheep. The skins had to be specially prepared by drying them and they were then stretched on a special frame. It is not known when parchment was first introduced, but it was the main writing material in Europe for hundreds of years.</p>\n<p>Paper—made from pulp, rags and fibres of plants—seems to have been invented in China and is considered to be one of the Four Great Inventions of Ancient China. In 105 AD, under the Han-Dynasty emperor Ho-Ti, a government official in China named Ts'ai Lun was the first to start a papermaking industry. Ts'ai Lun seems to have made his paper by mixing finely chopped mulberry bark and hemp rags with water, mashing the mixture flat with a stone mortar, and then pressing out the water and letting it dry in the sun. He may have based his idea on bark cloth, which was very common in China and also made from mulberry.</p>\n<p>Previously, during the Shang (1600-1050 BC) and Zhou (1050-256 BC) dynasties of Ancient China, documents were ordinarily written on bone or bamboo (on tablets or bamboo strips bound and rolled together into scrolls), making them very heavy and awkward to transport. The light material of silk was sometimes used, but was normally too expensive to consider. When paper was first invented, it was used for purposes of wrapping or padding protection for delicate bronze mirrors. Although paper for writing became popular by the 3rd century AD, it continued to be used for wrapping and other purposes.</p>\n<p>During the Tang Dynasty (618-907 AD) paper was folded and sewn into square bags to preserve the flavour of tea. During the same period, according to a written account, tea was served from baskets with multi-coloured paper cups and paper napkins of different sizes and shapes. During the Chinese Song Dynasty (960-1279 AD) not only did the government produce the world's first known printed paper money, or banknote, but paper money bestowed as gifts was wrapped in special paper envelopes.</p>\n<p>Paper spread widely outside China; other Asian cultures, even after seeing paper, could not make it themselves. Instruction in the manufacturing process was required, and the Chinese were reluctant to share their secrets. It made its true push westward in 751 AD when the Tang Dynasty was at war with the Islamic world. During a battle on the banks of the Talas River, a Chinese caravan was captured which happened to include several papermakers. They were taken away to Samarkand, which was a good place to make paper because it had an abundant supply of hemp and flax. Samarkanders changed the technology of manufacturing paper. They began to prepare it in stone mills and Samarkand became an important papermaking centre.</p>\n<p>The rudimentary and laborious process of papermaking was refined, and bulk manufacturing of paper began in Iran, where they invented a method to make a thicker sheet of paper, which helped transform papermaking from an art into an important business.</p>\n<p>Gradually papermakers made their way further west through the Arab world—to Baghdad, Damascus and Cairo. Finally, when the Moors from North Africa invaded Spain and Portugal, they brought the technology with them and so it was that papermaking entered Europe in the 12th century.</p>\n<p>In Europe, the preferred medium for the artists and literati of the time was still the smooth and lustrous parchment. The notion of paper being used as a practical everyday item did not occur until the 15th century, when Johannes Gutenberg perfected movable-type printing, which included the use of metal moulds and alloys, a special press, and oil-based inks, allowing the mass production of printed books. The birth of the modern paper and printing industry is commonly marked from this date.</p>\n<p>Printing technology rapidly developed and created an ever-increasing demand for paper. The early European papers were made from recycled cotton and linen—and a huge trade quickly developed around the trading of old rags. It is said that the disease known as the Black Death entered England from Europe on these old rags. Yet soon this source became insufficient and some curious attempts were made to find new materials. Experiments with fibres such as straw, cabbage, wasp nests and finally wood resulted in inexpensive—and replaceable—materials for papermaking. Today, the long, soft fibres of softwoods such as spruce have become the most suitable source of pulp for the mass production of paper.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-109", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 1–7</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 1–7 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> In Ancient China, writing was occasionally done on silk.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> Coloured paper was invented during the Tang Dynasty.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> Papermakers from Samarkand were captured by the Chinese.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> Papermaking as a large-scale industry originated in Iran.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> Papermaking skills were brought to Europe via North Africa.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> When Gutenberg invented movable type, paper materials were very expensive.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>7</strong> The end of the trade in rags was brought about by the difficulty of transporting them.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"table_completion","questionIds":["q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Questions 8–13</h4>\n<p>Complete the table below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<table class=\"completion-table\">\n<thead>\n<tr>\n<th colspan=\"4\">The Development of Paper</th>\n</tr>\n<tr>\n<th>Place</th>\n<th>Date of introduction</th>\n<th>Materials used</th>\n<th>Method of production</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td>Egypt</td>\n<td>about 2400 BC</td>\n<td>a plant called papyrus</td>\n<td><strong>8</strong> <input type=\"text\" id=\"q8_input\" name=\"q8\"> of the plant were softened in water, woven and pounded</td>\n</tr>\n<tr>\n<td>Europe</td>\n<td>unknown</td>\n<td>parchment made from the skin of animals such as <strong>9</strong> <input type=\"text\" id=\"q9_input\" name=\"q9\"></td>\n<td>skin was dried and <strong>10</strong> <input type=\"text\" id=\"q10_input\" name=\"q10\"></td>\n</tr>\n<tr>\n<td>China</td>\n<td>105 AD</td>\n<td><strong>11</strong> <input type=\"text\" id=\"q11_input\" name=\"q11\"> of a mulberry tree and hemp rags</td>\n<td>ingredients were mixed with water, pressed and put outside in the sun</td>\n</tr>\n<tr>\n<td><strong>12</strong> <input type=\"text\" id=\"q12_input\" name=\"q12\"></td>\n<td>751 AD</td>\n<td>flax and hemp</td>\n<td>mills made of <strong>13</strong> <input type=\"text\" id=\"q13_input\" name=\"q13\"> were used</td>\n</tr>\n</tbody>\n</table>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-11", "answers", {"answerKey":{"q1":"D","q2":"D","q3":"C","q4":"C","q5":"B","q6":"D","q7":"A","q8":"B","q9":"royal antelope","q10":"auroch","q11":"splayed hooves","q12":"arid deserts","q13":"pronghorn"}});
+})(typeof window !== "undefined" ? window : globalThis);
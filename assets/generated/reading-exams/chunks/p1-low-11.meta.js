@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-11", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-11","meta":{"title":"Bovids 牛科动物","category":"P1","frequency":"low","pdfFilename":"108. P1 - Bovids 牛科动物.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/108. P1 - Bovids 牛科动物/","legacyFilename":"108. P1 - Bovids 牛科动物.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/108. P1 - Bovids 牛科动物/108. P1 - Bovids 牛科动物.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/108. P1 - Bovids 牛科动物/108. P1 - Bovids 牛科动物.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-11T14:43:22.009Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
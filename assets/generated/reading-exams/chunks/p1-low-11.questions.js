@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-11", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-anchor\">\n<h4>Questions 1–3</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>1</strong> In which region is the biggest range of bovids to be found?</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A Africa</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B Eurasia</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C North America</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D South-east Asia</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> Most bovids have a preference for living in</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A isolation.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B small groups.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C tropical forest.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D wide open spaces.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> Which of the following features do all bovids have in common?</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A Their horns are shed</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B They have upper incisors</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C They store food in the body</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D Their hooves are undivided</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q4","q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q4-5-6-7-8-anchor\">\n<h4>Questions 4–8</h4>\n<p>Look at the following characteristics and the list of sub-families below.</p>\n<p>Match each characteristic with the correct sub-family, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>4</strong> can endure very harsh environments</p>\n<div class=\"match-dropzone\" data-question=\"q4\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>5</strong> includes the ox and the cow</p>\n<div class=\"match-dropzone\" data-question=\"q5\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>6</strong> may supplement its diet with meat</p>\n<div class=\"match-dropzone\" data-question=\"q6\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>7</strong> can usually move at speed</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>8</strong> does not defend a particular area of land</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"options-pool\" id=\"subfamily-options-pool\">\n<strong>List of sub-families</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"subfam-A\" draggable=\"true\" data-option=\"A\">A Antelope</div>\n<div class=\"drag-item\" id=\"subfam-B\" draggable=\"true\" data-option=\"B\">B Bovinae</div>\n<div class=\"drag-item\" id=\"subfam-C\" draggable=\"true\" data-option=\"C\">C Caprinae</div>\n<div class=\"drag-item\" id=\"subfam-D\" draggable=\"true\" data-option=\"D\">D Cephalophinae</div>\n</div>\n</div>\n</div>","allowOptionReuse":true},{"groupId":"group-3","kind":"sentence_completion","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 9–13</h4>\n<p>Answer the questions below.</p>\n<p>Choose <strong>NO MORE THAN THREE WORDS</strong> from the passage for each answer.</p>\n<ul class=\"short-answer-list\">\n<li class=\"short-answer-item\">\n<p><strong>9</strong> What is the smallest species of Bovid called?</p>\n<input name=\"q9\" type=\"text\" id=\"q9_input\">\n</li>\n<li class=\"short-answer-item\">\n<p><strong>10</strong> Which species of Bovinae has now died out?</p>\n<input name=\"q10\" type=\"text\" id=\"q10_input\">\n</li>\n<li class=\"short-answer-item\">\n<p><strong>11</strong> What facilitates the movement of the sitatunga over wetland?</p>\n<input name=\"q11\" type=\"text\" id=\"q11_input\">\n</li>\n<li class=\"short-answer-item\">\n<p><strong>12</strong> What sort of terrain do barbary sheep live in?</p>\n<input name=\"q12\" type=\"text\" id=\"q12_input\">\n</li>\n<li class=\"short-answer-item\">\n<p><strong>13</strong> What is the only living member of the Antilocapridae sub-family?</p>\n<input name=\"q13\" type=\"text\" id=\"q13_input\">\n</li>\n</ul>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
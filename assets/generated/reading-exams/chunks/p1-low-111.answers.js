@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-111", "answers", {"answerKey":{"q1":"FALSE","q2":"TRUE","q3":"NOT GIVEN","q4":"NOT GIVEN","q5":"FALSE","q6":"TRUE","q7":"FALSE","q8":"FALSE","q9":"imitations","q10":"violence","q11":"political","q12":"twists","q13":"beneficial"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-111", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-8-anchor\">\n<h4>Questions 1–8</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 1–8 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> C. Auguste Dupin and Émile Gaboriau were both writers of detective stories.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> It was Conan Doyle's creation of Sherlock Holmes that made the detective story a typically British genre.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> The positive qualities of the character of Sherlock Holmes outweigh the negative qualities.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> Officials at Scotland Yard were unhappy at the way they were portrayed in the Sherlock Holmes stories.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> Sherlock Holmes is based on a real private detective who was consulted by Scotland Yard.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> Conan Doyle's work fails to reflect the reality of crime in 19th-century Britain.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>7</strong> In the 1920s and 1930s, most writers of detective stories started to include interesting female characters in their work.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>8</strong> Agatha Christie only earned a few hundred pounds for her books.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"table_completion","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 9–13</h4>\n<p>Complete the table below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<table class=\"completion-table\">\n<thead>\n<tr>\n<th colspan=\"3\">The detective story and society</th>\n</tr>\n<tr>\n<th>Country</th>\n<th>Date</th>\n<th>Key Developments</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td rowspan=\"2\">USA</td>\n<td rowspan=\"2\">1920s–1930s</td>\n<td>\n<b>Rex Stout and Ellery Queen's works:</b>\n<ul><li>were mainly unsuccessful <strong>9</strong> <input type=\"text\" id=\"q9_input\" name=\"q9\"> of British detective fiction</li></ul>\n</td>\n</tr>\n<tr>\n<td>\n<b>Hammett and Chandler's works:</b>\n<ul>\n<li>introduced the ‘tough' private detective</li>\n<li>were full of <strong>10</strong> <input type=\"text\" id=\"q10_input\" name=\"q10\"></li>\n<li>had a <strong>11</strong> <input type=\"text\" id=\"q11_input\" name=\"q11\"> message about the unfairness of society</li>\n</ul>\n</td>\n</tr>\n<tr>\n<td>Britain</td>\n<td>1950s–1960s</td>\n<td>\n<b>Writers such as P. D. James:</b>\n<ul>\n<li>wrote about police inspectors, not private detectives</li>\n<li>created stories with many <strong>12</strong> <input type=\"text\" id=\"q12_input\" name=\"q12\"></li>\n</ul>\n</td>\n</tr>\n<tr>\n<td>Britain</td>\n<td>Present day</td>\n<td>\n<b>The end of the traditional detective story reflects social changes. For example:</b>\n<ul>\n<li>scientific progress is not always seen as <strong>13</strong> <input type=\"text\" id=\"q13_input\" name=\"q13\"></li>\n<li>less trust is now placed in rationality</li>\n<li>there is more questioning of the judicial system</li>\n</ul>\n</td>\n</tr>\n</tbody>\n</table>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-112", "answers", {"answerKey":{"q1":"TRUE","q2":"FALSE","q3":"NOT GIVEN","q4":"FALSE","q5":"NOT GIVEN","q6":"TRUE","q7":"80","q8":"teeth","q9":"seabirds","q10":"Polynesian","q11":"mainland","q12":"common","q13":"2500"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-112", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-112","meta":{"title":"The Tuatara of New Zealand 新西兰蜥蜴","category":"P1","frequency":"low","pdfFilename":"26. P1 - The Tuatara of New Zealand 新西兰蜥蜴.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/26. P1 - The Tuatara of New Zealand 新西兰蜥蜴/","legacyFilename":"26. P1 - The Tuatara of New Zealand 新西兰蜥蜴.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/26. P1 - The Tuatara of New Zealand 新西兰蜥蜴/26. P1 - The Tuatara of New Zealand 新西兰蜥蜴.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/26. P1 - The Tuatara of New Zealand 新西兰蜥蜴/26. P1 - The Tuatara of New Zealand 新西兰蜥蜴.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.697Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-112", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 1–6</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 1–6 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> The two living species of tuatara look alike.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> Many tuatara bones that have been discovered are millions of years old.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> The tails of male tuatara are a different colour from those of female tuatara.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> The female tuatara lays her eggs in a burrow.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> There are more female hatchlings than male hatchlings.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> Once they have hatched, young tuatara have to look after themselves.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-11-12-13-anchor\">\n<h4>Questions 7–13</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>The tuatara</h4>\n<ul>\n<li><b>Lifespan</b></li>\n<ul>\n<li>maximum lifespan unknown</li>\n<li>many live to at least <strong>7</strong> <input type=\"text\" id=\"q7_input\" name=\"q7\"> years</li>\n</ul>\n<li><b>Behaviour</b></li>\n<ul>\n<li>attack other creatures with their <strong>8</strong> <input type=\"text\" id=\"q8_input\" name=\"q8\"></li>\n<li>eat young <strong>9</strong> <input type=\"text\" id=\"q9_input\" name=\"q9\"> that share the same burrows, as well as invertebrates and reptiles</li>\n</ul>\n<li><b>Population</b></li>\n<ul>\n<li>abundant until rats were introduced by <strong>10</strong> <input type=\"text\" id=\"q10_input\" name=\"q10\"> people</li>\n<li>by the 1840s, hardly any tuatara were found on the <strong>11</strong> <input type=\"text\" id=\"q11_input\" name=\"q11\"></li>\n<li>islands off the north-eastern coast and in Cook Strait are now home to the <strong>12</strong> <input type=\"text\" id=\"q12_input\" name=\"q12\"> tuatara</li>\n<li>Brothers Island tuatara found only on North Brother Island</li>\n<li>density of tuatara on Stephens Island is up to <strong>13</strong> <input type=\"text\" id=\"q13_input\" name=\"q13\"> per hectare</li>\n</ul>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-113", "answers", {"answerKey":{"q1":"TRUE","q2":"FALSE","q3":"FALSE","q4":"TRUE","q5":"FALSE","q6":"TRUE","q7":"NOT GIVEN","q8":"46","q9":"the human eye","q10":"Indo-European","q11":"Richard Brocklesby","q12":"the Royal Institution","q13":"gas lighting"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-113", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-113","meta":{"title":"Thomas Young The last man who knew everything 托马斯·杨","category":"P1","frequency":"low","pdfFilename":"27. P1 - Thomas Young The last man who knew everything 托马斯·杨.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/27. P1 - Thomas Young The last man who knew everything 托马斯·杨/","legacyFilename":"27. P1 - Thomas Young The last man who knew everything 托马斯·杨.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/27. P1 - Thomas Young The last man who knew everything 托马斯·杨/27. P1 - Thomas Young The last man who knew everything 托马斯·杨.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/27. P1 - Thomas Young The last man who knew everything 托马斯·杨/27. P1 - Thomas Young The last man who knew everything 托马斯·杨.pdf","ieltsHtml":"IELTS/P1/Thomas Young The last man who knew everything.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.699Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
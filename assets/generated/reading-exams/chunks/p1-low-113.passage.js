@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-113", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>Thomas Young: The last man who knew everything</h3>\n<p>In the 21st century, it would be quite impossible for even the most learned man to know everything. However, as recently as the 18th century, there were those whose knowledge encompassed most of the information available at that time. This is a review of a biography of one such man.</p>\n<p>Thomas Young (1773–1829) contributed 63 articles to the great British encyclopaedia, Encyclopaedia Britannica, including 46 biographical entries (mostly on scientists and classical scholars) and substantial essays on ‘Bridge' (a card game), ‘Egypt', ‘Languages' and 'Tides'. Was someone who could write authoritatively about so many subjects a genius, or a dilettante? In an ambitious biography, Andrew Robinson argues that Young is a good contender to be described as “the last man who knew everything”. Young has competition, however: the phrase, which Robinson uses as the title of his biography of Young, also serves as the subtitle of two other recent biographies – Leonard Warren's 1998 life of palaeontologist Joseph Leidy (1823–1891) and Paula Findlen's 2004 book on Athanasius Kircher (1602–1680).</p>\n<p>Young, of course, did more than write encyclopaedia entries. He presented his first paper, on the human eye, to the prestigious academic institution, the Royal Society of London, at the age of 20 and was elected a Fellow of the Society shortly afterwards. In the paper, which sought to explain how the eye focuses on objects at varying distances, Young hypothesised that this was achieved by changes in the shape of the lens. He also theorised that light travels in waves and believed that, to be able to see in colour, there must be three receptors in the eye corresponding to the three principal colours (red, green and violet) to which the retina could respond. All these hypotheses were subsequently proved correct.</p>\n<p>Later in his life, when he was in his forties, Young was instrumental in cracking the code that unlocked the unknown script on the Rosetta Stone, a tablet found in Egypt by the Napoleonic army in 1799. The stone has text in three alphabets: Greek, Egyptian hieroglyphs and another script that was originally unrecognisable. The unrecognisable script is now known as demotic and, as Young deduced, is directly related to Egyptian hieroglyphs. His initial work on this appeared in the Britannica entry ‘Egypt'. In another entry, Young coined the term ‘Indo-European' to describe the family of languages spoken throughout most of Europe and northern India. These works are landmark achievements for a man who was a child prodigy but who, unlike many remarkable children, did not fade into obscurity as an adult.</p>\n<p>Born in 1773 in Somerset, England, Young lived with his maternal grandfather from an early age. He devoured books from the age of two and excelled at Latin, Greek, mathematics and natural philosophy (the 18th-century term for science). After leaving school, he was greatly encouraged by Richard Brocklesby, a physician and Fellow of the Royal Society. Following Brocklesby's lead, Young decided to pursue a career in medicine. He studied in London and then moved on to more formal education in Edinburgh, Göttingen and Cambridge. After completing his medical training at the University of Cambridge in 1808, Young set up practice as a physician in London and, a few years later, was appointed physician at St George's Hospital.</p>\n<p>Young's skill as a physician, however, did not equal his talent as a scholar of natural philosophy or linguistics. In 1801, he had been appointed to a professorship of natural philosophy at the Royal Institution, where he delivered as many as 60 lectures a year. His opinions were sought by civic and national authorities on matters such as the introduction of gas lighting to London streets and methods of ship construction. From 1819, he was Superintendent of the Nautical Almanac and Secretary to the Board of Longitude. Between 1816 and 1825, he contributed many entries to the Encyclopaedia Britannica, and throughout his career he authored numerous other essays, papers and books.</p>\n<p>Young is a perfect subject for a biography – perfect, but daunting. Few men contributed so much to so many technical fields. Robinson's aim is to introduce non-scientists to Young's work and life. He succeeds, providing clear expositions of the technical material (especially that on optics and Egyptian hieroglyphs). Some readers of this book will, like Robinson, find Young's accomplishments impressive; others will see him, as some historians have, as a dilettante. Yet despite the rich material presented in this book, readers will not end up knowing Young personally. We catch glimpses of a playful Young, doodling Greek and Latin phrases in his notes on medical lectures and translating the verses that a young lady had written on the walls of a summerhouse into Greek elegiacs. Young was introduced into elite society, attended the theatre and learned to dance and play the flute. In addition, he was an accomplished horseman. However, his personal life looks pale next to his vibrant career and studies.</p>\n<p>Young married Eliza Maxwell in 1804, and according to Robinson, “their marriage was happy and she appreciated his work”. Almost all we know about her is that she sustained her husband through some acrimonious disputes about optics and that she worried about money when his medical career was slow to take off. Little evidence survives concerning the complexities of Young's relationships with his mother and father, and Robinson does not credit them with shaping Young's extraordinary mind. Despite the lack of personal detail, anyone interested in what it means to be a genius should read this book.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
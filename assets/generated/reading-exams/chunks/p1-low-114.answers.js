@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-114", "answers", {"answerKey":{"q1":"disease","q2":"political","q3":"richer","q4":"economy","q5":"museum","q6":"property","q7":"contact","q8":"consumption","q9":"FALSE","q10":"NOT GIVEN","q11":"NOT GIVEN","q12":"FALSE","q13":"TRUE"}});
+})(typeof window !== "undefined" ? window : globalThis);
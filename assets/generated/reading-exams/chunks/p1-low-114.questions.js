@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-114", "questions", {"questionGroups":[{"groupId":"group-1","kind":"sentence_completion","questionIds":["q1","q2","q3","q4","q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-8-anchor\">\n<h4>Questions 1–8</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>Cities</h4>\n<p><strong>Problems with early cities</strong></p>\n<ul>\n<li>dirt</li>\n<li><strong>1</strong> <input type=\"text\" id=\"q1_input\" name=\"q1\"></li>\n<li>but there were commercial and <strong>2</strong> <input type=\"text\" id=\"q2_input\" name=\"q2\"> reasons for improving them</li>\n</ul>\n<p><strong>Urban poverty is not a major problem because poor people</strong></p>\n<ul>\n<li>generally get <strong>3</strong> <input type=\"text\" id=\"q3_input\" name=\"q3\"></li>\n<li>help to develop the urban <strong>4</strong> <input type=\"text\" id=\"q4_input\" name=\"q4\"></li>\n</ul>\n<p><strong>Cities do have some problems – e.g.</strong></p>\n<ul>\n<li>the centre of Paris is becoming a <strong>5</strong> <input type=\"text\" id=\"q5_input\" name=\"q5\"></li>\n<li>Mumbai is negatively affected by height restrictions on new buildings.</li>\n</ul>\n<p><strong>In the US, the middle classes have moved to the suburbs due to</strong></p>\n<ul>\n<li>cheap petrol</li>\n<li>high <strong>6</strong> <input type=\"text\" id=\"q6_input\" name=\"q6\"> prices in inner cities</li>\n</ul>\n<p><strong>Disadvantages of suburbs</strong></p>\n<ul>\n<li>less personal <strong>7</strong> <input type=\"text\" id=\"q7_input\" name=\"q7\"></li>\n<li>increased <strong>8</strong> <input type=\"text\" id=\"q8_input\" name=\"q8\"> of resources such as heating – which damages the environment</li>\n</ul>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"true_false_not_given","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 9–13</h4>\n<p>Do the following statements agree with the information in Reading Passage 1?</p>\n<p>In boxes 9–13 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>9</strong> Glaeser believes that congestion and poverty in some modern cities indicate serious problems.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q9\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>10</strong> The writer Henry David Thoreau discussed the ideas of the Romantic poets in his work.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q10\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>11</strong> Emperor Napoleon III was influenced by the complaints of poor people living in Paris.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\"value=\"TRUE\"> TRUE</label> <label><input name=\"q11\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>12</strong> Strict planning regulations may be beneficial for a city's development.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q12\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>13</strong> Glaeser argues that the location of commercial development at La Défense was a bad idea.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q13\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-116", "answers", {"answerKey":{"q1":"FALSE","q2":"NOT GIVEN","q3":"TRUE","q4":"TRUE","q5":"TRUE","q6":"NOT GIVEN","q7":"FALSE","q8":"regular commuters","q9":"visual processing","q10":"secondary images","q11":"emotional value","q12":"intrusive product placement","q13":"holiday season"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-116", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-116","meta":{"title":"Advertising Needs Attention 广告的吸引力","category":"P1","frequency":"low","pdfFilename":"3. P1 - Advertising Needs Attention 广告的吸引力.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/3. P1 - Advertising Needs Attention 广告的吸引力/","legacyFilename":"3. P1 - Advertising Needs Attention 广告的吸引力.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/3. P1 - Advertising Needs Attention 广告的吸引力/3. P1 - Advertising Needs Attention 广告的吸引力.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/3. P1 - Advertising Needs Attention 广告的吸引力/3. P1 - Advertising Needs Attention 广告的吸引力.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.708Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
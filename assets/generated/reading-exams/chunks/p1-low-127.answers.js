@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-127", "answers", {"answerKey":{"q1":"C","q2":"A","q3":"D","q4":"A","q5":"C","q6":"B","q7":"beaks","q8":"vomited up","q9":"hardens","q10":"TRUE","q11":"NOT GIVEN","q12":"FALSE","q13":"NOT GIVEN"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-127", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-127","meta":{"title":"Ambergris 龙涎香","category":"P1","frequency":"low","pdfFilename":"4. P1 - Ambergris 龙涎香.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/4. P1 - Ambergris 龙涎香/","legacyFilename":"4. P1 - Ambergris 龙涎香.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/4. P1 - Ambergris 龙涎香/4. P1 - Ambergris 龙涎香.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/4. P1 - Ambergris 龙涎香/4. P1 - Ambergris 龙涎香.pdf","ieltsHtml":"IELTS/P1/Ambergris.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.261Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-127", "questions", {"questionGroups":[{"groupId":"group-1","kind":"classification","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 1–6</h4>\n<p>Classify the following statements as referring to</p>\n<ul class=\"classification-options\">\n<li><strong>A</strong> ambergris only</li>\n<li><strong>B</strong> amber only</li>\n<li><strong>C</strong> both ambergris and amber</li>\n<li><strong>D</strong> neither ambergris nor amber</li>\n</ul>\n<p>Drag and drop the correct option into the boxes for questions 1–6.<br><strong>NB</strong> You may use any option more than once.</p>\n<div class=\"match-question-item\">\n<p><strong>1</strong> very expensive</p>\n<div class=\"match-dropzone\" data-question=\"q1\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>2</strong> a food flavouring</p>\n<div class=\"match-dropzone\" data-question=\"q2\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>3</strong> used as currency</p>\n<div class=\"match-dropzone\" data-question=\"q3\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>4</strong> sweet-smelling</p>\n<div class=\"match-dropzone\" data-question=\"q4\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>5</strong> referred to by Herman Melville</p>\n<div class=\"match-dropzone\" data-question=\"q5\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>6</strong> can be seen through</p>\n<div class=\"match-dropzone\" data-question=\"q6\"></div>\n</div>\n<div class=\"options-pool\" id=\"classification-options-pool\">\n<strong>List of Options</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"option-A\" draggable=\"true\" data-option=\"A\">A ambergris only</div>\n<div class=\"drag-item\" id=\"option-B\" draggable=\"true\" data-option=\"B\">B amber only</div>\n<div class=\"drag-item\" id=\"option-C\" draggable=\"true\" data-option=\"C\">C both ambergris and amber</div>\n<div class=\"drag-item\" id=\"option-D\" draggable=\"true\" data-option=\"D\">D neither ambergris nor amber</div>\n</div>\n</div>\n</div>","allowOptionReuse":true,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"diagram_completion","questionIds":["q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-anchor\">\n<h4>Questions 7–9</h4>\n<p>Complete the flow chart below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<h5>How ambergris is formed</h5>\n<div class=\"flow-chart-box\">\nAmbergris is formed in whales because of problems digesting the <strong>7</strong> <input name=\"q7\" type=\"text\" id=\"q7_input\"> of giant squid.\n</div>\n<div class=\"flow-chart-arrow\">↓</div>\n<div class=\"flow-chart-box\">\nBlack liquid is produced and is <strong>8</strong> <input name=\"q8\" type=\"text\" id=\"q8_input\"> from time to time.\n</div>\n<div class=\"flow-chart-arrow\">↓</div>\n<div class=\"flow-chart-box\">\nThe liquid <strong>9</strong> <input name=\"q9\" type=\"text\" id=\"q9_input\"> on contact with the air.\n</div>\n</div>"},{"groupId":"group-3","kind":"true_false_not_given","questionIds":["q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<h4>Questions 10–13</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 10–13 on your answer sheet, write</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>10</strong> In the 20th century, most of the world's ambergris came from processing dead whales.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q10\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>11</strong> The value of ambergris has increased recently.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q11\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>12</strong> Ambergris remains an important ingredient in perfume.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q12\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>13</strong> New uses have recently been found for ambergris.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q13\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
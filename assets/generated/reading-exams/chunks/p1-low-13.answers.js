@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-13", "answers", {"answerKey":{"q1":"process","q2":"discussion","q3":"freewriting","q4":"script","q5":"vote","q6":"interpretations","q7":"FALSE","q8":"FALSE","q9":"NOT GIVEN","q10":"TRUE","q11":"NOT GIVEN","q12":"FALSE","q13":"TRUE"}});
+})(typeof window !== "undefined" ? window : globalThis);
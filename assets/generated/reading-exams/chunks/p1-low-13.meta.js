@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-13", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-13","meta":{"title":"Report on a university drama project 大学戏剧项目报告","category":"P1","frequency":"low","pdfFilename":"11. P1 - Report on a university drama project 大学戏剧项目报告.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/11. P1 - Report on a university drama project 大学戏剧项目报告/","legacyFilename":"11. P1 - Report on a university drama project 大学戏剧项目报告.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/11. P1 - Report on a university drama project 大学戏剧项目报告/11. P1 - Report on a university drama project 大学戏剧项目报告.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/11. P1 - Report on a university drama project 大学戏剧项目报告/11. P1 - Report on a university drama project 大学戏剧项目报告.pdf","ieltsHtml":"IELTS/P1/Report on a university drama project.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.530Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-13", "questions", {"questionGroups":[{"groupId":"group-1","kind":"diagram_completion","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 1–6</h4>\n<p>Complete the flow-chart below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"flowchart\">\n<h4>Stages in collaborative drama project</h4>\n<div class=\"flowchart-box\">\n<h5>Origin of project</h5>\n<p>Started with the wish for a collaborative project focusing on the <strong>1</strong> <input type=\"text\" id=\"q1_input\" name=\"q1\"> of producing a play</p>\n</div>\n<div class=\"flowchart-arrow\">↓</div>\n<div class=\"flowchart-box\">\n<h5>Auditions</h5>\n<p>first round: organised as several workshops – fifteen actors were then selected<br>\nsecond round: organised as a <strong>2</strong> <input type=\"text\" id=\"q2_input\" name=\"q2\"> – the final six actors were then selected</p>\n</div>\n<div class=\"flowchart-arrow\">↓</div>\n<div class=\"flowchart-box\">\n<h5>Preparation</h5>\n<p>in early rehearsals, <strong>3</strong> <input type=\"text\" id=\"q3_input\" name=\"q3\"> was found to be an effective technique<br>\nthe <strong>4</strong> <input type=\"text\" id=\"q4_input\" name=\"q4\"> was only used in later rehearsals<br>\neveryone had a <strong>5</strong> <input type=\"text\" id=\"q5_input\" name=\"q5\"> to decide which actor would play each part<br>\neveryone was shown different designs for the publicity and the best one was chosen</p>\n</div>\n<div class=\"flowchart-arrow\">↓</div>\n<div class=\"flowchart-box\">\n<h5>Performance</h5>\n<p>the variety of <strong>6</strong> <input type=\"text\" id=\"q6_input\" name=\"q6\"> was surprising</p>\n</div>\n<div class=\"flowchart-arrow\">↓</div>\n<div class=\"flowchart-box\">\n<h5>After-show question-and-answer session</h5>\n<p>this resulted in some interesting comments</p>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"true_false_not_given","questionIds":["q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-11-12-13-anchor\">\n<h4>Questions 7–13</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 7–13 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>7</strong> The writer had been involved in other collaborative theatre productions at university.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>8</strong> Each actor chosen for the project would play one role for three nights.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>9</strong> The early rehearsals took place at the university theatre.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q9\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>10</strong> The writer felt satisfied that all the actors were paired with the right partner.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q10\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>11</strong> Some team members discovered an unexpected talent for set design.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q11\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>12</strong> The original intention was to use a different stage set for each performance.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q12\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>13</strong> The question-and-answer session encouraged the team to think about their aims.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q13\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-138", "answers", {"answerKey":{"q1":"TRUE","q2":"NOT GIVEN","q3":"FALSE","q4":"NOT GIVEN","q5":"FALSE","q6":"FALSE","q7":"TRUE","q8":"symbols","q9":"titles","q10":"stencilling","q11":"books","q12":"travel","q13":"400"}});
+})(typeof window !== "undefined" ? window : globalThis);
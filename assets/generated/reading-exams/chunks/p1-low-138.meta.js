@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-138", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-138","meta":{"title":"Australian artist Margaret Preston 澳大利亚艺术家","category":"P1","frequency":"low","pdfFilename":"5. P1 - Australian artist Margaret Preston 澳大利亚艺术家.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/5. P1 - Australian artist Margaret Preston 澳大利亚艺术家/","legacyFilename":"5. P1 - Australian artist Margaret Preston 澳大利亚艺术家.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/5. P1 - Australian artist Margaret Preston 澳大利亚艺术家/5. P1 - Australian artist Margaret Preston 澳大利亚艺术家.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/5. P1 - Australian artist Margaret Preston 澳大利亚艺术家/5. P1 - Australian artist Margaret Preston 澳大利亚艺术家.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.747Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
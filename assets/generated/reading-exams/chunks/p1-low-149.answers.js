@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-149", "answers", {"answerKey":{"q1":"TRUE","q2":"NOT GIVEN","q3":"FALSE","q4":"FALSE","q5":"TRUE","q6":"TRUE","q7":"NOT GIVEN","q8":"tools","q9":"nomadic","q10":"grouped together","q11":"foodstuffs","q12":"20,000","q13":"agricultural workers"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-160", "answers", {"answerKey":{"q1":"TRUE","q2":"FALSE","q3":"NOT GIVEN","q4":"FALSE","q5":"FALSE","q6":"TRUE","q7":"germination","q8":"fruit","q9":"ripening","q10":"concentration","q11":"coat","q12":"fungus","q13":"evolution"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-160", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>Chili peppers</h3>\n<h4>Origins</h4>\n<p>Chili peppers, the fruit of the capsicum plant, are believed to have originated in what is now Bolivia in South America, home to dozens of wild species that are probably the ancestors of each and every chili variety today, from mild green peppers to fiery hot naga jolokia peppers. The chili pepper contains a heat-generating ingredient known as capsaicin, which has long been known to affect human taste buds, nerve cells and nasal membranes. People have been spicing their food with chilies for at least 8,000 years. At first they used wild chilies, adding them to potatoes, grain and corn, says Linda Perry, archaeobotanist at the Smithsonian Institution, Washington DC in the US. She has found traces of chilies on ancient stones used to grind grains, and in vessels used in food preparation from the Bahamas to southern Peru.</p>\n<p>Based on her examination of ancient pieces of pottery, Ms Perry concludes that people in the Americas began cultivating chilies more than 6,000 years ago. 'Chilies were domesticated early and spread very quickly, just because people liked them,” she says. The chilies, it would seem, made otherwise quite bland food more enjoyable to eat. Other researchers, such as Jennifer Billing and Paul Sherman of Cornell University in the US, argue that people learned early on that chilies could reduce food spoilage. And some scholars point to medical uses: ancient Mayan Indians in Central America incorporated chilies into medicinal preparations for treating wounds, stomach problems and earaches.</p>\n<h4>Spreading chili peppers around the world</h4>\n<p>Whatever the benefits, chilies spread around the world at astonishing speed, thanks in part to Christopher Columbus, who is credited with being the first European to reach America in 1492, and claiming the new land for Spain. When Columbus took chilies back to Spain, they were initially not popular, but soon became widely accepted throughout Europe. The Portuguese first encountered chilies in Brazil and carried them, along with tobacco and cotton, to Africa. By 1550, chilies were being cultivated all over the world, including in India, Japan and China.</p>\n<h4>The heat of chili peppers</h4>\n<p>When people call chilies hot, they are not just speaking metaphorically. Capsaicin stimulates the neural sensors in the tongue and skin that also detect rising temperatures. As far as these neurons and the brain are concerned, when someone eats a hot chili, the effect is the same as exposure to fire. With enough heat, adrenaline flows and the heart pumps faster. This reaction, according to some physiologists, is part of what makes peppers so stimulating and enjoyable to eat.</p>\n<p>The scale that scientists use to describe a chili's heat was developed in 1912 by Wilbur Scoville, a chemist from Detroit in the US. He diluted a chili extract in sugar water until the heat was no longer detectable to a panel of trained tasters; that threshold is the basis of the Scoville rating. A sweet bell pepper, for instance, measures zero on the Scoville Heat Unit (SHU) scale, while a typical hot jalapeno chili pepper from Mexico falls between 2,500 and 8,000 SHUs. Last year, the naga jolokia chili, grown in India, was rated at one million SHUs.</p>\n<h4>The role of capsaicin</h4>\n<p>But why would chilies have evolved to produce the varying degrees of heat of capsaicin? Chili peppers, like other fruit, lure birds and other animals to eat them and disperse their seeds. But chilies also attract predators, largely rodents like packrats and cactus mice, that crush seeds and make germination impossible. In order to deter animals from eating their seeds, many plants produce toxic or foul-tasting chemicals, but these are usually found in the plant's leaves and roots as well as its fruit. In chilies, however, capsaicin is found just in the fruit, and becomes much stronger with ripening. Joshua Tewksbury, an ecologist at the University of Washington in the US, suspected that at least one role that capsaicin performs is to protect the chili seeds from rodents.</p>\n<p>To test his theory, Tewksbury grew plants that produced hot, spicy chilies as well as plants that yielded mild chilies (though both were from the same species). When he offered the fruits of those plants to laboratory rats and mice, they ate the mild chilies but avoided the ones with a strong concentration of capsaicin. He later found that birds do not seem to mind eating even the hottest chilies and, in fact, that the capsaicin had the strange effect of retarding birds' digestion, which helps some seeds germinate, possibly by softening the seed coat. Even so, Tewksbury didn't believe that deterring rodents and slowing bird digestion were enough to explain why the spicy heat of chilies evolved. Instead, he thinks that a chili's heat protects it from disease that a certain fungus can trigger, the primary reason chili seeds die prior to being dispersed. In looking at chili populations that contain hot, spicy and mild plants, Tewksbury has found that the more capsaicin, the less fungal infection. 'Capsaicin demonstrates the incredible elegance of evolution,' says Tewksbury. 'The capsaicin discourages rodents and deters microbes – and humans harness this ability when they use chilies to preserve food – but capsaicin doesn't prevent birds from eating chili fruit and spreading seeds. Once in a while, the complex, often conflicting demands that nature places on complex traits result in a truly elegant solution. This is one of those times.'</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-160", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 1–6</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 1–6 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> Archaeological evidence from pots has helped determine when people first began to grow chilies for food.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> Linda Perry thinks mankind began using chilies in cooking largely because they kept food from spoiling.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> Christopher Columbus is said to have enjoyed the new experience of eating food spiced with chilies.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> Explorers from Portugal were introduced to chilies in Africa.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> The feeling of heat while eating chilies is a purely psychological effect rather than a physical one.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> A chemist called Scoville created a heat scale based on the collective judgement of a group of individuals.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-11-12-13-anchor\">\n<h4>Questions 7–13</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>The role of capsaicin</h4>\n<h5>Chili seeds and capsaicin</h5>\n<ul>\n<li>certain birds and other animals eat chili fruit and spread the seeds</li>\n<li>some animals destroy the seeds, preventing <strong>7</strong> <input type=\"text\" id=\"q7_input\" name=\"q7\"></li>\n<li>unlike many other plants, chilies contain an unpleasant chemical only in their <strong>8</strong> <input type=\"text\" id=\"q8_input\" name=\"q8\"></li>\n<li>the <strong>9</strong> <input type=\"text\" id=\"q9_input\" name=\"q9\"> of the chili causes an increase in capsaicin</li>\n</ul>\n<h5>Tewksbury's experiments to test the effects of capsaicin</h5>\n<ul>\n<li>chilies offered to rodents and birds in laboratory conditions</li>\n<li>rodents avoided chilies with a high <strong>10</strong> <input type=\"text\" id=\"q10_input\" name=\"q10\"> of capsaicin</li>\n<li>birds do not mind eating capsaicin\n<ul>\n<li>capsaicin slows digestion in birds</li>\n<li>this may make the <strong>11</strong> <input type=\"text\" id=\"q11_input\" name=\"q11\"> of the seed softer</li>\n</ul>\n</li>\n<li>another role of capsaicin is in reducing infection caused by a <strong>12</strong> <input type=\"text\" id=\"q12_input\" name=\"q12\"></li>\n<li>Tewksbury considers the role of capsaicin in chilies to be an example in nature of the beauty of <strong>13</strong> <input type=\"text\" id=\"q13_input\" name=\"q13\"></li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-223", "answers", {"answerKey":{"q1":"TRUE","q2":"FALSE","q3":"TRUE","q4":"NOT GIVEN","q5":"NOT GIVEN","q6":"FALSE","q7":"TRUE","q8":"floods","q9":"leaves","q10":"seventh","q11":"estimated","q12":"height","q13":"earthquake"}});
+})(typeof window !== "undefined" ? window : globalThis);
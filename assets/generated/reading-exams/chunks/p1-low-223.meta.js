@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-223", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-223","meta":{"title":"Effect and Cause 湖泊海啸研究","category":"P1","frequency":"low"}});
+})(typeof window !== "undefined" ? window : globalThis);
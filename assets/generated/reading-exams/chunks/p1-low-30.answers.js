@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-30", "answers", {"answerKey":{"q1":"FALSE","q2":"NOT GIVEN","q3":"TRUE","q4":"FALSE","q5":"TRUE","q6":"NOT GIVEN","q7":"TRUE","q8":"FALSE","q9":"centenary","q10":"staff","q11":"overseas","q12":"recorded","q13":"target"}});
+})(typeof window !== "undefined" ? window : globalThis);
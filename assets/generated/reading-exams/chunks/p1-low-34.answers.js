@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-34", "answers", {"answerKey":{"q1":"TRUE","q2":"FALSE","q3":"TRUE","q4":"NOT GIVEN","q5":"FALSE","q6":"NOT GIVEN","q7":"unique","q8":"limited","q9":"unchanging","q10":"eggs","q11":"4/four","q12":"chefs","q13":"consumers"}});
+})(typeof window !== "undefined" ? window : globalThis);
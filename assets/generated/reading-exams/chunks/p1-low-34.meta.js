@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-34", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-34","meta":{"title":"The Slow Food Organization 慢食运动组织","category":"P1","frequency":"low","pdfFilename":"129. P1 - The Slow Food Organization 慢食运动组织.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/129. P1 - The Slow Food Organization 慢食运动组织/","legacyFilename":"129. P1 - The Slow Food Organization 慢食运动组织.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/129. P1 - The Slow Food Organization 慢食运动组织/129. P1 - The Slow Food Organization 慢食运动组织.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/129. P1 - The Slow Food Organization 慢食运动组织/129. P1 - The Slow Food Organization 慢食运动组织.pdf","ieltsHtml":"IELTS/P1/The Slow Food Organization.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.564Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-34", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>The Slow Food Organization</h3>\n<h4>Taking time with food</h4>\n<p>Slow Food began when Carlo Petrini, an Italian journalist, was dismayed by the opening of a fast food restaurant on the famous Piazza di Spagna in Rome. He decided it was time to celebrate the fast-disappearing virtues of the slow production, preparation and eating of food. What he had in mind when he began the Slow Food organization were local foods which were prepared in their traditional manner and eaten at leisurely meals with family and friends. Slow Food is the antithesis of everything fast food stands for, and it is now a thriving international organization with members in 45 countries, a successful publishing operation and a biannual trade show. In addition, Slow Food has launched a project called the 'Ark of Taste' and a concept called ‘virtuous globalization'.</p>\n<p>The Ark of Taste is the catalog of endangered food plant and animal species that Slow Food has resolved to protect against the rising global tide of fast food. Some examples of the biodiversity promoted by the Ark of Taste include Iroquois white corn and the Narragansett turkey, both of which are old, or heritage, foods in North America. Biodiversity is a term commonly associated with discussions of threats to wild species, but according to Slow Food the biodiversity of the domesticated species people have depended on for centuries is no less important. For example, when the latest patented hybrid variety of plant proves unable to withstand fungal or bacterial disease, plant breeders will need the disease-resistant genes which can be obtained from heritage plant varieties. If Iroquois white corn had fallen out of production, as it very nearly did two decades ago due to the commercial launch of a new hybrid corn, irreplaceable and possibly crucial sets of corn genes would have been lost forever.</p>\n<p>For some time, plant-saver groups have been preserving heritage plant varieties, but Slow Food takes that project a step further. The movement understands that all the food and plant species in its Ark of Taste carry not only information about genetic traits but they also embody a set of social practices, and in some cases even a way of life of previous generations. Slow Food teaches that when a variety of food or breed of animal disappears, something greater also disappears: a specific, irreplaceable mode of life that a particular people have devised for living in a particular part of the Earth. An example of this is the Iroquois white corn. By working to find new markets for this ancient variety of corn, Slow Food is ensuring a source of income for the Native Americans who grow, roast, and grind this corn and, at the same time, helping to preserve the specific cookery and religious uses that the corn has been selected to support over hundreds of years.</p>\n<p>Slow Food has moved away from the traditional locations for preserving rare animal and plant species. For example, instead of zoos for rare animals and botanic gardens for rare plants, Slow Food maintains that its plants and animals are best preserved on the dishes and plates of discerning customers. To this end, Slow Food has introduced the concept of virtuous globalization, which recognizes that the best way to ensure a safe future for distinctive local products and practices is to find a global market for them. In this way, local producers will be able to continue producing the food which for many years has been a defining factor of their cultural identity. The characteristics of the virtuous globalization of Slow Foods show how different the concept is from the globalization of fast foods. Whereas global fast food companies aim to sell food that has an unchanging taste wherever in the world it is eaten, the taste of a recognized Slow Food is unique to that food. Another aspect is the quantities sold of these two types of food. In the case of fast food, these are enormous, but the quantities of Slow Food products which are available for selling are limited, due to the rarity of the plants or animals. The customers of virtuous globalization Slow Foods are affluent people who value novelty and are undeterred by the costs, which are high when compared to fast food.</p>\n<p>Some years ago, a network of farmers in the USA volunteered to take part in a national Slow Food project. The project was for the farmers to raise a total of 5,000 turkeys from eggs which had been selected from four varieties of endangered turkey. The farmers had to begin by hatching the eggs they had been supplied with, then raising the young turkeys to adults. They were promised a guaranteed price per pound for the adult turkeys. The object of the enterprise was to raise heritage turkeys for the North American holiday of Thanksgiving. Although chefs in some restaurants where the turkeys were on the menu complained that the Slow Food turkeys were smaller than industrially produced turkeys, the distinctive flavors were very well received by consumers. By the following year, the world population of these turkeys had nearly doubled.</p>\n<p>It may seem strange that taking pleasure in eating could be a strategy for preserving biodiversity because pleasure is not normally associated with environmentalism. However, pleasure is part of what Slow Food aims to bring back, by demonstrating that, at least when it comes to the politics of food, the best choice is often the one that provides the most enjoyment.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-34", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 1–6</h4>\n<p>Do the following statements agree with the information in Reading Passage 1?</p>\n<p>In boxes 1–6 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> The Ark of Taste lists food plant and animal species in danger of extinction.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> Slow Food considers that the term ‘biodiversity’ should be restricted to wild species.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> The genes of heritage plants may be of vital importance to modern plant breeders.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> Countries can sell the genes of their heritage plant varieties internationally.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> Slow Food maintains that food and culture exist independently of each other.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> Some Native Americans are now giving cookery classes featuring Iroquois white corn.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"table_completion","questionIds":["q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-anchor\">\n<h4>Questions 7–9</h4>\n<p>Complete the table below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<table class=\"completion-table\">\n<thead>\n<tr>\n<th></th>\n<th>Taste</th>\n<th>Quantities sold</th>\n<th>Cost</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>Slow food</strong></td>\n<td><strong>7 </strong> <input type=\"text\" id=\"q7_input\" name=\"q7\"></td>\n<td><strong>8 </strong> <input type=\"text\" id=\"q8_input\" name=\"q8\"></td>\n<td>high</td>\n</tr>\n<tr>\n<td><strong>Fast food</strong></td>\n<td><strong>9 </strong> <input type=\"text\" id=\"q9_input\" name=\"q9\"></td>\n<td>enormous</td>\n<td>low</td>\n</tr>\n</tbody>\n</table>\n</div>"},{"groupId":"group-3","kind":"sentence_completion","questionIds":["q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<h4>Questions 10–13</h4>\n<p>Answer the questions below.</p>\n<p>Choose <strong>ONE WORD AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"question-item\">\n<p><strong>10</strong> What were farmers in the USA given so that they could raise endangered turkeys?</p>\n<input type=\"text\" id=\"q10_input\" name=\"q10\">\n</div>\n<div class=\"question-item\">\n<p><strong>11</strong> How many varieties of endangered turkey benefited from the project?</p>\n<input type=\"text\" id=\"q11_input\" name=\"q11\">\n</div>\n<div class=\"question-item\">\n<p><strong>12</strong> Who was not happy with the size of the turkeys?</p>\n<input type=\"text\" id=\"q12_input\" name=\"q12\">\n</div>\n<div class=\"question-item\">\n<p><strong>13</strong> Who liked the taste of the endangered turkeys?</p>\n<input type=\"text\" id=\"q13_input\" name=\"q13\">\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
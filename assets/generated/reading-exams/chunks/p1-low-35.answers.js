@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-35", "answers", {"answerKey":{"q1":"B","q2":"F","q3":"C","q4":"A","q5":"D","q6":"A","q7":"D","q8":"B","q9":"TRUE","q10":"NOT GIVEN","q11":"FALSE","q12":"NOT GIVEN","q13":"FALSE"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-35", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-35","meta":{"title":"Sweet Trouble 澳洲制糖产业","category":"P1","frequency":"low","pdfFilename":"13. P1 - Sweet Trouble 澳洲制糖产业.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/13. P1 - Sweet Trouble 澳洲制糖产业/","legacyFilename":"13. P1 - Sweet Trouble 澳洲制糖产业.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/13. P1 - Sweet Trouble 澳洲制糖产业/13. P1 - Sweet Trouble 澳洲制糖产业.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/13. P1 - Sweet Trouble 澳洲制糖产业/13. P1 - Sweet Trouble 澳洲制糖产业.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.567Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
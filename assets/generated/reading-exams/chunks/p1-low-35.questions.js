@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-35", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 1–4</h4>\n<p>Look at the following statements (Questions 1–4) and the list of people below.</p>\n<p>Match each statement with the correct person, <strong>A–F</strong>.</p>\n<p><em>Write the correct letter, <strong>A–F</strong>, in boxes 1–4 on your answer sheet.</em></p>\n<div class=\"match-question-item\">\n<p><strong>1</strong> Mossman cane-farming practices are close to an environmentally friendly model.</p>\n<div class=\"match-dropzone\" data-question=\"q1\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>2</strong> Financial return is not the only important factor for cane growers.</p>\n<div class=\"match-dropzone\" data-question=\"q2\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>3</strong> Cane sugar may not harm the environment as much as other crops do.</p>\n<div class=\"match-dropzone\" data-question=\"q3\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>4</strong> The local population would decline if the sugar-processing plant closed.</p>\n<div class=\"match-dropzone\" data-question=\"q4\"></div>\n</div>\n<div class=\"options-pool\" id=\"people-options-pool\">\n<strong>List of People</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Bill Phillips-Turner</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Mike Berwick</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Karen Benn</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Brian Roberts</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Tom Watters</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F Doug Crees</div>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-anchor\">\n<h4>Questions 5–8</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<ul>\n<li>\n<p><strong>5</strong> In the first paragraph, the writer says that the town is ‘holding its breath’ because</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q5\" value=\"A\"> A it has environmental problems.</label> <label><input type=\"radio\" name=\"q5\" value=\"B\"> B its tourism business is threatened.</label> <label><input type=\"radio\" name=\"q5\" value=\"C\"> C most of its people have left the town.</label> <label><input type=\"radio\" name=\"q5\" value=\"D\"> D a key processing plant may shut down.</label>\n</div>\n</li>\n<li>\n<p><strong>6</strong> According to the writer, cane growers who refuse the Government offer are expected to</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q6\" value=\"A\"> A expand their farms.</label> <label><input type=\"radio\" name=\"q6\" value=\"B\"> B sell their land at a low price.</label> <label><input type=\"radio\" name=\"q6\" value=\"C\"> C find jobs in other industries.</label> <label><input type=\"radio\" name=\"q6\" value=\"D\"> D seek financial help from banks.</label>\n</div>\n</li>\n<li>\n<p><strong>7</strong> Which of the following did Bill Phillips-Turner find most difficult to do?</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q7\" value=\"A\"> A sell mill property</label> <label><input type=\"radio\" name=\"q7\" value=\"B\"> B reduce spending on upkeep</label> <label><input type=\"radio\" name=\"q7\" value=\"C\"> C lower mill workers' wages</label> <label><input type=\"radio\" name=\"q7\" value=\"D\"> D cut the number of mill staff</label>\n</div>\n</li>\n<li>\n<p><strong>8</strong> Cane grower Doug Crees says that he</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q8\" value=\"A\"> A would prefer to grow cocoa.</label> <label><input type=\"radio\" name=\"q8\" value=\"B\"> B wants to remain on his farm.</label> <label><input type=\"radio\" name=\"q8\" value=\"C\"> C wants his family to live together.</label> <label><input type=\"radio\" name=\"q8\" value=\"D\"> D will look for part-time work in town.</label>\n</div>\n</li>\n</ul>\n</div>"},{"groupId":"group-3","kind":"true_false_not_given","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 9–13</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 9–13 on your answer sheet, write</p>\n<p>\n<strong>TRUE</strong> if the statement agrees with the information<br>\n<strong>FALSE</strong> if the statement contradicts the information<br>\n<strong>NOT GIVEN</strong> if there is no information on this\n</p>\n<ul>\n<li>\n<p><strong>9</strong> In 2004, the cost of producing sugar in Australia was similar to the selling price.</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q9\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q9\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q9\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</li>\n<li>\n<p><strong>10</strong> Farmers who accepted the Government offer have mostly moved to the city.</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q10\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q10\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q10\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</li>\n<li>\n<p><strong>11</strong> Fuel production is regarded as the most desirable alternative business for the sugar mill.</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q11\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q11\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q11\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</li>\n<li>\n<p><strong>12</strong> Tom Watters reduced his use of pesticides.</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q12\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q12\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q12\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</li>\n<li>\n<p><strong>13</strong> Environmentally friendly farming practices have been profitable for Tom Watters.</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q13\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q13\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q13\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</li>\n</ul>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
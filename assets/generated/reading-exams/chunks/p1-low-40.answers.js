@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-40", "answers", {"answerKey":{"q1":"TRUE","q2":"FALSE","q3":"TRUE","q4":"NOT GIVEN","q5":"FALSE","q6":"NOT GIVEN","q7":"FALSE","q8":"TRUE","q9":"shellfish","q10":"insects","q11":"blackberries","q12":"beehives","q13":"chemistry"}});
+})(typeof window !== "undefined" ? window : globalThis);
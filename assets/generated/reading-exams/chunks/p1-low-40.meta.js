@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-40", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-40","meta":{"title":"Dyes and fabric dyeing 染料的历史","category":"P1","frequency":"low","pdfFilename":"134. P1 - Dyes and fabric dyeing 染料的历史.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/134. P1 - Dyes and fabric dyeing 染料的历史/","legacyFilename":"134. P1 - Dyes and fabric dyeing 染料的历史.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/134. P1 - Dyes and fabric dyeing 染料的历史/134. P1 - Dyes and fabric dyeing 染料的历史.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/134. P1 - Dyes and fabric dyeing 染料的历史/134. P1 - Dyes and fabric dyeing 染料的历史.pdf","ieltsHtml":"IELTS/P1/Dyes and fabric dyeing.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.579Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
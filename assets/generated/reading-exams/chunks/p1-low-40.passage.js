@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-40", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>Dyes and fabric dyeing</h3>\n<p>When primitive people began using their hands to be creative, they began to add color to their lives. They used natural materials like ochre to stain animal hides, decorate shells and feathers, and paint on the walls of caves. Ochre is a naturally occurring brownish-yellow earth containing iron oxide. Scientists have been able to date the black, white, yellow and reddish pigments made from ochre, used in cave paintings, to over 15,000 BCE. With the development of fixed settlements and agriculture, around 7,000 to 2,000 BCE, people began to produce fabrics, and used natural substances such as ochre to color them.</p>\n<p>Natural dyes, or dyes made from substances found in nature, can be broken down into two categories: substantive and adjective. Substantive, or direct dyes, become fixed to fibers without the aid of any other chemicals or additives. Adjective dyes require a mordant (usually a metal salt), which acts as a fixative and prevents the color from washing out or being bleached by sunlight. Most natural dyes are adjective dyes, and require the application of a mordant solution to the fibers at some point in the dyeing process.</p>\n<p>Historically, three natural fibers were used in making fabrics: wool, silk and cotton. Wool fabric remains have been found in Europe dating back to 2,000 BCE. It was a common medieval fabric worn in both dyed and natural colors and was processed by both professional manufacturers and by people in their own homes. Silk was imported from China to Europe, and in the 14th to 16th centuries major silk manufacturing centers were set up in France, Spain and Italy. These silk production centers also became centers of dye technology, as most silk was dyed and required the highest quality dyes available. Cotton was considered a luxury fabric in Europe, as it was imported all the way from India and was dyed before it was shipped. Cotton was also valued because of the brightness and colorfastness of the dyes used to color it.</p>\n<p>Dyes that gave fabrics a good bright color and were able to withstand washing and exposure to sunlight without losing their color were highly prized. The names of some of these valued and traded colors are still familiar today. The color known as Tyrian purple, for example, originated in the Mediterranean 2,000 years ago, and cochineal is the name given to the red dye from Latin America. Both of these colors came from animals; the mucus found in certain species of shellfish produced the deep, rich Tyrian purple and cochineal was extracted from insects. Two other natural sources of color were saffron and indigo. Saffron, the base of yellow dyes, comes from the flowers of a particular kind of crocus which is thought to have first been cultivated on Crete in the eastern Mediterranean. The leaves of a plant native to India were used to produce indigo, which was the main source of the color blue.</p>\n<p>As societies developed over the centuries, the demand for dyes and dyed fabric grew, and by the 17th century a worldwide shipping and trading network was in place, allowing dyestuffs from all parts of the world to be brought to Europe. This meant that numerous dyestuffs could be blended to create a variety of colors for the rich and powerful. Fiber dyeing in the lower classes was a bit more restrictive. Without the money to buy exotic imported dyes, clothing in the countryside tended to be black, brown, grey and tan. Country people had some resources they could use to get a wider range of colors. They had always used local plants as food, and many of these plants were also used as medicines and in some cases as sources of dyes. Home dyers used any plants they could find that would give a good color. People who picked blackberries to make jam soon recognized this wild fruit as a source for a blue dye. Washing beehives in preparation for making mead (a popular drink containing honey) yielded a liquid that could be used as a yellow dye. The mosses which grow in many parts of Europe were used to produce green dye.</p>\n<p>With the tremendous rise of interest in chemistry in the mid-19th century, several important innovations in dyeing came about. W. H. Perkin, a student of celebrated European scientist Wilhelm von Hofmann, accidentally discovered the first synthetic dye, later called mauve. The color was so popular that Perkin was able to open a factory of his own and went on to develop more synthetic dye colors. Synthetic dye production grew in Europe, and hardly a year passed until the end of the century without a new synthetic dye being patented.</p>\n<p>Eventually, the old natural dyes lost popularity in favor of the newer synthetic ones, and now the use of natural dyes on a commercial scale only exists in a few remote areas where people have either little access to synthetic dyes or a vested interest in retaining their ancient dyeing customs.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-45", "answers", {"answerKey":{"q1":"TRUE","q2":"NOT GIVEN","q3":"NOT GIVEN","q4":"TRUE","q5":"energy","q6":"summer","q7":"short","q8":"fires","q9":"sunrise","q10":"temperature","q11":"sleeplessness","q12":"overweight","q13":"hearts"}});
+})(typeof window !== "undefined" ? window : globalThis);
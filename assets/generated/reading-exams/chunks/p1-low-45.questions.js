@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-45", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 1–4</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 1–4 on your answer sheet, write</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> Scientists studied hunter-gatherer societies because their sleep patterns are assumed to be similar to those of humans more than 10,000 years ago.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> The medical devices used in the research were specially designed for humid conditions.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> Researchers found that tribespeople stayed longer in bed than inhabitants of industrialised regions.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> Jerome Siegel believes that environment and culture have little effect on sleep patterns.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q5","q6","q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-9-10-11-12-13-anchor\">\n<h4>Questions 5–13</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>New Evidence on Sleep Patterns</h4>\n<h5>New ideas about napping</h5>\n<ul>\n<li>scientists have recorded an afternoon drop in <strong>5</strong> <input type=\"text\" id=\"q5_input\" name=\"q5\"></li>\n<li>studies of hunter-gatherer societies show that napping was rare and occurred more often during the <strong>6</strong> <input type=\"text\" id=\"q6_input\" name=\"q6\"></li>\n<li>the devices may not have detected <strong>7</strong> <input type=\"text\" id=\"q7_input\" name=\"q7\"> naps</li>\n</ul>\n<h5>Daily activity cycles</h5>\n<ul>\n<li>the tribespeople went to sleep several hours after sunset</li>\n<li>even with <strong>8</strong> <input type=\"text\" id=\"q8_input\" name=\"q8\"> there was little light</li>\n<li>tribespeople usually woke up around <strong>9</strong> <input type=\"text\" id=\"q9_input\" name=\"q9\"></li>\n<li>scientists found that <strong>10</strong> <input type=\"text\" id=\"q10_input\" name=\"q10\"> had almost as much influence on sleep patterns as light</li>\n</ul>\n<h5>Differences between tribespeople and people in industrialised regions</h5>\n<ul>\n<li><strong>11</strong> <input type=\"text\" id=\"q11_input\" name=\"q11\"> is something that very few of the tribespeople suffered from</li>\n<li>the environment of tribespeople may have been more suitable for sleep</li>\n<li>tribespeople had better fitness than industrialised populations and were not <strong>12</strong> <input type=\"text\" id=\"q12_input\" name=\"q12\"></li>\n<li>tribespeople also had stronger <strong>13</strong> <input type=\"text\" id=\"q13_input\" name=\"q13\"></li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-46", "answers", {"answerKey":{"q1":"FALSE","q2":"FALSE","q3":"TRUE","q4":"NOT GIVEN","q5":"TRUE","q6":"TRUE","q7":"FALSE","q8":"102 million","q9":"sweden","q10":"granite","q11":"four","q12":"forecourt","q13":"harbour"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-46", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-46","meta":{"title":"Sydney Opera House 悉尼歌剧院","category":"P1","frequency":"low","pdfFilename":"14. P1 - Sydney Opera House 悉尼歌剧院.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/14. P1 - Sydney Opera House 悉尼歌剧院/","legacyFilename":"14. P1 - Sydney Opera House 悉尼歌剧院.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/14. P1 - Sydney Opera House 悉尼歌剧院/14. P1 - Sydney Opera House 悉尼歌剧院.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/14. P1 - Sydney Opera House 悉尼歌剧院/14. P1 - Sydney Opera House 悉尼歌剧院.pdf","ieltsHtml":"IELTS/P1/Sydney Opera House.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.589Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
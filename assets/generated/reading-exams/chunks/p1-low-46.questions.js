@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-46", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 1–7</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 1–7 on your answer sheet, write</p>\n<p>\n<strong>TRUE</strong> if the statement agrees with the information<br>\n<strong>FALSE</strong> if the statement contradicts the information<br>\n<strong>NOT GIVEN</strong> if there is no information on this\n</p>\n<div class=\"question-item\">\n<p><strong>1</strong> Utzon was famous for his work before he designed the Opera House.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q1\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q1\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q1\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> Utzon's design was favoured by the four judges of the competition from the beginning.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q2\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q2\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q2\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> Utzon's knowledge of boats gave him the idea for parts of the Opera House.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q3\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q3\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q3\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> Utzon was impressed by the opera houses he had seen in Mexico.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q4\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q4\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q4\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> Utzon changed his designs in the 1960s after construction began.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q5\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q5\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q5\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> Seidler defended Utzon's role as architect.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q6\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q6\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q6\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>7</strong> Utzon went back to Australia in 1973 for the opening of the Opera House.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q7\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q7\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q7\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Questions 8–13</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>Sydney Opera House</h4>\n<ul>\n<li><strong>Final cost</strong>\n<ul>\n<li><strong>8</strong> $ <input name=\"q8\" type=\"text\" class=\"blank\" id=\"q8_input\"></li>\n</ul>\n</li>\n<li><strong>Construction</strong>\n<ul>\n<li>A large platform acting as a base for the building</li>\n<li>Concrete panels used to make 'shells', which are covered in tiles</li>\n<li>Over a million tiles from <strong>9</strong> <input name=\"q9\" type=\"text\" class=\"blank\" id=\"q9_input\"></li>\n<li><strong>10</strong> <input name=\"q10\" type=\"text\" class=\"blank\" id=\"q10_input\"> from Australia covering the outside walls</li>\n</ul>\n</li>\n<li><strong>Use</strong>\n<ul>\n<li>More than 1,500 performances annually</li>\n<li><strong>11</strong> <input name=\"q11\" type=\"text\" class=\"blank\" id=\"q11_input\"> performing-arts companies have their home base at the Opera House</li>\n</ul>\n</li>\n<li><strong>Outside</strong>\n<ul>\n<li>A large <strong>12</strong> <input name=\"q12\" type=\"text\" class=\"blank\" id=\"q12_input\"> at the foot of a wide staircase</li>\n</ul>\n</li>\n<li><strong>Alterations</strong>\n<ul>\n<li>A colonnade was added in 2006</li>\n<li>Openings made the <strong>13</strong> <input name=\"q13\" type=\"text\" class=\"blank\" id=\"q13_input\"> visible from foyers</li>\n</ul>\n</li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-47", "answers", {"answerKey":{"q1":"TRUE","q2":"NOT GIVEN","q3":"TRUE","q4":"FALSE","q5":"FALSE","q6":"Cambrian explosion","q7":"railway","q8":"1979","q9":"evolution","q10":"fan","q11":"food","q12":"leech","q13":"move"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-47", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-47","meta":{"title":"The Burgess Shale fossils 伯吉斯页岩","category":"P1","frequency":"low","pdfFilename":"140. P1 - The Burgess Shale fossils 伯吉斯页岩.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/140. P1 - The Burgess Shale fossils 伯吉斯页岩/","legacyFilename":"140. P1 - The Burgess Shale fossils 伯吉斯页岩.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/140. P1 - The Burgess Shale fossils 伯吉斯页岩/140. P1 - The Burgess Shale fossils 伯吉斯页岩.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/140. P1 - The Burgess Shale fossils 伯吉斯页岩/140. P1 - The Burgess Shale fossils 伯吉斯页岩.pdf","ieltsHtml":"IELTS/P1/The Burgess Shale fossils.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.590Z","notes":"signature:radio,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
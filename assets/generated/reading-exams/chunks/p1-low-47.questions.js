@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-47", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 1–5</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 1–5 on your answer sheet, write</p>\n<ul style=\"list-style-type: none; padding-left: 0;\">\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\" id=\"q1-anchor\">\n<p><strong>1</strong> The Burgess Shale became widely known to the public because of Gould's book.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q2-anchor\">\n<p><strong>2</strong> Charles Walcott had to get permission from Canadian authorities to gain access to the fossil site.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q3-anchor\">\n<p><strong>3</strong> The Burgess Shale includes impressions of soft and hard body parts.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q4-anchor\">\n<p><strong>4</strong> The Burgess Shale creatures were land animals.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q5-anchor\">\n<p><strong>5</strong> Researchers now believe that Hallucigenia is unrelated to any modern creature.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"short_answer","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 6–9</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"notes-section\">\n<h4 style=\"text-align: center; margin-bottom: 20px;\">Burgess Shale</h4>\n<h5>Formation</h5>\n<p>• Burgess Shale was formed following a time called the <strong>6</strong> <input class=\"blank\" name=\"q6\"></p>\n<h5>Discovery and investigation in the twentieth century</h5>\n<p>• Discovered in 1909</p>\n<p>• Charles Walcott learnt of the fossil finds from people building a <strong>7</strong> <input class=\"blank\" name=\"q7\"></p>\n<p>• The first work on Burgess Shale was undertaken at the start of the century</p>\n<p>• A researcher looked at Burgess Shale findings again in <strong>8</strong> <input class=\"blank\" name=\"q8\"></p>\n<h5>Recent theories</h5>\n<p>• Peter Van Roy</p>\n<p style=\"padding-left: 20px;\">– Believes that discoveries in Morocco show that the <strong>9</strong> <input class=\"blank\" name=\"q9\"> of complex life forms continued</p>\n</div>\n</div>"},{"groupId":"group-3","kind":"table_completion","questionIds":["q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<h4>Questions 10–13</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"table-section\">\n<h4 style=\"text-align: center; margin-bottom: 20px;\">Burgess Shale Creatures</h4>\n<table>\n<thead>\n<tr>\n<th>Name</th>\n<th>Feature</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>Opabinia</strong></td>\n<td>\n<ul>\n<li>Five eyes</li>\n<li>Tail resembling a <strong>10</strong> <input class=\"blank\" name=\"q10\"></li>\n<li>Claws used to hold <strong>11</strong> <input class=\"blank\" name=\"q11\"></li>\n</ul>\n</td>\n</tr>\n<tr>\n<td><strong>Nectocaris</strong></td>\n<td>\n<ul>\n<li>Looked like a <strong>12</strong> <input class=\"blank\" name=\"q12\"></li>\n<li>Fins</li>\n<li>Tentacles</li>\n</ul>\n</td>\n</tr>\n<tr>\n<td><strong>Hallucigenia</strong></td>\n<td>\n<ul>\n<li>Spines used to <strong>13</strong> <input class=\"blank\" name=\"q13\"></li>\n<li>Tentacles</li>\n</ul>\n</td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
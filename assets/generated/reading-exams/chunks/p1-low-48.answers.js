@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-48", "answers", {"answerKey":{"q1":"FALSE","q2":"TRUE","q3":"NOT GIVEN","q4":"NOT GIVEN","q5":"TRUE","q6":"FALSE","q7":"chartar","q8":"body","q9":"volume","q10":"America","q11":"steel","q12":"pickups","q13":"Gibson"}});
+})(typeof window !== "undefined" ? window : globalThis);
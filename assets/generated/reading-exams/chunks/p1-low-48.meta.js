@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-48", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-48","meta":{"title":"The history of the guitar 吉他的历史","category":"P1","frequency":"low","pdfFilename":"","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/141. P1 - The history of the guitar 吉他的历史/","legacyFilename":"141. P1 - The history of the guitar 吉他的历史.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/141. P1 - The history of the guitar 吉他的历史/141. P1 - The history of the guitar 吉他的历史.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/141. P1 - The history of the guitar 吉他的历史/","ieltsHtml":"IELTS/P1/The history of the guitar.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.592Z","notes":"signature:radio,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
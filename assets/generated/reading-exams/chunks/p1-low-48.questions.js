@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-48", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 1–6</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 1–6 on your answer sheet, write</p>\n<ul style=\"list-style-type: none; padding-left: 0;\">\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\" id=\"q1-anchor\">\n<p><strong>1</strong> The instrument found in Queen Shub-Ad's tomb is the world's oldest known version of a harp.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q2-anchor\">\n<p><strong>2</strong> Today's Afghan panchtar is very similar to an ancient Mesopotamian instrument.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q3-anchor\">\n<p><strong>3</strong> The Egyptian singer Har-Mose was an excellent tanbur player.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q4-anchor\">\n<p><strong>4</strong> The Cairo Archaeological Museum contains many historic musical instruments.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q5-anchor\">\n<p><strong>5</strong> The instrument carved in stone at Alaca Huyuk is consistent with Dr Michael Kasha's definition of a guitar.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q6-anchor\">\n<p><strong>6</strong> The different instruments that appeared in medieval literature had the same number of strings.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"table_completion","questionIds":["q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-11-12-13-anchor\">\n<h4>Questions 7–13</h4>\n<p>Complete the table below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"table-section\">\n<h4 style=\"text-align: center; margin-bottom: 20px;\">The development of the guitar</h4>\n<table>\n<thead>\n<tr>\n<th>Date</th>\n<th>Type of instrument</th>\n<th>Notes</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td>13th–19th century</td>\n<td>Chitarra</td>\n<td>\n<ul>\n<li>was a development of an earlier instrument called the <strong>7</strong> <input class=\"blank\" name=\"q7\"></li>\n<li>extra strings added in the 16th century in Italy</li>\n</ul>\n</td>\n</tr>\n<tr>\n<td>from around the 1850s</td>\n<td>Classical guitar</td>\n<td>\n<ul>\n<li>its shape a result of modifications, including a larger <strong>8</strong> <input class=\"blank\" name=\"q8\"> introduced by Antonio Torres</li>\n<li>changes produced better tone and greater <strong>9</strong> <input class=\"blank\" name=\"q9\"></li>\n</ul>\n</td>\n</tr>\n<tr>\n<td>—</td>\n<td>X-braced top guitar</td>\n<td>\n<ul>\n<li>first made in <strong>10</strong> <input class=\"blank\" name=\"q10\"> in the mid-19th century</li>\n<li>strings made of <strong>11</strong> <input class=\"blank\" name=\"q11\"> became available around 1900</li>\n</ul>\n</td>\n</tr>\n<tr>\n<td>1920s onwards</td>\n<td>Electric guitar</td>\n<td>\n<ul>\n<li>in the 1920s, <strong>12</strong> <input class=\"blank\" name=\"q12\"> were added to guitars</li>\n<li>a well-known version was brought out by <strong>13</strong> <input class=\"blank\" name=\"q13\"></li>\n</ul>\n</td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-52", "answers", {"answerKey":{"q1":"FALSE","q2":"TRUE","q3":"FALSE","q4":"TRUE","q5":"NOT GIVEN","q6":"FALSE","q7":"seeds","q8":"shells","q9":"fish","q10":"canals","q11":"maize","q12":"cotton","q13":"flotation"}});
+})(typeof window !== "undefined" ? window : globalThis);
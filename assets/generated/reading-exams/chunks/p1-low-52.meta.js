@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-52", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-52","meta":{"title":"Caral an ancient South American city 卡拉尔古城","category":"P1","frequency":"low","pdfFilename":"145. P1 - Caral an ancient South American city 卡拉尔古城.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/145. P1 - Caral an ancient South American city 卡拉尔古城/","legacyFilename":"145. P1 - Caral an ancient South American city 卡拉尔古城.html","questionIntroHtml":"<h3>Questions 1–6</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/145. P1 - Caral an ancient South American city 卡拉尔古城/145. P1 - Caral an ancient South American city 卡拉尔古城.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/145. P1 - Caral an ancient South American city 卡拉尔古城/145. P1 - Caral an ancient South American city 卡拉尔古城.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.600Z","notes":"signature:radio,text,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-52", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 1–6 on your answer sheet, write</p>\n<ul style=\"list-style-type: none; padding-left: 0;\">\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> Caral was built at the same time as the construction of the Egyptian pyramids.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> The absence of pottery at the archaeological dig gave Shady a significant clue to the age of the site.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> The stones used to build Piramide Mayor came from a location far away.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> The huge and complicated structures of Piramide Mayor suggest that its construction required an organised team of builders.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> Archaeological evidence shows that the residents of Caral were highly skilled musicians.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> The remains of housing areas at Caral suggest that there were no class distinctions in residential areas.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions 1–6</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-11-12-13-anchor\">\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>Caral as a trading centre</h4>\n<p><strong>Items discovered at Caral but not naturally occurring in the area</strong></p>\n<ul>\n<li>the <strong>7</strong> <input type=\"text\" id=\"q7_input\" maxlength=\"20\" name=\"q7\"> of a certain plant</li>\n<li><strong>8</strong> <input type=\"text\" id=\"q8_input\" maxlength=\"20\" name=\"q8\"> used to make jewellery</li>\n<li>the remains of certain food such as <strong>9</strong> <input type=\"text\" id=\"q9_input\" maxlength=\"20\" name=\"q9\"></li>\n</ul>\n<p><strong>Clues to farming around Caral</strong></p>\n<ul>\n<li><strong>10</strong> <input type=\"text\" id=\"q10_input\" maxlength=\"20\" name=\"q10\"> still in existence today indicate water diverted from rivers</li>\n<li>no evidence that <strong>11</strong> <input type=\"text\" id=\"q11_input\" maxlength=\"20\" name=\"q11\"> was grown</li>\n</ul>\n<p><strong>Evidence of relationship with fishing communities</strong></p>\n<ul>\n<li>the excavation findings and fishing nets found on the coast suggest Caral farmers traded <strong>12</strong> <input type=\"text\" id=\"q12_input\" maxlength=\"20\" name=\"q12\"></li>\n<li>dried squash may have been used to aid <strong>13</strong> <input type=\"text\" id=\"q13_input\" maxlength=\"20\" name=\"q13\"> of fishing nets</li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-53", "answers", {"answerKey":{"q1":"TRUE","q2":"FALSE","q3":"TRUE","q4":"NOT GIVEN","q5":"TRUE","q6":"NOT GIVEN","q7":"beating","q8":"bags","q9":"salt","q10":"pollution","q11":"floors","q12":"leather","q13":"pesticide"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-53", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Do the following statements agree with the information given in Reading Passage 1?</h4>\n<p>In boxes 1–6 on your answer sheet, write:</p>\n<ul style=\"list-style-position: inside; padding-left: 0; margin-bottom: 1rem;\">\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> In the cultivation of olives, a period without rain is advantageous.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> The most fertile fields are usually chosen for growing olives.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> In ancient Greece, the olive tree was said to have divine origins.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> Olive oil was more costly to buy in Greece than gold.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> Plato mentions the use of olive oil in the preparation of food.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> North African farmers initially resisted the introduction of olive trees.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions 1–6</h3>"},{"groupId":"group-2","kind":"diagram_completion","questionIds":["q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-anchor\">\n<h4>Complete the flow-chart below.</h4>\n<p>Write <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>Ancient olive oil processing</h4>\n<div class=\"flowchart-box\">olives are harvested by picking them or <strong>7</strong><input type=\"text\" id=\"q7_input\" name=\"q7\"> the trees</div>\n<div class=\"flowchart-arrow\">↓</div>\n<div class=\"flowchart-box\">milling stage</div>\n<div class=\"flowchart-arrow\">↓</div>\n<div class=\"flowchart-box\">olives are washed and crushed, and seeds removed</div>\n<div class=\"flowchart-arrow\">↓</div>\n<div class=\"flowchart-box\">olive flesh is placed in <strong>8</strong><input type=\"text\" id=\"q8_input\" name=\"q8\"> and pressed</div>\n<div class=\"flowchart-arrow\">↓</div>\n<div class=\"flowchart-box\">water is poured over the mixture</div>\n<div class=\"flowchart-arrow\">↓</div>\n<div class=\"flowchart-box\">resulting liquid is given time to settle and separate, and <strong>9</strong><input type=\"text\" id=\"q9_input\" name=\"q9\"> is used to aid the process</div>\n<div class=\"flowchart-arrow\">↓</div>\n<div class=\"flowchart-box\">oil is drawn off and separation repeated</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"sentence_completion","questionIds":["q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<h4>Complete the notes below.</h4>\n<p>Write <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4 style=\"text-align: left;\">Amurca</h4>\n<p>In ancient times, this waste liquid was usually thrown away, which led to <strong>10</strong><input type=\"text\" id=\"q10_input\" name=\"q10\">.</p>\n<p>However, Romans had practical applications for amurca:</p>\n<ul>\n<li>• when dried, created a hard surface, so used on <strong>11</strong><input type=\"text\" id=\"q11_input\" name=\"q11\"> of certain buildings</li>\n<li>• used when making <strong>12</strong><input type=\"text\" id=\"q12_input\" name=\"q12\"> into goods to wear</li>\n<li>• fed to livestock</li>\n<li>• used on farms as a <strong>13</strong><input type=\"text\" id=\"q13_input\" name=\"q13\"> to stop insects or animals from damaging crops</li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
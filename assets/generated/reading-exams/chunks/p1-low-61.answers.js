@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-61", "answers", {"answerKey":{"q1":"raindrops","q2":"stomach","q3":"pores","q4":"vacuum","q5":"frogs","q6":"TRUE","q7":"TRUE","q8":"FALSE","q9":"NOT GIVEN","q10":"FALSE","q11":"NOT GIVEN","q12":"TRUE","q13":"FALSE"}});
+})(typeof window !== "undefined" ? window : globalThis);
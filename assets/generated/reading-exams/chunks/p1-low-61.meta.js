@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-61", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-61","meta":{"title":"Carnivorous plants 食虫植物","category":"P1","frequency":"low","pdfFilename":"153. P1 - Carnivorous plants 食虫植物.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/153. P1 - Carnivorous plants 食虫植物/","legacyFilename":"153. P1 - Carnivorous plants 食虫植物.html","questionIntroHtml":"<h3>Questions 1–5</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/153. P1 - Carnivorous plants 食虫植物/153. P1 - Carnivorous plants 食虫植物.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/153. P1 - Carnivorous plants 食虫植物/153. P1 - Carnivorous plants 食虫植物.pdf","ieltsHtml":"IELTS/P1/Carnivorous plants.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.615Z","notes":"signature:radio,text,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
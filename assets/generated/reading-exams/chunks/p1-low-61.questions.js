@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-61", "questions", {"questionGroups":[{"groupId":"group-1","kind":"sentence_completion","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Complete the notes below.</h4>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>Carnivorous Plants</h4>\n<p><strong>Darwin's experiments:</strong></p>\n<p><u>Drosera</u></p>\n<ul>\n<li>He put insects and small amounts of meat onto leaves and observed what happened.</li>\n<li>He was amazed that one human hair triggered a response.</li>\n<li>He understood why the plant did not respond to <strong>1</strong> <input name=\"q1\" type=\"text\" id=\"q1_input\" maxlength=\"20\">.</li>\n</ul>\n<p><u>Venus flytrap</u></p>\n<ul>\n<li>He demonstrated how leaves close and then, for a short period, act like a <strong>2</strong> <input name=\"q2\" type=\"text\" id=\"q2_input\" maxlength=\"20\">.</li>\n<li>He noted the structure of the leaves ensures small insects are released.</li>\n</ul>\n<p><strong>Biology today:</strong></p>\n<p><u>Venus flytrap</u></p>\n<ul>\n<li>If insects come into contact with leaf hairs, their movement produces an electric charge.</li>\n<li>The charge enters fluid-filled tunnels, causing <strong>3</strong> <input name=\"q3\" type=\"text\" id=\"q3_input\" maxlength=\"20\"> in cell membranes to open.</li>\n<li>Water moves between cells and then the leaf changes from convex to concave, trapping the insect inside.</li>\n</ul>\n<p><u>Bladderwort</u></p>\n<ul>\n<li>Hairs bend when insects swim past, resulting in the opening of a flap.</li>\n<li>Water is sucked in.</li>\n<li>When water is pumped out of bladder cells, a <strong>4</strong> <input name=\"q4\" type=\"text\" id=\"q4_input\" maxlength=\"20\"> builds up inside.</li>\n</ul>\n<p><u>Pitcher plants</u></p>\n<ul>\n<li>The plants have tube-shaped leaves that insects fall into.</li>\n<li>Some plants are big enough to capture and eat <strong>5</strong> <input name=\"q5\" type=\"text\" id=\"q5_input\" maxlength=\"20\">.</li>\n</ul>\n</div>\n</div>","leadHtml":"<h3>Questions 1–5</h3>"},{"groupId":"group-2","kind":"true_false_not_given","questionIds":["q6","q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-10-11-12-13-anchor\">\n<h4>Do the following statements agree with the information given in Reading Passage 1?</h4>\n<p>In boxes 6–13 on your answer sheet, write:</p>\n<ul style=\"list-style-position: inside; padding-left: 0; margin-bottom: 1rem;\">\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>6</strong> Pitcher plants increase in size after they have digested a lot of insects.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>7</strong> Carnivorous plants produce light-harvesting enzymes with the nutrients they extract from animals.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>8</strong> Pitcher plants and Venus flytraps are more efficient at photosynthesis than plants with ordinary leaves.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>9</strong> Venus flytraps are better adapted to the soil of swamps and bogs than other carnivorous plants.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q9\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>10</strong> Carnivorous plants frequently find it difficult to photosynthesise in bogs due to a lack of sunlight.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q10\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>11</strong> Scientists have campaigned to reduce the amount of nitrogen that is released into the soil by agricultural practices.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q11\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>12</strong> A lot of exotic carnivorous plants are sold illegally.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q12\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>13</strong> Preventing wildfires is beneficial to the Venus flytrap.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q13\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
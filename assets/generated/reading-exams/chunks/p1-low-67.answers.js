@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-67", "answers", {"answerKey":{"q1":"F","q2":"G","q3":"H","q4":"C","q5":"C","q6":"D","q7":"B","q8":"D","q9":"C","q10":"FALSE","q11":"TRUE","q12":"NOT GIVEN","q13":"FALSE"}});
+})(typeof window !== "undefined" ? window : globalThis);
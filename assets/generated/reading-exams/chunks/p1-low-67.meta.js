@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-67", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-67","meta":{"title":"Scented Plants 植物的味道","category":"P1","frequency":"low","pdfFilename":"159. P1 - Scented Plants 植物的味道.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/159. P1 - Scented Plants 植物的味道/","legacyFilename":"159. P1 - Scented Plants 植物的味道.html","questionIntroHtml":""},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/159. P1 - Scented Plants 植物的味道/159. P1 - Scented Plants 植物的味道.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/159. P1 - Scented Plants 植物的味道/159. P1 - Scented Plants 植物的味道.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.627Z","notes":"signature:radio,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-67", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>Scented Plants</h2>\n<p><strong>A</strong> Many plants emit a smell. This may come from the flower of the plant, from the leaves, stem, or even, in some cases, from the root. What humans may perceive as a fragrant perfume is actually a tool used by plants to entice pollinators, discourage bacteria, or fend off predators. Fragrances consist of small organic particles with high vapor pressures, so that a scent compound evaporates easily if exposed to the air; chemicals which evaporate in this way are described as ‘volatile compounds'.</p>\n<p><strong>B</strong> Although we generally think of plant odors as pleasant, many volatile compounds in plants are toxic when eaten. These compounds are used by plants to protect themselves from bacterial attack. Humans have recognized and taken advantage of these plant-derived antibacterials since antiquity, when they were used to slow the spoilage of food. For example, the spice clove could be used in baked goods and prepared meats to slow the growth of mould and bacteria, because a small amount was not dangerous to humans. Before the development of modern food preservation techniques, European civilization was heavily dependent on cloves and other tropical spices to ensure a long-lasting supply of food. However, the long distance from Europe to South-east Asia made these spices extremely expensive and was part of the motivation behind the search for a shorter route to Asia, which resulted in the discovery of the Americas.</p>\n<p><strong>C</strong> Although volatile compounds in plants probably originally evolved to repel herbivorous (plant-eating) animals of all kinds, they now perform a remarkable range of functions. An important one common to many plants is to attract animals which will spread that plant's pollen. Insects are the most common animals to interact with plants in this way, and most insects detect volatile compounds through the extremely sensitive antennae on their heads. Some antennae can detect an airborne volatile compound at concentrations of just a few parts per billion.</p>\n<p><strong>D</strong> Other plants emit volatile compounds which function as toxins against invading insects, and still others emit such compounds when they have been injured, in order to deter insects from laying eggs on them and thus injuring them further. Volatile compounds released by plants in response to herbivore egg-laying, for example, can attract parasites of the eggs, thereby preventing them from hatching. In this way the plant can avoid the attack of the hungry young herbivores that would have emerged from the eggs.</p>\n<p><strong>E</strong> Volatile compounds in plants can also be used as a kind of currency in some very indirect defensive systems. In the rainforest tree Leonardoxa africana, for example, ants of the species Petalomyrmex phylax are attracted to young leaves because they emit high levels of the volatile compound methyl salicylate, a substance that ants need to use as an antiseptic in their nests; coincidentally, the ants attack any herbivorous insects that they encounter. It appears that methyl salicylate both attracts ants and rewards them for performing their valuable role in deterring herbivores. The web of interactions among plants and animals can become so complicated that it is difficult to detect what the outcome of the release of volatile compounds is. But it is clear that the system can have a defensive purpose, as many experiments have shown that the deactivation of a plant's volatile emission system makes it more vulnerable to herbivores.</p>\n<p><strong>F</strong> Floral scent has a strong impact on the economic success of many agricultural crops that rely on insect pollinators, including fruit trees such as the bee-pollinated cherry, apple, apricot, and peach, as well as vegetables and tropical plants such as the papaya. A decrease in fragrance emission, due to crossbreeding for fruit size or other characteristics, reduces the ability of plants to attract pollinators and may result in considerable losses for growers. This problem has been made worse in the United States by recent epidemics that have infected and killed many honeybees, the major insect pollinator.</p>\n<p><strong>G</strong> Some plant breeders have tried to solve this pollination problem by spraying scent compounds on orchard trees to enhance honeybee foraging, but this approach was costly and, in the end, proved to be inefficient. One of the reasons for its ineffectiveness was that general spraying of the crop could not tell insects exactly where the blossoms were. Clearly, a more refined strategy is needed; genetic manipulation of scents, for example, would allow growers to regulate the types of insect pollinators and the frequency of their visits.</p>\n<p><strong>H</strong> Such manipulation of scent will also benefit people who grow flowers commercially. Cut flowers and potted plants play an important aesthetic part in human life. Unfortunately, traditional breeding has produced varieties with improved vase life, color, and shape, while perfume has been sacrificed. The loss of scent among ornamental flowers, which have a worldwide annual value of more than US$30 billion, makes them important targets for the genetic manipulation of flower fragrance. Some preliminary experiments have already been carried out, but for technical reasons the scent was present in every part of the plant, rather than being localized in the flower, and the level of intensity of fragrance was below the threshold of detection for the human nose. The next generation of experiments, already in progress, will include more sophisticated schemes that target the expression of scent specifically to flowers or other organs, such as special glands that can store antibacterial or herbivore-repellent compounds.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-67", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 1–4</h4>\n<p>Reading Passage 1 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–H</strong>, in boxes 1–4 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>1</strong> a list of food plants which need insects to make them productive</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>2</strong> an explanation of why a genetic experiment may assist plant reproduction</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>3</strong> a description of current research with advantages for the flower industry</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>4</strong> an explanation of how insects perceive volatile compounds in plants</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q5","q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n<h4>Questions 5–9</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>5</strong> According to the passage, spices were used in the past to</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"><span>A keep insects away from food.</span></label> <label><input name=\"q5\" type=\"radio\" value=\"B\"><span>B improve the taste of food.</span></label> <label><input name=\"q5\" type=\"radio\" value=\"C\"><span>C prevent the decay of food.</span></label> <label><input name=\"q5\" type=\"radio\" value=\"D\"><span>D make food smell more attractive.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> The Leonardoxa africana tree protects itself by</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"A\"><span>A emitting a scent that repels plant-eating insects.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"B\"><span>B attracting and poisoning herbivorous insects.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"C\"><span>C chemically destroying the eggs of parasites.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"D\"><span>D attracting an enemy of herbivorous insects.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>7</strong> Which of the following statements about methyl salicylate is NOT true according to the passage?</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"><span>A It helps ants to protect their nests.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"B\"><span>B It helps herbivorous insects to find food.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"C\"><span>C It helps a rainforest tree to attract ants.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"D\"><span>D It helps a rainforest tree to avoid being eaten.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>8</strong> Which factor has made the problems of US fruit growers more serious?</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"><span>A Bees found an alternative source of food.</span></label> <label><input name=\"q8\" type=\"radio\" value=\"B\"><span>B Chemicals were killing too many bees.</span></label> <label><input name=\"q8\" type=\"radio\" value=\"C\"><span>C Fruit was decreasing in quality.</span></label> <label><input name=\"q8\" type=\"radio\" value=\"D\"><span>D Bees have had their numbers reduced by disease.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>9</strong> Experiments in genetically manipulating the fragrance of ornamental flowers have</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"><span>A cost US$30 billion.</span></label> <label><input name=\"q9\" type=\"radio\" value=\"B\"><span>B made the flowers more attractive to insects.</span></label> <label><input name=\"q9\" type=\"radio\" value=\"C\"><span>C failed to produce a strong enough scent.</span></label> <label><input name=\"q9\" type=\"radio\" value=\"D\"><span>D reduced production on flower farms.</span></label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"true_false_not_given","questionIds":["q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<h4>Questions 10–13</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<ul style=\"list-style: none; padding-left: 0;\">\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>10</strong> The theory that plants defend themselves with smells is untested.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q10\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q10\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>11</strong> The smell from fruit-tree flowers is important to farmers.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q11\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q11\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>12</strong> The population of honeybees in Europe has declined.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q12\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q12\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>13</strong> Applying perfume to orchard trees is accepted as a good method of increasing pollination.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q13\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q13\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-68", "answers", {"answerKey":{"q1":"FALSE","q2":"TRUE","q3":"TRUE","q4":"NOT GIVEN","q5":"FALSE","q6":"FALSE","q7":"sails","q8":"storms","q9":"challenger","q10":"ports","q11":"paperwork","q12":"tugs","q13":"money"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-68", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 1–6</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 1–6 on your answer sheet, write</p>\n<p>\n<strong>TRUE</strong> if the statement agrees with the information<br>\n<strong>FALSE</strong> if the statement contradicts the information<br>\n<strong>NOT GIVEN</strong> if there is no information on this\n</p>\n<div class=\"question-item\">\n<p><strong>1</strong> In the seventeenth and eighteenth centuries, the British East India Company faced a lot of competition.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q1\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q1\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q1\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> Before 1800, cargo size was the most important consideration for the East India Company.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q2\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q2\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q2\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> At best, voyages of the East Indiamen to China and back took nearly two years to complete.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q3\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q3\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q3\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> Before 1834, voyages to and from China were considered to be highly dangerous.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q4\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q4\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q4\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> After 1834, the ships which had served the East India Company stopped being used for commercial purposes.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q5\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q5\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q5\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> In the nineteenth century, British drinkers preferred tea made from mature leaves to that made from younger leaves.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q6\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q6\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q6\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-11-12-13-anchor\">\n<h4>Questions 7–13</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>Clipper races</h4>\n<ul>\n<li><strong>The ships</strong>\n<ul>\n<li>Clipper ships were first used for trading by American merchants.</li>\n<li>The ships were remarkable for the number of <strong>7</strong> <input name=\"q7\" type=\"text\" class=\"blank\" id=\"q7_input\"> they had.</li>\n<li>The performance of British tea clippers was particularly affected when there were <strong>8</strong> <input name=\"q8\" type=\"text\" class=\"blank\" id=\"q8_input\"> at sea.</li>\n</ul>\n</li>\n<li><strong>The races</strong>\n<ul>\n<li>It was in a ship called <strong>9</strong> <input name=\"q9\" type=\"text\" class=\"blank\" id=\"q9_input\"> that the British first competed successfully against the Americans.</li>\n<li>Richard Green's ship arrived two days ahead of its competitor.</li>\n<li>Competition increased when additional Chinese trading <strong>10</strong> <input name=\"q10\" type=\"text\" class=\"blank\" id=\"q10_input\"> were established.</li>\n<li>Merchants were occasionally in such a hurry that they failed to complete the <strong>11</strong> <input name=\"q11\" type=\"text\" class=\"blank\" id=\"q11_input\"> before leaving China.</li>\n<li>At the end of their journey, the ships needed the help of <strong>12</strong> <input name=\"q12\" type=\"text\" class=\"blank\" id=\"q12_input\">.</li>\n</ul>\n</li>\n<li><strong>The rewards</strong>\n<ul>\n<li>The crews were motivated by both <strong>13</strong> <input name=\"q13\" type=\"text\" class=\"blank\" id=\"q13_input\"> and their enthusiasm for the competition.</li>\n</ul>\n</li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-69", "answers", {"answerKey":{"q1":"TRUE","q2":"FALSE","q3":"TRUE","q4":"TRUE","q5":"NOT GIVEN","q6":"stones","q7":"cloth","q8":"receipt","q9":"envelope","q10":"sheep","q11":"triangles","q12":"accounting","q13":"paper"}});
+})(typeof window !== "undefined" ? window : globalThis);
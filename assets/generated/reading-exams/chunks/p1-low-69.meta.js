@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-69", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-69","meta":{"title":"An important language development 楔形文字","category":"P1","frequency":"low","pdfFilename":"160. P1 - An important language development 楔形文字.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/160. P1 - An important language development 楔形文字/","legacyFilename":"160. P1 - An important language development 楔形文字.html","questionIntroHtml":"<h3>Questions 1–5</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/160. P1 - An important language development 楔形文字/160. P1 - An important language development 楔形文字.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/160. P1 - An important language development 楔形文字/160. P1 - An important language development 楔形文字.pdf","ieltsHtml":"IELTS/P1/An important language development.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.629Z","notes":"signature:radio,text,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
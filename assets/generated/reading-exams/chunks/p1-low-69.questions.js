@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-69", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Do the following statements agree with the information given in Reading Passage 1?</h4>\n<p>In boxes 1–5 on your answer sheet, write:</p>\n<ul style=\"list-style-position: inside; padding-left: 0; margin-bottom: 1rem;\">\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> Cuneiform tablets were produced in different shapes and sizes.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> When Sumerian writers marked the clay tablets, the tablets were dry.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> Cuneiform was often difficult to read because of its size.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> A number of languages adopted cuneiform.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> Cuneiform signs can be found in some modern alphabets.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions 1–5</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q6","q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-10-11-12-13-anchor\">\n<h4>Complete the notes below.</h4>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>The Development and Translation of Cuneiform</h4>\n<p class=\"section-title\">Before cuneiform</p>\n<ul>\n<li>tokens, for example, <strong>6</strong> <input type=\"text\" id=\"q6_input\" maxlength=\"20\" name=\"q6\"> were often used</li>\n<li>the first tokens were kept in containers made of <strong>7</strong> <input type=\"text\" id=\"q7_input\" maxlength=\"20\" name=\"q7\"></li>\n<li>tokens were used as a <strong>8</strong> <input type=\"text\" id=\"q8_input\" maxlength=\"20\" name=\"q8\"> to give when selling something</li>\n</ul>\n<p class=\"section-title\">By the 4th century BCE</p>\n<ul>\n<li>tokens were put in a container that looked like a clay <strong>9</strong> <input type=\"text\" id=\"q9_input\" maxlength=\"20\" name=\"q9\"></li>\n</ul>\n<p class=\"section-title\">Complex, abstract symbols developed</p>\n<ul>\n<li>at first, signs looked like what they indicated, e.g. <strong>10</strong> <input type=\"text\" id=\"q10_input\" maxlength=\"20\" name=\"q10\"></li>\n<li>then signs became more abstract</li>\n<li>eventually, cuneiform signs shaped like <strong>11</strong> <input type=\"text\" id=\"q11_input\" maxlength=\"20\" name=\"q11\"> were developed</li>\n<li>according to experts, cuneiform was mainly used for <strong>12</strong> <input type=\"text\" id=\"q12_input\" maxlength=\"20\" name=\"q12\"></li>\n</ul>\n<p class=\"section-title\">19th-century translation of cuneiform inscriptions by Henry Rawlinson</p>\n<ul>\n<li>Rawlinson found cuneiform inscriptions in the Behistun Mountains</li>\n<li>Rawlinson copied the inscriptions onto <strong>13</strong> <input type=\"text\" id=\"q13_input\" maxlength=\"20\" name=\"q13\"></li>\n<li>Rawlinson realised that each word of the inscriptions appeared in three languages</li>\n<li>When translated, Rawlinson found that the writings were about a 5th-century BCE king</li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
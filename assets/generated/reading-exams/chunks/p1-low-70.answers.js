@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-70", "answers", {"answerKey":{"q1":"TRUE","q2":"TRUE","q3":"FALSE","q4":"NOT GIVEN","q5":"FALSE","q6":"TRUE","q7":"head","q8":"communication","q9":"enemies","q10":"location","q11":"species","q12":"corals","q13":"seahorse"}});
+})(typeof window !== "undefined" ? window : globalThis);
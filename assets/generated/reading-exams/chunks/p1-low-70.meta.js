@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-70", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-70","meta":{"title":"Fluorescence Deep sea discovery深海发光生物研究","category":"P1","frequency":"low","pdfFilename":"161. P1 - Fluorescence Deep sea discovery深海发光生物研究.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/161. P1 - Fluorescence Deep sea discovery深海发光生物研究/","legacyFilename":"161. P1 - Fluorescence Deep sea discovery深海发光生物研究.html","questionIntroHtml":"<h3>Questions 1–6</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/161. P1 - Fluorescence Deep sea discovery深海发光生物研究/161. P1 - Fluorescence Deep sea discovery深海发光生物研究.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/161. P1 - Fluorescence Deep sea discovery深海发光生物研究/161. P1 - Fluorescence Deep sea discovery深海发光生物研究.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.630Z","notes":"signature:radio,text,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
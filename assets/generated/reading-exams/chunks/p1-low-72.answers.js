@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-72", "answers", {"answerKey":{"q1":"location","q2":"policies","q3":"government","q4":"incomes","q5":"land","q6":"competition","q7":"FALSE","q8":"FALSE","q9":"NOT GIVEN","q10":"FALSE","q11":"TRUE","q12":"NOT GIVEN","q13":"TRUE"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-72", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-72","meta":{"title":"How to find your way out of a food desert 城市食物荒漠","category":"P1","frequency":"low","pdfFilename":"163. P1 - How to find your way out of a food desert 城市食物荒漠.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/163. P1 - How to find your way out of a food desert 城市食物荒漠/","legacyFilename":"163. P1 - How to find your way out of a food desert 城市食物荒漠.html","questionIntroHtml":"<h3>Questions 1–6</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/163. P1 - How to find your way out of a food desert 城市食物荒漠/163. P1 - How to find your way out of a food desert 城市食物荒漠.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/163. P1 - How to find your way out of a food desert 城市食物荒漠/163. P1 - How to find your way out of a food desert 城市食物荒漠.pdf","ieltsHtml":"IELTS/P1/How to find your way out of a food desert.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.633Z","notes":"signature:radio,text,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
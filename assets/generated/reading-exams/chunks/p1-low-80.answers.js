@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-80", "answers", {"answerKey":{"q1":"primates","q2":"400","q3":"drop","q4":"nightclub","q5":"music","q6":"95%","q7":"TRUE","q8":"TRUE","q9":"NOT GIVEN","q10":"FALSE","q11":"FALSE","q12":"NOT GIVEN","q13":"TRUE"}});
+})(typeof window !== "undefined" ? window : globalThis);
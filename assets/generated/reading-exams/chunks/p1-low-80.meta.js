@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-80", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-80","meta":{"title":"The unsung sense 被低估的嗅觉","category":"P1","frequency":"low","pdfFilename":"170. P1 - The unsung sense 被低估的嗅觉.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/170. P1 - The unsung sense 被低估的嗅觉/","legacyFilename":"170. P1 - The unsung sense 被低估的嗅觉.html","questionIntroHtml":"<h3>Questions 1–6</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/170. P1 - The unsung sense 被低估的嗅觉/170. P1 - The unsung sense 被低估的嗅觉.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/170. P1 - The unsung sense 被低估的嗅觉/170. P1 - The unsung sense 被低估的嗅觉.pdf","ieltsHtml":"IELTS/P1/The unsung sense.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.648Z","notes":"signature:radio,text,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-80", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>The unsung sense</h3>\n<h4>New research reassesses the nature and importance of smell</h4>\n<p>Traditionally, smell has not been at the forefront of sensory research, pushed aside in favour of the seemingly more vital senses of vision and hearing. There has been a strong belief that people, especially compared to other mammals, are not that influenced by smells.</p>\n<p>One of the first to assert the relative unimportance of the human sense of smell was Pierre Paul Broca, an influential 19th-century anatomist. After comparing the proportion of the brain devoted to smell in different animals, he suggested that mammals can be classed into two broad groups: macrosmatic mammals, such as dogs, have a finely tuned sense of smell which they rely on to perceive the world, while marine mammals and primates, including humans, are microsmatic – the organ with which they smell is small and functionally redundant.</p>\n<p>That idea seemed to fit with more recent studies in genetics, which found that the majority of mammals have about one thousand different types of smell receptor. Most of these aren't present in humans, who only possess four hundred or so different types.</p>\n<p>Yet these findings may have been misleading. Brain scans show that more of the human brain is devoted to smell processing than Broca's anatomical studies suggested. And although we may have fewer types of receptor than other mammals, research has shown that the human nose and brain are unusually well connected, with each group of receptors linking to many more neural regions than is the case in other animals. That should give us a good ability to process incoming scents.</p>\n<p>Once researchers began looking, they found the nose to be far more sensitive than its reputation suggested. One study, for example, found that we can pick out a particular substance even when heavily diluted. In fact, a person can smell just one drop of a chemical in a large swimming pool.</p>\n<p>What's more, with the latest findings, it is becoming clear that the brain's smelling centres are intimately linked to its system for controlling emotion, fear and memory. That suggests a link between smell and the way we think. One Dutch academic, for example, found that when the smell of orange, seawater or peppermint was pumped through a nightclub, those inside partied harder – they danced more, laughed more, and even thought the music was better than when there was no added scent.</p>\n<p>Other work has found that scent can influence our cognitive skills. A study found that when men were subjected to a novel smell – either good or bad – during a task used to test decision-making skills, they performed significantly worse than normal. The researchers concluded that the scent stimulated brain areas connected with emotion, making their decisions emotional rather than rational.</p>\n<p>The surprising thing about such studies is that up to 95% of subjects altered their behaviour, despite only 5% of them being aware of the introduced smells that they were facing. The question, then, is why do we pay so little conscious attention to our noses unless we smell something really strong?</p>\n<p>One vital factor is that our noses just aren't equipped to locate the source of an odour. This makes the sense of smell fundamentally different to vision or hearing, which are built to identify sights and sounds with precision. Apparently, we become aware of something when the brain focuses on a single location, after which it picks out the details, like a familiar face, from the scene. With smell, though, the brain does not focus in the same way, and so is not able to make us aware of the details relating to one particular area. It's for this reason that we can only ever pick out around four smells from a complex mixture.</p>\n<p>Nevertheless, we all have the capacity to train our sense of smell, but it needs to be worked at. Master perfumers, for instance, learn to recognise, name and imagine an extraordinary range of smells through years of practice. This is accompanied by a significant reorganisation of the olfactory areas in the brain that helps them to process the scents more efficiently.</p>\n<p>Smells are also especially good memory evokers, but it's actually a myth that odours trigger more complete memories than other stimuli. These memories are neither more accurate nor more detailed, but they are unique in that they are more emotional. This isn't surprising when you consider that both emotion and smell are processed by the same areas of the brain, and there is a strong link between emotion and memory.</p>\n<p>That said, not all smell memories are equal. The link between a memory and a smell is stronger if the smell is an unpleasant rather than a pleasant one, which makes sense from an evolutionary perspective. In addition, the very first time we associate a smell with an object, it evokes a much greater response in our brains than for any encounter with the smell or object in later life, laying down stronger foundations for the memory. That doesn't happen with any other sense. Since most first encounters with a smell happen at a young age, this might explain why smells often carry us back to our childhood.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
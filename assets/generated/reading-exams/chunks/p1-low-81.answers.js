@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-81", "answers", {"answerKey":{"q1":"TRUE","q2":"FALSE","q3":"FALSE","q4":"NOT GIVEN","q5":"TRUE","q6":"undercutting","q7":"pillars","q8":"grill","q9":"picking","q10":"metal","q11":"steam","q12":"pressure","q13":"screens"}});
+})(typeof window !== "undefined" ? window : globalThis);
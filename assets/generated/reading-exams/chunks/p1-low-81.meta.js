@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-81", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-81","meta":{"title":"Salt  盐的历史","category":"P1","frequency":"low","pdfFilename":"171. P1 - Salt  盐的历史.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/171. P1 - Salt  盐的历史/","legacyFilename":"171. P1 - Salt  盐的历史.html","questionIntroHtml":"<h3>Questions 1–5</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/171. P1 - Salt  盐的历史/171. P1 - Salt  盐的历史.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/171. P1 - Salt  盐的历史/171. P1 - Salt  盐的历史.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.649Z","notes":"signature:radio,text,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
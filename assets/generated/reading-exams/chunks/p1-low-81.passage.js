@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-81", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>Salt</h3>\n<p>Salt is the common name for the substance sodium chloride (NaCl), which occurs in the form of transparent cubic crystals. Although salt is most familiar as a food supplement, less than 5% of the salt produced worldwide is used for that purpose. About 70% is utilized by the chemical industry, mostly as a source of chlorine. Salt is also used for countless other purposes, such as removing snow and ice from roads, softening water, preserving food, and stabilizing soils for construction.</p>\n<p>The earliest humans obtained their salt from natural salt concentrations, as well as from meat. Those people who lived near the ocean may also have obtained it by chewing seaweed or from the natural evaporation of small pools of seawater. Meat became a more important source of salt as hunting was developed, as did milk when sheep, goats, horses, camels, reindeer, and cattle were domesticated. Even today, certain peoples—such as the Bedouin of the Middle Eastern deserts and the Maasai of East Africa—use no other forms of salt.</p>\n<p>As agriculture developed, leading to a diet consisting mostly of plants, it became necessary to devise ways of obtaining salt in greater amounts. The earliest method of salt production employed by humankind was the evaporation of seawater using the heat of the sun. This method was particularly suited to hot, arid regions near the ocean or near salty lakes, and is still used in those areas. Solar evaporation was soon followed by the quarrying of exposed masses of rock salt, which quickly developed into the mining of underground deposits of salt. Two thousand years ago, the Chinese began using wells to reach underground pools of salt water, some of which were more than one kilometer deep.</p>\n<p>In areas where the climate did not allow solar evaporation, salt water was poured on burning wood or heated rocks to boil it. The salt left behind was then scraped off. During the time of the Roman Empire, shallow lead pans were used to boil salt water over open fires to extract the salt. Later, in the Middle Ages, these were replaced with iron pans which were heated with coal. In the 1860s, a procedure known as the Michigan process was invented, in which salt water was heated by steam running through pipes immersed in the water. This process is still used to produce certain types of salt.</p>\n<p>Nowadays, salt is collected from two sources: rock salt and brine. Rock salt is simply crystallized salt, also known as halite. It is the result of the evaporation of ancient oceans millions of years ago. Underground salt deposits are usually discovered by prospectors searching for water or oil. When salt is detected, a diamond-tipped, hollow drill is used to take several regularly spaced core samples throughout the area. These are analyzed to determine if salt mining would be profitable. If the site is thought to be suitable, vertical tunnels are sunk into the center of the salt deposit. Then a machine resembling a gigantic chain saw is used to cut a long horizontal slot through the salt, in a procedure known as undercutting. A series of holes are then drilled into the salt with an electric drill, and the holes are filled with explosives such as dynamite. Cutting and blasting are repeated in a pattern that leaves salt pillars standing to support the roof of the mining area. This is known as the room-and-pillar method and is also used in coal mines. Once blasted, chunks of the rock salt are transported to an underground crushing area where smaller pieces are collected via a metal grill and larger pieces are crushed in a rotating cylinder. Finally, redundant matter is extracted from the rock salt, in what is known as picking.</p>\n<p>Brine is water containing a high concentration of salt. The most obvious source of brine is the ocean, but it can also be obtained from salty lakes such as the Dead Sea and from underground pools of salt water. Most brine is processed by a multi-effect vacuum evaporator. This device consists of three or more closed metal cylinders. Brine is first treated to remove chemical compounds. It then fills the bottom of the cylinders. The brine in the first cylinder passes through tubes heated by steam. The brine boils and its steam enters the next cylinder. In each cylinder, the condensation of steam causes the pressure inside to drop. A material called slurry forms at the bottom of the cylinders and goes into a tank. The slurry is then filtered to remove excess brine, dried, and passed through screens to sort the salt particles according to how large they are.</p>\n<p>Specifications for salt vary widely according to the intended use. Salt intended for human consumption must be much purer than salt used for melting snow and ice on roads, but salt used for certain scientific purposes may need to be even purer.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-81", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 1–5 on your answer sheet, write:</p>\n<ul style=\"list-style-type: none; padding-left: 0; margin-bottom: 1rem;\">\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> The chemical industry makes use of the majority of salt produced globally.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> In ancient times, people were only able to get salt from a single source.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> Salt production through quarrying rock salt was common before the solar evaporation method of producing salt.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> Two thousand years ago, the Chinese were quick to develop the equipment needed to mine underground.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> At the time of the Roman Empire, salt was removed from salt water by heating the water in a type of pan.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions 1–5</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>The production of rock salt</h4>\n<ul>\n<li>samples of the salt are collected with the aid of a drill</li>\n<li>the salt is analysed to see if mining should go ahead</li>\n<li>vertical tunnels are sunk into the middle of the salt deposit</li>\n<li>during a process called <strong>6</strong> <input type=\"text\" id=\"q6_input\" name=\"q6\">, a machine is used to break into the salt</li>\n<li>explosives are placed in the holes in the salt</li>\n<li>after blasting, <strong>7</strong> <input type=\"text\" id=\"q7_input\" name=\"q7\"> of salt are left behind to hold the roof up</li>\n<li>in an underground crushing area, small pieces of rock salt are gathered using a <strong>8</strong> <input type=\"text\" id=\"q8_input\" name=\"q8\"></li>\n<li>the process of <strong>9</strong> <input type=\"text\" id=\"q9_input\" name=\"q9\"> removes any unwanted material from the rock salt</li>\n</ul>\n</div>\n</div>"},{"groupId":"group-3","kind":"diagram_completion","questionIds":["q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<p>Complete the flow-chart below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"flow-chart\">\n<h4>Obtaining salt from brine: the multi-effect vacuum evaporator</h4>\n<div class=\"flow-item\">\ncylinders made of <strong>10</strong> <input type=\"text\" id=\"q10_input\" name=\"q10\"> are filled with brine\n</div>\n<div class=\"flow-arrow\">↓</div>\n<div class=\"flow-item\">\n<strong>11</strong> <input type=\"text\" id=\"q11_input\" name=\"q11\"> heats the tube in the first cylinder\n</div>\n<div class=\"flow-arrow\">↓</div>\n<div class=\"flow-item\">\nthe <strong>12</strong> <input type=\"text\" id=\"q12_input\" name=\"q12\"> in the cylinders falls due to condensation\n</div>\n<div class=\"flow-arrow\">↓</div>\n<div class=\"flow-item\">\nslurry collects in the cylinders and passes to a tank\n</div>\n<div class=\"flow-arrow\">↓</div>\n<div class=\"flow-item\">\n<strong>13</strong> <input type=\"text\" id=\"q13_input\" name=\"q13\"> are used to separate salt particles by size\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-84", "answers", {"answerKey":{"q1":"TRUE","q2":"TRUE","q3":"NOT GIVEN","q4":"NOT GIVEN","q5":"FALSE","q6":"surface","q7":"weight loss","q8":"name","q9":"container","q10":"behaviour","q11":"focus groups","q12":"simple surveys","q13":"instincts"}});
+})(typeof window !== "undefined" ? window : globalThis);
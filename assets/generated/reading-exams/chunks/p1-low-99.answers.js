@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-99", "answers", {"answerKey":{"q1":"ink","q2":"soundtracks","q3":"unreliable","q4":"lasers","q5":"standardization","q6":"speed","q7":"marathons","q8":"bees","q9":"FALSE","q10":"TRUE","q11":"NOT GIVEN","q12":"NOT GIVEN","q13":"TRUE"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-99", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-low-99","meta":{"title":"The history of the bar code 条形码的历史","category":"P1","frequency":"low","pdfFilename":"188. P1 - The history of the bar code 条形码的历史.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/188. P1 - The history of the bar code 条形码的历史/","legacyFilename":"188. P1 - The history of the bar code 条形码的历史.html","questionIntroHtml":"<h3>Questions 1–8</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/188. P1 - The history of the bar code 条形码的历史/188. P1 - The history of the bar code 条形码的历史.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/188. P1 - The history of the bar code 条形码的历史/188. P1 - The history of the bar code 条形码的历史.pdf","ieltsHtml":"IELTS/P1/The history of the bar code.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.675Z","notes":"signature:radio,text,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
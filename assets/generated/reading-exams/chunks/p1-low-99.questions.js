@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-low-99", "questions", {"questionGroups":[{"groupId":"group-1","kind":"sentence_completion","questionIds":["q1","q2","q3","q4","q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-8-anchor\">\n<h4>Complete the notes below.</h4>\n<p>Write <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>History of the bar code</h4>\n<p><strong>1948–1952</strong></p>\n<p>Methods of recording information automatically were developed by Silver and Woodland.</p>\n<p><strong>1st system:</strong></p>\n<ul>\n<li>used ultraviolet light and a special type of <strong>1</strong> <input type=\"text\" id=\"q1_input\" maxlength=\"20\" name=\"q1\"></li>\n<li>problems: expensive and not permanent</li>\n</ul>\n<p><strong>2nd system:</strong></p>\n<ul>\n<li>based on technology used in Morse code and also for the <strong>2</strong> <input type=\"text\" id=\"q2_input\" maxlength=\"20\" name=\"q2\"> of films</li>\n<li>problems: <strong>3</strong> <input type=\"text\" id=\"q3_input\" maxlength=\"20\" name=\"q3\"> and expensive</li>\n</ul>\n<p><strong>1970s</strong></p>\n<ul>\n<li>Availability of cheaper <strong>4</strong> <input type=\"text\" id=\"q4_input\" maxlength=\"20\" name=\"q4\"> meant scanning technology spread more widely</li>\n<li>Problem: lack of <strong>5</strong> <input type=\"text\" id=\"q5_input\" maxlength=\"20\" name=\"q5\"> in code systems</li>\n<li>April 1973: committee agreed on one universal product code (UPC)</li>\n<li>June 1974: pack of Juicy Fruit chewing gum sold with bar code scanner</li>\n<li>Advantages of bar code system:\n<ul>\n<li>supermarkets needed to spend less on labour</li>\n<li>the <strong>6</strong> <input type=\"text\" id=\"q6_input\" maxlength=\"20\" name=\"q6\"> of checkouts increased</li>\n<li>doing inventories was much cheaper</li>\n</ul>\n</li>\n</ul>\n<p><strong>Present day</strong></p>\n<p>Users of bar codes include:</p>\n<ul>\n<li>retail companies</li>\n<li>airlines</li>\n<li>staff in hospitals</li>\n<li>participants in <strong>7</strong> <input type=\"text\" id=\"q7_input\" maxlength=\"20\" name=\"q7\"></li>\n<li>scientists studying <strong>8</strong> <input type=\"text\" id=\"q8_input\" maxlength=\"20\" name=\"q8\"></li>\n</ul>\n</div>\n</div>","leadHtml":"<h3>Questions 1–8</h3>"},{"groupId":"group-2","kind":"true_false_not_given","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Do the following statements agree with the information given in Reading Passage 1?</h4>\n<p>In boxes 9–13 on your answer sheet, write:</p>\n<ul style=\"list-style-position: inside; padding-left: 0; margin-bottom: 1rem;\">\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>9</strong> Bernard Silver was invited to develop a system for capturing product information by the president of a food chain.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q9\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>10</strong> A committee set up in the 1970s said bar codes should be easy to use and not too expensive.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q10\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>11</strong> Alan Haberman disagreed with government policies on business matters.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q11\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>12</strong> Many grocery outlets were unable to afford the necessary scanning equipment.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q12\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>13</strong> The advantages of the new bar code scanner took some time to be accepted by users.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q13\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
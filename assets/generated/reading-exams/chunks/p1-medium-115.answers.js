@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-115", "answers", {"answerKey":{"q1":"NOT GIVEN","q2":"FALSE","q3":"TRUE","q4":"FALSE","q5":"NOT GIVEN","q6":"TRUE","q7":"NOT GIVEN","q8":"TRUE","q9":"worm","q10":"clay","q11":"headaches","q12":"accidents","q13":"government"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-115", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-medium-115","meta":{"title":"Tunnelling under the Thames 泰晤士河隧道","category":"P1","frequency":"medium","pdfFilename":"29. P1 - Tunnelling under the Thames 泰晤士河隧道【次】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/29. P1 - Tunnelling under the Thames 泰晤士河隧道【次】/","legacyFilename":"29. P1 - Tunnelling under the Thames 泰晤士河隧道【次】.html","questionIntroHtml":"<h3>Questions 1–8</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/29. P1 - Tunnelling under the Thames 泰晤士河隧道【次】/29. P1 - Tunnelling under the Thames 泰晤士河隧道【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/29. P1 - Tunnelling under the Thames 泰晤士河隧道【次】/29. P1 - Tunnelling under the Thames 泰晤士河隧道【次】.pdf","ieltsHtml":"IELTS/P1/Tunnelling under the Thames.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.706Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
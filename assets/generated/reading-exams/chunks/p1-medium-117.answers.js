@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-117", "answers", {"answerKey":{"q1":"FALSE","q2":"TRUE","q3":"TRUE","q4":"NOT GIVEN","q5":"TRUE","q6":"branches","q7":"ground","q8":"teeth","q9":"fruit","q10":"eggs","q11":"bones","q12":"childhood","q13":"brains"}});
+})(typeof window !== "undefined" ? window : globalThis);
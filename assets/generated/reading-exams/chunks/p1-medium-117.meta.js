@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-117", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-medium-117","meta":{"title":"What Lucy Taught Us 露西化石","category":"P1","frequency":"medium","pdfFilename":"30. P1 - What Lucy Taught Us 露西化石【次】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/30. P1 - What Lucy Taught Us 露西化石【次】/","legacyFilename":"30. P1 - What Lucy Taught Us 露西化石【次】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/30. P1 - What Lucy Taught Us 露西化石【次】/30. P1 - What Lucy Taught Us 露西化石【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/30. P1 - What Lucy Taught Us 露西化石【次】/30. P1 - What Lucy Taught Us 露西化石【次】.pdf","ieltsHtml":"IELTS/P1/What Lucy Taught Us.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.709Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
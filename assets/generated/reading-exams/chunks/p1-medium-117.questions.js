@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-117", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 1–5</h4>\n<p>Do the following statements agree with the information in Reading Passage 1?</p>\n<p>In boxes 1–5 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> Donald Johanson was uncertain about the nature of the elbow bone he found in Afar.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> Several bones were found by Donald Johanson at the same site in Afar.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> The experts realised the importance of the discovery at Afar.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> It was the upper part of the skeleton that had suffered the least damage.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> The skeleton's measurements helped Johanson's team to decide if it was male or female.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q6","q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-10-11-12-13-anchor\">\n<h4>Questions 6–13</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>Lucy</h4>\n<p><strong>Physical features</strong></p>\n<ul>\n<li>jaws and skull like those of an ape</li>\n<li>braincase similar in size to that of a chimp</li>\n</ul>\n<p><strong>Movement</strong></p>\n<ul>\n<li>the positioning and shape of her pelvis made it clear that she walked like a human</li>\n<li>upright movement possibly started among the <strong>6</strong> <input type=\"text\" id=\"q6_input\" name=\"q6\"> of trees</li>\n<li>probably moved to the <strong>7</strong> <input type=\"text\" id=\"q7_input\" name=\"q7\"> in search of food</li>\n</ul>\n<p><strong>Diet and eating habits</strong></p>\n<ul>\n<li>analysis of food in the <strong>8</strong> <input type=\"text\" id=\"q8_input\" name=\"q8\"> of the skeletons of early humans shows changes in their diet</li>\n<li>it is likely that meat and grasses were substituted for <strong>9</strong> <input type=\"text\" id=\"q9_input\" name=\"q9\"></li>\n<li><strong>10</strong> <input type=\"text\" id=\"q10_input\" name=\"q10\"> that were located close to Lucy suggest these were also part of her diet</li>\n<li><strong>11</strong> <input type=\"text\" id=\"q11_input\" name=\"q11\"> that were found had marks on them, possibly made by tools used for eating</li>\n</ul>\n<p><strong>Comparisons with modern-day humans</strong></p>\n<ul>\n<li>modern-day humans have a longer <strong>12</strong> <input type=\"text\" id=\"q12_input\" name=\"q12\"> than Lucy did</li>\n<li>the <strong>13</strong> <input type=\"text\" id=\"q13_input\" name=\"q13\"> of modern-day humans appear to develop later than Lucy's did</li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
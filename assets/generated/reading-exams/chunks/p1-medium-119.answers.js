@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-119", "answers", {"answerKey":{"q1":"FALSE","q2":"TRUE","q3":"NOT GIVEN","q4":"FALSE","q5":"NOT GIVEN","q6":"TRUE","q7":"shipping costs","q8":"export sector","q9":["60,000","60000","60 000"],"q10":"softwood","q11":"sustainability","q12":"Scandinavian countries","q13":"wood substitutes"}});
+})(typeof window !== "undefined" ? window : globalThis);
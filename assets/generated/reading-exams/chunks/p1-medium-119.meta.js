@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-119", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-medium-119","meta":{"title":"Wood 新西兰木材产业","category":"P1","frequency":"medium","pdfFilename":"32. P1 - Wood 新西兰木材产业.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/32. P1 - Wood 新西兰木材产业【次】/","legacyFilename":"32. P1 - Wood 新西兰木材产业【次】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/32. P1 - Wood 新西兰木材产业【次】/32. P1 - Wood 新西兰木材产业【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/32. P1 - Wood 新西兰木材产业【次】/32. P1 - Wood 新西兰木材产业【次】.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.712Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-182", "answers", {"answerKey":{"q1":"TRUE","q2":"FALSE","q3":"NOT GIVEN","q4":"TRUE","q5":"C","q6":"F","q7":"C","q8":"G","q9":"B","q10":"C","q11":"A","q12":"B","q13":"D"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-182", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-medium-182","meta":{"title":"Listening to the Ocean 海洋探测","category":"P1","frequency":"medium","pdfFilename":"9. P1 - Listening to the Ocean 海洋探测【次】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/9. P1 - Listening to the Ocean 海洋探测【次】/","legacyFilename":"9. P1 - Listening to the Ocean 海洋探测【次】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/9. P1 - Listening to the Ocean 海洋探测【次】/9. P1 - Listening to the Ocean 海洋探测【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/9. P1 - Listening to the Ocean 海洋探测【次】/9. P1 - Listening to the Ocean 海洋探测【次】.pdf","ieltsHtml":"IELTS/P1/Listening to the Ocean.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.812Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-182", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 1–4</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 1–4 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> In the past, it was easier for scientists to study the Moon than the oceans.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> Techniques for investigating the Moon are the same as techniques for researching the ocean.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> Measuring temperature changes in the ocean using sound is more time-consuming than other methods.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> Hydrophones can distinguish different kinds of rain.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-anchor\">\n<h4>Questions 5–8</h4>\n<p>Reading Passage 1 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p>Write the correct letter, <strong>A–G</strong>, in boxes 5–8 on your answer sheet.</p>\n<p><strong>NB</strong> You may use any letter more than once.</p>\n<div class=\"question-item\">\n<p><strong>5</strong> examples of things that affect the distance sound can travel in water<input type=\"text\" id=\"q5_input\" name=\"q5\"></p>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> details of the connection between ocean temperatures and climate<input type=\"text\" id=\"q6_input\" name=\"q6\"></p>\n</div>\n<div class=\"question-item\">\n<p><strong>7</strong> details of ways in which light and sound are similar<input type=\"text\" id=\"q7_input\" name=\"q7\"></p>\n</div>\n<div class=\"question-item\">\n<p><strong>8</strong> a reference to a long-term study of different types of weather<input type=\"text\" id=\"q8_input\" name=\"q8\"></p>\n</div>\n</div>"},{"groupId":"group-3","kind":"single_choice","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 9–13</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>9</strong> According to the passage, who conducted research into the rate at which sound travels in water?</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"> A Leonardo da Vinci</label> <label><input name=\"q9\" type=\"radio\" value=\"B\"> B Colladon and Sturm</label> <label><input name=\"q9\" type=\"radio\" value=\"C\"> C Ewing and Worzel</label> <label><input name=\"q9\" type=\"radio\" value=\"D\"> D Jeff Nystuen</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>10</strong> According to the passage, who conducted research into the distances certain types of sound waves travel in water?</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"> A Leonardo da Vinci</label> <label><input name=\"q10\" type=\"radio\" value=\"B\"> B Colladon and Sturm</label> <label><input name=\"q10\" type=\"radio\" value=\"C\"> C Ewing and Worzel</label> <label><input name=\"q10\" type=\"radio\" value=\"D\"> D Christopher Clark</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>11</strong> SOSUS allows whale researchers to</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"> A follow a number of whales at the same time.</label> <label><input name=\"q11\" type=\"radio\" value=\"B\"> B protect whales as they migrate.</label> <label><input name=\"q11\" type=\"radio\" value=\"C\"> C imitate whale calls of different species.</label> <label><input name=\"q11\" type=\"radio\" value=\"D\"> D change the whales' direction of travel.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>12</strong> Finback whale calls change</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"A\"> A when scientists track them.</label> <label><input name=\"q12\" type=\"radio\" value=\"B\"> B at different times of year.</label> <label><input name=\"q12\" type=\"radio\" value=\"C\"> C when whales communicate with other species.</label> <label><input name=\"q12\" type=\"radio\" value=\"D\"> D when whales come to the surface.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>13</strong> SOSUS allows scientists to</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"> A make accurate maps of the ocean floor.</label> <label><input name=\"q13\" type=\"radio\" value=\"B\"> B measure water-level changes.</label> <label><input name=\"q13\" type=\"radio\" value=\"C\"> C investigate ocean currents.</label> <label><input name=\"q13\" type=\"radio\" value=\"D\"> D measure variations in temperature.</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-20", "answers", {"answerKey":{"q1":"photographic film","q2":"Bakelite","q3":"electrical switches","q4":"Britain","q5":"fireproof","q6":"glass","q7":"foam","q8":"FALSE","q9":"NOT GIVEN","q10":"FALSE","q11":"TRUE","q12":"FALSE","q13":"TRUE"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-20", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-medium-20","meta":{"title":"The Development of Plastics 塑料的发展史","category":"P1","frequency":"medium","pdfFilename":"116. P1 - The Development of Plastics 塑料的发展史.pdf","legacyPath":"ReadingPractice/PDF/","legacyFilename":"116. P1 - The Development of Plastics 塑料的发展史.pdf","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"sourcePdf":"ReadingPractice/PDF/116. P1 - The Development of Plastics 塑料的发展史.pdf","shuiPdf":"ReadingPractice/PDF/116. P1 - The Development of Plastics 塑料的发展史.pdf","previousShuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/116. P1 - The Development of Plastics 塑料的发展史【次】/116. P1 - The Development of Plastics 塑料的发展史【次】.html","previousShuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/116. P1 - The Development of Plastics 塑料的发展史【次】/116. P1 - The Development of Plastics 塑料的发展史【次】.pdf","ieltsHtml":"IELTS/P1/The Development of Plastics.html"},"audit":{"matchStatus":"word_docx_visual_answer_verified","matchConfidence":0.98,"verifiedAt":"2026-05-09T00:00:00.000+08:00","notes":"Rebuilt from May Word DOCX source; passage, questions, and answer key verified from embedded answer images by visual inspection."}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-20", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 1-7</h4>\n<p>Complete the table below.</p>\n<p>Choose <strong>NO MORE THAN THREE WORDS</strong> from the passage for each answer.</p>\n<p>Write your answers in boxes 1-7 on your answer sheet.</p>\n<table class=\"table-completion\">\n<thead><tr><th colspan=\"5\">Early types of plastic</th></tr><tr><th>Name</th><th>Date</th><th>Country of origin</th><th>Properties</th><th>Common uses</th></tr></thead>\n<tbody>\n<tr><td><em>Celluloid</em></td><td>1860s</td><td>USA</td><td>can be soften and reshaped by heat</td><td>billiard balls (original use)<br>cutlery<br>clothing<br><strong>1</strong> <input type=\"text\" name=\"q1\"></td></tr>\n<tr><td><strong>2</strong> <input type=\"text\" name=\"q2\"></td><td>1907</td><td>USA</td><td>can't be softened after setting; good insulator; resistant to water and acid</td><td><strong>3</strong> <input type=\"text\" name=\"q3\"><br>household object</td></tr>\n<tr><td><em>Polythene</em></td><td>1930s</td><td><strong>4</strong> <input type=\"text\" name=\"q4\"></td><td>can be softened and reshaped by heat</td><td>bottles<br>pipes<br>plastic bags</td></tr>\n<tr><td><em>Polypropylene</em></td><td>1950s</td><td></td><td></td><td>bottles<br>pipes<br>plastic bags</td></tr>\n<tr><td><em><strong>Rigid</strong> PVC</em></td><td></td><td></td><td>is <strong>5</strong> <input type=\"text\" name=\"q5\"></td><td>external piping</td></tr>\n<tr><td><em>Soft PVC</em></td><td></td><td></td><td></td><td>outdoor clothing</td></tr>\n<tr><td><em>Polystyrene</em></td><td>1930s</td><td>Germany</td><td>resembles <strong>6</strong> <input type=\"text\" name=\"q6\"></td><td>food containers<br>toy</td></tr>\n<tr><td><em>Polyurethane</em></td><td></td><td>Germany</td><td>usually manufactured as a <strong>7</strong> <input type=\"text\" name=\"q7\"></td><td>insulation</td></tr>\n</tbody>\n</table>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"true_false_not_given","questionIds":["q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Questions 8-13</h4>\n<p>Do the following statements agree with the information in Reading Passage 1?</p>\n<p>In boxes 8-13 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information about this</li>\n</ul>\n<div class=\"question-item\"><p><strong>8</strong> The chemical structure of rubber is very different from that of plastics.</p><div class=\"radio-options\"><label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label><label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label><label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div>\n<div class=\"question-item\"><p><strong>9</strong> John Wesley Hyatt was an industrial chemist.</p><div class=\"radio-options\"><label><input name=\"q9\" type=\"radio\" value=\"TRUE\"> TRUE</label><label><input name=\"q9\" type=\"radio\" value=\"FALSE\"> FALSE</label><label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div>\n<div class=\"question-item\"><p><strong>10</strong> Celluloid and Bakelite react in the same way to heat.</p><div class=\"radio-options\"><label><input name=\"q10\" type=\"radio\" value=\"TRUE\"> TRUE</label><label><input name=\"q10\" type=\"radio\" value=\"FALSE\"> FALSE</label><label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div>\n<div class=\"question-item\"><p><strong>11</strong> If an object is made of several plastics, these prove hard to break down and reuse.</p><div class=\"radio-options\"><label><input name=\"q11\" type=\"radio\" value=\"TRUE\"> TRUE</label><label><input name=\"q11\" type=\"radio\" value=\"FALSE\"> FALSE</label><label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div>\n<div class=\"question-item\"><p><strong>12</strong> Adding starch to plastic makes it more durable.</p><div class=\"radio-options\"><label><input name=\"q12\" type=\"radio\" value=\"TRUE\"> TRUE</label><label><input name=\"q12\" type=\"radio\" value=\"FALSE\"> FALSE</label><label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div>\n<div class=\"question-item\"><p><strong>13</strong> Containers which are designed to decompose need particular storage conditions.</p><div class=\"radio-options\"><label><input name=\"q13\" type=\"radio\" value=\"TRUE\"> TRUE</label><label><input name=\"q13\" type=\"radio\" value=\"FALSE\"> FALSE</label><label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
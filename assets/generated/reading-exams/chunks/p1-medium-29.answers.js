@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-29", "answers", {"answerKey":{"q1":"FALSE","q2":"NOT GIVEN","q3":"TRUE","q4":"TRUE","q5":"FALSE","q6":"NOT GIVEN","q7":"skeletons","q8":"skull","q9":"shelter","q10":"plants","q11":"seasons","q12":"teeth","q13":"hibernate"}});
+})(typeof window !== "undefined" ? window : globalThis);
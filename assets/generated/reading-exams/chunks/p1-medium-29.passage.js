@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-29", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>The extinction of the cave bear</h3>\n<p>Hervé Bocherens, an evolutionary biologist at the University of Tübingen, Germany, says his colleagues find his research methods a little ‘crude'. He dissolves 30,000-year-old animal bones in hydrochloric acid, which is strong enough to burn through metal, soaks the bone solution in lye, cooks it at about 200 degrees Fahrenheit and freeze-dries it, until what's left is a speck of powder weighing less than one one-hundredth of an ounce. The method may be harsh, but the yield is precious – the biography of a cave bear as told through its chemical components. Bocherens is at the forefront of research on the bear, a European species that died out 25,000 years ago. People have been excavating cave bear remains for hundreds of years— in the Middle Ages, the massive skulls were attributed to dragons — but the past decade has seen a burst of discoveries about how the bears lived and why they became extinct. An abundance of bones has been found from Spain to Romania in caves where the animals once hibernated. ‘Caves are good places to preserve bones, and cave bears had the good sense to die there,' Bocherens says.</p>\n<p>Along with mammoths, lions and woolly rhinos, cave bears (Ursus spelaeus) were once among Europe's most impressive creatures. Males weighed up to 1,500 pounds, 50 per cent more than the largest modern grizzly bears. Cave bears had wider heads than today's bears, and powerful shoulders and forelimbs. But the relationship between humans and cave bears has been mysterious. Were humans prey for the bears, or predators? Were bears the object of worship or fear?</p>\n<p>Initially cave bears shared the continent of Europe, more than 100,000 years ago, with Neanderthals, a primitive species of humans. Modern humans arrived in Europe about 40,000 years ago, and were soon aware of the bears. They painted images of the animals on cave walls, and carved their likeness in fragments of mammoth tusk. The walls of France's Chauvet cave are painted with lions, hyenas and bears; dating back 32,000 years, these are perhaps the oldest paintings in the world. The painters weren't the cave's only occupants: the floor is covered with 150 cave bear skeletons, and its soft clay still holds paw prints. Most dramatically, a cave bear skull was perched on a stone slab in the center of one chamber, placed deliberately by some long-gone cave inhabitant. ‘There's no way to tell if it was just curiosity that made someone put a skull on the rock, or if it had religious significance,' says Bocherens.</p>\n<p>Another discovery, hundreds of miles to the east of Chauvet, would shed light on the relationship between cave bears and humans. The Swabian Jura is a limestone plateau in southwestern Germany that is riddled with caves. A steel gate guards the Hohle Fels cave from vandals and curiosity-seekers. Floodlights in the cave's main chamber illuminate the ceiling, vaulted like a cathedral above 5,000 square feet of floor space. Long ago, as shown by the bones and tools that archaeologists have found, cave bears and human beings sought shelter here from winter weather.</p>\n<p>In 2000, University of Tübingen paleobiologist Susanne Münzel unearthed a bear vertebra with a tiny triangular piece of flint embedded in it. The flint was likely a broken spear point, hard evidence of a successful bear hunt 29,000 years ago.</p>\n<p>Münzel also found bear bones that had clearly been scraped by stone tools. Evidence for bears being a food source for early humans was shown by cut marks on skulls and leg bones where the flesh had been cut away. Many of the bones were from baby bears, perhaps caught while hibernating.</p>\n<p>Cave bears disappeared not long after humans spread throughout Europe, and one theory is that hunting led to the bears' extinction. Hervé Bocherens' test tubes may hold the clues. Running his white powder through a mass spectrometer, he identifies different isotopes, or chemical forms, of elements such as carbon and nitrogen that reflect what the bears were eating and how quickly they grew. After studying hundreds of bones from dozens of sites in Europe, Bocherens has found that cave bears ate mainly plants.</p>\n<p>This would have made bears particularly vulnerable to the last Ice Age, which began around 30,000 years ago. This Ice Age shortened or eliminated growing seasons, and altered the distributions of plant species across Europe. Cave bears began to move from their old territories, according to a DNA analysis of teeth found near the Danube River. The cave bear population there was relatively stable, with the same genetic patterns showing up generation after generation. But about 28,000 years ago, newcomers with different DNA patterns arrived — a possible sign of hungry bears suddenly on the move.</p>\n<p>But changes in the climate can't be solely to blame for the bears' extinction. According to the latest study, by Erik Trinkaus and his colleagues at the Max Planck Institute, cave bear populations began a long, slow decline 50,000 years ago — well before the climate began to change. The new study supports a different explanation for the cave bears' demise. As Neanderthals, and then a growing population of modern humans moved into the caves of Europe, cave bears had fewer safe places to hibernate. An acute housing shortage may have been the final blow for these magnificent beasts.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
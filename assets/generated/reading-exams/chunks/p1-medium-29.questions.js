@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-29", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 1–6</h4>\n<p>Do the following statements agree with the information in Reading Passage 1?</p>\n<p>In boxes 1–6 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> Bocherens' findings on cave bears involve measuring the length of complete bones.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> Bocherens was the first person to conduct analytical research on cave bears in a laboratory.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> Cave bears have been extinct for 25,000 years.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> At one time, people thought the excavated remains of bears were those of dragons.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> Modern grizzly bears are similar in size to cave bears.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> Neanderthals understood cave bear behaviour better than modern humans did.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-11-12-13-anchor\">\n<h4>Questions 7–13</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>Research into the existence and disappearance of cave bears</h4>\n<p><strong>Evidence from the Chauvet cave in France</strong></p>\n<ul>\n<li>Paintings on the walls include bears.</li>\n<li>Over a hundred <strong>7</strong> <input type=\"text\" id=\"q7_input\" name=\"q7\"> of cave bears, together with paw prints, were found on the floor of the cave.</li>\n<li>The <strong>8</strong> <input type=\"text\" id=\"q8_input\" name=\"q8\"> of a cave bear was found in a prominent position in the cave.</li>\n</ul>\n<p><strong>Evidence from the Hohle Fels cave in the Swabian Jura, Germany</strong></p>\n<ul>\n<li>Bones and tools found in the cave indicate it provided <strong>9</strong> <input type=\"text\" id=\"q9_input\" name=\"q9\"> for both bears and humans.</li>\n</ul>\n<p><strong>Susanne Münzel's findings</strong></p>\n<ul>\n<li>A spear point in the vertebra of a bear indicates that a hunt had taken place.</li>\n<li>Marks on the bones of bears indicate the removal of flesh.</li>\n</ul>\n<p><strong>Hervé Bocherens' findings</strong></p>\n<ul>\n<li>Isotopes from the bones indicate that <strong>10</strong> <input type=\"text\" id=\"q10_input\" name=\"q10\"> were the cave bears' preferred food.</li>\n</ul>\n<p><strong>Factors leading to the disappearance of the cave bear</strong></p>\n<ul>\n<li><strong>Climate change</strong>\n<ul>\n<li>The Ice Age changed vegetation growth in <strong>11</strong> <input type=\"text\" id=\"q11_input\" name=\"q11\">.</li>\n<li>Bears were forced to migrate.</li>\n<li>Support for the above explanation comes from a study of changes in the DNA in the <strong>12</strong> <input type=\"text\" id=\"q12_input\" name=\"q12\"> of the population of cave bears near the Danube River at this time.</li>\n</ul>\n</li>\n<li><strong>Human population expansion</strong>\n<ul>\n<li>Competition from Neanderthals and modern humans for caves may have reduced opportunities for cave bears to <strong>13</strong> <input type=\"text\" id=\"q13_input\" name=\"q13\">.</li>\n</ul>\n</li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-33", "answers", {"answerKey":{"q1":"FALSE","q2":"NOT GIVEN","q3":"TRUE","q4":"FALSE","q5":"NOT GIVEN","q6":"TRUE","q7":"FALSE","q8":"brick","q9":"shape","q10":"countryside","q11":"statues","q12":"tunnel","q13":"pollution"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-33", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-medium-33","meta":{"title":"The Pyramid of Cestius 罗马金字塔","category":"P1","frequency":"medium","pdfFilename":"128. P1 - The Pyramid of Cestius 罗马金字塔【次】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/128. P1 - The Pyramid of Cestius 罗马金字塔【次】/","legacyFilename":"128. P1 - The Pyramid of Cestius 罗马金字塔【次】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/128. P1 - The Pyramid of Cestius 罗马金字塔【次】/128. P1 - The Pyramid of Cestius 罗马金字塔【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/128. P1 - The Pyramid of Cestius 罗马金字塔【次】/128. P1 - The Pyramid of Cestius 罗马金字塔【次】.pdf","ieltsHtml":"IELTS/P1/The Pyramid of Cestius.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.563Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-33", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 1–7</h4>\n<p>Do the following statements agree with the information in Reading Passage 1?</p>\n<p>In boxes 1–7 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information about this</li>\n</ul>\n<div class=\"question-item\" id=\"q1-anchor\">\n<p>1. The Pyramid of Cestius has always been one of Rome's most popular tourist attractions.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q2-anchor\">\n<p>2. The construction of the Pyramid was completed before Cestius' death.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q3-anchor\">\n<p>3. In the Middle Ages, people thought an original founder of Rome was buried in the Pyramid of Cestius.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q4-anchor\">\n<p>4. Today, the height of the Pyramid is something that tourists and residents immediately notice.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q5-anchor\">\n<p>5. Japanese businessman Yuzo Yagi was an admirer of both Italian and Egyptian architecture.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q6-anchor\">\n<p>6. The restoration of the Pyramid of Cestius, which was funded by Yuzo Yagi, finished earlier than expected.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q7-anchor\">\n<p>7. Most of the original frescoes inside Cestius' tomb have survived to this day.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"short_answer","questionIds":["q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 8-13</h4>\n<p>Complete the notes below.</p>\n<p>Choose ONE WORD ONLY from the passage for each answer.</p>\n<h5>History of the Pyramid of Cestius</h5>\n<p><strong>Construction of Cestius' pyramid</strong></p>\n<p>• it was made from 8 <input name=\"q8\" class=\"blank\" data-answer=\"brick\">, cement and marble</p>\n<p>• its 9 <input name=\"q9\" class=\"blank\" data-answer=\"shape\"> is different to the pyramids found in Egypt</p>\n<p>• it was originally built in the 10 <input name=\"q10\" class=\"blank\" data-answer=\"countryside\"> as building tombs in the city was forbidden</p>\n<p>• Emperor Aurelian ordered that a wall had to be built around it</p>\n<p><strong>Restoration of Cestius' pyramid in the 1660s</strong></p>\n<p>• In the 1660s, some broken 11 <input name=\"q11\" class=\"blank\" data-answer=\"statues\"> were found next to it</p>\n<p>• the 12 <input name=\"q12\" class=\"blank\" data-answer=\"tunnel\"> inside the tomb suggests that robbers had been there</p>\n<p>• the frescoes show mythological scenes, and images of vases</p>\n<p><strong>Restoration of Cestius' pyramid today</strong></p>\n<p>• a Japanese businessman paid for its restoration</p>\n<p>• climbers are helping to get rid of signs of 13 <input name=\"q13\" class=\"blank\" data-answer=\"pollution\"></p>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13"}});
+})(typeof window !== "undefined" ? window : globalThis);
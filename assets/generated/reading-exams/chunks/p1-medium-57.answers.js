@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-57", "answers", {"answerKey":{"q1":"C","q2":"A","q3":"D","q4":"C","q5":"customers","q6":"public relations skills","q7":"museology","q8":"tourist attractions","q9":"A","q10":"C","q11":["C","E","G"]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-57", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-medium-57","meta":{"title":"The Blockbuster Phenomenon 博物馆爆款现象","category":"P1","frequency":"medium","pdfFilename":"15. P1 - The Blockbuster Phenomenon 博物馆爆款现象【次】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/15. P1 - The Blockbuster Phenomenon 博物馆爆款现象【次】/","legacyFilename":"15. P1 - The Blockbuster Phenomenon 博物馆爆款现象【次】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/15. P1 - The Blockbuster Phenomenon 博物馆爆款现象【次】/15. P1 - The Blockbuster Phenomenon 博物馆爆款现象【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/15. P1 - The Blockbuster Phenomenon 博物馆爆款现象【次】/15. P1 - The Blockbuster Phenomenon 博物馆爆款现象【次】.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.608Z","notes":"signature:radio,checkbox,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-57", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 1–4</h4>\n<p>Reading Passage 1 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–H</strong>, in boxes 1–4 on your answer sheet.</em></p>\n<p><strong>NB</strong> You may use any letter more than once.</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>1</strong> the reason why museum directors need to constantly alter and update their exhibits</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>2</strong> mention of the length of time people will queue to see a blockbuster</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>3</strong> terms that people have used when referring to blockbusters</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>4</strong> the various ways that institutions like museums get financial support</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-anchor\">\n<h4>Questions 5–8</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>NO MORE THAN THREE WORDS</strong> from the passage for each answer.</p>\n<div class=\"question-item\">\n<div class=\"completion-item\">\n<span class=\"q-number\">5</span> These days, museum visitors tend to be referred to as <input name=\"q5\" type=\"text\" class=\"blank\" id=\"q5_input\">.\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"completion-item\">\n<span class=\"q-number\">6</span> Museum curators now need <input name=\"q6\" type=\"text\" class=\"blank\" id=\"q6_input\"> rather than academic qualifications.\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"completion-item\">\n<span class=\"q-number\">7</span> The linking of a range of public institutions that entertain the public is known as <input name=\"q7\" type=\"text\" class=\"blank\" id=\"q7_input\">.\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"completion-item\">\n<span class=\"q-number\">8</span> There is discussion about whether museums can be regarded in the same way as other <input name=\"q8\" type=\"text\" class=\"blank\" id=\"q8_input\">.\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"multi_choice","questionIds":["q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q9-10-anchor\">\n<h4>Questions 9 and 10</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>Which <strong>TWO</strong> of the following are mentioned by the writer as advantages of blockbusters?</p>\n<div class=\"checkbox-options\">\n<label><input type=\"checkbox\" name=\"q9_10\" value=\"A\"> <strong>A</strong> Some of the money they raise can be used for structural repairs.</label> <label><input type=\"checkbox\" name=\"q9_10\" value=\"B\"> <strong>B</strong> They can provide funds to help support amateur artists.</label> <label><input type=\"checkbox\" name=\"q9_10\" value=\"C\"> <strong>C</strong> Local services benefit from the extra business they bring about.</label> <label><input type=\"checkbox\" name=\"q9_10\" value=\"D\"> <strong>D</strong> They encourage overseas workers into the local area.</label> <label><input type=\"checkbox\" name=\"q9_10\" value=\"E\"> <strong>E</strong> They raise employee performance levels.</label>\n</div>\n</div>"},{"groupId":"group-4","kind":"multi_choice","questionIds":["q11"],"bodyHtml":"<div class=\"group\" id=\"q11-13-anchor\">\n<h4>Questions 11–13</h4>\n<p>Choose <strong>THREE</strong> letters, <strong>A–G</strong>.</p>\n<p>Which <strong>THREE</strong> of the following are mentioned by the writer as disadvantages of blockbusters?</p>\n<div class=\"checkbox-options\">\n<label><input type=\"checkbox\" name=\"q11\" value=\"A\"> <strong>A</strong> They do not suit museum management styles.</label> <label><input type=\"checkbox\" name=\"q11\" value=\"B\"> <strong>B</strong> Specialist business advice has to be paid for.</label> <label><input type=\"checkbox\" name=\"q11\" value=\"C\"> <strong>C</strong> They involve an increased workload for personnel.</label> <label><input type=\"checkbox\" name=\"q11\" value=\"D\"> <strong>D</strong> They do not increase overall annual visitor numbers.</label> <label><input type=\"checkbox\" name=\"q11\" value=\"E\"> <strong>E</strong> They are very tiring to put on.</label> <label><input type=\"checkbox\" name=\"q11\" value=\"F\"> <strong>F</strong> What is popular in one country may not be popular in another.</label> <label><input type=\"checkbox\" name=\"q11\" value=\"G\"> <strong>G</strong> The content can be weakened through financial pressure.</label>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11"],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11"}});
+})(typeof window !== "undefined" ? window : globalThis);
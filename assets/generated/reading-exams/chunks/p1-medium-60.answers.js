@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-60", "answers", {"answerKey":{"q1":"FALSE","q2":"NOT GIVEN","q3":"NOT GIVEN","q4":"TRUE","q5":"FALSE","q6":"TRUE","q7":"NOT GIVEN","q8":"animals","q9":"emotion","q10":"gene","q11":"left","q12":"laboratory","q13":"cheating"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-60", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-medium-60","meta":{"title":"Sorry—who are you 脸盲症","category":"P1","frequency":"medium","pdfFilename":"152. P1 - Sorry—who are you 脸盲症【次】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/152. P1 - Sorry—who are you 脸盲症【次】/","legacyFilename":"152. P1 - Sorry—who are you 脸盲症【次】.html","questionIntroHtml":"<h3>Questions 1–7</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/152. P1 - Sorry—who are you 脸盲症【次】/152. P1 - Sorry—who are you 脸盲症【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/152. P1 - Sorry—who are you 脸盲症【次】/152. P1 - Sorry—who are you 脸盲症【次】.pdf","ieltsHtml":"IELTS/P1/Sorry—who are you.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.614Z","notes":"signature:radio,text,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-63", "answers", {"answerKey":{"q1":"FALSE","q2":"TRUE","q3":"TRUE","q4":"NOT GIVEN","q5":"FALSE","q6":"populations","q7":"records","q8":"salt","q9":"glass","q10":"texture","q11":"lightweight","q12":"chisel","q13":"meat"}});
+})(typeof window !== "undefined" ? window : globalThis);
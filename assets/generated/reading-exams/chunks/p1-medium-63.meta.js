@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p1-medium-63", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p1-medium-63","meta":{"title":"A Brief History of Humans and Food 人类食物的历史","category":"P1","frequency":"medium","pdfFilename":"155. P1 - A Brief History of Humans and Food 人类食物的历史【次】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/155. P1 - A Brief History of Humans and Food 人类食物的历史【次】/","legacyFilename":"155. P1 - A Brief History of Humans and Food 人类食物的历史【次】.html","questionIntroHtml":"<h3>Questions 1–5</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/155. P1 - A Brief History of Humans and Food 人类食物的历史【次】/155. P1 - A Brief History of Humans and Food 人类食物的历史【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/155. P1 - A Brief History of Humans and Food 人类食物的历史【次】/155. P1 - A Brief History of Humans and Food 人类食物的历史【次】.pdf","ieltsHtml":"IELTS/P1/A Brief History of Humans and Food.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.621Z","notes":"signature:radio,text,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
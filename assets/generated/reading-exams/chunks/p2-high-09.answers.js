@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-09", "answers", {"answerKey":{"q1":"A","q2":"D","q3":"B","q4":"E","q5":"A","q6":"D","q7":"C","q8":"E","q9":"B","q10":"D","q11":"A","q12":"C","q13":"A"}});
+})(typeof window !== "undefined" ? window : globalThis);
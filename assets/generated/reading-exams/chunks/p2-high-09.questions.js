@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-09", "questions", {"questionGroups":[{"groupId":"group-1","kind":"multi_choice","questionIds":["q1","q2"],"bodyHtml":"<div class=\"group\" id=\"q1-2-anchor\">\n<h4>Questions 14 and 15</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>According to the writer, which <strong>TWO</strong> of the following are characteristics of the classical approach to organisational design?</p>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q1_2\" value=\"A\"> A. a marked ranking order for employees</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q1_2\" value=\"B\"> B. giving importance to everyone's work</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q1_2\" value=\"C\"> C. the advancement of older workers</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q1_2\" value=\"D\"> D. a neutral working environment</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q1_2\" value=\"E\"> E. increased benefits for workers</label>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"multi_choice","questionIds":["q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q3-4-anchor\">\n<h4>Questions 16 and 17</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>According to the writer, which <strong>TWO</strong> of the following are criticisms of the classical approach to organisational design?</p>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q3_4\" value=\"A\"> A. Too many guidelines are proposed</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q3_4\" value=\"B\"> B. Certain practices become negative if they are implemented too strictly</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q3_4\" value=\"C\"> C. Managers and workers are unable to co-operate with each other</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q3_4\" value=\"D\"> D. The administrative standards are unsuited to some work environments</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q3_4\" value=\"E\"> E. Positive outcomes which were expected in the past would be unlikely today</label>\n</div>\n</div>"},{"groupId":"group-3","kind":"multi_choice","questionIds":["q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q5-6-anchor\">\n<h4>Questions 18 and 19</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>According to the writer, which <strong>TWO</strong> of the following are aims of the neoclassical approach to organisational design?</p>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q5_6\" value=\"A\"> A. to ensure workers are treated as individual people</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q5_6\" value=\"B\"> B. to create a formal atmosphere in the workplace</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q5_6\" value=\"C\"> C. to change the methods of production</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q5_6\" value=\"D\"> D. to allow workers a greater say in what happens at the workplace</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q5_6\" value=\"E\"> E. to standardise the procedures for promotion of workers</label>\n</div>\n</div>"},{"groupId":"group-4","kind":"multi_choice","questionIds":["q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q7-8-anchor\">\n<h4>Questions 20 and 21</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>According to the writer, which <strong>TWO</strong> of the following are criticisms of the neoclassical approach to organisational design?</p>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q7_8\" value=\"A\"> A. It suggests that workers are involved in too many decisions</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q7_8\" value=\"B\"> B. The effects of some psychological factors are given low importance</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q7_8\" value=\"C\"> C. The effects of the workplace surroundings are ignored</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q7_8\" value=\"D\"> D. It exaggerates the success of the organisations that use this approach</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q7_8\" value=\"E\"> E. It assumes that all people work for enjoyment rather than financial gain</label>\n</div>\n</div>"},{"groupId":"group-5","kind":"matching","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 22–26</h4>\n<p>Look at the following beliefs (Questions 22–26) and the list of people below. Match each belief with the correct person, <strong>A–D</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>22</strong> The classical approach relied upon managers having incorrect views about workers.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> In the best organisational model, there is shared decision-making and interaction between teams at work.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>24</strong> In an efficient organisation, workers develop expertise in particular areas.</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>25</strong> An organisation must take into account the emotional demands of people.</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>26</strong> The classical approach allowed workers' skills to be assessed in a straightforward way.</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div class=\"options-pool\" id=\"people-options-pool\">\n<strong>List of people</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"person-A\" draggable=\"true\" data-option=\"A\">A. Max Weber</div>\n<div class=\"drag-item\" id=\"person-B\" draggable=\"true\" data-option=\"B\">B. Douglas McGregor</div>\n<div class=\"drag-item\" id=\"person-C\" draggable=\"true\" data-option=\"C\">C. Chris Argyris</div>\n<div class=\"drag-item\" id=\"person-D\" draggable=\"true\" data-option=\"D\">D. Rensis Likert</div>\n</div>\n</div>\n</div>","allowOptionReuse":true}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-120", "answers", {"answerKey":{"q1":"iv","q2":"ix","q3":"i","q4":"x","q5":"iii","q6":"v","q7":"vii","q8":"D","q9":"A","q10":"C","q11":"density","q12":"architects","q13":"budget"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-120", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-high-120","meta":{"title":"A new look for Talbot Park 奥克兰社区改造","category":"P2","frequency":"high","pdfFilename":"33. P2 - A new look for Talbot Park 奥克兰社区改造【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/33. P2 - A new look for Talbot Park 奥克兰社区改造【高】/","legacyFilename":"ai_studio_code (9).html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/33. P2 - A new look for Talbot Park 奥克兰社区改造【高】/ai_studio_code (9).html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/33. P2 - A new look for Talbot Park 奥克兰社区改造【高】/33. P2 - A new look for Talbot Park 奥克兰社区改造【高】.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-11T14:43:22.251Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-120", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>A new look for Talbot Park</h3>\n<p>Talbot Park, a housing project in Auckland, New Zealand, was once described as a ghetto, troubled by high rates of crime and vandalism. However, it has just been rebuilt at a cost of $48 m and the project reflects some new thinking about urban design.</p>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"A\" id=\"q1-dropzone\" data-question=\"q1\">\n<span class=\"paragraph-label\">Paragraph A (Q14):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> The new Talbot Park is immediately eye-catching because the buildings look quite different to other state-housing projects in Auckland. ‘There is no reason why state housing should look cheap in my view,' says architect Neil Cotton, one of the design team. ‘In fact, I was anticipating a backlash by those who objected to the quality of what is provided with government money.' The tidy brick and wood apartments and townhouses would not look out of place in some of the city's most affluent suburbs, and this is a central theme of the Talbot Park philosophy.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"B\" id=\"q2-dropzone\" data-question=\"q2\">\n<span class=\"paragraph-label\">Paragraph B (Q15):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> Talbot Park is a triangle of government-owned land, which in the early 1960s was developed for state housing built around a linear garden that ran through the middle. Initially, there was a strong sense of neighbourliness. Former residents recall how the garden played a big part in their childhoods — a place where kids came together to play softball, cricket and bullrush. ‘We had respect for our neighbours and addressed them by title — Mr and Mrs so-and-so,' recalls Georgie Thompson, who grew up there in the 1960s.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"C\" id=\"q3-dropzone\" data-question=\"q3\">\n<span class=\"paragraph-label\">Paragraph C (Q16):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> Exactly what went wrong with Talbot Park is unclear. The community began to change in the late 1970s as more immigrants moved in. The new arrivals didn't always integrate with the community and a 'them and us' mentality developed. In the process, standards dropped and the neighbourhood began to look shabbier. The buildings themselves were also deteriorating and becoming run-down, petty crime was on the rise and the garden was considered unsafe. In 2002, Housing New Zealand decided the properties needed upgrading. The question was, how to avoid repeating the mistakes of the past?</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"D\" id=\"q4-dropzone\" data-question=\"q4\">\n<span class=\"paragraph-label\">Paragraph D (Q17):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> One controversial aspect of the upgrade is that the new development has actually made the density of housing in Talbot Park greater, putting 52 more homes on the same site. Doing this required a fresh approach that can be summed up as 'mix and match'. The first priority was to mix up the housing by employing a variety of plans by different architects: some of the accommodation is free-standing houses, some semi-detached, some low-level, multi-apartment blocks. By doing this, the development avoids the uniform appearance of so many state-housing projects, which residents complain denies them any sense of individual identity. The next goal was to prevent overspending by using efficient designs to maximise the sense of space from minimum room sizes. There was also a no-frills, industrial approach to kitchens, bathrooms and flooring, to optimise durability and ensure the project did not go over budget. Architecturally, the buildings are relatively conservative: fairly plain houses standing in a small garden. There's a slight reflection of the traditional Pacific beach house (a fale) but it's not over-played. 'It seems to us that low-cost housing is about getting as much amenity as you can for the money,' says architect Michael Thompson. Another key aspect of the 'mix and match' approach is openness: one that not only lets residents see what is going on but also lets them know they are seen. The plan ensures there are no cul-de-sacs or properties hidden from view, that the gardens are not enclosed by trees and that most boundary fences are see-through — a community contained but without walls.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"E\" id=\"q5-dropzone\" data-question=\"q5\">\n<span class=\"paragraph-label\">Paragraph E (Q18):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> The population today is cosmopolitan: 50% Pacific Islanders, 20% Māori, 15% Asian, 10% New Zealand European and the rest composed of immigrants from Russia, Ukraine and Iran. 'It was important that the buildings were sufficiently flexible to cater for the needs of people from a wide variety of cultural backgrounds,' explains designer James Lundy.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"F\" id=\"q6-dropzone\" data-question=\"q6\">\n<span class=\"paragraph-label\">Paragraph F (Q19):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> Despite the quality of the buildings, however, there should be no doubt that Talbot Park and its surrounding suburb of Tāmaki are low socio-economic areas. Of the 5,000 houses there, 55% are state houses, 28% privately owned (compared to about 65% nationally) and 17% private rental. The area has a high density of households with incomes in the $5,000 to $15,000 range and very few with an income over $70,000. That's in sharp contrast to the more affluent suburbs in Auckland.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"G\" id=\"q7-dropzone\" data-question=\"q7\">\n<span class=\"paragraph-label\">Paragraph G (Q20):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>G</strong> Another important part of the new development is what Housing New Zealand calls 'intensive tenancy management'. Opponents of the project call it social control. ‘The focus is on frequent inspections and setting clear guidelines and boundaries regarding the sort of behaviour we expect from tenants,' says Graham Bodman, Housing New Zealand's regional manager. The result is a code of sometimes strict rules: no loud parties after 10 pm; no washing hung over balcony rails; and a requirement to mow lawns and keep the property tidy. The Tenancy Manager walks the site every day, knows everyone by name and deals with problems quickly. 'It's all based on the intensification,' says project manager Stuart Bracey. ‘We acknowledge that if you are going to ask people to live in these quite tightly-packed communities, you have to actually help them to get to know each other by organising morning teas and street barbecues.' So far it seems to be working and many involved in the project believe Talbot Park represents the way forward for state housing.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
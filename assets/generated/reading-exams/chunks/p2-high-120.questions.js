@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-120", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 14–20</h4>\n<p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i Some of the problems that developed at Talbot Park</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Where the residents lived while the work was being completed</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii The ethnic makeup of the new Talbot Park</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv The unexpectedly high standard of the housing</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v Financial hardship in Talbot Park and a neighbouring community</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi The experiences of one family living at Talbot Park today</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii How to co-ordinate and assist the people who live at Talbot Park</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii Raising the money to pay for the makeover</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix A close community in the original Talbot Park development</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"x\">x Details of the style of buildings used in the makeover</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-anchor\">\n<h4>Questions 21–23</h4>\n<p>Look at the following people (Questions 21–23) and the list of ideas below.</p>\n<p>Match each person with the correct idea, <strong>A–F</strong>.</p>\n<div class=\"question-item\">\n<p><strong>21</strong> James Lundy</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"> A Good tenant management involves supervision and regulation.</label> <label><input name=\"q8\" type=\"radio\" value=\"B\"> B State housing must be built at minimum expense to the public.</label> <label><input name=\"q8\" type=\"radio\" value=\"C\"> C Organising social events helps tenants to live close together.</label> <label><input name=\"q8\" type=\"radio\" value=\"D\"> D Mixed-race communities require adaptable and responsive designs.</label> <label><input name=\"q8\" type=\"radio\" value=\"E\"> E Complaints were expected about the high standard of the development.</label> <label><input name=\"q8\" type=\"radio\" value=\"F\"> F Too many rules and regulations will cause resentment from tenants.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>22</strong> Graham Bodman</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"> A Good tenant management involves supervision and regulation.</label> <label><input name=\"q9\" type=\"radio\" value=\"B\"> B State housing must be built at minimum expense to the public.</label> <label><input name=\"q9\" type=\"radio\" value=\"C\"> C Organising social events helps tenants to live close together.</label> <label><input name=\"q9\" type=\"radio\" value=\"D\"> D Mixed-race communities require adaptable and responsive designs.</label> <label><input name=\"q9\" type=\"radio\" value=\"E\"> E Complaints were expected about the high standard of the development.</label> <label><input name=\"q9\" type=\"radio\" value=\"F\"> F Too many rules and regulations will cause resentment from tenants.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>23</strong> Stuart Bracey</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"> A Good tenant management involves supervision and regulation.</label> <label><input name=\"q10\" type=\"radio\" value=\"B\"> B State housing must be built at minimum expense to the public.</label> <label><input name=\"q10\" type=\"radio\" value=\"C\"> C Organising social events helps tenants to live close together.</label> <label><input name=\"q10\" type=\"radio\" value=\"D\"> D Mixed-race communities require adaptable and responsive designs.</label> <label><input name=\"q10\" type=\"radio\" value=\"E\"> E Complaints were expected about the high standard of the development.</label> <label><input name=\"q10\" type=\"radio\" value=\"F\"> F Too many rules and regulations will cause resentment from tenants.</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>The 'mix and match' strategy</h4>\n<p>\nOne aspect of the Talbot Park project that some critics are concerned about is that the higher <strong>24</strong> <input type=\"text\" id=\"q24_input\" name=\"q11\"> of accommodation would lead to the old social problems returning. To prevent this, a team of various <strong>25</strong> <input type=\"text\" id=\"q25_input\" name=\"q12\"> worked on the project to ensure the buildings were not uniform. Further, they created pleasant, functional interiors that could still be built within their <strong>26</strong> <input type=\"text\" id=\"q26_input\" name=\"q13\">. Finally, the absence of walls means Talbot Park is characterised by openness, making it easier to regulate behaviour within the community.\n</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
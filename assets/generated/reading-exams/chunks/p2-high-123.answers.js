@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-123", "answers", {"answerKey":{"q1":"ii","q2":"iv","q3":"x","q4":"vi","q5":"v","q6":"i","q7":"ix","q8":"A","q9":"C","q10":"parental","q11":"predators","q12":"visible","q13":"lost"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-123", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-high-123","meta":{"title":"Bird Migration 鸟类迁徙","category":"P2","frequency":"high","pdfFilename":"36. P2 - Bird Migration 鸟类迁徙.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/36. P2 - Bird Migration 鸟类迁徙【高】/","legacyFilename":"36. P2 - Bird Migration 鸟类迁徙【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/36. P2 - Bird Migration 鸟类迁徙【高】/36. P2 - Bird Migration 鸟类迁徙【高】.html","shuiPdf":"ReadingPractice/PDF/36. P2 - Bird Migration 鸟类迁徙.pdf","ieltsHtml":"IELTS/P2/Bird Migration.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-04-30T00:00:00.000Z","notes":"Updated from ReadingPractice/PDF/36. P2 - Bird Migration 鸟类迁徙.pdf via pdftotext and pypdf extraction."}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-123", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14-26, which are based on Reading Passage 2 on the following pages.</p>\n<h3>Bird Migration</h3>\n<div class=\"paragraph-wrapper\" id=\"para-A-anchor\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"A\" data-question=\"q1\">\n<span class=\"paragraph-label\">Paragraph A (Q14):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> Birds are highly mobile and among the swiftest of living creatures. Flight gives them the power to move in any direction for as long as they have the energy to keep going. They are equipped with lightweight, hollow bones, a finely-tuned navigation system and an ingenious heat-conserving design that allows them to face life in the harshest of climates. Their respiratory systems have to perform efficiently during sustained flights at altitude, so they have evolved a system of extracting air from their lungs that far exceeds that of any other animal. These features enable birds to come and go with the seasons. On the way, they face constant danger and a daily requirement to find food, water and a safe place to rest. So why do millions of birds migrate rather than stay in one place?</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-B-anchor\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"B\" data-question=\"q2\">\n<span class=\"paragraph-label\">Paragraph B (Q15):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> Most of the explanation revolves around food. In temperate and arctic regions of the northern hemisphere, food is abundant during a short growing season. Migration evolved as a way for birds to exploit resources that are seasonally abundant and, equally important, to go elsewhere when the resources become scarce or harsh weather arrives. Many species can tolerate cold temperatures if food is plentiful but when food is not available they must migrate.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-C-anchor\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"C\" data-question=\"q3\">\n<span class=\"paragraph-label\">Paragraph C (Q16):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> While this simple explanation for why birds migrate is essentially true, intriguing questions remain. One puzzling fact is that many birds journey much further than would be necessary to find food and good weather. Another apparent conundrum involves the huge migrations performed by arctic birds and mudflat-probing shore birds that breed close to polar regions. In general, the further north a migrant species breeds, the further south it spends the winter. Yet, en route to a final destination in southern latitudes, all these individuals overfly areas of seemingly suitable habitat spanning two hemispheres. Such compulsive journeys probably evolved over time and in response to fluctuations in weather but we do not really know.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-D-anchor\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"D\" data-question=\"q4\">\n<span class=\"paragraph-label\">Paragraph D (Q17):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> But just how do birds reach their destination and, more to the point, how do young birds migrate over vast distances without parental assistance? Very few adults migrate accompanied by their offspring and youngsters may have little or no inkling of their parents' appearance. Cuckoos are famous for depositing their eggs in the nests of other birds that unwittingly serve as foster-parents. Astonishing as this piece of evolutionary behaviour is, it is even more remarkable to consider that, once grown, the young cuckoo makes its own way to ancestral wintering grounds in the tropics before returning single-handedly to northern Europe to seek out a mate among its own kind.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-E-anchor\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"E\" data-question=\"q5\">\n<span class=\"paragraph-label\">Paragraph E (Q18):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> As we continue to study bird migration, its mystery is better understood but also compounded. Mounting evidence has confirmed that birds use the sun and stars to obtain compass directions but true navigation requires an awareness of position and time, especially when lost. Experiments have shown that, after being taken thousands of miles over an unfamiliar landmass, birds are still capable of returning rapidly to nest sites. Such phenomenal powers are the product of computing a number of sophisticated cues including an innate map of the night sky and the pull of the Earth's magnetic field. How the birds use their 'instruments' remains unknown, but one thing is clear - they see the world with a sensory perception superior to ours. Most small birds migrate at night and take their direction from the position of the setting sun. However, as well as seeing the sun go down, they also seem to see the plane of polarised light it causes. This calibrates their compass. Travelling at night provides other benefits: the danger of meeting predators as well as the risk of dehydration due to flying for long periods in warm sunlit skies is reduced. Furthermore, at night the air structure is cool and smooth and conducive to sustained, stable flight.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-F-anchor\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"F\" data-question=\"q6\">\n<span class=\"paragraph-label\">Paragraph F (Q19):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> Nevertheless, all journeys involve considerable risk and part of the skill in arriving safely is setting off at the right time. This means accurate weather forecasting and utilising favourable winds. Birds are adept at both and, in tests, some can detect the minute difference in barometric pressure between the floor and ceiling of a room. Often birds react to weather changes before there is any visible sign of them. Certain species that feed on grassland flee at the onset of a cold snap because when the ground surface freezes the birds could starve. Yet they return ahead of a thaw, their arrival linked to a pressure change presaging an improvement in the weather.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-G-anchor\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"G\" data-question=\"q7\">\n<span class=\"paragraph-label\">Paragraph G (Q20):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>G</strong> Unfortunately, some never complete their journey. Not so long ago the assumption was that a bird in the air on a dark windy night with no visible reference points to judge position was, like a pilot without radar, hopelessly lost. We now know this is not the case. Losses do occur, but mainly because birds get swept off course by strong air masses against which battle is futile, and this results in a watery grave. Indeed, it is not unusual for ocean fish to be caught with bird remains in their stomachs. But sometimes there's a silver lining. Each autumn a small number of North American birds are blown across the Atlantic by fast-moving westerly tail winds. Not only do they arrive safely in Europe but, based on tracking evidence, some make it back to North America in the following spring - probably after spending the winter with European migrants in sunny African climes.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-123", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 14-20</h4>\n<p>Reading Passage 2 has seven paragraphs, <strong>A-G</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it into the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. Choosing the best moment to migrate</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. The physical characteristics of birds that allow them to migrate</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. Environmental pollution and migration patterns</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. The main reason why birds migrate</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. Research findings on how birds find their way</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. Successful migration despite a lack of teaching</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. Why some birds don't migrate</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. How larger birds make use of the wind</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix. Success despite problems with wind during migration</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"x\">x. The unexplained rejection of closer feeding grounds</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"multi_choice","questionIds":["q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q8-9-anchor\">\n<h4>Questions 21 and 22</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A-E</strong>.</p>\n<p>According to the passage, which <strong>TWO</strong> of the following statements are true of migrating birds?</p>\n<div class=\"question-item\">\n<div class=\"checkbox-options\">\n<label><input name=\"q8-9\" type=\"checkbox\" value=\"A\"> A. Many birds migrate longer distances than they need to.</label> <label><input name=\"q8-9\" type=\"checkbox\" value=\"B\"> B. Family groups migrate most successfully.</label> <label><input name=\"q8-9\" type=\"checkbox\" value=\"C\"> C. Birds need less water if they migrate at night.</label> <label><input name=\"q8-9\" type=\"checkbox\" value=\"D\"> D. Only shore birds are unaffected by wind.</label> <label><input name=\"q8-9\" type=\"checkbox\" value=\"E\"> E. Birds are unable to survive if separated from other members of their own species.</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"sentence_completion","questionIds":["q10","q11","q12","q13"],"bodyHtml":"<div class=\"group sentence-completion\" id=\"q10-11-12-13-anchor\">\n<h4>Questions 23-26</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"question-item\" id=\"q10-anchor\">\n<p><strong>23</strong> The cuckoo is able to migrate despite a lack of <input type=\"text\" name=\"q10\" id=\"q23_input\"> guidance.</p>\n</div>\n<div class=\"question-item\" id=\"q11-anchor\">\n<p><strong>24</strong> Night travel benefits birds because they can avoid contact with <input type=\"text\" name=\"q11\" id=\"q24_input\">.</p>\n</div>\n<div class=\"question-item\" id=\"q12-anchor\">\n<p><strong>25</strong> Some birds can anticipate weather changes without <input type=\"text\" name=\"q12\" id=\"q25_input\"> clues.</p>\n</div>\n<div class=\"question-item\" id=\"q13-anchor\">\n<p><strong>26</strong> In the past, birds were thought to be <input type=\"text\" name=\"q13\" id=\"q26_input\"> when flying in the dark.</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
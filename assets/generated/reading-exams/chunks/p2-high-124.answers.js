@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-124", "answers", {"answerKey":{"q1":"v","q2":"viii","q3":"vi","q4":"vii","q5":"iii","q6":"i","q7":"ii","q8":"equal opportunity","q9":"internal costs","q10":"C","q11":"C","q12":"A","q13":"B"}});
+})(typeof window !== "undefined" ? window : globalThis);
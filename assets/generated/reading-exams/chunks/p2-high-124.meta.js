@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-124", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-high-124","meta":{"title":"Corporate Social Responsibility  企业社会责任","category":"P2","frequency":"high","pdfFilename":"37. P2 - Corporate Social Responsibility  企业社会责任【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/37. P2 - Corporate Social Responsibility  企业社会责任【高】/","legacyFilename":"37. P2 - Corporate Social Responsibility  企业社会责任【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/37. P2 - Corporate Social Responsibility  企业社会责任【高】/37. P2 - Corporate Social Responsibility  企业社会责任【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/37. P2 - Corporate Social Responsibility  企业社会责任【高】/37. P2 - Corporate Social Responsibility  企业社会责任【高】.pdf","ieltsHtml":"IELTS/P2/Corporate Social Responsibility.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.257Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
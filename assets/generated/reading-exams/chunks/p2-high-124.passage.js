@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-124", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Corporate Social Responsibility</h3>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"A\" id=\"q1-dropzone\" data-question=\"q1\">\n<span class=\"paragraph-label\">Question 14 (A):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> An excellent definition was developed in the 1980s by Norwegian Prime Minister Gro Harlem Brundtland and used by the World Business Council for Sustainable Development: \"Meeting the needs of the present without compromising the ability of future generations to meet their own needs.\" Nowadays, governments and companies need to account for the social consequences of their actions. As a result, corporate social responsibility (CSR) has become a priority for business leaders around the world. When a well-run business applies its vast resources and expertise to social problems that it understands and in which it has a stake, it can have a greater impact than any other organisation. The notion of licence to operate derives from the fact that every company needs tacit or explicit permission from governments, communities, and numerous other stakeholders to justify CSR initiatives to improve a company's image, strengthen its brand, enliven morale and even raise the value of its stock.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"B\" id=\"q2-dropzone\" data-question=\"q2\">\n<span class=\"paragraph-label\">Question 15 (B):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> To advance CSR, we must root it in a broad understanding of the interrelationship between a corporation and society. Successful corporations need a healthy society. Education, health care, and equal opportunity are essential to a productive workforce. Safe products and working conditions not only attract customers but lower the internal costs of accidents. Efficient utilisation of land, water, energy, and other natural resources makes business more productive. Good government, the rule of law, and property rights are essential for efficiency and innovation. Strong regulatory standards protect both consumers and competitive companies from exploitation. Ultimately, a healthy society creates expanding demand for business, as more human needs are met and aspirations grow. Any business that pursues its ends at the expense of the society in which it operates will find its success to be illusory and ultimately temporary. At the same time, a healthy society needs successful companies. No social programme can rival the business sector when it comes to creating the jobs, wealth, and innovation that improve standards of living and social conditions over time.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"C\" id=\"q3-dropzone\" data-question=\"q3\">\n<span class=\"paragraph-label\">Question 16 (C):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> A company's impact on society also changes over time, as social standards evolve and science progresses. Asbestos, now understood as a serious health risk, was thought to be safe in the early 1900s, given the scientific knowledge then available. Evidence of its risks gradually mounted for more than 50 years before any company was held liable for the harms it can cause. Many firms that failed to anticipate the consequences of this evolving body of research have been bankrupted by the results. No longer can companies be content to monitor only the obvious social impacts of today. Without a careful process for identifying evolving social effects of tomorrow, firms may risk their very survival.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"D\" id=\"q4-dropzone\" data-question=\"q4\">\n<span class=\"paragraph-label\">Question 17 (D):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> No business can solve all of society's problems or bear the cost of doing so. Instead, each company must select issues that intersect with its particular business. Other social agendas are best left to those companies in other industries, NGOs, or government institutions that are better positioned to address them. The essential test that should guide CSR is not whether a cause is worthy but whether it presents an opportunity to create shared value – that is, a meaningful benefit for society that is also valuable to the business. Each company can identify the particular set of societal problems that it is best equipped to help resolve and from which it can gain the greatest competitive benefit.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"E\" id=\"q5-dropzone\" data-question=\"q5\">\n<span class=\"paragraph-label\">Question 18 (E):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> The best corporate citizenship initiatives involve far more than writing a cheque: they specify clear, measurable goals and track results over time. A good example is General Electric's programme to adopt underperforming public high schools near several of its major U.S. facilities. The company contributes between $250,000 and $1 million over a five-year period to each school and makes in-kind donations as well. GE managers and employees take an active role by working with school administrators to assess needs and mentor or tutor students. In an independent study of ten schools in the programme between 1989 and 1999, nearly all showed significant improvement, while the graduation rate in four of the five worst-performing schools doubled from an average of 30 % to 60 %. Effective corporate citizenship initiatives such as this one create goodwill and improve relations with local governments and other important constituencies. What's more, GE's employees feel great pride in their participation. Their effect is inherently limited, however. No matter how beneficial the programme is, it remains incidental to the company's business, and the direct effect on GE's recruiting and retention is modest.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"F\" id=\"q6-dropzone\" data-question=\"q6\">\n<span class=\"paragraph-label\">Question 19 (F):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> Microsoft's Working Connections partnership with the American Association of Community Colleges (AACC) is a good example of a shared-value opportunity arising from investments in context. The shortage of information-technology workers is a significant constraint on Microsoft's growth; currently, there are more than 450,000 unfilled IT positions in the United States alone. Community colleges, with an enrolment of 11.6 million students, representing 45 % of all U.S. undergraduates, could be a major solution. Microsoft recognises, however, that community colleges face special challenges: IT curricula are not standardised, technology used in classrooms is often outdated, and there are no systematic professional development programmes to keep faculty up to date. Microsoft's $50 million five-year initiative was aimed at all three problems. In addition to contributing money and products, Microsoft sent employee volunteers to colleges to assess needs, contribute to curriculum development, and create faculty-development institutes. Microsoft has achieved results that have benefited many communities while having a direct and potentially significant impact on the company.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"G\" id=\"q7-dropzone\" data-question=\"q7\">\n<span class=\"paragraph-label\">Question 20 (G):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>G</strong> At the heart of any strategy is a unique value proposition: a set of needs a company can meet for its chosen customers that its competitors cannot. The most strategic CSR occurs when a company adds a social dimension to its value proposition, making social impact integral to the overall strategy. Consider Whole Foods Market, whose value proposition is to sell organic, natural, and healthy food products to customers who are passionate about food and the environment. The company's sourcing emphasises purchases from local farmers through each store's procurement process. Buyers screen out foods containing any of nearly 100 common ingredients that the company considers unhealthy or environmentally damaging. The same standards apply to products made internally. Whole Foods' commitment to natural and environmentally friendly operating practices extends well beyond sourcing. Stores are constructed using a minimum of virgin raw materials. Recently, the company purchased renewable wind-energy credits equal to 100 % of its electricity use in all of its stores and facilities, the only Fortune 500 company to offset its electricity consumption entirely. Spoiled produce and biodegradable waste are trucked to regional centres for composting. Whole Foods' vehicles are being converted to run on biofuels. Even the cleaning products used in its stores are environmentally friendly. And through its philanthropy, the company has created the Animal Compassion Foundation to develop more natural and humane ways of raising farm animals. In short, nearly every aspect of the company's value chain reinforces the social dimensions of its value proposition, distinguishing Whole Foods from its competitors.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-124", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 14–20</h4>\n<p>The reading passage has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from this list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. How CSR may help one business to expand</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. CSR in many aspects of a company's business</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. A CSR initiative without a financial gain</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. Lack of action by the state on social issues</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. Drivers or pressures motivate companies to address CSR</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. The past illustrates businesses are responsible for future outcomes</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. Companies applying CSR should be selective</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. Reasons that business and society benefit each other</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q8","q9"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 21–22</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"question-item\" id=\"q8-anchor\">\n<p><strong>The implementation of CSR – How?</strong></p>\n<p>Promotion of CSR requires the understanding of interdependence between business and society. Corporations' workers' productivity generally needs health care, education, and 21 <input class=\"blank\" name=\"q8\">. Restrictions imposed by government and companies both protect consumers from being treated unfairly. Improvement of the safety standard can reduce the 22 <input class=\"blank\" name=\"q9\"> of accidents in the workplace. Similarly, society becomes a pool of more human needs and aspirations.</p>\n</div>\n<div id=\"q9-anchor\"></div>\n</div>"},{"groupId":"group-3","kind":"single_choice","questionIds":["q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 23–26</h4>\n<p>Look at the following opinions or deeds (Questions 23–26) and the list of companies below.</p>\n<p>Match each opinion or deed with the correct company, A, B or C.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"question-item\" id=\"q10-anchor\">\n<p><strong>23</strong> Disposable waste</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"> A General Electric</label> <label><input name=\"q10\" type=\"radio\" value=\"B\"> B Microsoft</label> <label><input name=\"q10\" type=\"radio\" value=\"C\"> C Whole Foods Market</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q11-anchor\">\n<p><strong>24</strong> The way the company purchases its goods</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"> A General Electric</label> <label><input name=\"q11\" type=\"radio\" value=\"B\"> B Microsoft</label> <label><input name=\"q11\" type=\"radio\" value=\"C\"> C Whole Foods Market</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q12-anchor\">\n<p><strong>25</strong> Helping the under-developed</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"A\"> A General Electric</label> <label><input name=\"q12\" type=\"radio\" value=\"B\"> B Microsoft</label> <label><input name=\"q12\" type=\"radio\" value=\"C\"> C Whole Foods Market</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q13-anchor\">\n<p><strong>26</strong> Ensuring that people have the latest information</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"> A General Electric</label> <label><input name=\"q13\" type=\"radio\" value=\"B\"> B Microsoft</label> <label><input name=\"q13\" type=\"radio\" value=\"C\"> C Whole Foods Market</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-128", "answers", {"answerKey":{"q1":"B","q2":"E","q3":"F","q4":"C","q5":"D","q6":"B","q7":"D","q8":"A","q9":"D","q10":"E","q11":"email voice","q12":"prefrontal cortex","q13":"group meetings"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-128", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-high-128","meta":{"title":"How Well Do We Concentrate_  多任务处理","category":"P2","frequency":"high","pdfFilename":"40. P2 - How Well Do We Concentrate_  多任务处理【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/40. P2 - How Well Do We Concentrate_  多任务处理【高】/","legacyFilename":"40. P2 - How Well Do We Concentrate_  多任务处理【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/40. P2 - How Well Do We Concentrate_  多任务处理【高】/40. P2 - How Well Do We Concentrate_  多任务处理【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/40. P2 - How Well Do We Concentrate_  多任务处理【高】/40. P2 - How Well Do We Concentrate_  多任务处理【高】.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-11T14:43:22.262Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
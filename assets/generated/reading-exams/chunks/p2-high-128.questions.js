@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-128", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 14–18</h4>\n<p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–F</strong>, in boxes 14–18 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 150px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> a reference to a domestic situation that does not require multitasking</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> a possible explanation of why we always multitask</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> a practical solution to multitasking in the work environment</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> relating multitasking to the size of the prefrontal cortex</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>18</strong> more time spent doing two tasks at the same time than doing one task at a time</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q6","q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-10-anchor\">\n<h4>Questions 19–23</h4>\n<p>Look at the following statements (Questions 19–23) and the list of scientists below.</p>\n<p>Match each statement with the correct scientist, <strong>A–E</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>19</strong> When faced with multiple visual stimuli, one can only concentrate on one of them.</p>\n<div class=\"match-dropzone\" data-question=\"q6\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>20</strong> Doing two things together may be faster but not better.</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>21</strong> People never really do two things together even if you think you do.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> The causes of multitasking lie in the environment.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> Even minor changes in the workplace will improve work efficiency.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"options-pool\" id=\"scientist-options-pool\">\n<strong>List of Scientists</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Thomas Lehman</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Earl Miller</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C David Meyer</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Gloria Mark</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Edward Hallowell</div>\n</div>\n</div>\n</div>","allowOptionReuse":true},{"groupId":"group-3","kind":"sentence_completion","questionIds":["q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"sentence-completion\">\n<p><strong>24</strong> A term used to refer to a situation when you are reading a text and cannot focus on your surroundings is <input name=\"q11\" type=\"text\" id=\"q24_input\">.</p>\n<p><strong>25</strong> The <input name=\"q12\" type=\"text\" id=\"q25_input\"> part of the brain controls multitasking.</p>\n<p><strong>26</strong> The practical solution to multitasking at work is not to allow the use of cellphones in <input name=\"q13\" type=\"text\" id=\"q26_input\">.</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
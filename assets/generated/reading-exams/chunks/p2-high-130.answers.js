@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-130", "answers", {"answerKey":{"q1":"iii","q2":"iv","q3":"ii","q4":"i","q5":"viii","q6":"vi","q7":"v","q8":"D","q9":"A","q10":"C","q11":"banker","q12":"computers","q13":"paper"}});
+})(typeof window !== "undefined" ? window : globalThis);
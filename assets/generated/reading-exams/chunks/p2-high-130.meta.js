@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-130", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-high-130","meta":{"title":"Investment in shares versus investment in other assets 回报数据分析","category":"P2","frequency":"high","pdfFilename":"42. P2 - Investment in shares versus investment in other assets 回报数据分析【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/42. P2 - Investment in shares versus investment in other assets 回报数据分析【高】/","legacyFilename":"42. P2 - Investment in shares versus investment in other assets 回报数据分析【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/42. P2 - Investment in shares versus investment in other assets 回报数据分析【高】/42. P2 - Investment in shares versus investment in other assets 回报数据分析【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/42. P2 - Investment in shares versus investment in other assets 回报数据分析【高】/42. P2 - Investment in shares versus investment in other assets 回报数据分析【高】.pdf","ieltsHtml":"IELTS/P2/Investment in shares versus investment in other assets.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.265Z","notes":"signature:text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
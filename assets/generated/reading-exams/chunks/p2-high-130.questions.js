@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-130", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 14–20</h4>\n<p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. Technological developments improve CRSP data</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. Initial findings of the CRSP project</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. A request and a far-reaching result</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. Difficulties in collecting CRSP data</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. What the future holds</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. Too much data for people to have an overall understanding</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. Other university departments which depend on CRSP</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. CRSP data not always being a useful basis for investment</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-anchor\">\n<h4>Questions 21–23</h4>\n<p>Look at the following statements (21–23) and the list of economists below.</p>\n<p>Match each statement with the correct economist <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"match-question-item\">\n<p><strong>21</strong> A traditional approach may have helped predict a financial downturn.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> Some people invest conservatively and as a result make less money.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> It may be possible to forecast share prices but not over the long term.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"options-pool\" id=\"economist-options-pool\">\n<strong>List of Economists</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A. Fisher and Lorie</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B. Myron Scholes</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C. Eugene Fama</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D. Robert Shiller</div>\n</div>\n</div>\n</div>","allowOptionReuse":false},{"groupId":"group-3","kind":"summary_completion","questionIds":["q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-text\">\n<h5>The beginnings of CRSP</h5>\n<p>In 1958 a <strong>24</strong> <input name=\"q11\" type=\"text\" class=\"summary-input\" id=\"q11-input\"> working for a financial management company telephoned Jim Lorie to ask how well investments in shares performed in comparison to investments in low-risk assets. Lorie offered to find out and as a result the University of Chicago's Center for Research in Security Prices (CRSP) was launched. Compiling the CRSP data was difficult because <strong>25</strong> <input name=\"q12\" type=\"text\" class=\"summary-input\" id=\"q12-input\"> were still being developed and information that had previously been on <strong>26</strong> <input name=\"q13\" type=\"text\" class=\"summary-input\" id=\"q13-input\"> needed to be put onto magnetic tape.</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-131", "answers", {"answerKey":{"q1":"D","q2":"B","q3":"F","q4":"A","q5":"E","q6":"G","q7":"C","q8":"A","q9":"C","q10":"limestone","q11":"third","q12":"fuel","q13":"industry"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-131", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 14–20</h4>\n<p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter <strong>A–G</strong> in boxes 14–20 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> an opinion on why the Romans reduced the amount of concrete they made for use in seawater</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td>\n<td><input type=\"radio\" name=\"q1\" value=\"B\"></td>\n<td><input type=\"radio\" name=\"q1\" value=\"C\"></td>\n<td><input type=\"radio\" name=\"q1\" value=\"D\"></td>\n<td><input type=\"radio\" name=\"q1\" value=\"E\"></td>\n<td><input type=\"radio\" name=\"q1\" value=\"F\"></td>\n<td><input type=\"radio\" name=\"q1\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> a list of the contents of both Portland and Roman cement</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td>\n<td><input type=\"radio\" name=\"q2\" value=\"B\"></td>\n<td><input type=\"radio\" name=\"q2\" value=\"C\"></td>\n<td><input type=\"radio\" name=\"q2\" value=\"D\"></td>\n<td><input type=\"radio\" name=\"q2\" value=\"E\"></td>\n<td><input type=\"radio\" name=\"q2\" value=\"F\"></td>\n<td><input type=\"radio\" name=\"q2\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> an argument for finding substitutes for a limited resource that is used in making cement</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td>\n<td><input type=\"radio\" name=\"q3\" value=\"B\"></td>\n<td><input type=\"radio\" name=\"q3\" value=\"C\"></td>\n<td><input type=\"radio\" name=\"q3\" value=\"D\"></td>\n<td><input type=\"radio\" name=\"q3\" value=\"E\"></td>\n<td><input type=\"radio\" name=\"q3\" value=\"F\"></td>\n<td><input type=\"radio\" name=\"q3\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> information about the structure from which the scientists took their Roman concrete samples</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td>\n<td><input type=\"radio\" name=\"q4\" value=\"B\"></td>\n<td><input type=\"radio\" name=\"q4\" value=\"C\"></td>\n<td><input type=\"radio\" name=\"q4\" value=\"D\"></td>\n<td><input type=\"radio\" name=\"q4\" value=\"E\"></td>\n<td><input type=\"radio\" name=\"q4\" value=\"F\"></td>\n<td><input type=\"radio\" name=\"q4\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>18</strong> a comparison of the environmental impacts of making modern and Roman concrete</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td>\n<td><input type=\"radio\" name=\"q5\" value=\"B\"></td>\n<td><input type=\"radio\" name=\"q5\" value=\"C\"></td>\n<td><input type=\"radio\" name=\"q5\" value=\"D\"></td>\n<td><input type=\"radio\" name=\"q5\" value=\"E\"></td>\n<td><input type=\"radio\" name=\"q5\" value=\"F\"></td>\n<td><input type=\"radio\" name=\"q5\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>19</strong> a comparison of the durability of Roman concrete with concrete produced today</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td>\n<td><input type=\"radio\" name=\"q6\" value=\"B\"></td>\n<td><input type=\"radio\" name=\"q6\" value=\"C\"></td>\n<td><input type=\"radio\" name=\"q6\" value=\"D\"></td>\n<td><input type=\"radio\" name=\"q6\" value=\"E\"></td>\n<td><input type=\"radio\" name=\"q6\" value=\"F\"></td>\n<td><input type=\"radio\" name=\"q6\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>20</strong> details of how the Romans used seawater to make concrete</td>\n<td><input type=\"radio\" name=\"q7\" value=\"A\"></td>\n<td><input type=\"radio\" name=\"q7\" value=\"B\"></td>\n<td><input type=\"radio\" name=\"q7\" value=\"C\"></td>\n<td><input type=\"radio\" name=\"q7\" value=\"D\"></td>\n<td><input type=\"radio\" name=\"q7\" value=\"E\"></td>\n<td><input type=\"radio\" name=\"q7\" value=\"F\"></td>\n<td><input type=\"radio\" name=\"q7\" value=\"G\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"multi_choice","questionIds":["q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q8-9-anchor\">\n<h4>Questions 21 and 22</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>According to the passage, which <strong>TWO</strong> of the following statements about fly ash are true?</p>\n<div class=\"options-list\">\n<label><input type=\"checkbox\" name=\"q8-9\" value=\"A\"> A Fly ash results in less damage to the environment than Portland cement.</label> <label><input type=\"checkbox\" name=\"q8-9\" value=\"B\"> B Fly ash was used by the Romans as an alternative to volcanic ash.</label> <label><input type=\"checkbox\" name=\"q8-9\" value=\"C\"> C Fly ash is already used in the production of some concrete.</label> <label><input type=\"checkbox\" name=\"q8-9\" value=\"D\"> D All countries have access to fly ash resources.</label> <label><input type=\"checkbox\" name=\"q8-9\" value=\"E\"> E Fly ash will soon replace volcanic ash.</label>\n</div>\n</div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<h4>Questions 23 – 26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>The environmental effects of concrete production</h4>\n<p>\nRoman concrete is better for the environment than modern concrete, which is made by using Portland cement. This is because a temperature of 1,450 degrees Celsius is needed to combine clays and <strong>23</strong> <input type=\"text\" id=\"q23_input\" name=\"q10\"> to make Portland cement. This level of heat was reduced by a <strong>24</strong> <input type=\"text\" id=\"q24_input\" name=\"q11\"> when making Roman concrete. Needing less heat meant less <strong>25</strong> <input type=\"text\" id=\"q25_input\" name=\"q12\"> had to be burned and less carbon dioxide was produced. According to Monteiro, when considering the amount of carbon dioxide emitted by <strong>26</strong> <input type=\"text\" id=\"q26_input\" name=\"q13\">, seven percent of it comes from the manufacture of Portland cement.\n</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
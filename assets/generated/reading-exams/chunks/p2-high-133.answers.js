@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-133", "answers", {"answerKey":{"q1":"E","q2":"C","q3":"F","q4":"B","q5":"G","q6":"D","q7":"C","q8":"E","q9":"B","q10":"D","q11":"principle","q12":"reward","q13":"record"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-133", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-high-133","meta":{"title":"Playing soccer 街头足球","category":"P2","frequency":"high","pdfFilename":"45. P2 - Playing soccer 街头足球【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/45. P2 - Playing soccer 街头足球【高】/","legacyFilename":"45. P2 - Playing soccer 街头足球【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/45. P2 - Playing soccer 街头足球【高】/45. P2 - Playing soccer 街头足球【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/45. P2 - Playing soccer 街头足球【高】/45. P2 - Playing soccer 街头足球【高】.pdf","ieltsHtml":"IELTS/P2/Playing soccer.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.741Z","notes":"signature:radio,checkbox,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
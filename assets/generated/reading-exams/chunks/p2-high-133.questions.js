@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-133", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has seven sections, <strong>A–G</strong>.</p>\n<p>Which section contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–G</strong>, to boxes 14–19 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 200px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> a contrast between the ways young players gain experience of playing different positions</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> examples outside sport of greater emphasis on individual safety</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> a description of methods of selection for leadership on soccer teams</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> details of urban changes that discourage street soccer</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>18</strong> a mention of the lesson that failure teaches street soccer players</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>19</strong> an explanation of why youth soccer emphasises the need for coaches</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"multi_choice","questionIds":["q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q7-8-anchor\">\n<h4>Questions 20 and 21</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>The list below gives some possible reasons for the popularity of street soccer. Which <strong>TWO</strong> of these reasons are mentioned by the writer of the text?</p>\n<div class=\"checkbox-group\">\n<label><input type=\"checkbox\" name=\"q7-8\" value=\"A\"> A Many famous soccer players got their start in street soccer.</label> <label><input type=\"checkbox\" name=\"q7-8\" value=\"B\"> B Young people can begin playing street soccer at a very early age.</label> <label><input type=\"checkbox\" name=\"q7-8\" value=\"C\"> C You do not need elaborate facilities to play street soccer.</label> <label><input type=\"checkbox\" name=\"q7-8\" value=\"D\"> D Inexperienced street soccer players are not criticised for mistakes.</label> <label><input type=\"checkbox\" name=\"q7-8\" value=\"E\"> E Street soccer teams can have varying numbers of players.</label>\n</div>\n</div>"},{"groupId":"group-3","kind":"multi_choice","questionIds":["q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q9-10-anchor\">\n<h4>Questions 22 and 23</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>The list below gives some possible results of the 1960s parenting style. Which <strong>TWO</strong> of these results are mentioned by Franklin Foer in the excerpt from How Soccer Explains the World?</p>\n<div class=\"checkbox-group\">\n<label><input type=\"checkbox\" name=\"q9-10\" value=\"A\"> A Participation in youth soccer became much more expensive.</label> <label><input type=\"checkbox\" name=\"q9-10\" value=\"B\"> B Some youth soccer leagues adopted more restrictive rules of play.</label> <label><input type=\"checkbox\" name=\"q9-10\" value=\"C\"> C Fewer young people joined youth soccer teams.</label> <label><input type=\"checkbox\" name=\"q9-10\" value=\"D\"> D Youth soccer players were sometimes rewarded for simply playing in games.</label> <label><input type=\"checkbox\" name=\"q9-10\" value=\"E\"> E Soccer equipment manufacturers directed advertising towards parents.</label>\n</div>\n</div>"},{"groupId":"group-4","kind":"summary_completion","questionIds":["q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h5>Winners and losers</h5>\n<p>\nFor youth soccer players, a key <strong>24</strong> <input type=\"text\" id=\"q24_input\" name=\"q11\"> is that they should always come away from the game with a positive attitude. In this respect, regardless of the effort the players make, they get some kind of <strong>25</strong> <input type=\"text\" id=\"q25_input\" name=\"q12\"> at the end of a game. In street soccer, however, players gain resilience because they have to learn to cope with failure. But the outcome of a match isn't remembered for long. In fact, no-one ever keeps a <strong>26</strong> <input type=\"text\" id=\"q26_input\" name=\"q13\"> of the results of games.\n</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
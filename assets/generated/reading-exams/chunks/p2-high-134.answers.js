@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-134", "answers", {"answerKey":{"q1":"chain","q2":"gear","q3":"motor","q4":"ice","q5":"waxed","q6":"wheels","q7":"coal","q8":"steam engines","q9":"TRUE","q10":"FALSE","q11":"NOT GIVEN","q12":"TRUE","q13":"TRUE"}});
+})(typeof window !== "undefined" ? window : globalThis);
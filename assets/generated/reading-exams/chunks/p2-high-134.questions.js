@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-134", "questions", {"questionGroups":[{"groupId":"group-1","kind":"diagram_completion","questionIds":["q1","q2","q3"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-anchor\">\n<h4>Questions 14–16</h4>\n<p>Label the diagram below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"diagram-container\">\n<img src=\"media/p2-high-134-roller-coaster-diagram.png\" alt=\"Diagram of a roller coaster lifting mechanism\" style=\"max-width: 100%; width: auto; height: auto; max-height: 420px; object-fit: contain; display: block; margin: 0 auto;\">\n</div>\n<div class=\"diagram-inputs\">\n<div class=\"diagram-input-row\">\n<label for=\"q14_input\"><strong>14</strong></label> <input type=\"text\" id=\"q14_input\" name=\"q1\">\n</div>\n<div class=\"diagram-input-row\">\n<label for=\"q15_input\"><strong>15</strong></label> <input type=\"text\" id=\"q15_input\" name=\"q2\">\n</div>\n<div class=\"diagram-input-row\">\n<label for=\"q16_input\"><strong>16</strong></label> <input type=\"text\" id=\"q16_input\" name=\"q3\">\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q4","q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q4-5-6-7-8-anchor\">\n<h4>Questions 17–21</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-completion-box\">\n<h4>History of roller coasters</h4>\n<ul>\n<li>Modern roller coasters are descended from 16th-century Russian slides with a surface of <strong>17</strong> <input type=\"text\" id=\"q17_input\" name=\"q4\">.</li>\n<li>In France, because of the higher temperatures, the wooden surface on the slides was <strong>18</strong> <input type=\"text\" id=\"q18_input\" name=\"q5\">, and <strong>19</strong> <input type=\"text\" id=\"q19_input\" name=\"q6\"> were attached to the cars to ease the descent.</li>\n<li>The first US roller coaster was used for transporting <strong>20</strong> <input type=\"text\" id=\"q20_input\" name=\"q7\"> down a mountainside in carts.</li>\n<li>Initially, these were pulled by mules, but in time power was produced by <strong>21</strong> <input type=\"text\" id=\"q21_input\" name=\"q8\">.</li>\n</ul>\n</div>\n</div>"},{"groupId":"group-3","kind":"true_false_not_given","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 22–26</h4>\n<p>Do the following statements agree with the information given in Reading Passage 2?</p>\n<p>In boxes 22–26 on your answer sheet, write</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>22</strong> The earliest modifications to the basic slide were made in France.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q9\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>23</strong> Roller coasters continued to increase in popularity throughout the 1920s and 1930s.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q10\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>24</strong> New roller-coaster technology was introduced in the 1970s in response to public demand.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q11\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>25</strong> Roller coasters were less popular for most of the 1980s than in the 1970s and 1990s.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q12\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>26</strong> The design of roller-coaster rides became more varied in the 1990s.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q13\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
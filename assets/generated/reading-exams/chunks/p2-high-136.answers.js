@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-136", "answers", {"answerKey":{"q1":"iv","q2":"vii","q3":"vi","q4":"i","q5":"v","q6":"ii","q7":"F","q8":"C","q9":"D","q10":"G","q11":"electronic","q12":"business","q13":"government"}});
+})(typeof window !== "undefined" ? window : globalThis);
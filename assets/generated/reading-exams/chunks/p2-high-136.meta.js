@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-136", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-high-136","meta":{"title":"Solving the problem of waste disposal 垃圾处理","category":"P2","frequency":"high","pdfFilename":"48. P2 - Solving the problem of waste disposal 垃圾处理【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/48. P2 - Solving the problem of waste disposal 垃圾处理【高】/","legacyFilename":"48. P2 - Solving the problem of waste disposal 垃圾处理【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/48. P2 - Solving the problem of waste disposal 垃圾处理【高】/48. P2 - Solving the problem of waste disposal 垃圾处理【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/48. P2 - Solving the problem of waste disposal 垃圾处理【高】/48. P2 - Solving the problem of waste disposal 垃圾处理【高】.pdf","ieltsHtml":"IELTS/P2/Solving the problem of waste disposal.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.274Z","notes":"signature:text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
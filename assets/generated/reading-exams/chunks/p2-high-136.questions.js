@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-136", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag the correct heading number into each paragraph answer box.</em></p>\n<div class=\"match-question-item\">\n<p><strong>14</strong> Paragraph A</p>\n<div class=\"match-dropzone\" data-question=\"q1\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>15</strong> Paragraph B</p>\n<div class=\"match-dropzone\" data-question=\"q2\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>16</strong> Paragraph C</p>\n<div class=\"match-dropzone\" data-question=\"q3\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>17</strong> Paragraph D</p>\n<div class=\"match-dropzone\" data-question=\"q4\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>18</strong> Paragraph E</p>\n<div class=\"match-dropzone\" data-question=\"q5\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>19</strong> Paragraph F</p>\n<div class=\"match-dropzone\" data-question=\"q6\"></div>\n</div>\n<div class=\"options-pool\" id=\"headings-options-pool\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"i\">i New terminology reflecting changing attitudes to waste disposal</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"ii\">ii Fundamental changes in behaviour in the past and future</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"iii\">iii Ways of rewarding the public for recycling</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"iv\">iv A surprising approach to waste disposal by several countries</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"v\">v Difficult choices for individuals and businesses</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"vi\">vi Arguments against incineration from a country that uses it</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"vii\">vii A number of justifications for the use of incineration</div>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-anchor\">\n<h4>Questions 20–23</h4>\n<p>Look at the following people (Questions 20–23) and the list of opinions below.</p>\n<p>Match each person with the correct opinion, <strong>A–G</strong>.</p>\n<p><em>Write the correct letter, <strong>A–G</strong>, in boxes 20–23 on your answer sheet.</em></p>\n<div class=\"match-question-item\">\n<p><strong>20</strong> Ted Michaels</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>21</strong> Joergen Fenhann</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> Joan Marc Simon</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> Tim Burns</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"options-pool\" id=\"opinions-pool\">\n<strong>List of Opinions</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Incineration does not encourage responsible attitudes to waste disposal.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Recycling can sometimes create serious problems for the future.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Greater consumerism leads to higher levels of waste.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Proper systems are needed for the recycling of environmentally-friendly products.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Landfill is better for the environment than incineration.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F Incineration of waste is now relatively harmless to the environment.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G Efforts to reduce waste may affect profits for some types of companies.</div>\n</div>\n</div>\n</div>","allowOptionReuse":false},{"groupId":"group-3","kind":"summary_completion","questionIds":["q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h5>What recent history tells us about recycling</h5>\n<p>\nRichard Fisher, a researcher from Cranfield University, points out that the pace of consumerism has increased more quickly than was predicted in the 1980s. There has, for example, been unexpected growth in waste from <strong>24</strong> <input name=\"q11\" type=\"text\" id=\"q24_input\"> products. He suggests that the need to protect the environment should be linked to basic values, and adds that it might be better if consumers had more influence over <strong>25</strong> <input name=\"q12\" type=\"text\" id=\"q25_input\"> and more direction was provided by <strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\">.\n</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
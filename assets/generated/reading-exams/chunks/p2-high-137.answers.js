@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-137", "answers", {"answerKey":{"q1":"vi","q2":"iv","q3":"vii","q4":"iii","q5":"i","q6":"ii","q7":"D","q8":"A","q9":"C","q10":"A","q11":"cockroaches","q12":"concrete","q13":"chemicals"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-137", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-high-137","meta":{"title":"Surviving city life 动物适应城市","category":"P2","frequency":"high","pdfFilename":"49. P2 - Surviving city life 动物适应城市【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/49. P2 - Surviving city life 动物适应城市【高】/","legacyFilename":"49. P2 - Surviving city life 动物适应城市【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/49. P2 - Surviving city life 动物适应城市【高】/49. P2 - Surviving city life 动物适应城市【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/49. P2 - Surviving city life 动物适应城市【高】/49. P2 - Surviving city life 动物适应城市【高】.pdf","ieltsHtml":"IELTS/P2/Surviving city life.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.276Z","notes":"signature:text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
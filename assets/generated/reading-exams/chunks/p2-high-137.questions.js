@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-137", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i The behaviour of a small animal expanding its territory</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii The urban environment encouraging the spread of imported flora and fauna</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii Insects that thrive in urban areas</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv A creature which likes rubbish</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v Creatures which change their shape and colour</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi Why natural scientists are interested in studying urban areas</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii Changes in the urban built environments encourage particular species</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-anchor\">\n<h4>Questions 20–23</h4>\n<p>Look at the following statements (Questions 20–23) and the list of researchers below.</p>\n<p>Match each statement with the correct researcher, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>20</strong> It is not clear why one small animal is moving from its natural environment.</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>21</strong> Hot weather might positively affect the health of a species.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> Sydney's residential gardens suit some species better than others.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> Research into the natural world's responses to urban settings is vital.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"options-pool\" id=\"researcher-options-pool\">\n<strong>List of Researchers</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Dieter Hochuli</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B John Martin</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Richard Major</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Catherine Price</div>\n</div>\n</div>\n</div>","allowOptionReuse":true},{"groupId":"group-3","kind":"summary_completion","questionIds":["q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>Seeking comfort in city living</h4>\n<p>\nIt's not only native plants and animals that are adapting to city life; non-native plants and animals are also adapting. Examples of successful ‘city dwellers' include small, non-native rats and non-native insects such as <strong>24</strong> <input name=\"q11\" type=\"text\" id=\"q24_input\">. However, what causes most problems in the city is weeds. Michelle Leishman, a scientist from Macquarie University, has proven that Sydney's large areas of <strong>25</strong> <input name=\"q12\" type=\"text\" id=\"q25_input\"> and its drainage network favour the growth of weeds. Water gathers <strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\"> as it passes from gardens and streets into the city drainage network. This, in turn, creates very good soil for several varieties of rapidly growing non-native plants.\n</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-139", "answers", {"answerKey":{"q1":"insects","q2":"miasma","q3":"hereditary","q4":"life expectancy","q5":"NOT GIVEN","q6":"TRUE","q7":"FALSE","q8":"E","q9":"C","q10":"F","q11":"H","q12":"B","q13":"D"}});
+})(typeof window !== "undefined" ? window : globalThis);
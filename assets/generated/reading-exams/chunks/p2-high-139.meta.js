@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-139", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-high-139","meta":{"title":"The conquest of malaria in Italy 意大利疟疾防治","category":"P2","frequency":"high","pdfFilename":"50. P2 - The conquest of malaria in Italy 意大利疟疾防治【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/50. P2 - The conquest of malaria in Italy 意大利疟疾防治【高】/","legacyFilename":"50. P2 - The conquest of malaria in Italy 意大利疟疾防治【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/50. P2 - The conquest of malaria in Italy 意大利疟疾防治【高】/50. P2 - The conquest of malaria in Italy 意大利疟疾防治【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/50. P2 - The conquest of malaria in Italy 意大利疟疾防治【高】/50. P2 - The conquest of malaria in Italy 意大利疟疾防治【高】.pdf","ieltsHtml":"IELTS/P2/The conquest of malaria in Italy.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.749Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-139", "questions", {"questionGroups":[{"groupId":"group-1","kind":"summary_completion","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 14–17</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>Malaria in 19th-century Italy</h4>\n<p>\nUp until the late nineteenth century, experts failed to make the connection between malaria and <strong>14</strong> <input type=\"text\" id=\"q14_input\" name=\"q1\">. The most popular belief at the time was the <strong>15</strong> <input type=\"text\" id=\"q15_input\" name=\"q2\"> theory, which upheld the idea that diseases were carried by unclean air. Another common idea was that malaria was a <strong>16</strong> <input type=\"text\" id=\"q16_input\" name=\"q3\"> disease, and as a result people from certain parts of the country were often held responsible for the spread of epidemics. Malaria was particularly widespread in rural regions, where <strong>17</strong> <input type=\"text\" id=\"q17_input\" name=\"q4\"> could be extremely short.\n</p>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"true_false_not_given","questionIds":["q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-anchor\">\n<h4>Questions 18–20</h4>\n<p>Do the following statements agree with the information given in Reading Passage 2?</p>\n<p>In boxes 18–20 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>18</strong> The volunteers in Giovanni Battista Grassi's research came from all parts of Italy.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>19</strong> Experiments in Italy proved that it was possible to remain healthy despite being in malarial zones.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>20</strong> In the early twentieth century, quinine was successfully administered to all inhabitants of vulnerable regions.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"table_completion","questionIds":["q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Questions 21–26</h4>\n<p>Reading Passage 2 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–H</strong>, in boxes 21–26 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>21</strong> a figure showing the dramatic results of an anti-malarial drug programme</td>\n<td><input type=\"radio\" name=\"q8\" value=\"A\"></td><td><input type=\"radio\" name=\"q8\" value=\"B\"></td><td><input type=\"radio\" name=\"q8\" value=\"C\"></td><td><input type=\"radio\" name=\"q8\" value=\"D\"></td><td><input type=\"radio\" name=\"q8\" value=\"E\"></td><td><input type=\"radio\" name=\"q8\" value=\"F\"></td><td><input type=\"radio\" name=\"q8\" value=\"G\"></td><td><input type=\"radio\" name=\"q8\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>22</strong> an important discovery about how malaria is spread</td>\n<td><input type=\"radio\" name=\"q9\" value=\"A\"></td><td><input type=\"radio\" name=\"q9\" value=\"B\"></td><td><input type=\"radio\" name=\"q9\" value=\"C\"></td><td><input type=\"radio\" name=\"q9\" value=\"D\"></td><td><input type=\"radio\" name=\"q9\" value=\"E\"></td><td><input type=\"radio\" name=\"q9\" value=\"F\"></td><td><input type=\"radio\" name=\"q9\" value=\"G\"></td><td><input type=\"radio\" name=\"q9\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>23</strong> mention of an expert's decision not to halt the spread of the disease</td>\n<td><input type=\"radio\" name=\"q10\" value=\"A\"></td><td><input type=\"radio\" name=\"q10\" value=\"B\"></td><td><input type=\"radio\" name=\"q10\" value=\"C\"></td><td><input type=\"radio\" name=\"q10\" value=\"D\"></td><td><input type=\"radio\" name=\"q10\" value=\"E\"></td><td><input type=\"radio\" name=\"q10\" value=\"F\"></td><td><input type=\"radio\" name=\"q10\" value=\"G\"></td><td><input type=\"radio\" name=\"q10\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>24</strong> the significance of the malaria story for today's readers</td>\n<td><input type=\"radio\" name=\"q11\" value=\"A\"></td><td><input type=\"radio\" name=\"q11\" value=\"B\"></td><td><input type=\"radio\" name=\"q11\" value=\"C\"></td><td><input type=\"radio\" name=\"q11\" value=\"D\"></td><td><input type=\"radio\" name=\"q11\" value=\"E\"></td><td><input type=\"radio\" name=\"q11\" value=\"F\"></td><td><input type=\"radio\" name=\"q11\" value=\"G\"></td><td><input type=\"radio\" name=\"q11\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>25</strong> examples of false assumptions which held back scientific understanding of malaria</td>\n<td><input type=\"radio\" name=\"q12\" value=\"A\"></td><td><input type=\"radio\" name=\"q12\" value=\"B\"></td><td><input type=\"radio\" name=\"q12\" value=\"C\"></td><td><input type=\"radio\" name=\"q12\" value=\"D\"></td><td><input type=\"radio\" name=\"q12\" value=\"E\"></td><td><input type=\"radio\" name=\"q12\" value=\"F\"></td><td><input type=\"radio\" name=\"q12\" value=\"G\"></td><td><input type=\"radio\" name=\"q12\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>26</strong> a reference to legislation to support the fight against malaria</td>\n<td><input type=\"radio\" name=\"q13\" value=\"A\"></td><td><input type=\"radio\" name=\"q13\" value=\"B\"></td><td><input type=\"radio\" name=\"q13\" value=\"C\"></td><td><input type=\"radio\" name=\"q13\" value=\"D\"></td><td><input type=\"radio\" name=\"q13\" value=\"E\"></td><td><input type=\"radio\" name=\"q13\" value=\"F\"></td><td><input type=\"radio\" name=\"q13\" value=\"G\"></td><td><input type=\"radio\" name=\"q13\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-14", "answers", {"answerKey":{"q1":"vi","q2":"iii","q3":"i","q4":"v","q5":"ix","q6":"viii","q7":"A","q8":"D","q9":"infrastructure","q10":"spaceships","q11":"communication","q12":"laboratories","q13":"colonisation"}});
+})(typeof window !== "undefined" ? window : globalThis);
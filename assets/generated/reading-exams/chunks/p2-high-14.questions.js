@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-14", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. Robots on Earth – a re-evaluation</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. The barriers to cooperation in space exploration</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. Some limitations of robots in space</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. Reduced expectations for space exploration</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. A general reconsideration of human/robot responsibilities in space</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. Problems in using humans for space exploration</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. The danger to humans of intelligent machines</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. Space settlement and the development of greater self-awareness</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix. Possible examples of cooperation in space</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"multi_choice","questionIds":["q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q7-8-anchor\">\n<h4>Questions 20 and 21</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>According to the writer, which <strong>TWO</strong> predictions about artificial intelligence have not yet been fulfilled?</p>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q7_8\" value=\"A\"> A. Robots will work independently of humans.</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q7_8\" value=\"B\"> B. Robots will begin to oppose human interests.</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q7_8\" value=\"C\"> C. Robots will be used to help humans perform tasks more efficiently.</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q7_8\" value=\"D\"> D. Robots will think in the same way as humans.</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q7_8\" value=\"E\"> E. Robots will become too costly to use on space missions.</label>\n</div>\n</div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 22–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-text\">\n<h5>Humans in space – the Mars Outposts approach and its implications</h5>\n<p>\nOne way of exploring space would be through collaboration between humans and robots. For example, when exploring the planet Mars, robots could be used to set up <strong>22</strong> <input type=\"text\" id=\"q22_input\" name=\"q9\"> and do initial research before humans arrive. In other cases, humans could stay in orbiting <strong>23</strong> <input type=\"text\" id=\"q23_input\" name=\"q10\"> and give orders to robots working on the surface of the planet. This would increase the speed of <strong>24</strong> <input type=\"text\" id=\"q24_input\" name=\"q11\"> with the robots.\n</p>\n<p>\nIn such ways, robots might be used to work in space in commercial enterprises or <strong>25</strong> <input type=\"text\" id=\"q25_input\" name=\"q12\">. However, the final aim of humankind may be the <strong>26</strong> <input type=\"text\" id=\"q26_input\" name=\"q13\"> of space, and this could in turn change people's attitudes towards Earth.\n</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
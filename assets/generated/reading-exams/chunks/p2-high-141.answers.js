@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-141", "answers", {"answerKey":{"q1":"H","q2":"C","q3":"B","q4":"F","q5":"G","q6":"D","q7":"B","q8":"A","q9":"C","q10":"A","q11":"A","q12":"B","q13":"D"}});
+})(typeof window !== "undefined" ? window : globalThis);
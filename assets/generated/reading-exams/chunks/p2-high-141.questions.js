@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-141", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which section contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–H</strong>, in boxes 14–19 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 250px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> two things at which leaf-cutter ants have succeeded but humans have failed.</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> a comparison between the nests of leaf-cutter ants and lower attine ants.</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> an assessment of the impact leaf-cutter ants have on their environment.</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> the effect Escovopsis has on ant communities.</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>18</strong> the advantage for lower attine ants of growing a range of fungi.</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>19</strong> the discovery of the age of the attine-ant fungi.</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td><td><input type=\"radio\" name=\"q6\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q7","q8","q9","q10","q11"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-11-anchor\">\n<h4>Questions 20–24</h4>\n<p>Classify the following descriptions as relating to</p>\n<ul style=\"list-style-type: none; padding-left: 0;\">\n<li><strong>A</strong> Leaf-cutting ants</li>\n<li><strong>B</strong> Lower attines</li>\n<li><strong>C</strong> Both leaf-cutting ants and lower attine ants</li>\n</ul>\n<p><em>Write the correct letter, A, B or C, in boxes 20-24 on your answer sheet.</em></p>\n<div class=\"question-item\">\n<p><strong>20</strong> the use of dead vegetation to cultivate their fungus</p>\n<div class=\"radio-options\">\n<label><input type=\"radio\" name=\"q7\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q7\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q7\" value=\"C\"> C</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>21</strong> very small ants that keep the fungus free of foreign organisms</p>\n<div class=\"radio-options\">\n<label><input type=\"radio\" name=\"q8\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q8\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q8\" value=\"C\"> C</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>22</strong> the ability to safely eat harmful plants</p>\n<div class=\"radio-options\">\n<label><input type=\"radio\" name=\"q9\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q9\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q9\" value=\"C\"> C</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>23</strong> the cultivation of a single fungus</p>\n<div class=\"radio-options\">\n<label><input type=\"radio\" name=\"q10\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q10\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q10\" value=\"C\"> C</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>24</strong> a nest with a very large number of rooms for growing fungus</p>\n<div class=\"radio-options\">\n<label><input type=\"radio\" name=\"q11\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q11\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q11\" value=\"C\"> C</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"single_choice","questionIds":["q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q12-13-anchor\">\n<h4>Questions 25–26</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>25</strong> What does the writer say about Cameron Currie's research?</p>\n<div class=\"radio-options radio-options-vertical\">\n<label><input type=\"radio\" name=\"q12\" value=\"A\"> A No previous work had been done in this area.</label> <label><input type=\"radio\" name=\"q12\" value=\"B\"> B Earlier studies did not support his theory.</label> <label><input type=\"radio\" name=\"q12\" value=\"C\"> C Textbooks on this subject lacked specific detail.</label> <label><input type=\"radio\" name=\"q12\" value=\"D\"> D Currie's initial theory had proven to be incorrect.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>26</strong> Using a microscope, Currie was the first to discover that the body of attine ants</p>\n<div class=\"radio-options radio-options-vertical\">\n<label><input type=\"radio\" name=\"q13\" value=\"A\"> A has a white covering.</label> <label><input type=\"radio\" name=\"q13\" value=\"B\"> B is covered in wax.</label> <label><input type=\"radio\" name=\"q13\" value=\"C\"> C is poisonous to humans.</label> <label><input type=\"radio\" name=\"q13\" value=\"D\"> D has a substance useful to humans.</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-145", "answers", {"answerKey":{"q1":"C","q2":"G","q3":"C","q4":"B","q5":"reproduction","q6":"fruit","q7":"toxins","q8":"drought","q9":"B","q10":"A","q11":"C","q12":"B","q13":"A"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-145", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-high-145","meta":{"title":"The return of monkey life 猴群回归","category":"P2","frequency":"high","pdfFilename":"56. P2 - The return of monkey life 猴群回归【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/56. P2 - The return of monkey life 猴群回归【高】/","legacyFilename":"56. P2 - The return of monkey life 猴群回归【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/56. P2 - The return of monkey life 猴群回归【高】/56. P2 - The return of monkey life 猴群回归【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/56. P2 - The return of monkey life 猴群回归【高】/56. P2 - The return of monkey life 猴群回归【高】.pdf","ieltsHtml":"IELTS/P2/The return of monkey life.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.759Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-145", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 14–17</h4>\n<p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–G</strong>, in boxes 14–17 on your answer sheet.</em></p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> a reason why newer forests provide howlers with better feeding opportunities than older forests</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> a reference to a change in farmers' attitudes towards wildlife</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> a description of the means by which howlers select the best available diet for themselves</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> figures relating to the reduction of natural wildlife habitat over a period of time</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-anchor\">\n<h4>Questions 18–21</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>Why do howlers have an advantage over other Central American monkeys?</h4>\n<p>\nHowler monkeys have a more rapid rate of <strong>18</strong> <input type=\"text\" id=\"q18_input\" name=\"q5\"> than either capuchin or spider monkeys. Unlike the other local monkey species, howlers can survive without eating <strong>19</strong> <input type=\"text\" id=\"q19_input\" name=\"q6\"> and so can live inside a relatively small habitat area. Their diet is more flexible, and they are able to tolerate leaves with high levels of <strong>20</strong> <input type=\"text\" id=\"q20_input\" name=\"q7\">. Howlers can also survive periods of <strong>21</strong> <input type=\"text\" id=\"q21_input\" name=\"q8\"> better than the other monkey species can.\n</p>\n</div>\n</div>"},{"groupId":"group-3","kind":"single_choice","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 22–26</h4>\n<p>Look at the following features (Questions 22–26) and the list of locations below.</p>\n<p>Match each feature with the correct location, <strong>A, B</strong> or <strong>C</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<ul class=\"location-list\">\n<li><strong>List of Locations</strong></li>\n<li><strong>A</strong> &nbsp; Hacienda La Pacifica</li>\n<li><strong>B</strong> &nbsp; Santa Rosa National Park</li>\n<li><strong>C</strong> &nbsp; Cholula Cacao Farm</li>\n</ul>\n<div class=\"location-question-item\">\n<p><strong>22</strong> It has seen the return of native tree species.</p>\n<div class=\"location-options\">\n<label><input type=\"radio\" name=\"q9\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q9\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q9\" value=\"C\"> C</label>\n</div>\n</div>\n<div class=\"location-question-item\">\n<p><strong>23</strong> It supports only one species of native monkey.</p>\n<div class=\"location-options\">\n<label><input type=\"radio\" name=\"q10\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q10\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q10\" value=\"C\"> C</label>\n</div>\n</div>\n<div class=\"location-question-item\">\n<p><strong>24</strong> Its monkey population helps the agriculture of the area.</p>\n<div class=\"location-options\">\n<label><input type=\"radio\" name=\"q11\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q11\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q11\" value=\"C\"> C</label>\n</div>\n</div>\n<div class=\"location-question-item\">\n<p><strong>25</strong> It is home to populations of all three local monkey species.</p>\n<div class=\"location-options\">\n<label><input type=\"radio\" name=\"q12\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q12\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q12\" value=\"C\"> C</label>\n</div>\n</div>\n<div class=\"location-question-item\">\n<p><strong>26</strong> Its landscape was altered by the construction of a transport link.</p>\n<div class=\"location-options\">\n<label><input type=\"radio\" name=\"q13\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q13\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q13\" value=\"C\"> C</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
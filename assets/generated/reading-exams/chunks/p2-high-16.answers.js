@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-16", "answers", {"answerKey":{"q1":"iv","q2":"vii","q3":"i","q4":"viii","q5":"vi","q6":"ii","q7":"C","q8":"D","q9":"truth","q10":"journalists","q11":"nurses","q12":"dedication","q13":"documents"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-16", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i Different areas of professional expertise</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Reasons why it is unfair to criticise lawyers</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii The disadvantages of the legal system</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv The law applies throughout our lives</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v The law has affected historical events</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi A negative regard for lawyers</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii The public's increasing ability to influence the law</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii Growth in laws</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"multi_choice","questionIds":["q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q7-8-anchor\">\n<h4>Questions 20–21</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>Which <strong>TWO</strong> of the following statements does the writer make about legal skills in today's world?</p>\n<div class=\"multi-choice-options\">\n<label><input type=\"checkbox\" name=\"q7-8\" value=\"A\"> A There should be a person with legal training in every hospital.</label> <label><input type=\"checkbox\" name=\"q7-8\" value=\"B\"> B Lawyers with experience in commercial law are the most in demand.</label> <label><input type=\"checkbox\" name=\"q7-8\" value=\"C\"> C Knowledge of the law is as important as having computer skills.</label> <label><input type=\"checkbox\" name=\"q7-8\" value=\"D\"> D Society could not function effectively without legal experts.</label> <label><input type=\"checkbox\" name=\"q7-8\" value=\"E\"> E Schools should teach students about the law.</label>\n</div>\n</div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 22–26</h4>\n<p>Complete the summary below. Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-box\">\n<h5>Lawyers as professionals</h5>\n<p>People sometimes say that <strong>22</strong> <input type=\"text\" id=\"q22_input\" name=\"q9\"> is of little interest to lawyers, who are more concerned with making money. This may well be the case with some individuals, in the same way that some <strong>23</strong> <input type=\"text\" id=\"q23_input\" name=\"q10\"> or scientific experts may also be driven purely by financial greed. However, criticising lawyers because their work is concerned with people's problems would be similar to attacking IT staff or <strong>24</strong> <input type=\"text\" id=\"q24_input\" name=\"q11\"> for the same reason. In fact, many lawyers focus on questions relating, for example, to housing or civil liberties, which requires them to have <strong>25</strong> <input type=\"text\" id=\"q25_input\" name=\"q12\"> to their work. What's more, a lot of lawyers' time is spent writing <strong>26</strong> <input type=\"text\" id=\"q26_input\" name=\"q13\"> rather than dealing with people's misfortunes.</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
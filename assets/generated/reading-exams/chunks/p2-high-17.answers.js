@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-17", "answers", {"answerKey":{"q1":"D","q2":"A","q3":"E","q4":"D","q5":"pain","q6":"book","q7":"law","q8":"course","q9":"A","q10":"B","q11":"D","q12":"A","q13":"C"}});
+})(typeof window !== "undefined" ? window : globalThis);
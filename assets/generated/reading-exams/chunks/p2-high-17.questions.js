@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-17", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 14–17</h4>\n<p>Reading Passage 2 has five paragraphs, <strong>A–E</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 200px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> a reference to the interest shown by large corporations in herbal remedies</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> examples of the uses of one particular herbal medicine</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> a warning that small companies cannot afford stricter controls of the herbal medicine industry</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> a statement by one expert about the effectiveness and limitations of herbal medicines</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-anchor\">\n<h4>Questions 18–21</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>The history of herbal medicines in New Zealand</h4>\n<p>Originally, the Maori people consumed plants to help deal with <strong>18</strong> <input name=\"q5\" type=\"text\" id=\"q18_input\">, and also as food. When Europeans settled in the country, a <strong>19</strong> <input name=\"q6\" type=\"text\" id=\"q19_input\"> by James Neil showed that some of them also recognised the medicinal value of native plants. However, criticism of herbal medicine appeared in one newspaper in 1907. The following year, the use of herbal medicines was made more difficult because of a new <strong>20</strong> <input name=\"q7\" type=\"text\" id=\"q20_input\">, and for a time in the mid-20th century, they were largely ignored. Then in the 1980s a number of institutions started offering a <strong>21</strong> <input name=\"q8\" type=\"text\" id=\"q21_input\"> in the subject, although for many years there was still little evidence to support their use, because doctors and academics were not interested.</p>\n</div>\n</div>"},{"groupId":"group-3","kind":"matching","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 22–26</h4>\n<p>Look at the following statements (Questions 22–26) and the list of people below.</p>\n<p>Match each statement with the correct person, <strong>A, B, C or D</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>22</strong> There ought to be restrictions on where you can buy some herbal medicines.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> The authorities stopped supporting one project without a good reason.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>24</strong> The herbal medicine industry has an effect on the environment where some plant-based medicines are found.</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>25</strong> New Zealand has the human resources and natural environment to grow herbs commercially.</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>26</strong> It is essential for herbal medicines to have international certification, despite the cost.</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div class=\"options-pool\" id=\"people-options-pool\">\n<strong>List of People</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"person-A\" draggable=\"true\" data-option=\"A\">A Phil Rasmussen</div>\n<div class=\"drag-item\" id=\"person-B\" draggable=\"true\" data-option=\"B\">B Malcolm Douglas</div>\n<div class=\"drag-item\" id=\"person-C\" draggable=\"true\" data-option=\"C\">C Sandra Clair</div>\n<div class=\"drag-item\" id=\"person-D\" draggable=\"true\" data-option=\"D\">D Isla Burgess</div>\n</div>\n</div>\n</div>","allowOptionReuse":true}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-19", "answers", {"answerKey":{"q1":"G","q2":"A","q3":"F","q4":"H","q5":"wrist","q6":"emotions","q7":"entertained","q8":"challenging","q9":"D","q10":"A","q11":"B","q12":"C","q13":"B"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-19", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-high-19","meta":{"title":"Mind Music 脑海中的音乐(心灵音乐)","category":"P2","frequency":"high","pdfFilename":"115. P2 - Mind Music 脑海中的音乐(心灵音乐)【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/115. P2 - Mind Music 脑海中的音乐(心灵音乐)【高】/","legacyFilename":"115. P2 - Mind Music 脑海中的音乐(心灵音乐)【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/115. P2 - Mind Music 脑海中的音乐(心灵音乐)【高】/115. P2 - Mind Music 脑海中的音乐(心灵音乐)【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/115. P2 - Mind Music 脑海中的音乐(心灵音乐)【高】/115. P2 - Mind Music 脑海中的音乐(心灵音乐)【高】.pdf","ieltsHtml":"IELTS/P2/Mind Music.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.024Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-19", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 14–17</h4>\n<p>Reading Passage 2 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 200px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> a description of the characteristics common to songs with earworms</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> a justification for research into earworms</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> a description of the brain's reaction to known and unknown songs</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> details of proposed research into the frequency with which earworms occur in different age groups</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-anchor\">\n<h4>Questions 18–21</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>Goldsmiths study</h4>\n<p>Researchers from Goldsmiths concluded that the music we imagine in our minds is quite similar to recordings. They proved this by asking volunteers to record the rhythm of music using a monitor on their <strong>18</strong> <input name=\"q5\" type=\"text\" id=\"q18_input\">. Further research has demonstrated that those who hear earworms more frequently have brains that may deal with <strong>19</strong> <input name=\"q6\" type=\"text\" id=\"q19_input\"> differently from other people. Dr Stewart also believes that the brain is <strong>20</strong> <input name=\"q7\" type=\"text\" id=\"q20_input\"> by earworms when it is not focused on a task. In fact, a reduction in the occurrence of earworms was found to be directly related to how <strong>21</strong> <input name=\"q8\" type=\"text\" id=\"q21_input\"> the task was. Interestingly, volunteers' diaries revealed that the songs they heard inside their head reflected their moods, so the choice of music is not accidental.</p>\n</div>\n</div>"},{"groupId":"group-3","kind":"matching","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 22–26</h4>\n<p>Look at the following statements and the list of researchers below.</p>\n<p>Match each statement with the correct person, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>22</strong> Some musicians create music that is intentionally memorable.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> People are unable to completely regulate how they think.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>24</strong> We can remember songs without knowing that we have heard them.</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>25</strong> Thinking about music has a similar effect on the brain to hearing music.</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>26</strong> Earworms are more persistent when only a short section of the song is constantly replayed.</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div class=\"options-pool\" id=\"researcher-options-pool\">\n<strong>List of Researchers</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"researcher-A\" draggable=\"true\" data-option=\"A\">A Lauren Stewart</div>\n<div class=\"drag-item\" id=\"researcher-B\" draggable=\"true\" data-option=\"B\">B Ira Hyman</div>\n<div class=\"drag-item\" id=\"researcher-C\" draggable=\"true\" data-option=\"C\">C Andrea Halpern</div>\n<div class=\"drag-item\" id=\"researcher-D\" draggable=\"true\" data-option=\"D\">D John Seabrook</div>\n</div>\n</div>\n</div>","allowOptionReuse":true}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-192", "answers", {"answerKey":{"q1":"e","q2":"d","q3":"h","q4":"f","q5":"irrigation","q6":"transport","q7":"land","q8":"nitrogen","q9":"erosion","q10":"c","q11":"e","q12":"d","q13":"b"}});
+})(typeof window !== "undefined" ? window : globalThis);
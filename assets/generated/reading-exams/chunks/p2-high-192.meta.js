@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-192", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-high-192","meta":{"title":"P2(1115纸笔) - Should we stop eating meat 是否应该吃素","category":"P2","frequency":"high"}});
+})(typeof window !== "undefined" ? window : globalThis);
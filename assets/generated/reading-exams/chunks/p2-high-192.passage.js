@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-192", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"text","bodyHtml":"<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Should we stop eating meat?</h3>\n<p><em>Some claim that it's the only way to save our planet from disaster. But is it really that simple?</em></p>\n<h4>A</h4>\n<p>The call for people to eat less meat to save the planet is growing louder, so if less is good, wouldn't none be better? To find out, let's imagine what would happen if the world eliminated meat, milk and eggs from its diet, then trace the effects. Last year the world consumed 289 million tonnes of meat, 700 million tonnes of milk and 1.2 billion eggs. Environmentally speaking, this came at an enormous cost.</p>\n<h4>B</h4>\n<p>All agriculture damages the environment. Take for example the felled forests and the common use of irrigation systems. And it may surprise you to know that agriculture creates more greenhouse gases than all methods of transport put together. Livestock farming does the most damage. In part, that is because most livestock eat grain that could be used to feed human populations, and farmers are forced to grow more than we would otherwise need to meet the demand. Altogether, if we switched to a vegan diet, meaning no meat, dairy or eggs, the land currently required for crops would drop by an estimated 21 per cent, about 3.4 million hectares, roughly the size of India.</p>\n<h4>C</h4>\n<p>One environmental impact that would also lessen through a reduction in animal farming would be that of the nitrogen emitted from agricultural processes, which spreads into both waterways and land. According to environmental scientist Allison Leach, if everyone eliminated dairy products and eggs, this kind of pollution would fall by 60%. Livestock production has another serious environmental impact. Global statistics are hard to come by, but in the US at least, livestock account for 55% of erosion, mostly from forests being cut down to make way for grazing land. On top of this, half of all antibiotics manufactured are fed to livestock as part of their normal diet, a practice that is leading to drug-resistant bacteria.</p>\n<h4>D</h4>\n<p>A meat-free world, then would be greener in many ways. However, if everyone opted to give up meat there would be significant costs too. For most of human history, livestock grazed on land that wasn't suitable for ploughing, and in doing so they converted inedible grass into edible meat and milk. Even today, a flock of sheep or goats can be the most efficient way to get food from marginal land. In a world in which over a billion people do not have enough to eat, using this land for crop production would contribute to food insecurity.</p>\n<h4>E</h4>\n<p>In some parts of the world today, livestock like chickens, for instance, can subsist on leftovers and whatever they find. Tara Garnett, who heads the Food Climate Research Network at the University of Surrey, points out the usefulness of these animals. By giving them your leftovers, she says, they deal with your rubbish, and you get meat. Garnett admits, though, that if this kind of approach were generally adopted, it would require a major adjustment in food preferences; people would have to get used to chicken, for example, with less fat.</p>\n<h4>F</h4>\n<p>Another downside to a meat-free world would be the disappearance of animal by-products. Such a world would have to replace the 11 million tonnes of leather and 2 million tonnes of wool that come annually from livestock farming and which are turned into clothing. Furthermore, even ardent vegetarians acknowledge that dairy products and meat may be a good thing in poorer countries. ‘Whilst there's no doubt that considerable reduction of meat consumption would have an environmental benefit, we do have to be careful about saying it would be the best solution if the whole world went vegetarian,' says Annette Pinner, chief executive of the UK Vegetarian Society. For many of the world's poorest rural residents, an animal may represent their only realistic hope for a little extra income, and a little animal protein can make a big difference to a marginal diet.</p>\n<h4>G</h4>\n<p>What if we decided on a no-meat vegetarian diet, rather than a vegan diet? After all, milk and eggs are very efficient ways of producing animal calories. ‘It's difficult to switch to a no-meat-but-milk diet,' says Helmut Haberl, a social ecologist. 'Dairy cows must calve every year to keep producing milk, and only half their offspring will be female. While many vegetarians see moral reasons not to kill and eat the males, there is surely no practical reason to waste so much meat.' Similar arguments apply to chickens kept for eggs.</p>\n<h4>H</h4>\n<p>So even though a meat-free world sounds good on paper, it is likely that a utopian future will still have some animal products in it. The real questions, then, are how much meat do we want, and how will we produce it? The answers depend on how you approach these questions. The most straightforward approach is to assume that the world will continue to want evermore meat. The United Nations' best guess is that by 2050, the world will need to more than double its production of meat, an increase that would be environmentally disastrous.</p>\n<h4>I</h4>\n<p>Under this scenario the goal will have to be producing the most meat at the lowest environmental cost. According to Walter Falcon, an agricultural economist, this means fewer free range cattle and sheep in green fields. 'If you're going to keep some livestock systems, I think the ones you'll want to keep are the intensive ones,' he says. Of course this does not take into account animal welfare issues, as intensive farming usually means poor living conditions and the use of growth hormones.</p>\n<p>&nbsp;</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
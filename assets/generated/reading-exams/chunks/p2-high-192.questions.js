@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-192", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\">\n<a id=\"q1-anchor\"></a>\n<h4>Questions 14–17</h4>\n<p>Which paragraph contains the following information?</p>\n<div class=\"q-block\"><p><strong>14</strong> the suggestion that people may need to adapt to a different quality of meat</p><div class=\"options\"><label><input type=\"radio\" name=\"q1\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q1\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q1\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q1\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q1\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q1\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q1\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q1\" value=\"H\"> H</label><label><input type=\"radio\" name=\"q1\" value=\"I\"> I</label></div></div>\n<div class=\"q-block\"><p><strong>15</strong> a description of the way animals were fed in the past</p><div class=\"options\"><label><input type=\"radio\" name=\"q2\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q2\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q2\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q2\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q2\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q2\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q2\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q2\" value=\"H\"> H</label><label><input type=\"radio\" name=\"q2\" value=\"I\"> I</label></div></div>\n<div class=\"q-block\"><p><strong>16</strong> a prediction in regard to human demand for meat</p><div class=\"options\"><label><input type=\"radio\" name=\"q3\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q3\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q3\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q3\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q3\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q3\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q3\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q3\" value=\"H\"> H</label><label><input type=\"radio\" name=\"q3\" value=\"I\"> I</label></div></div>\n<div class=\"q-block\"><p><strong>17</strong> the potential consequences of a meat-free world for textile industries</p><div class=\"options\"><label><input type=\"radio\" name=\"q4\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q4\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q4\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q4\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q4\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q4\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q4\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q4\" value=\"H\"> H</label><label><input type=\"radio\" name=\"q4\" value=\"I\"> I</label></div></div>\n</div>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q5","q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\">\n<a id=\"q5-anchor\"></a>\n<h4>Questions 18–22</h4>\n<p>Complete the summary below. Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<h5>How does agriculture damage the environment?</h5>\n<p>Agriculture causes significant harm to the environment in a number of ways, including the frequent use of <strong>18</strong> <input class=\"blank\" name=\"q5\"> in modern farming and the cutting down of trees. It is also responsible for the production of many greenhouse gases, more so than <strong>19</strong> <input class=\"blank\" name=\"q6\"> is. However, it is livestock farming in particular that is most harmful, because cows, chickens and sheep, for example, are given vast quantities of grain which could be consumed by people instead. A meat-free diet would mean that actually less <strong>20</strong> <input class=\"blank\" name=\"q7\"> could be used for crops. Far less chemical pollution, specifically in the form of <strong>21</strong> <input class=\"blank\" name=\"q8\">, would also be released into the environment, especially if consumers cut out dairy and egg products as well as meat. In the US, there is clear evidence that considerable <strong>22</strong> <input class=\"blank\" name=\"q9\"> is caused by the demand for grazing land, although there is no information on this from other countries.</p>\n</div>"},{"groupId":"group-3","kind":"short_answer","questionIds":["q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\">\n<a id=\"q10-anchor\"></a>\n<h4>Questions 23–26</h4>\n<p>Match each statement with the correct researcher. <em>NB You may use any letter more than once.</em></p>\n<div class=\"q-match-item\"><span class=\"q-text\"><strong>23</strong> It is not possible to say that a vegetarian diet is right for everyone.</span><span class=\"match-dropzone\" data-question=\"q10\"></span></div>\n<div class=\"q-match-item\"><span class=\"q-text\"><strong>24</strong> It may be economically preferable to farm animals in limited space.</span><span class=\"match-dropzone\" data-question=\"q11\"></span></div>\n<div class=\"q-match-item\"><span class=\"q-text\"><strong>25</strong> It does not make sense to give up meat without giving up dairy products too.</span><span class=\"match-dropzone\" data-question=\"q12\"></span></div>\n<div class=\"q-match-item\"><span class=\"q-text\"><strong>26</strong> Some animals can be fed in a way that allows waste to be recycled.</span><span class=\"match-dropzone\" data-question=\"q13\"></span></div>\n<div class=\"option-pool\" id=\"pool-researchers\">\n<div class=\"card\" draggable=\"true\" data-value=\"A\" data-clone=\"true\"><strong>A</strong> Allison Leach</div>\n<div class=\"card\" draggable=\"true\" data-value=\"B\" data-clone=\"true\"><strong>B</strong> Tara Garnett</div>\n<div class=\"card\" draggable=\"true\" data-value=\"C\" data-clone=\"true\"><strong>C</strong> Annette Pinner</div>\n<div class=\"card\" draggable=\"true\" data-value=\"D\" data-clone=\"true\"><strong>D</strong> Helmut Haberl</div>\n<div class=\"card\" draggable=\"true\" data-value=\"E\" data-clone=\"true\"><strong>E</strong> Walter Falcon</div>\n</div>\n</div>"}],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"},"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"]});
+})(typeof window !== "undefined" ? window : globalThis);
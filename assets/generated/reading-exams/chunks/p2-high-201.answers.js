@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-201", "answers", {"answerKey":{"q1":"iv","q2":"iii","q3":"vi","q4":"v","q5":"i","q6":"vii","q7":"c","q8":"c","q9":"a","q10":"e","q11":"position","q12":"attention","q13":"structure"}});
+})(typeof window !== "undefined" ? window : globalThis);
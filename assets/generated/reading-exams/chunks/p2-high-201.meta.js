@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-201", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-high-201","meta":{"title":"Multi-tasking and the brain 大脑与多任务处理","category":"P2","frequency":"high"}});
+})(typeof window !== "undefined" ? window : globalThis);
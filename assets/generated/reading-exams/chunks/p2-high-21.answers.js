@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-21", "answers", {"answerKey":{"q1":"C","q2":"A","q3":"A","q4":"D","q5":"B","q6":"C","q7":"D","q8":"B","q9":"injury","q10":"16.6 weeks","q11":"7%","q12":"massage","q13":"workloads"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-21", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 14–18</h4>\n<p>Look at the following statements (Questions 14–18) and the list of people below.</p>\n<p>Match each statement with the correct person, <strong>A–D</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>14</strong> High-level workers tend to react positively to stress</p>\n<div class=\"match-dropzone\" data-question=\"q1\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>15</strong> Stress levels are increased by trying to please customers</p>\n<div class=\"match-dropzone\" data-question=\"q2\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>16</strong> Support from other workers may relieve stress</p>\n<div class=\"match-dropzone\" data-question=\"q3\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>17</strong> Lack of independence at work is often responsible for stress</p>\n<div class=\"match-dropzone\" data-question=\"q4\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>18</strong> Workers commonly expect their workloads to lessen over time</p>\n<div class=\"match-dropzone\" data-question=\"q5\"></div>\n</div>\n<div class=\"options-pool\" id=\"people-options-pool\">\n<strong>List of People</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"person-A\" draggable=\"true\" data-option=\"A\">A Neil Plumridge</div>\n<div class=\"drag-item\" id=\"person-B\" draggable=\"true\" data-option=\"B\">B Gal Zauberman and John Lynch</div>\n<div class=\"drag-item\" id=\"person-C\" draggable=\"true\" data-option=\"C\">C Jan Elsner</div>\n<div class=\"drag-item\" id=\"person-D\" draggable=\"true\" data-option=\"D\">D Tony LaMontagne</div>\n</div>\n</div>\n</div>","allowOptionReuse":true,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-anchor\">\n<h4>Questions 19–21</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>19</strong> Which of the following is <strong>NOT</strong> mentioned by Neil Plumridge as an indication that his workload is too heavy?</p>\n<label class=\"mcq-option\"><input type=\"radio\" name=\"q6\" value=\"A\"> A an inability to keep to his schedule</label> <label class=\"mcq-option\"><input type=\"radio\" name=\"q6\" value=\"B\"> B inattention to family celebrations</label> <label class=\"mcq-option\"><input type=\"radio\" name=\"q6\" value=\"C\"> C a lack of concentration on a task</label> <label class=\"mcq-option\"><input type=\"radio\" name=\"q6\" value=\"D\"> D a period of insufficient sleep</label>\n</div>\n<div class=\"question-item\">\n<p><strong>20</strong> Which method of lessening work stress is <strong>NOT</strong> suggested by Neil Plumridge?</p>\n<label class=\"mcq-option\"><input type=\"radio\" name=\"q7\" value=\"A\"> A rethinking ideas of what can be achieved</label> <label class=\"mcq-option\"><input type=\"radio\" name=\"q7\" value=\"B\"> B extending the deadline for completing the task</label> <label class=\"mcq-option\"><input type=\"radio\" name=\"q7\" value=\"C\"> C using more workers on a project</label> <label class=\"mcq-option\"><input type=\"radio\" name=\"q7\" value=\"D\"> D taking more time off for sport or other recreation</label>\n</div>\n<div class=\"question-item\">\n<p><strong>21</strong> According to Jan Elsner, meditation offers a method of</p>\n<label class=\"mcq-option\"><input type=\"radio\" name=\"q8\" value=\"A\"> A taking a worker's mind off his troubles.</label> <label class=\"mcq-option\"><input type=\"radio\" name=\"q8\" value=\"B\"> B changing the physical response to stress.</label> <label class=\"mcq-option\"><input type=\"radio\" name=\"q8\" value=\"C\"> C resting more effectively.</label> <label class=\"mcq-option\"><input type=\"radio\" name=\"q8\" value=\"D\"> D encouraging executives to take breaks.</label>\n</div>\n</div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 22–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h5>Stress: its effects and how to reduce it</h5>\n<p>\nStatistics on workers' compensation show that people take more time off work due to stress than for any other <strong>22</strong> <input name=\"q9\" type=\"text\" id=\"q22_input\"> at work. On average, workers who take time off because of stress stay away for <strong>23</strong> <input name=\"q10\" type=\"text\" id=\"q23_input\">. This absence comes at a high price — while the number of insurance claims due to stress amount to only <strong>24</strong> <input name=\"q11\" type=\"text\" id=\"q24_input\"> of the total, they account for a much higher proportion of the cost of claim payments.\n</p>\n<p>\nExperts believe that seeking to relieve stress through physical therapies such as sport or <strong>25</strong> <input name=\"q12\" type=\"text\" id=\"q25_input\"> may be less effective than simply reviewing your <strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\">.\n</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
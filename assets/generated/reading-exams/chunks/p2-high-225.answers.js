@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-225", "answers", {"answerKey":{"q1":"B","q2":"C","q3":"B","q4":"E","q5":"D","q6":"B","q7":"D","q8":"D","q9":"E","q10":"social history","q11":"tag","q12":"protective clothing","q13":"water"}});
+})(typeof window !== "undefined" ? window : globalThis);
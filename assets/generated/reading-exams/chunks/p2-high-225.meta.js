@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-225", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-high-225","meta":{"title":"The problem of graffiti 涂鸦之困","category":"P2","frequency":"high","pdfFilename":"225. P2 - The problem of graffiti 涂鸦之困.pdf","legacyPath":"ReadingPractice/PDF/","legacyFilename":"225. P2 - The problem of graffiti 涂鸦之困.pdf","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/225. P2 - The problem of graffiti 涂鸦之困/225. P2 - The problem of graffiti 涂鸦之困.html","shuiPdf":"ReadingPractice/PDF/225. P2 - The problem of graffiti 涂鸦之困.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-31T19:30:00.000Z","notes":"signature:dragdrop,checkbox,textarea"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-225", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14-26, which are based on Reading Passage 2 below.</p>\n<h3>The problem of graffiti</h3>\n<h5>Is it art? Or is it a crime?</h5>\n<h4>A</h4>\n<p>The term 'graffiti' derives from the Italian word graffio meaning 'scratching', and can be defined as uninvited markings or writing scratched or applied to objects, built structures, and natural features. It is not a new phenomenon; examples can be found on ancient structures around the world, in some cases predating the Greeks and Romans. In such circumstances, it has acquired invaluable historical and archaeological significance as it provides a social history of life and events at that time. This is not true of more recent graffiti, which has become a pervasive problem particularly over the last 50 years, as a result of the availability of cheap and quick means of mark-making. These include the ubiquitous spray paints.</p>\n<h4>B</h4>\n<p>Graffitists, the people who are responsible for creating graffiti, are indiscriminate about the surfaces they choose. Wherever graffiti appears, it is usually considered a priority to remove it as quickly as possible. One reason for this is to prevent 'copy-cat' emulation, which can occur rapidly once a clean surface is defaced, and so many companies and councils have a policy of removing graffiti within an hour or two of it being reported. Another reason is that as paints, glues, and inks dry out, they can become increasingly difficult to remove. A more important factor, however, is that graffiti can lead to more serious forms of vandalism and, ultimately, to the deterioration of a neighborhood area, and in this way contributes to a general social decline. For this reason, the police like to be notified of new graffiti incidents. To aid in achieving a successful prosecution, they encourage owners of properties to take photographs of any new graffiti, as there could be other related incidents occurring locally. An incidence pattern can help to identify possible culprits, as can their 'tag' - the distinctive mark graffitists leave to show the graffiti is their work.</p>\n<h4>C</h4>\n<p>Any proposal to remove graffiti has to be carefully considered because techniques designed for robust or utilitarian surfaces may result in considerable damage to older, more historic buildings. Consequently, as no two sites are the same, there is no one treatment which will be suitable for all situations; each site must be looked at individually. The owners of some graffiti-affected sites may wish to attempt their own treatment, whereas others may prefer to contact a specialist contractor. However, whichever course is decided on, it is important to follow a systematic approach. The first step is to carry out cleaning trials to see which method is suitable for the removal of the graffiti media used, and also which method has the least impact on the site surface. These trials should be carried out on a small unobtrusive area if possible and should always start with the least aggressive cleaning method, usually water, and stop once a successful method has been found.</p>\n<h4>D</h4>\n<p>Apart from water, a variety of methods can be used to remove graffiti; broadly, these are divided into chemical and mechanical systems. When using either of these systems, care must be taken with regard to protecting both passers-by and the person carrying out the graffiti removal. Chemical preparations are based on dissolving the graffiti media; these solvents can range from mild to potentially dangerous chemical 'cocktails'. When using chemicals, it is important to wear protective clothing, take measures to minimize any run-off of potentially harmful chemicals, and avoid the drifting of aerial mists. Mechanical systems are often in the form of wire-brushing and grit blasting, which attempt to chip off the graffiti media. Operators of mechanical systems must also wear protective clothing to avoid being hurt by hard airborne particles. This method often leaves marks on a surface.</p>\n<h4>E</h4>\n<p>Different measures can be adopted to combat a recurring problem of graffiti. It is clear that protection measures will ultimately be more successful and less damaging than multiple removal treatments. Popular places for graffiti are often readily accessible flat surfaces where the graffiti will have an instant impact, but this is not always the case, and graffitists may scale bridges to give their work greater prominence. Possible protection measures may include a combination of floodlighting to illuminate dark areas and surveillance systems such as closed-circuit television. Research has shown that prominently placed cameras can reduce the incidence of graffiti in areas with a recurring problem. Unfortunately, the cost of any of these measures may be too high, and so physical obstacles such as fences, railings, doors, or gates can be introduced to discourage unauthorized access, though in some cases, these obstacles simply provide a new surface for graffiti.</p>\n<h4>F</h4>\n<p>Another strategy is to apply a removable anti-graffiti barrier-coating as a form of preventive measure. Although this will not stop graffiti being applied, it will make its removal much easier and usually only involves using water, which reduces the possibility of damage to the site surface. Barrier coatings are usually applied by brush or spray, leaving a thin veneer that essentially serves to isolate the graffiti from the surface. So, although there is no prescription for dealing with every graffiti incident, there are some steps that can be taken to minimize the impact of graffiti and to protect vulnerable surfaces.</p>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
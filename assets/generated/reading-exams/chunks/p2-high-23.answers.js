@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-23", "answers", {"answerKey":{"q1":"F","q2":"A","q3":"E","q4":"D","q5":"B","q6":"C","q7":"D","q8":"A","q9":"archaeological","q10":"andes","q11":"currant","q12":"mutation","q13":"infections"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-23", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 14–17</h4>\n<p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–F</strong>, in boxes 14–17 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> an explanation of research aimed at restoring the health of the heirloom tomato</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> a reference to a false belief about the heirloom tomato</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> a description of the flavor of the heirloom tomato</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> a reference to a single gene that significantly improves the cultivation of tomatoes</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-anchor\">\n<h4>Questions 18–21</h4>\n<p>Look at the following statements (Questions 18–21) and the list of researchers below.</p>\n<p>Match each statement with the correct researcher, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"match-question-item\">\n<p><strong>18</strong> The transplanting of certain genes into tomatoes can change their shape.</p>\n<div class=\"match-dropzone\" data-question=\"q5\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>19</strong> The flavor of the heirloom tomato is largely dependent on actual yield and cultivation.</p>\n<div class=\"match-dropzone\" data-question=\"q6\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>20</strong> A new type of tomato can be produced that is stronger than the original heirloom tomato yet equally sweet and flavorsome.</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>21</strong> The wide variety of heirloom tomatoes is due to only a small number of genes.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"options-pool\" id=\"researcher-options-pool\">\n<strong>List of Researchers</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Steven Tanksley</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Esther van der Knaap</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Roger Chetelat</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Doug Heath</div>\n</div>\n</div>\n</div>","allowOptionReuse":false},{"groupId":"group-3","kind":"sentence_completion","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 22–26</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"sentence-completion\">\n<p><strong>22</strong> There is little information on the origin of the tomato despite the existence of <input name=\"q9\" type=\"text\" id=\"q22_input\"> data on the growing of other New World crops.</p>\n<p><strong>23</strong> Although it is uncertain, the tomato is thought to have first grown in the <input name=\"q10\" type=\"text\" id=\"q23_input\">.</p>\n<p><strong>24</strong> In regard to genetic similarities, the type of tomato <input name=\"q11\" type=\"text\" id=\"q24_input\"> is the nearest to the earliest.</p>\n<p><strong>25</strong> A genetic <input name=\"q12\" type=\"text\" id=\"q25_input\">, which is evident in <i>pomodoro</i>, produced larger tomatoes.</p>\n<p><strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\"> are a problem for heirloom tomatoes because they frequently lead to damage and deterioration.</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
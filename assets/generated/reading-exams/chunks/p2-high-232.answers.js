@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-232", "answers", {"answerKey":{"q1":"iii","q2":"v","q3":"x","q4":"vii","q5":"viii","q6":"i","q7":"iv","q8":"A","q9":"D","q10":"silence","q11":"opera","q12":"reward","q13":"permanent"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-232", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-high-232","meta":{"title":"The origin and development of applause 掌声的历史","category":"P2","frequency":"high","pdfFilename":"232. P2 - The origin and development of applause 掌声的历史.pdf","legacyPath":"ReadingPractice/PDF/","legacyFilename":"232. P2 - The origin and development of applause 掌声的历史.pdf","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":null,"shuiPdf":"ReadingPractice/PDF/232. P2 - The origin and development of applause 掌声的历史.pdf","ieltsHtml":null},"audit":{"matchStatus":"word_docx_visual_answer_verified","matchConfidence":0.98,"verifiedAt":"2026-05-08T00:00:00.000+08:00","notes":"Rebuilt from May Word DOCX source; passage text and paragraphing extracted from Word Markdown; answer key verified from embedded answer images by visual inspection."}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-232", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14-26, which are based on Reading Passage 2 below.</p>\n<h3>The origin and development of applause</h3>\n<p><em>Whether you clap, cheer or whistle a great public performance, you are following a long tradition.</em></p>\n<p><strong>A</strong> Scholars aren’t quite sure about the origins of applause, but the form that is still most common, clapping the hands together, was formalized in Western culture during and after performances. During the time of the Roman Republic (509 BC – 27 BC) the common way to end a play was for the chief actor to yell ‘Valete et plaudite!’ (‘Goodbye and applause!’) thus signaling to the audience that it was time for them to give praise by striking hands and making explosive noise. It’s no surprise, then, that this became a means of crowd manipulation. Rome saw the rise of a professional class of applauders, or ‘people who clapped for their dinner’, hired to infiltrate crowds and manipulate their reaction to performances. Actors would hire a dozen or so people to spread out among their audiences and prolong the applause, or, if they were feeling especially bold, to start ‘spontaneous’ chants and shouts of praise.</p>\n<p><strong>B</strong> The Roman Republic came to an end and was replaced by the Roman Empire (27 BC – 476 AD) where applause became a way for leaders to interact directly with their citizens. One of the chief methods they used to estimate their standing with the people was gauging the greetings they got when they entered the arena. Leaders became astute at reading the volume, the rhythm, and the length of the crowd’s claps for clues about how well they were doing as officials and lawmakers. ‘We should think of it as an ancient type of opinion poll,’ says Greg Aldrete, a professor of history. ‘This is how you gauge the people.’ Roman leaders were gathering data about people by listening to applause.</p>\n<p><strong>C</strong> Clever leaders of the ancient world researched their rivals, too. Cicero, the Roman lawyer, would send friends to stand around outside the arena, taking notes to see what kind of greeting each official got when he entered, the better to see who was beloved by the people, and who was not. They had a lot of information to assess. ‘Ancient crowds were more interactive than they are today,’ Aldrete points out. ‘There was a lot of back and forth between speakers and crowds. And particularly in the Greco-Roman world, crowds, especially in cities, were really good at communicating messages through rhythmic clapping, sometimes coupled with shouts.’ The coding was, he says, invaluable when assessing an orator’s fortunes.</p>\n<p><strong>D</strong> Around the first century AD, those systems of applause became more and more elaborate. Applause no longer meant, simply, ‘claps’. While Greco-Roman audiences certainly smacked their palms together the same way we do today, their overall strategies of applause were much more varied than clapping alone. Crowds expressed degrees of approval of the person or persons before them, ranging from claps, to snaps (of the finger and thumb), to waves (of the edge of the toga). The emperor Aurelian decided to replace this gesture by waving a special handkerchief instead, a prop which he then distributed to all Roman citizens, so they would never be without a way to praise him.</p>\n<p><strong>E</strong> Although style of applause may have changed over the centuries, the need to manipulate remained. 16th-century French poet Jean Daurat is credited with bringing back the Roman practice of hiring professional applauders. In France, this group became known as a ‘claque’. Daurat handed out tickets to his own performances to people who promised to applaud at the end. By the early 1820s, claques had become institutionalized, with an agency in Paris specializing in the distribution of the claqueurs’ services. The historian William B. Cohen describes the intricate price lists agencies of this kind would hand out to potential patrons: polite clapping would cost this many francs, enthusiastic applause would cost this many. The claque also underwent a kind of classification: the rieurs (laughers) would laugh loudly at the jokes; the pleureurs (criers) would feign tears in reaction to performances; the commissaires (officers) would learn a play or a piece of music by heart and then call attention to its best parts. This practice spread to Milan, to Vienna, and to London before falling out of fashion. The claque lost its power once people became aware of its tricks.</p>\n<p><strong>F</strong> And clapping itself evolved. In the 18th century, symphonies and concerts became more serious, aligning themselves with the reverence and spirituality associated with religious ceremonies. Knowing when to maintain silence, as well as when to clap, became a mark of sophistication, a kind of code for audiences to learn. Applause became a matter of ‘do’ or ‘don’t’, so losing many old shades of meaning. Those changes changed performers, too. Applause became much less of a true dialogue with an audience, especially so with opera, where the singers saw it as part of a basic transaction with the crowd. So by the time the 19th century arrived, applause had become standardized and institutionalized, and had become an expectation rather than the reward it used to be.</p>\n<p><strong>G</strong> In the 21st century we’re reinventing applause, to make it what it used to be: a coded form of communication. More and more the digital world allows us to link and like and share through our devices. By connecting with others in this way, we become part of the performance by participating in it, demonstrating our appreciation by amplifying and extending the show through commenting and praising. Our kind of applause matters more now, in many ways, because it is no longer momentary and short-lived, but is far more permanent instead.</p>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
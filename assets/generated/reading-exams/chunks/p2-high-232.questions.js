@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-232", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"allowOptionReuse":false,"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\"><h4>Questions 14-20</h4><p>Reading Passage 2 has seven paragraphs, A-G.</p><p>Choose the correct heading for each paragraph from the list of headings below.</p><div class=\"match-question-item\" id=\"q1-anchor\">\n<p><strong>14</strong> Paragraph A</p>\n<div class=\"match-dropzone\" data-question=\"q1\"></div>\n</div><div class=\"match-question-item\" id=\"q2-anchor\">\n<p><strong>15</strong> Paragraph B</p>\n<div class=\"match-dropzone\" data-question=\"q2\"></div>\n</div><div class=\"match-question-item\" id=\"q3-anchor\">\n<p><strong>16</strong> Paragraph C</p>\n<div class=\"match-dropzone\" data-question=\"q3\"></div>\n</div><div class=\"match-question-item\" id=\"q4-anchor\">\n<p><strong>17</strong> Paragraph D</p>\n<div class=\"match-dropzone\" data-question=\"q4\"></div>\n</div><div class=\"match-question-item\" id=\"q5-anchor\">\n<p><strong>18</strong> Paragraph E</p>\n<div class=\"match-dropzone\" data-question=\"q5\"></div>\n</div><div class=\"match-question-item\" id=\"q6-anchor\">\n<p><strong>19</strong> Paragraph F</p>\n<div class=\"match-dropzone\" data-question=\"q6\"></div>\n</div><div class=\"match-question-item\" id=\"q7-anchor\">\n<p><strong>20</strong> Paragraph G</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div><h5>List of Headings</h5><div class=\"options-pool\"><div class=\"pool-items\"><div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i The impact of musical performance on the etiquette of applause</div><div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii The negative effects of applause on a kind of public performer</div><div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii The initial emergence of applause as a behaviour in the theatre</div><div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv A form of applause that is more far-reaching than ever before</div><div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v The use of applause by political figures to evaluate their own popularity</div><div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi How music can influence an audience’s level of applause</div><div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii The different methods of applause employed in ancient times, besides clapping</div><div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii The re-emergence and disappearance of fake appreciation</div><div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix How the theatrical world copied the world of politics in giving applause</div><div class=\"drag-item\" draggable=\"true\" data-heading=\"x\">x The use of applause in working out how popular an opponent was</div></div></div></div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"multi_choice","questionIds":["q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q8-9-anchor\"><h4>Questions 21 and 22</h4><p>Choose <strong>TWO</strong> letters, A-E.</p><p>Which TWO of the following statements are true of the 'claque' in France?</p><div class=\"choice-item\"><label><input type=\"checkbox\" name=\"q8_9\" value=\"A\"> A As a practice in France, it first appeared in the 16th century.</label></div><div class=\"choice-item\"><label><input type=\"checkbox\" name=\"q8_9\" value=\"B\"> B It did not become a widespread practice within France.</label></div><div class=\"choice-item\"><label><input type=\"checkbox\" name=\"q8_9\" value=\"C\"> C The cost of hire depended on the fame of the client.</label></div><div class=\"choice-item\"><label><input type=\"checkbox\" name=\"q8_9\" value=\"D\"> D Claqueurs were divided into different categories.</label></div><div class=\"choice-item\"><label><input type=\"checkbox\" name=\"q8_9\" value=\"E\"> E The practice did not exist beyond France in other countries.</label></div></div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-anchor\"><h4>Questions 23-26</h4><p>Complete the summary below.</p><p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p><p>In the 18th century, people could show their superiority by understanding when either <strong>23</strong> <input class=\"blank\" name=\"q10\" type=\"text\"> or applause was appropriate.</p><p>Performers in the 18th century, in particular those singing in the <strong>24</strong> <input class=\"blank\" name=\"q11\" type=\"text\">, no longer had a meaningful dialogue with their audiences.</p><p>In the 19th century, applause was no longer offered as a <strong>25</strong> <input class=\"blank\" name=\"q12\" type=\"text\"> to performers.</p><p>Nowadays our expressions of approval are seen as <strong>26</strong> <input class=\"blank\" name=\"q13\" type=\"text\"> in comparison to the applause of the past.</p></div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
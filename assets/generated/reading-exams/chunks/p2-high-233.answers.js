@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-233", "answers", {"answerKey":{"q1":"prescriptions","q2":"accidents","q3":"productivity","q4":"training","q5":"H","q6":"E","q7":"C","q8":"B","q9":"D","q10":"G","q11":"B","q12":"C","q13":"E"}});
+})(typeof window !== "undefined" ? window : globalThis);
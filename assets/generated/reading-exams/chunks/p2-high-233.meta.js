@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-233", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-high-233","meta":{"title":"Why don’t we sleep 失眠的原因","category":"P2","frequency":"high","pdfFilename":"233. P2 - Why don’t we sleep 失眠的原因.pdf","legacyPath":"ReadingPractice/PDF/","legacyFilename":"233. P2 - Why don’t we sleep 失眠的原因.pdf","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":null,"shuiPdf":"ReadingPractice/PDF/233. P2 - Why don’t we sleep 失眠的原因.pdf","ieltsHtml":null},"audit":{"matchStatus":"word_docx_visual_answer_verified","matchConfidence":0.98,"verifiedAt":"2026-05-08T00:00:00.000+08:00","notes":"Rebuilt from May Word DOCX source; passage text and paragraphing extracted from Word Markdown; answer key verified from embedded answer images by visual inspection."}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-233", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14-26, which are based on Reading Passage 2 below.</p>\n<h3>Why don’t we sleep?</h3>\n<p><em>Insomnia, the inability to fall and stay asleep, is at epidemic levels. If sleep is so important to us, why is it sometimes so hard to achieve?</em></p>\n<p><strong>A</strong> Fifty-six million prescriptions for sleeping medication were handed out by doctors in America last year. Yet remarkably little is being done to understand insomnia’s root causes. Socially and economically, the undertreatment of sleeplessness is hugely expensive. The Institute of Medicine, an independent scientific advisory group, estimates nearly 20 percent of all major accidents on the road are associated with driver sleepiness. The loss in terms of productivity within the workplace is even higher, costing billions. Then there are the softer costs which remain unmeasured but still exist; for example, the damaged relationships with others. If other medical problems were causing such widespread harm, governments would act, but US authorities contribute only about \\$230 million a year for the funding of sleep research, comparable to the amount that the manufacturers of popular sleeping pills spent in three months on advertising. Currently most medical school students get no more than four hours of training on sleep disorders; some get none.</p>\n<p><strong>B</strong> If we don’t know why we can’t sleep, it’s in part because we don’t really know why we need to sleep in the first place. We know that we divide it between periods of deep-wave sleep and rapid eye movement (REM) sleep, when the brain is as active as when we’re awake, but our voluntary muscles are paralyzed. We know that all mammals sleep, and that there are some insects and reptiles that only half sleep, in order to remain aware of their environment and predators.</p>\n<p><strong>C</strong> The predominant theory of sleep is that the brain demands it. Recently, researchers at Harvard, led by Robert Stickgold, tested undergraduates on various aptitude tests, allowed them to nap, then tested them again. They found that those who had engaged in REM sleep subsequently performed better in pattern recognition tasks, such as grammar, while those who slept deeply were better at memorization.</p>\n<p><strong>D</strong> Such studies suggest that memory consolidation may be one function of sleep. Giulio Tononi, a sleep researcher at the University of Wisconsin, published an interesting twist on this theory a few years ago. His study showed that the sleeping brain seems to delete redundant or unnecessary synapses or connections. So the purpose of sleep may be to help us remember what’s important, by letting us forget what’s not.</p>\n<p><strong>E</strong> Sleep is likely to have physiological purposes too. Some researchers have found that sleep deprivation impedes wound healing in rats, and others have suggested that sleep helps boost the immune system and control infection. But these studies are not conclusive. At Stanford University, William Dement, co-founder of the Stanford Sleep Medicine Center, explains what he knows after 50 years of research, about the reason we sleep. ‘As far as I know,’ he said, ‘the only reason we need to sleep that is really, really solid is because we get sleepy.’</p>\n<p><strong>F</strong> The Stanford clinic does more than 3,000 overnight sleep studies a year. Their main diagnostic tool is the polysomnogram, the main element of which is the electroencephalograph (EEG), which captures the electrical output from a patient’s brain. As the EEG records a person’s sleep patterns, the polysomnogram technicians also measure body temperature, muscle activity, eye movement, and breathing. Then they look over the data for signs of abnormal sleep. When a person has narcolepsy, for instance, they plunge from wakefulness into REM sleep without any intermediate steps. However, Clete Kushida, the clinic director, told me he can spot most people’s sleep problems right at the intake interview. ‘There are those who cannot keep their eyes open, and those who just speak of their exhaustion but don’t actually fall asleep. The former often have sleep apnea where they stop breathing. The latter have true insomnia.’</p>\n<p><strong>G</strong> In sleep apnea, muscle relaxation allows the soft tissue of the throat to close, shutting off the sleeper’s air passage. When the brain realizes it is not getting oxygen, it sends a signal to the body to wake up. The sleeper awakes, inhales, and sleep returns. Apnea is a serious problem but only indirectly a sleep disease. True insomniacs are people who either can’t get to, or can’t stay asleep for any evident reason.</p>\n<p><strong>H</strong> While apnea can be treated with a device that forces air down the sleeper’s throat to keep the airways open, the treatment of classic insomnia is not so clear cut. Acupuncture may help. It has long had this role in Asian medicine and is being studied at the University of Pittsburgh sleep center now. Typically in the US, insomnia is treated in two ways. First come the sleeping pills. Though safer than they once were, they can still lead to psychological addiction. ‘Many users complain that their sleeping-pill sleep seems different, and they feel unfocused on waking. Sleeping pills are not a natural way to sleep,’ points out Charles Czeisler, director of the Harvard Health and Safety Group.</p>\n<p><strong>I</strong> The second step in treating insomniacs is usually cognitive behavioral therapy (CBT). In CBT, a psychologist teaches insomniacs to think about sleep problems as manageable, and to practice good ‘sleep hygiene’: sleep in a dark room, go to bed only when you are sleepy, don’t exercise beforehand. Studies have shown that CBT is more effective than sleeping pills at treating long-term insomnia, but many sufferers aren’t convinced. ‘Some people continue in my experience to struggle,’ says John Winkelman, another sleep center director. ‘They’re not super-satisfied with their sleep.’</p>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-233", "questions", {"questionGroups":[{"groupId":"group-1","kind":"summary_completion","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\"><h4>Questions 14-17</h4><p>Complete the summary below.</p><p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p><p>Write your answers in boxes 14-17 on your answer sheet.</p><h5>Insomnia in the USA</h5><p>Last year the high number of <strong>14</strong> <input class=\"blank\" name=\"q1\" type=\"text\"> doctors gave their patients highlights the fact that insomnia is a serious issue in the USA. It is evidently responsible for a number of serious traffic <strong>15</strong> <input class=\"blank\" name=\"q2\" type=\"text\">, and has a considerable effect on company <strong>16</strong> <input class=\"blank\" name=\"q3\" type=\"text\">. A lack of sleep can also have a harmful effect on different relationships, although there are no statistics on this. Unfortunately, there is insufficient official funding given to research into sleep problems, and the <strong>17</strong> <input class=\"blank\" name=\"q4\" type=\"text\"> given at medical school is also insufficient to deal with insomnia.</p></div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q5","q6","q7","q8","q9","q10"],"allowOptionReuse":false,"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-9-10-anchor\"><h4>Questions 18-23</h4><p>Reading Passage 2 has nine paragraphs, A-I.</p><p>Which paragraph contains the following information?</p><div class=\"match-question-item\" id=\"q5-anchor\">\n<p><strong>18</strong> a mention of different cultural approaches to dealing with insomnia</p>\n<div class=\"match-dropzone\" data-question=\"q5\"></div>\n</div><div class=\"match-question-item\" id=\"q6-anchor\">\n<p><strong>19</strong> indications that sleep has a positive effect on health</p>\n<div class=\"match-dropzone\" data-question=\"q6\"></div>\n</div><div class=\"match-question-item\" id=\"q7-anchor\">\n<p><strong>20</strong> the effects of different kinds of sleep on mental performance</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div><div class=\"match-question-item\" id=\"q8-anchor\">\n<p><strong>21</strong> reasons why various species of animal sleep in different ways</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div><div class=\"match-question-item\" id=\"q9-anchor\">\n<p><strong>22</strong> the suggestion that sleep allows us to get rid of insignificant information</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div><div class=\"match-question-item\" id=\"q10-anchor\">\n<p><strong>23</strong> a description of how the brain responds when a person stops breathing</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div><h5>Paragraphs</h5><div class=\"options-pool\"><div class=\"pool-items\"><div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A</div><div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B</div><div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C</div><div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D</div><div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E</div><div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F</div><div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G</div><div class=\"drag-item\" draggable=\"true\" data-option=\"H\">H</div><div class=\"drag-item\" draggable=\"true\" data-option=\"I\">I</div></div></div></div>"},{"groupId":"group-3","kind":"matching","questionIds":["q11","q12","q13"],"allowOptionReuse":false,"bodyHtml":"<div class=\"group\" id=\"q11-12-13-anchor\"><h4>Questions 24-26</h4><p>Look at the following statements and the list of people below.</p><p>Match each statement with the correct person, A-E.</p><div class=\"match-question-item\" id=\"q11-anchor\">\n<p><strong>24</strong> Research tells us that we sleep as a reaction to our body’s signals.</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div><div class=\"match-question-item\" id=\"q12-anchor\">\n<p><strong>25</strong> People suffering from insomnia are easily recognisable.</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div><div class=\"match-question-item\" id=\"q13-anchor\">\n<p><strong>26</strong> Therapy does not always enable people to achieve good quality sleep.</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div><h5>List of People</h5><div class=\"options-pool\"><div class=\"pool-items\"><div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Giulio Tononi</div><div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B William Dement</div><div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Clete Kushida</div><div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Charles Czeisler</div><div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E John Winkelman</div></div></div></div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
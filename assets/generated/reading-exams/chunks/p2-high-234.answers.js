@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-234", "answers", {"answerKey":{"q1":"iii","q2":"vi","q3":"viii","q4":"i","q5":"iv","q6":"ii","q7":"roots","q8":"drought","q9":"fungi","q10":"aphids","q11":"C","q12":"A","q13":"B"}});
+})(typeof window !== "undefined" ? window : globalThis);
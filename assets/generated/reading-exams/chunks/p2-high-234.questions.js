@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-234", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6"],"allowOptionReuse":false,"bodyHtml":"<div class=\"group\" id=\"q1-q2-q3-q4-q5-q6-anchor\"><h4>Questions 14-19</h4><p>Reading Passage 2 has six paragraphs, A-F.</p><p>Choose the correct heading for each paragraph from the list of headings below.</p><p>Write the correct number, i-viii, in boxes 14-19 on your answer sheet.</p><div class=\"match-question-item\" id=\"q1-anchor\"><p><strong>14</strong> Paragraph A</p><div class=\"match-dropzone\" data-question=\"q1\"></div></div><div class=\"match-question-item\" id=\"q2-anchor\"><p><strong>15</strong> Paragraph B</p><div class=\"match-dropzone\" data-question=\"q2\"></div></div><div class=\"match-question-item\" id=\"q3-anchor\"><p><strong>16</strong> Paragraph C</p><div class=\"match-dropzone\" data-question=\"q3\"></div></div><div class=\"match-question-item\" id=\"q4-anchor\"><p><strong>17</strong> Paragraph D</p><div class=\"match-dropzone\" data-question=\"q4\"></div></div><div class=\"match-question-item\" id=\"q5-anchor\"><p><strong>18</strong> Paragraph E</p><div class=\"match-dropzone\" data-question=\"q5\"></div></div><div class=\"match-question-item\" id=\"q6-anchor\"><p><strong>19</strong> Paragraph F</p><div class=\"match-dropzone\" data-question=\"q6\"></div></div><div class=\"options-pool\"><div class=\"pool-items\"><div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i Sending messages underground</div><div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Potential advantages for farmers</div><div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii The widespread rejection of an idea</div><div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv One species accelerating growth in another</div><div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v Some obstacles to plant communication</div><div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi Evidence leading to renewed belief in a theory</div><div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii New technologies which helped researchers</div><div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii A suggested benefit to the sender of plant communication</div></div></div></div>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q7-q8-q9-q10-anchor\"><h4>Questions 20-23</h4><p>Complete the summary below.</p><p>Choose ONE WORD ONLY from the passage for each answer.</p><p>Write your answers in boxes 20-23 on your answer sheet.</p><h5>Plant communication research in Israel and Scotland</h5><p>Plants may send messages via their <strong>20</strong> <input class=\"blank\" name=\"q7\" type=\"text\"> according to Ariel Novoplansky of Ben-Gurion University in Israel. In one study, Novoplansky’s team planted rows of garden peas, and created conditions like a <strong>21</strong> <input class=\"blank\" name=\"q8\" type=\"text\"> around the first plant in each row. The plants responded by closing the tiny holes on their leaf surfaces, known as pores. They then appeared to signal to other plants nearby, causing them to respond in a similar way.</p><p>Research at the University of Aberdeen in Scotland, meanwhile, has focused on the networks of <strong>22</strong> <input class=\"blank\" name=\"q9\" type=\"text\"> which connect the plants beneath the soil. These structures, which extract sugars from the plants and supply them with phosphorus and nitrogen, also seem to play a key role in plant communication. Experiments involving broad bean plants and plant-eating insects called <strong>23</strong> <input class=\"blank\" name=\"q10\" type=\"text\"> have also produced some interesting results.</p></div>"},{"groupId":"group-3","kind":"matching","questionIds":["q11","q12","q13"],"allowOptionReuse":false,"bodyHtml":"<div class=\"group\" id=\"q11-q12-q13-anchor\"><h4>Questions 23-26</h4><p>Look at the following statements (Questions 23-26) and the list of researchers below.</p><p>Match each statement with the correct researcher, A-E.</p><p>Write the correct letter, A-E, in boxes 23-26 on your answer sheet.</p><div class=\"match-question-item\" id=\"q11-anchor\"><p><strong>24</strong> It is likely that research into plant communication will one day help to improve our food supply.</p><div class=\"match-dropzone\" data-question=\"q11\"></div></div><div class=\"match-question-item\" id=\"q12-anchor\"><p><strong>25</strong> Plant communication could occur as a consequence of internal mechanisms intended to help a single plant.</p><div class=\"match-dropzone\" data-question=\"q12\"></div></div><div class=\"match-question-item\" id=\"q13-anchor\"><p><strong>26</strong> Attitudes towards plant communication have changed greatly in recent decades.</p><div class=\"match-dropzone\" data-question=\"q13\"></div></div><div class=\"options-pool\"><div class=\"pool-items\"><div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Richard Karban</div><div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Ariel Novoplansky</div><div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C David Johnson</div><div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Monica Gagliano</div><div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Carel ten Cate</div></div></div></div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-235", "answers", {"answerKey":{"q1":"Siberian polecat","q2":"Europe","q3":"prairie dog","q4":"B","q5":"H","q6":"A","q7":"F","q8":"G","q9":"E","q10":"E","q11":"H","q12":"D","q13":"I"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-235", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-high-235","meta":{"title":"The return of the black-footed ferret 黑足鼬","category":"P2","frequency":"high","pdfFilename":"235. P2 - The return of the black-footed ferret 黑足鼬.pdf","legacyPath":"ReadingPractice/PDF/","legacyFilename":"235. P2 - The return of the black-footed ferret 黑足鼬.pdf","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":null,"shuiPdf":"ReadingPractice/PDF/235. P2 - The return of the black-footed ferret 黑足鼬.pdf","ieltsHtml":null},"audit":{"matchStatus":"pdf_visual_answer_verified","matchConfidence":0.98,"verifiedAt":"2026-06-06T00:00:00.000+08:00","notes":"Re-audited against the June PDF text layer; answer key and explanations match the embedded PDF answer images."}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-235", "questions", {"questionGroups":[{"groupId":"group-1","kind":"sentence_completion","questionIds":["q1","q2","q3"],"bodyHtml":"<div class=\"group\" id=\"q1-q2-q3-anchor\"><h4>Questions 14-16</h4><p>Complete the sentences below.</p><p>Choose NO MORE THAN TWO WORDS from the passage for each answer.</p><p>Write your answers in boxes 14-16 on your answer sheet.</p><p><strong>14</strong> The black-footed ferret shares most characteristics with its relative, the <input class=\"blank\" name=\"q1\" type=\"text\">.</p><p><strong>15</strong> North American ferrets are thought to have originally come from <input class=\"blank\" name=\"q2\" type=\"text\">.</p><p><strong>16</strong> The <input class=\"blank\" name=\"q3\" type=\"text\"> is the black-footed ferret’s primary source of food.</p></div>"},{"groupId":"group-2","kind":"matching","questionIds":["q4","q5","q6","q7","q8","q9"],"allowOptionReuse":false,"bodyHtml":"<div class=\"group\" id=\"q4-q5-q6-q7-q8-q9-anchor\"><h4>Questions 17-22</h4><p>Look at the following events (Questions 17-22) and the list of dates below.</p><p>Match each event with the correct date, A-H.</p><p>Write the correct letter, A-H, in boxes 17-22 on your answer sheet.</p><div class=\"match-question-item\" id=\"q4-anchor\"><p><strong>17</strong> An appeal for evidence of black-footed ferrets was published.</p><div class=\"match-dropzone\" data-question=\"q4\"></div></div><div class=\"match-question-item\" id=\"q5-anchor\"><p><strong>18</strong> A scheme for releasing captive-born black-footed ferrets into the wild was launched.</p><div class=\"match-dropzone\" data-question=\"q5\"></div></div><div class=\"match-question-item\" id=\"q6-anchor\"><p><strong>19</strong> The black-footed ferret first appeared in a scientific work.</p><div class=\"match-dropzone\" data-question=\"q6\"></div></div><div class=\"match-question-item\" id=\"q7-anchor\"><p><strong>20</strong> The discovery of a single black-footed ferret led to renewed hope for the species.</p><div class=\"match-dropzone\" data-question=\"q7\"></div></div><div class=\"match-question-item\" id=\"q8-anchor\"><p><strong>21</strong> North America’s last wild-born black-footed ferrets were taken into captivity.</p><div class=\"match-dropzone\" data-question=\"q8\"></div></div><div class=\"match-question-item\" id=\"q9-anchor\"><p><strong>22</strong> Efforts to save the black-footed ferret were officially announced as having failed.</p><div class=\"match-dropzone\" data-question=\"q9\"></div></div><div class=\"options-pool\"><div class=\"pool-items\"><div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A 1851</div><div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B 1874</div><div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C 1967</div><div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D 1974</div><div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E 1979</div><div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F 1981</div><div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G 1985</div><div class=\"drag-item\" draggable=\"true\" data-option=\"H\">H 1991</div></div></div></div>"},{"groupId":"group-3","kind":"matching","questionIds":["q10","q11","q12","q13"],"allowOptionReuse":false,"bodyHtml":"<div class=\"group\" id=\"q10-q11-q12-q13-anchor\"><h4>Questions 23-26</h4><p>Reading Passage 2 has nine paragraphs, A-I.</p><p>Which paragraph contains the following information?</p><p>Write the correct letter, A-I, in boxes 23-26 on your answer sheet.</p><div class=\"match-question-item\" id=\"q10-anchor\"><p><strong>23</strong> reasons for the sharp decrease in black-footed ferret populations</p><div class=\"match-dropzone\" data-question=\"q10\"></div></div><div class=\"match-question-item\" id=\"q11-anchor\"><p><strong>24</strong> the procedure by which black-footed ferrets are taught to survive in the wild</p><div class=\"match-dropzone\" data-question=\"q11\"></div></div><div class=\"match-question-item\" id=\"q12-anchor\"><p><strong>25</strong> mention of doubts about whether there was such an animal as a black-footed ferret</p><div class=\"match-dropzone\" data-question=\"q12\"></div></div><div class=\"match-question-item\" id=\"q13-anchor\"><p><strong>26</strong> reference to a site which is ideal for the release of black-footed ferrets into the wild</p><div class=\"match-dropzone\" data-question=\"q13\"></div></div><div class=\"options-pool\"><div class=\"pool-items\"><div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A</div><div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B</div><div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C</div><div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D</div><div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E</div><div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F</div><div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G</div><div class=\"drag-item\" draggable=\"true\" data-option=\"H\">H</div><div class=\"drag-item\" draggable=\"true\" data-option=\"I\">I</div></div></div></div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-236", "answers", {"answerKey":{"q1":"D","q2":"B","q3":"A","q4":"C","q5":"B","q6":"F","q7":"E","q8":"A","q9":"TRUE","q10":"NOT GIVEN","q11":"FALSE","q12":"FALSE","q13":"D"}});
+})(typeof window !== "undefined" ? window : globalThis);
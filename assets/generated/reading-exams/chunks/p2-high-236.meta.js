@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-236", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-high-236","meta":{"title":"War of the Plants","category":"P2","frequency":"high","sourceDoc":"P2 - War of the Plants(1).docx","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":null,"shuiPdf":null,"ieltsHtml":null},"audit":{"matchStatus":"imported_docx_visual_answer_verified","matchConfidence":0.98,"verifiedAt":"2026-05-24T00:00:00.000+08:00","notes":"Built from imported Word DOCX source; passage and question text extracted from Word XML; answer key and explanations extracted from embedded answer images by visual inspection."}});
+})(typeof window !== "undefined" ? window : globalThis);
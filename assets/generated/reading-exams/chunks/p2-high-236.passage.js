@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-236", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>War of the Plants</h3>\n<p><em>Professor John Lovett from New England University, Australia, describes some of the ways in which plants ensure their own survival.</em></p>\n<p><strong>A</strong> The general perception of plants is that they are defenceless when faced with threat from animals (including man), insects and other plants. This, however, is not the case. Plants are able to defend themselves against attack from their environment in many ways. There are two major features of plants that ensure their continuation as species. One of these relates to their physical attributes. Spinifex grass, a plant native to Australia, provides a notable example. Adapted to life in the hot, desert inland, spinifex has developed tightly rolled leaves which reduce the effects of drought stress. The hairs, or trichomes, which are found on the inner surface of the rolled-up spinifex leaf are believed to assist in minimising water loss. Trichomes also have defensive roles against predators. Many plants, such as the sunflower, have hairy leaves which are rough to the touch. When the plant is bitten by a grazing animal, the sensation is unpleasant on the tongue and the animal normally moves on to find more palatable food.</p>\n<p><strong>B</strong> Some families of plants such as the Solanaceae, which includes the tomato, the potato and other food plants, feature glandular trichomes. In these structures a tiny sac is carried on the hair, which rises from the epidermis, or skin, of the plant. The sac contains chemicals which may perform a range of functions. For example, an insect landing on a tomato leaf and rupturing the sac is exposed to a toxic chemical which will deter it from feeding on that plant in future. In other plants of the same family, the sacs contain a natural adhesive and the unsuspecting insect landing on such a leaf and rupturing a trichome sac is held onto the plant, unable to depart. In the leaves of the nettle plant these trichomes resemble miniature hypodermic syringes. An irritant chemical is stored at the base of the ‘syringe’. If an animal touches it, a shot of the chemical is discharged through the ‘needle’ and into the skin of the animal. The irritation the chemical causes is a deterrent against future threat.</p>\n<p><strong>C</strong> The poisons and glues of the Solanaceae and the irritant of the nettle indicate the other major method of plant survival: that some plants use chemicals to protect themselves, sometimes from each other. Chemical interactions that occur between plants are known as ‘allelopathy’, and in natural plant communities it is one of many factors which determine how plants grow in relation to one another. An example in Australia is the suppression of vegetation growth beneath eucalypt trees, an effect which decreases with increasing distance from the trunk of the tree.</p>\n<p><strong>D</strong> The most detailed studies of allelopathy have generally been carried out on agricultural plant communities. In agriculture, allelopathy has been identified particularly with weeds, which compete with desired crop or pasture species, such as wheat, oats and grass, for environmental resources. Competition can be physical, where the growth of one plant maximises the use of water, nutrients and light to the disadvantage of another. Allelopathy, on the other hand, involves plant-produced chemicals which may poison a neighbouring plant. On the whole, weeds are far more physically and chemically aggressive than crop and pasture species. As an example, recent research on the common thorn apple, Datura stramonium, a weed found throughout Australia, has found that two powerful chemicals are released from the seed during the early stages of germination. In fact, it is necessary for the chemicals to be released from the seed coat so that the seed can germinate. Once released, the chemicals then provide a barrier that inhibits the growth of any potential plant competitor near the thorn apple seedling.</p>\n<p><strong>E</strong> Allelopathic chemicals function in quite subtle ways. Generally they are active in small quantities, they are effective only with certain other plants, they act by disrupting the plant’s natural processes and they have no known residual effects. It has also been found that the activity of these chemicals may be synergistic, that is, two or more such substances may combine to produce an effect that is greater than the effects of the substances acting in isolation. These are the very attributes which are being targeted in the current development of synthetic herbicides*. Allelopathy is not restricted to weeds in agriculture, but allelopathic activity in crop and pasture plants appears to have diminished, possibly because plant breeders may have concentrated on improving aspects of crop quality and quantity rather than aspects of defence against natural enemies.</p>\n<p><strong>F</strong> Allelopathic chemicals may be harvested for development as ‘natural herbicides’, similar to the harvest of pyrethrins from the pyrethrum daisy for use as natural insecticides. Harnessing allelopathy is highly attractive to the farming industry, as at least half of the more than A$200-million annual cost of crop protection in Australia is spent on herbicides. Enhancing allelopathic activity in crop and pasture plants could reduce this enormous bill. Developing and harvesting natural herbicides might also offer real advantages in addressing environmental concerns about the over-use of synthetic chemicals currently used in crop protection. In many parts of the world, communities are showing an increased willingness to pay a premium for products grown with few or no synthetic chemicals, and natural products are becoming increasingly attractive.</p>\n<p><em>*herbicides: chemicals that kill plants, used mainly to control weeds</em></p>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-236", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6","q7","q8"],"allowOptionReuse":true,"bodyHtml":"<div class=\"group\" id=\"q1-q2-q3-q4-q5-q6-q7-q8-anchor\"><h4>Questions 14-21</h4><p>Reading Passage 2 has six paragraphs, A-F.</p><p>Which paragraph contains the following information?</p><p>Write the correct letter, A-F, in boxes 14-21 on your answer sheet.</p><p>NB You may use any letter more than once.</p><div class=\"match-question-item\" id=\"q1-anchor\"><p><strong>14</strong> an example of a plant’s use of chemicals in its reproductive process</p><div class=\"match-dropzone\" data-question=\"q1\"></div></div><div class=\"match-question-item\" id=\"q2-anchor\"><p><strong>15</strong> how some plants use a kind of glue to discourage attack</p><div class=\"match-dropzone\" data-question=\"q2\"></div></div><div class=\"match-question-item\" id=\"q3-anchor\"><p><strong>16</strong> two examples of non-chemical methods of defence in plants</p><div class=\"match-dropzone\" data-question=\"q3\"></div></div><div class=\"match-question-item\" id=\"q4-anchor\"><p><strong>17</strong> a definition of the term allelopathy</p><div class=\"match-dropzone\" data-question=\"q4\"></div></div><div class=\"match-question-item\" id=\"q5-anchor\"><p><strong>18</strong> descriptions of how plants use chemicals to discourage predators</p><div class=\"match-dropzone\" data-question=\"q5\"></div></div><div class=\"match-question-item\" id=\"q6-anchor\"><p><strong>19</strong> benefits of using plant-based chemicals to control weeds in agricultural areas</p><div class=\"match-dropzone\" data-question=\"q6\"></div></div><div class=\"match-question-item\" id=\"q7-anchor\"><p><strong>20</strong> a description of the characteristics of allelopathic chemicals</p><div class=\"match-dropzone\" data-question=\"q7\"></div></div><div class=\"match-question-item\" id=\"q8-anchor\"><p><strong>21</strong> an example of a physical characteristic that helps one plant conserve water</p><div class=\"match-dropzone\" data-question=\"q8\"></div></div><div class=\"options-pool\"><div class=\"pool-items\"><div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A</div><div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B</div><div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C</div><div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D</div><div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E</div><div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F</div></div></div></div>"},{"groupId":"group-2","kind":"true_false_not_given","questionIds":["q9","q10","q11","q12"],"bodyHtml":"<div class=\"group\" id=\"q9-q10-q11-q12-anchor\"><h4>Questions 22-25</h4><p>TRUE / FALSE / NOT GIVEN</p><div class=\"question-row\" id=\"q9-anchor\"><div class=\"question-text\"><strong>22</strong> The ‘hypodermic syringes’ of the nettle plant are an example of glandular trichomes.</div><div class=\"radio-group\"><label><input type=\"radio\" name=\"q9\" value=\"TRUE\"> TRUE</label><label><input type=\"radio\" name=\"q9\" value=\"FALSE\"> FALSE</label><label><input type=\"radio\" name=\"q9\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div><div class=\"question-row\" id=\"q10-anchor\"><div class=\"question-text\"><strong>23</strong> Allelopathic plants grow more successfully than plants that rely only on physical features.</div><div class=\"radio-group\"><label><input type=\"radio\" name=\"q10\" value=\"TRUE\"> TRUE</label><label><input type=\"radio\" name=\"q10\" value=\"FALSE\"> FALSE</label><label><input type=\"radio\" name=\"q10\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div><div class=\"question-row\" id=\"q11-anchor\"><div class=\"question-text\"><strong>24</strong> New research into synthetic herbicides is largely focused on individual allelopathic chemicals.</div><div class=\"radio-group\"><label><input type=\"radio\" name=\"q11\" value=\"TRUE\"> TRUE</label><label><input type=\"radio\" name=\"q11\" value=\"FALSE\"> FALSE</label><label><input type=\"radio\" name=\"q11\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div><div class=\"question-row\" id=\"q12-anchor\"><div class=\"question-text\"><strong>25</strong> Herbicides cost Australian farmers over A$200 million a year.</div><div class=\"radio-group\"><label><input type=\"radio\" name=\"q12\" value=\"TRUE\"> TRUE</label><label><input type=\"radio\" name=\"q12\" value=\"FALSE\"> FALSE</label><label><input type=\"radio\" name=\"q12\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div></div>"},{"groupId":"group-3","kind":"single_choice","questionIds":["q13"],"bodyHtml":"<div class=\"group\" id=\"q13-anchor\"><h4>Question 26</h4><p>Choose the correct letter, A, B, C or D.</p><div class=\"mc-question-item\" id=\"q13-anchor\"><p><strong>26</strong> The two main points of this article are that plants can defend themselves in a number of ways, and that</p><label class=\"mc-option\"><input type=\"radio\" name=\"q13\" value=\"A\"> A combating weeds is a major problem for Australian farmers.</label><label class=\"mc-option\"><input type=\"radio\" name=\"q13\" value=\"B\"> B considerable research has been carried out into the use of plant chemicals.</label><label class=\"mc-option\"><input type=\"radio\" name=\"q13\" value=\"C\"> C Australian plants have unique methods of self-protection.</label><label class=\"mc-option\"><input type=\"radio\" name=\"q13\" value=\"D\"> D chemicals found in weeds can have practical benefits for agriculture.</label></div></div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-239", "answers", {"answerKey":{"q1":"bricks","q2":"diameter","q3":"sunscreen","q4":"E","q5":"F","q6":"A","q7":"G","q8":"H","q9":"D","q10":"C","q11":"D","q12":"B","q13":"D"}});
+})(typeof window !== "undefined" ? window : globalThis);
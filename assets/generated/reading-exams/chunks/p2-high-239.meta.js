@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-239", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-high-239","meta":{"title":"Nanotechnology: the science of the very small 纳米科技","category":"P2","frequency":"high","pdfFilename":"239. P2 - Nanotechnology the science of the very small 纳米科技.pdf","legacyPath":"ReadingPractice/PDF/","legacyFilename":"239. P2 - Nanotechnology the science of the very small 纳米科技.pdf","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":null,"shuiPdf":"ReadingPractice/PDF/239. P2 - Nanotechnology the science of the very small 纳米科技.pdf","ieltsHtml":null},"audit":{"matchStatus":"pdf_visual_answer_verified","matchConfidence":0.96,"verifiedAt":"2026-06-06T00:00:00.000+08:00","notes":"Built from root PDF text layer; answer key and explanations extracted from embedded image pages by visual inspection."}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-239", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14-26, which are based on Reading Passage 2 below.</p>\n<h3>Nanotechnology: the science of the very small</h3>\n<p><strong>A</strong> Nanoscience and nanotechnology have become very fashionable in recent times. Their prominence has inspired science fiction and raised a lot of hope and hype about the possibilities. But what exactly is nanotechnology? Most definitions agree that it is the manufacture of structures that measure up to 100 nanometres (nm). The diameter of an atom is typically only two or three tenths of a nanometre while that of the human hair is around 1,000,000 nm. Essentially, we are now able to build new structures from atoms and molecules as if we were using the bricks of a children’s construction toy.</p>\n<p><strong>B</strong> Most of the electronic consumer goods that we use today contain components that measure less than 100 nm. The lasers in our CD and DVD players make use of the properties of semiconductor layers that are just a few atoms in thickness, so we clearly are in the nanotechnology age. There are many other everyday items that we take for granted that have nanoparticles in them. One of these is sunscreen. In the 1990s there were safety issues with many of the sunscreen products available, so scientists at Oxford University set about finding a solution. The product they developed uses nanoparticles of titanium dioxide that are doped with the element manganese. This product is almost transparent to the eye when spread on the skin, and it is effective for much longer than many of the traditional preparations. In this case, we see an example of nanotechnology providing a solution to an existing problem rather than opening up new product areas.</p>\n<p><strong>C</strong> The technique of using nanotechnology to adapt existing products can also be applied to garments, upholstery, paint, and plastics to improve their longevity. Bearing this in mind, it is interesting to ask whether nanotechnology can help with some of the world’s major current issues. The recent growth in climate change awareness calls a range of things into question. Can we use energy more effectively? Can we reduce the carbon dioxide in the atmosphere? Can we use and purify water more effectively? Can health care be improved? Nanotechnology may very well provide the solutions. There are few times in history when the application of science to improving the human condition has been so apparent.</p>\n<p><strong>D</strong> We are already making new types of solar cells and batteries by using our newfound ability to manipulate matter at the atomic and molecular scale. If we can capture some of the huge quantities of energy that arrive at the Earth’s surface from the Sun, and store it effectively, we can reduce the need for fossil fuel-based power stations. We are already using nanoparticles and nanoporous materials to capture harmful greenhouse gases, and we may possibly convert some of them back into fuel. There are, however, many technical problems involved, and it will be another decade or so before some of these ideas are deployed.</p>\n<p><strong>E</strong> Water purification is increasingly challenging and many believe that water, which we take for granted, is going to become more valuable than oil. Currently we do not use water efficiently, and many industrial and food processes leave contamination in water that is potentially toxic and difficult to remove. Nanofiltration may provide the solution to these problems, and may also offer new routes to the desalination of brackish water and groundwater in some parts of the world.</p>\n<p><strong>F</strong> Food production and processing are becoming more important as the world’s population increases. There are concerns that potentially harmful nano-products might enter the body via the gut. Such concerns are being addressed, but it is even more important to ask questions about how nanotechnology might increase the nutritious yield of food and be adapted to help preserve and package food. There is already evidence to show that it might also be helpful in the primary production of raw food materials, by way of better delivery of pesticides in the field and better extraction of protein and carbohydrates.</p>\n<p><strong>G</strong> Healthcare is an area where the application of nanotechnology is already exceeding the expectations of ten years ago. It is happening across several fronts: better appreciation of what the ‘natural’ nanoparticles circulating in body fluid do; better methods of delivering drugs to the body via nanoparticles that target the diseased body part; improvements to the diagnostic imaging techniques of ultrasound, magnetic resonance imaging and X-ray computerised tomography. We are now at the threshold of a new subject, ‘theranostics’, whereby nanoparticles will first deliver the diagnostic information to the clinician and then, using the same particle, deliver a form of therapy.</p>\n<p><strong>H</strong> Nanotechnology is a life-changing technology, making the quality of life better, enabling us to make use of our resources more effectively, thereby protecting our environment, and creating new business opportunities. There are many other examples in the world of ‘new materials’ that also make use of nanotechnology. The possibilities may well be limitless.</p>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
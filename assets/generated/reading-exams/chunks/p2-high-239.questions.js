@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-239", "questions", {"questionGroups":[{"groupId":"group-1","kind":"summary_completion","questionIds":["q1","q2","q3"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-anchor\"><h4>Questions 14-16</h4><p>Complete the summary below.</p><p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p><h5>Nanotechnology</h5><p>In the same way that a child may use <strong>14</strong> <input class=\"blank\" name=\"q1\" type=\"text\">, scientists are now able to create new structures by combining the smallest particles known to man. We can fully appreciate the microscopic scale of this work by comparing the exact <strong>15</strong> <input class=\"blank\" name=\"q2\" type=\"text\"> of one atom with that of a single human hair.</p><p>A lot of today’s electronic consumer goods, such as lasers, have components that are microscopic in size. They are not the only products relying on nanotechnology. For example, a long-lasting <strong>16</strong> <input class=\"blank\" name=\"q3\" type=\"text\">, widely available today, relies on minute nanoparticles for its effectiveness. This was developed in the 1990s as a result of concerns about the safety of existing products.</p></div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q4","q5","q6","q7","q8","q9"],"allowOptionReuse":false,"bodyHtml":"<div class=\"group\" id=\"q4-5-6-7-8-9-anchor\"><h4>Questions 17-22</h4><p>Reading Passage 2 has eight paragraphs, A-H.</p><p>Which paragraph contains the following information?</p><div class=\"match-question-item\" id=\"q4-anchor\"><p><strong>17</strong> a comparison between two of the world’s vital natural resources</p><div class=\"match-dropzone\" data-question=\"q4\"></div></div><div class=\"match-question-item\" id=\"q5-anchor\"><p><strong>18</strong> a mention of how nanotechnology could be dangerous for humans</p><div class=\"match-dropzone\" data-question=\"q5\"></div></div><div class=\"match-question-item\" id=\"q6-anchor\"><p><strong>19</strong> a claim that nanotechnology has influenced modern authors</p><div class=\"match-dropzone\" data-question=\"q6\"></div></div><div class=\"match-question-item\" id=\"q7-anchor\"><p><strong>20</strong> a reference to the fact that nanotechnology is achieving more than was anticipated a decade ago</p><div class=\"match-dropzone\" data-question=\"q7\"></div></div><div class=\"match-question-item\" id=\"q8-anchor\"><p><strong>21</strong> a suggestion that nanotechnology could provide financial as well as ecological benefits</p><div class=\"match-dropzone\" data-question=\"q8\"></div></div><div class=\"match-question-item\" id=\"q9-anchor\"><p><strong>22</strong> an acknowledgement that more time is required to realise some of nanotechnology’s potential</p><div class=\"match-dropzone\" data-question=\"q9\"></div></div><div class=\"options-pool\"><div class=\"pool-items\"><div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A</div><div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B</div><div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C</div><div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D</div><div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E</div><div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F</div><div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G</div><div class=\"drag-item\" draggable=\"true\" data-option=\"H\">H</div></div></div></div>"},{"groupId":"group-3","kind":"multi_choice","questionIds":["q10","q11"],"bodyHtml":"<div class=\"group\" id=\"q10-11-anchor\"><h4>Questions 23 and 24</h4><p>Choose <strong>TWO</strong> letters, A-E.</p><p>Which TWO of the following statements does the writer make about nanotechnology and energy resources?</p><div class=\"checkbox-options\" data-group=\"q10_11\" data-limit=\"2\"><div class=\"choice-item\"><label><input type=\"checkbox\" name=\"q10_11\" value=\"A\"> <strong>A</strong> Nanotechnology means that solar energy will replace fossil fuel energy.</label></div><div class=\"choice-item\"><label><input type=\"checkbox\" name=\"q10_11\" value=\"B\"> <strong>B</strong> We have made solar batteries for the first time by applying nanotechnology.</label></div><div class=\"choice-item\"><label><input type=\"checkbox\" name=\"q10_11\" value=\"C\"> <strong>C</strong> Further research is needed to turn nanotechnology into practical energy solutions.</label></div><div class=\"choice-item\"><label><input type=\"checkbox\" name=\"q10_11\" value=\"D\"> <strong>D</strong> Nanotechnology is being used to remove dangerous gases from the atmosphere.</label></div><div class=\"choice-item\"><label><input type=\"checkbox\" name=\"q10_11\" value=\"E\"> <strong>E</strong> Nanotechnology has helped create cheaper sources of energy.</label></div></div></div>"},{"groupId":"group-4","kind":"multi_choice","questionIds":["q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q12-13-anchor\"><h4>Questions 25 and 26</h4><p>Choose <strong>TWO</strong> letters, A-E.</p><p>In which TWO ways does the writer think nanotechnology could improve food production?</p><div class=\"checkbox-options\" data-group=\"q12_13\" data-limit=\"2\"><div class=\"choice-item\"><label><input type=\"checkbox\" name=\"q12_13\" value=\"A\"> <strong>A</strong> by enabling crops to grow faster</label></div><div class=\"choice-item\"><label><input type=\"checkbox\" name=\"q12_13\" value=\"B\"> <strong>B</strong> by keeping food fresh for longer</label></div><div class=\"choice-item\"><label><input type=\"checkbox\" name=\"q12_13\" value=\"C\"> <strong>C</strong> by making food tastier</label></div><div class=\"choice-item\"><label><input type=\"checkbox\" name=\"q12_13\" value=\"D\"> <strong>D</strong> by protecting food from insects better</label></div><div class=\"choice-item\"><label><input type=\"checkbox\" name=\"q12_13\" value=\"E\"> <strong>E</strong> by increasing the variety of food</label></div></div></div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-25", "answers", {"answerKey":{"q1":"B","q2":"G","q3":"E","q4":"C","q5":"A","q6":"D","q7":"A","q8":"C","q9":"A","q10":"B","q11":"ageing","q12":"lifespan","q13":"conflict"}});
+})(typeof window !== "undefined" ? window : globalThis);
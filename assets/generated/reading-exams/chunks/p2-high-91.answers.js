@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-91", "answers", {"answerKey":{"q1":"C","q2":"G","q3":"D","q4":"A","q5":"B","q6":"C","q7":"B","q8":"F","q9":"A","q10":"E","q11":"reefs","q12":"parasites","q13":"prey"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-91", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-high-91","meta":{"title":"Australia’s camouflaged creatures 澳洲伪装生物","category":"P2","frequency":"high","pdfFilename":"180. P2 - Australia’s camouflaged creatures 澳洲伪装生物.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/180. P2 - Australia’s camouflaged creatures 澳洲伪装生物【高】/","legacyFilename":"180. P2 - Australia’s camouflaged creatures 澳洲伪装生物.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/180. P2 - Australia’s camouflaged creatures 澳洲伪装生物【高】/180. P2 - Australia’s camouflaged creatures 澳洲伪装生物.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/180. P2 - Australia’s camouflaged creatures 澳洲伪装生物【高】/180. P2 - Australia’s camouflaged creatures 澳洲伪装生物.pdf","ieltsHtml":"IELTS/P2/Australia's camouflaged creatures.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.174Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
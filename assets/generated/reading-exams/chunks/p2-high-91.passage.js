@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-91", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Australia's Camouflaged Creatures</h3>\n<p>Many species of animal in Australia protect themselves by using camouflage — a way of ‘hiding’ by blending into the surroundings.</p>\n<p><strong>A</strong> Most species use camouflage to some extent. If they are convincing, they survive to pass their genes on to future generations. After generations of natural selection, animals can develop astonishingly complex camouflage techniques, manipulating shape, colour and movement. ‘The principle of camouflage is to make it economically unviable for a predator to pursue a particular species of prey,’ explains Professor Mark Elgar of the University of Melbourne. ‘Camouflage increases the search time and, as a consequence, the predator will simply target another species, either because it doesn’t see the camouflaged individual or it just finds something more obvious to do.’</p>\n<p><strong>B</strong> The easiest way for an animal to disguise itself is to be invisible in its surroundings. To that end, stick and leaf insects have evolved complex camouflage to hide themselves from predators. Many have the texture of sticks or dry leaves, while others imitate living foliage, even the veins in a leaf. Some insects develop blemishes to match the spots caused by disease. A convincing appearance only works if its owner also acts the part, so during the day the creature using this type of camouflage keeps motionless, or sways like a dead leaf in the breeze. If disturbed, it falls to the ground and stays still. Entomologist Paul Zborowski, who has spent decades photographing inconspicuous creatures, rates the desert insects of Central Australia as the most convincingly disguised creatures he’s seen. ‘It’s an incredibly old habitat, so the creatures have had a long time to adapt,’ Zborowski explains. Most of them behave like stones and don’t move all day, feeding only at night.</p>\n<p><strong>C</strong> A tawny frogmouth sitting motionless on a stump also illustrates the importance of pairing a persuasive costume with behaviour. Professor Gisela Kaplan of the University of New England in Australia says the frogmouth’s skill at camouflaging is learned behaviour. While adopting a pose may be a reflex of the bird, and can be observed in a hatchling’s first week, the ability to choose a backdrop which matches its colouration does not develop for 4–6 months. When the chicks land, they are usually highly conspicuous, and their parents try to signal to them to move to a safe location.</p>\n<p><strong>D</strong> Fixed camouflage is only good against a relatively unchanging environment, so some animals, such as the cuttlefish, have evolved an adaptable disguise. The cuttlefish can almost instantly change its colour, pattern and texture to match its surroundings, using specialised cells and muscles. On Queensland’s reefs, scientists have been studying another ocean dweller that uses colour change, although not to blend into the surroundings. Dr Karen Cheney, from the University of Queensland, says the bluestriped fangblenny alters its colouration to mimic other species of fish, allowing it to travel with them and benefit from safety in numbers. Its most impressive impersonation is of the black-with-neon-blue-striped cleaner wrasse, which eats the parasites on larger fish. Not only does the fangblenny benefit from the reduced predation that comes with the wrasse’s beneficial relationships with other fish, but the disguise also lets it get closer to prey. It darts out from the safety of the wrasse’s cleaning station to nip at unsuspecting fish passing by, but it doesn’t attack those coming to be cleaned.</p>\n<p><strong>E</strong> The most famous form of mimicry, however, is for defence, not attack. Batesian mimicry refers to animals that gain protection from predators by imitating a dangerous organism, often using conspicuous colours. The nineteenth-century naturalist Henry Bates first suggested this camouflage technique after noticing that several Amazonian butterfly species looked the same. The technique was later called after him. In Australian waters, the harmless harlequin snake eel sports the same black and white bandings as the highly toxic yellow-lipped sea krait, ensuring no predator will attack. However, the success of Batesian mimicry depends on the ratio of mimics to originals. If a predator encounters too many that are edible, it will just assume none of the animals with those markings are dangerous, explains Martyn Robinson, an educational naturalist with the Australian Museum.</p>\n<p><strong>F</strong> An imitation of a more dangerous creature needn’t be exact, just enough to make potential predators hesitate. The hawk moth caterpillar has markings resembling a snake’s eyes on its abdomen. When confronted, the caterpillar pulls its head in and the ‘eyes’ flash open. Whether the potential predator thinks it has seen a snake, or is simply startled, is unclear, but the outcome is that the caterpillar lives to see another day.</p>\n<p><strong>G</strong> In Queensland’s tablelands, the chameleon gecko has another way of making predators hesitate. Its body is brown, but its tail is banded in black and white. Robinson explains that if attacked, the chameleon gecko will drop off its tail, which will wriggle around on the ground. Many lizards do this, but in the case of the chameleon gecko the tail bones actually rub against one another, so it squeaks. ‘The predator is, of course, thoroughly absorbed by this black-and-white-striped, wriggling, squeaking thing on the ground, and the gecko can sneak away,’ Robinson says. It’s a one-time-only trick: the regrown tail is brown, the same as the gecko’s body. Such precise disguise and elaborate trickery illustrate the limitless possibilities of nature. But, as Robinson points out, only the most successful illusionists are here to tell the tale.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
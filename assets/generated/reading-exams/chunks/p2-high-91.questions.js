@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-high-91", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 14–18</h4>\n<p>Reading Passage 2 has seven sections, <strong>A–G</strong>.</p>\n<p>Which section contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–G</strong>, in boxes 14–18 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 200px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> a species that indicates to its young to move to a place where they are less visible</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> an instance where sound is used to help an animal escape</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> a creature that can use camouflage to match a range of different backgrounds</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> a claim that the majority of animals disguise themselves in some way</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>18</strong> examples of animals that use camouflage to look like plants</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q6","q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-10-anchor\">\n<h4>Questions 19–23</h4>\n<p>Look at the following statements (Questions 19–23) and the list of people below.</p>\n<p>Match each statement with the correct person, <strong>A–F</strong>.</p>\n<p><em>Write the correct letter, <strong>A–F</strong>, in boxes 19–23 on your answer sheet.</em></p>\n<div class=\"match-question-item\">\n<p><strong>19</strong> one species has a camouflage tactic that is not present from birth.</p>\n<div class=\"match-dropzone\" data-question=\"q6\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>20</strong> species that live in an ancient environment have become very effective at camouflaging themselves.</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>21</strong> part of an animal is left behind to distract predators.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> if it takes too long to find one kind of prey, animals will look for an alternative source of food.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> camouflage can involve copying a threatening type of animal.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"options-pool\" id=\"researcher-options-pool\">\n<strong>List of people</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"person-A\" draggable=\"true\" data-option=\"A\">A Professor Mark Elgar</div>\n<div class=\"drag-item\" id=\"person-B\" draggable=\"true\" data-option=\"B\">B Paul Zborowski</div>\n<div class=\"drag-item\" id=\"person-C\" draggable=\"true\" data-option=\"C\">C Professor Gisela Kaplan</div>\n<div class=\"drag-item\" id=\"person-D\" draggable=\"true\" data-option=\"D\">D Dr Karen Cheney</div>\n<div class=\"drag-item\" id=\"person-E\" draggable=\"true\" data-option=\"E\">E Henry Bates</div>\n<div class=\"drag-item\" id=\"person-F\" draggable=\"true\" data-option=\"F\">F Martyn Robinson</div>\n</div>\n</div>\n</div>","allowOptionReuse":false},{"groupId":"group-3","kind":"summary_completion","questionIds":["q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>The bluestriped fangblenny</h4>\n<p>\nDr Karen Cheney studies the bluestriped fangblenny on <strong>24</strong> <input name=\"q11\" type=\"text\" id=\"q24_input\"> off Queensland's coast. She found that the fangblenny was able to make itself resemble other fish by adjusting its colouration. The fangblenny impersonates the striped cleaner wrasse, a fish that is welcomed by other species as it gets rid of their <strong>25</strong> <input name=\"q12\" type=\"text\" id=\"q25_input\">. The fangblenny can approach its <strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\"> without drawing the attention of predators or disturbing the work of the striped cleaner wrasse.\n</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-051", "answers", {"answerKey":{"q1":"E","q2":"D","q3":"C","q4":"B","q5":"F","q6":"A","q7":"D","q8":"D","q9":"A","q10":"B","q11":"Tasmanian tiger","q12":"rabbits","q13":"overpopulation"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-051", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-051","meta":{"title":"The dingo debate 澳洲野犬_澳洲野狗","category":"P2","frequency":"low"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-051", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"text","bodyHtml":"<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>The dingo debate</h3>\n<p><em>Graziers see them as pests, and poisoning is common, but some biologists think Australia’s dingoes are the best weapon in a war against imported cats and foxes.</em></p>\n<span class=\"paragraph-label\">A</span>\n<p>A plane flies a slow pattern over Carlton Hill station, a 3,600 square kilometre ranch in the Kimberley region in northwest Australia. As the plane circles, those aboard drop 1,000 small pieces of meat, one by one, onto the scrubland below, each piece laced with poison; this practice is known as baiting.</p>\n<p>Besides 50,000 head of cattle, Carlton Hill is home to the dingo, Australia’s largest mammalian predator and the bane of a grazier’s (cattle farmer’s) life. Stuart McKechnie, manager of Carlton Hill, complains that graziers’ livelihoods are threatened when dingoes prey on cattle. But one man wants the baiting to end, and for dingoes to once again roam Australia’s wide-open spaces. According to Chris Johnson of James Cook University, \"Australia needs more dingoes to protect our biodiversity.\"</p>\n<span class=\"paragraph-label\">B</span>\n<p>About 4,000 years ago, Asian sailors introduced dingoes to Australia. Throughout the ensuing millennia, these descendants of the wolf spread across the continent and, as the Tasmanian tiger disappeared completely from Australia, dingoes became Australia’s top predators. As agricultural development took place, the European settlers found that they could not safely keep their livestock where dingoes roamed. So began one of the most sustained efforts at pest control in Australia’s history. Over the last 150 years, dingoes have been shot and poisoned, and fences have been used in an attempt to keep them away from livestock. But at the same time, as the European settlers tried to eliminate one native pest from Australia, they introduced more of their own.</p>\n<span class=\"paragraph-label\">C</span>\n<p>In 1860, the rabbit was unleashed on Australia by a wealthy landowner and by 1980 rabbits had covered most of the mainland. Rabbits provide huge prey base for two other introduced species: the feral (wild) cat and the red fox.</p>\n<p>The interaction between foxes, cats and rabbits is a huge problem for native mammals. In good years, rabbit numbers increase dramatically, and fox and cat populations grow quickly in response to the abundance of this prey. When bad seasons follow, rabbit numbers are significantly reduced – and the dwindling but still large fox and cat populations are left with little to eat besides native mammals.</p>\n<span class=\"paragraph-label\">D</span>\n<p>Australian mammals generally reproduce much more slowly than rabbits, cats and foxes – an adoption to prevent overpopulation in the arid environment, where food can be scarce and unreliable – and populations decline because they can’t grow fast enough to replace animals killed by the predators. Johnson says dingoes are the solution to this problem because they keep cat and fox populations under control. Besides regularly eating the smaller predators, dingoes will kill them simply to lessen competition.</p>\n<p>Dingo packs live in large, stable territories and generally have only one fertile female, which limits their rate of increase. In the 4,000 years that dingoes have been Australia, they have contributed to few, if any, extinctions, Johnson says.</p>\n<span class=\"paragraph-label\">E</span>\n<p>Reaching out from a desolate spot where three states meet, for 2,500 km in either direction, is the world’s longest fence, two meters high and stretching from the coast in Queensland to the Great Australian Bight in South Australia; it is there to keep dingoes out of southeast, the fence separates the main types of livestock found in Australia. To the northwest of the fence, cattle predominate; to the southwest, sheep fill the landscape. In fact, Australia is a land dominated by these animals – 25 million cattle, 100 million sheep and just over 20 million people.</p>\n<span class=\"paragraph-label\">F</span>\n<p>While there is no argument that dingoes will prey on sheep if given the chance, they don't hunt cattle once the calves are much past two or three weeks old, according to McKechnie. And a study in Queensland suggests that dingoes don't even prey heavily on the newborn calves unless their staple prey disappears due to deteriorating conditions like drought.</p>\n<p>This study, co-authored by Lee Allen of the Robert Wicks Research Centre in Queensland, suggests that the aggressive baiting programs used against dingoes may actually be counter-productive for graziers. When dingoes are removed from an area by baiting, the area is recolonized by younger, more solitary dingoes. These animals aren't capable of going after large prey like kangaroos, so they turn to calves. In their study, some of the highest rates of calf predation occurred in areas that had been baited.</p>\n<span class=\"paragraph-label\">G</span>\n<p>Mark Clifford, general manager of a firm that manages over 200,000 head of cattle, is not convinced by Allen's assertion. Clifford says, \"It's obvious if we drop or loosen control on dingoes, we are going to lose more calves.\" He doesn't believe that dingoes will go after kangaroos when calves are around. Nor is he persuaded of dingoes' supposed ecological benefits, saying he is not convinced that they manage to catch cats that often, believing they are more likely to catch small native animals instead.</p>\n<span class=\"paragraph-label\">H</span>\n<p>McKechnie agrees that dingoes kill the wallabies (small native animals) that compete with his cattle for food, but points out that in parts of Western Australia, there are no foxes, and not very many cats. He doesn't see how relaxing controls on dingoes in his area will improve the ecological balance.</p>\n<p>Johnson sees a need for a change in philosophy on the part of graziers. \"There might be a number of different ways of thinking through dingo management in cattle country,\" he says. \"At the moment, though, that hasn't got through to graziers. There's still just one prescription, and that is to bait as widely as possible.\"</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-06", "answers", {"answerKey":{"q1":"G","q2":"E","q3":"C","q4":"B","q5":"C","q6":"C","q7":"E","q8":"B","q9":"D","q10":"B","q11":"mound","q12":"water","q13":"fans"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-06", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-06","meta":{"title":"Biomimicry 仿生学","category":"P2","frequency":"low","pdfFilename":"103. P2 - Biomimicry 仿生学.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/103. P2 - Biomimicry 仿生学/","legacyFilename":"103. P2 - Biomimicry 仿生学.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/103. P2 - Biomimicry 仿生学/103. P2 - Biomimicry 仿生学.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/103. P2 - Biomimicry 仿生学/103. P2 - Biomimicry 仿生学.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-11T14:43:21.995Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-06", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Biomimicry</h3>\n<p><strong>A</strong> Velcro, now commonly used instead of buttons and zippers, is probably the most famous example of ‘biomimicry', where technologists turn to nature for inspiration. In 1948, scientist Georges de Mestral was walking through long grass when he noticed that dozens of seeds had attached themselves to his trousers. Under a microscope, de Mestral noted the hook-and-loop system the seed cases used to stick so firmly, and was inspired.</p>\n<p><strong>B</strong> US biologist Janine Benyus wrote a book on the subject called Biomimicry: Innovation Inspired by Nature. Published in 1997, the book set off the current wave of technology modelled on nature. According to Benyus, our ancestors were practised in the art of biomimicry. 'I think it's an old impulse for humans to take their cues from other organisms,' she says, referring to African tribes that found edible plants by observing the dining habits of chimpanzees. But lately we've become more focused on what we can make ourselves. Benyus thinks our drift away from nature started with the advent of agriculture: ‘When we broke free from the challenges of hunting and gathering and learnt to stock our cupboards, we fooled ourselves into believing that we didn't need other organisms at all,' she says.</p>\n<p><strong>C</strong> The scientific, industrial, petrochemical and genetic engineering revolutions have repeatedly reinforced the idea that we are liberated from biological constraints. In recent years, however, the illusion that we are independent of nature has been shattered by the spectre of global warming and the looming end to fossil fuel supplies. Since few of us would be willing to forgo the products and services we've grown accustomed to – food, water, shelter, the conveniences that modern technology brings – the challenge is to meet the complex demands of civilisation within the bounds of sustainability. ‘Nature has learnt to fly, live in the depths of the ocean and craft miracle materials,' writes Benyus. ‘Living creatures have done everything we want to do, without guzzling fossil fuel or polluting the planet. What better models could there be?'</p>\n<p><strong>D</strong> There are no better models, according to Tim Finnigan, a marine engineer at the University of Sydney. In his quest to harness the world's waves and tides for renewable energy more efficiently, Finnigan has taken his cues from aquatic life. With their streamlined bodies and stiff, high tail fins, sharks convert up to 90 per cent of their body energy into forward thrust. Inspired by such efficient hydrodynamics, but turning the theory on its head, Finnigan designed his tidal stream generator: an 18-metre-long biomimetic shark tail with a fin spanning 15 metres. ‘Rather than have a body moving through a stationary fluid, we have fluid that's moving past a stationary body,' says Finnigan.</p>\n<p><strong>E</strong> Then there's Finnigan's biomimetic forest of giant seaweed. ‘As a diver I've looked at the way motions occur under water in the presence of waves,' he says. 'I see plants that move quite dramatically and yet they never seem to be pulled out, even in the most dramatic waves.' The trouble with conventional designs, according to Finnigan, is that they're made to stand rigidly against the power of the ocean. ‘The structures we try to build in the ocean just never end up being strong enough to survive out there,' says Finnigan. In the manner of aquatic plants and animals, Finnigan's designs respond to changing current or wave conditions by reorienting to maximise energy capture. And in severe weather, to avoid a battering, his wave energy generator will lie flat against the ocean floor.</p>\n<p><strong>F</strong> While conventional architects were designing buildings dependent on expensive air conditioning systems, when Mick Pearce tried to do the same, he struck a problem. 'We were building office blocks for a client in Zimbabwe and we ran out of funds. So we looked for ways to make a building without traditional air conditioning.' One day, driving through the grasslands, he saw a large mound created by termites, the ant-like insect common in Africa. He noticed that air entering at the base of the mound was mixed with water drawn from subterranean levels by the termites, causing evaporative cooling. Pearce wanted to reproduce this principle but he needed an alternative system, and in his building massive fans were employed at the base of the structure to lower the temperature of the circulating air. Pearce's termite-inspired cooling system cut energy use to 10 per cent of a similar air-conditioned building.</p>\n<p><strong>G</strong> Photosynthesis is the process by which green plants use energy from the sun to convert water and carbon dioxide into carbohydrates and oxygen. Plants can manage it with humbling ease. But, as the 40 researchers from 11 institutes who have collaborated to form the Australian Artificial Photosynthesis Network have realised, it is very complex. However, there is one aspect working in our favour. In nature, environmental variables like temperature, carbon dioxide and light availability limit the rate of photosynthesis. In a laboratory these variables can be optimized. ‘We don't have to cope with drought or frost. We can work with a highly controlled, specified set of conditions,' says Tom Collings, the group's spokesman.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
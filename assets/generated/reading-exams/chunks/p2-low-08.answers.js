@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-08", "answers", {"answerKey":{"q1":"D","q2":"F","q3":"A","q4":"C","q5":"F","q6":"B","q7":"C","q8":"A","q9":"D","q10":"B","q11":"A","q12":"B","q13":"sticking","q14":"dimensions","q15":"structure","q16":"species"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-08", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5","q6","q14","q15","q16"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has six sections, <strong>A–F</strong>.</p>\n<p>Which section contains the following information?</p>\n<p><em>Write the correct letter, A–F, in the boxes for 14-19.</em></p>\n<p><strong>NB</strong> You may use any letter more than once.</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 250px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> a description of an experiment involving both human and non-human cells of a specific type</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> possibilities for improved research into various medical conditions</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> contrasting views of the importance of the Petri dish</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> a change remarked on by one scientist in the material used for the Petri dish</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>18</strong> a claim that the Petri dish enables a scientist to monitor the progress of an experiment on a regular basis</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>19</strong> a reference to the importance of a material for different types of laboratory equipment</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q7","q8","q9","q10","q11","q12"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-11-12-anchor\">\n<h4>Questions 20–25</h4>\n<p>Look at the following statements (Questions 20–25) and the list of people below.</p>\n<p>Match each statement with the correct person, <strong>A, B, C or D</strong>.</p>\n<div class=\"match-question-item\">\n<p><strong>20</strong> To deal with the injury, cells must go through a series of activities in a particular order.</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>21</strong> One technological development formed the basis of all modern scientific research.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> A modification to the Petri dish allows experiments to provide more accurate information.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> Petri dishes allow observation of medical conditions that are normally impossible to observe.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>24</strong> Visual evidence is a very important requirement for the provision of reliable information.</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>25</strong> Petri dishes can be used to help produce a range of new cells of many different kinds.</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"options-pool\" id=\"researcher-options-pool\">\n<strong>List of People</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"researcher-A\" draggable=\"true\" data-option=\"A\">A Alan Macfarlane</div>\n<div class=\"drag-item\" id=\"researcher-B\" draggable=\"true\" data-option=\"B\">B Professor Ludovic Vallier</div>\n<div class=\"drag-item\" id=\"researcher-C\" draggable=\"true\" data-option=\"C\">C Dr Meritxell Huch</div>\n<div class=\"drag-item\" id=\"researcher-D\" draggable=\"true\" data-option=\"D\">D Dr Madeline Lancaster</div>\n</div>\n</div>\n</div>","allowOptionReuse":true},{"groupId":"group-3","kind":"summary_completion","questionIds":["q13","q14","q15","q16"],"bodyHtml":"<div class=\"group\" id=\"q13-14-15-16-anchor\">\n<h4>Questions 26–29</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h5>Research in the MRC Lab of Molecular Biology</h5>\n<p>\nA team led by Dr Madeline Lancaster is using special Petri dishes which prevent brain cells from <strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\"> to them. The aim is to allow the neurons to grow in three <strong>27</strong> <input name=\"q14\" type=\"text\" id=\"q27_input\">. This results in a <strong>28</strong> <input name=\"q15\" type=\"text\" id=\"q28_input\"> that resembles a developing brain. The technology could help scientists study how neuron production varies in different <strong>29</strong> <input name=\"q16\" type=\"text\" id=\"q29_input\">, leading to possibilities for increased medical knowledge.\n</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14","q15","q16"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26","q14":"27","q15":"28","q16":"29"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-102", "answers", {"answerKey":{"q1":"D","q2":"B","q3":"C","q4":"G","q5":"E","q6":"physical health","q7":"brain scans","q8":"disabled","q9":"walking","q10":"C","q11":"B","q12":"A","q13":"B"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-102", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 14–18</h4>\n<p>Reading Passage 2 has nine paragraphs, <strong>A–I</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–I</strong>, in boxes 14–18 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 200px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th><th>I</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> a reference to studies involving children</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td><td><input type=\"radio\" name=\"q1\" value=\"I\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> a mention of the discovery of significant artefacts</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td><td><input type=\"radio\" name=\"q2\" value=\"I\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> reasons why a particular aspect of music has not been researched</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td><td><input type=\"radio\" name=\"q3\" value=\"I\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> a mention of an unexpected discovery involving two different areas of the brain</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td><td><input type=\"radio\" name=\"q4\" value=\"I\"></td>\n</tr>\n<tr>\n<td><strong>18</strong> a comparison of tone variations produced by certain animals and humans</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td><td><input type=\"radio\" name=\"q5\" value=\"I\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 19–22</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<p>A study involving collaboration between researchers in Oxford and Montreal. The participants in this study led by Dr Chen were chosen because they were not musicians, and they demonstrated a good state of <strong>19</strong> <input name=\"q6\" type=\"text\" id=\"q19_input\">. The participants were given <strong>20</strong> <input name=\"q7\" type=\"text\" id=\"q20_input\"> while music with a very noticeable rhythm was being played. Previous research had indicated that listening to this type of music seemed to be of assistance to some <strong>21</strong> <input name=\"q8\" type=\"text\" id=\"q21_input\"> people. By listening to it, their <strong>22</strong> <input name=\"q9\" type=\"text\" id=\"q22_input\"> ability had definitely got better. The findings of Dr Chen's study proved most informative.</p>\n</div>\n</div>"},{"groupId":"group-3","kind":"matching","questionIds":["q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<h4>Questions 23–26</h4>\n<p>Look at the following statements (Questions 23–26) and the list of researchers below.</p>\n<p>Match each statement with the correct researcher, <strong>A, B</strong> or <strong>C</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>23</strong> Research into the brain activity set off by music may help people with speech defects.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>24</strong> It may be possible in time to improve a person's ability to recognise certain musical characteristics.</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>25</strong> The way listeners react to certain musical combinations may be similar to the way they react to other noises.</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>26</strong> When a person reacts positively to music, the same parts of the brain are stimulated as when certain animals react to a positive outcome.</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div class=\"options-pool\" id=\"researcher-options-pool\">\n<strong>List of researchers</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Professor Norman Cook</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Professor Robert Zatorre</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Dr Joyce Chen</div>\n</div>\n</div>\n</div>","allowOptionReuse":true}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
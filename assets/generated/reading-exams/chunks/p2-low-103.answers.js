@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-103", "answers", {"answerKey":{"q1":"vi","q2":"vii","q3":"viii","q4":"x","q5":"i","q6":"ix","q7":"v","q8":"yellow fever epidemic","q9":"Finland","q10":"einkorn wheat","q11":"Eurasia","q12":"Singapore","q13":"administrative systems"}});
+})(typeof window !== "undefined" ? window : globalThis);
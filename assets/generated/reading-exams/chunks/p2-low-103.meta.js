@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-103", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-103","meta":{"title":"The economic effect of climate 气候对经济的影响","category":"P2","frequency":"low","pdfFilename":"191. P2 - The economic effect of climate 气候对经济的影响.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/191. P2 - The economic effect of climate 气候对经济的影响/","legacyFilename":"191. P2 - The economic effect of climate 气候对经济的影响.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/191. P2 - The economic effect of climate 气候对经济的影响/191. P2 - The economic effect of climate 气候对经济的影响.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/191. P2 - The economic effect of climate 气候对经济的影响/191. P2 - The economic effect of climate 气候对经济的影响.pdf","ieltsHtml":"IELTS/P2/The economic effect of climate.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.199Z","notes":"signature:text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
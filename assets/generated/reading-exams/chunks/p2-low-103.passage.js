@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-103", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>The economic effect of climate</h2>\n<h4>Latitude is crucial to a nation's strength, says Anjana Ahuja</h4>\n<div class=\"paragraph-wrapper\" id=\"para-a-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"A\" id=\"q1-dropzone\" data-question=\"q1\">\n<span class=\"paragraph-label\">Paragraph A (Q14):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> Dr William Masters was reading a book about mosquitoes when an idea struck him. ‘There was this anecdote about the yellow fever epidemic that hit Philadelphia in 1793,’ Masters recalls. ‘This epidemic decimated the city until the first frost came.’ The sub-zero temperatures froze out the insects, allowing Philadelphia to recover. If weather could be the key to a city’s fortunes, Masters thought, then why not to the historical fortunes of nations? And could frost lie at the heart of one of the most enduring economic mysteries of all – why are almost all the wealthy, industrialised nations to be found where the climate is cooler?</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-b-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"B\" id=\"q2-dropzone\" data-question=\"q2\">\n<span class=\"paragraph-label\">Paragraph B (Q15):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> After two years of research, he thinks that he has found a piece of the puzzle. Masters, an agricultural economist from Purdue University in Indiana, and Margaret McMillan at Tufts University, Boston, show that annual frosts are among the factors that distinguish rich nations from poor ones. Their study is published this month in the <em>Journal of Economic Growth</em>. The pair speculate that cold snaps have two main benefits – they freeze pests that would otherwise destroy crops, and also freeze organisms, such as those carried by mosquitoes, that carry disease. The result is agricultural abundance and a big workforce.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-c-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"C\" id=\"q3-dropzone\" data-question=\"q3\">\n<span class=\"paragraph-label\">Paragraph C (Q16):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> The academics took two sets of information. The first was average income for countries, the second was climate data provided by the University of East Anglia. They found a curious tally between the sets. Countries having five or more frosty days in the winter months are uniformly rich; those with fewer than five are impoverished. The authors speculate that the five-day figure is important: it could be the minimum time needed to kill pests in the soil. To illustrate this, Masters notes: ‘Finland is a small country that is growing quickly, but Bolivia is a small country that isn't growing at all. Perhaps climate has something to do with that.'</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-d-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"D\" id=\"q4-dropzone\" data-question=\"q4\">\n<span class=\"paragraph-label\">Paragraph D (Q17):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> Other minds have applied themselves to the split between poor and rich nations, citing anthropological, climatic and zoological reasons for why temperate nations are the most affluent. Jared Diamond, from the University of California at Los Angeles, pointed out in his book <em>Guns, Germs and Steel</em> that Eurasia is broadly aligned east-west, while Africa and the Americas are aligned north-south. So in Europe crops could move quickly across latitudes because climates are similar. One of the first domesticated crops, einkorn wheat, extended quickly from the Middle East into Europe; it took twice as long for it to get from Mexico to what is now the eastern United States. This easy movement along similar latitudes in Eurasia would also have meant a faster dissemination of other technologies, such as the wheel and writing, Diamond speculates.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-e-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"E\" id=\"q5-dropzone\" data-question=\"q5\">\n<span class=\"paragraph-label\">Paragraph E (Q18):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> There are exceptions to the ‘cold equals rich’ argument. There are well-heeled tropical countries such as Singapore, a result of its superior trading position. Likewise, not all European countries are moneyed. Masters stresses that climate will never be the overriding factor – the wealth of nations is too complicated to be attributable to just one factor. Climate, he feels, somehow combines with other factors – such as the presence of institutions, including governments, and access to trading routes – to determine whether a country will do well.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-f-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"F\" id=\"q6-dropzone\" data-question=\"q6\">\n<span class=\"paragraph-label\">Paragraph F (Q19):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> In the past, Masters says, economists thought that institutions had the biggest effect on the economy, because they brought order to a country in the form of, for example, laws and property rights. With order, so the thinking went, came affluence. 'But there are some problems that even countries with institutions have not been able to get around,' he says. 'My feeling is that, as countries get richer, they get better institutions. And the accumulation of wealth and improvement in governing institutions are both helped by a favourable environment, including climate.'</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-g-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"G\" id=\"q7-dropzone\" data-question=\"q7\">\n<span class=\"paragraph-label\">Paragraph G (Q20):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>G</strong> This does not mean, he insists, that tropical countries are beyond economic help and destined to remain penniless. Instead of aid being geared towards improving administrative systems, it should be spent on technology to improve agriculture and to combat disease. Masters cites one example: 'There are regions in India that have been provided with irrigation – agricultural productivity has gone up and there has been an improvement in health.' Supplying vaccines against tropical diseases and developing crop varieties that can grow in the tropics would break the poverty cycle.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
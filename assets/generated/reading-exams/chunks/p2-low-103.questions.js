@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-103", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 14–20</h4>\n<p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\"><span class=\"heading-num\">i</span> Levels of wealth affected by several other influences besides climate</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\"><span class=\"heading-num\">ii</span> The failure of vaccination programmes</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\"><span class=\"heading-num\">iii</span> The problems experienced by small countries</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\"><span class=\"heading-num\">iv</span> The role of governments in creating wealth</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\"><span class=\"heading-num\">v</span> The best use of financial assistance</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\"><span class=\"heading-num\">vi</span> The inspiration for Masters's research</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\"><span class=\"heading-num\">vii</span> The advantages of cold weather to people and agriculture</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\"><span class=\"heading-num\">viii</span> Positive correlations between climate and economy</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\"><span class=\"heading-num\">ix</span> Reflecting on the traditional view</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"x\"><span class=\"heading-num\">x</span> Crop spread in Europe and other continents</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Questions 21–26</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>NO MORE THAN THREE WORDS</strong> from the passage for each answer.</p>\n<div class=\"completion-item\">\n<p><strong>21</strong> Philadelphia recovered from its <input type=\"text\" id=\"q8\" name=\"q8\"> when the temperature dropped dramatically.</p>\n<p><strong>22</strong> <input type=\"text\" id=\"q9\" name=\"q9\"> is an example of a small country whose economy is expanding.</p>\n<p><strong>23</strong> <input type=\"text\" id=\"q10\" name=\"q10\"> spread more slowly from Mexico than it did from the Middle East.</p>\n<p><strong>24</strong> Technology spread more quickly in <input type=\"text\" id=\"q11\" name=\"q11\"> than in Africa.</p>\n<p><strong>25</strong> <input type=\"text\" id=\"q12\" name=\"q12\"> is economically rich in spite of its tropical climate.</p>\n<p><strong>26</strong> Aid should be used to improve agriculture rather than to improve <input type=\"text\" id=\"q13\" name=\"q13\">.</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
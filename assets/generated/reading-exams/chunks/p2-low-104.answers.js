@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-104", "answers", {"answerKey":{"q1":"E","q2":"D","q3":"H","q4":"F","q5":"irrigation","q6":"transport","q7":"land","q8":"nitrogen","q9":"erosion","q10":"C","q11":"E","q12":"D","q13":"B"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-104", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-104","meta":{"title":"1115纸笔Should we stop eating meat 是否应该吃素","category":"P2","frequency":"low","pdfFilename":"192. 1115纸笔P2 - Should we stop eating meat 是否应该吃素.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/192. 1115纸笔P2 - Should we stop eating meat 是否应该吃素/","legacyFilename":"192. 1115纸笔P2 - Should we stop eating meat 是否应该吃素.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/192. 1115纸笔P2 - Should we stop eating meat 是否应该吃素/192. 1115纸笔P2 - Should we stop eating meat 是否应该吃素.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/192. 1115纸笔P2 - Should we stop eating meat 是否应该吃素/192. 1115纸笔P2 - Should we stop eating meat 是否应该吃素.pdf","ieltsHtml":"IELTS/P2/Should we stop eating meat.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.201Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-104", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 14–17</h4>\n<p>Reading Passage 2 has nine paragraphs, <strong>A–I</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–I</strong>, in boxes 14–17 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 200px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th><th>I</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> the suggestion that people may need to adapt to a different quality of meat</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td><td><input type=\"radio\" name=\"q1\" value=\"I\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> a description of the way animals were fed in the past</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td><td><input type=\"radio\" name=\"q2\" value=\"I\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> a prediction in regard to human demand for meat</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td><td><input type=\"radio\" name=\"q3\" value=\"I\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> the potential consequences of a meat-free world for textile industries</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td><td><input type=\"radio\" name=\"q4\" value=\"I\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q5","q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n<h4>Questions 18–22</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>How does agriculture damage the environment?</h4>\n<p>Agriculture causes significant harm to the environment in a number of ways, including the frequent use of <strong>18</strong> <input name=\"q5\" type=\"text\" id=\"q18_input\"> in modern farming and the cutting down of trees. It is also responsible for the production of many greenhouse gases, more so than <strong>19</strong> <input name=\"q6\" type=\"text\" id=\"q19_input\"> is. However, it is livestock farming in particular that is most harmful, because cows, chickens and sheep, for example, are given vast quantities of grain which could be consumed by people instead. A meat-free diet would mean that actually less <strong>20</strong> <input name=\"q7\" type=\"text\" id=\"q20_input\"> could be used for crops. Far less chemical pollution, specifically in the form of <strong>21</strong> <input name=\"q8\" type=\"text\" id=\"q21_input\">, would also be released into the environment, especially if consumers cut out dairy and egg products as well as meat. In the US, there is clear evidence that considerable <strong>22</strong> <input name=\"q9\" type=\"text\" id=\"q22_input\"> is caused by the demand for grazing land, although there is no information on this from other countries.</p>\n</div>\n</div>"},{"groupId":"group-3","kind":"matching","questionIds":["q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<h4>Questions 23–26</h4>\n<p>Look at the following statements (Questions 23–26) and the list of people below.</p>\n<p>Match each statement with the correct researcher, <strong>A–E</strong>.</p>\n<p><em>Write the correct letter, <strong>A–E</strong>, in boxes 23–26 on your answer sheet.</em></p>\n<div class=\"match-question-item\">\n<p><strong>23</strong> It is not possible to say that a vegetarian diet is right for everyone.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>24</strong> It may be economically preferable to farm animals in limited space.</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>25</strong> It does not make sense to give up meat without giving up dairy products too.</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>26</strong> Some animals can be fed in a way that allows waste to be recycled.</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div class=\"options-pool\" id=\"researcher-options-pool\">\n<strong>List of People</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"person-A\" draggable=\"true\" data-option=\"A\">A Allison Leach</div>\n<div class=\"drag-item\" id=\"person-B\" draggable=\"true\" data-option=\"B\">B Tara Garnett</div>\n<div class=\"drag-item\" id=\"person-C\" draggable=\"true\" data-option=\"C\">C Annette Pinner</div>\n<div class=\"drag-item\" id=\"person-D\" draggable=\"true\" data-option=\"D\">D Helmut Haberl</div>\n<div class=\"drag-item\" id=\"person-E\" draggable=\"true\" data-option=\"E\">E Walter Falcon</div>\n</div>\n</div>\n</div>","allowOptionReuse":false}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
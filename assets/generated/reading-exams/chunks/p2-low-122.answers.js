@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-122", "answers", {"answerKey":{"q1":"C","q2":"B","q3":"A","q4":"H","q5":"B","q6":"F","q7":"technological","q8":"stress","q9":"sunlight","q10":"tree","q11":"air","q12":"B","q13":"D"}});
+})(typeof window !== "undefined" ? window : globalThis);
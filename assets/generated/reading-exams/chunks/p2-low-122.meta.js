@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-122", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-122","meta":{"title":"Biophilic Design 亲自然设计","category":"P2","frequency":"low","pdfFilename":"35. P2 - Biophilic Design 亲自然设计.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/35. P2 - Biophilic Design 亲自然设计/","legacyFilename":"35. P2 - Biophilic Design 亲自然设计.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/35. P2 - Biophilic Design 亲自然设计/35. P2 - Biophilic Design 亲自然设计.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/35. P2 - Biophilic Design 亲自然设计/35. P2 - Biophilic Design 亲自然设计.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.719Z","notes":"signature:radio,checkbox,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-122", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Biophilic Design</h3>\n<p><strong>A</strong> Biophilic design, a movement related to green architecture, has gained much momentum within the building community in recent years. The premise of biophilic design is to avoid or minimise harmful impacts on the natural environment and, equally importantly, to provide and restore beneficial contacts between people and nature in the built environment.</p>\n<p><strong>B</strong> People have a psychologically developed need to commune with nature, but this has frequently been neglected. All too often, architects put creative originality before the needs of the people who must live and work in their futuristic constructions, with scant regard for emotional as well as practical considerations. Biophilic design does not advocate tree houses or cave-dwelling, but it does provide nature-based features that maximise human functioning and health. Though not technically a biophilic design, Fallingwater—the stunning house in rural Pennsylvania designed in the 1930s by Frank Lloyd Wright—arguably speaks to the human soul far more than the box-like blocks of flats designed by his contemporary Le Corbusier.</p>\n<p><strong>C</strong> In the modern world, much of our built environment obstructs the age-old connection between humans and nature. The rate of technological progress far exceeds the rate of psychological evolution, leaving us ill-equipped to cope with our lifestyles, which in turn leads to increased stress. Because biophilia attempts to integrate basic and current needs, it can alleviate the difficulties caused by the brain's constant efforts to function in a modern environment it has not yet evolved to handle. For example, one crucial element of the natural landscape for human health is sunlight. We are evolutionarily programmed to respond positively to sunny areas over dark or overcast ones and sense that they will foster restoration, improve emotional well-being and promote health.</p>\n<p><strong>D</strong> Because of its tremendous impact on human psychology, biophilic design plays a vital role in healthcare and its delivery. The current healthcare system contains many flaws, especially in its physical spaces. Hospitals, clinics and offices are high-stress environments for patients, visitors and healthcare professionals alike. One well-known study looked at the impact of nature on patients after surgery. One group had a view of a tree; the others had a window looking onto a brick wall. The first group had shorter hospital stays, received fewer negative comments from nurses, required fewer analgesics and had slightly fewer post-operative complications.</p>\n<p><strong>E</strong> As a consequence of this and other studies, nature and nature-based design have been integrated into the physical design of many hospitals. For example, Dartmouth-Hitchcock Medical Center (DHMC) in New Hampshire boasts an atrium design illuminating the entire facility. Natural elements also permeate the building, including wood, stone and numerous live plants. While DHMC was built to incorporate these qualities, other hospitals have had biophilic features added to existing structures. The application of biophilic concepts to hospital interiors has increased substantially as administrators have witnessed patients' positive responses to nature.</p>\n<p><strong>F</strong> Many existing buildings contain biophilic elements, but only a few have been built with the specific idea of biophilic design in mind. One such building is the Adam Joseph Lewis Center for Environmental Studies at Oberlin College in Ohio. The director of Oberlin's Environmental Studies Program, David Orr, explained that the building's goals were “to create not just a place for classes but rather a building that would help to redefine the relationship between humankind and the environment—one that would expand our sense of ecological possibilities”. The Lewis Center is sustainable in a broader sense than in the typical application of the word. It harnesses solar power, utilises both active and passive air systems, and monitors the weather to adapt to conditions. The Centre's “Living Machine” treats wastewater by combining traditional wastewater technology with wetland ecosystems' purification processes, producing water that can be used in the toilets and for irrigation. In their design, Orr and his team of architects engineered a healthy and comfortable space for students while ensuring the surrounding environment was undamaged.</p>\n<p><strong>G</strong> Another example is the University of Guelph-Humber building in Ontario, Canada. It contains a centrally located bio-wall, vertically spanning the building. The wall is covered in dense foliage which not only connects people to nature on the inside of the building, but also functions as a new filtration-system prototype. The wall purifies the air and has the potential to fulfil the building's fresh-air-intake requirements. These examples prove that the built environment need not interfere with biological human needs to commune with nature, nor with existing ecological systems.</p>\n<p><strong>H</strong> Ancient architects built for their cultures, which were almost always more in touch with the earth than Western society is today. They mimicked nature's forms, producing magnificent structures that still awe us—though biophilic design is a novel concept, they certainly employed some of its recommendations. Today we can add another layer to this tradition and ensure maximal benefit for our planet and ourselves.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
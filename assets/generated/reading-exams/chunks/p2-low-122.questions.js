@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-122", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–H</strong>, in boxes 14–19 on your answer sheet.</em></p>\n<p><strong>NB</strong> You may use any letter more than once.</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"width: 50%;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> a description of how rapid change has a negative effect on people</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> a reference to an architect whose designs were uncharacteristic of biophilia</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> a definition of the two main aims of biophilia</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> a positive claim about early forms of architecture</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>18</strong> a reference to the fact that many architects are too focused on innovation</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>19</strong> a description of features which conserve energy in a biophilic design</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td><td><input type=\"radio\" name=\"q6\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q7","q8","q9","q10","q11"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-11-anchor\">\n<h4>Questions 20–24</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"sentence-completion\">\n<p>\n<strong>20</strong> In the modern world, <input type=\"text\" id=\"q20_input\" name=\"q7\"> advancements are happening so quickly that humans are unable to adjust to them.\n</p>\n<p>\n<strong>21</strong> Biophilia can help us deal with the <input type=\"text\" id=\"q21_input\" name=\"q8\"> caused by the difficulties of our current lifestyles.\n</p>\n<p>\n<strong>22</strong> People instinctively feel more comfortable in places which have plenty of <input type=\"text\" id=\"q22_input\" name=\"q9\"> something which is necessary for health and well-being.\n</p>\n<p>\n<strong>23</strong> An experiment designed to test the effect of nature on patient recovery times found that those who could see a <input type=\"text\" id=\"q23_input\" name=\"q10\"> made a faster recovery.\n</p>\n<p>\n<strong>24</strong> There is a biophilic design feature in the University of Guelph-Humber building which improves the quality of the <input type=\"text\" id=\"q24_input\" name=\"q11\">.\n</p>\n</div>\n</div>"},{"groupId":"group-3","kind":"multi_choice","questionIds":["q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q12-13-anchor\">\n<h4>Questions 25 and 26</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>Which <strong>TWO</strong> of the following statements does the writer make about the Adam Joseph Lewis Center at Oberlin College?</p>\n<div class=\"mcq\">\n<label class=\"mcq-item\" style=\"display:block;\"><input type=\"checkbox\" name=\"q12_13\" value=\"A\"> <strong>A</strong> It was the first educational establishment designed with biophilic principles.</label> <label class=\"mcq-item\" style=\"display:block;\"><input type=\"checkbox\" name=\"q12_13\" value=\"B\"> <strong>B</strong> It is beneficial for both students and the environment.</label> <label class=\"mcq-item\" style=\"display:block;\"><input type=\"checkbox\" name=\"q12_13\" value=\"C\"> <strong>C</strong> It has established new concepts for classroom design.</label> <label class=\"mcq-item\" style=\"display:block;\"><input type=\"checkbox\" name=\"q12_13\" value=\"D\"> <strong>D</strong> It aims to inspire new ways of thinking about the environment.</label> <label class=\"mcq-item\" style=\"display:block;\"><input type=\"checkbox\" name=\"q12_13\" value=\"E\"> <strong>E</strong> It provides solar power to other buildings in the surrounding area.</label>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-125", "answers", {"answerKey":{"q1":"F","q2":"A","q3":"E","q4":"F","q5":"temple","q6":"harbour","q7":"entrance","q8":"shipworms","q9":"C","q10":"A","q11":"B","q12":"A","q13":"D"}});
+})(typeof window !== "undefined" ? window : globalThis);
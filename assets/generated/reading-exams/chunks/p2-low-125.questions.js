@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-125", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 14–17</h4>\n<p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 200px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> possible reasons why the site of Mersa Gawasis was abandoned</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> mention of a lack of agreement about an archaeological discovery</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> reference to a study which involved copying ancient Egyptian boat-building techniques</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> a reason why the ancient Egyptians needed to import goods by sea</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-anchor\">\n<h4>Questions 18–21</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"sentence-completion\">\n<p><strong>18</strong> Illustrations of merchant ships sailing from Punt were found on wall carvings in an ancient <input name=\"q5\" type=\"text\" id=\"q18_input\"> in Egypt.</p>\n<p><strong>19</strong> Bard and Fattovich hoped to find evidence of a <input name=\"q6\" type=\"text\" id=\"q19_input\"> in the area of Mersa Gawasis.</p>\n<p><strong>20</strong> When Bard first discovered a cave at Mersa Gawasis, the shape of its <input name=\"q7\" type=\"text\" id=\"q20_input\"> indicated that it was man-made.</p>\n<p><strong>21</strong> Bard and Fattovich discovered a considerable number of objects that had been damaged by small sea creatures known as <input name=\"q8\" type=\"text\" id=\"q21_input\">.</p>\n</div>\n</div>"},{"groupId":"group-3","kind":"matching","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 22–26</h4>\n<p>Look at the following statements (Questions 22–26) and the list of archaeologists below.</p>\n<p>Match each statement with the correct archaeologist, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>22</strong> Ancient Egyptian sea voyages were probably relatively infrequent.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> It is now certain that the ancient Egyptians sailed to Punt.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>24</strong> During a certain period, Egyptians were forced to use sea rather than overland trade routes.</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>25</strong> It has been suggested that Punt never existed.</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>26</strong> The construction of ancient Egyptian ships was unlike any other.</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div class=\"options-pool\" id=\"archaeologist-options-pool\">\n<strong>List of archaeologists</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A John Baines</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Kathryn Bard</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Rodolfo Fattovich</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Cheryl Ward</div>\n</div>\n</div>\n</div>","allowOptionReuse":true}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
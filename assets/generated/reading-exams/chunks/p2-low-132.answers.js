@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-132", "answers", {"answerKey":{"q1":"visual memory","q2":"migration direction","q3":"destination","q4":"landmarks","q5":"Laysan albatross","q6":"C","q7":"B","q8":"C","q9":"G","q10":"C","q11":"F","q12":"A","q13":"D"}});
+})(typeof window !== "undefined" ? window : globalThis);
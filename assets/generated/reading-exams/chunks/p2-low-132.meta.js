@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-132", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-132","meta":{"title":"Orientation of Birds 鸟类的定位能力","category":"P2","frequency":"low","pdfFilename":"44. P2 - Orientation of Birds 鸟类的定位能力.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/44. P2 - Orientation of Birds 鸟类的定位能力/","legacyFilename":"44. P2 - Orientation of Birds 鸟类的定位能力.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/44. P2 - Orientation of Birds 鸟类的定位能力/44. P2 - Orientation of Birds 鸟类的定位能力.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/44. P2 - Orientation of Birds 鸟类的定位能力/44. P2 - Orientation of Birds 鸟类的定位能力.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-11T14:43:22.267Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
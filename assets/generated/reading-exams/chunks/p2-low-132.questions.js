@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-132", "questions", {"questionGroups":[{"groupId":"group-1","kind":"summary_completion","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 14–18</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>Types of homing behaviour</h4>\n<p>\n<strong>First type:</strong><br>\nBirds rely on their sophisticated <strong>14</strong> <input type=\"text\" id=\"q14_input\" name=\"q1\">. However, they are generally most successful if they are released within their feeding territory.\n</p>\n<p>\n<strong>Second type:</strong><br>\nBirds select their accustomed <strong>15</strong> <input type=\"text\" id=\"q15_input\" name=\"q2\">, no matter where they are released. As a result, they may miss their <strong>16</strong> <input type=\"text\" id=\"q16_input\" name=\"q3\">.\n</p>\n<p>\n<strong>Third type:</strong><br>\nBirds orientate correctly, even when they are released in an unfamiliar place and have no <strong>17</strong> <input type=\"text\" id=\"q17_input\" name=\"q4\"> to make use of. One bird with this type of skill is the <strong>18</strong> <input type=\"text\" id=\"q18_input\" name=\"q5\">.\n</p>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"table_completion","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 19–22</h4>\n<p>Reading Passage 2 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 250px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>19</strong> the effects of distance on some birds' ability to find their nests</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td><td><input type=\"radio\" name=\"q6\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>20</strong> a methodology for testing the general ability of birds to find their nests</td>\n<td><input type=\"radio\" name=\"q7\" value=\"A\"></td><td><input type=\"radio\" name=\"q7\" value=\"B\"></td><td><input type=\"radio\" name=\"q7\" value=\"C\"></td><td><input type=\"radio\" name=\"q7\" value=\"D\"></td><td><input type=\"radio\" name=\"q7\" value=\"E\"></td><td><input type=\"radio\" name=\"q7\" value=\"F\"></td><td><input type=\"radio\" name=\"q7\" value=\"G\"></td><td><input type=\"radio\" name=\"q7\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>21</strong> one aspect of physical ability in humans and birds</td>\n<td><input type=\"radio\" name=\"q8\" value=\"A\"></td><td><input type=\"radio\" name=\"q8\" value=\"B\"></td><td><input type=\"radio\" name=\"q8\" value=\"C\"></td><td><input type=\"radio\" name=\"q8\" value=\"D\"></td><td><input type=\"radio\" name=\"q8\" value=\"E\"></td><td><input type=\"radio\" name=\"q8\" value=\"F\"></td><td><input type=\"radio\" name=\"q8\" value=\"G\"></td><td><input type=\"radio\" name=\"q8\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>22</strong> how some birds' migration was delayed for experimental purposes</td>\n<td><input type=\"radio\" name=\"q9\" value=\"A\"></td><td><input type=\"radio\" name=\"q9\" value=\"B\"></td><td><input type=\"radio\" name=\"q9\" value=\"C\"></td><td><input type=\"radio\" name=\"q9\" value=\"D\"></td><td><input type=\"radio\" name=\"q9\" value=\"E\"></td><td><input type=\"radio\" name=\"q9\" value=\"F\"></td><td><input type=\"radio\" name=\"q9\" value=\"G\"></td><td><input type=\"radio\" name=\"q9\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"},{"groupId":"group-3","kind":"matching","questionIds":["q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<h4>Questions 23–26</h4>\n<p>Look at the following types of birds (Questions 23–26) and the list of points which the author wishes to illustrate below.</p>\n<p>Match each bird with the point which it illustrates, <strong>A–G</strong>.</p>\n<div class=\"match-question-item\">\n<p><strong>23</strong> Domestic pigeon</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>24</strong> Alpine swift</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>25</strong> European stork</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>26</strong> Starling</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div class=\"options-pool\" id=\"points-options-pool\">\n<strong>List of points which the author wishes to illustrate</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\"><strong>A</strong> an ability to orientate without previous training</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\"><strong>B</strong> the speed at which birds fly</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\"><strong>C</strong> the ability to remember things seen previously</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\"><strong>D</strong> the effect of age on homing ability</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\"><strong>E</strong> the strength required to fly a great distance</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\"><strong>F</strong> a high success rate in finding nests</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\"><strong>G</strong> the importance of seasonal cues for migrating birds</div>\n</div>\n</div>\n</div>","allowOptionReuse":false}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-135", "answers", {"answerKey":{"q1":"vii","q2":"ix","q3":"i","q4":"iii","q5":"iv","q6":"vi","q7":"erosion","q8":"operating costs","q9":"helicopters","q10":"B","q11":"A","q12":"A","q13":"C"}});
+})(typeof window !== "undefined" ? window : globalThis);
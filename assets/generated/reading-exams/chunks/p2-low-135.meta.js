@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-135", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-135","meta":{"title":"Skyscraper Farming 摩天大楼种植","category":"P2","frequency":"low","pdfFilename":"47. P2 - Skyscraper Farming 摩天大楼种植.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/47. P2 - Skyscraper Farming 摩天大楼种植/","legacyFilename":"47. P2 - Skyscraper Farming 摩天大楼种植.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/47. P2 - Skyscraper Farming 摩天大楼种植/47. P2 - Skyscraper Farming 摩天大楼种植.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/47. P2 - Skyscraper Farming 摩天大楼种植/47. P2 - Skyscraper Farming 摩天大楼种植.pdf","ieltsHtml":"IELTS/P2/Skyscraper Farming.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.273Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-135", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Write the correct number, i–ix, in boxes 14–19 on your answer sheet.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i Potential production capabilities of vertical farms</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Opposition to new ideas about food production</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii A successful application of vertical-farming technology</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv The potential to provide urgent relief</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v The original inspiration for vertical farming</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi Various environmental benefits of vertical farming</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii An increasing problem for farmers worldwide</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii A return to traditional farming methods</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix A rising demand for food</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"short_answer","questionIds":["q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-anchor\">\n<h4>Questions 20–22</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"question-item\">\n<p><strong>20</strong> A UK Government study found that <input class=\"blank\" name=\"q7\"> is a significant factor contributing to worldwide levels of soil degradation.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>21</strong> Disadvantages of vertical-farming projects include the expense of setting them up, as well as their high <input class=\"blank\" name=\"q8\">.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>22</strong> <input class=\"blank\" name=\"q9\"> could potentially be used to take vertical-farming facilities to areas where there is a critical food shortage.</p>\n</div>\n</div>"},{"groupId":"group-3","kind":"single_choice","questionIds":["q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<h4>Questions 23–26</h4>\n<p>Look at the following statements (Questions 23–26) and the list of people below.</p>\n<p>Match each statement with the correct person, A, B or C.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"question-item\">\n<p><strong>23</strong> Vertical farming can have financial benefits.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"> A Dickson Despommier</label> <label><input name=\"q10\" type=\"radio\" value=\"B\"> B Ted Yamanoko</label> <label><input name=\"q10\" type=\"radio\" value=\"C\"> C Natalie Jeremijenko</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>24</strong> Traditional farming has had a negative effect on the natural world.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"> A Dickson Despommier</label> <label><input name=\"q11\" type=\"radio\" value=\"B\"> B Ted Yamanoko</label> <label><input name=\"q11\" type=\"radio\" value=\"C\"> C Natalie Jeremijenko</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>25</strong> Vertical farming could dramatically increase world food production.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"A\"> A Dickson Despommier</label> <label><input name=\"q12\" type=\"radio\" value=\"B\"> B Ted Yamanoko</label> <label><input name=\"q12\" type=\"radio\" value=\"C\"> C Natalie Jeremijenko</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>26</strong> Traditional farms may benefit from wider use of vertical farming.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"> A Dickson Despommier</label> <label><input name=\"q13\" type=\"radio\" value=\"B\"> B Ted Yamanoko</label> <label><input name=\"q13\" type=\"radio\" value=\"C\"> C Natalie Jeremijenko</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
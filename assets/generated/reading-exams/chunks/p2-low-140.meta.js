@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-140", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-140","meta":{"title":"The dingo debate 澳洲野犬","category":"P2","frequency":"low","pdfFilename":"51. P2 - The dingo debate 澳洲野犬.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/51. P2 - The dingo debate 澳洲野犬/","legacyFilename":"51. P2 - The dingo debate 澳洲野犬.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/51. P2 - The dingo debate 澳洲野犬/51. P2 - The dingo debate 澳洲野犬.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/51. P2 - The dingo debate 澳洲野犬/51. P2 - The dingo debate 澳洲野犬.pdf","ieltsHtml":"IELTS/P2/The dingo debate.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.281Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-142", "answers", {"answerKey":{"q1":"v","q2":"ii","q3":"iv","q4":"i","q5":"viii","q6":"iii","q7":"vi","q8":"sewing machine","q9":"department stores","q10":"fixed prices","q11":"Europe","q12":"C","q13":"D"}});
+})(typeof window !== "undefined" ? window : globalThis);
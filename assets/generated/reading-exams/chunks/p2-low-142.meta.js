@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-142", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-142","meta":{"title":"The fashion industry 时尚产业","category":"P2","frequency":"low","pdfFilename":"53. P2 - The fashion industry 时尚产业.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/53. P2 - The fashion industry 时尚产业/","legacyFilename":"53. P2 - The fashion industry 时尚产业.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/53. P2 - The fashion industry 时尚产业/53. P2 - The fashion industry 时尚产业.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/53. P2 - The fashion industry 时尚产业/53. P2 - The fashion industry 时尚产业.pdf","ieltsHtml":"IELTS/P2/The fashion industry.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.755Z","notes":"signature:radio,checkbox,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-142", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 14–20</h4>\n<p>Reading Passage 2 has seven sections, <strong>A–G</strong>.</p>\n<p>Choose the correct heading for each section from the list of headings below.</p>\n<p><em>Write the correct number, <strong>i–viii</strong>, in boxes 14–20 on your answer sheet.</em></p>\n<ul class=\"headings-list\">\n<li><strong>List of Headings</strong></li>\n<li><strong>i</strong> &nbsp; How new clothing styles are created</li>\n<li><strong>ii</strong> &nbsp; The rise of the fashion industry</li>\n<li><strong>iii</strong> &nbsp; Joining the garment pieces together</li>\n<li><strong>iv</strong> &nbsp; Producing materials with a range of features</li>\n<li><strong>v</strong> &nbsp; The importance of the fashion industry</li>\n<li><strong>vi</strong> &nbsp; Factors affecting international commerce</li>\n<li><strong>vii</strong> &nbsp; The attractions of becoming a fashion model</li>\n<li><strong>viii</strong> &nbsp; Making patterns for people with different figures</li>\n</ul>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th>Section</th><th>i</th><th>ii</th><th>iii</th><th>iv</th><th>v</th><th>vi</th><th>vii</th><th>viii</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> Section A</td>\n<td><input type=\"radio\" name=\"q1\" value=\"i\"></td><td><input type=\"radio\" name=\"q1\" value=\"ii\"></td><td><input type=\"radio\" name=\"q1\" value=\"iii\"></td><td><input type=\"radio\" name=\"q1\" value=\"iv\"></td><td><input type=\"radio\" name=\"q1\" value=\"v\"></td><td><input type=\"radio\" name=\"q1\" value=\"vi\"></td><td><input type=\"radio\" name=\"q1\" value=\"vii\"></td><td><input type=\"radio\" name=\"q1\" value=\"viii\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> Section B</td>\n<td><input type=\"radio\" name=\"q2\" value=\"i\"></td><td><input type=\"radio\" name=\"q2\" value=\"ii\"></td><td><input type=\"radio\" name=\"q2\" value=\"iii\"></td><td><input type=\"radio\" name=\"q2\" value=\"iv\"></td><td><input type=\"radio\" name=\"q2\" value=\"v\"></td><td><input type=\"radio\" name=\"q2\" value=\"vi\"></td><td><input type=\"radio\" name=\"q2\" value=\"vii\"></td><td><input type=\"radio\" name=\"q2\" value=\"viii\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> Section C</td>\n<td><input type=\"radio\" name=\"q3\" value=\"i\"></td><td><input type=\"radio\" name=\"q3\" value=\"ii\"></td><td><input type=\"radio\" name=\"q3\" value=\"iii\"></td><td><input type=\"radio\" name=\"q3\" value=\"iv\"></td><td><input type=\"radio\" name=\"q3\" value=\"v\"></td><td><input type=\"radio\" name=\"q3\" value=\"vi\"></td><td><input type=\"radio\" name=\"q3\" value=\"vii\"></td><td><input type=\"radio\" name=\"q3\" value=\"viii\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> Section D</td>\n<td><input type=\"radio\" name=\"q4\" value=\"i\"></td><td><input type=\"radio\" name=\"q4\" value=\"ii\"></td><td><input type=\"radio\" name=\"q4\" value=\"iii\"></td><td><input type=\"radio\" name=\"q4\" value=\"iv\"></td><td><input type=\"radio\" name=\"q4\" value=\"v\"></td><td><input type=\"radio\" name=\"q4\" value=\"vi\"></td><td><input type=\"radio\" name=\"q4\" value=\"vii\"></td><td><input type=\"radio\" name=\"q4\" value=\"viii\"></td>\n</tr>\n<tr>\n<td><strong>18</strong> Section E</td>\n<td><input type=\"radio\" name=\"q5\" value=\"i\"></td><td><input type=\"radio\" name=\"q5\" value=\"ii\"></td><td><input type=\"radio\" name=\"q5\" value=\"iii\"></td><td><input type=\"radio\" name=\"q5\" value=\"iv\"></td><td><input type=\"radio\" name=\"q5\" value=\"v\"></td><td><input type=\"radio\" name=\"q5\" value=\"vi\"></td><td><input type=\"radio\" name=\"q5\" value=\"vii\"></td><td><input type=\"radio\" name=\"q5\" value=\"viii\"></td>\n</tr>\n<tr>\n<td><strong>19</strong> Section F</td>\n<td><input type=\"radio\" name=\"q6\" value=\"i\"></td><td><input type=\"radio\" name=\"q6\" value=\"ii\"></td><td><input type=\"radio\" name=\"q6\" value=\"iii\"></td><td><input type=\"radio\" name=\"q6\" value=\"iv\"></td><td><input type=\"radio\" name=\"q6\" value=\"v\"></td><td><input type=\"radio\" name=\"q6\" value=\"vi\"></td><td><input type=\"radio\" name=\"q6\" value=\"vii\"></td><td><input type=\"radio\" name=\"q6\" value=\"viii\"></td>\n</tr>\n<tr>\n<td><strong>20</strong> Section G</td>\n<td><input type=\"radio\" name=\"q7\" value=\"i\"></td><td><input type=\"radio\" name=\"q7\" value=\"ii\"></td><td><input type=\"radio\" name=\"q7\" value=\"iii\"></td><td><input type=\"radio\" name=\"q7\" value=\"iv\"></td><td><input type=\"radio\" name=\"q7\" value=\"v\"></td><td><input type=\"radio\" name=\"q7\" value=\"vi\"></td><td><input type=\"radio\" name=\"q7\" value=\"vii\"></td><td><input type=\"radio\" name=\"q7\" value=\"viii\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q8","q9","q10","q11"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-anchor\">\n<h4>Questions 21–24</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>The development of a modern fashion industry</h4>\n<p>\nUp until the middle of the 19th century, people generally wore handmade clothes. After that the situation changed, and by the 20th century many clothes were mass-produced. This development was partly due to inventions like the <strong>21</strong> <input type=\"text\" id=\"q21_input\" name=\"q8\">. It was also the result of general changes in manufacturing systems, as well as the spread of shops like <strong>22</strong> <input type=\"text\" id=\"q22_input\" name=\"q9\">. The changes also led to the standardisation of sizes and <strong>23</strong> <input type=\"text\" id=\"q23_input\" name=\"q10\">. Today, despite the fact that the fashion industry originated in <strong>24</strong> <input type=\"text\" id=\"q24_input\" name=\"q11\">, it has become a truly international enterprise.\n</p>\n</div>\n</div>"},{"groupId":"group-3","kind":"multi_choice","questionIds":["q12","q13"],"bodyHtml":"<div class=\"group checkbox-question\" id=\"q12-13-anchor\">\n<h4>Questions 25 and 26</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>Which <strong>TWO</strong> of the following statements does the writer make about garment assembly?</p>\n<div class=\"options\">\n<label><input type=\"checkbox\" name=\"q12_13\" value=\"A\"> A The majority of sewing is done by computer-operated machines.</label> <label><input type=\"checkbox\" name=\"q12_13\" value=\"B\"> B Highly skilled workers are the most important requirement.</label> <label><input type=\"checkbox\" name=\"q12_13\" value=\"C\"> C Most businesses use other companies to manufacture their products.</label> <label><input type=\"checkbox\" name=\"q12_13\" value=\"D\"> D Fasteners and labels are attached after the clothes have been made up.</label> <label><input type=\"checkbox\" name=\"q12_13\" value=\"E\"> E Manufacturers usually produce one range of women's clothing annually.</label>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
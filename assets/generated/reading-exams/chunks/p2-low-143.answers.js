@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-143", "answers", {"answerKey":{"q1":"C","q2":"E","q3":"H","q4":"F","q5":"G","q6":"D","q7":"D","q8":"E","q9":"B","q10":"D","q11":"biodiversity","q12":"equilibrium","q13":"waste"}});
+})(typeof window !== "undefined" ? window : globalThis);
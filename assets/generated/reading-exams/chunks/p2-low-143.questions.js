@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-143", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–H</strong>, in boxes 14–19 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> a suggestion that people have moved numerous species across the globe throughout history</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> an example of how an ecosystem can be damaged very rapidly</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> a description of what can be done to restrict the spread of invasive species</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> a reference to the lack of research on the effects of some invasive species</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>18</strong> a mention of a current lack of public awareness of the problem of invasive species</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>19</strong> an indication that an introduced species may benefit a specific ecosystem</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td><td><input type=\"radio\" name=\"q6\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"multi_choice","questionIds":["q7","q8"],"bodyHtml":"<div class=\"group checkbox-question\" id=\"q7-8-anchor\">\n<h4>Questions 20-21</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>Which <strong>TWO</strong> reasons for the spread of invasive species are mentioned in the text?</p>\n<div class=\"options\">\n<label><input type=\"checkbox\" name=\"q7_8\" value=\"A\"> A the wish to eliminate undesirable native species</label> <label><input type=\"checkbox\" name=\"q7_8\" value=\"B\"> B the recent expansion of international trade in agricultural products</label> <label><input type=\"checkbox\" name=\"q7_8\" value=\"C\"> C a lack of checks on some of the cargo on board ships</label> <label><input type=\"checkbox\" name=\"q7_8\" value=\"D\"> D the deliberate release of non-native animals</label> <label><input type=\"checkbox\" name=\"q7_8\" value=\"E\"> E an extension of their geographical range as a result of global warming</label>\n</div>\n</div>"},{"groupId":"group-3","kind":"multi_choice","questionIds":["q9","q10"],"bodyHtml":"<div class=\"group checkbox-question\" id=\"q9-10-anchor\">\n<h4>Questions 22-23</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>Which <strong>TWO</strong> statements does the writer make about the water hyacinth?</p>\n<div class=\"options\">\n<label><input type=\"checkbox\" name=\"q9_10\" value=\"A\"> A It is native to almost every region of the world.</label> <label><input type=\"checkbox\" name=\"q9_10\" value=\"B\"> B It was brought to North America in the late nineteenth century.</label> <label><input type=\"checkbox\" name=\"q9_10\" value=\"C\"> C Its beauty has led people to ignore the negative effects it has.</label> <label><input type=\"checkbox\" name=\"q9_10\" value=\"D\"> D Its spread has caused some practical problems in recent years.</label> <label><input type=\"checkbox\" name=\"q9_10\" value=\"E\"> E Scientists recommended its introduction to the USA.</label>\n</div>\n</div>"},{"groupId":"group-4","kind":"sentence_completion","questionIds":["q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"sentence-completion\">\n<p>\n<strong>24</strong> Kudzu has reduced the <input type=\"text\" id=\"q24_input\" name=\"q11\"> of certain areas in the south-east of the USA.\n</p>\n<p>\n<strong>25</strong> Some introduced species present a low level of threat if they remain within a small area and do not disturb the <input type=\"text\" id=\"q25_input\" name=\"q12\"> of the surrounding ecosystem.\n</p>\n<p>\n<strong>26</strong> The effect of invasive jellyfish in the Black Sea was greater than that <input type=\"text\" id=\"q26_input\" name=\"q13\"> from factories.\n</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
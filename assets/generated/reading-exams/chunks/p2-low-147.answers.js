@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-147", "answers", {"answerKey":{"q1":"C","q2":"A","q3":"C","q4":"B","q5":"G","q6":"A","q7":"collaboration","q8":"computers","q9":"fingerprint","q10":"C","q11":"A","q12":"E","q13":"B"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-147", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-147","meta":{"title":"Who wrote Shakespeare's plays 莎士比亚","category":"P2","frequency":"low","pdfFilename":"58. P2 - Who wrote Shakespeare's plays 莎士比亚.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/58. P2 - Who wrote Shakespeare's plays 莎士比亚/","legacyFilename":"58. P2 - Who wrote Shakespeare's plays 莎士比亚.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/58. P2 - Who wrote Shakespeare's plays 莎士比亚/58. P2 - Who wrote Shakespeare's plays 莎士比亚.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/58. P2 - Who wrote Shakespeare's plays 莎士比亚/58. P2 - Who wrote Shakespeare's plays 莎士比亚.pdf","ieltsHtml":"IELTS/P2/Who wrote Shakespeare's plays.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.765Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
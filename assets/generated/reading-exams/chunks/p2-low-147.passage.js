@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-147", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Who wrote Shakespeare's plays?</h3>\n<h4>Experts suggest 'Shakespeare' may have been a pseudonym - a pen-name - for another writer.</h4>\n<p><i>Robert Matthews investigates</i></p>\n<p><strong>A</strong> Even today, almost 400 years after his death, the works of the famous English dramatist William Shakespeare have lost none of their appeal, nor have questions about the source of his genius. For is it really credible that an ordinary actor from the small town of Stratford-upon-Avon should metamorphose into so extraordinary a dramatist? For some, the answer is obvious: Shakespeare was a genius whose gift is no more suspicious than that of the physicist Albert Einstein, the German salesman's son who devised the theory of relativity. But others have insisted that a mere school leaver simply could not have penned such sophisticated works. They believe that Shakespeare was a pseudonym for someone with far more impressive qualifications who wrote the plays that still play to packed theatres today. But after long and largely fruitless debate, researchers are now turning to scientific methods to resolve the controversies surrounding Shakespeare. Ways of identifying the literary ‘fingerprint' of writers are currently being developed using computers. This analysis of features of literary style is known as 'stylometry' and with it researchers can recognise the work of Shakespeare and his contemporaries with impressive reliability.</p>\n<p><strong>B</strong> The idea of using these basic scientific techniques to probe questions of authorship dates back to 1851, when the Victorian mathematician Augustus de Morgan suggested that different authors might be identified through the frequency with which they used words of different lengths. His idea attracted the attention of Thomas Mendenhall, an American physicist who decided to use word length to investigate one of the oldest controversies about the works of Shakespeare: were they actually written by someone else?</p>\n<p><strong>C</strong> As long ago as 1785, the Elizabethan writer and philosopher Sir Francis Bacon was identified as a possible contender for having written Shakespeare's works. Bacon's possible motivation for not wanting to be known as the author of such masterpieces is far from clear, but Mendenhall believed his methods might at least reveal telltale signs of Bacon's hand in the plays. However, his results, published in 1901, revealed Bacon's writing style to be quite unlike that of Shakespeare. But Mendenhall's methods also revealed some key concerns. Recognising the need to include large samples of writing from both authors, Mendenhall lumped all their works together, despite the fact that literary style can vary enormously between plays, poetry and philosophy, for example. His focus on word length as the sole 'fingerprint' of writing style was also questionable - for how could he be sure that some other characteristics would not give different results? But Mendenhall's biggest fault was perhaps simply that he was too far ahead of his time - he was attempting a task that cried out for the kind of computers not even conceivable over 100 years ago. More recently with their development scholars have been able to look for subtle peculiarities among the complete works of authors, which, in Shakespeare's case, amount to over 800,000 words.</p>\n<p><strong>D</strong> One of the key controversies now being probed is Shakespeare's relationship with other dramatists. Was he a lone genius or was his work the result of collaboration? Traditional methods of investigating such questions have relied on traits like the use of metaphor, but these may be shared by different authors simply on cultural grounds. In contrast, modern stylometry focuses on far more fundamental characteristics which are less likely to be shared by others. The text-crunching power of computers allows researchers to pinpoint phrases, words or even individual letters by their frequency in the work of different authors. Pattern recognition techniques are then used to develop a 'fingerprint' for each author.</p>\n<p><strong>E</strong> Stylometry has come up with little to encourage the continual number of experts who insist Shakespeare was simply too uneducated to create works of enduring brilliance. In 1996, literary scholar Ward Elliott and mathematician Robert Valenza of Claremont McKenna College, California, published the results of a stylometric comparison of the works of Shakespeare with those of over 30 of the proposed 'real' authors. Elliott and Valenza applied a battery of 51 tests to computerised texts and found that none of the claimants had a stylometric 'fingerprint' similar to that of Shakespeare. “I think these claims were driven initially by a sense that Shakespeare is too 'important' to be an ordinary person,” says Professor Kate McCluskey, director of the Shakespeare Institute at the University of Birmingham.</p>\n<p><strong>F</strong> Elliott and Valenza's research found something else too. Some of the earliest plays, notably Henry VI and the notoriously violent Titus Andronicus, seem to be a combination of Shakespeare and his brilliant contemporary the playwright Christopher Marlowe, who was born in the same year as Shakespeare. 'Traditional scholars accept that Marlowe influenced Shakespeare's early work,' says Dr Thomas Merriam, one of Britain's leading stylometry experts. He explains that, provisionally at least, stylometric studies suggest some of Marlowe's actual text exists within the early plays of Shakespeare.</p>\n<p><strong>G</strong> Some scholars remain cautious about basing new views of Shakespeare's career on stylometric analysis of centuries-old texts. \"If they have been edited, amended or shortened, then the data from them is highly compromised,” says Dr Markus Dahl of London University. Even so, the results to date are in line with the growing view of Shakespeare as a hardworking professional who perfected his skills throughout his career.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-147", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–G</strong>, in boxes 14–19 on your answer sheet.</em></p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 400px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> uncertainty why an author would wish to remain anonymous</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> a reference to the continuing popularity of Shakespeare's work</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> the reasons why a particular researcher's approach proved unsatisfactory</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> mention of the time when the use of stylometry was first proposed</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>18</strong> support for the opinion that Shakespeare became more skillful as he grew older</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>19</strong> a similarity between Shakespeare and a scientist with exceptional ability</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-anchor\">\n<h4>Questions 20–22</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h5>Stylometry</h5>\n<p>\nA key controversy is Shakespeare's relationships with other writers. It has always been uncertain whether he worked in <strong>20</strong> <input type=\"text\" id=\"q20_input\" name=\"q7\"> with others or not. To investigate this issue, literary experts traditionally looked at stylistic features such as the writer's choice of metaphor, although it was recognised that this choice may have been influenced by cultural factors.\n</p>\n<p>\nCurrent stylometric analysis has been made possible by the invention of <strong>21</strong> <input type=\"text\" id=\"q21_input\" name=\"q8\">. These can identify different features of writing such as the frequency with which particular letters, words or phrases are used by different writers. By using stylometric analysis of particular characteristics and pattern recognition systems, a so-called <strong>22</strong> <input type=\"text\" id=\"q22_input\" name=\"q9\"> of a writer can be identified.\n</p>\n</div>\n</div>"},{"groupId":"group-3","kind":"single_choice","questionIds":["q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<h4>Questions 23–26</h4>\n<p>Look at the following statements (Questions 23–26) and the list of people below.</p>\n<p>Match each statement with the correct person, <strong>A–E</strong>.</p>\n<ul class=\"people-list\">\n<li><strong>List of People</strong></li>\n<li><strong>A</strong> &nbsp; Thomas Mendenhall</li>\n<li><strong>B</strong> &nbsp; Ward Elliott and Robert Valenza</li>\n<li><strong>C</strong> &nbsp; Professor Kate McCluskey</li>\n<li><strong>D</strong> &nbsp; Dr Thomas Merriam</li>\n<li><strong>E</strong> &nbsp; Dr Markus Dahl</li>\n</ul>\n<div class=\"matching-question-item\">\n<p><strong>23</strong> People search for a more distinguished author because they cannot accept that a normal individual could write such brilliant plays.</p>\n<div class=\"matching-options\">\n<label><input type=\"radio\" name=\"q10\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q10\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q10\" value=\"C\"> C</label> <label><input type=\"radio\" name=\"q10\" value=\"D\"> D</label> <label><input type=\"radio\" name=\"q10\" value=\"E\"> E</label>\n</div>\n</div>\n<div class=\"matching-question-item\">\n<p><strong>24</strong> It should be possible to recognise writers by examining the number of letters in the words they use.</p>\n<div class=\"matching-options\">\n<label><input type=\"radio\" name=\"q11\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q11\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q11\" value=\"C\"> C</label> <label><input type=\"radio\" name=\"q11\" value=\"D\"> D</label> <label><input type=\"radio\" name=\"q11\" value=\"E\"> E</label>\n</div>\n</div>\n<div class=\"matching-question-item\">\n<p><strong>25</strong> The fact that Shakespeare's works are likely to have been altered over the years raises doubts about any stylometric analysis.</p>\n<div class=\"matching-options\">\n<label><input type=\"radio\" name=\"q12\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q12\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q12\" value=\"C\"> C</label> <label><input type=\"radio\" name=\"q12\" value=\"D\"> D</label> <label><input type=\"radio\" name=\"q12\" value=\"E\"> E</label>\n</div>\n</div>\n<div class=\"matching-question-item\">\n<p><strong>26</strong> Analysis proves that Shakespeare's style differs from those of writers who have been suggested as the authors of the plays.</p>\n<div class=\"matching-options\">\n<label><input type=\"radio\" name=\"q13\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q13\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q13\" value=\"C\"> C</label> <label><input type=\"radio\" name=\"q13\" value=\"D\"> D</label> <label><input type=\"radio\" name=\"q13\" value=\"E\"> E</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-148", "answers", {"answerKey":{"q1":"B","q2":"G","q3":"C","q4":"D","q5":"E","q6":"dancing","q7":"advertising","q8":"play","q9":"beauty","q10":"B","q11":"D","q12":"A","q13":"C"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-148", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 14–18</h4>\n<p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–G</strong>, in boxes 14–18 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> a claim that artists may have no clear objective when creating a piece of art</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> a description of how artists hope to benefit other people</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> a comparison between the arts and things made to perform a particular function</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> a claim that it's possible to convince the world that anything you have made is a work of art</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>18</strong> an example of something that has an unintentional benefit for us</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 19–22</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>The arts and human experience</h4>\n<p>\nSome people may claim that the arts serve no useful purpose, that they achieve nothing measurable and help nobody. But there are many clear examples of their usefulness, such as the interdependent relationship between music and <strong>19</strong> <input type=\"text\" id=\"q19_input\" name=\"q6\"> or between the visual arts and the <strong>20</strong> <input type=\"text\" id=\"q20_input\" name=\"q7\"> business. A dramatist may use a <strong>21</strong> <input type=\"text\" id=\"q21_input\" name=\"q8\"> to draw our attention to various issues in society, for example some kind of injustice which needs correcting. Apart from these obvious practical benefits, there are other benefits that we gain from things, such as the <strong>22</strong> <input type=\"text\" id=\"q22_input\" name=\"q9\"> we find in an artist's work.\n</p>\n</div>\n</div>"},{"groupId":"group-3","kind":"multi_choice","questionIds":["q10","q11"],"bodyHtml":"<div class=\"group\" id=\"q10-11-anchor\">\n<h4>Questions 23 and 24</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>In paragraph D, which <strong>TWO</strong> of the following effects does the writer say the arts can have?</p>\n<div class=\"question-options\">\n<label><input type=\"checkbox\" name=\"q10_11\" value=\"A\"> A They can interest people from all over the world.</label> <label><input type=\"checkbox\" name=\"q10_11\" value=\"B\"> B They can make us see things from a different perspective.</label> <label><input type=\"checkbox\" name=\"q10_11\" value=\"C\"> C They can inspire us to take up an artistic activity ourselves.</label> <label><input type=\"checkbox\" name=\"q10_11\" value=\"D\"> D They can encourage us to think about our reactions to things around us.</label> <label><input type=\"checkbox\" name=\"q10_11\" value=\"E\"> E They can draw our attention to serious global issues.</label>\n</div>\n</div>"},{"groupId":"group-4","kind":"multi_choice","questionIds":["q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q12-13-anchor\">\n<h4>Questions 25 and 26</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>Which <strong>TWO</strong> of the following statements about composers and music does the writer make?</p>\n<div class=\"question-options\">\n<label><input type=\"checkbox\" name=\"q12_13\" value=\"A\"> A Music tends to spring from the composer's individual experiences.</label> <label><input type=\"checkbox\" name=\"q12_13\" value=\"B\"> B Composers need to structure music very carefully.</label> <label><input type=\"checkbox\" name=\"q12_13\" value=\"C\"> C Music can be quite unrelated to the natural world.</label> <label><input type=\"checkbox\" name=\"q12_13\" value=\"D\"> D Music finds its best expression in a symphony.</label> <label><input type=\"checkbox\" name=\"q12_13\" value=\"E\"> E Composers are good at depicting the world around us.</label>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-222", "answers", {"answerKey":{"q1":"G","q2":"E","q3":"A","q4":"J","q5":"C","q6":"D","q7":"G","q8":"A","q9":"E","q10":"False","q11":"True","q12":"False","q13":"Not Given"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-222", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-222","meta":{"title":"Ideal Homes 理想居所","category":"P2","frequency":"low"}});
+})(typeof window !== "undefined" ? window : globalThis);
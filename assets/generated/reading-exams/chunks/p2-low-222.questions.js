@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-222", "questions", {"questionGroups":[{"groupId":"group-1","kind":"short_answer","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 14–18</h4>\n<p>The reading passage has eleven paragraphs A–K.</p>\n<p>Which paragraph contains the following information?</p>\n<p>Write the correct letter, A–K, in boxes 14–18.</p>\n<p class=\"word-limit\">NB You may use any letter more than once.</p>\n<div id=\"q1-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q1-anchor\"></a>\n<p><span class=\"question-number\">14.</span> reasons why a particular construction material is advantageous</p>\n<select id=\"q1\" name=\"q1\">\n<option value=\"\">-- Select --</option>\n<option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option><option value=\"I\">I</option><option value=\"J\">J</option><option value=\"K\">K</option>\n</select>\n</div>\n<div id=\"q2-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q2-anchor\"></a>\n<p><span class=\"question-number\">15.</span> an example of a construction design which benefits domestic interaction</p>\n<select id=\"q2\" name=\"q2\">\n<option value=\"\">-- Select --</option>\n<option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option><option value=\"I\">I</option><option value=\"J\">J</option><option value=\"K\">K</option>\n</select>\n</div>\n<div id=\"q3-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q3-anchor\"></a>\n<p><span class=\"question-number\">16.</span> a description of a house that is ventilated from below</p>\n<select id=\"q3\" name=\"q3\">\n<option value=\"\">-- Select --</option>\n<option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option><option value=\"I\">I</option><option value=\"J\">J</option><option value=\"K\">K</option>\n</select>\n</div>\n<div id=\"q4-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q4-anchor\"></a>\n<p><span class=\"question-number\">17.</span> an example of self‑sufficient energy supply</p>\n<select id=\"q4\" name=\"q4\">\n<option value=\"\">-- Select --</option>\n<option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option><option value=\"I\">I</option><option value=\"J\">J</option><option value=\"K\">K</option>\n</select>\n</div>\n<div id=\"q5-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q5-anchor\"></a>\n<p><span class=\"question-number\">18.</span> suggested methods of reducing temperatures in a city</p>\n<select id=\"q5\" name=\"q5\">\n<option value=\"\">-- Select --</option>\n<option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option><option value=\"I\">I</option><option value=\"J\">J</option><option value=\"K\">K</option>\n</select>\n</div>\n</div>"},{"groupId":"group-2","kind":"short_answer","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 19–22</h4>\n<p>Look at the following people and the list of ideas below.</p>\n<p>Match each person with the correct idea, A–G.</p>\n<p>Write the correct letter, A–G, in boxes 19–22.</p>\n<p class=\"word-limit\">List of ideas</p>\n<ul style=\"list-style-type: none; padding-left:0;\">\n<li>A The choice of a certain construction material can have a socio‑economic impact.</li>\n<li>B Throughout the world, people are rejecting traditional housing design in order to appear modern.</li>\n<li>C Houses should not only meet people's physical needs but also their social and psychological needs.</li>\n<li>D Traditional knowledge can be superior to modern knowledge.</li>\n<li>E There is an innovation that can save costs on both air‑conditioning and heating.</li>\n<li>F Solar energy can meet the energy needs of people living in villages in developing countries.</li>\n<li>G There is a very simple solution that can save on the cost of air‑conditioning.</li>\n</ul>\n<div id=\"q6-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q6-anchor\"></a>\n<p><span class=\"question-number\">19.</span> Muhammad Peter Davis</p>\n<select id=\"q6\" name=\"q6\">\n<option value=\"\">-- Select --</option>\n<option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option>\n</select>\n</div>\n<div id=\"q7-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q7-anchor\"></a>\n<p><span class=\"question-number\">20.</span> Arthur Rosenfeld</p>\n<select id=\"q7\" name=\"q7\">\n<option value=\"\">-- Select --</option>\n<option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option>\n</select>\n</div>\n<div id=\"q8-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q8-anchor\"></a>\n<p><span class=\"question-number\">21.</span> R van der Ley</p>\n<select id=\"q8\" name=\"q8\">\n<option value=\"\">-- Select --</option>\n<option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option>\n</select>\n</div>\n<div id=\"q9-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q9-anchor\"></a>\n<p><span class=\"question-number\">22.</span> Amory Lovins</p>\n<select id=\"q9\" name=\"q9\">\n<option value=\"\">-- Select --</option>\n<option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option>\n</select>\n</div>\n</div>"},{"groupId":"group-3","kind":"true_false_not_given","questionIds":["q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 23–26</h4>\n<p>Do the following statements agree with the information in Reading Passage 2?</p>\n<p>Write <strong>TRUE</strong>, <strong>FALSE</strong> or <strong>NOT GIVEN</strong>.</p>\n<div id=\"q10-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q10-anchor\"></a>\n<p><span class=\"question-number\">23.</span> The air temperature in modern Malaysian houses is lower than the air temperature outside.</p>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q10\" value=\"True\"> True</label> <label><input type=\"radio\" name=\"q10\" value=\"False\"> False</label> <label><input type=\"radio\" name=\"q10\" value=\"Not Given\"> Not Given</label>\n</div>\n</div>\n<div id=\"q11-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q11-anchor\"></a>\n<p><span class=\"question-number\">24.</span> The construction industry is more to blame than transport for global warming.</p>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q11\" value=\"True\"> True</label> <label><input type=\"radio\" name=\"q11\" value=\"False\"> False</label> <label><input type=\"radio\" name=\"q11\" value=\"Not Given\"> Not Given</label>\n</div>\n</div>\n<div id=\"q12-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q12-anchor\"></a>\n<p><span class=\"question-number\">25.</span> The use of wind towers for cooling is widespread in the Middle East today.</p>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q12\" value=\"True\"> True</label> <label><input type=\"radio\" name=\"q12\" value=\"False\"> False</label> <label><input type=\"radio\" name=\"q12\" value=\"Not Given\"> Not Given</label>\n</div>\n</div>\n<div id=\"q13-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q13-anchor\"></a>\n<p><span class=\"question-number\">26.</span> The 'super‑windows' promoted by Amory Lovins can be installed at low cost.</p>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q13\" value=\"True\"> True</label> <label><input type=\"radio\" name=\"q13\" value=\"False\"> False</label> <label><input type=\"radio\" name=\"q13\" value=\"Not Given\"> Not Given</label>\n</div>\n</div>\n</div>"}],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"},"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"]});
+})(typeof window !== "undefined" ? window : globalThis);
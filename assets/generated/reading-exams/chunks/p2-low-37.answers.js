@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-37", "answers", {"answerKey":{"q1":"F","q2":"C","q3":"B","q4":"D","q5":"E","q6":"G","q7":"A","q8":"D","q9":"central europe","q10":"mississippi","q11":"london","q12":"soft engineers","q13":"los angeles"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-37", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-37","meta":{"title":"Keeping the water away 洪水防控","category":"P2","frequency":"low","pdfFilename":"131. P2 - Keeping the water away 洪水防控.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/131. P2 - Keeping the water away 洪水防控/","legacyFilename":"131. P2 - Keeping the water away 洪水防控.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/131. P2 - Keeping the water away 洪水防控/131. P2 - Keeping the water away 洪水防控.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/131. P2 - Keeping the water away 洪水防控/131. P2 - Keeping the water away 洪水防控.pdf","ieltsHtml":"IELTS/P2/Keeping the water away.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.573Z","notes":"signature:radio,checkbox,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
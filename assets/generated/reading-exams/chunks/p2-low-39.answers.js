@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-39", "answers", {"answerKey":{"q1":"B","q2":"A","q3":"A","q4":"C","q5":"E","q6":"C","q7":"F","q8":"D","q9":"animals","q10":"blood","q11":"electricity","q12":"weather","q13":"fear"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-39", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>How to be Happy</h3>\n<h4>Some recent developments in the science of happiness</h4>\n<p><strong>A</strong> A psychiatrist Tony Fernando was walking down the street when he saw a group of young homeless men sitting on the footpath. As Fernando handed out gifts of food, he tried to video the men's reactions in his mind, recording how their gratitude lifted him in return. 'I felt warm, content, meaningful,' he says. Fernando believes the brain can be trained to make us happy and that his ‘video method' is one way to achieve this. In fact, a growing body of scientific research internationally is showing how we can learn happiness in the same way we can learn to play the piano. In the soft tissue that forms the brain, there are approximately ten trillion synapses connecting roughly a hundred billion neurons. Active synapses become more sensitive; less active synapses die, but new ones grow quickly. This is relatively new thinking – just 30 years ago, neuroscientists believed that adult brain cells couldn't regenerate. One of the pioneers in this field is University of Wisconsin professor Richard Davidson. He studied Buddhist monks using brain scans in his research facility, and found that those trained in meditation had higher levels of activity in the left prefrontal cortex – the area associated with happiness. Davidson believes that the trained brain is physically different from the untrained one.</p>\n<p><strong>B</strong> The idea that we can train our brains to find more happiness has been called 'mindfulness' by neuropsychologist Rick Hanson, author of Hardwiring Happiness. It was in college that Hanson, quite unintentionally, first recognised the importance of something that would become his life's work. As an unconfident teenager, he discovered he could turn a small event, ‘a young woman smiling at me', into a good feeling he could hold on to. To do this, Hanson employs exactly the same imaginary 'video method' as psychiatrist Tony Fernando. ‘The brain takes its shape from what the mind rests upon,' says Hanson. If you keep resting your mind on self-criticism and worries, he argues, your brain will be shaped by that. Hanson explains that resting it on pleasant feelings and the things you have accomplished means that over time your brain will take on a different shape, with strength and optimism hard-wired into it.</p>\n<p><strong>C</strong> In New Zealand, the Mental Health Foundation runs mindfulness programmes in 14 schools. Foundation CEO Judi Clements says, 'It's a valuable approach because children are told to pay attention, but aren't told how to pay attention.' Preliminary results on the outcomes found that children had sustained increases in well-being. The Foundation recognises five pathways to happiness – being active, connecting with others, taking notice, learning and giving. And, says Clements, ‘We're detecting a hunger for it from different organisations and professions as well, so the Foundation is soon going to pilot an online “well-being game” in several workplaces.' The project leader is psychologist Carsten Grimm, who is interested in whether some pathways to happiness are more effective than others. In a study, Grimm recorded the activities and corresponding happiness scores of 173 people. What he found was that people who used several pathways to happiness achieved the best results, suggesting it's better to have a balance than concentrate on the single pathway you most identify with.</p>\n<p><strong>D</strong> However, Associate Professor of Psychological Medicine Nathan Consedine greets our relentless search for the secrets to happiness with a tired sigh. ‘The more you chase it, the less you get it,' he says, quoting studies showing those who value contentment and well-being are, in fact, less happy. The big question, he says, is whether there's any benefit in actively seeking happiness. He cites a study, for example, which showed that people who were happier were less inclined to show sympathy. Consedine says that's probably because happy people are strongly motivated to stay happy, but engaging sympathetically with others typically involves engaging with their distress, and that's going to reduce their own happiness. Consedine's not disagreeing with the theory of mindfulness, but believes there's more work to be done.</p>\n<p><strong>E</strong> Some of that work is being conducted at Auckland University's Centre for Brain Research. Associate Professor Johanna Montgomery has been studying Hanson's theory - that altering our brain activity at a synaptic level affects our behaviour. She accepts that it's a logical explanation based on studies from animals, but we haven't yet got the technology to prove it scientifically in humans. It's true that MRI scans certainly do indicate an increased flow of blood to different areas of the brain which are experiencing positive stimuli. However, she warns that this is a long way from confirming that the brain itself is developing or strengthening.</p>\n<p><strong>F</strong> Nonetheless, Montgomery believes she is making progress. In the laboratory, when scientists want to experiment with synaptic connections, they stimulate the brain with electricity, as this copies the high-frequency firings that happen normally in the brain every second. Using this technique, Montgomery has made a number of findings. For example, the hormones that are released routinely in response to good or bad situations – such as adrenaline – act to regulate the brain, in the same way that weather has a regulating effect on human activity more generally. But scientists understand some of these stimuli better than others. More is known about the impact on brain activity of prolonged periods of fear than the effects of ‘happiness' hormones that are released by positive events in life. This is one potentially important area that she hopes to investigate further in future.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
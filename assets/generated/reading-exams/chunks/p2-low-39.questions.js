@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-39", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 14–17</h4>\n<p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–F</strong>, in boxes 14–17 on your answer sheet.</em></p>\n<p><strong>NB</strong> You may use any letter more than once.</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> a reference to a fact that two scientists use the same technique to promote their own happiness</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> the suggestion that scientific opinion about an aspect of brain function has changed over a given time period</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> an estimate of how numerous some brain components are</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> the reason why some educational courses were set up</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-anchor\">\n<h4>Questions 18–21</h4>\n<p>Look at the following statements (Questions 18–21) and the list of people below.</p>\n<p>Match each statement with the correct person, <strong>A–F</strong>.</p>\n<div class=\"match-question-item\">\n<p><strong>18</strong> It's better to look for a variety of ways to increase happiness than focus on just one.</p>\n<div class=\"match-dropzone\" data-question=\"q5\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>19</strong> Focusing on personal achievements rather than negative experiences will make people happier.</p>\n<div class=\"match-dropzone\" data-question=\"q6\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>20</strong> Happy people might have a reason not to display one favourable characteristic.</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>21</strong> A range of groups are becoming more interested in learning techniques to improve happiness.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"options-pool\" id=\"people-options-pool\">\n<strong>List of People</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Tony Fernando</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Richard Davidson</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Rick Hanson</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Judi Clements</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Carsten Grimm</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F Nathan Consedine</div>\n</div>\n</div>\n</div>","allowOptionReuse":false},{"groupId":"group-3","kind":"summary_completion","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 22–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>Auckland University's Centre for Brain Research</h4>\n<p>\nAssociate Professor Johanna Montgomery says that current research into brain activity and behaviour only relates to <strong>22</strong> <input name=\"q9\" type=\"text\" id=\"q22_input\"> so Hanson's theories have not been proved correct. While scans do show that positive stimuli result in more <strong>23</strong> <input name=\"q10\" type=\"text\" id=\"q23_input\"> reaching parts of the brain, this isn't proof that the brain is getting stronger.\n</p>\n<p>\nBut Montgomery is making progress. In laboratory experiments, scientists use <strong>24</strong> <input name=\"q11\" type=\"text\" id=\"q24_input\"> to initiate brain activity, because it's similar to natural processes. One finding is that hormones can be compared to the <strong>25</strong> <input name=\"q12\" type=\"text\" id=\"q25_input\"> because both can change human behaviour. But scientists understand some stimuli, such as <strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\"> better than they understand more positive stimuli.\n</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
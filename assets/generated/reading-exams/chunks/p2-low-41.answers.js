@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-41", "answers", {"answerKey":{"q1":"vii","q2":"v","q3":"i","q4":"vi","q5":"iii","q6":"C","q7":"E","q8":"B","q9":"B","q10":"D","q11":"sunset","q12":"dreams","q13":"thieves"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-41", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-41","meta":{"title":"The Myth of the Eight-hour Sleep 八小时睡眠","category":"P2","frequency":"low","pdfFilename":"135. P2 - The Myth of the Eight-hour Sleep 八小时睡眠.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/135. P2 - The Myth of the Eight-hour Sleep 八小时睡眠/","legacyFilename":"135. P2 - The Myth of the Eight-hour Sleep 八小时睡眠.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/135. P2 - The Myth of the Eight-hour Sleep 八小时睡眠/135. P2 - The Myth of the Eight-hour Sleep 八小时睡眠.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/135. P2 - The Myth of the Eight-hour Sleep 八小时睡眠/135. P2 - The Myth of the Eight-hour Sleep 八小时睡眠.pdf","ieltsHtml":"IELTS/P2/The Myth of the Eight-hour Sleep.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.065Z","notes":"signature:text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-41", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 14–18</h4>\n<p>Reading Passage 2 has five sections, <strong>A–E</strong>.</p>\n<p>Choose the correct heading for each section from the list of headings below.</p>\n<p><em>Drag a heading from this list and drop it onto the correct section's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i Historical reasons why interrupted sleep became uncommon</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Brain structures involved in sleep patterns</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii Potential health issues related to sleep</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv Famous cases in literature of sleep problems</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v An analysis of old documents to discover sleep patterns</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi Biological and environmental factors preventing people from falling asleep again</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii Scientific evidence that divided sleep is a natural phenomenon</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q6","q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-10-anchor\">\n<h4>Questions 19–23</h4>\n<p>Look at the following statements (Questions 19–23) and the list of researchers below.</p>\n<p>Match each statement with the correct researcher, <strong>A–E</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>19</strong> In certain historical periods, the threat of criminal danger led to segmented sleep.</p>\n<div class=\"match-dropzone\" data-question=\"q6\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>20</strong> Physicians should learn more about treating people with sleeping difficulties.</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>21</strong> Historically, when people experienced interrupted sleep, they used the waking periods at night for different activities.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> Technological changes in Europe made people more likely to sleep through the night.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> The belief that humans should have a long continuous sleep can be psychologically harmful.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"options-pool\" id=\"researchers-options-pool\">\n<strong>List of Researchers</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Thomas Wehr</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Roger Ekirch</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Craig Koslofsky</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Gregg Jacobs</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Russell Foster</div>\n</div>\n</div>\n</div>","allowOptionReuse":true},{"groupId":"group-3","kind":"summary_completion","questionIds":["q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>Historical patterns of interrupted sleep</h4>\n<p>\nHistorical evidence seems to show that humans had common sleep patterns which were quite unlike today's eight hours of unbroken sleep each night. People habitually went to bed early, soon after <strong>24</strong> <input name=\"q11\" type=\"text\" id=\"q24_input\">, slept for a while, then woke up for a few hours of activity or perhaps to consider, for example, the meaning of their <strong>25</strong> <input name=\"q12\" type=\"text\" id=\"q25_input\">.\n</p>\n<p>\nThere was little else to do at home in the dark, since what little means of lighting they had, such as using candles, was costly. In 16th-century Europe, people tended to stay at home at night because they feared <strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\"> on largely unlit city streets. Once urban street lighting improved, nightlife in cities became popular, and recreational spots like coffee houses came to be considered fashionable. Consequently, sleeping patterns also began to change.\n</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-49", "answers", {"answerKey":{"q1":"iv","q2":"iii","q3":"vi","q4":"ii","q5":"v","q6":"B","q7":"D","q8":"D","q9":"species","q10":"respect","q11":"competition","q12":"urbanisation","q13":"ancestors"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-49", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 14–18</h4>\n<p>Reading Passage 2 has five sections, <strong>A–E</strong>.</p>\n<p>Choose the correct heading for each section from the list of headings below.</p>\n<p><em>Write the correct number, i–vii, in boxes 14–18 on your answer sheet. (Drag a heading from this list and drop it onto the correct section's answer box on the left.)</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i The desire to make expensive jewellery</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii The clues that indicate ancient items were decorative</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii Querying the changes in the value of traded items</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv A natural human talent</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v How status can be gained from ownership of goods</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi Recent finds alter theories about when consumerism started</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii Changes in research methods</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-anchor\">\n<h4>Questions 19–21</h4>\n<p>Choose the correct letter, A, B, C or D.</p>\n<p><em>Write the correct letter in boxes 19–21 on your answer sheet.</em></p>\n<div class=\"question-item\">\n<div class=\"mc-question\">\n<p><strong>19</strong> In section A, ‘reciprocity' refers to our ancestors' ability to</p>\n<ul class=\"mc-options\">\n<li><label><input type=\"radio\" name=\"q6\" value=\"A\"><strong>A</strong>keep written records of different goods traded</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"B\"><strong>B</strong>monitor the balance between goods given and received</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"C\"><strong>C</strong>produce more materials for trading purposes</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"D\"><strong>D</strong>make money from trading goods and services</label></li>\n</ul>\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"mc-question\">\n<p><strong>20</strong> What is said about the ochre found at Blombos Cave?</p>\n<ul class=\"mc-options\">\n<li><label><input type=\"radio\" name=\"q7\" value=\"A\"><strong>A</strong>It is of a type only found in this particular area.</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"B\"><strong>B</strong>It has all been dyed to give the same shade of red.</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"C\"><strong>C</strong>It has been perfectly preserved despite its age.</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"D\"><strong>D</strong>It appears it was selected for its colour.</label></li>\n</ul>\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"mc-question\">\n<p><strong>21</strong> What made the researchers realise the purpose of the beads found at Blombos Cave?</p>\n<ul class=\"mc-options\">\n<li><label><input type=\"radio\" name=\"q8\" value=\"A\"><strong>A</strong>They are of many different shapes and sizes.</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"B\"><strong>B</strong>They were found in large numbers, clustered together.</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"C\"><strong>C</strong>They have patterns in many different colours.</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"D\"><strong>D</strong>They have holes and markings suggesting they were joined together.</label></li>\n</ul>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 22–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>Why certain objects are valued?</h4>\n<p>\nSome researchers argue that we may use ownership of desirable goods to demonstrate our strength and fitness as other <strong>22</strong> <input type=\"text\" id=\"q22_input\" name=\"q9\"> use their attractive physical features. Showing off one's superiority is not a new phenomenon and even in ancient times successful people would have gained <strong>23</strong> <input type=\"text\" id=\"q23_input\" name=\"q10\"> from this. A desire for status could have led to an increase in the worth of prestige goods and to <strong>24</strong> <input type=\"text\" id=\"q24_input\" name=\"q11\"> among people wishing to achieve this status.\n</p>\n<p>\nIt is thought that our natural desire to trade provided a basis for organised farming and <strong>25</strong> <input type=\"text\" id=\"q25_input\" name=\"q12\"> development and finally resulted in the complex societies which can be seen today. Whilst we do not value things such as beads nowadays, other items hold the same appeal for us and bring the same status as owning beads did for our <strong>26</strong> <input type=\"text\" id=\"q26_input\" name=\"q13\">.\n</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-50", "answers", {"answerKey":{"q1":"E","q2":"A","q3":"F","q4":"G","q5":"C","q6":"E","q7":"A","q8":"B","q9":"eggs","q10":"monoculture","q11":"nets","q12":"temperature","q13":"prevention"}});
+})(typeof window !== "undefined" ? window : globalThis);
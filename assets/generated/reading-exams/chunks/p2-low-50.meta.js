@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-50", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-50","meta":{"title":"Jellyfish – The Dominant Species 水母·海洋中的优势物种","category":"P2","frequency":"low","pdfFilename":"143. P2 - Jellyfish – The Dominant Species 水母·海洋中的优势物种.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/143. P2 - Jellyfish – The Dominant Species 水母·海洋中的优势物种/","legacyFilename":"143. P2 - Jellyfish – The Dominant Species 水母·海洋中的优势物种.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/143. P2 - Jellyfish – The Dominant Species 水母·海洋中的优势物种/143. P2 - Jellyfish – The Dominant Species 水母·海洋中的优势物种.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/143. P2 - Jellyfish – The Dominant Species 水母·海洋中的优势物种/143. P2 - Jellyfish – The Dominant Species 水母·海洋中的优势物种.pdf","ieltsHtml":"IELTS/P2/Jellyfish – The Dominant Species.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.597Z","notes":"signature:radio,checkbox,text,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-50", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 14–17</h4>\n<p>Reading Passage 2 has seven sections, <strong>A–G</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–G</strong>, in boxes 14–17 on your answer sheet.</em></p>\n<p><strong>NB</strong> You may use any letter more than once.</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 250px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> a prediction as to the direction in which the jellyfish population may spread</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> a description of some physical characteristics of jellyfish</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> an account of the consequences of jellyfish as lone survivors</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> suggestions on how to avoid further jellyfish invasions</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"multi_choice","questionIds":["q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q5-6-anchor\">\n<h4>Questions 18 and 19</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>The list below gives some effects that jellyfish have had on the world. Which <strong>TWO</strong> of these effects are mentioned by the writer of the text?</p>\n<div class=\"checkbox-group\">\n<label><input type=\"checkbox\" name=\"q5-6\" value=\"A\"> A They have damaged the tourism industry in some areas.</label> <label><input type=\"checkbox\" name=\"q5-6\" value=\"B\"> B They have led to a reduction in the oceans' oxygen levels.</label> <label><input type=\"checkbox\" name=\"q5-6\" value=\"C\"> C They have contributed to the decline in the Black Sea anchovy population.</label> <label><input type=\"checkbox\" name=\"q5-6\" value=\"D\"> D They have caused the shrimp business in the Gulf of Mexico to shut down.</label> <label><input type=\"checkbox\" name=\"q5-6\" value=\"E\"> E They have created financial hardship in the fishing industry.</label>\n</div>\n</div>"},{"groupId":"group-3","kind":"multi_choice","questionIds":["q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q7-8-anchor\">\n<h4>Questions 20 and 21</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>Which <strong>TWO</strong> of the following are possible causes of an increase in jellyfish numbers?</p>\n<div class=\"checkbox-group\">\n<label><input type=\"checkbox\" name=\"q7-8\" value=\"A\"> A a shortage of small fish in the oceans</label> <label><input type=\"checkbox\" name=\"q7-8\" value=\"B\"> B the dumping of chemicals into the oceans</label> <label><input type=\"checkbox\" name=\"q7-8\" value=\"C\"> C a decline in biodiversity in the oceans</label> <label><input type=\"checkbox\" name=\"q7-8\" value=\"D\"> D more competition among other fish in the oceans</label> <label><input type=\"checkbox\" name=\"q7-8\" value=\"E\"> E a decrease in seabird populations</label>\n</div>\n</div>"},{"groupId":"group-4","kind":"summary_completion","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 22–26</h4>\n<p>Complete the sentences below.</p>\n<p>Write <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<p><strong>22</strong> Some fish in the oceans may be unable to sustain their population as the jellyfish eat their <input type=\"text\" id=\"q22_input\" name=\"q9\">.</p>\n<p><strong>23</strong> The state of jellyfish becoming the main ocean species has been named <input type=\"text\" id=\"q23_input\" name=\"q10\">.</p>\n<p><strong>24</strong> Increasing numbers of jellyfish can damage <input type=\"text\" id=\"q24_input\" name=\"q11\"> used for commercial fishing.</p>\n<p><strong>25</strong> Understanding basic facts about jellyfish, such as the <input type=\"text\" id=\"q25_input\" name=\"q12\"> of the ocean which suits them best, may help control their numbers.</p>\n<p><strong>26</strong> Richardson believes it is better to direct attention to <input type=\"text\" id=\"q26_input\" name=\"q13\"> instead of just trying to solve existing problems.</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-51", "answers", {"answerKey":{"q1":"pass rates","q2":"decade","q3":"Australia","q4":"C","q5":"B","q6":"D","q7":"E","q8":"H","q9":"E","q10":"G","q11":"C","q12":"F","q13":"B"}});
+})(typeof window !== "undefined" ? window : globalThis);
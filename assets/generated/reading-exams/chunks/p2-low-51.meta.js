@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-51", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-51","meta":{"title":"The gender gap in New Zealand’s high school examination results 新西兰考试成绩的性别差异","category":"P2","frequency":"low","pdfFilename":"144. P2 - The gender gap in New Zealand’s high school examination results 新西兰考试成绩的性别差异.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/144. P2 - The gender gap in New Zealand’s high school examination results 新西兰考试成绩的性别差异/","legacyFilename":"144. P2 - The gender gap in New Zealand’s high school examination results 新西兰考试成绩的性别差异.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/144. P2 - The gender gap in New Zealand’s high school examination results 新西兰考试成绩的性别差异/144. P2 - The gender gap in New Zealand’s high school examination results 新西兰考试成绩的性别差异.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/144. P2 - The gender gap in New Zealand’s high school examination results 新西兰考试成绩的性别差异/144. P2 - The gender gap in New Zealand’s high school examination results 新西兰考试成绩的性别差异.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-11T14:43:22.088Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-51", "questions", {"questionGroups":[{"groupId":"group-1","kind":"summary_completion","questionIds":["q1","q2","q3"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-anchor\">\n<h4>Questions 14–16</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>High school assessment in New Zealand</h4>\n<p>\nNew Zealanders are worried at the outcomes of their high school assessment system, because the <strong>14</strong> <input name=\"q1\" type=\"text\" id=\"q14_input\"> of girls are higher than those of boys by 10%. A gender gap has been apparent for over a <strong>15</strong> <input name=\"q2\" type=\"text\" id=\"q15_input\">. This situation is not unique to New Zealand, and has been noticed in <strong>16</strong> <input name=\"q3\" type=\"text\" id=\"q16_input\"> also.\n</p>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"table_completion","questionIds":["q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q4-5-6-7-anchor\">\n<h4>Questions 17–20</h4>\n<p>Reading Passage 2 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 200px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>17</strong> an advantage of New Zealand's secondary school tests</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>18</strong> a mention of current government initiatives to boost male achievement</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>19</strong> when gender difference in literacy skills first becomes evident</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td><td><input type=\"radio\" name=\"q6\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>20</strong> findings that relate academic achievement to race</td>\n<td><input type=\"radio\" name=\"q7\" value=\"A\"></td><td><input type=\"radio\" name=\"q7\" value=\"B\"></td><td><input type=\"radio\" name=\"q7\" value=\"C\"></td><td><input type=\"radio\" name=\"q7\" value=\"D\"></td><td><input type=\"radio\" name=\"q7\" value=\"E\"></td><td><input type=\"radio\" name=\"q7\" value=\"F\"></td><td><input type=\"radio\" name=\"q7\" value=\"G\"></td><td><input type=\"radio\" name=\"q7\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"},{"groupId":"group-3","kind":"matching","questionIds":["q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Questions 21–26</h4>\n<p>Look at the following people (Questions 21–26) and the list of statements below.</p>\n<p>Match each person with the correct statement, <strong>A–H</strong>.</p>\n<div class=\"match-question-item\">\n<p><strong>21</strong> Celia Lashlie</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> Steve Benson</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> Roger Moses</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>24</strong> Rob Burroughs</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>25</strong> Stuart Martin</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>26</strong> Paul Baker</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div class=\"options-pool\" id=\"statements-options-pool\">\n<strong>List of Statements</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Boys gain lower marks on NCEA if they attend an all-boys' school.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Boys are disadvantaged by girls tending to take over at school.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Good teaching is more important than whether classrooms are single-sex or mixed.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Mathematical skills were not so important in the past.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E The difference in achievement between schoolboys and girls is only evident in some subjects.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F Older boys are more motivated to study than younger boys.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G The NCEA exams have higher literacy standards than past exams did.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"H\">H The New Zealand government is reluctant to take action on behalf of boys.</div>\n</div>\n</div>\n</div>","allowOptionReuse":false}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
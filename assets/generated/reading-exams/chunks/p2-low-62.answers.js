@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-62", "answers", {"answerKey":{"q1":"E","q2":"B","q3":"F","q4":"C","q5":"A","q6":"E","q7":"B","q8":"E","q9":"D","q10":"C","q11":"smile","q12":"dialog","q13":"tools"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-64", "answers", {"answerKey":{"q1":"clay","q2":"water","q3":"straw","q4":"cow manure","q5":"950 degrees","q6":"60 minutes","q7":"TRUE","q8":"NOT GIVEN","q9":"FALSE","q10":"NOT GIVEN","q11":"C","q12":"B","q13":"A"}});
+})(typeof window !== "undefined" ? window : globalThis);
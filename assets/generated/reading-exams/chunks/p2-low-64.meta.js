@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-64", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-64","meta":{"title":"New filter promises clean water for millions 新型泥土净水器","category":"P2","frequency":"low","pdfFilename":"156. P2 - New filter promises clean water for millions 新型泥土净水器.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/156. P2 - New filter promises clean water for millions 新型泥土净水器/","legacyFilename":"156. P2 - New filter promises clean water for millions 新型泥土净水器.html","questionIntroHtml":""},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/156. P2 - New filter promises clean water for millions 新型泥土净水器/156. P2 - New filter promises clean water for millions 新型泥土净水器.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/156. P2 - New filter promises clean water for millions 新型泥土净水器/156. P2 - New filter promises clean water for millions 新型泥土净水器.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.623Z","notes":"signature:radio,text,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
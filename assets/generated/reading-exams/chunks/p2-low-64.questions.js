@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-64", "questions", {"questionGroups":[{"groupId":"group-1","kind":"diagram_completion","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Complete the flow-chart below.</p>\n<p>Write <strong>NO MORE THAN TWO WORDS AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"flow-chart\">\n<h4>Step-by-step guide to making Flynn's water filters</h4>\n<div class=\"step\">\nMake the mixture for the filter from organic material (e.g., tea, coffee, rice),<br>\n<strong>14</strong> <input type=\"text\" id=\"q1\" name=\"q1\"> and <strong>15</strong> <input type=\"text\" id=\"q2\" name=\"q2\">\n</div>\n<div class=\"arrow\">↓</div>\n<div class=\"step\">\nShape into pots and place them in a fire made from <strong>16</strong> <input type=\"text\" id=\"q3\" name=\"q3\"> and <strong>17</strong> <input type=\"text\" id=\"q4\" name=\"q4\">\n</div>\n<div class=\"arrow\">↓</div>\n<div class=\"step\">\nFuel the fire to reach a maximum temperature of <strong>18</strong> <input type=\"text\" id=\"q5\" name=\"q5\">\n</div>\n<div class=\"arrow\">↓</div>\n<div class=\"step\">\nRemove the filters from the fire.\n</div>\n<div class=\"arrow\">↓</div>\n<div class=\"step\">\nBake the filters in the fire for a maximum period of <strong>19</strong> <input type=\"text\" id=\"q6\" name=\"q6\">\n</div>\n</div>\n</div>"},{"groupId":"group-2","kind":"true_false_not_given","questionIds":["q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-anchor\">\n<h4>Questions 20–23</h4>\n<p>Do the following statements agree with the information given in Reading Passage 2?</p>\n<ul style=\"list-style: none; padding-left: 0;\">\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>20</strong> The clay in the Manatuto project was initially unsuitable for the purpose of the project.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>21</strong> Coffee grounds produce filters that are twice as efficient as those using other organic materials.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>22</strong> It takes half an hour for a cow manure fire to reach 950 degrees.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q9\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q9\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>23</strong> E. coli is the most difficult bacterium to remove from water by filtration.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q10\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q10\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"single_choice","questionIds":["q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>24</strong> The Manatuto project aimed to set up a</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"><span>A charitable trust.</span></label> <label><input name=\"q11\" type=\"radio\" value=\"B\"><span>B filtration experiment.</span></label> <label><input name=\"q11\" type=\"radio\" value=\"C\"><span>C water filter factory.</span></label> <label><input name=\"q11\" type=\"radio\" value=\"D\"><span>D community kiln.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>25</strong> To be effective, the Flynn filters must</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"A\"><span>A remove all dangerous pathogens.</span></label> <label><input name=\"q12\" type=\"radio\" value=\"B\"><span>B be a particular thickness.</span></label> <label><input name=\"q12\" type=\"radio\" value=\"C\"><span>C filter water as quickly as possible.</span></label> <label><input name=\"q12\" type=\"radio\" value=\"D\"><span>D be made from 100 per cent clay.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>26</strong> Flynn does not intend to patent his filter because he</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"><span>A wants it to be freely available.</span></label> <label><input name=\"q13\" type=\"radio\" value=\"B\"><span>B has produced a very simple design.</span></label> <label><input name=\"q13\" type=\"radio\" value=\"C\"><span>C cannot make a profit in poor countries.</span></label> <label><input name=\"q13\" type=\"radio\" value=\"D\"><span>D has already given the idea to a charity.</span></label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
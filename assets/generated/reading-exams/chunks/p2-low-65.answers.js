@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-65", "answers", {"answerKey":{"q1":"F","q2":"A","q3":"B","q4":"D","q5":"C","q6":"A","q7":"D","q8":"C","q9":"D","q10":"A","q11":"facade","q12":"escalators","q13":"atrium"}});
+})(typeof window !== "undefined" ? window : globalThis);
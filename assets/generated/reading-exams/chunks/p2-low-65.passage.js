@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-65", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Boring Buildings</h3>\n<p>There could be more than an economic or nostalgic price to impersonal retail and high-rise construction; boring architecture may take an emotional toll on the people forced to live with it.</p>\n<p><strong>A</strong> A growing body of research in cognitive science illuminates the physical and mental toll bland cityscapes take on residents. Generally, these researchers argue that humans are healthier when they live surrounded by variety or work in well-designed, unique spaces, rather than unattractive, generic ones. Urban policy professor Justin Hollander and architect Ann Sussman review scientific data to help architects and urban planners understand how, exactly, people respond to their built surroundings, particularly at work. People, they argue, function best in intricate settings, not ‘big, blank, boxy offices'.</p>\n<p><strong>B</strong> Indeed, that's what Colin Ellard, a neuroscientist at the University of Waterloo in Canada, has found in his work. Five years ago, Ellard became interested in a certain building—the gigantic Whole Foods Market ‘plopped into' a notoriously textured part of Lower Manhattan in New York. Ellard partnered with the Guggenheim Museum to analyze what happens when someone walks out of a tiny neighborhood restaurant and encounters a full city block with nothing but 'the long, blank facade of the Whole Foods Market building'.</p>\n<p>In 2011, Ellard led small groups on Lower East Side walks to measure the effect of the urban environment on them. Participants recorded their responses to questions at each stopping point and wore sensors that measured skin conductance, a response to emotional excitement. Passing the monolithic Whole Foods Market, people's state of arousal plummeted. Physiologically, Ellard explained, they were bored. To describe this place, they used words like 'bland' and 'passionless'. In contrast, one block east at the other test site—‘a lively sea of restaurants with lots of open doors and windows’—people measured high levels of excitement, and they listed words like ‘lively' and 'socializing'. Ellard explains that the main objective of urban design should be to produce some kind of novelty or change every few seconds; otherwise, we become cognitively disengaged.</p>\n<p><strong>C</strong> The trick, it seems, is to design a world that excites but doesn't overload our faculties with a constant barrage of information. ‘We are, as animals, programmed to respond to thrill,' said professor Brendan Walker. In Walker's ‘thrill laboratory' at the University of Nottingham in the UK, devices measure heart rate and skin conductance to see how people respond to adrenaline-producing experiences such as a roller-coaster ride. A thrilling encounter moves us quickly from a state of equilibrium to a desirable 'disorientation'. 'Humans want a certain element of turmoil or confusion,' he said. 'Complexity is thrilling whether in an amusement park or architecture.'</p>\n<p><strong>D</strong> Psychologists have found that awe-inspiring moments can potentially improve our well-being. One study conducted by Melanie Rudd, Kathleen Vohs and Jennifer Aaker of Stanford University in the US showed that the feeling of 'awe' can make people more patient and less materialistic. In an experiment, the researchers showed students 60-second clips of waterfalls, whales, or astronauts in space. After only a minute of virtual images, those who said they were awed also felt less pressed for time. And in another variation, people made hypothetical choices between physical and experiential goods of equal monetary value. Those who had just ‘felt awe' were more likely to choose an experience over a possession, a choice that is linked with greater satisfaction in the long run. In other words, a visual buzz—whether architectural or natural—might have the ability to change our frame of mind, making modern-day life more satisfying and interactive.</p>\n<p><strong>E</strong> It's important to note, however, that architectural boredom isn't about how pristine a street is. People often confuse successful architecture with whether an area looks pleasant. On the contrary, when it comes to city buildings, people often focus too narrowly on aesthetics, said Charles Montgomery, author of <em>Happy City: Transforming Our Lives Through Urban Design</em>. Some of the happiest blocks in New York City, he argues, are 'kind of ugly and messy'.</p>\n<p>In 2014, Montgomery's Happy City Lab conducted an experiment in which he found a strong correlation between messier blocks and pro-social behavior. Montgomery sent researchers, posing as lost tourists, to places he coded as either 'active' or 'inactive' facades. He concluded that the former had a high level of interest—that is, they were messy—while the latter had no special features such as long warehouse blocks. Pedestrians at active sites were nearly five times more likely to offer assistance than at inactive ones. Of those who assisted, seven times as many at the active site offered use of their phones.</p>\n<p><strong>F</strong> Fortunately, it's not necessarily a dichotomy—new architecture can achieve the optimal level of cacophony and beauty. Take the 2006 Hearst Tower in midtown Manhattan. Designed by architect Norman Foster, Hearst Tower is a glass-and-steel skyscraper, 40 stories of which are designed in a triangular pattern, differing in style from the 1920s Art Deco base. From the outside, the facade jolts city dwellers from their daily commutes, while energizing employees who enter it each morning. For many who walk by, Hearst Tower's design may not be the easiest to understand; it's both sleek and old. The top looks like it traveled from the future. Inside, workers travel upon diagonal escalators, up a three-story water sculpture, through the tower's historic atrium, flooded with light. Few New Yorkers who pass by would find this building boring. And they're likely to be happier—maybe even nicer to each other—because of it.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
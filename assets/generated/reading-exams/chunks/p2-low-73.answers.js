@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-73", "answers", {"answerKey":{"q1":"D","q2":"B","q3":"F","q4":"C","q5":"A","q6":"E","q7":"E","q8":"C","q9":"F","q10":"B","q11":"amygdala","q12":"unpleasant","q13":"childhood"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-73", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-73","meta":{"title":"The Power of Smell 嗅觉的力量","category":"P2","frequency":"low","pdfFilename":"164. P2 - The Power of Smell 嗅觉的力量.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/164. P2 - The Power of Smell 嗅觉的力量/","legacyFilename":"164. P2 - The Power of Smell 嗅觉的力量.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/164. P2 - The Power of Smell 嗅觉的力量/164. P2 - The Power of Smell 嗅觉的力量.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/164. P2 - The Power of Smell 嗅觉的力量/164. P2 - The Power of Smell 嗅觉的力量.pdf","ieltsHtml":"IELTS/P2/The Power of Smell.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.118Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-73", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>The Power of Smell</h2>\n<h4>Research shows that our olfactory sense is more influential than we realise</h4>\n<p><strong>A</strong> Dogs' noses are renowned for sensitivity to smells, while human noses are thought to be poor by comparison, yet that might be a misconception. According to recent studies, our noses are in fact acutely sensitive instruments that guide our everyday lives to a surprising extent. Subtle smells can change your mood, behaviour and the choices you make, often without you realising it. Our own odours, meanwhile, indicate emotional states such as fear or sadness to those around us. The big mystery is why we aren't more aware of our nasal activity. Noses have certainly never been at the forefront of sensory research, and were pushed aside until recently in favour of the seemingly more vital senses of vision and hearing. ‘There has been a lot of prejudice that people are not that influenced by olfactory stimuli, especially compared to other mammals,' says Lilianne Mujica-Parodi, who studies the neurobiology of human stress at Stony Brook University in New York, in the United States.</p>\n<p><strong>B</strong> One of the first people to assert the relative unimportance of human smelling was Pierre Paul Broca, an influential 19th-century anatomist. After comparing the proportion of the brain devoted to smell in different animals, he suggested that mammals can be classed into two broad groups: macrosmatic mammals, such as dogs, have a finely tuned sense of smell which they rely on to perceive the world, while we, along with other primates and the marine mammals, are microsmatic – we have small olfactory organs that we only rely on to a small extent. That idea seemed to fit with more recent studies which found that the majority of mammals have genes coding for about 1000 different types of smell receptor. Most of these genes aren't expressed in humans, giving our noses just 400 different types of receptor.</p>\n<p><strong>C</strong> Yet these findings may have been misleading. Brain scans now show that more of the brain is devoted to smell processing than Broca's anatomical studies suggested. And although we may have fewer types of receptor than other mammals, Charles Greer at Yale University in the United States has shown that the human nose and brain are unusually well connected, with each group of receptors linking to many more neural regions than is the case in other animals. That should give us a good ability to process incoming scents. Once researchers began looking, they found the nose to be far more sensitive than its reputation suggested. One study, for example, found that we can detect certain chemicals diluted in water to less than one part per billion. That means that a person can detect just a few drops of a strong smell like ethyl mercaptan in an Olympic-sized pool.</p>\n<p><strong>D</strong> 'We are also exceptionally gifted at telling smells apart, even in the case of two molecules whose only difference is that their structures are mirror images of one another. That is fantastic sensitivity,' says George Dodd, a perfumer and researcher at the olfaction group of the University of Warwick, in the United Kingdom. What's more, it's becoming clear that the brain's olfactory centres are intimately linked to its limbic system, which is involved in emotion, fear and memory. That suggests a link between smell and the way we think.</p>\n<p><strong>E</strong> The power of smell will be no news to estate agents, who often advocate the smell of baking bread or brewing coffee to promote the sale of a house. But there are more subtle and surprising effects too. When Hendrik Schifferstein and colleagues, from Delft University of Technology in the Netherlands, pumped the smell of orange, seawater or peppermint into a nightclub, the revellers danced more, rated their night as more enjoyable, and even thought the music was better than when there was no added scent. Meanwhile, Rob Holland, of the University of Utrecht in the Netherlands, found that the hint of aroma wafting out of a hidden bucket of citrus-scented cleaner was enough to persuade students in a hostel to clean up after themselves.</p>\n<p><strong>F</strong> Other work has found that scent can influence our cognitive skills. A study by William Overman and colleagues at the University of North Carolina in the United States found that when men were subjected to a novel smell – either good or bad – during a task used to test decision-making skills, they performed significantly worse than normal. The researchers conclude the scent stimulated brain areas connected with emotion, making their decisions emotional rather than rational.</p>\n<p><strong>G</strong> Smells are especially good memory evokers, but it is actually a myth that odours trigger more detailed memories than other stimuli. ‘The memory is not more accurate and you don't remember more details,' says Yaara Yeshurun at the Weizmann Institute of Science in Rehovot, Israel, ‘but it is unique in that it is more emotional.' This isn't surprising when you consider that there are certain brain areas dedicated to both emotion and olfaction, such as the amygdala, and there is a strong link between emotion and memory. In 2009, Yeshurun found that the link between a memory and a smell is stronger if the smell is unpleasant rather than pleasant. She also discovered that the very first time we attach a smell to an object, it evokes a much greater response in our brains than for any subsequent encounter with the smell or object, laying down stronger foundations for the memory. That doesn't happen with any other sense. Since those first encounters with a smell would have happened at a young age, this explains why smells often transport us back to our childhood.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
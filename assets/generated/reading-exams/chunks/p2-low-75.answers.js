@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-75", "answers", {"answerKey":{"q1":"ii","q2":"iv","q3":"vii","q4":"viii","q5":"x","q6":"vi","q7":"iii","q8":"craft production","q9":"multi-skilled","q10":"manufacturing space","q11":"just-in-time","q12":["defects","abnormalities"],"q13":"lights"}});
+})(typeof window !== "undefined" ? window : globalThis);
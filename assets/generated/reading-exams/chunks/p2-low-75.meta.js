@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-75", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-75","meta":{"title":"Lean Production Innovation 精益生产","category":"P2","frequency":"low","pdfFilename":"166. P2 - Lean Production Innovation 精益生产.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/166. P2 - Lean Production Innovation 精益生产/","legacyFilename":"166. P2 - Lean Production Innovation 精益生产.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/166. P2 - Lean Production Innovation 精益生产/166. P2 - Lean Production Innovation 精益生产.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/166. P2 - Lean Production Innovation 精益生产/166. P2 - Lean Production Innovation 精益生产.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-11T14:43:22.121Z","notes":"signature:text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
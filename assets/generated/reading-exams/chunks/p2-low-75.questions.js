@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-75", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 14–20</h4>\n<p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i &nbsp; Global resistance to lean manufacturing</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii &nbsp; The historical context</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii &nbsp; Procedures for controlling quality</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv &nbsp; The pros and cons of different production systems</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v &nbsp; The impact on profits</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi &nbsp; Procedures for controlling supply</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii &nbsp; The origin of the term</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii &nbsp; A crucial difference in levels of quality</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix &nbsp; Working conditions</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"x\">x &nbsp; Interdependent strategies for controlling expenditure</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Questions 21–26</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>NO MORE THAN THREE WORDS</strong> from the passage for each answer.</p>\n<div class=\"sentence-completion-item\">\n<label for=\"q8\"><strong>21</strong> A small number of unusual cars are still produced by the <input type=\"text\" id=\"q8\" name=\"q8\"> method.</label>\n</div>\n<div class=\"sentence-completion-item\">\n<label for=\"q9\"><strong>22</strong> Lean production requires staff who are <input type=\"text\" id=\"q9\" name=\"q9\">.</label>\n</div>\n<div class=\"sentence-completion-item\">\n<label for=\"q10\"><strong>23</strong> Lean production employs fewer people, and uses less <input type=\"text\" id=\"q10\" name=\"q10\">, equipment and time.</label>\n</div>\n<div class=\"sentence-completion-item\">\n<label for=\"q11\"><strong>24</strong> Storage facilities are not needed if a procedure known as <input type=\"text\" id=\"q11\" name=\"q11\"> is implemented in the lean production method.</label>\n</div>\n<div class=\"sentence-completion-item\">\n<label for=\"q12\"><strong>25</strong> Autonomation is a procedure for spotting any <input type=\"text\" id=\"q12\" name=\"q12\"> in the products on a production line.</label>\n</div>\n<div class=\"sentence-completion-item\">\n<label for=\"q13\"><strong>26</strong> At Toyota factories, <input type=\"text\" id=\"q13\" name=\"q13\"> are suspended above manual production lines in order to show where production has to be halted.</label>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-77", "answers", {"answerKey":{"q1":"North America","q2":"overkill model","q3":"hunting","q4":"deadly disease","q5":"empirical evidence","q6":"climate instability","q7":"communities","q8":"B","q9":"C","q10":"B","q11":"A","q12":"B","q13":"C"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-77", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-77","meta":{"title":"Mammoth Kill 猛犸象的灭绝","category":"P2","frequency":"low","pdfFilename":"168. P2 - Mammoth Kill 猛犸象的灭绝.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/168. P2 - Mammoth Kill 猛犸象的灭绝/","legacyFilename":"168. P2 - Mammoth Kill 猛犸象的灭绝.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/168. P2 - Mammoth Kill 猛犸象的灭绝/168. P2 - Mammoth Kill 猛犸象的灭绝.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/168. P2 - Mammoth Kill 猛犸象的灭绝/168. P2 - Mammoth Kill 猛犸象的灭绝.pdf","ieltsHtml":"IELTS/P2/Mammoth Kill.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.125Z","notes":"signature:text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-77", "questions", {"questionGroups":[{"groupId":"group-1","kind":"summary_completion","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 14–20</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<p>\nThree theories have been put forward to explain the disappearance of the different species of large mammals that inhabited <strong>14</strong> <input name=\"q1\" type=\"text\" id=\"q14_input\"> 11,000 years ago. The <strong>15</strong> <input name=\"q2\" type=\"text\" id=\"q15_input\">, proposed around fifty years ago by Paul S. Martin, blames <strong>16</strong> <input name=\"q3\" type=\"text\" id=\"q16_input\"> by people for mass extinction. Computer calculations seem to support this explanation, but critics question the reliability of the figures they are based on.\n</p>\n<p>\nThe second theory suggests that humans introduced a <strong>17</strong> <input name=\"q4\" type=\"text\" id=\"q17_input\"> which wiped out the large mammals. However, so far this theory also lacks any <strong>18</strong> <input name=\"q5\" type=\"text\" id=\"q18_input\">.\n</p>\n<p>\nThe final theory suggests that this period experienced significant <strong>19</strong> <input name=\"q6\" type=\"text\" id=\"q19_input\">, which eventually led to the loss of habitat and to the division of the <strong>20</strong> <input name=\"q7\" type=\"text\" id=\"q20_input\"> that some of the large mammals had organized.\n</p>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Questions 21–26</h4>\n<p>Look at the following statements (Questions 21–26) and the list of people below.</p>\n<p>Match each statement with the correct person, <strong>A, B</strong> or <strong>C</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>21</strong> Too little evidence exists to support the hunting theory.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> The bigger the animal, the bigger the territory it requires for survival.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> Globally, humans have been indirectly responsible for the elimination of many species.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>24</strong> Population estimates can be used to understand how large mammals became extinct.</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>25</strong> Scientific examination of fossil remains may provide some proof for one of the theories.</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>26</strong> Environmental changes negatively affected the social groupings of some large species.</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div class=\"options-pool\" id=\"researcher-options-pool\">\n<strong>List of People</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"person-A\" draggable=\"true\" data-option=\"A\">A John Alroy</div>\n<div class=\"drag-item\" id=\"person-B\" draggable=\"true\" data-option=\"B\">B Ross D. E. MacPhee</div>\n<div class=\"drag-item\" id=\"person-C\" draggable=\"true\" data-option=\"C\">C Russell W. Graham</div>\n</div>\n</div>\n</div>","allowOptionReuse":true}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
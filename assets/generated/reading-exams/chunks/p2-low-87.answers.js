@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-87", "answers", {"answerKey":{"q1":"vii","q2":"iv","q3":"i","q4":"iii","q5":"ix","q6":"v","q7":"D","q8":"E","q9":"C","q10":"A","q11":"B","q12":"E","q13":"obligatory","q14":"commuters","q15":"paintings","q16":"topics"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-87", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-87","meta":{"title":"1025纸笔Speaking of Nothing [Pretest] 闲聊的意义","category":"P2","frequency":"low","pdfFilename":"177. 1025纸笔P2 - Speaking of Nothing [Pretest] 闲聊的意义.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/177. 1025纸笔P2 - Speaking of Nothing [Pretest] 闲聊的意义/","legacyFilename":"177. 1025纸笔P2 - Speaking of Nothing [Pretest] 闲聊的意义.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/177. 1025纸笔P2 - Speaking of Nothing [Pretest] 闲聊的意义/177. 1025纸笔P2 - Speaking of Nothing [Pretest] 闲聊的意义.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/177. 1025纸笔P2 - Speaking of Nothing [Pretest] 闲聊的意义/177. 1025纸笔P2 - Speaking of Nothing [Pretest] 闲聊的意义.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-11T14:43:22.158Z","notes":"signature:text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
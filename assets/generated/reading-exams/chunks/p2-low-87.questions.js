@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-87", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6","q14","q15","q16"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i How sounds and physical contact strengthen social connections</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii A cross-cultural study of superficial interaction</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii An experiment that led to surprising results</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv A study that categorised types of spoken exchanges</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v The personality types that find small talk more difficult</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi The effect of social media on conversation skills</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii Some occupations involve little or no interesting conversation</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii A campaign to improve interaction in the workplace</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix A range of common situations that were enhanced by small talk</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q7","q8","q9","q10","q11","q12"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-11-12-anchor\">\n<h4>Questions 20–25</h4>\n<p>Look at the following statements (Questions 20–25) and the list of people below.</p>\n<p>Match each statement with the correct person, <strong>A–E</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>20</strong> Interacting socially is preferable to hurrying through a transaction.</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>21</strong> If someone is truly uninterested in the wider world, they'll find small talk more difficult.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> People who had been unwilling to start a conversation ended up enjoying a social exchange.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> People whose conversations are mainly of a personal and meaningful nature are more satisfied with their lives.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>24</strong> There is more than one species whose members communicate for social reasons.</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>25</strong> Some people find it easier than others to change the subject of a conversation.</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"options-pool\" id=\"researcher-options-pool\">\n<strong>List of Researchers</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Matthias R. Mehl and Simine Vazire</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Ipek Kulahci</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Nicholas Epley and Juliana Schroeder</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Gillian Sandstrom and Elizabeth Dunn</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Todd Kashdan</div>\n</div>\n</div>\n</div>","allowOptionReuse":true},{"groupId":"group-3","kind":"sentence_completion","questionIds":["q13","q14","q15","q16"],"bodyHtml":"<div class=\"group\" id=\"q13-14-15-16-anchor\">\n<h4>Questions 26–29</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"sentence-completion\">\n<p><strong>26</strong> In the case of salespeople, some meaningless small talk is <input name=\"q13\" type=\"text\" id=\"q26_input\"> when dealing with customers.</p>\n<p><strong>27</strong> In a study that took place on a train, volunteers approached people who were regular <input name=\"q14\" type=\"text\" id=\"q27_input\">.</p>\n<p><strong>28</strong> In an experiment in an art gallery, people related more to the <input name=\"q15\" type=\"text\" id=\"q28_input\"> when they were drawn into a conversation.</p>\n<p><strong>29</strong> Introverted people found it helpful to be given <input name=\"q16\" type=\"text\" id=\"q29_input\"> which they could use to start conversations.</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14","q15","q16"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26","q14":"27","q15":"28","q16":"29"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-94", "answers", {"answerKey":{"q1":"B","q2":"A","q3":"G","q4":"C","q5":"A","q6":"A","q7":"C","q8":"D","q9":"A","q10":"brains","q11":"cat","q12":"anxiety","q13":"ball"}});
+})(typeof window !== "undefined" ? window : globalThis);
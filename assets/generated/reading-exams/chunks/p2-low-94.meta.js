@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-94", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-94","meta":{"title":"The importance of being playful 玩耍的重要性","category":"P2","frequency":"low","pdfFilename":"183. P2 - The importance of being playful 玩耍的重要性.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/183. P2 - The importance of being playful 玩耍的重要性/","legacyFilename":"183. P2 - The importance of being playful 玩耍的重要性.html","questionIntroHtml":"<h3>Questions 14–18</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/183. P2 - The importance of being playful 玩耍的重要性/183. P2 - The importance of being playful 玩耍的重要性.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/183. P2 - The importance of being playful 玩耍的重要性/183. P2 - The importance of being playful 玩耍的重要性.pdf","ieltsHtml":"IELTS/P2/The importance of being playful.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.181Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
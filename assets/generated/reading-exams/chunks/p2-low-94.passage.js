@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-94", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>The importance of being playful</h2>\n<h4>Free play makes us better adjusted, smarter and less stressed</h4>\n<p><strong>A</strong> While it has long been recognized that play affords benefits that last through adulthood, psychologists in the US are now becoming concerned that lack of play could actually be harming their country's kids. In the past, few children grew up without ample free-play time. But youngsters' leisure hours are now filled with structured activities such as music lessons and sports. Kids play soccer, Scrabble and saxophone – so why are experts worried that these activities are eating into free play? Most games are fun and sources of learning experiences – fostering group cohesion, for instance, says educational psychologist Anthony Pellegrini. But, Pellegrini explains, “games have predetermined rules - set up in advance and followed. Play, on the other hand, does not have rules, so affords more creative responses. Children initiate and create free play, and use their imagination to try out new activities and roles.”</p>\n<p><strong>B</strong> Perhaps most crucially, play helps us develop strong social skills. “You don't become socially competent via teachers telling you how to behave,” Pellegrini says. “Kids learn those skills by interacting with peers, learning what is and isn't acceptable. They want this thing to keep going, so they're willing to 'go the extra mile' to accommodate their playmates' desires. Keeping things friendly requires communication – arguably the most valuable social skill of all. Play among peers is the most important in this regard.” Studies show that children use more sophisticated language when playing with other children than when playing with adults. In pretend play, for instance, they have to communicate about something that's not physically present, so they have to use complicated language to communicate what it is that they're trying to say,” Pellegrini explains.</p>\n<p><strong>C</strong> If play helps children become socialized, then lack of play should impede social development – and research suggests that it does. A study of children in Michigan revealed that kids who enrolled in play-oriented preschools were more socially adjusted later in life – and less likely to commit a felony or be suspended from work – than kids who attended play-free preschools where they were constantly instructed by teachers.</p>\n<p><strong>D</strong> A 2003 study even suggests that play promotes emotional and social development in animals. Researchers allowed thirteen rats to play freely with companions for three and a half days, and kept fourteen others isolated for the same period. Examination revealed that the brains of the rats which had played contained much higher levels of BDNF a protein that stimulates the growth of new neurons than those of the animals that had not. \"I think play is the major mechanism whereby higher regions of the brain get socialized,” says neuroscientist Jaak Panksepp, who co-authored the study.</p>\n<p><strong>E</strong> Research also suggests that imaginative play is critical for children's emotional health, as it enables them to work through anxiety. In a 1984 study, researchers assessed the anxiety levels of seventy-four children on their first day of preschool. They labeled each child as either “anxious” or “not anxious”, then randomly split the kids into groups. Half were escorted to rooms full of toys, where they played for 15 minutes; the other half listened to a teacher tell a story for 15 minutes. Afterward, their levels were assessed again. The anxiety levels of the anxious kids who had played had dropped by more than twice as much compared with the anxious kids who had listened to the story.</p>\n<p><strong>F</strong> Results of animal studies support these views. In 2008, neuroscientist Stephen Siviy put rats into a chamber and exposed them to a collar previously worn by a cat, making them visibly anxious. Later, the chamber was cleaned to remove the cat odor, and the rats were put back without the collar. They immediately became anxious again, probably because they associated the space with the cat. The researchers then introduced another rat one that had never been exposed to the collar and was not afraid – and it began playing with one of the rats. “Shortly thereafter, the first rat relaxed and became calm,\" says Siviy, “suggesting that play helped lessen its anxiety.\"</p>\n<p><strong>G</strong> Play even appears to make kids smarter. In a classic study, researchers told a group of preschool children to play freely with some common objects such as paper towels, a screwdriver, a wooden board and paper clips. Another group was asked to imitate an experimenter using the objects in common ways. A third set was told to sit and draw whatever they wanted, without seeing the objects. After 10 minutes, the researchers asked the children to come up with ideas for how one of the objects could be used. The kids who had played with the objects named, on average, three times as many nonstandard, creative uses for the objects as those in either of the other two groups did, suggesting that play fosters imaginative thinking.</p>\n<p><strong>H</strong> A later animal study produced similar results. Experimenters isolated young rats during the development period when they would have most frequently played. The researchers taught these rats, and a group that had been allowed to play without constraints, to pull a rubber ball out of the way to get a food treat. A few days later they switched the setup so the rats would have to push the same ball to get the treat. Compared with the isolated rats, the ones which had played proved to be far more adept at solving problems. “Play is like a kaleidoscope,” says evolutionary biologist Marc Bekoff, “in that it is random and creative. It encourages flexibility and creativity that may, in the future, be advantageous in unexpected situations or new environments. And in the absence of play, children miss vital learning experiences.”</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
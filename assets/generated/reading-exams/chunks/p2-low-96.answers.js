@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-96", "answers", {"answerKey":{"q1":"D","q2":"E","q3":"C","q4":"D","q5":"G","q6":"F","q7":"A","q8":"A","q9":"D","q10":"B","q11":"E","q12":"fatigue","q13":"insomnia","q14":"emergency","q15":"depression","q16":"dreams"}});
+})(typeof window !== "undefined" ? window : globalThis);
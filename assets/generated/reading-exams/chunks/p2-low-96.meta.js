@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-96", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-low-96","meta":{"title":"[Pretest] Why Do We Need Sleep 睡眠的目的","category":"P2","frequency":"low","pdfFilename":"185. [Pretest] P2 - Why Do We Need Sleep 睡眠的目的.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/185. [Pretest] P2 - Why Do We Need Sleep 睡眠的目的/","legacyFilename":"185. [Pretest] P2 - Why Do We Need Sleep 睡眠的目的.html","questionIntroHtml":""},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/185. [Pretest] P2 - Why Do We Need Sleep 睡眠的目的/185. [Pretest] P2 - Why Do We Need Sleep 睡眠的目的.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/185. [Pretest] P2 - Why Do We Need Sleep 睡眠的目的/185. [Pretest] P2 - Why Do We Need Sleep 睡眠的目的.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.671Z","notes":"signature:radio,checkbox,text,textarea,select,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
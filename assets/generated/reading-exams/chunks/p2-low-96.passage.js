@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-96", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>Why Do We Need Sleep?</h2>\n<p class=\"passage-paragraph\"><strong>A</strong> According to the United States (U.S.) Centers for Disease Control and Prevention (CDC), more than 80 million American adults are chronically sleep deprived, meaning they sleep less than the recommended minimum of seven hours a night. The resulting fatigue contributes to more than a million auto accidents each year, as well as to a significant number of medical errors. Even small adjustments in sleep can be problematic. On the Monday after a daylight-saving time change in the U.S.—when the clocks are moved ahead one hour—there is a 24 percent increase in heart attacks and a jump in fatal car crashes, compared with other Mondays.</p>\n<p class=\"passage-paragraph\"><strong>B</strong> During their lifetimes, about a third of Americans will suffer from at least one of the recognized sleep disorders. They range from common sleep disorders to much rarer and stranger conditions such as sleep apnea and restless leg syndrome. For example, in exploding head syndrome, booming noises seem to reverberate in your brain as you try to sleep. Also, people with Kleine-Levin syndrome will, every few years, sleep nearly nonstop for a week or two. However, insomnia is by far the most prevalent of these problems and the main reason 4 percent of U.S. adults take sleeping pills in any given month.</p>\n<p class=\"passage-paragraph\"><strong>C</strong> Evolution endowed us with sleep that is flexible in its timing and easily disturbed, so that attention can be directed to higher priorities. The brain has an automatic override system that can wake us in all stages of sleep when it perceives an emergency like the cry of a child. But the problem is that, in the modern world, our ancient innate wake-up call is constantly triggered by something that is non-life-threatening, like worrying before an exam or the unexpected sound of a car alarm. Before the Industrial Revolution, which brought us alarm clocks and fixed work schedules, we could often counteract a sleep deficit by simply sleeping in. That is no longer possible.</p>\n<p class=\"passage-paragraph\"><strong>D</strong> The first segment of the brain that begins to fail when we don't get enough sleep is the prefrontal cortex, the center of decision-making and problem-solving. Dr Chiara Cirelli, a neuroscientist in the U.S., suggests that, ‘Every cognitive function to some extent seems to be affected by sleep loss,' and she comments that people are often more irritable, moody, and irrational. For instance, sleep-deprived suspects held by the police will often confess to anything in exchange for rest. Other research has also found that people who regularly sleep less than six hours a night have an elevated risk of developing depression, as well as other mental and physical illnesses. In fact, lack of sleep has been directly tied to obesity: without enough sleep, the stomach and other organs overproduce ghrelin, the hunger hormone, causing us to eat more. However, proving a cause-and-effect relationship in this case is challenging because subjecting humans to the necessary experiments is unethical.</p>\n<p class=\"passage-paragraph\"><strong>E</strong> NREM (Non-Rapid Eye Movement) makes up the first of two distinct and repetitive phases of a night's sleep. As we fall into NREM sleep, our brain stays active and begins an editing process—deciding which memories to keep and which ones to ignore. The first of NREM's four stages is called the shallow end of sleep and is characterized by a distinctive regular pattern of brain activity, as shown on an EEG (electroencephalogram) device—a machine that measures electrical impulses. In stage two, the EEG measures electric sparks that strike the cerebral cortex (grey matter covering the outer layer of the brain) in regular half-second intervals. Researchers believe that this electrical activity helps the cortex preserve and store recently acquired information. Stages three and four have been described as a deep, coma-like sleep that is as essential to our brain as food is to our body. In stage three, big, rolling waves of brain activity as measured on an EEG are present less than half the time; in stage four, more than half the time. It's in this deep sleep that our cells produce most growth hormone, which is needed throughout life to service bones and muscles.</p>\n<p class=\"passage-paragraph\"><strong>F</strong> REM (Rapid Eye Movement) sleep was at first believed to be only a variation of a stage in NREM sleep, and not particularly significant. However, once scientists documented the distinctive eye movements in REM, and found that virtually all dreaming takes place during this period, REM sleep was recognized as the second major phase of sleep. Today, scientists believe that the content of our approximately two hours of dreams each night in REM sleep is important in the processing of new memories. Some sleep theorists argue that REM sleep is when we are our most intelligent, insightful, creative, and free. It's when we truly come alive. ‘REM sleep may be the thing that makes us the most human, both for what it does for the brain and body, and for the sheer experience of it,' says Professor Michael Perlis.</p>\n<p class=\"passage-paragraph\"><strong>G</strong> The problem of sleep loss is not easily solved—whether by power naps or pharmaceuticals. Dr Jeffrey Ellenbogen, a sleep scientist at Johns Hopkins University in the U.S., argues, ‘It's tempting to manipulate sleep with drugs or devices, but we don't yet understand sleep enough to risk artificially manipulating the parts.' Dr Ellenbogen and other experts argue against shortcuts, especially the notion that we can mostly do without sleep. In fact, Dr Steven Lockley, of Brigham and Women's Hospital in Boston, suggests that sleep may be more essential to us than food.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-low-96", "questions", {"questionGroups":[{"groupId":"group-1","kind":"short_answer","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 17–23</h4>\n<p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–G</strong>, on your answer sheet.</em></p>\n<div id=\"paragraph-matching\">\n<div class=\"question-item\">\n<p><strong>17</strong> an example of how sleeplessness can influence a person accused of a crime</p>\n<div class=\"paragraph-options\">\n<select id=\"q1\" name=\"q1\"><option value=\"\">Select</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option></select>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>18</strong> a description of recordings of different types of brain activity during sleep</p>\n<div class=\"paragraph-options\">\n<select id=\"q2\" name=\"q2\"><option value=\"\">Select</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option></select>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>19</strong> a description of how present-day society interrupts sleep</p>\n<div class=\"paragraph-options\">\n<select id=\"q3\" name=\"q3\"><option value=\"\">Select</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option></select>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>20</strong> information about the relationship between being overweight and sleep</p>\n<div class=\"paragraph-options\">\n<select id=\"q4\" name=\"q4\"><option value=\"\">Select</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option></select>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>21</strong> a suggestion that medication is an ineffective solution for sleeping problems</p>\n<div class=\"paragraph-options\">\n<select id=\"q5\" name=\"q5\"><option value=\"\">Select</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option></select>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>22</strong> a discovery that changed ideas about how sleep is understood</p>\n<div class=\"paragraph-options\">\n<select id=\"q6\" name=\"q6\"><option value=\"\">Select</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option></select>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>23</strong> examples of the life-threatening consequences of inadequate sleep</p>\n<div class=\"paragraph-options\">\n<select id=\"q7\" name=\"q7\"><option value=\"\">Select</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option></select>\n</div>\n</div>\n</div>\n</div>"},{"groupId":"group-2","kind":"multi_choice","questionIds":["q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q8-9-anchor\">\n<h4>Questions 24 and 25</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>Which <strong>TWO</strong> of these statements describe characteristics of NREM sleep?</p>\n<div class=\"checkbox-options\" data-group=\"q8-9\" data-limit=\"2\">\n<label><input name=\"q8-9\" type=\"checkbox\" value=\"A\"><span><strong>A</strong> NREM sleep is important for maintaining brain function.</span></label> <label><input name=\"q8-9\" type=\"checkbox\" value=\"B\"><span><strong>B</strong> NREM sleep consists of two distinct parts.</span></label> <label><input name=\"q8-9\" type=\"checkbox\" value=\"C\"><span><strong>C</strong> The brain remains passive throughout NREM sleep.</span></label> <label><input name=\"q8-9\" type=\"checkbox\" value=\"D\"><span><strong>D</strong> Each stage of NREM sleep has a unique EEG pattern.</span></label> <label><input name=\"q8-9\" type=\"checkbox\" value=\"E\"><span><strong>E</strong> Hormones are released continuously throughout NREM sleep.</span></label>\n</div>\n</div>"},{"groupId":"group-3","kind":"multi_choice","questionIds":["q10","q11"],"bodyHtml":"<div class=\"group\" id=\"q10-11-anchor\">\n<h4>Questions 26 and 27</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>Which <strong>TWO</strong> of these statements describe the characteristics of REM sleep?</p>\n<div class=\"checkbox-options\" data-group=\"q10-11\" data-limit=\"2\">\n<label><input name=\"q10-11\" type=\"checkbox\" value=\"A\"><span><strong>A</strong> The REM stage is the longest phase of sleep.</span></label> <label><input name=\"q10-11\" type=\"checkbox\" value=\"B\"><span><strong>B</strong> REM sleep can be identified by an unusual physical feature.</span></label> <label><input name=\"q10-11\" type=\"checkbox\" value=\"C\"><span><strong>C</strong> REM sleep is important for removing unpleasant memories.</span></label> <label><input name=\"q10-11\" type=\"checkbox\" value=\"D\"><span><strong>D</strong> REM sleep is another part of NREM sleep.</span></label> <label><input name=\"q10-11\" type=\"checkbox\" value=\"E\"><span><strong>E</strong> Some scientists consider REM sleep to be a source of human innovation.</span></label>\n</div>\n</div>"},{"groupId":"group-4","kind":"sentence_completion","questionIds":["q12","q13","q14","q15","q16"],"bodyHtml":"<div class=\"group\" id=\"q12-13-14-15-16-anchor\">\n<h4>Questions 28–32</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"sentence-completion\">\n<p><span class=\"q-num\">28</span> According to the CDC, lack of sleep leads to <input type=\"text\" id=\"q12\" name=\"q12\">, which is often a factor in car crashes.</p>\n<p><span class=\"q-num\">29</span> The most common sleep disorder in the U.S. is <input type=\"text\" id=\"q13\" name=\"q13\">.</p>\n<p><span class=\"q-num\">30</span> The brain responds to any type of <input type=\"text\" id=\"q14\" name=\"q14\"> by activating a built-in alarm.</p>\n<p><span class=\"q-num\">31</span> Researchers claim that routinely sleep-deprived people are more likely to be obese and suffer from illnesses like <input type=\"text\" id=\"q15\" name=\"q15\">.</p>\n<p><span class=\"q-num\">32</span> The processing of new memories is crucially linked to our <input type=\"text\" id=\"q16\" name=\"q16\"> during sleep.</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14","q15","q16"],"questionDisplayMap":{"q1":"17","q2":"18","q3":"19","q4":"20","q5":"21","q6":"22","q7":"23","q8":"24","q9":"25","q10":"26","q11":"27","q12":"28","q13":"29","q14":"30","q15":"31","q16":"32"}});
+})(typeof window !== "undefined" ? window : globalThis);
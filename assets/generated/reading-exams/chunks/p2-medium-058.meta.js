@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-058", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-medium-058","meta":{"title":"Who wrote Shakespeare's plays 莎士比亚","category":"P2","frequency":"medium"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-10", "answers", {"answerKey":{"q1":"x","q2":"ii","q3":"v","q4":"vii","q5":"iv","q6":"viii","q7":"iii","q8":"D","q9":"A","q10":"C","q11":"newspapers","q12":"appearance","q13":"audience"}});
+})(typeof window !== "undefined" ? window : globalThis);
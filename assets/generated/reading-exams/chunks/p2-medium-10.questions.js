@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-10", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 14–20</h4>\n<p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Write the correct number, <strong>i–x</strong>, in boxes 14–20 on your answer sheet.</em></p>\n<div class=\"options-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\"><strong>i</strong> Why it is necessary to explain the meaning of the word celebrity</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\"><strong>ii</strong> The influence of non-human celebrities on societies</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\"><strong>iii</strong> The impact of broadcasting on concepts of celebrity</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\"><strong>iv</strong> Creativity having greater value</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\"><strong>v</strong> Admiration for physical achievement</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\"><strong>vi</strong> The advantages of celebrity status in the ancient world</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\"><strong>vii</strong> A result of hardship</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\"><strong>viii</strong> Literacy and widespread celebrity</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\"><strong>ix</strong> Attitudes of celebrities towards the media</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"x\"><strong>x</strong> The original definition of celebrity</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-anchor\">\n<h4>Questions 21–23</h4>\n<p>Look at the following statements (Questions 21–23) and the list of historical periods in Europe below.</p>\n<p>Match each statement with the correct historical period, <strong>A, B, C</strong>, or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<div class=\"match-question-item\">\n<p><strong>21</strong> A wide variety of people achieve a brief period of fame.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"match-question-item\">\n<p><strong>22</strong> Stories are invented about celebrities' lives.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"match-question-item\">\n<p><strong>23</strong> The fame of rulers is starting to diminish.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n</div>\n<div class=\"options-pool\" id=\"periods-options-pool\">\n<strong>List of historical periods in Europe</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\"><strong>A</strong> Ancient times</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\"><strong>B</strong> Dark Ages</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\"><strong>C</strong> Renaissance</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\"><strong>D</strong> Modern era</div>\n</div>\n</div>\n</div>","allowOptionReuse":false},{"groupId":"group-3","kind":"summary_completion","questionIds":["q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>Celebrities achieve a global status</h4>\n<p>The development of the publishing industry in the 1700s signalled the beginning of international fame. A growing number of people could read, which meant they had the chance to become informed about their favourite figures by reading <strong>24</strong> <input name=\"q11\" type=\"text\" id=\"q24_input\">. This exposure to celebrities expanded further when radio and television became popular, and it was mass media attention that resulted in higher status and fame for some celebrities. The recent rise of reality television has also meant that a person's <strong>25</strong> <input name=\"q12\" type=\"text\" id=\"q25_input\"> rather than their talent can bring fame. With this type of television programme, fame may be entirely dependent on the response of the <strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\">.</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
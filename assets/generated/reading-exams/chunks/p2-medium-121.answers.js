@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-121", "answers", {"answerKey":{"q1":"vii","q2":"v","q3":"ix","q4":"i","q5":"iv","q6":"vi","q7":"B","q8":"A","q9":"C","q10":"A","q11":"bacteria","q12":"gland","q13":"force"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-121", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-medium-121","meta":{"title":"A unique golden textile 蜘蛛丝","category":"P2","frequency":"medium","pdfFilename":"34. P2 - A unique golden textile 蜘蛛丝【次】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/34. P2 - A unique golden textile 蜘蛛丝【次】/","legacyFilename":"34. P2 - A unique golden textile 蜘蛛丝【次】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/34. P2 - A unique golden textile 蜘蛛丝【次】/34. P2 - A unique golden textile 蜘蛛丝【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/34. P2 - A unique golden textile 蜘蛛丝【次】/34. P2 - A unique golden textile 蜘蛛丝【次】.pdf","ieltsHtml":"IELTS/P2/A unique golden textile.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.253Z","notes":"signature:text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
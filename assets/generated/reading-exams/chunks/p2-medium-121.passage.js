@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-121", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>A unique golden textile</h3>\n<h4>A two-man project to use spider silk is achieved after 4 years</h4>\n<div class=\"paragraph-wrapper\" id=\"para-A-anchor\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"A\" data-question=\"q1\">\n<span class=\"paragraph-label\">Paragraph A</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> A rare textile made from the silk of more than a million wild spiders has been on display at the American Museum of Natural History in New York City. To produce this golden cloth, 70 people spent four years collecting golden-orb spiders from telephone poles in Madagascar, while another dozen workers carefully extracted about 80 feet of silk filament from each of the arachnids. The resulting 11-foot-by-4-foot textile is the only large piece of cloth made from natural spider silk in the world today.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-B-anchor\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"B\" data-question=\"q2\">\n<span class=\"paragraph-label\">Paragraph B</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> Spider silk is very elastic and strong compared with steel or Kevlar, said textile expert Simon Peers, who co-led the project. Kevlar is a lightweight synthetic fabric, chemically related to nylon, that is used in bullet-proof vests. Kevlar is resistant to wear, tear and heat and has virtually no melting point. But the tensile strength of spider silk is even greater than Kevlar's aramid filaments and higher than that of high-grade steel. Most importantly, spider silk is extremely lightweight: a strand long enough to circle the Earth would weigh less than 500 grams (18 oz). It is also especially ductile, able to stretch up to 140 percent of its length without breaking and to retain its strength below –40 °C, giving it toughness equal to that of leading commercial fibres.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-C-anchor\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"C\" data-question=\"q3\">\n<span class=\"paragraph-label\">Paragraph C</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> Researchers have long been intrigued by the unique properties of spider silk. Unfortunately, spider silk is extremely hard to mass-produce. Unlike silkworms—easy to raise in captivity—spiders have a habit of biting off each other's heads when housed together. According to Peers, there is intensive research worldwide aimed at replicating spider-silk tensile properties for use in medicine and industry, but no-one has yet reproduced all the qualities of natural silk.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-D-anchor\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"D\" data-question=\"q4\">\n<span class=\"paragraph-label\">Paragraph D</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> Peers conceived the idea of weaving spider silk after reading about French missionary Jacob Paul Camboué, who worked with spiders in Madagascar during the 1880s and 1890s. Camboué built a small hand-driven machine to extract silk from up to 24 spiders at once, without harming them: the spiders were briefly restrained, their silk collected, then released. Peers built a replica of this 24-spider “silking” machine, said co-leader Nicholas Godley. As a test the pair collected about 20 spiders. “When we stuck them in the machine and started turning it, lo and behold, this beautiful gold-coloured silk started coming out,” Godley recalled.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-E-anchor\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"E\" data-question=\"q5\">\n<span class=\"paragraph-label\">Paragraph E</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> To make a textile of any significant size, the scale had to increase dramatically. Fourteen thousand spiders yield about an ounce of silk, Godley said, and the finished textile weighs about 2.6 pounds. By the end, handlers had worked with more than one million female golden-orb spiders—abundant in Madagascar and famed for their golden thread. Because the spiders produce silk only in the rainy season, all were collected between October and June. An additional 12 workers used hand-powered machines to extract the silk and twist it into 96-filament yarn. After “silking”, the spiders were released; within a week they regenerate their silk, allowing the same individuals to be used again—“the gift that never stops giving,” said Godley.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-F-anchor\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"F\" data-question=\"q6\">\n<span class=\"paragraph-label\">Paragraph F</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> Spending four years to produce a single piece of cloth is hardly practical for scientists or companies hoping to exploit spider silk in biomedicine or as a Kevlar alternative. Several groups have inserted spider genes into bacteria and even goats to make silk, but results have been only partly successful. One reason is that spider silk begins as a liquid protein produced in a special gland in the abdomen. Using the spinneret, the spider applies force that rearranges the protein's molecular structure, transforming it into solid fibre. “When we talk about a spider spinning silk, we're talking about how it applies forces to convert liquid to solid,” explained spider-silk expert Todd Blackledge of the University of Akron, who was not involved in the project. “Every year we get closer to mass production, but we're not there yet.” For now, we must be content with one extraordinarily beautiful cloth—courtesy of more than a million spiders.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-121", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has six paragraphs <strong>A–F</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. Experimenting with an old idea</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. Life cycle of Madagascar spiders</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. Advances in the textile industry</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. Resources needed to meet the project's demands</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. The physical properties of spider silk</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. A scientific analysis of spider silk</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. A unique work of art</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. Importance of the silk-textile market</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix. Difficulties of raising spiders in captivity</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-anchor\">\n<h4>Questions 20–23</h4>\n<p>Look at the following statements (Questions 20–23) and the list of researchers below.</p>\n<p>Match each statement with the correct researcher, <strong>A, B</strong> or <strong>C</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>20</strong> It takes a tremendous number of spiders to make a small amount of silk.</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>21</strong> Scientists want to use the qualities of spider silk for medical purposes.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> Scientists are making some progress in their efforts to manufacture spider silk.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> Spider silk compares favourably to materials known for their strength.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"options-pool\" id=\"researcher-options-pool\">\n<strong>List of Researchers</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Simon Peers</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Nicholas Godley</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Todd Blackledge</div>\n</div>\n</div>\n</div>","allowOptionReuse":true},{"groupId":"group-3","kind":"summary_completion","questionIds":["q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>Producing spider silk in the lab</h4>\n<p>\nBoth scientists and manufacturers are interested in producing silk for many different purposes. Some researchers have tried to grow silk by introducing genetic material into <strong>24</strong> <input name=\"q11\" type=\"text\" id=\"q24_input\"> and some animals. But these experiments have been somewhat disappointing.\n<br><br>\nIt is difficult to make spider silk in a lab setting because the silk comes from a liquid protein made in a <strong>25</strong> <input name=\"q12\" type=\"text\" id=\"q25_input\"> inside the spider's body. When a spider spins silk, it applies <strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\"> that turns this liquid into solid silk. Scientists cannot replicate this yet.\n</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-126", "answers", {"answerKey":{"q1":"B","q2":"G","q3":"A","q4":"H","q5":"F","q6":"C","q7":"D","q8":"TRUE","q9":"FALSE","q10":"FALSE","q11":"TRUE","q12":"FALSE","q13":"FALSE"}});
+})(typeof window !== "undefined" ? window : globalThis);
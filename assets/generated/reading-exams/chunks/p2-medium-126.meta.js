@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-126", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-medium-126","meta":{"title":"How are deserts formed 沙漠成因","category":"P2","frequency":"medium","pdfFilename":"39. P2 - How are deserts formed 沙漠成因【次】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/39. P2 - How are deserts formed 沙漠成因【次】/","legacyFilename":"39. P2 - How are deserts formed 沙漠成因【次】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/39. P2 - How are deserts formed 沙漠成因【次】/39. P2 - How are deserts formed 沙漠成因【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/39. P2 - How are deserts formed 沙漠成因【次】/39. P2 - How are deserts formed 沙漠成因【次】.pdf","ieltsHtml":"IELTS/P2/How are deserts formed.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.726Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-129", "answers", {"answerKey":{"q1":"iv","q2":"viii","q3":"i","q4":"ix","q5":"vii","q6":"iii","q7":"vi","q8":"C","q9":"B","q10":"A","q11":"B","q12":"C","q13":"A"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-129", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor-right\">\n<h4>Questions 14–20</h4>\n<p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. The theory linking capacity for tool use in birds and survival</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. The influence of humans on tool use</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. The theory linking cognitive ability and living in a society</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. Reviewing long-held beliefs</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. Intelligence helps birds to remember</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. How some birds trick each other</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. Physiological evidence of birds' intelligence</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. Several examples of birds that use tools</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix. One species' multiple tool-using techniques</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Questions 21–26</h4>\n<p>Look at the following characteristics (Questions 21–26) and the list of birds below.</p>\n<p>Match each characteristic with the correct bird, <strong>A, B</strong> or <strong>C</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>21</strong> keeping tools that they like to use</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> drawing out their prey by frightening it</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> the use of tools to remove the outer covering from food</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>24</strong> using food to attract their prey</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>25</strong> the use of unfamiliar materials to make tools</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>26</strong> engaging in certain activities for the benefit of observers</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div class=\"options-pool\" id=\"bird-options-pool\">\n<strong>List of Birds</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A White-winged choughs</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Black kites</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C New Caledonian crows</div>\n</div>\n</div>\n</div>","allowOptionReuse":true}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-144", "answers", {"answerKey":{"q1":"v","q2":"viii","q3":"i","q4":"vii","q5":"iv","q6":"E","q7":"D","q8":"B","q9":"G","q10":"base","q11":"gravity","q12":"metals","q13":"water"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-144", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 14–18</h4>\n<p>Reading Passage 2 has five sections, <strong>A–E</strong>.</p>\n<p>Choose the correct heading for each section from the list of headings below.</p>\n<p><em>Drag a heading from this list and drop it onto the correct section's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i The need for skill and care</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Choosing the richest asteroid</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii The safest way to protect an asteroid</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv Obtaining support for the project</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v An achievable goal, not an impossible dream</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi The need for global cooperation</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii Beginning with a less challenging task</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii Practical, economic and research justifications</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"table_completion","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 19–22</h4>\n<p>Look at the following experts (Questions 19–22) and the list of statements below.</p>\n<p>Match each expert with the correct statement, <strong>A–G</strong>.</p>\n<div class=\"list-of-statements\">\n<strong>List of Statements</strong>\n<ul>\n<li><strong>A</strong> A mistake could have serious consequences for Earth.</li>\n<li><strong>B</strong> It might be difficult to arouse interest in an asteroid of limited size.</li>\n<li><strong>C</strong> The project could be an early step in space exploration.</li>\n<li><strong>D</strong> An asteroid's weight makes the project extremely challenging.</li>\n<li><strong>E</strong> The skill gained could save Earth from future danger.</li>\n<li><strong>F</strong> An asteroid could be a useful landing place for a spaceship.</li>\n<li><strong>G</strong> Capturing an asteroid would not be an efficient method of research.</li>\n</ul>\n</div>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th>Expert</th>\n<th>A</th>\n<th>B</th>\n<th>C</th>\n<th>D</th>\n<th>E</th>\n<th>F</th>\n<th>G</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>19</strong> Louis Friedman</td>\n<td><input name=\"q6\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q6\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q6\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q6\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q6\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q6\" type=\"radio\" value=\"F\"></td>\n<td><input name=\"q6\" type=\"radio\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>20</strong> Rusty Schweickart</td>\n<td><input name=\"q7\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q7\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q7\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q7\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q7\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q7\" type=\"radio\" value=\"F\"></td>\n<td><input name=\"q7\" type=\"radio\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>21</strong> Dan Mazanek</td>\n<td><input name=\"q8\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q8\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q8\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q8\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q8\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q8\" type=\"radio\" value=\"F\"></td>\n<td><input name=\"q8\" type=\"radio\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>22</strong> Joseph A. Nuth</td>\n<td><input name=\"q9\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"F\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"G\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<h4>Questions 23–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-box\">\n<h5>The merits of the US mission</h5>\n<p>\nCapture of an asteroid would reduce the time that astronauts travelling to it needed to spend in space. An asteroid could also act as a <strong>23</strong> <input id=\"q23_input\" name=\"q10\" type=\"text\"> for further space travel and exploration. The fact that an asteroid would have weaker <strong>24</strong> <input id=\"q24_input\" name=\"q11\" type=\"text\"> would allow easier movement of resources. These resources include <strong>25</strong> <input id=\"q25_input\" name=\"q12\" type=\"text\"> which could be used in space or on Earth, and <strong>26</strong> <input id=\"q26_input\" name=\"q13\" type=\"text\"> which could be consumed or used as a source of power. The mission could provide data on the history of our Sun and planets. It could also be good practice if there was a threat to Earth from a body from space.\n</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
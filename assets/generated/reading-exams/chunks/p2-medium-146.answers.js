@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-146", "answers", {"answerKey":{"q1":"striped","q2":"australia","q3":"12 million years","q4":"tasmania","q5":"europeans","q6":"B","q7":"A","q8":"D","q9":"C","q10":"A","q11":"D","q12":"B","q13":"D"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-146", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-medium-146","meta":{"title":"The Tasmanian Tiger 袋狼","category":"P2","frequency":"medium","pdfFilename":"57. P2 - The Tasmanian Tiger 袋狼【次】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/57. P2 - The Tasmanian Tiger 袋狼【次】/","legacyFilename":"57. P2 - The Tasmanian Tiger 袋狼【次】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/57. P2 - The Tasmanian Tiger 袋狼【次】/57. P2 - The Tasmanian Tiger 袋狼【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/57. P2 - The Tasmanian Tiger 袋狼【次】/57. P2 - The Tasmanian Tiger 袋狼【次】.pdf","ieltsHtml":"IELTS/P2/The Tasmanian Tiger.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.761Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
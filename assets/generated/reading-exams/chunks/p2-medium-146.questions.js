@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-146", "questions", {"questionGroups":[{"groupId":"group-1","kind":"summary_completion","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 14–18</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<p>\nThe thylacine was a dog-like animal which had a <strong>14</strong> <input type=\"text\" id=\"q14_input\" name=\"q1\"> coat and was carnivorous. It was originally spread widely throughout the mainland of <strong>15</strong> <input type=\"text\" id=\"q15_input\" name=\"q2\">. However, the number of thylacine decreased in that area around <strong>16</strong> <input type=\"text\" id=\"q16_input\" name=\"q3\"> ago because of climate change.\n</p>\n<p>\nIn the end, thylacines were found only on the island of <strong>17</strong> <input type=\"text\" id=\"q17_input\" name=\"q4\">, until the arrival of <strong>18</strong> <input type=\"text\" id=\"q18_input\" name=\"q5\"> with their farming practices brought about a drastic reduction in thylacine numbers. The last one is thought to have died in Hobart Zoo in 1936.\n</p>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q6","q7","q8","q9","q10","q11"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-10-11-anchor\">\n<h4>Questions 19–24</h4>\n<p>Look at the following statements (Questions 19–24) and the list of people below.</p>\n<p>Match each statement with the correct person, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<ul class=\"people-list\">\n<li><strong>List of People</strong></li>\n<li><strong>A</strong> &nbsp; Hans Naarding</li>\n<li><strong>B</strong> &nbsp; Randolph Rose</li>\n<li><strong>C</strong> &nbsp; David Pemberton</li>\n<li><strong>D</strong> &nbsp; Nick Mooney</li>\n</ul>\n<div class=\"matching-question-item\">\n<p><strong>19</strong> There is no longer any hope of finding a surviving Tasmanian tiger.</p>\n<div class=\"matching-options\">\n<label><input type=\"radio\" name=\"q6\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q6\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q6\" value=\"C\"> C</label> <label><input type=\"radio\" name=\"q6\" value=\"D\"> D</label>\n</div>\n</div>\n<div class=\"matching-question-item\">\n<p><strong>20</strong> It would be preferable not to disturb any surviving Tasmanian tigers.</p>\n<div class=\"matching-options\">\n<label><input type=\"radio\" name=\"q7\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q7\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q7\" value=\"C\"> C</label> <label><input type=\"radio\" name=\"q7\" value=\"D\"> D</label>\n</div>\n</div>\n<div class=\"matching-question-item\">\n<p><strong>21</strong> Many who claim to have seen Tasmanian tigers are not objective witnesses.</p>\n<div class=\"matching-options\">\n<label><input type=\"radio\" name=\"q8\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q8\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q8\" value=\"C\"> C</label> <label><input type=\"radio\" name=\"q8\" value=\"D\"> D</label>\n</div>\n</div>\n<div class=\"matching-question-item\">\n<p><strong>22</strong> Expert estimates of numbers needed to ensure species survival may be inaccurate.</p>\n<div class=\"matching-options\">\n<label><input type=\"radio\" name=\"q9\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q9\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q9\" value=\"C\"> C</label> <label><input type=\"radio\" name=\"q9\" value=\"D\"> D</label>\n</div>\n</div>\n<div class=\"matching-question-item\">\n<p><strong>23</strong> There is a great deal of international interest in Tasmanian tiger stories.</p>\n<div class=\"matching-options\">\n<label><input type=\"radio\" name=\"q10\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q10\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q10\" value=\"C\"> C</label> <label><input type=\"radio\" name=\"q10\" value=\"D\"> D</label>\n</div>\n</div>\n<div class=\"matching-question-item\">\n<p><strong>24</strong> Some fresh evidence provided by a visitor to Tasmania seems credible.</p>\n<div class=\"matching-options\">\n<label><input type=\"radio\" name=\"q11\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q11\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q11\" value=\"C\"> C</label> <label><input type=\"radio\" name=\"q11\" value=\"D\"> D</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"single_choice","questionIds":["q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q12-13-anchor\">\n<h4>Questions 25 and 26</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"matching-question-item\">\n<p><strong>25</strong> Has Naarding's sighting of a Tasmanian tiger resulted in</p>\n<div class=\"multiple-choice-options\">\n<label><input type=\"radio\" name=\"q12\" value=\"A\"> <strong>A</strong> the capture of the tiger.</label> <label><input type=\"radio\" name=\"q12\" value=\"B\"> <strong>B</strong> an extensive follow-up.</label> <label><input type=\"radio\" name=\"q12\" value=\"C\"> <strong>C</strong> many other sightings.</label> <label><input type=\"radio\" name=\"q12\" value=\"D\"> <strong>D</strong> the death of the tiger.</label>\n</div>\n</div>\n<div class=\"matching-question-item\">\n<p><strong>26</strong> The example of the coelacanth is used to show that</p>\n<div class=\"multiple-choice-options\">\n<label><input type=\"radio\" name=\"q13\" value=\"A\"> <strong>A</strong> new animal species are still evolving.</label> <label><input type=\"radio\" name=\"q13\" value=\"B\"> <strong>B</strong> animals can possess surprising physical characteristics.</label> <label><input type=\"radio\" name=\"q13\" value=\"C\"> <strong>C</strong> species of sea animals can be saved from extinction.</label> <label><input type=\"radio\" name=\"q13\" value=\"D\"> <strong>D</strong> opinions regarding the extinction of animal species can be mistaken.</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
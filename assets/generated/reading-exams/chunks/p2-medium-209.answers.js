@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-209", "answers", {"answerKey":{"q1":"e","q2":"b","q3":"g","q4":"f","q5":"c","q6":"d","q7":"rational","q8":"tired","q9":"shortcuts","q10":"a","q11":"a","q12":"c","q13":"b"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-209", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"text","bodyHtml":"<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Decision Fatigue</h3>\n<p><em>'Decision fatigue' helps explain why ordinarily sensible people avoid making decisions or are easily persuaded to make the wrong decisions when they are tired. Yet few people are conscious of it, and researchers are only beginning to understand why it happens.</em></p>\n<h4>A</h4>\n<p>No matter how rational people try to be, they can't make decision after decision without paying a biological price. This 'decision fatigue' is different from ordinary physical fatigue. People are not conscious of being tired, but nevertheless they are low on energy. The more choices one makes throughout the day, the harder it becomes for the brain, and eventually it looks for shortcuts: either to act impulsively instead of expending the energy to think through the possible results, or the ultimate energy saver: do nothing. Avoiding a decision often creates bigger problems in the long run, but for the moment it eases the mental strain.</p>\n<h4>B</h4>\n<p>Decision fatigue involves a phenomenon called ego depletion, a term coined by social psychologist Roy F. Baumeister. His research demonstrated that there is a finite store of mental stamina for exerting self-control. For example, when people fended off the temptation to eat freshly baked biscuits, they were then less able to resist other temptations. When they tried to resist the urge to cry during a sad movie, afterwards they gave up more quickly on tasks requiring self-discipline, such as working on a geometry puzzle. The experiments confirmed the 19th-century notion of willpower being like a muscle that became tired with use; something which could be conserved by avoiding temptation.</p>\n<h4>C</h4>\n<p>Decision fatigue leaves people vulnerable to marketers who know how to time their sales, as Jonathan Levav demonstrated. He visited a tailor to have a suit made for his wedding and began going through the choices of fabric, buttons, and so forth, and when he got through the third pile of fabric samples. Levav recalls, \"I couldn't tell the choices apart anymore. After a while my only response to the tailor became, 'What do you recommend?'\" Levav put the experience to use in an experiment conducted at German car dealerships, where real customers had to choose among four styles of gearshift knobs, 25 configurations of the engine and gearbox, and a palette of 56 colours for the interior. As they started picking features, customers would carefully weigh the choices, but as decision fatigue set in they would start settling for the default option. By manipulating the order of the car buyers' choices, the researchers found that customers would end up paying more.</p>\n<h4>D</h4>\n<p>Similarly, sweet snacks are featured prominently at cash registers at most supermarkets. With their willpower reduced after shopping, people are especially vulnerable to sweet drinks and snacks. While supermarkets figured this out a long time ago, only recently did researchers discover why. Baumeister's research team tested the notion that people could build up willpower by first indulging in pleasure. They found that a delicious, thick milkshake strengthened willpower by helping people perform better than expected on their next task. However, the experiment also included a control group who drank a tasteless low-fat dairy beverage. It provided them with no pleasure, yet it produced similar improvements in self-control. Baumeister concluded that even the tasteless drink had worked because the brain, like the rest of the body, derived energy from glucose, the simple sugar manufactured from all kinds of foods, including milk.</p>\n<h4>E</h4>\n<p>To establish cause and effect, researchers at Baumeister's lab tried refueling the brain in experiments involving lemonade mixed either with sugar or with a diet sweetener. The sugary lemonade provided a burst of glucose, the effects of which could be observed immediately in the lab; the sugarless sweeteners tasted similar but did not contain the glucose. Again and again, the sugar restored willpower, but the artificial sweetener had no effect. The glucose would mitigate the ego depletion and sometimes completely reverse it, improving self-control and the quality of decisions: the subjects resisted irrational bias when making choices and, when making financial decisions, they were more likely to choose the better long-term strategy instead of going for a quick payoff.</p>\n<h4>F</h4>\n<p>However, some brain researchers had reservations about the glucose connection. \"Todd Heatherton, a pioneer of social neuroscience, believed in ego depletion but didn't see how this process could be caused simply by variations in glucose levels.\" To observe the process, and to see if it could be reversed by glucose, Heatherton's team recorded images of the brains of 45 people who were on a low-calorie diet as they reacted to pictures of food. Next, these dieters watched a comedy video while forcing themselves to suppress their laughter—thereby draining mental energy and inducing ego depletion. When they were again shown pictures of food, further brain scans revealed more activity in the brain's reward centre and a decrease in the amygdala, which helps control impulses. The food's appeal, in other words, registered more strongly while impulse control weakened. What surprised Heatherton was that administering glucose completely reversed the brain changes brought about by ego depletion.</p>\n<h4>G</h4>\n<p>\"Good decision-making is not a trait of the person,\" Baumeister says. \"It's a state that fluctuates.\" His studies show that people with the best self-control are the ones who avoid temptations, and who establish habits that eliminate the mental effort of making choices. Instead of counting on willpower all day, they conserve it so that it's available for important decisions. \"Even the wisest people won't make good choices when they're not rested and their glucose is low,\" Baumeister notes. If a decision must be made late in the afternoon or in the evening, they know not to do it on an empty stomach. The best decision-makers, according to Baumeister, \"are the ones who know when not to trust themselves.\"</p>\n<p>&nbsp;</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
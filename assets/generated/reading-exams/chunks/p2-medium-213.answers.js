@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-213", "answers", {"answerKey":{"q1":"C","q2":"D","q3":"E","q4":"G","q5":"D","q6":"F","q7":"B","q8":"B","q9":"D","q10":"electromagnetic radiation","q11":"Henri Douche","q12":"crop failure","q13":"nutrients"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-213", "questions", {"questionGroups":[{"groupId":"group-1","kind":"sentence_completion","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 14-20</h4>\n<p>Reading Passage 2 has seven paragraphs, <strong>A-G</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, A-G, in boxes 14-20 on your answer sheet.</em></p>\n<p><strong>NB</strong> You may use any letter more than once.</p>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q1-anchor\"></a><strong>14</strong> an example of how farmers in one country are now using satellite data to determine fertiliser use</p>\n<input class=\"blank\" type=\"text\" name=\"q1\" maxlength=\"1\" style=\"width: 60px;\">\n</div>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q2-anchor\"></a><strong>15</strong> a reference to climate change and its effects</p>\n<input class=\"blank\" type=\"text\" name=\"q2\" maxlength=\"1\" style=\"width: 60px;\">\n</div>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q3-anchor\"></a><strong>16</strong> a reference to the effect on the soil of using too much fertiliser</p>\n<input class=\"blank\" type=\"text\" name=\"q3\" maxlength=\"1\" style=\"width: 60px;\">\n</div>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q4-anchor\"></a><strong>17</strong> an example of information that will be shared between different countries</p>\n<input class=\"blank\" type=\"text\" name=\"q4\" maxlength=\"1\" style=\"width: 60px;\">\n</div>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q5-anchor\"></a><strong>18</strong> a mention of the country which is the leader in agricultural technology</p>\n<input class=\"blank\" type=\"text\" name=\"q5\" maxlength=\"1\" style=\"width: 60px;\">\n</div>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q6-anchor\"></a><strong>19</strong> a description of an innovation in satellite imaging which requires further study</p>\n<input class=\"blank\" type=\"text\" name=\"q6\" maxlength=\"1\" style=\"width: 60px;\">\n</div>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q7-anchor\"></a><strong>20</strong> evidence of the cost effectiveness of using satellite technology in agriculture</p>\n<input class=\"blank\" type=\"text\" name=\"q7\" maxlength=\"1\" style=\"width: 60px;\">\n</div>\n</div>"},{"groupId":"group-2","kind":"multi_choice","questionIds":["q8","q9"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 21 and 22</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A-E</strong>.</p>\n<p>Write the correct letters in boxes 21 and 22 on your answer sheet.</p>\n<p>Which <strong>TWO</strong> companies obtain information directly from satellites?</p>\n<div class=\"mcq-group\">\n<label><input type=\"checkbox\" name=\"q8_9\" value=\"A\"> A. Sevepi</label> <label><input type=\"checkbox\" name=\"q8_9\" value=\"B\"> B. Infoterra</label> <label><input type=\"checkbox\" name=\"q8_9\" value=\"C\"> C. Agriculture and Agri-Food Canada</label> <label><input type=\"checkbox\" name=\"q8_9\" value=\"D\"> D. RapidEye</label> <label><input type=\"checkbox\" name=\"q8_9\" value=\"E\"> E. World Agroforestry Centre</label>\n</div>\n<p style=\"font-size: 0.9em; color: var(--muted); margin-top: 8px;\"><em>Note: Select exactly TWO options</em></p>\n</div>"},{"groupId":"group-3","kind":"sentence_completion","questionIds":["q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 23-26</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<p>Write your answers in boxes 23-26 on your answer sheet.</p>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q10-anchor\"></a><strong>23</strong> Initially, orbiting satellites are used to measure <input class=\"blank\" type=\"text\" name=\"q10\"> coming from farmland.</p>\n</div>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q11-anchor\"></a><strong>24</strong> <input class=\"blank\" type=\"text\" name=\"q11\"> believes that confusion about irregular weather will cause more farmers to use satellite technology.</p>\n</div>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q12-anchor\"></a><strong>25</strong> As a result of satellite technology, it may become possible to insure against the risk of <input class=\"blank\" type=\"text\" name=\"q12\">.</p>\n</div>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q13-anchor\"></a><strong>26</strong> In Africa, much of the soil suffers from the loss of <input class=\"blank\" type=\"text\" name=\"q13\">.</p>\n</div>\n</div>"}],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"},"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"]});
+})(typeof window !== "undefined" ? window : globalThis);
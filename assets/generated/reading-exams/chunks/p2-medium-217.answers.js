@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-217", "answers", {"answerKey":{"q1":"d","q2":"f","q3":"d","q4":"a","q5":"c","q6":"b","q7":"c","q8":"a","q9":"d","q10":"a","q11":"storytellers","q12":"peer","q13":"affection"}});
+})(typeof window !== "undefined" ? window : globalThis);
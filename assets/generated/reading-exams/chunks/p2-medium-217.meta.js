@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-217", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-medium-217","meta":{"title":"A mechanical friend for children 孩子的机器人朋友【次】","category":"P2","frequency":"medium"}});
+})(typeof window !== "undefined" ? window : globalThis);
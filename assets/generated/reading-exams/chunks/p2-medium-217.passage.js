@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-217", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"text","bodyHtml":"<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>A mechanical friend for children</h3>\n<h4>A</h4>\n<p>The development of robots that interact socially with people and assist them in everyday life has been an elusive goal of modern science. Despite impressive advances in the mechanical aspects of this problem, producing robots that bond and socialize with people for sustained periods of time has proven difficult. The most successful robots so far have been storytellers, but they have only been able to maintain human interest for a limited time and typically rely on the robot telling stories that change over time. In practice, commercially available robots seldom cross the 10-hour barrier (i.e., individual users tend to spend less than a combined total of 10 hours with the robots before losing interest). This observation is in sharp contrast to the long-term interactions and bonding that commonly develop between humans and their pets.</p>\n<h4>B</h4>\n<p>In a recent study, researchers from the Institute for Neural Computation in California introduced a state-of-the-art social robot into a classroom of 18-to-24-month-olds for five months as a way of studying human/robot interactions. The researchers, including Fumihide Tanaka and Javier R. Movellan, introduced a toddler-sized humanoid robot into a classroom at a childhood education center. One of the QRIO series of robots, the 58 cm machine, was originally developed by Sony. ‘Children of toddler age were chosen because they have no preconceived notions of robots,’ according to Tanaka. One of the goals of the study was to establish whether it was possible for social robots to maintain the interest of children beyond the 10-hour barrier.</p>\n<h4>C</h4>\n<p>The researchers sent instructions to the robot about every two minutes to do things like giggle, dance, sit down, fall down, or walk in a certain direction. The 45 sessions were videotaped, and interactions between toddlers and the robot were later analyzed. The results showed that the quality of those interactions improved steadily over 27 sessions. The interactions deteriorated quickly over the next 15 sessions, when the robot was ordered to behave in a more limited, predictable manner. Finally, the human/robot relations improved in the last three sessions, after the robot had been instructed to display its full range of behaviors.</p>\n<h4>D</h4>\n<p>‘Initially, the children treated the robot very differently from the way they treated each other,’ Tanaka said. ‘Early in the study, some children cried when QRIO fell. But a month into the study, the toddlers helped QRIO stand up by pushing its back or pulling its hands.’ ‘The most important aspect of interaction was touch,’ Tanaka said. ‘At first, the toddlers would touch the robot on its face, but later on they would touch it only on its hands and arms, like they would with other humans. Another robot-like toy named Robby, which resembled QRIO but did not move, was used as a control in the study. While hugging of QRIO increased, hugging of Robby decreased throughout the study. Furthermore, when QRIO laid down on the floor, caretaking behaviors were frequently observed toward QRIO but seldom toward Robby.’</p>\n<h4>E</h4>\n<p>The study concluded that after 45 days of immersion in a childcare center over a period of five months, long-term bonding and socialization occurred between toddlers and a state-of-the-art social robot. Overall, the interaction between children and the robot improved over time and the children progressively treated it more as a peer than a plaything. ‘To my knowledge, this is the first long-term study of this sort,’ said Ronald Arkin, a roboticist at the Georgia Institute of Technology in the US.</p>\n<h4>F</h4>\n<p>Tanaka and Movellan are now developing autonomous robots for the toddler classroom. ‘It could have great potential in educational settings, assisting teachers and enriching the classroom environment,’ Tanaka said. The researchers hope that more advanced versions of robots like QRIO could become personalized tutors to assist teachers in classrooms. A robotic tutor could react on the spot to social cues and approximate social skills like facial expression and eye gaze, they said. ‘It is becoming clear that, to achieve this goal, we are going to endow machines with something similar to emotion, not just traditional forms of intelligence,’ said Movellan.</p>\n<h4>G</h4>\n<p>Associate Professor David Powers, an expert in artificial intelligence and cognitive science at Flinders University in South Australia, commented, ‘In this study, it is clearly demonstrated that a limited range of robot behaviors, however impressive, is nowhere near as important to human/robot interaction as being able to make appropriate responses from a broad repertoire of behaviors.’ Ronald Arkin was not surprised by the affection demonstrated by the toddlers toward the robot. ‘Humans have a tremendous propensity to bond with artifacts, whether it be a car, a doll, or a robot,’ he said. But he also cautioned that researchers do not yet understand the consequences of increased human/robot interaction. ‘Studying how robots and humans work together can give us insight into whether this is a good thing or a bad thing for society,’ Arkin said. ‘We need to find out what the consequences are of introducing a robot into a cadre of children. How will that enhance, or potentially interfere with, their social development? Do we really understand the long-term impact of having a robot as a childhood friend?’</p>\n<p>&nbsp;</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
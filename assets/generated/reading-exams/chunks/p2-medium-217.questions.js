@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-217", "questions", {"questionGroups":[{"groupId":"group-1","kind":"short_answer","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 14–18</h4>\n<p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<p><em>Drag the correct paragraph letter (A-G) to the box next to the statement.</em></p>\n<div class=\"cardpool pool-vertical\" id=\"pool-paragraphs\">\n<div class=\"card\" draggable=\"true\" id=\"c-a\" data-value=\"A\" data-clone=\"true\"><strong>A</strong></div>\n<div class=\"card\" draggable=\"true\" id=\"c-b\" data-value=\"B\" data-clone=\"true\"><strong>B</strong></div>\n<div class=\"card\" draggable=\"true\" id=\"c-c\" data-value=\"C\" data-clone=\"true\"><strong>C</strong></div>\n<div class=\"card\" draggable=\"true\" id=\"c-d\" data-value=\"D\" data-clone=\"true\"><strong>D</strong></div>\n<div class=\"card\" draggable=\"true\" id=\"c-e\" data-value=\"E\" data-clone=\"true\"><strong>E</strong></div>\n<div class=\"card\" draggable=\"true\" id=\"c-f\" data-value=\"F\" data-clone=\"true\"><strong>F</strong></div>\n<div class=\"card\" draggable=\"true\" id=\"c-g\" data-value=\"G\" data-clone=\"true\"><strong>G</strong></div>\n</div>\n<hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n<div class=\"question-block\">\n<p><a id=\"q1-anchor\"></a><strong>14</strong> a comparison of children’s reactions towards different robots</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q1\" data-question=\"q1\"></span>\n</div>\n<div class=\"question-block\">\n<p><a id=\"q2-anchor\"></a><strong>15</strong> a speculation about ways robots may be able to communicate</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q2\" data-question=\"q2\"></span>\n</div>\n<div class=\"question-block\">\n<p><a id=\"q3-anchor\"></a><strong>16</strong> a description of changes in the way the children physically handled a robot</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q3\" data-question=\"q3\"></span>\n</div>\n<div class=\"question-block\">\n<p><a id=\"q4-anchor\"></a><strong>17</strong> a comparison between people’s connections with animals and their connections with robots</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q4\" data-question=\"q4\"></span>\n</div>\n<div class=\"question-block\">\n<p><a id=\"q5-anchor\"></a><strong>18</strong> an account of the way one robot was programmed</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q5\" data-question=\"q5\"></span>\n</div>\n</div>","allowOptionReuse":true},{"groupId":"group-2","kind":"short_answer","questionIds":["q6","q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 19–23</h4>\n<p>Look at the following statements (Questions 19–23) and the list of people below.</p>\n<p>Match each statement with the correct person, <strong>A-D</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<p><em>Drag the correct person block to the box below each statement.</em></p>\n<div class=\"cardpool pool-vertical\" id=\"pool-people\">\n<div class=\"card\" draggable=\"true\" id=\"res-A\" data-value=\"A\" data-clone=\"true\"><strong>A</strong> Fumihide Tanaka</div>\n<div class=\"card\" draggable=\"true\" id=\"res-B\" data-value=\"B\" data-clone=\"true\"><strong>B</strong> Javier R. Movellan</div>\n<div class=\"card\" draggable=\"true\" id=\"res-C\" data-value=\"C\" data-clone=\"true\"><strong>C</strong> Ronald Arkin</div>\n<div class=\"card\" draggable=\"true\" id=\"res-D\" data-value=\"D\" data-clone=\"true\"><strong>D</strong> David Powers</div>\n</div>\n<hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n<div class=\"question-block\">\n<p><a id=\"q6-anchor\"></a><strong>19</strong> In future, robots will not only have to think, but also to show feelings.</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q6\" data-question=\"q6\"></span>\n</div>\n<div class=\"question-block\">\n<p><a id=\"q7-anchor\"></a><strong>20</strong> It is uncertain whether more contact between people and robots will be beneficial.</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q7\" data-question=\"q7\"></span>\n</div>\n<div class=\"question-block\">\n<p><a id=\"q8-anchor\"></a><strong>21</strong> Very young children have not yet developed ideas about robots.</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q8\" data-question=\"q8\"></span>\n</div>\n<div class=\"question-block\">\n<p><a id=\"q9-anchor\"></a><strong>22</strong> Robots need to perform a wide variety of actions for people to relate to them.</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q9\" data-question=\"q9\"></span>\n</div>\n<div class=\"question-block\">\n<p><a id=\"q10-anchor\"></a><strong>23</strong> Using robots as an aid in schools may have many benefits.</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q10\" data-question=\"q10\"></span>\n</div>\n</div>","allowOptionReuse":true},{"groupId":"group-3","kind":"sentence_completion","questionIds":["q11","q12","q13"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 24–26</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<p>24 Until recently, robots that were best at holding people’s attention were those that acted as <a id=\"q11-anchor\"></a><input class=\"blank\" type=\"text\" name=\"q11\">.</p>\n<p>25 The children responded to the QRIO robot as a friend or a <a id=\"q12-anchor\"></a><input class=\"blank\" type=\"text\" name=\"q12\"> rather than as a toy.</p>\n<p>26 Arkin expected that the children would show <a id=\"q13-anchor\"></a><input class=\"blank\" type=\"text\" name=\"q13\"> towards the QRIO robot.</p>\n</div>"}],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"},"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"]});
+})(typeof window !== "undefined" ? window : globalThis);
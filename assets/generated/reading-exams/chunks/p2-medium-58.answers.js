@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-58", "answers", {"answerKey":{"q1":"vii","q2":"iii","q3":"vi","q4":"i","q5":"iv","q6":"ii","q7":"C","q8":"B","q9":"A","q10":"B","q11":"threatened","q12":"scouts","q13":"leaders"}});
+})(typeof window !== "undefined" ? window : globalThis);
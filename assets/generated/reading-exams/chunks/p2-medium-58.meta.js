@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-58", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-medium-58","meta":{"title":"Insect Decision-Making 昆虫决策","category":"P2","frequency":"medium","pdfFilename":"150. P2 - Insect Decision-Making 昆虫决策【次】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/150. P2 - Insect Decision-Making 昆虫决策【次】/","legacyFilename":"150. P2 - Insect Decision-Making 昆虫决策【次】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/150. P2 - Insect Decision-Making 昆虫决策【次】/150. P2 - Insect Decision-Making 昆虫决策【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/150. P2 - Insect Decision-Making 昆虫决策【次】/150. P2 - Insect Decision-Making 昆虫决策【次】.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-11T14:43:22.097Z","notes":"signature:text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
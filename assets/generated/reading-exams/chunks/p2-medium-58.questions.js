@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-58", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i The effect of man-made imitations on insects</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii The need to instruct additional insect guides</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii Signals used by certain insects to indicate a discovery</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv How urgency can affect the process of finding a new home</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v The use of trained insects in testing scientific theories</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi The use of virtual scenarios in the study of insect behaviour</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii How the number of decision-makers affects the decision</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-anchor\">\n<h4>Questions 20–23</h4>\n<p>Look at the following findings (Questions 20–23) and the list of academics below.</p>\n<p>Match each finding with the correct academic, <strong>A–D</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>20</strong> Certain members can influence the rest of the group to alter a previous decision.</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>21</strong> Individual verification of a proposed choice is important for a successful decision outcome.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> The more individuals taking part in a decision, the better the decision will be.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> The decision-making process of certain insects produces excellent results even when fine distinctions are required.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"options-pool\" id=\"researcher-options-pool\">\n<strong>List of Academics</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Nicolas de Condorcet</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Christian List and colleagues</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C José Halloy</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Nigel Franks and colleagues</div>\n</div>\n</div>\n</div>","allowOptionReuse":true},{"groupId":"group-3","kind":"summary_completion","questionIds":["q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>A Study of Insect Decision-making</h4>\n<p>\nA Bristol University study looked at how insects make decisions when their home has been <strong>24</strong> <input name=\"q11\" type=\"text\" id=\"q24_input\">. The ants in the experiment relied on the use of individuals called <strong>25</strong> <input name=\"q12\" type=\"text\" id=\"q25_input\"> to find a new nest and efficiently direct the others to go there. The study concluded that the effective implementation of the ants' decision meant that the insects could change homes quickly. The study emphasized the necessity, for people as well as insects, of having active <strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\"> in order to execute decisions successfully.\n</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-86", "answers", {"answerKey":{"q1":"iv","q2":"viii","q3":"i","q4":"vii","q5":"iii","q6":"v","q7":"B","q8":"C","q9":"A","q10":"D","q11":"meadow","q12":"museum","q13":"edges"}});
+})(typeof window !== "undefined" ? window : globalThis);
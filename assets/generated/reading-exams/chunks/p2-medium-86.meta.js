@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-86", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-medium-86","meta":{"title":"Urban Regeneration 柏林公园改造","category":"P2","frequency":"medium","pdfFilename":"176. P2 - Urban Regeneration 柏林公园改造.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/176. P2 - Urban Regeneration 柏林公园改造【次】/","legacyFilename":"176. P2 - Urban Regeneration 柏林公园改造.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/176. P2 - Urban Regeneration 柏林公园改造【次】/176. P2 - Urban Regeneration 柏林公园改造.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/176. P2 - Urban Regeneration 柏林公园改造【次】/176. P2 - Urban Regeneration 柏林公园改造.pdf","ieltsHtml":"IELTS/P2/Urban Regeneration.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.151Z","notes":"signature:checkbox,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-86", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i Objectives of the regeneration project</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Architectural details of the station buildings</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii Features and facilities of the completed development</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv The remains of a railway system</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v A positive evaluation of the finished project</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi A way of controlling development costs</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii Ways of crossing the site</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii Reasons why the area had become neglected</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"multi_choice","questionIds":["q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q7-8-anchor\">\n<h4>Questions 20–21</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>Which <strong>TWO</strong> reasons are given for the choice of Gleisdreieck as a site for a park?</p>\n<div class=\"checkbox-options\" data-group=\"q7-8\" data-limit=\"2\">\n<label><input name=\"q7-8\" type=\"checkbox\" value=\"A\"><span><strong>A</strong> It was a habitat for some rare wildlife species.</span></label> <label><input name=\"q7-8\" type=\"checkbox\" value=\"B\"><span><strong>B</strong> It contained a particular tourist attraction.</span></label> <label><input name=\"q7-8\" type=\"checkbox\" value=\"C\"><span><strong>C</strong> It lay at the heart of the reunited city.</span></label> <label><input name=\"q7-8\" type=\"checkbox\" value=\"D\"><span><strong>D</strong> It was served by a major rail network.</span></label> <label><input name=\"q7-8\" type=\"checkbox\" value=\"E\"><span><strong>E</strong> It contained buildings which could be easily converted.</span></label>\n</div>\n</div>"},{"groupId":"group-3","kind":"multi_choice","questionIds":["q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q9-10-anchor\">\n<h4>Questions 22–23</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>Which <strong>TWO</strong> things did the State of Berlin hope to achieve with the Gleisdreieck development?</p>\n<div class=\"checkbox-options\" data-group=\"q9-10\" data-limit=\"2\">\n<label><input name=\"q9-10\" type=\"checkbox\" value=\"A\"><span><strong>A</strong> to bring people of different ages together</span></label> <label><input name=\"q9-10\" type=\"checkbox\" value=\"B\"><span><strong>B</strong> to encourage tourism</span></label> <label><input name=\"q9-10\" type=\"checkbox\" value=\"C\"><span><strong>C</strong> to improve transport links</span></label> <label><input name=\"q9-10\" type=\"checkbox\" value=\"D\"><span><strong>D</strong> to preserve industrial remains</span></label> <label><input name=\"q9-10\" type=\"checkbox\" value=\"E\"><span><strong>E</strong> to generate income for the city</span></label>\n</div>\n</div>"},{"groupId":"group-4","kind":"summary_completion","questionIds":["q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<p>\nIn the middle of the new park is a <strong>24</strong> <input type=\"text\" id=\"q24_input\" name=\"q11\">, where there is a path for pedestrians and two railway lines. A slow train uses these lines to make a regular journey between its base and a <strong>25</strong> <input type=\"text\" id=\"q25_input\" name=\"q12\">. Benches have been provided on the north side, so that people can relax and enjoy the sunshine, and to the east is an area with mature trees of various kinds, as well as sets of swings. A range of sports and leisure areas are situated around the <strong>26</strong> <input type=\"text\" id=\"q26_input\" name=\"q13\"> of the site.\n</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-93", "answers", {"answerKey":{"q1":"D","q2":"B","q3":"A","q4":"F","q5":"starfish","q6":"predators","q7":"icebergs","q8":"glass","q9":"teeth","q10":"chin","q11":"F","q12":"G","q13":"B"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-93", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p2-medium-93","meta":{"title":"Antarctic research 南极考察","category":"P2","frequency":"medium","pdfFilename":"182. P2 - Antarctic research 南极考察.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/182. P2 - Antarctic research 南极考察【次】/","legacyFilename":"182. P2 - Antarctic research 南极考察.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/182. P2 - Antarctic research 南极考察【次】/182. P2 - Antarctic research 南极考察.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/182. P2 - Antarctic research 南极考察【次】/182. P2 - Antarctic research 南极考察.pdf","ieltsHtml":"IELTS/P2/Antarctic research.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.179Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
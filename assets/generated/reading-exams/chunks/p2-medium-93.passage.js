@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-93", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Antarctic research</h3>\n<h4>Thirteen nations took part in the recent International Polar Year</h4>\n<p><strong>A</strong> New Zealand's contribution to International Polar Year was a 52-day voyage by the ship Tangaroa in order to conduct research in Antarctica's Ross Sea. Lead scientist Mary Livingston emphasises just what a multi-faceted expedition this was, bringing together zoologists, oceanographers, meteorologists and other scientists from the Ministry of Fisheries, the National Institute for Water and Atmospheric Research, the National Museum and various universities, to study life beneath the seas of Antarctica. Competition for berths – the ship can carry 44 people, including 13 crew – was fierce. Voyage leader Stu Hanchet says, ‘We could have filled the science positions four times over ... we had so many people requesting a berth ... We ended up with a really strong team.'</p>\n<p><strong>B</strong> It would be hard to overstate how hostile the Antarctic environment is for scientists. The Tangaroa's captain, Graham Leachman, explains that the Ross Sea is subject to katabatic winds* that sweep down off the Antarctic continent to create rough seas. Another danger is the possibility of the ship colliding with floating ice. ‘Even though the ship's officers use all sorts of high-tech equipment ... none of it can tell you how thick the ice is,' says Leachman, ‘and you still can't beat looking out of the window.' In the dark, he says, you can't tell how thick the ice is, but if you can see its colour, it's possible to estimate. This is why he prefers sailing in summer, when the hours of daylight in these high latitudes are longest, even though this plays tricks with his passengers' body clocks.</p>\n<p><strong>C</strong> Analysis of what the expedition found continues, but it's likely that several new species have been discovered and numerous other secrets revealed about life 3,000 metres below the surface. ‘We have collected huge worms and strange crustaceans,' says Livingston, 'but most impressive of all were the starfish that measured more than half a metre across – that's most abnormal for creatures belonging to this species.' This phenomenon of Antarctic seas is called 'gigantism' – the fact that some species grow to unusually large sizes. Livingston suggests various possible causes for gigantism including the extreme cold, few predators and high levels of oxygen in the seawater, but as yet no final determination can be made. Another interesting discovery was that in some places every inch of the sea floor was covered with life, whereas elsewhere icebergs have scoured out deep scars and ravines in the sea floor as they go by.</p>\n<p><strong>D</strong> By using deep-sea trawl nets, high-definition cameras and water samplers, the team has revealed that many of the creatures that live at extreme depths have a bizarre appearance. Among them were spotted tunicates, plankton-eating animals that are slender structures that appear to be fashioned from glass. The most fearsome-looking fish was the Southern Ocean daggertooth, a species that is ‘monocyclic', meaning the fish die after the first spawning. They are also unusual for being capable of shedding their teeth and growing a new set. Another predatory fish brought to the surface was the stareater, an extraordinary species that has an appendage like a piece of cord hanging from its chin. In these deep, dark waters, this glows red and attracts prey to swim within striking distance. Just as impressive and much more beautiful were the basket stars, a species related to starfish that lives on the seabed. The basket stars' five arms branch out numerous times to form a spectacular fan-like structure which they turn to face into the current so that food is brought into their embrace.</p>\n<p><strong>E</strong> But whatever exciting discoveries were made, everyday life onboard ship in the Ross Sea is unrelenting. Most people share a cabin with one other person – they're allocated so that as one person begins their 12 hours off duty, the other occupant is starting work on deck. The fresh food runs out in a few days and after that most provisions are frozen, canned or dried. Expedition general manager Fred Smits recognises that the cook has an essential role in ensuring the well-being of those onboard. ‘When you are at sea for so long,' he says, 'you think a lot about your next meal.'</p>\n<p><strong>F</strong> Perhaps most controversially, one of the precious berths on the Tangaroa was taken up by cameraman Max Quinn, who filmed a documentary about the voyage. Quinn's inclusion wasn't welcomed at first. ‘Scientists by nature,' Livingston says, 'tend to be camera-shy and quiet. They're not into having cameras there, so it was difficult getting everyone's permission and agreement.' But in the end Quinn fitted in very well. ‘The trick,' he says, 'is to mostly film the scientists at work, in their professional roles ... rather than eating their breakfast.' He knows when not to intrude. The documentary is a window on a trip few people get to make and also a peek into what research really looks like. 'Science,' says Livingston, ‘is intrepid, more so than people realise. It's not necessarily examining dry samples in the laboratory, but can also mean braving the elements on deck. That's what the documentary captures, the sense of real people with real lives.'</p>\n<div class=\"footnote\">\n* katabatic wind: a wind caused by the local downward motion of cool air\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
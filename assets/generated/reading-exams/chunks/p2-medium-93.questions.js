@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p2-medium-93", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 14–17</h4>\n<p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, A–F, in boxes 14–17 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 200px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> details of some equipment used by the scientists</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> a description of the challenging sailing conditions in Antarctica</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> information about the composition of the scientific group</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> the identity of a potentially unpopular person on the ship</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q5","q6","q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-9-10-anchor\">\n<h4>Questions 18–23</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>The expedition's findings</h4>\n<p>Analysis continues of the expedition's remarkable discoveries, including a <strong>18</strong> <input name=\"q5\" type=\"text\" id=\"q18_input\"> very notable for its unusual width. The reasons why creatures grow so large at great depths in Antarctica may include the highly oxygenated water, the temperature, or the small number of <strong>19</strong> <input name=\"q6\" type=\"text\" id=\"q19_input\">. A further fascinating finding was the existence of canyons in the seabed caused by passing <strong>20</strong> <input name=\"q7\" type=\"text\" id=\"q20_input\">. Many creatures living at great depth look very strange, such as tunicates, which seem to be made of <strong>21</strong> <input name=\"q8\" type=\"text\" id=\"q21_input\">. One frightening-looking fish species is characterised by loss of its <strong>22</strong> <input name=\"q9\" type=\"text\" id=\"q22_input\"> and the fact that it spawns only once. Another fish has something like a length of string attached to its <strong>23</strong> <input name=\"q10\" type=\"text\" id=\"q23_input\"> that assists with hunting.</p>\n</div>\n</div>"},{"groupId":"group-3","kind":"matching","questionIds":["q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Look at the following people (Questions 24–26) and the list of opinions below.</p>\n<p>Match each person with the correct opinion, <strong>A–G</strong>.</p>\n<div class=\"match-question-item\">\n<p><strong>24</strong> Mary Livingston</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>25</strong> Stu Hanchet</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>26</strong> Max Quinn</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div class=\"options-pool\" id=\"opinions-pool\">\n<strong>List of opinions</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A The repetitive food was one of the hardships of the voyage.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Respecting your subjects' privacy gets the best results.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C The summer is the best time to sail these waters.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D The kitchen is one of the most important parts of the ship.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Being separated from family was difficult.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F The nature of scientific work may surprise some people.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G More applications to join the group were received than there were places.</div>\n</div>\n</div>\n</div>","allowOptionReuse":false}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"14","q2":"15","q3":"16","q4":"17","q5":"18","q6":"19","q7":"20","q8":"21","q9":"22","q10":"23","q11":"24","q12":"25","q13":"26"}});
+})(typeof window !== "undefined" ? window : globalThis);
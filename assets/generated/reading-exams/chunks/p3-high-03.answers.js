@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-03", "answers", {"answerKey":{"q1":"B","q2":"C","q3":"A","q4":"A","q5":"NOT GIVEN","q6":"YES","q7":"NOT GIVEN","q8":"NO","q9":"NO","q10":"YES","q11":"E","q12":"D","q13":"A","q14":"G"}});
+})(typeof window !== "undefined" ? window : globalThis);
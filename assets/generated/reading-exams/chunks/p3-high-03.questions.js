@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-03", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Choose the correct letter, A, B, C or D.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> In the first paragraph, the writer suggests that a talented musician is someone</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A who is aware of being set apart from other people.</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B whose brain structure is unlike that of other people.</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C who can perform extremely well in early childhood.</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D whose essential skills are more varied than those of ordinary people.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> According to the writer, what is unclear about the findings of Gottfried Schlaug?</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A which part of the brain is linked to a particular musical skill.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B which type of musical skill leads to the greatest change in the brain.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C whether a feature of the brain is a cause or an effect of a musical skill.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D whether the acquisition of a musical skill is easier for some people than others.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> According to the writer, what has been established by studies of violin players?</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A Changes may occur in the brain following violin practice.</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B Left-handed violinists have a different brain structure from other people.</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C A violinist's hand size is not due to practice but to genetic factors.</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D Violinists are born with brains that have a particular structure.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> According to the writer, findings on the amount of practice done by expert musicians suggest that</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A talent may have little to do with expertise.</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B practice may actually prevent the development of talent.</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C talent may not be recognised by teachers.</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D expertise may be related to quality of instruction.</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"yes_no_not_given","questionIds":["q5","q6","q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-9-10-anchor\">\n<h4>Questions 31–36</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 31-36 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>31</strong> Anders Ericsson's work with cognitive psychology has influenced other researchers.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> Different areas of expertise seem to have one specific thing in common.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> In order to be useful, practice must be carried out regularly every day.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Anyone who practises for long enough can reach the level of a world-class expert.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Occasionally, someone can become an expert at a global level with fewer than 10,000 hours' practice.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> Existing knowledge of learning and cognitive skills supports the importance of practice.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"matching","questionIds":["q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Complete the summary using the list of words, <strong>A-J</strong>, below.</p>\n<div class=\"summary-text\">\n<h5>Mozart</h5>\n<p>\nThe case of Mozart could be quoted as evidence against the 10,000-hour practice theory. However, the writer points out that the young Mozart received a lot of <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span> from his father, and that the symphony he wrote at the age of <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> was not <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span> and may be of only academic interest. The case therefore supports the view that expertise is not solely the result of <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span> characteristics.\n</p>\n</div>\n<div class=\"options-pool\" id=\"word-options-pool\">\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A popular</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B artistic</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C completed</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D eight</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E tuition</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F encouragement</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G inherited</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"H\">H four</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"I\">I practice</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"J\">J two</div>\n</div>\n</div>\n</div>","allowOptionReuse":false}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
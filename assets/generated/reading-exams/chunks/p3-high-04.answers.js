@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-04", "answers", {"answerKey":{"q1":"K","q2":"H","q3":"D","q4":"J","q5":"E","q6":"B","q7":"B","q8":"C","q9":"D","q10":"C","q11":"B","q12":"YES","q13":"NOT GIVEN","q14":"YES"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-04", "questions", {"questionGroups":[{"groupId":"group-1","kind":"summary_completion","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p>Complete the summary below using the list of words and phrases <strong>A–K</strong>.</p>\n<div class=\"summary-text\">\n<h5>Provine's early findings on yawns</h5>\n<p>Through his observations of yawns, Provine was able to confirm that <strong>27</strong> <span id=\"q1-target\" class=\"drop-target-summary\" data-question=\"q1\"></span> do not exist.</p>\n<p>Just like a <strong>28</strong> <span id=\"q2-target\" class=\"drop-target-summary\" data-question=\"q2\"></span>, yawns cannot be interrupted after they have begun. This is because yawns occur as a <strong>29</strong> <span id=\"q3-target\" class=\"drop-target-summary\" data-question=\"q3\"></span> rather than a stimulus-response, as was previously thought.</p>\n<p>In measuring the time taken to yawn, Provine found that a typical yawn lasts about <strong>30</strong> <span id=\"q4-target\" class=\"drop-target-summary\" data-question=\"q4\"></span>. He also found that it is common for people to yawn a number of times in quick succession, with the yawns usually being around <strong>31</strong> <span id=\"q5-target\" class=\"drop-target-summary\" data-question=\"q5\"></span> apart. When studying whether length and rate were connected, Provine concluded that people who yawn less do not necessarily produce <strong>32</strong> <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> to make up for this.</p>\n</div>\n<div id=\"word-options\">\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A form and function</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B long yawns</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C 3 seconds</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D fixed-action pattern</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E 68 seconds</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F short yawns</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G reflex</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H sneeze</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I short duration</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"J\">J 6 seconds</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"K\">K half-yawns</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q7","q8","q9","q10","q11"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-11-anchor\">\n<h4>Questions 33–37</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>33</strong> What did Provine conclude from his closed-nose yawn experiment?</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"> A Ending a yawn requires use of the nostrils</label> <label><input name=\"q7\" type=\"radio\" value=\"B\"> B You can yawn without breathing through your nose</label> <label><input name=\"q7\" type=\"radio\" value=\"C\"> C Breathing through the nose produces a silent yawn</label> <label><input name=\"q7\" type=\"radio\" value=\"D\"> D The role of the nose in yawning needs further investigation</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Provine's clenched-teeth yawn experiment shows that</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"> A yawning is unconnected with fatigue</label> <label><input name=\"q8\" type=\"radio\" value=\"B\"> B a yawn is the equivalent of a deep intake of breath</label> <label><input name=\"q8\" type=\"radio\" value=\"C\"> C you have to be able to open your mouth wide to yawn</label> <label><input name=\"q8\" type=\"radio\" value=\"D\"> D breathing with the teeth together is as efficient as through the nose</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> The nose-yawn experiment was used to test whether yawning</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"> A can be stopped after it has started</label> <label><input name=\"q9\" type=\"radio\" value=\"B\"> B is the result of motor programming</label> <label><input name=\"q9\" type=\"radio\" value=\"C\"> C involves both inhalation and exhalation</label> <label><input name=\"q9\" type=\"radio\" value=\"D\"> D can be accomplished only through the nose</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> In people paralysed on one side because of brain damage</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"> A yawning may involve only one side of the face</label> <label><input name=\"q10\" type=\"radio\" value=\"B\"> B the yawning response indicates that recovery is likely</label> <label><input name=\"q10\" type=\"radio\" value=\"C\"> C movement in the paralysed arm is stimulated by yawning</label> <label><input name=\"q10\" type=\"radio\" value=\"D\"> D yawning can be used as an exercise to prevent muscle wasting</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> In the last paragraph, the writer concludes that</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"> A yawning is a sign of boredom</label> <label><input name=\"q11\" type=\"radio\" value=\"B\"> B we yawn in spite of the development of our species</label> <label><input name=\"q11\" type=\"radio\" value=\"C\"> C yawning is a more passive activity than we imagine</label> <label><input name=\"q11\" type=\"radio\" value=\"D\"> D we are stimulated to yawn when our brain activity is low</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"yes_no_not_given","questionIds":["q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q12-13-14-anchor\">\n<h4>Questions 38–40</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>38</strong> Research students were initially reluctant to appreciate the value of Provine's studies.</p>\n<div class=\"radio-options\" style=\"flex-direction: row;\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> When fetuses yawn and stretch, they are learning how to control movement.</p>\n<div class=\"radio-options\" style=\"flex-direction: row;\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> According to Provine, referring to only one function is probably inadequate to explain why people yawn.</p>\n<div class=\"radio-options\" style=\"flex-direction: row;\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
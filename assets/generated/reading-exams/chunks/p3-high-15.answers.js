@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-15", "answers", {"answerKey":{"q1":"YES","q2":"NO","q3":"YES","q4":"NO","q5":"NOT GIVEN","q6":"pods","q7":"physical environment","q8":"mother","q9":"A","q10":"C","q11":"D","q12":"G","q13":"D","q14":"F"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-15", "questions", {"questionGroups":[{"groupId":"group-1","kind":"yes_no_not_given","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<p>In boxes 27–31 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> Resident killer whales appear to remain with their maternal group for life.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Resident killer whales have a more restricted range of calls than transients.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> There is a vocabulary of sounds which is common to all transient killer whales.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Resident killer whales share the dialects of other resident communities living in the same waters.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> The dialects of transient killer whales remain constant over time.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-anchor\">\n<h4>Questions 32–34</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<p>It has been observed that resident killer whales invariably live in fixed family groups, known as <strong>32</strong> <input type=\"text\" id=\"q32_input\" name=\"q6\">. Each of these has its own unique set of calls, despite close contact with other family groups. As the same areas of ocean contain many different groups with widely varying dialects, it is clear that these differences could not have emerged as a result of the whales' <strong>33</strong> <input type=\"text\" id=\"q33_input\" name=\"q7\">.</p>\n<p>According to tests conducted by Lance Barrett-Lennard, a calf communicates exclusively with the dialect of the group to which its <strong>34</strong> <input type=\"text\" id=\"q34_input\" name=\"q8\"> belongs. Barrett-Lennard also rejects the idea that the call patterns are inherited.</p>\n</div>\n</div>"},{"groupId":"group-3","kind":"multi_choice","questionIds":["q9","q10","q11"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-anchor\">\n<h4>Questions 35–37</h4>\n<p>Choose <strong>THREE</strong> letters, <strong>A–F</strong>.</p>\n<p>Which <strong>THREE</strong> of the following features of whales are mentioned in the passage?</p>\n<div class=\"checkbox-options\" style=\"flex-direction: column; align-items: flex-start; gap: 10px;\">\n<label><input type=\"checkbox\" name=\"q9-10-11\" value=\"A\"> <strong>A</strong> intelligence</label> <label><input type=\"checkbox\" name=\"q9-10-11\" value=\"B\"> <strong>B</strong> physical strength</label> <label><input type=\"checkbox\" name=\"q9-10-11\" value=\"C\"> <strong>C</strong> sensitivity to sound</label> <label><input type=\"checkbox\" name=\"q9-10-11\" value=\"D\"> <strong>D</strong> prolonged life span</label> <label><input type=\"checkbox\" name=\"q9-10-11\" value=\"E\"> <strong>E</strong> lengthy period of fertility</label> <label><input type=\"checkbox\" name=\"q9-10-11\" value=\"F\"> <strong>F</strong> adaptability to a variety of foods</label>\n</div>\n</div>"},{"groupId":"group-4","kind":"table_completion","questionIds":["q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q12-13-14-anchor\">\n<h4>Questions 38–40</h4>\n<p>Reading Passage 3 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 200px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>38</strong> an example of the kind of information passed by whales to each other</td>\n<td><input type=\"radio\" name=\"q12\" value=\"A\"></td><td><input type=\"radio\" name=\"q12\" value=\"B\"></td><td><input type=\"radio\" name=\"q12\" value=\"C\"></td><td><input type=\"radio\" name=\"q12\" value=\"D\"></td><td><input type=\"radio\" name=\"q12\" value=\"E\"></td><td><input type=\"radio\" name=\"q12\" value=\"F\"></td><td><input type=\"radio\" name=\"q12\" value=\"G\"></td><td><input type=\"radio\" name=\"q12\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>39</strong> a reference to variations in communication styles between different cultures within one species</td>\n<td><input type=\"radio\" name=\"q13\" value=\"A\"></td><td><input type=\"radio\" name=\"q13\" value=\"B\"></td><td><input type=\"radio\" name=\"q13\" value=\"C\"></td><td><input type=\"radio\" name=\"q13\" value=\"D\"></td><td><input type=\"radio\" name=\"q13\" value=\"E\"></td><td><input type=\"radio\" name=\"q13\" value=\"F\"></td><td><input type=\"radio\" name=\"q13\" value=\"G\"></td><td><input type=\"radio\" name=\"q13\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>40</strong> ways in which the skills of whales are favourable for the development of culture</td>\n<td><input type=\"radio\" name=\"q14\" value=\"A\"></td><td><input type=\"radio\" name=\"q14\" value=\"B\"></td><td><input type=\"radio\" name=\"q14\" value=\"C\"></td><td><input type=\"radio\" name=\"q14\" value=\"D\"></td><td><input type=\"radio\" name=\"q14\" value=\"E\"></td><td><input type=\"radio\" name=\"q14\" value=\"F\"></td><td><input type=\"radio\" name=\"q14\" value=\"G\"></td><td><input type=\"radio\" name=\"q14\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
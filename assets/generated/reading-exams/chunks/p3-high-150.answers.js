@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-150", "answers", {"answerKey":{"q1":"D","q2":"G","q3":"A","q4":"E","q5":"YES","q6":"NO","q7":"NOT GIVEN","q8":"NO","q9":"NOT GIVEN","q10":"A","q11":"B","q12":"D","q13":"A","q14":"C"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-150", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-high-150","meta":{"title":"A closer examination of a study on verbal and non-verbal messages 语言表达研究","category":"P3","frequency":"high","pdfFilename":"60. P3 - A closer examination of a study on verbal and non-verbal messages 语言表达研究【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/60. P3 - A closer examination of a study on verbal and non-verbal messages 语言表达研究【高】/","legacyFilename":"60. P3 - A closer examination of a study on verbal and non-verbal messages 语言表达研究【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/60. P3 - A closer examination of a study on verbal and non-verbal messages 语言表达研究【高】/60. P3 - A closer examination of a study on verbal and non-verbal messages 语言表达研究【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/60. P3 - A closer examination of a study on verbal and non-verbal messages 语言表达研究【高】/60. P3 - A closer examination of a study on verbal and non-verbal messages 语言表达研究【高】.pdf","ieltsHtml":"IELTS/P3/A closer examination of a study on verbal and non-verbal messages.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.770Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-150", "questions", {"questionGroups":[{"groupId":"group-1","kind":"summary_completion","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Complete the summary using the list of words and phrases, A–H, below.</p>\n<div class=\"summary-text\">\n<h5>Mehrabian's 1967 study</h5>\n<p>\nAlbert Mehrabian and his colleagues carried out an influential study comparing the <strong>27</strong> <span id=\"q1-target\" class=\"drop-target-summary\" data-question=\"q1\"></span> of verbal and non-verbal communication. This involved two experiments. In both experiments, subjects had to identify the <strong>28</strong> <span id=\"q2-target\" class=\"drop-target-summary\" data-question=\"q2\"></span> being communicated by other people. The two main areas focused on in the first experiment were voice tones and <strong>29</strong> <span id=\"q3-target\" class=\"drop-target-summary\" data-question=\"q3\"></span>, while the second focused mainly on voice tones and <strong>30</strong> <span id=\"q4-target\" class=\"drop-target-summary\" data-question=\"q4\"></span>.\n</p>\n</div>\n<div id=\"word-options\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A facial expressions</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B purposes</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C printed words</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D effects</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E word meanings</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F gender differences</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G feelings</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H characteristics</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"yes_no_not_given","questionIds":["q5","q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n<h4>Questions 31–35</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<p>In boxes 31–35 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>31</strong> One limitation of the study was that there were too few subjects involved.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> The fact that the subjects in the study came from a similar background was an advantage.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> The two experiments should have been carried out in a different order.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> The researchers' choice of a neutral word was helpful in the context of the study.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> The study would have been more valid if it had included a range of languages.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"single_choice","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>36</strong> What does the writer say about the “numerical precision” of Mehrabian's study?</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"> A It makes the claims more attractive.</label> <label><input name=\"q10\" type=\"radio\" value=\"B\"> B It is the strongest point of the study.</label> <label><input name=\"q10\" type=\"radio\" value=\"C\"> C It will appeal to superstitious people.</label> <label><input name=\"q10\" type=\"radio\" value=\"D\"> D It allows comparison between languages.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> What does the writer say about the popularity of the 7–38–55 formula?</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"> A It is unlikely to maintain its present status.</label> <label><input name=\"q11\" type=\"radio\" value=\"B\"> B It is leading to an undervaluing of words.</label> <label><input name=\"q11\" type=\"radio\" value=\"C\"> C It should be applied in a more practical way.</label> <label><input name=\"q11\" type=\"radio\" value=\"D\"> D It may help understanding of non-verbal messages.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> What point is Bradley making about language learning?</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"A\"> A Language could be learned more efficiently than it is.</label> <label><input name=\"q12\" type=\"radio\" value=\"B\"> B More research is needed into attitudes to communication.</label> <label><input name=\"q12\" type=\"radio\" value=\"C\"> C More time should be spent looking at tone and body language.</label> <label><input name=\"q12\" type=\"radio\" value=\"D\"> D Language must be important since we make an effort to acquire it.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> What does Mehrabian himself say about his findings?</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"> A They are relevant to only one area of communication.</label> <label><input name=\"q13\" type=\"radio\" value=\"B\"> B It is only in maths that 100% of communication is verbal.</label> <label><input name=\"q13\" type=\"radio\" value=\"C\"> C Feelings are more difficult to communicate than numerical facts.</label> <label><input name=\"q13\" type=\"radio\" value=\"D\"> D Non-verbal communication is the main part of the message.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> What is the writer's purpose in the paragraph beginning “To be fair...\"?</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"A\"> A To justify the strong points of Mehrabian's study.</label> <label><input name=\"q14\" type=\"radio\" value=\"B\"> B To outline other research on non-verbal behaviour.</label> <label><input name=\"q14\" type=\"radio\" value=\"C\"> C To present varying interpretations of Mehrabian's study.</label> <label><input name=\"q14\" type=\"radio\" value=\"D\"> D To show that textbooks tend to ignore non-verbal behaviour.</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
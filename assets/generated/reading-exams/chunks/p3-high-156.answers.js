@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-156", "answers", {"answerKey":{"q1":["hammer","hammer bone"],"q2":"body","q3":"pad","q4":"sinus cavities","q5":"trunks and feet","q6":"infrasonic","q7":"ecology","q8":"seismic signals","q9":"auditory communication","q10":"mate","q11":"ground","q12":"A","q13":"A"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-156", "questions", {"questionGroups":[{"groupId":"group-1","kind":"diagram_completion","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 28–31</h4>\n<p>Label the diagram below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"diagram-container diagram-container--elephant\">\n<img class=\"diagram-image--elephant\" loading=\"lazy\" src=\"media/p3-high-156-elephant-communication.png\" alt=\"Diagram of an elephant's head and features for seismic communication\" style=\"max-width: 100%; width: auto; height: auto; display: block; margin: 0 auto;\">\n</div>\n<div class=\"diagram-inputs\">\n<div class=\"diagram-input-item\"><label for=\"q28_input\">28</label><input type=\"text\" id=\"q28_input\" name=\"q1\"></div>\n<div class=\"diagram-input-item\"><label for=\"q29_input\">29</label><input type=\"text\" id=\"q29_input\" name=\"q2\"></div>\n<div class=\"diagram-input-item\"><label for=\"q30_input\">30</label><input type=\"text\" id=\"q30_input\" name=\"q3\"></div>\n<div class=\"diagram-input-item\"><label for=\"q31_input\">31</label><input type=\"text\" id=\"q31_input\" name=\"q4\"></div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q5","q6","q7","q8","q9","q10","q11"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-9-10-11-anchor\">\n<h4>Questions 32–38</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN THREE WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<p>\nHow the elephants sense these sound vibrations is still unknown, but O'Connell-Rodwell, a post-doctoral researcher at Stanford University, proposes that elephants are ‘listening' with their <strong>32</strong> <input type=\"text\" id=\"q32_input\" name=\"q5\"> by two kinds of nerve endings that respond to vibrations with both <strong>33</strong> <input type=\"text\" id=\"q33_input\" name=\"q6\"> frequency and slightly higher frequencies. O'Connell-Rodwell's work is at the combination of geophysics, neurophysiology and <strong>34</strong> <input type=\"text\" id=\"q34_input\" name=\"q7\">.\n</p>\n<p>\nIt was known that seismic communication existed extensively within small animals, but O'Connell-Rodwell was the first person to indicate that a large land animal would send and receive <strong>35</strong> <input type=\"text\" id=\"q35_input\" name=\"q8\"> too. Also, she noticed the freezing behaviour by putting a male planthopper on a stem and playing back a female call, which might prove the existence of other communicative approaches besides <strong>36</strong> <input type=\"text\" id=\"q36_input\" name=\"q9\">.\n</p>\n<p>\nScientists have determined that an elephant's ability to communicate over long distances is essential, especially when elephant herds are finding a <strong>37</strong> <input type=\"text\" id=\"q37_input\" name=\"q10\"> or are warning of predators. Finally, the results of our 2002 study showed us that elephants could detect warning calls through the <strong>38</strong> <input type=\"text\" id=\"q38_input\" name=\"q11\">.\n</p>\n</div>\n</div>"},{"groupId":"group-3","kind":"single_choice","questionIds":["q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q12-13-anchor\">\n<h4>Questions 39–40</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>39</strong> According to the passage, it is determined that an elephant needs to communicate over long distances for its survival</p>\n<div class=\"mcq-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"A\"> A when a threatening predator appears.</label> <label><input name=\"q12\" type=\"radio\" value=\"B\"> B when young elephants meet humans.</label> <label><input name=\"q12\" type=\"radio\" value=\"C\"> C when older members of the herd want to flee from the group.</label> <label><input name=\"q12\" type=\"radio\" value=\"D\"> D when a female elephant is in estrus.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> What is the author's attitude toward the experiment using three different recordings in the last paragraph?</p>\n<div class=\"mcq-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"> A The outcome is definitely out of the original expectation.</label> <label><input name=\"q13\" type=\"radio\" value=\"B\"> B The data cannot be very clearly obtained.</label> <label><input name=\"q13\" type=\"radio\" value=\"C\"> C The result can be somewhat undecided or inaccurate.</label> <label><input name=\"q13\" type=\"radio\" value=\"D\"> D The result can be unfamiliar to the public.</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"28","q2":"29","q3":"30","q4":"31","q5":"32","q6":"33","q7":"34","q8":"35","q9":"36","q10":"37","q11":"38","q12":"39","q13":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
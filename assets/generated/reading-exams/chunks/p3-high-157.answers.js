@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-157", "answers", {"answerKey":{"q1":"v","q2":"iv","q3":"vii","q4":"ii","q5":"viii","q6":"vi","q7":"iii","q8":"B","q9":"A","q10":"C","q11":"B","q12":"food","q13":"children","q14":"edible"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-157", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-high-157","meta":{"title":"Flower Power 鲜花的力量(花之力)","category":"P3","frequency":"high","pdfFilename":"67. P3 - Flower Power 鲜花的力量(花之力)【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/67. P3 - Flower Power 鲜花的力量(花之力)【高】/","legacyFilename":"67. P3 - Flower Power 鲜花的力量(花之力)【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/67. P3 - Flower Power 鲜花的力量(花之力)【高】/67. P3 - Flower Power 鲜花的力量(花之力)【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/67. P3 - Flower Power 鲜花的力量(花之力)【高】/67. P3 - Flower Power 鲜花的力量(花之力)【高】.pdf","ieltsHtml":"IELTS/P3/Flower Power.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.312Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-157", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 27–33</h4>\n<p>Reading Passage 3 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from this list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. A negative reaction to receiving flowers</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. Some surprisingly strong responses to flowers</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. A mutually beneficial relationship?</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. Becoming more open about personal matters</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. Some common social functions of flowers</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. Sensory appeal versus practical purpose of flowers</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. Bridging the gap between strangers in an enclosed space</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. An imperfect theory</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q8","q9","q10","q11"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-anchor\">\n<h4>Questions 34–37</h4>\n<p>Look at the following statements (Questions 34–37) and the list of studies below.</p>\n<p>Match each statement with the correct studies, <strong>A-C</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"question-item\" id=\"q8-anchor\">\n<p><strong>34</strong> The study focused on participants' short-term reaction to receiving flowers.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"> A the first study</label> <label><input name=\"q8\" type=\"radio\" value=\"B\"> B the second study</label> <label><input name=\"q8\" type=\"radio\" value=\"C\"> C the third study</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q9-anchor\">\n<p><strong>35</strong> Participants were deliberately misled as to the aim of the study.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"> A the first study</label> <label><input name=\"q9\" type=\"radio\" value=\"B\"> B the second study</label> <label><input name=\"q9\" type=\"radio\" value=\"C\"> C the third study</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q10-anchor\">\n<p><strong>36</strong> Receiving flowers had a notable effect on participants' mental capacities.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"> A the first study</label> <label><input name=\"q10\" type=\"radio\" value=\"B\"> B the second study</label> <label><input name=\"q10\" type=\"radio\" value=\"C\"> C the third study</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q11-anchor\">\n<p><strong>37</strong> Male and female responses were more uniform than expected.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"> A the first study</label> <label><input name=\"q11\" type=\"radio\" value=\"B\"> B the second study</label> <label><input name=\"q11\" type=\"radio\" value=\"C\"> C the third study</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q12-13-14-anchor\">\n<h4>Questions 38–40</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<p style=\"line-height: 2.5;\"><strong>A possible explanation for the appeal of flowers</strong></p>\n<p style=\"line-height: 2.5;\">It has been suggested that our intense response to flowers originates in prehistoric times. The presence of flowers might indicate a potential source of <strong>38</strong> <input class=\"blank\" name=\"q12\"> in a particular location, and primitive humans would search for such signs when looking for a suitable site to raise their <strong>39</strong> <input class=\"blank\" name=\"q13\">. The interpretation of these signs was essential for the survival of our ancestors. However, the problem with this idea is that the plants producing the most attractive flowers do not usually have fruit which is <strong>40</strong> <input class=\"blank\" name=\"q14\">.</p>\n<div id=\"q13-anchor\"></div>\n<div id=\"q14-anchor\"></div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-159", "answers", {"answerKey":{"q1":"NO","q2":"NOT GIVEN","q3":"YES","q4":"NOT GIVEN","q5":"YES","q6":"NO","q7":"A","q8":"C","q9":"D","q10":"D","q11":"A","q12":"H","q13":"E","q14":"B"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-159", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>Grimm's Fairy Tales</h3>\n<p><strong>A</strong> The Brothers Grimm, Jacob and Wilhelm, named their story collection Children's and Household Tales and published the first of its seven editions in Germany in 1812. The table of contents reads like an A-list of fairy-tale celebrities: Cinderella, Sleeping Beauty, Snow White, Little Red Riding Hood, Rapunzel, Rumpelstiltskin, Hansel and Gretel, the Frog King. Drawn mostly from oral narratives, the 210 stories in the Grimm's' collection represent an anthology of fairy tales, animal fables, rustic farces, and religious allegories that remain unrivalled to this day.</p>\n<p><strong>B</strong> Such lasting fame would have shocked the humble Grimms. During their lifetimes the collection sold modestly in Germany, at first only a few hundred copies a year. The early editions were not even aimed at children. The brothers initially refused to consider illustrations, and scholarly footnotes took up almost as much space as the tales themselves. Jacob and Wilhelm viewed themselves as patriotic folklorists, not as entertainers of children. They began their work at a time when Germany had been overrun by the French under Napoleon, who was intent on suppressing local culture. As young, workaholic scholars, single and sharing a cramped flat, the Brothers Grimm undertook the fairy-tale collection with the goal of serving the endangered oral tradition of Germany.</p>\n<p><strong>C</strong> For much of the 19th-century teachers, parents, and religious figures, particularly in the United States, deplored the Grimms' collection for its raw, uncivilized content. Offended adults objected to the gruesome punishments inflicted on the stories' villains. In the original “Snow White\" the evil stepmother is forced to dance in red-hot iron shoes until she falls down dead. Even today some protective parents shy from the Grimms' tales because of their reputation for violence.</p>\n<p><strong>D</strong> Despite its sometimes rocky reception, Children's and Household Tales gradually took root with the public. The brothers had not foreseen that the appearance of their work would coincide with a great flowering of children's literature in Europe. English publishers led the way, issuing high-quality picture books such as Jack and the Beanstalk and handsome folktale collections, all to satisfy a newly literate audience seeking virtuous material for the nursery. Once the Brothers Grimm sighted this new public, they set about refining and softening their tales, which had originated centuries earlier as earthy peasant fare. In the Grimms' hands, cruel mothers became nasty stepmothers, unmarried lovers were made chaste, and the incestuous father was recast as the devil.</p>\n<p><strong>E</strong> In the 20th century, the Grimms' fairy tales have come to rule the bookshelves of children's bedrooms. The stories read like dreams come true: handsome lads and beautiful damsels, armed with magic, triumph over giants and witches and wild beasts. They outwit mean, selfish adults. Inevitably the boy and girl fall in love and live happily ever after. And parents keep reading because they approve of the finger-wagging lessons inserted into the stories: keep your promises, don't talk to strangers, work hard, obey your parents. According to the Grimms, the collection served as \"a manual of manners\".</p>\n<p><strong>F</strong> Altogether some 40 persons delivered tales to the Grimms. Many of the storytellers came to the Grimms' house in Kassel. The brothers particularly welcomed the visits of Dorothea Viehmann, a widow who walked to town to sell produce from her garden. An innkeeper's daughter, Viehmann had grown up listening to stories from travellers on the road to Frankfurt. Among her treasure was “Aschenputtel” -Cinderella. Marie Hassenpflug was a 20-year-old friend of their sister, Charlotte, from a well-bred, French-speaking family. Marie's wonderful stories blended motifs from the oral tradition and from Perrault's influential 1697 book, Tales of My Mother Goose, which contained elaborate versions of “Little Red Riding Hood”, “Snow White\", and \"Sleeping Beauty”, among others. Many of these had been adapted from earlier Italian tales.</p>\n<p><strong>G</strong> Given that the origins of many of the Grimm fairy tales reach throughout Europe and into the Middle East and Orient, the question must be asked: How German are the Grimm tales? Very, says scholar Heinz Rolleke. Love of the underdog, rustic simplicity, creative energy—these are Teutonic traits. The coarse texture of life during medieval times in Germany, when many of the tales entered the oral tradition, also coloured the narratives. Throughout Europe, children were often neglected and abandoned, like Hansel and Gretel. Accused witches were burned at the stake, like the evil mother-in-law in “The Six Swans”. “The cruelty in the stories was not the Grimms' fantasy”, Rolleke points out, “It reflected the law-and-order system of the old times\".</p>\n<p><strong>H</strong> The editorial fingerprints left by the Grimms betray the specific values of 19th-century Christian, bourgeois German society. But that has not stopped the tales from being embraced by almost every culture and nationality in the world. What accounts for this widespread, enduring popularity? Bernhard Lauer points to the “universal style” of the writing, you have no concrete descriptions of the land, or the clothes, or the forest, or the castles. It makes the stories timeless and placeless. “The tales allow us to express ‘our utopian longings',” says Jack Zipes of the University of Minnesota, whose 1987 translation of the complete fairy tales captures the rustic vigour of the original text. “They show a striving for happiness that none of us knows but that we sense is possible. We can identify with the heroes of the tales and become in our mind the masters and mistresses of our own destinies.\"</p>\n<p><strong>I</strong> Fairy tales provide a workout for the unconscious, psychoanalysts maintain. Bruno Bettelheim famously promoted the therapeutic value of the Grimms' stories, calling fairy tales the “great comforters\". By confronting fears and phobias, symbolized by witches, heartless stepmothers, and hungry wolves, children find they can master their anxieties. Bettelheim's theory continues to be hotly debated. But most young readers aren't interested in exercising their unconsciousness. The Grimm tales, in fact, please in an infinite number of ways, something about them seems to mirror whatever moods or interests we bring to our reading of them. The flexibility of interpretation suits them for almost any time and any culture.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-159", "questions", {"questionGroups":[{"groupId":"group-1","kind":"yes_no_not_given","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p>Do the following statements agree with the information given in Reading Passage 3?</p>\n<p>In boxes 27–32 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> The Grimm brothers believed they would achieve international fame.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> The Grimm brothers were forced to work in secret.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Some parents today still think Grimm fairy tales are not suitable for children.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> The first edition of Grimm's fairy tales sold more widely in England than in Germany.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> Adults like reading Grimm's fairy tales for reasons different from those of children.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> The Grimm brothers based the story “Cinderella” on the life of Dorothea Viehmann.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-anchor\">\n<h4>Questions 33–35</h4>\n<p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>33</strong> In paragraph D, what changes happened at that time in Europe?</p>\n<div class=\"radio-options radio-options-column\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"> A Literacy levels of the population increased.</label> <label><input name=\"q7\" type=\"radio\" value=\"B\"> B The development of printing technology made it easier to publish.</label> <label><input name=\"q7\" type=\"radio\" value=\"C\"> C Schools were open to children.</label> <label><input name=\"q7\" type=\"radio\" value=\"D\"> D People were fond of collecting superb picture books.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> What changes did the Grimm Brothers make in later editions?</p>\n<div class=\"radio-options radio-options-column\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"> A They made the stories shorter.</label> <label><input name=\"q8\" type=\"radio\" value=\"B\"> B They used more oral language.</label> <label><input name=\"q8\" type=\"radio\" value=\"C\"> C The content of the tales became less violent.</label> <label><input name=\"q8\" type=\"radio\" value=\"D\"> D They found other origins of the tales.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> What did Marie Hassenpflug contribute to the Grimm's Fairy tales?</p>\n<div class=\"radio-options radio-options-column\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"> A She wrote stories.</label> <label><input name=\"q9\" type=\"radio\" value=\"B\"> B She discussed the stories with them.</label> <label><input name=\"q9\" type=\"radio\" value=\"C\"> C She translated a popular book for the brothers using her talent for languages.</label> <label><input name=\"q9\" type=\"radio\" value=\"D\"> D She told the oral stories that were based on traditional Italian stories.</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"single_choice","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A-H</strong>, below.</p>\n<div class=\"question-item\">\n<p><strong>36</strong> Heinz Rolleke said the Grimm's tales are \"German\" because some tales</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"> A</label><label><input name=\"q10\" type=\"radio\" value=\"B\"> B</label><label><input name=\"q10\" type=\"radio\" value=\"C\"> C</label><label><input name=\"q10\" type=\"radio\" value=\"D\"> D</label><label><input name=\"q10\" type=\"radio\" value=\"E\"> E</label><label><input name=\"q10\" type=\"radio\" value=\"F\"> F</label><label><input name=\"q10\" type=\"radio\" value=\"G\"> G</label><label><input name=\"q10\" type=\"radio\" value=\"H\"> H</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> Heinz Rolleke said the abandoned children in tales</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"> A</label><label><input name=\"q11\" type=\"radio\" value=\"B\"> B</label><label><input name=\"q11\" type=\"radio\" value=\"C\"> C</label><label><input name=\"q11\" type=\"radio\" value=\"D\"> D</label><label><input name=\"q11\" type=\"radio\" value=\"E\"> E</label><label><input name=\"q11\" type=\"radio\" value=\"F\"> F</label><label><input name=\"q11\" type=\"radio\" value=\"G\"> G</label><label><input name=\"q11\" type=\"radio\" value=\"H\"> H</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> Bernhard Lauer said the writing style of the Grimm brothers is universal because they</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"A\"> A</label><label><input name=\"q12\" type=\"radio\" value=\"B\"> B</label><label><input name=\"q12\" type=\"radio\" value=\"C\"> C</label><label><input name=\"q12\" type=\"radio\" value=\"D\"> D</label><label><input name=\"q12\" type=\"radio\" value=\"E\"> E</label><label><input name=\"q12\" type=\"radio\" value=\"F\"> F</label><label><input name=\"q12\" type=\"radio\" value=\"G\"> G</label><label><input name=\"q12\" type=\"radio\" value=\"H\"> H</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> Jack Zipes said the pursuit of happiness in the tales means they</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"> A</label><label><input name=\"q13\" type=\"radio\" value=\"B\"> B</label><label><input name=\"q13\" type=\"radio\" value=\"C\"> C</label><label><input name=\"q13\" type=\"radio\" value=\"D\"> D</label><label><input name=\"q13\" type=\"radio\" value=\"E\"> E</label><label><input name=\"q13\" type=\"radio\" value=\"F\"> F</label><label><input name=\"q13\" type=\"radio\" value=\"G\"> G</label><label><input name=\"q13\" type=\"radio\" value=\"H\"> H</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> Bruno Bettelheim said the therapeutic value of the tales means that the fairy tales</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"A\"> A</label><label><input name=\"q14\" type=\"radio\" value=\"B\"> B</label><label><input name=\"q14\" type=\"radio\" value=\"C\"> C</label><label><input name=\"q14\" type=\"radio\" value=\"D\"> D</label><label><input name=\"q14\" type=\"radio\" value=\"E\"> E</label><label><input name=\"q14\" type=\"radio\" value=\"F\"> F</label><label><input name=\"q14\" type=\"radio\" value=\"G\"> G</label><label><input name=\"q14\" type=\"radio\" value=\"H\"> H</label>\n</div>\n</div>\n<div class=\"sentence-completion-options\">\n<ul class=\"question-options-list\">\n<li><strong>A</strong> reflect what life was like at that time.</li>\n<li><strong>B</strong> help children deal with their problems.</li>\n<li><strong>C</strong> demonstrate the outdated system.</li>\n<li><strong>D</strong> tell of the simplicity of life in the German countryside.</li>\n<li><strong>E</strong> encourage people to believe that they can do anything.</li>\n<li><strong>F</strong> recognize the heroes in the real life.</li>\n<li><strong>G</strong> contribute to the belief in nature's power.</li>\n<li><strong>H</strong> avoid details about characters' social settings.</li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-161", "answers", {"answerKey":{"q1":"F","q2":"B","q3":"E","q4":"D","q5":"A","q6":"C","q7":["mantis shrimp"],"q8":["a panoramic camera","panoramic camera"],"q9":["the sahara desert","sahara desert"],"q10":["polarised light"],"q11":"D","q12":"A","q13":"F","q14":"C"}});
+})(typeof window !== "undefined" ? window : globalThis);
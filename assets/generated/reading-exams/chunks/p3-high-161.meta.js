@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-161", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-high-161","meta":{"title":"Insect-inspired robots 昆虫机器人","category":"P3","frequency":"high","pdfFilename":"70. P3 - Insect-inspired robots 昆虫机器人【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/70. P3 - Insect-inspired robots 昆虫机器人【高】/","legacyFilename":"70. P3 - Insect-inspired robots 昆虫机器人【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/70. P3 - Insect-inspired robots 昆虫机器人【高】/70. P3 - Insect-inspired robots 昆虫机器人【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/70. P3 - Insect-inspired robots 昆虫机器人【高】/70. P3 - Insect-inspired robots 昆虫机器人【高】.pdf","ieltsHtml":"IELTS/P3/Insect-inspired robots.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.785Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-161", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p>Reading Passage 3 has six sections, <strong>A–F</strong>.</p>\n<p>Which section contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–F</strong>, in the table below.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 250px;\">Information</th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>27</strong> positive and negative possibilities for the use of insect-inspired robots</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>28</strong> how perceived size is used as an aid to navigation</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>29</strong> an example of decision-making taking place in the limbs</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>30</strong> a description of a potential aid in space exploration</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>31</strong> the range of skills that have inspired biorobotics</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>32</strong> how a variety of navigational methods operate at the same time</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-anchor\">\n<h4>Questions 33–36</h4>\n<p>Answer the questions below.</p>\n<p>Choose <strong>NO MORE THAN THREE WORDS</strong> from the passage for each answer.</p>\n<div class=\"short-answer-q\">\n<p><strong>33</strong> Which creature sees particularly well under water?</p>\n<input type=\"text\" id=\"q33_input\" name=\"q7\">\n</div>\n<div class=\"short-answer-q\">\n<p><strong>34</strong> In addition to a computer, what technical equipment is fitted in Dr Zelinsky's robot?</p>\n<input type=\"text\" id=\"q34_input\" name=\"q8\">\n</div>\n<div class=\"short-answer-q\">\n<p><strong>35</strong> Where is the Cataglyphis ant found?</p>\n<input type=\"text\" id=\"q35_input\" name=\"q9\">\n</div>\n<div class=\"short-answer-q\">\n<p><strong>36</strong> What atmospheric effect helps the Cataglyphis ant to know its direction?</p>\n<input type=\"text\" id=\"q36_input\" name=\"q10\">\n</div>\n</div>"},{"groupId":"group-3","kind":"table_completion","questionIds":["q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Look at the following people (Questions 37–40) and the list of robots below.</p>\n<p>Match each person or people with the correct robot, <strong>A–G</strong>.</p>\n<div class=\"group\" style=\"background:var(--bg); padding: 12px; font-size: 0.9em;\">\n<strong>List of Robots</strong><br>\n<strong>A</strong> a robot that makes use of light as well as stored images for navigational purposes<br>\n<strong>B</strong> a robot that can contribute to environmental health<br>\n<strong>C</strong> a robot that can move over difficult surfaces<br>\n<strong>D</strong> a robot that categorises information from the environment according to its usefulness<br>\n<strong>E</strong> a robot that can be used to clean surfaces and collect rubbish<br>\n<strong>F</strong> a robot that has improved on the ability of the insect on which it is based<br>\n<strong>G</strong> a robot that can replace soldiers in war\n</div>\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th>Person / People</th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>37</strong> Dr Alex Zelinsky</td>\n<td><input type=\"radio\" name=\"q11\" value=\"A\"></td><td><input type=\"radio\" name=\"q11\" value=\"B\"></td><td><input type=\"radio\" name=\"q11\" value=\"C\"></td><td><input type=\"radio\" name=\"q11\" value=\"D\"></td><td><input type=\"radio\" name=\"q11\" value=\"E\"></td><td><input type=\"radio\" name=\"q11\" value=\"F\"></td><td><input type=\"radio\" name=\"q11\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>38</strong> Professor Ruediger Wehner</td>\n<td><input type=\"radio\" name=\"q12\" value=\"A\"></td><td><input type=\"radio\" name=\"q12\" value=\"B\"></td><td><input type=\"radio\" name=\"q12\" value=\"C\"></td><td><input type=\"radio\" name=\"q12\" value=\"D\"></td><td><input type=\"radio\" name=\"q12\" value=\"E\"></td><td><input type=\"radio\" name=\"q12\" value=\"F\"></td><td><input type=\"radio\" name=\"q12\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>39</strong> Professor Robert Michelson</td>\n<td><input type=\"radio\" name=\"q13\" value=\"A\"></td><td><input type=\"radio\" name=\"q13\" value=\"B\"></td><td><input type=\"radio\" name=\"q13\" value=\"C\"></td><td><input type=\"radio\" name=\"q13\" value=\"D\"></td><td><input type=\"radio\" name=\"q13\" value=\"E\"></td><td><input type=\"radio\" name=\"q13\" value=\"F\"></td><td><input type=\"radio\" name=\"q13\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>40</strong> Roger Quinn and Professor Roy Ritzmann</td>\n<td><input type=\"radio\" name=\"q14\" value=\"A\"></td><td><input type=\"radio\" name=\"q14\" value=\"B\"></td><td><input type=\"radio\" name=\"q14\" value=\"C\"></td><td><input type=\"radio\" name=\"q14\" value=\"D\"></td><td><input type=\"radio\" name=\"q14\" value=\"E\"></td><td><input type=\"radio\" name=\"q14\" value=\"F\"></td><td><input type=\"radio\" name=\"q14\" value=\"G\"></td>\n</tr>\n</tbody>\n</table>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
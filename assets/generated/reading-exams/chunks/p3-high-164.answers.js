@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-164", "answers", {"answerKey":{"q1":"B","q2":"F","q3":"A","q4":"C","q5":"L","q6":"D","q7":"personnel development","q8":"a luxury","q9":"a language strategy","q10":"strategic solution","q11":"six","q12":"90 hours","q13":"three years","q14":"C"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-164", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p>Complete the summary using the list of phrases, <strong>A–L</strong>, below.</p>\n<div class=\"summary-text\">\n<p>\nMNCs often encounter language barriers in their daily operations, so they seek several approaches to solve such problems. First, using the native language gives them a realistic base in a different-language-speaking country, but problems turn up when they deal with overseas <span id=\"q1-target\" class=\"drop-target-summary\" data-question=\"q1\"></span>. For example, when translating key <span id=\"q2-target\" class=\"drop-target-summary\" data-question=\"q2\"></span>, differences inevitably arise because of rules in different countries. Another way is to rely on a combination of spoken language and <span id=\"q3-target\" class=\"drop-target-summary\" data-question=\"q3\"></span>, yet a report noted that over one-tenth of business <span id=\"q4-target\" class=\"drop-target-summary\" data-question=\"q4\"></span> were processed in a party-language setting. A third way is to hire translators. However, this is <span id=\"q5-target\" class=\"drop-target-summary\" data-question=\"q5\"></span>; besides, if they are not well-prepared, they have to engage in <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> work.\n</p>\n</div>\n<div id=\"word-options\" class=\"options-pool\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A gestures</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B clients</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C transactions</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D assumption</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E accurate</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F documents</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G managers</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H body language</div>\n<div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I long-term</div>\n<div id=\"word-J\" class=\"draggable-word\" draggable=\"true\" data-key=\"J\">J effective</div>\n<div id=\"word-K\" class=\"draggable-word\" draggable=\"true\" data-key=\"K\">K rivals</div>\n<div id=\"word-L\" class=\"draggable-word\" draggable=\"true\" data-key=\"L\">L costly</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-11-12-13-anchor\">\n<h4>Questions 33–39</h4>\n<p>Choose <strong>NO MORE THAN THREE WORDS AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"question-item\" id=\"q7-item\">\n<p><strong>33</strong> What \"understandable reaction” does the author say companies show when facing a skills shortage?</p>\n<input name=\"q7\" type=\"text\" id=\"q7-input\" placeholder=\"Your answer...\">\n</div>\n<div class=\"question-item\" id=\"q8-item\">\n<p><strong>34</strong> During an economic depression, how does the writer label language training in firms?</p>\n<input name=\"q8\" type=\"text\" id=\"q8-input\" placeholder=\"Your answer...\">\n</div>\n<div class=\"question-item\" id=\"q9-item\">\n<p><strong>35</strong> What has Volkswagen Group provided as an example for other multinationals?</p>\n<input name=\"q9\" type=\"text\" id=\"q9-input\" placeholder=\"Your answer...\">\n</div>\n<div class=\"question-item\" id=\"q10-item\">\n<p><strong>36</strong> In Volkswagen, language training is regarded as what kind of solution?</p>\n<input name=\"q10\" type=\"text\" id=\"q10-input\" placeholder=\"Your answer...\">\n</div>\n<div class=\"question-item\" id=\"q11-item\">\n<p><strong>37</strong> How many stages are required to progress from basics to full competence?</p>\n<input name=\"q11\" type=\"text\" id=\"q11-input\" placeholder=\"Your answer...\">\n</div>\n<div class=\"question-item\" id=\"q12-item\">\n<p><strong>38</strong> Roughly how long does each refresher course take?</p>\n<input name=\"q12\" type=\"text\" id=\"q12-input\" placeholder=\"Your answer...\">\n</div>\n<div class=\"question-item\" id=\"q13-item\">\n<p><strong>39</strong> At least how long is needed for a specialist to work effectively in a foreign language?</p>\n<input name=\"q13\" type=\"text\" id=\"q13-input\" placeholder=\"Your answer...\">\n</div>\n</div>"},{"groupId":"group-3","kind":"single_choice","questionIds":["q14"],"bodyHtml":"<div class=\"group\" id=\"q14-anchor\">\n<h4>Question 40</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>40</strong> What is the main function of this passage?</p>\n<div class=\"radio-options\">\n<label><input type=\"radio\" name=\"q14\" value=\"A\"> A Reveal all kinds of language problems that companies may encounter.</label> <label><input type=\"radio\" name=\"q14\" value=\"B\"> B Exhibit well-known cases in dealing with language difficulties.</label> <label><input type=\"radio\" name=\"q14\" value=\"C\"> C Evaluate various approaches to the language barrier in multinational companies.</label> <label><input type=\"radio\" name=\"q14\" value=\"D\"> D Testify that training is the only feasible approach to solve language problems.</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
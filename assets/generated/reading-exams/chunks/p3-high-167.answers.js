@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-167", "answers", {"answerKey":{"q1":"iv","q2":"viii","q3":"vi","q4":"vii","q5":"v","q6":"ix","q7":"ii","q8":"C","q9":"B","q10":"D","q11":"barchans","q12":"shape","q13":"tone","q14":"minerals"}});
+})(typeof window !== "undefined" ? window : globalThis);
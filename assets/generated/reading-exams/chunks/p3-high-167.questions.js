@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-167", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-group\">\n<h4>Questions 27–33</h4>\n<p>Reading Passage 3 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i Moving rapidly across the desert</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Recreating the process in a laboratory</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii Strange music created by human movement</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv A potential threat to industry and communications</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v Dunes coming together and re-forming</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi Needing a specific combination of conditions</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii A continuous cycle</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii The commonest type of dune</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix Old superstitions demystified</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-group\">\n<h4>Questions 34–36</h4>\n<p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>34</strong> What are we told about linear dunes?</p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q8\" type=\"radio\" value=\"A\"> A They are formed by strong winds blowing from one direction.</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"B\"> B They can move up to 100 metres in a twelve-month period.</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"C\"> C They develop in a recognisable shape.</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"D\"> D They make up about 20% of the world's deserts.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Bagnold discovered that movement in barchans was caused by</p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q9\" type=\"radio\" value=\"A\"> A the long straight shape of the dunes.</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"B\"> B the particular composition of the dunes.</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"C\"> C the exceptionally heavy nature of the sand grains.</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"D\"> D the unusual strength of the wind in certain seasons.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> Why does Dr Douady compare a barchan dune to a living organism?</p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q10\" type=\"radio\" value=\"A\"> A It starts small and then increases in size.</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"B\"> B It has an effect on its immediate surroundings.</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"C\"> C Its relations with desert organisms are quite developed.</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"D\"> D Its outline stays the same even after a period of movement.</label></li>\n</ul>\n</div>\n</div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-14-group\">\n<h4>Questions 37–40</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>Singing dunes</h4>\n<p>\nSinging dunes, which belong to the type of dunes known as <strong>37</strong> <input name=\"q11\" type=\"text\" id=\"q37_input\">, produce a very loud sound which is transmitted at a low frequency. Researchers have worked out that sand grains fall down the dune and start vibrating against other grains, forming a sound wave.\n</p>\n<p>\nResearch proves that the individual grains have a similar <strong>38</strong> <input name=\"q12\" type=\"text\" id=\"q38_input\">, but the differences in dimensions alter the <strong>39</strong> <input name=\"q13\" type=\"text\" id=\"q39_input\"> of the 'song'. Each grain is covered with a mixture of different <strong>40</strong> <input name=\"q14\" type=\"text\" id=\"q40_input\">, and this is vital to the sound production.\n</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-170", "answers", {"answerKey":{"q1":"YES","q2":"NO","q3":"YES","q4":"YES","q5":"NOT GIVEN","q6":"A","q7":"C","q8":"B","q9":"D","q10":"B","q11":"C","q12":"A","q13":"D","q14":"E"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-170", "questions", {"questionGroups":[{"groupId":"group-1","kind":"yes_no_not_given","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 27–31 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> The Pacific islands were uninhabited when migrants arrived by sea from Southeast Asia.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Andrew Sharp was the first person to write about the migrants to the islands.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Andrew Sharp believed migratory voyages were based more on luck than on skill.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Despite being controversial, Andrew Sharp's research had positive results.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> Edwin Doran disagreed with the findings of Lewis's research.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q6","q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-10-anchor\">\n<h4>Questions 32–36</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>32</strong> David Lewis's research was different because</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q6\" type=\"radio\" value=\"A\"> A he observed traditional navigators at work</label></li>\n<li><label><input name=\"q6\" type=\"radio\" value=\"B\"> B he conducted test voyages using his own yacht</label></li>\n<li><label><input name=\"q6\" type=\"radio\" value=\"C\"> C he carried no modern instruments on test voyages</label></li>\n<li><label><input name=\"q6\" type=\"radio\" value=\"D\"> D he spoke the same language as the islanders he sailed with</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> What did David Lewis's research discover about traditional navigators?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q7\" type=\"radio\" value=\"A\"> A They used the sun and moon to find their position</label></li>\n<li><label><input name=\"q7\" type=\"radio\" value=\"B\"> B They could not sail further than about 1,000 nautical miles</label></li>\n<li><label><input name=\"q7\" type=\"radio\" value=\"C\"> C They knew which direction they were sailing in</label></li>\n<li><label><input name=\"q7\" type=\"radio\" value=\"D\"> D They were able to drift for long distances</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> What are we told about Edwin Doran's research?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q8\" type=\"radio\" value=\"A\"> A Data were collected after the canoes had returned to land</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"B\"> B Canoe characteristics were recorded using modern instruments</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"C\"> C Research was conducted in the most densely populated regions</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"D\"> D Navigators were not allowed to see the instruments Doran used</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Which of the following did Steven Horvath discover during his research?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q9\" type=\"radio\" value=\"A\"> A Canoe design was less important than human strength</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"B\"> B New research methods had to be developed for use in canoes</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"C\"> C Navigators became very tired on the longest voyages</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"D\"> D Human energy may have been used to assist sailing canoes</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> What is the writer's opinion of Wall Garrard's research?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q10\" type=\"radio\" value=\"A\"> A He is disappointed it was conducted in the laboratory</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"B\"> B He is impressed by the originality of the techniques used</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"C\"> C He is surprised it was used to help linguists with their research</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"D\"> D He is concerned that the islands studied are long distances apart</label></li>\n</ul>\n</div>\n</div>"},{"groupId":"group-3","kind":"sentence_completion","questionIds":["q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–F</strong>, below.</p>\n<ul class=\"sentence-ending-options\">\n<li>was the variety of experimental techniques used</li>\n<li>was not of interest to young islanders today</li>\n<li>was not conclusive evidence in support of a single theory</li>\n<li>was being able to change their practices when necessary</li>\n<li>was the first time humans intentionally crossed an ocean</li>\n<li>was the speed with which it was conducted</li>\n</ul>\n<div class=\"question-item\"><strong>37</strong> One limitation in the information produced by all of this research is that it <input type=\"text\" id=\"q37_input\" maxlength=\"1\" name=\"q11\"></div>\n<div class=\"question-item\"><strong>38</strong> The best thing about this type of research <input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\"></div>\n<div class=\"question-item\"><strong>39</strong> The most important achievement of traditional navigators <input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\"></div>\n<div class=\"question-item\"><strong>40</strong> The migration of people from Asia to the Pacific <input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"></div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
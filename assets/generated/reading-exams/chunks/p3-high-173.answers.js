@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-173", "answers", {"answerKey":{"q1":"D","q2":"C","q3":"B","q4":"A","q5":"C","q6":"YES","q7":"NOT GIVEN","q8":"NO","q9":"YES","q10":"F","q11":"A","q12":"H","q13":"G","q14":"I"}});
+})(typeof window !== "undefined" ? window : globalThis);
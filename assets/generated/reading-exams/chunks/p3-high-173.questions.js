@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-173", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> In the opinion of the writer, the biographers Balfour and Crouch</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A understated the role played by Stevenson's family</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B misunderstood Stevenson's religious beliefs</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C overestimated other writers' influence on Stevenson</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D elevated Stevenson above his true status as a writer</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> What is the writer's main point about Stevenson in the second paragraph?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A The public judged him more fairly than the critics.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B Recent criticism of him has been justified.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C Critics argued that his style covered up his faults.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D The ethical nature of his stories was often criticized.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> According to the writer, the adventure story</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A is more appropriate for books than films</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B can be used by writers to tell moral stories</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C is more fashionable today than in the past</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D has been used by other writers but not Stevenson</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What point does the writer make about Stevenson and Scotland?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A His ideas contrasted with those of many Scots.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B He demonstrated great sympathy for Scotland's problems.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C He was not considered a true Scot as he was not born there.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D His unflattering stories about Scotland angered many Scots.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> According to the writer, Stevenson's own lifestyle</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q5\" type=\"radio\" value=\"A\"> A was envied by his friends</label></li>\n<li><label><input name=\"q5\" type=\"radio\" value=\"B\"> B was responsible for his early death</label></li>\n<li><label><input name=\"q5\" type=\"radio\" value=\"C\"> C attracted more attention than his books</label></li>\n<li><label><input name=\"q5\" type=\"radio\" value=\"D\"> D did not prepare him for living in Samoa</label></li>\n</ul>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"yes_no_not_given","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 32–35 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>32</strong> Although Oscar Wilde admired Robert Louis Stevenson very much, he believed Stevenson could have written greater works.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Robert Louis Stevenson encouraged Oscar Wilde to start writing in the first place.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Galsworthy respected Hardy's works more than Stevenson's.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> There is a need to study in detail Stevenson's influence on Chesterton.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n<div class=\"summary-completion\">\n<h5>Sir Walter Scott and Robert Louis Stevenson</h5>\n<p>A lot of people believe that Sir Walter Scott and Robert Louis Stevenson are the most influential writers in the history of Scotland, but Sir Walter Scott is more proficient in<input type=\"text\" id=\"q36_input\" maxlength=\"1\" name=\"q10\">, while Stevenson has better<input type=\"text\" id=\"q37_input\" maxlength=\"1\" name=\"q11\">. Scott's books illustrate<input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\">, especially in terms of tragedy, but many readers prefer Stevenson's<input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\">. What's more, Stevenson's understanding of<input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"> gave his works a unique expression of the Scottish people.</p>\n</div>\n<div class=\"word-list\">\n<span><strong>A</strong> natural ability</span> <span><strong>B</strong> romance</span> <span><strong>C</strong> colorful language</span> <span><strong>D</strong> critical acclaim</span> <span><strong>E</strong> humor</span> <span><strong>F</strong> technical control</span> <span><strong>G</strong> storytelling</span> <span><strong>H</strong> depth</span> <span><strong>I</strong> human nature</span>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-174", "answers", {"answerKey":{"q1":"NOT GIVEN","q2":"YES","q3":"NOT GIVEN","q4":"NO","q5":"YES","q6":"A","q7":"C","q8":"D","q9":"B","q10":"A","q11":"B","q12":"E","q13":"G","q14":"A"}});
+})(typeof window !== "undefined" ? window : globalThis);
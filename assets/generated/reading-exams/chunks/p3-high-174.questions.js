@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-174", "questions", {"questionGroups":[{"groupId":"group-1","kind":"yes_no_not_given","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 27–31 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> Young people are easily persuaded by surveys that listening to music is beneficial.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Different studies share the same conclusions about the desirability of working in silence.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Some doctors recommend wearing headphones to lower blood pressure.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Nathaniel Baldwin was a respected government researcher.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> The effect of the invention of headphones is comparable to the effect of the invention of writing.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q6","q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-10-anchor\">\n<h4>Questions 32–36</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>32</strong> What does the writer suggest about a service economy?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q6\" type=\"radio\" value=\"A\"> A The work is mentally demanding</label></li>\n<li><label><input name=\"q6\" type=\"radio\" value=\"B\"> B It provides employment for younger workers</label></li>\n<li><label><input name=\"q6\" type=\"radio\" value=\"C\"> C It is a small part of a country's economy</label></li>\n<li><label><input name=\"q6\" type=\"radio\" value=\"D\"> D Workers have to live in urban centres</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> When the writer mentions the historical evidence for early music, he is</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q7\" type=\"radio\" value=\"A\"> A emphasizing the diversity of musical forms</label></li>\n<li><label><input name=\"q7\" type=\"radio\" value=\"B\"> B expressing his frustration with the limited archaeological evidence uncovered</label></li>\n<li><label><input name=\"q7\" type=\"radio\" value=\"C\"> C lending support to the view that music has been important in human history</label></li>\n<li><label><input name=\"q7\" type=\"radio\" value=\"D\"> D creating a geographical map of the evolution of music</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> What does the writer say about the social effects of listening to music through headphones?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q8\" type=\"radio\" value=\"A\"> A It has caused a reduction in the number of people who listen to music</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"B\"> B It has increased people's participation in music events</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"C\"> C It has reduced the global variation of music styles</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"D\"> D It has changed the traditional role of music in society</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> What does the writer say about personal independence?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q9\" type=\"radio\" value=\"A\"> A Americans are unique in their desire for personal independence</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"B\"> B Personal independence is something that can be purchased</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"C\"> C Striving for personal independence is a recent phenomenon</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"D\"> D Personal independence destroys social connections</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> Why does the writer quote Jonah Lehrer in the last paragraph?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q10\" type=\"radio\" value=\"A\"> A To support the writer's own view</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"B\"> B To draw attention to an authoritative book about music</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"C\"> C To raise awareness of people's loss of listening skills</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"D\"> D To illustrate how music brings people closer to each other</label></li>\n</ul>\n</div>\n</div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n<div class=\"summary-completion\">\n<h5>Headphones and city living</h5>\n<p>Dr Michael Bull believes that listening to music through headphones has changed the <input type=\"text\" id=\"q37_input\" maxlength=\"1\" name=\"q11\"> the wearers of headphones have with public spaces. Living in the centre of cities is becoming popular, as people become less keen on living in the <input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\">. In densely populated city centres, headphones form <input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\"> that isolate people from fellow citizens and from their environment. Wearers of headphones are treated with <input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"> that other people do not receive. This is because if we see someone wearing headphones, we believe they must be occupied in some way and should not be interrupted.</p>\n</div>\n<div class=\"word-list\">\n<span><strong>A</strong> courtesy</span> <span><strong>B</strong> relationship</span> <span><strong>C</strong> difficulty</span> <span><strong>D</strong> countryside</span> <span><strong>E</strong> suburbs</span> <span><strong>F</strong> language</span> <span><strong>G</strong> barriers</span> <span><strong>H</strong> obstacles</span> <span><strong>I</strong> disapproval</span>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
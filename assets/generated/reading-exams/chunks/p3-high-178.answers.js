@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-178", "answers", {"answerKey":{"q1":"NOT GIVEN","q2":"NO","q3":"NOT GIVEN","q4":"YES","q5":"D","q6":"A","q7":"C","q8":"B","q9":"A","q10":"D","q11":"A","q12":"B","q13":"F","q14":"C"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-178", "questions", {"questionGroups":[{"groupId":"group-1","kind":"yes_no_not_given","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 27–30 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> Many parents indicate that their children struggle to learn a musical instrument.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> The findings of the recent research into pre-school children's IQs are unreliable.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> The main reasons people take up an instrument are that they enjoy playing music and being creative.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Evidence about the long-term advantages of learning an instrument is increasing.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q5","q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n<h4>Questions 31–35</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>31</strong> The studies mentioned in the first paragraph</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q5\" type=\"radio\" value=\"A\"> A confirm a link between musical training and intelligence.</label></li>\n<li><label><input name=\"q5\" type=\"radio\" value=\"B\"> B present misleading information about the value of learning an instrument.</label></li>\n<li><label><input name=\"q5\" type=\"radio\" value=\"C\"> C suggest that there are undiscovered benefits to studying music.</label></li>\n<li><label><input name=\"q5\" type=\"radio\" value=\"D\"> D cast doubt on a belief about the effects of taking music lessons.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> According to the second paragraph, there may be many benefits to studying music,</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q6\" type=\"radio\" value=\"A\"> A even for those who begin learning in adulthood.</label></li>\n<li><label><input name=\"q6\" type=\"radio\" value=\"B\"> B providing the person learns the correct techniques.</label></li>\n<li><label><input name=\"q6\" type=\"radio\" value=\"C\"> C especially if the person practises on a regular basis.</label></li>\n<li><label><input name=\"q6\" type=\"radio\" value=\"D\"> D particularly if the person plays a range of different instruments.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> The phrase ‘this might well be the case' in the fourth paragraph suggests that</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q7\" type=\"radio\" value=\"A\"> A music lessons and long-term physical well-being may be connected.</label></li>\n<li><label><input name=\"q7\" type=\"radio\" value=\"B\"> B the ability to learn music may depend on neurological features.</label></li>\n<li><label><input name=\"q7\" type=\"radio\" value=\"C\"> C learning an instrument may have a lasting impact on brain function.</label></li>\n<li><label><input name=\"q7\" type=\"radio\" value=\"D\"> D older people's brains may be better suited to studying music than those of children.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Which aspect of playing an instrument was included in Hanna-Pladdy's follow-up study but not in her first study?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q8\" type=\"radio\" value=\"A\"> A the number of years that the person had played</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"B\"> B at which age the person began having lessons</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"C\"> C the length of time since the person last played</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"D\"> D how the person had practised as a child</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> What do Hanna-Pladdy's studies suggest about people's general education?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q9\" type=\"radio\" value=\"A\"> A Studying music compensates for an otherwise limited level of education.</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"B\"> B Learning to play an instrument improves educational performance.</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"C\"> C Highly educated people are more likely to benefit from music training.</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"D\"> D Level of education makes no difference to a person's musical ability.</label></li>\n</ul>\n</div>\n</div>"},{"groupId":"group-3","kind":"sentence_completion","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–F</strong>, below.</p>\n<p><em>Write the correct letter, <strong>A-F</strong>, in boxes 36-40 on your answer sheet.</em></p>\n<div class=\"question-item\"><strong>36</strong> Brenda Hanna-Pladdy believes the cognitive benefits of music lessons are a result of <input type=\"text\" id=\"q36_input\" maxlength=\"1\" name=\"q10\"></div>\n<div class=\"question-item\"><strong>37</strong> The research undertaken by Gottfried Schlaug focused on <input type=\"text\" id=\"q37_input\" maxlength=\"1\" name=\"q11\"></div>\n<div class=\"question-item\"><strong>38</strong> According to Alison Balbag, playing an instrument is a unique experience because it involves <input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\"></div>\n<div class=\"question-item\"><strong>39</strong> Nina Kraus believes there is a link between better hearing in later life and the experience of <input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\"></div>\n<div class=\"question-item\"><strong>40</strong> Jennifer Bugos's study involved <input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"></div>\n<ul class=\"sentence-ending-options\">\n<li>comparing the brains of people who had never played an instrument with those who played for a living.</li>\n<li>activating many different parts of the brain at the same time.</li>\n<li>teaching a group of older people to play an instrument.</li>\n<li>acquiring the particular set of physical skills needed to play an instrument.</li>\n<li>discovering which group of people becomes the best musicians.</li>\n<li>having played an instrument for a considerable length of time.</li>\n</ul>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-180", "answers", {"answerKey":{"q1":"A","q2":"C","q3":"D","q4":"A","q5":"B","q6":"NO","q7":"YES","q8":"NOT GIVEN","q9":"YES","q10":"B","q11":"G","q12":"A","q13":"D","q14":"C"}});
+})(typeof window !== "undefined" ? window : globalThis);
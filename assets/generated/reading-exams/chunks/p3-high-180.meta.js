@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-180", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-high-180","meta":{"title":"The fluoridation controversy 氟化水争议","category":"P3","frequency":"high","pdfFilename":"88. P3 - The fluoridation controversy 氟化水争议【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/88. P3 - The fluoridation controversy 氟化水争议【高】/","legacyFilename":"88. P3 - The fluoridation controversy 氟化水争议【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/88. P3 - The fluoridation controversy 氟化水争议【高】/88. P3 - The fluoridation controversy 氟化水争议【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/88. P3 - The fluoridation controversy 氟化水争议【高】/88. P3 - The fluoridation controversy 氟化水争议【高】.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.809Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
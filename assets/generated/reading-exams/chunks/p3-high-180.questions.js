@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-180", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<p>Write the correct letter in boxes 27–31 on your answer sheet.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> The optimum amount of fluoride in fluoridated water is calculated partly according to</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A how hot the area is.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B how warm the water is.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C how many dental problems there are in the community.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D how much fluorine the community chooses to have in its water.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> One reason given by the writer for opposing fluoridation is that</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A it may contribute to tooth decay.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B it will be unacceptably expensive for the public.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C obligatory fluoridation takes away personal freedom.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D excessive fluoride could be added to the water by mistake.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> The writer mentions Kuhn in order to</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A provide a contrast with the view of Collins.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B support the rational nature of scientific inquiry.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C demonstrate that Kuhn did not argue his case adequately.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D show that science can be influenced by non-scientific considerations.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What did Sutton's research discover about earlier studies in North America?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A There were failings in the way they were carried out.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B The scientists involved had achieved unique results.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C Proponents of fluoridation had not understood its long-term effects.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D Fluoridation had a greater effect on tooth decay than previously believed.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> In the last paragraph, what does the writer say about scientists?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q5\" type=\"radio\" value=\"A\"> A They should reveal their true motivations.</label></li>\n<li><label><input name=\"q5\" type=\"radio\" value=\"B\"> B They should not decide the fluoridation policy.</label></li>\n<li><label><input name=\"q5\" type=\"radio\" value=\"C\"> C They are solely concerned with scientific truths.</label></li>\n<li><label><input name=\"q5\" type=\"radio\" value=\"D\"> D They cannot reach agreement on the fluoridation issue.</label></li>\n</ul>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"yes_no_not_given","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<p>In boxes 32–35 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>32</strong> Scientific knowledge should be kept separate from social values.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Many sociologists have disregarded the doubts that some scientists have concerning fluoridation.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Sutton's findings have been given insufficient attention by scientists outside of North America.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> There are valid arguments on both sides of the fluoridation debate.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"sentence_completion","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–G</strong>, below.</p>\n<p>Write the correct letter, <strong>A–G</strong>, in boxes 36–40 on your answer sheet.</p>\n<ul class=\"sentence-ending-options\">\n<li>the results of scientific research are not always understood at first.</li>\n<li>science is an unbiased discipline.</li>\n<li>people should be able to choose whether they want fluoride.</li>\n<li>there is insufficient proof to support a cautious approach.</li>\n<li>the serious damage fluoride causes far outweighs any positive effects.</li>\n<li>children are not the only ones who benefit from fluoridation.</li>\n<li>scientific knowledge is affected by the beliefs of everyone concerned.</li>\n</ul>\n<div class=\"question-item\"><strong>36</strong> The traditional view of science is that<input type=\"text\" id=\"q36_input\" maxlength=\"1\" name=\"q10\"></div>\n<div class=\"question-item\"><strong>37</strong> A sociological view of science argues that<input type=\"text\" id=\"q37_input\" maxlength=\"1\" name=\"q11\"></div>\n<div class=\"question-item\"><strong>38</strong> Collins is of the opinion that<input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\"></div>\n<div class=\"question-item\"><strong>39</strong> The writer suggests that a supporter of fluoridation may conclude that<input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\"></div>\n<div class=\"question-item\"><strong>40</strong> The writer suggests that an opponent of fluoridation may conclude that<input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"></div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
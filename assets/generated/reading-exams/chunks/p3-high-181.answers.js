@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-181", "answers", {"answerKey":{"q1":"D","q2":"A","q3":"C","q4":"B","q5":"E","q6":"I","q7":["forest fruit","fruit"],"q8":["fibre"],"q9":["uxi trees","uxi"],"q10":["unpredictable"],"q11":["piquia trees"],"q12":["subsistence use","subsistence"],"q13":["commercial potential"],"q14":["non-timber forest products","ntfps"]}});
+})(typeof window !== "undefined" ? window : globalThis);
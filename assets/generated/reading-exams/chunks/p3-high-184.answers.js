@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-184", "answers", {"answerKey":{"q1":"NO","q2":"NOT GIVEN","q3":"NOT GIVEN","q4":"YES","q5":"NO","q6":"B","q7":"E","q8":"I","q9":"H","q10":"B","q11":"C","q12":"D","q13":"C","q14":"A"}});
+})(typeof window !== "undefined" ? window : globalThis);
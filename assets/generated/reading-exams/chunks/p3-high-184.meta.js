@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-184", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-high-184","meta":{"title":"The New Zealand writer Margaret Mahy 新西兰女作家","category":"P3","frequency":"high","pdfFilename":"91. P3 - The New Zealand writer Margaret Mahy 新西兰女作家【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/91. P3 - The New Zealand writer Margaret Mahy 新西兰女作家【高】/","legacyFilename":"91. P3 - The New Zealand writer Margaret Mahy 新西兰女作家【高】.html","questionIntroHtml":"<h2>Questions</h2>\n<div class=\"question-group\" id=\"q1-31-section\">\n<h4>Questions 27–31</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 27–31 on your answer sheet, write</p>\n<ul style=\"list-style: none; padding-left: 0;\">\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> Mahy explores the traditional themes of New Zealand literature.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Mahy's children's books have been more popular than her teenage books.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Mahy and Knox have sometimes criticised each other's work.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Mahy is welcoming to interviewers.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> Mahy is at ease speaking about her experiences.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q6-35-section\">\n<h4>Questions 32–35</h4>\n<p>Complete the summary below using the list of words and phrases A–I.</p>\n<div class=\"summary-text\">\n<h4>Theories about Mahy's style</h4>\n<p>\nMahy's determination to earn a living from writing has encouraged her to find the ideas for her work in <strong>32</strong> <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> places. The stories themselves are set in locations that are <strong>33</strong> <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span>. In terms of characterisation, almost all of her books feature unruly people, and very often an adolescent who possesses <strong>34</strong> <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> abilities. Finally, the endings of the stories tend to be <strong>35</strong> <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span>.\n</p>\n</div>\n<div id=\"word-options\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"A\">A disruptive and unpredictable</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"B\">B everyday</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"C\">C loveable</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"D\">D controversial</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"E\">E exotic and ordinary</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"F\">F isolated</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"G\">G unconfident</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"H\">H unsurprising but satisfying</div>\n<div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-word=\"I\">I magical</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q10-40-section\">\n<h4>Questions 36–40</h4>\n<p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>36</strong> What does the writer say about <i>The Magician of Hoad</i>?</p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q10\" type=\"radio\" value=\"A\"> A It is partly based on true history.</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"B\"> B It was restructured in the writing process.</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"C\"> C It is quite different from conventional stories.</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"D\"> D It does not reflect the usual themes of Mahy's work.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> According to the writer, <i>Bubble Trouble</i></p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q11\" type=\"radio\" value=\"A\"> A was first illustrated in 1991.</label></li>\n<li><label><input name=\"q11\" type=\"radio\" value=\"B\"> B is written in plain language.</label></li>\n<li><label><input name=\"q11\" type=\"radio\" value=\"C\"> C is an old favourite for many families.</label></li>\n<li><label><input name=\"q11\" type=\"radio\" value=\"D\"> D has not been read aloud by Mahy before.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> The writer's purpose in the fifth paragraph is to</p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q12\" type=\"radio\" value=\"A\"> A show how Mahy's style has changed through generations.</label></li>\n<li><label><input name=\"q12\" type=\"radio\" value=\"B\"> B criticise Mahy's children's stories for being repetitive.</label></li>\n<li><label><input name=\"q12\" type=\"radio\" value=\"C\"> C describe how new media have changed entertainment.</label></li>\n<li><label><input name=\"q12\" type=\"radio\" value=\"D\"> D illustrate Mahy's popularity with generations of children.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> According to the sixth paragraph, which of the following is true?</p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q13\" type=\"radio\" value=\"A\"> A Readers sometimes do not finish Mahy's books.</label></li>\n<li><label><input name=\"q13\" type=\"radio\" value=\"B\"> B Mahy actively encourages feedback from readers.</label></li>\n<li><label><input name=\"q13\" type=\"radio\" value=\"C\"> C Readers are necessary in order to complete a book.</label></li>\n<li><label><input name=\"q13\" type=\"radio\" value=\"D\"> D Mahy does not realise how important she is to some readers.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> What is the writer doing in the final paragraph?</p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q14\" type=\"radio\" value=\"A\"> A illustrating Mahy's view of the world</label></li>\n<li><label><input name=\"q14\" type=\"radio\" value=\"B\"> B comparing Mahy with another writer</label></li>\n<li><label><input name=\"q14\" type=\"radio\" value=\"C\"> C correcting a misconception about Mahy</label></li>\n<li><label><input name=\"q14\" type=\"radio\" value=\"D\"> D suggesting reasons for Mahy's approach</label></li>\n</ul>\n</div>\n</div>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/91. P3 - The New Zealand writer Margaret Mahy 新西兰女作家【高】/91. P3 - The New Zealand writer Margaret Mahy 新西兰女作家【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/91. P3 - The New Zealand writer Margaret Mahy 新西兰女作家【高】/91. P3 - The New Zealand writer Margaret Mahy 新西兰女作家【高】.pdf","ieltsHtml":"IELTS/P3/The New Zealand writer Margaret Mahy.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.815Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
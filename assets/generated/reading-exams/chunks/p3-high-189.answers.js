@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-189", "answers", {"answerKey":{"q1":"C","q2":"B","q3":"B","q4":"D","q5":"D","q6":"YES","q7":"YES","q8":"NOT GIVEN","q9":"NO","q10":"creative thought","q11":"trout","q12":"native fish","q13":"restoration","q14":"extinction"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-189", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-high-189","meta":{"title":"The tuatara – past and future 新西兰蜥蜴","category":"P3","frequency":"high","pdfFilename":"96. P3 - The tuatara – past and future 新西兰蜥蜴【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/96. P3 - The tuatara – past and future 新西兰蜥蜴【高】/","legacyFilename":"96. P3 - The tuatara – past and future 新西兰蜥蜴【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/96. P3 - The tuatara – past and future 新西兰蜥蜴【高】/96. P3 - The tuatara – past and future 新西兰蜥蜴【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/96. P3 - The tuatara – past and future 新西兰蜥蜴【高】/96. P3 - The tuatara – past and future 新西兰蜥蜴【高】.pdf","ieltsHtml":"IELTS/P3/The tuatara – past and future.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.823Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-189", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter, A, B, C or D.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> What are we told about the Europeans who arrived in 1769?</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A They thought there was only one large island.</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B They had not come to study natural history.</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C They had no interest in the tuatara.</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D They sent a tuatara to the British Museum.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> What does the writer say about Albert Gunther in the third paragraph?</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A He believed the tuatara could fetch a high price.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B He was typical of his generation of scientists.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C He disagreed with Charles Darwin's theory.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D He wanted to stop the tuatara becoming extinct.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> What did Albert Gunther think about the rats in New Zealand?</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A They did not eat the tuatara.</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B There was one species of rat.</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C There had always been rats in New Zealand.</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D They were killed by Polynesians.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What did lan Crook conclude from his research?</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A Tuatara are safe on small islands.</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B Ship's rats kill more tuatara than kiore.</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C Kiore cannot swim to offshore islands.</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D Rats and tuatara cannot live together.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> What were the findings of Richard Holdaway's research?</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"> A Maori settled more recently than previously thought.</label> <label><input name=\"q5\" type=\"radio\" value=\"B\"> B The first Polynesian explorers formed permanent settlements.</label> <label><input name=\"q5\" type=\"radio\" value=\"C\"> C Ship's rats are the oldest rat species in the country.</label> <label><input name=\"q5\" type=\"radio\" value=\"D\"> D Rats caused extinctions before any humans settled.</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"yes_no_not_given","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Do the following statements agree with the claims of the writer?</p>\n<p>In boxes 32–35 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>32</strong> The available research supports Holdaway's theory but it has not been proved.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Nowadays, it is possible to totally destroy a population of rats on a small island.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Crook was the first person to recognise the potential of offshore islands as sanctuaries.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Tuatara numbers are continuing to fall.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete the summary using the list of words, A–H, below.</p>\n<p><em>Drag and drop the correct letter into the summary blanks.</em></p>\n<div class=\"summary-text\">\n<h5>What conclusions can we draw?</h5>\n<p>\nThe most important result of the tuatara research is that it frees our <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span>. For example, there are many similarities between rats and <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span>. Should we now go further and consider reintroducing <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> to our mainland rivers? Perhaps our children will come to believe in the <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span> of species, in the same way that our generation refuses to accept <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span>.\n</p>\n</div>\n<div id=\"word-options\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"natural evolution\">A natural evolution</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"creative thought\">B creative thought</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"indigenous plants\">C indigenous plants</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"trout\">D trout</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"pollution\">E pollution</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"restoration\">F restoration</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"native fish\">G native fish</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"extinction\">H extinction</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
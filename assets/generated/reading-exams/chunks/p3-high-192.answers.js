@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-192", "answers", {"answerKey":{"q1":"TRUE","q2":"NOT GIVEN","q3":"TRUE","q4":"FALSE","q5":"D","q6":"A","q7":"E","q8":"C","q9":"microscope","q10":"concepts","q11":"computer","q12":"spectral analysis","q13":"table","q14":"C"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-192", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-high-192","meta":{"title":"Voynich Manuscript 伏尼契手稿","category":"P3","frequency":"high","pdfFilename":"99. P3 - Voynich Manuscript 伏尼契手稿【高】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/99. P3 - Voynich Manuscript 伏尼契手稿【高】/","legacyFilename":"99. P3 - Voynich Manuscript 伏尼契手稿【高】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/99. P3 - Voynich Manuscript 伏尼契手稿【高】/99. P3 - Voynich Manuscript 伏尼契手稿【高】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/99. P3 - Voynich Manuscript 伏尼契手稿【高】/99. P3 - Voynich Manuscript 伏尼契手稿【高】.pdf","ieltsHtml":"IELTS/P3/Voynich Manuscript.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.411Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-192", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n                <h4>Questions 27–30</h4>\n                <p>Do the following statements agree with the information given in Reading Passage 3?</p>\n                <p>In boxes 27-30 on your answer sheet, write</p>\n                <p><strong>TRUE</strong> if the statement agrees with the information<br>\n                <strong>FALSE</strong> if the statement contradicts the information<br>\n                <strong>NOT GIVEN</strong> if there is no information on this</p>\n\n                <div class=\"question-item\">\n                    <p><strong>27</strong> It is uncertain when the Voynich manuscript was written.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> Wilfrid Voynich donated the manuscript to the Beinecke Library.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> Interest in the Voynich manuscript extends beyond that of academics and professional code-breakers.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>30</strong> The text of the Voynich manuscript contains just under 70 symbols.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-anchor\">\n                <h4>Questions 31–34</h4>\n                <p>Look at the following statements (Questions 31-34) and the list of people below.</p>\n                <p>Match each statement with the correct person, <strong>A–H</strong>.</p>\n                \n                <div class=\"match-question-item\">\n                    <p><strong>31</strong> The number of times that some words occur makes it unlikely that the manuscript is based on an authentic language.</p>\n                    <div class=\"match-dropzone\" data-question=\"q5\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>32</strong> Unlike some other similar objects of fascination, people can gain direct access to the Voynich manuscript.</p>\n                    <div class=\"match-dropzone\" data-question=\"q6\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                     <p><strong>33</strong> The person who wrote the manuscript may not have been entirely sane.</p>\n                    <div class=\"match-dropzone\" data-question=\"q7\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                    <p><strong>34</strong> It is likely that the author of the manuscript is the same person as suggested by Wilfrid Voynich.</p>\n                    <div class=\"match-dropzone\" data-question=\"q8\"></div>\n                </div>\n\n                <div class=\"options-pool\" id=\"people-options-pool\">\n                    <strong>List of People</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Gordon Rugg</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Roger Bacon</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C William Newbold</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D William Friedman</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Rob Churchill</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F Gabriel Landini</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G René Zandbergen</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"H\">H Girolamo Cardano</div>\n                    </div>\n                </div>\n            </div>","allowOptionReuse":false},{"groupId":"group-3","kind":"summary_completion","questionIds":["q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n                 <h4>Questions 35–39</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n                <div class=\"summary-completion\">\n                    <h4>Voynich Researchers</h4>\n                    <p>\n                    William Newbold believed that the author of the Voynich manuscript had been able to look at cells through a <strong>35</strong> <input name=\"q9\" type=\"text\" id=\"q35_input\">. Other researchers later demonstrated that there were flaws in his argument.\n                    </p>\n                    <p>\n                    William Friedman concluded that the manuscript was written in an artificial language that was based on <strong>36</strong> <input name=\"q10\" type=\"text\" id=\"q36_input\">. He couldn't find out the meaning of this language but he believed that the <strong>37</strong> <input name=\"q11\" type=\"text\" id=\"q37_input\"> would continue to bring advances in code-breaking.\n                    </p>\n                    <p>\n                    Dr Gabriel Landini used a system known as <strong>38</strong> <input name=\"q12\" type=\"text\" id=\"q38_input\"> in his research, and claims to have demonstrated the presence of genuine words.\n                    </p>\n                    <p>\n                    Dr Gordon Rugg's system involved a grille, that made it possible to quickly select symbols that appeared in a <strong>39</strong> <input name=\"q13\" type=\"text\" id=\"q39_input\">. Rugg's conclusion was that the manuscript lacked genuine meaning.\n                    </p>\n                </div>\n            </div>"},{"groupId":"group-4","kind":"single_choice","questionIds":["q14"],"bodyHtml":"<div class=\"group\" id=\"q14-anchor\">\n                 <h4>Question 40</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                \n                <div class=\"question-item\">\n                    <p><strong>40</strong> The writer's main aim in this passage is to</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q14\" type=\"radio\" value=\"A\"> A explain the meaning of the manuscript.</label><br>\n                        <label><input name=\"q14\" type=\"radio\" value=\"B\"> B determine the true identity of the manuscript's author.</label><br>\n                        <label><input name=\"q14\" type=\"radio\" value=\"C\"> C describe the numerous attempts to decode the manuscript.</label><br>\n                        <label><input name=\"q14\" type=\"radio\" value=\"D\"> D identify which research into the manuscript has had the most media coverage.</label>\n                    </div>\n                </div>\n            </div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-204", "answers", {"answerKey":{"q1":"d","q2":"b","q3":"a","q4":"c","q5":"b","q6":"no","q7":"not given","q8":"yes","q9":"not given","q10":"e","q11":"c","q12":"d","q13":"g","q14":"b"}});
+})(typeof window !== "undefined" ? window : globalThis);
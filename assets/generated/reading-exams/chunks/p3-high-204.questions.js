@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-204", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q1-anchor\"></a><strong>27</strong> What does the writer tell us about people with tone deafness (amusia) in the first paragraph?</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q1\" value=\"a\"> A. They usually have hearing problems</label> <label><input type=\"radio\" name=\"q1\" value=\"b\"> B. Some can play a musical instrument very well</label> <label><input type=\"radio\" name=\"q1\" value=\"c\"> C. Some may be able to sing well-known melodies</label> <label><input type=\"radio\" name=\"q1\" value=\"d\"> D. They have several inabilities in regard to music</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q2-anchor\"></a><strong>28</strong> What is the writer doing in the second paragraph?</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q2\" value=\"a\"> A. outlining some of the factors that cause amusia</label> <label><input type=\"radio\" name=\"q2\" value=\"b\"> B. summarising some findings about people with amusia</label> <label><input type=\"radio\" name=\"q2\" value=\"c\"> C. suggesting that people with amusia are disadvantaged</label> <label><input type=\"radio\" name=\"q2\" value=\"d\"> D. comparing the singing ability of amusics with their sense</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q3-anchor\"></a><strong>29</strong> What does the writer say about the relationship between language ability and musical ability?</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q3\" value=\"a\"> A. People who are unable to speak can sometimes sing</label> <label><input type=\"radio\" name=\"q3\" value=\"b\"> B. People with amusia usually have language problems too</label> <label><input type=\"radio\" name=\"q3\" value=\"c\"> C. Speakers of tonal languages like Chinese rarely have amusia</label> <label><input type=\"radio\" name=\"q3\" value=\"d\"> D. People with amusia have difficulty recognizing people by their voices</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q4-anchor\"></a><strong>30</strong> In the third paragraph, the writer notes that most amusics are able to</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q4\" value=\"a\"> A. learn how to sing in tune</label> <label><input type=\"radio\" name=\"q4\" value=\"b\"> B. identify a song by its tune</label> <label><input type=\"radio\" name=\"q4\" value=\"c\"> C. distinguish a sad tone from a happy tune</label> <label><input type=\"radio\" name=\"q4\" value=\"d\"> D. recognise when a singer is not singing in tune</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q5-anchor\"></a><strong>31</strong> What is the writer doing in the fourth paragraph?</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q5\" value=\"a\"> A. claiming that amusics have problems in the auditory cortex</label> <label><input type=\"radio\" name=\"q5\" value=\"b\"> B. outlining progress in understanding the brains of amusics</label> <label><input type=\"radio\" name=\"q5\" value=\"c\"> C. proving that amusia is located in the temporal lobes</label> <label><input type=\"radio\" name=\"q5\" value=\"d\"> D. explaining why studies of hearing are difficult</label>\n</div>\n</div>\n</div>"},{"groupId":"group-2","kind":"yes_no_not_given","questionIds":["q6","q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 32–36</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<p><em>In boxes 32–36 on your answer sheet, write</em></p>\n<ul style=\"list-style:none; padding-left:0; font-weight:bold; font-size:0.9em;\">\n<li>YES <span style=\"font-weight:normal; margin-left:45px;\">if the statement agrees with the views of the writer</span></li>\n<li>NO <span style=\"font-weight:normal; margin-left:52px;\">if the statement contradicts the views of the writer</span></li>\n<li>NOT GIVEN <span style=\"font-weight:normal; margin-left:8px;\">if it is impossible to say what the writer thinks about this</span></li>\n</ul>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q6-anchor\"></a><b>32</b> Peretz’s research suggesting that amusia is a disorder is convincing.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q6\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q6\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q6\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q7-anchor\"></a><b>33</b> People with musical ability are happier than those without this ability.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q7\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q7\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q7\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q8-anchor\"></a><b>34</b> It is inappropriate to consider amusia as a real disorder.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q8\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q8\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q8\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q9-anchor\"></a><b>35</b> People with amusia often have bad handwriting.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q9\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q9\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q9\" value=\"not given\"> NG</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"short_answer","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 36–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–H</strong>, below.</p>\n<p><em>Drag the correct ending block to the box below each sentence start.</em></p>\n<div class=\"cardpool pool-vertical\" id=\"pool-endings\">\n<div class=\"card\" draggable=\"true\" id=\"c-a\" data-value=\"A\"><strong>A</strong> an inability to hear when spoken language rises and falls.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-b\" data-value=\"B\"><strong>B</strong> considered to be desirable.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-c\" data-value=\"C\"><strong>C</strong> an inability to follow the beat of music.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-d\" data-value=\"D\"><strong>D</strong> not a problem.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-e\" data-value=\"E\"><strong>E</strong> not yet well understood.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-f\" data-value=\"F\"><strong>F</strong> a result of injury to the mother.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-g\" data-value=\"G\"><strong>G</strong> more marked than with other people.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-h\" data-value=\"H\"><strong>H</strong> associated with intelligence.</div>\n</div>\n<hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n<div>\n<p><a id=\"q10-anchor\"></a><strong>36</strong> The reason why some people are born with amusia is</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q10\" data-question=\"q10\"></span>\n</div>\n<div>\n<p><a id=\"q11-anchor\"></a><strong>37</strong> One of the difficulties amusics experience is</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q11\" data-question=\"q11\"></span>\n</div>\n<div>\n<p><a id=\"q12-anchor\"></a><strong>38</strong> For amusics, discrimination of meaning in speech is</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q12\" data-question=\"q12\"></span>\n</div>\n<div>\n<p><a id=\"q13-anchor\"></a><strong>39</strong> Certain reactions in the brain of an amusic are</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q13\" data-question=\"q13\"></span>\n</div>\n<div>\n<p><a id=\"q14-anchor\"></a><strong>40</strong> In most cultures, musical ability is</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q14\" data-question=\"q14\"></span>\n</div>\n</div>"}],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"},"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"]});
+})(typeof window !== "undefined" ? window : globalThis);
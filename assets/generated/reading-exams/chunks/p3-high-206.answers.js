@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-206", "answers", {"answerKey":{"q1":"no","q2":"not given","q3":"yes","q4":"yes","q5":"no","q6":"c","q7":"b","q8":"a","q9":"c","q10":"a","q11":"f","q12":"e","q13":"a","q14":"c"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-206", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-high-206","meta":{"title":"200 Years of Australian Landscapes at the Royal Academy in London 澳洲风景展【高】","category":"P3","frequency":"high"}});
+})(typeof window !== "undefined" ? window : globalThis);
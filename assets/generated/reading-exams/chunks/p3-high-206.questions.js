@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-206", "questions", {"questionGroups":[{"groupId":"group-1","kind":"yes_no_not_given","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 27–31</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<p><em>In boxes 27–31 on your answer sheet, write</em></p>\n<ul style=\"list-style:none; padding-left:0; font-weight:bold; font-size:0.9em;\">\n<li>YES <span style=\"font-weight:normal; margin-left:45px;\">if the statement agrees with the views of the writer</span></li>\n<li>NO <span style=\"font-weight:normal; margin-left:52px;\">if the statement contradicts the views of the writer</span></li>\n<li>NOT GIVEN <span style=\"font-weight:normal; margin-left:8px;\">if it is impossible to say what the writer thinks about this</span></li>\n</ul>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q1-anchor\"></a><b>27</b> As expected, the artworks chosen for the exhibition reflect a narrow interpretation of landscape.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q1\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q1\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q1\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q2-anchor\"></a><b>28</b> The Academy rejected Australian suggestions for the subject of the exhibition.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q2\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q2\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q2\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q3-anchor\"></a><b>29</b> The colonial relationship meant that early Australian landscape painting followed the traditions of English landscape painting.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q3\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q3\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q3\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q4-anchor\"></a><b>30</b> The exhibition reflects the fact that Australian art developed its own particular qualities.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q4\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q4\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q4\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q5-anchor\"></a><b>31</b> Contemporary Australian artists have generally rejected British landscape traditions.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q5\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q5\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q5\" value=\"not given\"> NG</label>\n</div>\n</div>\n</div>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q6","q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 32–36</h4>\n<p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q6-anchor\"></a><strong>32</strong> What is the writer's main point in the second paragraph?</p>\n<div class=\"mcq-group\" style=\"display:flex; flex-direction:column; gap:8px;\">\n<label><input type=\"radio\" name=\"q6\" value=\"a\"> A. Australian landscape painting derives from the British tradition.</label> <label><input type=\"radio\" name=\"q6\" value=\"b\"> B. Australian landscape painting is more highly regarded than British.</label> <label><input type=\"radio\" name=\"q6\" value=\"c\"> C. Britain is still imposing its principles on Australian art.</label> <label><input type=\"radio\" name=\"q6\" value=\"d\"> D. British art cannot be compared to Australian art.</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q7-anchor\"></a><strong>33</strong> What does Joanna Mendelssohn find surprising?</p>\n<div class=\"mcq-group\" style=\"display:flex; flex-direction:column; gap:8px;\">\n<label><input type=\"radio\" name=\"q7\" value=\"a\"> A. Modern Australian landscape painting has great variety.</label> <label><input type=\"radio\" name=\"q7\" value=\"b\"> B. The guidelines for the choice of work were very traditional.</label> <label><input type=\"radio\" name=\"q7\" value=\"c\"> C. Landscape painting remains a popular subject for British artists.</label> <label><input type=\"radio\" name=\"q7\" value=\"d\"> D. The British find the Australian landscape unsuitable as a subject.</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q8-anchor\"></a><strong>34</strong> Shaun Gladwell's work is included in the exhibition because</p>\n<div class=\"mcq-group\" style=\"display:flex; flex-direction:column; gap:8px;\">\n<label><input type=\"radio\" name=\"q8\" value=\"a\"> A. it adopts a subjective approach to depicting the landscape.</label> <label><input type=\"radio\" name=\"q8\" value=\"b\"> B. skateboarding is an inspiration to many Australian artists.</label> <label><input type=\"radio\" name=\"q8\" value=\"c\"> C. storms are a significant feature in the Australian landscape.</label> <label><input type=\"radio\" name=\"q8\" value=\"d\"> D. Bondi is an iconic Australian location.</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q9-anchor\"></a><strong>35</strong> What was the reason for Soriano including Aboriginal art in the exhibition</p>\n<div class=\"mcq-group\" style=\"display:flex; flex-direction:column; gap:8px;\">\n<label><input type=\"radio\" name=\"q9\" value=\"a\"> A. It is not well known in London art circles.</label> <label><input type=\"radio\" name=\"q9\" value=\"b\"> B. Aboriginal landscape painting influenced Australian settlers.</label> <label><input type=\"radio\" name=\"q9\" value=\"c\"> C. It is part of the Australian art tradition and not independent of it.</label> <label><input type=\"radio\" name=\"q9\" value=\"d\"> D. Modern Aboriginal painting deals with changes to the landscape.</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q10-anchor\"></a><strong>36</strong> By referring to China, Mendelssohn is making the point that</p>\n<div class=\"mcq-group\" style=\"display:flex; flex-direction:column; gap:8px;\">\n<label><input type=\"radio\" name=\"q10\" value=\"a\"> A. having an exhibition in London is not as important as it used to be.</label> <label><input type=\"radio\" name=\"q10\" value=\"b\"> B. young artists in Britain are not interested in Australian art.</label> <label><input type=\"radio\" name=\"q10\" value=\"c\"> C. art from Shanghai is more important than Australian art.</label> <label><input type=\"radio\" name=\"q10\" value=\"d\"> D. New York is still a preferred destination for young artists.</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"short_answer","questionIds":["q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 37–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–F</strong>, below.</p>\n<p><em>Drag the correct ending block to the box below each sentence start.</em></p>\n<div class=\"options-pool\" id=\"pool-endings\">\n<strong>List of Endings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" id=\"c-a\" data-option=\"A\"><strong>A</strong> reflects the mood created by the natural environment.</div>\n<div class=\"drag-item\" draggable=\"true\" id=\"c-b\" data-option=\"B\"><strong>B</strong> demonstrates that the dominant art form in Australia is landscape painting.</div>\n<div class=\"drag-item\" draggable=\"true\" id=\"c-c\" data-option=\"C\"><strong>C</strong> demonstrates an understanding of the historical importance of the land.</div>\n<div class=\"drag-item\" draggable=\"true\" id=\"c-d\" data-option=\"D\"><strong>D</strong> showcases a very small number of artists.</div>\n<div class=\"drag-item\" draggable=\"true\" id=\"c-e\" data-option=\"E\"><strong>E</strong> demonstrates a strong European flavour.</div>\n<div class=\"drag-item\" draggable=\"true\" id=\"c-f\" data-option=\"F\"><strong>F</strong> shows an acceptance of the unique qualities of Australian art.</div>\n</div>\n</div>\n<hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n<div>\n<p><a id=\"q11-anchor\"></a><strong>37</strong> In spite of its conservatism, the Royal Academy exhibition</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div>\n<p><a id=\"q12-anchor\"></a><strong>38</strong> Australian art of the early to mid-1800s</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div>\n<p><a id=\"q13-anchor\"></a><strong>39</strong> The modern work by Gladwell chosen for the exhibition</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div>\n<p><a id=\"q14-anchor\"></a><strong>40</strong> Including Aboriginal art in the exhibition</p>\n<div class=\"match-dropzone\" data-question=\"q14\"></div>\n</div>\n</div>"}],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"},"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"]});
+})(typeof window !== "undefined" ? window : globalThis);
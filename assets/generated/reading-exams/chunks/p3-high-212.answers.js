@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-212", "answers", {"answerKey":{"q1":"a","q2":"c","q3":"b","q4":"no","q5":"no","q6":"not given","q7":"yes","q8":"not given","q9":"f","q10":"c","q11":"h","q12":"a","q13":"e","q14":"c"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-212", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-high-212","meta":{"title":"Children’s literature studies today 儿童文学【高】","category":"P3","frequency":"high"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-212", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"text","bodyHtml":"<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Children's literature studies today</h3>\n<p>Who studies children's literature and what is it that they study? The answers to this question are complex and messy, because of the many confounding factors which exist in this field.</p>\n<p>Firstly, unlike literature for adults, children's literature is not generally written by its own readers. Adults write for children, and thus adult perceptions of what children are and of what they could and should become are woven into the literature.</p>\n<p>Furthermore, some of those who study children's literature (and those who write certain kinds of children's books) are less interested in literary values than in the kinds of lessons it can teach- either in terms of creating better children or in terms of serving a particular curriculum. The issue of how a teacher can use a children's book is often contentious, but even outside the classroom, much material for children is still didactic.</p>\n<p>Thirdly, while almost all literature is currently promoted within a strong commercial matrix, children's literature is often especially targeted for marketing initiatives. This fact means that readers are often recruited with a message that is negligibly literary and significantly oriented to ideas of consumption. Daniel Hade (2002) has raised useful questions about whether children's experience of reading is altered when their books are part of a larger marketing framework involving the movie, the game, and the toy of a popular children's book. How children perceive and respond to their stories in this new context is an important question.</p>\n<p>It is also important to note that texts in an ever-increasing range of new media compete with print media for the attention of the child reader, and create definitional issues for scholars. Does the term literature' exclusively imply a verbal text? If not, where are the limits? Could a literary computer game ever be considered a work of literature? If not, what kind of attention should be paid to it, since children themselves undoubtedly perceive their print literature as part of a broader continuum? The internet provides one forum through which children now communicate with each other. (In 2003, the internet search engine Google listed 7,920,000 sites relating to the Harry Potter novels; even allowing for duplication and dead ends, that is a number with revolutionary implications.)</p>\n<p>Finally, in the context of the higher education institutions where the formal study of children's literature is often located, at least three disciplinary frameworks (English, education, and librarianship) fragment the focus of scholarly study of children's literature.</p>\n<p>How is the value of the imaginative encounter with the work of literature sustained and honored among such a welter of conflicting interests? One route through this maze is to ask the child readers for help. As David Lewis (2001) has perceptively noted, what children think of reading is not usually the same as what adults think, whether teachers or parents. As Lewis points out, children 'sometimes see more and they often see differently'. If those who study reading can explore children's perceptions as well as those of adults, their understanding of the nature of reading will be enhanced.</p>\n<p>Lewis makes a further valid point when he adds that exploring children's perceptions is usually justified for educational reasons: \"It is true that a better understanding of how children read and how they learn to read, is a prerequisite to improved approaches to teaching. However, it can also be argued, as Lewis rightly does, that when children's responses to literature are accessed and interpreted, they frequently lead to an understanding of how picture books appeal to children.</p>\n<p>Young people's accounts of what and how they read also enable a more sophisticated description of many of the complex processes involved in reading. All descriptions of reading runs the risk of solipsism: i.e. this is how I read so this is what reading is for everyone. Asking other readers how they read, however, reduces that risk. For example, if I am a strong visualizer as I read, I may consider that visualization is a key component of successful reading and I may judge books by their capacity to evoke a vivid visual response. Other readers, however, may help me to realize that not everyone reads with mental pictures. Some readers respond to the patterns of the words, 'hearing' them inaudibly like a subliminal radio program. Others respond to the patterns of feelings in the story, responding with an emotional connection. Talking to competent readers, of all ages, provides a better understanding of reading experiences.</p>\n<p>Children's insights are even more important when it comes to understanding the significance of print literature as one aspect of literary culture. Too often adults assume that reading any book at all is a more worthwhile experience than playing a digital game of any kind. A humbler approach would include asking why the game appeals to the player. Many adults will probably never develop the automatic skills to process a game as readily as they can read a book. This does not indicate that a book is better, but that a particular set of skills is absent. Non-players must acknowledge that some fictional universes are thus closed to them, and a logical response would be to find someone who can guide them to the pleasures and challenges of the gaming world. Games need to be judged individually just as books do, and any evaluative framework needs to take this into account.</p>\n<p>&nbsp;</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-218", "answers", {"answerKey":{"q1":"sound laws","q2":"fashion","q3":"children","q4":"principle of ease","q5":"FALSE","q6":"NOT GIVEN","q7":"TRUE","q8":"NOT GIVEN","q9":"TRUE","q10":"NOT GIVEN","q11":"TRUE","q12":"A","q13":"B","q14":"C"}});
+})(typeof window !== "undefined" ? window : globalThis);
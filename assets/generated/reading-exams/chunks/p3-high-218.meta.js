@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-218", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-high-218","meta":{"title":"The Causes of Linguistic Change 语音的演变【高】","category":"P3","frequency":"high","sourceDoc":"P3 - The Causes of Linguistic Change(1).docx","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":null,"shuiPdf":null,"ieltsHtml":null},"audit":{"matchStatus":"imported_docx_visual_answer_verified","matchConfidence":0.98,"verifiedAt":"2026-05-24T00:00:00.000+08:00","notes":"Built from imported Word DOCX source; passage and question text extracted from Word XML; answer key and explanations extracted from embedded answer images by visual inspection."}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-218", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>The Causes of Linguistic Change</h3>\n<p>All living languages undergo changes of various kinds, for which there are various reasons. The changes that have caused most dispute are those in pronunciation. We have various sources of evidence for the pronunciations of earlier times, like the evidence of spellings, the treatment of words borrowed from other languages or borrowed by them, the descriptions of contemporary grammarians, and the modern pronunciations in all the languages and dialects concerned. These, combined with a knowledge of the mechanism of speech production, can often give us a very good idea of the pronunciation of an earlier age, though absolute certainty is never possible. When we study the pronunciation of a language over any period of a few generations or more, we find that it is subject to change. Moreover, there are always large-scale regularities in the changes: for example, over a period of time, all the long a sounds in a language may change into long o sounds, or all the b sounds in a certain position (for example, at the end of a word) may change into p sounds. Such regular changes are often called sound laws. There are no universal sound laws, but simply particular sound laws for one given language at one given period.</p>\n<p>One cause of change is the influence of one language on another. We learn our mother tongue very thoroughly, and acquire a whole set of speech habits which become second nature to us. When later we learn a foreign language, we inevitably carry over some of these speech habits into it, and so do not speak it exactly like a native. Consequently, in bilingual situations the second language tends to be modified. Such modifications may not persist, of course: an isolated Polish or German immigrant to Britain will usually have grandchildren who speak English like natives because the influence of the general speech environment (playmates, school, work) is stronger than that of the home. But if a large and closely knit group of people adopt a new language, then the modifications they make in it may persist among their descendants, even if the latter no longer speak the original language that caused the changes. This can be seen in Wales, where the influence of Welsh has affected the pronunciation of English, and the very characteristic melody of Welsh English has been carried over from Welsh.</p>\n<p>It is also possible that fashion plays a part in the process of change. It certainly plays a part in the spread of change: one person imitates another, and people with the most prestige are most likely to be imitated, so that a change that takes place in one social group may be imitated (more or less accurately) by speakers in another group. When a social group goes up or down in the world, its pronunciation will gain or lose prestige. Some of the changes in accepted English pronunciation in the seventeenth and eighteenth centuries have been shown to consist of the replacement of one style of pronunciation by another style already existing, and it is likely that such substitutions were a result of the great social changes of the period: the increased power and wealth of the middle classes, and their steady infiltration upwards into the ranks of the landed gentry probably carried elements of middle class dialect into upper class speech. However, besides spreading changes that have already taken place, fashion may actually cause changes in pronunciation. In a stratified society, the important thing about a fashion is that it is exclusive: as soon as the fashion has penetrated to a lower social group, it’s time to move on.</p>\n<p>This can be seen in clothes: fashionable people may find it flattering to be imitated, but as soon as the new fashion has really caught on they must change to something else, to mark themselves off as different. It may be the same with language, for social groups use characteristic styles of language to mark themselves off from other groups. A group that has high prestige may find that its style of speech is being imitated by other groups, and then its members may (perhaps subconsciously) begin to change it, perhaps by exaggerating its distinguishing characteristics.</p>\n<p>However, while interaction between different languages, and between the dialects of a single language, can explain some changes in pronunciation, it cannot explain them all.</p>\n<p>Another cause that has been suggested is the fact that the imitation of children is imperfect: they copy their parents’ speech, but never reproduce it exactly. This seems to be true enough and it moreover seems to be true that even adults show a certain amount of random variation in their pronunciation. However, these facts cannot explain changes in pronunciation, unless it can be shown that there is some systematic trend in the failures in imitation. If they are merely random deviations they will cancel one another out and there will be no net change in the language. For some of these random variations to be selected at the expense of others, there must be further forces at work.</p>\n<p>One such force, which is often suggested, is known as the principle of ease. We are all naturally lazy, it is argued, and so we tend to take short cuts in the movements of our speech organs, to replace movements calling for great accuracy or energy by less demanding ones, to omit sounds if they are not essential for understanding, and so on. For example, the word scant was once skamt, but the m has been changed to n under the influence of the following t. An economy of effort has thereby been achieved, because n and t are articulated in the same place (with the tip of the tongue against the teeth-ridge), whereas m is articulated elsewhere (with the two lips). The change from skamt to scant would be an example of assimilation, which is a very common kind of change. Assimilation is the changing of a sound under the influence of a neighbouring sound.</p>\n<p>Assimilation is not the only way in which we change our pronunciation in order to reduce effort. A sound may come to be pronounced less energetically, wherever it occurs: the English r and h sounds are undoubtedly pronounced much less vigorously now than they were a thousand years ago. In some positions a sound may disappear altogether. At one time the t was pronounced in words like castle and Christmas, and the g in words like gnat and gnaw. Sometimes a whole syllable is dropped out if it occurs twice running. A modern example is temporary, which in Britain is pronounced as if it were tempory.</p>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-218", "questions", {"questionGroups":[{"groupId":"group-1","kind":"summary_completion","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-q2-q3-q4-anchor\"><h4>Questions 27-30</h4><p>Complete the summary below.</p><p>Choose NO MORE THAN THREE WORDS from the passage for each answer.</p><p>Write your answers in boxes 27-30 on your answer sheet.</p><p>It is known that the pronunciation of language changes over time. The changes include large-scale regularities known as <strong>27</strong> <input class=\"blank\" name=\"q1\" type=\"text\">. There are several possible causes for change. Firstly, there is the effect of one language on another. Secondly, there is the role of <strong>28</strong> <input class=\"blank\" name=\"q2\" type=\"text\">. The speech of certain groups has prestige, and is imitated by others. It has also been suggested that some changes are introduced by <strong>29</strong> <input class=\"blank\" name=\"q3\" type=\"text\">, who are unable to imitate speech in an exact way. Finally, there is a factor referred to as the <strong>30</strong> <input class=\"blank\" name=\"q4\" type=\"text\">, by which the effort necessary to produce words is reduced.</p></div>"},{"groupId":"group-2","kind":"true_false_not_given","questionIds":["q5","q6","q7","q8","q9","q10","q11"],"bodyHtml":"<div class=\"group\" id=\"q5-q6-q7-q8-q9-q10-q11-anchor\"><h4>Questions 31-37</h4><p>TRUE / FALSE / NOT GIVEN</p><div class=\"question-row\" id=\"q5-anchor\"><div class=\"question-text\"><strong>31</strong> It is impossible to know how words used to be pronounced.</div><div class=\"radio-group\"><label><input type=\"radio\" name=\"q5\" value=\"TRUE\"> TRUE</label><label><input type=\"radio\" name=\"q5\" value=\"FALSE\"> FALSE</label><label><input type=\"radio\" name=\"q5\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div><div class=\"question-row\" id=\"q6-anchor\"><div class=\"question-text\"><strong>32</strong> Some languages appear to have changed more than others.</div><div class=\"radio-group\"><label><input type=\"radio\" name=\"q6\" value=\"TRUE\"> TRUE</label><label><input type=\"radio\" name=\"q6\" value=\"FALSE\"> FALSE</label><label><input type=\"radio\" name=\"q6\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div><div class=\"question-row\" id=\"q7-anchor\"><div class=\"question-text\"><strong>33</strong> Some changes in English were probably led by the middle classes.</div><div class=\"radio-group\"><label><input type=\"radio\" name=\"q7\" value=\"TRUE\"> TRUE</label><label><input type=\"radio\" name=\"q7\" value=\"FALSE\"> FALSE</label><label><input type=\"radio\" name=\"q7\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div><div class=\"question-row\" id=\"q8-anchor\"><div class=\"question-text\"><strong>34</strong> Certain English sounds are difficult for all children to pronounce.</div><div class=\"radio-group\"><label><input type=\"radio\" name=\"q8\" value=\"TRUE\"> TRUE</label><label><input type=\"radio\" name=\"q8\" value=\"FALSE\"> FALSE</label><label><input type=\"radio\" name=\"q8\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div><div class=\"question-row\" id=\"q9-anchor\"><div class=\"question-text\"><strong>35</strong> Scant is generally easier to pronounce than skamt.</div><div class=\"radio-group\"><label><input type=\"radio\" name=\"q9\" value=\"TRUE\"> TRUE</label><label><input type=\"radio\" name=\"q9\" value=\"FALSE\"> FALSE</label><label><input type=\"radio\" name=\"q9\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div><div class=\"question-row\" id=\"q10-anchor\"><div class=\"question-text\"><strong>36</strong> The spelling of gnat is likely to change in the future.</div><div class=\"radio-group\"><label><input type=\"radio\" name=\"q10\" value=\"TRUE\"> TRUE</label><label><input type=\"radio\" name=\"q10\" value=\"FALSE\"> FALSE</label><label><input type=\"radio\" name=\"q10\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div><div class=\"question-row\" id=\"q11-anchor\"><div class=\"question-text\"><strong>37</strong> The spelling of temporary no longer reflects its pronunciation.</div><div class=\"radio-group\"><label><input type=\"radio\" name=\"q11\" value=\"TRUE\"> TRUE</label><label><input type=\"radio\" name=\"q11\" value=\"FALSE\"> FALSE</label><label><input type=\"radio\" name=\"q11\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div></div>"},{"groupId":"group-3","kind":"matching","questionIds":["q12","q13","q14"],"allowOptionReuse":false,"bodyHtml":"<div class=\"group\" id=\"q12-q13-q14-anchor\"><h4>Questions 38-40</h4><p>Look at the following statements (questions 38-40) and the list of options below.</p><p>Match each statement with the option A, B, C or D.</p><p>Write the correct letter A, B, C or D in boxes 38-40 on your answer sheet.</p><div class=\"match-question-item\" id=\"q12-anchor\"><p><strong>38</strong> the b sound changing to a p sound at the end of words</p><div class=\"match-dropzone\" data-question=\"q12\"></div></div><div class=\"match-question-item\" id=\"q13-anchor\"><p><strong>39</strong> the melodic pronunciation of Welsh English</p><div class=\"match-dropzone\" data-question=\"q13\"></div></div><div class=\"match-question-item\" id=\"q14-anchor\"><p><strong>40</strong> the disappearance of the t sound in Christmas</p><div class=\"match-dropzone\" data-question=\"q14\"></div></div><div class=\"options-pool\"><div class=\"pool-items\"><div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A large-scale change</div><div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B influence of one language on another</div><div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C minimisation of effort</div><div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D imitation of prestigious group</div></div></div></div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-221", "answers", {"answerKey":{"q1":"NOT GIVEN","q2":"YES","q3":"NO","q4":"YES","q5":"NO","q6":"D","q7":"A","q8":"B","q9":"H","q10":"E","q11":"B","q12":"D","q13":"C","q14":"A"}});
+})(typeof window !== "undefined" ? window : globalThis);
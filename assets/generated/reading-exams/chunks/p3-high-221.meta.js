@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-221", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-high-221","meta":{"title":"The Animal Connection 动物联结","category":"P3","frequency":"medium","pdfFilename":"221. P3 - The Animal Connection 动物联结.pdf","legacyPath":"ReadingPractice/PDF/","legacyFilename":"221. P3 - The Animal Connection 动物联结.pdf","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":null,"shuiPdf":"ReadingPractice/PDF/221. P3 - The Animal Connection 动物联结.pdf","ieltsHtml":null},"audit":{"matchStatus":"pdf_visual_answer_verified","matchConfidence":0.96,"verifiedAt":"2026-06-06T00:00:00.000+08:00","notes":"Built from root PDF text layer; answer key and explanations extracted from embedded image page by visual inspection."}});
+})(typeof window !== "undefined" ? window : globalThis);
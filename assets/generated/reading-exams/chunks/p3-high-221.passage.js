@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-221", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>The Animal Connection</h3>\n<p><em>Professor of anthropology Pat Shipman looks at the ways in which our relationships with animals have shaped our own human evolution.</em></p>\n<p>Travel anywhere and you see something so common it may not even catch your attention. Wherever there are people, animals are being walked, herded and fed. Many, such as dogs, cats and sheep, are domesticated, but you will also find people living alongside wild creatures like monkeys and wolves. Close contact with animals is not confined to one particular culture, region or ethnic group but is a universal human trait.</p>\n<p>On the face of it this makes little sense. No other mammal adopts individuals from another species, with good reason. Since the ultimate prize in evolution is perpetuating your genes, providing food for another species is counterproductive to success. Even if pets offer friendship, that cannot explain why our bond with other species arose in the first place. Who would bring a ferocious wolf into their home in the hope that thousands of years later it would become a loving pet?</p>\n<p>As an anthropologist I have tried to understand this puzzle by looking to the past for the origins of our link with animals. What I found was a long and unbroken evolutionary trail of evidence I call the ‘animal connection’. This trail links to three important developments in human evolution: tool making, language and domestication. If I am correct, and I believe that further research will conclusively show that I am, the animal connection is a hugely significant force instrumental in our global success.</p>\n<p>The trail begins at least 2.6 million years ago. That is when the first tools appear in the archaeological record. This development required the intellectual breakthrough of realizing that the properties of an object can be altered. Man learnt how to turn stone into small, sharp items that could cut up animal carcasses, providing them with an evolutionary shortcut to becoming predators.</p>\n<p>There were many consequences of the new hunting lifestyle. On the plus side, eating more meat and fat was a requirement for the increase in relative brain size. And since meat tends to come in bigger packages than leaves and roots, meat eaters could spend less time finding food and more on activities like learning and social interaction. On the minus side, preying on animals put our ancestors into direct competition with the other predators that shared their ecosystem, animals such as lions and hyenas. To get the upper hand, they needed more than just tools, and that is where the animal connection comes in. What made it possible for our ancestors to compete successfully with true carnivores was the ability to pay very close attention to the habits of both potential prey and competitors. Knowledge was power, so we acquired a deep understanding of the minds of other animals. Another significant consequence of becoming more predatory was the need to live at lower densities, as successful predators soon exhaust food supplies. The record of the geographic distribution of our ancestors provides further support for my idea that the animal connection has shaped our evolution. Early man lived in Africa and nowhere else, but then underwent a dramatic expansion in territory, forced by the search for new hunting grounds.</p>\n<p>Throughout the period of these enormous changes in the lifestyle of our ancestors, gathering, sharing and recording knowledge became increasingly advantageous, and examples of prehistoric art that appear in Europe, Asia, Africa and Australia allow us to eavesdrop on their conversations. Through the art, we realize the main topic was animals: their colours, shapes, postures and habits. This focus is even more striking considering that scenes of human life are rarely depicted. Pictures of people, social interaction and ceremonies are rare.</p>\n<p>This leads me on to the development of language. Nobody doubts this proved a major adaptive advantage to our ancestors in developing complex behaviours. How it arose, however, remains a mystery. I believe I am the first to propose a continuity between the strong human-animal link that appeared 2.6 million years ago and the origin of language. The complexity and importance of animal-related information, indicated in the predominance of animal images, spurred early humans to move beyond what other species could achieve. Vervet monkeys, for example, have different cries for eagles and snakes, but they cannot discuss what threats might appear tomorrow. The property of full language is that it is comprised of vocabulary and grammatical rules that can be combined in an infinite number of ways to convey fine shades of meaning.</p>\n<p>As our ancestors became more involved with animals, the third product of the animal connection appeared: domestication, which has long been linked with the keeping of animals like sheep. Domestic animals are usually considered as ‘walking larders’, or easy food sources, reflecting the idea that the basis of this change was a drive for greater food security. Looking at the origins of domestication for clues to its underlying reasons, I found fundamental flaws in this idea. Instead, my analysis suggests domestication emerged as a natural progression of our close association with, and understanding of, other species. If domestication was about knowing where your next meal was coming from, the first domesticate ought to have been a food source, yet analysis of fossils shows that the domestication of dogs pre-dated that of any other species, even plants, from wolves. Furthermore, if the objective was to have meat to eat, you wouldn’t select an animal that eats two kilograms of meat a day. It was familiarity with this species that led to eventual domestication.</p>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-221", "questions", {"questionGroups":[{"groupId":"group-1","kind":"yes_no_not_given","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\"><h4>Questions 27-31</h4><p>Do the following statements agree with the views of the writer in Reading Passage 3?</p><p>In boxes 27-31 on your answer sheet, write <strong>YES</strong> if the statement agrees with the views of the writer, <strong>NO</strong> if the statement contradicts the views of the writer, and <strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this.</p><div class=\"question-item\" id=\"q1-anchor\"><p><strong>27</strong> Travellers are more likely to notice wild animals than domesticated ones.</p><div class=\"radio-options\"><label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label><label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label><label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div><div class=\"question-item\" id=\"q2-anchor\"><p><strong>28</strong> All cultures demonstrate a need to have close contact with animals.</p><div class=\"radio-options\"><label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label><label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label><label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div><div class=\"question-item\" id=\"q3-anchor\"><p><strong>29</strong> Animals benefit from allowing other animal species to share food resources.</p><div class=\"radio-options\"><label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label><label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label><label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div><div class=\"question-item\" id=\"q4-anchor\"><p><strong>30</strong> It is unlikely that people initially domesticated wolves for future companionship.</p><div class=\"radio-options\"><label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label><label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label><label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div><div class=\"question-item\" id=\"q5-anchor\"><p><strong>31</strong> There are periods of human evolution for which we have little information about man’s relationship with animals.</p><div class=\"radio-options\"><label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label><label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label><label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div></div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q6","q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-10-anchor\"><h4>Questions 32-36</h4><p>Complete the summary using the list of words, A-J, below.</p><p>Write the correct letter, A-J, in boxes 32-36 on your answer sheet.</p><h5>Hunting and the animal connection</h5><p>Around 2.6 million years ago, humans became predators after they realized the possibility of object <strong>32</strong> <input class=\"blank\" name=\"q6\" type=\"text\">. Once humans were hunters, they benefited from better <strong>33</strong> <input class=\"blank\" name=\"q7\" type=\"text\"> and extra time which could be spent on non-physical activities. However, the more humans came to depend on meat as a food source, the more <strong>34</strong> <input class=\"blank\" name=\"q8\" type=\"text\"> there was between them and other predators. Humans needed to find an advantage over animals such as lions and hyenas. It wasn’t a spear or knife that gave them this advantage, but the <strong>35</strong> <input class=\"blank\" name=\"q9\" type=\"text\"> skills that humans began to develop. Then, because humans were such successful predators, they required more <strong>36</strong> <input class=\"blank\" name=\"q10\" type=\"text\"> and this led to groups of people moving away from Africa.</p><div class=\"options-list\"><span class=\"summary-option\"><strong>A</strong> nutrition</span><span class=\"summary-option\"><strong>B</strong> competition</span><span class=\"summary-option\"><strong>C</strong> leadership</span><span class=\"summary-option\"><strong>D</strong> adaptation</span><span class=\"summary-option\"><strong>E</strong> territory</span><span class=\"summary-option\"><strong>F</strong> trade</span><span class=\"summary-option\"><strong>G</strong> connection</span><span class=\"summary-option\"><strong>H</strong> observation</span><span class=\"summary-option\"><strong>I</strong> behavior</span><span class=\"summary-option\"><strong>J</strong> worship</span></div></div>"},{"groupId":"group-3","kind":"multi_choice","questionIds":["q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-14-anchor\"><h4>Questions 37-40</h4><p>Choose the correct letter, A, B, C, or D.</p><div class=\"question-item\" id=\"q11-anchor\"><p><strong>37</strong> What is the writer’s main argument in the sixth paragraph?</p><div class=\"radio-options\"><label><input name=\"q11\" type=\"radio\" value=\"A\"> A Prehistoric art allows us to date human migration patterns.</label><label><input name=\"q11\" type=\"radio\" value=\"B\"> B Early man valued the communication of knowledge about animal behaviour and appearance.</label><label><input name=\"q11\" type=\"radio\" value=\"C\"> C There is evidence of big lifestyle differences between early humans in different regions.</label><label><input name=\"q11\" type=\"radio\" value=\"D\"> D There was little spoken interaction between different groups of people.</label></div></div><div class=\"question-item\" id=\"q12-anchor\"><p><strong>38</strong> What is the writer doing in the seventh paragraph?</p><div class=\"radio-options\"><label><input name=\"q12\" type=\"radio\" value=\"A\"> A rejecting an established theory about human evolution.</label><label><input name=\"q12\" type=\"radio\" value=\"B\"> B emphasizing the value of art in language development.</label><label><input name=\"q12\" type=\"radio\" value=\"C\"> C expressing doubt about the initial purpose of communication.</label><label><input name=\"q12\" type=\"radio\" value=\"D\"> D making a claim about the way that language developed.</label></div></div><div class=\"question-item\" id=\"q13-anchor\"><p><strong>39</strong> The writer refers to vervet monkeys in order to:</p><div class=\"radio-options\"><label><input name=\"q13\" type=\"radio\" value=\"A\"> A indicate which animal species have a kind of basic language.</label><label><input name=\"q13\" type=\"radio\" value=\"B\"> B show how danger is a significant motivation for human communication.</label><label><input name=\"q13\" type=\"radio\" value=\"C\"> C highlight the sophistication of human communication.</label><label><input name=\"q13\" type=\"radio\" value=\"D\"> D suggest a possible influence on the way early humans interacted.</label></div></div><div class=\"question-item\" id=\"q14-anchor\"><p><strong>40</strong> The writer says that the ‘walking larder’ idea</p><div class=\"radio-options\"><label><input name=\"q14\" type=\"radio\" value=\"A\"> A fails to explain the purpose of domestication.</label><label><input name=\"q14\" type=\"radio\" value=\"B\"> B is true only for domesticated animals.</label><label><input name=\"q14\" type=\"radio\" value=\"C\"> C supports the idea the writer proposes.</label><label><input name=\"q14\" type=\"radio\" value=\"D\"> D is based on research the writer has carried out.</label></div></div></div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-228", "answers", {"answerKey":{"q1":"F","q2":"H","q3":"G","q4":"A","q5":"C","q6":"F","q7":"B","q8":"G","q9":"E","q10":"A","q11":"truthful","q12":"shock","q13":"understand","q14":"interpretation"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-228", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-high-228","meta":{"title":"On art and artists 艺术与艺术家","category":"P3","frequency":"high","pdfFilename":"228. P3 - On art and artists 艺术与艺术家.pdf","legacyPath":"ReadingPractice/PDF/","legacyFilename":"228. P3 - On art and artists 艺术与艺术家.pdf","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/228. P3 - On art and artists 艺术与艺术家/228. P3 - On art and artists 艺术与艺术家.html","shuiPdf":"ReadingPractice/PDF/228. P3 - On art and artists 艺术与艺术家.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-31T19:30:00.000Z","notes":"signature:dragdrop,textarea"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-228", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>On art and artists</h3>\n<h4>A</h4>\n<p>There really is no such thing as art, only artists. Once these were people who took coloured earth and roughed out the forms of a bison on the wall of a cave; today some buy their paints, and others design posters for hoardings; they did and do many other things. There is no harm in calling all these activities art as long as we keep in mind that such a word may mean very different things in different times and places, and as long as we realize that Art with a capital A has no existence: it has become something of an obsession. You may crush an artist by telling him that what he has just done may be quite good in its own way, only it is not true art.</p>\n<h4>B</h4>\n<p>Actually, I do not think that there are any wrong reasons for liking a statue or a picture. We may like a painting of a village scene because it reminds us of home. There is nothing wrong with that. All of us, when we see a painting, are bound to be reminded of a hundred-and-one things which influence our likes and dislikes. As long as these memories help us to enjoy what we see, we need not worry.</p>\n<h4>C</h4>\n<p>It is only when some irrelevant memory makes us prejudiced, when we instinctively turn away from a magnificent picture of an alpine scene because we dislike climbing, that we should search our mind for the reason for the aversion which spoils a pleasure we might otherwise have had. There are wrong reasons for disliking a work of art.</p>\n<h4>D</h4>\n<p>Most people like to see in pictures what they would also like to see in reality. This is quite a natural preference. We all like beauty in nature, and are grateful to the artists who have preserved it in their works. Nor would these artists themselves have rebuffed us for our taste. When the great Flemish painter Rubens made a drawing of his young son, he was surely proud of his good looks, and wanted us, too, to delight in the child's appearance. But this bias for the pretty and engaging subject is apt to become a stumbling block if it leads us to reject works which represent a less appealing subject.</p>\n<h4>E</h4>\n<p>The great German painter Durer certainly drew his mother with as much devotion and love as Rubens felt for his child. His truthful study of old age may give us a shock which makes us turn away from it - and yet, if we fight against that first reaction we may be richly rewarded. For Durer's drawing in its tremendous sincerity is a great work. The beauty of a picture does not really lie in the beauty of its subject matter. The trouble about beauty is that tastes and standards of what is beautiful vary so much.</p>\n<h4>F</h4>\n<p>What is true of beauty is also true of facial expression. In fact, it is often the expression of a figure in the painting which makes us like or loathe the work. Some people like an expression - perhaps of suffering or of compassion - which they can readily understand, and which therefore moves them profoundly. But we should not, for that reason, turn away from works whose expression is perhaps less easy to understand. Often we must first learn to know the artist's methods of drawing to understand the feelings he or she wishes to portray, and may even come to prefer works of art in which expression is not obvious. Just as some of us would rather people use few words and gestures and leave something to be guessed, so some of us would rather look at paintings or sculptures which are open to interpretation.</p>\n<h4>G</h4>\n<p>But here newcomers to art are often brought up against another difficulty. They want to admire the artist's skill in representing the things they see. What they like best are paintings which 'look real'. This is an important consideration, and the patience and skill which go into the faithful rendering of the visible world are indeed to be admired. Great artists of the past have devoted much labour to works in which every tiny detail is carefully recorded. Durer's watercolour study of a hare is one of the most famous examples of this loving patience. But who would say that Rembrandt's drawing of an elephant is necessarily less good because it shows fewer details? Indeed Rembrandt gave us the feel of the elephant's wrinkly skin with just a few lines of his chalk.</p>\n<h4>H</h4>\n<p>If we find fault with the accuracy of a picture, we must remember that artists may have their reasons for changing the appearance of what they see. We should also never condemn a work for being incorrectly drawn unless we are quite sure that we are right and the painter is wrong. We have a curious habit of thinking that nature must always look like the pictures we are accustomed to. For generations, paintings showed horses galloping with outstretched legs in full flight through the air, and we came to believe that this was indeed how they moved. It was only the development of photography which proved that horses simply do not gallop in that way. And yet, when painters began to apply this new discovery, and painted horses moving as they actually do, everyone complained that their pictures looked wrong.</p>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-229", "answers", {"answerKey":{"q1":"NO","q2":"NOT GIVEN","q3":"NOT GIVEN","q4":"YES","q5":"B","q6":"C","q7":"C","q8":"D","q9":"G","q10":"B","q11":"F","q12":"I","q13":"K","q14":"D"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-229", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-high-229","meta":{"title":"All in the family 兄弟姐妹的影响","category":"P3","frequency":"high","pdfFilename":"237. P3 - All in the family 兄弟姐妹的影响.pdf","legacyPath":"ReadingPractice/PDF/","legacyFilename":"237. P3 - All in the family 兄弟姐妹的影响.pdf","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":null,"shuiPdf":"ReadingPractice/PDF/237. P3 - All in the family 兄弟姐妹的影响.pdf","ieltsHtml":null},"audit":{"matchStatus":"pdf_visual_answer_verified","matchConfidence":0.98,"verifiedAt":"2026-06-06T00:00:00.000+08:00","notes":"Re-audited against the June PDF text layer; answer key and explanations match the embedded PDF answer images."}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-229", "questions", {"questionGroups":[{"groupId":"group-1","kind":"yes_no_not_given","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-q2-q3-q4-anchor\"><h4>Questions 27-30</h4><p>YES / NO / NOT GIVEN</p><div class=\"question-row\" id=\"q1-anchor\"><div class=\"question-text\"><strong>27</strong> Parents and siblings play equal roles in shaping people’s adult personalities.</div><div class=\"radio-group\"><label><input type=\"radio\" name=\"q1\" value=\"YES\"> YES</label><label><input type=\"radio\" name=\"q1\" value=\"NO\"> NO</label><label><input type=\"radio\" name=\"q1\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div><div class=\"question-row\" id=\"q2-anchor\"><div class=\"question-text\"><strong>28</strong> People’s first social relationships tend to be with siblings of their own gender.</div><div class=\"radio-group\"><label><input type=\"radio\" name=\"q2\" value=\"YES\"> YES</label><label><input type=\"radio\" name=\"q2\" value=\"NO\"> NO</label><label><input type=\"radio\" name=\"q2\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div><div class=\"question-row\" id=\"q3-anchor\"><div class=\"question-text\"><strong>29</strong> People’s relationships with their siblings tend to receive less attention when they marry.</div><div class=\"radio-group\"><label><input type=\"radio\" name=\"q3\" value=\"YES\"> YES</label><label><input type=\"radio\" name=\"q3\" value=\"NO\"> NO</label><label><input type=\"radio\" name=\"q3\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div><div class=\"question-row\" id=\"q4-anchor\"><div class=\"question-text\"><strong>30</strong> Parental ‘basking’ is advantageous for later siblings.</div><div class=\"radio-group\"><label><input type=\"radio\" name=\"q4\" value=\"YES\"> YES</label><label><input type=\"radio\" name=\"q4\" value=\"NO\"> NO</label><label><input type=\"radio\" name=\"q4\" value=\"NOT GIVEN\"> NOT GIVEN</label></div></div></div>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q5-q6-q7-q8-anchor\"><h4>Questions 31-34</h4><p>Choose the correct letter, A, B, C or D.</p><div class=\"mc-question-item\" id=\"q5-anchor\"><p><strong>31</strong> What point does the writer make about birth order in the third paragraph?</p><label class=\"mc-option\"><input type=\"radio\" name=\"q5\" value=\"A\"> A Its role is underestimated by parents.</label><label class=\"mc-option\"><input type=\"radio\" name=\"q5\" value=\"B\"> B It may shape the characteristics of adults.</label><label class=\"mc-option\"><input type=\"radio\" name=\"q5\" value=\"C\"> C Its importance decreases as children grow up.</label><label class=\"mc-option\"><input type=\"radio\" name=\"q5\" value=\"D\"> D It has more influence on personality than genetics.</label></div><div class=\"mc-question-item\" id=\"q6-anchor\"><p><strong>32</strong> What are we told about some of Claire Cartwright’s clients?</p><label class=\"mc-option\"><input type=\"radio\" name=\"q6\" value=\"A\"> A Their parents treated them fairly.</label><label class=\"mc-option\"><input type=\"radio\" name=\"q6\" value=\"B\"> B They were treated harshly by their siblings.</label><label class=\"mc-option\"><input type=\"radio\" name=\"q6\" value=\"C\"> C Their perceptions of childhood may be inaccurate.</label><label class=\"mc-option\"><input type=\"radio\" name=\"q6\" value=\"D\"> D They have closer relationships with their siblings as adults.</label></div><div class=\"mc-question-item\" id=\"q7-anchor\"><p><strong>33</strong> What is the writer’s main point about siblings in the fifth paragraph?</p><label class=\"mc-option\"><input type=\"radio\" name=\"q7\" value=\"A\"> A Parents tend to repeat their own parents’ mistakes.</label><label class=\"mc-option\"><input type=\"radio\" name=\"q7\" value=\"B\"> B Favoured children are likely to make good leaders as adults.</label><label class=\"mc-option\"><input type=\"radio\" name=\"q7\" value=\"C\"> C Negative characteristics in children can become positive in adults.</label><label class=\"mc-option\"><input type=\"radio\" name=\"q7\" value=\"D\"> D Attention-seeking children are unlikely to please bosses in later life.</label></div><div class=\"mc-question-item\" id=\"q8-anchor\"><p><strong>34</strong> Which of the following best summarises the writer’s argument in the sixth paragraph?</p><label class=\"mc-option\"><input type=\"radio\" name=\"q8\" value=\"A\"> A Many children have a favourite parent.</label><label class=\"mc-option\"><input type=\"radio\" name=\"q8\" value=\"B\"> B Parenting skills improve with later children.</label><label class=\"mc-option\"><input type=\"radio\" name=\"q8\" value=\"C\"> C Siblings are born with different personalities.</label><label class=\"mc-option\"><input type=\"radio\" name=\"q8\" value=\"D\"> D The family environment may change over time.</label></div></div>"},{"groupId":"group-3","kind":"matching","questionIds":["q9","q10","q11","q12","q13","q14"],"allowOptionReuse":false,"bodyHtml":"<div class=\"group\" id=\"q9-q10-q11-q12-q13-q14-anchor\"><h4>Questions 35-40</h4><p>Complete the summary using the list of phrases, A-K, below.</p><p>Write the correct letter, A-K, in boxes 35-40 on your answer sheet.</p><div class=\"match-question-item\" id=\"q9-anchor\"><p><strong>35</strong> Annette Henderson suggests that young children’s interactions with older siblings involve ...</p><div class=\"match-dropzone\" data-question=\"q9\"></div></div><div class=\"match-question-item\" id=\"q10-anchor\"><p><strong>36</strong> a Cambridge study found that siblings still enjoy ...</p><div class=\"match-dropzone\" data-question=\"q10\"></div></div><div class=\"match-question-item\" id=\"q11-anchor\"><p><strong>37</strong> Research conducted in 2003 suggests that children develop ...</p><div class=\"match-dropzone\" data-question=\"q11\"></div></div><div class=\"match-question-item\" id=\"q12-anchor\"><p><strong>38</strong> the trend for smaller families may mean today’s siblings enjoy ... as adults.</p><div class=\"match-dropzone\" data-question=\"q12\"></div></div><div class=\"match-question-item\" id=\"q13-anchor\"><p><strong>39</strong> a 2010 American study linked having a sister with ... among children aged 10-14.</p><div class=\"match-dropzone\" data-question=\"q13\"></div></div><div class=\"match-question-item\" id=\"q14-anchor\"><p><strong>40</strong> having a sibling may promote ... according to the same study.</p><div class=\"match-dropzone\" data-question=\"q14\"></div></div><div class=\"options-pool\"><div class=\"pool-items\"><div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A parental love</div><div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B imaginative games</div><div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C physical development</div><div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D generous behaviour</div><div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E strong marriages</div><div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F greater individuality</div><div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G learning experiences</div><div class=\"drag-item\" draggable=\"true\" data-option=\"H\">H career success</div><div class=\"drag-item\" draggable=\"true\" data-option=\"I\">I closer relationships</div><div class=\"drag-item\" draggable=\"true\" data-option=\"J\">J healthy competition</div><div class=\"drag-item\" draggable=\"true\" data-option=\"K\">K mental well-being</div></div></div></div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
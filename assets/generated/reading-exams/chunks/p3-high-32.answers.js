@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-32", "answers", {"answerKey":{"q1":"D","q2":"A","q3":"A","q4":"B","q5":"B","q6":"D","q7":"YES","q8":"NOT GIVEN","q9":"NOT GIVEN","q10":"NO","q11":"A","q12":"F","q13":"D","q14":"G"}});
+})(typeof window !== "undefined" ? window : globalThis);
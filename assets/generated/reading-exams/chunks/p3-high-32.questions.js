@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-32", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p>Choose the correct letter, <strong>A, B, C,</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> What is the writer's main point in the first paragraph?</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A Computer scientists are rarely represented at the Oscars.</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B Film-industry awards hold little interest for computer scientists.</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C The USA rewards film actors more than computer scientists.</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D Computer scientists are becoming a vital part of the film industry.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> When describing the way computer-generated imagery changes actors' appearance, what does the writer suggest?</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A CGI looks best from a distance.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B CGI interferes with actors' facial expressions.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C Audiences expect too much of CGI.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D The scientists had hoped for more convincing results.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> What does the writer suggest about the scientists' attitude to their work in the fourth paragraph?</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A They were motivated to get as near to reality as possible.</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B They were interested in gaining recognition for their work.</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C They thought it could have medical applications.</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D They hoped to receive further funding for their research.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What are we told about computerised tomography?</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A It has only recently been used by doctors.</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B It is similar to X-rays in the way it works.</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C Filmmakers have used it for many years for special lighting effects.</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D It can be administered using traditional radiography machines.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> Which of these advantages does the writer attribute to the current use of computerised tomography?</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"> A It is most effective when used to create images of skin.</label> <label><input name=\"q5\" type=\"radio\" value=\"B\"> B It can make a few people seem like a crowd.</label> <label><input name=\"q5\" type=\"radio\" value=\"C\"> C It allows clothes designers to create new designs.</label> <label><input name=\"q5\" type=\"radio\" value=\"D\"> D It is practical because of the time it takes.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> The writer mentions Kavita Bala in order to</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"A\"> A comment on the success of CGI in commercial contexts.</label> <label><input name=\"q6\" type=\"radio\" value=\"B\"> B highlight the link between CGI and photography.</label> <label><input name=\"q6\" type=\"radio\" value=\"C\"> C show that Marschner's team are uncertain about the future of CGI.</label> <label><input name=\"q6\" type=\"radio\" value=\"D\"> D demonstrate a use for CGI outside the film industry.</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"yes_no_not_given","questionIds":["q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-anchor\">\n<h4>Questions 33–36</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<p>In boxes 33–36 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>33</strong> It used to be unusual for university researchers to receive a cinematography award.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> CGI is popular among ageing actors.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> The scientists' success in generating images of complete CGI garments has won them many awards.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> It will be a long time before computerised tomographic imaging of fabric is used by filmmakers.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"matching","questionIds":["q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n<p><em>Drag and drop the correct option into each blank.</em></p>\n<div class=\"summary-box\">\n<h5>The work of Marschner and his colleagues</h5>\n<p>\nFor many years, CGI characters did not appear entirely lifelike as their skin appeared plastic. Marschner and his colleagues were the first to apply an understanding of how <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span> interacts with human skin. Their CGI model is based on a novel application of principles of <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span>, which had previously been applied in other scientific research. The importance of CGI to the film industry has led to the <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span> of Marschner's model by special-effects studios. Marschner's model has led to the <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span> of cinematography.\n</p>\n</div>\n<div class=\"options-pool\" id=\"word-options-pool\">\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\"><strong>A</strong> light</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\"><strong>B</strong> transparency</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\"><strong>C</strong> age</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\"><strong>D</strong> use</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\"><strong>E</strong> astrophysics</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\"><strong>F</strong> mathematics</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\"><strong>G</strong> improvement</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"H\"><strong>H</strong> colour</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"I\"><strong>I</strong> translucency</div>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-89", "answers", {"answerKey":{"q1":"D","q2":"B","q3":"C","q4":"B","q5":"NOT GIVEN","q6":"YES","q7":"NOT GIVEN","q8":"NO","q9":"YES","q10":"NO","q11":"I","q12":"H","q13":"E","q14":"C"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-89", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-high-89","meta":{"title":"Looking at daily life in ancient Rome  古罗马的日常","category":"P3","frequency":"high","pdfFilename":"179. P3 - Looking at daily life in ancient Rome  古罗马的日常.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/179. P3 - Looking at daily life in ancient Rome  古罗马的日常【高】/","legacyFilename":"179. P3 - Looking at daily life in ancient Rome  古罗马的日常.html","questionIntroHtml":""},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/179. P3 - Looking at daily life in ancient Rome  古罗马的日常【高】/179. P3 - Looking at daily life in ancient Rome  古罗马的日常.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/179. P3 - Looking at daily life in ancient Rome  古罗马的日常【高】/179. P3 - Looking at daily life in ancient Rome  古罗马的日常.pdf","ieltsHtml":"IELTS/P3/Looking at daily life in ancient Rome.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.661Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-89", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>Looking at daily life in ancient Rome</h3>\n<h4>In this preface to a history, the writer explains the factors affecting the scope of his study.</h4>\n<p>If our ideas on Roman life are not to become lost in confusion, we must study it within a strictly defined time. Nothing changes more rapidly than human customs. Looking at our own more familiar world, apart from the great scientific discoveries of recent centuries which have turned it upside down—steam, electricity, railways, motor cars and aeroplanes, for example—it is clear that the elementary forms of everyday life have been subject to increasing change. Potatoes, for example, were not introduced into Europe until the sixteenth century, coffee was first drunk there in the late sixteenth or early seventeenth, and the banana was used in desserts in Europe at the beginning of the twentieth. The law of change was not less operative in antiquity. It was a commonplace of Roman rhetoric to contrast the crude simplicity of the Republic (509BC–27BC) with the luxury and refinement of the imperial times which followed. There is no common measure, whether of home, or house, or furniture, between ages which are so different.</p>\n<p>Since a choice of time must necessarily be made, this history will confine itself to studying the generation which was born about the middle of the first century AD, toward the end of the reign of Claudius (41–54AD) or the beginning of the reign of Nero (54–68AD), and which lived on into the reign of Trajan (98–117AD) or of Hadrian (117–138AD). This generation saw the Roman Empire at its most powerful and prosperous. It was witness to the last conquests of the Caesars: the conquest of Dacia, in modern-day eastern Europe, which brought vast mineral wealth into the Empire, and the conquest of Arabia, which helped to bring the riches of India and East Asia flooding into Rome. In the material domain, this generation attained the pinnacle of ancient civilisation.</p>\n<p>By a fortunate coincidence—all the more fortunate in that Latin* literature was soon to run nearly dry—this generation is the one whose records combine to offer us the most complete picture of Roman life that we possess. We have a profusion of vivid and picturesque descriptions, precise and colourful, in such works as the <em>Epigrams</em> of Martial, the <em>Satires</em> of Juvenal and the <em>Letters</em> of Pliny. In addition, the Forum of Trajan in Rome itself and the ruins of Herculaneum and Pompeii, the two prosperous resorts buried by the eruption of Mount Vesuvius in 79AD, supply an immense fund of archaeological evidence. Later excavations have also restored to us the ruins of the city of Ostia, which date in the main from the time when the Emperor Hadrian created this great commercial city as a realisation of his town planning ideas. Fortune has favoured the historian of this time.</p>\n<p><em>* Latin: the language of ancient Rome.</em></p>\n<p>It is not enough to focus our study of Roman life only on a fixed time. It would lack foundation and consistency if we did not also focus it in space—in the country or in the town. Even today when the facilities for communication bring something of the city into the smallest and most isolated country cottage, there remains a significant difference between rural existence and the excitement of city life: a much greater gulf separated the peasant from the townsman of antiquity. So large was the inequality between them that, according to the historian Rostovtzeff, it pitted one against the other in a fierce and silent struggle which pierced the wall protecting the Roman privileged classes from the barbarian flood from the north. When the barbarian forces began to invade Roman territory, the peasants decided to fight alongside them.</p>\n<p>The townsman, in fact, enjoyed all the goods and resources of the earth. The peasant knew nothing but unending labour without profit, and was unable to enjoy the activities available in even the poorest of cities: the liveliness of the sports field, the warmth of the public baths and the magnificence of public spectacles. In a work on the history of everyday life, we must give up any attempt to blend two such dissimilar pictures into one, and must choose between them. The time which we have chosen to describe day by day is that of those Roman subjects who spent their time exclusively in the town, or rather in The City, Rome, which they regarded as the hub and centre of the universe, proud and wealthy ruler of a world which seemed at that time to have been pacified for ever.</p>\n<p>To perform our task well, we must first try to form an adequate picture of the surroundings in which our subjects lived, and by which their lives were coloured, freeing ourselves from any misconceptions concerning it. We must seek to reconstruct the physical nature of the great city and the social milieu of the various classes of the hierarchy by which it was governed. We must also investigate the moral background of thought and sentiment which can help explain both its strength and its weaknesses. The way in which the Romans of Rome employed their time can only be studied satisfactorily after we have plotted out the main lines of the framework within which they lived and outside of which the routine of their daily life would be more or less unintelligible.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
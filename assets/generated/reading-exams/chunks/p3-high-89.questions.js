@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-high-89", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> What does the writer say about the period mentioned in the second paragraph?</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"><span>A There was a high level of immigration into Rome.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"B\"><span>B The export of minerals made Rome rich.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"C\"><span>C Rome sent armies to control trade with India and East Asia.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"D\"><span>D The Roman standard of living reached its highest level.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Ostia is mentioned as</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"><span>A a city which often features in literature.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"B\"><span>B an important area for archaeological research.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"C\"><span>C the birthplace of a Roman Emperor.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"D\"><span>D a city whose layout was similar to that of Rome.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> The statement that 'Fortune has favoured the historian of this time' refers to the fact that</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"><span>A historians of this period have become wealthy as a result of their discoveries.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"B\"><span>B works on this period are popular among the reading public.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"C\"><span>C a wide range of sources is available for this period.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"D\"><span>D this period has been less studied than many others.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> In comparing urban and rural life in the Roman Empire, the writer states that</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"><span>A rural Romans were largely illiterate.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"B\"><span>B rural life and urban life had little in common.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"C\"><span>C little information is available concerning rural life.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"D\"><span>D most readers of history are more interested in city life.</span></label>\n</div>\n</div>\n</div>"},{"groupId":"group-2","kind":"yes_no_not_given","questionIds":["q5","q6","q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-9-10-anchor\">\n<h4>Questions 31–36</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<p>In boxes 31–36 on your answer sheet, write</p>\n<ul style=\"list-style: none; padding-left: 0;\">\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>31</strong> Rome's conquest of Arabia resulted in large-scale immigration from the east into Rome.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> More can be learned about Roman life from the literature of the period studied in this book than from later Latin literature.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Discoveries at Herculaneum and Pompeii showed that certain beliefs about Roman life were wrong.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Roman peasants provided assistance to the Empire when it was attacked.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Rural inhabitants of the Roman Empire had a difficult life.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> Entertainment facilities were limited to the city of Rome itself.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n<div class=\"summary-box\">\n<h5 style=\"text-align: center;\">The scope of the writer's study</h5>\n<div class=\"summary-text\">\n<p>It was important for the writer to limit several aspects of his <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span>. He decided to focus on a limited <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> in Roman history, and to concentrate on the section of the population who were <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span>. The writer was interested in the physical environment, the people that ruled the country and the <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span> that contributed both to Rome's strength and to its weaknesses.</p>\n</div>\n</div>\n<div id=\"word-options\">\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A emperors</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B setting</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C values</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D peasants</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E city-dwellers</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F social classes</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G myths</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H period</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I investigation</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
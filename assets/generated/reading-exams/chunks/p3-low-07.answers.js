@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-07", "answers", {"answerKey":{"q1":"A","q2":"E","q3":"B","q4":"F","q5":"C","q6":"B","q7":"16","q8":"Bach","q9":"coaches","q10":"FALSE","q11":"NOT GIVEN","q12":"FALSE","q13":"TRUE","q14":"NOT GIVEN"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-07", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-07","meta":{"title":"Star Performers 明星员工","category":"P3","frequency":"low","pdfFilename":"104. P3 - Star Performers 明星员工.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/104. P3 - Star Performers 明星员工/","legacyFilename":"104. P3 - Star Performers 明星员工.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/104. P3 - Star Performers 明星员工/104. P3 - Star Performers 明星员工.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/104. P3 - Star Performers 明星员工/104. P3 - Star Performers 明星员工.pdf","ieltsHtml":"IELTS/P3/Star Performers.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.520Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
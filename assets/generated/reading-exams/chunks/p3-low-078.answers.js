@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-078", "answers", {"answerKey":{"q1":"A","q2":"B","q3":"C","q4":"D","q5":"E","q6":"F","q7":"G","q8":"true","q9":"true","q10":"true","q11":"false","q12":"true","q13":"false","q14":"false","q15":"b","q16":"c","q17":"b","q18":"b","q19":"evolutionary frippery","q20":"are intricately connected","q21":"mathematical ratios","q22":"abstracted","q23":"speech","q24":"chromatic scale","q25":"continuum","q26":"emotional states"}});
+})(typeof window !== "undefined" ? window : globalThis);
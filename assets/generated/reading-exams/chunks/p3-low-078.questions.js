@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-078", "questions", {"questionGroups":[{"groupId":"group-1","kind":"short_answer","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 1–7</h4>\n<p>Match the following people with their corresponding opinions. Choose the correct option from <strong>A-G</strong> and fill in the brackets.</p>\n<div class=\"matching-grid\">\n<div class=\"matching-item\">\n<span class=\"matching-num\">1.</span> <span>Steven Pinker</span>\n<select name=\"q1\" id=\"q1\">\n<option value=\"\">Select...</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n</select>\n</div>\n<div class=\"matching-item\">\n<span class=\"matching-num\">2.</span> <span>David Schwartz</span>\n<select name=\"q2\" id=\"q2\">\n<option value=\"\">Select...</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n</select>\n</div>\n<div class=\"matching-item\">\n<span class=\"matching-num\">3.</span> <span>Catherine Howe & Dale Purves</span>\n<select name=\"q3\" id=\"q3\">\n<option value=\"\">Select...</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n</select>\n</div>\n<div class=\"matching-item\">\n<span class=\"matching-num\">4.</span> <span>Charles Rosen</span>\n<select name=\"q4\" id=\"q4\">\n<option value=\"\">Select...</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n</select>\n</div>\n<div class=\"matching-item\">\n<span class=\"matching-num\">5.</span> <span>Pythagoras</span>\n<select name=\"q5\" id=\"q5\">\n<option value=\"\">Select...</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n</select>\n</div>\n<div class=\"matching-item\">\n<span class=\"matching-num\">6.</span> <span>Marc Hauser & Josh McDermott</span>\n<select name=\"q6\" id=\"q6\">\n<option value=\"\">Select...</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n</select>\n</div>\n<div class=\"matching-item\">\n<span class=\"matching-num\">7.</span> <span>Sandra Trehub</span>\n<select name=\"q7\" id=\"q7\">\n<option value=\"\">Select...</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n</select>\n</div>\n</div>\n<p style=\"margin-top: 15px; font-weight: bold;\">Opinion Options:</p>\n<ol type=\"A\" style=\"margin-top: 5px; padding-left: 20px; font-size: 0.9em;\">\n<li>Music is a non-essential element in evolution, described as \"auditory cheesecake.\"</li>\n<li>Musical preferences are rooted in biology and speech, not pure mathematical ratios.</li>\n<li>Musical sounds are closely linked to linguistic sounds, supported by speech frequency research.</li>\n<li>Music is completely divorced from nature and the world of daily life.</li>\n<li>Harmony in music is related to the mathematical ratios of sounding objects.</li>\n<li>Animals do not create or perceive music in the way humans do; there is no \"Mozart among birds.\"</li>\n<li>For infants, music and language lie on a continuum, and musicalized speech can regulate infants' emotions.</li>\n</ol>\n</div>"},{"groupId":"group-2","kind":"true_false_not_given","questionIds":["q8","q9","q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 8–14</h4>\n<p>Based on the passage, determine whether the following statements are correct. Write <strong>True (T)</strong> for correct, <strong>False (F)</strong> for incorrect, and <strong>Not Given (NG)</strong> if the information is not mentioned in the passage.</p>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q8-anchor\"></a><b>8</b> Language is universally essential for human survival and practical activities, while music is not.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q8\" value=\"true\"> T</label> <label><input type=\"radio\" name=\"q8\" value=\"false\"> F</label> <label><input type=\"radio\" name=\"q8\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q9-anchor\"></a><b>9</b> The chromatic scale is a universal feature in the music of all cultures.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q9\" value=\"true\"> T</label> <label><input type=\"radio\" name=\"q9\" value=\"false\"> F</label> <label><input type=\"radio\" name=\"q9\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q10-anchor\"></a><b>10</b> Schwartz's team analyzed over 100,000 speech segments and found that their frequency distribution matches the chromatic scale.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q10\" value=\"true\"> T</label> <label><input type=\"radio\" name=\"q10\" value=\"false\"> F</label> <label><input type=\"radio\" name=\"q10\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q11-anchor\"></a><b>11</b> Birds can create novel and original melodies similar to those of human composers.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q11\" value=\"true\"> T</label> <label><input type=\"radio\" name=\"q11\" value=\"false\"> F</label> <label><input type=\"radio\" name=\"q11\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q12-anchor\"></a><b>12</b> Regardless of the language used, the musicalized speech mothers use with infants is the same.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q12\" value=\"true\"> T</label> <label><input type=\"radio\" name=\"q12\" value=\"false\"> F</label> <label><input type=\"radio\" name=\"q12\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q13-anchor\"></a><b>13</b> Pythagoras' theory about the relationship between music and mathematics has never been challenged.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q13\" value=\"true\"> T</label> <label><input type=\"radio\" name=\"q13\" value=\"false\"> F</label> <label><input type=\"radio\" name=\"q13\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q14-anchor\"></a><b>14</b> Animals will definitely respond to music composed based on their own soundscapes.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q14\" value=\"true\"> T</label> <label><input type=\"radio\" name=\"q14\" value=\"false\"> F</label> <label><input type=\"radio\" name=\"q14\" value=\"not given\"> NG</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"single_choice","questionIds":["q15","q16","q17","q18"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 15–18</h4>\n<p>Choose the option (<strong>A, B, C, or D</strong>) that best matches the content of the passage.</p>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q15-anchor\"></a><strong>15</strong> What does \"the tune is changing\" (in Paragraph B) refer to?</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q15\" value=\"a\"> A. The way music is created has undergone significant evolution.</label> <label><input type=\"radio\" name=\"q15\" value=\"b\"> B. Neuroscience research has changed the traditional view of music.</label> <label><input type=\"radio\" name=\"q15\" value=\"c\"> C. The relationship between music and mathematics has been confirmed.</label> <label><input type=\"radio\" name=\"q15\" value=\"d\"> D. Different cultures have developed unique musical styles.</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q16-anchor\"></a><strong>16</strong> According to Schwartz, why do humans prefer certain musical sounds?</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q16\" value=\"a\"> A. They correspond to simple mathematical ratios.</label> <label><input type=\"radio\" name=\"q16\" value=\"b\"> B. They are abstract and unrelated to real life.</label> <label><input type=\"radio\" name=\"q16\" value=\"c\"> C. They remind people of familiar speech sounds.</label> <label><input type=\"radio\" name=\"q16\" value=\"d\"> D. They are inherited from the musical traditions of ancient humans.</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q17-anchor\"></a><strong>17</strong> What is the core view of Sandra Trehub's research?</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q17\" value=\"a\"> A. Infants have better musical perception abilities than adults.</label> <label><input type=\"radio\" name=\"q17\" value=\"b\"> B. Musicalized speech helps mothers communicate emotionally with infants.</label> <label><input type=\"radio\" name=\"q17\" value=\"c\"> C. Infants can clearly distinguish between music and language.</label> <label><input type=\"radio\" name=\"q17\" value=\"d\"> D. What mothers say to infants is more like songs than speech.</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q18-anchor\"></a><strong>18</strong> How does Schwartz suggest testing whether animals appreciate music?</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q18\" value=\"a\"> A. Playing human music to different animal species.</label> <label><input type=\"radio\" name=\"q18\" value=\"b\"> B. Observing animals' responses to music composed based on their own soundscapes.</label> <label><input type=\"radio\" name=\"q18\" value=\"c\"> C. Comparing the auditory systems of humans and animals.</label> <label><input type=\"radio\" name=\"q18\" value=\"d\"> D. Analyzing the mathematical patterns in animal sounds.</label>\n</div>\n</div>\n</div>"},{"groupId":"group-4","kind":"summary_completion","questionIds":["q19","q20","q21","q22","q23","q24","q25","q26"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 19–26</h4>\n<p>Complete the summary with words from the passage. Each blank can be filled with a maximum of <strong>3 words</strong>.</p>\n<div style=\"margin-top: 15px; line-height: 1.6;\">\n<p>Both music and language are universally possessed human abilities, but they have held different positions in research for a long time. Language is regarded as the key to human intelligence, while music was once considered a <input type=\"text\" name=\"q19\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q19-anchor\"></a>. However, recent neuroscience research shows that the two <input type=\"text\" name=\"q20\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q20-anchor\"></a>.</p>\n<p>The traditional view holds that musical harmony originates from <input type=\"text\" name=\"q21\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q21-anchor\"></a>, or that music is completely <input type=\"text\" name=\"q22\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q22-anchor\"></a>. But Schwartz's team believes that the basic elements of music exist in <input type=\"text\" name=\"q23\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q23-anchor\"></a>, because their analysis of speech frequencies matches the <input type=\"text\" name=\"q24\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q24-anchor\"></a>.</p>\n<p>For infants, music and language lie on a <input type=\"text\" name=\"q25\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q25-anchor\"></a>, and mothers use musicalized speech to regulate infants' <input type=\"text\" name=\"q26\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q26-anchor\"></a>. This suggests that music may be more necessary than previously thought.</p>\n</div>\n</div>"}],"questionDisplayMap":{"q1":"1","q2":"2","q3":"3","q4":"4","q5":"5","q6":"6","q7":"7","q8":"8","q9":"9","q10":"10","q11":"11","q12":"12","q13":"13","q14":"14","q15":"15","q16":"16","q17":"17","q18":"18","q19":"19","q20":"20","q21":"21","q22":"22","q23":"23","q24":"24","q25":"25","q26":"26"},"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14","q15","q16","q17","q18","q19","q20","q21","q22","q23","q24","q25","q26"]});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-100", "answers", {"answerKey":{"q1":"NO","q2":"NOT GIVEN","q3":"YES","q4":"NOT GIVEN","q5":"B","q6":"A","q7":"C","q8":"B","q9":"H","q10":"F","q11":"B","q12":"I","q13":"E","q14":"C"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-100", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 3</h2>\n<p><strong>A</strong> Whether made of highly polished metal or of glass with a coating of metal on the back, mirrors have fascinated people for thousands of years. Ancient Egyptians were often depicted holding hand mirrors. For centuries, the people of Rajasthan in India have sewn bits of reflective glass into their clothing, and the resulting sparkle emphasizes the magic and mystery of that desert land.</p>\n<p><strong>B</strong> To scientists, the simultaneous simplicity and complexity of mirrors make them effective and accessible tools for exploring questions about perception and cognition in humans and other 'intelligent' species, and about how the brain interprets and acts upon the great mass of sensory information from the external world. Mirrors are used to study how the brain decides what is self and what is other, how it judges distance, and how it reconstructs the richly three-dimensional quality of the outside world from what is essentially a two-dimensional snapshot taken by the retina of the eye. Mirrors are applied in medicine to create reflected images of patients' limbs or other body parts and thus trick the brain into healing itself. Mirror therapy has been successful in treating chronic pain and paralysis. In a sense, mirrors are the best 'virtual reality' system that can be built. The object 'inside' the mirror is virtual, but as far as our eyes are concerned, it exists as much as any other object.</p>\n<p><strong>C</strong> Research has shown that mirrors can subtly affect human behaviour, often in surprisingly positive ways. Subjects tested in a room with a mirror have been found to work harder and to be less inclined to cheat, compared with control groups performing the same exercises in non-mirrored settings. In addition, the researchers found that people in a room with a mirror were comparatively less likely to make judgements about others based on negative social stereotypes concerning, for example, sex, race or religion. The researchers said that this indicates that when people are made to be self-aware, they are likelier to stop and think about what they are doing. A by-product of that awareness may be a shift away from acting on autopilot toward more desirable ways of behaving. Physical self-reflection, in other words, encourages philosophical self-reflection — a lesson in the ancient Greek notion that you cannot know or appreciate others until you know yourself.</p>\n<p><strong>D</strong> The link between self-awareness and elaborate sociality may help explain why the few nonhuman species that have been found to recognize themselves in a mirror are those with sophisticated social lives. Animals that live in communal units, such as the great apes – chimpanzees, bonobos, orangutans and gorillas – along with dolphins and Asian elephants, have passed the famed mirror self-recognition test, which means they will, when given a mirror, scrutinize marks that have been applied to their faces or bodies. The animals will also check up on personal cleanliness, inspecting their mouths, nostrils and bodies. Yet not all members of self-reflective species will pass the mirror test. Studies of individual elephants and dolphins raised in isolation suggest that these particular individuals do not exhibit mirror self-recognition.</p>\n<p><strong>E</strong> For that matter, humans do not necessarily see the face in the mirror as it actually is either. What the human eye sees objectively and how the brain interprets that image are not necessarily the same. Dr Nicholas Epley, Professor of Behavioral Science at the University of Chicago, USA, described experiments in which people were asked to pick out pictures of themselves from among pictures of other human faces. Participants identified their personal photographs significantly quicker when their faces had been computer-enhanced to be more appealing and they were likely to call this retouched image their genuine face. This self-delusion is not simply the result of a widespread preference for prettiness: when asked to match photographs of strangers, participants were, in fact, best at spotting unenhanced faces — that is, those not made to look prettier.</p>\n<p><strong>F</strong> How can we be so self-delusional when the truth stares back at us? Dr Epley explains that, although we do indeed see ourselves in the mirror every day, we don't look exactly the same every time. There is the just-out-of-bed morning you, the ready-for-work you, the dressed-for-an-elegant-dinner you. Which image is you? People on average resolve the question of these multiple images of themselves in their favour. That is, they piece together a mental representation formed from different aspects of themselves when they are looking their best.</p>\n<p><strong>G</strong> In a series of other studies, psychologists interviewed people about what they think a mirror shows them. They asked questions like, 'Imagine you are standing in front of a bathroom mirror; how big do you think the image of your face is on the surface? And what will happen to the size of that image if you step steadily backward, away from the glass?' To the first question, people overwhelmingly say 'The outline of my face on the mirror would be pretty much the size of my face. As for the second question, that's obvious: if I move away from the mirror, the size of my image will shrink with each step.' Both answers, it turns out, are wrong. Outline your face on a mirror, and you will find it to be exactly half the size of your real face. Step back as much as you please, and the size of that outlined oval will not change: it remains half the size of your face, even as the background scene reflected in the mirror steadily changes.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-100", "questions", {"questionGroups":[{"groupId":"group-1","kind":"yes_no_not_given","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<ul style=\"list-style: none; padding-left: 0; margin-top: 8px;\">\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> The conflicting nature of mirrors makes them inappropriate aids for investigating human thought.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Humans find it difficult to distinguish between reflections of two- and three-dimensional objects.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Illusions using mirrors can help in the treatment of medical problems.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Mirrors for use in scientific experiments have to be constructed to precise specifications.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-anchor\">\n<h4>Questions 31–34</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>31</strong> If a mirror is present during certain experiments, the subjects tend to</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"><span>A monitor the behaviour of other subjects.</span></label> <label><input name=\"q5\" type=\"radio\" value=\"B\"><span>B act more industriously and independently.</span></label> <label><input name=\"q5\" type=\"radio\" value=\"C\"><span>C become less confident of themselves.</span></label> <label><input name=\"q5\" type=\"radio\" value=\"D\"><span>D focus overwhelmingly on their own reflection.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> Research results imply that physical self-reflection leads people to be</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"A\"><span>A more tolerant of others.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"B\"><span>B more satisfied with their own lives.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"C\"><span>C more open to learning from others.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"D\"><span>D more likely to accept unpopular ideas.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> The successful completion of a well-known mirror test suggests that the animal subjects</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"><span>A find the image in the mirror uninteresting.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"B\"><span>B recognise the basic need for personal cleanliness.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"C\"><span>C realise that the marks they see are on their own body.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"D\"><span>D understand that marks on their face have been made deliberately.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Which of the following is the most suitable title for Reading Passage 3?</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"><span>A Conflicting interpretations of mirror research</span></label> <label><input name=\"q8\" type=\"radio\" value=\"B\"><span>B Psychological responses to mirror images</span></label> <label><input name=\"q8\" type=\"radio\" value=\"C\"><span>C The physical properties of mirrors</span></label> <label><input name=\"q8\" type=\"radio\" value=\"D\"><span>D The use of mirrors through history</span></label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"short_answer","questionIds":["q9","q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-14-anchor\">\n<h4>Questions 35–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–I</strong>, below.</p>\n<div class=\"completion-item\">\n<p><strong>35</strong> Dr Epley found that when identifying images of themselves, people</p>\n<div class=\"drop-target-completion drop-target-summary\" id=\"q9-target\" data-question=\"q9\"></div>\n</div>\n<div class=\"completion-item\">\n<p><strong>36</strong> When trying to identify images of unfamiliar individuals, Dr Epley found that people most frequently</p>\n<div class=\"drop-target-completion drop-target-summary\" id=\"q10-target\" data-question=\"q10\"></div>\n</div>\n<div class=\"completion-item\">\n<p><strong>37</strong> Dr Epley says that a single objective reflection is impossible because people</p>\n<div class=\"drop-target-completion drop-target-summary\" id=\"q11-target\" data-question=\"q11\"></div>\n</div>\n<div class=\"completion-item\">\n<p><strong>38</strong> Dr Epley says that when forming an opinion of how they think they look, people</p>\n<div class=\"drop-target-completion drop-target-summary\" id=\"q12-target\" data-question=\"q12\"></div>\n</div>\n<div class=\"completion-item\">\n<p><strong>39</strong> When guessing the size of their mirrored face from close up, people</p>\n<div class=\"drop-target-completion drop-target-summary\" id=\"q13-target\" data-question=\"q13\"></div>\n</div>\n<div class=\"completion-item\">\n<p><strong>40</strong> As they imagine stepping backwards from a mirror, people</p>\n<div class=\"drop-target-completion drop-target-summary\" id=\"q14-target\" data-question=\"q14\"></div>\n</div>\n<div id=\"word-options\">\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"A\"><strong>A</strong> believe they can improve their looks by being friendly.</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"B\"><strong>B</strong> are confronted daily with their images in a variety of situations.</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"C\"><strong>C</strong> assume their image will get progressively smaller.</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"D\"><strong>D</strong> recognise familiar faces much more readily.</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"E\"><strong>E</strong> estimate the image to be larger than it actually is.</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"F\"><strong>F</strong> select those photographs which have not been altered.</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"G\"><strong>G</strong> find there is little change in the image they face.</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"H\"><strong>H</strong> locate the photographs faster if they are made to look attractive.</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"I\"><strong>I</strong> create a positive generalised self-image.</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-12", "answers", {"answerKey":{"q1":"NO","q2":"NO","q3":"YES","q4":"YES","q5":"NOT GIVEN","q6":"D","q7":"B","q8":"B","q9":"A","q10":"G","q11":"F","q12":"B","q13":"A","q14":"C"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-12", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-12","meta":{"title":"Humanities and the health professional 人文医学","category":"P3","frequency":"low","pdfFilename":"109. P3 - Humanities and the health professional 人文医学.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/109. P3 - Humanities and the health professional 人文医学/","legacyFilename":"109. P3 - Humanities and the health professional 人文医学.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/109. P3 - Humanities and the health professional 人文医学/109. P3 - Humanities and the health professional 人文医学.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/109. P3 - Humanities and the health professional 人文医学/109. P3 - Humanities and the health professional 人文医学.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-11T14:43:22.010Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-12", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Humanities and the health professional</h3>\n<h4>Professor Jock Murray from Dalhousie Medical School in Canada writes about the role of humanities in the education of health professionals</h4>\n<p>In a recent meeting with health professionals from many disciplines, the concept of the humanities and how they enrich the lives and practice of physicians was discussed. There were nurses, chiropractors, speech therapists, health administrators and professionals from a dozen other fields. Everyone commented on the need to achieve a balance between the humanities and the skills and technological expertise of their specific discipline, beginning with the experience in medical school and then life in their chosen specialisation, to create fully realised professionals. The purpose of my discussion here is to advocate a balanced approach to the education of all health professionals.</p>\n<p>I believe that most people wish to see in their medical professional a person who not only brings excellent skills, techniques and treatments, but also personal qualities that show they are fully developed individuals. Such individuals are sensitive, communicative, and understanding of the human condition. They acknowledge the vast array of backgrounds, views, fears and hopes each person brings to the clinical encounter.</p>\n<p>The training of health professionals has usually been exemplary in teaching them to recognise and treat a symptom or disease, but often less attentive to the broad education that would inform and educate them about the persons who come from various cultures, backgrounds and experiences. Such understanding does not come from the course textbooks but from literature, history, poetry, art and other aspects of the humanities.</p>\n<p>There are two sides to the healing profession, once described as the art and the science of medical practice. It is evident, however, that most educational programmes emphasise knowledge, clinical skill and competence, and although educators wish the person to be humanistic, empathetic and communicative, they take this aspect for granted, as if valuable educational time does not need to be allocated to this 'soft' feature of the profession. It is compounded by the recognition that this aspect is harder to define and measure than knowledge and competence. We may want the health professional to understand many elements of the human condition so they can understand, assess and manage the suffering of patients, but it is harder to design and teach such a course than one on anatomy, for example. Developing a humanities programme in professional education refocuses attention on what everyone recognises as important. Rather than take humanities education for granted, it becomes a direct part of the programme. This signals that the school takes it seriously and encourages activities related to the broad area of the humanities.</p>\n<p>Distinguished by their focus on human values, the humanities cover many areas, including history, ethics, literature, theology, art, music, law and the social sciences as they apply to the profession. For example, a history of the profession gives us an understanding of how we have come to be where we are, and how things change and progress. Literature can teach us about human hopes and aspirations, suffering and loss, relationships, and life and death. Emphasis on human values is important in this day and age as we are increasingly at risk of being overwhelmed by more emotionless technology and complex bureaucracy.</p>\n<p>In medical education during the 18th and 19th centuries, there was an emphasis on the humanities. As time went on, encouraged by increasing interest in medical sciences, laboratory experiments and technological aspects of the profession, emphasis in medical studies was weighted towards courses in the sciences. The Flexner Report in 1910 recognised the variable quality of medical education and the need to have better teaching in the medical sciences and laboratory methods. This resulted in a pendulum swing in emphasis, directing the curriculum to the medical sciences, to the exclusion of the humanities, an imbalance never intended by Flexner.</p>\n<p>Currently at Dalhousie Medical School we have elective programmes in the humanities, summer research studentships, lecture series, presentations and discussions. There is an artist-in-residence programme that brings artists to the school. There is a large choir of over a hundred students and faculty, a concert band, a string ensemble, and groups of student artists who put on regular performances and exhibitions. The list of activities is much longer, but it should be pointed out that these provide some balance and broaden the life and learning of the student.</p>\n<p>Perhaps more important than the activities themselves is the change in mind-set that occurs when students see that diversity in their studies and activities is legitimised and encouraged. We emphasise that we want students and faculty to continue to express interests and talents they had before entering medical school. They now come forward with ideas and activities that are more imaginative and exciting than we could have designed. They also comment that the humanities has made medical school a more enjoyable and fulfilling experience. Students see that their learning and their lives can be more balanced, making them better equipped to care for their patients.</p>\n<p>Will involvement in the humanities make one a better health professional? It's a question often asked of today's medical professionals but very difficult to document in this evidence-based era of medicine. But as ethics scholars have said of learning ethics, it cannot guarantee that a person will be more ethical, but it is more likely than not. My firm belief is that all the healing professions should increase the balance of humanities with the traditional educational emphasis on skills and knowledge, and this will benefit both the healers and those who need to be healed.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-12", "questions", {"questionGroups":[{"groupId":"group-1","kind":"yes_no_not_given","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 27–31 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> An approach that incorporates the humanities is more important for some medical disciplines than others.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Most people value medical expertise over sensitivity in their medical professionals.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Most medical programmes devote little course time to developing interpersonal skills.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> It is more difficult to design a humanities course for health professionals than a medical one.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> It would be best if a medical programme included a course about the lives of medical professionals.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>32</strong> What unforeseen result did the Flexner report have?</p>\n<div class=\"radio-options column\">\n<label><input name=\"q6\" type=\"radio\" value=\"A\"> <strong>A</strong> It caused the public to distrust the quality of medical education.</label> <label><input name=\"q6\" type=\"radio\" value=\"B\"> <strong>B</strong> It caused a dramatic increase in medical-school applicants.</label> <label><input name=\"q6\" type=\"radio\" value=\"C\"> <strong>C</strong> It started a fierce debate over proper laboratory methods.</label> <label><input name=\"q6\" type=\"radio\" value=\"D\"> <strong>D</strong> It moved the focus of medical studies away from the humanities.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> The writer lists humanities activities at Dalhousie Medical School to show how these activities</p>\n<div class=\"radio-options column\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"> <strong>A</strong> have become the most popular events on campus.</label> <label><input name=\"q7\" type=\"radio\" value=\"B\"> <strong>B</strong> widen students' educational experiences.</label> <label><input name=\"q7\" type=\"radio\" value=\"C\"> <strong>C</strong> are of as high a quality as medical ones.</label> <label><input name=\"q7\" type=\"radio\" value=\"D\"> <strong>D</strong> have gained acceptance with teaching staff.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> How do students at Dalhousie Medical School react to humanities activities?</p>\n<div class=\"radio-options column\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"> <strong>A</strong> They have difficulty letting go of the mind-set that scientific knowledge is more legitimate.</label> <label><input name=\"q8\" type=\"radio\" value=\"B\"> <strong>B</strong> They report feeling that medical school has become more engaging and satisfying.</label> <label><input name=\"q8\" type=\"radio\" value=\"C\"> <strong>C</strong> They have started to transfer creative ideas to their scientific and laboratory studies.</label> <label><input name=\"q8\" type=\"radio\" value=\"D\"> <strong>D</strong> They have trouble connecting to talents they had valued before entering medical school.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> What is the writer's main conclusion?</p>\n<div class=\"radio-options column\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"> <strong>A</strong> Greater emphasis on humanities in medical schools will benefit both patients and practitioners.</label> <label><input name=\"q9\" type=\"radio\" value=\"B\"> <strong>B</strong> Medical schools are not adequately preparing students to become balanced medical professionals.</label> <label><input name=\"q9\" type=\"radio\" value=\"C\"> <strong>C</strong> Creating a humanities programme in a medical school is an overwhelmingly difficult but necessary task.</label> <label><input name=\"q9\" type=\"radio\" value=\"D\"> <strong>D</strong> Medical schools should return to the early-twentieth-century model of medical education.</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"matching","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–G</strong>, below.</p>\n<p><em>Write the correct letter, <strong>A–G</strong>, in boxes 36–40 on your answer sheet.</em></p>\n<div class=\"question-item\">\n<div class=\"match-question-item\">\n<p><strong>36</strong> Health professionals at a recent seminar discussed a need for educational institutions to</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"match-question-item\">\n<p><strong>37</strong> Most medical training programmes</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"match-question-item\">\n<p><strong>38</strong> The interpersonal and behavioural aspects of medical practice</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"match-question-item\">\n<p><strong>39</strong> Dalhousie Medical School students and faculty</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"match-question-item\">\n<p><strong>40</strong> Modern evidence-based practitioners</p>\n<div class=\"match-dropzone\" data-question=\"q14\"></div>\n</div>\n</div>\n<div class=\"options-pool\" id=\"endings-options-pool\">\n<strong>List of Endings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\"><strong>A</strong> generate innovative and creative suggestions for activities and programmes.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\"><strong>B</strong> are difficult to describe with any precision.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\"><strong>C</strong> find it difficult to prove statistically the benefits of humanities programmes.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\"><strong>D</strong> suggest that humanities studies create stronger practitioners.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\"><strong>E</strong> rely on course textbooks to teach humanities.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\"><strong>F</strong> give less attention to broad education and more to recognising and treating symptoms.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\"><strong>G</strong> provide more equal coverage of both medical knowledge and skills, and humanities.</div>\n</div>\n</div>\n</div>","allowOptionReuse":false}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-151", "answers", {"answerKey":{"q1":"A","q2":"C","q3":"E","q4":"H","q5":"B","q6":"personality","q7":"sporting","q8":"an outsider","q9":"timelessness","q10":"D","q11":"C","q12":"D","q13":"B","q14":"A"}});
+})(typeof window !== "undefined" ? window : globalThis);
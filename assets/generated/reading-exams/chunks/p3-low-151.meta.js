@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-151", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-151","meta":{"title":"Book Review The Discovery of Slowness 富兰克林(慢的发现)","category":"P3","frequency":"low","pdfFilename":"61. P3 - Book Review The Discovery of Slowness 富兰克林(慢的发现).pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/61. P3 - Book Review The Discovery of Slowness 富兰克林(慢的发现)/","legacyFilename":"61. P3 - Book Review The Discovery of Slowness 富兰克林(慢的发现).html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/61. P3 - Book Review The Discovery of Slowness 富兰克林(慢的发现)/61. P3 - Book Review The Discovery of Slowness 富兰克林(慢的发现).html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/61. P3 - Book Review The Discovery of Slowness 富兰克林(慢的发现)/61. P3 - Book Review The Discovery of Slowness 富兰克林(慢的发现).pdf","ieltsHtml":"IELTS/P3/Book Review The Discovery of Slowness.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.771Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
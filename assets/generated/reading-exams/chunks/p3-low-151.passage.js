@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-151", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Book Review: The Discovery of Slowness by Sten Nadolny</h3>\n<p><strong>A</strong> The English explorer and writer John Franklin (1786–1847) joined the Navy at the age of 14, and fought at the battle of Trafalgar. When peace came, he turned his attention to Arctic exploration, and in particular to solving the conundrum of the Northwest Passage, a mythical clear-water route through the ice which would, if it existed, link the Pacific Ocean on America's West Coast with the Atlantic on its East. The first expedition Franklin led to the Arctic was an arduous overland journey lasting from 1819 to 1822, in which he and his twenty-strong team covered 8,880 kilometres on foot. Their expedition was a triumph of surveying – they managed to chart hundreds of kilometres of previously unknown coastline – but food ran out on their journey back to civilisation, and the men were forced to eat their belts and their boots (which they boiled up to make leather soup).</p>\n<p><strong>B</strong> There followed a career as a travel writer and public speaker ('the man who ate his boots' was Franklin's tag-line). Then in 1845, Franklin set off back to the Arctic with two ships – the Erebus and the Terror – and 129 men. Nothing was heard of them for 14 years, although more than 30 expeditions were dispatched in search of them. Eventually it was discovered that Franklin and all his team had perished after their ships were trapped in the ice.</p>\n<p><strong>C</strong> In his personal correspondence and published memoirs, Franklin comes across as a man dedicated to the external duties of war and exploration, who kept introspection and self-analysis to a minimum. His blandness makes him an amenably malleable subject for a novelist, and Sten Nadolny has taken full advantage of this in his book. Most important, Nadolny has endowed John Franklin with a defining trait for which there is no historical evidence: Langsamkeit (‘slowness', or 'calmness').</p>\n<p><strong>D</strong> Slowness influences not only Franklin's behaviour, but also his vision, his thought and his speech. The opening scene of The Discovery of Slowness depicts Franklin as a young boy, failing to catch a ball because his reaction time is too slow. Despite the bullying of his peers, Franklin resolves not to fall into step with ‘their way of doing things'. For Nadolny, Franklin's fascination with the Arctic stems from his desire to find an environment suited to his peculiar slowness. He describes Franklin as a boy dreaming of the 'time without hours and days' which exists in the far north, a place ‘where nobody would find him too slow'.</p>\n<p><strong>E</strong> Ice is a slow mover. The compressed blue ice inside an Alpine crevasse will have fallen as snow several decades earlier. Polar pack ice takes at least two years to form. The film of crystals which first appears on the surface of the sea thickens into a silkily pliant layer called nilas; this in turn consolidates into young ice, which then deepens during several seasons to become pack. Ice demands a corresponding patience from those who venture onto it. The explorers who have thrived at high latitudes and at high altitudes haven't usually been men of great speed. They have tended instead to demonstrate unusual self-possession, a considerable capacity for boredom, and a talent for the uncomplaining endurance of suffering.</p>\n<p><strong>F</strong> These were all qualities which the historical Franklin possessed in abundance, and so Nadolny's exaggeration of them isn't unreasonable. Even as an adult, Franklin's slowness of thought means that he is unable to speak fluently, so he learns by heart ‘entire fleets of words and batteries of responses', and speaks a languid, bric-à-brac language. In the Navy, his method of thinking first and acting later initially provokes mockery from his fellow sailors. But Franklin persists in doing things his way, and gradually earns the respect of those around him. To a commodore who tells him to speed up his report of an engagement, he replies: ‘When I tell something, sir, I use my own rhythm.' A lieutenant says approvingly of him: ‘Because Franklin is so slow, he never loses time.'</p>\n<p><strong>G</strong> Nadolny also brings his central metaphor of slowness to bear on the novel's language. The chapters describing Franklin's early years are a medley of separate fragments, rhetorical questions, associative jumps and exclamation marks. In the later sections recounting Franklin's first Arctic expedition, Nadolny brilliantly sets the narrative pace to the rhythms of the frozen landscape, and to the 'slowness which is bred by hunger'.</p>\n<p><strong>H</strong> Since it was first published in Germany in 1983, The Discovery of Slowness has sold more than a million copies and been translated into 15 languages. It has been adopted as a manual and manifesto by European pressure groups and institutions representing causes as diverse as sustainable development, management science and motoring policy, even becoming involved in the debate about speed limits on German roads. The various groups that have taken the novel up have one thing in common: a dislike of the high-speed culture of Post-modernity. Nadolny's Franklin appeals to them because he is immune to 'the compulsion to be constantly occupied', and to the idea that 'someone was better if he could do the same thing fast'. It's easy to see where the attraction lies for those in management. The novel is crammed with quotations about time-efficiency, punctiliousness and profitability: ‘What did “too late” mean? They hadn't waited for it long enough, that's what it meant.'</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-151", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Reading Passage 3 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 250px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>27</strong> a summary of Franklin's occupation in the period before his first expedition</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>28</strong> a reference to a feature of Franklin's character in Nadolny's novel that has no definite basis in fact</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>29</strong> a connection between the central theme of the novel and an environmental process</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>30</strong> a reference to the widespread appeal of Nadolny's novel</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>31</strong> a summary of events following Franklin's return from his first expedition</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Complete the summary using the list of words, <strong>A–L</strong>, below.</p>\n<div class=\"summary-text\">\n<h4>John Franklin and the Quality of Slowness</h4>\n<p>\nLittle is known from Franklin's correspondence and published writings about his <strong>32</strong> <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span>. The author, Nadolny, suggests that Franklin's whole life can be explained by the quality of ‘slowness'. He begins the book by showing how this affects the young Franklin's <strong>33</strong> <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> activities, and makes him become <strong>34</strong> <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span>. As a child, it is the quality of <strong>35</strong> <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span> that attracts Franklin to the Arctic.\n</p>\n</div>\n<div id=\"word-options\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"a bully\">A a bully</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"discoveries\">B discoveries</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"educational\">C educational</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"family\">D family</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"isolation\">E isolation</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"an outsider\">F an outsider</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"personality\">G personality</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"problems\">H problems</div>\n<div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-word=\"remoteness\">I remoteness</div>\n<div id=\"word-J\" class=\"draggable-word\" draggable=\"true\" data-word=\"a scholar\">J a scholar</div>\n<div id=\"word-K\" class=\"draggable-word\" draggable=\"true\" data-word=\"sporting\">K sporting</div>\n<div id=\"word-L\" class=\"draggable-word\" draggable=\"true\" data-word=\"timelessness\">L timelessness</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"single_choice","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"mcq-question\" style=\"margin-bottom: 20px;\">\n<p><strong>36</strong> In paragraph E, the writer describes different types of ice in order to illustrate</p>\n<ul class=\"mcq-options\">\n<li><label><input type=\"radio\" name=\"q10\" value=\"A\"> A the extreme conditions that Polar explorers have to face.</label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"B\"> B the unusual quality of the beauty of Polar regions.</label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"C\"> C the vital importance of preserving the Arctic environment.</label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"D\"> D the personal qualities required of an explorer in Arctic conditions.</label></li>\n</ul>\n</div>\n<div class=\"mcq-question\" style=\"margin-bottom: 20px;\">\n<p><strong>37</strong> What is said about the way Franklin communicates?</p>\n<ul class=\"mcq-options\">\n<li><label><input type=\"radio\" name=\"q11\" value=\"A\"> A He expresses a very limited range of ideas.</label></li>\n<li><label><input type=\"radio\" name=\"q11\" value=\"B\"> B He is only willing to discuss things he is familiar with.</label></li>\n<li><label><input type=\"radio\" name=\"q11\" value=\"C\"> C He uses words and phrases that he has previously memorised.</label></li>\n<li><label><input type=\"radio\" name=\"q11\" value=\"D\"> D He is only fluent when talking about naval matters.</label></li>\n</ul>\n</div>\n<div class=\"mcq-question\" style=\"margin-bottom: 20px;\">\n<p><strong>38</strong> How does the attitude of the other sailors change towards Franklin?</p>\n<ul class=\"mcq-options\">\n<li><label><input type=\"radio\" name=\"q12\" value=\"A\"> A They no longer notice his slowness.</label></li>\n<li><label><input type=\"radio\" name=\"q12\" value=\"B\"> B They start to copy his approach to work.</label></li>\n<li><label><input type=\"radio\" name=\"q12\" value=\"C\"> C They begin to recognise his efforts to overcome his problems.</label></li>\n<li><label><input type=\"radio\" name=\"q12\" value=\"D\"> D They eventually appreciate his good qualities.</label></li>\n</ul>\n</div>\n<div class=\"mcq-question\" style=\"margin-bottom: 20px;\">\n<p><strong>39</strong> The chapters of The Discovery of Slowness which describe Franklin's early years contain</p>\n<ul class=\"mcq-options\">\n<li><label><input type=\"radio\" name=\"q13\" value=\"A\"> A text from a wide variety of sources.</label></li>\n<li><label><input type=\"radio\" name=\"q13\" value=\"B\"> B short, disconnected pieces of text.</label></li>\n<li><label><input type=\"radio\" name=\"q13\" value=\"C\"> C descriptions of the Arctic landscape.</label></li>\n<li><label><input type=\"radio\" name=\"q13\" value=\"D\"> D information about other explorers like Franklin.</label></li>\n</ul>\n</div>\n<div class=\"mcq-question\">\n<p><strong>40</strong> The Discovery of Slowness has achieved widespread popularity because</p>\n<ul class=\"mcq-options\">\n<li><label><input type=\"radio\" name=\"q14\" value=\"A\"> A it reflects many people's concern about one aspect of modern life.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"B\"> B it offers achievable solutions to many of the problems of today.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"C\"> C it tells the story of someone's triumph over personal problems.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"D\"> D it shows how life in the past was less pressured than it is now.</label></li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
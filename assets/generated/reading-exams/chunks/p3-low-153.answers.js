@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-153", "answers", {"answerKey":{"q1":"C","q2":"D","q3":"A","q4":"B","q5":"C","q6":"YES","q7":"NO","q8":"YES","q9":"NOT GIVEN","q10":"NO","q11":"F","q12":"C","q13":"A","q14":"D"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-153", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-153","meta":{"title":"Crossing the Threshold 奥克兰美术馆","category":"P3","frequency":"low","pdfFilename":"63. P3 - Crossing the Threshold 奥克兰美术馆.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/63. P3 - Crossing the Threshold 奥克兰美术馆/","legacyFilename":"63. P3 - Crossing the Threshold 奥克兰美术馆.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/63. P3 - Crossing the Threshold 奥克兰美术馆/63. P3 - Crossing the Threshold 奥克兰美术馆.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/63. P3 - Crossing the Threshold 奥克兰美术馆/63. P3 - Crossing the Threshold 奥克兰美术馆.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.774Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-153", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Crossing the Threshold</h3>\n<h4>The renovated Auckland Art Gallery in New Zealand unites old and new, creating an irresistible urge to step inside</h4>\n<p>Architects are finding it very difficult in today's cultural landscape. The profession faces a three-way threat: a public that apparently doesn't understand what architects do, developers who couldn't care less what they do, and overbearing councils micromanaging every single aspect of what they do. According to sources within the architectural profession, the situation is much worse when architects work on municipal buildings, as architects FJMT and Archimedia discovered with their Auckland Gallery makeover, where a vast number of external pressures threatened the project, and with so many bureaucratic difficulties it looked doomed to fail.</p>\n<p>The major challenge of the gallery renovation project was that it involved two parts. The first was to restore the heritage building, dating back to 1888, which contained a network of small spaces, refurbished so often it contained 17 different floor heights. The second was to deliver a new extension that would not only double floor and exhibition space but also attract new patrons, a total necessity. While the old building's circulation was off-putting, so was something intangible yet just as powerful: its atmosphere. For many, Auckland Art Gallery was just an old building that served a limited range of patrons with highbrow interests, missing its chance to engage with new audiences.</p>\n<p>A 2003 survey of young people's impressions of the gallery confirmed this opinion, sounding more like references to an abandoned building. For the survey authors, ‘threshold fear' – where certain groups are intimidated from entering certain spaces by their off-putting atmosphere – was the institution's undoing, something no architect wants anything to do with. For those young people Auckland Art Gallery was undemocratic, ‘dusty' and 'cold' – the epitome of threshold fear. Also, 16 % of the sample group had no idea where it even was, despite being interviewed on the pavement right outside it. Clearly, the gallery was fatally out of step at a time when New Zealand's national museum in Wellington was successfully engaging broader audiences with contemporary branding and marketing, interactive displays and temporary events.</p>\n<p>The decision to evolve the gallery was actually made in 2000, although it took eight years for building to commence, as the architects fought off heritage committees and conservationists trying to stop them. The architects were not just dealing with a disillusioned public, but also with precious timber and the parkland which surrounds the building. Pushing the design through the Environment Court, the body which approves renovations of this scale, alone took three years. During this time the budget blew out by several million dollars, the funding dried up, and the new wing had to be completely redesigned. Even after the redesign, the use of kauri timber, with its significance to New Zealand's Māori* people, stirred up political debate. In the new building the architects have used kauri to produce a canopy with a curving interior roof supported by tapered, steel columns, also clad in kauri. The canopy represents a stag in full public face, its curvature filtering light to the forecourt to the west and creating a visual echo of the canopy of pohutukawa trees in Albert Park to the east. The park also has cultural significance to Māori as it was the site of early settlements.</p>\n<p>The connection is reinforced by sculptures from Māori artist Arnold Wilson decorating the columns, while fellow artist Bernard Makoare was a consultant, ensuring the gallery emphasised Māori beliefs. Still that didn't stop the conservationist Stephen King from accusing the architects of \"throwing\" kauri at a “mediocre building” and of misappropriating the ‘mana' (spiritual energy) of the precious material (which is almost extinct: harvesting of both petrified and swamp kauri has been likened to a gold rush). However, the kauri that was used here was from the forest floor, and King's misconceptions sum up the prejudice that surrounded the project.</p>\n<p>Objections also came from the Auckland Regional Council, worrying about the extension's impact on Albert Park, yet the project's relationship with parkland is one of the most successful outcomes. Impact is not only minimal, but improves the park's social function. The extension's enormous glass atrium opens up the building by directing the gaze from street level to the parkland beyond, while inside, the new art space is fronted along the east by a continuous glass wall incorporating the park into the gallery. The glass becomes a ‘screen' for viewing the outside world and makes the art accessible to those in the park, a far cry from both ‘white cube' galleries worldwide – the plain boxes where paintings are hung in antiseptic white surroundings – and also the dusty, impermeable Auckland Gallery of old.</p>\n<p>Another success is the refurbishment of the heritage building, especially the Mackelvie Gallery, in disrepair after its characteristic early-twentieth-century Edwardian decoration had been stripped out or walked away in previous renovations. Remarkably, the Mackelvie space has been reconstructed from two old photos, although the problem of multiple floor levels was so serious that scaffolding had to be erected at the highest level, with work progressing downwards, the reverse of normal practice. When it was over, a fascinating detail was retained: the lowest level visible under glass embedded in the new floor. The building itself is artwork, while elsewhere columns from the old gallery have been exposed in the walls of the new wing.</p>\n<p>In 2008 the gallery averaged just 190,000 visitors annually. After reopening, it had 300,000 in five months. Cynics will chalk that up to novelty of the new, but the fact is the gallery is now an alluring cultural space which is crawling with young people.</p>\n<p><sub>*Māori: an indigenous people who were already living in New Zealand when Europeans arrived</sub></p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
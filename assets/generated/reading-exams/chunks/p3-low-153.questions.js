@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-153", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> What is the writer's main point in the first paragraph?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A Criticism of architects by different groups is unfair.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B The architectural profession is generally well respected.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C The most difficult projects for architects are public buildings.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D Failure to deliver buildings is a result of poor communication.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> The Auckland Gallery project was particularly difficult because</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A the existing building was old and parts of it had fallen down.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B there was a high number of floors in the building.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C it needed to satisfy the requirements of the existing patrons.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D it involved renovating the existing building and adding a new one.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> What disturbing information did the architects find out from the survey of young people?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A They did not visit the gallery because of the way it made them feel.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B They thought that the gallery buildings were not in use.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C The gallery had the reputation of being dirty.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D They did not like the entrance.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What point is the writer making when he says that 16 % of the sample group did not know where the museum was?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A Young people are not interested in galleries.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B The gallery was not reaching out to involve young people.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C The entrance to the gallery was not well signposted.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D The location of the gallery was difficult to access.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> Māori artists were used on this project to</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q5\" type=\"radio\" value=\"A\"> A satisfy the concerns of conservationists.</label></li>\n<li><label><input name=\"q5\" type=\"radio\" value=\"B\"> B protect sacred materials in the Albert Park site.</label></li>\n<li><label><input name=\"q5\" type=\"radio\" value=\"C\"> C make sure the gallery respects Māori culture.</label></li>\n<li><label><input name=\"q5\" type=\"radio\" value=\"D\"> D ensure that certain sources of kauri were not used.</label></li>\n</ul>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"yes_no_not_given","questionIds":["q6","q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-10-anchor\">\n<h4>Questions 32–36</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 32–36 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>32</strong> Before the renovation, the Auckland Art Gallery was regarded as an elitist institution.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Stephen King's intervention in the project shows his understanding of the architects' use of kauri.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> The way the building interacts with its surroundings is a triumph.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> The glass screen along the east wall was one of the most costly items in the rebuild.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> The design of the extension to the Auckland Art Gallery is similar to the design of 'white cube' galleries in other parts of the world.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"sentence_completion","questionIds":["q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–F</strong>, below.</p>\n<p>Write the correct letter, <strong>A–F</strong>, in boxes 37–40 on your answer sheet.</p>\n<ul class=\"sentence-ending-options\">\n<li>resulted in work being done in the opposite direction to that usually followed.</li>\n<li>is more than cosmetic and has improved the circulation.</li>\n<li>was the clue to rebuilding the Mackelvie Gallery successfully.</li>\n<li>has resulted in the building itself becoming a work of art.</li>\n<li>means that you should be able to tell whether you are in the old wing or the new one.</li>\n<li>was the result of earlier attempts to modernise the building.</li>\n</ul>\n<div class=\"question-item\"><strong>37</strong> The destruction of Edwardian ornamentation <input type=\"text\" id=\"q37_input\" maxlength=\"1\" name=\"q11\"></div>\n<div class=\"question-item\"><strong>38</strong> It is extraordinary that a limited number of photographs <input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\"></div>\n<div class=\"question-item\"><strong>39</strong> The problem of having so many floor levels to deal with <input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\"></div>\n<div class=\"question-item\"><strong>40</strong> The glass flooring in the Mackelvie Gallery which reveals old features <input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"></div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
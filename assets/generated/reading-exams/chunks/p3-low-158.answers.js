@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-158", "answers", {"answerKey":{"q1":"C","q2":"D","q3":"D","q4":"A","q5":"B","q6":"YES","q7":"NO","q8":"NOT GIVEN","q9":"NOT GIVEN","q10":"E","q11":"A","q12":"D","q13":"C","q14":"B"}});
+})(typeof window !== "undefined" ? window : globalThis);
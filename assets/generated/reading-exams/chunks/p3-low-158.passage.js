@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-158", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>Game theory</h3>\n<h4>Computer software that models human behaviour can make forecasts, outsmart rivals and transform negotiations</h4>\n<p>According to game theory, our chances of success in negotiations are based on the choices of others. Computer models have been developed to work out how events will unfold as people and organisations act in what they perceive to be their own best interests. Numerical values are placed on the goals, motivations and influence of players, and likely options are considered. Game-theory software then evaluates the ability of each of those players to influence others, and hence predicts the course of events.</p>\n<p>Although many individuals would feel uncomfortable having a computer make decisions for them, many organisations run such computer simulations for law firms, companies and governments. But feeding software with accurate data on all the players involved is especially tricky for political matters. Reinier van Oosten of Decide, a Dutch firm that models political negotiations, notes that predictions may become unreliable when people unexpectedly give in to 'non-rational emotions', such as hatred, rather than pursuing what is apparently in their best interests. However, sorting out people's motivations is much easier when making money is the main object. Accordingly, modelling behaviour using game theory is proving especially useful when applied to economics.</p>\n<p>Using game-theory software to model auctions can be very lucrative. Consulting firms are entering the market to help clients design profitable auctions, or to win them less expensively. In 2006, in the run-up to an online auction of radio-spectrum licences by America's Federal Communications Commission, Dr Paul Milgrom, a consultant and Stanford University professor in the United States, customised his game-theory software to assist a consortium of bidders. He was apprehensive at first, but the result was a triumph. When the auction began, Milgrom's software tracked competitors' bids to estimate their budgets for the 1,132 licences on offer. Crucially, the software estimated the secret values bidders placed on specific licences, and determined that certain big licences were being over-valued. Milgrom's clients were then directed to obtain a collection of smaller, less-expensive licences instead. Two of his clients paid about a third less than their competitors for an equivalent amount of spectrum, saving almost $1.2 billion. Such a saving makes one wonder why everyone isn't using game-theory software. And, if they were, how would that affect the game?</p>\n<p>PA Consulting, a British firm, designs models for software based on game theory to help its clients solve specific problems in areas from pharmaceuticals to the production of television shows. British government agencies have asked PA Consulting to build models to test zoning rules that govern how many of a certain type of business should be allowed to operate in one area. To give a simple example: if two competing ice-cream sellers share a long beach, they will set up stalls back-to-back in the middle and stay put, explains Dr Stephen Black, a modeller for PA. Unfortunately for potential customers at the far ends of the beach, each seller prevents the other from relocating—no other spot would be closer to more people. Introduce a third seller, however, and the stifling equilibrium is broken as relocations and pricing changes energise the market. By studying a chain of events such as this, software designers can assess the effect of change and see the patterns in possible outcomes that may occur. As a result, the use of modelling makes clients more inclined to look at future repercussions when making business decisions, Black says.</p>\n<p>Where is all this heading? Alongside the increasingly elaborate modelling software, there are also efforts to develop software that can assist in negotiation and mediation. Two decades ago, Dr Clara Ponsatí, a Spanish academic, came up with a clever idea. She accepted that, as negotiators everywhere know, the first side to disclose the maximum amount that it is willing to pay loses considerable bargaining power. Without leverage, it can be pushed backward in the bargaining process by a clever opponent. But if neither side reveals the concessions it is prepared to make, negotiations can become very slow or collapse. However, difficult negotiations can often be pushed along by neutral mediators, especially if they are entrusted with the secret bottom lines of all parties. Ponsatí's idea was that if a human mediator was not trusted, affordable or available, a computer could do the job instead. Negotiating parties would update the software with the confidential information on their bargaining positions after each round of talks. Once positions on both sides were no longer mutually exclusive, the software would be used to split the difference and propose an agreement. Ponsatí, now head of the Institute of Economic Analysis at the Autonomous University of Barcelona in Spain, says such ‘mediation machines' could be employed to push negotiations forward by unlocking information that would otherwise be withheld from an opponent.</p>\n<p>Could mediation which has been achieved using software based on game theory spread from auction bids and utility pricing to resolving political and military disputes? Today's game-theory software is not yet sufficiently advanced to mediate between warring countries. But one day opponents on the brink of war might be tempted to use it to exchange information without having to engage in conflict. According to some game theorists, opponents could learn how a war would turn out, skip the fighting and strike a deal. Over-optimistic, perhaps—but game theorists do have rather an impressive track record when it comes to predicting the future.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-158", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter A, B, C or D.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> What does the writer suggest about game-theory software in the first paragraph?</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A Traditional negotiating practices should be used to supplement the software.</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B Success of the software depends on the accuracy of the assigned values.</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C This software anticipates the outcome of future events.</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D Future business negotiations will be dominated by this software.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Reinier van Oosten says predicting what people will do works best if</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A participants are honest about how they feel.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B there is a good understanding of the client's culture.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C people strongly dislike the other party.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D profit is the primary motivator.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> After using game-theory software in 2006, Dr Milgrom instructed his clients to</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A buy big licences.</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B negotiate with the other parties directly.</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C make one big offer at the end of the auction.</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D purchase a mix of licences.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> The writer refers to Stephen Black's ice-cream-seller example in order to</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A show the impact new competitors have on business.</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B highlight the importance of location on business success.</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C demonstrate that businesses must follow a strategy.</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D clarify how pricing affects sales.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> Ponsatí believes business negotiations are more likely to progress if</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"> A a solution is proposed by one of the interested parties.</label> <label><input name=\"q5\" type=\"radio\" value=\"B\"> B mediators or computers take over the bargaining process.</label> <label><input name=\"q5\" type=\"radio\" value=\"C\"> C both parties follow the rules of negotiating.</label> <label><input name=\"q5\" type=\"radio\" value=\"D\"> D sufficient time is allowed for the bargaining process.</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"yes_no_not_given","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>Write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>32</strong> Game-theory software may be unhelpful when dealing with political issues.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Dr Milgrom was confident about applying his software to an auction in 2006.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Dr Ponsatí believes ‘mediation machines' are an inappropriate method of negotiation in areas other than business.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Military organisations refuse to accept that software based on game theory could prevent wars.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"single_choice","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A-F</strong>, below.</p>\n<div class=\"question-item\">\n<p><strong>36</strong> According to Reinier van Oosten, game-theory software fails when</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q10\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q10\" type=\"radio\" value=\"C\"> C</label> <label><input name=\"q10\" type=\"radio\" value=\"D\"> D</label> <label><input name=\"q10\" type=\"radio\" value=\"E\"> E</label> <label><input name=\"q10\" type=\"radio\" value=\"F\"> F</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> Dr Milgrom's software is successful in detecting if</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q11\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q11\" type=\"radio\" value=\"C\"> C</label> <label><input name=\"q11\" type=\"radio\" value=\"D\"> D</label> <label><input name=\"q11\" type=\"radio\" value=\"E\"> E</label> <label><input name=\"q11\" type=\"radio\" value=\"F\"> F</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> Dr Black's game-theory software is a helpful tool when</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q12\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q12\" type=\"radio\" value=\"C\"> C</label> <label><input name=\"q12\" type=\"radio\" value=\"D\"> D</label> <label><input name=\"q12\" type=\"radio\" value=\"E\"> E</label> <label><input name=\"q12\" type=\"radio\" value=\"F\"> F</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> According to Dr Ponsatí, negotiators fall behind if</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q13\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q13\" type=\"radio\" value=\"C\"> C</label> <label><input name=\"q13\" type=\"radio\" value=\"D\"> D</label> <label><input name=\"q13\" type=\"radio\" value=\"E\"> E</label> <label><input name=\"q13\" type=\"radio\" value=\"F\"> F</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> Dr Ponsatí's mediation machine is useful when</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q14\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q14\" type=\"radio\" value=\"C\"> C</label> <label><input name=\"q14\" type=\"radio\" value=\"D\"> D</label> <label><input name=\"q14\" type=\"radio\" value=\"E\"> E</label> <label><input name=\"q14\" type=\"radio\" value=\"F\"> F</label>\n</div>\n</div>\n<div class=\"sentence-completion-options\">\n<ul class=\"question-options-list\">\n<li><strong>A</strong> something is thought to be worth more than it really is</li>\n<li><strong>B</strong> discussions between the parties begin to break down</li>\n<li><strong>C</strong> too much information is given to the other parties early on</li>\n<li><strong>D</strong> businesses consider possible future developments</li>\n<li><strong>E</strong> people allow their feelings to influence decisions</li>\n<li><strong>F</strong> a solution requires face-to-face negotiation</li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
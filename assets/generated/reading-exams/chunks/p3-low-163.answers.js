@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-163", "answers", {"answerKey":{"q1":"iv","q2":"viii","q3":"ii","q4":"iii","q5":"i","q6":"vi","q7":"weight and position","q8":"resonance frequency","q9":"three axes","q10":"headaches","q11":"Coriolis illusion","q12":"YES","q13":"NOT GIVEN","q14":"YES"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-163", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-163","meta":{"title":"Keeping the Fun in Funfairs 游乐场设计科学","category":"P3","frequency":"low","pdfFilename":"72. P3 - Keeping the Fun in Funfairs 游乐场设计科学.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/72. P3 - Keeping the Fun in Funfairs 游乐场设计科学/","legacyFilename":"72. P3 - Keeping the Fun in Funfairs 游乐场设计科学.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/72. P3 - Keeping the Fun in Funfairs 游乐场设计科学/72. P3 - Keeping the Fun in Funfairs 游乐场设计科学.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/72. P3 - Keeping the Fun in Funfairs 游乐场设计科学/72. P3 - Keeping the Fun in Funfairs 游乐场设计科学.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-11T14:43:22.324Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-163", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p>Reading Passage 3 has seven paragraphs A–G.</p>\n<p>Choose the correct heading for paragraphs B–G from the list of headings below.</p>\n<p><em>Drag a heading from this list and drop it onto the correct paragraph's answer box on the left. (Example for Para A is vii)</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i Less is more</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Research can't guarantee safety</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii Unexplained symptoms</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv Setting the limits of acceleration</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v The irresistible appeal of speed</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi Gentle surprises</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii A difficult task</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii A different ride every time</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"short_answer","questionIds":["q7","q8","q9","q10","q11"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 33–37</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>NO MORE THAN THREE WORDS AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"question-item\" id=\"q7-anchor\">\n<p><strong>33</strong> Some attractions, such as the new type of waltzers, depend on both the <input class=\"blank\" name=\"q7\" style=\"min-width: 250px;\"> and of their passengers in order to create a variety of ride experiences.</p>\n</div>\n<div class=\"question-item\" id=\"q8-anchor\">\n<p><strong>34</strong> Designers need to be aware that a “chaotic” ride could accelerate at a violent rate if it reaches its <input class=\"blank\" name=\"q8\">.</p>\n</div>\n<div class=\"question-item\" id=\"q9-anchor\">\n<p><strong>35</strong> Research has shown that people will begin to feel ill if they are subjected to movement on all <input class=\"blank\" name=\"q9\"> at the same time.</p>\n</div>\n<div class=\"question-item\" id=\"q10-anchor\">\n<p><strong>36</strong> Volunteers in Stengel's rotation tests suffered delayed reactions such as <input class=\"blank\" name=\"q10\">.</p>\n</div>\n<div class=\"question-item\" id=\"q11-anchor\">\n<p><strong>37</strong> A phenomenon known as the <input class=\"blank\" name=\"q11\"> produced a pleasurable sensation in test subjects.</p>\n</div>\n</div>"},{"groupId":"group-3","kind":"yes_no_not_given","questionIds":["q12","q13","q14"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 38–40</h4>\n<p>Do the following statements agree with the claims of the writer of Reading Passage 3?</p>\n<p>In boxes 38-40 on your answer sheet, write</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\" id=\"q12-anchor\">\n<p><strong>38</strong> There is still a lot to be learnt about the rates of acceleration that people can withstand.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q13-anchor\">\n<p><strong>39</strong> Children enjoy funfairs more than adults.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q14-anchor\">\n<p><strong>40</strong> Current rides could probably be adapted to become more enjoyable.</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
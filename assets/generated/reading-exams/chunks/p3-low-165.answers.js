@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-165", "answers", {"answerKey":{"q1":"D","q2":"A","q3":"B","q4":"C","q5":"D","q6":"YES","q7":"NO","q8":"NO","q9":"NOT GIVEN","q10":"YES","q11":"D","q12":"A","q13":"F","q14":"C"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-165", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-165","meta":{"title":"Let’s teach them how to teach 教他们如何教学","category":"P3","frequency":"low","pdfFilename":"74. P3 - Let’s teach them how to teach 教他们如何教学.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/74. P3 - Let’s teach them how to teach 教他们如何教学/","legacyFilename":"74. P3 - Let’s teach them how to teach 教他们如何教学.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/74. P3 - Let’s teach them how to teach 教他们如何教学/74. P3 - Let’s teach them how to teach 教他们如何教学.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/74. P3 - Let’s teach them how to teach 教他们如何教学/74. P3 - Let’s teach them how to teach 教他们如何教学.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.791Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-165", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Let's teach them how to teach</h3>\n<h4>What matters in schools is teaching. Fortunately, teaching can be taught</h4>\n<p>Forget smart uniforms and small classes. The secret to stellar grades and thriving students is teachers. One US study found that in a single year's teaching the top 10% of teachers impart three times as much learning to their pupils as the worst 10% do. Another US study suggests that if black pupils were taught by the best quarter of teachers, the gap between their achievement and that of white pupils would disappear. But efforts to ensure that every teacher can teach are hindered by the persistent myth that good teachers are born, not made. Government policies, which often start from the same assumption, seek to raise teaching standards by attracting high-flying graduates to join the profession and prodding bad teachers to leave. Teachers' unions, meanwhile, insist that if only their members were free from centralised policies, excellence would follow.</p>\n<p>The premise that teaching ability is something you either have or don't is mistaken. A new breed of teacher trainers is founding a rigorous science of pedagogy. The aim is to make ordinary teachers great, just as sports coaches help athletes of all abilities to improve their personal best. Done right, this will revolutionise schools and change lives.</p>\n<p>Education has a history of lurching from one ‘miracle' solution to the next. The best of them even achieve some good. The US initiative Teach for America has brought energetic new graduates into the profession, and dismissing teachers for bad performance has boosted results in Washington, DC. But each approach has its limits. Teaching is a mass profession: it cannot grab all the top graduates, year after year. When poor teachers are fired, new ones are needed – and they will have come through the same educational system that failed to make fine teachers of their predecessors.</p>\n<p>By contrast, the idea of improving the average teacher could revolutionise the entire profession. Around the world, few newly qualified teachers are well enough prepared for the classroom. A recent report found 31 countries in which more than a quarter of primary-school teachers had not reached minimal national standards. In rich countries, the problem is subtler. Teachers qualify after completing a long, specialised course, which almost always involves superficial and seemingly useless discussions of theory. Some of these courses, including master's degrees in education, have no effect on how well their graduates' pupils end up being taught.</p>\n<p>What teachers fail to learn in universities and teacher-training colleges they rarely pick up on the job. They become better teachers in their first few years as they get to grips with real pupils in real classrooms, but after that improvements tail off. This is largely because schools neglect their most important learners: teachers themselves. Across the Organisation for Economic Cooperation and Development (OECD) club of mostly rich countries, two-fifths of teachers say they have never had a chance to learn by sitting in on another teacher's lessons; nor have they been asked to give feedback on their peers.</p>\n<p>If this is to change, teachers need to learn how to impart knowledge and prepare young minds to receive and retain it. Good teachers set clear goals, enforce high standards of behaviour and manage their lesson time wisely. They use tried-and-tested instructional techniques to ensure that all brains are working all the time – for example, asking questions in the classroom with “cold calling*\" rather than relying on the same eager pupils putting up their hands.</p>\n<p>Like other complex skills, teaching requires a route to mastery that is not based on abstruse theory but on intense, guided practice grounded in subject-matter knowledge and pedagogical methods. Trainees should spend more time in the classroom. The places where pupils do best – for example, Finland, Singapore and Shanghai – put novice teachers through a demanding apprenticeship. In the US, high-performing schools teach trainees in the classroom and bring them on with coaching and feedback.</p>\n<p>Teacher-training institutions need to be more rigorous. A century ago, medical schools raised the calibre of doctors by introducing systematic curriculums and providing clinical experience. It is essential that teacher-training colleges start to collect and publish data on how their graduates perform in the classroom. Courses that produce teachers who go on to do little to improve their pupils' learning should not receive subsidies or see their graduates become teachers. They would then have to improve to survive.</p>\n<p>Big changes are needed in schools, too, to ensure that teachers improve throughout their careers. Teachers in the best ones hone their craft through observation and coaching. They accept critical feedback, which their unions should not resist but welcome, as it is only proper for people doing such an important job. The best head teachers hold novices' hands by helping them prepare high-quality lessons and arranging for more-experienced teachers to cover for them when they need time for further study and practice.</p>\n<p>Money is less important than one might think. Teachers in top-of-the-class Finland, for example, earn about the OECD average. But ensuring the best teachers stay in the classroom will, in most places, mean paying more. People who thrive in front of pupils should not have to become managers to earn a pay rise. And more flexibility on salaries would make it much easier to attract the best teachers to the worst schools.</p>\n<p>Improving the quality of the average teacher would raise the profession's prestige, setting up a virtuous cycle in which more talented graduates clamoured to join. But the biggest gains will come from preparing new teachers better, and upgrading the ones already in classrooms.</p>\n<hr style=\"margin: 20px 0;\">\n<p style=\"font-size: 0.9em; color: var(--muted);\">*cold calling: a simple technique in which the teacher calls on specific pupils to answer a question, regardless of whether they have raised their hand</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
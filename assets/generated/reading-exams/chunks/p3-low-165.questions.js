@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-165", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> According to the third paragraph, why is dismissing bad teachers a poor solution to problems in educational standards?</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A Problems are increasing year on year.</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B There are not enough top graduates to replace them.</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C It leads to a poor relationship with teachers' unions.</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D Replacement teachers have the same training as the dismissed ones.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> What does the writer say about teacher-training institutions in the fourth paragraph?</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A Graduating teachers are not ready for the classroom.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B Improving a teacher of average talent is a very difficult task.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C More theory in teacher-training courses is required.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D Primary teacher training is not taken seriously.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> In their first few years of working, teachers improve in the classroom because they</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A are well equipped to build on the theory they learned in college.</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B have to engage with the realities of the job.</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C have opportunities to observe and learn from their peers.</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D enjoy a high level of support from the schools that employ them.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Which of the following does the writer suggest is least effective for teachers to use?</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A enforcing strict standards of behaviour</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B setting high goals that students are aware of</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C responding to pupils who raise their hands to answer questions</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D ensuring that lesson time is properly scheduled and used</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> The author suggests that head teachers can assist newly qualified teachers by</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"> A carrying out classroom observations personally.</label> <label><input name=\"q5\" type=\"radio\" value=\"B\"> B providing critical feedback.</label> <label><input name=\"q5\" type=\"radio\" value=\"C\"> C welcoming union interaction.</label> <label><input name=\"q5\" type=\"radio\" value=\"D\"> D working closely with them.</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"yes_no_not_given","questionIds":["q6","q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-10-anchor\">\n<h4>Questions 32–36</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 32–36 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>32</strong> Of the many 'miracle' educational solutions that have been put forward, a few have been effective.</p>\n<div class=\"radio-options\" style=\"flex-direction:row; gap:16px;\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Understanding educational theories is an essential part of teacher training.</p>\n<div class=\"radio-options\" style=\"flex-direction:row; gap:16px;\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Courses producing unsuccessful teachers should be given grants to improve.</p>\n<div class=\"radio-options\" style=\"flex-direction:row; gap:16px;\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Education is currently underfunded, which is leading to problems in schools.</p>\n<div class=\"radio-options\" style=\"flex-direction:row; gap:16px;\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> Good classroom teachers should be paid more to remain in the classroom.</p>\n<div class=\"radio-options\" style=\"flex-direction:row; gap:16px;\">\n<label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"sentence_completion","questionIds":["q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–F</strong>, below.</p>\n<p>Write the correct letter, <strong>A–F</strong>, in boxes 37–40 on your answer sheet.</p>\n<div class=\"sentence-completion-options\">\n<ul>\n<li><strong>A</strong> practice will always be more important than theory.</li>\n<li><strong>B</strong> better trainers are the only answer.</li>\n<li><strong>C</strong> more capable graduates could be attracted into the profession.</li>\n<li><strong>D</strong> a teacher who is not outstanding can be improved.</li>\n<li><strong>E</strong> the assistance of teachers' unions is essential.</li>\n<li><strong>F</strong> a better syllabus and more practical involvement will improve results.</li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> Just as any athlete can be coached for better performance,<input type=\"text\" id=\"q37_input\" maxlength=\"1\" name=\"q11\"></p>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> If teachers are to be taught the complex skills they require,<input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\"></p>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> In teaching, as in the medical profession,<input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\"></p>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> If the status of teachers were improved,<input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"></p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
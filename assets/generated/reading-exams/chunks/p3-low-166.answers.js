@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-166", "answers", {"answerKey":{"q1":"NO","q2":"NOT GIVEN","q3":"YES","q4":"NO","q5":"YES","q6":"D","q7":"A","q8":"C","q9":"C","q10":"I","q11":"A","q12":"C","q13":"B","q14":"D"}});
+})(typeof window !== "undefined" ? window : globalThis);
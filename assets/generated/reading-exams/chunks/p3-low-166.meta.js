@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-166", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-166","meta":{"title":"Life on Mars_ 火星地球化改造","category":"P3","frequency":"low","pdfFilename":"75. P3 - Life on Mars_ 火星地球化改造.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/75. P3 - Life on Mars_ 火星地球化改造/","legacyFilename":"75. P3 - Life on Mars_ 火星地球化改造.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/75. P3 - Life on Mars_ 火星地球化改造/75. P3 - Life on Mars_ 火星地球化改造.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/75. P3 - Life on Mars_ 火星地球化改造/75. P3 - Life on Mars_ 火星地球化改造.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.792Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-166", "questions", {"questionGroups":[{"groupId":"group-1","kind":"yes_no_not_given","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Do the following statements agree with the views of the writer in the Reading passage 3?</p>\n<p>In boxes 27-31 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the writer's view</li>\n<li><strong>NO</strong> if the statement contradicts the writer's view</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> Pictures of Mars suggest it might make a good place for people to settle.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Modern Mars and ancient Earth looked remarkably similar.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> One method of terraforming could involve adapting technology that is already under development.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Greenhouse-gas factories would provide enough oxygen for people to breathe without special equipment.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> Terraforming Mars would be an extreme test of human skill and intelligence.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>32</strong> Which one of these factors suggests that Mars might be a good place for people to settle?</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"A\"> A It is not too far from Earth.</label><br>\n<label><input name=\"q6\" type=\"radio\" value=\"B\"> B It has no other life forms living there.</label><br>\n<label><input name=\"q6\" type=\"radio\" value=\"C\"> C It has a cool, dry climate.</label><br>\n<label><input name=\"q6\" type=\"radio\" value=\"D\"> D It has some similarities with Earth.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> The first step in terraforming Mars would be to</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"> A make the planet warmer.</label><br>\n<label><input name=\"q7\" type=\"radio\" value=\"B\"> B create a breathable atmosphere.</label><br>\n<label><input name=\"q7\" type=\"radio\" value=\"C\"> C find a suitable source of water.</label><br>\n<label><input name=\"q7\" type=\"radio\" value=\"D\"> D create a habitat for living organisms.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Special factories on Mars could be used to</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"> A control the level of greenhouse gases.</label><br>\n<label><input name=\"q8\" type=\"radio\" value=\"B\"> B absorb excess levels of carbon dioxide.</label><br>\n<label><input name=\"q8\" type=\"radio\" value=\"C\"> C produce oxygen in a manner similar to plants.</label><br>\n<label><input name=\"q8\" type=\"radio\" value=\"D\"> D help grow essential bacteria.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> What is the writer's main purpose in the passage?</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"> A To explain why we need to terraform Mars.</label><br>\n<label><input name=\"q9\" type=\"radio\" value=\"B\"> B To illustrate the three processes required to terraform a planet like Mars.</label><br>\n<label><input name=\"q9\" type=\"radio\" value=\"C\"> C To consider how and why Mars might be terraformed.</label><br>\n<label><input name=\"q9\" type=\"radio\" value=\"D\"> D To demonstrate how straightforward it would be to terraform a planet.</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete the summary using a word A–I from the box.</p>\n<p>Write the correct letter, A-I, in boxes 36-40 on your answer sheet.</p>\n<div class=\"summary-box\">\n<p>One method of terraforming Mars would be to <strong>36</strong> <input type=\"text\" id=\"q36_input\" name=\"q10\"> asteroids at the planet. Rockets attached to an enormous asteroid would propel it towards Mars, taking ten years to <strong>37</strong> <input type=\"text\" id=\"q37_input\" name=\"q11\"> the enormous distances required. The asteroid would <strong>38</strong> <input type=\"text\" id=\"q38_input\" name=\"q12\"> the planet with incredible force and <strong>39</strong> <input type=\"text\" id=\"q39_input\" name=\"q13\"> enough energy to <strong>40</strong> <input type=\"text\" id=\"q40_input\" name=\"q14\"> the planet's temperature. The result would be a temperate climate and lots of water from melting ice caps.</p>\n<div class=\"word-list\">\n<strong>A</strong> cover &nbsp;&nbsp; <strong>B</strong> create &nbsp;&nbsp; <strong>C</strong> hit<br>\n<strong>D</strong> increase &nbsp;&nbsp; <strong>E</strong> land &nbsp;&nbsp; <strong>F</strong> drive<br>\n<strong>G</strong> power &nbsp;&nbsp; <strong>H</strong> rise &nbsp;&nbsp; <strong>I</strong> shoot\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-172", "answers", {"answerKey":{"q1":"C","q2":"B","q3":"C","q4":"B","q5":"NO","q6":"NO","q7":"NOT GIVEN","q8":"NOT GIVEN","q9":"YES","q10":"F","q11":"E","q12":"C","q13":"A","q14":"D"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-172", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-172","meta":{"title":"Rebranding art museums 博物馆品牌重塑","category":"P3","frequency":"low","pdfFilename":"80. P3 - Rebranding art museums 博物馆品牌重塑.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/80. P3 - Rebranding art museums 博物馆品牌重塑/","legacyFilename":"80. P3 - Rebranding art museums 博物馆品牌重塑.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/80. P3 - Rebranding art museums 博物馆品牌重塑/80. P3 - Rebranding art museums 博物馆品牌重塑.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/80. P3 - Rebranding art museums 博物馆品牌重塑/80. P3 - Rebranding art museums 博物馆品牌重塑.pdf","ieltsHtml":"IELTS/P3/Rebranding art museums.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.798Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
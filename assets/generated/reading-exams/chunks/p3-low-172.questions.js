@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-172", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> What is the writer doing in the first paragraph?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A comparing the old NGV with the new NGV</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B describing the role of art museums in Australian culture</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C considering the influence of gallery design on art appreciation</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D suggesting there has been little recent change in gallery design</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> The writer criticises the old NGV because</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A the permanent collection was poorly displayed.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B the building tended to make art seem remote.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C Asian and Pacific art was neglected.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D the foyer resembled a shop.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> What does the writer notice about the new NGV?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A He thinks the ticket booths are well positioned.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B He is upset that he is made to move so quickly.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C He is frustrated because the art is obscured by the entrance.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D He thinks the redevelopment fails to keep up with international trends.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> The writer argues that rental 'blockbuster' exhibitions</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A should be cheaper.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B are a financial necessity.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C should be increased in number.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D allow the museum to present an original programme.</label></li>\n</ul>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"yes_no_not_given","questionIds":["q5","q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n<h4>Questions 31–35</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 31–35 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>31</strong> Roy Grounds's design failed to recognise the importance of functions and performances in museums.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> Mario Bellini's new NGV rejects international museum design trends.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Mario Bellini's work on subsequent museum projects has been less successful than that on the NGV.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> The NGV monitors the number of first-time visitors to permanent collections.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Too much change may have negative impacts on museums.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"sentence_completion","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–G</strong>, below.</p>\n<ul class=\"sentence-ending-options\">\n<li><strong>A</strong> the museum programme will lose its individuality.</li>\n<li><strong>B</strong> the museum will lose credibility.</li>\n<li><strong>C</strong> the art loses its importance.</li>\n<li><strong>D</strong> it will have to balance opposing demands.</li>\n<li><strong>E</strong> this will encourage museum visitors in the future.</li>\n<li><strong>F</strong> it will have the capability of increasing revenue.</li>\n<li><strong>G</strong> the architect's reputation might suffer.</li>\n</ul>\n<div class=\"question-item\"><strong>36</strong> If a large space is available in the museum, <input type=\"text\" id=\"q36_input\" maxlength=\"1\" name=\"q10\"></div>\n<div class=\"question-item\"><strong>37</strong> If children are allowed to move freely in parts of the gallery, <input type=\"text\" id=\"q37_input\" maxlength=\"1\" name=\"q11\"></div>\n<div class=\"question-item\"><strong>38</strong> If too much emphasis is placed on the museum building itself, <input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\"></div>\n<div class=\"question-item\"><strong>39</strong> If there is an over-reliance on 'blockbuster' exhibitions, <input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\"></div>\n<div class=\"question-item\"><strong>40</strong> If the NGV wants to continue to be successful, <input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"></div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
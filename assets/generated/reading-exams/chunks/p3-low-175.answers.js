@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-175", "answers", {"answerKey":{"q1":"iii","q2":"vii","q3":"iv","q4":"ix","q5":"ii","q6":"i","q7":"vi","q8":"tunnels","q9":"air","q10":"moisture","q11":"evaporation","q12":"YES","q13":"NO","q14":"YES"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-175", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-175","meta":{"title":"Termite Mounds 白蚁丘","category":"P3","frequency":"low","pdfFilename":"83. P3 - Termite Mounds 白蚁丘.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/83. P3 - Termite Mounds 白蚁丘/","legacyFilename":"83. P3 - Termite Mounds 白蚁丘.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/83. P3 - Termite Mounds 白蚁丘/83. P3 - Termite Mounds 白蚁丘.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/83. P3 - Termite Mounds 白蚁丘/83. P3 - Termite Mounds 白蚁丘.pdf","ieltsHtml":"IELTS/P3/Termite Mounds.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.347Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-175", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 27–33</h4>\n<p>Reading Passage 3 has seven paragraphs <strong>A–G</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. methods used to investigate termite mound formation</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. challenging our assumptions about the nature of life</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. reconsidering the termite's reputation</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. principal functions of the termite mound</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. distribution of termite mounds in sub-Saharan Africa</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. some potential benefits of understanding termite architecture</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. the astonishing physical dimensions of the termite mound</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. termite mounds under threat from global climate change</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix. a mutually beneficial relationship</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"diagram_completion","questionIds":["q8","q9","q10","q11"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-anchor\">\n<h4>Questions 34–37</h4>\n<p>Label the diagram below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"diagram-container\">\n<img src=\"https://i.ibb.co/ZpTTLng3/2600b83a-d7e6-4e33-915c-2c117ca4796a.png\" alt=\"Diagram of a termite mound\" style=\"max-width: 100%; width: auto; height: auto; max-height: 420px; object-fit: contain; display: block; margin: 0 auto;\">\n</div>\n<div class=\"diagram-inputs\">\n<div class=\"diagram-input-row\">\n<label for=\"q34_input\"><strong>34</strong></label> <input name=\"q8\" type=\"text\" id=\"q34_input\">\n</div>\n<div class=\"diagram-input-row\">\n<label for=\"q35_input\"><strong>35</strong></label> <input name=\"q9\" type=\"text\" id=\"q35_input\">\n</div>\n<div class=\"diagram-input-row\">\n<label for=\"q36_input\"><strong>36</strong></label> <input name=\"q10\" type=\"text\" id=\"q36_input\">\n</div>\n<div class=\"diagram-input-row\">\n<label for=\"q37_input\"><strong>37</strong></label> <input name=\"q11\" type=\"text\" id=\"q37_input\">\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"yes_no_not_given","questionIds":["q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q12-13-14-anchor\">\n<h4>Questions 38–40</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 38–40 on your answer sheet, write</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>38</strong> The termite mound appears to process its refuse material internally.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> Dr Soar's reconstruction involves scanning a single photograph of a complete mound into a computer.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> New information about termite architecture could help people deal with future energy crises.</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-186", "answers", {"answerKey":{"q1":"A","q2":"E","q3":"sporting events","q4":"scoreboards","q5":"equal scores","q6":"Rattlers","q7":"cheating","q8":"less tough","q9":"food fights","q10":"watching films","q11":"common goal","q12":"problem solving","q13":"C","q14":"E"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-186", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-186","meta":{"title":"The Robbers Cave Study (山洞)群体行为实验","category":"P3","frequency":"low","pdfFilename":"93. P3 - The Robbers Cave Study (山洞)群体行为实验.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/93. P3 - The Robbers Cave Study (山洞)群体行为实验/","legacyFilename":"93. P3 - The Robbers Cave Study (山洞)群体行为实验.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/93. P3 - The Robbers Cave Study (山洞)群体行为实验/93. P3 - The Robbers Cave Study (山洞)群体行为实验.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/93. P3 - The Robbers Cave Study (山洞)群体行为实验/93. P3 - The Robbers Cave Study (山洞)群体行为实验.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.818Z","notes":"signature:checkbox,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-186", "questions", {"questionGroups":[{"groupId":"group-1","kind":"multi_choice","questionIds":["q1","q2"],"bodyHtml":"<div class=\"group\" id=\"q1-2-anchor\">\n<h4>Questions 27 and 28</h4>\n<p>Choose <strong>TWO</strong> letters, A–F.</p>\n<p>Which <strong>TWO</strong> of the following statements about the boys who took part in the study are made by the writer?</p>\n<div class=\"checkbox-options\">\n<label><input name=\"q1_2\" type=\"checkbox\" value=\"A\"> A They had approximately the same number of friends.</label> <label><input name=\"q1_2\" type=\"checkbox\" value=\"B\"> B Some of their parents helped to set up the camp.</label> <label><input name=\"q1_2\" type=\"checkbox\" value=\"C\"> C They selected the group that they wanted to be in.</label> <label><input name=\"q1_2\" type=\"checkbox\" value=\"D\"> D They were responsible for bringing their own tents.</label> <label><input name=\"q1_2\" type=\"checkbox\" value=\"E\"> E They received clothes that identified the group they belonged to.</label> <label><input name=\"q1_2\" type=\"checkbox\" value=\"F\"> F Some of them were criticised for dropping litter.</label>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q3","q4","q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q3-4-5-6-7-8-anchor\">\n<h4>Questions 29–34</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>The Grand Tournament</h4>\n<p>\nThe Grand Tournament marked the second part of Sherif's experiment. It included a range of <strong>29</strong> <input type=\"text\" id=\"q29_input\" name=\"q3\"> that each team would compete in, and the allocation of extra points for things like cleaning cabins.\n</p>\n<p>\nTo increase the competitive element of the tournament, the organisers used <strong>30</strong> <input type=\"text\" id=\"q30_input\" name=\"q4\"> in the dining hall. They also made sure that the boys were under the impression that their scores were nearly <strong>31</strong> <input type=\"text\" id=\"q31_input\" name=\"q5\"> as the tournament neared its end.\n</p>\n<p>\nThe <strong>32</strong> <input type=\"text\" id=\"q32_input\" name=\"q6\">, who were thought to be the tougher group, won the first ball game and lost the second. In other games there were accusations of <strong>33</strong> <input type=\"text\" id=\"q33_input\" name=\"q7\">. During the next day, various instances of conflict occurred within the boys' cabins. Eventually, the tournament was won by the group that was considered to be <strong>34</strong> <input type=\"text\" id=\"q34_input\" name=\"q8\"> – the Eagles.\n</p>\n</div>\n</div>"},{"groupId":"group-3","kind":"table_completion","questionIds":["q9","q10","q11","q12"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-anchor\">\n<h4>Questions 35–38</h4>\n<p>Complete the table below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<table class=\"table-completion\">\n<thead>\n<tr>\n<th colspan=\"3\">Phase 3: Non-competitive contact</th>\n</tr>\n<tr>\n<th>Conditions</th>\n<th>Type of situation</th>\n<th>Result</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>Equal status</strong></td>\n<td>eating</td>\n<td><strong>35</strong> <input type=\"text\" id=\"q35_input\" name=\"q9\"></td>\n</tr>\n<tr>\n<td></td>\n<td><strong>36</strong> <input type=\"text\" id=\"q36_input\" name=\"q10\"></td>\n<td>enjoyed them but were not sitting together</td>\n</tr>\n<tr>\n<td rowspan=\"2\">A <strong>37</strong> <input type=\"text\" id=\"q37_input\" name=\"q11\"></td>\n<td>raising money</td>\n<td rowspan=\"2\">friendship groups</td>\n</tr>\n<tr>\n<td><strong>38</strong> <input type=\"text\" id=\"q38_input\" name=\"q12\">, e.g. stuck truck</td>\n</tr>\n</tbody>\n</table>\n</div>"},{"groupId":"group-4","kind":"multi_choice","questionIds":["q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q13-14-anchor\">\n<h4>Questions 39 and 40</h4>\n<p>Choose <strong>TWO</strong> letters, A–F.</p>\n<p>Which <strong>TWO</strong> of the following statements are true of the experimenters who ran the study?</p>\n<div class=\"checkbox-options\">\n<label><input name=\"q13_14\" type=\"checkbox\" value=\"A\"> A They collected their data from secret observation posts.</label> <label><input name=\"q13_14\" type=\"checkbox\" value=\"B\"> B They encouraged the boys to use the terms ‘them' and 'us'.</label> <label><input name=\"q13_14\" type=\"checkbox\" value=\"C\"> C They used a rating exercise to assess the amount of in-group bias.</label> <label><input name=\"q13_14\" type=\"checkbox\" value=\"D\"> D They took steps to avoid personal injury among the boys.</label> <label><input name=\"q13_14\" type=\"checkbox\" value=\"E\"> E They secretly altered some of the results of the tournament.</label> <label><input name=\"q13_14\" type=\"checkbox\" value=\"F\"> F They joined in with the non-competitive activities.</label>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-187", "answers", {"answerKey":{"q1":"C","q2":"F","q3":"A","q4":"D","q5":"B","q6":"E","q7":["breathing","eating"],"q8":"babies","q9":"brain activity","q10":"(vigorous) exercise","q11":"temperature","q12":"scanning techniques","q13":"drug","q14":"D"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-187", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-187","meta":{"title":"The science of sleep 睡眠的科学","category":"P3","frequency":"low","pdfFilename":"94. P3 - The science of sleep 睡眠的科学.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/94. P3 - The science of sleep 睡眠的科学/","legacyFilename":"94. P3 - The science of sleep 睡眠的科学.pdf.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/94. P3 - The science of sleep 睡眠的科学/94. P3 - The science of sleep 睡眠的科学.pdf.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/94. P3 - The science of sleep 睡眠的科学/94. P3 - The science of sleep 睡眠的科学.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-11T14:43:22.403Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-187", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p>Look at the following statements (Questions 27–32) and the list of people below.</p>\n<p>Match each statement with the correct person, <strong>A–F</strong>.</p>\n<div class=\"match-question-item\">\n<p><strong>27</strong> All of the body is able to recover during one type of sleep.</p>\n<div class=\"match-dropzone\" data-question=\"q1\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>28</strong> The brain benefits from one type of sleep during an early stage of life.</p>\n<div class=\"match-dropzone\" data-question=\"q2\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>29</strong> Humans spend more time asleep than engaged in any other activity.</p>\n<div class=\"match-dropzone\" data-question=\"q3\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>30</strong> It is likely that the purpose of one type of sleep has altered over time.</p>\n<div class=\"match-dropzone\" data-question=\"q4\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>31</strong> Brain activity during one type of sleep is similar to that when people are awake.</p>\n<div class=\"match-dropzone\" data-question=\"q5\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>32</strong> One type of sleep enables an individual to learn from past experience.</p>\n<div class=\"match-dropzone\" data-question=\"q6\"></div>\n</div>\n<div class=\"options-pool\" id=\"people-options-pool\">\n<strong>List of People</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Paul Martin</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Nathaniel Kleitman</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Jerome M. Siegel</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Jim Horne</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Claudio Stampi</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F Michel Jouvet</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q7","q8","q9","q10","q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-11-12-13-anchor\">\n<h4>Questions 33–39</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h5>People</h5>\n<ul>\n<li>sleep is vital for human survival</li>\n<li>biological advantages of sleep not clear – this makes it different from either <strong>33</strong> <input name=\"q7\" type=\"text\" id=\"q33_input\" maxlength=\"20\"> or <input name=\"q7\" type=\"text\" id=\"q33_input_2\" maxlength=\"20\"></li>\n</ul>\n<h5>Animals</h5>\n<ul>\n<li>aspects of sleep that most creatures share:\n<ul>\n<li>- lack of physical movement</li>\n<li>- reduced sensory awareness</li>\n<li>- sleep longer when they are <strong>34</strong> <input name=\"q8\" type=\"text\" id=\"q34_input\" maxlength=\"20\"></li>\n</ul>\n</li>\n</ul>\n<h5>Research</h5>\n<ul>\n<li>scientists once believed that <strong>35</strong> <input name=\"q9\" type=\"text\" id=\"q35_input\" maxlength=\"20\"> stopped during sleep – now know it takes place but not in a uniform way</li>\n</ul>\n<h5>Types of sleep – REM and NREM</h5>\n<ul>\n<li>primitive reptiles do not experience REM sleep</li>\n<li>now possible to prove that amount of NREM sleep rises with <strong>36</strong> <input name=\"q10\" type=\"text\" id=\"q36_input\" maxlength=\"20\"></li>\n<li>the metabolic rate and the <strong>37</strong> <input name=\"q11\" type=\"text\" id=\"q37_input\" maxlength=\"20\"> of the brain fall during NREM sleep</li>\n</ul>\n<h5>The Future</h5>\n<ul>\n<li>mysteries of REM sleep may become clearer as the <strong>38</strong> <input name=\"q12\" type=\"text\" id=\"q38_input\" maxlength=\"20\"> improve</li>\n<li>unlikely that a <strong>39</strong> <input name=\"q13\" type=\"text\" id=\"q39_input\" maxlength=\"20\"> will ever replace the need for sleep</li>\n</ul>\n</div>\n</div>"},{"groupId":"group-3","kind":"single_choice","questionIds":["q14"],"bodyHtml":"<div class=\"group\" id=\"q14-anchor\">\n<h4>Question 40</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"mcq-question\">\n<p><strong>40</strong> The writer's main aim in this passage is to</p>\n<ul class=\"mcq-options\">\n<li><label><input type=\"radio\" name=\"q14\" value=\"A\"> A compare animal and human brain activity during sleep.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"B\"> B suggest why some people need more sleep than others.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"C\"> C account for the fact that some dreams are easily forgotten.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"D\"> D describe the differences between two types of sleep.</label></li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-190", "answers", {"answerKey":{"q1":"C","q2":"A","q3":"D","q4":"C","q5":"NO","q6":"NOT GIVEN","q7":"YES","q8":"YES","q9":"NOT GIVEN","q10":"G","q11":"A","q12":"D","q13":"C","q14":"F"}});
+})(typeof window !== "undefined" ? window : globalThis);
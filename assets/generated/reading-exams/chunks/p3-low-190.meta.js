@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-190", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-190","meta":{"title":"The value of literary prizes 文学奖项的价值","category":"P3","frequency":"low","pdfFilename":"97. P3 - The value of literary prizes 文学奖项的价值.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/97. P3 - The value of literary prizes 文学奖项的价值/","legacyFilename":"97. P3 - The value of literary prizes 文学奖项的价值.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/97. P3 - The value of literary prizes 文学奖项的价值/97. P3 - The value of literary prizes 文学奖项的价值.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/97. P3 - The value of literary prizes 文学奖项的价值/97. P3 - The value of literary prizes 文学奖项的价值.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-11T14:43:22.408Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
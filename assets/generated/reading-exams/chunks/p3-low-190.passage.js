@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-190", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>The Value of Literary Prizes</h3>\n<p>It is a central paradox of literary writing that true greatness only becomes apparent over time, and yet that the judgements of the future are substantially dependent on what the present chooses to publish, publicise and preserve. Viewed from the pinnacles of hindsight, literary history looks like a stately procession of great texts. A snapshot taken at any particular moment, however, reveals a far messier business: one clogged with readers, writers, commercial obligations, prejudices and misconceptions. All those enduring works that collectively form a standard by which we judge others are busily being forged or maintained within that snapshot. And somewhere close to the heart of this business lies one of the most ancient and contentious of all artistic institutions: the literary prize.</p>\n<p>The ancient Greeks founded the idea of the literary prize. In fact, the Greek calendar was full of formal contests, most of which were either poetical, athletic or some combination of the two; the competitive singing of dithyrambs—choruses of praise to the god Dionysus— was a kind of literary sport, with groups of up to 50 men or boys moving in stately circles and declaiming verse in order to win the honour of coming first. It might look comical to our eyes, but this was art of the most serious kind. To my mind, just as sporting spectacles today offer people the thrill of watching the human body pushed toward its limits, so the quest for supremacy in words made the deepest concerns of the mind accessible to a wide audience in classical Greece.</p>\n<p>After the classical era, the importance of prizes diminished. Later, in medieval Europe, aristocratic patrons and learned societies singled out the most promising writers and commissioned and rewarded them. It was only at the start of the 20th century that the first truly modern literary prize arrived. Alfred Nobel, the inventor of dynamite, bequeathed an immense sum, equivalent to US $186m today, to fund five international prizes in the fields of literature, chemistry, physics, medicine and peace (prompted, it is said, by the guilt he felt when a French newspaper described him as a ‘merchant of death'). In 1901, the first Nobel prizes were announced. Crucially, they were awarded not by patrons or clubs, but by impartial and authoritative committees—something as close to an absolute and enduring standard as the modern world could find. Their impact was instant, and the results were reported in over 100 newspapers worldwide. Like the newly reborn Olympic movement (founded in 1896), here was an annual competition that would deliver a stream of victory headlines.</p>\n<p>Nobel imitators soon came thick and fast: the Goncourt and Femina prizes in France, the Pulitzer in America, and many more. However, as the years went by neither the gradual expansion of the universities nor the increasing number of awards seemed to be infusing the general reader with an overwhelming regard for great literary works. For example, in 1955, the recently formed British Crime Writers' Association started an annual prize for the best crime novel; in the same year, there was an annual award for Science Fiction. What was emerging was a complex system of patronage whose value was open to dispute. Perhaps the most familiar example of this is Britain's Booker prize (now the Man Booker). Where the Nobel had aimed at rewarding 'an ideal direction' in literature, this award intended to stimulate interest ‘in serious British fiction as a whole'. The people behind it had clearly learned something from the bestseller market. The Booker would aim at catching the imagination of the press by establishing an explicitly sporting-style atmosphere: a shortlist of authors, a high-profile panel of judges, an exciting victor. Above all, though, what came to impress was the fact that by the 1990s, winners could regularly expect to shift over 500,000 copies.</p>\n<p>Yet there is a pale glow of illusion surrounding the wilder claims made for prizes. Winners can prosper, but no victory guarantees vast sales. Most importantly, there is still no substitute for word of mouth. In 2007, <em>The Reluctant Fundamentalist</em> by Mohsin Hamid lost out to Kiran Desai's <em>The Inheritance of Loss</em> in the Man Booker, but considerably outsold it, becoming one of the best-performing literary novels of the year. It was also a far more ambitious and exciting book. Prizes grant opportunities, but their winners remain at the mercy of the reading public. And the bottom line is that this public is ill-served by much of the current marketplace of overlapping awards and those books that are manufactured to claim them—sensitive, trendy tracts of needlessly effortful prose whose elegant openings so impress some juries.</p>\n<p>If, however, we are willing to have a little more faith in the hunger that's still out there for fresh, awakening words, there remain causes for hope. Literature should take a step towards this audience—should wind down some of the media circus, shed its timid obsession with narrow categories, and learn a little more from the worlds both of genre fiction (where much that is most exciting in contemporary writing is taking place) and grassroots prizes like the Man Booker. But we should thin out the other awards, and spend some money instead on competitions that will get writers' first books into print. We should restore proper expertise to juries, and then—and only then—open the door to science fiction, crime, thrillers, horror and everything else that's out there racking up sales.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-190", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> What is the writer's main point about great literary works in the first paragraph?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A They often attract unfair criticism.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B Readers today are more interested in other types of writing.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C Their quality is not always immediately recognised.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D Publishers do not see them as commercially attractive.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> The writer compares Greek poetry contests to sports events because of</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A their impact on spectators.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B the amount of preparation required.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C the fame enjoyed by top performers.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D the common criticisms made of them.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> What point is the writer making in the fourth paragraph?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A International awards encouraged people to write.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B People paid little attention to the creation of new prizes.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C Readers began to see the value of many different types of writing.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D More awards did not lead to a greater appreciation of literary merit.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What are we told about the development of the Man Booker prize?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A The media did not take it seriously at first.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B It had a similar focus to that of the Nobel prize.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C The organisers knew how to generate interest in it.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D Writers were not likely to gain more from it than the honour of winning.</label></li>\n</ul>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"yes_no_not_given","questionIds":["q5","q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n<h4>Questions 31–35</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<p>In boxes 31–35 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>31</strong> The founders of the Man Booker prize rejected high-profile commercialisation of its prize.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> The judges of the 2007 Man Booker prize came to regret their choice of winning title.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Some authors deliberately write in an exaggerated style which they think will attract judges.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> There should be a reduction in the number of literary awards.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Juries of literary awards should consist of writers rather than critics.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"matching","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–G</strong>, below.</p>\n<div class=\"match-question-item-sentence\">\n<p><strong>36</strong> In ancient Greece, prizes</p>\n<div class=\"match-match-dropzone-sentence match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item-sentence\">\n<p><strong>37</strong> In the post-classical period, literary prizes</p>\n<div class=\"match-match-dropzone-sentence match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item-sentence\">\n<p><strong>38</strong> In medieval Europe, talented writers</p>\n<div class=\"match-match-dropzone-sentence match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"match-question-item-sentence\">\n<p><strong>39</strong> The first results issued by the Nobel foundation</p>\n<div class=\"match-match-dropzone-sentence match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div class=\"match-question-item-sentence\">\n<p><strong>40</strong> After the establishment of the Nobel prizes, other awards</p>\n<div class=\"match-match-dropzone-sentence match-dropzone\" data-question=\"q14\"></div>\n</div>\n<div class=\"options-pool\" id=\"sentence-endings-pool\">\n<strong>List of Endings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\" data-pool-id=\"sentence-endings-pool\"><strong>A</strong> were considered to be less significant than previously.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\" data-pool-id=\"sentence-endings-pool\"><strong>B</strong> were intended to be a boost to public education.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\" data-pool-id=\"sentence-endings-pool\"><strong>C</strong> were covered by the international press.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\" data-pool-id=\"sentence-endings-pool\"><strong>D</strong> were supported by wealthy people.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\" data-pool-id=\"sentence-endings-pool\"><strong>E</strong> were felt to be out of touch with their time.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\" data-pool-id=\"sentence-endings-pool\"><strong>F</strong> were presented for many different categories of literature.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\" data-pool-id=\"sentence-endings-pool\"><strong>G</strong> were presented to teams for oral performance of sacred works.</div>\n</div>\n</div>\n</div>","allowOptionReuse":false}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-198", "answers", {"answerKey":{"q1":"d","q2":"g","q3":"e","q4":"f","q5":"b","q6":"i","q7":"j","q8":"f","q9":"c","q10":"no","q11":"not given","q12":"yes","q13":"not given","q14":"yes"}});
+})(typeof window !== "undefined" ? window : globalThis);
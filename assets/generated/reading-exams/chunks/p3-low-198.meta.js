@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-198", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-198","meta":{"title":"Child’s Play in Medieval England 中世纪的游戏","category":"P3","frequency":"low"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-198", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\">\n<a id=\"q1-anchor\"></a>\n<h4>Questions 27–31</h4>\n<p>Which paragraph contains the following information?</p>\n<div class=\"q-block\"><p><strong>27</strong> economic evidence for play in medieval England</p><div class=\"options\"><label><input type=\"radio\" name=\"q1\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q1\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q1\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q1\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q1\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q1\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q1\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q1\" value=\"H\"> H</label></div></div>\n<div class=\"q-block\"><p><strong>28</strong> an example of how children created their own toys</p><div class=\"options\"><label><input type=\"radio\" name=\"q2\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q2\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q2\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q2\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q2\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q2\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q2\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q2\" value=\"H\"> H</label></div></div>\n<div class=\"q-block\"><p><strong>29</strong> an example of warlike play approved by grown-ups</p><div class=\"options\"><label><input type=\"radio\" name=\"q3\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q3\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q3\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q3\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q3\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q3\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q3\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q3\" value=\"H\"> H</label></div></div>\n<div class=\"q-block\"><p><strong>30</strong> a political event mirrored in children's play</p><div class=\"options\"><label><input type=\"radio\" name=\"q4\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q4\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q4\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q4\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q4\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q4\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q4\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q4\" value=\"H\"> H</label></div></div>\n<div class=\"q-block\"><p><strong>31</strong> the origin of an academic debate about medieval life</p><div class=\"options\"><label><input type=\"radio\" name=\"q5\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q5\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q5\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q5\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q5\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q5\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q5\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q5\" value=\"H\"> H</label></div></div>\n</div>"},{"groupId":"group-2","kind":"short_answer","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\">\n<a id=\"q6-anchor\"></a>\n<h4>Questions 32–35</h4>\n<p>Match each date with the correct event, A–J.</p>\n<div class=\"q-match-item\"><span class=\"q-text\"><strong>32</strong> 1400</span><span class=\"dropzone match-dropzone\" data-target=\"q6\" data-question=\"q6\"></span></div>\n<div class=\"q-match-item\"><span class=\"q-text\"><strong>33</strong> 1518</span><span class=\"dropzone match-dropzone\" data-target=\"q7\" data-question=\"q7\"></span></div>\n<div class=\"q-match-item\"><span class=\"q-text\"><strong>34</strong> 1582</span><span class=\"dropzone match-dropzone\" data-target=\"q8\" data-question=\"q8\"></span></div>\n<div class=\"q-match-item\"><span class=\"q-text\"><strong>35</strong> 1908</span><span class=\"dropzone match-dropzone\" data-target=\"q9\" data-question=\"q9\"></span></div>\n<div class=\"option-pool\" id=\"pool-events\">\n<div class=\"card\" draggable=\"true\" data-value=\"A\"><strong>A</strong> invention of cricket</div><div class=\"card\" draggable=\"true\" data-value=\"B\"><strong>B</strong> children picking grapes</div><div class=\"card\" draggable=\"true\" data-value=\"C\"><strong>C</strong> poem about value of games</div><div class=\"card\" draggable=\"true\" data-value=\"D\"><strong>D</strong> early toy manufacturing in England</div><div class=\"card\" draggable=\"true\" data-value=\"E\"><strong>E</strong> puppets first imported into England</div><div class=\"card\" draggable=\"true\" data-value=\"F\"><strong>F</strong> dolls taxed in England</div><div class=\"card\" draggable=\"true\" data-value=\"G\"><strong>G</strong> death of Adam of Usk</div><div class=\"card\" draggable=\"true\" data-value=\"H\"><strong>H</strong> children playing tennis</div><div class=\"card\" draggable=\"true\" data-value=\"I\"><strong>I</strong> children's gang warfare</div><div class=\"card\" draggable=\"true\" data-value=\"J\"><strong>J</strong> a description of seasonal activities</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"yes_no_not_given","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\">\n<a id=\"q10-anchor\"></a>\n<h4>Questions 36–40</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<div class=\"q-block\"><p><strong>36</strong> Little is known about adult attitudes to children's play in the Middle Ages.</p><div class=\"options-col\"><label><input type=\"radio\" name=\"q10\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q10\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q10\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>37</strong> Most toys were imported into England before 1300.</p><div class=\"options-col\"><label><input type=\"radio\" name=\"q11\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q11\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q11\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>38</strong> Medieval children celebrated the seasons in their own ways.</p><div class=\"options-col\"><label><input type=\"radio\" name=\"q12\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q12\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q12\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>39</strong> Medieval children made presents for their parents on special occasions.</p><div class=\"options-col\"><label><input type=\"radio\" name=\"q13\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q13\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q13\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>40</strong> Parents and children in the Middle Ages behaved much as they do today.</p><div class=\"options-col\"><label><input type=\"radio\" name=\"q14\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q14\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q14\" value=\"not given\"> NOT GIVEN</label></div></div>\n</div>"}],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"},"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"]});
+})(typeof window !== "undefined" ? window : globalThis);
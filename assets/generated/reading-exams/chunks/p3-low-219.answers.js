@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-219", "answers", {"answerKey":{"q1":"C","q2":"A","q3":"A","q4":"D","q5":"C","q6":"D","q7":"H","q8":"A","q9":"B","q10":"E","q11":"G","q12":["A","D","E"]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-219", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"text","bodyHtml":"<h2>READING PASSAGE 3 <span id=\"timer\">00:00</span></h2>\n<p>You should spend about 20 minutes on <strong>Questions 27-40</strong>, which are based on Reading Passage 3 below.</p>\n<h3>The Origin of Language</h3>\n<p>The origin of language has been a major area of my research for many years. By 1859, when British scientist Charles Darwin published <em>The Origin of Species</em>, there was already a great deal of interest in this subject. However, the debate became plagued by strange theories, so much so that in 1866 the influential Societe de Linguistique de Paris banned all discussions about the origin of language. The ban lasted for more than a century, before a surge of research began during the 1990s. Linguists, psychologists, anthropologists and archaeologists now frequently debate the origin of language and have published many articles and books on this topic. And yet, despite almost frenzied activity, limited progress has been made.</p>\n<p>I believe there are four reasons for this. The first is an insufficient concern with the archaeological and fossil proof of the brains and behaviour of our human ancestors. Many theories to date rely on an assumed association between brain size and language abilities, without acknowledging the problem this creates: fossil evidence indicates that the Neanderthals had larger brains than modern humans, <em>Homo sapiens</em>, but archaeological evidence indicates that the Neanderthals lacked a capacity for language. So something is seriously amiss with those theories.</p>\n<p>That 'something' might relate to the second reason for limited progress: insufficient concern with the other major aural and vocal communication system of modern humans: music. Even though the Societe de Linguistique de Paris had nothing to say about studying the origin of music, academics appear to have had a self- imposed ban, with limited discussion of this issue during the 19th and 20th centuries. However, there are notable exceptions that should be acknowledged. One is the aforementioned Charles Darwin who, in his 1871 book on human evolution, <em>The Descent of Man</em>, devoted several pages to the development of music. Another is the renowned ethnomusicologist John Blacking, whose 1973 book, <em>How Musical is Man?</em>, broached the idea that music is an inherent and universal human quality.</p>\n<p>The origin of music deserves as much attention as that of language, as we cannot treat one without the other. Those writers who had evidently annoyed the Societe de Linguistique de Paris were quite aware of this. For them, music and language were intimately linked; the French writer and philosopher Jean- Jacques Rousseau's <em>On the Origin of Language</em> (1781) was a reflection on both music and language. In contrast, Morten Christiansen and Simon Kirby's book, <em>Language Evolution</em> (2000), which they conceived as 'a definitive book on the subject', failed to mention music in any of its 17 chapters. Those authors have an important lesson to learn from Rousseau and other writers of his time who addressed the origin of language.</p>\n<p>Music is a universal feature of human society and plays a significant role in the lives of all individuals. Indeed, music is perhaps in even greater need of study than language: the latter has a self- evident function—the transmission of information—and can be readily accepted as a product of evolution, even if its specific evolutionary history remains unclear. But what is the point of music?</p>\n<p>That question leads directly to a third reason for our lack of progress in understanding how language evolved, and indeed the human mind in general: an insufficient concern with emotion. If music is about anything, it is about expressing emotion. But while archaeologists have put significant effort into examining the intellectual capacities of our ancestors, their emotional lives have been sorely neglected. This has contributed to the neglect of music, which, in turn, has constrained our understanding of language.</p>\n<p>There is one further reason why progress has been limited: those who have been most influential regarding the evolution of language have simply got it wrong, and misled everyone else. Linguist Derek Bickerton has made an important contribution towards our understanding of the origin of language by bringing his profound knowledge of linguistics to the discussions that have occurred. But Bickerton's idea that the precursor of modern language consisted of words strung together with limited, if any, grammar is, I believe, fundamentally mistaken. Bickerton refers to this precursor as 'proto- language' and suggests that it was similar to the type of language spoken by young children today, and mastered by apes through the use of computer keyboards. This idea has dominated the field of language origins for the last two decades, and is one that I once found persuasive. But I now understand that it is not only flawed but has severely limited the progress that should have been made.</p>\n<p>My book therefore provides an alternative view, one that draws on the ideas of a linguist who has, I believe, identified the true nature of proto- language. Her name is Alison Wray. She argues that proto- language was 'holistic' rather than compositional in character. By this she means that the precursor to language was a communication system composed of 'messages' rather than words; each message was uniquely associated with an arbitrary meaning, as are the utterances of language today. But in Wray's proto- language, they were not composed out of smaller units of meaning (i.e. words) which could be combined together using a rule system (i.e. grammar) to make more complex messages with emergent meanings. For Wray, proto- language was semantically complex and grammatical. I believe this insight enables us to understand the origin of music as well as language, and to relate both to the emotional lives of our human ancestors.</p>\n<p>&nbsp;</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-219", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 27-31</h4>\n<p class=\"question-note\">Choose the correct letter, A, B, C or D.</p>\n<p>Write the correct letter in boxes 27-31 on your answer sheet.</p>\n<a id=\"q1-anchor\"></a>\n<div id=\"q1-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<p>27. In the first paragraph, what does the writer suggest about the origin of language?</p>\n<div style=\"display:flex; flex-direction: column; gap:8px; margin:4px 0;\">\n<label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"A\"> A. Too many branches of science have been involved in its study.</label> <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"B\"> B. The Societe de Linguistique de Paris instigated research in this area.</label> <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"C\"> C. The lack of progress is surprising given the amount of work being done.</label> <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"D\"> D. Most progress in the study of language was made between 1859 and 1866.</label>\n</div>\n</div>\n<a id=\"q2-anchor\"></a>\n<div id=\"q2-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<p>28. What is the 'problem' referred to in the second paragraph?</p>\n<div style=\"display:flex; flex-direction: column; gap:8px; margin:4px 0;\">\n<label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"A\"> A. Some current theories are based on conflicting evidence.</label> <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"B\"> B. There is insufficient fossil evidence to reach a conclusion.</label> <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"C\"> C. Fossil evidence suggests that Homo sapiens had larger brains than Neanderthals.</label> <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"D\"> D. Archaeological evidence shows that Neanderthals were able to talk.</label>\n</div>\n</div>\n<a id=\"q3-anchor\"></a>\n<div id=\"q3-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<p>29. What does the writer suggest about Jean-Jacques Rousseau's work in 1781?</p>\n<div style=\"display:flex; flex-direction: column; gap:8px; margin:4px 0;\">\n<label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"A\"> A. Modern theorists should pay more attention to his approach.</label> <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"B\"> B. His ideas supported those of the Societe de Linguistique de Paris.</label> <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"C\"> C. His ideas were mirrored in a later book called Language Evolution.</label> <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"D\"> D. His ideas are too outdated to be of any relevance today.</label>\n</div>\n</div>\n<a id=\"q4-anchor\"></a>\n<div id=\"q4-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<p>30. What is the writer's current view of Derek Bickerton's ideas?</p>\n<div style=\"display:flex; flex-direction: column; gap:8px; margin:4px 0;\">\n<label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"A\"> A. They have had little impact on the study of language.</label> <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"B\"> B. They have helped the study of linguistics to progress.</label> <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"C\"> C. They are not accepted by the majority of linguists.</label> <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"D\"> D. The assumption behind them is wrong.</label>\n</div>\n</div>\n<a id=\"q5-anchor\"></a>\n<div id=\"q5-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<p>31. In the final paragraph, the writer concludes that Alison Wray's ideas will help establish a link between</p>\n<div style=\"display:flex; flex-direction: column; gap:8px; margin:4px 0;\">\n<label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"A\"> A. grammar and meaning.</label> <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"B\"> B. messages and proto-language.</label> <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"C\"> C. language, music and emotions.</label> <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"D\"> D. proto-language and modern semantics.</label>\n</div>\n</div>\n</div>"},{"groupId":"group-2","kind":"short_answer","questionIds":["q6","q7","q8","q9","q10","q11"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 32-37</h4>\n<p class=\"question-note\">Look at the following statements (Questions 32-37) and the list of people/books below.</p>\n<p>Match each statement with the correct person/book, A-H.</p>\n<p>Write the correct letter, A-H, in boxes 32-37 on your answer sheet.</p>\n<div style=\"margin: 12px 0;\">\n<div class=\"matching-option\"><strong>32.</strong> The Societe de Linguistique de Paris</div>\n<select id=\"q6\" name=\"q6\">\n<option value=\"\">Select option</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n<option value=\"H\">H</option>\n</select>\n</div>\n<div class=\"matching-option\"><strong>33.</strong> Charles Darwin</div>\n<select id=\"q7\" name=\"q7\">\n<option value=\"\">Select option</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n<option value=\"H\">H</option>\n</select>\n<div class=\"matching-option\"><strong>34.</strong> John Blacking</div>\n<select id=\"q8\" name=\"q8\">\n<option value=\"\">Select option</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n<option value=\"H\">H</option>\n</select>\n<div class=\"matching-option\"><strong>35.</strong> Christiansen and Kirby</div>\n<select id=\"q9\" name=\"q9\">\n<option value=\"\">Select option</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n<option value=\"H\">H</option>\n</select>\n<div class=\"matching-option\"><strong>36.</strong> Derek Bickerton</div>\n<select id=\"q10\" name=\"q10\">\n<option value=\"\">Select option</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n<option value=\"H\">H</option>\n</select>\n<div class=\"matching-option\"><strong>37.</strong> Alison Wray</div>\n<select id=\"q11\" name=\"q11\">\n<option value=\"\">Select option</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n<option value=\"H\">H</option>\n</select>\n<div style=\"margin-top: 16px; padding: 12px; background: #f8fafc; border-radius: 8px; font-size: 14px;\">\n<p><strong>List of people/books</strong></p>\n<p>A. suggested music was an essential part of every individual</p>\n<p>B. made no link between music and language in a comprehensive study</p>\n<p>C. believes that early language was very musical</p>\n<p>D. felt that the origin of language should not be debated</p>\n<p>E. states that early language was made up of basic words used in an unsystematic way</p>\n<p>F. devoted 17 chapters of a book to music</p>\n<p>G. believes that proto-language had no individual words</p>\n<p>H. referred to music in part of a book about the development of human beings</p>\n</div>\n</div>"},{"groupId":"group-3","kind":"multi_choice","questionIds":["q12"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 38-40</h4>\n<a id=\"q12-anchor\"></a>\n<p class=\"question-note\">Choose <strong>THREE</strong> letters, A-G.</p>\n<p>Write the correct letters in boxes 38-40 on your answer sheet.</p>\n<p><strong>According to the writer, which THREE of the following areas have not been studied enough in order to understand the origin of language?</strong></p>\n<div class=\"checkbox-list\">\n<label> <input type=\"checkbox\" name=\"q12_40\" value=\"A\"> <span>A. evidence from prehistoric times</span> </label> <label> <input type=\"checkbox\" name=\"q12_40\" value=\"B\"> <span>B. intelligence</span> </label> <label> <input type=\"checkbox\" name=\"q12_40\" value=\"C\"> <span>C. individual sounds</span> </label> <label> <input type=\"checkbox\" name=\"q12_40\" value=\"D\"> <span>D. music</span> </label> <label> <input type=\"checkbox\" name=\"q12_40\" value=\"E\"> <span>E. emotions</span> </label> <label> <input type=\"checkbox\" name=\"q12_40\" value=\"F\"> <span>F. human intellect</span> </label> <label> <input type=\"checkbox\" name=\"q12_40\" value=\"G\"> <span>G. children's language</span> </label>\n</div>\n</div>"}],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38-40"},"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12"]});
+})(typeof window !== "undefined" ? window : globalThis);
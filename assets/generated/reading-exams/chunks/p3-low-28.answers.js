@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-28", "answers", {"answerKey":{"q1":"v","q2":"vi","q3":"i","q4":"iii","q5":"vii","q6":"ii","q7":"D","q8":"E","q9":"B","q10":"C","q11":"G","q12":"A","q13":"B","q14":"D"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-28", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-28","meta":{"title":"Images and Places 风景与印记","category":"P3","frequency":"low","pdfFilename":"123. P3 - Images and Places 风景与印记.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/123. P3 - Images and Places 风景与印记/","legacyFilename":"123. P3 - Images and Places 风景与印记.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/123. P3 - Images and Places 风景与印记/123. P3 - Images and Places 风景与印记.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/123. P3 - Images and Places 风景与印记/123. P3 - Images and Places 风景与印记.pdf","ieltsHtml":"IELTS/P3/Images and Places.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.035Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
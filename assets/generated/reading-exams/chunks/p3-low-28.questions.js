@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-28", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor-right\">\n<h4>Questions 27–32</h4>\n<p>Reading Passage 3 has six sections, <strong>A–F</strong>.</p>\n<p>Choose the correct heading for each section from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct section's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. The relevance of time to the sense of belonging to a place</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. Making sense of photographic studies</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. The advantages of photography in sense-of-place research</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. Reasons for weak attachments</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. A new approach to sense-of-place research</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. Defining the significance of places</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. Important considerations when using VEP</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. Local residents' feelings towards visitors</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q7","q8","q9","q10","q11","q12"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 33–38</h4>\n<p>Look at the following observations (Questions 33–38) and the list of people below.</p>\n<p>Match each observation with the correct person, <strong>A–G</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"question-item\" id=\"q7-anchor\">\n<div class=\"match-question-item\">\n<p><strong>33</strong> Our attachment to a place can happen quickly.</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n</div>\n<div class=\"question-item\" id=\"q8-anchor\">\n<div class=\"match-question-item\">\n<p><strong>34</strong> Limiting the amount of time for taking photographs may produce a narrow range of images.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n</div>\n<div class=\"question-item\" id=\"q9-anchor\">\n<div class=\"match-question-item\">\n<p><strong>35</strong> Members of a group will hold a similar view about a place.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n</div>\n<div class=\"question-item\" id=\"q10-anchor\">\n<div class=\"match-question-item\">\n<p><strong>36</strong> Given time, a place can have the same impact on us as people do.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n</div>\n<div class=\"question-item\" id=\"q11-anchor\">\n<div class=\"match-question-item\">\n<p><strong>37</strong> Tourists should keep a written account of their photographs.</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n</div>\n<div class=\"question-item\" id=\"q12-anchor\">\n<div class=\"match-question-item\">\n<p><strong>38</strong> Each place means something different to each visitor.</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n</div>\n<div class=\"options-pool\" id=\"people-options-pool\">\n<strong>List of People</strong>\n<div class=\"pool-items\" style=\"flex-direction: column; align-items: flex-start;\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Meinig</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Greider and Garkovich</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Ryden</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Tuan</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Haywood</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F Markwell</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G Yamashita</div>\n</div>\n</div>\n</div>","allowOptionReuse":true},{"groupId":"group-3","kind":"single_choice","questionIds":["q13","q14"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 39–40</h4>\n<p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div class=\"question-item\" id=\"q13-anchor\">\n<p><strong>39</strong> The 2002 study by Yamashita shows that local residents</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"> A appreciate the beauty of their surroundings.</label> <label><input name=\"q13\" type=\"radio\" value=\"B\"> B know their surroundings too well to appreciate them.</label> <label><input name=\"q13\" type=\"radio\" value=\"C\"> C consider water the most important aspect of their surroundings.</label> <label><input name=\"q13\" type=\"radio\" value=\"D\"> D dislike the negative impact of visitors on their surroundings.</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q14-anchor\">\n<p><strong>40</strong> In the final paragraph, the writer states that photographs present</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"A\"> A a factual account of a visit.</label> <label><input name=\"q14\" type=\"radio\" value=\"B\"> B an unreliable source for research.</label> <label><input name=\"q14\" type=\"radio\" value=\"C\"> C a clear picture of the visitor's feelings.</label> <label><input name=\"q14\" type=\"radio\" value=\"D\"> D an image that needs to be explained to others.</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
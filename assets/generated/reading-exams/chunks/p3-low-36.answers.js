@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-36", "answers", {"answerKey":{"q1":"YES","q2":"YES","q3":"NO","q4":"NOT GIVEN","q5":"NOT GIVEN","q6":"NO","q7":"B","q8":"A","q9":"D","q10":"B","q11":"D","q12":"C","q13":"A","q14":"D"}});
+})(typeof window !== "undefined" ? window : globalThis);
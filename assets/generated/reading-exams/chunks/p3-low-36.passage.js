@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-36", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Tasmania's Museum of Old and New Art</h3>\n<h4><em>Katelin Butler, returning to her home city of Hobart, reflects on how a new museum has brought about change.</em></h4>\n<p>As an eighteen-year-old living in the small Australian island state of Tasmania, moving to the 'mainland' could not happen soon enough. Now, ten years later, I look forward to going home. This is probably because I've grown up, but also perhaps because the cultural landscape of Tasmania has matured. The latest addition to Tasmania's cultural scene is David Walsh's Museum of Old and New Art (MONA), a museum that has established Hobart, the capital city of Tasmania, on the global art circuit.</p>\n<p>This building is an example of how art and architecture can have an instant impact on the social and cultural reputation of a place. Andrew Bain of The Sydney Morning Herald wrote, 'In a virtual blink, Hobart's cultural landscape has been transformed, with art, wine, fine food and stylish accommodation becoming integral features of the city ... If Hobart's makeover has an origin, it's the opening of MONA – the Museum of Old and New Art.' MONA is said to have been solely instrumental in the reinvention of Hobart as a cultural hub.</p>\n<p>MONA made the national press and international blogs before it opened. After that, Tourism Industry Council of Tasmania's chief executive, Luke Martin, claimed that MONA was proving so popular it was underpinning the tourism industry in Tasmania. However, MONA's effect on Hobart has broader ramifications for Tasmania's tourism industry. As reported in Hobart's local paper, The Mercury, there is concern about how long people are staying in Tasmania. Rather than spending a week in the state and hiring a car to experience the beauty of the Tasmanian landscape, people are making short stays in Hobart only to visit the gallery. The next challenge for the state is how to entice holiday-makers to stay longer, and to venture further afield. Tasmania is more than a one-hit wonder.</p>\n<p>According to Martin, possibilities for packaging up MONA with visits to other galleries around Tasmania are being investigated. Although not directly related to these investigations, the 1891 Queen Victoria Museum and Art Gallery at Royal Park in Launceston is currently being restored to its original condition; there are also plans to extensively redevelop the Tasmanian Museum and Art Gallery in Hobart. In addition to this, there are up to twenty other existing quality galleries in the state. So there is more to see than just MONA.</p>\n<p>Although large, the building is rather nondescript, sitting heavily on the edge of the Derwent River. MONA's ‘wow factor' comes from the notoriety of David Walsh, the museum's millionaire founder, and his choice of unusual artworks. The architecture has more depth of meaning and does exactly as it should: it supports the vision of the museum, essentially the vision of Walsh. It's a new building in the context of a maturing city. The dark, moody labyrinth of gallery spaces could be likened to the mind of the eccentric founder himself. Each artwork appears to be integrated into the dark materiality of the architecture – the interiors are far from light, bright and neutral, as might be seen in a more traditional gallery. The dim lighting and rough, rocky surfaces are a reminder that visitors are three levels underground.</p>\n<p>The warped, mirrored surface at the museum's entry could be seen as the start of a journey of reflecting on one's existence. Much of the art explores the human condition – there are uninhibited artistic descriptions of human relationships, death, and even the digestion process. Going to a gallery with such confronting artworks with your parents is an interesting experience; I was pleasantly surprised by my parents' openness to the exhibitions. My father, who normally whisks through a gallery while my mother likes to take her time, happily spent almost five hours at MONA; the urge to linger is a common feeling here. This is because the gallery engages all of the senses, and visitors often pause to experience the effect each artwork has on them. This raises the question of who is actually visiting MONA – and it's definitely not just the normal gallery-goers. People from all kinds of socioeconomic backgrounds are curious about what lies within the subterranean maze of MONA. Conservative minds are being opened, which is a good thing anywhere.</p>\n<p>Walsh's antiquities collection is superb, but he knew that old coins would compete for attention against new works that are more challenging in scale and subject matter, hence the device of setting antiquities among twentieth- and twenty-first-century works. For me, one of the intriguing outcomes of this strategy was an intensified feeling that the makers of the coins and antiquities were the great contemporary artists of their time.</p>\n<p>The so-called Bilbao Effect has worked its magic on Hobart because, just as Frank Gehry's Guggenheim Museum has transformed the city of Bilbao in Spain, MONA has been a magnet for tourists in Hobart. However, the architectural 'wow' factor of the Guggenheim was the most famous component of that city's transformation, whereas Fender Katsalidis's MONA does not have the same spectacular impact as the shimmering metal surfaces of Gehry's building. Walsh himself abhors descriptions of MONA as the Bilbao of the south, saying that Fender Katsalidis solved a problem when he designed MONA, in executing a project of this scale in an underground location. Walsh contrasts this with what he describes as the \"architectural self-indulgence of Gehry when designing the Guggenheim in Bilbao.” Call it the Bilbao Effect, but this phenomenon has been around for thousands of years – good public architecture forms the centrepiece of a city. This is probably true, but like the Guggenheim, MONA has initiated something very important for Tasmania, and for Hobart in particular. Now the question is how Tasmania will build on David Walsh's input into its cultural setting.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
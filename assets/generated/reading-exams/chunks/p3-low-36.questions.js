@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-36", "questions", {"questionGroups":[{"groupId":"group-1","kind":"yes_no_not_given","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 27–32</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 27–32 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\" id=\"q1-anchor\">\n<p>27. The writer changed her mind about spending time in Tasmania.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q2-anchor\">\n<p>28. Andrew Bain believes that the effect MONA had on Hobart was immediate.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q3-anchor\">\n<p>29. Other factors have contributed as much as MONA to Hobart's transformation.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q4-anchor\">\n<p>30. The Tourism Industry Council of Tasmania works closely with the director of MONA.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q5-anchor\">\n<p>31. Many local residents are writing to The Mercury expressing concern about the length of tourists' stays in Hobart.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q6-anchor\">\n<p>32. Tourists now regard MONA as a starting point for longer trips in Tasmania.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q7","q8","q9","q10","q11"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 33–37</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<p>Write the correct letter in boxes 33–37 on your answer sheet.</p>\n<div class=\"question-item\" id=\"q7-anchor\">\n<p><strong>33.</strong> Luke Martin plans to promote tourism in Tasmania by</p>\n<div class=\"radio-options vertical\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"> A focusing more on MONA as the leading attraction.</label> <label><input name=\"q7\" type=\"radio\" value=\"B\"> B combining trips to MONA with visits to other galleries.</label> <label><input name=\"q7\" type=\"radio\" value=\"C\"> C encouraging visitors to do activities that are not connected with art galleries.</label> <label><input name=\"q7\" type=\"radio\" value=\"D\"> D improving the quality of promotional information about Tasmania's galleries.</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q8-anchor\">\n<p><strong>34.</strong> According to the writer, what is especially interesting about MONA?</p>\n<div class=\"radio-options vertical\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"> A the man who founded the gallery</label> <label><input name=\"q8\" type=\"radio\" value=\"B\"> B its location close to a river</label> <label><input name=\"q8\" type=\"radio\" value=\"C\"> C visitors' responses to the gallery spaces</label> <label><input name=\"q8\" type=\"radio\" value=\"D\"> D the striking architecture of the building</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q9-anchor\">\n<p><strong>35.</strong> Why do visitors spend a long time at the gallery?</p>\n<div class=\"radio-options vertical\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"> A There is a great number of exhibits.</label> <label><input name=\"q9\" type=\"radio\" value=\"B\"> B Visitors tend to come in family groups.</label> <label><input name=\"q9\" type=\"radio\" value=\"C\"> C Many of the works are difficult to understand.</label> <label><input name=\"q9\" type=\"radio\" value=\"D\"> D The gallery has a physical effect on visitors.</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q10-anchor\">\n<p><strong>36.</strong> What does the writer say about the visitors to MONA?</p>\n<div class=\"radio-options vertical\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"> A Older people spend longer there than younger people do.</label> <label><input name=\"q10\" type=\"radio\" value=\"B\"> B A wide variety of people are interested in MONA.</label> <label><input name=\"q10\" type=\"radio\" value=\"C\"> C The majority of visitors are young people.</label> <label><input name=\"q10\" type=\"radio\" value=\"D\"> D The visitors are representative of gallery enthusiasts generally.</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q11-anchor\">\n<p><strong>37.</strong> Why does the writer mention the coins at MONA?</p>\n<div class=\"radio-options vertical\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"> A to illustrate how interesting they are to visitors to modern galleries</label> <label><input name=\"q11\" type=\"radio\" value=\"B\"> B to explain why they are displayed in a separate section of the gallery</label> <label><input name=\"q11\" type=\"radio\" value=\"C\"> C to argue that Walsh's collection is among the best in the world</label> <label><input name=\"q11\" type=\"radio\" value=\"D\"> D to express admiration for the way that the exhibits are presented</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q12","q13","q14"],"bodyHtml":"<div class=\"group\">\n<h4>Questions 38–40</h4>\n<p>Complete the summary using the list of words, <strong>A–H</strong>, below.</p>\n<p>Write the correct letter, <strong>A–H</strong>, in boxes 38–40 on your answer sheet.</p>\n<div class=\"summary-box\">\n<h4>The Bilbao Effect</h4>\n<p>\nMONA has huge appeal for visitors to Hobart, just as Gehry's Guggenheim Museum has for Bilbao. While MONA may lack the <strong>38</strong> <input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\"> effect of the Guggenheim, David Walsh explains that MONA's architect had a different objective when designing MONA: unlike the architectural showcasing of the Guggenheim, with MONA there was a major <strong>39</strong> <input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\"> that needed to be dealt with; the gallery was set beneath the ground. In any case, both galleries have transformed their cities, just as successful public buildings have for thousands of years. It remains to be seen how the <strong>40</strong> <input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"> of David Walsh will be expanded upon in Tasmania.\n</p>\n</div>\n<div class=\"word-list\">\n<span><strong>A</strong> challenge</span> <span><strong>B</strong> pipe</span> <span><strong>C</strong> visual</span> <span><strong>D</strong> contribution</span> <span><strong>E</strong> lasting</span> <span><strong>F</strong> essential</span> <span><strong>G</strong> ambition</span> <span><strong>H</strong> attraction</span>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
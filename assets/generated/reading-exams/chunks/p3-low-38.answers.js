@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-38", "answers", {"answerKey":{"q1":"D","q2":"B","q3":"A","q4":"G","q5":"J","q6":"H","q7":"E","q8":"B","q9":"G","q10":"E","q11":"C","q12":"E","q13":"F","q14":"D"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-38", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-38","meta":{"title":"Research into the effects of different teaching styles 教学风格研究","category":"P3","frequency":"low","pdfFilename":"132. P3 - Research into the effects of different teaching styles 教学风格研究.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/132. P3 - Research into the effects of different teaching styles 教学风格研究/","legacyFilename":"132. P3 - Research into the effects of different teaching styles 教学风格研究.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/132. P3 - Research into the effects of different teaching styles 教学风格研究/132. P3 - Research into the effects of different teaching styles 教学风格研究.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/132. P3 - Research into the effects of different teaching styles 教学风格研究/132. P3 - Research into the effects of different teaching styles 教学风格研究.pdf","ieltsHtml":"IELTS/P3/Research into the effects of different teaching styles.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.060Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-38", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Research into the effects of different teaching styles</h3>\n<p><strong>A</strong> Prior to 1960, most inquiries into pupils' learning skills explored the relationship between factors such as children's social background, personality or measured intelligence and their achievement in various school subjects. Studies of teachers were largely a quest for criteria of effectiveness, and numerous investigations sought links between personality or attitude and 'success' at teaching. By 1950, Domas and Tiedeman were able to survey 672 such studies of teacher effectiveness. Yet there was widespread disappointment with such research, partly because so little of value seemed to emerge. First of all, there was little agreement about what constituted 'good' teaching or who the good teachers were. Secondly, there were numerous conflicting and contradictory findings. No sooner had one investigator found a relationship which appeared to be significant, than another discovered the opposite effect.</p>\n<p><strong>B</strong> For example, in 1945, two American researchers, Rostker and Rolfe, both using standardized testing techniques and broad samples of teachers, reached exactly opposite conclusions. Rostker concluded that the intelligence of the teacher is the most important single factor conditioning teaching ability, and that there is no significant relationship between personality and teaching ability. Rolfe, however, found no correlation between intelligence and teaching efficiency: he claimed that the teacher's personality was what produced good teaching. Another American writer, Barr (1961), summarized a massive amount of American research and underlined the chaos in the research literature on effectiveness: \"Some teachers were preferred by administrators, some were liked by the pupils, and some taught in classes where there were substantial pupil gains, and generally speaking these were not the same teachers.”</p>\n<p><strong>C</strong> One of the earliest pieces of research dates from 1912, when Stevens made 100 random observations of lessons in a variety of subject areas, in order to analyze the number and nature of questions being asked by teachers. Stevens's overall total was 64% teacher talk and 36% pupil talk, figures which are remarkably similar to a number of findings half a century later.</p>\n<p><strong>D</strong> For many years in the first half of the 20th century, so-called 'formal' teaching was the norm. Teachers taught their classes as a whole group, gave out information, asked questions which predominantly required factual recall, and frequently set a common written task for the children to complete in a prescribed period of time. It was hardly surprising, therefore, that one focus of classroom interaction research in the decades following Stevens's inquiry was on the phenomenon of 'attentiveness'. A number of studies in the 1920s and 1930s, by Morrison and others, sought relationships between the degree of attention being paid by children and the amount they subsequently appeared to have learnt. Such research was usually based on observing teachers at work, a technique which was also employed extensively by United States administrators in the 1920s and 1930s, in order to assess teachers' competence and allocate merit payments to so-called 'superior' teachers.</p>\n<p><strong>E</strong> As the 1930s came to an end, it was partly the emergence of totalitarian regimes in Europe which led to a shift in interest in the United States away from attentiveness, with its emphasis on the authority of the teacher, and towards a scrutiny of authoritarianism itself. A number of people began to feel that if dictatorship were to be avoided, children must learn in school how to handle democracy. Several investigators examined the processes taking place within small discussion groups, and tried to establish superiority for discussion groups over lecture classes, but with conflicting results. The movement towards what was becoming known as child-centred education was gathering momentum, and as interest in child development increased, investigators began to discover the usefulness of direct observation and the categorization of child behavior.</p>\n<p><strong>F</strong> This was when systematic observation of teacher-pupil interaction began in earnest. Anderson (1939) studied what he called 'domination' and 'integration' amongst kindergarten children. Dominative acts by children included blaming and snatching toys, and such acts by teachers included restricting children's activities; while children's integrative acts included sharing facilities and playing harmoniously, and those of teachers included expanding opportunities for self-direction and co-operation. Anderson then attempted to measure what is now commonly called 'classroom climate'.</p>\n<p><strong>G</strong> Lewin, Lippitt and White (1939 and 1943) studied the effects of different teaching styles. They arranged for three groups of five boys each to be taught in very different ways: these were labelled 'authoritarian', 'democratic' and 'laissez-faire'. The first two of these were similar to Anderson's concept of dominative and integrative teachers.</p>\n<p><strong>H</strong> Beginning with Withall's work in 1949, there was much greater interest in interaction within the classroom. Withall used the term 'social-emotional climate' to describe the emotional tone created as a result of face-to-face interaction in groups, and, like many who followed him, concentrated his analysis of this climate on the study of teachers' verbal behavior. Withall also made efforts towards increasing the reliability of analyses, and this important pioneering work in the development of classroom observation methodology was followed by many others during the 1950s.</p>\n<p><strong>I</strong> Partly because of the disappointing results of the teacher-effectiveness research, and partly because of the general neglect in earlier work of the variables of actual classroom behavior, the decade 1960–70 produced a large number of studies of classroom processes, based on observation of teachers at work.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-38", "questions", {"questionGroups":[{"groupId":"group-1","kind":"summary_completion","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 27–33</h4>\n<p>Complete the summary below using the list of words. Drag a word and drop it into the correct blank.</p>\n<div class=\"summary-text\">\n<h5>Research into classroom interaction: 1920–1970</h5>\n<p>\n<strong>1920–1939</strong><br>\nResearch largely investigated the relationship between children's attentiveness and their <span id=\"q1-target\" class=\"drop-target-summary\" data-question=\"q1\"></span>. In addition, attentiveness was used to measure the <span id=\"q2-target\" class=\"drop-target-summary\" data-question=\"q2\"></span> of the teachers.\n</p>\n<p>\n<strong>1939–49</strong><br>\nResearch was influenced by a growing distrust of <span id=\"q3-target\" class=\"drop-target-summary\" data-question=\"q3\"></span>. The period saw the beginnings of systematic analysis of the <span id=\"q4-target\" class=\"drop-target-summary\" data-question=\"q4\"></span> which occur in lecture classes and in small group discussions.\n</p>\n<p>\n<strong>1949–60</strong><br>\nClassroom transactions were analysed in more detail, often with a focus on the <span id=\"q5-target\" class=\"drop-target-summary\" data-question=\"q5\"></span> of teachers. Researchers aimed to improve the <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> of their methods.\n</p>\n<p>\n<strong>1960–70</strong><br>\nThe number of studies based on live <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> greatly increased.\n</p>\n</div>\n<div id=\"word-options\" class=\"pool-items\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A authoritarianism</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B competence</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C emergence</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D learning</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E observation</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F personality</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G processes</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H reliability</div>\n<div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I training</div>\n<div id=\"word-J\" class=\"draggable-word\" draggable=\"true\" data-key=\"J\">J verbal behavior</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q8","q9","q10","q11"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-anchor\">\n<h4>Questions 34–37</h4>\n<p>Look at the following descriptions (Questions 34–37) and the list of researchers below.</p>\n<p>Match each description with the correct researcher(s), <strong>A–G</strong>.</p>\n<div class=\"match-question-item\">\n<p><strong>34</strong> claimed that the most important contribution to success in teaching is made by intelligence</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>35</strong> set up an experiment to discover how pupils responded to various types of teaching</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>36</strong> focused on the questions which teachers asked in the classroom</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>37</strong> discovered a connection between success in teaching and the personality of the teacher</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"options-pool\" id=\"researcher-options-pool\">\n<strong>List of Researchers</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"researcher-A\" draggable=\"true\" data-option=\"A\">A Domas and Tiedeman</div>\n<div class=\"drag-item\" id=\"researcher-B\" draggable=\"true\" data-option=\"B\">B Rostker</div>\n<div class=\"drag-item\" id=\"researcher-C\" draggable=\"true\" data-option=\"C\">C Rolfe</div>\n<div class=\"drag-item\" id=\"researcher-D\" draggable=\"true\" data-option=\"D\">D Barr</div>\n<div class=\"drag-item\" id=\"researcher-E\" draggable=\"true\" data-option=\"E\">E Stevens</div>\n<div class=\"drag-item\" id=\"researcher-F\" draggable=\"true\" data-option=\"F\">F Morrison</div>\n<div class=\"drag-item\" id=\"researcher-G\" draggable=\"true\" data-option=\"G\">G Lewin, Lippitt and White</div>\n</div>\n</div>\n</div>","allowOptionReuse":false},{"groupId":"group-3","kind":"table_completion","questionIds":["q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q12-13-14-anchor\">\n<h4>Questions 38–40</h4>\n<p>Reading Passage 3 has nine paragraphs, <strong>A–I</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 200px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th><th>I</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>38</strong> the influence of political events on research</td>\n<td><input type=\"radio\" name=\"q12\" value=\"A\"></td><td><input type=\"radio\" name=\"q12\" value=\"B\"></td><td><input type=\"radio\" name=\"q12\" value=\"C\"></td><td><input type=\"radio\" name=\"q12\" value=\"D\"></td><td><input type=\"radio\" name=\"q12\" value=\"E\"></td><td><input type=\"radio\" name=\"q12\" value=\"F\"></td><td><input type=\"radio\" name=\"q12\" value=\"G\"></td><td><input type=\"radio\" name=\"q12\" value=\"H\"></td><td><input type=\"radio\" name=\"q12\" value=\"I\"></td>\n</tr>\n<tr>\n<td><strong>39</strong> an example of how children's behavior was categorized for research purposes</td>\n<td><input type=\"radio\" name=\"q13\" value=\"A\"></td><td><input type=\"radio\" name=\"q13\" value=\"B\"></td><td><input type=\"radio\" name=\"q13\" value=\"C\"></td><td><input type=\"radio\" name=\"q13\" value=\"D\"></td><td><input type=\"radio\" name=\"q13\" value=\"E\"></td><td><input type=\"radio\" name=\"q13\" value=\"F\"></td><td><input type=\"radio\" name=\"q13\" value=\"G\"></td><td><input type=\"radio\" name=\"q13\" value=\"H\"></td><td><input type=\"radio\" name=\"q13\" value=\"I\"></td>\n</tr>\n<tr>\n<td><strong>40</strong> a reason for research into children's attention</td>\n<td><input type=\"radio\" name=\"q14\" value=\"A\"></td><td><input type=\"radio\" name=\"q14\" value=\"B\"></td><td><input type=\"radio\" name=\"q14\" value=\"C\"></td><td><input type=\"radio\" name=\"q14\" value=\"D\"></td><td><input type=\"radio\" name=\"q14\" value=\"E\"></td><td><input type=\"radio\" name=\"q14\" value=\"F\"></td><td><input type=\"radio\" name=\"q14\" value=\"G\"></td><td><input type=\"radio\" name=\"q14\" value=\"H\"></td><td><input type=\"radio\" name=\"q14\" value=\"I\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
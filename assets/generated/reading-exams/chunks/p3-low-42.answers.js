@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-42", "answers", {"answerKey":{"q1":"C","q2":"C","q3":"A","q4":"D","q5":"B","q6":"NO","q7":"NOT GIVEN","q8":"NO","q9":"YES","q10":"D","q11":"B","q12":"C","q13":"H","q14":"J"}});
+})(typeof window !== "undefined" ? window : globalThis);
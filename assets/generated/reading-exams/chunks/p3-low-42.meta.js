@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-42", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-42","meta":{"title":"The peopling of Patagonia 巴塔哥尼亚的人类迁徙","category":"P3","frequency":"low","pdfFilename":"136. P3 - The peopling of Patagonia 巴塔哥尼亚的人类迁徙.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/136. P3 - The peopling of Patagonia 巴塔哥尼亚的人类迁徙/","legacyFilename":"136. P3 - The peopling of Patagonia 巴塔哥尼亚的人类迁徙.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/136. P3 - The peopling of Patagonia 巴塔哥尼亚的人类迁徙/136. P3 - The peopling of Patagonia 巴塔哥尼亚的人类迁徙.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/136. P3 - The peopling of Patagonia 巴塔哥尼亚的人类迁徙/136. P3 - The peopling of Patagonia 巴塔哥尼亚的人类迁徙.pdf","ieltsHtml":"IELTS/P3/The peopling of Patagonia.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.067Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
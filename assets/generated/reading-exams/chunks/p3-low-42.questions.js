@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-42", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter, A, B, C or D.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> In the first paragraph, what is the writer's main point about migration to Patagonia?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q1\" value=\"A\"> <strong>A</strong> It started earlier than previously thought.</label></li>\n<li><label><input type=\"radio\" name=\"q1\" value=\"B\"> <strong>B</strong> Historians have overlooked its importance.</label></li>\n<li><label><input type=\"radio\" name=\"q1\" value=\"C\"> <strong>C</strong> It impacts on research into the wider region.</label></li>\n<li><label><input type=\"radio\" name=\"q1\" value=\"D\"> <strong>D</strong> Researchers have calculated its effects on the environment.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> In the second paragraph, what is the writer's purpose?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q2\" value=\"A\"> <strong>A</strong> to challenge previous research</label></li>\n<li><label><input type=\"radio\" name=\"q2\" value=\"B\"> <strong>B</strong> to propose new areas to investigate</label></li>\n<li><label><input type=\"radio\" name=\"q2\" value=\"C\"> <strong>C</strong> to summarise a scholarly debate</label></li>\n<li><label><input type=\"radio\" name=\"q2\" value=\"D\"> <strong>D</strong> to suggest reasons for human migration</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> The writer refers to the 'late' model in order to</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q3\" value=\"A\"> <strong>A</strong> compare it with another theory of migration.</label></li>\n<li><label><input type=\"radio\" name=\"q3\" value=\"B\"> <strong>B</strong> evaluate the success of American migration.</label></li>\n<li><label><input type=\"radio\" name=\"q3\" value=\"C\"> <strong>C</strong> criticise the speed of research into migration.</label></li>\n<li><label><input type=\"radio\" name=\"q3\" value=\"D\"> <strong>D</strong> compare migration in different parts of the world.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What is the writer's main point about the ‘early' model?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q4\" value=\"A\"> <strong>A</strong> Scholars support the idea of fast migrations.</label></li>\n<li><label><input type=\"radio\" name=\"q4\" value=\"B\"> <strong>B</strong> It is too random to be a convincing theory.</label></li>\n<li><label><input type=\"radio\" name=\"q4\" value=\"C\"> <strong>C</strong> South America was more habitable at an earlier time.</label></li>\n<li><label><input type=\"radio\" name=\"q4\" value=\"D\"> <strong>D</strong> It is more consistent with the physical conditions of the land.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> What does the writer suggest about the Monte Verde site?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q5\" value=\"A\"> <strong>A</strong> It is much younger than researchers once estimated.</label></li>\n<li><label><input type=\"radio\" name=\"q5\" value=\"B\"> <strong>B</strong> It provides supporting evidence for relatively early settlement.</label></li>\n<li><label><input type=\"radio\" name=\"q5\" value=\"C\"> <strong>C</strong> Archaeologists believe the site is of questionable value.</label></li>\n<li><label><input type=\"radio\" name=\"q5\" value=\"D\"> <strong>D</strong> Streams exposed the site, making new research possible.</label></li>\n</ul>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"yes_no_not_given","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3? Write YES, NO, or NOT GIVEN.</p>\n<div class=\"question-item\">\n<p><strong>32</strong> The conditions encountered by the first migrants to Patagonia were unique.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q6\" value=\"YES\"> YES</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"NO\"> NO</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> In the high country the first migrants hunted wild animals for food.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q7\" value=\"YES\"> YES</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"NO\"> NO</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Archaeologists have failed to draw conclusions from the evidence found at rock shelters in Argentina and Chile.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q8\" value=\"YES\"> YES</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"NO\"> NO</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Archaeological evidence can be moved from place to place in a variety of ways.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q9\" value=\"YES\"> YES</label></li>\n<li><label><input type=\"radio\" name=\"q9\" value=\"NO\"> NO</label></li>\n<li><label><input type=\"radio\" name=\"q9\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n</ul>\n</div>\n</div>"},{"groupId":"group-3","kind":"matching","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete the summary using the list of words and phrases, A–J, below.</p>\n<p><em>Drag a phrase from the list and drop it into the correct blank.</em></p>\n<div class=\"summary-text\">\n<h5>The archaeological evidence from Patagonia</h5>\n<p>\nBuilding remains and other evidence have been found in <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span> at the Chinchihuapi Creek site, and because of this it has been possible to date them to around 12,500 years ago. However, the <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span> of the samples taken from Los Toldos means that this site is of doubtful value. El Ceibo is a more promising dig, where the examination of artefacts would be beneficial in order to confirm the usefulness of discoveries there. The remains found at the Arroyo Eeo site show <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> and date from around 9,000 years ago. Unfortunately, no <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span> can be made between the samples taken from Las Buitreras and human presence. The findings of the work carried out at Cueva Fell cannot provide useful information beyond the <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span>. In conclusion, though the evidence is mixed, it is believed that the human population of Patagonia began about 11,000 years ago.\n</p>\n</div>\n<div class=\"options-pool\">\n<div class=\"pool-items\" id=\"summary-options-pool\">\n<div class=\"drag-item\" id=\"word-A\" draggable=\"true\" data-option=\"A\">A fixed date</div>\n<div class=\"drag-item\" id=\"word-B\" draggable=\"true\" data-option=\"B\">B random collection</div>\n<div class=\"drag-item\" id=\"word-C\" draggable=\"true\" data-option=\"C\">C similar properties</div>\n<div class=\"drag-item\" id=\"word-D\" draggable=\"true\" data-option=\"D\">D good condition</div>\n<div class=\"drag-item\" id=\"word-E\" draggable=\"true\" data-option=\"E\">E scientific evaluation</div>\n<div class=\"drag-item\" id=\"word-F\" draggable=\"true\" data-option=\"F\">F huge quantities</div>\n<div class=\"drag-item\" id=\"word-G\" draggable=\"true\" data-option=\"G\">G new samples</div>\n<div class=\"drag-item\" id=\"word-H\" draggable=\"true\" data-option=\"H\">H reliable connection</div>\n<div class=\"drag-item\" id=\"word-I\" draggable=\"true\" data-option=\"I\">I skilled preservation</div>\n<div class=\"drag-item\" id=\"word-J\" draggable=\"true\" data-option=\"J\">J immediate surroundings</div>\n</div>\n</div>\n</div>","allowOptionReuse":false}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
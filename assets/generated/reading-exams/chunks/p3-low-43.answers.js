@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-43", "answers", {"answerKey":{"q1":"C","q2":"F","q3":"D","q4":"H","q5":"A","q6":"NO","q7":"YES","q8":"NO","q9":"NOT GIVEN","q10":"D","q11":"B","q12":"B","q13":"C","q14":"A"}});
+})(typeof window !== "undefined" ? window : globalThis);
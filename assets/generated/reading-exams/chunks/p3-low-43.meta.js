@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-43", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-43","meta":{"title":"What is social history 社会史","category":"P3","frequency":"low","pdfFilename":"137. P3 - What is social history 社会史.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/137. P3 - What is social history 社会史/","legacyFilename":"137. P3 - What is social history 社会史.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/137. P3 - What is social history 社会史/137. P3 - What is social history 社会史.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/137. P3 - What is social history 社会史/137. P3 - What is social history 社会史.pdf","ieltsHtml":"IELTS/P3/What is social history.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.070Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
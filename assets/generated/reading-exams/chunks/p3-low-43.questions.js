@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-43", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Complete the summary using the list of words, <strong>A–H</strong>, below.</p>\n<p><em>Drag a word from the list and drop it into the correct blank.</em></p>\n<div class=\"summary-text\">\n<h5>How is social history different from historical study?</h5>\n<p>\nSince it became an academic discipline, historical study has been too concerned with a search for <strong>27</strong> <span id=\"q1-target\" class=\"drop-target-summary\" data-question=\"q1\"></span> by researchers who want to develop their careers. Social history, however, is more closely related to the <strong>28</strong> <span id=\"q2-target\" class=\"drop-target-summary\" data-question=\"q2\"></span> of the public. It avoids history's traditional focus on <strong>29</strong> <span id=\"q3-target\" class=\"drop-target-summary\" data-question=\"q3\"></span>, and its later concentration on <strong>30</strong> <span id=\"q4-target\" class=\"drop-target-summary\" data-question=\"q4\"></span>, and it is also different from traditional history in its teaching <strong>31</strong> <span id=\"q5-target\" class=\"drop-target-summary\" data-question=\"q5\"></span>, which is derived from different academic subjects.\n</p>\n</div>\n<div class=\"options-pool\">\n<div class=\"pool-items\" id=\"summary-options-pool\">\n<div class=\"drag-item\" id=\"word-A\" draggable=\"true\" data-option=\"A\">A methodology</div>\n<div class=\"drag-item\" id=\"word-B\" draggable=\"true\" data-option=\"B\">B needs</div>\n<div class=\"drag-item\" id=\"word-C\" draggable=\"true\" data-option=\"C\">C originality</div>\n<div class=\"drag-item\" id=\"word-D\" draggable=\"true\" data-option=\"D\">D important people</div>\n<div class=\"drag-item\" id=\"word-E\" draggable=\"true\" data-option=\"E\">E accuracy</div>\n<div class=\"drag-item\" id=\"word-F\" draggable=\"true\" data-option=\"F\">F interests and feelings</div>\n<div class=\"drag-item\" id=\"word-G\" draggable=\"true\" data-option=\"G\">G explanation</div>\n<div class=\"drag-item\" id=\"word-H\" draggable=\"true\" data-option=\"H\">H organisational matters</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"yes_no_not_given","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3? Write YES, NO, or NOT GIVEN.</p>\n<div class=\"question-item\">\n<p><strong>32</strong> The rise of social history led to the cultural revolution of the 1960s.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q6\" value=\"YES\"> YES</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"NO\"> NO</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Social historians tend to study a later period of history than traditional historians did.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q7\" value=\"YES\"> YES</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"NO\"> NO</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> British cinema in the 1960s lacked any working-class characters.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q8\" value=\"YES\"> YES</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"NO\"> NO</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> The loss of respect for authority in the 1960s was a leading cause of social problems.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q9\" value=\"YES\"> YES</label></li>\n<li><label><input type=\"radio\" name=\"q9\" value=\"NO\"> NO</label></li>\n<li><label><input type=\"radio\" name=\"q9\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n</ul>\n</div>\n</div>"},{"groupId":"group-3","kind":"single_choice","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Choose the correct letter, <strong>A, B, C,</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>36</strong> What point is made about the 'nostalgia industry'?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q10\" value=\"A\"> <strong>A</strong> Its products were not always genuine historical items.</label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"B\"> <strong>B</strong> It led to the abandonment of modernisation.</label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"C\"> <strong>C</strong> Its origins were political rather than industrial.</label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"D\"> <strong>D</strong> It opposed the dominant trend of the time.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> In the sixth paragraph, the writer makes the point that in the 1960s</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q11\" value=\"A\"> <strong>A</strong> construction workers gained greater status.</label></li>\n<li><label><input type=\"radio\" name=\"q11\" value=\"B\"> <strong>B</strong> there was a new interest in traditional industrial buildings.</label></li>\n<li><label><input type=\"radio\" name=\"q11\" value=\"C\"> <strong>C</strong> architects applied industrial techniques to home design.</label></li>\n<li><label><input type=\"radio\" name=\"q11\" value=\"D\"> <strong>D</strong> many older homes were unsuitable as places of residence.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> By the 1970s, historians had come to believe that</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q12\" value=\"A\"> <strong>A</strong> researchers should focus on the immediate past.</label></li>\n<li><label><input type=\"radio\" name=\"q12\" value=\"B\"> <strong>B</strong> modern life is not necessarily an improvement on the past.</label></li>\n<li><label><input type=\"radio\" name=\"q12\" value=\"C\"> <strong>C</strong> they should not overemphasise the difficulties of life in the past.</label></li>\n<li><label><input type=\"radio\" name=\"q12\" value=\"D\"> <strong>D</strong> there was a need for more ‘ordinary' people to do research into the past.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> One problem related to the use of detail by social historians is that</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q13\" value=\"A\"> <strong>A</strong> the wrong types of facts are collected.</label></li>\n<li><label><input type=\"radio\" name=\"q13\" value=\"B\"> <strong>B</strong> some information may be hard to categorise.</label></li>\n<li><label><input type=\"radio\" name=\"q13\" value=\"C\"> <strong>C</strong> more important issues may be ignored.</label></li>\n<li><label><input type=\"radio\" name=\"q13\" value=\"D\"> <strong>D</strong> some of the data may be incorrect.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> The writer recommends that to be effective, social history must</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q14\" value=\"A\"> <strong>A</strong> explore the negative emotions that are part of daily life.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"B\"> <strong>B</strong> build on what has already been established by historians.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"C\"> <strong>C</strong> try to provide an objective view of the recent past.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"D\"> <strong>D</strong> offer solutions to the pressing problems of our day.</label></li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-44", "answers", {"answerKey":{"q1":"YES","q2":"NOT GIVEN","q3":"NOT GIVEN","q4":"NO","q5":"beans","q6":"group","q7":"match","q8":"untrue","q9":"anxious","q10":"Asch","q11":"internalization","q12":"valid","q13":"identification","q14":"teenagers"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-44", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-44","meta":{"title":"Conformity 从众心理","category":"P3","frequency":"low","pdfFilename":"138. P3 - Conformity 从众心理.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/138. P3 - Conformity 从众心理/","legacyFilename":"138. P3 - Conformity 从众心理.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/138. P3 - Conformity 从众心理/138. P3 - Conformity 从众心理.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/138. P3 - Conformity 从众心理/138. P3 - Conformity 从众心理.pdf","ieltsHtml":"IELTS/P3/Conformity.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.586Z","notes":"signature:radio,text,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
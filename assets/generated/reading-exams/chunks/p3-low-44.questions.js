@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-44", "questions", {"questionGroups":[{"groupId":"group-1","kind":"yes_no_not_given","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3? In boxes 27–30 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> Childhood crazes can centre on items of any value.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Children are more vulnerable to crazes now than they used to be.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Consumers make too many quick decisions in shops.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Crutchfield's definition of conformity is the most reliable.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q5","q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n<h4>Questions 31–35</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-notes\">\n<h4>Studies on conformity</h4>\n<p>\nIn the Jenness study, people had to guess how many <strong>31</strong> <input type=\"text\" id=\"q31_input\" name=\"q5\"> were in a container. Jenness found that, in most cases, people opted for an estimate given by a <strong>32</strong> <input type=\"text\" id=\"q32_input\" name=\"q6\">.\n</p>\n<p>\nAsch asked his subjects to <strong>33</strong> <input type=\"text\" id=\"q33_input\" name=\"q7\"> line lengths. To test the extent to which people would conform, he placed his subjects with colleagues who gave <strong>34</strong> <input type=\"text\" id=\"q34_input\" name=\"q8\"> responses. He found that his subjects agreed with his colleagues 32% of the time, although they admitted to feeling <strong>35</strong> <input type=\"text\" id=\"q35_input\" name=\"q9\"> about giving their answer.\n</p>\n</div>\n</div>"},{"groupId":"group-3","kind":"sentence_completion","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"kelman-notes\">\n<h4>Kelman's processes of social conformity</h4>\n<ul>\n<li>\n<h5>Compliance</h5>\n<div class=\"sub-point\">– people support the majority view despite their own ideas</div>\n<div class=\"sub-point\">– social harmony is maintained</div>\n<div class=\"sub-point\">– illustrated by the results of the research conducted by <strong>36</strong> <input type=\"text\" id=\"q36_input\" name=\"q10\"></div>\n</li>\n<li>\n<h5><strong>37</strong> <input type=\"text\" id=\"q37_input\" name=\"q11\"></h5>\n<div class=\"sub-point\">– majority view is considered most <strong>38</strong> <input type=\"text\" id=\"q38_input\" name=\"q12\"> view</div>\n<div class=\"sub-point\">– people persuade themselves despite their own ideas</div>\n</li>\n<li>\n<h5><strong>39</strong> <input type=\"text\" id=\"q39_input\" name=\"q13\"></h5>\n<div class=\"sub-point\">– people change their ideas to those of the majority</div>\n<div class=\"sub-point\">– typical of <strong>40</strong> <input type=\"text\" id=\"q40_input\" name=\"q14\"></div>\n</li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-54", "answers", {"answerKey":{"q1":"D","q2":"C","q3":"G","q4":"A","q5":"B","q6":["speed"],"q7":["acceleration"],"q8":["freshwater pike","pike"],"q9":["butterfly fishes"],"q10":["turbulent"],"q11":["up-and-down"],"q12":["sideways"],"q13":["maneuverability"],"q14":["form"]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-54", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-54","meta":{"title":"Movement Underwater 水下运动","category":"P3","frequency":"low","pdfFilename":"147. P3 - Movement Underwater 水下运动.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/147. P3 - Movement Underwater 水下运动/","legacyFilename":"147. P3 - Movement Underwater 水下运动.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/147. P3 - Movement Underwater 水下运动/147. P3 - Movement Underwater 水下运动.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/147. P3 - Movement Underwater 水下运动/147. P3 - Movement Underwater 水下运动.pdf","ieltsHtml":"IELTS/P3/Movement Underwater.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.603Z","notes":"signature:radio,text,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-54", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Reading Passage 3 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–H</strong>, in boxes 27–31 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 250px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>27</strong> A strategy to avoid being attacked</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>28</strong> How fish are able to keep afloat naturally</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>29</strong> The physical process by which fish propel themselves ahead</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>30</strong> A list of reasons why different creatures move from one place to another</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>31</strong> How the medium of water both restricts and aids movement</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"table_completion","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Complete the table below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<table class=\"completion-table\">\n<thead>\n<tr>\n<th colspan=\"2\">Specialisation</th>\n</tr>\n<tr>\n<th>Specialised ability</th>\n<th>Example fish species</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td>Ability to maintain the same <strong>32</strong> <input type=\"text\" id=\"q32_input\" name=\"q6\"> over long distances</td>\n<td>Swordfish</td>\n</tr>\n<tr>\n<td>Rapid <strong>33</strong> <input type=\"text\" id=\"q33_input\" name=\"q7\"></td>\n<td>Barracuda</td>\n</tr>\n<tr>\n<td>Sudden attack on prey following period of lying in wait</td>\n<td><strong>34</strong> <input type=\"text\" id=\"q34_input\" name=\"q8\"></td>\n</tr>\n<tr>\n<td>Rapid changes of direction</td>\n<td><strong>35</strong> <input type=\"text\" id=\"q35_input\" name=\"q9\"></td>\n</tr>\n</tbody>\n</table>\n</div>"},{"groupId":"group-3","kind":"diagram_completion","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete the diagram below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"diagram-layout-container\">\n<div class=\"diagram-image-wrapper\">\n<img src=\"media/p3-low-54-fish-diagram.avif\" alt=\"Diagram showing a fish's features for mobility, stability and combating drag resistance\">\n</div>\n<div class=\"diagram-inputs-wrapper\">\n<div class=\"diagram-input-item\"><label for=\"q36_input\">36</label><input type=\"text\" id=\"q36_input\" name=\"q10\"></div>\n<div class=\"diagram-input-item\"><label for=\"q37_input\">37</label><input type=\"text\" id=\"q37_input\" name=\"q11\"></div>\n<div class=\"diagram-input-item\"><label for=\"q38_input\">38</label><input type=\"text\" id=\"q38_input\" name=\"q12\"></div>\n<div class=\"diagram-input-item\"><label for=\"q39_input\">39</label><input type=\"text\" id=\"q39_input\" name=\"q13\"></div>\n<div class=\"diagram-input-item\"><label for=\"q40_input\">40</label><input type=\"text\" id=\"q40_input\" name=\"q14\"></div>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
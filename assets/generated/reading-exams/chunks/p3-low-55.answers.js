@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-55", "answers", {"answerKey":{"q1":"C","q2":"D","q3":"B","q4":"A","q5":"D","q6":"C","q7":"marketing team","q8":"external design team","q9":"consumers","q10":"in-house design team","q11":"design engineers","q12":"B","q13":"C","q14":"A"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-55", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-55","meta":{"title":"Improving Patient Safety 药品包装设计","category":"P3","frequency":"low","pdfFilename":"148. P3 - Improving Patient Safety 药品包装设计.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/148. P3 - Improving Patient Safety 药品包装设计/","legacyFilename":"148. P3 - Improving Patient Safety 药品包装设计.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/148. P3 - Improving Patient Safety 药品包装设计/148. P3 - Improving Patient Safety 药品包装设计.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/148. P3 - Improving Patient Safety 药品包装设计/148. P3 - Improving Patient Safety 药品包装设计.pdf","ieltsHtml":"IELTS/P3/Improving Patient Safety.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.093Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
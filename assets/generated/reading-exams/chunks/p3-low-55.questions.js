@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-55", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p>Look at the following statements (Questions 27–32) and the list of people or groups below.</p>\n<p>Match each statement with the correct person or group, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>27</strong> The elderly would benefit from drug containers that do not require force to open them.</p>\n<div class=\"match-dropzone\" data-question=\"q1\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>28</strong> Adapting packaging for the blind may disadvantage people who can see.</p>\n<div class=\"match-dropzone\" data-question=\"q2\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>29</strong> Specially designed containers have not been able to eliminate drugs being swallowed accidentally.</p>\n<div class=\"match-dropzone\" data-question=\"q3\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>30</strong> Designers have to consider how drugs are used in the home.</p>\n<div class=\"match-dropzone\" data-question=\"q4\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>31</strong> Governing bodies need to compare different drug containers rather than studying individual ones.</p>\n<div class=\"match-dropzone\" data-question=\"q5\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>32</strong> Information provided with medicine is not listed in the right order.</p>\n<div class=\"match-dropzone\" data-question=\"q6\"></div>\n</div>\n<div class=\"options-pool\" id=\"people-options-pool\">\n<strong>List of People or Groups</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Thea Swayne</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B The Child Accident Prevention Trust</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Richard Mawle</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Karel van der Waarde</div>\n</div>\n</div>\n</div>","allowOptionReuse":true,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q7","q8","q9","q10","q11"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-11-anchor\">\n<h4>Questions 33–37</h4>\n<p>Complete the summary using the list of words, A–G, below.</p>\n<p><em>Drag and drop the correct word into the summary blanks.</em></p>\n<div class=\"summary-text\">\n<h5>Packaging design in the pharmaceutical industry</h5>\n<h6>Over-the-counter drugs</h6>\n<p>\nFirst, a proposal is written by the <strong>33</strong> <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span>. Then several designs are produced by the <strong>34</strong> <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span>. Finally, selected designs are shown to <strong>35</strong> <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span>.\n</p>\n<h6>Prescription-only drugs</h6>\n<p>\nThe <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span> create the design. The design is then passed to <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span>.\n</p>\n</div>\n<div id=\"word-options\" class=\"options-pool\">\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-word=\"consumers\">A consumers</div>\n<div class=\"drag-item\" draggable=\"true\" data-word=\"design engineers\">B design engineers</div>\n<div class=\"drag-item\" draggable=\"true\" data-word=\"external design team\">C external design team</div>\n<div class=\"drag-item\" draggable=\"true\" data-word=\"in-house design team\">D in-house design team</div>\n<div class=\"drag-item\" draggable=\"true\" data-word=\"marketing team\">E marketing team</div>\n<div class=\"drag-item\" draggable=\"true\" data-word=\"pharmaceutical industry\">F pharmaceutical industry</div>\n<div class=\"drag-item\" draggable=\"true\" data-word=\"pharmacists\">G pharmacists</div>\n</div>\n</div>\n</div>","allowOptionReuse":false},{"groupId":"group-3","kind":"single_choice","questionIds":["q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q12-13-14-anchor\">\n<h4>Questions 38–40</h4>\n<p>Choose the correct letter, A, B, C or D.</p>\n<div class=\"question-item\">\n<p><strong>38</strong> In the accident mentioned in the passage, what was the 'design consideration' that caused a drug to be given incorrectly?</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"A\"> A a printing error</label> <label><input name=\"q12\" type=\"radio\" value=\"B\"> B the style of print</label> <label><input name=\"q12\" type=\"radio\" value=\"C\"> C an incorrect label</label> <label><input name=\"q12\" type=\"radio\" value=\"D\"> D the shape of the bottle</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> What do some people say about the use of only black and white as a design feature?</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"> A Consumers would dislike this option.</label> <label><input name=\"q13\" type=\"radio\" value=\"B\"> B Drug containers would all look too similar.</label> <label><input name=\"q13\" type=\"radio\" value=\"C\"> C People would pay more attention to label information.</label> <label><input name=\"q13\" type=\"radio\" value=\"D\"> D Partially sighted people would find these colours more helpful.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> Why does the writer refer to ‘the popper’ and ‘Pluspoint'?</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"A\"> A to show that progress is being made in pharmaceutical packaging design</label> <label><input name=\"q14\" type=\"radio\" value=\"B\"> B to give an example of pharmaceutical design problems that can cause accidents</label> <label><input name=\"q14\" type=\"radio\" value=\"C\"> C to prove that a lot of work still needs to be done to improve pharmaceutical packaging design</label> <label><input name=\"q14\" type=\"radio\" value=\"D\"> D to point out that patients need to be more informed about pharmaceutical products</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
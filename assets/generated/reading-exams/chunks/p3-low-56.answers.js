@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-56", "answers", {"answerKey":{"q1":"B","q2":"C","q3":"A","q4":"D","q5":"A","q6":"C","q7":"H","q8":"C","q9":"A","q10":"E","q11":"YES","q12":"NOT GIVEN","q13":"NO","q14":"NOT GIVEN"}});
+})(typeof window !== "undefined" ? window : globalThis);
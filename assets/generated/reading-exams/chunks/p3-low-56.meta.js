@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-56", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-56","meta":{"title":"Learning to be bilingual 双语学习","category":"P3","frequency":"low","pdfFilename":"149. P3 - Learning to be bilingual 双语学习.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/149. P3 - Learning to be bilingual 双语学习/","legacyFilename":"149. P3 - Learning to be bilingual 双语学习.html","questionIntroHtml":""},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/149. P3 - Learning to be bilingual 双语学习/149. P3 - Learning to be bilingual 双语学习.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/149. P3 - Learning to be bilingual 双语学习/149. P3 - Learning to be bilingual 双语学习.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.607Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
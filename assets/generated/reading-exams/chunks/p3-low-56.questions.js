@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-56", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> What does the writer say about families in which the parents speak different languages?</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"><span>A They constantly research ways to help their children learn both languages.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"B\"><span>B They realise the importance of their role in their children's language learning.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"C\"><span>C They prioritise their children's language learning over their own.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"D\"><span>D They find the OPOL approach the easiest to adopt.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> The writer uses the term 'received wisdom' in the first paragraph to illustrate that</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"><span>A the success of OPOL depends on the languages spoken by the parents.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"B\"><span>B OPOL fails if the parents are not consistent in its use.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"C\"><span>C one generally accepted principle of OPOL is incorrect.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"D\"><span>D there has been a lack of research into OPOL.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> The mothers who took part in the writer's research</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"><span>A compensated for the fact that their children were exposed to more English than Japanese.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"B\"><span>B took their children's language learning more seriously than their partners did.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"C\"><span>C used language learning to increase the time they spent with their children.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"D\"><span>D were reluctant for their partners to speak Japanese to their children.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> The writer says that the children in her study</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"><span>A preferred to use Japanese exclusively for communicating with their mothers.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"B\"><span>B understood their mothers better as their knowledge of Japanese increased.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"C\"><span>C argued about things that would be unimportant for monolingual children.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"D\"><span>D used language in a way that is uncommon.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> What does the writer suggest about correcting children who are learning to be bilingual?</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"><span>A It is usually avoided if it causes bad feeling.</span></label> <label><input name=\"q5\" type=\"radio\" value=\"B\"><span>B Parents tend to prioritise it over maintaining a conversation.</span></label> <label><input name=\"q5\" type=\"radio\" value=\"C\"><span>C It is unnecessary with the OPOL method of learning.</span></label> <label><input name=\"q5\" type=\"radio\" value=\"D\"><span>D Parents are less likely to do it if they speak both languages.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> The writer gives the 'ice cream' example to show that</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"A\"><span>A bilingual children find the use of borrowed words less confusing than other children.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"B\"><span>B bilingual children like to test their parents with words they know to be wrong.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"C\"><span>C knowledge of two languages leads bilingual children to invent new word forms.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"D\"><span>D it may be difficult to distinguish which language a bilingual child is using.</span></label>\n</div>\n</div>\n</div>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-10-anchor\">\n<h4>Questions 33–36</h4>\n<p>Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n<div class=\"summary-box\">\n<h5 style=\"text-align: center;\">A bilingual child negotiates with her brother</h5>\n<div class=\"summary-text\">\n<p>Faced with her little brother's <strong>33</strong> <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> to let her play with his toys, a young bilingual child used all of her communication <strong>34</strong> <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> to change his mind. First, she expressed her <strong>35</strong> <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span> in gentler, more polite language, and pretended to be about to cry. Having switched from English to Japanese, she exploited aspects of Japanese culture, such as reminding him of his <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span> to her as her brother. She succeeded in her attempts to convince him.</p>\n</div>\n</div>\n<div id=\"word-options\">\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A request</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B attempts</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C strategies</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D misunderstandings</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E responsibility</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F agreement</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G judgement</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H refusal</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I behaviour</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"yes_no_not_given","questionIds":["q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<ul style=\"list-style: none; padding-left: 0;\">\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>37</strong> Even people who speak only one language know how to adapt their way of communicating according to the situation.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> People who grow up in OPOL families will go on to use this approach with their own children.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> The reason the OPOL approach is favoured by many parents is that it encourages them to switch languages when necessary.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> Bilingual children who mix languages eventually develop a preference for one of the languages.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-59", "answers", {"answerKey":{"q1":"F","q2":"B","q3":"E","q4":"C","q5":"D","q6":"E","q7":"C","q8":"A","q9":"C","q10":"YES","q11":"NO","q12":"NO","q13":"NOT GIVEN","q14":"YES"}});
+})(typeof window !== "undefined" ? window : globalThis);
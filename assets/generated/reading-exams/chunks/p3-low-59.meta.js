@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-59", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-59","meta":{"title":"Inside the mind of a fan 观赛心境","category":"P3","frequency":"low","pdfFilename":"151. P3 - Inside the mind of a fan 观赛心境.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/151. P3 - Inside the mind of a fan 观赛心境/","legacyFilename":"151. P3 - Inside the mind of a fan 观赛心境.html","questionIntroHtml":""},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/151. P3 - Inside the mind of a fan 观赛心境/151. P3 - Inside the mind of a fan 观赛心境.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/151. P3 - Inside the mind of a fan 观赛心境/151. P3 - Inside the mind of a fan 观赛心境.pdf","ieltsHtml":"IELTS/P3/Inside the mind of a fan.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.611Z","notes":"signature:radio,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-59", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p>Reading Passage has six paragraphs, <strong>A–F</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–F</strong>, in boxes 27–32 on your answer sheet.<br><strong>NB</strong> You may use any letter more than once.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>27</strong> an explanation of why watching sport may be emotionally satisfying</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>28</strong> an explanation of why beginners find sporting tasks difficult</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>29</strong> a factor that needs to combine with mirroring to attain sporting excellence</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>30</strong> a comparison of human and animal mirror neurons</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>31</strong> the first discovery of brain activity related to mirror neurons</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>32</strong> a claim linking observation to improvement in performance</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-anchor\">\n<h4>Questions 33–35</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>33</strong> The writer uses the term 'grammar of movement' to mean</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"><span>A a level of sporting skill.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"B\"><span>B a system of words about movement.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"C\"><span>C a pattern of connected cells.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"D\"><span>D a type of golf swing.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> The writer states that expert players perform their actions</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"><span>A without conscious thought.</span></label> <label><input name=\"q8\" type=\"radio\" value=\"B\"><span>B by planning each phase of movement.</span></label> <label><input name=\"q8\" type=\"radio\" value=\"C\"><span>C without regular practice.</span></label> <label><input name=\"q8\" type=\"radio\" value=\"D\"><span>D by thinking about the actions of others.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> The writer states that the most common motive for watching sport is to</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"><span>A improve personal performance.</span></label> <label><input name=\"q9\" type=\"radio\" value=\"B\"><span>B feel linked with people of different nationalities.</span></label> <label><input name=\"q9\" type=\"radio\" value=\"C\"><span>C experience strong positive emotions.</span></label> <label><input name=\"q9\" type=\"radio\" value=\"D\"><span>D realize what skill consists of.</span></label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"yes_no_not_given","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<ul style=\"list-style: none; padding-left: 0;\">\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>36</strong> Inexpert sports players are too aware of what they are doing.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> Monkeys have a more complex mirror neuron system than humans.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> Looking at a photograph can activate mirror neurons.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> Gastaut and Bert were both researchers and sports players.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> The mu system is at rest when we are engaged in an activity.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
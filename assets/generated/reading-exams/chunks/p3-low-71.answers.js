@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-71", "answers", {"answerKey":{"q1":"E","q2":"H","q3":"B","q4":"C","q5":"E","q6":"H","q7":"B","q8":"B","q9":"A","q10":"C","q11":"C","q12":"B","q13":"C","q14":"A"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-71", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-71","meta":{"title":"Sea Change for Salinity 土地盐碱化","category":"P3","frequency":"low","pdfFilename":"162. P3 - Sea Change for Salinity 土地盐碱化.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/162. P3 - Sea Change for Salinity 土地盐碱化/","legacyFilename":"162. P3 - Sea Change for Salinity 土地盐碱化.html","questionIntroHtml":""},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/162. P3 - Sea Change for Salinity 土地盐碱化/162. P3 - Sea Change for Salinity 土地盐碱化.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/162. P3 - Sea Change for Salinity 土地盐碱化/162. P3 - Sea Change for Salinity 土地盐碱化.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.632Z","notes":"signature:radio,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-71", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>Sea Change for Salinity</h2>\n<h4>One of the most serious problems facing Australian farmers is an increase in the salt content in the soil. However, there are new weapons emerging in the fight against salinity.</h4>\n<p><strong>A</strong> Beneath the flat, impassive surface of Australia lie hidden mountains, valleys and gorges – ancient traps and channels for the deadly salt that is stealthily killing so much of the Australian landscape. The war on salt is calling forth new weapons. A suite of high technologies used by geologists to see underground and prospect for gold and minerals is now being used to pinpoint the presence of salt beneath the landscape, and to predict where it might move.</p>\n<p><strong>B</strong> Unless this process is clearly understood, warns Chief of Exploration and Mining Dr Neil Phillips, the hard work now underway of planning and tree-planting on the surface may be rendered ineffective: salt can still sneak past and erupt, following one of the ancient river channels formed millions of years ago. The use of airborne electromagnetics to detect salt hidden beneath the landscape has been around for a decade, but the past two years have seen a major development in its precision and powers of detection. Like the use of radar in battles, it has the potential to turn the tide of the struggle in favour of the defence by helping to pinpoint, plot and predict the movements of the foe.</p>\n<p><strong>C</strong> Angus Howell, who farms near Warrenbayne, in Southeast Australia, saw his first outbreak of salt in 1948. Over the ensuing decades the patches spread and multiplied until they consumed almost 100 hectares. By the late 1970s, Howell and his fellow farmers had decided it was time for action and established a government-funded “Landcare” group in a bid to save Australia's farmland. But despite a mounting effort by scientists, farmers and governments, the “white death” continued to encroach. Small successes were eclipsed by larger defeats and fresh outbreaks.</p>\n<p><strong>D</strong> \"The technical solutions just aren't there yet for dealing with broadacre salinity, nor are the social and economic solutions. How do you introduce the land-use changes that are needed when people still need to make a living?” Howell asks. There is no satisfactory solution yet. Part of the problem has lain in salt's ability to mount ambushes, emerging somewhere new, sometimes unexpected and unexplained, beating plans to intercept it. Only now are scientists starting to really disclose its secret subterranean stores and passages.</p>\n<p><strong>E</strong> The need for such knowledge is pressing. Salt has already afflicted six million hectares of once-productive country. At present rates, it is predicted that, by 2050, it will have sterilised a total of 17 million hectares and the waters of Australia's Murray River will regularly exceed the World Health Organisation's salt limits for drinking water. Defeating this assault may take centuries, not decades.</p>\n<p><strong>F</strong> Electromagnetic surveys measure the electrical conductivity of soil to reveal the distribution of salt and the nature and variability of the regolith – the weathered rock and sediment that may lie above the bedrock. Magnetic surveys measure small differences in the Earth's magnetic field, enabling scientists to probe the deep past and reconstruct ancient landscapes – rivers, basins and faults now buried under tens of metres of sediment. These features help to reveal where groundwater is stored, dictate the direction of groundwater movement, and are critical to predicting or ruling out salinity hot-spots.</p>\n<p><strong>G</strong> Radiometric analysis is based on the detection of radiation emitted by elements contained in rocks and soils, allowing scientists to delineate landforms. These factors influence the mobility of salt through the soil profile and help determine where to plant particular crop species to tackle the problem. Using data from the Murray River region, scientists have revealed a network of ancient drainage systems that channelled water beneath the current land-surface. These buried channels may carry salt and sometimes run at right angles to channels on the surface. This implies that the salt could move underground in quite a different direction to what one would expect by looking at surface slope and drainage.</p>\n<p><strong>H</strong> One of the biggest advances in detection, says Professor Neil Phillips, has come with the integration of different techniques such as magnetics, electromagnetics and radiometrics, and ground mapping. Individually, these technologies only gave clues to what was going on underground. Together they provide a far more revealing picture of the subsurface landscape, several hundred metres deep. Advanced airborne electromagnetics, in particular, enables scientists to take “slices” of the landscape at depths of five metres, ten metres, fifteen metres and so on, to determine where salt may be stored at depth. This is building up a four-dimensional picture of the subsurface landscape, enabling researchers to understand movements of salt in length, breadth, depth and time. From such technologies it will be possible to locate salt stores, identify how saline they are, look at man-made and natural changes to the landscape that may cause it to mobilise, and then predict where it will head to and over what time span. This in turn will give the salt warriors time to model various ways of containing or curbing the menace, see what works best and then try it out on the ground.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-71", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 27–33</h4>\n<p>Reading Passage 3 has eight sections, <strong>A–H</strong>.</p>\n<p>Which section contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–H</strong>, in the boxes on your answer sheet.<br><strong>NB</strong> You may use any letter more than once.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>27</strong> a prediction of the future risk of salt to water supplies.</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>28</strong> the reason why technologies must be combined to be effective.</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>29</strong> a reference to the recent improvements in the accuracy of airborne electromagnetics.</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>30</strong> the organization of concerned farmers into an official body.</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>31</strong> the estimated length of time salinity is likely to be a problem.</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>32</strong> a summary of stages in a proposed plan of action to combat the salt problem.</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td><td><input type=\"radio\" name=\"q6\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>33</strong> the possibility that current re-vegetation practices are a waste of time.</td>\n<td><input type=\"radio\" name=\"q7\" value=\"A\"></td><td><input type=\"radio\" name=\"q7\" value=\"B\"></td><td><input type=\"radio\" name=\"q7\" value=\"C\"></td><td><input type=\"radio\" name=\"q7\" value=\"D\"></td><td><input type=\"radio\" name=\"q7\" value=\"E\"></td><td><input type=\"radio\" name=\"q7\" value=\"F\"></td><td><input type=\"radio\" name=\"q7\" value=\"G\"></td><td><input type=\"radio\" name=\"q7\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-anchor\">\n<h4>Questions 34–36</h4>\n<p>Look at the list of techniques (Questions 34–36) and the list of uses which follows it.</p>\n<p>Match each technique with the correct use, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<p><em>Write the correct letter, <strong>A, B, C</strong> or <strong>D</strong>, in the boxes on your answer sheet.</em></p>\n<div class=\"list-box\">\n<h5>List of uses</h5>\n<ul>\n<li><strong>A</strong> can help farmers choose the best location for plants.</li>\n<li><strong>B</strong> can show the composition of the top layer of the ground.</li>\n<li><strong>C</strong> can detect how far below ground the salt is.</li>\n<li><strong>D</strong> can determine how old the salt is in a particular area.</li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Electromagnetic surveys</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 12px; flex-wrap: wrap;\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"><span>A</span></label> <label><input name=\"q8\" type=\"radio\" value=\"B\"><span>B</span></label> <label><input name=\"q8\" type=\"radio\" value=\"C\"><span>C</span></label> <label><input name=\"q8\" type=\"radio\" value=\"D\"><span>D</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Radiometric analysis</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 12px; flex-wrap: wrap;\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"><span>A</span></label> <label><input name=\"q9\" type=\"radio\" value=\"B\"><span>B</span></label> <label><input name=\"q9\" type=\"radio\" value=\"C\"><span>C</span></label> <label><input name=\"q9\" type=\"radio\" value=\"D\"><span>D</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> Airborne electromagnetics</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 12px; flex-wrap: wrap;\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"><span>A</span></label> <label><input name=\"q10\" type=\"radio\" value=\"B\"><span>B</span></label> <label><input name=\"q10\" type=\"radio\" value=\"C\"><span>C</span></label> <label><input name=\"q10\" type=\"radio\" value=\"D\"><span>D</span></label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"single_choice","questionIds":["q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>37</strong> What link does the writer make between salt and gold?</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"><span>A They can both be found in the same locations.</span></label> <label><input name=\"q11\" type=\"radio\" value=\"B\"><span>B Both have been found to have an impact on the landscape.</span></label> <label><input name=\"q11\" type=\"radio\" value=\"C\"><span>C The same techniques can be used to find both.</span></label> <label><input name=\"q11\" type=\"radio\" value=\"D\"><span>D Neither is present in mountainous areas.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> What is the 'process' referred to in Section B?</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"A\"><span>A the killing of vegetation by salt</span></label> <label><input name=\"q12\" type=\"radio\" value=\"B\"><span>B salt's ability to travel below ground</span></label> <label><input name=\"q12\" type=\"radio\" value=\"C\"><span>C the ability of trees to decrease salt levels</span></label> <label><input name=\"q12\" type=\"radio\" value=\"D\"><span>D the detection of salt by tracing other minerals</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> According to Angus Howell, one problem in the fight against salinity is that</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"><span>A not enough farmers are concerned about the fight.</span></label> <label><input name=\"q13\" type=\"radio\" value=\"B\"><span>B farmers' requests for help have been ignored.</span></label> <label><input name=\"q13\" type=\"radio\" value=\"C\"><span>C some possible measures may cause farmers to lose income.</span></label> <label><input name=\"q13\" type=\"radio\" value=\"D\"><span>D the government has not provided farmers with sufficient financial support.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> Which of the following best describes the writer's view of the salinity problem in Australia?</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"A\"><span>A Farmers are fighting an enemy that moves secretly and hides well.</span></label> <label><input name=\"q14\" type=\"radio\" value=\"B\"><span>B Farmers have been able to contain this enemy in a small area.</span></label> <label><input name=\"q14\" type=\"radio\" value=\"C\"><span>C Farmers have already had significant success in fighting this problem.</span></label> <label><input name=\"q14\" type=\"radio\" value=\"D\"><span>D Farmers need to form more organised groups to solve this problem.</span></label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
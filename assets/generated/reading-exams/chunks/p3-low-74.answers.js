@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-74", "answers", {"answerKey":{"q1":"D","q2":"A","q3":"H","q4":"B","q5":"G","q6":"D","q7":"A","q8":"D","q9":"NO","q10":"NOT GIVEN","q11":"YES","q12":"YES","q13":"NOT GIVEN","q14":"YES"}});
+})(typeof window !== "undefined" ? window : globalThis);
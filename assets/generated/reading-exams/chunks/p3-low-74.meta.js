@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-74", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-74","meta":{"title":"The Placebo Effect5 安慰剂效应","category":"P3","frequency":"low","pdfFilename":"165. P3 - The Placebo Effect5 安慰剂效应.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/165. P3 - The Placebo Effect5 安慰剂效应/","legacyFilename":"165. P3 - The Placebo Effect5 安慰剂效应.html","questionIntroHtml":""},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/165. P3 - The Placebo Effect5 安慰剂效应/165. P3 - The Placebo Effect5 安慰剂效应.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/165. P3 - The Placebo Effect5 安慰剂效应/165. P3 - The Placebo Effect5 安慰剂效应.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.641Z","notes":"signature:radio,textarea,select,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
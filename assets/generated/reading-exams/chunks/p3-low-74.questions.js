@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-74", "questions", {"questionGroups":[{"groupId":"group-1","kind":"short_answer","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Complete each sentence with the correct ending, <strong>A–H</strong>, below.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> An appointment with an alternative practitioner\n<select name=\"q1\" class=\"sentence-completion-select\">\n<option value=\"\">Select...</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option>\n</select>\n</p>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> An alternative practitioner's explanation of their treatment\n<select name=\"q2\" class=\"sentence-completion-select\">\n<option value=\"\">Select...</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option>\n</select>\n</p>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> If alternative practitioners have faith in their treatment, they\n<select name=\"q3\" class=\"sentence-completion-select\">\n<option value=\"\">Select...</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option>\n</select>\n</p>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Quite often, a patient's illness\n<select name=\"q4\" class=\"sentence-completion-select\">\n<option value=\"\">Select...</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option>\n</select>\n</p>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> Conventional doctors are aware of the placebo effect and they\n<select name=\"q5\" class=\"sentence-completion-select\">\n<option value=\"\">Select...</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option>\n</select>\n</p>\n</div>\n<div class=\"endings-list\">\n<ul>\n<li><strong>A</strong> should be easy to understand</li>\n<li><strong>B</strong> can improve without treatment</li>\n<li><strong>C</strong> can cost the patient less</li>\n<li><strong>D</strong> ought to last a minimum length of time</li>\n<li><strong>E</strong> can require a range of different products</li>\n<li><strong>F</strong> can be described as serious</li>\n<li><strong>G</strong> should give it greater recognition</li>\n<li><strong>H</strong> should be able to get a high income</li>\n</ul>\n</div>\n</div>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-anchor\">\n<h4>Questions 32–34</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>32</strong> In the third paragraph, the writer says that the placebo effect</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"A\"><span>A works best in tablet form.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"B\"><span>B is a new type of medical treatment.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"C\"><span>C is trusted more by some patients than by others.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"D\"><span>D has a significant role in both alternative and conventional medicine.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> A reference is made to anger and sadness in order to show that</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"><span>A personal feelings can alter our physical condition.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"B\"><span>B some human behaviour has no clear explanation.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"C\"><span>C placebos, like emotions, are experienced by everyone.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"D\"><span>D people find some physical reactions hard to control.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Research on pain control attracts most of the attention because</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"><span>A Only a limited amount of research has been conducted so far.</span></label> <label><input name=\"q8\" type=\"radio\" value=\"B\"><span>B Scientists have discovered that endorphins can help to reduce pain.</span></label> <label><input name=\"q8\" type=\"radio\" value=\"C\"><span>C Pain-reducing agents might also be involved in the placebo effect.</span></label> <label><input name=\"q8\" type=\"radio\" value=\"D\"><span>D Patients often experience pain and like to complain about it.</span></label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"yes_no_not_given","questionIds":["q9","q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-14-anchor\">\n<h4>Questions 35–40</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<ul style=\"list-style: none; padding-left: 0;\">\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>35</strong> Scientists now have enough information to understand how the placebo effect becomes active in people.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> As a result of experiments, some painkillers have been taken off the market.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> Individual preference can have an impact on the effectiveness of different brands of headache tablets.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> Doctors expressed a range of views on the drug chlorpromazine when it was first introduced.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> Ernst's study had a big influence on doctors' behaviour with patients.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> Alternative practitioners work in a way that is likely to trigger the placebo effect.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-76", "answers", {"answerKey":{"q1":"A","q2":"B","q3":"G","q4":"E","q5":"C","q6":"G","q7":"F","q8":"FALSE","q9":"NOT GIVEN","q10":"TRUE","q11":"NOT GIVEN","q12":"NOT GIVEN","q13":"TRUE","q14":"TRUE"}});
+})(typeof window !== "undefined" ? window : globalThis);
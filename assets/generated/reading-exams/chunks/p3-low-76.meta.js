@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-76", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-76","meta":{"title":"Sign, Baby, Sign! 美国手语","category":"P3","frequency":"low","pdfFilename":"167. P3 - Sign, Baby, Sign! 美国手语.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/167. P3 - Sign, Baby, Sign! 美国手语/","legacyFilename":"167. P3 - Sign, Baby, Sign! 美国手语.html","questionIntroHtml":""},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/167. P3 - Sign, Baby, Sign! 美国手语/167. P3 - Sign, Baby, Sign! 美国手语.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/167. P3 - Sign, Baby, Sign! 美国手语/167. P3 - Sign, Baby, Sign! 美国手语.pdf","ieltsHtml":"IELTS/P3/Sign, Baby, Sign!.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.643Z","notes":"signature:radio,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
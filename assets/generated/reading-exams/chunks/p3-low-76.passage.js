@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-76", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>Sign, Baby, Sign!</h2>\n<p><strong>A</strong> Language is a powerful tool that humans use for a wide variety of purposes—from expressing emotions and sharing ideas to passing down cultural values and acquiring knowledge. It is not limited to spoken words; gestures, facial expressions, and even posture all contribute to how we communicate. Language, whether signed or spoken, plays a vital role in how we engage with the world around us.</p>\n<p><strong>B</strong> In recent years, many American schools have begun to recognize American Sign Language (ASL) as a valid foreign language credit, just like Spanish or French. This change has opened the door for hearing students to choose ASL as an academic subject, which not only gives them a practical skill but also increases their awareness of and empathy toward the Deaf community. Some educators believe this early exposure may even influence students to pursue careers in special education, speech therapy, or interpreting.</p>\n<p><strong>C</strong> One clear benefit of learning ASL for hearing children is the opportunity for broader social interaction. Children who understand ASL can communicate with deaf peers, making their social circles more inclusive. Additionally, they may find it easier to express complex ideas or emotions non-verbally, which is helpful in noisy environments or when verbal speech isn't possible.</p>\n<p><strong>D</strong> Dr. Marilyn Daniels, a researcher and advocate for baby sign language, has spent over two decades studying the impact of signing on early communication. While she promotes the use of sign language with infants, she emphasizes that there is no need for parents to invent their own signs. Instead, she suggests that parents use ASL or another standardized system to ensure consistency and eventual recognition by others.</p>\n<p><strong>E</strong> Very young children often develop motor skills before verbal skills. Dr. Daniels notes that even babies as young as six months can learn to use simple signs like “milk” or “more” with their hands, long before they can articulate those words. This early form of communication can reduce frustration—for both babies and their parents—and may even accelerate speech development.</p>\n<p><strong>F</strong> Studies have shown that hearing children exposed to sign language from an early age tend to have stronger reading skills by the time they enter primary school. It is believed that learning sign language can strengthen understanding of symbolic representation and grammar, both of which are foundational to literacy. These cognitive advantages suggest that signing benefits not only communication but academic success as well.</p>\n<p><strong>G</strong> There remains some debate about the best approach to language instruction for deaf children. Some educators argue that speech and lip-reading should come first, while others advocate for immediate exposure to sign language. Dr. Daniels believes the latter is more effective and less frustrating for the child. She calls the idea that children must learn to lip-read before learning sign language “an outdated notion.” She, along with other advocates, stresses that deaf children have a right to a full, accessible language from birth—and that language is often sign.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-78", "answers", {"answerKey":{"q1":"D","q2":"C","q3":"D","q4":"D","q5":"NOT GIVEN","q6":"NO","q7":"NOT GIVEN","q8":"NO","q9":"YES","q10":"B","q11":"F","q12":"I","q13":"A","q14":"C"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-78", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-78","meta":{"title":"The Costs of Brand Loyalty 品牌忠诚的代价","category":"P3","frequency":"low","pdfFilename":"169. P3 - The Costs of Brand Loyalty 品牌忠诚的代价.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/169. P3 - The Costs of Brand Loyalty 品牌忠诚的代价/","legacyFilename":"169. P3 - The Costs of Brand Loyalty 品牌忠诚的代价.html","questionIntroHtml":""},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/169. P3 - The Costs of Brand Loyalty 品牌忠诚的代价/169. P3 - The Costs of Brand Loyalty 品牌忠诚的代价.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/169. P3 - The Costs of Brand Loyalty 品牌忠诚的代价/169. P3 - The Costs of Brand Loyalty 品牌忠诚的代价.pdf","ieltsHtml":"IELTS/P3/The Costs of Brand Loyalty.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.646Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-78", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>The Costs of Brand Loyalty</h2>\n<p>A Londoner with a sudden urge for giant African snails could do worse than head to the bustling marketplace in Brixton, a part of south London that is home to many people from Africa. Markets like Brixton Market that cater to migrants are a testament to the fact that people often retain very strong preferences for the kinds of food they grew up eating. Just ask the expatriate Britons who flock to ‘Tea and Sympathy' in New York's Greenwich Village for pots of Marmite, a yeast-based spread whose delights baffle other nationalities (and many of their own compatriots).</p>\n<p>Past research has shown that people are often willing to pay much more for a favoured brand than for seemingly identical alternatives. It is not always obvious why. However, there is ample evidence to support the theory that certain food preferences form in childhood. Children have a predisposition to fear new foods, which is only overcome when they are repeatedly presented with, and encouraged to consume, a particular food. Evidence shows that children's instinctive wariness of new foods dates back to the times when humans had to forage for food, and it was important that they learnt which foods were safe to eat. In the modern world, people routinely express a strong liking for a brand even though they are unable to tell the brand apart from rival brands in blind tests, and many studies have found that advertising alone cannot explain the strength of brand loyalty.</p>\n<p>A new study by economists from the universities of Tilburg and Chicago tracks the consumption patterns of 38,000 US households over two years, and confirms the theory that such brand loyalty is widespread, deep and long-lasting. There were clear local patterns in consumption, although the same brands were available everywhere. But 16% of people studied were migrants: they had grown up in one state and moved to another. These migrants had the same options, in terms of what was on offer and at what price, as everyone else in their adopted home, but although they consumed local favourites, they bought fewer than longtime residents. This gap between purchases of migrants and those of the locally born was quite stubborn: although it faded the longer a person lived in their new state, it still took 20 years to halve in magnitude. Even 50 years on, it was still large enough to show up in the data. This could mean that the benefits of being the first brand into a market could last longer than might be assumed.</p>\n<p>David Atkin of Yale University has identified some important implications of local food favourites. He suggests in a recent paper that the effects of people being loyal to known brands may also lead economists to rethink the way they calculate the benefits resulting from trade. This is because opening up to trade is in some ways very similar to migrating, as it changes the composition and prices of the foods that are available to a person. In particular, trade can cause local foods to become relatively more expensive. Atkin's data show something many economists do not take into account: when a traditional food has to compete with imported foods, it may no longer be the cheapest food available for people to choose to eat. Atkin decided to look at this situation in the context of developing countries.</p>\n<p>To illustrate his point, Atkin uses detailed data about people's food choices in India. India is a good choice because it covers a large number of climatic zones where different specialised crops are grown. Despite being part of the same country, the prevalence of internal barriers to trade means that its regions are best thought of as being only partially open to trade. Atkin's data show that the foods a region specialises in producing are instead cheaper in that region.</p>\n<p>However, there has been some opening up of internal trade in India in recent years, and this has revealed that for every rupee spent on food, people's intake of calories declined most in regions where prices of local favourite foods had risen. In theory, when there is a greater choice of types of food, people should adjust their food habits and purchase the cheapest option so that they boost their calorie intake. However, in practice, food habits mean that consumers keep buying the things they know and like even though these foods have become relatively expensive. Atkin calculates that if all barriers to internal trade in India were abolished, the average Indian household would have to generate a rise of 3.3 percent in income to maintain their calorie intake.</p>\n<p>In developing countries where there is a high prevalence of undernutrition, such as in sub-Saharan Africa, the habit of continuing to eat favourite foods could have a serious effect on development. There is clear evidence that nutritional shortfalls in children can affect their ability to work and earn as adults, and also have detrimental effects on their long-term health.</p>\n<p>Consequently, the nutritional declines that can occur as a result of the opening up of trade are of serious concern, because an entire generation that is malnourished as children will continue to suffer irreversible consequences for the rest of their lives, which could hinder the development of their country due to a lack of a quality workforce.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-78", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> In the first paragraph, the writer's purpose is to</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"><span>A show that London has a multicultural society.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"B\"><span>B point out that people grow up eating food from markets.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"C\"><span>C give examples of the wide variety of food available in Britain.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"D\"><span>D illustrate the way adults enjoy eating food from their childhood.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Economists from the universities of Tilburg and Chicago found that people who have migrated from one American state to another</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"><span>A were poorer than longtime residents of the new state.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"B\"><span>B sometimes returned to their home states to buy their favourite foods.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"C\"><span>C bought only some of the brands which were popular in their new state.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"D\"><span>D were particularly sensitive to price increases on food items.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Atkin's research shows that</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"><span>A trade makes favourite foods hard to find.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"B\"><span>B trade results in increasing levels of migration.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"C\"><span>C imported food is of a higher quality than local food.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"D\"><span>D economists fail to understand all the effects of increased trade.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> The writer thinks Atkin was wise to choose India for his study because</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"><span>A trade barriers create food shortages between regions.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"B\"><span>B food is cheap in India in comparison to developed countries.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"C\"><span>C cultural variation results in a wide range of food preferences.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"D\"><span>D the varying weather patterns have resulted in regional crop types.</span></label>\n</div>\n</div>\n</div>"},{"groupId":"group-2","kind":"yes_no_not_given","questionIds":["q5","q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n<h4>Questions 31–35</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<ul style=\"list-style: none; padding-left: 0;\">\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>31</strong> The Tilburg and Chicago study shows that brand loyalty is greater in some states of the United States than in others.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> The study shows that the differences in shopping habits between migrants and native residents increased in the first 20 years.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> First brands to enter a new market only hold their advantage if they are supported by advertising.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Atkin originally chose India as a case study because trade within the country was unrestricted.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> In India, if a region focuses on certain foods, the cost of those foods remains comparatively low.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete the summary using the list of words and phrases, <strong>A–I</strong>, below.</p>\n<div class=\"summary-box\">\n<h5>Food habits and trade in developing countries</h5>\n<div class=\"summary-text\">\n<p>Trade is not always beneficial for the citizens of developing countries. Data show that a wider <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span> of foods does not necessarily result in a corresponding <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span> in the amount of calories in people's diets. This is because people's <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> on continuing to eat the foods they grew up eating could result in insufficient calories in their diets if the cost of these foods rises as a result of more open trade conditions. This is especially true in countries where adequate <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span> is already a problem and could result in a whole section of society being unable to contribute fully to their country's <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span> in the future.</p>\n</div>\n</div>\n<div id=\"word-options\">\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A nutrition</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B range</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C progress</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D dislike</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E incentive</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F increase</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G independence</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H production</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I insistence</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-83", "answers", {"answerKey":{"q1":"D","q2":"F","q3":"B","q4":"C","q5":"B","q6":"G","q7":"scalp electrodes","q8":["inspiration","elaboration"],"q9":"alpha waves","q10":"difference","q11":"FALSE","q12":"NOT GIVEN","q13":"TRUE","q14":"NOT GIVEN"}});
+})(typeof window !== "undefined" ? window : globalThis);
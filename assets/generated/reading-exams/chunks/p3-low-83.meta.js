@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-83", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-83","meta":{"title":"1018纸笔 Looking for inspiration 寻找灵感","category":"P3","frequency":"low","pdfFilename":"173. 1018纸笔 P3 - Looking for inspiration 寻找灵感.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/173. 1018纸笔 P3 - Looking for inspiration 寻找灵感/","legacyFilename":"173. 1018纸笔 P3 - Looking for inspiration 寻找灵感.html","questionIntroHtml":""},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/173. 1018纸笔 P3 - Looking for inspiration 寻找灵感/173. 1018纸笔 P3 - Looking for inspiration 寻找灵感.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/173. 1018纸笔 P3 - Looking for inspiration 寻找灵感/173. 1018纸笔 P3 - Looking for inspiration 寻找灵感.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-11T14:43:22.142Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-83", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p class=\"instructions\">Look at the following statements (Questions 27–32) and the list of people below.<br>Match each statement with the correct person, <strong>A–G</strong>.</p>\n<p class=\"instructions\"><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>27</strong> Creative people are receptive to the immense amounts of information that the brain has to deal with.</p>\n<div class=\"match-dropzone\" data-question=\"q1\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>28</strong> Creativity requires numerous parts of the brain to be active at the same time.</p>\n<div class=\"match-dropzone\" data-question=\"q2\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>29</strong> Creative people engage in, and are well informed about, a wide range of subjects.</p>\n<div class=\"match-dropzone\" data-question=\"q3\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>30</strong> Creative people may have unstable personalities.</p>\n<div class=\"match-dropzone\" data-question=\"q4\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>31</strong> Creative people are driven to achieve the goals they set themselves.</p>\n<div class=\"match-dropzone\" data-question=\"q5\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>32</strong> Creative people need support from others.</p>\n<div class=\"match-dropzone\" data-question=\"q6\"></div>\n</div>\n<div class=\"options-pool\" id=\"people-options-pool\">\n<strong>List of People</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"person-A\" draggable=\"true\" data-option=\"A\">A Paul Torrance</div>\n<div class=\"drag-item\" id=\"person-B\" draggable=\"true\" data-option=\"B\">B Mark Runco</div>\n<div class=\"drag-item\" id=\"person-C\" draggable=\"true\" data-option=\"C\">C Kay Redfield Jamison</div>\n<div class=\"drag-item\" id=\"person-D\" draggable=\"true\" data-option=\"D\">D Jordan Peterson</div>\n<div class=\"drag-item\" id=\"person-E\" draggable=\"true\" data-option=\"E\">E Colin Martindale</div>\n<div class=\"drag-item\" id=\"person-F\" draggable=\"true\" data-option=\"F\">F Guy Claxton</div>\n<div class=\"drag-item\" id=\"person-G\" draggable=\"true\" data-option=\"G\">G Vera John-Steiner</div>\n</div>\n</div>\n</div>","allowOptionReuse":true},{"groupId":"group-2","kind":"summary_completion","questionIds":["q7","q8","q9","q10"],"bodyHtml":"<div class=\"group summary-completion\" id=\"q7-8-9-10-anchor\">\n<h4>Questions 33–36</h4>\n<p class=\"instructions\">Complete the summary below.<br>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<p>\nColin Martindale carried out research into the creative brain at work. For his study, volunteers had a series of <strong>33</strong> <input name=\"q7\" type=\"text\" id=\"q33_input\"> placed on their heads which were used to monitor brain activity while they made up stories. Martindale demonstrated that creativity consisted of <strong>34</strong> <input name=\"q8\" type=\"text\" id=\"q34a_input\"> and <input name=\"q8\" type=\"text\" id=\"q34b_input\"> phases. In the first of these, the brain was mostly inactive except for <strong>35</strong> <input name=\"q9\" type=\"text\" id=\"q35_input\">, and this corresponds to what takes place during dreaming or relaxation. In the second phase, when the volunteers worked on their stories, however, their brains became a lot busier. Interestingly, the most creative stories were produced by those volunteers with the greatest <strong>36</strong> <input name=\"q10\" type=\"text\" id=\"q36_input\"> in brain activity between the two phases.\n</p>\n</div>"},{"groupId":"group-3","kind":"true_false_not_given","questionIds":["q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p class=\"instructions\">Do the following statements agree with the information given in Reading Passage 3?</p>\n<div class=\"question-item\">\n<p><strong>37</strong> People with very high IQs are more likely to be creative than those with average IQs.</p>\n<div class=\"radio-options tfng-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"TRUE\"><span>TRUE</span></label> <label><input name=\"q11\" type=\"radio\" value=\"FALSE\"><span>FALSE</span></label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> Society tends to value aesthetic skills highly.</p>\n<div class=\"radio-options tfng-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"TRUE\"><span>TRUE</span></label> <label><input name=\"q12\" type=\"radio\" value=\"FALSE\"><span>FALSE</span></label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> There can be disadvantages to having a creative personality.</p>\n<div class=\"radio-options tfng-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"TRUE\"><span>TRUE</span></label> <label><input name=\"q13\" type=\"radio\" value=\"FALSE\"><span>FALSE</span></label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> Language skills are more important than spatial awareness in any form of creativity.</p>\n<div class=\"radio-options tfng-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"TRUE\"><span>TRUE</span></label> <label><input name=\"q14\" type=\"radio\" value=\"FALSE\"><span>FALSE</span></label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
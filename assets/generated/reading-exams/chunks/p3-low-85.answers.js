@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-85", "answers", {"answerKey":{"q1":"NO","q2":"NOT GIVEN","q3":"NO","q4":"YES","q5":"NO","q6":"YES","q7":"D","q8":"A","q9":"B","q10":"F","q11":"D","q12":"C","q13":"B","q14":"H"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-85", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-85","meta":{"title":"Music soothes and awes 音乐疗愈","category":"P3","frequency":"low","pdfFilename":"175. P3 - Music soothes and awes 音乐疗愈.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/175. P3 - Music soothes and awes 音乐疗愈/","legacyFilename":"175. P3 - Music soothes and awes 音乐疗愈.html","questionIntroHtml":""},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/175. P3 - Music soothes and awes 音乐疗愈/175. P3 - Music soothes and awes 音乐疗愈.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/175. P3 - Music soothes and awes 音乐疗愈/175. P3 - Music soothes and awes 音乐疗愈.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-11T14:43:22.148Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-85", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>Music soothes and awes – and may help us heal</h2>\n<h4>Tapping into the brain's ability to process music, researchers are using songs and sounds in novel ways</h4>\n<p>Dan Ellsey, 33, was sitting in his wheelchair, his virtually useless arms and weak torso strapped to the chair for safety. As we were introduced, he arched his back, grinned broadly and aimed the power of his dark brown eyes at me, as if eye contact were his only means of transcending the prison of his body.</p>\n<p>But it isn't. In the last few years, Ellsey, who was born with cerebral palsy, has discovered another, almost miraculous way of expressing himself: composing music with a special computerized system called Hyperscore. For Ellsey, as for most human beings, music has almost inexplicable power. It can rouse armies to battle, soothe babies to sleep, communicate peaks of joy and depths of sorrow that mere words cannot.</p>\n<p>Why evolution would have endowed our brains with the neural machinery to make music is a mystery. 'It's unclear why humans are so uniquely sensitive to music. Certainly, music shares many features with spoken language, and our brains are particularly developed to process the rapid tones and segments of sound that are common to both,' said neurologist and author Dr Oliver Sacks, whose latest book is <i>Musicophilia: Tales of Music and the Brain</i>. 'Some researchers,' he added in an e-mail interview, ‘think that in primitive cultures, music and speech were not distinct. Other researchers debate which came first in evolution, speech or song.' What is clear is that the brain is abundantly wired to process music.</p>\n<p>Scientists at the Montreal Neurological Institute and Hospital, for instance, have found dramatic evidence on brain scans that the chills, or visceral feelings of awe, that people report when listening to their favorite music are real. Reactions to music appear to vary greatly. Music that a person likes, but not music that is disliked, activates the higher thinking centers in the brain's cortex and, perhaps more importantly, the 'ancient circuitry, the motivation and reward system,' according to experimental psychologist Robert Zatorre, a member of the Montreal team. This primeval part of the brain also governs basic drives such as hunger, thirst and sex, suggesting that the brain may consider music on a par with them.</p>\n<p>Music has the power not just to awe but also to heal. If a person has a stroke on the left side of the brain, where the speech centers in most people are, that 'wipes out a major part of communication,' said Dr Gottfried Schlaug, chief of the Cerebrovascular Disorders Division and Stroke Recovery Laboratory at Beth Israel Deaconess Medical Center. But if the right side, where a lot of music is processed, is intact, some stroke patients can use melodic intonation therapy, which involves singing using two tones relatively close in pitch, to communicate. Schlaug's research suggests that with intensive therapy, some patients can even move from this two-tone singing back to actual speech.</p>\n<p>Stroke patients with gait problems also profit from music therapy. At the Center for Biomedical Research in Music at Colorado State University in Fort Collins, director Michael Thaut and his team have shown that people who are partially paralyzed on one side of the body can be retrained to walk faster and in a more coordinated way if they practice walking rhythmically, cued by music or a metronome. Combining rhythmic training with physical therapy also helps stroke patients recover gait faster. ‘Music helps us organize our movement,' said Kathleen Howland, a music therapist who teaches at Lesley University in Cambridge in the USA. In fact, researchers have found that auditory signals are more powerful than visual signals in coordinating movement in healthy people.</p>\n<p>Patients undergoing colonoscopy seem to feel less pain and need fewer sedative drugs if they listen to music during the procedure, according to several studies. But not all studies have been so clear-cut. A 2007 review by the Cochrane Collaboration, a nonprofit, international organization that evaluates medical research, pooled data from 51 pain studies and concluded that, although listening to music can reduce the intensity of pain and the need for narcotic drugs, the benefit, overall, was small.</p>\n<p>A number of studies, however, show that music therapy can reduce pain, such as a 2001 study on burn patients, whose burns must be frequently scraped to reduce dead tissue. Music therapy may improve mental state and functioning in people with schizophrenia, and communication in children with autistic spectrum disorders, according to Cochrane reviews. Babies, as any parent knows, clearly respond to music. Premature infants who listen to lullabies learn to suck better and gain more weight than those who don't get music therapy. Deforia Lane, director of music therapy at the University Hospitals Ireland Cancer Center in Cleveland, has found an improvement in immune response among hospitalized children who played, sang and created music, compared with children who did not get music therapy. Indeed, the list of potential benefits from music therapy seems long. And for people such as Ellsey, the benefits can be nothing short of liberating.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-85", "questions", {"questionGroups":[{"groupId":"group-1","kind":"yes_no_not_given","questionIds":["q1","q2","q3","q4","q5","q6"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<ul style=\"list-style: none; padding-left: 0;\">\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> Dan Ellsey has been able to communicate through music since he was very young.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Armies respond to music that is loud and rhythmic.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Researchers have determined why people react so emotionally to music.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Both music and speech are composed of sound segments.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> It is clear that song developed more quickly than speech.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> Emotional reactions to music have been scientifically demonstrated.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q7-8-9-anchor\">\n<h4>Questions 33–35</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>33</strong> According to the article, music stimulates higher brain activity when it</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"><span>A provokes hunger.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"B\"><span>B requires thought.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"C\"><span>C is soothing.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"D\"><span>D is pleasing.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> According to Dr Schlaug's research, some stroke patients may regain speech if</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"><span>A they practise making sounds that are close together.</span></label> <label><input name=\"q8\" type=\"radio\" value=\"B\"><span>B they reactivate the left side of the brain.</span></label> <label><input name=\"q8\" type=\"radio\" value=\"C\"><span>C they receive music therapy daily.</span></label> <label><input name=\"q8\" type=\"radio\" value=\"D\"><span>D they listen to tunes in groups.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> According to the Cochrane Collaboration review, some research into the link between music and pain relief suggests</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"><span>A the value of music is underestimated.</span></label> <label><input name=\"q9\" type=\"radio\" value=\"B\"><span>B the value of music may be limited.</span></label> <label><input name=\"q9\" type=\"radio\" value=\"C\"><span>C more studies are needed in these areas.</span></label> <label><input name=\"q9\" type=\"radio\" value=\"D\"><span>D patients welcome this research.</span></label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"matching","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–H</strong>, below.</p>\n<div class=\"match-question-item\">\n<p><strong>36</strong> Burn victims who receive music therapy</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>37</strong> People with schizophrenia who receive music therapy</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>38</strong> Autistic children who receive music therapy</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>39</strong> Premature babies who receive music therapy</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>40</strong> Hospitalised children who receive music therapy</p>\n<div class=\"match-dropzone\" data-question=\"q14\"></div>\n</div>\n<div class=\"options-pool\">\n<strong>List of Endings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A rely less on drugs.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B get heavier.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C exhibit improved social interaction.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D experience psychological benefits.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E sleep more soundly.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F suffer less discomfort.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G accept their situation more easily.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"H\">H have stronger resistance to disease.</div>\n</div>\n</div>\n</div>","allowOptionReuse":false}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
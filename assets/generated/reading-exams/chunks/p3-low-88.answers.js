@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-88", "answers", {"answerKey":{"q1":"E","q2":"H","q3":"B","q4":"semantic equivalence","q5":"purpose","q6":"stylistic","q7":"content","q8":"E","q9":"B","q10":"D","q11":"C","q12":"B","q13":"D","q14":"F"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-88", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-88","meta":{"title":"1025纸笔Translating a key to international understanding 翻译的艺术","category":"P3","frequency":"low","pdfFilename":"178. 1025纸笔P3 - Translating a key to international understanding 翻译的艺术.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/178. 1025纸笔P3 - Translating a key to international understanding 翻译的艺术/","legacyFilename":"178. 1025纸笔P3 - Translating a key to international understanding 翻译的艺术.html","questionIntroHtml":""},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/178. 1025纸笔P3 - Translating a key to international understanding 翻译的艺术/178. 1025纸笔P3 - Translating a key to international understanding 翻译的艺术.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/178. 1025纸笔P3 - Translating a key to international understanding 翻译的艺术/178. 1025纸笔P3 - Translating a key to international understanding 翻译的艺术.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-11T14:43:22.166Z","notes":"signature:radio,checkbox,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-88", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-anchor\">\n<h4>Questions 27–29</h4>\n<p>Reading Passage 3 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, A–H, in boxes 27–29 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 250px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>27</strong> the effect that a client's requirements have on the nature of a translation</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>28</strong> contrasting attitudes towards translators</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>29</strong> a list of the areas of knowledge studied by translators</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q4-5-6-7-anchor\">\n<h4>Questions 30–33</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from paragraphs C, D and E for each answer.</p>\n<div class=\"summary-completion\">\n<h4>The goal of translation</h4>\n<p>\nTranslation is an attempt to create a text in the target language which displays <strong>30</strong> <input name=\"q4\" type=\"text\" id=\"q30_input\"> with a source text. It is inevitable that not all information can be conveyed, however, so translations are best judged according to their <strong>31</strong> <input name=\"q5\" type=\"text\" id=\"q31_input\">; for example, the translator of a business letter or scientific text does not need to consider its <strong>32</strong> <input name=\"q6\" type=\"text\" id=\"q32_input\"> aspects, while someone dubbing a film may give a relatively low value to <strong>33</strong> <input name=\"q7\" type=\"text\" id=\"q33_input\">.\n</p>\n</div>\n</div>"},{"groupId":"group-3","kind":"matching","questionIds":["q8","q9","q10","q11"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-anchor\">\n<h4>Questions 34–37</h4>\n<p>Look at the following features of translating (Questions 34–37) and the types of translation below.</p>\n<p>Match each feature with the correct type of translation, <strong>A–F</strong>.</p>\n<div class=\"match-question-item\">\n<p><strong>34</strong> focuses on reproducing the content accurately</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>35</strong> looks at important cultural aspects of language use</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>36</strong> follows the original grammatical structures as required by the target language</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>37</strong> focuses on meaning without necessarily using the original grammatical structures</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"options-pool\" id=\"translation-options-pool\">\n<strong>Types of Translation</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"type-A\" draggable=\"true\" data-option=\"A\">A aesthetic</div>\n<div class=\"drag-item\" id=\"type-B\" draggable=\"true\" data-option=\"B\">B ethnographic</div>\n<div class=\"drag-item\" id=\"type-C\" draggable=\"true\" data-option=\"C\">C free</div>\n<div class=\"drag-item\" id=\"type-D\" draggable=\"true\" data-option=\"D\">D literal</div>\n<div class=\"drag-item\" id=\"type-E\" draggable=\"true\" data-option=\"E\">E pragmatic</div>\n<div class=\"drag-item\" id=\"type-F\" draggable=\"true\" data-option=\"F\">F word-for-word</div>\n</div>\n</div>\n</div>","allowOptionReuse":false},{"groupId":"group-4","kind":"multi_choice","questionIds":["q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q12-13-14-anchor\">\n<h4>Questions 38–40</h4>\n<p>Choose <strong>THREE</strong> letters, <strong>A–F</strong>.</p>\n<p>Which <strong>THREE</strong> of the following points are mentioned by the writer of the passage?</p>\n<div class=\"checkbox-options mcq\" data-group=\"group1\" data-limit=\"3\">\n<label class=\"mcq-item\" style=\"display:block;\"><input name=\"q12-13-14\" type=\"checkbox\" value=\"A\"><span><strong>A</strong> The objectives of translating are always clearly different from those of interpreting.</span></label> <label class=\"mcq-item\" style=\"display:block;\"><input name=\"q12-13-14\" type=\"checkbox\" value=\"B\"><span><strong>B</strong> A translator may need to consider the culture of the target language.</span></label> <label class=\"mcq-item\" style=\"display:block;\"><input name=\"q12-13-14\" type=\"checkbox\" value=\"C\"><span><strong>C</strong> Translation is an activity which requires professional training.</span></label> <label class=\"mcq-item\" style=\"display:block;\"><input name=\"q12-13-14\" type=\"checkbox\" value=\"D\"><span><strong>D</strong> It is difficult to specify what constitutes a very good translation.</span></label> <label class=\"mcq-item\" style=\"display:block;\"><input name=\"q12-13-14\" type=\"checkbox\" value=\"E\"><span><strong>E</strong> The skill required for translation is increasingly gaining recognition.</span></label> <label class=\"mcq-item\" style=\"display:block;\"><input name=\"q12-13-14\" type=\"checkbox\" value=\"F\"><span><strong>F</strong> A translation should give the impression of being an original work.</span></label>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-95", "answers", {"answerKey":{"q1":"D","q2":"C","q3":"C","q4":"A","q5":"NO","q6":"NOT GIVEN","q7":"YES","q8":"NO","q9":"NOT GIVEN","q10":"YES","q11":"G","q12":"F","q13":"I","q14":"J"}});
+})(typeof window !== "undefined" ? window : globalThis);
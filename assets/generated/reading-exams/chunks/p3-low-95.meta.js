@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-95", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-95","meta":{"title":"The strange world of sight 奇异的视觉世界","category":"P3","frequency":"low","pdfFilename":"184. P3 - The strange world of sight 奇异的视觉世界.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/184. P3 - The strange world of sight 奇异的视觉世界/","legacyFilename":"184. P3 - The strange world of sight 奇异的视觉世界.html","questionIntroHtml":""},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/184. P3 - The strange world of sight 奇异的视觉世界/184. P3 - The strange world of sight 奇异的视觉世界.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/184. P3 - The strange world of sight 奇异的视觉世界/184. P3 - The strange world of sight 奇异的视觉世界.pdf","ieltsHtml":"IELTS/P3/The strange world of sight.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.670Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-95", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> Why does the writer refer to Locke and Newton in the first paragraph?</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"><span>A to indicate that his article will cover several scientific fields</span></label> <label><input name=\"q1\" type=\"radio\" value=\"B\"><span>B to stress how much physics has changed in 400 years</span></label> <label><input name=\"q1\" type=\"radio\" value=\"C\"><span>C to persuade the reader to take him seriously</span></label> <label><input name=\"q1\" type=\"radio\" value=\"D\"><span>D to point out that his notions are not new</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> According to the writer, why was Freud's theory of the unconscious mocked?</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"><span>A It was too complex for his contemporaries to understand.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"B\"><span>B It involved criticism of the way people behaved in society.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"C\"><span>C People felt that it devalued the accepted concept of humanity.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"D\"><span>D People assumed that it was intended as a joke.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> The writer describes Mr S failing to get up in order to demonstrate</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"><span>A how realistic most people's memories are.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"B\"><span>B how hard it is to tell dreaming and waking apart.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"C\"><span>C how unusual it is to mistake a perception for a memory.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"D\"><span>D how valuable knowledge of the past can be.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What point is the writer making in the text as a whole?</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"><span>A Perception involves much more than the data collected by the eyes.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"B\"><span>B Learning to see as an adult can be a time-consuming process.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"C\"><span>C Science is failing to devote enough attention to sight.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"D\"><span>D Human perception is remarkably reliable.</span></label>\n</div>\n</div>\n</div>"},{"groupId":"group-2","kind":"yes_no_not_given","questionIds":["q5","q6","q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-9-10-anchor\">\n<h4>Questions 31–36</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<ul style=\"list-style: none; padding-left: 0;\">\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>31</strong> Sydney Bradford relied on recollections of objects he had been told about to help him see after his operation.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> People who only start to see as adults can learn to see as other people do in time.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> People who have gained their sight as adults find certain activities harder to do than before.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> It is evident now that sight involves the eyes and one particular area of the brain.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> The mask experiment is particularly useful in training people who are regaining their sight.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> People with perfect vision can fail to interpret objects correctly under certain circumstances.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Complete the summary using the list of words, <strong>A–J</strong>, below.</p>\n<div class=\"summary-box\">\n<h5>The mask experiment</h5>\n<div class=\"summary-text\">\n<p>\nIn this experiment, having looked at the front of a simple face-mask, subjects look at the reverse. However, the subjects are convinced that they are still looking at a mask which is <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span> in shape. They believe that the <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> is poking out in the normal manner because that is what they are used to seeing. Attempting to make a <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span> of the mask in this orientation leads to the same problem. The subjects fail to see a concave form because of the <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span> they have that the features of a face stick out.\n</p>\n</div>\n</div>\n<div id=\"word-options\">\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A back</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B brain</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C view</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D round</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E sight</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F nose</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G convex</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H hollow</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I drawing</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"J\">J preconception</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-97", "answers", {"answerKey":{"q1":"x","q2":"ii","q3":"ix","q4":"iv","q5":"vii","q6":"viii","q7":"i","q8":"E","q9":"D","q10":"A","q11":"C","q12":"G","q13":"C","q14":"D"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-97", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-97","meta":{"title":"Saving languages 拯救濒危语言","category":"P3","frequency":"low","pdfFilename":"186. P3 - Saving languages 拯救濒危语言.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/186. P3 - Saving languages 拯救濒危语言/","legacyFilename":"186. P3 - Saving languages 拯救濒危语言.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/186. P3 - Saving languages 拯救濒危语言/186. P3 - Saving languages 拯救濒危语言.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/186. P3 - Saving languages 拯救濒危语言/186. P3 - Saving languages 拯救濒危语言.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-11T14:43:22.189Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-97", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>Saving languages</h2>\n<h4>The campaign to keep minority languages alive</h4>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q1\">\n<span class=\"paragraph-heading-label\">Paragraph A (Q27):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> Ten years ago, Michael Krauss, a professor at the University of Alaska, shocked his colleagues in the discipline of linguistics with his prediction that half the 6,000 or so languages spoken in the world would disappear within a century. Krauss founded the Alaskan Native Language Center to preserve as much as possible of the 20 tongues still known to the state's indigenous people. Only two of those languages were being taught to children, and the rest were rapidly falling from use. Other linguists are making similar predictions. A survey in Australia found that 70 of the surviving 90 Aboriginal languages were no longer used regularly by all age groups. The same is true for all but 20 of the other 175 North American languages in the US.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q2\">\n<span class=\"paragraph-heading-label\">Paragraph B (Q28):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> Outwardly, the consolidation of human language might seem like a good trend that could ease ethnic tensions and aid global commerce. Linguists don't deny those benefits, and they acknowledge that small communities often choose to switch to the majority language because they believe it will boost their social or economic status.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q3\">\n<span class=\"paragraph-heading-label\">Paragraph C (Q29):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> Many experts in the field nonetheless mourn the loss of rare languages, for several reasons. Some of the most basic questions in linguistics have to do with the limits of human speech, still far from fully explored. Many researchers would like to know which elements of grammar and vocabulary—if any—are universal. An English researcher, Nicholas Ostler, offers an example: 'Ica, spoken in northern Colombia, seems to have nothing comparable to a personal pronoun system—I, we, you, etc. Otherwise, I would have thought that personal pronouns were a linguistic universal.' Other scientists try to reconstruct ancient migration patterns by comparing borrowed words in otherwise unrelated languages. In each of these cases, the wider the range of languages you study, the more likely you are to get the right answers.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-heading-dropzone match-dropzone\" data-question=\"qD\">\n<span class=\"paragraph-heading-label\">Paragraph D:</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> 'I think the value is mostly in human terms,' says James Matisoff, a specialist in rare Asian languages at the University of California. ‘Language is the most important element in the culture of a community. When it dies, you lose the special knowledge of that culture and a unique window on the world. But despite the constant talk about saving endangered languages over the past ten years, the field of descriptive linguistics has accomplished little in this respect. You would think that there would be some organised response to this situation, some attempt to determine which languages can be saved and which should be documented before they disappear,' says Sarah G. Thomason, of the University of Michigan. ‘But there isn't any such effort.'</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q4\">\n<span class=\"paragraph-heading-label\">Paragraph E (Q30):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> However, there are some signs of progress. The Volkswagen Foundation, a German charity, has created a multimedia archive in the Netherlands that can house recordings, grammars, dictionaries and other data. Contributions from the Ford Foundation have helped a master-apprentice programme, in which fluent speakers receive $3,000 to teach a younger relative their native tongue through shared activities. So far, about 75 teams have completed the programme. ‘It's too early to call this language revitalisation,' admits Leanne Hinton of Berkeley. ‘In California, the death rate of elderly speakers will always be greater than the recruitment rate of young speakers. But if nothing else, we prolong the survival of the language.' This will give linguists more time to record these tongues before they vanish.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q5\">\n<span class=\"paragraph-heading-label\">Paragraph F (Q31):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> Complicating matters, dozens of institutions around the world are setting up digital libraries on endangered languages. This could create chaos, because the projects use non-standardised data formats, terminology and even names of languages. Gary F. Simons, of the Dallas-based research group SIL International, has been working to bring some order to this by building an ‘open languages data community'—a kind of digital card catalogue. This system will allow researchers to check their theories against a vast array of data.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q6\">\n<span class=\"paragraph-heading-label\">Paragraph G (Q32):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>G</strong> However, even if a language has been fully documented, all that remains once it vanishes from use is a fossil skeleton. Linguists may be able to sketch an outline of the language and fix its place on the evolutionary tree, but little more. As yet, there is no discipline of conservation linguistics. Almost every strategy to keep people speaking a language has succeeded in some places but failed in others. One factor that always seems to occur in the death of a language, according to Hans-Jurgen Sasse of the University of Cologne in Germany, is that speakers start regarding their own language as inferior to the majority language. Children pick up on the attitude, and prefer to speak the dominant language. This is how Cornish and some dialects of Scottish Gaelic slipped into extinction.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q7\">\n<span class=\"paragraph-heading-label\">Paragraph H (Q33):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>H</strong> 'Ultimately, the answer to the problem of language extinction is multilingualism,' argues James Matisoff. ‘Even uneducated people can speak a number of languages if they start as children.' Many people in the world are at least bilingual, and in some places it is common to speak three or four languages. But in addition to the fact that children may reject minority languages, there is also the concern that speakers of a majority language may react badly to speakers of minority languages. The first step in saving dying languages may be to persuade the world's majorities to allow the minorities among them to speak with their own voices.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-97", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5","q6","q7"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 27–33</h4>\n<p>Reading Passage 3 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Choose the correct heading for paragraphs <strong>A–C</strong> and <strong>E–H</strong> from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\"><strong>i</strong> The conservation role of majority language speakers</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\"><strong>ii</strong> Some advantages of changing languages</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\"><strong>iii</strong> The loss rate of European languages</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\"><strong>iv</strong> Positive gains of conservation programmes</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\"><strong>v</strong> The economic value of minority languages</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\"><strong>vi</strong> The success rate of language rescue strategies in the past decade</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\"><strong>vii</strong> Improving the consistency of research data</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\"><strong>viii</strong> The potential failure of language conservation</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\"><strong>ix</strong> The value of minority languages to language researchers</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"x\"><strong>x</strong> The current position of minority languages</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q8","q9","q10","q11","q12"],"bodyHtml":"<div class=\"group\" id=\"q8-9-10-11-12-anchor\">\n<h4>Questions 34–38</h4>\n<p>Match each opinion with the correct person, <strong>A–G</strong>.</p>\n<div class=\"match-question-item\">\n<p><strong>34</strong> In the long run, the California scheme will not have enough tutors.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>35</strong> Decisions need to be made about priorities in language rescue.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>36</strong> Languages currently in use face extinction in the foreseeable future.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>37</strong> There is a solution to the problem of languages dying out.</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>38</strong> A language may be dying when its speakers begin to value it less.</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"options-pool\" id=\"people-options-pool\">\n<strong>List of People</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\"><strong>A</strong> Michael Krauss</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\"><strong>B</strong> Nicholas Ostler</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\"><strong>C</strong> James Matisoff</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\"><strong>D</strong> Sarah G Thomason</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\"><strong>E</strong> Leanne Hinton</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\"><strong>F</strong> Gary F Simons</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\"><strong>G</strong> Hans-Jurgen Sasse</div>\n</div>\n</div>\n</div>","allowOptionReuse":false},{"groupId":"group-3","kind":"single_choice","questionIds":["q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q13-14-anchor\">\n<h4>Questions 39 and 40</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>39</strong> The Alaskan Language Center was set up to</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"><span>A teach indigenous languages to children.</span></label> <label><input name=\"q13\" type=\"radio\" value=\"B\"><span>B revive indigenous languages which have fallen from use.</span></label> <label><input name=\"q13\" type=\"radio\" value=\"C\"><span>C prevent further loss of indigenous languages.</span></label> <label><input name=\"q13\" type=\"radio\" value=\"D\"><span>D predict the rate of loss of indigenous languages.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> According to the writer, majority language speakers</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"A\"><span>A usually speak more than one language.</span></label> <label><input name=\"q14\" type=\"radio\" value=\"B\"><span>B generally have a high level of education.</span></label> <label><input name=\"q14\" type=\"radio\" value=\"C\"><span>C should make an effort to learn a minority language.</span></label> <label><input name=\"q14\" type=\"radio\" value=\"D\"><span>D should be more tolerant of minority languages.</span></label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
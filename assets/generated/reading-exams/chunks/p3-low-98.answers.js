@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-98", "answers", {"answerKey":{"q1":"A","q2":"C","q3":"B","q4":"A","q5":"H","q6":"J","q7":"B","q8":"E","q9":"C","q10":"NO","q11":"YES","q12":"NOT GIVEN","q13":"NO","q14":"YES"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-98", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-98","meta":{"title":"Petrol power an eco-revolution 交通的革命","category":"P3","frequency":"low","pdfFilename":"187. P3 - Petrol power an eco-revolution 交通的革命.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/187. P3 - Petrol power an eco-revolution 交通的革命/","legacyFilename":"187. P3 - Petrol power an eco-revolution 交通的革命.html","questionIntroHtml":"<h3>Questions 27–40</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/187. P3 - Petrol power an eco-revolution 交通的革命/187. P3 - Petrol power an eco-revolution 交通的革命.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/187. P3 - Petrol power an eco-revolution 交通的革命/187. P3 - Petrol power an eco-revolution 交通的革命.pdf","ieltsHtml":"IELTS/P3/Petrol power an eco-revolution.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.674Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
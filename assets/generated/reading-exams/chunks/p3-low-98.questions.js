@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-98", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> Why were the inhabitants of De Smet in danger of starvation?</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"><span>A The trains were unable to operate normally.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"B\"><span>B The harvest had been completely destroyed.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"C\"><span>C The roads to the town had not yet been built.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"D\"><span>D The farmers were reluctant to sell their produce.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> What problem did subsistence farmers have in the past?</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"><span>A They had no effective means of storing food.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"B\"><span>B Food was expensive because of high shipping costs.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"C\"><span>C Their access to food was limited at certain times.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"D\"><span>D Food could not be transported for long distances by road.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> The writer says that the use of coal to power railways and steamships</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"><span>A led to a greater range of fresh vegetables being available in urban areas.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"B\"><span>B was less efficient than the use of petroleum-derived products.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"C\"><span>C allowed farmers to be more self-sufficient than they were previously.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"D\"><span>D was better for the environment than using petroleum-derived products.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> The writer refers to an urban-planning conference held in 1898 in order to</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"><span>A illustrate a problem that was later solved by modern technology.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"B\"><span>B give an example of poor decisions made about urban planning.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"C\"><span>C show that urban issues were misunderstood in the past.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"D\"><span>D indicate the disregard at the time for public health concerns.</span></label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions 27–40</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q5","q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n<h4>Questions 31–35</h4>\n<p>Complete the summary using the list of words, <strong>A–J</strong>, below.</p>\n<div class=\"summary-completion\">\n<h4>Problems caused by urban workhorses</h4>\n<p>\nIn cities, the large amounts of horse manure led to <span id=\"q5-target\" class=\"drop-target-summary\" data-question=\"q5\"></span> in the streets and were also linked to the spread of <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span>. In certain situations, the horses might even cause <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> to passers-by. There were also the problems of noise and congestion caused by horse-drawn vehicles. In the countryside, there were problems too. The <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> was damaged because of the need to provide <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span> for urban workhorses.\n</p>\n</div>\n<div id=\"word-options\">\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"A\"><strong>A</strong> rich landowners</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"B\"><strong>B</strong> injuries</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"C\"><strong>C</strong> food</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"D\"><strong>D</strong> accidental falls</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"E\"><strong>E</strong> environment</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"F\"><strong>F</strong> dangerous area</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"G\"><strong>G</strong> use of irrigation</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"H\"><strong>H</strong> unpleasant smells</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"I\"><strong>I</strong> treatment</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"J\"><strong>J</strong> diseases</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"yes_no_not_given","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<ul style=\"list-style-type: none; padding-left: 0; margin-bottom: 1em;\">\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>36</strong> Farmers whose land was poor failed to benefit from modern forms of transport.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> Between 1830 and 1960 there were positive effects associated with changing patterns of agriculture in France.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> A fairer distribution of the world's water resources is needed.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> Living in the countryside does less harm to the environment than living in a city.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> It is possible that modern developments in transportation have had a beneficial impact on the world.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
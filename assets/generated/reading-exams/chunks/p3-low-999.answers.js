@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-999", "answers", {"answerKey":{"q1":"E","q2":"F","q3":"D","q4":"A","q5":"B","q6":"F","q7":"C","q8":"A","q9":"B","q10":"E","q11":"H","q12":"D","q13":"C","q14":"B"}});
+})(typeof window !== "undefined" ? window : globalThis);
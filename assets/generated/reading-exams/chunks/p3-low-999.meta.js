@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-999", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-low-999","meta":{"title":"Risk taking","category":"P3","frequency":"low"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-low-999", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"text","bodyHtml":"<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Risk taking</h3>\n<p><strong>A</strong> We run risks. Most of the time we ignore them; sometimes we stop and decide how to deal with them. That's life. Risks arise in sports, in business, in personal relationships; they are present in the laboratory, in political calculations, everywhere. Acting individually, we often prefer to gain some benefit by accepting some danger. Acting collectively, we make similar trade-offs.</p>\n<p><strong>B</strong> When society must assess risks, and those risks can be clarified, at least in part, by science, technology or mathematics, the responsibility of the research community is to be clear and complete. But that is not always so easy. Furthermore, too few people pay full attention to the best evidence, much less modify their behaviors as a result. Even when the evidence of high risk is clear - about smoking, for instance - many will deny the risk, or dispute it, or accept that it exists and still go ahead. As a former cigarette smoker, I understand denial.</p>\n<p><strong>C</strong> Perhaps more important than the basic facts of risk are the varied perception of it. Hearing the prediction of 60% chance of rain, or recognizing the minuscule likelihood of becoming ill from a flu shot, most people understand the right responses: take your umbrella and get your flu shot. But some, fearfully but irrationally, go to the extreme and stay at home and avoid all contact with other people. Irrational decisions occasionally affect us all. When it comes to risks the best odds do not always influence people to make the correct decision.</p>\n<p><strong>D</strong> In her book, The Universe and the Teacup, the science writer K. C. Cole reminds us that the risks of losing something and gaining something appear to be calculated in our minds according to quite different scales. People will risk a lot to prevent a loss, she notes; some people will rush into a burning building to save a pet. But they will usually risk very little if the only perceived outcome is a possible gain; many people won't even risk pursuing an exciting job, if the current job, though unfulfilling, remains comfortable. That psychological mechanism, a desire to maintain the status quo, helps explain the high hurdles that any rational risk assessment must confront.</p>\n<p><strong>E</strong> Organizations face the same hurdles whenever they must cope with major shifts in policy. In his classic examination of the character of high-tech industry, Only the Paranoid Survive, Andrew S. Grove gives a perceptive account of a crisis that took place during his tenure as Chairman of the Intel Corporation. The business environment for Intel and its competitors was transformed by a flood of low-cost memory chips from Japan, and Intel made the difficult decision to abandon its chip-making business. Such a period of change in the outside world is filled with danger, Grove notes, precisely because it is so easy for executives to try to disregard it or misinterpret the mounting evidence showing the profound risks of not making change at the very core. The distinction Cole cites is instructive here: one reason management and staff may not act is that they tend to focus on the potential gains of risking change (which they characterize as small), rather than on the catastrophic losses that risking change could prevent. The period becomes critical for a company, according to Grove, and deadly when unattended to.</p>\n<p><strong>F</strong> Likewise, at the national level, and even the global one, institutions tend to be more willing to take a risk if it means avoiding a loss, than they are if it might confer a gain. Almost everyone, for instance, sees the signs of ecological decay. Reid J. Lifest's article, 'Full Accounting', describes newly developed techniques for clarifying which critical decision would have the highest pay-offs for the environment. Once these 'leverage points' as he calls them, are located, many environmental organizations will be willing to risk the resources needed to prevent further deterioration.</p>\n<p><strong>G</strong> More complicated are decisions by nations to invest broadly in educational research. Some governmental leaders are oblivious to the risks posed by social underinvestment, because the urgent needs of the present take precedence over actions that would give rise to even more substantial gains in the future. Their attitude is that today's risks must be manageable, and that tomorrow's gains are at the very least difficult to measure. Better consideration and decision making for what lies ahead is essential.</p>\n<p><strong>H</strong> Nevertheless, I confess to being an optimist. My glass is generally half full - though that may not help me handle risk. Whether one's temperament is optimistic or pessimistic, everyone in our scientific and engineering community has a social responsibility: measure with care and portray with honesty the level of risk involved in any action or decision.</p>\n<p>&nbsp;</p><p>&nbsp;</p>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
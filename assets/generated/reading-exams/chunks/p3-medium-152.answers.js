@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-152", "answers", {"answerKey":{"q1":"C","q2":"D","q3":"B","q4":"D","q5":"B","q6":"YES","q7":"NO","q8":"NOT GIVEN","q9":"NO","q10":"H","q11":"B","q12":"E","q13":"G","q14":"I"}});
+})(typeof window !== "undefined" ? window : globalThis);
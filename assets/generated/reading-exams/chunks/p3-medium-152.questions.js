@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-152", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter, A, B, C or D.</p>\n<div class=\"question-item\">\n<p class=\"question-text\"><strong>27</strong> The writer's purpose in the first paragraph is to</p>\n<div class=\"options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A oppose the views of Charles Darwin.</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B compare experts' opinions of Darwin's theory.</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C explain the theory of evolutionary psychology.</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D name experts in the field of evolutionary psychology.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p class=\"question-text\"><strong>28</strong> In the third paragraph, which view about evolutionary psychology matches Nicholson's opinion?</p>\n<div class=\"options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A Our characters determine our career choices.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B We begin life without any preconceived notions.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C Our interests and skills depend on our environment.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D We inherit ideas and characteristics from our ancestors.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p class=\"question-text\"><strong>29</strong> The writer discusses the key element of emotion in order to</p>\n<div class=\"options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A criticise primitive survival strategies.</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B explain attitudes and actions at work.</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C demonstrate the slowness of evolution.</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D suggest companies today are poorly structured.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p class=\"question-text\"><strong>30</strong> Which of the following does Nicholson predict will happen in the business world?</p>\n<div class=\"options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A Companies will remain in city centres.</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B Promotion will no longer motivate people.</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C Employees will be less independent than now.</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D Social interaction will remain important to workers.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p class=\"question-text\"><strong>31</strong> Which of the following is the most suitable title for Reading Passage 3?</p>\n<div class=\"options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"> A How successful companies manage change.</label> <label><input name=\"q5\" type=\"radio\" value=\"B\"> B Understanding the origins of workplace behaviour.</label> <label><input name=\"q5\" type=\"radio\" value=\"C\"> C Darwin's theories rejected by modern management.</label> <label><input name=\"q5\" type=\"radio\" value=\"D\"> D Why post-industrial organisations need to evolve more quickly.</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"yes_no_not_given","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Do the following statements agree with the information given in Reading Passage 3?</p>\n<p>In boxes 32–35 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p class=\"question-text\"><strong>32</strong> Nicholson makes a persuasive argument in his book.</p>\n<div class=\"options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p class=\"question-text\"><strong>33</strong> Tooby and Cosmides believe natural selection through the generations has prepared us for modern times.</p>\n<div class=\"options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p class=\"question-text\"><strong>34</strong> Our reliance on technology causes emotional problems in the workplace.</p>\n<div class=\"options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p class=\"question-text\"><strong>35</strong> People today are more trusting than they used to be.</p>\n<div class=\"options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete the summary using the list of words, A–I, below.</p>\n<div class=\"summary-text\">\n<h5>Nicholson's advice to the corporate world</h5>\n<p>\nNicholson believes that if we know why people act the way they do, we can change <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span> so employees will work more efficiently. Nicholson's ideas are unwelcome to <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span>, but some executives are more open to what evolutionary psychology says. However, these executives still believe that there is a <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> that will make employees act according to the company's practices. According to Nicholson, these senior executives are engaging in <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span>, and we should not try to change <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span> but instead we should change our business structures.\n</p>\n</div>\n<div id=\"word-options\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A business leaders</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B MBA graduates</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C promotion structures</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D reward strategy</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E magic formula</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F strategic planning</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G back-to-front thinking</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H business environments</div>\n<div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I human nature</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
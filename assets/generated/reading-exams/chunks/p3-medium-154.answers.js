@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-154", "answers", {"answerKey":{"q1":"B","q2":"B","q3":"C","q4":"B","q5":"D","q6":"A","q7":"D","q8":"G","q9":"B","q10":"NO","q11":"YES","q12":"NOT GIVEN","q13":"YES","q14":"YES"}});
+})(typeof window !== "undefined" ? window : globalThis);
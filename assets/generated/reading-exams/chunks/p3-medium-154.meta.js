@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-154", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-medium-154","meta":{"title":"Decisions, Decisions 决策之间","category":"P3","frequency":"medium","pdfFilename":"64. P3 - Decisions, Decisions 决策之间【次】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/64. P3 - Decisions, Decisions 决策之间【次】/","legacyFilename":"64. P3 - Decisions, Decisions 决策之间【次】.html","questionIntroHtml":"<h3>Questions 27–40</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/64. P3 - Decisions, Decisions 决策之间【次】/64. P3 - Decisions, Decisions 决策之间【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/64. P3 - Decisions, Decisions 决策之间【次】/64. P3 - Decisions, Decisions 决策之间【次】.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.776Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-154", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter, A, B, C or D.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> The legend of the Gordian knot is used to illustrate the idea that</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A anyone can solve a difficult problem.</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B difficult problems can have easy solutions.</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C the solution to any problem requires a lot of thought.</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D people who can solve complex problems make good leaders.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> The 'conflict model' of decision making proposed by Janis and Mann requires that</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A opposing political parties be involved.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B all important facts be considered.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C people be encouraged to have different ideas.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D previous similar situations be thoroughly examined.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> According to recent thinking reinforced by Malcolm Gladwell, the best decisions</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A involve consultation.</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B involve complex thought.</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C are made very quickly.</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D are the most attractive option.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Dijksterhuis and his colleagues claim in their article that</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A our cognitive resources improve as tasks become more complex.</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B conscious decision making is negatively affected by task complexity.</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C unconscious decision making is a popular approach.</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D deliberation without attention defines the way we make decisions.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> Dijksterhuis's car study found that, in simple tasks, participants</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"> A were involved in lengthy discussions.</label> <label><input name=\"q5\" type=\"radio\" value=\"B\"> B found it impossible to make decisions quickly.</label> <label><input name=\"q5\" type=\"radio\" value=\"C\"> C were unable to differentiate between the options.</label> <label><input name=\"q5\" type=\"radio\" value=\"D\"> D could make a better choice when allowed to concentrate.</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions 27–40</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Complete the summary below using the list of words, A–I, below.</p>\n<div class=\"summary-text\">\n<h5>Dijksterhuis's shopping study and its conclusions</h5>\n<p>\nUsing clothing and furniture as examples of different types of purchases, Dijksterhuis questioned shoppers on their satisfaction with what they had bought. People who spent <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> time buying simple clothing items were more satisfied than those who had not. However, when buying furniture, shoppers made <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> purchasing decisions if they didn't think too hard. From this, the researchers concluded that in other choices, perhaps more important than shopping, <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> decisions are best made by the unconscious. The writer comments that Dijksterhuis's finding is apparently <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span> but nonetheless true.\n</p>\n</div>\n<div id=\"word-options\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A more</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B counterintuitive</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C simple</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D better</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E conscious</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F obvious</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G complex</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H less</div>\n<div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I worse</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"yes_no_not_given","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<p>In boxes 36–40 on your answer sheet, write</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>36</strong> Dijksterhuis's findings agree with existing political and management theories.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> Some political leaders seem to use deliberation without attention when making complex decisions.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> All political decisions are complex ones.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> We judge political errors according to our own political beliefs.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> Social considerations must be taken into account for any examination of decision making to prove useful.</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
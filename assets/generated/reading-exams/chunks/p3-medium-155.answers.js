@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-155", "answers", {"answerKey":{"q1":"D","q2":"F","q3":"A","q4":"C","q5":"D","q6":"A","q7":"A","q8":"B","q9":"C","q10":"A","q11":"C","q12":"A","q13":"B","q14":"A"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-155", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-medium-155","meta":{"title":"Does Class Size Matter? 课堂规模","category":"P3","frequency":"medium","pdfFilename":"65. P3 - Does class size matter 课堂规模.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/65. P3 - Does class size matter_ 课堂规模【次】/","legacyFilename":"65. P3 - Does class size matter_ 课堂规模【次】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/65. P3 - Does class size matter_ 课堂规模【次】/65. P3 - Does class size matter_ 课堂规模【次】.html","shuiPdf":"ReadingPractice/PDF/65. P3 - Does class size matter 课堂规模.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-04-30T00:00:00.000Z","notes":"aligned_with_readingpractice_pdf_65_may_version"}});
+})(typeof window !== "undefined" ? window : globalThis);
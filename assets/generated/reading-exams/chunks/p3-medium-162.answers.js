@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-162", "answers", {"answerKey":{"q1":"C","q2":"A","q3":"D","q4":"C","q5":"A","q6":"logical","q7":"theories","q8":"psychology","q9":"brain","q10":"teachers","q11":"NOT GIVEN","q12":"NO","q13":"YES","q14":"YES"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-162", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-medium-162","meta":{"title":"Jean Piaget (1896–1980) 让·皮亚杰","category":"P3","frequency":"medium","pdfFilename":"71. P3 - Jean Piaget (1896–1980) 让·皮亚杰【次】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/71. P3 - Jean Piaget (1896–1980) 让·皮亚杰【次】/","legacyFilename":"71. P3 - Jean Piaget (1896–1980) 让·皮亚杰【次】.html","questionIntroHtml":"<h2>Questions</h2>\n<div class=\"question-group\" id=\"q1-31-section\">\n<h3>Questions 27–31</h3>\n<p style=\"margin-bottom: 12px;\">Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> In the second paragraph, the writer mentions the example of modern anthropology to illustrate</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"A\"> A the universality of Piaget's insights into the workings of the mind.</label> <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"B\"> B the similarity between children's thought-processing in different cultures.</label> <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"C\"> C how Piaget's work represents a crucial turning-point in our approach to education.</label> <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"D\"> D how Piaget's work has aided our understanding of humankind's evolution from primitive origins.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> According to the writer, what point is illustrated by the dialogue about the wind?</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"A\"> A The factual accuracy of what children say is of minor significance.</label> <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"B\"> B Children want to learn about scientific principles.</label> <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"C\"> C Children's reasoning processes can be amusing to adults.</label> <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"D\"> D Children often pretend that they know the answers to questions.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Piaget believed in the importance of</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"A\"> A preventing children from making false assumptions.</label> <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"B\"> B giving children honest feedback on their hypotheses.</label> <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"C\"> C showing children how to formulate their own ideas about the world.</label> <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"D\"> D maintaining children's confidence in their ability to interpret the world.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What does the writer suggest in the seventh paragraph?</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"A\"> A Children's sense of their surroundings changes as they get older.</label> <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"B\"> B Children are able to grasp certain complex ideas as well as adults are.</label> <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"C\"> C Even apparently irrational ideas can be worthy of interest.</label> <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"D\"> D Sometimes the simplest explanations are the best.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> The writer's main purpose is to</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"A\"> A outline Piaget's contribution to a range of scientific fields.</label> <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"B\"> B summarise how education has benefited from Piaget's findings.</label> <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"C\"> C discuss Piaget's role in the development of 20th-century psychology.</label> <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"D\"> D express doubts about a number of Piaget's theories.</label>\n</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q6-36-section\">\n<h3>Questions 32–36</h3>\n<p style=\"margin-bottom: 12px;\">Complete the summary using the list of words below. Drag a word from the list and drop it into the correct blank.</p>\n<div class=\"summary-text\">\n<p>\nPiaget maintained that children's mental processes were far more <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> than they might appear. He encouraged the view that a child was not a 'blank slate' waiting to be filled with information, but rather a systematic builder of knowledge who regularly tries out his or her own <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> about the world. Piaget's impact on the area of <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> could well outlast that of more celebrated pioneers of this discipline. Despite doubts cast over his ideas by the current view associating knowledge exclusively with the <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span>, the effects of his work are still strong today. His principles are still widely used in the professional development of <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span>.\n</p>\n</div>\n<div id=\"word-options\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"correct\">A correct</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"theories\">B theories</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"brain\">C brain</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"simple\">D simple</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"teachers\">E teachers</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"psychology\">F psychology</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"logical\">G logical</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"thought\">H thought</div>\n<div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-word=\"philosophers\">I philosophers</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q11-40-section\">\n<h3>Questions 37–40</h3>\n<p>Do the following statements agree with the claims of the writer? Write <strong>YES</strong>, <strong>NO</strong>, or <strong>NOT GIVEN</strong>.</p>\n<div class=\"question-item\">\n<p><strong>37</strong> Piaget's early work in Paris involved innovative research techniques.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label> <label style=\"margin:0;\"><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label> <label style=\"margin:0;\"><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> Piaget gave clear guidelines as to how adults should give information to children.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label style=\"margin:0;\"><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label style=\"margin:0;\"><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> Piaget made a significant contribution to the field of epistemology.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label style=\"margin:0;\"><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label style=\"margin:0;\"><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> We still have much to learn about the nature of knowledge.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label style=\"margin:0;\"><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label style=\"margin:0;\"><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/71. P3 - Jean Piaget (1896–1980) 让·皮亚杰【次】/71. P3 - Jean Piaget (1896–1980) 让·皮亚杰【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/71. P3 - Jean Piaget (1896–1980) 让·皮亚杰【次】/71. P3 - Jean Piaget (1896–1980) 让·皮亚杰【次】.pdf","ieltsHtml":"IELTS/P3/Jean Piaget (1896–1980).html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.786Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-168", "answers", {"answerKey":{"q1":"F","q2":"A","q3":"B","q4":"H","q5":"D","q6":"NO","q7":"NOT GIVEN","q8":"YES","q9":"YES","q10":"YES","q11":"marketing managers","q12":"information needs","q13":"internal records","q14":"analysis unit"}});
+})(typeof window !== "undefined" ? window : globalThis);
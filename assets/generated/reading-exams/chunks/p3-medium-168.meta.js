@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-168", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-medium-168","meta":{"title":"Marketing and the information age 信息时代营销","category":"P3","frequency":"medium","pdfFilename":"77. P3 - Marketing and the information age 信息时代营销【次】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/77. P3 - Marketing and the information age 信息时代营销【次】/","legacyFilename":"77. P3 - Marketing and the information age 信息时代营销【次】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/77. P3 - Marketing and the information age 信息时代营销【次】/77. P3 - Marketing and the information age 信息时代营销【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/77. P3 - Marketing and the information age 信息时代营销【次】/77. P3 - Marketing and the information age 信息时代营销【次】.pdf","ieltsHtml":"IELTS/P3/Marketing and the information age.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.794Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
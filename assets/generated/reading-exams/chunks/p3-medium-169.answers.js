@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-169", "answers", {"answerKey":{"q1":"iii","q2":"vii","q3":"iv","q4":"i","q5":"v","q6":"F","q7":"B","q8":"E","q9":"D","q10":"G","q11":"A","q12":"C","q13":"B","q14":"B"}});
+})(typeof window !== "undefined" ? window : globalThis);
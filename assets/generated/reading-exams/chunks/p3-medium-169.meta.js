@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-169", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-medium-169","meta":{"title":"（无题目）  Music Language We All Speak 音乐语言","category":"P3","frequency":"medium","pdfFilename":"78. P3 (仅原文无题) - Music Language We All Speak 音乐语言【次】.pdf","legacyPath":"睡着过项目组/1.11月高频文章[94篇+18背景]/P3 （29高+6次高）/2. P3次高频 (6篇)/78. P3 (仅原文无题) - Music Language We All Speak 音乐语言【次】/","legacyFilename":"78. P3 (仅原文无题) - Music Language We All Speak 音乐语言【次】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/1.11月高频文章[94篇+18背景]/P3 （29高+6次高）/2. P3次高频 (6篇)/78. P3 (仅原文无题) - Music Language We All Speak 音乐语言【次】/78. P3 (仅原文无题) - Music Language We All Speak 音乐语言【次】.html","shuiPdf":"睡着过项目组/1.11月高频文章[94篇+18背景]/P3 （29高+6次高）/2. P3次高频 (6篇)/78. P3 (仅原文无题) - Music Language We All Speak 音乐语言【次】/78. P3 (仅原文无题) - Music Language We All Speak 音乐语言【次】.pdf","ieltsHtml":"IELTS/P3/Music Language We All Speak.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:21.976Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-169", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Reading Passage 3 has five sections, <strong>A–E</strong>.</p>\n<p>Choose the correct heading for each section from the list of headings below. Write the correct number i-viii in boxes 27-31 on your answer sheet.</p>\n<p><em>To answer, drag a heading from the list below and drop it into the correct box above each section in the passage on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i &nbsp; Communication in music with animals</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii &nbsp; New discoveries on animal music</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii &nbsp; Music and language contrasted</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv &nbsp; Current research on music</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v &nbsp; Music is beneficial for infants.</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi &nbsp; Music transcends cultures.</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii &nbsp; Look back at some of the historical theories</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii &nbsp; Are we genetically designed for music?</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q6","q7","q8","q9","q10","q11","q12"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-10-11-12-anchor\">\n<h4>Questions 32–38</h4>\n<p>Look at the following statements and the list of people below.</p>\n<p>Match each statement with the correct person.</p>\n<div class=\"match-question-item\">\n<p><strong>32</strong> Steven Pinker</p>\n<div class=\"match-dropzone\" data-question=\"q6\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>33</strong> Musicologists</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>34</strong> Greek philosopher Pythagoras</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>35</strong> Schwartz, Howe, and Purves</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>36</strong> Marc Hauser and Josh McDermott</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>37</strong> Charles Rosen</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>38</strong> Sandra Trehub</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"options-pool\" id=\"statements-options-pool\">\n<strong>List of Statements</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A &nbsp; Music exists outside of the world it is created in.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B &nbsp; Music has a universal character despite cultural influences on it.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C &nbsp; Music is a necessity for humans.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D &nbsp; Music preference is related to the surrounding influences.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E &nbsp; He discovered the mathematical basis of music.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F &nbsp; Music doesn’t enjoy the same status of research interest as language.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G &nbsp; Humans and monkeys have similar traits in perceiving sound.</div>\n</div>\n</div>\n</div>","allowOptionReuse":false},{"groupId":"group-3","kind":"single_choice","questionIds":["q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q13-14-anchor\">\n<h4>Questions 39–40</h4>\n<p>Choose the correct letter, A, B, C or D.</p>\n<div class=\"mc-question-item\">\n<p><strong>39</strong> Why was the study of animal music inconclusive?</p>\n<label class=\"mc-option\"><input type=\"radio\" name=\"q13\" value=\"A\"> A &nbsp; Animals don’t have the same auditory system as humans.</label> <label class=\"mc-option\"><input type=\"radio\" name=\"q13\" value=\"B\"> B &nbsp; Tests on animal music are limited.</label> <label class=\"mc-option\"><input type=\"radio\" name=\"q13\" value=\"C\"> C &nbsp; Animals can’t make up new tunes.</label> <label class=\"mc-option\"><input type=\"radio\" name=\"q13\" value=\"D\"> D &nbsp; There aren’t enough tests on a wide range of animals.</label>\n</div>\n<div class=\"mc-question-item\">\n<p><strong>40</strong> What is the main theme of this passage?</p>\n<label class=\"mc-option\"><input type=\"radio\" name=\"q14\" value=\"A\"> A &nbsp; Language and learning</label> <label class=\"mc-option\"><input type=\"radio\" name=\"q14\" value=\"B\"> B &nbsp; The evolution of music</label> <label class=\"mc-option\"><input type=\"radio\" name=\"q14\" value=\"C\"> C &nbsp; The role of music in human society</label> <label class=\"mc-option\"><input type=\"radio\" name=\"q14\" value=\"D\"> D &nbsp; Music for animals</label>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
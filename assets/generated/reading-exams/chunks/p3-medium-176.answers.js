@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-176", "answers", {"answerKey":{"q1":"B","q2":"C","q3":"D","q4":"A","q5":"C","q6":"B","q7":"C","q8":"A","q9":"A","q10":"age","q11":"two weeks","q12":"human beings","q13":"good motor control","q14":"mature monkeys"}});
+})(typeof window !== "undefined" ? window : globalThis);
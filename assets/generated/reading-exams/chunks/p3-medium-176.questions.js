@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-176", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> In the first paragraph, the writer points out that</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A fear and stress are different feelings.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B most humans develop strategies for dealing with fear.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C business situations cause more fear than others.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D some people never experience fear.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> When discussing the use of rhesus monkeys as experimental subjects, the writer notes that</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A they react more quickly to fear than humans.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B they are more influenced by fear than humans.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C their mental growth resembles that of humans.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D their brains work more slowly than those of humans.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Which of the following did Kalin and Shelton outline as the second stage in their research project?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A the identification of expressions of anxiety in monkeys</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B the identification of situations that arouse stress in monkeys</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C an analysis of brain development in monkeys</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D the study of reactions to fear in monkeys of different ages</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> In the fourth paragraph, the writer notes that the three related situations</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A reflect common experiences for infant humans and monkeys.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B highlight the similarities between monkey and human infant care.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C were predicted to cause monkeys more distress than human infants.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D were graded in terms of their potential effect on young monkeys.</label></li>\n</ul>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q5","q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n<h4>Questions 31–35</h4>\n<p>Look at the following responses of monkeys and the list of conditions below.</p>\n<p>Match each response with the correct condition, <strong>A, B</strong> or <strong>C</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div style=\"padding:10px; border:1px solid var(--line); border-radius:8px; margin-top:12px; background: var(--bg);\">\n<strong>List of Conditions</strong><br>\n<strong>A</strong> the alone condition<br>\n<strong>B</strong> the no-eye-contact condition<br>\n<strong>C</strong> the stare condition\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> aggressive facial expressions</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q5\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q5\" type=\"radio\" value=\"C\"> C</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> prolonged stillness</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q6\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q6\" type=\"radio\" value=\"C\"> C</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> a combination of contradictory signals</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q7\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q7\" type=\"radio\" value=\"C\"> C</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> appeals for maternal protection</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q8\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q8\" type=\"radio\" value=\"C\"> C</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> the production of soft sounds</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q9\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q9\" type=\"radio\" value=\"C\"> C</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"summary_completion","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN THREE WORDS AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<p>Once they had identified three types of defensive behaviour, Kalin and Shelton grouped the monkeys according to their <input type=\"text\" id=\"q36_input\" name=\"q10\">, in order to discover precisely when they were able to respond appropriately to different fear-related cues. They videotaped their results and found that monkeys as young as <input type=\"text\" id=\"q37_input\" name=\"q11\"> reacted to the cues but in a haphazard fashion. The researchers noted that they seemed to be unaware of the <input type=\"text\" id=\"q38_input\" name=\"q12\"> who were around them. Despite demonstrating <input type=\"text\" id=\"q39_input\" name=\"q13\">, the monkeys in the middle groups failed to react in ways corresponding to the experimental situation. The oldest group, however, reacted in the same way as <input type=\"text\" id=\"q40_input\" name=\"q14\">, and the researchers concluded that monkeys are capable of selective responding between nine and 12 weeks old.</p>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
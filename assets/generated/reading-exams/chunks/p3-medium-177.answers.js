@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-177", "answers", {"answerKey":{"q1":"C","q2":"B","q3":"A","q4":"B","q5":"B","q6":"C","q7":"E","q8":"H","q9":"D","q10":"F","q11":"NOT GIVEN","q12":"NO","q13":"NOT GIVEN","q14":"YES"}});
+})(typeof window !== "undefined" ? window : globalThis);
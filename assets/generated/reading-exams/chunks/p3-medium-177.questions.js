@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-177", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> According to the writer, Ekman became interested in lying after a question from his</p>\n<div class=\"mcq-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A peers.</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B patients.</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C students.</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D teachers.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> The writer refers to the 12-minute interviews in order to</p>\n<div class=\"mcq-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A illustrate how frequently patients lie.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B describe the origins of Ekman's theories.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C compare Ekman's research to previous studies.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D show how patients' behaviour is affected by filming.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> What is the writer's point in the third paragraph?</p>\n<div class=\"mcq-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A Micro-expressions are common to all people.</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B Recent research has refuted an old idea.</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C With practice we can learn to control our micro-expressions.</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D Human society is too complex to allow for generalisations.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What are we told about Ekman's conclusions from his tests?</p>\n<div class=\"mcq-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A It's natural for people to lie.</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B Few untrained people can detect lying.</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C Most liars suffer from periods of depression.</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D All of his subjects were trained to identify micro-expressions.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> What point does the writer make about Ekman's techniques in the fourth paragraph?</p>\n<div class=\"mcq-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"> A They take a decade to teach.</label> <label><input name=\"q5\" type=\"radio\" value=\"B\"> B They have been in great demand.</label> <label><input name=\"q5\" type=\"radio\" value=\"C\"> C They have aroused the suspicions of some agencies.</label> <label><input name=\"q5\" type=\"radio\" value=\"D\"> D They can be used by a limited range of occupations.</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q6","q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-10-anchor\">\n<h4>Questions 32–36</h4>\n<p>Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n<div class=\"summary-completion\">\n<h5>The television series based on Ekman's work</h5>\n<p>A new TV series based on Ekman's work features a hero named Lightman, who detects lies. Initially, Ekman was unenthusiastic about the TV project because he feared the possibility of encouraging viewers' <strong>32</strong> <input type=\"text\" id=\"q32_input\" maxlength=\"1\" name=\"q6\">. For example, he was worried that one day the programme could result in <strong>33</strong> <input type=\"text\" id=\"q33_input\" maxlength=\"1\" name=\"q7\"> not being carried out. Ultimately, though, he has given the show his blessing because he is not aware of any other comparable programme based on a single person's <strong>34</strong> <input type=\"text\" id=\"q34_input\" maxlength=\"1\" name=\"q8\">. The <strong>35</strong> <input type=\"text\" id=\"q35_input\" maxlength=\"1\" name=\"q9\"> of the show's producer have been another pleasant surprise considering the genre of the programme. Ekman is happy with the show's overall <strong>36</strong> <input type=\"text\" id=\"q36_input\" maxlength=\"1\" name=\"q10\">.</p>\n</div>\n<div class=\"word-list\">\n<ul>\n<li><strong>A</strong> consequences</li>\n<li><strong>B</strong> crimes</li>\n<li><strong>C</strong> false beliefs</li>\n<li><strong>D</strong> motives</li>\n<li><strong>E</strong> justice</li>\n<li><strong>F</strong> accuracy</li>\n<li><strong>G</strong> acting</li>\n<li><strong>H</strong> research</li>\n<li><strong>I</strong> ratings</li>\n</ul>\n</div>\n</div>"},{"groupId":"group-3","kind":"yes_no_not_given","questionIds":["q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 37–40 on your answer sheet, write</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>37</strong> Ekman regrets the lies he told as a child.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> People who are good at lying tend to be good at detecting lies.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> Ekman has worked with poker players to help them lie more convincingly.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> Ekman is more interested in the types of lies with serious consequences.</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
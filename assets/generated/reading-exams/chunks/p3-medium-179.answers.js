@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-179", "answers", {"answerKey":{"q1":"D","q2":"H","q3":"A","q4":"G","q5":"E","q6":"F","q7":"C","q8":"B","q9":"B","q10":"A","q11":"NOT GIVEN","q12":"FALSE","q13":"TRUE","q14":"NOT GIVEN"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-179", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-medium-179","meta":{"title":"The Exploration of Mars 火星探索","category":"P3","frequency":"medium","pdfFilename":"87. P3 - The Exploration of Mars 火星探索【次】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/87. P3 - The Exploration of Mars 火星探索【次】/","legacyFilename":"87. P3 - The Exploration of Mars 火星探索【次】.html","questionIntroHtml":"<h3>Questions</h3>\n<div class=\"question-group\" id=\"q1-32-section\">\n<h4>Questions 27–32</h4>\n<p>The reading passage has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–H</strong>, in the boxes on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>27</strong> Martian evidence found on Earth</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>28</strong> Mars and Earth may share the same origin of life</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>29</strong> Detailed depiction of large-scale agricultural constructions</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>30</strong> A project that aims to detect life under conditions similar to those on Mars</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>31</strong> Mars has undergone drastic climatic transformation</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>32</strong> Scientific attempts to locate liquid water on Mars</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td><td><input type=\"radio\" name=\"q6\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>\n<div class=\"question-group\" id=\"q7-36-section\">\n<h4>Questions 33–36</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>33</strong> How did Percival Lowell describe Mars in this passage?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q7\" value=\"A\"><span>A Arizona provides the perfect location for observation.</span></label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"B\"><span>B The canals of Mars are wider than those on Earth.</span></label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"C\"><span>C There are clear traces of water and agriculture similar to Earth's.</span></label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"D\"><span>D Active, mobile Martian creatures were seen through telescopes.</span></label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> How did people change their view of Mars from the 19th century onwards?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q8\" value=\"A\"><span>A They experienced a real Martian attack.</span></label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"B\"><span>B They absorbed new ideas through literary works.</span></label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"C\"><span>C They learned new concepts by listening to a famous radio programme.</span></label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"D\"><span>D They attended public lectures given by well-known writers.</span></label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> According to the probes sent in the 1960s, which statement about Mars is correct?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q9\" value=\"A\"><span>A Its landscape is full of rocks and rivers.</span></label></li>\n<li><label><input type=\"radio\" name=\"q9\" value=\"B\"><span>B It appeared far less dynamic than Earth.</span></label></li>\n<li><label><input type=\"radio\" name=\"q9\" value=\"C\"><span>C It contained exactly the same substances as the Moon.</span></label></li>\n<li><label><input type=\"radio\" name=\"q9\" value=\"D\"><span>D Images differed completely from those taken by later probes.</span></label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> What is the implication of the project using the technology called SOLID in the Atacama Desert?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q10\" value=\"A\"><span>A It could be employed to explore organisms under Martian-like conditions.</span></label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"B\"><span>B This technology could not be used to identify life in environments similar to Mars.</span></label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"C\"><span>C The Atacama Desert is the only place on Earth that suits such organisms.</span></label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"D\"><span>D Life has not yet been found anywhere in the Atacama Desert.</span></label></li>\n</ul>\n</div>\n</div>\n<div class=\"question-group\" id=\"q11-40-section\">\n<h4>Questions 37–40</h4>\n<p>Do the following statements agree with the information given in Reading Passage 3?</p>\n<p>In boxes 37–40 on your answer sheet, write</p>\n<p style=\"padding-left: 20px;\">\n<strong>TRUE</strong> if the statement agrees with the information<br>\n<strong>FALSE</strong> if the statement contradicts the information<br>\n<strong>NOT GIVEN</strong> if there is no information on this\n</p>\n<div class=\"question-item\">\n<p><strong>37</strong> According to <i>The War of the Worlds</i>, Martian technology surpassed that of humans in every field at the time.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q11\" value=\"TRUE\"><span>TRUE</span></label></li>\n<li><label><input type=\"radio\" name=\"q11\" value=\"FALSE\"><span>FALSE</span></label></li>\n<li><label><input type=\"radio\" name=\"q11\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> The evidence supplied by the Viking probes has never been challenged.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q12\" value=\"TRUE\"><span>TRUE</span></label></li>\n<li><label><input type=\"radio\" name=\"q12\" value=\"FALSE\"><span>FALSE</span></label></li>\n<li><label><input type=\"radio\" name=\"q12\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> Analysis of a meteorite from Mars discovered a substance associated with certain germs.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q13\" value=\"TRUE\"><span>TRUE</span></label></li>\n<li><label><input type=\"radio\" name=\"q13\" value=\"FALSE\"><span>FALSE</span></label></li>\n<li><label><input type=\"radio\" name=\"q13\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> According to Víctor Parro, their project will be sent to Mars once DNA-based life has been identified on Earth.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q14\" value=\"TRUE\"><span>TRUE</span></label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"FALSE\"><span>FALSE</span></label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label></li>\n</ul>\n</div>\n</div>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/87. P3 - The Exploration of Mars 火星探索【次】/87. P3 - The Exploration of Mars 火星探索【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/87. P3 - The Exploration of Mars 火星探索【次】/87. P3 - The Exploration of Mars 火星探索【次】.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.808Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
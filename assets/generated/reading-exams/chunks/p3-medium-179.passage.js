@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-179", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>The Exploration of Mars</h3>\n<p><strong>A</strong> In 1877, Giovanni Schiaparelli, an Italian astronomer, made drawings and maps of the Martian surface that suggested strange features. The images from telescopes at that time were not as sharp as today's. Schiaparelli said he could see a network of lines, or <i>canali</i>. In 1894, an American astronomer, Percival Lowell, made a series of observations of Mars from his own observatory at Flagstaff, Arizona, U.S.A. Lowell was convinced a great network of canals had been dug to irrigate crops for the Martian race. He suggested that each canal had fertile vegetation on either side, making them noticeable from Earth. Drawings and globes he made show a network of canals and oases all over the planet.</p>\n<p><strong>B</strong> The idea that there was intelligent life on Mars gained strength in the late 19th century. In 1898, H. G. Wells wrote the science-fiction classic <i>The War of the Worlds</i> about an invading force of Martians who try to conquer Earth. They use highly advanced technology (advanced for 1898) to crush human resistance. In 1917, Edgar Rice Burroughs wrote the first in a series of 11 novels about Mars. Strange beings and rampaging Martian monsters gripped the public's imagination. A radio broadcast by Orson Welles on Halloween night in 1938 of <i>The War of the Worlds</i> caused widespread panic across America; people ran into the streets in their pyjamas—millions believed the dramatic reports of a Martian invasion.</p>\n<p><strong>C</strong> Probes are very important to our understanding of other planets. Much of our recent knowledge comes from these robotic missions into space. The first images sent back from Mars came from Mariner 4 in July 1965. They showed a cratered and barren landscape, more like the surface of our Moon than Earth. In 1969, Mariners 6 and 7 were launched and took 200 photographs of Mars's southern hemisphere and pole on fly-by missions, but these revealed little more information. In 1971, Mariner 9 became the first spacecraft to orbit the planet, circling every 12 hours. In 1975, the U.S.A. sent two Viking probes, each with an orbiter and a lander. The landers had sampler arms to scoop up Martian rocks and carried out experiments to try to find signs of life. Although no life was found, they sent back the first colour pictures of the planet's surface and atmosphere from pivoting cameras.</p>\n<p><strong>D</strong> A Martian meteorite found on Earth raised fresh doubts about the above analysis. Meteorite ALH 84001 was discovered in December 1984 in Antarctica by members of the ANSMET project. The sample was ejected from Mars about 17 million years ago and spent 11,000 years in, or on, Antarctic ice sheets. NASA's compositional analysis revealed a kind of magnetite that on Earth is only found in association with certain micro-organisms. Some structures resemble the mineralised casts of terrestrial bacteria and their appendages, fibrils or by-products occurring in the rims of carbonate globules and pre-terrestrial aqueous-alteration regions. The size and shape of the objects are consistent with Earthly fossilised nanobacteria, but the very existence of nanobacteria is still controversial.</p>\n<p><strong>E</strong> In 1965, the Mariner 4 probe discovered that Mars had no global magnetic field to protect the planet from potentially life-threatening cosmic and solar radiation; observations made in the late 1990s by Mars Global Surveyor confirmed this discovery. Scientists speculate that the lack of magnetic shielding helped the solar wind blow away much of Mars's atmosphere over several billion years. After mapping cosmic-radiation levels at various depths on Mars, researchers concluded that any life within the first several metres of the planet's surface would be killed by lethal doses of radiation. In 2007 it was calculated that DNA and RNA damage would limit life on Mars to depths greater than 7.5 metres below the surface. Therefore, the best places to look for life may be subsurface environments that have not yet been studied. The disappearance of the magnetic field may have played a significant role in Martian climate change. According to scientists' evaluation, Mars's climate gradually transitioned from warm and wet to cold and dry after the magnetic field vanished.</p>\n<p><strong>F</strong> NASA's recent missions have focused on another question: whether Mars had lakes or oceans of liquid water on its surface in the ancient past. Scientists have found hematite, a mineral that forms only in the presence of water. Thus, the 2004 Mars Exploration Rovers were designed not to look for present or past life, but for evidence of ancient liquid water. Because of Mars's current low atmospheric pressure and temperature, liquid water cannot persist at the surface except, briefly, at the lowest shaded elevations. In March 2004, NASA announced that its rover Opportunity had discovered evidence that Mars was once a wet planet. This raised hopes that evidence of past life might still be found. Later the Mars Express orbiter detected huge reserves of water-ice at Mars's south pole in January 2004.</p>\n<p><strong>G</strong> Researchers from the Center for Astrobiology (Spain) and the Catholic University of the North in Chile have found an oasis of micro-organisms two metres below the surface of the Atacama Desert. SOLID, a life-detection instrument, could be used in environments similar to Martian sub-soil. “We have named it a <i>microbial oasis</i> because we found micro-organisms developing in a habitat rich in rock salt and other highly hygroscopic compounds that absorb water,” explained Víctor Parro of the Center for Astrobiology. “If similar microbes, or their remains, exist on Mars under comparable conditions, we could detect them with instruments like SOLID,\" Parro added.</p>\n<p><strong>H</strong> Even more intriguing is an alternative scenario proposed by the Spanish scientists. If samples on Mars were found to use DNA—as Earthly life does—it would be extremely unlikely that such a specialised, complex molecule could have evolved independently on two planets. This would indicate a common origin for Martian and Earth life. Life based on DNA might have appeared first on Mars and then spread to Earth, where it evolved into the myriad plants and creatures alive today. If that proved true, we would face a startling conclusion: we are all Martians. If not, we must continue the search for other signs of life.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-18", "answers", {"answerKey":{"q1":"F","q2":"C","q3":"B","q4":"G","q5":"D","q6":"D","q7":"C","q8":"C","q9":"A","q10":"C","q11":"B","q12":"G","q13":"F","q14":"A"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-18", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-medium-18","meta":{"title":"Unlocking the mystery of dreams 梦的解析","category":"P3","frequency":"medium","pdfFilename":"114. P3 - Unlocking the mystery of dreams 梦的解析【次】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/114. P3 - Unlocking the mystery of dreams 梦的解析【次】/","legacyFilename":"114. P3 - Unlocking the mystery of dreams 梦的解析【次】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/114. P3 - Unlocking the mystery of dreams 梦的解析【次】/114. P3 - Unlocking the mystery of dreams 梦的解析【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/114. P3 - Unlocking the mystery of dreams 梦的解析【次】/114. P3 - Unlocking the mystery of dreams 梦的解析【次】.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-11T14:43:22.022Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
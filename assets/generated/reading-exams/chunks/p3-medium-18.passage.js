@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-18", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>Unlocking the mystery of dreams</h3>\n<p>Dreams have captivated thinkers since ancient times, but their mystery is now closer than ever to resolution, thanks to new technology that allows scientists to watch the sleeping brain at work.</p>\n<p><strong>A</strong> Thousands of years ago, dreams were seen as messages from the gods, and in many cultures, they are still considered prophetic, foretelling things to come. In ancient Greece, sick people slept at the temples of Asclepius, the god of medicine, in order to receive healing dreams. Modern dream science really begins at the end of the 19th century with Sigmund Freud, who theorized that dreams were the expression of unconscious desires often from childhood. He believed that exploring these hidden emotions through analysis could help cure mental illness. After Freud, the most important event in dream science was the discovery in the early 1950s of a phase of sleep characterized by intense brain activity and rapid eye movement (REM).</p>\n<p><strong>B</strong> Adult humans spend about a quarter of their sleep time in REM, much of it dreaming. People awakened in the midst of REM sleep reported vivid dreams, which led researchers to conclude that most dreaming took place during REM. Using a machine called the electroencephalograph (EEG), researchers were able to see that brain activity during REM resembled that of the brain when the body is awake. The mystery of REM sleep is that even though it may not be essential, it is universal – at least in mammals and even birds. Some researchers think REM may have evolved for physiological reasons. “One thing that's unique about mammals and birds is that they regulate body temperature,” says neuroscientist Jerry Siegel, director of UCLA's Center for Sleep Research. “There's no good evidence that any cold-blooded animal has REM sleep.\" REM sleep heats up the brain and non-REM cools it off, Siegel says, and that could mean that the changing sleep cycles allow the brain to repair itself. “It seems likely that REM sleep is filling a basic physiological function and that dreams are a kind of a side effect, or by-product of this.”</p>\n<p><strong>C</strong> There is great disagreement about the psychological function of dreams and researchers have come up with some differing theories. On one side are scientists like Harvard's Allan Hobson, who believes that dreams are essentially random. In the 1970s, Hobson and his colleague Robert McCarley proposed what they called the “activation-synthesis hypothesis,” which describes how dreams are formed by nerve signals sent out during REM sleep from a small area at the base of the brain called the pons. These signals, the researchers said, activate the images that we call dreams. That raised questions about dream research. If dreams are insignificant night-time images created by the brain, what is the point of studying them?</p>\n<p><strong>D</strong> But more recently, new theories have made some scientists take dreams more seriously. In 1997, Mark Solms of the University of Cape Town in South Africa found that there was more than one mechanism in the brain for activating dreams. Since then, Solms has argued that medical diagnostic equipment like functional magnetic resonance imaging (fMRI) and positron emission tomography (PET) that helps researchers watch dreaming brains might actually lend new support to Freud's ideas because the parts of the brain that are most active during dreaming control emotion. Further research has supported Solms's findings. Scientists using PET and fMRI technology to watch the dreaming brain have found that one of the most active areas during REM is the limbic system, which controls our emotions.</p>\n<p><strong>E</strong> Much less active during REM sleep is the prefrontal cortex, which is associated with logical thinking. That could explain why dreams in REM sleep often lack a coherent story line. Some researchers have also found that people dream in non-REM sleep as well, although those dreams generally are less vivid. Another active part of the brain in REM sleep is the anterior cingulate cortex, which detects differences or inconsistencies. Eric Nofzinger, director of the Sleep Neuroimaging Program at the University of Pittsburgh Medical Center, thinks that could be why people often solve tricky problems in their dreams.</p>\n<p><strong>F</strong> Deirdre Barrett, assistant professor at Harvard Medical School, would agree. In her book \"The Committee of Sleep,” she describes how painters like Jasper Johns and Salvador Dali found inspiration in their dreams. In her own research on problem solving through dreams, Barrett has found that even ordinary people can solve simple problems in their lives (like how to fit old furniture into a new apartment) if they focus on the dilemma before they fall asleep. There is also evidence that dreaming helps certain kinds of learning. Some researchers have found that dreaming about physical tasks, like a gymnast's floor routine, enhances performance.</p>\n<p><strong>G</strong> Whatever the function of dreams at night, they clearly can play a role in therapy during the day. The University of Maryland's Clara Hill, who has studied the use of dreams in therapy, says that dreams are a “back door” into a patient's thinking. “Dreams reveal stuff about you that you didn't know was there,” she says. The therapists she trains to work with patients' dreams use dream imagery to uncover hidden emotions and feelings. Rosalind Cartwright from the university medical center in Chicago has been studying depression in divorced men and women, and she is finding that \"good dreamers,\" people who have vivid dreams with strong story lines, are less likely to remain depressed. She thinks that dreaming helps diffuse powerful emotions. \"Dreaming is a mental-health activity,” she says.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
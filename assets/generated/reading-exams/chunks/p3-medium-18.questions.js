@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-18", "questions", {"questionGroups":[{"groupId":"group-1","kind":"table_completion","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Reading Passage 3 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–G</strong>, in boxes 27–31 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>27</strong> a reference to the significance of dreams on artists' work</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>28</strong> a concern about the usefulness of dream research</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>29</strong> the types of living creatures that have REM sleep</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>30</strong> research results linking dreams to psychological well-being</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>31</strong> an account of how modern research tools have strengthened Freud's theory</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"single_choice","questionIds":["q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<p><em>Write the correct letter in boxes 32–35 on your answer sheet.</em></p>\n<div class=\"question-item\">\n<p><strong>32</strong> In ancient times, people thought that dreams</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"A\"> A sent messages to the gods.</label> <label><input name=\"q6\" type=\"radio\" value=\"B\"> B helped resolve conflict.</label> <label><input name=\"q6\" type=\"radio\" value=\"C\"> C were a sign of physical illness.</label> <label><input name=\"q6\" type=\"radio\" value=\"D\"> D predicted future events.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> According to the passage, which of the following happens during REM sleep?</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"> A People rarely dream.</label> <label><input name=\"q7\" type=\"radio\" value=\"B\"> B People's dreams become confused.</label> <label><input name=\"q7\" type=\"radio\" value=\"C\"> C The temperature of the brain increases.</label> <label><input name=\"q7\" type=\"radio\" value=\"D\"> D The brain behaves differently than when you are awake.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> What explanation is suggested in paragraph E for lack of a clear narrative in dreams?</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"> A Some dreams occur in non-REM sleep.</label> <label><input name=\"q8\" type=\"radio\" value=\"B\"> B Some dreams are generated in different areas of the brain.</label> <label><input name=\"q8\" type=\"radio\" value=\"C\"> C The part of the brain in control of reasoning is less involved.</label> <label><input name=\"q8\" type=\"radio\" value=\"D\"> D The part of the brain responsible for feelings is more involved.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> According to the passage, which area of the brain helps people find solutions to difficult situations through their dreams?</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"> A the anterior cingulate cortex</label> <label><input name=\"q9\" type=\"radio\" value=\"B\"> B the pons</label> <label><input name=\"q9\" type=\"radio\" value=\"C\"> C the limbic system</label> <label><input name=\"q9\" type=\"radio\" value=\"D\"> D the prefrontal cortex</label>\n</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"matching","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Look at the following statements (Questions 36–40) and the list of people below.</p>\n<p>Match each statement with the correct person or people, <strong>A–G</strong>.</p>\n<p><em>Write the correct letter, <strong>A–G</strong>, in boxes 36–40 on your answer sheet.</em></p>\n<div class=\"match-question-item\">\n<p><strong>36</strong> Technology shows there is a link between dreams and the areas of the brain that deal with feelings.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>37</strong> Dreams are meaningless pictures created by the brain.</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>38</strong> Dreaming is a method of calming strong feelings.</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>39</strong> Our dreams can show us unexpected things about ourselves.</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>40</strong> Dreams may be a result of maintaining an essential body function.</p>\n<div class=\"match-dropzone\" data-question=\"q14\"></div>\n</div>\n<div class=\"options-pool\" id=\"people-options-pool\">\n<strong>List of People</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Jerry Siegel</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Allan Hobson and Robert McCarley</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Mark Solms</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Eric Nofzinger</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Deirdre Barrett</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F Clara Hill</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G Rosalind Cartwright</div>\n</div>\n</div>\n</div>","allowOptionReuse":false}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-183", "answers", {"answerKey":{"q1":"B","q2":"C","q3":"A","q4":"B","q5":"D","q6":"B","q7":"D","q8":"C","q9":"forehead","q10":"mental resources","q11":"cells","q12":"new memories","q13":"new skills","q14":"B"}});
+})(typeof window !== "undefined" ? window : globalThis);
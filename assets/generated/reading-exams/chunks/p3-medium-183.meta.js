@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-183", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-medium-183","meta":{"title":"The hazards of multitasking 多任务处理","category":"P3","frequency":"medium","pdfFilename":"90. P3 - The hazards of multitasking 多任务处理【次】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/90. P3 - The hazards of multitasking 多任务处理【次】/","legacyFilename":"90. P3 - The hazards of multitasking 多任务处理【次】.html","questionIntroHtml":"<div class=\"question-group\" id=\"q1-31-section\">\n<h3>Questions 27 – 31</h3>\n<p>Look at the following theories (Questions 27–31) and the list of people below.</p>\n<p>Match each theory with the correct person or people, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<p><em>Write the correct letter, <strong>A, B, C</strong> or <strong>D</strong>, in the boxes.</em></p>\n<div class=\"question-item matching-item\">\n<input name=\"q1\" type=\"text\" id=\"q27_input\" maxlength=\"1\">\n<p><strong>27</strong> Less attention will be paid to each task when more than one task is attempted at the same time.</p>\n</div>\n<div class=\"question-item matching-item\">\n<input name=\"q2\" type=\"text\" id=\"q28_input\" maxlength=\"1\">\n<p><strong>28</strong> Repeated changes of task mean that the brain will take a while to adjust.</p>\n</div>\n<div class=\"question-item matching-item\">\n<input name=\"q3\" type=\"text\" id=\"q29_input\" maxlength=\"1\">\n<p><strong>29</strong> Using the skills required for one task may make performing another one more difficult.</p>\n</div>\n<div class=\"question-item matching-item\">\n<input name=\"q4\" type=\"text\" id=\"q30_input\" maxlength=\"1\">\n<p><strong>30</strong> When multitasking, the brain can only focus on single tasks for very short periods.</p>\n</div>\n<div class=\"question-item matching-item\">\n<input name=\"q5\" type=\"text\" id=\"q31_input\" maxlength=\"1\">\n<p><strong>31</strong> Multitasking can lead to a medical problem.</p>\n</div>\n<div style=\"margin-top: 16px; padding: 10px; border: 1px solid var(--line); border-radius: 6px;\">\n<strong>List of People</strong>\n<ul class=\"options-list\">\n<li data-letter=\"A\">John Ridley Stroop</li>\n<li data-letter=\"B\">Ernst Pöppel</li>\n<li data-letter=\"C\">David E. Meyer</li>\n<li data-letter=\"D\">Edward Hallowell & John Ratey</li>\n</ul>\n</div>\n</div>\n<div class=\"question-group\" id=\"q6-34-section\">\n<h3>Questions 32 – 34</h3>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>32</strong> What is suggested about the worker in the opening paragraph?</p>\n<ul class=\"radio-options-list\">\n<li><label><input type=\"radio\" name=\"q6\" value=\"A\"> A Anxiety deprived him of sleep the previous night.</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"B\"> B He feels overwhelmed by his workload.</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"C\"> C His manager has expressed disapproval.</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"D\"> D He finds his work dull and uninteresting.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Drivers and air-traffic controllers are mentioned in the passage because they</p>\n<ul class=\"radio-options-list\">\n<li><label><input type=\"radio\" name=\"q7\" value=\"A\"> A need to perform several tasks at once.</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"B\"> B are unable to maintain concentration.</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"C\"> C use their time efficiently.</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"D\"> D cannot afford to make mistakes.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> In John Ridley Stroop's experiment, participants found it difficult to</p>\n<ul class=\"radio-options-list\">\n<li><label><input type=\"radio\" name=\"q8\" value=\"A\"> A tell one colour from another.</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"B\"> B match up pairs of similar colours.</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"C\"> C read out the name of one colour printed in another colour.</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"D\"> D decide what colour looks appropriate for a particular word.</label></li>\n</ul>\n</div>\n</div>\n<div class=\"question-group\" id=\"q9-39-section\">\n<h3>Questions 35 – 39</h3>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-text\">\n<h4>Multitasking and its effects on the brain</h4>\n<p>The stressful nature of multitasking has been shown to affect parts of the brain. The area most affected is the prefrontal cortex, which is found to the rear of the <strong>35</strong> <input name=\"q9\" type=\"text\" id=\"q35_input\">. It is the part of the brain which judges tasks, then puts them in order of importance and allocates <strong>36</strong> <input name=\"q10\" type=\"text\" id=\"q36_input\">; it also enables a worker to resume a task which has been put to one side.</p>\n<p>A second area, the hippocampus, may also be affected by the stress of multitasking. If any <strong>37</strong> <input name=\"q11\" type=\"text\" id=\"q37_input\"> in the hippocampus are affected, people may have problems with storing <strong>38</strong> <input name=\"q12\" type=\"text\" id=\"q38_input\"> as well as learning <strong>39</strong> <input name=\"q13\" type=\"text\" id=\"q39_input\">.</p>\n</div>\n</div>\n<div class=\"question-group\" id=\"q14-section\">\n<h3>Question 40</h3>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>40</strong> The main aim of this passage is to</p>\n<ul class=\"radio-options-list\">\n<li><label><input type=\"radio\" name=\"q14\" value=\"A\"> A describe areas where multitasking is useful.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"B\"> B challenge widely held opinions on multitasking.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"C\"> C show the physical damage that multitasking can cause.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"D\"> D call for better psychological experiments on multitasking.</label></li>\n</ul>\n</div>\n</div>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/90. P3 - The hazards of multitasking 多任务处理【次】/90. P3 - The hazards of multitasking 多任务处理【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/90. P3 - The hazards of multitasking 多任务处理【次】/90. P3 - The hazards of multitasking 多任务处理【次】.pdf","ieltsHtml":null},"audit":{"matchStatus":"shui_only","matchConfidence":0,"verifiedAt":"2026-03-08T16:24:30.814Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-185", "answers", {"answerKey":{"q1":"D","q2":"A","q3":"D","q4":"B","q5":"D","q6":"B","q7":"culture","q8":"present","q9":"grammar","q10":"individuality","q11":"NO","q12":"NOT GIVEN","q13":"YES","q14":"NO"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-185", "questions", {"questionGroups":[{"groupId":"group-1","kind":"short_answer","questionIds":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"leadHtml":"<h2>Questions</h2>\n<div class=\"question-group\" id=\"q1-32-section\">\n<h3>Questions 27–32</h3>\n<p style=\"margin-bottom: 12px;\">Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> What are we told about Daniel Everett in the first paragraph?</p>\n<div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A He has lived among the Pirahã since 1977.</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B It took him seven years to learn the Pirahã language.</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C No one would publish his research for three decades.</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D Studying the Pirahã language is the focus of his work.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Which of the following is the best summary of the second paragraph?</p>\n<div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A Humans are the only species to be linguistically creative.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B Humans, bees, birds and whales share a characteristic.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C Human language is not fully understood by scientists.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D Humans are the only species to use syntax.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Why does the writer refer to subordinate clauses?</p>\n<div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A to criticise the general approach of linguistics</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B to compare two features of the Pirahã language</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C to explain why the Pirahã language is difficult to learn</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D to exemplify an unusual feature of the Pirahã language</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What point does the writer make about the work of Whorf?</p>\n<div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A He thought that numbers were common to all human languages.</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B His theory might be supported by Everett's research.</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C His research enabled him to find a new life among the Pirahã.</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D He predicted that people like the Pirahã would never be found.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> The writer refers to the Warlpiri people in order to</p>\n<div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"> A suggest that the Pirahã be taught to count in English.</label> <label><input name=\"q5\" type=\"radio\" value=\"B\"> B show how tribal peoples learn a foreign language.</label> <label><input name=\"q5\" type=\"radio\" value=\"C\"> C compare counting in English and Portuguese.</label> <label><input name=\"q5\" type=\"radio\" value=\"D\"> D illustrate the uniqueness of the Pirahã.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> What is Everett's point about the Pirahã's intellectual capacities?</p>\n<div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q6\" type=\"radio\" value=\"A\"> A Pirahã students have not graduated from universities.</label> <label><input name=\"q6\" type=\"radio\" value=\"B\"> B He does not want people to criticise their intelligence.</label> <label><input name=\"q6\" type=\"radio\" value=\"C\"> C Their isolation makes it difficult to evaluate their intelligence.</label> <label><input name=\"q6\" type=\"radio\" value=\"D\"> D He believes their language is more complex than their neighbours'.</label>\n</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q7-36-section\">\n<h3>Questions 33–36</h3>\n<p style=\"margin-bottom: 12px;\">Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n<div class=\"summary-text\">\n<h4>Everett's explanation</h4>\n<p>\nEverett believes that a group's language is a product of their <strong>33</strong> <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> and thus language is infinitely varied. During the time he spent living among them, he observed that the Pirahã only place value on the <strong>34</strong> <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> and have no <strong>35</strong> <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span> to describe completed events. Similarly, the types of names they use reflect the fact that they do not celebrate <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span>.\n</p>\n</div>\n<div id=\"word-options\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"present\">A present</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"past\">B past</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"time\">C time</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"future\">D future</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"culture\">E culture</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"grammar\">F grammar</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"art\">G art</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"individuality\">H individuality</div>\n<div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-word=\"children\">I children</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q11-40-section\">\n<h3>Questions 37–40</h3>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3? Write <strong>YES</strong>, <strong>NO</strong>, or <strong>NOT GIVEN</strong>.</p>\n<div class=\"question-item\">\n<p><strong>37</strong> Everett was surprised by the way his research was greeted.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> Chomsky has been critical of Everett's research methodology.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> If 'recursion' as a universal concept is disproved, Chomsky's ideas about language would be wrong.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> The Pirahã will benefit from their new-found status among academics.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","bodyHtml":""}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
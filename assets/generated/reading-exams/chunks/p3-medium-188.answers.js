@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-188", "answers", {"answerKey":{"q1":"C","q2":"A","q3":"B","q4":"D","q5":"I","q6":"D","q7":"J","q8":"F","q9":"C","q10":"YES","q11":"NO","q12":"NOT GIVEN","q13":"NOT GIVEN","q14":"YES"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-188", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-medium-188","meta":{"title":"The Significant Role of Mother Tongue in Education 母语教育","category":"P3","frequency":"medium","pdfFilename":"95. P3 - The Significant Role of Mother Tongue in Education 母语教育【次】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/95. P3 - The Significant Role of Mother Tongue in Education 母语教育【次】/","legacyFilename":"95. P3 - The Significant Role of Mother Tongue in Education 母语教育【次】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/95. P3 - The Significant Role of Mother Tongue in Education 母语教育【次】/95. P3 - The Significant Role of Mother Tongue in Education 母语教育【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/95. P3 - The Significant Role of Mother Tongue in Education 母语教育【次】/95. P3 - The Significant Role of Mother Tongue in Education 母语教育【次】.pdf","ieltsHtml":"IELTS/P3/The Significant Role of Mother Tongue in Education.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.821Z","notes":"signature:radio,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-188", "questions", {"questionGroups":[{"groupId":"group-1","kind":"single_choice","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> What point did the writer make in the second paragraph?</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A Some present studies on children's mother tongues are misleading.</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B A culturally rich education programme benefits some children more than others.</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C Bilingual children can make a valuable contribution to the wealth of a country.</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D The law on mother tongue use at school should be strengthened.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Why does the writer refer to something that Goethe said?</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A to lend weight to his argument</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B to contradict some research</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C to introduce a new concept</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D to update current thinking</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> The writer believes that when young children have a firm grasp of their mother tongue</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A They can teach older family members what they learnt at school.</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B They go on to do much better throughout their time at school.</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C They can read stories about their cultural background.</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D They develop stronger relationships with their family than with their peers.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Why are some people suspicious about mother-tongue-based teaching programmes?</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A They worry that children will be slow to learn to read in either language.</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B They think that children will confuse words in the two languages.</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C They believe that the programmes will make children less interested in their lessons.</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D They fear that the programmes will use up valuable time in the school day.</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q5","q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n<h4>Questions 31–35</h4>\n<p>Complete the summary using the list of words, <strong>A–J</strong>, below.</p>\n<div class=\"summary-text\">\n<h4>Bilingual Children</h4>\n<p>\nIt was often recorded that bilingual children acquire the <strong>31</strong> <span id=\"q5-target\" class=\"drop-target-summary\" data-question=\"q5\"></span> to converse in the majority language remarkably quickly. The fact that the mother tongue can disappear at a similar <strong>32</strong> <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> is less well understood. This phenomenon depends, to a certain extent, on the proportion of people with the same linguistic background who have settled in a particular <strong>33</strong> <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span>. If this is limited, children are likely to lose the active use of their mother tongue, and thus no longer employ it even with <strong>34</strong> <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span>, although they may still understand it. It follows that teenage children in these circumstances experience a sense of <strong>35</strong> <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span> in relation to all aspects of their lives.\n</p>\n</div>\n<div id=\"word-options\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A teachers</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B school</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C dislocation</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D rate</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E time</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F family</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G communication</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H type</div>\n<div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I ability</div>\n<div id=\"word-J\" class=\"draggable-word\" draggable=\"true\" data-key=\"J\">J area</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"yes_no_not_given","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Do the following statements agree with the information given in Reading Passage 3?</p>\n<p>In boxes 36–40 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>36</strong> Less than half of the children who attend kindergarten in Toronto have English as their mother tongue.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> Research proves that learning the host country language at school can have an adverse effect on a child's mother tongue.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> The Foyer program is to be accepted by the French education system.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> Bilingual children are taught to tell the time earlier than monolingual children.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> Bilingual children can apply reading comprehension strategies acquired in one language when reading in the other.</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
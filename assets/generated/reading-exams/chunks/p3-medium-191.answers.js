@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-191", "answers", {"answerKey":{"q1":"D","q2":"C","q3":"C","q4":"D","q5":"NOT GIVEN","q6":"NOT GIVEN","q7":"NOT GIVEN","q8":"FALSE","q9":"C","q10":"D","q11":"B","q12":"E","q13":"A"}});
+})(typeof window !== "undefined" ? window : globalThis);
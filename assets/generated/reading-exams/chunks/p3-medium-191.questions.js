@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-191", "questions", {"questionGroups":[{"groupId":"group-1","kind":"short_answer","questionIds":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"leadHtml":"<h2>Questions</h2>\n<div class=\"question-group\" id=\"q2-31-section\">\n<h3>Questions 28–31</h3>\n<p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>28</strong> What is the main purpose of paragraph A?</p>\n<ul class=\"options-list\">\n<li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A Introduction of Professor James Paul Gee.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B Introduction of the video game Pajama Sam.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C Introduction of types of video games.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D Introduction of the background of this passage.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> What does the author want to express in the second paragraph?</p>\n<ul class=\"options-list\">\n<li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A Video games are widely considered harmful for children's brains.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B Most violent video games are the direct cause of juvenile delinquency.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C Even though there is a certain proportion of violence in most video games, scientists and psychologists see their benefits to children's intellectual abilities.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D Many parents regard video games as time-wasters that rot children's brains.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What is correctly mentioned in paragraph D?</p>\n<ul class=\"options-list\">\n<li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A Some schools use video games to teach students abstract and high-level thinking.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B Video games improve brain ability in various aspects.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C Some surgeons have better skills because they play more video games.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D Skilful fighter pilots in this generation love to play video games.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> What is the finding of the experiment the three researchers conducted in the last paragraph?</p>\n<ul class=\"options-list\">\n<li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A Gamers have to make the best use of limited resources.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B Gamers with better math skills will win in the end.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C Strategy-game players have better ability to make quick decisions.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D Video games help increase the speed of players' reactions effectively.</label></li>\n</ul>\n</div>\n</div>\n<div class=\"question-group\" id=\"q6-35-section\">\n<h3>Questions 32–35</h3>\n<p>Do the following statements agree with the information given in Reading Passage 3? Write <strong>TRUE</strong>, <strong>FALSE</strong>, or <strong>NOT GIVEN</strong>.</p>\n<div class=\"question-item\">\n<p><strong>32</strong> Most video games are popular because of their violent content.</p>\n<div class=\"matching-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> It would be a good idea for schools to apply video games in their classrooms.</p>\n<div class=\"matching-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Those people who are addicted to video games have lots of dopamine in their brains.</p>\n<div class=\"matching-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> The action-game players minimised the percentage of mistakes in the experiment.</p>\n<div class=\"matching-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q10-40-section\">\n<h3>Questions 36–40</h3>\n<p>Look at the following statements (Questions 36–40) and the list of people below. Match each statement with the correct person, <strong>A–F</strong>.</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th>Statement</th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>36</strong> Video games, like other daily-life skills, alter the brain’s physical structure.</td>\n<td><input name=\"q9\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>37</strong> The brain is ready to make decisions without hesitation when players are immersed in stressful games.</td>\n<td><input name=\"q10\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q10\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q10\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q10\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q10\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q10\" type=\"radio\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>38</strong> The purpose-motivated experience that video games offer plays an essential role in studying.</td>\n<td><input name=\"q11\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q11\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q11\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q11\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q11\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q11\" type=\"radio\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>39</strong> Players are good at tackling immediate issues while keeping future intentions in mind.</td>\n<td><input name=\"q12\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q12\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q12\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q12\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q12\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q12\" type=\"radio\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>40</strong> Video games help children broaden their horizons in many aspects and gain self-confidence.</td>\n<td><input name=\"q13\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q13\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q13\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q13\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q13\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q13\" type=\"radio\" value=\"F\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n<div class=\"people-list\" style=\"margin-top: 20px;\">\n<h5>List of people</h5>\n<p><strong>A</strong> The writer's opinion</p>\n<p><strong>B</strong> James Paul Gee</p>\n<p><strong>C</strong> Shawn Green</p>\n<p><strong>D</strong> Daphne Bavelier</p>\n<p><strong>E</strong> Steven Johnson</p>\n<p><strong>F</strong> Jacob Benjamin</p>\n</div>\n</div>","bodyHtml":""}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13"],"questionDisplayMap":{"q1":"28","q2":"29","q3":"30","q4":"31","q5":"32","q6":"33","q7":"34","q8":"35","q9":"36","q10":"37","q11":"38","q12":"39","q13":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
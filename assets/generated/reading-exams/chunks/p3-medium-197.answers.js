@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-197", "answers", {"answerKey":{"q1":"yes","q2":"not given","q3":"no","q4":"yes","q5":"b","q6":"f","q7":"d","q8":"c","q9":"g","q10":"a","q11":"b","q12":"d","q13":"b","q14":"d"}});
+})(typeof window !== "undefined" ? window : globalThis);
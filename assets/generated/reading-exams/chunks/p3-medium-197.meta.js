@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-197", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-medium-197","meta":{"title":"Australia’s Megafauna Controversy 巨兽灭绝【次】","category":"P3","frequency":"medium"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-197", "questions", {"questionGroups":[{"groupId":"group-1","kind":"yes_no_not_given","questionIds":["q1","q2","q3","q4"],"bodyHtml":"<div class=\"group\">\n<a id=\"q1-anchor\"></a>\n<h4>Questions 27–30</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<div class=\"q-block\"><p><strong>27</strong> Field and Wroe argue that findings at the Cuddie Springs site show that people lived in this area at the same time as megafauna.</p><div class=\"options\"><label><input type=\"radio\" name=\"q1\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q1\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q1\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>28</strong> Field and Wroe believe it is likely that smaller megafauna species survived the last Ice Age.</p><div class=\"options\"><label><input type=\"radio\" name=\"q2\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q2\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q2\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>29</strong> The writers believe that the dating of earth up to 1.7 m below the present surface at Cuddie Springs is unreliable.</p><div class=\"options\"><label><input type=\"radio\" name=\"q3\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q3\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q3\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>30</strong> Some artefacts found at Cuddie Springs were preserved well enough to reveal their function.</p><div class=\"options\"><label><input type=\"radio\" name=\"q4\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q4\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q4\" value=\"not given\"> NOT GIVEN</label></div></div>\n</div>"},{"groupId":"group-2","kind":"summary_completion","questionIds":["q5","q6","q7","q8","q9"],"bodyHtml":"<div class=\"group\">\n<a id=\"q5-anchor\"></a>\n<h4>Questions 31–35</h4>\n<p>Complete the summary using the list of words, A–I, below.</p>\n<h5>The writers' arguments against Field and Wroe's analysis of the scientific data from Cuddie Springs</h5>\n<p>One objection to Field and Wroe's interpretation is the large quantity of charcoal, <strong>31</strong> <span class=\"dropzone match-dropzone\" data-target=\"q5\" data-question=\"q5\"></span> and artefacts found at Cuddie Springs. Such large numbers of artefacts would be impossible if the area had been covered with <strong>32</strong> <span class=\"dropzone match-dropzone\" data-target=\"q6\" data-question=\"q6\"></span> for a period. There is also a complete lack of man-made structures, for instance those used for <strong>33</strong> <span class=\"dropzone match-dropzone\" data-target=\"q7\" data-question=\"q7\"></span>.</p>\n<p>Other evidence that casts doubt on Field and Wroe's claim is the fact that while some material in the highest levels of sediment is 36,000 years old, the <strong>34</strong> <span class=\"dropzone match-dropzone\" data-target=\"q8\" data-question=\"q8\"></span> in the same levels is much more recent. The tools used to process plants and animals may also be newer than Field and Wroe believe. Further evidence against human occupation of the area is the absence of tools and <strong>35</strong> <span class=\"dropzone match-dropzone\" data-target=\"q9\" data-question=\"q9\"></span> just a short distance away.</p>\n<div class=\"option-pool\" id=\"pool-summary\">\n<div class=\"card\" draggable=\"true\" data-value=\"A\"><strong>A</strong> seeds</div><div class=\"card\" draggable=\"true\" data-value=\"B\"><strong>B</strong> stone</div><div class=\"card\" draggable=\"true\" data-value=\"C\"><strong>C</strong> sand</div><div class=\"card\" draggable=\"true\" data-value=\"D\"><strong>D</strong> cooking</div><div class=\"card\" draggable=\"true\" data-value=\"E\"><strong>E</strong> deep drill core</div><div class=\"card\" draggable=\"true\" data-value=\"F\"><strong>F</strong> water</div><div class=\"card\" draggable=\"true\" data-value=\"G\"><strong>G</strong> fossil bones</div><div class=\"card\" draggable=\"true\" data-value=\"H\"><strong>H</strong> sediment</div><div class=\"card\" draggable=\"true\" data-value=\"I\"><strong>I</strong> storage</div>\n</div>\n</div>"},{"groupId":"group-3","kind":"single_choice","questionIds":["q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\">\n<a id=\"q10-anchor\"></a>\n<h4>Questions 36–40</h4>\n<p>Choose the correct letter, A, B, C or D.</p>\n<div class=\"q-block\"><p><strong>36</strong> What conclusions did the writers reach about the inconsistencies in the data from Cuddie Springs?</p><div class=\"options\"><label><input type=\"radio\" name=\"q10\" value=\"A\"> A The different layers of sediment have been mixed over time.</label><label><input type=\"radio\" name=\"q10\" value=\"B\"> B The sand evidence is unhelpful and should be disregarded.</label><label><input type=\"radio\" name=\"q10\" value=\"C\"> C The area needs to be re-examined when technology improves.</label><label><input type=\"radio\" name=\"q10\" value=\"D\"> D The charcoal found in the area cannot be dated.</label></div></div>\n<div class=\"q-block\"><p><strong>37</strong> According to the writers, what impact could a natural phenomenon have had on this site?</p><div class=\"options\"><label><input type=\"radio\" name=\"q11\" value=\"A\"> A Floods could have caused the death of the megafauna.</label><label><input type=\"radio\" name=\"q11\" value=\"B\"> B Floods could have disturbed the archaeological evidence.</label><label><input type=\"radio\" name=\"q11\" value=\"C\"> C Bushfires could have prevented humans from settling in the area for any length of time.</label><label><input type=\"radio\" name=\"q11\" value=\"D\"> D Bushfires could have destroyed much of the evidence left by megafauna and humans.</label></div></div>\n<div class=\"q-block\"><p><strong>38</strong> What did the writers speculate about the people who lived at this site in 1876?</p><div class=\"options\"><label><input type=\"radio\" name=\"q12\" value=\"A\"> A They bred cattle whose bones could have been confused with megafauna.</label><label><input type=\"radio\" name=\"q12\" value=\"B\"> B They found that the soil was too waterlogged for farming.</label><label><input type=\"radio\" name=\"q12\" value=\"C\"> C They allowed cattle to move around freely at the site.</label><label><input type=\"radio\" name=\"q12\" value=\"D\"> D They brought stones there from another area.</label></div></div>\n<div class=\"q-block\"><p><strong>39</strong> In the final paragraph, what suggestion do the writers make about Australia's megafauna?</p><div class=\"options\"><label><input type=\"radio\" name=\"q13\" value=\"A\"> A A rapid change in climate may have been responsible for the extinction of the megafauna.</label><label><input type=\"radio\" name=\"q13\" value=\"B\"> B Megafauna could have died out as a result of small numbers being killed year after year.</label><label><input type=\"radio\" name=\"q13\" value=\"C\"> C The population of humans at that time was probably insufficient to cause the extinction of the megafauna.</label><label><input type=\"radio\" name=\"q13\" value=\"D\"> D The extinction of ancient animals should not be compared to that of modern-day species.</label></div></div>\n<div class=\"q-block\"><p><strong>40</strong> Which of the following best represents the writers' criticism of Field and Wroe?</p><div class=\"options\"><label><input type=\"radio\" name=\"q14\" value=\"A\"> A Their methods were not well thought out.</label><label><input type=\"radio\" name=\"q14\" value=\"B\"> B The excavations did not go deep enough.</label><label><input type=\"radio\" name=\"q14\" value=\"C\"> C Their technology failed to obtain precise data.</label><label><input type=\"radio\" name=\"q14\" value=\"D\"> D Their conclusions were based on inconsistent data.</label></div></div>\n</div>"}],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"},"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"]});
+})(typeof window !== "undefined" ? window : globalThis);
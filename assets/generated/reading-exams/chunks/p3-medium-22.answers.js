@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-22", "answers", {"answerKey":{"q1":"v","q2":"iii","q3":"i","q4":"iv","q5":"vi","q6":"E","q7":"D","q8":"C","q9":"B","q10":"C","q11":"sub-arctic","q12":"short","q13":"predatory animals","q14":"C"}});
+})(typeof window !== "undefined" ? window : globalThis);
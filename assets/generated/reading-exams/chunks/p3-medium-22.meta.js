@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-22", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-medium-22","meta":{"title":"Neanderthal Technology 尼安德特人的生存技艺","category":"P3","frequency":"medium","pdfFilename":"118. P3 - Neanderthal Technology 尼安德特人的生存技艺【次】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/118. P3 - Neanderthal Technology 尼安德特人的生存技艺【次】/","legacyFilename":"118. P3 - Neanderthal Technology 尼安德特人的生存技艺【次】.html","questionIntroHtml":"<h3>Questions</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/118. P3 - Neanderthal Technology 尼安德特人的生存技艺【次】/118. P3 - Neanderthal Technology 尼安德特人的生存技艺【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/118. P3 - Neanderthal Technology 尼安德特人的生存技艺【次】/118. P3 - Neanderthal Technology 尼安德特人的生存技艺【次】.pdf","ieltsHtml":"IELTS/P3/Neanderthal Technology.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-11T14:43:22.028Z","notes":"signature:radio,text,textarea,dragdrop,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-22", "questions", {"questionGroups":[{"groupId":"group-1","kind":"matching","questionIds":["q1","q2","q3","q4","q5"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Reading Passage 3 has five sections, <strong>A–E</strong>.</p>\n<p>Choose the correct heading for each section from the list of headings below.</p>\n<p><em>Drag a heading from this list and drop it onto the correct section's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i Evidence of outdoor dwellings</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Learning to make fire</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii A perfect place to live</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv Examining the cave contents</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v Contrasting two types of home</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi A vital source of power</div>\n</div>\n</div>\n</div>","allowOptionReuse":false,"leadHtml":"<h3>Questions</h3>"},{"groupId":"group-2","kind":"matching","questionIds":["q6","q7","q8","q9","q10"],"bodyHtml":"<div class=\"group\" id=\"q6-7-8-9-10-anchor\">\n<h4>Questions 32–36</h4>\n<p>Look at the following findings (Questions 32–36) and the list of places below.</p>\n<p>Match each finding with the correct place, <strong>A–E</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>32</strong> a burnt piece of wood</p>\n<div class=\"match-dropzone\" data-question=\"q6\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>33</strong> evidence of efforts to prevent pools of water forming</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>34</strong> the remains of sea creatures</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>35</strong> a circular arrangement of animal bones</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>36</strong> evidence suggesting the use of animal fur for warmth</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"options-pool\" id=\"places-options-pool\">\n<strong>List of Places</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A The Périgord region</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Moldova</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C The Grotte du Lazaret</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D The cave of Baume-Bonne</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Krapina</div>\n</div>\n</div>\n</div>","allowOptionReuse":true},{"groupId":"group-3","kind":"summary_completion","questionIds":["q11","q12","q13"],"bodyHtml":"<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 37–39</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>The use of fire</h4>\n<p>\nNeanderthalers could not have survived without fire because the conditions they lived in were <strong>37</strong> <input name=\"q11\" type=\"text\" id=\"q37_input\">. Most evidence of purpose-built fires takes the form of ash piles, features of which suggest that the fires lasted a <strong>38</strong> <input name=\"q12\" type=\"text\" id=\"q38_input\"> time. It is hard to be certain about the size and structure of the fires, though they were certainly needed to protect the occupants from dangerous <strong>39</strong> <input name=\"q13\" type=\"text\" id=\"q39_input\">, among other things.\n</p>\n</div>\n</div>"},{"groupId":"group-4","kind":"single_choice","questionIds":["q14"],"bodyHtml":"<div class=\"group\" id=\"q14-anchor\">\n<h4>Question 40</h4>\n<p>Choose the correct letter, A, B, C or D.</p>\n<div class=\"mc-question\">\n<p><strong>40</strong> The purpose of the writer of this article is to</p>\n<ul class=\"mc-options\">\n<li><label><input type=\"radio\" name=\"q14\" value=\"A\"><strong>A</strong>argue that Neanderthal homes were bigger than originally thought.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"B\"><strong>B</strong>explain why Neanderthal people migrated to Western Europe.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"C\"><strong>C</strong>discuss what is known about Neanderthal settlements.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"D\"><strong>D</strong>track the progress of early Neanderthal development.</label></li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
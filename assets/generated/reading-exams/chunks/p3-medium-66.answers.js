@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-66", "answers", {"answerKey":{"q1":"TRUE","q2":"NOT GIVEN","q3":"TRUE","q4":"TRUE","q5":"FALSE","q6":"FALSE","q7":"FALSE","q8":"TRUE","q9":"two-dimensional","q10":"straight line","q11":"areal distortion","q12":"polar regions","q13":"navigation","q14":"North America"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-66", "meta", {"schemaVersion":"ReadingExamSourceV1","examId":"p3-medium-66","meta":{"title":"Mercator - The Map Maker 地理制图师","category":"P3","frequency":"medium","pdfFilename":"158. P3 - Mercator - The Map Maker 地理制图师【次】.pdf","legacyPath":"睡着过项目组/2. 所有文章(11.20)[192篇]/158. P3 - Mercator - The Map Maker 地理制图师【次】/","legacyFilename":"158. P3 - Mercator - The Map Maker 地理制图师【次】.html","questionIntroHtml":"<h3>Questions 27–34</h3>"},"sourceRefs":{"shuiHtml":"睡着过项目组/2. 所有文章(11.20)[192篇]/158. P3 - Mercator - The Map Maker 地理制图师【次】/158. P3 - Mercator - The Map Maker 地理制图师【次】.html","shuiPdf":"睡着过项目组/2. 所有文章(11.20)[192篇]/158. P3 - Mercator - The Map Maker 地理制图师【次】/158. P3 - Mercator - The Map Maker 地理制图师【次】.pdf","ieltsHtml":"IELTS/P3/Mercator - The Map Maker.html"},"audit":{"matchStatus":"matched","matchConfidence":1,"verifiedAt":"2026-03-08T16:24:30.625Z","notes":"signature:radio,text,textarea,table"}});
+})(typeof window !== "undefined" ? window : globalThis);
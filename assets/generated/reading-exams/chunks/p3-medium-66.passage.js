@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-66", "passage", {"passage":{"blocks":[{"blockId":"passage-main","kind":"html","html":"<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>Mercator - The Map Maker</h3>\n<p>Maps codify the miracle of existence. And the man who wrote the codes for the maps we use today was Gerard Mercator, a cobbler's son born 500 years ago on a muddy floodplain in northern Europe.</p>\n<p>Mercator was a humble man with a universal vision. In his own time he was ‘the prince of modern geographers', his depictions of the planet and its regions unsurpassed in accuracy, clarity and consistency. More recently, he was crowned by the American scholar Robert W. Karrow as 'the first modern, scientific cartographer'. Where his predecessors had adopted a piecemeal approach to cartography, Mercator sought to wrap the world in systematic overlapping maps. Along the way he erected a number of historic milestones. He participated in the naming and mapping of 'America', he constructed the two most important globes of the 16th century, and the title of his pioneering 'modern geography', the Atlas, became the standard term for a volume of maps. Mercator also devised a new method - 'a projection' - of converting the spherical world into a two-dimensional map.</p>\n<p>Mercator was born in 1512 and died in 1594. His world was one of military conflict, social upheaval, religious revolution - and geographical discovery. He was ten years old when the survivors of the world's first circumnavigation returned to Spain in their leaking caravel. No better example is required of genius arising from turmoil. He knew poverty, plague, war and persecution. He was imprisoned for his ideas yet patronised by an emperor. His life was one of brilliant breakthroughs and abrupt reversals. In its telling, his is the story of the poor boy made good: the pauper who embraced the world, found fame, faced death, yet triumphed through fortitude. Variously described by his peers as honest, calm, candid, sincere and peaceable, Mercator wore an aura of calm in troubled times. His attitude to his geographical calling was described by his friend and neighbour, William Ghim, as 'indefatigable'. Some 40 or so of Mercator's letters have survived, together with examples of virtually all of his printed maps and globes.</p>\n<p>Mercator's most significant work was a project of cosmic proportions. A multi-part cosmography, the work would include a section on astronomy, a chronology of world events and a modern geography, which would eventually contain over 100 maps.</p>\n<p>Before he commenced the great work, Mercator produced in 1569 an enormous world map on a new projection. His method for converting the spherical globe into a two-dimensional map helped to solve the greatest cartographic riddle of the day: how could the course of a ship following a constant compass bearing be represented as a straight line on a map which had been constructed on a grid of latitude and longitude?</p>\n<p>Mercator's solution was to progressively increase the space between his lines of latitude, away from the equator. The effect was to straighten the lines of constant compass bearing (also known as rhumbs or loxodromes). Unfortunately, straightening the rhumbs caused areal* distortion: at the map's northern and southern extremities, the polar regions occupied the full width of the map, while North America appeared to fill half the circumference of the world.</p>\n<p>Few of Mercator's contemporaries understood what he was up to, despite the map's title explaining that it was intended ‘for use in navigation'. Mercator knew that his projection was unsuitable as an areal description of the world, but it would be several decades before the map's true navigational value would be recognised.</p>\n<p>Meanwhile, Mercator was marshalling and editing all the geographical data he needed for his modern regional maps of the world. His sources were wide-ranging and multitudinous, including an imperial physician in Vienna and his competitor, the Viceroy of Holstein. He was still working on these maps when he died. The great cosmography that Mercator had already titled 'Atlas' would never be finished.</p>\n<p>In the Atlas, Mercator had embodied the principles of future mapmaking: his italic lettering, his identical map overlaps, his complete coverage of regions at more than one scale, his consistent use of grids of latitude and longitude, his singular editorial control, were all adopted as cartographic standards. 'Atlas', the cosmography, became 'atlas', the (Oxford English Dictionary) term for ‘a collection of maps in a volume.'</p>\n<p>The projection assumed a life of its own. So powerful a cartographic tool did it become that Mercator the man became subsumed by his own device. By the 20th century, Mercator's Projection had been adopted by state cartographers to map the land that he had named 'North America'. In 1938, Mercator's Projection was selected by the Ordnance Survey to map Britain anew. And in 1974, the American cartographer Alden P. Colvocoresses used the Space Oblique Mercator Projection for the first satellite map of the USA. When the Jet Propulsion Laboratory sent Mariner 8 and Mariner 9 to map Mars, they undertook their Martian cartography on a standard Mercator Projection. One by one, the mappable orbs of our solar system are appearing on the worldwide web, flattened for our screens according to Mercator's cartographic principles.</p>\n<p>Mercator's Projection succeeded in reconciling the sphere and the plane, while his Atlas enveloped the world with an integrated system of maps.</p>\n<p>*areal: of an area</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"}]}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,7 @@
+(function registerReadingExamPart(global) {
+  'use strict';
+  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {
+    throw new Error("reading_exam_registry_missing");
+  }
+  global.__READING_EXAM_DATA__.registerPart("p3-medium-66", "questions", {"questionGroups":[{"groupId":"group-1","kind":"true_false_not_given","questionIds":["q1","q2","q3","q4","q5","q6","q7","q8"],"bodyHtml":"<div class=\"group\" id=\"q1-2-3-4-5-6-7-8-anchor\">\n<h4>Do the following statements agree with the information given in Reading Passage 3?</h4>\n<p>In boxes 27-34 on your answer sheet, write:</p>\n<ul style=\"list-style-position: inside; padding-left: 0; margin-bottom: 1rem;\">\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> Cartographers before Mercator had tended to produce separate, individual maps.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Mercator was critical of the work of his contemporaries.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> During his life, Mercator experienced great changes of fortune.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Most of Mercator's published work remains intact today.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> Mercator started work on his projection shortly after embarking on his cosmography.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> Mercator's Projection was immediately seen as a major breakthrough.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Mercator produced an accurate areal description of the world.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Mercator consulted the work of various people when producing his maps.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>","leadHtml":"<h3>Questions 27–34</h3>"},{"groupId":"group-2","kind":"sentence_completion","questionIds":["q9","q10","q11","q12","q13","q14"],"bodyHtml":"<div class=\"group\" id=\"q9-10-11-12-13-14-anchor\">\n<h4>Complete the notes below.</h4>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>Mercator's Projection</h4>\n<ul>\n<li>His attempt to represent the globe as a <strong>35</strong> <input type=\"text\" id=\"q35_input\" maxlength=\"25\" name=\"q9\"> map</li>\n</ul>\n<p><strong>Problem:</strong></p>\n<ul>\n<li>When sailors used a map based on lines of latitude and longitude and kept to a constant compass bearing, the course of the ship could not be shown as a <strong>36</strong> <input type=\"text\" id=\"q36_input\" maxlength=\"25\" name=\"q10\"> on a map</li>\n</ul>\n<p><strong>Solution:</strong></p>\n<ul>\n<li>To increase the space separating the lines of latitude, the further they are from the equator</li>\n</ul>\n<p><strong>Result:</strong></p>\n<ul>\n<li>When Mercator straightened the ‘rhumbs’ as intended, this produced <strong>37</strong> <input type=\"text\" id=\"q37_input\" maxlength=\"25\" name=\"q11\"> at the northern and southern extremities, with the full width of the map being taken up by the <strong>38</strong> <input type=\"text\" id=\"q38_input\" maxlength=\"25\" name=\"q12\"></li>\n</ul>\n<p><strong>Original intention:</strong></p>\n<ul>\n<li>Mercator originally designed the map for <strong>39</strong> <input type=\"text\" id=\"q39_input\" maxlength=\"25\" name=\"q13\"> purposes</li>\n</ul>\n<p><strong>Uses of Mercator's Projection up to the present day:</strong></p>\n<ul>\n<li>Various uses including the mapping of <strong>40</strong> <input type=\"text\" id=\"q40_input\" maxlength=\"25\" name=\"q14\"> by state cartographers</li>\n<li>Also used to portray planets in our solar system on the web</li>\n</ul>\n</div>\n</div>"}],"questionOrder":["q1","q2","q3","q4","q5","q6","q7","q8","q9","q10","q11","q12","q13","q14"],"questionDisplayMap":{"q1":"27","q2":"28","q3":"29","q4":"30","q5":"31","q6":"32","q7":"33","q8":"34","q9":"35","q10":"36","q11":"37","q12":"38","q13":"39","q14":"40"}});
+})(typeof window !== "undefined" ? window : globalThis);
@@ -3426,6 +3426,16 @@
       "sourceKind": "generated-reading"
     }
   };
+  const READING_EXAM_SUMMARY = {
+    "ids": ["p1-high-01", "p1-low-02", "p3-high-03", "p3-high-04", "p1-high-05", "p2-low-06", "p3-low-07", "p2-low-08", "p2-high-09", "p2-medium-10", "p1-low-11", "p3-low-12", "p1-low-13", "p2-high-14", "p3-high-15", "p2-high-16", "p2-high-17", "p3-medium-18", "p2-high-19", "p1-medium-20", "p2-high-21", "p3-medium-22", "p2-high-23", "p1-high-24", "p2-high-25", "p1-high-27", "p3-low-28", "p1-medium-29", "p1-low-30", "p1-high-31", "p3-high-32", "p1-medium-33", "p1-low-34", "p1-low-35", "p3-low-36", "p2-low-37", "p3-low-38", "p2-low-39", "p1-low-40", "p2-low-41", "p3-low-42", "p3-low-43", "p3-low-44", "p1-low-45", "p1-low-46", "p1-low-47", "p1-low-48", "p2-low-49", "p2-low-50", "p2-low-51", "p1-low-52", "p1-low-53", "p3-low-54", "p3-low-55", "p3-low-56", "p1-medium-57", "p2-medium-58", "p3-low-59", "p1-medium-60", "p1-low-61", "p2-low-62", "p1-medium-63", "p2-low-64", "p2-low-65", "p3-medium-66", "p1-low-67", "p1-low-68", "p1-low-69", "p1-low-70", "p3-low-71", "p1-low-72", "p2-low-73", "p3-low-74", "p2-low-75", "p3-low-76", "p2-low-77", "p3-low-78", "p1-high-79", "p1-low-80", "p1-low-81", "p1-high-82", "p3-low-83", "p1-low-84", "p3-low-85", "p2-medium-86", "p2-low-87", "p3-low-88", "p3-high-89", "p1-high-90", "p2-high-91", "p1-high-92", "p2-medium-93", "p2-low-94", "p3-low-95", "p2-low-96", "p3-low-97", "p3-low-98", "p1-low-99", "p3-low-100", "p1-high-101", "p2-low-102", "p2-low-103", "p2-low-104", "p1-high-105", "p1-low-106", "p1-low-107", "p1-low-108", "p1-low-109", "p1-high-110", "p1-low-111", "p1-low-112", "p1-low-113", "p1-low-114", "p1-medium-115", "p1-low-116", "p1-medium-117", "p1-high-118", "p1-medium-119", "p2-high-120", "p2-medium-121", "p2-low-122", "p2-high-123", "p2-high-124", "p2-low-125", "p2-medium-126", "p1-low-127", "p2-high-128", "p2-medium-129", "p2-high-130", "p2-high-131", "p2-low-132", "p2-high-133", "p2-high-134", "p2-low-135", "p2-high-136", "p2-high-137", "p1-low-138", "p2-high-139", "p2-low-140", "p2-high-141", "p2-low-142", "p2-low-143", "p2-medium-144", "p2-high-145", "p2-medium-146", "p2-low-147", "p2-low-148", "p1-low-149", "p3-high-150", "p3-low-151", "p3-medium-152", "p3-low-153", "p3-medium-154", "p3-medium-155", "p3-high-156", "p3-high-157", "p3-low-158", "p3-high-159", "p1-low-160", "p3-high-161", "p3-medium-162", "p3-low-163", "p3-high-164", "p3-low-165", "p3-low-166", "p3-high-167", "p3-medium-168", "p3-medium-169", "p3-high-170", "p1-high-171", "p3-low-172", "p3-high-173", "p3-high-174", "p3-low-175", "p3-medium-176", "p3-medium-177", "p3-high-178", "p3-medium-179", "p3-high-180", "p3-high-181", "p1-medium-182", "p3-medium-183", "p3-high-184", "p3-medium-185", "p3-low-186", "p3-low-187", "p3-medium-188", "p3-high-189", "p3-low-190", "p3-medium-191", "p3-high-192", "p1-high-200", "p1-high-211", "p1-high-216", "p1-high-194", "p2-low-222", "p1-low-223", "p2-high-201", "p2-medium-217", "p2-high-192", "p2-medium-209", "p2-medium-213", "p2-low-051", "p2-medium-058", "p3-high-204", "p3-high-206", "p3-high-212", "p3-high-218", "p3-low-219", "p3-low-999", "p3-medium-197", "p3-low-198", "p3-low-078", "p1-high-227", "p2-high-225", "p3-high-228", "p1-high-229", "p1-high-230", "p1-high-231", "p2-high-232", "p2-high-233", "p2-high-234", "p3-high-221", "p2-high-235", "p2-high-236", "p3-high-229", "p2-high-239"],
+    "kinds": ["classification", "diagram_completion", "flow_chart_completion", "matching", "multi_choice", "notes_completion", "sentence_completion", "short_answer", "single_choice", "summary_completion", "table_completion", "true_false_not_given", "yes_no_not_given"],
+    "columns": {
+      "questionCount": [13, 13, 14, 14, 13, 13, 14, 16, 13, 13, 13, 14, 13, 13, 14, 13, 13, 14, 13, 13, 13, 14, 13, 13, 13, 13, 14, 13, 13, 13, 14, 13, 13, 13, 14, 13, 14, 13, 13, 13, 14, 14, 14, 13, 13, 13, 13, 13, 13, 13, 13, 13, 14, 14, 14, 11, 13, 14, 13, 13, 13, 13, 13, 13, 14, 13, 13, 13, 13, 14, 13, 13, 14, 13, 14, 13, 14, 13, 13, 13, 13, 14, 13, 14, 13, 16, 14, 14, 13, 13, 13, 13, 13, 14, 16, 14, 14, 13, 14, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 14, 14, 14, 14, 14, 14, 13, 14, 14, 14, 13, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 13, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 13, 14, 14, 14, 14, 14, 14, 14, 14, 13, 14, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 14, 14, 14, 14, 12, 14, 14, 14, 26, 13, 13, 14, 13, 13, 13, 13, 13, 13, 14, 13, 13, 14, 13],
+      "kindMask": [8, 3072, 4360, 4864, 2176, 1544, 3136, 1544, 24, 520, 328, 4360, 2050, 536, 5648, 536, 1544, 1288, 1544, 3072, 776, 776, 1096, 2560, 1544, 2560, 264, 2112, 2112, 2176, 4360, 2176, 3136, 2312, 4864, 1104, 1544, 1544, 2112, 520, 4360, 4360, 4672, 2112, 2112, 3200, 3072, 776, 1552, 1544, 2112, 2114, 1026, 264, 4864, 1104, 520, 5376, 2112, 2112, 1544, 2112, 2306, 1544, 2112, 3328, 2112, 2112, 2112, 1280, 2112, 1096, 4480, 72, 3072, 520, 4864, 2112, 2112, 2114, 2112, 2568, 2112, 4360, 536, 72, 1560, 4864, 2176, 1544, 2112, 1544, 1544, 4864, 208, 264, 4864, 2112, 4480, 2176, 1544, 72, 1544, 2112, 2112, 2112, 1536, 3072, 3080, 3072, 2112, 2112, 2112, 2112, 2112, 2112, 2072, 2112, 776, 520, 1104, 88, 776, 1096, 3072, 2051, 1096, 8, 520, 1552, 1544, 1552, 2562, 392, 520, 520, 2112, 3584, 1096, 1280, 1552, 1104, 1544, 1792, 768, 1792, 1552, 2112, 4864, 1792, 4864, 4416, 4864, 1032, 770, 776, 4352, 4352, 2112, 1088, 128, 4232, 328, 4416, 4864, 776, 5122, 264, 4416, 2176, 4416, 4864, 4864, 4106, 768, 4864, 4416, 128, 4416, 1536, 2368, 128, 128, 128, 1552, 328, 4864, 4864, 4360, 128, 2824, 2176, 2114, 2112, 2176, 2176, 2050, 640, 192, 896, 640, 80, 320, 768, 4480, 4480, 4480, 2568, 400, 256, 4864, 4480, 2944, 4224, 152, 136, 3072, 2080, 2084, 536, 520, 520, 4624, 72, 2312, 4360, 536],
+      "wordCount": [852, 977, 945, 945, 886, 847, 919, 902, 868, 790, 748, 924, 818, 873, 889, 889, 900, 918, 918, 753, 903, 910, 922, 878, 927, 921, 928, 900, 839, 890, 869, 839, 911, 952, 972, 899, 878, 917, 838, 900, 919, 943, 913, 750, 862, 808, 889, 939, 853, 873, 867, 768, 908, 929, 978, 874, 857, 893, 929, 977, 883, 818, 940, 918, 862, 894, 850, 755, 939, 863, 932, 939, 897, 912, 493, 751, 890, 908, 863, 817, 867, 917, 941, 846, 798, 950, 903, 901, 1007, 901, 874, 873, 952, 918, 924, 917, 940, 871, 911, 1002, 958, 754, 938, 819, 842, 763, 888, 863, 966, 824, 800, 921, 763, 1053, 916, 826, 874, 841, 928, 695, 805, 934, 1192, 892, 771, 893, 984, 979, 966, 899, 918, 926, 838, 637, 913, 855, 871, 890, 940, 902, 870, 965, 938, 922, 915, 897, 958, 908, 856, 904, 889, 959, 964, 909, 746, 858, 906, 1006, 897, 938, 928, 925, 945, 956, 986, 892, 900, 1311, 912, 835, 921, 895, 929, 767, 895, 930, 876, 1030, 926, 1274, 934, 897, 932, 935, 913, 899, 918, 896, 911, 914, 971, 799, 780, 797, 889, 984, 847, 772, 864, 938, 958, 880, 940, 897, 903, 937, 895, 1109, 916, 786, 983, 872, 1301, 810, 872, 906, 911, 850, 803, 936, 929, 897, 928, 920, 904, 908, 820],
+      "answerCount": [13, 13, 14, 14, 13, 13, 14, 16, 13, 13, 13, 14, 13, 13, 14, 13, 13, 14, 13, 13, 13, 14, 13, 13, 13, 13, 14, 13, 13, 13, 14, 13, 13, 13, 14, 13, 14, 13, 13, 13, 14, 14, 14, 13, 13, 13, 13, 13, 13, 13, 13, 13, 14, 14, 14, 11, 13, 14, 13, 13, 13, 13, 13, 13, 14, 13, 13, 13, 13, 14, 13, 13, 14, 13, 14, 13, 14, 13, 13, 13, 13, 14, 13, 14, 13, 16, 14, 14, 13, 13, 13, 13, 13, 14, 16, 14, 14, 13, 14, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 14, 14, 14, 14, 14, 14, 13, 14, 14, 14, 13, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 13, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 13, 14, 14, 14, 14, 14, 14, 14, 14, 13, 14, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 14, 14, 14, 14, 12, 14, 14, 14, 26, 13, 13, 14, 13, 13, 13, 13, 13, 13, 14, 13, 13, 14, 13]
+    }
+  };
 
   function clonePathRoot() {
     return Object.assign({}, PATH_ROOT);
@@ -3465,6 +3475,7 @@
   }
 
   global.__READING_EXAM_MANIFEST__ = manifest;
+  global.__READING_EXAM_SUMMARY__ = READING_EXAM_SUMMARY;
   global.__READING_EXAM_INDEX__ = buildReadingExamIndex();
   global.__READING_EXAM_INDEX__.pathRoot = clonePathRoot();
   global.__READING_EXAM_PATH_ROOT__ = clonePathRoot();
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 1</h2>\n            <p>You should spend about 20 minutes on Questions 1-13, which are based on Reading Passage 1 on the following pages.</p>\n            \n            <h3>A Brief History of Tea</h3>\n            \n            <div class=\"paragraph-wrapper\" id=\"q1-anchor\">\n                <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"A\" data-question=\"q1\">\n                    <span class=\"paragraph-label\">Paragraph A (Q1):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>A</strong> The story of tea began in ancient China over 5,000 years ago. According to legend, the Emperor Shen Nung was a skilled ruler, creative scientist and patron of the arts. His far-sighted edicts required, among other things, that all drinking water be boiled as a hygienic precaution. One summer day, while visiting a distant region of his realm, he and the court stopped to rest. In accordance with his ruling, the servants began to boil water for the court to drink. Dried leaves from a nearby bush fell into the boiling water, and as the leaves infused the water turned brown. As a scientist, the Emperor was intrigued by the new liquid, drank some, and found it very refreshing. And so, according to legend, tea was created.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q2-anchor\">\n                <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"B\" data-question=\"q2\">\n                    <span class=\"paragraph-label\">Paragraph B (Q2):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>B</strong> Tea consumption spread throughout Chinese culture, reaching into every aspect of society. The first definitive book was written on tea a book clearly reflecting Zen Buddhist philosophy – 1,200 years ago. The first tea seeds were brought to Japan by a returning Buddhist priest, who had seen the value of tea in enhancing meditation in China. As a result, he is known as the “Father of Tea” in Japan. Because of this early association, tea in Japan has always been linked with Zen Buddhism. Tea received the Japanese Emperor's support almost instantly and spread rapidly from the royal court and monasteries to other sections of society.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q3-anchor\">\n                 <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"C\" data-question=\"q3\">\n                    <span class=\"paragraph-label\">Paragraph C (Q3):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>C</strong> Tea was elevated to an art form in the Japanese tea ceremony, in which supreme importance is given to making tea in the most perfect, most polite, most graceful, most charming manner possible. Such a purity of expression prompted the creation of a particular form of architecture for tea houses, duplicating the simplicity of a forest cottage. The cultural/artistic hostesses of Japan, the geishas, began to specialise in the presentation of the tea ceremony. However, as more and more people became involved in the excitement surrounding tea, the purity of the original concept was lost, and for a period the tea ceremony became corrupted, boisterous and highly embellished. Efforts were then made to return to the earlier simplicity, with the result that, in the 15th and 16th centuries, tea was viewed as the ultimate gift. Even warlords paused for tea before battles.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q4-anchor\">\n                <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"D\" data-question=\"q4\">\n                    <span class=\"paragraph-label\">Paragraph D (Q4):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>D</strong> While tea was at this high level of development in parts of Asia, information concerning the then-unknown beverage began to filter back to Europe. Earlier traders had mentioned it, but were unclear as to whether tea should be eaten or drunk. The first European to personally encounter tea and write about it was Portuguese – Portugal, with her technologically advanced navy, had been successful in gaining the first right of trade with China.</p>\n            </div>\n             <div class=\"paragraph-wrapper\" id=\"q5-anchor\">\n                 <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"E\" data-question=\"q5\">\n                    <span class=\"paragraph-label\">Paragraph E (Q5):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>E</strong> Tea finally arrived in Europe in the 16th century, brought to Holland by the country's navy, and became very fashionable in the Dutch capital, The Hague. This was due in part to tea being very expensive (over $100 per pound), which immediately made it the domain of the wealthy. Slowly, as the amount of tea imported increased, the price fell, and by 1675 it was available in common food shops throughout Holland.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q6-anchor\">\n                 <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"F\" data-question=\"q6\">\n                    <span class=\"paragraph-label\">Paragraph F (Q6):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>F</strong> As the consumption of tea increased dramatically in Dutch society, doctors and university authorities in Holland argued as to its benefits or drawbacks. The public largely ignored the scholarly debate and continued to enjoy their new beverage, though the controversy lasted from 1635 to roughly 1657. Throughout this period, France and Holland led Europe in the use of tea.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q7-anchor\">\n                 <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"G\" data-question=\"q7\">\n                    <span class=\"paragraph-label\">Paragraph G (Q7):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>G</strong> As the craze for all things oriental swept through Europe, tea became part of everyday life. Adding milk to the drink was first mentioned in 1680. Around that time, Dutch inns provided the first restaurant service of tea. Innkeepers would furnish guests with a portable tea set complete with a heating unit. The Dutchman would then prepare tea for himself and his friends outside in the inn garden. Tea remained popular in France for only about fifty years, being replaced by a preference for wine, chocolate and exotic coffees. Tea was introduced into England in 1660 by King Charles II and his Portuguese queen, who were both confirmed tea drinkers. Tea mania swept across England as it had earlier spread throughout France and Holland. By 1708, tea importation had risen to thirteen times the 1699 level. Tea was drunk by all levels of society.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q8-anchor\">\n                 <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"H\" data-question=\"q8\">\n                    <span class=\"paragraph-label\">Paragraph H (Q8):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>H</strong> Russian interest in tea began as early as 1618, when the Chinese embassy in Moscow presented several chests of tea to the Emperor, Czar Alexis. Later in the century, a trade treaty between Russia and China allowed caravans to cross back and forth freely between the two countries. Still, the journey was not easy. The average caravan consisted of 200 to 300 camels, and the 18,000-kilometre trip took over 16 months to complete. Eventually, however, tea became – as it still is – one of the most popular drinks in the country.</p>\n            </div>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1-13, which are based on Reading Passage 1 on the following pages.</p>\n<h3>A Brief History of Tea</h3>\n<div class=\"paragraph-wrapper\" id=\"q1-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"A\" data-question=\"q1\">\n<span class=\"paragraph-label\">Paragraph A (Q1):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> The story of tea began in ancient China over 5,000 years ago. According to legend, the Emperor Shen Nung was a skilled ruler, creative scientist and patron of the arts. His far-sighted edicts required, among other things, that all drinking water be boiled as a hygienic precaution. One summer day, while visiting a distant region of his realm, he and the court stopped to rest. In accordance with his ruling, the servants began to boil water for the court to drink. Dried leaves from a nearby bush fell into the boiling water, and as the leaves infused the water turned brown. As a scientist, the Emperor was intrigued by the new liquid, drank some, and found it very refreshing. And so, according to legend, tea was created.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q2-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"B\" data-question=\"q2\">\n<span class=\"paragraph-label\">Paragraph B (Q2):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> Tea consumption spread throughout Chinese culture, reaching into every aspect of society. The first definitive book was written on tea a book clearly reflecting Zen Buddhist philosophy – 1,200 years ago. The first tea seeds were brought to Japan by a returning Buddhist priest, who had seen the value of tea in enhancing meditation in China. As a result, he is known as the “Father of Tea” in Japan. Because of this early association, tea in Japan has always been linked with Zen Buddhism. Tea received the Japanese Emperor's support almost instantly and spread rapidly from the royal court and monasteries to other sections of society.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q3-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"C\" data-question=\"q3\">\n<span class=\"paragraph-label\">Paragraph C (Q3):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> Tea was elevated to an art form in the Japanese tea ceremony, in which supreme importance is given to making tea in the most perfect, most polite, most graceful, most charming manner possible. Such a purity of expression prompted the creation of a particular form of architecture for tea houses, duplicating the simplicity of a forest cottage. The cultural/artistic hostesses of Japan, the geishas, began to specialise in the presentation of the tea ceremony. However, as more and more people became involved in the excitement surrounding tea, the purity of the original concept was lost, and for a period the tea ceremony became corrupted, boisterous and highly embellished. Efforts were then made to return to the earlier simplicity, with the result that, in the 15th and 16th centuries, tea was viewed as the ultimate gift. Even warlords paused for tea before battles.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q4-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"D\" data-question=\"q4\">\n<span class=\"paragraph-label\">Paragraph D (Q4):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> While tea was at this high level of development in parts of Asia, information concerning the then-unknown beverage began to filter back to Europe. Earlier traders had mentioned it, but were unclear as to whether tea should be eaten or drunk. The first European to personally encounter tea and write about it was Portuguese – Portugal, with her technologically advanced navy, had been successful in gaining the first right of trade with China.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q5-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"E\" data-question=\"q5\">\n<span class=\"paragraph-label\">Paragraph E (Q5):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> Tea finally arrived in Europe in the 16th century, brought to Holland by the country's navy, and became very fashionable in the Dutch capital, The Hague. This was due in part to tea being very expensive (over $100 per pound), which immediately made it the domain of the wealthy. Slowly, as the amount of tea imported increased, the price fell, and by 1675 it was available in common food shops throughout Holland.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q6-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"F\" data-question=\"q6\">\n<span class=\"paragraph-label\">Paragraph F (Q6):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> As the consumption of tea increased dramatically in Dutch society, doctors and university authorities in Holland argued as to its benefits or drawbacks. The public largely ignored the scholarly debate and continued to enjoy their new beverage, though the controversy lasted from 1635 to roughly 1657. Throughout this period, France and Holland led Europe in the use of tea.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q7-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"G\" data-question=\"q7\">\n<span class=\"paragraph-label\">Paragraph G (Q7):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>G</strong> As the craze for all things oriental swept through Europe, tea became part of everyday life. Adding milk to the drink was first mentioned in 1680. Around that time, Dutch inns provided the first restaurant service of tea. Innkeepers would furnish guests with a portable tea set complete with a heating unit. The Dutchman would then prepare tea for himself and his friends outside in the inn garden. Tea remained popular in France for only about fifty years, being replaced by a preference for wine, chocolate and exotic coffees. Tea was introduced into England in 1660 by King Charles II and his Portuguese queen, who were both confirmed tea drinkers. Tea mania swept across England as it had earlier spread throughout France and Holland. By 1708, tea importation had risen to thirteen times the 1699 level. Tea was drunk by all levels of society.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q8-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"H\" data-question=\"q8\">\n<span class=\"paragraph-label\">Paragraph H (Q8):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>H</strong> Russian interest in tea began as early as 1618, when the Chinese embassy in Moscow presented several chests of tea to the Emperor, Czar Alexis. Later in the century, a trade treaty between Russia and China allowed caravans to cross back and forth freely between the two countries. Still, the journey was not easy. The average caravan consisted of 200 to 300 camels, and the 18,000-kilometre trip took over 16 months to complete. Eventually, however, tea became – as it still is – one of the most popular drinks in the country.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -38,7 +38,7 @@
         "q7",
         "q8"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-8-anchor-right\">\n                <h4>Questions 1–8</h4>\n                <p>Reading Passage 1 has eight paragraphs <strong>A–H</strong>.</p>\n                <p>Choose the correct heading for each paragraph from the list of headings below.</p>\n                <p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n                \n                <div class=\"headings-pool\" id=\"headings-pool-container\">\n                    <strong>List of Headings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. Not enough tea to meet demand</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. Religious objections</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. In - and sometimes out – of fashion</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. A connection between tea and religion</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. A luxury item</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. News of tea reaches another continent</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. Is tea a good or a bad thing?</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. A chance discovery</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix. Tea-making as a ritual</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"x\">x. Difficulties in importing tea</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-8-anchor-right\">\n<h4>Questions 1–8</h4>\n<p>Reading Passage 1 has eight paragraphs <strong>A–H</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. Not enough tea to meet demand</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. Religious objections</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. In - and sometimes out – of fashion</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. A connection between tea and religion</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. A luxury item</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. News of tea reaches another continent</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. Is tea a good or a bad thing?</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. A chance discovery</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix. Tea-making as a ritual</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"x\">x. Difficulties in importing tea</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -52,7 +52,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\">\n                <h4>Questions 9–13</h4>\n                <p>Look at the following statements (Questions 9–13) and the list of countries below.</p>\n                <p>Match each statement with the correct country, <strong>A–G</strong>.</p>\n\n                <div class=\"question-item\" id=\"q9-anchor\">\n                     <div class=\"match-question-item\">\n                        <div class=\"match-dropzone\" data-question=\"q9\"></div>\n                        <p><strong>9</strong> Claims that tea might be harmful failed to affect its popularity.</p>\n                     </div>\n                </div>\n                <div class=\"question-item\" id=\"q10-anchor\">\n                     <div class=\"match-question-item\">\n                        <div class=\"match-dropzone\" data-question=\"q10\"></div>\n                        <p><strong>10</strong> Tea lost favour to other drinks.</p>\n                     </div>\n                </div>\n                <div class=\"question-item\" id=\"q11-anchor\">\n                     <div class=\"match-question-item\">\n                        <div class=\"match-dropzone\" data-question=\"q11\"></div>\n                        <p><strong>11</strong> Special buildings were constructed in which to drink tea.</p>\n                     </div>\n                </div>\n                <div class=\"question-item\" id=\"q12-anchor\">\n                     <div class=\"match-question-item\">\n                        <div class=\"match-dropzone\" data-question=\"q12\"></div>\n                        <p><strong>12</strong> Animals were involved in importing tea.</p>\n                     </div>\n                </div>\n                <div class=\"question-item\" id=\"q13-anchor\">\n                     <div class=\"match-question-item\">\n                        <div class=\"match-dropzone\" data-question=\"q13\"></div>\n                        <p><strong>13</strong> A ruler's specialist knowledge led to an interest in tea.</p>\n                     </div>\n                </div>\n                \n                <div class=\"options-pool\" id=\"country-options-pool\">\n                    <strong>List of Countries</strong>\n                    <div class=\"pool-items\" style=\"flex-direction: column; align-items: flex-start;\">\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A China</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Japan</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Portugal</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Holland</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E France</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F England</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G Russia</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 9–13</h4>\n<p>Look at the following statements (Questions 9–13) and the list of countries below.</p>\n<p>Match each statement with the correct country, <strong>A–G</strong>.</p>\n<div class=\"question-item\" id=\"q9-anchor\">\n<div class=\"match-question-item\">\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n<p><strong>9</strong> Claims that tea might be harmful failed to affect its popularity.</p>\n</div>\n</div>\n<div class=\"question-item\" id=\"q10-anchor\">\n<div class=\"match-question-item\">\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n<p><strong>10</strong> Tea lost favour to other drinks.</p>\n</div>\n</div>\n<div class=\"question-item\" id=\"q11-anchor\">\n<div class=\"match-question-item\">\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n<p><strong>11</strong> Special buildings were constructed in which to drink tea.</p>\n</div>\n</div>\n<div class=\"question-item\" id=\"q12-anchor\">\n<div class=\"match-question-item\">\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n<p><strong>12</strong> Animals were involved in importing tea.</p>\n</div>\n</div>\n<div class=\"question-item\" id=\"q13-anchor\">\n<div class=\"match-question-item\">\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n<p><strong>13</strong> A ruler's specialist knowledge led to an interest in tea.</p>\n</div>\n</div>\n<div class=\"options-pool\" id=\"country-options-pool\">\n<strong>List of Countries</strong>\n<div class=\"pool-items\" style=\"flex-direction: column; align-items: flex-start;\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A China</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Japan</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Portugal</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Holland</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E France</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F England</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G Russia</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": true
     }
   ],
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 1</h2>\n            <p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n            \n            <h3>Katherine Mansfield</h3>\n            <h4><em>Katherine Mansfield was a modernist writer of short fiction who was born and brought up in New Zealand.</em></h4>\n            \n            <p>Katherine Mansfield Beauchamp Murry was born in 1888, into a prominent family in Wellington, New Zealand. She became one of New Zealand’s best-known writers, using the pen name of Katherine Mansfield. The daughter of a banker, and born into a middle-class family, she was also a first cousin of Countess Elizabeth von Arnim, a distinguished novelist in her time. Mansfield had two older sisters and a younger brother. Her father, Harold Beauchamp, went on to become the chairman of the Bank of New Zealand. In 1893, the Mansfield family moved to Karori, a suburb of Wellington, where Mansfield would spend the happiest years of her childhood; she later used her memories of this time as an inspiration for her Prelude story.</p>\n            \n            <p>Her first published stories appeared in the High School Reporter and the Wellington Girls’ High School magazine in 1898 and 1899. In 1902, she developed strong feelings for a musician who played the cello, Arnold Trowell, although her feelings were not, for the most part, returned. Mansfield herself was an accomplished cellist, having received lessons from Trowell’s father. Mansfield wrote in her journals of feeling isolated to some extent in New Zealand, and, in general terms, of her interest in the Maori people (New Zealand’s native people), who were often portrayed in a sympathetic light in her later stories, such as How Pearl Button Was Kidnapped.</p>\n\n            <p>She moved to London in 1903, where she attended Queen’s College, along with her two sisters. Mansfield recommenced playing the cello, an occupation that she believed, during her time at Queen’s, she would take up professionally. She also began contributing to the college newspaper, with such a dedication to it that she eventually became its editor. She was particularly interested in the works of the French writers of this period and in the 19th-century British writer, Oscar Wilde, and she was appreciated amongst fellow students at Queen’s for her lively and charismatic approach to life and work. She met fellow writer Ida Baker, a South African, at the college, and the pair became lifelong friends. Mansfield did not actively support the suffragette movement in the UK. Women in New Zealand had gained the right to vote in 1893.</p>\n\n            <p>Mansfield first began journeying into other parts of Europe in the period 1903–1906, mainly to Belgium and Germany. After finishing her schooling in England, she returned to her New Zealand home in 1906, only then beginning to write short stories in a serious way. She had several works published in Australia in a magazine called The Native Companion, which was her first paid writing work, and by this time she had her mind set on becoming a professional writer. It was also the first occasion on which she used the pseudonym “K. Mansfield”.</p>\n\n            <p>Mansfield rapidly grew discontented with the provincial New Zealand lifestyle, and with her family. Two years later she headed again to London. Her father sent her an annual subsidy of £100 for the rest of her life. In later years, she would express both admiration and disdain for New Zealand in her journals.</p>\n\n            <p>In 1911, Mansfield met John Middleton Murry, the Oxford scholar and editor of the literary magazine Rhythm. They were later to marry in 1918. Mansfield became a co-editor of Rhythm, which was subsequently called The Blue Review, in which more of her works were published. She and Murry lived in various houses in England and briefly in Paris. The Blue Review failed to gain enough readers and was no longer published. Their attempt to set up as writers in Paris was cut short by Murry’s bankruptcy, which resulted from the failure of this and other journals. Life back in England meant frequently changed addresses and very limited funds.</p>\n\n            <p>Between 1915 and 1918, Mansfield moved between England and Bandol, France. She and Murry developed close contact with other well-known writers of the time such as D. H. Lawrence, Bertrand Russell and Aldous Huxley. By October 1918 Mansfield had become seriously ill; she had been diagnosed with tuberculosis and was advised to enter a sanatorium. She could no longer spend winters in London. In the autumn of 1918 she was so ill that she decided to go to Ospedaletti in Italy. It was the publication of Bliss and Other Stories in 1920 that was to solidify Mansfield’s reputation as a writer.</p>\n\n            <p>Mansfield also spent time in Menton, France, as the tenant of her father’s cousin at “The Villa Isola Bella”. There she wrote eight stories including Miss Brill and The Daughters of the Late Colonel, the latter of which she pronounced to be “…the only story that satisfies me to any extent”.</p>\n\n            <p>Mansfield produced a great deal of work in the final years of her life, and much of her prose and poetry remained unpublished at her death in 1923. After her death, her husband, Murry, took on the task of editing and publishing her works. His efforts resulted in two additional volumes of short stories, The Doves’ Nest and Something Childish, published in 1923 and 1924 respectively; the publication of her Poems; as well as a collection of critical writings (Novels and Novelists) and a number of editions of Mansfield’s previously unpublished letters and journals.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>Katherine Mansfield</h3>\n<h4><em>Katherine Mansfield was a modernist writer of short fiction who was born and brought up in New Zealand.</em></h4>\n<p>Katherine Mansfield Beauchamp Murry was born in 1888, into a prominent family in Wellington, New Zealand. She became one of New Zealand’s best-known writers, using the pen name of Katherine Mansfield. The daughter of a banker, and born into a middle-class family, she was also a first cousin of Countess Elizabeth von Arnim, a distinguished novelist in her time. Mansfield had two older sisters and a younger brother. Her father, Harold Beauchamp, went on to become the chairman of the Bank of New Zealand. In 1893, the Mansfield family moved to Karori, a suburb of Wellington, where Mansfield would spend the happiest years of her childhood; she later used her memories of this time as an inspiration for her Prelude story.</p>\n<p>Her first published stories appeared in the High School Reporter and the Wellington Girls’ High School magazine in 1898 and 1899. In 1902, she developed strong feelings for a musician who played the cello, Arnold Trowell, although her feelings were not, for the most part, returned. Mansfield herself was an accomplished cellist, having received lessons from Trowell’s father. Mansfield wrote in her journals of feeling isolated to some extent in New Zealand, and, in general terms, of her interest in the Maori people (New Zealand’s native people), who were often portrayed in a sympathetic light in her later stories, such as How Pearl Button Was Kidnapped.</p>\n<p>She moved to London in 1903, where she attended Queen’s College, along with her two sisters. Mansfield recommenced playing the cello, an occupation that she believed, during her time at Queen’s, she would take up professionally. She also began contributing to the college newspaper, with such a dedication to it that she eventually became its editor. She was particularly interested in the works of the French writers of this period and in the 19th-century British writer, Oscar Wilde, and she was appreciated amongst fellow students at Queen’s for her lively and charismatic approach to life and work. She met fellow writer Ida Baker, a South African, at the college, and the pair became lifelong friends. Mansfield did not actively support the suffragette movement in the UK. Women in New Zealand had gained the right to vote in 1893.</p>\n<p>Mansfield first began journeying into other parts of Europe in the period 1903–1906, mainly to Belgium and Germany. After finishing her schooling in England, she returned to her New Zealand home in 1906, only then beginning to write short stories in a serious way. She had several works published in Australia in a magazine called The Native Companion, which was her first paid writing work, and by this time she had her mind set on becoming a professional writer. It was also the first occasion on which she used the pseudonym “K. Mansfield”.</p>\n<p>Mansfield rapidly grew discontented with the provincial New Zealand lifestyle, and with her family. Two years later she headed again to London. Her father sent her an annual subsidy of £100 for the rest of her life. In later years, she would express both admiration and disdain for New Zealand in her journals.</p>\n<p>In 1911, Mansfield met John Middleton Murry, the Oxford scholar and editor of the literary magazine Rhythm. They were later to marry in 1918. Mansfield became a co-editor of Rhythm, which was subsequently called The Blue Review, in which more of her works were published. She and Murry lived in various houses in England and briefly in Paris. The Blue Review failed to gain enough readers and was no longer published. Their attempt to set up as writers in Paris was cut short by Murry’s bankruptcy, which resulted from the failure of this and other journals. Life back in England meant frequently changed addresses and very limited funds.</p>\n<p>Between 1915 and 1918, Mansfield moved between England and Bandol, France. She and Murry developed close contact with other well-known writers of the time such as D. H. Lawrence, Bertrand Russell and Aldous Huxley. By October 1918 Mansfield had become seriously ill; she had been diagnosed with tuberculosis and was advised to enter a sanatorium. She could no longer spend winters in London. In the autumn of 1918 she was so ill that she decided to go to Ospedaletti in Italy. It was the publication of Bliss and Other Stories in 1920 that was to solidify Mansfield’s reputation as a writer.</p>\n<p>Mansfield also spent time in Menton, France, as the tenant of her father’s cousin at “The Villa Isola Bella”. There she wrote eight stories including Miss Brill and The Daughters of the Late Colonel, the latter of which she pronounced to be “…the only story that satisfies me to any extent”.</p>\n<p>Mansfield produced a great deal of work in the final years of her life, and much of her prose and poetry remained unpublished at her death in 1923. After her death, her husband, Murry, took on the task of editing and publishing her works. His efforts resulted in two additional volumes of short stories, The Doves’ Nest and Something Childish, published in 1923 and 1924 respectively; the publication of her Poems; as well as a collection of critical writings (Novels and Novelists) and a number of editions of Mansfield’s previously unpublished letters and journals.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\">\n                <h4>Questions 1–6</h4>\n                <p>Do the following statements agree with the information given in Reading Passage 1?</p>\n                <p>In boxes 1–6 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>TRUE</strong> if the statement agrees with the information</li>\n                    <li><strong>FALSE</strong> if the statement contradicts the information</li>\n                    <li><strong>NOT GIVEN</strong> if there is no information on this</li>\n                </ul>\n                \n                <div class=\"question-item\" id=\"q1-anchor\">\n                    <p>1. The name Katherine Mansfield, which appears on the writer’s books, was exactly the same as her original name.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                \n                <div class=\"question-item\" id=\"q2-anchor\">\n                    <p>2. Mansfield won a prize for a story she wrote for the High School Reporter.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                \n                <div class=\"question-item\" id=\"q3-anchor\">\n                    <p>3. How Pearl Button Was Kidnapped portrayed Maori people in a favourable way.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                \n                <div class=\"question-item\" id=\"q4-anchor\">\n                    <p>4. When Mansfield was at Queen’s College, she planned to be a professional writer.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                \n                <div class=\"question-item\" id=\"q5-anchor\">\n                    <p>5. Mansfield was unpopular with the other students at Queen’s College.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                \n                <div class=\"question-item\" id=\"q6-anchor\">\n                    <p>6. In London, Mansfield showed little interest in politics.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 1–6</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 1–6 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\" id=\"q1-anchor\">\n<p>1. The name Katherine Mansfield, which appears on the writer’s books, was exactly the same as her original name.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q2-anchor\">\n<p>2. Mansfield won a prize for a story she wrote for the High School Reporter.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q3-anchor\">\n<p>3. How Pearl Button Was Kidnapped portrayed Maori people in a favourable way.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q4-anchor\">\n<p>4. When Mansfield was at Queen’s College, she planned to be a professional writer.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q5-anchor\">\n<p>5. Mansfield was unpopular with the other students at Queen’s College.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q6-anchor\">\n<p>6. In London, Mansfield showed little interest in politics.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -51,7 +51,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\">\n                <h4>Questions 7–13</h4>\n                <p>Complete the notes below</p>\n                <p>Choose <strong>ONE WORD AND/OR A NUMBER</strong> from the passage for each answer</p>\n                <p>Write your answers in boxes 7–13 on your answer sheet</p>\n                \n                <div class=\"notes-section\">\n                    <h4 style=\"text-align: center; margin-bottom: 20px;\">Katherine Mansfield’s adult years</h4>\n                    <p class=\"bullet-point\">• <input name=\"q7\" class=\"blank\" data-answer=\"1906\" style=\"width: 80px; text-align: center;\"> <br> – moved from England back to New Zealand</p>\n                    <p class=\"bullet-point\" style=\"margin-left: 20px;\">– first paid writing work was in a publication based in 8 <input name=\"q8\" class=\"blank\" data-answer=\"Australia\"></p>\n                    <p class=\"bullet-point\" style=\"margin-left: 20px;\">– her 9 <input name=\"q9\" class=\"blank\" data-answer=\"family\"> and the New Zealand way of life made her feel dissatisfied</p>\n                    \n                    <p class=\"bullet-point\">• 1908<br> – returned to London</p>\n                    \n                    <p class=\"bullet-point\">• 1911–1919<br> – Met John Middleton Murry in 1911</p>\n                    <p class=\"bullet-point\" style=\"margin-left: 20px;\">– 10 <input name=\"q10\" class=\"blank\" data-answer=\"bankruptcy\"> prevented Mansfield and Murry from staying together in Paris</p>\n                    <p class=\"bullet-point\" style=\"margin-left: 20px;\">– spent time with distinguished 11 <input name=\"q11\" class=\"blank\" data-answer=\"writers\"></p>\n                    <p class=\"bullet-point\" style=\"margin-left: 20px;\">– from 1916, tuberculosis restricted the time she spent in London</p>\n\n                    <p class=\"bullet-point\">• 1920<br> – her 12 <input name=\"q12\" class=\"blank\" data-answer=\"reputation\"> was consolidated when <em>Bliss and Other Stories</em> was published</p>\n                    <p class=\"bullet-point\" style=\"margin-left: 20px;\">– wrote several stories at “Villa Isola Bella”</p>\n\n                    <p class=\"bullet-point\">• 1923–1924<br> – Mansfield’s 13 <input name=\"q13\" class=\"blank\" data-answer=\"husband\"> published more of her works after her death</p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 7–13</h4>\n<p>Complete the notes below</p>\n<p>Choose <strong>ONE WORD AND/OR A NUMBER</strong> from the passage for each answer</p>\n<p>Write your answers in boxes 7–13 on your answer sheet</p>\n<div class=\"notes-section\">\n<h4 style=\"text-align: center; margin-bottom: 20px;\">Katherine Mansfield’s adult years</h4>\n<p class=\"bullet-point\">• <input name=\"q7\" class=\"blank\" data-answer=\"1906\" style=\"width: 80px; text-align: center;\"><br>– moved from England back to New Zealand</p>\n<p class=\"bullet-point\" style=\"margin-left: 20px;\">– first paid writing work was in a publication based in 8 <input name=\"q8\" class=\"blank\" data-answer=\"Australia\"></p>\n<p class=\"bullet-point\" style=\"margin-left: 20px;\">– her 9 <input name=\"q9\" class=\"blank\" data-answer=\"family\"> and the New Zealand way of life made her feel dissatisfied</p>\n<p class=\"bullet-point\">• 1908<br>– returned to London</p>\n<p class=\"bullet-point\">• 1911–1919<br>– Met John Middleton Murry in 1911</p>\n<p class=\"bullet-point\" style=\"margin-left: 20px;\">– 10 <input name=\"q10\" class=\"blank\" data-answer=\"bankruptcy\"> prevented Mansfield and Murry from staying together in Paris</p>\n<p class=\"bullet-point\" style=\"margin-left: 20px;\">– spent time with distinguished 11 <input name=\"q11\" class=\"blank\" data-answer=\"writers\"></p>\n<p class=\"bullet-point\" style=\"margin-left: 20px;\">– from 1916, tuberculosis restricted the time she spent in London</p>\n<p class=\"bullet-point\">• 1920<br>– her 12 <input name=\"q12\" class=\"blank\" data-answer=\"reputation\"> was consolidated when <em>Bliss and Other Stories</em> was published</p>\n<p class=\"bullet-point\" style=\"margin-left: 20px;\">– wrote several stories at “Villa Isola Bella”</p>\n<p class=\"bullet-point\">• 1923–1924<br>– Mansfield’s 13 <input name=\"q13\" class=\"blank\" data-answer=\"husband\"> published more of her works after her death</p>\n</div>\n</div>"
     }
   ],
   "answerKey": {
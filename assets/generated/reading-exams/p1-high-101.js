@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 1</h2>\n            <p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n            \n            <h3>The Impact of the Potato</h3>\n            <p><i>Jeff Chapman relates the story of history's most important vegetable</i></p>\n            <p>The potato was first cultivated in South America between three and seven thousand years ago, though scientists believe they may have grown wild in the region as long as 13,000 years ago. The genetic patterns of potato distribution indicate that the potato probably originated in the mountainous west-central region of the continent.</p>\n            <p>Early Spanish chroniclers who misused the Indian word batata (sweet potato) as the name for the potato noted the importance of the tuber to the Incan Empire. The Incas had learned to preserve the potato for storage by dehydrating and mashing potatoes into a substance called chuño, which could be stored in a room for up to 10 years, providing excellent insurance against possible crop failures. As well as using the food as a staple crop, the Incas thought potatoes made childbirth easier and used them to treat injuries.</p>\n            <p>The Spanish conquistadors first encountered the potato when they arrived in Peru in 1532 in search of gold, and noted Inca miners eating chuño. At the time the Spaniards failed to realize that the potato represented a far more important treasure than either silver or gold, but they did gradually begin to use potatoes as basic rations aboard their ships. After the arrival of the potato in Spain in 1570, a few Spanish farmers began to cultivate them on a small scale, mostly as food for livestock.</p>\n            <p>Throughout Europe, potatoes were regarded with suspicion, distaste and fear. Generally considered to be unfit for human consumption, they were used only as animal fodder and sustenance for the starving. In northern Europe, potatoes were primarily grown in botanical gardens as an exotic novelty. Even peasants refused to eat from a plant that produced ugly, misshapen tubers and that had come from a heathen civilization. Some felt that the potato plant's resemblance to plants in the nightshade family hinted that it was the creation of witches or devils.</p>\n            <p>In meat-loving England, farmers and urban workers regarded potatoes with extreme distaste. In 1662, the Royal Society recommended the cultivation of the tuber to the English government and the nation, but this recommendation had little impact. Potatoes did not become a staple until, during the food shortages associated with the Revolutionary Wars, the English government began to officially encourage potato cultivation. In 1795, the Board of Agriculture issued a pamphlet entitled \"Hints Respecting the Culture and Use of Potatoes”; this was followed shortly by pro-potato editorials and potato recipes in The Times. Gradually, the lower classes began to follow the lead of the upper classes.</p>\n            <p>A similar pattern emerged across the English Channel in the Netherlands, Belgium and France. While the potato slowly gained ground in eastern France (where it was often the only crop remaining after marauding soldiers plundered wheat fields and vineyards), it did not achieve widespread acceptance until the late 1700s. The peasants remained suspicious, in spite of a 1771 paper from the Faculté de Paris testifying that the potato was not harmful but beneficial. The people began to overcome their distaste when the plant received the royal seal of approval: Louis XVI began to sport a potato flower in his buttonhole, and Marie-Antoinette wore a purple potato blossom in her hair.</p>\n            <p>Frederick the Great of Prussia saw the potato's potential to help feed his nation and lower the price of bread, but faced the challenge of overcoming the people's prejudice against the plant. When he issued a 1774 order for his subjects to grow potatoes as protection against famine, the town of Kolberg replied: “The things have neither smell nor taste, not even the dogs will eat them, so what use are they to us?” Trying a less direct approach to encourage his subjects to begin planting potatoes, Frederick used a bit of reverse psychology: he planted a royal field of potato plants and stationed a heavy guard to protect this field from thieves. Nearby peasants naturally assumed that anything worth guarding was worth stealing, and so sneaked into the field and snatched the plants for their home gardens. Of course, this was entirely in line with Frederick's wishes.</p>\n            <p>Historians debate whether the potato was primarily a cause or an effect of the huge population boom in industrial-era England and Wales. Prior to 1800, the English diet had consisted primarily of meat, supplemented by bread, butter and cheese. Few vegetables were consumed, most vegetables being regarded as nutritionally worthless and potentially harmful. This view began to change gradually in the late 1700s. The Industrial Revolution was drawing an ever-increasing percentage of the populace into crowded cities, where only the richest could afford homes with ovens or coal storage rooms, and people were working 12–16-hour days which left them with little time or energy to prepare food. High-yielding, easily prepared potato crops were the obvious solution to England's food problems.</p>\n            <p>Whereas most of their neighbours regarded the potato with suspicion and had to be persuaded to use it by the upper classes, the Irish peasantry embraced the tuber more passionately than anyone since the Incas. The potato was well suited to the Irish soil and climate, and its high yield suited the most important concern of most Irish farmers: to feed their families.</p>\n            <p>The most dramatic example of the potato's potential to alter population patterns occurred in Ireland, where the potato had become a staple by 1800. The Irish population doubled to eight million between 1780 and 1841, this without any significant expansion of industry or reform of agricultural techniques beyond the widespread cultivation of the potato. Though Irish landholding practices were primitive in comparison with those of England, the potato's high yields allowed even the poorest farmers to produce more healthy food than they needed with scarcely any investment or hard labour. Even children could easily plant, harvest and cook potatoes, which of course required no threshing, curing or grinding. The abundance provided by potatoes greatly decreased infant mortality and encouraged early marriage.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>The Impact of the Potato</h3>\n<p><i>Jeff Chapman relates the story of history's most important vegetable</i></p>\n<p>The potato was first cultivated in South America between three and seven thousand years ago, though scientists believe they may have grown wild in the region as long as 13,000 years ago. The genetic patterns of potato distribution indicate that the potato probably originated in the mountainous west-central region of the continent.</p>\n<p>Early Spanish chroniclers who misused the Indian word batata (sweet potato) as the name for the potato noted the importance of the tuber to the Incan Empire. The Incas had learned to preserve the potato for storage by dehydrating and mashing potatoes into a substance called chuño, which could be stored in a room for up to 10 years, providing excellent insurance against possible crop failures. As well as using the food as a staple crop, the Incas thought potatoes made childbirth easier and used them to treat injuries.</p>\n<p>The Spanish conquistadors first encountered the potato when they arrived in Peru in 1532 in search of gold, and noted Inca miners eating chuño. At the time the Spaniards failed to realize that the potato represented a far more important treasure than either silver or gold, but they did gradually begin to use potatoes as basic rations aboard their ships. After the arrival of the potato in Spain in 1570, a few Spanish farmers began to cultivate them on a small scale, mostly as food for livestock.</p>\n<p>Throughout Europe, potatoes were regarded with suspicion, distaste and fear. Generally considered to be unfit for human consumption, they were used only as animal fodder and sustenance for the starving. In northern Europe, potatoes were primarily grown in botanical gardens as an exotic novelty. Even peasants refused to eat from a plant that produced ugly, misshapen tubers and that had come from a heathen civilization. Some felt that the potato plant's resemblance to plants in the nightshade family hinted that it was the creation of witches or devils.</p>\n<p>In meat-loving England, farmers and urban workers regarded potatoes with extreme distaste. In 1662, the Royal Society recommended the cultivation of the tuber to the English government and the nation, but this recommendation had little impact. Potatoes did not become a staple until, during the food shortages associated with the Revolutionary Wars, the English government began to officially encourage potato cultivation. In 1795, the Board of Agriculture issued a pamphlet entitled \"Hints Respecting the Culture and Use of Potatoes”; this was followed shortly by pro-potato editorials and potato recipes in The Times. Gradually, the lower classes began to follow the lead of the upper classes.</p>\n<p>A similar pattern emerged across the English Channel in the Netherlands, Belgium and France. While the potato slowly gained ground in eastern France (where it was often the only crop remaining after marauding soldiers plundered wheat fields and vineyards), it did not achieve widespread acceptance until the late 1700s. The peasants remained suspicious, in spite of a 1771 paper from the Faculté de Paris testifying that the potato was not harmful but beneficial. The people began to overcome their distaste when the plant received the royal seal of approval: Louis XVI began to sport a potato flower in his buttonhole, and Marie-Antoinette wore a purple potato blossom in her hair.</p>\n<p>Frederick the Great of Prussia saw the potato's potential to help feed his nation and lower the price of bread, but faced the challenge of overcoming the people's prejudice against the plant. When he issued a 1774 order for his subjects to grow potatoes as protection against famine, the town of Kolberg replied: “The things have neither smell nor taste, not even the dogs will eat them, so what use are they to us?” Trying a less direct approach to encourage his subjects to begin planting potatoes, Frederick used a bit of reverse psychology: he planted a royal field of potato plants and stationed a heavy guard to protect this field from thieves. Nearby peasants naturally assumed that anything worth guarding was worth stealing, and so sneaked into the field and snatched the plants for their home gardens. Of course, this was entirely in line with Frederick's wishes.</p>\n<p>Historians debate whether the potato was primarily a cause or an effect of the huge population boom in industrial-era England and Wales. Prior to 1800, the English diet had consisted primarily of meat, supplemented by bread, butter and cheese. Few vegetables were consumed, most vegetables being regarded as nutritionally worthless and potentially harmful. This view began to change gradually in the late 1700s. The Industrial Revolution was drawing an ever-increasing percentage of the populace into crowded cities, where only the richest could afford homes with ovens or coal storage rooms, and people were working 12–16-hour days which left them with little time or energy to prepare food. High-yielding, easily prepared potato crops were the obvious solution to England's food problems.</p>\n<p>Whereas most of their neighbours regarded the potato with suspicion and had to be persuaded to use it by the upper classes, the Irish peasantry embraced the tuber more passionately than anyone since the Incas. The potato was well suited to the Irish soil and climate, and its high yield suited the most important concern of most Irish farmers: to feed their families.</p>\n<p>The most dramatic example of the potato's potential to alter population patterns occurred in Ireland, where the potato had become a staple by 1800. The Irish population doubled to eight million between 1780 and 1841, this without any significant expansion of industry or reform of agricultural techniques beyond the widespread cultivation of the potato. Though Irish landholding practices were primitive in comparison with those of England, the potato's high yields allowed even the poorest farmers to produce more healthy food than they needed with scarcely any investment or hard labour. Even children could easily plant, harvest and cook potatoes, which of course required no threshing, curing or grinding. The abundance provided by potatoes greatly decreased infant mortality and encouraged early marriage.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 1–5</h4>\n                <p>Do the following statements agree with the views of the writer in Reading Passage 1?</p>\n                <p>\n                    <strong>TRUE</strong> if the statement agrees with the information<br>\n                    <strong>FALSE</strong> if the statement contradicts the information<br>\n                    <strong>NOT GIVEN</strong> if there is no information on this\n                </p>\n                <div class=\"question-item\">\n                    <p><strong>1</strong> Early Spanish chroniclers called the potato by the Incan name ‘chuño’.</p>\n                    <div class=\"tfng-options\">\n                        <label><input type=\"radio\" name=\"q1\" value=\"TRUE\"> TRUE</label>\n                        <label><input type=\"radio\" name=\"q1\" value=\"FALSE\"> FALSE</label>\n                        <label><input type=\"radio\" name=\"q1\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>2</strong> The purpose of the Spanish coming to Peru was to find potatoes.</p>\n                    <div class=\"tfng-options\">\n                        <label><input type=\"radio\" name=\"q2\" value=\"TRUE\"> TRUE</label>\n                        <label><input type=\"radio\" name=\"q2\" value=\"FALSE\"> FALSE</label>\n                        <label><input type=\"radio\" name=\"q2\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>3</strong> The Spanish believed that the potato had the same nutrients as other vegetables.</p>\n                    <div class=\"tfng-options\">\n                        <label><input type=\"radio\" name=\"q3\" value=\"TRUE\"> TRUE</label>\n                        <label><input type=\"radio\" name=\"q3\" value=\"FALSE\"> FALSE</label>\n                        <label><input type=\"radio\" name=\"q3\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>4</strong> Peasants at that time did not like to eat potatoes because they were ugly.</p>\n                    <div class=\"tfng-options\">\n                        <label><input type=\"radio\" name=\"q4\" value=\"TRUE\"> TRUE</label>\n                        <label><input type=\"radio\" name=\"q4\" value=\"FALSE\"> FALSE</label>\n                        <label><input type=\"radio\" name=\"q4\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>5</strong> The popularity of potatoes in the UK was due to food shortages during the war.</p>\n                    <div class=\"tfng-options\">\n                        <label><input type=\"radio\" name=\"q5\" value=\"TRUE\"> TRUE</label>\n                        <label><input type=\"radio\" name=\"q5\" value=\"FALSE\"> FALSE</label>\n                        <label><input type=\"radio\" name=\"q5\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 1–5</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 1?</p>\n<p>\n<strong>TRUE</strong> if the statement agrees with the information<br>\n<strong>FALSE</strong> if the statement contradicts the information<br>\n<strong>NOT GIVEN</strong> if there is no information on this\n</p>\n<div class=\"question-item\">\n<p><strong>1</strong> Early Spanish chroniclers called the potato by the Incan name ‘chuño’.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q1\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q1\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q1\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> The purpose of the Spanish coming to Peru was to find potatoes.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q2\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q2\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q2\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> The Spanish believed that the potato had the same nutrients as other vegetables.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q3\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q3\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q3\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> Peasants at that time did not like to eat potatoes because they were ugly.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q4\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q4\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q4\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> The popularity of potatoes in the UK was due to food shortages during the war.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q5\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q5\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q5\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -51,7 +51,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-10-11-12-13-anchor\">\n                <h4>Questions 6–13</h4>\n                <p>Complete the sentences below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                <div class=\"question-item\">\n                    <p><strong>6</strong> In France, people began to overcome their disgust towards potatoes because the King put a potato <input name=\"q6\" class=\"blank\" id=\"q6_input\"> in his buttonhole.</p>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>7</strong> Frederick realised the potential of the potato, but he had to handle the <input name=\"q7\" class=\"blank\" id=\"q7_input\"> from ordinary people.</p>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>8</strong> The King of Prussia adopted a form of <input name=\"q8\" class=\"blank\" id=\"q8_input\"> psychology to make people accept potatoes.</p>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>9</strong> Before 1800, English people preferred eating <input name=\"q9\" class=\"blank\" id=\"q9_input\"> with bread, butter and cheese.</p>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>10</strong> The obvious way to deal with England's food problems was high-yielding potato <input name=\"q10\" class=\"blank\" id=\"q10_input\">.</p>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>11</strong> The Irish <input name=\"q11\" class=\"blank\" id=\"q11_input\"> and climate suited potatoes well.</p>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>12</strong> Between 1780 and 1841, thanks to the <input name=\"q12\" class=\"blank\" id=\"q12_input\"> of the potato, the Irish population doubled to eight million.</p>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>13</strong> The potato's high yields helped the poorest farmers to produce more healthy food almost without <input name=\"q13\" class=\"blank\" id=\"q13_input\">.</p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-10-11-12-13-anchor\">\n<h4>Questions 6–13</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"question-item\">\n<p><strong>6</strong> In France, people began to overcome their disgust towards potatoes because the King put a potato <input name=\"q6\" class=\"blank\" id=\"q6_input\"> in his buttonhole.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>7</strong> Frederick realised the potential of the potato, but he had to handle the <input name=\"q7\" class=\"blank\" id=\"q7_input\"> from ordinary people.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>8</strong> The King of Prussia adopted a form of <input name=\"q8\" class=\"blank\" id=\"q8_input\"> psychology to make people accept potatoes.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>9</strong> Before 1800, English people preferred eating <input name=\"q9\" class=\"blank\" id=\"q9_input\"> with bread, butter and cheese.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>10</strong> The obvious way to deal with England's food problems was high-yielding potato <input name=\"q10\" class=\"blank\" id=\"q10_input\">.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>11</strong> The Irish <input name=\"q11\" class=\"blank\" id=\"q11_input\"> and climate suited potatoes well.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>12</strong> Between 1780 and 1841, thanks to the <input name=\"q12\" class=\"blank\" id=\"q12_input\"> of the potato, the Irish population doubled to eight million.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>13</strong> The potato's high yields helped the poorest farmers to produce more healthy food almost without <input name=\"q13\" class=\"blank\" id=\"q13_input\">.</p>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 1</h2>\n      <p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n\n      <h3>A survivor's story</h3>\n      <h4>One native bird in New Zealand that has managed to survive the introduction of non-native species</h4>\n\n      <p>As an island country with a fauna dominated by birds, New Zealand was once home to an owl species which is now\n        extinct, the laughing owl, named for its distinctive cry. This bird was widespread throughout the islands when\n        European settlers arrived in the middle of the 19th century and it remained in good numbers for some years\n        thereafter. Where other native birds suffered from predation by the Polynesian rat, the laughing owl turned the\n        tables and adapted its diet to include the rodent. It was also capable of catching and killing the other New\n        Zealand owl, the morepork, and even larger birds, such as the weka. However, the laughing owl was wiped out\n        around the beginning of the 20th century, its demise caused by specimen collectors, habitat changes, and\n        non-native predators including cats and stoats. Surprisingly, it is the smaller owl, the morepork, that has\n        managed to survive until this day.</p>\n      <p>Speckled dark brown, with yellow eyes and long tails, they are around 29 centimetres long from head to tail and\n        175 grams in weight. Moreporks have fringes on the edge of their feathers, so they can fly almost silently and\n        not alert potential prey. They have acute hearing and their large eyes are very sensitive to light.</p>\n      <p>Moreporks nest in tree hollows, in clumps of plants, or in cavities among rocks and roots. In the wild,\n        moreporks usually start nesting in October, although two specimens have been recorded nesting in mid-winter,\n        possibly stimulated by an ample food supply. The female lays up to three white eggs, which she incubates for 20\n        to 30 days. During this time, she rarely hunts, and the male brings food to her.</p>\n      <p>Once the chicks hatch, she stays mainly on the nest until the young owls are fully feathered. When hatched,\n        chicks are covered in light grey down and have their eyes closed. The eyes do not open until the eighth day\n        after hatching. They can fly at around 35 days.</p>\n      <p>By day, moreporks sleep in roosts. By night, they hunt a variety of animals – mainly large invertebrates\n        including scarab and huhu beetles, moths, caterpillars and spiders. They also take small birds and mice. They\n        can find suitable food in pine forest as well as native forest. A morepork uses its sharp talons to catch or\n        stun its prey, which it then carries away in its bill. Moreporks are clever hunters, and birds such as robins,\n        grey warblers and fantails can end up as their prey. In the day, these small birds sometimes mob drowsy\n        moreporks and chase them away from their roosts; they force the sleepy predators to search for a more peaceful\n        spot.</p>\n      <p>Moreporks have proved to be ungracious hosts. Scientists trying to establish a population of plovers on Motuora\n        Island in New Zealand's Hauraki Gulf were mystified as to why only two birds survived out of the 75 placed\n        there. The culprits turned out to be five pairs of moreporks that ate or chased away the new arrivals.</p>\n      <p>Although moreporks are still considered to be relatively common, it is likely that numbers are in gradual\n        decline due to predation and loss of habitat. As the female is a hole-nester, she is vulnerable to predators\n        such as stoats and possums during the breeding season, and eggs and chicks will also be at risk from rats. The\n        use of pesticides is another possible threat to the owls, though not a direct one. As moreporks are at the top\n        of the food chain, they could be affected by an accumulative poison by consuming prey that has ingested poison.\n      </p>\n      <p>The New Zealand Department of Conservation is taking steps to ensure the preservation of New Zealand's only\n        native owl. The department is involved in measuring the population of moreporks and has put transmitters on a\n        number of birds to determine survival and mortality. As well as being New Zealand's only native owl, the\n        morepork has symbolic and spiritual importance, so in monitoring the birds it is hoped that the morepork will\n        continue to survive and thrive.</p>\n      <p>At dusk, the melancholy sound of the morepork can be heard in forests and parks as it calls to other moreporks\n        and claims territory. Its Māori name (ruru) echoes its two-part cry. In the tradition of the Māori people of New\n        Zealand, the morepork, or ruru, was often seen as a careful guardian. A number of sayings referred to the bird's\n        alertness. As a bird of the night, it was associated with the spirit world. Moreporks were believed to act as\n        messengers to the gods in the heavens, flying along spiritual paths in the sky. They were the mediums used to\n        communicate with the gods. The occasional high, piercing call of the morepork signified bad news, but the\n        lower-pitched and more common “ruru” call heralded good news.</p>\n\n      <div class=\"empty-space\"></div>\n    </section>\n\n    <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>A survivor's story</h3>\n<h4>One native bird in New Zealand that has managed to survive the introduction of non-native species</h4>\n<p>As an island country with a fauna dominated by birds, New Zealand was once home to an owl species which is now extinct, the laughing owl, named for its distinctive cry. This bird was widespread throughout the islands when European settlers arrived in the middle of the 19th century and it remained in good numbers for some years thereafter. Where other native birds suffered from predation by the Polynesian rat, the laughing owl turned the tables and adapted its diet to include the rodent. It was also capable of catching and killing the other New Zealand owl, the morepork, and even larger birds, such as the weka. However, the laughing owl was wiped out around the beginning of the 20th century, its demise caused by specimen collectors, habitat changes, and non-native predators including cats and stoats. Surprisingly, it is the smaller owl, the morepork, that has managed to survive until this day.</p>\n<p>Speckled dark brown, with yellow eyes and long tails, they are around 29 centimetres long from head to tail and 175 grams in weight. Moreporks have fringes on the edge of their feathers, so they can fly almost silently and not alert potential prey. They have acute hearing and their large eyes are very sensitive to light.</p>\n<p>Moreporks nest in tree hollows, in clumps of plants, or in cavities among rocks and roots. In the wild, moreporks usually start nesting in October, although two specimens have been recorded nesting in mid-winter, possibly stimulated by an ample food supply. The female lays up to three white eggs, which she incubates for 20 to 30 days. During this time, she rarely hunts, and the male brings food to her.</p>\n<p>Once the chicks hatch, she stays mainly on the nest until the young owls are fully feathered. When hatched, chicks are covered in light grey down and have their eyes closed. The eyes do not open until the eighth day after hatching. They can fly at around 35 days.</p>\n<p>By day, moreporks sleep in roosts. By night, they hunt a variety of animals – mainly large invertebrates including scarab and huhu beetles, moths, caterpillars and spiders. They also take small birds and mice. They can find suitable food in pine forest as well as native forest. A morepork uses its sharp talons to catch or stun its prey, which it then carries away in its bill. Moreporks are clever hunters, and birds such as robins, grey warblers and fantails can end up as their prey. In the day, these small birds sometimes mob drowsy moreporks and chase them away from their roosts; they force the sleepy predators to search for a more peaceful spot.</p>\n<p>Moreporks have proved to be ungracious hosts. Scientists trying to establish a population of plovers on Motuora Island in New Zealand's Hauraki Gulf were mystified as to why only two birds survived out of the 75 placed there. The culprits turned out to be five pairs of moreporks that ate or chased away the new arrivals.</p>\n<p>Although moreporks are still considered to be relatively common, it is likely that numbers are in gradual decline due to predation and loss of habitat. As the female is a hole-nester, she is vulnerable to predators such as stoats and possums during the breeding season, and eggs and chicks will also be at risk from rats. The use of pesticides is another possible threat to the owls, though not a direct one. As moreporks are at the top of the food chain, they could be affected by an accumulative poison by consuming prey that has ingested poison.\n</p>\n<p>The New Zealand Department of Conservation is taking steps to ensure the preservation of New Zealand's only native owl. The department is involved in measuring the population of moreporks and has put transmitters on a number of birds to determine survival and mortality. As well as being New Zealand's only native owl, the morepork has symbolic and spiritual importance, so in monitoring the birds it is hoped that the morepork will continue to survive and thrive.</p>\n<p>At dusk, the melancholy sound of the morepork can be heard in forests and parks as it calls to other moreporks and claims territory. Its Māori name (ruru) echoes its two-part cry. In the tradition of the Māori people of New Zealand, the morepork, or ruru, was often seen as a careful guardian. A number of sayings referred to the bird's alertness. As a bird of the night, it was associated with the spirit world. Moreporks were believed to act as messengers to the gods in the heavens, flying along spiritual paths in the sky. They were the mediums used to communicate with the gods. The occasional high, piercing call of the morepork signified bad news, but the lower-pitched and more common “ruru” call heralded good news.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -37,7 +37,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n        <h4>Questions 1–7</h4>\n        <p>Do the following statements agree with the information in Reading Passage 1?</p>\n        <p>In boxes 1–7 on your answer sheet, write:</p>\n        <ul>\n          <li><strong>TRUE</strong> if the statement agrees with the information</li>\n          <li><strong>FALSE</strong> if the statement contradicts the information</li>\n          <li><strong>NOT GIVEN</strong> if there is no information about this</li>\n        </ul>\n\n        <div class=\"question-item\">\n          <p><strong>1</strong> Early European settlers made detailed studies of the morepork.</p>\n          <div class=\"radio-options\">\n            <label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n            <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n            <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n          </div>\n        </div>\n        <div class=\"question-item\">\n          <p><strong>2</strong> The Polynesian rat had a negative effect on the number of laughing owls.</p>\n          <div class=\"radio-options\">\n            <label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n            <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n            <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n          </div>\n        </div>\n        <div class=\"question-item\">\n          <p><strong>3</strong> The laughing owl was larger than the morepork.</p>\n          <div class=\"radio-options\">\n            <label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n            <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n            <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n          </div>\n        </div>\n        <div class=\"question-item\">\n          <p><strong>4</strong> Rats pose a risk to young moreporks.</p>\n          <div class=\"radio-options\">\n            <label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n            <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n            <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n          </div>\n        </div>\n        <div class=\"question-item\">\n          <p><strong>5</strong> The New Zealand Department of Conservation is hoping to limit the population of\n            moreporks.</p>\n          <div class=\"radio-options\">\n            <label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n            <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n            <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n          </div>\n        </div>\n        <div class=\"question-item\">\n          <p><strong>6</strong> Other bird species are frightened away when they hear the morepork's cry.</p>\n          <div class=\"radio-options\">\n            <label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n            <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n            <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n          </div>\n        </div>\n        <div class=\"question-item\">\n          <p><strong>7</strong> In Māori tradition, the low call of the morepork had negative associations.</p>\n          <div class=\"radio-options\">\n            <label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n            <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n            <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n          </div>\n        </div>\n      </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 1–7</h4>\n<p>Do the following statements agree with the information in Reading Passage 1?</p>\n<p>In boxes 1–7 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> Early European settlers made detailed studies of the morepork.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> The Polynesian rat had a negative effect on the number of laughing owls.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> The laughing owl was larger than the morepork.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> Rats pose a risk to young moreporks.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> The New Zealand Department of Conservation is hoping to limit the population of moreporks.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> Other bird species are frightened away when they hear the morepork's cry.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>7</strong> In Māori tradition, the low call of the morepork had negative associations.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -51,7 +51,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n        <h4>Questions 8–13</h4>\n        <p>Complete the notes below.</p>\n        <p>Choose <strong>ONE WORD AND/OR A NUMBER</strong> from the passage for each answer.</p>\n\n        <div class=\"notes-completion\">\n          <h4>The Morepork</h4>\n          <ul>\n            <li>\n              <strong>Appearance</strong>\n              <ul>\n                <li>approximately <strong>8</strong> <input type=\"text\" id=\"q8_input\" name=\"q8\"> in length</li>\n                <li>feathers with fringes to enable quiet flight</li>\n              </ul>\n            </li>\n            <li>\n              <strong>Nesting</strong>\n              <ul>\n                <li>nests in trees, plants or spaces in roots and <strong>9</strong> <input type=\"text\" id=\"q9_input\" name=\"q9\">\n                </li>\n                <li>after about 35 days, baby moreporks are capable of leaving the nest</li>\n              </ul>\n            </li>\n            <li>\n              <strong>Hunting</strong>\n              <ul>\n                <li>transports its prey using its <strong>10</strong> <input type=\"text\" id=\"q10_input\" name=\"q10\"></li>\n                <li>can be chased away by other birds during the <strong>11</strong> <input type=\"text\" id=\"q11_input\" name=\"q11\">\n                </li>\n                <li>attacked <strong>12</strong> <input type=\"text\" id=\"q12_input\" name=\"q12\"> that had been introduced to Motuora\n                  Island</li>\n              </ul>\n            </li>\n            <li>\n              <strong>Threats</strong>\n              <ul>\n                <li>may be exposed to <strong>13</strong> <input type=\"text\" id=\"q13_input\" name=\"q13\"> in their prey</li>\n              </ul>\n            </li>\n          </ul>\n        </div>\n      </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Questions 8–13</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>The Morepork</h4>\n<ul>\n<li>\n<strong>Appearance</strong>\n<ul>\n<li>approximately <strong>8</strong> <input type=\"text\" id=\"q8_input\" name=\"q8\"> in length</li>\n<li>feathers with fringes to enable quiet flight</li>\n</ul>\n</li>\n<li>\n<strong>Nesting</strong>\n<ul>\n<li>nests in trees, plants or spaces in roots and <strong>9</strong> <input type=\"text\" id=\"q9_input\" name=\"q9\">\n</li>\n<li>after about 35 days, baby moreporks are capable of leaving the nest</li>\n</ul>\n</li>\n<li>\n<strong>Hunting</strong>\n<ul>\n<li>transports its prey using its <strong>10</strong> <input type=\"text\" id=\"q10_input\" name=\"q10\"></li>\n<li>can be chased away by other birds during the <strong>11</strong> <input type=\"text\" id=\"q11_input\" name=\"q11\">\n</li>\n<li>attacked <strong>12</strong> <input type=\"text\" id=\"q12_input\" name=\"q12\"> that had been introduced to Motuora Island</li>\n</ul>\n</li>\n<li>\n<strong>Threats</strong>\n<ul>\n<li>may be exposed to <strong>13</strong> <input type=\"text\" id=\"q13_input\" name=\"q13\"> in their prey</li>\n</ul>\n</li>\n</ul>\n</div>\n</div>"
     }
   ],
   "answerKey": {
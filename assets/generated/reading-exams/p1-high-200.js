@@ -16,7 +16,7 @@
       {
         "blockId": "passage-main",
         "kind": "text",
-        "bodyHtml": "<h2>READING PASSAGE 1</h2>\n    <p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n    \n    <h3>Australia's Airborne Dentists</h3>\n  \n    <p>Australians living or travelling in rural and remote areas can face particular difficulties when they need medical care. Hundreds of kilometres from major cities and many hours by road from the closest hospital or clinic, some rural Australians do not have easy access to doctors, nurses and dentists. Organisations such as the Royal Flying Doctor Service (RFDS) have been established to bring health services to outback Australian communities. The RFDS provides free medical care to people who live, work or travel in remote and regional parts of Australia. This non-profit organisation is the oldest and largest airborne health service of its kind in the world, and since 1928 it has used small aircraft to send doctors and nurses to some of Australia's most far-away communities.</p>\n    <p>In recent years, the RFDS has also started to fly dentists to regional Australia. As well as offering mobile dental clinics, the RFDS offers a range of preventative and educational services. Looking after the teeth of people in remote areas presents special challenges. These include providing care to disparate communities with no established dental facilities, and dealing with higher incidences of other diseases which are linked to, or caused by poor dental health.</p>\n    <p>People in remote areas have very infrequent visits by health staff. RFDS dentists might only visit a community once every few months, or sometimes once per year. Because of infrequent dentist visits, patients in these areas often need to put up with their dental problems before they can get treatment. Consequently, people in remote areas are more likely to have tooth decay (the blackening and deterioration of teeth) and develop gum and other mouth diseases.</p>\n    <p>In some locations that the RFDS visits, there are no suitable dental facilities, so dentists have to bring everything with them. This includes drills, dentists' chairs, portable X-ray machines, and computers for keeping track of patients' treatments. Equipment can weigh up to 100 kilograms, and since the small planes that transport dentists have limited space, dentists cannot always bring everything that they need.</p>\n    <p>While dentists in town or city centres can specialise in certain types of treatment, RFDS dentists need to be ‘all-rounders'. They need to be able to do all kinds of dental procedures, as they don't have the ability to refer patients to more specialised dentists. Even with their broad experience, there are some services that are particularly challenging for RFDS dentists. For example, dentures (or artificial teeth) can be very difficult to provide, as they need to be the right shape and size for the patient, and this requires many visits over a long period of time. As a result, it is not practical to make dentures available.</p>\n    <p>Some chronic illnesses are more common in remote communities than in the rest of Australia. These illnesses can in turn lead to a lowered resistance to infection, including gum and other oral infections. As a result, people in outback Australian communities are more likely to experience oral health problems than city folk, and this poses extra challenges for both the dentists and the doctors of the RFDS.</p>\n    <p>Because there aren't a lot of dental services in remote areas, people living in these areas also receive less education about good dental hygiene than their city counterparts do. Australians in very remote communities might not be aware of things that people in cities take for granted, such as the importance of daily tooth brushing. Also, basic dental hygiene items such as toothpaste and toothbrushes can be more expensive in outback areas. Many people are on low incomes, meaning they have extra difficulty affording these products. If this is the case, the RFDS supplies these.</p>\n    <p>As well as treating patients, RFDS dentists try to focus on preventative oral health and educate their patients on good oral hygiene, such as tooth brushing and flossing. The RFDS also provides mouthguards for young sports players. Playing contact sports, such as rugby league or Australian rules football, can damage young people's teeth, so mouthguards provide protection which prevents accidental injuries.</p>\n    <p>Adding fluoride to water supplies has been proven to reduce the incidence of tooth decay in many parts of the world. City dwellers in Australia use water supplies that have been fluoridated, and their rates of tooth decay are lower because of this. In remote areas, it is not practical to fluoridate drinking water supplies, and so people living in these areas are more subject to tooth decay. As a result, it is particularly important that people living in areas without fluoridated water pay special attention to regular brushing of their teeth with fluoridated toothpaste.</p>\n    <p>Despite many challenges, the RFDS continues to offer much needed dental and medical support. Its presence in isolated communities greatly improves the quality of dental health, and supports important oral hygiene and health initiatives.</p>\n    \n    <p>&nbsp;</p> <!-- Final padding -->\n  </section>\n\n  <!-- Draggable Divider -->\n  <div id=\"divider\" title=\"Drag to resize\"></div>\n\n  <!-- Right Pane: Questions and Controls -->"
+        "bodyHtml": "<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>Australia's Airborne Dentists</h3>\n<p>Australians living or travelling in rural and remote areas can face particular difficulties when they need medical care. Hundreds of kilometres from major cities and many hours by road from the closest hospital or clinic, some rural Australians do not have easy access to doctors, nurses and dentists. Organisations such as the Royal Flying Doctor Service (RFDS) have been established to bring health services to outback Australian communities. The RFDS provides free medical care to people who live, work or travel in remote and regional parts of Australia. This non-profit organisation is the oldest and largest airborne health service of its kind in the world, and since 1928 it has used small aircraft to send doctors and nurses to some of Australia's most far-away communities.</p>\n<p>In recent years, the RFDS has also started to fly dentists to regional Australia. As well as offering mobile dental clinics, the RFDS offers a range of preventative and educational services. Looking after the teeth of people in remote areas presents special challenges. These include providing care to disparate communities with no established dental facilities, and dealing with higher incidences of other diseases which are linked to, or caused by poor dental health.</p>\n<p>People in remote areas have very infrequent visits by health staff. RFDS dentists might only visit a community once every few months, or sometimes once per year. Because of infrequent dentist visits, patients in these areas often need to put up with their dental problems before they can get treatment. Consequently, people in remote areas are more likely to have tooth decay (the blackening and deterioration of teeth) and develop gum and other mouth diseases.</p>\n<p>In some locations that the RFDS visits, there are no suitable dental facilities, so dentists have to bring everything with them. This includes drills, dentists' chairs, portable X-ray machines, and computers for keeping track of patients' treatments. Equipment can weigh up to 100 kilograms, and since the small planes that transport dentists have limited space, dentists cannot always bring everything that they need.</p>\n<p>While dentists in town or city centres can specialise in certain types of treatment, RFDS dentists need to be ‘all-rounders'. They need to be able to do all kinds of dental procedures, as they don't have the ability to refer patients to more specialised dentists. Even with their broad experience, there are some services that are particularly challenging for RFDS dentists. For example, dentures (or artificial teeth) can be very difficult to provide, as they need to be the right shape and size for the patient, and this requires many visits over a long period of time. As a result, it is not practical to make dentures available.</p>\n<p>Some chronic illnesses are more common in remote communities than in the rest of Australia. These illnesses can in turn lead to a lowered resistance to infection, including gum and other oral infections. As a result, people in outback Australian communities are more likely to experience oral health problems than city folk, and this poses extra challenges for both the dentists and the doctors of the RFDS.</p>\n<p>Because there aren't a lot of dental services in remote areas, people living in these areas also receive less education about good dental hygiene than their city counterparts do. Australians in very remote communities might not be aware of things that people in cities take for granted, such as the importance of daily tooth brushing. Also, basic dental hygiene items such as toothpaste and toothbrushes can be more expensive in outback areas. Many people are on low incomes, meaning they have extra difficulty affording these products. If this is the case, the RFDS supplies these.</p>\n<p>As well as treating patients, RFDS dentists try to focus on preventative oral health and educate their patients on good oral hygiene, such as tooth brushing and flossing. The RFDS also provides mouthguards for young sports players. Playing contact sports, such as rugby league or Australian rules football, can damage young people's teeth, so mouthguards provide protection which prevents accidental injuries.</p>\n<p>Adding fluoride to water supplies has been proven to reduce the incidence of tooth decay in many parts of the world. City dwellers in Australia use water supplies that have been fluoridated, and their rates of tooth decay are lower because of this. In remote areas, it is not practical to fluoridate drinking water supplies, and so people living in these areas are more subject to tooth decay. As a result, it is particularly important that people living in areas without fluoridated water pay special attention to regular brushing of their teeth with fluoridated toothpaste.</p>\n<p>Despite many challenges, the RFDS continues to offer much needed dental and medical support. Its presence in isolated communities greatly improves the quality of dental health, and supports important oral hygiene and health initiatives.</p>\n<p>&nbsp;</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"
       }
     ]
   },
@@ -33,7 +33,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <a id=\"q1-anchor\"></a>\n      <h4>Questions 1–7</h4>\n      <p>Do the following statements agree with the information in Reading Passage 1?</p>\n      <div class=\"q-block\"><p><strong>1</strong> Many of the RFDS doctors work as volunteers.</p><div class=\"options\"><label><input type=\"radio\" name=\"q1\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q1\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q1\" value=\"not given\"> NOT GIVEN</label></div></div>\n      <div class=\"q-block\"><p><strong>2</strong> RFDS dentists make trips to outback communities each month.</p><div class=\"options\"><label><input type=\"radio\" name=\"q2\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q2\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q2\" value=\"not given\"> NOT GIVEN</label></div></div>\n      <div class=\"q-block\"><p><strong>3</strong> RFDS dentists are accompanied on their journeys to remote areas by a dental nurse.</p><div class=\"options\"><label><input type=\"radio\" name=\"q3\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q3\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q3\" value=\"not given\"> NOT GIVEN</label></div></div>\n      <div class=\"q-block\"><p><strong>4</strong> RFDS dentists must provide a wide range of dental services.</p><div class=\"options\"><label><input type=\"radio\" name=\"q4\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q4\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q4\" value=\"not given\"> NOT GIVEN</label></div></div>\n      <div class=\"q-block\"><p><strong>5</strong> Rural dental patients are more informed about oral hygiene than urban patients.</p><div class=\"options\"><label><input type=\"radio\" name=\"q5\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q5\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q5\" value=\"not given\"> NOT GIVEN</label></div></div>\n      <div class=\"q-block\"><p><strong>6</strong> RFDS dentists educate patients about good eating habits.</p><div class=\"options\"><label><input type=\"radio\" name=\"q6\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q6\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q6\" value=\"not given\"> NOT GIVEN</label></div></div>\n      <div class=\"q-block\"><p><strong>7</strong> Urban Australians generally have better teeth because their water is treated.</p><div class=\"options\"><label><input type=\"radio\" name=\"q7\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q7\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q7\" value=\"not given\"> NOT GIVEN</label></div></div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<a id=\"q1-anchor\"></a>\n<h4>Questions 1–7</h4>\n<p>Do the following statements agree with the information in Reading Passage 1?</p>\n<div class=\"q-block\"><p><strong>1</strong> Many of the RFDS doctors work as volunteers.</p><div class=\"options\"><label><input type=\"radio\" name=\"q1\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q1\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q1\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>2</strong> RFDS dentists make trips to outback communities each month.</p><div class=\"options\"><label><input type=\"radio\" name=\"q2\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q2\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q2\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>3</strong> RFDS dentists are accompanied on their journeys to remote areas by a dental nurse.</p><div class=\"options\"><label><input type=\"radio\" name=\"q3\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q3\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q3\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>4</strong> RFDS dentists must provide a wide range of dental services.</p><div class=\"options\"><label><input type=\"radio\" name=\"q4\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q4\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q4\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>5</strong> Rural dental patients are more informed about oral hygiene than urban patients.</p><div class=\"options\"><label><input type=\"radio\" name=\"q5\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q5\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q5\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>6</strong> RFDS dentists educate patients about good eating habits.</p><div class=\"options\"><label><input type=\"radio\" name=\"q6\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q6\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q6\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>7</strong> Urban Australians generally have better teeth because their water is treated.</p><div class=\"options\"><label><input type=\"radio\" name=\"q7\" value=\"true\"> TRUE</label><label><input type=\"radio\" name=\"q7\" value=\"false\"> FALSE</label><label><input type=\"radio\" name=\"q7\" value=\"not given\"> NOT GIVEN</label></div></div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -46,7 +46,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <a id=\"q8-anchor\"></a>\n      <h4>Questions 8–13</h4>\n      <p>Complete the notes below. Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n      <h5>Challenges faced by RFDS dentists</h5>\n      <ul>\n        <li>need to bring equipment including <strong>8</strong> <input class=\"blank\" name=\"q8\"> for records</li>\n        <li>aircraft used to carry equipment have restricted <strong>9</strong> <input class=\"blank\" name=\"q9\"></li>\n        <li>problems offering some services, e.g. fitting <strong>10</strong> <input class=\"blank\" name=\"q10\"></li>\n        <li>people in remote areas are more likely to have infection in their mouth</li>\n      </ul>\n      <h5>Products supplied by RFDS dentists</h5>\n      <p>If necessary RFDS provides:</p>\n      <ul>\n        <li><strong>11</strong> <input class=\"blank\" name=\"q11\"> and <strong>12</strong> <input class=\"blank\" name=\"q12\"> for regular use</li>\n        <li><strong>13</strong> <input class=\"blank\" name=\"q13\"> to limit dental accidents on the sports field</li>\n      </ul>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<a id=\"q8-anchor\"></a>\n<h4>Questions 8–13</h4>\n<p>Complete the notes below. Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<h5>Challenges faced by RFDS dentists</h5>\n<ul>\n<li>need to bring equipment including <strong>8</strong> <input class=\"blank\" name=\"q8\"> for records</li>\n<li>aircraft used to carry equipment have restricted <strong>9</strong> <input class=\"blank\" name=\"q9\"></li>\n<li>problems offering some services, e.g. fitting <strong>10</strong> <input class=\"blank\" name=\"q10\"></li>\n<li>people in remote areas are more likely to have infection in their mouth</li>\n</ul>\n<h5>Products supplied by RFDS dentists</h5>\n<p>If necessary RFDS provides:</p>\n<ul>\n<li><strong>11</strong> <input class=\"blank\" name=\"q11\"> and <strong>12</strong> <input class=\"blank\" name=\"q12\"> for regular use</li>\n<li><strong>13</strong> <input class=\"blank\" name=\"q13\"> to limit dental accidents on the sports field</li>\n</ul>\n</div>"
     }
   ],
   "answerKey": {
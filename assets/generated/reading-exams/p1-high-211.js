@@ -16,7 +16,7 @@
       {
         "blockId": "passage-main",
         "kind": "text",
-        "bodyHtml": "<h2>READING PASSAGE 1</h2>\n    <p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n    \n    <h3>Ahead of its time</h3>\n    <p><em>A chance discovery in New Zealand has challenged the country's recorded history.</em></p>\n  \n    <p>One October afternoon, a young New Zealander, Sam Tobin, called his dogs and went for a walk down to the nearby Ruamahanga River. Having been very high for days, the river had at last fallen, and Tobin was eager to see what changes the floods had brought. The family farm borders the river, and a four-metre-high flood bank testifies to its natural tendency to flood.</p>\n\n    <p>Tobin stepped out onto a broad shoulder of river sand, where he noticed what he initially took to be a whitish rock, lit by the sun. Then, getting closer, he realised it was a bone. Such a thing was not uncommon in these parts - he had often come home with fragments, or even whole skeletons, of cows and sheep. But as he scraped aside a stone he realised that it was a human bone, something quite new in his experience. As he picked it up, he saw it was a skull, discoloured with age.</p>\n\n    <p>Tobin replaced the skull and hurried home to tell his mother what the river had delivered to their doorstep. It would prove to be a spectacular find, setting in motion an investigation by some of the country's most respected specialists, and ultimately challenging our most firmly held assertions about the human settlement of New Zealand.</p>\n\n    <p>The police were immediately called, but despite a thorough search they could find nothing that might shed light on the identity of the Ruamahanga skull, or the circumstances of its sudden appearance. The skull was then taken north to be examined by forensic pathologist Dr Fetvis at Auckland Hospital. Despite being hampered by its damaged and incomplete condition - the jawbone and lower left portion of the cranium were missing - Dr Fetvis determined that the skull was that of a female. He'd then consulted with a colleague, Dr Koelmeyer, who believed that the deterioration of the bone placed the time of dead 'before living memory' and, most significantly as it would turn out, the skull appeared to be European in origin.</p>\n\n    <p>Wellington-based forensic anthropologist Dr Watt also examined the skull, and suggested it belonged to a 40–45-year-old. He believed that it could be the remains of an old farm burial, but was not certain, and proposed the use of radiocarbon dating to make sure it wasn't a recent death. As a result, the Institute of Geological and Nuclear Sciences (GNS) in Lower Hutt was contacted, and provided with a sample of bone that had originated in the top of the skull. In a little over three weeks, the seemingly astonishing results from the GNS laboratory came back. Cutting through the bewildering complexity of the scientific analysis was a single line reading: conventional radiocarbon age approximately 296 years. This was staggering, for the skull was about 200 years older than Dr Koelmeyer had believed.</p>\n\n    <p>Of course, a skull of this age wasn't particularly unusual in New Zealand. The Maori people have been living in the country for at least 800 years and scientists frequently come across human remains of considerable age. The fascinating question, however, was how a skull of this race, let alone this gender, had reached these remote islands in the South Pacific at such a time, long before the arrival of the explorer Captain Cook in 1769, and perhaps even before the very first European landfall - the fleeting visit of the Dutch explorer Tasman in 1642 - neither of whom had women among their crews.</p>\n\n    <p>The first known European women in the Pacific came with a doomed colonising venture which sailed from Peru in 1595 under the command of Spanish captain Mendana. However, it is unlikely the Ruamahanga skull originated from this expedition because no evidence of Mendana's ships has ever been found in New Zealand, while a team of archaeologists working in the Solomon Islands in 1979 did discover the remains of European vessels dating from the 16th century.</p>\n\n    <p>Two centuries were to pass before the first recorded European females arrived in New Zealand, both having escaped from prison in Australia. Kathleen Hagerty and Charlotte Edgar are known to have reached the country in 1806. How then do we account for the Ruamahanga skull, which appears to be about 100 years older than that? It is impossible to say with certainty, but the most likely explanation is that a Spanish or Portuguese trading ship was washed onto these wild shores as a result of a shipwreck and a woman got ashore. Implausible, perhaps, but the Ruamahanga skull, today resting in the Wellington Museum, could be the kind of concrete evidence that demands such a drastic re-evaluation of history.</p>\n    \n    <p>&nbsp;</p> <!-- Final padding -->\n  </section>\n\n  <!-- Draggable Divider -->\n  <div id=\"divider\" title=\"Drag to resize\"></div>\n\n  <!-- Right Pane: Questions and Controls -->"
+        "bodyHtml": "<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>Ahead of its time</h3>\n<p><em>A chance discovery in New Zealand has challenged the country's recorded history.</em></p>\n<p>One October afternoon, a young New Zealander, Sam Tobin, called his dogs and went for a walk down to the nearby Ruamahanga River. Having been very high for days, the river had at last fallen, and Tobin was eager to see what changes the floods had brought. The family farm borders the river, and a four-metre-high flood bank testifies to its natural tendency to flood.</p>\n<p>Tobin stepped out onto a broad shoulder of river sand, where he noticed what he initially took to be a whitish rock, lit by the sun. Then, getting closer, he realised it was a bone. Such a thing was not uncommon in these parts - he had often come home with fragments, or even whole skeletons, of cows and sheep. But as he scraped aside a stone he realised that it was a human bone, something quite new in his experience. As he picked it up, he saw it was a skull, discoloured with age.</p>\n<p>Tobin replaced the skull and hurried home to tell his mother what the river had delivered to their doorstep. It would prove to be a spectacular find, setting in motion an investigation by some of the country's most respected specialists, and ultimately challenging our most firmly held assertions about the human settlement of New Zealand.</p>\n<p>The police were immediately called, but despite a thorough search they could find nothing that might shed light on the identity of the Ruamahanga skull, or the circumstances of its sudden appearance. The skull was then taken north to be examined by forensic pathologist Dr Fetvis at Auckland Hospital. Despite being hampered by its damaged and incomplete condition - the jawbone and lower left portion of the cranium were missing - Dr Fetvis determined that the skull was that of a female. He'd then consulted with a colleague, Dr Koelmeyer, who believed that the deterioration of the bone placed the time of dead 'before living memory' and, most significantly as it would turn out, the skull appeared to be European in origin.</p>\n<p>Wellington-based forensic anthropologist Dr Watt also examined the skull, and suggested it belonged to a 40–45-year-old. He believed that it could be the remains of an old farm burial, but was not certain, and proposed the use of radiocarbon dating to make sure it wasn't a recent death. As a result, the Institute of Geological and Nuclear Sciences (GNS) in Lower Hutt was contacted, and provided with a sample of bone that had originated in the top of the skull. In a little over three weeks, the seemingly astonishing results from the GNS laboratory came back. Cutting through the bewildering complexity of the scientific analysis was a single line reading: conventional radiocarbon age approximately 296 years. This was staggering, for the skull was about 200 years older than Dr Koelmeyer had believed.</p>\n<p>Of course, a skull of this age wasn't particularly unusual in New Zealand. The Maori people have been living in the country for at least 800 years and scientists frequently come across human remains of considerable age. The fascinating question, however, was how a skull of this race, let alone this gender, had reached these remote islands in the South Pacific at such a time, long before the arrival of the explorer Captain Cook in 1769, and perhaps even before the very first European landfall - the fleeting visit of the Dutch explorer Tasman in 1642 - neither of whom had women among their crews.</p>\n<p>The first known European women in the Pacific came with a doomed colonising venture which sailed from Peru in 1595 under the command of Spanish captain Mendana. However, it is unlikely the Ruamahanga skull originated from this expedition because no evidence of Mendana's ships has ever been found in New Zealand, while a team of archaeologists working in the Solomon Islands in 1979 did discover the remains of European vessels dating from the 16th century.</p>\n<p>Two centuries were to pass before the first recorded European females arrived in New Zealand, both having escaped from prison in Australia. Kathleen Hagerty and Charlotte Edgar are known to have reached the country in 1806. How then do we account for the Ruamahanga skull, which appears to be about 100 years older than that? It is impossible to say with certainty, but the most likely explanation is that a Spanish or Portuguese trading ship was washed onto these wild shores as a result of a shipwreck and a woman got ashore. Implausible, perhaps, but the Ruamahanga skull, today resting in the Wellington Museum, could be the kind of concrete evidence that demands such a drastic re-evaluation of history.</p>\n<p>&nbsp;</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"
       }
     ]
   },
@@ -30,7 +30,7 @@
         "q3",
         "q4"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 1–4</h4>\n      <p>Do the following statements agree with the information given in Reading Passage 1?</p>\n      <p><em>In boxes 1–4 on your answer sheet, write</em></p>\n      <ul style=\"list-style:none; padding-left:0; font-weight:bold; font-size:0.9em;\">\n        <li>TRUE <span style=\"font-weight:normal; margin-left:45px;\">if the statement agrees with the information</span></li>\n        <li>FALSE <span style=\"font-weight:normal; margin-left:38px;\">if the statement contradicts the information</span></li>\n        <li>NOT GIVEN <span style=\"font-weight:normal; margin-left:8px;\">if there is no information on this</span></li>\n      </ul>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q1-anchor\"></a><b>1</b> The Ruamahanga River often floods.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q1\" value=\"true\"> True</label>\n            <label><input type=\"radio\" name=\"q1\" value=\"false\"> False</label>\n            <label><input type=\"radio\" name=\"q1\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q2-anchor\"></a><b>2</b> When Tobin first found the object in the river, he mistook it for something else.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q2\" value=\"true\"> True</label>\n            <label><input type=\"radio\" name=\"q2\" value=\"false\"> False</label>\n            <label><input type=\"radio\" name=\"q2\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q3-anchor\"></a><b>3</b> Tobin could not decide what part of the body the bone came from.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q3\" value=\"true\"> True</label>\n            <label><input type=\"radio\" name=\"q3\" value=\"false\"> False</label>\n            <label><input type=\"radio\" name=\"q3\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q4-anchor\"></a><b>4</b> Tobin's mother was surprised that the skull caused debate among specialists.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q4\" value=\"true\"> True</label>\n            <label><input type=\"radio\" name=\"q4\" value=\"false\"> False</label>\n            <label><input type=\"radio\" name=\"q4\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 1–4</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p><em>In boxes 1–4 on your answer sheet, write</em></p>\n<ul style=\"list-style:none; padding-left:0; font-weight:bold; font-size:0.9em;\">\n<li>TRUE <span style=\"font-weight:normal; margin-left:45px;\">if the statement agrees with the information</span></li>\n<li>FALSE <span style=\"font-weight:normal; margin-left:38px;\">if the statement contradicts the information</span></li>\n<li>NOT GIVEN <span style=\"font-weight:normal; margin-left:8px;\">if there is no information on this</span></li>\n</ul>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q1-anchor\"></a><b>1</b> The Ruamahanga River often floods.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q1\" value=\"true\"> True</label> <label><input type=\"radio\" name=\"q1\" value=\"false\"> False</label> <label><input type=\"radio\" name=\"q1\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q2-anchor\"></a><b>2</b> When Tobin first found the object in the river, he mistook it for something else.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q2\" value=\"true\"> True</label> <label><input type=\"radio\" name=\"q2\" value=\"false\"> False</label> <label><input type=\"radio\" name=\"q2\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q3-anchor\"></a><b>3</b> Tobin could not decide what part of the body the bone came from.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q3\" value=\"true\"> True</label> <label><input type=\"radio\" name=\"q3\" value=\"false\"> False</label> <label><input type=\"radio\" name=\"q3\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q4-anchor\"></a><b>4</b> Tobin's mother was surprised that the skull caused debate among specialists.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q4\" value=\"true\"> True</label> <label><input type=\"radio\" name=\"q4\" value=\"false\"> False</label> <label><input type=\"radio\" name=\"q4\" value=\"not given\"> NG</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -42,7 +42,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 5–9</h4>\n      <p>Complete the flow-chart below.</p>\n      <p>Choose <strong>NO MORE THAN TWO WORDS AND/OR A NUMBER</strong> from the passage for each answer.</p>\n      \n      <h3 style=\"text-align:center;\">The events after the river flooded</h3>\n      <div class=\"flow-chart\">\n        <div class=\"flow-box\">Tobin found a human skull.</div>\n        <div class=\"flow-arrow\">⬇</div>\n        <div class=\"flow-box\">The <a id=\"q5-anchor\"></a><b>5</b> <input class=\"blank\" type=\"text\" name=\"q5\"> were initially involved in trying to explain the presence of the skull.</div>\n        <div class=\"flow-arrow\">⬇</div>\n        <div class=\"flow-box\">Dr Ferris believed the skull belonged to a female.</div>\n        <div class=\"flow-arrow\">⬇</div>\n        <div class=\"flow-box\">Dr Koelmeyer suggested it was a <a id=\"q6-anchor\"></a><b>6</b> <input class=\"blank\" type=\"text\" name=\"q6\"> skull.</div>\n        <div class=\"flow-arrow\">⬇</div>\n        <div class=\"flow-box\">Dr Watt recommended <a id=\"q7-anchor\"></a><b>7</b> <input class=\"blank\" type=\"text\" name=\"q7\"> to establish the skull's age.</div>\n        <div class=\"flow-arrow\">⬇</div>\n        <div class=\"flow-box\">A bone <a id=\"q8-anchor\"></a><b>8</b> <input class=\"blank\" type=\"text\" name=\"q8\"> was sent to the GNS.</div>\n        <div class=\"flow-arrow\">⬇</div>\n        <div class=\"flow-box\">The age of the skull was about <a id=\"q9-anchor\"></a><b>9</b> <input class=\"blank\" type=\"text\" name=\"q9\"> years.</div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 5–9</h4>\n<p>Complete the flow-chart below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<h3 style=\"text-align:center;\">The events after the river flooded</h3>\n<div class=\"flow-chart\">\n<div class=\"flow-box\">Tobin found a human skull.</div>\n<div class=\"flow-arrow\">⬇</div>\n<div class=\"flow-box\">The <a id=\"q5-anchor\"></a><b>5</b> <input class=\"blank\" type=\"text\" name=\"q5\"> were initially involved in trying to explain the presence of the skull.</div>\n<div class=\"flow-arrow\">⬇</div>\n<div class=\"flow-box\">Dr Ferris believed the skull belonged to a female.</div>\n<div class=\"flow-arrow\">⬇</div>\n<div class=\"flow-box\">Dr Koelmeyer suggested it was a <a id=\"q6-anchor\"></a><b>6</b> <input class=\"blank\" type=\"text\" name=\"q6\"> skull.</div>\n<div class=\"flow-arrow\">⬇</div>\n<div class=\"flow-box\">Dr Watt recommended <a id=\"q7-anchor\"></a><b>7</b> <input class=\"blank\" type=\"text\" name=\"q7\"> to establish the skull's age.</div>\n<div class=\"flow-arrow\">⬇</div>\n<div class=\"flow-box\">A bone <a id=\"q8-anchor\"></a><b>8</b> <input class=\"blank\" type=\"text\" name=\"q8\"> was sent to the GNS.</div>\n<div class=\"flow-arrow\">⬇</div>\n<div class=\"flow-box\">The age of the skull was about <a id=\"q9-anchor\"></a><b>9</b> <input class=\"blank\" type=\"text\" name=\"q9\"> years.</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -53,7 +53,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 10–13</h4>\n      <p>Complete the notes below.</p>\n      <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n      \n      <h5>Problem of the skull's origins</h5>\n      <ul class=\"notes-list\">\n        <li>old bones common in New Zealand</li>\n        <li>Maori living there for 800 years</li>\n        <li>Ruamahanga skull surprising because of its\n          <ul style=\"list-style:none; padding-left:15px;\">\n            <li>– age</li>\n            <li>– <a id=\"q10-anchor\"></a><b>10</b> <input class=\"blank\" type=\"text\" name=\"q10\"></li>\n            <li>– gender</li>\n          </ul>\n        </li>\n      </ul>\n\n      <h5>Mendana expedition</h5>\n      <ul class=\"notes-list\">\n        <li>possible source of skull</li>\n        <li>but probably did not visit New Zealand</li>\n        <li>evidence of this expedition found elsewhere by <a id=\"q11-anchor\"></a><b>11</b> <input class=\"blank\" type=\"text\" name=\"q11\"></li>\n      </ul>\n\n      <h5>New Zealand</h5>\n      <ul class=\"notes-list\">\n        <li>first European explorer arrived in 1642</li>\n        <li>Hagerty and Edgar arrived in 1806 from <a id=\"q12-anchor\"></a><b>12</b> <input class=\"blank\" type=\"text\" name=\"q12\">, where they had been imprisoned</li>\n      </ul>\n\n      <h5>Possible solution</h5>\n      <ul class=\"notes-list\">\n        <li>Ruamahanga skull may have reached New Zealand in 17th century after a <a id=\"q13-anchor\"></a><b>13</b> <input class=\"blank\" type=\"text\" name=\"q13\"></li>\n      </ul>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 10–13</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<h5>Problem of the skull's origins</h5>\n<ul class=\"notes-list\">\n<li>old bones common in New Zealand</li>\n<li>Maori living there for 800 years</li>\n<li>Ruamahanga skull surprising because of its\n<ul style=\"list-style:none; padding-left:15px;\">\n<li>– age</li>\n<li>– <a id=\"q10-anchor\"></a><b>10</b> <input class=\"blank\" type=\"text\" name=\"q10\"></li>\n<li>– gender</li>\n</ul>\n</li>\n</ul>\n<h5>Mendana expedition</h5>\n<ul class=\"notes-list\">\n<li>possible source of skull</li>\n<li>but probably did not visit New Zealand</li>\n<li>evidence of this expedition found elsewhere by <a id=\"q11-anchor\"></a><b>11</b> <input class=\"blank\" type=\"text\" name=\"q11\"></li>\n</ul>\n<h5>New Zealand</h5>\n<ul class=\"notes-list\">\n<li>first European explorer arrived in 1642</li>\n<li>Hagerty and Edgar arrived in 1806 from <a id=\"q12-anchor\"></a><b>12</b> <input class=\"blank\" type=\"text\" name=\"q12\">, where they had been imprisoned</li>\n</ul>\n<h5>Possible solution</h5>\n<ul class=\"notes-list\">\n<li>Ruamahanga skull may have reached New Zealand in 17th century after a <a id=\"q13-anchor\"></a><b>13</b> <input class=\"blank\" type=\"text\" name=\"q13\"></li>\n</ul>\n</div>"
     }
   ],
   "answerKey": {
@@ -11,7 +11,7 @@
       {
         "blockId": "passage-main",
         "kind": "text",
-        "bodyHtml": "<h2>READING PASSAGE 1</h2>\n    <p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n    \n    <h3>Australia’s cane toad problem</h3>\n    <p><em>How a toad introduced in Australia to control pests has itself become a pest</em></p>\n  \n    <p>In the north of Australia there are many sugar cane plantations, which early in the 20th century were being damaged by a particular pest. This was a species of beetle whose larvae, the infant form of the beetle, lived underground in the soil in the sugar cane fields. The sugar cane plants were weakened or died because their roots were eaten by the larvae. This had serious economic consequences for sugar cane farmers. Modern pesticides were not developed until the 1940s, so farmers had to use what was available at the time. Chemicals like arsenic and copper were used, but these were not only expensive but also stayed in the environment and were poisonous to people, plants and animals. It was generally acknowledged by government, farmers and scientists that cheaper and safer methods of pest control had to be found.</p>\n\n    <p>A promising replacement for copper and arsenic was the use of biological control. Farmers already used some forms of biological pest control in the form of predatory and parasitic wasps and flies, insect-eating birds, and plants from different regions or countries to control pests. Common practice was to release these introduced agents into new environments, the expectation being that they would destroy resident pests. Some species of toad already had successful records as agents of biological control in gardens. For example, in 19th-century France toads were sold to gardeners at markets in Paris to eat insect pests in their gardens. In the early 20th century French sugar cane farmers first took giant toads from South America to control pests in their Caribbean sugar cane plantations. Although there is no evidence that these toads did help to control pests, sugar cane scientists then carried some of these toads from Jamaica and Barbados to Puerto Rico and from there to Hawaii.</p>\n\n    <p>The idea of biological control of pests was not new to Australia. For example, in 1926 there had been a highly successful prevention of the increase of the exotic prickly-pear cactus by the introduction of a moth from Argentina. This success added strength to the argument that biological control was the answer to the sugar cane industry’s pest problems. Accordingly, in the early 1930s a decision was taken to introduce the giant South American toads, which in Australia are now commonly called cane toads, into Australian sugar cane plantations.</p>\n\n    <p>In 1935, an Australian entomologist brought 101 cane toads from Hawaii and released them in sugar cane plantations in the north of Australia. However, over the following years it became clear that the cane toads were a failure. There was a fatal flaw in the plan to use them as a form of biological control. This was that earthbound cane toads were expected to eat the mostly flying adult beetles in order to eliminate the soil-dwelling beetle larvae that ate the roots of the cane sugar plants. This, of course, cane toads could not do.</p>\n\n    <p>Prior to their introduction in Australia, there had been very few opponents and only one made his views public. He was a retired former Chief Entomologist from the state government of New South Wales named Walter Froggatt. He forecast that cane toads might become as great a pest in Australia as rabbits. However, Froggatt’s peers rebuked him and eminent scientists branded his views ‘decidedly pessimistic’. It is estimated that today as many as a hundred million cane toads form a toxic infestation which is slowly spreading throughout the land.</p>\n\n    <p>Cane toads are large, heavily built amphibians. Average-sized adults are 10-15 cm long and weigh more than a kilo. They have large swellings on each shoulder from which they squirt poison when they are threatened. This venom contains 14 different chemicals, but they do not appear to be harmful to humans as no-one has died in Australia from cane toad poison. Until recently there was no understanding of the toxicity of cane toad poison, but it is now clear that freshwater crocodiles, goannas (large lizards) and dingoes (wild dogs) have died after eating cane toads. Cane toads compete with native Australian fauna for food, and eat the eggs and young of ground-nesting birds. As their numbers increase, they are taking over more and more of the land where native Australian fauna live.</p>\n\n    <p>The lesson that can be learned from the introduction of cane toads is important. It is wrong to think that such an awful biological event could not be repeated. In this instance, the catalyst was the overwhelming consensus of support for introducing cane toads to Australia. The error was that there was little or no testing of these biological agents before they were introduced to see what unplanned effects they might have on the environment.</p>\n    \n    <p>&nbsp;</p> <!-- Final padding -->\n  </section>\n\n  <!-- Draggable Divider -->\n  <div id=\"divider\" title=\"Drag to resize\"></div>\n\n  <!-- Right Pane: Questions and Controls -->"
+        "bodyHtml": "<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>Australia’s cane toad problem</h3>\n<p><em>How a toad introduced in Australia to control pests has itself become a pest</em></p>\n<p>In the north of Australia there are many sugar cane plantations, which early in the 20th century were being damaged by a particular pest. This was a species of beetle whose larvae, the infant form of the beetle, lived underground in the soil in the sugar cane fields. The sugar cane plants were weakened or died because their roots were eaten by the larvae. This had serious economic consequences for sugar cane farmers. Modern pesticides were not developed until the 1940s, so farmers had to use what was available at the time. Chemicals like arsenic and copper were used, but these were not only expensive but also stayed in the environment and were poisonous to people, plants and animals. It was generally acknowledged by government, farmers and scientists that cheaper and safer methods of pest control had to be found.</p>\n<p>A promising replacement for copper and arsenic was the use of biological control. Farmers already used some forms of biological pest control in the form of predatory and parasitic wasps and flies, insect-eating birds, and plants from different regions or countries to control pests. Common practice was to release these introduced agents into new environments, the expectation being that they would destroy resident pests. Some species of toad already had successful records as agents of biological control in gardens. For example, in 19th-century France toads were sold to gardeners at markets in Paris to eat insect pests in their gardens. In the early 20th century French sugar cane farmers first took giant toads from South America to control pests in their Caribbean sugar cane plantations. Although there is no evidence that these toads did help to control pests, sugar cane scientists then carried some of these toads from Jamaica and Barbados to Puerto Rico and from there to Hawaii.</p>\n<p>The idea of biological control of pests was not new to Australia. For example, in 1926 there had been a highly successful prevention of the increase of the exotic prickly-pear cactus by the introduction of a moth from Argentina. This success added strength to the argument that biological control was the answer to the sugar cane industry’s pest problems. Accordingly, in the early 1930s a decision was taken to introduce the giant South American toads, which in Australia are now commonly called cane toads, into Australian sugar cane plantations.</p>\n<p>In 1935, an Australian entomologist brought 101 cane toads from Hawaii and released them in sugar cane plantations in the north of Australia. However, over the following years it became clear that the cane toads were a failure. There was a fatal flaw in the plan to use them as a form of biological control. This was that earthbound cane toads were expected to eat the mostly flying adult beetles in order to eliminate the soil-dwelling beetle larvae that ate the roots of the cane sugar plants. This, of course, cane toads could not do.</p>\n<p>Prior to their introduction in Australia, there had been very few opponents and only one made his views public. He was a retired former Chief Entomologist from the state government of New South Wales named Walter Froggatt. He forecast that cane toads might become as great a pest in Australia as rabbits. However, Froggatt’s peers rebuked him and eminent scientists branded his views ‘decidedly pessimistic’. It is estimated that today as many as a hundred million cane toads form a toxic infestation which is slowly spreading throughout the land.</p>\n<p>Cane toads are large, heavily built amphibians. Average-sized adults are 10-15 cm long and weigh more than a kilo. They have large swellings on each shoulder from which they squirt poison when they are threatened. This venom contains 14 different chemicals, but they do not appear to be harmful to humans as no-one has died in Australia from cane toad poison. Until recently there was no understanding of the toxicity of cane toad poison, but it is now clear that freshwater crocodiles, goannas (large lizards) and dingoes (wild dogs) have died after eating cane toads. Cane toads compete with native Australian fauna for food, and eat the eggs and young of ground-nesting birds. As their numbers increase, they are taking over more and more of the land where native Australian fauna live.</p>\n<p>The lesson that can be learned from the introduction of cane toads is important. It is wrong to think that such an awful biological event could not be repeated. In this instance, the catalyst was the overwhelming consensus of support for introducing cane toads to Australia. The error was that there was little or no testing of these biological agents before they were introduced to see what unplanned effects they might have on the environment.</p>\n<p>&nbsp;</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"
       }
     ]
   },
@@ -28,7 +28,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 1–7</h4>\n      <p>Complete the notes below.</p>\n      <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n      \n      <h3>Pest control</h3>\n      \n      <h5>Early 20th-century problems in Australia</h5>\n      <ul class=\"notes-list\">\n        <li>The larvae of a type of <a id=\"q1-anchor\"></a><b>1</b> <input class=\"blank\" type=\"text\" name=\"q1\"> were a serious pest in sugar cane fields.</li>\n        <li>Its larvae ate the <a id=\"q2-anchor\"></a><b>2</b> <input class=\"blank\" type=\"text\" name=\"q2\"> of the plant.</li>\n        <li>Chemical pesticides were unsatisfactory because they were:\n          <ul>\n            <li>– poisonous</li>\n            <li>– <a id=\"q3-anchor\"></a><b>3</b> <input class=\"blank\" type=\"text\" name=\"q3\"></li>\n            <li>– difficult to remove from the ground</li>\n          </ul>\n        </li>\n      </ul>\n\n      <h5>Experiences with biological pest control</h5>\n      <ul class=\"notes-list\">\n        <li>The use of insects, plants and birds was widespread.</li>\n        <li>In the 19th century French <a id=\"q4-anchor\"></a><b>4</b> <input class=\"blank\" type=\"text\" name=\"q4\"> used toads.</li>\n        <li>In Australia a <a id=\"q5-anchor\"></a><b>5</b> <input class=\"blank\" type=\"text\" name=\"q5\"> stopped the spread of prickly-pear cactus.</li>\n        <li>Cane toads were brought to Australia from <a id=\"q6-anchor\"></a><b>6</b> <input class=\"blank\" type=\"text\" name=\"q6\">.</li>\n        <li>Cane toads proved to be a <a id=\"q7-anchor\"></a><b>7</b> <input class=\"blank\" type=\"text\" name=\"q7\"> as pest control.</li>\n      </ul>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 1–7</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<h3>Pest control</h3>\n<h5>Early 20th-century problems in Australia</h5>\n<ul class=\"notes-list\">\n<li>The larvae of a type of <a id=\"q1-anchor\"></a><b>1</b> <input class=\"blank\" type=\"text\" name=\"q1\"> were a serious pest in sugar cane fields.</li>\n<li>Its larvae ate the <a id=\"q2-anchor\"></a><b>2</b> <input class=\"blank\" type=\"text\" name=\"q2\"> of the plant.</li>\n<li>Chemical pesticides were unsatisfactory because they were:\n<ul>\n<li>– poisonous</li>\n<li>– <a id=\"q3-anchor\"></a><b>3</b> <input class=\"blank\" type=\"text\" name=\"q3\"></li>\n<li>– difficult to remove from the ground</li>\n</ul>\n</li>\n</ul>\n<h5>Experiences with biological pest control</h5>\n<ul class=\"notes-list\">\n<li>The use of insects, plants and birds was widespread.</li>\n<li>In the 19th century French <a id=\"q4-anchor\"></a><b>4</b> <input class=\"blank\" type=\"text\" name=\"q4\"> used toads.</li>\n<li>In Australia a <a id=\"q5-anchor\"></a><b>5</b> <input class=\"blank\" type=\"text\" name=\"q5\"> stopped the spread of prickly-pear cactus.</li>\n<li>Cane toads were brought to Australia from <a id=\"q6-anchor\"></a><b>6</b> <input class=\"blank\" type=\"text\" name=\"q6\">.</li>\n<li>Cane toads proved to be a <a id=\"q7-anchor\"></a><b>7</b> <input class=\"blank\" type=\"text\" name=\"q7\"> as pest control.</li>\n</ul>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -41,7 +41,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 8–13</h4>\n      <p>Do the following statements agree with the information given in Reading Passage 1?</p>\n      <p><em>In boxes 8–13 on your answer sheet, write</em></p>\n      <ul style=\"list-style:none; padding-left:0; font-weight:bold; font-size:0.9em;\">\n        <li>TRUE <span style=\"font-weight:normal; margin-left:45px;\">if the statement agrees with the information</span></li>\n        <li>FALSE <span style=\"font-weight:normal; margin-left:38px;\">if the statement contradicts the information</span></li>\n        <li>NOT GIVEN <span style=\"font-weight:normal; margin-left:8px;\">if there is no information on this</span></li>\n      </ul>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q8-anchor\"></a><b>8</b> The outcome of the introduction of cane toads was immediately obvious.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q8\" value=\"true\"> True</label>\n            <label><input type=\"radio\" name=\"q8\" value=\"false\"> False</label>\n            <label><input type=\"radio\" name=\"q8\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q9-anchor\"></a><b>9</b> Rabbits were introduced to Australia to control weeds.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q9\" value=\"true\"> True</label>\n            <label><input type=\"radio\" name=\"q9\" value=\"false\"> False</label>\n            <label><input type=\"radio\" name=\"q9\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q10-anchor\"></a><b>10</b> Walter Froggatt was criticised for his efforts to stop the introduction of the cane toad to Australia.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q10\" value=\"true\"> True</label>\n            <label><input type=\"radio\" name=\"q10\" value=\"false\"> False</label>\n            <label><input type=\"radio\" name=\"q10\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q11-anchor\"></a><b>11</b> The average size of cane toads has increased since their introduction.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q11\" value=\"true\"> True</label>\n            <label><input type=\"radio\" name=\"q11\" value=\"false\"> False</label>\n            <label><input type=\"radio\" name=\"q11\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q12-anchor\"></a><b>12</b> Australian animals can eat cane toads safely.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q12\" value=\"true\"> True</label>\n            <label><input type=\"radio\" name=\"q12\" value=\"false\"> False</label>\n            <label><input type=\"radio\" name=\"q12\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q13-anchor\"></a><b>13</b> In many places cane toads are gaining control of the habitats of Australian fauna.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q13\" value=\"true\"> True</label>\n            <label><input type=\"radio\" name=\"q13\" value=\"false\"> False</label>\n            <label><input type=\"radio\" name=\"q13\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 8–13</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p><em>In boxes 8–13 on your answer sheet, write</em></p>\n<ul style=\"list-style:none; padding-left:0; font-weight:bold; font-size:0.9em;\">\n<li>TRUE <span style=\"font-weight:normal; margin-left:45px;\">if the statement agrees with the information</span></li>\n<li>FALSE <span style=\"font-weight:normal; margin-left:38px;\">if the statement contradicts the information</span></li>\n<li>NOT GIVEN <span style=\"font-weight:normal; margin-left:8px;\">if there is no information on this</span></li>\n</ul>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q8-anchor\"></a><b>8</b> The outcome of the introduction of cane toads was immediately obvious.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q8\" value=\"true\"> True</label> <label><input type=\"radio\" name=\"q8\" value=\"false\"> False</label> <label><input type=\"radio\" name=\"q8\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q9-anchor\"></a><b>9</b> Rabbits were introduced to Australia to control weeds.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q9\" value=\"true\"> True</label> <label><input type=\"radio\" name=\"q9\" value=\"false\"> False</label> <label><input type=\"radio\" name=\"q9\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q10-anchor\"></a><b>10</b> Walter Froggatt was criticised for his efforts to stop the introduction of the cane toad to Australia.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q10\" value=\"true\"> True</label> <label><input type=\"radio\" name=\"q10\" value=\"false\"> False</label> <label><input type=\"radio\" name=\"q10\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q11-anchor\"></a><b>11</b> The average size of cane toads has increased since their introduction.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q11\" value=\"true\"> True</label> <label><input type=\"radio\" name=\"q11\" value=\"false\"> False</label> <label><input type=\"radio\" name=\"q11\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q12-anchor\"></a><b>12</b> Australian animals can eat cane toads safely.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q12\" value=\"true\"> True</label> <label><input type=\"radio\" name=\"q12\" value=\"false\"> False</label> <label><input type=\"radio\" name=\"q12\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q13-anchor\"></a><b>13</b> In many places cane toads are gaining control of the habitats of Australian fauna.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q13\" value=\"true\"> True</label> <label><input type=\"radio\" name=\"q13\" value=\"false\"> False</label> <label><input type=\"radio\" name=\"q13\" value=\"not given\"> NG</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -37,7 +37,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 1-7</h4><p>Do the following statements agree with the information given in Reading Passage 1?</p><p>In boxes 1-7 on your answer sheet, write TRUE, FALSE or NOT GIVEN.</p>\n<div class=\"question-item\" id=\"q1-anchor\">\n<p><strong>1</strong> The amount of research on giraffes in their natural environment has increased lately.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n<label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n<label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q2-anchor\">\n<p><strong>2</strong> Megan Strauss disapproves of keeping giraffes in zoos.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n<label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n<label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q3-anchor\">\n<p><strong>3</strong> The number of giraffes in Africa has nearly doubled.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n<label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n<label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q4-anchor\">\n<p><strong>4</strong> Female giraffes tend to live longer than males.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n<label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n<label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q5-anchor\">\n<p><strong>5</strong> Mother giraffes sometimes use their legs to defend their young.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n<label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n<label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q6-anchor\">\n<p><strong>6</strong> Younger bulls hold their necks higher in the presence of more powerful males.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n<label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n<label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q7-anchor\">\n<p><strong>7</strong> Male giraffes have been observed fighting.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n<label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n<label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div></div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 1-7</h4><p>Do the following statements agree with the information given in Reading Passage 1?</p><p>In boxes 1-7 on your answer sheet, write TRUE, FALSE or NOT GIVEN.</p>\n<div class=\"question-item\" id=\"q1-anchor\">\n<p><strong>1</strong> The amount of research on giraffes in their natural environment has increased lately.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q2-anchor\">\n<p><strong>2</strong> Megan Strauss disapproves of keeping giraffes in zoos.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q3-anchor\">\n<p><strong>3</strong> The number of giraffes in Africa has nearly doubled.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q4-anchor\">\n<p><strong>4</strong> Female giraffes tend to live longer than males.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q5-anchor\">\n<p><strong>5</strong> Mother giraffes sometimes use their legs to defend their young.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q6-anchor\">\n<p><strong>6</strong> Younger bulls hold their necks higher in the presence of more powerful males.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q7-anchor\">\n<p><strong>7</strong> Male giraffes have been observed fighting.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div></div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -51,7 +51,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-11-12-13-anchor\"><h4>Questions 7-13</h4><p>Do the following statements agree with the information given in Reading Passage 1?</p><p>In boxes 7-13 on your answer sheet, write TRUE, FALSE or NOT GIVEN.</p><div class=\"question-item\" id=\"q7-anchor\">\n<p><strong>7</strong> The Italians were the first to make pencils out of wood.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n<label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n<label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q8-anchor\">\n<p><strong>8</strong> The Germans used different types of wood to produce pencils.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n<label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n<label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q9-anchor\">\n<p><strong>9</strong> More clay in a pencil makes it write more darkly.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n<label><input name=\"q9\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n<label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q10-anchor\">\n<p><strong>10</strong> After the HB code was introduced, it very quickly became used by all manufacturers.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n<label><input name=\"q10\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n<label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q11-anchor\">\n<p><strong>11</strong> English pencil factories have now all closed down.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n<label><input name=\"q11\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n<label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q12-anchor\">\n<p><strong>12</strong> American astronauts used pencils on their early journeys into space.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n<label><input name=\"q12\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n<label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q13-anchor\">\n<p><strong>13</strong> The use of graphite pencils is unlikely to continue into the future.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n<label><input name=\"q13\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n<label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div></div>"
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-11-12-13-anchor\"><h4>Questions 7-13</h4><p>Do the following statements agree with the information given in Reading Passage 1?</p><p>In boxes 7-13 on your answer sheet, write TRUE, FALSE or NOT GIVEN.</p><div class=\"question-item\" id=\"q7-anchor\">\n<p><strong>7</strong> The Italians were the first to make pencils out of wood.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q8-anchor\">\n<p><strong>8</strong> The Germans used different types of wood to produce pencils.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q9-anchor\">\n<p><strong>9</strong> More clay in a pencil makes it write more darkly.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q9\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q10-anchor\">\n<p><strong>10</strong> After the HB code was introduced, it very quickly became used by all manufacturers.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q10\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q11-anchor\">\n<p><strong>11</strong> English pencil factories have now all closed down.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q11\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q12-anchor\">\n<p><strong>12</strong> American astronauts used pencils on their early journeys into space.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q12\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q13-anchor\">\n<p><strong>13</strong> The use of graphite pencils is unlikely to continue into the future.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q13\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div></div>"
     }
   ],
   "answerKey": {
@@ -46,7 +46,7 @@
         "q7",
         "q8"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q4-5-6-7-8-anchor\"><h4>Questions 4-8</h4><p>Do the following statements agree with the information given in Reading Passage 1?</p><p>In boxes 4-8 on your answer sheet, write TRUE, FALSE or NOT GIVEN.</p><div class=\"question-item\" id=\"q4-anchor\">\n<p><strong>4</strong> Borrowdale graphite was superior to all other forms of graphite.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n<label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n<label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q5-anchor\">\n<p><strong>5</strong> Pencil production in the Borrowdale area only lasted until the 1860s.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n<label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n<label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q6-anchor\">\n<p><strong>6</strong> The Cumberland pencil museum contains examples of pencils from different European countries.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n<label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n<label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q7-anchor\">\n<p><strong>7</strong> A technique which improved on the Bernacottis’ method of making pencils is still used now.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n<label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n<label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q8-anchor\">\n<p><strong>8</strong> In 1662, manufacturers in Nuremberg made pencils with graphite imported from England.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n<label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n<label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div></div>"
+      "bodyHtml": "<div class=\"group\" id=\"q4-5-6-7-8-anchor\"><h4>Questions 4-8</h4><p>Do the following statements agree with the information given in Reading Passage 1?</p><p>In boxes 4-8 on your answer sheet, write TRUE, FALSE or NOT GIVEN.</p><div class=\"question-item\" id=\"q4-anchor\">\n<p><strong>4</strong> Borrowdale graphite was superior to all other forms of graphite.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q5-anchor\">\n<p><strong>5</strong> Pencil production in the Borrowdale area only lasted until the 1860s.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q6-anchor\">\n<p><strong>6</strong> The Cumberland pencil museum contains examples of pencils from different European countries.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q7-anchor\">\n<p><strong>7</strong> A technique which improved on the Bernacottis’ method of making pencils is still used now.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q8-anchor\">\n<p><strong>8</strong> In 1662, manufacturers in Nuremberg made pencils with graphite imported from England.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div></div>"
     },
     {
       "groupId": "group-3",
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 1</h2>\n            <p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n            \n            <h3>The Importance of Business Cards</h3>\n            <p><i>The exchange of business cards is as close to a universal ritual as you can find in the business world.</i></p>\n            <p>The ritual may be universal, but the details of business cards and how they are swapped vary across countries. Americans throw their cards casually across a table; the Japanese make the exchange of cards a formal ceremony. While there are cards that are discreet and understated, others are crammed full of details and titles. Some businesspeople hand out 24-carat gold cards, and there are kindergarten children who have cards with not only their own contact details, but also with the job descriptions of their parents and even grandparents. This practice has become so common in parts of New York, for example, that the use of such cards is now prohibited by some of these institutions.</p>\n            <p>Cards have been around a long time in one form or another. The Chinese invented calling cards in the 15th century to give people notice that they intended to pay them a visit, but these were for social purposes only. Then, in the 17th century, European businesspeople invented a new type of card to act as miniature advertisements, signalling the advent of the business card. In today's world, business cards can cause people to have strong emotional reactions. According to one experienced company director, very few things can provoke more heated discussion at a board meeting than the composition of the company's business cards.</p>\n            <p>Lots of companies try to promote themselves by altering the form of the card. Employees at one famous toy company give out little plastic figures with their contact details stamped on them. One fast-food company has business cards which are shaped like a portion of French fries. A Canadian divorce lawyer once gave out cards that could be torn in two one half for each of the spouses. For many business commentators, such gimmicky business cards prove that the use of a physical business card is nearly at an end. After all, why bother exchanging bits of thick paper at all when you can simply swap electronic versions by smartphone?</p>\n            <p>However, one can just as well argue the opposite: that business cards are here to stay, and, in a business world full of meetings and correspondence, it is more important than ever that your card is unique. Attempts to reinvent business cards for the digital age have not been successful. Even at the latest technology conferences, people still greet each other by handing out little rectangles made from paper rather than using a digital alternative.</p>\n            <p>To understand business cards, it is necessary to understand how business works. That business cards are thriving in a digital age is a forceful reminder that there is much about business that is timeless. According to Kate Jones, a business lecturer, there is one eternal and inescapable issue. Her 2006 study of more than 200 business executives in North America found that trust was the key element for running a successful business. It is vital to be able to look someone in the eye and decide what sort of person they are. In this way, you can transform acquaintanceships into relationships. A good proportion of business life will always be about building social connections – having dinner or playing sport with clients and colleagues – and while computers can deal with administrative tasks, it is still human beings that have to focus on the emotional.</p>\n            <p>The rapid advance of globalisation means that this relationship-building process is becoming ever more demanding. Managers have to put more effort in when dealing with international counterparts, especially when there is not a common language, which is so often the case these days. A recent UK survey showed that chief executives of global organisations now routinely spend three out of every four weeks on international travel. It is in these situations that business cards are doubly useful, as they are a quick way of establishing connections. Cards can also remind you that you have actually met someone in a face-to-face meeting rather than just searched for them on the Internet. Looking through piles of different cards can enhance your memory in ways that simply looking through uniform electronic lists would never do.</p>\n            <p>Janet McIntyre is a leading expert on business cards in today's world. She maintains that as companies become more complex, cards are essential in determining the exact status of every contact you meet in multinational corporations. Janet also explains how exchanging business cards can be an effective way of initiating a conversation, because it gives people a ritual to follow when they first meet a new business contact.</p>\n            <p>The business world is obsessed with the idea of creating and inventing new things that will change the way we do everything, and this does lead to progress. But there are lots of things that do not need to be changed and, in Janet McIntyre's view, tradition also has an equally valuable role to play. Therefore the practice of exchanging business cards is likely to continue in the business world.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>The Importance of Business Cards</h3>\n<p><i>The exchange of business cards is as close to a universal ritual as you can find in the business world.</i></p>\n<p>The ritual may be universal, but the details of business cards and how they are swapped vary across countries. Americans throw their cards casually across a table; the Japanese make the exchange of cards a formal ceremony. While there are cards that are discreet and understated, others are crammed full of details and titles. Some businesspeople hand out 24-carat gold cards, and there are kindergarten children who have cards with not only their own contact details, but also with the job descriptions of their parents and even grandparents. This practice has become so common in parts of New York, for example, that the use of such cards is now prohibited by some of these institutions.</p>\n<p>Cards have been around a long time in one form or another. The Chinese invented calling cards in the 15th century to give people notice that they intended to pay them a visit, but these were for social purposes only. Then, in the 17th century, European businesspeople invented a new type of card to act as miniature advertisements, signalling the advent of the business card. In today's world, business cards can cause people to have strong emotional reactions. According to one experienced company director, very few things can provoke more heated discussion at a board meeting than the composition of the company's business cards.</p>\n<p>Lots of companies try to promote themselves by altering the form of the card. Employees at one famous toy company give out little plastic figures with their contact details stamped on them. One fast-food company has business cards which are shaped like a portion of French fries. A Canadian divorce lawyer once gave out cards that could be torn in two one half for each of the spouses. For many business commentators, such gimmicky business cards prove that the use of a physical business card is nearly at an end. After all, why bother exchanging bits of thick paper at all when you can simply swap electronic versions by smartphone?</p>\n<p>However, one can just as well argue the opposite: that business cards are here to stay, and, in a business world full of meetings and correspondence, it is more important than ever that your card is unique. Attempts to reinvent business cards for the digital age have not been successful. Even at the latest technology conferences, people still greet each other by handing out little rectangles made from paper rather than using a digital alternative.</p>\n<p>To understand business cards, it is necessary to understand how business works. That business cards are thriving in a digital age is a forceful reminder that there is much about business that is timeless. According to Kate Jones, a business lecturer, there is one eternal and inescapable issue. Her 2006 study of more than 200 business executives in North America found that trust was the key element for running a successful business. It is vital to be able to look someone in the eye and decide what sort of person they are. In this way, you can transform acquaintanceships into relationships. A good proportion of business life will always be about building social connections – having dinner or playing sport with clients and colleagues – and while computers can deal with administrative tasks, it is still human beings that have to focus on the emotional.</p>\n<p>The rapid advance of globalisation means that this relationship-building process is becoming ever more demanding. Managers have to put more effort in when dealing with international counterparts, especially when there is not a common language, which is so often the case these days. A recent UK survey showed that chief executives of global organisations now routinely spend three out of every four weeks on international travel. It is in these situations that business cards are doubly useful, as they are a quick way of establishing connections. Cards can also remind you that you have actually met someone in a face-to-face meeting rather than just searched for them on the Internet. Looking through piles of different cards can enhance your memory in ways that simply looking through uniform electronic lists would never do.</p>\n<p>Janet McIntyre is a leading expert on business cards in today's world. She maintains that as companies become more complex, cards are essential in determining the exact status of every contact you meet in multinational corporations. Janet also explains how exchanging business cards can be an effective way of initiating a conversation, because it gives people a ritual to follow when they first meet a new business contact.</p>\n<p>The business world is obsessed with the idea of creating and inventing new things that will change the way we do everything, and this does lead to progress. But there are lots of things that do not need to be changed and, in Janet McIntyre's view, tradition also has an equally valuable role to play. Therefore the practice of exchanging business cards is likely to continue in the business world.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 1–5</h4>\n                <p>Do the following statements agree with the information given in Reading Passage 1?</p>\n                <p>\n                    <strong>TRUE</strong> if the statement agrees with the information<br>\n                    <strong>FALSE</strong> if the statement contradicts the information<br>\n                    <strong>NOT GIVEN</strong> if there is no information on this\n                </p>\n                <div class=\"question-item\">\n                    <p><strong>1</strong> Children's business cards have been banned in some kindergartens.</p>\n                    <div class=\"tfng-options\">\n                        <label><input type=\"radio\" name=\"q1\" value=\"TRUE\"> TRUE</label>\n                        <label><input type=\"radio\" name=\"q1\" value=\"FALSE\"> FALSE</label>\n                        <label><input type=\"radio\" name=\"q1\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>2</strong> It was the Chinese who first began the practice of using business cards.</p>\n                    <div class=\"tfng-options\">\n                        <label><input type=\"radio\" name=\"q2\" value=\"TRUE\"> TRUE</label>\n                        <label><input type=\"radio\" name=\"q2\" value=\"FALSE\"> FALSE</label>\n                        <label><input type=\"radio\" name=\"q2\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>3</strong> Designing business cards can be a controversial process for some companies.</p>\n                    <div class=\"tfng-options\">\n                        <label><input type=\"radio\" name=\"q3\" value=\"TRUE\"> TRUE</label>\n                        <label><input type=\"radio\" name=\"q3\" value=\"FALSE\"> FALSE</label>\n                        <label><input type=\"radio\" name=\"q3\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>4</strong> A famous toy company has boosted its sales by using one type of unusual business card.</p>\n                    <div class=\"tfng-options\">\n                        <label><input type=\"radio\" name=\"q4\" value=\"TRUE\"> TRUE</label>\n                        <label><input type=\"radio\" name=\"q4\" value=\"FALSE\"> FALSE</label>\n                        <label><input type=\"radio\" name=\"q4\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>5</strong> Some business commentators predict a decline in the use of paper business cards.</p>\n                    <div class=\"tfng-options\">\n                        <label><input type=\"radio\" name=\"q5\" value=\"TRUE\"> TRUE</label>\n                        <label><input type=\"radio\" name=\"q5\" value=\"FALSE\"> FALSE</label>\n                        <label><input type=\"radio\" name=\"q5\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 1–5</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>\n<strong>TRUE</strong> if the statement agrees with the information<br>\n<strong>FALSE</strong> if the statement contradicts the information<br>\n<strong>NOT GIVEN</strong> if there is no information on this\n</p>\n<div class=\"question-item\">\n<p><strong>1</strong> Children's business cards have been banned in some kindergartens.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q1\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q1\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q1\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> It was the Chinese who first began the practice of using business cards.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q2\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q2\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q2\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> Designing business cards can be a controversial process for some companies.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q3\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q3\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q3\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> A famous toy company has boosted its sales by using one type of unusual business card.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q4\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q4\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q4\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> Some business commentators predict a decline in the use of paper business cards.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q5\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q5\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q5\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -51,7 +51,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-10-11-12-13-anchor\">\n                <h4>Questions 6–13</h4>\n                <p>Complete the notes below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                <div class=\"notes-completion\">\n                    <h4>How business works</h4>\n                    <ul>\n                        <li><strong>Kate Jones's research</strong>\n                            <ul>\n                                <li>The most important aspect of business is having <strong>6</strong> <input name=\"q6\" type=\"text\" class=\"blank\" id=\"q6_input\"> in others.</li>\n                                <li><strong>7</strong> <input name=\"q7\" type=\"text\" class=\"blank\" id=\"q7_input\"> do not have the ability to establish the good relationships essential to business.</li>\n                            </ul>\n                        </li>\n                        <li><strong>Business and globalisation</strong>\n                            <ul>\n                                <li>Managers must work harder when they don't share the same <strong>8</strong> <input name=\"q8\" type=\"text\" class=\"blank\" id=\"q8_input\"> with their contacts.</li>\n                                <li>A UK survey indicates that <strong>9</strong> <input name=\"q9\" type=\"text\" class=\"blank\" id=\"q9_input\"> takes up the largest part of business leaders' time.</li>\n                                <li>A business person's <strong>10</strong> <input name=\"q10\" type=\"text\" class=\"blank\" id=\"q10_input\"> of a meeting can be improved by looking at business cards.</li>\n                            </ul>\n                        </li>\n                         <li><strong>Janet McIntyre</strong>\n                            <ul>\n                                <li>Business cards clearly show the <strong>11</strong> <input name=\"q11\" type=\"text\" class=\"blank\" id=\"q11_input\"> of each person in a large company.</li>\n                                <li>The ritual of swapping business cards is a good way of starting a <strong>12</strong> <input name=\"q12\" type=\"text\" class=\"blank\" id=\"q12_input\"> at the beginning of a business relationship.</li>\n                                <li>Janet feels that in the business world, <strong>13</strong> <input name=\"q13\" type=\"text\" class=\"blank\" id=\"q13_input\"> is just as important as innovation.</li>\n                            </ul>\n                        </li>\n                    </ul>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-10-11-12-13-anchor\">\n<h4>Questions 6–13</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>How business works</h4>\n<ul>\n<li><strong>Kate Jones's research</strong>\n<ul>\n<li>The most important aspect of business is having <strong>6</strong> <input name=\"q6\" type=\"text\" class=\"blank\" id=\"q6_input\"> in others.</li>\n<li><strong>7</strong> <input name=\"q7\" type=\"text\" class=\"blank\" id=\"q7_input\"> do not have the ability to establish the good relationships essential to business.</li>\n</ul>\n</li>\n<li><strong>Business and globalisation</strong>\n<ul>\n<li>Managers must work harder when they don't share the same <strong>8</strong> <input name=\"q8\" type=\"text\" class=\"blank\" id=\"q8_input\"> with their contacts.</li>\n<li>A UK survey indicates that <strong>9</strong> <input name=\"q9\" type=\"text\" class=\"blank\" id=\"q9_input\"> takes up the largest part of business leaders' time.</li>\n<li>A business person's <strong>10</strong> <input name=\"q10\" type=\"text\" class=\"blank\" id=\"q10_input\"> of a meeting can be improved by looking at business cards.</li>\n</ul>\n</li>\n<li><strong>Janet McIntyre</strong>\n<ul>\n<li>Business cards clearly show the <strong>11</strong> <input name=\"q11\" type=\"text\" class=\"blank\" id=\"q11_input\"> of each person in a large company.</li>\n<li>The ritual of swapping business cards is a good way of starting a <strong>12</strong> <input name=\"q12\" type=\"text\" class=\"blank\" id=\"q12_input\"> at the beginning of a business relationship.</li>\n<li>Janet feels that in the business world, <strong>13</strong> <input name=\"q13\" type=\"text\" class=\"blank\" id=\"q13_input\"> is just as important as innovation.</li>\n</ul>\n</li>\n</ul>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 1</h2>\n            <p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n            \n            <h3>The Nature of Yawning</h3>\n            \n            <p id=\"para-A\"><strong>A</strong> While fatigue, drowsiness or boredom easily bring on yawns, scientists are discovering there is more to yawning than most people think. Not much is known about why we yawn or if it serves any useful function. People have already learned that yawning can be infectious. “Contagious yawning” is the increase in likelihood that you will yawn after watching or hearing someone else yawn, but not much is known about the underlying causes, and very little research has been done on the subject. However, scientists at the University at Albany, as well as the University of Leeds and the University of London, have done some exploration.</p>\n            <p id=\"para-B\"><strong>B</strong> It is commonly believed that people yawn as a result of being sleepy or tired or because they need oxygen. However, the latest research shows that a yawn can help cool the brain and help it work more effectively, which is quite different from the popular belief that yawning promotes sleep and is a sign of tiredness. Dr Andrew Gallup and his colleagues at the University at Albany in New York State said their experiments on 44 students showed that raising or lowering oxygen and carbon-dioxide levels in the blood did not produce that reaction. In the study, participants were shown videos of people laughing and yawning, and researchers counted how many times the volunteers responded to the “contagious yawns.” The researchers found that those who breathed through the nose rather than the mouth were less likely to yawn when watching a video of other people yawning. The same effect was found among those who held a cool pack to their forehead, whereas those who held a warm pack yawned more while watching the video. Since yawning occurs when brain temperature rises, sending cool blood to the brain serves to maintain optimal levels of mental efficiency.</p>\n            <p id=\"para-C\"><strong>C</strong> Yawning is universal to humans and many animals. Cats, dogs and fish yawn just like humans do, but they yawn spontaneously. Only humans and chimpanzees, our closest relatives in the animal kingdom, have shown definite contagious yawning. Though much of yawning is due to suggestibility, sometimes people do not need to actually see a person yawn to involuntarily yawn themselves: hearing someone yawning or even reading about yawning can cause the same reaction.</p>\n            <p id=\"para-D\"><strong>D</strong> However, contagious yawning goes beyond mere suggestibility. Recent studies show that contagious yawning is also related to our predisposition toward empathy — the ability to understand and connect with others' emotional states. So empathy is important, sure, but how could it possibly be related to contagious yawning? Psychologists at Leeds University in England set out to answer that. In their study, researchers selected 40 psychology students and 40 engineering students. Generally, psychology students are more likely to feel empathy for others, while engineering students are thought to be concerned with objects and science. Each student was made to wait individually in a waiting room along with an undercover assistant who yawned ten times in as many minutes. The students were then given an emotional-quotient test: they were shown 40 images of eyes and asked what emotion each one displayed. The results support the idea that contagious yawning is linked to empathy. The psychology students, whose future profession requires them to focus on others, yawned contagiously an average of 5.5 times in the waiting room and scored 28 out of 40 on the emotional test. The engineering students, who tend to focus on numbers and systems, yawned an average of 1.5 times and scored 25.5 out of 40. The difference does not sound large, but researchers consider it significant. Strangely enough, women — generally viewed as more emotionally attuned — did not score any higher than men.</p>\n            <p id=\"para-E\"><strong>E</strong> Another study, led by Atsushi Senju, a cognitive researcher at the University of London, also sought to answer that question. People with autism spectrum disorder are considered to be developmentally impaired emotionally: they have trouble connecting with others and find it difficult to feel empathy. Since autistics have difficulty feeling empathy, they should not be susceptible to contagious yawning. To find out, Senju and his colleagues placed 49 children aged 7 to 15 in a room with a television. Twenty-four of the subjects had been diagnosed with autism spectrum disorder; the other 25 were non-autistic. The children were shown short clips of people yawning as well as clips of people opening their mouths but not yawning. While the kids with autism showed the same lack of reaction to both kinds of clips, the non-autistic kids yawned more after the clips of people yawning.</p>\n            <p id=\"para-F\"><strong>F</strong> There have also been studies suggesting that yawning, especially psychological “contagious” yawning, may have developed as a way of keeping a group of animals alert and bonding members of a group into a more unified one. If an animal is drowsy or bored, it may not be as alert as it should be to spring into action, and its yawning is practically saying, “Hey, I need some rest; you stay awake.” Therefore, a contagious yawn could be an instinctual reaction to a signal from one member of the herd reminding the others to stay alert when danger comes. Thus, the theory provides evidence that yawning comes from the evolution of early humans who needed to be ready to physically exert themselves at any given moment.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>The Nature of Yawning</h3>\n<p id=\"para-A\"><strong>A</strong> While fatigue, drowsiness or boredom easily bring on yawns, scientists are discovering there is more to yawning than most people think. Not much is known about why we yawn or if it serves any useful function. People have already learned that yawning can be infectious. “Contagious yawning” is the increase in likelihood that you will yawn after watching or hearing someone else yawn, but not much is known about the underlying causes, and very little research has been done on the subject. However, scientists at the University at Albany, as well as the University of Leeds and the University of London, have done some exploration.</p>\n<p id=\"para-B\"><strong>B</strong> It is commonly believed that people yawn as a result of being sleepy or tired or because they need oxygen. However, the latest research shows that a yawn can help cool the brain and help it work more effectively, which is quite different from the popular belief that yawning promotes sleep and is a sign of tiredness. Dr Andrew Gallup and his colleagues at the University at Albany in New York State said their experiments on 44 students showed that raising or lowering oxygen and carbon-dioxide levels in the blood did not produce that reaction. In the study, participants were shown videos of people laughing and yawning, and researchers counted how many times the volunteers responded to the “contagious yawns.” The researchers found that those who breathed through the nose rather than the mouth were less likely to yawn when watching a video of other people yawning. The same effect was found among those who held a cool pack to their forehead, whereas those who held a warm pack yawned more while watching the video. Since yawning occurs when brain temperature rises, sending cool blood to the brain serves to maintain optimal levels of mental efficiency.</p>\n<p id=\"para-C\"><strong>C</strong> Yawning is universal to humans and many animals. Cats, dogs and fish yawn just like humans do, but they yawn spontaneously. Only humans and chimpanzees, our closest relatives in the animal kingdom, have shown definite contagious yawning. Though much of yawning is due to suggestibility, sometimes people do not need to actually see a person yawn to involuntarily yawn themselves: hearing someone yawning or even reading about yawning can cause the same reaction.</p>\n<p id=\"para-D\"><strong>D</strong> However, contagious yawning goes beyond mere suggestibility. Recent studies show that contagious yawning is also related to our predisposition toward empathy — the ability to understand and connect with others' emotional states. So empathy is important, sure, but how could it possibly be related to contagious yawning? Psychologists at Leeds University in England set out to answer that. In their study, researchers selected 40 psychology students and 40 engineering students. Generally, psychology students are more likely to feel empathy for others, while engineering students are thought to be concerned with objects and science. Each student was made to wait individually in a waiting room along with an undercover assistant who yawned ten times in as many minutes. The students were then given an emotional-quotient test: they were shown 40 images of eyes and asked what emotion each one displayed. The results support the idea that contagious yawning is linked to empathy. The psychology students, whose future profession requires them to focus on others, yawned contagiously an average of 5.5 times in the waiting room and scored 28 out of 40 on the emotional test. The engineering students, who tend to focus on numbers and systems, yawned an average of 1.5 times and scored 25.5 out of 40. The difference does not sound large, but researchers consider it significant. Strangely enough, women — generally viewed as more emotionally attuned — did not score any higher than men.</p>\n<p id=\"para-E\"><strong>E</strong> Another study, led by Atsushi Senju, a cognitive researcher at the University of London, also sought to answer that question. People with autism spectrum disorder are considered to be developmentally impaired emotionally: they have trouble connecting with others and find it difficult to feel empathy. Since autistics have difficulty feeling empathy, they should not be susceptible to contagious yawning. To find out, Senju and his colleagues placed 49 children aged 7 to 15 in a room with a television. Twenty-four of the subjects had been diagnosed with autism spectrum disorder; the other 25 were non-autistic. The children were shown short clips of people yawning as well as clips of people opening their mouths but not yawning. While the kids with autism showed the same lack of reaction to both kinds of clips, the non-autistic kids yawned more after the clips of people yawning.</p>\n<p id=\"para-F\"><strong>F</strong> There have also been studies suggesting that yawning, especially psychological “contagious” yawning, may have developed as a way of keeping a group of animals alert and bonding members of a group into a more unified one. If an animal is drowsy or bored, it may not be as alert as it should be to spring into action, and its yawning is practically saying, “Hey, I need some rest; you stay awake.” Therefore, a contagious yawn could be an instinctual reaction to a signal from one member of the herd reminding the others to stay alert when danger comes. Thus, the theory provides evidence that yawning comes from the evolution of early humans who needed to be ready to physically exert themselves at any given moment.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 1–5</h4>\n                <p>Reading Passage 1 has six paragraphs, <strong>A–F</strong>.</p>\n                <p>Which paragraph contains the following information?</p>\n                <p><em>Write the correct letter, <strong>A–F</strong>, in boxes 1–5 on your answer sheet. You may use any letter more than once.</em></p>\n                <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                        <thead>\n                            <tr>\n                                <th></th>\n                                <th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>1</strong> Humans' imaginations can cause yawning.</td>\n                                <td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>2</strong> Research shows that yawning is closely related to occupations.</td>\n                                <td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>3</strong> An overview of the latest research on yawning.</td>\n                                <td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>4</strong> Yawning is used to regulate brain temperature.</td>\n                                <td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>5</strong> Scientists discovered some evidence disproving the earlier understanding of yawning.</td>\n                                <td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td>\n                            </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 1–5</h4>\n<p>Reading Passage 1 has six paragraphs, <strong>A–F</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–F</strong>, in boxes 1–5 on your answer sheet. You may use any letter more than once.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>1</strong> Humans' imaginations can cause yawning.</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>2</strong> Research shows that yawning is closely related to occupations.</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>3</strong> An overview of the latest research on yawning.</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>4</strong> Yawning is used to regulate brain temperature.</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>5</strong> Scientists discovered some evidence disproving the earlier understanding of yawning.</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n                <h4>Questions 6–9</h4>\n                <p>Match each of the following research results with the university from which it comes.</p>\n                <p><em>You may use any letter more than once.</em></p>\n                 <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                         <thead>\n                            <tr>\n                                <th></th>\n                                <th>A. University at Albany</th>\n                                <th>B. University of Leeds</th>\n                                <th>C. University of London</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>6</strong> There is no gender difference in the cause of yawning.</td>\n                                <td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>7</strong> People with certain disorders are less likely to be affected by other people yawning.</td>\n                                <td><input type=\"radio\" name=\"q7\" value=\"A\"></td><td><input type=\"radio\" name=\"q7\" value=\"B\"></td><td><input type=\"radio\" name=\"q7\" value=\"C\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>8</strong> Yawning is associated with the way people breathe.</td>\n                                <td><input type=\"radio\" name=\"q8\" value=\"A\"></td><td><input type=\"radio\" name=\"q8\" value=\"B\"></td><td><input type=\"radio\" name=\"q8\" value=\"C\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>9</strong> People who are trained to feel empathy for others are more likely to yawn than those who are untrained.</td>\n                                <td><input type=\"radio\" name=\"q9\" value=\"A\"></td><td><input type=\"radio\" name=\"q9\" value=\"B\"></td><td><input type=\"radio\" name=\"q9\" value=\"C\"></td>\n                            </tr>\n                        </tbody>\n                    </table>\n                 </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 6–9</h4>\n<p>Match each of the following research results with the university from which it comes.</p>\n<p><em>You may use any letter more than once.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A. University at Albany</th>\n<th>B. University of Leeds</th>\n<th>C. University of London</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>6</strong> There is no gender difference in the cause of yawning.</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td>\n</tr>\n<tr>\n<td><strong>7</strong> People with certain disorders are less likely to be affected by other people yawning.</td>\n<td><input type=\"radio\" name=\"q7\" value=\"A\"></td><td><input type=\"radio\" name=\"q7\" value=\"B\"></td><td><input type=\"radio\" name=\"q7\" value=\"C\"></td>\n</tr>\n<tr>\n<td><strong>8</strong> Yawning is associated with the way people breathe.</td>\n<td><input type=\"radio\" name=\"q8\" value=\"A\"></td><td><input type=\"radio\" name=\"q8\" value=\"B\"></td><td><input type=\"radio\" name=\"q8\" value=\"C\"></td>\n</tr>\n<tr>\n<td><strong>9</strong> People who are trained to feel empathy for others are more likely to yawn than those who are untrained.</td>\n<td><input type=\"radio\" name=\"q9\" value=\"A\"></td><td><input type=\"radio\" name=\"q9\" value=\"B\"></td><td><input type=\"radio\" name=\"q9\" value=\"C\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -58,7 +58,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-anchor\">\n                 <h4>Questions 10–13</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                <div class=\"summary-completion\">\n                    <p>\n                    Another theory shows that yawning is used for <strong>10</strong> <input type=\"text\" id=\"q10_input\" maxlength=\"15\" name=\"q10\"> individuals into a tighter social unit. Alternatively, yawning can help increase alertness of group members in case <strong>11</strong> <input type=\"text\" id=\"q11_input\" maxlength=\"15\" name=\"q11\"> is close. For example, yawning signals that a member of the group needs some <strong>12</strong> <input type=\"text\" id=\"q12_input\" maxlength=\"15\" name=\"q12\"> and requires the others to stay aware of the surrounding situation. This theory proves that yawning is only a spontaneous behaviour resulting from some part of a simple <strong>13</strong> <input type=\"text\" id=\"q13_input\" maxlength=\"15\" name=\"q13\"> system in early humans.\n                    </p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<h4>Questions 10–13</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<p>\nAnother theory shows that yawning is used for <strong>10</strong> <input type=\"text\" id=\"q10_input\" maxlength=\"15\" name=\"q10\"> individuals into a tighter social unit. Alternatively, yawning can help increase alertness of group members in case <strong>11</strong> <input type=\"text\" id=\"q11_input\" maxlength=\"15\" name=\"q11\"> is close. For example, yawning signals that a member of the group needs some <strong>12</strong> <input type=\"text\" id=\"q12_input\" maxlength=\"15\" name=\"q12\"> and requires the others to stay aware of the surrounding situation. This theory proves that yawning is only a spontaneous behaviour resulting from some part of a simple <strong>13</strong> <input type=\"text\" id=\"q13_input\" maxlength=\"15\" name=\"q13\"> system in early humans.\n</p>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 1</h2>\n            <p>You should spend about 20 minutes on Questions 1-13, which are based on Reading Passage 1.</p>\n            \n            <h3>The Origin of Paper</h3>\n            \n            <p>The word paper derives from the Greek term for the ancient Egyptian writing material called papyrus. In about 2400 BC, the Egyptians discovered how to make a writing surface out of papyrus, a type of reed that grows along waterways in southern Europe and North Africa. The Egyptians cut the plant into strips which they softened in water. Papyrus was cross-woven into a mat and then pounded into a hard, thin sheet.</p>\n            <p>As the papyrus plant requires subtropical conditions to grow, papyrus was not much used in Europe at that time; instead, the main material used for writing was parchment. This was made from animal skin and was extremely expensive. In fact, it has been estimated that a single book written on parchment required the skins of 300 sheep. The skins had to be specially prepared by drying them and they were then stretched on a special frame. It is not known when parchment was first introduced, but it was the main writing material in Europe for hundreds of years.</p>\n            <p>Paper—made from pulp, rags and fibres of plants—seems to have been invented in China and is considered to be one of the Four Great Inventions of Ancient China. In 105 AD, under the Han-Dynasty emperor Ho-Ti, a government official in China named Ts'ai Lun was the first to start a papermaking industry. Ts'ai Lun seems to have made his paper by mixing finely chopped mulberry bark and hemp rags with water, mashing the mixture flat with a stone mortar, and then pressing out the water and letting it dry in the sun. He may have based his idea on bark cloth, which was very common in China and also made from mulberry.</p>\n            <p>Previously, during the Shang (1600-1050 BC) and Zhou (1050-256 BC) dynasties of Ancient China, documents were ordinarily written on bone or bamboo (on tablets or bamboo strips bound and rolled together into scrolls), making them very heavy and awkward to transport. The light material of silk was sometimes used, but was normally too expensive to consider. When paper was first invented, it was used for purposes of wrapping or padding protection for delicate bronze mirrors. Although paper for writing became popular by the 3rd century AD, it continued to be used for wrapping and other purposes.</p>\n            <p>During the Tang Dynasty (618-907 AD) paper was folded and sewn into square bags to preserve the flavour of tea. During the same period, according to a written account, tea was served from baskets with multi-coloured paper cups and paper napkins of different sizes and shapes. During the Chinese Song Dynasty (960-1279 AD) not only did the government produce the world's first known printed paper money, or banknote, but paper money bestowed as gifts was wrapped in special paper envelopes.</p>\n            <p>Paper spread widely outside China; other Asian cultures, even after seeing paper, could not make it themselves. Instruction in the manufacturing process was required, and the Chinese were reluctant to share their secrets. It made its true push westward in 751 AD when the Tang Dynasty was at war with the Islamic world. During a battle on the banks of the Talas River, a Chinese caravan was captured which happened to include several papermakers. They were taken away to Samarkand, which was a good place to make paper because it had an abundant supply of hemp and flax. Samarkanders changed the technology of manufacturing paper. They began to prepare it in stone mills and Samarkand became an important papermaking centre.</p>\n            <p>The rudimentary and laborious process of papermaking was refined, and bulk manufacturing of paper began in Iran, where they invented a method to make a thicker sheet of paper, which helped transform papermaking from an art into an important business.</p>\n            <p>Gradually papermakers made their way further west through the Arab world—to Baghdad, Damascus and Cairo. Finally, when the Moors from North Africa invaded Spain and Portugal, they brought the technology with them and so it was that papermaking entered Europe in the 12th century.</p>\n            <p>In Europe, the preferred medium for the artists and literati of the time was still the smooth and lustrous parchment. The notion of paper being used as a practical everyday item did not occur until the 15th century, when Johannes Gutenberg perfected movable-type printing, which included the use of metal moulds and alloys, a special press, and oil-based inks, allowing the mass production of printed books. The birth of the modern paper and printing industry is commonly marked from this date.</p>\n            <p>Printing technology rapidly developed and created an ever-increasing demand for paper. The early European papers were made from recycled cotton and linen—and a huge trade quickly developed around the trading of old rags. It is said that the disease known as the Black Death entered England from Europe on these old rags. Yet soon this source became insufficient and some curious attempts were made to find new materials. Experiments with fibres such as straw, cabbage, wasp nests and finally wood resulted in inexpensive—and replaceable—materials for papermaking. Today, the long, soft fibres of softwoods such as spruce have become the most suitable source of pulp for the mass production of paper.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1-13, which are based on Reading Passage 1.</p>\n<h3>The Origin of Paper</h3>\n<p>The word paper derives from the Greek term for the ancient Egyptian writing material called papyrus. In about 2400 BC, the Egyptians discovered how to make a writing surface out of papyrus, a type of reed that grows along waterways in southern Europe and North Africa. The Egyptians cut the plant into strips which they softened in water. Papyrus was cross-woven into a mat and then pounded into a hard, thin sheet.</p>\n<p>As the papyrus plant requires subtropical conditions to grow, papyrus was not much used in Europe at that time; instead, the main material used for writing was parchment. This was made from animal skin and was extremely expensive. In fact, it has been estimated that a single book written on parchment required the skins of 300 sheep. The skins had to be specially prepared by drying them and they were then stretched on a special frame. It is not known when parchment was first introduced, but it was the main writing material in Europe for hundreds of years.</p>\n<p>Paper—made from pulp, rags and fibres of plants—seems to have been invented in China and is considered to be one of the Four Great Inventions of Ancient China. In 105 AD, under the Han-Dynasty emperor Ho-Ti, a government official in China named Ts'ai Lun was the first to start a papermaking industry. Ts'ai Lun seems to have made his paper by mixing finely chopped mulberry bark and hemp rags with water, mashing the mixture flat with a stone mortar, and then pressing out the water and letting it dry in the sun. He may have based his idea on bark cloth, which was very common in China and also made from mulberry.</p>\n<p>Previously, during the Shang (1600-1050 BC) and Zhou (1050-256 BC) dynasties of Ancient China, documents were ordinarily written on bone or bamboo (on tablets or bamboo strips bound and rolled together into scrolls), making them very heavy and awkward to transport. The light material of silk was sometimes used, but was normally too expensive to consider. When paper was first invented, it was used for purposes of wrapping or padding protection for delicate bronze mirrors. Although paper for writing became popular by the 3rd century AD, it continued to be used for wrapping and other purposes.</p>\n<p>During the Tang Dynasty (618-907 AD) paper was folded and sewn into square bags to preserve the flavour of tea. During the same period, according to a written account, tea was served from baskets with multi-coloured paper cups and paper napkins of different sizes and shapes. During the Chinese Song Dynasty (960-1279 AD) not only did the government produce the world's first known printed paper money, or banknote, but paper money bestowed as gifts was wrapped in special paper envelopes.</p>\n<p>Paper spread widely outside China; other Asian cultures, even after seeing paper, could not make it themselves. Instruction in the manufacturing process was required, and the Chinese were reluctant to share their secrets. It made its true push westward in 751 AD when the Tang Dynasty was at war with the Islamic world. During a battle on the banks of the Talas River, a Chinese caravan was captured which happened to include several papermakers. They were taken away to Samarkand, which was a good place to make paper because it had an abundant supply of hemp and flax. Samarkanders changed the technology of manufacturing paper. They began to prepare it in stone mills and Samarkand became an important papermaking centre.</p>\n<p>The rudimentary and laborious process of papermaking was refined, and bulk manufacturing of paper began in Iran, where they invented a method to make a thicker sheet of paper, which helped transform papermaking from an art into an important business.</p>\n<p>Gradually papermakers made their way further west through the Arab world—to Baghdad, Damascus and Cairo. Finally, when the Moors from North Africa invaded Spain and Portugal, they brought the technology with them and so it was that papermaking entered Europe in the 12th century.</p>\n<p>In Europe, the preferred medium for the artists and literati of the time was still the smooth and lustrous parchment. The notion of paper being used as a practical everyday item did not occur until the 15th century, when Johannes Gutenberg perfected movable-type printing, which included the use of metal moulds and alloys, a special press, and oil-based inks, allowing the mass production of printed books. The birth of the modern paper and printing industry is commonly marked from this date.</p>\n<p>Printing technology rapidly developed and created an ever-increasing demand for paper. The early European papers were made from recycled cotton and linen—and a huge trade quickly developed around the trading of old rags. It is said that the disease known as the Black Death entered England from Europe on these old rags. Yet soon this source became insufficient and some curious attempts were made to find new materials. Experiments with fibres such as straw, cabbage, wasp nests and finally wood resulted in inexpensive—and replaceable—materials for papermaking. Today, the long, soft fibres of softwoods such as spruce have become the most suitable source of pulp for the mass production of paper.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -37,7 +37,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n                <h4>Questions 1–7</h4>\n                <p>Do the following statements agree with the information given in Reading Passage 1?</p>\n                <p>In boxes 1–7 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>TRUE</strong> if the statement agrees with the information</li>\n                    <li><strong>FALSE</strong> if the statement contradicts the information</li>\n                    <li><strong>NOT GIVEN</strong> if there is no information on this</li>\n                </ul>\n                \n                <div class=\"question-item\">\n                    <p><strong>1</strong> In Ancient China, writing was occasionally done on silk.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>2</strong> Coloured paper was invented during the Tang Dynasty.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>3</strong> Papermakers from Samarkand were captured by the Chinese.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>4</strong> Papermaking as a large-scale industry originated in Iran.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>5</strong> Papermaking skills were brought to Europe via North Africa.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>6</strong> When Gutenberg invented movable type, paper materials were very expensive.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>7</strong> The end of the trade in rags was brought about by the difficulty of transporting them.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 1–7</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 1–7 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> In Ancient China, writing was occasionally done on silk.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> Coloured paper was invented during the Tang Dynasty.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> Papermakers from Samarkand were captured by the Chinese.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> Papermaking as a large-scale industry originated in Iran.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> Papermaking skills were brought to Europe via North Africa.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> When Gutenberg invented movable type, paper materials were very expensive.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>7</strong> The end of the trade in rags was brought about by the difficulty of transporting them.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -51,7 +51,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n                <h4>Questions 8–13</h4>\n                <p>Complete the table below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                \n                <table class=\"completion-table\">\n                    <thead>\n                        <tr>\n                            <th colspan=\"4\">The Development of Paper</th>\n                        </tr>\n                        <tr>\n                            <th>Place</th>\n                            <th>Date of introduction</th>\n                            <th>Materials used</th>\n                            <th>Method of production</th>\n                        </tr>\n                    </thead>\n                    <tbody>\n                        <tr>\n                            <td>Egypt</td>\n                            <td>about 2400 BC</td>\n                            <td>a plant called papyrus</td>\n                            <td><strong>8</strong> <input type=\"text\" id=\"q8_input\" name=\"q8\"> of the plant were softened in water, woven and pounded</td>\n                        </tr>\n                        <tr>\n                            <td>Europe</td>\n                            <td>unknown</td>\n                            <td>parchment made from the skin of animals such as <strong>9</strong> <input type=\"text\" id=\"q9_input\" name=\"q9\"></td>\n                            <td>skin was dried and <strong>10</strong> <input type=\"text\" id=\"q10_input\" name=\"q10\"></td>\n                        </tr>\n                        <tr>\n                             <td>China</td>\n                            <td>105 AD</td>\n                            <td><strong>11</strong> <input type=\"text\" id=\"q11_input\" name=\"q11\"> of a mulberry tree and hemp rags</td>\n                            <td>ingredients were mixed with water, pressed and put outside in the sun</td>\n                        </tr>\n                         <tr>\n                            <td><strong>12</strong> <input type=\"text\" id=\"q12_input\" name=\"q12\"></td>\n                            <td>751 AD</td>\n                            <td>flax and hemp</td>\n                            <td>mills made of <strong>13</strong> <input type=\"text\" id=\"q13_input\" name=\"q13\"> were used</td>\n                        </tr>\n                    </tbody>\n                </table>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Questions 8–13</h4>\n<p>Complete the table below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<table class=\"completion-table\">\n<thead>\n<tr>\n<th colspan=\"4\">The Development of Paper</th>\n</tr>\n<tr>\n<th>Place</th>\n<th>Date of introduction</th>\n<th>Materials used</th>\n<th>Method of production</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td>Egypt</td>\n<td>about 2400 BC</td>\n<td>a plant called papyrus</td>\n<td><strong>8</strong> <input type=\"text\" id=\"q8_input\" name=\"q8\"> of the plant were softened in water, woven and pounded</td>\n</tr>\n<tr>\n<td>Europe</td>\n<td>unknown</td>\n<td>parchment made from the skin of animals such as <strong>9</strong> <input type=\"text\" id=\"q9_input\" name=\"q9\"></td>\n<td>skin was dried and <strong>10</strong> <input type=\"text\" id=\"q10_input\" name=\"q10\"></td>\n</tr>\n<tr>\n<td>China</td>\n<td>105 AD</td>\n<td><strong>11</strong> <input type=\"text\" id=\"q11_input\" name=\"q11\"> of a mulberry tree and hemp rags</td>\n<td>ingredients were mixed with water, pressed and put outside in the sun</td>\n</tr>\n<tr>\n<td><strong>12</strong> <input type=\"text\" id=\"q12_input\" name=\"q12\"></td>\n<td>751 AD</td>\n<td>flax and hemp</td>\n<td>mills made of <strong>13</strong> <input type=\"text\" id=\"q13_input\" name=\"q13\"> were used</td>\n</tr>\n</tbody>\n</table>\n</div>"
     }
   ],
   "answerKey": {
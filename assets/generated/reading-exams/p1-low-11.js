@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>Bovids</h2>\n            \n            <p>The family of mammals called bovids belongs to the Artiodactyl class, which also includes giraffes. Bovids are a highly diverse group consisting of 137 species, some of which are man's most important domestic animals.</p>\n            <p>Bovids are well represented in most parts of Eurasia and Southeast Asian islands, but they are by far the most numerous and diverse in the latter. Some species of bovid are solitary, but others live in large groups with complex social structures. Although bovids have adapted to a wide range of habitats, from arctic tundra to deep tropical forest, the majority of species favour open grassland, scrub or desert. This diversity of habitat is also matched by great diversity in size and form: at one extreme is the royal antelope of West Africa, which stands a mere 25 cm at the shoulder; at the other, the massively built bison of North America and Europe, growing to a shoulder height of 2.2m.</p>\n            <p>Despite differences in size and appearance, bovids are united by the possession of certain common features. All species are ruminants, which means that they retain undigested food in their stomachs, and regurgitate it as necessary. Bovids are almost exclusively herbivorous. Typically, their teeth are highly modified for browsing and grazing: grass or foliage is cropped with the upper lip and lower incisors (the upper incisors are usually absent), and then ground down by the cheek teeth. As well as having cloven, or split hooves, the males of all bovid species and the females of most carry horns. Bovid horns have bony cores covered in a sheath of horny material that is constantly renewed from within; they are unbranched and never shed. They vary in shape and size: the relatively simple horns of a large Indian buffalo may measure around 4 m from tip to tip along the outer curve, while the various gazelles have horns with a variety of elegant curves.</p>\n            <p>Five groups, or sub-families, may be distinguished: Bovinae, Antelope, Caprinae, Cephalophinae and Antilocapridae. The sub-family Bovinae comprises most of the larger bovids, including the African bongo, nilgai, eland, bison and cattle. Unlike most other bovids, they are all non-territorial. The ancestors of the various species of domestic cattle (such as banteng, gaur, yak and water buffalo) are generally rare and endangered in the wild, while the auroch (the ancestor of the domestic cattle of Europe) is extinct.</p>\n            <p>The term 'antelope' is not a very precise zoological name – it is used to loosely describe a number of bovids that have followed different lines of development. Antelopes are typically long-legged, fast-running species, often with long horns that may be laid along the back when the animal is in full flight. There are two main sub-groups of antelope: Hippotraginae, which includes the oryx and the addax, and Antilopinae, which generally contains slighter and more graceful animals such as gazelle and the springbok. Antelopes are mainly grassland species, but many have adapted to flooded grasslands: pukus, waterbucks and lechwes are all good at swimming, usually feeding in deep water, while the sitatunga has long, splayed hooves that enable it to walk freely on swampy ground.</p>\n            <p>The sub-family Caprinae includes the sheep and the goat, together with various relatives such as the goral and the tahr. Most are woolly or have long hair. Several species, such as wild goats, chamois and ibex, are agile cliff and mountain-dwellers. Tolerance of extreme conditions is most marked in this group: barbary and bighorn sheep have adapted to arid deserts, while Rocky Mountain sheep survive high up in mountains and musk oxen in arctic tundra.</p>\n            <p>The duiker of Africa belongs to the Cephalophinae sub-family. It is generally small and solitary, often living in thick forest. Although mainly feeding on grass and leaves, some duikers - unlike most other bovids – are believed to eat insects and feed on dead animal carcasses, and even to kill small animals.</p>\n            <p>The pronghorn is the sole survivor of a New World sub-family of herbivorous ruminants, the Antilocapridae in North America. It is similar in appearance and habits to the Old World antelope. Although greatly reduced in numbers since the arrival of Europeans, and the subsequent enclosure of grasslands, the pronghorn is still found in considerable numbers throughout North America, from Washington State to Mexico. When alarmed by the approach of wolves or other predators, hairs on the pronghorn's rump stand erect, so showing and emphasising the white patch there. At this signal, the whole herd gallops off at speed of over 60 km per hour.</p>\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>Bovids</h2>\n<p>The family of mammals called bovids belongs to the Artiodactyl class, which also includes giraffes. Bovids are a highly diverse group consisting of 137 species, some of which are man's most important domestic animals.</p>\n<p>Bovids are well represented in most parts of Eurasia and Southeast Asian islands, but they are by far the most numerous and diverse in the latter. Some species of bovid are solitary, but others live in large groups with complex social structures. Although bovids have adapted to a wide range of habitats, from arctic tundra to deep tropical forest, the majority of species favour open grassland, scrub or desert. This diversity of habitat is also matched by great diversity in size and form: at one extreme is the royal antelope of West Africa, which stands a mere 25 cm at the shoulder; at the other, the massively built bison of North America and Europe, growing to a shoulder height of 2.2m.</p>\n<p>Despite differences in size and appearance, bovids are united by the possession of certain common features. All species are ruminants, which means that they retain undigested food in their stomachs, and regurgitate it as necessary. Bovids are almost exclusively herbivorous. Typically, their teeth are highly modified for browsing and grazing: grass or foliage is cropped with the upper lip and lower incisors (the upper incisors are usually absent), and then ground down by the cheek teeth. As well as having cloven, or split hooves, the males of all bovid species and the females of most carry horns. Bovid horns have bony cores covered in a sheath of horny material that is constantly renewed from within; they are unbranched and never shed. They vary in shape and size: the relatively simple horns of a large Indian buffalo may measure around 4 m from tip to tip along the outer curve, while the various gazelles have horns with a variety of elegant curves.</p>\n<p>Five groups, or sub-families, may be distinguished: Bovinae, Antelope, Caprinae, Cephalophinae and Antilocapridae. The sub-family Bovinae comprises most of the larger bovids, including the African bongo, nilgai, eland, bison and cattle. Unlike most other bovids, they are all non-territorial. The ancestors of the various species of domestic cattle (such as banteng, gaur, yak and water buffalo) are generally rare and endangered in the wild, while the auroch (the ancestor of the domestic cattle of Europe) is extinct.</p>\n<p>The term 'antelope' is not a very precise zoological name – it is used to loosely describe a number of bovids that have followed different lines of development. Antelopes are typically long-legged, fast-running species, often with long horns that may be laid along the back when the animal is in full flight. There are two main sub-groups of antelope: Hippotraginae, which includes the oryx and the addax, and Antilopinae, which generally contains slighter and more graceful animals such as gazelle and the springbok. Antelopes are mainly grassland species, but many have adapted to flooded grasslands: pukus, waterbucks and lechwes are all good at swimming, usually feeding in deep water, while the sitatunga has long, splayed hooves that enable it to walk freely on swampy ground.</p>\n<p>The sub-family Caprinae includes the sheep and the goat, together with various relatives such as the goral and the tahr. Most are woolly or have long hair. Several species, such as wild goats, chamois and ibex, are agile cliff and mountain-dwellers. Tolerance of extreme conditions is most marked in this group: barbary and bighorn sheep have adapted to arid deserts, while Rocky Mountain sheep survive high up in mountains and musk oxen in arctic tundra.</p>\n<p>The duiker of Africa belongs to the Cephalophinae sub-family. It is generally small and solitary, often living in thick forest. Although mainly feeding on grass and leaves, some duikers - unlike most other bovids – are believed to eat insects and feed on dead animal carcasses, and even to kill small animals.</p>\n<p>The pronghorn is the sole survivor of a New World sub-family of herbivorous ruminants, the Antilocapridae in North America. It is similar in appearance and habits to the Old World antelope. Although greatly reduced in numbers since the arrival of Europeans, and the subsequent enclosure of grasslands, the pronghorn is still found in considerable numbers throughout North America, from Washington State to Mexico. When alarmed by the approach of wolves or other predators, hairs on the pronghorn's rump stand erect, so showing and emphasising the white patch there. At this signal, the whole herd gallops off at speed of over 60 km per hour.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -33,7 +33,7 @@
         "q2",
         "q3"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-anchor\">\n                <h4>Questions 1–3</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                \n                <div class=\"question-item\">\n                    <p><strong>1</strong> In which region is the biggest range of bovids to be found?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"A\"> A Africa</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"B\"> B Eurasia</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"C\"> C North America</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"D\"> D South-east Asia</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>2</strong> Most bovids have a preference for living in</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"A\"> A isolation.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"B\"> B small groups.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"C\"> C tropical forest.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"D\"> D wide open spaces.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>3</strong> Which of the following features do all bovids have in common?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"A\"> A Their horns are shed</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"B\"> B They have upper incisors</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"C\"> C They store food in the body</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"D\"> D Their hooves are undivided</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-anchor\">\n<h4>Questions 1–3</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>1</strong> In which region is the biggest range of bovids to be found?</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A Africa</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B Eurasia</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C North America</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D South-east Asia</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> Most bovids have a preference for living in</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A isolation.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B small groups.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C tropical forest.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D wide open spaces.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> Which of the following features do all bovids have in common?</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A Their horns are shed</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B They have upper incisors</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C They store food in the body</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D Their hooves are undivided</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -46,7 +46,7 @@
         "q7",
         "q8"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q4-5-6-7-8-anchor\">\n                <h4>Questions 4–8</h4>\n                <p>Look at the following characteristics and the list of sub-families below.</p>\n                <p>Match each characteristic with the correct sub-family, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <p><em>NB You may use any letter more than once.</em></p>\n                \n                <div class=\"match-question-item\">\n                    <p><strong>4</strong> can endure very harsh environments</p>\n                    <div class=\"match-dropzone\" data-question=\"q4\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>5</strong> includes the ox and the cow</p>\n                    <div class=\"match-dropzone\" data-question=\"q5\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>6</strong> may supplement its diet with meat</p>\n                    <div class=\"match-dropzone\" data-question=\"q6\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>7</strong> can usually move at speed</p>\n                    <div class=\"match-dropzone\" data-question=\"q7\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>8</strong> does not defend a particular area of land</p>\n                    <div class=\"match-dropzone\" data-question=\"q8\"></div>\n                </div>\n\n                <div class=\"options-pool\" id=\"subfamily-options-pool\">\n                    <strong>List of sub-families</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" id=\"subfam-A\" draggable=\"true\" data-option=\"A\">A Antelope</div>\n                        <div class=\"drag-item\" id=\"subfam-B\" draggable=\"true\" data-option=\"B\">B Bovinae</div>\n                        <div class=\"drag-item\" id=\"subfam-C\" draggable=\"true\" data-option=\"C\">C Caprinae</div>\n                        <div class=\"drag-item\" id=\"subfam-D\" draggable=\"true\" data-option=\"D\">D Cephalophinae</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q4-5-6-7-8-anchor\">\n<h4>Questions 4–8</h4>\n<p>Look at the following characteristics and the list of sub-families below.</p>\n<p>Match each characteristic with the correct sub-family, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>4</strong> can endure very harsh environments</p>\n<div class=\"match-dropzone\" data-question=\"q4\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>5</strong> includes the ox and the cow</p>\n<div class=\"match-dropzone\" data-question=\"q5\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>6</strong> may supplement its diet with meat</p>\n<div class=\"match-dropzone\" data-question=\"q6\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>7</strong> can usually move at speed</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>8</strong> does not defend a particular area of land</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"options-pool\" id=\"subfamily-options-pool\">\n<strong>List of sub-families</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"subfam-A\" draggable=\"true\" data-option=\"A\">A Antelope</div>\n<div class=\"drag-item\" id=\"subfam-B\" draggable=\"true\" data-option=\"B\">B Bovinae</div>\n<div class=\"drag-item\" id=\"subfam-C\" draggable=\"true\" data-option=\"C\">C Caprinae</div>\n<div class=\"drag-item\" id=\"subfam-D\" draggable=\"true\" data-option=\"D\">D Cephalophinae</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": true
     },
     {
@@ -59,7 +59,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n                <h4>Questions 9–13</h4>\n                <p>Answer the questions below.</p>\n                <p>Choose <strong>NO MORE THAN THREE WORDS</strong> from the passage for each answer.</p>\n                \n                <ul class=\"short-answer-list\">\n                    <li class=\"short-answer-item\">\n                        <p><strong>9</strong> What is the smallest species of Bovid called?</p>\n                        <input name=\"q9\" type=\"text\" id=\"q9_input\">\n                    </li>\n                    <li class=\"short-answer-item\">\n                        <p><strong>10</strong> Which species of Bovinae has now died out?</p>\n                        <input name=\"q10\" type=\"text\" id=\"q10_input\">\n                    </li>\n                    <li class=\"short-answer-item\">\n                        <p><strong>11</strong> What facilitates the movement of the sitatunga over wetland?</p>\n                        <input name=\"q11\" type=\"text\" id=\"q11_input\">\n                    </li>\n                    <li class=\"short-answer-item\">\n                        <p><strong>12</strong> What sort of terrain do barbary sheep live in?</p>\n                        <input name=\"q12\" type=\"text\" id=\"q12_input\">\n                    </li>\n                    <li class=\"short-answer-item\">\n                        <p><strong>13</strong> What is the only living member of the Antilocapridae sub-family?</p>\n                        <input name=\"q13\" type=\"text\" id=\"q13_input\">\n                    </li>\n                </ul>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 9–13</h4>\n<p>Answer the questions below.</p>\n<p>Choose <strong>NO MORE THAN THREE WORDS</strong> from the passage for each answer.</p>\n<ul class=\"short-answer-list\">\n<li class=\"short-answer-item\">\n<p><strong>9</strong> What is the smallest species of Bovid called?</p>\n<input name=\"q9\" type=\"text\" id=\"q9_input\">\n</li>\n<li class=\"short-answer-item\">\n<p><strong>10</strong> Which species of Bovinae has now died out?</p>\n<input name=\"q10\" type=\"text\" id=\"q10_input\">\n</li>\n<li class=\"short-answer-item\">\n<p><strong>11</strong> What facilitates the movement of the sitatunga over wetland?</p>\n<input name=\"q11\" type=\"text\" id=\"q11_input\">\n</li>\n<li class=\"short-answer-item\">\n<p><strong>12</strong> What sort of terrain do barbary sheep live in?</p>\n<input name=\"q12\" type=\"text\" id=\"q12_input\">\n</li>\n<li class=\"short-answer-item\">\n<p><strong>13</strong> What is the only living member of the Antilocapridae sub-family?</p>\n<input name=\"q13\" type=\"text\" id=\"q13_input\">\n</li>\n</ul>\n</div>"
     }
   ],
   "answerKey": {
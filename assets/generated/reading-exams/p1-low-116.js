@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 1</h2>\n            <p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n            \n            <h3>Advertising Needs Attention</h3>\n            <h4>The harder advertisers try to get your attention, the more your brain ignores them.</h4>\n            \n            <p>Jane Raymond, a consumer psychologist at the University of Wales in Bangor, is carefully holding and gazing at a bottle of Chillz mineral water like a baby. Despite being made of clear plastic, it looks as if it has been carved from ice. This simple feature means shoppers are drawn to this bottle over the others on the shelf and cannot resist picking it up, Raymond says. She studies the subtle factors that motivate us to buy what we buy and advises big companies on how powerful an advertisement is and how it could be designed to stick more firmly in a consumer's memory. Most of all, she works out how to attract your attention.</p>\n            <p>In today's fast-paced consumer world, attention is in short supply. Whether we are taking our time shopping in a mall, surfing the Internet for information, or just watching television as a form of passive entertainment, consumers are surrounded by messages—one every 15 seconds of our waking lives, according to some estimates. Last year, companies worldwide spent $401 billion on advertising, according to the independent World Advertising Research Centre in the UK. But as the graveyard of failed products shows, they usually get it wrong.</p>\n            <p>Nine out of ten new products meet an early death, says Jamie Rayner, director of research at ID Magasin, a UK consultancy specialising in consumer behaviour. And the reason, he explains, is simple: conventional advertising has ceased to work. Rayner and his colleagues have measured how consumers—particularly regular commuters—react to advertising, and their conclusion should alarm many executives. They used a camera embedded in a pair of glasses worn to and from work to record commuters' gaze as they glanced at advertisements on their journey. After analysing the recordings and questioning the subjects, they found that most of the advertisements made no impression at all: only about one per cent could be recalled without prompting. It seems that although we may be looking at brands and advertisements all day long, most of the time we're not taking anything in.</p>\n            <p>Raymond thinks she knows why. Her move from research in visual processing into consumer psychology began in the early 1990s, when she discovered some strange behaviours in the brain's attentional system. She showed people a stream of letters and numbers on a screen and asked them to look out for a letter X. When she asked her volunteers afterwards what they had seen, she found that if the X appeared up to half a second or so after the white letter, or vice versa, people failed to see it. She concluded that if something catches your attention, your brain is blind to anything else for a short period afterwards. She called this effect the \"attentional blink.” “In short, the reason most advertising doesn't work is that we're in a severe state of attentional overload. Unless advertising is presented in a way the brain can absorb, it is simply not seen,” Raymond says.</p>\n            <p>So what does this mean for advertisers? A typical television advertisement consists of a series of attention-grabbing images interspersed with the product. But unless the scenes in the advertisement are cut to take account of attentional blinks, the brain is likely to ignore the information the advertiser wants to get across. The same applies to magazine advertisements, where viewers often register the main image but fail to pick up on the secondary images—the bits advertisers often desperately want us to see. Raymond says advertisers consistently fail to consider how easily the brain misses the point. It's not that they haven't realised that the space and time they have to get their message across has shrunk. But advertisers respond by cramming in ever more complex information. Raymond is opposed to this and her advice is simple: deliver your message in a straightforward manner and do so slowly, gently and concisely.</p>\n            <p>After her research on the attentional blink, she wondered whether attention would be linked to other processes in the brain, particularly emotion. Could our attentional state influence whether we like or dislike a brand, for example? Today, companies are hugely interested in the emotional value of their brands as they want their products to make us feel good. It is well known that if something elicits positive emotions then you are more likely to take notice of it. But Raymond's further research also demonstrates that if people are distracted by an image or a brand when performing an intellectually demanding task, they tend to instantly dislike the brands, regardless of their emotional value. So, for example, if you are reading a web page when a banner advertisement starts flashing, or are watching a film with intrusive product placement, it is probable you will come to dislike the brand whatever it is.</p>\n            <p>This contradicts the more-exposure-the-better rule most of the industry follows, says Raymond, and means that advertising can backfire horribly. Advertisers tend to buy as much exposure for a product as they can—through television and radio commercials, billboards, whatever they think will attract their target audiences—but again Raymond has found that this doesn't necessarily work in their favour. Perhaps the most dangerous time, says Raymond, is the holiday season when advertisers are madly competing to grab people's attention. “Marketers don't realise that humans digest information like they do food. Once they are full, if they are shown any more food, they're disgusted,” she says.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>Advertising Needs Attention</h3>\n<h4>The harder advertisers try to get your attention, the more your brain ignores them.</h4>\n<p>Jane Raymond, a consumer psychologist at the University of Wales in Bangor, is carefully holding and gazing at a bottle of Chillz mineral water like a baby. Despite being made of clear plastic, it looks as if it has been carved from ice. This simple feature means shoppers are drawn to this bottle over the others on the shelf and cannot resist picking it up, Raymond says. She studies the subtle factors that motivate us to buy what we buy and advises big companies on how powerful an advertisement is and how it could be designed to stick more firmly in a consumer's memory. Most of all, she works out how to attract your attention.</p>\n<p>In today's fast-paced consumer world, attention is in short supply. Whether we are taking our time shopping in a mall, surfing the Internet for information, or just watching television as a form of passive entertainment, consumers are surrounded by messages—one every 15 seconds of our waking lives, according to some estimates. Last year, companies worldwide spent $401 billion on advertising, according to the independent World Advertising Research Centre in the UK. But as the graveyard of failed products shows, they usually get it wrong.</p>\n<p>Nine out of ten new products meet an early death, says Jamie Rayner, director of research at ID Magasin, a UK consultancy specialising in consumer behaviour. And the reason, he explains, is simple: conventional advertising has ceased to work. Rayner and his colleagues have measured how consumers—particularly regular commuters—react to advertising, and their conclusion should alarm many executives. They used a camera embedded in a pair of glasses worn to and from work to record commuters' gaze as they glanced at advertisements on their journey. After analysing the recordings and questioning the subjects, they found that most of the advertisements made no impression at all: only about one per cent could be recalled without prompting. It seems that although we may be looking at brands and advertisements all day long, most of the time we're not taking anything in.</p>\n<p>Raymond thinks she knows why. Her move from research in visual processing into consumer psychology began in the early 1990s, when she discovered some strange behaviours in the brain's attentional system. She showed people a stream of letters and numbers on a screen and asked them to look out for a letter X. When she asked her volunteers afterwards what they had seen, she found that if the X appeared up to half a second or so after the white letter, or vice versa, people failed to see it. She concluded that if something catches your attention, your brain is blind to anything else for a short period afterwards. She called this effect the \"attentional blink.” “In short, the reason most advertising doesn't work is that we're in a severe state of attentional overload. Unless advertising is presented in a way the brain can absorb, it is simply not seen,” Raymond says.</p>\n<p>So what does this mean for advertisers? A typical television advertisement consists of a series of attention-grabbing images interspersed with the product. But unless the scenes in the advertisement are cut to take account of attentional blinks, the brain is likely to ignore the information the advertiser wants to get across. The same applies to magazine advertisements, where viewers often register the main image but fail to pick up on the secondary images—the bits advertisers often desperately want us to see. Raymond says advertisers consistently fail to consider how easily the brain misses the point. It's not that they haven't realised that the space and time they have to get their message across has shrunk. But advertisers respond by cramming in ever more complex information. Raymond is opposed to this and her advice is simple: deliver your message in a straightforward manner and do so slowly, gently and concisely.</p>\n<p>After her research on the attentional blink, she wondered whether attention would be linked to other processes in the brain, particularly emotion. Could our attentional state influence whether we like or dislike a brand, for example? Today, companies are hugely interested in the emotional value of their brands as they want their products to make us feel good. It is well known that if something elicits positive emotions then you are more likely to take notice of it. But Raymond's further research also demonstrates that if people are distracted by an image or a brand when performing an intellectually demanding task, they tend to instantly dislike the brands, regardless of their emotional value. So, for example, if you are reading a web page when a banner advertisement starts flashing, or are watching a film with intrusive product placement, it is probable you will come to dislike the brand whatever it is.</p>\n<p>This contradicts the more-exposure-the-better rule most of the industry follows, says Raymond, and means that advertising can backfire horribly. Advertisers tend to buy as much exposure for a product as they can—through television and radio commercials, billboards, whatever they think will attract their target audiences—but again Raymond has found that this doesn't necessarily work in their favour. Perhaps the most dangerous time, says Raymond, is the holiday season when advertisers are madly competing to grab people's attention. “Marketers don't realise that humans digest information like they do food. Once they are full, if they are shown any more food, they're disgusted,” she says.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -37,7 +37,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n                <h4>Questions 1–7</h4>\n                <p>Do the following statements agree with the information in Reading Passage 1?</p>\n                <p>In boxes 1–7 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>TRUE</strong> if the statement agrees with the information</li>\n                    <li><strong>FALSE</strong> if the statement contradicts the information</li>\n                    <li><strong>NOT GIVEN</strong> if there is no information about this</li>\n                </ul>\n                \n                <div class=\"question-item\">\n                    <p><strong>1</strong> Jane Raymond states that Chillz mineral water is packaged in a way that is unattractive to consumers.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>2</strong> Consumers are still exposed to more advertising through television commercials than through the medium of the Internet.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>3</strong> Jamie Rayner says that people are no longer influenced by traditional advertisements.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>4</strong> According to Jamie Rayner, the reason that most products are discontinued is that advertising fails to attract consumers.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>5</strong> Jane Raymond believes that commercials should be simpler in their content.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>6</strong> Advertisements showing unfamiliar brands affect a person's concentration more than ones with familiar brands.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>7</strong> Jane Raymond suggests that a product should be advertised in as many ways as possible.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 1–7</h4>\n<p>Do the following statements agree with the information in Reading Passage 1?</p>\n<p>In boxes 1–7 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> Jane Raymond states that Chillz mineral water is packaged in a way that is unattractive to consumers.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> Consumers are still exposed to more advertising through television commercials than through the medium of the Internet.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> Jamie Rayner says that people are no longer influenced by traditional advertisements.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> According to Jamie Rayner, the reason that most products are discontinued is that advertising fails to attract consumers.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> Jane Raymond believes that commercials should be simpler in their content.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> Advertisements showing unfamiliar brands affect a person's concentration more than ones with familiar brands.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>7</strong> Jane Raymond suggests that a product should be advertised in as many ways as possible.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -51,7 +51,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n                <h4>Questions 8–13</h4>\n                <p>Choose <strong>NO MORE THAN THREE WORDS</strong> from the passage for each answer.</p>\n                \n                <div class=\"question-item\">\n                    <p><strong>8</strong> What group of consumers were specifically targeted in Jamie Rayner's research?</p>\n                    <input type=\"text\" id=\"q8_input\" name=\"q8\">\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>9</strong> What subject did Jane Raymond study before focusing on the behaviour of consumers?</p>\n                    <input type=\"text\" id=\"q9_input\" name=\"q9\">\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>10</strong> According to the writer, what important aspect of an advertisement in print do many people fail to notice?</p>\n                    <input type=\"text\" id=\"q10_input\" name=\"q10\">\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>11</strong> According to the writer, what do companies today want their products to have in order to make consumers feel positive about themselves?</p>\n                    <input type=\"text\" id=\"q11_input\" name=\"q11\">\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>12</strong> What does Jane Raymond say will annoy someone watching a movie?</p>\n                    <input type=\"text\" id=\"q12_input\" name=\"q12\">\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>13</strong> According to Jane Raymond, when do advertisers promote their products most fiercely?</p>\n                    <input type=\"text\" id=\"q13_input\" name=\"q13\">\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Questions 8–13</h4>\n<p>Choose <strong>NO MORE THAN THREE WORDS</strong> from the passage for each answer.</p>\n<div class=\"question-item\">\n<p><strong>8</strong> What group of consumers were specifically targeted in Jamie Rayner's research?</p>\n<input type=\"text\" id=\"q8_input\" name=\"q8\">\n</div>\n<div class=\"question-item\">\n<p><strong>9</strong> What subject did Jane Raymond study before focusing on the behaviour of consumers?</p>\n<input type=\"text\" id=\"q9_input\" name=\"q9\">\n</div>\n<div class=\"question-item\">\n<p><strong>10</strong> According to the writer, what important aspect of an advertisement in print do many people fail to notice?</p>\n<input type=\"text\" id=\"q10_input\" name=\"q10\">\n</div>\n<div class=\"question-item\">\n<p><strong>11</strong> According to the writer, what do companies today want their products to have in order to make consumers feel positive about themselves?</p>\n<input type=\"text\" id=\"q11_input\" name=\"q11\">\n</div>\n<div class=\"question-item\">\n<p><strong>12</strong> What does Jane Raymond say will annoy someone watching a movie?</p>\n<input type=\"text\" id=\"q12_input\" name=\"q12\">\n</div>\n<div class=\"question-item\">\n<p><strong>13</strong> According to Jane Raymond, when do advertisers promote their products most fiercely?</p>\n<input type=\"text\" id=\"q13_input\" name=\"q13\">\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 1</h2>\n            \n            <h3>Report on a university drama project</h3>\n            <h4>Drama student Imogen Clare-Wood describes a collaborative theatre project she took part in</h4>\n            \n            <p>This project was born from discussions I had with other drama students about the kind of theatre productions we'd like to create. Although we had previously been involved in various university productions where we took on specific roles, such as costume designer, producer, director and so on, we now wanted to take a collaborative approach that was new to all of us. We wanted a project in which every voice would carry equal weight and everyone would be able to contribute to every aspect of the show. We decided that the way to achieve this feeling of collaboration would be to concentrate on the process by which the work emerged during auditions and rehearsals. We chose a play that we felt allowed varied interpretations – Harold Pinter's The Lover, a modern one-act play with just two characters. We decided we would use six actors cast as three different couples, and each pair would have a turn to perform on one of the three nights that the play was to be staged.</p>\n            <p>The next step was to hold auditions in order to find six actors who felt the same way about the project as we did. We were anxious not to create an “us-and-them” feeling to the auditions, since collective ownership of the project was crucial to our ideas. So we ran the first round of auditions as a series of workshops, which we kept very informal and relaxed. Then we recalled fifteen actors for the second round of auditions. At this stage we wanted the reactions and ideas to flow and be explored by the group in the form of a discussion. We were looking for actors who could encourage other people's ideas but who were also eager to input their own thoughts. Possibly the hardest part of the whole process was sitting down afterwards and deciding on the final six actors who would take part in the project.</p>\n            <p>Our initial rehearsals were dedicated to creating a strong group dynamic and to exploring some of the themes of the play without explicit reference to the script. One of the strongest tools we used for this was freewriting – an exercise in which one person would read out a list of unconnected words and the rest of the group would clear their minds and simply write something in response to those words. We found it helped us to gain insight into the different ways our minds work. It also meant that we got to know each other very well, very quickly!</p>\n            <p>It was only during the next phase of rehearsals that we finally began to work with the script. We had not yet decided on the pairings for the six actors at this point, and we had the non-actors on the team reading in addition to the people who would be doing the final performances. The whole team finally decided on the pairings of the actors by a vote, and, miraculously, it was a unanimous decision. The casting of the roles worked well and felt more natural than it had in any other show I've worked on. I think the dynamic that we developed over the early rehearsals was crucial in giving us three such strong onstage relationships.</p>\n            <p>Other decisions were made in much the same way. The publicity was the responsibility of one member of the team, but she asked everyone what they thought would be effective. She then made several different versions, and from these we chose the design we liked the most. The stage set was left more to the individual pairs of actors, but since a large part of the later rehearsals was observing and feeding back on the individual performances being created by each pair, everyone was able to help with set design. We initially planned that each pair would use the same stage set. However, due to the different ways they interpreted the script, it became important for the set to be adapted for each couple.</p>\n            <p>In the final performances, it was surprising that despite the collaborative nature of the project, a range of very different interpretations emerged. This is, of course, partly due to the tragicomic nature of Pinter's text, which allowed the pairs of actors to exploit these two disparate elements, tragedy and comedy, to different degrees.</p>\n            <p>The question-and-answer session held after the show was perhaps the most rewarding part of the project. The questions that the audience asked were interesting and insightful, and certainly made everyone in the team think about what we'd been doing, what we'd wanted to achieve and whether we'd achieved it. We were asked, among other things, about how successful our collaborative ethic had been, how we'd ended up with three such different shows, how we'd overcome the initial \"production-team-versus-cast” divide, and how we would continue in the future.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 1</h2>\n<h3>Report on a university drama project</h3>\n<h4>Drama student Imogen Clare-Wood describes a collaborative theatre project she took part in</h4>\n<p>This project was born from discussions I had with other drama students about the kind of theatre productions we'd like to create. Although we had previously been involved in various university productions where we took on specific roles, such as costume designer, producer, director and so on, we now wanted to take a collaborative approach that was new to all of us. We wanted a project in which every voice would carry equal weight and everyone would be able to contribute to every aspect of the show. We decided that the way to achieve this feeling of collaboration would be to concentrate on the process by which the work emerged during auditions and rehearsals. We chose a play that we felt allowed varied interpretations – Harold Pinter's The Lover, a modern one-act play with just two characters. We decided we would use six actors cast as three different couples, and each pair would have a turn to perform on one of the three nights that the play was to be staged.</p>\n<p>The next step was to hold auditions in order to find six actors who felt the same way about the project as we did. We were anxious not to create an “us-and-them” feeling to the auditions, since collective ownership of the project was crucial to our ideas. So we ran the first round of auditions as a series of workshops, which we kept very informal and relaxed. Then we recalled fifteen actors for the second round of auditions. At this stage we wanted the reactions and ideas to flow and be explored by the group in the form of a discussion. We were looking for actors who could encourage other people's ideas but who were also eager to input their own thoughts. Possibly the hardest part of the whole process was sitting down afterwards and deciding on the final six actors who would take part in the project.</p>\n<p>Our initial rehearsals were dedicated to creating a strong group dynamic and to exploring some of the themes of the play without explicit reference to the script. One of the strongest tools we used for this was freewriting – an exercise in which one person would read out a list of unconnected words and the rest of the group would clear their minds and simply write something in response to those words. We found it helped us to gain insight into the different ways our minds work. It also meant that we got to know each other very well, very quickly!</p>\n<p>It was only during the next phase of rehearsals that we finally began to work with the script. We had not yet decided on the pairings for the six actors at this point, and we had the non-actors on the team reading in addition to the people who would be doing the final performances. The whole team finally decided on the pairings of the actors by a vote, and, miraculously, it was a unanimous decision. The casting of the roles worked well and felt more natural than it had in any other show I've worked on. I think the dynamic that we developed over the early rehearsals was crucial in giving us three such strong onstage relationships.</p>\n<p>Other decisions were made in much the same way. The publicity was the responsibility of one member of the team, but she asked everyone what they thought would be effective. She then made several different versions, and from these we chose the design we liked the most. The stage set was left more to the individual pairs of actors, but since a large part of the later rehearsals was observing and feeding back on the individual performances being created by each pair, everyone was able to help with set design. We initially planned that each pair would use the same stage set. However, due to the different ways they interpreted the script, it became important for the set to be adapted for each couple.</p>\n<p>In the final performances, it was surprising that despite the collaborative nature of the project, a range of very different interpretations emerged. This is, of course, partly due to the tragicomic nature of Pinter's text, which allowed the pairs of actors to exploit these two disparate elements, tragedy and comedy, to different degrees.</p>\n<p>The question-and-answer session held after the show was perhaps the most rewarding part of the project. The questions that the audience asked were interesting and insightful, and certainly made everyone in the team think about what we'd been doing, what we'd wanted to achieve and whether we'd achieved it. We were asked, among other things, about how successful our collaborative ethic had been, how we'd ended up with three such different shows, how we'd overcome the initial \"production-team-versus-cast” divide, and how we would continue in the future.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                <h4>Questions 1–6</h4>\n                <p>Complete the flow-chart below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                \n                <div class=\"flowchart\">\n                    <h4>Stages in collaborative drama project</h4>\n                    \n                    <div class=\"flowchart-box\">\n                        <h5>Origin of project</h5>\n                        <p>Started with the wish for a collaborative project focusing on the <strong>1</strong> <input type=\"text\" id=\"q1_input\" name=\"q1\"> of producing a play</p>\n                    </div>\n\n                    <div class=\"flowchart-arrow\">↓</div>\n\n                    <div class=\"flowchart-box\">\n                        <h5>Auditions</h5>\n                        <p>first round: organised as several workshops – fifteen actors were then selected<br>\n                        second round: organised as a <strong>2</strong> <input type=\"text\" id=\"q2_input\" name=\"q2\"> – the final six actors were then selected</p>\n                    </div>\n\n                    <div class=\"flowchart-arrow\">↓</div>\n\n                    <div class=\"flowchart-box\">\n                        <h5>Preparation</h5>\n                        <p>in early rehearsals, <strong>3</strong> <input type=\"text\" id=\"q3_input\" name=\"q3\"> was found to be an effective technique<br>\n                        the <strong>4</strong> <input type=\"text\" id=\"q4_input\" name=\"q4\"> was only used in later rehearsals<br>\n                        everyone had a <strong>5</strong> <input type=\"text\" id=\"q5_input\" name=\"q5\"> to decide which actor would play each part<br>\n                        everyone was shown different designs for the publicity and the best one was chosen</p>\n                    </div>\n\n                    <div class=\"flowchart-arrow\">↓</div>\n                    \n                    <div class=\"flowchart-box\">\n                        <h5>Performance</h5>\n                        <p>the variety of <strong>6</strong> <input type=\"text\" id=\"q6_input\" name=\"q6\"> was surprising</p>\n                    </div>\n                    \n                    <div class=\"flowchart-arrow\">↓</div>\n\n                    <div class=\"flowchart-box\">\n                        <h5>After-show question-and-answer session</h5>\n                        <p>this resulted in some interesting comments</p>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 1–6</h4>\n<p>Complete the flow-chart below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"flowchart\">\n<h4>Stages in collaborative drama project</h4>\n<div class=\"flowchart-box\">\n<h5>Origin of project</h5>\n<p>Started with the wish for a collaborative project focusing on the <strong>1</strong> <input type=\"text\" id=\"q1_input\" name=\"q1\"> of producing a play</p>\n</div>\n<div class=\"flowchart-arrow\">↓</div>\n<div class=\"flowchart-box\">\n<h5>Auditions</h5>\n<p>first round: organised as several workshops – fifteen actors were then selected<br>\nsecond round: organised as a <strong>2</strong> <input type=\"text\" id=\"q2_input\" name=\"q2\"> – the final six actors were then selected</p>\n</div>\n<div class=\"flowchart-arrow\">↓</div>\n<div class=\"flowchart-box\">\n<h5>Preparation</h5>\n<p>in early rehearsals, <strong>3</strong> <input type=\"text\" id=\"q3_input\" name=\"q3\"> was found to be an effective technique<br>\nthe <strong>4</strong> <input type=\"text\" id=\"q4_input\" name=\"q4\"> was only used in later rehearsals<br>\neveryone had a <strong>5</strong> <input type=\"text\" id=\"q5_input\" name=\"q5\"> to decide which actor would play each part<br>\neveryone was shown different designs for the publicity and the best one was chosen</p>\n</div>\n<div class=\"flowchart-arrow\">↓</div>\n<div class=\"flowchart-box\">\n<h5>Performance</h5>\n<p>the variety of <strong>6</strong> <input type=\"text\" id=\"q6_input\" name=\"q6\"> was surprising</p>\n</div>\n<div class=\"flowchart-arrow\">↓</div>\n<div class=\"flowchart-box\">\n<h5>After-show question-and-answer session</h5>\n<p>this resulted in some interesting comments</p>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -51,7 +51,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-11-12-13-anchor\">\n                <h4>Questions 7–13</h4>\n                <p>Do the following statements agree with the information given in Reading Passage 1?</p>\n                <p>In boxes 7–13 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>TRUE</strong> if the statement agrees with the information</li>\n                    <li><strong>FALSE</strong> if the statement contradicts the information</li>\n                    <li><strong>NOT GIVEN</strong> if there is no information about this</li>\n                </ul>\n                \n                <div class=\"question-item\">\n                    <p><strong>7</strong> The writer had been involved in other collaborative theatre productions at university.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>8</strong> Each actor chosen for the project would play one role for three nights.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>9</strong> The early rehearsals took place at the university theatre.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>10</strong> The writer felt satisfied that all the actors were paired with the right partner.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q10\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>11</strong> Some team members discovered an unexpected talent for set design.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q11\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>12</strong> The original intention was to use a different stage set for each performance.</p>\n                     <div class=\"radio-options\">\n                        <label><input name=\"q12\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>13</strong> The question-and-answer session encouraged the team to think about their aims.</p>\n                     <div class=\"radio-options\">\n                        <label><input name=\"q13\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-11-12-13-anchor\">\n<h4>Questions 7–13</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 7–13 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>7</strong> The writer had been involved in other collaborative theatre productions at university.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>8</strong> Each actor chosen for the project would play one role for three nights.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>9</strong> The early rehearsals took place at the university theatre.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q9\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>10</strong> The writer felt satisfied that all the actors were paired with the right partner.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q10\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>11</strong> Some team members discovered an unexpected talent for set design.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q11\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>12</strong> The original intention was to use a different stage set for each performance.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q12\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>13</strong> The question-and-answer session encouraged the team to think about their aims.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q13\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 1</h2>\n            <p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n            \n            <h3>Categorizing societies</h3>\n            \n            <p>When research scholars, including archaeologists and anthropologists, study societies past or present, it can be very useful to have a system of ranking against which to test their ideas. A four-fold categorizing system was developed by the American anthropologist Elman Service; each grouping is associated with certain types of site and settlement. The four types are known as bands, tribes, chiefdoms and early states.</p>\n            \n            <h4>Bands</h4>\n            <p>These are small-scale societies, generally of fewer than 100 people, who live by hunting and gathering, moving seasonally to take advantage of wild (undomesticated) food sources. Most groups who live in this way today, such as the Hadza of Tanzania or the San of southern Africa, would be classified as bands. The members of one band are generally related to each other, either by descent or by marriage. Bands lack formal leaders, so there are no clear economic differences or other differences in status among the members. Because bands are composed of mobile groups, their sites consist mainly of seasonally occupied camps and some other sites, such as work sites, where tools are made or other specific activities are carried out. Archaeological sites associated with this type of society may show evidence of insubstantial dwellings, along with the debris of residential occupation. Most sites from the Palaeolithic period (more than 12,000 years ago) seem to be associated with groups of this type.</p>\n\n            <h4>Tribes</h4>\n            <p>These are generally larger than bands but rarely number more than a few thousand people, whose diet is mainly based on plants or domestic animals. Typically, these people are settled farmers, but for some groups life is nomadic, with a mobile economy based on herds of animals. Although some tribes have officials, these lack the economic base necessary for effective use of power. The typical settlement pattern for tribes is one of permanent agricultural homesteads or villages. Characteristically, no one settlement dominates any of the others in the region. Instead, the archaeologist often finds evidence of isolated, permanently occupied houses, or permanent villages. These latter may be made up of a collection of free-standing houses like those of the first farmers of the Danube Valley in Europe, or their houses may be grouped together, as in the pueblos of the American Southwest, or the early farming village of Catalhoyuk in what is now Turkey.</p>\n\n            <h4>Chiefdoms</h4>\n            <p>These operate on the principle of ranking—differences in social status between people. Different lineages (groups claiming descent from a common ancestor) are graded on a scale of prestige, and the senior lineage, and hence the society as a whole, is governed by a chief. Prestige and rank are determined by how closely related one is to the chief, and there is no true stratification into classes. The role of the chief is crucial.</p>\n            <p>Often, there is local specialisation in craft products such as pottery, cloth and leatherware, and any surplus of these and of foodstuffs is periodically paid to the chief. He uses these to pay his retainers and may also redistribute them to his subjects as rewards. The chiefdom generally has a centre of power, often with temples, residences of the chief and his retainers, and craft specialists. Chiefdoms vary greatly in size, but the range is generally between 5,000 and 20,000 persons. Chiefdoms give indications that some sites were more important than others and may have operated as permanent ritual and ceremonial centres, although they were not centres with an established bureaucracy. Examples are Moundville in Alabama, USA, or the late-Neolithic monuments of Wessex in southern Britain, including the famous ceremonial centre of Stonehenge.</p>\n\n            <h4>Early states</h4>\n            <p>These preserve many of the features of chiefdoms, but the ruler, perhaps a king or queen, has explicit authority to establish laws and to enforce them by means of a standing army. The society no longer depends on kin relationships but is stratified into different classes. Agricultural workers and the poorer urban dwellers make up the base of the pyramid, with the craft specialists above them and the priests and relatives of the ruler higher still. The society is regarded as a territory owned by the ruling lineage and populated by tenants who have the obligation to pay taxes. The central capital houses the officials of a bureaucratic administration. One of their main functions is to collect revenue (often in the form of taxes and tolls) and distribute it to government, army and craft specialists. Many early states developed complex redistribution systems to support these essential services.</p>\n            <p>Early-state societies show a characteristic settlement pattern in which cities play the predominant part. The city is typically a large population centre of more than 5,000 people, with major public buildings, and often there is a pronounced settlement hierarchy with the capital city as the major centre and subsidiary or regional centres as well as local villages.</p>\n            <p>Certainly, it would be wrong to over-emphasise the importance of the four types of society given above, or to spend too long agonising as to whether a particular society should be classified in one category or another. However, in seeking to talk about early societies, we must use words and hence concepts to do so. Elman Service's categories provide us with a good framework to organise our thoughts. They should not, however, deflect us from focusing on changes over time in the different institutions of a society, whether in the social sphere, the organisation of the food quest, technology, contact and exchange, or the spiritual life.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>Categorizing societies</h3>\n<p>When research scholars, including archaeologists and anthropologists, study societies past or present, it can be very useful to have a system of ranking against which to test their ideas. A four-fold categorizing system was developed by the American anthropologist Elman Service; each grouping is associated with certain types of site and settlement. The four types are known as bands, tribes, chiefdoms and early states.</p>\n<h4>Bands</h4>\n<p>These are small-scale societies, generally of fewer than 100 people, who live by hunting and gathering, moving seasonally to take advantage of wild (undomesticated) food sources. Most groups who live in this way today, such as the Hadza of Tanzania or the San of southern Africa, would be classified as bands. The members of one band are generally related to each other, either by descent or by marriage. Bands lack formal leaders, so there are no clear economic differences or other differences in status among the members. Because bands are composed of mobile groups, their sites consist mainly of seasonally occupied camps and some other sites, such as work sites, where tools are made or other specific activities are carried out. Archaeological sites associated with this type of society may show evidence of insubstantial dwellings, along with the debris of residential occupation. Most sites from the Palaeolithic period (more than 12,000 years ago) seem to be associated with groups of this type.</p>\n<h4>Tribes</h4>\n<p>These are generally larger than bands but rarely number more than a few thousand people, whose diet is mainly based on plants or domestic animals. Typically, these people are settled farmers, but for some groups life is nomadic, with a mobile economy based on herds of animals. Although some tribes have officials, these lack the economic base necessary for effective use of power. The typical settlement pattern for tribes is one of permanent agricultural homesteads or villages. Characteristically, no one settlement dominates any of the others in the region. Instead, the archaeologist often finds evidence of isolated, permanently occupied houses, or permanent villages. These latter may be made up of a collection of free-standing houses like those of the first farmers of the Danube Valley in Europe, or their houses may be grouped together, as in the pueblos of the American Southwest, or the early farming village of Catalhoyuk in what is now Turkey.</p>\n<h4>Chiefdoms</h4>\n<p>These operate on the principle of ranking—differences in social status between people. Different lineages (groups claiming descent from a common ancestor) are graded on a scale of prestige, and the senior lineage, and hence the society as a whole, is governed by a chief. Prestige and rank are determined by how closely related one is to the chief, and there is no true stratification into classes. The role of the chief is crucial.</p>\n<p>Often, there is local specialisation in craft products such as pottery, cloth and leatherware, and any surplus of these and of foodstuffs is periodically paid to the chief. He uses these to pay his retainers and may also redistribute them to his subjects as rewards. The chiefdom generally has a centre of power, often with temples, residences of the chief and his retainers, and craft specialists. Chiefdoms vary greatly in size, but the range is generally between 5,000 and 20,000 persons. Chiefdoms give indications that some sites were more important than others and may have operated as permanent ritual and ceremonial centres, although they were not centres with an established bureaucracy. Examples are Moundville in Alabama, USA, or the late-Neolithic monuments of Wessex in southern Britain, including the famous ceremonial centre of Stonehenge.</p>\n<h4>Early states</h4>\n<p>These preserve many of the features of chiefdoms, but the ruler, perhaps a king or queen, has explicit authority to establish laws and to enforce them by means of a standing army. The society no longer depends on kin relationships but is stratified into different classes. Agricultural workers and the poorer urban dwellers make up the base of the pyramid, with the craft specialists above them and the priests and relatives of the ruler higher still. The society is regarded as a territory owned by the ruling lineage and populated by tenants who have the obligation to pay taxes. The central capital houses the officials of a bureaucratic administration. One of their main functions is to collect revenue (often in the form of taxes and tolls) and distribute it to government, army and craft specialists. Many early states developed complex redistribution systems to support these essential services.</p>\n<p>Early-state societies show a characteristic settlement pattern in which cities play the predominant part. The city is typically a large population centre of more than 5,000 people, with major public buildings, and often there is a pronounced settlement hierarchy with the capital city as the major centre and subsidiary or regional centres as well as local villages.</p>\n<p>Certainly, it would be wrong to over-emphasise the importance of the four types of society given above, or to spend too long agonising as to whether a particular society should be classified in one category or another. However, in seeking to talk about early societies, we must use words and hence concepts to do so. Elman Service's categories provide us with a good framework to organise our thoughts. They should not, however, deflect us from focusing on changes over time in the different institutions of a society, whether in the social sphere, the organisation of the food quest, technology, contact and exchange, or the spiritual life.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -37,7 +37,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n                <h4>Questions 1–7</h4>\n                <p>Do the following statements agree with the information given in Reading Passage 1?</p>\n                <p>In boxes 1-7 on your answer sheet write</p>\n                <ul>\n                    <li><strong>TRUE</strong> if the statement agrees with the information</li>\n                    <li><strong>FALSE</strong> if the statement contradicts the information</li>\n                    <li><strong>NOT GIVEN</strong> if there is no information on this</li>\n                </ul>\n                \n                <div class=\"question-item\">\n                    <p><strong>1</strong> There is usually little difference in wealth between the various members of a band.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>2</strong> In tribes, farmers typically grow a wide range of food plants.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>3</strong> A typical tribe has one settlement which is more important than others.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>4</strong> In a chiefdom, social status usually depends on the amount of land a person owns.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>5</strong> A chiefdom typically contains some workers who are engaged in making goods.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>6</strong> An early state may depend on military power to maintain law and order.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>7</strong> Bureaucratic officials in early states receive higher salaries than any other workers.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 1–7</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 1-7 on your answer sheet write</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> There is usually little difference in wealth between the various members of a band.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> In tribes, farmers typically grow a wide range of food plants.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> A typical tribe has one settlement which is more important than others.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> In a chiefdom, social status usually depends on the amount of land a person owns.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> A chiefdom typically contains some workers who are engaged in making goods.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> An early state may depend on military power to maintain law and order.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>7</strong> Bureaucratic officials in early states receive higher salaries than any other workers.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -51,7 +51,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n                <h4>Questions 8–13</h4>\n                <p>Answer the questions below.</p>\n                <p>Choose <strong>NO MORE THAN TWO WORDS AND / OR A NUMBER</strong> from the passage for each answer.</p>\n                \n                <div class=\"question-item\">\n                    <p><strong>8</strong> What items do bands produce at work sites?</p>\n                    <input type=\"text\" id=\"q8_input\" name=\"q8\">\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>9</strong> Which way of life, apart from settled farming, may be followed by people in tribes?</p>\n                    <input type=\"text\" id=\"q9_input\" name=\"q9\">\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>10</strong> How were houses arranged in the village of Catalhoyuk?</p>\n                     <input type=\"text\" id=\"q10_input\" name=\"q10\">\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>11</strong> Which items, apart from craft goods, may be given by a chief to members of his chiefdom?</p>\n                    <input type=\"text\" id=\"q11_input\" name=\"q11\">\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>12</strong> What is usually the maximum number of people living in a society which has a chief?</p>\n                    <input type=\"text\" id=\"q12_input\" name=\"q12\">\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>13</strong> Apart from less wealthy inhabitants of cities, which group forms the lowest class in an early state?</p>\n                    <input type=\"text\" id=\"q13_input\" name=\"q13\">\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Questions 8–13</h4>\n<p>Answer the questions below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS AND / OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"question-item\">\n<p><strong>8</strong> What items do bands produce at work sites?</p>\n<input type=\"text\" id=\"q8_input\" name=\"q8\">\n</div>\n<div class=\"question-item\">\n<p><strong>9</strong> Which way of life, apart from settled farming, may be followed by people in tribes?</p>\n<input type=\"text\" id=\"q9_input\" name=\"q9\">\n</div>\n<div class=\"question-item\">\n<p><strong>10</strong> How were houses arranged in the village of Catalhoyuk?</p>\n<input type=\"text\" id=\"q10_input\" name=\"q10\">\n</div>\n<div class=\"question-item\">\n<p><strong>11</strong> Which items, apart from craft goods, may be given by a chief to members of his chiefdom?</p>\n<input type=\"text\" id=\"q11_input\" name=\"q11\">\n</div>\n<div class=\"question-item\">\n<p><strong>12</strong> What is usually the maximum number of people living in a society which has a chief?</p>\n<input type=\"text\" id=\"q12_input\" name=\"q12\">\n</div>\n<div class=\"question-item\">\n<p><strong>13</strong> Apart from less wealthy inhabitants of cities, which group forms the lowest class in an early state?</p>\n<input type=\"text\" id=\"q13_input\" name=\"q13\">\n</div>\n</div>"
     }
   ],
   "answerKey": {
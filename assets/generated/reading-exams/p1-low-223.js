@@ -11,7 +11,7 @@
       {
         "blockId": "passage-main",
         "kind": "text",
-        "bodyHtml": "<h2>READING PASSAGE 1 <span id=\"timer\">00:00</span></h2>\n        <p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n        <h3>Effect and Cause</h3>\n        <p><em>A chance finding by a Swiss research team explains an event that happened centuries ago around Lake Geneva</em></p>\n        <p>In the sixth century Gregory of Tours, a chronicler of the Germanic people known as the Franks, told of an extraordinary event in what is now Switzerland, where the Rhone River spills into Lake Geneva. He wrote of a big rockfall in the year 563 AD in the vicinity of a place called Tauredunum. The debris plunged into the river, and a great mass of water 'overwhelmed with a sudden and violent flood all that was on the banks as far as the city of Geneva,' more than 64 kilometres across the lake. The Geneva bridge was demolished, and several people inside the city walls of Geneva were killed. Historians and scientists have long believed that Gregory and another chronicler, Marius of Avenches, who told a similar tale, were describing a tsunami that raced across the lake. But there has not been any direct evidence of it until now.</p>\n        <p>Researchers at the University of Geneva now say they have found that evidence, in the form of a large deposit of sediment in the middle of the lake. In a study published in the journal Nature Geoscience, they also propose the sequence of events that caused the deadly surge. The researchers think that large boulders crashed down onto soft sediments which had accumulated at the river mouth because of the slowing of the river's flow when it enters the lake. These sediments formed an underwater delta that had several canyon-like channels. When the falling rocks hit the delta they destabilised the sediments and caused the canyons to collapse. It was this collapse that created the tsunami. The sediments from this collapse would have been propelled towards the lake's centre.</p>\n        <p>Guy Simpson, a lecturer in the University of Geneva's Department of Geology and Paleontology, says the thick layer of sediment, which has the same curved shape as a lens, lies more than 305 metres down in the deepest part of the lake, and was found largely by chance. Katrina Kremer, a University of Geneva doctoral student and the study's lead author, had been conducting seismic soundings, searching for thin sediment layers that might be evidence of major floods that had taken place in pre-historic times, long before the event described by Gregory of Tours. 'But we came across this enormous deposit,' Simpson says. 'We didn't know straight away that it was the deposit that caused the [sixthcentury] tsunami. But it was a jumbled mess of sediment. It was quite obvious that it was deposited rapidly.'</p>\n        <p>The researchers then took samples of the sediments and used carbon-dating techniques on remains of leaves and other organic matter they found to determine when the deposit formed. This narrowed the range to a period between the late fourth century and the early seventh century. Other than the rockfall, there is no record of any special event during that period, Simpson says.</p>\n        <p>The researchers estimated that the deposit, which is at least 9.6 kilometres long by 4.8 kilometres wide, and averages about five metres thick, contains more than 248 million cubic metres of material. They ran multiple computer simulations showing that the collapse of that much sediment at the mouth of the Rhone would have caused a tsunami with an estimated height of 7.9 metres at Geneva - where it would have arrived in about 70 minutes. The rockfall itself may have been set off by a major earthquake, as some scientists have speculated.</p>\n        <p>Lake tsunami, although unusual, are not unknown, says Richard Schweickert, an Emeritus Professor of Geology at the University of Nevada in Reno, in the United States. He cites evidence that the collapse of part of the shoreline of Lake Tahoe in northern California within the past 20,000 years caused a tsunami with wave heights of about 30 metres. There are two faults under the lake that could have caused an earthquake, he says and that the collapse of the Rhone delta sediments, as calculated by the Swiss researchers, 'would certainly be capable of moving a large amount of material into the lake.' He suggests that the findings could be corroborated by careful mapping of the shoreline to look for unusual deposits or erosion left behind by the giant waves.</p>\n        <p>Simpson says the Rhone delta sediments might collapse again, perhaps from an earthquake or even their own weight. In the sixth century, Geneva was a small community, mostly behind walls on a hill, whereas today it is home to international organisations and about 200,000 people, many living in low-lying areas near the water. Testing the stability of nearby slopes, and creating more detailed models of how a tsunami could affect Geneva today, would provide a more accurate assessment of whether or not this is something the lakeside city should be concerned about.</p>\n        <p>Most tsunamis occur in oceans and are generated by earthquakes. However, the study is a reminder that even a landlocked nation like Switzerland is not immune to catastrophic waves.</p>\n    </section>\n    <div id=\"divider\" title=\"Drag to resize\"></div>"
+        "bodyHtml": "<h2>READING PASSAGE 1 <span id=\"timer\">00:00</span></h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>Effect and Cause</h3>\n<p><em>A chance finding by a Swiss research team explains an event that happened centuries ago around Lake Geneva</em></p>\n<p>In the sixth century Gregory of Tours, a chronicler of the Germanic people known as the Franks, told of an extraordinary event in what is now Switzerland, where the Rhone River spills into Lake Geneva. He wrote of a big rockfall in the year 563 AD in the vicinity of a place called Tauredunum. The debris plunged into the river, and a great mass of water 'overwhelmed with a sudden and violent flood all that was on the banks as far as the city of Geneva,' more than 64 kilometres across the lake. The Geneva bridge was demolished, and several people inside the city walls of Geneva were killed. Historians and scientists have long believed that Gregory and another chronicler, Marius of Avenches, who told a similar tale, were describing a tsunami that raced across the lake. But there has not been any direct evidence of it until now.</p>\n<p>Researchers at the University of Geneva now say they have found that evidence, in the form of a large deposit of sediment in the middle of the lake. In a study published in the journal Nature Geoscience, they also propose the sequence of events that caused the deadly surge. The researchers think that large boulders crashed down onto soft sediments which had accumulated at the river mouth because of the slowing of the river's flow when it enters the lake. These sediments formed an underwater delta that had several canyon-like channels. When the falling rocks hit the delta they destabilised the sediments and caused the canyons to collapse. It was this collapse that created the tsunami. The sediments from this collapse would have been propelled towards the lake's centre.</p>\n<p>Guy Simpson, a lecturer in the University of Geneva's Department of Geology and Paleontology, says the thick layer of sediment, which has the same curved shape as a lens, lies more than 305 metres down in the deepest part of the lake, and was found largely by chance. Katrina Kremer, a University of Geneva doctoral student and the study's lead author, had been conducting seismic soundings, searching for thin sediment layers that might be evidence of major floods that had taken place in pre-historic times, long before the event described by Gregory of Tours. 'But we came across this enormous deposit,' Simpson says. 'We didn't know straight away that it was the deposit that caused the [sixthcentury] tsunami. But it was a jumbled mess of sediment. It was quite obvious that it was deposited rapidly.'</p>\n<p>The researchers then took samples of the sediments and used carbon-dating techniques on remains of leaves and other organic matter they found to determine when the deposit formed. This narrowed the range to a period between the late fourth century and the early seventh century. Other than the rockfall, there is no record of any special event during that period, Simpson says.</p>\n<p>The researchers estimated that the deposit, which is at least 9.6 kilometres long by 4.8 kilometres wide, and averages about five metres thick, contains more than 248 million cubic metres of material. They ran multiple computer simulations showing that the collapse of that much sediment at the mouth of the Rhone would have caused a tsunami with an estimated height of 7.9 metres at Geneva - where it would have arrived in about 70 minutes. The rockfall itself may have been set off by a major earthquake, as some scientists have speculated.</p>\n<p>Lake tsunami, although unusual, are not unknown, says Richard Schweickert, an Emeritus Professor of Geology at the University of Nevada in Reno, in the United States. He cites evidence that the collapse of part of the shoreline of Lake Tahoe in northern California within the past 20,000 years caused a tsunami with wave heights of about 30 metres. There are two faults under the lake that could have caused an earthquake, he says and that the collapse of the Rhone delta sediments, as calculated by the Swiss researchers, 'would certainly be capable of moving a large amount of material into the lake.' He suggests that the findings could be corroborated by careful mapping of the shoreline to look for unusual deposits or erosion left behind by the giant waves.</p>\n<p>Simpson says the Rhone delta sediments might collapse again, perhaps from an earthquake or even their own weight. In the sixth century, Geneva was a small community, mostly behind walls on a hill, whereas today it is home to international organisations and about 200,000 people, many living in low-lying areas near the water. Testing the stability of nearby slopes, and creating more detailed models of how a tsunami could affect Geneva today, would provide a more accurate assessment of whether or not this is something the lakeside city should be concerned about.</p>\n<p>Most tsunamis occur in oceans and are generated by earthquakes. However, the study is a reminder that even a landlocked nation like Switzerland is not immune to catastrophic waves.</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"
       }
     ]
   },
@@ -28,7 +28,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\">\n            <h4>Questions 1–7</h4>\n            <p>Do the following statements agree with the information given in Reading Passage 1? In boxes 1–7 write <strong>TRUE, FALSE or NOT GIVEN</strong>.</p>\n\n            <div id=\"q1-anchor\" class=\"question-block\">\n                <p class=\"question-text\">1. According to Gregory of Tours, the landslide which caused the flood happened near Tauredunum.</p>\n                <div class=\"yesno-group\">\n                    <label><input type=\"radio\" name=\"q1\" value=\"TRUE\" onchange=\"markAnswered(1)\"> TRUE</label>\n                    <label><input type=\"radio\" name=\"q1\" value=\"FALSE\" onchange=\"markAnswered(1)\"> FALSE</label>\n                    <label><input type=\"radio\" name=\"q1\" value=\"NOT GIVEN\" onchange=\"markAnswered(1)\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div id=\"q2-anchor\" class=\"question-block\">\n                <p class=\"question-text\">2. The city of Geneva was undamaged by the tsunami that Gregory described.</p>\n                <div class=\"yesno-group\">\n                    <label><input type=\"radio\" name=\"q2\" value=\"TRUE\" onchange=\"markAnswered(2)\"> TRUE</label>\n                    <label><input type=\"radio\" name=\"q2\" value=\"FALSE\" onchange=\"markAnswered(2)\"> FALSE</label>\n                    <label><input type=\"radio\" name=\"q2\" value=\"NOT GIVEN\" onchange=\"markAnswered(2)\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div id=\"q3-anchor\" class=\"question-block\">\n                <p class=\"question-text\">3. The work of Marius of Avenches supported the idea that there was a tsunami.</p>\n                <div class=\"yesno-group\">\n                    <label><input type=\"radio\" name=\"q3\" value=\"TRUE\" onchange=\"markAnswered(3)\"> TRUE</label>\n                    <label><input type=\"radio\" name=\"q3\" value=\"FALSE\" onchange=\"markAnswered(3)\"> FALSE</label>\n                    <label><input type=\"radio\" name=\"q3\" value=\"NOT GIVEN\" onchange=\"markAnswered(3)\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div id=\"q4-anchor\" class=\"question-block\">\n                <p class=\"question-text\">4. The rocks which fell into the delta were very hard and dense.</p>\n                <div class=\"yesno-group\">\n                    <label><input type=\"radio\" name=\"q4\" value=\"TRUE\" onchange=\"markAnswered(4)\"> TRUE</label>\n                    <label><input type=\"radio\" name=\"q4\" value=\"FALSE\" onchange=\"markAnswered(4)\"> FALSE</label>\n                    <label><input type=\"radio\" name=\"q4\" value=\"NOT GIVEN\" onchange=\"markAnswered(4)\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div id=\"q5-anchor\" class=\"question-block\">\n                <p class=\"question-text\">5. Richard Schweickert has published studies on lake tsunamis that have occurred in several countries.</p>\n                <div class=\"yesno-group\">\n                    <label><input type=\"radio\" name=\"q5\" value=\"TRUE\" onchange=\"markAnswered(5)\"> TRUE</label>\n                    <label><input type=\"radio\" name=\"q5\" value=\"FALSE\" onchange=\"markAnswered(5)\"> FALSE</label>\n                    <label><input type=\"radio\" name=\"q5\" value=\"NOT GIVEN\" onchange=\"markAnswered(5)\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div id=\"q6-anchor\" class=\"question-block\">\n                <p class=\"question-text\">6. The shoreline of Lake Tahoe has remained unchanged for 20,000 years.</p>\n                <div class=\"yesno-group\">\n                    <label><input type=\"radio\" name=\"q6\" value=\"TRUE\" onchange=\"markAnswered(6)\"> TRUE</label>\n                    <label><input type=\"radio\" name=\"q6\" value=\"FALSE\" onchange=\"markAnswered(6)\"> FALSE</label>\n                    <label><input type=\"radio\" name=\"q6\" value=\"NOT GIVEN\" onchange=\"markAnswered(6)\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div id=\"q7-anchor\" class=\"question-block\">\n                <p class=\"question-text\">7. Parts of the population of Geneva now live closer to the lake than was the case in the sixth century.</p>\n                <div class=\"yesno-group\">\n                    <label><input type=\"radio\" name=\"q7\" value=\"TRUE\" onchange=\"markAnswered(7)\"> TRUE</label>\n                    <label><input type=\"radio\" name=\"q7\" value=\"FALSE\" onchange=\"markAnswered(7)\"> FALSE</label>\n                    <label><input type=\"radio\" name=\"q7\" value=\"NOT GIVEN\" onchange=\"markAnswered(7)\"> NOT GIVEN</label>\n                </div>\n            </div>\n        </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 1–7</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1? In boxes 1–7 write <strong>TRUE, FALSE or NOT GIVEN</strong>.</p>\n<div id=\"q1-anchor\" class=\"question-block\">\n<p class=\"question-text\">1. According to Gregory of Tours, the landslide which caused the flood happened near Tauredunum.</p>\n<div class=\"yesno-group\">\n<label><input type=\"radio\" name=\"q1\" value=\"TRUE\" onchange=\"markAnswered(1)\"> TRUE</label> <label><input type=\"radio\" name=\"q1\" value=\"FALSE\" onchange=\"markAnswered(1)\"> FALSE</label> <label><input type=\"radio\" name=\"q1\" value=\"NOT GIVEN\" onchange=\"markAnswered(1)\"> NOT GIVEN</label>\n</div>\n</div>\n<div id=\"q2-anchor\" class=\"question-block\">\n<p class=\"question-text\">2. The city of Geneva was undamaged by the tsunami that Gregory described.</p>\n<div class=\"yesno-group\">\n<label><input type=\"radio\" name=\"q2\" value=\"TRUE\" onchange=\"markAnswered(2)\"> TRUE</label> <label><input type=\"radio\" name=\"q2\" value=\"FALSE\" onchange=\"markAnswered(2)\"> FALSE</label> <label><input type=\"radio\" name=\"q2\" value=\"NOT GIVEN\" onchange=\"markAnswered(2)\"> NOT GIVEN</label>\n</div>\n</div>\n<div id=\"q3-anchor\" class=\"question-block\">\n<p class=\"question-text\">3. The work of Marius of Avenches supported the idea that there was a tsunami.</p>\n<div class=\"yesno-group\">\n<label><input type=\"radio\" name=\"q3\" value=\"TRUE\" onchange=\"markAnswered(3)\"> TRUE</label> <label><input type=\"radio\" name=\"q3\" value=\"FALSE\" onchange=\"markAnswered(3)\"> FALSE</label> <label><input type=\"radio\" name=\"q3\" value=\"NOT GIVEN\" onchange=\"markAnswered(3)\"> NOT GIVEN</label>\n</div>\n</div>\n<div id=\"q4-anchor\" class=\"question-block\">\n<p class=\"question-text\">4. The rocks which fell into the delta were very hard and dense.</p>\n<div class=\"yesno-group\">\n<label><input type=\"radio\" name=\"q4\" value=\"TRUE\" onchange=\"markAnswered(4)\"> TRUE</label> <label><input type=\"radio\" name=\"q4\" value=\"FALSE\" onchange=\"markAnswered(4)\"> FALSE</label> <label><input type=\"radio\" name=\"q4\" value=\"NOT GIVEN\" onchange=\"markAnswered(4)\"> NOT GIVEN</label>\n</div>\n</div>\n<div id=\"q5-anchor\" class=\"question-block\">\n<p class=\"question-text\">5. Richard Schweickert has published studies on lake tsunamis that have occurred in several countries.</p>\n<div class=\"yesno-group\">\n<label><input type=\"radio\" name=\"q5\" value=\"TRUE\" onchange=\"markAnswered(5)\"> TRUE</label> <label><input type=\"radio\" name=\"q5\" value=\"FALSE\" onchange=\"markAnswered(5)\"> FALSE</label> <label><input type=\"radio\" name=\"q5\" value=\"NOT GIVEN\" onchange=\"markAnswered(5)\"> NOT GIVEN</label>\n</div>\n</div>\n<div id=\"q6-anchor\" class=\"question-block\">\n<p class=\"question-text\">6. The shoreline of Lake Tahoe has remained unchanged for 20,000 years.</p>\n<div class=\"yesno-group\">\n<label><input type=\"radio\" name=\"q6\" value=\"TRUE\" onchange=\"markAnswered(6)\"> TRUE</label> <label><input type=\"radio\" name=\"q6\" value=\"FALSE\" onchange=\"markAnswered(6)\"> FALSE</label> <label><input type=\"radio\" name=\"q6\" value=\"NOT GIVEN\" onchange=\"markAnswered(6)\"> NOT GIVEN</label>\n</div>\n</div>\n<div id=\"q7-anchor\" class=\"question-block\">\n<p class=\"question-text\">7. Parts of the population of Geneva now live closer to the lake than was the case in the sixth century.</p>\n<div class=\"yesno-group\">\n<label><input type=\"radio\" name=\"q7\" value=\"TRUE\" onchange=\"markAnswered(7)\"> TRUE</label> <label><input type=\"radio\" name=\"q7\" value=\"FALSE\" onchange=\"markAnswered(7)\"> FALSE</label> <label><input type=\"radio\" name=\"q7\" value=\"NOT GIVEN\" onchange=\"markAnswered(7)\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -41,7 +41,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\">\n            <h4>Questions 8–13</h4>\n            <p>Complete the flow-chart below. Choose <strong>ONE WORD AND/OR A NUMBER</strong> from the passage for each answer.</p>\n            <p><strong>The evidence for a tsunami in Lake Geneva</strong></p>\n\n            <div id=\"q8-anchor\" class=\"flowchart-item\">\n                <span class=\"flowchart-text\">Katrina Kremer was looking for indications of prehistoric</span>\n                <input type=\"text\" id=\"q8\" placeholder=\"(one word)\" oninput=\"markAnswered(8)\" name=\"q8\">\n                <span>that had occurred before the sixth-century event.</span>\n            </div>\n            <div class=\"flowchart-item\">\n                <span class=\"flowchart-text\">Instead her research team found a large lens-shaped deposit.</span>\n            </div>\n            <div class=\"flowchart-item\">\n                <span class=\"flowchart-text\">Researchers extracted samples from the deposit and dated organic material such as</span>\n                <input type=\"text\" id=\"q9\" placeholder=\"(one word)\" oninput=\"markAnswered(9)\" name=\"q9\">\n            </div>\n            <div class=\"flowchart-item\">\n                <span class=\"flowchart-text\">Carbon-dating confirmed that the deposit was present in the lake by the beginning of the</span>\n                <input type=\"text\" id=\"q10\" placeholder=\"(e.g. fifth)\" oninput=\"markAnswered(10)\" name=\"q10\">\n                <span>century.</span>\n            </div>\n            <div class=\"flowchart-item\">\n                <span class=\"flowchart-text\">The volume of the deposit was then</span>\n                <input type=\"text\" id=\"q11\" placeholder=\"(one word)\" oninput=\"markAnswered(11)\" name=\"q11\">\n                <span>by the scientists.</span>\n            </div>\n            <div class=\"flowchart-item\">\n                <span class=\"flowchart-text\">The researchers established the approximate</span>\n                <input type=\"text\" id=\"q12\" placeholder=\"(one word)\" oninput=\"markAnswered(12)\" name=\"q12\">\n                <span>and speed of the tsunami through extensive computer modelling.</span>\n            </div>\n            <div class=\"flowchart-item\">\n                <span class=\"flowchart-text\">A likely cause of the rockfall was a significant</span>\n                <input type=\"text\" id=\"q13\" placeholder=\"(one word)\" oninput=\"markAnswered(13)\" name=\"q13\">\n            </div>\n        </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 8–13</h4>\n<p>Complete the flow-chart below. Choose <strong>ONE WORD AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<p><strong>The evidence for a tsunami in Lake Geneva</strong></p>\n<div id=\"q8-anchor\" class=\"flowchart-item\">\n<span class=\"flowchart-text\">Katrina Kremer was looking for indications of prehistoric</span> <input type=\"text\" id=\"q8\" placeholder=\"(one word)\" oninput=\"markAnswered(8)\" name=\"q8\"> <span>that had occurred before the sixth-century event.</span>\n</div>\n<div class=\"flowchart-item\">\n<span class=\"flowchart-text\">Instead her research team found a large lens-shaped deposit.</span>\n</div>\n<div class=\"flowchart-item\">\n<span class=\"flowchart-text\">Researchers extracted samples from the deposit and dated organic material such as</span> <input type=\"text\" id=\"q9\" placeholder=\"(one word)\" oninput=\"markAnswered(9)\" name=\"q9\">\n</div>\n<div class=\"flowchart-item\">\n<span class=\"flowchart-text\">Carbon-dating confirmed that the deposit was present in the lake by the beginning of the</span> <input type=\"text\" id=\"q10\" placeholder=\"(e.g. fifth)\" oninput=\"markAnswered(10)\" name=\"q10\"> <span>century.</span>\n</div>\n<div class=\"flowchart-item\">\n<span class=\"flowchart-text\">The volume of the deposit was then</span> <input type=\"text\" id=\"q11\" placeholder=\"(one word)\" oninput=\"markAnswered(11)\" name=\"q11\"> <span>by the scientists.</span>\n</div>\n<div class=\"flowchart-item\">\n<span class=\"flowchart-text\">The researchers established the approximate</span> <input type=\"text\" id=\"q12\" placeholder=\"(one word)\" oninput=\"markAnswered(12)\" name=\"q12\"> <span>and speed of the tsunami through extensive computer modelling.</span>\n</div>\n<div class=\"flowchart-item\">\n<span class=\"flowchart-text\">A likely cause of the rockfall was a significant</span> <input type=\"text\" id=\"q13\" placeholder=\"(one word)\" oninput=\"markAnswered(13)\" name=\"q13\">\n</div>\n</div>"
     }
   ],
   "answerKey": {
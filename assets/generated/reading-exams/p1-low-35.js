@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 1</h2>\n            <p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n            \n            <h3>Sweet Trouble</h3>\n            <h4>Problems in the Australian sugar industry</h4>\n            \n            <p>The Australian town of Mossman in the state of Queensland sits in a tropical landscape between the rainforest and the Great Barrier Reef. Eco-tourism is important there; more than 80 per cent of Douglas Shire, of which Mossman is the administrative centre, is protected by World Heritage listing. But for most of the town's history, forest and reef have been largely irrelevant: since the sugar mill was built in 1894, the town has relied on sugarcane. Now Mossman is holding its breath. For two years the mill used by all the farms has been close to bankruptcy. It is at the centre of the economic shocks that have shaken Australia's sugar industry, and for lifetime farmers and a long list of cane-industry workers a way of life will disappear if the mill closes. Mossman has roughly 160 growers, who now produce less than one million tonnes of the nation's annual cane harvest of 30–40 million tonnes. But it is a microcosm of the industry. All across Australia, the cane-growing business is being squeezed between the pincers of economics and the environment.</p>\n\n            <p>The ten-year average return to sugar growers throughout the 1990s was about $350 a tonne. In early 2004, sugar prices plummeted, resulting in a 25-year-low average price for Australian sugar of about $232 a tonne. Although figures vary widely across farms and regions, that was about what it cost to grow a tonne of sugar in Australia. To forestall social and economic disaster, the Government offered more than $400 million to encourage growers to leave the industry. By the end of the year, 21 farmers had taken up the offer to leave, but another 1,000 are thought to be seriously considering it, allowing those remaining to buy the vacated land and improve their economies of scale.</p>\n\n            <p>Fourth-generation Mossman grower Bill Phillips-Turner is one who plans to fight on. 'The consequences of losing the mill would be catastrophic,' Bill says. 'Sugar has a big economic multiplier effect: for every dollar generated from sugar, an additional $7 is generated in the wider community. Because of limited options around here, most people now employed by the industry would have to leave the area to find work.' The farmer-shareholders have so far saved the mill by accepting substantial cuts to cane payments, but this has come at a big cost to everyone. As chairman of the board of the mill, Bill has presided over some tough and unpopular decisions; the hardest was slashing the mill workforce. Assets were sold and maintenance costs cut. The board has also worked hard to find new ways of doing business. Ethanol production, where sugar is used to produce fuel, has potential, and co-generation, using cane waste to generate electric power, is another possibility. However, the most radical—but preferred—alternative is to create a future for the mill as a food factory, turning out quality sugar-based foods.</p>\n            \n            <p>In addition to the economic struggle, there is the environmental one. The sugar industry has the reputation of being environmentally damaging, but it has some surprising supporters. Douglas Shire mayor, Mike Berwick, is a well-known environmentalist and might be expected to be anti-cane. ‘There's no question of the past damage it's done to the reef through chemical and nutrient run-off*,' he says. 'But there's a formula for sustainable cane production and Mossman has nearly reached it.' Another surprise endorsement for cane comes from the Queensland Environmental Protection Agency's sugar liaison officer, Karen Benn. 'I'm less worried about the effect of cane on the environment than I am about other agriculture,' she says. 'There are good growers everywhere, but at Mossman they seem to have taken up the challenges faster.' For example, sediment run-off, previously one of the main environmental problems caused by cane growing, is now nothing like it once was, according to Dr Brian Roberts, co-ordinator of the Douglas Shire Water Quality Improvement Program. ‘North Queensland used to hold the record for soil loss,' he says. 'Now ... cane country is accumulating soil.'</p>\n\n            <p>However, these improvements have been achieved at a great cost to growers. Now in his 60s, Tom Watters has spent a lifetime on the same farm. Fourteen years ago, he was alerted to the effect his cane could be having on Mackay Creek, the narrow waterway that receives all his run-off, and so Tom planted a 5,000-tree buffer along the edge of the creek, built up the edges of the creek with rocks to prevent erosion, and began exploring farming methods that cause minimal soil disturbance. However, none of these costly initiatives has helped him get better cane prices. Another cane grower, Doug Crees, comments that 'Economically, it [cane growing] doesn't make much sense. But there's more to life than money.' It's this addiction to the way of life that keeps many cane farmers growing an underperforming crop. 'It's a good lifestyle,' Doug says. 'I spend eight months working on the farm and four months looking after our kids while my wife works in town. I've been looking at alternative crops, like forestry and cocoa, and it turns out that working away from the farm is the best diversification we could do. However, I still don't want to do that.'</p>\n\n            <p>It is difficult to see how anyone can deal satisfactorily with the passing of a way of life. Cane farmers have been part of eastern Queensland for more than a century, but despite the efforts they have put into fighting the good environmental fight, there is no guarantee that the new way of life evolving there will include cane.</p>\n            \n            <p><em>*run-off: water that is used for agriculture and then passes into waterways, carrying soil and agricultural chemicals with it</em></p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>Sweet Trouble</h3>\n<h4>Problems in the Australian sugar industry</h4>\n<p>The Australian town of Mossman in the state of Queensland sits in a tropical landscape between the rainforest and the Great Barrier Reef. Eco-tourism is important there; more than 80 per cent of Douglas Shire, of which Mossman is the administrative centre, is protected by World Heritage listing. But for most of the town's history, forest and reef have been largely irrelevant: since the sugar mill was built in 1894, the town has relied on sugarcane. Now Mossman is holding its breath. For two years the mill used by all the farms has been close to bankruptcy. It is at the centre of the economic shocks that have shaken Australia's sugar industry, and for lifetime farmers and a long list of cane-industry workers a way of life will disappear if the mill closes. Mossman has roughly 160 growers, who now produce less than one million tonnes of the nation's annual cane harvest of 30–40 million tonnes. But it is a microcosm of the industry. All across Australia, the cane-growing business is being squeezed between the pincers of economics and the environment.</p>\n<p>The ten-year average return to sugar growers throughout the 1990s was about $350 a tonne. In early 2004, sugar prices plummeted, resulting in a 25-year-low average price for Australian sugar of about $232 a tonne. Although figures vary widely across farms and regions, that was about what it cost to grow a tonne of sugar in Australia. To forestall social and economic disaster, the Government offered more than $400 million to encourage growers to leave the industry. By the end of the year, 21 farmers had taken up the offer to leave, but another 1,000 are thought to be seriously considering it, allowing those remaining to buy the vacated land and improve their economies of scale.</p>\n<p>Fourth-generation Mossman grower Bill Phillips-Turner is one who plans to fight on. 'The consequences of losing the mill would be catastrophic,' Bill says. 'Sugar has a big economic multiplier effect: for every dollar generated from sugar, an additional $7 is generated in the wider community. Because of limited options around here, most people now employed by the industry would have to leave the area to find work.' The farmer-shareholders have so far saved the mill by accepting substantial cuts to cane payments, but this has come at a big cost to everyone. As chairman of the board of the mill, Bill has presided over some tough and unpopular decisions; the hardest was slashing the mill workforce. Assets were sold and maintenance costs cut. The board has also worked hard to find new ways of doing business. Ethanol production, where sugar is used to produce fuel, has potential, and co-generation, using cane waste to generate electric power, is another possibility. However, the most radical—but preferred—alternative is to create a future for the mill as a food factory, turning out quality sugar-based foods.</p>\n<p>In addition to the economic struggle, there is the environmental one. The sugar industry has the reputation of being environmentally damaging, but it has some surprising supporters. Douglas Shire mayor, Mike Berwick, is a well-known environmentalist and might be expected to be anti-cane. ‘There's no question of the past damage it's done to the reef through chemical and nutrient run-off*,' he says. 'But there's a formula for sustainable cane production and Mossman has nearly reached it.' Another surprise endorsement for cane comes from the Queensland Environmental Protection Agency's sugar liaison officer, Karen Benn. 'I'm less worried about the effect of cane on the environment than I am about other agriculture,' she says. 'There are good growers everywhere, but at Mossman they seem to have taken up the challenges faster.' For example, sediment run-off, previously one of the main environmental problems caused by cane growing, is now nothing like it once was, according to Dr Brian Roberts, co-ordinator of the Douglas Shire Water Quality Improvement Program. ‘North Queensland used to hold the record for soil loss,' he says. 'Now ... cane country is accumulating soil.'</p>\n<p>However, these improvements have been achieved at a great cost to growers. Now in his 60s, Tom Watters has spent a lifetime on the same farm. Fourteen years ago, he was alerted to the effect his cane could be having on Mackay Creek, the narrow waterway that receives all his run-off, and so Tom planted a 5,000-tree buffer along the edge of the creek, built up the edges of the creek with rocks to prevent erosion, and began exploring farming methods that cause minimal soil disturbance. However, none of these costly initiatives has helped him get better cane prices. Another cane grower, Doug Crees, comments that 'Economically, it [cane growing] doesn't make much sense. But there's more to life than money.' It's this addiction to the way of life that keeps many cane farmers growing an underperforming crop. 'It's a good lifestyle,' Doug says. 'I spend eight months working on the farm and four months looking after our kids while my wife works in town. I've been looking at alternative crops, like forestry and cocoa, and it turns out that working away from the farm is the best diversification we could do. However, I still don't want to do that.'</p>\n<p>It is difficult to see how anyone can deal satisfactorily with the passing of a way of life. Cane farmers have been part of eastern Queensland for more than a century, but despite the efforts they have put into fighting the good environmental fight, there is no guarantee that the new way of life evolving there will include cane.</p>\n<p><em>*run-off: water that is used for agriculture and then passes into waterways, carrying soil and agricultural chemicals with it</em></p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -34,7 +34,7 @@
         "q3",
         "q4"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n                <h4>Questions 1–4</h4>\n                <p>Look at the following statements (Questions 1–4) and the list of people below.</p>\n                <p>Match each statement with the correct person, <strong>A–F</strong>.</p>\n                <p><em>Write the correct letter, <strong>A–F</strong>, in boxes 1–4 on your answer sheet.</em></p>\n\n                <div class=\"match-question-item\">\n                    <p><strong>1</strong> Mossman cane-farming practices are close to an environmentally friendly model.</p>\n                    <div class=\"match-dropzone\" data-question=\"q1\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>2</strong> Financial return is not the only important factor for cane growers.</p>\n                    <div class=\"match-dropzone\" data-question=\"q2\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>3</strong> Cane sugar may not harm the environment as much as other crops do.</p>\n                    <div class=\"match-dropzone\" data-question=\"q3\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>4</strong> The local population would decline if the sugar-processing plant closed.</p>\n                    <div class=\"match-dropzone\" data-question=\"q4\"></div>\n                </div>\n\n                <div class=\"options-pool\" id=\"people-options-pool\">\n                    <strong>List of People</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Bill Phillips-Turner</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Mike Berwick</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Karen Benn</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Brian Roberts</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Tom Watters</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F Doug Crees</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 1–4</h4>\n<p>Look at the following statements (Questions 1–4) and the list of people below.</p>\n<p>Match each statement with the correct person, <strong>A–F</strong>.</p>\n<p><em>Write the correct letter, <strong>A–F</strong>, in boxes 1–4 on your answer sheet.</em></p>\n<div class=\"match-question-item\">\n<p><strong>1</strong> Mossman cane-farming practices are close to an environmentally friendly model.</p>\n<div class=\"match-dropzone\" data-question=\"q1\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>2</strong> Financial return is not the only important factor for cane growers.</p>\n<div class=\"match-dropzone\" data-question=\"q2\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>3</strong> Cane sugar may not harm the environment as much as other crops do.</p>\n<div class=\"match-dropzone\" data-question=\"q3\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>4</strong> The local population would decline if the sugar-processing plant closed.</p>\n<div class=\"match-dropzone\" data-question=\"q4\"></div>\n</div>\n<div class=\"options-pool\" id=\"people-options-pool\">\n<strong>List of People</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Bill Phillips-Turner</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Mike Berwick</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Karen Benn</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Brian Roberts</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Tom Watters</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F Doug Crees</div>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -46,7 +46,7 @@
         "q7",
         "q8"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-anchor\">\n                <h4>Questions 5–8</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <ul>\n                    <li>\n                        <p><strong>5</strong> In the first paragraph, the writer says that the town is ‘holding its breath’ because</p>\n                        <div class=\"options\">\n                           <label><input type=\"radio\" name=\"q5\" value=\"A\"> A it has environmental problems.</label>\n                           <label><input type=\"radio\" name=\"q5\" value=\"B\"> B its tourism business is threatened.</label>\n                           <label><input type=\"radio\" name=\"q5\" value=\"C\"> C most of its people have left the town.</label>\n                           <label><input type=\"radio\" name=\"q5\" value=\"D\"> D a key processing plant may shut down.</label>\n                        </div>\n                    </li>\n                     <li>\n                        <p><strong>6</strong> According to the writer, cane growers who refuse the Government offer are expected to</p>\n                        <div class=\"options\">\n                           <label><input type=\"radio\" name=\"q6\" value=\"A\"> A expand their farms.</label>\n                           <label><input type=\"radio\" name=\"q6\" value=\"B\"> B sell their land at a low price.</label>\n                           <label><input type=\"radio\" name=\"q6\" value=\"C\"> C find jobs in other industries.</label>\n                           <label><input type=\"radio\" name=\"q6\" value=\"D\"> D seek financial help from banks.</label>\n                        </div>\n                    </li>\n                     <li>\n                        <p><strong>7</strong> Which of the following did Bill Phillips-Turner find most difficult to do?</p>\n                        <div class=\"options\">\n                           <label><input type=\"radio\" name=\"q7\" value=\"A\"> A sell mill property</label>\n                           <label><input type=\"radio\" name=\"q7\" value=\"B\"> B reduce spending on upkeep</label>\n                           <label><input type=\"radio\" name=\"q7\" value=\"C\"> C lower mill workers' wages</label>\n                           <label><input type=\"radio\" name=\"q7\" value=\"D\"> D cut the number of mill staff</label>\n                        </div>\n                    </li>\n                    <li>\n                        <p><strong>8</strong> Cane grower Doug Crees says that he</p>\n                        <div class=\"options\">\n                           <label><input type=\"radio\" name=\"q8\" value=\"A\"> A would prefer to grow cocoa.</label>\n                           <label><input type=\"radio\" name=\"q8\" value=\"B\"> B wants to remain on his farm.</label>\n                           <label><input type=\"radio\" name=\"q8\" value=\"C\"> C wants his family to live together.</label>\n                           <label><input type=\"radio\" name=\"q8\" value=\"D\"> D will look for part-time work in town.</label>\n                        </div>\n                    </li>\n                </ul>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-anchor\">\n<h4>Questions 5–8</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<ul>\n<li>\n<p><strong>5</strong> In the first paragraph, the writer says that the town is ‘holding its breath’ because</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q5\" value=\"A\"> A it has environmental problems.</label> <label><input type=\"radio\" name=\"q5\" value=\"B\"> B its tourism business is threatened.</label> <label><input type=\"radio\" name=\"q5\" value=\"C\"> C most of its people have left the town.</label> <label><input type=\"radio\" name=\"q5\" value=\"D\"> D a key processing plant may shut down.</label>\n</div>\n</li>\n<li>\n<p><strong>6</strong> According to the writer, cane growers who refuse the Government offer are expected to</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q6\" value=\"A\"> A expand their farms.</label> <label><input type=\"radio\" name=\"q6\" value=\"B\"> B sell their land at a low price.</label> <label><input type=\"radio\" name=\"q6\" value=\"C\"> C find jobs in other industries.</label> <label><input type=\"radio\" name=\"q6\" value=\"D\"> D seek financial help from banks.</label>\n</div>\n</li>\n<li>\n<p><strong>7</strong> Which of the following did Bill Phillips-Turner find most difficult to do?</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q7\" value=\"A\"> A sell mill property</label> <label><input type=\"radio\" name=\"q7\" value=\"B\"> B reduce spending on upkeep</label> <label><input type=\"radio\" name=\"q7\" value=\"C\"> C lower mill workers' wages</label> <label><input type=\"radio\" name=\"q7\" value=\"D\"> D cut the number of mill staff</label>\n</div>\n</li>\n<li>\n<p><strong>8</strong> Cane grower Doug Crees says that he</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q8\" value=\"A\"> A would prefer to grow cocoa.</label> <label><input type=\"radio\" name=\"q8\" value=\"B\"> B wants to remain on his farm.</label> <label><input type=\"radio\" name=\"q8\" value=\"C\"> C wants his family to live together.</label> <label><input type=\"radio\" name=\"q8\" value=\"D\"> D will look for part-time work in town.</label>\n</div>\n</li>\n</ul>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -58,7 +58,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n                 <h4>Questions 9–13</h4>\n                <p>Do the following statements agree with the information given in Reading Passage 1?</p>\n                <p>In boxes 9–13 on your answer sheet, write</p>\n                <p>\n                    <strong>TRUE</strong> if the statement agrees with the information<br>\n                    <strong>FALSE</strong> if the statement contradicts the information<br>\n                    <strong>NOT GIVEN</strong> if there is no information on this\n                </p>\n                <ul>\n                    <li>\n                        <p><strong>9</strong> In 2004, the cost of producing sugar in Australia was similar to the selling price.</p>\n                        <div class=\"options\">\n                           <label><input type=\"radio\" name=\"q9\" value=\"TRUE\"> TRUE</label>\n                           <label><input type=\"radio\" name=\"q9\" value=\"FALSE\"> FALSE</label>\n                           <label><input type=\"radio\" name=\"q9\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                        </div>\n                    </li>\n                    <li>\n                        <p><strong>10</strong> Farmers who accepted the Government offer have mostly moved to the city.</p>\n                        <div class=\"options\">\n                           <label><input type=\"radio\" name=\"q10\" value=\"TRUE\"> TRUE</label>\n                           <label><input type=\"radio\" name=\"q10\" value=\"FALSE\"> FALSE</label>\n                           <label><input type=\"radio\" name=\"q10\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                        </div>\n                    </li>\n                    <li>\n                        <p><strong>11</strong> Fuel production is regarded as the most desirable alternative business for the sugar mill.</p>\n                        <div class=\"options\">\n                           <label><input type=\"radio\" name=\"q11\" value=\"TRUE\"> TRUE</label>\n                           <label><input type=\"radio\" name=\"q11\" value=\"FALSE\"> FALSE</label>\n                           <label><input type=\"radio\" name=\"q11\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                        </div>\n                    </li>\n                     <li>\n                        <p><strong>12</strong> Tom Watters reduced his use of pesticides.</p>\n                        <div class=\"options\">\n                           <label><input type=\"radio\" name=\"q12\" value=\"TRUE\"> TRUE</label>\n                           <label><input type=\"radio\" name=\"q12\" value=\"FALSE\"> FALSE</label>\n                           <label><input type=\"radio\" name=\"q12\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                        </div>\n                    </li>\n                     <li>\n                        <p><strong>13</strong> Environmentally friendly farming practices have been profitable for Tom Watters.</p>\n                        <div class=\"options\">\n                           <label><input type=\"radio\" name=\"q13\" value=\"TRUE\"> TRUE</label>\n                           <label><input type=\"radio\" name=\"q13\" value=\"FALSE\"> FALSE</label>\n                           <label><input type=\"radio\" name=\"q13\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                        </div>\n                    </li>\n                </ul>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 9–13</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 9–13 on your answer sheet, write</p>\n<p>\n<strong>TRUE</strong> if the statement agrees with the information<br>\n<strong>FALSE</strong> if the statement contradicts the information<br>\n<strong>NOT GIVEN</strong> if there is no information on this\n</p>\n<ul>\n<li>\n<p><strong>9</strong> In 2004, the cost of producing sugar in Australia was similar to the selling price.</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q9\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q9\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q9\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</li>\n<li>\n<p><strong>10</strong> Farmers who accepted the Government offer have mostly moved to the city.</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q10\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q10\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q10\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</li>\n<li>\n<p><strong>11</strong> Fuel production is regarded as the most desirable alternative business for the sugar mill.</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q11\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q11\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q11\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</li>\n<li>\n<p><strong>12</strong> Tom Watters reduced his use of pesticides.</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q12\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q12\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q12\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</li>\n<li>\n<p><strong>13</strong> Environmentally friendly farming practices have been profitable for Tom Watters.</p>\n<div class=\"options\">\n<label><input type=\"radio\" name=\"q13\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q13\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q13\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</li>\n</ul>\n</div>"
     }
   ],
   "answerKey": {
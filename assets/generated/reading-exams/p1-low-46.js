@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 1</h2>\n            <p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n            \n            <h3>Sydney Opera House</h3>\n            <p>Sydney Opera House is an example of late modern architecture; it is admired internationally and treasured by the people of Australia.</p>\n            <p>In 1956 the Premier of New South Wales, Australia, announced an international competition for the design of an opera house for Sydney. It attracted more than 200 entries from around the world and was won by Jørn Utzon, a relatively little-known architect from Denmark. The story goes that during the judging of the competition, one judge, American architect Eero Saarinen, arrived in Sydney after the other three judges had started assessing the entries. He looked through their rejected entries and stopped at the Utzon design, declaring it to be outstanding.</p>\n            <p>It was Utzon's life and travels that had shaped his design for the Sydney Opera House. Though he had never visited the site, he used his maritime background to study naval charts of Sydney Harbour. His early exposure to shipbuilding provided the inspiration for the design of the roof, which is a series of curved ‘shells' that look like the sails of a sailing ship billowing in the wind. From his travels to Mexico, he had the idea of placing his building on a wide horizontal platform.</p>\n            <p>Construction of the platform began in 1959, and throughout the early 1960s Utzon amended his original designs in order to develop a way to build the large ‘shells' that cover the two main halls. The construction of the roof brought together some of the world's best engineers and craftsmen, devising innovative techniques to create a major visual impact in accordance with Utzon's vision. The design was one of the first examples of the use of computer-aided design for complex shapes.</p>\n            <p>Although Utzon had spectacular plans for the interior, he was unable to realise them. Cost overruns contributed to criticism of the project and, after a change of government, the Minister of Works began questioning Utzon's schedules and cost estimates. Payments to Utzon were stopped and he was forced to withdraw as chief architect in 1966. Following his resignation, there were protests through the streets led by prominent architect Harry Seidler and others, demanding that Utzon be reinstated as architect. However, Utzon was not reinstated and left Australia in 1966. He never returned, and new architects were appointed to complete the building in his absence. The original cost estimate for the Opera House was $7 million, with the completion date set for 26 January 1963. However, the Opera House was not formally completed until 1973, having cost $102 million.</p>\n            <p>Since its opening in 1973, Sydney Opera House has earned a reputation as a world-class performing-arts centre and become a symbol of both Sydney and Australia. Situated at Bennelong Point on Sydney Harbour, it consists of a series of large precast 'shells' made of concrete, each composed of sections of a sphere of 75.2 metres radius, forming the roofs of the structure, set on a monumental platform. The building is 183 metres long and 120 metres wide at its widest point. It is supported on 588 concrete piers, which are sunk approximately 25 metres below sea level.</p>\n            <p>Although the roof structures are commonly referred to as 'shells', they are precast concrete panels supported by concrete ribs. The ‘shells' are covered with 1,056,006 white and cream-coloured tiles manufactured in a factory in Sweden that generally produced stoneware tiles for the paper-mill industry. The design solution and construction of the shell structure took eight years to complete, and the development of the special ceramic tiles took over three years. Apart from the tiles covering the ‘shells', the building's exterior is mostly clad with granite quarried in Australia.</p>\n            <p>Contrary to its name, Sydney Opera House includes multiple performance venues. It is among the busiest performing-arts centres in the world, holding over 1,500 performances each year. It hosts a large number of performing-arts companies, including the four resident companies: Opera Australia, the Australian Ballet, the Sydney Theatre Company and the Sydney Symphony Orchestra.</p>\n            <p>With its grand setting and cathedral-like atmosphere, the Concert Hall is Sydney Opera House's most prestigious performance space. The largest of all interior venues, it delivers outstanding acoustics thanks to its high ceiling and wood panelling. There is a sizeable outdoor forecourt from which people ascend to the main entrance. The steps, which lead up from the forecourt to the main performance venues, are nearly 100 metres wide.</p>\n            <p>In 1999 Utzon was re-engaged to develop a set of design principles to act as a guide for future changes to the building. All of this design work he did from his base in Europe. These principles help to ensure that the building's architectural integrity is maintained. The first alteration to the exterior was the addition of a new colonnade, which shades nine large glass openings in the previously solid exterior wall. This Utzon-led project, completed in 2006, enabled theatre patrons to see the harbour for the first time from the theatre foyers. The design also incorporates the first public lift and interior escalators to assist less-mobile patrons.</p>\n            <p>Since 2007, the cultural, heritage and architectural importance of Sydney Opera House has been protected by its inclusion on the World Heritage List.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>Sydney Opera House</h3>\n<p>Sydney Opera House is an example of late modern architecture; it is admired internationally and treasured by the people of Australia.</p>\n<p>In 1956 the Premier of New South Wales, Australia, announced an international competition for the design of an opera house for Sydney. It attracted more than 200 entries from around the world and was won by Jørn Utzon, a relatively little-known architect from Denmark. The story goes that during the judging of the competition, one judge, American architect Eero Saarinen, arrived in Sydney after the other three judges had started assessing the entries. He looked through their rejected entries and stopped at the Utzon design, declaring it to be outstanding.</p>\n<p>It was Utzon's life and travels that had shaped his design for the Sydney Opera House. Though he had never visited the site, he used his maritime background to study naval charts of Sydney Harbour. His early exposure to shipbuilding provided the inspiration for the design of the roof, which is a series of curved ‘shells' that look like the sails of a sailing ship billowing in the wind. From his travels to Mexico, he had the idea of placing his building on a wide horizontal platform.</p>\n<p>Construction of the platform began in 1959, and throughout the early 1960s Utzon amended his original designs in order to develop a way to build the large ‘shells' that cover the two main halls. The construction of the roof brought together some of the world's best engineers and craftsmen, devising innovative techniques to create a major visual impact in accordance with Utzon's vision. The design was one of the first examples of the use of computer-aided design for complex shapes.</p>\n<p>Although Utzon had spectacular plans for the interior, he was unable to realise them. Cost overruns contributed to criticism of the project and, after a change of government, the Minister of Works began questioning Utzon's schedules and cost estimates. Payments to Utzon were stopped and he was forced to withdraw as chief architect in 1966. Following his resignation, there were protests through the streets led by prominent architect Harry Seidler and others, demanding that Utzon be reinstated as architect. However, Utzon was not reinstated and left Australia in 1966. He never returned, and new architects were appointed to complete the building in his absence. The original cost estimate for the Opera House was $7 million, with the completion date set for 26 January 1963. However, the Opera House was not formally completed until 1973, having cost $102 million.</p>\n<p>Since its opening in 1973, Sydney Opera House has earned a reputation as a world-class performing-arts centre and become a symbol of both Sydney and Australia. Situated at Bennelong Point on Sydney Harbour, it consists of a series of large precast 'shells' made of concrete, each composed of sections of a sphere of 75.2 metres radius, forming the roofs of the structure, set on a monumental platform. The building is 183 metres long and 120 metres wide at its widest point. It is supported on 588 concrete piers, which are sunk approximately 25 metres below sea level.</p>\n<p>Although the roof structures are commonly referred to as 'shells', they are precast concrete panels supported by concrete ribs. The ‘shells' are covered with 1,056,006 white and cream-coloured tiles manufactured in a factory in Sweden that generally produced stoneware tiles for the paper-mill industry. The design solution and construction of the shell structure took eight years to complete, and the development of the special ceramic tiles took over three years. Apart from the tiles covering the ‘shells', the building's exterior is mostly clad with granite quarried in Australia.</p>\n<p>Contrary to its name, Sydney Opera House includes multiple performance venues. It is among the busiest performing-arts centres in the world, holding over 1,500 performances each year. It hosts a large number of performing-arts companies, including the four resident companies: Opera Australia, the Australian Ballet, the Sydney Theatre Company and the Sydney Symphony Orchestra.</p>\n<p>With its grand setting and cathedral-like atmosphere, the Concert Hall is Sydney Opera House's most prestigious performance space. The largest of all interior venues, it delivers outstanding acoustics thanks to its high ceiling and wood panelling. There is a sizeable outdoor forecourt from which people ascend to the main entrance. The steps, which lead up from the forecourt to the main performance venues, are nearly 100 metres wide.</p>\n<p>In 1999 Utzon was re-engaged to develop a set of design principles to act as a guide for future changes to the building. All of this design work he did from his base in Europe. These principles help to ensure that the building's architectural integrity is maintained. The first alteration to the exterior was the addition of a new colonnade, which shades nine large glass openings in the previously solid exterior wall. This Utzon-led project, completed in 2006, enabled theatre patrons to see the harbour for the first time from the theatre foyers. The design also incorporates the first public lift and interior escalators to assist less-mobile patrons.</p>\n<p>Since 2007, the cultural, heritage and architectural importance of Sydney Opera House has been protected by its inclusion on the World Heritage List.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -37,7 +37,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n                <h4>Questions 1–7</h4>\n                <p>Do the following statements agree with the information given in Reading Passage 1?</p>\n                <p>In boxes 1–7 on your answer sheet, write</p>\n                <p>\n                    <strong>TRUE</strong> if the statement agrees with the information<br>\n                    <strong>FALSE</strong> if the statement contradicts the information<br>\n                    <strong>NOT GIVEN</strong> if there is no information on this\n                </p>\n                <div class=\"question-item\">\n                    <p><strong>1</strong> Utzon was famous for his work before he designed the Opera House.</p>\n                    <div class=\"tfng-options\">\n                        <label><input type=\"radio\" name=\"q1\" value=\"TRUE\"> TRUE</label>\n                        <label><input type=\"radio\" name=\"q1\" value=\"FALSE\"> FALSE</label>\n                        <label><input type=\"radio\" name=\"q1\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>2</strong> Utzon's design was favoured by the four judges of the competition from the beginning.</p>\n                    <div class=\"tfng-options\">\n                        <label><input type=\"radio\" name=\"q2\" value=\"TRUE\"> TRUE</label>\n                        <label><input type=\"radio\" name=\"q2\" value=\"FALSE\"> FALSE</label>\n                        <label><input type=\"radio\" name=\"q2\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>3</strong> Utzon's knowledge of boats gave him the idea for parts of the Opera House.</p>\n                    <div class=\"tfng-options\">\n                        <label><input type=\"radio\" name=\"q3\" value=\"TRUE\"> TRUE</label>\n                        <label><input type=\"radio\" name=\"q3\" value=\"FALSE\"> FALSE</label>\n                        <label><input type=\"radio\" name=\"q3\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>4</strong> Utzon was impressed by the opera houses he had seen in Mexico.</p>\n                    <div class=\"tfng-options\">\n                        <label><input type=\"radio\" name=\"q4\" value=\"TRUE\"> TRUE</label>\n                        <label><input type=\"radio\" name=\"q4\" value=\"FALSE\"> FALSE</label>\n                        <label><input type=\"radio\" name=\"q4\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>5</strong> Utzon changed his designs in the 1960s after construction began.</p>\n                    <div class=\"tfng-options\">\n                        <label><input type=\"radio\" name=\"q5\" value=\"TRUE\"> TRUE</label>\n                        <label><input type=\"radio\" name=\"q5\" value=\"FALSE\"> FALSE</label>\n                        <label><input type=\"radio\" name=\"q5\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>6</strong> Seidler defended Utzon's role as architect.</p>\n                    <div class=\"tfng-options\">\n                        <label><input type=\"radio\" name=\"q6\" value=\"TRUE\"> TRUE</label>\n                        <label><input type=\"radio\" name=\"q6\" value=\"FALSE\"> FALSE</label>\n                        <label><input type=\"radio\" name=\"q6\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>7</strong> Utzon went back to Australia in 1973 for the opening of the Opera House.</p>\n                    <div class=\"tfng-options\">\n                        <label><input type=\"radio\" name=\"q7\" value=\"TRUE\"> TRUE</label>\n                        <label><input type=\"radio\" name=\"q7\" value=\"FALSE\"> FALSE</label>\n                        <label><input type=\"radio\" name=\"q7\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 1–7</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 1–7 on your answer sheet, write</p>\n<p>\n<strong>TRUE</strong> if the statement agrees with the information<br>\n<strong>FALSE</strong> if the statement contradicts the information<br>\n<strong>NOT GIVEN</strong> if there is no information on this\n</p>\n<div class=\"question-item\">\n<p><strong>1</strong> Utzon was famous for his work before he designed the Opera House.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q1\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q1\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q1\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> Utzon's design was favoured by the four judges of the competition from the beginning.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q2\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q2\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q2\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> Utzon's knowledge of boats gave him the idea for parts of the Opera House.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q3\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q3\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q3\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> Utzon was impressed by the opera houses he had seen in Mexico.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q4\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q4\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q4\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> Utzon changed his designs in the 1960s after construction began.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q5\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q5\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q5\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>6</strong> Seidler defended Utzon's role as architect.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q6\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q6\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q6\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>7</strong> Utzon went back to Australia in 1973 for the opening of the Opera House.</p>\n<div class=\"tfng-options\">\n<label><input type=\"radio\" name=\"q7\" value=\"TRUE\"> TRUE</label> <label><input type=\"radio\" name=\"q7\" value=\"FALSE\"> FALSE</label> <label><input type=\"radio\" name=\"q7\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -51,7 +51,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n                <h4>Questions 8–13</h4>\n                <p>Complete the notes below.</p>\n                <p>Choose <strong>ONE WORD AND/OR A NUMBER</strong> from the passage for each answer.</p>\n                <div class=\"notes-completion\">\n                    <h4>Sydney Opera House</h4>\n                    <ul>\n                        <li><strong>Final cost</strong>\n                            <ul>\n                                <li><strong>8</strong> $ <input name=\"q8\" type=\"text\" class=\"blank\" id=\"q8_input\"></li>\n                            </ul>\n                        </li>\n                        <li><strong>Construction</strong>\n                            <ul>\n                                <li>A large platform acting as a base for the building</li>\n                                <li>Concrete panels used to make 'shells', which are covered in tiles</li>\n                                <li>Over a million tiles from <strong>9</strong> <input name=\"q9\" type=\"text\" class=\"blank\" id=\"q9_input\"></li>\n                                <li><strong>10</strong> <input name=\"q10\" type=\"text\" class=\"blank\" id=\"q10_input\"> from Australia covering the outside walls</li>\n                            </ul>\n                        </li>\n                         <li><strong>Use</strong>\n                            <ul>\n                                <li>More than 1,500 performances annually</li>\n                                <li><strong>11</strong> <input name=\"q11\" type=\"text\" class=\"blank\" id=\"q11_input\"> performing-arts companies have their home base at the Opera House</li>\n                            </ul>\n                        </li>\n                        <li><strong>Outside</strong>\n                            <ul>\n                                <li>A large <strong>12</strong> <input name=\"q12\" type=\"text\" class=\"blank\" id=\"q12_input\"> at the foot of a wide staircase</li>\n                            </ul>\n                        </li>\n                        <li><strong>Alterations</strong>\n                            <ul>\n                                <li>A colonnade was added in 2006</li>\n                                <li>Openings made the <strong>13</strong> <input name=\"q13\" type=\"text\" class=\"blank\" id=\"q13_input\"> visible from foyers</li>\n                            </ul>\n                        </li>\n                    </ul>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Questions 8–13</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>Sydney Opera House</h4>\n<ul>\n<li><strong>Final cost</strong>\n<ul>\n<li><strong>8</strong> $ <input name=\"q8\" type=\"text\" class=\"blank\" id=\"q8_input\"></li>\n</ul>\n</li>\n<li><strong>Construction</strong>\n<ul>\n<li>A large platform acting as a base for the building</li>\n<li>Concrete panels used to make 'shells', which are covered in tiles</li>\n<li>Over a million tiles from <strong>9</strong> <input name=\"q9\" type=\"text\" class=\"blank\" id=\"q9_input\"></li>\n<li><strong>10</strong> <input name=\"q10\" type=\"text\" class=\"blank\" id=\"q10_input\"> from Australia covering the outside walls</li>\n</ul>\n</li>\n<li><strong>Use</strong>\n<ul>\n<li>More than 1,500 performances annually</li>\n<li><strong>11</strong> <input name=\"q11\" type=\"text\" class=\"blank\" id=\"q11_input\"> performing-arts companies have their home base at the Opera House</li>\n</ul>\n</li>\n<li><strong>Outside</strong>\n<ul>\n<li>A large <strong>12</strong> <input name=\"q12\" type=\"text\" class=\"blank\" id=\"q12_input\"> at the foot of a wide staircase</li>\n</ul>\n</li>\n<li><strong>Alterations</strong>\n<ul>\n<li>A colonnade was added in 2006</li>\n<li>Openings made the <strong>13</strong> <input name=\"q13\" type=\"text\" class=\"blank\" id=\"q13_input\"> visible from foyers</li>\n</ul>\n</li>\n</ul>\n</div>\n</div>"
     }
   ],
   "answerKey": {
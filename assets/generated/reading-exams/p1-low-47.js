@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 1</h2>\n            <p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n            \n            <h3>The Burgess Shale fossils</h3>\n            <h4>Fauna vanished with a whimper, not a bang</h4>\n            \n            <p>Some discoveries are so unusual it takes decades and sometimes even centuries to understand their full significance. One such discovery is the fossil bed known as the Burgess Shale, which contains a record of bizarre creatures that lived 505 million years ago. It was discovered in the Canadian Rockies over a century ago, and was popularized in 1989 in a book, <em>Wonderful Life</em>, by Stephen Jay Gould, an American paleontologist.</p>\n            <p>The Burgess Shale fossils were created at a time when the future Canadian land mass was situated near the Earth's equator. The creatures were preserved when an entire marine ecosystem was buried in mud that eventually hardened and became exposed hundreds of millions of years later in an outcrop of the Rocky Mountains. American paleontologist Charles Walcott, following reports of fabulous fossil finds by construction workers on a Canadian railway who were digging in the mountains in the late 19th century, is said to have tripped over a block of shale in 1909 that revealed the area's remarkable supply of specimens. It has long been believed that the curious fauna that lived there vanished in a series of extinctions because the fossil record ends abruptly. But that no longer appears to be the case.</p>\n            <p>The Burgess Shale began to form soon after a period known as the Cambrian explosion, when most major groups of complex animals arose over a surprisingly short period. Before 560 million years ago, most living things were either individual cells or simple colonies of cells. Then, and for reasons that remain a mystery, life massively diversified and became ever more complex as the rate of evolution increased. An unusual feature of the Burgess Shale is that it is one of the earliest fossil beds to contain impressions of soft body parts alongside the remains of bones and shells, which is highly unusual.</p>\n            <p>Although the fossil bed was discovered on a mountain, these animals originally existed below an ocean, the bed of which was later pushed up to create the Rockies. Nobody knows exactly why they were so well preserved. One possibility is that the creatures were buried quickly and in conditions that were hostile to the bacteria that cause decomposition of soft body parts.</p>\n            <p>Those who first worked on the Burgess Shale, unearthing 65,000 specimens over a 14-year period up to 1924, assumed that the fossils came from extinct members of groups of animals in existence today. This turned out to be misleading because many of the creatures are so unusual that they are still difficult to classify.</p>\n            <p>One such example is Opabinia, a creature that grew to about 8 cm (3 inches), had five eyes, a body that was a series of lobes, a tail in the shape of a fan, and that ate using a proboscis.</p>\n            <p>The proboscis had a set of grasping claws on the end, with which it grabbed food and stuffed it into its mouth. Nectocaris, meanwhile, could be mistaken for a leech, but with fins and tentacles. Weirdest of all was Hallucigenia, described by paleontologist Simon Conway Morris, when he re-examined Walcott's specimens in 1979. With its multiplicity of spines and tentacles, little about Hallucigenia made sense, but scientists hypothesized that the spines were legs that helped it move and the tentacles were for feeding. Like an abstract painting, its orientation is a mystery at first, making it difficult to work out which way up it went, which hole food went into, and which hole food came out of.</p>\n            <p>Paleontologists had long thought that many of the Burgess Shale animals were examples of experiments in evolution. In other words, entirely new forms of life that did not survive or lead to other groups or species. Hallucigenia, ironically, turned out to be the exception that proved the rule. It is now thought to be an ancestor of the modern group of arthropods, which includes everything from flies and butterflies to centipedes and crabs.</p>\n            <p>Now another misconception has been quashed. Writing in <em>Nature</em> recently, Peter Van Roy of Yale University in the United States and his colleagues suggest that the sudden absence of such crazy soft-bodied fossils does not indicate a mass extinction, but merely an end to the unusual local circumstances that caused the creatures to be preserved. In an area of the Atlas Mountains of Morocco, Van Roy's team of researchers has found another diverse (and sometimes bizarre) assemblage of soft-bodied organisms from a period after the Burgess Shale was formed. One discovery includes something that may be a stalked barnacle. This suggests that the evolution of such complex life went on uninterrupted. For its part, the Burgess Shale continues to produce an astonishing array of indefinable creatures faster than paleontologists can examine them. The world still has plenty to learn about this wonderful life.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>The Burgess Shale fossils</h3>\n<h4>Fauna vanished with a whimper, not a bang</h4>\n<p>Some discoveries are so unusual it takes decades and sometimes even centuries to understand their full significance. One such discovery is the fossil bed known as the Burgess Shale, which contains a record of bizarre creatures that lived 505 million years ago. It was discovered in the Canadian Rockies over a century ago, and was popularized in 1989 in a book, <em>Wonderful Life</em>, by Stephen Jay Gould, an American paleontologist.</p>\n<p>The Burgess Shale fossils were created at a time when the future Canadian land mass was situated near the Earth's equator. The creatures were preserved when an entire marine ecosystem was buried in mud that eventually hardened and became exposed hundreds of millions of years later in an outcrop of the Rocky Mountains. American paleontologist Charles Walcott, following reports of fabulous fossil finds by construction workers on a Canadian railway who were digging in the mountains in the late 19th century, is said to have tripped over a block of shale in 1909 that revealed the area's remarkable supply of specimens. It has long been believed that the curious fauna that lived there vanished in a series of extinctions because the fossil record ends abruptly. But that no longer appears to be the case.</p>\n<p>The Burgess Shale began to form soon after a period known as the Cambrian explosion, when most major groups of complex animals arose over a surprisingly short period. Before 560 million years ago, most living things were either individual cells or simple colonies of cells. Then, and for reasons that remain a mystery, life massively diversified and became ever more complex as the rate of evolution increased. An unusual feature of the Burgess Shale is that it is one of the earliest fossil beds to contain impressions of soft body parts alongside the remains of bones and shells, which is highly unusual.</p>\n<p>Although the fossil bed was discovered on a mountain, these animals originally existed below an ocean, the bed of which was later pushed up to create the Rockies. Nobody knows exactly why they were so well preserved. One possibility is that the creatures were buried quickly and in conditions that were hostile to the bacteria that cause decomposition of soft body parts.</p>\n<p>Those who first worked on the Burgess Shale, unearthing 65,000 specimens over a 14-year period up to 1924, assumed that the fossils came from extinct members of groups of animals in existence today. This turned out to be misleading because many of the creatures are so unusual that they are still difficult to classify.</p>\n<p>One such example is Opabinia, a creature that grew to about 8 cm (3 inches), had five eyes, a body that was a series of lobes, a tail in the shape of a fan, and that ate using a proboscis.</p>\n<p>The proboscis had a set of grasping claws on the end, with which it grabbed food and stuffed it into its mouth. Nectocaris, meanwhile, could be mistaken for a leech, but with fins and tentacles. Weirdest of all was Hallucigenia, described by paleontologist Simon Conway Morris, when he re-examined Walcott's specimens in 1979. With its multiplicity of spines and tentacles, little about Hallucigenia made sense, but scientists hypothesized that the spines were legs that helped it move and the tentacles were for feeding. Like an abstract painting, its orientation is a mystery at first, making it difficult to work out which way up it went, which hole food went into, and which hole food came out of.</p>\n<p>Paleontologists had long thought that many of the Burgess Shale animals were examples of experiments in evolution. In other words, entirely new forms of life that did not survive or lead to other groups or species. Hallucigenia, ironically, turned out to be the exception that proved the rule. It is now thought to be an ancestor of the modern group of arthropods, which includes everything from flies and butterflies to centipedes and crabs.</p>\n<p>Now another misconception has been quashed. Writing in <em>Nature</em> recently, Peter Van Roy of Yale University in the United States and his colleagues suggest that the sudden absence of such crazy soft-bodied fossils does not indicate a mass extinction, but merely an end to the unusual local circumstances that caused the creatures to be preserved. In an area of the Atlas Mountains of Morocco, Van Roy's team of researchers has found another diverse (and sometimes bizarre) assemblage of soft-bodied organisms from a period after the Burgess Shale was formed. One discovery includes something that may be a stalked barnacle. This suggests that the evolution of such complex life went on uninterrupted. For its part, the Burgess Shale continues to produce an astonishing array of indefinable creatures faster than paleontologists can examine them. The world still has plenty to learn about this wonderful life.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 1–5</h4>\n                <p>Do the following statements agree with the information given in Reading Passage 1?</p>\n                <p>In boxes 1–5 on your answer sheet, write</p>\n                <ul style=\"list-style-type: none; padding-left: 0;\">\n                    <li><strong>TRUE</strong> if the statement agrees with the information</li>\n                    <li><strong>FALSE</strong> if the statement contradicts the information</li>\n                    <li><strong>NOT GIVEN</strong> if there is no information on this</li>\n                </ul>\n                \n                <div class=\"question-item\" id=\"q1-anchor\">\n                    <p><strong>1</strong> The Burgess Shale became widely known to the public because of Gould's book.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                \n                <div class=\"question-item\" id=\"q2-anchor\">\n                    <p><strong>2</strong> Charles Walcott had to get permission from Canadian authorities to gain access to the fossil site.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                \n                <div class=\"question-item\" id=\"q3-anchor\">\n                    <p><strong>3</strong> The Burgess Shale includes impressions of soft and hard body parts.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n\n                <div class=\"question-item\" id=\"q4-anchor\">\n                    <p><strong>4</strong> The Burgess Shale creatures were land animals.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                \n                <div class=\"question-item\" id=\"q5-anchor\">\n                    <p><strong>5</strong> Researchers now believe that Hallucigenia is unrelated to any modern creature.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 1–5</h4>\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 1–5 on your answer sheet, write</p>\n<ul style=\"list-style-type: none; padding-left: 0;\">\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\" id=\"q1-anchor\">\n<p><strong>1</strong> The Burgess Shale became widely known to the public because of Gould's book.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q2-anchor\">\n<p><strong>2</strong> Charles Walcott had to get permission from Canadian authorities to gain access to the fossil site.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q3-anchor\">\n<p><strong>3</strong> The Burgess Shale includes impressions of soft and hard body parts.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q4-anchor\">\n<p><strong>4</strong> The Burgess Shale creatures were land animals.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q5-anchor\">\n<p><strong>5</strong> Researchers now believe that Hallucigenia is unrelated to any modern creature.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n                <h4>Questions 6–9</h4>\n                <p>Complete the notes below.</p>\n                <p>Choose <strong>NO MORE THAN TWO WORDS AND/OR A NUMBER</strong> from the passage for each answer.</p>\n                \n                <div class=\"notes-section\">\n                    <h4 style=\"text-align: center; margin-bottom: 20px;\">Burgess Shale</h4>\n                    <h5>Formation</h5>\n                    <p>• Burgess Shale was formed following a time called the <strong>6</strong> <input class=\"blank\" name=\"q6\"></p>\n\n                    <h5>Discovery and investigation in the twentieth century</h5>\n                    <p>• Discovered in 1909</p>\n                    <p>• Charles Walcott learnt of the fossil finds from people building a <strong>7</strong> <input class=\"blank\" name=\"q7\"></p>\n                    <p>• The first work on Burgess Shale was undertaken at the start of the century</p>\n                    <p>• A researcher looked at Burgess Shale findings again in <strong>8</strong> <input class=\"blank\" name=\"q8\"></p>\n\n                    <h5>Recent theories</h5>\n                    <p>• Peter Van Roy</p>\n                    <p style=\"padding-left: 20px;\">– Believes that discoveries in Morocco show that the <strong>9</strong> <input class=\"blank\" name=\"q9\"> of complex life forms continued</p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 6–9</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"notes-section\">\n<h4 style=\"text-align: center; margin-bottom: 20px;\">Burgess Shale</h4>\n<h5>Formation</h5>\n<p>• Burgess Shale was formed following a time called the <strong>6</strong> <input class=\"blank\" name=\"q6\"></p>\n<h5>Discovery and investigation in the twentieth century</h5>\n<p>• Discovered in 1909</p>\n<p>• Charles Walcott learnt of the fossil finds from people building a <strong>7</strong> <input class=\"blank\" name=\"q7\"></p>\n<p>• The first work on Burgess Shale was undertaken at the start of the century</p>\n<p>• A researcher looked at Burgess Shale findings again in <strong>8</strong> <input class=\"blank\" name=\"q8\"></p>\n<h5>Recent theories</h5>\n<p>• Peter Van Roy</p>\n<p style=\"padding-left: 20px;\">– Believes that discoveries in Morocco show that the <strong>9</strong> <input class=\"blank\" name=\"q9\"> of complex life forms continued</p>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -58,7 +58,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-anchor\">\n                <h4>Questions 10–13</h4>\n                <p>Complete the notes below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                \n                <div class=\"table-section\">\n                     <h4 style=\"text-align: center; margin-bottom: 20px;\">Burgess Shale Creatures</h4>\n                    <table>\n                        <thead>\n                            <tr>\n                                <th>Name</th>\n                                <th>Feature</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>Opabinia</strong></td>\n                                <td>\n                                    <ul>\n                                        <li>Five eyes</li>\n                                        <li>Tail resembling a <strong>10</strong> <input class=\"blank\" name=\"q10\"></li>\n                                        <li>Claws used to hold <strong>11</strong> <input class=\"blank\" name=\"q11\"></li>\n                                    </ul>\n                                </td>\n                            </tr>\n                             <tr>\n                                <td><strong>Nectocaris</strong></td>\n                                <td>\n                                    <ul>\n                                        <li>Looked like a <strong>12</strong> <input class=\"blank\" name=\"q12\"></li>\n                                        <li>Fins</li>\n                                        <li>Tentacles</li>\n                                    </ul>\n                                </td>\n                            </tr>\n                            <tr>\n                                <td><strong>Hallucigenia</strong></td>\n                                <td>\n                                    <ul>\n                                        <li>Spines used to <strong>13</strong> <input class=\"blank\" name=\"q13\"></li>\n                                        <li>Tentacles</li>\n                                    </ul>\n                                </td>\n                            </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<h4>Questions 10–13</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"table-section\">\n<h4 style=\"text-align: center; margin-bottom: 20px;\">Burgess Shale Creatures</h4>\n<table>\n<thead>\n<tr>\n<th>Name</th>\n<th>Feature</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>Opabinia</strong></td>\n<td>\n<ul>\n<li>Five eyes</li>\n<li>Tail resembling a <strong>10</strong> <input class=\"blank\" name=\"q10\"></li>\n<li>Claws used to hold <strong>11</strong> <input class=\"blank\" name=\"q11\"></li>\n</ul>\n</td>\n</tr>\n<tr>\n<td><strong>Nectocaris</strong></td>\n<td>\n<ul>\n<li>Looked like a <strong>12</strong> <input class=\"blank\" name=\"q12\"></li>\n<li>Fins</li>\n<li>Tentacles</li>\n</ul>\n</td>\n</tr>\n<tr>\n<td><strong>Hallucigenia</strong></td>\n<td>\n<ul>\n<li>Spines used to <strong>13</strong> <input class=\"blank\" name=\"q13\"></li>\n<li>Tentacles</li>\n</ul>\n</td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"
     }
   ],
   "answerKey": {
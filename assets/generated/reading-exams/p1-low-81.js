@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 1</h2>\n            <p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n            \n            <h3>Salt</h3>\n            \n            <p>Salt is the common name for the substance sodium chloride (NaCl), which occurs in the form of transparent cubic crystals. Although salt is most familiar as a food supplement, less than 5% of the salt produced worldwide is used for that purpose. About 70% is utilized by the chemical industry, mostly as a source of chlorine. Salt is also used for countless other purposes, such as removing snow and ice from roads, softening water, preserving food, and stabilizing soils for construction.</p>\n            <p>The earliest humans obtained their salt from natural salt concentrations, as well as from meat. Those people who lived near the ocean may also have obtained it by chewing seaweed or from the natural evaporation of small pools of seawater. Meat became a more important source of salt as hunting was developed, as did milk when sheep, goats, horses, camels, reindeer, and cattle were domesticated. Even today, certain peoples—such as the Bedouin of the Middle Eastern deserts and the Maasai of East Africa—use no other forms of salt.</p>\n            <p>As agriculture developed, leading to a diet consisting mostly of plants, it became necessary to devise ways of obtaining salt in greater amounts. The earliest method of salt production employed by humankind was the evaporation of seawater using the heat of the sun. This method was particularly suited to hot, arid regions near the ocean or near salty lakes, and is still used in those areas. Solar evaporation was soon followed by the quarrying of exposed masses of rock salt, which quickly developed into the mining of underground deposits of salt. Two thousand years ago, the Chinese began using wells to reach underground pools of salt water, some of which were more than one kilometer deep.</p>\n            <p>In areas where the climate did not allow solar evaporation, salt water was poured on burning wood or heated rocks to boil it. The salt left behind was then scraped off. During the time of the Roman Empire, shallow lead pans were used to boil salt water over open fires to extract the salt. Later, in the Middle Ages, these were replaced with iron pans which were heated with coal. In the 1860s, a procedure known as the Michigan process was invented, in which salt water was heated by steam running through pipes immersed in the water. This process is still used to produce certain types of salt.</p>\n            <p>Nowadays, salt is collected from two sources: rock salt and brine. Rock salt is simply crystallized salt, also known as halite. It is the result of the evaporation of ancient oceans millions of years ago. Underground salt deposits are usually discovered by prospectors searching for water or oil. When salt is detected, a diamond-tipped, hollow drill is used to take several regularly spaced core samples throughout the area. These are analyzed to determine if salt mining would be profitable. If the site is thought to be suitable, vertical tunnels are sunk into the center of the salt deposit. Then a machine resembling a gigantic chain saw is used to cut a long horizontal slot through the salt, in a procedure known as undercutting. A series of holes are then drilled into the salt with an electric drill, and the holes are filled with explosives such as dynamite. Cutting and blasting are repeated in a pattern that leaves salt pillars standing to support the roof of the mining area. This is known as the room-and-pillar method and is also used in coal mines. Once blasted, chunks of the rock salt are transported to an underground crushing area where smaller pieces are collected via a metal grill and larger pieces are crushed in a rotating cylinder. Finally, redundant matter is extracted from the rock salt, in what is known as picking.</p>\n            <p>Brine is water containing a high concentration of salt. The most obvious source of brine is the ocean, but it can also be obtained from salty lakes such as the Dead Sea and from underground pools of salt water. Most brine is processed by a multi-effect vacuum evaporator. This device consists of three or more closed metal cylinders. Brine is first treated to remove chemical compounds. It then fills the bottom of the cylinders. The brine in the first cylinder passes through tubes heated by steam. The brine boils and its steam enters the next cylinder. In each cylinder, the condensation of steam causes the pressure inside to drop. A material called slurry forms at the bottom of the cylinders and goes into a tank. The slurry is then filtered to remove excess brine, dried, and passed through screens to sort the salt particles according to how large they are.</p>\n            <p>Specifications for salt vary widely according to the intended use. Salt intended for human consumption must be much purer than salt used for melting snow and ice on roads, but salt used for certain scientific purposes may need to be even purer.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>Salt</h3>\n<p>Salt is the common name for the substance sodium chloride (NaCl), which occurs in the form of transparent cubic crystals. Although salt is most familiar as a food supplement, less than 5% of the salt produced worldwide is used for that purpose. About 70% is utilized by the chemical industry, mostly as a source of chlorine. Salt is also used for countless other purposes, such as removing snow and ice from roads, softening water, preserving food, and stabilizing soils for construction.</p>\n<p>The earliest humans obtained their salt from natural salt concentrations, as well as from meat. Those people who lived near the ocean may also have obtained it by chewing seaweed or from the natural evaporation of small pools of seawater. Meat became a more important source of salt as hunting was developed, as did milk when sheep, goats, horses, camels, reindeer, and cattle were domesticated. Even today, certain peoples—such as the Bedouin of the Middle Eastern deserts and the Maasai of East Africa—use no other forms of salt.</p>\n<p>As agriculture developed, leading to a diet consisting mostly of plants, it became necessary to devise ways of obtaining salt in greater amounts. The earliest method of salt production employed by humankind was the evaporation of seawater using the heat of the sun. This method was particularly suited to hot, arid regions near the ocean or near salty lakes, and is still used in those areas. Solar evaporation was soon followed by the quarrying of exposed masses of rock salt, which quickly developed into the mining of underground deposits of salt. Two thousand years ago, the Chinese began using wells to reach underground pools of salt water, some of which were more than one kilometer deep.</p>\n<p>In areas where the climate did not allow solar evaporation, salt water was poured on burning wood or heated rocks to boil it. The salt left behind was then scraped off. During the time of the Roman Empire, shallow lead pans were used to boil salt water over open fires to extract the salt. Later, in the Middle Ages, these were replaced with iron pans which were heated with coal. In the 1860s, a procedure known as the Michigan process was invented, in which salt water was heated by steam running through pipes immersed in the water. This process is still used to produce certain types of salt.</p>\n<p>Nowadays, salt is collected from two sources: rock salt and brine. Rock salt is simply crystallized salt, also known as halite. It is the result of the evaporation of ancient oceans millions of years ago. Underground salt deposits are usually discovered by prospectors searching for water or oil. When salt is detected, a diamond-tipped, hollow drill is used to take several regularly spaced core samples throughout the area. These are analyzed to determine if salt mining would be profitable. If the site is thought to be suitable, vertical tunnels are sunk into the center of the salt deposit. Then a machine resembling a gigantic chain saw is used to cut a long horizontal slot through the salt, in a procedure known as undercutting. A series of holes are then drilled into the salt with an electric drill, and the holes are filled with explosives such as dynamite. Cutting and blasting are repeated in a pattern that leaves salt pillars standing to support the roof of the mining area. This is known as the room-and-pillar method and is also used in coal mines. Once blasted, chunks of the rock salt are transported to an underground crushing area where smaller pieces are collected via a metal grill and larger pieces are crushed in a rotating cylinder. Finally, redundant matter is extracted from the rock salt, in what is known as picking.</p>\n<p>Brine is water containing a high concentration of salt. The most obvious source of brine is the ocean, but it can also be obtained from salty lakes such as the Dead Sea and from underground pools of salt water. Most brine is processed by a multi-effect vacuum evaporator. This device consists of three or more closed metal cylinders. Brine is first treated to remove chemical compounds. It then fills the bottom of the cylinders. The brine in the first cylinder passes through tubes heated by steam. The brine boils and its steam enters the next cylinder. In each cylinder, the condensation of steam causes the pressure inside to drop. A material called slurry forms at the bottom of the cylinders and goes into a tank. The slurry is then filtered to remove excess brine, dried, and passed through screens to sort the salt particles according to how large they are.</p>\n<p>Specifications for salt vary widely according to the intended use. Salt intended for human consumption must be much purer than salt used for melting snow and ice on roads, but salt used for certain scientific purposes may need to be even purer.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <p>Do the following statements agree with the information given in Reading Passage 1?</p>\n                <p>In boxes 1–5 on your answer sheet, write:</p>\n                <ul style=\"list-style-type: none; padding-left: 0; margin-bottom: 1rem;\">\n                    <li><strong>TRUE</strong> if the statement agrees with the information</li>\n                    <li><strong>FALSE</strong> if the statement contradicts the information</li>\n                    <li><strong>NOT GIVEN</strong> if there is no information on this</li>\n                </ul>\n                \n                <div class=\"question-item\">\n                    <p><strong>1</strong> The chemical industry makes use of the majority of salt produced globally.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>2</strong> In ancient times, people were only able to get salt from a single source.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>3</strong> Salt production through quarrying rock salt was common before the solar evaporation method of producing salt.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>4</strong> Two thousand years ago, the Chinese were quick to develop the equipment needed to mine underground.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>5</strong> At the time of the Roman Empire, salt was removed from salt water by heating the water in a type of pan.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<p>Do the following statements agree with the information given in Reading Passage 1?</p>\n<p>In boxes 1–5 on your answer sheet, write:</p>\n<ul style=\"list-style-type: none; padding-left: 0; margin-bottom: 1rem;\">\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>1</strong> The chemical industry makes use of the majority of salt produced globally.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q1\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>2</strong> In ancient times, people were only able to get salt from a single source.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q2\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>3</strong> Salt production through quarrying rock salt was common before the solar evaporation method of producing salt.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q3\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>4</strong> Two thousand years ago, the Chinese were quick to develop the equipment needed to mine underground.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q4\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>5</strong> At the time of the Roman Empire, salt was removed from salt water by heating the water in a type of pan.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions 1–5</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n                <p>Complete the notes below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                <div class=\"notes-completion\">\n                    <h4>The production of rock salt</h4>\n                    <ul>\n                        <li>samples of the salt are collected with the aid of a drill</li>\n                        <li>the salt is analysed to see if mining should go ahead</li>\n                        <li>vertical tunnels are sunk into the middle of the salt deposit</li>\n                        <li>during a process called <strong>6</strong> <input type=\"text\" id=\"q6_input\" name=\"q6\">, a machine is used to break into the salt</li>\n                        <li>explosives are placed in the holes in the salt</li>\n                        <li>after blasting, <strong>7</strong> <input type=\"text\" id=\"q7_input\" name=\"q7\"> of salt are left behind to hold the roof up</li>\n                        <li>in an underground crushing area, small pieces of rock salt are gathered using a <strong>8</strong> <input type=\"text\" id=\"q8_input\" name=\"q8\"></li>\n                        <li>the process of <strong>9</strong> <input type=\"text\" id=\"q9_input\" name=\"q9\"> removes any unwanted material from the rock salt</li>\n                    </ul>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"notes-completion\">\n<h4>The production of rock salt</h4>\n<ul>\n<li>samples of the salt are collected with the aid of a drill</li>\n<li>the salt is analysed to see if mining should go ahead</li>\n<li>vertical tunnels are sunk into the middle of the salt deposit</li>\n<li>during a process called <strong>6</strong> <input type=\"text\" id=\"q6_input\" name=\"q6\">, a machine is used to break into the salt</li>\n<li>explosives are placed in the holes in the salt</li>\n<li>after blasting, <strong>7</strong> <input type=\"text\" id=\"q7_input\" name=\"q7\"> of salt are left behind to hold the roof up</li>\n<li>in an underground crushing area, small pieces of rock salt are gathered using a <strong>8</strong> <input type=\"text\" id=\"q8_input\" name=\"q8\"></li>\n<li>the process of <strong>9</strong> <input type=\"text\" id=\"q9_input\" name=\"q9\"> removes any unwanted material from the rock salt</li>\n</ul>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -58,7 +58,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-anchor\">\n                 <p>Complete the flow-chart below.</p>\n                 <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                 <div class=\"flow-chart\">\n                    <h4>Obtaining salt from brine: the multi-effect vacuum evaporator</h4>\n                    <div class=\"flow-item\">\n                        cylinders made of <strong>10</strong> <input type=\"text\" id=\"q10_input\" name=\"q10\"> are filled with brine\n                    </div>\n                    <div class=\"flow-arrow\">↓</div>\n                    <div class=\"flow-item\">\n                        <strong>11</strong> <input type=\"text\" id=\"q11_input\" name=\"q11\"> heats the tube in the first cylinder\n                    </div>\n                    <div class=\"flow-arrow\">↓</div>\n                    <div class=\"flow-item\">\n                        the <strong>12</strong> <input type=\"text\" id=\"q12_input\" name=\"q12\"> in the cylinders falls due to condensation\n                    </div>\n                    <div class=\"flow-arrow\">↓</div>\n                    <div class=\"flow-item\">\n                        slurry collects in the cylinders and passes to a tank\n                    </div>\n                    <div class=\"flow-arrow\">↓</div>\n                     <div class=\"flow-item\">\n                        <strong>13</strong> <input type=\"text\" id=\"q13_input\" name=\"q13\"> are used to separate salt particles by size\n                    </div>\n                 </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<p>Complete the flow-chart below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"flow-chart\">\n<h4>Obtaining salt from brine: the multi-effect vacuum evaporator</h4>\n<div class=\"flow-item\">\ncylinders made of <strong>10</strong> <input type=\"text\" id=\"q10_input\" name=\"q10\"> are filled with brine\n</div>\n<div class=\"flow-arrow\">↓</div>\n<div class=\"flow-item\">\n<strong>11</strong> <input type=\"text\" id=\"q11_input\" name=\"q11\"> heats the tube in the first cylinder\n</div>\n<div class=\"flow-arrow\">↓</div>\n<div class=\"flow-item\">\nthe <strong>12</strong> <input type=\"text\" id=\"q12_input\" name=\"q12\"> in the cylinders falls due to condensation\n</div>\n<div class=\"flow-arrow\">↓</div>\n<div class=\"flow-item\">\nslurry collects in the cylinders and passes to a tank\n</div>\n<div class=\"flow-arrow\">↓</div>\n<div class=\"flow-item\">\n<strong>13</strong> <input type=\"text\" id=\"q13_input\" name=\"q13\"> are used to separate salt particles by size\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
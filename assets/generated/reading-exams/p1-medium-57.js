@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 1</h2>\n            <p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n            \n            <h3>The Blockbuster Phenomenon: A New Museum Trend</h3>\n            <p>Museums in Australia, like other pleasure-giving public organizations, are adapting their activities so that they more closely reflect the marketplace.</p>\n\n            <p><strong>A</strong> Since the 1980s, the term ‘blockbuster' has become the fashionable word for spectacular, high-profile museum exhibitions that have the ability to attract large crowds. A blockbuster is a 'large-scale loan exhibition that people who normally don't go to museums will stand in line for hours to see' (Eisen 1984). Once the museum that created the exhibition has shown it to its local market, it can be offered to other organizations for a fee. This means that you can boost your own door takings and make money from boosting someone else's door takings.</p>\n            <p><strong>B</strong> While partaking of the excitement of the blockbuster, visitors thus lured are likely to stay longer at the museum. Betty Churcher, when Director of the Australian National Gallery, summed up the new blockbuster creed as follows: 'The bonus of the blockbuster exhibitions is that people come to see the blockbuster and they stay to look at the permanent collection, so you are getting broader exposure for your collection.'</p>\n            <p><strong>C</strong> Museums across the UK, USA, Canada and Australia currently operate under a system of plural funding: revenue raised through contributions by federal, state and/or local governments, combined with revenue raised through admission charges and other activities. Maintaining and increasing visitor levels is thus paramount and involves not only creating or hiring blockbuster exhibitions, but providing regular exhibition changes and innovations. In addition, the visiting public have become known as customers rather than visitors, and the skills that are valued in museums to keep the new customers coming through the door have changed. Curators are now administrators, and being a museum director no longer requires an Arts degree—but public relations skills are essential if the museum is going to compete with other museums to stage travelling exhibitions which draw huge crowds.</p>\n            <p><strong>D</strong> The convergence of museums, the heritage industry, tourism, profit-making and pleasure-giving has resulted in the new 'museology'. This has given rise to much debate about whether it is appropriate to see museums primarily as tourist attractions. In literature from both the UK and USA, the words that are starting to appear in some descriptions of blockbusters are ‘less scholarly', 'non-elitist' and 'popularist', while others extol the virtues of encouraging scholars to co-operate on projects, and to provide exhibitions that cater for a broad selection of the community rather than an elite sector. Whatever commentators may think, managers of museums worldwide are looking for artful ways to blend culture and commerce, and blockbuster exhibitions are at the top of the list.</p>\n            <p><strong>E</strong> But do blockbusters held in public institutions really create a surplus to fund other activities? If the bottom line is profit, then according to the records of many major museums blockbusters do make money. For museums in some countries, it may be the money that they require to replace parts of their collections or to fix buildings that are in need of attention. For some museums in Australia, it may be the opportunity to illustrate that they are attempting to pay their way by recovering part of their operating costs. Also, creating or hiring a blockbuster has many positive spin-offs: blockbusters mean crowds, and crowds are good for the local economy, providing increased trade for shops, hotels, restaurants, the transport industry and retailers. The argument that the arts provide sustained economic benefits has been well illustrated in impact studies in the USA and UK.</p>\n            <p><strong>F</strong> However, blockbusters require large capital expenditure and draw on resources across all branches of an organization, and the costs don't end there. There is a Human Resource Management cost in addition to a measurable 'real' dollar cost. Receiving a touring exhibition draws resources from across functional management structures in a project-management style. Everyone—from general labourers to building services, front-of-house, technical, promotional, educational and administrative staff—is required to perform additional tasks. Furthermore, as an increasing number of institutions try their hand at increasing visitor numbers and memberships (and therefore revenue) by staging blockbuster exhibitions, it may be less likely that blockbusters will continue to provide a surplus to subsidize other activities due to the competitive nature of the market.</p>\n            <p><strong>G</strong> It has been illustrated in both the UK and USA that the blockbuster ideology has resulted in the false expectation that the momentum required to stage blockbusters can be maintained continually. Creating, mounting or hiring blockbusters is exhausting, with the real costs throughout an institution difficult to calculate. Secondly, as some analysts have argued, the 'shopkeeping' mentality and cost-benefit analysis, and a pure concentration on the bottom line, can squeeze substance out of an exhibition. Taking out substance can be a recipe for blockbuster failure and therefore financial failure.</p>\n            <p><strong>H</strong> Perhaps the best pathway to take is one that balances both blockbusters and regular exhibitions. However, this easy middle ground may only work if you have enough space, and have alternative sources of funding to continue to support the regular, less exciting fare. Perhaps the advice should be to make sure that you find out what your local community wants from you and make sure that your regular activities and exhibitions are more enduring.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 1</h2>\n<p>You should spend about 20 minutes on Questions 1–13, which are based on Reading Passage 1 below.</p>\n<h3>The Blockbuster Phenomenon: A New Museum Trend</h3>\n<p>Museums in Australia, like other pleasure-giving public organizations, are adapting their activities so that they more closely reflect the marketplace.</p>\n<p><strong>A</strong> Since the 1980s, the term ‘blockbuster' has become the fashionable word for spectacular, high-profile museum exhibitions that have the ability to attract large crowds. A blockbuster is a 'large-scale loan exhibition that people who normally don't go to museums will stand in line for hours to see' (Eisen 1984). Once the museum that created the exhibition has shown it to its local market, it can be offered to other organizations for a fee. This means that you can boost your own door takings and make money from boosting someone else's door takings.</p>\n<p><strong>B</strong> While partaking of the excitement of the blockbuster, visitors thus lured are likely to stay longer at the museum. Betty Churcher, when Director of the Australian National Gallery, summed up the new blockbuster creed as follows: 'The bonus of the blockbuster exhibitions is that people come to see the blockbuster and they stay to look at the permanent collection, so you are getting broader exposure for your collection.'</p>\n<p><strong>C</strong> Museums across the UK, USA, Canada and Australia currently operate under a system of plural funding: revenue raised through contributions by federal, state and/or local governments, combined with revenue raised through admission charges and other activities. Maintaining and increasing visitor levels is thus paramount and involves not only creating or hiring blockbuster exhibitions, but providing regular exhibition changes and innovations. In addition, the visiting public have become known as customers rather than visitors, and the skills that are valued in museums to keep the new customers coming through the door have changed. Curators are now administrators, and being a museum director no longer requires an Arts degree—but public relations skills are essential if the museum is going to compete with other museums to stage travelling exhibitions which draw huge crowds.</p>\n<p><strong>D</strong> The convergence of museums, the heritage industry, tourism, profit-making and pleasure-giving has resulted in the new 'museology'. This has given rise to much debate about whether it is appropriate to see museums primarily as tourist attractions. In literature from both the UK and USA, the words that are starting to appear in some descriptions of blockbusters are ‘less scholarly', 'non-elitist' and 'popularist', while others extol the virtues of encouraging scholars to co-operate on projects, and to provide exhibitions that cater for a broad selection of the community rather than an elite sector. Whatever commentators may think, managers of museums worldwide are looking for artful ways to blend culture and commerce, and blockbuster exhibitions are at the top of the list.</p>\n<p><strong>E</strong> But do blockbusters held in public institutions really create a surplus to fund other activities? If the bottom line is profit, then according to the records of many major museums blockbusters do make money. For museums in some countries, it may be the money that they require to replace parts of their collections or to fix buildings that are in need of attention. For some museums in Australia, it may be the opportunity to illustrate that they are attempting to pay their way by recovering part of their operating costs. Also, creating or hiring a blockbuster has many positive spin-offs: blockbusters mean crowds, and crowds are good for the local economy, providing increased trade for shops, hotels, restaurants, the transport industry and retailers. The argument that the arts provide sustained economic benefits has been well illustrated in impact studies in the USA and UK.</p>\n<p><strong>F</strong> However, blockbusters require large capital expenditure and draw on resources across all branches of an organization, and the costs don't end there. There is a Human Resource Management cost in addition to a measurable 'real' dollar cost. Receiving a touring exhibition draws resources from across functional management structures in a project-management style. Everyone—from general labourers to building services, front-of-house, technical, promotional, educational and administrative staff—is required to perform additional tasks. Furthermore, as an increasing number of institutions try their hand at increasing visitor numbers and memberships (and therefore revenue) by staging blockbuster exhibitions, it may be less likely that blockbusters will continue to provide a surplus to subsidize other activities due to the competitive nature of the market.</p>\n<p><strong>G</strong> It has been illustrated in both the UK and USA that the blockbuster ideology has resulted in the false expectation that the momentum required to stage blockbusters can be maintained continually. Creating, mounting or hiring blockbusters is exhausting, with the real costs throughout an institution difficult to calculate. Secondly, as some analysts have argued, the 'shopkeeping' mentality and cost-benefit analysis, and a pure concentration on the bottom line, can squeeze substance out of an exhibition. Taking out substance can be a recipe for blockbuster failure and therefore financial failure.</p>\n<p><strong>H</strong> Perhaps the best pathway to take is one that balances both blockbusters and regular exhibitions. However, this easy middle ground may only work if you have enough space, and have alternative sources of funding to continue to support the regular, less exciting fare. Perhaps the advice should be to make sure that you find out what your local community wants from you and make sure that your regular activities and exhibitions are more enduring.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -34,7 +34,7 @@
         "q3",
         "q4"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n                <h4>Questions 1–4</h4>\n                <p>Reading Passage 1 has eight paragraphs, <strong>A–H</strong>.</p>\n                <p>Which paragraph contains the following information?</p>\n                <p><em>Write the correct letter, <strong>A–H</strong>, in boxes 1–4 on your answer sheet.</em></p>\n                <p><strong>NB</strong> You may use any letter more than once.</p>\n                <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                        <thead>\n                            <tr>\n                                <th></th>\n                                <th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>1</strong> the reason why museum directors need to constantly alter and update their exhibits</td>\n                                <td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>2</strong> mention of the length of time people will queue to see a blockbuster</td>\n                                <td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>3</strong> terms that people have used when referring to blockbusters</td>\n                                <td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>4</strong> the various ways that institutions like museums get financial support</td>\n                                <td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n                            </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 1–4</h4>\n<p>Reading Passage 1 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–H</strong>, in boxes 1–4 on your answer sheet.</em></p>\n<p><strong>NB</strong> You may use any letter more than once.</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>1</strong> the reason why museum directors need to constantly alter and update their exhibits</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>2</strong> mention of the length of time people will queue to see a blockbuster</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>3</strong> terms that people have used when referring to blockbusters</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>4</strong> the various ways that institutions like museums get financial support</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -46,7 +46,7 @@
         "q7",
         "q8"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-anchor\">\n                <h4>Questions 5–8</h4>\n                <p>Complete the sentences below.</p>\n                <p>Choose <strong>NO MORE THAN THREE WORDS</strong> from the passage for each answer.</p>\n                <div class=\"question-item\">\n                    <div class=\"completion-item\">\n                        <span class=\"q-number\">5</span> These days, museum visitors tend to be referred to as <input name=\"q5\" type=\"text\" class=\"blank\" id=\"q5_input\">.\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <div class=\"completion-item\">\n                        <span class=\"q-number\">6</span> Museum curators now need <input name=\"q6\" type=\"text\" class=\"blank\" id=\"q6_input\"> rather than academic qualifications.\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <div class=\"completion-item\">\n                        <span class=\"q-number\">7</span> The linking of a range of public institutions that entertain the public is known as <input name=\"q7\" type=\"text\" class=\"blank\" id=\"q7_input\">.\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                     <div class=\"completion-item\">\n                        <span class=\"q-number\">8</span> There is discussion about whether museums can be regarded in the same way as other <input name=\"q8\" type=\"text\" class=\"blank\" id=\"q8_input\">.\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-anchor\">\n<h4>Questions 5–8</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>NO MORE THAN THREE WORDS</strong> from the passage for each answer.</p>\n<div class=\"question-item\">\n<div class=\"completion-item\">\n<span class=\"q-number\">5</span> These days, museum visitors tend to be referred to as <input name=\"q5\" type=\"text\" class=\"blank\" id=\"q5_input\">.\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"completion-item\">\n<span class=\"q-number\">6</span> Museum curators now need <input name=\"q6\" type=\"text\" class=\"blank\" id=\"q6_input\"> rather than academic qualifications.\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"completion-item\">\n<span class=\"q-number\">7</span> The linking of a range of public institutions that entertain the public is known as <input name=\"q7\" type=\"text\" class=\"blank\" id=\"q7_input\">.\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"completion-item\">\n<span class=\"q-number\">8</span> There is discussion about whether museums can be regarded in the same way as other <input name=\"q8\" type=\"text\" class=\"blank\" id=\"q8_input\">.\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -55,7 +55,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q9-10-anchor\">\n                <h4>Questions 9 and 10</h4>\n                <p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n                <p>Which <strong>TWO</strong> of the following are mentioned by the writer as advantages of blockbusters?</p>\n                <div class=\"checkbox-options\">\n                    <label><input type=\"checkbox\" name=\"q9_10\" value=\"A\"> <strong>A</strong> Some of the money they raise can be used for structural repairs.</label>\n                    <label><input type=\"checkbox\" name=\"q9_10\" value=\"B\"> <strong>B</strong> They can provide funds to help support amateur artists.</label>\n                    <label><input type=\"checkbox\" name=\"q9_10\" value=\"C\"> <strong>C</strong> Local services benefit from the extra business they bring about.</label>\n                    <label><input type=\"checkbox\" name=\"q9_10\" value=\"D\"> <strong>D</strong> They encourage overseas workers into the local area.</label>\n                    <label><input type=\"checkbox\" name=\"q9_10\" value=\"E\"> <strong>E</strong> They raise employee performance levels.</label>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q9-10-anchor\">\n<h4>Questions 9 and 10</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>Which <strong>TWO</strong> of the following are mentioned by the writer as advantages of blockbusters?</p>\n<div class=\"checkbox-options\">\n<label><input type=\"checkbox\" name=\"q9_10\" value=\"A\"> <strong>A</strong> Some of the money they raise can be used for structural repairs.</label> <label><input type=\"checkbox\" name=\"q9_10\" value=\"B\"> <strong>B</strong> They can provide funds to help support amateur artists.</label> <label><input type=\"checkbox\" name=\"q9_10\" value=\"C\"> <strong>C</strong> Local services benefit from the extra business they bring about.</label> <label><input type=\"checkbox\" name=\"q9_10\" value=\"D\"> <strong>D</strong> They encourage overseas workers into the local area.</label> <label><input type=\"checkbox\" name=\"q9_10\" value=\"E\"> <strong>E</strong> They raise employee performance levels.</label>\n</div>\n</div>"
     },
     {
       "groupId": "group-4",
@@ -63,7 +63,7 @@
       "questionIds": [
         "q11"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-13-anchor\">\n                <h4>Questions 11–13</h4>\n                <p>Choose <strong>THREE</strong> letters, <strong>A–G</strong>.</p>\n                <p>Which <strong>THREE</strong> of the following are mentioned by the writer as disadvantages of blockbusters?</p>\n                 <div class=\"checkbox-options\">\n                    <label><input type=\"checkbox\" name=\"q11\" value=\"A\"> <strong>A</strong> They do not suit museum management styles.</label>\n                    <label><input type=\"checkbox\" name=\"q11\" value=\"B\"> <strong>B</strong> Specialist business advice has to be paid for.</label>\n                    <label><input type=\"checkbox\" name=\"q11\" value=\"C\"> <strong>C</strong> They involve an increased workload for personnel.</label>\n                    <label><input type=\"checkbox\" name=\"q11\" value=\"D\"> <strong>D</strong> They do not increase overall annual visitor numbers.</label>\n                    <label><input type=\"checkbox\" name=\"q11\" value=\"E\"> <strong>E</strong> They are very tiring to put on.</label>\n                    <label><input type=\"checkbox\" name=\"q11\" value=\"F\"> <strong>F</strong> What is popular in one country may not be popular in another.</label>\n                    <label><input type=\"checkbox\" name=\"q11\" value=\"G\"> <strong>G</strong> The content can be weakened through financial pressure.</label>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q11-13-anchor\">\n<h4>Questions 11–13</h4>\n<p>Choose <strong>THREE</strong> letters, <strong>A–G</strong>.</p>\n<p>Which <strong>THREE</strong> of the following are mentioned by the writer as disadvantages of blockbusters?</p>\n<div class=\"checkbox-options\">\n<label><input type=\"checkbox\" name=\"q11\" value=\"A\"> <strong>A</strong> They do not suit museum management styles.</label> <label><input type=\"checkbox\" name=\"q11\" value=\"B\"> <strong>B</strong> Specialist business advice has to be paid for.</label> <label><input type=\"checkbox\" name=\"q11\" value=\"C\"> <strong>C</strong> They involve an increased workload for personnel.</label> <label><input type=\"checkbox\" name=\"q11\" value=\"D\"> <strong>D</strong> They do not increase overall annual visitor numbers.</label> <label><input type=\"checkbox\" name=\"q11\" value=\"E\"> <strong>E</strong> They are very tiring to put on.</label> <label><input type=\"checkbox\" name=\"q11\" value=\"F\"> <strong>F</strong> What is popular in one country may not be popular in another.</label> <label><input type=\"checkbox\" name=\"q11\" value=\"G\"> <strong>G</strong> The content can be weakened through financial pressure.</label>\n</div>\n</div>"
     }
   ],
   "answerKey": {
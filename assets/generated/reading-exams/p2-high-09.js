@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 2</h2>\n            <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n            \n            <h3>Early Approaches to Organisational Design</h3>\n            <h5>A review of the classical and neoclassical theories of organisational structures</h5>\n            \n            <p>Determining the 'best' type of organisational structure for a particular situation has long been an important task for managers in all types of organisations. All structures have advantages and disadvantages and managers face the challenge of developing the most appropriate design for changing circumstances.</p>\n            \n            <h4>The Classical Approach</h4>\n            <p>Early management writers attempted to approach organisational design using a set of principles that would make an organisational structure perform efficiently in most situations, independent of external conditions and internal objectives. The sociologist Max Weber and management writers Frederick Taylor and Henri Fayol were major contributors to this so-called classical approach. They believed that the most efficient organisations had a legalised, formal and hierarchical structure called a ‘bureaucracy'. Members of the organisation were guided by a sense of duty to the organisation and by a set of rational rules and regulations. According to Weber, such organisations were characterised by the specialisation of tasks, appointment by merit, and an impersonal climate.</p>\n            <p>Today the word 'bureaucracy' sometimes has negative connotations. Early management writers, however, commended bureaucracy as an organisational design for its rationality, rules for decision-making, clear chain of command, and promotion of people based on ability and experience, rather than favouritism or whim. Weber also believed that clearly specified authority and responsibility made performance easier to evaluate and reward.</p>\n            \n            <h4>Criticism of the Classical Approach</h4>\n            <p>Weber, Taylor and Fayol developed their theories when organisations that resembled this bureaucratic model were modern and efficient. It became evident, however, that some of the major advantages of the bureaucratic structure could become disadvantages if the theory were applied dogmatically. For example, the safeguards against favouritism could be rigidly imposed by adhering excessively to rules, resulting in both managers and subordinates becoming depersonalised.</p>\n            <p>The classical approach has been criticised from two major perspectives. First, the theory may not have a basis in reality. Have organisations like those described by Weber and the others ever existed? Second, it claims that organisations designed and managed according to bureaucratic principles will enjoy the predicted benefits. But critics argue that the world no longer fits the assumptions in Weber's model (if it ever did), and so a bureaucracy might not yield beneficial results.</p>\n            <p>Early human relations researchers and behavioural scientists attempted to deal with the major inadequacy of the classical bureaucratic model: neglect of the human element. They argued that an industrial organisation has two objectives: economic effectiveness and employee satisfaction. They also wrote that the bureaucratic structure could be improved by permitting more subordinate participation in decision-making. Because these researchers tried to improve, and not reject, the classical model, they are sometimes called neoclassical theorists and include Douglas McGregor, Chris Argyris and Rensis Likert.</p>\n            \n            <h4>The Neoclassical Approach</h4>\n            <p>McGregor believed that the vertical division of labour that characterised bureaucratic organisations was derived from negative and false assumptions about workers which he called Theory X. Managers assume lower-level employees lack ambition and need orders to work effectively. The rigid formal hierarchy is designed to maintain managers' power over subordinates. Decision-making takes place at upper levels of management while the decisions are carried out by people at lower levels. McGregor argued that organisations based instead on Theory Y assumptions use their members' potential. Theory Y assumes that most people find work satisfying, commit themselves willingly to organisational goals and seek responsibility. Members have more independence than in bureaucratic organisations and lower-level participation in decision-making is encouraged.</p>\n            <p>Argyris was concerned that managers in bureaucratic organisations had near-total responsibility for controlling their subordinates' work. He argued that managerial domination makes subordinates passive and dependent, and decreases their sense of responsibility and self-control. Argyris argued for an alternative organisational design that acknowledged human needs and feelings, and increased workers' satisfaction. Like McGregor, he favoured giving subordinates more independence and decision-making power to create a more informal organisational culture.</p>\n            <p>Likert shared the perspectives of McGregor and Argyris. In his research, he found that managers who encouraged their subordinates could motivate them more than traditional authoritarian managers. Likert based his model of four possible systems on these findings. In System 1, power and authority are distributed strictly according to the classical management subordinate relationship: a manager gives orders to lower-level members. In System 4 organisations, by contrast, there is extensive participation in decision-making and problem-solving groups. Some individuals in each group also belong to other work groups to ensure communication between them. System 4 represents Likert's view of an ideal organisation.</p>\n\n            <h4>Criticisms of the Neoclassical Approach</h4>\n            <p>The neoclassical approach to organisational design compensates for limitations in the traditional classical model, but it has also been criticised. First, the neoclassicists share the classical assumption that there is one best way to design an organisation. They overlook environmental, technological, and other variables that might affect an organisation's design, and overemphasise psychological and behavioural variables. Second, Theories X and Y oversimplify human motivation and neglect individual differences. Not everyone is motivated by the non-monetary aspects of work, nor is all work satisfying. Finally, the coordination of work groups to achieve organisational goals may be more difficult than the neoclassicists suggest, particularly when the objectives of lower-level employees are not consistent with those of upper-level managers.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Early Approaches to Organisational Design</h3>\n<h5>A review of the classical and neoclassical theories of organisational structures</h5>\n<p>Determining the 'best' type of organisational structure for a particular situation has long been an important task for managers in all types of organisations. All structures have advantages and disadvantages and managers face the challenge of developing the most appropriate design for changing circumstances.</p>\n<h4>The Classical Approach</h4>\n<p>Early management writers attempted to approach organisational design using a set of principles that would make an organisational structure perform efficiently in most situations, independent of external conditions and internal objectives. The sociologist Max Weber and management writers Frederick Taylor and Henri Fayol were major contributors to this so-called classical approach. They believed that the most efficient organisations had a legalised, formal and hierarchical structure called a ‘bureaucracy'. Members of the organisation were guided by a sense of duty to the organisation and by a set of rational rules and regulations. According to Weber, such organisations were characterised by the specialisation of tasks, appointment by merit, and an impersonal climate.</p>\n<p>Today the word 'bureaucracy' sometimes has negative connotations. Early management writers, however, commended bureaucracy as an organisational design for its rationality, rules for decision-making, clear chain of command, and promotion of people based on ability and experience, rather than favouritism or whim. Weber also believed that clearly specified authority and responsibility made performance easier to evaluate and reward.</p>\n<h4>Criticism of the Classical Approach</h4>\n<p>Weber, Taylor and Fayol developed their theories when organisations that resembled this bureaucratic model were modern and efficient. It became evident, however, that some of the major advantages of the bureaucratic structure could become disadvantages if the theory were applied dogmatically. For example, the safeguards against favouritism could be rigidly imposed by adhering excessively to rules, resulting in both managers and subordinates becoming depersonalised.</p>\n<p>The classical approach has been criticised from two major perspectives. First, the theory may not have a basis in reality. Have organisations like those described by Weber and the others ever existed? Second, it claims that organisations designed and managed according to bureaucratic principles will enjoy the predicted benefits. But critics argue that the world no longer fits the assumptions in Weber's model (if it ever did), and so a bureaucracy might not yield beneficial results.</p>\n<p>Early human relations researchers and behavioural scientists attempted to deal with the major inadequacy of the classical bureaucratic model: neglect of the human element. They argued that an industrial organisation has two objectives: economic effectiveness and employee satisfaction. They also wrote that the bureaucratic structure could be improved by permitting more subordinate participation in decision-making. Because these researchers tried to improve, and not reject, the classical model, they are sometimes called neoclassical theorists and include Douglas McGregor, Chris Argyris and Rensis Likert.</p>\n<h4>The Neoclassical Approach</h4>\n<p>McGregor believed that the vertical division of labour that characterised bureaucratic organisations was derived from negative and false assumptions about workers which he called Theory X. Managers assume lower-level employees lack ambition and need orders to work effectively. The rigid formal hierarchy is designed to maintain managers' power over subordinates. Decision-making takes place at upper levels of management while the decisions are carried out by people at lower levels. McGregor argued that organisations based instead on Theory Y assumptions use their members' potential. Theory Y assumes that most people find work satisfying, commit themselves willingly to organisational goals and seek responsibility. Members have more independence than in bureaucratic organisations and lower-level participation in decision-making is encouraged.</p>\n<p>Argyris was concerned that managers in bureaucratic organisations had near-total responsibility for controlling their subordinates' work. He argued that managerial domination makes subordinates passive and dependent, and decreases their sense of responsibility and self-control. Argyris argued for an alternative organisational design that acknowledged human needs and feelings, and increased workers' satisfaction. Like McGregor, he favoured giving subordinates more independence and decision-making power to create a more informal organisational culture.</p>\n<p>Likert shared the perspectives of McGregor and Argyris. In his research, he found that managers who encouraged their subordinates could motivate them more than traditional authoritarian managers. Likert based his model of four possible systems on these findings. In System 1, power and authority are distributed strictly according to the classical management subordinate relationship: a manager gives orders to lower-level members. In System 4 organisations, by contrast, there is extensive participation in decision-making and problem-solving groups. Some individuals in each group also belong to other work groups to ensure communication between them. System 4 represents Likert's view of an ideal organisation.</p>\n<h4>Criticisms of the Neoclassical Approach</h4>\n<p>The neoclassical approach to organisational design compensates for limitations in the traditional classical model, but it has also been criticised. First, the neoclassicists share the classical assumption that there is one best way to design an organisation. They overlook environmental, technological, and other variables that might affect an organisation's design, and overemphasise psychological and behavioural variables. Second, Theories X and Y oversimplify human motivation and neglect individual differences. Not everyone is motivated by the non-monetary aspects of work, nor is all work satisfying. Finally, the coordination of work groups to achieve organisational goals may be more difficult than the neoclassicists suggest, particularly when the objectives of lower-level employees are not consistent with those of upper-level managers.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -32,7 +32,7 @@
         "q1",
         "q2"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-anchor\">\n                <h4>Questions 14 and 15</h4>\n                <p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n                <p>According to the writer, which <strong>TWO</strong> of the following are characteristics of the classical approach to organisational design?</p>\n                <div class=\"choice-item\">\n                    <label><input type=\"checkbox\" name=\"q1_2\" value=\"A\"> A. a marked ranking order for employees</label>\n                </div>\n                <div class=\"choice-item\">\n                    <label><input type=\"checkbox\" name=\"q1_2\" value=\"B\"> B. giving importance to everyone's work</label>\n                </div>\n                <div class=\"choice-item\">\n                    <label><input type=\"checkbox\" name=\"q1_2\" value=\"C\"> C. the advancement of older workers</label>\n                </div>\n                <div class=\"choice-item\">\n                    <label><input type=\"checkbox\" name=\"q1_2\" value=\"D\"> D. a neutral working environment</label>\n                </div>\n                <div class=\"choice-item\">\n                    <label><input type=\"checkbox\" name=\"q1_2\" value=\"E\"> E. increased benefits for workers</label>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-anchor\">\n<h4>Questions 14 and 15</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>According to the writer, which <strong>TWO</strong> of the following are characteristics of the classical approach to organisational design?</p>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q1_2\" value=\"A\"> A. a marked ranking order for employees</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q1_2\" value=\"B\"> B. giving importance to everyone's work</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q1_2\" value=\"C\"> C. the advancement of older workers</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q1_2\" value=\"D\"> D. a neutral working environment</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q1_2\" value=\"E\"> E. increased benefits for workers</label>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -42,7 +42,7 @@
         "q3",
         "q4"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q3-4-anchor\">\n                <h4>Questions 16 and 17</h4>\n                <p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n                <p>According to the writer, which <strong>TWO</strong> of the following are criticisms of the classical approach to organisational design?</p>\n                <div class=\"choice-item\">\n                    <label><input type=\"checkbox\" name=\"q3_4\" value=\"A\"> A. Too many guidelines are proposed</label>\n                </div>\n                <div class=\"choice-item\">\n                    <label><input type=\"checkbox\" name=\"q3_4\" value=\"B\"> B. Certain practices become negative if they are implemented too strictly</label>\n                </div>\n                <div class=\"choice-item\">\n                    <label><input type=\"checkbox\" name=\"q3_4\" value=\"C\"> C. Managers and workers are unable to co-operate with each other</label>\n                </div>\n                <div class=\"choice-item\">\n                    <label><input type=\"checkbox\" name=\"q3_4\" value=\"D\"> D. The administrative standards are unsuited to some work environments</label>\n                </div>\n                <div class=\"choice-item\">\n                    <label><input type=\"checkbox\" name=\"q3_4\" value=\"E\"> E. Positive outcomes which were expected in the past would be unlikely today</label>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q3-4-anchor\">\n<h4>Questions 16 and 17</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>According to the writer, which <strong>TWO</strong> of the following are criticisms of the classical approach to organisational design?</p>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q3_4\" value=\"A\"> A. Too many guidelines are proposed</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q3_4\" value=\"B\"> B. Certain practices become negative if they are implemented too strictly</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q3_4\" value=\"C\"> C. Managers and workers are unable to co-operate with each other</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q3_4\" value=\"D\"> D. The administrative standards are unsuited to some work environments</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q3_4\" value=\"E\"> E. Positive outcomes which were expected in the past would be unlikely today</label>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -51,7 +51,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q5-6-anchor\">\n                <h4>Questions 18 and 19</h4>\n                <p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n                <p>According to the writer, which <strong>TWO</strong> of the following are aims of the neoclassical approach to organisational design?</p>\n                <div class=\"choice-item\">\n                    <label><input type=\"checkbox\" name=\"q5_6\" value=\"A\"> A. to ensure workers are treated as individual people</label>\n                </div>\n                <div class=\"choice-item\">\n                    <label><input type=\"checkbox\" name=\"q5_6\" value=\"B\"> B. to create a formal atmosphere in the workplace</label>\n                </div>\n                <div class=\"choice-item\">\n                    <label><input type=\"checkbox\" name=\"q5_6\" value=\"C\"> C. to change the methods of production</label>\n                </div>\n                <div class=\"choice-item\">\n                    <label><input type=\"checkbox\" name=\"q5_6\" value=\"D\"> D. to allow workers a greater say in what happens at the workplace</label>\n                </div>\n                <div class=\"choice-item\">\n                    <label><input type=\"checkbox\" name=\"q5_6\" value=\"E\"> E. to standardise the procedures for promotion of workers</label>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q5-6-anchor\">\n<h4>Questions 18 and 19</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>According to the writer, which <strong>TWO</strong> of the following are aims of the neoclassical approach to organisational design?</p>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q5_6\" value=\"A\"> A. to ensure workers are treated as individual people</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q5_6\" value=\"B\"> B. to create a formal atmosphere in the workplace</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q5_6\" value=\"C\"> C. to change the methods of production</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q5_6\" value=\"D\"> D. to allow workers a greater say in what happens at the workplace</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q5_6\" value=\"E\"> E. to standardise the procedures for promotion of workers</label>\n</div>\n</div>"
     },
     {
       "groupId": "group-4",
@@ -60,7 +60,7 @@
         "q7",
         "q8"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-anchor\">\n                <h4>Questions 20 and 21</h4>\n                <p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n                <p>According to the writer, which <strong>TWO</strong> of the following are criticisms of the neoclassical approach to organisational design?</p>\n                <div class=\"choice-item\">\n                    <label><input type=\"checkbox\" name=\"q7_8\" value=\"A\"> A. It suggests that workers are involved in too many decisions</label>\n                </div>\n                <div class=\"choice-item\">\n                    <label><input type=\"checkbox\" name=\"q7_8\" value=\"B\"> B. The effects of some psychological factors are given low importance</label>\n                </div>\n                <div class=\"choice-item\">\n                    <label><input type=\"checkbox\" name=\"q7_8\" value=\"C\"> C. The effects of the workplace surroundings are ignored</label>\n                </div>\n                <div class=\"choice-item\">\n                    <label><input type=\"checkbox\" name=\"q7_8\" value=\"D\"> D. It exaggerates the success of the organisations that use this approach</label>\n                </div>\n                <div class=\"choice-item\">\n                    <label><input type=\"checkbox\" name=\"q7_8\" value=\"E\"> E. It assumes that all people work for enjoyment rather than financial gain</label>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-anchor\">\n<h4>Questions 20 and 21</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>According to the writer, which <strong>TWO</strong> of the following are criticisms of the neoclassical approach to organisational design?</p>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q7_8\" value=\"A\"> A. It suggests that workers are involved in too many decisions</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q7_8\" value=\"B\"> B. The effects of some psychological factors are given low importance</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q7_8\" value=\"C\"> C. The effects of the workplace surroundings are ignored</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q7_8\" value=\"D\"> D. It exaggerates the success of the organisations that use this approach</label>\n</div>\n<div class=\"choice-item\">\n<label><input type=\"checkbox\" name=\"q7_8\" value=\"E\"> E. It assumes that all people work for enjoyment rather than financial gain</label>\n</div>\n</div>"
     },
     {
       "groupId": "group-5",
@@ -72,7 +72,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n                <h4>Questions 22–26</h4>\n                <p>Look at the following beliefs (Questions 22–26) and the list of people below. Match each belief with the correct person, <strong>A–D</strong>.</p>\n                <p><em>NB You may use any letter more than once.</em></p>\n                \n                <div class=\"match-question-item\">\n                    <p><strong>22</strong> The classical approach relied upon managers having incorrect views about workers.</p>\n                    <div class=\"match-dropzone\" data-question=\"q9\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>23</strong> In the best organisational model, there is shared decision-making and interaction between teams at work.</p>\n                    <div class=\"match-dropzone\" data-question=\"q10\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                    <p><strong>24</strong> In an efficient organisation, workers develop expertise in particular areas.</p>\n                    <div class=\"match-dropzone\" data-question=\"q11\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                    <p><strong>25</strong> An organisation must take into account the emotional demands of people.</p>\n                    <div class=\"match-dropzone\" data-question=\"q12\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>26</strong> The classical approach allowed workers' skills to be assessed in a straightforward way.</p>\n                    <div class=\"match-dropzone\" data-question=\"q13\"></div>\n                </div>\n\n                <div class=\"options-pool\" id=\"people-options-pool\">\n                    <strong>List of people</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" id=\"person-A\" draggable=\"true\" data-option=\"A\">A. Max Weber</div>\n                        <div class=\"drag-item\" id=\"person-B\" draggable=\"true\" data-option=\"B\">B. Douglas McGregor</div>\n                        <div class=\"drag-item\" id=\"person-C\" draggable=\"true\" data-option=\"C\">C. Chris Argyris</div>\n                        <div class=\"drag-item\" id=\"person-D\" draggable=\"true\" data-option=\"D\">D. Rensis Likert</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 22–26</h4>\n<p>Look at the following beliefs (Questions 22–26) and the list of people below. Match each belief with the correct person, <strong>A–D</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>22</strong> The classical approach relied upon managers having incorrect views about workers.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> In the best organisational model, there is shared decision-making and interaction between teams at work.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>24</strong> In an efficient organisation, workers develop expertise in particular areas.</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>25</strong> An organisation must take into account the emotional demands of people.</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>26</strong> The classical approach allowed workers' skills to be assessed in a straightforward way.</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div class=\"options-pool\" id=\"people-options-pool\">\n<strong>List of people</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"person-A\" draggable=\"true\" data-option=\"A\">A. Max Weber</div>\n<div class=\"drag-item\" id=\"person-B\" draggable=\"true\" data-option=\"B\">B. Douglas McGregor</div>\n<div class=\"drag-item\" id=\"person-C\" draggable=\"true\" data-option=\"C\">C. Chris Argyris</div>\n<div class=\"drag-item\" id=\"person-D\" draggable=\"true\" data-option=\"D\">D. Rensis Likert</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": true
     }
   ],
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 2</h2>\n            <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n            \n            <h3>Corporate Social Responsibility</h3>\n            \n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"A\" id=\"q1-dropzone\" data-question=\"q1\">\n                    <span class=\"paragraph-label\">Question 14 (A):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>A</strong> An excellent definition was developed in the 1980s by Norwegian Prime Minister Gro Harlem Brundtland and used by the World Business Council for Sustainable Development: \"Meeting the needs of the present without compromising the ability of future generations to meet their own needs.\" Nowadays, governments and companies need to account for the social consequences of their actions. As a result, corporate social responsibility (CSR) has become a priority for business leaders around the world. When a well-run business applies its vast resources and expertise to social problems that it understands and in which it has a stake, it can have a greater impact than any other organisation. The notion of licence to operate derives from the fact that every company needs tacit or explicit permission from governments, communities, and numerous other stakeholders to justify CSR initiatives to improve a company's image, strengthen its brand, enliven morale and even raise the value of its stock.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"B\" id=\"q2-dropzone\" data-question=\"q2\">\n                    <span class=\"paragraph-label\">Question 15 (B):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>B</strong> To advance CSR, we must root it in a broad understanding of the interrelationship between a corporation and society. Successful corporations need a healthy society. Education, health care, and equal opportunity are essential to a productive workforce. Safe products and working conditions not only attract customers but lower the internal costs of accidents. Efficient utilisation of land, water, energy, and other natural resources makes business more productive. Good government, the rule of law, and property rights are essential for efficiency and innovation. Strong regulatory standards protect both consumers and competitive companies from exploitation. Ultimately, a healthy society creates expanding demand for business, as more human needs are met and aspirations grow. Any business that pursues its ends at the expense of the society in which it operates will find its success to be illusory and ultimately temporary. At the same time, a healthy society needs successful companies. No social programme can rival the business sector when it comes to creating the jobs, wealth, and innovation that improve standards of living and social conditions over time.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                 <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"C\" id=\"q3-dropzone\" data-question=\"q3\">\n                    <span class=\"paragraph-label\">Question 16 (C):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>C</strong> A company's impact on society also changes over time, as social standards evolve and science progresses. Asbestos, now understood as a serious health risk, was thought to be safe in the early 1900s, given the scientific knowledge then available. Evidence of its risks gradually mounted for more than 50 years before any company was held liable for the harms it can cause. Many firms that failed to anticipate the consequences of this evolving body of research have been bankrupted by the results. No longer can companies be content to monitor only the obvious social impacts of today. Without a careful process for identifying evolving social effects of tomorrow, firms may risk their very survival.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"D\" id=\"q4-dropzone\" data-question=\"q4\">\n                    <span class=\"paragraph-label\">Question 17 (D):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>D</strong> No business can solve all of society's problems or bear the cost of doing so. Instead, each company must select issues that intersect with its particular business. Other social agendas are best left to those companies in other industries, NGOs, or government institutions that are better positioned to address them. The essential test that should guide CSR is not whether a cause is worthy but whether it presents an opportunity to create shared value – that is, a meaningful benefit for society that is also valuable to the business. Each company can identify the particular set of societal problems that it is best equipped to help resolve and from which it can gain the greatest competitive benefit.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                 <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"E\" id=\"q5-dropzone\" data-question=\"q5\">\n                    <span class=\"paragraph-label\">Question 18 (E):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>E</strong> The best corporate citizenship initiatives involve far more than writing a cheque: they specify clear, measurable goals and track results over time. A good example is General Electric's programme to adopt underperforming public high schools near several of its major U.S. facilities. The company contributes between $250,000 and $1 million over a five-year period to each school and makes in-kind donations as well. GE managers and employees take an active role by working with school administrators to assess needs and mentor or tutor students. In an independent study of ten schools in the programme between 1989 and 1999, nearly all showed significant improvement, while the graduation rate in four of the five worst-performing schools doubled from an average of 30 % to 60 %. Effective corporate citizenship initiatives such as this one create goodwill and improve relations with local governments and other important constituencies. What's more, GE's employees feel great pride in their participation. Their effect is inherently limited, however. No matter how beneficial the programme is, it remains incidental to the company's business, and the direct effect on GE's recruiting and retention is modest.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                 <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"F\" id=\"q6-dropzone\" data-question=\"q6\">\n                    <span class=\"paragraph-label\">Question 19 (F):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>F</strong> Microsoft's Working Connections partnership with the American Association of Community Colleges (AACC) is a good example of a shared-value opportunity arising from investments in context. The shortage of information-technology workers is a significant constraint on Microsoft's growth; currently, there are more than 450,000 unfilled IT positions in the United States alone. Community colleges, with an enrolment of 11.6 million students, representing 45 % of all U.S. undergraduates, could be a major solution. Microsoft recognises, however, that community colleges face special challenges: IT curricula are not standardised, technology used in classrooms is often outdated, and there are no systematic professional development programmes to keep faculty up to date. Microsoft's $50 million five-year initiative was aimed at all three problems. In addition to contributing money and products, Microsoft sent employee volunteers to colleges to assess needs, contribute to curriculum development, and create faculty-development institutes. Microsoft has achieved results that have benefited many communities while having a direct and potentially significant impact on the company.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                 <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"G\" id=\"q7-dropzone\" data-question=\"q7\">\n                    <span class=\"paragraph-label\">Question 20 (G):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>G</strong> At the heart of any strategy is a unique value proposition: a set of needs a company can meet for its chosen customers that its competitors cannot. The most strategic CSR occurs when a company adds a social dimension to its value proposition, making social impact integral to the overall strategy. Consider Whole Foods Market, whose value proposition is to sell organic, natural, and healthy food products to customers who are passionate about food and the environment. The company's sourcing emphasises purchases from local farmers through each store's procurement process. Buyers screen out foods containing any of nearly 100 common ingredients that the company considers unhealthy or environmentally damaging. The same standards apply to products made internally. Whole Foods' commitment to natural and environmentally friendly operating practices extends well beyond sourcing. Stores are constructed using a minimum of virgin raw materials. Recently, the company purchased renewable wind-energy credits equal to 100 % of its electricity use in all of its stores and facilities, the only Fortune 500 company to offset its electricity consumption entirely. Spoiled produce and biodegradable waste are trucked to regional centres for composting. Whole Foods' vehicles are being converted to run on biofuels. Even the cleaning products used in its stores are environmentally friendly. And through its philanthropy, the company has created the Animal Compassion Foundation to develop more natural and humane ways of raising farm animals. In short, nearly every aspect of the company's value chain reinforces the social dimensions of its value proposition, distinguishing Whole Foods from its competitors.</p>\n            </div>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Corporate Social Responsibility</h3>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"A\" id=\"q1-dropzone\" data-question=\"q1\">\n<span class=\"paragraph-label\">Question 14 (A):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> An excellent definition was developed in the 1980s by Norwegian Prime Minister Gro Harlem Brundtland and used by the World Business Council for Sustainable Development: \"Meeting the needs of the present without compromising the ability of future generations to meet their own needs.\" Nowadays, governments and companies need to account for the social consequences of their actions. As a result, corporate social responsibility (CSR) has become a priority for business leaders around the world. When a well-run business applies its vast resources and expertise to social problems that it understands and in which it has a stake, it can have a greater impact than any other organisation. The notion of licence to operate derives from the fact that every company needs tacit or explicit permission from governments, communities, and numerous other stakeholders to justify CSR initiatives to improve a company's image, strengthen its brand, enliven morale and even raise the value of its stock.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"B\" id=\"q2-dropzone\" data-question=\"q2\">\n<span class=\"paragraph-label\">Question 15 (B):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> To advance CSR, we must root it in a broad understanding of the interrelationship between a corporation and society. Successful corporations need a healthy society. Education, health care, and equal opportunity are essential to a productive workforce. Safe products and working conditions not only attract customers but lower the internal costs of accidents. Efficient utilisation of land, water, energy, and other natural resources makes business more productive. Good government, the rule of law, and property rights are essential for efficiency and innovation. Strong regulatory standards protect both consumers and competitive companies from exploitation. Ultimately, a healthy society creates expanding demand for business, as more human needs are met and aspirations grow. Any business that pursues its ends at the expense of the society in which it operates will find its success to be illusory and ultimately temporary. At the same time, a healthy society needs successful companies. No social programme can rival the business sector when it comes to creating the jobs, wealth, and innovation that improve standards of living and social conditions over time.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"C\" id=\"q3-dropzone\" data-question=\"q3\">\n<span class=\"paragraph-label\">Question 16 (C):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> A company's impact on society also changes over time, as social standards evolve and science progresses. Asbestos, now understood as a serious health risk, was thought to be safe in the early 1900s, given the scientific knowledge then available. Evidence of its risks gradually mounted for more than 50 years before any company was held liable for the harms it can cause. Many firms that failed to anticipate the consequences of this evolving body of research have been bankrupted by the results. No longer can companies be content to monitor only the obvious social impacts of today. Without a careful process for identifying evolving social effects of tomorrow, firms may risk their very survival.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"D\" id=\"q4-dropzone\" data-question=\"q4\">\n<span class=\"paragraph-label\">Question 17 (D):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> No business can solve all of society's problems or bear the cost of doing so. Instead, each company must select issues that intersect with its particular business. Other social agendas are best left to those companies in other industries, NGOs, or government institutions that are better positioned to address them. The essential test that should guide CSR is not whether a cause is worthy but whether it presents an opportunity to create shared value – that is, a meaningful benefit for society that is also valuable to the business. Each company can identify the particular set of societal problems that it is best equipped to help resolve and from which it can gain the greatest competitive benefit.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"E\" id=\"q5-dropzone\" data-question=\"q5\">\n<span class=\"paragraph-label\">Question 18 (E):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> The best corporate citizenship initiatives involve far more than writing a cheque: they specify clear, measurable goals and track results over time. A good example is General Electric's programme to adopt underperforming public high schools near several of its major U.S. facilities. The company contributes between $250,000 and $1 million over a five-year period to each school and makes in-kind donations as well. GE managers and employees take an active role by working with school administrators to assess needs and mentor or tutor students. In an independent study of ten schools in the programme between 1989 and 1999, nearly all showed significant improvement, while the graduation rate in four of the five worst-performing schools doubled from an average of 30 % to 60 %. Effective corporate citizenship initiatives such as this one create goodwill and improve relations with local governments and other important constituencies. What's more, GE's employees feel great pride in their participation. Their effect is inherently limited, however. No matter how beneficial the programme is, it remains incidental to the company's business, and the direct effect on GE's recruiting and retention is modest.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"F\" id=\"q6-dropzone\" data-question=\"q6\">\n<span class=\"paragraph-label\">Question 19 (F):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> Microsoft's Working Connections partnership with the American Association of Community Colleges (AACC) is a good example of a shared-value opportunity arising from investments in context. The shortage of information-technology workers is a significant constraint on Microsoft's growth; currently, there are more than 450,000 unfilled IT positions in the United States alone. Community colleges, with an enrolment of 11.6 million students, representing 45 % of all U.S. undergraduates, could be a major solution. Microsoft recognises, however, that community colleges face special challenges: IT curricula are not standardised, technology used in classrooms is often outdated, and there are no systematic professional development programmes to keep faculty up to date. Microsoft's $50 million five-year initiative was aimed at all three problems. In addition to contributing money and products, Microsoft sent employee volunteers to colleges to assess needs, contribute to curriculum development, and create faculty-development institutes. Microsoft has achieved results that have benefited many communities while having a direct and potentially significant impact on the company.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"G\" id=\"q7-dropzone\" data-question=\"q7\">\n<span class=\"paragraph-label\">Question 20 (G):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>G</strong> At the heart of any strategy is a unique value proposition: a set of needs a company can meet for its chosen customers that its competitors cannot. The most strategic CSR occurs when a company adds a social dimension to its value proposition, making social impact integral to the overall strategy. Consider Whole Foods Market, whose value proposition is to sell organic, natural, and healthy food products to customers who are passionate about food and the environment. The company's sourcing emphasises purchases from local farmers through each store's procurement process. Buyers screen out foods containing any of nearly 100 common ingredients that the company considers unhealthy or environmentally damaging. The same standards apply to products made internally. Whole Foods' commitment to natural and environmentally friendly operating practices extends well beyond sourcing. Stores are constructed using a minimum of virgin raw materials. Recently, the company purchased renewable wind-energy credits equal to 100 % of its electricity use in all of its stores and facilities, the only Fortune 500 company to offset its electricity consumption entirely. Spoiled produce and biodegradable waste are trucked to regional centres for composting. Whole Foods' vehicles are being converted to run on biofuels. Even the cleaning products used in its stores are environmentally friendly. And through its philanthropy, the company has created the Animal Compassion Foundation to develop more natural and humane ways of raising farm animals. In short, nearly every aspect of the company's value chain reinforces the social dimensions of its value proposition, distinguishing Whole Foods from its competitors.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -37,7 +37,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n                <h4>Questions 14–20</h4>\n                <p>The reading passage has seven paragraphs, <strong>A–G</strong>.</p>\n                <p>Choose the correct heading for each paragraph from the list of headings below.</p>\n                <p><em>Drag a heading from this list and drop it onto the correct paragraph's answer box on the left.</em></p>\n                <div class=\"headings-pool\" id=\"headings-pool-container\">\n                    <strong>List of Headings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. How CSR may help one business to expand</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. CSR in many aspects of a company's business</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. A CSR initiative without a financial gain</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. Lack of action by the state on social issues</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. Drivers or pressures motivate companies to address CSR</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. The past illustrates businesses are responsible for future outcomes</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. Companies applying CSR should be selective</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. Reasons that business and society benefit each other</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 14–20</h4>\n<p>The reading passage has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from this list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. How CSR may help one business to expand</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. CSR in many aspects of a company's business</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. A CSR initiative without a financial gain</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. Lack of action by the state on social issues</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. Drivers or pressures motivate companies to address CSR</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. The past illustrates businesses are responsible for future outcomes</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. Companies applying CSR should be selective</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. Reasons that business and society benefit each other</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -48,7 +48,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\">\n                <h4>Questions 21–22</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n                <div class=\"question-item\" id=\"q8-anchor\">\n                    <p><strong>The implementation of CSR – How?</strong></p>\n                    <p>Promotion of CSR requires the understanding of interdependence between business and society. Corporations' workers' productivity generally needs health care, education, and 21 <input class=\"blank\" name=\"q8\">. Restrictions imposed by government and companies both protect consumers from being treated unfairly. Improvement of the safety standard can reduce the 22 <input class=\"blank\" name=\"q9\"> of accidents in the workplace. Similarly, society becomes a pool of more human needs and aspirations.</p>\n                </div>\n                <div id=\"q9-anchor\"></div>\n            </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 21–22</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"question-item\" id=\"q8-anchor\">\n<p><strong>The implementation of CSR – How?</strong></p>\n<p>Promotion of CSR requires the understanding of interdependence between business and society. Corporations' workers' productivity generally needs health care, education, and 21 <input class=\"blank\" name=\"q8\">. Restrictions imposed by government and companies both protect consumers from being treated unfairly. Improvement of the safety standard can reduce the 22 <input class=\"blank\" name=\"q9\"> of accidents in the workplace. Similarly, society becomes a pool of more human needs and aspirations.</p>\n</div>\n<div id=\"q9-anchor\"></div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\">\n                <h4>Questions 23–26</h4>\n                <p>Look at the following opinions or deeds (Questions 23–26) and the list of companies below.</p>\n                <p>Match each opinion or deed with the correct company, A, B or C.</p>\n                <p><em>NB You may use any letter more than once.</em></p>\n                \n                <div class=\"question-item\" id=\"q10-anchor\">\n                    <p><strong>23</strong> Disposable waste</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q10\" type=\"radio\" value=\"A\"> A General Electric</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"B\"> B Microsoft</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"C\"> C Whole Foods Market</label>\n                    </div>\n                </div>\n                \n                <div class=\"question-item\" id=\"q11-anchor\">\n                    <p><strong>24</strong> The way the company purchases its goods</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q11\" type=\"radio\" value=\"A\"> A General Electric</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"B\"> B Microsoft</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"C\"> C Whole Foods Market</label>\n                    </div>\n                </div>\n\n                <div class=\"question-item\" id=\"q12-anchor\">\n                    <p><strong>25</strong> Helping the under-developed</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q12\" type=\"radio\" value=\"A\"> A General Electric</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"B\"> B Microsoft</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"C\"> C Whole Foods Market</label>\n                    </div>\n                </div>\n                \n                <div class=\"question-item\" id=\"q13-anchor\">\n                    <p><strong>26</strong> Ensuring that people have the latest information</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q13\" type=\"radio\" value=\"A\"> A General Electric</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"B\"> B Microsoft</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"C\"> C Whole Foods Market</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 23–26</h4>\n<p>Look at the following opinions or deeds (Questions 23–26) and the list of companies below.</p>\n<p>Match each opinion or deed with the correct company, A, B or C.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"question-item\" id=\"q10-anchor\">\n<p><strong>23</strong> Disposable waste</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"> A General Electric</label> <label><input name=\"q10\" type=\"radio\" value=\"B\"> B Microsoft</label> <label><input name=\"q10\" type=\"radio\" value=\"C\"> C Whole Foods Market</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q11-anchor\">\n<p><strong>24</strong> The way the company purchases its goods</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"> A General Electric</label> <label><input name=\"q11\" type=\"radio\" value=\"B\"> B Microsoft</label> <label><input name=\"q11\" type=\"radio\" value=\"C\"> C Whole Foods Market</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q12-anchor\">\n<p><strong>25</strong> Helping the under-developed</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"A\"> A General Electric</label> <label><input name=\"q12\" type=\"radio\" value=\"B\"> B Microsoft</label> <label><input name=\"q12\" type=\"radio\" value=\"C\"> C Whole Foods Market</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q13-anchor\">\n<p><strong>26</strong> Ensuring that people have the latest information</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"> A General Electric</label> <label><input name=\"q13\" type=\"radio\" value=\"B\"> B Microsoft</label> <label><input name=\"q13\" type=\"radio\" value=\"C\"> C Whole Foods Market</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 2</h2>\n            <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 on the following pages.</p>\n            \n            <h3>Investment in Shares vs. Investment in Other Assets</h3>\n            <h4>Which Gives the Greater Gain?</h4>\n            <p><em>How one university collected the data to try and answer this question</em></p>\n\n            <div class=\"paragraph-wrapper\" id=\"q1-anchor\">\n                <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"A\" data-question=\"q1\">\n                    <span class=\"paragraph-label\">Paragraph A (Q14):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>A</strong> It all began in 1958 with a phone call from Louis Engel, a banker at Merrill Lynch, a US-based financial management company, who wanted to know how investors in shares had performed relative to investors in other assets such as low-risk investments with guaranteed returns. 'I don't know, but if you gave me $50,000 I could find out,' replied Jim Lorie, a dean at the University of Chicago's business school. Louis Engel soon agreed to provide the funding, and more. The result, in 1960, was the launch of the University's Center for Research in Security Prices. Half a century later CRSP (pronounced 'crisp') data are everywhere. They provided the foundation of at least one-third of all empirical research in finance over the past 40 years, according to a presentation at a symposium held this month. They probably influenced much of the rest.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q2-anchor\">\n                <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"B\" data-question=\"q2\">\n                    <span class=\"paragraph-label\">Paragraph B (Q15):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>B</strong> Getting the CRSP data together was a tough process in what were then the early days of computers. Up to three million pieces of information on all the shares traded on the New York Stock Exchange between 1926 and 1960 were transferred from paper in the exchange's archive to magnetic tape. A lot of time was spent adjusting prices to take account of complexities in the market. Lorie and his co-researcher, Lawrence Fisher, chose January 1926 as the start date because they wanted the data to span at least one complete business cycle from boom to bust, or vice versa.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q3-anchor\">\n                 <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"C\" data-question=\"q3\">\n                    <span class=\"paragraph-label\">Paragraph C (Q16):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>C</strong> When these two economists published the first study based on the CRSP data in 1964, they reported that the annual compound return on the shares over the entire 35-year period was (depending on the tax status of the investor) between 6.8% and 9%. Acknowledging that good data on the performance of other assets were not available, the study claimed that the rate of return on shares was 'substantially higher than for alternative investment media', providing the first empirical support for the still-popular idea that shares outperform other investments over the long run. Fisher and Lorie also observed that many people chose to invest in assets with lower returns because they were cautious by nature and were concerned about the risk of loss inherent in investing in the stock market. Economists today call the amount of extra return that investors need to compensate them for this additional risk the ‘equity risk premium', although they differ greatly on how big investors should expect it to be.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q4-anchor\">\n                <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"D\" data-question=\"q4\">\n                    <span class=\"paragraph-label\">Paragraph D (Q17):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>D</strong> After Fisher and Lorie's 1964 report there was no stopping the love affair between financial economists and the data that studying these numbers produced. Myron Scholes, now a Nobel laureate, became director of CRSP in 1974, and ensured the database was both kept up to date and made readily available to academic economists everywhere. In turn, this resource became ever more useful as computing power became more affordable. The CRSP database has since been expanded to include a full range of different types of investments. It has been replicated across the world.</p>\n            </div>\n             <div class=\"paragraph-wrapper\" id=\"q5-anchor\">\n                 <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"E\" data-question=\"q5\">\n                    <span class=\"paragraph-label\">Paragraph E (Q18):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>E</strong> One of the earliest uses of CRSP data was by Eugene Fama, an economist at the University of Chicago, to support his ‘efficient-market hypothesis'. He found that over a lengthy period share prices tended to rise and fall randomly, without showing much of a pattern. Markets are efficient, he said, because all relevant information is reflected in share prices at any given moment, meaning there are no predictable movements in prices for smart investors to exploit. Fama did concede that there was some evidence of temporary short-term predictability in share prices, however. That stipulation has resulted in a vast number of papers based on discovering such 'variations' through data mining. In theory, such anomalies are potentially lucrative for investors, but as believers in efficient markets observe with satisfaction, it seems that no sooner are such anomalies discovered and reported in journals than they typically disappear.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q6-anchor\">\n                 <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"F\" data-question=\"q6\">\n                    <span class=\"paragraph-label\">Paragraph F (Q19):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>F</strong> However, the sheer volume of material means that financial economists are becoming increasingly specialised, which may have costs as well as benefits. Some economists worry that much of this statistical analysis is creating some interference that drowns out serious thinking about the big questions, such as why the financial system nearly collapsed in 2008 and how a repeat can be avoided. Robert Shiller, an economist at Yale University and a long-time sceptic about the efficient-market hypothesis, feels that with the creation of the CRSP database economists suddenly believed that finance had become scientific. According to Shiller, conventional ideas about investing and financial markets - and about their vulnerabilities – seemed out of date to the new empiricists. He worries that academic departments are full of economists who are so specialised in data analysis that they fail to see and understand the whole. They get a sense of authority from work that contains lots of data. To have seen the 2008 global financial crisis coming, he argues, it would have been better to ‘go back to old-fashioned readings of history, studying institutions and laws. We should have talked to grandpa.’</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q7-anchor\">\n                 <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"G\" data-question=\"q7\">\n                    <span class=\"paragraph-label\">Paragraph G (Q20):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>G</strong> Scholes responds to this criticism with the contention that the usefulness of this empirical analysis is proven by the fact that demand for it continues to grow. At CRSP's 50th-anniversary symposium, plans were unveiled to publish indicators on an expanding range of investments, as well as for growth and value stocks. These indicators, CRSP claims, will be more academically rigorous and cheaper than existing ones. For believers in the efficiency of markets, that should be enough to ensure CRSP's continuing success.</p>\n            </div>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 on the following pages.</p>\n<h3>Investment in Shares vs. Investment in Other Assets</h3>\n<h4>Which Gives the Greater Gain?</h4>\n<p><em>How one university collected the data to try and answer this question</em></p>\n<div class=\"paragraph-wrapper\" id=\"q1-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"A\" data-question=\"q1\">\n<span class=\"paragraph-label\">Paragraph A (Q14):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> It all began in 1958 with a phone call from Louis Engel, a banker at Merrill Lynch, a US-based financial management company, who wanted to know how investors in shares had performed relative to investors in other assets such as low-risk investments with guaranteed returns. 'I don't know, but if you gave me $50,000 I could find out,' replied Jim Lorie, a dean at the University of Chicago's business school. Louis Engel soon agreed to provide the funding, and more. The result, in 1960, was the launch of the University's Center for Research in Security Prices. Half a century later CRSP (pronounced 'crisp') data are everywhere. They provided the foundation of at least one-third of all empirical research in finance over the past 40 years, according to a presentation at a symposium held this month. They probably influenced much of the rest.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q2-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"B\" data-question=\"q2\">\n<span class=\"paragraph-label\">Paragraph B (Q15):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> Getting the CRSP data together was a tough process in what were then the early days of computers. Up to three million pieces of information on all the shares traded on the New York Stock Exchange between 1926 and 1960 were transferred from paper in the exchange's archive to magnetic tape. A lot of time was spent adjusting prices to take account of complexities in the market. Lorie and his co-researcher, Lawrence Fisher, chose January 1926 as the start date because they wanted the data to span at least one complete business cycle from boom to bust, or vice versa.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q3-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"C\" data-question=\"q3\">\n<span class=\"paragraph-label\">Paragraph C (Q16):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> When these two economists published the first study based on the CRSP data in 1964, they reported that the annual compound return on the shares over the entire 35-year period was (depending on the tax status of the investor) between 6.8% and 9%. Acknowledging that good data on the performance of other assets were not available, the study claimed that the rate of return on shares was 'substantially higher than for alternative investment media', providing the first empirical support for the still-popular idea that shares outperform other investments over the long run. Fisher and Lorie also observed that many people chose to invest in assets with lower returns because they were cautious by nature and were concerned about the risk of loss inherent in investing in the stock market. Economists today call the amount of extra return that investors need to compensate them for this additional risk the ‘equity risk premium', although they differ greatly on how big investors should expect it to be.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q4-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"D\" data-question=\"q4\">\n<span class=\"paragraph-label\">Paragraph D (Q17):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> After Fisher and Lorie's 1964 report there was no stopping the love affair between financial economists and the data that studying these numbers produced. Myron Scholes, now a Nobel laureate, became director of CRSP in 1974, and ensured the database was both kept up to date and made readily available to academic economists everywhere. In turn, this resource became ever more useful as computing power became more affordable. The CRSP database has since been expanded to include a full range of different types of investments. It has been replicated across the world.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q5-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"E\" data-question=\"q5\">\n<span class=\"paragraph-label\">Paragraph E (Q18):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> One of the earliest uses of CRSP data was by Eugene Fama, an economist at the University of Chicago, to support his ‘efficient-market hypothesis'. He found that over a lengthy period share prices tended to rise and fall randomly, without showing much of a pattern. Markets are efficient, he said, because all relevant information is reflected in share prices at any given moment, meaning there are no predictable movements in prices for smart investors to exploit. Fama did concede that there was some evidence of temporary short-term predictability in share prices, however. That stipulation has resulted in a vast number of papers based on discovering such 'variations' through data mining. In theory, such anomalies are potentially lucrative for investors, but as believers in efficient markets observe with satisfaction, it seems that no sooner are such anomalies discovered and reported in journals than they typically disappear.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q6-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"F\" data-question=\"q6\">\n<span class=\"paragraph-label\">Paragraph F (Q19):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> However, the sheer volume of material means that financial economists are becoming increasingly specialised, which may have costs as well as benefits. Some economists worry that much of this statistical analysis is creating some interference that drowns out serious thinking about the big questions, such as why the financial system nearly collapsed in 2008 and how a repeat can be avoided. Robert Shiller, an economist at Yale University and a long-time sceptic about the efficient-market hypothesis, feels that with the creation of the CRSP database economists suddenly believed that finance had become scientific. According to Shiller, conventional ideas about investing and financial markets - and about their vulnerabilities – seemed out of date to the new empiricists. He worries that academic departments are full of economists who are so specialised in data analysis that they fail to see and understand the whole. They get a sense of authority from work that contains lots of data. To have seen the 2008 global financial crisis coming, he argues, it would have been better to ‘go back to old-fashioned readings of history, studying institutions and laws. We should have talked to grandpa.’</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q7-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"G\" data-question=\"q7\">\n<span class=\"paragraph-label\">Paragraph G (Q20):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>G</strong> Scholes responds to this criticism with the contention that the usefulness of this empirical analysis is proven by the fact that demand for it continues to grow. At CRSP's 50th-anniversary symposium, plans were unveiled to publish indicators on an expanding range of investments, as well as for growth and value stocks. These indicators, CRSP claims, will be more academically rigorous and cheaper than existing ones. For believers in the efficiency of markets, that should be enough to ensure CRSP's continuing success.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -37,7 +37,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n                <h4>Questions 14–20</h4>\n                <p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n                <p>Choose the correct heading for each paragraph from the list of headings below.</p>\n                \n                <div class=\"headings-pool\" id=\"headings-pool-container\">\n                    <strong>List of Headings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. Technological developments improve CRSP data</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. Initial findings of the CRSP project</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. A request and a far-reaching result</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. Difficulties in collecting CRSP data</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. What the future holds</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. Too much data for people to have an overall understanding</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. Other university departments which depend on CRSP</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. CRSP data not always being a useful basis for investment</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 14–20</h4>\n<p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. Technological developments improve CRSP data</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. Initial findings of the CRSP project</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. A request and a far-reaching result</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. Difficulties in collecting CRSP data</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. What the future holds</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. Too much data for people to have an overall understanding</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. Other university departments which depend on CRSP</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. CRSP data not always being a useful basis for investment</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -49,7 +49,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-anchor\">\n                <h4>Questions 21–23</h4>\n                <p>Look at the following statements (21–23) and the list of economists below.</p>\n                <p>Match each statement with the correct economist <strong>A, B, C</strong> or <strong>D</strong>.</p>\n\n                <div class=\"match-question-item\">\n                    <p><strong>21</strong> A traditional approach may have helped predict a financial downturn.</p>\n                    <div class=\"match-dropzone\" data-question=\"q8\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>22</strong> Some people invest conservatively and as a result make less money.</p>\n                    <div class=\"match-dropzone\" data-question=\"q9\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>23</strong> It may be possible to forecast share prices but not over the long term.</p>\n                    <div class=\"match-dropzone\" data-question=\"q10\"></div>\n                </div>\n                \n                <div class=\"options-pool\" id=\"economist-options-pool\">\n                    <strong>List of Economists</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A. Fisher and Lorie</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B. Myron Scholes</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C. Eugene Fama</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D. Robert Shiller</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-anchor\">\n<h4>Questions 21–23</h4>\n<p>Look at the following statements (21–23) and the list of economists below.</p>\n<p>Match each statement with the correct economist <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"match-question-item\">\n<p><strong>21</strong> A traditional approach may have helped predict a financial downturn.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> Some people invest conservatively and as a result make less money.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> It may be possible to forecast share prices but not over the long term.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"options-pool\" id=\"economist-options-pool\">\n<strong>List of Economists</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A. Fisher and Lorie</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B. Myron Scholes</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C. Eugene Fama</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D. Robert Shiller</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false
     },
     {
@@ -60,7 +60,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-anchor\">\n                <h4>Questions 24–26</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                <div class=\"summary-text\">\n                    <h5>The beginnings of CRSP</h5>\n                    <p>In 1958 a <strong>24</strong> <input name=\"q11\" type=\"text\" class=\"summary-input\" id=\"q11-input\"> working for a financial management company telephoned Jim Lorie to ask how well investments in shares performed in comparison to investments in low-risk assets. Lorie offered to find out and as a result the University of Chicago's Center for Research in Security Prices (CRSP) was launched. Compiling the CRSP data was difficult because <strong>25</strong> <input name=\"q12\" type=\"text\" class=\"summary-input\" id=\"q12-input\"> were still being developed and information that had previously been on <strong>26</strong> <input name=\"q13\" type=\"text\" class=\"summary-input\" id=\"q13-input\"> needed to be put onto magnetic tape.</p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-text\">\n<h5>The beginnings of CRSP</h5>\n<p>In 1958 a <strong>24</strong> <input name=\"q11\" type=\"text\" class=\"summary-input\" id=\"q11-input\"> working for a financial management company telephoned Jim Lorie to ask how well investments in shares performed in comparison to investments in low-risk assets. Lorie offered to find out and as a result the University of Chicago's Center for Research in Security Prices (CRSP) was launched. Compiling the CRSP data was difficult because <strong>25</strong> <input name=\"q12\" type=\"text\" class=\"summary-input\" id=\"q12-input\"> were still being developed and information that had previously been on <strong>26</strong> <input name=\"q13\" type=\"text\" class=\"summary-input\" id=\"q13-input\"> needed to be put onto magnetic tape.</p>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 2</h2>\n            <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n            \n            <h3>Surviving city life</h3>\n            <h4>Although the colonisation of Australia profoundly affected the continent's natural environment, many plants and animals have actually flourished since European settlement. Some even thrive in the concrete jungle of Australia's biggest city, Sydney.</h4>\n            \n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"A\" id=\"q1-dropzone\" data-question=\"q1\">\n                    <span class=\"paragraph-label\">Paragraph A (Q14):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>A</strong> Ecologists often prefer to study plants and animals in exotic locations, but a growing number have turned their attention to the complex interactions of the wildlife that inhabits concrete jungles. Inner-city Sydney is the laboratory of choice for a number of ecologists, and their research is timely. More than half the world's human population resides in cities, and urban development continues to increase all over the world. By 2030, the United Nations projects five billion people will live in cities. Associate Professor Dieter Hochuli, a biologist at the University of Sydney, believes that ‘we need to understand how cities are changing the ecology of the systems they are built on, and how plants and animals are adapting to them'.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"B\" id=\"q2-dropzone\" data-question=\"q2\">\n                    <span class=\"paragraph-label\">Paragraph B (Q15):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>B</strong> If any species has learnt to thrive in an urban environment, it's the native white ibis. A strange long-legged bird with a bow-shaped beak, it is known as the 'garbage turkey'. The bird's reputation for digging through inner-city bins and scavenging street garbage has not endeared it to the public. The white ibis began its move to the city in the 1970s, when large parts of its natural habitat of inland wetlands became degraded due to years of low rainfall. ‘The species is a wetland forager,' wildlife officer John Martin from Sydney's Royal Botanic Gardens says. 'Now it happily forages in city parks and landfill.' During the peak of its spring breeding season, there are more than 9 000 of these birds in Sydney.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"C\" id=\"q3-dropzone\" data-question=\"q3\">\n                    <span class=\"paragraph-label\">Paragraph C (Q16):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>C</strong> Specimens at Sydney's Australian Museum show that the city's overall bird life has changed dramatically over the two centuries since colonisation. Prior to urban development, Sydney's native bushland was populated by large numbers of small insect-eating birds, such as the superb fairy-wren and the eastern yellow robin. Today, homeowners prefer to landscape their backyards with tall trees and manicured lawns—an environment that provides little protection for small birds. But one bird's trash is another's treasure. Gardens filled with flowering plants and fruit trees favour omnivorous birds such as currawongs, bowerbirds and the city's most despised resident – the noisy miner. ‘They're a real winner in cities,' Australian Museum ornithologist Richard Major says. ‘The predominant driver in the decline of small birds is that we've made a suitable environment for native noisy miners.'</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"D\" id=\"q4-dropzone\" data-question=\"q4\">\n                    <span class=\"paragraph-label\">Paragraph D (Q17):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>D</strong> Many invertebrates, such as the golden orb-weaver spider and the blue triangle butterfly, also relish living in the city. The golden orb spiders in Sydney are fatter and fitter than species found elsewhere, and Professor Hochuli and his team are trying to understand why. ‘We're trying to determine whether it's more food or the urban heat as it's up to four degrees warmer in the city.' Hochuli has also found some varieties of ant more at home in the city. 'The green ant, known for its painful bite, will build a nest where there is space and food, regardless of whether it's a backyard or a sports oval.' ‘It's remarkable how many things persist in city environments,' he says. The decline in birds that eat small invertebrates means these populations grow unchecked, allowing them to chew their way through the foliage of the city's trees.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"E\" id=\"q5-dropzone\" data-question=\"q5\">\n                    <span class=\"paragraph-label\">Paragraph E (Q18):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>E</strong> While some species can survive in relatively small areas, mammals have been confined to patches of bushland scattered around Sydney and its nearby national parks. However, the rabbit-sized, long-nosed bandicoot has discovered the advantages of venturing out to grassy suburban backyards and gardens. ‘They forage for invertebrates in the grass and like the surrounding habitat to nest and escape from predators,' Catherine Price, a research associate at the University of Sydney, says. Dr Price is trying to understand what encourages the little mammal into urban environments. ‘We don't know if it's an overflow from the park, or if they've got particular survival traits that allow them to evade dogs and cats, and use the urban habitat that benefits them,' she says.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"F\" id=\"q6-dropzone\" data-question=\"q6\">\n                    <span class=\"paragraph-label\">Paragraph F (Q19):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>F</strong> It's not just native wildlife that has sought comfort in city living. Non-native species such as black rodents, cockroaches and foxes have developed survival strategies too. But weeds are the pest that has gained the most advantage. ‘In residential Sydney there would not be a single area of remnant bushland not infested by introduced plant life,' Michelle Leishman, a Macquarie University plant biologist, says. Over 20 years, Leishman and her colleagues have shown how Sydney's huge stretches of impermeable concrete, together with the storm-water system, have helped weeds infiltrate the few remaining pockets of bushland. As rain washes over backyards and roadways, it collects chemicals which enter the storm-water system, where they are piped to the edges of bushland. The nutrient-rich water seeps into the earth, favouring the many exotic species that 'live fast and die young,' Leishman says. Indigenous plants prefer low-fertility soil and struggle to cope with one that is more fertile.</p>\n            </div>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Surviving city life</h3>\n<h4>Although the colonisation of Australia profoundly affected the continent's natural environment, many plants and animals have actually flourished since European settlement. Some even thrive in the concrete jungle of Australia's biggest city, Sydney.</h4>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"A\" id=\"q1-dropzone\" data-question=\"q1\">\n<span class=\"paragraph-label\">Paragraph A (Q14):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> Ecologists often prefer to study plants and animals in exotic locations, but a growing number have turned their attention to the complex interactions of the wildlife that inhabits concrete jungles. Inner-city Sydney is the laboratory of choice for a number of ecologists, and their research is timely. More than half the world's human population resides in cities, and urban development continues to increase all over the world. By 2030, the United Nations projects five billion people will live in cities. Associate Professor Dieter Hochuli, a biologist at the University of Sydney, believes that ‘we need to understand how cities are changing the ecology of the systems they are built on, and how plants and animals are adapting to them'.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"B\" id=\"q2-dropzone\" data-question=\"q2\">\n<span class=\"paragraph-label\">Paragraph B (Q15):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> If any species has learnt to thrive in an urban environment, it's the native white ibis. A strange long-legged bird with a bow-shaped beak, it is known as the 'garbage turkey'. The bird's reputation for digging through inner-city bins and scavenging street garbage has not endeared it to the public. The white ibis began its move to the city in the 1970s, when large parts of its natural habitat of inland wetlands became degraded due to years of low rainfall. ‘The species is a wetland forager,' wildlife officer John Martin from Sydney's Royal Botanic Gardens says. 'Now it happily forages in city parks and landfill.' During the peak of its spring breeding season, there are more than 9 000 of these birds in Sydney.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"C\" id=\"q3-dropzone\" data-question=\"q3\">\n<span class=\"paragraph-label\">Paragraph C (Q16):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> Specimens at Sydney's Australian Museum show that the city's overall bird life has changed dramatically over the two centuries since colonisation. Prior to urban development, Sydney's native bushland was populated by large numbers of small insect-eating birds, such as the superb fairy-wren and the eastern yellow robin. Today, homeowners prefer to landscape their backyards with tall trees and manicured lawns—an environment that provides little protection for small birds. But one bird's trash is another's treasure. Gardens filled with flowering plants and fruit trees favour omnivorous birds such as currawongs, bowerbirds and the city's most despised resident – the noisy miner. ‘They're a real winner in cities,' Australian Museum ornithologist Richard Major says. ‘The predominant driver in the decline of small birds is that we've made a suitable environment for native noisy miners.'</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"D\" id=\"q4-dropzone\" data-question=\"q4\">\n<span class=\"paragraph-label\">Paragraph D (Q17):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> Many invertebrates, such as the golden orb-weaver spider and the blue triangle butterfly, also relish living in the city. The golden orb spiders in Sydney are fatter and fitter than species found elsewhere, and Professor Hochuli and his team are trying to understand why. ‘We're trying to determine whether it's more food or the urban heat as it's up to four degrees warmer in the city.' Hochuli has also found some varieties of ant more at home in the city. 'The green ant, known for its painful bite, will build a nest where there is space and food, regardless of whether it's a backyard or a sports oval.' ‘It's remarkable how many things persist in city environments,' he says. The decline in birds that eat small invertebrates means these populations grow unchecked, allowing them to chew their way through the foliage of the city's trees.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"E\" id=\"q5-dropzone\" data-question=\"q5\">\n<span class=\"paragraph-label\">Paragraph E (Q18):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> While some species can survive in relatively small areas, mammals have been confined to patches of bushland scattered around Sydney and its nearby national parks. However, the rabbit-sized, long-nosed bandicoot has discovered the advantages of venturing out to grassy suburban backyards and gardens. ‘They forage for invertebrates in the grass and like the surrounding habitat to nest and escape from predators,' Catherine Price, a research associate at the University of Sydney, says. Dr Price is trying to understand what encourages the little mammal into urban environments. ‘We don't know if it's an overflow from the park, or if they've got particular survival traits that allow them to evade dogs and cats, and use the urban habitat that benefits them,' she says.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"F\" id=\"q6-dropzone\" data-question=\"q6\">\n<span class=\"paragraph-label\">Paragraph F (Q19):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> It's not just native wildlife that has sought comfort in city living. Non-native species such as black rodents, cockroaches and foxes have developed survival strategies too. But weeds are the pest that has gained the most advantage. ‘In residential Sydney there would not be a single area of remnant bushland not infested by introduced plant life,' Michelle Leishman, a Macquarie University plant biologist, says. Over 20 years, Leishman and her colleagues have shown how Sydney's huge stretches of impermeable concrete, together with the storm-water system, have helped weeds infiltrate the few remaining pockets of bushland. As rain washes over backyards and roadways, it collects chemicals which enter the storm-water system, where they are piped to the edges of bushland. The nutrient-rich water seeps into the earth, favouring the many exotic species that 'live fast and die young,' Leishman says. Indigenous plants prefer low-fertility soil and struggle to cope with one that is more fertile.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                <h4>Questions 14–19</h4>\n                <p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n                <p>Choose the correct heading for each paragraph from the list of headings below.</p>\n                <p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n                \n                <div class=\"headings-pool\" id=\"headings-pool-container\">\n                    <strong>List of Headings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i The behaviour of a small animal expanding its territory</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii The urban environment encouraging the spread of imported flora and fauna</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii Insects that thrive in urban areas</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv A creature which likes rubbish</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v Creatures which change their shape and colour</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi Why natural scientists are interested in studying urban areas</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii Changes in the urban built environments encourage particular species</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i The behaviour of a small animal expanding its territory</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii The urban environment encouraging the spread of imported flora and fauna</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii Insects that thrive in urban areas</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv A creature which likes rubbish</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v Creatures which change their shape and colour</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi Why natural scientists are interested in studying urban areas</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii Changes in the urban built environments encourage particular species</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -49,7 +49,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-anchor\">\n                <h4>Questions 20–23</h4>\n                <p>Look at the following statements (Questions 20–23) and the list of researchers below.</p>\n                <p>Match each statement with the correct researcher, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <p><em>NB You may use any letter more than once.</em></p>\n                \n                <div class=\"match-question-item\">\n                    <p><strong>20</strong> It is not clear why one small animal is moving from its natural environment.</p>\n                    <div class=\"match-dropzone\" data-question=\"q7\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>21</strong> Hot weather might positively affect the health of a species.</p>\n                    <div class=\"match-dropzone\" data-question=\"q8\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                    <p><strong>22</strong> Sydney's residential gardens suit some species better than others.</p>\n                    <div class=\"match-dropzone\" data-question=\"q9\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                    <p><strong>23</strong> Research into the natural world's responses to urban settings is vital.</p>\n                    <div class=\"match-dropzone\" data-question=\"q10\"></div>\n                </div>\n\n                <div class=\"options-pool\" id=\"researcher-options-pool\">\n                    <strong>List of Researchers</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Dieter Hochuli</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B John Martin</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Richard Major</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Catherine Price</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-anchor\">\n<h4>Questions 20–23</h4>\n<p>Look at the following statements (Questions 20–23) and the list of researchers below.</p>\n<p>Match each statement with the correct researcher, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>20</strong> It is not clear why one small animal is moving from its natural environment.</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>21</strong> Hot weather might positively affect the health of a species.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> Sydney's residential gardens suit some species better than others.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> Research into the natural world's responses to urban settings is vital.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"options-pool\" id=\"researcher-options-pool\">\n<strong>List of Researchers</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Dieter Hochuli</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B John Martin</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Richard Major</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Catherine Price</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": true
     },
     {
@@ -60,7 +60,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-anchor\">\n                 <h4>Questions 24–26</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                <div class=\"summary-completion\">\n                    <h4>Seeking comfort in city living</h4>\n                    <p>\n                    It's not only native plants and animals that are adapting to city life; non-native plants and animals are also adapting. Examples of successful ‘city dwellers' include small, non-native rats and non-native insects such as <strong>24</strong> <input name=\"q11\" type=\"text\" id=\"q24_input\">. However, what causes most problems in the city is weeds. Michelle Leishman, a scientist from Macquarie University, has proven that Sydney's large areas of <strong>25</strong> <input name=\"q12\" type=\"text\" id=\"q25_input\"> and its drainage network favour the growth of weeds. Water gathers <strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\"> as it passes from gardens and streets into the city drainage network. This, in turn, creates very good soil for several varieties of rapidly growing non-native plants.\n                    </p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>Seeking comfort in city living</h4>\n<p>\nIt's not only native plants and animals that are adapting to city life; non-native plants and animals are also adapting. Examples of successful ‘city dwellers' include small, non-native rats and non-native insects such as <strong>24</strong> <input name=\"q11\" type=\"text\" id=\"q24_input\">. However, what causes most problems in the city is weeds. Michelle Leishman, a scientist from Macquarie University, has proven that Sydney's large areas of <strong>25</strong> <input name=\"q12\" type=\"text\" id=\"q25_input\"> and its drainage network favour the growth of weeds. Water gathers <strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\"> as it passes from gardens and streets into the city drainage network. This, in turn, creates very good soil for several varieties of rapidly growing non-native plants.\n</p>\n</div>\n</div>"
     }
   ],
   "answerKey": {
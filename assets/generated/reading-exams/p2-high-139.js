@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 2</h2>\n            <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n            \n            <h3>The conquest of malaria in Italy</h3>\n            <h4>A review of Frank M Snowden's masterly history of a country's fight to eradicate a deadly disease</h4>\n            \n            <p><strong>A</strong> The word 'malaria' means 'bad air' in Italian, and this terrible disease marked the life of the people of that country for thousands of years. Yet by 1962, Italy was officially declared malaria-free, and it has remained so ever since. Frank Snowden's study of this successful endeavour is a remarkable piece of historical work. Original, crystal clear, analytical and passionate, Snowden takes us to areas historians have rarely visited before.</p>\n            <p><strong>B</strong> Everybody now knows that malaria is carried by mosquitoes. But in the 19th century most experts subscribed to the theory of ‘miasma' or 'poisoning of the air'. Others made a link between swamps, water and malaria, but did not make the further leap towards insects. The consequence of these theories was that little was done to combat the disease before the end of that century. The situation was so serious that from a total population of 25m Italians, 11m were ‘permanently at risk'. In warm, damp, malarial zones, the life expectancy of land workers was a terrifying 22.5 years. The economic impact of the disease was immense. Epidemics were blamed on people who originated from the hotter parts of Italy, given the widespread belief that malaria was hereditary.</p>\n            <p><strong>C</strong> One of the first breakthroughs in the war against malaria came in 1898 when the zoologist Giovanni Battista Grassi demonstrated that the micro-organisms causing the disease were carried in the digestive tract of the mosquito. By releasing mosquitoes into rooms to drink the blood of healthy human volunteers, Grassi was able to make the direct link between the insects and the disease. Definitive proof of this theory was obtained after an extraordinary series of experiments in Italy, where healthy people were introduced into malarial zones but kept free of mosquito bites – and remained well. The recently formed Italian state at last had the necessary information to begin tackling the disease.</p>\n            <p><strong>D</strong> A complicated approach was adopted, which made use of quinine – a drug obtained from tree bark which had long been used to combat fever, but was now seen as a crucial part of the war on malaria. Italy introduced a quinine law and a quinine tax in 1904, and the drug was administered to large numbers of rural workers. Despite its often terrible side effects, the drug was successful in limiting the spread of the disease, and in breaking cycles of infection. In addition, Italy set up rural health centres and invested heavily in education programmes. Malaria, as Snowden shows, was not just a medical problem, but a social and regional issue, and could only be defeated through multi-layered strategies.</p>\n            <p><strong>E</strong> It was originally decided to give quinine to all those in vulnerable regions – even healthy people. However, peasants were often suspicious of medicine being forced upon them, and doctors were frequently met with hostility and stubborn refusal to accept the treatment offered. But despite the refusals, the strategy as a whole was hugely successful. Deaths from malaria fell by some 80% in the first decade of the 20th century and some areas escaped altogether from the scourge of the disease.</p>\n            <p><strong>F</strong> The 1915-18 war delayed the campaign, as funds were diverted to the battlefields. In the 1920s and 1930s the draining of the damp, unhealthy marshlands around Rome had a certain impact on the spread of malaria. However, as war swept through the drained lands in the 1940s, the disease returned with a vengeance. Yet the country's leading malariologist Alberto Missiroli refused to order the distribution of quinine, so allowing the epidemic to spread unchecked. According to Snowden, he did this in order to create the ideal conditions for a new strategy, supported by the US Rockefeller Foundation a massive experiment involving the extermination of mosquitoes with the chemical DDT. It is estimated that more than a third of the inhabitants in the affected area contracted malaria and countless thousands died.</p>\n            <p><strong>G</strong> With the end of the war in 1945, the US government and the Rockefeller Foundation were free to experiment. DDT was sprayed from the air, and 3m Italians had their bodies covered with the chemical. The effects were immense, and by 1962 malaria was more or less gone from the whole country. One of the final victims to die of the disease in Italy was the popular cyclist, Fausto Coppi. He had contracted malaria in Africa in 1960, and the failure of doctors in Italy to spot the disease was a sign of the times. A few decades earlier, they would have immediately noticed the telltale signs; it was later claimed that a small dose of quinine would have saved his life.</p>\n            <p><strong>H</strong> As there are still more than 1m deaths every year from malaria worldwide, Snowden's book also has contemporary relevance. This is a disease that affects every level of the societies where it is rampant. The economic miracle of the 1950s and 1960s which made Italy into a modern industrial nation would not have been possible without the eradication of malaria. Moreover, this book convincingly argues that the disease was 'an integral part of the big picture of modern Italian history'. This magnificent study, beautifully written and impeccably documented, deserves an audience beyond specialists in history, or in Italy.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>The conquest of malaria in Italy</h3>\n<h4>A review of Frank M Snowden's masterly history of a country's fight to eradicate a deadly disease</h4>\n<p><strong>A</strong> The word 'malaria' means 'bad air' in Italian, and this terrible disease marked the life of the people of that country for thousands of years. Yet by 1962, Italy was officially declared malaria-free, and it has remained so ever since. Frank Snowden's study of this successful endeavour is a remarkable piece of historical work. Original, crystal clear, analytical and passionate, Snowden takes us to areas historians have rarely visited before.</p>\n<p><strong>B</strong> Everybody now knows that malaria is carried by mosquitoes. But in the 19th century most experts subscribed to the theory of ‘miasma' or 'poisoning of the air'. Others made a link between swamps, water and malaria, but did not make the further leap towards insects. The consequence of these theories was that little was done to combat the disease before the end of that century. The situation was so serious that from a total population of 25m Italians, 11m were ‘permanently at risk'. In warm, damp, malarial zones, the life expectancy of land workers was a terrifying 22.5 years. The economic impact of the disease was immense. Epidemics were blamed on people who originated from the hotter parts of Italy, given the widespread belief that malaria was hereditary.</p>\n<p><strong>C</strong> One of the first breakthroughs in the war against malaria came in 1898 when the zoologist Giovanni Battista Grassi demonstrated that the micro-organisms causing the disease were carried in the digestive tract of the mosquito. By releasing mosquitoes into rooms to drink the blood of healthy human volunteers, Grassi was able to make the direct link between the insects and the disease. Definitive proof of this theory was obtained after an extraordinary series of experiments in Italy, where healthy people were introduced into malarial zones but kept free of mosquito bites – and remained well. The recently formed Italian state at last had the necessary information to begin tackling the disease.</p>\n<p><strong>D</strong> A complicated approach was adopted, which made use of quinine – a drug obtained from tree bark which had long been used to combat fever, but was now seen as a crucial part of the war on malaria. Italy introduced a quinine law and a quinine tax in 1904, and the drug was administered to large numbers of rural workers. Despite its often terrible side effects, the drug was successful in limiting the spread of the disease, and in breaking cycles of infection. In addition, Italy set up rural health centres and invested heavily in education programmes. Malaria, as Snowden shows, was not just a medical problem, but a social and regional issue, and could only be defeated through multi-layered strategies.</p>\n<p><strong>E</strong> It was originally decided to give quinine to all those in vulnerable regions – even healthy people. However, peasants were often suspicious of medicine being forced upon them, and doctors were frequently met with hostility and stubborn refusal to accept the treatment offered. But despite the refusals, the strategy as a whole was hugely successful. Deaths from malaria fell by some 80% in the first decade of the 20th century and some areas escaped altogether from the scourge of the disease.</p>\n<p><strong>F</strong> The 1915-18 war delayed the campaign, as funds were diverted to the battlefields. In the 1920s and 1930s the draining of the damp, unhealthy marshlands around Rome had a certain impact on the spread of malaria. However, as war swept through the drained lands in the 1940s, the disease returned with a vengeance. Yet the country's leading malariologist Alberto Missiroli refused to order the distribution of quinine, so allowing the epidemic to spread unchecked. According to Snowden, he did this in order to create the ideal conditions for a new strategy, supported by the US Rockefeller Foundation a massive experiment involving the extermination of mosquitoes with the chemical DDT. It is estimated that more than a third of the inhabitants in the affected area contracted malaria and countless thousands died.</p>\n<p><strong>G</strong> With the end of the war in 1945, the US government and the Rockefeller Foundation were free to experiment. DDT was sprayed from the air, and 3m Italians had their bodies covered with the chemical. The effects were immense, and by 1962 malaria was more or less gone from the whole country. One of the final victims to die of the disease in Italy was the popular cyclist, Fausto Coppi. He had contracted malaria in Africa in 1960, and the failure of doctors in Italy to spot the disease was a sign of the times. A few decades earlier, they would have immediately noticed the telltale signs; it was later claimed that a small dose of quinine would have saved his life.</p>\n<p><strong>H</strong> As there are still more than 1m deaths every year from malaria worldwide, Snowden's book also has contemporary relevance. This is a disease that affects every level of the societies where it is rampant. The economic miracle of the 1950s and 1960s which made Italy into a modern industrial nation would not have been possible without the eradication of malaria. Moreover, this book convincingly argues that the disease was 'an integral part of the big picture of modern Italian history'. This magnificent study, beautifully written and impeccably documented, deserves an audience beyond specialists in history, or in Italy.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -34,7 +34,7 @@
         "q3",
         "q4"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n                 <h4>Questions 14–17</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n                <div class=\"summary-completion\">\n                    <h4>Malaria in 19th-century Italy</h4>\n                    <p>\n                    Up until the late nineteenth century, experts failed to make the connection between malaria and <strong>14</strong> <input type=\"text\" id=\"q14_input\" name=\"q1\">. The most popular belief at the time was the <strong>15</strong> <input type=\"text\" id=\"q15_input\" name=\"q2\"> theory, which upheld the idea that diseases were carried by unclean air. Another common idea was that malaria was a <strong>16</strong> <input type=\"text\" id=\"q16_input\" name=\"q3\"> disease, and as a result people from certain parts of the country were often held responsible for the spread of epidemics. Malaria was particularly widespread in rural regions, where <strong>17</strong> <input type=\"text\" id=\"q17_input\" name=\"q4\"> could be extremely short.\n                    </p>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 14–17</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>Malaria in 19th-century Italy</h4>\n<p>\nUp until the late nineteenth century, experts failed to make the connection between malaria and <strong>14</strong> <input type=\"text\" id=\"q14_input\" name=\"q1\">. The most popular belief at the time was the <strong>15</strong> <input type=\"text\" id=\"q15_input\" name=\"q2\"> theory, which upheld the idea that diseases were carried by unclean air. Another common idea was that malaria was a <strong>16</strong> <input type=\"text\" id=\"q16_input\" name=\"q3\"> disease, and as a result people from certain parts of the country were often held responsible for the spread of epidemics. Malaria was particularly widespread in rural regions, where <strong>17</strong> <input type=\"text\" id=\"q17_input\" name=\"q4\"> could be extremely short.\n</p>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -45,7 +45,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-anchor\">\n                <h4>Questions 18–20</h4>\n                <p>Do the following statements agree with the information given in Reading Passage 2?</p>\n                <p>In boxes 18–20 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>TRUE</strong> if the statement agrees with the information</li>\n                    <li><strong>FALSE</strong> if the statement contradicts the information</li>\n                    <li><strong>NOT GIVEN</strong> if there is no information about this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p><strong>18</strong> The volunteers in Giovanni Battista Grassi's research came from all parts of Italy.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>19</strong> Experiments in Italy proved that it was possible to remain healthy despite being in malarial zones.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>20</strong> In the early twentieth century, quinine was successfully administered to all inhabitants of vulnerable regions.</p>\n                     <div class=\"radio-options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-anchor\">\n<h4>Questions 18–20</h4>\n<p>Do the following statements agree with the information given in Reading Passage 2?</p>\n<p>In boxes 18–20 on your answer sheet, write:</p>\n<ul>\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>18</strong> The volunteers in Giovanni Battista Grassi's research came from all parts of Italy.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>19</strong> Experiments in Italy proved that it was possible to remain healthy despite being in malarial zones.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>20</strong> In the early twentieth century, quinine was successfully administered to all inhabitants of vulnerable regions.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -58,7 +58,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n                <h4>Questions 21–26</h4>\n                <p>Reading Passage 2 has eight paragraphs, <strong>A–H</strong>.</p>\n                <p>Which paragraph contains the following information?</p>\n                <p><em>Write the correct letter, <strong>A–H</strong>, in boxes 21–26 on your answer sheet.</em></p>\n                <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                        <thead>\n                            <tr>\n                                <th></th>\n                                <th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>21</strong> a figure showing the dramatic results of an anti-malarial drug programme</td>\n                                <td><input type=\"radio\" name=\"q8\" value=\"A\"></td><td><input type=\"radio\" name=\"q8\" value=\"B\"></td><td><input type=\"radio\" name=\"q8\" value=\"C\"></td><td><input type=\"radio\" name=\"q8\" value=\"D\"></td><td><input type=\"radio\" name=\"q8\" value=\"E\"></td><td><input type=\"radio\" name=\"q8\" value=\"F\"></td><td><input type=\"radio\" name=\"q8\" value=\"G\"></td><td><input type=\"radio\" name=\"q8\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>22</strong> an important discovery about how malaria is spread</td>\n                                <td><input type=\"radio\" name=\"q9\" value=\"A\"></td><td><input type=\"radio\" name=\"q9\" value=\"B\"></td><td><input type=\"radio\" name=\"q9\" value=\"C\"></td><td><input type=\"radio\" name=\"q9\" value=\"D\"></td><td><input type=\"radio\" name=\"q9\" value=\"E\"></td><td><input type=\"radio\" name=\"q9\" value=\"F\"></td><td><input type=\"radio\" name=\"q9\" value=\"G\"></td><td><input type=\"radio\" name=\"q9\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>23</strong> mention of an expert's decision not to halt the spread of the disease</td>\n                                <td><input type=\"radio\" name=\"q10\" value=\"A\"></td><td><input type=\"radio\" name=\"q10\" value=\"B\"></td><td><input type=\"radio\" name=\"q10\" value=\"C\"></td><td><input type=\"radio\" name=\"q10\" value=\"D\"></td><td><input type=\"radio\" name=\"q10\" value=\"E\"></td><td><input type=\"radio\" name=\"q10\" value=\"F\"></td><td><input type=\"radio\" name=\"q10\" value=\"G\"></td><td><input type=\"radio\" name=\"q10\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>24</strong> the significance of the malaria story for today's readers</td>\n                                <td><input type=\"radio\" name=\"q11\" value=\"A\"></td><td><input type=\"radio\" name=\"q11\" value=\"B\"></td><td><input type=\"radio\" name=\"q11\" value=\"C\"></td><td><input type=\"radio\" name=\"q11\" value=\"D\"></td><td><input type=\"radio\" name=\"q11\" value=\"E\"></td><td><input type=\"radio\" name=\"q11\" value=\"F\"></td><td><input type=\"radio\" name=\"q11\" value=\"G\"></td><td><input type=\"radio\" name=\"q11\" value=\"H\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>25</strong> examples of false assumptions which held back scientific understanding of malaria</td>\n                                <td><input type=\"radio\" name=\"q12\" value=\"A\"></td><td><input type=\"radio\" name=\"q12\" value=\"B\"></td><td><input type=\"radio\" name=\"q12\" value=\"C\"></td><td><input type=\"radio\" name=\"q12\" value=\"D\"></td><td><input type=\"radio\" name=\"q12\" value=\"E\"></td><td><input type=\"radio\" name=\"q12\" value=\"F\"></td><td><input type=\"radio\" name=\"q12\" value=\"G\"></td><td><input type=\"radio\" name=\"q12\" value=\"H\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>26</strong> a reference to legislation to support the fight against malaria</td>\n                                <td><input type=\"radio\" name=\"q13\" value=\"A\"></td><td><input type=\"radio\" name=\"q13\" value=\"B\"></td><td><input type=\"radio\" name=\"q13\" value=\"C\"></td><td><input type=\"radio\" name=\"q13\" value=\"D\"></td><td><input type=\"radio\" name=\"q13\" value=\"E\"></td><td><input type=\"radio\" name=\"q13\" value=\"F\"></td><td><input type=\"radio\" name=\"q13\" value=\"G\"></td><td><input type=\"radio\" name=\"q13\" value=\"H\"></td>\n                            </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Questions 21–26</h4>\n<p>Reading Passage 2 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–H</strong>, in boxes 21–26 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>21</strong> a figure showing the dramatic results of an anti-malarial drug programme</td>\n<td><input type=\"radio\" name=\"q8\" value=\"A\"></td><td><input type=\"radio\" name=\"q8\" value=\"B\"></td><td><input type=\"radio\" name=\"q8\" value=\"C\"></td><td><input type=\"radio\" name=\"q8\" value=\"D\"></td><td><input type=\"radio\" name=\"q8\" value=\"E\"></td><td><input type=\"radio\" name=\"q8\" value=\"F\"></td><td><input type=\"radio\" name=\"q8\" value=\"G\"></td><td><input type=\"radio\" name=\"q8\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>22</strong> an important discovery about how malaria is spread</td>\n<td><input type=\"radio\" name=\"q9\" value=\"A\"></td><td><input type=\"radio\" name=\"q9\" value=\"B\"></td><td><input type=\"radio\" name=\"q9\" value=\"C\"></td><td><input type=\"radio\" name=\"q9\" value=\"D\"></td><td><input type=\"radio\" name=\"q9\" value=\"E\"></td><td><input type=\"radio\" name=\"q9\" value=\"F\"></td><td><input type=\"radio\" name=\"q9\" value=\"G\"></td><td><input type=\"radio\" name=\"q9\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>23</strong> mention of an expert's decision not to halt the spread of the disease</td>\n<td><input type=\"radio\" name=\"q10\" value=\"A\"></td><td><input type=\"radio\" name=\"q10\" value=\"B\"></td><td><input type=\"radio\" name=\"q10\" value=\"C\"></td><td><input type=\"radio\" name=\"q10\" value=\"D\"></td><td><input type=\"radio\" name=\"q10\" value=\"E\"></td><td><input type=\"radio\" name=\"q10\" value=\"F\"></td><td><input type=\"radio\" name=\"q10\" value=\"G\"></td><td><input type=\"radio\" name=\"q10\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>24</strong> the significance of the malaria story for today's readers</td>\n<td><input type=\"radio\" name=\"q11\" value=\"A\"></td><td><input type=\"radio\" name=\"q11\" value=\"B\"></td><td><input type=\"radio\" name=\"q11\" value=\"C\"></td><td><input type=\"radio\" name=\"q11\" value=\"D\"></td><td><input type=\"radio\" name=\"q11\" value=\"E\"></td><td><input type=\"radio\" name=\"q11\" value=\"F\"></td><td><input type=\"radio\" name=\"q11\" value=\"G\"></td><td><input type=\"radio\" name=\"q11\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>25</strong> examples of false assumptions which held back scientific understanding of malaria</td>\n<td><input type=\"radio\" name=\"q12\" value=\"A\"></td><td><input type=\"radio\" name=\"q12\" value=\"B\"></td><td><input type=\"radio\" name=\"q12\" value=\"C\"></td><td><input type=\"radio\" name=\"q12\" value=\"D\"></td><td><input type=\"radio\" name=\"q12\" value=\"E\"></td><td><input type=\"radio\" name=\"q12\" value=\"F\"></td><td><input type=\"radio\" name=\"q12\" value=\"G\"></td><td><input type=\"radio\" name=\"q12\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>26</strong> a reference to legislation to support the fight against malaria</td>\n<td><input type=\"radio\" name=\"q13\" value=\"A\"></td><td><input type=\"radio\" name=\"q13\" value=\"B\"></td><td><input type=\"radio\" name=\"q13\" value=\"C\"></td><td><input type=\"radio\" name=\"q13\" value=\"D\"></td><td><input type=\"radio\" name=\"q13\" value=\"E\"></td><td><input type=\"radio\" name=\"q13\" value=\"F\"></td><td><input type=\"radio\" name=\"q13\" value=\"G\"></td><td><input type=\"radio\" name=\"q13\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 2</h2>\n            <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n            \n            <h3>The Fascinating World of Attine Ants</h3>\n            <h4>Nicholas Wade examines leaf-cutter ants and their amazing agriculture</h4>\n            \n            <p><strong>A</strong> Leaf-cutting ants and their fungus 'farm' are a marvel of nature and perhaps the best-known example of symbiosis — the mutual dependence of two species. Ants cultivate a mushroom-like fungus in 'farms'. Both the ants and their so-called 'agriculture' have been extensively studied over the years, but recent research has uncovered intriguing new findings. Ants invented agriculture 50 million years before people did, and the leaf-cutters, members of the large attine ant family, practise the most sophisticated example of it. They grow their fungus in underground chambers that can reach the size of a football. A single leaf-cutter nest may contain a thousand such chambers, embedded in an underground metropolis up to 18 feet deep, and support a society of more than a million ants.</p>\n            <p><strong>B</strong> These ant communities are the dominant plant-eaters of the Neotropics, the region comprising South and Central America, Mexico and the Caribbean. Biologists believe 15 percent of the leaf production of tropical forests disappears down the nests of leaf-cutter ants. In the nest, the leaves are shredded and added to the fungus, which digests the leaves and is in turn eaten by the ants. The attine ants' achievement is remarkable because it allows them to consume, courtesy of their mushroom's digestive powers, the harvest of tropical forests whose leaves are laden with poisonous chemicals.</p>\n            <p><strong>C</strong> There are more than 200 known species of the attine ant tribe, divided into 12 groups, or genera. The leaf-cutters use fresh vegetation; the other groups, known as the lower attines because their nests are smaller and their techniques more primitive, feed their gardens with similar leaves that have fallen on the ground and insects that lie on the forest floor. Lower attine ants are all a similar size. However, leaf-cutter worker ants come in made-to-fit sizes — large ants to saw off leaves, medium ones to shred them, and miniature workers to seed them with fungus and clean off alien growths.</p>\n            <p><strong>D</strong> In 1994, biologists from the United States Department of Agriculture analysed the DNA of ant fungi. They found that the leaf-cutters' fungus was descended from a single pure strain, propagated for at least 23 million years. However, the fungi grown by lower attine ants fell into four different groups, as if the ants had domesticated wild fungi at least four times in evolutionary history. What could be driving these two patterns of fungus gardening — the pure clone cultivation of the leaf-cutters and the multiple varieties of the lower attines?</p>\n            <p><strong>E</strong> The answer has been suggested by Cameron Currie of the University of Toronto. The pure strain of fungus grown by the leaf-cutters, it seemed to him, resembled the single crops grown by humans to the exclusion of all others, such as potato growing. These 'monocultures', which lack the genetic diversity to respond to changing environmental threats, are particularly vulnerable to parasites — organisms that live and feed on their host, often causing harm. Currie felt there had to be a parasite in the ant-fungus system. But a century of ant research had provided no evidence for his idea. Textbooks describe how leaf-cutter ants scrupulously weed their gardens of all foreign organisms. “People kept telling me the ants keep their gardens free of parasites,” said Currie. Nevertheless, after three years of sifting through attine ant gardens, Currie discovered several alien organisms, particularly a family of parasitic moulds called 'Escovopsis'.</p>\n            <p><strong>F</strong> Escovopsis is a deadly disease that can devastate a fungus garden in a couple of days. It blooms like a white cloud which envelops the whole garden. Other ants won't go near it, and the ants associated with the garden just starve to death. Evidently, the ants usually manage to keep Escovopsis and other parasites under control. Nevertheless, with any lapse in control Escovopsis will quickly burst forth. Although new leaf-cutter gardens start off free of Escovopsis, within two years some 60 percent become infected.</p>\n            <p><strong>G</strong> The discovery of Escovopsis's role brings a new level of understanding to the evolution of the attine ants. In the last decade, evolutionary biologists have been increasingly aware of the role of parasites as driving forces in evolution. With Currie's work, there is now a possible reason for the different varieties of fungus in the lower attine mushroom gardens — to stay one step ahead of the relentless Escovopsis. Interestingly, the leaf-cutters had, in general, fewer alien moulds in their gardens than the lower attines, yet more Escovopsis infections. Clearly, the price they pay for cultivating a pure variety of fungus is a higher risk from Escovopsis.</p>\n            <p><strong>H</strong> So how do attine ants keep this parasite under control? People have known for a hundred years that ants have a whitish growth on their body surface. It was thought to be wax but, after examining it under a microscope, Currie discovered a specialised patch on the ants' bodies that harbours a particular kind of bacterium, one well known to the pharmaceutical industry and the source of half the antibiotics used in medicine. This bacterium is a potent poisoner of Escovopsis, inhibiting its growth and suppressing spore formation. Astoundingly, the leaf-cutter ants are accomplishing feats beyond the power of humans: they are growing a monocultural crop year after year without disaster, and they are using an antibiotic apparently so wisely that, unlike people, they are not provoking antibiotic resistance in the target disease-producing organism.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>The Fascinating World of Attine Ants</h3>\n<h4>Nicholas Wade examines leaf-cutter ants and their amazing agriculture</h4>\n<p><strong>A</strong> Leaf-cutting ants and their fungus 'farm' are a marvel of nature and perhaps the best-known example of symbiosis — the mutual dependence of two species. Ants cultivate a mushroom-like fungus in 'farms'. Both the ants and their so-called 'agriculture' have been extensively studied over the years, but recent research has uncovered intriguing new findings. Ants invented agriculture 50 million years before people did, and the leaf-cutters, members of the large attine ant family, practise the most sophisticated example of it. They grow their fungus in underground chambers that can reach the size of a football. A single leaf-cutter nest may contain a thousand such chambers, embedded in an underground metropolis up to 18 feet deep, and support a society of more than a million ants.</p>\n<p><strong>B</strong> These ant communities are the dominant plant-eaters of the Neotropics, the region comprising South and Central America, Mexico and the Caribbean. Biologists believe 15 percent of the leaf production of tropical forests disappears down the nests of leaf-cutter ants. In the nest, the leaves are shredded and added to the fungus, which digests the leaves and is in turn eaten by the ants. The attine ants' achievement is remarkable because it allows them to consume, courtesy of their mushroom's digestive powers, the harvest of tropical forests whose leaves are laden with poisonous chemicals.</p>\n<p><strong>C</strong> There are more than 200 known species of the attine ant tribe, divided into 12 groups, or genera. The leaf-cutters use fresh vegetation; the other groups, known as the lower attines because their nests are smaller and their techniques more primitive, feed their gardens with similar leaves that have fallen on the ground and insects that lie on the forest floor. Lower attine ants are all a similar size. However, leaf-cutter worker ants come in made-to-fit sizes — large ants to saw off leaves, medium ones to shred them, and miniature workers to seed them with fungus and clean off alien growths.</p>\n<p><strong>D</strong> In 1994, biologists from the United States Department of Agriculture analysed the DNA of ant fungi. They found that the leaf-cutters' fungus was descended from a single pure strain, propagated for at least 23 million years. However, the fungi grown by lower attine ants fell into four different groups, as if the ants had domesticated wild fungi at least four times in evolutionary history. What could be driving these two patterns of fungus gardening — the pure clone cultivation of the leaf-cutters and the multiple varieties of the lower attines?</p>\n<p><strong>E</strong> The answer has been suggested by Cameron Currie of the University of Toronto. The pure strain of fungus grown by the leaf-cutters, it seemed to him, resembled the single crops grown by humans to the exclusion of all others, such as potato growing. These 'monocultures', which lack the genetic diversity to respond to changing environmental threats, are particularly vulnerable to parasites — organisms that live and feed on their host, often causing harm. Currie felt there had to be a parasite in the ant-fungus system. But a century of ant research had provided no evidence for his idea. Textbooks describe how leaf-cutter ants scrupulously weed their gardens of all foreign organisms. “People kept telling me the ants keep their gardens free of parasites,” said Currie. Nevertheless, after three years of sifting through attine ant gardens, Currie discovered several alien organisms, particularly a family of parasitic moulds called 'Escovopsis'.</p>\n<p><strong>F</strong> Escovopsis is a deadly disease that can devastate a fungus garden in a couple of days. It blooms like a white cloud which envelops the whole garden. Other ants won't go near it, and the ants associated with the garden just starve to death. Evidently, the ants usually manage to keep Escovopsis and other parasites under control. Nevertheless, with any lapse in control Escovopsis will quickly burst forth. Although new leaf-cutter gardens start off free of Escovopsis, within two years some 60 percent become infected.</p>\n<p><strong>G</strong> The discovery of Escovopsis's role brings a new level of understanding to the evolution of the attine ants. In the last decade, evolutionary biologists have been increasingly aware of the role of parasites as driving forces in evolution. With Currie's work, there is now a possible reason for the different varieties of fungus in the lower attine mushroom gardens — to stay one step ahead of the relentless Escovopsis. Interestingly, the leaf-cutters had, in general, fewer alien moulds in their gardens than the lower attines, yet more Escovopsis infections. Clearly, the price they pay for cultivating a pure variety of fungus is a higher risk from Escovopsis.</p>\n<p><strong>H</strong> So how do attine ants keep this parasite under control? People have known for a hundred years that ants have a whitish growth on their body surface. It was thought to be wax but, after examining it under a microscope, Currie discovered a specialised patch on the ants' bodies that harbours a particular kind of bacterium, one well known to the pharmaceutical industry and the source of half the antibiotics used in medicine. This bacterium is a potent poisoner of Escovopsis, inhibiting its growth and suppressing spore formation. Astoundingly, the leaf-cutter ants are accomplishing feats beyond the power of humans: they are growing a monocultural crop year after year without disaster, and they are using an antibiotic apparently so wisely that, unlike people, they are not provoking antibiotic resistance in the target disease-producing organism.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                <h4>Questions 14–19</h4>\n                <p>Reading Passage 2 has eight paragraphs, <strong>A–H</strong>.</p>\n                <p>Which section contains the following information?</p>\n                <p><em>Write the correct letter, <strong>A–H</strong>, in boxes 14–19 on your answer sheet.</em></p>\n                <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                        <thead>\n                            <tr>\n                                <th style=\"min-width: 250px;\"></th>\n                                <th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>14</strong> two things at which leaf-cutter ants have succeeded but humans have failed.</td>\n                                <td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>15</strong> a comparison between the nests of leaf-cutter ants and lower attine ants.</td>\n                                <td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>16</strong> an assessment of the impact leaf-cutter ants have on their environment.</td>\n                                <td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>17</strong> the effect Escovopsis has on ant communities.</td>\n                                <td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>18</strong> the advantage for lower attine ants of growing a range of fungi.</td>\n                                <td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>19</strong> the discovery of the age of the attine-ant fungi.</td>\n                                <td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td><td><input type=\"radio\" name=\"q6\" value=\"H\"></td>\n                            </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which section contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–H</strong>, in boxes 14–19 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 250px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> two things at which leaf-cutter ants have succeeded but humans have failed.</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> a comparison between the nests of leaf-cutter ants and lower attine ants.</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> an assessment of the impact leaf-cutter ants have on their environment.</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> the effect Escovopsis has on ant communities.</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>18</strong> the advantage for lower attine ants of growing a range of fungi.</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>19</strong> the discovery of the age of the attine-ant fungi.</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td><td><input type=\"radio\" name=\"q6\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -49,7 +49,7 @@
         "q10",
         "q11"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-11-anchor\">\n                <h4>Questions 20–24</h4>\n                <p>Classify the following descriptions as relating to</p>\n                <ul style=\"list-style-type: none; padding-left: 0;\">\n                    <li><strong>A</strong> Leaf-cutting ants</li>\n                    <li><strong>B</strong> Lower attines</li>\n                    <li><strong>C</strong> Both leaf-cutting ants and lower attine ants</li>\n                </ul>\n                <p><em>Write the correct letter, A, B or C, in boxes 20-24 on your answer sheet.</em></p>\n                <div class=\"question-item\">\n                    <p><strong>20</strong> the use of dead vegetation to cultivate their fungus</p>\n                    <div class=\"radio-options\">\n                        <label><input type=\"radio\" name=\"q7\" value=\"A\"> A</label>\n                        <label><input type=\"radio\" name=\"q7\" value=\"B\"> B</label>\n                        <label><input type=\"radio\" name=\"q7\" value=\"C\"> C</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>21</strong> very small ants that keep the fungus free of foreign organisms</p>\n                    <div class=\"radio-options\">\n                        <label><input type=\"radio\" name=\"q8\" value=\"A\"> A</label>\n                        <label><input type=\"radio\" name=\"q8\" value=\"B\"> B</label>\n                        <label><input type=\"radio\" name=\"q8\" value=\"C\"> C</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>22</strong> the ability to safely eat harmful plants</p>\n                    <div class=\"radio-options\">\n                        <label><input type=\"radio\" name=\"q9\" value=\"A\"> A</label>\n                        <label><input type=\"radio\" name=\"q9\" value=\"B\"> B</label>\n                        <label><input type=\"radio\" name=\"q9\" value=\"C\"> C</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>23</strong> the cultivation of a single fungus</p>\n                    <div class=\"radio-options\">\n                        <label><input type=\"radio\" name=\"q10\" value=\"A\"> A</label>\n                        <label><input type=\"radio\" name=\"q10\" value=\"B\"> B</label>\n                        <label><input type=\"radio\" name=\"q10\" value=\"C\"> C</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>24</strong> a nest with a very large number of rooms for growing fungus</p>\n                    <div class=\"radio-options\">\n                        <label><input type=\"radio\" name=\"q11\" value=\"A\"> A</label>\n                        <label><input type=\"radio\" name=\"q11\" value=\"B\"> B</label>\n                        <label><input type=\"radio\" name=\"q11\" value=\"C\"> C</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-11-anchor\">\n<h4>Questions 20–24</h4>\n<p>Classify the following descriptions as relating to</p>\n<ul style=\"list-style-type: none; padding-left: 0;\">\n<li><strong>A</strong> Leaf-cutting ants</li>\n<li><strong>B</strong> Lower attines</li>\n<li><strong>C</strong> Both leaf-cutting ants and lower attine ants</li>\n</ul>\n<p><em>Write the correct letter, A, B or C, in boxes 20-24 on your answer sheet.</em></p>\n<div class=\"question-item\">\n<p><strong>20</strong> the use of dead vegetation to cultivate their fungus</p>\n<div class=\"radio-options\">\n<label><input type=\"radio\" name=\"q7\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q7\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q7\" value=\"C\"> C</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>21</strong> very small ants that keep the fungus free of foreign organisms</p>\n<div class=\"radio-options\">\n<label><input type=\"radio\" name=\"q8\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q8\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q8\" value=\"C\"> C</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>22</strong> the ability to safely eat harmful plants</p>\n<div class=\"radio-options\">\n<label><input type=\"radio\" name=\"q9\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q9\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q9\" value=\"C\"> C</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>23</strong> the cultivation of a single fungus</p>\n<div class=\"radio-options\">\n<label><input type=\"radio\" name=\"q10\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q10\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q10\" value=\"C\"> C</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>24</strong> a nest with a very large number of rooms for growing fungus</p>\n<div class=\"radio-options\">\n<label><input type=\"radio\" name=\"q11\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q11\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q11\" value=\"C\"> C</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -58,7 +58,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q12-13-anchor\">\n                 <h4>Questions 25–26</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>25</strong> What does the writer say about Cameron Currie's research?</p>\n                    <div class=\"radio-options radio-options-vertical\">\n                        <label><input type=\"radio\" name=\"q12\" value=\"A\"> A No previous work had been done in this area.</label>\n                        <label><input type=\"radio\" name=\"q12\" value=\"B\"> B Earlier studies did not support his theory.</label>\n                        <label><input type=\"radio\" name=\"q12\" value=\"C\"> C Textbooks on this subject lacked specific detail.</label>\n                        <label><input type=\"radio\" name=\"q12\" value=\"D\"> D Currie's initial theory had proven to be incorrect.</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>26</strong> Using a microscope, Currie was the first to discover that the body of attine ants</p>\n                    <div class=\"radio-options radio-options-vertical\">\n                        <label><input type=\"radio\" name=\"q13\" value=\"A\"> A has a white covering.</label>\n                        <label><input type=\"radio\" name=\"q13\" value=\"B\"> B is covered in wax.</label>\n                        <label><input type=\"radio\" name=\"q13\" value=\"C\"> C is poisonous to humans.</label>\n                        <label><input type=\"radio\" name=\"q13\" value=\"D\"> D has a substance useful to humans.</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q12-13-anchor\">\n<h4>Questions 25–26</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>25</strong> What does the writer say about Cameron Currie's research?</p>\n<div class=\"radio-options radio-options-vertical\">\n<label><input type=\"radio\" name=\"q12\" value=\"A\"> A No previous work had been done in this area.</label> <label><input type=\"radio\" name=\"q12\" value=\"B\"> B Earlier studies did not support his theory.</label> <label><input type=\"radio\" name=\"q12\" value=\"C\"> C Textbooks on this subject lacked specific detail.</label> <label><input type=\"radio\" name=\"q12\" value=\"D\"> D Currie's initial theory had proven to be incorrect.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>26</strong> Using a microscope, Currie was the first to discover that the body of attine ants</p>\n<div class=\"radio-options radio-options-vertical\">\n<label><input type=\"radio\" name=\"q13\" value=\"A\"> A has a white covering.</label> <label><input type=\"radio\" name=\"q13\" value=\"B\"> B is covered in wax.</label> <label><input type=\"radio\" name=\"q13\" value=\"C\"> C is poisonous to humans.</label> <label><input type=\"radio\" name=\"q13\" value=\"D\"> D has a substance useful to humans.</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
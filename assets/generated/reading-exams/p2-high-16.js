@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 2</h2>\n            <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 on the following pages.</p>\n            \n            <h3>The Importance of Law</h3>\n            \n            <div class=\"paragraph-wrapper\" id=\"para-a-anchor\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"A\" data-question=\"q1\">\n                    <span class=\"paragraph-label\">Paragraph A:</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>A</strong> The law influences all of us virtually all the time. It governs almost all aspects of our behaviour, and even what happens to us when we are no longer alive. It affects us from the embryo onwards. It governs the air we breathe, the food and drink we consume, our travel, family relationships, and our property. It applies at the bottom of the ocean and in space. Each time we examine a label on a food product, engage in work as an employee or employer, travel on the roads, go to school to learn or to teach, stay in a hotel, borrow a library book, create or dissolve a commercial company, play sports, or engage the services of someone for anything from plumbing a sink to planning a city, we are in the world of law.</p>\n            </div>\n\n            <div class=\"paragraph-wrapper\" id=\"para-b-anchor\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"B\" data-question=\"q2\">\n                    <span class=\"paragraph-label\">Paragraph B:</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>B</strong> Law has also become much more widely recognised as the standard by which behaviour needs to be judged. A very telling development in recent history is the way in which the idea of law has permeated all parts of social life. The universal standard of whether something is socially tolerated is progressively becoming whether it is legal, rather than something that has always been considered acceptable. In earlier times, most people were illiterate. Today, by contrast, a vast number of people can read, and it is becoming easier for people to take an interest in law, and for the general population to help actually shape the law in many countries. However, law is a versatile instrument that can be used equally well for the improvement or the degradation of humanity.</p>\n            </div>\n\n            <div class=\"paragraph-wrapper\" id=\"para-c-anchor\">\n                 <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"C\" data-question=\"q3\">\n                    <span class=\"paragraph-label\">Paragraph C:</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>C</strong> This, of course, puts law in a very significant position. In our rapidly developing world, all sorts of skills and knowledge are valuable. Those people, for example, with knowledge of computers, the internet, and communications technology are relied upon by the rest of us. There is now someone with IT skills or an IT help desk in every UK school, every company, every hospital, every local and central government office. Without their knowledge, many parts of commercial and social life today would seize up in minutes. But legal understanding is just as vital and as universally needed. The American comedian Jerry Seinfeld put it like this, 'We are all throwing the dice, playing the game, moving our pieces around the board, but if there is a problem, the lawyer is the only person who has read the inside of the top of the box.' In other words, the lawyer is the only person who has read and made sense of the rules.</p>\n            </div>\n\n            <div class=\"paragraph-wrapper\" id=\"para-d-anchor\">\n                 <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"D\" data-question=\"q4\">\n                    <span class=\"paragraph-label\">Paragraph D:</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>D</strong> The number of laws has never been greater. In the UK alone, about 35 new Acts of Parliament are produced every year, thereby delivering thousands of new rules. The legislative output of the British Parliament has more than doubled in recent times from 1,100 pages a year in the early 1970s, to over 2,500 pages a year today. Between 1997 and 2006, the legislature passed 365 Acts of Parliament and more than 32,000 legally binding statutory instruments. In a system with so much law, lawyers do a great deal not just to vindicate the rights of citizens and organisations but also to help develop the law through legal arguments, some of which are adapted by judges to become laws. Law courts can and do produce new law and revise old law, but they do so having heard the arguments of lawyers.</p>\n            </div>\n\n            <div class=\"paragraph-wrapper\" id=\"para-e-anchor\">\n                 <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"E\" data-question=\"q5\">\n                    <span class=\"paragraph-label\">Paragraph E:</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>E</strong> However, despite their important role in developing the rules, lawyers are not universally admired. Anti-lawyer jokes have a long history going back to the ancient Greeks. More recently, the son of a famous Hollywood actor was asked at his junior school what his father did for a living, to which he replied, ‘My daddy is a movie actor, and sometimes he plays the good guy, and sometimes, he plays the lawyer.' For balance, though, it is worth remembering that there are and have been many heroic and revered lawyers such as the Roman philosopher and politician Cicero, and Mahatma Gandhi, the Indian campaigner for Independence.</p>\n            </div>\n\n            <div class=\"paragraph-wrapper\" id=\"para-f-anchor\">\n                 <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"F\" data-question=\"q6\">\n                    <span class=\"paragraph-label\">Paragraph F:</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>F</strong> People sometimes make comments that characterise lawyers as professionals whose concerns put personal reward above truth, or who gain financially from misfortune. There are undoubtedly lawyers that would fit that bill, just as there are some scientists, journalists and others in that category. But, in general, it is no more just to say that lawyers are bad because they make a living from people's problems than it is to make the same accusation in respect of nurses or IT consultants. A great many lawyers are involved in public law work, such as that involving civil liberties, housing and other issues. Such work is not lavishly remunerated and the quality of the service provided by these lawyers relies on considerable professional dedication. Moreover, much legal work has nothing to do with conflict or misfortune, but is primarily concerned with drafting documents. Another source of social disaffection for lawyers, and disaffection for the law, is a limited public understanding of how law works and how it could be changed. Greater clarity about these issues, maybe as a result of better public relations, would reduce many aspects of public dissatisfaction with the law.</p>\n            </div>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 on the following pages.</p>\n<h3>The Importance of Law</h3>\n<div class=\"paragraph-wrapper\" id=\"para-a-anchor\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"A\" data-question=\"q1\">\n<span class=\"paragraph-label\">Paragraph A:</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> The law influences all of us virtually all the time. It governs almost all aspects of our behaviour, and even what happens to us when we are no longer alive. It affects us from the embryo onwards. It governs the air we breathe, the food and drink we consume, our travel, family relationships, and our property. It applies at the bottom of the ocean and in space. Each time we examine a label on a food product, engage in work as an employee or employer, travel on the roads, go to school to learn or to teach, stay in a hotel, borrow a library book, create or dissolve a commercial company, play sports, or engage the services of someone for anything from plumbing a sink to planning a city, we are in the world of law.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-b-anchor\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"B\" data-question=\"q2\">\n<span class=\"paragraph-label\">Paragraph B:</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> Law has also become much more widely recognised as the standard by which behaviour needs to be judged. A very telling development in recent history is the way in which the idea of law has permeated all parts of social life. The universal standard of whether something is socially tolerated is progressively becoming whether it is legal, rather than something that has always been considered acceptable. In earlier times, most people were illiterate. Today, by contrast, a vast number of people can read, and it is becoming easier for people to take an interest in law, and for the general population to help actually shape the law in many countries. However, law is a versatile instrument that can be used equally well for the improvement or the degradation of humanity.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-c-anchor\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"C\" data-question=\"q3\">\n<span class=\"paragraph-label\">Paragraph C:</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> This, of course, puts law in a very significant position. In our rapidly developing world, all sorts of skills and knowledge are valuable. Those people, for example, with knowledge of computers, the internet, and communications technology are relied upon by the rest of us. There is now someone with IT skills or an IT help desk in every UK school, every company, every hospital, every local and central government office. Without their knowledge, many parts of commercial and social life today would seize up in minutes. But legal understanding is just as vital and as universally needed. The American comedian Jerry Seinfeld put it like this, 'We are all throwing the dice, playing the game, moving our pieces around the board, but if there is a problem, the lawyer is the only person who has read the inside of the top of the box.' In other words, the lawyer is the only person who has read and made sense of the rules.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-d-anchor\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"D\" data-question=\"q4\">\n<span class=\"paragraph-label\">Paragraph D:</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> The number of laws has never been greater. In the UK alone, about 35 new Acts of Parliament are produced every year, thereby delivering thousands of new rules. The legislative output of the British Parliament has more than doubled in recent times from 1,100 pages a year in the early 1970s, to over 2,500 pages a year today. Between 1997 and 2006, the legislature passed 365 Acts of Parliament and more than 32,000 legally binding statutory instruments. In a system with so much law, lawyers do a great deal not just to vindicate the rights of citizens and organisations but also to help develop the law through legal arguments, some of which are adapted by judges to become laws. Law courts can and do produce new law and revise old law, but they do so having heard the arguments of lawyers.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-e-anchor\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"E\" data-question=\"q5\">\n<span class=\"paragraph-label\">Paragraph E:</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> However, despite their important role in developing the rules, lawyers are not universally admired. Anti-lawyer jokes have a long history going back to the ancient Greeks. More recently, the son of a famous Hollywood actor was asked at his junior school what his father did for a living, to which he replied, ‘My daddy is a movie actor, and sometimes he plays the good guy, and sometimes, he plays the lawyer.' For balance, though, it is worth remembering that there are and have been many heroic and revered lawyers such as the Roman philosopher and politician Cicero, and Mahatma Gandhi, the Indian campaigner for Independence.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-f-anchor\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"F\" data-question=\"q6\">\n<span class=\"paragraph-label\">Paragraph F:</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> People sometimes make comments that characterise lawyers as professionals whose concerns put personal reward above truth, or who gain financially from misfortune. There are undoubtedly lawyers that would fit that bill, just as there are some scientists, journalists and others in that category. But, in general, it is no more just to say that lawyers are bad because they make a living from people's problems than it is to make the same accusation in respect of nurses or IT consultants. A great many lawyers are involved in public law work, such as that involving civil liberties, housing and other issues. Such work is not lavishly remunerated and the quality of the service provided by these lawyers relies on considerable professional dedication. Moreover, much legal work has nothing to do with conflict or misfortune, but is primarily concerned with drafting documents. Another source of social disaffection for lawyers, and disaffection for the law, is a limited public understanding of how law works and how it could be changed. Greater clarity about these issues, maybe as a result of better public relations, would reduce many aspects of public dissatisfaction with the law.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                <h4>Questions 14–19</h4>\n                <p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n                <p>Choose the correct heading for each paragraph from the list of headings below.</p>\n                \n                <div class=\"headings-pool\" id=\"headings-pool-container\">\n                    <strong>List of headings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i Different areas of professional expertise</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Reasons why it is unfair to criticise lawyers</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii The disadvantages of the legal system</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv The law applies throughout our lives</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v The law has affected historical events</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi A negative regard for lawyers</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii The public's increasing ability to influence the law</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii Growth in laws</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i Different areas of professional expertise</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Reasons why it is unfair to criticise lawyers</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii The disadvantages of the legal system</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv The law applies throughout our lives</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v The law has affected historical events</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi A negative regard for lawyers</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii The public's increasing ability to influence the law</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii Growth in laws</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -47,7 +47,7 @@
         "q7",
         "q8"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-anchor\">\n                <h4>Questions 20–21</h4>\n                <p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n                <p>Which <strong>TWO</strong> of the following statements does the writer make about legal skills in today's world?</p>\n                <div class=\"multi-choice-options\">\n                    <label><input type=\"checkbox\" name=\"q7-8\" value=\"A\"> A There should be a person with legal training in every hospital.</label>\n                    <label><input type=\"checkbox\" name=\"q7-8\" value=\"B\"> B Lawyers with experience in commercial law are the most in demand.</label>\n                    <label><input type=\"checkbox\" name=\"q7-8\" value=\"C\"> C Knowledge of the law is as important as having computer skills.</label>\n                    <label><input type=\"checkbox\" name=\"q7-8\" value=\"D\"> D Society could not function effectively without legal experts.</label>\n                    <label><input type=\"checkbox\" name=\"q7-8\" value=\"E\"> E Schools should teach students about the law.</label>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-anchor\">\n<h4>Questions 20–21</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>Which <strong>TWO</strong> of the following statements does the writer make about legal skills in today's world?</p>\n<div class=\"multi-choice-options\">\n<label><input type=\"checkbox\" name=\"q7-8\" value=\"A\"> A There should be a person with legal training in every hospital.</label> <label><input type=\"checkbox\" name=\"q7-8\" value=\"B\"> B Lawyers with experience in commercial law are the most in demand.</label> <label><input type=\"checkbox\" name=\"q7-8\" value=\"C\"> C Knowledge of the law is as important as having computer skills.</label> <label><input type=\"checkbox\" name=\"q7-8\" value=\"D\"> D Society could not function effectively without legal experts.</label> <label><input type=\"checkbox\" name=\"q7-8\" value=\"E\"> E Schools should teach students about the law.</label>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n                 <h4>Questions 22–26</h4>\n                 <p>Complete the summary below. Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                 <div class=\"summary-box\">\n                    <h5>Lawyers as professionals</h5>\n                    <p>People sometimes say that <strong>22</strong> <input type=\"text\" id=\"q22_input\" name=\"q9\"> is of little interest to lawyers, who are more concerned with making money. This may well be the case with some individuals, in the same way that some <strong>23</strong> <input type=\"text\" id=\"q23_input\" name=\"q10\"> or scientific experts may also be driven purely by financial greed. However, criticising lawyers because their work is concerned with people's problems would be similar to attacking IT staff or <strong>24</strong> <input type=\"text\" id=\"q24_input\" name=\"q11\"> for the same reason. In fact, many lawyers focus on questions relating, for example, to housing or civil liberties, which requires them to have <strong>25</strong> <input type=\"text\" id=\"q25_input\" name=\"q12\"> to their work. What's more, a lot of lawyers' time is spent writing <strong>26</strong> <input type=\"text\" id=\"q26_input\" name=\"q13\"> rather than dealing with people's misfortunes.</p>\n                 </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 22–26</h4>\n<p>Complete the summary below. Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-box\">\n<h5>Lawyers as professionals</h5>\n<p>People sometimes say that <strong>22</strong> <input type=\"text\" id=\"q22_input\" name=\"q9\"> is of little interest to lawyers, who are more concerned with making money. This may well be the case with some individuals, in the same way that some <strong>23</strong> <input type=\"text\" id=\"q23_input\" name=\"q10\"> or scientific experts may also be driven purely by financial greed. However, criticising lawyers because their work is concerned with people's problems would be similar to attacking IT staff or <strong>24</strong> <input type=\"text\" id=\"q24_input\" name=\"q11\"> for the same reason. In fact, many lawyers focus on questions relating, for example, to housing or civil liberties, which requires them to have <strong>25</strong> <input type=\"text\" id=\"q25_input\" name=\"q12\"> to their work. What's more, a lot of lawyers' time is spent writing <strong>26</strong> <input type=\"text\" id=\"q26_input\" name=\"q13\"> rather than dealing with people's misfortunes.</p>\n</div>\n</div>"
     }
   ],
   "answerKey": {
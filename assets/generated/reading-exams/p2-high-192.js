@@ -16,7 +16,7 @@
       {
         "blockId": "passage-main",
         "kind": "text",
-        "bodyHtml": "<h2>READING PASSAGE 2</h2>\n    <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n    \n    <h3>Should we stop eating meat?</h3>\n    <p><em>Some claim that it's the only way to save our planet from disaster. But is it really that simple?</em></p>\n  \n    <h4>A</h4>\n    <p>The call for people to eat less meat to save the planet is growing louder, so if less is good, wouldn't none be better? To find out, let's imagine what would happen if the world eliminated meat, milk and eggs from its diet, then trace the effects. Last year the world consumed 289 million tonnes of meat, 700 million tonnes of milk and 1.2 billion eggs. Environmentally speaking, this came at an enormous cost.</p>\n    \n    <h4>B</h4>\n    <p>All agriculture damages the environment. Take for example the felled forests and the common use of irrigation systems. And it may surprise you to know that agriculture creates more greenhouse gases than all methods of transport put together. Livestock farming does the most damage. In part, that is because most livestock eat grain that could be used to feed human populations, and farmers are forced to grow more than we would otherwise need to meet the demand. Altogether, if we switched to a vegan diet, meaning no meat, dairy or eggs, the land currently required for crops would drop by an estimated 21 per cent, about 3.4 million hectares, roughly the size of India.</p>\n    \n    <h4>C</h4>\n    <p>One environmental impact that would also lessen through a reduction in animal farming would be that of the nitrogen emitted from agricultural processes, which spreads into both waterways and land. According to environmental scientist Allison Leach, if everyone eliminated dairy products and eggs, this kind of pollution would fall by 60%. Livestock production has another serious environmental impact. Global statistics are hard to come by, but in the US at least, livestock account for 55% of erosion, mostly from forests being cut down to make way for grazing land. On top of this, half of all antibiotics manufactured are fed to livestock as part of their normal diet, a practice that is leading to drug-resistant bacteria.</p>\n    \n    <h4>D</h4>\n    <p>A meat-free world, then would be greener in many ways. However, if everyone opted to give up meat there would be significant costs too. For most of human history, livestock grazed on land that wasn't suitable for ploughing, and in doing so they converted inedible grass into edible meat and milk. Even today, a flock of sheep or goats can be the most efficient way to get food from marginal land. In a world in which over a billion people do not have enough to eat, using this land for crop production would contribute to food insecurity.</p>\n    \n    <h4>E</h4>\n    <p>In some parts of the world today, livestock like chickens, for instance, can subsist on leftovers and whatever they find. Tara Garnett, who heads the Food Climate Research Network at the University of Surrey, points out the usefulness of these animals. By giving them your leftovers, she says, they deal with your rubbish, and you get meat. Garnett admits, though, that if this kind of approach were generally adopted, it would require a major adjustment in food preferences; people would have to get used to chicken, for example, with less fat.</p>\n\n    <h4>F</h4>\n    <p>Another downside to a meat-free world would be the disappearance of animal by-products. Such a world would have to replace the 11 million tonnes of leather and 2 million tonnes of wool that come annually from livestock farming and which are turned into clothing. Furthermore, even ardent vegetarians acknowledge that dairy products and meat may be a good thing in poorer countries. ‘Whilst there's no doubt that considerable reduction of meat consumption would have an environmental benefit, we do have to be careful about saying it would be the best solution if the whole world went vegetarian,' says Annette Pinner, chief executive of the UK Vegetarian Society. For many of the world's poorest rural residents, an animal may represent their only realistic hope for a little extra income, and a little animal protein can make a big difference to a marginal diet.</p>\n    \n    <h4>G</h4>\n    <p>What if we decided on a no-meat vegetarian diet, rather than a vegan diet? After all, milk and eggs are very efficient ways of producing animal calories. ‘It's difficult to switch to a no-meat-but-milk diet,' says Helmut Haberl, a social ecologist. 'Dairy cows must calve every year to keep producing milk, and only half their offspring will be female. While many vegetarians see moral reasons not to kill and eat the males, there is surely no practical reason to waste so much meat.' Similar arguments apply to chickens kept for eggs.</p>\n\n    <h4>H</h4>\n    <p>So even though a meat-free world sounds good on paper, it is likely that a utopian future will still have some animal products in it. The real questions, then, are how much meat do we want, and how will we produce it? The answers depend on how you approach these questions. The most straightforward approach is to assume that the world will continue to want evermore meat. The United Nations' best guess is that by 2050, the world will need to more than double its production of meat, an increase that would be environmentally disastrous.</p>\n\n    <h4>I</h4>\n    <p>Under this scenario the goal will have to be producing the most meat at the lowest environmental cost. According to Walter Falcon, an agricultural economist, this means fewer free range cattle and sheep in green fields. 'If you're going to keep some livestock systems, I think the ones you'll want to keep are the intensive ones,' he says. Of course this does not take into account animal welfare issues, as intensive farming usually means poor living conditions and the use of growth hormones.</p>\n    \n    <p>&nbsp;</p> <!-- Final padding -->\n  </section>\n\n  <!-- Draggable Divider -->\n  <div id=\"divider\" title=\"Drag to resize\"></div>\n\n  <!-- Right Pane: Questions and Controls -->"
+        "bodyHtml": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Should we stop eating meat?</h3>\n<p><em>Some claim that it's the only way to save our planet from disaster. But is it really that simple?</em></p>\n<h4>A</h4>\n<p>The call for people to eat less meat to save the planet is growing louder, so if less is good, wouldn't none be better? To find out, let's imagine what would happen if the world eliminated meat, milk and eggs from its diet, then trace the effects. Last year the world consumed 289 million tonnes of meat, 700 million tonnes of milk and 1.2 billion eggs. Environmentally speaking, this came at an enormous cost.</p>\n<h4>B</h4>\n<p>All agriculture damages the environment. Take for example the felled forests and the common use of irrigation systems. And it may surprise you to know that agriculture creates more greenhouse gases than all methods of transport put together. Livestock farming does the most damage. In part, that is because most livestock eat grain that could be used to feed human populations, and farmers are forced to grow more than we would otherwise need to meet the demand. Altogether, if we switched to a vegan diet, meaning no meat, dairy or eggs, the land currently required for crops would drop by an estimated 21 per cent, about 3.4 million hectares, roughly the size of India.</p>\n<h4>C</h4>\n<p>One environmental impact that would also lessen through a reduction in animal farming would be that of the nitrogen emitted from agricultural processes, which spreads into both waterways and land. According to environmental scientist Allison Leach, if everyone eliminated dairy products and eggs, this kind of pollution would fall by 60%. Livestock production has another serious environmental impact. Global statistics are hard to come by, but in the US at least, livestock account for 55% of erosion, mostly from forests being cut down to make way for grazing land. On top of this, half of all antibiotics manufactured are fed to livestock as part of their normal diet, a practice that is leading to drug-resistant bacteria.</p>\n<h4>D</h4>\n<p>A meat-free world, then would be greener in many ways. However, if everyone opted to give up meat there would be significant costs too. For most of human history, livestock grazed on land that wasn't suitable for ploughing, and in doing so they converted inedible grass into edible meat and milk. Even today, a flock of sheep or goats can be the most efficient way to get food from marginal land. In a world in which over a billion people do not have enough to eat, using this land for crop production would contribute to food insecurity.</p>\n<h4>E</h4>\n<p>In some parts of the world today, livestock like chickens, for instance, can subsist on leftovers and whatever they find. Tara Garnett, who heads the Food Climate Research Network at the University of Surrey, points out the usefulness of these animals. By giving them your leftovers, she says, they deal with your rubbish, and you get meat. Garnett admits, though, that if this kind of approach were generally adopted, it would require a major adjustment in food preferences; people would have to get used to chicken, for example, with less fat.</p>\n<h4>F</h4>\n<p>Another downside to a meat-free world would be the disappearance of animal by-products. Such a world would have to replace the 11 million tonnes of leather and 2 million tonnes of wool that come annually from livestock farming and which are turned into clothing. Furthermore, even ardent vegetarians acknowledge that dairy products and meat may be a good thing in poorer countries. ‘Whilst there's no doubt that considerable reduction of meat consumption would have an environmental benefit, we do have to be careful about saying it would be the best solution if the whole world went vegetarian,' says Annette Pinner, chief executive of the UK Vegetarian Society. For many of the world's poorest rural residents, an animal may represent their only realistic hope for a little extra income, and a little animal protein can make a big difference to a marginal diet.</p>\n<h4>G</h4>\n<p>What if we decided on a no-meat vegetarian diet, rather than a vegan diet? After all, milk and eggs are very efficient ways of producing animal calories. ‘It's difficult to switch to a no-meat-but-milk diet,' says Helmut Haberl, a social ecologist. 'Dairy cows must calve every year to keep producing milk, and only half their offspring will be female. While many vegetarians see moral reasons not to kill and eat the males, there is surely no practical reason to waste so much meat.' Similar arguments apply to chickens kept for eggs.</p>\n<h4>H</h4>\n<p>So even though a meat-free world sounds good on paper, it is likely that a utopian future will still have some animal products in it. The real questions, then, are how much meat do we want, and how will we produce it? The answers depend on how you approach these questions. The most straightforward approach is to assume that the world will continue to want evermore meat. The United Nations' best guess is that by 2050, the world will need to more than double its production of meat, an increase that would be environmentally disastrous.</p>\n<h4>I</h4>\n<p>Under this scenario the goal will have to be producing the most meat at the lowest environmental cost. According to Walter Falcon, an agricultural economist, this means fewer free range cattle and sheep in green fields. 'If you're going to keep some livestock systems, I think the ones you'll want to keep are the intensive ones,' he says. Of course this does not take into account animal welfare issues, as intensive farming usually means poor living conditions and the use of growth hormones.</p>\n<p>&nbsp;</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"
       }
     ]
   },
@@ -30,7 +30,7 @@
         "q3",
         "q4"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <a id=\"q1-anchor\"></a>\n      <h4>Questions 14–17</h4>\n      <p>Which paragraph contains the following information?</p>\n      <div class=\"q-block\"><p><strong>14</strong> the suggestion that people may need to adapt to a different quality of meat</p><div class=\"options\"><label><input type=\"radio\" name=\"q1\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q1\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q1\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q1\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q1\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q1\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q1\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q1\" value=\"H\"> H</label><label><input type=\"radio\" name=\"q1\" value=\"I\"> I</label></div></div>\n      <div class=\"q-block\"><p><strong>15</strong> a description of the way animals were fed in the past</p><div class=\"options\"><label><input type=\"radio\" name=\"q2\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q2\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q2\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q2\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q2\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q2\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q2\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q2\" value=\"H\"> H</label><label><input type=\"radio\" name=\"q2\" value=\"I\"> I</label></div></div>\n      <div class=\"q-block\"><p><strong>16</strong> a prediction in regard to human demand for meat</p><div class=\"options\"><label><input type=\"radio\" name=\"q3\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q3\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q3\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q3\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q3\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q3\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q3\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q3\" value=\"H\"> H</label><label><input type=\"radio\" name=\"q3\" value=\"I\"> I</label></div></div>\n      <div class=\"q-block\"><p><strong>17</strong> the potential consequences of a meat-free world for textile industries</p><div class=\"options\"><label><input type=\"radio\" name=\"q4\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q4\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q4\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q4\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q4\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q4\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q4\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q4\" value=\"H\"> H</label><label><input type=\"radio\" name=\"q4\" value=\"I\"> I</label></div></div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<a id=\"q1-anchor\"></a>\n<h4>Questions 14–17</h4>\n<p>Which paragraph contains the following information?</p>\n<div class=\"q-block\"><p><strong>14</strong> the suggestion that people may need to adapt to a different quality of meat</p><div class=\"options\"><label><input type=\"radio\" name=\"q1\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q1\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q1\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q1\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q1\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q1\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q1\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q1\" value=\"H\"> H</label><label><input type=\"radio\" name=\"q1\" value=\"I\"> I</label></div></div>\n<div class=\"q-block\"><p><strong>15</strong> a description of the way animals were fed in the past</p><div class=\"options\"><label><input type=\"radio\" name=\"q2\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q2\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q2\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q2\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q2\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q2\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q2\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q2\" value=\"H\"> H</label><label><input type=\"radio\" name=\"q2\" value=\"I\"> I</label></div></div>\n<div class=\"q-block\"><p><strong>16</strong> a prediction in regard to human demand for meat</p><div class=\"options\"><label><input type=\"radio\" name=\"q3\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q3\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q3\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q3\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q3\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q3\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q3\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q3\" value=\"H\"> H</label><label><input type=\"radio\" name=\"q3\" value=\"I\"> I</label></div></div>\n<div class=\"q-block\"><p><strong>17</strong> the potential consequences of a meat-free world for textile industries</p><div class=\"options\"><label><input type=\"radio\" name=\"q4\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q4\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q4\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q4\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q4\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q4\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q4\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q4\" value=\"H\"> H</label><label><input type=\"radio\" name=\"q4\" value=\"I\"> I</label></div></div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -42,7 +42,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <a id=\"q5-anchor\"></a>\n      <h4>Questions 18–22</h4>\n      <p>Complete the summary below. Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n      <h5>How does agriculture damage the environment?</h5>\n      <p>Agriculture causes significant harm to the environment in a number of ways, including the frequent use of <strong>18</strong> <input class=\"blank\" name=\"q5\"> in modern farming and the cutting down of trees. It is also responsible for the production of many greenhouse gases, more so than <strong>19</strong> <input class=\"blank\" name=\"q6\"> is. However, it is livestock farming in particular that is most harmful, because cows, chickens and sheep, for example, are given vast quantities of grain which could be consumed by people instead. A meat-free diet would mean that actually less <strong>20</strong> <input class=\"blank\" name=\"q7\"> could be used for crops. Far less chemical pollution, specifically in the form of <strong>21</strong> <input class=\"blank\" name=\"q8\">, would also be released into the environment, especially if consumers cut out dairy and egg products as well as meat. In the US, there is clear evidence that considerable <strong>22</strong> <input class=\"blank\" name=\"q9\"> is caused by the demand for grazing land, although there is no information on this from other countries.</p>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<a id=\"q5-anchor\"></a>\n<h4>Questions 18–22</h4>\n<p>Complete the summary below. Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<h5>How does agriculture damage the environment?</h5>\n<p>Agriculture causes significant harm to the environment in a number of ways, including the frequent use of <strong>18</strong> <input class=\"blank\" name=\"q5\"> in modern farming and the cutting down of trees. It is also responsible for the production of many greenhouse gases, more so than <strong>19</strong> <input class=\"blank\" name=\"q6\"> is. However, it is livestock farming in particular that is most harmful, because cows, chickens and sheep, for example, are given vast quantities of grain which could be consumed by people instead. A meat-free diet would mean that actually less <strong>20</strong> <input class=\"blank\" name=\"q7\"> could be used for crops. Far less chemical pollution, specifically in the form of <strong>21</strong> <input class=\"blank\" name=\"q8\">, would also be released into the environment, especially if consumers cut out dairy and egg products as well as meat. In the US, there is clear evidence that considerable <strong>22</strong> <input class=\"blank\" name=\"q9\"> is caused by the demand for grazing land, although there is no information on this from other countries.</p>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -53,7 +53,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <a id=\"q10-anchor\"></a>\n      <h4>Questions 23–26</h4>\n      <p>Match each statement with the correct researcher. <em>NB You may use any letter more than once.</em></p>\n      <div class=\"q-match-item\"><span class=\"q-text\"><strong>23</strong> It is not possible to say that a vegetarian diet is right for everyone.</span><span class=\"match-dropzone\" data-question=\"q10\"></span></div>\n      <div class=\"q-match-item\"><span class=\"q-text\"><strong>24</strong> It may be economically preferable to farm animals in limited space.</span><span class=\"match-dropzone\" data-question=\"q11\"></span></div>\n      <div class=\"q-match-item\"><span class=\"q-text\"><strong>25</strong> It does not make sense to give up meat without giving up dairy products too.</span><span class=\"match-dropzone\" data-question=\"q12\"></span></div>\n      <div class=\"q-match-item\"><span class=\"q-text\"><strong>26</strong> Some animals can be fed in a way that allows waste to be recycled.</span><span class=\"match-dropzone\" data-question=\"q13\"></span></div>\n      <div class=\"option-pool\" id=\"pool-researchers\">\n        <div class=\"card\" draggable=\"true\" data-value=\"A\" data-clone=\"true\"><strong>A</strong> Allison Leach</div>\n        <div class=\"card\" draggable=\"true\" data-value=\"B\" data-clone=\"true\"><strong>B</strong> Tara Garnett</div>\n        <div class=\"card\" draggable=\"true\" data-value=\"C\" data-clone=\"true\"><strong>C</strong> Annette Pinner</div>\n        <div class=\"card\" draggable=\"true\" data-value=\"D\" data-clone=\"true\"><strong>D</strong> Helmut Haberl</div>\n        <div class=\"card\" draggable=\"true\" data-value=\"E\" data-clone=\"true\"><strong>E</strong> Walter Falcon</div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<a id=\"q10-anchor\"></a>\n<h4>Questions 23–26</h4>\n<p>Match each statement with the correct researcher. <em>NB You may use any letter more than once.</em></p>\n<div class=\"q-match-item\"><span class=\"q-text\"><strong>23</strong> It is not possible to say that a vegetarian diet is right for everyone.</span><span class=\"match-dropzone\" data-question=\"q10\"></span></div>\n<div class=\"q-match-item\"><span class=\"q-text\"><strong>24</strong> It may be economically preferable to farm animals in limited space.</span><span class=\"match-dropzone\" data-question=\"q11\"></span></div>\n<div class=\"q-match-item\"><span class=\"q-text\"><strong>25</strong> It does not make sense to give up meat without giving up dairy products too.</span><span class=\"match-dropzone\" data-question=\"q12\"></span></div>\n<div class=\"q-match-item\"><span class=\"q-text\"><strong>26</strong> Some animals can be fed in a way that allows waste to be recycled.</span><span class=\"match-dropzone\" data-question=\"q13\"></span></div>\n<div class=\"option-pool\" id=\"pool-researchers\">\n<div class=\"card\" draggable=\"true\" data-value=\"A\" data-clone=\"true\"><strong>A</strong> Allison Leach</div>\n<div class=\"card\" draggable=\"true\" data-value=\"B\" data-clone=\"true\"><strong>B</strong> Tara Garnett</div>\n<div class=\"card\" draggable=\"true\" data-value=\"C\" data-clone=\"true\"><strong>C</strong> Annette Pinner</div>\n<div class=\"card\" draggable=\"true\" data-value=\"D\" data-clone=\"true\"><strong>D</strong> Helmut Haberl</div>\n<div class=\"card\" draggable=\"true\" data-value=\"E\" data-clone=\"true\"><strong>E</strong> Walter Falcon</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -16,7 +16,7 @@
       {
         "blockId": "passage-main",
         "kind": "text",
-        "bodyHtml": "<h2>READING PASSAGE 2</h2>\n    <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n    \n    <h3>Multi-tasking and the brain</h3>\n  \n    <h4>A</h4>\n    <p>Do you think you're a master of multi-tasking? Think again. Unless you are one of the three percent of super-taskers in the population, research shows that your brain isn't capable of paying close attention to more than one complex task at a time. Researchers who study attention say that effective multi-tasking is beyond most of us. Psychiatrist Edward M Hallowell even describes multi-tasking as 'a mythical activity in which people believe they can perform two or more tasks simultaneously as effectively as they can perform one'.</p>\n\n    <h4>B</h4>\n    <p>It is true that you can check your email while eating your lunch, or listen to music while walking. But innate activities like walking, chewing, and breathing do not require you to pay attention, whereas activities such as reading, tapping out a text message, or driving a car do require attention. Why is paying attention to two things at once difficult? 'The brain can perform simultaneous tasks, but attention has capacity limitations,' says Associate Professor Paul E Dux, a cognitive neuroscientist at the University of Queensland in Australia. When you do only one thing at a time, you're better at that task than when you're doing multiple things concurrently.</p>\n    <p>Take the classic multi-tasking scenario of talking on a mobile phone while driving - an ill-advised activity that many people believe they have mastered. When David Strayer, Professor of Psychology at the University of Utah in the US, and his team observed 56,000 drivers as they approached an intersection, the majority of drivers who were talking on their phone failed to stop in accordance with traffic laws. And it did not matter if the driver was using a handheld or hands-free device. Even with both eyes on the road and both hands on the wheel, drivers' performance was impaired. Strayer's research shows that performance deteriorates drastically when attention is split between tasks: more mistakes are made and it takes longer to complete each activity.</p>\n\n    <h4>C</h4>\n    <p>The prefrontal cortex is the brain region responsible for choosing what to pay attention to, and for coordinating inputs from other brain areas. By scanning the prefrontal cortex of people while they multi-tasked, scientists at the French Institute of Health and Medical Research in Paris (INSERM) found that when people focused on a single thing, the right and left sides of the prefrontal cortex work together. But when people attempt to perform two things at once, the sides work independently. Neuroscientist Etienne Koechlin says his study demonstrates that while the brain can switch back and forth between two tasks, we might be in great trouble when we try to juggle more than two tasks, simply because we have only two frontal lobes'.</p>\n\n    <h4>D</h4>\n    <p>To the question of whether there is a difference between the sexes, Koechlin's imaging studies uncovered no differences in the ability to switch between tasks in the prefrontal cortices of men or women. But other researchers studying real life scenarios such as finding lost keys, believe there might be some truth to the claim that women are superior multi-taskers. Women have a much better strategy for finding the keys, whereas men tend to jump to it and be far less organised and thorough. 'It's as if they don't stop to reflect and plan for a moment,' says Professor Keith Laws from the University of Hertfordshire in England. But while the ability to develop strategies for coping with the numerous tasks in everyday life could give women an advantage, 'nobody can juggle two, never mind three, \"complex\" tasks at the same time.'</p>\n\n    <h4>E</h4>\n    <p>However, David Strayer's research uncovered that some rare people possess extraordinary multi-tasking ability. These so-called 'super-taskers' exhibit different patterns of brain activity when multi-tasking compared to ordinary people: they show less activity in the prefrontal cortex during multi-tasking, suggesting their brains are functioning with a high level of efficiency. Strayer thinks that pilots of high-performance aircraft, high-end chefs who can cook several meals at the same time to perfection, and elite doctors in hospital emergency rooms might all be more likely to be super-taskers. \"All other things being equal, we suspect that super-taskers will rise to a top position in any occupation that places a high demand on juggling various tasks that demand attention at the same time.'</p>\n\n    <h4>F</h4>\n    <p>The ability to multi-task probably comes down to the DNA you inherit from your parents to a large extent, says Strayer. 'You are either born with the neural structure that allows you to overcome the usual multi-tasking challenges, or you aren't. Super-taskers' brains are doing something we can't do.' All in all, these findings may have very real consequences on our lives.</p>\n    \n    <p>&nbsp;</p> <!-- Final padding -->\n  </section>\n\n  <!-- Draggable Divider -->\n  <div id=\"divider\" title=\"Drag to resize\"></div>\n\n  <!-- Right Pane: Questions and Controls -->"
+        "bodyHtml": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Multi-tasking and the brain</h3>\n<h4>A</h4>\n<p>Do you think you're a master of multi-tasking? Think again. Unless you are one of the three percent of super-taskers in the population, research shows that your brain isn't capable of paying close attention to more than one complex task at a time. Researchers who study attention say that effective multi-tasking is beyond most of us. Psychiatrist Edward M Hallowell even describes multi-tasking as 'a mythical activity in which people believe they can perform two or more tasks simultaneously as effectively as they can perform one'.</p>\n<h4>B</h4>\n<p>It is true that you can check your email while eating your lunch, or listen to music while walking. But innate activities like walking, chewing, and breathing do not require you to pay attention, whereas activities such as reading, tapping out a text message, or driving a car do require attention. Why is paying attention to two things at once difficult? 'The brain can perform simultaneous tasks, but attention has capacity limitations,' says Associate Professor Paul E Dux, a cognitive neuroscientist at the University of Queensland in Australia. When you do only one thing at a time, you're better at that task than when you're doing multiple things concurrently.</p>\n<p>Take the classic multi-tasking scenario of talking on a mobile phone while driving - an ill-advised activity that many people believe they have mastered. When David Strayer, Professor of Psychology at the University of Utah in the US, and his team observed 56,000 drivers as they approached an intersection, the majority of drivers who were talking on their phone failed to stop in accordance with traffic laws. And it did not matter if the driver was using a handheld or hands-free device. Even with both eyes on the road and both hands on the wheel, drivers' performance was impaired. Strayer's research shows that performance deteriorates drastically when attention is split between tasks: more mistakes are made and it takes longer to complete each activity.</p>\n<h4>C</h4>\n<p>The prefrontal cortex is the brain region responsible for choosing what to pay attention to, and for coordinating inputs from other brain areas. By scanning the prefrontal cortex of people while they multi-tasked, scientists at the French Institute of Health and Medical Research in Paris (INSERM) found that when people focused on a single thing, the right and left sides of the prefrontal cortex work together. But when people attempt to perform two things at once, the sides work independently. Neuroscientist Etienne Koechlin says his study demonstrates that while the brain can switch back and forth between two tasks, we might be in great trouble when we try to juggle more than two tasks, simply because we have only two frontal lobes'.</p>\n<h4>D</h4>\n<p>To the question of whether there is a difference between the sexes, Koechlin's imaging studies uncovered no differences in the ability to switch between tasks in the prefrontal cortices of men or women. But other researchers studying real life scenarios such as finding lost keys, believe there might be some truth to the claim that women are superior multi-taskers. Women have a much better strategy for finding the keys, whereas men tend to jump to it and be far less organised and thorough. 'It's as if they don't stop to reflect and plan for a moment,' says Professor Keith Laws from the University of Hertfordshire in England. But while the ability to develop strategies for coping with the numerous tasks in everyday life could give women an advantage, 'nobody can juggle two, never mind three, \"complex\" tasks at the same time.'</p>\n<h4>E</h4>\n<p>However, David Strayer's research uncovered that some rare people possess extraordinary multi-tasking ability. These so-called 'super-taskers' exhibit different patterns of brain activity when multi-tasking compared to ordinary people: they show less activity in the prefrontal cortex during multi-tasking, suggesting their brains are functioning with a high level of efficiency. Strayer thinks that pilots of high-performance aircraft, high-end chefs who can cook several meals at the same time to perfection, and elite doctors in hospital emergency rooms might all be more likely to be super-taskers. \"All other things being equal, we suspect that super-taskers will rise to a top position in any occupation that places a high demand on juggling various tasks that demand attention at the same time.'</p>\n<h4>F</h4>\n<p>The ability to multi-task probably comes down to the DNA you inherit from your parents to a large extent, says Strayer. 'You are either born with the neural structure that allows you to overcome the usual multi-tasking challenges, or you aren't. Super-taskers' brains are doing something we can't do.' All in all, these findings may have very real consequences on our lives.</p>\n<p>&nbsp;</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"
       }
     ]
   },
@@ -32,7 +32,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 14–19</h4>\n      <p>Reading Passage 2 has six sections, <strong>A–F</strong>.</p>\n      <p>Choose the correct heading for each section from the list of headings below.</p>\n      <p><em>Drag the correct heading block to the box below each section label.</em></p>\n\n      <!-- Draggable Full Text Options -->\n      <div class=\"cardpool pool-vertical\" id=\"pool-headings\">\n        <div class=\"card\" draggable=\"true\" id=\"c-i\" data-value=\"i\"><strong>i</strong> Professions in which super-taskers are likely to be found</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-ii\" data-value=\"ii\"><strong>ii</strong> The effects of multi-tasking on neurological structure</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-iii\" data-value=\"iii\"><strong>iii</strong> A distinction between situations when people can and can’t multi-task</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-iv\" data-value=\"iv\"><strong>iv</strong> Real multi-tasking is nearly impossible</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-v\" data-value=\"v\"><strong>v</strong> Multi-tasking and gender</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-vi\" data-value=\"vi\"><strong>vi</strong> The neurological reasons for struggling to manage more things</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-vii\" data-value=\"vii\"><strong>vii</strong> The ability to multi-task is determined by people’s genes</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-viii\" data-value=\"viii\"><strong>viii</strong> Gender and the structure of the brain</div>\n      </div>\n\n      <hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n\n      <div class=\"match-row\">\n        <span class=\"label\"><a id=\"q1-anchor\"></a>14 Section A</span>\n        <span class=\"match-dropzone\" data-question=\"q1\"></span>\n      </div>\n      <div class=\"match-row\">\n        <span class=\"label\"><a id=\"q2-anchor\"></a>15 Section B</span>\n        <span class=\"match-dropzone\" data-question=\"q2\"></span>\n      </div>\n      <div class=\"match-row\">\n        <span class=\"label\"><a id=\"q3-anchor\"></a>16 Section C</span>\n        <span class=\"match-dropzone\" data-question=\"q3\"></span>\n      </div>\n      <div class=\"match-row\">\n        <span class=\"label\"><a id=\"q4-anchor\"></a>17 Section D</span>\n        <span class=\"match-dropzone\" data-question=\"q4\"></span>\n      </div>\n      <div class=\"match-row\">\n        <span class=\"label\"><a id=\"q5-anchor\"></a>18 Section E</span>\n        <span class=\"match-dropzone\" data-question=\"q5\"></span>\n      </div>\n      <div class=\"match-row\">\n        <span class=\"label\"><a id=\"q6-anchor\"></a>19 Section F</span>\n        <span class=\"match-dropzone\" data-question=\"q6\"></span>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has six sections, <strong>A–F</strong>.</p>\n<p>Choose the correct heading for each section from the list of headings below.</p>\n<p><em>Drag the correct heading block to the box below each section label.</em></p>\n<div class=\"cardpool pool-vertical\" id=\"pool-headings\">\n<div class=\"card\" draggable=\"true\" id=\"c-i\" data-value=\"i\"><strong>i</strong> Professions in which super-taskers are likely to be found</div>\n<div class=\"card\" draggable=\"true\" id=\"c-ii\" data-value=\"ii\"><strong>ii</strong> The effects of multi-tasking on neurological structure</div>\n<div class=\"card\" draggable=\"true\" id=\"c-iii\" data-value=\"iii\"><strong>iii</strong> A distinction between situations when people can and can’t multi-task</div>\n<div class=\"card\" draggable=\"true\" id=\"c-iv\" data-value=\"iv\"><strong>iv</strong> Real multi-tasking is nearly impossible</div>\n<div class=\"card\" draggable=\"true\" id=\"c-v\" data-value=\"v\"><strong>v</strong> Multi-tasking and gender</div>\n<div class=\"card\" draggable=\"true\" id=\"c-vi\" data-value=\"vi\"><strong>vi</strong> The neurological reasons for struggling to manage more things</div>\n<div class=\"card\" draggable=\"true\" id=\"c-vii\" data-value=\"vii\"><strong>vii</strong> The ability to multi-task is determined by people’s genes</div>\n<div class=\"card\" draggable=\"true\" id=\"c-viii\" data-value=\"viii\"><strong>viii</strong> Gender and the structure of the brain</div>\n</div>\n<hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n<div class=\"match-row\">\n<span class=\"label\"><a id=\"q1-anchor\"></a>14 Section A</span> <span class=\"match-dropzone\" data-question=\"q1\"></span>\n</div>\n<div class=\"match-row\">\n<span class=\"label\"><a id=\"q2-anchor\"></a>15 Section B</span> <span class=\"match-dropzone\" data-question=\"q2\"></span>\n</div>\n<div class=\"match-row\">\n<span class=\"label\"><a id=\"q3-anchor\"></a>16 Section C</span> <span class=\"match-dropzone\" data-question=\"q3\"></span>\n</div>\n<div class=\"match-row\">\n<span class=\"label\"><a id=\"q4-anchor\"></a>17 Section D</span> <span class=\"match-dropzone\" data-question=\"q4\"></span>\n</div>\n<div class=\"match-row\">\n<span class=\"label\"><a id=\"q5-anchor\"></a>18 Section E</span> <span class=\"match-dropzone\" data-question=\"q5\"></span>\n</div>\n<div class=\"match-row\">\n<span class=\"label\"><a id=\"q6-anchor\"></a>19 Section F</span> <span class=\"match-dropzone\" data-question=\"q6\"></span>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -43,7 +43,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 20–23</h4>\n      <p>Look at the following statements (Questions 20–23) and the list of researchers below.</p>\n      <p>Match each statement with the correct researcher, <strong>A–E</strong>.</p>\n      <p><em>NB You may use any researcher more than once.</em></p>\n\n      <!-- Draggable Full Text Options (Cloneable) -->\n      <div class=\"cardpool pool-vertical\" id=\"pool-researchers\">\n        <div class=\"card\" draggable=\"true\" id=\"card-A\" data-value=\"A\" data-clone=\"true\"><strong>A</strong> Edward M Hallowell</div>\n        <div class=\"card\" draggable=\"true\" id=\"card-B\" data-value=\"B\" data-clone=\"true\"><strong>B</strong> Paul E Dux</div>\n        <div class=\"card\" draggable=\"true\" id=\"card-C\" data-value=\"C\" data-clone=\"true\"><strong>C</strong> David Strayer</div>\n        <div class=\"card\" draggable=\"true\" id=\"card-D\" data-value=\"D\" data-clone=\"true\"><strong>D</strong> Etienne Koechlin</div>\n        <div class=\"card\" draggable=\"true\" id=\"card-E\" data-value=\"E\" data-clone=\"true\"><strong>E</strong> Keith Laws</div>\n      </div>\n\n      <hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n\n      <div class=\"match-row\">\n        <span class=\"label\"><a id=\"q7-anchor\"></a>20 The brain of a good multi-tasker works differently from other people’s.</span>\n        <span class=\"match-dropzone\" data-question=\"q7\"></span>\n      </div>\n      <div class=\"match-row\">\n        <span class=\"label\"><a id=\"q8-anchor\"></a>21 The rate of error is considerably higher when people multi-task.</span>\n        <span class=\"match-dropzone\" data-question=\"q8\"></span>\n      </div>\n      <div class=\"match-row\">\n        <span class=\"label\"><a id=\"q9-anchor\"></a>22 People are mistaken in their assumption that they can multi-task.</span>\n        <span class=\"match-dropzone\" data-question=\"q9\"></span>\n      </div>\n      <div class=\"match-row\">\n        <span class=\"label\"><a id=\"q10-anchor\"></a>23 One gender does not seem to pause to consider before taking action.</span>\n        <span class=\"match-dropzone\" data-question=\"q10\"></span>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 20–23</h4>\n<p>Look at the following statements (Questions 20–23) and the list of researchers below.</p>\n<p>Match each statement with the correct researcher, <strong>A–E</strong>.</p>\n<p><em>NB You may use any researcher more than once.</em></p>\n<div class=\"cardpool pool-vertical\" id=\"pool-researchers\">\n<div class=\"card\" draggable=\"true\" id=\"card-A\" data-value=\"A\" data-clone=\"true\"><strong>A</strong> Edward M Hallowell</div>\n<div class=\"card\" draggable=\"true\" id=\"card-B\" data-value=\"B\" data-clone=\"true\"><strong>B</strong> Paul E Dux</div>\n<div class=\"card\" draggable=\"true\" id=\"card-C\" data-value=\"C\" data-clone=\"true\"><strong>C</strong> David Strayer</div>\n<div class=\"card\" draggable=\"true\" id=\"card-D\" data-value=\"D\" data-clone=\"true\"><strong>D</strong> Etienne Koechlin</div>\n<div class=\"card\" draggable=\"true\" id=\"card-E\" data-value=\"E\" data-clone=\"true\"><strong>E</strong> Keith Laws</div>\n</div>\n<hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n<div class=\"match-row\">\n<span class=\"label\"><a id=\"q7-anchor\"></a>20 The brain of a good multi-tasker works differently from other people’s.</span> <span class=\"match-dropzone\" data-question=\"q7\"></span>\n</div>\n<div class=\"match-row\">\n<span class=\"label\"><a id=\"q8-anchor\"></a>21 The rate of error is considerably higher when people multi-task.</span> <span class=\"match-dropzone\" data-question=\"q8\"></span>\n</div>\n<div class=\"match-row\">\n<span class=\"label\"><a id=\"q9-anchor\"></a>22 People are mistaken in their assumption that they can multi-task.</span> <span class=\"match-dropzone\" data-question=\"q9\"></span>\n</div>\n<div class=\"match-row\">\n<span class=\"label\"><a id=\"q10-anchor\"></a>23 One gender does not seem to pause to consider before taking action.</span> <span class=\"match-dropzone\" data-question=\"q10\"></span>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -53,7 +53,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 24–26</h4>\n      <p>Complete the summary below.</p>\n      <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n      \n      <h3>Super-taskers</h3>\n      <p>Super-taskers are those of us who possess special multi-tasking ability. They can be found in all professions. People who are pilots, chefs and doctors are often super-taskers, and super-taskers are most likely to achieve a <a id=\"q11-anchor\"></a><strong>24</strong> <input class=\"blank\" type=\"text\" name=\"q11\"> that is high on the career ladder.</p>\n      \n      <p>Super-taskers typically have to undertake many tasks simultaneously that need their <a id=\"q12-anchor\"></a><strong>25</strong> <input class=\"blank\" type=\"text\" name=\"q12\">.</p>\n      \n      <p>Genes play an important role in having this capability: these people have a special brain <a id=\"q13-anchor\"></a><strong>26</strong> <input class=\"blank\" type=\"text\" name=\"q13\">, which helps them do what we cannot.</p>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 24–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<h3>Super-taskers</h3>\n<p>Super-taskers are those of us who possess special multi-tasking ability. They can be found in all professions. People who are pilots, chefs and doctors are often super-taskers, and super-taskers are most likely to achieve a <a id=\"q11-anchor\"></a><strong>24</strong> <input class=\"blank\" type=\"text\" name=\"q11\"> that is high on the career ladder.</p>\n<p>Super-taskers typically have to undertake many tasks simultaneously that need their <a id=\"q12-anchor\"></a><strong>25</strong> <input class=\"blank\" type=\"text\" name=\"q12\">.</p>\n<p>Genes play an important role in having this capability: these people have a special brain <a id=\"q13-anchor\"></a><strong>26</strong> <input class=\"blank\" type=\"text\" name=\"q13\">, which helps them do what we cannot.</p>\n</div>"
     }
   ],
   "answerKey": {
@@ -11,7 +11,7 @@
       {
         "blockId": "passage-main",
         "kind": "text",
-        "bodyHtml": "<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n    \n    <h3>The dingo debate</h3>\n    <p><em>Graziers see them as pests, and poisoning is common, but some biologists think Australia’s dingoes are the best weapon in a war against imported cats and foxes.</em></p>\n    \n    <span class=\"paragraph-label\">A</span>\n    <p>A plane flies a slow pattern over Carlton Hill station, a 3,600 square kilometre ranch in the Kimberley region in northwest Australia. As the plane circles, those aboard drop 1,000 small pieces of meat, one by one, onto the scrubland below, each piece laced with poison; this practice is known as baiting.</p>\n    <p>Besides 50,000 head of cattle, Carlton Hill is home to the dingo, Australia’s largest mammalian predator and the bane of a grazier’s (cattle farmer’s) life. Stuart McKechnie, manager of Carlton Hill, complains that graziers’ livelihoods are threatened when dingoes prey on cattle. But one man wants the baiting to end, and for dingoes to once again roam Australia’s wide-open spaces. According to Chris Johnson of James Cook University, \"Australia needs more dingoes to protect our biodiversity.\"</p>\n    \n    <span class=\"paragraph-label\">B</span>\n    <p>About 4,000 years ago, Asian sailors introduced dingoes to Australia. Throughout the ensuing millennia, these descendants of the wolf spread across the continent and, as the Tasmanian tiger disappeared completely from Australia, dingoes became Australia’s top predators. As agricultural development took place, the European settlers found that they could not safely keep their livestock where dingoes roamed. So began one of the most sustained efforts at pest control in Australia’s history. Over the last 150 years, dingoes have been shot and poisoned, and fences have been used in an attempt to keep them away from livestock. But at the same time, as the European settlers tried to eliminate one native pest from Australia, they introduced more of their own.</p>\n    \n    <span class=\"paragraph-label\">C</span>\n    <p>In 1860, the rabbit was unleashed on Australia by a wealthy landowner and by 1980 rabbits had covered most of the mainland. Rabbits provide huge prey base for two other introduced species: the feral (wild) cat and the red fox.</p>\n    <p>The interaction between foxes, cats and rabbits is a huge problem for native mammals. In good years, rabbit numbers increase dramatically, and fox and cat populations grow quickly in response to the abundance of this prey. When bad seasons follow, rabbit numbers are significantly reduced – and the dwindling but still large fox and cat populations are left with little to eat besides native mammals.</p>\n    \n    <span class=\"paragraph-label\">D</span>\n    <p>Australian mammals generally reproduce much more slowly than rabbits, cats and foxes – an adoption to prevent overpopulation in the arid environment, where food can be scarce and unreliable – and populations decline because they can’t grow fast enough to replace animals killed by the predators. Johnson says dingoes are the solution to this problem because they keep cat and fox populations under control. Besides regularly eating the smaller predators, dingoes will kill them simply to lessen competition.</p>\n    <p>Dingo packs live in large, stable territories and generally have only one fertile female, which limits their rate of increase. In the 4,000 years that dingoes have been Australia, they have contributed to few, if any, extinctions, Johnson says.</p>\n    \n    <span class=\"paragraph-label\">E</span>\n    <p>Reaching out from a desolate spot where three states meet, for 2,500 km in either direction, is the world’s longest fence, two meters high and stretching from the coast in Queensland to the Great Australian Bight in South Australia; it is there to keep dingoes out of southeast, the fence separates the main types of livestock found in Australia. To the northwest of the fence, cattle predominate; to the southwest, sheep fill the landscape. In fact, Australia is a land dominated by these animals – 25 million cattle, 100 million sheep and just over 20 million people.</p>\n    \n    <span class=\"paragraph-label\">F</span>\n    <p>While there is no argument that dingoes will prey on sheep if given the chance, they don't hunt cattle once the calves are much past two or three weeks old, according to McKechnie. And a study in Queensland suggests that dingoes don't even prey heavily on the newborn calves unless their staple prey disappears due to deteriorating conditions like drought.</p>\n    <p>This study, co-authored by Lee Allen of the Robert Wicks Research Centre in Queensland, suggests that the aggressive baiting programs used against dingoes may actually be counter-productive for graziers. When dingoes are removed from an area by baiting, the area is recolonized by younger, more solitary dingoes. These animals aren't capable of going after large prey like kangaroos, so they turn to calves. In their study, some of the highest rates of calf predation occurred in areas that had been baited.</p>\n    \n    <span class=\"paragraph-label\">G</span>\n    <p>Mark Clifford, general manager of a firm that manages over 200,000 head of cattle, is not convinced by Allen's assertion. Clifford says, \"It's obvious if we drop or loosen control on dingoes, we are going to lose more calves.\" He doesn't believe that dingoes will go after kangaroos when calves are around. Nor is he persuaded of dingoes' supposed ecological benefits, saying he is not convinced that they manage to catch cats that often, believing they are more likely to catch small native animals instead.</p>\n    \n    <span class=\"paragraph-label\">H</span>\n    <p>McKechnie agrees that dingoes kill the wallabies (small native animals) that compete with his cattle for food, but points out that in parts of Western Australia, there are no foxes, and not very many cats. He doesn't see how relaxing controls on dingoes in his area will improve the ecological balance.</p>\n    <p>Johnson sees a need for a change in philosophy on the part of graziers. \"There might be a number of different ways of thinking through dingo management in cattle country,\" he says. \"At the moment, though, that hasn't got through to graziers. There's still just one prescription, and that is to bait as widely as possible.\"</p>\n  </section>\n  \n  <div id=\"divider\" title=\"Drag to resize\"></div>"
+        "bodyHtml": "<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>The dingo debate</h3>\n<p><em>Graziers see them as pests, and poisoning is common, but some biologists think Australia’s dingoes are the best weapon in a war against imported cats and foxes.</em></p>\n<span class=\"paragraph-label\">A</span>\n<p>A plane flies a slow pattern over Carlton Hill station, a 3,600 square kilometre ranch in the Kimberley region in northwest Australia. As the plane circles, those aboard drop 1,000 small pieces of meat, one by one, onto the scrubland below, each piece laced with poison; this practice is known as baiting.</p>\n<p>Besides 50,000 head of cattle, Carlton Hill is home to the dingo, Australia’s largest mammalian predator and the bane of a grazier’s (cattle farmer’s) life. Stuart McKechnie, manager of Carlton Hill, complains that graziers’ livelihoods are threatened when dingoes prey on cattle. But one man wants the baiting to end, and for dingoes to once again roam Australia’s wide-open spaces. According to Chris Johnson of James Cook University, \"Australia needs more dingoes to protect our biodiversity.\"</p>\n<span class=\"paragraph-label\">B</span>\n<p>About 4,000 years ago, Asian sailors introduced dingoes to Australia. Throughout the ensuing millennia, these descendants of the wolf spread across the continent and, as the Tasmanian tiger disappeared completely from Australia, dingoes became Australia’s top predators. As agricultural development took place, the European settlers found that they could not safely keep their livestock where dingoes roamed. So began one of the most sustained efforts at pest control in Australia’s history. Over the last 150 years, dingoes have been shot and poisoned, and fences have been used in an attempt to keep them away from livestock. But at the same time, as the European settlers tried to eliminate one native pest from Australia, they introduced more of their own.</p>\n<span class=\"paragraph-label\">C</span>\n<p>In 1860, the rabbit was unleashed on Australia by a wealthy landowner and by 1980 rabbits had covered most of the mainland. Rabbits provide huge prey base for two other introduced species: the feral (wild) cat and the red fox.</p>\n<p>The interaction between foxes, cats and rabbits is a huge problem for native mammals. In good years, rabbit numbers increase dramatically, and fox and cat populations grow quickly in response to the abundance of this prey. When bad seasons follow, rabbit numbers are significantly reduced – and the dwindling but still large fox and cat populations are left with little to eat besides native mammals.</p>\n<span class=\"paragraph-label\">D</span>\n<p>Australian mammals generally reproduce much more slowly than rabbits, cats and foxes – an adoption to prevent overpopulation in the arid environment, where food can be scarce and unreliable – and populations decline because they can’t grow fast enough to replace animals killed by the predators. Johnson says dingoes are the solution to this problem because they keep cat and fox populations under control. Besides regularly eating the smaller predators, dingoes will kill them simply to lessen competition.</p>\n<p>Dingo packs live in large, stable territories and generally have only one fertile female, which limits their rate of increase. In the 4,000 years that dingoes have been Australia, they have contributed to few, if any, extinctions, Johnson says.</p>\n<span class=\"paragraph-label\">E</span>\n<p>Reaching out from a desolate spot where three states meet, for 2,500 km in either direction, is the world’s longest fence, two meters high and stretching from the coast in Queensland to the Great Australian Bight in South Australia; it is there to keep dingoes out of southeast, the fence separates the main types of livestock found in Australia. To the northwest of the fence, cattle predominate; to the southwest, sheep fill the landscape. In fact, Australia is a land dominated by these animals – 25 million cattle, 100 million sheep and just over 20 million people.</p>\n<span class=\"paragraph-label\">F</span>\n<p>While there is no argument that dingoes will prey on sheep if given the chance, they don't hunt cattle once the calves are much past two or three weeks old, according to McKechnie. And a study in Queensland suggests that dingoes don't even prey heavily on the newborn calves unless their staple prey disappears due to deteriorating conditions like drought.</p>\n<p>This study, co-authored by Lee Allen of the Robert Wicks Research Centre in Queensland, suggests that the aggressive baiting programs used against dingoes may actually be counter-productive for graziers. When dingoes are removed from an area by baiting, the area is recolonized by younger, more solitary dingoes. These animals aren't capable of going after large prey like kangaroos, so they turn to calves. In their study, some of the highest rates of calf predation occurred in areas that had been baited.</p>\n<span class=\"paragraph-label\">G</span>\n<p>Mark Clifford, general manager of a firm that manages over 200,000 head of cattle, is not convinced by Allen's assertion. Clifford says, \"It's obvious if we drop or loosen control on dingoes, we are going to lose more calves.\" He doesn't believe that dingoes will go after kangaroos when calves are around. Nor is he persuaded of dingoes' supposed ecological benefits, saying he is not convinced that they manage to catch cats that often, believing they are more likely to catch small native animals instead.</p>\n<span class=\"paragraph-label\">H</span>\n<p>McKechnie agrees that dingoes kill the wallabies (small native animals) that compete with his cattle for food, but points out that in parts of Western Australia, there are no foxes, and not very many cats. He doesn't see how relaxing controls on dingoes in his area will improve the ecological balance.</p>\n<p>Johnson sees a need for a change in philosophy on the part of graziers. \"There might be a number of different ways of thinking through dingo management in cattle country,\" he says. \"At the moment, though, that hasn't got through to graziers. There's still just one prescription, and that is to bait as widely as possible.\"</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"
       }
     ]
   },
@@ -28,7 +28,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 14-20</h4>\n      <p>Reading Passage has eight sections, A-H.</p>\n      <p>Which section contains the following information?</p>\n      <p>Write the correct letter, A-H, in boxes 14-20 on your answer sheet.</p>\n      <p><strong>NB You may use any letter more than once.</strong></p>\n      \n      <a id=\"q1-anchor\"></a>\n      <div id=\"q1-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <span class=\"question-number\">14.</span> a description of a barrier designed to stop dingoes, which also divides two kinds of non-native animals\n        <div class=\"heading-options\">\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q1\" value=\"A\"> A</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q1\" value=\"B\"> B</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q1\" value=\"C\"> C</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q1\" value=\"D\"> D</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q1\" value=\"E\"> E</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q1\" value=\"F\"> F</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q1\" value=\"G\"> G</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q1\" value=\"H\"> H</div>\n        </div>\n      </div>\n      \n      <a id=\"q2-anchor\"></a>\n      <div id=\"q2-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <span class=\"question-number\">15.</span> how dingoes ensure that rival species do not dominate\n        <div class=\"heading-options\">\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q2\" value=\"A\"> A</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q2\" value=\"B\"> B</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q2\" value=\"C\"> C</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q2\" value=\"D\"> D</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q2\" value=\"E\"> E</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q2\" value=\"F\"> F</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q2\" value=\"G\"> G</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q2\" value=\"H\"> H</div>\n        </div>\n      </div>\n      \n      <a id=\"q3-anchor\"></a>\n      <div id=\"q3-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <span class=\"question-number\">16.</span> a reference to a widespread non-native species that other animals feed on\n        <div class=\"heading-options\">\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q3\" value=\"A\"> A</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q3\" value=\"B\"> B</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q3\" value=\"C\"> C</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q3\" value=\"D\"> D</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q3\" value=\"E\"> E</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q3\" value=\"F\"> F</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q3\" value=\"G\"> G</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q3\" value=\"H\"> H</div>\n        </div>\n      </div>\n      \n      <a id=\"q4-anchor\"></a>\n      <div id=\"q4-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <span class=\"question-number\">17.</span> a mention of the dingo's arrival in Australia\n        <div class=\"heading-options\">\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q4\" value=\"A\"> A</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q4\" value=\"B\"> B</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q4\" value=\"C\"> C</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q4\" value=\"D\"> D</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q4\" value=\"E\"> E</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q4\" value=\"F\"> F</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q4\" value=\"G\"> G</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q4\" value=\"H\"> H</div>\n        </div>\n      </div>\n      \n      <a id=\"q5-anchor\"></a>\n      <div id=\"q5-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <span class=\"question-number\">18.</span> research which has proved that dingoes have resorted to eating young livestock\n        <div class=\"heading-options\">\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q5\" value=\"A\"> A</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q5\" value=\"B\"> B</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q5\" value=\"C\"> C</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q5\" value=\"D\"> D</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q5\" value=\"E\"> E</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q5\" value=\"F\"> F</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q5\" value=\"G\"> G</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q5\" value=\"H\"> H</div>\n        </div>\n      </div>\n      \n      <a id=\"q6-anchor\"></a>\n      <div id=\"q6-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <span class=\"question-number\">19.</span> a description of a method used to kill dingoes\n        <div class=\"heading-options\">\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q6\" value=\"A\"> A</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q6\" value=\"B\"> B</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q6\" value=\"C\"> C</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q6\" value=\"D\"> D</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q6\" value=\"E\"> E</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q6\" value=\"F\"> F</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q6\" value=\"G\"> G</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q6\" value=\"H\"> H</div>\n        </div>\n      </div>\n      \n      <a id=\"q7-anchor\"></a>\n      <div id=\"q7-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <span class=\"question-number\">20.</span> the way that the structure of dingo groups affects how quickly their numbers grow\n        <div class=\"heading-options\">\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q7\" value=\"A\"> A</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q7\" value=\"B\"> B</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q7\" value=\"C\"> C</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q7\" value=\"D\"> D</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q7\" value=\"E\"> E</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q7\" value=\"F\"> F</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q7\" value=\"G\"> G</div>\n          <div class=\"heading-option\"><input type=\"radio\" name=\"q7\" value=\"H\"> H</div>\n        </div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 14-20</h4>\n<p>Reading Passage has eight sections, A-H.</p>\n<p>Which section contains the following information?</p>\n<p>Write the correct letter, A-H, in boxes 14-20 on your answer sheet.</p>\n<p><strong>NB You may use any letter more than once.</strong></p>\n<a id=\"q1-anchor\"></a>\n<div id=\"q1-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<span class=\"question-number\">14.</span> a description of a barrier designed to stop dingoes, which also divides two kinds of non-native animals\n<div class=\"heading-options\">\n<div class=\"heading-option\"><input type=\"radio\" name=\"q1\" value=\"A\"> A</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q1\" value=\"B\"> B</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q1\" value=\"C\"> C</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q1\" value=\"D\"> D</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q1\" value=\"E\"> E</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q1\" value=\"F\"> F</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q1\" value=\"G\"> G</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q1\" value=\"H\"> H</div>\n</div>\n</div>\n<a id=\"q2-anchor\"></a>\n<div id=\"q2-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<span class=\"question-number\">15.</span> how dingoes ensure that rival species do not dominate\n<div class=\"heading-options\">\n<div class=\"heading-option\"><input type=\"radio\" name=\"q2\" value=\"A\"> A</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q2\" value=\"B\"> B</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q2\" value=\"C\"> C</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q2\" value=\"D\"> D</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q2\" value=\"E\"> E</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q2\" value=\"F\"> F</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q2\" value=\"G\"> G</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q2\" value=\"H\"> H</div>\n</div>\n</div>\n<a id=\"q3-anchor\"></a>\n<div id=\"q3-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<span class=\"question-number\">16.</span> a reference to a widespread non-native species that other animals feed on\n<div class=\"heading-options\">\n<div class=\"heading-option\"><input type=\"radio\" name=\"q3\" value=\"A\"> A</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q3\" value=\"B\"> B</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q3\" value=\"C\"> C</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q3\" value=\"D\"> D</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q3\" value=\"E\"> E</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q3\" value=\"F\"> F</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q3\" value=\"G\"> G</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q3\" value=\"H\"> H</div>\n</div>\n</div>\n<a id=\"q4-anchor\"></a>\n<div id=\"q4-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<span class=\"question-number\">17.</span> a mention of the dingo's arrival in Australia\n<div class=\"heading-options\">\n<div class=\"heading-option\"><input type=\"radio\" name=\"q4\" value=\"A\"> A</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q4\" value=\"B\"> B</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q4\" value=\"C\"> C</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q4\" value=\"D\"> D</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q4\" value=\"E\"> E</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q4\" value=\"F\"> F</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q4\" value=\"G\"> G</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q4\" value=\"H\"> H</div>\n</div>\n</div>\n<a id=\"q5-anchor\"></a>\n<div id=\"q5-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<span class=\"question-number\">18.</span> research which has proved that dingoes have resorted to eating young livestock\n<div class=\"heading-options\">\n<div class=\"heading-option\"><input type=\"radio\" name=\"q5\" value=\"A\"> A</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q5\" value=\"B\"> B</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q5\" value=\"C\"> C</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q5\" value=\"D\"> D</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q5\" value=\"E\"> E</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q5\" value=\"F\"> F</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q5\" value=\"G\"> G</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q5\" value=\"H\"> H</div>\n</div>\n</div>\n<a id=\"q6-anchor\"></a>\n<div id=\"q6-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<span class=\"question-number\">19.</span> a description of a method used to kill dingoes\n<div class=\"heading-options\">\n<div class=\"heading-option\"><input type=\"radio\" name=\"q6\" value=\"A\"> A</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q6\" value=\"B\"> B</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q6\" value=\"C\"> C</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q6\" value=\"D\"> D</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q6\" value=\"E\"> E</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q6\" value=\"F\"> F</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q6\" value=\"G\"> G</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q6\" value=\"H\"> H</div>\n</div>\n</div>\n<a id=\"q7-anchor\"></a>\n<div id=\"q7-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<span class=\"question-number\">20.</span> the way that the structure of dingo groups affects how quickly their numbers grow\n<div class=\"heading-options\">\n<div class=\"heading-option\"><input type=\"radio\" name=\"q7\" value=\"A\"> A</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q7\" value=\"B\"> B</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q7\" value=\"C\"> C</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q7\" value=\"D\"> D</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q7\" value=\"E\"> E</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q7\" value=\"F\"> F</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q7\" value=\"G\"> G</div>\n<div class=\"heading-option\"><input type=\"radio\" name=\"q7\" value=\"H\"> H</div>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -38,7 +38,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 21-23</h4>\n      <p>Look at the following statements (Questions 21-23) and the list of people below.</p>\n      <p>Match each statement with the correct person, A, B, C or D.</p>\n      <p>Write the correct letter, A, B, C or D, in boxes 21-23 on your answer sheet.</p>\n      \n      <p><strong>21</strong> Dingoes tend to hunt native animals rather than hunting other non-native predators.</p>\n      <p><strong>22</strong> The presence of dingoes puts the income of some people at risk.</p>\n      <p><strong>23</strong> Dingoes have had little impact on the dying out of animal species in Australia.</p>\n      \n      <p><strong>List of People</strong></p>\n      <ul>\n        <li>A Stuart McKechnie</li>\n        <li>B Chris Johnson</li>\n        <li>C Lee Allen</li>\n        <li>D Mark Clifford</li>\n      </ul>\n      \n      <a id=\"q8-anchor\"></a>\n      <div id=\"q8-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <span class=\"question-number\">21.</span> Dingoes tend to hunt native animals rather than hunting other non-native predators.\n        <div class=\"researcher-option\">\n          <label><input name=\"q8\" type=\"radio\" value=\"A\"> A</label>\n          <label><input name=\"q8\" type=\"radio\" value=\"B\"> B</label>\n          <label><input name=\"q8\" type=\"radio\" value=\"C\"> C</label>\n          <label><input name=\"q8\" type=\"radio\" value=\"D\"> D</label>\n        </div>\n      </div>\n      \n      <a id=\"q9-anchor\"></a>\n      <div id=\"q9-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <span class=\"question-number\">22.</span> The presence of dingoes puts the income of some people at risk.\n        <div class=\"researcher-option\">\n          <label><input name=\"q9\" type=\"radio\" value=\"A\"> A</label>\n          <label><input name=\"q9\" type=\"radio\" value=\"B\"> B</label>\n          <label><input name=\"q9\" type=\"radio\" value=\"C\"> C</label>\n          <label><input name=\"q9\" type=\"radio\" value=\"D\"> D</label>\n        </div>\n      </div>\n      \n      <a id=\"q10-anchor\"></a>\n      <div id=\"q10-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <span class=\"question-number\">23.</span> Dingoes have had little impact on the dying out of animal species in Australia.\n        <div class=\"researcher-option\">\n          <label><input name=\"q10\" type=\"radio\" value=\"A\"> A</label>\n          <label><input name=\"q10\" type=\"radio\" value=\"B\"> B</label>\n          <label><input name=\"q10\" type=\"radio\" value=\"C\"> C</label>\n          <label><input name=\"q10\" type=\"radio\" value=\"D\"> D</label>\n        </div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 21-23</h4>\n<p>Look at the following statements (Questions 21-23) and the list of people below.</p>\n<p>Match each statement with the correct person, A, B, C or D.</p>\n<p>Write the correct letter, A, B, C or D, in boxes 21-23 on your answer sheet.</p>\n<p><strong>21</strong> Dingoes tend to hunt native animals rather than hunting other non-native predators.</p>\n<p><strong>22</strong> The presence of dingoes puts the income of some people at risk.</p>\n<p><strong>23</strong> Dingoes have had little impact on the dying out of animal species in Australia.</p>\n<p><strong>List of People</strong></p>\n<ul>\n<li>A Stuart McKechnie</li>\n<li>B Chris Johnson</li>\n<li>C Lee Allen</li>\n<li>D Mark Clifford</li>\n</ul>\n<a id=\"q8-anchor\"></a>\n<div id=\"q8-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<span class=\"question-number\">21.</span> Dingoes tend to hunt native animals rather than hunting other non-native predators.\n<div class=\"researcher-option\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q8\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q8\" type=\"radio\" value=\"C\"> C</label> <label><input name=\"q8\" type=\"radio\" value=\"D\"> D</label>\n</div>\n</div>\n<a id=\"q9-anchor\"></a>\n<div id=\"q9-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<span class=\"question-number\">22.</span> The presence of dingoes puts the income of some people at risk.\n<div class=\"researcher-option\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q9\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q9\" type=\"radio\" value=\"C\"> C</label> <label><input name=\"q9\" type=\"radio\" value=\"D\"> D</label>\n</div>\n</div>\n<a id=\"q10-anchor\"></a>\n<div id=\"q10-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<span class=\"question-number\">23.</span> Dingoes have had little impact on the dying out of animal species in Australia.\n<div class=\"researcher-option\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q10\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q10\" type=\"radio\" value=\"C\"> C</label> <label><input name=\"q10\" type=\"radio\" value=\"D\"> D</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -48,7 +48,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 24-26</h4>\n      <p>Complete the sentences below.</p>\n      <p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n      <p>Write your answers in boxes 24-26 on your answer sheet.</p>\n      \n      <a id=\"q11-anchor\"></a>\n      <div id=\"q11-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <span class=\"question-number\">24.</span> The dingo replaced the <input type=\"text\" class=\"blank\" id=\"q11\" name=\"q11\"> as the main predatory animal in Australia.\n      </div>\n      \n      <a id=\"q12-anchor\"></a>\n      <div id=\"q12-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <span class=\"question-number\">25.</span> Foxes and cats are more likely to hunt native animals when there are fewer <input type=\"text\" class=\"blank\" id=\"q12\" name=\"q12\">.\n      </div>\n      \n      <a id=\"q13-anchor\"></a>\n      <div id=\"q13-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <span class=\"question-number\">26.</span> Australian animals reproduce at a slow rate as a natural way of avoiding <input type=\"text\" class=\"blank\" id=\"q13\" name=\"q13\">.\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 24-26</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<p>Write your answers in boxes 24-26 on your answer sheet.</p>\n<a id=\"q11-anchor\"></a>\n<div id=\"q11-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<span class=\"question-number\">24.</span> The dingo replaced the <input type=\"text\" class=\"blank\" id=\"q11\" name=\"q11\"> as the main predatory animal in Australia.\n</div>\n<a id=\"q12-anchor\"></a>\n<div id=\"q12-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<span class=\"question-number\">25.</span> Foxes and cats are more likely to hunt native animals when there are fewer <input type=\"text\" class=\"blank\" id=\"q12\" name=\"q12\">.\n</div>\n<a id=\"q13-anchor\"></a>\n<div id=\"q13-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<span class=\"question-number\">26.</span> Australian animals reproduce at a slow rate as a natural way of avoiding <input type=\"text\" class=\"blank\" id=\"q13\" name=\"q13\">.\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 2</h2>\n            <p>You should spend about 20 minutes on Questions 14–29, which are based on Reading Passage 2 below.</p>\n            \n            <h3>How the Petri dish supports scientific advances</h3>\n            <h5>A simple piece of scientific equipment is helping research in three institutions in Cambridge, UK</h5>\n            \n            <p><strong>A</strong> Petri dishes, invented by German microbiologist Julius Richard Petri in 1887, rarely receive the appreciation or attention that their more complex lab companions like the microscope enjoy. They are simple, utilitarian little things, and it's understandable that some people see them as just shallow dishes with lids. But Petri dishes deserve celebrating; they are still at the forefront of scientific discovery.</p>\n            <p><strong>B</strong> The invention of the Petri dish, and the advances it has helped to create, are part of a bigger whole, of course – the development of glass scientific instruments, from microscope lenses to laboratory beakers. In <em>The Glass Bathyscaphe: How Glass Changed the World</em>, Alan Macfarlane argues that without glass, the Renaissance and the scientific revolution would never have happened. Around 70 per cent of what we know about the world comes in through our eyes, Macfarlane points out, and glass instruments enabled us to see better. Until about 1400, knowledge was based on what people had been told in the past. ‘Glass allowed the growth of the experimental method. Don't trust what you are being told: see it for yourself. It was transformational,’ he says.</p>\n            <p><strong>C</strong> At the Wellcome-MRC Cambridge Stem Cell Institute, Professor Ludovic Vallier says that his first encounter with a Petri dish was a classic example of understanding the world in this way: students used the dishes to see which bacteria could grow in the presence of antibiotics. ‘It's good to see things grow,’ he says. ‘It is a fascinating experience. Now, we grow cells in the Petri dish, and we don't use glass any more, but plastic.’ Today, his team focuses on stem cells, which have the capacity to become any cell type in the human body: neurons, skin cells, liver cells, and so on. Vallier and his colleagues study them in order to understand how they do this, and how they can produce more cells. And to study them, they need to grow them. ‘We put the stem cells on the dish and then we feed them and they grow,’ he says. ‘And then ... we divide them and distribute them in new Petri dishes, and we grow them again. We feed them on a liquid medium that is basically food for cells: it tells them to grow and also what to do, as we want to produce new cells. So by feeding them this medium we can allow the cells to become neurons, cardiac cells, liver cells, and so on. We can then model disease in a dish, or produce cells for regenerative-medicine applications.’ This means that the Petri dish becomes a place where Vallier and his team can study what happens to those cells when disease strikes. ‘We work a lot on fatty-liver diseases, and in this case the liver cell in the dish becomes full of fat, which we can see ... We can't look inside a patient's liver to see what's happening. So we are reproducing those diseases in our dishes.’</p>\n            <p><strong>D</strong> ‘Disease in a dish’ is also the focus of Dr Meritxell Huch's team at the Gurdon Institute. They use between 50 and 150 Petri dishes every day to grow mouse liver and human liver cells, in order to study how the liver can regenerate itself. Huch's team is examining the molecular mechanisms by which these cells decide to multiply. She says: ‘You can divide regeneration into different phases. The cells first have to realise that there is damage and activate the response. Once they activate the response, the cells will proliferate to compensate for the loss of cells owing to the damage. And once they have proliferated, they then become functional cells.’</p>\n            <p><strong>E</strong> In the MRC Laboratory of Molecular Biology, Dr Madeline Lancaster and her team grow ‘mini-brains’ in hundreds of Petri dishes. Here, the dish has been specially treated to stop cells sticking to it and to encourage them to float freely. Dr Lancaster explains that they want the cells to develop in three, rather than two, dimensions as that's the way our brains are. ‘If you can grow neurons in a dish in two dimensions, you can see individual neurons and see what they do, but you won't be able to understand the architecture of those cells – their positioning relative to one another.’ She says that this new method gives you a structure that looks a lot more like that of an actual developing brain.</p>\n            <p><strong>F</strong> The aim of this research is to look at exactly how neurons are made and how that differs in humans compared with other species. One day, says Lancaster, this work could translate into understanding far more about Alzheimer's disease, Parkinson's and schizophrenia. So in a world of cutting-edge and highly complex technology, Petri dishes, in their relative simplicity, remain a vital weapon in the fight against the world's most serious diseases. And they also enable a hands-on approach that she finds satisfying. ‘It's a bit like gardening,’ she says. ‘You're taking care of this thing. You keep an eye on it and you check it every day. You change the media this day or that day to help it grow better. It's rewarding to see something grow before your eyes. There's something about the interplay between new, next-generation and classic technologies. They give you capabilities that were not possible before.’</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–29, which are based on Reading Passage 2 below.</p>\n<h3>How the Petri dish supports scientific advances</h3>\n<h5>A simple piece of scientific equipment is helping research in three institutions in Cambridge, UK</h5>\n<p><strong>A</strong> Petri dishes, invented by German microbiologist Julius Richard Petri in 1887, rarely receive the appreciation or attention that their more complex lab companions like the microscope enjoy. They are simple, utilitarian little things, and it's understandable that some people see them as just shallow dishes with lids. But Petri dishes deserve celebrating; they are still at the forefront of scientific discovery.</p>\n<p><strong>B</strong> The invention of the Petri dish, and the advances it has helped to create, are part of a bigger whole, of course – the development of glass scientific instruments, from microscope lenses to laboratory beakers. In <em>The Glass Bathyscaphe: How Glass Changed the World</em>, Alan Macfarlane argues that without glass, the Renaissance and the scientific revolution would never have happened. Around 70 per cent of what we know about the world comes in through our eyes, Macfarlane points out, and glass instruments enabled us to see better. Until about 1400, knowledge was based on what people had been told in the past. ‘Glass allowed the growth of the experimental method. Don't trust what you are being told: see it for yourself. It was transformational,’ he says.</p>\n<p><strong>C</strong> At the Wellcome-MRC Cambridge Stem Cell Institute, Professor Ludovic Vallier says that his first encounter with a Petri dish was a classic example of understanding the world in this way: students used the dishes to see which bacteria could grow in the presence of antibiotics. ‘It's good to see things grow,’ he says. ‘It is a fascinating experience. Now, we grow cells in the Petri dish, and we don't use glass any more, but plastic.’ Today, his team focuses on stem cells, which have the capacity to become any cell type in the human body: neurons, skin cells, liver cells, and so on. Vallier and his colleagues study them in order to understand how they do this, and how they can produce more cells. And to study them, they need to grow them. ‘We put the stem cells on the dish and then we feed them and they grow,’ he says. ‘And then ... we divide them and distribute them in new Petri dishes, and we grow them again. We feed them on a liquid medium that is basically food for cells: it tells them to grow and also what to do, as we want to produce new cells. So by feeding them this medium we can allow the cells to become neurons, cardiac cells, liver cells, and so on. We can then model disease in a dish, or produce cells for regenerative-medicine applications.’ This means that the Petri dish becomes a place where Vallier and his team can study what happens to those cells when disease strikes. ‘We work a lot on fatty-liver diseases, and in this case the liver cell in the dish becomes full of fat, which we can see ... We can't look inside a patient's liver to see what's happening. So we are reproducing those diseases in our dishes.’</p>\n<p><strong>D</strong> ‘Disease in a dish’ is also the focus of Dr Meritxell Huch's team at the Gurdon Institute. They use between 50 and 150 Petri dishes every day to grow mouse liver and human liver cells, in order to study how the liver can regenerate itself. Huch's team is examining the molecular mechanisms by which these cells decide to multiply. She says: ‘You can divide regeneration into different phases. The cells first have to realise that there is damage and activate the response. Once they activate the response, the cells will proliferate to compensate for the loss of cells owing to the damage. And once they have proliferated, they then become functional cells.’</p>\n<p><strong>E</strong> In the MRC Laboratory of Molecular Biology, Dr Madeline Lancaster and her team grow ‘mini-brains’ in hundreds of Petri dishes. Here, the dish has been specially treated to stop cells sticking to it and to encourage them to float freely. Dr Lancaster explains that they want the cells to develop in three, rather than two, dimensions as that's the way our brains are. ‘If you can grow neurons in a dish in two dimensions, you can see individual neurons and see what they do, but you won't be able to understand the architecture of those cells – their positioning relative to one another.’ She says that this new method gives you a structure that looks a lot more like that of an actual developing brain.</p>\n<p><strong>F</strong> The aim of this research is to look at exactly how neurons are made and how that differs in humans compared with other species. One day, says Lancaster, this work could translate into understanding far more about Alzheimer's disease, Parkinson's and schizophrenia. So in a world of cutting-edge and highly complex technology, Petri dishes, in their relative simplicity, remain a vital weapon in the fight against the world's most serious diseases. And they also enable a hands-on approach that she finds satisfying. ‘It's a bit like gardening,’ she says. ‘You're taking care of this thing. You keep an eye on it and you check it every day. You change the media this day or that day to help it grow better. It's rewarding to see something grow before your eyes. There's something about the interplay between new, next-generation and classic technologies. They give you capabilities that were not possible before.’</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -39,7 +39,7 @@
         "q15",
         "q16"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                 <h4>Questions 14–19</h4>\n                <p>Reading Passage 2 has six sections, <strong>A–F</strong>.</p>\n                <p>Which section contains the following information?</p>\n                <p><em>Write the correct letter, A–F, in the boxes for 14-19.</em></p>\n                <p><strong>NB</strong> You may use any letter more than once.</p>\n\n                <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                        <thead>\n                            <tr>\n                                <th style=\"min-width: 250px;\"></th>\n                                <th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>14</strong> a description of an experiment involving both human and non-human cells of a specific type</td>\n                                <td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>15</strong> possibilities for improved research into various medical conditions</td>\n                                <td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>16</strong> contrasting views of the importance of the Petri dish</td>\n                                <td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>17</strong> a change remarked on by one scientist in the material used for the Petri dish</td>\n                                <td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>18</strong> a claim that the Petri dish enables a scientist to monitor the progress of an experiment on a regular basis</td>\n                                <td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>19</strong> a reference to the importance of a material for different types of laboratory equipment</td>\n                                <td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td>\n                            </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has six sections, <strong>A–F</strong>.</p>\n<p>Which section contains the following information?</p>\n<p><em>Write the correct letter, A–F, in the boxes for 14-19.</em></p>\n<p><strong>NB</strong> You may use any letter more than once.</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 250px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> a description of an experiment involving both human and non-human cells of a specific type</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> possibilities for improved research into various medical conditions</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> contrasting views of the importance of the Petri dish</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> a change remarked on by one scientist in the material used for the Petri dish</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>18</strong> a claim that the Petri dish enables a scientist to monitor the progress of an experiment on a regular basis</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>19</strong> a reference to the importance of a material for different types of laboratory equipment</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -53,7 +53,7 @@
         "q11",
         "q12"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-11-12-anchor\">\n                <h4>Questions 20–25</h4>\n                <p>Look at the following statements (Questions 20–25) and the list of people below.</p>\n                <p>Match each statement with the correct person, <strong>A, B, C or D</strong>.</p>\n                \n                <div class=\"match-question-item\">\n                    <p><strong>20</strong> To deal with the injury, cells must go through a series of activities in a particular order.</p>\n                    <div class=\"match-dropzone\" data-question=\"q7\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>21</strong> One technological development formed the basis of all modern scientific research.</p>\n                    <div class=\"match-dropzone\" data-question=\"q8\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                     <p><strong>22</strong> A modification to the Petri dish allows experiments to provide more accurate information.</p>\n                    <div class=\"match-dropzone\" data-question=\"q9\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>23</strong> Petri dishes allow observation of medical conditions that are normally impossible to observe.</p>\n                    <div class=\"match-dropzone\" data-question=\"q10\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>24</strong> Visual evidence is a very important requirement for the provision of reliable information.</p>\n                    <div class=\"match-dropzone\" data-question=\"q11\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                    <p><strong>25</strong> Petri dishes can be used to help produce a range of new cells of many different kinds.</p>\n                    <div class=\"match-dropzone\" data-question=\"q12\"></div>\n                </div>\n\n                <div class=\"options-pool\" id=\"researcher-options-pool\">\n                    <strong>List of People</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" id=\"researcher-A\" draggable=\"true\" data-option=\"A\">A Alan Macfarlane</div>\n                        <div class=\"drag-item\" id=\"researcher-B\" draggable=\"true\" data-option=\"B\">B Professor Ludovic Vallier</div>\n                        <div class=\"drag-item\" id=\"researcher-C\" draggable=\"true\" data-option=\"C\">C Dr Meritxell Huch</div>\n                        <div class=\"drag-item\" id=\"researcher-D\" draggable=\"true\" data-option=\"D\">D Dr Madeline Lancaster</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-11-12-anchor\">\n<h4>Questions 20–25</h4>\n<p>Look at the following statements (Questions 20–25) and the list of people below.</p>\n<p>Match each statement with the correct person, <strong>A, B, C or D</strong>.</p>\n<div class=\"match-question-item\">\n<p><strong>20</strong> To deal with the injury, cells must go through a series of activities in a particular order.</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>21</strong> One technological development formed the basis of all modern scientific research.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> A modification to the Petri dish allows experiments to provide more accurate information.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> Petri dishes allow observation of medical conditions that are normally impossible to observe.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>24</strong> Visual evidence is a very important requirement for the provision of reliable information.</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>25</strong> Petri dishes can be used to help produce a range of new cells of many different kinds.</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"options-pool\" id=\"researcher-options-pool\">\n<strong>List of People</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"researcher-A\" draggable=\"true\" data-option=\"A\">A Alan Macfarlane</div>\n<div class=\"drag-item\" id=\"researcher-B\" draggable=\"true\" data-option=\"B\">B Professor Ludovic Vallier</div>\n<div class=\"drag-item\" id=\"researcher-C\" draggable=\"true\" data-option=\"C\">C Dr Meritxell Huch</div>\n<div class=\"drag-item\" id=\"researcher-D\" draggable=\"true\" data-option=\"D\">D Dr Madeline Lancaster</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": true
     },
     {
@@ -65,7 +65,7 @@
         "q15",
         "q16"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q13-14-15-16-anchor\">\n                <h4>Questions 26–29</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                <div class=\"summary-completion\">\n                    <h5>Research in the MRC Lab of Molecular Biology</h5>\n                    <p>\n                        A team led by Dr Madeline Lancaster is using special Petri dishes which prevent brain cells from <strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\"> to them. The aim is to allow the neurons to grow in three <strong>27</strong> <input name=\"q14\" type=\"text\" id=\"q27_input\">. This results in a <strong>28</strong> <input name=\"q15\" type=\"text\" id=\"q28_input\"> that resembles a developing brain. The technology could help scientists study how neuron production varies in different <strong>29</strong> <input name=\"q16\" type=\"text\" id=\"q29_input\">, leading to possibilities for increased medical knowledge.\n                    </p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q13-14-15-16-anchor\">\n<h4>Questions 26–29</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h5>Research in the MRC Lab of Molecular Biology</h5>\n<p>\nA team led by Dr Madeline Lancaster is using special Petri dishes which prevent brain cells from <strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\"> to them. The aim is to allow the neurons to grow in three <strong>27</strong> <input name=\"q14\" type=\"text\" id=\"q27_input\">. This results in a <strong>28</strong> <input name=\"q15\" type=\"text\" id=\"q28_input\"> that resembles a developing brain. The technology could help scientists study how neuron production varies in different <strong>29</strong> <input name=\"q16\" type=\"text\" id=\"q29_input\">, leading to possibilities for increased medical knowledge.\n</p>\n</div>\n</div>"
     }
   ],
   "answerKey": {
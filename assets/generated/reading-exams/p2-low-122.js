@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 2</h2>\n            <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n            \n            <h3>Biophilic Design</h3>\n            \n            <p><strong>A</strong> Biophilic design, a movement related to green architecture, has gained much momentum within the building community in recent years. The premise of biophilic design is to avoid or minimise harmful impacts on the natural environment and, equally importantly, to provide and restore beneficial contacts between people and nature in the built environment.</p>\n            <p><strong>B</strong> People have a psychologically developed need to commune with nature, but this has frequently been neglected. All too often, architects put creative originality before the needs of the people who must live and work in their futuristic constructions, with scant regard for emotional as well as practical considerations. Biophilic design does not advocate tree houses or cave-dwelling, but it does provide nature-based features that maximise human functioning and health. Though not technically a biophilic design, Fallingwater—the stunning house in rural Pennsylvania designed in the 1930s by Frank Lloyd Wright—arguably speaks to the human soul far more than the box-like blocks of flats designed by his contemporary Le Corbusier.</p>\n            <p><strong>C</strong> In the modern world, much of our built environment obstructs the age-old connection between humans and nature. The rate of technological progress far exceeds the rate of psychological evolution, leaving us ill-equipped to cope with our lifestyles, which in turn leads to increased stress. Because biophilia attempts to integrate basic and current needs, it can alleviate the difficulties caused by the brain's constant efforts to function in a modern environment it has not yet evolved to handle. For example, one crucial element of the natural landscape for human health is sunlight. We are evolutionarily programmed to respond positively to sunny areas over dark or overcast ones and sense that they will foster restoration, improve emotional well-being and promote health.</p>\n            <p><strong>D</strong> Because of its tremendous impact on human psychology, biophilic design plays a vital role in healthcare and its delivery. The current healthcare system contains many flaws, especially in its physical spaces. Hospitals, clinics and offices are high-stress environments for patients, visitors and healthcare professionals alike. One well-known study looked at the impact of nature on patients after surgery. One group had a view of a tree; the others had a window looking onto a brick wall. The first group had shorter hospital stays, received fewer negative comments from nurses, required fewer analgesics and had slightly fewer post-operative complications.</p>\n            <p><strong>E</strong> As a consequence of this and other studies, nature and nature-based design have been integrated into the physical design of many hospitals. For example, Dartmouth-Hitchcock Medical Center (DHMC) in New Hampshire boasts an atrium design illuminating the entire facility. Natural elements also permeate the building, including wood, stone and numerous live plants. While DHMC was built to incorporate these qualities, other hospitals have had biophilic features added to existing structures. The application of biophilic concepts to hospital interiors has increased substantially as administrators have witnessed patients' positive responses to nature.</p>\n            <p><strong>F</strong> Many existing buildings contain biophilic elements, but only a few have been built with the specific idea of biophilic design in mind. One such building is the Adam Joseph Lewis Center for Environmental Studies at Oberlin College in Ohio. The director of Oberlin's Environmental Studies Program, David Orr, explained that the building's goals were “to create not just a place for classes but rather a building that would help to redefine the relationship between humankind and the environment—one that would expand our sense of ecological possibilities”. The Lewis Center is sustainable in a broader sense than in the typical application of the word. It harnesses solar power, utilises both active and passive air systems, and monitors the weather to adapt to conditions. The Centre's “Living Machine” treats wastewater by combining traditional wastewater technology with wetland ecosystems' purification processes, producing water that can be used in the toilets and for irrigation. In their design, Orr and his team of architects engineered a healthy and comfortable space for students while ensuring the surrounding environment was undamaged.</p>\n            <p><strong>G</strong> Another example is the University of Guelph-Humber building in Ontario, Canada. It contains a centrally located bio-wall, vertically spanning the building. The wall is covered in dense foliage which not only connects people to nature on the inside of the building, but also functions as a new filtration-system prototype. The wall purifies the air and has the potential to fulfil the building's fresh-air-intake requirements. These examples prove that the built environment need not interfere with biological human needs to commune with nature, nor with existing ecological systems.</p>\n            <p><strong>H</strong> Ancient architects built for their cultures, which were almost always more in touch with the earth than Western society is today. They mimicked nature's forms, producing magnificent structures that still awe us—though biophilic design is a novel concept, they certainly employed some of its recommendations. Today we can add another layer to this tradition and ensure maximal benefit for our planet and ourselves.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Biophilic Design</h3>\n<p><strong>A</strong> Biophilic design, a movement related to green architecture, has gained much momentum within the building community in recent years. The premise of biophilic design is to avoid or minimise harmful impacts on the natural environment and, equally importantly, to provide and restore beneficial contacts between people and nature in the built environment.</p>\n<p><strong>B</strong> People have a psychologically developed need to commune with nature, but this has frequently been neglected. All too often, architects put creative originality before the needs of the people who must live and work in their futuristic constructions, with scant regard for emotional as well as practical considerations. Biophilic design does not advocate tree houses or cave-dwelling, but it does provide nature-based features that maximise human functioning and health. Though not technically a biophilic design, Fallingwater—the stunning house in rural Pennsylvania designed in the 1930s by Frank Lloyd Wright—arguably speaks to the human soul far more than the box-like blocks of flats designed by his contemporary Le Corbusier.</p>\n<p><strong>C</strong> In the modern world, much of our built environment obstructs the age-old connection between humans and nature. The rate of technological progress far exceeds the rate of psychological evolution, leaving us ill-equipped to cope with our lifestyles, which in turn leads to increased stress. Because biophilia attempts to integrate basic and current needs, it can alleviate the difficulties caused by the brain's constant efforts to function in a modern environment it has not yet evolved to handle. For example, one crucial element of the natural landscape for human health is sunlight. We are evolutionarily programmed to respond positively to sunny areas over dark or overcast ones and sense that they will foster restoration, improve emotional well-being and promote health.</p>\n<p><strong>D</strong> Because of its tremendous impact on human psychology, biophilic design plays a vital role in healthcare and its delivery. The current healthcare system contains many flaws, especially in its physical spaces. Hospitals, clinics and offices are high-stress environments for patients, visitors and healthcare professionals alike. One well-known study looked at the impact of nature on patients after surgery. One group had a view of a tree; the others had a window looking onto a brick wall. The first group had shorter hospital stays, received fewer negative comments from nurses, required fewer analgesics and had slightly fewer post-operative complications.</p>\n<p><strong>E</strong> As a consequence of this and other studies, nature and nature-based design have been integrated into the physical design of many hospitals. For example, Dartmouth-Hitchcock Medical Center (DHMC) in New Hampshire boasts an atrium design illuminating the entire facility. Natural elements also permeate the building, including wood, stone and numerous live plants. While DHMC was built to incorporate these qualities, other hospitals have had biophilic features added to existing structures. The application of biophilic concepts to hospital interiors has increased substantially as administrators have witnessed patients' positive responses to nature.</p>\n<p><strong>F</strong> Many existing buildings contain biophilic elements, but only a few have been built with the specific idea of biophilic design in mind. One such building is the Adam Joseph Lewis Center for Environmental Studies at Oberlin College in Ohio. The director of Oberlin's Environmental Studies Program, David Orr, explained that the building's goals were “to create not just a place for classes but rather a building that would help to redefine the relationship between humankind and the environment—one that would expand our sense of ecological possibilities”. The Lewis Center is sustainable in a broader sense than in the typical application of the word. It harnesses solar power, utilises both active and passive air systems, and monitors the weather to adapt to conditions. The Centre's “Living Machine” treats wastewater by combining traditional wastewater technology with wetland ecosystems' purification processes, producing water that can be used in the toilets and for irrigation. In their design, Orr and his team of architects engineered a healthy and comfortable space for students while ensuring the surrounding environment was undamaged.</p>\n<p><strong>G</strong> Another example is the University of Guelph-Humber building in Ontario, Canada. It contains a centrally located bio-wall, vertically spanning the building. The wall is covered in dense foliage which not only connects people to nature on the inside of the building, but also functions as a new filtration-system prototype. The wall purifies the air and has the potential to fulfil the building's fresh-air-intake requirements. These examples prove that the built environment need not interfere with biological human needs to commune with nature, nor with existing ecological systems.</p>\n<p><strong>H</strong> Ancient architects built for their cultures, which were almost always more in touch with the earth than Western society is today. They mimicked nature's forms, producing magnificent structures that still awe us—though biophilic design is a novel concept, they certainly employed some of its recommendations. Today we can add another layer to this tradition and ensure maximal benefit for our planet and ourselves.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                <h4>Questions 14–19</h4>\n                <p>Reading Passage 2 has eight paragraphs, <strong>A–H</strong>.</p>\n                <p>Which paragraph contains the following information?</p>\n                <p><em>Write the correct letter, <strong>A–H</strong>, in boxes 14–19 on your answer sheet.</em></p>\n                <p><strong>NB</strong> You may use any letter more than once.</p>\n                <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                        <thead>\n                            <tr>\n                                <th style=\"width: 50%;\"></th>\n                                <th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>14</strong> a description of how rapid change has a negative effect on people</td>\n                                <td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>15</strong> a reference to an architect whose designs were uncharacteristic of biophilia</td>\n                                <td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>16</strong> a definition of the two main aims of biophilia</td>\n                                <td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>17</strong> a positive claim about early forms of architecture</td>\n                                <td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>18</strong> a reference to the fact that many architects are too focused on innovation</td>\n                                <td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>19</strong> a description of features which conserve energy in a biophilic design</td>\n                                <td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td><td><input type=\"radio\" name=\"q6\" value=\"H\"></td>\n                            </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–H</strong>, in boxes 14–19 on your answer sheet.</em></p>\n<p><strong>NB</strong> You may use any letter more than once.</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"width: 50%;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> a description of how rapid change has a negative effect on people</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> a reference to an architect whose designs were uncharacteristic of biophilia</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> a definition of the two main aims of biophilia</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> a positive claim about early forms of architecture</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>18</strong> a reference to the fact that many architects are too focused on innovation</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>19</strong> a description of features which conserve energy in a biophilic design</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td><td><input type=\"radio\" name=\"q6\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -49,7 +49,7 @@
         "q10",
         "q11"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-11-anchor\">\n                <h4>Questions 20–24</h4>\n                <p>Complete the sentences below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                <div class=\"sentence-completion\">\n                    <p>\n                    <strong>20</strong> In the modern world, <input type=\"text\" id=\"q20_input\" name=\"q7\"> advancements are happening so quickly that humans are unable to adjust to them.\n                    </p>\n                     <p>\n                    <strong>21</strong> Biophilia can help us deal with the <input type=\"text\" id=\"q21_input\" name=\"q8\"> caused by the difficulties of our current lifestyles.\n                    </p>\n                    <p>\n                    <strong>22</strong> People instinctively feel more comfortable in places which have plenty of <input type=\"text\" id=\"q22_input\" name=\"q9\"> something which is necessary for health and well-being.\n                    </p>\n                    <p>\n                    <strong>23</strong> An experiment designed to test the effect of nature on patient recovery times found that those who could see a <input type=\"text\" id=\"q23_input\" name=\"q10\"> made a faster recovery.\n                    </p>\n                    <p>\n                    <strong>24</strong> There is a biophilic design feature in the University of Guelph-Humber building which improves the quality of the <input type=\"text\" id=\"q24_input\" name=\"q11\">.\n                    </p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-11-anchor\">\n<h4>Questions 20–24</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"sentence-completion\">\n<p>\n<strong>20</strong> In the modern world, <input type=\"text\" id=\"q20_input\" name=\"q7\"> advancements are happening so quickly that humans are unable to adjust to them.\n</p>\n<p>\n<strong>21</strong> Biophilia can help us deal with the <input type=\"text\" id=\"q21_input\" name=\"q8\"> caused by the difficulties of our current lifestyles.\n</p>\n<p>\n<strong>22</strong> People instinctively feel more comfortable in places which have plenty of <input type=\"text\" id=\"q22_input\" name=\"q9\"> something which is necessary for health and well-being.\n</p>\n<p>\n<strong>23</strong> An experiment designed to test the effect of nature on patient recovery times found that those who could see a <input type=\"text\" id=\"q23_input\" name=\"q10\"> made a faster recovery.\n</p>\n<p>\n<strong>24</strong> There is a biophilic design feature in the University of Guelph-Humber building which improves the quality of the <input type=\"text\" id=\"q24_input\" name=\"q11\">.\n</p>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -58,7 +58,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q12-13-anchor\">\n                 <h4>Questions 25 and 26</h4>\n                <p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n                <p>Which <strong>TWO</strong> of the following statements does the writer make about the Adam Joseph Lewis Center at Oberlin College?</p>\n                <div class=\"mcq\">\n                    <label class=\"mcq-item\" style=\"display:block;\"><input type=\"checkbox\" name=\"q12_13\" value=\"A\"> <strong>A</strong> It was the first educational establishment designed with biophilic principles.</label>\n                    <label class=\"mcq-item\" style=\"display:block;\"><input type=\"checkbox\" name=\"q12_13\" value=\"B\"> <strong>B</strong> It is beneficial for both students and the environment.</label>\n                    <label class=\"mcq-item\" style=\"display:block;\"><input type=\"checkbox\" name=\"q12_13\" value=\"C\"> <strong>C</strong> It has established new concepts for classroom design.</label>\n                    <label class=\"mcq-item\" style=\"display:block;\"><input type=\"checkbox\" name=\"q12_13\" value=\"D\"> <strong>D</strong> It aims to inspire new ways of thinking about the environment.</label>\n                    <label class=\"mcq-item\" style=\"display:block;\"><input type=\"checkbox\" name=\"q12_13\" value=\"E\"> <strong>E</strong> It provides solar power to other buildings in the surrounding area.</label>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q12-13-anchor\">\n<h4>Questions 25 and 26</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>Which <strong>TWO</strong> of the following statements does the writer make about the Adam Joseph Lewis Center at Oberlin College?</p>\n<div class=\"mcq\">\n<label class=\"mcq-item\" style=\"display:block;\"><input type=\"checkbox\" name=\"q12_13\" value=\"A\"> <strong>A</strong> It was the first educational establishment designed with biophilic principles.</label> <label class=\"mcq-item\" style=\"display:block;\"><input type=\"checkbox\" name=\"q12_13\" value=\"B\"> <strong>B</strong> It is beneficial for both students and the environment.</label> <label class=\"mcq-item\" style=\"display:block;\"><input type=\"checkbox\" name=\"q12_13\" value=\"C\"> <strong>C</strong> It has established new concepts for classroom design.</label> <label class=\"mcq-item\" style=\"display:block;\"><input type=\"checkbox\" name=\"q12_13\" value=\"D\"> <strong>D</strong> It aims to inspire new ways of thinking about the environment.</label> <label class=\"mcq-item\" style=\"display:block;\"><input type=\"checkbox\" name=\"q12_13\" value=\"E\"> <strong>E</strong> It provides solar power to other buildings in the surrounding area.</label>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 2</h2>\n            <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n            \n            <h3>Orientation of Birds</h3>\n            \n            <p><strong>A</strong> For many of us, the way birds are able to orientate is both astounding and difficult to appreciate fully. For instance, the annual migration of the golden plover of the Pacific takes it from Alaska to Hawaii on a flight of well over 3,000 kilometres, and if it were to deviate by only one degree, it would miss the island on which it nests.</p>\n            <p><strong>B</strong> The first systematic studies on orientation in birds were made possible by the ‘homing instinct' exhibited by so many species. Birds are caught at a time when they show an attachment to their territory, especially during the nesting season. They are taken to some spot, released, and the percentage of returns is recorded. The distance can be varied, and the direction, as well as the method of transporting them, and then the influence of climatic and other factors on their ability to find their way home can be studied. These experiments have shown a wide variation in ability to home, and three types of homing behaviour have been identified.</p>\n            <p><strong>C</strong> In the first type, birds methodically explore the area in which they are released until they pick up some familiar feature, and then they quickly find their way back to the nest. Such birds possess a highly developed visual memory, as experiments with pigeons have shown. Domestic pigeons have been trained to peck at a certain point on an aerial photograph, with a system of rewards, and four years later the birds were still able to respond to this training when placed on the aerial photograph. Birds' eyes have a power of resolution two to three times greater than ours, enabling them to pick up very fine details. If a bird uses only this type of homing behaviour, however, it can only succeed if the point of release is not too far away. If the birds are transported 800 kilometres from their nest, it is only by good fortune that they find their way back as a result of long exploratory flights. Usually, the area known to a bird is its feeding territory. Released within this area, the birds soon make their return; release them outside it and far fewer return. However, if a bird is released for a second time in the same place, its visual memory comes into play, and the bird, no longer requiring tedious exploratory flights, will return much more quickly.</p>\n            <p><strong>D</strong> The second type of homing behaviour is shown by birds that are capable of choosing their flight direction and holding to it for the rest of their journey. How do they decide what direction to take? They appear to choose their normal migration direction even if they are released in a different place from their usual starting point. If, for example, birds which normally fly to the north-east to reach latitude 45 degrees north are released at that latitude, they will immediately start flying north-east anyway. So if they are released further to the west, they maintain the correct direction but fly west of their destination, and so fail to arrive.</p>\n            <p><strong>E</strong> The third type of homing behaviour shows the highest degree of orientation. Released at one point, the birds immediately take stock of it, compare its position with that of the nest, decide on the direction and fly off. This happens even if the birds are in a country right off their migration routes, where they have never been before. In one example, a Laysan albatross returned to its nesting area on Midway Island in the middle of the Pacific, having flown over 5,000 kilometres from the west coast of the USA in just over ten days. This is a perfect example of the third type of homing, for the albatross clearly couldn't rely on any landmarks over the vast expanse of the Pacific Ocean.</p>\n            <p><strong>F</strong> The percentage of successful birds varies greatly, being highest in those species with a strong migratory behaviour. Thus the lesser black-backed gull is more migratory than the herring gull and more often reaches ‘home'. Great migrants such as the swift have the highest percentage of returns. In one case, seven out of nine Alpine swifts were recaptured at their nests after being displaced some 1,400 kilometres; one made the journey in three days.</p>\n            <p><strong>G</strong> What part does heredity play in all this? Two research studies suggest that instinctive, i.e. genetically inherited, behaviour patterns play a part in navigation. The first was carried out by Ernst Schüz and it is highly significant. Schüz caught first-year European storks and released them later, after the departure of the adult storks at a time when they normally make their south-west autumn migration to Africa. The recaptures showed that, in spite of the fact that there were no adults to guide them, the birds unanimously headed south-west. This was a most striking finding, for it showed that the birds had an innate and unlearned attraction for the African wintering area that they have occupied for thousands of years.</p>\n            <p><strong>H</strong> The case of starlings is a little different. These birds have a great aptitude for homing, but this behaviour differs in the different age groups. Birds that were shifted to the south-east of their normal migration route split into two groups. The adults, in full possession of their gift for orientation, found their wintering area by modifying their direction by 90 degrees, whereas the juveniles sought their winter quarters to the south-east of their real position.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Orientation of Birds</h3>\n<p><strong>A</strong> For many of us, the way birds are able to orientate is both astounding and difficult to appreciate fully. For instance, the annual migration of the golden plover of the Pacific takes it from Alaska to Hawaii on a flight of well over 3,000 kilometres, and if it were to deviate by only one degree, it would miss the island on which it nests.</p>\n<p><strong>B</strong> The first systematic studies on orientation in birds were made possible by the ‘homing instinct' exhibited by so many species. Birds are caught at a time when they show an attachment to their territory, especially during the nesting season. They are taken to some spot, released, and the percentage of returns is recorded. The distance can be varied, and the direction, as well as the method of transporting them, and then the influence of climatic and other factors on their ability to find their way home can be studied. These experiments have shown a wide variation in ability to home, and three types of homing behaviour have been identified.</p>\n<p><strong>C</strong> In the first type, birds methodically explore the area in which they are released until they pick up some familiar feature, and then they quickly find their way back to the nest. Such birds possess a highly developed visual memory, as experiments with pigeons have shown. Domestic pigeons have been trained to peck at a certain point on an aerial photograph, with a system of rewards, and four years later the birds were still able to respond to this training when placed on the aerial photograph. Birds' eyes have a power of resolution two to three times greater than ours, enabling them to pick up very fine details. If a bird uses only this type of homing behaviour, however, it can only succeed if the point of release is not too far away. If the birds are transported 800 kilometres from their nest, it is only by good fortune that they find their way back as a result of long exploratory flights. Usually, the area known to a bird is its feeding territory. Released within this area, the birds soon make their return; release them outside it and far fewer return. However, if a bird is released for a second time in the same place, its visual memory comes into play, and the bird, no longer requiring tedious exploratory flights, will return much more quickly.</p>\n<p><strong>D</strong> The second type of homing behaviour is shown by birds that are capable of choosing their flight direction and holding to it for the rest of their journey. How do they decide what direction to take? They appear to choose their normal migration direction even if they are released in a different place from their usual starting point. If, for example, birds which normally fly to the north-east to reach latitude 45 degrees north are released at that latitude, they will immediately start flying north-east anyway. So if they are released further to the west, they maintain the correct direction but fly west of their destination, and so fail to arrive.</p>\n<p><strong>E</strong> The third type of homing behaviour shows the highest degree of orientation. Released at one point, the birds immediately take stock of it, compare its position with that of the nest, decide on the direction and fly off. This happens even if the birds are in a country right off their migration routes, where they have never been before. In one example, a Laysan albatross returned to its nesting area on Midway Island in the middle of the Pacific, having flown over 5,000 kilometres from the west coast of the USA in just over ten days. This is a perfect example of the third type of homing, for the albatross clearly couldn't rely on any landmarks over the vast expanse of the Pacific Ocean.</p>\n<p><strong>F</strong> The percentage of successful birds varies greatly, being highest in those species with a strong migratory behaviour. Thus the lesser black-backed gull is more migratory than the herring gull and more often reaches ‘home'. Great migrants such as the swift have the highest percentage of returns. In one case, seven out of nine Alpine swifts were recaptured at their nests after being displaced some 1,400 kilometres; one made the journey in three days.</p>\n<p><strong>G</strong> What part does heredity play in all this? Two research studies suggest that instinctive, i.e. genetically inherited, behaviour patterns play a part in navigation. The first was carried out by Ernst Schüz and it is highly significant. Schüz caught first-year European storks and released them later, after the departure of the adult storks at a time when they normally make their south-west autumn migration to Africa. The recaptures showed that, in spite of the fact that there were no adults to guide them, the birds unanimously headed south-west. This was a most striking finding, for it showed that the birds had an innate and unlearned attraction for the African wintering area that they have occupied for thousands of years.</p>\n<p><strong>H</strong> The case of starlings is a little different. These birds have a great aptitude for homing, but this behaviour differs in the different age groups. Birds that were shifted to the south-east of their normal migration route split into two groups. The adults, in full possession of their gift for orientation, found their wintering area by modifying their direction by 90 degrees, whereas the juveniles sought their winter quarters to the south-east of their real position.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 14–18</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n                <div class=\"summary-completion\">\n                    <h4>Types of homing behaviour</h4>\n                    <p>\n                        <strong>First type:</strong><br>\n                        Birds rely on their sophisticated <strong>14</strong> <input type=\"text\" id=\"q14_input\" name=\"q1\">. However, they are generally most successful if they are released within their feeding territory.\n                    </p>\n                    <p>\n                        <strong>Second type:</strong><br>\n                        Birds select their accustomed <strong>15</strong> <input type=\"text\" id=\"q15_input\" name=\"q2\">, no matter where they are released. As a result, they may miss their <strong>16</strong> <input type=\"text\" id=\"q16_input\" name=\"q3\">.\n                    </p>\n                    <p>\n                        <strong>Third type:</strong><br>\n                        Birds orientate correctly, even when they are released in an unfamiliar place and have no <strong>17</strong> <input type=\"text\" id=\"q17_input\" name=\"q4\"> to make use of. One bird with this type of skill is the <strong>18</strong> <input type=\"text\" id=\"q18_input\" name=\"q5\">.\n                    </p>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 14–18</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>Types of homing behaviour</h4>\n<p>\n<strong>First type:</strong><br>\nBirds rely on their sophisticated <strong>14</strong> <input type=\"text\" id=\"q14_input\" name=\"q1\">. However, they are generally most successful if they are released within their feeding territory.\n</p>\n<p>\n<strong>Second type:</strong><br>\nBirds select their accustomed <strong>15</strong> <input type=\"text\" id=\"q15_input\" name=\"q2\">, no matter where they are released. As a result, they may miss their <strong>16</strong> <input type=\"text\" id=\"q16_input\" name=\"q3\">.\n</p>\n<p>\n<strong>Third type:</strong><br>\nBirds orientate correctly, even when they are released in an unfamiliar place and have no <strong>17</strong> <input type=\"text\" id=\"q17_input\" name=\"q4\"> to make use of. One bird with this type of skill is the <strong>18</strong> <input type=\"text\" id=\"q18_input\" name=\"q5\">.\n</p>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n                <h4>Questions 19–22</h4>\n                <p>Reading Passage 2 has eight paragraphs, <strong>A–H</strong>.</p>\n                <p>Which paragraph contains the following information?</p>\n                <p><em>NB You may use any letter more than once.</em></p>\n                <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                        <thead>\n                            <tr>\n                                <th style=\"min-width: 250px;\"></th>\n                                <th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>19</strong> the effects of distance on some birds' ability to find their nests</td>\n                                <td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td><td><input type=\"radio\" name=\"q6\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>20</strong> a methodology for testing the general ability of birds to find their nests</td>\n                                <td><input type=\"radio\" name=\"q7\" value=\"A\"></td><td><input type=\"radio\" name=\"q7\" value=\"B\"></td><td><input type=\"radio\" name=\"q7\" value=\"C\"></td><td><input type=\"radio\" name=\"q7\" value=\"D\"></td><td><input type=\"radio\" name=\"q7\" value=\"E\"></td><td><input type=\"radio\" name=\"q7\" value=\"F\"></td><td><input type=\"radio\" name=\"q7\" value=\"G\"></td><td><input type=\"radio\" name=\"q7\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>21</strong> one aspect of physical ability in humans and birds</td>\n                                <td><input type=\"radio\" name=\"q8\" value=\"A\"></td><td><input type=\"radio\" name=\"q8\" value=\"B\"></td><td><input type=\"radio\" name=\"q8\" value=\"C\"></td><td><input type=\"radio\" name=\"q8\" value=\"D\"></td><td><input type=\"radio\" name=\"q8\" value=\"E\"></td><td><input type=\"radio\" name=\"q8\" value=\"F\"></td><td><input type=\"radio\" name=\"q8\" value=\"G\"></td><td><input type=\"radio\" name=\"q8\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>22</strong> how some birds' migration was delayed for experimental purposes</td>\n                                <td><input type=\"radio\" name=\"q9\" value=\"A\"></td><td><input type=\"radio\" name=\"q9\" value=\"B\"></td><td><input type=\"radio\" name=\"q9\" value=\"C\"></td><td><input type=\"radio\" name=\"q9\" value=\"D\"></td><td><input type=\"radio\" name=\"q9\" value=\"E\"></td><td><input type=\"radio\" name=\"q9\" value=\"F\"></td><td><input type=\"radio\" name=\"q9\" value=\"G\"></td><td><input type=\"radio\" name=\"q9\" value=\"H\"></td>\n                            </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 19–22</h4>\n<p>Reading Passage 2 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 250px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>19</strong> the effects of distance on some birds' ability to find their nests</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td><td><input type=\"radio\" name=\"q6\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>20</strong> a methodology for testing the general ability of birds to find their nests</td>\n<td><input type=\"radio\" name=\"q7\" value=\"A\"></td><td><input type=\"radio\" name=\"q7\" value=\"B\"></td><td><input type=\"radio\" name=\"q7\" value=\"C\"></td><td><input type=\"radio\" name=\"q7\" value=\"D\"></td><td><input type=\"radio\" name=\"q7\" value=\"E\"></td><td><input type=\"radio\" name=\"q7\" value=\"F\"></td><td><input type=\"radio\" name=\"q7\" value=\"G\"></td><td><input type=\"radio\" name=\"q7\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>21</strong> one aspect of physical ability in humans and birds</td>\n<td><input type=\"radio\" name=\"q8\" value=\"A\"></td><td><input type=\"radio\" name=\"q8\" value=\"B\"></td><td><input type=\"radio\" name=\"q8\" value=\"C\"></td><td><input type=\"radio\" name=\"q8\" value=\"D\"></td><td><input type=\"radio\" name=\"q8\" value=\"E\"></td><td><input type=\"radio\" name=\"q8\" value=\"F\"></td><td><input type=\"radio\" name=\"q8\" value=\"G\"></td><td><input type=\"radio\" name=\"q8\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>22</strong> how some birds' migration was delayed for experimental purposes</td>\n<td><input type=\"radio\" name=\"q9\" value=\"A\"></td><td><input type=\"radio\" name=\"q9\" value=\"B\"></td><td><input type=\"radio\" name=\"q9\" value=\"C\"></td><td><input type=\"radio\" name=\"q9\" value=\"D\"></td><td><input type=\"radio\" name=\"q9\" value=\"E\"></td><td><input type=\"radio\" name=\"q9\" value=\"F\"></td><td><input type=\"radio\" name=\"q9\" value=\"G\"></td><td><input type=\"radio\" name=\"q9\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -58,7 +58,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-anchor\">\n                <h4>Questions 23–26</h4>\n                <p>Look at the following types of birds (Questions 23–26) and the list of points which the author wishes to illustrate below.</p>\n                <p>Match each bird with the point which it illustrates, <strong>A–G</strong>.</p>\n                \n                <div class=\"match-question-item\">\n                    <p><strong>23</strong> Domestic pigeon</p>\n                    <div class=\"match-dropzone\" data-question=\"q10\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>24</strong> Alpine swift</p>\n                    <div class=\"match-dropzone\" data-question=\"q11\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                     <p><strong>25</strong> European stork</p>\n                    <div class=\"match-dropzone\" data-question=\"q12\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                    <p><strong>26</strong> Starling</p>\n                    <div class=\"match-dropzone\" data-question=\"q13\"></div>\n                </div>\n\n                <div class=\"options-pool\" id=\"points-options-pool\">\n                    <strong>List of points which the author wishes to illustrate</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"A\"><strong>A</strong> an ability to orientate without previous training</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"B\"><strong>B</strong> the speed at which birds fly</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"C\"><strong>C</strong> the ability to remember things seen previously</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"D\"><strong>D</strong> the effect of age on homing ability</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"E\"><strong>E</strong> the strength required to fly a great distance</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"F\"><strong>F</strong> a high success rate in finding nests</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"G\"><strong>G</strong> the importance of seasonal cues for migrating birds</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<h4>Questions 23–26</h4>\n<p>Look at the following types of birds (Questions 23–26) and the list of points which the author wishes to illustrate below.</p>\n<p>Match each bird with the point which it illustrates, <strong>A–G</strong>.</p>\n<div class=\"match-question-item\">\n<p><strong>23</strong> Domestic pigeon</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>24</strong> Alpine swift</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>25</strong> European stork</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>26</strong> Starling</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div class=\"options-pool\" id=\"points-options-pool\">\n<strong>List of points which the author wishes to illustrate</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\"><strong>A</strong> an ability to orientate without previous training</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\"><strong>B</strong> the speed at which birds fly</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\"><strong>C</strong> the ability to remember things seen previously</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\"><strong>D</strong> the effect of age on homing ability</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\"><strong>E</strong> the strength required to fly a great distance</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\"><strong>F</strong> a high success rate in finding nests</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\"><strong>G</strong> the importance of seasonal cues for migrating birds</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false
     }
   ],
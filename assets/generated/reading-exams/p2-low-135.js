@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 2</h2>\n            <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n            \n            <h3>Skyscraper Farming</h3>\n            \n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"A\" id=\"q1-dropzone\" data-question=\"q1\">\n                    <span class=\"paragraph-label\">Question 14 (A):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>A</strong> Today's environmental scientists are in no doubt that the world's resources of fertile soil are rapidly deteriorating, and that new land for agriculture is becoming ever more sparse. Intensive farming, urbanisation, desertification and sea-level rises are all putting growing pressure on the planet's agricultural land and therefore on food supplies. Currently 24 per cent of the world's 11.5 billion hectares of cultivated land has already undergone human-induced soil degradation, particularly through erosion, according to a recent study by the UK Government Office for Science.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"B\" id=\"q2-dropzone\" data-question=\"q2\">\n                    <span class=\"paragraph-label\">Question 15 (B):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>B</strong> The global population is expected to exceed nine billion by 2050 — up a third from today's level — and studies suggest that food production will have to go up by 70 per cent if we are to feed all of those new mouths. This means that scientists will have to develop new ways of growing crops if we are to avoid a humanitarian crisis. Indeed, UN Food and Agriculture Organization figures suggest that the number of under-nourished people is already growing, and with escalating climate change, crop yields in many areas have been projected to decline.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                 <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"C\" id=\"q3-dropzone\" data-question=\"q3\">\n                    <span class=\"paragraph-label\">Question 16 (C):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>C</strong> With this in mind, some scientists and agricultural experts are advocating an innovative alternative to traditional farming whereby skyscrapers packed with shelf-based systems for growing vegetables on each storey — known as 'vertical farms' — could hold the key to revolutionising agriculture. Columbia University professor Dickson Despommier claims that vertical farming could boost crop yields many times over. A single 20-storey vertical farm could theoretically feed 50 000 people. And if the theory translates into reality as proposed, 160 skyscraper-sized vertical farms could feed the entire population of New York City, while 180 would be needed for London, 289 for Cairo and 302 for Kolkata.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"D\" id=\"q4-dropzone\" data-question=\"q4\">\n                    <span class=\"paragraph-label\">Question 17 (D):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>D</strong> It's a compelling vision, and one that has already been put into practice in Asia — albeit on a smaller scale. 'But there are problems, such as initial investment and operating costs that are too great,' says a spokesman for Japan's Ministry of Agriculture, Forestry and Fisheries. Nevertheless, Tokyo-based mushroom producer Hokuto Corporation is a model example of how a vertical farm can be profitable. With 28 vertical mushroom farms operating across the country, it produces some 68 000 tonnes of mushrooms annually. 'Vertical mushroom farms have more advantages than ground-level farms,’ says Hokuto's Ted Yamanoko, who highlights the relative cost-effectiveness of his organisation's farming practices together with reduced emissions of greenhouse gases.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                 <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"E\" id=\"q5-dropzone\" data-question=\"q5\">\n                    <span class=\"paragraph-label\">Question 18 (E):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>E</strong> And the impact of vertical farms could extend beyond feeding established urban populations. Despommier sees them as being capable of helping centres of displaced persons — such as refugee camps — in much the same way that Mobile Army Surgical Hospital (MASH) units are deployed in emergencies. ‘Developing an emergency-response system for crop production inside specially constructed modular and highly transportable greenhouses would allow for humanitarian interventions,' he says. 'If you have three or four storeys of food already growing someplace, they could become mobile units that could be picked up by helicopters and dropped into the middle of a crisis zone.'</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                 <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"F\" id=\"q6-dropzone\" data-question=\"q6\">\n                    <span class=\"paragraph-label\">Question 19 (F):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>F</strong> But it isn't only about increasing food production. Despommier is concerned about the harm that farming has done to the world's landscape over a relatively short time span, particularly the elimination of hardwood forests. 'Farming is only 12 000 years old,' he points out. 'Vertical farming could allow us for the first time to feed everyone on Earth and still return land to its original ecological function.' Natalie Jeremijenko of New York University agrees. Reducing the land needed for food production could enrich biodiversity, which in turn can raise the productivity of conventional farms. Furthermore, vertical farming could dramatically cut fossil-fuel use and reduce geopolitical tensions in regions where poor farming conditions drive conflict and malnutrition.</p>\n            </div>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Skyscraper Farming</h3>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"A\" id=\"q1-dropzone\" data-question=\"q1\">\n<span class=\"paragraph-label\">Question 14 (A):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> Today's environmental scientists are in no doubt that the world's resources of fertile soil are rapidly deteriorating, and that new land for agriculture is becoming ever more sparse. Intensive farming, urbanisation, desertification and sea-level rises are all putting growing pressure on the planet's agricultural land and therefore on food supplies. Currently 24 per cent of the world's 11.5 billion hectares of cultivated land has already undergone human-induced soil degradation, particularly through erosion, according to a recent study by the UK Government Office for Science.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"B\" id=\"q2-dropzone\" data-question=\"q2\">\n<span class=\"paragraph-label\">Question 15 (B):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> The global population is expected to exceed nine billion by 2050 — up a third from today's level — and studies suggest that food production will have to go up by 70 per cent if we are to feed all of those new mouths. This means that scientists will have to develop new ways of growing crops if we are to avoid a humanitarian crisis. Indeed, UN Food and Agriculture Organization figures suggest that the number of under-nourished people is already growing, and with escalating climate change, crop yields in many areas have been projected to decline.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"C\" id=\"q3-dropzone\" data-question=\"q3\">\n<span class=\"paragraph-label\">Question 16 (C):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> With this in mind, some scientists and agricultural experts are advocating an innovative alternative to traditional farming whereby skyscrapers packed with shelf-based systems for growing vegetables on each storey — known as 'vertical farms' — could hold the key to revolutionising agriculture. Columbia University professor Dickson Despommier claims that vertical farming could boost crop yields many times over. A single 20-storey vertical farm could theoretically feed 50 000 people. And if the theory translates into reality as proposed, 160 skyscraper-sized vertical farms could feed the entire population of New York City, while 180 would be needed for London, 289 for Cairo and 302 for Kolkata.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"D\" id=\"q4-dropzone\" data-question=\"q4\">\n<span class=\"paragraph-label\">Question 17 (D):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> It's a compelling vision, and one that has already been put into practice in Asia — albeit on a smaller scale. 'But there are problems, such as initial investment and operating costs that are too great,' says a spokesman for Japan's Ministry of Agriculture, Forestry and Fisheries. Nevertheless, Tokyo-based mushroom producer Hokuto Corporation is a model example of how a vertical farm can be profitable. With 28 vertical mushroom farms operating across the country, it produces some 68 000 tonnes of mushrooms annually. 'Vertical mushroom farms have more advantages than ground-level farms,’ says Hokuto's Ted Yamanoko, who highlights the relative cost-effectiveness of his organisation's farming practices together with reduced emissions of greenhouse gases.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"E\" id=\"q5-dropzone\" data-question=\"q5\">\n<span class=\"paragraph-label\">Question 18 (E):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> And the impact of vertical farms could extend beyond feeding established urban populations. Despommier sees them as being capable of helping centres of displaced persons — such as refugee camps — in much the same way that Mobile Army Surgical Hospital (MASH) units are deployed in emergencies. ‘Developing an emergency-response system for crop production inside specially constructed modular and highly transportable greenhouses would allow for humanitarian interventions,' he says. 'If you have three or four storeys of food already growing someplace, they could become mobile units that could be picked up by helicopters and dropped into the middle of a crisis zone.'</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"F\" id=\"q6-dropzone\" data-question=\"q6\">\n<span class=\"paragraph-label\">Question 19 (F):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> But it isn't only about increasing food production. Despommier is concerned about the harm that farming has done to the world's landscape over a relatively short time span, particularly the elimination of hardwood forests. 'Farming is only 12 000 years old,' he points out. 'Vertical farming could allow us for the first time to feed everyone on Earth and still return land to its original ecological function.' Natalie Jeremijenko of New York University agrees. Reducing the land needed for food production could enrich biodiversity, which in turn can raise the productivity of conventional farms. Furthermore, vertical farming could dramatically cut fossil-fuel use and reduce geopolitical tensions in regions where poor farming conditions drive conflict and malnutrition.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                <h4>Questions 14–19</h4>\n                <p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n                <p>Choose the correct heading for each paragraph from the list of headings below.</p>\n                <p><em>Write the correct number, i–ix, in boxes 14–19 on your answer sheet.</em></p>\n                <div class=\"headings-pool\" id=\"headings-pool-container\">\n                    <strong>List of Headings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i Potential production capabilities of vertical farms</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Opposition to new ideas about food production</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii A successful application of vertical-farming technology</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv The potential to provide urgent relief</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v The original inspiration for vertical farming</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi Various environmental benefits of vertical farming</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii An increasing problem for farmers worldwide</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii A return to traditional farming methods</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix A rising demand for food</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Write the correct number, i–ix, in boxes 14–19 on your answer sheet.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i Potential production capabilities of vertical farms</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Opposition to new ideas about food production</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii A successful application of vertical-farming technology</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv The potential to provide urgent relief</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v The original inspiration for vertical farming</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi Various environmental benefits of vertical farming</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii An increasing problem for farmers worldwide</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii A return to traditional farming methods</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix A rising demand for food</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -48,7 +48,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-anchor\">\n                <h4>Questions 20–22</h4>\n                <p>Complete the sentences below.</p>\n                <p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n                <div class=\"question-item\">\n                     <p><strong>20</strong> A UK Government study found that <input class=\"blank\" name=\"q7\"> is a significant factor contributing to worldwide levels of soil degradation.</p>\n                </div>\n                <div class=\"question-item\">\n                     <p><strong>21</strong> Disadvantages of vertical-farming projects include the expense of setting them up, as well as their high <input class=\"blank\" name=\"q8\">.</p>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>22</strong> <input class=\"blank\" name=\"q9\"> could potentially be used to take vertical-farming facilities to areas where there is a critical food shortage.</p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-anchor\">\n<h4>Questions 20–22</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"question-item\">\n<p><strong>20</strong> A UK Government study found that <input class=\"blank\" name=\"q7\"> is a significant factor contributing to worldwide levels of soil degradation.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>21</strong> Disadvantages of vertical-farming projects include the expense of setting them up, as well as their high <input class=\"blank\" name=\"q8\">.</p>\n</div>\n<div class=\"question-item\">\n<p><strong>22</strong> <input class=\"blank\" name=\"q9\"> could potentially be used to take vertical-farming facilities to areas where there is a critical food shortage.</p>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-anchor\">\n                <h4>Questions 23–26</h4>\n                <p>Look at the following statements (Questions 23–26) and the list of people below.</p>\n                <p>Match each statement with the correct person, A, B or C.</p>\n                <p><em>NB You may use any letter more than once.</em></p>\n                \n                <div class=\"question-item\">\n                    <p><strong>23</strong> Vertical farming can have financial benefits.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q10\" type=\"radio\" value=\"A\"> A Dickson Despommier</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"B\"> B Ted Yamanoko</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"C\"> C Natalie Jeremijenko</label>\n                    </div>\n                </div>\n                \n                <div class=\"question-item\">\n                    <p><strong>24</strong> Traditional farming has had a negative effect on the natural world.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q11\" type=\"radio\" value=\"A\"> A Dickson Despommier</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"B\"> B Ted Yamanoko</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"C\"> C Natalie Jeremijenko</label>\n                    </div>\n                </div>\n\n                <div class=\"question-item\">\n                    <p><strong>25</strong> Vertical farming could dramatically increase world food production.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q12\" type=\"radio\" value=\"A\"> A Dickson Despommier</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"B\"> B Ted Yamanoko</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"C\"> C Natalie Jeremijenko</label>\n                    </div>\n                </div>\n                \n                <div class=\"question-item\">\n                    <p><strong>26</strong> Traditional farms may benefit from wider use of vertical farming.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q13\" type=\"radio\" value=\"A\"> A Dickson Despommier</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"B\"> B Ted Yamanoko</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"C\"> C Natalie Jeremijenko</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<h4>Questions 23–26</h4>\n<p>Look at the following statements (Questions 23–26) and the list of people below.</p>\n<p>Match each statement with the correct person, A, B or C.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"question-item\">\n<p><strong>23</strong> Vertical farming can have financial benefits.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"> A Dickson Despommier</label> <label><input name=\"q10\" type=\"radio\" value=\"B\"> B Ted Yamanoko</label> <label><input name=\"q10\" type=\"radio\" value=\"C\"> C Natalie Jeremijenko</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>24</strong> Traditional farming has had a negative effect on the natural world.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"> A Dickson Despommier</label> <label><input name=\"q11\" type=\"radio\" value=\"B\"> B Ted Yamanoko</label> <label><input name=\"q11\" type=\"radio\" value=\"C\"> C Natalie Jeremijenko</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>25</strong> Vertical farming could dramatically increase world food production.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"A\"> A Dickson Despommier</label> <label><input name=\"q12\" type=\"radio\" value=\"B\"> B Ted Yamanoko</label> <label><input name=\"q12\" type=\"radio\" value=\"C\"> C Natalie Jeremijenko</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>26</strong> Traditional farms may benefit from wider use of vertical farming.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"> A Dickson Despommier</label> <label><input name=\"q13\" type=\"radio\" value=\"B\"> B Ted Yamanoko</label> <label><input name=\"q13\" type=\"radio\" value=\"C\"> C Natalie Jeremijenko</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
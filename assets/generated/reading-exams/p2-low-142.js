@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 2</h2>\n            <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n            \n            <h3>The fashion industry</h3>\n            \n            <p><strong>A</strong> The fashion industry is a multibillion-dollar global enterprise devoted to the business of making and selling clothes. It encompasses all types of garments, from designer fashions to ordinary everyday clothing. Because data on the industry are typically reported for national economies and expressed in terms of its many separate sectors, total figures for world production of textiles and clothing are difficult to obtain. However, by any measure, the industry accounts for a significant share of world economic output.</p>\n            <p><strong>B</strong> The fashion industry is a product of the modern age. Prior to the mid-19th century, virtually all clothing was handmade for individuals, either as home production or on order from dressmakers and tailors. By the beginning of the 20th century, with the development of new technologies such as the sewing machine, the factory system of production, and the growth of department stores and other retail outlets, clothing had increasingly come to be mass-produced in standard sizes and sold at fixed prices. Although the fashion industry developed first in Europe, today it is highly globalised, with garments often designed in one country, manufactured in another, and sold in a third. For example, an American fashion company might source fabric in China, have the clothes manufactured in Vietnam, finished in Italy, and shipped to a warehouse in the United States for distribution to retail outlets internationally.</p>\n            <p><strong>C</strong> One of the first accomplishments of the Industrial Revolution in the 18th century was the partial automation of the spinning and weaving of wool, cotton, silk and other natural fibres. Today, these processes are highly automated and carried out by computer-controlled, high-speed machinery, and fabrics made from both natural fibres and synthetic fibres (such as nylon, acrylic and polyester) are produced. A growing interest in sustainable fashion (or ‘eco-fashion') has led to greater use of environmentally friendly fibres, such as hemp. In addition, high-tech synthetic fabrics confer such properties as moisture absorption, stain resistance, retention or dissipation of body heat, and protection against fire, weapons, cold, ultraviolet radiation and other hazards. Fabrics are also produced with a wide range of visual effects through dyeing, weaving, printing and other processes. Together with fashion forecasters, fabric manufacturers work well in advance of the clothing production cycle to create fabrics with colours, textures and other qualities that anticipate consumer demand.</p>\n            <p><strong>D</strong> Historically, very few fashion designers have become famous—brands such as Coco Chanel or Calvin Klein—who have been responsible for prestigious high-fashion collections. These designers are influential in the fashion world, but, contrary to popular belief, they do not dictate new fashions; rather, they endeavour to design clothes that will meet consumer demand. The vast majority of designers work anonymously for manufacturers, as part of design teams, adapting designs into marketable garments for average consumers. They draw inspiration from a wide range of sources, including film and television costumes, street clothing and active sportswear.</p>\n            <p><strong>E</strong> An important stage in garment production is the translation of the clothing design into templates, in a range of sizes, for cutting the cloth. Because the proportions of the human body change with increases or decreases in weight, templates cannot simply be scaled up or down. Template-making was traditionally a highly skilled profession. Today, despite innovations in computer programming, designs in larger sizes are difficult to adjust for every body shape. Whatever the size, the template—whether drawn on paper or programmed as a set of computer instructions—determines how fabric is cut into the pieces that will be joined to make a garment. For all but the most expensive clothing, fabric cutting is accomplished by computer-guided knives or high-intensity lasers that can cut many layers of fabric at once.</p>\n            <p><strong>F</strong> The next stage of production is the assembly process. Some companies use their own production facilities for some or all of the manufacturing process, but the majority rely on separately owned manufacturing firms or contractors to produce garments to their specifications. In the field of women's clothing, manufacturers typically produce several product lines a year, which they deliver to retailers on predetermined dates. Technological innovation, including the development of computer-guided machinery, has resulted in the automation of some stages of assembly. Nevertheless, the fundamental process of sewing remains labour-intensive. In the late 20th century, China emerged as the world's largest producer of clothing because of its low labour costs and highly disciplined workforce. Assembled items then go through various processes collectively known as 'finishing'. These include the addition of decorative elements, fasteners, brand-name labels and other labels (often legally required) specifying fibre content, laundry instructions and country of manufacture. Finished items are then pressed and packed for shipment.</p>\n            <p><strong>G</strong> For much of the period following World War II, trade in textiles and garments was strictly regulated by purchasing countries, which imposed quotas and tariffs. Since the 1980s, these protectionist measures, which were intended (ultimately without success) to prevent textile and clothing production from moving from high-wage to low-wage countries, have gradually been abandoned. They have been replaced by a free-trade approach, under the regulatory control of global organisations. The advent of metal shipping containers and relatively inexpensive air freight has also made it possible for production to be closely tied to market conditions, even across globe-spanning distances.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>The fashion industry</h3>\n<p><strong>A</strong> The fashion industry is a multibillion-dollar global enterprise devoted to the business of making and selling clothes. It encompasses all types of garments, from designer fashions to ordinary everyday clothing. Because data on the industry are typically reported for national economies and expressed in terms of its many separate sectors, total figures for world production of textiles and clothing are difficult to obtain. However, by any measure, the industry accounts for a significant share of world economic output.</p>\n<p><strong>B</strong> The fashion industry is a product of the modern age. Prior to the mid-19th century, virtually all clothing was handmade for individuals, either as home production or on order from dressmakers and tailors. By the beginning of the 20th century, with the development of new technologies such as the sewing machine, the factory system of production, and the growth of department stores and other retail outlets, clothing had increasingly come to be mass-produced in standard sizes and sold at fixed prices. Although the fashion industry developed first in Europe, today it is highly globalised, with garments often designed in one country, manufactured in another, and sold in a third. For example, an American fashion company might source fabric in China, have the clothes manufactured in Vietnam, finished in Italy, and shipped to a warehouse in the United States for distribution to retail outlets internationally.</p>\n<p><strong>C</strong> One of the first accomplishments of the Industrial Revolution in the 18th century was the partial automation of the spinning and weaving of wool, cotton, silk and other natural fibres. Today, these processes are highly automated and carried out by computer-controlled, high-speed machinery, and fabrics made from both natural fibres and synthetic fibres (such as nylon, acrylic and polyester) are produced. A growing interest in sustainable fashion (or ‘eco-fashion') has led to greater use of environmentally friendly fibres, such as hemp. In addition, high-tech synthetic fabrics confer such properties as moisture absorption, stain resistance, retention or dissipation of body heat, and protection against fire, weapons, cold, ultraviolet radiation and other hazards. Fabrics are also produced with a wide range of visual effects through dyeing, weaving, printing and other processes. Together with fashion forecasters, fabric manufacturers work well in advance of the clothing production cycle to create fabrics with colours, textures and other qualities that anticipate consumer demand.</p>\n<p><strong>D</strong> Historically, very few fashion designers have become famous—brands such as Coco Chanel or Calvin Klein—who have been responsible for prestigious high-fashion collections. These designers are influential in the fashion world, but, contrary to popular belief, they do not dictate new fashions; rather, they endeavour to design clothes that will meet consumer demand. The vast majority of designers work anonymously for manufacturers, as part of design teams, adapting designs into marketable garments for average consumers. They draw inspiration from a wide range of sources, including film and television costumes, street clothing and active sportswear.</p>\n<p><strong>E</strong> An important stage in garment production is the translation of the clothing design into templates, in a range of sizes, for cutting the cloth. Because the proportions of the human body change with increases or decreases in weight, templates cannot simply be scaled up or down. Template-making was traditionally a highly skilled profession. Today, despite innovations in computer programming, designs in larger sizes are difficult to adjust for every body shape. Whatever the size, the template—whether drawn on paper or programmed as a set of computer instructions—determines how fabric is cut into the pieces that will be joined to make a garment. For all but the most expensive clothing, fabric cutting is accomplished by computer-guided knives or high-intensity lasers that can cut many layers of fabric at once.</p>\n<p><strong>F</strong> The next stage of production is the assembly process. Some companies use their own production facilities for some or all of the manufacturing process, but the majority rely on separately owned manufacturing firms or contractors to produce garments to their specifications. In the field of women's clothing, manufacturers typically produce several product lines a year, which they deliver to retailers on predetermined dates. Technological innovation, including the development of computer-guided machinery, has resulted in the automation of some stages of assembly. Nevertheless, the fundamental process of sewing remains labour-intensive. In the late 20th century, China emerged as the world's largest producer of clothing because of its low labour costs and highly disciplined workforce. Assembled items then go through various processes collectively known as 'finishing'. These include the addition of decorative elements, fasteners, brand-name labels and other labels (often legally required) specifying fibre content, laundry instructions and country of manufacture. Finished items are then pressed and packed for shipment.</p>\n<p><strong>G</strong> For much of the period following World War II, trade in textiles and garments was strictly regulated by purchasing countries, which imposed quotas and tariffs. Since the 1980s, these protectionist measures, which were intended (ultimately without success) to prevent textile and clothing production from moving from high-wage to low-wage countries, have gradually been abandoned. They have been replaced by a free-trade approach, under the regulatory control of global organisations. The advent of metal shipping containers and relatively inexpensive air freight has also made it possible for production to be closely tied to market conditions, even across globe-spanning distances.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -37,7 +37,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n                <h4>Questions 14–20</h4>\n                <p>Reading Passage 2 has seven sections, <strong>A–G</strong>.</p>\n                <p>Choose the correct heading for each section from the list of headings below.</p>\n                <p><em>Write the correct number, <strong>i–viii</strong>, in boxes 14–20 on your answer sheet.</em></p>\n                \n                <ul class=\"headings-list\">\n                    <li><strong>List of Headings</strong></li>\n                    <li><strong>i</strong> &nbsp; How new clothing styles are created</li>\n                    <li><strong>ii</strong> &nbsp; The rise of the fashion industry</li>\n                    <li><strong>iii</strong> &nbsp; Joining the garment pieces together</li>\n                    <li><strong>iv</strong> &nbsp; Producing materials with a range of features</li>\n                    <li><strong>v</strong> &nbsp; The importance of the fashion industry</li>\n                    <li><strong>vi</strong> &nbsp; Factors affecting international commerce</li>\n                    <li><strong>vii</strong> &nbsp; The attractions of becoming a fashion model</li>\n                    <li><strong>viii</strong> &nbsp; Making patterns for people with different figures</li>\n                </ul>\n\n                <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                        <thead>\n                            <tr>\n                                <th>Section</th><th>i</th><th>ii</th><th>iii</th><th>iv</th><th>v</th><th>vi</th><th>vii</th><th>viii</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>14</strong> Section A</td>\n                                <td><input type=\"radio\" name=\"q1\" value=\"i\"></td><td><input type=\"radio\" name=\"q1\" value=\"ii\"></td><td><input type=\"radio\" name=\"q1\" value=\"iii\"></td><td><input type=\"radio\" name=\"q1\" value=\"iv\"></td><td><input type=\"radio\" name=\"q1\" value=\"v\"></td><td><input type=\"radio\" name=\"q1\" value=\"vi\"></td><td><input type=\"radio\" name=\"q1\" value=\"vii\"></td><td><input type=\"radio\" name=\"q1\" value=\"viii\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>15</strong> Section B</td>\n                                <td><input type=\"radio\" name=\"q2\" value=\"i\"></td><td><input type=\"radio\" name=\"q2\" value=\"ii\"></td><td><input type=\"radio\" name=\"q2\" value=\"iii\"></td><td><input type=\"radio\" name=\"q2\" value=\"iv\"></td><td><input type=\"radio\" name=\"q2\" value=\"v\"></td><td><input type=\"radio\" name=\"q2\" value=\"vi\"></td><td><input type=\"radio\" name=\"q2\" value=\"vii\"></td><td><input type=\"radio\" name=\"q2\" value=\"viii\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>16</strong> Section C</td>\n                                <td><input type=\"radio\" name=\"q3\" value=\"i\"></td><td><input type=\"radio\" name=\"q3\" value=\"ii\"></td><td><input type=\"radio\" name=\"q3\" value=\"iii\"></td><td><input type=\"radio\" name=\"q3\" value=\"iv\"></td><td><input type=\"radio\" name=\"q3\" value=\"v\"></td><td><input type=\"radio\" name=\"q3\" value=\"vi\"></td><td><input type=\"radio\" name=\"q3\" value=\"vii\"></td><td><input type=\"radio\" name=\"q3\" value=\"viii\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>17</strong> Section D</td>\n                                <td><input type=\"radio\" name=\"q4\" value=\"i\"></td><td><input type=\"radio\" name=\"q4\" value=\"ii\"></td><td><input type=\"radio\" name=\"q4\" value=\"iii\"></td><td><input type=\"radio\" name=\"q4\" value=\"iv\"></td><td><input type=\"radio\" name=\"q4\" value=\"v\"></td><td><input type=\"radio\" name=\"q4\" value=\"vi\"></td><td><input type=\"radio\" name=\"q4\" value=\"vii\"></td><td><input type=\"radio\" name=\"q4\" value=\"viii\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>18</strong> Section E</td>\n                                <td><input type=\"radio\" name=\"q5\" value=\"i\"></td><td><input type=\"radio\" name=\"q5\" value=\"ii\"></td><td><input type=\"radio\" name=\"q5\" value=\"iii\"></td><td><input type=\"radio\" name=\"q5\" value=\"iv\"></td><td><input type=\"radio\" name=\"q5\" value=\"v\"></td><td><input type=\"radio\" name=\"q5\" value=\"vi\"></td><td><input type=\"radio\" name=\"q5\" value=\"vii\"></td><td><input type=\"radio\" name=\"q5\" value=\"viii\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>19</strong> Section F</td>\n                                <td><input type=\"radio\" name=\"q6\" value=\"i\"></td><td><input type=\"radio\" name=\"q6\" value=\"ii\"></td><td><input type=\"radio\" name=\"q6\" value=\"iii\"></td><td><input type=\"radio\" name=\"q6\" value=\"iv\"></td><td><input type=\"radio\" name=\"q6\" value=\"v\"></td><td><input type=\"radio\" name=\"q6\" value=\"vi\"></td><td><input type=\"radio\" name=\"q6\" value=\"vii\"></td><td><input type=\"radio\" name=\"q6\" value=\"viii\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>20</strong> Section G</td>\n                                <td><input type=\"radio\" name=\"q7\" value=\"i\"></td><td><input type=\"radio\" name=\"q7\" value=\"ii\"></td><td><input type=\"radio\" name=\"q7\" value=\"iii\"></td><td><input type=\"radio\" name=\"q7\" value=\"iv\"></td><td><input type=\"radio\" name=\"q7\" value=\"v\"></td><td><input type=\"radio\" name=\"q7\" value=\"vi\"></td><td><input type=\"radio\" name=\"q7\" value=\"vii\"></td><td><input type=\"radio\" name=\"q7\" value=\"viii\"></td>\n                           </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 14–20</h4>\n<p>Reading Passage 2 has seven sections, <strong>A–G</strong>.</p>\n<p>Choose the correct heading for each section from the list of headings below.</p>\n<p><em>Write the correct number, <strong>i–viii</strong>, in boxes 14–20 on your answer sheet.</em></p>\n<ul class=\"headings-list\">\n<li><strong>List of Headings</strong></li>\n<li><strong>i</strong> &nbsp; How new clothing styles are created</li>\n<li><strong>ii</strong> &nbsp; The rise of the fashion industry</li>\n<li><strong>iii</strong> &nbsp; Joining the garment pieces together</li>\n<li><strong>iv</strong> &nbsp; Producing materials with a range of features</li>\n<li><strong>v</strong> &nbsp; The importance of the fashion industry</li>\n<li><strong>vi</strong> &nbsp; Factors affecting international commerce</li>\n<li><strong>vii</strong> &nbsp; The attractions of becoming a fashion model</li>\n<li><strong>viii</strong> &nbsp; Making patterns for people with different figures</li>\n</ul>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th>Section</th><th>i</th><th>ii</th><th>iii</th><th>iv</th><th>v</th><th>vi</th><th>vii</th><th>viii</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> Section A</td>\n<td><input type=\"radio\" name=\"q1\" value=\"i\"></td><td><input type=\"radio\" name=\"q1\" value=\"ii\"></td><td><input type=\"radio\" name=\"q1\" value=\"iii\"></td><td><input type=\"radio\" name=\"q1\" value=\"iv\"></td><td><input type=\"radio\" name=\"q1\" value=\"v\"></td><td><input type=\"radio\" name=\"q1\" value=\"vi\"></td><td><input type=\"radio\" name=\"q1\" value=\"vii\"></td><td><input type=\"radio\" name=\"q1\" value=\"viii\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> Section B</td>\n<td><input type=\"radio\" name=\"q2\" value=\"i\"></td><td><input type=\"radio\" name=\"q2\" value=\"ii\"></td><td><input type=\"radio\" name=\"q2\" value=\"iii\"></td><td><input type=\"radio\" name=\"q2\" value=\"iv\"></td><td><input type=\"radio\" name=\"q2\" value=\"v\"></td><td><input type=\"radio\" name=\"q2\" value=\"vi\"></td><td><input type=\"radio\" name=\"q2\" value=\"vii\"></td><td><input type=\"radio\" name=\"q2\" value=\"viii\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> Section C</td>\n<td><input type=\"radio\" name=\"q3\" value=\"i\"></td><td><input type=\"radio\" name=\"q3\" value=\"ii\"></td><td><input type=\"radio\" name=\"q3\" value=\"iii\"></td><td><input type=\"radio\" name=\"q3\" value=\"iv\"></td><td><input type=\"radio\" name=\"q3\" value=\"v\"></td><td><input type=\"radio\" name=\"q3\" value=\"vi\"></td><td><input type=\"radio\" name=\"q3\" value=\"vii\"></td><td><input type=\"radio\" name=\"q3\" value=\"viii\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> Section D</td>\n<td><input type=\"radio\" name=\"q4\" value=\"i\"></td><td><input type=\"radio\" name=\"q4\" value=\"ii\"></td><td><input type=\"radio\" name=\"q4\" value=\"iii\"></td><td><input type=\"radio\" name=\"q4\" value=\"iv\"></td><td><input type=\"radio\" name=\"q4\" value=\"v\"></td><td><input type=\"radio\" name=\"q4\" value=\"vi\"></td><td><input type=\"radio\" name=\"q4\" value=\"vii\"></td><td><input type=\"radio\" name=\"q4\" value=\"viii\"></td>\n</tr>\n<tr>\n<td><strong>18</strong> Section E</td>\n<td><input type=\"radio\" name=\"q5\" value=\"i\"></td><td><input type=\"radio\" name=\"q5\" value=\"ii\"></td><td><input type=\"radio\" name=\"q5\" value=\"iii\"></td><td><input type=\"radio\" name=\"q5\" value=\"iv\"></td><td><input type=\"radio\" name=\"q5\" value=\"v\"></td><td><input type=\"radio\" name=\"q5\" value=\"vi\"></td><td><input type=\"radio\" name=\"q5\" value=\"vii\"></td><td><input type=\"radio\" name=\"q5\" value=\"viii\"></td>\n</tr>\n<tr>\n<td><strong>19</strong> Section F</td>\n<td><input type=\"radio\" name=\"q6\" value=\"i\"></td><td><input type=\"radio\" name=\"q6\" value=\"ii\"></td><td><input type=\"radio\" name=\"q6\" value=\"iii\"></td><td><input type=\"radio\" name=\"q6\" value=\"iv\"></td><td><input type=\"radio\" name=\"q6\" value=\"v\"></td><td><input type=\"radio\" name=\"q6\" value=\"vi\"></td><td><input type=\"radio\" name=\"q6\" value=\"vii\"></td><td><input type=\"radio\" name=\"q6\" value=\"viii\"></td>\n</tr>\n<tr>\n<td><strong>20</strong> Section G</td>\n<td><input type=\"radio\" name=\"q7\" value=\"i\"></td><td><input type=\"radio\" name=\"q7\" value=\"ii\"></td><td><input type=\"radio\" name=\"q7\" value=\"iii\"></td><td><input type=\"radio\" name=\"q7\" value=\"iv\"></td><td><input type=\"radio\" name=\"q7\" value=\"v\"></td><td><input type=\"radio\" name=\"q7\" value=\"vi\"></td><td><input type=\"radio\" name=\"q7\" value=\"vii\"></td><td><input type=\"radio\" name=\"q7\" value=\"viii\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -49,7 +49,7 @@
         "q10",
         "q11"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-anchor\">\n                 <h4>Questions 21–24</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n                <div class=\"summary-completion\">\n                    <h4>The development of a modern fashion industry</h4>\n                    <p>\n                    Up until the middle of the 19th century, people generally wore handmade clothes. After that the situation changed, and by the 20th century many clothes were mass-produced. This development was partly due to inventions like the <strong>21</strong> <input type=\"text\" id=\"q21_input\" name=\"q8\">. It was also the result of general changes in manufacturing systems, as well as the spread of shops like <strong>22</strong> <input type=\"text\" id=\"q22_input\" name=\"q9\">. The changes also led to the standardisation of sizes and <strong>23</strong> <input type=\"text\" id=\"q23_input\" name=\"q10\">. Today, despite the fact that the fashion industry originated in <strong>24</strong> <input type=\"text\" id=\"q24_input\" name=\"q11\">, it has become a truly international enterprise.\n                    </p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-anchor\">\n<h4>Questions 21–24</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>The development of a modern fashion industry</h4>\n<p>\nUp until the middle of the 19th century, people generally wore handmade clothes. After that the situation changed, and by the 20th century many clothes were mass-produced. This development was partly due to inventions like the <strong>21</strong> <input type=\"text\" id=\"q21_input\" name=\"q8\">. It was also the result of general changes in manufacturing systems, as well as the spread of shops like <strong>22</strong> <input type=\"text\" id=\"q22_input\" name=\"q9\">. The changes also led to the standardisation of sizes and <strong>23</strong> <input type=\"text\" id=\"q23_input\" name=\"q10\">. Today, despite the fact that the fashion industry originated in <strong>24</strong> <input type=\"text\" id=\"q24_input\" name=\"q11\">, it has become a truly international enterprise.\n</p>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -58,7 +58,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group checkbox-question\" id=\"q12-13-anchor\">\n                <h4>Questions 25 and 26</h4>\n                <p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n                <p>Which <strong>TWO</strong> of the following statements does the writer make about garment assembly?</p>\n                <div class=\"options\">\n                    <label><input type=\"checkbox\" name=\"q12_13\" value=\"A\"> A The majority of sewing is done by computer-operated machines.</label>\n                    <label><input type=\"checkbox\" name=\"q12_13\" value=\"B\"> B Highly skilled workers are the most important requirement.</label>\n                    <label><input type=\"checkbox\" name=\"q12_13\" value=\"C\"> C Most businesses use other companies to manufacture their products.</label>\n                    <label><input type=\"checkbox\" name=\"q12_13\" value=\"D\"> D Fasteners and labels are attached after the clothes have been made up.</label>\n                    <label><input type=\"checkbox\" name=\"q12_13\" value=\"E\"> E Manufacturers usually produce one range of women's clothing annually.</label>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group checkbox-question\" id=\"q12-13-anchor\">\n<h4>Questions 25 and 26</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>Which <strong>TWO</strong> of the following statements does the writer make about garment assembly?</p>\n<div class=\"options\">\n<label><input type=\"checkbox\" name=\"q12_13\" value=\"A\"> A The majority of sewing is done by computer-operated machines.</label> <label><input type=\"checkbox\" name=\"q12_13\" value=\"B\"> B Highly skilled workers are the most important requirement.</label> <label><input type=\"checkbox\" name=\"q12_13\" value=\"C\"> C Most businesses use other companies to manufacture their products.</label> <label><input type=\"checkbox\" name=\"q12_13\" value=\"D\"> D Fasteners and labels are attached after the clothes have been made up.</label> <label><input type=\"checkbox\" name=\"q12_13\" value=\"E\"> E Manufacturers usually produce one range of women's clothing annually.</label>\n</div>\n</div>"
     }
   ],
   "answerKey": {
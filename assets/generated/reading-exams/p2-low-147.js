@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 2</h2>\n            <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n            \n            <h3>Who wrote Shakespeare's plays?</h3>\n            <h4>Experts suggest 'Shakespeare' may have been a pseudonym - a pen-name - for another writer.</h4>\n            <p><i>Robert Matthews investigates</i></p>\n\n            <p><strong>A</strong> Even today, almost 400 years after his death, the works of the famous English dramatist William Shakespeare have lost none of their appeal, nor have questions about the source of his genius. For is it really credible that an ordinary actor from the small town of Stratford-upon-Avon should metamorphose into so extraordinary a dramatist? For some, the answer is obvious: Shakespeare was a genius whose gift is no more suspicious than that of the physicist Albert Einstein, the German salesman's son who devised the theory of relativity. But others have insisted that a mere school leaver simply could not have penned such sophisticated works. They believe that Shakespeare was a pseudonym for someone with far more impressive qualifications who wrote the plays that still play to packed theatres today. But after long and largely fruitless debate, researchers are now turning to scientific methods to resolve the controversies surrounding Shakespeare. Ways of identifying the literary ‘fingerprint' of writers are currently being developed using computers. This analysis of features of literary style is known as 'stylometry' and with it researchers can recognise the work of Shakespeare and his contemporaries with impressive reliability.</p>\n            <p><strong>B</strong> The idea of using these basic scientific techniques to probe questions of authorship dates back to 1851, when the Victorian mathematician Augustus de Morgan suggested that different authors might be identified through the frequency with which they used words of different lengths. His idea attracted the attention of Thomas Mendenhall, an American physicist who decided to use word length to investigate one of the oldest controversies about the works of Shakespeare: were they actually written by someone else?</p>\n            <p><strong>C</strong> As long ago as 1785, the Elizabethan writer and philosopher Sir Francis Bacon was identified as a possible contender for having written Shakespeare's works. Bacon's possible motivation for not wanting to be known as the author of such masterpieces is far from clear, but Mendenhall believed his methods might at least reveal telltale signs of Bacon's hand in the plays. However, his results, published in 1901, revealed Bacon's writing style to be quite unlike that of Shakespeare. But Mendenhall's methods also revealed some key concerns. Recognising the need to include large samples of writing from both authors, Mendenhall lumped all their works together, despite the fact that literary style can vary enormously between plays, poetry and philosophy, for example. His focus on word length as the sole 'fingerprint' of writing style was also questionable - for how could he be sure that some other characteristics would not give different results? But Mendenhall's biggest fault was perhaps simply that he was too far ahead of his time - he was attempting a task that cried out for the kind of computers not even conceivable over 100 years ago. More recently with their development scholars have been able to look for subtle peculiarities among the complete works of authors, which, in Shakespeare's case, amount to over 800,000 words.</p>\n            <p><strong>D</strong> One of the key controversies now being probed is Shakespeare's relationship with other dramatists. Was he a lone genius or was his work the result of collaboration? Traditional methods of investigating such questions have relied on traits like the use of metaphor, but these may be shared by different authors simply on cultural grounds. In contrast, modern stylometry focuses on far more fundamental characteristics which are less likely to be shared by others. The text-crunching power of computers allows researchers to pinpoint phrases, words or even individual letters by their frequency in the work of different authors. Pattern recognition techniques are then used to develop a 'fingerprint' for each author.</p>\n            <p><strong>E</strong> Stylometry has come up with little to encourage the continual number of experts who insist Shakespeare was simply too uneducated to create works of enduring brilliance. In 1996, literary scholar Ward Elliott and mathematician Robert Valenza of Claremont McKenna College, California, published the results of a stylometric comparison of the works of Shakespeare with those of over 30 of the proposed 'real' authors. Elliott and Valenza applied a battery of 51 tests to computerised texts and found that none of the claimants had a stylometric 'fingerprint' similar to that of Shakespeare. “I think these claims were driven initially by a sense that Shakespeare is too 'important' to be an ordinary person,” says Professor Kate McCluskey, director of the Shakespeare Institute at the University of Birmingham.</p>\n            <p><strong>F</strong> Elliott and Valenza's research found something else too. Some of the earliest plays, notably Henry VI and the notoriously violent Titus Andronicus, seem to be a combination of Shakespeare and his brilliant contemporary the playwright Christopher Marlowe, who was born in the same year as Shakespeare. 'Traditional scholars accept that Marlowe influenced Shakespeare's early work,' says Dr Thomas Merriam, one of Britain's leading stylometry experts. He explains that, provisionally at least, stylometric studies suggest some of Marlowe's actual text exists within the early plays of Shakespeare.</p>\n            <p><strong>G</strong> Some scholars remain cautious about basing new views of Shakespeare's career on stylometric analysis of centuries-old texts. \"If they have been edited, amended or shortened, then the data from them is highly compromised,” says Dr Markus Dahl of London University. Even so, the results to date are in line with the growing view of Shakespeare as a hardworking professional who perfected his skills throughout his career.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Who wrote Shakespeare's plays?</h3>\n<h4>Experts suggest 'Shakespeare' may have been a pseudonym - a pen-name - for another writer.</h4>\n<p><i>Robert Matthews investigates</i></p>\n<p><strong>A</strong> Even today, almost 400 years after his death, the works of the famous English dramatist William Shakespeare have lost none of their appeal, nor have questions about the source of his genius. For is it really credible that an ordinary actor from the small town of Stratford-upon-Avon should metamorphose into so extraordinary a dramatist? For some, the answer is obvious: Shakespeare was a genius whose gift is no more suspicious than that of the physicist Albert Einstein, the German salesman's son who devised the theory of relativity. But others have insisted that a mere school leaver simply could not have penned such sophisticated works. They believe that Shakespeare was a pseudonym for someone with far more impressive qualifications who wrote the plays that still play to packed theatres today. But after long and largely fruitless debate, researchers are now turning to scientific methods to resolve the controversies surrounding Shakespeare. Ways of identifying the literary ‘fingerprint' of writers are currently being developed using computers. This analysis of features of literary style is known as 'stylometry' and with it researchers can recognise the work of Shakespeare and his contemporaries with impressive reliability.</p>\n<p><strong>B</strong> The idea of using these basic scientific techniques to probe questions of authorship dates back to 1851, when the Victorian mathematician Augustus de Morgan suggested that different authors might be identified through the frequency with which they used words of different lengths. His idea attracted the attention of Thomas Mendenhall, an American physicist who decided to use word length to investigate one of the oldest controversies about the works of Shakespeare: were they actually written by someone else?</p>\n<p><strong>C</strong> As long ago as 1785, the Elizabethan writer and philosopher Sir Francis Bacon was identified as a possible contender for having written Shakespeare's works. Bacon's possible motivation for not wanting to be known as the author of such masterpieces is far from clear, but Mendenhall believed his methods might at least reveal telltale signs of Bacon's hand in the plays. However, his results, published in 1901, revealed Bacon's writing style to be quite unlike that of Shakespeare. But Mendenhall's methods also revealed some key concerns. Recognising the need to include large samples of writing from both authors, Mendenhall lumped all their works together, despite the fact that literary style can vary enormously between plays, poetry and philosophy, for example. His focus on word length as the sole 'fingerprint' of writing style was also questionable - for how could he be sure that some other characteristics would not give different results? But Mendenhall's biggest fault was perhaps simply that he was too far ahead of his time - he was attempting a task that cried out for the kind of computers not even conceivable over 100 years ago. More recently with their development scholars have been able to look for subtle peculiarities among the complete works of authors, which, in Shakespeare's case, amount to over 800,000 words.</p>\n<p><strong>D</strong> One of the key controversies now being probed is Shakespeare's relationship with other dramatists. Was he a lone genius or was his work the result of collaboration? Traditional methods of investigating such questions have relied on traits like the use of metaphor, but these may be shared by different authors simply on cultural grounds. In contrast, modern stylometry focuses on far more fundamental characteristics which are less likely to be shared by others. The text-crunching power of computers allows researchers to pinpoint phrases, words or even individual letters by their frequency in the work of different authors. Pattern recognition techniques are then used to develop a 'fingerprint' for each author.</p>\n<p><strong>E</strong> Stylometry has come up with little to encourage the continual number of experts who insist Shakespeare was simply too uneducated to create works of enduring brilliance. In 1996, literary scholar Ward Elliott and mathematician Robert Valenza of Claremont McKenna College, California, published the results of a stylometric comparison of the works of Shakespeare with those of over 30 of the proposed 'real' authors. Elliott and Valenza applied a battery of 51 tests to computerised texts and found that none of the claimants had a stylometric 'fingerprint' similar to that of Shakespeare. “I think these claims were driven initially by a sense that Shakespeare is too 'important' to be an ordinary person,” says Professor Kate McCluskey, director of the Shakespeare Institute at the University of Birmingham.</p>\n<p><strong>F</strong> Elliott and Valenza's research found something else too. Some of the earliest plays, notably Henry VI and the notoriously violent Titus Andronicus, seem to be a combination of Shakespeare and his brilliant contemporary the playwright Christopher Marlowe, who was born in the same year as Shakespeare. 'Traditional scholars accept that Marlowe influenced Shakespeare's early work,' says Dr Thomas Merriam, one of Britain's leading stylometry experts. He explains that, provisionally at least, stylometric studies suggest some of Marlowe's actual text exists within the early plays of Shakespeare.</p>\n<p><strong>G</strong> Some scholars remain cautious about basing new views of Shakespeare's career on stylometric analysis of centuries-old texts. \"If they have been edited, amended or shortened, then the data from them is highly compromised,” says Dr Markus Dahl of London University. Even so, the results to date are in line with the growing view of Shakespeare as a hardworking professional who perfected his skills throughout his career.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                <h4>Questions 14–19</h4>\n                <p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n                <p>Which paragraph contains the following information?</p>\n                <p><em>Write the correct letter, <strong>A–G</strong>, in boxes 14–19 on your answer sheet.</em></p>\n                <p><em>NB You may use any letter more than once.</em></p>\n                <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                        <thead>\n                            <tr>\n                                <th style=\"min-width: 400px;\"></th>\n                                <th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>14</strong> uncertainty why an author would wish to remain anonymous</td>\n                                <td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>15</strong> a reference to the continuing popularity of Shakespeare's work</td>\n                                <td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>16</strong> the reasons why a particular researcher's approach proved unsatisfactory</td>\n                                <td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>17</strong> mention of the time when the use of stylometry was first proposed</td>\n                                <td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>18</strong> support for the opinion that Shakespeare became more skillful as he grew older</td>\n                                <td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>19</strong> a similarity between Shakespeare and a scientist with exceptional ability</td>\n                                <td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td>\n                            </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–G</strong>, in boxes 14–19 on your answer sheet.</em></p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 400px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> uncertainty why an author would wish to remain anonymous</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> a reference to the continuing popularity of Shakespeare's work</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> the reasons why a particular researcher's approach proved unsatisfactory</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> mention of the time when the use of stylometry was first proposed</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>18</strong> support for the opinion that Shakespeare became more skillful as he grew older</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>19</strong> a similarity between Shakespeare and a scientist with exceptional ability</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-anchor\">\n                 <h4>Questions 20–22</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                <div class=\"summary-completion\">\n                    <h5>Stylometry</h5>\n                    <p>\n                    A key controversy is Shakespeare's relationships with other writers. It has always been uncertain whether he worked in <strong>20</strong> <input type=\"text\" id=\"q20_input\" name=\"q7\"> with others or not. To investigate this issue, literary experts traditionally looked at stylistic features such as the writer's choice of metaphor, although it was recognised that this choice may have been influenced by cultural factors.\n                    </p>\n                    <p>\n                    Current stylometric analysis has been made possible by the invention of <strong>21</strong> <input type=\"text\" id=\"q21_input\" name=\"q8\">. These can identify different features of writing such as the frequency with which particular letters, words or phrases are used by different writers. By using stylometric analysis of particular characteristics and pattern recognition systems, a so-called <strong>22</strong> <input type=\"text\" id=\"q22_input\" name=\"q9\"> of a writer can be identified.\n                    </p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-anchor\">\n<h4>Questions 20–22</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h5>Stylometry</h5>\n<p>\nA key controversy is Shakespeare's relationships with other writers. It has always been uncertain whether he worked in <strong>20</strong> <input type=\"text\" id=\"q20_input\" name=\"q7\"> with others or not. To investigate this issue, literary experts traditionally looked at stylistic features such as the writer's choice of metaphor, although it was recognised that this choice may have been influenced by cultural factors.\n</p>\n<p>\nCurrent stylometric analysis has been made possible by the invention of <strong>21</strong> <input type=\"text\" id=\"q21_input\" name=\"q8\">. These can identify different features of writing such as the frequency with which particular letters, words or phrases are used by different writers. By using stylometric analysis of particular characteristics and pattern recognition systems, a so-called <strong>22</strong> <input type=\"text\" id=\"q22_input\" name=\"q9\"> of a writer can be identified.\n</p>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -58,7 +58,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-anchor\">\n                <h4>Questions 23–26</h4>\n                <p>Look at the following statements (Questions 23–26) and the list of people below.</p>\n                <p>Match each statement with the correct person, <strong>A–E</strong>.</p>\n                \n                <ul class=\"people-list\">\n                    <li><strong>List of People</strong></li>\n                    <li><strong>A</strong> &nbsp; Thomas Mendenhall</li>\n                    <li><strong>B</strong> &nbsp; Ward Elliott and Robert Valenza</li>\n                    <li><strong>C</strong> &nbsp; Professor Kate McCluskey</li>\n                    <li><strong>D</strong> &nbsp; Dr Thomas Merriam</li>\n                    <li><strong>E</strong> &nbsp; Dr Markus Dahl</li>\n                </ul>\n\n                <div class=\"matching-question-item\">\n                    <p><strong>23</strong> People search for a more distinguished author because they cannot accept that a normal individual could write such brilliant plays.</p>\n                    <div class=\"matching-options\">\n                        <label><input type=\"radio\" name=\"q10\" value=\"A\"> A</label>\n                        <label><input type=\"radio\" name=\"q10\" value=\"B\"> B</label>\n                        <label><input type=\"radio\" name=\"q10\" value=\"C\"> C</label>\n                        <label><input type=\"radio\" name=\"q10\" value=\"D\"> D</label>\n                        <label><input type=\"radio\" name=\"q10\" value=\"E\"> E</label>\n                    </div>\n                </div>\n                <div class=\"matching-question-item\">\n                    <p><strong>24</strong> It should be possible to recognise writers by examining the number of letters in the words they use.</p>\n                     <div class=\"matching-options\">\n                        <label><input type=\"radio\" name=\"q11\" value=\"A\"> A</label>\n                        <label><input type=\"radio\" name=\"q11\" value=\"B\"> B</label>\n                        <label><input type=\"radio\" name=\"q11\" value=\"C\"> C</label>\n                        <label><input type=\"radio\" name=\"q11\" value=\"D\"> D</label>\n                        <label><input type=\"radio\" name=\"q11\" value=\"E\"> E</label>\n                    </div>\n                </div>\n                <div class=\"matching-question-item\">\n                    <p><strong>25</strong> The fact that Shakespeare's works are likely to have been altered over the years raises doubts about any stylometric analysis.</p>\n                     <div class=\"matching-options\">\n                        <label><input type=\"radio\" name=\"q12\" value=\"A\"> A</label>\n                        <label><input type=\"radio\" name=\"q12\" value=\"B\"> B</label>\n                        <label><input type=\"radio\" name=\"q12\" value=\"C\"> C</label>\n                        <label><input type=\"radio\" name=\"q12\" value=\"D\"> D</label>\n                        <label><input type=\"radio\" name=\"q12\" value=\"E\"> E</label>\n                    </div>\n                </div>\n                <div class=\"matching-question-item\">\n                    <p><strong>26</strong> Analysis proves that Shakespeare's style differs from those of writers who have been suggested as the authors of the plays.</p>\n                     <div class=\"matching-options\">\n                        <label><input type=\"radio\" name=\"q13\" value=\"A\"> A</label>\n                        <label><input type=\"radio\" name=\"q13\" value=\"B\"> B</label>\n                        <label><input type=\"radio\" name=\"q13\" value=\"C\"> C</label>\n                        <label><input type=\"radio\" name=\"q13\" value=\"D\"> D</label>\n                        <label><input type=\"radio\" name=\"q13\" value=\"E\"> E</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<h4>Questions 23–26</h4>\n<p>Look at the following statements (Questions 23–26) and the list of people below.</p>\n<p>Match each statement with the correct person, <strong>A–E</strong>.</p>\n<ul class=\"people-list\">\n<li><strong>List of People</strong></li>\n<li><strong>A</strong> &nbsp; Thomas Mendenhall</li>\n<li><strong>B</strong> &nbsp; Ward Elliott and Robert Valenza</li>\n<li><strong>C</strong> &nbsp; Professor Kate McCluskey</li>\n<li><strong>D</strong> &nbsp; Dr Thomas Merriam</li>\n<li><strong>E</strong> &nbsp; Dr Markus Dahl</li>\n</ul>\n<div class=\"matching-question-item\">\n<p><strong>23</strong> People search for a more distinguished author because they cannot accept that a normal individual could write such brilliant plays.</p>\n<div class=\"matching-options\">\n<label><input type=\"radio\" name=\"q10\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q10\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q10\" value=\"C\"> C</label> <label><input type=\"radio\" name=\"q10\" value=\"D\"> D</label> <label><input type=\"radio\" name=\"q10\" value=\"E\"> E</label>\n</div>\n</div>\n<div class=\"matching-question-item\">\n<p><strong>24</strong> It should be possible to recognise writers by examining the number of letters in the words they use.</p>\n<div class=\"matching-options\">\n<label><input type=\"radio\" name=\"q11\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q11\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q11\" value=\"C\"> C</label> <label><input type=\"radio\" name=\"q11\" value=\"D\"> D</label> <label><input type=\"radio\" name=\"q11\" value=\"E\"> E</label>\n</div>\n</div>\n<div class=\"matching-question-item\">\n<p><strong>25</strong> The fact that Shakespeare's works are likely to have been altered over the years raises doubts about any stylometric analysis.</p>\n<div class=\"matching-options\">\n<label><input type=\"radio\" name=\"q12\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q12\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q12\" value=\"C\"> C</label> <label><input type=\"radio\" name=\"q12\" value=\"D\"> D</label> <label><input type=\"radio\" name=\"q12\" value=\"E\"> E</label>\n</div>\n</div>\n<div class=\"matching-question-item\">\n<p><strong>26</strong> Analysis proves that Shakespeare's style differs from those of writers who have been suggested as the authors of the plays.</p>\n<div class=\"matching-options\">\n<label><input type=\"radio\" name=\"q13\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q13\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q13\" value=\"C\"> C</label> <label><input type=\"radio\" name=\"q13\" value=\"D\"> D</label> <label><input type=\"radio\" name=\"q13\" value=\"E\"> E</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -11,7 +11,7 @@
       {
         "blockId": "passage-main",
         "kind": "text",
-        "bodyHtml": "<h2>READING PASSAGE 2</h2>\n    <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n    <h3>Ideal Homes</h3>\n    <p><em>New ideas and some old ones</em></p>\n\n    <p><span class=\"paragraph-label\">A</span> The traditional kampung houses of Malaysia do not need air‑conditioning. Built on stilts and with steep roofs, they have year‑round ventilation. The raised structure ensures a cooling breeze comes up through the floorboards, while the high roof acts as a chimney to release hot air. The airtight, concrete boxes of modern city construction, in contrast, are heat traps, says Muhammad Peter Davis of University Putra Malaysia. He has calculated that typical modern Malaysian houses are 5°C hotter than the air outside. The builders of kampung houses \"had no knowledge of modern science or engineering but they came up with the perfect design,\" says Davis.</p>\n    <p><span class=\"paragraph-label\">B</span> This story of ancient architectural sophistication and modern insanity is repeated around the world. In the name of modernism, people have thrown away architecture designed to cope with the environment in which they live, and adopted house designs originating from cold, northern environments, where the idea is to keep heat in.</p>\n    <p><span class=\"paragraph-label\">C</span> Once, the aim of architectural modernists was to build structures that kept nature out and to replace it with air‑conditioning. Now they are learning that they cannot do that effectively. Slowly, they are seeing the benefit of working with nature, rather than against it. In California, they probably use more power for air‑conditioning than anywhere else on Earth. According to Arthur Rosenfeld from the University of California, what California needs is white paint. If Los Angeles painted its roofs white, planted trees to shade buildings, and chose lighter‑colored paving, it could reduce city temperatures by 3°C and cut the annual air‑conditioning bill by US$170 million a year.</p>\n    <p><span class=\"paragraph-label\">D</span> Modern buildings are greedy in their use of energy. Much is made of the contribution of transportation to global warming, through its emissions of greenhouse gases. But, globally, transportation is responsible for just 22 per cent of carbon dioxide emissions. The building sector is responsible for 31 per cent, mostly the result of heating and air‑conditioning systems. In developing countries, where demand for electricity for buildings is rising by 5 per cent a year, the biggest demand is for air‑conditioning in modern buildings which are often designed to cope with every different climatic condition.</p>\n    <p><span class=\"paragraph-label\">E</span> Before air‑conditioning, much of the Arab world kept cool through thoughtful building design. Many buildings were built according to the principles of the wind tower, a tall structure with vertical vents at the top that open in all directions to catch any passing breeze. Typically, these wind‑tower buildings were made of local materials such as stone, mud brick, wood and palm‑tree fronds. The buildings were inward‑looking, which served the dual function of focusing attention on the courtyard, where family members spend time together, and protecting living areas from the rays of the sun.</p>\n    <p><span class=\"paragraph-label\">F</span> Throughout the Middle East today, wind towers are often little more than museum pieces. But there are exceptions. Jordan has won awards for the architecture of a village on the shores of the Red Sea, which is designed to conserve energy. Made of rough, local stone in a traditional style, it combines the ventilation system of the wind towers for summer coolness with up‑to‑date heating and floor insulation to protect against the desert cold in winter.</p>\n    <p><span class=\"paragraph-label\">G</span> Traditional building materials, like traditional building designs, are being rediscovered by those looking for low‑energy solutions to the current construction needs. Clay is one such material: As the Dutch housing contractor R van der Ley has argued in promoting a series of clay housing projects in developing countries, clay has many benefits over its industrialized version, brick. Clay blocks cost only half as much as ordinary bricks. Clay also generates work because people can find it, mould it, bake it and work it themselves. Two hundred clay bricks can be made with the fuel oil that makes just one ordinary brick. Moreover, clay is an excellent insulator against both cold and heat outside, and can easily be recycled.</p>\n    <p><span class=\"paragraph-label\">H</span> But although traditional methods and materials can be revived in appropriate settings, new green, low‑energy technologies are needed, especially in urban environments. The thermal insulation of homes in cold countries is an example. In 1983, Sweden adopted a national standard, requiring the country's homes to lose no more than 60 kilowatt‑hours per square metre over the year. To meet that standard, windows were double‑glazed, and walls and roofs insulated. Every home became a fortress against the cold air outside. Unfortunately, the rest of Europe has not followed the lead.</p>\n    <p><span class=\"paragraph-label\">I</span> In the United States, Amory Lovins has promoted a range of low‑energy technologies: \"super‑windows\", for example, which let in invisible light but can be \"tuned\" to either allow in, or reflect away, infrared solar radiation — the stuff that heats. Buildings with large expanses of window (and big energy bills) can be designed to achieve optimum temperatures.</p>\n    <p><span class=\"paragraph-label\">J</span> As well as more efficient use of energy, the world also needs new sources of renewable power. Solar energy is being tried out in the developing world, in villages often far from electricity grids. The world's biggest solar power installation got underway in the Philippines, in 2001, where a project commenced to install solar panels for 400,000 people in 150 villages. Such projects are demonstrating that countries, whether developing or developed, no longer need huge national grids to supply electricity. Every home can do its own thing with the help of a solar panel and a storage battery.</p>\n    <p><span class=\"paragraph-label\">K</span> Houses, of course, are more than machines for living in. They are social and psychological spaces, too. Future houses may not look exactly like kampungs or wind towers or any other traditional models. But to work for us and for our environment, they will have to suit us as well as these traditional forms did.</p>\n    <p>&nbsp;</p>"
+        "bodyHtml": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Ideal Homes</h3>\n<p><em>New ideas and some old ones</em></p>\n<p><span class=\"paragraph-label\">A</span> The traditional kampung houses of Malaysia do not need air‑conditioning. Built on stilts and with steep roofs, they have year‑round ventilation. The raised structure ensures a cooling breeze comes up through the floorboards, while the high roof acts as a chimney to release hot air. The airtight, concrete boxes of modern city construction, in contrast, are heat traps, says Muhammad Peter Davis of University Putra Malaysia. He has calculated that typical modern Malaysian houses are 5°C hotter than the air outside. The builders of kampung houses \"had no knowledge of modern science or engineering but they came up with the perfect design,\" says Davis.</p>\n<p><span class=\"paragraph-label\">B</span> This story of ancient architectural sophistication and modern insanity is repeated around the world. In the name of modernism, people have thrown away architecture designed to cope with the environment in which they live, and adopted house designs originating from cold, northern environments, where the idea is to keep heat in.</p>\n<p><span class=\"paragraph-label\">C</span> Once, the aim of architectural modernists was to build structures that kept nature out and to replace it with air‑conditioning. Now they are learning that they cannot do that effectively. Slowly, they are seeing the benefit of working with nature, rather than against it. In California, they probably use more power for air‑conditioning than anywhere else on Earth. According to Arthur Rosenfeld from the University of California, what California needs is white paint. If Los Angeles painted its roofs white, planted trees to shade buildings, and chose lighter‑colored paving, it could reduce city temperatures by 3°C and cut the annual air‑conditioning bill by US$170 million a year.</p>\n<p><span class=\"paragraph-label\">D</span> Modern buildings are greedy in their use of energy. Much is made of the contribution of transportation to global warming, through its emissions of greenhouse gases. But, globally, transportation is responsible for just 22 per cent of carbon dioxide emissions. The building sector is responsible for 31 per cent, mostly the result of heating and air‑conditioning systems. In developing countries, where demand for electricity for buildings is rising by 5 per cent a year, the biggest demand is for air‑conditioning in modern buildings which are often designed to cope with every different climatic condition.</p>\n<p><span class=\"paragraph-label\">E</span> Before air‑conditioning, much of the Arab world kept cool through thoughtful building design. Many buildings were built according to the principles of the wind tower, a tall structure with vertical vents at the top that open in all directions to catch any passing breeze. Typically, these wind‑tower buildings were made of local materials such as stone, mud brick, wood and palm‑tree fronds. The buildings were inward‑looking, which served the dual function of focusing attention on the courtyard, where family members spend time together, and protecting living areas from the rays of the sun.</p>\n<p><span class=\"paragraph-label\">F</span> Throughout the Middle East today, wind towers are often little more than museum pieces. But there are exceptions. Jordan has won awards for the architecture of a village on the shores of the Red Sea, which is designed to conserve energy. Made of rough, local stone in a traditional style, it combines the ventilation system of the wind towers for summer coolness with up‑to‑date heating and floor insulation to protect against the desert cold in winter.</p>\n<p><span class=\"paragraph-label\">G</span> Traditional building materials, like traditional building designs, are being rediscovered by those looking for low‑energy solutions to the current construction needs. Clay is one such material: As the Dutch housing contractor R van der Ley has argued in promoting a series of clay housing projects in developing countries, clay has many benefits over its industrialized version, brick. Clay blocks cost only half as much as ordinary bricks. Clay also generates work because people can find it, mould it, bake it and work it themselves. Two hundred clay bricks can be made with the fuel oil that makes just one ordinary brick. Moreover, clay is an excellent insulator against both cold and heat outside, and can easily be recycled.</p>\n<p><span class=\"paragraph-label\">H</span> But although traditional methods and materials can be revived in appropriate settings, new green, low‑energy technologies are needed, especially in urban environments. The thermal insulation of homes in cold countries is an example. In 1983, Sweden adopted a national standard, requiring the country's homes to lose no more than 60 kilowatt‑hours per square metre over the year. To meet that standard, windows were double‑glazed, and walls and roofs insulated. Every home became a fortress against the cold air outside. Unfortunately, the rest of Europe has not followed the lead.</p>\n<p><span class=\"paragraph-label\">I</span> In the United States, Amory Lovins has promoted a range of low‑energy technologies: \"super‑windows\", for example, which let in invisible light but can be \"tuned\" to either allow in, or reflect away, infrared solar radiation — the stuff that heats. Buildings with large expanses of window (and big energy bills) can be designed to achieve optimum temperatures.</p>\n<p><span class=\"paragraph-label\">J</span> As well as more efficient use of energy, the world also needs new sources of renewable power. Solar energy is being tried out in the developing world, in villages often far from electricity grids. The world's biggest solar power installation got underway in the Philippines, in 2001, where a project commenced to install solar panels for 400,000 people in 150 villages. Such projects are demonstrating that countries, whether developing or developed, no longer need huge national grids to supply electricity. Every home can do its own thing with the help of a solar panel and a storage battery.</p>\n<p><span class=\"paragraph-label\">K</span> Houses, of course, are more than machines for living in. They are social and psychological spaces, too. Future houses may not look exactly like kampungs or wind towers or any other traditional models. But to work for us and for our environment, they will have to suit us as well as these traditional forms did.</p>\n<p>&nbsp;</p>"
       }
     ]
   },
@@ -26,7 +26,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 14–18</h4>\n      <p>The reading passage has eleven paragraphs A–K.</p>\n      <p>Which paragraph contains the following information?</p>\n      <p>Write the correct letter, A–K, in boxes 14–18.</p>\n      <p class=\"word-limit\">NB You may use any letter more than once.</p>\n\n      <div id=\"q1-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <a id=\"q1-anchor\"></a>\n        <p><span class=\"question-number\">14.</span> reasons why a particular construction material is advantageous</p>\n        <select id=\"q1\" name=\"q1\">\n          <option value=\"\">-- Select --</option>\n          <option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option><option value=\"I\">I</option><option value=\"J\">J</option><option value=\"K\">K</option>\n        </select>\n      </div>\n      <div id=\"q2-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <a id=\"q2-anchor\"></a>\n        <p><span class=\"question-number\">15.</span> an example of a construction design which benefits domestic interaction</p>\n        <select id=\"q2\" name=\"q2\">\n          <option value=\"\">-- Select --</option>\n          <option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option><option value=\"I\">I</option><option value=\"J\">J</option><option value=\"K\">K</option>\n        </select>\n      </div>\n      <div id=\"q3-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <a id=\"q3-anchor\"></a>\n        <p><span class=\"question-number\">16.</span> a description of a house that is ventilated from below</p>\n        <select id=\"q3\" name=\"q3\">\n          <option value=\"\">-- Select --</option>\n          <option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option><option value=\"I\">I</option><option value=\"J\">J</option><option value=\"K\">K</option>\n        </select>\n      </div>\n      <div id=\"q4-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <a id=\"q4-anchor\"></a>\n        <p><span class=\"question-number\">17.</span> an example of self‑sufficient energy supply</p>\n        <select id=\"q4\" name=\"q4\">\n          <option value=\"\">-- Select --</option>\n          <option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option><option value=\"I\">I</option><option value=\"J\">J</option><option value=\"K\">K</option>\n        </select>\n      </div>\n      <div id=\"q5-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <a id=\"q5-anchor\"></a>\n        <p><span class=\"question-number\">18.</span> suggested methods of reducing temperatures in a city</p>\n        <select id=\"q5\" name=\"q5\">\n          <option value=\"\">-- Select --</option>\n          <option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option><option value=\"I\">I</option><option value=\"J\">J</option><option value=\"K\">K</option>\n        </select>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 14–18</h4>\n<p>The reading passage has eleven paragraphs A–K.</p>\n<p>Which paragraph contains the following information?</p>\n<p>Write the correct letter, A–K, in boxes 14–18.</p>\n<p class=\"word-limit\">NB You may use any letter more than once.</p>\n<div id=\"q1-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q1-anchor\"></a>\n<p><span class=\"question-number\">14.</span> reasons why a particular construction material is advantageous</p>\n<select id=\"q1\" name=\"q1\">\n<option value=\"\">-- Select --</option>\n<option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option><option value=\"I\">I</option><option value=\"J\">J</option><option value=\"K\">K</option>\n</select>\n</div>\n<div id=\"q2-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q2-anchor\"></a>\n<p><span class=\"question-number\">15.</span> an example of a construction design which benefits domestic interaction</p>\n<select id=\"q2\" name=\"q2\">\n<option value=\"\">-- Select --</option>\n<option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option><option value=\"I\">I</option><option value=\"J\">J</option><option value=\"K\">K</option>\n</select>\n</div>\n<div id=\"q3-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q3-anchor\"></a>\n<p><span class=\"question-number\">16.</span> a description of a house that is ventilated from below</p>\n<select id=\"q3\" name=\"q3\">\n<option value=\"\">-- Select --</option>\n<option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option><option value=\"I\">I</option><option value=\"J\">J</option><option value=\"K\">K</option>\n</select>\n</div>\n<div id=\"q4-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q4-anchor\"></a>\n<p><span class=\"question-number\">17.</span> an example of self‑sufficient energy supply</p>\n<select id=\"q4\" name=\"q4\">\n<option value=\"\">-- Select --</option>\n<option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option><option value=\"I\">I</option><option value=\"J\">J</option><option value=\"K\">K</option>\n</select>\n</div>\n<div id=\"q5-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q5-anchor\"></a>\n<p><span class=\"question-number\">18.</span> suggested methods of reducing temperatures in a city</p>\n<select id=\"q5\" name=\"q5\">\n<option value=\"\">-- Select --</option>\n<option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option><option value=\"I\">I</option><option value=\"J\">J</option><option value=\"K\">K</option>\n</select>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -37,7 +37,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 19–22</h4>\n      <p>Look at the following people and the list of ideas below.</p>\n      <p>Match each person with the correct idea, A–G.</p>\n      <p>Write the correct letter, A–G, in boxes 19–22.</p>\n      <p class=\"word-limit\">List of ideas</p>\n      <ul style=\"list-style-type: none; padding-left:0;\">\n        <li>A The choice of a certain construction material can have a socio‑economic impact.</li>\n        <li>B Throughout the world, people are rejecting traditional housing design in order to appear modern.</li>\n        <li>C Houses should not only meet people's physical needs but also their social and psychological needs.</li>\n        <li>D Traditional knowledge can be superior to modern knowledge.</li>\n        <li>E There is an innovation that can save costs on both air‑conditioning and heating.</li>\n        <li>F Solar energy can meet the energy needs of people living in villages in developing countries.</li>\n        <li>G There is a very simple solution that can save on the cost of air‑conditioning.</li>\n      </ul>\n\n      <div id=\"q6-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <a id=\"q6-anchor\"></a>\n        <p><span class=\"question-number\">19.</span> Muhammad Peter Davis</p>\n        <select id=\"q6\" name=\"q6\">\n          <option value=\"\">-- Select --</option>\n          <option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option>\n        </select>\n      </div>\n      <div id=\"q7-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <a id=\"q7-anchor\"></a>\n        <p><span class=\"question-number\">20.</span> Arthur Rosenfeld</p>\n        <select id=\"q7\" name=\"q7\">\n          <option value=\"\">-- Select --</option>\n          <option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option>\n        </select>\n      </div>\n      <div id=\"q8-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <a id=\"q8-anchor\"></a>\n        <p><span class=\"question-number\">21.</span> R van der Ley</p>\n        <select id=\"q8\" name=\"q8\">\n          <option value=\"\">-- Select --</option>\n          <option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option>\n        </select>\n      </div>\n      <div id=\"q9-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <a id=\"q9-anchor\"></a>\n        <p><span class=\"question-number\">22.</span> Amory Lovins</p>\n        <select id=\"q9\" name=\"q9\">\n          <option value=\"\">-- Select --</option>\n          <option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option>\n        </select>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 19–22</h4>\n<p>Look at the following people and the list of ideas below.</p>\n<p>Match each person with the correct idea, A–G.</p>\n<p>Write the correct letter, A–G, in boxes 19–22.</p>\n<p class=\"word-limit\">List of ideas</p>\n<ul style=\"list-style-type: none; padding-left:0;\">\n<li>A The choice of a certain construction material can have a socio‑economic impact.</li>\n<li>B Throughout the world, people are rejecting traditional housing design in order to appear modern.</li>\n<li>C Houses should not only meet people's physical needs but also their social and psychological needs.</li>\n<li>D Traditional knowledge can be superior to modern knowledge.</li>\n<li>E There is an innovation that can save costs on both air‑conditioning and heating.</li>\n<li>F Solar energy can meet the energy needs of people living in villages in developing countries.</li>\n<li>G There is a very simple solution that can save on the cost of air‑conditioning.</li>\n</ul>\n<div id=\"q6-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q6-anchor\"></a>\n<p><span class=\"question-number\">19.</span> Muhammad Peter Davis</p>\n<select id=\"q6\" name=\"q6\">\n<option value=\"\">-- Select --</option>\n<option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option>\n</select>\n</div>\n<div id=\"q7-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q7-anchor\"></a>\n<p><span class=\"question-number\">20.</span> Arthur Rosenfeld</p>\n<select id=\"q7\" name=\"q7\">\n<option value=\"\">-- Select --</option>\n<option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option>\n</select>\n</div>\n<div id=\"q8-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q8-anchor\"></a>\n<p><span class=\"question-number\">21.</span> R van der Ley</p>\n<select id=\"q8\" name=\"q8\">\n<option value=\"\">-- Select --</option>\n<option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option>\n</select>\n</div>\n<div id=\"q9-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q9-anchor\"></a>\n<p><span class=\"question-number\">22.</span> Amory Lovins</p>\n<select id=\"q9\" name=\"q9\">\n<option value=\"\">-- Select --</option>\n<option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option>\n</select>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -48,7 +48,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 23–26</h4>\n      <p>Do the following statements agree with the information in Reading Passage 2?</p>\n      <p>Write <strong>TRUE</strong>, <strong>FALSE</strong> or <strong>NOT GIVEN</strong>.</p>\n\n      <div id=\"q10-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <a id=\"q10-anchor\"></a>\n        <p><span class=\"question-number\">23.</span> The air temperature in modern Malaysian houses is lower than the air temperature outside.</p>\n        <div class=\"radio-group\">\n          <label><input type=\"radio\" name=\"q10\" value=\"True\"> True</label>\n          <label><input type=\"radio\" name=\"q10\" value=\"False\"> False</label>\n          <label><input type=\"radio\" name=\"q10\" value=\"Not Given\"> Not Given</label>\n        </div>\n      </div>\n      <div id=\"q11-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <a id=\"q11-anchor\"></a>\n        <p><span class=\"question-number\">24.</span> The construction industry is more to blame than transport for global warming.</p>\n        <div class=\"radio-group\">\n          <label><input type=\"radio\" name=\"q11\" value=\"True\"> True</label>\n          <label><input type=\"radio\" name=\"q11\" value=\"False\"> False</label>\n          <label><input type=\"radio\" name=\"q11\" value=\"Not Given\"> Not Given</label>\n        </div>\n      </div>\n      <div id=\"q12-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <a id=\"q12-anchor\"></a>\n        <p><span class=\"question-number\">25.</span> The use of wind towers for cooling is widespread in the Middle East today.</p>\n        <div class=\"radio-group\">\n          <label><input type=\"radio\" name=\"q12\" value=\"True\"> True</label>\n          <label><input type=\"radio\" name=\"q12\" value=\"False\"> False</label>\n          <label><input type=\"radio\" name=\"q12\" value=\"Not Given\"> Not Given</label>\n        </div>\n      </div>\n      <div id=\"q13-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <a id=\"q13-anchor\"></a>\n        <p><span class=\"question-number\">26.</span> The 'super‑windows' promoted by Amory Lovins can be installed at low cost.</p>\n        <div class=\"radio-group\">\n          <label><input type=\"radio\" name=\"q13\" value=\"True\"> True</label>\n          <label><input type=\"radio\" name=\"q13\" value=\"False\"> False</label>\n          <label><input type=\"radio\" name=\"q13\" value=\"Not Given\"> Not Given</label>\n        </div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 23–26</h4>\n<p>Do the following statements agree with the information in Reading Passage 2?</p>\n<p>Write <strong>TRUE</strong>, <strong>FALSE</strong> or <strong>NOT GIVEN</strong>.</p>\n<div id=\"q10-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q10-anchor\"></a>\n<p><span class=\"question-number\">23.</span> The air temperature in modern Malaysian houses is lower than the air temperature outside.</p>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q10\" value=\"True\"> True</label> <label><input type=\"radio\" name=\"q10\" value=\"False\"> False</label> <label><input type=\"radio\" name=\"q10\" value=\"Not Given\"> Not Given</label>\n</div>\n</div>\n<div id=\"q11-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q11-anchor\"></a>\n<p><span class=\"question-number\">24.</span> The construction industry is more to blame than transport for global warming.</p>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q11\" value=\"True\"> True</label> <label><input type=\"radio\" name=\"q11\" value=\"False\"> False</label> <label><input type=\"radio\" name=\"q11\" value=\"Not Given\"> Not Given</label>\n</div>\n</div>\n<div id=\"q12-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q12-anchor\"></a>\n<p><span class=\"question-number\">25.</span> The use of wind towers for cooling is widespread in the Middle East today.</p>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q12\" value=\"True\"> True</label> <label><input type=\"radio\" name=\"q12\" value=\"False\"> False</label> <label><input type=\"radio\" name=\"q12\" value=\"Not Given\"> Not Given</label>\n</div>\n</div>\n<div id=\"q13-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<a id=\"q13-anchor\"></a>\n<p><span class=\"question-number\">26.</span> The 'super‑windows' promoted by Amory Lovins can be installed at low cost.</p>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q13\" value=\"True\"> True</label> <label><input type=\"radio\" name=\"q13\" value=\"False\"> False</label> <label><input type=\"radio\" name=\"q13\" value=\"Not Given\"> Not Given</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
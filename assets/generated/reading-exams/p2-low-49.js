@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 2</h2>\n            <p>You should spend about 20 minutes on Questions 14-26, which are based on Reading Passage 2 on the following pages.</p>\n\n            <h3>Born to Trade</h3>\n            <p><em>Long before our ancestors had any trappings of civilisation, they had a taste for material goods. Kate Douglas discovers where this ancient obsession has led us.</em></p>\n            \n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-section=\"A\" id=\"q1-dropzone\" data-question=\"q1\">\n                    <span class=\"paragraph-label\">Section A (Q14):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>A</strong> Humans are born to trade and we don't need shops or money to do it—the heart of commerce is an instinctive ability for what anthropologists call “reciprocity”. This is an ability to exchange goods of equal worth, and it evolved as the brains of our ancient ancestors and societies became more complex, allowing individuals to keep a running tally of their interactions with others. Evidence from modern hunter-gatherers leaves little doubt that the exchange of food and favours is innate, as is the ability to keep track of the credits and debits that accrue as a result. Combine this skill for mental book-keeping with even the most basic material culture, and trade inevitably follows.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-section=\"B\" id=\"q2-dropzone\" data-question=\"q2\">\n                    <span class=\"paragraph-label\">Section B (Q15):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>B</strong> Once trade gets off the ground, the economic benefits quickly make it irresistible. But exchanging tools, food and other essentials of life in a barter economy is a far cry from the shopping mall. Modern consumerism extends beyond subsistence and utilitarianism to encompass everything from Gucci handbags and BMW convertibles to valuable paintings. Clearly, the worth of such goods is not inherent but resides in certain intangible qualities that we invest in them. When did humans start holding these goods in such high esteem?</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-section=\"C\" id=\"q3-dropzone\" data-question=\"q3\">\n                    <span class=\"paragraph-label\">Section C (Q16):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>C</strong> All the archaeological evidence for the flowering of consumer culture has up to now pointed to a date of around 40,000 years ago. That's when early modern humans started making increasingly intricate bone and stone tools, carving patterns into rocks and creating representational art such as carved figurines, jewellery and cave paintings. However, discoveries in Africa are pushing the origins of consumerism much further back into human prehistory.</p>\n                <p>A few years ago, reports began to emerge of discoveries made at the Blombos Cave, a site of ancient human habitation in South Africa. Christopher Henshilwood and colleagues from the University of Bergen in Norway dated thousands of pieces of ochre from the cave, and many of them proved to be more than 100,000 years old — before the time that early humans moved out of Africa. Ochre, a coloured clay that comes in various shades from red to black, does not occur naturally around Blombos and must have been imported from quarries at least 30 kilometres away, either directly by Blombos residents or through trade. Although ochre can be used to dry and preserve (cure) animal hides, the researchers are convinced the Blombos ochre had a symbolic purpose. For a start, it is predominantly red—any of the other colours available would have done for curing—and the surfaces of the clay had been scraped in a way that indicates they were used to yield pigment for dyes.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-section=\"D\" id=\"q4-dropzone\" data-question=\"q4\">\n                    <span class=\"paragraph-label\">Section D (Q17):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>D</strong> An even more intriguing discovery from Blombos was of 41 beads dating from 76,000 years ago, found in clusters and made from the shells of a tiny mollusc. These cannot be natural deposits, argue the researchers, as each cluster contains shells of a similar size and colour with consistently placed holes. What's more, all the beads display a pattern of wear suggesting friction from rubbing against thread, clothes or other beads.</p>\n                <p>The previous oldest find of beads in Africa dates back to just 45,000 years ago. And it seems the Blombos people's taste for beautiful items was not an isolated phenomenon. Jessica Thompson of Arizona State University in Tempe has described finding shell fragments from a site in Tanzania that she believes may represent debris from bead manufacture. They are at least 45,000—and possibly 280,000—years old. Although there is no evidence of how the ancient beads were used, their modern counterparts are often traded. So it looks as though our taste for jewellery and art is much older than we thought.</p>\n            </div>\n             <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-section=\"E\" id=\"q5-dropzone\" data-question=\"q5\">\n                    <span class=\"paragraph-label\">Section E (Q18):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>E</strong> But why did we come to value these objects in the first place? In many animal species, individuals signal their genetic fitness by showing off with attention-grabbing adornment. Some researchers think that in humans, consumer products play a similar role. Archaeologist Aimee Plourde, from the University of California, also argues that even in egalitarian societies, some people are more successful than others. Among our ancestors, superior skills in areas such as hunting, crafts, environmental knowledge and contact with neighbouring groups would have brought respect—in other words, prestige.</p>\n                <p>And because prestige brings social benefits, people would want to show off their talents. The best way to do this would be through demonstrating possession of material items that are hard to fake. ‘A good hunter, for instance, could advertise his skills by wearing the tooth of an animal that is elusive or dangerous,' says Plourde. The benefits of prestige would also lead to competition to acquire it. As a result, the value and variety of prestige goods would spiral and there would be a parallel increase in the ranking of social systems.</p>\n                <p>If Plourde is correct, prestige goods form a direct link between our innate drive for trade and the development of structured, hierarchical societies. They are arguably the first step on the road to modern civilisation, paving the way for agriculture and urbanisation. We may not be impressed by beads any more, but their modern equivalents have the same fascination. Nobody believes the guy who spends €670,000 on a Bugatti Veyron car does so because he needs to travel at 250 mph. We all know in today's consumer society he's buying an exclusive status symbol.</p>\n            </div>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14-26, which are based on Reading Passage 2 on the following pages.</p>\n<h3>Born to Trade</h3>\n<p><em>Long before our ancestors had any trappings of civilisation, they had a taste for material goods. Kate Douglas discovers where this ancient obsession has led us.</em></p>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-section=\"A\" id=\"q1-dropzone\" data-question=\"q1\">\n<span class=\"paragraph-label\">Section A (Q14):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> Humans are born to trade and we don't need shops or money to do it—the heart of commerce is an instinctive ability for what anthropologists call “reciprocity”. This is an ability to exchange goods of equal worth, and it evolved as the brains of our ancient ancestors and societies became more complex, allowing individuals to keep a running tally of their interactions with others. Evidence from modern hunter-gatherers leaves little doubt that the exchange of food and favours is innate, as is the ability to keep track of the credits and debits that accrue as a result. Combine this skill for mental book-keeping with even the most basic material culture, and trade inevitably follows.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-section=\"B\" id=\"q2-dropzone\" data-question=\"q2\">\n<span class=\"paragraph-label\">Section B (Q15):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> Once trade gets off the ground, the economic benefits quickly make it irresistible. But exchanging tools, food and other essentials of life in a barter economy is a far cry from the shopping mall. Modern consumerism extends beyond subsistence and utilitarianism to encompass everything from Gucci handbags and BMW convertibles to valuable paintings. Clearly, the worth of such goods is not inherent but resides in certain intangible qualities that we invest in them. When did humans start holding these goods in such high esteem?</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-section=\"C\" id=\"q3-dropzone\" data-question=\"q3\">\n<span class=\"paragraph-label\">Section C (Q16):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> All the archaeological evidence for the flowering of consumer culture has up to now pointed to a date of around 40,000 years ago. That's when early modern humans started making increasingly intricate bone and stone tools, carving patterns into rocks and creating representational art such as carved figurines, jewellery and cave paintings. However, discoveries in Africa are pushing the origins of consumerism much further back into human prehistory.</p>\n<p>A few years ago, reports began to emerge of discoveries made at the Blombos Cave, a site of ancient human habitation in South Africa. Christopher Henshilwood and colleagues from the University of Bergen in Norway dated thousands of pieces of ochre from the cave, and many of them proved to be more than 100,000 years old — before the time that early humans moved out of Africa. Ochre, a coloured clay that comes in various shades from red to black, does not occur naturally around Blombos and must have been imported from quarries at least 30 kilometres away, either directly by Blombos residents or through trade. Although ochre can be used to dry and preserve (cure) animal hides, the researchers are convinced the Blombos ochre had a symbolic purpose. For a start, it is predominantly red—any of the other colours available would have done for curing—and the surfaces of the clay had been scraped in a way that indicates they were used to yield pigment for dyes.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-section=\"D\" id=\"q4-dropzone\" data-question=\"q4\">\n<span class=\"paragraph-label\">Section D (Q17):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> An even more intriguing discovery from Blombos was of 41 beads dating from 76,000 years ago, found in clusters and made from the shells of a tiny mollusc. These cannot be natural deposits, argue the researchers, as each cluster contains shells of a similar size and colour with consistently placed holes. What's more, all the beads display a pattern of wear suggesting friction from rubbing against thread, clothes or other beads.</p>\n<p>The previous oldest find of beads in Africa dates back to just 45,000 years ago. And it seems the Blombos people's taste for beautiful items was not an isolated phenomenon. Jessica Thompson of Arizona State University in Tempe has described finding shell fragments from a site in Tanzania that she believes may represent debris from bead manufacture. They are at least 45,000—and possibly 280,000—years old. Although there is no evidence of how the ancient beads were used, their modern counterparts are often traded. So it looks as though our taste for jewellery and art is much older than we thought.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-section=\"E\" id=\"q5-dropzone\" data-question=\"q5\">\n<span class=\"paragraph-label\">Section E (Q18):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> But why did we come to value these objects in the first place? In many animal species, individuals signal their genetic fitness by showing off with attention-grabbing adornment. Some researchers think that in humans, consumer products play a similar role. Archaeologist Aimee Plourde, from the University of California, also argues that even in egalitarian societies, some people are more successful than others. Among our ancestors, superior skills in areas such as hunting, crafts, environmental knowledge and contact with neighbouring groups would have brought respect—in other words, prestige.</p>\n<p>And because prestige brings social benefits, people would want to show off their talents. The best way to do this would be through demonstrating possession of material items that are hard to fake. ‘A good hunter, for instance, could advertise his skills by wearing the tooth of an animal that is elusive or dangerous,' says Plourde. The benefits of prestige would also lead to competition to acquire it. As a result, the value and variety of prestige goods would spiral and there would be a parallel increase in the ranking of social systems.</p>\n<p>If Plourde is correct, prestige goods form a direct link between our innate drive for trade and the development of structured, hierarchical societies. They are arguably the first step on the road to modern civilisation, paving the way for agriculture and urbanisation. We may not be impressed by beads any more, but their modern equivalents have the same fascination. Nobody believes the guy who spends €670,000 on a Bugatti Veyron car does so because he needs to travel at 250 mph. We all know in today's consumer society he's buying an exclusive status symbol.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 14–18</h4>\n                <p>Reading Passage 2 has five sections, <strong>A–E</strong>.</p>\n                <p>Choose the correct heading for each section from the list of headings below.</p>\n                <p><em>Write the correct number, i–vii, in boxes 14–18 on your answer sheet. (Drag a heading from this list and drop it onto the correct section's answer box on the left.)</em></p>\n                <div class=\"headings-pool\" id=\"headings-pool-container\">\n                    <strong>List of Headings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i The desire to make expensive jewellery</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii The clues that indicate ancient items were decorative</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii Querying the changes in the value of traded items</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv A natural human talent</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v How status can be gained from ownership of goods</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi Recent finds alter theories about when consumerism started</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii Changes in research methods</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 14–18</h4>\n<p>Reading Passage 2 has five sections, <strong>A–E</strong>.</p>\n<p>Choose the correct heading for each section from the list of headings below.</p>\n<p><em>Write the correct number, i–vii, in boxes 14–18 on your answer sheet. (Drag a heading from this list and drop it onto the correct section's answer box on the left.)</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i The desire to make expensive jewellery</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii The clues that indicate ancient items were decorative</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii Querying the changes in the value of traded items</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv A natural human talent</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v How status can be gained from ownership of goods</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi Recent finds alter theories about when consumerism started</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii Changes in research methods</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -47,7 +47,7 @@
         "q7",
         "q8"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-anchor\">\n                <h4>Questions 19–21</h4>\n                <p>Choose the correct letter, A, B, C or D.</p>\n                <p><em>Write the correct letter in boxes 19–21 on your answer sheet.</em></p>\n\n                <div class=\"question-item\">\n                     <div class=\"mc-question\">\n                        <p><strong>19</strong> In section A, ‘reciprocity' refers to our ancestors' ability to</p>\n                        <ul class=\"mc-options\">\n                            <li><label><input type=\"radio\" name=\"q6\" value=\"A\"><strong>A</strong>keep written records of different goods traded</label></li>\n                            <li><label><input type=\"radio\" name=\"q6\" value=\"B\"><strong>B</strong>monitor the balance between goods given and received</label></li>\n                            <li><label><input type=\"radio\" name=\"q6\" value=\"C\"><strong>C</strong>produce more materials for trading purposes</label></li>\n                            <li><label><input type=\"radio\" name=\"q6\" value=\"D\"><strong>D</strong>make money from trading goods and services</label></li>\n                        </ul>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                     <div class=\"mc-question\">\n                        <p><strong>20</strong> What is said about the ochre found at Blombos Cave?</p>\n                        <ul class=\"mc-options\">\n                            <li><label><input type=\"radio\" name=\"q7\" value=\"A\"><strong>A</strong>It is of a type only found in this particular area.</label></li>\n                            <li><label><input type=\"radio\" name=\"q7\" value=\"B\"><strong>B</strong>It has all been dyed to give the same shade of red.</label></li>\n                            <li><label><input type=\"radio\" name=\"q7\" value=\"C\"><strong>C</strong>It has been perfectly preserved despite its age.</label></li>\n                            <li><label><input type=\"radio\" name=\"q7\" value=\"D\"><strong>D</strong>It appears it was selected for its colour.</label></li>\n                        </ul>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                     <div class=\"mc-question\">\n                        <p><strong>21</strong> What made the researchers realise the purpose of the beads found at Blombos Cave?</p>\n                        <ul class=\"mc-options\">\n                            <li><label><input type=\"radio\" name=\"q8\" value=\"A\"><strong>A</strong>They are of many different shapes and sizes.</label></li>\n                            <li><label><input type=\"radio\" name=\"q8\" value=\"B\"><strong>B</strong>They were found in large numbers, clustered together.</label></li>\n                            <li><label><input type=\"radio\" name=\"q8\" value=\"C\"><strong>C</strong>They have patterns in many different colours.</label></li>\n                            <li><label><input type=\"radio\" name=\"q8\" value=\"D\"><strong>D</strong>They have holes and markings suggesting they were joined together.</label></li>\n                        </ul>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-anchor\">\n<h4>Questions 19–21</h4>\n<p>Choose the correct letter, A, B, C or D.</p>\n<p><em>Write the correct letter in boxes 19–21 on your answer sheet.</em></p>\n<div class=\"question-item\">\n<div class=\"mc-question\">\n<p><strong>19</strong> In section A, ‘reciprocity' refers to our ancestors' ability to</p>\n<ul class=\"mc-options\">\n<li><label><input type=\"radio\" name=\"q6\" value=\"A\"><strong>A</strong>keep written records of different goods traded</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"B\"><strong>B</strong>monitor the balance between goods given and received</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"C\"><strong>C</strong>produce more materials for trading purposes</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"D\"><strong>D</strong>make money from trading goods and services</label></li>\n</ul>\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"mc-question\">\n<p><strong>20</strong> What is said about the ochre found at Blombos Cave?</p>\n<ul class=\"mc-options\">\n<li><label><input type=\"radio\" name=\"q7\" value=\"A\"><strong>A</strong>It is of a type only found in this particular area.</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"B\"><strong>B</strong>It has all been dyed to give the same shade of red.</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"C\"><strong>C</strong>It has been perfectly preserved despite its age.</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"D\"><strong>D</strong>It appears it was selected for its colour.</label></li>\n</ul>\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"mc-question\">\n<p><strong>21</strong> What made the researchers realise the purpose of the beads found at Blombos Cave?</p>\n<ul class=\"mc-options\">\n<li><label><input type=\"radio\" name=\"q8\" value=\"A\"><strong>A</strong>They are of many different shapes and sizes.</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"B\"><strong>B</strong>They were found in large numbers, clustered together.</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"C\"><strong>C</strong>They have patterns in many different colours.</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"D\"><strong>D</strong>They have holes and markings suggesting they were joined together.</label></li>\n</ul>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n                <h4>Questions 22–26</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                <div class=\"summary-completion\">\n                    <h4>Why certain objects are valued?</h4>\n                    <p>\n                    Some researchers argue that we may use ownership of desirable goods to demonstrate our strength and fitness as other <strong>22</strong> <input type=\"text\" id=\"q22_input\" name=\"q9\"> use their attractive physical features. Showing off one's superiority is not a new phenomenon and even in ancient times successful people would have gained <strong>23</strong> <input type=\"text\" id=\"q23_input\" name=\"q10\"> from this. A desire for status could have led to an increase in the worth of prestige goods and to <strong>24</strong> <input type=\"text\" id=\"q24_input\" name=\"q11\"> among people wishing to achieve this status.\n                    </p>\n                    <p>\n                    It is thought that our natural desire to trade provided a basis for organised farming and <strong>25</strong> <input type=\"text\" id=\"q25_input\" name=\"q12\"> development and finally resulted in the complex societies which can be seen today. Whilst we do not value things such as beads nowadays, other items hold the same appeal for us and bring the same status as owning beads did for our <strong>26</strong> <input type=\"text\" id=\"q26_input\" name=\"q13\">.\n                    </p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q9-10-11-12-13-anchor\">\n<h4>Questions 22–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>Why certain objects are valued?</h4>\n<p>\nSome researchers argue that we may use ownership of desirable goods to demonstrate our strength and fitness as other <strong>22</strong> <input type=\"text\" id=\"q22_input\" name=\"q9\"> use their attractive physical features. Showing off one's superiority is not a new phenomenon and even in ancient times successful people would have gained <strong>23</strong> <input type=\"text\" id=\"q23_input\" name=\"q10\"> from this. A desire for status could have led to an increase in the worth of prestige goods and to <strong>24</strong> <input type=\"text\" id=\"q24_input\" name=\"q11\"> among people wishing to achieve this status.\n</p>\n<p>\nIt is thought that our natural desire to trade provided a basis for organised farming and <strong>25</strong> <input type=\"text\" id=\"q25_input\" name=\"q12\"> development and finally resulted in the complex societies which can be seen today. Whilst we do not value things such as beads nowadays, other items hold the same appeal for us and bring the same status as owning beads did for our <strong>26</strong> <input type=\"text\" id=\"q26_input\" name=\"q13\">.\n</p>\n</div>\n</div>"
     }
   ],
   "answerKey": {
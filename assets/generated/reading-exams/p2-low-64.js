@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>New filter promises clean water for millions</h2>\n            <h4>An ingenious invention is set to bring clean water to developing countries, and while the science may be cutting edge, the materials are extremely down to earth.</h4>\n            \n            <p>A handful of clay, yesterday's coffee grounds and some cow manure are the ingredients that could bring clean, safe drinking water to many developing countries. The simple new technology, developed by Australian National University (ANU) materials scientist and potter Tony Flynn, allows water filters to be made from commonly available materials and fired (or baked) using cow manure as the source of heat, without the need for a kiln (an oven for baking or drying pottery). The filters have been tested and shown to remove common pathogens (disease-producing organisms) including E. coli.</p>\n            <p>The invention was born out of a project involving the Manatuto community in East Timor. A charity operating there wanted to help set up a small industrial site manufacturing water filters, but initial research found the local clay to be too fine — a problem solved by the addition of organic material. While the problems of producing a working ceramic filter in East Timor were overcome, the solution was kiln-based and particular to that community's materials and couldn't be applied elsewhere. Flynn's technique for manure firing, with no requirement for a kiln, has made this zero-technology approach available anywhere it is needed.</p>\n            <p>Other commercial clay filters do exist, but, even if available, with prices starting at US$5 each, they are often outside the budgets of most people in the developing world. Unlike other water filtering devices, Flynn's filters are inexpensive and simple to produce. Take a handful of clay, mix it with a handful of organic material such as used tea leaves, coffee grounds or rice hulls, add water in a sufficient quantity to make a stiff mixture and form a cylindrical pot that has one end closed, then dry it in the sun. According to Flynn, used coffee grounds have given the best results to date. The walls of the filter can be measured using the width of an adult finger as the standard. Next, surround the pots with straw, put them in a mound of cow manure, light the straw and then top up the burning manure as required. The filters are finished in 45 to 60 minutes.</p>\n            <p>The properties of cow manure are vital, as the fuel can reach a temperature of 700 degrees in half an hour, and will be up to 950 degrees after another 20 to 30 minutes. The manure makes a good fuel because it is very high in organic material that burns readily and quickly. The manure has to be dry and is best used exactly as found in the field; there is no need to break it up or process it any further. In contrast, a potter's kiln is an expensive item and can take up to four or five hours to get up to 800 degrees. It needs expensive, scarce fuel, such as gas or wood to heat it, and experience to use it. With no technology, no insulation and nothing other than a pile of cow manure and a match, none of these requirements apply.</p>\n            <p>It is also helpful that, like clay and organic material, cow manure is freely available across the developing world. A cow is a natural fuel factory. Manure is a mixture of vegetable materials of different sizes, and cow manure as a fuel is the same wherever it is found.</p>\n            <p>Just as using manure as a fuel for domestic use is not a new idea, the fact that liquid can pass through clay objects is something that potters have always known, and clay's porous nature is something that, as a former ceramics lecturer in the ANU School of Art, Flynn is well aware of. The difference is that, rather than viewing the porous nature of the material as a problem — after all, not many people want a pot that won't hold water — his filters capitalize on this property.</p>\n            <p>The filtration process is simple, but effective. The basic principle is that there are passages through the filter that are wide enough for water droplets to pass through, but too narrow for pathogens. Tests with the deadly E. coli bacterium have seen the filters remove 96.4 to 99.8 per cent of the pathogen — well within safe levels. The thickness of the clay container needs to be the same thickness as an adult finger for the process to be effective. If this is the case, using only one filter, a liter of water can be obtained in two hours.</p>\n            <p>The use of organic material, which burns away leaving cavities after firing, helps produce the structure in which pathogens will become trapped. It overcomes the potential problems of finer clays that may not let water through and also means that cracks are soon halted. And like clay and cow manure, organic material is universally available in the developing communities that need the most assistance, as tea, coffee and rice are grown in these areas.</p>\n            <p>With all the components being widely available, Flynn says there is no reason the technology couldn't be applied throughout the developing world. He has no plans to exploit his idea financially by registering ownership through a patent. If he did, any commercial copying would legally entitle him to a share in any profits made. Without a patent, there will be no illegality in it being adopted in any community that needs it. “Everyone has a right to clean water, and these filters have the potential to enable anyone in the world to drink water safely,\" says Flynn.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>New filter promises clean water for millions</h2>\n<h4>An ingenious invention is set to bring clean water to developing countries, and while the science may be cutting edge, the materials are extremely down to earth.</h4>\n<p>A handful of clay, yesterday's coffee grounds and some cow manure are the ingredients that could bring clean, safe drinking water to many developing countries. The simple new technology, developed by Australian National University (ANU) materials scientist and potter Tony Flynn, allows water filters to be made from commonly available materials and fired (or baked) using cow manure as the source of heat, without the need for a kiln (an oven for baking or drying pottery). The filters have been tested and shown to remove common pathogens (disease-producing organisms) including E. coli.</p>\n<p>The invention was born out of a project involving the Manatuto community in East Timor. A charity operating there wanted to help set up a small industrial site manufacturing water filters, but initial research found the local clay to be too fine — a problem solved by the addition of organic material. While the problems of producing a working ceramic filter in East Timor were overcome, the solution was kiln-based and particular to that community's materials and couldn't be applied elsewhere. Flynn's technique for manure firing, with no requirement for a kiln, has made this zero-technology approach available anywhere it is needed.</p>\n<p>Other commercial clay filters do exist, but, even if available, with prices starting at US$5 each, they are often outside the budgets of most people in the developing world. Unlike other water filtering devices, Flynn's filters are inexpensive and simple to produce. Take a handful of clay, mix it with a handful of organic material such as used tea leaves, coffee grounds or rice hulls, add water in a sufficient quantity to make a stiff mixture and form a cylindrical pot that has one end closed, then dry it in the sun. According to Flynn, used coffee grounds have given the best results to date. The walls of the filter can be measured using the width of an adult finger as the standard. Next, surround the pots with straw, put them in a mound of cow manure, light the straw and then top up the burning manure as required. The filters are finished in 45 to 60 minutes.</p>\n<p>The properties of cow manure are vital, as the fuel can reach a temperature of 700 degrees in half an hour, and will be up to 950 degrees after another 20 to 30 minutes. The manure makes a good fuel because it is very high in organic material that burns readily and quickly. The manure has to be dry and is best used exactly as found in the field; there is no need to break it up or process it any further. In contrast, a potter's kiln is an expensive item and can take up to four or five hours to get up to 800 degrees. It needs expensive, scarce fuel, such as gas or wood to heat it, and experience to use it. With no technology, no insulation and nothing other than a pile of cow manure and a match, none of these requirements apply.</p>\n<p>It is also helpful that, like clay and organic material, cow manure is freely available across the developing world. A cow is a natural fuel factory. Manure is a mixture of vegetable materials of different sizes, and cow manure as a fuel is the same wherever it is found.</p>\n<p>Just as using manure as a fuel for domestic use is not a new idea, the fact that liquid can pass through clay objects is something that potters have always known, and clay's porous nature is something that, as a former ceramics lecturer in the ANU School of Art, Flynn is well aware of. The difference is that, rather than viewing the porous nature of the material as a problem — after all, not many people want a pot that won't hold water — his filters capitalize on this property.</p>\n<p>The filtration process is simple, but effective. The basic principle is that there are passages through the filter that are wide enough for water droplets to pass through, but too narrow for pathogens. Tests with the deadly E. coli bacterium have seen the filters remove 96.4 to 99.8 per cent of the pathogen — well within safe levels. The thickness of the clay container needs to be the same thickness as an adult finger for the process to be effective. If this is the case, using only one filter, a liter of water can be obtained in two hours.</p>\n<p>The use of organic material, which burns away leaving cavities after firing, helps produce the structure in which pathogens will become trapped. It overcomes the potential problems of finer clays that may not let water through and also means that cracks are soon halted. And like clay and cow manure, organic material is universally available in the developing communities that need the most assistance, as tea, coffee and rice are grown in these areas.</p>\n<p>With all the components being widely available, Flynn says there is no reason the technology couldn't be applied throughout the developing world. He has no plans to exploit his idea financially by registering ownership through a patent. If he did, any commercial copying would legally entitle him to a share in any profits made. Without a patent, there will be no illegality in it being adopted in any community that needs it. “Everyone has a right to clean water, and these filters have the potential to enable anyone in the world to drink water safely,\" says Flynn.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                <h4>Questions 14–19</h4>\n                <p>Complete the flow-chart below.</p>\n                <p>Write <strong>NO MORE THAN TWO WORDS AND/OR A NUMBER</strong> from the passage for each answer.</p>\n                <div class=\"flow-chart\">\n                    <h4>Step-by-step guide to making Flynn's water filters</h4>\n                    <div class=\"step\">\n                        Make the mixture for the filter from organic material (e.g., tea, coffee, rice), <br>\n                        <strong>14</strong> <input type=\"text\" id=\"q1\" name=\"q1\"> and <strong>15</strong> <input type=\"text\" id=\"q2\" name=\"q2\">\n                    </div>\n                    <div class=\"arrow\">↓</div>\n                     <div class=\"step\">\n                        Shape into pots and place them in a fire made from <strong>16</strong> <input type=\"text\" id=\"q3\" name=\"q3\"> and <strong>17</strong> <input type=\"text\" id=\"q4\" name=\"q4\">\n                    </div>\n                    <div class=\"arrow\">↓</div>\n                    <div class=\"step\">\n                       Fuel the fire to reach a maximum temperature of <strong>18</strong> <input type=\"text\" id=\"q5\" name=\"q5\">\n                    </div>\n                    <div class=\"arrow\">↓</div>\n                    <div class=\"step\">\n                        Remove the filters from the fire.\n                    </div>\n                     <div class=\"arrow\">↓</div>\n                    <div class=\"step\">\n                        Bake the filters in the fire for a maximum period of <strong>19</strong> <input type=\"text\" id=\"q6\" name=\"q6\">\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Complete the flow-chart below.</p>\n<p>Write <strong>NO MORE THAN TWO WORDS AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"flow-chart\">\n<h4>Step-by-step guide to making Flynn's water filters</h4>\n<div class=\"step\">\nMake the mixture for the filter from organic material (e.g., tea, coffee, rice),<br>\n<strong>14</strong> <input type=\"text\" id=\"q1\" name=\"q1\"> and <strong>15</strong> <input type=\"text\" id=\"q2\" name=\"q2\">\n</div>\n<div class=\"arrow\">↓</div>\n<div class=\"step\">\nShape into pots and place them in a fire made from <strong>16</strong> <input type=\"text\" id=\"q3\" name=\"q3\"> and <strong>17</strong> <input type=\"text\" id=\"q4\" name=\"q4\">\n</div>\n<div class=\"arrow\">↓</div>\n<div class=\"step\">\nFuel the fire to reach a maximum temperature of <strong>18</strong> <input type=\"text\" id=\"q5\" name=\"q5\">\n</div>\n<div class=\"arrow\">↓</div>\n<div class=\"step\">\nRemove the filters from the fire.\n</div>\n<div class=\"arrow\">↓</div>\n<div class=\"step\">\nBake the filters in the fire for a maximum period of <strong>19</strong> <input type=\"text\" id=\"q6\" name=\"q6\">\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -47,7 +47,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-anchor\">\n                <h4>Questions 20–23</h4>\n                <p>Do the following statements agree with the information given in Reading Passage 2?</p>\n                <ul style=\"list-style: none; padding-left: 0;\">\n                    <li><strong>TRUE</strong> if the statement agrees with the information</li>\n                    <li><strong>FALSE</strong> if the statement contradicts the information</li>\n                    <li><strong>NOT GIVEN</strong> if there is no information on this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p><strong>20</strong> The clay in the Manatuto project was initially unsuitable for the purpose of the project.</p>\n                    <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>21</strong> Coffee grounds produce filters that are twice as efficient as those using other organic materials.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>22</strong> It takes half an hour for a cow manure fire to reach 950 degrees.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>23</strong> E. coli is the most difficult bacterium to remove from water by filtration.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q10\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-anchor\">\n<h4>Questions 20–23</h4>\n<p>Do the following statements agree with the information given in Reading Passage 2?</p>\n<ul style=\"list-style: none; padding-left: 0;\">\n<li><strong>TRUE</strong> if the statement agrees with the information</li>\n<li><strong>FALSE</strong> if the statement contradicts the information</li>\n<li><strong>NOT GIVEN</strong> if there is no information on this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>20</strong> The clay in the Manatuto project was initially unsuitable for the purpose of the project.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>21</strong> Coffee grounds produce filters that are twice as efficient as those using other organic materials.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>22</strong> It takes half an hour for a cow manure fire to reach 950 degrees.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q9\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q9\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>23</strong> E. coli is the most difficult bacterium to remove from water by filtration.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q10\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q10\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -57,7 +57,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-anchor\">\n                <h4>Questions 24–26</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>24</strong> The Manatuto project aimed to set up a</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q11\" type=\"radio\" value=\"A\"><span>A charitable trust.</span></label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"B\"><span>B filtration experiment.</span></label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"C\"><span>C water filter factory.</span></label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"D\"><span>D community kiln.</span></label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>25</strong> To be effective, the Flynn filters must</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q12\" type=\"radio\" value=\"A\"><span>A remove all dangerous pathogens.</span></label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"B\"><span>B be a particular thickness.</span></label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"C\"><span>C filter water as quickly as possible.</span></label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"D\"><span>D be made from 100 per cent clay.</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>26</strong> Flynn does not intend to patent his filter because he</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q13\" type=\"radio\" value=\"A\"><span>A wants it to be freely available.</span></label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"B\"><span>B has produced a very simple design.</span></label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"C\"><span>C cannot make a profit in poor countries.</span></label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"D\"><span>D has already given the idea to a charity.</span></label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>24</strong> The Manatuto project aimed to set up a</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"><span>A charitable trust.</span></label> <label><input name=\"q11\" type=\"radio\" value=\"B\"><span>B filtration experiment.</span></label> <label><input name=\"q11\" type=\"radio\" value=\"C\"><span>C water filter factory.</span></label> <label><input name=\"q11\" type=\"radio\" value=\"D\"><span>D community kiln.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>25</strong> To be effective, the Flynn filters must</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"A\"><span>A remove all dangerous pathogens.</span></label> <label><input name=\"q12\" type=\"radio\" value=\"B\"><span>B be a particular thickness.</span></label> <label><input name=\"q12\" type=\"radio\" value=\"C\"><span>C filter water as quickly as possible.</span></label> <label><input name=\"q12\" type=\"radio\" value=\"D\"><span>D be made from 100 per cent clay.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>26</strong> Flynn does not intend to patent his filter because he</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"><span>A wants it to be freely available.</span></label> <label><input name=\"q13\" type=\"radio\" value=\"B\"><span>B has produced a very simple design.</span></label> <label><input name=\"q13\" type=\"radio\" value=\"C\"><span>C cannot make a profit in poor countries.</span></label> <label><input name=\"q13\" type=\"radio\" value=\"D\"><span>D has already given the idea to a charity.</span></label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
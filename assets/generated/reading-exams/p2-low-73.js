@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>The Power of Smell</h2>\n            <h4>Research shows that our olfactory sense is more influential than we realise</h4>\n            \n            <p><strong>A</strong> Dogs' noses are renowned for sensitivity to smells, while human noses are thought to be poor by comparison, yet that might be a misconception. According to recent studies, our noses are in fact acutely sensitive instruments that guide our everyday lives to a surprising extent. Subtle smells can change your mood, behaviour and the choices you make, often without you realising it. Our own odours, meanwhile, indicate emotional states such as fear or sadness to those around us. The big mystery is why we aren't more aware of our nasal activity. Noses have certainly never been at the forefront of sensory research, and were pushed aside until recently in favour of the seemingly more vital senses of vision and hearing. ‘There has been a lot of prejudice that people are not that influenced by olfactory stimuli, especially compared to other mammals,' says Lilianne Mujica-Parodi, who studies the neurobiology of human stress at Stony Brook University in New York, in the United States.</p>\n            <p><strong>B</strong> One of the first people to assert the relative unimportance of human smelling was Pierre Paul Broca, an influential 19th-century anatomist. After comparing the proportion of the brain devoted to smell in different animals, he suggested that mammals can be classed into two broad groups: macrosmatic mammals, such as dogs, have a finely tuned sense of smell which they rely on to perceive the world, while we, along with other primates and the marine mammals, are microsmatic – we have small olfactory organs that we only rely on to a small extent. That idea seemed to fit with more recent studies which found that the majority of mammals have genes coding for about 1000 different types of smell receptor. Most of these genes aren't expressed in humans, giving our noses just 400 different types of receptor.</p>\n            <p><strong>C</strong> Yet these findings may have been misleading. Brain scans now show that more of the brain is devoted to smell processing than Broca's anatomical studies suggested. And although we may have fewer types of receptor than other mammals, Charles Greer at Yale University in the United States has shown that the human nose and brain are unusually well connected, with each group of receptors linking to many more neural regions than is the case in other animals. That should give us a good ability to process incoming scents. Once researchers began looking, they found the nose to be far more sensitive than its reputation suggested. One study, for example, found that we can detect certain chemicals diluted in water to less than one part per billion. That means that a person can detect just a few drops of a strong smell like ethyl mercaptan in an Olympic-sized pool.</p>\n            <p><strong>D</strong> 'We are also exceptionally gifted at telling smells apart, even in the case of two molecules whose only difference is that their structures are mirror images of one another. That is fantastic sensitivity,' says George Dodd, a perfumer and researcher at the olfaction group of the University of Warwick, in the United Kingdom. What's more, it's becoming clear that the brain's olfactory centres are intimately linked to its limbic system, which is involved in emotion, fear and memory. That suggests a link between smell and the way we think.</p>\n            <p><strong>E</strong> The power of smell will be no news to estate agents, who often advocate the smell of baking bread or brewing coffee to promote the sale of a house. But there are more subtle and surprising effects too. When Hendrik Schifferstein and colleagues, from Delft University of Technology in the Netherlands, pumped the smell of orange, seawater or peppermint into a nightclub, the revellers danced more, rated their night as more enjoyable, and even thought the music was better than when there was no added scent. Meanwhile, Rob Holland, of the University of Utrecht in the Netherlands, found that the hint of aroma wafting out of a hidden bucket of citrus-scented cleaner was enough to persuade students in a hostel to clean up after themselves.</p>\n            <p><strong>F</strong> Other work has found that scent can influence our cognitive skills. A study by William Overman and colleagues at the University of North Carolina in the United States found that when men were subjected to a novel smell – either good or bad – during a task used to test decision-making skills, they performed significantly worse than normal. The researchers conclude the scent stimulated brain areas connected with emotion, making their decisions emotional rather than rational.</p>\n            <p><strong>G</strong> Smells are especially good memory evokers, but it is actually a myth that odours trigger more detailed memories than other stimuli. ‘The memory is not more accurate and you don't remember more details,' says Yaara Yeshurun at the Weizmann Institute of Science in Rehovot, Israel, ‘but it is unique in that it is more emotional.' This isn't surprising when you consider that there are certain brain areas dedicated to both emotion and olfaction, such as the amygdala, and there is a strong link between emotion and memory. In 2009, Yeshurun found that the link between a memory and a smell is stronger if the smell is unpleasant rather than pleasant. She also discovered that the very first time we attach a smell to an object, it evokes a much greater response in our brains than for any subsequent encounter with the smell or object, laying down stronger foundations for the memory. That doesn't happen with any other sense. Since those first encounters with a smell would have happened at a young age, this explains why smells often transport us back to our childhood.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>The Power of Smell</h2>\n<h4>Research shows that our olfactory sense is more influential than we realise</h4>\n<p><strong>A</strong> Dogs' noses are renowned for sensitivity to smells, while human noses are thought to be poor by comparison, yet that might be a misconception. According to recent studies, our noses are in fact acutely sensitive instruments that guide our everyday lives to a surprising extent. Subtle smells can change your mood, behaviour and the choices you make, often without you realising it. Our own odours, meanwhile, indicate emotional states such as fear or sadness to those around us. The big mystery is why we aren't more aware of our nasal activity. Noses have certainly never been at the forefront of sensory research, and were pushed aside until recently in favour of the seemingly more vital senses of vision and hearing. ‘There has been a lot of prejudice that people are not that influenced by olfactory stimuli, especially compared to other mammals,' says Lilianne Mujica-Parodi, who studies the neurobiology of human stress at Stony Brook University in New York, in the United States.</p>\n<p><strong>B</strong> One of the first people to assert the relative unimportance of human smelling was Pierre Paul Broca, an influential 19th-century anatomist. After comparing the proportion of the brain devoted to smell in different animals, he suggested that mammals can be classed into two broad groups: macrosmatic mammals, such as dogs, have a finely tuned sense of smell which they rely on to perceive the world, while we, along with other primates and the marine mammals, are microsmatic – we have small olfactory organs that we only rely on to a small extent. That idea seemed to fit with more recent studies which found that the majority of mammals have genes coding for about 1000 different types of smell receptor. Most of these genes aren't expressed in humans, giving our noses just 400 different types of receptor.</p>\n<p><strong>C</strong> Yet these findings may have been misleading. Brain scans now show that more of the brain is devoted to smell processing than Broca's anatomical studies suggested. And although we may have fewer types of receptor than other mammals, Charles Greer at Yale University in the United States has shown that the human nose and brain are unusually well connected, with each group of receptors linking to many more neural regions than is the case in other animals. That should give us a good ability to process incoming scents. Once researchers began looking, they found the nose to be far more sensitive than its reputation suggested. One study, for example, found that we can detect certain chemicals diluted in water to less than one part per billion. That means that a person can detect just a few drops of a strong smell like ethyl mercaptan in an Olympic-sized pool.</p>\n<p><strong>D</strong> 'We are also exceptionally gifted at telling smells apart, even in the case of two molecules whose only difference is that their structures are mirror images of one another. That is fantastic sensitivity,' says George Dodd, a perfumer and researcher at the olfaction group of the University of Warwick, in the United Kingdom. What's more, it's becoming clear that the brain's olfactory centres are intimately linked to its limbic system, which is involved in emotion, fear and memory. That suggests a link between smell and the way we think.</p>\n<p><strong>E</strong> The power of smell will be no news to estate agents, who often advocate the smell of baking bread or brewing coffee to promote the sale of a house. But there are more subtle and surprising effects too. When Hendrik Schifferstein and colleagues, from Delft University of Technology in the Netherlands, pumped the smell of orange, seawater or peppermint into a nightclub, the revellers danced more, rated their night as more enjoyable, and even thought the music was better than when there was no added scent. Meanwhile, Rob Holland, of the University of Utrecht in the Netherlands, found that the hint of aroma wafting out of a hidden bucket of citrus-scented cleaner was enough to persuade students in a hostel to clean up after themselves.</p>\n<p><strong>F</strong> Other work has found that scent can influence our cognitive skills. A study by William Overman and colleagues at the University of North Carolina in the United States found that when men were subjected to a novel smell – either good or bad – during a task used to test decision-making skills, they performed significantly worse than normal. The researchers conclude the scent stimulated brain areas connected with emotion, making their decisions emotional rather than rational.</p>\n<p><strong>G</strong> Smells are especially good memory evokers, but it is actually a myth that odours trigger more detailed memories than other stimuli. ‘The memory is not more accurate and you don't remember more details,' says Yaara Yeshurun at the Weizmann Institute of Science in Rehovot, Israel, ‘but it is unique in that it is more emotional.' This isn't surprising when you consider that there are certain brain areas dedicated to both emotion and olfaction, such as the amygdala, and there is a strong link between emotion and memory. In 2009, Yeshurun found that the link between a memory and a smell is stronger if the smell is unpleasant rather than pleasant. She also discovered that the very first time we attach a smell to an object, it evokes a much greater response in our brains than for any subsequent encounter with the smell or object, laying down stronger foundations for the memory. That doesn't happen with any other sense. Since those first encounters with a smell would have happened at a young age, this explains why smells often transport us back to our childhood.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                 <h4>Questions 14–19</h4>\n                <p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n                <p>Which paragraph contains the following information?</p>\n                <p><em>Write the correct letter, <strong>A–G</strong>, in boxes 14–19 on your answer sheet.</em></p>\n                <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                        <thead>\n                            <tr>\n                                <th style=\"min-width: 200px;\"></th>\n                                <th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>14</strong> a finding that humans can distinguish between two extremely similar substances</td>\n                                <td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>15</strong> a categorisation of species according to their sensitivity to smell</td>\n                                <td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>16</strong> an instance where smell negatively affected people's ability to make choices</td>\n                                <td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>17</strong> a study that proved humans could perceive a tiny quantity of a substance</td>\n                                <td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>18</strong> an observation that studies of the sense of smell have been undervalued</td>\n                                <td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>19</strong> an example of using smell to prompt people to buy something</td>\n                                <td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td>\n                            </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–G</strong>, in boxes 14–19 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 200px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> a finding that humans can distinguish between two extremely similar substances</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> a categorisation of species according to their sensitivity to smell</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> an instance where smell negatively affected people's ability to make choices</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> a study that proved humans could perceive a tiny quantity of a substance</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>18</strong> an observation that studies of the sense of smell have been undervalued</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>19</strong> an example of using smell to prompt people to buy something</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -48,7 +48,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-anchor\">\n                <h4>Questions 20–23</h4>\n                <p>Look at the following statements (Questions 20–23) and the list of people below.</p>\n                <p>Match each statement with the correct person, <strong>A–F</strong>.</p>\n                \n                <div class=\"match-question-item\">\n                    <p><strong>20</strong> A faint smell could motivate people to do household chores</p>\n                    <div class=\"match-dropzone\" data-question=\"q7\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>21</strong> Humans are better equipped to interpret smell than other species are</p>\n                    <div class=\"match-dropzone\" data-question=\"q8\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                     <p><strong>22</strong> Smell is associated with feelings, rather than the logical part of the brain</p>\n                    <div class=\"match-dropzone\" data-question=\"q9\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                    <p><strong>23</strong> Humans do not require a sophisticated ability to smell</p>\n                    <div class=\"match-dropzone\" data-question=\"q10\"></div>\n                </div>\n\n                <div class=\"options-pool\" id=\"people-options-pool\">\n                    <strong>List of People</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" id=\"person-A\" draggable=\"true\" data-option=\"A\">A Lilianne Mujica-Parodi</div>\n                        <div class=\"drag-item\" id=\"person-B\" draggable=\"true\" data-option=\"B\">B Pierre Paul Broca</div>\n                        <div class=\"drag-item\" id=\"person-C\" draggable=\"true\" data-option=\"C\">C Charles Greer</div>\n                        <div class=\"drag-item\" id=\"person-D\" draggable=\"true\" data-option=\"D\">D Hendrik Schifferstein and colleagues</div>\n                        <div class=\"drag-item\" id=\"person-E\" draggable=\"true\" data-option=\"E\">E Rob Holland</div>\n                        <div class=\"drag-item\" id=\"person-F\" draggable=\"true\" data-option=\"F\">F William Overman and colleagues</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-anchor\">\n<h4>Questions 20–23</h4>\n<p>Look at the following statements (Questions 20–23) and the list of people below.</p>\n<p>Match each statement with the correct person, <strong>A–F</strong>.</p>\n<div class=\"match-question-item\">\n<p><strong>20</strong> A faint smell could motivate people to do household chores</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>21</strong> Humans are better equipped to interpret smell than other species are</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> Smell is associated with feelings, rather than the logical part of the brain</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> Humans do not require a sophisticated ability to smell</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"options-pool\" id=\"people-options-pool\">\n<strong>List of People</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"person-A\" draggable=\"true\" data-option=\"A\">A Lilianne Mujica-Parodi</div>\n<div class=\"drag-item\" id=\"person-B\" draggable=\"true\" data-option=\"B\">B Pierre Paul Broca</div>\n<div class=\"drag-item\" id=\"person-C\" draggable=\"true\" data-option=\"C\">C Charles Greer</div>\n<div class=\"drag-item\" id=\"person-D\" draggable=\"true\" data-option=\"D\">D Hendrik Schifferstein and colleagues</div>\n<div class=\"drag-item\" id=\"person-E\" draggable=\"true\" data-option=\"E\">E Rob Holland</div>\n<div class=\"drag-item\" id=\"person-F\" draggable=\"true\" data-option=\"F\">F William Overman and colleagues</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false
     },
     {
@@ -59,7 +59,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-anchor\">\n                 <h4>Questions 24–26</h4>\n                <p>Complete the sentences below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                <div class=\"completion-container\">\n                    <p>\n                    <strong>24</strong> The <input name=\"q11\" type=\"text\" id=\"q24_input\"> is a part of the brain that deals with feelings and smell.\n                    </p>\n                    <p>\n                    <strong>25</strong> <input name=\"q12\" type=\"text\" id=\"q25_input\"> smells create especially powerful associations with memories.\n                    </p>\n                    <p>\n                    <strong>26</strong> Of all the senses, smell has the capacity to prompt memories of <input name=\"q13\" type=\"text\" id=\"q26_input\">.\n                    </p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"completion-container\">\n<p>\n<strong>24</strong> The <input name=\"q11\" type=\"text\" id=\"q24_input\"> is a part of the brain that deals with feelings and smell.\n</p>\n<p>\n<strong>25</strong> <input name=\"q12\" type=\"text\" id=\"q25_input\"> smells create especially powerful associations with memories.\n</p>\n<p>\n<strong>26</strong> Of all the senses, smell has the capacity to prompt memories of <input name=\"q13\" type=\"text\" id=\"q26_input\">.\n</p>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>Mammoth Kill</h2>\n            <h4>What Led to the disappearance of the giant mammals? Kate Wong examines the theories</h4>\n            \n            <p>Although it's hard to imagine in this age of urban sprawl and automobiles, North America once belonged to huge, elephant-like mammoths, camels, bear-sized beavers and other giant beasts, collectively known as ‘megafauna'. Some 11,000 years ago, however, these large-bodied mammals—about 70 species in all—disappeared. Their demise coincided roughly with the arrival of humans on the continent and dramatic climate change—factors that have inspired several theories about the die-off. Yet despite decades of scientific investigation, the exact cause remains a mystery. Now new findings offer support to one of these controversial hypotheses: that human hunting drove these huge megafauna species to extinction.</p>\n            <p>This belief resulted in the overkill model which emerged in the 1960s, when it was put forth by Paul S. Martin of the University of Arizona. Since then, critics have charged that no archaeological remains exist to support the idea that the first Americans hunted to the extent necessary to cause these extinctions, but at the annual meeting of the Society of Vertebrate Paleontology in Mexico City in October 1999, specialist John Alroy of the University of California at Santa Barbara argued that, in fact, hunting-driven extinction is not only plausible, it was unavoidable. He has determined, using a computer simulation, that even a very modest amount of hunting would have wiped out these animals.</p>\n            <p>Assuming an initial human population of 100 people that grew no more than two per cent annually, Alroy determined that, if each band of, say, 50 people killed 15 to 20 large animals a year, humans could have eliminated the animal populations within 1,000 years. Large mammals in particular would have been vulnerable to the pressure because they have longer gestation periods than smaller mammals and their young require extended care.</p>\n            <p>However, not everyone agrees with Alroy's assessment. For one thing, the results depend on population-size estimates for the extinct animals—estimates that are not necessarily reliable. But a more specific criticism comes from mammal expert Ross D. E. MacPhee of the American Museum of Natural History in New York City, who points out that the relevant archaeological record contains barely a dozen examples of stone points embedded in mammoth bones (and none, it should be noted, are known from other megafaunal remains)—hardly what one might expect if hunting drove these animals to extinction. Furthermore, some of these species had a vast range, covering the whole continent—the Jefferson's ground sloth, for example, lived as far north as the Yukon and as far south as Mexico—which would have made hunting them in numbers sufficient to cause their extinction rather unlikely, he says.</p>\n            <p>MacPhee agrees that humans most likely brought about these extinctions (as well as others around the world that coincided with human arrival), but not directly. Rather than through hunting, he suggests that people may have introduced a deadly disease, perhaps through their dogs or accompanying vermin, which then spread wildly among the native species because of their low resistance to the new introductions. Repeated outbreaks of a deadly disease could thus quickly drive them to the point of no return. So far, MacPhee does not have empirical evidence for this theory, and it will not be easy to come by: such disease would kill far too quickly to leave its signature on the bones themselves. But he hopes that analyses of tissue and DNA from the most recent animal remains will eventually reveal the microbes responsible.</p>\n            <p>The third explanation for what brought on this North American extinction does not involve human beings. Instead, its proponents blame the loss on the climate. The Pleistocene epoch in question witnessed considerable climate instability, explains Russell W. Graham of the Denver Museum of Nature and Science. As a result, their regular habitats disappeared, and species that had once formed communities split apart. For some animals, this brought opportunity. For much of the megafauna, however, the increasingly uniform terrain left them with shrinking geographical ranges—a death sentence for large animals, which need correspondingly large ranges. Although these creatures managed to maintain viable populations through most of the Pleistocene period, the final major climate fluctuation pushed them over the edge, Graham says.</p>\n            <p>For his part, Alroy is still convinced that human hunters were the destroyers of the giant animals. The overkill model explains everything the disease and climate scenarios explain, he asserts, and in addition makes accurate predictions about which species would eventually become extinct.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>Mammoth Kill</h2>\n<h4>What Led to the disappearance of the giant mammals? Kate Wong examines the theories</h4>\n<p>Although it's hard to imagine in this age of urban sprawl and automobiles, North America once belonged to huge, elephant-like mammoths, camels, bear-sized beavers and other giant beasts, collectively known as ‘megafauna'. Some 11,000 years ago, however, these large-bodied mammals—about 70 species in all—disappeared. Their demise coincided roughly with the arrival of humans on the continent and dramatic climate change—factors that have inspired several theories about the die-off. Yet despite decades of scientific investigation, the exact cause remains a mystery. Now new findings offer support to one of these controversial hypotheses: that human hunting drove these huge megafauna species to extinction.</p>\n<p>This belief resulted in the overkill model which emerged in the 1960s, when it was put forth by Paul S. Martin of the University of Arizona. Since then, critics have charged that no archaeological remains exist to support the idea that the first Americans hunted to the extent necessary to cause these extinctions, but at the annual meeting of the Society of Vertebrate Paleontology in Mexico City in October 1999, specialist John Alroy of the University of California at Santa Barbara argued that, in fact, hunting-driven extinction is not only plausible, it was unavoidable. He has determined, using a computer simulation, that even a very modest amount of hunting would have wiped out these animals.</p>\n<p>Assuming an initial human population of 100 people that grew no more than two per cent annually, Alroy determined that, if each band of, say, 50 people killed 15 to 20 large animals a year, humans could have eliminated the animal populations within 1,000 years. Large mammals in particular would have been vulnerable to the pressure because they have longer gestation periods than smaller mammals and their young require extended care.</p>\n<p>However, not everyone agrees with Alroy's assessment. For one thing, the results depend on population-size estimates for the extinct animals—estimates that are not necessarily reliable. But a more specific criticism comes from mammal expert Ross D. E. MacPhee of the American Museum of Natural History in New York City, who points out that the relevant archaeological record contains barely a dozen examples of stone points embedded in mammoth bones (and none, it should be noted, are known from other megafaunal remains)—hardly what one might expect if hunting drove these animals to extinction. Furthermore, some of these species had a vast range, covering the whole continent—the Jefferson's ground sloth, for example, lived as far north as the Yukon and as far south as Mexico—which would have made hunting them in numbers sufficient to cause their extinction rather unlikely, he says.</p>\n<p>MacPhee agrees that humans most likely brought about these extinctions (as well as others around the world that coincided with human arrival), but not directly. Rather than through hunting, he suggests that people may have introduced a deadly disease, perhaps through their dogs or accompanying vermin, which then spread wildly among the native species because of their low resistance to the new introductions. Repeated outbreaks of a deadly disease could thus quickly drive them to the point of no return. So far, MacPhee does not have empirical evidence for this theory, and it will not be easy to come by: such disease would kill far too quickly to leave its signature on the bones themselves. But he hopes that analyses of tissue and DNA from the most recent animal remains will eventually reveal the microbes responsible.</p>\n<p>The third explanation for what brought on this North American extinction does not involve human beings. Instead, its proponents blame the loss on the climate. The Pleistocene epoch in question witnessed considerable climate instability, explains Russell W. Graham of the Denver Museum of Nature and Science. As a result, their regular habitats disappeared, and species that had once formed communities split apart. For some animals, this brought opportunity. For much of the megafauna, however, the increasingly uniform terrain left them with shrinking geographical ranges—a death sentence for large animals, which need correspondingly large ranges. Although these creatures managed to maintain viable populations through most of the Pleistocene period, the final major climate fluctuation pushed them over the edge, Graham says.</p>\n<p>For his part, Alroy is still convinced that human hunters were the destroyers of the giant animals. The overkill model explains everything the disease and climate scenarios explain, he asserts, and in addition makes accurate predictions about which species would eventually become extinct.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -37,7 +37,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n                <h4>Questions 14–20</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n                \n                <div class=\"summary-completion\">\n                    <p>\n                    Three theories have been put forward to explain the disappearance of the different species of large mammals that inhabited <strong>14</strong> <input name=\"q1\" type=\"text\" id=\"q14_input\"> 11,000 years ago. The <strong>15</strong> <input name=\"q2\" type=\"text\" id=\"q15_input\">, proposed around fifty years ago by Paul S. Martin, blames <strong>16</strong> <input name=\"q3\" type=\"text\" id=\"q16_input\"> by people for mass extinction. Computer calculations seem to support this explanation, but critics question the reliability of the figures they are based on.\n                    </p>\n                    <p>\n                    The second theory suggests that humans introduced a <strong>17</strong> <input name=\"q4\" type=\"text\" id=\"q17_input\"> which wiped out the large mammals. However, so far this theory also lacks any <strong>18</strong> <input name=\"q5\" type=\"text\" id=\"q18_input\">.\n                    </p>\n                    <p>\n                    The final theory suggests that this period experienced significant <strong>19</strong> <input name=\"q6\" type=\"text\" id=\"q19_input\">, which eventually led to the loss of habitat and to the division of the <strong>20</strong> <input name=\"q7\" type=\"text\" id=\"q20_input\"> that some of the large mammals had organized.\n                    </p>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 14–20</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<p>\nThree theories have been put forward to explain the disappearance of the different species of large mammals that inhabited <strong>14</strong> <input name=\"q1\" type=\"text\" id=\"q14_input\"> 11,000 years ago. The <strong>15</strong> <input name=\"q2\" type=\"text\" id=\"q15_input\">, proposed around fifty years ago by Paul S. Martin, blames <strong>16</strong> <input name=\"q3\" type=\"text\" id=\"q16_input\"> by people for mass extinction. Computer calculations seem to support this explanation, but critics question the reliability of the figures they are based on.\n</p>\n<p>\nThe second theory suggests that humans introduced a <strong>17</strong> <input name=\"q4\" type=\"text\" id=\"q17_input\"> which wiped out the large mammals. However, so far this theory also lacks any <strong>18</strong> <input name=\"q5\" type=\"text\" id=\"q18_input\">.\n</p>\n<p>\nThe final theory suggests that this period experienced significant <strong>19</strong> <input name=\"q6\" type=\"text\" id=\"q19_input\">, which eventually led to the loss of habitat and to the division of the <strong>20</strong> <input name=\"q7\" type=\"text\" id=\"q20_input\"> that some of the large mammals had organized.\n</p>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -51,7 +51,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n                <h4>Questions 21–26</h4>\n                <p>Look at the following statements (Questions 21–26) and the list of people below.</p>\n                <p>Match each statement with the correct person, <strong>A, B</strong> or <strong>C</strong>.</p>\n                <p><em>NB You may use any letter more than once.</em></p>\n                \n                <div class=\"match-question-item\">\n                    <p><strong>21</strong> Too little evidence exists to support the hunting theory.</p>\n                    <div class=\"match-dropzone\" data-question=\"q8\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>22</strong> The bigger the animal, the bigger the territory it requires for survival.</p>\n                    <div class=\"match-dropzone\" data-question=\"q9\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                     <p><strong>23</strong> Globally, humans have been indirectly responsible for the elimination of many species.</p>\n                    <div class=\"match-dropzone\" data-question=\"q10\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>24</strong> Population estimates can be used to understand how large mammals became extinct.</p>\n                    <div class=\"match-dropzone\" data-question=\"q11\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>25</strong> Scientific examination of fossil remains may provide some proof for one of the theories.</p>\n                    <div class=\"match-dropzone\" data-question=\"q12\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>26</strong> Environmental changes negatively affected the social groupings of some large species.</p>\n                    <div class=\"match-dropzone\" data-question=\"q13\"></div>\n                </div>\n\n                <div class=\"options-pool\" id=\"researcher-options-pool\">\n                    <strong>List of People</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" id=\"person-A\" draggable=\"true\" data-option=\"A\">A John Alroy</div>\n                        <div class=\"drag-item\" id=\"person-B\" draggable=\"true\" data-option=\"B\">B Ross D. E. MacPhee</div>\n                        <div class=\"drag-item\" id=\"person-C\" draggable=\"true\" data-option=\"C\">C Russell W. Graham</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-12-13-anchor\">\n<h4>Questions 21–26</h4>\n<p>Look at the following statements (Questions 21–26) and the list of people below.</p>\n<p>Match each statement with the correct person, <strong>A, B</strong> or <strong>C</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>21</strong> Too little evidence exists to support the hunting theory.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> The bigger the animal, the bigger the territory it requires for survival.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> Globally, humans have been indirectly responsible for the elimination of many species.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>24</strong> Population estimates can be used to understand how large mammals became extinct.</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>25</strong> Scientific examination of fossil remains may provide some proof for one of the theories.</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>26</strong> Environmental changes negatively affected the social groupings of some large species.</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div class=\"options-pool\" id=\"researcher-options-pool\">\n<strong>List of People</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"person-A\" draggable=\"true\" data-option=\"A\">A John Alroy</div>\n<div class=\"drag-item\" id=\"person-B\" draggable=\"true\" data-option=\"B\">B Ross D. E. MacPhee</div>\n<div class=\"drag-item\" id=\"person-C\" draggable=\"true\" data-option=\"C\">C Russell W. Graham</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": true
     }
   ],
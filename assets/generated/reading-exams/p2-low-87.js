@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 2</h2>\n            <p>You should spend about 20 minutes on Questions 14–29, which are based on Reading Passage 2 on the following pages.</p>\n            \n            <h3>Speaking of Nothing</h3>\n            <h4>Why we talk about the weather and other trivial topics</h4>\n            \n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"A\" id=\"q1-dropzone\" data-question=\"q1\">\n                    <span class=\"paragraph-label\">Paragraph A (Q14):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>A</strong> Some workers are happier in their jobs than others, but it's not only to do with the work itself. For example, security guards, truck drivers and salespeople—year after year, these jobs appear on lists of the unhappiest careers. It's true that many factors can make a job cheerless, including unusual hours, low pay and a lack of chances for advancement. However, these three types of work stand out for another reason: they're characterised by a lack of conversation or by meaningless small talk, which unfortunately represents an obligatory part of the job. Examples of such small talk include comments about the weather, holiday destinations and food. Psychologists have long said that connecting with others through meaningful exchanges is central to well-being, but just how much conversation we require is under investigation.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"B\" id=\"q2-dropzone\" data-question=\"q2\">\n                    <span class=\"paragraph-label\">Paragraph B (Q15):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>B</strong> Matthias R. Mehl and Simine Vazire of the University of Arizona in the United States wanted to investigate the types of conversations people have. The team used a device to periodically record short verbal exchanges while participants went about their daily tasks. In the study, the researchers eavesdropped on undergraduates for four days, then catalogued each overheard conversation as either ‘small talk’ (“What do you have there? Popcorn? That looks good!”) or ‘substantive’ (“So did their proposal get funding?” “How did you feel?”). They found that people who had more substantive conversations were more likely to say they were feeling happy and fulfilled overall. In fact, the happiest students had roughly twice as many substantive talks as the unhappiest ones. Small talk, meanwhile, made up only 10 per cent of their conversation, versus almost 30 per cent of conversation among the least content students.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"C\" id=\"q3-dropzone\" data-question=\"q3\">\n                    <span class=\"paragraph-label\">Paragraph C (Q16):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>C</strong> However, small talk still has a role to play. Rather than convey information, scientists believe that it can promote bonding. Ipek Kulahci and her team of researchers at University College Cork in Ireland tested the relationship between vocal exchanges and grooming in lemurs. The researchers reported that the animals reserve their call-and-response conversations, equivalent to human chitchat, for the animals they groom the most—suggesting that small talk maintains closeness with loved ones, and isn't merely for awkward exchanges with strangers. It appears that, even among animals, vocal exchanges indicate strong social bonds between the group members.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"D\" id=\"q4-dropzone\" data-question=\"q4\">\n                    <span class=\"paragraph-label\">Paragraph D (Q17):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>D</strong> Connecting with others seems to increase happiness, but strangers in close proximity routinely ignore each other. To examine the experience of connecting to strangers, psychologists Nicholas Epley and Juliana Schroeder from the University of Chicago in the United States gave volunteers varying directions about whether to talk with other commuters who usually took the same train to work every day—something they typically avoided. Those told to chat with others reported a more pleasant journey than those told to “enjoy your solitude” or do whatever they normally would. All of the volunteers in the study who initiated conversations reported a positive reaction from the people they spoke to. Participants had predicted precisely the opposite outcome. They expected that the others on the train would have preferred to be left alone.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"E\" id=\"q5-dropzone\" data-question=\"q5\">\n                    <span class=\"paragraph-label\">Paragraph E (Q18):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>E</strong> When we buy a cup of coffee at a café, we sometimes chat with the service staff, but on other occasions we say as little as possible so as not to waste time. Every day we have opportunities to transform potentially impersonal exchanges into genuine social interactions; in other words, treating a service provider like we would an acquaintance might make us happier. In a study by Gillian Sandstrom and Elizabeth Dunn, people who had a social interaction with a server in a coffee shop felt better emotionally than people who were in a rush to get everything done. As well as feeling happier, the first group had a stronger sense of belonging. These results suggest that, although people are often reluctant to have a genuine social interaction with a stranger, they are happier when they do. In similar studies, when volunteers broke the silence at a gallery to chat with other visitors, the visitors felt happier and more connected to the paintings than those who were not approached. The pleasure of connection seems contagious; in a laboratory waiting room, participants who were talked to had equally positive experiences as those instructed to talk to them.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"F\" id=\"q6-dropzone\" data-question=\"q6\">\n                    <span class=\"paragraph-label\">Paragraph F (Q19):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>F</strong> Of course, some of us are better than others at small talk. In a study by Todd Kashdan and his team from George Mason University in the United States, people who were rated by the researchers as ‘less curious’ about all aspects of life had trouble getting a conversation going on their own. However, they had greater luck building closeness with others when they were supplied with topics that encouraged people to open up about themselves and their lives. But people who were deemed ‘curious’ needed no help transforming conversations about ordinary things like favourite holidays into other areas of conversation that allowed for intimate exchanges. The study showed that curious people expect to generate closeness during intimate conversations but not during small talk; less curious people anticipated poor outcomes in both situations. In an experiment by William Fleeson at Wake Forest University in the United States, participants were divided into two groups—those who were naturally outgoing, and those who were more reserved in social situations. They were then instructed to behave in the opposite manner to their usual nature. Participants reported more positive feelings when instructed to act extroverted than when instructed to act introverted. The overall conclusion, therefore, is that everyone can benefit from more conversation; the more meaningful, the better.</p>\n            </div>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–29, which are based on Reading Passage 2 on the following pages.</p>\n<h3>Speaking of Nothing</h3>\n<h4>Why we talk about the weather and other trivial topics</h4>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"A\" id=\"q1-dropzone\" data-question=\"q1\">\n<span class=\"paragraph-label\">Paragraph A (Q14):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> Some workers are happier in their jobs than others, but it's not only to do with the work itself. For example, security guards, truck drivers and salespeople—year after year, these jobs appear on lists of the unhappiest careers. It's true that many factors can make a job cheerless, including unusual hours, low pay and a lack of chances for advancement. However, these three types of work stand out for another reason: they're characterised by a lack of conversation or by meaningless small talk, which unfortunately represents an obligatory part of the job. Examples of such small talk include comments about the weather, holiday destinations and food. Psychologists have long said that connecting with others through meaningful exchanges is central to well-being, but just how much conversation we require is under investigation.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"B\" id=\"q2-dropzone\" data-question=\"q2\">\n<span class=\"paragraph-label\">Paragraph B (Q15):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> Matthias R. Mehl and Simine Vazire of the University of Arizona in the United States wanted to investigate the types of conversations people have. The team used a device to periodically record short verbal exchanges while participants went about their daily tasks. In the study, the researchers eavesdropped on undergraduates for four days, then catalogued each overheard conversation as either ‘small talk’ (“What do you have there? Popcorn? That looks good!”) or ‘substantive’ (“So did their proposal get funding?” “How did you feel?”). They found that people who had more substantive conversations were more likely to say they were feeling happy and fulfilled overall. In fact, the happiest students had roughly twice as many substantive talks as the unhappiest ones. Small talk, meanwhile, made up only 10 per cent of their conversation, versus almost 30 per cent of conversation among the least content students.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"C\" id=\"q3-dropzone\" data-question=\"q3\">\n<span class=\"paragraph-label\">Paragraph C (Q16):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> However, small talk still has a role to play. Rather than convey information, scientists believe that it can promote bonding. Ipek Kulahci and her team of researchers at University College Cork in Ireland tested the relationship between vocal exchanges and grooming in lemurs. The researchers reported that the animals reserve their call-and-response conversations, equivalent to human chitchat, for the animals they groom the most—suggesting that small talk maintains closeness with loved ones, and isn't merely for awkward exchanges with strangers. It appears that, even among animals, vocal exchanges indicate strong social bonds between the group members.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"D\" id=\"q4-dropzone\" data-question=\"q4\">\n<span class=\"paragraph-label\">Paragraph D (Q17):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> Connecting with others seems to increase happiness, but strangers in close proximity routinely ignore each other. To examine the experience of connecting to strangers, psychologists Nicholas Epley and Juliana Schroeder from the University of Chicago in the United States gave volunteers varying directions about whether to talk with other commuters who usually took the same train to work every day—something they typically avoided. Those told to chat with others reported a more pleasant journey than those told to “enjoy your solitude” or do whatever they normally would. All of the volunteers in the study who initiated conversations reported a positive reaction from the people they spoke to. Participants had predicted precisely the opposite outcome. They expected that the others on the train would have preferred to be left alone.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"E\" id=\"q5-dropzone\" data-question=\"q5\">\n<span class=\"paragraph-label\">Paragraph E (Q18):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> When we buy a cup of coffee at a café, we sometimes chat with the service staff, but on other occasions we say as little as possible so as not to waste time. Every day we have opportunities to transform potentially impersonal exchanges into genuine social interactions; in other words, treating a service provider like we would an acquaintance might make us happier. In a study by Gillian Sandstrom and Elizabeth Dunn, people who had a social interaction with a server in a coffee shop felt better emotionally than people who were in a rush to get everything done. As well as feeling happier, the first group had a stronger sense of belonging. These results suggest that, although people are often reluctant to have a genuine social interaction with a stranger, they are happier when they do. In similar studies, when volunteers broke the silence at a gallery to chat with other visitors, the visitors felt happier and more connected to the paintings than those who were not approached. The pleasure of connection seems contagious; in a laboratory waiting room, participants who were talked to had equally positive experiences as those instructed to talk to them.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"F\" id=\"q6-dropzone\" data-question=\"q6\">\n<span class=\"paragraph-label\">Paragraph F (Q19):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> Of course, some of us are better than others at small talk. In a study by Todd Kashdan and his team from George Mason University in the United States, people who were rated by the researchers as ‘less curious’ about all aspects of life had trouble getting a conversation going on their own. However, they had greater luck building closeness with others when they were supplied with topics that encouraged people to open up about themselves and their lives. But people who were deemed ‘curious’ needed no help transforming conversations about ordinary things like favourite holidays into other areas of conversation that allowed for intimate exchanges. The study showed that curious people expect to generate closeness during intimate conversations but not during small talk; less curious people anticipated poor outcomes in both situations. In an experiment by William Fleeson at Wake Forest University in the United States, participants were divided into two groups—those who were naturally outgoing, and those who were more reserved in social situations. They were then instructed to behave in the opposite manner to their usual nature. Participants reported more positive feelings when instructed to act extroverted than when instructed to act introverted. The overall conclusion, therefore, is that everyone can benefit from more conversation; the more meaningful, the better.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -39,7 +39,7 @@
         "q15",
         "q16"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                <h4>Questions 14–19</h4>\n                <p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n                <p>Choose the correct heading for each paragraph from the list of headings below.</p>\n                <p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n                \n                <div class=\"headings-pool\" id=\"headings-pool-container\">\n                    <strong>List of Headings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i How sounds and physical contact strengthen social connections</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii A cross-cultural study of superficial interaction</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii An experiment that led to surprising results</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv A study that categorised types of spoken exchanges</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v The personality types that find small talk more difficult</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi The effect of social media on conversation skills</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii Some occupations involve little or no interesting conversation</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii A campaign to improve interaction in the workplace</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix A range of common situations that were enhanced by small talk</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i How sounds and physical contact strengthen social connections</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii A cross-cultural study of superficial interaction</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii An experiment that led to surprising results</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv A study that categorised types of spoken exchanges</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v The personality types that find small talk more difficult</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi The effect of social media on conversation skills</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii Some occupations involve little or no interesting conversation</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii A campaign to improve interaction in the workplace</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix A range of common situations that were enhanced by small talk</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -54,7 +54,7 @@
         "q11",
         "q12"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-11-12-anchor\">\n                <h4>Questions 20–25</h4>\n                <p>Look at the following statements (Questions 20–25) and the list of people below.</p>\n                <p>Match each statement with the correct person, <strong>A–E</strong>.</p>\n                <p><em>NB You may use any letter more than once.</em></p>\n                \n                <div class=\"match-question-item\">\n                    <p><strong>20</strong> Interacting socially is preferable to hurrying through a transaction.</p>\n                    <div class=\"match-dropzone\" data-question=\"q7\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>21</strong> If someone is truly uninterested in the wider world, they'll find small talk more difficult.</p>\n                    <div class=\"match-dropzone\" data-question=\"q8\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                    <p><strong>22</strong> People who had been unwilling to start a conversation ended up enjoying a social exchange.</p>\n                    <div class=\"match-dropzone\" data-question=\"q9\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                    <p><strong>23</strong> People whose conversations are mainly of a personal and meaningful nature are more satisfied with their lives.</p>\n                    <div class=\"match-dropzone\" data-question=\"q10\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>24</strong> There is more than one species whose members communicate for social reasons.</p>\n                    <div class=\"match-dropzone\" data-question=\"q11\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>25</strong> Some people find it easier than others to change the subject of a conversation.</p>\n                    <div class=\"match-dropzone\" data-question=\"q12\"></div>\n                </div>\n\n                <div class=\"options-pool\" id=\"researcher-options-pool\">\n                    <strong>List of Researchers</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Matthias R. Mehl and Simine Vazire</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Ipek Kulahci</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Nicholas Epley and Juliana Schroeder</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Gillian Sandstrom and Elizabeth Dunn</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Todd Kashdan</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-11-12-anchor\">\n<h4>Questions 20–25</h4>\n<p>Look at the following statements (Questions 20–25) and the list of people below.</p>\n<p>Match each statement with the correct person, <strong>A–E</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>20</strong> Interacting socially is preferable to hurrying through a transaction.</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>21</strong> If someone is truly uninterested in the wider world, they'll find small talk more difficult.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> People who had been unwilling to start a conversation ended up enjoying a social exchange.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> People whose conversations are mainly of a personal and meaningful nature are more satisfied with their lives.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>24</strong> There is more than one species whose members communicate for social reasons.</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>25</strong> Some people find it easier than others to change the subject of a conversation.</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"options-pool\" id=\"researcher-options-pool\">\n<strong>List of Researchers</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Matthias R. Mehl and Simine Vazire</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Ipek Kulahci</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Nicholas Epley and Juliana Schroeder</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Gillian Sandstrom and Elizabeth Dunn</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Todd Kashdan</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": true
     },
     {
@@ -66,7 +66,7 @@
         "q15",
         "q16"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q13-14-15-16-anchor\">\n                 <h4>Questions 26–29</h4>\n                <p>Complete the sentences below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                <div class=\"sentence-completion\">\n                    <p><strong>26</strong> In the case of salespeople, some meaningless small talk is <input name=\"q13\" type=\"text\" id=\"q26_input\"> when dealing with customers.</p>\n                    <p><strong>27</strong> In a study that took place on a train, volunteers approached people who were regular <input name=\"q14\" type=\"text\" id=\"q27_input\">.</p>\n                    <p><strong>28</strong> In an experiment in an art gallery, people related more to the <input name=\"q15\" type=\"text\" id=\"q28_input\"> when they were drawn into a conversation.</p>\n                    <p><strong>29</strong> Introverted people found it helpful to be given <input name=\"q16\" type=\"text\" id=\"q29_input\"> which they could use to start conversations.</p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q13-14-15-16-anchor\">\n<h4>Questions 26–29</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"sentence-completion\">\n<p><strong>26</strong> In the case of salespeople, some meaningless small talk is <input name=\"q13\" type=\"text\" id=\"q26_input\"> when dealing with customers.</p>\n<p><strong>27</strong> In a study that took place on a train, volunteers approached people who were regular <input name=\"q14\" type=\"text\" id=\"q27_input\">.</p>\n<p><strong>28</strong> In an experiment in an art gallery, people related more to the <input name=\"q15\" type=\"text\" id=\"q28_input\"> when they were drawn into a conversation.</p>\n<p><strong>29</strong> Introverted people found it helpful to be given <input name=\"q16\" type=\"text\" id=\"q29_input\"> which they could use to start conversations.</p>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>The importance of being playful</h2>\n            <h4>Free play makes us better adjusted, smarter and less stressed</h4>\n\n            <p><strong>A</strong> While it has long been recognized that play affords benefits that last through adulthood, psychologists in the US are now becoming concerned that lack of play could actually be harming their country's kids. In the past, few children grew up without ample free-play time. But youngsters' leisure hours are now filled with structured activities such as music lessons and sports. Kids play soccer, Scrabble and saxophone – so why are experts worried that these activities are eating into free play? Most games are fun and sources of learning experiences – fostering group cohesion, for instance, says educational psychologist Anthony Pellegrini. But, Pellegrini explains, “games have predetermined rules - set up in advance and followed. Play, on the other hand, does not have rules, so affords more creative responses. Children initiate and create free play, and use their imagination to try out new activities and roles.”</p>\n            <p><strong>B</strong> Perhaps most crucially, play helps us develop strong social skills. “You don't become socially competent via teachers telling you how to behave,” Pellegrini says. “Kids learn those skills by interacting with peers, learning what is and isn't acceptable. They want this thing to keep going, so they're willing to 'go the extra mile' to accommodate their playmates' desires. Keeping things friendly requires communication – arguably the most valuable social skill of all. Play among peers is the most important in this regard.” Studies show that children use more sophisticated language when playing with other children than when playing with adults. In pretend play, for instance, they have to communicate about something that's not physically present, so they have to use complicated language to communicate what it is that they're trying to say,” Pellegrini explains.</p>\n            <p><strong>C</strong> If play helps children become socialized, then lack of play should impede social development – and research suggests that it does. A study of children in Michigan revealed that kids who enrolled in play-oriented preschools were more socially adjusted later in life – and less likely to commit a felony or be suspended from work – than kids who attended play-free preschools where they were constantly instructed by teachers.</p>\n            <p><strong>D</strong> A 2003 study even suggests that play promotes emotional and social development in animals. Researchers allowed thirteen rats to play freely with companions for three and a half days, and kept fourteen others isolated for the same period. Examination revealed that the brains of the rats which had played contained much higher levels of BDNF a protein that stimulates the growth of new neurons than those of the animals that had not. \"I think play is the major mechanism whereby higher regions of the brain get socialized,” says neuroscientist Jaak Panksepp, who co-authored the study.</p>\n            <p><strong>E</strong> Research also suggests that imaginative play is critical for children's emotional health, as it enables them to work through anxiety. In a 1984 study, researchers assessed the anxiety levels of seventy-four children on their first day of preschool. They labeled each child as either “anxious” or “not anxious”, then randomly split the kids into groups. Half were escorted to rooms full of toys, where they played for 15 minutes; the other half listened to a teacher tell a story for 15 minutes. Afterward, their levels were assessed again. The anxiety levels of the anxious kids who had played had dropped by more than twice as much compared with the anxious kids who had listened to the story.</p>\n            <p><strong>F</strong> Results of animal studies support these views. In 2008, neuroscientist Stephen Siviy put rats into a chamber and exposed them to a collar previously worn by a cat, making them visibly anxious. Later, the chamber was cleaned to remove the cat odor, and the rats were put back without the collar. They immediately became anxious again, probably because they associated the space with the cat. The researchers then introduced another rat one that had never been exposed to the collar and was not afraid – and it began playing with one of the rats. “Shortly thereafter, the first rat relaxed and became calm,\" says Siviy, “suggesting that play helped lessen its anxiety.\"</p>\n            <p><strong>G</strong> Play even appears to make kids smarter. In a classic study, researchers told a group of preschool children to play freely with some common objects such as paper towels, a screwdriver, a wooden board and paper clips. Another group was asked to imitate an experimenter using the objects in common ways. A third set was told to sit and draw whatever they wanted, without seeing the objects. After 10 minutes, the researchers asked the children to come up with ideas for how one of the objects could be used. The kids who had played with the objects named, on average, three times as many nonstandard, creative uses for the objects as those in either of the other two groups did, suggesting that play fosters imaginative thinking.</p>\n            <p><strong>H</strong> A later animal study produced similar results. Experimenters isolated young rats during the development period when they would have most frequently played. The researchers taught these rats, and a group that had been allowed to play without constraints, to pull a rubber ball out of the way to get a food treat. A few days later they switched the setup so the rats would have to push the same ball to get the treat. Compared with the isolated rats, the ones which had played proved to be far more adept at solving problems. “Play is like a kaleidoscope,” says evolutionary biologist Marc Bekoff, “in that it is random and creative. It encourages flexibility and creativity that may, in the future, be advantageous in unexpected situations or new environments. And in the absence of play, children miss vital learning experiences.”</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n\n        <div id=\"divider\"></div>"
+        "html": "<h2>The importance of being playful</h2>\n<h4>Free play makes us better adjusted, smarter and less stressed</h4>\n<p><strong>A</strong> While it has long been recognized that play affords benefits that last through adulthood, psychologists in the US are now becoming concerned that lack of play could actually be harming their country's kids. In the past, few children grew up without ample free-play time. But youngsters' leisure hours are now filled with structured activities such as music lessons and sports. Kids play soccer, Scrabble and saxophone – so why are experts worried that these activities are eating into free play? Most games are fun and sources of learning experiences – fostering group cohesion, for instance, says educational psychologist Anthony Pellegrini. But, Pellegrini explains, “games have predetermined rules - set up in advance and followed. Play, on the other hand, does not have rules, so affords more creative responses. Children initiate and create free play, and use their imagination to try out new activities and roles.”</p>\n<p><strong>B</strong> Perhaps most crucially, play helps us develop strong social skills. “You don't become socially competent via teachers telling you how to behave,” Pellegrini says. “Kids learn those skills by interacting with peers, learning what is and isn't acceptable. They want this thing to keep going, so they're willing to 'go the extra mile' to accommodate their playmates' desires. Keeping things friendly requires communication – arguably the most valuable social skill of all. Play among peers is the most important in this regard.” Studies show that children use more sophisticated language when playing with other children than when playing with adults. In pretend play, for instance, they have to communicate about something that's not physically present, so they have to use complicated language to communicate what it is that they're trying to say,” Pellegrini explains.</p>\n<p><strong>C</strong> If play helps children become socialized, then lack of play should impede social development – and research suggests that it does. A study of children in Michigan revealed that kids who enrolled in play-oriented preschools were more socially adjusted later in life – and less likely to commit a felony or be suspended from work – than kids who attended play-free preschools where they were constantly instructed by teachers.</p>\n<p><strong>D</strong> A 2003 study even suggests that play promotes emotional and social development in animals. Researchers allowed thirteen rats to play freely with companions for three and a half days, and kept fourteen others isolated for the same period. Examination revealed that the brains of the rats which had played contained much higher levels of BDNF a protein that stimulates the growth of new neurons than those of the animals that had not. \"I think play is the major mechanism whereby higher regions of the brain get socialized,” says neuroscientist Jaak Panksepp, who co-authored the study.</p>\n<p><strong>E</strong> Research also suggests that imaginative play is critical for children's emotional health, as it enables them to work through anxiety. In a 1984 study, researchers assessed the anxiety levels of seventy-four children on their first day of preschool. They labeled each child as either “anxious” or “not anxious”, then randomly split the kids into groups. Half were escorted to rooms full of toys, where they played for 15 minutes; the other half listened to a teacher tell a story for 15 minutes. Afterward, their levels were assessed again. The anxiety levels of the anxious kids who had played had dropped by more than twice as much compared with the anxious kids who had listened to the story.</p>\n<p><strong>F</strong> Results of animal studies support these views. In 2008, neuroscientist Stephen Siviy put rats into a chamber and exposed them to a collar previously worn by a cat, making them visibly anxious. Later, the chamber was cleaned to remove the cat odor, and the rats were put back without the collar. They immediately became anxious again, probably because they associated the space with the cat. The researchers then introduced another rat one that had never been exposed to the collar and was not afraid – and it began playing with one of the rats. “Shortly thereafter, the first rat relaxed and became calm,\" says Siviy, “suggesting that play helped lessen its anxiety.\"</p>\n<p><strong>G</strong> Play even appears to make kids smarter. In a classic study, researchers told a group of preschool children to play freely with some common objects such as paper towels, a screwdriver, a wooden board and paper clips. Another group was asked to imitate an experimenter using the objects in common ways. A third set was told to sit and draw whatever they wanted, without seeing the objects. After 10 minutes, the researchers asked the children to come up with ideas for how one of the objects could be used. The kids who had played with the objects named, on average, three times as many nonstandard, creative uses for the objects as those in either of the other two groups did, suggesting that play fosters imaginative thinking.</p>\n<p><strong>H</strong> A later animal study produced similar results. Experimenters isolated young rats during the development period when they would have most frequently played. The researchers taught these rats, and a group that had been allowed to play without constraints, to pull a rubber ball out of the way to get a food treat. A few days later they switched the setup so the rats would have to push the same ball to get the treat. Compared with the isolated rats, the ones which had played proved to be far more adept at solving problems. “Play is like a kaleidoscope,” says evolutionary biologist Marc Bekoff, “in that it is random and creative. It encourages flexibility and creativity that may, in the future, be advantageous in unexpected situations or new environments. And in the absence of play, children miss vital learning experiences.”</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                 <p>Reading Passage 2 has eight paragraphs, <strong>A–H</strong>.</p>\n                 <p>Which paragraph contains the following information?</p>\n                 <p><em>Write the correct letter, <strong>A–H</strong>, in boxes 14–18 on your answer sheet.</em></p>\n                 <p><strong>NB</strong> You may use any letter more than once.</p>\n                <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                        <thead>\n                            <tr>\n                                <th style=\"min-width: 200px;\"></th>\n                                <th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>14</strong> reference to how play can develop children's verbal skills</td>\n                                <td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>15</strong> mention of a change in the amount of free play children engage in</td>\n                                <td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>16</strong> an account of some research indicating that free play stimulates children's creativity</td>\n                                <td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>17</strong> evidence of the link between antisocial behaviour and a lack of free play</td>\n                                <td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>18</strong> a comparison between free play and other forms of play</td>\n                                <td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n                            </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<p>Reading Passage 2 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–H</strong>, in boxes 14–18 on your answer sheet.</em></p>\n<p><strong>NB</strong> You may use any letter more than once.</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 200px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>14</strong> reference to how play can develop children's verbal skills</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>15</strong> mention of a change in the amount of free play children engage in</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>16</strong> an account of some research indicating that free play stimulates children's creativity</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>17</strong> evidence of the link between antisocial behaviour and a lack of free play</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>18</strong> a comparison between free play and other forms of play</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>",
       "leadHtml": "<h3>Questions 14–18</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n                <p>Look at the following statements about free play (Questions 19–22) and the list of researchers below.</p>\n                <p>Match each statement with the correct researcher, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <p><em>NB You may use any letter more than once.</em></p>\n\n                <div class=\"match-question-item\">\n                    <p><strong>19</strong> It encourages children to take other people's wishes into account.</p>\n                    <div class=\"match-dropzone\" data-question=\"q6\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>20</strong> It can serve to relieve stress.</p>\n                    <div class=\"match-dropzone\" data-question=\"q7\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                     <p><strong>21</strong> It prepares children for dealing with unpredictable situations.</p>\n                    <div class=\"match-dropzone\" data-question=\"q8\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                    <p><strong>22</strong> It is less useful for children when adults are involved.</p>\n                    <div class=\"match-dropzone\" data-question=\"q9\"></div>\n                </div>\n\n                <div class=\"options-pool\" id=\"researcher-options-pool\">\n                    <strong>List of researchers</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" id=\"researcher-A\" draggable=\"true\" data-option=\"A\">A Anthony Pellegrini</div>\n                        <div class=\"drag-item\" id=\"researcher-B\" draggable=\"true\" data-option=\"B\">B Jaak Panksepp</div>\n                        <div class=\"drag-item\" id=\"researcher-C\" draggable=\"true\" data-option=\"C\">C Stephen Siviy</div>\n                        <div class=\"drag-item\" id=\"researcher-D\" draggable=\"true\" data-option=\"D\">D Marc Bekoff</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<p>Look at the following statements about free play (Questions 19–22) and the list of researchers below.</p>\n<p>Match each statement with the correct researcher, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>19</strong> It encourages children to take other people's wishes into account.</p>\n<div class=\"match-dropzone\" data-question=\"q6\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>20</strong> It can serve to relieve stress.</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>21</strong> It prepares children for dealing with unpredictable situations.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> It is less useful for children when adults are involved.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"options-pool\" id=\"researcher-options-pool\">\n<strong>List of researchers</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"researcher-A\" draggable=\"true\" data-option=\"A\">A Anthony Pellegrini</div>\n<div class=\"drag-item\" id=\"researcher-B\" draggable=\"true\" data-option=\"B\">B Jaak Panksepp</div>\n<div class=\"drag-item\" id=\"researcher-C\" draggable=\"true\" data-option=\"C\">C Stephen Siviy</div>\n<div class=\"drag-item\" id=\"researcher-D\" draggable=\"true\" data-option=\"D\">D Marc Bekoff</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": true
     },
     {
@@ -59,7 +59,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-anchor\">\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                <div class=\"summary-completion\">\n                    <h4>Animal research into the value of play</h4>\n                    <p>In studies researching links between play and social learning, experiments analysing protein levels in the <strong>23</strong> <input name=\"q10\" type=\"text\" id=\"q23_input\"> of rats noted significant differences between rats which had played and those which had not.</p>\n                    <p>In another study, rats made distressed by an object smelling of a <strong>24</strong> <input name=\"q11\" type=\"text\" id=\"q24_input\"> experienced a noticeable reduction in their <strong>25</strong> <input name=\"q12\" type=\"text\" id=\"q25_input\"> levels after they had been allowed to play.</p>\n                    <p>A further experiment, in which rats had to move a <strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\"> in order to reach a reward, indicated that rats deprived of play were less skilled at dealing with problems.</p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>Animal research into the value of play</h4>\n<p>In studies researching links between play and social learning, experiments analysing protein levels in the <strong>23</strong> <input name=\"q10\" type=\"text\" id=\"q23_input\"> of rats noted significant differences between rats which had played and those which had not.</p>\n<p>In another study, rats made distressed by an object smelling of a <strong>24</strong> <input name=\"q11\" type=\"text\" id=\"q24_input\"> experienced a noticeable reduction in their <strong>25</strong> <input name=\"q12\" type=\"text\" id=\"q25_input\"> levels after they had been allowed to play.</p>\n<p>A further experiment, in which rats had to move a <strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\"> in order to reach a reward, indicated that rats deprived of play were less skilled at dealing with problems.</p>\n</div>\n</div>"
     }
   ],
   "answerKey": {
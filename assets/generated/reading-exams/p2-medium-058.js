@@ -16,7 +16,7 @@
       {
         "blockId": "passage-main",
         "kind": "text",
-        "bodyHtml": "<h2>READING PASSAGE 2</h2>\n    <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n    \n    <h3>Who wrote Shakespeare's plays?</h3>\n    <p style=\"font-style: italic; color: var(--muted);\">Experts suggest 'Shakespeare' may have been a pseudonym - a pen-name - for another writer. Robert Matthews investigates</p>\n    \n    <p><span class=\"paragraph-label\">A</span> Even today, almost 400 years after his death, the works of the famous English dramatist William Shakespeare have lost none of their appeal, nor have questions about the source of his genius. For is it really credible that an ordinary actor from the small town of Stratford-upon-Avon should metamorphose into so extraordinary a dramatist? For some, the answer is obvious: Shakespeare was a genius whose gift is no more suspicious than that of the physicist Albert Einstein, the German salesman's son who devised the theory of relativity. But others have insisted that a mere school leaver simply could not have penned such sophisticated works. They believe that Shakespeare was a pseudonym for someone with far more impressive qualifications who wrote the plays that still play to packed theatres today. But after long and largely fruitless debate, researchers are now turning to scientific methods to resolve the controversies surrounding Shakespeare. Ways of identifying the literary 'fingerprint' of writers are currently being developed using computers. This analysis of features of literary style is known as 'stylometry' and with it researchers can recognise the work of Shakespeare and his contemporaries with impressive reliability.</p>\n    \n    <p><span class=\"paragraph-label\">B</span> The idea of using these basic scientific techniques to probe questions of authorship dates back to 1851, when the Victorian mathematician Augustus de Morgan suggested that different authors might be identified through the frequency with which they used words of different lengths. His idea attracted the attention of Thomas Mendenhall, an American physicist who decided to use word length to investigate one of the oldest controversies about the works of Shakespeare: were they actually written by someone else?</p>\n    \n    <p><span class=\"paragraph-label\">C</span> As long ago as 1785, the Elizabethan writer and philosopher Sir Francis Bacon was identified as a possible contender for having written Shakespeare's works. Bacon's possible motivation for not wanting to be known as the author of such masterpieces is far from clear, but Mendenhall believed his methods might at least reveal telltale signs of Bacon's hand in the plays. However, his results, published in 1901, revealed Bacon's writing style to be quite unlike that of Shakespeare. But Mendenhall's methods also revealed some key concerns. Recognising the need to include large samples of writing from both authors, Mendenhall lumped all their works together, despite the fact that literary style can vary enormously between plays, poetry and philosophy, for example. His focus on word length as the sole 'fingerprint' of writing style was also questionable - for how could he be sure that some other characteristics would not give different results? But Mendenhall's biggest fault was perhaps simply that he was too far ahead of his time - he was attempting a task that cried out for the kind of computers not even conceivable over 100 years ago. More recently with their development scholars have been able to look for subtle peculiarities among the complete works of authors, which, in Shakespeare's case, amount to over 800,000 words.</p>\n    \n    <p><span class=\"paragraph-label\">D</span> One of the key controversies now being probed is Shakespeare's relationship with other dramatists. Was he a lone genius or was his work the result of collaboration? Traditional methods of investigating such questions have relied on traits like the use of metaphor, but these may be shared by different authors simply on cultural grounds. In contrast, modern stylometry focuses on far more fundamental characteristics which are less likely to be shared by others. The text-crunching power of computers allows researchers to pinpoint phrases, words or even individual letters by their frequency in the work of different authors. Pattern recognition techniques are then used to develop a 'fingerprint' for each author.</p>\n    \n    <p><span class=\"paragraph-label\">E</span> Stylometry has come up with little to encourage the continual number of experts who insist Shakespeare was simply too uneducated to create works of enduring brilliance. In 1996, literary scholar Ward Elliott and mathematician Robert Valenza of Claremont McKenna College, California, published the results of a stylometric comparison of the works of Shakespeare with those of over 30 of the proposed 'real' authors. Elliott and Valenza applied a battery of 51 tests to computerized texts and found that none of the claimants had a stylometric 'fingerprint' similar to that of Shakespeare. \"I think these claims were driven initially by a sense that Shakespeare is too 'important' to be an ordinary person,\" says Professor Kate McCluskey, director of the Shakespeare Institute at the University of Birmingham.</p>\n    \n    <p><span class=\"paragraph-label\">F</span> Elliott and Valenza's research found something else too. Some of the earliest plays, notably Henry VI and the notoriously violent Titus Andronicus, seem to be a combination of Shakespeare and his brilliant contemporary the playwright Christopher Marlowe, who was born in the same year as Shakespeare. Traditional scholars accept that Marlowe influenced Shakespeare's early work,' says Dr Thomas Merriam, one of Britain's leading stylometry experts. He explains that, provisionally at least, stylometric studies suggest some of Marlowe's actual text exists within the early plays of Shakespeare.</p>\n    \n    <p><span class=\"paragraph-label\">G</span> Some scholars remain cautious about basing new views of Shakespeare's career on stylometric analysis of centuries-old texts. \"If they have been edited, amended or shortened, then the data from them is highly compromised,\" says Dr Markus Dahl of London University. Even so, the results to date are in line with the growing view of Shakespeare as a hardworking professional who perfected his skills throughout his career.</p>\n    \n    <p>&nbsp;</p>\n    <p>&nbsp;</p>\n    <p>&nbsp;</p>"
+        "bodyHtml": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Who wrote Shakespeare's plays?</h3>\n<p style=\"font-style: italic; color: var(--muted);\">Experts suggest 'Shakespeare' may have been a pseudonym - a pen-name - for another writer. Robert Matthews investigates</p>\n<p><span class=\"paragraph-label\">A</span> Even today, almost 400 years after his death, the works of the famous English dramatist William Shakespeare have lost none of their appeal, nor have questions about the source of his genius. For is it really credible that an ordinary actor from the small town of Stratford-upon-Avon should metamorphose into so extraordinary a dramatist? For some, the answer is obvious: Shakespeare was a genius whose gift is no more suspicious than that of the physicist Albert Einstein, the German salesman's son who devised the theory of relativity. But others have insisted that a mere school leaver simply could not have penned such sophisticated works. They believe that Shakespeare was a pseudonym for someone with far more impressive qualifications who wrote the plays that still play to packed theatres today. But after long and largely fruitless debate, researchers are now turning to scientific methods to resolve the controversies surrounding Shakespeare. Ways of identifying the literary 'fingerprint' of writers are currently being developed using computers. This analysis of features of literary style is known as 'stylometry' and with it researchers can recognise the work of Shakespeare and his contemporaries with impressive reliability.</p>\n<p><span class=\"paragraph-label\">B</span> The idea of using these basic scientific techniques to probe questions of authorship dates back to 1851, when the Victorian mathematician Augustus de Morgan suggested that different authors might be identified through the frequency with which they used words of different lengths. His idea attracted the attention of Thomas Mendenhall, an American physicist who decided to use word length to investigate one of the oldest controversies about the works of Shakespeare: were they actually written by someone else?</p>\n<p><span class=\"paragraph-label\">C</span> As long ago as 1785, the Elizabethan writer and philosopher Sir Francis Bacon was identified as a possible contender for having written Shakespeare's works. Bacon's possible motivation for not wanting to be known as the author of such masterpieces is far from clear, but Mendenhall believed his methods might at least reveal telltale signs of Bacon's hand in the plays. However, his results, published in 1901, revealed Bacon's writing style to be quite unlike that of Shakespeare. But Mendenhall's methods also revealed some key concerns. Recognising the need to include large samples of writing from both authors, Mendenhall lumped all their works together, despite the fact that literary style can vary enormously between plays, poetry and philosophy, for example. His focus on word length as the sole 'fingerprint' of writing style was also questionable - for how could he be sure that some other characteristics would not give different results? But Mendenhall's biggest fault was perhaps simply that he was too far ahead of his time - he was attempting a task that cried out for the kind of computers not even conceivable over 100 years ago. More recently with their development scholars have been able to look for subtle peculiarities among the complete works of authors, which, in Shakespeare's case, amount to over 800,000 words.</p>\n<p><span class=\"paragraph-label\">D</span> One of the key controversies now being probed is Shakespeare's relationship with other dramatists. Was he a lone genius or was his work the result of collaboration? Traditional methods of investigating such questions have relied on traits like the use of metaphor, but these may be shared by different authors simply on cultural grounds. In contrast, modern stylometry focuses on far more fundamental characteristics which are less likely to be shared by others. The text-crunching power of computers allows researchers to pinpoint phrases, words or even individual letters by their frequency in the work of different authors. Pattern recognition techniques are then used to develop a 'fingerprint' for each author.</p>\n<p><span class=\"paragraph-label\">E</span> Stylometry has come up with little to encourage the continual number of experts who insist Shakespeare was simply too uneducated to create works of enduring brilliance. In 1996, literary scholar Ward Elliott and mathematician Robert Valenza of Claremont McKenna College, California, published the results of a stylometric comparison of the works of Shakespeare with those of over 30 of the proposed 'real' authors. Elliott and Valenza applied a battery of 51 tests to computerized texts and found that none of the claimants had a stylometric 'fingerprint' similar to that of Shakespeare. \"I think these claims were driven initially by a sense that Shakespeare is too 'important' to be an ordinary person,\" says Professor Kate McCluskey, director of the Shakespeare Institute at the University of Birmingham.</p>\n<p><span class=\"paragraph-label\">F</span> Elliott and Valenza's research found something else too. Some of the earliest plays, notably Henry VI and the notoriously violent Titus Andronicus, seem to be a combination of Shakespeare and his brilliant contemporary the playwright Christopher Marlowe, who was born in the same year as Shakespeare. Traditional scholars accept that Marlowe influenced Shakespeare's early work,' says Dr Thomas Merriam, one of Britain's leading stylometry experts. He explains that, provisionally at least, stylometric studies suggest some of Marlowe's actual text exists within the early plays of Shakespeare.</p>\n<p><span class=\"paragraph-label\">G</span> Some scholars remain cautious about basing new views of Shakespeare's career on stylometric analysis of centuries-old texts. \"If they have been edited, amended or shortened, then the data from them is highly compromised,\" says Dr Markus Dahl of London University. Even so, the results to date are in line with the growing view of Shakespeare as a hardworking professional who perfected his skills throughout his career.</p>\n<p>&nbsp;</p>\n<p>&nbsp;</p>\n<p>&nbsp;</p>"
       }
     ]
   },
@@ -32,7 +32,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 14–19</h4>\n      <p>Reading Passage 2 has seven paragraphs, A–G.</p>\n      <p>Which paragraph contains the following information?</p>\n      <p>Write the correct letter A–G in boxes 14–19 on your answer sheet.</p>\n      \n      <a id=\"q1-anchor\"></a>\n      <div id=\"q1-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <p><span class=\"question-number\">14.</span> uncertainty why an author would wish to remain anonymous</p>\n        <div class=\"para-match-option\">\n          <label><input name=\"q1\" type=\"radio\" value=\"A\"> A</label>\n          <label><input name=\"q1\" type=\"radio\" value=\"B\"> B</label>\n          <label><input name=\"q1\" type=\"radio\" value=\"C\"> C</label>\n          <label><input name=\"q1\" type=\"radio\" value=\"D\"> D</label>\n          <label><input name=\"q1\" type=\"radio\" value=\"E\"> E</label>\n          <label><input name=\"q1\" type=\"radio\" value=\"F\"> F</label>\n          <label><input name=\"q1\" type=\"radio\" value=\"G\"> G</label>\n        </div>\n      </div>\n      \n      <a id=\"q2-anchor\"></a>\n      <div id=\"q2-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <p><span class=\"question-number\">15.</span> a reference to the continuing popularity of Shakespeare's work</p>\n        <div class=\"para-match-option\">\n          <label><input name=\"q2\" type=\"radio\" value=\"A\"> A</label>\n          <label><input name=\"q2\" type=\"radio\" value=\"B\"> B</label>\n          <label><input name=\"q2\" type=\"radio\" value=\"C\"> C</label>\n          <label><input name=\"q2\" type=\"radio\" value=\"D\"> D</label>\n          <label><input name=\"q2\" type=\"radio\" value=\"E\"> E</label>\n          <label><input name=\"q2\" type=\"radio\" value=\"F\"> F</label>\n          <label><input name=\"q2\" type=\"radio\" value=\"G\"> G</label>\n        </div>\n      </div>\n      \n      <a id=\"q3-anchor\"></a>\n      <div id=\"q3-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <p><span class=\"question-number\">16.</span> the reasons why a particular researcher's approach proved unsatisfactory</p>\n        <div class=\"para-match-option\">\n          <label><input name=\"q3\" type=\"radio\" value=\"A\"> A</label>\n          <label><input name=\"q3\" type=\"radio\" value=\"B\"> B</label>\n          <label><input name=\"q3\" type=\"radio\" value=\"C\"> C</label>\n          <label><input name=\"q3\" type=\"radio\" value=\"D\"> D</label>\n          <label><input name=\"q3\" type=\"radio\" value=\"E\"> E</label>\n          <label><input name=\"q3\" type=\"radio\" value=\"F\"> F</label>\n          <label><input name=\"q3\" type=\"radio\" value=\"G\"> G</label>\n        </div>\n      </div>\n      \n      <a id=\"q4-anchor\"></a>\n      <div id=\"q4-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <p><span class=\"question-number\">17.</span> mention of the time when the use of stylometry was first proposed</p>\n        <div class=\"para-match-option\">\n          <label><input name=\"q4\" type=\"radio\" value=\"A\"> A</label>\n          <label><input name=\"q4\" type=\"radio\" value=\"B\"> B</label>\n          <label><input name=\"q4\" type=\"radio\" value=\"C\"> C</label>\n          <label><input name=\"q4\" type=\"radio\" value=\"D\"> D</label>\n          <label><input name=\"q4\" type=\"radio\" value=\"E\"> E</label>\n          <label><input name=\"q4\" type=\"radio\" value=\"F\"> F</label>\n          <label><input name=\"q4\" type=\"radio\" value=\"G\"> G</label>\n        </div>\n      </div>\n      \n      <a id=\"q5-anchor\"></a>\n      <div id=\"q5-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <p><span class=\"question-number\">18.</span> support for the opinion that Shakespeare became more skillful as he grew older</p>\n        <div class=\"para-match-option\">\n          <label><input name=\"q5\" type=\"radio\" value=\"A\"> A</label>\n          <label><input name=\"q5\" type=\"radio\" value=\"B\"> B</label>\n          <label><input name=\"q5\" type=\"radio\" value=\"C\"> C</label>\n          <label><input name=\"q5\" type=\"radio\" value=\"D\"> D</label>\n          <label><input name=\"q5\" type=\"radio\" value=\"E\"> E</label>\n          <label><input name=\"q5\" type=\"radio\" value=\"F\"> F</label>\n          <label><input name=\"q5\" type=\"radio\" value=\"G\"> G</label>\n        </div>\n      </div>\n      \n      <a id=\"q6-anchor\"></a>\n      <div id=\"q6-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <p><span class=\"question-number\">19.</span> a similarity between Shakespeare and a scientist with exceptional ability</p>\n        <div class=\"para-match-option\">\n          <label><input name=\"q6\" type=\"radio\" value=\"A\"> A</label>\n          <label><input name=\"q6\" type=\"radio\" value=\"B\"> B</label>\n          <label><input name=\"q6\" type=\"radio\" value=\"C\"> C</label>\n          <label><input name=\"q6\" type=\"radio\" value=\"D\"> D</label>\n          <label><input name=\"q6\" type=\"radio\" value=\"E\"> E</label>\n          <label><input name=\"q6\" type=\"radio\" value=\"F\"> F</label>\n          <label><input name=\"q6\" type=\"radio\" value=\"G\"> G</label>\n        </div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has seven paragraphs, A–G.</p>\n<p>Which paragraph contains the following information?</p>\n<p>Write the correct letter A–G in boxes 14–19 on your answer sheet.</p>\n<a id=\"q1-anchor\"></a>\n<div id=\"q1-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<p><span class=\"question-number\">14.</span> uncertainty why an author would wish to remain anonymous</p>\n<div class=\"para-match-option\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D</label> <label><input name=\"q1\" type=\"radio\" value=\"E\"> E</label> <label><input name=\"q1\" type=\"radio\" value=\"F\"> F</label> <label><input name=\"q1\" type=\"radio\" value=\"G\"> G</label>\n</div>\n</div>\n<a id=\"q2-anchor\"></a>\n<div id=\"q2-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<p><span class=\"question-number\">15.</span> a reference to the continuing popularity of Shakespeare's work</p>\n<div class=\"para-match-option\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D</label> <label><input name=\"q2\" type=\"radio\" value=\"E\"> E</label> <label><input name=\"q2\" type=\"radio\" value=\"F\"> F</label> <label><input name=\"q2\" type=\"radio\" value=\"G\"> G</label>\n</div>\n</div>\n<a id=\"q3-anchor\"></a>\n<div id=\"q3-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<p><span class=\"question-number\">16.</span> the reasons why a particular researcher's approach proved unsatisfactory</p>\n<div class=\"para-match-option\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D</label> <label><input name=\"q3\" type=\"radio\" value=\"E\"> E</label> <label><input name=\"q3\" type=\"radio\" value=\"F\"> F</label> <label><input name=\"q3\" type=\"radio\" value=\"G\"> G</label>\n</div>\n</div>\n<a id=\"q4-anchor\"></a>\n<div id=\"q4-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<p><span class=\"question-number\">17.</span> mention of the time when the use of stylometry was first proposed</p>\n<div class=\"para-match-option\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D</label> <label><input name=\"q4\" type=\"radio\" value=\"E\"> E</label> <label><input name=\"q4\" type=\"radio\" value=\"F\"> F</label> <label><input name=\"q4\" type=\"radio\" value=\"G\"> G</label>\n</div>\n</div>\n<a id=\"q5-anchor\"></a>\n<div id=\"q5-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<p><span class=\"question-number\">18.</span> support for the opinion that Shakespeare became more skillful as he grew older</p>\n<div class=\"para-match-option\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q5\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q5\" type=\"radio\" value=\"C\"> C</label> <label><input name=\"q5\" type=\"radio\" value=\"D\"> D</label> <label><input name=\"q5\" type=\"radio\" value=\"E\"> E</label> <label><input name=\"q5\" type=\"radio\" value=\"F\"> F</label> <label><input name=\"q5\" type=\"radio\" value=\"G\"> G</label>\n</div>\n</div>\n<a id=\"q6-anchor\"></a>\n<div id=\"q6-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<p><span class=\"question-number\">19.</span> a similarity between Shakespeare and a scientist with exceptional ability</p>\n<div class=\"para-match-option\">\n<label><input name=\"q6\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q6\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q6\" type=\"radio\" value=\"C\"> C</label> <label><input name=\"q6\" type=\"radio\" value=\"D\"> D</label> <label><input name=\"q6\" type=\"radio\" value=\"E\"> E</label> <label><input name=\"q6\" type=\"radio\" value=\"F\"> F</label> <label><input name=\"q6\" type=\"radio\" value=\"G\"> G</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -42,7 +42,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 20–22</h4>\n      <p>Complete the summary below.</p>\n      <p>Choose ONE WORD ONLY from the passage for each answer.</p>\n      <p>Write your answers in boxes 20–22 on your answer sheet.</p>\n      \n      <div class=\"summary-text\">\n        <h4>Stylometry</h4>\n        <p>A key controversy is Shakespeare's relationships with other writers. It has always been uncertain whether he worked in <input name=\"q7\" type=\"text\" class=\"blank\" id=\"q7\"> with others or not. To investigate this issue, literary experts traditionally looked at stylistic features such as the writer's choice of metaphor, although it was recognised that this choice may have been influenced by cultural factors.</p>\n        \n        <p>Current stylometric analysis has been made possible by the invention of <input name=\"q8\" type=\"text\" class=\"blank\" id=\"q8\">. These can identify different features of writing such as the frequency with which particular letters, words or phrases are used by different writers. By using stylometric analysis of particular characteristics and pattern recognition systems, a so-called <input name=\"q9\" type=\"text\" class=\"blank\" id=\"q9\"> of a writer can be identified.</p>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 20–22</h4>\n<p>Complete the summary below.</p>\n<p>Choose ONE WORD ONLY from the passage for each answer.</p>\n<p>Write your answers in boxes 20–22 on your answer sheet.</p>\n<div class=\"summary-text\">\n<h4>Stylometry</h4>\n<p>A key controversy is Shakespeare's relationships with other writers. It has always been uncertain whether he worked in <input name=\"q7\" type=\"text\" class=\"blank\" id=\"q7\"> with others or not. To investigate this issue, literary experts traditionally looked at stylistic features such as the writer's choice of metaphor, although it was recognised that this choice may have been influenced by cultural factors.</p>\n<p>Current stylometric analysis has been made possible by the invention of <input name=\"q8\" type=\"text\" class=\"blank\" id=\"q8\">. These can identify different features of writing such as the frequency with which particular letters, words or phrases are used by different writers. By using stylometric analysis of particular characteristics and pattern recognition systems, a so-called <input name=\"q9\" type=\"text\" class=\"blank\" id=\"q9\"> of a writer can be identified.</p>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -53,7 +53,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 23–26</h4>\n      <p>Look at the following statements and the list of people below.</p>\n      <p>Match each statement with the correct person, A–E.</p>\n      <p>Write the correct letter, A–E, in boxes 23–26 on your answer sheet.</p>\n      \n      <div style=\"margin-bottom: 12px; padding: 8px; background: #f8f9fa; border-radius: 6px;\">\n        <p style=\"margin: 0; font-weight: 500;\">List of People</p>\n        <p style=\"margin: 4px 0;\">A. Thomas Mendenhall</p>\n        <p style=\"margin: 4px 0;\">B. Ward Elliott and Robert Valenza</p>\n        <p style=\"margin: 4px 0;\">C. Professor Kate McCluskey</p>\n        <p style=\"margin: 4px 0;\">D. Dr Thomas Merriam</p>\n        <p style=\"margin: 4px 0;\">E. Dr Markus Dahl</p>\n      </div>\n      \n      <a id=\"q10-anchor\"></a>\n      <div id=\"q10-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <p><span class=\"question-number\">23.</span> People search for a more distinguished author because they cannot accept that a normal individual could write such brilliant plays.</p>\n        <div class=\"person-match-option\">\n          <label><input name=\"q10\" type=\"radio\" value=\"A\"> A. Thomas Mendenhall</label>\n          <label><input name=\"q10\" type=\"radio\" value=\"B\"> B. Ward Elliott and Robert Valenza</label>\n          <label><input name=\"q10\" type=\"radio\" value=\"C\"> C. Professor Kate McCluskey</label>\n          <label><input name=\"q10\" type=\"radio\" value=\"D\"> D. Dr Thomas Merriam</label>\n          <label><input name=\"q10\" type=\"radio\" value=\"E\"> E. Dr Markus Dahl</label>\n        </div>\n      </div>\n      \n      <a id=\"q11-anchor\"></a>\n      <div id=\"q11-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <p><span class=\"question-number\">24.</span> It should be possible to recognise writers by examining the number of letters in the words they use.</p>\n        <div class=\"person-match-option\">\n          <label><input name=\"q11\" type=\"radio\" value=\"A\"> A. Thomas Mendenhall</label>\n          <label><input name=\"q11\" type=\"radio\" value=\"B\"> B. Ward Elliott and Robert Valenza</label>\n          <label><input name=\"q11\" type=\"radio\" value=\"C\"> C. Professor Kate McCluskey</label>\n          <label><input name=\"q11\" type=\"radio\" value=\"D\"> D. Dr Thomas Merriam</label>\n          <label><input name=\"q11\" type=\"radio\" value=\"E\"> E. Dr Markus Dahl</label>\n        </div>\n      </div>\n      \n      <a id=\"q12-anchor\"></a>\n      <div id=\"q12-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <p><span class=\"question-number\">25.</span> The fact that Shakespeare's works are likely to have been altered over the years raises doubts about any stylometric analysis.</p>\n        <div class=\"person-match-option\">\n          <label><input name=\"q12\" type=\"radio\" value=\"A\"> A. Thomas Mendenhall</label>\n          <label><input name=\"q12\" type=\"radio\" value=\"B\"> B. Ward Elliott and Robert Valenza</label>\n          <label><input name=\"q12\" type=\"radio\" value=\"C\"> C. Professor Kate McCluskey</label>\n          <label><input name=\"q12\" type=\"radio\" value=\"D\"> D. Dr Thomas Merriam</label>\n          <label><input name=\"q12\" type=\"radio\" value=\"E\"> E. Dr Markus Dahl</label>\n        </div>\n      </div>\n      \n      <a id=\"q13-anchor\"></a>\n      <div id=\"q13-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <p><span class=\"question-number\">26.</span> Analysis proves that Shakespeare's style differs from those of writers who have been suggested as the authors of the plays.</p>\n        <div class=\"person-match-option\">\n          <label><input name=\"q13\" type=\"radio\" value=\"A\"> A. Thomas Mendenhall</label>\n          <label><input name=\"q13\" type=\"radio\" value=\"B\"> B. Ward Elliott and Robert Valenza</label>\n          <label><input name=\"q13\" type=\"radio\" value=\"C\"> C. Professor Kate McCluskey</label>\n          <label><input name=\"q13\" type=\"radio\" value=\"D\"> D. Dr Thomas Merriam</label>\n          <label><input name=\"q13\" type=\"radio\" value=\"E\"> E. Dr Markus Dahl</label>\n        </div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 23–26</h4>\n<p>Look at the following statements and the list of people below.</p>\n<p>Match each statement with the correct person, A–E.</p>\n<p>Write the correct letter, A–E, in boxes 23–26 on your answer sheet.</p>\n<div style=\"margin-bottom: 12px; padding: 8px; background: #f8f9fa; border-radius: 6px;\">\n<p style=\"margin: 0; font-weight: 500;\">List of People</p>\n<p style=\"margin: 4px 0;\">A. Thomas Mendenhall</p>\n<p style=\"margin: 4px 0;\">B. Ward Elliott and Robert Valenza</p>\n<p style=\"margin: 4px 0;\">C. Professor Kate McCluskey</p>\n<p style=\"margin: 4px 0;\">D. Dr Thomas Merriam</p>\n<p style=\"margin: 4px 0;\">E. Dr Markus Dahl</p>\n</div>\n<a id=\"q10-anchor\"></a>\n<div id=\"q10-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<p><span class=\"question-number\">23.</span> People search for a more distinguished author because they cannot accept that a normal individual could write such brilliant plays.</p>\n<div class=\"person-match-option\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"> A. Thomas Mendenhall</label> <label><input name=\"q10\" type=\"radio\" value=\"B\"> B. Ward Elliott and Robert Valenza</label> <label><input name=\"q10\" type=\"radio\" value=\"C\"> C. Professor Kate McCluskey</label> <label><input name=\"q10\" type=\"radio\" value=\"D\"> D. Dr Thomas Merriam</label> <label><input name=\"q10\" type=\"radio\" value=\"E\"> E. Dr Markus Dahl</label>\n</div>\n</div>\n<a id=\"q11-anchor\"></a>\n<div id=\"q11-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<p><span class=\"question-number\">24.</span> It should be possible to recognise writers by examining the number of letters in the words they use.</p>\n<div class=\"person-match-option\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"> A. Thomas Mendenhall</label> <label><input name=\"q11\" type=\"radio\" value=\"B\"> B. Ward Elliott and Robert Valenza</label> <label><input name=\"q11\" type=\"radio\" value=\"C\"> C. Professor Kate McCluskey</label> <label><input name=\"q11\" type=\"radio\" value=\"D\"> D. Dr Thomas Merriam</label> <label><input name=\"q11\" type=\"radio\" value=\"E\"> E. Dr Markus Dahl</label>\n</div>\n</div>\n<a id=\"q12-anchor\"></a>\n<div id=\"q12-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<p><span class=\"question-number\">25.</span> The fact that Shakespeare's works are likely to have been altered over the years raises doubts about any stylometric analysis.</p>\n<div class=\"person-match-option\">\n<label><input name=\"q12\" type=\"radio\" value=\"A\"> A. Thomas Mendenhall</label> <label><input name=\"q12\" type=\"radio\" value=\"B\"> B. Ward Elliott and Robert Valenza</label> <label><input name=\"q12\" type=\"radio\" value=\"C\"> C. Professor Kate McCluskey</label> <label><input name=\"q12\" type=\"radio\" value=\"D\"> D. Dr Thomas Merriam</label> <label><input name=\"q12\" type=\"radio\" value=\"E\"> E. Dr Markus Dahl</label>\n</div>\n</div>\n<a id=\"q13-anchor\"></a>\n<div id=\"q13-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<p><span class=\"question-number\">26.</span> Analysis proves that Shakespeare's style differs from those of writers who have been suggested as the authors of the plays.</p>\n<div class=\"person-match-option\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"> A. Thomas Mendenhall</label> <label><input name=\"q13\" type=\"radio\" value=\"B\"> B. Ward Elliott and Robert Valenza</label> <label><input name=\"q13\" type=\"radio\" value=\"C\"> C. Professor Kate McCluskey</label> <label><input name=\"q13\" type=\"radio\" value=\"D\"> D. Dr Thomas Merriam</label> <label><input name=\"q13\" type=\"radio\" value=\"E\"> E. Dr Markus Dahl</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>A study of western celebrity</h2>\n            <p><em>In our celebrity-obsessed culture, TV shows, internet blogs, and even newspapers are often full of the latest news, gossip and scandals about current celebrities</em></p>\n            \n            <div class=\"paragraph-wrapper\" id=\"para-A-anchor\">\n                <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"A\" data-question=\"q1\">\n                    <span class=\"paragraph-label\">Paragraph A (Q14):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>A</strong> It seems that our current society cannot get enough information about the daily lives of celebrities. But how did celebrities become such an important force in our culture? While people have always shared a certain obsession with the fantastic and the famous, the notion of celebrity, as well as the types of people termed ‘celebrities', has evolved greatly throughout the ages. The word 'celebrity' has its roots in the language of the ancient Roman civilization. The word we now know to mean 'a condition of being famous' or 'a famous person' is derived from the Latin word ‘celeber', meaning ‘frequented or populous'.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"para-B-anchor\">\n                 <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"B\" data-question=\"q2\">\n                    <span class=\"paragraph-label\">Paragraph B (Q15):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>B</strong> The celebrities of the ancient world were the powerful and awesome deities of Greece and Rome, and the citizens of these civilizations believed in a vast number of immortals who had a direct impact on their lives. It was, therefore, important to know about these figures' personal lives. This need to know led to the creation of myths, which personalized the gods and involved them in ancient celebrity scandals that thrilled and excited the common people.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"para-C-anchor\">\n                <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"C\" data-question=\"q3\">\n                    <span class=\"paragraph-label\">Paragraph C (Q16):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>C</strong> During ancient times, amateur and professional athletes also began to make an impact on the celebrity culture. Victors in the ancient Olympic Games were treated as heroes and were often elevated to god-like status. In the ancient Roman civilization, gladiators – the equivalent of today's professional athletes – were also revered by the common people for their heroics and seemingly superhuman strength.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"para-D-anchor\">\n                <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"D\" data-question=\"q4\">\n                    <span class=\"paragraph-label\">Paragraph D (Q17):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>D</strong> As Europe moved into the Dark Ages (the years spanning approximately 400–1300 AD) and a time when athletics and the arts were largely forgotten, monarchs and rulers continued to maintain celebrity status, while religious figures took on newfound fame. The miraculous lives and fascinating deaths of spiritual figures lent excitement to the lives of common people when there was often little else to be excited about, as they faced war, disease and food shortages.</p>\n            </div>\n             <div class=\"paragraph-wrapper\" id=\"para-E-anchor\">\n                <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"E\" data-question=\"q5\">\n                    <span class=\"paragraph-label\">Paragraph E (Q18):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>E</strong> During the period 1300–1600 AD, or the Renaissance period as it is known, interest in ruling figures faded. As Europe emerged from its long neglect of the arts, there was greater appreciation for portraits, statues and stone carvings. This period of appreciation for the arts lent a sense of celebrity to artists who were noted for their works and their personal achievements. It was a time when artists began to surpass political and religious individuals for supreme celebrity – a trend that would continue into later centuries.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"para-F-anchor\">\n                <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"F\" data-question=\"q6\">\n                    <span class=\"paragraph-label\">Paragraph F (Q19):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>F</strong> While the figures of the ancient and early modern civilizations were able to achieve moderate and sometimes lasting celebrity within particular cultures, the global reach of their fame was limited. It was not until the 1700s, when technological advances made publishing commercially viable, that the extent of a person's fame could spread further. The increase in the availability of the written word was accompanied by a huge rise in the number of common people who could read, allowing a mass audience to find out about celebrities for the first time. Suddenly, the lives of authors, politicians, war heroes, and other celebrities could now be read about in newspapers around the world. These gave ordinary people the opportunity to become intimately knowledgeable about the figures they most admired.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"para-G-anchor\">\n                <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"G\" data-question=\"q7\">\n                    <span class=\"paragraph-label\">Paragraph G (Q20):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>G</strong> In the modern era, particularly as radio and film took off in the 1900s, things really began to change. First, radio began to make its way into the average home in the 1920s and 1930s. Professional athletes also began to be regarded as stars, as their games and exploits could be broadcast over the air for an entirely new audience. Then, the rise of television in the 1950s only cemented the premier level of celebrity that film stars, athletes and television actors were beginning to share. This also meant a huge increase in the individual salaries of these celebrities. Even a few animals gained fame through children's TV shows. The emergence of reality television shows in the late 1990s allowed all kinds of people with little ability to enjoy a short burst of fame on the television screen. All you needed, it seemed, was an attractive appearance. Today, reality television programmers make it possible to be famous not for doing anything in particular, but simply for being, with the audience deciding whether someone deserves to become a celebrity or not. As the meaning of celebrity continues to evolve and redefine itself in a quickly changing world, there is no telling who will become of interest next.</p>\n            </div>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>A study of western celebrity</h2>\n<p><em>In our celebrity-obsessed culture, TV shows, internet blogs, and even newspapers are often full of the latest news, gossip and scandals about current celebrities</em></p>\n<div class=\"paragraph-wrapper\" id=\"para-A-anchor\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"A\" data-question=\"q1\">\n<span class=\"paragraph-label\">Paragraph A (Q14):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> It seems that our current society cannot get enough information about the daily lives of celebrities. But how did celebrities become such an important force in our culture? While people have always shared a certain obsession with the fantastic and the famous, the notion of celebrity, as well as the types of people termed ‘celebrities', has evolved greatly throughout the ages. The word 'celebrity' has its roots in the language of the ancient Roman civilization. The word we now know to mean 'a condition of being famous' or 'a famous person' is derived from the Latin word ‘celeber', meaning ‘frequented or populous'.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-B-anchor\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"B\" data-question=\"q2\">\n<span class=\"paragraph-label\">Paragraph B (Q15):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> The celebrities of the ancient world were the powerful and awesome deities of Greece and Rome, and the citizens of these civilizations believed in a vast number of immortals who had a direct impact on their lives. It was, therefore, important to know about these figures' personal lives. This need to know led to the creation of myths, which personalized the gods and involved them in ancient celebrity scandals that thrilled and excited the common people.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-C-anchor\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"C\" data-question=\"q3\">\n<span class=\"paragraph-label\">Paragraph C (Q16):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> During ancient times, amateur and professional athletes also began to make an impact on the celebrity culture. Victors in the ancient Olympic Games were treated as heroes and were often elevated to god-like status. In the ancient Roman civilization, gladiators – the equivalent of today's professional athletes – were also revered by the common people for their heroics and seemingly superhuman strength.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-D-anchor\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"D\" data-question=\"q4\">\n<span class=\"paragraph-label\">Paragraph D (Q17):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> As Europe moved into the Dark Ages (the years spanning approximately 400–1300 AD) and a time when athletics and the arts were largely forgotten, monarchs and rulers continued to maintain celebrity status, while religious figures took on newfound fame. The miraculous lives and fascinating deaths of spiritual figures lent excitement to the lives of common people when there was often little else to be excited about, as they faced war, disease and food shortages.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-E-anchor\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"E\" data-question=\"q5\">\n<span class=\"paragraph-label\">Paragraph E (Q18):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> During the period 1300–1600 AD, or the Renaissance period as it is known, interest in ruling figures faded. As Europe emerged from its long neglect of the arts, there was greater appreciation for portraits, statues and stone carvings. This period of appreciation for the arts lent a sense of celebrity to artists who were noted for their works and their personal achievements. It was a time when artists began to surpass political and religious individuals for supreme celebrity – a trend that would continue into later centuries.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-F-anchor\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"F\" data-question=\"q6\">\n<span class=\"paragraph-label\">Paragraph F (Q19):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> While the figures of the ancient and early modern civilizations were able to achieve moderate and sometimes lasting celebrity within particular cultures, the global reach of their fame was limited. It was not until the 1700s, when technological advances made publishing commercially viable, that the extent of a person's fame could spread further. The increase in the availability of the written word was accompanied by a huge rise in the number of common people who could read, allowing a mass audience to find out about celebrities for the first time. Suddenly, the lives of authors, politicians, war heroes, and other celebrities could now be read about in newspapers around the world. These gave ordinary people the opportunity to become intimately knowledgeable about the figures they most admired.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-G-anchor\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"G\" data-question=\"q7\">\n<span class=\"paragraph-label\">Paragraph G (Q20):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>G</strong> In the modern era, particularly as radio and film took off in the 1900s, things really began to change. First, radio began to make its way into the average home in the 1920s and 1930s. Professional athletes also began to be regarded as stars, as their games and exploits could be broadcast over the air for an entirely new audience. Then, the rise of television in the 1950s only cemented the premier level of celebrity that film stars, athletes and television actors were beginning to share. This also meant a huge increase in the individual salaries of these celebrities. Even a few animals gained fame through children's TV shows. The emergence of reality television shows in the late 1990s allowed all kinds of people with little ability to enjoy a short burst of fame on the television screen. All you needed, it seemed, was an attractive appearance. Today, reality television programmers make it possible to be famous not for doing anything in particular, but simply for being, with the audience deciding whether someone deserves to become a celebrity or not. As the meaning of celebrity continues to evolve and redefine itself in a quickly changing world, there is no telling who will become of interest next.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -37,7 +37,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n                <h4>Questions 14–20</h4>\n                <p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n                <p>Choose the correct heading for each paragraph from the list of headings below.</p>\n                <p><em>Write the correct number, <strong>i–x</strong>, in boxes 14–20 on your answer sheet.</em></p>\n                \n                <div class=\"options-pool\" id=\"headings-pool-container\">\n                    <strong>List of Headings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"i\"><strong>i</strong> Why it is necessary to explain the meaning of the word celebrity</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\"><strong>ii</strong> The influence of non-human celebrities on societies</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\"><strong>iii</strong> The impact of broadcasting on concepts of celebrity</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\"><strong>iv</strong> Creativity having greater value</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"v\"><strong>v</strong> Admiration for physical achievement</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\"><strong>vi</strong> The advantages of celebrity status in the ancient world</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\"><strong>vii</strong> A result of hardship</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\"><strong>viii</strong> Literacy and widespread celebrity</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\"><strong>ix</strong> Attitudes of celebrities towards the media</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"x\"><strong>x</strong> The original definition of celebrity</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 14–20</h4>\n<p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Write the correct number, <strong>i–x</strong>, in boxes 14–20 on your answer sheet.</em></p>\n<div class=\"options-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\"><strong>i</strong> Why it is necessary to explain the meaning of the word celebrity</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\"><strong>ii</strong> The influence of non-human celebrities on societies</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\"><strong>iii</strong> The impact of broadcasting on concepts of celebrity</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\"><strong>iv</strong> Creativity having greater value</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\"><strong>v</strong> Admiration for physical achievement</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\"><strong>vi</strong> The advantages of celebrity status in the ancient world</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\"><strong>vii</strong> A result of hardship</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\"><strong>viii</strong> Literacy and widespread celebrity</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\"><strong>ix</strong> Attitudes of celebrities towards the media</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"x\"><strong>x</strong> The original definition of celebrity</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -49,7 +49,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-anchor\">\n                <h4>Questions 21–23</h4>\n                <p>Look at the following statements (Questions 21–23) and the list of historical periods in Europe below.</p>\n                <p>Match each statement with the correct historical period, <strong>A, B, C</strong>, or <strong>D</strong>.</p>\n                \n                <div class=\"question-item\">\n                    <div class=\"match-question-item\">\n                        <p><strong>21</strong> A wide variety of people achieve a brief period of fame.</p>\n                        <div class=\"match-dropzone\" data-question=\"q8\"></div>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <div class=\"match-question-item\">\n                        <p><strong>22</strong> Stories are invented about celebrities' lives.</p>\n                        <div class=\"match-dropzone\" data-question=\"q9\"></div>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <div class=\"match-question-item\">\n                        <p><strong>23</strong> The fame of rulers is starting to diminish.</p>\n                        <div class=\"match-dropzone\" data-question=\"q10\"></div>\n                    </div>\n                </div>\n                <div class=\"options-pool\" id=\"periods-options-pool\">\n                    <strong>List of historical periods in Europe</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"A\"><strong>A</strong> Ancient times</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"B\"><strong>B</strong> Dark Ages</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"C\"><strong>C</strong> Renaissance</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"D\"><strong>D</strong> Modern era</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-anchor\">\n<h4>Questions 21–23</h4>\n<p>Look at the following statements (Questions 21–23) and the list of historical periods in Europe below.</p>\n<p>Match each statement with the correct historical period, <strong>A, B, C</strong>, or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<div class=\"match-question-item\">\n<p><strong>21</strong> A wide variety of people achieve a brief period of fame.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"match-question-item\">\n<p><strong>22</strong> Stories are invented about celebrities' lives.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"match-question-item\">\n<p><strong>23</strong> The fame of rulers is starting to diminish.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n</div>\n<div class=\"options-pool\" id=\"periods-options-pool\">\n<strong>List of historical periods in Europe</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\"><strong>A</strong> Ancient times</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\"><strong>B</strong> Dark Ages</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\"><strong>C</strong> Renaissance</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\"><strong>D</strong> Modern era</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false
     },
     {
@@ -60,7 +60,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-anchor\">\n                <h4>Questions 24–26</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                \n                <div class=\"summary-completion\">\n                    <h4>Celebrities achieve a global status</h4>\n                    <p>The development of the publishing industry in the 1700s signalled the beginning of international fame. A growing number of people could read, which meant they had the chance to become informed about their favourite figures by reading <strong>24</strong> <input name=\"q11\" type=\"text\" id=\"q24_input\">. This exposure to celebrities expanded further when radio and television became popular, and it was mass media attention that resulted in higher status and fame for some celebrities. The recent rise of reality television has also meant that a person's <strong>25</strong> <input name=\"q12\" type=\"text\" id=\"q25_input\"> rather than their talent can bring fame. With this type of television programme, fame may be entirely dependent on the response of the <strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\">.</p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>Celebrities achieve a global status</h4>\n<p>The development of the publishing industry in the 1700s signalled the beginning of international fame. A growing number of people could read, which meant they had the chance to become informed about their favourite figures by reading <strong>24</strong> <input name=\"q11\" type=\"text\" id=\"q24_input\">. This exposure to celebrities expanded further when radio and television became popular, and it was mass media attention that resulted in higher status and fame for some celebrities. The recent rise of reality television has also meant that a person's <strong>25</strong> <input name=\"q12\" type=\"text\" id=\"q25_input\"> rather than their talent can bring fame. With this type of television programme, fame may be entirely dependent on the response of the <strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\">.</p>\n</div>\n</div>"
     }
   ],
   "answerKey": {
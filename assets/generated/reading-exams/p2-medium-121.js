@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 2</h2>\n            <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n            \n            <h3>A unique golden textile</h3>\n            <h4>A two-man project to use spider silk is achieved after 4 years</h4>\n            \n            <div class=\"paragraph-wrapper\" id=\"para-A-anchor\">\n                <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"A\" data-question=\"q1\">\n                    <span class=\"paragraph-label\">Paragraph A</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>A</strong> A rare textile made from the silk of more than a million wild spiders has been on display at the American Museum of Natural History in New York City. To produce this golden cloth, 70 people spent four years collecting golden-orb spiders from telephone poles in Madagascar, while another dozen workers carefully extracted about 80 feet of silk filament from each of the arachnids. The resulting 11-foot-by-4-foot textile is the only large piece of cloth made from natural spider silk in the world today.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"para-B-anchor\">\n                 <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"B\" data-question=\"q2\">\n                    <span class=\"paragraph-label\">Paragraph B</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>B</strong> Spider silk is very elastic and strong compared with steel or Kevlar, said textile expert Simon Peers, who co-led the project. Kevlar is a lightweight synthetic fabric, chemically related to nylon, that is used in bullet-proof vests. Kevlar is resistant to wear, tear and heat and has virtually no melting point. But the tensile strength of spider silk is even greater than Kevlar's aramid filaments and higher than that of high-grade steel. Most importantly, spider silk is extremely lightweight: a strand long enough to circle the Earth would weigh less than 500 grams (18 oz). It is also especially ductile, able to stretch up to 140 percent of its length without breaking and to retain its strength below –40 °C, giving it toughness equal to that of leading commercial fibres.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"para-C-anchor\">\n                 <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"C\" data-question=\"q3\">\n                    <span class=\"paragraph-label\">Paragraph C</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>C</strong> Researchers have long been intrigued by the unique properties of spider silk. Unfortunately, spider silk is extremely hard to mass-produce. Unlike silkworms—easy to raise in captivity—spiders have a habit of biting off each other's heads when housed together. According to Peers, there is intensive research worldwide aimed at replicating spider-silk tensile properties for use in medicine and industry, but no-one has yet reproduced all the qualities of natural silk.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"para-D-anchor\">\n                 <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"D\" data-question=\"q4\">\n                    <span class=\"paragraph-label\">Paragraph D</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>D</strong> Peers conceived the idea of weaving spider silk after reading about French missionary Jacob Paul Camboué, who worked with spiders in Madagascar during the 1880s and 1890s. Camboué built a small hand-driven machine to extract silk from up to 24 spiders at once, without harming them: the spiders were briefly restrained, their silk collected, then released. Peers built a replica of this 24-spider “silking” machine, said co-leader Nicholas Godley. As a test the pair collected about 20 spiders. “When we stuck them in the machine and started turning it, lo and behold, this beautiful gold-coloured silk started coming out,” Godley recalled.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"para-E-anchor\">\n                 <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"E\" data-question=\"q5\">\n                    <span class=\"paragraph-label\">Paragraph E</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>E</strong> To make a textile of any significant size, the scale had to increase dramatically. Fourteen thousand spiders yield about an ounce of silk, Godley said, and the finished textile weighs about 2.6 pounds. By the end, handlers had worked with more than one million female golden-orb spiders—abundant in Madagascar and famed for their golden thread. Because the spiders produce silk only in the rainy season, all were collected between October and June. An additional 12 workers used hand-powered machines to extract the silk and twist it into 96-filament yarn. After “silking”, the spiders were released; within a week they regenerate their silk, allowing the same individuals to be used again—“the gift that never stops giving,” said Godley.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"para-F-anchor\">\n                 <div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"F\" data-question=\"q6\">\n                    <span class=\"paragraph-label\">Paragraph F</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>F</strong> Spending four years to produce a single piece of cloth is hardly practical for scientists or companies hoping to exploit spider silk in biomedicine or as a Kevlar alternative. Several groups have inserted spider genes into bacteria and even goats to make silk, but results have been only partly successful. One reason is that spider silk begins as a liquid protein produced in a special gland in the abdomen. Using the spinneret, the spider applies force that rearranges the protein's molecular structure, transforming it into solid fibre. “When we talk about a spider spinning silk, we're talking about how it applies forces to convert liquid to solid,” explained spider-silk expert Todd Blackledge of the University of Akron, who was not involved in the project. “Every year we get closer to mass production, but we're not there yet.” For now, we must be content with one extraordinarily beautiful cloth—courtesy of more than a million spiders.</p>\n            </div>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>A unique golden textile</h3>\n<h4>A two-man project to use spider silk is achieved after 4 years</h4>\n<div class=\"paragraph-wrapper\" id=\"para-A-anchor\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"A\" data-question=\"q1\">\n<span class=\"paragraph-label\">Paragraph A</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> A rare textile made from the silk of more than a million wild spiders has been on display at the American Museum of Natural History in New York City. To produce this golden cloth, 70 people spent four years collecting golden-orb spiders from telephone poles in Madagascar, while another dozen workers carefully extracted about 80 feet of silk filament from each of the arachnids. The resulting 11-foot-by-4-foot textile is the only large piece of cloth made from natural spider silk in the world today.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-B-anchor\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"B\" data-question=\"q2\">\n<span class=\"paragraph-label\">Paragraph B</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> Spider silk is very elastic and strong compared with steel or Kevlar, said textile expert Simon Peers, who co-led the project. Kevlar is a lightweight synthetic fabric, chemically related to nylon, that is used in bullet-proof vests. Kevlar is resistant to wear, tear and heat and has virtually no melting point. But the tensile strength of spider silk is even greater than Kevlar's aramid filaments and higher than that of high-grade steel. Most importantly, spider silk is extremely lightweight: a strand long enough to circle the Earth would weigh less than 500 grams (18 oz). It is also especially ductile, able to stretch up to 140 percent of its length without breaking and to retain its strength below –40 °C, giving it toughness equal to that of leading commercial fibres.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-C-anchor\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"C\" data-question=\"q3\">\n<span class=\"paragraph-label\">Paragraph C</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> Researchers have long been intrigued by the unique properties of spider silk. Unfortunately, spider silk is extremely hard to mass-produce. Unlike silkworms—easy to raise in captivity—spiders have a habit of biting off each other's heads when housed together. According to Peers, there is intensive research worldwide aimed at replicating spider-silk tensile properties for use in medicine and industry, but no-one has yet reproduced all the qualities of natural silk.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-D-anchor\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"D\" data-question=\"q4\">\n<span class=\"paragraph-label\">Paragraph D</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> Peers conceived the idea of weaving spider silk after reading about French missionary Jacob Paul Camboué, who worked with spiders in Madagascar during the 1880s and 1890s. Camboué built a small hand-driven machine to extract silk from up to 24 spiders at once, without harming them: the spiders were briefly restrained, their silk collected, then released. Peers built a replica of this 24-spider “silking” machine, said co-leader Nicholas Godley. As a test the pair collected about 20 spiders. “When we stuck them in the machine and started turning it, lo and behold, this beautiful gold-coloured silk started coming out,” Godley recalled.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-E-anchor\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"E\" data-question=\"q5\">\n<span class=\"paragraph-label\">Paragraph E</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> To make a textile of any significant size, the scale had to increase dramatically. Fourteen thousand spiders yield about an ounce of silk, Godley said, and the finished textile weighs about 2.6 pounds. By the end, handlers had worked with more than one million female golden-orb spiders—abundant in Madagascar and famed for their golden thread. Because the spiders produce silk only in the rainy season, all were collected between October and June. An additional 12 workers used hand-powered machines to extract the silk and twist it into 96-filament yarn. After “silking”, the spiders were released; within a week they regenerate their silk, allowing the same individuals to be used again—“the gift that never stops giving,” said Godley.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"para-F-anchor\">\n<div class=\"paragraph-dropzone dropzone match-dropzone\" data-paragraph=\"F\" data-question=\"q6\">\n<span class=\"paragraph-label\">Paragraph F</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> Spending four years to produce a single piece of cloth is hardly practical for scientists or companies hoping to exploit spider silk in biomedicine or as a Kevlar alternative. Several groups have inserted spider genes into bacteria and even goats to make silk, but results have been only partly successful. One reason is that spider silk begins as a liquid protein produced in a special gland in the abdomen. Using the spinneret, the spider applies force that rearranges the protein's molecular structure, transforming it into solid fibre. “When we talk about a spider spinning silk, we're talking about how it applies forces to convert liquid to solid,” explained spider-silk expert Todd Blackledge of the University of Akron, who was not involved in the project. “Every year we get closer to mass production, but we're not there yet.” For now, we must be content with one extraordinarily beautiful cloth—courtesy of more than a million spiders.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                <h4>Questions 14–19</h4>\n                <p>Reading Passage 2 has six paragraphs <strong>A–F</strong>.</p>\n                <p>Choose the correct heading for each paragraph from the list of headings below.</p>\n                <p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n                \n                <div class=\"headings-pool\" id=\"headings-pool-container\">\n                    <strong>List of Headings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. Experimenting with an old idea</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. Life cycle of Madagascar spiders</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. Advances in the textile industry</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. Resources needed to meet the project's demands</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. The physical properties of spider silk</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. A scientific analysis of spider silk</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. A unique work of art</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. Importance of the silk-textile market</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix. Difficulties of raising spiders in captivity</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has six paragraphs <strong>A–F</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. Experimenting with an old idea</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. Life cycle of Madagascar spiders</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. Advances in the textile industry</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. Resources needed to meet the project's demands</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. The physical properties of spider silk</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. A scientific analysis of spider silk</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. A unique work of art</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. Importance of the silk-textile market</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix. Difficulties of raising spiders in captivity</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -49,7 +49,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-anchor\">\n                <h4>Questions 20–23</h4>\n                <p>Look at the following statements (Questions 20–23) and the list of researchers below.</p>\n                <p>Match each statement with the correct researcher, <strong>A, B</strong> or <strong>C</strong>.</p>\n                <p><em>NB You may use any letter more than once.</em></p>\n                \n                <div class=\"match-question-item\">\n                    <p><strong>20</strong> It takes a tremendous number of spiders to make a small amount of silk.</p>\n                    <div class=\"match-dropzone\" data-question=\"q7\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>21</strong> Scientists want to use the qualities of spider silk for medical purposes.</p>\n                    <div class=\"match-dropzone\" data-question=\"q8\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                     <p><strong>22</strong> Scientists are making some progress in their efforts to manufacture spider silk.</p>\n                    <div class=\"match-dropzone\" data-question=\"q9\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                    <p><strong>23</strong> Spider silk compares favourably to materials known for their strength.</p>\n                    <div class=\"match-dropzone\" data-question=\"q10\"></div>\n                </div>\n\n                <div class=\"options-pool\" id=\"researcher-options-pool\">\n                    <strong>List of Researchers</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Simon Peers</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Nicholas Godley</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Todd Blackledge</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-anchor\">\n<h4>Questions 20–23</h4>\n<p>Look at the following statements (Questions 20–23) and the list of researchers below.</p>\n<p>Match each statement with the correct researcher, <strong>A, B</strong> or <strong>C</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>20</strong> It takes a tremendous number of spiders to make a small amount of silk.</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>21</strong> Scientists want to use the qualities of spider silk for medical purposes.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>22</strong> Scientists are making some progress in their efforts to manufacture spider silk.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>23</strong> Spider silk compares favourably to materials known for their strength.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"options-pool\" id=\"researcher-options-pool\">\n<strong>List of Researchers</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Simon Peers</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Nicholas Godley</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Todd Blackledge</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": true
     },
     {
@@ -60,7 +60,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-anchor\">\n                 <h4>Questions 24–26</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                <div class=\"summary-completion\">\n                    <h4>Producing spider silk in the lab</h4>\n                    <p>\n                    Both scientists and manufacturers are interested in producing silk for many different purposes. Some researchers have tried to grow silk by introducing genetic material into <strong>24</strong> <input name=\"q11\" type=\"text\" id=\"q24_input\"> and some animals. But these experiments have been somewhat disappointing.\n                    <br><br>\n                    It is difficult to make spider silk in a lab setting because the silk comes from a liquid protein made in a <strong>25</strong> <input name=\"q12\" type=\"text\" id=\"q25_input\"> inside the spider's body. When a spider spins silk, it applies <strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\"> that turns this liquid into solid silk. Scientists cannot replicate this yet.\n                    </p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>Producing spider silk in the lab</h4>\n<p>\nBoth scientists and manufacturers are interested in producing silk for many different purposes. Some researchers have tried to grow silk by introducing genetic material into <strong>24</strong> <input name=\"q11\" type=\"text\" id=\"q24_input\"> and some animals. But these experiments have been somewhat disappointing.\n<br><br>\nIt is difficult to make spider silk in a lab setting because the silk comes from a liquid protein made in a <strong>25</strong> <input name=\"q12\" type=\"text\" id=\"q25_input\"> inside the spider's body. When a spider spins silk, it applies <strong>26</strong> <input name=\"q13\" type=\"text\" id=\"q26_input\"> that turns this liquid into solid silk. Scientists cannot replicate this yet.\n</p>\n</div>\n</div>"
     }
   ],
   "answerKey": {
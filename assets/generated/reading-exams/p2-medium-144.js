@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 2</h2>\n            <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n            \n            <h3>The plan to bring an asteroid to Earth</h3>\n            <p>Moving in orbit around our Sun are millions of rocks known as asteroids. Now scientists have plans to capture one.</p>\n            \n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"A\" id=\"q1-dropzone\" data-question=\"q1\">\n                    <span class=\"paragraph-label\">Section A (Q14):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>A</strong> Send a robot into space, catch an asteroid and bring it back to Earth's orbit. This, say scientists and engineers at the California Institute of Technology (Caltech), could be feasible. A four-day workshop was dedicated to investigating the feasibility of capturing a near-Earth asteroid, bringing it closer to our planet and using it as a base for future manned space-flight missions. This is not something the scientists are imagining could be done someday in the future. It is possible with the technology we have today and could be accomplished within a decade. A robotic probe could anchor to an asteroid with simple magnets or grab it with specialised claws. Alternatively, a large spacecraft could use its gravitational field to shift the orbit of a larger asteroid, sending it towards Earth. 'Once you get over the initial reaction — You want to do what?! — it actually starts to seem like a reasonable idea,' says engineer John Brophy, who helped organise the workshop. In fact, many of these ideas have been on the drawing board for years as part of NASA's planetary-defence programme against large space-based objects that might threaten Earth. And there's no shortage of potential targets: NASA estimates there are 19,500 asteroids at least 100 metres wide within 45 million kilometres of Earth.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"B\" id=\"q2-dropzone\" data-question=\"q2\">\n                    <span class=\"paragraph-label\">Section B (Q15):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>B</strong> Though rearranging the heavens may seem an excessive undertaking, this US mission has its merits. The US already has plans to send astronauts to a near-Earth asteroid, a mission that would mean confining them in a tiny capsule for three to six months and would involve all the risks of a deep-space voyage. Instead, robots could bring an asteroid close enough for them to get there in just a month. An asteroid would provide a stationary base from which to launch missions further into space. There are several advantages to this. For one, launching missions carrying materials from Earth requires a lot of power, fuel and, consequently, money, because of our planet's strong force of gravity. Since this would be far weaker on an asteroid, materials mined there could be more easily taken off the asteroid and shuttled around the solar system. Many asteroids have a lot to offer. Some are rich in metals, which can be mined and used to build space-based habitats, or brought back to Earth. Others are up to one-quarter water, which could be used for life-support or broken down into hydrogen and oxygen to make fuel. Astronomers would also have the chance to get a close-up look at one of the solar system's earliest relics, generating important scientific data. ‘Executing the asteroid-retrieval plan would help demonstrate and greatly expand mankind's space-based engineering capabilities,' says engineer Louis Friedman, another co-organiser of the Caltech workshop. For instance, the mission would teach engineers how to capture an unco-operative target, which could be useful practice for planetary-defence missions in the event of a threat from a meteoroid or comet approaching our planet,' he adds.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                 <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"C\" id=\"q3-dropzone\" data-question=\"q3\">\n                    <span class=\"paragraph-label\">Section C (Q16):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>C</strong> Former astronaut Rusty Schweickart, co-founder of the B612 Foundation, an organisation dedicated to protecting Earth from asteroid strikes, points out that although it would be technically feasible, shifting such a hefty and substantial target would not be easy: ‘You're moving the largest mother-lode imaginable,' he says. Engineers would need to be absolutely certain they could control such a potentially dangerous object. 'It's the opposite of planetary defence; if you do something wrong you have a Tunguska event,' says engineer Marco Tantardini from the Planetary Society, referring to the powerful 1908 explosion above a remote Russian region thought to have been caused by a meteoroid or comet.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"D\" id=\"q4-dropzone\" data-question=\"q4\">\n                    <span class=\"paragraph-label\">Section D (Q17):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>D</strong> Still, these obstacles only add to the appeal of the project for engineers, who love to go over every potential difficulty in order to solve it. And if the challenges posed by a large asteroid seem too daunting, researchers could always start with a smaller asteroid, perhaps two to ten metres across. Last year, Brophy helped conduct a study to look at the feasibility of bringing a two-metre, 1,000-kilogram asteroid — of which there might conceivably be millions — to the International Space Station. The study suggested the asteroid could be captured robotically in something as simple as a large bag. Of course, such a small object might not have the same emotional impact as a larger target. ‘NASA isn't going to want to go to something that is smaller than our spaceships,' says engineer Dan Mazanek from NASA's Langley Research Center.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                 <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"E\" id=\"q5-dropzone\" data-question=\"q5\">\n                    <span class=\"paragraph-label\">Section E (Q18):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>E</strong> No matter the size of the asteroid, these plans would require hefty investments. Even capturing a small asteroid would consume at least a billion dollars. Convincing taxpayers to foot such a bill could be difficult. However, private industry might be interested in getting involved. One possibility would be to push the asteroid into near-Earth orbit and then invite anyone who wants to develop the capabilities to reach and mine the object. However, although the undertaking might be scientifically exciting and provide great insight into the solar system's formation, this is not enough on its own to justify the expense of bringing an asteroid to Earth. Investigations of asteroids can be done much more cheaply with an unmanned spacecraft, says chemist Joseph A. Nuth from NASA's Goddard Space Flight Center. According to Brophy, ultimately we would be working towards bringing an asteroid closer to Earth in order to help humanity move out into the solar system.</p>\n            </div>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>The plan to bring an asteroid to Earth</h3>\n<p>Moving in orbit around our Sun are millions of rocks known as asteroids. Now scientists have plans to capture one.</p>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"A\" id=\"q1-dropzone\" data-question=\"q1\">\n<span class=\"paragraph-label\">Section A (Q14):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> Send a robot into space, catch an asteroid and bring it back to Earth's orbit. This, say scientists and engineers at the California Institute of Technology (Caltech), could be feasible. A four-day workshop was dedicated to investigating the feasibility of capturing a near-Earth asteroid, bringing it closer to our planet and using it as a base for future manned space-flight missions. This is not something the scientists are imagining could be done someday in the future. It is possible with the technology we have today and could be accomplished within a decade. A robotic probe could anchor to an asteroid with simple magnets or grab it with specialised claws. Alternatively, a large spacecraft could use its gravitational field to shift the orbit of a larger asteroid, sending it towards Earth. 'Once you get over the initial reaction — You want to do what?! — it actually starts to seem like a reasonable idea,' says engineer John Brophy, who helped organise the workshop. In fact, many of these ideas have been on the drawing board for years as part of NASA's planetary-defence programme against large space-based objects that might threaten Earth. And there's no shortage of potential targets: NASA estimates there are 19,500 asteroids at least 100 metres wide within 45 million kilometres of Earth.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"B\" id=\"q2-dropzone\" data-question=\"q2\">\n<span class=\"paragraph-label\">Section B (Q15):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> Though rearranging the heavens may seem an excessive undertaking, this US mission has its merits. The US already has plans to send astronauts to a near-Earth asteroid, a mission that would mean confining them in a tiny capsule for three to six months and would involve all the risks of a deep-space voyage. Instead, robots could bring an asteroid close enough for them to get there in just a month. An asteroid would provide a stationary base from which to launch missions further into space. There are several advantages to this. For one, launching missions carrying materials from Earth requires a lot of power, fuel and, consequently, money, because of our planet's strong force of gravity. Since this would be far weaker on an asteroid, materials mined there could be more easily taken off the asteroid and shuttled around the solar system. Many asteroids have a lot to offer. Some are rich in metals, which can be mined and used to build space-based habitats, or brought back to Earth. Others are up to one-quarter water, which could be used for life-support or broken down into hydrogen and oxygen to make fuel. Astronomers would also have the chance to get a close-up look at one of the solar system's earliest relics, generating important scientific data. ‘Executing the asteroid-retrieval plan would help demonstrate and greatly expand mankind's space-based engineering capabilities,' says engineer Louis Friedman, another co-organiser of the Caltech workshop. For instance, the mission would teach engineers how to capture an unco-operative target, which could be useful practice for planetary-defence missions in the event of a threat from a meteoroid or comet approaching our planet,' he adds.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"C\" id=\"q3-dropzone\" data-question=\"q3\">\n<span class=\"paragraph-label\">Section C (Q16):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> Former astronaut Rusty Schweickart, co-founder of the B612 Foundation, an organisation dedicated to protecting Earth from asteroid strikes, points out that although it would be technically feasible, shifting such a hefty and substantial target would not be easy: ‘You're moving the largest mother-lode imaginable,' he says. Engineers would need to be absolutely certain they could control such a potentially dangerous object. 'It's the opposite of planetary defence; if you do something wrong you have a Tunguska event,' says engineer Marco Tantardini from the Planetary Society, referring to the powerful 1908 explosion above a remote Russian region thought to have been caused by a meteoroid or comet.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"D\" id=\"q4-dropzone\" data-question=\"q4\">\n<span class=\"paragraph-label\">Section D (Q17):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> Still, these obstacles only add to the appeal of the project for engineers, who love to go over every potential difficulty in order to solve it. And if the challenges posed by a large asteroid seem too daunting, researchers could always start with a smaller asteroid, perhaps two to ten metres across. Last year, Brophy helped conduct a study to look at the feasibility of bringing a two-metre, 1,000-kilogram asteroid — of which there might conceivably be millions — to the International Space Station. The study suggested the asteroid could be captured robotically in something as simple as a large bag. Of course, such a small object might not have the same emotional impact as a larger target. ‘NASA isn't going to want to go to something that is smaller than our spaceships,' says engineer Dan Mazanek from NASA's Langley Research Center.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"E\" id=\"q5-dropzone\" data-question=\"q5\">\n<span class=\"paragraph-label\">Section E (Q18):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> No matter the size of the asteroid, these plans would require hefty investments. Even capturing a small asteroid would consume at least a billion dollars. Convincing taxpayers to foot such a bill could be difficult. However, private industry might be interested in getting involved. One possibility would be to push the asteroid into near-Earth orbit and then invite anyone who wants to develop the capabilities to reach and mine the object. However, although the undertaking might be scientifically exciting and provide great insight into the solar system's formation, this is not enough on its own to justify the expense of bringing an asteroid to Earth. Investigations of asteroids can be done much more cheaply with an unmanned spacecraft, says chemist Joseph A. Nuth from NASA's Goddard Space Flight Center. According to Brophy, ultimately we would be working towards bringing an asteroid closer to Earth in order to help humanity move out into the solar system.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 14–18</h4>\n                <p>Reading Passage 2 has five sections, <strong>A–E</strong>.</p>\n                <p>Choose the correct heading for each section from the list of headings below.</p>\n                <p><em>Drag a heading from this list and drop it onto the correct section's answer box on the left.</em></p>\n                <div class=\"headings-pool\" id=\"headings-pool-container\">\n                    <strong>List of Headings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i The need for skill and care</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Choosing the richest asteroid</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii The safest way to protect an asteroid</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv Obtaining support for the project</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v An achievable goal, not an impossible dream</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi The need for global cooperation</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii Beginning with a less challenging task</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii Practical, economic and research justifications</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 14–18</h4>\n<p>Reading Passage 2 has five sections, <strong>A–E</strong>.</p>\n<p>Choose the correct heading for each section from the list of headings below.</p>\n<p><em>Drag a heading from this list and drop it onto the correct section's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i The need for skill and care</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Choosing the richest asteroid</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii The safest way to protect an asteroid</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv Obtaining support for the project</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v An achievable goal, not an impossible dream</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi The need for global cooperation</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii Beginning with a less challenging task</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii Practical, economic and research justifications</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -48,7 +48,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n                <h4>Questions 19–22</h4>\n                <p>Look at the following experts (Questions 19–22) and the list of statements below.</p>\n                <p>Match each expert with the correct statement, <strong>A–G</strong>.</p>\n\n                <div class=\"list-of-statements\">\n                    <strong>List of Statements</strong>\n                    <ul>\n                        <li><strong>A</strong> A mistake could have serious consequences for Earth.</li>\n                        <li><strong>B</strong> It might be difficult to arouse interest in an asteroid of limited size.</li>\n                        <li><strong>C</strong> The project could be an early step in space exploration.</li>\n                        <li><strong>D</strong> An asteroid's weight makes the project extremely challenging.</li>\n                        <li><strong>E</strong> The skill gained could save Earth from future danger.</li>\n                        <li><strong>F</strong> An asteroid could be a useful landing place for a spaceship.</li>\n                        <li><strong>G</strong> Capturing an asteroid would not be an efficient method of research.</li>\n                    </ul>\n                </div>\n                \n                <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                        <thead>\n                            <tr>\n                                <th>Expert</th>\n                                <th>A</th>\n                                <th>B</th>\n                                <th>C</th>\n                                <th>D</th>\n                                <th>E</th>\n                                <th>F</th>\n                                <th>G</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>19</strong> Louis Friedman</td>\n                                <td><input name=\"q6\" type=\"radio\" value=\"A\"></td>\n                                <td><input name=\"q6\" type=\"radio\" value=\"B\"></td>\n                                <td><input name=\"q6\" type=\"radio\" value=\"C\"></td>\n                                <td><input name=\"q6\" type=\"radio\" value=\"D\"></td>\n                                <td><input name=\"q6\" type=\"radio\" value=\"E\"></td>\n                                <td><input name=\"q6\" type=\"radio\" value=\"F\"></td>\n                                <td><input name=\"q6\" type=\"radio\" value=\"G\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>20</strong> Rusty Schweickart</td>\n                                <td><input name=\"q7\" type=\"radio\" value=\"A\"></td>\n                                <td><input name=\"q7\" type=\"radio\" value=\"B\"></td>\n                                <td><input name=\"q7\" type=\"radio\" value=\"C\"></td>\n                                <td><input name=\"q7\" type=\"radio\" value=\"D\"></td>\n                                <td><input name=\"q7\" type=\"radio\" value=\"E\"></td>\n                                <td><input name=\"q7\" type=\"radio\" value=\"F\"></td>\n                                <td><input name=\"q7\" type=\"radio\" value=\"G\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>21</strong> Dan Mazanek</td>\n                                <td><input name=\"q8\" type=\"radio\" value=\"A\"></td>\n                                <td><input name=\"q8\" type=\"radio\" value=\"B\"></td>\n                                <td><input name=\"q8\" type=\"radio\" value=\"C\"></td>\n                                <td><input name=\"q8\" type=\"radio\" value=\"D\"></td>\n                                <td><input name=\"q8\" type=\"radio\" value=\"E\"></td>\n                                <td><input name=\"q8\" type=\"radio\" value=\"F\"></td>\n                                <td><input name=\"q8\" type=\"radio\" value=\"G\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>22</strong> Joseph A. Nuth</td>\n                                <td><input name=\"q9\" type=\"radio\" value=\"A\"></td>\n                                <td><input name=\"q9\" type=\"radio\" value=\"B\"></td>\n                                <td><input name=\"q9\" type=\"radio\" value=\"C\"></td>\n                                <td><input name=\"q9\" type=\"radio\" value=\"D\"></td>\n                                <td><input name=\"q9\" type=\"radio\" value=\"E\"></td>\n                                <td><input name=\"q9\" type=\"radio\" value=\"F\"></td>\n                                <td><input name=\"q9\" type=\"radio\" value=\"G\"></td>\n                            </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 19–22</h4>\n<p>Look at the following experts (Questions 19–22) and the list of statements below.</p>\n<p>Match each expert with the correct statement, <strong>A–G</strong>.</p>\n<div class=\"list-of-statements\">\n<strong>List of Statements</strong>\n<ul>\n<li><strong>A</strong> A mistake could have serious consequences for Earth.</li>\n<li><strong>B</strong> It might be difficult to arouse interest in an asteroid of limited size.</li>\n<li><strong>C</strong> The project could be an early step in space exploration.</li>\n<li><strong>D</strong> An asteroid's weight makes the project extremely challenging.</li>\n<li><strong>E</strong> The skill gained could save Earth from future danger.</li>\n<li><strong>F</strong> An asteroid could be a useful landing place for a spaceship.</li>\n<li><strong>G</strong> Capturing an asteroid would not be an efficient method of research.</li>\n</ul>\n</div>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th>Expert</th>\n<th>A</th>\n<th>B</th>\n<th>C</th>\n<th>D</th>\n<th>E</th>\n<th>F</th>\n<th>G</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>19</strong> Louis Friedman</td>\n<td><input name=\"q6\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q6\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q6\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q6\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q6\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q6\" type=\"radio\" value=\"F\"></td>\n<td><input name=\"q6\" type=\"radio\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>20</strong> Rusty Schweickart</td>\n<td><input name=\"q7\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q7\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q7\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q7\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q7\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q7\" type=\"radio\" value=\"F\"></td>\n<td><input name=\"q7\" type=\"radio\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>21</strong> Dan Mazanek</td>\n<td><input name=\"q8\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q8\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q8\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q8\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q8\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q8\" type=\"radio\" value=\"F\"></td>\n<td><input name=\"q8\" type=\"radio\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>22</strong> Joseph A. Nuth</td>\n<td><input name=\"q9\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"F\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"G\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-anchor\">\n                <h4>Questions 23–26</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                <div class=\"summary-box\">\n                    <h5>The merits of the US mission</h5>\n                    <p>\n                        Capture of an asteroid would reduce the time that astronauts travelling to it needed to spend in space. An asteroid could also act as a <strong>23</strong> <input id=\"q23_input\" name=\"q10\" type=\"text\"> for further space travel and exploration. The fact that an asteroid would have weaker <strong>24</strong> <input id=\"q24_input\" name=\"q11\" type=\"text\"> would allow easier movement of resources. These resources include <strong>25</strong> <input id=\"q25_input\" name=\"q12\" type=\"text\"> which could be used in space or on Earth, and <strong>26</strong> <input id=\"q26_input\" name=\"q13\" type=\"text\"> which could be consumed or used as a source of power. The mission could provide data on the history of our Sun and planets. It could also be good practice if there was a threat to Earth from a body from space.\n                    </p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-anchor\">\n<h4>Questions 23–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-box\">\n<h5>The merits of the US mission</h5>\n<p>\nCapture of an asteroid would reduce the time that astronauts travelling to it needed to spend in space. An asteroid could also act as a <strong>23</strong> <input id=\"q23_input\" name=\"q10\" type=\"text\"> for further space travel and exploration. The fact that an asteroid would have weaker <strong>24</strong> <input id=\"q24_input\" name=\"q11\" type=\"text\"> would allow easier movement of resources. These resources include <strong>25</strong> <input id=\"q25_input\" name=\"q12\" type=\"text\"> which could be used in space or on Earth, and <strong>26</strong> <input id=\"q26_input\" name=\"q13\" type=\"text\"> which could be consumed or used as a source of power. The mission could provide data on the history of our Sun and planets. It could also be good practice if there was a threat to Earth from a body from space.\n</p>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -16,7 +16,7 @@
       {
         "blockId": "passage-main",
         "kind": "text",
-        "bodyHtml": "<h2>READING PASSAGE 2</h2>\n    <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n    \n    <h3>Decision Fatigue</h3>\n    <p><em>'Decision fatigue' helps explain why ordinarily sensible people avoid making decisions or are easily persuaded to make the wrong decisions when they are tired. Yet few people are conscious of it, and researchers are only beginning to understand why it happens.</em></p>\n  \n    <h4>A</h4>\n    <p>No matter how rational people try to be, they can't make decision after decision without paying a biological price. This 'decision fatigue' is different from ordinary physical fatigue. People are not conscious of being tired, but nevertheless they are low on energy. The more choices one makes throughout the day, the harder it becomes for the brain, and eventually it looks for shortcuts: either to act impulsively instead of expending the energy to think through the possible results, or the ultimate energy saver: do nothing. Avoiding a decision often creates bigger problems in the long run, but for the moment it eases the mental strain.</p>\n\n    <h4>B</h4>\n    <p>Decision fatigue involves a phenomenon called ego depletion, a term coined by social psychologist Roy F. Baumeister. His research demonstrated that there is a finite store of mental stamina for exerting self-control. For example, when people fended off the temptation to eat freshly baked biscuits, they were then less able to resist other temptations. When they tried to resist the urge to cry during a sad movie, afterwards they gave up more quickly on tasks requiring self-discipline, such as working on a geometry puzzle. The experiments confirmed the 19th-century notion of willpower being like a muscle that became tired with use; something which could be conserved by avoiding temptation.</p>\n\n    <h4>C</h4>\n    <p>Decision fatigue leaves people vulnerable to marketers who know how to time their sales, as Jonathan Levav demonstrated. He visited a tailor to have a suit made for his wedding and began going through the choices of fabric, buttons, and so forth, and when he got through the third pile of fabric samples. Levav recalls, \"I couldn't tell the choices apart anymore. After a while my only response to the tailor became, 'What do you recommend?'\" Levav put the experience to use in an experiment conducted at German car dealerships, where real customers had to choose among four styles of gearshift knobs, 25 configurations of the engine and gearbox, and a palette of 56 colours for the interior. As they started picking features, customers would carefully weigh the choices, but as decision fatigue set in they would start settling for the default option. By manipulating the order of the car buyers' choices, the researchers found that customers would end up paying more.</p>\n\n    <h4>D</h4>\n    <p>Similarly, sweet snacks are featured prominently at cash registers at most supermarkets. With their willpower reduced after shopping, people are especially vulnerable to sweet drinks and snacks. While supermarkets figured this out a long time ago, only recently did researchers discover why. Baumeister's research team tested the notion that people could build up willpower by first indulging in pleasure. They found that a delicious, thick milkshake strengthened willpower by helping people perform better than expected on their next task. However, the experiment also included a control group who drank a tasteless low-fat dairy beverage. It provided them with no pleasure, yet it produced similar improvements in self-control. Baumeister concluded that even the tasteless drink had worked because the brain, like the rest of the body, derived energy from glucose, the simple sugar manufactured from all kinds of foods, including milk.</p>\n\n    <h4>E</h4>\n    <p>To establish cause and effect, researchers at Baumeister's lab tried refueling the brain in experiments involving lemonade mixed either with sugar or with a diet sweetener. The sugary lemonade provided a burst of glucose, the effects of which could be observed immediately in the lab; the sugarless sweeteners tasted similar but did not contain the glucose. Again and again, the sugar restored willpower, but the artificial sweetener had no effect. The glucose would mitigate the ego depletion and sometimes completely reverse it, improving self-control and the quality of decisions: the subjects resisted irrational bias when making choices and, when making financial decisions, they were more likely to choose the better long-term strategy instead of going for a quick payoff.</p>\n\n    <h4>F</h4>\n    <p>However, some brain researchers had reservations about the glucose connection. \"Todd Heatherton, a pioneer of social neuroscience, believed in ego depletion but didn't see how this process could be caused simply by variations in glucose levels.\" To observe the process, and to see if it could be reversed by glucose, Heatherton's team recorded images of the brains of 45 people who were on a low-calorie diet as they reacted to pictures of food. Next, these dieters watched a comedy video while forcing themselves to suppress their laughter—thereby draining mental energy and inducing ego depletion. When they were again shown pictures of food, further brain scans revealed more activity in the brain's reward centre and a decrease in the amygdala, which helps control impulses. The food's appeal, in other words, registered more strongly while impulse control weakened. What surprised Heatherton was that administering glucose completely reversed the brain changes brought about by ego depletion.</p>\n\n    <h4>G</h4>\n    <p>\"Good decision-making is not a trait of the person,\" Baumeister says. \"It's a state that fluctuates.\" His studies show that people with the best self-control are the ones who avoid temptations, and who establish habits that eliminate the mental effort of making choices. Instead of counting on willpower all day, they conserve it so that it's available for important decisions. \"Even the wisest people won't make good choices when they're not rested and their glucose is low,\" Baumeister notes. If a decision must be made late in the afternoon or in the evening, they know not to do it on an empty stomach. The best decision-makers, according to Baumeister, \"are the ones who know when not to trust themselves.\"</p>\n    \n    <p>&nbsp;</p> <!-- Final padding -->\n  </section>\n\n  <!-- Draggable Divider -->\n  <div id=\"divider\" title=\"Drag to resize\"></div>\n\n  <!-- Right Pane: Questions and Controls -->"
+        "bodyHtml": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Decision Fatigue</h3>\n<p><em>'Decision fatigue' helps explain why ordinarily sensible people avoid making decisions or are easily persuaded to make the wrong decisions when they are tired. Yet few people are conscious of it, and researchers are only beginning to understand why it happens.</em></p>\n<h4>A</h4>\n<p>No matter how rational people try to be, they can't make decision after decision without paying a biological price. This 'decision fatigue' is different from ordinary physical fatigue. People are not conscious of being tired, but nevertheless they are low on energy. The more choices one makes throughout the day, the harder it becomes for the brain, and eventually it looks for shortcuts: either to act impulsively instead of expending the energy to think through the possible results, or the ultimate energy saver: do nothing. Avoiding a decision often creates bigger problems in the long run, but for the moment it eases the mental strain.</p>\n<h4>B</h4>\n<p>Decision fatigue involves a phenomenon called ego depletion, a term coined by social psychologist Roy F. Baumeister. His research demonstrated that there is a finite store of mental stamina for exerting self-control. For example, when people fended off the temptation to eat freshly baked biscuits, they were then less able to resist other temptations. When they tried to resist the urge to cry during a sad movie, afterwards they gave up more quickly on tasks requiring self-discipline, such as working on a geometry puzzle. The experiments confirmed the 19th-century notion of willpower being like a muscle that became tired with use; something which could be conserved by avoiding temptation.</p>\n<h4>C</h4>\n<p>Decision fatigue leaves people vulnerable to marketers who know how to time their sales, as Jonathan Levav demonstrated. He visited a tailor to have a suit made for his wedding and began going through the choices of fabric, buttons, and so forth, and when he got through the third pile of fabric samples. Levav recalls, \"I couldn't tell the choices apart anymore. After a while my only response to the tailor became, 'What do you recommend?'\" Levav put the experience to use in an experiment conducted at German car dealerships, where real customers had to choose among four styles of gearshift knobs, 25 configurations of the engine and gearbox, and a palette of 56 colours for the interior. As they started picking features, customers would carefully weigh the choices, but as decision fatigue set in they would start settling for the default option. By manipulating the order of the car buyers' choices, the researchers found that customers would end up paying more.</p>\n<h4>D</h4>\n<p>Similarly, sweet snacks are featured prominently at cash registers at most supermarkets. With their willpower reduced after shopping, people are especially vulnerable to sweet drinks and snacks. While supermarkets figured this out a long time ago, only recently did researchers discover why. Baumeister's research team tested the notion that people could build up willpower by first indulging in pleasure. They found that a delicious, thick milkshake strengthened willpower by helping people perform better than expected on their next task. However, the experiment also included a control group who drank a tasteless low-fat dairy beverage. It provided them with no pleasure, yet it produced similar improvements in self-control. Baumeister concluded that even the tasteless drink had worked because the brain, like the rest of the body, derived energy from glucose, the simple sugar manufactured from all kinds of foods, including milk.</p>\n<h4>E</h4>\n<p>To establish cause and effect, researchers at Baumeister's lab tried refueling the brain in experiments involving lemonade mixed either with sugar or with a diet sweetener. The sugary lemonade provided a burst of glucose, the effects of which could be observed immediately in the lab; the sugarless sweeteners tasted similar but did not contain the glucose. Again and again, the sugar restored willpower, but the artificial sweetener had no effect. The glucose would mitigate the ego depletion and sometimes completely reverse it, improving self-control and the quality of decisions: the subjects resisted irrational bias when making choices and, when making financial decisions, they were more likely to choose the better long-term strategy instead of going for a quick payoff.</p>\n<h4>F</h4>\n<p>However, some brain researchers had reservations about the glucose connection. \"Todd Heatherton, a pioneer of social neuroscience, believed in ego depletion but didn't see how this process could be caused simply by variations in glucose levels.\" To observe the process, and to see if it could be reversed by glucose, Heatherton's team recorded images of the brains of 45 people who were on a low-calorie diet as they reacted to pictures of food. Next, these dieters watched a comedy video while forcing themselves to suppress their laughter—thereby draining mental energy and inducing ego depletion. When they were again shown pictures of food, further brain scans revealed more activity in the brain's reward centre and a decrease in the amygdala, which helps control impulses. The food's appeal, in other words, registered more strongly while impulse control weakened. What surprised Heatherton was that administering glucose completely reversed the brain changes brought about by ego depletion.</p>\n<h4>G</h4>\n<p>\"Good decision-making is not a trait of the person,\" Baumeister says. \"It's a state that fluctuates.\" His studies show that people with the best self-control are the ones who avoid temptations, and who establish habits that eliminate the mental effort of making choices. Instead of counting on willpower all day, they conserve it so that it's available for important decisions. \"Even the wisest people won't make good choices when they're not rested and their glucose is low,\" Baumeister notes. If a decision must be made late in the afternoon or in the evening, they know not to do it on an empty stomach. The best decision-makers, according to Baumeister, \"are the ones who know when not to trust themselves.\"</p>\n<p>&nbsp;</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"
       }
     ]
   },
@@ -32,7 +32,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 14–19</h4>\n      <p>Reading Passage 2 has seven sections, <strong>A–G</strong>.</p>\n      <p>Which section contains the following information?</p>\n      <p><em>Drag the correct section letter (A-G) to the box next to the statement.</em></p>\n\n      <!-- Draggable Options Pool (Cloneable because multiple items can come from same section) -->\n      <div class=\"cardpool pool-vertical\" id=\"pool-sections\">\n        <div class=\"card\" draggable=\"true\" id=\"card-A\" data-value=\"A\" data-clone=\"true\"><strong>A</strong></div>\n        <div class=\"card\" draggable=\"true\" id=\"card-B\" data-value=\"B\" data-clone=\"true\"><strong>B</strong></div>\n        <div class=\"card\" draggable=\"true\" id=\"card-C\" data-value=\"C\" data-clone=\"true\"><strong>C</strong></div>\n        <div class=\"card\" draggable=\"true\" id=\"card-D\" data-value=\"D\" data-clone=\"true\"><strong>D</strong></div>\n        <div class=\"card\" draggable=\"true\" id=\"card-E\" data-value=\"E\" data-clone=\"true\"><strong>E</strong></div>\n        <div class=\"card\" draggable=\"true\" id=\"card-F\" data-value=\"F\" data-clone=\"true\"><strong>F</strong></div>\n        <div class=\"card\" draggable=\"true\" id=\"card-G\" data-value=\"G\" data-clone=\"true\"><strong>G</strong></div>\n      </div>\n\n      <hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n\n      <div style=\"margin-bottom:10px;\">\n        <p><a id=\"q1-anchor\"></a><strong>14</strong> research in which two substances that tasted alike had different effects on the subjects</p>\n        <span class=\"match-dropzone\" data-question=\"q1\"></span>\n      </div>\n      <div style=\"margin-bottom:10px;\">\n        <p><a id=\"q2-anchor\"></a><strong>15</strong> an instance where controlling emotions while viewing something upsetting led to a lack of perseverance in other activities</p>\n        <span class=\"match-dropzone\" data-question=\"q2\"></span>\n      </div>\n      <div style=\"margin-bottom:10px;\">\n        <p><a id=\"q3-anchor\"></a><strong>16</strong> an explanation of why it is important to eat something before making a decision at the end of the day</p>\n        <span class=\"match-dropzone\" data-question=\"q3\"></span>\n      </div>\n      <div style=\"margin-bottom:10px;\">\n        <p><a id=\"q4-anchor\"></a><strong>17</strong> a reference to a researcher who was not initially convinced of the effect of glucose</p>\n        <span class=\"match-dropzone\" data-question=\"q4\"></span>\n      </div>\n      <div style=\"margin-bottom:10px;\">\n        <p><a id=\"q5-anchor\"></a><strong>18</strong> an account of research that mirrored an experience the researcher had in his personal life</p>\n        <span class=\"match-dropzone\" data-question=\"q5\"></span>\n      </div>\n      <div style=\"margin-bottom:10px;\">\n        <p><a id=\"q6-anchor\"></a><strong>19</strong> an example of how the location of products in a shop can be used to take advantage of 'decision fatigue'</p>\n        <span class=\"match-dropzone\" data-question=\"q6\"></span>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has seven sections, <strong>A–G</strong>.</p>\n<p>Which section contains the following information?</p>\n<p><em>Drag the correct section letter (A-G) to the box next to the statement.</em></p>\n<div class=\"cardpool pool-vertical\" id=\"pool-sections\">\n<div class=\"card\" draggable=\"true\" id=\"card-A\" data-value=\"A\" data-clone=\"true\"><strong>A</strong></div>\n<div class=\"card\" draggable=\"true\" id=\"card-B\" data-value=\"B\" data-clone=\"true\"><strong>B</strong></div>\n<div class=\"card\" draggable=\"true\" id=\"card-C\" data-value=\"C\" data-clone=\"true\"><strong>C</strong></div>\n<div class=\"card\" draggable=\"true\" id=\"card-D\" data-value=\"D\" data-clone=\"true\"><strong>D</strong></div>\n<div class=\"card\" draggable=\"true\" id=\"card-E\" data-value=\"E\" data-clone=\"true\"><strong>E</strong></div>\n<div class=\"card\" draggable=\"true\" id=\"card-F\" data-value=\"F\" data-clone=\"true\"><strong>F</strong></div>\n<div class=\"card\" draggable=\"true\" id=\"card-G\" data-value=\"G\" data-clone=\"true\"><strong>G</strong></div>\n</div>\n<hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n<div style=\"margin-bottom:10px;\">\n<p><a id=\"q1-anchor\"></a><strong>14</strong> research in which two substances that tasted alike had different effects on the subjects</p>\n<span class=\"match-dropzone\" data-question=\"q1\"></span>\n</div>\n<div style=\"margin-bottom:10px;\">\n<p><a id=\"q2-anchor\"></a><strong>15</strong> an instance where controlling emotions while viewing something upsetting led to a lack of perseverance in other activities</p>\n<span class=\"match-dropzone\" data-question=\"q2\"></span>\n</div>\n<div style=\"margin-bottom:10px;\">\n<p><a id=\"q3-anchor\"></a><strong>16</strong> an explanation of why it is important to eat something before making a decision at the end of the day</p>\n<span class=\"match-dropzone\" data-question=\"q3\"></span>\n</div>\n<div style=\"margin-bottom:10px;\">\n<p><a id=\"q4-anchor\"></a><strong>17</strong> a reference to a researcher who was not initially convinced of the effect of glucose</p>\n<span class=\"match-dropzone\" data-question=\"q4\"></span>\n</div>\n<div style=\"margin-bottom:10px;\">\n<p><a id=\"q5-anchor\"></a><strong>18</strong> an account of research that mirrored an experience the researcher had in his personal life</p>\n<span class=\"match-dropzone\" data-question=\"q5\"></span>\n</div>\n<div style=\"margin-bottom:10px;\">\n<p><a id=\"q6-anchor\"></a><strong>19</strong> an example of how the location of products in a shop can be used to take advantage of 'decision fatigue'</p>\n<span class=\"match-dropzone\" data-question=\"q6\"></span>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -42,7 +42,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 20–22</h4>\n      <p>Complete the summary below.</p>\n      <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n      \n      <h3>The biological price of decision-making</h3>\n      <p>Even when people attempt to be <a id=\"q7-anchor\"></a><strong>20</strong> <input class=\"blank\" type=\"text\" name=\"q7\">, they experience 'decision fatigue' if they make several decisions in a row. They are not aware of how <a id=\"q8-anchor\"></a><strong>21</strong> <input class=\"blank\" type=\"text\" name=\"q8\"> they are, but it is increasingly more difficult for their brains to make decisions as the day progresses. After making many decisions in one day, the brain seeks <a id=\"q9-anchor\"></a><strong>22</strong> <input class=\"blank\" type=\"text\" name=\"q9\"> in order to conserve energy. The person may fail to consider the consequences of their decision or not make a decision at all. Avoiding decisions reduces the immediate strain but can cause difficulties later.</p>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 20–22</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<h3>The biological price of decision-making</h3>\n<p>Even when people attempt to be <a id=\"q7-anchor\"></a><strong>20</strong> <input class=\"blank\" type=\"text\" name=\"q7\">, they experience 'decision fatigue' if they make several decisions in a row. They are not aware of how <a id=\"q8-anchor\"></a><strong>21</strong> <input class=\"blank\" type=\"text\" name=\"q8\"> they are, but it is increasingly more difficult for their brains to make decisions as the day progresses. After making many decisions in one day, the brain seeks <a id=\"q9-anchor\"></a><strong>22</strong> <input class=\"blank\" type=\"text\" name=\"q9\"> in order to conserve energy. The person may fail to consider the consequences of their decision or not make a decision at all. Avoiding decisions reduces the immediate strain but can cause difficulties later.</p>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -53,7 +53,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 23–26</h4>\n      <p>Look at the following statements (Questions 23–26) and the list of researchers below.</p>\n      <p>Match each statement with the correct researcher, <strong>A, B or C</strong>.</p>\n      <p><em>Drag the correct researcher block to the box below each statement.</em></p>\n\n      <div class=\"info-box\">\n        <strong>List of Researchers</strong>\n        <ul style=\"list-style:none; padding-left:10px;\">\n          <li><strong>A</strong> Roy F. Baumeister</li>\n          <li><strong>B</strong> Jonathan Levav</li>\n          <li><strong>C</strong> Todd Heatherton</li>\n        </ul>\n      </div>\n\n      <!-- Draggable Options Pool (Cloneable) -->\n      <div class=\"cardpool pool-vertical\" id=\"pool-researchers\">\n        <div class=\"card\" draggable=\"true\" id=\"res-A\" data-value=\"A\" data-clone=\"true\"><strong>A</strong> Roy F. Baumeister</div>\n        <div class=\"card\" draggable=\"true\" id=\"res-B\" data-value=\"B\" data-clone=\"true\"><strong>B</strong> Jonathan Levav</div>\n        <div class=\"card\" draggable=\"true\" id=\"res-C\" data-value=\"C\" data-clone=\"true\"><strong>C</strong> Todd Heatherton</div>\n      </div>\n\n      <hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n\n      <div style=\"margin-bottom:10px;\">\n        <p><a id=\"q10-anchor\"></a><strong>23</strong> The energy people have for exercising willpower is limited.</p>\n        <span class=\"match-dropzone\" data-question=\"q10\"></span>\n      </div>\n      <div style=\"margin-bottom:10px;\">\n        <p><a id=\"q11-anchor\"></a><strong>24</strong> Even an unpleasant substance had a positive effect on willpower.</p>\n        <span class=\"match-dropzone\" data-question=\"q11\"></span>\n      </div>\n      <div style=\"margin-bottom:10px;\">\n        <p><a id=\"q12-anchor\"></a><strong>25</strong> People's responses to images changed after having to exercise self-control.</p>\n        <span class=\"match-dropzone\" data-question=\"q12\"></span>\n      </div>\n      <div style=\"margin-bottom:10px;\">\n        <p><a id=\"q13-anchor\"></a><strong>26</strong> The sequence of options presented to consumers could be used to the consumers' disadvantage.</p>\n        <span class=\"match-dropzone\" data-question=\"q13\"></span>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 23–26</h4>\n<p>Look at the following statements (Questions 23–26) and the list of researchers below.</p>\n<p>Match each statement with the correct researcher, <strong>A, B or C</strong>.</p>\n<p><em>Drag the correct researcher block to the box below each statement.</em></p>\n<div class=\"info-box\">\n<strong>List of Researchers</strong>\n<ul style=\"list-style:none; padding-left:10px;\">\n<li><strong>A</strong> Roy F. Baumeister</li>\n<li><strong>B</strong> Jonathan Levav</li>\n<li><strong>C</strong> Todd Heatherton</li>\n</ul>\n</div>\n<div class=\"cardpool pool-vertical\" id=\"pool-researchers\">\n<div class=\"card\" draggable=\"true\" id=\"res-A\" data-value=\"A\" data-clone=\"true\"><strong>A</strong> Roy F. Baumeister</div>\n<div class=\"card\" draggable=\"true\" id=\"res-B\" data-value=\"B\" data-clone=\"true\"><strong>B</strong> Jonathan Levav</div>\n<div class=\"card\" draggable=\"true\" id=\"res-C\" data-value=\"C\" data-clone=\"true\"><strong>C</strong> Todd Heatherton</div>\n</div>\n<hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n<div style=\"margin-bottom:10px;\">\n<p><a id=\"q10-anchor\"></a><strong>23</strong> The energy people have for exercising willpower is limited.</p>\n<span class=\"match-dropzone\" data-question=\"q10\"></span>\n</div>\n<div style=\"margin-bottom:10px;\">\n<p><a id=\"q11-anchor\"></a><strong>24</strong> Even an unpleasant substance had a positive effect on willpower.</p>\n<span class=\"match-dropzone\" data-question=\"q11\"></span>\n</div>\n<div style=\"margin-bottom:10px;\">\n<p><a id=\"q12-anchor\"></a><strong>25</strong> People's responses to images changed after having to exercise self-control.</p>\n<span class=\"match-dropzone\" data-question=\"q12\"></span>\n</div>\n<div style=\"margin-bottom:10px;\">\n<p><a id=\"q13-anchor\"></a><strong>26</strong> The sequence of options presented to consumers could be used to the consumers' disadvantage.</p>\n<span class=\"match-dropzone\" data-question=\"q13\"></span>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -16,7 +16,7 @@
       {
         "blockId": "passage-main",
         "kind": "text",
-        "bodyHtml": "<h2>READING PASSAGE 2</h2>\n    <p>You should spend about 20 minutes on <strong>Questions 14-26</strong>, which are based on Reading Passage 2 below.</p>\n    \n    <h3>Growing more for less</h3>\n    <p><em>Satellite technology is helping farmers boost crop yields</em></p>\n  \n    <h4>A</h4>\n    <p>For farmers, working out the optimal amount of seed, fertiliser, pesticide and water to scatter on a field can make, or break, the subsequent harvest. Regular laboratory analyses of soil and plant samples from various parts of the field can help - but such expertise is costly, and often unavailable. However, a new and cheaper method of doing this analysis is now on offer. Precise prescriptions for growing crops can be obtained quickly, and less expensively, by calculating the amount of electromagnetic radiation reflected from agricultural land. The data is collected by orbiting satellites.</p>\n\n    <h4>B</h4>\n    <p>Examining the wavelength of the radiation that is reflected can reveal, with surprising precision, the properties of the soil, the quantity of crop being grown, and the levels in those crops of chlorophyll*, various minerals, moisture and other indicators of their quality. If recent and forecast weather data is added to the mix, detailed maps can be produced indicating exactly how, where and when crops should be grown. The service usually costs less than US$15 per hectare for a handful of readings a year, and can increase yields by as much as 10%.</p>\n\n    <h4>C</h4>\n    <p>Such precision farming using satellite-based intelligence is a relatively new technique. Even so, it is catching on quickly. Five times a year, for example, a French cereals growers' co-operative called Sevepi purchases satellite data and makes it available to its members in the form of maps of their fields, divided into three or four colour-coded zones per hectare. For each zone, one of about 50 fertiliser formulas is recommended. On top of this, if the wheat in the field has already grown quite high early in the season, and heavy showers are expected, an appropriate dose of growth regulator is recommended for each zone. (Long, fragile stems break more easily in downpours.) Then, farm vehicles equipped with global-positioning system locators automatically mix and apply the prescribed dose to each area.</p>\n\n    <h4>D</h4>\n    <p>France is the pioneer in this sort of surveillance. More farmland is analysed by satellite there than in any other country, according to Infoterra (a subsidiary of EADS Astrium), the firm that is France's largest provider of such information, supplying data to companies such as Sevepi. Moreover, Henri Douche, head of Infoterra's agriculture sales in Toulouse, reckons the amount of monitored farmland will increase as weather patterns change and farmers can no longer rely on the past as a guide to the future. When confounded by the yield variations that these new weather patterns will bring, even farmers who are afraid of new technology will sign up, he says.</p>\n\n    <h4>E</h4>\n    <p>Inexpensive data on the productivity of land is advantageous to governments, too. Areas where fertilisers and pesticides are being applied excessively can be pinpointed, studied and regulated by environmental and land-use agencies. Guy Lafond, an agronomist with Agriculture and Agri-Food Canada, a government agency, says the satellite data it purchases is proving useful for the study of fields with declining productivity in the province of Saskatchewan. Overkill with nitrate fertilisers (which are also a source of greenhouse gases) appears partly responsible. And according to RapidEye, a German satellite operator, insurance companies are also studying satellite data with a view to selling insurance policies to governments of famine-prone countries that might be threatened by crop failure.</p>\n\n    <h4>F</h4>\n    <p>In March, RapidEye began selling data that helps forecast harvests. 'Too often, farmers limit productivity by managing fields uniformly,' says Fredrick Jung-Rothenhausler, head of product development at the firm's headquarters in Brandenburg an der Havel. 'Our satellites are the first commercial satellites to include the Red-Edge band of the light spectrum, which is sensitive to changes in chlorophyll content. More research will be necessary to realise the full potential of the Red-Edge band. However, this band can assist in monitoring vegetation health, improving species separation and also help in measuring protein and nitrogen content in biomass.' The company's data, which comes from both Europe and the Americas, breaks field productivity down into patches just five metres square.</p>\n\n    <h4>G</h4>\n    <p>The advantages that satellite technology provides in terms of precision farming do not have to be restricted to rich countries. In Africa, where many soils have become badly depleted of nutrients, better fertiliser management would greatly improve the situation. As a consequence, the charitable trust World Agroforestry Centre, in the city of Nairobi, in Kenya, has begun to build up a catalogue of the radiation patterns derived from around 100,000 samples of African soils. The information is the key to understanding the potential of these soils to be more agriculturally productive. Once passed on to the International Centre for Tropical Agriculture, based in Colombia, South America, it is intended that the information be used to build a database called the 'Digital Soil Map'. When ready, this will provide farmers with free forecasts, developed with regularly updated satellite imagery, across farmland in a number of countries in Africa. This is information which will almost certainly assist in improving crop yields. For a hunger-ravaged continent, that is good news indeed.</p>\n    \n    <p style=\"font-size: 0.9em; color: var(--muted); margin-top: 20px;\">* chlorophyll: the green substance in plants that absorbs light from the sun</p>\n    <p style=\"font-size: 0.8em; color: var(--muted);\">Compiled, formatted, and lightly proofread by ZYZ Reading Walks. All copyright in the underlying works remains with the original authors and publishers.</p>\n  </section>\n\n  <!-- Draggable Divider -->\n  <div id=\"divider\" title=\"Drag to resize\"></div>\n\n  <!-- Right Pane: Questions and Controls -->"
+        "bodyHtml": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on <strong>Questions 14-26</strong>, which are based on Reading Passage 2 below.</p>\n<h3>Growing more for less</h3>\n<p><em>Satellite technology is helping farmers boost crop yields</em></p>\n<h4>A</h4>\n<p>For farmers, working out the optimal amount of seed, fertiliser, pesticide and water to scatter on a field can make, or break, the subsequent harvest. Regular laboratory analyses of soil and plant samples from various parts of the field can help - but such expertise is costly, and often unavailable. However, a new and cheaper method of doing this analysis is now on offer. Precise prescriptions for growing crops can be obtained quickly, and less expensively, by calculating the amount of electromagnetic radiation reflected from agricultural land. The data is collected by orbiting satellites.</p>\n<h4>B</h4>\n<p>Examining the wavelength of the radiation that is reflected can reveal, with surprising precision, the properties of the soil, the quantity of crop being grown, and the levels in those crops of chlorophyll*, various minerals, moisture and other indicators of their quality. If recent and forecast weather data is added to the mix, detailed maps can be produced indicating exactly how, where and when crops should be grown. The service usually costs less than US$15 per hectare for a handful of readings a year, and can increase yields by as much as 10%.</p>\n<h4>C</h4>\n<p>Such precision farming using satellite-based intelligence is a relatively new technique. Even so, it is catching on quickly. Five times a year, for example, a French cereals growers' co-operative called Sevepi purchases satellite data and makes it available to its members in the form of maps of their fields, divided into three or four colour-coded zones per hectare. For each zone, one of about 50 fertiliser formulas is recommended. On top of this, if the wheat in the field has already grown quite high early in the season, and heavy showers are expected, an appropriate dose of growth regulator is recommended for each zone. (Long, fragile stems break more easily in downpours.) Then, farm vehicles equipped with global-positioning system locators automatically mix and apply the prescribed dose to each area.</p>\n<h4>D</h4>\n<p>France is the pioneer in this sort of surveillance. More farmland is analysed by satellite there than in any other country, according to Infoterra (a subsidiary of EADS Astrium), the firm that is France's largest provider of such information, supplying data to companies such as Sevepi. Moreover, Henri Douche, head of Infoterra's agriculture sales in Toulouse, reckons the amount of monitored farmland will increase as weather patterns change and farmers can no longer rely on the past as a guide to the future. When confounded by the yield variations that these new weather patterns will bring, even farmers who are afraid of new technology will sign up, he says.</p>\n<h4>E</h4>\n<p>Inexpensive data on the productivity of land is advantageous to governments, too. Areas where fertilisers and pesticides are being applied excessively can be pinpointed, studied and regulated by environmental and land-use agencies. Guy Lafond, an agronomist with Agriculture and Agri-Food Canada, a government agency, says the satellite data it purchases is proving useful for the study of fields with declining productivity in the province of Saskatchewan. Overkill with nitrate fertilisers (which are also a source of greenhouse gases) appears partly responsible. And according to RapidEye, a German satellite operator, insurance companies are also studying satellite data with a view to selling insurance policies to governments of famine-prone countries that might be threatened by crop failure.</p>\n<h4>F</h4>\n<p>In March, RapidEye began selling data that helps forecast harvests. 'Too often, farmers limit productivity by managing fields uniformly,' says Fredrick Jung-Rothenhausler, head of product development at the firm's headquarters in Brandenburg an der Havel. 'Our satellites are the first commercial satellites to include the Red-Edge band of the light spectrum, which is sensitive to changes in chlorophyll content. More research will be necessary to realise the full potential of the Red-Edge band. However, this band can assist in monitoring vegetation health, improving species separation and also help in measuring protein and nitrogen content in biomass.' The company's data, which comes from both Europe and the Americas, breaks field productivity down into patches just five metres square.</p>\n<h4>G</h4>\n<p>The advantages that satellite technology provides in terms of precision farming do not have to be restricted to rich countries. In Africa, where many soils have become badly depleted of nutrients, better fertiliser management would greatly improve the situation. As a consequence, the charitable trust World Agroforestry Centre, in the city of Nairobi, in Kenya, has begun to build up a catalogue of the radiation patterns derived from around 100,000 samples of African soils. The information is the key to understanding the potential of these soils to be more agriculturally productive. Once passed on to the International Centre for Tropical Agriculture, based in Colombia, South America, it is intended that the information be used to build a database called the 'Digital Soil Map'. When ready, this will provide farmers with free forecasts, developed with regularly updated satellite imagery, across farmland in a number of countries in Africa. This is information which will almost certainly assist in improving crop yields. For a hunger-ravaged continent, that is good news indeed.</p>\n<p style=\"font-size: 0.9em; color: var(--muted); margin-top: 20px;\">* chlorophyll: the green substance in plants that absorbs light from the sun</p>\n<p style=\"font-size: 0.8em; color: var(--muted);\">Compiled, formatted, and lightly proofread by ZYZ Reading Walks. All copyright in the underlying works remains with the original authors and publishers.</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"
       }
     ]
   },
@@ -33,7 +33,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 14-20</h4>\n      <p>Reading Passage 2 has seven paragraphs, <strong>A-G</strong>.</p>\n      <p>Which paragraph contains the following information?</p>\n      <p><em>Write the correct letter, A-G, in boxes 14-20 on your answer sheet.</em></p>\n      <p><strong>NB</strong> You may use any letter more than once.</p>\n\n      <div style=\"margin-bottom: 16px;\">\n        <p><a id=\"q1-anchor\"></a><strong>14</strong> an example of how farmers in one country are now using satellite data to determine fertiliser use</p>\n        <input class=\"blank\" type=\"text\" name=\"q1\" maxlength=\"1\" style=\"width: 60px;\">\n      </div>\n\n      <div style=\"margin-bottom: 16px;\">\n        <p><a id=\"q2-anchor\"></a><strong>15</strong> a reference to climate change and its effects</p>\n        <input class=\"blank\" type=\"text\" name=\"q2\" maxlength=\"1\" style=\"width: 60px;\">\n      </div>\n\n      <div style=\"margin-bottom: 16px;\">\n        <p><a id=\"q3-anchor\"></a><strong>16</strong> a reference to the effect on the soil of using too much fertiliser</p>\n        <input class=\"blank\" type=\"text\" name=\"q3\" maxlength=\"1\" style=\"width: 60px;\">\n      </div>\n\n      <div style=\"margin-bottom: 16px;\">\n        <p><a id=\"q4-anchor\"></a><strong>17</strong> an example of information that will be shared between different countries</p>\n        <input class=\"blank\" type=\"text\" name=\"q4\" maxlength=\"1\" style=\"width: 60px;\">\n      </div>\n\n      <div style=\"margin-bottom: 16px;\">\n        <p><a id=\"q5-anchor\"></a><strong>18</strong> a mention of the country which is the leader in agricultural technology</p>\n        <input class=\"blank\" type=\"text\" name=\"q5\" maxlength=\"1\" style=\"width: 60px;\">\n      </div>\n\n      <div style=\"margin-bottom: 16px;\">\n        <p><a id=\"q6-anchor\"></a><strong>19</strong> a description of an innovation in satellite imaging which requires further study</p>\n        <input class=\"blank\" type=\"text\" name=\"q6\" maxlength=\"1\" style=\"width: 60px;\">\n      </div>\n\n      <div style=\"margin-bottom: 16px;\">\n        <p><a id=\"q7-anchor\"></a><strong>20</strong> evidence of the cost effectiveness of using satellite technology in agriculture</p>\n        <input class=\"blank\" type=\"text\" name=\"q7\" maxlength=\"1\" style=\"width: 60px;\">\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 14-20</h4>\n<p>Reading Passage 2 has seven paragraphs, <strong>A-G</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, A-G, in boxes 14-20 on your answer sheet.</em></p>\n<p><strong>NB</strong> You may use any letter more than once.</p>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q1-anchor\"></a><strong>14</strong> an example of how farmers in one country are now using satellite data to determine fertiliser use</p>\n<input class=\"blank\" type=\"text\" name=\"q1\" maxlength=\"1\" style=\"width: 60px;\">\n</div>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q2-anchor\"></a><strong>15</strong> a reference to climate change and its effects</p>\n<input class=\"blank\" type=\"text\" name=\"q2\" maxlength=\"1\" style=\"width: 60px;\">\n</div>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q3-anchor\"></a><strong>16</strong> a reference to the effect on the soil of using too much fertiliser</p>\n<input class=\"blank\" type=\"text\" name=\"q3\" maxlength=\"1\" style=\"width: 60px;\">\n</div>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q4-anchor\"></a><strong>17</strong> an example of information that will be shared between different countries</p>\n<input class=\"blank\" type=\"text\" name=\"q4\" maxlength=\"1\" style=\"width: 60px;\">\n</div>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q5-anchor\"></a><strong>18</strong> a mention of the country which is the leader in agricultural technology</p>\n<input class=\"blank\" type=\"text\" name=\"q5\" maxlength=\"1\" style=\"width: 60px;\">\n</div>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q6-anchor\"></a><strong>19</strong> a description of an innovation in satellite imaging which requires further study</p>\n<input class=\"blank\" type=\"text\" name=\"q6\" maxlength=\"1\" style=\"width: 60px;\">\n</div>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q7-anchor\"></a><strong>20</strong> evidence of the cost effectiveness of using satellite technology in agriculture</p>\n<input class=\"blank\" type=\"text\" name=\"q7\" maxlength=\"1\" style=\"width: 60px;\">\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -42,7 +42,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 21 and 22</h4>\n      <p>Choose <strong>TWO</strong> letters, <strong>A-E</strong>.</p>\n      <p>Write the correct letters in boxes 21 and 22 on your answer sheet.</p>\n      <p>Which <strong>TWO</strong> companies obtain information directly from satellites?</p>\n      \n      <div class=\"mcq-group\">\n        <label><input type=\"checkbox\" name=\"q8_9\" value=\"A\"> A. Sevepi</label>\n        <label><input type=\"checkbox\" name=\"q8_9\" value=\"B\"> B. Infoterra</label>\n        <label><input type=\"checkbox\" name=\"q8_9\" value=\"C\"> C. Agriculture and Agri-Food Canada</label>\n        <label><input type=\"checkbox\" name=\"q8_9\" value=\"D\"> D. RapidEye</label>\n        <label><input type=\"checkbox\" name=\"q8_9\" value=\"E\"> E. World Agroforestry Centre</label>\n      </div>\n      <p style=\"font-size: 0.9em; color: var(--muted); margin-top: 8px;\"><em>Note: Select exactly TWO options</em></p>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 21 and 22</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A-E</strong>.</p>\n<p>Write the correct letters in boxes 21 and 22 on your answer sheet.</p>\n<p>Which <strong>TWO</strong> companies obtain information directly from satellites?</p>\n<div class=\"mcq-group\">\n<label><input type=\"checkbox\" name=\"q8_9\" value=\"A\"> A. Sevepi</label> <label><input type=\"checkbox\" name=\"q8_9\" value=\"B\"> B. Infoterra</label> <label><input type=\"checkbox\" name=\"q8_9\" value=\"C\"> C. Agriculture and Agri-Food Canada</label> <label><input type=\"checkbox\" name=\"q8_9\" value=\"D\"> D. RapidEye</label> <label><input type=\"checkbox\" name=\"q8_9\" value=\"E\"> E. World Agroforestry Centre</label>\n</div>\n<p style=\"font-size: 0.9em; color: var(--muted); margin-top: 8px;\"><em>Note: Select exactly TWO options</em></p>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -53,7 +53,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 23-26</h4>\n      <p>Complete the sentences below.</p>\n      <p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n      <p>Write your answers in boxes 23-26 on your answer sheet.</p>\n      \n      <div style=\"margin-bottom: 16px;\">\n        <p><a id=\"q10-anchor\"></a><strong>23</strong> Initially, orbiting satellites are used to measure <input class=\"blank\" type=\"text\" name=\"q10\"> coming from farmland.</p>\n      </div>\n      \n      <div style=\"margin-bottom: 16px;\">\n        <p><a id=\"q11-anchor\"></a><strong>24</strong> <input class=\"blank\" type=\"text\" name=\"q11\"> believes that confusion about irregular weather will cause more farmers to use satellite technology.</p>\n      </div>\n      \n      <div style=\"margin-bottom: 16px;\">\n        <p><a id=\"q12-anchor\"></a><strong>25</strong> As a result of satellite technology, it may become possible to insure against the risk of <input class=\"blank\" type=\"text\" name=\"q12\">.</p>\n      </div>\n      \n      <div style=\"margin-bottom: 16px;\">\n        <p><a id=\"q13-anchor\"></a><strong>26</strong> In Africa, much of the soil suffers from the loss of <input class=\"blank\" type=\"text\" name=\"q13\">.</p>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 23-26</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<p>Write your answers in boxes 23-26 on your answer sheet.</p>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q10-anchor\"></a><strong>23</strong> Initially, orbiting satellites are used to measure <input class=\"blank\" type=\"text\" name=\"q10\"> coming from farmland.</p>\n</div>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q11-anchor\"></a><strong>24</strong> <input class=\"blank\" type=\"text\" name=\"q11\"> believes that confusion about irregular weather will cause more farmers to use satellite technology.</p>\n</div>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q12-anchor\"></a><strong>25</strong> As a result of satellite technology, it may become possible to insure against the risk of <input class=\"blank\" type=\"text\" name=\"q12\">.</p>\n</div>\n<div style=\"margin-bottom: 16px;\">\n<p><a id=\"q13-anchor\"></a><strong>26</strong> In Africa, much of the soil suffers from the loss of <input class=\"blank\" type=\"text\" name=\"q13\">.</p>\n</div>\n</div>"
     }
   ],
   "answerKey": {
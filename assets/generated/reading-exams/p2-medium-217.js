@@ -11,7 +11,7 @@
       {
         "blockId": "passage-main",
         "kind": "text",
-        "bodyHtml": "<h2>READING PASSAGE 2</h2>\n    <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n    \n    <h3>A mechanical friend for children</h3>\n  \n    <h4>A</h4>\n    <p>The development of robots that interact socially with people and assist them in everyday life has been an elusive goal of modern science. Despite impressive advances in the mechanical aspects of this problem, producing robots that bond and socialize with people for sustained periods of time has proven difficult. The most successful robots so far have been storytellers, but they have only been able to maintain human interest for a limited time and typically rely on the robot telling stories that change over time. In practice, commercially available robots seldom cross the 10-hour barrier (i.e., individual users tend to spend less than a combined total of 10 hours with the robots before losing interest). This observation is in sharp contrast to the long-term interactions and bonding that commonly develop between humans and their pets.</p>\n\n    <h4>B</h4>\n    <p>In a recent study, researchers from the Institute for Neural Computation in California introduced a state-of-the-art social robot into a classroom of 18-to-24-month-olds for five months as a way of studying human/robot interactions. The researchers, including Fumihide Tanaka and Javier R. Movellan, introduced a toddler-sized humanoid robot into a classroom at a childhood education center. One of the QRIO series of robots, the 58 cm machine, was originally developed by Sony. ‘Children of toddler age were chosen because they have no preconceived notions of robots,’ according to Tanaka. One of the goals of the study was to establish whether it was possible for social robots to maintain the interest of children beyond the 10-hour barrier.</p>\n\n    <h4>C</h4>\n    <p>The researchers sent instructions to the robot about every two minutes to do things like giggle, dance, sit down, fall down, or walk in a certain direction. The 45 sessions were videotaped, and interactions between toddlers and the robot were later analyzed. The results showed that the quality of those interactions improved steadily over 27 sessions. The interactions deteriorated quickly over the next 15 sessions, when the robot was ordered to behave in a more limited, predictable manner. Finally, the human/robot relations improved in the last three sessions, after the robot had been instructed to display its full range of behaviors.</p>\n\n    <h4>D</h4>\n    <p>‘Initially, the children treated the robot very differently from the way they treated each other,’ Tanaka said. ‘Early in the study, some children cried when QRIO fell. But a month into the study, the toddlers helped QRIO stand up by pushing its back or pulling its hands.’ ‘The most important aspect of interaction was touch,’ Tanaka said. ‘At first, the toddlers would touch the robot on its face, but later on they would touch it only on its hands and arms, like they would with other humans. Another robot-like toy named Robby, which resembled QRIO but did not move, was used as a control in the study. While hugging of QRIO increased, hugging of Robby decreased throughout the study. Furthermore, when QRIO laid down on the floor, caretaking behaviors were frequently observed toward QRIO but seldom toward Robby.’</p>\n\n    <h4>E</h4>\n    <p>The study concluded that after 45 days of immersion in a childcare center over a period of five months, long-term bonding and socialization occurred between toddlers and a state-of-the-art social robot. Overall, the interaction between children and the robot improved over time and the children progressively treated it more as a peer than a plaything. ‘To my knowledge, this is the first long-term study of this sort,’ said Ronald Arkin, a roboticist at the Georgia Institute of Technology in the US.</p>\n\n    <h4>F</h4>\n    <p>Tanaka and Movellan are now developing autonomous robots for the toddler classroom. ‘It could have great potential in educational settings, assisting teachers and enriching the classroom environment,’ Tanaka said. The researchers hope that more advanced versions of robots like QRIO could become personalized tutors to assist teachers in classrooms. A robotic tutor could react on the spot to social cues and approximate social skills like facial expression and eye gaze, they said. ‘It is becoming clear that, to achieve this goal, we are going to endow machines with something similar to emotion, not just traditional forms of intelligence,’ said Movellan.</p>\n\n    <h4>G</h4>\n    <p>Associate Professor David Powers, an expert in artificial intelligence and cognitive science at Flinders University in South Australia, commented, ‘In this study, it is clearly demonstrated that a limited range of robot behaviors, however impressive, is nowhere near as important to human/robot interaction as being able to make appropriate responses from a broad repertoire of behaviors.’ Ronald Arkin was not surprised by the affection demonstrated by the toddlers toward the robot. ‘Humans have a tremendous propensity to bond with artifacts, whether it be a car, a doll, or a robot,’ he said. But he also cautioned that researchers do not yet understand the consequences of increased human/robot interaction. ‘Studying how robots and humans work together can give us insight into whether this is a good thing or a bad thing for society,’ Arkin said. ‘We need to find out what the consequences are of introducing a robot into a cadre of children. How will that enhance, or potentially interfere with, their social development? Do we really understand the long-term impact of having a robot as a childhood friend?’</p>\n    \n    <p>&nbsp;</p> <!-- Final padding -->\n  </section>\n\n  <!-- Draggable Divider -->\n  <div id=\"divider\" title=\"Drag to resize\"></div>\n\n  <!-- Right Pane: Questions and Controls -->"
+        "bodyHtml": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>A mechanical friend for children</h3>\n<h4>A</h4>\n<p>The development of robots that interact socially with people and assist them in everyday life has been an elusive goal of modern science. Despite impressive advances in the mechanical aspects of this problem, producing robots that bond and socialize with people for sustained periods of time has proven difficult. The most successful robots so far have been storytellers, but they have only been able to maintain human interest for a limited time and typically rely on the robot telling stories that change over time. In practice, commercially available robots seldom cross the 10-hour barrier (i.e., individual users tend to spend less than a combined total of 10 hours with the robots before losing interest). This observation is in sharp contrast to the long-term interactions and bonding that commonly develop between humans and their pets.</p>\n<h4>B</h4>\n<p>In a recent study, researchers from the Institute for Neural Computation in California introduced a state-of-the-art social robot into a classroom of 18-to-24-month-olds for five months as a way of studying human/robot interactions. The researchers, including Fumihide Tanaka and Javier R. Movellan, introduced a toddler-sized humanoid robot into a classroom at a childhood education center. One of the QRIO series of robots, the 58 cm machine, was originally developed by Sony. ‘Children of toddler age were chosen because they have no preconceived notions of robots,’ according to Tanaka. One of the goals of the study was to establish whether it was possible for social robots to maintain the interest of children beyond the 10-hour barrier.</p>\n<h4>C</h4>\n<p>The researchers sent instructions to the robot about every two minutes to do things like giggle, dance, sit down, fall down, or walk in a certain direction. The 45 sessions were videotaped, and interactions between toddlers and the robot were later analyzed. The results showed that the quality of those interactions improved steadily over 27 sessions. The interactions deteriorated quickly over the next 15 sessions, when the robot was ordered to behave in a more limited, predictable manner. Finally, the human/robot relations improved in the last three sessions, after the robot had been instructed to display its full range of behaviors.</p>\n<h4>D</h4>\n<p>‘Initially, the children treated the robot very differently from the way they treated each other,’ Tanaka said. ‘Early in the study, some children cried when QRIO fell. But a month into the study, the toddlers helped QRIO stand up by pushing its back or pulling its hands.’ ‘The most important aspect of interaction was touch,’ Tanaka said. ‘At first, the toddlers would touch the robot on its face, but later on they would touch it only on its hands and arms, like they would with other humans. Another robot-like toy named Robby, which resembled QRIO but did not move, was used as a control in the study. While hugging of QRIO increased, hugging of Robby decreased throughout the study. Furthermore, when QRIO laid down on the floor, caretaking behaviors were frequently observed toward QRIO but seldom toward Robby.’</p>\n<h4>E</h4>\n<p>The study concluded that after 45 days of immersion in a childcare center over a period of five months, long-term bonding and socialization occurred between toddlers and a state-of-the-art social robot. Overall, the interaction between children and the robot improved over time and the children progressively treated it more as a peer than a plaything. ‘To my knowledge, this is the first long-term study of this sort,’ said Ronald Arkin, a roboticist at the Georgia Institute of Technology in the US.</p>\n<h4>F</h4>\n<p>Tanaka and Movellan are now developing autonomous robots for the toddler classroom. ‘It could have great potential in educational settings, assisting teachers and enriching the classroom environment,’ Tanaka said. The researchers hope that more advanced versions of robots like QRIO could become personalized tutors to assist teachers in classrooms. A robotic tutor could react on the spot to social cues and approximate social skills like facial expression and eye gaze, they said. ‘It is becoming clear that, to achieve this goal, we are going to endow machines with something similar to emotion, not just traditional forms of intelligence,’ said Movellan.</p>\n<h4>G</h4>\n<p>Associate Professor David Powers, an expert in artificial intelligence and cognitive science at Flinders University in South Australia, commented, ‘In this study, it is clearly demonstrated that a limited range of robot behaviors, however impressive, is nowhere near as important to human/robot interaction as being able to make appropriate responses from a broad repertoire of behaviors.’ Ronald Arkin was not surprised by the affection demonstrated by the toddlers toward the robot. ‘Humans have a tremendous propensity to bond with artifacts, whether it be a car, a doll, or a robot,’ he said. But he also cautioned that researchers do not yet understand the consequences of increased human/robot interaction. ‘Studying how robots and humans work together can give us insight into whether this is a good thing or a bad thing for society,’ Arkin said. ‘We need to find out what the consequences are of introducing a robot into a cadre of children. How will that enhance, or potentially interfere with, their social development? Do we really understand the long-term impact of having a robot as a childhood friend?’</p>\n<p>&nbsp;</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"
       }
     ]
   },
@@ -26,7 +26,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 14–18</h4>\n      <p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n      <p>Which paragraph contains the following information?</p>\n      <p><em>NB You may use any letter more than once.</em></p>\n      <p><em>Drag the correct paragraph letter (A-G) to the box next to the statement.</em></p>\n\n      <!-- Draggable Options Pool (Cloneable) -->\n      <div class=\"cardpool pool-vertical\" id=\"pool-paragraphs\">\n        <div class=\"card\" draggable=\"true\" id=\"c-a\" data-value=\"A\" data-clone=\"true\"><strong>A</strong></div>\n        <div class=\"card\" draggable=\"true\" id=\"c-b\" data-value=\"B\" data-clone=\"true\"><strong>B</strong></div>\n        <div class=\"card\" draggable=\"true\" id=\"c-c\" data-value=\"C\" data-clone=\"true\"><strong>C</strong></div>\n        <div class=\"card\" draggable=\"true\" id=\"c-d\" data-value=\"D\" data-clone=\"true\"><strong>D</strong></div>\n        <div class=\"card\" draggable=\"true\" id=\"c-e\" data-value=\"E\" data-clone=\"true\"><strong>E</strong></div>\n        <div class=\"card\" draggable=\"true\" id=\"c-f\" data-value=\"F\" data-clone=\"true\"><strong>F</strong></div>\n        <div class=\"card\" draggable=\"true\" id=\"c-g\" data-value=\"G\" data-clone=\"true\"><strong>G</strong></div>\n      </div>\n\n      <hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n\n      <div class=\"question-block\">\n        <p><a id=\"q1-anchor\"></a><strong>14</strong> a comparison of children’s reactions towards different robots</p>\n        <span class=\"dropzone match-dropzone\" data-target=\"q1\" data-question=\"q1\"></span>\n      </div>\n      <div class=\"question-block\">\n        <p><a id=\"q2-anchor\"></a><strong>15</strong> a speculation about ways robots may be able to communicate</p>\n        <span class=\"dropzone match-dropzone\" data-target=\"q2\" data-question=\"q2\"></span>\n      </div>\n      <div class=\"question-block\">\n        <p><a id=\"q3-anchor\"></a><strong>16</strong> a description of changes in the way the children physically handled a robot</p>\n        <span class=\"dropzone match-dropzone\" data-target=\"q3\" data-question=\"q3\"></span>\n      </div>\n      <div class=\"question-block\">\n        <p><a id=\"q4-anchor\"></a><strong>17</strong> a comparison between people’s connections with animals and their connections with robots</p>\n        <span class=\"dropzone match-dropzone\" data-target=\"q4\" data-question=\"q4\"></span>\n      </div>\n      <div class=\"question-block\">\n        <p><a id=\"q5-anchor\"></a><strong>18</strong> an account of the way one robot was programmed</p>\n        <span class=\"dropzone match-dropzone\" data-target=\"q5\" data-question=\"q5\"></span>\n      </div>\n    </div>",
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 14–18</h4>\n<p>Reading Passage 2 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<p><em>Drag the correct paragraph letter (A-G) to the box next to the statement.</em></p>\n<div class=\"cardpool pool-vertical\" id=\"pool-paragraphs\">\n<div class=\"card\" draggable=\"true\" id=\"c-a\" data-value=\"A\" data-clone=\"true\"><strong>A</strong></div>\n<div class=\"card\" draggable=\"true\" id=\"c-b\" data-value=\"B\" data-clone=\"true\"><strong>B</strong></div>\n<div class=\"card\" draggable=\"true\" id=\"c-c\" data-value=\"C\" data-clone=\"true\"><strong>C</strong></div>\n<div class=\"card\" draggable=\"true\" id=\"c-d\" data-value=\"D\" data-clone=\"true\"><strong>D</strong></div>\n<div class=\"card\" draggable=\"true\" id=\"c-e\" data-value=\"E\" data-clone=\"true\"><strong>E</strong></div>\n<div class=\"card\" draggable=\"true\" id=\"c-f\" data-value=\"F\" data-clone=\"true\"><strong>F</strong></div>\n<div class=\"card\" draggable=\"true\" id=\"c-g\" data-value=\"G\" data-clone=\"true\"><strong>G</strong></div>\n</div>\n<hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n<div class=\"question-block\">\n<p><a id=\"q1-anchor\"></a><strong>14</strong> a comparison of children’s reactions towards different robots</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q1\" data-question=\"q1\"></span>\n</div>\n<div class=\"question-block\">\n<p><a id=\"q2-anchor\"></a><strong>15</strong> a speculation about ways robots may be able to communicate</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q2\" data-question=\"q2\"></span>\n</div>\n<div class=\"question-block\">\n<p><a id=\"q3-anchor\"></a><strong>16</strong> a description of changes in the way the children physically handled a robot</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q3\" data-question=\"q3\"></span>\n</div>\n<div class=\"question-block\">\n<p><a id=\"q4-anchor\"></a><strong>17</strong> a comparison between people’s connections with animals and their connections with robots</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q4\" data-question=\"q4\"></span>\n</div>\n<div class=\"question-block\">\n<p><a id=\"q5-anchor\"></a><strong>18</strong> an account of the way one robot was programmed</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q5\" data-question=\"q5\"></span>\n</div>\n</div>",
       "allowOptionReuse": true
     },
     {
@@ -39,7 +39,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 19–23</h4>\n      <p>Look at the following statements (Questions 19–23) and the list of people below.</p>\n      <p>Match each statement with the correct person, <strong>A-D</strong>.</p>\n      <p><em>NB You may use any letter more than once.</em></p>\n      <p><em>Drag the correct person block to the box below each statement.</em></p>\n\n      <!-- Draggable Options Pool (Cloneable) -->\n      <div class=\"cardpool pool-vertical\" id=\"pool-people\">\n        <div class=\"card\" draggable=\"true\" id=\"res-A\" data-value=\"A\" data-clone=\"true\"><strong>A</strong> Fumihide Tanaka</div>\n        <div class=\"card\" draggable=\"true\" id=\"res-B\" data-value=\"B\" data-clone=\"true\"><strong>B</strong> Javier R. Movellan</div>\n        <div class=\"card\" draggable=\"true\" id=\"res-C\" data-value=\"C\" data-clone=\"true\"><strong>C</strong> Ronald Arkin</div>\n        <div class=\"card\" draggable=\"true\" id=\"res-D\" data-value=\"D\" data-clone=\"true\"><strong>D</strong> David Powers</div>\n      </div>\n\n      <hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n\n      <div class=\"question-block\">\n        <p><a id=\"q6-anchor\"></a><strong>19</strong> In future, robots will not only have to think, but also to show feelings.</p>\n        <span class=\"dropzone match-dropzone\" data-target=\"q6\" data-question=\"q6\"></span>\n      </div>\n      <div class=\"question-block\">\n        <p><a id=\"q7-anchor\"></a><strong>20</strong> It is uncertain whether more contact between people and robots will be beneficial.</p>\n        <span class=\"dropzone match-dropzone\" data-target=\"q7\" data-question=\"q7\"></span>\n      </div>\n      <div class=\"question-block\">\n        <p><a id=\"q8-anchor\"></a><strong>21</strong> Very young children have not yet developed ideas about robots.</p>\n        <span class=\"dropzone match-dropzone\" data-target=\"q8\" data-question=\"q8\"></span>\n      </div>\n      <div class=\"question-block\">\n        <p><a id=\"q9-anchor\"></a><strong>22</strong> Robots need to perform a wide variety of actions for people to relate to them.</p>\n        <span class=\"dropzone match-dropzone\" data-target=\"q9\" data-question=\"q9\"></span>\n      </div>\n      <div class=\"question-block\">\n        <p><a id=\"q10-anchor\"></a><strong>23</strong> Using robots as an aid in schools may have many benefits.</p>\n        <span class=\"dropzone match-dropzone\" data-target=\"q10\" data-question=\"q10\"></span>\n      </div>\n    </div>",
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 19–23</h4>\n<p>Look at the following statements (Questions 19–23) and the list of people below.</p>\n<p>Match each statement with the correct person, <strong>A-D</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<p><em>Drag the correct person block to the box below each statement.</em></p>\n<div class=\"cardpool pool-vertical\" id=\"pool-people\">\n<div class=\"card\" draggable=\"true\" id=\"res-A\" data-value=\"A\" data-clone=\"true\"><strong>A</strong> Fumihide Tanaka</div>\n<div class=\"card\" draggable=\"true\" id=\"res-B\" data-value=\"B\" data-clone=\"true\"><strong>B</strong> Javier R. Movellan</div>\n<div class=\"card\" draggable=\"true\" id=\"res-C\" data-value=\"C\" data-clone=\"true\"><strong>C</strong> Ronald Arkin</div>\n<div class=\"card\" draggable=\"true\" id=\"res-D\" data-value=\"D\" data-clone=\"true\"><strong>D</strong> David Powers</div>\n</div>\n<hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n<div class=\"question-block\">\n<p><a id=\"q6-anchor\"></a><strong>19</strong> In future, robots will not only have to think, but also to show feelings.</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q6\" data-question=\"q6\"></span>\n</div>\n<div class=\"question-block\">\n<p><a id=\"q7-anchor\"></a><strong>20</strong> It is uncertain whether more contact between people and robots will be beneficial.</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q7\" data-question=\"q7\"></span>\n</div>\n<div class=\"question-block\">\n<p><a id=\"q8-anchor\"></a><strong>21</strong> Very young children have not yet developed ideas about robots.</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q8\" data-question=\"q8\"></span>\n</div>\n<div class=\"question-block\">\n<p><a id=\"q9-anchor\"></a><strong>22</strong> Robots need to perform a wide variety of actions for people to relate to them.</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q9\" data-question=\"q9\"></span>\n</div>\n<div class=\"question-block\">\n<p><a id=\"q10-anchor\"></a><strong>23</strong> Using robots as an aid in schools may have many benefits.</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q10\" data-question=\"q10\"></span>\n</div>\n</div>",
       "allowOptionReuse": true
     },
     {
@@ -50,7 +50,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 24–26</h4>\n      <p>Complete the sentences below.</p>\n      <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n      \n      <p>24 Until recently, robots that were best at holding people’s attention were those that acted as <a id=\"q11-anchor\"></a><input class=\"blank\" type=\"text\" name=\"q11\">.</p>\n      <p>25 The children responded to the QRIO robot as a friend or a <a id=\"q12-anchor\"></a><input class=\"blank\" type=\"text\" name=\"q12\"> rather than as a toy.</p>\n      <p>26 Arkin expected that the children would show <a id=\"q13-anchor\"></a><input class=\"blank\" type=\"text\" name=\"q13\"> towards the QRIO robot.</p>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 24–26</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<p>24 Until recently, robots that were best at holding people’s attention were those that acted as <a id=\"q11-anchor\"></a><input class=\"blank\" type=\"text\" name=\"q11\">.</p>\n<p>25 The children responded to the QRIO robot as a friend or a <a id=\"q12-anchor\"></a><input class=\"blank\" type=\"text\" name=\"q12\"> rather than as a toy.</p>\n<p>26 Arkin expected that the children would show <a id=\"q13-anchor\"></a><input class=\"blank\" type=\"text\" name=\"q13\"> towards the QRIO robot.</p>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 2</h2>\n            <p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n            \n            <h3>Urban Regeneration: an award-winning redevelopment project in Berlin</h3>\n            \n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"A\" id=\"q1-dropzone\" data-question=\"q1\">\n                    <span class=\"paragraph-label\">Paragraph A (Q14):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>A</strong> Just over a kilometer south of Berlin's Potsdamer Platz, near the left bank of the Landwehr Canal, an extensive, triangular-shaped area of waste ground once separated the neighbourhoods of Kreuzberg to the east and Schöneberg to the west. Known as Gleisdreieck, meaning ‘triangle of rails’, it was formed by the intersection of different railway lines built in the mid-nineteenth century that entered Berlin from the south. Tracks, sheds and warehouses belonging to three old railway stations – Dresdner Bahnhof (1875-1882), Potsdamer Bahnhof (1838-1944) and Anhalter Bahnhof (1839-1952) – are situated on a raised area some twenty hectares in size, at a height of four metres above the surrounding ground level.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"B\" id=\"q2-dropzone\" data-question=\"q2\">\n                    <span class=\"paragraph-label\">Paragraph B (Q15):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>B</strong> As the railway infrastructure gradually ceased to be used, the whole area of Gleisdreieck became increasingly run down and abandoned, to the point of being used as a rubbish tip after 1945. Meanwhile, vegetation took over, turning it into a surprising, natural haven in the middle of built-up areas. The closeness of the wall which divided the city of Berlin between 1961 and 1990 also contributed to the fact that Gleisdreieck was for decades clearly identified as no-man’s-land. Only a station of the same name in Berlin’s underground railway system testified to its existence. Shortly before the fall of the Berlin Wall, however, the German Museum of Technology was established there, attracting large numbers of visitors and giving visibility to the site. More importantly, the unification of the formerly divided city gave the zone more centrality, at which point it became imperative to identify a purpose for it.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"C\" id=\"q3-dropzone\" data-question=\"q3\">\n                    <span class=\"paragraph-label\">Paragraph C (Q16):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>C</strong> After 2006, the State of Berlin put forward the proposal of converting Gleisdreieck into a large urban park that would integrate the different urban zones which converged there. The decades-long isolation of the site, which had formerly presented a problem, now represented an opportunity for joining the southern area of Potsdamer Platz with Kreuzberg and Schöneberg. The creation of the park would trigger one of the biggest urban expansions inside Berlin, all within a framework of multiple uses and social characteristics. It was necessary to stimulate the development of sixteen new hectares of local amenities that would be capable of integrating different generations and social groups in a sustainable way, and in harmony with nature. Following intense discussion with local proprietors and residents, the need to reconcile these goals with the conservation of railway heritage also emerged.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"D\" id=\"q4-dropzone\" data-question=\"q4\">\n                    <span class=\"paragraph-label\">Paragraph D (Q17):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>D</strong> Once the area had been subjected to a process of undergrowth clearance and decontamination, it was then organized around a combination of existing and added elements. The project as a whole was planned around a large central meadow, intersected from east to west by a concrete footpath, and from north to south by a pair of railway lines. Once a month, a train slowly travels along these lines from its parking shed to the German Museum of Technology. The concrete footpath, which is a continuation of one of the main Kreuzberg boulevards, starts in the east, bridges the four-metre difference in ground level by means of a stairway, and suddenly ends in the west on reaching the underground lines.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"E\" id=\"q5-dropzone\" data-question=\"q5\">\n                    <span class=\"paragraph-label\">Paragraph E (Q18):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>E</strong> North of the meadow, there is a large concrete slab with rounded edges. Being south-facing, this functions as a big sunny terrace, full of benches complete with footrests. In the south, the meadow overlooks Yorckstrasse, an underpass crossed by more than fifteen former railway bridges. To the east of the meadow there is quite a dense forest of pre-existing maples, oaks and birches, as well as newly planted trees of the same species. In this area, a couple of large metal frames each hold two swings. The edges of the park are finished with a collection of distinctive, functional spaces, for example a nursery, sports fields, concave surfaces for skateboards, stages for dancing, community gardens, or simply areas covered in gravel obtained from the site itself.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"F\" id=\"q6-dropzone\" data-question=\"q6\">\n                    <span class=\"paragraph-label\">Paragraph F (Q19):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>F</strong> Although initially the regeneration of Gleisdreieck Park was the subject of disagreement between those who were in favour of safeguarding the railway heritage and those who wanted to regenerate the adjacent neighbourhoods, it was opened to the public in September 2011. The heart of Berlin now has a new green lung, in which the atmosphere of various small, very different corners fits neatly into a large-scale, wide-ranging and robust general order. This has been possible precisely because the intervention was not limited to conserving industrial remains in order to promote railway history. And as a reminder of the six decades of human absence, during which nature took over, the park has been able to conserve to some extent the spirit of the non-place that preceded it.</p>\n            </div>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 2</h2>\n<p>You should spend about 20 minutes on Questions 14–26, which are based on Reading Passage 2 below.</p>\n<h3>Urban Regeneration: an award-winning redevelopment project in Berlin</h3>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"A\" id=\"q1-dropzone\" data-question=\"q1\">\n<span class=\"paragraph-label\">Paragraph A (Q14):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> Just over a kilometer south of Berlin's Potsdamer Platz, near the left bank of the Landwehr Canal, an extensive, triangular-shaped area of waste ground once separated the neighbourhoods of Kreuzberg to the east and Schöneberg to the west. Known as Gleisdreieck, meaning ‘triangle of rails’, it was formed by the intersection of different railway lines built in the mid-nineteenth century that entered Berlin from the south. Tracks, sheds and warehouses belonging to three old railway stations – Dresdner Bahnhof (1875-1882), Potsdamer Bahnhof (1838-1944) and Anhalter Bahnhof (1839-1952) – are situated on a raised area some twenty hectares in size, at a height of four metres above the surrounding ground level.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"B\" id=\"q2-dropzone\" data-question=\"q2\">\n<span class=\"paragraph-label\">Paragraph B (Q15):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> As the railway infrastructure gradually ceased to be used, the whole area of Gleisdreieck became increasingly run down and abandoned, to the point of being used as a rubbish tip after 1945. Meanwhile, vegetation took over, turning it into a surprising, natural haven in the middle of built-up areas. The closeness of the wall which divided the city of Berlin between 1961 and 1990 also contributed to the fact that Gleisdreieck was for decades clearly identified as no-man’s-land. Only a station of the same name in Berlin’s underground railway system testified to its existence. Shortly before the fall of the Berlin Wall, however, the German Museum of Technology was established there, attracting large numbers of visitors and giving visibility to the site. More importantly, the unification of the formerly divided city gave the zone more centrality, at which point it became imperative to identify a purpose for it.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"C\" id=\"q3-dropzone\" data-question=\"q3\">\n<span class=\"paragraph-label\">Paragraph C (Q16):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> After 2006, the State of Berlin put forward the proposal of converting Gleisdreieck into a large urban park that would integrate the different urban zones which converged there. The decades-long isolation of the site, which had formerly presented a problem, now represented an opportunity for joining the southern area of Potsdamer Platz with Kreuzberg and Schöneberg. The creation of the park would trigger one of the biggest urban expansions inside Berlin, all within a framework of multiple uses and social characteristics. It was necessary to stimulate the development of sixteen new hectares of local amenities that would be capable of integrating different generations and social groups in a sustainable way, and in harmony with nature. Following intense discussion with local proprietors and residents, the need to reconcile these goals with the conservation of railway heritage also emerged.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"D\" id=\"q4-dropzone\" data-question=\"q4\">\n<span class=\"paragraph-label\">Paragraph D (Q17):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> Once the area had been subjected to a process of undergrowth clearance and decontamination, it was then organized around a combination of existing and added elements. The project as a whole was planned around a large central meadow, intersected from east to west by a concrete footpath, and from north to south by a pair of railway lines. Once a month, a train slowly travels along these lines from its parking shed to the German Museum of Technology. The concrete footpath, which is a continuation of one of the main Kreuzberg boulevards, starts in the east, bridges the four-metre difference in ground level by means of a stairway, and suddenly ends in the west on reaching the underground lines.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"E\" id=\"q5-dropzone\" data-question=\"q5\">\n<span class=\"paragraph-label\">Paragraph E (Q18):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> North of the meadow, there is a large concrete slab with rounded edges. Being south-facing, this functions as a big sunny terrace, full of benches complete with footrests. In the south, the meadow overlooks Yorckstrasse, an underpass crossed by more than fifteen former railway bridges. To the east of the meadow there is quite a dense forest of pre-existing maples, oaks and birches, as well as newly planted trees of the same species. In this area, a couple of large metal frames each hold two swings. The edges of the park are finished with a collection of distinctive, functional spaces, for example a nursery, sports fields, concave surfaces for skateboards, stages for dancing, community gardens, or simply areas covered in gravel obtained from the site itself.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"F\" id=\"q6-dropzone\" data-question=\"q6\">\n<span class=\"paragraph-label\">Paragraph F (Q19):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> Although initially the regeneration of Gleisdreieck Park was the subject of disagreement between those who were in favour of safeguarding the railway heritage and those who wanted to regenerate the adjacent neighbourhoods, it was opened to the public in September 2011. The heart of Berlin now has a new green lung, in which the atmosphere of various small, very different corners fits neatly into a large-scale, wide-ranging and robust general order. This has been possible precisely because the intervention was not limited to conserving industrial remains in order to promote railway history. And as a reminder of the six decades of human absence, during which nature took over, the park has been able to conserve to some extent the spirit of the non-place that preceded it.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                <h4>Questions 14–19</h4>\n                <p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n                <p>Choose the correct heading for each paragraph from the list of headings below.</p>\n                <p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n                \n                <div class=\"headings-pool\" id=\"headings-pool-container\">\n                    <strong>List of Headings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i Objectives of the regeneration project</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Architectural details of the station buildings</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii Features and facilities of the completed development</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv The remains of a railway system</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v A positive evaluation of the finished project</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi A way of controlling development costs</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii Ways of crossing the site</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii Reasons why the area had become neglected</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 14–19</h4>\n<p>Reading Passage 2 has six paragraphs, <strong>A–F</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i Objectives of the regeneration project</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Architectural details of the station buildings</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii Features and facilities of the completed development</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv The remains of a railway system</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v A positive evaluation of the finished project</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi A way of controlling development costs</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii Ways of crossing the site</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii Reasons why the area had become neglected</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -47,7 +47,7 @@
         "q7",
         "q8"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-anchor\">\n                <h4>Questions 20–21</h4>\n                <p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n                <p>Which <strong>TWO</strong> reasons are given for the choice of Gleisdreieck as a site for a park?</p>\n                <div class=\"checkbox-options\" data-group=\"q7-8\" data-limit=\"2\">\n                    <label><input name=\"q7-8\" type=\"checkbox\" value=\"A\"><span><strong>A</strong> It was a habitat for some rare wildlife species.</span></label>\n                    <label><input name=\"q7-8\" type=\"checkbox\" value=\"B\"><span><strong>B</strong> It contained a particular tourist attraction.</span></label>\n                    <label><input name=\"q7-8\" type=\"checkbox\" value=\"C\"><span><strong>C</strong> It lay at the heart of the reunited city.</span></label>\n                    <label><input name=\"q7-8\" type=\"checkbox\" value=\"D\"><span><strong>D</strong> It was served by a major rail network.</span></label>\n                    <label><input name=\"q7-8\" type=\"checkbox\" value=\"E\"><span><strong>E</strong> It contained buildings which could be easily converted.</span></label>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-anchor\">\n<h4>Questions 20–21</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>Which <strong>TWO</strong> reasons are given for the choice of Gleisdreieck as a site for a park?</p>\n<div class=\"checkbox-options\" data-group=\"q7-8\" data-limit=\"2\">\n<label><input name=\"q7-8\" type=\"checkbox\" value=\"A\"><span><strong>A</strong> It was a habitat for some rare wildlife species.</span></label> <label><input name=\"q7-8\" type=\"checkbox\" value=\"B\"><span><strong>B</strong> It contained a particular tourist attraction.</span></label> <label><input name=\"q7-8\" type=\"checkbox\" value=\"C\"><span><strong>C</strong> It lay at the heart of the reunited city.</span></label> <label><input name=\"q7-8\" type=\"checkbox\" value=\"D\"><span><strong>D</strong> It was served by a major rail network.</span></label> <label><input name=\"q7-8\" type=\"checkbox\" value=\"E\"><span><strong>E</strong> It contained buildings which could be easily converted.</span></label>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -56,7 +56,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q9-10-anchor\">\n                <h4>Questions 22–23</h4>\n                <p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n                <p>Which <strong>TWO</strong> things did the State of Berlin hope to achieve with the Gleisdreieck development?</p>\n                <div class=\"checkbox-options\" data-group=\"q9-10\" data-limit=\"2\">\n                    <label><input name=\"q9-10\" type=\"checkbox\" value=\"A\"><span><strong>A</strong> to bring people of different ages together</span></label>\n                    <label><input name=\"q9-10\" type=\"checkbox\" value=\"B\"><span><strong>B</strong> to encourage tourism</span></label>\n                    <label><input name=\"q9-10\" type=\"checkbox\" value=\"C\"><span><strong>C</strong> to improve transport links</span></label>\n                    <label><input name=\"q9-10\" type=\"checkbox\" value=\"D\"><span><strong>D</strong> to preserve industrial remains</span></label>\n                    <label><input name=\"q9-10\" type=\"checkbox\" value=\"E\"><span><strong>E</strong> to generate income for the city</span></label>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q9-10-anchor\">\n<h4>Questions 22–23</h4>\n<p>Choose <strong>TWO</strong> letters, <strong>A–E</strong>.</p>\n<p>Which <strong>TWO</strong> things did the State of Berlin hope to achieve with the Gleisdreieck development?</p>\n<div class=\"checkbox-options\" data-group=\"q9-10\" data-limit=\"2\">\n<label><input name=\"q9-10\" type=\"checkbox\" value=\"A\"><span><strong>A</strong> to bring people of different ages together</span></label> <label><input name=\"q9-10\" type=\"checkbox\" value=\"B\"><span><strong>B</strong> to encourage tourism</span></label> <label><input name=\"q9-10\" type=\"checkbox\" value=\"C\"><span><strong>C</strong> to improve transport links</span></label> <label><input name=\"q9-10\" type=\"checkbox\" value=\"D\"><span><strong>D</strong> to preserve industrial remains</span></label> <label><input name=\"q9-10\" type=\"checkbox\" value=\"E\"><span><strong>E</strong> to generate income for the city</span></label>\n</div>\n</div>"
     },
     {
       "groupId": "group-4",
@@ -66,7 +66,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-anchor\">\n                 <h4>Questions 24–26</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                <div class=\"summary-completion\">\n                    <p>\n                    In the middle of the new park is a <strong>24</strong> <input type=\"text\" id=\"q24_input\" name=\"q11\">, where there is a path for pedestrians and two railway lines. A slow train uses these lines to make a regular journey between its base and a <strong>25</strong> <input type=\"text\" id=\"q25_input\" name=\"q12\">. Benches have been provided on the north side, so that people can relax and enjoy the sunshine, and to the east is an area with mature trees of various kinds, as well as sets of swings. A range of sports and leisure areas are situated around the <strong>26</strong> <input type=\"text\" id=\"q26_input\" name=\"q13\"> of the site.\n                    </p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-anchor\">\n<h4>Questions 24–26</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<p>\nIn the middle of the new park is a <strong>24</strong> <input type=\"text\" id=\"q24_input\" name=\"q11\">, where there is a path for pedestrians and two railway lines. A slow train uses these lines to make a regular journey between its base and a <strong>25</strong> <input type=\"text\" id=\"q25_input\" name=\"q12\">. Benches have been provided on the north side, so that people can relax and enjoy the sunshine, and to the east is an area with mature trees of various kinds, as well as sets of swings. A range of sports and leisure areas are situated around the <strong>26</strong> <input type=\"text\" id=\"q26_input\" name=\"q13\"> of the site.\n</p>\n</div>\n</div>"
     }
   ],
   "answerKey": {
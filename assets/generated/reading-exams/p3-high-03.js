@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>What makes a musical expert?</h3>\n            <h4>How does someone become expert in music?</h4>\n            <h4>And is it really possible to have a talent for music?</h4>\n            \n            <p>Does that class of people acknowledged to be musical experts just have more of the same basic skills we are all endowed with, or do they have a set of abilities — or neural structures — that are totally different from those of the rest of us? Are high levels of musical achievement simply the result of training and practice, or are they based on innate brain structure — what we refer to as talent? Talent can be defined as something that originates in genetic structures and that is identifiable by trained people who can recognize its existence before a person has achieved exceptional levels of performance. The emphasis on early identification means that to investigate it, we study the development of skills in children.</p>\n            <p>It is evident that some children acquire skills more rapidly than others: the age of onset for walking and talking varies widely, even between children in the same household. There may be genetic factors at work, but these are closely linked with other factors — with a presumably environmental component — such as motivation and family dynamics. Similar factors can influence musical development and can mask the contribution of genetics to musical ability.</p>\n            <p>Brain studies, so far, haven't been of much use in sorting out the issues. Gottfried Schlaug at Harvard collected brain scans of individuals with absolute pitch* (AP) and showed that a region in the brain called the planum temporale is larger in these people than in others. This suggests that the planum is involved in AP, but it's not clear if it starts out larger in people who eventually acquire AP, or if the acquisition of AP makes the planum increase in size.</p>\n            <p>Results of research into the areas of the brain involved in skilled motor movement are more conclusive. Studies of violin players have shown that the region of the brain responsible for controlling the movement of the left hand (the hand that requires greater precision in violin playing) increases in size as a result of practice. We do not know yet if the propensity for increase pre-exists in some people and not others.</p>\n            <p>The evidence against talent comes from research on how much training the experts do. Like experts in mathematics, chess, or sports, experts in music require lengthy periods of instruction and practice. In several studies, the very best music students were found to have practised more than twice as much as the others. In another study, students were secretly divided into two groups based on teachers' perceptions of their talent. Several years later, it was found that the students who achieved the highest performance ratings had practised the most, irrespective of which talent group they had been assigned to, suggesting that practice does not merely correlate with achievement, but causes it.</p>\n            <p>Anders Ericsson, at Florida State University, approaches the topic of musical expertise as a general problem in cognitive psychology. He takes as a starting point the assumption that there are certain issues involved in becoming an expert at anything; that we can learn about musical expertise by studying expert chess players, athletes, artists, mathematicians, as well as the musicians themselves. The emerging picture from such studies is that ten thousand hours of practice is required to achieve the level of mastery associated with being a world-class expert — in anything. In study after study, of composers, ice-skaters, concert pianists, chess players and master criminals, this number comes up again and again. Someone would do this amount of practice if they practised, for example, roughly 20 hours a week for ten years. Of course, this does not address why some people do not seem to get anywhere when they practise, and why some people get more out of their practice sessions than others. But no-one has yet found a case in which true world-class expertise was accomplished in less time. It seems that it takes the brain this long to assimilate all that it needs to know to achieve true mastery.</p>\n            <p>The ten-thousand-hour theory is consistent with what we know about how the brain learns. Learning requires the assimilation and consolidation of information in neural tissue. The more experiences we have with something, the stronger the memory/learning trace for that experience becomes. Although people differ in how long it takes them to consolidate information neurally, it remains true that increased practice leads to a greater number of neural traces, which create stronger memory representation.</p>\n            <p>The classic rebuttal to this theory goes something like this: What about Mozart? I hear that he composed his first symphony at the age of four! First, there is a factual error here: Mozart did not write it until he was eight. Still, this is unusual, to say the least. However, this early work received little acclaim and was not performed very often. In fact, the only reason we know about it is because the child who wrote it grew up to become Mozart. And Mozart had an expert teacher in his father, who was renowned as a teacher of musicians all over Europe. We do not know how much Mozart practised, but if he started at age two and worked thirty-two hours a week (quite possible, given that his father was a stern task-master) he would have made his ten thousand hours by the time he composed his first symphony. This does not mean that there are no genetic factors involved in Mozart's greatness, but that inborn traits may not be the only cause.</p>\n            \n            <p><em>*individuals with absolute pitch: people who can identify or sing any musical note correctly without help</em></p>\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>What makes a musical expert?</h3>\n<h4>How does someone become expert in music?</h4>\n<h4>And is it really possible to have a talent for music?</h4>\n<p>Does that class of people acknowledged to be musical experts just have more of the same basic skills we are all endowed with, or do they have a set of abilities — or neural structures — that are totally different from those of the rest of us? Are high levels of musical achievement simply the result of training and practice, or are they based on innate brain structure — what we refer to as talent? Talent can be defined as something that originates in genetic structures and that is identifiable by trained people who can recognize its existence before a person has achieved exceptional levels of performance. The emphasis on early identification means that to investigate it, we study the development of skills in children.</p>\n<p>It is evident that some children acquire skills more rapidly than others: the age of onset for walking and talking varies widely, even between children in the same household. There may be genetic factors at work, but these are closely linked with other factors — with a presumably environmental component — such as motivation and family dynamics. Similar factors can influence musical development and can mask the contribution of genetics to musical ability.</p>\n<p>Brain studies, so far, haven't been of much use in sorting out the issues. Gottfried Schlaug at Harvard collected brain scans of individuals with absolute pitch* (AP) and showed that a region in the brain called the planum temporale is larger in these people than in others. This suggests that the planum is involved in AP, but it's not clear if it starts out larger in people who eventually acquire AP, or if the acquisition of AP makes the planum increase in size.</p>\n<p>Results of research into the areas of the brain involved in skilled motor movement are more conclusive. Studies of violin players have shown that the region of the brain responsible for controlling the movement of the left hand (the hand that requires greater precision in violin playing) increases in size as a result of practice. We do not know yet if the propensity for increase pre-exists in some people and not others.</p>\n<p>The evidence against talent comes from research on how much training the experts do. Like experts in mathematics, chess, or sports, experts in music require lengthy periods of instruction and practice. In several studies, the very best music students were found to have practised more than twice as much as the others. In another study, students were secretly divided into two groups based on teachers' perceptions of their talent. Several years later, it was found that the students who achieved the highest performance ratings had practised the most, irrespective of which talent group they had been assigned to, suggesting that practice does not merely correlate with achievement, but causes it.</p>\n<p>Anders Ericsson, at Florida State University, approaches the topic of musical expertise as a general problem in cognitive psychology. He takes as a starting point the assumption that there are certain issues involved in becoming an expert at anything; that we can learn about musical expertise by studying expert chess players, athletes, artists, mathematicians, as well as the musicians themselves. The emerging picture from such studies is that ten thousand hours of practice is required to achieve the level of mastery associated with being a world-class expert — in anything. In study after study, of composers, ice-skaters, concert pianists, chess players and master criminals, this number comes up again and again. Someone would do this amount of practice if they practised, for example, roughly 20 hours a week for ten years. Of course, this does not address why some people do not seem to get anywhere when they practise, and why some people get more out of their practice sessions than others. But no-one has yet found a case in which true world-class expertise was accomplished in less time. It seems that it takes the brain this long to assimilate all that it needs to know to achieve true mastery.</p>\n<p>The ten-thousand-hour theory is consistent with what we know about how the brain learns. Learning requires the assimilation and consolidation of information in neural tissue. The more experiences we have with something, the stronger the memory/learning trace for that experience becomes. Although people differ in how long it takes them to consolidate information neurally, it remains true that increased practice leads to a greater number of neural traces, which create stronger memory representation.</p>\n<p>The classic rebuttal to this theory goes something like this: What about Mozart? I hear that he composed his first symphony at the age of four! First, there is a factual error here: Mozart did not write it until he was eight. Still, this is unusual, to say the least. However, this early work received little acclaim and was not performed very often. In fact, the only reason we know about it is because the child who wrote it grew up to become Mozart. And Mozart had an expert teacher in his father, who was renowned as a teacher of musicians all over Europe. We do not know how much Mozart practised, but if he started at age two and worked thirty-two hours a week (quite possible, given that his father was a stern task-master) he would have made his ten thousand hours by the time he composed his first symphony. This does not mean that there are no genetic factors involved in Mozart's greatness, but that inborn traits may not be the only cause.</p>\n<p><em>*individuals with absolute pitch: people who can identify or sing any musical note correctly without help</em></p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -34,7 +34,7 @@
         "q3",
         "q4"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n                <h4>Questions 27–30</h4>\n                <p>Choose the correct letter, A, B, C or D.</p>\n                \n                <div class=\"question-item\">\n                    <p><strong>27</strong> In the first paragraph, the writer suggests that a talented musician is someone</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"A\"> A who is aware of being set apart from other people.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"B\"> B whose brain structure is unlike that of other people.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"C\"> C who can perform extremely well in early childhood.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"D\"> D whose essential skills are more varied than those of ordinary people.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> According to the writer, what is unclear about the findings of Gottfried Schlaug?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"A\"> A which part of the brain is linked to a particular musical skill.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"B\"> B which type of musical skill leads to the greatest change in the brain.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"C\"> C whether a feature of the brain is a cause or an effect of a musical skill.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"D\"> D whether the acquisition of a musical skill is easier for some people than others.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> According to the writer, what has been established by studies of violin players?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"A\"> A Changes may occur in the brain following violin practice.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"B\"> B Left-handed violinists have a different brain structure from other people.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"C\"> C A violinist's hand size is not due to practice but to genetic factors.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"D\"> D Violinists are born with brains that have a particular structure.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> According to the writer, findings on the amount of practice done by expert musicians suggest that</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"A\"> A talent may have little to do with expertise.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"B\"> B practice may actually prevent the development of talent.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"C\"> C talent may not be recognised by teachers.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"D\"> D expertise may be related to quality of instruction.</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Choose the correct letter, A, B, C or D.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> In the first paragraph, the writer suggests that a talented musician is someone</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A who is aware of being set apart from other people.</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B whose brain structure is unlike that of other people.</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C who can perform extremely well in early childhood.</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D whose essential skills are more varied than those of ordinary people.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> According to the writer, what is unclear about the findings of Gottfried Schlaug?</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A which part of the brain is linked to a particular musical skill.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B which type of musical skill leads to the greatest change in the brain.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C whether a feature of the brain is a cause or an effect of a musical skill.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D whether the acquisition of a musical skill is easier for some people than others.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> According to the writer, what has been established by studies of violin players?</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A Changes may occur in the brain following violin practice.</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B Left-handed violinists have a different brain structure from other people.</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C A violinist's hand size is not due to practice but to genetic factors.</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D Violinists are born with brains that have a particular structure.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> According to the writer, findings on the amount of practice done by expert musicians suggest that</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A talent may have little to do with expertise.</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B practice may actually prevent the development of talent.</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C talent may not be recognised by teachers.</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D expertise may be related to quality of instruction.</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -48,7 +48,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-9-10-anchor\">\n                <h4>Questions 31–36</h4>\n                <p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n                <p>In boxes 31-36 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p><strong>31</strong> Anders Ericsson's work with cognitive psychology has influenced other researchers.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>32</strong> Different areas of expertise seem to have one specific thing in common.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> In order to be useful, practice must be carried out regularly every day.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>34</strong> Anyone who practises for long enough can reach the level of a world-class expert.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>35</strong> Occasionally, someone can become an expert at a global level with fewer than 10,000 hours' practice.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>36</strong> Existing knowledge of learning and cognitive skills supports the importance of practice.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-9-10-anchor\">\n<h4>Questions 31–36</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 31-36 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>31</strong> Anders Ericsson's work with cognitive psychology has influenced other researchers.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> Different areas of expertise seem to have one specific thing in common.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> In order to be useful, practice must be carried out regularly every day.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Anyone who practises for long enough can reach the level of a world-class expert.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Occasionally, someone can become an expert at a global level with fewer than 10,000 hours' practice.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> Existing knowledge of learning and cognitive skills supports the importance of practice.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n                <h4>Questions 37–40</h4>\n                <p>Complete the summary using the list of words, <strong>A-J</strong>, below.</p>\n                \n                <div class=\"summary-text\">\n                    <h5>Mozart</h5>\n                    <p>\n                    The case of Mozart could be quoted as evidence against the 10,000-hour practice theory. However, the writer points out that the young Mozart received a lot of <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span> from his father, and that the symphony he wrote at the age of <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> was not <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span> and may be of only academic interest. The case therefore supports the view that expertise is not solely the result of <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span> characteristics.\n                    </p>\n                </div>\n\n                <div class=\"options-pool\" id=\"word-options-pool\">\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A popular</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B artistic</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C completed</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D eight</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E tuition</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F encouragement</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G inherited</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"H\">H four</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"I\">I practice</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"J\">J two</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Complete the summary using the list of words, <strong>A-J</strong>, below.</p>\n<div class=\"summary-text\">\n<h5>Mozart</h5>\n<p>\nThe case of Mozart could be quoted as evidence against the 10,000-hour practice theory. However, the writer points out that the young Mozart received a lot of <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span> from his father, and that the symphony he wrote at the age of <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> was not <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span> and may be of only academic interest. The case therefore supports the view that expertise is not solely the result of <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span> characteristics.\n</p>\n</div>\n<div class=\"options-pool\" id=\"word-options-pool\">\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A popular</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B artistic</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C completed</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D eight</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E tuition</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F encouragement</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G inherited</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"H\">H four</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"I\">I practice</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"J\">J two</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false
     }
   ],
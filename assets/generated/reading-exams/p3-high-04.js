@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>Yawning</h2>\n            <p class=\"italic\" style=\"text-align: center;\">how and why we yawn still presents problems for researchers in an area<br>which has only recently been opened up to study.</p>\n            \n            <p>When Robert R. Provine began studying yawning in the 1960s, it was difficult for him to convince research students of the merits of 'yawning science'. Although it may appear quirky to some, Provine's decision to study yawning was a logical extension of his research in developmental neuroscience.</p>\n            <p>The verb <span class=\"italic\">to yawn</span> is derived from the Old English <span class=\"italic\">ganien</span> or <span class=\"italic\">ginian</span>, meaning to gape or open wide. But in addition to gaping jaws, yawning has significant features that are easy to observe and analyse. Provine ‘collected' yawns to study by using a variation of the contagion response*. He asked people to “think about yawning” and, once they began to yawn, to depress a button that would record from the start of the yawn to the exhalation at its end.</p>\n            <p>Provine's early discoveries can be summarized as follows: the yawn is highly stereotyped but not invariant in its duration and form. It is an excellent example of the instinctive fixed-action pattern of classical animal-behaviour study, or ethology. It is not a reflex (short-duration, rapid, proportional response to a simple stimulus), but, once started, a yawn progresses with the inevitability of a sneeze. The standard yawn runs its course over about six seconds on average, but its duration can range from about three seconds to much longer than the average. There are no half-yawns: this is an example of the typical intensity of fixed-action patterns and a reason why you cannot stifle yawns. Just like a cough, yawns can come in bouts with a highly variable inter-yawn interval, which is generally about 68 seconds but rarely more than 70. There is no relation between yawn frequency and duration: producers of short or long yawns do not compensate by yawning more or less often. Furthermore, Provine's hypotheses about the form and function of yawning can be tested by three informative yawn variants which can be used to look at the roles of the nose, the mouth and the jaws.</p>\n            \n            <h4>i The closed-nose yawn</h4>\n            <p>Subjects are asked to pinch their nose closed when they feel themselves start to yawn. Most subjects report being able to perform perfectly normal closed-nose yawns. This indicates that the inhalation at the onset of a yawn, and the exhalation at its end, need not involve the nostrils — the mouth provides a sufficient airway.</p>\n\n            <h4>ii The clenched-teeth yawn</h4>\n            <p>Subjects are asked to clench their teeth when they feel themselves start to yawn but allow themselves to inhale normally through their open lips and clenched teeth. This variant gives one the sensation of being stuck mid-yawn. This shows that gaping of the jaws is an essential component of the fixed-action pattern of the yawn, and unless it is accomplished, the programme will not run to completion. The yawn is also shown to be more than a deep breath, because, unlike normal breathing, inhalation and exhalation cannot be performed so well through the clenched teeth as through the nose.</p>\n\n            <h4>iii The nose yawn</h4>\n            <p>This variant tests the adequacy of the nasal airway to sustain a yawn. Unlike normal breathing, which can be performed equally well through mouth or nose, yawning is impossible via nasal inhalation alone. As with the clenched-teeth yawn, the nose yawn provides the unfulfilling sensation of being stuck in mid-yawn. Exhalation, on the other hand, can be accomplished equally well through nose or mouth. Through this methodology Provine demonstrated that inhalation through the oral airway and the gaping of jaws are necessary for normal yawns. The motor programme for yawning will not run to completion without feedback that these parts of the programme have been accomplished.</p>\n            \n            <p>But yawning is a powerful, generalised movement that involves much more than airway manoeuvres and jaw-gaping. When yawning you also stretch your facial muscles, tilt your head back, narrow or close your eyes, produce tears, salivate, open the Eustachian tubes of your middle ear and perform many other, yet unspecified, cardiovascular and respiratory acts. Perhaps the yawn shares components with other behaviour. For example, is the yawn a kind of 'slow sneeze', or is the sneeze a 'fast yawn'? Both share common respiratory and other features including jaw gaping, eye closing and head tilting.</p>\n            <p>Yawning and stretching share properties and may be performed together as parts of a global motor complex. Studies by J. I. P. de Vries <span class=\"italic\">et al.</span> in the early 1980s, charting movement in the developing foetus using ultrasound, observed a link between yawning and stretching. The most extraordinary demonstration of the yawn-stretch linkage occurs in many people paralysed on one side of their body because of brain damage caused by a stroke: the prominent British neurologist Sir Francis Walshe noted in 1923 that when these people yawn, they are startled and mystified to observe that their otherwise paralysed arm rises and flexes automatically in what neurologists term an 'associated response'. Yawning apparently activates undamaged, unconsciously controlled connections between the brain and the motor system, causing the paralysed limb to move. It is not known whether the associated response is a positive prognosis for recovery, nor whether yawning is therapeutic for prevention of muscular deterioration.</p>\n            <p>Provine speculated that, in general, yawning may have many functions, and selecting a single function from the available options may be an unrealistic goal. Yawning appears to be associated with a change of behavioural state, switching from one activity to another. Yawning is also a reminder that ancient and unconscious behaviour linking us to the animal world lurks beneath the veneer of culture, rationality and language.</p>\n            \n            <p style=\"font-size: 0.9em; color: var(--muted); border-top: 1px solid var(--line); padding-top: 10px; margin-top: 20px;\">*contagion response: the well-known tendency for yawns to trigger yawns in observers.</p>\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>Yawning</h2>\n<p class=\"italic\" style=\"text-align: center;\">how and why we yawn still presents problems for researchers in an area<br>which has only recently been opened up to study.</p>\n<p>When Robert R. Provine began studying yawning in the 1960s, it was difficult for him to convince research students of the merits of 'yawning science'. Although it may appear quirky to some, Provine's decision to study yawning was a logical extension of his research in developmental neuroscience.</p>\n<p>The verb <span class=\"italic\">to yawn</span> is derived from the Old English <span class=\"italic\">ganien</span> or <span class=\"italic\">ginian</span>, meaning to gape or open wide. But in addition to gaping jaws, yawning has significant features that are easy to observe and analyse. Provine ‘collected' yawns to study by using a variation of the contagion response*. He asked people to “think about yawning” and, once they began to yawn, to depress a button that would record from the start of the yawn to the exhalation at its end.</p>\n<p>Provine's early discoveries can be summarized as follows: the yawn is highly stereotyped but not invariant in its duration and form. It is an excellent example of the instinctive fixed-action pattern of classical animal-behaviour study, or ethology. It is not a reflex (short-duration, rapid, proportional response to a simple stimulus), but, once started, a yawn progresses with the inevitability of a sneeze. The standard yawn runs its course over about six seconds on average, but its duration can range from about three seconds to much longer than the average. There are no half-yawns: this is an example of the typical intensity of fixed-action patterns and a reason why you cannot stifle yawns. Just like a cough, yawns can come in bouts with a highly variable inter-yawn interval, which is generally about 68 seconds but rarely more than 70. There is no relation between yawn frequency and duration: producers of short or long yawns do not compensate by yawning more or less often. Furthermore, Provine's hypotheses about the form and function of yawning can be tested by three informative yawn variants which can be used to look at the roles of the nose, the mouth and the jaws.</p>\n<h4>i The closed-nose yawn</h4>\n<p>Subjects are asked to pinch their nose closed when they feel themselves start to yawn. Most subjects report being able to perform perfectly normal closed-nose yawns. This indicates that the inhalation at the onset of a yawn, and the exhalation at its end, need not involve the nostrils — the mouth provides a sufficient airway.</p>\n<h4>ii The clenched-teeth yawn</h4>\n<p>Subjects are asked to clench their teeth when they feel themselves start to yawn but allow themselves to inhale normally through their open lips and clenched teeth. This variant gives one the sensation of being stuck mid-yawn. This shows that gaping of the jaws is an essential component of the fixed-action pattern of the yawn, and unless it is accomplished, the programme will not run to completion. The yawn is also shown to be more than a deep breath, because, unlike normal breathing, inhalation and exhalation cannot be performed so well through the clenched teeth as through the nose.</p>\n<h4>iii The nose yawn</h4>\n<p>This variant tests the adequacy of the nasal airway to sustain a yawn. Unlike normal breathing, which can be performed equally well through mouth or nose, yawning is impossible via nasal inhalation alone. As with the clenched-teeth yawn, the nose yawn provides the unfulfilling sensation of being stuck in mid-yawn. Exhalation, on the other hand, can be accomplished equally well through nose or mouth. Through this methodology Provine demonstrated that inhalation through the oral airway and the gaping of jaws are necessary for normal yawns. The motor programme for yawning will not run to completion without feedback that these parts of the programme have been accomplished.</p>\n<p>But yawning is a powerful, generalised movement that involves much more than airway manoeuvres and jaw-gaping. When yawning you also stretch your facial muscles, tilt your head back, narrow or close your eyes, produce tears, salivate, open the Eustachian tubes of your middle ear and perform many other, yet unspecified, cardiovascular and respiratory acts. Perhaps the yawn shares components with other behaviour. For example, is the yawn a kind of 'slow sneeze', or is the sneeze a 'fast yawn'? Both share common respiratory and other features including jaw gaping, eye closing and head tilting.</p>\n<p>Yawning and stretching share properties and may be performed together as parts of a global motor complex. Studies by J. I. P. de Vries <span class=\"italic\">et al.</span> in the early 1980s, charting movement in the developing foetus using ultrasound, observed a link between yawning and stretching. The most extraordinary demonstration of the yawn-stretch linkage occurs in many people paralysed on one side of their body because of brain damage caused by a stroke: the prominent British neurologist Sir Francis Walshe noted in 1923 that when these people yawn, they are startled and mystified to observe that their otherwise paralysed arm rises and flexes automatically in what neurologists term an 'associated response'. Yawning apparently activates undamaged, unconsciously controlled connections between the brain and the motor system, causing the paralysed limb to move. It is not known whether the associated response is a positive prognosis for recovery, nor whether yawning is therapeutic for prevention of muscular deterioration.</p>\n<p>Provine speculated that, in general, yawning may have many functions, and selecting a single function from the available options may be an unrealistic goal. Yawning appears to be associated with a change of behavioural state, switching from one activity to another. Yawning is also a reminder that ancient and unconscious behaviour linking us to the animal world lurks beneath the veneer of culture, rationality and language.</p>\n<p style=\"font-size: 0.9em; color: var(--muted); border-top: 1px solid var(--line); padding-top: 10px; margin-top: 20px;\">*contagion response: the well-known tendency for yawns to trigger yawns in observers.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                <h4>Questions 27–32</h4>\n                <p>Complete the summary below using the list of words and phrases <strong>A–K</strong>.</p>\n                <div class=\"summary-text\">\n                    <h5>Provine's early findings on yawns</h5>\n                    <p>Through his observations of yawns, Provine was able to confirm that <strong>27</strong> <span id=\"q1-target\" class=\"drop-target-summary\" data-question=\"q1\"></span> do not exist.</p>\n                    <p>Just like a <strong>28</strong> <span id=\"q2-target\" class=\"drop-target-summary\" data-question=\"q2\"></span>, yawns cannot be interrupted after they have begun. This is because yawns occur as a <strong>29</strong> <span id=\"q3-target\" class=\"drop-target-summary\" data-question=\"q3\"></span> rather than a stimulus-response, as was previously thought.</p>\n                    <p>In measuring the time taken to yawn, Provine found that a typical yawn lasts about <strong>30</strong> <span id=\"q4-target\" class=\"drop-target-summary\" data-question=\"q4\"></span>. He also found that it is common for people to yawn a number of times in quick succession, with the yawns usually being around <strong>31</strong> <span id=\"q5-target\" class=\"drop-target-summary\" data-question=\"q5\"></span> apart. When studying whether length and rate were connected, Provine concluded that people who yawn less do not necessarily produce <strong>32</strong> <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> to make up for this.</p>\n                </div>\n                <div id=\"word-options\">\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A form and function</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B long yawns</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C 3 seconds</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D fixed-action pattern</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E 68 seconds</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F short yawns</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G reflex</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H sneeze</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I short duration</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"J\">J 6 seconds</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"K\">K half-yawns</div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p>Complete the summary below using the list of words and phrases <strong>A–K</strong>.</p>\n<div class=\"summary-text\">\n<h5>Provine's early findings on yawns</h5>\n<p>Through his observations of yawns, Provine was able to confirm that <strong>27</strong> <span id=\"q1-target\" class=\"drop-target-summary\" data-question=\"q1\"></span> do not exist.</p>\n<p>Just like a <strong>28</strong> <span id=\"q2-target\" class=\"drop-target-summary\" data-question=\"q2\"></span>, yawns cannot be interrupted after they have begun. This is because yawns occur as a <strong>29</strong> <span id=\"q3-target\" class=\"drop-target-summary\" data-question=\"q3\"></span> rather than a stimulus-response, as was previously thought.</p>\n<p>In measuring the time taken to yawn, Provine found that a typical yawn lasts about <strong>30</strong> <span id=\"q4-target\" class=\"drop-target-summary\" data-question=\"q4\"></span>. He also found that it is common for people to yawn a number of times in quick succession, with the yawns usually being around <strong>31</strong> <span id=\"q5-target\" class=\"drop-target-summary\" data-question=\"q5\"></span> apart. When studying whether length and rate were connected, Provine concluded that people who yawn less do not necessarily produce <strong>32</strong> <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> to make up for this.</p>\n</div>\n<div id=\"word-options\">\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A form and function</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B long yawns</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C 3 seconds</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D fixed-action pattern</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E 68 seconds</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F short yawns</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G reflex</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H sneeze</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I short duration</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"J\">J 6 seconds</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"K\">K half-yawns</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -49,7 +49,7 @@
         "q10",
         "q11"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-11-anchor\">\n                <h4>Questions 33–37</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> What did Provine conclude from his closed-nose yawn experiment?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"A\"> A Ending a yawn requires use of the nostrils</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"B\"> B You can yawn without breathing through your nose</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"C\"> C Breathing through the nose produces a silent yawn</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"D\"> D The role of the nose in yawning needs further investigation</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>34</strong> Provine's clenched-teeth yawn experiment shows that</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"A\"> A yawning is unconnected with fatigue</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"B\"> B a yawn is the equivalent of a deep intake of breath</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"C\"> C you have to be able to open your mouth wide to yawn</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"D\"> D breathing with the teeth together is as efficient as through the nose</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>35</strong> The nose-yawn experiment was used to test whether yawning</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"A\"> A can be stopped after it has started</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"B\"> B is the result of motor programming</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"C\"> C involves both inhalation and exhalation</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"D\"> D can be accomplished only through the nose</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>36</strong> In people paralysed on one side because of brain damage</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q10\" type=\"radio\" value=\"A\"> A yawning may involve only one side of the face</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"B\"> B the yawning response indicates that recovery is likely</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"C\"> C movement in the paralysed arm is stimulated by yawning</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"D\"> D yawning can be used as an exercise to prevent muscle wasting</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>37</strong> In the last paragraph, the writer concludes that</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q11\" type=\"radio\" value=\"A\"> A yawning is a sign of boredom</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"B\"> B we yawn in spite of the development of our species</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"C\"> C yawning is a more passive activity than we imagine</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"D\"> D we are stimulated to yawn when our brain activity is low</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-11-anchor\">\n<h4>Questions 33–37</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>33</strong> What did Provine conclude from his closed-nose yawn experiment?</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"> A Ending a yawn requires use of the nostrils</label> <label><input name=\"q7\" type=\"radio\" value=\"B\"> B You can yawn without breathing through your nose</label> <label><input name=\"q7\" type=\"radio\" value=\"C\"> C Breathing through the nose produces a silent yawn</label> <label><input name=\"q7\" type=\"radio\" value=\"D\"> D The role of the nose in yawning needs further investigation</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Provine's clenched-teeth yawn experiment shows that</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"> A yawning is unconnected with fatigue</label> <label><input name=\"q8\" type=\"radio\" value=\"B\"> B a yawn is the equivalent of a deep intake of breath</label> <label><input name=\"q8\" type=\"radio\" value=\"C\"> C you have to be able to open your mouth wide to yawn</label> <label><input name=\"q8\" type=\"radio\" value=\"D\"> D breathing with the teeth together is as efficient as through the nose</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> The nose-yawn experiment was used to test whether yawning</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"> A can be stopped after it has started</label> <label><input name=\"q9\" type=\"radio\" value=\"B\"> B is the result of motor programming</label> <label><input name=\"q9\" type=\"radio\" value=\"C\"> C involves both inhalation and exhalation</label> <label><input name=\"q9\" type=\"radio\" value=\"D\"> D can be accomplished only through the nose</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> In people paralysed on one side because of brain damage</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"> A yawning may involve only one side of the face</label> <label><input name=\"q10\" type=\"radio\" value=\"B\"> B the yawning response indicates that recovery is likely</label> <label><input name=\"q10\" type=\"radio\" value=\"C\"> C movement in the paralysed arm is stimulated by yawning</label> <label><input name=\"q10\" type=\"radio\" value=\"D\"> D yawning can be used as an exercise to prevent muscle wasting</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> In the last paragraph, the writer concludes that</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"> A yawning is a sign of boredom</label> <label><input name=\"q11\" type=\"radio\" value=\"B\"> B we yawn in spite of the development of our species</label> <label><input name=\"q11\" type=\"radio\" value=\"C\"> C yawning is a more passive activity than we imagine</label> <label><input name=\"q11\" type=\"radio\" value=\"D\"> D we are stimulated to yawn when our brain activity is low</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q12-13-14-anchor\">\n                <h4>Questions 38–40</h4>\n                <p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p><strong>38</strong> Research students were initially reluctant to appreciate the value of Provine's studies.</p>\n                    <div class=\"radio-options\" style=\"flex-direction: row;\">\n                        <label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>39</strong> When fetuses yawn and stretch, they are learning how to control movement.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row;\">\n                        <label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>40</strong> According to Provine, referring to only one function is probably inadequate to explain why people yawn.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row;\">\n                        <label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q12-13-14-anchor\">\n<h4>Questions 38–40</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>38</strong> Research students were initially reluctant to appreciate the value of Provine's studies.</p>\n<div class=\"radio-options\" style=\"flex-direction: row;\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> When fetuses yawn and stretch, they are learning how to control movement.</p>\n<div class=\"radio-options\" style=\"flex-direction: row;\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> According to Provine, referring to only one function is probably inadequate to explain why people yawn.</p>\n<div class=\"radio-options\" style=\"flex-direction: row;\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>Whale Culture</h2>\n            \n            <p><strong>A</strong> Most social scientists stubbornly resist the idea that animals have culture. Even such advanced cetacean mammals as whales and dolphins clearly don't have art, literature, or architecture. But patient observation over many years has begun to reveal behaviours that can only be learnt from other whales. And that, say whale biologists, constitutes culture.</p>\n            <p><strong>B</strong> So far, humpback and killer whales provide the best evidence of culture in cetaceans, and the song of the male humpback is among the most striking examples. Humpback populations in different oceans sing different songs, but within the same ocean they all stick to the same one. However, during the breeding season the sounds change, as it appears that females are drawn to novel songs. One male might add an extra set of groans; another might drop a series of grunts. Soon all the other males have altered their own rendition to incorporate the changes until they are once again singing the same song. Since this occurs among thousands of whales spread across a vast part of the planet, the change cannot be in response to any factor in the animal's environment. The latest version of the song can be learnt only from other whales – almost certainly by imitation.</p>\n            <p><strong>C</strong> Culture plays an even bigger part in the life of killer whales. Nowhere is this more obvious than along the north-west coast of America, where killer whales are split into two distinct populations – 'residents' and 'transients'. They live in the same stretch of water, but they don't mingle. In effect, they belong to two quite separate cultures. Residents live in stable groups, or ‘pods', made up of two or three mothers and their offspring - perhaps 20 whales in all. Calves stay with their mothers throughout adulthood, and in many years of observation no one has ever seen a whale switch pods. Transients travel in smaller, more changeable groups of between three and six.</p>\n            <p><strong>D</strong> One of the most obvious distinctions between the transient and resident societies is the way they impart information. Killer whales detect prey with a range of echo-locating clicks, but converse with a vocabulary of squeaks, whistles and whines. Transients have only a few such calls, and all transient societies share the same ones. Residents have a much more extensive repertoire, and each family group has its own unique and distinctive set of calls. Despite regular interaction between them, each resident pod sticks firmly to its own dialect. Research shows these dialects are maintained for at least 40 years.</p>\n            <p><strong>E</strong> To qualify as part of killer whale culture, dialects must be learnt from other members of the pod. Animals with different dialects share the same waters, so the variation can't be a product of physical environment. ‘And we can throw out the notion that dialects are inherited,' says Lance Barrett-Lennard of the University of British Columbia. He has spent the past seven years analysing DNA from 270 whales. His paternity tests reveal that female killer whales invariably attract mates from outside their own pod – males with a very different dialect. If dialects were programmed by genetics, call patterns from both father and mother would be passed on to the calf. ‘A calf uses the calls of its maternal pod very precisely. There's no input from the father,' says Barrett-Lennard.</p>\n            <p><strong>F</strong> The question still remains – is this culture? It is, according to Frans de Waal of Emory University in Atlanta, who argues that culture is just another biological adaptation that has evolved in many creatures. One benefit of viewing culture in this way is that you can start to understand how and why it might have arisen in these creatures. Whales have several biological attributes that give them an advantage in social learning. Apart from their advanced mental abilities, they are adept at recognising sounds: ideal for communicating in the marine environment. Many species spend years rearing their offspring, and live in small, stable, multi-generational societies, a social system that provides ample opportunity for teaching and learning.</p>\n            <p><strong>G</strong> But why have cetaceans evolved the ability to learn from other group members? Experts in whale biology believe that ecological factors and the need to adapt to sudden changes in the environment played a large part in the emergence of culture. Although the ocean is a relatively stable habitat in many ways, it is highly changeable in one crucial respect – the availability of food. One moment there might be a plentiful supply of fish, the next they've disappeared. When that happens, the past experience of senior members of the group – and the ability to share this knowledge – is a huge asset. The dialects of killer whales allow members of the group to identify each other, enabling them to share information about food hot spots. Among resident killer whales, it also allows females to avoid inbreeding by picking out a mate with a strange dialect from outside their pod, says Barrett-Lennard.</p>\n            <p><strong>H</strong> The importance of sharing information seems to have led to biological changes in at least some species of whale. Female killer whales, like humans, are very unusual in that they live up to a quarter of a century after they have had their descendants. And what whale matriarchs offer is the most important thing of all – cultural knowledge, vital for the group's survival, passed directly from one generation to the next.</p>\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>Whale Culture</h2>\n<p><strong>A</strong> Most social scientists stubbornly resist the idea that animals have culture. Even such advanced cetacean mammals as whales and dolphins clearly don't have art, literature, or architecture. But patient observation over many years has begun to reveal behaviours that can only be learnt from other whales. And that, say whale biologists, constitutes culture.</p>\n<p><strong>B</strong> So far, humpback and killer whales provide the best evidence of culture in cetaceans, and the song of the male humpback is among the most striking examples. Humpback populations in different oceans sing different songs, but within the same ocean they all stick to the same one. However, during the breeding season the sounds change, as it appears that females are drawn to novel songs. One male might add an extra set of groans; another might drop a series of grunts. Soon all the other males have altered their own rendition to incorporate the changes until they are once again singing the same song. Since this occurs among thousands of whales spread across a vast part of the planet, the change cannot be in response to any factor in the animal's environment. The latest version of the song can be learnt only from other whales – almost certainly by imitation.</p>\n<p><strong>C</strong> Culture plays an even bigger part in the life of killer whales. Nowhere is this more obvious than along the north-west coast of America, where killer whales are split into two distinct populations – 'residents' and 'transients'. They live in the same stretch of water, but they don't mingle. In effect, they belong to two quite separate cultures. Residents live in stable groups, or ‘pods', made up of two or three mothers and their offspring - perhaps 20 whales in all. Calves stay with their mothers throughout adulthood, and in many years of observation no one has ever seen a whale switch pods. Transients travel in smaller, more changeable groups of between three and six.</p>\n<p><strong>D</strong> One of the most obvious distinctions between the transient and resident societies is the way they impart information. Killer whales detect prey with a range of echo-locating clicks, but converse with a vocabulary of squeaks, whistles and whines. Transients have only a few such calls, and all transient societies share the same ones. Residents have a much more extensive repertoire, and each family group has its own unique and distinctive set of calls. Despite regular interaction between them, each resident pod sticks firmly to its own dialect. Research shows these dialects are maintained for at least 40 years.</p>\n<p><strong>E</strong> To qualify as part of killer whale culture, dialects must be learnt from other members of the pod. Animals with different dialects share the same waters, so the variation can't be a product of physical environment. ‘And we can throw out the notion that dialects are inherited,' says Lance Barrett-Lennard of the University of British Columbia. He has spent the past seven years analysing DNA from 270 whales. His paternity tests reveal that female killer whales invariably attract mates from outside their own pod – males with a very different dialect. If dialects were programmed by genetics, call patterns from both father and mother would be passed on to the calf. ‘A calf uses the calls of its maternal pod very precisely. There's no input from the father,' says Barrett-Lennard.</p>\n<p><strong>F</strong> The question still remains – is this culture? It is, according to Frans de Waal of Emory University in Atlanta, who argues that culture is just another biological adaptation that has evolved in many creatures. One benefit of viewing culture in this way is that you can start to understand how and why it might have arisen in these creatures. Whales have several biological attributes that give them an advantage in social learning. Apart from their advanced mental abilities, they are adept at recognising sounds: ideal for communicating in the marine environment. Many species spend years rearing their offspring, and live in small, stable, multi-generational societies, a social system that provides ample opportunity for teaching and learning.</p>\n<p><strong>G</strong> But why have cetaceans evolved the ability to learn from other group members? Experts in whale biology believe that ecological factors and the need to adapt to sudden changes in the environment played a large part in the emergence of culture. Although the ocean is a relatively stable habitat in many ways, it is highly changeable in one crucial respect – the availability of food. One moment there might be a plentiful supply of fish, the next they've disappeared. When that happens, the past experience of senior members of the group – and the ability to share this knowledge – is a huge asset. The dialects of killer whales allow members of the group to identify each other, enabling them to share information about food hot spots. Among resident killer whales, it also allows females to avoid inbreeding by picking out a mate with a strange dialect from outside their pod, says Barrett-Lennard.</p>\n<p><strong>H</strong> The importance of sharing information seems to have led to biological changes in at least some species of whale. Female killer whales, like humans, are very unusual in that they live up to a quarter of a century after they have had their descendants. And what whale matriarchs offer is the most important thing of all – cultural knowledge, vital for the group's survival, passed directly from one generation to the next.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 27–31</h4>\n                <p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n                <p>In boxes 27–31 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                \n                <div class=\"question-item\">\n                    <p><strong>27</strong> Resident killer whales appear to remain with their maternal group for life.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> Resident killer whales have a more restricted range of calls than transients.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> There is a vocabulary of sounds which is common to all transient killer whales.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> Resident killer whales share the dialects of other resident communities living in the same waters.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>31</strong> The dialects of transient killer whales remain constant over time.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<p>In boxes 27–31 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> Resident killer whales appear to remain with their maternal group for life.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Resident killer whales have a more restricted range of calls than transients.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> There is a vocabulary of sounds which is common to all transient killer whales.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Resident killer whales share the dialects of other resident communities living in the same waters.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> The dialects of transient killer whales remain constant over time.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -46,7 +46,7 @@
         "q7",
         "q8"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-anchor\">\n                <h4>Questions 32–34</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n                \n                <div class=\"summary-completion\">\n                    <p>It has been observed that resident killer whales invariably live in fixed family groups, known as <strong>32</strong> <input type=\"text\" id=\"q32_input\" name=\"q6\">. Each of these has its own unique set of calls, despite close contact with other family groups. As the same areas of ocean contain many different groups with widely varying dialects, it is clear that these differences could not have emerged as a result of the whales' <strong>33</strong> <input type=\"text\" id=\"q33_input\" name=\"q7\">.</p>\n                    <p>According to tests conducted by Lance Barrett-Lennard, a calf communicates exclusively with the dialect of the group to which its <strong>34</strong> <input type=\"text\" id=\"q34_input\" name=\"q8\"> belongs. Barrett-Lennard also rejects the idea that the call patterns are inherited.</p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-anchor\">\n<h4>Questions 32–34</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<p>It has been observed that resident killer whales invariably live in fixed family groups, known as <strong>32</strong> <input type=\"text\" id=\"q32_input\" name=\"q6\">. Each of these has its own unique set of calls, despite close contact with other family groups. As the same areas of ocean contain many different groups with widely varying dialects, it is clear that these differences could not have emerged as a result of the whales' <strong>33</strong> <input type=\"text\" id=\"q33_input\" name=\"q7\">.</p>\n<p>According to tests conducted by Lance Barrett-Lennard, a calf communicates exclusively with the dialect of the group to which its <strong>34</strong> <input type=\"text\" id=\"q34_input\" name=\"q8\"> belongs. Barrett-Lennard also rejects the idea that the call patterns are inherited.</p>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -56,7 +56,7 @@
         "q10",
         "q11"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q9-10-11-anchor\">\n                <h4>Questions 35–37</h4>\n                <p>Choose <strong>THREE</strong> letters, <strong>A–F</strong>.</p>\n                <p>Which <strong>THREE</strong> of the following features of whales are mentioned in the passage?</p>\n                <div class=\"checkbox-options\" style=\"flex-direction: column; align-items: flex-start; gap: 10px;\">\n                    <label><input type=\"checkbox\" name=\"q9-10-11\" value=\"A\"> <strong>A</strong> intelligence</label>\n                    <label><input type=\"checkbox\" name=\"q9-10-11\" value=\"B\"> <strong>B</strong> physical strength</label>\n                    <label><input type=\"checkbox\" name=\"q9-10-11\" value=\"C\"> <strong>C</strong> sensitivity to sound</label>\n                    <label><input type=\"checkbox\" name=\"q9-10-11\" value=\"D\"> <strong>D</strong> prolonged life span</label>\n                    <label><input type=\"checkbox\" name=\"q9-10-11\" value=\"E\"> <strong>E</strong> lengthy period of fertility</label>\n                    <label><input type=\"checkbox\" name=\"q9-10-11\" value=\"F\"> <strong>F</strong> adaptability to a variety of foods</label>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q9-10-11-anchor\">\n<h4>Questions 35–37</h4>\n<p>Choose <strong>THREE</strong> letters, <strong>A–F</strong>.</p>\n<p>Which <strong>THREE</strong> of the following features of whales are mentioned in the passage?</p>\n<div class=\"checkbox-options\" style=\"flex-direction: column; align-items: flex-start; gap: 10px;\">\n<label><input type=\"checkbox\" name=\"q9-10-11\" value=\"A\"> <strong>A</strong> intelligence</label> <label><input type=\"checkbox\" name=\"q9-10-11\" value=\"B\"> <strong>B</strong> physical strength</label> <label><input type=\"checkbox\" name=\"q9-10-11\" value=\"C\"> <strong>C</strong> sensitivity to sound</label> <label><input type=\"checkbox\" name=\"q9-10-11\" value=\"D\"> <strong>D</strong> prolonged life span</label> <label><input type=\"checkbox\" name=\"q9-10-11\" value=\"E\"> <strong>E</strong> lengthy period of fertility</label> <label><input type=\"checkbox\" name=\"q9-10-11\" value=\"F\"> <strong>F</strong> adaptability to a variety of foods</label>\n</div>\n</div>"
     },
     {
       "groupId": "group-4",
@@ -66,7 +66,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q12-13-14-anchor\">\n                 <h4>Questions 38–40</h4>\n                <p>Reading Passage 3 has eight paragraphs, <strong>A–H</strong>.</p>\n                <p>Which paragraph contains the following information?</p>\n                <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                        <thead>\n                            <tr>\n                                <th style=\"min-width: 200px;\"></th>\n                                <th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>38</strong> an example of the kind of information passed by whales to each other</td>\n                                <td><input type=\"radio\" name=\"q12\" value=\"A\"></td><td><input type=\"radio\" name=\"q12\" value=\"B\"></td><td><input type=\"radio\" name=\"q12\" value=\"C\"></td><td><input type=\"radio\" name=\"q12\" value=\"D\"></td><td><input type=\"radio\" name=\"q12\" value=\"E\"></td><td><input type=\"radio\" name=\"q12\" value=\"F\"></td><td><input type=\"radio\" name=\"q12\" value=\"G\"></td><td><input type=\"radio\" name=\"q12\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>39</strong> a reference to variations in communication styles between different cultures within one species</td>\n                                <td><input type=\"radio\" name=\"q13\" value=\"A\"></td><td><input type=\"radio\" name=\"q13\" value=\"B\"></td><td><input type=\"radio\" name=\"q13\" value=\"C\"></td><td><input type=\"radio\" name=\"q13\" value=\"D\"></td><td><input type=\"radio\" name=\"q13\" value=\"E\"></td><td><input type=\"radio\" name=\"q13\" value=\"F\"></td><td><input type=\"radio\" name=\"q13\" value=\"G\"></td><td><input type=\"radio\" name=\"q13\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>40</strong> ways in which the skills of whales are favourable for the development of culture</td>\n                                <td><input type=\"radio\" name=\"q14\" value=\"A\"></td><td><input type=\"radio\" name=\"q14\" value=\"B\"></td><td><input type=\"radio\" name=\"q14\" value=\"C\"></td><td><input type=\"radio\" name=\"q14\" value=\"D\"></td><td><input type=\"radio\" name=\"q14\" value=\"E\"></td><td><input type=\"radio\" name=\"q14\" value=\"F\"></td><td><input type=\"radio\" name=\"q14\" value=\"G\"></td><td><input type=\"radio\" name=\"q14\" value=\"H\"></td>\n                            </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q12-13-14-anchor\">\n<h4>Questions 38–40</h4>\n<p>Reading Passage 3 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 200px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>38</strong> an example of the kind of information passed by whales to each other</td>\n<td><input type=\"radio\" name=\"q12\" value=\"A\"></td><td><input type=\"radio\" name=\"q12\" value=\"B\"></td><td><input type=\"radio\" name=\"q12\" value=\"C\"></td><td><input type=\"radio\" name=\"q12\" value=\"D\"></td><td><input type=\"radio\" name=\"q12\" value=\"E\"></td><td><input type=\"radio\" name=\"q12\" value=\"F\"></td><td><input type=\"radio\" name=\"q12\" value=\"G\"></td><td><input type=\"radio\" name=\"q12\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>39</strong> a reference to variations in communication styles between different cultures within one species</td>\n<td><input type=\"radio\" name=\"q13\" value=\"A\"></td><td><input type=\"radio\" name=\"q13\" value=\"B\"></td><td><input type=\"radio\" name=\"q13\" value=\"C\"></td><td><input type=\"radio\" name=\"q13\" value=\"D\"></td><td><input type=\"radio\" name=\"q13\" value=\"E\"></td><td><input type=\"radio\" name=\"q13\" value=\"F\"></td><td><input type=\"radio\" name=\"q13\" value=\"G\"></td><td><input type=\"radio\" name=\"q13\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>40</strong> ways in which the skills of whales are favourable for the development of culture</td>\n<td><input type=\"radio\" name=\"q14\" value=\"A\"></td><td><input type=\"radio\" name=\"q14\" value=\"B\"></td><td><input type=\"radio\" name=\"q14\" value=\"C\"></td><td><input type=\"radio\" name=\"q14\" value=\"D\"></td><td><input type=\"radio\" name=\"q14\" value=\"E\"></td><td><input type=\"radio\" name=\"q14\" value=\"F\"></td><td><input type=\"radio\" name=\"q14\" value=\"G\"></td><td><input type=\"radio\" name=\"q14\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>A closer examination of a study on verbal and non-verbal messages</h3>\n            <p><i>A study of non-verbal communication carried out in 1967 continues to be widely quoted today. David Lapakko looks at limitations in the original study.</i></p>\n\n            <h4>Description of the Study</h4>\n            <p>The findings of a study on verbal and non-verbal messages in communication by Albert Mehrabian and his colleagues at UCLA in 1967 have been quoted so frequently that they are now often regarded as a self-evident truth.</p>\n            <p>In the first experiment, subjects were asked to listen to a recording of a female saying the word “maybe” in three tones of voice to convey liking, neutrality, and disliking. The subjects were then shown photos of female faces expressing the same three emotions and were asked to guess the emotions in the recorded voice and the photos. It was found that the photos received more accurate responses than the voices. In the second experiment, subjects listened to nine recorded words spoken in different tones of voice. Three words had positive meanings (e.g. honey), three were neutral (e.g. oh), and three were negative (e.g. terrible). Again, the subjects had to guess the speaker's emotions. It was found that tone of voice carried more meaning than the individual words. From these experiments the researchers concluded that 7% of our feeling towards a speaker is based on the actual words they use, 38% on their tone of voice, and 55% on their body language (e.g. facial expression).</p>\n\n            <h4>Methodological Issues</h4>\n            <p>However, a closer look at the study reveals several limitations. The first is that the entire study involved only 62 subjects. Of these, 25 were used to select the word for the first experiment, while the key issue – comparing verbal and non-verbal communication – was determined by only the 37 remaining subjects. All were female undergraduates who participated as part of their introductory psychology course, and their ages and academic qualifications seem remarkably uniform. Thus, the findings may simply be a product of the nature of the sample.</p>\n            <p>Critics have also pointed out that the 7–38–55 formula is flawed since it was pieced together from two different experiments, neither of which involved all three channels (verbal, vocal, and facial). In addition, in the first experiment the single word “maybe” was used throughout so it was impossible for the effects of changes in verbal input to be assessed. The researchers intentionally used a \"neutral” word so naturally the subjects found little meaning there. Clearly, such a methodology lacks validity. In the real world, people communicate in a particular context and speak in phrases and full-blown sentences, making extensive use of the multi-faceted vehicle of language.</p>\n            <p>My concern is that interpretations of this study have gained such prominence in our pedagogical literature. This 7–38–55 formula appears in many basic texts, used for training in public speaking, interpersonal communication, and organizational communication.</p>\n\n            <h4>Lessons to consider</h4>\n            <p>Clearly, one appealing aspect of the Mehrabian study is its numerical precision. Communication is a complex phenomenon, but it seems less so when we can rely on these three magical numbers. In contrast to the ambiguities of language, numbers seem to possess exactness. And the popular appeal of the study has given the 7–38–55 formula enormous credibility. There is a certain mystique about non-verbal communication, and the continued references to this research sustain it, encouraging people to believe in the overwhelming importance of the non-verbal message compared with the verbal one. Yet we know that even one ill-chosen word to a colleague or friend can make or break a communicative effort. Words do matter. Bradley (1991), one of the few textbook writers to criticize the Mehrabian study, makes the same point when he observes, “If we could communicate 93% of information and attitudes with vocal and facial cues, it would be wasteful to spend time learning a language.”</p>\n            <p>Mehrabian himself believes his research should not be interpreted to devalue the role of language in communication, saying: “Please remember that all my findings... dealt with communications of feelings and attitudes... it is absurd to imply or suggest that the verbal portion of all communication constitutes only 7% of the message... anytime we communicate abstract relationships (e.g., x = y – the square of z) clearly 100% of the entire communication is verbal.” (Mehrabian, 1995)</p>\n            <p>To be fair, many textbook writers attempt to be faithful to the context of Mehrabian's research. For example, Stewart and D'Angelo (1988) write: “Mehrabian argues that when we're uncertain about what someone's feeling, or about how much we like him or her, we rely... only 7% on the words that are spoken.” Others try to play down the specific percentages, saying that an understanding of the general importance of non-verbal cues is more important. Nonetheless, other textbook authors simply use the numbers without placing any limits on their meaning.</p>\n\n            <h4>Conclusion</h4>\n            <p>Since this relatively small study was first published it has achieved an influence far beyond its intended scope. We need to put it into its proper perspective and learn some important lessons from it regarding social science research, communication pedagogy, and the forces which have created widespread misunderstanding about communication.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>A closer examination of a study on verbal and non-verbal messages</h3>\n<p><i>A study of non-verbal communication carried out in 1967 continues to be widely quoted today. David Lapakko looks at limitations in the original study.</i></p>\n<h4>Description of the Study</h4>\n<p>The findings of a study on verbal and non-verbal messages in communication by Albert Mehrabian and his colleagues at UCLA in 1967 have been quoted so frequently that they are now often regarded as a self-evident truth.</p>\n<p>In the first experiment, subjects were asked to listen to a recording of a female saying the word “maybe” in three tones of voice to convey liking, neutrality, and disliking. The subjects were then shown photos of female faces expressing the same three emotions and were asked to guess the emotions in the recorded voice and the photos. It was found that the photos received more accurate responses than the voices. In the second experiment, subjects listened to nine recorded words spoken in different tones of voice. Three words had positive meanings (e.g. honey), three were neutral (e.g. oh), and three were negative (e.g. terrible). Again, the subjects had to guess the speaker's emotions. It was found that tone of voice carried more meaning than the individual words. From these experiments the researchers concluded that 7% of our feeling towards a speaker is based on the actual words they use, 38% on their tone of voice, and 55% on their body language (e.g. facial expression).</p>\n<h4>Methodological Issues</h4>\n<p>However, a closer look at the study reveals several limitations. The first is that the entire study involved only 62 subjects. Of these, 25 were used to select the word for the first experiment, while the key issue – comparing verbal and non-verbal communication – was determined by only the 37 remaining subjects. All were female undergraduates who participated as part of their introductory psychology course, and their ages and academic qualifications seem remarkably uniform. Thus, the findings may simply be a product of the nature of the sample.</p>\n<p>Critics have also pointed out that the 7–38–55 formula is flawed since it was pieced together from two different experiments, neither of which involved all three channels (verbal, vocal, and facial). In addition, in the first experiment the single word “maybe” was used throughout so it was impossible for the effects of changes in verbal input to be assessed. The researchers intentionally used a \"neutral” word so naturally the subjects found little meaning there. Clearly, such a methodology lacks validity. In the real world, people communicate in a particular context and speak in phrases and full-blown sentences, making extensive use of the multi-faceted vehicle of language.</p>\n<p>My concern is that interpretations of this study have gained such prominence in our pedagogical literature. This 7–38–55 formula appears in many basic texts, used for training in public speaking, interpersonal communication, and organizational communication.</p>\n<h4>Lessons to consider</h4>\n<p>Clearly, one appealing aspect of the Mehrabian study is its numerical precision. Communication is a complex phenomenon, but it seems less so when we can rely on these three magical numbers. In contrast to the ambiguities of language, numbers seem to possess exactness. And the popular appeal of the study has given the 7–38–55 formula enormous credibility. There is a certain mystique about non-verbal communication, and the continued references to this research sustain it, encouraging people to believe in the overwhelming importance of the non-verbal message compared with the verbal one. Yet we know that even one ill-chosen word to a colleague or friend can make or break a communicative effort. Words do matter. Bradley (1991), one of the few textbook writers to criticize the Mehrabian study, makes the same point when he observes, “If we could communicate 93% of information and attitudes with vocal and facial cues, it would be wasteful to spend time learning a language.”</p>\n<p>Mehrabian himself believes his research should not be interpreted to devalue the role of language in communication, saying: “Please remember that all my findings... dealt with communications of feelings and attitudes... it is absurd to imply or suggest that the verbal portion of all communication constitutes only 7% of the message... anytime we communicate abstract relationships (e.g., x = y – the square of z) clearly 100% of the entire communication is verbal.” (Mehrabian, 1995)</p>\n<p>To be fair, many textbook writers attempt to be faithful to the context of Mehrabian's research. For example, Stewart and D'Angelo (1988) write: “Mehrabian argues that when we're uncertain about what someone's feeling, or about how much we like him or her, we rely... only 7% on the words that are spoken.” Others try to play down the specific percentages, saying that an understanding of the general importance of non-verbal cues is more important. Nonetheless, other textbook authors simply use the numbers without placing any limits on their meaning.</p>\n<h4>Conclusion</h4>\n<p>Since this relatively small study was first published it has achieved an influence far beyond its intended scope. We need to put it into its proper perspective and learn some important lessons from it regarding social science research, communication pedagogy, and the forces which have created widespread misunderstanding about communication.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -34,7 +34,7 @@
         "q3",
         "q4"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n                <h4>Questions 27–30</h4>\n                <p>Complete the summary using the list of words and phrases, A–H, below.</p>\n                <div class=\"summary-text\">\n                    <h5>Mehrabian's 1967 study</h5>\n                    <p>\n                    Albert Mehrabian and his colleagues carried out an influential study comparing the <strong>27</strong> <span id=\"q1-target\" class=\"drop-target-summary\" data-question=\"q1\"></span> of verbal and non-verbal communication. This involved two experiments. In both experiments, subjects had to identify the <strong>28</strong> <span id=\"q2-target\" class=\"drop-target-summary\" data-question=\"q2\"></span> being communicated by other people. The two main areas focused on in the first experiment were voice tones and <strong>29</strong> <span id=\"q3-target\" class=\"drop-target-summary\" data-question=\"q3\"></span>, while the second focused mainly on voice tones and <strong>30</strong> <span id=\"q4-target\" class=\"drop-target-summary\" data-question=\"q4\"></span>.\n                    </p>\n                </div>\n                <div id=\"word-options\">\n                    <div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A facial expressions</div>\n                    <div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B purposes</div>\n                    <div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C printed words</div>\n                    <div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D effects</div>\n                    <div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E word meanings</div>\n                    <div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F gender differences</div>\n                    <div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G feelings</div>\n                    <div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H characteristics</div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Complete the summary using the list of words and phrases, A–H, below.</p>\n<div class=\"summary-text\">\n<h5>Mehrabian's 1967 study</h5>\n<p>\nAlbert Mehrabian and his colleagues carried out an influential study comparing the <strong>27</strong> <span id=\"q1-target\" class=\"drop-target-summary\" data-question=\"q1\"></span> of verbal and non-verbal communication. This involved two experiments. In both experiments, subjects had to identify the <strong>28</strong> <span id=\"q2-target\" class=\"drop-target-summary\" data-question=\"q2\"></span> being communicated by other people. The two main areas focused on in the first experiment were voice tones and <strong>29</strong> <span id=\"q3-target\" class=\"drop-target-summary\" data-question=\"q3\"></span>, while the second focused mainly on voice tones and <strong>30</strong> <span id=\"q4-target\" class=\"drop-target-summary\" data-question=\"q4\"></span>.\n</p>\n</div>\n<div id=\"word-options\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A facial expressions</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B purposes</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C printed words</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D effects</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E word meanings</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F gender differences</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G feelings</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H characteristics</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n                <h4>Questions 31–35</h4>\n                <p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n                <p>In boxes 31–35 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                \n                <div class=\"question-item\">\n                    <p><strong>31</strong> One limitation of the study was that there were too few subjects involved.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>32</strong> The fact that the subjects in the study came from a similar background was an advantage.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> The two experiments should have been carried out in a different order.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>34</strong> The researchers' choice of a neutral word was helpful in the context of the study.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>35</strong> The study would have been more valid if it had included a range of languages.</p>\n                     <div class=\"radio-options\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n<h4>Questions 31–35</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<p>In boxes 31–35 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>31</strong> One limitation of the study was that there were too few subjects involved.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> The fact that the subjects in the study came from a similar background was an advantage.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> The two experiments should have been carried out in a different order.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> The researchers' choice of a neutral word was helpful in the context of the study.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> The study would have been more valid if it had included a range of languages.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n                 <h4>Questions 36–40</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>36</strong> What does the writer say about the “numerical precision” of Mehrabian's study?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q10\" type=\"radio\" value=\"A\"> A It makes the claims more attractive.</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"B\"> B It is the strongest point of the study.</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"C\"> C It will appeal to superstitious people.</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"D\"> D It allows comparison between languages.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>37</strong> What does the writer say about the popularity of the 7–38–55 formula?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q11\" type=\"radio\" value=\"A\"> A It is unlikely to maintain its present status.</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"B\"> B It is leading to an undervaluing of words.</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"C\"> C It should be applied in a more practical way.</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"D\"> D It may help understanding of non-verbal messages.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>38</strong> What point is Bradley making about language learning?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q12\" type=\"radio\" value=\"A\"> A Language could be learned more efficiently than it is.</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"B\"> B More research is needed into attitudes to communication.</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"C\"> C More time should be spent looking at tone and body language.</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"D\"> D Language must be important since we make an effort to acquire it.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>39</strong> What does Mehrabian himself say about his findings?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q13\" type=\"radio\" value=\"A\"> A They are relevant to only one area of communication.</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"B\"> B It is only in maths that 100% of communication is verbal.</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"C\"> C Feelings are more difficult to communicate than numerical facts.</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"D\"> D Non-verbal communication is the main part of the message.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>40</strong> What is the writer's purpose in the paragraph beginning “To be fair...\"?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q14\" type=\"radio\" value=\"A\"> A To justify the strong points of Mehrabian's study.</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"B\"> B To outline other research on non-verbal behaviour.</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"C\"> C To present varying interpretations of Mehrabian's study.</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"D\"> D To show that textbooks tend to ignore non-verbal behaviour.</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>36</strong> What does the writer say about the “numerical precision” of Mehrabian's study?</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"> A It makes the claims more attractive.</label> <label><input name=\"q10\" type=\"radio\" value=\"B\"> B It is the strongest point of the study.</label> <label><input name=\"q10\" type=\"radio\" value=\"C\"> C It will appeal to superstitious people.</label> <label><input name=\"q10\" type=\"radio\" value=\"D\"> D It allows comparison between languages.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> What does the writer say about the popularity of the 7–38–55 formula?</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"> A It is unlikely to maintain its present status.</label> <label><input name=\"q11\" type=\"radio\" value=\"B\"> B It is leading to an undervaluing of words.</label> <label><input name=\"q11\" type=\"radio\" value=\"C\"> C It should be applied in a more practical way.</label> <label><input name=\"q11\" type=\"radio\" value=\"D\"> D It may help understanding of non-verbal messages.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> What point is Bradley making about language learning?</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"A\"> A Language could be learned more efficiently than it is.</label> <label><input name=\"q12\" type=\"radio\" value=\"B\"> B More research is needed into attitudes to communication.</label> <label><input name=\"q12\" type=\"radio\" value=\"C\"> C More time should be spent looking at tone and body language.</label> <label><input name=\"q12\" type=\"radio\" value=\"D\"> D Language must be important since we make an effort to acquire it.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> What does Mehrabian himself say about his findings?</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"> A They are relevant to only one area of communication.</label> <label><input name=\"q13\" type=\"radio\" value=\"B\"> B It is only in maths that 100% of communication is verbal.</label> <label><input name=\"q13\" type=\"radio\" value=\"C\"> C Feelings are more difficult to communicate than numerical facts.</label> <label><input name=\"q13\" type=\"radio\" value=\"D\"> D Non-verbal communication is the main part of the message.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> What is the writer's purpose in the paragraph beginning “To be fair...\"?</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"A\"> A To justify the strong points of Mehrabian's study.</label> <label><input name=\"q14\" type=\"radio\" value=\"B\"> B To outline other research on non-verbal behaviour.</label> <label><input name=\"q14\" type=\"radio\" value=\"C\"> C To present varying interpretations of Mehrabian's study.</label> <label><input name=\"q14\" type=\"radio\" value=\"D\"> D To show that textbooks tend to ignore non-verbal behaviour.</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
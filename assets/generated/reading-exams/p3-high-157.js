@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Flower Power</h3>\n            \n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"A\" id=\"q1-dropzone\" data-question=\"q1\">\n                    <span class=\"paragraph-label\">Question 27 (A):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>A</strong> Why do we give people flowers? To offer condolence to those who are grieving. To celebrate. To woo. To ask for forgiveness. We all know intuitively that there is a universal emotional response. In the US alone, the flower industry is now worth about $5 billion a year, which suggests that, at the very least, they service a compelling human need.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"B\" id=\"q2-dropzone\" data-question=\"q2\">\n                    <span class=\"paragraph-label\">Question 28 (B):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>B</strong> Recent studies at the Department of Psychology at Rutgers State University of New Jersey investigated claims that flowers are unique among living organisms in their ability to induce profound changes in our emotional state. As the first part of their research, the Rutgers team visited 150 women in their homes. Each was presented with a variety of gifts such as flowers, fruit or sweets. The women were unaware that the study was about the effect of the flowers on their emotions. They were told that it was a study about their daily moods, and that they would receive a gift in return for taking part. Following the presentation of the gift, those receiving flowers were assessed as displaying a much more positive mood than those who got other gifts, and this effect lasted for several days. After receiving flowers, they were also more willing to answer questions concerning their social circle and intimate conversations with friends and family. The results suggest that flowers influence our secondary socio-emotional behaviours, as well as having a strong effect on our immediate emotional expression.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                 <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"C\" id=\"q3-dropzone\" data-question=\"q3\">\n                    <span class=\"paragraph-label\">Question 29 (C):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>C</strong> In the second study, the psychologists observed participants being handed single flowers, or alternative gifts, in a constrained and stressful situation – inside an elevator. Contrary to predictions regarding gender differences, both men and women presented with flowers were more likely to smile, to stand closer and to initiate conversation. Several subjects who were given the alternative gift then learnt that flowers were also being handed out, and returned to the elevator and demanded a flower. The scientists used elevators for this study precisely because the most typical behaviour in sparsely occupied elevators is for people to retreat to opposite corners. The subjects who received flowers, however, closed up that space to a considerable extent – indicating that the flowers not only induced a strong positive mood, but brought a significant affiliation among people who had never previously met.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"D\" id=\"q4-dropzone\" data-question=\"q4\">\n                    <span class=\"paragraph-label\">Question 30 (D):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>D</strong> The third study involved regularly sending flowers to a selected sample of men and women. The researchers found not only a profound elevation of mood, but also reliable improvements in other measures of cognitive function, like memory. In this series of experiments, some participants produced such extraordinary emotional displays that the psychologists were totally unprepared for them. Subjects gave spontaneous hugs and kisses to the people who delivered the flowers, and sent invitations to the psychologists to come to their homes for refreshments.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                 <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"E\" id=\"q5-dropzone\" data-question=\"q5\">\n                    <span class=\"paragraph-label\">Question 31 (E):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>E</strong> Various evolutionary hypotheses attempt to explain the remarkably powerful psychological effect of flowers. One is that our aesthetic preferences for fertile locations and growing things stem from prehistory, when these clues in our environment could mean the difference between starvation and survival. We may have become hardwired to respond positively to flowers because for early man, finding them in a particular location predicted future food supplies and possibly a better place to rear children. Yet the flaw in this argument is that the showy flowers which humans seem to find most visually attractive are generally found on those plants which yield no edible products.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                 <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"F\" id=\"q6-dropzone\" data-question=\"q6\">\n                    <span class=\"paragraph-label\">Question 32 (F):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>F</strong> The Rutgers psychologists' findings show that the various physical attributes of flowers combine to directly affect our emotions through multi-channel interactions. We have evolved preferences for the particular colours, textures, patterned symmetries and specific floral odours which influence our moods. Indeed, previous research has established that popular perfumes, which often have a floral ‘top-note', will actually reduce depression. The origins of these inclinations may well be as the evolutionary theories suggest: the patterned symmetries of flowers can be detected easily as a recognisable signal within a wide variety of visual arrays, and a response to certain colour tones is important in finding ripe fruit against a leafy background. But, claim the Rutgers team, these preferences have long been separated from their primary evolutionary use, and become rewarding to us more generally. Thus plants with preferred colours, shapes and odours – despite having no other products – would therefore be protected and dispersed.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                 <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"G\" id=\"q7-dropzone\" data-question=\"q7\">\n                    <span class=\"paragraph-label\">Question 33 (G):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>G</strong> The Rutgers study suggests that flowers may have actually evolved to exploit their peculiar impact on humans. The team's theory proposes a plant-human co-evolution, or even domestication, based on the intense emotional rewards that flowers provide. The idea that flowering plants, with no known food or other basic survival value to man, have co-evolved with us by exploiting an emotional niche instead, is very much like the scenario presented for the evolution of dogs. Flowers may be the plant equivalent of 'companion animals'. If this is true, then there is a very real sense in which, when you next give flowers, they are using you just as much as you are using them.</p>\n            </div>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Flower Power</h3>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"A\" id=\"q1-dropzone\" data-question=\"q1\">\n<span class=\"paragraph-label\">Question 27 (A):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> Why do we give people flowers? To offer condolence to those who are grieving. To celebrate. To woo. To ask for forgiveness. We all know intuitively that there is a universal emotional response. In the US alone, the flower industry is now worth about $5 billion a year, which suggests that, at the very least, they service a compelling human need.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"B\" id=\"q2-dropzone\" data-question=\"q2\">\n<span class=\"paragraph-label\">Question 28 (B):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> Recent studies at the Department of Psychology at Rutgers State University of New Jersey investigated claims that flowers are unique among living organisms in their ability to induce profound changes in our emotional state. As the first part of their research, the Rutgers team visited 150 women in their homes. Each was presented with a variety of gifts such as flowers, fruit or sweets. The women were unaware that the study was about the effect of the flowers on their emotions. They were told that it was a study about their daily moods, and that they would receive a gift in return for taking part. Following the presentation of the gift, those receiving flowers were assessed as displaying a much more positive mood than those who got other gifts, and this effect lasted for several days. After receiving flowers, they were also more willing to answer questions concerning their social circle and intimate conversations with friends and family. The results suggest that flowers influence our secondary socio-emotional behaviours, as well as having a strong effect on our immediate emotional expression.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"C\" id=\"q3-dropzone\" data-question=\"q3\">\n<span class=\"paragraph-label\">Question 29 (C):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> In the second study, the psychologists observed participants being handed single flowers, or alternative gifts, in a constrained and stressful situation – inside an elevator. Contrary to predictions regarding gender differences, both men and women presented with flowers were more likely to smile, to stand closer and to initiate conversation. Several subjects who were given the alternative gift then learnt that flowers were also being handed out, and returned to the elevator and demanded a flower. The scientists used elevators for this study precisely because the most typical behaviour in sparsely occupied elevators is for people to retreat to opposite corners. The subjects who received flowers, however, closed up that space to a considerable extent – indicating that the flowers not only induced a strong positive mood, but brought a significant affiliation among people who had never previously met.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"D\" id=\"q4-dropzone\" data-question=\"q4\">\n<span class=\"paragraph-label\">Question 30 (D):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> The third study involved regularly sending flowers to a selected sample of men and women. The researchers found not only a profound elevation of mood, but also reliable improvements in other measures of cognitive function, like memory. In this series of experiments, some participants produced such extraordinary emotional displays that the psychologists were totally unprepared for them. Subjects gave spontaneous hugs and kisses to the people who delivered the flowers, and sent invitations to the psychologists to come to their homes for refreshments.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"E\" id=\"q5-dropzone\" data-question=\"q5\">\n<span class=\"paragraph-label\">Question 31 (E):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> Various evolutionary hypotheses attempt to explain the remarkably powerful psychological effect of flowers. One is that our aesthetic preferences for fertile locations and growing things stem from prehistory, when these clues in our environment could mean the difference between starvation and survival. We may have become hardwired to respond positively to flowers because for early man, finding them in a particular location predicted future food supplies and possibly a better place to rear children. Yet the flaw in this argument is that the showy flowers which humans seem to find most visually attractive are generally found on those plants which yield no edible products.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"F\" id=\"q6-dropzone\" data-question=\"q6\">\n<span class=\"paragraph-label\">Question 32 (F):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> The Rutgers psychologists' findings show that the various physical attributes of flowers combine to directly affect our emotions through multi-channel interactions. We have evolved preferences for the particular colours, textures, patterned symmetries and specific floral odours which influence our moods. Indeed, previous research has established that popular perfumes, which often have a floral ‘top-note', will actually reduce depression. The origins of these inclinations may well be as the evolutionary theories suggest: the patterned symmetries of flowers can be detected easily as a recognisable signal within a wide variety of visual arrays, and a response to certain colour tones is important in finding ripe fruit against a leafy background. But, claim the Rutgers team, these preferences have long been separated from their primary evolutionary use, and become rewarding to us more generally. Thus plants with preferred colours, shapes and odours – despite having no other products – would therefore be protected and dispersed.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"G\" id=\"q7-dropzone\" data-question=\"q7\">\n<span class=\"paragraph-label\">Question 33 (G):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>G</strong> The Rutgers study suggests that flowers may have actually evolved to exploit their peculiar impact on humans. The team's theory proposes a plant-human co-evolution, or even domestication, based on the intense emotional rewards that flowers provide. The idea that flowering plants, with no known food or other basic survival value to man, have co-evolved with us by exploiting an emotional niche instead, is very much like the scenario presented for the evolution of dogs. Flowers may be the plant equivalent of 'companion animals'. If this is true, then there is a very real sense in which, when you next give flowers, they are using you just as much as you are using them.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -37,7 +37,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n                <h4>Questions 27–33</h4>\n                <p>Reading Passage 3 has seven paragraphs, <strong>A–G</strong>.</p>\n                <p>Choose the correct heading for each paragraph from the list of headings below.</p>\n                <p><em>Drag a heading from this list and drop it onto the correct paragraph's answer box on the left.</em></p>\n                <div class=\"headings-pool\" id=\"headings-pool-container\">\n                    <strong>List of Headings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. A negative reaction to receiving flowers</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. Some surprisingly strong responses to flowers</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. A mutually beneficial relationship?</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. Becoming more open about personal matters</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. Some common social functions of flowers</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. Sensory appeal versus practical purpose of flowers</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. Bridging the gap between strangers in an enclosed space</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. An imperfect theory</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 27–33</h4>\n<p>Reading Passage 3 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from this list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. A negative reaction to receiving flowers</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. Some surprisingly strong responses to flowers</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. A mutually beneficial relationship?</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. Becoming more open about personal matters</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. Some common social functions of flowers</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. Sensory appeal versus practical purpose of flowers</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. Bridging the gap between strangers in an enclosed space</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. An imperfect theory</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -50,7 +50,7 @@
         "q10",
         "q11"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-anchor\">\n                <h4>Questions 34–37</h4>\n                <p>Look at the following statements (Questions 34–37) and the list of studies below.</p>\n                <p>Match each statement with the correct studies, <strong>A-C</strong>.</p>\n                <p><em>NB You may use any letter more than once.</em></p>\n\n                <div class=\"question-item\" id=\"q8-anchor\">\n                    <p><strong>34</strong> The study focused on participants' short-term reaction to receiving flowers.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"A\"> A the first study</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"B\"> B the second study</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"C\"> C the third study</label>\n                    </div>\n                </div>\n                \n                <div class=\"question-item\" id=\"q9-anchor\">\n                    <p><strong>35</strong> Participants were deliberately misled as to the aim of the study.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"A\"> A the first study</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"B\"> B the second study</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"C\"> C the third study</label>\n                    </div>\n                </div>\n\n                <div class=\"question-item\" id=\"q10-anchor\">\n                    <p><strong>36</strong> Receiving flowers had a notable effect on participants' mental capacities.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q10\" type=\"radio\" value=\"A\"> A the first study</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"B\"> B the second study</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"C\"> C the third study</label>\n                    </div>\n                </div>\n                \n                <div class=\"question-item\" id=\"q11-anchor\">\n                    <p><strong>37</strong> Male and female responses were more uniform than expected.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q11\" type=\"radio\" value=\"A\"> A the first study</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"B\"> B the second study</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"C\"> C the third study</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-anchor\">\n<h4>Questions 34–37</h4>\n<p>Look at the following statements (Questions 34–37) and the list of studies below.</p>\n<p>Match each statement with the correct studies, <strong>A-C</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"question-item\" id=\"q8-anchor\">\n<p><strong>34</strong> The study focused on participants' short-term reaction to receiving flowers.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"> A the first study</label> <label><input name=\"q8\" type=\"radio\" value=\"B\"> B the second study</label> <label><input name=\"q8\" type=\"radio\" value=\"C\"> C the third study</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q9-anchor\">\n<p><strong>35</strong> Participants were deliberately misled as to the aim of the study.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"> A the first study</label> <label><input name=\"q9\" type=\"radio\" value=\"B\"> B the second study</label> <label><input name=\"q9\" type=\"radio\" value=\"C\"> C the third study</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q10-anchor\">\n<p><strong>36</strong> Receiving flowers had a notable effect on participants' mental capacities.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"> A the first study</label> <label><input name=\"q10\" type=\"radio\" value=\"B\"> B the second study</label> <label><input name=\"q10\" type=\"radio\" value=\"C\"> C the third study</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q11-anchor\">\n<p><strong>37</strong> Male and female responses were more uniform than expected.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"> A the first study</label> <label><input name=\"q11\" type=\"radio\" value=\"B\"> B the second study</label> <label><input name=\"q11\" type=\"radio\" value=\"C\"> C the third study</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -60,7 +60,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q12-13-14-anchor\">\n                <h4>Questions 38–40</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                 <p style=\"line-height: 2.5;\"><strong>A possible explanation for the appeal of flowers</strong></p>\n                <p style=\"line-height: 2.5;\">It has been suggested that our intense response to flowers originates in prehistoric times. The presence of flowers might indicate a potential source of <strong>38</strong> <input class=\"blank\" name=\"q12\"> in a particular location, and primitive humans would search for such signs when looking for a suitable site to raise their <strong>39</strong> <input class=\"blank\" name=\"q13\">. The interpretation of these signs was essential for the survival of our ancestors. However, the problem with this idea is that the plants producing the most attractive flowers do not usually have fruit which is <strong>40</strong> <input class=\"blank\" name=\"q14\">.</p>\n                <div id=\"q13-anchor\"></div>\n                <div id=\"q14-anchor\"></div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q12-13-14-anchor\">\n<h4>Questions 38–40</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<p style=\"line-height: 2.5;\"><strong>A possible explanation for the appeal of flowers</strong></p>\n<p style=\"line-height: 2.5;\">It has been suggested that our intense response to flowers originates in prehistoric times. The presence of flowers might indicate a potential source of <strong>38</strong> <input class=\"blank\" name=\"q12\"> in a particular location, and primitive humans would search for such signs when looking for a suitable site to raise their <strong>39</strong> <input class=\"blank\" name=\"q13\">. The interpretation of these signs was essential for the survival of our ancestors. However, the problem with this idea is that the plants producing the most attractive flowers do not usually have fruit which is <strong>40</strong> <input class=\"blank\" name=\"q14\">.</p>\n<div id=\"q13-anchor\"></div>\n<div id=\"q14-anchor\"></div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Grimm's Fairy Tales</h3>\n            \n            <p><strong>A</strong> The Brothers Grimm, Jacob and Wilhelm, named their story collection Children's and Household Tales and published the first of its seven editions in Germany in 1812. The table of contents reads like an A-list of fairy-tale celebrities: Cinderella, Sleeping Beauty, Snow White, Little Red Riding Hood, Rapunzel, Rumpelstiltskin, Hansel and Gretel, the Frog King. Drawn mostly from oral narratives, the 210 stories in the Grimm's' collection represent an anthology of fairy tales, animal fables, rustic farces, and religious allegories that remain unrivalled to this day.</p>\n            <p><strong>B</strong> Such lasting fame would have shocked the humble Grimms. During their lifetimes the collection sold modestly in Germany, at first only a few hundred copies a year. The early editions were not even aimed at children. The brothers initially refused to consider illustrations, and scholarly footnotes took up almost as much space as the tales themselves. Jacob and Wilhelm viewed themselves as patriotic folklorists, not as entertainers of children. They began their work at a time when Germany had been overrun by the French under Napoleon, who was intent on suppressing local culture. As young, workaholic scholars, single and sharing a cramped flat, the Brothers Grimm undertook the fairy-tale collection with the goal of serving the endangered oral tradition of Germany.</p>\n            <p><strong>C</strong> For much of the 19th-century teachers, parents, and religious figures, particularly in the United States, deplored the Grimms' collection for its raw, uncivilized content. Offended adults objected to the gruesome punishments inflicted on the stories' villains. In the original “Snow White\" the evil stepmother is forced to dance in red-hot iron shoes until she falls down dead. Even today some protective parents shy from the Grimms' tales because of their reputation for violence.</p>\n            <p><strong>D</strong> Despite its sometimes rocky reception, Children's and Household Tales gradually took root with the public. The brothers had not foreseen that the appearance of their work would coincide with a great flowering of children's literature in Europe. English publishers led the way, issuing high-quality picture books such as Jack and the Beanstalk and handsome folktale collections, all to satisfy a newly literate audience seeking virtuous material for the nursery. Once the Brothers Grimm sighted this new public, they set about refining and softening their tales, which had originated centuries earlier as earthy peasant fare. In the Grimms' hands, cruel mothers became nasty stepmothers, unmarried lovers were made chaste, and the incestuous father was recast as the devil.</p>\n            <p><strong>E</strong> In the 20th century, the Grimms' fairy tales have come to rule the bookshelves of children's bedrooms. The stories read like dreams come true: handsome lads and beautiful damsels, armed with magic, triumph over giants and witches and wild beasts. They outwit mean, selfish adults. Inevitably the boy and girl fall in love and live happily ever after. And parents keep reading because they approve of the finger-wagging lessons inserted into the stories: keep your promises, don't talk to strangers, work hard, obey your parents. According to the Grimms, the collection served as \"a manual of manners\".</p>\n            <p><strong>F</strong> Altogether some 40 persons delivered tales to the Grimms. Many of the storytellers came to the Grimms' house in Kassel. The brothers particularly welcomed the visits of Dorothea Viehmann, a widow who walked to town to sell produce from her garden. An innkeeper's daughter, Viehmann had grown up listening to stories from travellers on the road to Frankfurt. Among her treasure was “Aschenputtel” -Cinderella. Marie Hassenpflug was a 20-year-old friend of their sister, Charlotte, from a well-bred, French-speaking family. Marie's wonderful stories blended motifs from the oral tradition and from Perrault's influential 1697 book, Tales of My Mother Goose, which contained elaborate versions of “Little Red Riding Hood”, “Snow White\", and \"Sleeping Beauty”, among others. Many of these had been adapted from earlier Italian tales.</p>\n            <p><strong>G</strong> Given that the origins of many of the Grimm fairy tales reach throughout Europe and into the Middle East and Orient, the question must be asked: How German are the Grimm tales? Very, says scholar Heinz Rolleke. Love of the underdog, rustic simplicity, creative energy—these are Teutonic traits. The coarse texture of life during medieval times in Germany, when many of the tales entered the oral tradition, also coloured the narratives. Throughout Europe, children were often neglected and abandoned, like Hansel and Gretel. Accused witches were burned at the stake, like the evil mother-in-law in “The Six Swans”. “The cruelty in the stories was not the Grimms' fantasy”, Rolleke points out, “It reflected the law-and-order system of the old times\".</p>\n            <p><strong>H</strong> The editorial fingerprints left by the Grimms betray the specific values of 19th-century Christian, bourgeois German society. But that has not stopped the tales from being embraced by almost every culture and nationality in the world. What accounts for this widespread, enduring popularity? Bernhard Lauer points to the “universal style” of the writing, you have no concrete descriptions of the land, or the clothes, or the forest, or the castles. It makes the stories timeless and placeless. “The tales allow us to express ‘our utopian longings',” says Jack Zipes of the University of Minnesota, whose 1987 translation of the complete fairy tales captures the rustic vigour of the original text. “They show a striving for happiness that none of us knows but that we sense is possible. We can identify with the heroes of the tales and become in our mind the masters and mistresses of our own destinies.\"</p>\n            <p><strong>I</strong> Fairy tales provide a workout for the unconscious, psychoanalysts maintain. Bruno Bettelheim famously promoted the therapeutic value of the Grimms' stories, calling fairy tales the “great comforters\". By confronting fears and phobias, symbolized by witches, heartless stepmothers, and hungry wolves, children find they can master their anxieties. Bettelheim's theory continues to be hotly debated. But most young readers aren't interested in exercising their unconsciousness. The Grimm tales, in fact, please in an infinite number of ways, something about them seems to mirror whatever moods or interests we bring to our reading of them. The flexibility of interpretation suits them for almost any time and any culture.</p>\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>Grimm's Fairy Tales</h3>\n<p><strong>A</strong> The Brothers Grimm, Jacob and Wilhelm, named their story collection Children's and Household Tales and published the first of its seven editions in Germany in 1812. The table of contents reads like an A-list of fairy-tale celebrities: Cinderella, Sleeping Beauty, Snow White, Little Red Riding Hood, Rapunzel, Rumpelstiltskin, Hansel and Gretel, the Frog King. Drawn mostly from oral narratives, the 210 stories in the Grimm's' collection represent an anthology of fairy tales, animal fables, rustic farces, and religious allegories that remain unrivalled to this day.</p>\n<p><strong>B</strong> Such lasting fame would have shocked the humble Grimms. During their lifetimes the collection sold modestly in Germany, at first only a few hundred copies a year. The early editions were not even aimed at children. The brothers initially refused to consider illustrations, and scholarly footnotes took up almost as much space as the tales themselves. Jacob and Wilhelm viewed themselves as patriotic folklorists, not as entertainers of children. They began their work at a time when Germany had been overrun by the French under Napoleon, who was intent on suppressing local culture. As young, workaholic scholars, single and sharing a cramped flat, the Brothers Grimm undertook the fairy-tale collection with the goal of serving the endangered oral tradition of Germany.</p>\n<p><strong>C</strong> For much of the 19th-century teachers, parents, and religious figures, particularly in the United States, deplored the Grimms' collection for its raw, uncivilized content. Offended adults objected to the gruesome punishments inflicted on the stories' villains. In the original “Snow White\" the evil stepmother is forced to dance in red-hot iron shoes until she falls down dead. Even today some protective parents shy from the Grimms' tales because of their reputation for violence.</p>\n<p><strong>D</strong> Despite its sometimes rocky reception, Children's and Household Tales gradually took root with the public. The brothers had not foreseen that the appearance of their work would coincide with a great flowering of children's literature in Europe. English publishers led the way, issuing high-quality picture books such as Jack and the Beanstalk and handsome folktale collections, all to satisfy a newly literate audience seeking virtuous material for the nursery. Once the Brothers Grimm sighted this new public, they set about refining and softening their tales, which had originated centuries earlier as earthy peasant fare. In the Grimms' hands, cruel mothers became nasty stepmothers, unmarried lovers were made chaste, and the incestuous father was recast as the devil.</p>\n<p><strong>E</strong> In the 20th century, the Grimms' fairy tales have come to rule the bookshelves of children's bedrooms. The stories read like dreams come true: handsome lads and beautiful damsels, armed with magic, triumph over giants and witches and wild beasts. They outwit mean, selfish adults. Inevitably the boy and girl fall in love and live happily ever after. And parents keep reading because they approve of the finger-wagging lessons inserted into the stories: keep your promises, don't talk to strangers, work hard, obey your parents. According to the Grimms, the collection served as \"a manual of manners\".</p>\n<p><strong>F</strong> Altogether some 40 persons delivered tales to the Grimms. Many of the storytellers came to the Grimms' house in Kassel. The brothers particularly welcomed the visits of Dorothea Viehmann, a widow who walked to town to sell produce from her garden. An innkeeper's daughter, Viehmann had grown up listening to stories from travellers on the road to Frankfurt. Among her treasure was “Aschenputtel” -Cinderella. Marie Hassenpflug was a 20-year-old friend of their sister, Charlotte, from a well-bred, French-speaking family. Marie's wonderful stories blended motifs from the oral tradition and from Perrault's influential 1697 book, Tales of My Mother Goose, which contained elaborate versions of “Little Red Riding Hood”, “Snow White\", and \"Sleeping Beauty”, among others. Many of these had been adapted from earlier Italian tales.</p>\n<p><strong>G</strong> Given that the origins of many of the Grimm fairy tales reach throughout Europe and into the Middle East and Orient, the question must be asked: How German are the Grimm tales? Very, says scholar Heinz Rolleke. Love of the underdog, rustic simplicity, creative energy—these are Teutonic traits. The coarse texture of life during medieval times in Germany, when many of the tales entered the oral tradition, also coloured the narratives. Throughout Europe, children were often neglected and abandoned, like Hansel and Gretel. Accused witches were burned at the stake, like the evil mother-in-law in “The Six Swans”. “The cruelty in the stories was not the Grimms' fantasy”, Rolleke points out, “It reflected the law-and-order system of the old times\".</p>\n<p><strong>H</strong> The editorial fingerprints left by the Grimms betray the specific values of 19th-century Christian, bourgeois German society. But that has not stopped the tales from being embraced by almost every culture and nationality in the world. What accounts for this widespread, enduring popularity? Bernhard Lauer points to the “universal style” of the writing, you have no concrete descriptions of the land, or the clothes, or the forest, or the castles. It makes the stories timeless and placeless. “The tales allow us to express ‘our utopian longings',” says Jack Zipes of the University of Minnesota, whose 1987 translation of the complete fairy tales captures the rustic vigour of the original text. “They show a striving for happiness that none of us knows but that we sense is possible. We can identify with the heroes of the tales and become in our mind the masters and mistresses of our own destinies.\"</p>\n<p><strong>I</strong> Fairy tales provide a workout for the unconscious, psychoanalysts maintain. Bruno Bettelheim famously promoted the therapeutic value of the Grimms' stories, calling fairy tales the “great comforters\". By confronting fears and phobias, symbolized by witches, heartless stepmothers, and hungry wolves, children find they can master their anxieties. Bettelheim's theory continues to be hotly debated. But most young readers aren't interested in exercising their unconsciousness. The Grimm tales, in fact, please in an infinite number of ways, something about them seems to mirror whatever moods or interests we bring to our reading of them. The flexibility of interpretation suits them for almost any time and any culture.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                <h4>Questions 27–32</h4>\n                <p>Do the following statements agree with the information given in Reading Passage 3?</p>\n                <p>In boxes 27–32 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                \n                <div class=\"question-item\">\n                    <p><strong>27</strong> The Grimm brothers believed they would achieve international fame.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> The Grimm brothers were forced to work in secret.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> Some parents today still think Grimm fairy tales are not suitable for children.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> The first edition of Grimm's fairy tales sold more widely in England than in Germany.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>31</strong> Adults like reading Grimm's fairy tales for reasons different from those of children.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>32</strong> The Grimm brothers based the story “Cinderella” on the life of Dorothea Viehmann.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p>Do the following statements agree with the information given in Reading Passage 3?</p>\n<p>In boxes 27–32 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> The Grimm brothers believed they would achieve international fame.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> The Grimm brothers were forced to work in secret.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Some parents today still think Grimm fairy tales are not suitable for children.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> The first edition of Grimm's fairy tales sold more widely in England than in Germany.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> Adults like reading Grimm's fairy tales for reasons different from those of children.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> The Grimm brothers based the story “Cinderella” on the life of Dorothea Viehmann.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-anchor\">\n                 <h4>Questions 33–35</h4>\n                <p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> In paragraph D, what changes happened at that time in Europe?</p>\n                    <div class=\"radio-options radio-options-column\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"A\"> A Literacy levels of the population increased.</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"B\"> B The development of printing technology made it easier to publish.</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"C\"> C Schools were open to children.</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"D\"> D People were fond of collecting superb picture books.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>34</strong> What changes did the Grimm Brothers make in later editions?</p>\n                     <div class=\"radio-options radio-options-column\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"A\"> A They made the stories shorter.</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"B\"> B They used more oral language.</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"C\"> C The content of the tales became less violent.</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"D\"> D They found other origins of the tales.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>35</strong> What did Marie Hassenpflug contribute to the Grimm's Fairy tales?</p>\n                     <div class=\"radio-options radio-options-column\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"A\"> A She wrote stories.</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"B\"> B She discussed the stories with them.</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"C\"> C She translated a popular book for the brothers using her talent for languages.</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"D\"> D She told the oral stories that were based on traditional Italian stories.</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-anchor\">\n<h4>Questions 33–35</h4>\n<p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>33</strong> In paragraph D, what changes happened at that time in Europe?</p>\n<div class=\"radio-options radio-options-column\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"> A Literacy levels of the population increased.</label> <label><input name=\"q7\" type=\"radio\" value=\"B\"> B The development of printing technology made it easier to publish.</label> <label><input name=\"q7\" type=\"radio\" value=\"C\"> C Schools were open to children.</label> <label><input name=\"q7\" type=\"radio\" value=\"D\"> D People were fond of collecting superb picture books.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> What changes did the Grimm Brothers make in later editions?</p>\n<div class=\"radio-options radio-options-column\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"> A They made the stories shorter.</label> <label><input name=\"q8\" type=\"radio\" value=\"B\"> B They used more oral language.</label> <label><input name=\"q8\" type=\"radio\" value=\"C\"> C The content of the tales became less violent.</label> <label><input name=\"q8\" type=\"radio\" value=\"D\"> D They found other origins of the tales.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> What did Marie Hassenpflug contribute to the Grimm's Fairy tales?</p>\n<div class=\"radio-options radio-options-column\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"> A She wrote stories.</label> <label><input name=\"q9\" type=\"radio\" value=\"B\"> B She discussed the stories with them.</label> <label><input name=\"q9\" type=\"radio\" value=\"C\"> C She translated a popular book for the brothers using her talent for languages.</label> <label><input name=\"q9\" type=\"radio\" value=\"D\"> D She told the oral stories that were based on traditional Italian stories.</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n                <h4>Questions 36–40</h4>\n                <p>Complete each sentence with the correct ending, <strong>A-H</strong>, below.</p>\n                <div class=\"question-item\">\n                    <p><strong>36</strong> Heinz Rolleke said the Grimm's tales are \"German\" because some tales</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q10\" type=\"radio\" value=\"A\"> A</label><label><input name=\"q10\" type=\"radio\" value=\"B\"> B</label><label><input name=\"q10\" type=\"radio\" value=\"C\"> C</label><label><input name=\"q10\" type=\"radio\" value=\"D\"> D</label><label><input name=\"q10\" type=\"radio\" value=\"E\"> E</label><label><input name=\"q10\" type=\"radio\" value=\"F\"> F</label><label><input name=\"q10\" type=\"radio\" value=\"G\"> G</label><label><input name=\"q10\" type=\"radio\" value=\"H\"> H</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>37</strong> Heinz Rolleke said the abandoned children in tales</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q11\" type=\"radio\" value=\"A\"> A</label><label><input name=\"q11\" type=\"radio\" value=\"B\"> B</label><label><input name=\"q11\" type=\"radio\" value=\"C\"> C</label><label><input name=\"q11\" type=\"radio\" value=\"D\"> D</label><label><input name=\"q11\" type=\"radio\" value=\"E\"> E</label><label><input name=\"q11\" type=\"radio\" value=\"F\"> F</label><label><input name=\"q11\" type=\"radio\" value=\"G\"> G</label><label><input name=\"q11\" type=\"radio\" value=\"H\"> H</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>38</strong> Bernhard Lauer said the writing style of the Grimm brothers is universal because they</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q12\" type=\"radio\" value=\"A\"> A</label><label><input name=\"q12\" type=\"radio\" value=\"B\"> B</label><label><input name=\"q12\" type=\"radio\" value=\"C\"> C</label><label><input name=\"q12\" type=\"radio\" value=\"D\"> D</label><label><input name=\"q12\" type=\"radio\" value=\"E\"> E</label><label><input name=\"q12\" type=\"radio\" value=\"F\"> F</label><label><input name=\"q12\" type=\"radio\" value=\"G\"> G</label><label><input name=\"q12\" type=\"radio\" value=\"H\"> H</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>39</strong> Jack Zipes said the pursuit of happiness in the tales means they</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q13\" type=\"radio\" value=\"A\"> A</label><label><input name=\"q13\" type=\"radio\" value=\"B\"> B</label><label><input name=\"q13\" type=\"radio\" value=\"C\"> C</label><label><input name=\"q13\" type=\"radio\" value=\"D\"> D</label><label><input name=\"q13\" type=\"radio\" value=\"E\"> E</label><label><input name=\"q13\" type=\"radio\" value=\"F\"> F</label><label><input name=\"q13\" type=\"radio\" value=\"G\"> G</label><label><input name=\"q13\" type=\"radio\" value=\"H\"> H</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>40</strong> Bruno Bettelheim said the therapeutic value of the tales means that the fairy tales</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q14\" type=\"radio\" value=\"A\"> A</label><label><input name=\"q14\" type=\"radio\" value=\"B\"> B</label><label><input name=\"q14\" type=\"radio\" value=\"C\"> C</label><label><input name=\"q14\" type=\"radio\" value=\"D\"> D</label><label><input name=\"q14\" type=\"radio\" value=\"E\"> E</label><label><input name=\"q14\" type=\"radio\" value=\"F\"> F</label><label><input name=\"q14\" type=\"radio\" value=\"G\"> G</label><label><input name=\"q14\" type=\"radio\" value=\"H\"> H</label>\n                    </div>\n                </div>\n                <div class=\"sentence-completion-options\">\n                    <ul class=\"question-options-list\">\n                        <li><strong>A</strong> reflect what life was like at that time.</li>\n                        <li><strong>B</strong> help children deal with their problems.</li>\n                        <li><strong>C</strong> demonstrate the outdated system.</li>\n                        <li><strong>D</strong> tell of the simplicity of life in the German countryside.</li>\n                        <li><strong>E</strong> encourage people to believe that they can do anything.</li>\n                        <li><strong>F</strong> recognize the heroes in the real life.</li>\n                        <li><strong>G</strong> contribute to the belief in nature's power.</li>\n                        <li><strong>H</strong> avoid details about characters' social settings.</li>\n                    </ul>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A-H</strong>, below.</p>\n<div class=\"question-item\">\n<p><strong>36</strong> Heinz Rolleke said the Grimm's tales are \"German\" because some tales</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"> A</label><label><input name=\"q10\" type=\"radio\" value=\"B\"> B</label><label><input name=\"q10\" type=\"radio\" value=\"C\"> C</label><label><input name=\"q10\" type=\"radio\" value=\"D\"> D</label><label><input name=\"q10\" type=\"radio\" value=\"E\"> E</label><label><input name=\"q10\" type=\"radio\" value=\"F\"> F</label><label><input name=\"q10\" type=\"radio\" value=\"G\"> G</label><label><input name=\"q10\" type=\"radio\" value=\"H\"> H</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> Heinz Rolleke said the abandoned children in tales</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"> A</label><label><input name=\"q11\" type=\"radio\" value=\"B\"> B</label><label><input name=\"q11\" type=\"radio\" value=\"C\"> C</label><label><input name=\"q11\" type=\"radio\" value=\"D\"> D</label><label><input name=\"q11\" type=\"radio\" value=\"E\"> E</label><label><input name=\"q11\" type=\"radio\" value=\"F\"> F</label><label><input name=\"q11\" type=\"radio\" value=\"G\"> G</label><label><input name=\"q11\" type=\"radio\" value=\"H\"> H</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> Bernhard Lauer said the writing style of the Grimm brothers is universal because they</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"A\"> A</label><label><input name=\"q12\" type=\"radio\" value=\"B\"> B</label><label><input name=\"q12\" type=\"radio\" value=\"C\"> C</label><label><input name=\"q12\" type=\"radio\" value=\"D\"> D</label><label><input name=\"q12\" type=\"radio\" value=\"E\"> E</label><label><input name=\"q12\" type=\"radio\" value=\"F\"> F</label><label><input name=\"q12\" type=\"radio\" value=\"G\"> G</label><label><input name=\"q12\" type=\"radio\" value=\"H\"> H</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> Jack Zipes said the pursuit of happiness in the tales means they</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"> A</label><label><input name=\"q13\" type=\"radio\" value=\"B\"> B</label><label><input name=\"q13\" type=\"radio\" value=\"C\"> C</label><label><input name=\"q13\" type=\"radio\" value=\"D\"> D</label><label><input name=\"q13\" type=\"radio\" value=\"E\"> E</label><label><input name=\"q13\" type=\"radio\" value=\"F\"> F</label><label><input name=\"q13\" type=\"radio\" value=\"G\"> G</label><label><input name=\"q13\" type=\"radio\" value=\"H\"> H</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> Bruno Bettelheim said the therapeutic value of the tales means that the fairy tales</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"A\"> A</label><label><input name=\"q14\" type=\"radio\" value=\"B\"> B</label><label><input name=\"q14\" type=\"radio\" value=\"C\"> C</label><label><input name=\"q14\" type=\"radio\" value=\"D\"> D</label><label><input name=\"q14\" type=\"radio\" value=\"E\"> E</label><label><input name=\"q14\" type=\"radio\" value=\"F\"> F</label><label><input name=\"q14\" type=\"radio\" value=\"G\"> G</label><label><input name=\"q14\" type=\"radio\" value=\"H\"> H</label>\n</div>\n</div>\n<div class=\"sentence-completion-options\">\n<ul class=\"question-options-list\">\n<li><strong>A</strong> reflect what life was like at that time.</li>\n<li><strong>B</strong> help children deal with their problems.</li>\n<li><strong>C</strong> demonstrate the outdated system.</li>\n<li><strong>D</strong> tell of the simplicity of life in the German countryside.</li>\n<li><strong>E</strong> encourage people to believe that they can do anything.</li>\n<li><strong>F</strong> recognize the heroes in the real life.</li>\n<li><strong>G</strong> contribute to the belief in nature's power.</li>\n<li><strong>H</strong> avoid details about characters' social settings.</li>\n</ul>\n</div>\n</div>"
     }
   ],
   "answerKey": {
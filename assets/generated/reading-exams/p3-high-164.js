@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Language Strategy in Multinational Companies</h3>\n            \n            <p>The importance of language management in multinational companies has never been greater than today. Multinationals are becoming ever more conscious of the importance of global coordination as a source of competitive advantage, and language remains the ultimate barrier to aspirations of international harmonization. Before attempting to consider language-management strategies, companies will have to evaluate the magnitude of the language barrier confronting them and, in doing so, examine it in three dimensions: language diversity, language penetration and language sophistication. Companies next need to turn their attention to how they should best manage language. There is a range of options from which MNCs can formulate their language strategy.</p>\n\n            <h4>Lingua Franca</h4>\n            <p>The simplest answer—though realistic only for English-speaking companies—is to rely on one's native tongue. As recently as 1991 a survey of British exporting companies found that over a third used English exclusively in dealings with foreign customers. This attitude that “one language fits all\" has also been carried through into the Internet age. A survey of the websites of top American companies confirmed that over half made no provision for foreign-language access, and another found that less than 10 % of leading companies were able to respond adequately to e-mails other than in the company's language. Widespread though it is, however, reliance on a single language is a strategy that is fatally flawed. It makes no allowance for the growing trend in linguistic nationalism whereby buyers in Asia, South America and the Middle East in particular are asserting their right to \"work in the language of the customer”. It also fails to recognise the increasing vitality of languages such as Spanish, Arabic and Chinese that over time are likely to challenge the dominance of English as a lingua franca. In the IT arena it ignores the rapid globalisation of the Internet, where the number of English-language e-commerce transactions, e-mails and websites is rapidly diminishing as a percentage of the total. Finally, total reliance on a single language puts the English speaker at risk in negotiations. Contracts, rules and legislation are invariably written in the local language, and a company unable to operate in that language is vulnerable.</p>\n\n            <h4>Functional Multilingualism</h4>\n            <p>Another improvised approach is to rely on what has been termed “functional multilingualism”. Essentially, this means muddling through—relying on a mix of languages, pidgins and gestures to communicate by whatever means the parties have at their disposal. In a social context such a shared effort might aid bonding, the frustration of communication being regularly punctuated by moments of absurdity and humour. However, as the basis for business negotiations it appears very hit-and-miss. Yet Hagen's recent study suggests that 16% of international business transactions are conducted in a “cocktail of languages\". Functional multilingualism shares the same defects as reliance on a lingua franca and increases the probability of cognitive divergence between the parties.</p>\n\n            <h4>External Language Resources</h4>\n            <p>A more rational response is to employ external resources such as translators and interpreters, and certainly there are many excellent companies specialised in these fields. However, this is by no means an end to the language barrier. For a start these services can be very expensive, with a top simultaneous interpreter commanding daily rates as high as a partner in an international consulting firm. Secondly, any good translator or interpreter will insist that, to be fully effective, they must understand the context of the subject matter—something not always possible owing to complexity, lack of preparation time, or more often the reluctance of the parties to explain the wider context to an outsider. Unless there has been considerable pre-explanation, ambiguity and cultural overtones are likely to remain in the source messages. Interpreters will of course endeavour to provide a hi-fidelity translation, but in such circumstances they must use initiative and guess-work, clearly injecting a potential source of misunderstanding. Finally, while a good interpreter will attempt to convey spirit as well as meaning, there is inevitably a loss of rhetorical power; for negotiation, persuasion or humour, an interpreter is a poor substitute for direct communication.</p>\n\n            <h4>Training</h4>\n            <p>The immediate and understandable reaction to any skills shortage is to consider personnel development, and the language-training industry is well developed, offering programmes at almost every level and in numerous languages. However, no company should be deluded into believing training alone guarantees success. Training budgets are geared to the economic cycle: when times are good, money is invested; when belts tighten, training is one of the first luxuries to be pared down. In a study across four European countries nearly twice as many companies said they needed language training in coming years as had conducted it in past years—highlighting the gap between good intentions and delivery. Unless a company is committed to sustaining the strategy even through bad times, it will fail.</p>\n            <p>One notable and committed leader in language training is the Volkswagen Group. Over many years it has developed a language strategy that can be regarded as a model of professional management. Volkswagen treats language training as a strategic solution, not a tactical one. Progressing from “basics” to full “communication competence” requires completion of six language stages, each demanding roughly 90 hours of classroom refresher work, supplemented by self-study over 6-9 months. Each stage ends with an achievement test that is a prerequisite for continuing. Even this highly structured programme expects a minimum of three years of fairly intensive study before an accountant, engineer, buyer or salesperson can work effectively in a foreign language. Clearly, firms pursuing this route must do so with realistic expectations and long-term commitment; except for brush-up courses for the already fluent, training is not a quick fix and other methods will still be needed.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Language Strategy in Multinational Companies</h3>\n<p>The importance of language management in multinational companies has never been greater than today. Multinationals are becoming ever more conscious of the importance of global coordination as a source of competitive advantage, and language remains the ultimate barrier to aspirations of international harmonization. Before attempting to consider language-management strategies, companies will have to evaluate the magnitude of the language barrier confronting them and, in doing so, examine it in three dimensions: language diversity, language penetration and language sophistication. Companies next need to turn their attention to how they should best manage language. There is a range of options from which MNCs can formulate their language strategy.</p>\n<h4>Lingua Franca</h4>\n<p>The simplest answer—though realistic only for English-speaking companies—is to rely on one's native tongue. As recently as 1991 a survey of British exporting companies found that over a third used English exclusively in dealings with foreign customers. This attitude that “one language fits all\" has also been carried through into the Internet age. A survey of the websites of top American companies confirmed that over half made no provision for foreign-language access, and another found that less than 10 % of leading companies were able to respond adequately to e-mails other than in the company's language. Widespread though it is, however, reliance on a single language is a strategy that is fatally flawed. It makes no allowance for the growing trend in linguistic nationalism whereby buyers in Asia, South America and the Middle East in particular are asserting their right to \"work in the language of the customer”. It also fails to recognise the increasing vitality of languages such as Spanish, Arabic and Chinese that over time are likely to challenge the dominance of English as a lingua franca. In the IT arena it ignores the rapid globalisation of the Internet, where the number of English-language e-commerce transactions, e-mails and websites is rapidly diminishing as a percentage of the total. Finally, total reliance on a single language puts the English speaker at risk in negotiations. Contracts, rules and legislation are invariably written in the local language, and a company unable to operate in that language is vulnerable.</p>\n<h4>Functional Multilingualism</h4>\n<p>Another improvised approach is to rely on what has been termed “functional multilingualism”. Essentially, this means muddling through—relying on a mix of languages, pidgins and gestures to communicate by whatever means the parties have at their disposal. In a social context such a shared effort might aid bonding, the frustration of communication being regularly punctuated by moments of absurdity and humour. However, as the basis for business negotiations it appears very hit-and-miss. Yet Hagen's recent study suggests that 16% of international business transactions are conducted in a “cocktail of languages\". Functional multilingualism shares the same defects as reliance on a lingua franca and increases the probability of cognitive divergence between the parties.</p>\n<h4>External Language Resources</h4>\n<p>A more rational response is to employ external resources such as translators and interpreters, and certainly there are many excellent companies specialised in these fields. However, this is by no means an end to the language barrier. For a start these services can be very expensive, with a top simultaneous interpreter commanding daily rates as high as a partner in an international consulting firm. Secondly, any good translator or interpreter will insist that, to be fully effective, they must understand the context of the subject matter—something not always possible owing to complexity, lack of preparation time, or more often the reluctance of the parties to explain the wider context to an outsider. Unless there has been considerable pre-explanation, ambiguity and cultural overtones are likely to remain in the source messages. Interpreters will of course endeavour to provide a hi-fidelity translation, but in such circumstances they must use initiative and guess-work, clearly injecting a potential source of misunderstanding. Finally, while a good interpreter will attempt to convey spirit as well as meaning, there is inevitably a loss of rhetorical power; for negotiation, persuasion or humour, an interpreter is a poor substitute for direct communication.</p>\n<h4>Training</h4>\n<p>The immediate and understandable reaction to any skills shortage is to consider personnel development, and the language-training industry is well developed, offering programmes at almost every level and in numerous languages. However, no company should be deluded into believing training alone guarantees success. Training budgets are geared to the economic cycle: when times are good, money is invested; when belts tighten, training is one of the first luxuries to be pared down. In a study across four European countries nearly twice as many companies said they needed language training in coming years as had conducted it in past years—highlighting the gap between good intentions and delivery. Unless a company is committed to sustaining the strategy even through bad times, it will fail.</p>\n<p>One notable and committed leader in language training is the Volkswagen Group. Over many years it has developed a language strategy that can be regarded as a model of professional management. Volkswagen treats language training as a strategic solution, not a tactical one. Progressing from “basics” to full “communication competence” requires completion of six language stages, each demanding roughly 90 hours of classroom refresher work, supplemented by self-study over 6-9 months. Each stage ends with an achievement test that is a prerequisite for continuing. Even this highly structured programme expects a minimum of three years of fairly intensive study before an accountant, engineer, buyer or salesperson can work effectively in a foreign language. Clearly, firms pursuing this route must do so with realistic expectations and long-term commitment; except for brush-up courses for the already fluent, training is not a quick fix and other methods will still be needed.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                <h4>Questions 27–32</h4>\n                <p>Complete the summary using the list of phrases, <strong>A–L</strong>, below.</p>\n                <div class=\"summary-text\">\n                    <p>\n                    MNCs often encounter language barriers in their daily operations, so they seek several approaches to solve such problems. First, using the native language gives them a realistic base in a different-language-speaking country, but problems turn up when they deal with overseas <span id=\"q1-target\" class=\"drop-target-summary\" data-question=\"q1\"></span>. For example, when translating key <span id=\"q2-target\" class=\"drop-target-summary\" data-question=\"q2\"></span>, differences inevitably arise because of rules in different countries. Another way is to rely on a combination of spoken language and <span id=\"q3-target\" class=\"drop-target-summary\" data-question=\"q3\"></span>, yet a report noted that over one-tenth of business <span id=\"q4-target\" class=\"drop-target-summary\" data-question=\"q4\"></span> were processed in a party-language setting. A third way is to hire translators. However, this is <span id=\"q5-target\" class=\"drop-target-summary\" data-question=\"q5\"></span>; besides, if they are not well-prepared, they have to engage in <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> work.\n                    </p>\n                </div>\n                <div id=\"word-options\" class=\"options-pool\">\n                    <div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A gestures</div>\n                    <div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B clients</div>\n                    <div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C transactions</div>\n                    <div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D assumption</div>\n                    <div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E accurate</div>\n                    <div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F documents</div>\n                    <div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G managers</div>\n                    <div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H body language</div>\n                    <div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I long-term</div>\n                    <div id=\"word-J\" class=\"draggable-word\" draggable=\"true\" data-key=\"J\">J effective</div>\n                    <div id=\"word-K\" class=\"draggable-word\" draggable=\"true\" data-key=\"K\">K rivals</div>\n                    <div id=\"word-L\" class=\"draggable-word\" draggable=\"true\" data-key=\"L\">L costly</div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p>Complete the summary using the list of phrases, <strong>A–L</strong>, below.</p>\n<div class=\"summary-text\">\n<p>\nMNCs often encounter language barriers in their daily operations, so they seek several approaches to solve such problems. First, using the native language gives them a realistic base in a different-language-speaking country, but problems turn up when they deal with overseas <span id=\"q1-target\" class=\"drop-target-summary\" data-question=\"q1\"></span>. For example, when translating key <span id=\"q2-target\" class=\"drop-target-summary\" data-question=\"q2\"></span>, differences inevitably arise because of rules in different countries. Another way is to rely on a combination of spoken language and <span id=\"q3-target\" class=\"drop-target-summary\" data-question=\"q3\"></span>, yet a report noted that over one-tenth of business <span id=\"q4-target\" class=\"drop-target-summary\" data-question=\"q4\"></span> were processed in a party-language setting. A third way is to hire translators. However, this is <span id=\"q5-target\" class=\"drop-target-summary\" data-question=\"q5\"></span>; besides, if they are not well-prepared, they have to engage in <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> work.\n</p>\n</div>\n<div id=\"word-options\" class=\"options-pool\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A gestures</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B clients</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C transactions</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D assumption</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E accurate</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F documents</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G managers</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H body language</div>\n<div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I long-term</div>\n<div id=\"word-J\" class=\"draggable-word\" draggable=\"true\" data-key=\"J\">J effective</div>\n<div id=\"word-K\" class=\"draggable-word\" draggable=\"true\" data-key=\"K\">K rivals</div>\n<div id=\"word-L\" class=\"draggable-word\" draggable=\"true\" data-key=\"L\">L costly</div>\n</div>\n</div>",
       "allowOptionReuse": false,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -52,7 +52,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-11-12-13-anchor\">\n                <h4>Questions 33–39</h4>\n                <p>Choose <strong>NO MORE THAN THREE WORDS AND/OR A NUMBER</strong> from the passage for each answer.</p>\n                <div class=\"question-item\" id=\"q7-item\">\n                    <p><strong>33</strong> What \"understandable reaction” does the author say companies show when facing a skills shortage?</p>\n                    <input name=\"q7\" type=\"text\" id=\"q7-input\" placeholder=\"Your answer...\">\n                </div>\n                <div class=\"question-item\" id=\"q8-item\">\n                    <p><strong>34</strong> During an economic depression, how does the writer label language training in firms?</p>\n                    <input name=\"q8\" type=\"text\" id=\"q8-input\" placeholder=\"Your answer...\">\n                </div>\n                 <div class=\"question-item\" id=\"q9-item\">\n                    <p><strong>35</strong> What has Volkswagen Group provided as an example for other multinationals?</p>\n                    <input name=\"q9\" type=\"text\" id=\"q9-input\" placeholder=\"Your answer...\">\n                </div>\n                 <div class=\"question-item\" id=\"q10-item\">\n                    <p><strong>36</strong> In Volkswagen, language training is regarded as what kind of solution?</p>\n                    <input name=\"q10\" type=\"text\" id=\"q10-input\" placeholder=\"Your answer...\">\n                </div>\n                <div class=\"question-item\" id=\"q11-item\">\n                    <p><strong>37</strong> How many stages are required to progress from basics to full competence?</p>\n                    <input name=\"q11\" type=\"text\" id=\"q11-input\" placeholder=\"Your answer...\">\n                </div>\n                <div class=\"question-item\" id=\"q12-item\">\n                    <p><strong>38</strong> Roughly how long does each refresher course take?</p>\n                    <input name=\"q12\" type=\"text\" id=\"q12-input\" placeholder=\"Your answer...\">\n                </div>\n                <div class=\"question-item\" id=\"q13-item\">\n                    <p><strong>39</strong> At least how long is needed for a specialist to work effectively in a foreign language?</p>\n                    <input name=\"q13\" type=\"text\" id=\"q13-input\" placeholder=\"Your answer...\">\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-11-12-13-anchor\">\n<h4>Questions 33–39</h4>\n<p>Choose <strong>NO MORE THAN THREE WORDS AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"question-item\" id=\"q7-item\">\n<p><strong>33</strong> What \"understandable reaction” does the author say companies show when facing a skills shortage?</p>\n<input name=\"q7\" type=\"text\" id=\"q7-input\" placeholder=\"Your answer...\">\n</div>\n<div class=\"question-item\" id=\"q8-item\">\n<p><strong>34</strong> During an economic depression, how does the writer label language training in firms?</p>\n<input name=\"q8\" type=\"text\" id=\"q8-input\" placeholder=\"Your answer...\">\n</div>\n<div class=\"question-item\" id=\"q9-item\">\n<p><strong>35</strong> What has Volkswagen Group provided as an example for other multinationals?</p>\n<input name=\"q9\" type=\"text\" id=\"q9-input\" placeholder=\"Your answer...\">\n</div>\n<div class=\"question-item\" id=\"q10-item\">\n<p><strong>36</strong> In Volkswagen, language training is regarded as what kind of solution?</p>\n<input name=\"q10\" type=\"text\" id=\"q10-input\" placeholder=\"Your answer...\">\n</div>\n<div class=\"question-item\" id=\"q11-item\">\n<p><strong>37</strong> How many stages are required to progress from basics to full competence?</p>\n<input name=\"q11\" type=\"text\" id=\"q11-input\" placeholder=\"Your answer...\">\n</div>\n<div class=\"question-item\" id=\"q12-item\">\n<p><strong>38</strong> Roughly how long does each refresher course take?</p>\n<input name=\"q12\" type=\"text\" id=\"q12-input\" placeholder=\"Your answer...\">\n</div>\n<div class=\"question-item\" id=\"q13-item\">\n<p><strong>39</strong> At least how long is needed for a specialist to work effectively in a foreign language?</p>\n<input name=\"q13\" type=\"text\" id=\"q13-input\" placeholder=\"Your answer...\">\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -60,7 +60,7 @@
       "questionIds": [
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q14-anchor\">\n                <h4>Question 40</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                     <p><strong>40</strong> What is the main function of this passage?</p>\n                     <div class=\"radio-options\">\n                        <label><input type=\"radio\" name=\"q14\" value=\"A\"> A Reveal all kinds of language problems that companies may encounter.</label>\n                        <label><input type=\"radio\" name=\"q14\" value=\"B\"> B Exhibit well-known cases in dealing with language difficulties.</label>\n                        <label><input type=\"radio\" name=\"q14\" value=\"C\"> C Evaluate various approaches to the language barrier in multinational companies.</label>\n                        <label><input type=\"radio\" name=\"q14\" value=\"D\"> D Testify that training is the only feasible approach to solve language problems.</label>\n                     </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q14-anchor\">\n<h4>Question 40</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>40</strong> What is the main function of this passage?</p>\n<div class=\"radio-options\">\n<label><input type=\"radio\" name=\"q14\" value=\"A\"> A Reveal all kinds of language problems that companies may encounter.</label> <label><input type=\"radio\" name=\"q14\" value=\"B\"> B Exhibit well-known cases in dealing with language difficulties.</label> <label><input type=\"radio\" name=\"q14\" value=\"C\"> C Evaluate various approaches to the language barrier in multinational companies.</label> <label><input type=\"radio\" name=\"q14\" value=\"D\"> D Testify that training is the only feasible approach to solve language problems.</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Living dunes</h3>\n            <h4>Things don't come much stranger than heaps of sand that can move and sing of their own accord. Sally Palmer investigates</h4>\n            \n            <div class=\"paragraph-wrapper\" id=\"q1-anchor\">\n                <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"A\" data-question=\"q1\">\n                    <span class=\"paragraph-label\">Paragraph A (Q27):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>A</strong> Armies of giant sand dunes are advancing across the world's deserts, engulfing anything that crosses their path. They are tens of metres tall and hundreds of metres long. Fortunately, they aren't going very fast. Even the smallest, speediest dunes only travel about 100 metres over the course of a year, while the bigger ones, which weigh something in the order of 10,000 tonnes, barely move one metre in that time. However, their insidious creep can have serious consequences if there is an oil installation or a railway line in their path.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q2-anchor\">\n                <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"B\" data-question=\"q2\">\n                    <span class=\"paragraph-label\">Paragraph B (Q28):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>B</strong> About 47% of the world's land mass, including Antarctica, most of Australia and large areas of Africa, is classified as arid or semi-arid desert. Only around 20% of that is sand-covered, however, and over half of that is classified as ‘linear' sand dunes. These form in a long curving wave, as a result of wind blowing strongly from several quarters, flipping them from side to side. Although linear dunes are static, sand blowing off them can cause problems for desert villages, burying crops and buildings.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q3-anchor\">\n                 <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"C\" data-question=\"q3\">\n                    <span class=\"paragraph-label\">Paragraph C (Q29):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>C</strong> Moving dunes make up just a small percentage of the rest, but they are of the most interest to scientists. They are known as 'barchans': heavy, crescent-shaped sand piles with a ridged crest and two elongated arms, one curving away to either side. ‘Barchan dunes only tend to form where you have one-directional winds on the edge of sandy deserts near coastal areas,' says Giles Wiggs, a geomorphologist at Oxford University, who has been studying the formation and movement of sand dunes for more than a decade.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q4-anchor\">\n                <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"D\" data-question=\"q4\">\n                    <span class=\"paragraph-label\">Paragraph D (Q30):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>D</strong> But even with strong winds, how can entire barchans move while retaining their form? That question was first answered in the mid-20th century by British explorer Ralph Alger Bagnold, and his answer hinges on the fact that dunes aren't solid, but granular. Bagnold figured out how barchan dunes are able to move grain by grain. Imagine a single grain of sand being blown up the back of a dune by the wind and deposited on the top. More grains follow the same pattern, until the accumulated weight of piled-up sand finally pushes the top down the dune face. The grain tumbles, then stops on the face until subsequent mini-avalanches bury it. Eventually, it reappears at the back of the dune, ready to repeat the process. As this happens to every grain of sand in the dune, the whole thing creeps in the direction of the prevailing wind.</p>\n            </div>\n             <div class=\"paragraph-wrapper\" id=\"q5-anchor\">\n                 <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"E\" data-question=\"q5\">\n                    <span class=\"paragraph-label\">Paragraph E (Q31):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>E</strong> The relationship between the wind and barchan dunes is complex. As a dune grows, it modifies the speed and course of the wind, which in turn alters how that dune and its neighbours evolve. ‘Interestingly, the dune can regulate its own shape, and maintain it as it moves,' says Dr Stéphane Douady, a physicist at École Normale Supérieure (ENS) in France. 'Even when two dunes collide, they quickly take on their distinctive shapes again. It's like a living organism.'</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q6-anchor\">\n                 <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"F\" data-question=\"q6\">\n                    <span class=\"paragraph-label\">Paragraph F (Q32):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>F</strong> Douady and his colleagues have also been studying an even odder phenomenon than moving dunes: some barchans actually sing. Local legends attributed the sounds to dangerous spirits which were trying to trap unwary travellers. Douady is more pragmatic. 'It's a strong booming noise with a low frequency,' he explains, making a noise like a foghorn to demonstrate. ‘It can last for a long time – up to several minutes. It's a very loud sound and you don't understand where it's coming from when you first hear it.' There are about 50 dunes distributed across 35 deserts round the world that are known to sing. Douady says the sound is caused by the way sand avalanches down the faces of particular dunes. Rather than tumbling randomly, the sand grains flow in synchrony and set each other vibrating like the membrane on a gigantic loudspeaker. The synchronisation causes the air to move in and out between the grains, creating a powerful sound wave.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q7-anchor\">\n                 <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"G\" data-question=\"q7\">\n                    <span class=\"paragraph-label\">Paragraph G (Q33):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>G</strong> What really surprised the scientists, however, was that they were able to take samples of the singing sand back to France and replicate the sound at ENS, proving that it's the sand, not the dune shape, that causes the sound. Their studies show the grains are a uniform shape, well-rounded from years of striking each other, and that the variations in size affect the tone. Crucially, the grains are coated with a special veneer, which Douady calls 'desert glaze', made from a precise combination of minerals from surrounding rocks including iron, aluminium, manganese, silicon and calcium. The team found that after a month or so, the veneer wore off and the grains lost their ‘voice'. ‘We managed to reproduce the desert glaze and then the grains started to sing again,' says Douady. 'We tried putting the coating onto different grains, but they weren't round enough and it didn't work. But some American colleagues made some artificial grains and managed to make them sing, after covering them in desert glaze.' Douady has now made recordings of dunesong from all over the world which are to be made into a CD.</p>\n            </div>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Living dunes</h3>\n<h4>Things don't come much stranger than heaps of sand that can move and sing of their own accord. Sally Palmer investigates</h4>\n<div class=\"paragraph-wrapper\" id=\"q1-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"A\" data-question=\"q1\">\n<span class=\"paragraph-label\">Paragraph A (Q27):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> Armies of giant sand dunes are advancing across the world's deserts, engulfing anything that crosses their path. They are tens of metres tall and hundreds of metres long. Fortunately, they aren't going very fast. Even the smallest, speediest dunes only travel about 100 metres over the course of a year, while the bigger ones, which weigh something in the order of 10,000 tonnes, barely move one metre in that time. However, their insidious creep can have serious consequences if there is an oil installation or a railway line in their path.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q2-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"B\" data-question=\"q2\">\n<span class=\"paragraph-label\">Paragraph B (Q28):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> About 47% of the world's land mass, including Antarctica, most of Australia and large areas of Africa, is classified as arid or semi-arid desert. Only around 20% of that is sand-covered, however, and over half of that is classified as ‘linear' sand dunes. These form in a long curving wave, as a result of wind blowing strongly from several quarters, flipping them from side to side. Although linear dunes are static, sand blowing off them can cause problems for desert villages, burying crops and buildings.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q3-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"C\" data-question=\"q3\">\n<span class=\"paragraph-label\">Paragraph C (Q29):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> Moving dunes make up just a small percentage of the rest, but they are of the most interest to scientists. They are known as 'barchans': heavy, crescent-shaped sand piles with a ridged crest and two elongated arms, one curving away to either side. ‘Barchan dunes only tend to form where you have one-directional winds on the edge of sandy deserts near coastal areas,' says Giles Wiggs, a geomorphologist at Oxford University, who has been studying the formation and movement of sand dunes for more than a decade.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q4-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"D\" data-question=\"q4\">\n<span class=\"paragraph-label\">Paragraph D (Q30):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> But even with strong winds, how can entire barchans move while retaining their form? That question was first answered in the mid-20th century by British explorer Ralph Alger Bagnold, and his answer hinges on the fact that dunes aren't solid, but granular. Bagnold figured out how barchan dunes are able to move grain by grain. Imagine a single grain of sand being blown up the back of a dune by the wind and deposited on the top. More grains follow the same pattern, until the accumulated weight of piled-up sand finally pushes the top down the dune face. The grain tumbles, then stops on the face until subsequent mini-avalanches bury it. Eventually, it reappears at the back of the dune, ready to repeat the process. As this happens to every grain of sand in the dune, the whole thing creeps in the direction of the prevailing wind.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q5-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"E\" data-question=\"q5\">\n<span class=\"paragraph-label\">Paragraph E (Q31):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> The relationship between the wind and barchan dunes is complex. As a dune grows, it modifies the speed and course of the wind, which in turn alters how that dune and its neighbours evolve. ‘Interestingly, the dune can regulate its own shape, and maintain it as it moves,' says Dr Stéphane Douady, a physicist at École Normale Supérieure (ENS) in France. 'Even when two dunes collide, they quickly take on their distinctive shapes again. It's like a living organism.'</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q6-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"F\" data-question=\"q6\">\n<span class=\"paragraph-label\">Paragraph F (Q32):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> Douady and his colleagues have also been studying an even odder phenomenon than moving dunes: some barchans actually sing. Local legends attributed the sounds to dangerous spirits which were trying to trap unwary travellers. Douady is more pragmatic. 'It's a strong booming noise with a low frequency,' he explains, making a noise like a foghorn to demonstrate. ‘It can last for a long time – up to several minutes. It's a very loud sound and you don't understand where it's coming from when you first hear it.' There are about 50 dunes distributed across 35 deserts round the world that are known to sing. Douady says the sound is caused by the way sand avalanches down the faces of particular dunes. Rather than tumbling randomly, the sand grains flow in synchrony and set each other vibrating like the membrane on a gigantic loudspeaker. The synchronisation causes the air to move in and out between the grains, creating a powerful sound wave.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q7-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"G\" data-question=\"q7\">\n<span class=\"paragraph-label\">Paragraph G (Q33):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>G</strong> What really surprised the scientists, however, was that they were able to take samples of the singing sand back to France and replicate the sound at ENS, proving that it's the sand, not the dune shape, that causes the sound. Their studies show the grains are a uniform shape, well-rounded from years of striking each other, and that the variations in size affect the tone. Crucially, the grains are coated with a special veneer, which Douady calls 'desert glaze', made from a precise combination of minerals from surrounding rocks including iron, aluminium, manganese, silicon and calcium. The team found that after a month or so, the veneer wore off and the grains lost their ‘voice'. ‘We managed to reproduce the desert glaze and then the grains started to sing again,' says Douady. 'We tried putting the coating onto different grains, but they weren't round enough and it didn't work. But some American colleagues made some artificial grains and managed to make them sing, after covering them in desert glaze.' Douady has now made recordings of dunesong from all over the world which are to be made into a CD.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -37,7 +37,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-group\">\n                <h4>Questions 27–33</h4>\n                <p>Reading Passage 3 has seven paragraphs, <strong>A–G</strong>.</p>\n                <p>Choose the correct heading for each paragraph from the list of headings below.</p>\n                \n                <div class=\"headings-pool\" id=\"headings-pool-container\">\n                    <strong>List of Headings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i Moving rapidly across the desert</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Recreating the process in a laboratory</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii Strange music created by human movement</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv A potential threat to industry and communications</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v Dunes coming together and re-forming</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi Needing a specific combination of conditions</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii A continuous cycle</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii The commonest type of dune</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix Old superstitions demystified</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-group\">\n<h4>Questions 27–33</h4>\n<p>Reading Passage 3 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i Moving rapidly across the desert</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Recreating the process in a laboratory</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii Strange music created by human movement</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv A potential threat to industry and communications</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v Dunes coming together and re-forming</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi Needing a specific combination of conditions</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii A continuous cycle</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii The commonest type of dune</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix Old superstitions demystified</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -49,7 +49,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-group\">\n                <h4>Questions 34–36</h4>\n                <p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>34</strong> What are we told about linear dunes?</p>\n                    <ul class=\"radio-options-list\">\n                      <li><label><input name=\"q8\" type=\"radio\" value=\"A\"> A They are formed by strong winds blowing from one direction.</label></li>\n                      <li><label><input name=\"q8\" type=\"radio\" value=\"B\"> B They can move up to 100 metres in a twelve-month period.</label></li>\n                      <li><label><input name=\"q8\" type=\"radio\" value=\"C\"> C They develop in a recognisable shape.</label></li>\n                      <li><label><input name=\"q8\" type=\"radio\" value=\"D\"> D They make up about 20% of the world's deserts.</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>35</strong> Bagnold discovered that movement in barchans was caused by</p>\n                    <ul class=\"radio-options-list\">\n                      <li><label><input name=\"q9\" type=\"radio\" value=\"A\"> A the long straight shape of the dunes.</label></li>\n                      <li><label><input name=\"q9\" type=\"radio\" value=\"B\"> B the particular composition of the dunes.</label></li>\n                      <li><label><input name=\"q9\" type=\"radio\" value=\"C\"> C the exceptionally heavy nature of the sand grains.</label></li>\n                      <li><label><input name=\"q9\" type=\"radio\" value=\"D\"> D the unusual strength of the wind in certain seasons.</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>36</strong> Why does Dr Douady compare a barchan dune to a living organism?</p>\n                    <ul class=\"radio-options-list\">\n                      <li><label><input name=\"q10\" type=\"radio\" value=\"A\"> A It starts small and then increases in size.</label></li>\n                      <li><label><input name=\"q10\" type=\"radio\" value=\"B\"> B It has an effect on its immediate surroundings.</label></li>\n                      <li><label><input name=\"q10\" type=\"radio\" value=\"C\"> C Its relations with desert organisms are quite developed.</label></li>\n                      <li><label><input name=\"q10\" type=\"radio\" value=\"D\"> D Its outline stays the same even after a period of movement.</label></li>\n                    </ul>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-group\">\n<h4>Questions 34–36</h4>\n<p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>34</strong> What are we told about linear dunes?</p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q8\" type=\"radio\" value=\"A\"> A They are formed by strong winds blowing from one direction.</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"B\"> B They can move up to 100 metres in a twelve-month period.</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"C\"> C They develop in a recognisable shape.</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"D\"> D They make up about 20% of the world's deserts.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Bagnold discovered that movement in barchans was caused by</p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q9\" type=\"radio\" value=\"A\"> A the long straight shape of the dunes.</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"B\"> B the particular composition of the dunes.</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"C\"> C the exceptionally heavy nature of the sand grains.</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"D\"> D the unusual strength of the wind in certain seasons.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> Why does Dr Douady compare a barchan dune to a living organism?</p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q10\" type=\"radio\" value=\"A\"> A It starts small and then increases in size.</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"B\"> B It has an effect on its immediate surroundings.</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"C\"> C Its relations with desert organisms are quite developed.</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"D\"> D Its outline stays the same even after a period of movement.</label></li>\n</ul>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -60,7 +60,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-group\">\n                <h4>Questions 37–40</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                <div class=\"summary-completion\">\n                    <h4>Singing dunes</h4>\n                    <p>\n                    Singing dunes, which belong to the type of dunes known as <strong>37</strong> <input name=\"q11\" type=\"text\" id=\"q37_input\">, produce a very loud sound which is transmitted at a low frequency. Researchers have worked out that sand grains fall down the dune and start vibrating against other grains, forming a sound wave.\n                    </p>\n                    <p>\n                    Research proves that the individual grains have a similar <strong>38</strong> <input name=\"q12\" type=\"text\" id=\"q38_input\">, but the differences in dimensions alter the <strong>39</strong> <input name=\"q13\" type=\"text\" id=\"q39_input\"> of the 'song'. Each grain is covered with a mixture of different <strong>40</strong> <input name=\"q14\" type=\"text\" id=\"q40_input\">, and this is vital to the sound production.\n                    </p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-group\">\n<h4>Questions 37–40</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>Singing dunes</h4>\n<p>\nSinging dunes, which belong to the type of dunes known as <strong>37</strong> <input name=\"q11\" type=\"text\" id=\"q37_input\">, produce a very loud sound which is transmitted at a low frequency. Researchers have worked out that sand grains fall down the dune and start vibrating against other grains, forming a sound wave.\n</p>\n<p>\nResearch proves that the individual grains have a similar <strong>38</strong> <input name=\"q12\" type=\"text\" id=\"q38_input\">, but the differences in dimensions alter the <strong>39</strong> <input name=\"q13\" type=\"text\" id=\"q39_input\"> of the 'song'. Each grain is covered with a mixture of different <strong>40</strong> <input name=\"q14\" type=\"text\" id=\"q40_input\">, and this is vital to the sound production.\n</p>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Pacific Navigation and Voyaging</h3>\n            <h4>How people migrated to the Pacific islands</h4>\n            \n            <p>The many tiny islands of the Pacific Ocean had no human population until ancestors of today's islanders sailed from Southeast Asia in ocean-going canoes approximately 2,000 years ago. At the present time, the debate continues about exactly how they migrated such vast distances across the ocean, without any of the modern technologies we take for granted.</p>\n            <p>Although the romantic vision of some early twentieth-century writers of fleets of heroic navigators simultaneously setting sail had come to be considered by later investigators to be exaggerated, no considered assessment of Pacific voyaging was forthcoming until 1956 when the American historian Andrew Sharp published his research. Sharp challenged the 'heroic vision' by asserting that the expertise of the navigators was limited, and that the settlement of the islands was not systematic, being more dependent on good fortune by drifting canoes. Sharp's theory was widely challenged, and deservedly so. If nothing else, however, it did spark renewed interest in the topic and precipitated valuable new research.</p>\n            <p>Since the 1960s a wealth of investigations has been conducted, and most of them, thankfully, have been of the ‘non-armchair' variety. While it would be wrong to denigrate all 'armchair' research — that based on an examination of available published materials — it has turned out that so little progress had been made in the area of Pacific voyaging because most writers relied on the same old sources — travelers' journals or missionary narratives compiled by unskilled observers. After Sharp, this began to change, and researchers conducted most of their investigations not in libraries, but in the field.</p>\n            <p>In 1965, David Lewis, a physician and experienced yachtsman, set to work using his own unique philosophy: he took the yacht he had owned for many years and navigated through the islands in order to contact those men who still find their way at sea using traditional methods. He then accompanied these men, in their traditional canoes, on test voyages from which all modern instruments were banished from sight, though Lewis secretly used them to confirm the navigator's calculations. His most famous such voyage was a return trip of around 1,000 nautical miles between two islands in mid-ocean. Far from drifting, as proposed by Sharp, Lewis found that ancient navigators would have known which course to steer by memorizing which stars rose and set in certain positions along the horizon, and this gave them fixed directions by which to steer their boats.</p>\n            <p>The geographer Edwin Doran followed a quite different approach. He was interested in obtaining exact data on canoe sailing performance, and to that end employed the latest electronic instrumentation. Doran traveled on board traditional sailing canoes in some of the most remote parts of the Pacific, all the while using his instruments to record canoe speeds in different wind strengths — from gales to calms — and the angle canoes could sail relative to the wind. In the process, he provided the first really precise attributes of traditional sailing canoes.</p>\n            <p>A further contribution was made by Steven Horvath. As a physiologist, Horvath's interest was not in navigation techniques or in canoes, but in the physical capabilities of the men themselves. By adapting standard physiological techniques, Horvath was able to calculate the energy expenditure required to paddle canoes of this sort at times when there was no wind to fill the sails, or when the wind was contrary. He concluded that paddles, or perhaps long oars, could indeed have propelled for long distances what were primarily sailing vessels.</p>\n            <p>Finally, a team led by P. Wall Garrard conducted important research, in this case by making investigations while remaining safely in the laboratory. Wall Garrard's unusual method was to use the findings of linguists who had studied the languages of the Pacific islands, many of which are remarkably similar although the islands where they are spoken are sometimes thousands of kilometres apart. Clever adaptation of computer simulation techniques pioneered in other disciplines allowed him to produce convincing models suggesting the migrations were indeed systematic, but not simultaneous. Wall Garrard proposed the migrations should be seen not as a single journey made by a massed fleet of canoes, but as a series of ever more ambitious voyages, each pushing further into the unknown ocean.</p>\n            <p>What do we learn about Pacific navigation and voyaging from this research? Quite correctly, none of the researchers tried to use their findings to prove one theory or another; experiments such as these cannot categorically confirm or negate a hypothesis. The strength of this research lay in the range of methodologies employed. When we splice together these findings we can propose that traditional navigators used a variety of canoe types, sources of information and navigation techniques, and it was this adaptability which was their greatest accomplishment. These navigators observed the conditions prevailing at sea at the time a voyage was made and altered their techniques accordingly. Furthermore, the canoes of the navigators were not drifting helplessly at sea but were most likely part of a systematic migration; as such, the Pacific peoples were able to view the ocean as an avenue, not a barrier, to communication before any other race on Earth. Finally, one unexpected but most welcome consequence of this research has been a renaissance in the practice of traditional voyaging. In some groups of islands in the Pacific today, young people are resurrecting the skills of their ancestors, when a few decades ago it seemed they would be lost forever.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Pacific Navigation and Voyaging</h3>\n<h4>How people migrated to the Pacific islands</h4>\n<p>The many tiny islands of the Pacific Ocean had no human population until ancestors of today's islanders sailed from Southeast Asia in ocean-going canoes approximately 2,000 years ago. At the present time, the debate continues about exactly how they migrated such vast distances across the ocean, without any of the modern technologies we take for granted.</p>\n<p>Although the romantic vision of some early twentieth-century writers of fleets of heroic navigators simultaneously setting sail had come to be considered by later investigators to be exaggerated, no considered assessment of Pacific voyaging was forthcoming until 1956 when the American historian Andrew Sharp published his research. Sharp challenged the 'heroic vision' by asserting that the expertise of the navigators was limited, and that the settlement of the islands was not systematic, being more dependent on good fortune by drifting canoes. Sharp's theory was widely challenged, and deservedly so. If nothing else, however, it did spark renewed interest in the topic and precipitated valuable new research.</p>\n<p>Since the 1960s a wealth of investigations has been conducted, and most of them, thankfully, have been of the ‘non-armchair' variety. While it would be wrong to denigrate all 'armchair' research — that based on an examination of available published materials — it has turned out that so little progress had been made in the area of Pacific voyaging because most writers relied on the same old sources — travelers' journals or missionary narratives compiled by unskilled observers. After Sharp, this began to change, and researchers conducted most of their investigations not in libraries, but in the field.</p>\n<p>In 1965, David Lewis, a physician and experienced yachtsman, set to work using his own unique philosophy: he took the yacht he had owned for many years and navigated through the islands in order to contact those men who still find their way at sea using traditional methods. He then accompanied these men, in their traditional canoes, on test voyages from which all modern instruments were banished from sight, though Lewis secretly used them to confirm the navigator's calculations. His most famous such voyage was a return trip of around 1,000 nautical miles between two islands in mid-ocean. Far from drifting, as proposed by Sharp, Lewis found that ancient navigators would have known which course to steer by memorizing which stars rose and set in certain positions along the horizon, and this gave them fixed directions by which to steer their boats.</p>\n<p>The geographer Edwin Doran followed a quite different approach. He was interested in obtaining exact data on canoe sailing performance, and to that end employed the latest electronic instrumentation. Doran traveled on board traditional sailing canoes in some of the most remote parts of the Pacific, all the while using his instruments to record canoe speeds in different wind strengths — from gales to calms — and the angle canoes could sail relative to the wind. In the process, he provided the first really precise attributes of traditional sailing canoes.</p>\n<p>A further contribution was made by Steven Horvath. As a physiologist, Horvath's interest was not in navigation techniques or in canoes, but in the physical capabilities of the men themselves. By adapting standard physiological techniques, Horvath was able to calculate the energy expenditure required to paddle canoes of this sort at times when there was no wind to fill the sails, or when the wind was contrary. He concluded that paddles, or perhaps long oars, could indeed have propelled for long distances what were primarily sailing vessels.</p>\n<p>Finally, a team led by P. Wall Garrard conducted important research, in this case by making investigations while remaining safely in the laboratory. Wall Garrard's unusual method was to use the findings of linguists who had studied the languages of the Pacific islands, many of which are remarkably similar although the islands where they are spoken are sometimes thousands of kilometres apart. Clever adaptation of computer simulation techniques pioneered in other disciplines allowed him to produce convincing models suggesting the migrations were indeed systematic, but not simultaneous. Wall Garrard proposed the migrations should be seen not as a single journey made by a massed fleet of canoes, but as a series of ever more ambitious voyages, each pushing further into the unknown ocean.</p>\n<p>What do we learn about Pacific navigation and voyaging from this research? Quite correctly, none of the researchers tried to use their findings to prove one theory or another; experiments such as these cannot categorically confirm or negate a hypothesis. The strength of this research lay in the range of methodologies employed. When we splice together these findings we can propose that traditional navigators used a variety of canoe types, sources of information and navigation techniques, and it was this adaptability which was their greatest accomplishment. These navigators observed the conditions prevailing at sea at the time a voyage was made and altered their techniques accordingly. Furthermore, the canoes of the navigators were not drifting helplessly at sea but were most likely part of a systematic migration; as such, the Pacific peoples were able to view the ocean as an avenue, not a barrier, to communication before any other race on Earth. Finally, one unexpected but most welcome consequence of this research has been a renaissance in the practice of traditional voyaging. In some groups of islands in the Pacific today, young people are resurrecting the skills of their ancestors, when a few decades ago it seemed they would be lost forever.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 27–31</h4>\n                <p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n                <p>In boxes 27–31 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                \n                <div class=\"question-item\">\n                    <p><strong>27</strong> The Pacific islands were uninhabited when migrants arrived by sea from Southeast Asia.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> Andrew Sharp was the first person to write about the migrants to the islands.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> Andrew Sharp believed migratory voyages were based more on luck than on skill.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> Despite being controversial, Andrew Sharp's research had positive results.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>31</strong> Edwin Doran disagreed with the findings of Lewis's research.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 27–31 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> The Pacific islands were uninhabited when migrants arrived by sea from Southeast Asia.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Andrew Sharp was the first person to write about the migrants to the islands.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Andrew Sharp believed migratory voyages were based more on luck than on skill.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Despite being controversial, Andrew Sharp's research had positive results.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> Edwin Doran disagreed with the findings of Lewis's research.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -48,7 +48,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-10-anchor\">\n                <h4>Questions 32–36</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>32</strong> David Lewis's research was different because</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input name=\"q6\" type=\"radio\" value=\"A\"> A he observed traditional navigators at work</label></li>\n                        <li><label><input name=\"q6\" type=\"radio\" value=\"B\"> B he conducted test voyages using his own yacht</label></li>\n                        <li><label><input name=\"q6\" type=\"radio\" value=\"C\"> C he carried no modern instruments on test voyages</label></li>\n                        <li><label><input name=\"q6\" type=\"radio\" value=\"D\"> D he spoke the same language as the islanders he sailed with</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> What did David Lewis's research discover about traditional navigators?</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input name=\"q7\" type=\"radio\" value=\"A\"> A They used the sun and moon to find their position</label></li>\n                        <li><label><input name=\"q7\" type=\"radio\" value=\"B\"> B They could not sail further than about 1,000 nautical miles</label></li>\n                        <li><label><input name=\"q7\" type=\"radio\" value=\"C\"> C They knew which direction they were sailing in</label></li>\n                        <li><label><input name=\"q7\" type=\"radio\" value=\"D\"> D They were able to drift for long distances</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>34</strong> What are we told about Edwin Doran's research?</p>\n                     <ul class=\"mcq-options\">\n                        <li><label><input name=\"q8\" type=\"radio\" value=\"A\"> A Data were collected after the canoes had returned to land</label></li>\n                        <li><label><input name=\"q8\" type=\"radio\" value=\"B\"> B Canoe characteristics were recorded using modern instruments</label></li>\n                        <li><label><input name=\"q8\" type=\"radio\" value=\"C\"> C Research was conducted in the most densely populated regions</label></li>\n                        <li><label><input name=\"q8\" type=\"radio\" value=\"D\"> D Navigators were not allowed to see the instruments Doran used</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>35</strong> Which of the following did Steven Horvath discover during his research?</p>\n                     <ul class=\"mcq-options\">\n                        <li><label><input name=\"q9\" type=\"radio\" value=\"A\"> A Canoe design was less important than human strength</label></li>\n                        <li><label><input name=\"q9\" type=\"radio\" value=\"B\"> B New research methods had to be developed for use in canoes</label></li>\n                        <li><label><input name=\"q9\" type=\"radio\" value=\"C\"> C Navigators became very tired on the longest voyages</label></li>\n                        <li><label><input name=\"q9\" type=\"radio\" value=\"D\"> D Human energy may have been used to assist sailing canoes</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>36</strong> What is the writer's opinion of Wall Garrard's research?</p>\n                     <ul class=\"mcq-options\">\n                        <li><label><input name=\"q10\" type=\"radio\" value=\"A\"> A He is disappointed it was conducted in the laboratory</label></li>\n                        <li><label><input name=\"q10\" type=\"radio\" value=\"B\"> B He is impressed by the originality of the techniques used</label></li>\n                        <li><label><input name=\"q10\" type=\"radio\" value=\"C\"> C He is surprised it was used to help linguists with their research</label></li>\n                        <li><label><input name=\"q10\" type=\"radio\" value=\"D\"> D He is concerned that the islands studied are long distances apart</label></li>\n                    </ul>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-10-anchor\">\n<h4>Questions 32–36</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>32</strong> David Lewis's research was different because</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q6\" type=\"radio\" value=\"A\"> A he observed traditional navigators at work</label></li>\n<li><label><input name=\"q6\" type=\"radio\" value=\"B\"> B he conducted test voyages using his own yacht</label></li>\n<li><label><input name=\"q6\" type=\"radio\" value=\"C\"> C he carried no modern instruments on test voyages</label></li>\n<li><label><input name=\"q6\" type=\"radio\" value=\"D\"> D he spoke the same language as the islanders he sailed with</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> What did David Lewis's research discover about traditional navigators?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q7\" type=\"radio\" value=\"A\"> A They used the sun and moon to find their position</label></li>\n<li><label><input name=\"q7\" type=\"radio\" value=\"B\"> B They could not sail further than about 1,000 nautical miles</label></li>\n<li><label><input name=\"q7\" type=\"radio\" value=\"C\"> C They knew which direction they were sailing in</label></li>\n<li><label><input name=\"q7\" type=\"radio\" value=\"D\"> D They were able to drift for long distances</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> What are we told about Edwin Doran's research?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q8\" type=\"radio\" value=\"A\"> A Data were collected after the canoes had returned to land</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"B\"> B Canoe characteristics were recorded using modern instruments</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"C\"> C Research was conducted in the most densely populated regions</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"D\"> D Navigators were not allowed to see the instruments Doran used</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Which of the following did Steven Horvath discover during his research?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q9\" type=\"radio\" value=\"A\"> A Canoe design was less important than human strength</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"B\"> B New research methods had to be developed for use in canoes</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"C\"> C Navigators became very tired on the longest voyages</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"D\"> D Human energy may have been used to assist sailing canoes</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> What is the writer's opinion of Wall Garrard's research?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q10\" type=\"radio\" value=\"A\"> A He is disappointed it was conducted in the laboratory</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"B\"> B He is impressed by the originality of the techniques used</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"C\"> C He is surprised it was used to help linguists with their research</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"D\"> D He is concerned that the islands studied are long distances apart</label></li>\n</ul>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n                 <h4>Questions 37–40</h4>\n                <p>Complete each sentence with the correct ending, <strong>A–F</strong>, below.</p>\n                <ul class=\"sentence-ending-options\">\n                    <li>was the variety of experimental techniques used</li>\n                    <li>was not of interest to young islanders today</li>\n                    <li>was not conclusive evidence in support of a single theory</li>\n                    <li>was being able to change their practices when necessary</li>\n                    <li>was the first time humans intentionally crossed an ocean</li>\n                    <li>was the speed with which it was conducted</li>\n                </ul>\n\n                <div class=\"question-item\"><strong>37</strong> One limitation in the information produced by all of this research is that it <input type=\"text\" id=\"q37_input\" maxlength=\"1\" name=\"q11\"></div>\n                <div class=\"question-item\"><strong>38</strong> The best thing about this type of research <input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\"></div>\n                <div class=\"question-item\"><strong>39</strong> The most important achievement of traditional navigators <input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\"></div>\n                <div class=\"question-item\"><strong>40</strong> The migration of people from Asia to the Pacific <input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"></div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–F</strong>, below.</p>\n<ul class=\"sentence-ending-options\">\n<li>was the variety of experimental techniques used</li>\n<li>was not of interest to young islanders today</li>\n<li>was not conclusive evidence in support of a single theory</li>\n<li>was being able to change their practices when necessary</li>\n<li>was the first time humans intentionally crossed an ocean</li>\n<li>was the speed with which it was conducted</li>\n</ul>\n<div class=\"question-item\"><strong>37</strong> One limitation in the information produced by all of this research is that it <input type=\"text\" id=\"q37_input\" maxlength=\"1\" name=\"q11\"></div>\n<div class=\"question-item\"><strong>38</strong> The best thing about this type of research <input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\"></div>\n<div class=\"question-item\"><strong>39</strong> The most important achievement of traditional navigators <input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\"></div>\n<div class=\"question-item\"><strong>40</strong> The migration of people from Asia to the Pacific <input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"></div>\n</div>"
     }
   ],
   "answerKey": {
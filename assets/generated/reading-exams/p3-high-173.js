@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Robert Louis Stevenson</h3>\n            <h4>The writer of some of the best-known stories in the English language, including Treasure Island and The Strange Case of Dr. Jekyll and Mr. Hyde</h4>\n            \n            <p>It is more than 100 years since the death of the Scottish writer Robert Louis Stevenson on the South Pacific island of Samoa. And it seems that time has not been kind to Stevenson's memory. Immediately after his death, his family and friends set to work to fashion the legend of Robert Louis Stevenson, or R.L.S. as he became known—one of the few writers familiar from his initials alone. Subsequent works of biography then turned him into a writer of almost religious importance. One example was critic Balfour, who in 1901 portrayed Stevenson's family as ministering angels to the dying genius during his final illness. Similarly, the biographer Crouch absurdly overstated Stevenson's significance by placing him in the same company as those most revered names in English literature, Shakespeare and Keats. The reaction to this nonsense was a number of highly critical assessments of Stevenson's legacy in the 1920s.</p>\n            <p>Normally, the critical pendulum can be relied on to swing back again, but there are several aspects of Stevenson's work that have until recently acted against a more balanced appraisal. First is the allegation that Stevenson was a mere master of linguistic fireworks who lacked moral depth. Some critics accused him of being a literary charlatan, juggling words very prettily to strike effects that overawed an ignorant public and served to distract from the inadequacy of his ideas.</p>\n            <p>Then there has been a prejudice against the adventure story as the proper medium for deep moral seriousness, a prejudice which is still extremely influential today. It seems that we can accept that an adventure film can successfully express profound moral truths, but we reject the same idea for a book. The absurdity of this becomes apparent when we think of writers like Joseph Conrad and Graham Greene, but it is no use pretending that this bias against adventure stories is not part of our high culture. A further problem is that Stevenson has often not found favour in the land of his birth because his conservatism so often collides with the strong radical tradition in Scotland. His many escapist stories and preference for living abroad have led to accusations that he camouflaged Scotland's real problems. Lastly, the high adventure of Stevenson's own lifestyle has sometimes obscured his output. His globe-trotting, and above all the final phase of his life in Samoa, tended to make his own life a greater story than any he could devise. This was precisely what his friends feared would happen towards the end of his short life: his art might be overwhelmed by the drama of life in Samoa.</p>\n            <p>One consequence of this has been that Stevenson's influence on other writers has too often been neglected. The writer and poet Oscar Wilde was deeply influenced by Stevenson, even though he declared that Stevenson would have produced better work if he had lived in London rather than Samoa. Stevenson tends to stick in the throat even of those writers who would like to spit him out, such as Shaw, who claimed to have learned from him that the romantic hero is always mocked by reality. Likewise, the writer Galsworthy, who was a determined critic, later changed his mind and said that the superiority of Stevenson over the novelist Hardy was that Stevenson was all life and Hardy, all death. The influence on the novelist Chesterton would also repay detailed study, for it was through him that Stevenson has managed to cross the ages, emerging as an influence on the modernist movement and our own contemporary Latin American school of magical realism.</p>\n            <p>When making an assessment of his life and work, one question must inevitably be asked: was Robert Louis Stevenson Scotland's greatest writer of English prose? For most commentators this honour falls to Sir Walter Scott, author of Ivanhoe among many other classic novels, and it is true that in terms of craftsmanship, precision and the ability to minutely regulate language to create the desired effect, Scott takes the prize. However, this is not the same thing at all as inherent talent: by way of comparison one may take the example of the two great Russian composers Shostakovich and Prokofiev, of whom the former had learned more precise skills of execution but the latter's intrinsic genius was greater, and so it seems to be with Scott and Stevenson. Admittedly, Scott's detailed style does permit his stories to explore levels of tragedy that are beyond Stevenson's reach, but in this regard they have the musty smell of the museum, somehow artificial and removed from modern-day reality. On the other hand, Stevenson's skill with plotting and narrative give his books a timeless quality, so that they still live today. And Stevenson was also the shrewder judge of behaviour and psychology. For example, his compelling description of a man with a split personality in The Strange Case of Dr. Jekyll and Mr. Hyde has proved so accessible and accurate that the expression “Jekyll and Hyde” has entered common English usage. Even if we do not see a revival of critical interest in this great Scottish writer, it is to be hoped that readers go back to Robert Louis Stevenson's magnificent stories and reassess this neglected genius.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Robert Louis Stevenson</h3>\n<h4>The writer of some of the best-known stories in the English language, including Treasure Island and The Strange Case of Dr. Jekyll and Mr. Hyde</h4>\n<p>It is more than 100 years since the death of the Scottish writer Robert Louis Stevenson on the South Pacific island of Samoa. And it seems that time has not been kind to Stevenson's memory. Immediately after his death, his family and friends set to work to fashion the legend of Robert Louis Stevenson, or R.L.S. as he became known—one of the few writers familiar from his initials alone. Subsequent works of biography then turned him into a writer of almost religious importance. One example was critic Balfour, who in 1901 portrayed Stevenson's family as ministering angels to the dying genius during his final illness. Similarly, the biographer Crouch absurdly overstated Stevenson's significance by placing him in the same company as those most revered names in English literature, Shakespeare and Keats. The reaction to this nonsense was a number of highly critical assessments of Stevenson's legacy in the 1920s.</p>\n<p>Normally, the critical pendulum can be relied on to swing back again, but there are several aspects of Stevenson's work that have until recently acted against a more balanced appraisal. First is the allegation that Stevenson was a mere master of linguistic fireworks who lacked moral depth. Some critics accused him of being a literary charlatan, juggling words very prettily to strike effects that overawed an ignorant public and served to distract from the inadequacy of his ideas.</p>\n<p>Then there has been a prejudice against the adventure story as the proper medium for deep moral seriousness, a prejudice which is still extremely influential today. It seems that we can accept that an adventure film can successfully express profound moral truths, but we reject the same idea for a book. The absurdity of this becomes apparent when we think of writers like Joseph Conrad and Graham Greene, but it is no use pretending that this bias against adventure stories is not part of our high culture. A further problem is that Stevenson has often not found favour in the land of his birth because his conservatism so often collides with the strong radical tradition in Scotland. His many escapist stories and preference for living abroad have led to accusations that he camouflaged Scotland's real problems. Lastly, the high adventure of Stevenson's own lifestyle has sometimes obscured his output. His globe-trotting, and above all the final phase of his life in Samoa, tended to make his own life a greater story than any he could devise. This was precisely what his friends feared would happen towards the end of his short life: his art might be overwhelmed by the drama of life in Samoa.</p>\n<p>One consequence of this has been that Stevenson's influence on other writers has too often been neglected. The writer and poet Oscar Wilde was deeply influenced by Stevenson, even though he declared that Stevenson would have produced better work if he had lived in London rather than Samoa. Stevenson tends to stick in the throat even of those writers who would like to spit him out, such as Shaw, who claimed to have learned from him that the romantic hero is always mocked by reality. Likewise, the writer Galsworthy, who was a determined critic, later changed his mind and said that the superiority of Stevenson over the novelist Hardy was that Stevenson was all life and Hardy, all death. The influence on the novelist Chesterton would also repay detailed study, for it was through him that Stevenson has managed to cross the ages, emerging as an influence on the modernist movement and our own contemporary Latin American school of magical realism.</p>\n<p>When making an assessment of his life and work, one question must inevitably be asked: was Robert Louis Stevenson Scotland's greatest writer of English prose? For most commentators this honour falls to Sir Walter Scott, author of Ivanhoe among many other classic novels, and it is true that in terms of craftsmanship, precision and the ability to minutely regulate language to create the desired effect, Scott takes the prize. However, this is not the same thing at all as inherent talent: by way of comparison one may take the example of the two great Russian composers Shostakovich and Prokofiev, of whom the former had learned more precise skills of execution but the latter's intrinsic genius was greater, and so it seems to be with Scott and Stevenson. Admittedly, Scott's detailed style does permit his stories to explore levels of tragedy that are beyond Stevenson's reach, but in this regard they have the musty smell of the museum, somehow artificial and removed from modern-day reality. On the other hand, Stevenson's skill with plotting and narrative give his books a timeless quality, so that they still live today. And Stevenson was also the shrewder judge of behaviour and psychology. For example, his compelling description of a man with a split personality in The Strange Case of Dr. Jekyll and Mr. Hyde has proved so accessible and accurate that the expression “Jekyll and Hyde” has entered common English usage. Even if we do not see a revival of critical interest in this great Scottish writer, it is to be hoped that readers go back to Robert Louis Stevenson's magnificent stories and reassess this neglected genius.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 27–31</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>27</strong> In the opinion of the writer, the biographers Balfour and Crouch</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A understated the role played by Stevenson's family</label></li>\n                        <li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B misunderstood Stevenson's religious beliefs</label></li>\n                        <li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C overestimated other writers' influence on Stevenson</label></li>\n                        <li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D elevated Stevenson above his true status as a writer</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> What is the writer's main point about Stevenson in the second paragraph?</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A The public judged him more fairly than the critics.</label></li>\n                        <li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B Recent criticism of him has been justified.</label></li>\n                        <li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C Critics argued that his style covered up his faults.</label></li>\n                        <li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D The ethical nature of his stories was often criticized.</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> According to the writer, the adventure story</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A is more appropriate for books than films</label></li>\n                        <li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B can be used by writers to tell moral stories</label></li>\n                        <li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C is more fashionable today than in the past</label></li>\n                        <li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D has been used by other writers but not Stevenson</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> What point does the writer make about Stevenson and Scotland?</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A His ideas contrasted with those of many Scots.</label></li>\n                        <li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B He demonstrated great sympathy for Scotland's problems.</label></li>\n                        <li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C He was not considered a true Scot as he was not born there.</label></li>\n                        <li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D His unflattering stories about Scotland angered many Scots.</label></li>\n                    </ul>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>31</strong> According to the writer, Stevenson's own lifestyle</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input name=\"q5\" type=\"radio\" value=\"A\"> A was envied by his friends</label></li>\n                        <li><label><input name=\"q5\" type=\"radio\" value=\"B\"> B was responsible for his early death</label></li>\n                        <li><label><input name=\"q5\" type=\"radio\" value=\"C\"> C attracted more attention than his books</label></li>\n                        <li><label><input name=\"q5\" type=\"radio\" value=\"D\"> D did not prepare him for living in Samoa</label></li>\n                    </ul>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> In the opinion of the writer, the biographers Balfour and Crouch</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A understated the role played by Stevenson's family</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B misunderstood Stevenson's religious beliefs</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C overestimated other writers' influence on Stevenson</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D elevated Stevenson above his true status as a writer</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> What is the writer's main point about Stevenson in the second paragraph?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A The public judged him more fairly than the critics.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B Recent criticism of him has been justified.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C Critics argued that his style covered up his faults.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D The ethical nature of his stories was often criticized.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> According to the writer, the adventure story</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A is more appropriate for books than films</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B can be used by writers to tell moral stories</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C is more fashionable today than in the past</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D has been used by other writers but not Stevenson</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What point does the writer make about Stevenson and Scotland?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A His ideas contrasted with those of many Scots.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B He demonstrated great sympathy for Scotland's problems.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C He was not considered a true Scot as he was not born there.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D His unflattering stories about Scotland angered many Scots.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> According to the writer, Stevenson's own lifestyle</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q5\" type=\"radio\" value=\"A\"> A was envied by his friends</label></li>\n<li><label><input name=\"q5\" type=\"radio\" value=\"B\"> B was responsible for his early death</label></li>\n<li><label><input name=\"q5\" type=\"radio\" value=\"C\"> C attracted more attention than his books</label></li>\n<li><label><input name=\"q5\" type=\"radio\" value=\"D\"> D did not prepare him for living in Samoa</label></li>\n</ul>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n                <h4>Questions 32–35</h4>\n                <p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n                <p>In boxes 32–35 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p><strong>32</strong> Although Oscar Wilde admired Robert Louis Stevenson very much, he believed Stevenson could have written greater works.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> Robert Louis Stevenson encouraged Oscar Wilde to start writing in the first place.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>34</strong> Galsworthy respected Hardy's works more than Stevenson's.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>35</strong> There is a need to study in detail Stevenson's influence on Chesterton.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 32–35 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>32</strong> Although Oscar Wilde admired Robert Louis Stevenson very much, he believed Stevenson could have written greater works.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Robert Louis Stevenson encouraged Oscar Wilde to start writing in the first place.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Galsworthy respected Hardy's works more than Stevenson's.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> There is a need to study in detail Stevenson's influence on Chesterton.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n                <h4>Questions 36–40</h4>\n                <p>Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n                <div class=\"summary-completion\">\n                    <h5>Sir Walter Scott and Robert Louis Stevenson</h5>\n                    <p>A lot of people believe that Sir Walter Scott and Robert Louis Stevenson are the most influential writers in the history of Scotland, but Sir Walter Scott is more proficient in<input type=\"text\" id=\"q36_input\" maxlength=\"1\" name=\"q10\">, while Stevenson has better<input type=\"text\" id=\"q37_input\" maxlength=\"1\" name=\"q11\">. Scott's books illustrate<input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\">, especially in terms of tragedy, but many readers prefer Stevenson's<input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\">. What's more, Stevenson's understanding of<input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"> gave his works a unique expression of the Scottish people.</p>\n                </div>\n                <div class=\"word-list\">\n                    <span><strong>A</strong> natural ability</span>\n                    <span><strong>B</strong> romance</span>\n                    <span><strong>C</strong> colorful language</span>\n                    <span><strong>D</strong> critical acclaim</span>\n                    <span><strong>E</strong> humor</span>\n                    <span><strong>F</strong> technical control</span>\n                    <span><strong>G</strong> storytelling</span>\n                    <span><strong>H</strong> depth</span>\n                    <span><strong>I</strong> human nature</span>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n<div class=\"summary-completion\">\n<h5>Sir Walter Scott and Robert Louis Stevenson</h5>\n<p>A lot of people believe that Sir Walter Scott and Robert Louis Stevenson are the most influential writers in the history of Scotland, but Sir Walter Scott is more proficient in<input type=\"text\" id=\"q36_input\" maxlength=\"1\" name=\"q10\">, while Stevenson has better<input type=\"text\" id=\"q37_input\" maxlength=\"1\" name=\"q11\">. Scott's books illustrate<input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\">, especially in terms of tragedy, but many readers prefer Stevenson's<input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\">. What's more, Stevenson's understanding of<input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"> gave his works a unique expression of the Scottish people.</p>\n</div>\n<div class=\"word-list\">\n<span><strong>A</strong> natural ability</span> <span><strong>B</strong> romance</span> <span><strong>C</strong> colorful language</span> <span><strong>D</strong> critical acclaim</span> <span><strong>E</strong> humor</span> <span><strong>F</strong> technical control</span> <span><strong>G</strong> storytelling</span> <span><strong>H</strong> depth</span> <span><strong>I</strong> human nature</span>\n</div>\n</div>"
     }
   ],
   "answerKey": {
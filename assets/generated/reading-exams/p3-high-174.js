@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Some views on the use of headphones</h3>\n            <h4>Whether wearing headphones at work, or in other areas of everyday life, is a good thing or a bad thing has generated a lot of research and opinion</h4>\n            \n            <p>To visit a typical modern office today is to walk into a room with possibly a dozen songs playing simultaneously but to hear none of them. Up to half of younger workers listen to music on their headphones, and nearly all of them think it makes them better at their jobs. In survey after survey, people report with confidence that music makes them happier, better at concentrating, and more productive.</p>\n            <p>Scientists do not share this belief; they maintain that listening to music hurts people's ability to recall other things they should be doing, and any pop song, loud or soft, reduces overall performance for both extroverts and introverts. A Taiwanese study linked music that has lyrics to lower marks on concentration tests for college students, and other research has shown music with lyrics scrambles our brains' verbal-processing skills. “As silence has the best overall performance, it would still be advisable that people work in silence,” another reporter dryly concluded.</p>\n            <p>The question is therefore: if headphones are so bad for productivity, why do so many people at work have them? One factor to consider is that countries like the USA have moved from a farming and manufacturing economy to a service economy, with an emphasis on jobs in offices that require higher levels of concentration, reflection and creativity. As an estimated 70 percent of office workers work in open-plan office spaces, it is more important to create one's own enclosing bubble of sound. Lending strength to the argument for headphones at work is evidence that music relaxes our muscles, improves our mood, and may even moderately reduce blood pressure, heart rate and anxiety.</p>\n            <p>The story of headphones began in 1910, when the US Navy received an odd letter written in purple ink on blue-and-pink paper. The letter writer, an eccentric inventor and repairman named Nathaniel Baldwin, from the US state of Utah, made what at the time was an astonishing claim: he had built, in his kitchen, a new kind of headset that could amplify sound. This was an opportune invention for the Navy, which asked for a sound test and then enthusiastically adopted the headsets, later called headphones, and used them in World War I for naval radio communication.</p>\n            <p>The purpose of headphones is to concentrate a quiet and private sound in the ear of the listener, which is a radical departure from music's social purpose in history. “Music, together with dance, co-evolved biologically and culturally to serve as a technology of social bonding,” Nils L. Wallin and Björn Merker wrote in The Origins of Music. Songs don't leave behind bones, but evidence of musical notation dates back to Sumeria, 3,500 years ago, and in 1995 archaeologists discovered a bone flute in southern Europe estimated to be 44,000 years old. If music evolved as a social glue for the species, as a way to make groups and keep them together, headphones have done what writing and literacy did for language - they made music private.</p>\n            <p>Author and columnist Stephen Marche wrote that separation from other people is one of the first things ordinary Americans spend their money achieving. It is “a by-product of a long-standing national appetite for independence,” he said. Americans are not alone in their desire for personal independence and privacy. Marche is right; wealth can buy – and modern technology can deliver – personal independence, and it is this that people have always sought.</p>\n            <p>Dr Michael Bull, an expert on personal music devices from the University of Sussex in the UK, has repeatedly made the larger point that personal music devices change how we relate to public spaces. Controlling our public spaces is more important now that more people are moving from the edges of cities to live in urban centres. \"With the urban space, the more it's inhabited, the safer you feel,” Bull says. “You feel safe if you can feel people there, but you don't want to interact with them.” Headphones create shields for wearers, separating them from other people and their surroundings. Headphones have their own rules of good manners; they are like wearing a “Do not disturb” sign. We assume that people wearing them are busy and we should respect their privacy, so now people wear them to appear busy. In fact, it is now becoming quite common for people not to listen to anything at all, but just to wear headphones.</p>\n            <p>However, as pointed out at the beginning of this piece, although scientists have stated that headphones are bad for productivity, people still wear them at work. It is not just that headphones create privacy out of public areas, but also that music causes people to relax and reflect and pause. The outcome of relaxation, reflection and pausing at work won't be captured in minute-to-minute productivity metrics. What must be considered is that in moments of extreme focus, our attention radiates outward, toward the problem, rather than inward, on how to solve the problem. However, with music “When our minds are at ease, we're more likely to direct the spotlight of attention inward,” Jonah Lehrer wrote in his book Imagine: How Creativity Works. “The answers have been there all along. We just weren't listening.\" In a crowded world, real estate is the ultimate scarce resource, and a headphone is a small invisible fence around our minds – making space, creating separation, and helping us listen to ourselves.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Some views on the use of headphones</h3>\n<h4>Whether wearing headphones at work, or in other areas of everyday life, is a good thing or a bad thing has generated a lot of research and opinion</h4>\n<p>To visit a typical modern office today is to walk into a room with possibly a dozen songs playing simultaneously but to hear none of them. Up to half of younger workers listen to music on their headphones, and nearly all of them think it makes them better at their jobs. In survey after survey, people report with confidence that music makes them happier, better at concentrating, and more productive.</p>\n<p>Scientists do not share this belief; they maintain that listening to music hurts people's ability to recall other things they should be doing, and any pop song, loud or soft, reduces overall performance for both extroverts and introverts. A Taiwanese study linked music that has lyrics to lower marks on concentration tests for college students, and other research has shown music with lyrics scrambles our brains' verbal-processing skills. “As silence has the best overall performance, it would still be advisable that people work in silence,” another reporter dryly concluded.</p>\n<p>The question is therefore: if headphones are so bad for productivity, why do so many people at work have them? One factor to consider is that countries like the USA have moved from a farming and manufacturing economy to a service economy, with an emphasis on jobs in offices that require higher levels of concentration, reflection and creativity. As an estimated 70 percent of office workers work in open-plan office spaces, it is more important to create one's own enclosing bubble of sound. Lending strength to the argument for headphones at work is evidence that music relaxes our muscles, improves our mood, and may even moderately reduce blood pressure, heart rate and anxiety.</p>\n<p>The story of headphones began in 1910, when the US Navy received an odd letter written in purple ink on blue-and-pink paper. The letter writer, an eccentric inventor and repairman named Nathaniel Baldwin, from the US state of Utah, made what at the time was an astonishing claim: he had built, in his kitchen, a new kind of headset that could amplify sound. This was an opportune invention for the Navy, which asked for a sound test and then enthusiastically adopted the headsets, later called headphones, and used them in World War I for naval radio communication.</p>\n<p>The purpose of headphones is to concentrate a quiet and private sound in the ear of the listener, which is a radical departure from music's social purpose in history. “Music, together with dance, co-evolved biologically and culturally to serve as a technology of social bonding,” Nils L. Wallin and Björn Merker wrote in The Origins of Music. Songs don't leave behind bones, but evidence of musical notation dates back to Sumeria, 3,500 years ago, and in 1995 archaeologists discovered a bone flute in southern Europe estimated to be 44,000 years old. If music evolved as a social glue for the species, as a way to make groups and keep them together, headphones have done what writing and literacy did for language - they made music private.</p>\n<p>Author and columnist Stephen Marche wrote that separation from other people is one of the first things ordinary Americans spend their money achieving. It is “a by-product of a long-standing national appetite for independence,” he said. Americans are not alone in their desire for personal independence and privacy. Marche is right; wealth can buy – and modern technology can deliver – personal independence, and it is this that people have always sought.</p>\n<p>Dr Michael Bull, an expert on personal music devices from the University of Sussex in the UK, has repeatedly made the larger point that personal music devices change how we relate to public spaces. Controlling our public spaces is more important now that more people are moving from the edges of cities to live in urban centres. \"With the urban space, the more it's inhabited, the safer you feel,” Bull says. “You feel safe if you can feel people there, but you don't want to interact with them.” Headphones create shields for wearers, separating them from other people and their surroundings. Headphones have their own rules of good manners; they are like wearing a “Do not disturb” sign. We assume that people wearing them are busy and we should respect their privacy, so now people wear them to appear busy. In fact, it is now becoming quite common for people not to listen to anything at all, but just to wear headphones.</p>\n<p>However, as pointed out at the beginning of this piece, although scientists have stated that headphones are bad for productivity, people still wear them at work. It is not just that headphones create privacy out of public areas, but also that music causes people to relax and reflect and pause. The outcome of relaxation, reflection and pausing at work won't be captured in minute-to-minute productivity metrics. What must be considered is that in moments of extreme focus, our attention radiates outward, toward the problem, rather than inward, on how to solve the problem. However, with music “When our minds are at ease, we're more likely to direct the spotlight of attention inward,” Jonah Lehrer wrote in his book Imagine: How Creativity Works. “The answers have been there all along. We just weren't listening.\" In a crowded world, real estate is the ultimate scarce resource, and a headphone is a small invisible fence around our minds – making space, creating separation, and helping us listen to ourselves.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 27–31</h4>\n                <p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n                <p>In boxes 27–31 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                \n                <div class=\"question-item\">\n                    <p><strong>27</strong> Young people are easily persuaded by surveys that listening to music is beneficial.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> Different studies share the same conclusions about the desirability of working in silence.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> Some doctors recommend wearing headphones to lower blood pressure.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> Nathaniel Baldwin was a respected government researcher.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>31</strong> The effect of the invention of headphones is comparable to the effect of the invention of writing.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 27–31 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> Young people are easily persuaded by surveys that listening to music is beneficial.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Different studies share the same conclusions about the desirability of working in silence.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Some doctors recommend wearing headphones to lower blood pressure.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Nathaniel Baldwin was a respected government researcher.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> The effect of the invention of headphones is comparable to the effect of the invention of writing.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -48,7 +48,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-10-anchor\">\n                <h4>Questions 32–36</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>32</strong> What does the writer suggest about a service economy?</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input name=\"q6\" type=\"radio\" value=\"A\"> A The work is mentally demanding</label></li>\n                        <li><label><input name=\"q6\" type=\"radio\" value=\"B\"> B It provides employment for younger workers</label></li>\n                        <li><label><input name=\"q6\" type=\"radio\" value=\"C\"> C It is a small part of a country's economy</label></li>\n                        <li><label><input name=\"q6\" type=\"radio\" value=\"D\"> D Workers have to live in urban centres</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> When the writer mentions the historical evidence for early music, he is</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input name=\"q7\" type=\"radio\" value=\"A\"> A emphasizing the diversity of musical forms</label></li>\n                        <li><label><input name=\"q7\" type=\"radio\" value=\"B\"> B expressing his frustration with the limited archaeological evidence uncovered</label></li>\n                        <li><label><input name=\"q7\" type=\"radio\" value=\"C\"> C lending support to the view that music has been important in human history</label></li>\n                        <li><label><input name=\"q7\" type=\"radio\" value=\"D\"> D creating a geographical map of the evolution of music</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>34</strong> What does the writer say about the social effects of listening to music through headphones?</p>\n                     <ul class=\"mcq-options\">\n                        <li><label><input name=\"q8\" type=\"radio\" value=\"A\"> A It has caused a reduction in the number of people who listen to music</label></li>\n                        <li><label><input name=\"q8\" type=\"radio\" value=\"B\"> B It has increased people's participation in music events</label></li>\n                        <li><label><input name=\"q8\" type=\"radio\" value=\"C\"> C It has reduced the global variation of music styles</label></li>\n                        <li><label><input name=\"q8\" type=\"radio\" value=\"D\"> D It has changed the traditional role of music in society</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>35</strong> What does the writer say about personal independence?</p>\n                     <ul class=\"mcq-options\">\n                        <li><label><input name=\"q9\" type=\"radio\" value=\"A\"> A Americans are unique in their desire for personal independence</label></li>\n                        <li><label><input name=\"q9\" type=\"radio\" value=\"B\"> B Personal independence is something that can be purchased</label></li>\n                        <li><label><input name=\"q9\" type=\"radio\" value=\"C\"> C Striving for personal independence is a recent phenomenon</label></li>\n                        <li><label><input name=\"q9\" type=\"radio\" value=\"D\"> D Personal independence destroys social connections</label></li>\n                    </ul>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>36</strong> Why does the writer quote Jonah Lehrer in the last paragraph?</p>\n                     <ul class=\"mcq-options\">\n                        <li><label><input name=\"q10\" type=\"radio\" value=\"A\"> A To support the writer's own view</label></li>\n                        <li><label><input name=\"q10\" type=\"radio\" value=\"B\"> B To draw attention to an authoritative book about music</label></li>\n                        <li><label><input name=\"q10\" type=\"radio\" value=\"C\"> C To raise awareness of people's loss of listening skills</label></li>\n                        <li><label><input name=\"q10\" type=\"radio\" value=\"D\"> D To illustrate how music brings people closer to each other</label></li>\n                    </ul>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-10-anchor\">\n<h4>Questions 32–36</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>32</strong> What does the writer suggest about a service economy?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q6\" type=\"radio\" value=\"A\"> A The work is mentally demanding</label></li>\n<li><label><input name=\"q6\" type=\"radio\" value=\"B\"> B It provides employment for younger workers</label></li>\n<li><label><input name=\"q6\" type=\"radio\" value=\"C\"> C It is a small part of a country's economy</label></li>\n<li><label><input name=\"q6\" type=\"radio\" value=\"D\"> D Workers have to live in urban centres</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> When the writer mentions the historical evidence for early music, he is</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q7\" type=\"radio\" value=\"A\"> A emphasizing the diversity of musical forms</label></li>\n<li><label><input name=\"q7\" type=\"radio\" value=\"B\"> B expressing his frustration with the limited archaeological evidence uncovered</label></li>\n<li><label><input name=\"q7\" type=\"radio\" value=\"C\"> C lending support to the view that music has been important in human history</label></li>\n<li><label><input name=\"q7\" type=\"radio\" value=\"D\"> D creating a geographical map of the evolution of music</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> What does the writer say about the social effects of listening to music through headphones?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q8\" type=\"radio\" value=\"A\"> A It has caused a reduction in the number of people who listen to music</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"B\"> B It has increased people's participation in music events</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"C\"> C It has reduced the global variation of music styles</label></li>\n<li><label><input name=\"q8\" type=\"radio\" value=\"D\"> D It has changed the traditional role of music in society</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> What does the writer say about personal independence?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q9\" type=\"radio\" value=\"A\"> A Americans are unique in their desire for personal independence</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"B\"> B Personal independence is something that can be purchased</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"C\"> C Striving for personal independence is a recent phenomenon</label></li>\n<li><label><input name=\"q9\" type=\"radio\" value=\"D\"> D Personal independence destroys social connections</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> Why does the writer quote Jonah Lehrer in the last paragraph?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q10\" type=\"radio\" value=\"A\"> A To support the writer's own view</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"B\"> B To draw attention to an authoritative book about music</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"C\"> C To raise awareness of people's loss of listening skills</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"D\"> D To illustrate how music brings people closer to each other</label></li>\n</ul>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n                 <h4>Questions 37–40</h4>\n                <p>Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n                <div class=\"summary-completion\">\n                    <h5>Headphones and city living</h5>\n                    <p>Dr Michael Bull believes that listening to music through headphones has changed the <input type=\"text\" id=\"q37_input\" maxlength=\"1\" name=\"q11\"> the wearers of headphones have with public spaces. Living in the centre of cities is becoming popular, as people become less keen on living in the <input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\">. In densely populated city centres, headphones form <input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\"> that isolate people from fellow citizens and from their environment. Wearers of headphones are treated with <input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"> that other people do not receive. This is because if we see someone wearing headphones, we believe they must be occupied in some way and should not be interrupted.</p>\n                </div>\n                <div class=\"word-list\">\n                    <span><strong>A</strong> courtesy</span>\n                    <span><strong>B</strong> relationship</span>\n                    <span><strong>C</strong> difficulty</span>\n                    <span><strong>D</strong> countryside</span>\n                    <span><strong>E</strong> suburbs</span>\n                    <span><strong>F</strong> language</span>\n                    <span><strong>G</strong> barriers</span>\n                    <span><strong>H</strong> obstacles</span>\n                    <span><strong>I</strong> disapproval</span>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n<div class=\"summary-completion\">\n<h5>Headphones and city living</h5>\n<p>Dr Michael Bull believes that listening to music through headphones has changed the <input type=\"text\" id=\"q37_input\" maxlength=\"1\" name=\"q11\"> the wearers of headphones have with public spaces. Living in the centre of cities is becoming popular, as people become less keen on living in the <input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\">. In densely populated city centres, headphones form <input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\"> that isolate people from fellow citizens and from their environment. Wearers of headphones are treated with <input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"> that other people do not receive. This is because if we see someone wearing headphones, we believe they must be occupied in some way and should not be interrupted.</p>\n</div>\n<div class=\"word-list\">\n<span><strong>A</strong> courtesy</span> <span><strong>B</strong> relationship</span> <span><strong>C</strong> difficulty</span> <span><strong>D</strong> countryside</span> <span><strong>E</strong> suburbs</span> <span><strong>F</strong> language</span> <span><strong>G</strong> barriers</span> <span><strong>H</strong> obstacles</span> <span><strong>I</strong> disapproval</span>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -13,14 +13,14 @@
     "pdfFilename": "91. P3 - The New Zealand writer Margaret Mahy 新西兰女作家【高】.pdf",
     "legacyPath": "睡着过项目组/2. 所有文章(11.20)[192篇]/91. P3 - The New Zealand writer Margaret Mahy 新西兰女作家【高】/",
     "legacyFilename": "91. P3 - The New Zealand writer Margaret Mahy 新西兰女作家【高】.html",
-    "questionIntroHtml": "<h2>Questions</h2>\n\n      <div class=\"question-group\" id=\"q1-31-section\">\n        <h4>Questions 27–31</h4>\n        <p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n        <p>In boxes 27–31 on your answer sheet, write</p>\n        <ul style=\"list-style: none; padding-left: 0;\">\n            <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n            <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n            <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n        </ul>\n        \n        <div class=\"question-item\">\n            <p><strong>27</strong> Mahy explores the traditional themes of New Zealand literature.</p>\n            <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n              <label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label>\n              <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label>\n              <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n            </div>\n        </div>\n        <div class=\"question-item\">\n            <p><strong>28</strong> Mahy's children's books have been more popular than her teenage books.</p>\n            <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n              <label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label>\n              <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label>\n              <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n            </div>\n        </div>\n        <div class=\"question-item\">\n            <p><strong>29</strong> Mahy and Knox have sometimes criticised each other's work.</p>\n            <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n              <label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label>\n              <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label>\n              <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n            </div>\n        </div>\n        <div class=\"question-item\">\n            <p><strong>30</strong> Mahy is welcoming to interviewers.</p>\n            <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n              <label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label>\n              <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label>\n              <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n            </div>\n        </div>\n        <div class=\"question-item\">\n            <p><strong>31</strong> Mahy is at ease speaking about her experiences.</p>\n            <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n              <label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label>\n              <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label>\n              <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n            </div>\n        </div>\n      </div>\n\n      <div class=\"question-group\" id=\"q6-35-section\">\n        <h4>Questions 32–35</h4>\n        <p>Complete the summary below using the list of words and phrases A–I.</p>\n        <div class=\"summary-text\">\n            <h4>Theories about Mahy's style</h4>\n            <p>\n              Mahy's determination to earn a living from writing has encouraged her to find the ideas for her work in <strong>32</strong> <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> places. The stories themselves are set in locations that are <strong>33</strong> <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span>. In terms of characterisation, almost all of her books feature unruly people, and very often an adolescent who possesses <strong>34</strong> <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> abilities. Finally, the endings of the stories tend to be <strong>35</strong> <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span>.\n            </p>\n        </div>\n        <div id=\"word-options\">\n          <div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"A\">A disruptive and unpredictable</div>\n          <div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"B\">B everyday</div>\n          <div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"C\">C loveable</div>\n          <div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"D\">D controversial</div>\n          <div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"E\">E exotic and ordinary</div>\n          <div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"F\">F isolated</div>\n          <div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"G\">G unconfident</div>\n          <div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"H\">H unsurprising but satisfying</div>\n          <div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-word=\"I\">I magical</div>\n        </div>\n      </div>\n      \n      <div class=\"question-group\" id=\"q10-40-section\">\n        <h4>Questions 36–40</h4>\n        <p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n        <div class=\"question-item\">\n            <p><strong>36</strong> What does the writer say about <i>The Magician of Hoad</i>?</p>\n            <ul class=\"radio-options-list\">\n              <li><label><input name=\"q10\" type=\"radio\" value=\"A\"> A It is partly based on true history.</label></li>\n              <li><label><input name=\"q10\" type=\"radio\" value=\"B\"> B It was restructured in the writing process.</label></li>\n              <li><label><input name=\"q10\" type=\"radio\" value=\"C\"> C It is quite different from conventional stories.</label></li>\n              <li><label><input name=\"q10\" type=\"radio\" value=\"D\"> D It does not reflect the usual themes of Mahy's work.</label></li>\n            </ul>\n        </div>\n        <div class=\"question-item\">\n            <p><strong>37</strong> According to the writer, <i>Bubble Trouble</i></p>\n            <ul class=\"radio-options-list\">\n              <li><label><input name=\"q11\" type=\"radio\" value=\"A\"> A was first illustrated in 1991.</label></li>\n              <li><label><input name=\"q11\" type=\"radio\" value=\"B\"> B is written in plain language.</label></li>\n              <li><label><input name=\"q11\" type=\"radio\" value=\"C\"> C is an old favourite for many families.</label></li>\n              <li><label><input name=\"q11\" type=\"radio\" value=\"D\"> D has not been read aloud by Mahy before.</label></li>\n            </ul>\n        </div>\n        <div class=\"question-item\">\n            <p><strong>38</strong> The writer's purpose in the fifth paragraph is to</p>\n            <ul class=\"radio-options-list\">\n              <li><label><input name=\"q12\" type=\"radio\" value=\"A\"> A show how Mahy's style has changed through generations.</label></li>\n              <li><label><input name=\"q12\" type=\"radio\" value=\"B\"> B criticise Mahy's children's stories for being repetitive.</label></li>\n              <li><label><input name=\"q12\" type=\"radio\" value=\"C\"> C describe how new media have changed entertainment.</label></li>\n              <li><label><input name=\"q12\" type=\"radio\" value=\"D\"> D illustrate Mahy's popularity with generations of children.</label></li>\n            </ul>\n        </div>\n        <div class=\"question-item\">\n            <p><strong>39</strong> According to the sixth paragraph, which of the following is true?</p>\n            <ul class=\"radio-options-list\">\n              <li><label><input name=\"q13\" type=\"radio\" value=\"A\"> A Readers sometimes do not finish Mahy's books.</label></li>\n              <li><label><input name=\"q13\" type=\"radio\" value=\"B\"> B Mahy actively encourages feedback from readers.</label></li>\n              <li><label><input name=\"q13\" type=\"radio\" value=\"C\"> C Readers are necessary in order to complete a book.</label></li>\n              <li><label><input name=\"q13\" type=\"radio\" value=\"D\"> D Mahy does not realise how important she is to some readers.</label></li>\n            </ul>\n        </div>\n        <div class=\"question-item\">\n            <p><strong>40</strong> What is the writer doing in the final paragraph?</p>\n            <ul class=\"radio-options-list\">\n              <li><label><input name=\"q14\" type=\"radio\" value=\"A\"> A illustrating Mahy's view of the world</label></li>\n              <li><label><input name=\"q14\" type=\"radio\" value=\"B\"> B comparing Mahy with another writer</label></li>\n              <li><label><input name=\"q14\" type=\"radio\" value=\"C\"> C correcting a misconception about Mahy</label></li>\n              <li><label><input name=\"q14\" type=\"radio\" value=\"D\"> D suggesting reasons for Mahy's approach</label></li>\n            </ul>\n        </div>\n      </div>"
+    "questionIntroHtml": "<h2>Questions</h2>\n<div class=\"question-group\" id=\"q1-31-section\">\n<h4>Questions 27–31</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 27–31 on your answer sheet, write</p>\n<ul style=\"list-style: none; padding-left: 0;\">\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> Mahy explores the traditional themes of New Zealand literature.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Mahy's children's books have been more popular than her teenage books.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Mahy and Knox have sometimes criticised each other's work.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Mahy is welcoming to interviewers.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> Mahy is at ease speaking about her experiences.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q6-35-section\">\n<h4>Questions 32–35</h4>\n<p>Complete the summary below using the list of words and phrases A–I.</p>\n<div class=\"summary-text\">\n<h4>Theories about Mahy's style</h4>\n<p>\nMahy's determination to earn a living from writing has encouraged her to find the ideas for her work in <strong>32</strong> <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> places. The stories themselves are set in locations that are <strong>33</strong> <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span>. In terms of characterisation, almost all of her books feature unruly people, and very often an adolescent who possesses <strong>34</strong> <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> abilities. Finally, the endings of the stories tend to be <strong>35</strong> <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span>.\n</p>\n</div>\n<div id=\"word-options\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"A\">A disruptive and unpredictable</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"B\">B everyday</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"C\">C loveable</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"D\">D controversial</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"E\">E exotic and ordinary</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"F\">F isolated</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"G\">G unconfident</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"H\">H unsurprising but satisfying</div>\n<div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-word=\"I\">I magical</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q10-40-section\">\n<h4>Questions 36–40</h4>\n<p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>36</strong> What does the writer say about <i>The Magician of Hoad</i>?</p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q10\" type=\"radio\" value=\"A\"> A It is partly based on true history.</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"B\"> B It was restructured in the writing process.</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"C\"> C It is quite different from conventional stories.</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"D\"> D It does not reflect the usual themes of Mahy's work.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> According to the writer, <i>Bubble Trouble</i></p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q11\" type=\"radio\" value=\"A\"> A was first illustrated in 1991.</label></li>\n<li><label><input name=\"q11\" type=\"radio\" value=\"B\"> B is written in plain language.</label></li>\n<li><label><input name=\"q11\" type=\"radio\" value=\"C\"> C is an old favourite for many families.</label></li>\n<li><label><input name=\"q11\" type=\"radio\" value=\"D\"> D has not been read aloud by Mahy before.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> The writer's purpose in the fifth paragraph is to</p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q12\" type=\"radio\" value=\"A\"> A show how Mahy's style has changed through generations.</label></li>\n<li><label><input name=\"q12\" type=\"radio\" value=\"B\"> B criticise Mahy's children's stories for being repetitive.</label></li>\n<li><label><input name=\"q12\" type=\"radio\" value=\"C\"> C describe how new media have changed entertainment.</label></li>\n<li><label><input name=\"q12\" type=\"radio\" value=\"D\"> D illustrate Mahy's popularity with generations of children.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> According to the sixth paragraph, which of the following is true?</p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q13\" type=\"radio\" value=\"A\"> A Readers sometimes do not finish Mahy's books.</label></li>\n<li><label><input name=\"q13\" type=\"radio\" value=\"B\"> B Mahy actively encourages feedback from readers.</label></li>\n<li><label><input name=\"q13\" type=\"radio\" value=\"C\"> C Readers are necessary in order to complete a book.</label></li>\n<li><label><input name=\"q13\" type=\"radio\" value=\"D\"> D Mahy does not realise how important she is to some readers.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> What is the writer doing in the final paragraph?</p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q14\" type=\"radio\" value=\"A\"> A illustrating Mahy's view of the world</label></li>\n<li><label><input name=\"q14\" type=\"radio\" value=\"B\"> B comparing Mahy with another writer</label></li>\n<li><label><input name=\"q14\" type=\"radio\" value=\"C\"> C correcting a misconception about Mahy</label></li>\n<li><label><input name=\"q14\" type=\"radio\" value=\"D\"> D suggesting reasons for Mahy's approach</label></li>\n</ul>\n</div>\n</div>"
   },
   "passage": {
     "blocks": [
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n        <p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3.</p>\n        \n        <h3>The New Zealand writer Margaret Mahy</h3>\n\n        <p>In a career spanning some fifty years, Margaret Mahy has come to occupy a unique place in New Zealand writing with innovative fiction and original characterisation. In our solidly realist tradition, the linguistic fireworks of Mahy's children's fiction and the explorations of human behaviour at the heart of her supernatural teenage fiction stand gloriously alone. Mahy's clearest heir, I have always thought, is Elizabeth Knox – and maybe the true inheritance there is sheer singularity. Just as there is no one else like Knox in New Zealand writing, Mahy, too, has ventured into imaginative territory unknown to other local writers. So it was with great pleasure that I visited Mahy recently at her Governor's Bay home to talk about her new book. As with all journalists, she is generous to a fault with her time and attention; and, as always — despite her careful consideration of questions and thoughtful answers — I'm reminded she isn't truly comfortable making herself or her life the heart of any conversation.</p>\n        <p>Certainly, any consideration of the style of Mahy's novels and picture books throws up some irresistible theories. As a writer committed to supporting herself through her art, she has seldom had the time for formal research. Rather, it has been a matter of going out and finding inspiration from her immediate environment: the writing on the side of a bus; a spelling mistake in a note to herself; the similarity between a cat and a fur hat. But despite these sometimes mundane origins, the settings for her stories are delightfully varied, as these books celebrate the dramatic plot twists and unpredictability of adventures on the high seas or in Antarctica, and also in quite unassuming places like the library or even down the back of a chair at home. Mahy has a lifelong affection for characters who are agents of upheaval and disturbance. Her junior and picture books are peppered with pirates, robbers and lions, though they appear alongside librarians, mothers and children, working against comfortable stereotype. Her fictions often have at their heart a young adult burdened with special powers, such as the ability to cast spells in order to transform their world in supernatural and fantastical ways. Another common feature is that, while the conclusions of her tales are usually predictable, they leave the reader feeling absolutely complete, the moral questions resulting from our hero's powers having been resolved.</p>\n        <p>Many of these themes can be found in her new novel, The Magician of Hoad. The book was begun more than 15 years ago and envisioned as an ‘entire' fantasy — one set in a fully imagined world with detailed history and complex tribal inter-relationships, a classical hero quest at its heart. The story ballooned at one point to 800 pages and has been through at least two substantial rewrites. Now half its original size, it is a fascinating read — an adventure, a romance, and a gold mine of Mahy literary preoccupations.</p>\n        <p>The other splendid Mahy publication this year is a re-issue of Bubble Trouble in a now-illustrated edition. This tongue-twister tale first appeared in 1991, was included in 100 New Zealand Poems (1993) and has been recited by Mahy at countless private and public functions. Perhaps more than any other work, Bubble Trouble is the Mahy that New Zealand children and their parents know so well, the rollicking story of a clown who serves up a joyous torrent of word-play and unexpected rhyme.</p>\n        <p>Those connections are four or five deep now. I read The Lion in the Meadow in the School Journal in the late 1960s; my step-daughter listened to The Boy Who Was Followed Home over and over in the 1970s; my own children sat very still mouthing The Great White Man-Eating Shark in the 80s and 90s; now, in the 21st century, my grandchildren have heard Down the Dragon's Tongue, A Summery Saturday Morning and Dashing Dog many times.</p>\n        <p>Of course, readers are important to any working writer, but Mahy's espousal of the act of reading goes beyond that: a book is not properly finished, she has often said, until it has been read, because a reader brings something important to the book. So, doubtless out of need to build a market — she's not ignorant of her popularity — but also out of genuine care for that other dynamic part of the author-reader relationship, Mahy has, until recently, kept up a punishing schedule of public appearances.</p>\n        <p>Private conversation with Mahy has always been a wild ride — marvellous, in the true sense of the word, the product of a hungry head and an infinite capacity to be astonished. She races away at one stage to consult an encyclopaedia for L. M. Montgomery's date of death, and speculates about the 'real' Montgomery, creator of the ever-popular Anne of Green Gables. Although I'd come to talk about her new book, I couldn't help but be captivated by her infectious curiosity.</p>\n        <p>A few years ago, the writer David Hill told a funny story. Though his writing was, he conceded, very different from Mahy's, he had been affected by her peculiarly alert way of looking at the world, particularly the mad, slippery life of language. Once, Hill said, in a motel room, a sign on a door caught his eye: ‘This door is alarmed.' Mahy would like that, thought Hill. She would enjoy the comedy just below the surface of the formal warning; she would leap immediately to the possibilities for story and language play: 'Yes, and this window is concerned, this light fitting is irritated.' His story was a wonderful comment on Mahy's vision.</p>\n        \n        <div class=\"empty-space\"></div>\n    </div>\n\n    <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3.</p>\n<h3>The New Zealand writer Margaret Mahy</h3>\n<p>In a career spanning some fifty years, Margaret Mahy has come to occupy a unique place in New Zealand writing with innovative fiction and original characterisation. In our solidly realist tradition, the linguistic fireworks of Mahy's children's fiction and the explorations of human behaviour at the heart of her supernatural teenage fiction stand gloriously alone. Mahy's clearest heir, I have always thought, is Elizabeth Knox – and maybe the true inheritance there is sheer singularity. Just as there is no one else like Knox in New Zealand writing, Mahy, too, has ventured into imaginative territory unknown to other local writers. So it was with great pleasure that I visited Mahy recently at her Governor's Bay home to talk about her new book. As with all journalists, she is generous to a fault with her time and attention; and, as always — despite her careful consideration of questions and thoughtful answers — I'm reminded she isn't truly comfortable making herself or her life the heart of any conversation.</p>\n<p>Certainly, any consideration of the style of Mahy's novels and picture books throws up some irresistible theories. As a writer committed to supporting herself through her art, she has seldom had the time for formal research. Rather, it has been a matter of going out and finding inspiration from her immediate environment: the writing on the side of a bus; a spelling mistake in a note to herself; the similarity between a cat and a fur hat. But despite these sometimes mundane origins, the settings for her stories are delightfully varied, as these books celebrate the dramatic plot twists and unpredictability of adventures on the high seas or in Antarctica, and also in quite unassuming places like the library or even down the back of a chair at home. Mahy has a lifelong affection for characters who are agents of upheaval and disturbance. Her junior and picture books are peppered with pirates, robbers and lions, though they appear alongside librarians, mothers and children, working against comfortable stereotype. Her fictions often have at their heart a young adult burdened with special powers, such as the ability to cast spells in order to transform their world in supernatural and fantastical ways. Another common feature is that, while the conclusions of her tales are usually predictable, they leave the reader feeling absolutely complete, the moral questions resulting from our hero's powers having been resolved.</p>\n<p>Many of these themes can be found in her new novel, The Magician of Hoad. The book was begun more than 15 years ago and envisioned as an ‘entire' fantasy — one set in a fully imagined world with detailed history and complex tribal inter-relationships, a classical hero quest at its heart. The story ballooned at one point to 800 pages and has been through at least two substantial rewrites. Now half its original size, it is a fascinating read — an adventure, a romance, and a gold mine of Mahy literary preoccupations.</p>\n<p>The other splendid Mahy publication this year is a re-issue of Bubble Trouble in a now-illustrated edition. This tongue-twister tale first appeared in 1991, was included in 100 New Zealand Poems (1993) and has been recited by Mahy at countless private and public functions. Perhaps more than any other work, Bubble Trouble is the Mahy that New Zealand children and their parents know so well, the rollicking story of a clown who serves up a joyous torrent of word-play and unexpected rhyme.</p>\n<p>Those connections are four or five deep now. I read The Lion in the Meadow in the School Journal in the late 1960s; my step-daughter listened to The Boy Who Was Followed Home over and over in the 1970s; my own children sat very still mouthing The Great White Man-Eating Shark in the 80s and 90s; now, in the 21st century, my grandchildren have heard Down the Dragon's Tongue, A Summery Saturday Morning and Dashing Dog many times.</p>\n<p>Of course, readers are important to any working writer, but Mahy's espousal of the act of reading goes beyond that: a book is not properly finished, she has often said, until it has been read, because a reader brings something important to the book. So, doubtless out of need to build a market — she's not ignorant of her popularity — but also out of genuine care for that other dynamic part of the author-reader relationship, Mahy has, until recently, kept up a punishing schedule of public appearances.</p>\n<p>Private conversation with Mahy has always been a wild ride — marvellous, in the true sense of the word, the product of a hungry head and an infinite capacity to be astonished. She races away at one stage to consult an encyclopaedia for L. M. Montgomery's date of death, and speculates about the 'real' Montgomery, creator of the ever-popular Anne of Green Gables. Although I'd come to talk about her new book, I couldn't help but be captivated by her infectious curiosity.</p>\n<p>A few years ago, the writer David Hill told a funny story. Though his writing was, he conceded, very different from Mahy's, he had been affected by her peculiarly alert way of looking at the world, particularly the mad, slippery life of language. Once, Hill said, in a motel room, a sign on a door caught his eye: ‘This door is alarmed.' Mahy would like that, thought Hill. She would enjoy the comedy just below the surface of the formal warning; she would leap immediately to the possibilities for story and language play: 'Yes, and this window is concerned, this light fitting is irritated.' His story was a wonderful comment on Mahy's vision.</p>\n<div class=\"empty-space\"></div>\n</div>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -44,7 +44,7 @@
         "q13",
         "q14"
       ],
-      "leadHtml": "<h2>Questions</h2>\n\n      <div class=\"question-group\" id=\"q1-31-section\">\n        <h4>Questions 27–31</h4>\n        <p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n        <p>In boxes 27–31 on your answer sheet, write</p>\n        <ul style=\"list-style: none; padding-left: 0;\">\n            <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n            <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n            <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n        </ul>\n        \n        <div class=\"question-item\">\n            <p><strong>27</strong> Mahy explores the traditional themes of New Zealand literature.</p>\n            <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n              <label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label>\n              <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label>\n              <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n            </div>\n        </div>\n        <div class=\"question-item\">\n            <p><strong>28</strong> Mahy's children's books have been more popular than her teenage books.</p>\n            <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n              <label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label>\n              <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label>\n              <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n            </div>\n        </div>\n        <div class=\"question-item\">\n            <p><strong>29</strong> Mahy and Knox have sometimes criticised each other's work.</p>\n            <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n              <label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label>\n              <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label>\n              <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n            </div>\n        </div>\n        <div class=\"question-item\">\n            <p><strong>30</strong> Mahy is welcoming to interviewers.</p>\n            <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n              <label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label>\n              <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label>\n              <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n            </div>\n        </div>\n        <div class=\"question-item\">\n            <p><strong>31</strong> Mahy is at ease speaking about her experiences.</p>\n            <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n              <label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label>\n              <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label>\n              <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n            </div>\n        </div>\n      </div>\n\n      <div class=\"question-group\" id=\"q6-35-section\">\n        <h4>Questions 32–35</h4>\n        <p>Complete the summary below using the list of words and phrases A–I.</p>\n        <div class=\"summary-text\">\n            <h4>Theories about Mahy's style</h4>\n            <p>\n              Mahy's determination to earn a living from writing has encouraged her to find the ideas for her work in <strong>32</strong> <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> places. The stories themselves are set in locations that are <strong>33</strong> <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span>. In terms of characterisation, almost all of her books feature unruly people, and very often an adolescent who possesses <strong>34</strong> <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> abilities. Finally, the endings of the stories tend to be <strong>35</strong> <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span>.\n            </p>\n        </div>\n        <div id=\"word-options\">\n          <div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"A\">A disruptive and unpredictable</div>\n          <div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"B\">B everyday</div>\n          <div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"C\">C loveable</div>\n          <div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"D\">D controversial</div>\n          <div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"E\">E exotic and ordinary</div>\n          <div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"F\">F isolated</div>\n          <div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"G\">G unconfident</div>\n          <div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"H\">H unsurprising but satisfying</div>\n          <div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-word=\"I\">I magical</div>\n        </div>\n      </div>\n      \n      <div class=\"question-group\" id=\"q10-40-section\">\n        <h4>Questions 36–40</h4>\n        <p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n        <div class=\"question-item\">\n            <p><strong>36</strong> What does the writer say about <i>The Magician of Hoad</i>?</p>\n            <ul class=\"radio-options-list\">\n              <li><label><input name=\"q10\" type=\"radio\" value=\"A\"> A It is partly based on true history.</label></li>\n              <li><label><input name=\"q10\" type=\"radio\" value=\"B\"> B It was restructured in the writing process.</label></li>\n              <li><label><input name=\"q10\" type=\"radio\" value=\"C\"> C It is quite different from conventional stories.</label></li>\n              <li><label><input name=\"q10\" type=\"radio\" value=\"D\"> D It does not reflect the usual themes of Mahy's work.</label></li>\n            </ul>\n        </div>\n        <div class=\"question-item\">\n            <p><strong>37</strong> According to the writer, <i>Bubble Trouble</i></p>\n            <ul class=\"radio-options-list\">\n              <li><label><input name=\"q11\" type=\"radio\" value=\"A\"> A was first illustrated in 1991.</label></li>\n              <li><label><input name=\"q11\" type=\"radio\" value=\"B\"> B is written in plain language.</label></li>\n              <li><label><input name=\"q11\" type=\"radio\" value=\"C\"> C is an old favourite for many families.</label></li>\n              <li><label><input name=\"q11\" type=\"radio\" value=\"D\"> D has not been read aloud by Mahy before.</label></li>\n            </ul>\n        </div>\n        <div class=\"question-item\">\n            <p><strong>38</strong> The writer's purpose in the fifth paragraph is to</p>\n            <ul class=\"radio-options-list\">\n              <li><label><input name=\"q12\" type=\"radio\" value=\"A\"> A show how Mahy's style has changed through generations.</label></li>\n              <li><label><input name=\"q12\" type=\"radio\" value=\"B\"> B criticise Mahy's children's stories for being repetitive.</label></li>\n              <li><label><input name=\"q12\" type=\"radio\" value=\"C\"> C describe how new media have changed entertainment.</label></li>\n              <li><label><input name=\"q12\" type=\"radio\" value=\"D\"> D illustrate Mahy's popularity with generations of children.</label></li>\n            </ul>\n        </div>\n        <div class=\"question-item\">\n            <p><strong>39</strong> According to the sixth paragraph, which of the following is true?</p>\n            <ul class=\"radio-options-list\">\n              <li><label><input name=\"q13\" type=\"radio\" value=\"A\"> A Readers sometimes do not finish Mahy's books.</label></li>\n              <li><label><input name=\"q13\" type=\"radio\" value=\"B\"> B Mahy actively encourages feedback from readers.</label></li>\n              <li><label><input name=\"q13\" type=\"radio\" value=\"C\"> C Readers are necessary in order to complete a book.</label></li>\n              <li><label><input name=\"q13\" type=\"radio\" value=\"D\"> D Mahy does not realise how important she is to some readers.</label></li>\n            </ul>\n        </div>\n        <div class=\"question-item\">\n            <p><strong>40</strong> What is the writer doing in the final paragraph?</p>\n            <ul class=\"radio-options-list\">\n              <li><label><input name=\"q14\" type=\"radio\" value=\"A\"> A illustrating Mahy's view of the world</label></li>\n              <li><label><input name=\"q14\" type=\"radio\" value=\"B\"> B comparing Mahy with another writer</label></li>\n              <li><label><input name=\"q14\" type=\"radio\" value=\"C\"> C correcting a misconception about Mahy</label></li>\n              <li><label><input name=\"q14\" type=\"radio\" value=\"D\"> D suggesting reasons for Mahy's approach</label></li>\n            </ul>\n        </div>\n      </div>",
+      "leadHtml": "<h2>Questions</h2>\n<div class=\"question-group\" id=\"q1-31-section\">\n<h4>Questions 27–31</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 27–31 on your answer sheet, write</p>\n<ul style=\"list-style: none; padding-left: 0;\">\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> Mahy explores the traditional themes of New Zealand literature.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Mahy's children's books have been more popular than her teenage books.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Mahy and Knox have sometimes criticised each other's work.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Mahy is welcoming to interviewers.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> Mahy is at ease speaking about her experiences.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin-top:10px;\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q6-35-section\">\n<h4>Questions 32–35</h4>\n<p>Complete the summary below using the list of words and phrases A–I.</p>\n<div class=\"summary-text\">\n<h4>Theories about Mahy's style</h4>\n<p>\nMahy's determination to earn a living from writing has encouraged her to find the ideas for her work in <strong>32</strong> <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> places. The stories themselves are set in locations that are <strong>33</strong> <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span>. In terms of characterisation, almost all of her books feature unruly people, and very often an adolescent who possesses <strong>34</strong> <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> abilities. Finally, the endings of the stories tend to be <strong>35</strong> <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span>.\n</p>\n</div>\n<div id=\"word-options\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"A\">A disruptive and unpredictable</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"B\">B everyday</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"C\">C loveable</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"D\">D controversial</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"E\">E exotic and ordinary</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"F\">F isolated</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"G\">G unconfident</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"H\">H unsurprising but satisfying</div>\n<div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-word=\"I\">I magical</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q10-40-section\">\n<h4>Questions 36–40</h4>\n<p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>36</strong> What does the writer say about <i>The Magician of Hoad</i>?</p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q10\" type=\"radio\" value=\"A\"> A It is partly based on true history.</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"B\"> B It was restructured in the writing process.</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"C\"> C It is quite different from conventional stories.</label></li>\n<li><label><input name=\"q10\" type=\"radio\" value=\"D\"> D It does not reflect the usual themes of Mahy's work.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> According to the writer, <i>Bubble Trouble</i></p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q11\" type=\"radio\" value=\"A\"> A was first illustrated in 1991.</label></li>\n<li><label><input name=\"q11\" type=\"radio\" value=\"B\"> B is written in plain language.</label></li>\n<li><label><input name=\"q11\" type=\"radio\" value=\"C\"> C is an old favourite for many families.</label></li>\n<li><label><input name=\"q11\" type=\"radio\" value=\"D\"> D has not been read aloud by Mahy before.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> The writer's purpose in the fifth paragraph is to</p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q12\" type=\"radio\" value=\"A\"> A show how Mahy's style has changed through generations.</label></li>\n<li><label><input name=\"q12\" type=\"radio\" value=\"B\"> B criticise Mahy's children's stories for being repetitive.</label></li>\n<li><label><input name=\"q12\" type=\"radio\" value=\"C\"> C describe how new media have changed entertainment.</label></li>\n<li><label><input name=\"q12\" type=\"radio\" value=\"D\"> D illustrate Mahy's popularity with generations of children.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> According to the sixth paragraph, which of the following is true?</p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q13\" type=\"radio\" value=\"A\"> A Readers sometimes do not finish Mahy's books.</label></li>\n<li><label><input name=\"q13\" type=\"radio\" value=\"B\"> B Mahy actively encourages feedback from readers.</label></li>\n<li><label><input name=\"q13\" type=\"radio\" value=\"C\"> C Readers are necessary in order to complete a book.</label></li>\n<li><label><input name=\"q13\" type=\"radio\" value=\"D\"> D Mahy does not realise how important she is to some readers.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> What is the writer doing in the final paragraph?</p>\n<ul class=\"radio-options-list\">\n<li><label><input name=\"q14\" type=\"radio\" value=\"A\"> A illustrating Mahy's view of the world</label></li>\n<li><label><input name=\"q14\" type=\"radio\" value=\"B\"> B comparing Mahy with another writer</label></li>\n<li><label><input name=\"q14\" type=\"radio\" value=\"C\"> C correcting a misconception about Mahy</label></li>\n<li><label><input name=\"q14\" type=\"radio\" value=\"D\"> D suggesting reasons for Mahy's approach</label></li>\n</ul>\n</div>\n</div>",
       "bodyHtml": ""
     }
   ],
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>The tuatara – past and future</h3>\n            \n            <p>The New Zealand species of lizard, the tuatara, is firmly embedded in the national psyche: an icon for today which dates from the age of dinosaurs; an ancient reptile commemorated on the back of the five-cent coin. New Zealanders feel an affinity with the tuatara, and accept that active conservation management is required to ensure it will be among the legacies left to future generations.</p>\n            <p>When European explorers reached New Zealand in 1769 they found two large islands, which together they called the mainland, and many tiny offshore islands around the coast. The naturalists who came with the explorers disregarded the tuatara, though it is improbable none were seen. Only several decades later did a tuatara specimen reach the British Museum, where it was eventually classified as just another type of lizard.</p>\n            <p>One of the first scientists who realised that aspects of tuatara anatomy were odd— unchanged for tens of thousands of years—was Albert Gunther in 1876. Gunther believed the tuatara was one of the most valuable objects in zoological anatomical collections, and also noted, in passing, the reptile was likely to become extinct. From today's perspective, it is striking that Gunther expressed no concern about the probable demise of the tuatara. He and his contemporaries were products of their age, strongly influenced by Charles Darwin's theory, which had only recently been published. Their views were something like this: 'Extinction is a natural process. It is sad that species disappear, but that is part of nature.'</p>\n            <p>There is a second important aspect of Gunther's work. He recorded, correctly, that some of the mammals introduced by Europeans were predators of the tuatara—particularly rats. But what he did not realise was that New Zealand has two species of rat, both introduced, both with an appetite for tuatara: the ship's rat came with European explorers and settlers; but the kiore rat had already been in the country for hundreds of years, brought by Polynesians from the Pacific Islands. Gunther failed to recognise the distinction, believing all rats to be a relatively recent introduction.</p>\n            <p>Little further research was conducted until lan Crook of the NZ Wildlife Service published his findings in 1973, which can be summarised as follows. Tuatara thrive on offshore islands with no rats. Tuatara never survived on islands with ship's rats. On a few islands, small and declining populations of tuatara occur with the kiore. This should not be seen, however, as evidence that tuatara and kiore can coexist. Rather, Crook proposed, kiore probably only arrived recently on such islands, and thus the small populations represent extinctions in progress.</p>\n            <p>Throughout the 1990s, Richard Holdaway and his colleagues at Victoria University in Wellington documented the surprising discovery that kiore probably arrived about 1,800 years ago, although the human population of New Zealand is thought to be no older than 800 years. How is this possible? Presumably, Holdaway argued, the kiore were brought by Polynesian explorers who visited the country but did not settle. Thereafter, the rats were agents of ecological warfare, exterminating perhaps 1,000–3,000 species. Thus, tuatara and many other species were already rare or extinct when permanent human inhabitants— the Maori-arrived around 1300. This hypothesis is still being debated, but the evidence continues to accumulate in its favour.</p>\n            <p>Conservation practice has changed dramatically since Crook's findings were published in 1973. Eradication of rats from any given environment was believed to be virtually impossible until about 1980, but since then has become routine. Enormous conservation benefits are accruing as newly rat-free offshore islands are providing sanctuaries for the country's rarest species. In 1995, for example, Nicola Nelson of the Department of Conservation established 68 tuatara on Titi Island. Since then, four more populations of tuatara have been established elsewhere under similar conditions. Today, numbers of tuatara are still a fraction of what they once were, but for the first time in 1,800 years the decline has been reversed.</p>\n            <p>While the recovery of rare species is itself a good thing, the truly significant outcome of this research is that it liberates the imagination. If we can remove predatory introduced mammals from islands, why not from the mainland too? Perhaps the questions we ask should demonstrate even more visionary ambition. Can non-mammalian pests also be removed from the mainland? Our rivers, for example, are full of surrogate rats, in the form of introduced species of fish called trout. Some day more people will understand that trout have replaced a whole native fauna in our waterways, just as rats replaced tuatara on the mainland. Will such knowledge lead to the creation of mainland ‘aquatic islands' where we can once again establish those species of indigenous fish that used to live in our rivers? Similarly, can bellbirds and tuis replace birds like starlings and mynahs?</p>\n            <p>The answers to such questions are uncertain, and opposing sides will doubtless be fiercely debated. But the role of scientific knowledge in illuminating the past will be crucial. Just as we no longer tolerate extinction, in the future we may no longer accept a mainland devoid of the biological wonders of our past such as tuatara. Conservation is thus not primarily about the past but about imagining and then creating the future we wish for our children and ourselves. For 80 million years until humans arrived, tuatara occurred throughout New Zealand-might they do so again?</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>The tuatara – past and future</h3>\n<p>The New Zealand species of lizard, the tuatara, is firmly embedded in the national psyche: an icon for today which dates from the age of dinosaurs; an ancient reptile commemorated on the back of the five-cent coin. New Zealanders feel an affinity with the tuatara, and accept that active conservation management is required to ensure it will be among the legacies left to future generations.</p>\n<p>When European explorers reached New Zealand in 1769 they found two large islands, which together they called the mainland, and many tiny offshore islands around the coast. The naturalists who came with the explorers disregarded the tuatara, though it is improbable none were seen. Only several decades later did a tuatara specimen reach the British Museum, where it was eventually classified as just another type of lizard.</p>\n<p>One of the first scientists who realised that aspects of tuatara anatomy were odd— unchanged for tens of thousands of years—was Albert Gunther in 1876. Gunther believed the tuatara was one of the most valuable objects in zoological anatomical collections, and also noted, in passing, the reptile was likely to become extinct. From today's perspective, it is striking that Gunther expressed no concern about the probable demise of the tuatara. He and his contemporaries were products of their age, strongly influenced by Charles Darwin's theory, which had only recently been published. Their views were something like this: 'Extinction is a natural process. It is sad that species disappear, but that is part of nature.'</p>\n<p>There is a second important aspect of Gunther's work. He recorded, correctly, that some of the mammals introduced by Europeans were predators of the tuatara—particularly rats. But what he did not realise was that New Zealand has two species of rat, both introduced, both with an appetite for tuatara: the ship's rat came with European explorers and settlers; but the kiore rat had already been in the country for hundreds of years, brought by Polynesians from the Pacific Islands. Gunther failed to recognise the distinction, believing all rats to be a relatively recent introduction.</p>\n<p>Little further research was conducted until lan Crook of the NZ Wildlife Service published his findings in 1973, which can be summarised as follows. Tuatara thrive on offshore islands with no rats. Tuatara never survived on islands with ship's rats. On a few islands, small and declining populations of tuatara occur with the kiore. This should not be seen, however, as evidence that tuatara and kiore can coexist. Rather, Crook proposed, kiore probably only arrived recently on such islands, and thus the small populations represent extinctions in progress.</p>\n<p>Throughout the 1990s, Richard Holdaway and his colleagues at Victoria University in Wellington documented the surprising discovery that kiore probably arrived about 1,800 years ago, although the human population of New Zealand is thought to be no older than 800 years. How is this possible? Presumably, Holdaway argued, the kiore were brought by Polynesian explorers who visited the country but did not settle. Thereafter, the rats were agents of ecological warfare, exterminating perhaps 1,000–3,000 species. Thus, tuatara and many other species were already rare or extinct when permanent human inhabitants— the Maori-arrived around 1300. This hypothesis is still being debated, but the evidence continues to accumulate in its favour.</p>\n<p>Conservation practice has changed dramatically since Crook's findings were published in 1973. Eradication of rats from any given environment was believed to be virtually impossible until about 1980, but since then has become routine. Enormous conservation benefits are accruing as newly rat-free offshore islands are providing sanctuaries for the country's rarest species. In 1995, for example, Nicola Nelson of the Department of Conservation established 68 tuatara on Titi Island. Since then, four more populations of tuatara have been established elsewhere under similar conditions. Today, numbers of tuatara are still a fraction of what they once were, but for the first time in 1,800 years the decline has been reversed.</p>\n<p>While the recovery of rare species is itself a good thing, the truly significant outcome of this research is that it liberates the imagination. If we can remove predatory introduced mammals from islands, why not from the mainland too? Perhaps the questions we ask should demonstrate even more visionary ambition. Can non-mammalian pests also be removed from the mainland? Our rivers, for example, are full of surrogate rats, in the form of introduced species of fish called trout. Some day more people will understand that trout have replaced a whole native fauna in our waterways, just as rats replaced tuatara on the mainland. Will such knowledge lead to the creation of mainland ‘aquatic islands' where we can once again establish those species of indigenous fish that used to live in our rivers? Similarly, can bellbirds and tuis replace birds like starlings and mynahs?</p>\n<p>The answers to such questions are uncertain, and opposing sides will doubtless be fiercely debated. But the role of scientific knowledge in illuminating the past will be crucial. Just as we no longer tolerate extinction, in the future we may no longer accept a mainland devoid of the biological wonders of our past such as tuatara. Conservation is thus not primarily about the past but about imagining and then creating the future we wish for our children and ourselves. For 80 million years until humans arrived, tuatara occurred throughout New Zealand-might they do so again?</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 27–31</h4>\n                <p>Choose the correct letter, A, B, C or D.</p>\n                <div class=\"question-item\">\n                    <p><strong>27</strong> What are we told about the Europeans who arrived in 1769?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"A\"> A They thought there was only one large island.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"B\"> B They had not come to study natural history.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"C\"> C They had no interest in the tuatara.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"D\"> D They sent a tuatara to the British Museum.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> What does the writer say about Albert Gunther in the third paragraph?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"A\"> A He believed the tuatara could fetch a high price.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"B\"> B He was typical of his generation of scientists.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"C\"> C He disagreed with Charles Darwin's theory.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"D\"> D He wanted to stop the tuatara becoming extinct.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> What did Albert Gunther think about the rats in New Zealand?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"A\"> A They did not eat the tuatara.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"B\"> B There was one species of rat.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"C\"> C There had always been rats in New Zealand.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"D\"> D They were killed by Polynesians.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> What did lan Crook conclude from his research?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"A\"> A Tuatara are safe on small islands.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"B\"> B Ship's rats kill more tuatara than kiore.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"C\"> C Kiore cannot swim to offshore islands.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"D\"> D Rats and tuatara cannot live together.</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>31</strong> What were the findings of Richard Holdaway's research?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"A\"> A Maori settled more recently than previously thought.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"B\"> B The first Polynesian explorers formed permanent settlements.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"C\"> C Ship's rats are the oldest rat species in the country.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"D\"> D Rats caused extinctions before any humans settled.</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter, A, B, C or D.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> What are we told about the Europeans who arrived in 1769?</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A They thought there was only one large island.</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B They had not come to study natural history.</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C They had no interest in the tuatara.</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D They sent a tuatara to the British Museum.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> What does the writer say about Albert Gunther in the third paragraph?</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A He believed the tuatara could fetch a high price.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B He was typical of his generation of scientists.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C He disagreed with Charles Darwin's theory.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D He wanted to stop the tuatara becoming extinct.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> What did Albert Gunther think about the rats in New Zealand?</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A They did not eat the tuatara.</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B There was one species of rat.</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C There had always been rats in New Zealand.</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D They were killed by Polynesians.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What did lan Crook conclude from his research?</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A Tuatara are safe on small islands.</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B Ship's rats kill more tuatara than kiore.</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C Kiore cannot swim to offshore islands.</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D Rats and tuatara cannot live together.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> What were the findings of Richard Holdaway's research?</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"> A Maori settled more recently than previously thought.</label> <label><input name=\"q5\" type=\"radio\" value=\"B\"> B The first Polynesian explorers formed permanent settlements.</label> <label><input name=\"q5\" type=\"radio\" value=\"C\"> C Ship's rats are the oldest rat species in the country.</label> <label><input name=\"q5\" type=\"radio\" value=\"D\"> D Rats caused extinctions before any humans settled.</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n                 <h4>Questions 32–35</h4>\n                <p>Do the following statements agree with the claims of the writer?</p>\n                <p>In boxes 32–35 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p><strong>32</strong> The available research supports Holdaway's theory but it has not been proved.</p>\n                     <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> Nowadays, it is possible to totally destroy a population of rats on a small island.</p>\n                     <div class=\"radio-options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>34</strong> Crook was the first person to recognise the potential of offshore islands as sanctuaries.</p>\n                     <div class=\"radio-options\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>35</strong> Tuatara numbers are continuing to fall.</p>\n                     <div class=\"radio-options\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Do the following statements agree with the claims of the writer?</p>\n<p>In boxes 32–35 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>32</strong> The available research supports Holdaway's theory but it has not been proved.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Nowadays, it is possible to totally destroy a population of rats on a small island.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Crook was the first person to recognise the potential of offshore islands as sanctuaries.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Tuatara numbers are continuing to fall.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n                <h4>Questions 36–40</h4>\n                <p>Complete the summary using the list of words, A–H, below.</p>\n                <p><em>Drag and drop the correct letter into the summary blanks.</em></p>\n                \n                <div class=\"summary-text\">\n                    <h5>What conclusions can we draw?</h5>\n                    <p>\n                    The most important result of the tuatara research is that it frees our <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span>. For example, there are many similarities between rats and <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span>. Should we now go further and consider reintroducing <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> to our mainland rivers? Perhaps our children will come to believe in the <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span> of species, in the same way that our generation refuses to accept <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span>.\n                    </p>\n                </div>\n                 <div id=\"word-options\">\n                    <div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"natural evolution\">A natural evolution</div>\n                    <div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"creative thought\">B creative thought</div>\n                    <div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"indigenous plants\">C indigenous plants</div>\n                    <div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"trout\">D trout</div>\n                    <div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"pollution\">E pollution</div>\n                    <div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"restoration\">F restoration</div>\n                    <div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"native fish\">G native fish</div>\n                    <div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"extinction\">H extinction</div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete the summary using the list of words, A–H, below.</p>\n<p><em>Drag and drop the correct letter into the summary blanks.</em></p>\n<div class=\"summary-text\">\n<h5>What conclusions can we draw?</h5>\n<p>\nThe most important result of the tuatara research is that it frees our <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span>. For example, there are many similarities between rats and <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span>. Should we now go further and consider reintroducing <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> to our mainland rivers? Perhaps our children will come to believe in the <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span> of species, in the same way that our generation refuses to accept <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span>.\n</p>\n</div>\n<div id=\"word-options\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"natural evolution\">A natural evolution</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"creative thought\">B creative thought</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"indigenous plants\">C indigenous plants</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"trout\">D trout</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"pollution\">E pollution</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"restoration\">F restoration</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"native fish\">G native fish</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"extinction\">H extinction</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
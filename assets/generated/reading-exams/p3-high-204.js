@@ -11,7 +11,7 @@
       {
         "blockId": "passage-main",
         "kind": "text",
-        "bodyHtml": "<h2>READING PASSAGE 3</h2>\n    <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n    \n    <h3>When people are ‘deaf’ to music</h3>\n  \n    <p>Music has long been considered a uniquely human concept. In fact, most psychologists agree that music is a universal human instinct. Like any ability, however, there is great variation in people’s musical competence. For every brilliant pianist in the world, there are several people we refer to as ‘tone deaf’. It is not simply that people with tone deafness (or ‘amusia’) are unable to sing in tune, they are also unable to discriminate between tones or recognize familiar melodies. Such a ‘disorder’ can occur after some sort of brain damage, but recently research has been undertaken in an attempt to discover the cause of congenital amusia (when people are born with the condition), which is not associated with any brain damage, hearing problems, or lack of exposure to music.</p>\n\n    <p>According to the research of Dr. Isabelle Peretz of the University of Montreal, amusia is more complicated than the inability to distinguish pitches. An amusic (a person who has the condition of amusia) can distinguish between two pitches that are far apart, but cannot tell the difference between intervals smaller than a half step on the Western diatonic scale, while most people can easily distinguish differences smaller than that. When listening to melodies which have had a single note altered so that it is out of key with the rest of the melody, they do not notice a problem. As would be expected, amusics perform significantly worse at singing and tapping a rhythm along with a melody than do non-amusics.</p>\n\n    <p>The most fascinating aspect of amusia is how specific to music it is. Because of music’s close ties to language, it might be expected that a musical impairment may be caused by a language impairment. Studies suggest, however, that language and music ability are independent of one another. People with brain damage in areas critical to language are often still able to sing, despite being unable to communicate through speech. Moreover, while amusics show deficiencies in their recognition of pitch differences in melodies, they show no such deficiencies in tonal languages. Amusics who speak tonal languages, such as Chinese, do not report having any difficulty discriminating between words that differ only in their intonation. The linguistic cues inherent in speech make discrimination of meaning much easier for amusics. Amusics are also successful most of the time at detecting the mood of a melody, can identify a speaker based on his or her voice and can discriminate and identify environmental sounds.</p>\n\n    <p>Recent work has been focused on locating the part of the brain that is responsible for amusia. The temporal lobes of the brain, the location of the primary auditory cortex, have been considered. It has long been believed that the temporal lobes, especially the right temporal lobe, are most active when engaged in musical activity, so any musical disability should logically stem from here as well. Because it has been shown that there is no hearing deficit in amusia, researchers moved on to the temporal neocortex, which is where more sophisticated processing of musical cues was thought to take place. New studies, however, have suggested that the deficits in amusics are located outside the auditory cortex. Brain scans of amusics do not show any reaction at all to differences smaller than a half step. When changes in tones are large, their brains overreact, showing twice as much activity on the right side of the brain as a normal brain hearing the same thing. These differences do not occur in the auditory cortex, indicating again that the deficits of amusia lie not in hearing impairment, but in higher processing of melodies.</p>\n\n    <p>So what does this all mean? Looking only at the research of Peretz in the field of neuropsychology of music, it would appear that amusia is some sort of disorder. As a student of neurobiology, however, I am skeptical. Certainly the studies by Peretz that have found significant differences between the brains of so-called amusics and normal brains are legitimate. The more important question now becomes one of normality. Every trait from skin color to intelligence to mood exists on a continuum—there is a great deal of variation from one extreme to the other. Just because we recognize that basic musical ability is something that the vast majority of people have, this doesn’t mean that the lack of it is abnormal.</p>\n\n    <p>What makes an amusic worse off than a musical prodigy? Musical ability is culturally valued, and may have been a factor in survival at one point in human history, but it does not seem likely that it is being selected for on an evolutionary scale any longer. Darwin believed that music was adaptive as a way of finding a mate, but who needs to be able to sing to find a partner in an age when it is possible to express your emotions through a song on your iPod?</p>\n\n    <p>While the idea of amusia is interesting, it seems to be just one end of the continuum of innate musical ability. Comparing this ‘disorder’ to learning disorders like a specific language impairment seems to be going too far. Before amusia can be declared a disability, further research must be done to determine whether lack of musical ability is actually detrimental in any way. If no disadvantages can be found of having amusia, then it is no more a disability than having poor fashion sense or bad handwriting.</p>\n    \n    <p>&nbsp;</p> <!-- Final padding -->\n  </section>\n\n  <!-- Draggable Divider -->\n  <div id=\"divider\" title=\"Drag to resize\"></div>\n\n  <!-- Right Pane: Questions and Controls -->"
+        "bodyHtml": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>When people are ‘deaf’ to music</h3>\n<p>Music has long been considered a uniquely human concept. In fact, most psychologists agree that music is a universal human instinct. Like any ability, however, there is great variation in people’s musical competence. For every brilliant pianist in the world, there are several people we refer to as ‘tone deaf’. It is not simply that people with tone deafness (or ‘amusia’) are unable to sing in tune, they are also unable to discriminate between tones or recognize familiar melodies. Such a ‘disorder’ can occur after some sort of brain damage, but recently research has been undertaken in an attempt to discover the cause of congenital amusia (when people are born with the condition), which is not associated with any brain damage, hearing problems, or lack of exposure to music.</p>\n<p>According to the research of Dr. Isabelle Peretz of the University of Montreal, amusia is more complicated than the inability to distinguish pitches. An amusic (a person who has the condition of amusia) can distinguish between two pitches that are far apart, but cannot tell the difference between intervals smaller than a half step on the Western diatonic scale, while most people can easily distinguish differences smaller than that. When listening to melodies which have had a single note altered so that it is out of key with the rest of the melody, they do not notice a problem. As would be expected, amusics perform significantly worse at singing and tapping a rhythm along with a melody than do non-amusics.</p>\n<p>The most fascinating aspect of amusia is how specific to music it is. Because of music’s close ties to language, it might be expected that a musical impairment may be caused by a language impairment. Studies suggest, however, that language and music ability are independent of one another. People with brain damage in areas critical to language are often still able to sing, despite being unable to communicate through speech. Moreover, while amusics show deficiencies in their recognition of pitch differences in melodies, they show no such deficiencies in tonal languages. Amusics who speak tonal languages, such as Chinese, do not report having any difficulty discriminating between words that differ only in their intonation. The linguistic cues inherent in speech make discrimination of meaning much easier for amusics. Amusics are also successful most of the time at detecting the mood of a melody, can identify a speaker based on his or her voice and can discriminate and identify environmental sounds.</p>\n<p>Recent work has been focused on locating the part of the brain that is responsible for amusia. The temporal lobes of the brain, the location of the primary auditory cortex, have been considered. It has long been believed that the temporal lobes, especially the right temporal lobe, are most active when engaged in musical activity, so any musical disability should logically stem from here as well. Because it has been shown that there is no hearing deficit in amusia, researchers moved on to the temporal neocortex, which is where more sophisticated processing of musical cues was thought to take place. New studies, however, have suggested that the deficits in amusics are located outside the auditory cortex. Brain scans of amusics do not show any reaction at all to differences smaller than a half step. When changes in tones are large, their brains overreact, showing twice as much activity on the right side of the brain as a normal brain hearing the same thing. These differences do not occur in the auditory cortex, indicating again that the deficits of amusia lie not in hearing impairment, but in higher processing of melodies.</p>\n<p>So what does this all mean? Looking only at the research of Peretz in the field of neuropsychology of music, it would appear that amusia is some sort of disorder. As a student of neurobiology, however, I am skeptical. Certainly the studies by Peretz that have found significant differences between the brains of so-called amusics and normal brains are legitimate. The more important question now becomes one of normality. Every trait from skin color to intelligence to mood exists on a continuum—there is a great deal of variation from one extreme to the other. Just because we recognize that basic musical ability is something that the vast majority of people have, this doesn’t mean that the lack of it is abnormal.</p>\n<p>What makes an amusic worse off than a musical prodigy? Musical ability is culturally valued, and may have been a factor in survival at one point in human history, but it does not seem likely that it is being selected for on an evolutionary scale any longer. Darwin believed that music was adaptive as a way of finding a mate, but who needs to be able to sing to find a partner in an age when it is possible to express your emotions through a song on your iPod?</p>\n<p>While the idea of amusia is interesting, it seems to be just one end of the continuum of innate musical ability. Comparing this ‘disorder’ to learning disorders like a specific language impairment seems to be going too far. Before amusia can be declared a disability, further research must be done to determine whether lack of musical ability is actually detrimental in any way. If no disadvantages can be found of having amusia, then it is no more a disability than having poor fashion sense or bad handwriting.</p>\n<p>&nbsp;</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"
       }
     ]
   },
@@ -26,7 +26,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 27–31</h4>\n      <p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n      \n      <div style=\"margin-bottom:16px;\">\n        <p><a id=\"q1-anchor\"></a><strong>27</strong> What does the writer tell us about people with tone deafness (amusia) in the first paragraph?</p>\n        <div class=\"mcq-group\">\n          <label><input type=\"radio\" name=\"q1\" value=\"a\"> A. They usually have hearing problems</label>\n          <label><input type=\"radio\" name=\"q1\" value=\"b\"> B. Some can play a musical instrument very well</label>\n          <label><input type=\"radio\" name=\"q1\" value=\"c\"> C. Some may be able to sing well-known melodies</label>\n          <label><input type=\"radio\" name=\"q1\" value=\"d\"> D. They have several inabilities in regard to music</label>\n        </div>\n      </div>\n\n      <div style=\"margin-bottom:16px;\">\n        <p><a id=\"q2-anchor\"></a><strong>28</strong> What is the writer doing in the second paragraph?</p>\n        <div class=\"mcq-group\">\n          <label><input type=\"radio\" name=\"q2\" value=\"a\"> A. outlining some of the factors that cause amusia</label>\n          <label><input type=\"radio\" name=\"q2\" value=\"b\"> B. summarising some findings about people with amusia</label>\n          <label><input type=\"radio\" name=\"q2\" value=\"c\"> C. suggesting that people with amusia are disadvantaged</label>\n          <label><input type=\"radio\" name=\"q2\" value=\"d\"> D. comparing the singing ability of amusics with their sense</label>\n        </div>\n      </div>\n\n      <div style=\"margin-bottom:16px;\">\n        <p><a id=\"q3-anchor\"></a><strong>29</strong> What does the writer say about the relationship between language ability and musical ability?</p>\n        <div class=\"mcq-group\">\n          <label><input type=\"radio\" name=\"q3\" value=\"a\"> A. People who are unable to speak can sometimes sing</label>\n          <label><input type=\"radio\" name=\"q3\" value=\"b\"> B. People with amusia usually have language problems too</label>\n          <label><input type=\"radio\" name=\"q3\" value=\"c\"> C. Speakers of tonal languages like Chinese rarely have amusia</label>\n          <label><input type=\"radio\" name=\"q3\" value=\"d\"> D. People with amusia have difficulty recognizing people by their voices</label>\n        </div>\n      </div>\n\n      <div style=\"margin-bottom:16px;\">\n        <p><a id=\"q4-anchor\"></a><strong>30</strong> In the third paragraph, the writer notes that most amusics are able to</p>\n        <div class=\"mcq-group\">\n          <label><input type=\"radio\" name=\"q4\" value=\"a\"> A. learn how to sing in tune</label>\n          <label><input type=\"radio\" name=\"q4\" value=\"b\"> B. identify a song by its tune</label>\n          <label><input type=\"radio\" name=\"q4\" value=\"c\"> C. distinguish a sad tone from a happy tune</label>\n          <label><input type=\"radio\" name=\"q4\" value=\"d\"> D. recognise when a singer is not singing in tune</label>\n        </div>\n      </div>\n\n      <div style=\"margin-bottom:16px;\">\n        <p><a id=\"q5-anchor\"></a><strong>31</strong> What is the writer doing in the fourth paragraph?</p>\n        <div class=\"mcq-group\">\n          <label><input type=\"radio\" name=\"q5\" value=\"a\"> A. claiming that amusics have problems in the auditory cortex</label>\n          <label><input type=\"radio\" name=\"q5\" value=\"b\"> B. outlining progress in understanding the brains of amusics</label>\n          <label><input type=\"radio\" name=\"q5\" value=\"c\"> C. proving that amusia is located in the temporal lobes</label>\n          <label><input type=\"radio\" name=\"q5\" value=\"d\"> D. explaining why studies of hearing are difficult</label>\n        </div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q1-anchor\"></a><strong>27</strong> What does the writer tell us about people with tone deafness (amusia) in the first paragraph?</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q1\" value=\"a\"> A. They usually have hearing problems</label> <label><input type=\"radio\" name=\"q1\" value=\"b\"> B. Some can play a musical instrument very well</label> <label><input type=\"radio\" name=\"q1\" value=\"c\"> C. Some may be able to sing well-known melodies</label> <label><input type=\"radio\" name=\"q1\" value=\"d\"> D. They have several inabilities in regard to music</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q2-anchor\"></a><strong>28</strong> What is the writer doing in the second paragraph?</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q2\" value=\"a\"> A. outlining some of the factors that cause amusia</label> <label><input type=\"radio\" name=\"q2\" value=\"b\"> B. summarising some findings about people with amusia</label> <label><input type=\"radio\" name=\"q2\" value=\"c\"> C. suggesting that people with amusia are disadvantaged</label> <label><input type=\"radio\" name=\"q2\" value=\"d\"> D. comparing the singing ability of amusics with their sense</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q3-anchor\"></a><strong>29</strong> What does the writer say about the relationship between language ability and musical ability?</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q3\" value=\"a\"> A. People who are unable to speak can sometimes sing</label> <label><input type=\"radio\" name=\"q3\" value=\"b\"> B. People with amusia usually have language problems too</label> <label><input type=\"radio\" name=\"q3\" value=\"c\"> C. Speakers of tonal languages like Chinese rarely have amusia</label> <label><input type=\"radio\" name=\"q3\" value=\"d\"> D. People with amusia have difficulty recognizing people by their voices</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q4-anchor\"></a><strong>30</strong> In the third paragraph, the writer notes that most amusics are able to</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q4\" value=\"a\"> A. learn how to sing in tune</label> <label><input type=\"radio\" name=\"q4\" value=\"b\"> B. identify a song by its tune</label> <label><input type=\"radio\" name=\"q4\" value=\"c\"> C. distinguish a sad tone from a happy tune</label> <label><input type=\"radio\" name=\"q4\" value=\"d\"> D. recognise when a singer is not singing in tune</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q5-anchor\"></a><strong>31</strong> What is the writer doing in the fourth paragraph?</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q5\" value=\"a\"> A. claiming that amusics have problems in the auditory cortex</label> <label><input type=\"radio\" name=\"q5\" value=\"b\"> B. outlining progress in understanding the brains of amusics</label> <label><input type=\"radio\" name=\"q5\" value=\"c\"> C. proving that amusia is located in the temporal lobes</label> <label><input type=\"radio\" name=\"q5\" value=\"d\"> D. explaining why studies of hearing are difficult</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -38,7 +38,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 32–36</h4>\n      <p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n      <p><em>In boxes 32–36 on your answer sheet, write</em></p>\n      <ul style=\"list-style:none; padding-left:0; font-weight:bold; font-size:0.9em;\">\n        <li>YES <span style=\"font-weight:normal; margin-left:45px;\">if the statement agrees with the views of the writer</span></li>\n        <li>NO <span style=\"font-weight:normal; margin-left:52px;\">if the statement contradicts the views of the writer</span></li>\n        <li>NOT GIVEN <span style=\"font-weight:normal; margin-left:8px;\">if it is impossible to say what the writer thinks about this</span></li>\n      </ul>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q6-anchor\"></a><b>32</b> Peretz’s research suggesting that amusia is a disorder is convincing.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q6\" value=\"yes\"> Yes</label>\n            <label><input type=\"radio\" name=\"q6\" value=\"no\"> No</label>\n            <label><input type=\"radio\" name=\"q6\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q7-anchor\"></a><b>33</b> People with musical ability are happier than those without this ability.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q7\" value=\"yes\"> Yes</label>\n            <label><input type=\"radio\" name=\"q7\" value=\"no\"> No</label>\n            <label><input type=\"radio\" name=\"q7\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q8-anchor\"></a><b>34</b> It is inappropriate to consider amusia as a real disorder.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q8\" value=\"yes\"> Yes</label>\n            <label><input type=\"radio\" name=\"q8\" value=\"no\"> No</label>\n            <label><input type=\"radio\" name=\"q8\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q9-anchor\"></a><b>35</b> People with amusia often have bad handwriting.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q9\" value=\"yes\"> Yes</label>\n            <label><input type=\"radio\" name=\"q9\" value=\"no\"> No</label>\n            <label><input type=\"radio\" name=\"q9\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 32–36</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<p><em>In boxes 32–36 on your answer sheet, write</em></p>\n<ul style=\"list-style:none; padding-left:0; font-weight:bold; font-size:0.9em;\">\n<li>YES <span style=\"font-weight:normal; margin-left:45px;\">if the statement agrees with the views of the writer</span></li>\n<li>NO <span style=\"font-weight:normal; margin-left:52px;\">if the statement contradicts the views of the writer</span></li>\n<li>NOT GIVEN <span style=\"font-weight:normal; margin-left:8px;\">if it is impossible to say what the writer thinks about this</span></li>\n</ul>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q6-anchor\"></a><b>32</b> Peretz’s research suggesting that amusia is a disorder is convincing.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q6\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q6\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q6\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q7-anchor\"></a><b>33</b> People with musical ability are happier than those without this ability.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q7\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q7\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q7\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q8-anchor\"></a><b>34</b> It is inappropriate to consider amusia as a real disorder.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q8\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q8\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q8\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q9-anchor\"></a><b>35</b> People with amusia often have bad handwriting.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q9\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q9\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q9\" value=\"not given\"> NG</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -50,7 +50,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 36–40</h4>\n      <p>Complete each sentence with the correct ending, <strong>A–H</strong>, below.</p>\n      <p><em>Drag the correct ending block to the box below each sentence start.</em></p>\n\n      <!-- Draggable Full Text Options -->\n      <div class=\"cardpool pool-vertical\" id=\"pool-endings\">\n        <div class=\"card\" draggable=\"true\" id=\"c-a\" data-value=\"A\"><strong>A</strong> an inability to hear when spoken language rises and falls.</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-b\" data-value=\"B\"><strong>B</strong> considered to be desirable.</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-c\" data-value=\"C\"><strong>C</strong> an inability to follow the beat of music.</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-d\" data-value=\"D\"><strong>D</strong> not a problem.</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-e\" data-value=\"E\"><strong>E</strong> not yet well understood.</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-f\" data-value=\"F\"><strong>F</strong> a result of injury to the mother.</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-g\" data-value=\"G\"><strong>G</strong> more marked than with other people.</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-h\" data-value=\"H\"><strong>H</strong> associated with intelligence.</div>\n      </div>\n\n      <hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n\n      <div>\n        <p><a id=\"q10-anchor\"></a><strong>36</strong> The reason why some people are born with amusia is</p>\n        <span class=\"dropzone match-dropzone\" data-target=\"q10\" data-question=\"q10\"></span>\n      </div>\n      <div>\n        <p><a id=\"q11-anchor\"></a><strong>37</strong> One of the difficulties amusics experience is</p>\n        <span class=\"dropzone match-dropzone\" data-target=\"q11\" data-question=\"q11\"></span>\n      </div>\n      <div>\n        <p><a id=\"q12-anchor\"></a><strong>38</strong> For amusics, discrimination of meaning in speech is</p>\n        <span class=\"dropzone match-dropzone\" data-target=\"q12\" data-question=\"q12\"></span>\n      </div>\n      <div>\n        <p><a id=\"q13-anchor\"></a><strong>39</strong> Certain reactions in the brain of an amusic are</p>\n        <span class=\"dropzone match-dropzone\" data-target=\"q13\" data-question=\"q13\"></span>\n      </div>\n      <div>\n        <p><a id=\"q14-anchor\"></a><strong>40</strong> In most cultures, musical ability is</p>\n        <span class=\"dropzone match-dropzone\" data-target=\"q14\" data-question=\"q14\"></span>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 36–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–H</strong>, below.</p>\n<p><em>Drag the correct ending block to the box below each sentence start.</em></p>\n<div class=\"cardpool pool-vertical\" id=\"pool-endings\">\n<div class=\"card\" draggable=\"true\" id=\"c-a\" data-value=\"A\"><strong>A</strong> an inability to hear when spoken language rises and falls.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-b\" data-value=\"B\"><strong>B</strong> considered to be desirable.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-c\" data-value=\"C\"><strong>C</strong> an inability to follow the beat of music.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-d\" data-value=\"D\"><strong>D</strong> not a problem.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-e\" data-value=\"E\"><strong>E</strong> not yet well understood.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-f\" data-value=\"F\"><strong>F</strong> a result of injury to the mother.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-g\" data-value=\"G\"><strong>G</strong> more marked than with other people.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-h\" data-value=\"H\"><strong>H</strong> associated with intelligence.</div>\n</div>\n<hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n<div>\n<p><a id=\"q10-anchor\"></a><strong>36</strong> The reason why some people are born with amusia is</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q10\" data-question=\"q10\"></span>\n</div>\n<div>\n<p><a id=\"q11-anchor\"></a><strong>37</strong> One of the difficulties amusics experience is</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q11\" data-question=\"q11\"></span>\n</div>\n<div>\n<p><a id=\"q12-anchor\"></a><strong>38</strong> For amusics, discrimination of meaning in speech is</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q12\" data-question=\"q12\"></span>\n</div>\n<div>\n<p><a id=\"q13-anchor\"></a><strong>39</strong> Certain reactions in the brain of an amusic are</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q13\" data-question=\"q13\"></span>\n</div>\n<div>\n<p><a id=\"q14-anchor\"></a><strong>40</strong> In most cultures, musical ability is</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q14\" data-question=\"q14\"></span>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -11,7 +11,7 @@
       {
         "blockId": "passage-main",
         "kind": "text",
-        "bodyHtml": "<h2>READING PASSAGE 3</h2>\n    <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n    \n    <h3>200 Years of Australian Landscapes at the Royal Academy in London</h3>\n    <p><em>This exhibition promises to chart the evolution of a nation through its art, but not everyone agrees with the reasons behind the choice of artwork.</em></p>\n  \n    <p>For the casual viewer, the exhibition of landscapes, <em>Australia</em>, selected by the Royal Academy of Art, will be a spectacular guide through Australian art history. Included in the exhibition are a range of artists and styles, dating from the earliest days of colonial art and progressing through expressionism and modernism to the greats of the 20th century, culminating with the current generation of Australian artists. It is hardly surprising, then, that this results in a flexible, wide-ranging notion of landscape.</p>\n\n    <p>But this landmark exhibition gives rise to some questions, and perhaps problems, regarding Britain's relationship with its former colony. By choosing a style of painting at which British artists excel, the Academy could be seen as inviting criticism that hints at a telling attitude towards Australian art by comparison. But it is the very theme of landscape that provides the strongest connection to Australian art from Britain. To consider it condescending is perhaps too strong, but for Joanna Mendelssohn, an Australian critic and Associate Professor at the University of NSW's College of Fine Arts (COFA), there is a suggestion that British artistic values have directed this exhibition, rather than allowing Australia the freedom to demonstrate its maturity.</p>\n\n    <p>What Mendelssohn found surprising about this exhibition was that the underlying rules for the selection of works seemed to have been so conservative. Since the landscape is a very strong British artistic theme, it appeared to her that when the British looked to the art of a former colony, there was a tendency for them to think that those colonies would continue to be like the British themselves. In reviewing <em>Australia</em>, the British insisted on looking at the genre of landscape painting.</p>\n\n    <p>Because of colonial ties, it was inevitable during Australian art's formative years that it would reflect Britain's devotion to the beloved landscape before its own character and idiosyncrasies took shape. And while Mendelssohn's concern over the exhibition's conventional selection is valid, the Academy is nevertheless embracing the peculiarities of Australian art from the mid-19th century onward, albeit within the boundaries of landscape.</p>\n\n    <p><em>Australia</em> is curated by Kathleen Soriano, director of exhibitions at the Royal Academy. \"Certainly the influence of English, French, or German art is much more evident in the early periods, in the early 1800s to mid-1800s,\" she says. \"What I wanted to show was how Australian art develops a real distinctiveness, associated with the landscape and the light.\"</p>\n\n    <p>The fusion of tradition of the European kind with something more specifically Australian, and often personal, is crucial to the exhibition, and extends particularly to some of the more contemporary artists involved. Sydney-born video artist Shaun Gladwell is a good example of this. Gladwell's most famous piece, which is featured in the exhibition, is <em>Storm Sequence</em> (2000), a video of Gladwell skateboarding on the Bondi seafront as one of Sydney's signature brutal storms lingers offshore. It is his acknowledgment of landscape (or seascape) tradition, colored by Gladwell's own individualism. \"To exhibit my work in this show might make some sense because I was interested in Turner and the idea of atmosphere affecting vision, something I was really interested in around the time of <em>Storm Sequence</em>. I was thinking about this tradition of Romantic landscape, but I wanted to make it personal,\" says Gladwell. But he didn't want to just embark on borrowing imagery from elsewhere. He wanted to bring it to his experience and his world through skateboarding and beach culture.</p>\n\n    <p>So while it may seem narrow for Britain to reduce Australian art to the genre of landscape, there can be little denying that British landscape painting is still relevant to a current generation of Australian practitioners, however indirectly.</p>\n\n    <p>Visitors to the exhibition encounter Australian Aboriginal art first, the idea being that these works warrant a prominent position because they were 'first'. Over the last couple of decades, London has hosted many successful exhibitions of Aboriginal art in smaller spaces, but for Soriano, <em>Australia</em> represents an opportunity to place such art in a broader context, with new relationships to the art of the settlers and white Australia. 'One of the reasons landscape makes sense as being the right theme was because Aboriginal art started in and on the landscape,' she says. '[The exhibition] is a beautiful meshing of the two different kinds of art, that allowed me to bring them together comfortably and honestly within this theme. It was important for me to present Indigenous art to audiences, and I felt it was most authentic that it was seen as part of Australian art history, rather than a separate area with a world of its own.'</p>\n\n    <p>Meanwhile, Australian critic Mendelssohn also points out that London is increasingly less important to today's generation of artists, and this somewhat weakens the ceremony surrounding the exhibition in London. 'China is the most important art market in the world,' she says. 'If you've made it in Shanghai, you've made it. The world has changed. My students in Australia, who come from all over the world, really want to see Venice Biennale and Art Basel, but they're less interested in going to London. When I was growing up, London was the destination, and then when I was at university all the smart young things wanted to go to New York,' she added. 'Now they want to go everywhere. There's no such thing as the centre and the periphery like there used to be. It's much more complicated.'</p>\n    \n    <p>&nbsp;</p> <!-- Final padding -->\n  </section>\n\n  <!-- Draggable Divider -->\n  <div id=\"divider\" title=\"Drag to resize\"></div>\n\n  <!-- Right Pane: Questions and Controls -->"
+        "bodyHtml": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>200 Years of Australian Landscapes at the Royal Academy in London</h3>\n<p><em>This exhibition promises to chart the evolution of a nation through its art, but not everyone agrees with the reasons behind the choice of artwork.</em></p>\n<p>For the casual viewer, the exhibition of landscapes, <em>Australia</em>, selected by the Royal Academy of Art, will be a spectacular guide through Australian art history. Included in the exhibition are a range of artists and styles, dating from the earliest days of colonial art and progressing through expressionism and modernism to the greats of the 20th century, culminating with the current generation of Australian artists. It is hardly surprising, then, that this results in a flexible, wide-ranging notion of landscape.</p>\n<p>But this landmark exhibition gives rise to some questions, and perhaps problems, regarding Britain's relationship with its former colony. By choosing a style of painting at which British artists excel, the Academy could be seen as inviting criticism that hints at a telling attitude towards Australian art by comparison. But it is the very theme of landscape that provides the strongest connection to Australian art from Britain. To consider it condescending is perhaps too strong, but for Joanna Mendelssohn, an Australian critic and Associate Professor at the University of NSW's College of Fine Arts (COFA), there is a suggestion that British artistic values have directed this exhibition, rather than allowing Australia the freedom to demonstrate its maturity.</p>\n<p>What Mendelssohn found surprising about this exhibition was that the underlying rules for the selection of works seemed to have been so conservative. Since the landscape is a very strong British artistic theme, it appeared to her that when the British looked to the art of a former colony, there was a tendency for them to think that those colonies would continue to be like the British themselves. In reviewing <em>Australia</em>, the British insisted on looking at the genre of landscape painting.</p>\n<p>Because of colonial ties, it was inevitable during Australian art's formative years that it would reflect Britain's devotion to the beloved landscape before its own character and idiosyncrasies took shape. And while Mendelssohn's concern over the exhibition's conventional selection is valid, the Academy is nevertheless embracing the peculiarities of Australian art from the mid-19th century onward, albeit within the boundaries of landscape.</p>\n<p><em>Australia</em> is curated by Kathleen Soriano, director of exhibitions at the Royal Academy. \"Certainly the influence of English, French, or German art is much more evident in the early periods, in the early 1800s to mid-1800s,\" she says. \"What I wanted to show was how Australian art develops a real distinctiveness, associated with the landscape and the light.\"</p>\n<p>The fusion of tradition of the European kind with something more specifically Australian, and often personal, is crucial to the exhibition, and extends particularly to some of the more contemporary artists involved. Sydney-born video artist Shaun Gladwell is a good example of this. Gladwell's most famous piece, which is featured in the exhibition, is <em>Storm Sequence</em> (2000), a video of Gladwell skateboarding on the Bondi seafront as one of Sydney's signature brutal storms lingers offshore. It is his acknowledgment of landscape (or seascape) tradition, colored by Gladwell's own individualism. \"To exhibit my work in this show might make some sense because I was interested in Turner and the idea of atmosphere affecting vision, something I was really interested in around the time of <em>Storm Sequence</em>. I was thinking about this tradition of Romantic landscape, but I wanted to make it personal,\" says Gladwell. But he didn't want to just embark on borrowing imagery from elsewhere. He wanted to bring it to his experience and his world through skateboarding and beach culture.</p>\n<p>So while it may seem narrow for Britain to reduce Australian art to the genre of landscape, there can be little denying that British landscape painting is still relevant to a current generation of Australian practitioners, however indirectly.</p>\n<p>Visitors to the exhibition encounter Australian Aboriginal art first, the idea being that these works warrant a prominent position because they were 'first'. Over the last couple of decades, London has hosted many successful exhibitions of Aboriginal art in smaller spaces, but for Soriano, <em>Australia</em> represents an opportunity to place such art in a broader context, with new relationships to the art of the settlers and white Australia. 'One of the reasons landscape makes sense as being the right theme was because Aboriginal art started in and on the landscape,' she says. '[The exhibition] is a beautiful meshing of the two different kinds of art, that allowed me to bring them together comfortably and honestly within this theme. It was important for me to present Indigenous art to audiences, and I felt it was most authentic that it was seen as part of Australian art history, rather than a separate area with a world of its own.'</p>\n<p>Meanwhile, Australian critic Mendelssohn also points out that London is increasingly less important to today's generation of artists, and this somewhat weakens the ceremony surrounding the exhibition in London. 'China is the most important art market in the world,' she says. 'If you've made it in Shanghai, you've made it. The world has changed. My students in Australia, who come from all over the world, really want to see Venice Biennale and Art Basel, but they're less interested in going to London. When I was growing up, London was the destination, and then when I was at university all the smart young things wanted to go to New York,' she added. 'Now they want to go everywhere. There's no such thing as the centre and the periphery like there used to be. It's much more complicated.'</p>\n<p>&nbsp;</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"
       }
     ]
   },
@@ -26,7 +26,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 27–31</h4>\n      <p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n      <p><em>In boxes 27–31 on your answer sheet, write</em></p>\n      <ul style=\"list-style:none; padding-left:0; font-weight:bold; font-size:0.9em;\">\n        <li>YES <span style=\"font-weight:normal; margin-left:45px;\">if the statement agrees with the views of the writer</span></li>\n        <li>NO <span style=\"font-weight:normal; margin-left:52px;\">if the statement contradicts the views of the writer</span></li>\n        <li>NOT GIVEN <span style=\"font-weight:normal; margin-left:8px;\">if it is impossible to say what the writer thinks about this</span></li>\n      </ul>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q1-anchor\"></a><b>27</b> As expected, the artworks chosen for the exhibition reflect a narrow interpretation of landscape.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q1\" value=\"yes\"> Yes</label>\n            <label><input type=\"radio\" name=\"q1\" value=\"no\"> No</label>\n            <label><input type=\"radio\" name=\"q1\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q2-anchor\"></a><b>28</b> The Academy rejected Australian suggestions for the subject of the exhibition.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q2\" value=\"yes\"> Yes</label>\n            <label><input type=\"radio\" name=\"q2\" value=\"no\"> No</label>\n            <label><input type=\"radio\" name=\"q2\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q3-anchor\"></a><b>29</b> The colonial relationship meant that early Australian landscape painting followed the traditions of English landscape painting.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q3\" value=\"yes\"> Yes</label>\n            <label><input type=\"radio\" name=\"q3\" value=\"no\"> No</label>\n            <label><input type=\"radio\" name=\"q3\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q4-anchor\"></a><b>30</b> The exhibition reflects the fact that Australian art developed its own particular qualities.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q4\" value=\"yes\"> Yes</label>\n            <label><input type=\"radio\" name=\"q4\" value=\"no\"> No</label>\n            <label><input type=\"radio\" name=\"q4\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q5-anchor\"></a><b>31</b> Contemporary Australian artists have generally rejected British landscape traditions.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q5\" value=\"yes\"> Yes</label>\n            <label><input type=\"radio\" name=\"q5\" value=\"no\"> No</label>\n            <label><input type=\"radio\" name=\"q5\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 27–31</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<p><em>In boxes 27–31 on your answer sheet, write</em></p>\n<ul style=\"list-style:none; padding-left:0; font-weight:bold; font-size:0.9em;\">\n<li>YES <span style=\"font-weight:normal; margin-left:45px;\">if the statement agrees with the views of the writer</span></li>\n<li>NO <span style=\"font-weight:normal; margin-left:52px;\">if the statement contradicts the views of the writer</span></li>\n<li>NOT GIVEN <span style=\"font-weight:normal; margin-left:8px;\">if it is impossible to say what the writer thinks about this</span></li>\n</ul>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q1-anchor\"></a><b>27</b> As expected, the artworks chosen for the exhibition reflect a narrow interpretation of landscape.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q1\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q1\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q1\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q2-anchor\"></a><b>28</b> The Academy rejected Australian suggestions for the subject of the exhibition.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q2\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q2\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q2\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q3-anchor\"></a><b>29</b> The colonial relationship meant that early Australian landscape painting followed the traditions of English landscape painting.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q3\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q3\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q3\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q4-anchor\"></a><b>30</b> The exhibition reflects the fact that Australian art developed its own particular qualities.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q4\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q4\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q4\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q5-anchor\"></a><b>31</b> Contemporary Australian artists have generally rejected British landscape traditions.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q5\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q5\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q5\" value=\"not given\"> NG</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -38,7 +38,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 32–36</h4>\n      <p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n      \n      <div style=\"margin-bottom:16px;\">\n        <p><a id=\"q6-anchor\"></a><strong>32</strong> What is the writer's main point in the second paragraph?</p>\n        <div class=\"mcq-group\" style=\"display:flex; flex-direction:column; gap:8px;\">\n          <label><input type=\"radio\" name=\"q6\" value=\"a\"> A. Australian landscape painting derives from the British tradition.</label>\n          <label><input type=\"radio\" name=\"q6\" value=\"b\"> B. Australian landscape painting is more highly regarded than British.</label>\n          <label><input type=\"radio\" name=\"q6\" value=\"c\"> C. Britain is still imposing its principles on Australian art.</label>\n          <label><input type=\"radio\" name=\"q6\" value=\"d\"> D. British art cannot be compared to Australian art.</label>\n        </div>\n      </div>\n\n      <div style=\"margin-bottom:16px;\">\n        <p><a id=\"q7-anchor\"></a><strong>33</strong> What does Joanna Mendelssohn find surprising?</p>\n        <div class=\"mcq-group\" style=\"display:flex; flex-direction:column; gap:8px;\">\n          <label><input type=\"radio\" name=\"q7\" value=\"a\"> A. Modern Australian landscape painting has great variety.</label>\n          <label><input type=\"radio\" name=\"q7\" value=\"b\"> B. The guidelines for the choice of work were very traditional.</label>\n          <label><input type=\"radio\" name=\"q7\" value=\"c\"> C. Landscape painting remains a popular subject for British artists.</label>\n          <label><input type=\"radio\" name=\"q7\" value=\"d\"> D. The British find the Australian landscape unsuitable as a subject.</label>\n        </div>\n      </div>\n\n      <div style=\"margin-bottom:16px;\">\n        <p><a id=\"q8-anchor\"></a><strong>34</strong> Shaun Gladwell's work is included in the exhibition because</p>\n        <div class=\"mcq-group\" style=\"display:flex; flex-direction:column; gap:8px;\">\n          <label><input type=\"radio\" name=\"q8\" value=\"a\"> A. it adopts a subjective approach to depicting the landscape.</label>\n          <label><input type=\"radio\" name=\"q8\" value=\"b\"> B. skateboarding is an inspiration to many Australian artists.</label>\n          <label><input type=\"radio\" name=\"q8\" value=\"c\"> C. storms are a significant feature in the Australian landscape.</label>\n          <label><input type=\"radio\" name=\"q8\" value=\"d\"> D. Bondi is an iconic Australian location.</label>\n        </div>\n      </div>\n\n      <div style=\"margin-bottom:16px;\">\n        <p><a id=\"q9-anchor\"></a><strong>35</strong> What was the reason for Soriano including Aboriginal art in the exhibition</p>\n        <div class=\"mcq-group\" style=\"display:flex; flex-direction:column; gap:8px;\">\n          <label><input type=\"radio\" name=\"q9\" value=\"a\"> A. It is not well known in London art circles.</label>\n          <label><input type=\"radio\" name=\"q9\" value=\"b\"> B. Aboriginal landscape painting influenced Australian settlers.</label>\n          <label><input type=\"radio\" name=\"q9\" value=\"c\"> C. It is part of the Australian art tradition and not independent of it.</label>\n          <label><input type=\"radio\" name=\"q9\" value=\"d\"> D. Modern Aboriginal painting deals with changes to the landscape.</label>\n        </div>\n      </div>\n\n      <div style=\"margin-bottom:16px;\">\n        <p><a id=\"q10-anchor\"></a><strong>36</strong> By referring to China, Mendelssohn is making the point that</p>\n        <div class=\"mcq-group\" style=\"display:flex; flex-direction:column; gap:8px;\">\n          <label><input type=\"radio\" name=\"q10\" value=\"a\"> A. having an exhibition in London is not as important as it used to be.</label>\n          <label><input type=\"radio\" name=\"q10\" value=\"b\"> B. young artists in Britain are not interested in Australian art.</label>\n          <label><input type=\"radio\" name=\"q10\" value=\"c\"> C. art from Shanghai is more important than Australian art.</label>\n          <label><input type=\"radio\" name=\"q10\" value=\"d\"> D. New York is still a preferred destination for young artists.</label>\n        </div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 32–36</h4>\n<p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q6-anchor\"></a><strong>32</strong> What is the writer's main point in the second paragraph?</p>\n<div class=\"mcq-group\" style=\"display:flex; flex-direction:column; gap:8px;\">\n<label><input type=\"radio\" name=\"q6\" value=\"a\"> A. Australian landscape painting derives from the British tradition.</label> <label><input type=\"radio\" name=\"q6\" value=\"b\"> B. Australian landscape painting is more highly regarded than British.</label> <label><input type=\"radio\" name=\"q6\" value=\"c\"> C. Britain is still imposing its principles on Australian art.</label> <label><input type=\"radio\" name=\"q6\" value=\"d\"> D. British art cannot be compared to Australian art.</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q7-anchor\"></a><strong>33</strong> What does Joanna Mendelssohn find surprising?</p>\n<div class=\"mcq-group\" style=\"display:flex; flex-direction:column; gap:8px;\">\n<label><input type=\"radio\" name=\"q7\" value=\"a\"> A. Modern Australian landscape painting has great variety.</label> <label><input type=\"radio\" name=\"q7\" value=\"b\"> B. The guidelines for the choice of work were very traditional.</label> <label><input type=\"radio\" name=\"q7\" value=\"c\"> C. Landscape painting remains a popular subject for British artists.</label> <label><input type=\"radio\" name=\"q7\" value=\"d\"> D. The British find the Australian landscape unsuitable as a subject.</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q8-anchor\"></a><strong>34</strong> Shaun Gladwell's work is included in the exhibition because</p>\n<div class=\"mcq-group\" style=\"display:flex; flex-direction:column; gap:8px;\">\n<label><input type=\"radio\" name=\"q8\" value=\"a\"> A. it adopts a subjective approach to depicting the landscape.</label> <label><input type=\"radio\" name=\"q8\" value=\"b\"> B. skateboarding is an inspiration to many Australian artists.</label> <label><input type=\"radio\" name=\"q8\" value=\"c\"> C. storms are a significant feature in the Australian landscape.</label> <label><input type=\"radio\" name=\"q8\" value=\"d\"> D. Bondi is an iconic Australian location.</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q9-anchor\"></a><strong>35</strong> What was the reason for Soriano including Aboriginal art in the exhibition</p>\n<div class=\"mcq-group\" style=\"display:flex; flex-direction:column; gap:8px;\">\n<label><input type=\"radio\" name=\"q9\" value=\"a\"> A. It is not well known in London art circles.</label> <label><input type=\"radio\" name=\"q9\" value=\"b\"> B. Aboriginal landscape painting influenced Australian settlers.</label> <label><input type=\"radio\" name=\"q9\" value=\"c\"> C. It is part of the Australian art tradition and not independent of it.</label> <label><input type=\"radio\" name=\"q9\" value=\"d\"> D. Modern Aboriginal painting deals with changes to the landscape.</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q10-anchor\"></a><strong>36</strong> By referring to China, Mendelssohn is making the point that</p>\n<div class=\"mcq-group\" style=\"display:flex; flex-direction:column; gap:8px;\">\n<label><input type=\"radio\" name=\"q10\" value=\"a\"> A. having an exhibition in London is not as important as it used to be.</label> <label><input type=\"radio\" name=\"q10\" value=\"b\"> B. young artists in Britain are not interested in Australian art.</label> <label><input type=\"radio\" name=\"q10\" value=\"c\"> C. art from Shanghai is more important than Australian art.</label> <label><input type=\"radio\" name=\"q10\" value=\"d\"> D. New York is still a preferred destination for young artists.</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -49,7 +49,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 37–40</h4>\n      <p>Complete each sentence with the correct ending, <strong>A–F</strong>, below.</p>\n      <p><em>Drag the correct ending block to the box below each sentence start.</em></p>\n\n      <!-- Draggable Full Text Options -->\n      <div class=\"options-pool\" id=\"pool-endings\">\n        <strong>List of Endings</strong>\n        <div class=\"pool-items\">\n        <div class=\"drag-item\" draggable=\"true\" id=\"c-a\" data-option=\"A\"><strong>A</strong> reflects the mood created by the natural environment.</div>\n        <div class=\"drag-item\" draggable=\"true\" id=\"c-b\" data-option=\"B\"><strong>B</strong> demonstrates that the dominant art form in Australia is landscape painting.</div>\n        <div class=\"drag-item\" draggable=\"true\" id=\"c-c\" data-option=\"C\"><strong>C</strong> demonstrates an understanding of the historical importance of the land.</div>\n        <div class=\"drag-item\" draggable=\"true\" id=\"c-d\" data-option=\"D\"><strong>D</strong> showcases a very small number of artists.</div>\n        <div class=\"drag-item\" draggable=\"true\" id=\"c-e\" data-option=\"E\"><strong>E</strong> demonstrates a strong European flavour.</div>\n        <div class=\"drag-item\" draggable=\"true\" id=\"c-f\" data-option=\"F\"><strong>F</strong> shows an acceptance of the unique qualities of Australian art.</div>\n      </div>\n      </div>\n\n      <hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n\n      <div>\n        <p><a id=\"q11-anchor\"></a><strong>37</strong> In spite of its conservatism, the Royal Academy exhibition</p>\n        <div class=\"match-dropzone\" data-question=\"q11\"></div>\n      </div>\n      <div>\n        <p><a id=\"q12-anchor\"></a><strong>38</strong> Australian art of the early to mid-1800s</p>\n        <div class=\"match-dropzone\" data-question=\"q12\"></div>\n      </div>\n      <div>\n        <p><a id=\"q13-anchor\"></a><strong>39</strong> The modern work by Gladwell chosen for the exhibition</p>\n        <div class=\"match-dropzone\" data-question=\"q13\"></div>\n      </div>\n      <div>\n        <p><a id=\"q14-anchor\"></a><strong>40</strong> Including Aboriginal art in the exhibition</p>\n        <div class=\"match-dropzone\" data-question=\"q14\"></div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 37–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–F</strong>, below.</p>\n<p><em>Drag the correct ending block to the box below each sentence start.</em></p>\n<div class=\"options-pool\" id=\"pool-endings\">\n<strong>List of Endings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" id=\"c-a\" data-option=\"A\"><strong>A</strong> reflects the mood created by the natural environment.</div>\n<div class=\"drag-item\" draggable=\"true\" id=\"c-b\" data-option=\"B\"><strong>B</strong> demonstrates that the dominant art form in Australia is landscape painting.</div>\n<div class=\"drag-item\" draggable=\"true\" id=\"c-c\" data-option=\"C\"><strong>C</strong> demonstrates an understanding of the historical importance of the land.</div>\n<div class=\"drag-item\" draggable=\"true\" id=\"c-d\" data-option=\"D\"><strong>D</strong> showcases a very small number of artists.</div>\n<div class=\"drag-item\" draggable=\"true\" id=\"c-e\" data-option=\"E\"><strong>E</strong> demonstrates a strong European flavour.</div>\n<div class=\"drag-item\" draggable=\"true\" id=\"c-f\" data-option=\"F\"><strong>F</strong> shows an acceptance of the unique qualities of Australian art.</div>\n</div>\n</div>\n<hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n<div>\n<p><a id=\"q11-anchor\"></a><strong>37</strong> In spite of its conservatism, the Royal Academy exhibition</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div>\n<p><a id=\"q12-anchor\"></a><strong>38</strong> Australian art of the early to mid-1800s</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div>\n<p><a id=\"q13-anchor\"></a><strong>39</strong> The modern work by Gladwell chosen for the exhibition</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div>\n<p><a id=\"q14-anchor\"></a><strong>40</strong> Including Aboriginal art in the exhibition</p>\n<div class=\"match-dropzone\" data-question=\"q14\"></div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -11,7 +11,7 @@
       {
         "blockId": "passage-main",
         "kind": "text",
-        "bodyHtml": "<h2>READING PASSAGE 3</h2>\n    <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n    \n    <h3>Children's literature studies today</h3>\n  \n    <p>Who studies children's literature and what is it that they study? The answers to this question are complex and messy, because of the many confounding factors which exist in this field.</p>\n\n    <p>Firstly, unlike literature for adults, children's literature is not generally written by its own readers. Adults write for children, and thus adult perceptions of what children are and of what they could and should become are woven into the literature.</p>\n\n    <p>Furthermore, some of those who study children's literature (and those who write certain kinds of children's books) are less interested in literary values than in the kinds of lessons it can teach- either in terms of creating better children or in terms of serving a particular curriculum. The issue of how a teacher can use a children's book is often contentious, but even outside the classroom, much material for children is still didactic.</p>\n\n    <p>Thirdly, while almost all literature is currently promoted within a strong commercial matrix, children's literature is often especially targeted for marketing initiatives. This fact means that readers are often recruited with a message that is negligibly literary and significantly oriented to ideas of consumption. Daniel Hade (2002) has raised useful questions about whether children's experience of reading is altered when their books are part of a larger marketing framework involving the movie, the game, and the toy of a popular children's book. How children perceive and respond to their stories in this new context is an important question.</p>\n\n    <p>It is also important to note that texts in an ever-increasing range of new media compete with print media for the attention of the child reader, and create definitional issues for scholars. Does the term literature' exclusively imply a verbal text? If not, where are the limits? Could a literary computer game ever be considered a work of literature? If not, what kind of attention should be paid to it, since children themselves undoubtedly perceive their print literature as part of a broader continuum? The internet provides one forum through which children now communicate with each other. (In 2003, the internet search engine Google listed 7,920,000 sites relating to the Harry Potter novels; even allowing for duplication and dead ends, that is a number with revolutionary implications.)</p>\n    \n    <p>Finally, in the context of the higher education institutions where the formal study of children's literature is often located, at least three disciplinary frameworks (English, education, and librarianship) fragment the focus of scholarly study of children's literature.</p>\n\n    <p>How is the value of the imaginative encounter with the work of literature sustained and honored among such a welter of conflicting interests? One route through this maze is to ask the child readers for help. As David Lewis (2001) has perceptively noted, what children think of reading is not usually the same as what adults think, whether teachers or parents. As Lewis points out, children 'sometimes see more and they often see differently'. If those who study reading can explore children's perceptions as well as those of adults, their understanding of the nature of reading will be enhanced.</p>\n\n    <p>Lewis makes a further valid point when he adds that exploring children's perceptions is usually justified for educational reasons: \"It is true that a better understanding of how children read and how they learn to read, is a prerequisite to improved approaches to teaching. However, it can also be argued, as Lewis rightly does, that when children's responses to literature are accessed and interpreted, they frequently lead to an understanding of how picture books appeal to children.</p>\n\n    <p>Young people's accounts of what and how they read also enable a more sophisticated description of many of the complex processes involved in reading. All descriptions of reading runs the risk of solipsism: i.e. this is how I read so this is what reading is for everyone. Asking other readers how they read, however, reduces that risk. For example, if I am a strong visualizer as I read, I may consider that visualization is a key component of successful reading and I may judge books by their capacity to evoke a vivid visual response. Other readers, however, may help me to realize that not everyone reads with mental pictures. Some readers respond to the patterns of the words, 'hearing' them inaudibly like a subliminal radio program. Others respond to the patterns of feelings in the story, responding with an emotional connection. Talking to competent readers, of all ages, provides a better understanding of reading experiences.</p>\n\n    <p>Children's insights are even more important when it comes to understanding the significance of print literature as one aspect of literary culture. Too often adults assume that reading any book at all is a more worthwhile experience than playing a digital game of any kind. A humbler approach would include asking why the game appeals to the player. Many adults will probably never develop the automatic skills to process a game as readily as they can read a book. This does not indicate that a book is better, but that a particular set of skills is absent. Non-players must acknowledge that some fictional universes are thus closed to them, and a logical response would be to find someone who can guide them to the pleasures and challenges of the gaming world. Games need to be judged individually just as books do, and any evaluative framework needs to take this into account.</p>\n    \n    <p>&nbsp;</p> <!-- Final padding -->\n  </section>\n\n  <!-- Draggable Divider -->\n  <div id=\"divider\" title=\"Drag to resize\"></div>\n\n  <!-- Right Pane: Questions and Controls -->"
+        "bodyHtml": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Children's literature studies today</h3>\n<p>Who studies children's literature and what is it that they study? The answers to this question are complex and messy, because of the many confounding factors which exist in this field.</p>\n<p>Firstly, unlike literature for adults, children's literature is not generally written by its own readers. Adults write for children, and thus adult perceptions of what children are and of what they could and should become are woven into the literature.</p>\n<p>Furthermore, some of those who study children's literature (and those who write certain kinds of children's books) are less interested in literary values than in the kinds of lessons it can teach- either in terms of creating better children or in terms of serving a particular curriculum. The issue of how a teacher can use a children's book is often contentious, but even outside the classroom, much material for children is still didactic.</p>\n<p>Thirdly, while almost all literature is currently promoted within a strong commercial matrix, children's literature is often especially targeted for marketing initiatives. This fact means that readers are often recruited with a message that is negligibly literary and significantly oriented to ideas of consumption. Daniel Hade (2002) has raised useful questions about whether children's experience of reading is altered when their books are part of a larger marketing framework involving the movie, the game, and the toy of a popular children's book. How children perceive and respond to their stories in this new context is an important question.</p>\n<p>It is also important to note that texts in an ever-increasing range of new media compete with print media for the attention of the child reader, and create definitional issues for scholars. Does the term literature' exclusively imply a verbal text? If not, where are the limits? Could a literary computer game ever be considered a work of literature? If not, what kind of attention should be paid to it, since children themselves undoubtedly perceive their print literature as part of a broader continuum? The internet provides one forum through which children now communicate with each other. (In 2003, the internet search engine Google listed 7,920,000 sites relating to the Harry Potter novels; even allowing for duplication and dead ends, that is a number with revolutionary implications.)</p>\n<p>Finally, in the context of the higher education institutions where the formal study of children's literature is often located, at least three disciplinary frameworks (English, education, and librarianship) fragment the focus of scholarly study of children's literature.</p>\n<p>How is the value of the imaginative encounter with the work of literature sustained and honored among such a welter of conflicting interests? One route through this maze is to ask the child readers for help. As David Lewis (2001) has perceptively noted, what children think of reading is not usually the same as what adults think, whether teachers or parents. As Lewis points out, children 'sometimes see more and they often see differently'. If those who study reading can explore children's perceptions as well as those of adults, their understanding of the nature of reading will be enhanced.</p>\n<p>Lewis makes a further valid point when he adds that exploring children's perceptions is usually justified for educational reasons: \"It is true that a better understanding of how children read and how they learn to read, is a prerequisite to improved approaches to teaching. However, it can also be argued, as Lewis rightly does, that when children's responses to literature are accessed and interpreted, they frequently lead to an understanding of how picture books appeal to children.</p>\n<p>Young people's accounts of what and how they read also enable a more sophisticated description of many of the complex processes involved in reading. All descriptions of reading runs the risk of solipsism: i.e. this is how I read so this is what reading is for everyone. Asking other readers how they read, however, reduces that risk. For example, if I am a strong visualizer as I read, I may consider that visualization is a key component of successful reading and I may judge books by their capacity to evoke a vivid visual response. Other readers, however, may help me to realize that not everyone reads with mental pictures. Some readers respond to the patterns of the words, 'hearing' them inaudibly like a subliminal radio program. Others respond to the patterns of feelings in the story, responding with an emotional connection. Talking to competent readers, of all ages, provides a better understanding of reading experiences.</p>\n<p>Children's insights are even more important when it comes to understanding the significance of print literature as one aspect of literary culture. Too often adults assume that reading any book at all is a more worthwhile experience than playing a digital game of any kind. A humbler approach would include asking why the game appeals to the player. Many adults will probably never develop the automatic skills to process a game as readily as they can read a book. This does not indicate that a book is better, but that a particular set of skills is absent. Non-players must acknowledge that some fictional universes are thus closed to them, and a logical response would be to find someone who can guide them to the pleasures and challenges of the gaming world. Games need to be judged individually just as books do, and any evaluative framework needs to take this into account.</p>\n<p>&nbsp;</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"
       }
     ]
   },
@@ -24,7 +24,7 @@
         "q2",
         "q3"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 27–29</h4>\n      <p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n      \n      <div style=\"margin-bottom:16px;\">\n        <p><a id=\"q1-anchor\"></a><strong>27</strong> Which of the following best summarises the writer's argument in the second paragraph?</p>\n        <div class=\"mcq-group\">\n          <label><input type=\"radio\" name=\"q1\" value=\"a\"> A. Children are portrayed as adults see them.</label>\n          <label><input type=\"radio\" name=\"q1\" value=\"b\"> B. Children are unable to write their own stories.</label>\n          <label><input type=\"radio\" name=\"q1\" value=\"c\"> C. Adults fail to stimulate children's imaginations.</label>\n          <label><input type=\"radio\" name=\"q1\" value=\"d\"> D. Adult literature is too difficult for children.</label>\n        </div>\n      </div>\n\n      <div style=\"margin-bottom:16px;\">\n        <p><a id=\"q2-anchor\"></a><strong>28</strong> In the third paragraph, what does the writer say is the main interest of some people who study children's literature?</p>\n        <div class=\"mcq-group\">\n          <label><input type=\"radio\" name=\"q2\" value=\"a\"> A. the quality of the writing</label>\n          <label><input type=\"radio\" name=\"q2\" value=\"b\"> B. the imaginative content of stories</label>\n          <label><input type=\"radio\" name=\"q2\" value=\"c\"> C. the instructive nature of children's books</label>\n          <label><input type=\"radio\" name=\"q2\" value=\"d\"> D. the way children are written about in stories</label>\n        </div>\n      </div>\n\n      <div style=\"margin-bottom:16px;\">\n        <p><a id=\"q3-anchor\"></a><strong>29</strong> The main point of the writer's argument in the fifth paragraph is to</p>\n        <div class=\"mcq-group\">\n          <label><input type=\"radio\" name=\"q3\" value=\"a\"> A. demonstrate that academics consider computer games to be a logical extension of children's literature.</label>\n          <label><input type=\"radio\" name=\"q3\" value=\"b\"> B. explore the impact of computers on the boundaries of children's literature.</label>\n          <label><input type=\"radio\" name=\"q3\" value=\"c\"> C. illustrate that literature and computer games have different origins.</label>\n          <label><input type=\"radio\" name=\"q3\" value=\"d\"> D. prove that children are using computers more than they are reading literature.</label>\n        </div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 27–29</h4>\n<p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q1-anchor\"></a><strong>27</strong> Which of the following best summarises the writer's argument in the second paragraph?</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q1\" value=\"a\"> A. Children are portrayed as adults see them.</label> <label><input type=\"radio\" name=\"q1\" value=\"b\"> B. Children are unable to write their own stories.</label> <label><input type=\"radio\" name=\"q1\" value=\"c\"> C. Adults fail to stimulate children's imaginations.</label> <label><input type=\"radio\" name=\"q1\" value=\"d\"> D. Adult literature is too difficult for children.</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q2-anchor\"></a><strong>28</strong> In the third paragraph, what does the writer say is the main interest of some people who study children's literature?</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q2\" value=\"a\"> A. the quality of the writing</label> <label><input type=\"radio\" name=\"q2\" value=\"b\"> B. the imaginative content of stories</label> <label><input type=\"radio\" name=\"q2\" value=\"c\"> C. the instructive nature of children's books</label> <label><input type=\"radio\" name=\"q2\" value=\"d\"> D. the way children are written about in stories</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q3-anchor\"></a><strong>29</strong> The main point of the writer's argument in the fifth paragraph is to</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q3\" value=\"a\"> A. demonstrate that academics consider computer games to be a logical extension of children's literature.</label> <label><input type=\"radio\" name=\"q3\" value=\"b\"> B. explore the impact of computers on the boundaries of children's literature.</label> <label><input type=\"radio\" name=\"q3\" value=\"c\"> C. illustrate that literature and computer games have different origins.</label> <label><input type=\"radio\" name=\"q3\" value=\"d\"> D. prove that children are using computers more than they are reading literature.</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -36,7 +36,7 @@
         "q7",
         "q8"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 30–34</h4>\n      <p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n      <p><em>In boxes 30–34 on your answer sheet, write</em></p>\n      <ul style=\"list-style:none; padding-left:0; font-weight:bold; font-size:0.9em;\">\n        <li>YES <span style=\"font-weight:normal; margin-left:45px;\">if the statement agrees with the views of the writer</span></li>\n        <li>NO <span style=\"font-weight:normal; margin-left:52px;\">if the statement contradicts the views of the writer</span></li>\n        <li>NOT GIVEN <span style=\"font-weight:normal; margin-left:8px;\">if it is impossible to say what the writer thinks about this</span></li>\n      </ul>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q4-anchor\"></a><b>30</b> Children tend to make a clear distinction between print literature and electronic media.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q4\" value=\"yes\"> Yes</label>\n            <label><input type=\"radio\" name=\"q4\" value=\"no\"> No</label>\n            <label><input type=\"radio\" name=\"q4\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q5-anchor\"></a><b>31</b> The study of children's literature at higher education institutions is restricted to one subject area.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q5\" value=\"yes\"> Yes</label>\n            <label><input type=\"radio\" name=\"q5\" value=\"no\"> No</label>\n            <label><input type=\"radio\" name=\"q5\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q6-anchor\"></a><b>32</b> Exploring children's perceptions of reading will assist parents to choose suitable books for children.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q6\" value=\"yes\"> Yes</label>\n            <label><input type=\"radio\" name=\"q6\" value=\"no\"> No</label>\n            <label><input type=\"radio\" name=\"q6\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q7-anchor\"></a><b>33</b> Adults may appreciate the appeal of illustrated stories better, if they have more information on how children read.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q7\" value=\"yes\"> Yes</label>\n            <label><input type=\"radio\" name=\"q7\" value=\"no\"> No</label>\n            <label><input type=\"radio\" name=\"q7\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q8-anchor\"></a><b>34</b> Children should be asked what features they would like digital games to include.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q8\" value=\"yes\"> Yes</label>\n            <label><input type=\"radio\" name=\"q8\" value=\"no\"> No</label>\n            <label><input type=\"radio\" name=\"q8\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 30–34</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<p><em>In boxes 30–34 on your answer sheet, write</em></p>\n<ul style=\"list-style:none; padding-left:0; font-weight:bold; font-size:0.9em;\">\n<li>YES <span style=\"font-weight:normal; margin-left:45px;\">if the statement agrees with the views of the writer</span></li>\n<li>NO <span style=\"font-weight:normal; margin-left:52px;\">if the statement contradicts the views of the writer</span></li>\n<li>NOT GIVEN <span style=\"font-weight:normal; margin-left:8px;\">if it is impossible to say what the writer thinks about this</span></li>\n</ul>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q4-anchor\"></a><b>30</b> Children tend to make a clear distinction between print literature and electronic media.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q4\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q4\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q4\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q5-anchor\"></a><b>31</b> The study of children's literature at higher education institutions is restricted to one subject area.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q5\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q5\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q5\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q6-anchor\"></a><b>32</b> Exploring children's perceptions of reading will assist parents to choose suitable books for children.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q6\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q6\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q6\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q7-anchor\"></a><b>33</b> Adults may appreciate the appeal of illustrated stories better, if they have more information on how children read.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q7\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q7\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q7\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q8-anchor\"></a><b>34</b> Children should be asked what features they would like digital games to include.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q8\" value=\"yes\"> Yes</label> <label><input type=\"radio\" name=\"q8\" value=\"no\"> No</label> <label><input type=\"radio\" name=\"q8\" value=\"not given\"> NG</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -48,7 +48,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 35–39</h4>\n      <p>Complete each sentence with the correct ending, <strong>A–H</strong>, below.</p>\n      <p><em>Drag the correct ending block to the box below each sentence start.</em></p>\n\n      <!-- Draggable Full Text Options -->\n      <div class=\"cardpool pool-vertical\" id=\"pool-endings\">\n        <div class=\"card\" draggable=\"true\" id=\"c-a\" data-value=\"A\"><strong>A</strong> accepting that literature exists in a variety of forms today.</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-b\" data-value=\"B\"><strong>B</strong> verbalising the words in their heads.</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-c\" data-value=\"C\"><strong>C</strong> discovering the reading techniques used by others.</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-d\" data-value=\"D\"><strong>D</strong> the style of written stories changing over time.</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-e\" data-value=\"E\"><strong>E</strong> the lack of some specific abilities.</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-f\" data-value=\"F\"><strong>F</strong> a deeper knowledge of the intricacies of reading.</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-g\" data-value=\"G\"><strong>G</strong> children teaching adults to play computer games.</div>\n        <div class=\"card\" draggable=\"true\" id=\"c-h\" data-value=\"H\"><strong>H</strong> creating a variety of images in their minds.</div>\n      </div>\n\n      <hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n\n      <div>\n        <p><a id=\"q9-anchor\"></a><strong>35</strong> Young people's accounts of how they read lead to</p>\n        <span class=\"dropzone match-dropzone\" data-target=\"q9\" data-question=\"q9\"></span>\n      </div>\n      <div>\n        <p><a id=\"q10-anchor\"></a><strong>36</strong> The risk of solipsism is reduced by</p>\n        <span class=\"dropzone match-dropzone\" data-target=\"q10\" data-question=\"q10\"></span>\n      </div>\n      <div>\n        <p><a id=\"q11-anchor\"></a><strong>37</strong> Strong visualisers judge books on the basis that they are</p>\n        <span class=\"dropzone match-dropzone\" data-target=\"q11\" data-question=\"q11\"></span>\n      </div>\n      <div>\n        <p><a id=\"q12-anchor\"></a><strong>38</strong> Children's insights are important in</p>\n        <span class=\"dropzone match-dropzone\" data-target=\"q12\" data-question=\"q12\"></span>\n      </div>\n      <div>\n        <p><a id=\"q13-anchor\"></a><strong>39</strong> When adults read a book more easily than they play a digital game, it simply suggests</p>\n        <span class=\"dropzone match-dropzone\" data-target=\"q13\" data-question=\"q13\"></span>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 35–39</h4>\n<p>Complete each sentence with the correct ending, <strong>A–H</strong>, below.</p>\n<p><em>Drag the correct ending block to the box below each sentence start.</em></p>\n<div class=\"cardpool pool-vertical\" id=\"pool-endings\">\n<div class=\"card\" draggable=\"true\" id=\"c-a\" data-value=\"A\"><strong>A</strong> accepting that literature exists in a variety of forms today.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-b\" data-value=\"B\"><strong>B</strong> verbalising the words in their heads.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-c\" data-value=\"C\"><strong>C</strong> discovering the reading techniques used by others.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-d\" data-value=\"D\"><strong>D</strong> the style of written stories changing over time.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-e\" data-value=\"E\"><strong>E</strong> the lack of some specific abilities.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-f\" data-value=\"F\"><strong>F</strong> a deeper knowledge of the intricacies of reading.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-g\" data-value=\"G\"><strong>G</strong> children teaching adults to play computer games.</div>\n<div class=\"card\" draggable=\"true\" id=\"c-h\" data-value=\"H\"><strong>H</strong> creating a variety of images in their minds.</div>\n</div>\n<hr style=\"border:0; border-top:1px dashed var(--line); margin:20px 0;\">\n<div>\n<p><a id=\"q9-anchor\"></a><strong>35</strong> Young people's accounts of how they read lead to</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q9\" data-question=\"q9\"></span>\n</div>\n<div>\n<p><a id=\"q10-anchor\"></a><strong>36</strong> The risk of solipsism is reduced by</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q10\" data-question=\"q10\"></span>\n</div>\n<div>\n<p><a id=\"q11-anchor\"></a><strong>37</strong> Strong visualisers judge books on the basis that they are</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q11\" data-question=\"q11\"></span>\n</div>\n<div>\n<p><a id=\"q12-anchor\"></a><strong>38</strong> Children's insights are important in</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q12\" data-question=\"q12\"></span>\n</div>\n<div>\n<p><a id=\"q13-anchor\"></a><strong>39</strong> When adults read a book more easily than they play a digital game, it simply suggests</p>\n<span class=\"dropzone match-dropzone\" data-target=\"q13\" data-question=\"q13\"></span>\n</div>\n</div>"
     },
     {
       "groupId": "group-4",
@@ -56,7 +56,7 @@
       "questionIds": [
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Question 40</h4>\n      <p>Choose the correct letter <strong>A, B, C or D</strong>.</p>\n      \n      <div style=\"margin-bottom:16px;\">\n        <p><a id=\"q14-anchor\"></a><strong>40</strong> What was the writer's main purpose in writing this article?</p>\n        <div class=\"mcq-group\">\n          <label><input type=\"radio\" name=\"q14\" value=\"a\"> A. to evaluate how the process of reading fits into children's literature studies</label>\n          <label><input type=\"radio\" name=\"q14\" value=\"b\"> B. to discuss the impact of the increasing commercial influence on children's literature studies</label>\n          <label><input type=\"radio\" name=\"q14\" value=\"c\"> C. to review the challenges in the field of children's literature studies and suggest how to proceed</label>\n          <label><input type=\"radio\" name=\"q14\" value=\"d\"> D. to provide arguments in favor of including computerized forms in children's literature studies</label>\n        </div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Question 40</h4>\n<p>Choose the correct letter <strong>A, B, C or D</strong>.</p>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q14-anchor\"></a><strong>40</strong> What was the writer's main purpose in writing this article?</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q14\" value=\"a\"> A. to evaluate how the process of reading fits into children's literature studies</label> <label><input type=\"radio\" name=\"q14\" value=\"b\"> B. to discuss the impact of the increasing commercial influence on children's literature studies</label> <label><input type=\"radio\" name=\"q14\" value=\"c\"> C. to review the challenges in the field of children's literature studies and suggest how to proceed</label> <label><input type=\"radio\" name=\"q14\" value=\"d\"> D. to provide arguments in favor of including computerized forms in children's literature studies</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Science and Filmmaking</h3>\n            <h4>Academics are now working more with filmmakers who are impressed by the results of their research in computer-generated imagery (CGI)</h4>\n            \n            <p>Every year the film academy in the USA celebrates the outstanding achievements of the year in a ceremony known as the Oscars. An increasingly important component of the ceremony is the presentation of the Scientific and Technical awards. In 2004 a notable event took place: the academic world met the cinematographic world when researchers from Stanford University in the USA were awarded an Oscar. These researchers, led by Steve Marschner, were from the field of Computer Graphics at Stanford. They were part of a growing cohort of computer scientists that has become fundamental to moviemaking.</p>\n            <p>Films have shown that it is possible to use CGI to make actors look younger, older, weaker or stronger than they actually are in a surprisingly realistic manner. At least, it is possible if the altered actors are not filmed too closely. This is because the difficulty of recreating the textures of both skin and fabric means that the effect is less convincing when seen close up. The work of Marschner and his colleagues has greatly improved the accurate and realistic modeling of both skin and fabric. They recognized that one of the difficulties of creating lifelike characters in the computer world is that, in CGI, the characters' skin is opaque (two-dimensional) whereas real skin is in fact translucent (three-dimensional), that is to say, it is semi-transparent.</p>\n            <p>Marschner and his colleagues received the Oscar for their work in successfully producing a CGI model that simulates translucency; this is when light penetrates skin and then scatters below the skin's surface before re-emerging. This is called subsurface scattering, and the mathematics for the model goes back many decades to the time when it was used in astrophysics. Because human skin is naturally translucent, it was necessary to be able to create this artificially in order to simulate the soft appearance of real skin. Previous CGI models, which assumed that skin was entirely opaque, resulted in characters with a plastic appearance. The scientists' new model of CGI was so important in bringing digital characters to life that, within two years of their original research paper, all the major special-effects studios had incorporated it into their digital rendering systems.</p>\n            <p>However, despite their award, the scientists, with admirable tenacity, continued their search for perfection, as they still did not feel that they had yet satisfactorily recreated the subtle ways light is reflected. To do this, they began to look in detail at the way skins and fabrics reflect light differently according to their make-up: the exact arrangement of fibers in fabric and the network of fibers in skin. Marschner and his team tried to do this by using computerized tomography, which is most familiar as a medical technique for examining people's internal organs. Like classical radiology, it uses X-rays, but because the image is constructed inside a computer using exposures taken from many different positions, rather than a single exposure on photographic film, it can capture fine details that are invisible in classical radiography.</p>\n            <p>Unfortunately, the scientists understood that at this point in time they could not use computerized tomography on skin, because a very high-intensity X-ray is needed to show the kind of detail they wanted and this would be very dangerous for human skin. They have, however, had some success with fabric. Using this new method of imaging, they are able to accurately record the three-dimensional structure of all the fibers in a number of small pieces of fabric. These same pieces of fabric, through the use of CGI, can then be patched together to form an entire garment inside a computer, in the same way that a small group of actors can be made to look like hundreds of people gathered together. A garment created through CGI is therefore made up of pieces of fabric whose internal structure has been pre-recorded. This means that the way light is reflected by the garment can be calculated far more realistically than if the scientists just made a computer model of what they thought the interior of the fabric looked like. Cinematography will benefit from this because, although it may take some years to be able to use computerized tomographic imaging of skin, for the moment the movement of a virtual cloak or the lifting of a computerized hat should look far more realistic.</p>\n            <p>In the meantime, according to Marschner's colleague Kavita Bala, the technology might have an application in online retailing. At the moment, people buying clothes over the internet have only a standard photograph to help them choose their purchases. It is hoped that if online shoppers can view items which have been presented through the use of computerized tomography graphics, they will have a much better understanding of what the material the item is made of is really like.</p>\n            <p>Marschner is now working on the way light is scattered from individual hairs. He says, 'I feel lucky to be working in this niche. I'm a visual person and to be able to spend my time scrutinizing the world around me, trying to understand why it looks the way it does, is very rewarding'.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Science and Filmmaking</h3>\n<h4>Academics are now working more with filmmakers who are impressed by the results of their research in computer-generated imagery (CGI)</h4>\n<p>Every year the film academy in the USA celebrates the outstanding achievements of the year in a ceremony known as the Oscars. An increasingly important component of the ceremony is the presentation of the Scientific and Technical awards. In 2004 a notable event took place: the academic world met the cinematographic world when researchers from Stanford University in the USA were awarded an Oscar. These researchers, led by Steve Marschner, were from the field of Computer Graphics at Stanford. They were part of a growing cohort of computer scientists that has become fundamental to moviemaking.</p>\n<p>Films have shown that it is possible to use CGI to make actors look younger, older, weaker or stronger than they actually are in a surprisingly realistic manner. At least, it is possible if the altered actors are not filmed too closely. This is because the difficulty of recreating the textures of both skin and fabric means that the effect is less convincing when seen close up. The work of Marschner and his colleagues has greatly improved the accurate and realistic modeling of both skin and fabric. They recognized that one of the difficulties of creating lifelike characters in the computer world is that, in CGI, the characters' skin is opaque (two-dimensional) whereas real skin is in fact translucent (three-dimensional), that is to say, it is semi-transparent.</p>\n<p>Marschner and his colleagues received the Oscar for their work in successfully producing a CGI model that simulates translucency; this is when light penetrates skin and then scatters below the skin's surface before re-emerging. This is called subsurface scattering, and the mathematics for the model goes back many decades to the time when it was used in astrophysics. Because human skin is naturally translucent, it was necessary to be able to create this artificially in order to simulate the soft appearance of real skin. Previous CGI models, which assumed that skin was entirely opaque, resulted in characters with a plastic appearance. The scientists' new model of CGI was so important in bringing digital characters to life that, within two years of their original research paper, all the major special-effects studios had incorporated it into their digital rendering systems.</p>\n<p>However, despite their award, the scientists, with admirable tenacity, continued their search for perfection, as they still did not feel that they had yet satisfactorily recreated the subtle ways light is reflected. To do this, they began to look in detail at the way skins and fabrics reflect light differently according to their make-up: the exact arrangement of fibers in fabric and the network of fibers in skin. Marschner and his team tried to do this by using computerized tomography, which is most familiar as a medical technique for examining people's internal organs. Like classical radiology, it uses X-rays, but because the image is constructed inside a computer using exposures taken from many different positions, rather than a single exposure on photographic film, it can capture fine details that are invisible in classical radiography.</p>\n<p>Unfortunately, the scientists understood that at this point in time they could not use computerized tomography on skin, because a very high-intensity X-ray is needed to show the kind of detail they wanted and this would be very dangerous for human skin. They have, however, had some success with fabric. Using this new method of imaging, they are able to accurately record the three-dimensional structure of all the fibers in a number of small pieces of fabric. These same pieces of fabric, through the use of CGI, can then be patched together to form an entire garment inside a computer, in the same way that a small group of actors can be made to look like hundreds of people gathered together. A garment created through CGI is therefore made up of pieces of fabric whose internal structure has been pre-recorded. This means that the way light is reflected by the garment can be calculated far more realistically than if the scientists just made a computer model of what they thought the interior of the fabric looked like. Cinematography will benefit from this because, although it may take some years to be able to use computerized tomographic imaging of skin, for the moment the movement of a virtual cloak or the lifting of a computerized hat should look far more realistic.</p>\n<p>In the meantime, according to Marschner's colleague Kavita Bala, the technology might have an application in online retailing. At the moment, people buying clothes over the internet have only a standard photograph to help them choose their purchases. It is hoped that if online shoppers can view items which have been presented through the use of computerized tomography graphics, they will have a much better understanding of what the material the item is made of is really like.</p>\n<p>Marschner is now working on the way light is scattered from individual hairs. He says, 'I feel lucky to be working in this niche. I'm a visual person and to be able to spend my time scrutinizing the world around me, trying to understand why it looks the way it does, is very rewarding'.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                <h4>Questions 27–32</h4>\n                <p>Choose the correct letter, <strong>A, B, C,</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>27</strong> What is the writer's main point in the first paragraph?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"A\"> A Computer scientists are rarely represented at the Oscars.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"B\"> B Film-industry awards hold little interest for computer scientists.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"C\"> C The USA rewards film actors more than computer scientists.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"D\"> D Computer scientists are becoming a vital part of the film industry.</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>28</strong> When describing the way computer-generated imagery changes actors' appearance, what does the writer suggest?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"A\"> A CGI looks best from a distance.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"B\"> B CGI interferes with actors' facial expressions.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"C\"> C Audiences expect too much of CGI.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"D\"> D The scientists had hoped for more convincing results.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> What does the writer suggest about the scientists' attitude to their work in the fourth paragraph?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"A\"> A They were motivated to get as near to reality as possible.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"B\"> B They were interested in gaining recognition for their work.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"C\"> C They thought it could have medical applications.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"D\"> D They hoped to receive further funding for their research.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> What are we told about computerised tomography?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"A\"> A It has only recently been used by doctors.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"B\"> B It is similar to X-rays in the way it works.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"C\"> C Filmmakers have used it for many years for special lighting effects.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"D\"> D It can be administered using traditional radiography machines.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>31</strong> Which of these advantages does the writer attribute to the current use of computerised tomography?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"A\"> A It is most effective when used to create images of skin.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"B\"> B It can make a few people seem like a crowd.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"C\"> C It allows clothes designers to create new designs.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"D\"> D It is practical because of the time it takes.</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>32</strong> The writer mentions Kavita Bala in order to</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"A\"> A comment on the success of CGI in commercial contexts.</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"B\"> B highlight the link between CGI and photography.</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"C\"> C show that Marschner's team are uncertain about the future of CGI.</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"D\"> D demonstrate a use for CGI outside the film industry.</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p>Choose the correct letter, <strong>A, B, C,</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> What is the writer's main point in the first paragraph?</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A Computer scientists are rarely represented at the Oscars.</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B Film-industry awards hold little interest for computer scientists.</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C The USA rewards film actors more than computer scientists.</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D Computer scientists are becoming a vital part of the film industry.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> When describing the way computer-generated imagery changes actors' appearance, what does the writer suggest?</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A CGI looks best from a distance.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B CGI interferes with actors' facial expressions.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C Audiences expect too much of CGI.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D The scientists had hoped for more convincing results.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> What does the writer suggest about the scientists' attitude to their work in the fourth paragraph?</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A They were motivated to get as near to reality as possible.</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B They were interested in gaining recognition for their work.</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C They thought it could have medical applications.</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D They hoped to receive further funding for their research.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What are we told about computerised tomography?</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A It has only recently been used by doctors.</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B It is similar to X-rays in the way it works.</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C Filmmakers have used it for many years for special lighting effects.</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D It can be administered using traditional radiography machines.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> Which of these advantages does the writer attribute to the current use of computerised tomography?</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"> A It is most effective when used to create images of skin.</label> <label><input name=\"q5\" type=\"radio\" value=\"B\"> B It can make a few people seem like a crowd.</label> <label><input name=\"q5\" type=\"radio\" value=\"C\"> C It allows clothes designers to create new designs.</label> <label><input name=\"q5\" type=\"radio\" value=\"D\"> D It is practical because of the time it takes.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> The writer mentions Kavita Bala in order to</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"A\"> A comment on the success of CGI in commercial contexts.</label> <label><input name=\"q6\" type=\"radio\" value=\"B\"> B highlight the link between CGI and photography.</label> <label><input name=\"q6\" type=\"radio\" value=\"C\"> C show that Marschner's team are uncertain about the future of CGI.</label> <label><input name=\"q6\" type=\"radio\" value=\"D\"> D demonstrate a use for CGI outside the film industry.</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -48,7 +48,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-anchor\">\n                 <h4>Questions 33–36</h4>\n                <p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n                <p>In boxes 33–36 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n\n                <div class=\"question-item\">\n                    <p><strong>33</strong> It used to be unusual for university researchers to receive a cinematography award.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>34</strong> CGI is popular among ageing actors.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>35</strong> The scientists' success in generating images of complete CGI garments has won them many awards.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>36</strong> It will be a long time before computerised tomographic imaging of fabric is used by filmmakers.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-anchor\">\n<h4>Questions 33–36</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<p>In boxes 33–36 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>33</strong> It used to be unusual for university researchers to receive a cinematography award.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> CGI is popular among ageing actors.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> The scientists' success in generating images of complete CGI garments has won them many awards.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> It will be a long time before computerised tomographic imaging of fabric is used by filmmakers.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n                <h4>Questions 37–40</h4>\n                <p>Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n                <p><em>Drag and drop the correct option into each blank.</em></p>\n                <div class=\"summary-box\">\n                    <h5>The work of Marschner and his colleagues</h5>\n                    <p>\n                    For many years, CGI characters did not appear entirely lifelike as their skin appeared plastic. Marschner and his colleagues were the first to apply an understanding of how <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span> interacts with human skin. Their CGI model is based on a novel application of principles of <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span>, which had previously been applied in other scientific research. The importance of CGI to the film industry has led to the <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span> of Marschner's model by special-effects studios. Marschner's model has led to the <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span> of cinematography.\n                    </p>\n                </div>\n                <div class=\"options-pool\" id=\"word-options-pool\">\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"A\"><strong>A</strong> light</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"B\"><strong>B</strong> transparency</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"C\"><strong>C</strong> age</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"D\"><strong>D</strong> use</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"E\"><strong>E</strong> astrophysics</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"F\"><strong>F</strong> mathematics</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"G\"><strong>G</strong> improvement</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"H\"><strong>H</strong> colour</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"I\"><strong>I</strong> translucency</div>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n<p><em>Drag and drop the correct option into each blank.</em></p>\n<div class=\"summary-box\">\n<h5>The work of Marschner and his colleagues</h5>\n<p>\nFor many years, CGI characters did not appear entirely lifelike as their skin appeared plastic. Marschner and his colleagues were the first to apply an understanding of how <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span> interacts with human skin. Their CGI model is based on a novel application of principles of <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span>, which had previously been applied in other scientific research. The importance of CGI to the film industry has led to the <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span> of Marschner's model by special-effects studios. Marschner's model has led to the <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span> of cinematography.\n</p>\n</div>\n<div class=\"options-pool\" id=\"word-options-pool\">\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\"><strong>A</strong> light</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\"><strong>B</strong> transparency</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\"><strong>C</strong> age</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\"><strong>D</strong> use</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\"><strong>E</strong> astrophysics</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\"><strong>F</strong> mathematics</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\"><strong>G</strong> improvement</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"H\"><strong>H</strong> colour</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"I\"><strong>I</strong> translucency</div>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n\n            <h3>Looking at daily life in ancient Rome</h3>\n            <h4>In this preface to a history, the writer explains the factors affecting the scope of his study.</h4>\n\n            <p>If our ideas on Roman life are not to become lost in confusion, we must study it within a strictly defined time. Nothing changes more rapidly than human customs. Looking at our own more familiar world, apart from the great scientific discoveries of recent centuries which have turned it upside down—steam, electricity, railways, motor cars and aeroplanes, for example—it is clear that the elementary forms of everyday life have been subject to increasing change. Potatoes, for example, were not introduced into Europe until the sixteenth century, coffee was first drunk there in the late sixteenth or early seventeenth, and the banana was used in desserts in Europe at the beginning of the twentieth. The law of change was not less operative in antiquity. It was a commonplace of Roman rhetoric to contrast the crude simplicity of the Republic (509BC–27BC) with the luxury and refinement of the imperial times which followed. There is no common measure, whether of home, or house, or furniture, between ages which are so different.</p>\n            <p>Since a choice of time must necessarily be made, this history will confine itself to studying the generation which was born about the middle of the first century AD, toward the end of the reign of Claudius (41–54AD) or the beginning of the reign of Nero (54–68AD), and which lived on into the reign of Trajan (98–117AD) or of Hadrian (117–138AD). This generation saw the Roman Empire at its most powerful and prosperous. It was witness to the last conquests of the Caesars: the conquest of Dacia, in modern-day eastern Europe, which brought vast mineral wealth into the Empire, and the conquest of Arabia, which helped to bring the riches of India and East Asia flooding into Rome. In the material domain, this generation attained the pinnacle of ancient civilisation.</p>\n            <p>By a fortunate coincidence—all the more fortunate in that Latin* literature was soon to run nearly dry—this generation is the one whose records combine to offer us the most complete picture of Roman life that we possess. We have a profusion of vivid and picturesque descriptions, precise and colourful, in such works as the <em>Epigrams</em> of Martial, the <em>Satires</em> of Juvenal and the <em>Letters</em> of Pliny. In addition, the Forum of Trajan in Rome itself and the ruins of Herculaneum and Pompeii, the two prosperous resorts buried by the eruption of Mount Vesuvius in 79AD, supply an immense fund of archaeological evidence. Later excavations have also restored to us the ruins of the city of Ostia, which date in the main from the time when the Emperor Hadrian created this great commercial city as a realisation of his town planning ideas. Fortune has favoured the historian of this time.</p>\n            <p><em>* Latin: the language of ancient Rome.</em></p>\n            <p>It is not enough to focus our study of Roman life only on a fixed time. It would lack foundation and consistency if we did not also focus it in space—in the country or in the town. Even today when the facilities for communication bring something of the city into the smallest and most isolated country cottage, there remains a significant difference between rural existence and the excitement of city life: a much greater gulf separated the peasant from the townsman of antiquity. So large was the inequality between them that, according to the historian Rostovtzeff, it pitted one against the other in a fierce and silent struggle which pierced the wall protecting the Roman privileged classes from the barbarian flood from the north. When the barbarian forces began to invade Roman territory, the peasants decided to fight alongside them.</p>\n            <p>The townsman, in fact, enjoyed all the goods and resources of the earth. The peasant knew nothing but unending labour without profit, and was unable to enjoy the activities available in even the poorest of cities: the liveliness of the sports field, the warmth of the public baths and the magnificence of public spectacles. In a work on the history of everyday life, we must give up any attempt to blend two such dissimilar pictures into one, and must choose between them. The time which we have chosen to describe day by day is that of those Roman subjects who spent their time exclusively in the town, or rather in The City, Rome, which they regarded as the hub and centre of the universe, proud and wealthy ruler of a world which seemed at that time to have been pacified for ever.</p>\n            <p>To perform our task well, we must first try to form an adequate picture of the surroundings in which our subjects lived, and by which their lives were coloured, freeing ourselves from any misconceptions concerning it. We must seek to reconstruct the physical nature of the great city and the social milieu of the various classes of the hierarchy by which it was governed. We must also investigate the moral background of thought and sentiment which can help explain both its strength and its weaknesses. The way in which the Romans of Rome employed their time can only be studied satisfactorily after we have plotted out the main lines of the framework within which they lived and outside of which the routine of their daily life would be more or less unintelligible.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n\n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>Looking at daily life in ancient Rome</h3>\n<h4>In this preface to a history, the writer explains the factors affecting the scope of his study.</h4>\n<p>If our ideas on Roman life are not to become lost in confusion, we must study it within a strictly defined time. Nothing changes more rapidly than human customs. Looking at our own more familiar world, apart from the great scientific discoveries of recent centuries which have turned it upside down—steam, electricity, railways, motor cars and aeroplanes, for example—it is clear that the elementary forms of everyday life have been subject to increasing change. Potatoes, for example, were not introduced into Europe until the sixteenth century, coffee was first drunk there in the late sixteenth or early seventeenth, and the banana was used in desserts in Europe at the beginning of the twentieth. The law of change was not less operative in antiquity. It was a commonplace of Roman rhetoric to contrast the crude simplicity of the Republic (509BC–27BC) with the luxury and refinement of the imperial times which followed. There is no common measure, whether of home, or house, or furniture, between ages which are so different.</p>\n<p>Since a choice of time must necessarily be made, this history will confine itself to studying the generation which was born about the middle of the first century AD, toward the end of the reign of Claudius (41–54AD) or the beginning of the reign of Nero (54–68AD), and which lived on into the reign of Trajan (98–117AD) or of Hadrian (117–138AD). This generation saw the Roman Empire at its most powerful and prosperous. It was witness to the last conquests of the Caesars: the conquest of Dacia, in modern-day eastern Europe, which brought vast mineral wealth into the Empire, and the conquest of Arabia, which helped to bring the riches of India and East Asia flooding into Rome. In the material domain, this generation attained the pinnacle of ancient civilisation.</p>\n<p>By a fortunate coincidence—all the more fortunate in that Latin* literature was soon to run nearly dry—this generation is the one whose records combine to offer us the most complete picture of Roman life that we possess. We have a profusion of vivid and picturesque descriptions, precise and colourful, in such works as the <em>Epigrams</em> of Martial, the <em>Satires</em> of Juvenal and the <em>Letters</em> of Pliny. In addition, the Forum of Trajan in Rome itself and the ruins of Herculaneum and Pompeii, the two prosperous resorts buried by the eruption of Mount Vesuvius in 79AD, supply an immense fund of archaeological evidence. Later excavations have also restored to us the ruins of the city of Ostia, which date in the main from the time when the Emperor Hadrian created this great commercial city as a realisation of his town planning ideas. Fortune has favoured the historian of this time.</p>\n<p><em>* Latin: the language of ancient Rome.</em></p>\n<p>It is not enough to focus our study of Roman life only on a fixed time. It would lack foundation and consistency if we did not also focus it in space—in the country or in the town. Even today when the facilities for communication bring something of the city into the smallest and most isolated country cottage, there remains a significant difference between rural existence and the excitement of city life: a much greater gulf separated the peasant from the townsman of antiquity. So large was the inequality between them that, according to the historian Rostovtzeff, it pitted one against the other in a fierce and silent struggle which pierced the wall protecting the Roman privileged classes from the barbarian flood from the north. When the barbarian forces began to invade Roman territory, the peasants decided to fight alongside them.</p>\n<p>The townsman, in fact, enjoyed all the goods and resources of the earth. The peasant knew nothing but unending labour without profit, and was unable to enjoy the activities available in even the poorest of cities: the liveliness of the sports field, the warmth of the public baths and the magnificence of public spectacles. In a work on the history of everyday life, we must give up any attempt to blend two such dissimilar pictures into one, and must choose between them. The time which we have chosen to describe day by day is that of those Roman subjects who spent their time exclusively in the town, or rather in The City, Rome, which they regarded as the hub and centre of the universe, proud and wealthy ruler of a world which seemed at that time to have been pacified for ever.</p>\n<p>To perform our task well, we must first try to form an adequate picture of the surroundings in which our subjects lived, and by which their lives were coloured, freeing ourselves from any misconceptions concerning it. We must seek to reconstruct the physical nature of the great city and the social milieu of the various classes of the hierarchy by which it was governed. We must also investigate the moral background of thought and sentiment which can help explain both its strength and its weaknesses. The way in which the Romans of Rome employed their time can only be studied satisfactorily after we have plotted out the main lines of the framework within which they lived and outside of which the routine of their daily life would be more or less unintelligible.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -34,7 +34,7 @@
         "q3",
         "q4"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n                <h4>Questions 27–30</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>27</strong> What does the writer say about the period mentioned in the second paragraph?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"A\"><span>A There was a high level of immigration into Rome.</span></label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"B\"><span>B The export of minerals made Rome rich.</span></label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"C\"><span>C Rome sent armies to control trade with India and East Asia.</span></label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"D\"><span>D The Roman standard of living reached its highest level.</span></label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>28</strong> Ostia is mentioned as</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"A\"><span>A a city which often features in literature.</span></label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"B\"><span>B an important area for archaeological research.</span></label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"C\"><span>C the birthplace of a Roman Emperor.</span></label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"D\"><span>D a city whose layout was similar to that of Rome.</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> The statement that 'Fortune has favoured the historian of this time' refers to the fact that</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"A\"><span>A historians of this period have become wealthy as a result of their discoveries.</span></label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"B\"><span>B works on this period are popular among the reading public.</span></label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"C\"><span>C a wide range of sources is available for this period.</span></label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"D\"><span>D this period has been less studied than many others.</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> In comparing urban and rural life in the Roman Empire, the writer states that</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"A\"><span>A rural Romans were largely illiterate.</span></label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"B\"><span>B rural life and urban life had little in common.</span></label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"C\"><span>C little information is available concerning rural life.</span></label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"D\"><span>D most readers of history are more interested in city life.</span></label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> What does the writer say about the period mentioned in the second paragraph?</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"><span>A There was a high level of immigration into Rome.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"B\"><span>B The export of minerals made Rome rich.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"C\"><span>C Rome sent armies to control trade with India and East Asia.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"D\"><span>D The Roman standard of living reached its highest level.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Ostia is mentioned as</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"><span>A a city which often features in literature.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"B\"><span>B an important area for archaeological research.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"C\"><span>C the birthplace of a Roman Emperor.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"D\"><span>D a city whose layout was similar to that of Rome.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> The statement that 'Fortune has favoured the historian of this time' refers to the fact that</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"><span>A historians of this period have become wealthy as a result of their discoveries.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"B\"><span>B works on this period are popular among the reading public.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"C\"><span>C a wide range of sources is available for this period.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"D\"><span>D this period has been less studied than many others.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> In comparing urban and rural life in the Roman Empire, the writer states that</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"><span>A rural Romans were largely illiterate.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"B\"><span>B rural life and urban life had little in common.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"C\"><span>C little information is available concerning rural life.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"D\"><span>D most readers of history are more interested in city life.</span></label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -47,7 +47,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-9-10-anchor\">\n                <h4>Questions 31–36</h4>\n                <p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n                <p>In boxes 31–36 on your answer sheet, write</p>\n                <ul style=\"list-style: none; padding-left: 0;\">\n                    <li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p><strong>31</strong> Rome's conquest of Arabia resulted in large-scale immigration from the east into Rome.</p>\n                    <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>32</strong> More can be learned about Roman life from the literature of the period studied in this book than from later Latin literature.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> Discoveries at Herculaneum and Pompeii showed that certain beliefs about Roman life were wrong.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>34</strong> Roman peasants provided assistance to the Empire when it was attacked.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>35</strong> Rural inhabitants of the Roman Empire had a difficult life.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>36</strong> Entertainment facilities were limited to the city of Rome itself.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-9-10-anchor\">\n<h4>Questions 31–36</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<p>In boxes 31–36 on your answer sheet, write</p>\n<ul style=\"list-style: none; padding-left: 0;\">\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>31</strong> Rome's conquest of Arabia resulted in large-scale immigration from the east into Rome.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> More can be learned about Roman life from the literature of the period studied in this book than from later Latin literature.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Discoveries at Herculaneum and Pompeii showed that certain beliefs about Roman life were wrong.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Roman peasants provided assistance to the Empire when it was attacked.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Rural inhabitants of the Roman Empire had a difficult life.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> Entertainment facilities were limited to the city of Rome itself.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -58,7 +58,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n                <h4>Questions 37–40</h4>\n                <p>Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n                <div class=\"summary-box\">\n                    <h5 style=\"text-align: center;\">The scope of the writer's study</h5>\n                    <div class=\"summary-text\">\n                        <p>It was important for the writer to limit several aspects of his <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span>. He decided to focus on a limited <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> in Roman history, and to concentrate on the section of the population who were <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span>. The writer was interested in the physical environment, the people that ruled the country and the <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span> that contributed both to Rome's strength and to its weaknesses.</p>\n                    </div>\n                </div>\n                <div id=\"word-options\">\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A emperors</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B setting</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C values</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D peasants</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E city-dwellers</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F social classes</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G myths</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H period</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I investigation</div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n<div class=\"summary-box\">\n<h5 style=\"text-align: center;\">The scope of the writer's study</h5>\n<div class=\"summary-text\">\n<p>It was important for the writer to limit several aspects of his <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span>. He decided to focus on a limited <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> in Roman history, and to concentrate on the section of the population who were <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span>. The writer was interested in the physical environment, the people that ruled the country and the <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span> that contributed both to Rome's strength and to its weaknesses.</p>\n</div>\n</div>\n<div id=\"word-options\">\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A emperors</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B setting</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C values</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D peasants</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E city-dwellers</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F social classes</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G myths</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H period</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I investigation</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
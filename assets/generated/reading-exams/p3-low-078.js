@@ -11,7 +11,7 @@
       {
         "blockId": "passage-main",
         "kind": "text",
-        "bodyHtml": "<h2>READING PASSAGE 3</h2>\n    <p>You should spend about 20 minutes on Questions 1-26, which are based on Reading Passage 3 below.</p>\n    \n    <h3>Music: Language We All Speak</h3>\n    \n    <p><strong>A</strong> Music is one of the human species' relatively few universal abilities. Without formal training, any individual, from Stone Age tribesman to suburban teenager, has the ability to recognise music and, in some fashion, to make it. Why this should be so is a mystery. After all, music isn't necessary for getting through the day, and if it aids in reproduction, it does so only in highly indirect ways. Language, by contrast, is also everywhere — but for reasons that are more obvious. With language, you and the members of your tribe can organise a migration across Africa, build reed boats and cross the seas, and communicate at night even when you can't see each other. Modern culture, in all its technological extravagance, springs directly from the human talent for manipulating symbols and syntax.</p>\n\n    <p>Scientists have always been intrigued by the connection between music and language. Yet over the years, words and melody have acquired a vastly different status in the lab and the seminar room. While language has long been considered essential to unlocking the mechanisms of human intelligence, music is generally treated as an evolutionary frippery — mere \"auditory cheesecake\", as the Harvard cognitive scientist Steven Pinker puts it.</p>\n\n    <p><strong>B</strong> But thanks to a decade-long wave of neuroscience research, that tune is changing. A flurry of recent publications suggests that language and music may equally be able to tell us who we are and where we're from — not just emotionally, but biologically. In July, the journal Nature Neuroscience devoted a special issue to the topic. And in an article in the 6 August issue of the Journal of Neuroscience, David Schwartz, Catherine Howe and Dale Purves of Duke University argued that the sounds of music and the sounds of language are intricately connected.</p>\n\n    <p>To grasp the originality of this idea, it's necessary to realise two things about how music has traditionally been understood. First, musicologists have long emphasised that while each culture stamps a special identity onto its music, music itself has some universal qualities. For example, in virtually all cultures, sound is divided into some or all of the 12 intervals that make up the chromatic scale — that is, the scale represented by the keys on a piano. For centuries, observers have attributed this preference for certain combinations of tones to the mathematical properties of sound itself.</p>\n\n    <p>Some 2,500 years ago, Pythagoras was the first to note a direct relationship between the harmoniousness of a tone combination and the physical dimensions of the object that produced it. For example, a plucked string will always play an octave lower than a similar string half its size, and a fifth lower than a similar string two-thirds its length. This link between simple ratios and harmony has influenced music theory ever since.</p>\n\n    <p><strong>C</strong> This music-is-math idea is often accompanied by the notion that music, formally speaking at least, exists apart from the world in which it was created. Writing recently in The New York Review of Books, pianist and critic Charles Rosen discussed the long-standing notion that while painting and sculpture reproduce at least some aspects of the natural world, and writing describes thoughts and feelings we are all familiar with, music is entirely abstracted from the world in which we live. Neither idea is right, according to David Schwartz and his colleagues. Human musical preferences are fundamentally shaped not by elegant algorithms or ratios but by the messy sounds of real life, and of speech in particular – which in turn is shaped by our evolutionary heritage. \"The explanation of music, like the explanation of any product of the mind, must be rooted in biology, not in numbers per se,\" says Schwartz.</p>\n\n    <p>Schwartz, Howe and Purves analysed a vast selection of speech sounds from a variety of languages to reveal the underlying patterns common to all utterances. In order to focus only on the raw sounds, they discarded all theories about speech and meaning, and sliced sentences into random bites. Using a database of over 100,000 brief segments of speech, they noted which frequency had the greatest emphasis in each sound. The resulting set of frequencies, they discovered, corresponded closely to the chromatic scale. In short, the building blocks of music are to be found in speech.</p>\n\n    <p>Far from being abstract, music presents a strange analogue to the patterns created by the sounds of speech. \"Music, like visual arts, is rooted in our experience of the natural world,\" says Schwartz. \"It emulates our sound environment in the way that visual arts emulate the visual environment.\" In music we hear the echo of our basic sound-making instrument — the vocal tract. The explanation for human music is simpler still than Pythagoras's mathematical equations: we like the sounds that are familiar to us — specifically, we like the sounds that remind us of us.</p>\n\n    <p>This brings up some chicken-or-egg evolutionary questions. It may be that music imitates speech directly, the researchers say, in which case it would seem that language evolved first. It's also conceivable that music came first and language is in effect an imitation of song — that in everyday speech we hit the musical notes we especially like. Alternatively, it may be that music imitates the general products of the human sound-making system, which just happens to be mostly speech. \"We can't know this,\" says Schwartz. \"What we do know is that they both come from the same system, and it is this that shapes our preferences.\"</p>\n\n    <p><strong>D</strong> Schwartz's study also casts light on the long-running question of whether animals understand or appreciate music. Despite the apparent abundance of \"music\" in the natural world — birdsong, whale song, wolf howls, synchronised chimpanzee hooting — previous studies have found that many laboratory animals don't show a great affinity for the human variety of music making.</p>\n\n    <p>Marc Hauser and Josh McDermott of Harvard argued in the July issue of Nature Neuroscience that animals don't create or perceive music the way we do. The fact that laboratory monkeys can show recognition of human tunes is evidence, they say, of shared general features of the auditory system, not any specific chimpanzee musical ability. As for birds, those most musical beasts, they generally recognise their own tunes — a narrow repertoire — but don't generate novel melodies like we do. There are no avian Mozarts.</p>\n\n    <p>But what's been played to animals, Schwartz notes, is human music. If animals evolve preferences for sound as we do — based upon the soundscape in which they live — then their \"music\" would be fundamentally different from ours. In the same way our scales derive from human utterances, a cat's idea of a good tune would derive from yowls and meows. To demonstrate that animals don't appreciate sound the way we do, we'd need evidence that they don't respond to \"music\" constructed from their own sound environment.</p>\n\n    <p><strong>E</strong> No matter how the connection between language and music is parsed, what is apparent is that our sense of music, even our love for it, is as deeply rooted in our biology and in our brains as language is. This is most obvious with babies, says Sandra Trehub at the University of Toronto, who also published a paper in the Nature Neuroscience special issue.</p>\n\n    <p>For babies, music and speech are on a continuum. Mothers use musical speech to \"regulate infants' emotional states\", Trehub says. Regardless of what language they speak, the voice all mothers use with babies is the same: \"something between speech and song\". This kind of communication \"puts the baby in a trance-like state, which may proceed to sleep or extended periods of rapture\". So if the babies of the world could understand the latest research on language and music, they probably wouldn't be very surprised. The upshot, says Trehub, is that music may be even more of a necessity than we realise.</p>\n    \n    <p>&nbsp;</p> <!-- Final padding -->\n  </section>\n\n  <!-- Draggable Divider -->\n  <div id=\"divider\" title=\"Drag to resize\"></div>\n\n  <!-- Right Pane: Questions and Controls -->"
+        "bodyHtml": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 1-26, which are based on Reading Passage 3 below.</p>\n<h3>Music: Language We All Speak</h3>\n<p><strong>A</strong> Music is one of the human species' relatively few universal abilities. Without formal training, any individual, from Stone Age tribesman to suburban teenager, has the ability to recognise music and, in some fashion, to make it. Why this should be so is a mystery. After all, music isn't necessary for getting through the day, and if it aids in reproduction, it does so only in highly indirect ways. Language, by contrast, is also everywhere — but for reasons that are more obvious. With language, you and the members of your tribe can organise a migration across Africa, build reed boats and cross the seas, and communicate at night even when you can't see each other. Modern culture, in all its technological extravagance, springs directly from the human talent for manipulating symbols and syntax.</p>\n<p>Scientists have always been intrigued by the connection between music and language. Yet over the years, words and melody have acquired a vastly different status in the lab and the seminar room. While language has long been considered essential to unlocking the mechanisms of human intelligence, music is generally treated as an evolutionary frippery — mere \"auditory cheesecake\", as the Harvard cognitive scientist Steven Pinker puts it.</p>\n<p><strong>B</strong> But thanks to a decade-long wave of neuroscience research, that tune is changing. A flurry of recent publications suggests that language and music may equally be able to tell us who we are and where we're from — not just emotionally, but biologically. In July, the journal Nature Neuroscience devoted a special issue to the topic. And in an article in the 6 August issue of the Journal of Neuroscience, David Schwartz, Catherine Howe and Dale Purves of Duke University argued that the sounds of music and the sounds of language are intricately connected.</p>\n<p>To grasp the originality of this idea, it's necessary to realise two things about how music has traditionally been understood. First, musicologists have long emphasised that while each culture stamps a special identity onto its music, music itself has some universal qualities. For example, in virtually all cultures, sound is divided into some or all of the 12 intervals that make up the chromatic scale — that is, the scale represented by the keys on a piano. For centuries, observers have attributed this preference for certain combinations of tones to the mathematical properties of sound itself.</p>\n<p>Some 2,500 years ago, Pythagoras was the first to note a direct relationship between the harmoniousness of a tone combination and the physical dimensions of the object that produced it. For example, a plucked string will always play an octave lower than a similar string half its size, and a fifth lower than a similar string two-thirds its length. This link between simple ratios and harmony has influenced music theory ever since.</p>\n<p><strong>C</strong> This music-is-math idea is often accompanied by the notion that music, formally speaking at least, exists apart from the world in which it was created. Writing recently in The New York Review of Books, pianist and critic Charles Rosen discussed the long-standing notion that while painting and sculpture reproduce at least some aspects of the natural world, and writing describes thoughts and feelings we are all familiar with, music is entirely abstracted from the world in which we live. Neither idea is right, according to David Schwartz and his colleagues. Human musical preferences are fundamentally shaped not by elegant algorithms or ratios but by the messy sounds of real life, and of speech in particular – which in turn is shaped by our evolutionary heritage. \"The explanation of music, like the explanation of any product of the mind, must be rooted in biology, not in numbers per se,\" says Schwartz.</p>\n<p>Schwartz, Howe and Purves analysed a vast selection of speech sounds from a variety of languages to reveal the underlying patterns common to all utterances. In order to focus only on the raw sounds, they discarded all theories about speech and meaning, and sliced sentences into random bites. Using a database of over 100,000 brief segments of speech, they noted which frequency had the greatest emphasis in each sound. The resulting set of frequencies, they discovered, corresponded closely to the chromatic scale. In short, the building blocks of music are to be found in speech.</p>\n<p>Far from being abstract, music presents a strange analogue to the patterns created by the sounds of speech. \"Music, like visual arts, is rooted in our experience of the natural world,\" says Schwartz. \"It emulates our sound environment in the way that visual arts emulate the visual environment.\" In music we hear the echo of our basic sound-making instrument — the vocal tract. The explanation for human music is simpler still than Pythagoras's mathematical equations: we like the sounds that are familiar to us — specifically, we like the sounds that remind us of us.</p>\n<p>This brings up some chicken-or-egg evolutionary questions. It may be that music imitates speech directly, the researchers say, in which case it would seem that language evolved first. It's also conceivable that music came first and language is in effect an imitation of song — that in everyday speech we hit the musical notes we especially like. Alternatively, it may be that music imitates the general products of the human sound-making system, which just happens to be mostly speech. \"We can't know this,\" says Schwartz. \"What we do know is that they both come from the same system, and it is this that shapes our preferences.\"</p>\n<p><strong>D</strong> Schwartz's study also casts light on the long-running question of whether animals understand or appreciate music. Despite the apparent abundance of \"music\" in the natural world — birdsong, whale song, wolf howls, synchronised chimpanzee hooting — previous studies have found that many laboratory animals don't show a great affinity for the human variety of music making.</p>\n<p>Marc Hauser and Josh McDermott of Harvard argued in the July issue of Nature Neuroscience that animals don't create or perceive music the way we do. The fact that laboratory monkeys can show recognition of human tunes is evidence, they say, of shared general features of the auditory system, not any specific chimpanzee musical ability. As for birds, those most musical beasts, they generally recognise their own tunes — a narrow repertoire — but don't generate novel melodies like we do. There are no avian Mozarts.</p>\n<p>But what's been played to animals, Schwartz notes, is human music. If animals evolve preferences for sound as we do — based upon the soundscape in which they live — then their \"music\" would be fundamentally different from ours. In the same way our scales derive from human utterances, a cat's idea of a good tune would derive from yowls and meows. To demonstrate that animals don't appreciate sound the way we do, we'd need evidence that they don't respond to \"music\" constructed from their own sound environment.</p>\n<p><strong>E</strong> No matter how the connection between language and music is parsed, what is apparent is that our sense of music, even our love for it, is as deeply rooted in our biology and in our brains as language is. This is most obvious with babies, says Sandra Trehub at the University of Toronto, who also published a paper in the Nature Neuroscience special issue.</p>\n<p>For babies, music and speech are on a continuum. Mothers use musical speech to \"regulate infants' emotional states\", Trehub says. Regardless of what language they speak, the voice all mothers use with babies is the same: \"something between speech and song\". This kind of communication \"puts the baby in a trance-like state, which may proceed to sleep or extended periods of rapture\". So if the babies of the world could understand the latest research on language and music, they probably wouldn't be very surprised. The upshot, says Trehub, is that music may be even more of a necessity than we realise.</p>\n<p>&nbsp;</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"
       }
     ]
   },
@@ -28,7 +28,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 1–7</h4>\n      <p>Match the following people with their corresponding opinions. Choose the correct option from <strong>A-G</strong> and fill in the brackets.</p>\n      \n      <div class=\"matching-grid\">\n        <div class=\"matching-item\">\n          <span class=\"matching-num\">1.</span>\n          <span>Steven Pinker</span>\n          <select name=\"q1\" id=\"q1\">\n            <option value=\"\">Select...</option>\n            <option value=\"A\">A</option>\n            <option value=\"B\">B</option>\n            <option value=\"C\">C</option>\n            <option value=\"D\">D</option>\n            <option value=\"E\">E</option>\n            <option value=\"F\">F</option>\n            <option value=\"G\">G</option>\n          </select>\n        </div>\n        <div class=\"matching-item\">\n          <span class=\"matching-num\">2.</span>\n          <span>David Schwartz</span>\n          <select name=\"q2\" id=\"q2\">\n            <option value=\"\">Select...</option>\n            <option value=\"A\">A</option>\n            <option value=\"B\">B</option>\n            <option value=\"C\">C</option>\n            <option value=\"D\">D</option>\n            <option value=\"E\">E</option>\n            <option value=\"F\">F</option>\n            <option value=\"G\">G</option>\n          </select>\n        </div>\n        <div class=\"matching-item\">\n          <span class=\"matching-num\">3.</span>\n          <span>Catherine Howe & Dale Purves</span>\n          <select name=\"q3\" id=\"q3\">\n            <option value=\"\">Select...</option>\n            <option value=\"A\">A</option>\n            <option value=\"B\">B</option>\n            <option value=\"C\">C</option>\n            <option value=\"D\">D</option>\n            <option value=\"E\">E</option>\n            <option value=\"F\">F</option>\n            <option value=\"G\">G</option>\n          </select>\n        </div>\n        <div class=\"matching-item\">\n          <span class=\"matching-num\">4.</span>\n          <span>Charles Rosen</span>\n          <select name=\"q4\" id=\"q4\">\n            <option value=\"\">Select...</option>\n            <option value=\"A\">A</option>\n            <option value=\"B\">B</option>\n            <option value=\"C\">C</option>\n            <option value=\"D\">D</option>\n            <option value=\"E\">E</option>\n            <option value=\"F\">F</option>\n            <option value=\"G\">G</option>\n          </select>\n        </div>\n        <div class=\"matching-item\">\n          <span class=\"matching-num\">5.</span>\n          <span>Pythagoras</span>\n          <select name=\"q5\" id=\"q5\">\n            <option value=\"\">Select...</option>\n            <option value=\"A\">A</option>\n            <option value=\"B\">B</option>\n            <option value=\"C\">C</option>\n            <option value=\"D\">D</option>\n            <option value=\"E\">E</option>\n            <option value=\"F\">F</option>\n            <option value=\"G\">G</option>\n          </select>\n        </div>\n        <div class=\"matching-item\">\n          <span class=\"matching-num\">6.</span>\n          <span>Marc Hauser & Josh McDermott</span>\n          <select name=\"q6\" id=\"q6\">\n            <option value=\"\">Select...</option>\n            <option value=\"A\">A</option>\n            <option value=\"B\">B</option>\n            <option value=\"C\">C</option>\n            <option value=\"D\">D</option>\n            <option value=\"E\">E</option>\n            <option value=\"F\">F</option>\n            <option value=\"G\">G</option>\n          </select>\n        </div>\n        <div class=\"matching-item\">\n          <span class=\"matching-num\">7.</span>\n          <span>Sandra Trehub</span>\n          <select name=\"q7\" id=\"q7\">\n            <option value=\"\">Select...</option>\n            <option value=\"A\">A</option>\n            <option value=\"B\">B</option>\n            <option value=\"C\">C</option>\n            <option value=\"D\">D</option>\n            <option value=\"E\">E</option>\n            <option value=\"F\">F</option>\n            <option value=\"G\">G</option>\n          </select>\n        </div>\n      </div>\n      \n      <p style=\"margin-top: 15px; font-weight: bold;\">Opinion Options:</p>\n      <ol type=\"A\" style=\"margin-top: 5px; padding-left: 20px; font-size: 0.9em;\">\n        <li>Music is a non-essential element in evolution, described as \"auditory cheesecake.\"</li>\n        <li>Musical preferences are rooted in biology and speech, not pure mathematical ratios.</li>\n        <li>Musical sounds are closely linked to linguistic sounds, supported by speech frequency research.</li>\n        <li>Music is completely divorced from nature and the world of daily life.</li>\n        <li>Harmony in music is related to the mathematical ratios of sounding objects.</li>\n        <li>Animals do not create or perceive music in the way humans do; there is no \"Mozart among birds.\"</li>\n        <li>For infants, music and language lie on a continuum, and musicalized speech can regulate infants' emotions.</li>\n      </ol>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 1–7</h4>\n<p>Match the following people with their corresponding opinions. Choose the correct option from <strong>A-G</strong> and fill in the brackets.</p>\n<div class=\"matching-grid\">\n<div class=\"matching-item\">\n<span class=\"matching-num\">1.</span> <span>Steven Pinker</span>\n<select name=\"q1\" id=\"q1\">\n<option value=\"\">Select...</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n</select>\n</div>\n<div class=\"matching-item\">\n<span class=\"matching-num\">2.</span> <span>David Schwartz</span>\n<select name=\"q2\" id=\"q2\">\n<option value=\"\">Select...</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n</select>\n</div>\n<div class=\"matching-item\">\n<span class=\"matching-num\">3.</span> <span>Catherine Howe & Dale Purves</span>\n<select name=\"q3\" id=\"q3\">\n<option value=\"\">Select...</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n</select>\n</div>\n<div class=\"matching-item\">\n<span class=\"matching-num\">4.</span> <span>Charles Rosen</span>\n<select name=\"q4\" id=\"q4\">\n<option value=\"\">Select...</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n</select>\n</div>\n<div class=\"matching-item\">\n<span class=\"matching-num\">5.</span> <span>Pythagoras</span>\n<select name=\"q5\" id=\"q5\">\n<option value=\"\">Select...</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n</select>\n</div>\n<div class=\"matching-item\">\n<span class=\"matching-num\">6.</span> <span>Marc Hauser & Josh McDermott</span>\n<select name=\"q6\" id=\"q6\">\n<option value=\"\">Select...</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n</select>\n</div>\n<div class=\"matching-item\">\n<span class=\"matching-num\">7.</span> <span>Sandra Trehub</span>\n<select name=\"q7\" id=\"q7\">\n<option value=\"\">Select...</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n</select>\n</div>\n</div>\n<p style=\"margin-top: 15px; font-weight: bold;\">Opinion Options:</p>\n<ol type=\"A\" style=\"margin-top: 5px; padding-left: 20px; font-size: 0.9em;\">\n<li>Music is a non-essential element in evolution, described as \"auditory cheesecake.\"</li>\n<li>Musical preferences are rooted in biology and speech, not pure mathematical ratios.</li>\n<li>Musical sounds are closely linked to linguistic sounds, supported by speech frequency research.</li>\n<li>Music is completely divorced from nature and the world of daily life.</li>\n<li>Harmony in music is related to the mathematical ratios of sounding objects.</li>\n<li>Animals do not create or perceive music in the way humans do; there is no \"Mozart among birds.\"</li>\n<li>For infants, music and language lie on a continuum, and musicalized speech can regulate infants' emotions.</li>\n</ol>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -42,7 +42,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 8–14</h4>\n      <p>Based on the passage, determine whether the following statements are correct. Write <strong>True (T)</strong> for correct, <strong>False (F)</strong> for incorrect, and <strong>Not Given (NG)</strong> if the information is not mentioned in the passage.</p>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q8-anchor\"></a><b>8</b> Language is universally essential for human survival and practical activities, while music is not.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q8\" value=\"true\"> T</label>\n            <label><input type=\"radio\" name=\"q8\" value=\"false\"> F</label>\n            <label><input type=\"radio\" name=\"q8\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q9-anchor\"></a><b>9</b> The chromatic scale is a universal feature in the music of all cultures.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q9\" value=\"true\"> T</label>\n            <label><input type=\"radio\" name=\"q9\" value=\"false\"> F</label>\n            <label><input type=\"radio\" name=\"q9\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q10-anchor\"></a><b>10</b> Schwartz's team analyzed over 100,000 speech segments and found that their frequency distribution matches the chromatic scale.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q10\" value=\"true\"> T</label>\n            <label><input type=\"radio\" name=\"q10\" value=\"false\"> F</label>\n            <label><input type=\"radio\" name=\"q10\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q11-anchor\"></a><b>11</b> Birds can create novel and original melodies similar to those of human composers.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q11\" value=\"true\"> T</label>\n            <label><input type=\"radio\" name=\"q11\" value=\"false\"> F</label>\n            <label><input type=\"radio\" name=\"q11\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q12-anchor\"></a><b>12</b> Regardless of the language used, the musicalized speech mothers use with infants is the same.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q12\" value=\"true\"> T</label>\n            <label><input type=\"radio\" name=\"q12\" value=\"false\"> F</label>\n            <label><input type=\"radio\" name=\"q12\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q13-anchor\"></a><b>13</b> Pythagoras' theory about the relationship between music and mathematics has never been challenged.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q13\" value=\"true\"> T</label>\n            <label><input type=\"radio\" name=\"q13\" value=\"false\"> F</label>\n            <label><input type=\"radio\" name=\"q13\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n\n      <div class=\"question-row\">\n        <div class=\"question-text\"><a id=\"q14-anchor\"></a><b>14</b> Animals will definitely respond to music composed based on their own soundscapes.</div>\n        <div class=\"radio-group\">\n            <label><input type=\"radio\" name=\"q14\" value=\"true\"> T</label>\n            <label><input type=\"radio\" name=\"q14\" value=\"false\"> F</label>\n            <label><input type=\"radio\" name=\"q14\" value=\"not given\"> NG</label>\n        </div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 8–14</h4>\n<p>Based on the passage, determine whether the following statements are correct. Write <strong>True (T)</strong> for correct, <strong>False (F)</strong> for incorrect, and <strong>Not Given (NG)</strong> if the information is not mentioned in the passage.</p>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q8-anchor\"></a><b>8</b> Language is universally essential for human survival and practical activities, while music is not.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q8\" value=\"true\"> T</label> <label><input type=\"radio\" name=\"q8\" value=\"false\"> F</label> <label><input type=\"radio\" name=\"q8\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q9-anchor\"></a><b>9</b> The chromatic scale is a universal feature in the music of all cultures.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q9\" value=\"true\"> T</label> <label><input type=\"radio\" name=\"q9\" value=\"false\"> F</label> <label><input type=\"radio\" name=\"q9\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q10-anchor\"></a><b>10</b> Schwartz's team analyzed over 100,000 speech segments and found that their frequency distribution matches the chromatic scale.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q10\" value=\"true\"> T</label> <label><input type=\"radio\" name=\"q10\" value=\"false\"> F</label> <label><input type=\"radio\" name=\"q10\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q11-anchor\"></a><b>11</b> Birds can create novel and original melodies similar to those of human composers.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q11\" value=\"true\"> T</label> <label><input type=\"radio\" name=\"q11\" value=\"false\"> F</label> <label><input type=\"radio\" name=\"q11\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q12-anchor\"></a><b>12</b> Regardless of the language used, the musicalized speech mothers use with infants is the same.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q12\" value=\"true\"> T</label> <label><input type=\"radio\" name=\"q12\" value=\"false\"> F</label> <label><input type=\"radio\" name=\"q12\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q13-anchor\"></a><b>13</b> Pythagoras' theory about the relationship between music and mathematics has never been challenged.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q13\" value=\"true\"> T</label> <label><input type=\"radio\" name=\"q13\" value=\"false\"> F</label> <label><input type=\"radio\" name=\"q13\" value=\"not given\"> NG</label>\n</div>\n</div>\n<div class=\"question-row\">\n<div class=\"question-text\"><a id=\"q14-anchor\"></a><b>14</b> Animals will definitely respond to music composed based on their own soundscapes.</div>\n<div class=\"radio-group\">\n<label><input type=\"radio\" name=\"q14\" value=\"true\"> T</label> <label><input type=\"radio\" name=\"q14\" value=\"false\"> F</label> <label><input type=\"radio\" name=\"q14\" value=\"not given\"> NG</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -53,7 +53,7 @@
         "q17",
         "q18"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 15–18</h4>\n      <p>Choose the option (<strong>A, B, C, or D</strong>) that best matches the content of the passage.</p>\n      \n      <div style=\"margin-bottom:16px;\">\n        <p><a id=\"q15-anchor\"></a><strong>15</strong> What does \"the tune is changing\" (in Paragraph B) refer to?</p>\n        <div class=\"mcq-group\">\n          <label><input type=\"radio\" name=\"q15\" value=\"a\"> A. The way music is created has undergone significant evolution.</label>\n          <label><input type=\"radio\" name=\"q15\" value=\"b\"> B. Neuroscience research has changed the traditional view of music.</label>\n          <label><input type=\"radio\" name=\"q15\" value=\"c\"> C. The relationship between music and mathematics has been confirmed.</label>\n          <label><input type=\"radio\" name=\"q15\" value=\"d\"> D. Different cultures have developed unique musical styles.</label>\n        </div>\n      </div>\n\n      <div style=\"margin-bottom:16px;\">\n        <p><a id=\"q16-anchor\"></a><strong>16</strong> According to Schwartz, why do humans prefer certain musical sounds?</p>\n        <div class=\"mcq-group\">\n          <label><input type=\"radio\" name=\"q16\" value=\"a\"> A. They correspond to simple mathematical ratios.</label>\n          <label><input type=\"radio\" name=\"q16\" value=\"b\"> B. They are abstract and unrelated to real life.</label>\n          <label><input type=\"radio\" name=\"q16\" value=\"c\"> C. They remind people of familiar speech sounds.</label>\n          <label><input type=\"radio\" name=\"q16\" value=\"d\"> D. They are inherited from the musical traditions of ancient humans.</label>\n        </div>\n      </div>\n\n      <div style=\"margin-bottom:16px;\">\n        <p><a id=\"q17-anchor\"></a><strong>17</strong> What is the core view of Sandra Trehub's research?</p>\n        <div class=\"mcq-group\">\n          <label><input type=\"radio\" name=\"q17\" value=\"a\"> A. Infants have better musical perception abilities than adults.</label>\n          <label><input type=\"radio\" name=\"q17\" value=\"b\"> B. Musicalized speech helps mothers communicate emotionally with infants.</label>\n          <label><input type=\"radio\" name=\"q17\" value=\"c\"> C. Infants can clearly distinguish between music and language.</label>\n          <label><input type=\"radio\" name=\"q17\" value=\"d\"> D. What mothers say to infants is more like songs than speech.</label>\n        </div>\n      </div>\n\n      <div style=\"margin-bottom:16px;\">\n        <p><a id=\"q18-anchor\"></a><strong>18</strong> How does Schwartz suggest testing whether animals appreciate music?</p>\n        <div class=\"mcq-group\">\n          <label><input type=\"radio\" name=\"q18\" value=\"a\"> A. Playing human music to different animal species.</label>\n          <label><input type=\"radio\" name=\"q18\" value=\"b\"> B. Observing animals' responses to music composed based on their own soundscapes.</label>\n          <label><input type=\"radio\" name=\"q18\" value=\"c\"> C. Comparing the auditory systems of humans and animals.</label>\n          <label><input type=\"radio\" name=\"q18\" value=\"d\"> D. Analyzing the mathematical patterns in animal sounds.</label>\n        </div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 15–18</h4>\n<p>Choose the option (<strong>A, B, C, or D</strong>) that best matches the content of the passage.</p>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q15-anchor\"></a><strong>15</strong> What does \"the tune is changing\" (in Paragraph B) refer to?</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q15\" value=\"a\"> A. The way music is created has undergone significant evolution.</label> <label><input type=\"radio\" name=\"q15\" value=\"b\"> B. Neuroscience research has changed the traditional view of music.</label> <label><input type=\"radio\" name=\"q15\" value=\"c\"> C. The relationship between music and mathematics has been confirmed.</label> <label><input type=\"radio\" name=\"q15\" value=\"d\"> D. Different cultures have developed unique musical styles.</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q16-anchor\"></a><strong>16</strong> According to Schwartz, why do humans prefer certain musical sounds?</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q16\" value=\"a\"> A. They correspond to simple mathematical ratios.</label> <label><input type=\"radio\" name=\"q16\" value=\"b\"> B. They are abstract and unrelated to real life.</label> <label><input type=\"radio\" name=\"q16\" value=\"c\"> C. They remind people of familiar speech sounds.</label> <label><input type=\"radio\" name=\"q16\" value=\"d\"> D. They are inherited from the musical traditions of ancient humans.</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q17-anchor\"></a><strong>17</strong> What is the core view of Sandra Trehub's research?</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q17\" value=\"a\"> A. Infants have better musical perception abilities than adults.</label> <label><input type=\"radio\" name=\"q17\" value=\"b\"> B. Musicalized speech helps mothers communicate emotionally with infants.</label> <label><input type=\"radio\" name=\"q17\" value=\"c\"> C. Infants can clearly distinguish between music and language.</label> <label><input type=\"radio\" name=\"q17\" value=\"d\"> D. What mothers say to infants is more like songs than speech.</label>\n</div>\n</div>\n<div style=\"margin-bottom:16px;\">\n<p><a id=\"q18-anchor\"></a><strong>18</strong> How does Schwartz suggest testing whether animals appreciate music?</p>\n<div class=\"mcq-group\">\n<label><input type=\"radio\" name=\"q18\" value=\"a\"> A. Playing human music to different animal species.</label> <label><input type=\"radio\" name=\"q18\" value=\"b\"> B. Observing animals' responses to music composed based on their own soundscapes.</label> <label><input type=\"radio\" name=\"q18\" value=\"c\"> C. Comparing the auditory systems of humans and animals.</label> <label><input type=\"radio\" name=\"q18\" value=\"d\"> D. Analyzing the mathematical patterns in animal sounds.</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-4",
@@ -68,7 +68,7 @@
         "q25",
         "q26"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 19–26</h4>\n      <p>Complete the summary with words from the passage. Each blank can be filled with a maximum of <strong>3 words</strong>.</p>\n      \n      <div style=\"margin-top: 15px; line-height: 1.6;\">\n        <p>Both music and language are universally possessed human abilities, but they have held different positions in research for a long time. Language is regarded as the key to human intelligence, while music was once considered a <input type=\"text\" name=\"q19\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q19-anchor\"></a>. However, recent neuroscience research shows that the two <input type=\"text\" name=\"q20\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q20-anchor\"></a>.</p>\n        \n        <p>The traditional view holds that musical harmony originates from <input type=\"text\" name=\"q21\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q21-anchor\"></a>, or that music is completely <input type=\"text\" name=\"q22\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q22-anchor\"></a>. But Schwartz's team believes that the basic elements of music exist in <input type=\"text\" name=\"q23\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q23-anchor\"></a>, because their analysis of speech frequencies matches the <input type=\"text\" name=\"q24\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q24-anchor\"></a>.</p>\n        \n        <p>For infants, music and language lie on a <input type=\"text\" name=\"q25\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q25-anchor\"></a>, and mothers use musicalized speech to regulate infants' <input type=\"text\" name=\"q26\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q26-anchor\"></a>. This suggests that music may be more necessary than previously thought.</p>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 19–26</h4>\n<p>Complete the summary with words from the passage. Each blank can be filled with a maximum of <strong>3 words</strong>.</p>\n<div style=\"margin-top: 15px; line-height: 1.6;\">\n<p>Both music and language are universally possessed human abilities, but they have held different positions in research for a long time. Language is regarded as the key to human intelligence, while music was once considered a <input type=\"text\" name=\"q19\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q19-anchor\"></a>. However, recent neuroscience research shows that the two <input type=\"text\" name=\"q20\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q20-anchor\"></a>.</p>\n<p>The traditional view holds that musical harmony originates from <input type=\"text\" name=\"q21\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q21-anchor\"></a>, or that music is completely <input type=\"text\" name=\"q22\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q22-anchor\"></a>. But Schwartz's team believes that the basic elements of music exist in <input type=\"text\" name=\"q23\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q23-anchor\"></a>, because their analysis of speech frequencies matches the <input type=\"text\" name=\"q24\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q24-anchor\"></a>.</p>\n<p>For infants, music and language lie on a <input type=\"text\" name=\"q25\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q25-anchor\"></a>, and mothers use musicalized speech to regulate infants' <input type=\"text\" name=\"q26\" class=\"blank\" placeholder=\"1-3 words\"> <a id=\"q26-anchor\"></a>. This suggests that music may be more necessary than previously thought.</p>\n</div>\n</div>"
     }
   ],
   "answerKey": {
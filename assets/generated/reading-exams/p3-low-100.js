@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            \n            <p><strong>A</strong> Whether made of highly polished metal or of glass with a coating of metal on the back, mirrors have fascinated people for thousands of years. Ancient Egyptians were often depicted holding hand mirrors. For centuries, the people of Rajasthan in India have sewn bits of reflective glass into their clothing, and the resulting sparkle emphasizes the magic and mystery of that desert land.</p>\n            <p><strong>B</strong> To scientists, the simultaneous simplicity and complexity of mirrors make them effective and accessible tools for exploring questions about perception and cognition in humans and other 'intelligent' species, and about how the brain interprets and acts upon the great mass of sensory information from the external world. Mirrors are used to study how the brain decides what is self and what is other, how it judges distance, and how it reconstructs the richly three-dimensional quality of the outside world from what is essentially a two-dimensional snapshot taken by the retina of the eye. Mirrors are applied in medicine to create reflected images of patients' limbs or other body parts and thus trick the brain into healing itself. Mirror therapy has been successful in treating chronic pain and paralysis. In a sense, mirrors are the best 'virtual reality' system that can be built. The object 'inside' the mirror is virtual, but as far as our eyes are concerned, it exists as much as any other object.</p>\n            <p><strong>C</strong> Research has shown that mirrors can subtly affect human behaviour, often in surprisingly positive ways. Subjects tested in a room with a mirror have been found to work harder and to be less inclined to cheat, compared with control groups performing the same exercises in non-mirrored settings. In addition, the researchers found that people in a room with a mirror were comparatively less likely to make judgements about others based on negative social stereotypes concerning, for example, sex, race or religion. The researchers said that this indicates that when people are made to be self-aware, they are likelier to stop and think about what they are doing. A by-product of that awareness may be a shift away from acting on autopilot toward more desirable ways of behaving. Physical self-reflection, in other words, encourages philosophical self-reflection — a lesson in the ancient Greek notion that you cannot know or appreciate others until you know yourself.</p>\n            <p><strong>D</strong> The link between self-awareness and elaborate sociality may help explain why the few nonhuman species that have been found to recognize themselves in a mirror are those with sophisticated social lives. Animals that live in communal units, such as the great apes – chimpanzees, bonobos, orangutans and gorillas – along with dolphins and Asian elephants, have passed the famed mirror self-recognition test, which means they will, when given a mirror, scrutinize marks that have been applied to their faces or bodies. The animals will also check up on personal cleanliness, inspecting their mouths, nostrils and bodies. Yet not all members of self-reflective species will pass the mirror test. Studies of individual elephants and dolphins raised in isolation suggest that these particular individuals do not exhibit mirror self-recognition.</p>\n            <p><strong>E</strong> For that matter, humans do not necessarily see the face in the mirror as it actually is either. What the human eye sees objectively and how the brain interprets that image are not necessarily the same. Dr Nicholas Epley, Professor of Behavioral Science at the University of Chicago, USA, described experiments in which people were asked to pick out pictures of themselves from among pictures of other human faces. Participants identified their personal photographs significantly quicker when their faces had been computer-enhanced to be more appealing and they were likely to call this retouched image their genuine face. This self-delusion is not simply the result of a widespread preference for prettiness: when asked to match photographs of strangers, participants were, in fact, best at spotting unenhanced faces — that is, those not made to look prettier.</p>\n            <p><strong>F</strong> How can we be so self-delusional when the truth stares back at us? Dr Epley explains that, although we do indeed see ourselves in the mirror every day, we don't look exactly the same every time. There is the just-out-of-bed morning you, the ready-for-work you, the dressed-for-an-elegant-dinner you. Which image is you? People on average resolve the question of these multiple images of themselves in their favour. That is, they piece together a mental representation formed from different aspects of themselves when they are looking their best.</p>\n            <p><strong>G</strong> In a series of other studies, psychologists interviewed people about what they think a mirror shows them. They asked questions like, 'Imagine you are standing in front of a bathroom mirror; how big do you think the image of your face is on the surface? And what will happen to the size of that image if you step steadily backward, away from the glass?' To the first question, people overwhelmingly say 'The outline of my face on the mirror would be pretty much the size of my face. As for the second question, that's obvious: if I move away from the mirror, the size of my image will shrink with each step.' Both answers, it turns out, are wrong. Outline your face on a mirror, and you will find it to be exactly half the size of your real face. Step back as much as you please, and the size of that outlined oval will not change: it remains half the size of your face, even as the background scene reflected in the mirror steadily changes.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p><strong>A</strong> Whether made of highly polished metal or of glass with a coating of metal on the back, mirrors have fascinated people for thousands of years. Ancient Egyptians were often depicted holding hand mirrors. For centuries, the people of Rajasthan in India have sewn bits of reflective glass into their clothing, and the resulting sparkle emphasizes the magic and mystery of that desert land.</p>\n<p><strong>B</strong> To scientists, the simultaneous simplicity and complexity of mirrors make them effective and accessible tools for exploring questions about perception and cognition in humans and other 'intelligent' species, and about how the brain interprets and acts upon the great mass of sensory information from the external world. Mirrors are used to study how the brain decides what is self and what is other, how it judges distance, and how it reconstructs the richly three-dimensional quality of the outside world from what is essentially a two-dimensional snapshot taken by the retina of the eye. Mirrors are applied in medicine to create reflected images of patients' limbs or other body parts and thus trick the brain into healing itself. Mirror therapy has been successful in treating chronic pain and paralysis. In a sense, mirrors are the best 'virtual reality' system that can be built. The object 'inside' the mirror is virtual, but as far as our eyes are concerned, it exists as much as any other object.</p>\n<p><strong>C</strong> Research has shown that mirrors can subtly affect human behaviour, often in surprisingly positive ways. Subjects tested in a room with a mirror have been found to work harder and to be less inclined to cheat, compared with control groups performing the same exercises in non-mirrored settings. In addition, the researchers found that people in a room with a mirror were comparatively less likely to make judgements about others based on negative social stereotypes concerning, for example, sex, race or religion. The researchers said that this indicates that when people are made to be self-aware, they are likelier to stop and think about what they are doing. A by-product of that awareness may be a shift away from acting on autopilot toward more desirable ways of behaving. Physical self-reflection, in other words, encourages philosophical self-reflection — a lesson in the ancient Greek notion that you cannot know or appreciate others until you know yourself.</p>\n<p><strong>D</strong> The link between self-awareness and elaborate sociality may help explain why the few nonhuman species that have been found to recognize themselves in a mirror are those with sophisticated social lives. Animals that live in communal units, such as the great apes – chimpanzees, bonobos, orangutans and gorillas – along with dolphins and Asian elephants, have passed the famed mirror self-recognition test, which means they will, when given a mirror, scrutinize marks that have been applied to their faces or bodies. The animals will also check up on personal cleanliness, inspecting their mouths, nostrils and bodies. Yet not all members of self-reflective species will pass the mirror test. Studies of individual elephants and dolphins raised in isolation suggest that these particular individuals do not exhibit mirror self-recognition.</p>\n<p><strong>E</strong> For that matter, humans do not necessarily see the face in the mirror as it actually is either. What the human eye sees objectively and how the brain interprets that image are not necessarily the same. Dr Nicholas Epley, Professor of Behavioral Science at the University of Chicago, USA, described experiments in which people were asked to pick out pictures of themselves from among pictures of other human faces. Participants identified their personal photographs significantly quicker when their faces had been computer-enhanced to be more appealing and they were likely to call this retouched image their genuine face. This self-delusion is not simply the result of a widespread preference for prettiness: when asked to match photographs of strangers, participants were, in fact, best at spotting unenhanced faces — that is, those not made to look prettier.</p>\n<p><strong>F</strong> How can we be so self-delusional when the truth stares back at us? Dr Epley explains that, although we do indeed see ourselves in the mirror every day, we don't look exactly the same every time. There is the just-out-of-bed morning you, the ready-for-work you, the dressed-for-an-elegant-dinner you. Which image is you? People on average resolve the question of these multiple images of themselves in their favour. That is, they piece together a mental representation formed from different aspects of themselves when they are looking their best.</p>\n<p><strong>G</strong> In a series of other studies, psychologists interviewed people about what they think a mirror shows them. They asked questions like, 'Imagine you are standing in front of a bathroom mirror; how big do you think the image of your face is on the surface? And what will happen to the size of that image if you step steadily backward, away from the glass?' To the first question, people overwhelmingly say 'The outline of my face on the mirror would be pretty much the size of my face. As for the second question, that's obvious: if I move away from the mirror, the size of my image will shrink with each step.' Both answers, it turns out, are wrong. Outline your face on a mirror, and you will find it to be exactly half the size of your real face. Step back as much as you please, and the size of that outlined oval will not change: it remains half the size of your face, even as the background scene reflected in the mirror steadily changes.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -34,7 +34,7 @@
         "q3",
         "q4"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n                <h4>Questions 27–30</h4>\n                <p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n                <ul style=\"list-style: none; padding-left: 0; margin-top: 8px;\">\n                    <li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p><strong>27</strong> The conflicting nature of mirrors makes them inappropriate aids for investigating human thought.</p>\n                    <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> Humans find it difficult to distinguish between reflections of two- and three-dimensional objects.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> Illusions using mirrors can help in the treatment of medical problems.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>30</strong> Mirrors for use in scientific experiments have to be constructed to precise specifications.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<ul style=\"list-style: none; padding-left: 0; margin-top: 8px;\">\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> The conflicting nature of mirrors makes them inappropriate aids for investigating human thought.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Humans find it difficult to distinguish between reflections of two- and three-dimensional objects.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Illusions using mirrors can help in the treatment of medical problems.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Mirrors for use in scientific experiments have to be constructed to precise specifications.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -45,7 +45,7 @@
         "q7",
         "q8"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-anchor\">\n                <h4>Questions 31–34</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>31</strong> If a mirror is present during certain experiments, the subjects tend to</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"A\"><span>A monitor the behaviour of other subjects.</span></label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"B\"><span>B act more industriously and independently.</span></label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"C\"><span>C become less confident of themselves.</span></label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"D\"><span>D focus overwhelmingly on their own reflection.</span></label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>32</strong> Research results imply that physical self-reflection leads people to be</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"A\"><span>A more tolerant of others.</span></label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"B\"><span>B more satisfied with their own lives.</span></label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"C\"><span>C more open to learning from others.</span></label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"D\"><span>D more likely to accept unpopular ideas.</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> The successful completion of a well-known mirror test suggests that the animal subjects</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"A\"><span>A find the image in the mirror uninteresting.</span></label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"B\"><span>B recognise the basic need for personal cleanliness.</span></label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"C\"><span>C realise that the marks they see are on their own body.</span></label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"D\"><span>D understand that marks on their face have been made deliberately.</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>34</strong> Which of the following is the most suitable title for Reading Passage 3?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"A\"><span>A Conflicting interpretations of mirror research</span></label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"B\"><span>B Psychological responses to mirror images</span></label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"C\"><span>C The physical properties of mirrors</span></label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"D\"><span>D The use of mirrors through history</span></label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-anchor\">\n<h4>Questions 31–34</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>31</strong> If a mirror is present during certain experiments, the subjects tend to</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"><span>A monitor the behaviour of other subjects.</span></label> <label><input name=\"q5\" type=\"radio\" value=\"B\"><span>B act more industriously and independently.</span></label> <label><input name=\"q5\" type=\"radio\" value=\"C\"><span>C become less confident of themselves.</span></label> <label><input name=\"q5\" type=\"radio\" value=\"D\"><span>D focus overwhelmingly on their own reflection.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> Research results imply that physical self-reflection leads people to be</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"A\"><span>A more tolerant of others.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"B\"><span>B more satisfied with their own lives.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"C\"><span>C more open to learning from others.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"D\"><span>D more likely to accept unpopular ideas.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> The successful completion of a well-known mirror test suggests that the animal subjects</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"><span>A find the image in the mirror uninteresting.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"B\"><span>B recognise the basic need for personal cleanliness.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"C\"><span>C realise that the marks they see are on their own body.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"D\"><span>D understand that marks on their face have been made deliberately.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Which of the following is the most suitable title for Reading Passage 3?</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"><span>A Conflicting interpretations of mirror research</span></label> <label><input name=\"q8\" type=\"radio\" value=\"B\"><span>B Psychological responses to mirror images</span></label> <label><input name=\"q8\" type=\"radio\" value=\"C\"><span>C The physical properties of mirrors</span></label> <label><input name=\"q8\" type=\"radio\" value=\"D\"><span>D The use of mirrors through history</span></label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -58,7 +58,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q9-10-11-12-13-14-anchor\">\n                <h4>Questions 35–40</h4>\n                <p>Complete each sentence with the correct ending, <strong>A–I</strong>, below.</p>\n                \n                <div class=\"completion-item\">\n                    <p><strong>35</strong> Dr Epley found that when identifying images of themselves, people</p>\n                    <div class=\"drop-target-completion drop-target-summary\" id=\"q9-target\" data-question=\"q9\"></div>\n                </div>\n                <div class=\"completion-item\">\n                    <p><strong>36</strong> When trying to identify images of unfamiliar individuals, Dr Epley found that people most frequently</p>\n                    <div class=\"drop-target-completion drop-target-summary\" id=\"q10-target\" data-question=\"q10\"></div>\n                </div>\n                <div class=\"completion-item\">\n                    <p><strong>37</strong> Dr Epley says that a single objective reflection is impossible because people</p>\n                    <div class=\"drop-target-completion drop-target-summary\" id=\"q11-target\" data-question=\"q11\"></div>\n                </div>\n                <div class=\"completion-item\">\n                    <p><strong>38</strong> Dr Epley says that when forming an opinion of how they think they look, people</p>\n                    <div class=\"drop-target-completion drop-target-summary\" id=\"q12-target\" data-question=\"q12\"></div>\n                </div>\n                <div class=\"completion-item\">\n                    <p><strong>39</strong> When guessing the size of their mirrored face from close up, people</p>\n                    <div class=\"drop-target-completion drop-target-summary\" id=\"q13-target\" data-question=\"q13\"></div>\n                </div>\n                <div class=\"completion-item\">\n                    <p><strong>40</strong> As they imagine stepping backwards from a mirror, people</p>\n                    <div class=\"drop-target-completion drop-target-summary\" id=\"q14-target\" data-question=\"q14\"></div>\n                </div>\n\n                <div id=\"word-options\">\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"A\"><strong>A</strong> believe they can improve their looks by being friendly.</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"B\"><strong>B</strong> are confronted daily with their images in a variety of situations.</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"C\"><strong>C</strong> assume their image will get progressively smaller.</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"D\"><strong>D</strong> recognise familiar faces much more readily.</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"E\"><strong>E</strong> estimate the image to be larger than it actually is.</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"F\"><strong>F</strong> select those photographs which have not been altered.</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"G\"><strong>G</strong> find there is little change in the image they face.</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"H\"><strong>H</strong> locate the photographs faster if they are made to look attractive.</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"I\"><strong>I</strong> create a positive generalised self-image.</div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q9-10-11-12-13-14-anchor\">\n<h4>Questions 35–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–I</strong>, below.</p>\n<div class=\"completion-item\">\n<p><strong>35</strong> Dr Epley found that when identifying images of themselves, people</p>\n<div class=\"drop-target-completion drop-target-summary\" id=\"q9-target\" data-question=\"q9\"></div>\n</div>\n<div class=\"completion-item\">\n<p><strong>36</strong> When trying to identify images of unfamiliar individuals, Dr Epley found that people most frequently</p>\n<div class=\"drop-target-completion drop-target-summary\" id=\"q10-target\" data-question=\"q10\"></div>\n</div>\n<div class=\"completion-item\">\n<p><strong>37</strong> Dr Epley says that a single objective reflection is impossible because people</p>\n<div class=\"drop-target-completion drop-target-summary\" id=\"q11-target\" data-question=\"q11\"></div>\n</div>\n<div class=\"completion-item\">\n<p><strong>38</strong> Dr Epley says that when forming an opinion of how they think they look, people</p>\n<div class=\"drop-target-completion drop-target-summary\" id=\"q12-target\" data-question=\"q12\"></div>\n</div>\n<div class=\"completion-item\">\n<p><strong>39</strong> When guessing the size of their mirrored face from close up, people</p>\n<div class=\"drop-target-completion drop-target-summary\" id=\"q13-target\" data-question=\"q13\"></div>\n</div>\n<div class=\"completion-item\">\n<p><strong>40</strong> As they imagine stepping backwards from a mirror, people</p>\n<div class=\"drop-target-completion drop-target-summary\" id=\"q14-target\" data-question=\"q14\"></div>\n</div>\n<div id=\"word-options\">\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"A\"><strong>A</strong> believe they can improve their looks by being friendly.</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"B\"><strong>B</strong> are confronted daily with their images in a variety of situations.</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"C\"><strong>C</strong> assume their image will get progressively smaller.</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"D\"><strong>D</strong> recognise familiar faces much more readily.</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"E\"><strong>E</strong> estimate the image to be larger than it actually is.</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"F\"><strong>F</strong> select those photographs which have not been altered.</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"G\"><strong>G</strong> find there is little change in the image they face.</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"H\"><strong>H</strong> locate the photographs faster if they are made to look attractive.</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"I\"><strong>I</strong> create a positive generalised self-image.</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Humanities and the health professional</h3>\n            <h4>Professor Jock Murray from Dalhousie Medical School in Canada writes about the role of humanities in the education of health professionals</h4>\n            \n            <p>In a recent meeting with health professionals from many disciplines, the concept of the humanities and how they enrich the lives and practice of physicians was discussed. There were nurses, chiropractors, speech therapists, health administrators and professionals from a dozen other fields. Everyone commented on the need to achieve a balance between the humanities and the skills and technological expertise of their specific discipline, beginning with the experience in medical school and then life in their chosen specialisation, to create fully realised professionals. The purpose of my discussion here is to advocate a balanced approach to the education of all health professionals.</p>\n            <p>I believe that most people wish to see in their medical professional a person who not only brings excellent skills, techniques and treatments, but also personal qualities that show they are fully developed individuals. Such individuals are sensitive, communicative, and understanding of the human condition. They acknowledge the vast array of backgrounds, views, fears and hopes each person brings to the clinical encounter.</p>\n            <p>The training of health professionals has usually been exemplary in teaching them to recognise and treat a symptom or disease, but often less attentive to the broad education that would inform and educate them about the persons who come from various cultures, backgrounds and experiences. Such understanding does not come from the course textbooks but from literature, history, poetry, art and other aspects of the humanities.</p>\n            <p>There are two sides to the healing profession, once described as the art and the science of medical practice. It is evident, however, that most educational programmes emphasise knowledge, clinical skill and competence, and although educators wish the person to be humanistic, empathetic and communicative, they take this aspect for granted, as if valuable educational time does not need to be allocated to this 'soft' feature of the profession. It is compounded by the recognition that this aspect is harder to define and measure than knowledge and competence. We may want the health professional to understand many elements of the human condition so they can understand, assess and manage the suffering of patients, but it is harder to design and teach such a course than one on anatomy, for example. Developing a humanities programme in professional education refocuses attention on what everyone recognises as important. Rather than take humanities education for granted, it becomes a direct part of the programme. This signals that the school takes it seriously and encourages activities related to the broad area of the humanities.</p>\n            <p>Distinguished by their focus on human values, the humanities cover many areas, including history, ethics, literature, theology, art, music, law and the social sciences as they apply to the profession. For example, a history of the profession gives us an understanding of how we have come to be where we are, and how things change and progress. Literature can teach us about human hopes and aspirations, suffering and loss, relationships, and life and death. Emphasis on human values is important in this day and age as we are increasingly at risk of being overwhelmed by more emotionless technology and complex bureaucracy.</p>\n            <p>In medical education during the 18th and 19th centuries, there was an emphasis on the humanities. As time went on, encouraged by increasing interest in medical sciences, laboratory experiments and technological aspects of the profession, emphasis in medical studies was weighted towards courses in the sciences. The Flexner Report in 1910 recognised the variable quality of medical education and the need to have better teaching in the medical sciences and laboratory methods. This resulted in a pendulum swing in emphasis, directing the curriculum to the medical sciences, to the exclusion of the humanities, an imbalance never intended by Flexner.</p>\n            <p>Currently at Dalhousie Medical School we have elective programmes in the humanities, summer research studentships, lecture series, presentations and discussions. There is an artist-in-residence programme that brings artists to the school. There is a large choir of over a hundred students and faculty, a concert band, a string ensemble, and groups of student artists who put on regular performances and exhibitions. The list of activities is much longer, but it should be pointed out that these provide some balance and broaden the life and learning of the student.</p>\n            <p>Perhaps more important than the activities themselves is the change in mind-set that occurs when students see that diversity in their studies and activities is legitimised and encouraged. We emphasise that we want students and faculty to continue to express interests and talents they had before entering medical school. They now come forward with ideas and activities that are more imaginative and exciting than we could have designed. They also comment that the humanities has made medical school a more enjoyable and fulfilling experience. Students see that their learning and their lives can be more balanced, making them better equipped to care for their patients.</p>\n            <p>Will involvement in the humanities make one a better health professional? It's a question often asked of today's medical professionals but very difficult to document in this evidence-based era of medicine. But as ethics scholars have said of learning ethics, it cannot guarantee that a person will be more ethical, but it is more likely than not. My firm belief is that all the healing professions should increase the balance of humanities with the traditional educational emphasis on skills and knowledge, and this will benefit both the healers and those who need to be healed.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Humanities and the health professional</h3>\n<h4>Professor Jock Murray from Dalhousie Medical School in Canada writes about the role of humanities in the education of health professionals</h4>\n<p>In a recent meeting with health professionals from many disciplines, the concept of the humanities and how they enrich the lives and practice of physicians was discussed. There were nurses, chiropractors, speech therapists, health administrators and professionals from a dozen other fields. Everyone commented on the need to achieve a balance between the humanities and the skills and technological expertise of their specific discipline, beginning with the experience in medical school and then life in their chosen specialisation, to create fully realised professionals. The purpose of my discussion here is to advocate a balanced approach to the education of all health professionals.</p>\n<p>I believe that most people wish to see in their medical professional a person who not only brings excellent skills, techniques and treatments, but also personal qualities that show they are fully developed individuals. Such individuals are sensitive, communicative, and understanding of the human condition. They acknowledge the vast array of backgrounds, views, fears and hopes each person brings to the clinical encounter.</p>\n<p>The training of health professionals has usually been exemplary in teaching them to recognise and treat a symptom or disease, but often less attentive to the broad education that would inform and educate them about the persons who come from various cultures, backgrounds and experiences. Such understanding does not come from the course textbooks but from literature, history, poetry, art and other aspects of the humanities.</p>\n<p>There are two sides to the healing profession, once described as the art and the science of medical practice. It is evident, however, that most educational programmes emphasise knowledge, clinical skill and competence, and although educators wish the person to be humanistic, empathetic and communicative, they take this aspect for granted, as if valuable educational time does not need to be allocated to this 'soft' feature of the profession. It is compounded by the recognition that this aspect is harder to define and measure than knowledge and competence. We may want the health professional to understand many elements of the human condition so they can understand, assess and manage the suffering of patients, but it is harder to design and teach such a course than one on anatomy, for example. Developing a humanities programme in professional education refocuses attention on what everyone recognises as important. Rather than take humanities education for granted, it becomes a direct part of the programme. This signals that the school takes it seriously and encourages activities related to the broad area of the humanities.</p>\n<p>Distinguished by their focus on human values, the humanities cover many areas, including history, ethics, literature, theology, art, music, law and the social sciences as they apply to the profession. For example, a history of the profession gives us an understanding of how we have come to be where we are, and how things change and progress. Literature can teach us about human hopes and aspirations, suffering and loss, relationships, and life and death. Emphasis on human values is important in this day and age as we are increasingly at risk of being overwhelmed by more emotionless technology and complex bureaucracy.</p>\n<p>In medical education during the 18th and 19th centuries, there was an emphasis on the humanities. As time went on, encouraged by increasing interest in medical sciences, laboratory experiments and technological aspects of the profession, emphasis in medical studies was weighted towards courses in the sciences. The Flexner Report in 1910 recognised the variable quality of medical education and the need to have better teaching in the medical sciences and laboratory methods. This resulted in a pendulum swing in emphasis, directing the curriculum to the medical sciences, to the exclusion of the humanities, an imbalance never intended by Flexner.</p>\n<p>Currently at Dalhousie Medical School we have elective programmes in the humanities, summer research studentships, lecture series, presentations and discussions. There is an artist-in-residence programme that brings artists to the school. There is a large choir of over a hundred students and faculty, a concert band, a string ensemble, and groups of student artists who put on regular performances and exhibitions. The list of activities is much longer, but it should be pointed out that these provide some balance and broaden the life and learning of the student.</p>\n<p>Perhaps more important than the activities themselves is the change in mind-set that occurs when students see that diversity in their studies and activities is legitimised and encouraged. We emphasise that we want students and faculty to continue to express interests and talents they had before entering medical school. They now come forward with ideas and activities that are more imaginative and exciting than we could have designed. They also comment that the humanities has made medical school a more enjoyable and fulfilling experience. Students see that their learning and their lives can be more balanced, making them better equipped to care for their patients.</p>\n<p>Will involvement in the humanities make one a better health professional? It's a question often asked of today's medical professionals but very difficult to document in this evidence-based era of medicine. But as ethics scholars have said of learning ethics, it cannot guarantee that a person will be more ethical, but it is more likely than not. My firm belief is that all the healing professions should increase the balance of humanities with the traditional educational emphasis on skills and knowledge, and this will benefit both the healers and those who need to be healed.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 27–31</h4>\n                <p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n                <p>In boxes 27–31 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                \n                <div class=\"question-item\">\n                    <p><strong>27</strong> An approach that incorporates the humanities is more important for some medical disciplines than others.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> Most people value medical expertise over sensitivity in their medical professionals.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> Most medical programmes devote little course time to developing interpersonal skills.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> It is more difficult to design a humanities course for health professionals than a medical one.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>31</strong> It would be best if a medical programme included a course about the lives of medical professionals.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 27–31 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> An approach that incorporates the humanities is more important for some medical disciplines than others.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Most people value medical expertise over sensitivity in their medical professionals.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Most medical programmes devote little course time to developing interpersonal skills.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> It is more difficult to design a humanities course for health professionals than a medical one.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> It would be best if a medical programme included a course about the lives of medical professionals.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n                <h4>Questions 32–35</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                \n                <div class=\"question-item\">\n                    <p><strong>32</strong> What unforeseen result did the Flexner report have?</p>\n                    <div class=\"radio-options column\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"A\"> <strong>A</strong> It caused the public to distrust the quality of medical education.</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"B\"> <strong>B</strong> It caused a dramatic increase in medical-school applicants.</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"C\"> <strong>C</strong> It started a fierce debate over proper laboratory methods.</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"D\"> <strong>D</strong> It moved the focus of medical studies away from the humanities.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> The writer lists humanities activities at Dalhousie Medical School to show how these activities</p>\n                    <div class=\"radio-options column\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"A\"> <strong>A</strong> have become the most popular events on campus.</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"B\"> <strong>B</strong> widen students' educational experiences.</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"C\"> <strong>C</strong> are of as high a quality as medical ones.</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"D\"> <strong>D</strong> have gained acceptance with teaching staff.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>34</strong> How do students at Dalhousie Medical School react to humanities activities?</p>\n                    <div class=\"radio-options column\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"A\"> <strong>A</strong> They have difficulty letting go of the mind-set that scientific knowledge is more legitimate.</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"B\"> <strong>B</strong> They report feeling that medical school has become more engaging and satisfying.</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"C\"> <strong>C</strong> They have started to transfer creative ideas to their scientific and laboratory studies.</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"D\"> <strong>D</strong> They have trouble connecting to talents they had valued before entering medical school.</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>35</strong> What is the writer's main conclusion?</p>\n                    <div class=\"radio-options column\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"A\"> <strong>A</strong> Greater emphasis on humanities in medical schools will benefit both patients and practitioners.</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"B\"> <strong>B</strong> Medical schools are not adequately preparing students to become balanced medical professionals.</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"C\"> <strong>C</strong> Creating a humanities programme in a medical school is an overwhelmingly difficult but necessary task.</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"D\"> <strong>D</strong> Medical schools should return to the early-twentieth-century model of medical education.</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>32</strong> What unforeseen result did the Flexner report have?</p>\n<div class=\"radio-options column\">\n<label><input name=\"q6\" type=\"radio\" value=\"A\"> <strong>A</strong> It caused the public to distrust the quality of medical education.</label> <label><input name=\"q6\" type=\"radio\" value=\"B\"> <strong>B</strong> It caused a dramatic increase in medical-school applicants.</label> <label><input name=\"q6\" type=\"radio\" value=\"C\"> <strong>C</strong> It started a fierce debate over proper laboratory methods.</label> <label><input name=\"q6\" type=\"radio\" value=\"D\"> <strong>D</strong> It moved the focus of medical studies away from the humanities.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> The writer lists humanities activities at Dalhousie Medical School to show how these activities</p>\n<div class=\"radio-options column\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"> <strong>A</strong> have become the most popular events on campus.</label> <label><input name=\"q7\" type=\"radio\" value=\"B\"> <strong>B</strong> widen students' educational experiences.</label> <label><input name=\"q7\" type=\"radio\" value=\"C\"> <strong>C</strong> are of as high a quality as medical ones.</label> <label><input name=\"q7\" type=\"radio\" value=\"D\"> <strong>D</strong> have gained acceptance with teaching staff.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> How do students at Dalhousie Medical School react to humanities activities?</p>\n<div class=\"radio-options column\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"> <strong>A</strong> They have difficulty letting go of the mind-set that scientific knowledge is more legitimate.</label> <label><input name=\"q8\" type=\"radio\" value=\"B\"> <strong>B</strong> They report feeling that medical school has become more engaging and satisfying.</label> <label><input name=\"q8\" type=\"radio\" value=\"C\"> <strong>C</strong> They have started to transfer creative ideas to their scientific and laboratory studies.</label> <label><input name=\"q8\" type=\"radio\" value=\"D\"> <strong>D</strong> They have trouble connecting to talents they had valued before entering medical school.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> What is the writer's main conclusion?</p>\n<div class=\"radio-options column\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"> <strong>A</strong> Greater emphasis on humanities in medical schools will benefit both patients and practitioners.</label> <label><input name=\"q9\" type=\"radio\" value=\"B\"> <strong>B</strong> Medical schools are not adequately preparing students to become balanced medical professionals.</label> <label><input name=\"q9\" type=\"radio\" value=\"C\"> <strong>C</strong> Creating a humanities programme in a medical school is an overwhelmingly difficult but necessary task.</label> <label><input name=\"q9\" type=\"radio\" value=\"D\"> <strong>D</strong> Medical schools should return to the early-twentieth-century model of medical education.</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n                <h4>Questions 36–40</h4>\n                <p>Complete each sentence with the correct ending, <strong>A–G</strong>, below.</p>\n                <p><em>Write the correct letter, <strong>A–G</strong>, in boxes 36–40 on your answer sheet.</em></p>\n                \n                <div class=\"question-item\">\n                    <div class=\"match-question-item\">\n                        <p><strong>36</strong> Health professionals at a recent seminar discussed a need for educational institutions to</p>\n                        <div class=\"match-dropzone\" data-question=\"q10\"></div>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <div class=\"match-question-item\">\n                        <p><strong>37</strong> Most medical training programmes</p>\n                        <div class=\"match-dropzone\" data-question=\"q11\"></div>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <div class=\"match-question-item\">\n                        <p><strong>38</strong> The interpersonal and behavioural aspects of medical practice</p>\n                        <div class=\"match-dropzone\" data-question=\"q12\"></div>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <div class=\"match-question-item\">\n                        <p><strong>39</strong> Dalhousie Medical School students and faculty</p>\n                        <div class=\"match-dropzone\" data-question=\"q13\"></div>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <div class=\"match-question-item\">\n                        <p><strong>40</strong> Modern evidence-based practitioners</p>\n                        <div class=\"match-dropzone\" data-question=\"q14\"></div>\n                    </div>\n                </div>\n\n                <div class=\"options-pool\" id=\"endings-options-pool\">\n                    <strong>List of Endings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"A\"><strong>A</strong> generate innovative and creative suggestions for activities and programmes.</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"B\"><strong>B</strong> are difficult to describe with any precision.</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"C\"><strong>C</strong> find it difficult to prove statistically the benefits of humanities programmes.</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"D\"><strong>D</strong> suggest that humanities studies create stronger practitioners.</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"E\"><strong>E</strong> rely on course textbooks to teach humanities.</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"F\"><strong>F</strong> give less attention to broad education and more to recognising and treating symptoms.</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"G\"><strong>G</strong> provide more equal coverage of both medical knowledge and skills, and humanities.</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–G</strong>, below.</p>\n<p><em>Write the correct letter, <strong>A–G</strong>, in boxes 36–40 on your answer sheet.</em></p>\n<div class=\"question-item\">\n<div class=\"match-question-item\">\n<p><strong>36</strong> Health professionals at a recent seminar discussed a need for educational institutions to</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"match-question-item\">\n<p><strong>37</strong> Most medical training programmes</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"match-question-item\">\n<p><strong>38</strong> The interpersonal and behavioural aspects of medical practice</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"match-question-item\">\n<p><strong>39</strong> Dalhousie Medical School students and faculty</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n</div>\n<div class=\"question-item\">\n<div class=\"match-question-item\">\n<p><strong>40</strong> Modern evidence-based practitioners</p>\n<div class=\"match-dropzone\" data-question=\"q14\"></div>\n</div>\n</div>\n<div class=\"options-pool\" id=\"endings-options-pool\">\n<strong>List of Endings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\"><strong>A</strong> generate innovative and creative suggestions for activities and programmes.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\"><strong>B</strong> are difficult to describe with any precision.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\"><strong>C</strong> find it difficult to prove statistically the benefits of humanities programmes.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\"><strong>D</strong> suggest that humanities studies create stronger practitioners.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\"><strong>E</strong> rely on course textbooks to teach humanities.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\"><strong>F</strong> give less attention to broad education and more to recognising and treating symptoms.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\"><strong>G</strong> provide more equal coverage of both medical knowledge and skills, and humanities.</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false
     }
   ],
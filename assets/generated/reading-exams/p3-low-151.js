@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Book Review: The Discovery of Slowness by Sten Nadolny</h3>\n            \n            <p><strong>A</strong> The English explorer and writer John Franklin (1786–1847) joined the Navy at the age of 14, and fought at the battle of Trafalgar. When peace came, he turned his attention to Arctic exploration, and in particular to solving the conundrum of the Northwest Passage, a mythical clear-water route through the ice which would, if it existed, link the Pacific Ocean on America's West Coast with the Atlantic on its East. The first expedition Franklin led to the Arctic was an arduous overland journey lasting from 1819 to 1822, in which he and his twenty-strong team covered 8,880 kilometres on foot. Their expedition was a triumph of surveying – they managed to chart hundreds of kilometres of previously unknown coastline – but food ran out on their journey back to civilisation, and the men were forced to eat their belts and their boots (which they boiled up to make leather soup).</p>\n            <p><strong>B</strong> There followed a career as a travel writer and public speaker ('the man who ate his boots' was Franklin's tag-line). Then in 1845, Franklin set off back to the Arctic with two ships – the Erebus and the Terror – and 129 men. Nothing was heard of them for 14 years, although more than 30 expeditions were dispatched in search of them. Eventually it was discovered that Franklin and all his team had perished after their ships were trapped in the ice.</p>\n            <p><strong>C</strong> In his personal correspondence and published memoirs, Franklin comes across as a man dedicated to the external duties of war and exploration, who kept introspection and self-analysis to a minimum. His blandness makes him an amenably malleable subject for a novelist, and Sten Nadolny has taken full advantage of this in his book. Most important, Nadolny has endowed John Franklin with a defining trait for which there is no historical evidence: Langsamkeit (‘slowness', or 'calmness').</p>\n            <p><strong>D</strong> Slowness influences not only Franklin's behaviour, but also his vision, his thought and his speech. The opening scene of The Discovery of Slowness depicts Franklin as a young boy, failing to catch a ball because his reaction time is too slow. Despite the bullying of his peers, Franklin resolves not to fall into step with ‘their way of doing things'. For Nadolny, Franklin's fascination with the Arctic stems from his desire to find an environment suited to his peculiar slowness. He describes Franklin as a boy dreaming of the 'time without hours and days' which exists in the far north, a place ‘where nobody would find him too slow'.</p>\n            <p><strong>E</strong> Ice is a slow mover. The compressed blue ice inside an Alpine crevasse will have fallen as snow several decades earlier. Polar pack ice takes at least two years to form. The film of crystals which first appears on the surface of the sea thickens into a silkily pliant layer called nilas; this in turn consolidates into young ice, which then deepens during several seasons to become pack. Ice demands a corresponding patience from those who venture onto it. The explorers who have thrived at high latitudes and at high altitudes haven't usually been men of great speed. They have tended instead to demonstrate unusual self-possession, a considerable capacity for boredom, and a talent for the uncomplaining endurance of suffering.</p>\n            <p><strong>F</strong> These were all qualities which the historical Franklin possessed in abundance, and so Nadolny's exaggeration of them isn't unreasonable. Even as an adult, Franklin's slowness of thought means that he is unable to speak fluently, so he learns by heart ‘entire fleets of words and batteries of responses', and speaks a languid, bric-à-brac language. In the Navy, his method of thinking first and acting later initially provokes mockery from his fellow sailors. But Franklin persists in doing things his way, and gradually earns the respect of those around him. To a commodore who tells him to speed up his report of an engagement, he replies: ‘When I tell something, sir, I use my own rhythm.' A lieutenant says approvingly of him: ‘Because Franklin is so slow, he never loses time.'</p>\n            <p><strong>G</strong> Nadolny also brings his central metaphor of slowness to bear on the novel's language. The chapters describing Franklin's early years are a medley of separate fragments, rhetorical questions, associative jumps and exclamation marks. In the later sections recounting Franklin's first Arctic expedition, Nadolny brilliantly sets the narrative pace to the rhythms of the frozen landscape, and to the 'slowness which is bred by hunger'.</p>\n            <p><strong>H</strong> Since it was first published in Germany in 1983, The Discovery of Slowness has sold more than a million copies and been translated into 15 languages. It has been adopted as a manual and manifesto by European pressure groups and institutions representing causes as diverse as sustainable development, management science and motoring policy, even becoming involved in the debate about speed limits on German roads. The various groups that have taken the novel up have one thing in common: a dislike of the high-speed culture of Post-modernity. Nadolny's Franklin appeals to them because he is immune to 'the compulsion to be constantly occupied', and to the idea that 'someone was better if he could do the same thing fast'. It's easy to see where the attraction lies for those in management. The novel is crammed with quotations about time-efficiency, punctiliousness and profitability: ‘What did “too late” mean? They hadn't waited for it long enough, that's what it meant.'</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Book Review: The Discovery of Slowness by Sten Nadolny</h3>\n<p><strong>A</strong> The English explorer and writer John Franklin (1786–1847) joined the Navy at the age of 14, and fought at the battle of Trafalgar. When peace came, he turned his attention to Arctic exploration, and in particular to solving the conundrum of the Northwest Passage, a mythical clear-water route through the ice which would, if it existed, link the Pacific Ocean on America's West Coast with the Atlantic on its East. The first expedition Franklin led to the Arctic was an arduous overland journey lasting from 1819 to 1822, in which he and his twenty-strong team covered 8,880 kilometres on foot. Their expedition was a triumph of surveying – they managed to chart hundreds of kilometres of previously unknown coastline – but food ran out on their journey back to civilisation, and the men were forced to eat their belts and their boots (which they boiled up to make leather soup).</p>\n<p><strong>B</strong> There followed a career as a travel writer and public speaker ('the man who ate his boots' was Franklin's tag-line). Then in 1845, Franklin set off back to the Arctic with two ships – the Erebus and the Terror – and 129 men. Nothing was heard of them for 14 years, although more than 30 expeditions were dispatched in search of them. Eventually it was discovered that Franklin and all his team had perished after their ships were trapped in the ice.</p>\n<p><strong>C</strong> In his personal correspondence and published memoirs, Franklin comes across as a man dedicated to the external duties of war and exploration, who kept introspection and self-analysis to a minimum. His blandness makes him an amenably malleable subject for a novelist, and Sten Nadolny has taken full advantage of this in his book. Most important, Nadolny has endowed John Franklin with a defining trait for which there is no historical evidence: Langsamkeit (‘slowness', or 'calmness').</p>\n<p><strong>D</strong> Slowness influences not only Franklin's behaviour, but also his vision, his thought and his speech. The opening scene of The Discovery of Slowness depicts Franklin as a young boy, failing to catch a ball because his reaction time is too slow. Despite the bullying of his peers, Franklin resolves not to fall into step with ‘their way of doing things'. For Nadolny, Franklin's fascination with the Arctic stems from his desire to find an environment suited to his peculiar slowness. He describes Franklin as a boy dreaming of the 'time without hours and days' which exists in the far north, a place ‘where nobody would find him too slow'.</p>\n<p><strong>E</strong> Ice is a slow mover. The compressed blue ice inside an Alpine crevasse will have fallen as snow several decades earlier. Polar pack ice takes at least two years to form. The film of crystals which first appears on the surface of the sea thickens into a silkily pliant layer called nilas; this in turn consolidates into young ice, which then deepens during several seasons to become pack. Ice demands a corresponding patience from those who venture onto it. The explorers who have thrived at high latitudes and at high altitudes haven't usually been men of great speed. They have tended instead to demonstrate unusual self-possession, a considerable capacity for boredom, and a talent for the uncomplaining endurance of suffering.</p>\n<p><strong>F</strong> These were all qualities which the historical Franklin possessed in abundance, and so Nadolny's exaggeration of them isn't unreasonable. Even as an adult, Franklin's slowness of thought means that he is unable to speak fluently, so he learns by heart ‘entire fleets of words and batteries of responses', and speaks a languid, bric-à-brac language. In the Navy, his method of thinking first and acting later initially provokes mockery from his fellow sailors. But Franklin persists in doing things his way, and gradually earns the respect of those around him. To a commodore who tells him to speed up his report of an engagement, he replies: ‘When I tell something, sir, I use my own rhythm.' A lieutenant says approvingly of him: ‘Because Franklin is so slow, he never loses time.'</p>\n<p><strong>G</strong> Nadolny also brings his central metaphor of slowness to bear on the novel's language. The chapters describing Franklin's early years are a medley of separate fragments, rhetorical questions, associative jumps and exclamation marks. In the later sections recounting Franklin's first Arctic expedition, Nadolny brilliantly sets the narrative pace to the rhythms of the frozen landscape, and to the 'slowness which is bred by hunger'.</p>\n<p><strong>H</strong> Since it was first published in Germany in 1983, The Discovery of Slowness has sold more than a million copies and been translated into 15 languages. It has been adopted as a manual and manifesto by European pressure groups and institutions representing causes as diverse as sustainable development, management science and motoring policy, even becoming involved in the debate about speed limits on German roads. The various groups that have taken the novel up have one thing in common: a dislike of the high-speed culture of Post-modernity. Nadolny's Franklin appeals to them because he is immune to 'the compulsion to be constantly occupied', and to the idea that 'someone was better if he could do the same thing fast'. It's easy to see where the attraction lies for those in management. The novel is crammed with quotations about time-efficiency, punctiliousness and profitability: ‘What did “too late” mean? They hadn't waited for it long enough, that's what it meant.'</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 27–31</h4>\n                <p>Reading Passage 3 has eight paragraphs, <strong>A–H</strong>.</p>\n                <p>Which paragraph contains the following information?</p>\n                <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                        <thead>\n                            <tr>\n                                <th style=\"min-width: 250px;\"></th>\n                                <th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>27</strong> a summary of Franklin's occupation in the period before his first expedition</td>\n                                <td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>28</strong> a reference to a feature of Franklin's character in Nadolny's novel that has no definite basis in fact</td>\n                                <td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>29</strong> a connection between the central theme of the novel and an environmental process</td>\n                                <td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>30</strong> a reference to the widespread appeal of Nadolny's novel</td>\n                                <td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>31</strong> a summary of events following Franklin's return from his first expedition</td>\n                                <td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n                            </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Reading Passage 3 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 250px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>27</strong> a summary of Franklin's occupation in the period before his first expedition</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>28</strong> a reference to a feature of Franklin's character in Nadolny's novel that has no definite basis in fact</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>29</strong> a connection between the central theme of the novel and an environmental process</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>30</strong> a reference to the widespread appeal of Nadolny's novel</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>31</strong> a summary of events following Franklin's return from his first expedition</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n                <h4>Questions 32–35</h4>\n                <p>Complete the summary using the list of words, <strong>A–L</strong>, below.</p>\n                <div class=\"summary-text\">\n                    <h4>John Franklin and the Quality of Slowness</h4>\n                    <p>\n                    Little is known from Franklin's correspondence and published writings about his <strong>32</strong> <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span>. The author, Nadolny, suggests that Franklin's whole life can be explained by the quality of ‘slowness'. He begins the book by showing how this affects the young Franklin's <strong>33</strong> <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> activities, and makes him become <strong>34</strong> <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span>. As a child, it is the quality of <strong>35</strong> <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span> that attracts Franklin to the Arctic.\n                    </p>\n                </div>\n                 <div id=\"word-options\">\n                    <div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"a bully\">A a bully</div>\n                    <div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"discoveries\">B discoveries</div>\n                    <div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"educational\">C educational</div>\n                    <div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"family\">D family</div>\n                    <div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"isolation\">E isolation</div>\n                    <div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"an outsider\">F an outsider</div>\n                    <div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"personality\">G personality</div>\n                    <div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"problems\">H problems</div>\n                    <div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-word=\"remoteness\">I remoteness</div>\n                    <div id=\"word-J\" class=\"draggable-word\" draggable=\"true\" data-word=\"a scholar\">J a scholar</div>\n                    <div id=\"word-K\" class=\"draggable-word\" draggable=\"true\" data-word=\"sporting\">K sporting</div>\n                    <div id=\"word-L\" class=\"draggable-word\" draggable=\"true\" data-word=\"timelessness\">L timelessness</div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Complete the summary using the list of words, <strong>A–L</strong>, below.</p>\n<div class=\"summary-text\">\n<h4>John Franklin and the Quality of Slowness</h4>\n<p>\nLittle is known from Franklin's correspondence and published writings about his <strong>32</strong> <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span>. The author, Nadolny, suggests that Franklin's whole life can be explained by the quality of ‘slowness'. He begins the book by showing how this affects the young Franklin's <strong>33</strong> <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> activities, and makes him become <strong>34</strong> <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span>. As a child, it is the quality of <strong>35</strong> <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span> that attracts Franklin to the Arctic.\n</p>\n</div>\n<div id=\"word-options\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"a bully\">A a bully</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"discoveries\">B discoveries</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"educational\">C educational</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"family\">D family</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"isolation\">E isolation</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"an outsider\">F an outsider</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"personality\">G personality</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"problems\">H problems</div>\n<div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-word=\"remoteness\">I remoteness</div>\n<div id=\"word-J\" class=\"draggable-word\" draggable=\"true\" data-word=\"a scholar\">J a scholar</div>\n<div id=\"word-K\" class=\"draggable-word\" draggable=\"true\" data-word=\"sporting\">K sporting</div>\n<div id=\"word-L\" class=\"draggable-word\" draggable=\"true\" data-word=\"timelessness\">L timelessness</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n                 <h4>Questions 36–40</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                \n                <div class=\"mcq-question\" style=\"margin-bottom: 20px;\">\n                    <p><strong>36</strong> In paragraph E, the writer describes different types of ice in order to illustrate</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input type=\"radio\" name=\"q10\" value=\"A\"> A the extreme conditions that Polar explorers have to face.</label></li>\n                        <li><label><input type=\"radio\" name=\"q10\" value=\"B\"> B the unusual quality of the beauty of Polar regions.</label></li>\n                        <li><label><input type=\"radio\" name=\"q10\" value=\"C\"> C the vital importance of preserving the Arctic environment.</label></li>\n                        <li><label><input type=\"radio\" name=\"q10\" value=\"D\"> D the personal qualities required of an explorer in Arctic conditions.</label></li>\n                    </ul>\n                </div>\n\n                <div class=\"mcq-question\" style=\"margin-bottom: 20px;\">\n                    <p><strong>37</strong> What is said about the way Franklin communicates?</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input type=\"radio\" name=\"q11\" value=\"A\"> A He expresses a very limited range of ideas.</label></li>\n                        <li><label><input type=\"radio\" name=\"q11\" value=\"B\"> B He is only willing to discuss things he is familiar with.</label></li>\n                        <li><label><input type=\"radio\" name=\"q11\" value=\"C\"> C He uses words and phrases that he has previously memorised.</label></li>\n                        <li><label><input type=\"radio\" name=\"q11\" value=\"D\"> D He is only fluent when talking about naval matters.</label></li>\n                    </ul>\n                </div>\n\n                <div class=\"mcq-question\" style=\"margin-bottom: 20px;\">\n                    <p><strong>38</strong> How does the attitude of the other sailors change towards Franklin?</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input type=\"radio\" name=\"q12\" value=\"A\"> A They no longer notice his slowness.</label></li>\n                        <li><label><input type=\"radio\" name=\"q12\" value=\"B\"> B They start to copy his approach to work.</label></li>\n                        <li><label><input type=\"radio\" name=\"q12\" value=\"C\"> C They begin to recognise his efforts to overcome his problems.</label></li>\n                        <li><label><input type=\"radio\" name=\"q12\" value=\"D\"> D They eventually appreciate his good qualities.</label></li>\n                    </ul>\n                </div>\n                \n                 <div class=\"mcq-question\" style=\"margin-bottom: 20px;\">\n                    <p><strong>39</strong> The chapters of The Discovery of Slowness which describe Franklin's early years contain</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input type=\"radio\" name=\"q13\" value=\"A\"> A text from a wide variety of sources.</label></li>\n                        <li><label><input type=\"radio\" name=\"q13\" value=\"B\"> B short, disconnected pieces of text.</label></li>\n                        <li><label><input type=\"radio\" name=\"q13\" value=\"C\"> C descriptions of the Arctic landscape.</label></li>\n                        <li><label><input type=\"radio\" name=\"q13\" value=\"D\"> D information about other explorers like Franklin.</label></li>\n                    </ul>\n                </div>\n\n                <div class=\"mcq-question\">\n                    <p><strong>40</strong> The Discovery of Slowness has achieved widespread popularity because</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input type=\"radio\" name=\"q14\" value=\"A\"> A it reflects many people's concern about one aspect of modern life.</label></li>\n                        <li><label><input type=\"radio\" name=\"q14\" value=\"B\"> B it offers achievable solutions to many of the problems of today.</label></li>\n                        <li><label><input type=\"radio\" name=\"q14\" value=\"C\"> C it tells the story of someone's triumph over personal problems.</label></li>\n                        <li><label><input type=\"radio\" name=\"q14\" value=\"D\"> D it shows how life in the past was less pressured than it is now.</label></li>\n                    </ul>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"mcq-question\" style=\"margin-bottom: 20px;\">\n<p><strong>36</strong> In paragraph E, the writer describes different types of ice in order to illustrate</p>\n<ul class=\"mcq-options\">\n<li><label><input type=\"radio\" name=\"q10\" value=\"A\"> A the extreme conditions that Polar explorers have to face.</label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"B\"> B the unusual quality of the beauty of Polar regions.</label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"C\"> C the vital importance of preserving the Arctic environment.</label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"D\"> D the personal qualities required of an explorer in Arctic conditions.</label></li>\n</ul>\n</div>\n<div class=\"mcq-question\" style=\"margin-bottom: 20px;\">\n<p><strong>37</strong> What is said about the way Franklin communicates?</p>\n<ul class=\"mcq-options\">\n<li><label><input type=\"radio\" name=\"q11\" value=\"A\"> A He expresses a very limited range of ideas.</label></li>\n<li><label><input type=\"radio\" name=\"q11\" value=\"B\"> B He is only willing to discuss things he is familiar with.</label></li>\n<li><label><input type=\"radio\" name=\"q11\" value=\"C\"> C He uses words and phrases that he has previously memorised.</label></li>\n<li><label><input type=\"radio\" name=\"q11\" value=\"D\"> D He is only fluent when talking about naval matters.</label></li>\n</ul>\n</div>\n<div class=\"mcq-question\" style=\"margin-bottom: 20px;\">\n<p><strong>38</strong> How does the attitude of the other sailors change towards Franklin?</p>\n<ul class=\"mcq-options\">\n<li><label><input type=\"radio\" name=\"q12\" value=\"A\"> A They no longer notice his slowness.</label></li>\n<li><label><input type=\"radio\" name=\"q12\" value=\"B\"> B They start to copy his approach to work.</label></li>\n<li><label><input type=\"radio\" name=\"q12\" value=\"C\"> C They begin to recognise his efforts to overcome his problems.</label></li>\n<li><label><input type=\"radio\" name=\"q12\" value=\"D\"> D They eventually appreciate his good qualities.</label></li>\n</ul>\n</div>\n<div class=\"mcq-question\" style=\"margin-bottom: 20px;\">\n<p><strong>39</strong> The chapters of The Discovery of Slowness which describe Franklin's early years contain</p>\n<ul class=\"mcq-options\">\n<li><label><input type=\"radio\" name=\"q13\" value=\"A\"> A text from a wide variety of sources.</label></li>\n<li><label><input type=\"radio\" name=\"q13\" value=\"B\"> B short, disconnected pieces of text.</label></li>\n<li><label><input type=\"radio\" name=\"q13\" value=\"C\"> C descriptions of the Arctic landscape.</label></li>\n<li><label><input type=\"radio\" name=\"q13\" value=\"D\"> D information about other explorers like Franklin.</label></li>\n</ul>\n</div>\n<div class=\"mcq-question\">\n<p><strong>40</strong> The Discovery of Slowness has achieved widespread popularity because</p>\n<ul class=\"mcq-options\">\n<li><label><input type=\"radio\" name=\"q14\" value=\"A\"> A it reflects many people's concern about one aspect of modern life.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"B\"> B it offers achievable solutions to many of the problems of today.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"C\"> C it tells the story of someone's triumph over personal problems.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"D\"> D it shows how life in the past was less pressured than it is now.</label></li>\n</ul>\n</div>\n</div>"
     }
   ],
   "answerKey": {
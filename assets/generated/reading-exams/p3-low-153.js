@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Crossing the Threshold</h3>\n            <h4>The renovated Auckland Art Gallery in New Zealand unites old and new, creating an irresistible urge to step inside</h4>\n            \n            <p>Architects are finding it very difficult in today's cultural landscape. The profession faces a three-way threat: a public that apparently doesn't understand what architects do, developers who couldn't care less what they do, and overbearing councils micromanaging every single aspect of what they do. According to sources within the architectural profession, the situation is much worse when architects work on municipal buildings, as architects FJMT and Archimedia discovered with their Auckland Gallery makeover, where a vast number of external pressures threatened the project, and with so many bureaucratic difficulties it looked doomed to fail.</p>\n            <p>The major challenge of the gallery renovation project was that it involved two parts. The first was to restore the heritage building, dating back to 1888, which contained a network of small spaces, refurbished so often it contained 17 different floor heights. The second was to deliver a new extension that would not only double floor and exhibition space but also attract new patrons, a total necessity. While the old building's circulation was off-putting, so was something intangible yet just as powerful: its atmosphere. For many, Auckland Art Gallery was just an old building that served a limited range of patrons with highbrow interests, missing its chance to engage with new audiences.</p>\n            <p>A 2003 survey of young people's impressions of the gallery confirmed this opinion, sounding more like references to an abandoned building. For the survey authors, ‘threshold fear' – where certain groups are intimidated from entering certain spaces by their off-putting atmosphere – was the institution's undoing, something no architect wants anything to do with. For those young people Auckland Art Gallery was undemocratic, ‘dusty' and 'cold' – the epitome of threshold fear. Also, 16 % of the sample group had no idea where it even was, despite being interviewed on the pavement right outside it. Clearly, the gallery was fatally out of step at a time when New Zealand's national museum in Wellington was successfully engaging broader audiences with contemporary branding and marketing, interactive displays and temporary events.</p>\n            <p>The decision to evolve the gallery was actually made in 2000, although it took eight years for building to commence, as the architects fought off heritage committees and conservationists trying to stop them. The architects were not just dealing with a disillusioned public, but also with precious timber and the parkland which surrounds the building. Pushing the design through the Environment Court, the body which approves renovations of this scale, alone took three years. During this time the budget blew out by several million dollars, the funding dried up, and the new wing had to be completely redesigned. Even after the redesign, the use of kauri timber, with its significance to New Zealand's Māori* people, stirred up political debate. In the new building the architects have used kauri to produce a canopy with a curving interior roof supported by tapered, steel columns, also clad in kauri. The canopy represents a stag in full public face, its curvature filtering light to the forecourt to the west and creating a visual echo of the canopy of pohutukawa trees in Albert Park to the east. The park also has cultural significance to Māori as it was the site of early settlements.</p>\n            <p>The connection is reinforced by sculptures from Māori artist Arnold Wilson decorating the columns, while fellow artist Bernard Makoare was a consultant, ensuring the gallery emphasised Māori beliefs. Still that didn't stop the conservationist Stephen King from accusing the architects of \"throwing\" kauri at a “mediocre building” and of misappropriating the ‘mana' (spiritual energy) of the precious material (which is almost extinct: harvesting of both petrified and swamp kauri has been likened to a gold rush). However, the kauri that was used here was from the forest floor, and King's misconceptions sum up the prejudice that surrounded the project.</p>\n            <p>Objections also came from the Auckland Regional Council, worrying about the extension's impact on Albert Park, yet the project's relationship with parkland is one of the most successful outcomes. Impact is not only minimal, but improves the park's social function. The extension's enormous glass atrium opens up the building by directing the gaze from street level to the parkland beyond, while inside, the new art space is fronted along the east by a continuous glass wall incorporating the park into the gallery. The glass becomes a ‘screen' for viewing the outside world and makes the art accessible to those in the park, a far cry from both ‘white cube' galleries worldwide – the plain boxes where paintings are hung in antiseptic white surroundings – and also the dusty, impermeable Auckland Gallery of old.</p>\n            <p>Another success is the refurbishment of the heritage building, especially the Mackelvie Gallery, in disrepair after its characteristic early-twentieth-century Edwardian decoration had been stripped out or walked away in previous renovations. Remarkably, the Mackelvie space has been reconstructed from two old photos, although the problem of multiple floor levels was so serious that scaffolding had to be erected at the highest level, with work progressing downwards, the reverse of normal practice. When it was over, a fascinating detail was retained: the lowest level visible under glass embedded in the new floor. The building itself is artwork, while elsewhere columns from the old gallery have been exposed in the walls of the new wing.</p>\n            <p>In 2008 the gallery averaged just 190,000 visitors annually. After reopening, it had 300,000 in five months. Cynics will chalk that up to novelty of the new, but the fact is the gallery is now an alluring cultural space which is crawling with young people.</p>\n            <p><sub>*Māori: an indigenous people who were already living in New Zealand when Europeans arrived</sub></p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Crossing the Threshold</h3>\n<h4>The renovated Auckland Art Gallery in New Zealand unites old and new, creating an irresistible urge to step inside</h4>\n<p>Architects are finding it very difficult in today's cultural landscape. The profession faces a three-way threat: a public that apparently doesn't understand what architects do, developers who couldn't care less what they do, and overbearing councils micromanaging every single aspect of what they do. According to sources within the architectural profession, the situation is much worse when architects work on municipal buildings, as architects FJMT and Archimedia discovered with their Auckland Gallery makeover, where a vast number of external pressures threatened the project, and with so many bureaucratic difficulties it looked doomed to fail.</p>\n<p>The major challenge of the gallery renovation project was that it involved two parts. The first was to restore the heritage building, dating back to 1888, which contained a network of small spaces, refurbished so often it contained 17 different floor heights. The second was to deliver a new extension that would not only double floor and exhibition space but also attract new patrons, a total necessity. While the old building's circulation was off-putting, so was something intangible yet just as powerful: its atmosphere. For many, Auckland Art Gallery was just an old building that served a limited range of patrons with highbrow interests, missing its chance to engage with new audiences.</p>\n<p>A 2003 survey of young people's impressions of the gallery confirmed this opinion, sounding more like references to an abandoned building. For the survey authors, ‘threshold fear' – where certain groups are intimidated from entering certain spaces by their off-putting atmosphere – was the institution's undoing, something no architect wants anything to do with. For those young people Auckland Art Gallery was undemocratic, ‘dusty' and 'cold' – the epitome of threshold fear. Also, 16 % of the sample group had no idea where it even was, despite being interviewed on the pavement right outside it. Clearly, the gallery was fatally out of step at a time when New Zealand's national museum in Wellington was successfully engaging broader audiences with contemporary branding and marketing, interactive displays and temporary events.</p>\n<p>The decision to evolve the gallery was actually made in 2000, although it took eight years for building to commence, as the architects fought off heritage committees and conservationists trying to stop them. The architects were not just dealing with a disillusioned public, but also with precious timber and the parkland which surrounds the building. Pushing the design through the Environment Court, the body which approves renovations of this scale, alone took three years. During this time the budget blew out by several million dollars, the funding dried up, and the new wing had to be completely redesigned. Even after the redesign, the use of kauri timber, with its significance to New Zealand's Māori* people, stirred up political debate. In the new building the architects have used kauri to produce a canopy with a curving interior roof supported by tapered, steel columns, also clad in kauri. The canopy represents a stag in full public face, its curvature filtering light to the forecourt to the west and creating a visual echo of the canopy of pohutukawa trees in Albert Park to the east. The park also has cultural significance to Māori as it was the site of early settlements.</p>\n<p>The connection is reinforced by sculptures from Māori artist Arnold Wilson decorating the columns, while fellow artist Bernard Makoare was a consultant, ensuring the gallery emphasised Māori beliefs. Still that didn't stop the conservationist Stephen King from accusing the architects of \"throwing\" kauri at a “mediocre building” and of misappropriating the ‘mana' (spiritual energy) of the precious material (which is almost extinct: harvesting of both petrified and swamp kauri has been likened to a gold rush). However, the kauri that was used here was from the forest floor, and King's misconceptions sum up the prejudice that surrounded the project.</p>\n<p>Objections also came from the Auckland Regional Council, worrying about the extension's impact on Albert Park, yet the project's relationship with parkland is one of the most successful outcomes. Impact is not only minimal, but improves the park's social function. The extension's enormous glass atrium opens up the building by directing the gaze from street level to the parkland beyond, while inside, the new art space is fronted along the east by a continuous glass wall incorporating the park into the gallery. The glass becomes a ‘screen' for viewing the outside world and makes the art accessible to those in the park, a far cry from both ‘white cube' galleries worldwide – the plain boxes where paintings are hung in antiseptic white surroundings – and also the dusty, impermeable Auckland Gallery of old.</p>\n<p>Another success is the refurbishment of the heritage building, especially the Mackelvie Gallery, in disrepair after its characteristic early-twentieth-century Edwardian decoration had been stripped out or walked away in previous renovations. Remarkably, the Mackelvie space has been reconstructed from two old photos, although the problem of multiple floor levels was so serious that scaffolding had to be erected at the highest level, with work progressing downwards, the reverse of normal practice. When it was over, a fascinating detail was retained: the lowest level visible under glass embedded in the new floor. The building itself is artwork, while elsewhere columns from the old gallery have been exposed in the walls of the new wing.</p>\n<p>In 2008 the gallery averaged just 190,000 visitors annually. After reopening, it had 300,000 in five months. Cynics will chalk that up to novelty of the new, but the fact is the gallery is now an alluring cultural space which is crawling with young people.</p>\n<p><sub>*Māori: an indigenous people who were already living in New Zealand when Europeans arrived</sub></p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 27–31</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>27</strong> What is the writer's main point in the first paragraph?</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A Criticism of architects by different groups is unfair.</label></li>\n                        <li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B The architectural profession is generally well respected.</label></li>\n                        <li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C The most difficult projects for architects are public buildings.</label></li>\n                        <li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D Failure to deliver buildings is a result of poor communication.</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> The Auckland Gallery project was particularly difficult because</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A the existing building was old and parts of it had fallen down.</label></li>\n                        <li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B there was a high number of floors in the building.</label></li>\n                        <li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C it needed to satisfy the requirements of the existing patrons.</label></li>\n                        <li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D it involved renovating the existing building and adding a new one.</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> What disturbing information did the architects find out from the survey of young people?</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A They did not visit the gallery because of the way it made them feel.</label></li>\n                        <li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B They thought that the gallery buildings were not in use.</label></li>\n                        <li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C The gallery had the reputation of being dirty.</label></li>\n                        <li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D They did not like the entrance.</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> What point is the writer making when he says that 16 % of the sample group did not know where the museum was?</p>\n                     <ul class=\"mcq-options\">\n                        <li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A Young people are not interested in galleries.</label></li>\n                        <li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B The gallery was not reaching out to involve young people.</label></li>\n                        <li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C The entrance to the gallery was not well signposted.</label></li>\n                        <li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D The location of the gallery was difficult to access.</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>31</strong> Māori artists were used on this project to</p>\n                     <ul class=\"mcq-options\">\n                        <li><label><input name=\"q5\" type=\"radio\" value=\"A\"> A satisfy the concerns of conservationists.</label></li>\n                        <li><label><input name=\"q5\" type=\"radio\" value=\"B\"> B protect sacred materials in the Albert Park site.</label></li>\n                        <li><label><input name=\"q5\" type=\"radio\" value=\"C\"> C make sure the gallery respects Māori culture.</label></li>\n                        <li><label><input name=\"q5\" type=\"radio\" value=\"D\"> D ensure that certain sources of kauri were not used.</label></li>\n                    </ul>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> What is the writer's main point in the first paragraph?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A Criticism of architects by different groups is unfair.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B The architectural profession is generally well respected.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C The most difficult projects for architects are public buildings.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D Failure to deliver buildings is a result of poor communication.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> The Auckland Gallery project was particularly difficult because</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A the existing building was old and parts of it had fallen down.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B there was a high number of floors in the building.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C it needed to satisfy the requirements of the existing patrons.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D it involved renovating the existing building and adding a new one.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> What disturbing information did the architects find out from the survey of young people?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A They did not visit the gallery because of the way it made them feel.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B They thought that the gallery buildings were not in use.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C The gallery had the reputation of being dirty.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D They did not like the entrance.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What point is the writer making when he says that 16 % of the sample group did not know where the museum was?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A Young people are not interested in galleries.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B The gallery was not reaching out to involve young people.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C The entrance to the gallery was not well signposted.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D The location of the gallery was difficult to access.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> Māori artists were used on this project to</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q5\" type=\"radio\" value=\"A\"> A satisfy the concerns of conservationists.</label></li>\n<li><label><input name=\"q5\" type=\"radio\" value=\"B\"> B protect sacred materials in the Albert Park site.</label></li>\n<li><label><input name=\"q5\" type=\"radio\" value=\"C\"> C make sure the gallery respects Māori culture.</label></li>\n<li><label><input name=\"q5\" type=\"radio\" value=\"D\"> D ensure that certain sources of kauri were not used.</label></li>\n</ul>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -48,7 +48,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-10-anchor\">\n                <h4>Questions 32–36</h4>\n                <p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n                <p>In boxes 32–36 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p><strong>32</strong> Before the renovation, the Auckland Art Gallery was regarded as an elitist institution.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> Stephen King's intervention in the project shows his understanding of the architects' use of kauri.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>34</strong> The way the building interacts with its surroundings is a triumph.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>35</strong> The glass screen along the east wall was one of the most costly items in the rebuild.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>36</strong> The design of the extension to the Auckland Art Gallery is similar to the design of 'white cube' galleries in other parts of the world.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-10-anchor\">\n<h4>Questions 32–36</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 32–36 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>32</strong> Before the renovation, the Auckland Art Gallery was regarded as an elitist institution.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Stephen King's intervention in the project shows his understanding of the architects' use of kauri.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> The way the building interacts with its surroundings is a triumph.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> The glass screen along the east wall was one of the most costly items in the rebuild.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> The design of the extension to the Auckland Art Gallery is similar to the design of 'white cube' galleries in other parts of the world.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n                 <h4>Questions 37–40</h4>\n                <p>Complete each sentence with the correct ending, <strong>A–F</strong>, below.</p>\n                <p>Write the correct letter, <strong>A–F</strong>, in boxes 37–40 on your answer sheet.</p>\n                <ul class=\"sentence-ending-options\">\n                    <li>resulted in work being done in the opposite direction to that usually followed.</li>\n                    <li>is more than cosmetic and has improved the circulation.</li>\n                    <li>was the clue to rebuilding the Mackelvie Gallery successfully.</li>\n                    <li>has resulted in the building itself becoming a work of art.</li>\n                    <li>means that you should be able to tell whether you are in the old wing or the new one.</li>\n                    <li>was the result of earlier attempts to modernise the building.</li>\n                </ul>\n\n                <div class=\"question-item\"><strong>37</strong> The destruction of Edwardian ornamentation <input type=\"text\" id=\"q37_input\" maxlength=\"1\" name=\"q11\"></div>\n                <div class=\"question-item\"><strong>38</strong> It is extraordinary that a limited number of photographs <input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\"></div>\n                <div class=\"question-item\"><strong>39</strong> The problem of having so many floor levels to deal with <input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\"></div>\n                <div class=\"question-item\"><strong>40</strong> The glass flooring in the Mackelvie Gallery which reveals old features <input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"></div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–F</strong>, below.</p>\n<p>Write the correct letter, <strong>A–F</strong>, in boxes 37–40 on your answer sheet.</p>\n<ul class=\"sentence-ending-options\">\n<li>resulted in work being done in the opposite direction to that usually followed.</li>\n<li>is more than cosmetic and has improved the circulation.</li>\n<li>was the clue to rebuilding the Mackelvie Gallery successfully.</li>\n<li>has resulted in the building itself becoming a work of art.</li>\n<li>means that you should be able to tell whether you are in the old wing or the new one.</li>\n<li>was the result of earlier attempts to modernise the building.</li>\n</ul>\n<div class=\"question-item\"><strong>37</strong> The destruction of Edwardian ornamentation <input type=\"text\" id=\"q37_input\" maxlength=\"1\" name=\"q11\"></div>\n<div class=\"question-item\"><strong>38</strong> It is extraordinary that a limited number of photographs <input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\"></div>\n<div class=\"question-item\"><strong>39</strong> The problem of having so many floor levels to deal with <input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\"></div>\n<div class=\"question-item\"><strong>40</strong> The glass flooring in the Mackelvie Gallery which reveals old features <input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"></div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Game theory</h3>\n            <h4>Computer software that models human behaviour can make forecasts, outsmart rivals and transform negotiations</h4>\n            \n            <p>According to game theory, our chances of success in negotiations are based on the choices of others. Computer models have been developed to work out how events will unfold as people and organisations act in what they perceive to be their own best interests. Numerical values are placed on the goals, motivations and influence of players, and likely options are considered. Game-theory software then evaluates the ability of each of those players to influence others, and hence predicts the course of events.</p>\n            <p>Although many individuals would feel uncomfortable having a computer make decisions for them, many organisations run such computer simulations for law firms, companies and governments. But feeding software with accurate data on all the players involved is especially tricky for political matters. Reinier van Oosten of Decide, a Dutch firm that models political negotiations, notes that predictions may become unreliable when people unexpectedly give in to 'non-rational emotions', such as hatred, rather than pursuing what is apparently in their best interests. However, sorting out people's motivations is much easier when making money is the main object. Accordingly, modelling behaviour using game theory is proving especially useful when applied to economics.</p>\n            <p>Using game-theory software to model auctions can be very lucrative. Consulting firms are entering the market to help clients design profitable auctions, or to win them less expensively. In 2006, in the run-up to an online auction of radio-spectrum licences by America's Federal Communications Commission, Dr Paul Milgrom, a consultant and Stanford University professor in the United States, customised his game-theory software to assist a consortium of bidders. He was apprehensive at first, but the result was a triumph. When the auction began, Milgrom's software tracked competitors' bids to estimate their budgets for the 1,132 licences on offer. Crucially, the software estimated the secret values bidders placed on specific licences, and determined that certain big licences were being over-valued. Milgrom's clients were then directed to obtain a collection of smaller, less-expensive licences instead. Two of his clients paid about a third less than their competitors for an equivalent amount of spectrum, saving almost $1.2 billion. Such a saving makes one wonder why everyone isn't using game-theory software. And, if they were, how would that affect the game?</p>\n            <p>PA Consulting, a British firm, designs models for software based on game theory to help its clients solve specific problems in areas from pharmaceuticals to the production of television shows. British government agencies have asked PA Consulting to build models to test zoning rules that govern how many of a certain type of business should be allowed to operate in one area. To give a simple example: if two competing ice-cream sellers share a long beach, they will set up stalls back-to-back in the middle and stay put, explains Dr Stephen Black, a modeller for PA. Unfortunately for potential customers at the far ends of the beach, each seller prevents the other from relocating—no other spot would be closer to more people. Introduce a third seller, however, and the stifling equilibrium is broken as relocations and pricing changes energise the market. By studying a chain of events such as this, software designers can assess the effect of change and see the patterns in possible outcomes that may occur. As a result, the use of modelling makes clients more inclined to look at future repercussions when making business decisions, Black says.</p>\n            <p>Where is all this heading? Alongside the increasingly elaborate modelling software, there are also efforts to develop software that can assist in negotiation and mediation. Two decades ago, Dr Clara Ponsatí, a Spanish academic, came up with a clever idea. She accepted that, as negotiators everywhere know, the first side to disclose the maximum amount that it is willing to pay loses considerable bargaining power. Without leverage, it can be pushed backward in the bargaining process by a clever opponent. But if neither side reveals the concessions it is prepared to make, negotiations can become very slow or collapse. However, difficult negotiations can often be pushed along by neutral mediators, especially if they are entrusted with the secret bottom lines of all parties. Ponsatí's idea was that if a human mediator was not trusted, affordable or available, a computer could do the job instead. Negotiating parties would update the software with the confidential information on their bargaining positions after each round of talks. Once positions on both sides were no longer mutually exclusive, the software would be used to split the difference and propose an agreement. Ponsatí, now head of the Institute of Economic Analysis at the Autonomous University of Barcelona in Spain, says such ‘mediation machines' could be employed to push negotiations forward by unlocking information that would otherwise be withheld from an opponent.</p>\n            <p>Could mediation which has been achieved using software based on game theory spread from auction bids and utility pricing to resolving political and military disputes? Today's game-theory software is not yet sufficiently advanced to mediate between warring countries. But one day opponents on the brink of war might be tempted to use it to exchange information without having to engage in conflict. According to some game theorists, opponents could learn how a war would turn out, skip the fighting and strike a deal. Over-optimistic, perhaps—but game theorists do have rather an impressive track record when it comes to predicting the future.</p>\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>Game theory</h3>\n<h4>Computer software that models human behaviour can make forecasts, outsmart rivals and transform negotiations</h4>\n<p>According to game theory, our chances of success in negotiations are based on the choices of others. Computer models have been developed to work out how events will unfold as people and organisations act in what they perceive to be their own best interests. Numerical values are placed on the goals, motivations and influence of players, and likely options are considered. Game-theory software then evaluates the ability of each of those players to influence others, and hence predicts the course of events.</p>\n<p>Although many individuals would feel uncomfortable having a computer make decisions for them, many organisations run such computer simulations for law firms, companies and governments. But feeding software with accurate data on all the players involved is especially tricky for political matters. Reinier van Oosten of Decide, a Dutch firm that models political negotiations, notes that predictions may become unreliable when people unexpectedly give in to 'non-rational emotions', such as hatred, rather than pursuing what is apparently in their best interests. However, sorting out people's motivations is much easier when making money is the main object. Accordingly, modelling behaviour using game theory is proving especially useful when applied to economics.</p>\n<p>Using game-theory software to model auctions can be very lucrative. Consulting firms are entering the market to help clients design profitable auctions, or to win them less expensively. In 2006, in the run-up to an online auction of radio-spectrum licences by America's Federal Communications Commission, Dr Paul Milgrom, a consultant and Stanford University professor in the United States, customised his game-theory software to assist a consortium of bidders. He was apprehensive at first, but the result was a triumph. When the auction began, Milgrom's software tracked competitors' bids to estimate their budgets for the 1,132 licences on offer. Crucially, the software estimated the secret values bidders placed on specific licences, and determined that certain big licences were being over-valued. Milgrom's clients were then directed to obtain a collection of smaller, less-expensive licences instead. Two of his clients paid about a third less than their competitors for an equivalent amount of spectrum, saving almost $1.2 billion. Such a saving makes one wonder why everyone isn't using game-theory software. And, if they were, how would that affect the game?</p>\n<p>PA Consulting, a British firm, designs models for software based on game theory to help its clients solve specific problems in areas from pharmaceuticals to the production of television shows. British government agencies have asked PA Consulting to build models to test zoning rules that govern how many of a certain type of business should be allowed to operate in one area. To give a simple example: if two competing ice-cream sellers share a long beach, they will set up stalls back-to-back in the middle and stay put, explains Dr Stephen Black, a modeller for PA. Unfortunately for potential customers at the far ends of the beach, each seller prevents the other from relocating—no other spot would be closer to more people. Introduce a third seller, however, and the stifling equilibrium is broken as relocations and pricing changes energise the market. By studying a chain of events such as this, software designers can assess the effect of change and see the patterns in possible outcomes that may occur. As a result, the use of modelling makes clients more inclined to look at future repercussions when making business decisions, Black says.</p>\n<p>Where is all this heading? Alongside the increasingly elaborate modelling software, there are also efforts to develop software that can assist in negotiation and mediation. Two decades ago, Dr Clara Ponsatí, a Spanish academic, came up with a clever idea. She accepted that, as negotiators everywhere know, the first side to disclose the maximum amount that it is willing to pay loses considerable bargaining power. Without leverage, it can be pushed backward in the bargaining process by a clever opponent. But if neither side reveals the concessions it is prepared to make, negotiations can become very slow or collapse. However, difficult negotiations can often be pushed along by neutral mediators, especially if they are entrusted with the secret bottom lines of all parties. Ponsatí's idea was that if a human mediator was not trusted, affordable or available, a computer could do the job instead. Negotiating parties would update the software with the confidential information on their bargaining positions after each round of talks. Once positions on both sides were no longer mutually exclusive, the software would be used to split the difference and propose an agreement. Ponsatí, now head of the Institute of Economic Analysis at the Autonomous University of Barcelona in Spain, says such ‘mediation machines' could be employed to push negotiations forward by unlocking information that would otherwise be withheld from an opponent.</p>\n<p>Could mediation which has been achieved using software based on game theory spread from auction bids and utility pricing to resolving political and military disputes? Today's game-theory software is not yet sufficiently advanced to mediate between warring countries. But one day opponents on the brink of war might be tempted to use it to exchange information without having to engage in conflict. According to some game theorists, opponents could learn how a war would turn out, skip the fighting and strike a deal. Over-optimistic, perhaps—but game theorists do have rather an impressive track record when it comes to predicting the future.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 27–31</h4>\n                <p>Choose the correct letter A, B, C or D.</p>\n                \n                <div class=\"question-item\">\n                    <p><strong>27</strong> What does the writer suggest about game-theory software in the first paragraph?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"A\"> A Traditional negotiating practices should be used to supplement the software.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"B\"> B Success of the software depends on the accuracy of the assigned values.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"C\"> C This software anticipates the outcome of future events.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"D\"> D Future business negotiations will be dominated by this software.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> Reinier van Oosten says predicting what people will do works best if</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"A\"> A participants are honest about how they feel.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"B\"> B there is a good understanding of the client's culture.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"C\"> C people strongly dislike the other party.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"D\"> D profit is the primary motivator.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> After using game-theory software in 2006, Dr Milgrom instructed his clients to</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"A\"> A buy big licences.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"B\"> B negotiate with the other parties directly.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"C\"> C make one big offer at the end of the auction.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"D\"> D purchase a mix of licences.</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>30</strong> The writer refers to Stephen Black's ice-cream-seller example in order to</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"A\"> A show the impact new competitors have on business.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"B\"> B highlight the importance of location on business success.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"C\"> C demonstrate that businesses must follow a strategy.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"D\"> D clarify how pricing affects sales.</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>31</strong> Ponsatí believes business negotiations are more likely to progress if</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"A\"> A a solution is proposed by one of the interested parties.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"B\"> B mediators or computers take over the bargaining process.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"C\"> C both parties follow the rules of negotiating.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"D\"> D sufficient time is allowed for the bargaining process.</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter A, B, C or D.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> What does the writer suggest about game-theory software in the first paragraph?</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A Traditional negotiating practices should be used to supplement the software.</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B Success of the software depends on the accuracy of the assigned values.</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C This software anticipates the outcome of future events.</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D Future business negotiations will be dominated by this software.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Reinier van Oosten says predicting what people will do works best if</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A participants are honest about how they feel.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B there is a good understanding of the client's culture.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C people strongly dislike the other party.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D profit is the primary motivator.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> After using game-theory software in 2006, Dr Milgrom instructed his clients to</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A buy big licences.</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B negotiate with the other parties directly.</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C make one big offer at the end of the auction.</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D purchase a mix of licences.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> The writer refers to Stephen Black's ice-cream-seller example in order to</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A show the impact new competitors have on business.</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B highlight the importance of location on business success.</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C demonstrate that businesses must follow a strategy.</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D clarify how pricing affects sales.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> Ponsatí believes business negotiations are more likely to progress if</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"> A a solution is proposed by one of the interested parties.</label> <label><input name=\"q5\" type=\"radio\" value=\"B\"> B mediators or computers take over the bargaining process.</label> <label><input name=\"q5\" type=\"radio\" value=\"C\"> C both parties follow the rules of negotiating.</label> <label><input name=\"q5\" type=\"radio\" value=\"D\"> D sufficient time is allowed for the bargaining process.</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n                <h4>Questions 32–35</h4>\n                <p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n                <p>Write:</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                \n                <div class=\"question-item\">\n                    <p><strong>32</strong> Game-theory software may be unhelpful when dealing with political issues.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> Dr Milgrom was confident about applying his software to an auction in 2006.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>34</strong> Dr Ponsatí believes ‘mediation machines' are an inappropriate method of negotiation in areas other than business.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>35</strong> Military organisations refuse to accept that software based on game theory could prevent wars.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>Write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>32</strong> Game-theory software may be unhelpful when dealing with political issues.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Dr Milgrom was confident about applying his software to an auction in 2006.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Dr Ponsatí believes ‘mediation machines' are an inappropriate method of negotiation in areas other than business.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Military organisations refuse to accept that software based on game theory could prevent wars.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n                <h4>Questions 36–40</h4>\n                <p>Complete each sentence with the correct ending, <strong>A-F</strong>, below.</p>\n                <div class=\"question-item\">\n                    <p><strong>36</strong> According to Reinier van Oosten, game-theory software fails when</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q10\" type=\"radio\" value=\"A\"> A</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"B\"> B</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"C\"> C</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"D\"> D</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"E\"> E</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"F\"> F</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>37</strong> Dr Milgrom's software is successful in detecting if</p>\n                     <div class=\"radio-options\">\n                        <label><input name=\"q11\" type=\"radio\" value=\"A\"> A</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"B\"> B</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"C\"> C</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"D\"> D</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"E\"> E</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"F\"> F</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>38</strong> Dr Black's game-theory software is a helpful tool when</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q12\" type=\"radio\" value=\"A\"> A</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"B\"> B</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"C\"> C</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"D\"> D</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"E\"> E</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"F\"> F</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>39</strong> According to Dr Ponsatí, negotiators fall behind if</p>\n                     <div class=\"radio-options\">\n                        <label><input name=\"q13\" type=\"radio\" value=\"A\"> A</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"B\"> B</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"C\"> C</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"D\"> D</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"E\"> E</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"F\"> F</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>40</strong> Dr Ponsatí's mediation machine is useful when</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q14\" type=\"radio\" value=\"A\"> A</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"B\"> B</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"C\"> C</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"D\"> D</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"E\"> E</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"F\"> F</label>\n                    </div>\n                </div>\n                <div class=\"sentence-completion-options\">\n                    <ul class=\"question-options-list\">\n                        <li><strong>A</strong> something is thought to be worth more than it really is</li>\n                        <li><strong>B</strong> discussions between the parties begin to break down</li>\n                        <li><strong>C</strong> too much information is given to the other parties early on</li>\n                        <li><strong>D</strong> businesses consider possible future developments</li>\n                        <li><strong>E</strong> people allow their feelings to influence decisions</li>\n                        <li><strong>F</strong> a solution requires face-to-face negotiation</li>\n                    </ul>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A-F</strong>, below.</p>\n<div class=\"question-item\">\n<p><strong>36</strong> According to Reinier van Oosten, game-theory software fails when</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q10\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q10\" type=\"radio\" value=\"C\"> C</label> <label><input name=\"q10\" type=\"radio\" value=\"D\"> D</label> <label><input name=\"q10\" type=\"radio\" value=\"E\"> E</label> <label><input name=\"q10\" type=\"radio\" value=\"F\"> F</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> Dr Milgrom's software is successful in detecting if</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q11\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q11\" type=\"radio\" value=\"C\"> C</label> <label><input name=\"q11\" type=\"radio\" value=\"D\"> D</label> <label><input name=\"q11\" type=\"radio\" value=\"E\"> E</label> <label><input name=\"q11\" type=\"radio\" value=\"F\"> F</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> Dr Black's game-theory software is a helpful tool when</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q12\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q12\" type=\"radio\" value=\"C\"> C</label> <label><input name=\"q12\" type=\"radio\" value=\"D\"> D</label> <label><input name=\"q12\" type=\"radio\" value=\"E\"> E</label> <label><input name=\"q12\" type=\"radio\" value=\"F\"> F</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> According to Dr Ponsatí, negotiators fall behind if</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q13\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q13\" type=\"radio\" value=\"C\"> C</label> <label><input name=\"q13\" type=\"radio\" value=\"D\"> D</label> <label><input name=\"q13\" type=\"radio\" value=\"E\"> E</label> <label><input name=\"q13\" type=\"radio\" value=\"F\"> F</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> Dr Ponsatí's mediation machine is useful when</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q14\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q14\" type=\"radio\" value=\"C\"> C</label> <label><input name=\"q14\" type=\"radio\" value=\"D\"> D</label> <label><input name=\"q14\" type=\"radio\" value=\"E\"> E</label> <label><input name=\"q14\" type=\"radio\" value=\"F\"> F</label>\n</div>\n</div>\n<div class=\"sentence-completion-options\">\n<ul class=\"question-options-list\">\n<li><strong>A</strong> something is thought to be worth more than it really is</li>\n<li><strong>B</strong> discussions between the parties begin to break down</li>\n<li><strong>C</strong> too much information is given to the other parties early on</li>\n<li><strong>D</strong> businesses consider possible future developments</li>\n<li><strong>E</strong> people allow their feelings to influence decisions</li>\n<li><strong>F</strong> a solution requires face-to-face negotiation</li>\n</ul>\n</div>\n</div>"
     }
   ],
   "answerKey": {
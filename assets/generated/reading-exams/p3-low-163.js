@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Keeping the Fun in Funfairs</h3>\n\n            <p><strong>A</strong> Fun is becoming a tricky issue for ride designers. In order to increase excitement, they have been ramping up the accelerations to create the most dizzying forces possible. But getting it right is far from easy. Err on the side of caution and people won't bother with a second ride; go too far, however, and they may not be able to. Experts realise we are now at the limit of how much acceleration a human body can take, and designers are finding it hard to think up ways of keeping the public coming back for more. The problem is that true innovation has been lacking for a while, and fair-ground rides have become more about survival than actual enjoyment. So if our thrill-seeking bodies can really take no more, what's going to keep dragging us back to amusement parks? Creating something new and exciting, yet safe, is going to take some careful thought.</p>\n\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"B\" id=\"q1-dropzone\" data-question=\"q1\">\n                    <span class=\"paragraph-label\">Paragraph B (Q27):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>B</strong> When the Disney Corporation asked German designer Walter Stengel to design a giant loop ride for them in the 1970s, he went to NASA, the aeronautics and space administration, to discover the effects of sustained acceleration on pilots. NASA's research suggests that the maximum level we can endure is 9 g (g is the standard unit of acceleration due to gravity). Go much beyond that and pilots pass out; go further still and they suffer serious internal damage. So Stengel decided that the maximum vertical acceleration for the public should be 6 g, and then only for a second or so. What's more, he put firm restrictions on the rate at which acceleration can increase – you'll never go down a 45-degree ramp into a tight circular loop, for instance.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"C\" id=\"q2-dropzone\" data-question=\"q2\">\n                    <span class=\"paragraph-label\">Paragraph C (Q28):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>C</strong> But stricter safety limits only intensify the need to search for novel ways to thrill customers. Part of the problem is that no matter how exciting an attraction is, after a few rides passengers will have some idea of what to expect. The next stage in designing rides, however, could throw predictability out of the window. This step has already been taken in the most recent waltzers (or tea-cup rides). Ride a waltzer and you sit in a car that spins on its own axis; the car is on a huge platform that also rotates. In the past you could take comfort from the fact that the spin was tightly controlled by gears that turned your car at a rate determined by the rotation speed of the whole ride. But the latest generation of waltzer cars spin freely, at a rate determined by the weight and position of the people in them. So you never have the same experience twice. \"People seem to like these ‘chaotic rides',\" says Stengel.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"D\" id=\"q3-dropzone\" data-question=\"q3\">\n                    <span class=\"paragraph-label\">Paragraph D (Q29):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>D</strong> Although seemingly a passport to endless thrills, chaos does have one rather obvious drawback – it's unpredictable. Despite complex calculations, designers can never be completely sure that something odd won't happen, especially since freely turning systems occasionally hit a resonance frequency. For example, if pushed at a particular frequency, a child on a swing would go over the top of the swing's frame. Similarly, if you drive a revolving waltzer car at its resonance frequency it could speed up uncontrollably. This could be very hazardous, according to Stengel. If a ride is subjected to unforeseen stresses, no one can guarantee that it will be able to cope.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                 <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"E\" id=\"q4-dropzone\" data-question=\"q4\">\n                    <span class=\"paragraph-label\">Paragraph E (Q30):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>E</strong> No one even knows what the safe limits of rotational force are, let alone its effect on the human body. Stengel has worked with the German Air Force, rotating volunteers head over heels while also making them cartwheel or pirouette like ballet dancers. It emerged that if the pilots were turned on all three axes simultaneously, they became so nauseous they almost blacked out, and when they got off they couldn't walk. But what Stengel found particularly puzzling was that they also developed headaches and other problems about two days later. Since these effects aren't understood, he tries to limit how people on his rides are rotated. People want to enjoy fun, not pain.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                 <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"F\" id=\"q5-dropzone\" data-question=\"q5\">\n                    <span class=\"paragraph-label\">Paragraph F (Q31):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>F</strong> With that goal in mind, Stengel feels that flinging people around in ever more chaotic machines is no longer the way forward. He believes that the sequence of accelerations, not their size, is what counts and that the way to make rides more fun is to put people through a carefully designed succession of relatively small accelerations. Other experts in this field agree, and it seems likely that designers could formulate profiles even for existing attractions that would lead to higher amusement value. Recent experiments testing the tolerances of Dutch military pilots to a range of accelerations have shown that tumbling around in machines doesn't have to be unpleasant – when the force is kept low, the subjects actually enjoy the experience.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                 <div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"G\" id=\"q6-dropzone\" data-question=\"q6\">\n                    <span class=\"paragraph-label\">Paragraph G (Q32):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>G</strong> The fun seems to come from the unforeseen, particularly when an effect called the Coriolis illusion comes into play. This is an agreeable tumbling feeling which occurs, for example, when the head is suddenly tilted while the subject is spinning with eyes closed. It appears that a roll which includes, for instance, an unexpected change of acceleration from a small negative g – a feeling of weightlessness – to a small positive g – a slight crushing sensation – has an extraordinary effect on people. If the theories of Stengel and other experts really do work, fair-ground fun might one day be measured in smiles, not screams.</p>\n            </div>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Keeping the Fun in Funfairs</h3>\n<p><strong>A</strong> Fun is becoming a tricky issue for ride designers. In order to increase excitement, they have been ramping up the accelerations to create the most dizzying forces possible. But getting it right is far from easy. Err on the side of caution and people won't bother with a second ride; go too far, however, and they may not be able to. Experts realise we are now at the limit of how much acceleration a human body can take, and designers are finding it hard to think up ways of keeping the public coming back for more. The problem is that true innovation has been lacking for a while, and fair-ground rides have become more about survival than actual enjoyment. So if our thrill-seeking bodies can really take no more, what's going to keep dragging us back to amusement parks? Creating something new and exciting, yet safe, is going to take some careful thought.</p>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"B\" id=\"q1-dropzone\" data-question=\"q1\">\n<span class=\"paragraph-label\">Paragraph B (Q27):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> When the Disney Corporation asked German designer Walter Stengel to design a giant loop ride for them in the 1970s, he went to NASA, the aeronautics and space administration, to discover the effects of sustained acceleration on pilots. NASA's research suggests that the maximum level we can endure is 9 g (g is the standard unit of acceleration due to gravity). Go much beyond that and pilots pass out; go further still and they suffer serious internal damage. So Stengel decided that the maximum vertical acceleration for the public should be 6 g, and then only for a second or so. What's more, he put firm restrictions on the rate at which acceleration can increase – you'll never go down a 45-degree ramp into a tight circular loop, for instance.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"C\" id=\"q2-dropzone\" data-question=\"q2\">\n<span class=\"paragraph-label\">Paragraph C (Q28):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> But stricter safety limits only intensify the need to search for novel ways to thrill customers. Part of the problem is that no matter how exciting an attraction is, after a few rides passengers will have some idea of what to expect. The next stage in designing rides, however, could throw predictability out of the window. This step has already been taken in the most recent waltzers (or tea-cup rides). Ride a waltzer and you sit in a car that spins on its own axis; the car is on a huge platform that also rotates. In the past you could take comfort from the fact that the spin was tightly controlled by gears that turned your car at a rate determined by the rotation speed of the whole ride. But the latest generation of waltzer cars spin freely, at a rate determined by the weight and position of the people in them. So you never have the same experience twice. \"People seem to like these ‘chaotic rides',\" says Stengel.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"D\" id=\"q3-dropzone\" data-question=\"q3\">\n<span class=\"paragraph-label\">Paragraph D (Q29):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> Although seemingly a passport to endless thrills, chaos does have one rather obvious drawback – it's unpredictable. Despite complex calculations, designers can never be completely sure that something odd won't happen, especially since freely turning systems occasionally hit a resonance frequency. For example, if pushed at a particular frequency, a child on a swing would go over the top of the swing's frame. Similarly, if you drive a revolving waltzer car at its resonance frequency it could speed up uncontrollably. This could be very hazardous, according to Stengel. If a ride is subjected to unforeseen stresses, no one can guarantee that it will be able to cope.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"E\" id=\"q4-dropzone\" data-question=\"q4\">\n<span class=\"paragraph-label\">Paragraph E (Q30):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> No one even knows what the safe limits of rotational force are, let alone its effect on the human body. Stengel has worked with the German Air Force, rotating volunteers head over heels while also making them cartwheel or pirouette like ballet dancers. It emerged that if the pilots were turned on all three axes simultaneously, they became so nauseous they almost blacked out, and when they got off they couldn't walk. But what Stengel found particularly puzzling was that they also developed headaches and other problems about two days later. Since these effects aren't understood, he tries to limit how people on his rides are rotated. People want to enjoy fun, not pain.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"F\" id=\"q5-dropzone\" data-question=\"q5\">\n<span class=\"paragraph-label\">Paragraph F (Q31):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> With that goal in mind, Stengel feels that flinging people around in ever more chaotic machines is no longer the way forward. He believes that the sequence of accelerations, not their size, is what counts and that the way to make rides more fun is to put people through a carefully designed succession of relatively small accelerations. Other experts in this field agree, and it seems likely that designers could formulate profiles even for existing attractions that would lead to higher amusement value. Recent experiments testing the tolerances of Dutch military pilots to a range of accelerations have shown that tumbling around in machines doesn't have to be unpleasant – when the force is kept low, the subjects actually enjoy the experience.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-dropzone match-dropzone\" data-paragraph=\"G\" id=\"q6-dropzone\" data-question=\"q6\">\n<span class=\"paragraph-label\">Paragraph G (Q32):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>G</strong> The fun seems to come from the unforeseen, particularly when an effect called the Coriolis illusion comes into play. This is an agreeable tumbling feeling which occurs, for example, when the head is suddenly tilted while the subject is spinning with eyes closed. It appears that a roll which includes, for instance, an unexpected change of acceleration from a small negative g – a feeling of weightlessness – to a small positive g – a slight crushing sensation – has an extraordinary effect on people. If the theories of Stengel and other experts really do work, fair-ground fun might one day be measured in smiles, not screams.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                <h4>Questions 27–32</h4>\n                <p>Reading Passage 3 has seven paragraphs A–G.</p>\n                <p>Choose the correct heading for paragraphs B–G from the list of headings below.</p>\n                <p><em>Drag a heading from this list and drop it onto the correct paragraph's answer box on the left. (Example for Para A is vii)</em></p>\n                <div class=\"headings-pool\" id=\"headings-pool-container\">\n                    <strong>List of Headings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i Less is more</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Research can't guarantee safety</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii Unexplained symptoms</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv Setting the limits of acceleration</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v The irresistible appeal of speed</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi Gentle surprises</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii A difficult task</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii A different ride every time</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p>Reading Passage 3 has seven paragraphs A–G.</p>\n<p>Choose the correct heading for paragraphs B–G from the list of headings below.</p>\n<p><em>Drag a heading from this list and drop it onto the correct paragraph's answer box on the left. (Example for Para A is vii)</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i Less is more</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii Research can't guarantee safety</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii Unexplained symptoms</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv Setting the limits of acceleration</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v The irresistible appeal of speed</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi Gentle surprises</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii A difficult task</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii A different ride every time</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -50,7 +50,7 @@
         "q10",
         "q11"
       ],
-      "bodyHtml": "<div class=\"group\">\n                <h4>Questions 33–37</h4>\n                <p>Complete the sentences below.</p>\n                <p>Choose <strong>NO MORE THAN THREE WORDS AND/OR A NUMBER</strong> from the passage for each answer.</p>\n                <div class=\"question-item\" id=\"q7-anchor\">\n                    <p><strong>33</strong> Some attractions, such as the new type of waltzers, depend on both the <input class=\"blank\" name=\"q7\" style=\"min-width: 250px;\"> and of their passengers in order to create a variety of ride experiences.</p>\n                </div>\n                <div class=\"question-item\" id=\"q8-anchor\">\n                    <p><strong>34</strong> Designers need to be aware that a “chaotic” ride could accelerate at a violent rate if it reaches its <input class=\"blank\" name=\"q8\">.</p>\n                </div>\n                <div class=\"question-item\" id=\"q9-anchor\">\n                    <p><strong>35</strong> Research has shown that people will begin to feel ill if they are subjected to movement on all <input class=\"blank\" name=\"q9\"> at the same time.</p>\n                </div>\n                <div class=\"question-item\" id=\"q10-anchor\">\n                    <p><strong>36</strong> Volunteers in Stengel's rotation tests suffered delayed reactions such as <input class=\"blank\" name=\"q10\">.</p>\n                </div>\n                <div class=\"question-item\" id=\"q11-anchor\">\n                    <p><strong>37</strong> A phenomenon known as the <input class=\"blank\" name=\"q11\"> produced a pleasurable sensation in test subjects.</p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 33–37</h4>\n<p>Complete the sentences below.</p>\n<p>Choose <strong>NO MORE THAN THREE WORDS AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"question-item\" id=\"q7-anchor\">\n<p><strong>33</strong> Some attractions, such as the new type of waltzers, depend on both the <input class=\"blank\" name=\"q7\" style=\"min-width: 250px;\"> and of their passengers in order to create a variety of ride experiences.</p>\n</div>\n<div class=\"question-item\" id=\"q8-anchor\">\n<p><strong>34</strong> Designers need to be aware that a “chaotic” ride could accelerate at a violent rate if it reaches its <input class=\"blank\" name=\"q8\">.</p>\n</div>\n<div class=\"question-item\" id=\"q9-anchor\">\n<p><strong>35</strong> Research has shown that people will begin to feel ill if they are subjected to movement on all <input class=\"blank\" name=\"q9\"> at the same time.</p>\n</div>\n<div class=\"question-item\" id=\"q10-anchor\">\n<p><strong>36</strong> Volunteers in Stengel's rotation tests suffered delayed reactions such as <input class=\"blank\" name=\"q10\">.</p>\n</div>\n<div class=\"question-item\" id=\"q11-anchor\">\n<p><strong>37</strong> A phenomenon known as the <input class=\"blank\" name=\"q11\"> produced a pleasurable sensation in test subjects.</p>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -60,7 +60,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\">\n                <h4>Questions 38–40</h4>\n                <p>Do the following statements agree with the claims of the writer of Reading Passage 3?</p>\n                <p>In boxes 38-40 on your answer sheet, write</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                \n                <div class=\"question-item\" id=\"q12-anchor\">\n                    <p><strong>38</strong> There is still a lot to be learnt about the rates of acceleration that people can withstand.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                \n                <div class=\"question-item\" id=\"q13-anchor\">\n                    <p><strong>39</strong> Children enjoy funfairs more than adults.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n\n                <div class=\"question-item\" id=\"q14-anchor\">\n                    <p><strong>40</strong> Current rides could probably be adapted to become more enjoyable.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 38–40</h4>\n<p>Do the following statements agree with the claims of the writer of Reading Passage 3?</p>\n<p>In boxes 38-40 on your answer sheet, write</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\" id=\"q12-anchor\">\n<p><strong>38</strong> There is still a lot to be learnt about the rates of acceleration that people can withstand.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q13-anchor\">\n<p><strong>39</strong> Children enjoy funfairs more than adults.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q14-anchor\">\n<p><strong>40</strong> Current rides could probably be adapted to become more enjoyable.</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Let's teach them how to teach</h3>\n            <h4>What matters in schools is teaching. Fortunately, teaching can be taught</h4>\n            \n            <p>Forget smart uniforms and small classes. The secret to stellar grades and thriving students is teachers. One US study found that in a single year's teaching the top 10% of teachers impart three times as much learning to their pupils as the worst 10% do. Another US study suggests that if black pupils were taught by the best quarter of teachers, the gap between their achievement and that of white pupils would disappear. But efforts to ensure that every teacher can teach are hindered by the persistent myth that good teachers are born, not made. Government policies, which often start from the same assumption, seek to raise teaching standards by attracting high-flying graduates to join the profession and prodding bad teachers to leave. Teachers' unions, meanwhile, insist that if only their members were free from centralised policies, excellence would follow.</p>\n            <p>The premise that teaching ability is something you either have or don't is mistaken. A new breed of teacher trainers is founding a rigorous science of pedagogy. The aim is to make ordinary teachers great, just as sports coaches help athletes of all abilities to improve their personal best. Done right, this will revolutionise schools and change lives.</p>\n            <p>Education has a history of lurching from one ‘miracle' solution to the next. The best of them even achieve some good. The US initiative Teach for America has brought energetic new graduates into the profession, and dismissing teachers for bad performance has boosted results in Washington, DC. But each approach has its limits. Teaching is a mass profession: it cannot grab all the top graduates, year after year. When poor teachers are fired, new ones are needed – and they will have come through the same educational system that failed to make fine teachers of their predecessors.</p>\n            <p>By contrast, the idea of improving the average teacher could revolutionise the entire profession. Around the world, few newly qualified teachers are well enough prepared for the classroom. A recent report found 31 countries in which more than a quarter of primary-school teachers had not reached minimal national standards. In rich countries, the problem is subtler. Teachers qualify after completing a long, specialised course, which almost always involves superficial and seemingly useless discussions of theory. Some of these courses, including master's degrees in education, have no effect on how well their graduates' pupils end up being taught.</p>\n            <p>What teachers fail to learn in universities and teacher-training colleges they rarely pick up on the job. They become better teachers in their first few years as they get to grips with real pupils in real classrooms, but after that improvements tail off. This is largely because schools neglect their most important learners: teachers themselves. Across the Organisation for Economic Cooperation and Development (OECD) club of mostly rich countries, two-fifths of teachers say they have never had a chance to learn by sitting in on another teacher's lessons; nor have they been asked to give feedback on their peers.</p>\n            <p>If this is to change, teachers need to learn how to impart knowledge and prepare young minds to receive and retain it. Good teachers set clear goals, enforce high standards of behaviour and manage their lesson time wisely. They use tried-and-tested instructional techniques to ensure that all brains are working all the time – for example, asking questions in the classroom with “cold calling*\" rather than relying on the same eager pupils putting up their hands.</p>\n            <p>Like other complex skills, teaching requires a route to mastery that is not based on abstruse theory but on intense, guided practice grounded in subject-matter knowledge and pedagogical methods. Trainees should spend more time in the classroom. The places where pupils do best – for example, Finland, Singapore and Shanghai – put novice teachers through a demanding apprenticeship. In the US, high-performing schools teach trainees in the classroom and bring them on with coaching and feedback.</p>\n            <p>Teacher-training institutions need to be more rigorous. A century ago, medical schools raised the calibre of doctors by introducing systematic curriculums and providing clinical experience. It is essential that teacher-training colleges start to collect and publish data on how their graduates perform in the classroom. Courses that produce teachers who go on to do little to improve their pupils' learning should not receive subsidies or see their graduates become teachers. They would then have to improve to survive.</p>\n            <p>Big changes are needed in schools, too, to ensure that teachers improve throughout their careers. Teachers in the best ones hone their craft through observation and coaching. They accept critical feedback, which their unions should not resist but welcome, as it is only proper for people doing such an important job. The best head teachers hold novices' hands by helping them prepare high-quality lessons and arranging for more-experienced teachers to cover for them when they need time for further study and practice.</p>\n            <p>Money is less important than one might think. Teachers in top-of-the-class Finland, for example, earn about the OECD average. But ensuring the best teachers stay in the classroom will, in most places, mean paying more. People who thrive in front of pupils should not have to become managers to earn a pay rise. And more flexibility on salaries would make it much easier to attract the best teachers to the worst schools.</p>\n            <p>Improving the quality of the average teacher would raise the profession's prestige, setting up a virtuous cycle in which more talented graduates clamoured to join. But the biggest gains will come from preparing new teachers better, and upgrading the ones already in classrooms.</p>\n            <hr style=\"margin: 20px 0;\">\n            <p style=\"font-size: 0.9em; color: var(--muted);\">*cold calling: a simple technique in which the teacher calls on specific pupils to answer a question, regardless of whether they have raised their hand</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Let's teach them how to teach</h3>\n<h4>What matters in schools is teaching. Fortunately, teaching can be taught</h4>\n<p>Forget smart uniforms and small classes. The secret to stellar grades and thriving students is teachers. One US study found that in a single year's teaching the top 10% of teachers impart three times as much learning to their pupils as the worst 10% do. Another US study suggests that if black pupils were taught by the best quarter of teachers, the gap between their achievement and that of white pupils would disappear. But efforts to ensure that every teacher can teach are hindered by the persistent myth that good teachers are born, not made. Government policies, which often start from the same assumption, seek to raise teaching standards by attracting high-flying graduates to join the profession and prodding bad teachers to leave. Teachers' unions, meanwhile, insist that if only their members were free from centralised policies, excellence would follow.</p>\n<p>The premise that teaching ability is something you either have or don't is mistaken. A new breed of teacher trainers is founding a rigorous science of pedagogy. The aim is to make ordinary teachers great, just as sports coaches help athletes of all abilities to improve their personal best. Done right, this will revolutionise schools and change lives.</p>\n<p>Education has a history of lurching from one ‘miracle' solution to the next. The best of them even achieve some good. The US initiative Teach for America has brought energetic new graduates into the profession, and dismissing teachers for bad performance has boosted results in Washington, DC. But each approach has its limits. Teaching is a mass profession: it cannot grab all the top graduates, year after year. When poor teachers are fired, new ones are needed – and they will have come through the same educational system that failed to make fine teachers of their predecessors.</p>\n<p>By contrast, the idea of improving the average teacher could revolutionise the entire profession. Around the world, few newly qualified teachers are well enough prepared for the classroom. A recent report found 31 countries in which more than a quarter of primary-school teachers had not reached minimal national standards. In rich countries, the problem is subtler. Teachers qualify after completing a long, specialised course, which almost always involves superficial and seemingly useless discussions of theory. Some of these courses, including master's degrees in education, have no effect on how well their graduates' pupils end up being taught.</p>\n<p>What teachers fail to learn in universities and teacher-training colleges they rarely pick up on the job. They become better teachers in their first few years as they get to grips with real pupils in real classrooms, but after that improvements tail off. This is largely because schools neglect their most important learners: teachers themselves. Across the Organisation for Economic Cooperation and Development (OECD) club of mostly rich countries, two-fifths of teachers say they have never had a chance to learn by sitting in on another teacher's lessons; nor have they been asked to give feedback on their peers.</p>\n<p>If this is to change, teachers need to learn how to impart knowledge and prepare young minds to receive and retain it. Good teachers set clear goals, enforce high standards of behaviour and manage their lesson time wisely. They use tried-and-tested instructional techniques to ensure that all brains are working all the time – for example, asking questions in the classroom with “cold calling*\" rather than relying on the same eager pupils putting up their hands.</p>\n<p>Like other complex skills, teaching requires a route to mastery that is not based on abstruse theory but on intense, guided practice grounded in subject-matter knowledge and pedagogical methods. Trainees should spend more time in the classroom. The places where pupils do best – for example, Finland, Singapore and Shanghai – put novice teachers through a demanding apprenticeship. In the US, high-performing schools teach trainees in the classroom and bring them on with coaching and feedback.</p>\n<p>Teacher-training institutions need to be more rigorous. A century ago, medical schools raised the calibre of doctors by introducing systematic curriculums and providing clinical experience. It is essential that teacher-training colleges start to collect and publish data on how their graduates perform in the classroom. Courses that produce teachers who go on to do little to improve their pupils' learning should not receive subsidies or see their graduates become teachers. They would then have to improve to survive.</p>\n<p>Big changes are needed in schools, too, to ensure that teachers improve throughout their careers. Teachers in the best ones hone their craft through observation and coaching. They accept critical feedback, which their unions should not resist but welcome, as it is only proper for people doing such an important job. The best head teachers hold novices' hands by helping them prepare high-quality lessons and arranging for more-experienced teachers to cover for them when they need time for further study and practice.</p>\n<p>Money is less important than one might think. Teachers in top-of-the-class Finland, for example, earn about the OECD average. But ensuring the best teachers stay in the classroom will, in most places, mean paying more. People who thrive in front of pupils should not have to become managers to earn a pay rise. And more flexibility on salaries would make it much easier to attract the best teachers to the worst schools.</p>\n<p>Improving the quality of the average teacher would raise the profession's prestige, setting up a virtuous cycle in which more talented graduates clamoured to join. But the biggest gains will come from preparing new teachers better, and upgrading the ones already in classrooms.</p>\n<hr style=\"margin: 20px 0;\">\n<p style=\"font-size: 0.9em; color: var(--muted);\">*cold calling: a simple technique in which the teacher calls on specific pupils to answer a question, regardless of whether they have raised their hand</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 27–31</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                \n                <div class=\"question-item\">\n                    <p><strong>27</strong> According to the third paragraph, why is dismissing bad teachers a poor solution to problems in educational standards?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"A\"> A Problems are increasing year on year.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"B\"> B There are not enough top graduates to replace them.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"C\"> C It leads to a poor relationship with teachers' unions.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"D\"> D Replacement teachers have the same training as the dismissed ones.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> What does the writer say about teacher-training institutions in the fourth paragraph?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"A\"> A Graduating teachers are not ready for the classroom.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"B\"> B Improving a teacher of average talent is a very difficult task.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"C\"> C More theory in teacher-training courses is required.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"D\"> D Primary teacher training is not taken seriously.</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>29</strong> In their first few years of working, teachers improve in the classroom because they</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"A\"> A are well equipped to build on the theory they learned in college.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"B\"> B have to engage with the realities of the job.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"C\"> C have opportunities to observe and learn from their peers.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"D\"> D enjoy a high level of support from the schools that employ them.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> Which of the following does the writer suggest is least effective for teachers to use?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"A\"> A enforcing strict standards of behaviour</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"B\"> B setting high goals that students are aware of</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"C\"> C responding to pupils who raise their hands to answer questions</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"D\"> D ensuring that lesson time is properly scheduled and used</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>31</strong> The author suggests that head teachers can assist newly qualified teachers by</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"A\"> A carrying out classroom observations personally.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"B\"> B providing critical feedback.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"C\"> C welcoming union interaction.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"D\"> D working closely with them.</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> According to the third paragraph, why is dismissing bad teachers a poor solution to problems in educational standards?</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A Problems are increasing year on year.</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B There are not enough top graduates to replace them.</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C It leads to a poor relationship with teachers' unions.</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D Replacement teachers have the same training as the dismissed ones.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> What does the writer say about teacher-training institutions in the fourth paragraph?</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A Graduating teachers are not ready for the classroom.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B Improving a teacher of average talent is a very difficult task.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C More theory in teacher-training courses is required.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D Primary teacher training is not taken seriously.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> In their first few years of working, teachers improve in the classroom because they</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A are well equipped to build on the theory they learned in college.</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B have to engage with the realities of the job.</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C have opportunities to observe and learn from their peers.</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D enjoy a high level of support from the schools that employ them.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Which of the following does the writer suggest is least effective for teachers to use?</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A enforcing strict standards of behaviour</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B setting high goals that students are aware of</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C responding to pupils who raise their hands to answer questions</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D ensuring that lesson time is properly scheduled and used</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> The author suggests that head teachers can assist newly qualified teachers by</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"> A carrying out classroom observations personally.</label> <label><input name=\"q5\" type=\"radio\" value=\"B\"> B providing critical feedback.</label> <label><input name=\"q5\" type=\"radio\" value=\"C\"> C welcoming union interaction.</label> <label><input name=\"q5\" type=\"radio\" value=\"D\"> D working closely with them.</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -48,7 +48,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-10-anchor\">\n                <h4>Questions 32–36</h4>\n                <p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n                <p>In boxes 32–36 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                \n                <div class=\"question-item\">\n                    <p><strong>32</strong> Of the many 'miracle' educational solutions that have been put forward, a few have been effective.</p>\n                    <div class=\"radio-options\" style=\"flex-direction:row; gap:16px;\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> Understanding educational theories is an essential part of teacher training.</p>\n                    <div class=\"radio-options\" style=\"flex-direction:row; gap:16px;\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>34</strong> Courses producing unsuccessful teachers should be given grants to improve.</p>\n                    <div class=\"radio-options\" style=\"flex-direction:row; gap:16px;\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>35</strong> Education is currently underfunded, which is leading to problems in schools.</p>\n                    <div class=\"radio-options\" style=\"flex-direction:row; gap:16px;\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>36</strong> Good classroom teachers should be paid more to remain in the classroom.</p>\n                     <div class=\"radio-options\" style=\"flex-direction:row; gap:16px;\">\n                        <label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-10-anchor\">\n<h4>Questions 32–36</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 32–36 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>32</strong> Of the many 'miracle' educational solutions that have been put forward, a few have been effective.</p>\n<div class=\"radio-options\" style=\"flex-direction:row; gap:16px;\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Understanding educational theories is an essential part of teacher training.</p>\n<div class=\"radio-options\" style=\"flex-direction:row; gap:16px;\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Courses producing unsuccessful teachers should be given grants to improve.</p>\n<div class=\"radio-options\" style=\"flex-direction:row; gap:16px;\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Education is currently underfunded, which is leading to problems in schools.</p>\n<div class=\"radio-options\" style=\"flex-direction:row; gap:16px;\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> Good classroom teachers should be paid more to remain in the classroom.</p>\n<div class=\"radio-options\" style=\"flex-direction:row; gap:16px;\">\n<label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n                <h4>Questions 37–40</h4>\n                <p>Complete each sentence with the correct ending, <strong>A–F</strong>, below.</p>\n                <p>Write the correct letter, <strong>A–F</strong>, in boxes 37–40 on your answer sheet.</p>\n                \n                <div class=\"sentence-completion-options\">\n                    <ul>\n                        <li><strong>A</strong> practice will always be more important than theory.</li>\n                        <li><strong>B</strong> better trainers are the only answer.</li>\n                        <li><strong>C</strong> more capable graduates could be attracted into the profession.</li>\n                        <li><strong>D</strong> a teacher who is not outstanding can be improved.</li>\n                        <li><strong>E</strong> the assistance of teachers' unions is essential.</li>\n                        <li><strong>F</strong> a better syllabus and more practical involvement will improve results.</li>\n                    </ul>\n                </div>\n\n                <div class=\"question-item\">\n                    <p><strong>37</strong> Just as any athlete can be coached for better performance,<input type=\"text\" id=\"q37_input\" maxlength=\"1\" name=\"q11\"></p>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>38</strong> If teachers are to be taught the complex skills they require,<input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\"></p>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>39</strong> In teaching, as in the medical profession,<input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\"></p>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>40</strong> If the status of teachers were improved,<input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"></p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–F</strong>, below.</p>\n<p>Write the correct letter, <strong>A–F</strong>, in boxes 37–40 on your answer sheet.</p>\n<div class=\"sentence-completion-options\">\n<ul>\n<li><strong>A</strong> practice will always be more important than theory.</li>\n<li><strong>B</strong> better trainers are the only answer.</li>\n<li><strong>C</strong> more capable graduates could be attracted into the profession.</li>\n<li><strong>D</strong> a teacher who is not outstanding can be improved.</li>\n<li><strong>E</strong> the assistance of teachers' unions is essential.</li>\n<li><strong>F</strong> a better syllabus and more practical involvement will improve results.</li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> Just as any athlete can be coached for better performance,<input type=\"text\" id=\"q37_input\" maxlength=\"1\" name=\"q11\"></p>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> If teachers are to be taught the complex skills they require,<input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\"></p>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> In teaching, as in the medical profession,<input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\"></p>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> If the status of teachers were improved,<input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"></p>\n</div>\n</div>"
     }
   ],
   "answerKey": {
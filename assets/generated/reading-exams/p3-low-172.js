@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Rebranding art museums</h3>\n            <h4>A study of the reopened National Gallery of Victoria</h4>\n            \n            <p>As anyone with even a passing interest in cultural institutions will know, art museums are adapting to keep up with changes in society. Do any of these newly developed spaces indicate a fundamental shift in the ways we engage with art at the beginning of the twenty-first century? The answer is a qualified Yes and also, it must be said, No. A clear sense of this can be gained by considering the 2003 redevelopment of the National Gallery of Victoria (NGV) in Melbourne, Australia's second largest city, in the light of the aspirations embodied in the original building that served as its template.</p>\n            <p>The first building was considered a thoroughly modern museum when it opened to the public in 1968. We should not forget that it was also bold, entrepreneurial and innovative in ways that have done great credit to the vision and foresight of the architect, Roy Grounds. For one thing, the 1968 building signalled a strong sense of engagement with Asian and Pacific cultures, both in its architecture and through the layout of its collections. Its entrance lobby was designed to facilitate the rapid and efficient circulation of visitors. It also contained a series of greatly expanded temporary exhibition galleries and a vast Great Hall, which represented an unprecedented emphasis on the ancillary roles of corporate functions and public performances in the contemporary museum.</p>\n            <p>This last feature might have seemed excessive to some, yet how wise it has proven over the years as museums have come to place increasing emphasis on corporate sponsorship, and on the need to generate additional funds via room hire. Furthermore, the Great Hall has for forty years provided an area for children to roam at large before being escorted through the much less spatially accommodating galleries themselves. As an unintimidating introduction to the lifelong rigours of visiting art museums, its impact on attendance cannot be overestimated.</p>\n            <p>At the same time, other aspects of the 1968 NGV have not withstood the test of time so well. Foremost among these are the huge expanse of the exterior's windowless wall and the surrounding moat, which creates a rather unwelcoming expression of the museum as a temple of culture set apart from the everyday world. Over time, this idea has been questioned, and has been superseded by the growing impetus towards the alternative model of the museum as a more open-ended and visitor-friendly forum that engages the public more effectively.</p>\n            <p>With these considerations in mind, Mario Bellini's redeveloped NGV opened in 2003 and his design reflects what the new, improved, twenty-first century global museum feels it should be emphasising to its visitors. Here the institution's energies are focused, not so much on the technical subtleties of how to design the galleries themselves, as on presenting to the public a spectacular image of the museum itself as a welcoming yet efficient facilitator of social interaction, popular entertainment and public knowledge. All of this is certainly impressive, but where has the art gone? We are not allowed to see the exhibitions until we have completed the necessary inductions. We are greeted by a hugely expanded cloakroom screening off our vision to the right, followed by a large visitor information office leading to the ticket booths. Above us is the cafe and to our left we cannot escape the NGV shop set alongside the exit.</p>\n            <p>And what of the redesigned galleries themselves? In fact, they represent a wonderfully elegant reframing of the permanent collections in ways that should offer first-time visitors and seasoned members alike many new avenues for engagement in the years to come. But herein lies the conundrum posed by the NGV renovation and by the global sweep of new museum projects more generally. The mainstay elements of a permanent collection can become all too easily lost in the increased prominence that these rebranding exercises tend to place on the more glamorously spectacular aspects of the institution itself. At its most extreme, this results in the construction of new buildings that supplant the artworks inside them to become the major attractions themselves.</p>\n            <p>These challenges are most keenly felt in the area of the temporary exhibition. Entrance to the NGV permanent collection is now free, so the NGV needs something to keep the paying public coming back. The answer lies in the international ‘blockbuster' exhibition. The Impressionists, for example, netted a total of 380,000 visitors, making it one of the most popular exhibitions in Australian history. There has also been, it needs to be said, a commendable attempt to leaven the international masterpieces with selected highlights from the permanent collection. Overall, though, the prevalence of these ‘rental' blockbusters cannot but help introduce a certain ‘off the rack' feeling to the institution's exhibition programme. More importantly perhaps, they clearly narrow the options for other worthy but less glamorous projects, and they take energy away from the curators' potential to do further work on and around the permanent collection itself.</p>\n            <p>Yet the show must go on, and shows can't exist without the public. Even the most adroit organisation, as the NGV assuredly is, needs to be able to juggle numerous, often conflicting priorities: the need to advance scholarship, on the one hand, versus the imperative of access on the other; the need to introduce audiences to new areas, versus the necessity of luring them in with instant brand recognition. Nobody said it was going to be easy, and the effect of too much innovation in museums can be disastrous.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Rebranding art museums</h3>\n<h4>A study of the reopened National Gallery of Victoria</h4>\n<p>As anyone with even a passing interest in cultural institutions will know, art museums are adapting to keep up with changes in society. Do any of these newly developed spaces indicate a fundamental shift in the ways we engage with art at the beginning of the twenty-first century? The answer is a qualified Yes and also, it must be said, No. A clear sense of this can be gained by considering the 2003 redevelopment of the National Gallery of Victoria (NGV) in Melbourne, Australia's second largest city, in the light of the aspirations embodied in the original building that served as its template.</p>\n<p>The first building was considered a thoroughly modern museum when it opened to the public in 1968. We should not forget that it was also bold, entrepreneurial and innovative in ways that have done great credit to the vision and foresight of the architect, Roy Grounds. For one thing, the 1968 building signalled a strong sense of engagement with Asian and Pacific cultures, both in its architecture and through the layout of its collections. Its entrance lobby was designed to facilitate the rapid and efficient circulation of visitors. It also contained a series of greatly expanded temporary exhibition galleries and a vast Great Hall, which represented an unprecedented emphasis on the ancillary roles of corporate functions and public performances in the contemporary museum.</p>\n<p>This last feature might have seemed excessive to some, yet how wise it has proven over the years as museums have come to place increasing emphasis on corporate sponsorship, and on the need to generate additional funds via room hire. Furthermore, the Great Hall has for forty years provided an area for children to roam at large before being escorted through the much less spatially accommodating galleries themselves. As an unintimidating introduction to the lifelong rigours of visiting art museums, its impact on attendance cannot be overestimated.</p>\n<p>At the same time, other aspects of the 1968 NGV have not withstood the test of time so well. Foremost among these are the huge expanse of the exterior's windowless wall and the surrounding moat, which creates a rather unwelcoming expression of the museum as a temple of culture set apart from the everyday world. Over time, this idea has been questioned, and has been superseded by the growing impetus towards the alternative model of the museum as a more open-ended and visitor-friendly forum that engages the public more effectively.</p>\n<p>With these considerations in mind, Mario Bellini's redeveloped NGV opened in 2003 and his design reflects what the new, improved, twenty-first century global museum feels it should be emphasising to its visitors. Here the institution's energies are focused, not so much on the technical subtleties of how to design the galleries themselves, as on presenting to the public a spectacular image of the museum itself as a welcoming yet efficient facilitator of social interaction, popular entertainment and public knowledge. All of this is certainly impressive, but where has the art gone? We are not allowed to see the exhibitions until we have completed the necessary inductions. We are greeted by a hugely expanded cloakroom screening off our vision to the right, followed by a large visitor information office leading to the ticket booths. Above us is the cafe and to our left we cannot escape the NGV shop set alongside the exit.</p>\n<p>And what of the redesigned galleries themselves? In fact, they represent a wonderfully elegant reframing of the permanent collections in ways that should offer first-time visitors and seasoned members alike many new avenues for engagement in the years to come. But herein lies the conundrum posed by the NGV renovation and by the global sweep of new museum projects more generally. The mainstay elements of a permanent collection can become all too easily lost in the increased prominence that these rebranding exercises tend to place on the more glamorously spectacular aspects of the institution itself. At its most extreme, this results in the construction of new buildings that supplant the artworks inside them to become the major attractions themselves.</p>\n<p>These challenges are most keenly felt in the area of the temporary exhibition. Entrance to the NGV permanent collection is now free, so the NGV needs something to keep the paying public coming back. The answer lies in the international ‘blockbuster' exhibition. The Impressionists, for example, netted a total of 380,000 visitors, making it one of the most popular exhibitions in Australian history. There has also been, it needs to be said, a commendable attempt to leaven the international masterpieces with selected highlights from the permanent collection. Overall, though, the prevalence of these ‘rental' blockbusters cannot but help introduce a certain ‘off the rack' feeling to the institution's exhibition programme. More importantly perhaps, they clearly narrow the options for other worthy but less glamorous projects, and they take energy away from the curators' potential to do further work on and around the permanent collection itself.</p>\n<p>Yet the show must go on, and shows can't exist without the public. Even the most adroit organisation, as the NGV assuredly is, needs to be able to juggle numerous, often conflicting priorities: the need to advance scholarship, on the one hand, versus the imperative of access on the other; the need to introduce audiences to new areas, versus the necessity of luring them in with instant brand recognition. Nobody said it was going to be easy, and the effect of too much innovation in museums can be disastrous.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -34,7 +34,7 @@
         "q3",
         "q4"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n                <h4>Questions 27–30</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>27</strong> What is the writer doing in the first paragraph?</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A comparing the old NGV with the new NGV</label></li>\n                        <li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B describing the role of art museums in Australian culture</label></li>\n                        <li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C considering the influence of gallery design on art appreciation</label></li>\n                        <li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D suggesting there has been little recent change in gallery design</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> The writer criticises the old NGV because</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A the permanent collection was poorly displayed.</label></li>\n                        <li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B the building tended to make art seem remote.</label></li>\n                        <li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C Asian and Pacific art was neglected.</label></li>\n                        <li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D the foyer resembled a shop.</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> What does the writer notice about the new NGV?</p>\n                     <ul class=\"mcq-options\">\n                        <li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A He thinks the ticket booths are well positioned.</label></li>\n                        <li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B He is upset that he is made to move so quickly.</label></li>\n                        <li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C He is frustrated because the art is obscured by the entrance.</label></li>\n                        <li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D He thinks the redevelopment fails to keep up with international trends.</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> The writer argues that rental 'blockbuster' exhibitions</p>\n                     <ul class=\"mcq-options\">\n                        <li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A should be cheaper.</label></li>\n                        <li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B are a financial necessity.</label></li>\n                        <li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C should be increased in number.</label></li>\n                        <li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D allow the museum to present an original programme.</label></li>\n                    </ul>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> What is the writer doing in the first paragraph?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A comparing the old NGV with the new NGV</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B describing the role of art museums in Australian culture</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C considering the influence of gallery design on art appreciation</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D suggesting there has been little recent change in gallery design</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> The writer criticises the old NGV because</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A the permanent collection was poorly displayed.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B the building tended to make art seem remote.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C Asian and Pacific art was neglected.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D the foyer resembled a shop.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> What does the writer notice about the new NGV?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A He thinks the ticket booths are well positioned.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B He is upset that he is made to move so quickly.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C He is frustrated because the art is obscured by the entrance.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D He thinks the redevelopment fails to keep up with international trends.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> The writer argues that rental 'blockbuster' exhibitions</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A should be cheaper.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B are a financial necessity.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C should be increased in number.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D allow the museum to present an original programme.</label></li>\n</ul>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n                <h4>Questions 31–35</h4>\n                <p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n                <p>In boxes 31–35 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p><strong>31</strong> Roy Grounds's design failed to recognise the importance of functions and performances in museums.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>32</strong> Mario Bellini's new NGV rejects international museum design trends.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> Mario Bellini's work on subsequent museum projects has been less successful than that on the NGV.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>34</strong> The NGV monitors the number of first-time visitors to permanent collections.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>35</strong> Too much change may have negative impacts on museums.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n<h4>Questions 31–35</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 31–35 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>31</strong> Roy Grounds's design failed to recognise the importance of functions and performances in museums.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> Mario Bellini's new NGV rejects international museum design trends.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Mario Bellini's work on subsequent museum projects has been less successful than that on the NGV.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> The NGV monitors the number of first-time visitors to permanent collections.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Too much change may have negative impacts on museums.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n                 <h4>Questions 36–40</h4>\n                <p>Complete each sentence with the correct ending, <strong>A–G</strong>, below.</p>\n                <ul class=\"sentence-ending-options\">\n                    <li><strong>A</strong> the museum programme will lose its individuality.</li>\n                    <li><strong>B</strong> the museum will lose credibility.</li>\n                    <li><strong>C</strong> the art loses its importance.</li>\n                    <li><strong>D</strong> it will have to balance opposing demands.</li>\n                    <li><strong>E</strong> this will encourage museum visitors in the future.</li>\n                    <li><strong>F</strong> it will have the capability of increasing revenue.</li>\n                    <li><strong>G</strong> the architect's reputation might suffer.</li>\n                </ul>\n\n                <div class=\"question-item\"><strong>36</strong> If a large space is available in the museum, <input type=\"text\" id=\"q36_input\" maxlength=\"1\" name=\"q10\"></div>\n                <div class=\"question-item\"><strong>37</strong> If children are allowed to move freely in parts of the gallery, <input type=\"text\" id=\"q37_input\" maxlength=\"1\" name=\"q11\"></div>\n                <div class=\"question-item\"><strong>38</strong> If too much emphasis is placed on the museum building itself, <input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\"></div>\n                <div class=\"question-item\"><strong>39</strong> If there is an over-reliance on 'blockbuster' exhibitions, <input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\"></div>\n                <div class=\"question-item\"><strong>40</strong> If the NGV wants to continue to be successful, <input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"></div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–G</strong>, below.</p>\n<ul class=\"sentence-ending-options\">\n<li><strong>A</strong> the museum programme will lose its individuality.</li>\n<li><strong>B</strong> the museum will lose credibility.</li>\n<li><strong>C</strong> the art loses its importance.</li>\n<li><strong>D</strong> it will have to balance opposing demands.</li>\n<li><strong>E</strong> this will encourage museum visitors in the future.</li>\n<li><strong>F</strong> it will have the capability of increasing revenue.</li>\n<li><strong>G</strong> the architect's reputation might suffer.</li>\n</ul>\n<div class=\"question-item\"><strong>36</strong> If a large space is available in the museum, <input type=\"text\" id=\"q36_input\" maxlength=\"1\" name=\"q10\"></div>\n<div class=\"question-item\"><strong>37</strong> If children are allowed to move freely in parts of the gallery, <input type=\"text\" id=\"q37_input\" maxlength=\"1\" name=\"q11\"></div>\n<div class=\"question-item\"><strong>38</strong> If too much emphasis is placed on the museum building itself, <input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\"></div>\n<div class=\"question-item\"><strong>39</strong> If there is an over-reliance on 'blockbuster' exhibitions, <input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\"></div>\n<div class=\"question-item\"><strong>40</strong> If the NGV wants to continue to be successful, <input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"></div>\n</div>"
     }
   ],
   "answerKey": {
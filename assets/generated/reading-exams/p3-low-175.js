@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Termite Mounds</h3>\n            <p><em>Could the vast towers of mud constructed by insects in sub-Saharan Africa hold the key to our energy-efficient building of the future?</em></p>\n            \n            <div class=\"paragraph-wrapper\" id=\"q1-anchor\">\n                <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"A\" data-question=\"q1\">\n                    <span class=\"paragraph-label\">Paragraph A (Q27):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>A</strong> To most of us, termites are destructive insects which can cause damage on a devastating scale. But according to Dr Rupert Soar of Loughborough University's School of Mechanical and Manufacturing Engineering, these pests may serve a useful purpose for us after all. His multidisciplinary team of British and American engineers and biologists has set out to investigate the giant mounds built by termites in Namibia, in sub-Saharan Africa, as part of the most extensive study of these structures ever taken.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q2-anchor\">\n                <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"B\" data-question=\"q2\">\n                    <span class=\"paragraph-label\">Paragraph B (Q28):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>B</strong> Termite mounds are impressive for their size alone; typically they are three metres high, and some as tall as eight metres have been found. They also reach far into the earth, where the insects ‘mine' their building materials, carefully selecting each grain of sand they use. The termite's nest is contained in the central cavity of the mound, safely protected from the harsh environment outside. The mound itself is formed of an intricate lattice of tunnels, which split into smaller and smaller tunnels, much like a person's blood vessels.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q3-anchor\">\n                 <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"C\" data-question=\"q3\">\n                    <span class=\"paragraph-label\">Paragraph C (Q29):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>C</strong> This complex system of tunnels draws in air from the outside, capturing wind energy to drive it through the mound. It also serves to expel spent respiratory gases from the nest to prevent the termites from suffocating, so ensuring them a continuous provision of fresh, breathable air. So detailed is the design that the nest stays within three degrees of a constant temperature, despite variations on the outside of up to 50 °C, from blistering heat in the daytime to below freezing on the coldest nights. The mound also automatically regulates moisture in the air, by means of both its underground ‘cellar', and evaporation from the top of the mound. Some colonies even had ‘chimneys' at a height of 20 m to control moisture loss in the hottest regions of sub-Saharan Africa.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q4-anchor\">\n                <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"D\" data-question=\"q4\">\n                    <span class=\"paragraph-label\">Paragraph D (Q30):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>D</strong> Furthermore, the termites have evolved in such a way as to outsource some of their biological functions. Part of their digestive process is carried out by a fungus, which they 'farm' inside the mound. This fungus, which is found nowhere else on earth, thrives in the constant and optimum environment of the mound. The termites feed the fungus with slightly chewed wood pulp, which the fungus then breaks down into a digestible sugary food to provide the insects with energy, and cellulose which they use for building. And, although the termites must generate waste, none ever leaves the structure, indicating that there is also some kind of internal waste-recycling system.</p>\n            </div>\n             <div class=\"paragraph-wrapper\" id=\"q5-anchor\">\n                 <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"E\" data-question=\"q5\">\n                    <span class=\"paragraph-label\">Paragraph E (Q31):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>E</strong> Scientists are so excited by the mounds that they have labelled them a 'super organism' because, in Soar's words, “They dance on the edge of what we would perceive to be cool or, if you're too cold, you need to thrive: that's called homeostasis.” What the termites have done is to move homeostatic function away from their body, into the structure in which they live. “As more information comes to light about the unique features of termite mounds, we may ultimately need to redefine our understanding of what constitutes a ‘living' organism.”</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q6-anchor\">\n                 <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"F\" data-question=\"q6\">\n                    <span class=\"paragraph-label\">Paragraph F (Q32):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>F</strong> To reveal the structure of the mounds, Soar's team begins by filling and covering their plaster of Paris, a chalky white paste based on the mineral gypsum, which becomes rock-solid when dry. The researcher then carves the plaster of Paris into half-millimetre-thick slices, and photographs them sequentially. Once the pictures are digitally scanned, computer technology is able to recreate complex three-dimensional images of the mounds. These models have enabled the team to map termite architecture at a level of detail never before attained.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q7-anchor\">\n                 <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"G\" data-question=\"q7\">\n                    <span class=\"paragraph-label\">Paragraph G (Q33):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>G</strong> Soar hopes that the models will explain how termite mounds create a self-regulating living environment which manages to respond to changing internal and external conditions without drawing on any outside source of power. If they do, the findings could be invaluable in informing future architectural design, and could inspire buildings that are self-sufficient, environmentally friendly, and cheap to run. “As we approach a world of climate change and temperatures rise,” he explains, “there will not be enough fuel to drive air conditioners around the world.” It is hoped, says Soar, “that the findings will provide clues that aid the ultimate development of new kinds of human habitats, suitable for a variety of arid, hostile environments not only on the earth but maybe one day on the moon and beyond.”</p>\n            </div>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>Termite Mounds</h3>\n<p><em>Could the vast towers of mud constructed by insects in sub-Saharan Africa hold the key to our energy-efficient building of the future?</em></p>\n<div class=\"paragraph-wrapper\" id=\"q1-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"A\" data-question=\"q1\">\n<span class=\"paragraph-label\">Paragraph A (Q27):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> To most of us, termites are destructive insects which can cause damage on a devastating scale. But according to Dr Rupert Soar of Loughborough University's School of Mechanical and Manufacturing Engineering, these pests may serve a useful purpose for us after all. His multidisciplinary team of British and American engineers and biologists has set out to investigate the giant mounds built by termites in Namibia, in sub-Saharan Africa, as part of the most extensive study of these structures ever taken.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q2-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"B\" data-question=\"q2\">\n<span class=\"paragraph-label\">Paragraph B (Q28):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> Termite mounds are impressive for their size alone; typically they are three metres high, and some as tall as eight metres have been found. They also reach far into the earth, where the insects ‘mine' their building materials, carefully selecting each grain of sand they use. The termite's nest is contained in the central cavity of the mound, safely protected from the harsh environment outside. The mound itself is formed of an intricate lattice of tunnels, which split into smaller and smaller tunnels, much like a person's blood vessels.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q3-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"C\" data-question=\"q3\">\n<span class=\"paragraph-label\">Paragraph C (Q29):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> This complex system of tunnels draws in air from the outside, capturing wind energy to drive it through the mound. It also serves to expel spent respiratory gases from the nest to prevent the termites from suffocating, so ensuring them a continuous provision of fresh, breathable air. So detailed is the design that the nest stays within three degrees of a constant temperature, despite variations on the outside of up to 50 °C, from blistering heat in the daytime to below freezing on the coldest nights. The mound also automatically regulates moisture in the air, by means of both its underground ‘cellar', and evaporation from the top of the mound. Some colonies even had ‘chimneys' at a height of 20 m to control moisture loss in the hottest regions of sub-Saharan Africa.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q4-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"D\" data-question=\"q4\">\n<span class=\"paragraph-label\">Paragraph D (Q30):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> Furthermore, the termites have evolved in such a way as to outsource some of their biological functions. Part of their digestive process is carried out by a fungus, which they 'farm' inside the mound. This fungus, which is found nowhere else on earth, thrives in the constant and optimum environment of the mound. The termites feed the fungus with slightly chewed wood pulp, which the fungus then breaks down into a digestible sugary food to provide the insects with energy, and cellulose which they use for building. And, although the termites must generate waste, none ever leaves the structure, indicating that there is also some kind of internal waste-recycling system.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q5-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"E\" data-question=\"q5\">\n<span class=\"paragraph-label\">Paragraph E (Q31):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> Scientists are so excited by the mounds that they have labelled them a 'super organism' because, in Soar's words, “They dance on the edge of what we would perceive to be cool or, if you're too cold, you need to thrive: that's called homeostasis.” What the termites have done is to move homeostatic function away from their body, into the structure in which they live. “As more information comes to light about the unique features of termite mounds, we may ultimately need to redefine our understanding of what constitutes a ‘living' organism.”</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q6-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"F\" data-question=\"q6\">\n<span class=\"paragraph-label\">Paragraph F (Q32):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> To reveal the structure of the mounds, Soar's team begins by filling and covering their plaster of Paris, a chalky white paste based on the mineral gypsum, which becomes rock-solid when dry. The researcher then carves the plaster of Paris into half-millimetre-thick slices, and photographs them sequentially. Once the pictures are digitally scanned, computer technology is able to recreate complex three-dimensional images of the mounds. These models have enabled the team to map termite architecture at a level of detail never before attained.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q7-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"G\" data-question=\"q7\">\n<span class=\"paragraph-label\">Paragraph G (Q33):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>G</strong> Soar hopes that the models will explain how termite mounds create a self-regulating living environment which manages to respond to changing internal and external conditions without drawing on any outside source of power. If they do, the findings could be invaluable in informing future architectural design, and could inspire buildings that are self-sufficient, environmentally friendly, and cheap to run. “As we approach a world of climate change and temperatures rise,” he explains, “there will not be enough fuel to drive air conditioners around the world.” It is hoped, says Soar, “that the findings will provide clues that aid the ultimate development of new kinds of human habitats, suitable for a variety of arid, hostile environments not only on the earth but maybe one day on the moon and beyond.”</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -37,7 +37,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n                <h4>Questions 27–33</h4>\n                <p>Reading Passage 3 has seven paragraphs <strong>A–G</strong>.</p>\n                <p>Choose the correct heading for each paragraph from the list of headings below.</p>\n                <p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n                \n                <div class=\"headings-pool\" id=\"headings-pool-container\">\n                    <strong>List of Headings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. methods used to investigate termite mound formation</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. challenging our assumptions about the nature of life</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. reconsidering the termite's reputation</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. principal functions of the termite mound</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. distribution of termite mounds in sub-Saharan Africa</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. some potential benefits of understanding termite architecture</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. the astonishing physical dimensions of the termite mound</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. termite mounds under threat from global climate change</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix. a mutually beneficial relationship</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 27–33</h4>\n<p>Reading Passage 3 has seven paragraphs <strong>A–G</strong>.</p>\n<p>Choose the correct heading for each paragraph from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. methods used to investigate termite mound formation</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. challenging our assumptions about the nature of life</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. reconsidering the termite's reputation</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. principal functions of the termite mound</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. distribution of termite mounds in sub-Saharan Africa</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. some potential benefits of understanding termite architecture</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. the astonishing physical dimensions of the termite mound</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. termite mounds under threat from global climate change</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\">ix. a mutually beneficial relationship</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -50,7 +50,7 @@
         "q10",
         "q11"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-anchor\">\n                <h4>Questions 34–37</h4>\n                <p>Label the diagram below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                <div class=\"diagram-container\">\n                    <img src=\"https://i.ibb.co/ZpTTLng3/2600b83a-d7e6-4e33-915c-2c117ca4796a.png\" alt=\"Diagram of a termite mound\" style=\"max-width: 100%; width: auto; height: auto; max-height: 420px; object-fit: contain; display: block; margin: 0 auto;\">\n                </div>\n                <div class=\"diagram-inputs\">\n                    <div class=\"diagram-input-row\">\n                        <label for=\"q34_input\"><strong>34</strong></label>\n                        <input name=\"q8\" type=\"text\" id=\"q34_input\">\n                    </div>\n                    <div class=\"diagram-input-row\">\n                        <label for=\"q35_input\"><strong>35</strong></label>\n                        <input name=\"q9\" type=\"text\" id=\"q35_input\">\n                    </div>\n                    <div class=\"diagram-input-row\">\n                        <label for=\"q36_input\"><strong>36</strong></label>\n                        <input name=\"q10\" type=\"text\" id=\"q36_input\">\n                    </div>\n                    <div class=\"diagram-input-row\">\n                        <label for=\"q37_input\"><strong>37</strong></label>\n                        <input name=\"q11\" type=\"text\" id=\"q37_input\">\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-anchor\">\n<h4>Questions 34–37</h4>\n<p>Label the diagram below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"diagram-container\">\n<img src=\"https://i.ibb.co/ZpTTLng3/2600b83a-d7e6-4e33-915c-2c117ca4796a.png\" alt=\"Diagram of a termite mound\" style=\"max-width: 100%; width: auto; height: auto; max-height: 420px; object-fit: contain; display: block; margin: 0 auto;\">\n</div>\n<div class=\"diagram-inputs\">\n<div class=\"diagram-input-row\">\n<label for=\"q34_input\"><strong>34</strong></label> <input name=\"q8\" type=\"text\" id=\"q34_input\">\n</div>\n<div class=\"diagram-input-row\">\n<label for=\"q35_input\"><strong>35</strong></label> <input name=\"q9\" type=\"text\" id=\"q35_input\">\n</div>\n<div class=\"diagram-input-row\">\n<label for=\"q36_input\"><strong>36</strong></label> <input name=\"q10\" type=\"text\" id=\"q36_input\">\n</div>\n<div class=\"diagram-input-row\">\n<label for=\"q37_input\"><strong>37</strong></label> <input name=\"q11\" type=\"text\" id=\"q37_input\">\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -60,7 +60,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q12-13-14-anchor\">\n                <h4>Questions 38–40</h4>\n                <p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n                <p>In boxes 38–40 on your answer sheet, write</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p><strong>38</strong> The termite mound appears to process its refuse material internally.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>39</strong> Dr Soar's reconstruction involves scanning a single photograph of a complete mound into a computer.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>40</strong> New information about termite architecture could help people deal with future energy crises.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q12-13-14-anchor\">\n<h4>Questions 38–40</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 38–40 on your answer sheet, write</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>38</strong> The termite mound appears to process its refuse material internally.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> Dr Soar's reconstruction involves scanning a single photograph of a complete mound into a computer.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> New information about termite architecture could help people deal with future energy crises.</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>The Robbers Cave Study</h3>\n            <h4>A review of a famous study into group behaviour</h4>\n            \n            <p>Group self-centredness seems to occur the minute people are divided into groups. It doesn't matter what the group is, or on what basis it was formed, we perceive the group we belong to as being superior to other groups and we develop an ‘in-group' bias.</p>\n            <p>Probably one of the most famous pieces of research looking at group behaviour was a field study conducted by Sherif in 1956. This study involved 22 boys aged between 11 and 12, who were divided into two groups. The groups were roughly matched in terms of sporting ability, camping experience and general popularity among their peers. Their parents were told that they were going to a three-week summer camp to see how well they would work alongside other boys when put into different teams. The parents were also told that the boys would not be allowed to be visited during that time, but would be able to go home if they wanted to. It was intended that the data for the study would be collected by participant observers.</p>\n            <p>At first, neither set of boys knew of the existence of the other set. They were taken to their respective campsites, which were located on a 200-acre, densely wooded area in Robbers Cave State Park, Oklahoma. The first week was spent doing a variety of activities, such as pitching tents and cooking. During this week, the two groups seemed to develop different group norms, one group being more 'tough' than the other, from which two boys went home early, as they were homesick. The groups were given a set of caps and T-shirts, and gave themselves names: the ‘Eagles' and the ‘Rattlers' (the latter being the tougher group).</p>\n            <p>At the end of the first week, they became aware of each other's existence by finding litter left by the other group or overhearing voices. Sherif noticed that already the groups had started to refer to the other group as 'them' and their group as 'us'. This marked the beginning of phase two of the experiment.</p>\n            <p>The groups were told that they were going to take part in a ‘Grand Tournament', which involved ten different sporting events, and they were shown the prizes for winning. The tournament was also to include in the final scores points which would be awarded for other activities, such as how tidy the cabins were kept. These scores were displayed on big scoreboards in what now became a joint hall where the two groups ate their meals together. This was necessary so the two groups would think they were on almost equal scores in the time leading up to the final event, which would increase the sense of competition. Needless to say, these scores were manipulated by the experimenters.</p>\n            <p>In order to check how high the levels of group self-centredness were in the groups at this time, a number of tasks were set up which involved the groups rating their own members and members of the other group. Each time, group members rated the boys in their own group much better at the tasks than the other boys, even though there was no real difference between them. They were also asked to rate all others in terms of how desirable they were as friends, and 93 per cent of friendship preferences were in-group preferences.</p>\n            <p>When the tournament started, the first game was basketball. The group that was thought to be less tough lost the game and claimed that they had lost only because the other group were bigger and older than they were. The Eagles won the next ball game and then were said to be cheating in the tug-of-war. This resulted in visits by both groups to each other's cabins over the course of the next 24 hours, where they ripped the mosquito nets, turned over the beds and generally made a mess. The Eagles devised a new weapon in the conflict which consisted of ‘rocks in socks' – and so it went on. Eventually, the Eagles won the tournament (with some help from the experimenters) and it was time for phase three to begin.</p>\n            <p>Research has suggested that the best way to reduce group conflict is by non-competitive contact. This required two conditions: that the groups had equal status and that they had a common goal to work towards. This was exactly what Sherif engineered. There were actually seven situations organised which gave the groups equal-status contact; these were things like having meals together or watching films together. The meals resulted in food fights; the films were enjoyed by both groups sitting totally apart from each other.</p>\n            <p>The other situations, where the groups had to work for common goals, had a much better outcome. These included raising money to go and see a film and solving problems, such as one with the water supply. The final common goal was a visit by truck to Cedar Lake to camp there before the end of the holiday. In this situation, although both groups travelled in separate trucks, another problem-solving situation arose when one of the trucks became stuck. All the boys joined in, using one of the tug-of-war ropes to help move it. At this point the group boundaries were beginning to disappear. On the final day, when they were due to return home, the boys themselves suggested that they travel in one bus and sat in friendship groups rather than as Eagles and Rattlers.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>The Robbers Cave Study</h3>\n<h4>A review of a famous study into group behaviour</h4>\n<p>Group self-centredness seems to occur the minute people are divided into groups. It doesn't matter what the group is, or on what basis it was formed, we perceive the group we belong to as being superior to other groups and we develop an ‘in-group' bias.</p>\n<p>Probably one of the most famous pieces of research looking at group behaviour was a field study conducted by Sherif in 1956. This study involved 22 boys aged between 11 and 12, who were divided into two groups. The groups were roughly matched in terms of sporting ability, camping experience and general popularity among their peers. Their parents were told that they were going to a three-week summer camp to see how well they would work alongside other boys when put into different teams. The parents were also told that the boys would not be allowed to be visited during that time, but would be able to go home if they wanted to. It was intended that the data for the study would be collected by participant observers.</p>\n<p>At first, neither set of boys knew of the existence of the other set. They were taken to their respective campsites, which were located on a 200-acre, densely wooded area in Robbers Cave State Park, Oklahoma. The first week was spent doing a variety of activities, such as pitching tents and cooking. During this week, the two groups seemed to develop different group norms, one group being more 'tough' than the other, from which two boys went home early, as they were homesick. The groups were given a set of caps and T-shirts, and gave themselves names: the ‘Eagles' and the ‘Rattlers' (the latter being the tougher group).</p>\n<p>At the end of the first week, they became aware of each other's existence by finding litter left by the other group or overhearing voices. Sherif noticed that already the groups had started to refer to the other group as 'them' and their group as 'us'. This marked the beginning of phase two of the experiment.</p>\n<p>The groups were told that they were going to take part in a ‘Grand Tournament', which involved ten different sporting events, and they were shown the prizes for winning. The tournament was also to include in the final scores points which would be awarded for other activities, such as how tidy the cabins were kept. These scores were displayed on big scoreboards in what now became a joint hall where the two groups ate their meals together. This was necessary so the two groups would think they were on almost equal scores in the time leading up to the final event, which would increase the sense of competition. Needless to say, these scores were manipulated by the experimenters.</p>\n<p>In order to check how high the levels of group self-centredness were in the groups at this time, a number of tasks were set up which involved the groups rating their own members and members of the other group. Each time, group members rated the boys in their own group much better at the tasks than the other boys, even though there was no real difference between them. They were also asked to rate all others in terms of how desirable they were as friends, and 93 per cent of friendship preferences were in-group preferences.</p>\n<p>When the tournament started, the first game was basketball. The group that was thought to be less tough lost the game and claimed that they had lost only because the other group were bigger and older than they were. The Eagles won the next ball game and then were said to be cheating in the tug-of-war. This resulted in visits by both groups to each other's cabins over the course of the next 24 hours, where they ripped the mosquito nets, turned over the beds and generally made a mess. The Eagles devised a new weapon in the conflict which consisted of ‘rocks in socks' – and so it went on. Eventually, the Eagles won the tournament (with some help from the experimenters) and it was time for phase three to begin.</p>\n<p>Research has suggested that the best way to reduce group conflict is by non-competitive contact. This required two conditions: that the groups had equal status and that they had a common goal to work towards. This was exactly what Sherif engineered. There were actually seven situations organised which gave the groups equal-status contact; these were things like having meals together or watching films together. The meals resulted in food fights; the films were enjoyed by both groups sitting totally apart from each other.</p>\n<p>The other situations, where the groups had to work for common goals, had a much better outcome. These included raising money to go and see a film and solving problems, such as one with the water supply. The final common goal was a visit by truck to Cedar Lake to camp there before the end of the holiday. In this situation, although both groups travelled in separate trucks, another problem-solving situation arose when one of the trucks became stuck. All the boys joined in, using one of the tug-of-war ropes to help move it. At this point the group boundaries were beginning to disappear. On the final day, when they were due to return home, the boys themselves suggested that they travel in one bus and sat in friendship groups rather than as Eagles and Rattlers.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -32,7 +32,7 @@
         "q1",
         "q2"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-anchor\">\n                <h4>Questions 27 and 28</h4>\n                <p>Choose <strong>TWO</strong> letters, A–F.</p>\n                <p>Which <strong>TWO</strong> of the following statements about the boys who took part in the study are made by the writer?</p>\n                <div class=\"checkbox-options\">\n                    <label><input name=\"q1_2\" type=\"checkbox\" value=\"A\"> A They had approximately the same number of friends.</label>\n                    <label><input name=\"q1_2\" type=\"checkbox\" value=\"B\"> B Some of their parents helped to set up the camp.</label>\n                    <label><input name=\"q1_2\" type=\"checkbox\" value=\"C\"> C They selected the group that they wanted to be in.</label>\n                    <label><input name=\"q1_2\" type=\"checkbox\" value=\"D\"> D They were responsible for bringing their own tents.</label>\n                    <label><input name=\"q1_2\" type=\"checkbox\" value=\"E\"> E They received clothes that identified the group they belonged to.</label>\n                    <label><input name=\"q1_2\" type=\"checkbox\" value=\"F\"> F Some of them were criticised for dropping litter.</label>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-anchor\">\n<h4>Questions 27 and 28</h4>\n<p>Choose <strong>TWO</strong> letters, A–F.</p>\n<p>Which <strong>TWO</strong> of the following statements about the boys who took part in the study are made by the writer?</p>\n<div class=\"checkbox-options\">\n<label><input name=\"q1_2\" type=\"checkbox\" value=\"A\"> A They had approximately the same number of friends.</label> <label><input name=\"q1_2\" type=\"checkbox\" value=\"B\"> B Some of their parents helped to set up the camp.</label> <label><input name=\"q1_2\" type=\"checkbox\" value=\"C\"> C They selected the group that they wanted to be in.</label> <label><input name=\"q1_2\" type=\"checkbox\" value=\"D\"> D They were responsible for bringing their own tents.</label> <label><input name=\"q1_2\" type=\"checkbox\" value=\"E\"> E They received clothes that identified the group they belonged to.</label> <label><input name=\"q1_2\" type=\"checkbox\" value=\"F\"> F Some of them were criticised for dropping litter.</label>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -46,7 +46,7 @@
         "q7",
         "q8"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q3-4-5-6-7-8-anchor\">\n                <h4>Questions 29–34</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n                <div class=\"summary-completion\">\n                    <h4>The Grand Tournament</h4>\n                    <p>\n                        The Grand Tournament marked the second part of Sherif's experiment. It included a range of <strong>29</strong> <input type=\"text\" id=\"q29_input\" name=\"q3\"> that each team would compete in, and the allocation of extra points for things like cleaning cabins.\n                    </p>\n                    <p>\n                        To increase the competitive element of the tournament, the organisers used <strong>30</strong> <input type=\"text\" id=\"q30_input\" name=\"q4\"> in the dining hall. They also made sure that the boys were under the impression that their scores were nearly <strong>31</strong> <input type=\"text\" id=\"q31_input\" name=\"q5\"> as the tournament neared its end.\n                    </p>\n                     <p>\n                        The <strong>32</strong> <input type=\"text\" id=\"q32_input\" name=\"q6\">, who were thought to be the tougher group, won the first ball game and lost the second. In other games there were accusations of <strong>33</strong> <input type=\"text\" id=\"q33_input\" name=\"q7\">. During the next day, various instances of conflict occurred within the boys' cabins. Eventually, the tournament was won by the group that was considered to be <strong>34</strong> <input type=\"text\" id=\"q34_input\" name=\"q8\"> – the Eagles.\n                    </p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q3-4-5-6-7-8-anchor\">\n<h4>Questions 29–34</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<h4>The Grand Tournament</h4>\n<p>\nThe Grand Tournament marked the second part of Sherif's experiment. It included a range of <strong>29</strong> <input type=\"text\" id=\"q29_input\" name=\"q3\"> that each team would compete in, and the allocation of extra points for things like cleaning cabins.\n</p>\n<p>\nTo increase the competitive element of the tournament, the organisers used <strong>30</strong> <input type=\"text\" id=\"q30_input\" name=\"q4\"> in the dining hall. They also made sure that the boys were under the impression that their scores were nearly <strong>31</strong> <input type=\"text\" id=\"q31_input\" name=\"q5\"> as the tournament neared its end.\n</p>\n<p>\nThe <strong>32</strong> <input type=\"text\" id=\"q32_input\" name=\"q6\">, who were thought to be the tougher group, won the first ball game and lost the second. In other games there were accusations of <strong>33</strong> <input type=\"text\" id=\"q33_input\" name=\"q7\">. During the next day, various instances of conflict occurred within the boys' cabins. Eventually, the tournament was won by the group that was considered to be <strong>34</strong> <input type=\"text\" id=\"q34_input\" name=\"q8\"> – the Eagles.\n</p>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -57,7 +57,7 @@
         "q11",
         "q12"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q9-10-11-12-anchor\">\n                <h4>Questions 35–38</h4>\n                <p>Complete the table below.</p>\n                <p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n                 <table class=\"table-completion\">\n                    <thead>\n                        <tr>\n                            <th colspan=\"3\">Phase 3: Non-competitive contact</th>\n                        </tr>\n                        <tr>\n                            <th>Conditions</th>\n                            <th>Type of situation</th>\n                            <th>Result</th>\n                        </tr>\n                    </thead>\n                    <tbody>\n                        <tr>\n                            <td><strong>Equal status</strong></td>\n                            <td>eating</td>\n                            <td><strong>35</strong> <input type=\"text\" id=\"q35_input\" name=\"q9\"></td>\n                        </tr>\n                        <tr>\n                            <td></td>\n                            <td><strong>36</strong> <input type=\"text\" id=\"q36_input\" name=\"q10\"></td>\n                            <td>enjoyed them but were not sitting together</td>\n                        </tr>\n                        <tr>\n                            <td rowspan=\"2\">A <strong>37</strong> <input type=\"text\" id=\"q37_input\" name=\"q11\"></td>\n                            <td>raising money</td>\n                            <td rowspan=\"2\">friendship groups</td>\n                        </tr>\n                         <tr>\n                            <td><strong>38</strong> <input type=\"text\" id=\"q38_input\" name=\"q12\">, e.g. stuck truck</td>\n                        </tr>\n                    </tbody>\n                </table>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q9-10-11-12-anchor\">\n<h4>Questions 35–38</h4>\n<p>Complete the table below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<table class=\"table-completion\">\n<thead>\n<tr>\n<th colspan=\"3\">Phase 3: Non-competitive contact</th>\n</tr>\n<tr>\n<th>Conditions</th>\n<th>Type of situation</th>\n<th>Result</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>Equal status</strong></td>\n<td>eating</td>\n<td><strong>35</strong> <input type=\"text\" id=\"q35_input\" name=\"q9\"></td>\n</tr>\n<tr>\n<td></td>\n<td><strong>36</strong> <input type=\"text\" id=\"q36_input\" name=\"q10\"></td>\n<td>enjoyed them but were not sitting together</td>\n</tr>\n<tr>\n<td rowspan=\"2\">A <strong>37</strong> <input type=\"text\" id=\"q37_input\" name=\"q11\"></td>\n<td>raising money</td>\n<td rowspan=\"2\">friendship groups</td>\n</tr>\n<tr>\n<td><strong>38</strong> <input type=\"text\" id=\"q38_input\" name=\"q12\">, e.g. stuck truck</td>\n</tr>\n</tbody>\n</table>\n</div>"
     },
     {
       "groupId": "group-4",
@@ -66,7 +66,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q13-14-anchor\">\n                <h4>Questions 39 and 40</h4>\n                <p>Choose <strong>TWO</strong> letters, A–F.</p>\n                <p>Which <strong>TWO</strong> of the following statements are true of the experimenters who ran the study?</p>\n                <div class=\"checkbox-options\">\n                    <label><input name=\"q13_14\" type=\"checkbox\" value=\"A\"> A They collected their data from secret observation posts.</label>\n                    <label><input name=\"q13_14\" type=\"checkbox\" value=\"B\"> B They encouraged the boys to use the terms ‘them' and 'us'.</label>\n                    <label><input name=\"q13_14\" type=\"checkbox\" value=\"C\"> C They used a rating exercise to assess the amount of in-group bias.</label>\n                    <label><input name=\"q13_14\" type=\"checkbox\" value=\"D\"> D They took steps to avoid personal injury among the boys.</label>\n                    <label><input name=\"q13_14\" type=\"checkbox\" value=\"E\"> E They secretly altered some of the results of the tournament.</label>\n                    <label><input name=\"q13_14\" type=\"checkbox\" value=\"F\"> F They joined in with the non-competitive activities.</label>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q13-14-anchor\">\n<h4>Questions 39 and 40</h4>\n<p>Choose <strong>TWO</strong> letters, A–F.</p>\n<p>Which <strong>TWO</strong> of the following statements are true of the experimenters who ran the study?</p>\n<div class=\"checkbox-options\">\n<label><input name=\"q13_14\" type=\"checkbox\" value=\"A\"> A They collected their data from secret observation posts.</label> <label><input name=\"q13_14\" type=\"checkbox\" value=\"B\"> B They encouraged the boys to use the terms ‘them' and 'us'.</label> <label><input name=\"q13_14\" type=\"checkbox\" value=\"C\"> C They used a rating exercise to assess the amount of in-group bias.</label> <label><input name=\"q13_14\" type=\"checkbox\" value=\"D\"> D They took steps to avoid personal injury among the boys.</label> <label><input name=\"q13_14\" type=\"checkbox\" value=\"E\"> E They secretly altered some of the results of the tournament.</label> <label><input name=\"q13_14\" type=\"checkbox\" value=\"F\"> F They joined in with the non-competitive activities.</label>\n</div>\n</div>"
     }
   ],
   "answerKey": {
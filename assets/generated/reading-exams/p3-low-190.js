@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>The Value of Literary Prizes</h3>\n            \n            <p>It is a central paradox of literary writing that true greatness only becomes apparent over time, and yet that the judgements of the future are substantially dependent on what the present chooses to publish, publicise and preserve. Viewed from the pinnacles of hindsight, literary history looks like a stately procession of great texts. A snapshot taken at any particular moment, however, reveals a far messier business: one clogged with readers, writers, commercial obligations, prejudices and misconceptions. All those enduring works that collectively form a standard by which we judge others are busily being forged or maintained within that snapshot. And somewhere close to the heart of this business lies one of the most ancient and contentious of all artistic institutions: the literary prize.</p>\n            <p>The ancient Greeks founded the idea of the literary prize. In fact, the Greek calendar was full of formal contests, most of which were either poetical, athletic or some combination of the two; the competitive singing of dithyrambs—choruses of praise to the god Dionysus— was a kind of literary sport, with groups of up to 50 men or boys moving in stately circles and declaiming verse in order to win the honour of coming first. It might look comical to our eyes, but this was art of the most serious kind. To my mind, just as sporting spectacles today offer people the thrill of watching the human body pushed toward its limits, so the quest for supremacy in words made the deepest concerns of the mind accessible to a wide audience in classical Greece.</p>\n            <p>After the classical era, the importance of prizes diminished. Later, in medieval Europe, aristocratic patrons and learned societies singled out the most promising writers and commissioned and rewarded them. It was only at the start of the 20th century that the first truly modern literary prize arrived. Alfred Nobel, the inventor of dynamite, bequeathed an immense sum, equivalent to US $186m today, to fund five international prizes in the fields of literature, chemistry, physics, medicine and peace (prompted, it is said, by the guilt he felt when a French newspaper described him as a ‘merchant of death'). In 1901, the first Nobel prizes were announced. Crucially, they were awarded not by patrons or clubs, but by impartial and authoritative committees—something as close to an absolute and enduring standard as the modern world could find. Their impact was instant, and the results were reported in over 100 newspapers worldwide. Like the newly reborn Olympic movement (founded in 1896), here was an annual competition that would deliver a stream of victory headlines.</p>\n            <p>Nobel imitators soon came thick and fast: the Goncourt and Femina prizes in France, the Pulitzer in America, and many more. However, as the years went by neither the gradual expansion of the universities nor the increasing number of awards seemed to be infusing the general reader with an overwhelming regard for great literary works. For example, in 1955, the recently formed British Crime Writers' Association started an annual prize for the best crime novel; in the same year, there was an annual award for Science Fiction. What was emerging was a complex system of patronage whose value was open to dispute. Perhaps the most familiar example of this is Britain's Booker prize (now the Man Booker). Where the Nobel had aimed at rewarding 'an ideal direction' in literature, this award intended to stimulate interest ‘in serious British fiction as a whole'. The people behind it had clearly learned something from the bestseller market. The Booker would aim at catching the imagination of the press by establishing an explicitly sporting-style atmosphere: a shortlist of authors, a high-profile panel of judges, an exciting victor. Above all, though, what came to impress was the fact that by the 1990s, winners could regularly expect to shift over 500,000 copies.</p>\n            <p>Yet there is a pale glow of illusion surrounding the wilder claims made for prizes. Winners can prosper, but no victory guarantees vast sales. Most importantly, there is still no substitute for word of mouth. In 2007, <em>The Reluctant Fundamentalist</em> by Mohsin Hamid lost out to Kiran Desai's <em>The Inheritance of Loss</em> in the Man Booker, but considerably outsold it, becoming one of the best-performing literary novels of the year. It was also a far more ambitious and exciting book. Prizes grant opportunities, but their winners remain at the mercy of the reading public. And the bottom line is that this public is ill-served by much of the current marketplace of overlapping awards and those books that are manufactured to claim them—sensitive, trendy tracts of needlessly effortful prose whose elegant openings so impress some juries.</p>\n            <p>If, however, we are willing to have a little more faith in the hunger that's still out there for fresh, awakening words, there remain causes for hope. Literature should take a step towards this audience—should wind down some of the media circus, shed its timid obsession with narrow categories, and learn a little more from the worlds both of genre fiction (where much that is most exciting in contemporary writing is taking place) and grassroots prizes like the Man Booker. But we should thin out the other awards, and spend some money instead on competitions that will get writers' first books into print. We should restore proper expertise to juries, and then—and only then—open the door to science fiction, crime, thrillers, horror and everything else that's out there racking up sales.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>The Value of Literary Prizes</h3>\n<p>It is a central paradox of literary writing that true greatness only becomes apparent over time, and yet that the judgements of the future are substantially dependent on what the present chooses to publish, publicise and preserve. Viewed from the pinnacles of hindsight, literary history looks like a stately procession of great texts. A snapshot taken at any particular moment, however, reveals a far messier business: one clogged with readers, writers, commercial obligations, prejudices and misconceptions. All those enduring works that collectively form a standard by which we judge others are busily being forged or maintained within that snapshot. And somewhere close to the heart of this business lies one of the most ancient and contentious of all artistic institutions: the literary prize.</p>\n<p>The ancient Greeks founded the idea of the literary prize. In fact, the Greek calendar was full of formal contests, most of which were either poetical, athletic or some combination of the two; the competitive singing of dithyrambs—choruses of praise to the god Dionysus— was a kind of literary sport, with groups of up to 50 men or boys moving in stately circles and declaiming verse in order to win the honour of coming first. It might look comical to our eyes, but this was art of the most serious kind. To my mind, just as sporting spectacles today offer people the thrill of watching the human body pushed toward its limits, so the quest for supremacy in words made the deepest concerns of the mind accessible to a wide audience in classical Greece.</p>\n<p>After the classical era, the importance of prizes diminished. Later, in medieval Europe, aristocratic patrons and learned societies singled out the most promising writers and commissioned and rewarded them. It was only at the start of the 20th century that the first truly modern literary prize arrived. Alfred Nobel, the inventor of dynamite, bequeathed an immense sum, equivalent to US $186m today, to fund five international prizes in the fields of literature, chemistry, physics, medicine and peace (prompted, it is said, by the guilt he felt when a French newspaper described him as a ‘merchant of death'). In 1901, the first Nobel prizes were announced. Crucially, they were awarded not by patrons or clubs, but by impartial and authoritative committees—something as close to an absolute and enduring standard as the modern world could find. Their impact was instant, and the results were reported in over 100 newspapers worldwide. Like the newly reborn Olympic movement (founded in 1896), here was an annual competition that would deliver a stream of victory headlines.</p>\n<p>Nobel imitators soon came thick and fast: the Goncourt and Femina prizes in France, the Pulitzer in America, and many more. However, as the years went by neither the gradual expansion of the universities nor the increasing number of awards seemed to be infusing the general reader with an overwhelming regard for great literary works. For example, in 1955, the recently formed British Crime Writers' Association started an annual prize for the best crime novel; in the same year, there was an annual award for Science Fiction. What was emerging was a complex system of patronage whose value was open to dispute. Perhaps the most familiar example of this is Britain's Booker prize (now the Man Booker). Where the Nobel had aimed at rewarding 'an ideal direction' in literature, this award intended to stimulate interest ‘in serious British fiction as a whole'. The people behind it had clearly learned something from the bestseller market. The Booker would aim at catching the imagination of the press by establishing an explicitly sporting-style atmosphere: a shortlist of authors, a high-profile panel of judges, an exciting victor. Above all, though, what came to impress was the fact that by the 1990s, winners could regularly expect to shift over 500,000 copies.</p>\n<p>Yet there is a pale glow of illusion surrounding the wilder claims made for prizes. Winners can prosper, but no victory guarantees vast sales. Most importantly, there is still no substitute for word of mouth. In 2007, <em>The Reluctant Fundamentalist</em> by Mohsin Hamid lost out to Kiran Desai's <em>The Inheritance of Loss</em> in the Man Booker, but considerably outsold it, becoming one of the best-performing literary novels of the year. It was also a far more ambitious and exciting book. Prizes grant opportunities, but their winners remain at the mercy of the reading public. And the bottom line is that this public is ill-served by much of the current marketplace of overlapping awards and those books that are manufactured to claim them—sensitive, trendy tracts of needlessly effortful prose whose elegant openings so impress some juries.</p>\n<p>If, however, we are willing to have a little more faith in the hunger that's still out there for fresh, awakening words, there remain causes for hope. Literature should take a step towards this audience—should wind down some of the media circus, shed its timid obsession with narrow categories, and learn a little more from the worlds both of genre fiction (where much that is most exciting in contemporary writing is taking place) and grassroots prizes like the Man Booker. But we should thin out the other awards, and spend some money instead on competitions that will get writers' first books into print. We should restore proper expertise to juries, and then—and only then—open the door to science fiction, crime, thrillers, horror and everything else that's out there racking up sales.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -34,7 +34,7 @@
         "q3",
         "q4"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n                <h4>Questions 27–30</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>27</strong> What is the writer's main point about great literary works in the first paragraph?</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A They often attract unfair criticism.</label></li>\n                        <li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B Readers today are more interested in other types of writing.</label></li>\n                        <li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C Their quality is not always immediately recognised.</label></li>\n                        <li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D Publishers do not see them as commercially attractive.</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> The writer compares Greek poetry contests to sports events because of</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A their impact on spectators.</label></li>\n                        <li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B the amount of preparation required.</label></li>\n                        <li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C the fame enjoyed by top performers.</label></li>\n                        <li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D the common criticisms made of them.</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> What point is the writer making in the fourth paragraph?</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A International awards encouraged people to write.</label></li>\n                        <li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B People paid little attention to the creation of new prizes.</label></li>\n                        <li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C Readers began to see the value of many different types of writing.</label></li>\n                        <li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D More awards did not lead to a greater appreciation of literary merit.</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> What are we told about the development of the Man Booker prize?</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A The media did not take it seriously at first.</label></li>\n                        <li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B It had a similar focus to that of the Nobel prize.</label></li>\n                        <li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C The organisers knew how to generate interest in it.</label></li>\n                        <li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D Writers were not likely to gain more from it than the honour of winning.</label></li>\n                    </ul>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> What is the writer's main point about great literary works in the first paragraph?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A They often attract unfair criticism.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B Readers today are more interested in other types of writing.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C Their quality is not always immediately recognised.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D Publishers do not see them as commercially attractive.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> The writer compares Greek poetry contests to sports events because of</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A their impact on spectators.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B the amount of preparation required.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C the fame enjoyed by top performers.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D the common criticisms made of them.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> What point is the writer making in the fourth paragraph?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A International awards encouraged people to write.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B People paid little attention to the creation of new prizes.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C Readers began to see the value of many different types of writing.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D More awards did not lead to a greater appreciation of literary merit.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What are we told about the development of the Man Booker prize?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A The media did not take it seriously at first.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B It had a similar focus to that of the Nobel prize.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C The organisers knew how to generate interest in it.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D Writers were not likely to gain more from it than the honour of winning.</label></li>\n</ul>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n                <h4>Questions 31–35</h4>\n                <p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n                <p>In boxes 31–35 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p><strong>31</strong> The founders of the Man Booker prize rejected high-profile commercialisation of its prize.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>32</strong> The judges of the 2007 Man Booker prize came to regret their choice of winning title.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> Some authors deliberately write in an exaggerated style which they think will attract judges.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>34</strong> There should be a reduction in the number of literary awards.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>35</strong> Juries of literary awards should consist of writers rather than critics.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n<h4>Questions 31–35</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<p>In boxes 31–35 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>31</strong> The founders of the Man Booker prize rejected high-profile commercialisation of its prize.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> The judges of the 2007 Man Booker prize came to regret their choice of winning title.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Some authors deliberately write in an exaggerated style which they think will attract judges.</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> There should be a reduction in the number of literary awards.</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Juries of literary awards should consist of writers rather than critics.</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n                <h4>Questions 36–40</h4>\n                <p>Complete each sentence with the correct ending, <strong>A–G</strong>, below.</p>\n                <div class=\"match-question-item-sentence\">\n                    <p><strong>36</strong> In ancient Greece, prizes</p>\n                    <div class=\"match-match-dropzone-sentence match-dropzone\" data-question=\"q10\"></div>\n                </div>\n                <div class=\"match-question-item-sentence\">\n                    <p><strong>37</strong> In the post-classical period, literary prizes</p>\n                    <div class=\"match-match-dropzone-sentence match-dropzone\" data-question=\"q11\"></div>\n                </div>\n                <div class=\"match-question-item-sentence\">\n                    <p><strong>38</strong> In medieval Europe, talented writers</p>\n                    <div class=\"match-match-dropzone-sentence match-dropzone\" data-question=\"q12\"></div>\n                </div>\n                <div class=\"match-question-item-sentence\">\n                    <p><strong>39</strong> The first results issued by the Nobel foundation</p>\n                    <div class=\"match-match-dropzone-sentence match-dropzone\" data-question=\"q13\"></div>\n                </div>\n                <div class=\"match-question-item-sentence\">\n                    <p><strong>40</strong> After the establishment of the Nobel prizes, other awards</p>\n                    <div class=\"match-match-dropzone-sentence match-dropzone\" data-question=\"q14\"></div>\n                </div>\n\n                <div class=\"options-pool\" id=\"sentence-endings-pool\">\n                    <strong>List of Endings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"A\" data-pool-id=\"sentence-endings-pool\"><strong>A</strong> were considered to be less significant than previously.</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"B\" data-pool-id=\"sentence-endings-pool\"><strong>B</strong> were intended to be a boost to public education.</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"C\" data-pool-id=\"sentence-endings-pool\"><strong>C</strong> were covered by the international press.</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"D\" data-pool-id=\"sentence-endings-pool\"><strong>D</strong> were supported by wealthy people.</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"E\" data-pool-id=\"sentence-endings-pool\"><strong>E</strong> were felt to be out of touch with their time.</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"F\" data-pool-id=\"sentence-endings-pool\"><strong>F</strong> were presented for many different categories of literature.</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"G\" data-pool-id=\"sentence-endings-pool\"><strong>G</strong> were presented to teams for oral performance of sacred works.</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–G</strong>, below.</p>\n<div class=\"match-question-item-sentence\">\n<p><strong>36</strong> In ancient Greece, prizes</p>\n<div class=\"match-match-dropzone-sentence match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item-sentence\">\n<p><strong>37</strong> In the post-classical period, literary prizes</p>\n<div class=\"match-match-dropzone-sentence match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item-sentence\">\n<p><strong>38</strong> In medieval Europe, talented writers</p>\n<div class=\"match-match-dropzone-sentence match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"match-question-item-sentence\">\n<p><strong>39</strong> The first results issued by the Nobel foundation</p>\n<div class=\"match-match-dropzone-sentence match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div class=\"match-question-item-sentence\">\n<p><strong>40</strong> After the establishment of the Nobel prizes, other awards</p>\n<div class=\"match-match-dropzone-sentence match-dropzone\" data-question=\"q14\"></div>\n</div>\n<div class=\"options-pool\" id=\"sentence-endings-pool\">\n<strong>List of Endings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\" data-pool-id=\"sentence-endings-pool\"><strong>A</strong> were considered to be less significant than previously.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\" data-pool-id=\"sentence-endings-pool\"><strong>B</strong> were intended to be a boost to public education.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\" data-pool-id=\"sentence-endings-pool\"><strong>C</strong> were covered by the international press.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\" data-pool-id=\"sentence-endings-pool\"><strong>D</strong> were supported by wealthy people.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\" data-pool-id=\"sentence-endings-pool\"><strong>E</strong> were felt to be out of touch with their time.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\" data-pool-id=\"sentence-endings-pool\"><strong>F</strong> were presented for many different categories of literature.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\" data-pool-id=\"sentence-endings-pool\"><strong>G</strong> were presented to teams for oral performance of sacred works.</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false
     }
   ],
@@ -11,7 +11,7 @@
       {
         "blockId": "passage-main",
         "kind": "text",
-        "bodyHtml": "<h2>READING PASSAGE 3</h2>\n    <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n    \n    <h3>Child's Play in Medieval England</h3>\n    <p><em>Professor Nicholas Orme investigates childhood in the Middle Ages</em></p>\n    \n    <h4>A</h4>\n    <p>'Play up! Play up! And play the game!' The ringing chorus of Sir Henry Newbolt's celebrated cricket poem ‘Vitai Lampada' (1908) sums up views about play in 19th- and early 20th-century Britain. Children's play was important, and adults should regulate and direct it. Games promoted endurance, self-discipline and team spirit – qualities needed for the health of society and government. Newbolt was one in a long line of people who thought in this way. The notion that children's play should be used for educational and social purposes goes back at least to the ancient Greeks and the toys and games of medieval England tell us much about how adults then saw childhood. But they also reveal a good deal about children themselves, and cast light on what has recently become a controversial issue.</p>\n    \n    <h4>B</h4>\n    <p>Forty years ago, the French historian Philippe Aries argued, in Centuries of Childhood, that childhood in the Middle Ages did not exist in its modern sense. Children were regarded by adults with relatively little affection and followed a way of life not very different from that of their elders. More recent historians have disputed this, pointing to plentiful signs of parental affection and arguing that childhood, by its very nature, must always have been much the same.</p>\n    \n    <h4>C</h4>\n    <p>In this debate play is crucial. Did adults encourage it? If so, did they see it as recreational (by providing toys, for example) or as educational (making children play in particular ways)? Did children play as their elders told them, or did they invent their own games, away from adults and even against their wishes? These questions can be answered from a rich body of evidence including actual toys of the period, pictures of children's activities in contemporary manuscripts and literary sources such as religious works and dictionaries. We know not only how medieval English children played but what their elders thought on the subject.</p>\n    \n    <h4>D</h4>\n    <p>We know, for example, that adults gave children toys from infancy onwards. In 1398 the writer John Trevisa describes babies playing with 'a child's brooch', an object similar in function to the bright plastic toys given to babies today to bite and handle. William Horman, 16th-century author of a Latin textbook, talks of buying a rattle to stop a baby crying. Indeed, by 1300 it appears there was a toy industry in England. Boys' toys often took military forms, such as the two metal soldiers of that date, found in London, and made from a mould. Girls had dolls, known before the 17th century as 'poppets' or puppets, commercially manufactured, imported and, in 1582, taxed at a halfpenny each. Not that children were by any means dependent on things that were bought for them. Gerald of Wales recalls how he and his brothers built towns, palaces, churches and monasteries from sand at Manorbier Castle in about 1150 (perhaps on the nearby beach).</p>\n    \n    <h4>E</h4>\n    <p>Active games were universal. In his English-to-Latin dictionary of 1440, a mysterious recluse known as Geoffrey mentions children playing ‘tennis' and swinging on what he calls a 'totter' or 'merrytotter'. Children chased each other, swam and played ball games. Boys in the later Middle Ages shot arrows with bows, and archery is an example of a sport encouraged by adults, who wanted boys to grow up to play their part in what was, for most men, a warrior society.</p>\n    \n    <h4>F</h4>\n    <p>However, by no means all children's military activity was directed by adults. In 1400, six months after King Richard II had been overthrown by Henry IV, the children of London gathered together and chose themselves kings. Adam of Usk tells us they congregated 'in thousands ... and made war upon each other ... whereby many died'. The new king had to order their parents and masters to stop them.</p>\n    \n    <h4>G</h4>\n    <p>This willingness of children to take the initiative in play, not just to wait for adults to direct them, is evident in the way they observed the calendar. Medieval life was regulated by light, weather, crops and the Church's cycle of fasts and festivals. Children shared in the adult round of religious festivals, but had their own observances as well, semi-detached from their elders. In the 1200s, the priest Thomas Docking remarked that in spring a child 'follows the ploughman; in autumn he accompanies the grape-gatherers'. In 1518, the poet Alexander Barclay records children playing with tops in March, looking for fruit in summer and making footballs by filling pigs' bladders with dried peas in autumn.</p>\n    \n    <h4>H</h4>\n    <p>It is clear from this evidence that the relationship between adults and children in medieval society was, in major respects, a modern one. Parents took an indulgent interest in their children, providing them with toys and giving them time to play. Children played in a wide variety of ways – imaginatively, skilfully, athletically and violently – developing their minds, bodies and social skills. Adults tried at times to direct play – partly to keep children in order, partly to give them skills for adult life – but children gravitated to one another and formed a culture of their own. We can answer Aries's thesis, then, with a resounding ‘No!’. Childhood has always been much the same.</p>\n    \n    <p>&nbsp;</p> <!-- Final padding -->\n  </section>\n\n  <!-- Draggable Divider -->\n  <div id=\"divider\" title=\"Drag to resize\"></div>\n\n  <!-- Right Pane: Questions and Controls -->"
+        "bodyHtml": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Child's Play in Medieval England</h3>\n<p><em>Professor Nicholas Orme investigates childhood in the Middle Ages</em></p>\n<h4>A</h4>\n<p>'Play up! Play up! And play the game!' The ringing chorus of Sir Henry Newbolt's celebrated cricket poem ‘Vitai Lampada' (1908) sums up views about play in 19th- and early 20th-century Britain. Children's play was important, and adults should regulate and direct it. Games promoted endurance, self-discipline and team spirit – qualities needed for the health of society and government. Newbolt was one in a long line of people who thought in this way. The notion that children's play should be used for educational and social purposes goes back at least to the ancient Greeks and the toys and games of medieval England tell us much about how adults then saw childhood. But they also reveal a good deal about children themselves, and cast light on what has recently become a controversial issue.</p>\n<h4>B</h4>\n<p>Forty years ago, the French historian Philippe Aries argued, in Centuries of Childhood, that childhood in the Middle Ages did not exist in its modern sense. Children were regarded by adults with relatively little affection and followed a way of life not very different from that of their elders. More recent historians have disputed this, pointing to plentiful signs of parental affection and arguing that childhood, by its very nature, must always have been much the same.</p>\n<h4>C</h4>\n<p>In this debate play is crucial. Did adults encourage it? If so, did they see it as recreational (by providing toys, for example) or as educational (making children play in particular ways)? Did children play as their elders told them, or did they invent their own games, away from adults and even against their wishes? These questions can be answered from a rich body of evidence including actual toys of the period, pictures of children's activities in contemporary manuscripts and literary sources such as religious works and dictionaries. We know not only how medieval English children played but what their elders thought on the subject.</p>\n<h4>D</h4>\n<p>We know, for example, that adults gave children toys from infancy onwards. In 1398 the writer John Trevisa describes babies playing with 'a child's brooch', an object similar in function to the bright plastic toys given to babies today to bite and handle. William Horman, 16th-century author of a Latin textbook, talks of buying a rattle to stop a baby crying. Indeed, by 1300 it appears there was a toy industry in England. Boys' toys often took military forms, such as the two metal soldiers of that date, found in London, and made from a mould. Girls had dolls, known before the 17th century as 'poppets' or puppets, commercially manufactured, imported and, in 1582, taxed at a halfpenny each. Not that children were by any means dependent on things that were bought for them. Gerald of Wales recalls how he and his brothers built towns, palaces, churches and monasteries from sand at Manorbier Castle in about 1150 (perhaps on the nearby beach).</p>\n<h4>E</h4>\n<p>Active games were universal. In his English-to-Latin dictionary of 1440, a mysterious recluse known as Geoffrey mentions children playing ‘tennis' and swinging on what he calls a 'totter' or 'merrytotter'. Children chased each other, swam and played ball games. Boys in the later Middle Ages shot arrows with bows, and archery is an example of a sport encouraged by adults, who wanted boys to grow up to play their part in what was, for most men, a warrior society.</p>\n<h4>F</h4>\n<p>However, by no means all children's military activity was directed by adults. In 1400, six months after King Richard II had been overthrown by Henry IV, the children of London gathered together and chose themselves kings. Adam of Usk tells us they congregated 'in thousands ... and made war upon each other ... whereby many died'. The new king had to order their parents and masters to stop them.</p>\n<h4>G</h4>\n<p>This willingness of children to take the initiative in play, not just to wait for adults to direct them, is evident in the way they observed the calendar. Medieval life was regulated by light, weather, crops and the Church's cycle of fasts and festivals. Children shared in the adult round of religious festivals, but had their own observances as well, semi-detached from their elders. In the 1200s, the priest Thomas Docking remarked that in spring a child 'follows the ploughman; in autumn he accompanies the grape-gatherers'. In 1518, the poet Alexander Barclay records children playing with tops in March, looking for fruit in summer and making footballs by filling pigs' bladders with dried peas in autumn.</p>\n<h4>H</h4>\n<p>It is clear from this evidence that the relationship between adults and children in medieval society was, in major respects, a modern one. Parents took an indulgent interest in their children, providing them with toys and giving them time to play. Children played in a wide variety of ways – imaginatively, skilfully, athletically and violently – developing their minds, bodies and social skills. Adults tried at times to direct play – partly to keep children in order, partly to give them skills for adult life – but children gravitated to one another and formed a culture of their own. We can answer Aries's thesis, then, with a resounding ‘No!’. Childhood has always been much the same.</p>\n<p>&nbsp;</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"
       }
     ]
   },
@@ -26,7 +26,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <a id=\"q1-anchor\"></a>\n      <h4>Questions 27–31</h4>\n      <p>Which paragraph contains the following information?</p>\n      <div class=\"q-block\"><p><strong>27</strong> economic evidence for play in medieval England</p><div class=\"options\"><label><input type=\"radio\" name=\"q1\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q1\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q1\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q1\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q1\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q1\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q1\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q1\" value=\"H\"> H</label></div></div>\n      <div class=\"q-block\"><p><strong>28</strong> an example of how children created their own toys</p><div class=\"options\"><label><input type=\"radio\" name=\"q2\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q2\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q2\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q2\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q2\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q2\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q2\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q2\" value=\"H\"> H</label></div></div>\n      <div class=\"q-block\"><p><strong>29</strong> an example of warlike play approved by grown-ups</p><div class=\"options\"><label><input type=\"radio\" name=\"q3\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q3\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q3\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q3\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q3\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q3\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q3\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q3\" value=\"H\"> H</label></div></div>\n      <div class=\"q-block\"><p><strong>30</strong> a political event mirrored in children's play</p><div class=\"options\"><label><input type=\"radio\" name=\"q4\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q4\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q4\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q4\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q4\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q4\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q4\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q4\" value=\"H\"> H</label></div></div>\n      <div class=\"q-block\"><p><strong>31</strong> the origin of an academic debate about medieval life</p><div class=\"options\"><label><input type=\"radio\" name=\"q5\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q5\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q5\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q5\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q5\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q5\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q5\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q5\" value=\"H\"> H</label></div></div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<a id=\"q1-anchor\"></a>\n<h4>Questions 27–31</h4>\n<p>Which paragraph contains the following information?</p>\n<div class=\"q-block\"><p><strong>27</strong> economic evidence for play in medieval England</p><div class=\"options\"><label><input type=\"radio\" name=\"q1\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q1\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q1\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q1\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q1\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q1\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q1\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q1\" value=\"H\"> H</label></div></div>\n<div class=\"q-block\"><p><strong>28</strong> an example of how children created their own toys</p><div class=\"options\"><label><input type=\"radio\" name=\"q2\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q2\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q2\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q2\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q2\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q2\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q2\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q2\" value=\"H\"> H</label></div></div>\n<div class=\"q-block\"><p><strong>29</strong> an example of warlike play approved by grown-ups</p><div class=\"options\"><label><input type=\"radio\" name=\"q3\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q3\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q3\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q3\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q3\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q3\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q3\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q3\" value=\"H\"> H</label></div></div>\n<div class=\"q-block\"><p><strong>30</strong> a political event mirrored in children's play</p><div class=\"options\"><label><input type=\"radio\" name=\"q4\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q4\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q4\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q4\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q4\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q4\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q4\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q4\" value=\"H\"> H</label></div></div>\n<div class=\"q-block\"><p><strong>31</strong> the origin of an academic debate about medieval life</p><div class=\"options\"><label><input type=\"radio\" name=\"q5\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q5\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q5\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q5\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q5\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q5\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q5\" value=\"G\"> G</label><label><input type=\"radio\" name=\"q5\" value=\"H\"> H</label></div></div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -37,7 +37,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <a id=\"q6-anchor\"></a>\n      <h4>Questions 32–35</h4>\n      <p>Match each date with the correct event, A–J.</p>\n      <div class=\"q-match-item\"><span class=\"q-text\"><strong>32</strong> 1400</span><span class=\"dropzone match-dropzone\" data-target=\"q6\" data-question=\"q6\"></span></div>\n      <div class=\"q-match-item\"><span class=\"q-text\"><strong>33</strong> 1518</span><span class=\"dropzone match-dropzone\" data-target=\"q7\" data-question=\"q7\"></span></div>\n      <div class=\"q-match-item\"><span class=\"q-text\"><strong>34</strong> 1582</span><span class=\"dropzone match-dropzone\" data-target=\"q8\" data-question=\"q8\"></span></div>\n      <div class=\"q-match-item\"><span class=\"q-text\"><strong>35</strong> 1908</span><span class=\"dropzone match-dropzone\" data-target=\"q9\" data-question=\"q9\"></span></div>\n      <div class=\"option-pool\" id=\"pool-events\">\n        <div class=\"card\" draggable=\"true\" data-value=\"A\"><strong>A</strong> invention of cricket</div><div class=\"card\" draggable=\"true\" data-value=\"B\"><strong>B</strong> children picking grapes</div><div class=\"card\" draggable=\"true\" data-value=\"C\"><strong>C</strong> poem about value of games</div><div class=\"card\" draggable=\"true\" data-value=\"D\"><strong>D</strong> early toy manufacturing in England</div><div class=\"card\" draggable=\"true\" data-value=\"E\"><strong>E</strong> puppets first imported into England</div><div class=\"card\" draggable=\"true\" data-value=\"F\"><strong>F</strong> dolls taxed in England</div><div class=\"card\" draggable=\"true\" data-value=\"G\"><strong>G</strong> death of Adam of Usk</div><div class=\"card\" draggable=\"true\" data-value=\"H\"><strong>H</strong> children playing tennis</div><div class=\"card\" draggable=\"true\" data-value=\"I\"><strong>I</strong> children's gang warfare</div><div class=\"card\" draggable=\"true\" data-value=\"J\"><strong>J</strong> a description of seasonal activities</div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<a id=\"q6-anchor\"></a>\n<h4>Questions 32–35</h4>\n<p>Match each date with the correct event, A–J.</p>\n<div class=\"q-match-item\"><span class=\"q-text\"><strong>32</strong> 1400</span><span class=\"dropzone match-dropzone\" data-target=\"q6\" data-question=\"q6\"></span></div>\n<div class=\"q-match-item\"><span class=\"q-text\"><strong>33</strong> 1518</span><span class=\"dropzone match-dropzone\" data-target=\"q7\" data-question=\"q7\"></span></div>\n<div class=\"q-match-item\"><span class=\"q-text\"><strong>34</strong> 1582</span><span class=\"dropzone match-dropzone\" data-target=\"q8\" data-question=\"q8\"></span></div>\n<div class=\"q-match-item\"><span class=\"q-text\"><strong>35</strong> 1908</span><span class=\"dropzone match-dropzone\" data-target=\"q9\" data-question=\"q9\"></span></div>\n<div class=\"option-pool\" id=\"pool-events\">\n<div class=\"card\" draggable=\"true\" data-value=\"A\"><strong>A</strong> invention of cricket</div><div class=\"card\" draggable=\"true\" data-value=\"B\"><strong>B</strong> children picking grapes</div><div class=\"card\" draggable=\"true\" data-value=\"C\"><strong>C</strong> poem about value of games</div><div class=\"card\" draggable=\"true\" data-value=\"D\"><strong>D</strong> early toy manufacturing in England</div><div class=\"card\" draggable=\"true\" data-value=\"E\"><strong>E</strong> puppets first imported into England</div><div class=\"card\" draggable=\"true\" data-value=\"F\"><strong>F</strong> dolls taxed in England</div><div class=\"card\" draggable=\"true\" data-value=\"G\"><strong>G</strong> death of Adam of Usk</div><div class=\"card\" draggable=\"true\" data-value=\"H\"><strong>H</strong> children playing tennis</div><div class=\"card\" draggable=\"true\" data-value=\"I\"><strong>I</strong> children's gang warfare</div><div class=\"card\" draggable=\"true\" data-value=\"J\"><strong>J</strong> a description of seasonal activities</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -49,7 +49,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <a id=\"q10-anchor\"></a>\n      <h4>Questions 36–40</h4>\n      <p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n      <div class=\"q-block\"><p><strong>36</strong> Little is known about adult attitudes to children's play in the Middle Ages.</p><div class=\"options-col\"><label><input type=\"radio\" name=\"q10\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q10\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q10\" value=\"not given\"> NOT GIVEN</label></div></div>\n      <div class=\"q-block\"><p><strong>37</strong> Most toys were imported into England before 1300.</p><div class=\"options-col\"><label><input type=\"radio\" name=\"q11\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q11\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q11\" value=\"not given\"> NOT GIVEN</label></div></div>\n      <div class=\"q-block\"><p><strong>38</strong> Medieval children celebrated the seasons in their own ways.</p><div class=\"options-col\"><label><input type=\"radio\" name=\"q12\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q12\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q12\" value=\"not given\"> NOT GIVEN</label></div></div>\n      <div class=\"q-block\"><p><strong>39</strong> Medieval children made presents for their parents on special occasions.</p><div class=\"options-col\"><label><input type=\"radio\" name=\"q13\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q13\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q13\" value=\"not given\"> NOT GIVEN</label></div></div>\n      <div class=\"q-block\"><p><strong>40</strong> Parents and children in the Middle Ages behaved much as they do today.</p><div class=\"options-col\"><label><input type=\"radio\" name=\"q14\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q14\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q14\" value=\"not given\"> NOT GIVEN</label></div></div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<a id=\"q10-anchor\"></a>\n<h4>Questions 36–40</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<div class=\"q-block\"><p><strong>36</strong> Little is known about adult attitudes to children's play in the Middle Ages.</p><div class=\"options-col\"><label><input type=\"radio\" name=\"q10\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q10\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q10\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>37</strong> Most toys were imported into England before 1300.</p><div class=\"options-col\"><label><input type=\"radio\" name=\"q11\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q11\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q11\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>38</strong> Medieval children celebrated the seasons in their own ways.</p><div class=\"options-col\"><label><input type=\"radio\" name=\"q12\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q12\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q12\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>39</strong> Medieval children made presents for their parents on special occasions.</p><div class=\"options-col\"><label><input type=\"radio\" name=\"q13\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q13\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q13\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>40</strong> Parents and children in the Middle Ages behaved much as they do today.</p><div class=\"options-col\"><label><input type=\"radio\" name=\"q14\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q14\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q14\" value=\"not given\"> NOT GIVEN</label></div></div>\n</div>"
     }
   ],
   "answerKey": {
@@ -11,7 +11,7 @@
       {
         "blockId": "passage-main",
         "kind": "text",
-        "bodyHtml": "<h2>READING PASSAGE 3 <span id=\"timer\">00:00</span></h2>\n    <p>You should spend about 20 minutes on <strong>Questions 27-40</strong>, which are based on Reading Passage 3 below.</p>\n    <h3>The Origin of Language</h3>\n    \n    <p>The origin of language has been a major area of my research for many years. By 1859, when British scientist Charles Darwin published <em>The Origin of Species</em>, there was already a great deal of interest in this subject. However, the debate became plagued by strange theories, so much so that in 1866 the influential Societe de Linguistique de Paris banned all discussions about the origin of language. The ban lasted for more than a century, before a surge of research began during the 1990s. Linguists, psychologists, anthropologists and archaeologists now frequently debate the origin of language and have published many articles and books on this topic. And yet, despite almost frenzied activity, limited progress has been made.</p>\n    \n    <p>I believe there are four reasons for this. The first is an insufficient concern with the archaeological and fossil proof of the brains and behaviour of our human ancestors. Many theories to date rely on an assumed association between brain size and language abilities, without acknowledging the problem this creates: fossil evidence indicates that the Neanderthals had larger brains than modern humans, <em>Homo sapiens</em>, but archaeological evidence indicates that the Neanderthals lacked a capacity for language. So something is seriously amiss with those theories.</p>\n    \n    <p>That 'something' might relate to the second reason for limited progress: insufficient concern with the other major aural and vocal communication system of modern humans: music. Even though the Societe de Linguistique de Paris had nothing to say about studying the origin of music, academics appear to have had a self- imposed ban, with limited discussion of this issue during the 19th and 20th centuries. However, there are notable exceptions that should be acknowledged. One is the aforementioned Charles Darwin who, in his 1871 book on human evolution, <em>The Descent of Man</em>, devoted several pages to the development of music. Another is the renowned ethnomusicologist John Blacking, whose 1973 book, <em>How Musical is Man?</em>, broached the idea that music is an inherent and universal human quality.</p>\n    \n    <p>The origin of music deserves as much attention as that of language, as we cannot treat one without the other. Those writers who had evidently annoyed the Societe de Linguistique de Paris were quite aware of this. For them, music and language were intimately linked; the French writer and philosopher Jean- Jacques Rousseau's <em>On the Origin of Language</em> (1781) was a reflection on both music and language. In contrast, Morten Christiansen and Simon Kirby's book, <em>Language Evolution</em> (2000), which they conceived as 'a definitive book on the subject', failed to mention music in any of its 17 chapters. Those authors have an important lesson to learn from Rousseau and other writers of his time who addressed the origin of language.</p>\n    \n    <p>Music is a universal feature of human society and plays a significant role in the lives of all individuals. Indeed, music is perhaps in even greater need of study than language: the latter has a self- evident function—the transmission of information—and can be readily accepted as a product of evolution, even if its specific evolutionary history remains unclear. But what is the point of music?</p>\n    \n    <p>That question leads directly to a third reason for our lack of progress in understanding how language evolved, and indeed the human mind in general: an insufficient concern with emotion. If music is about anything, it is about expressing emotion. But while archaeologists have put significant effort into examining the intellectual capacities of our ancestors, their emotional lives have been sorely neglected. This has contributed to the neglect of music, which, in turn, has constrained our understanding of language.</p>\n    \n    <p>There is one further reason why progress has been limited: those who have been most influential regarding the evolution of language have simply got it wrong, and misled everyone else. Linguist Derek Bickerton has made an important contribution towards our understanding of the origin of language by bringing his profound knowledge of linguistics to the discussions that have occurred. But Bickerton's idea that the precursor of modern language consisted of words strung together with limited, if any, grammar is, I believe, fundamentally mistaken. Bickerton refers to this precursor as 'proto- language' and suggests that it was similar to the type of language spoken by young children today, and mastered by apes through the use of computer keyboards. This idea has dominated the field of language origins for the last two decades, and is one that I once found persuasive. But I now understand that it is not only flawed but has severely limited the progress that should have been made.</p>\n    \n    <p>My book therefore provides an alternative view, one that draws on the ideas of a linguist who has, I believe, identified the true nature of proto- language. Her name is Alison Wray. She argues that proto- language was 'holistic' rather than compositional in character. By this she means that the precursor to language was a communication system composed of 'messages' rather than words; each message was uniquely associated with an arbitrary meaning, as are the utterances of language today. But in Wray's proto- language, they were not composed out of smaller units of meaning (i.e. words) which could be combined together using a rule system (i.e. grammar) to make more complex messages with emergent meanings. For Wray, proto- language was semantically complex and grammatical. I believe this insight enables us to understand the origin of music as well as language, and to relate both to the emotional lives of our human ancestors.</p>\n    \n    <p>&nbsp;</p>\n  </section>\n  <div id=\"divider\" title=\"Drag to resize\"></div>"
+        "bodyHtml": "<h2>READING PASSAGE 3 <span id=\"timer\">00:00</span></h2>\n<p>You should spend about 20 minutes on <strong>Questions 27-40</strong>, which are based on Reading Passage 3 below.</p>\n<h3>The Origin of Language</h3>\n<p>The origin of language has been a major area of my research for many years. By 1859, when British scientist Charles Darwin published <em>The Origin of Species</em>, there was already a great deal of interest in this subject. However, the debate became plagued by strange theories, so much so that in 1866 the influential Societe de Linguistique de Paris banned all discussions about the origin of language. The ban lasted for more than a century, before a surge of research began during the 1990s. Linguists, psychologists, anthropologists and archaeologists now frequently debate the origin of language and have published many articles and books on this topic. And yet, despite almost frenzied activity, limited progress has been made.</p>\n<p>I believe there are four reasons for this. The first is an insufficient concern with the archaeological and fossil proof of the brains and behaviour of our human ancestors. Many theories to date rely on an assumed association between brain size and language abilities, without acknowledging the problem this creates: fossil evidence indicates that the Neanderthals had larger brains than modern humans, <em>Homo sapiens</em>, but archaeological evidence indicates that the Neanderthals lacked a capacity for language. So something is seriously amiss with those theories.</p>\n<p>That 'something' might relate to the second reason for limited progress: insufficient concern with the other major aural and vocal communication system of modern humans: music. Even though the Societe de Linguistique de Paris had nothing to say about studying the origin of music, academics appear to have had a self- imposed ban, with limited discussion of this issue during the 19th and 20th centuries. However, there are notable exceptions that should be acknowledged. One is the aforementioned Charles Darwin who, in his 1871 book on human evolution, <em>The Descent of Man</em>, devoted several pages to the development of music. Another is the renowned ethnomusicologist John Blacking, whose 1973 book, <em>How Musical is Man?</em>, broached the idea that music is an inherent and universal human quality.</p>\n<p>The origin of music deserves as much attention as that of language, as we cannot treat one without the other. Those writers who had evidently annoyed the Societe de Linguistique de Paris were quite aware of this. For them, music and language were intimately linked; the French writer and philosopher Jean- Jacques Rousseau's <em>On the Origin of Language</em> (1781) was a reflection on both music and language. In contrast, Morten Christiansen and Simon Kirby's book, <em>Language Evolution</em> (2000), which they conceived as 'a definitive book on the subject', failed to mention music in any of its 17 chapters. Those authors have an important lesson to learn from Rousseau and other writers of his time who addressed the origin of language.</p>\n<p>Music is a universal feature of human society and plays a significant role in the lives of all individuals. Indeed, music is perhaps in even greater need of study than language: the latter has a self- evident function—the transmission of information—and can be readily accepted as a product of evolution, even if its specific evolutionary history remains unclear. But what is the point of music?</p>\n<p>That question leads directly to a third reason for our lack of progress in understanding how language evolved, and indeed the human mind in general: an insufficient concern with emotion. If music is about anything, it is about expressing emotion. But while archaeologists have put significant effort into examining the intellectual capacities of our ancestors, their emotional lives have been sorely neglected. This has contributed to the neglect of music, which, in turn, has constrained our understanding of language.</p>\n<p>There is one further reason why progress has been limited: those who have been most influential regarding the evolution of language have simply got it wrong, and misled everyone else. Linguist Derek Bickerton has made an important contribution towards our understanding of the origin of language by bringing his profound knowledge of linguistics to the discussions that have occurred. But Bickerton's idea that the precursor of modern language consisted of words strung together with limited, if any, grammar is, I believe, fundamentally mistaken. Bickerton refers to this precursor as 'proto- language' and suggests that it was similar to the type of language spoken by young children today, and mastered by apes through the use of computer keyboards. This idea has dominated the field of language origins for the last two decades, and is one that I once found persuasive. But I now understand that it is not only flawed but has severely limited the progress that should have been made.</p>\n<p>My book therefore provides an alternative view, one that draws on the ideas of a linguist who has, I believe, identified the true nature of proto- language. Her name is Alison Wray. She argues that proto- language was 'holistic' rather than compositional in character. By this she means that the precursor to language was a communication system composed of 'messages' rather than words; each message was uniquely associated with an arbitrary meaning, as are the utterances of language today. But in Wray's proto- language, they were not composed out of smaller units of meaning (i.e. words) which could be combined together using a rule system (i.e. grammar) to make more complex messages with emergent meanings. For Wray, proto- language was semantically complex and grammatical. I believe this insight enables us to understand the origin of music as well as language, and to relate both to the emotional lives of our human ancestors.</p>\n<p>&nbsp;</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"
       }
     ]
   },
@@ -26,7 +26,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 27-31</h4>\n      <p class=\"question-note\">Choose the correct letter, A, B, C or D.</p>\n      <p>Write the correct letter in boxes 27-31 on your answer sheet.</p>\n      \n      <a id=\"q1-anchor\"></a>\n      <div id=\"q1-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <p>27. In the first paragraph, what does the writer suggest about the origin of language?</p>\n        <div style=\"display:flex; flex-direction: column; gap:8px; margin:4px 0;\">\n          <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"A\"> A. Too many branches of science have been involved in its study.</label>\n          <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"B\"> B. The Societe de Linguistique de Paris instigated research in this area.</label>\n          <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"C\"> C. The lack of progress is surprising given the amount of work being done.</label>\n          <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"D\"> D. Most progress in the study of language was made between 1859 and 1866.</label>\n        </div>\n      </div>\n      \n      <a id=\"q2-anchor\"></a>\n      <div id=\"q2-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <p>28. What is the 'problem' referred to in the second paragraph?</p>\n        <div style=\"display:flex; flex-direction: column; gap:8px; margin:4px 0;\">\n          <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"A\"> A. Some current theories are based on conflicting evidence.</label>\n          <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"B\"> B. There is insufficient fossil evidence to reach a conclusion.</label>\n          <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"C\"> C. Fossil evidence suggests that Homo sapiens had larger brains than Neanderthals.</label>\n          <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"D\"> D. Archaeological evidence shows that Neanderthals were able to talk.</label>\n        </div>\n      </div>\n      \n      <a id=\"q3-anchor\"></a>\n      <div id=\"q3-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <p>29. What does the writer suggest about Jean-Jacques Rousseau's work in 1781?</p>\n        <div style=\"display:flex; flex-direction: column; gap:8px; margin:4px 0;\">\n          <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"A\"> A. Modern theorists should pay more attention to his approach.</label>\n          <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"B\"> B. His ideas supported those of the Societe de Linguistique de Paris.</label>\n          <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"C\"> C. His ideas were mirrored in a later book called Language Evolution.</label>\n          <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"D\"> D. His ideas are too outdated to be of any relevance today.</label>\n        </div>\n      </div>\n      \n      <a id=\"q4-anchor\"></a>\n      <div id=\"q4-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <p>30. What is the writer's current view of Derek Bickerton's ideas?</p>\n        <div style=\"display:flex; flex-direction: column; gap:8px; margin:4px 0;\">\n          <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"A\"> A. They have had little impact on the study of language.</label>\n          <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"B\"> B. They have helped the study of linguistics to progress.</label>\n          <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"C\"> C. They are not accepted by the majority of linguists.</label>\n          <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"D\"> D. The assumption behind them is wrong.</label>\n        </div>\n      </div>\n      \n      <a id=\"q5-anchor\"></a>\n      <div id=\"q5-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n        <p>31. In the final paragraph, the writer concludes that Alison Wray's ideas will help establish a link between</p>\n        <div style=\"display:flex; flex-direction: column; gap:8px; margin:4px 0;\">\n          <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"A\"> A. grammar and meaning.</label>\n          <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"B\"> B. messages and proto-language.</label>\n          <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"C\"> C. language, music and emotions.</label>\n          <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"D\"> D. proto-language and modern semantics.</label>\n        </div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 27-31</h4>\n<p class=\"question-note\">Choose the correct letter, A, B, C or D.</p>\n<p>Write the correct letter in boxes 27-31 on your answer sheet.</p>\n<a id=\"q1-anchor\"></a>\n<div id=\"q1-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<p>27. In the first paragraph, what does the writer suggest about the origin of language?</p>\n<div style=\"display:flex; flex-direction: column; gap:8px; margin:4px 0;\">\n<label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"A\"> A. Too many branches of science have been involved in its study.</label> <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"B\"> B. The Societe de Linguistique de Paris instigated research in this area.</label> <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"C\"> C. The lack of progress is surprising given the amount of work being done.</label> <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"D\"> D. Most progress in the study of language was made between 1859 and 1866.</label>\n</div>\n</div>\n<a id=\"q2-anchor\"></a>\n<div id=\"q2-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<p>28. What is the 'problem' referred to in the second paragraph?</p>\n<div style=\"display:flex; flex-direction: column; gap:8px; margin:4px 0;\">\n<label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"A\"> A. Some current theories are based on conflicting evidence.</label> <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"B\"> B. There is insufficient fossil evidence to reach a conclusion.</label> <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"C\"> C. Fossil evidence suggests that Homo sapiens had larger brains than Neanderthals.</label> <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"D\"> D. Archaeological evidence shows that Neanderthals were able to talk.</label>\n</div>\n</div>\n<a id=\"q3-anchor\"></a>\n<div id=\"q3-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<p>29. What does the writer suggest about Jean-Jacques Rousseau's work in 1781?</p>\n<div style=\"display:flex; flex-direction: column; gap:8px; margin:4px 0;\">\n<label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"A\"> A. Modern theorists should pay more attention to his approach.</label> <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"B\"> B. His ideas supported those of the Societe de Linguistique de Paris.</label> <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"C\"> C. His ideas were mirrored in a later book called Language Evolution.</label> <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"D\"> D. His ideas are too outdated to be of any relevance today.</label>\n</div>\n</div>\n<a id=\"q4-anchor\"></a>\n<div id=\"q4-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<p>30. What is the writer's current view of Derek Bickerton's ideas?</p>\n<div style=\"display:flex; flex-direction: column; gap:8px; margin:4px 0;\">\n<label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"A\"> A. They have had little impact on the study of language.</label> <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"B\"> B. They have helped the study of linguistics to progress.</label> <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"C\"> C. They are not accepted by the majority of linguists.</label> <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"D\"> D. The assumption behind them is wrong.</label>\n</div>\n</div>\n<a id=\"q5-anchor\"></a>\n<div id=\"q5-section\" style=\"padding:8px 0;border-top:1px dashed var(--line);\">\n<p>31. In the final paragraph, the writer concludes that Alison Wray's ideas will help establish a link between</p>\n<div style=\"display:flex; flex-direction: column; gap:8px; margin:4px 0;\">\n<label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"A\"> A. grammar and meaning.</label> <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"B\"> B. messages and proto-language.</label> <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"C\"> C. language, music and emotions.</label> <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"D\"> D. proto-language and modern semantics.</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -39,7 +39,7 @@
         "q10",
         "q11"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 32-37</h4>\n      <p class=\"question-note\">Look at the following statements (Questions 32-37) and the list of people/books below.</p>\n      <p>Match each statement with the correct person/book, A-H.</p>\n      <p>Write the correct letter, A-H, in boxes 32-37 on your answer sheet.</p>\n      \n      <div style=\"margin: 12px 0;\">\n        <div class=\"matching-option\"><strong>32.</strong> The Societe de Linguistique de Paris</div>\n        <select id=\"q6\" name=\"q6\">\n          <option value=\"\">Select option</option>\n          <option value=\"A\">A</option>\n          <option value=\"B\">B</option>\n          <option value=\"C\">C</option>\n          <option value=\"D\">D</option>\n          <option value=\"E\">E</option>\n          <option value=\"F\">F</option>\n          <option value=\"G\">G</option>\n          <option value=\"H\">H</option>\n        </select>\n      </div>\n      \n      <div class=\"matching-option\"><strong>33.</strong> Charles Darwin</div>\n      <select id=\"q7\" name=\"q7\">\n        <option value=\"\">Select option</option>\n        <option value=\"A\">A</option>\n        <option value=\"B\">B</option>\n        <option value=\"C\">C</option>\n        <option value=\"D\">D</option>\n        <option value=\"E\">E</option>\n        <option value=\"F\">F</option>\n        <option value=\"G\">G</option>\n        <option value=\"H\">H</option>\n      </select>\n      \n      <div class=\"matching-option\"><strong>34.</strong> John Blacking</div>\n      <select id=\"q8\" name=\"q8\">\n        <option value=\"\">Select option</option>\n        <option value=\"A\">A</option>\n        <option value=\"B\">B</option>\n        <option value=\"C\">C</option>\n        <option value=\"D\">D</option>\n        <option value=\"E\">E</option>\n        <option value=\"F\">F</option>\n        <option value=\"G\">G</option>\n        <option value=\"H\">H</option>\n      </select>\n      \n      <div class=\"matching-option\"><strong>35.</strong> Christiansen and Kirby</div>\n      <select id=\"q9\" name=\"q9\">\n        <option value=\"\">Select option</option>\n        <option value=\"A\">A</option>\n        <option value=\"B\">B</option>\n        <option value=\"C\">C</option>\n        <option value=\"D\">D</option>\n        <option value=\"E\">E</option>\n        <option value=\"F\">F</option>\n        <option value=\"G\">G</option>\n        <option value=\"H\">H</option>\n      </select>\n      \n      <div class=\"matching-option\"><strong>36.</strong> Derek Bickerton</div>\n      <select id=\"q10\" name=\"q10\">\n        <option value=\"\">Select option</option>\n        <option value=\"A\">A</option>\n        <option value=\"B\">B</option>\n        <option value=\"C\">C</option>\n        <option value=\"D\">D</option>\n        <option value=\"E\">E</option>\n        <option value=\"F\">F</option>\n        <option value=\"G\">G</option>\n        <option value=\"H\">H</option>\n      </select>\n      \n      <div class=\"matching-option\"><strong>37.</strong> Alison Wray</div>\n      <select id=\"q11\" name=\"q11\">\n        <option value=\"\">Select option</option>\n        <option value=\"A\">A</option>\n        <option value=\"B\">B</option>\n        <option value=\"C\">C</option>\n        <option value=\"D\">D</option>\n        <option value=\"E\">E</option>\n        <option value=\"F\">F</option>\n        <option value=\"G\">G</option>\n        <option value=\"H\">H</option>\n      </select>\n      \n      <div style=\"margin-top: 16px; padding: 12px; background: #f8fafc; border-radius: 8px; font-size: 14px;\">\n        <p><strong>List of people/books</strong></p>\n        <p>A. suggested music was an essential part of every individual</p>\n        <p>B. made no link between music and language in a comprehensive study</p>\n        <p>C. believes that early language was very musical</p>\n        <p>D. felt that the origin of language should not be debated</p>\n        <p>E. states that early language was made up of basic words used in an unsystematic way</p>\n        <p>F. devoted 17 chapters of a book to music</p>\n        <p>G. believes that proto-language had no individual words</p>\n        <p>H. referred to music in part of a book about the development of human beings</p>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 32-37</h4>\n<p class=\"question-note\">Look at the following statements (Questions 32-37) and the list of people/books below.</p>\n<p>Match each statement with the correct person/book, A-H.</p>\n<p>Write the correct letter, A-H, in boxes 32-37 on your answer sheet.</p>\n<div style=\"margin: 12px 0;\">\n<div class=\"matching-option\"><strong>32.</strong> The Societe de Linguistique de Paris</div>\n<select id=\"q6\" name=\"q6\">\n<option value=\"\">Select option</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n<option value=\"H\">H</option>\n</select>\n</div>\n<div class=\"matching-option\"><strong>33.</strong> Charles Darwin</div>\n<select id=\"q7\" name=\"q7\">\n<option value=\"\">Select option</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n<option value=\"H\">H</option>\n</select>\n<div class=\"matching-option\"><strong>34.</strong> John Blacking</div>\n<select id=\"q8\" name=\"q8\">\n<option value=\"\">Select option</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n<option value=\"H\">H</option>\n</select>\n<div class=\"matching-option\"><strong>35.</strong> Christiansen and Kirby</div>\n<select id=\"q9\" name=\"q9\">\n<option value=\"\">Select option</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n<option value=\"H\">H</option>\n</select>\n<div class=\"matching-option\"><strong>36.</strong> Derek Bickerton</div>\n<select id=\"q10\" name=\"q10\">\n<option value=\"\">Select option</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n<option value=\"H\">H</option>\n</select>\n<div class=\"matching-option\"><strong>37.</strong> Alison Wray</div>\n<select id=\"q11\" name=\"q11\">\n<option value=\"\">Select option</option>\n<option value=\"A\">A</option>\n<option value=\"B\">B</option>\n<option value=\"C\">C</option>\n<option value=\"D\">D</option>\n<option value=\"E\">E</option>\n<option value=\"F\">F</option>\n<option value=\"G\">G</option>\n<option value=\"H\">H</option>\n</select>\n<div style=\"margin-top: 16px; padding: 12px; background: #f8fafc; border-radius: 8px; font-size: 14px;\">\n<p><strong>List of people/books</strong></p>\n<p>A. suggested music was an essential part of every individual</p>\n<p>B. made no link between music and language in a comprehensive study</p>\n<p>C. believes that early language was very musical</p>\n<p>D. felt that the origin of language should not be debated</p>\n<p>E. states that early language was made up of basic words used in an unsystematic way</p>\n<p>F. devoted 17 chapters of a book to music</p>\n<p>G. believes that proto-language had no individual words</p>\n<p>H. referred to music in part of a book about the development of human beings</p>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -47,7 +47,7 @@
       "questionIds": [
         "q12"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <h4>Questions 38-40</h4>\n      <a id=\"q12-anchor\"></a>\n      <p class=\"question-note\">Choose <strong>THREE</strong> letters, A-G.</p>\n      <p>Write the correct letters in boxes 38-40 on your answer sheet.</p>\n      \n      <p><strong>According to the writer, which THREE of the following areas have not been studied enough in order to understand the origin of language?</strong></p>\n      \n      <div class=\"checkbox-list\">\n        <label>\n          <input type=\"checkbox\" name=\"q12_40\" value=\"A\">\n          <span>A. evidence from prehistoric times</span>\n        </label>\n        <label>\n          <input type=\"checkbox\" name=\"q12_40\" value=\"B\">\n          <span>B. intelligence</span>\n        </label>\n        <label>\n          <input type=\"checkbox\" name=\"q12_40\" value=\"C\">\n          <span>C. individual sounds</span>\n        </label>\n        <label>\n          <input type=\"checkbox\" name=\"q12_40\" value=\"D\">\n          <span>D. music</span>\n        </label>\n        <label>\n          <input type=\"checkbox\" name=\"q12_40\" value=\"E\">\n          <span>E. emotions</span>\n        </label>\n        <label>\n          <input type=\"checkbox\" name=\"q12_40\" value=\"F\">\n          <span>F. human intellect</span>\n        </label>\n        <label>\n          <input type=\"checkbox\" name=\"q12_40\" value=\"G\">\n          <span>G. children's language</span>\n        </label>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 38-40</h4>\n<a id=\"q12-anchor\"></a>\n<p class=\"question-note\">Choose <strong>THREE</strong> letters, A-G.</p>\n<p>Write the correct letters in boxes 38-40 on your answer sheet.</p>\n<p><strong>According to the writer, which THREE of the following areas have not been studied enough in order to understand the origin of language?</strong></p>\n<div class=\"checkbox-list\">\n<label> <input type=\"checkbox\" name=\"q12_40\" value=\"A\"> <span>A. evidence from prehistoric times</span> </label> <label> <input type=\"checkbox\" name=\"q12_40\" value=\"B\"> <span>B. intelligence</span> </label> <label> <input type=\"checkbox\" name=\"q12_40\" value=\"C\"> <span>C. individual sounds</span> </label> <label> <input type=\"checkbox\" name=\"q12_40\" value=\"D\"> <span>D. music</span> </label> <label> <input type=\"checkbox\" name=\"q12_40\" value=\"E\"> <span>E. emotions</span> </label> <label> <input type=\"checkbox\" name=\"q12_40\" value=\"F\"> <span>F. human intellect</span> </label> <label> <input type=\"checkbox\" name=\"q12_40\" value=\"G\"> <span>G. children's language</span> </label>\n</div>\n</div>"
     }
   ],
   "answerKey": {
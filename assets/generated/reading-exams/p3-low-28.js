@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 on the following pages.</p>\n            \n            <h3>Images and Places</h3>\n            <h4>A new research method uses photography to try to explain why people form an attachment to certain places</h4>\n            \n            <div class=\"paragraph-wrapper\" id=\"q1-anchor\">\n                <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"A\" data-question=\"q1\">\n                    <span class=\"paragraph-label\">Question 27 (Sec A):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>A</strong> Human beings naturally become attached to places they visit or inhabit and these emotional attachments have become increasingly important in research on recreation sites and activities. Research into this phenomenon is called 'sense-of-place research'. This research has employed a variety of approaches to gauge people's feelings toward a place, including surveys and personal interviews, but so far has not used photo-based methods. However, Visitor Employed Photography (VEP), used to capture visitor perceptions of landscape and recreational quality, represents a potential innovation in sense-of-place research.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q2-anchor\">\n                <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"B\" data-question=\"q2\">\n                    <span class=\"paragraph-label\">Question 28 (Sec B):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>B</strong> A 'place' is a setting that we give meaning to based on the personal experiences, relationships and feelings we associate with it. A crucial distinction that needs to be made is between the more subjective concept of attachment and the symbolic 'meanings' or labels we use to describe the type of place a setting represents. Is, for example, a multiple-use forest area a wilderness? A playground? A workplace? Symbolic meanings are important in that they form the basis of our attachment to a place: we attribute meaning to our settings, and in turn become attached to the meanings (Stedman, 2003). All settings can have multiple meanings depending on how we encounter them. Some researchers suggest that, because meaning emerges through individual experience, for example 'my camping trip', place meanings are completely individualistic: a given setting such as a park will contain as many different meanings as there are people using the setting (Meinig, 1979). Others, however, (e.g. Greider & Garkovich, 1994) assert that meanings are based on social categories and therefore are shared by others within these categories. For example, farmers share certain meanings for a plot of land that are distinct from those of real-estate developers or hunters.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q3-anchor\">\n                 <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"C\" data-question=\"q3\">\n                    <span class=\"paragraph-label\">Question 29 (Sec C):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>C</strong> Clearly, place attachment is built through familiarity with a place over a period of months or even years. Relph (1976) describes sense-of-place attachment as the steady accumulation of events within a setting; this creates ‘home places'. According to this view, those who have participated fully in the life of the home or community, or have accumulated a series of everyday events in a setting, will have the strongest attachment to it. Extended residence in a place tends to make us feel toward it almost as a living thing, affecting our emotions in the same way as a family would (Ryden, 1993). However, Tuan (1977) notes that a sense of place may also develop quite rapidly in 'chosen places', where dramatic landscapes and intense experiences can lead to an immediate attachment. Indeed, many settings, especially those that attract visitors, may simultaneously exist as home places and chosen places.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q4-anchor\">\n                <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"D\" data-question=\"q4\">\n                    <span class=\"paragraph-label\">Question 30 (Sec D):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>D</strong> Clearly we are dealing with a complex phenomenon and photo-based research methods may help us to understand it better. In VEP, tourists are asked to take photographs. This technique has primarily been used to assess the perceptions of visitors to parks and recreation places. Haywood (1990) describes several benefits of VEP. Photography is an enjoyable, familiar activity to tourists which helps to sharpen observation and identify specific locations that are important. It can give clearer ideas on elements that are liked or disliked and also facilitates comparisons between places.</p>\n            </div>\n             <div class=\"paragraph-wrapper\" id=\"q5-anchor\">\n                 <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"E\" data-question=\"q5\">\n                    <span class=\"paragraph-label\">Question 31 (Sec E):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>E</strong> However, several methodological issues need to be taken into account. First, who should take the photographs? VEP research typically involves visitors or tourists but, when applied to questions of attachment to a community, this approach has potential pitfalls. Chenoweth (1984) notes that research subjects may take photos that represent only a part of their entire recreational experience. This tendency probably relates to unfamiliarity with the setting. For example, when researchers assign the task of photographing a travel route with which respondents are not familiar, participants may save too many pictures and then use them all up at the end of their visit, even if there is no suitable material. Markwell (1997) noted an opposite tendency in his study of pictures taken on a nature tour: beginnings of excursions were over-represented, due perhaps to the initial novelty of the trip. Furthermore, Haywood (1990) suggests that compressing the photo-taking period into a single day (as he did in his work) may result in an over-representation of tourist icons rather than ordinary places. In contrast, Yamashita (2002), when focusing on local residents' perceptions of the qualities of the water around them, noted that residents may have more difficulty expressing visual appeal than visitors, precisely because they are insiders and less conscious of aesthetic qualities. When addressing complex attachment to landscape, we would expect, however, that familiarity ought to increase the validity of the items selected to represent sources of attachment. We also expect that photographs taken by local residents will represent a wider range of phenomena than pictures taken by transient visitors.</p>\n            </div>\n            <div class=\"paragraph-wrapper\" id=\"q6-anchor\">\n                 <div class=\"paragraph-dropzone dropzone\" data-paragraph=\"F\" data-question=\"q6\">\n                    <span class=\"paragraph-label\">Question 32 (Sec F):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>F</strong> But how should the photographs be interpreted? Goin (2001) notes that with every photo taken 'a fiction is created ... but presents to the uninformed an overwhelming conviction of fact' (p. 363). By implication, what photos appear to be and what they really represent may be very different things, and some follow-up helps to uncover the intended meanings of the participant. Yamashita (2002) notes the utility of asking respondents to provide descriptions of each photo in a notebook or diary. These elaborations are helpful, but in cases of complex phenomena, an interview may help participants clarify their intentions (Markwell, 1997).</p>\n            </div>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 on the following pages.</p>\n<h3>Images and Places</h3>\n<h4>A new research method uses photography to try to explain why people form an attachment to certain places</h4>\n<div class=\"paragraph-wrapper\" id=\"q1-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"A\" data-question=\"q1\">\n<span class=\"paragraph-label\">Question 27 (Sec A):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> Human beings naturally become attached to places they visit or inhabit and these emotional attachments have become increasingly important in research on recreation sites and activities. Research into this phenomenon is called 'sense-of-place research'. This research has employed a variety of approaches to gauge people's feelings toward a place, including surveys and personal interviews, but so far has not used photo-based methods. However, Visitor Employed Photography (VEP), used to capture visitor perceptions of landscape and recreational quality, represents a potential innovation in sense-of-place research.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q2-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"B\" data-question=\"q2\">\n<span class=\"paragraph-label\">Question 28 (Sec B):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> A 'place' is a setting that we give meaning to based on the personal experiences, relationships and feelings we associate with it. A crucial distinction that needs to be made is between the more subjective concept of attachment and the symbolic 'meanings' or labels we use to describe the type of place a setting represents. Is, for example, a multiple-use forest area a wilderness? A playground? A workplace? Symbolic meanings are important in that they form the basis of our attachment to a place: we attribute meaning to our settings, and in turn become attached to the meanings (Stedman, 2003). All settings can have multiple meanings depending on how we encounter them. Some researchers suggest that, because meaning emerges through individual experience, for example 'my camping trip', place meanings are completely individualistic: a given setting such as a park will contain as many different meanings as there are people using the setting (Meinig, 1979). Others, however, (e.g. Greider & Garkovich, 1994) assert that meanings are based on social categories and therefore are shared by others within these categories. For example, farmers share certain meanings for a plot of land that are distinct from those of real-estate developers or hunters.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q3-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"C\" data-question=\"q3\">\n<span class=\"paragraph-label\">Question 29 (Sec C):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> Clearly, place attachment is built through familiarity with a place over a period of months or even years. Relph (1976) describes sense-of-place attachment as the steady accumulation of events within a setting; this creates ‘home places'. According to this view, those who have participated fully in the life of the home or community, or have accumulated a series of everyday events in a setting, will have the strongest attachment to it. Extended residence in a place tends to make us feel toward it almost as a living thing, affecting our emotions in the same way as a family would (Ryden, 1993). However, Tuan (1977) notes that a sense of place may also develop quite rapidly in 'chosen places', where dramatic landscapes and intense experiences can lead to an immediate attachment. Indeed, many settings, especially those that attract visitors, may simultaneously exist as home places and chosen places.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q4-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"D\" data-question=\"q4\">\n<span class=\"paragraph-label\">Question 30 (Sec D):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> Clearly we are dealing with a complex phenomenon and photo-based research methods may help us to understand it better. In VEP, tourists are asked to take photographs. This technique has primarily been used to assess the perceptions of visitors to parks and recreation places. Haywood (1990) describes several benefits of VEP. Photography is an enjoyable, familiar activity to tourists which helps to sharpen observation and identify specific locations that are important. It can give clearer ideas on elements that are liked or disliked and also facilitates comparisons between places.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q5-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"E\" data-question=\"q5\">\n<span class=\"paragraph-label\">Question 31 (Sec E):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> However, several methodological issues need to be taken into account. First, who should take the photographs? VEP research typically involves visitors or tourists but, when applied to questions of attachment to a community, this approach has potential pitfalls. Chenoweth (1984) notes that research subjects may take photos that represent only a part of their entire recreational experience. This tendency probably relates to unfamiliarity with the setting. For example, when researchers assign the task of photographing a travel route with which respondents are not familiar, participants may save too many pictures and then use them all up at the end of their visit, even if there is no suitable material. Markwell (1997) noted an opposite tendency in his study of pictures taken on a nature tour: beginnings of excursions were over-represented, due perhaps to the initial novelty of the trip. Furthermore, Haywood (1990) suggests that compressing the photo-taking period into a single day (as he did in his work) may result in an over-representation of tourist icons rather than ordinary places. In contrast, Yamashita (2002), when focusing on local residents' perceptions of the qualities of the water around them, noted that residents may have more difficulty expressing visual appeal than visitors, precisely because they are insiders and less conscious of aesthetic qualities. When addressing complex attachment to landscape, we would expect, however, that familiarity ought to increase the validity of the items selected to represent sources of attachment. We also expect that photographs taken by local residents will represent a wider range of phenomena than pictures taken by transient visitors.</p>\n</div>\n<div class=\"paragraph-wrapper\" id=\"q6-anchor\">\n<div class=\"paragraph-dropzone dropzone\" data-paragraph=\"F\" data-question=\"q6\">\n<span class=\"paragraph-label\">Question 32 (Sec F):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> But how should the photographs be interpreted? Goin (2001) notes that with every photo taken 'a fiction is created ... but presents to the uninformed an overwhelming conviction of fact' (p. 363). By implication, what photos appear to be and what they really represent may be very different things, and some follow-up helps to uncover the intended meanings of the participant. Yamashita (2002) notes the utility of asking respondents to provide descriptions of each photo in a notebook or diary. These elaborations are helpful, but in cases of complex phenomena, an interview may help participants clarify their intentions (Markwell, 1997).</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor-right\">\n                <h4>Questions 27–32</h4>\n                <p>Reading Passage 3 has six sections, <strong>A–F</strong>.</p>\n                <p>Choose the correct heading for each section from the list of headings below.</p>\n                <p><em>Drag a heading from the list and drop it onto the correct section's answer box on the left.</em></p>\n                \n                <div class=\"headings-pool\" id=\"headings-pool-container\">\n                    <strong>List of Headings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. The relevance of time to the sense of belonging to a place</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. Making sense of photographic studies</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. The advantages of photography in sense-of-place research</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. Reasons for weak attachments</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. A new approach to sense-of-place research</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. Defining the significance of places</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. Important considerations when using VEP</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. Local residents' feelings towards visitors</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor-right\">\n<h4>Questions 27–32</h4>\n<p>Reading Passage 3 has six sections, <strong>A–F</strong>.</p>\n<p>Choose the correct heading for each section from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct section's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\">i. The relevance of time to the sense of belonging to a place</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\">ii. Making sense of photographic studies</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\">iii. The advantages of photography in sense-of-place research</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\">iv. Reasons for weak attachments</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\">v. A new approach to sense-of-place research</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\">vi. Defining the significance of places</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\">vii. Important considerations when using VEP</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\">viii. Local residents' feelings towards visitors</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -51,7 +51,7 @@
         "q11",
         "q12"
       ],
-      "bodyHtml": "<div class=\"group\">\n                <h4>Questions 33–38</h4>\n                <p>Look at the following observations (Questions 33–38) and the list of people below.</p>\n                <p>Match each observation with the correct person, <strong>A–G</strong>.</p>\n                <p><em>NB You may use any letter more than once.</em></p>\n\n                <div class=\"question-item\" id=\"q7-anchor\">\n                     <div class=\"match-question-item\">\n                        <p><strong>33</strong> Our attachment to a place can happen quickly.</p>\n                        <div class=\"match-dropzone\" data-question=\"q7\"></div>\n                     </div>\n                </div>\n                <div class=\"question-item\" id=\"q8-anchor\">\n                     <div class=\"match-question-item\">\n                        <p><strong>34</strong> Limiting the amount of time for taking photographs may produce a narrow range of images.</p>\n                        <div class=\"match-dropzone\" data-question=\"q8\"></div>\n                     </div>\n                </div>\n                <div class=\"question-item\" id=\"q9-anchor\">\n                     <div class=\"match-question-item\">\n                        <p><strong>35</strong> Members of a group will hold a similar view about a place.</p>\n                        <div class=\"match-dropzone\" data-question=\"q9\"></div>\n                     </div>\n                </div>\n                <div class=\"question-item\" id=\"q10-anchor\">\n                     <div class=\"match-question-item\">\n                        <p><strong>36</strong> Given time, a place can have the same impact on us as people do.</p>\n                        <div class=\"match-dropzone\" data-question=\"q10\"></div>\n                     </div>\n                </div>\n                <div class=\"question-item\" id=\"q11-anchor\">\n                     <div class=\"match-question-item\">\n                        <p><strong>37</strong> Tourists should keep a written account of their photographs.</p>\n                        <div class=\"match-dropzone\" data-question=\"q11\"></div>\n                     </div>\n                </div>\n                 <div class=\"question-item\" id=\"q12-anchor\">\n                     <div class=\"match-question-item\">\n                        <p><strong>38</strong> Each place means something different to each visitor.</p>\n                        <div class=\"match-dropzone\" data-question=\"q12\"></div>\n                     </div>\n                </div>\n                \n                <div class=\"options-pool\" id=\"people-options-pool\">\n                    <strong>List of People</strong>\n                    <div class=\"pool-items\" style=\"flex-direction: column; align-items: flex-start;\">\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Meinig</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Greider and Garkovich</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Ryden</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Tuan</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Haywood</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F Markwell</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G Yamashita</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 33–38</h4>\n<p>Look at the following observations (Questions 33–38) and the list of people below.</p>\n<p>Match each observation with the correct person, <strong>A–G</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"question-item\" id=\"q7-anchor\">\n<div class=\"match-question-item\">\n<p><strong>33</strong> Our attachment to a place can happen quickly.</p>\n<div class=\"match-dropzone\" data-question=\"q7\"></div>\n</div>\n</div>\n<div class=\"question-item\" id=\"q8-anchor\">\n<div class=\"match-question-item\">\n<p><strong>34</strong> Limiting the amount of time for taking photographs may produce a narrow range of images.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n</div>\n<div class=\"question-item\" id=\"q9-anchor\">\n<div class=\"match-question-item\">\n<p><strong>35</strong> Members of a group will hold a similar view about a place.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n</div>\n<div class=\"question-item\" id=\"q10-anchor\">\n<div class=\"match-question-item\">\n<p><strong>36</strong> Given time, a place can have the same impact on us as people do.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n</div>\n<div class=\"question-item\" id=\"q11-anchor\">\n<div class=\"match-question-item\">\n<p><strong>37</strong> Tourists should keep a written account of their photographs.</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n</div>\n<div class=\"question-item\" id=\"q12-anchor\">\n<div class=\"match-question-item\">\n<p><strong>38</strong> Each place means something different to each visitor.</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n</div>\n<div class=\"options-pool\" id=\"people-options-pool\">\n<strong>List of People</strong>\n<div class=\"pool-items\" style=\"flex-direction: column; align-items: flex-start;\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Meinig</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Greider and Garkovich</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Ryden</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Tuan</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Haywood</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F Markwell</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G Yamashita</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": true
     },
     {
@@ -61,7 +61,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\">\n                <h4>Questions 39–40</h4>\n                <p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n                \n                <div class=\"question-item\" id=\"q13-anchor\">\n                    <p><strong>39</strong> The 2002 study by Yamashita shows that local residents</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q13\" type=\"radio\" value=\"A\"> A appreciate the beauty of their surroundings.</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"B\"> B know their surroundings too well to appreciate them.</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"C\"> C consider water the most important aspect of their surroundings.</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"D\"> D dislike the negative impact of visitors on their surroundings.</label>\n                    </div>\n                </div>\n\n                <div class=\"question-item\" id=\"q14-anchor\">\n                    <p><strong>40</strong> In the final paragraph, the writer states that photographs present</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q14\" type=\"radio\" value=\"A\"> A a factual account of a visit.</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"B\"> B an unreliable source for research.</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"C\"> C a clear picture of the visitor's feelings.</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"D\"> D an image that needs to be explained to others.</label>\n                    </div>\n                </div>\n\n            </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 39–40</h4>\n<p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div class=\"question-item\" id=\"q13-anchor\">\n<p><strong>39</strong> The 2002 study by Yamashita shows that local residents</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"> A appreciate the beauty of their surroundings.</label> <label><input name=\"q13\" type=\"radio\" value=\"B\"> B know their surroundings too well to appreciate them.</label> <label><input name=\"q13\" type=\"radio\" value=\"C\"> C consider water the most important aspect of their surroundings.</label> <label><input name=\"q13\" type=\"radio\" value=\"D\"> D dislike the negative impact of visitors on their surroundings.</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q14-anchor\">\n<p><strong>40</strong> In the final paragraph, the writer states that photographs present</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"A\"> A a factual account of a visit.</label> <label><input name=\"q14\" type=\"radio\" value=\"B\"> B an unreliable source for research.</label> <label><input name=\"q14\" type=\"radio\" value=\"C\"> C a clear picture of the visitor's feelings.</label> <label><input name=\"q14\" type=\"radio\" value=\"D\"> D an image that needs to be explained to others.</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Tasmania's Museum of Old and New Art</h3>\n            <h4><em>Katelin Butler, returning to her home city of Hobart, reflects on how a new museum has brought about change.</em></h4>\n            \n            <p>As an eighteen-year-old living in the small Australian island state of Tasmania, moving to the 'mainland' could not happen soon enough. Now, ten years later, I look forward to going home. This is probably because I've grown up, but also perhaps because the cultural landscape of Tasmania has matured. The latest addition to Tasmania's cultural scene is David Walsh's Museum of Old and New Art (MONA), a museum that has established Hobart, the capital city of Tasmania, on the global art circuit.</p>\n            \n            <p>This building is an example of how art and architecture can have an instant impact on the social and cultural reputation of a place. Andrew Bain of The Sydney Morning Herald wrote, 'In a virtual blink, Hobart's cultural landscape has been transformed, with art, wine, fine food and stylish accommodation becoming integral features of the city ... If Hobart's makeover has an origin, it's the opening of MONA – the Museum of Old and New Art.' MONA is said to have been solely instrumental in the reinvention of Hobart as a cultural hub.</p>\n            \n            <p>MONA made the national press and international blogs before it opened. After that, Tourism Industry Council of Tasmania's chief executive, Luke Martin, claimed that MONA was proving so popular it was underpinning the tourism industry in Tasmania. However, MONA's effect on Hobart has broader ramifications for Tasmania's tourism industry. As reported in Hobart's local paper, The Mercury, there is concern about how long people are staying in Tasmania. Rather than spending a week in the state and hiring a car to experience the beauty of the Tasmanian landscape, people are making short stays in Hobart only to visit the gallery. The next challenge for the state is how to entice holiday-makers to stay longer, and to venture further afield. Tasmania is more than a one-hit wonder.</p>\n            \n            <p>According to Martin, possibilities for packaging up MONA with visits to other galleries around Tasmania are being investigated. Although not directly related to these investigations, the 1891 Queen Victoria Museum and Art Gallery at Royal Park in Launceston is currently being restored to its original condition; there are also plans to extensively redevelop the Tasmanian Museum and Art Gallery in Hobart. In addition to this, there are up to twenty other existing quality galleries in the state. So there is more to see than just MONA.</p>\n            \n            <p>Although large, the building is rather nondescript, sitting heavily on the edge of the Derwent River. MONA's ‘wow factor' comes from the notoriety of David Walsh, the museum's millionaire founder, and his choice of unusual artworks. The architecture has more depth of meaning and does exactly as it should: it supports the vision of the museum, essentially the vision of Walsh. It's a new building in the context of a maturing city. The dark, moody labyrinth of gallery spaces could be likened to the mind of the eccentric founder himself. Each artwork appears to be integrated into the dark materiality of the architecture – the interiors are far from light, bright and neutral, as might be seen in a more traditional gallery. The dim lighting and rough, rocky surfaces are a reminder that visitors are three levels underground.</p>\n\n            <p>The warped, mirrored surface at the museum's entry could be seen as the start of a journey of reflecting on one's existence. Much of the art explores the human condition – there are uninhibited artistic descriptions of human relationships, death, and even the digestion process. Going to a gallery with such confronting artworks with your parents is an interesting experience; I was pleasantly surprised by my parents' openness to the exhibitions. My father, who normally whisks through a gallery while my mother likes to take her time, happily spent almost five hours at MONA; the urge to linger is a common feeling here. This is because the gallery engages all of the senses, and visitors often pause to experience the effect each artwork has on them. This raises the question of who is actually visiting MONA – and it's definitely not just the normal gallery-goers. People from all kinds of socioeconomic backgrounds are curious about what lies within the subterranean maze of MONA. Conservative minds are being opened, which is a good thing anywhere.</p>\n\n            <p>Walsh's antiquities collection is superb, but he knew that old coins would compete for attention against new works that are more challenging in scale and subject matter, hence the device of setting antiquities among twentieth- and twenty-first-century works. For me, one of the intriguing outcomes of this strategy was an intensified feeling that the makers of the coins and antiquities were the great contemporary artists of their time.</p>\n\n            <p>The so-called Bilbao Effect has worked its magic on Hobart because, just as Frank Gehry's Guggenheim Museum has transformed the city of Bilbao in Spain, MONA has been a magnet for tourists in Hobart. However, the architectural 'wow' factor of the Guggenheim was the most famous component of that city's transformation, whereas Fender Katsalidis's MONA does not have the same spectacular impact as the shimmering metal surfaces of Gehry's building. Walsh himself abhors descriptions of MONA as the Bilbao of the south, saying that Fender Katsalidis solved a problem when he designed MONA, in executing a project of this scale in an underground location. Walsh contrasts this with what he describes as the \"architectural self-indulgence of Gehry when designing the Guggenheim in Bilbao.” Call it the Bilbao Effect, but this phenomenon has been around for thousands of years – good public architecture forms the centrepiece of a city. This is probably true, but like the Guggenheim, MONA has initiated something very important for Tasmania, and for Hobart in particular. Now the question is how Tasmania will build on David Walsh's input into its cultural setting.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Tasmania's Museum of Old and New Art</h3>\n<h4><em>Katelin Butler, returning to her home city of Hobart, reflects on how a new museum has brought about change.</em></h4>\n<p>As an eighteen-year-old living in the small Australian island state of Tasmania, moving to the 'mainland' could not happen soon enough. Now, ten years later, I look forward to going home. This is probably because I've grown up, but also perhaps because the cultural landscape of Tasmania has matured. The latest addition to Tasmania's cultural scene is David Walsh's Museum of Old and New Art (MONA), a museum that has established Hobart, the capital city of Tasmania, on the global art circuit.</p>\n<p>This building is an example of how art and architecture can have an instant impact on the social and cultural reputation of a place. Andrew Bain of The Sydney Morning Herald wrote, 'In a virtual blink, Hobart's cultural landscape has been transformed, with art, wine, fine food and stylish accommodation becoming integral features of the city ... If Hobart's makeover has an origin, it's the opening of MONA – the Museum of Old and New Art.' MONA is said to have been solely instrumental in the reinvention of Hobart as a cultural hub.</p>\n<p>MONA made the national press and international blogs before it opened. After that, Tourism Industry Council of Tasmania's chief executive, Luke Martin, claimed that MONA was proving so popular it was underpinning the tourism industry in Tasmania. However, MONA's effect on Hobart has broader ramifications for Tasmania's tourism industry. As reported in Hobart's local paper, The Mercury, there is concern about how long people are staying in Tasmania. Rather than spending a week in the state and hiring a car to experience the beauty of the Tasmanian landscape, people are making short stays in Hobart only to visit the gallery. The next challenge for the state is how to entice holiday-makers to stay longer, and to venture further afield. Tasmania is more than a one-hit wonder.</p>\n<p>According to Martin, possibilities for packaging up MONA with visits to other galleries around Tasmania are being investigated. Although not directly related to these investigations, the 1891 Queen Victoria Museum and Art Gallery at Royal Park in Launceston is currently being restored to its original condition; there are also plans to extensively redevelop the Tasmanian Museum and Art Gallery in Hobart. In addition to this, there are up to twenty other existing quality galleries in the state. So there is more to see than just MONA.</p>\n<p>Although large, the building is rather nondescript, sitting heavily on the edge of the Derwent River. MONA's ‘wow factor' comes from the notoriety of David Walsh, the museum's millionaire founder, and his choice of unusual artworks. The architecture has more depth of meaning and does exactly as it should: it supports the vision of the museum, essentially the vision of Walsh. It's a new building in the context of a maturing city. The dark, moody labyrinth of gallery spaces could be likened to the mind of the eccentric founder himself. Each artwork appears to be integrated into the dark materiality of the architecture – the interiors are far from light, bright and neutral, as might be seen in a more traditional gallery. The dim lighting and rough, rocky surfaces are a reminder that visitors are three levels underground.</p>\n<p>The warped, mirrored surface at the museum's entry could be seen as the start of a journey of reflecting on one's existence. Much of the art explores the human condition – there are uninhibited artistic descriptions of human relationships, death, and even the digestion process. Going to a gallery with such confronting artworks with your parents is an interesting experience; I was pleasantly surprised by my parents' openness to the exhibitions. My father, who normally whisks through a gallery while my mother likes to take her time, happily spent almost five hours at MONA; the urge to linger is a common feeling here. This is because the gallery engages all of the senses, and visitors often pause to experience the effect each artwork has on them. This raises the question of who is actually visiting MONA – and it's definitely not just the normal gallery-goers. People from all kinds of socioeconomic backgrounds are curious about what lies within the subterranean maze of MONA. Conservative minds are being opened, which is a good thing anywhere.</p>\n<p>Walsh's antiquities collection is superb, but he knew that old coins would compete for attention against new works that are more challenging in scale and subject matter, hence the device of setting antiquities among twentieth- and twenty-first-century works. For me, one of the intriguing outcomes of this strategy was an intensified feeling that the makers of the coins and antiquities were the great contemporary artists of their time.</p>\n<p>The so-called Bilbao Effect has worked its magic on Hobart because, just as Frank Gehry's Guggenheim Museum has transformed the city of Bilbao in Spain, MONA has been a magnet for tourists in Hobart. However, the architectural 'wow' factor of the Guggenheim was the most famous component of that city's transformation, whereas Fender Katsalidis's MONA does not have the same spectacular impact as the shimmering metal surfaces of Gehry's building. Walsh himself abhors descriptions of MONA as the Bilbao of the south, saying that Fender Katsalidis solved a problem when he designed MONA, in executing a project of this scale in an underground location. Walsh contrasts this with what he describes as the \"architectural self-indulgence of Gehry when designing the Guggenheim in Bilbao.” Call it the Bilbao Effect, but this phenomenon has been around for thousands of years – good public architecture forms the centrepiece of a city. This is probably true, but like the Guggenheim, MONA has initiated something very important for Tasmania, and for Hobart in particular. Now the question is how Tasmania will build on David Walsh's input into its cultural setting.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\">\n                <h4>Questions 27–32</h4>\n                <p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n                <p>In boxes 27–32 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                \n                <div class=\"question-item\" id=\"q1-anchor\">\n                    <p>27. The writer changed her mind about spending time in Tasmania.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                \n                <div class=\"question-item\" id=\"q2-anchor\">\n                    <p>28. Andrew Bain believes that the effect MONA had on Hobart was immediate.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                \n                <div class=\"question-item\" id=\"q3-anchor\">\n                    <p>29. Other factors have contributed as much as MONA to Hobart's transformation.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                \n                <div class=\"question-item\" id=\"q4-anchor\">\n                    <p>30. The Tourism Industry Council of Tasmania works closely with the director of MONA.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                \n                <div class=\"question-item\" id=\"q5-anchor\">\n                    <p>31. Many local residents are writing to The Mercury expressing concern about the length of tourists' stays in Hobart.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                \n                <div class=\"question-item\" id=\"q6-anchor\">\n                    <p>32. Tourists now regard MONA as a starting point for longer trips in Tasmania.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 27–32</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 27–32 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\" id=\"q1-anchor\">\n<p>27. The writer changed her mind about spending time in Tasmania.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q2-anchor\">\n<p>28. Andrew Bain believes that the effect MONA had on Hobart was immediate.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q3-anchor\">\n<p>29. Other factors have contributed as much as MONA to Hobart's transformation.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q4-anchor\">\n<p>30. The Tourism Industry Council of Tasmania works closely with the director of MONA.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q5-anchor\">\n<p>31. Many local residents are writing to The Mercury expressing concern about the length of tourists' stays in Hobart.</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q6-anchor\">\n<p>32. Tourists now regard MONA as a starting point for longer trips in Tasmania.</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -49,7 +49,7 @@
         "q10",
         "q11"
       ],
-      "bodyHtml": "<div class=\"group\">\n                <h4>Questions 33–37</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <p>Write the correct letter in boxes 33–37 on your answer sheet.</p>\n\n                <div class=\"question-item\" id=\"q7-anchor\">\n                    <p><strong>33.</strong> Luke Martin plans to promote tourism in Tasmania by</p>\n                    <div class=\"radio-options vertical\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"A\"> A focusing more on MONA as the leading attraction.</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"B\"> B combining trips to MONA with visits to other galleries.</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"C\"> C encouraging visitors to do activities that are not connected with art galleries.</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"D\"> D improving the quality of promotional information about Tasmania's galleries.</label>\n                    </div>\n                </div>\n\n                <div class=\"question-item\" id=\"q8-anchor\">\n                    <p><strong>34.</strong> According to the writer, what is especially interesting about MONA?</p>\n                    <div class=\"radio-options vertical\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"A\"> A the man who founded the gallery</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"B\"> B its location close to a river</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"C\"> C visitors' responses to the gallery spaces</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"D\"> D the striking architecture of the building</label>\n                    </div>\n                </div>\n\n                <div class=\"question-item\" id=\"q9-anchor\">\n                    <p><strong>35.</strong> Why do visitors spend a long time at the gallery?</p>\n                    <div class=\"radio-options vertical\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"A\"> A There is a great number of exhibits.</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"B\"> B Visitors tend to come in family groups.</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"C\"> C Many of the works are difficult to understand.</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"D\"> D The gallery has a physical effect on visitors.</label>\n                    </div>\n                </div>\n\n                <div class=\"question-item\" id=\"q10-anchor\">\n                    <p><strong>36.</strong> What does the writer say about the visitors to MONA?</p>\n                    <div class=\"radio-options vertical\">\n                        <label><input name=\"q10\" type=\"radio\" value=\"A\"> A Older people spend longer there than younger people do.</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"B\"> B A wide variety of people are interested in MONA.</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"C\"> C The majority of visitors are young people.</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"D\"> D The visitors are representative of gallery enthusiasts generally.</label>\n                    </div>\n                </div>\n\n                 <div class=\"question-item\" id=\"q11-anchor\">\n                    <p><strong>37.</strong> Why does the writer mention the coins at MONA?</p>\n                    <div class=\"radio-options vertical\">\n                        <label><input name=\"q11\" type=\"radio\" value=\"A\"> A to illustrate how interesting they are to visitors to modern galleries</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"B\"> B to explain why they are displayed in a separate section of the gallery</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"C\"> C to argue that Walsh's collection is among the best in the world</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"D\"> D to express admiration for the way that the exhibits are presented</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 33–37</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<p>Write the correct letter in boxes 33–37 on your answer sheet.</p>\n<div class=\"question-item\" id=\"q7-anchor\">\n<p><strong>33.</strong> Luke Martin plans to promote tourism in Tasmania by</p>\n<div class=\"radio-options vertical\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"> A focusing more on MONA as the leading attraction.</label> <label><input name=\"q7\" type=\"radio\" value=\"B\"> B combining trips to MONA with visits to other galleries.</label> <label><input name=\"q7\" type=\"radio\" value=\"C\"> C encouraging visitors to do activities that are not connected with art galleries.</label> <label><input name=\"q7\" type=\"radio\" value=\"D\"> D improving the quality of promotional information about Tasmania's galleries.</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q8-anchor\">\n<p><strong>34.</strong> According to the writer, what is especially interesting about MONA?</p>\n<div class=\"radio-options vertical\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"> A the man who founded the gallery</label> <label><input name=\"q8\" type=\"radio\" value=\"B\"> B its location close to a river</label> <label><input name=\"q8\" type=\"radio\" value=\"C\"> C visitors' responses to the gallery spaces</label> <label><input name=\"q8\" type=\"radio\" value=\"D\"> D the striking architecture of the building</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q9-anchor\">\n<p><strong>35.</strong> Why do visitors spend a long time at the gallery?</p>\n<div class=\"radio-options vertical\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"> A There is a great number of exhibits.</label> <label><input name=\"q9\" type=\"radio\" value=\"B\"> B Visitors tend to come in family groups.</label> <label><input name=\"q9\" type=\"radio\" value=\"C\"> C Many of the works are difficult to understand.</label> <label><input name=\"q9\" type=\"radio\" value=\"D\"> D The gallery has a physical effect on visitors.</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q10-anchor\">\n<p><strong>36.</strong> What does the writer say about the visitors to MONA?</p>\n<div class=\"radio-options vertical\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"> A Older people spend longer there than younger people do.</label> <label><input name=\"q10\" type=\"radio\" value=\"B\"> B A wide variety of people are interested in MONA.</label> <label><input name=\"q10\" type=\"radio\" value=\"C\"> C The majority of visitors are young people.</label> <label><input name=\"q10\" type=\"radio\" value=\"D\"> D The visitors are representative of gallery enthusiasts generally.</label>\n</div>\n</div>\n<div class=\"question-item\" id=\"q11-anchor\">\n<p><strong>37.</strong> Why does the writer mention the coins at MONA?</p>\n<div class=\"radio-options vertical\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"> A to illustrate how interesting they are to visitors to modern galleries</label> <label><input name=\"q11\" type=\"radio\" value=\"B\"> B to explain why they are displayed in a separate section of the gallery</label> <label><input name=\"q11\" type=\"radio\" value=\"C\"> C to argue that Walsh's collection is among the best in the world</label> <label><input name=\"q11\" type=\"radio\" value=\"D\"> D to express admiration for the way that the exhibits are presented</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\">\n                <h4>Questions 38–40</h4>\n                <p>Complete the summary using the list of words, <strong>A–H</strong>, below.</p>\n                <p>Write the correct letter, <strong>A–H</strong>, in boxes 38–40 on your answer sheet.</p>\n\n                <div class=\"summary-box\">\n                    <h4>The Bilbao Effect</h4>\n                    <p>\n                        MONA has huge appeal for visitors to Hobart, just as Gehry's Guggenheim Museum has for Bilbao. While MONA may lack the <strong>38</strong> <input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\"> effect of the Guggenheim, David Walsh explains that MONA's architect had a different objective when designing MONA: unlike the architectural showcasing of the Guggenheim, with MONA there was a major <strong>39</strong> <input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\"> that needed to be dealt with; the gallery was set beneath the ground. In any case, both galleries have transformed their cities, just as successful public buildings have for thousands of years. It remains to be seen how the <strong>40</strong> <input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"> of David Walsh will be expanded upon in Tasmania.\n                    </p>\n                </div>\n\n                <div class=\"word-list\">\n                    <span><strong>A</strong> challenge</span>\n                    <span><strong>B</strong> pipe</span>\n                    <span><strong>C</strong> visual</span>\n                    <span><strong>D</strong> contribution</span>\n                    <span><strong>E</strong> lasting</span>\n                    <span><strong>F</strong> essential</span>\n                    <span><strong>G</strong> ambition</span>\n                    <span><strong>H</strong> attraction</span>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 38–40</h4>\n<p>Complete the summary using the list of words, <strong>A–H</strong>, below.</p>\n<p>Write the correct letter, <strong>A–H</strong>, in boxes 38–40 on your answer sheet.</p>\n<div class=\"summary-box\">\n<h4>The Bilbao Effect</h4>\n<p>\nMONA has huge appeal for visitors to Hobart, just as Gehry's Guggenheim Museum has for Bilbao. While MONA may lack the <strong>38</strong> <input type=\"text\" id=\"q38_input\" maxlength=\"1\" name=\"q12\"> effect of the Guggenheim, David Walsh explains that MONA's architect had a different objective when designing MONA: unlike the architectural showcasing of the Guggenheim, with MONA there was a major <strong>39</strong> <input type=\"text\" id=\"q39_input\" maxlength=\"1\" name=\"q13\"> that needed to be dealt with; the gallery was set beneath the ground. In any case, both galleries have transformed their cities, just as successful public buildings have for thousands of years. It remains to be seen how the <strong>40</strong> <input type=\"text\" id=\"q40_input\" maxlength=\"1\" name=\"q14\"> of David Walsh will be expanded upon in Tasmania.\n</p>\n</div>\n<div class=\"word-list\">\n<span><strong>A</strong> challenge</span> <span><strong>B</strong> pipe</span> <span><strong>C</strong> visual</span> <span><strong>D</strong> contribution</span> <span><strong>E</strong> lasting</span> <span><strong>F</strong> essential</span> <span><strong>G</strong> ambition</span> <span><strong>H</strong> attraction</span>\n</div>\n</div>"
     }
   ],
   "answerKey": {
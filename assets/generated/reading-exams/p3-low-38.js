@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Research into the effects of different teaching styles</h3>\n            \n            <p><strong>A</strong> Prior to 1960, most inquiries into pupils' learning skills explored the relationship between factors such as children's social background, personality or measured intelligence and their achievement in various school subjects. Studies of teachers were largely a quest for criteria of effectiveness, and numerous investigations sought links between personality or attitude and 'success' at teaching. By 1950, Domas and Tiedeman were able to survey 672 such studies of teacher effectiveness. Yet there was widespread disappointment with such research, partly because so little of value seemed to emerge. First of all, there was little agreement about what constituted 'good' teaching or who the good teachers were. Secondly, there were numerous conflicting and contradictory findings. No sooner had one investigator found a relationship which appeared to be significant, than another discovered the opposite effect.</p>\n            <p><strong>B</strong> For example, in 1945, two American researchers, Rostker and Rolfe, both using standardized testing techniques and broad samples of teachers, reached exactly opposite conclusions. Rostker concluded that the intelligence of the teacher is the most important single factor conditioning teaching ability, and that there is no significant relationship between personality and teaching ability. Rolfe, however, found no correlation between intelligence and teaching efficiency: he claimed that the teacher's personality was what produced good teaching. Another American writer, Barr (1961), summarized a massive amount of American research and underlined the chaos in the research literature on effectiveness: \"Some teachers were preferred by administrators, some were liked by the pupils, and some taught in classes where there were substantial pupil gains, and generally speaking these were not the same teachers.”</p>\n            <p><strong>C</strong> One of the earliest pieces of research dates from 1912, when Stevens made 100 random observations of lessons in a variety of subject areas, in order to analyze the number and nature of questions being asked by teachers. Stevens's overall total was 64% teacher talk and 36% pupil talk, figures which are remarkably similar to a number of findings half a century later.</p>\n            <p><strong>D</strong> For many years in the first half of the 20th century, so-called 'formal' teaching was the norm. Teachers taught their classes as a whole group, gave out information, asked questions which predominantly required factual recall, and frequently set a common written task for the children to complete in a prescribed period of time. It was hardly surprising, therefore, that one focus of classroom interaction research in the decades following Stevens's inquiry was on the phenomenon of 'attentiveness'. A number of studies in the 1920s and 1930s, by Morrison and others, sought relationships between the degree of attention being paid by children and the amount they subsequently appeared to have learnt. Such research was usually based on observing teachers at work, a technique which was also employed extensively by United States administrators in the 1920s and 1930s, in order to assess teachers' competence and allocate merit payments to so-called 'superior' teachers.</p>\n            <p><strong>E</strong> As the 1930s came to an end, it was partly the emergence of totalitarian regimes in Europe which led to a shift in interest in the United States away from attentiveness, with its emphasis on the authority of the teacher, and towards a scrutiny of authoritarianism itself. A number of people began to feel that if dictatorship were to be avoided, children must learn in school how to handle democracy. Several investigators examined the processes taking place within small discussion groups, and tried to establish superiority for discussion groups over lecture classes, but with conflicting results. The movement towards what was becoming known as child-centred education was gathering momentum, and as interest in child development increased, investigators began to discover the usefulness of direct observation and the categorization of child behavior.</p>\n            <p><strong>F</strong> This was when systematic observation of teacher-pupil interaction began in earnest. Anderson (1939) studied what he called 'domination' and 'integration' amongst kindergarten children. Dominative acts by children included blaming and snatching toys, and such acts by teachers included restricting children's activities; while children's integrative acts included sharing facilities and playing harmoniously, and those of teachers included expanding opportunities for self-direction and co-operation. Anderson then attempted to measure what is now commonly called 'classroom climate'.</p>\n            <p><strong>G</strong> Lewin, Lippitt and White (1939 and 1943) studied the effects of different teaching styles. They arranged for three groups of five boys each to be taught in very different ways: these were labelled 'authoritarian', 'democratic' and 'laissez-faire'. The first two of these were similar to Anderson's concept of dominative and integrative teachers.</p>\n            <p><strong>H</strong> Beginning with Withall's work in 1949, there was much greater interest in interaction within the classroom. Withall used the term 'social-emotional climate' to describe the emotional tone created as a result of face-to-face interaction in groups, and, like many who followed him, concentrated his analysis of this climate on the study of teachers' verbal behavior. Withall also made efforts towards increasing the reliability of analyses, and this important pioneering work in the development of classroom observation methodology was followed by many others during the 1950s.</p>\n            <p><strong>I</strong> Partly because of the disappointing results of the teacher-effectiveness research, and partly because of the general neglect in earlier work of the variables of actual classroom behavior, the decade 1960–70 produced a large number of studies of classroom processes, based on observation of teachers at work.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Research into the effects of different teaching styles</h3>\n<p><strong>A</strong> Prior to 1960, most inquiries into pupils' learning skills explored the relationship between factors such as children's social background, personality or measured intelligence and their achievement in various school subjects. Studies of teachers were largely a quest for criteria of effectiveness, and numerous investigations sought links between personality or attitude and 'success' at teaching. By 1950, Domas and Tiedeman were able to survey 672 such studies of teacher effectiveness. Yet there was widespread disappointment with such research, partly because so little of value seemed to emerge. First of all, there was little agreement about what constituted 'good' teaching or who the good teachers were. Secondly, there were numerous conflicting and contradictory findings. No sooner had one investigator found a relationship which appeared to be significant, than another discovered the opposite effect.</p>\n<p><strong>B</strong> For example, in 1945, two American researchers, Rostker and Rolfe, both using standardized testing techniques and broad samples of teachers, reached exactly opposite conclusions. Rostker concluded that the intelligence of the teacher is the most important single factor conditioning teaching ability, and that there is no significant relationship between personality and teaching ability. Rolfe, however, found no correlation between intelligence and teaching efficiency: he claimed that the teacher's personality was what produced good teaching. Another American writer, Barr (1961), summarized a massive amount of American research and underlined the chaos in the research literature on effectiveness: \"Some teachers were preferred by administrators, some were liked by the pupils, and some taught in classes where there were substantial pupil gains, and generally speaking these were not the same teachers.”</p>\n<p><strong>C</strong> One of the earliest pieces of research dates from 1912, when Stevens made 100 random observations of lessons in a variety of subject areas, in order to analyze the number and nature of questions being asked by teachers. Stevens's overall total was 64% teacher talk and 36% pupil talk, figures which are remarkably similar to a number of findings half a century later.</p>\n<p><strong>D</strong> For many years in the first half of the 20th century, so-called 'formal' teaching was the norm. Teachers taught their classes as a whole group, gave out information, asked questions which predominantly required factual recall, and frequently set a common written task for the children to complete in a prescribed period of time. It was hardly surprising, therefore, that one focus of classroom interaction research in the decades following Stevens's inquiry was on the phenomenon of 'attentiveness'. A number of studies in the 1920s and 1930s, by Morrison and others, sought relationships between the degree of attention being paid by children and the amount they subsequently appeared to have learnt. Such research was usually based on observing teachers at work, a technique which was also employed extensively by United States administrators in the 1920s and 1930s, in order to assess teachers' competence and allocate merit payments to so-called 'superior' teachers.</p>\n<p><strong>E</strong> As the 1930s came to an end, it was partly the emergence of totalitarian regimes in Europe which led to a shift in interest in the United States away from attentiveness, with its emphasis on the authority of the teacher, and towards a scrutiny of authoritarianism itself. A number of people began to feel that if dictatorship were to be avoided, children must learn in school how to handle democracy. Several investigators examined the processes taking place within small discussion groups, and tried to establish superiority for discussion groups over lecture classes, but with conflicting results. The movement towards what was becoming known as child-centred education was gathering momentum, and as interest in child development increased, investigators began to discover the usefulness of direct observation and the categorization of child behavior.</p>\n<p><strong>F</strong> This was when systematic observation of teacher-pupil interaction began in earnest. Anderson (1939) studied what he called 'domination' and 'integration' amongst kindergarten children. Dominative acts by children included blaming and snatching toys, and such acts by teachers included restricting children's activities; while children's integrative acts included sharing facilities and playing harmoniously, and those of teachers included expanding opportunities for self-direction and co-operation. Anderson then attempted to measure what is now commonly called 'classroom climate'.</p>\n<p><strong>G</strong> Lewin, Lippitt and White (1939 and 1943) studied the effects of different teaching styles. They arranged for three groups of five boys each to be taught in very different ways: these were labelled 'authoritarian', 'democratic' and 'laissez-faire'. The first two of these were similar to Anderson's concept of dominative and integrative teachers.</p>\n<p><strong>H</strong> Beginning with Withall's work in 1949, there was much greater interest in interaction within the classroom. Withall used the term 'social-emotional climate' to describe the emotional tone created as a result of face-to-face interaction in groups, and, like many who followed him, concentrated his analysis of this climate on the study of teachers' verbal behavior. Withall also made efforts towards increasing the reliability of analyses, and this important pioneering work in the development of classroom observation methodology was followed by many others during the 1950s.</p>\n<p><strong>I</strong> Partly because of the disappointing results of the teacher-effectiveness research, and partly because of the general neglect in earlier work of the variables of actual classroom behavior, the decade 1960–70 produced a large number of studies of classroom processes, based on observation of teachers at work.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -37,7 +37,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n                <h4>Questions 27–33</h4>\n                <p>Complete the summary below using the list of words. Drag a word and drop it into the correct blank.</p>\n                <div class=\"summary-text\">\n                    <h5>Research into classroom interaction: 1920–1970</h5>\n                    <p>\n                    <strong>1920–1939</strong><br>\n                    Research largely investigated the relationship between children's attentiveness and their <span id=\"q1-target\" class=\"drop-target-summary\" data-question=\"q1\"></span>. In addition, attentiveness was used to measure the <span id=\"q2-target\" class=\"drop-target-summary\" data-question=\"q2\"></span> of the teachers.\n                    </p>\n                    <p>\n                    <strong>1939–49</strong><br>\n                    Research was influenced by a growing distrust of <span id=\"q3-target\" class=\"drop-target-summary\" data-question=\"q3\"></span>. The period saw the beginnings of systematic analysis of the <span id=\"q4-target\" class=\"drop-target-summary\" data-question=\"q4\"></span> which occur in lecture classes and in small group discussions.\n                    </p>\n                    <p>\n                    <strong>1949–60</strong><br>\n                    Classroom transactions were analysed in more detail, often with a focus on the <span id=\"q5-target\" class=\"drop-target-summary\" data-question=\"q5\"></span> of teachers. Researchers aimed to improve the <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> of their methods.\n                    </p>\n                    <p>\n                    <strong>1960–70</strong><br>\n                    The number of studies based on live <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> greatly increased.\n                    </p>\n                </div>\n                <div id=\"word-options\" class=\"pool-items\">\n                    <div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A authoritarianism</div>\n                    <div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B competence</div>\n                    <div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C emergence</div>\n                    <div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D learning</div>\n                    <div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E observation</div>\n                    <div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F personality</div>\n                    <div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G processes</div>\n                    <div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H reliability</div>\n                    <div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I training</div>\n                    <div id=\"word-J\" class=\"draggable-word\" draggable=\"true\" data-key=\"J\">J verbal behavior</div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 27–33</h4>\n<p>Complete the summary below using the list of words. Drag a word and drop it into the correct blank.</p>\n<div class=\"summary-text\">\n<h5>Research into classroom interaction: 1920–1970</h5>\n<p>\n<strong>1920–1939</strong><br>\nResearch largely investigated the relationship between children's attentiveness and their <span id=\"q1-target\" class=\"drop-target-summary\" data-question=\"q1\"></span>. In addition, attentiveness was used to measure the <span id=\"q2-target\" class=\"drop-target-summary\" data-question=\"q2\"></span> of the teachers.\n</p>\n<p>\n<strong>1939–49</strong><br>\nResearch was influenced by a growing distrust of <span id=\"q3-target\" class=\"drop-target-summary\" data-question=\"q3\"></span>. The period saw the beginnings of systematic analysis of the <span id=\"q4-target\" class=\"drop-target-summary\" data-question=\"q4\"></span> which occur in lecture classes and in small group discussions.\n</p>\n<p>\n<strong>1949–60</strong><br>\nClassroom transactions were analysed in more detail, often with a focus on the <span id=\"q5-target\" class=\"drop-target-summary\" data-question=\"q5\"></span> of teachers. Researchers aimed to improve the <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> of their methods.\n</p>\n<p>\n<strong>1960–70</strong><br>\nThe number of studies based on live <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> greatly increased.\n</p>\n</div>\n<div id=\"word-options\" class=\"pool-items\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A authoritarianism</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B competence</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C emergence</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D learning</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E observation</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F personality</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G processes</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H reliability</div>\n<div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I training</div>\n<div id=\"word-J\" class=\"draggable-word\" draggable=\"true\" data-key=\"J\">J verbal behavior</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -49,7 +49,7 @@
         "q10",
         "q11"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-anchor\">\n                <h4>Questions 34–37</h4>\n                <p>Look at the following descriptions (Questions 34–37) and the list of researchers below.</p>\n                <p>Match each description with the correct researcher(s), <strong>A–G</strong>.</p>\n                \n                <div class=\"match-question-item\">\n                    <p><strong>34</strong> claimed that the most important contribution to success in teaching is made by intelligence</p>\n                    <div class=\"match-dropzone\" data-question=\"q8\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>35</strong> set up an experiment to discover how pupils responded to various types of teaching</p>\n                    <div class=\"match-dropzone\" data-question=\"q9\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                     <p><strong>36</strong> focused on the questions which teachers asked in the classroom</p>\n                    <div class=\"match-dropzone\" data-question=\"q10\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                    <p><strong>37</strong> discovered a connection between success in teaching and the personality of the teacher</p>\n                    <div class=\"match-dropzone\" data-question=\"q11\"></div>\n                </div>\n\n                <div class=\"options-pool\" id=\"researcher-options-pool\">\n                    <strong>List of Researchers</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" id=\"researcher-A\" draggable=\"true\" data-option=\"A\">A Domas and Tiedeman</div>\n                        <div class=\"drag-item\" id=\"researcher-B\" draggable=\"true\" data-option=\"B\">B Rostker</div>\n                        <div class=\"drag-item\" id=\"researcher-C\" draggable=\"true\" data-option=\"C\">C Rolfe</div>\n                        <div class=\"drag-item\" id=\"researcher-D\" draggable=\"true\" data-option=\"D\">D Barr</div>\n                        <div class=\"drag-item\" id=\"researcher-E\" draggable=\"true\" data-option=\"E\">E Stevens</div>\n                        <div class=\"drag-item\" id=\"researcher-F\" draggable=\"true\" data-option=\"F\">F Morrison</div>\n                        <div class=\"drag-item\" id=\"researcher-G\" draggable=\"true\" data-option=\"G\">G Lewin, Lippitt and White</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-anchor\">\n<h4>Questions 34–37</h4>\n<p>Look at the following descriptions (Questions 34–37) and the list of researchers below.</p>\n<p>Match each description with the correct researcher(s), <strong>A–G</strong>.</p>\n<div class=\"match-question-item\">\n<p><strong>34</strong> claimed that the most important contribution to success in teaching is made by intelligence</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>35</strong> set up an experiment to discover how pupils responded to various types of teaching</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>36</strong> focused on the questions which teachers asked in the classroom</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>37</strong> discovered a connection between success in teaching and the personality of the teacher</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"options-pool\" id=\"researcher-options-pool\">\n<strong>List of Researchers</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"researcher-A\" draggable=\"true\" data-option=\"A\">A Domas and Tiedeman</div>\n<div class=\"drag-item\" id=\"researcher-B\" draggable=\"true\" data-option=\"B\">B Rostker</div>\n<div class=\"drag-item\" id=\"researcher-C\" draggable=\"true\" data-option=\"C\">C Rolfe</div>\n<div class=\"drag-item\" id=\"researcher-D\" draggable=\"true\" data-option=\"D\">D Barr</div>\n<div class=\"drag-item\" id=\"researcher-E\" draggable=\"true\" data-option=\"E\">E Stevens</div>\n<div class=\"drag-item\" id=\"researcher-F\" draggable=\"true\" data-option=\"F\">F Morrison</div>\n<div class=\"drag-item\" id=\"researcher-G\" draggable=\"true\" data-option=\"G\">G Lewin, Lippitt and White</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false
     },
     {
@@ -60,7 +60,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q12-13-14-anchor\">\n                 <h4>Questions 38–40</h4>\n                <p>Reading Passage 3 has nine paragraphs, <strong>A–I</strong>.</p>\n                <p>Which paragraph contains the following information?</p>\n                <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                        <thead>\n                            <tr>\n                                <th style=\"min-width: 200px;\"></th>\n                                <th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th><th>I</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>38</strong> the influence of political events on research</td>\n                                <td><input type=\"radio\" name=\"q12\" value=\"A\"></td><td><input type=\"radio\" name=\"q12\" value=\"B\"></td><td><input type=\"radio\" name=\"q12\" value=\"C\"></td><td><input type=\"radio\" name=\"q12\" value=\"D\"></td><td><input type=\"radio\" name=\"q12\" value=\"E\"></td><td><input type=\"radio\" name=\"q12\" value=\"F\"></td><td><input type=\"radio\" name=\"q12\" value=\"G\"></td><td><input type=\"radio\" name=\"q12\" value=\"H\"></td><td><input type=\"radio\" name=\"q12\" value=\"I\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>39</strong> an example of how children's behavior was categorized for research purposes</td>\n                                <td><input type=\"radio\" name=\"q13\" value=\"A\"></td><td><input type=\"radio\" name=\"q13\" value=\"B\"></td><td><input type=\"radio\" name=\"q13\" value=\"C\"></td><td><input type=\"radio\" name=\"q13\" value=\"D\"></td><td><input type=\"radio\" name=\"q13\" value=\"E\"></td><td><input type=\"radio\" name=\"q13\" value=\"F\"></td><td><input type=\"radio\" name=\"q13\" value=\"G\"></td><td><input type=\"radio\" name=\"q13\" value=\"H\"></td><td><input type=\"radio\" name=\"q13\" value=\"I\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>40</strong> a reason for research into children's attention</td>\n                                <td><input type=\"radio\" name=\"q14\" value=\"A\"></td><td><input type=\"radio\" name=\"q14\" value=\"B\"></td><td><input type=\"radio\" name=\"q14\" value=\"C\"></td><td><input type=\"radio\" name=\"q14\" value=\"D\"></td><td><input type=\"radio\" name=\"q14\" value=\"E\"></td><td><input type=\"radio\" name=\"q14\" value=\"F\"></td><td><input type=\"radio\" name=\"q14\" value=\"G\"></td><td><input type=\"radio\" name=\"q14\" value=\"H\"></td><td><input type=\"radio\" name=\"q14\" value=\"I\"></td>\n                            </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q12-13-14-anchor\">\n<h4>Questions 38–40</h4>\n<p>Reading Passage 3 has nine paragraphs, <strong>A–I</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 200px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th><th>I</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>38</strong> the influence of political events on research</td>\n<td><input type=\"radio\" name=\"q12\" value=\"A\"></td><td><input type=\"radio\" name=\"q12\" value=\"B\"></td><td><input type=\"radio\" name=\"q12\" value=\"C\"></td><td><input type=\"radio\" name=\"q12\" value=\"D\"></td><td><input type=\"radio\" name=\"q12\" value=\"E\"></td><td><input type=\"radio\" name=\"q12\" value=\"F\"></td><td><input type=\"radio\" name=\"q12\" value=\"G\"></td><td><input type=\"radio\" name=\"q12\" value=\"H\"></td><td><input type=\"radio\" name=\"q12\" value=\"I\"></td>\n</tr>\n<tr>\n<td><strong>39</strong> an example of how children's behavior was categorized for research purposes</td>\n<td><input type=\"radio\" name=\"q13\" value=\"A\"></td><td><input type=\"radio\" name=\"q13\" value=\"B\"></td><td><input type=\"radio\" name=\"q13\" value=\"C\"></td><td><input type=\"radio\" name=\"q13\" value=\"D\"></td><td><input type=\"radio\" name=\"q13\" value=\"E\"></td><td><input type=\"radio\" name=\"q13\" value=\"F\"></td><td><input type=\"radio\" name=\"q13\" value=\"G\"></td><td><input type=\"radio\" name=\"q13\" value=\"H\"></td><td><input type=\"radio\" name=\"q13\" value=\"I\"></td>\n</tr>\n<tr>\n<td><strong>40</strong> a reason for research into children's attention</td>\n<td><input type=\"radio\" name=\"q14\" value=\"A\"></td><td><input type=\"radio\" name=\"q14\" value=\"B\"></td><td><input type=\"radio\" name=\"q14\" value=\"C\"></td><td><input type=\"radio\" name=\"q14\" value=\"D\"></td><td><input type=\"radio\" name=\"q14\" value=\"E\"></td><td><input type=\"radio\" name=\"q14\" value=\"F\"></td><td><input type=\"radio\" name=\"q14\" value=\"G\"></td><td><input type=\"radio\" name=\"q14\" value=\"H\"></td><td><input type=\"radio\" name=\"q14\" value=\"I\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"
     }
   ],
   "answerKey": {
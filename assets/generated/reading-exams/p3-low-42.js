@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n\n            <h3>The Peopling of Patagonia</h3>\n            <h4>Anthropologists continue to investigate human migration to Patagonia at the southern tip of South America</h4>\n            \n            <p>The human settlement of the southern extremity of the Americas has always fascinated prehistorians. Viewed from a global perspective, this was the last major continental land mass to be reached by human beings. The earliest occupation of Patagonia carries obvious implications for understanding when the North and South American continents were peopled, because it gives a baseline that all calculations regarding the rate of dispersion of humans throughout both continents must take into account.</p>\n            <p>For many years the human settlement of North and South America has been conceived of as beginning in the far north and travelling progressively southwards to Patagonia. However, fundamental disagreements developed concerning the length of time involved. Some scholars accepted a human presence in the Americas as early as 20,000 years ago, while others proposed that it could date no earlier than 8,000 years ago, and the debate is still with us today.</p>\n            <p>The idea of a relatively ‘late' settlement of the Americas (around 8,000 years ago) implies that a rapid process of migration took place. Herein lies a second debate, which revolves around the question of how migration is to be understood. The ‘late' model demands a hypothetical migration conceived of as a single, continually advancing wave of settlement. This has always been difficult to take seriously, and many scholars now support the idea of an 'early' model that sees the migration as a less ordered migration, and this is surely the most realistic scenario as migrants slowly adapted to the diverse natural habitats they would have met while travelling through the continent.</p>\n            <p>Those who argue for an earlier settlement, however, must contend with the lack of unequivocal evidence for archaeological sites older than around 14,000 years. Nevertheless, evidence for human occupation of the centre of South America is now securely dated to around 12,500 years ago at the Monte Verde site, which casts doubt on the 'late' model. The lack of archaeological evidence further south for this time period may be explained by the obstacle to humans on foot posed by the huge glacial streams that were present at that time.</p>\n            <p>We can speculate then that the retreat of the Patagonian glaciers around 14,000 years ago allowed the initial human intrusion into a pristine environment, which was similar to that of early post-glacial Europe. Human settlement of the vast horizontal expanse of treeless high country must have been tenuous at best, and the evidence for this occupation remains relatively scant, most of it coming from rock shelters in Argentina and Chile. There is, however, reliable evidence from these sites to confirm the presence of humans by around 11,000 years ago in different habitats, and some hints of an even older occupation. However, some other sites where evidence for even earlier human occupation was initially posited have recently come under fresh scrutiny. This is because anthropologists have come to recognise that bones or other evidence may be deposited in caves by natural agency—in other words, by other forces such as floods or predators—and not necessarily by humans.</p>\n            <p>We shall turn now to a more detailed discussion of the archaeological evidence found in various parts of Patagonia. At the site located beside Chinchihuapi Creek, excavations have produced convincing evidence of human occupation, including hut foundations and wooden artefacts. They were buried in layers of peat, which has the property of preserving wood remarkably well, and as a result, radiocarbon dating tests have shown these artefacts to date from around 12,500 years ago. One of the most famous Patagonian sites is a cave known as Los Toldos. However, the evidence from this site has recently been called into question, because dispersed flecks of carbon used in the test process were taken unsystematically from many different places at the site. As a result, the association of this material with the artefacts is not at all clear. About 150 kilometres to the south is the site called El Ceibo, where a similar collection of artefacts to that found at Los Toldos has been discovered from the lowest levels of the dig, but as yet no radiocarbon dates are available, and this sort of analysis of the existing evidence is required before the site's value can be confirmed.</p>\n            <p>The Arroyo Eeo site is located very close to the high plateau. The artefacts from the earliest occupations were found at the same depth and have the same origins as those from Los Toldos, and have been securely dated to around 9,000 years ago. Another site that is mentioned in the debate is at Las Buitreras, where a number of stone flakes associated with bone remains of various animals have been discovered. However, anthropologists now believe that presumed cut marks on the bones are somewhat dubious, and despite detailed testing there is no way of securely relating any of these remains to human occupation. Finally, some 50 kilometres to the south is the site at Cueva Fell, which was the first Patagonian site to be systematically studied by modern archaeological methods. However, it is now recognised that the utility of this site must be restricted to its direct vicinity, given changes to the nearby area caused by flooding, and findings cannot be freely extrapolated further afield.</p>\n            <p>In conclusion, based on the evidence from a number of reliable sites, it seems probable that human populations reached Patagonia around 11,000 years ago.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>The Peopling of Patagonia</h3>\n<h4>Anthropologists continue to investigate human migration to Patagonia at the southern tip of South America</h4>\n<p>The human settlement of the southern extremity of the Americas has always fascinated prehistorians. Viewed from a global perspective, this was the last major continental land mass to be reached by human beings. The earliest occupation of Patagonia carries obvious implications for understanding when the North and South American continents were peopled, because it gives a baseline that all calculations regarding the rate of dispersion of humans throughout both continents must take into account.</p>\n<p>For many years the human settlement of North and South America has been conceived of as beginning in the far north and travelling progressively southwards to Patagonia. However, fundamental disagreements developed concerning the length of time involved. Some scholars accepted a human presence in the Americas as early as 20,000 years ago, while others proposed that it could date no earlier than 8,000 years ago, and the debate is still with us today.</p>\n<p>The idea of a relatively ‘late' settlement of the Americas (around 8,000 years ago) implies that a rapid process of migration took place. Herein lies a second debate, which revolves around the question of how migration is to be understood. The ‘late' model demands a hypothetical migration conceived of as a single, continually advancing wave of settlement. This has always been difficult to take seriously, and many scholars now support the idea of an 'early' model that sees the migration as a less ordered migration, and this is surely the most realistic scenario as migrants slowly adapted to the diverse natural habitats they would have met while travelling through the continent.</p>\n<p>Those who argue for an earlier settlement, however, must contend with the lack of unequivocal evidence for archaeological sites older than around 14,000 years. Nevertheless, evidence for human occupation of the centre of South America is now securely dated to around 12,500 years ago at the Monte Verde site, which casts doubt on the 'late' model. The lack of archaeological evidence further south for this time period may be explained by the obstacle to humans on foot posed by the huge glacial streams that were present at that time.</p>\n<p>We can speculate then that the retreat of the Patagonian glaciers around 14,000 years ago allowed the initial human intrusion into a pristine environment, which was similar to that of early post-glacial Europe. Human settlement of the vast horizontal expanse of treeless high country must have been tenuous at best, and the evidence for this occupation remains relatively scant, most of it coming from rock shelters in Argentina and Chile. There is, however, reliable evidence from these sites to confirm the presence of humans by around 11,000 years ago in different habitats, and some hints of an even older occupation. However, some other sites where evidence for even earlier human occupation was initially posited have recently come under fresh scrutiny. This is because anthropologists have come to recognise that bones or other evidence may be deposited in caves by natural agency—in other words, by other forces such as floods or predators—and not necessarily by humans.</p>\n<p>We shall turn now to a more detailed discussion of the archaeological evidence found in various parts of Patagonia. At the site located beside Chinchihuapi Creek, excavations have produced convincing evidence of human occupation, including hut foundations and wooden artefacts. They were buried in layers of peat, which has the property of preserving wood remarkably well, and as a result, radiocarbon dating tests have shown these artefacts to date from around 12,500 years ago. One of the most famous Patagonian sites is a cave known as Los Toldos. However, the evidence from this site has recently been called into question, because dispersed flecks of carbon used in the test process were taken unsystematically from many different places at the site. As a result, the association of this material with the artefacts is not at all clear. About 150 kilometres to the south is the site called El Ceibo, where a similar collection of artefacts to that found at Los Toldos has been discovered from the lowest levels of the dig, but as yet no radiocarbon dates are available, and this sort of analysis of the existing evidence is required before the site's value can be confirmed.</p>\n<p>The Arroyo Eeo site is located very close to the high plateau. The artefacts from the earliest occupations were found at the same depth and have the same origins as those from Los Toldos, and have been securely dated to around 9,000 years ago. Another site that is mentioned in the debate is at Las Buitreras, where a number of stone flakes associated with bone remains of various animals have been discovered. However, anthropologists now believe that presumed cut marks on the bones are somewhat dubious, and despite detailed testing there is no way of securely relating any of these remains to human occupation. Finally, some 50 kilometres to the south is the site at Cueva Fell, which was the first Patagonian site to be systematically studied by modern archaeological methods. However, it is now recognised that the utility of this site must be restricted to its direct vicinity, given changes to the nearby area caused by flooding, and findings cannot be freely extrapolated further afield.</p>\n<p>In conclusion, based on the evidence from a number of reliable sites, it seems probable that human populations reached Patagonia around 11,000 years ago.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 27–31</h4>\n                <p>Choose the correct letter, A, B, C or D.</p>\n                <div class=\"question-item\">\n                    <p><strong>27</strong> In the first paragraph, what is the writer's main point about migration to Patagonia?</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q1\" value=\"A\"> <strong>A</strong> It started earlier than previously thought.</label></li>\n                        <li><label><input type=\"radio\" name=\"q1\" value=\"B\"> <strong>B</strong> Historians have overlooked its importance.</label></li>\n                        <li><label><input type=\"radio\" name=\"q1\" value=\"C\"> <strong>C</strong> It impacts on research into the wider region.</label></li>\n                        <li><label><input type=\"radio\" name=\"q1\" value=\"D\"> <strong>D</strong> Researchers have calculated its effects on the environment.</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> In the second paragraph, what is the writer's purpose?</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q2\" value=\"A\"> <strong>A</strong> to challenge previous research</label></li>\n                        <li><label><input type=\"radio\" name=\"q2\" value=\"B\"> <strong>B</strong> to propose new areas to investigate</label></li>\n                        <li><label><input type=\"radio\" name=\"q2\" value=\"C\"> <strong>C</strong> to summarise a scholarly debate</label></li>\n                        <li><label><input type=\"radio\" name=\"q2\" value=\"D\"> <strong>D</strong> to suggest reasons for human migration</label></li>\n                    </ul>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>29</strong> The writer refers to the 'late' model in order to</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q3\" value=\"A\"> <strong>A</strong> compare it with another theory of migration.</label></li>\n                        <li><label><input type=\"radio\" name=\"q3\" value=\"B\"> <strong>B</strong> evaluate the success of American migration.</label></li>\n                        <li><label><input type=\"radio\" name=\"q3\" value=\"C\"> <strong>C</strong> criticise the speed of research into migration.</label></li>\n                        <li><label><input type=\"radio\" name=\"q3\" value=\"D\"> <strong>D</strong> compare migration in different parts of the world.</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> What is the writer's main point about the ‘early' model?</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q4\" value=\"A\"> <strong>A</strong> Scholars support the idea of fast migrations.</label></li>\n                        <li><label><input type=\"radio\" name=\"q4\" value=\"B\"> <strong>B</strong> It is too random to be a convincing theory.</label></li>\n                        <li><label><input type=\"radio\" name=\"q4\" value=\"C\"> <strong>C</strong> South America was more habitable at an earlier time.</label></li>\n                        <li><label><input type=\"radio\" name=\"q4\" value=\"D\"> <strong>D</strong> It is more consistent with the physical conditions of the land.</label></li>\n                    </ul>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>31</strong> What does the writer suggest about the Monte Verde site?</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q5\" value=\"A\"> <strong>A</strong> It is much younger than researchers once estimated.</label></li>\n                        <li><label><input type=\"radio\" name=\"q5\" value=\"B\"> <strong>B</strong> It provides supporting evidence for relatively early settlement.</label></li>\n                        <li><label><input type=\"radio\" name=\"q5\" value=\"C\"> <strong>C</strong> Archaeologists believe the site is of questionable value.</label></li>\n                        <li><label><input type=\"radio\" name=\"q5\" value=\"D\"> <strong>D</strong> Streams exposed the site, making new research possible.</label></li>\n                    </ul>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter, A, B, C or D.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> In the first paragraph, what is the writer's main point about migration to Patagonia?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q1\" value=\"A\"> <strong>A</strong> It started earlier than previously thought.</label></li>\n<li><label><input type=\"radio\" name=\"q1\" value=\"B\"> <strong>B</strong> Historians have overlooked its importance.</label></li>\n<li><label><input type=\"radio\" name=\"q1\" value=\"C\"> <strong>C</strong> It impacts on research into the wider region.</label></li>\n<li><label><input type=\"radio\" name=\"q1\" value=\"D\"> <strong>D</strong> Researchers have calculated its effects on the environment.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> In the second paragraph, what is the writer's purpose?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q2\" value=\"A\"> <strong>A</strong> to challenge previous research</label></li>\n<li><label><input type=\"radio\" name=\"q2\" value=\"B\"> <strong>B</strong> to propose new areas to investigate</label></li>\n<li><label><input type=\"radio\" name=\"q2\" value=\"C\"> <strong>C</strong> to summarise a scholarly debate</label></li>\n<li><label><input type=\"radio\" name=\"q2\" value=\"D\"> <strong>D</strong> to suggest reasons for human migration</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> The writer refers to the 'late' model in order to</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q3\" value=\"A\"> <strong>A</strong> compare it with another theory of migration.</label></li>\n<li><label><input type=\"radio\" name=\"q3\" value=\"B\"> <strong>B</strong> evaluate the success of American migration.</label></li>\n<li><label><input type=\"radio\" name=\"q3\" value=\"C\"> <strong>C</strong> criticise the speed of research into migration.</label></li>\n<li><label><input type=\"radio\" name=\"q3\" value=\"D\"> <strong>D</strong> compare migration in different parts of the world.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What is the writer's main point about the ‘early' model?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q4\" value=\"A\"> <strong>A</strong> Scholars support the idea of fast migrations.</label></li>\n<li><label><input type=\"radio\" name=\"q4\" value=\"B\"> <strong>B</strong> It is too random to be a convincing theory.</label></li>\n<li><label><input type=\"radio\" name=\"q4\" value=\"C\"> <strong>C</strong> South America was more habitable at an earlier time.</label></li>\n<li><label><input type=\"radio\" name=\"q4\" value=\"D\"> <strong>D</strong> It is more consistent with the physical conditions of the land.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> What does the writer suggest about the Monte Verde site?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q5\" value=\"A\"> <strong>A</strong> It is much younger than researchers once estimated.</label></li>\n<li><label><input type=\"radio\" name=\"q5\" value=\"B\"> <strong>B</strong> It provides supporting evidence for relatively early settlement.</label></li>\n<li><label><input type=\"radio\" name=\"q5\" value=\"C\"> <strong>C</strong> Archaeologists believe the site is of questionable value.</label></li>\n<li><label><input type=\"radio\" name=\"q5\" value=\"D\"> <strong>D</strong> Streams exposed the site, making new research possible.</label></li>\n</ul>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n                <h4>Questions 32–35</h4>\n                <p>Do the following statements agree with the claims of the writer in Reading Passage 3? Write YES, NO, or NOT GIVEN.</p>\n                <div class=\"question-item\">\n                    <p><strong>32</strong> The conditions encountered by the first migrants to Patagonia were unique.</p>\n                     <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q6\" value=\"YES\"> YES</label></li>\n                        <li><label><input type=\"radio\" name=\"q6\" value=\"NO\"> NO</label></li>\n                        <li><label><input type=\"radio\" name=\"q6\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> In the high country the first migrants hunted wild animals for food.</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q7\" value=\"YES\"> YES</label></li>\n                        <li><label><input type=\"radio\" name=\"q7\" value=\"NO\"> NO</label></li>\n                        <li><label><input type=\"radio\" name=\"q7\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>34</strong> Archaeologists have failed to draw conclusions from the evidence found at rock shelters in Argentina and Chile.</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q8\" value=\"YES\"> YES</label></li>\n                        <li><label><input type=\"radio\" name=\"q8\" value=\"NO\"> NO</label></li>\n                        <li><label><input type=\"radio\" name=\"q8\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n                    </ul>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>35</strong> Archaeological evidence can be moved from place to place in a variety of ways.</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q9\" value=\"YES\"> YES</label></li>\n                        <li><label><input type=\"radio\" name=\"q9\" value=\"NO\"> NO</label></li>\n                        <li><label><input type=\"radio\" name=\"q9\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n                    </ul>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3? Write YES, NO, or NOT GIVEN.</p>\n<div class=\"question-item\">\n<p><strong>32</strong> The conditions encountered by the first migrants to Patagonia were unique.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q6\" value=\"YES\"> YES</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"NO\"> NO</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> In the high country the first migrants hunted wild animals for food.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q7\" value=\"YES\"> YES</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"NO\"> NO</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Archaeologists have failed to draw conclusions from the evidence found at rock shelters in Argentina and Chile.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q8\" value=\"YES\"> YES</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"NO\"> NO</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Archaeological evidence can be moved from place to place in a variety of ways.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q9\" value=\"YES\"> YES</label></li>\n<li><label><input type=\"radio\" name=\"q9\" value=\"NO\"> NO</label></li>\n<li><label><input type=\"radio\" name=\"q9\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n</ul>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n                <h4>Questions 36–40</h4>\n                <p>Complete the summary using the list of words and phrases, A–J, below.</p>\n                <p><em>Drag a phrase from the list and drop it into the correct blank.</em></p>\n                <div class=\"summary-text\">\n                    <h5>The archaeological evidence from Patagonia</h5>\n                    <p>\n                    Building remains and other evidence have been found in <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span> at the Chinchihuapi Creek site, and because of this it has been possible to date them to around 12,500 years ago. However, the <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span> of the samples taken from Los Toldos means that this site is of doubtful value. El Ceibo is a more promising dig, where the examination of artefacts would be beneficial in order to confirm the usefulness of discoveries there. The remains found at the Arroyo Eeo site show <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> and date from around 9,000 years ago. Unfortunately, no <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span> can be made between the samples taken from Las Buitreras and human presence. The findings of the work carried out at Cueva Fell cannot provide useful information beyond the <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span>. In conclusion, though the evidence is mixed, it is believed that the human population of Patagonia began about 11,000 years ago.\n                    </p>\n                </div>\n                 <div class=\"options-pool\">\n                    <div class=\"pool-items\" id=\"summary-options-pool\">\n                        <div class=\"drag-item\" id=\"word-A\" draggable=\"true\" data-option=\"A\">A fixed date</div>\n                        <div class=\"drag-item\" id=\"word-B\" draggable=\"true\" data-option=\"B\">B random collection</div>\n                        <div class=\"drag-item\" id=\"word-C\" draggable=\"true\" data-option=\"C\">C similar properties</div>\n                        <div class=\"drag-item\" id=\"word-D\" draggable=\"true\" data-option=\"D\">D good condition</div>\n                        <div class=\"drag-item\" id=\"word-E\" draggable=\"true\" data-option=\"E\">E scientific evaluation</div>\n                        <div class=\"drag-item\" id=\"word-F\" draggable=\"true\" data-option=\"F\">F huge quantities</div>\n                        <div class=\"drag-item\" id=\"word-G\" draggable=\"true\" data-option=\"G\">G new samples</div>\n                        <div class=\"drag-item\" id=\"word-H\" draggable=\"true\" data-option=\"H\">H reliable connection</div>\n                        <div class=\"drag-item\" id=\"word-I\" draggable=\"true\" data-option=\"I\">I skilled preservation</div>\n                        <div class=\"drag-item\" id=\"word-J\" draggable=\"true\" data-option=\"J\">J immediate surroundings</div>\n                    </div>\n                 </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete the summary using the list of words and phrases, A–J, below.</p>\n<p><em>Drag a phrase from the list and drop it into the correct blank.</em></p>\n<div class=\"summary-text\">\n<h5>The archaeological evidence from Patagonia</h5>\n<p>\nBuilding remains and other evidence have been found in <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span> at the Chinchihuapi Creek site, and because of this it has been possible to date them to around 12,500 years ago. However, the <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span> of the samples taken from Los Toldos means that this site is of doubtful value. El Ceibo is a more promising dig, where the examination of artefacts would be beneficial in order to confirm the usefulness of discoveries there. The remains found at the Arroyo Eeo site show <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> and date from around 9,000 years ago. Unfortunately, no <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span> can be made between the samples taken from Las Buitreras and human presence. The findings of the work carried out at Cueva Fell cannot provide useful information beyond the <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span>. In conclusion, though the evidence is mixed, it is believed that the human population of Patagonia began about 11,000 years ago.\n</p>\n</div>\n<div class=\"options-pool\">\n<div class=\"pool-items\" id=\"summary-options-pool\">\n<div class=\"drag-item\" id=\"word-A\" draggable=\"true\" data-option=\"A\">A fixed date</div>\n<div class=\"drag-item\" id=\"word-B\" draggable=\"true\" data-option=\"B\">B random collection</div>\n<div class=\"drag-item\" id=\"word-C\" draggable=\"true\" data-option=\"C\">C similar properties</div>\n<div class=\"drag-item\" id=\"word-D\" draggable=\"true\" data-option=\"D\">D good condition</div>\n<div class=\"drag-item\" id=\"word-E\" draggable=\"true\" data-option=\"E\">E scientific evaluation</div>\n<div class=\"drag-item\" id=\"word-F\" draggable=\"true\" data-option=\"F\">F huge quantities</div>\n<div class=\"drag-item\" id=\"word-G\" draggable=\"true\" data-option=\"G\">G new samples</div>\n<div class=\"drag-item\" id=\"word-H\" draggable=\"true\" data-option=\"H\">H reliable connection</div>\n<div class=\"drag-item\" id=\"word-I\" draggable=\"true\" data-option=\"I\">I skilled preservation</div>\n<div class=\"drag-item\" id=\"word-J\" draggable=\"true\" data-option=\"J\">J immediate surroundings</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false
     }
   ],
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n\n            <h3>What is social history?</h3>\n            \n            <p>Ever since its elevation to the status of an academic discipline, history has been very largely concerned with problems of its own making. These may be gaps which the young researcher is advised by supervisors to fill; or established views which he or she is encouraged to challenge. In either case, the need for the researcher to provide new insights in order to gain professional advancement often counts for more than the intrinsic interest of the topic.</p>\n            <p>Social history is quite different. It touches on, and arguably helps to focus, major issues of public debate. It mobilises popular enthusiasm and engages popular passions. It prides itself on being concerned with everyday things rather than sensational events and is directed against the ‘Great Man' theories that originally characterised history, and the tedious focus on bureaucratic issues that subsequently dominated the 1920s and 30s. This is also reflected in the way it is taught, through the adoption of multi-disciplinary perspectives rather than a narrow historical interpretation.</p>\n            <p>Social history emerged, both as a popular enthusiasm and as a scholarly practice, from the cultural revolution of the 1960s in North America and Europe, and reproduces its leading inspirations. The spirit of social history was pre-eminently a modernising one, as reflected in its choice of subject matter. Whereas traditional history had focused on the 12th to 17th centuries, social history was apt to make its historical homeland in the 19th century. Latterly, it has even begun to extend its inquiry up to contemporary events and movements.</p>\n            <p>The subject matter favoured by the new social history, with its move away from the aristocracy and the establishment, corresponds to other cultural manifestations of the 1960s, such as New Wave British cinema, with its working-class protagonists, or ‘Pop art', with its use of everyday artefacts. Similarly, the anti-institutional bias of the new social history—the renewed determination to write the history of ‘ordinary' people as against that of statecraft—could be said to echo a much more widespread collapse of social deference, and a questioning of authority figures of all kinds.</p>\n            <p>Another major 1960s influence on the new social history—very different in its origins and effects—was the 'nostalgia industry', which focused on the sale of memorabilia and artefacts from recent history. This emerged as a kind of negative counterpart to the otherwise dominant modernisation of the decade and reflected a disenchantment, no less apparent on the Left of the political spectrum than on the Right, with post-war social change.</p>\n            <p>Industrial archaeology, an invention of the 1960s, elevated disused factories and mills to the status of national monuments. Following in the same track, property restorers turned houses built for 19th-century factory workers—once emblems of poverty, overcrowding, and ill-health—into picturesque residences. In another sphere, one could point to the proliferation of folk clubs and the discovery of industrial folk songs, prefiguring one of the major themes of the new social history—the dignity of labour.</p>\n            <p>So far as historical work was concerned, by the 1970s the sense of disenchantment had crystallised into an idealised view of the past, fostering a nostalgic regard for disappearing communities. The restoration of vanished components of 'the world we have lost' became a major impetus in historical writing and research. The dignity of ordinary people could be said to be the unifying theme of this line of historical inquiry and retrieval—a celebration of everyday life, even, perhaps especially, when it involved hardship and suffering.</p>\n            <p>Despite the novelty of its subject matter, social history reproduces many of the characteristic biases of its predecessors. Social historians are good at amassing details on household artefacts, budgets, daily purchases, but at times the evidence is assumed to speak for itself, and the simple reproduction of fact masquerades as explanation. The facts accumulated may leave no conceptual space for the great absences, for the many areas where the documentary record is silent.</p>\n            <p>The indulgence which social historians extend towards their subjects, and the desire to establish 'empathy'—seeing the past in terms of its own values rather than those of today—can also serve to flatter our self-esteem, making history a field in which, at no great cost to ourselves, we can demonstrate our enlarged sympathies and benevolence. Recognising our kinship to people in the past, and tracing, or discovering, their likeness to ourselves, we are flattered in the belief that underneath we are all lovable; eccentric perhaps and even absurd, but large-hearted, generous and frank. This sense of integration with the past can thus serve as a comfortable alternative to critical awareness and self-questioning, allowing us to dignify the present by illegitimate association with the past.</p>\n            <p>Social history, if it is to fulfil its subversive potential, needs to be a great deal more disturbing. If it is to celebrate a common humanity, and to bring past and present closer together, far more weight needs to be given to the effects of insecurities and emergencies—the fears that shadow the growing up of children, the oppositions we encounter during our lives—experiences which may be hard for an individual to categorise but which nevertheless have a significance which goes beyond that individual.</p>\n            <p>Perhaps too we might recognise that there is a profound condescension in the notion of 'ordinary people'—that unified totality in which social historians are apt to deal. Implicitly it is a category from which we tend to exclude ourselves, although in fact we are exceptional only by our privilege of hindsight. ‘There are no masses,' Raymond Williams wrote, ‘only ways of seeing people as masses.' It is perhaps time for historians to scrutinise the term 'ordinary people' in the same way.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>What is social history?</h3>\n<p>Ever since its elevation to the status of an academic discipline, history has been very largely concerned with problems of its own making. These may be gaps which the young researcher is advised by supervisors to fill; or established views which he or she is encouraged to challenge. In either case, the need for the researcher to provide new insights in order to gain professional advancement often counts for more than the intrinsic interest of the topic.</p>\n<p>Social history is quite different. It touches on, and arguably helps to focus, major issues of public debate. It mobilises popular enthusiasm and engages popular passions. It prides itself on being concerned with everyday things rather than sensational events and is directed against the ‘Great Man' theories that originally characterised history, and the tedious focus on bureaucratic issues that subsequently dominated the 1920s and 30s. This is also reflected in the way it is taught, through the adoption of multi-disciplinary perspectives rather than a narrow historical interpretation.</p>\n<p>Social history emerged, both as a popular enthusiasm and as a scholarly practice, from the cultural revolution of the 1960s in North America and Europe, and reproduces its leading inspirations. The spirit of social history was pre-eminently a modernising one, as reflected in its choice of subject matter. Whereas traditional history had focused on the 12th to 17th centuries, social history was apt to make its historical homeland in the 19th century. Latterly, it has even begun to extend its inquiry up to contemporary events and movements.</p>\n<p>The subject matter favoured by the new social history, with its move away from the aristocracy and the establishment, corresponds to other cultural manifestations of the 1960s, such as New Wave British cinema, with its working-class protagonists, or ‘Pop art', with its use of everyday artefacts. Similarly, the anti-institutional bias of the new social history—the renewed determination to write the history of ‘ordinary' people as against that of statecraft—could be said to echo a much more widespread collapse of social deference, and a questioning of authority figures of all kinds.</p>\n<p>Another major 1960s influence on the new social history—very different in its origins and effects—was the 'nostalgia industry', which focused on the sale of memorabilia and artefacts from recent history. This emerged as a kind of negative counterpart to the otherwise dominant modernisation of the decade and reflected a disenchantment, no less apparent on the Left of the political spectrum than on the Right, with post-war social change.</p>\n<p>Industrial archaeology, an invention of the 1960s, elevated disused factories and mills to the status of national monuments. Following in the same track, property restorers turned houses built for 19th-century factory workers—once emblems of poverty, overcrowding, and ill-health—into picturesque residences. In another sphere, one could point to the proliferation of folk clubs and the discovery of industrial folk songs, prefiguring one of the major themes of the new social history—the dignity of labour.</p>\n<p>So far as historical work was concerned, by the 1970s the sense of disenchantment had crystallised into an idealised view of the past, fostering a nostalgic regard for disappearing communities. The restoration of vanished components of 'the world we have lost' became a major impetus in historical writing and research. The dignity of ordinary people could be said to be the unifying theme of this line of historical inquiry and retrieval—a celebration of everyday life, even, perhaps especially, when it involved hardship and suffering.</p>\n<p>Despite the novelty of its subject matter, social history reproduces many of the characteristic biases of its predecessors. Social historians are good at amassing details on household artefacts, budgets, daily purchases, but at times the evidence is assumed to speak for itself, and the simple reproduction of fact masquerades as explanation. The facts accumulated may leave no conceptual space for the great absences, for the many areas where the documentary record is silent.</p>\n<p>The indulgence which social historians extend towards their subjects, and the desire to establish 'empathy'—seeing the past in terms of its own values rather than those of today—can also serve to flatter our self-esteem, making history a field in which, at no great cost to ourselves, we can demonstrate our enlarged sympathies and benevolence. Recognising our kinship to people in the past, and tracing, or discovering, their likeness to ourselves, we are flattered in the belief that underneath we are all lovable; eccentric perhaps and even absurd, but large-hearted, generous and frank. This sense of integration with the past can thus serve as a comfortable alternative to critical awareness and self-questioning, allowing us to dignify the present by illegitimate association with the past.</p>\n<p>Social history, if it is to fulfil its subversive potential, needs to be a great deal more disturbing. If it is to celebrate a common humanity, and to bring past and present closer together, far more weight needs to be given to the effects of insecurities and emergencies—the fears that shadow the growing up of children, the oppositions we encounter during our lives—experiences which may be hard for an individual to categorise but which nevertheless have a significance which goes beyond that individual.</p>\n<p>Perhaps too we might recognise that there is a profound condescension in the notion of 'ordinary people'—that unified totality in which social historians are apt to deal. Implicitly it is a category from which we tend to exclude ourselves, although in fact we are exceptional only by our privilege of hindsight. ‘There are no masses,' Raymond Williams wrote, ‘only ways of seeing people as masses.' It is perhaps time for historians to scrutinise the term 'ordinary people' in the same way.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 27–31</h4>\n                <p>Complete the summary using the list of words, <strong>A–H</strong>, below.</p>\n                <p><em>Drag a word from the list and drop it into the correct blank.</em></p>\n                <div class=\"summary-text\">\n                    <h5>How is social history different from historical study?</h5>\n                    <p>\n                    Since it became an academic discipline, historical study has been too concerned with a search for <strong>27</strong> <span id=\"q1-target\" class=\"drop-target-summary\" data-question=\"q1\"></span> by researchers who want to develop their careers. Social history, however, is more closely related to the <strong>28</strong> <span id=\"q2-target\" class=\"drop-target-summary\" data-question=\"q2\"></span> of the public. It avoids history's traditional focus on <strong>29</strong> <span id=\"q3-target\" class=\"drop-target-summary\" data-question=\"q3\"></span>, and its later concentration on <strong>30</strong> <span id=\"q4-target\" class=\"drop-target-summary\" data-question=\"q4\"></span>, and it is also different from traditional history in its teaching <strong>31</strong> <span id=\"q5-target\" class=\"drop-target-summary\" data-question=\"q5\"></span>, which is derived from different academic subjects.\n                    </p>\n                </div>\n                 <div class=\"options-pool\">\n                    <div class=\"pool-items\" id=\"summary-options-pool\">\n                        <div class=\"drag-item\" id=\"word-A\" draggable=\"true\" data-option=\"A\">A methodology</div>\n                        <div class=\"drag-item\" id=\"word-B\" draggable=\"true\" data-option=\"B\">B needs</div>\n                        <div class=\"drag-item\" id=\"word-C\" draggable=\"true\" data-option=\"C\">C originality</div>\n                        <div class=\"drag-item\" id=\"word-D\" draggable=\"true\" data-option=\"D\">D important people</div>\n                        <div class=\"drag-item\" id=\"word-E\" draggable=\"true\" data-option=\"E\">E accuracy</div>\n                        <div class=\"drag-item\" id=\"word-F\" draggable=\"true\" data-option=\"F\">F interests and feelings</div>\n                        <div class=\"drag-item\" id=\"word-G\" draggable=\"true\" data-option=\"G\">G explanation</div>\n                        <div class=\"drag-item\" id=\"word-H\" draggable=\"true\" data-option=\"H\">H organisational matters</div>\n                    </div>\n                 </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Complete the summary using the list of words, <strong>A–H</strong>, below.</p>\n<p><em>Drag a word from the list and drop it into the correct blank.</em></p>\n<div class=\"summary-text\">\n<h5>How is social history different from historical study?</h5>\n<p>\nSince it became an academic discipline, historical study has been too concerned with a search for <strong>27</strong> <span id=\"q1-target\" class=\"drop-target-summary\" data-question=\"q1\"></span> by researchers who want to develop their careers. Social history, however, is more closely related to the <strong>28</strong> <span id=\"q2-target\" class=\"drop-target-summary\" data-question=\"q2\"></span> of the public. It avoids history's traditional focus on <strong>29</strong> <span id=\"q3-target\" class=\"drop-target-summary\" data-question=\"q3\"></span>, and its later concentration on <strong>30</strong> <span id=\"q4-target\" class=\"drop-target-summary\" data-question=\"q4\"></span>, and it is also different from traditional history in its teaching <strong>31</strong> <span id=\"q5-target\" class=\"drop-target-summary\" data-question=\"q5\"></span>, which is derived from different academic subjects.\n</p>\n</div>\n<div class=\"options-pool\">\n<div class=\"pool-items\" id=\"summary-options-pool\">\n<div class=\"drag-item\" id=\"word-A\" draggable=\"true\" data-option=\"A\">A methodology</div>\n<div class=\"drag-item\" id=\"word-B\" draggable=\"true\" data-option=\"B\">B needs</div>\n<div class=\"drag-item\" id=\"word-C\" draggable=\"true\" data-option=\"C\">C originality</div>\n<div class=\"drag-item\" id=\"word-D\" draggable=\"true\" data-option=\"D\">D important people</div>\n<div class=\"drag-item\" id=\"word-E\" draggable=\"true\" data-option=\"E\">E accuracy</div>\n<div class=\"drag-item\" id=\"word-F\" draggable=\"true\" data-option=\"F\">F interests and feelings</div>\n<div class=\"drag-item\" id=\"word-G\" draggable=\"true\" data-option=\"G\">G explanation</div>\n<div class=\"drag-item\" id=\"word-H\" draggable=\"true\" data-option=\"H\">H organisational matters</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -48,7 +48,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n                <h4>Questions 32–35</h4>\n                <p>Do the following statements agree with the claims of the writer in Reading Passage 3? Write YES, NO, or NOT GIVEN.</p>\n                <div class=\"question-item\">\n                    <p><strong>32</strong> The rise of social history led to the cultural revolution of the 1960s.</p>\n                     <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q6\" value=\"YES\"> YES</label></li>\n                        <li><label><input type=\"radio\" name=\"q6\" value=\"NO\"> NO</label></li>\n                        <li><label><input type=\"radio\" name=\"q6\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> Social historians tend to study a later period of history than traditional historians did.</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q7\" value=\"YES\"> YES</label></li>\n                        <li><label><input type=\"radio\" name=\"q7\" value=\"NO\"> NO</label></li>\n                        <li><label><input type=\"radio\" name=\"q7\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>34</strong> British cinema in the 1960s lacked any working-class characters.</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q8\" value=\"YES\"> YES</label></li>\n                        <li><label><input type=\"radio\" name=\"q8\" value=\"NO\"> NO</label></li>\n                        <li><label><input type=\"radio\" name=\"q8\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n                    </ul>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>35</strong> The loss of respect for authority in the 1960s was a leading cause of social problems.</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q9\" value=\"YES\"> YES</label></li>\n                        <li><label><input type=\"radio\" name=\"q9\" value=\"NO\"> NO</label></li>\n                        <li><label><input type=\"radio\" name=\"q9\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n                    </ul>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3? Write YES, NO, or NOT GIVEN.</p>\n<div class=\"question-item\">\n<p><strong>32</strong> The rise of social history led to the cultural revolution of the 1960s.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q6\" value=\"YES\"> YES</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"NO\"> NO</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Social historians tend to study a later period of history than traditional historians did.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q7\" value=\"YES\"> YES</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"NO\"> NO</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> British cinema in the 1960s lacked any working-class characters.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q8\" value=\"YES\"> YES</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"NO\"> NO</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> The loss of respect for authority in the 1960s was a leading cause of social problems.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q9\" value=\"YES\"> YES</label></li>\n<li><label><input type=\"radio\" name=\"q9\" value=\"NO\"> NO</label></li>\n<li><label><input type=\"radio\" name=\"q9\" value=\"NOT GIVEN\"> NOT GIVEN</label></li>\n</ul>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -60,7 +60,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n                <h4>Questions 36–40</h4>\n                <p>Choose the correct letter, <strong>A, B, C,</strong> or <strong>D</strong>.</p>\n                 <div class=\"question-item\">\n                    <p><strong>36</strong> What point is made about the 'nostalgia industry'?</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q10\" value=\"A\"> <strong>A</strong> Its products were not always genuine historical items.</label></li>\n                        <li><label><input type=\"radio\" name=\"q10\" value=\"B\"> <strong>B</strong> It led to the abandonment of modernisation.</label></li>\n                        <li><label><input type=\"radio\" name=\"q10\" value=\"C\"> <strong>C</strong> Its origins were political rather than industrial.</label></li>\n                        <li><label><input type=\"radio\" name=\"q10\" value=\"D\"> <strong>D</strong> It opposed the dominant trend of the time.</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>37</strong> In the sixth paragraph, the writer makes the point that in the 1960s</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q11\" value=\"A\"> <strong>A</strong> construction workers gained greater status.</label></li>\n                        <li><label><input type=\"radio\" name=\"q11\" value=\"B\"> <strong>B</strong> there was a new interest in traditional industrial buildings.</label></li>\n                        <li><label><input type=\"radio\" name=\"q11\" value=\"C\"> <strong>C</strong> architects applied industrial techniques to home design.</label></li>\n                        <li><label><input type=\"radio\" name=\"q11\" value=\"D\"> <strong>D</strong> many older homes were unsuitable as places of residence.</label></li>\n                    </ul>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>38</strong> By the 1970s, historians had come to believe that</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q12\" value=\"A\"> <strong>A</strong> researchers should focus on the immediate past.</label></li>\n                        <li><label><input type=\"radio\" name=\"q12\" value=\"B\"> <strong>B</strong> modern life is not necessarily an improvement on the past.</label></li>\n                        <li><label><input type=\"radio\" name=\"q12\" value=\"C\"> <strong>C</strong> they should not overemphasise the difficulties of life in the past.</label></li>\n                        <li><label><input type=\"radio\" name=\"q12\" value=\"D\"> <strong>D</strong> there was a need for more ‘ordinary' people to do research into the past.</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>39</strong> One problem related to the use of detail by social historians is that</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q13\" value=\"A\"> <strong>A</strong> the wrong types of facts are collected.</label></li>\n                        <li><label><input type=\"radio\" name=\"q13\" value=\"B\"> <strong>B</strong> some information may be hard to categorise.</label></li>\n                        <li><label><input type=\"radio\" name=\"q13\" value=\"C\"> <strong>C</strong> more important issues may be ignored.</label></li>\n                        <li><label><input type=\"radio\" name=\"q13\" value=\"D\"> <strong>D</strong> some of the data may be incorrect.</label></li>\n                    </ul>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>40</strong> The writer recommends that to be effective, social history must</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q14\" value=\"A\"> <strong>A</strong> explore the negative emotions that are part of daily life.</label></li>\n                        <li><label><input type=\"radio\" name=\"q14\" value=\"B\"> <strong>B</strong> build on what has already been established by historians.</label></li>\n                        <li><label><input type=\"radio\" name=\"q14\" value=\"C\"> <strong>C</strong> try to provide an objective view of the recent past.</label></li>\n                        <li><label><input type=\"radio\" name=\"q14\" value=\"D\"> <strong>D</strong> offer solutions to the pressing problems of our day.</label></li>\n                    </ul>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Choose the correct letter, <strong>A, B, C,</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>36</strong> What point is made about the 'nostalgia industry'?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q10\" value=\"A\"> <strong>A</strong> Its products were not always genuine historical items.</label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"B\"> <strong>B</strong> It led to the abandonment of modernisation.</label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"C\"> <strong>C</strong> Its origins were political rather than industrial.</label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"D\"> <strong>D</strong> It opposed the dominant trend of the time.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> In the sixth paragraph, the writer makes the point that in the 1960s</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q11\" value=\"A\"> <strong>A</strong> construction workers gained greater status.</label></li>\n<li><label><input type=\"radio\" name=\"q11\" value=\"B\"> <strong>B</strong> there was a new interest in traditional industrial buildings.</label></li>\n<li><label><input type=\"radio\" name=\"q11\" value=\"C\"> <strong>C</strong> architects applied industrial techniques to home design.</label></li>\n<li><label><input type=\"radio\" name=\"q11\" value=\"D\"> <strong>D</strong> many older homes were unsuitable as places of residence.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> By the 1970s, historians had come to believe that</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q12\" value=\"A\"> <strong>A</strong> researchers should focus on the immediate past.</label></li>\n<li><label><input type=\"radio\" name=\"q12\" value=\"B\"> <strong>B</strong> modern life is not necessarily an improvement on the past.</label></li>\n<li><label><input type=\"radio\" name=\"q12\" value=\"C\"> <strong>C</strong> they should not overemphasise the difficulties of life in the past.</label></li>\n<li><label><input type=\"radio\" name=\"q12\" value=\"D\"> <strong>D</strong> there was a need for more ‘ordinary' people to do research into the past.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> One problem related to the use of detail by social historians is that</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q13\" value=\"A\"> <strong>A</strong> the wrong types of facts are collected.</label></li>\n<li><label><input type=\"radio\" name=\"q13\" value=\"B\"> <strong>B</strong> some information may be hard to categorise.</label></li>\n<li><label><input type=\"radio\" name=\"q13\" value=\"C\"> <strong>C</strong> more important issues may be ignored.</label></li>\n<li><label><input type=\"radio\" name=\"q13\" value=\"D\"> <strong>D</strong> some of the data may be incorrect.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> The writer recommends that to be effective, social history must</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q14\" value=\"A\"> <strong>A</strong> explore the negative emotions that are part of daily life.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"B\"> <strong>B</strong> build on what has already been established by historians.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"C\"> <strong>C</strong> try to provide an objective view of the recent past.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"D\"> <strong>D</strong> offer solutions to the pressing problems of our day.</label></li>\n</ul>\n</div>\n</div>"
     }
   ],
   "answerKey": {
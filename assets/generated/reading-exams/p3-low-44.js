@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n\n            <h3>Conformity</h3>\n            <h4>A review of conformity and some of the studies that have been done on it</h4>\n            \n            <p>During your childhood, there will have been some kind of craze which affected all the people in your school. It may have been to do with a particular toy or possibly a must-have item of clothing. It may have been something as simple as a type of pen or as expensive as an electronic games console. Fashion designers, toy manufacturers and anyone else involved in the retail trade love conformity. Set up a craze, especially in the young, and everyone will go for it. In fact, it's an ideal way to sell huge quantities of merchandise. The levels of conformity in consumerism are phenomenal. When you actually stand back and consider how easily we are persuaded that having certain items is the only way we can ensure peace of mind, you see what an important concept conformity is.</p>\n            <p>Conformity has been described as “yielding to group pressure” (Crutchfield, 1962). However, this implies that other people put pressure on us to make us conform and this is not always the case. A better definition is given by Aronson (1976) who said it was a \"change in a person's behaviour or opinions as a result of real or imagined pressure from a person or group of people”. This would make more sense, as often the pressure we feel is imagined. The person or group he refers to would have to be important to us at the time, regardless of their status.</p>\n            <p>There has been considerable research on conformity. One of the first studies looked at the answers people gave when asked to estimate the number of beans in a bottle (Jenness, 1932). If you have ever entered a “guess the number\" competition, you probably looked at the previous estimates made and based your judgment on what other people had guessed. This is more or less what happened in the Jenness study. First of all, he asked the respondents to give their own estimates, and then he asked them to decide a group estimate. Finally, he asked them alone again and discovered that they had stayed with the group answer.</p>\n            <p>Probably the most famous study on conformity was undertaken by Asch (1951) when he created a situation where many of his subjects gave answers which were blatantly untrue, rather than contradict the people they were with. He did this by getting his subject to sit round a table with six stooges (colleagues of the experimenter) so that the subject was second to last. He showed them all a large card which had three lines of different lengths drawn on it, labelled A, B and C. He then gave them a card with a single line and asked them to match this in terms of length to one of the lines A, B or C.</p>\n            <p>The stooges gave untrue responses in a number of the trials and the subjects were left in the situation where they either reported what they saw with their own eyes or conformed to the norm of the group. When the results were assessed, Asch found that in one out of every three trials where the wrong answer was given, the subject gave the same wrong answer as the stooges. This led to an average level of conformity of 32 per cent. Asch interviewed his subjects after the trials to try to find out why they conformed to an answer which was so obviously wrong. Most of them said that they did not want to cause problems within the group, although they also stated that when they did give wrong answers it made them anxious. (Asch found that when there was just one other person present who did not go along with the majority, no matter how many others there were, it was sufficient to make the subject give the right answer.)</p>\n            <p>Kelman (1953) outlined three processes which can explain social conformity. The first is compliance, where subjects go along with the crowd to prevent any in-group hostility or bad feeling and to maintain group harmony. However, they do not change their own private belief. If we look back to the Asch study, we can see that the subjects were simply complying with the demands of the experimental situation but hadn't actually internalized the group's norms. They agreed in public, but dissented in private. In a process known as internalization, however, subjects do actually see the view of the group as the more valid one. They may be able to do this, for example, by convincing themselves that their eyesight is poor. Sometimes, however, subjects actually seem to change their beliefs because they want to become more like their heroes. If they really want to become part of an in-group, they will start to identify with that group and take on the group's values and beliefs, even if they are different to their own. Kelman calls this identification. It frequently happens with teenagers who want to become more like a peer group in order to be accepted, and suddenly seem to go against all the values and beliefs of their parents.</p>\n            <p>So why is it that we have to conform? Some people feel confident most of the time, have high self-esteem and do not have to go along with the majority. For most of us, though, how confident we feel varies from day to day, depending on the situation we are in, and this can influence behaviour.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>Conformity</h3>\n<h4>A review of conformity and some of the studies that have been done on it</h4>\n<p>During your childhood, there will have been some kind of craze which affected all the people in your school. It may have been to do with a particular toy or possibly a must-have item of clothing. It may have been something as simple as a type of pen or as expensive as an electronic games console. Fashion designers, toy manufacturers and anyone else involved in the retail trade love conformity. Set up a craze, especially in the young, and everyone will go for it. In fact, it's an ideal way to sell huge quantities of merchandise. The levels of conformity in consumerism are phenomenal. When you actually stand back and consider how easily we are persuaded that having certain items is the only way we can ensure peace of mind, you see what an important concept conformity is.</p>\n<p>Conformity has been described as “yielding to group pressure” (Crutchfield, 1962). However, this implies that other people put pressure on us to make us conform and this is not always the case. A better definition is given by Aronson (1976) who said it was a \"change in a person's behaviour or opinions as a result of real or imagined pressure from a person or group of people”. This would make more sense, as often the pressure we feel is imagined. The person or group he refers to would have to be important to us at the time, regardless of their status.</p>\n<p>There has been considerable research on conformity. One of the first studies looked at the answers people gave when asked to estimate the number of beans in a bottle (Jenness, 1932). If you have ever entered a “guess the number\" competition, you probably looked at the previous estimates made and based your judgment on what other people had guessed. This is more or less what happened in the Jenness study. First of all, he asked the respondents to give their own estimates, and then he asked them to decide a group estimate. Finally, he asked them alone again and discovered that they had stayed with the group answer.</p>\n<p>Probably the most famous study on conformity was undertaken by Asch (1951) when he created a situation where many of his subjects gave answers which were blatantly untrue, rather than contradict the people they were with. He did this by getting his subject to sit round a table with six stooges (colleagues of the experimenter) so that the subject was second to last. He showed them all a large card which had three lines of different lengths drawn on it, labelled A, B and C. He then gave them a card with a single line and asked them to match this in terms of length to one of the lines A, B or C.</p>\n<p>The stooges gave untrue responses in a number of the trials and the subjects were left in the situation where they either reported what they saw with their own eyes or conformed to the norm of the group. When the results were assessed, Asch found that in one out of every three trials where the wrong answer was given, the subject gave the same wrong answer as the stooges. This led to an average level of conformity of 32 per cent. Asch interviewed his subjects after the trials to try to find out why they conformed to an answer which was so obviously wrong. Most of them said that they did not want to cause problems within the group, although they also stated that when they did give wrong answers it made them anxious. (Asch found that when there was just one other person present who did not go along with the majority, no matter how many others there were, it was sufficient to make the subject give the right answer.)</p>\n<p>Kelman (1953) outlined three processes which can explain social conformity. The first is compliance, where subjects go along with the crowd to prevent any in-group hostility or bad feeling and to maintain group harmony. However, they do not change their own private belief. If we look back to the Asch study, we can see that the subjects were simply complying with the demands of the experimental situation but hadn't actually internalized the group's norms. They agreed in public, but dissented in private. In a process known as internalization, however, subjects do actually see the view of the group as the more valid one. They may be able to do this, for example, by convincing themselves that their eyesight is poor. Sometimes, however, subjects actually seem to change their beliefs because they want to become more like their heroes. If they really want to become part of an in-group, they will start to identify with that group and take on the group's values and beliefs, even if they are different to their own. Kelman calls this identification. It frequently happens with teenagers who want to become more like a peer group in order to be accepted, and suddenly seem to go against all the values and beliefs of their parents.</p>\n<p>So why is it that we have to conform? Some people feel confident most of the time, have high self-esteem and do not have to go along with the majority. For most of us, though, how confident we feel varies from day to day, depending on the situation we are in, and this can influence behaviour.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -34,7 +34,7 @@
         "q3",
         "q4"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n                <h4>Questions 27–30</h4>\n                <p>Do the following statements agree with the claims of the writer in Reading Passage 3? In boxes 27–30 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p><strong>27</strong> Childhood crazes can centre on items of any value.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> Children are more vulnerable to crazes now than they used to be.</p>\n                     <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> Consumers make too many quick decisions in shops.</p>\n                     <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> Crutchfield's definition of conformity is the most reliable.</p>\n                     <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3? In boxes 27–30 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> Childhood crazes can centre on items of any value.</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Children are more vulnerable to crazes now than they used to be.</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Consumers make too many quick decisions in shops.</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Crutchfield's definition of conformity is the most reliable.</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n                 <h4>Questions 31–35</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                <div class=\"summary-notes\">\n                    <h4>Studies on conformity</h4>\n                    <p>\n                    In the Jenness study, people had to guess how many <strong>31</strong> <input type=\"text\" id=\"q31_input\" name=\"q5\"> were in a container. Jenness found that, in most cases, people opted for an estimate given by a <strong>32</strong> <input type=\"text\" id=\"q32_input\" name=\"q6\">.\n                    </p>\n                    <p>\n                    Asch asked his subjects to <strong>33</strong> <input type=\"text\" id=\"q33_input\" name=\"q7\"> line lengths. To test the extent to which people would conform, he placed his subjects with colleagues who gave <strong>34</strong> <input type=\"text\" id=\"q34_input\" name=\"q8\"> responses. He found that his subjects agreed with his colleagues 32% of the time, although they admitted to feeling <strong>35</strong> <input type=\"text\" id=\"q35_input\" name=\"q9\"> about giving their answer.\n                    </p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n<h4>Questions 31–35</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"summary-notes\">\n<h4>Studies on conformity</h4>\n<p>\nIn the Jenness study, people had to guess how many <strong>31</strong> <input type=\"text\" id=\"q31_input\" name=\"q5\"> were in a container. Jenness found that, in most cases, people opted for an estimate given by a <strong>32</strong> <input type=\"text\" id=\"q32_input\" name=\"q6\">.\n</p>\n<p>\nAsch asked his subjects to <strong>33</strong> <input type=\"text\" id=\"q33_input\" name=\"q7\"> line lengths. To test the extent to which people would conform, he placed his subjects with colleagues who gave <strong>34</strong> <input type=\"text\" id=\"q34_input\" name=\"q8\"> responses. He found that his subjects agreed with his colleagues 32% of the time, although they admitted to feeling <strong>35</strong> <input type=\"text\" id=\"q35_input\" name=\"q9\"> about giving their answer.\n</p>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n                 <h4>Questions 36–40</h4>\n                <p>Complete the notes below.</p>\n                <p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n                <div class=\"kelman-notes\">\n                    <h4>Kelman's processes of social conformity</h4>\n                    <ul>\n                        <li>\n                            <h5>Compliance</h5>\n                            <div class=\"sub-point\">– people support the majority view despite their own ideas</div>\n                            <div class=\"sub-point\">– social harmony is maintained</div>\n                            <div class=\"sub-point\">– illustrated by the results of the research conducted by <strong>36</strong> <input type=\"text\" id=\"q36_input\" name=\"q10\"></div>\n                        </li>\n                        <li>\n                            <h5><strong>37</strong> <input type=\"text\" id=\"q37_input\" name=\"q11\"></h5>\n                            <div class=\"sub-point\">– majority view is considered most <strong>38</strong> <input type=\"text\" id=\"q38_input\" name=\"q12\"> view</div>\n                            <div class=\"sub-point\">– people persuade themselves despite their own ideas</div>\n                        </li>\n                        <li>\n                            <h5><strong>39</strong> <input type=\"text\" id=\"q39_input\" name=\"q13\"></h5>\n                             <div class=\"sub-point\">– people change their ideas to those of the majority</div>\n                             <div class=\"sub-point\">– typical of <strong>40</strong> <input type=\"text\" id=\"q40_input\" name=\"q14\"></div>\n                        </li>\n                    </ul>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete the notes below.</p>\n<p>Choose <strong>ONE WORD ONLY</strong> from the passage for each answer.</p>\n<div class=\"kelman-notes\">\n<h4>Kelman's processes of social conformity</h4>\n<ul>\n<li>\n<h5>Compliance</h5>\n<div class=\"sub-point\">– people support the majority view despite their own ideas</div>\n<div class=\"sub-point\">– social harmony is maintained</div>\n<div class=\"sub-point\">– illustrated by the results of the research conducted by <strong>36</strong> <input type=\"text\" id=\"q36_input\" name=\"q10\"></div>\n</li>\n<li>\n<h5><strong>37</strong> <input type=\"text\" id=\"q37_input\" name=\"q11\"></h5>\n<div class=\"sub-point\">– majority view is considered most <strong>38</strong> <input type=\"text\" id=\"q38_input\" name=\"q12\"> view</div>\n<div class=\"sub-point\">– people persuade themselves despite their own ideas</div>\n</li>\n<li>\n<h5><strong>39</strong> <input type=\"text\" id=\"q39_input\" name=\"q13\"></h5>\n<div class=\"sub-point\">– people change their ideas to those of the majority</div>\n<div class=\"sub-point\">– typical of <strong>40</strong> <input type=\"text\" id=\"q40_input\" name=\"q14\"></div>\n</li>\n</ul>\n</div>\n</div>"
     }
   ],
   "answerKey": {
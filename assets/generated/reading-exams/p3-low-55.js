@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Improving Patient Safety</h3>\n            <h4>How improved drug packaging could provide some answers to patient safety issues</h4>\n            \n            <h4>Packaging</h4>\n            <p>One of the most prominent design issues in pharmacy is that of drug packages and the patient information leaflets (PILs) included in them. Many pharmacists are concerned that current designs are 'accidents waiting to happen'. The UK government shares this concern and, in 2003, the National Patient Safety Agency created a new role, appointing Colum Lowe, who has 14 years' experience as a designer in the private sector, as head of design and human factors.</p>\n            <p>Packaging design in the pharmaceutical industry is handled by either in-house teams or external design agencies. For packaging design of over-the-counter medicines, which do not have to be dispensed by a pharmacist but can be bought directly from a sales assistant, characteristics such as attractiveness and distinguishability are important and so these are usually commissioned from an external design team. The marketing team prepares the initial brief and the designers come up with six or seven designs. Two or three of these are then tested on a consumer group. In contrast, most designs for prescription-only products are created in-house. In some cases, this may simply involve the company's design team applying the house design and then handing it over to design engineers rather than testing the design on a consumer group. Clearly this process cannot adequately address the needs of the wide variety of patients using medication.</p>\n            \n            <h4>Design considerations</h4>\n            <p>In her book Information Design for Patient Safety, Thea Swayne highlighted a multitude of design problems. For example, drugs that look or sound alike can lead to confusion; small type sizes and even the glare on silver-foil packaging can lead to names or instructions being misread. One such example is a drug that was accidentally injected into a patient through the spine (intrathecally) rather than through the veins (intravenously). Investigations following this tragedy attributed some blame to the poor choice of typescript used on the drug container. Furthermore, according to Swayne, real situations in which medicines are used include a parent giving a cough medicine to a child in the middle of the night; packaging should be designed for moments such as these rather than for the ideal world of a hospital.</p>\n\n            <h4>Safety and compliance</h4>\n            <p>Child protection is another area that gives designers opportunities to improve safety. According to the Child Accident Prevention Trust, 70% of children admitted to hospital with suspected poisoning have swallowed medicines, and although child-resistant lids have helped, they are not yet fully effective. There is scope for improving what is currently available, according to Richard Mawle, a freelance product designer who feels it is not just children who are blocked by child-proof closures. ‘Many child-resistant packs are based on strength but older people may have the same level of strength as a child,' he explained, and suggested that better designs could rely on cognitive skills (e.g. removing the lid using a three-step process).</p>\n            <p>Mawle also worked on a project which involved applying his skills to packaging and PILs. Commenting on the information presented, he said: ‘There can be an awful lot of junk at the beginning of PILs. For example, why are company details towards the beginning of a leaflet when what might be more vital for the patient is that the medicine should not be taken with alcohol?'</p>\n\n            <h4>Design principles and guidelines</h4>\n            <p>Most designers work according to basic principles; for example, certain print styles are known to be more difficult to read than others. Look-alike boxes present the potential for errors and an obvious solution would be to use colours to highlight a larger dosage of a drug. However, according to Thea Swayne, designating a colour to a particular dosage is not recommended because this could lead to the user not reading the text on a box.</p>\n            <p>Design features can provide the basis for lengthy debates. One argument is that if all packaging was white with black lettering, people would have no choice but to read every box carefully. The problem is that trials of drug packaging are few – common signage studies concern road-traffic signs and visual-display units. Although some designers take results from such studies into account, proving that a particular feature is beneficial can be difficult. For example, current UK legislation requires packaging to include the name of the medicine in Braille, but, according to Karel van der Waarde, a design consultant to the pharmaceutical industry, ‘it is not known how much visually impaired patients will benefit nor how much the reading of visually able patients will be impaired'. Van der Waarde is sceptical about current legislation and says that many regulatory authorities do not have the resources to handle packaging information properly. ‘They do not look at the use of packaging in a practical context – they only see one box at a time and not several together as pharmacists would do,' he said.</p>\n\n            <h4>Innovation</h4>\n            <p>On a positive note, a recent innovation exhibition revealed several new designs. 'The popper' aims to help arthritis sufferers remove tablets from blister packs, and ‘Pluspoint' is an adrenaline auto-injector (a device that allows diabetics to inject themselves) aimed at overcoming the fact that many patients do not carry their medication due to its prohibitive size. The aim of good design is to try to make things more user-friendly as well as safer. The guidelines in Information Design for Patient Safety are not intended to be legally binding. Rather, the book's purpose is to create a basic design standard and to stimulate innovation. The challenge for the pharmaceutical industry is to adopt such a standard.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Improving Patient Safety</h3>\n<h4>How improved drug packaging could provide some answers to patient safety issues</h4>\n<h4>Packaging</h4>\n<p>One of the most prominent design issues in pharmacy is that of drug packages and the patient information leaflets (PILs) included in them. Many pharmacists are concerned that current designs are 'accidents waiting to happen'. The UK government shares this concern and, in 2003, the National Patient Safety Agency created a new role, appointing Colum Lowe, who has 14 years' experience as a designer in the private sector, as head of design and human factors.</p>\n<p>Packaging design in the pharmaceutical industry is handled by either in-house teams or external design agencies. For packaging design of over-the-counter medicines, which do not have to be dispensed by a pharmacist but can be bought directly from a sales assistant, characteristics such as attractiveness and distinguishability are important and so these are usually commissioned from an external design team. The marketing team prepares the initial brief and the designers come up with six or seven designs. Two or three of these are then tested on a consumer group. In contrast, most designs for prescription-only products are created in-house. In some cases, this may simply involve the company's design team applying the house design and then handing it over to design engineers rather than testing the design on a consumer group. Clearly this process cannot adequately address the needs of the wide variety of patients using medication.</p>\n<h4>Design considerations</h4>\n<p>In her book Information Design for Patient Safety, Thea Swayne highlighted a multitude of design problems. For example, drugs that look or sound alike can lead to confusion; small type sizes and even the glare on silver-foil packaging can lead to names or instructions being misread. One such example is a drug that was accidentally injected into a patient through the spine (intrathecally) rather than through the veins (intravenously). Investigations following this tragedy attributed some blame to the poor choice of typescript used on the drug container. Furthermore, according to Swayne, real situations in which medicines are used include a parent giving a cough medicine to a child in the middle of the night; packaging should be designed for moments such as these rather than for the ideal world of a hospital.</p>\n<h4>Safety and compliance</h4>\n<p>Child protection is another area that gives designers opportunities to improve safety. According to the Child Accident Prevention Trust, 70% of children admitted to hospital with suspected poisoning have swallowed medicines, and although child-resistant lids have helped, they are not yet fully effective. There is scope for improving what is currently available, according to Richard Mawle, a freelance product designer who feels it is not just children who are blocked by child-proof closures. ‘Many child-resistant packs are based on strength but older people may have the same level of strength as a child,' he explained, and suggested that better designs could rely on cognitive skills (e.g. removing the lid using a three-step process).</p>\n<p>Mawle also worked on a project which involved applying his skills to packaging and PILs. Commenting on the information presented, he said: ‘There can be an awful lot of junk at the beginning of PILs. For example, why are company details towards the beginning of a leaflet when what might be more vital for the patient is that the medicine should not be taken with alcohol?'</p>\n<h4>Design principles and guidelines</h4>\n<p>Most designers work according to basic principles; for example, certain print styles are known to be more difficult to read than others. Look-alike boxes present the potential for errors and an obvious solution would be to use colours to highlight a larger dosage of a drug. However, according to Thea Swayne, designating a colour to a particular dosage is not recommended because this could lead to the user not reading the text on a box.</p>\n<p>Design features can provide the basis for lengthy debates. One argument is that if all packaging was white with black lettering, people would have no choice but to read every box carefully. The problem is that trials of drug packaging are few – common signage studies concern road-traffic signs and visual-display units. Although some designers take results from such studies into account, proving that a particular feature is beneficial can be difficult. For example, current UK legislation requires packaging to include the name of the medicine in Braille, but, according to Karel van der Waarde, a design consultant to the pharmaceutical industry, ‘it is not known how much visually impaired patients will benefit nor how much the reading of visually able patients will be impaired'. Van der Waarde is sceptical about current legislation and says that many regulatory authorities do not have the resources to handle packaging information properly. ‘They do not look at the use of packaging in a practical context – they only see one box at a time and not several together as pharmacists would do,' he said.</p>\n<h4>Innovation</h4>\n<p>On a positive note, a recent innovation exhibition revealed several new designs. 'The popper' aims to help arthritis sufferers remove tablets from blister packs, and ‘Pluspoint' is an adrenaline auto-injector (a device that allows diabetics to inject themselves) aimed at overcoming the fact that many patients do not carry their medication due to its prohibitive size. The aim of good design is to try to make things more user-friendly as well as safer. The guidelines in Information Design for Patient Safety are not intended to be legally binding. Rather, the book's purpose is to create a basic design standard and to stimulate innovation. The challenge for the pharmaceutical industry is to adopt such a standard.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                <h4>Questions 27–32</h4>\n                <p>Look at the following statements (Questions 27–32) and the list of people or groups below.</p>\n                <p>Match each statement with the correct person or group, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <p><em>NB You may use any letter more than once.</em></p>\n                \n                <div class=\"match-question-item\">\n                    <p><strong>27</strong> The elderly would benefit from drug containers that do not require force to open them.</p>\n                    <div class=\"match-dropzone\" data-question=\"q1\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>28</strong> Adapting packaging for the blind may disadvantage people who can see.</p>\n                    <div class=\"match-dropzone\" data-question=\"q2\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                     <p><strong>29</strong> Specially designed containers have not been able to eliminate drugs being swallowed accidentally.</p>\n                    <div class=\"match-dropzone\" data-question=\"q3\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                    <p><strong>30</strong> Designers have to consider how drugs are used in the home.</p>\n                    <div class=\"match-dropzone\" data-question=\"q4\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>31</strong> Governing bodies need to compare different drug containers rather than studying individual ones.</p>\n                    <div class=\"match-dropzone\" data-question=\"q5\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>32</strong> Information provided with medicine is not listed in the right order.</p>\n                    <div class=\"match-dropzone\" data-question=\"q6\"></div>\n                </div>\n\n                <div class=\"options-pool\" id=\"people-options-pool\">\n                    <strong>List of People or Groups</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Thea Swayne</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B The Child Accident Prevention Trust</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Richard Mawle</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Karel van der Waarde</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p>Look at the following statements (Questions 27–32) and the list of people or groups below.</p>\n<p>Match each statement with the correct person or group, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>27</strong> The elderly would benefit from drug containers that do not require force to open them.</p>\n<div class=\"match-dropzone\" data-question=\"q1\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>28</strong> Adapting packaging for the blind may disadvantage people who can see.</p>\n<div class=\"match-dropzone\" data-question=\"q2\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>29</strong> Specially designed containers have not been able to eliminate drugs being swallowed accidentally.</p>\n<div class=\"match-dropzone\" data-question=\"q3\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>30</strong> Designers have to consider how drugs are used in the home.</p>\n<div class=\"match-dropzone\" data-question=\"q4\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>31</strong> Governing bodies need to compare different drug containers rather than studying individual ones.</p>\n<div class=\"match-dropzone\" data-question=\"q5\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>32</strong> Information provided with medicine is not listed in the right order.</p>\n<div class=\"match-dropzone\" data-question=\"q6\"></div>\n</div>\n<div class=\"options-pool\" id=\"people-options-pool\">\n<strong>List of People or Groups</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Thea Swayne</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B The Child Accident Prevention Trust</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Richard Mawle</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Karel van der Waarde</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": true,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -50,7 +50,7 @@
         "q10",
         "q11"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-11-anchor\">\n                <h4>Questions 33–37</h4>\n                <p>Complete the summary using the list of words, A–G, below.</p>\n                <p><em>Drag and drop the correct word into the summary blanks.</em></p>\n                \n                <div class=\"summary-text\">\n                    <h5>Packaging design in the pharmaceutical industry</h5>\n                    <h6>Over-the-counter drugs</h6>\n                    <p>\n                    First, a proposal is written by the <strong>33</strong> <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span>. Then several designs are produced by the <strong>34</strong> <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span>. Finally, selected designs are shown to <strong>35</strong> <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span>.\n                    </p>\n                    <h6>Prescription-only drugs</h6>\n                    <p>\n                    The <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span> create the design. The design is then passed to <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span>.\n                    </p>\n                </div>\n                 <div id=\"word-options\" class=\"options-pool\">\n                     <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-word=\"consumers\">A consumers</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-word=\"design engineers\">B design engineers</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-word=\"external design team\">C external design team</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-word=\"in-house design team\">D in-house design team</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-word=\"marketing team\">E marketing team</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-word=\"pharmaceutical industry\">F pharmaceutical industry</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-word=\"pharmacists\">G pharmacists</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-11-anchor\">\n<h4>Questions 33–37</h4>\n<p>Complete the summary using the list of words, A–G, below.</p>\n<p><em>Drag and drop the correct word into the summary blanks.</em></p>\n<div class=\"summary-text\">\n<h5>Packaging design in the pharmaceutical industry</h5>\n<h6>Over-the-counter drugs</h6>\n<p>\nFirst, a proposal is written by the <strong>33</strong> <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span>. Then several designs are produced by the <strong>34</strong> <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span>. Finally, selected designs are shown to <strong>35</strong> <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span>.\n</p>\n<h6>Prescription-only drugs</h6>\n<p>\nThe <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span> create the design. The design is then passed to <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span>.\n</p>\n</div>\n<div id=\"word-options\" class=\"options-pool\">\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-word=\"consumers\">A consumers</div>\n<div class=\"drag-item\" draggable=\"true\" data-word=\"design engineers\">B design engineers</div>\n<div class=\"drag-item\" draggable=\"true\" data-word=\"external design team\">C external design team</div>\n<div class=\"drag-item\" draggable=\"true\" data-word=\"in-house design team\">D in-house design team</div>\n<div class=\"drag-item\" draggable=\"true\" data-word=\"marketing team\">E marketing team</div>\n<div class=\"drag-item\" draggable=\"true\" data-word=\"pharmaceutical industry\">F pharmaceutical industry</div>\n<div class=\"drag-item\" draggable=\"true\" data-word=\"pharmacists\">G pharmacists</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false
     },
     {
@@ -61,7 +61,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q12-13-14-anchor\">\n                <h4>Questions 38–40</h4>\n                <p>Choose the correct letter, A, B, C or D.</p>\n                <div class=\"question-item\">\n                    <p><strong>38</strong> In the accident mentioned in the passage, what was the 'design consideration' that caused a drug to be given incorrectly?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q12\" type=\"radio\" value=\"A\"> A a printing error</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"B\"> B the style of print</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"C\"> C an incorrect label</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"D\"> D the shape of the bottle</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>39</strong> What do some people say about the use of only black and white as a design feature?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q13\" type=\"radio\" value=\"A\"> A Consumers would dislike this option.</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"B\"> B Drug containers would all look too similar.</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"C\"> C People would pay more attention to label information.</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"D\"> D Partially sighted people would find these colours more helpful.</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>40</strong> Why does the writer refer to ‘the popper’ and ‘Pluspoint'?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q14\" type=\"radio\" value=\"A\"> A to show that progress is being made in pharmaceutical packaging design</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"B\"> B to give an example of pharmaceutical design problems that can cause accidents</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"C\"> C to prove that a lot of work still needs to be done to improve pharmaceutical packaging design</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"D\"> D to point out that patients need to be more informed about pharmaceutical products</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q12-13-14-anchor\">\n<h4>Questions 38–40</h4>\n<p>Choose the correct letter, A, B, C or D.</p>\n<div class=\"question-item\">\n<p><strong>38</strong> In the accident mentioned in the passage, what was the 'design consideration' that caused a drug to be given incorrectly?</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"A\"> A a printing error</label> <label><input name=\"q12\" type=\"radio\" value=\"B\"> B the style of print</label> <label><input name=\"q12\" type=\"radio\" value=\"C\"> C an incorrect label</label> <label><input name=\"q12\" type=\"radio\" value=\"D\"> D the shape of the bottle</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> What do some people say about the use of only black and white as a design feature?</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"> A Consumers would dislike this option.</label> <label><input name=\"q13\" type=\"radio\" value=\"B\"> B Drug containers would all look too similar.</label> <label><input name=\"q13\" type=\"radio\" value=\"C\"> C People would pay more attention to label information.</label> <label><input name=\"q13\" type=\"radio\" value=\"D\"> D Partially sighted people would find these colours more helpful.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> Why does the writer refer to ‘the popper’ and ‘Pluspoint'?</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"A\"> A to show that progress is being made in pharmaceutical packaging design</label> <label><input name=\"q14\" type=\"radio\" value=\"B\"> B to give an example of pharmaceutical design problems that can cause accidents</label> <label><input name=\"q14\" type=\"radio\" value=\"C\"> C to prove that a lot of work still needs to be done to improve pharmaceutical packaging design</label> <label><input name=\"q14\" type=\"radio\" value=\"D\"> D to point out that patients need to be more informed about pharmaceutical products</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>Learning to be bilingual</h2>\n            <h4>Dr Chisato Danjo, Lecturer in Japanese and Linguistics, examines the bilingual family home</h4>\n            \n            <p>Few people would consider mastering more than one language a bad idea. Consequently, parents who speak different languages from each other are generally keen for their children to learn both. They understand that the family setting they create is central to this, and seek ways to ensure their children thrive bilingually. One of the best-known approaches is the 'one-parent-one-language' strategy (OPOL). Each parent uses their native language when communicating with their children, so the children learn both simultaneously. OPOL emphasises consistency – each parent sticking to one language – as key to its approach. But this creates the myth that mixing languages should always be avoided. My recent study, part of a new wave of multilingualism studies, would suggest that this received wisdom is just that: a myth. My research looked at Japanese-British families living in the UK with pre- and early school-age children who were following a more-or-less strict OPOL language policy. I was particularly interested in examining the impact of OPOL in the family home – how does this unique language environment affect the way children use languages?</p>\n            <p>Most of the Japanese mothers who participated were fluent in Japanese and English, while the fathers possessed merely an elementary grasp of Japanese. This made English the primary language of communication between the parents and outside the home. For this reason, the mothers were careful to carve out additional space for more sustained Japanese language learning with their children. In other words, this dedicated space for communicating in Japanese was time the children spent exclusively with their mother. This seemed to create a connection between ‘Japanese language' and 'motherhood' in the children's perception. This link became apparent in the way the children used Japanese as a means of emotional bonding with their mother. In addition, they adopted a broader behavioural repertoire than that which is usually associated with a language. For example, switching to Japanese could sometimes serve as a method to appease Mum when she seemed unhappy. At other times, refusing to communicate in Japanese was a useful means of defiance, even when the dispute was not related to language.</p>\n            <p>The OPOL approach emphasises the need for parents to monitor children's language closely and correct them if they mix the two languages. In practice, many parents speaking the minority language are bilingual themselves – so they understand what their children are saying even when they do mix the two. In addition, parents feel it's problematic to keep correcting children when they mix languages. This is particularly the case when children show annoyance at being corrected. The parents believe it is a lot more important to have a meaningful conversation with their children.</p>\n            <p>But what if a child uses language that cannot readily be categorised as either one language or the other? An example from my study involved the use of English words adapted to accommodate Japanese pronunciation. One of these borrowed words, ‘ice cream', is usually pronounced ‘aisukurimu'. The distinction between singular and plural does not exist in Japanese nouns in the English language sense, so whether using singular or plural, even in a borrowed word, ‘aisukurimu' is the form normally used. But one of my child participants showed his mother a drawing of two cones of ice cream and described them as 'aisukurimuzu', with a Japanese pronunciation but in English plural form. The child had created something in between.</p>\n            <p>Another example from my study focused on the interaction between Japanese-English bilingual siblings. In one case, a six-year-old girl was trying to convince her four-year-old brother to let her play with his toys. Following firm rejections by her brother, the girl drew on her communicative repertoire to convince him. To start with, she shifted from an authoritative demand to a softer and humbler appeal. She rephrased the question by using various polite forms. Then, her voice became more nasal, suggesting she was about to burst into tears. Even more interestingly, while the negotiation had begun in English, in the middle she shifted to Japanese. Although this may give the impression of language mixing, a considerably more complex process was taking place. The shift was accompanied by the incorporation of Japanese cultural elements, such as honorific titles that emphasise emotional attachment, a relationship of dependence between sister and brother, and an assumed obligation to care on the part of the brother. She succeeded.</p>\n            <p>These examples show how creatively and strategically human beings use language in their daily communication. Whether bilingual or not, we all constantly select from our repertoire anything that will best serve our purpose. For instance, imagine you want to ask a neighbour a favour. You would use polite language in a friendly voice. But what about your facial expression? Your body language? It is likely you would make appropriate choices. For bilinguals, shifting between languages is all part of their repertoire.</p>\n            <p>Our language repertoires are shaped by meaning, based on knowledge gathered throughout our lives, and the ways we use language also shape its meaning. The use of OPOL in the family brings specific meaning to language used at home, and children make full use of emergent meaning in their own interactions.</p>\n            <p>The popularity of OPOL amongst parents rests on the simplicity of its message, which is that it should be applied consistently. But when we see a child actively using, adapting and negotiating their repertoire, it casts doubt on the belief that it's bad for children to mix languages. What they could actually be doing is demonstrating high-level flexibility and interpersonal skills.</p>\n            <p>Being bilingual isn't simply about an ability to speak two languages. Rigidly policing consistency in the OPOL approach could actually inhibit bilingual children's linguistic ability and creativity. And in the same way, it could also limit their parents' ability to reveal their own bilingual skills, using their own repertoires.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>Learning to be bilingual</h2>\n<h4>Dr Chisato Danjo, Lecturer in Japanese and Linguistics, examines the bilingual family home</h4>\n<p>Few people would consider mastering more than one language a bad idea. Consequently, parents who speak different languages from each other are generally keen for their children to learn both. They understand that the family setting they create is central to this, and seek ways to ensure their children thrive bilingually. One of the best-known approaches is the 'one-parent-one-language' strategy (OPOL). Each parent uses their native language when communicating with their children, so the children learn both simultaneously. OPOL emphasises consistency – each parent sticking to one language – as key to its approach. But this creates the myth that mixing languages should always be avoided. My recent study, part of a new wave of multilingualism studies, would suggest that this received wisdom is just that: a myth. My research looked at Japanese-British families living in the UK with pre- and early school-age children who were following a more-or-less strict OPOL language policy. I was particularly interested in examining the impact of OPOL in the family home – how does this unique language environment affect the way children use languages?</p>\n<p>Most of the Japanese mothers who participated were fluent in Japanese and English, while the fathers possessed merely an elementary grasp of Japanese. This made English the primary language of communication between the parents and outside the home. For this reason, the mothers were careful to carve out additional space for more sustained Japanese language learning with their children. In other words, this dedicated space for communicating in Japanese was time the children spent exclusively with their mother. This seemed to create a connection between ‘Japanese language' and 'motherhood' in the children's perception. This link became apparent in the way the children used Japanese as a means of emotional bonding with their mother. In addition, they adopted a broader behavioural repertoire than that which is usually associated with a language. For example, switching to Japanese could sometimes serve as a method to appease Mum when she seemed unhappy. At other times, refusing to communicate in Japanese was a useful means of defiance, even when the dispute was not related to language.</p>\n<p>The OPOL approach emphasises the need for parents to monitor children's language closely and correct them if they mix the two languages. In practice, many parents speaking the minority language are bilingual themselves – so they understand what their children are saying even when they do mix the two. In addition, parents feel it's problematic to keep correcting children when they mix languages. This is particularly the case when children show annoyance at being corrected. The parents believe it is a lot more important to have a meaningful conversation with their children.</p>\n<p>But what if a child uses language that cannot readily be categorised as either one language or the other? An example from my study involved the use of English words adapted to accommodate Japanese pronunciation. One of these borrowed words, ‘ice cream', is usually pronounced ‘aisukurimu'. The distinction between singular and plural does not exist in Japanese nouns in the English language sense, so whether using singular or plural, even in a borrowed word, ‘aisukurimu' is the form normally used. But one of my child participants showed his mother a drawing of two cones of ice cream and described them as 'aisukurimuzu', with a Japanese pronunciation but in English plural form. The child had created something in between.</p>\n<p>Another example from my study focused on the interaction between Japanese-English bilingual siblings. In one case, a six-year-old girl was trying to convince her four-year-old brother to let her play with his toys. Following firm rejections by her brother, the girl drew on her communicative repertoire to convince him. To start with, she shifted from an authoritative demand to a softer and humbler appeal. She rephrased the question by using various polite forms. Then, her voice became more nasal, suggesting she was about to burst into tears. Even more interestingly, while the negotiation had begun in English, in the middle she shifted to Japanese. Although this may give the impression of language mixing, a considerably more complex process was taking place. The shift was accompanied by the incorporation of Japanese cultural elements, such as honorific titles that emphasise emotional attachment, a relationship of dependence between sister and brother, and an assumed obligation to care on the part of the brother. She succeeded.</p>\n<p>These examples show how creatively and strategically human beings use language in their daily communication. Whether bilingual or not, we all constantly select from our repertoire anything that will best serve our purpose. For instance, imagine you want to ask a neighbour a favour. You would use polite language in a friendly voice. But what about your facial expression? Your body language? It is likely you would make appropriate choices. For bilinguals, shifting between languages is all part of their repertoire.</p>\n<p>Our language repertoires are shaped by meaning, based on knowledge gathered throughout our lives, and the ways we use language also shape its meaning. The use of OPOL in the family brings specific meaning to language used at home, and children make full use of emergent meaning in their own interactions.</p>\n<p>The popularity of OPOL amongst parents rests on the simplicity of its message, which is that it should be applied consistently. But when we see a child actively using, adapting and negotiating their repertoire, it casts doubt on the belief that it's bad for children to mix languages. What they could actually be doing is demonstrating high-level flexibility and interpersonal skills.</p>\n<p>Being bilingual isn't simply about an ability to speak two languages. Rigidly policing consistency in the OPOL approach could actually inhibit bilingual children's linguistic ability and creativity. And in the same way, it could also limit their parents' ability to reveal their own bilingual skills, using their own repertoires.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                <h4>Questions 27–32</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>27</strong> What does the writer say about families in which the parents speak different languages?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"A\"><span>A They constantly research ways to help their children learn both languages.</span></label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"B\"><span>B They realise the importance of their role in their children's language learning.</span></label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"C\"><span>C They prioritise their children's language learning over their own.</span></label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"D\"><span>D They find the OPOL approach the easiest to adopt.</span></label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>28</strong> The writer uses the term 'received wisdom' in the first paragraph to illustrate that</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"A\"><span>A the success of OPOL depends on the languages spoken by the parents.</span></label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"B\"><span>B OPOL fails if the parents are not consistent in its use.</span></label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"C\"><span>C one generally accepted principle of OPOL is incorrect.</span></label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"D\"><span>D there has been a lack of research into OPOL.</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> The mothers who took part in the writer's research</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"A\"><span>A compensated for the fact that their children were exposed to more English than Japanese.</span></label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"B\"><span>B took their children's language learning more seriously than their partners did.</span></label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"C\"><span>C used language learning to increase the time they spent with their children.</span></label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"D\"><span>D were reluctant for their partners to speak Japanese to their children.</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> The writer says that the children in her study</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"A\"><span>A preferred to use Japanese exclusively for communicating with their mothers.</span></label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"B\"><span>B understood their mothers better as their knowledge of Japanese increased.</span></label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"C\"><span>C argued about things that would be unimportant for monolingual children.</span></label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"D\"><span>D used language in a way that is uncommon.</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>31</strong> What does the writer suggest about correcting children who are learning to be bilingual?</p>\n                     <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"A\"><span>A It is usually avoided if it causes bad feeling.</span></label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"B\"><span>B Parents tend to prioritise it over maintaining a conversation.</span></label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"C\"><span>C It is unnecessary with the OPOL method of learning.</span></label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"D\"><span>D Parents are less likely to do it if they speak both languages.</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>32</strong> The writer gives the 'ice cream' example to show that</p>\n                     <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"A\"><span>A bilingual children find the use of borrowed words less confusing than other children.</span></label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"B\"><span>B bilingual children like to test their parents with words they know to be wrong.</span></label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"C\"><span>C knowledge of two languages leads bilingual children to invent new word forms.</span></label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"D\"><span>D it may be difficult to distinguish which language a bilingual child is using.</span></label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> What does the writer say about families in which the parents speak different languages?</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"><span>A They constantly research ways to help their children learn both languages.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"B\"><span>B They realise the importance of their role in their children's language learning.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"C\"><span>C They prioritise their children's language learning over their own.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"D\"><span>D They find the OPOL approach the easiest to adopt.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> The writer uses the term 'received wisdom' in the first paragraph to illustrate that</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"><span>A the success of OPOL depends on the languages spoken by the parents.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"B\"><span>B OPOL fails if the parents are not consistent in its use.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"C\"><span>C one generally accepted principle of OPOL is incorrect.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"D\"><span>D there has been a lack of research into OPOL.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> The mothers who took part in the writer's research</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"><span>A compensated for the fact that their children were exposed to more English than Japanese.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"B\"><span>B took their children's language learning more seriously than their partners did.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"C\"><span>C used language learning to increase the time they spent with their children.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"D\"><span>D were reluctant for their partners to speak Japanese to their children.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> The writer says that the children in her study</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"><span>A preferred to use Japanese exclusively for communicating with their mothers.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"B\"><span>B understood their mothers better as their knowledge of Japanese increased.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"C\"><span>C argued about things that would be unimportant for monolingual children.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"D\"><span>D used language in a way that is uncommon.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> What does the writer suggest about correcting children who are learning to be bilingual?</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"><span>A It is usually avoided if it causes bad feeling.</span></label> <label><input name=\"q5\" type=\"radio\" value=\"B\"><span>B Parents tend to prioritise it over maintaining a conversation.</span></label> <label><input name=\"q5\" type=\"radio\" value=\"C\"><span>C It is unnecessary with the OPOL method of learning.</span></label> <label><input name=\"q5\" type=\"radio\" value=\"D\"><span>D Parents are less likely to do it if they speak both languages.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> The writer gives the 'ice cream' example to show that</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"A\"><span>A bilingual children find the use of borrowed words less confusing than other children.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"B\"><span>B bilingual children like to test their parents with words they know to be wrong.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"C\"><span>C knowledge of two languages leads bilingual children to invent new word forms.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"D\"><span>D it may be difficult to distinguish which language a bilingual child is using.</span></label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -47,7 +47,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-anchor\">\n                <h4>Questions 33–36</h4>\n                <p>Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n                <div class=\"summary-box\">\n                    <h5 style=\"text-align: center;\">A bilingual child negotiates with her brother</h5>\n                    <div class=\"summary-text\">\n                        <p>Faced with her little brother's <strong>33</strong> <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> to let her play with his toys, a young bilingual child used all of her communication <strong>34</strong> <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> to change his mind. First, she expressed her <strong>35</strong> <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span> in gentler, more polite language, and pretended to be about to cry. Having switched from English to Japanese, she exploited aspects of Japanese culture, such as reminding him of his <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span> to her as her brother. She succeeded in her attempts to convince him.</p>\n                    </div>\n                </div>\n                <div id=\"word-options\">\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A request</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B attempts</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C strategies</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D misunderstandings</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E responsibility</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F agreement</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G judgement</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H refusal</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I behaviour</div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-10-anchor\">\n<h4>Questions 33–36</h4>\n<p>Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n<div class=\"summary-box\">\n<h5 style=\"text-align: center;\">A bilingual child negotiates with her brother</h5>\n<div class=\"summary-text\">\n<p>Faced with her little brother's <strong>33</strong> <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> to let her play with his toys, a young bilingual child used all of her communication <strong>34</strong> <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> to change his mind. First, she expressed her <strong>35</strong> <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span> in gentler, more polite language, and pretended to be about to cry. Having switched from English to Japanese, she exploited aspects of Japanese culture, such as reminding him of his <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span> to her as her brother. She succeeded in her attempts to convince him.</p>\n</div>\n</div>\n<div id=\"word-options\">\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A request</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B attempts</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C strategies</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D misunderstandings</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E responsibility</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F agreement</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G judgement</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H refusal</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I behaviour</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -58,7 +58,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n                <h4>Questions 37–40</h4>\n                <p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n                <ul style=\"list-style: none; padding-left: 0;\">\n                    <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p><strong>37</strong> Even people who speak only one language know how to adapt their way of communicating according to the situation.</p>\n                    <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>38</strong> People who grow up in OPOL families will go on to use this approach with their own children.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>39</strong> The reason the OPOL approach is favoured by many parents is that it encourages them to switch languages when necessary.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>40</strong> Bilingual children who mix languages eventually develop a preference for one of the languages.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<ul style=\"list-style: none; padding-left: 0;\">\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>37</strong> Even people who speak only one language know how to adapt their way of communicating according to the situation.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> People who grow up in OPOL families will go on to use this approach with their own children.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> The reason the OPOL approach is favoured by many parents is that it encourages them to switch languages when necessary.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> Bilingual children who mix languages eventually develop a preference for one of the languages.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>Sea Change for Salinity</h2>\n            <h4>One of the most serious problems facing Australian farmers is an increase in the salt content in the soil. However, there are new weapons emerging in the fight against salinity.</h4>\n            \n            <p><strong>A</strong> Beneath the flat, impassive surface of Australia lie hidden mountains, valleys and gorges – ancient traps and channels for the deadly salt that is stealthily killing so much of the Australian landscape. The war on salt is calling forth new weapons. A suite of high technologies used by geologists to see underground and prospect for gold and minerals is now being used to pinpoint the presence of salt beneath the landscape, and to predict where it might move.</p>\n            <p><strong>B</strong> Unless this process is clearly understood, warns Chief of Exploration and Mining Dr Neil Phillips, the hard work now underway of planning and tree-planting on the surface may be rendered ineffective: salt can still sneak past and erupt, following one of the ancient river channels formed millions of years ago. The use of airborne electromagnetics to detect salt hidden beneath the landscape has been around for a decade, but the past two years have seen a major development in its precision and powers of detection. Like the use of radar in battles, it has the potential to turn the tide of the struggle in favour of the defence by helping to pinpoint, plot and predict the movements of the foe.</p>\n            <p><strong>C</strong> Angus Howell, who farms near Warrenbayne, in Southeast Australia, saw his first outbreak of salt in 1948. Over the ensuing decades the patches spread and multiplied until they consumed almost 100 hectares. By the late 1970s, Howell and his fellow farmers had decided it was time for action and established a government-funded “Landcare” group in a bid to save Australia's farmland. But despite a mounting effort by scientists, farmers and governments, the “white death” continued to encroach. Small successes were eclipsed by larger defeats and fresh outbreaks.</p>\n            <p><strong>D</strong> \"The technical solutions just aren't there yet for dealing with broadacre salinity, nor are the social and economic solutions. How do you introduce the land-use changes that are needed when people still need to make a living?” Howell asks. There is no satisfactory solution yet. Part of the problem has lain in salt's ability to mount ambushes, emerging somewhere new, sometimes unexpected and unexplained, beating plans to intercept it. Only now are scientists starting to really disclose its secret subterranean stores and passages.</p>\n            <p><strong>E</strong> The need for such knowledge is pressing. Salt has already afflicted six million hectares of once-productive country. At present rates, it is predicted that, by 2050, it will have sterilised a total of 17 million hectares and the waters of Australia's Murray River will regularly exceed the World Health Organisation's salt limits for drinking water. Defeating this assault may take centuries, not decades.</p>\n            <p><strong>F</strong> Electromagnetic surveys measure the electrical conductivity of soil to reveal the distribution of salt and the nature and variability of the regolith – the weathered rock and sediment that may lie above the bedrock. Magnetic surveys measure small differences in the Earth's magnetic field, enabling scientists to probe the deep past and reconstruct ancient landscapes – rivers, basins and faults now buried under tens of metres of sediment. These features help to reveal where groundwater is stored, dictate the direction of groundwater movement, and are critical to predicting or ruling out salinity hot-spots.</p>\n            <p><strong>G</strong> Radiometric analysis is based on the detection of radiation emitted by elements contained in rocks and soils, allowing scientists to delineate landforms. These factors influence the mobility of salt through the soil profile and help determine where to plant particular crop species to tackle the problem. Using data from the Murray River region, scientists have revealed a network of ancient drainage systems that channelled water beneath the current land-surface. These buried channels may carry salt and sometimes run at right angles to channels on the surface. This implies that the salt could move underground in quite a different direction to what one would expect by looking at surface slope and drainage.</p>\n            <p><strong>H</strong> One of the biggest advances in detection, says Professor Neil Phillips, has come with the integration of different techniques such as magnetics, electromagnetics and radiometrics, and ground mapping. Individually, these technologies only gave clues to what was going on underground. Together they provide a far more revealing picture of the subsurface landscape, several hundred metres deep. Advanced airborne electromagnetics, in particular, enables scientists to take “slices” of the landscape at depths of five metres, ten metres, fifteen metres and so on, to determine where salt may be stored at depth. This is building up a four-dimensional picture of the subsurface landscape, enabling researchers to understand movements of salt in length, breadth, depth and time. From such technologies it will be possible to locate salt stores, identify how saline they are, look at man-made and natural changes to the landscape that may cause it to mobilise, and then predict where it will head to and over what time span. This in turn will give the salt warriors time to model various ways of containing or curbing the menace, see what works best and then try it out on the ground.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>Sea Change for Salinity</h2>\n<h4>One of the most serious problems facing Australian farmers is an increase in the salt content in the soil. However, there are new weapons emerging in the fight against salinity.</h4>\n<p><strong>A</strong> Beneath the flat, impassive surface of Australia lie hidden mountains, valleys and gorges – ancient traps and channels for the deadly salt that is stealthily killing so much of the Australian landscape. The war on salt is calling forth new weapons. A suite of high technologies used by geologists to see underground and prospect for gold and minerals is now being used to pinpoint the presence of salt beneath the landscape, and to predict where it might move.</p>\n<p><strong>B</strong> Unless this process is clearly understood, warns Chief of Exploration and Mining Dr Neil Phillips, the hard work now underway of planning and tree-planting on the surface may be rendered ineffective: salt can still sneak past and erupt, following one of the ancient river channels formed millions of years ago. The use of airborne electromagnetics to detect salt hidden beneath the landscape has been around for a decade, but the past two years have seen a major development in its precision and powers of detection. Like the use of radar in battles, it has the potential to turn the tide of the struggle in favour of the defence by helping to pinpoint, plot and predict the movements of the foe.</p>\n<p><strong>C</strong> Angus Howell, who farms near Warrenbayne, in Southeast Australia, saw his first outbreak of salt in 1948. Over the ensuing decades the patches spread and multiplied until they consumed almost 100 hectares. By the late 1970s, Howell and his fellow farmers had decided it was time for action and established a government-funded “Landcare” group in a bid to save Australia's farmland. But despite a mounting effort by scientists, farmers and governments, the “white death” continued to encroach. Small successes were eclipsed by larger defeats and fresh outbreaks.</p>\n<p><strong>D</strong> \"The technical solutions just aren't there yet for dealing with broadacre salinity, nor are the social and economic solutions. How do you introduce the land-use changes that are needed when people still need to make a living?” Howell asks. There is no satisfactory solution yet. Part of the problem has lain in salt's ability to mount ambushes, emerging somewhere new, sometimes unexpected and unexplained, beating plans to intercept it. Only now are scientists starting to really disclose its secret subterranean stores and passages.</p>\n<p><strong>E</strong> The need for such knowledge is pressing. Salt has already afflicted six million hectares of once-productive country. At present rates, it is predicted that, by 2050, it will have sterilised a total of 17 million hectares and the waters of Australia's Murray River will regularly exceed the World Health Organisation's salt limits for drinking water. Defeating this assault may take centuries, not decades.</p>\n<p><strong>F</strong> Electromagnetic surveys measure the electrical conductivity of soil to reveal the distribution of salt and the nature and variability of the regolith – the weathered rock and sediment that may lie above the bedrock. Magnetic surveys measure small differences in the Earth's magnetic field, enabling scientists to probe the deep past and reconstruct ancient landscapes – rivers, basins and faults now buried under tens of metres of sediment. These features help to reveal where groundwater is stored, dictate the direction of groundwater movement, and are critical to predicting or ruling out salinity hot-spots.</p>\n<p><strong>G</strong> Radiometric analysis is based on the detection of radiation emitted by elements contained in rocks and soils, allowing scientists to delineate landforms. These factors influence the mobility of salt through the soil profile and help determine where to plant particular crop species to tackle the problem. Using data from the Murray River region, scientists have revealed a network of ancient drainage systems that channelled water beneath the current land-surface. These buried channels may carry salt and sometimes run at right angles to channels on the surface. This implies that the salt could move underground in quite a different direction to what one would expect by looking at surface slope and drainage.</p>\n<p><strong>H</strong> One of the biggest advances in detection, says Professor Neil Phillips, has come with the integration of different techniques such as magnetics, electromagnetics and radiometrics, and ground mapping. Individually, these technologies only gave clues to what was going on underground. Together they provide a far more revealing picture of the subsurface landscape, several hundred metres deep. Advanced airborne electromagnetics, in particular, enables scientists to take “slices” of the landscape at depths of five metres, ten metres, fifteen metres and so on, to determine where salt may be stored at depth. This is building up a four-dimensional picture of the subsurface landscape, enabling researchers to understand movements of salt in length, breadth, depth and time. From such technologies it will be possible to locate salt stores, identify how saline they are, look at man-made and natural changes to the landscape that may cause it to mobilise, and then predict where it will head to and over what time span. This in turn will give the salt warriors time to model various ways of containing or curbing the menace, see what works best and then try it out on the ground.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -37,7 +37,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n                <h4>Questions 27–33</h4>\n                <p>Reading Passage 3 has eight sections, <strong>A–H</strong>.</p>\n                <p>Which section contains the following information?</p>\n                <p><em>Write the correct letter, <strong>A–H</strong>, in the boxes on your answer sheet. <br><strong>NB</strong> You may use any letter more than once.</em></p>\n                <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                        <thead>\n                            <tr>\n                                <th></th>\n                                <th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>27</strong> a prediction of the future risk of salt to water supplies.</td>\n                                <td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>28</strong> the reason why technologies must be combined to be effective.</td>\n                                <td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>29</strong> a reference to the recent improvements in the accuracy of airborne electromagnetics.</td>\n                                <td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>30</strong> the organization of concerned farmers into an official body.</td>\n                                <td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>31</strong> the estimated length of time salinity is likely to be a problem.</td>\n                                <td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>32</strong> a summary of stages in a proposed plan of action to combat the salt problem.</td>\n                                <td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td><td><input type=\"radio\" name=\"q6\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>33</strong> the possibility that current re-vegetation practices are a waste of time.</td>\n                                <td><input type=\"radio\" name=\"q7\" value=\"A\"></td><td><input type=\"radio\" name=\"q7\" value=\"B\"></td><td><input type=\"radio\" name=\"q7\" value=\"C\"></td><td><input type=\"radio\" name=\"q7\" value=\"D\"></td><td><input type=\"radio\" name=\"q7\" value=\"E\"></td><td><input type=\"radio\" name=\"q7\" value=\"F\"></td><td><input type=\"radio\" name=\"q7\" value=\"G\"></td><td><input type=\"radio\" name=\"q7\" value=\"H\"></td>\n                            </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 27–33</h4>\n<p>Reading Passage 3 has eight sections, <strong>A–H</strong>.</p>\n<p>Which section contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–H</strong>, in the boxes on your answer sheet.<br><strong>NB</strong> You may use any letter more than once.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>27</strong> a prediction of the future risk of salt to water supplies.</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>28</strong> the reason why technologies must be combined to be effective.</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>29</strong> a reference to the recent improvements in the accuracy of airborne electromagnetics.</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>30</strong> the organization of concerned farmers into an official body.</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>31</strong> the estimated length of time salinity is likely to be a problem.</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>32</strong> a summary of stages in a proposed plan of action to combat the salt problem.</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td><td><input type=\"radio\" name=\"q6\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>33</strong> the possibility that current re-vegetation practices are a waste of time.</td>\n<td><input type=\"radio\" name=\"q7\" value=\"A\"></td><td><input type=\"radio\" name=\"q7\" value=\"B\"></td><td><input type=\"radio\" name=\"q7\" value=\"C\"></td><td><input type=\"radio\" name=\"q7\" value=\"D\"></td><td><input type=\"radio\" name=\"q7\" value=\"E\"></td><td><input type=\"radio\" name=\"q7\" value=\"F\"></td><td><input type=\"radio\" name=\"q7\" value=\"G\"></td><td><input type=\"radio\" name=\"q7\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -47,7 +47,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-anchor\">\n                <h4>Questions 34–36</h4>\n                <p>Look at the list of techniques (Questions 34–36) and the list of uses which follows it.</p>\n                <p>Match each technique with the correct use, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <p><em>Write the correct letter, <strong>A, B, C</strong> or <strong>D</strong>, in the boxes on your answer sheet.</em></p>\n                \n                <div class=\"list-box\">\n                    <h5>List of uses</h5>\n                    <ul>\n                        <li><strong>A</strong> can help farmers choose the best location for plants.</li>\n                        <li><strong>B</strong> can show the composition of the top layer of the ground.</li>\n                        <li><strong>C</strong> can detect how far below ground the salt is.</li>\n                        <li><strong>D</strong> can determine how old the salt is in a particular area.</li>\n                    </ul>\n                </div>\n\n                <div class=\"question-item\">\n                    <p><strong>34</strong> Electromagnetic surveys</p>\n                    <div class=\"radio-options\" style=\"flex-direction: row; gap: 12px; flex-wrap: wrap;\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"A\"><span>A</span></label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"B\"><span>B</span></label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"C\"><span>C</span></label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"D\"><span>D</span></label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>35</strong> Radiometric analysis</p>\n                    <div class=\"radio-options\" style=\"flex-direction: row; gap: 12px; flex-wrap: wrap;\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"A\"><span>A</span></label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"B\"><span>B</span></label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"C\"><span>C</span></label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"D\"><span>D</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>36</strong> Airborne electromagnetics</p>\n                    <div class=\"radio-options\" style=\"flex-direction: row; gap: 12px; flex-wrap: wrap;\">\n                        <label><input name=\"q10\" type=\"radio\" value=\"A\"><span>A</span></label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"B\"><span>B</span></label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"C\"><span>C</span></label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"D\"><span>D</span></label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-anchor\">\n<h4>Questions 34–36</h4>\n<p>Look at the list of techniques (Questions 34–36) and the list of uses which follows it.</p>\n<p>Match each technique with the correct use, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<p><em>Write the correct letter, <strong>A, B, C</strong> or <strong>D</strong>, in the boxes on your answer sheet.</em></p>\n<div class=\"list-box\">\n<h5>List of uses</h5>\n<ul>\n<li><strong>A</strong> can help farmers choose the best location for plants.</li>\n<li><strong>B</strong> can show the composition of the top layer of the ground.</li>\n<li><strong>C</strong> can detect how far below ground the salt is.</li>\n<li><strong>D</strong> can determine how old the salt is in a particular area.</li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Electromagnetic surveys</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 12px; flex-wrap: wrap;\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"><span>A</span></label> <label><input name=\"q8\" type=\"radio\" value=\"B\"><span>B</span></label> <label><input name=\"q8\" type=\"radio\" value=\"C\"><span>C</span></label> <label><input name=\"q8\" type=\"radio\" value=\"D\"><span>D</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> Radiometric analysis</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 12px; flex-wrap: wrap;\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"><span>A</span></label> <label><input name=\"q9\" type=\"radio\" value=\"B\"><span>B</span></label> <label><input name=\"q9\" type=\"radio\" value=\"C\"><span>C</span></label> <label><input name=\"q9\" type=\"radio\" value=\"D\"><span>D</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> Airborne electromagnetics</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 12px; flex-wrap: wrap;\">\n<label><input name=\"q10\" type=\"radio\" value=\"A\"><span>A</span></label> <label><input name=\"q10\" type=\"radio\" value=\"B\"><span>B</span></label> <label><input name=\"q10\" type=\"radio\" value=\"C\"><span>C</span></label> <label><input name=\"q10\" type=\"radio\" value=\"D\"><span>D</span></label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -58,7 +58,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n                <h4>Questions 37–40</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                \n                <div class=\"question-item\">\n                    <p><strong>37</strong> What link does the writer make between salt and gold?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q11\" type=\"radio\" value=\"A\"><span>A They can both be found in the same locations.</span></label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"B\"><span>B Both have been found to have an impact on the landscape.</span></label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"C\"><span>C The same techniques can be used to find both.</span></label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"D\"><span>D Neither is present in mountainous areas.</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>38</strong> What is the 'process' referred to in Section B?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q12\" type=\"radio\" value=\"A\"><span>A the killing of vegetation by salt</span></label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"B\"><span>B salt's ability to travel below ground</span></label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"C\"><span>C the ability of trees to decrease salt levels</span></label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"D\"><span>D the detection of salt by tracing other minerals</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>39</strong> According to Angus Howell, one problem in the fight against salinity is that</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q13\" type=\"radio\" value=\"A\"><span>A not enough farmers are concerned about the fight.</span></label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"B\"><span>B farmers' requests for help have been ignored.</span></label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"C\"><span>C some possible measures may cause farmers to lose income.</span></label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"D\"><span>D the government has not provided farmers with sufficient financial support.</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>40</strong> Which of the following best describes the writer's view of the salinity problem in Australia?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q14\" type=\"radio\" value=\"A\"><span>A Farmers are fighting an enemy that moves secretly and hides well.</span></label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"B\"><span>B Farmers have been able to contain this enemy in a small area.</span></label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"C\"><span>C Farmers have already had significant success in fighting this problem.</span></label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"D\"><span>D Farmers need to form more organised groups to solve this problem.</span></label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>37</strong> What link does the writer make between salt and gold?</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"A\"><span>A They can both be found in the same locations.</span></label> <label><input name=\"q11\" type=\"radio\" value=\"B\"><span>B Both have been found to have an impact on the landscape.</span></label> <label><input name=\"q11\" type=\"radio\" value=\"C\"><span>C The same techniques can be used to find both.</span></label> <label><input name=\"q11\" type=\"radio\" value=\"D\"><span>D Neither is present in mountainous areas.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> What is the 'process' referred to in Section B?</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"A\"><span>A the killing of vegetation by salt</span></label> <label><input name=\"q12\" type=\"radio\" value=\"B\"><span>B salt's ability to travel below ground</span></label> <label><input name=\"q12\" type=\"radio\" value=\"C\"><span>C the ability of trees to decrease salt levels</span></label> <label><input name=\"q12\" type=\"radio\" value=\"D\"><span>D the detection of salt by tracing other minerals</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> According to Angus Howell, one problem in the fight against salinity is that</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"><span>A not enough farmers are concerned about the fight.</span></label> <label><input name=\"q13\" type=\"radio\" value=\"B\"><span>B farmers' requests for help have been ignored.</span></label> <label><input name=\"q13\" type=\"radio\" value=\"C\"><span>C some possible measures may cause farmers to lose income.</span></label> <label><input name=\"q13\" type=\"radio\" value=\"D\"><span>D the government has not provided farmers with sufficient financial support.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> Which of the following best describes the writer's view of the salinity problem in Australia?</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"A\"><span>A Farmers are fighting an enemy that moves secretly and hides well.</span></label> <label><input name=\"q14\" type=\"radio\" value=\"B\"><span>B Farmers have been able to contain this enemy in a small area.</span></label> <label><input name=\"q14\" type=\"radio\" value=\"C\"><span>C Farmers have already had significant success in fighting this problem.</span></label> <label><input name=\"q14\" type=\"radio\" value=\"D\"><span>D Farmers need to form more organised groups to solve this problem.</span></label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
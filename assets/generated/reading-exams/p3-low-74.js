@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>The Placebo Effect</h2>\n            <h4>With the right encouragement, your mind can convince the body to heal itself. What is the mysterious force that can do this?</h4>\n            \n            <p>Want to devise a new form of alternative medical treatment? No problem. Here's the recipe. As a practitioner, be warm, sympathetic, reassuring and enthusiastic. Your treatment should involve physical contact, and each session with your patients should take at least half an hour. Encourage your patients to take an active part in their treatment and understand how their disorders relate to the rest of their lives. Tell them that their own bodies possess the true power to heal. Get them to pay you well. Describe your treatment in familiar words, but embroidered with a hint of mysticism: energy fields, energy flows, energy blocks, meridians, forces, auras, rhythms and the like. Refer to the knowledge of an earlier age: wisdom carelessly swept aside by the rise of blind mechanistic science. Oh, come off it, you're saying. Something like that couldn't possibly work, could it?</p>\n            <p>Well, yes, it could and often well enough to earn you a living. And a very good living if you are sufficiently convincing or, better still, really believe in your therapy. Many illnesses get better on their own, so if you are lucky and administer your treatment at just the right time you'll get the credit. But that's only part of it. Some of the improvement really would be down to you. Not necessarily because you'd recommended ginseng rather than chamomile tea or used this crystal as opposed to that pressure point. Nothing so specific. Your healing power would be the outcome of a paradoxical force that conventional medicine recognizes but remains oddly ambivalent about: the placebo effect.</p>\n            <p>Placebos are treatments that have no direct effect on the body, yet still work because the patient has faith in their power to heal. Most often the term refers to a dummy pill, but it applies just as much to any device or procedure, from a sticking plaster to a crystal. The existence of the placebo effect implies that even a complete fraud could make a difference to someone's health, which is why some practitioners of alternative medicine are sensitive about any mention of the subject. In fact, the placebo is a powerful part of all medical care, orthodox or otherwise, though its role is often neglected and misunderstood.</p>\n            <p>At one level, it should come as no surprise that our state of mind can influence our physiology: anger opens the superficial blood vessels of the face; sadness pumps the tear glands. But exactly how placebos work their medical magic is still largely unknown. Most of the scant research to date has focused on the control of pain, because it's one of the commonest complaints and lends itself to experimental study. Here, attention has turned to the endorphins, natural substances produced in the brain that are known to help control pain. Any of the neurochemicals involved in transmitting pain impulses or modulating them might also be involved in generating the placebo response, says Don Price, an oral surgeon at the University of Florida.</p>\n            <p>That case has been strengthened by the recent work of Fabrizio Benedetti of the University of Turin, who showed that the placebo effect can be abolished by a drug, naloxone, which blocks the effects of endorphins. Benedetti induced pain in a pressure cuff on the forearm. He did this several times a day for several days, using morphine each time to control the pain. On the final day, without saying anything, he replaced the morphine with a saline solution. This still relieved the subjects' pain: a placebo effect. But when he added naloxone to the saline, and blocked the endorphins, the pain relief disappeared. Here was direct proof that the relief of pain by a placebo is carried out, at least in part, by these natural opiates.</p>\n            <p>Though scientists don't know exactly how placebos work, they have accumulated a fair bit of knowledge about how to trigger the effect. A London rheumatologist found, for example, that red dummy capsules made more effective painkillers than blue, green or yellow ones. Research on American students revealed that blue pills make better tranquillisers than pink, a colour more suitable for stimulants. Even branding can make a difference: if Aspro or Tylenol are what you like to take for a headache; their chemically identical generic equivalents may be less effective.</p>\n            <p>It matters too how the treatment is delivered. Decades ago, when the major tranquilliser chlorpromazine was being introduced, a doctor in Kansas categorised his colleagues according to whether they were keen on it, openly sceptical of its benefits, or took a let's-try-and-see attitude. His conclusion: the more enthusiastic the doctor, the better the drug performed. A recent survey by Ernst on doctors' bedside manners turned up one consistent finding: physicians who adopt a warm, friendly, reassuring manner are more effective than those whose consultations are formal and do not offer reassurance.</p>\n            <p>Warm, friendly and reassuring are precisely what alternative treatment is all about, of course. Many of the ingredients of that opening recipe — the physical contact, the generous swaths of time, the strong hints of supernormal healing power — are just the kind of thing likely to impress patients. It's hardly surprising then, that complementary practitioners are generally best at mobilising the placebo effect, says Arthur Kleinman, professor of social anthropology at Harvard University.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>The Placebo Effect</h2>\n<h4>With the right encouragement, your mind can convince the body to heal itself. What is the mysterious force that can do this?</h4>\n<p>Want to devise a new form of alternative medical treatment? No problem. Here's the recipe. As a practitioner, be warm, sympathetic, reassuring and enthusiastic. Your treatment should involve physical contact, and each session with your patients should take at least half an hour. Encourage your patients to take an active part in their treatment and understand how their disorders relate to the rest of their lives. Tell them that their own bodies possess the true power to heal. Get them to pay you well. Describe your treatment in familiar words, but embroidered with a hint of mysticism: energy fields, energy flows, energy blocks, meridians, forces, auras, rhythms and the like. Refer to the knowledge of an earlier age: wisdom carelessly swept aside by the rise of blind mechanistic science. Oh, come off it, you're saying. Something like that couldn't possibly work, could it?</p>\n<p>Well, yes, it could and often well enough to earn you a living. And a very good living if you are sufficiently convincing or, better still, really believe in your therapy. Many illnesses get better on their own, so if you are lucky and administer your treatment at just the right time you'll get the credit. But that's only part of it. Some of the improvement really would be down to you. Not necessarily because you'd recommended ginseng rather than chamomile tea or used this crystal as opposed to that pressure point. Nothing so specific. Your healing power would be the outcome of a paradoxical force that conventional medicine recognizes but remains oddly ambivalent about: the placebo effect.</p>\n<p>Placebos are treatments that have no direct effect on the body, yet still work because the patient has faith in their power to heal. Most often the term refers to a dummy pill, but it applies just as much to any device or procedure, from a sticking plaster to a crystal. The existence of the placebo effect implies that even a complete fraud could make a difference to someone's health, which is why some practitioners of alternative medicine are sensitive about any mention of the subject. In fact, the placebo is a powerful part of all medical care, orthodox or otherwise, though its role is often neglected and misunderstood.</p>\n<p>At one level, it should come as no surprise that our state of mind can influence our physiology: anger opens the superficial blood vessels of the face; sadness pumps the tear glands. But exactly how placebos work their medical magic is still largely unknown. Most of the scant research to date has focused on the control of pain, because it's one of the commonest complaints and lends itself to experimental study. Here, attention has turned to the endorphins, natural substances produced in the brain that are known to help control pain. Any of the neurochemicals involved in transmitting pain impulses or modulating them might also be involved in generating the placebo response, says Don Price, an oral surgeon at the University of Florida.</p>\n<p>That case has been strengthened by the recent work of Fabrizio Benedetti of the University of Turin, who showed that the placebo effect can be abolished by a drug, naloxone, which blocks the effects of endorphins. Benedetti induced pain in a pressure cuff on the forearm. He did this several times a day for several days, using morphine each time to control the pain. On the final day, without saying anything, he replaced the morphine with a saline solution. This still relieved the subjects' pain: a placebo effect. But when he added naloxone to the saline, and blocked the endorphins, the pain relief disappeared. Here was direct proof that the relief of pain by a placebo is carried out, at least in part, by these natural opiates.</p>\n<p>Though scientists don't know exactly how placebos work, they have accumulated a fair bit of knowledge about how to trigger the effect. A London rheumatologist found, for example, that red dummy capsules made more effective painkillers than blue, green or yellow ones. Research on American students revealed that blue pills make better tranquillisers than pink, a colour more suitable for stimulants. Even branding can make a difference: if Aspro or Tylenol are what you like to take for a headache; their chemically identical generic equivalents may be less effective.</p>\n<p>It matters too how the treatment is delivered. Decades ago, when the major tranquilliser chlorpromazine was being introduced, a doctor in Kansas categorised his colleagues according to whether they were keen on it, openly sceptical of its benefits, or took a let's-try-and-see attitude. His conclusion: the more enthusiastic the doctor, the better the drug performed. A recent survey by Ernst on doctors' bedside manners turned up one consistent finding: physicians who adopt a warm, friendly, reassuring manner are more effective than those whose consultations are formal and do not offer reassurance.</p>\n<p>Warm, friendly and reassuring are precisely what alternative treatment is all about, of course. Many of the ingredients of that opening recipe — the physical contact, the generous swaths of time, the strong hints of supernormal healing power — are just the kind of thing likely to impress patients. It's hardly surprising then, that complementary practitioners are generally best at mobilising the placebo effect, says Arthur Kleinman, professor of social anthropology at Harvard University.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 27–31</h4>\n                <p>Complete each sentence with the correct ending, <strong>A–H</strong>, below.</p>\n                \n                <div class=\"question-item\">\n                    <p><strong>27</strong> An appointment with an alternative practitioner\n                        <select name=\"q1\" class=\"sentence-completion-select\">\n                            <option value=\"\">Select...</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option>\n                        </select>\n                    </p>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> An alternative practitioner's explanation of their treatment\n                        <select name=\"q2\" class=\"sentence-completion-select\">\n                            <option value=\"\">Select...</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option>\n                        </select>\n                    </p>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> If alternative practitioners have faith in their treatment, they\n                        <select name=\"q3\" class=\"sentence-completion-select\">\n                            <option value=\"\">Select...</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option>\n                        </select>\n                    </p>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> Quite often, a patient's illness\n                        <select name=\"q4\" class=\"sentence-completion-select\">\n                            <option value=\"\">Select...</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option>\n                        </select>\n                    </p>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>31</strong> Conventional doctors are aware of the placebo effect and they\n                        <select name=\"q5\" class=\"sentence-completion-select\">\n                            <option value=\"\">Select...</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option>\n                        </select>\n                    </p>\n                </div>\n\n                <div class=\"endings-list\">\n                    <ul>\n                        <li><strong>A</strong> should be easy to understand</li>\n                        <li><strong>B</strong> can improve without treatment</li>\n                        <li><strong>C</strong> can cost the patient less</li>\n                        <li><strong>D</strong> ought to last a minimum length of time</li>\n                        <li><strong>E</strong> can require a range of different products</li>\n                        <li><strong>F</strong> can be described as serious</li>\n                        <li><strong>G</strong> should give it greater recognition</li>\n                        <li><strong>H</strong> should be able to get a high income</li>\n                    </ul>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Complete each sentence with the correct ending, <strong>A–H</strong>, below.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> An appointment with an alternative practitioner\n<select name=\"q1\" class=\"sentence-completion-select\">\n<option value=\"\">Select...</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option>\n</select>\n</p>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> An alternative practitioner's explanation of their treatment\n<select name=\"q2\" class=\"sentence-completion-select\">\n<option value=\"\">Select...</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option>\n</select>\n</p>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> If alternative practitioners have faith in their treatment, they\n<select name=\"q3\" class=\"sentence-completion-select\">\n<option value=\"\">Select...</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option>\n</select>\n</p>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Quite often, a patient's illness\n<select name=\"q4\" class=\"sentence-completion-select\">\n<option value=\"\">Select...</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option>\n</select>\n</p>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> Conventional doctors are aware of the placebo effect and they\n<select name=\"q5\" class=\"sentence-completion-select\">\n<option value=\"\">Select...</option><option value=\"A\">A</option><option value=\"B\">B</option><option value=\"C\">C</option><option value=\"D\">D</option><option value=\"E\">E</option><option value=\"F\">F</option><option value=\"G\">G</option><option value=\"H\">H</option>\n</select>\n</p>\n</div>\n<div class=\"endings-list\">\n<ul>\n<li><strong>A</strong> should be easy to understand</li>\n<li><strong>B</strong> can improve without treatment</li>\n<li><strong>C</strong> can cost the patient less</li>\n<li><strong>D</strong> ought to last a minimum length of time</li>\n<li><strong>E</strong> can require a range of different products</li>\n<li><strong>F</strong> can be described as serious</li>\n<li><strong>G</strong> should give it greater recognition</li>\n<li><strong>H</strong> should be able to get a high income</li>\n</ul>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -45,7 +45,7 @@
         "q7",
         "q8"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-anchor\">\n                <h4>Questions 32–34</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>32</strong> In the third paragraph, the writer says that the placebo effect</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"A\"><span>A works best in tablet form.</span></label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"B\"><span>B is a new type of medical treatment.</span></label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"C\"><span>C is trusted more by some patients than by others.</span></label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"D\"><span>D has a significant role in both alternative and conventional medicine.</span></label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>33</strong> A reference is made to anger and sadness in order to show that</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"A\"><span>A personal feelings can alter our physical condition.</span></label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"B\"><span>B some human behaviour has no clear explanation.</span></label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"C\"><span>C placebos, like emotions, are experienced by everyone.</span></label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"D\"><span>D people find some physical reactions hard to control.</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>34</strong> Research on pain control attracts most of the attention because</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"A\"><span>A Only a limited amount of research has been conducted so far.</span></label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"B\"><span>B Scientists have discovered that endorphins can help to reduce pain.</span></label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"C\"><span>C Pain-reducing agents might also be involved in the placebo effect.</span></label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"D\"><span>D Patients often experience pain and like to complain about it.</span></label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-anchor\">\n<h4>Questions 32–34</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>32</strong> In the third paragraph, the writer says that the placebo effect</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"A\"><span>A works best in tablet form.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"B\"><span>B is a new type of medical treatment.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"C\"><span>C is trusted more by some patients than by others.</span></label> <label><input name=\"q6\" type=\"radio\" value=\"D\"><span>D has a significant role in both alternative and conventional medicine.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> A reference is made to anger and sadness in order to show that</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"><span>A personal feelings can alter our physical condition.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"B\"><span>B some human behaviour has no clear explanation.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"C\"><span>C placebos, like emotions, are experienced by everyone.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"D\"><span>D people find some physical reactions hard to control.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Research on pain control attracts most of the attention because</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"><span>A Only a limited amount of research has been conducted so far.</span></label> <label><input name=\"q8\" type=\"radio\" value=\"B\"><span>B Scientists have discovered that endorphins can help to reduce pain.</span></label> <label><input name=\"q8\" type=\"radio\" value=\"C\"><span>C Pain-reducing agents might also be involved in the placebo effect.</span></label> <label><input name=\"q8\" type=\"radio\" value=\"D\"><span>D Patients often experience pain and like to complain about it.</span></label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -58,7 +58,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q9-10-11-12-13-14-anchor\">\n                <h4>Questions 35–40</h4>\n                <p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n                <ul style=\"list-style: none; padding-left: 0;\">\n                    <li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p><strong>35</strong> Scientists now have enough information to understand how the placebo effect becomes active in people.</p>\n                    <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>36</strong> As a result of experiments, some painkillers have been taken off the market.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>37</strong> Individual preference can have an impact on the effectiveness of different brands of headache tablets.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>38</strong> Doctors expressed a range of views on the drug chlorpromazine when it was first introduced.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>39</strong> Ernst's study had a big influence on doctors' behaviour with patients.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>40</strong> Alternative practitioners work in a way that is likely to trigger the placebo effect.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q9-10-11-12-13-14-anchor\">\n<h4>Questions 35–40</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<ul style=\"list-style: none; padding-left: 0;\">\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>35</strong> Scientists now have enough information to understand how the placebo effect becomes active in people.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> As a result of experiments, some painkillers have been taken off the market.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> Individual preference can have an impact on the effectiveness of different brands of headache tablets.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> Doctors expressed a range of views on the drug chlorpromazine when it was first introduced.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> Ernst's study had a big influence on doctors' behaviour with patients.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> Alternative practitioners work in a way that is likely to trigger the placebo effect.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>The Costs of Brand Loyalty</h2>\n            \n            <p>A Londoner with a sudden urge for giant African snails could do worse than head to the bustling marketplace in Brixton, a part of south London that is home to many people from Africa. Markets like Brixton Market that cater to migrants are a testament to the fact that people often retain very strong preferences for the kinds of food they grew up eating. Just ask the expatriate Britons who flock to ‘Tea and Sympathy' in New York's Greenwich Village for pots of Marmite, a yeast-based spread whose delights baffle other nationalities (and many of their own compatriots).</p>\n            <p>Past research has shown that people are often willing to pay much more for a favoured brand than for seemingly identical alternatives. It is not always obvious why. However, there is ample evidence to support the theory that certain food preferences form in childhood. Children have a predisposition to fear new foods, which is only overcome when they are repeatedly presented with, and encouraged to consume, a particular food. Evidence shows that children's instinctive wariness of new foods dates back to the times when humans had to forage for food, and it was important that they learnt which foods were safe to eat. In the modern world, people routinely express a strong liking for a brand even though they are unable to tell the brand apart from rival brands in blind tests, and many studies have found that advertising alone cannot explain the strength of brand loyalty.</p>\n            <p>A new study by economists from the universities of Tilburg and Chicago tracks the consumption patterns of 38,000 US households over two years, and confirms the theory that such brand loyalty is widespread, deep and long-lasting. There were clear local patterns in consumption, although the same brands were available everywhere. But 16% of people studied were migrants: they had grown up in one state and moved to another. These migrants had the same options, in terms of what was on offer and at what price, as everyone else in their adopted home, but although they consumed local favourites, they bought fewer than longtime residents. This gap between purchases of migrants and those of the locally born was quite stubborn: although it faded the longer a person lived in their new state, it still took 20 years to halve in magnitude. Even 50 years on, it was still large enough to show up in the data. This could mean that the benefits of being the first brand into a market could last longer than might be assumed.</p>\n            <p>David Atkin of Yale University has identified some important implications of local food favourites. He suggests in a recent paper that the effects of people being loyal to known brands may also lead economists to rethink the way they calculate the benefits resulting from trade. This is because opening up to trade is in some ways very similar to migrating, as it changes the composition and prices of the foods that are available to a person. In particular, trade can cause local foods to become relatively more expensive. Atkin's data show something many economists do not take into account: when a traditional food has to compete with imported foods, it may no longer be the cheapest food available for people to choose to eat. Atkin decided to look at this situation in the context of developing countries.</p>\n            <p>To illustrate his point, Atkin uses detailed data about people's food choices in India. India is a good choice because it covers a large number of climatic zones where different specialised crops are grown. Despite being part of the same country, the prevalence of internal barriers to trade means that its regions are best thought of as being only partially open to trade. Atkin's data show that the foods a region specialises in producing are instead cheaper in that region.</p>\n            <p>However, there has been some opening up of internal trade in India in recent years, and this has revealed that for every rupee spent on food, people's intake of calories declined most in regions where prices of local favourite foods had risen. In theory, when there is a greater choice of types of food, people should adjust their food habits and purchase the cheapest option so that they boost their calorie intake. However, in practice, food habits mean that consumers keep buying the things they know and like even though these foods have become relatively expensive. Atkin calculates that if all barriers to internal trade in India were abolished, the average Indian household would have to generate a rise of 3.3 percent in income to maintain their calorie intake.</p>\n            <p>In developing countries where there is a high prevalence of undernutrition, such as in sub-Saharan Africa, the habit of continuing to eat favourite foods could have a serious effect on development. There is clear evidence that nutritional shortfalls in children can affect their ability to work and earn as adults, and also have detrimental effects on their long-term health.</p>\n            <p>Consequently, the nutritional declines that can occur as a result of the opening up of trade are of serious concern, because an entire generation that is malnourished as children will continue to suffer irreversible consequences for the rest of their lives, which could hinder the development of their country due to a lack of a quality workforce.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>The Costs of Brand Loyalty</h2>\n<p>A Londoner with a sudden urge for giant African snails could do worse than head to the bustling marketplace in Brixton, a part of south London that is home to many people from Africa. Markets like Brixton Market that cater to migrants are a testament to the fact that people often retain very strong preferences for the kinds of food they grew up eating. Just ask the expatriate Britons who flock to ‘Tea and Sympathy' in New York's Greenwich Village for pots of Marmite, a yeast-based spread whose delights baffle other nationalities (and many of their own compatriots).</p>\n<p>Past research has shown that people are often willing to pay much more for a favoured brand than for seemingly identical alternatives. It is not always obvious why. However, there is ample evidence to support the theory that certain food preferences form in childhood. Children have a predisposition to fear new foods, which is only overcome when they are repeatedly presented with, and encouraged to consume, a particular food. Evidence shows that children's instinctive wariness of new foods dates back to the times when humans had to forage for food, and it was important that they learnt which foods were safe to eat. In the modern world, people routinely express a strong liking for a brand even though they are unable to tell the brand apart from rival brands in blind tests, and many studies have found that advertising alone cannot explain the strength of brand loyalty.</p>\n<p>A new study by economists from the universities of Tilburg and Chicago tracks the consumption patterns of 38,000 US households over two years, and confirms the theory that such brand loyalty is widespread, deep and long-lasting. There were clear local patterns in consumption, although the same brands were available everywhere. But 16% of people studied were migrants: they had grown up in one state and moved to another. These migrants had the same options, in terms of what was on offer and at what price, as everyone else in their adopted home, but although they consumed local favourites, they bought fewer than longtime residents. This gap between purchases of migrants and those of the locally born was quite stubborn: although it faded the longer a person lived in their new state, it still took 20 years to halve in magnitude. Even 50 years on, it was still large enough to show up in the data. This could mean that the benefits of being the first brand into a market could last longer than might be assumed.</p>\n<p>David Atkin of Yale University has identified some important implications of local food favourites. He suggests in a recent paper that the effects of people being loyal to known brands may also lead economists to rethink the way they calculate the benefits resulting from trade. This is because opening up to trade is in some ways very similar to migrating, as it changes the composition and prices of the foods that are available to a person. In particular, trade can cause local foods to become relatively more expensive. Atkin's data show something many economists do not take into account: when a traditional food has to compete with imported foods, it may no longer be the cheapest food available for people to choose to eat. Atkin decided to look at this situation in the context of developing countries.</p>\n<p>To illustrate his point, Atkin uses detailed data about people's food choices in India. India is a good choice because it covers a large number of climatic zones where different specialised crops are grown. Despite being part of the same country, the prevalence of internal barriers to trade means that its regions are best thought of as being only partially open to trade. Atkin's data show that the foods a region specialises in producing are instead cheaper in that region.</p>\n<p>However, there has been some opening up of internal trade in India in recent years, and this has revealed that for every rupee spent on food, people's intake of calories declined most in regions where prices of local favourite foods had risen. In theory, when there is a greater choice of types of food, people should adjust their food habits and purchase the cheapest option so that they boost their calorie intake. However, in practice, food habits mean that consumers keep buying the things they know and like even though these foods have become relatively expensive. Atkin calculates that if all barriers to internal trade in India were abolished, the average Indian household would have to generate a rise of 3.3 percent in income to maintain their calorie intake.</p>\n<p>In developing countries where there is a high prevalence of undernutrition, such as in sub-Saharan Africa, the habit of continuing to eat favourite foods could have a serious effect on development. There is clear evidence that nutritional shortfalls in children can affect their ability to work and earn as adults, and also have detrimental effects on their long-term health.</p>\n<p>Consequently, the nutritional declines that can occur as a result of the opening up of trade are of serious concern, because an entire generation that is malnourished as children will continue to suffer irreversible consequences for the rest of their lives, which could hinder the development of their country due to a lack of a quality workforce.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -34,7 +34,7 @@
         "q3",
         "q4"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n                <h4>Questions 27–30</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>27</strong> In the first paragraph, the writer's purpose is to</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"A\"><span>A show that London has a multicultural society.</span></label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"B\"><span>B point out that people grow up eating food from markets.</span></label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"C\"><span>C give examples of the wide variety of food available in Britain.</span></label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"D\"><span>D illustrate the way adults enjoy eating food from their childhood.</span></label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>28</strong> Economists from the universities of Tilburg and Chicago found that people who have migrated from one American state to another</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"A\"><span>A were poorer than longtime residents of the new state.</span></label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"B\"><span>B sometimes returned to their home states to buy their favourite foods.</span></label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"C\"><span>C bought only some of the brands which were popular in their new state.</span></label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"D\"><span>D were particularly sensitive to price increases on food items.</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> Atkin's research shows that</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"A\"><span>A trade makes favourite foods hard to find.</span></label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"B\"><span>B trade results in increasing levels of migration.</span></label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"C\"><span>C imported food is of a higher quality than local food.</span></label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"D\"><span>D economists fail to understand all the effects of increased trade.</span></label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>30</strong> The writer thinks Atkin was wise to choose India for his study because</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"A\"><span>A trade barriers create food shortages between regions.</span></label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"B\"><span>B food is cheap in India in comparison to developed countries.</span></label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"C\"><span>C cultural variation results in a wide range of food preferences.</span></label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"D\"><span>D the varying weather patterns have resulted in regional crop types.</span></label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> In the first paragraph, the writer's purpose is to</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"><span>A show that London has a multicultural society.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"B\"><span>B point out that people grow up eating food from markets.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"C\"><span>C give examples of the wide variety of food available in Britain.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"D\"><span>D illustrate the way adults enjoy eating food from their childhood.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Economists from the universities of Tilburg and Chicago found that people who have migrated from one American state to another</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"><span>A were poorer than longtime residents of the new state.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"B\"><span>B sometimes returned to their home states to buy their favourite foods.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"C\"><span>C bought only some of the brands which were popular in their new state.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"D\"><span>D were particularly sensitive to price increases on food items.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Atkin's research shows that</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"><span>A trade makes favourite foods hard to find.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"B\"><span>B trade results in increasing levels of migration.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"C\"><span>C imported food is of a higher quality than local food.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"D\"><span>D economists fail to understand all the effects of increased trade.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> The writer thinks Atkin was wise to choose India for his study because</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"><span>A trade barriers create food shortages between regions.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"B\"><span>B food is cheap in India in comparison to developed countries.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"C\"><span>C cultural variation results in a wide range of food preferences.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"D\"><span>D the varying weather patterns have resulted in regional crop types.</span></label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -46,7 +46,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n                <h4>Questions 31–35</h4>\n                <p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n                <ul style=\"list-style: none; padding-left: 0;\">\n                    <li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p><strong>31</strong> The Tilburg and Chicago study shows that brand loyalty is greater in some states of the United States than in others.</p>\n                    <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>32</strong> The study shows that the differences in shopping habits between migrants and native residents increased in the first 20 years.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> First brands to enter a new market only hold their advantage if they are supported by advertising.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>34</strong> Atkin originally chose India as a case study because trade within the country was unrestricted.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>35</strong> In India, if a region focuses on certain foods, the cost of those foods remains comparatively low.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n<h4>Questions 31–35</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<ul style=\"list-style: none; padding-left: 0;\">\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>31</strong> The Tilburg and Chicago study shows that brand loyalty is greater in some states of the United States than in others.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> The study shows that the differences in shopping habits between migrants and native residents increased in the first 20 years.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> First brands to enter a new market only hold their advantage if they are supported by advertising.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Atkin originally chose India as a case study because trade within the country was unrestricted.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> In India, if a region focuses on certain foods, the cost of those foods remains comparatively low.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -58,7 +58,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n                <h4>Questions 36–40</h4>\n                <p>Complete the summary using the list of words and phrases, <strong>A–I</strong>, below.</p>\n                <div class=\"summary-box\">\n                    <h5>Food habits and trade in developing countries</h5>\n                    <div class=\"summary-text\">\n                        <p>Trade is not always beneficial for the citizens of developing countries. Data show that a wider <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span> of foods does not necessarily result in a corresponding <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span> in the amount of calories in people's diets. This is because people's <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> on continuing to eat the foods they grew up eating could result in insufficient calories in their diets if the cost of these foods rises as a result of more open trade conditions. This is especially true in countries where adequate <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span> is already a problem and could result in a whole section of society being unable to contribute fully to their country's <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span> in the future.</p>\n                    </div>\n                </div>\n                <div id=\"word-options\">\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A nutrition</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B range</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C progress</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D dislike</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E incentive</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F increase</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G independence</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H production</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I insistence</div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete the summary using the list of words and phrases, <strong>A–I</strong>, below.</p>\n<div class=\"summary-box\">\n<h5>Food habits and trade in developing countries</h5>\n<div class=\"summary-text\">\n<p>Trade is not always beneficial for the citizens of developing countries. Data show that a wider <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span> of foods does not necessarily result in a corresponding <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span> in the amount of calories in people's diets. This is because people's <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> on continuing to eat the foods they grew up eating could result in insufficient calories in their diets if the cost of these foods rises as a result of more open trade conditions. This is especially true in countries where adequate <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span> is already a problem and could result in a whole section of society being unable to contribute fully to their country's <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span> in the future.</p>\n</div>\n</div>\n<div id=\"word-options\">\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A nutrition</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B range</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C progress</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D dislike</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E incentive</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F increase</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G independence</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H production</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I insistence</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>Looking for inspiration</h2>\n            <h4>Helen Phillips asks what makes one person more creative than another</h4>\n            \n            <p>People have speculated about their own creativity for centuries—perhaps ever since we became able to think about thinking. Whatever creativity is, it is thinking that results in new ideas and new ways of doing things. The only bit of the creative process we actually know about is the moment of insight, yet creative ideas and projects may incubate beyond our awareness for months. Not surprising, then, that creativity has long eluded scientific study.</p>\n            <p>In the early 1970s, it was still seen as a type of intelligence. But when more subtle tests of IQ and creative skills were developed in the 1970s, particularly by the father of creativity testing, Paul Torrance, it became clear that the link was not so simple. Creative people are intelligent, in terms of IQ tests at least, but only averagely or just above. While it depends on the discipline, in general, having beyond a certain level IQ does not help boost creativity.</p>\n            <p>Because of the difficulty of studying the actual process, most early attempts to study creativity concentrated on personality. According to creativity specialist Mark Runco of California State University, the creative personality tends to place a high value on aesthetic qualities and have broad interests, providing lots of resources to draw on and knowledge to recombine into novel solutions. ‘Creatives' have an attraction to complexity and an ability to handle conflict. They are also highly self-motivated, perhaps even a little obsessive, when it comes to realising their ambitions.</p>\n            <p>But there may be a price to pay for having a creative personality. For centuries, a link has been made between creativity and mental illness. Psychiatrist and author Kay Redfield Jamison of Johns Hopkins University, who herself has bipolar disorder, found that established artists are significantly more likely to have mood disorders. But she also suggests that a switch of mood state might be the key to triggering a creative event, rather than the negative mood itself.</p>\n            <p>Jordan Peterson, a psychologist at the University of Toronto, has carried out work that suggests that the brains of creative people are more open to incoming stimuli than less creative types. Our senses are continuously feeding a mass of data into our brains, which have to block most of it to save us from being snowed under. Peterson calls this process latent inhibition and argues that people who have less of it, and who have a reasonably high IQ, can juggle more of the data, and so may be open to more ideas.</p>\n            <p>But what of the creative act itself? One of the first studies of the creative brain at work was by Colin Martindale, a psychologist from the University of Maine. Back in 1978, he used a network of scalp electrodes to record the pattern of brain waves as people made up stories. Creativity, he showed, has two stages: inspiration and elaboration, each characterized at very different states of mind. While people were dreaming up their stories, he found their brains were surprisingly quiet. The dominant activity was alpha waves, which is the same sort of brain activity as in some stages of dreaming or rest. This could explain why sleep and relaxation can help people be creative.</p>\n            <p>However, when these quiet-minded people were asked to work on their stories, the alpha wave activity dropped off and the brain became busier, revealing increased cortical arousal, and more organised thinking. Strikingly, it was the people who showed the biggest difference in brain activity between the two stages who produced the most creative storylines. Nothing in their background brain activity marked them as creative or uncreative. 'It's as if the less creative person can't move up a gear,' says Guy Claxton, a psychologist at the University of Bristol. 'Creativity requires different kinds of thinking. Very creative people move between these states intuitively.'</p>\n            <p>Researchers are now trying to identify some of the specific anatomy of creativity. Brain studies of people with particular types of creativity show, perhaps not surprisingly, that active areas are determined by the specialist knowledge being used. Imagery, spatial awareness, language and so on—whatever the skill, it is localised to some extent to a particular brain part or parts. But it's not just these speciality areas that are active. Using information creatively needs coordination. ‘Creative synthesis requires a new pattern, to put the brain in a state where many areas are simultaneously active,' says Claxton. When we concentrate in a less creative way, such as when reading the gas bill, there are fewer active centres and less synthesis.</p>\n            <p>But to be truly creative needs more than just the right personality and the right brain areas and networks. It's about using them effectively. Skills, situations and our social setting can shape our creativity just as dramatically as the brain resources we are born with. The most creative people also use the different rhythms of the days, the weekends and the holidays to help alter focus and brain state. They may spend two hours at their desk, then go for a walk, because they know that pattern works for them.</p>\n            <p>Another often forgotten aspect of creativity is social. Vera John-Steiner of the University of New Mexico says that to be really creative you need strong social networks and trusting relationships, not just active neural networks. One vital characteristic of a 'creative', she says, is that they have at least one other person in their life who doesn't think they are completely mad!</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>Looking for inspiration</h2>\n<h4>Helen Phillips asks what makes one person more creative than another</h4>\n<p>People have speculated about their own creativity for centuries—perhaps ever since we became able to think about thinking. Whatever creativity is, it is thinking that results in new ideas and new ways of doing things. The only bit of the creative process we actually know about is the moment of insight, yet creative ideas and projects may incubate beyond our awareness for months. Not surprising, then, that creativity has long eluded scientific study.</p>\n<p>In the early 1970s, it was still seen as a type of intelligence. But when more subtle tests of IQ and creative skills were developed in the 1970s, particularly by the father of creativity testing, Paul Torrance, it became clear that the link was not so simple. Creative people are intelligent, in terms of IQ tests at least, but only averagely or just above. While it depends on the discipline, in general, having beyond a certain level IQ does not help boost creativity.</p>\n<p>Because of the difficulty of studying the actual process, most early attempts to study creativity concentrated on personality. According to creativity specialist Mark Runco of California State University, the creative personality tends to place a high value on aesthetic qualities and have broad interests, providing lots of resources to draw on and knowledge to recombine into novel solutions. ‘Creatives' have an attraction to complexity and an ability to handle conflict. They are also highly self-motivated, perhaps even a little obsessive, when it comes to realising their ambitions.</p>\n<p>But there may be a price to pay for having a creative personality. For centuries, a link has been made between creativity and mental illness. Psychiatrist and author Kay Redfield Jamison of Johns Hopkins University, who herself has bipolar disorder, found that established artists are significantly more likely to have mood disorders. But she also suggests that a switch of mood state might be the key to triggering a creative event, rather than the negative mood itself.</p>\n<p>Jordan Peterson, a psychologist at the University of Toronto, has carried out work that suggests that the brains of creative people are more open to incoming stimuli than less creative types. Our senses are continuously feeding a mass of data into our brains, which have to block most of it to save us from being snowed under. Peterson calls this process latent inhibition and argues that people who have less of it, and who have a reasonably high IQ, can juggle more of the data, and so may be open to more ideas.</p>\n<p>But what of the creative act itself? One of the first studies of the creative brain at work was by Colin Martindale, a psychologist from the University of Maine. Back in 1978, he used a network of scalp electrodes to record the pattern of brain waves as people made up stories. Creativity, he showed, has two stages: inspiration and elaboration, each characterized at very different states of mind. While people were dreaming up their stories, he found their brains were surprisingly quiet. The dominant activity was alpha waves, which is the same sort of brain activity as in some stages of dreaming or rest. This could explain why sleep and relaxation can help people be creative.</p>\n<p>However, when these quiet-minded people were asked to work on their stories, the alpha wave activity dropped off and the brain became busier, revealing increased cortical arousal, and more organised thinking. Strikingly, it was the people who showed the biggest difference in brain activity between the two stages who produced the most creative storylines. Nothing in their background brain activity marked them as creative or uncreative. 'It's as if the less creative person can't move up a gear,' says Guy Claxton, a psychologist at the University of Bristol. 'Creativity requires different kinds of thinking. Very creative people move between these states intuitively.'</p>\n<p>Researchers are now trying to identify some of the specific anatomy of creativity. Brain studies of people with particular types of creativity show, perhaps not surprisingly, that active areas are determined by the specialist knowledge being used. Imagery, spatial awareness, language and so on—whatever the skill, it is localised to some extent to a particular brain part or parts. But it's not just these speciality areas that are active. Using information creatively needs coordination. ‘Creative synthesis requires a new pattern, to put the brain in a state where many areas are simultaneously active,' says Claxton. When we concentrate in a less creative way, such as when reading the gas bill, there are fewer active centres and less synthesis.</p>\n<p>But to be truly creative needs more than just the right personality and the right brain areas and networks. It's about using them effectively. Skills, situations and our social setting can shape our creativity just as dramatically as the brain resources we are born with. The most creative people also use the different rhythms of the days, the weekends and the holidays to help alter focus and brain state. They may spend two hours at their desk, then go for a walk, because they know that pattern works for them.</p>\n<p>Another often forgotten aspect of creativity is social. Vera John-Steiner of the University of New Mexico says that to be really creative you need strong social networks and trusting relationships, not just active neural networks. One vital characteristic of a 'creative', she says, is that they have at least one other person in their life who doesn't think they are completely mad!</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                <h4>Questions 27–32</h4>\n                <p class=\"instructions\">Look at the following statements (Questions 27–32) and the list of people below.<br>Match each statement with the correct person, <strong>A–G</strong>.</p>\n                <p class=\"instructions\"><em>NB You may use any letter more than once.</em></p>\n                \n                <div class=\"match-question-item\">\n                    <p><strong>27</strong> Creative people are receptive to the immense amounts of information that the brain has to deal with.</p>\n                    <div class=\"match-dropzone\" data-question=\"q1\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>28</strong> Creativity requires numerous parts of the brain to be active at the same time.</p>\n                    <div class=\"match-dropzone\" data-question=\"q2\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                     <p><strong>29</strong> Creative people engage in, and are well informed about, a wide range of subjects.</p>\n                    <div class=\"match-dropzone\" data-question=\"q3\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                     <p><strong>30</strong> Creative people may have unstable personalities.</p>\n                    <div class=\"match-dropzone\" data-question=\"q4\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                     <p><strong>31</strong> Creative people are driven to achieve the goals they set themselves.</p>\n                    <div class=\"match-dropzone\" data-question=\"q5\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>32</strong> Creative people need support from others.</p>\n                    <div class=\"match-dropzone\" data-question=\"q6\"></div>\n                </div>\n\n                <div class=\"options-pool\" id=\"people-options-pool\">\n                    <strong>List of People</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" id=\"person-A\" draggable=\"true\" data-option=\"A\">A Paul Torrance</div>\n                        <div class=\"drag-item\" id=\"person-B\" draggable=\"true\" data-option=\"B\">B Mark Runco</div>\n                        <div class=\"drag-item\" id=\"person-C\" draggable=\"true\" data-option=\"C\">C Kay Redfield Jamison</div>\n                        <div class=\"drag-item\" id=\"person-D\" draggable=\"true\" data-option=\"D\">D Jordan Peterson</div>\n                        <div class=\"drag-item\" id=\"person-E\" draggable=\"true\" data-option=\"E\">E Colin Martindale</div>\n                        <div class=\"drag-item\" id=\"person-F\" draggable=\"true\" data-option=\"F\">F Guy Claxton</div>\n                        <div class=\"drag-item\" id=\"person-G\" draggable=\"true\" data-option=\"G\">G Vera John-Steiner</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p class=\"instructions\">Look at the following statements (Questions 27–32) and the list of people below.<br>Match each statement with the correct person, <strong>A–G</strong>.</p>\n<p class=\"instructions\"><em>NB You may use any letter more than once.</em></p>\n<div class=\"match-question-item\">\n<p><strong>27</strong> Creative people are receptive to the immense amounts of information that the brain has to deal with.</p>\n<div class=\"match-dropzone\" data-question=\"q1\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>28</strong> Creativity requires numerous parts of the brain to be active at the same time.</p>\n<div class=\"match-dropzone\" data-question=\"q2\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>29</strong> Creative people engage in, and are well informed about, a wide range of subjects.</p>\n<div class=\"match-dropzone\" data-question=\"q3\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>30</strong> Creative people may have unstable personalities.</p>\n<div class=\"match-dropzone\" data-question=\"q4\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>31</strong> Creative people are driven to achieve the goals they set themselves.</p>\n<div class=\"match-dropzone\" data-question=\"q5\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>32</strong> Creative people need support from others.</p>\n<div class=\"match-dropzone\" data-question=\"q6\"></div>\n</div>\n<div class=\"options-pool\" id=\"people-options-pool\">\n<strong>List of People</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"person-A\" draggable=\"true\" data-option=\"A\">A Paul Torrance</div>\n<div class=\"drag-item\" id=\"person-B\" draggable=\"true\" data-option=\"B\">B Mark Runco</div>\n<div class=\"drag-item\" id=\"person-C\" draggable=\"true\" data-option=\"C\">C Kay Redfield Jamison</div>\n<div class=\"drag-item\" id=\"person-D\" draggable=\"true\" data-option=\"D\">D Jordan Peterson</div>\n<div class=\"drag-item\" id=\"person-E\" draggable=\"true\" data-option=\"E\">E Colin Martindale</div>\n<div class=\"drag-item\" id=\"person-F\" draggable=\"true\" data-option=\"F\">F Guy Claxton</div>\n<div class=\"drag-item\" id=\"person-G\" draggable=\"true\" data-option=\"G\">G Vera John-Steiner</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": true
     },
     {
@@ -48,7 +48,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group summary-completion\" id=\"q7-8-9-10-anchor\">\n                <h4>Questions 33–36</h4>\n                <p class=\"instructions\">Complete the summary below.<br>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n                <p>\n                Colin Martindale carried out research into the creative brain at work. For his study, volunteers had a series of <strong>33</strong> <input name=\"q7\" type=\"text\" id=\"q33_input\"> placed on their heads which were used to monitor brain activity while they made up stories. Martindale demonstrated that creativity consisted of <strong>34</strong> <input name=\"q8\" type=\"text\" id=\"q34a_input\"> and <input name=\"q8\" type=\"text\" id=\"q34b_input\"> phases. In the first of these, the brain was mostly inactive except for <strong>35</strong> <input name=\"q9\" type=\"text\" id=\"q35_input\">, and this corresponds to what takes place during dreaming or relaxation. In the second phase, when the volunteers worked on their stories, however, their brains became a lot busier. Interestingly, the most creative stories were produced by those volunteers with the greatest <strong>36</strong> <input name=\"q10\" type=\"text\" id=\"q36_input\"> in brain activity between the two phases.\n                </p>\n            </div>"
+      "bodyHtml": "<div class=\"group summary-completion\" id=\"q7-8-9-10-anchor\">\n<h4>Questions 33–36</h4>\n<p class=\"instructions\">Complete the summary below.<br>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<p>\nColin Martindale carried out research into the creative brain at work. For his study, volunteers had a series of <strong>33</strong> <input name=\"q7\" type=\"text\" id=\"q33_input\"> placed on their heads which were used to monitor brain activity while they made up stories. Martindale demonstrated that creativity consisted of <strong>34</strong> <input name=\"q8\" type=\"text\" id=\"q34a_input\"> and <input name=\"q8\" type=\"text\" id=\"q34b_input\"> phases. In the first of these, the brain was mostly inactive except for <strong>35</strong> <input name=\"q9\" type=\"text\" id=\"q35_input\">, and this corresponds to what takes place during dreaming or relaxation. In the second phase, when the volunteers worked on their stories, however, their brains became a lot busier. Interestingly, the most creative stories were produced by those volunteers with the greatest <strong>36</strong> <input name=\"q10\" type=\"text\" id=\"q36_input\"> in brain activity between the two phases.\n</p>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n                <h4>Questions 37–40</h4>\n                <p class=\"instructions\">Do the following statements agree with the information given in Reading Passage 3?</p>\n                <div class=\"question-item\">\n                    <p><strong>37</strong> People with very high IQs are more likely to be creative than those with average IQs.</p>\n                    <div class=\"radio-options tfng-options\">\n                        <label><input name=\"q11\" type=\"radio\" value=\"TRUE\"><span>TRUE</span></label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"FALSE\"><span>FALSE</span></label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>38</strong> Society tends to value aesthetic skills highly.</p>\n                     <div class=\"radio-options tfng-options\">\n                        <label><input name=\"q12\" type=\"radio\" value=\"TRUE\"><span>TRUE</span></label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"FALSE\"><span>FALSE</span></label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>39</strong> There can be disadvantages to having a creative personality.</p>\n                     <div class=\"radio-options tfng-options\">\n                        <label><input name=\"q13\" type=\"radio\" value=\"TRUE\"><span>TRUE</span></label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"FALSE\"><span>FALSE</span></label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>40</strong> Language skills are more important than spatial awareness in any form of creativity.</p>\n                     <div class=\"radio-options tfng-options\">\n                        <label><input name=\"q14\" type=\"radio\" value=\"TRUE\"><span>TRUE</span></label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"FALSE\"><span>FALSE</span></label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p class=\"instructions\">Do the following statements agree with the information given in Reading Passage 3?</p>\n<div class=\"question-item\">\n<p><strong>37</strong> People with very high IQs are more likely to be creative than those with average IQs.</p>\n<div class=\"radio-options tfng-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"TRUE\"><span>TRUE</span></label> <label><input name=\"q11\" type=\"radio\" value=\"FALSE\"><span>FALSE</span></label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> Society tends to value aesthetic skills highly.</p>\n<div class=\"radio-options tfng-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"TRUE\"><span>TRUE</span></label> <label><input name=\"q12\" type=\"radio\" value=\"FALSE\"><span>FALSE</span></label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> There can be disadvantages to having a creative personality.</p>\n<div class=\"radio-options tfng-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"TRUE\"><span>TRUE</span></label> <label><input name=\"q13\" type=\"radio\" value=\"FALSE\"><span>FALSE</span></label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> Language skills are more important than spatial awareness in any form of creativity.</p>\n<div class=\"radio-options tfng-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"TRUE\"><span>TRUE</span></label> <label><input name=\"q14\" type=\"radio\" value=\"FALSE\"><span>FALSE</span></label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>Music soothes and awes – and may help us heal</h2>\n            <h4>Tapping into the brain's ability to process music, researchers are using songs and sounds in novel ways</h4>\n            \n            <p>Dan Ellsey, 33, was sitting in his wheelchair, his virtually useless arms and weak torso strapped to the chair for safety. As we were introduced, he arched his back, grinned broadly and aimed the power of his dark brown eyes at me, as if eye contact were his only means of transcending the prison of his body.</p>\n            <p>But it isn't. In the last few years, Ellsey, who was born with cerebral palsy, has discovered another, almost miraculous way of expressing himself: composing music with a special computerized system called Hyperscore. For Ellsey, as for most human beings, music has almost inexplicable power. It can rouse armies to battle, soothe babies to sleep, communicate peaks of joy and depths of sorrow that mere words cannot.</p>\n            <p>Why evolution would have endowed our brains with the neural machinery to make music is a mystery. 'It's unclear why humans are so uniquely sensitive to music. Certainly, music shares many features with spoken language, and our brains are particularly developed to process the rapid tones and segments of sound that are common to both,' said neurologist and author Dr Oliver Sacks, whose latest book is <i>Musicophilia: Tales of Music and the Brain</i>. 'Some researchers,' he added in an e-mail interview, ‘think that in primitive cultures, music and speech were not distinct. Other researchers debate which came first in evolution, speech or song.' What is clear is that the brain is abundantly wired to process music.</p>\n            <p>Scientists at the Montreal Neurological Institute and Hospital, for instance, have found dramatic evidence on brain scans that the chills, or visceral feelings of awe, that people report when listening to their favorite music are real. Reactions to music appear to vary greatly. Music that a person likes, but not music that is disliked, activates the higher thinking centers in the brain's cortex and, perhaps more importantly, the 'ancient circuitry, the motivation and reward system,' according to experimental psychologist Robert Zatorre, a member of the Montreal team. This primeval part of the brain also governs basic drives such as hunger, thirst and sex, suggesting that the brain may consider music on a par with them.</p>\n            <p>Music has the power not just to awe but also to heal. If a person has a stroke on the left side of the brain, where the speech centers in most people are, that 'wipes out a major part of communication,' said Dr Gottfried Schlaug, chief of the Cerebrovascular Disorders Division and Stroke Recovery Laboratory at Beth Israel Deaconess Medical Center. But if the right side, where a lot of music is processed, is intact, some stroke patients can use melodic intonation therapy, which involves singing using two tones relatively close in pitch, to communicate. Schlaug's research suggests that with intensive therapy, some patients can even move from this two-tone singing back to actual speech.</p>\n            <p>Stroke patients with gait problems also profit from music therapy. At the Center for Biomedical Research in Music at Colorado State University in Fort Collins, director Michael Thaut and his team have shown that people who are partially paralyzed on one side of the body can be retrained to walk faster and in a more coordinated way if they practice walking rhythmically, cued by music or a metronome. Combining rhythmic training with physical therapy also helps stroke patients recover gait faster. ‘Music helps us organize our movement,' said Kathleen Howland, a music therapist who teaches at Lesley University in Cambridge in the USA. In fact, researchers have found that auditory signals are more powerful than visual signals in coordinating movement in healthy people.</p>\n            <p>Patients undergoing colonoscopy seem to feel less pain and need fewer sedative drugs if they listen to music during the procedure, according to several studies. But not all studies have been so clear-cut. A 2007 review by the Cochrane Collaboration, a nonprofit, international organization that evaluates medical research, pooled data from 51 pain studies and concluded that, although listening to music can reduce the intensity of pain and the need for narcotic drugs, the benefit, overall, was small.</p>\n            <p>A number of studies, however, show that music therapy can reduce pain, such as a 2001 study on burn patients, whose burns must be frequently scraped to reduce dead tissue. Music therapy may improve mental state and functioning in people with schizophrenia, and communication in children with autistic spectrum disorders, according to Cochrane reviews. Babies, as any parent knows, clearly respond to music. Premature infants who listen to lullabies learn to suck better and gain more weight than those who don't get music therapy. Deforia Lane, director of music therapy at the University Hospitals Ireland Cancer Center in Cleveland, has found an improvement in immune response among hospitalized children who played, sang and created music, compared with children who did not get music therapy. Indeed, the list of potential benefits from music therapy seems long. And for people such as Ellsey, the benefits can be nothing short of liberating.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>Music soothes and awes – and may help us heal</h2>\n<h4>Tapping into the brain's ability to process music, researchers are using songs and sounds in novel ways</h4>\n<p>Dan Ellsey, 33, was sitting in his wheelchair, his virtually useless arms and weak torso strapped to the chair for safety. As we were introduced, he arched his back, grinned broadly and aimed the power of his dark brown eyes at me, as if eye contact were his only means of transcending the prison of his body.</p>\n<p>But it isn't. In the last few years, Ellsey, who was born with cerebral palsy, has discovered another, almost miraculous way of expressing himself: composing music with a special computerized system called Hyperscore. For Ellsey, as for most human beings, music has almost inexplicable power. It can rouse armies to battle, soothe babies to sleep, communicate peaks of joy and depths of sorrow that mere words cannot.</p>\n<p>Why evolution would have endowed our brains with the neural machinery to make music is a mystery. 'It's unclear why humans are so uniquely sensitive to music. Certainly, music shares many features with spoken language, and our brains are particularly developed to process the rapid tones and segments of sound that are common to both,' said neurologist and author Dr Oliver Sacks, whose latest book is <i>Musicophilia: Tales of Music and the Brain</i>. 'Some researchers,' he added in an e-mail interview, ‘think that in primitive cultures, music and speech were not distinct. Other researchers debate which came first in evolution, speech or song.' What is clear is that the brain is abundantly wired to process music.</p>\n<p>Scientists at the Montreal Neurological Institute and Hospital, for instance, have found dramatic evidence on brain scans that the chills, or visceral feelings of awe, that people report when listening to their favorite music are real. Reactions to music appear to vary greatly. Music that a person likes, but not music that is disliked, activates the higher thinking centers in the brain's cortex and, perhaps more importantly, the 'ancient circuitry, the motivation and reward system,' according to experimental psychologist Robert Zatorre, a member of the Montreal team. This primeval part of the brain also governs basic drives such as hunger, thirst and sex, suggesting that the brain may consider music on a par with them.</p>\n<p>Music has the power not just to awe but also to heal. If a person has a stroke on the left side of the brain, where the speech centers in most people are, that 'wipes out a major part of communication,' said Dr Gottfried Schlaug, chief of the Cerebrovascular Disorders Division and Stroke Recovery Laboratory at Beth Israel Deaconess Medical Center. But if the right side, where a lot of music is processed, is intact, some stroke patients can use melodic intonation therapy, which involves singing using two tones relatively close in pitch, to communicate. Schlaug's research suggests that with intensive therapy, some patients can even move from this two-tone singing back to actual speech.</p>\n<p>Stroke patients with gait problems also profit from music therapy. At the Center for Biomedical Research in Music at Colorado State University in Fort Collins, director Michael Thaut and his team have shown that people who are partially paralyzed on one side of the body can be retrained to walk faster and in a more coordinated way if they practice walking rhythmically, cued by music or a metronome. Combining rhythmic training with physical therapy also helps stroke patients recover gait faster. ‘Music helps us organize our movement,' said Kathleen Howland, a music therapist who teaches at Lesley University in Cambridge in the USA. In fact, researchers have found that auditory signals are more powerful than visual signals in coordinating movement in healthy people.</p>\n<p>Patients undergoing colonoscopy seem to feel less pain and need fewer sedative drugs if they listen to music during the procedure, according to several studies. But not all studies have been so clear-cut. A 2007 review by the Cochrane Collaboration, a nonprofit, international organization that evaluates medical research, pooled data from 51 pain studies and concluded that, although listening to music can reduce the intensity of pain and the need for narcotic drugs, the benefit, overall, was small.</p>\n<p>A number of studies, however, show that music therapy can reduce pain, such as a 2001 study on burn patients, whose burns must be frequently scraped to reduce dead tissue. Music therapy may improve mental state and functioning in people with schizophrenia, and communication in children with autistic spectrum disorders, according to Cochrane reviews. Babies, as any parent knows, clearly respond to music. Premature infants who listen to lullabies learn to suck better and gain more weight than those who don't get music therapy. Deforia Lane, director of music therapy at the University Hospitals Ireland Cancer Center in Cleveland, has found an improvement in immune response among hospitalized children who played, sang and created music, compared with children who did not get music therapy. Indeed, the list of potential benefits from music therapy seems long. And for people such as Ellsey, the benefits can be nothing short of liberating.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -36,7 +36,7 @@
         "q5",
         "q6"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n                <h4>Questions 27–32</h4>\n                <p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n                <ul style=\"list-style: none; padding-left: 0;\">\n                    <li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p><strong>27</strong> Dan Ellsey has been able to communicate through music since he was very young.</p>\n                    <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> Armies respond to music that is loud and rhythmic.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> Researchers have determined why people react so emotionally to music.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>30</strong> Both music and speech are composed of sound segments.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>31</strong> It is clear that song developed more quickly than speech.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>32</strong> Emotional reactions to music have been scientifically demonstrated.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-anchor\">\n<h4>Questions 27–32</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<ul style=\"list-style: none; padding-left: 0;\">\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>27</strong> Dan Ellsey has been able to communicate through music since he was very young.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q1\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q1\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q1\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Armies respond to music that is loud and rhythmic.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q2\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q2\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q2\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Researchers have determined why people react so emotionally to music.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q3\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q3\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q3\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Both music and speech are composed of sound segments.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q4\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q4\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q4\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> It is clear that song developed more quickly than speech.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> Emotional reactions to music have been scientifically demonstrated.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -46,7 +46,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-anchor\">\n                <h4>Questions 33–35</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> According to the article, music stimulates higher brain activity when it</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"A\"><span>A provokes hunger.</span></label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"B\"><span>B requires thought.</span></label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"C\"><span>C is soothing.</span></label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"D\"><span>D is pleasing.</span></label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>34</strong> According to Dr Schlaug's research, some stroke patients may regain speech if</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"A\"><span>A they practise making sounds that are close together.</span></label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"B\"><span>B they reactivate the left side of the brain.</span></label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"C\"><span>C they receive music therapy daily.</span></label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"D\"><span>D they listen to tunes in groups.</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>35</strong> According to the Cochrane Collaboration review, some research into the link between music and pain relief suggests</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"A\"><span>A the value of music is underestimated.</span></label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"B\"><span>B the value of music may be limited.</span></label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"C\"><span>C more studies are needed in these areas.</span></label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"D\"><span>D patients welcome this research.</span></label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q7-8-9-anchor\">\n<h4>Questions 33–35</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>33</strong> According to the article, music stimulates higher brain activity when it</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"><span>A provokes hunger.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"B\"><span>B requires thought.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"C\"><span>C is soothing.</span></label> <label><input name=\"q7\" type=\"radio\" value=\"D\"><span>D is pleasing.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> According to Dr Schlaug's research, some stroke patients may regain speech if</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"><span>A they practise making sounds that are close together.</span></label> <label><input name=\"q8\" type=\"radio\" value=\"B\"><span>B they reactivate the left side of the brain.</span></label> <label><input name=\"q8\" type=\"radio\" value=\"C\"><span>C they receive music therapy daily.</span></label> <label><input name=\"q8\" type=\"radio\" value=\"D\"><span>D they listen to tunes in groups.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> According to the Cochrane Collaboration review, some research into the link between music and pain relief suggests</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"><span>A the value of music is underestimated.</span></label> <label><input name=\"q9\" type=\"radio\" value=\"B\"><span>B the value of music may be limited.</span></label> <label><input name=\"q9\" type=\"radio\" value=\"C\"><span>C more studies are needed in these areas.</span></label> <label><input name=\"q9\" type=\"radio\" value=\"D\"><span>D patients welcome this research.</span></label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -58,7 +58,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n                <h4>Questions 36–40</h4>\n                <p>Complete each sentence with the correct ending, <strong>A–H</strong>, below.</p>\n                \n                <div class=\"match-question-item\">\n                    <p><strong>36</strong> Burn victims who receive music therapy</p>\n                    <div class=\"match-dropzone\" data-question=\"q10\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>37</strong> People with schizophrenia who receive music therapy</p>\n                    <div class=\"match-dropzone\" data-question=\"q11\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                     <p><strong>38</strong> Autistic children who receive music therapy</p>\n                    <div class=\"match-dropzone\" data-question=\"q12\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                    <p><strong>39</strong> Premature babies who receive music therapy</p>\n                    <div class=\"match-dropzone\" data-question=\"q13\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>40</strong> Hospitalised children who receive music therapy</p>\n                    <div class=\"match-dropzone\" data-question=\"q14\"></div>\n                </div>\n\n                <div class=\"options-pool\">\n                    <strong>List of Endings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A rely less on drugs.</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B get heavier.</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C exhibit improved social interaction.</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D experience psychological benefits.</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E sleep more soundly.</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F suffer less discomfort.</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G accept their situation more easily.</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"H\">H have stronger resistance to disease.</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete each sentence with the correct ending, <strong>A–H</strong>, below.</p>\n<div class=\"match-question-item\">\n<p><strong>36</strong> Burn victims who receive music therapy</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>37</strong> People with schizophrenia who receive music therapy</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>38</strong> Autistic children who receive music therapy</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>39</strong> Premature babies who receive music therapy</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>40</strong> Hospitalised children who receive music therapy</p>\n<div class=\"match-dropzone\" data-question=\"q14\"></div>\n</div>\n<div class=\"options-pool\">\n<strong>List of Endings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A rely less on drugs.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B get heavier.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C exhibit improved social interaction.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D experience psychological benefits.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E sleep more soundly.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F suffer less discomfort.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G accept their situation more easily.</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"H\">H have stronger resistance to disease.</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false
     }
   ],
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n\n            <h3>Translating: a key to international understanding?</h3>\n            \n            <p><strong>A</strong> The term 'translation' is used for all cases where the meaning of expressions in one language (the 'source' language) is turned into the meaning in another (the target language), whether the medium is spoken, written, or signed. In specific professional contexts, however, a distinction is drawn between work with the spoken or signed language (interpreting), and work with the written language (translating), although certain tasks blur this distinction.</p>\n            <p><strong>B</strong> It is sometimes said that there is no task more complex than translation – a claim that can be readily believed when all the variables involved are taken into account. Translators not only need to know their source language well; they must also have a thorough understanding of the field of knowledge covered by the source text, and of any social, cultural, or emotional connotations that need to be specified in the target language if the intended effect is to be conveyed. The same special awareness needs to be present for the target language, so that points of special phrasing, contemporary fashions in expression, local expectations, and so on, can all be taken into account. On the whole, translators work into their mother tongue (or language of habitual use), to ensure a result that sounds as natural as possible – though some translators have argued that, for certain types of text (e.g., scientific material) where translation accuracy is more crucial than naturalness, it makes more sense for the translators to be more fluent in the source language.</p>\n            <p><strong>C</strong> The aim of translation is to provide semantic equivalence between source and target languages. This is what makes translation different from other linguistic activities, such as adapting, précis writing, and abstracting. However, there are many problems hidden within this apparently simple statement, all to do with what standards of 'equivalence' should be expected and accepted.</p>\n            <p><strong>D</strong> Exact equivalence is of course impossible: no translator could provide a translation that was a perfect parallel to the source text, in such respects as rhythm, puns and cultural allusions. Such a parallel is not even possible when paraphrasing within a single language: there is always some loss of information.</p>\n            <p><strong>E</strong> On the other hand, there are many kinds of inexact equivalence, any of which can be successful at a certain level of practical functioning. It therefore follows that there is no such thing as a 'best' translation. The success of translation depends on the purpose for which it was made, which in turn reflects the needs of the people for whom it was made. A rough-and-ready translation of a letter can suffice to inform a firm of the nature of an enquiry. A translation of a scientific article requires careful attention to meaning, but little attention to stylistic features. The provision of a dubbed film script will warrant scrupulous care over the synchronisation of lip movements, often at the expense of content. Literary work requires a sensitive consideration of form as well as content, and may prompt several translations, each of which emphasises a different aspect of the original. It is easy to see that what might be 'best' for one set of circumstances may be entirely unsuitable for another.</p>\n            <p><strong>F</strong> Several different kinds of translation have been proposed to allow for this range of possibilities. A pragmatic translation emphasises accuracy and knowledge of the subject, as required for instruction manuals and much scientific research. In an aesthetic translation, important for literary material, the focus is on preserving the emotional as well as the cognitive content of the work, and on maintaining some level of stylistic equivalence. Ethnographic or sociolinguistic translations aim to pay full attention to the cultural backgrounds of the authors and the recipients, and take into account differences between source and target languages, and the ways of life in which they are embedded. And there are various kinds of linguistic translation, where the aim is to convey the structural flavour of the original text, often in quite a literal manner, emphasising such features as archaisms, dialectisms, and levels of formality. Most translations, of course, are mixtures of these theoretical types, reflecting the complex reality of language in use.</p>\n            <p><strong>G</strong> At another level, in a word-for-word translation each word in the source language is translated by a word in the target language. The result often makes no sense, especially when idiomatic constructions are used. In a literal translation, the linguistic structure of the source text is followed, but is normalised according to the rules of the target language. In a free translation, the linguistic structure of the source language is ignored, and an equivalent is found based on the meaning it conveys.</p>\n            <p><strong>H</strong> Translators aim to produce a text that is as faithful to the original as circumstances require or permit, and yet that reads as if it were written originally in the target language. They aim to be ‘invisible people' – transferring content without drawing attention to the considerable artistic and technical skills involved in the process. The complexity of the task is apparent, but its importance is often underestimated, and its practitioners' social status and legal rights undervalued. Some countries view translation as a menial, clerical task, and pay their translators accordingly, while others regard it as a major intellectual discipline in its own right. The question of status is currently much debated, particularly in Europe, where demand for translators is rocketing, especially in relation to the European Union.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>Translating: a key to international understanding?</h3>\n<p><strong>A</strong> The term 'translation' is used for all cases where the meaning of expressions in one language (the 'source' language) is turned into the meaning in another (the target language), whether the medium is spoken, written, or signed. In specific professional contexts, however, a distinction is drawn between work with the spoken or signed language (interpreting), and work with the written language (translating), although certain tasks blur this distinction.</p>\n<p><strong>B</strong> It is sometimes said that there is no task more complex than translation – a claim that can be readily believed when all the variables involved are taken into account. Translators not only need to know their source language well; they must also have a thorough understanding of the field of knowledge covered by the source text, and of any social, cultural, or emotional connotations that need to be specified in the target language if the intended effect is to be conveyed. The same special awareness needs to be present for the target language, so that points of special phrasing, contemporary fashions in expression, local expectations, and so on, can all be taken into account. On the whole, translators work into their mother tongue (or language of habitual use), to ensure a result that sounds as natural as possible – though some translators have argued that, for certain types of text (e.g., scientific material) where translation accuracy is more crucial than naturalness, it makes more sense for the translators to be more fluent in the source language.</p>\n<p><strong>C</strong> The aim of translation is to provide semantic equivalence between source and target languages. This is what makes translation different from other linguistic activities, such as adapting, précis writing, and abstracting. However, there are many problems hidden within this apparently simple statement, all to do with what standards of 'equivalence' should be expected and accepted.</p>\n<p><strong>D</strong> Exact equivalence is of course impossible: no translator could provide a translation that was a perfect parallel to the source text, in such respects as rhythm, puns and cultural allusions. Such a parallel is not even possible when paraphrasing within a single language: there is always some loss of information.</p>\n<p><strong>E</strong> On the other hand, there are many kinds of inexact equivalence, any of which can be successful at a certain level of practical functioning. It therefore follows that there is no such thing as a 'best' translation. The success of translation depends on the purpose for which it was made, which in turn reflects the needs of the people for whom it was made. A rough-and-ready translation of a letter can suffice to inform a firm of the nature of an enquiry. A translation of a scientific article requires careful attention to meaning, but little attention to stylistic features. The provision of a dubbed film script will warrant scrupulous care over the synchronisation of lip movements, often at the expense of content. Literary work requires a sensitive consideration of form as well as content, and may prompt several translations, each of which emphasises a different aspect of the original. It is easy to see that what might be 'best' for one set of circumstances may be entirely unsuitable for another.</p>\n<p><strong>F</strong> Several different kinds of translation have been proposed to allow for this range of possibilities. A pragmatic translation emphasises accuracy and knowledge of the subject, as required for instruction manuals and much scientific research. In an aesthetic translation, important for literary material, the focus is on preserving the emotional as well as the cognitive content of the work, and on maintaining some level of stylistic equivalence. Ethnographic or sociolinguistic translations aim to pay full attention to the cultural backgrounds of the authors and the recipients, and take into account differences between source and target languages, and the ways of life in which they are embedded. And there are various kinds of linguistic translation, where the aim is to convey the structural flavour of the original text, often in quite a literal manner, emphasising such features as archaisms, dialectisms, and levels of formality. Most translations, of course, are mixtures of these theoretical types, reflecting the complex reality of language in use.</p>\n<p><strong>G</strong> At another level, in a word-for-word translation each word in the source language is translated by a word in the target language. The result often makes no sense, especially when idiomatic constructions are used. In a literal translation, the linguistic structure of the source text is followed, but is normalised according to the rules of the target language. In a free translation, the linguistic structure of the source language is ignored, and an equivalent is found based on the meaning it conveys.</p>\n<p><strong>H</strong> Translators aim to produce a text that is as faithful to the original as circumstances require or permit, and yet that reads as if it were written originally in the target language. They aim to be ‘invisible people' – transferring content without drawing attention to the considerable artistic and technical skills involved in the process. The complexity of the task is apparent, but its importance is often underestimated, and its practitioners' social status and legal rights undervalued. Some countries view translation as a menial, clerical task, and pay their translators accordingly, while others regard it as a major intellectual discipline in its own right. The question of status is currently much debated, particularly in Europe, where demand for translators is rocketing, especially in relation to the European Union.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -33,7 +33,7 @@
         "q2",
         "q3"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-anchor\">\n                <h4>Questions 27–29</h4>\n                <p>Reading Passage 3 has eight paragraphs, <strong>A–H</strong>.</p>\n                <p>Which paragraph contains the following information?</p>\n                <p><em>Write the correct letter, A–H, in boxes 27–29 on your answer sheet.</em></p>\n                <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                         <thead>\n                            <tr>\n                                <th style=\"min-width: 250px;\"></th>\n                                <th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>27</strong> the effect that a client's requirements have on the nature of a translation</td>\n                                <td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>28</strong> contrasting attitudes towards translators</td>\n                                <td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>29</strong> a list of the areas of knowledge studied by translators</td>\n                                <td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n                            </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-anchor\">\n<h4>Questions 27–29</h4>\n<p>Reading Passage 3 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, A–H, in boxes 27–29 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th style=\"min-width: 250px;\"></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>27</strong> the effect that a client's requirements have on the nature of a translation</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>28</strong> contrasting attitudes towards translators</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>29</strong> a list of the areas of knowledge studied by translators</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -44,7 +44,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q4-5-6-7-anchor\">\n                <h4>Questions 30–33</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>NO MORE THAN TWO WORDS</strong> from paragraphs C, D and E for each answer.</p>\n                <div class=\"summary-completion\">\n                    <h4>The goal of translation</h4>\n                    <p>\n                    Translation is an attempt to create a text in the target language which displays <strong>30</strong> <input name=\"q4\" type=\"text\" id=\"q30_input\"> with a source text. It is inevitable that not all information can be conveyed, however, so translations are best judged according to their <strong>31</strong> <input name=\"q5\" type=\"text\" id=\"q31_input\">; for example, the translator of a business letter or scientific text does not need to consider its <strong>32</strong> <input name=\"q6\" type=\"text\" id=\"q32_input\"> aspects, while someone dubbing a film may give a relatively low value to <strong>33</strong> <input name=\"q7\" type=\"text\" id=\"q33_input\">.\n                    </p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q4-5-6-7-anchor\">\n<h4>Questions 30–33</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from paragraphs C, D and E for each answer.</p>\n<div class=\"summary-completion\">\n<h4>The goal of translation</h4>\n<p>\nTranslation is an attempt to create a text in the target language which displays <strong>30</strong> <input name=\"q4\" type=\"text\" id=\"q30_input\"> with a source text. It is inevitable that not all information can be conveyed, however, so translations are best judged according to their <strong>31</strong> <input name=\"q5\" type=\"text\" id=\"q31_input\">; for example, the translator of a business letter or scientific text does not need to consider its <strong>32</strong> <input name=\"q6\" type=\"text\" id=\"q32_input\"> aspects, while someone dubbing a film may give a relatively low value to <strong>33</strong> <input name=\"q7\" type=\"text\" id=\"q33_input\">.\n</p>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -55,7 +55,7 @@
         "q10",
         "q11"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-anchor\">\n                <h4>Questions 34–37</h4>\n                <p>Look at the following features of translating (Questions 34–37) and the types of translation below.</p>\n                <p>Match each feature with the correct type of translation, <strong>A–F</strong>.</p>\n                \n                <div class=\"match-question-item\">\n                    <p><strong>34</strong> focuses on reproducing the content accurately</p>\n                    <div class=\"match-dropzone\" data-question=\"q8\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>35</strong> looks at important cultural aspects of language use</p>\n                    <div class=\"match-dropzone\" data-question=\"q9\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                     <p><strong>36</strong> follows the original grammatical structures as required by the target language</p>\n                    <div class=\"match-dropzone\" data-question=\"q10\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                    <p><strong>37</strong> focuses on meaning without necessarily using the original grammatical structures</p>\n                    <div class=\"match-dropzone\" data-question=\"q11\"></div>\n                </div>\n\n                <div class=\"options-pool\" id=\"translation-options-pool\">\n                    <strong>Types of Translation</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" id=\"type-A\" draggable=\"true\" data-option=\"A\">A aesthetic</div>\n                        <div class=\"drag-item\" id=\"type-B\" draggable=\"true\" data-option=\"B\">B ethnographic</div>\n                        <div class=\"drag-item\" id=\"type-C\" draggable=\"true\" data-option=\"C\">C free</div>\n                        <div class=\"drag-item\" id=\"type-D\" draggable=\"true\" data-option=\"D\">D literal</div>\n                        <div class=\"drag-item\" id=\"type-E\" draggable=\"true\" data-option=\"E\">E pragmatic</div>\n                        <div class=\"drag-item\" id=\"type-F\" draggable=\"true\" data-option=\"F\">F word-for-word</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-anchor\">\n<h4>Questions 34–37</h4>\n<p>Look at the following features of translating (Questions 34–37) and the types of translation below.</p>\n<p>Match each feature with the correct type of translation, <strong>A–F</strong>.</p>\n<div class=\"match-question-item\">\n<p><strong>34</strong> focuses on reproducing the content accurately</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>35</strong> looks at important cultural aspects of language use</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>36</strong> follows the original grammatical structures as required by the target language</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>37</strong> focuses on meaning without necessarily using the original grammatical structures</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"options-pool\" id=\"translation-options-pool\">\n<strong>Types of Translation</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" id=\"type-A\" draggable=\"true\" data-option=\"A\">A aesthetic</div>\n<div class=\"drag-item\" id=\"type-B\" draggable=\"true\" data-option=\"B\">B ethnographic</div>\n<div class=\"drag-item\" id=\"type-C\" draggable=\"true\" data-option=\"C\">C free</div>\n<div class=\"drag-item\" id=\"type-D\" draggable=\"true\" data-option=\"D\">D literal</div>\n<div class=\"drag-item\" id=\"type-E\" draggable=\"true\" data-option=\"E\">E pragmatic</div>\n<div class=\"drag-item\" id=\"type-F\" draggable=\"true\" data-option=\"F\">F word-for-word</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false
     },
     {
@@ -66,7 +66,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q12-13-14-anchor\">\n                <h4>Questions 38–40</h4>\n                <p>Choose <strong>THREE</strong> letters, <strong>A–F</strong>.</p>\n                <p>Which <strong>THREE</strong> of the following points are mentioned by the writer of the passage?</p>\n                <div class=\"checkbox-options mcq\" data-group=\"group1\" data-limit=\"3\">\n                    <label class=\"mcq-item\" style=\"display:block;\"><input name=\"q12-13-14\" type=\"checkbox\" value=\"A\"><span><strong>A</strong> The objectives of translating are always clearly different from those of interpreting.</span></label>\n                    <label class=\"mcq-item\" style=\"display:block;\"><input name=\"q12-13-14\" type=\"checkbox\" value=\"B\"><span><strong>B</strong> A translator may need to consider the culture of the target language.</span></label>\n                    <label class=\"mcq-item\" style=\"display:block;\"><input name=\"q12-13-14\" type=\"checkbox\" value=\"C\"><span><strong>C</strong> Translation is an activity which requires professional training.</span></label>\n                    <label class=\"mcq-item\" style=\"display:block;\"><input name=\"q12-13-14\" type=\"checkbox\" value=\"D\"><span><strong>D</strong> It is difficult to specify what constitutes a very good translation.</span></label>\n                    <label class=\"mcq-item\" style=\"display:block;\"><input name=\"q12-13-14\" type=\"checkbox\" value=\"E\"><span><strong>E</strong> The skill required for translation is increasingly gaining recognition.</span></label>\n                    <label class=\"mcq-item\" style=\"display:block;\"><input name=\"q12-13-14\" type=\"checkbox\" value=\"F\"><span><strong>F</strong> A translation should give the impression of being an original work.</span></label>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q12-13-14-anchor\">\n<h4>Questions 38–40</h4>\n<p>Choose <strong>THREE</strong> letters, <strong>A–F</strong>.</p>\n<p>Which <strong>THREE</strong> of the following points are mentioned by the writer of the passage?</p>\n<div class=\"checkbox-options mcq\" data-group=\"group1\" data-limit=\"3\">\n<label class=\"mcq-item\" style=\"display:block;\"><input name=\"q12-13-14\" type=\"checkbox\" value=\"A\"><span><strong>A</strong> The objectives of translating are always clearly different from those of interpreting.</span></label> <label class=\"mcq-item\" style=\"display:block;\"><input name=\"q12-13-14\" type=\"checkbox\" value=\"B\"><span><strong>B</strong> A translator may need to consider the culture of the target language.</span></label> <label class=\"mcq-item\" style=\"display:block;\"><input name=\"q12-13-14\" type=\"checkbox\" value=\"C\"><span><strong>C</strong> Translation is an activity which requires professional training.</span></label> <label class=\"mcq-item\" style=\"display:block;\"><input name=\"q12-13-14\" type=\"checkbox\" value=\"D\"><span><strong>D</strong> It is difficult to specify what constitutes a very good translation.</span></label> <label class=\"mcq-item\" style=\"display:block;\"><input name=\"q12-13-14\" type=\"checkbox\" value=\"E\"><span><strong>E</strong> The skill required for translation is increasingly gaining recognition.</span></label> <label class=\"mcq-item\" style=\"display:block;\"><input name=\"q12-13-14\" type=\"checkbox\" value=\"F\"><span><strong>F</strong> A translation should give the impression of being an original work.</span></label>\n</div>\n</div>"
     }
   ],
   "answerKey": {
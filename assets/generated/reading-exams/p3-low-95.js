@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>The strange world of sight</h2>\n            <h4>Seeing is believing, it is said. But, asks Richard Gregory, could it be the other way round?</h4>\n            \n            <p>Two of the great British men of the 17th century, the philosopher John Locke and the physicist Isaac Newton, were both aware that objects are not coloured, and that against all appearances light is not coloured either. This is still not generally recognised even now, 400 years later, because it seems so implausible. Yet it tells us something very important - that perceptions are not identical with what we perceive, and may be very different.</p>\n            <p>The most accurate historical account of perception is that of the 19th-century German scientist Hermann von Helmholtz. However, it was ridiculed at the time. Von Helmholtz thought that perceptions are unconscious inferences we make based on a combination of clues provided by the eyes and other senses, and knowledge of the world. This idea of unconscious inference for perception preceded, by several years, the psychoanalyst Freud's notion of the unconscious, which was also initially treated with derision because it undermined the notion of humans as pre-eminently rational beings who could be held responsible for their actions and awarded blame or praise accordingly.</p>\n            <p>Crucially, perception of the present depends on rich, though of course not always correct or appropriate, knowledge from the past. We interpret sense data (what we hear, touch, taste, see and smell) from the present according to what we already know. This raises the question: if we see the present through memory, why aren't past and present confused? The pioneering Russian neurologist Alexander Luria described the case of Mr S, who had a remarkable memory. However, he was prone to just such confusions, for example mistaking seeing his clock for remembering it, and so failing to get up in the morning. This suggests that perhaps an important function of perception is to underline the present. Individual perceptions have a vividness that is rare for memories, which might be how we are able to separate them. Try this: look at something for a few seconds, and then shut your eyes and visualise it in memory. You will almost certainly find that the memory is pale by comparison with the perception. Perhaps this is why past and present are not normally confused. Luria's Mr S had exceptionally vivid memories, and rich synaesthesia (experiencing perceptions from another sense as well as the one being stimulated, such as musical notes experienced as colours), which may be why he confused seeing with having seen.</p>\n            <p>The complexity of processes involved in how we see first impressed itself on me 45 years ago. With my colleague Jean Wallace, I studied the rare case of Sydney Bradford, a man who had been born blind but, through a corneal graft at the age of 52, suddenly found himself able to see. Almost immediately after the operation he was able to 'see' but he could only see those things that he already knew about, having experienced them through touch. It was his touch memories that enabled him to perceive them with his eyes. When Bradford was first taken to the zoo, he proved utterly unable to see an elephant as he had no knowledge to make sense of his perceptions.</p>\n            <p>The more recent case in California of Mike May, who was also born blind, is similar. Since his operation, his sight has gradually improved as he learns to see, for example, by understanding how shadows represent depth and tell us about the shape of things. Some of the consequences of May's new-found vision were less happy. He had been a champion blind skier, but following the operation, he would have to shut his eyes while skiing to block out what he now found was a terrifying sight.</p>\n            <p>But acceptance of this intimate connection between memory and perception, even though it was first noticed in the 17th century, has been slow in brain science. Despite the fact that state-of-the-art brain imaging shows that perception animates parts of the brain associated with both present information and memory, most research on memory and perception is still undertaken as if these were separate processes. Seeing used to be thought of as taking place only in the eyes, and in quite specialised brain regions; but now it seems that half the brain is occupied with seeing, requiring a lot of energy. Perhaps this is why we shut our eyes for a rest.</p>\n            <p>It is not just extreme cases like Mike May, but also much more common errors of seeing — illusions — that can reveal the crucial role of memory in governing what we (think we) see. Perception depends on specific knowledge and probabilities. Our brains calculate the likelihood of what is out there, and when too far-fetched, perceptions are rejected.</p>\n            <p>A dramatic and discomforting example is looking at the two sides of a face-mask. From the front it is a convex shape with the nose sticking out. Then if the mask is rotated, the back of the mask will be seen as convex, though we know that it must be concave. It is almost, if not quite, impossible to sketch the back of a hollow mask to look as it is — hollow. Science often learns from what does not happen: people not seeing a hollow face as hollow is the most revealing experiment on perception. The unsettling truth from brain science is that even people with no visual impairment see what, at some level, they expect to see, and often miss things as they really are.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>The strange world of sight</h2>\n<h4>Seeing is believing, it is said. But, asks Richard Gregory, could it be the other way round?</h4>\n<p>Two of the great British men of the 17th century, the philosopher John Locke and the physicist Isaac Newton, were both aware that objects are not coloured, and that against all appearances light is not coloured either. This is still not generally recognised even now, 400 years later, because it seems so implausible. Yet it tells us something very important - that perceptions are not identical with what we perceive, and may be very different.</p>\n<p>The most accurate historical account of perception is that of the 19th-century German scientist Hermann von Helmholtz. However, it was ridiculed at the time. Von Helmholtz thought that perceptions are unconscious inferences we make based on a combination of clues provided by the eyes and other senses, and knowledge of the world. This idea of unconscious inference for perception preceded, by several years, the psychoanalyst Freud's notion of the unconscious, which was also initially treated with derision because it undermined the notion of humans as pre-eminently rational beings who could be held responsible for their actions and awarded blame or praise accordingly.</p>\n<p>Crucially, perception of the present depends on rich, though of course not always correct or appropriate, knowledge from the past. We interpret sense data (what we hear, touch, taste, see and smell) from the present according to what we already know. This raises the question: if we see the present through memory, why aren't past and present confused? The pioneering Russian neurologist Alexander Luria described the case of Mr S, who had a remarkable memory. However, he was prone to just such confusions, for example mistaking seeing his clock for remembering it, and so failing to get up in the morning. This suggests that perhaps an important function of perception is to underline the present. Individual perceptions have a vividness that is rare for memories, which might be how we are able to separate them. Try this: look at something for a few seconds, and then shut your eyes and visualise it in memory. You will almost certainly find that the memory is pale by comparison with the perception. Perhaps this is why past and present are not normally confused. Luria's Mr S had exceptionally vivid memories, and rich synaesthesia (experiencing perceptions from another sense as well as the one being stimulated, such as musical notes experienced as colours), which may be why he confused seeing with having seen.</p>\n<p>The complexity of processes involved in how we see first impressed itself on me 45 years ago. With my colleague Jean Wallace, I studied the rare case of Sydney Bradford, a man who had been born blind but, through a corneal graft at the age of 52, suddenly found himself able to see. Almost immediately after the operation he was able to 'see' but he could only see those things that he already knew about, having experienced them through touch. It was his touch memories that enabled him to perceive them with his eyes. When Bradford was first taken to the zoo, he proved utterly unable to see an elephant as he had no knowledge to make sense of his perceptions.</p>\n<p>The more recent case in California of Mike May, who was also born blind, is similar. Since his operation, his sight has gradually improved as he learns to see, for example, by understanding how shadows represent depth and tell us about the shape of things. Some of the consequences of May's new-found vision were less happy. He had been a champion blind skier, but following the operation, he would have to shut his eyes while skiing to block out what he now found was a terrifying sight.</p>\n<p>But acceptance of this intimate connection between memory and perception, even though it was first noticed in the 17th century, has been slow in brain science. Despite the fact that state-of-the-art brain imaging shows that perception animates parts of the brain associated with both present information and memory, most research on memory and perception is still undertaken as if these were separate processes. Seeing used to be thought of as taking place only in the eyes, and in quite specialised brain regions; but now it seems that half the brain is occupied with seeing, requiring a lot of energy. Perhaps this is why we shut our eyes for a rest.</p>\n<p>It is not just extreme cases like Mike May, but also much more common errors of seeing — illusions — that can reveal the crucial role of memory in governing what we (think we) see. Perception depends on specific knowledge and probabilities. Our brains calculate the likelihood of what is out there, and when too far-fetched, perceptions are rejected.</p>\n<p>A dramatic and discomforting example is looking at the two sides of a face-mask. From the front it is a convex shape with the nose sticking out. Then if the mask is rotated, the back of the mask will be seen as convex, though we know that it must be concave. It is almost, if not quite, impossible to sketch the back of a hollow mask to look as it is — hollow. Science often learns from what does not happen: people not seeing a hollow face as hollow is the most revealing experiment on perception. The unsettling truth from brain science is that even people with no visual impairment see what, at some level, they expect to see, and often miss things as they really are.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -34,7 +34,7 @@
         "q3",
         "q4"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n                <h4>Questions 27–30</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>27</strong> Why does the writer refer to Locke and Newton in the first paragraph?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"A\"><span>A to indicate that his article will cover several scientific fields</span></label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"B\"><span>B to stress how much physics has changed in 400 years</span></label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"C\"><span>C to persuade the reader to take him seriously</span></label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"D\"><span>D to point out that his notions are not new</span></label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>28</strong> According to the writer, why was Freud's theory of the unconscious mocked?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"A\"><span>A It was too complex for his contemporaries to understand.</span></label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"B\"><span>B It involved criticism of the way people behaved in society.</span></label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"C\"><span>C People felt that it devalued the accepted concept of humanity.</span></label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"D\"><span>D People assumed that it was intended as a joke.</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> The writer describes Mr S failing to get up in order to demonstrate</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"A\"><span>A how realistic most people's memories are.</span></label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"B\"><span>B how hard it is to tell dreaming and waking apart.</span></label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"C\"><span>C how unusual it is to mistake a perception for a memory.</span></label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"D\"><span>D how valuable knowledge of the past can be.</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> What point is the writer making in the text as a whole?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"A\"><span>A Perception involves much more than the data collected by the eyes.</span></label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"B\"><span>B Learning to see as an adult can be a time-consuming process.</span></label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"C\"><span>C Science is failing to devote enough attention to sight.</span></label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"D\"><span>D Human perception is remarkably reliable.</span></label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> Why does the writer refer to Locke and Newton in the first paragraph?</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"><span>A to indicate that his article will cover several scientific fields</span></label> <label><input name=\"q1\" type=\"radio\" value=\"B\"><span>B to stress how much physics has changed in 400 years</span></label> <label><input name=\"q1\" type=\"radio\" value=\"C\"><span>C to persuade the reader to take him seriously</span></label> <label><input name=\"q1\" type=\"radio\" value=\"D\"><span>D to point out that his notions are not new</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> According to the writer, why was Freud's theory of the unconscious mocked?</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"><span>A It was too complex for his contemporaries to understand.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"B\"><span>B It involved criticism of the way people behaved in society.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"C\"><span>C People felt that it devalued the accepted concept of humanity.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"D\"><span>D People assumed that it was intended as a joke.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> The writer describes Mr S failing to get up in order to demonstrate</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"><span>A how realistic most people's memories are.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"B\"><span>B how hard it is to tell dreaming and waking apart.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"C\"><span>C how unusual it is to mistake a perception for a memory.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"D\"><span>D how valuable knowledge of the past can be.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What point is the writer making in the text as a whole?</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"><span>A Perception involves much more than the data collected by the eyes.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"B\"><span>B Learning to see as an adult can be a time-consuming process.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"C\"><span>C Science is failing to devote enough attention to sight.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"D\"><span>D Human perception is remarkably reliable.</span></label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -47,7 +47,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-9-10-anchor\">\n                <h4>Questions 31–36</h4>\n                <p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n                <ul style=\"list-style: none; padding-left: 0;\">\n                    <li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p><strong>31</strong> Sydney Bradford relied on recollections of objects he had been told about to help him see after his operation.</p>\n                    <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>32</strong> People who only start to see as adults can learn to see as other people do in time.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> People who have gained their sight as adults find certain activities harder to do than before.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>34</strong> It is evident now that sight involves the eyes and one particular area of the brain.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>35</strong> The mask experiment is particularly useful in training people who are regaining their sight.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>36</strong> People with perfect vision can fail to interpret objects correctly under certain circumstances.</p>\n                     <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-9-10-anchor\">\n<h4>Questions 31–36</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<ul style=\"list-style: none; padding-left: 0;\">\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>31</strong> Sydney Bradford relied on recollections of objects he had been told about to help him see after his operation.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q5\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q5\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> People who only start to see as adults can learn to see as other people do in time.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> People who have gained their sight as adults find certain activities harder to do than before.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> It is evident now that sight involves the eyes and one particular area of the brain.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> The mask experiment is particularly useful in training people who are regaining their sight.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> People with perfect vision can fail to interpret objects correctly under certain circumstances.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -58,7 +58,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n                <h4>Questions 37–40</h4>\n                <p>Complete the summary using the list of words, <strong>A–J</strong>, below.</p>\n                <div class=\"summary-box\">\n                    <h5>The mask experiment</h5>\n                    <div class=\"summary-text\">\n                        <p>\n                            In this experiment, having looked at the front of a simple face-mask, subjects look at the reverse. However, the subjects are convinced that they are still looking at a mask which is <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span> in shape. They believe that the <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> is poking out in the normal manner because that is what they are used to seeing. Attempting to make a <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span> of the mask in this orientation leads to the same problem. The subjects fail to see a concave form because of the <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span> they have that the features of a face stick out.\n                        </p>\n                    </div>\n                </div>\n                <div id=\"word-options\">\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A back</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B brain</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C view</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D round</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E sight</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F nose</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G convex</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H hollow</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I drawing</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"J\">J preconception</div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Complete the summary using the list of words, <strong>A–J</strong>, below.</p>\n<div class=\"summary-box\">\n<h5>The mask experiment</h5>\n<div class=\"summary-text\">\n<p>\nIn this experiment, having looked at the front of a simple face-mask, subjects look at the reverse. However, the subjects are convinced that they are still looking at a mask which is <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span> in shape. They believe that the <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> is poking out in the normal manner because that is what they are used to seeing. Attempting to make a <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span> of the mask in this orientation leads to the same problem. The subjects fail to see a concave form because of the <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span> they have that the features of a face stick out.\n</p>\n</div>\n</div>\n<div id=\"word-options\">\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A back</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B brain</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C view</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D round</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E sight</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F nose</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G convex</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H hollow</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I drawing</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"J\">J preconception</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
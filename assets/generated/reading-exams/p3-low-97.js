@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>Saving languages</h2>\n            <h4>The campaign to keep minority languages alive</h4>\n            \n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q1\">\n                    <span class=\"paragraph-heading-label\">Paragraph A (Q27):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>A</strong> Ten years ago, Michael Krauss, a professor at the University of Alaska, shocked his colleagues in the discipline of linguistics with his prediction that half the 6,000 or so languages spoken in the world would disappear within a century. Krauss founded the Alaskan Native Language Center to preserve as much as possible of the 20 tongues still known to the state's indigenous people. Only two of those languages were being taught to children, and the rest were rapidly falling from use. Other linguists are making similar predictions. A survey in Australia found that 70 of the surviving 90 Aboriginal languages were no longer used regularly by all age groups. The same is true for all but 20 of the other 175 North American languages in the US.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q2\">\n                    <span class=\"paragraph-heading-label\">Paragraph B (Q28):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>B</strong> Outwardly, the consolidation of human language might seem like a good trend that could ease ethnic tensions and aid global commerce. Linguists don't deny those benefits, and they acknowledge that small communities often choose to switch to the majority language because they believe it will boost their social or economic status.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                 <div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q3\">\n                    <span class=\"paragraph-heading-label\">Paragraph C (Q29):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>C</strong> Many experts in the field nonetheless mourn the loss of rare languages, for several reasons. Some of the most basic questions in linguistics have to do with the limits of human speech, still far from fully explored. Many researchers would like to know which elements of grammar and vocabulary—if any—are universal. An English researcher, Nicholas Ostler, offers an example: 'Ica, spoken in northern Colombia, seems to have nothing comparable to a personal pronoun system—I, we, you, etc. Otherwise, I would have thought that personal pronouns were a linguistic universal.' Other scientists try to reconstruct ancient migration patterns by comparing borrowed words in otherwise unrelated languages. In each of these cases, the wider the range of languages you study, the more likely you are to get the right answers.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                 <div class=\"paragraph-heading-dropzone match-dropzone\" data-question=\"qD\">\n                    <span class=\"paragraph-heading-label\">Paragraph D:</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>D</strong> 'I think the value is mostly in human terms,' says James Matisoff, a specialist in rare Asian languages at the University of California. ‘Language is the most important element in the culture of a community. When it dies, you lose the special knowledge of that culture and a unique window on the world. But despite the constant talk about saving endangered languages over the past ten years, the field of descriptive linguistics has accomplished little in this respect. You would think that there would be some organised response to this situation, some attempt to determine which languages can be saved and which should be documented before they disappear,' says Sarah G. Thomason, of the University of Michigan. ‘But there isn't any such effort.'</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q4\">\n                    <span class=\"paragraph-heading-label\">Paragraph E (Q30):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>E</strong> However, there are some signs of progress. The Volkswagen Foundation, a German charity, has created a multimedia archive in the Netherlands that can house recordings, grammars, dictionaries and other data. Contributions from the Ford Foundation have helped a master-apprentice programme, in which fluent speakers receive $3,000 to teach a younger relative their native tongue through shared activities. So far, about 75 teams have completed the programme. ‘It's too early to call this language revitalisation,' admits Leanne Hinton of Berkeley. ‘In California, the death rate of elderly speakers will always be greater than the recruitment rate of young speakers. But if nothing else, we prolong the survival of the language.' This will give linguists more time to record these tongues before they vanish.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q5\">\n                    <span class=\"paragraph-heading-label\">Paragraph F (Q31):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>F</strong> Complicating matters, dozens of institutions around the world are setting up digital libraries on endangered languages. This could create chaos, because the projects use non-standardised data formats, terminology and even names of languages. Gary F. Simons, of the Dallas-based research group SIL International, has been working to bring some order to this by building an ‘open languages data community'—a kind of digital card catalogue. This system will allow researchers to check their theories against a vast array of data.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                <div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q6\">\n                    <span class=\"paragraph-heading-label\">Paragraph G (Q32):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>G</strong> However, even if a language has been fully documented, all that remains once it vanishes from use is a fossil skeleton. Linguists may be able to sketch an outline of the language and fix its place on the evolutionary tree, but little more. As yet, there is no discipline of conservation linguistics. Almost every strategy to keep people speaking a language has succeeded in some places but failed in others. One factor that always seems to occur in the death of a language, according to Hans-Jurgen Sasse of the University of Cologne in Germany, is that speakers start regarding their own language as inferior to the majority language. Children pick up on the attitude, and prefer to speak the dominant language. This is how Cornish and some dialects of Scottish Gaelic slipped into extinction.</p>\n            </div>\n            <div class=\"paragraph-wrapper\">\n                 <div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q7\">\n                    <span class=\"paragraph-heading-label\">Paragraph H (Q33):</span>\n                    <div class=\"dropped-items\"></div>\n                </div>\n                <p><strong>H</strong> 'Ultimately, the answer to the problem of language extinction is multilingualism,' argues James Matisoff. ‘Even uneducated people can speak a number of languages if they start as children.' Many people in the world are at least bilingual, and in some places it is common to speak three or four languages. But in addition to the fact that children may reject minority languages, there is also the concern that speakers of a majority language may react badly to speakers of minority languages. The first step in saving dying languages may be to persuade the world's majorities to allow the minorities among them to speak with their own voices.</p>\n            </div>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>Saving languages</h2>\n<h4>The campaign to keep minority languages alive</h4>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q1\">\n<span class=\"paragraph-heading-label\">Paragraph A (Q27):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>A</strong> Ten years ago, Michael Krauss, a professor at the University of Alaska, shocked his colleagues in the discipline of linguistics with his prediction that half the 6,000 or so languages spoken in the world would disappear within a century. Krauss founded the Alaskan Native Language Center to preserve as much as possible of the 20 tongues still known to the state's indigenous people. Only two of those languages were being taught to children, and the rest were rapidly falling from use. Other linguists are making similar predictions. A survey in Australia found that 70 of the surviving 90 Aboriginal languages were no longer used regularly by all age groups. The same is true for all but 20 of the other 175 North American languages in the US.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q2\">\n<span class=\"paragraph-heading-label\">Paragraph B (Q28):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>B</strong> Outwardly, the consolidation of human language might seem like a good trend that could ease ethnic tensions and aid global commerce. Linguists don't deny those benefits, and they acknowledge that small communities often choose to switch to the majority language because they believe it will boost their social or economic status.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q3\">\n<span class=\"paragraph-heading-label\">Paragraph C (Q29):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>C</strong> Many experts in the field nonetheless mourn the loss of rare languages, for several reasons. Some of the most basic questions in linguistics have to do with the limits of human speech, still far from fully explored. Many researchers would like to know which elements of grammar and vocabulary—if any—are universal. An English researcher, Nicholas Ostler, offers an example: 'Ica, spoken in northern Colombia, seems to have nothing comparable to a personal pronoun system—I, we, you, etc. Otherwise, I would have thought that personal pronouns were a linguistic universal.' Other scientists try to reconstruct ancient migration patterns by comparing borrowed words in otherwise unrelated languages. In each of these cases, the wider the range of languages you study, the more likely you are to get the right answers.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-heading-dropzone match-dropzone\" data-question=\"qD\">\n<span class=\"paragraph-heading-label\">Paragraph D:</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>D</strong> 'I think the value is mostly in human terms,' says James Matisoff, a specialist in rare Asian languages at the University of California. ‘Language is the most important element in the culture of a community. When it dies, you lose the special knowledge of that culture and a unique window on the world. But despite the constant talk about saving endangered languages over the past ten years, the field of descriptive linguistics has accomplished little in this respect. You would think that there would be some organised response to this situation, some attempt to determine which languages can be saved and which should be documented before they disappear,' says Sarah G. Thomason, of the University of Michigan. ‘But there isn't any such effort.'</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q4\">\n<span class=\"paragraph-heading-label\">Paragraph E (Q30):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>E</strong> However, there are some signs of progress. The Volkswagen Foundation, a German charity, has created a multimedia archive in the Netherlands that can house recordings, grammars, dictionaries and other data. Contributions from the Ford Foundation have helped a master-apprentice programme, in which fluent speakers receive $3,000 to teach a younger relative their native tongue through shared activities. So far, about 75 teams have completed the programme. ‘It's too early to call this language revitalisation,' admits Leanne Hinton of Berkeley. ‘In California, the death rate of elderly speakers will always be greater than the recruitment rate of young speakers. But if nothing else, we prolong the survival of the language.' This will give linguists more time to record these tongues before they vanish.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q5\">\n<span class=\"paragraph-heading-label\">Paragraph F (Q31):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>F</strong> Complicating matters, dozens of institutions around the world are setting up digital libraries on endangered languages. This could create chaos, because the projects use non-standardised data formats, terminology and even names of languages. Gary F. Simons, of the Dallas-based research group SIL International, has been working to bring some order to this by building an ‘open languages data community'—a kind of digital card catalogue. This system will allow researchers to check their theories against a vast array of data.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q6\">\n<span class=\"paragraph-heading-label\">Paragraph G (Q32):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>G</strong> However, even if a language has been fully documented, all that remains once it vanishes from use is a fossil skeleton. Linguists may be able to sketch an outline of the language and fix its place on the evolutionary tree, but little more. As yet, there is no discipline of conservation linguistics. Almost every strategy to keep people speaking a language has succeeded in some places but failed in others. One factor that always seems to occur in the death of a language, according to Hans-Jurgen Sasse of the University of Cologne in Germany, is that speakers start regarding their own language as inferior to the majority language. Children pick up on the attitude, and prefer to speak the dominant language. This is how Cornish and some dialects of Scottish Gaelic slipped into extinction.</p>\n</div>\n<div class=\"paragraph-wrapper\">\n<div class=\"paragraph-heading-match-dropzone match-dropzone\" data-question=\"q7\">\n<span class=\"paragraph-heading-label\">Paragraph H (Q33):</span>\n<div class=\"dropped-items\"></div>\n</div>\n<p><strong>H</strong> 'Ultimately, the answer to the problem of language extinction is multilingualism,' argues James Matisoff. ‘Even uneducated people can speak a number of languages if they start as children.' Many people in the world are at least bilingual, and in some places it is common to speak three or four languages. But in addition to the fact that children may reject minority languages, there is also the concern that speakers of a majority language may react badly to speakers of minority languages. The first step in saving dying languages may be to persuade the world's majorities to allow the minorities among them to speak with their own voices.</p>\n</div>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -37,7 +37,7 @@
         "q6",
         "q7"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n                <h4>Questions 27–33</h4>\n                <p>Reading Passage 3 has eight paragraphs, <strong>A–H</strong>.</p>\n                <p>Choose the correct heading for paragraphs <strong>A–C</strong> and <strong>E–H</strong> from the list of headings below.</p>\n                <p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n                \n                <div class=\"headings-pool\" id=\"headings-pool-container\">\n                    <strong>List of Headings</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"i\"><strong>i</strong> The conservation role of majority language speakers</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\"><strong>ii</strong> Some advantages of changing languages</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\"><strong>iii</strong> The loss rate of European languages</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\"><strong>iv</strong> Positive gains of conservation programmes</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"v\"><strong>v</strong> The economic value of minority languages</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\"><strong>vi</strong> The success rate of language rescue strategies in the past decade</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\"><strong>vii</strong> Improving the consistency of research data</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\"><strong>viii</strong> The potential failure of language conservation</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\"><strong>ix</strong> The value of minority languages to language researchers</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-heading=\"x\"><strong>x</strong> The current position of minority languages</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-6-7-anchor\">\n<h4>Questions 27–33</h4>\n<p>Reading Passage 3 has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Choose the correct heading for paragraphs <strong>A–C</strong> and <strong>E–H</strong> from the list of headings below.</p>\n<p><em>Drag a heading from the list and drop it onto the correct paragraph's answer box on the left.</em></p>\n<div class=\"headings-pool\" id=\"headings-pool-container\">\n<strong>List of Headings</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"i\"><strong>i</strong> The conservation role of majority language speakers</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ii\"><strong>ii</strong> Some advantages of changing languages</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iii\"><strong>iii</strong> The loss rate of European languages</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"iv\"><strong>iv</strong> Positive gains of conservation programmes</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"v\"><strong>v</strong> The economic value of minority languages</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vi\"><strong>vi</strong> The success rate of language rescue strategies in the past decade</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"vii\"><strong>vii</strong> Improving the consistency of research data</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"viii\"><strong>viii</strong> The potential failure of language conservation</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"ix\"><strong>ix</strong> The value of minority languages to language researchers</div>\n<div class=\"drag-item\" draggable=\"true\" data-heading=\"x\"><strong>x</strong> The current position of minority languages</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false,
       "leadHtml": "<h3>Questions</h3>"
     },
@@ -51,7 +51,7 @@
         "q11",
         "q12"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-12-anchor\">\n                <h4>Questions 34–38</h4>\n                <p>Match each opinion with the correct person, <strong>A–G</strong>.</p>\n                \n                <div class=\"match-question-item\">\n                    <p><strong>34</strong> In the long run, the California scheme will not have enough tutors.</p>\n                    <div class=\"match-dropzone\" data-question=\"q8\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>35</strong> Decisions need to be made about priorities in language rescue.</p>\n                    <div class=\"match-dropzone\" data-question=\"q9\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                    <p><strong>36</strong> Languages currently in use face extinction in the foreseeable future.</p>\n                    <div class=\"match-dropzone\" data-question=\"q10\"></div>\n                </div>\n                 <div class=\"match-question-item\">\n                    <p><strong>37</strong> There is a solution to the problem of languages dying out.</p>\n                    <div class=\"match-dropzone\" data-question=\"q11\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>38</strong> A language may be dying when its speakers begin to value it less.</p>\n                    <div class=\"match-dropzone\" data-question=\"q12\"></div>\n                </div>\n\n                <div class=\"options-pool\" id=\"people-options-pool\">\n                    <strong>List of People</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"A\"><strong>A</strong> Michael Krauss</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"B\"><strong>B</strong> Nicholas Ostler</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"C\"><strong>C</strong> James Matisoff</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"D\"><strong>D</strong> Sarah G Thomason</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"E\"><strong>E</strong> Leanne Hinton</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"F\"><strong>F</strong> Gary F Simons</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"G\"><strong>G</strong> Hans-Jurgen Sasse</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q8-9-10-11-12-anchor\">\n<h4>Questions 34–38</h4>\n<p>Match each opinion with the correct person, <strong>A–G</strong>.</p>\n<div class=\"match-question-item\">\n<p><strong>34</strong> In the long run, the California scheme will not have enough tutors.</p>\n<div class=\"match-dropzone\" data-question=\"q8\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>35</strong> Decisions need to be made about priorities in language rescue.</p>\n<div class=\"match-dropzone\" data-question=\"q9\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>36</strong> Languages currently in use face extinction in the foreseeable future.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>37</strong> There is a solution to the problem of languages dying out.</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>38</strong> A language may be dying when its speakers begin to value it less.</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"options-pool\" id=\"people-options-pool\">\n<strong>List of People</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\"><strong>A</strong> Michael Krauss</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\"><strong>B</strong> Nicholas Ostler</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\"><strong>C</strong> James Matisoff</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\"><strong>D</strong> Sarah G Thomason</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\"><strong>E</strong> Leanne Hinton</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\"><strong>F</strong> Gary F Simons</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\"><strong>G</strong> Hans-Jurgen Sasse</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false
     },
     {
@@ -61,7 +61,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q13-14-anchor\">\n                 <h4>Questions 39 and 40</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>39</strong> The Alaskan Language Center was set up to</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q13\" type=\"radio\" value=\"A\"><span>A teach indigenous languages to children.</span></label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"B\"><span>B revive indigenous languages which have fallen from use.</span></label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"C\"><span>C prevent further loss of indigenous languages.</span></label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"D\"><span>D predict the rate of loss of indigenous languages.</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>40</strong> According to the writer, majority language speakers</p>\n                     <div class=\"radio-options\">\n                        <label><input name=\"q14\" type=\"radio\" value=\"A\"><span>A usually speak more than one language.</span></label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"B\"><span>B generally have a high level of education.</span></label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"C\"><span>C should make an effort to learn a minority language.</span></label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"D\"><span>D should be more tolerant of minority languages.</span></label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q13-14-anchor\">\n<h4>Questions 39 and 40</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>39</strong> The Alaskan Language Center was set up to</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"A\"><span>A teach indigenous languages to children.</span></label> <label><input name=\"q13\" type=\"radio\" value=\"B\"><span>B revive indigenous languages which have fallen from use.</span></label> <label><input name=\"q13\" type=\"radio\" value=\"C\"><span>C prevent further loss of indigenous languages.</span></label> <label><input name=\"q13\" type=\"radio\" value=\"D\"><span>D predict the rate of loss of indigenous languages.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> According to the writer, majority language speakers</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"A\"><span>A usually speak more than one language.</span></label> <label><input name=\"q14\" type=\"radio\" value=\"B\"><span>B generally have a high level of education.</span></label> <label><input name=\"q14\" type=\"radio\" value=\"C\"><span>C should make an effort to learn a minority language.</span></label> <label><input name=\"q14\" type=\"radio\" value=\"D\"><span>D should be more tolerant of minority languages.</span></label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
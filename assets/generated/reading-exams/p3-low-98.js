@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Petrol power: an eco-revolution?</h3>\n            \n            <p>Laura Ingalls Wilder's semi-autobiographical novel The Long Winter describes how the inhabitants of a small town called De Smet in the American Midwest narrowly avoided starvation during the severe winter of 1880–1881. Over three metres of snow fell on the northern plains, immobilising the railways and cutting off the settlers from the rest of the world. Laura and her neighbours were only saved when her fiancé and his friend trudged 30 kilometres through the snow to fetch food, risking their lives in the process. The story is a reminder of how lethal geographical isolation and crop failures could be before the advent of modern farming and transportation technologies. Not long ago, subsistence farmers in many countries had to cope with the ‘lean season' – the period of greatest scarcity before new crops became available. In England, late spring was once referred to as the ‘hungry gap'. The situation was made worse by the cost of moving heavy things over muddy dirt roads; three centuries ago, moving goods 50 kilometres on land between, say, Liverpool and Manchester was as expensive as shipping them across the North Atlantic.</p>\n\n            <p>The development of coal-powered railways and steamships in the 19th century revolutionized the lives of farmers. Instead of having to grow everything they needed, they could now specialise in what they did best and rely on other producers for their remaining needs. The result was not only food and ever-cheaper prices, but the end of widespread famine and starvation, as the surplus from regions with good harvests could now be transported to those that had experienced mediocre ones. Since then, petroleum-derived fuels have largely displaced coal because of their higher energy density, cleaner combustion and greater ease of extraction, further improving road and rail transportation systems.</p>\n\n            <p>While the convenience of modern methods of transportation is obvious, few people grasp their historical significance in terms of their beneficial impact on large cities and the health of residents. In 1898, delegates gathered in New York City for the world's first international urban-planning conference.</p>\n\n            <p>The topic that dominated discussions was not infrastructure or housing, but horse manure. The problem was that as the populations of cities like New York and London grew, the number of horses there also grew, and in New York these produced nearly two million kilograms of manure each day. If this problem continued, it was estimated that by 1950 every street in London would be buried three metres deep in horse manure. Unable to think of any solution, the delegates concluded that urban living was inherently unsustainable.</p>\n\n            <p>Paradoxically, much of the urban manure problem was related to the growth of the railways. The ability to deliver perishable goods, such as meat and dairy products, from locations that benefited from better soil and climate, put many farms located near cities out of business. As these had relied on manure from city workhorses for fertiliser, the demand for this was greatly reduced.</p>\n\n            <p>The impact of urban workhorses was felt both in the cities and in the countryside. In cities, apart from their overpowering stench, the manure piles were prime breeding grounds for house flies, perhaps three billion of which hatched each day in US cities in the early 20th century. With flies came outbreaks of typhoid, cholera and diphtheria. Workhorses sometimes panicked in heavy traffic and kicked or bit bystanders. The clatter of wagon wheels on cobblestone pavement could be deafening, and since a horse and wagon occupied more street space than a modern truck, they also created significant traffic congestion, while a horse that collapsed on the road created an obstruction that was difficult to remove. The countryside also suffered. To supply the workhorses with oats and hay, additional land had to be cleared of its natural animal life and vegetation, and sometimes water had to be diverted to irrigate it, with considerable negative effects on the whole area.</p>\n\n            <p>So, while the trains, cars and trucks of the early 20th century were noisy and polluting by today's standards, they were regarded as a significant improvement on what had gone before. Before they were available, poor soils often meant that a large amount of land was required to sustain a household, and much environmental damage, primarily in the form of soil erosion, was caused by trying to farm these soils. It could be argued that modern transportation allowed the development of remote regions like the Canadian Prairies and allowed more suitable crops to be grown in the poorer soils in Europe before being sold elsewhere.</p>\n\n            <p>Over time, the concentration of food production in the world's best locations allowed some agricultural land to revert to a wild state. For instance, France benefited from an expansion of its forest area by one third between 1830 and 1960. This so-called 'forest transition' occurred in the context of a doubling of the French population and a dramatic increase in standards of living.</p>\n\n            <p>Improvements in logistics also allowed the production and export of food from locations where water was abundant to regions where it was scarce, thus preventing the depletion of water resources there. It also made possible a drastic increase in the size of our cities. Contrary to what most people believe, the growth in cities is a positive development. In the words of economist Ed Glaeser: ‘Residing in a forest might seem to be a good way of showing one's love of nature, but living in a concrete jungle is actually far more ecologically friendly... If you love nature, stay away from it.' It could be argued that modern transportation technologies have been a major contributor to a wealthier, cleaner and more sustainable world.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>Petrol power: an eco-revolution?</h3>\n<p>Laura Ingalls Wilder's semi-autobiographical novel The Long Winter describes how the inhabitants of a small town called De Smet in the American Midwest narrowly avoided starvation during the severe winter of 1880–1881. Over three metres of snow fell on the northern plains, immobilising the railways and cutting off the settlers from the rest of the world. Laura and her neighbours were only saved when her fiancé and his friend trudged 30 kilometres through the snow to fetch food, risking their lives in the process. The story is a reminder of how lethal geographical isolation and crop failures could be before the advent of modern farming and transportation technologies. Not long ago, subsistence farmers in many countries had to cope with the ‘lean season' – the period of greatest scarcity before new crops became available. In England, late spring was once referred to as the ‘hungry gap'. The situation was made worse by the cost of moving heavy things over muddy dirt roads; three centuries ago, moving goods 50 kilometres on land between, say, Liverpool and Manchester was as expensive as shipping them across the North Atlantic.</p>\n<p>The development of coal-powered railways and steamships in the 19th century revolutionized the lives of farmers. Instead of having to grow everything they needed, they could now specialise in what they did best and rely on other producers for their remaining needs. The result was not only food and ever-cheaper prices, but the end of widespread famine and starvation, as the surplus from regions with good harvests could now be transported to those that had experienced mediocre ones. Since then, petroleum-derived fuels have largely displaced coal because of their higher energy density, cleaner combustion and greater ease of extraction, further improving road and rail transportation systems.</p>\n<p>While the convenience of modern methods of transportation is obvious, few people grasp their historical significance in terms of their beneficial impact on large cities and the health of residents. In 1898, delegates gathered in New York City for the world's first international urban-planning conference.</p>\n<p>The topic that dominated discussions was not infrastructure or housing, but horse manure. The problem was that as the populations of cities like New York and London grew, the number of horses there also grew, and in New York these produced nearly two million kilograms of manure each day. If this problem continued, it was estimated that by 1950 every street in London would be buried three metres deep in horse manure. Unable to think of any solution, the delegates concluded that urban living was inherently unsustainable.</p>\n<p>Paradoxically, much of the urban manure problem was related to the growth of the railways. The ability to deliver perishable goods, such as meat and dairy products, from locations that benefited from better soil and climate, put many farms located near cities out of business. As these had relied on manure from city workhorses for fertiliser, the demand for this was greatly reduced.</p>\n<p>The impact of urban workhorses was felt both in the cities and in the countryside. In cities, apart from their overpowering stench, the manure piles were prime breeding grounds for house flies, perhaps three billion of which hatched each day in US cities in the early 20th century. With flies came outbreaks of typhoid, cholera and diphtheria. Workhorses sometimes panicked in heavy traffic and kicked or bit bystanders. The clatter of wagon wheels on cobblestone pavement could be deafening, and since a horse and wagon occupied more street space than a modern truck, they also created significant traffic congestion, while a horse that collapsed on the road created an obstruction that was difficult to remove. The countryside also suffered. To supply the workhorses with oats and hay, additional land had to be cleared of its natural animal life and vegetation, and sometimes water had to be diverted to irrigate it, with considerable negative effects on the whole area.</p>\n<p>So, while the trains, cars and trucks of the early 20th century were noisy and polluting by today's standards, they were regarded as a significant improvement on what had gone before. Before they were available, poor soils often meant that a large amount of land was required to sustain a household, and much environmental damage, primarily in the form of soil erosion, was caused by trying to farm these soils. It could be argued that modern transportation allowed the development of remote regions like the Canadian Prairies and allowed more suitable crops to be grown in the poorer soils in Europe before being sold elsewhere.</p>\n<p>Over time, the concentration of food production in the world's best locations allowed some agricultural land to revert to a wild state. For instance, France benefited from an expansion of its forest area by one third between 1830 and 1960. This so-called 'forest transition' occurred in the context of a doubling of the French population and a dramatic increase in standards of living.</p>\n<p>Improvements in logistics also allowed the production and export of food from locations where water was abundant to regions where it was scarce, thus preventing the depletion of water resources there. It also made possible a drastic increase in the size of our cities. Contrary to what most people believe, the growth in cities is a positive development. In the words of economist Ed Glaeser: ‘Residing in a forest might seem to be a good way of showing one's love of nature, but living in a concrete jungle is actually far more ecologically friendly... If you love nature, stay away from it.' It could be argued that modern transportation technologies have been a major contributor to a wealthier, cleaner and more sustainable world.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -34,7 +34,7 @@
         "q3",
         "q4"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n                <h4>Questions 27–30</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>27</strong> Why were the inhabitants of De Smet in danger of starvation?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"A\"><span>A The trains were unable to operate normally.</span></label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"B\"><span>B The harvest had been completely destroyed.</span></label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"C\"><span>C The roads to the town had not yet been built.</span></label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"D\"><span>D The farmers were reluctant to sell their produce.</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> What problem did subsistence farmers have in the past?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"A\"><span>A They had no effective means of storing food.</span></label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"B\"><span>B Food was expensive because of high shipping costs.</span></label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"C\"><span>C Their access to food was limited at certain times.</span></label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"D\"><span>D Food could not be transported for long distances by road.</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> The writer says that the use of coal to power railways and steamships</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"A\"><span>A led to a greater range of fresh vegetables being available in urban areas.</span></label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"B\"><span>B was less efficient than the use of petroleum-derived products.</span></label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"C\"><span>C allowed farmers to be more self-sufficient than they were previously.</span></label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"D\"><span>D was better for the environment than using petroleum-derived products.</span></label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> The writer refers to an urban-planning conference held in 1898 in order to</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"A\"><span>A illustrate a problem that was later solved by modern technology.</span></label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"B\"><span>B give an example of poor decisions made about urban planning.</span></label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"C\"><span>C show that urban issues were misunderstood in the past.</span></label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"D\"><span>D indicate the disregard at the time for public health concerns.</span></label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> Why were the inhabitants of De Smet in danger of starvation?</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"><span>A The trains were unable to operate normally.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"B\"><span>B The harvest had been completely destroyed.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"C\"><span>C The roads to the town had not yet been built.</span></label> <label><input name=\"q1\" type=\"radio\" value=\"D\"><span>D The farmers were reluctant to sell their produce.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> What problem did subsistence farmers have in the past?</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"><span>A They had no effective means of storing food.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"B\"><span>B Food was expensive because of high shipping costs.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"C\"><span>C Their access to food was limited at certain times.</span></label> <label><input name=\"q2\" type=\"radio\" value=\"D\"><span>D Food could not be transported for long distances by road.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> The writer says that the use of coal to power railways and steamships</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"><span>A led to a greater range of fresh vegetables being available in urban areas.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"B\"><span>B was less efficient than the use of petroleum-derived products.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"C\"><span>C allowed farmers to be more self-sufficient than they were previously.</span></label> <label><input name=\"q3\" type=\"radio\" value=\"D\"><span>D was better for the environment than using petroleum-derived products.</span></label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> The writer refers to an urban-planning conference held in 1898 in order to</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"><span>A illustrate a problem that was later solved by modern technology.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"B\"><span>B give an example of poor decisions made about urban planning.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"C\"><span>C show that urban issues were misunderstood in the past.</span></label> <label><input name=\"q4\" type=\"radio\" value=\"D\"><span>D indicate the disregard at the time for public health concerns.</span></label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions 27–40</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n                <h4>Questions 31–35</h4>\n                <p>Complete the summary using the list of words, <strong>A–J</strong>, below.</p>\n                <div class=\"summary-completion\">\n                    <h4>Problems caused by urban workhorses</h4>\n                    <p>\n                        In cities, the large amounts of horse manure led to <span id=\"q5-target\" class=\"drop-target-summary\" data-question=\"q5\"></span> in the streets and were also linked to the spread of <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span>. In certain situations, the horses might even cause <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> to passers-by. There were also the problems of noise and congestion caused by horse-drawn vehicles. In the countryside, there were problems too. The <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> was damaged because of the need to provide <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span> for urban workhorses.\n                    </p>\n                </div>\n                <div id=\"word-options\">\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"A\"><strong>A</strong> rich landowners</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"B\"><strong>B</strong> injuries</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"C\"><strong>C</strong> food</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"D\"><strong>D</strong> accidental falls</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"E\"><strong>E</strong> environment</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"F\"><strong>F</strong> dangerous area</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"G\"><strong>G</strong> use of irrigation</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"H\"><strong>H</strong> unpleasant smells</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"I\"><strong>I</strong> treatment</div>\n                    <div class=\"draggable-word\" draggable=\"true\" data-key=\"J\"><strong>J</strong> diseases</div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n<h4>Questions 31–35</h4>\n<p>Complete the summary using the list of words, <strong>A–J</strong>, below.</p>\n<div class=\"summary-completion\">\n<h4>Problems caused by urban workhorses</h4>\n<p>\nIn cities, the large amounts of horse manure led to <span id=\"q5-target\" class=\"drop-target-summary\" data-question=\"q5\"></span> in the streets and were also linked to the spread of <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span>. In certain situations, the horses might even cause <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> to passers-by. There were also the problems of noise and congestion caused by horse-drawn vehicles. In the countryside, there were problems too. The <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> was damaged because of the need to provide <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span> for urban workhorses.\n</p>\n</div>\n<div id=\"word-options\">\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"A\"><strong>A</strong> rich landowners</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"B\"><strong>B</strong> injuries</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"C\"><strong>C</strong> food</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"D\"><strong>D</strong> accidental falls</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"E\"><strong>E</strong> environment</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"F\"><strong>F</strong> dangerous area</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"G\"><strong>G</strong> use of irrigation</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"H\"><strong>H</strong> unpleasant smells</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"I\"><strong>I</strong> treatment</div>\n<div class=\"draggable-word\" draggable=\"true\" data-key=\"J\"><strong>J</strong> diseases</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n                <h4>Questions 36–40</h4>\n                <p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n                <ul style=\"list-style-type: none; padding-left: 0; margin-bottom: 1em;\">\n                    <li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p><strong>36</strong> Farmers whose land was poor failed to benefit from modern forms of transport.</p>\n                    <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>37</strong> Between 1830 and 1960 there were positive effects associated with changing patterns of agriculture in France.</p>\n                    <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>38</strong> A fairer distribution of the world's water resources is needed.</p>\n                    <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>39</strong> Living in the countryside does less harm to the environment than living in a city.</p>\n                    <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>40</strong> It is possible that modern developments in transportation have had a beneficial impact on the world.</p>\n                    <div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n                        <label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<ul style=\"list-style-type: none; padding-left: 0; margin-bottom: 1em;\">\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>36</strong> Farmers whose land was poor failed to benefit from modern forms of transport.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> Between 1830 and 1960 there were positive effects associated with changing patterns of agriculture in France.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> A fairer distribution of the world's water resources is needed.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> Living in the countryside does less harm to the environment than living in a city.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> It is possible that modern developments in transportation have had a beneficial impact on the world.</p>\n<div class=\"radio-options\" style=\"flex-direction: row; gap: 16px;\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -11,7 +11,7 @@
       {
         "blockId": "passage-main",
         "kind": "text",
-        "bodyHtml": "<h2>READING PASSAGE 3</h2>\n      <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n      <h3>Risk taking</h3>\n      <p><strong>A</strong> We run risks. Most of the time we ignore them; sometimes we stop and decide how to deal with them. That's life. Risks arise in sports, in business, in personal relationships; they are present in the laboratory, in political calculations, everywhere. Acting individually, we often prefer to gain some benefit by accepting some danger. Acting collectively, we make similar trade-offs.</p>\n      <p><strong>B</strong> When society must assess risks, and those risks can be clarified, at least in part, by science, technology or mathematics, the responsibility of the research community is to be clear and complete. But that is not always so easy. Furthermore, too few people pay full attention to the best evidence, much less modify their behaviors as a result. Even when the evidence of high risk is clear - about smoking, for instance - many will deny the risk, or dispute it, or accept that it exists and still go ahead. As a former cigarette smoker, I understand denial.</p>\n      <p><strong>C</strong> Perhaps more important than the basic facts of risk are the varied perception of it. Hearing the prediction of 60% chance of rain, or recognizing the minuscule likelihood of becoming ill from a flu shot, most people understand the right responses: take your umbrella and get your flu shot. But some, fearfully but irrationally, go to the extreme and stay at home and avoid all contact with other people. Irrational decisions occasionally affect us all. When it comes to risks the best odds do not always influence people to make the correct decision.</p>\n      <p><strong>D</strong> In her book, The Universe and the Teacup, the science writer K. C. Cole reminds us that the risks of losing something and gaining something appear to be calculated in our minds according to quite different scales. People will risk a lot to prevent a loss, she notes; some people will rush into a burning building to save a pet. But they will usually risk very little if the only perceived outcome is a possible gain; many people won't even risk pursuing an exciting job, if the current job, though unfulfilling, remains comfortable. That psychological mechanism, a desire to maintain the status quo, helps explain the high hurdles that any rational risk assessment must confront.</p>\n      <p><strong>E</strong> Organizations face the same hurdles whenever they must cope with major shifts in policy. In his classic examination of the character of high-tech industry, Only the Paranoid Survive, Andrew S. Grove gives a perceptive account of a crisis that took place during his tenure as Chairman of the Intel Corporation. The business environment for Intel and its competitors was transformed by a flood of low-cost memory chips from Japan, and Intel made the difficult decision to abandon its chip-making business. Such a period of change in the outside world is filled with danger, Grove notes, precisely because it is so easy for executives to try to disregard it or misinterpret the mounting evidence showing the profound risks of not making change at the very core. The distinction Cole cites is instructive here: one reason management and staff may not act is that they tend to focus on the potential gains of risking change (which they characterize as small), rather than on the catastrophic losses that risking change could prevent. The period becomes critical for a company, according to Grove, and deadly when unattended to.</p>\n      <p><strong>F</strong> Likewise, at the national level, and even the global one, institutions tend to be more willing to take a risk if it means avoiding a loss, than they are if it might confer a gain. Almost everyone, for instance, sees the signs of ecological decay. Reid J. Lifest's article, 'Full Accounting', describes newly developed techniques for clarifying which critical decision would have the highest pay-offs for the environment. Once these 'leverage points' as he calls them, are located, many environmental organizations will be willing to risk the resources needed to prevent further deterioration.</p>\n      <p><strong>G</strong> More complicated are decisions by nations to invest broadly in educational research. Some governmental leaders are oblivious to the risks posed by social underinvestment, because the urgent needs of the present take precedence over actions that would give rise to even more substantial gains in the future. Their attitude is that today's risks must be manageable, and that tomorrow's gains are at the very least difficult to measure. Better consideration and decision making for what lies ahead is essential.</p>\n      <p><strong>H</strong> Nevertheless, I confess to being an optimist. My glass is generally half full - though that may not help me handle risk. Whether one's temperament is optimistic or pessimistic, everyone in our scientific and engineering community has a social responsibility: measure with care and portray with honesty the level of risk involved in any action or decision.</p>\n      <p>&nbsp;</p><p>&nbsp;</p>"
+        "bodyHtml": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Risk taking</h3>\n<p><strong>A</strong> We run risks. Most of the time we ignore them; sometimes we stop and decide how to deal with them. That's life. Risks arise in sports, in business, in personal relationships; they are present in the laboratory, in political calculations, everywhere. Acting individually, we often prefer to gain some benefit by accepting some danger. Acting collectively, we make similar trade-offs.</p>\n<p><strong>B</strong> When society must assess risks, and those risks can be clarified, at least in part, by science, technology or mathematics, the responsibility of the research community is to be clear and complete. But that is not always so easy. Furthermore, too few people pay full attention to the best evidence, much less modify their behaviors as a result. Even when the evidence of high risk is clear - about smoking, for instance - many will deny the risk, or dispute it, or accept that it exists and still go ahead. As a former cigarette smoker, I understand denial.</p>\n<p><strong>C</strong> Perhaps more important than the basic facts of risk are the varied perception of it. Hearing the prediction of 60% chance of rain, or recognizing the minuscule likelihood of becoming ill from a flu shot, most people understand the right responses: take your umbrella and get your flu shot. But some, fearfully but irrationally, go to the extreme and stay at home and avoid all contact with other people. Irrational decisions occasionally affect us all. When it comes to risks the best odds do not always influence people to make the correct decision.</p>\n<p><strong>D</strong> In her book, The Universe and the Teacup, the science writer K. C. Cole reminds us that the risks of losing something and gaining something appear to be calculated in our minds according to quite different scales. People will risk a lot to prevent a loss, she notes; some people will rush into a burning building to save a pet. But they will usually risk very little if the only perceived outcome is a possible gain; many people won't even risk pursuing an exciting job, if the current job, though unfulfilling, remains comfortable. That psychological mechanism, a desire to maintain the status quo, helps explain the high hurdles that any rational risk assessment must confront.</p>\n<p><strong>E</strong> Organizations face the same hurdles whenever they must cope with major shifts in policy. In his classic examination of the character of high-tech industry, Only the Paranoid Survive, Andrew S. Grove gives a perceptive account of a crisis that took place during his tenure as Chairman of the Intel Corporation. The business environment for Intel and its competitors was transformed by a flood of low-cost memory chips from Japan, and Intel made the difficult decision to abandon its chip-making business. Such a period of change in the outside world is filled with danger, Grove notes, precisely because it is so easy for executives to try to disregard it or misinterpret the mounting evidence showing the profound risks of not making change at the very core. The distinction Cole cites is instructive here: one reason management and staff may not act is that they tend to focus on the potential gains of risking change (which they characterize as small), rather than on the catastrophic losses that risking change could prevent. The period becomes critical for a company, according to Grove, and deadly when unattended to.</p>\n<p><strong>F</strong> Likewise, at the national level, and even the global one, institutions tend to be more willing to take a risk if it means avoiding a loss, than they are if it might confer a gain. Almost everyone, for instance, sees the signs of ecological decay. Reid J. Lifest's article, 'Full Accounting', describes newly developed techniques for clarifying which critical decision would have the highest pay-offs for the environment. Once these 'leverage points' as he calls them, are located, many environmental organizations will be willing to risk the resources needed to prevent further deterioration.</p>\n<p><strong>G</strong> More complicated are decisions by nations to invest broadly in educational research. Some governmental leaders are oblivious to the risks posed by social underinvestment, because the urgent needs of the present take precedence over actions that would give rise to even more substantial gains in the future. Their attitude is that today's risks must be manageable, and that tomorrow's gains are at the very least difficult to measure. Better consideration and decision making for what lies ahead is essential.</p>\n<p><strong>H</strong> Nevertheless, I confess to being an optimist. My glass is generally half full - though that may not help me handle risk. Whether one's temperament is optimistic or pessimistic, everyone in our scientific and engineering community has a social responsibility: measure with care and portray with honesty the level of risk involved in any action or decision.</p>\n<p>&nbsp;</p><p>&nbsp;</p>"
       }
     ]
   },
@@ -25,7 +25,7 @@
         "q3",
         "q4"
       ],
-      "bodyHtml": "<div class=\"group\">\n        <h4>Questions 27–30</h4>\n        <p>Complete each sentence with the correct ending, A–G, below.</p>\n        <p>Write the correct letter, A–G, in boxes 27–30 on your answer sheet.</p>\n        <div class=\"option-pool\">\n          <strong>List of endings:</strong>\n          <ul style=\"margin:5px 0 0; padding-left:20px;\">\n            <li>A planning for the future.</li>\n            <li>B predicting their errors.</li>\n            <li>C continuing in the present situation.</li>\n            <li>D recent findings on the most effective solutions to problems.</li>\n            <li>E achieving a gain.</li>\n            <li>F changes occurring externally.</li>\n            <li>G a high level of agreement.</li>\n          </ul>\n        </div>\n\n        <a id=\"q1-anchor\"></a>\n        <div style=\"padding:8px 0; border-top:1px dashed var(--line);\">\n          <p>27. K. C. Cole points out that avoiding a loss seems more important to people than ______.</p>\n          <div class=\"match-option\" style=\"gap:6px;\">\n            <label><input type=\"radio\" name=\"q1\" value=\"A\"> A</label>\n            <label><input type=\"radio\" name=\"q1\" value=\"B\"> B</label>\n            <label><input type=\"radio\" name=\"q1\" value=\"C\"> C</label>\n            <label><input type=\"radio\" name=\"q1\" value=\"D\"> D</label>\n            <label><input type=\"radio\" name=\"q1\" value=\"E\"> E</label>\n            <label><input type=\"radio\" name=\"q1\" value=\"F\"> F</label>\n            <label><input type=\"radio\" name=\"q1\" value=\"G\"> G</label>\n          </div>\n        </div>\n        <a id=\"q2-anchor\"></a>\n        <div style=\"padding:8px 0; border-top:1px dashed var(--line);\">\n          <p>28. According to Andrew S. Grove, it can be very dangerous for companies to ignore ______.</p>\n          <div class=\"match-option\" style=\"gap:6px;\">\n            <label><input type=\"radio\" name=\"q2\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q2\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q2\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q2\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q2\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q2\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q2\" value=\"G\"> G</label>\n          </div>\n        </div>\n        <a id=\"q3-anchor\"></a>\n        <div style=\"padding:8px 0; border-top:1px dashed var(--line);\">\n          <p>29. Reid J. Lifset argues that environmental agencies can benefit from ______.</p>\n          <div class=\"match-option\" style=\"gap:6px;\">\n            <label><input type=\"radio\" name=\"q3\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q3\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q3\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q3\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q3\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q3\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q3\" value=\"G\"> G</label>\n          </div>\n        </div>\n        <a id=\"q4-anchor\"></a>\n        <div style=\"padding:8px 0; border-top:1px dashed var(--line);\">\n          <p>30. The writer suggests that government leaders need to focus more on ______.</p>\n          <div class=\"match-option\" style=\"gap:6px;\">\n            <label><input type=\"radio\" name=\"q4\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q4\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q4\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q4\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q4\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q4\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q4\" value=\"G\"> G</label>\n          </div>\n        </div>\n      </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 27–30</h4>\n<p>Complete each sentence with the correct ending, A–G, below.</p>\n<p>Write the correct letter, A–G, in boxes 27–30 on your answer sheet.</p>\n<div class=\"option-pool\">\n<strong>List of endings:</strong>\n<ul style=\"margin:5px 0 0; padding-left:20px;\">\n<li>A planning for the future.</li>\n<li>B predicting their errors.</li>\n<li>C continuing in the present situation.</li>\n<li>D recent findings on the most effective solutions to problems.</li>\n<li>E achieving a gain.</li>\n<li>F changes occurring externally.</li>\n<li>G a high level of agreement.</li>\n</ul>\n</div>\n<a id=\"q1-anchor\"></a>\n<div style=\"padding:8px 0; border-top:1px dashed var(--line);\">\n<p>27. K. C. Cole points out that avoiding a loss seems more important to people than ______.</p>\n<div class=\"match-option\" style=\"gap:6px;\">\n<label><input type=\"radio\" name=\"q1\" value=\"A\"> A</label> <label><input type=\"radio\" name=\"q1\" value=\"B\"> B</label> <label><input type=\"radio\" name=\"q1\" value=\"C\"> C</label> <label><input type=\"radio\" name=\"q1\" value=\"D\"> D</label> <label><input type=\"radio\" name=\"q1\" value=\"E\"> E</label> <label><input type=\"radio\" name=\"q1\" value=\"F\"> F</label> <label><input type=\"radio\" name=\"q1\" value=\"G\"> G</label>\n</div>\n</div>\n<a id=\"q2-anchor\"></a>\n<div style=\"padding:8px 0; border-top:1px dashed var(--line);\">\n<p>28. According to Andrew S. Grove, it can be very dangerous for companies to ignore ______.</p>\n<div class=\"match-option\" style=\"gap:6px;\">\n<label><input type=\"radio\" name=\"q2\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q2\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q2\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q2\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q2\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q2\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q2\" value=\"G\"> G</label>\n</div>\n</div>\n<a id=\"q3-anchor\"></a>\n<div style=\"padding:8px 0; border-top:1px dashed var(--line);\">\n<p>29. Reid J. Lifset argues that environmental agencies can benefit from ______.</p>\n<div class=\"match-option\" style=\"gap:6px;\">\n<label><input type=\"radio\" name=\"q3\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q3\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q3\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q3\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q3\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q3\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q3\" value=\"G\"> G</label>\n</div>\n</div>\n<a id=\"q4-anchor\"></a>\n<div style=\"padding:8px 0; border-top:1px dashed var(--line);\">\n<p>30. The writer suggests that government leaders need to focus more on ______.</p>\n<div class=\"match-option\" style=\"gap:6px;\">\n<label><input type=\"radio\" name=\"q4\" value=\"A\"> A</label><label><input type=\"radio\" name=\"q4\" value=\"B\"> B</label><label><input type=\"radio\" name=\"q4\" value=\"C\"> C</label><label><input type=\"radio\" name=\"q4\" value=\"D\"> D</label><label><input type=\"radio\" name=\"q4\" value=\"E\"> E</label><label><input type=\"radio\" name=\"q4\" value=\"F\"> F</label><label><input type=\"radio\" name=\"q4\" value=\"G\"> G</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -41,7 +41,7 @@
         "q12",
         "q13"
       ],
-      "bodyHtml": "<div class=\"group\">\n        <h4>Questions 31–39</h4>\n        <p>The reading passage has eight paragraphs, <strong>A–H</strong>.</p>\n        <p>Which paragraph contains the following information?</p>\n        <p>Write the correct letter, <strong>A–H</strong>, in boxes 31–39 on your answer sheet.</p>\n        <p><em>NB You may use any letter more than once.</em></p>\n\n        <a id=\"q5-anchor\"></a><div style=\"padding:6px 0;\"><span class=\"question-number\">31.</span> the areas of study that help us understand risk\n          <div class=\"match-option\"><label>A<input type=\"radio\" name=\"q5\" value=\"A\"></label><label>B<input type=\"radio\" name=\"q5\" value=\"B\"></label><label>C<input type=\"radio\" name=\"q5\" value=\"C\"></label><label>D<input type=\"radio\" name=\"q5\" value=\"D\"></label><label>E<input type=\"radio\" name=\"q5\" value=\"E\"></label><label>F<input type=\"radio\" name=\"q5\" value=\"F\"></label><label>G<input type=\"radio\" name=\"q5\" value=\"G\"></label><label>H<input type=\"radio\" name=\"q5\" value=\"H\"></label></div>\n        </div>\n        <a id=\"q6-anchor\"></a><div style=\"padding:6px 0;\"><span class=\"question-number\">32.</span> reference to key actions that might benefit the world\n          <div class=\"match-option\"><label>A<input type=\"radio\" name=\"q6\" value=\"A\"></label><label>B<input type=\"radio\" name=\"q6\" value=\"B\"></label><label>C<input type=\"radio\" name=\"q6\" value=\"C\"></label><label>D<input type=\"radio\" name=\"q6\" value=\"D\"></label><label>E<input type=\"radio\" name=\"q6\" value=\"E\"></label><label>F<input type=\"radio\" name=\"q6\" value=\"F\"></label><label>G<input type=\"radio\" name=\"q6\" value=\"G\"></label><label>H<input type=\"radio\" name=\"q6\" value=\"H\"></label></div>\n        </div>\n        <a id=\"q7-anchor\"></a><div style=\"padding:6px 0;\"><span class=\"question-number\">33.</span> examples of statistical predictions that the majority of the public react to in the same way\n          <div class=\"match-option\"><label>A<input type=\"radio\" name=\"q7\" value=\"A\"></label><label>B<input type=\"radio\" name=\"q7\" value=\"B\"></label><label>C<input type=\"radio\" name=\"q7\" value=\"C\"></label><label>D<input type=\"radio\" name=\"q7\" value=\"D\"></label><label>E<input type=\"radio\" name=\"q7\" value=\"E\"></label><label>F<input type=\"radio\" name=\"q7\" value=\"F\"></label><label>G<input type=\"radio\" name=\"q7\" value=\"G\"></label><label>H<input type=\"radio\" name=\"q7\" value=\"H\"></label></div>\n        </div>\n        <a id=\"q8-anchor\"></a><div style=\"padding:6px 0;\"><span class=\"question-number\">34.</span> the variety of contexts in which risk occurs\n          <div class=\"match-option\"><label>A<input type=\"radio\" name=\"q8\" value=\"A\"></label><label>B<input type=\"radio\" name=\"q8\" value=\"B\"></label><label>C<input type=\"radio\" name=\"q8\" value=\"C\"></label><label>D<input type=\"radio\" name=\"q8\" value=\"D\"></label><label>E<input type=\"radio\" name=\"q8\" value=\"E\"></label><label>F<input type=\"radio\" name=\"q8\" value=\"F\"></label><label>G<input type=\"radio\" name=\"q8\" value=\"G\"></label><label>H<input type=\"radio\" name=\"q8\" value=\"H\"></label></div>\n        </div>\n        <a id=\"q9-anchor\"></a><div style=\"padding:6px 0;\"><span class=\"question-number\">35.</span> mention of a habit that has been proved to be very risky\n          <div class=\"match-option\"><label>A<input type=\"radio\" name=\"q9\" value=\"A\"></label><label>B<input type=\"radio\" name=\"q9\" value=\"B\"></label><label>C<input type=\"radio\" name=\"q9\" value=\"C\"></label><label>D<input type=\"radio\" name=\"q9\" value=\"D\"></label><label>E<input type=\"radio\" name=\"q9\" value=\"E\"></label><label>F<input type=\"radio\" name=\"q9\" value=\"F\"></label><label>G<input type=\"radio\" name=\"q9\" value=\"G\"></label><label>H<input type=\"radio\" name=\"q9\" value=\"H\"></label></div>\n        </div>\n        <a id=\"q10-anchor\"></a><div style=\"padding:6px 0;\"><span class=\"question-number\">36.</span> reference to market forces motivating change\n          <div class=\"match-option\"><label>A<input type=\"radio\" name=\"q10\" value=\"A\"></label><label>B<input type=\"radio\" name=\"q10\" value=\"B\"></label><label>C<input type=\"radio\" name=\"q10\" value=\"C\"></label><label>D<input type=\"radio\" name=\"q10\" value=\"D\"></label><label>E<input type=\"radio\" name=\"q10\" value=\"E\"></label><label>F<input type=\"radio\" name=\"q10\" value=\"F\"></label><label>G<input type=\"radio\" name=\"q10\" value=\"G\"></label><label>H<input type=\"radio\" name=\"q10\" value=\"H\"></label></div>\n        </div>\n        <a id=\"q11-anchor\"></a><div style=\"padding:6px 0;\"><span class=\"question-number\">37.</span> the writer's current attitude towards risk\n          <div class=\"match-option\"><label>A<input type=\"radio\" name=\"q11\" value=\"A\"></label><label>B<input type=\"radio\" name=\"q11\" value=\"B\"></label><label>C<input type=\"radio\" name=\"q11\" value=\"C\"></label><label>D<input type=\"radio\" name=\"q11\" value=\"D\"></label><label>E<input type=\"radio\" name=\"q11\" value=\"E\"></label><label>F<input type=\"radio\" name=\"q11\" value=\"F\"></label><label>G<input type=\"radio\" name=\"q11\" value=\"G\"></label><label>H<input type=\"radio\" name=\"q11\" value=\"H\"></label></div>\n        </div>\n        <a id=\"q12-anchor\"></a><div style=\"padding:6px 0;\"><span class=\"question-number\">38.</span> a reason why some individuals avoid making a career change\n          <div class=\"match-option\"><label>A<input type=\"radio\" name=\"q12\" value=\"A\"></label><label>B<input type=\"radio\" name=\"q12\" value=\"B\"></label><label>C<input type=\"radio\" name=\"q12\" value=\"C\"></label><label>D<input type=\"radio\" name=\"q12\" value=\"D\"></label><label>E<input type=\"radio\" name=\"q12\" value=\"E\"></label><label>F<input type=\"radio\" name=\"q12\" value=\"F\"></label><label>G<input type=\"radio\" name=\"q12\" value=\"G\"></label><label>H<input type=\"radio\" name=\"q12\" value=\"H\"></label></div>\n        </div>\n        <a id=\"q13-anchor\"></a><div style=\"padding:6px 0;\"><span class=\"question-number\">39.</span> how some people over-react to information about risk\n          <div class=\"match-option\"><label>A<input type=\"radio\" name=\"q13\" value=\"A\"></label><label>B<input type=\"radio\" name=\"q13\" value=\"B\"></label><label>C<input type=\"radio\" name=\"q13\" value=\"C\"></label><label>D<input type=\"radio\" name=\"q13\" value=\"D\"></label><label>E<input type=\"radio\" name=\"q13\" value=\"E\"></label><label>F<input type=\"radio\" name=\"q13\" value=\"F\"></label><label>G<input type=\"radio\" name=\"q13\" value=\"G\"></label><label>H<input type=\"radio\" name=\"q13\" value=\"H\"></label></div>\n        </div>\n      </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Questions 31–39</h4>\n<p>The reading passage has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p>Write the correct letter, <strong>A–H</strong>, in boxes 31–39 on your answer sheet.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<a id=\"q5-anchor\"></a><div style=\"padding:6px 0;\"><span class=\"question-number\">31.</span> the areas of study that help us understand risk\n<div class=\"match-option\"><label>A<input type=\"radio\" name=\"q5\" value=\"A\"></label><label>B<input type=\"radio\" name=\"q5\" value=\"B\"></label><label>C<input type=\"radio\" name=\"q5\" value=\"C\"></label><label>D<input type=\"radio\" name=\"q5\" value=\"D\"></label><label>E<input type=\"radio\" name=\"q5\" value=\"E\"></label><label>F<input type=\"radio\" name=\"q5\" value=\"F\"></label><label>G<input type=\"radio\" name=\"q5\" value=\"G\"></label><label>H<input type=\"radio\" name=\"q5\" value=\"H\"></label></div>\n</div>\n<a id=\"q6-anchor\"></a><div style=\"padding:6px 0;\"><span class=\"question-number\">32.</span> reference to key actions that might benefit the world\n<div class=\"match-option\"><label>A<input type=\"radio\" name=\"q6\" value=\"A\"></label><label>B<input type=\"radio\" name=\"q6\" value=\"B\"></label><label>C<input type=\"radio\" name=\"q6\" value=\"C\"></label><label>D<input type=\"radio\" name=\"q6\" value=\"D\"></label><label>E<input type=\"radio\" name=\"q6\" value=\"E\"></label><label>F<input type=\"radio\" name=\"q6\" value=\"F\"></label><label>G<input type=\"radio\" name=\"q6\" value=\"G\"></label><label>H<input type=\"radio\" name=\"q6\" value=\"H\"></label></div>\n</div>\n<a id=\"q7-anchor\"></a><div style=\"padding:6px 0;\"><span class=\"question-number\">33.</span> examples of statistical predictions that the majority of the public react to in the same way\n<div class=\"match-option\"><label>A<input type=\"radio\" name=\"q7\" value=\"A\"></label><label>B<input type=\"radio\" name=\"q7\" value=\"B\"></label><label>C<input type=\"radio\" name=\"q7\" value=\"C\"></label><label>D<input type=\"radio\" name=\"q7\" value=\"D\"></label><label>E<input type=\"radio\" name=\"q7\" value=\"E\"></label><label>F<input type=\"radio\" name=\"q7\" value=\"F\"></label><label>G<input type=\"radio\" name=\"q7\" value=\"G\"></label><label>H<input type=\"radio\" name=\"q7\" value=\"H\"></label></div>\n</div>\n<a id=\"q8-anchor\"></a><div style=\"padding:6px 0;\"><span class=\"question-number\">34.</span> the variety of contexts in which risk occurs\n<div class=\"match-option\"><label>A<input type=\"radio\" name=\"q8\" value=\"A\"></label><label>B<input type=\"radio\" name=\"q8\" value=\"B\"></label><label>C<input type=\"radio\" name=\"q8\" value=\"C\"></label><label>D<input type=\"radio\" name=\"q8\" value=\"D\"></label><label>E<input type=\"radio\" name=\"q8\" value=\"E\"></label><label>F<input type=\"radio\" name=\"q8\" value=\"F\"></label><label>G<input type=\"radio\" name=\"q8\" value=\"G\"></label><label>H<input type=\"radio\" name=\"q8\" value=\"H\"></label></div>\n</div>\n<a id=\"q9-anchor\"></a><div style=\"padding:6px 0;\"><span class=\"question-number\">35.</span> mention of a habit that has been proved to be very risky\n<div class=\"match-option\"><label>A<input type=\"radio\" name=\"q9\" value=\"A\"></label><label>B<input type=\"radio\" name=\"q9\" value=\"B\"></label><label>C<input type=\"radio\" name=\"q9\" value=\"C\"></label><label>D<input type=\"radio\" name=\"q9\" value=\"D\"></label><label>E<input type=\"radio\" name=\"q9\" value=\"E\"></label><label>F<input type=\"radio\" name=\"q9\" value=\"F\"></label><label>G<input type=\"radio\" name=\"q9\" value=\"G\"></label><label>H<input type=\"radio\" name=\"q9\" value=\"H\"></label></div>\n</div>\n<a id=\"q10-anchor\"></a><div style=\"padding:6px 0;\"><span class=\"question-number\">36.</span> reference to market forces motivating change\n<div class=\"match-option\"><label>A<input type=\"radio\" name=\"q10\" value=\"A\"></label><label>B<input type=\"radio\" name=\"q10\" value=\"B\"></label><label>C<input type=\"radio\" name=\"q10\" value=\"C\"></label><label>D<input type=\"radio\" name=\"q10\" value=\"D\"></label><label>E<input type=\"radio\" name=\"q10\" value=\"E\"></label><label>F<input type=\"radio\" name=\"q10\" value=\"F\"></label><label>G<input type=\"radio\" name=\"q10\" value=\"G\"></label><label>H<input type=\"radio\" name=\"q10\" value=\"H\"></label></div>\n</div>\n<a id=\"q11-anchor\"></a><div style=\"padding:6px 0;\"><span class=\"question-number\">37.</span> the writer's current attitude towards risk\n<div class=\"match-option\"><label>A<input type=\"radio\" name=\"q11\" value=\"A\"></label><label>B<input type=\"radio\" name=\"q11\" value=\"B\"></label><label>C<input type=\"radio\" name=\"q11\" value=\"C\"></label><label>D<input type=\"radio\" name=\"q11\" value=\"D\"></label><label>E<input type=\"radio\" name=\"q11\" value=\"E\"></label><label>F<input type=\"radio\" name=\"q11\" value=\"F\"></label><label>G<input type=\"radio\" name=\"q11\" value=\"G\"></label><label>H<input type=\"radio\" name=\"q11\" value=\"H\"></label></div>\n</div>\n<a id=\"q12-anchor\"></a><div style=\"padding:6px 0;\"><span class=\"question-number\">38.</span> a reason why some individuals avoid making a career change\n<div class=\"match-option\"><label>A<input type=\"radio\" name=\"q12\" value=\"A\"></label><label>B<input type=\"radio\" name=\"q12\" value=\"B\"></label><label>C<input type=\"radio\" name=\"q12\" value=\"C\"></label><label>D<input type=\"radio\" name=\"q12\" value=\"D\"></label><label>E<input type=\"radio\" name=\"q12\" value=\"E\"></label><label>F<input type=\"radio\" name=\"q12\" value=\"F\"></label><label>G<input type=\"radio\" name=\"q12\" value=\"G\"></label><label>H<input type=\"radio\" name=\"q12\" value=\"H\"></label></div>\n</div>\n<a id=\"q13-anchor\"></a><div style=\"padding:6px 0;\"><span class=\"question-number\">39.</span> how some people over-react to information about risk\n<div class=\"match-option\"><label>A<input type=\"radio\" name=\"q13\" value=\"A\"></label><label>B<input type=\"radio\" name=\"q13\" value=\"B\"></label><label>C<input type=\"radio\" name=\"q13\" value=\"C\"></label><label>D<input type=\"radio\" name=\"q13\" value=\"D\"></label><label>E<input type=\"radio\" name=\"q13\" value=\"E\"></label><label>F<input type=\"radio\" name=\"q13\" value=\"F\"></label><label>G<input type=\"radio\" name=\"q13\" value=\"G\"></label><label>H<input type=\"radio\" name=\"q13\" value=\"H\"></label></div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -49,7 +49,7 @@
       "questionIds": [
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\">\n        <h4>Question 40</h4>\n        <p>Choose the correct letter, A, B, C or D.</p>\n        <a id=\"q14-anchor\"></a>\n        <div><p>40. At the end of the passage the writer concludes that</p>\n          <div class=\"mcq-options\">\n            <div class=\"mcq-option\"><label><input type=\"radio\" name=\"q14\" value=\"A\"> A. risk is something we must try to avoid.</label></div>\n            <div class=\"mcq-option\"><label><input type=\"radio\" name=\"q14\" value=\"B\"> B. experts should be truthful about risk to the public.</label></div>\n            <div class=\"mcq-option\"><label><input type=\"radio\" name=\"q14\" value=\"C\"> C. optimists are better able to deal with risk than pessimists.</label></div>\n            <div class=\"mcq-option\"><label><input type=\"radio\" name=\"q14\" value=\"D\"> D. it is important to take risks in order to fulfil social obligations.</label></div>\n          </div>\n        </div>\n      </div>"
+      "bodyHtml": "<div class=\"group\">\n<h4>Question 40</h4>\n<p>Choose the correct letter, A, B, C or D.</p>\n<a id=\"q14-anchor\"></a>\n<div><p>40. At the end of the passage the writer concludes that</p>\n<div class=\"mcq-options\">\n<div class=\"mcq-option\"><label><input type=\"radio\" name=\"q14\" value=\"A\"> A. risk is something we must try to avoid.</label></div>\n<div class=\"mcq-option\"><label><input type=\"radio\" name=\"q14\" value=\"B\"> B. experts should be truthful about risk to the public.</label></div>\n<div class=\"mcq-option\"><label><input type=\"radio\" name=\"q14\" value=\"C\"> C. optimists are better able to deal with risk than pessimists.</label></div>\n<div class=\"mcq-option\"><label><input type=\"radio\" name=\"q14\" value=\"D\"> D. it is important to take risks in order to fulfil social obligations.</label></div>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
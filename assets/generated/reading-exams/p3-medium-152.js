@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>Charles Darwin, the brilliant anthropologist and creator of the theory of evolution, is not normally associated with the modern business world. Nevertheless, Darwinian evolutionary theory is the foundation of a new wave of ideas about human behaviour in general and particularly the way people behave in the workplace; these ideas have given the title of 'evolutionary psychology'. Evolutionary psychology revolves around the notion that our brains, like our bodies, have an inherited evolutionary design that has scarcely changed for 10,000 years. As respected evolutionary psychology experts Leda Cosmides and John Tooby comment, ‘our modern skulls house a Stone Age mind'. The US biologist Edward O. Wilson sees evolutionary psychology as being a discipline which is based on both sociobiology, which is the study of the biological basis of social behaviour, and psychology, which is the systematic study of human behaviour.</p>\n            <p>Nigel Nicholson, an organisational psychologist from the London Business School, is a strong supporter of evolutionary psychology and on this subject has published Managing the Human Animal. His book takes the reader on a journey from the Stone Age plains of the savannah to the modern office, and includes a discussion of Darwinism and behavioural psychology, together with a dissection of dysfunctional organisational behaviour. It is an effective approach explaining why people behave as they do, particularly at work. Evolutionary psychology is increasingly being cited in management circles, where managers are trying to understand puzzling aspects of human behaviour and, by doing so, improve the workplace. Nicholson believes that evolutionary psychology can help managers understand what goes wrong in organisational life and what they can do about it.</p>\n            <p>Nicholson maintains that evolutionary psychology dismisses the long-held assumption that our minds are like blank pages just waiting for culture and experience to write on them and shape our nature. He points out that sophisticated research shows the brain actually houses a store of knowledge when we are born, and now genetic research is establishing there are certain genes that account for abilities, tastes and tendencies. The stored knowledge in the human brain has not changed much since the Stone Age. As Tooby and Cosmides stress, there have not been enough generations for a brain that is well-adapted to our post-industrial life to evolve through natural selection.</p>\n            <p>The evolutionary psychology version of human nature revolves around some key elements which we have inherited from our hunter-gatherer minds. One key element is emotion. Emotion was originally essential to keep early man alive and safe from predators. Emotion was, and continues to be, our radar, guiding us throughout today's techno-defined business world. Despite this, the business world emphasises rational, not emotional, behaviour, and does not admit the importance of emotion. We still use the emotional part of our minds to make sense of other people's behaviour and to create an impression, so we can often be taken in by appearances. This mental predisposition actually works best in small communities (the tribe), not in much larger environments filled with people we barely know (the modern workplace). Our minds naturally try to re-create our ancestral communities with networks of no more than 150 people, where there are clear hierarchies and leaders. As a consequence, it takes very little to trigger people's innate distrust of others because our safety in antiquity depended on supporting our near family and friends, whom we valued more than other people.</p>\n            <p>So what advice does Nicholson have for the corporate world? He thinks that by knowing the reasons for people's behaviour it is possible to mould corporate environments into places that have more chance of working efficiently and being pleasant places to work in. Nicholson admits that not everybody in the business world agrees with his belief in the effectiveness of evolutionary psychology in the workplace. One group that resists the theory of evolutionary psychology is young MBA graduates who are just beginning their careers and feel that evolutionary psychology will make their lives at work more difficult. Older and wiser executives point out that they still tend to cling to the idea of a magic formula to bring people into line with corporate strategy. But that is back-to-front thinking, according to Nicholson, who contends that we should be reinventing our business structures, not our fundamental human nature.</p>\n            <p>At the end of his book, Nicholson gives his forecast of what will and will not change in the business world. He believes that most people will still prefer more traditional forms of work and throughout their lives will continue to aim at lifelong status advancement. He also maintains that the line between work and home will be less defined, but that people will prefer traditional working patterns if working from home leaves them isolated from their work community. He doubts that the high-tech ideas of virtual companies will ever be very successful because people will still want to meet each other face-to-face. Nicholson describes his ideal organisation in the future: it would be decentralised, with small sub-units; the staff would be from diverse backgrounds and be allowed a high degree of self-determination. New endeavours and creativity would replace systems and rationality. Nicholson acknowledges that there is a long way to go in terms of the translation of his ideas of evolutionary psychology into practical propositions, but he is confident more and more people will come round to his way of thinking.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>Charles Darwin, the brilliant anthropologist and creator of the theory of evolution, is not normally associated with the modern business world. Nevertheless, Darwinian evolutionary theory is the foundation of a new wave of ideas about human behaviour in general and particularly the way people behave in the workplace; these ideas have given the title of 'evolutionary psychology'. Evolutionary psychology revolves around the notion that our brains, like our bodies, have an inherited evolutionary design that has scarcely changed for 10,000 years. As respected evolutionary psychology experts Leda Cosmides and John Tooby comment, ‘our modern skulls house a Stone Age mind'. The US biologist Edward O. Wilson sees evolutionary psychology as being a discipline which is based on both sociobiology, which is the study of the biological basis of social behaviour, and psychology, which is the systematic study of human behaviour.</p>\n<p>Nigel Nicholson, an organisational psychologist from the London Business School, is a strong supporter of evolutionary psychology and on this subject has published Managing the Human Animal. His book takes the reader on a journey from the Stone Age plains of the savannah to the modern office, and includes a discussion of Darwinism and behavioural psychology, together with a dissection of dysfunctional organisational behaviour. It is an effective approach explaining why people behave as they do, particularly at work. Evolutionary psychology is increasingly being cited in management circles, where managers are trying to understand puzzling aspects of human behaviour and, by doing so, improve the workplace. Nicholson believes that evolutionary psychology can help managers understand what goes wrong in organisational life and what they can do about it.</p>\n<p>Nicholson maintains that evolutionary psychology dismisses the long-held assumption that our minds are like blank pages just waiting for culture and experience to write on them and shape our nature. He points out that sophisticated research shows the brain actually houses a store of knowledge when we are born, and now genetic research is establishing there are certain genes that account for abilities, tastes and tendencies. The stored knowledge in the human brain has not changed much since the Stone Age. As Tooby and Cosmides stress, there have not been enough generations for a brain that is well-adapted to our post-industrial life to evolve through natural selection.</p>\n<p>The evolutionary psychology version of human nature revolves around some key elements which we have inherited from our hunter-gatherer minds. One key element is emotion. Emotion was originally essential to keep early man alive and safe from predators. Emotion was, and continues to be, our radar, guiding us throughout today's techno-defined business world. Despite this, the business world emphasises rational, not emotional, behaviour, and does not admit the importance of emotion. We still use the emotional part of our minds to make sense of other people's behaviour and to create an impression, so we can often be taken in by appearances. This mental predisposition actually works best in small communities (the tribe), not in much larger environments filled with people we barely know (the modern workplace). Our minds naturally try to re-create our ancestral communities with networks of no more than 150 people, where there are clear hierarchies and leaders. As a consequence, it takes very little to trigger people's innate distrust of others because our safety in antiquity depended on supporting our near family and friends, whom we valued more than other people.</p>\n<p>So what advice does Nicholson have for the corporate world? He thinks that by knowing the reasons for people's behaviour it is possible to mould corporate environments into places that have more chance of working efficiently and being pleasant places to work in. Nicholson admits that not everybody in the business world agrees with his belief in the effectiveness of evolutionary psychology in the workplace. One group that resists the theory of evolutionary psychology is young MBA graduates who are just beginning their careers and feel that evolutionary psychology will make their lives at work more difficult. Older and wiser executives point out that they still tend to cling to the idea of a magic formula to bring people into line with corporate strategy. But that is back-to-front thinking, according to Nicholson, who contends that we should be reinventing our business structures, not our fundamental human nature.</p>\n<p>At the end of his book, Nicholson gives his forecast of what will and will not change in the business world. He believes that most people will still prefer more traditional forms of work and throughout their lives will continue to aim at lifelong status advancement. He also maintains that the line between work and home will be less defined, but that people will prefer traditional working patterns if working from home leaves them isolated from their work community. He doubts that the high-tech ideas of virtual companies will ever be very successful because people will still want to meet each other face-to-face. Nicholson describes his ideal organisation in the future: it would be decentralised, with small sub-units; the staff would be from diverse backgrounds and be allowed a high degree of self-determination. New endeavours and creativity would replace systems and rationality. Nicholson acknowledges that there is a long way to go in terms of the translation of his ideas of evolutionary psychology into practical propositions, but he is confident more and more people will come round to his way of thinking.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 27–31</h4>\n                <p>Choose the correct letter, A, B, C or D.</p>\n                \n                <div class=\"question-item\">\n                    <p class=\"question-text\"><strong>27</strong> The writer's purpose in the first paragraph is to</p>\n                    <div class=\"options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"A\"> A oppose the views of Charles Darwin.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"B\"> B compare experts' opinions of Darwin's theory.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"C\"> C explain the theory of evolutionary psychology.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"D\"> D name experts in the field of evolutionary psychology.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p class=\"question-text\"><strong>28</strong> In the third paragraph, which view about evolutionary psychology matches Nicholson's opinion?</p>\n                    <div class=\"options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"A\"> A Our characters determine our career choices.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"B\"> B We begin life without any preconceived notions.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"C\"> C Our interests and skills depend on our environment.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"D\"> D We inherit ideas and characteristics from our ancestors.</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p class=\"question-text\"><strong>29</strong> The writer discusses the key element of emotion in order to</p>\n                    <div class=\"options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"A\"> A criticise primitive survival strategies.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"B\"> B explain attitudes and actions at work.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"C\"> C demonstrate the slowness of evolution.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"D\"> D suggest companies today are poorly structured.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p class=\"question-text\"><strong>30</strong> Which of the following does Nicholson predict will happen in the business world?</p>\n                    <div class=\"options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"A\"> A Companies will remain in city centres.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"B\"> B Promotion will no longer motivate people.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"C\"> C Employees will be less independent than now.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"D\"> D Social interaction will remain important to workers.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p class=\"question-text\"><strong>31</strong> Which of the following is the most suitable title for Reading Passage 3?</p>\n                    <div class=\"options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"A\"> A How successful companies manage change.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"B\"> B Understanding the origins of workplace behaviour.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"C\"> C Darwin's theories rejected by modern management.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"D\"> D Why post-industrial organisations need to evolve more quickly.</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter, A, B, C or D.</p>\n<div class=\"question-item\">\n<p class=\"question-text\"><strong>27</strong> The writer's purpose in the first paragraph is to</p>\n<div class=\"options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A oppose the views of Charles Darwin.</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B compare experts' opinions of Darwin's theory.</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C explain the theory of evolutionary psychology.</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D name experts in the field of evolutionary psychology.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p class=\"question-text\"><strong>28</strong> In the third paragraph, which view about evolutionary psychology matches Nicholson's opinion?</p>\n<div class=\"options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A Our characters determine our career choices.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B We begin life without any preconceived notions.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C Our interests and skills depend on our environment.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D We inherit ideas and characteristics from our ancestors.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p class=\"question-text\"><strong>29</strong> The writer discusses the key element of emotion in order to</p>\n<div class=\"options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A criticise primitive survival strategies.</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B explain attitudes and actions at work.</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C demonstrate the slowness of evolution.</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D suggest companies today are poorly structured.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p class=\"question-text\"><strong>30</strong> Which of the following does Nicholson predict will happen in the business world?</p>\n<div class=\"options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A Companies will remain in city centres.</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B Promotion will no longer motivate people.</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C Employees will be less independent than now.</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D Social interaction will remain important to workers.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p class=\"question-text\"><strong>31</strong> Which of the following is the most suitable title for Reading Passage 3?</p>\n<div class=\"options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"> A How successful companies manage change.</label> <label><input name=\"q5\" type=\"radio\" value=\"B\"> B Understanding the origins of workplace behaviour.</label> <label><input name=\"q5\" type=\"radio\" value=\"C\"> C Darwin's theories rejected by modern management.</label> <label><input name=\"q5\" type=\"radio\" value=\"D\"> D Why post-industrial organisations need to evolve more quickly.</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n                <h4>Questions 32–35</h4>\n                <p>Do the following statements agree with the information given in Reading Passage 3?</p>\n                <p>In boxes 32–35 on your answer sheet, write:</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p class=\"question-text\"><strong>32</strong> Nicholson makes a persuasive argument in his book.</p>\n                    <div class=\"options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p class=\"question-text\"><strong>33</strong> Tooby and Cosmides believe natural selection through the generations has prepared us for modern times.</p>\n                    <div class=\"options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p class=\"question-text\"><strong>34</strong> Our reliance on technology causes emotional problems in the workplace.</p>\n                    <div class=\"options\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p class=\"question-text\"><strong>35</strong> People today are more trusting than they used to be.</p>\n                    <div class=\"options\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Do the following statements agree with the information given in Reading Passage 3?</p>\n<p>In boxes 32–35 on your answer sheet, write:</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p class=\"question-text\"><strong>32</strong> Nicholson makes a persuasive argument in his book.</p>\n<div class=\"options\">\n<label><input name=\"q6\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q6\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p class=\"question-text\"><strong>33</strong> Tooby and Cosmides believe natural selection through the generations has prepared us for modern times.</p>\n<div class=\"options\">\n<label><input name=\"q7\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q7\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p class=\"question-text\"><strong>34</strong> Our reliance on technology causes emotional problems in the workplace.</p>\n<div class=\"options\">\n<label><input name=\"q8\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q8\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p class=\"question-text\"><strong>35</strong> People today are more trusting than they used to be.</p>\n<div class=\"options\">\n<label><input name=\"q9\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q9\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q9\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n                 <h4>Questions 36–40</h4>\n                <p>Complete the summary using the list of words, A–I, below.</p>\n                 <div class=\"summary-text\">\n                    <h5>Nicholson's advice to the corporate world</h5>\n                    <p>\n                    Nicholson believes that if we know why people act the way they do, we can change <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span> so employees will work more efficiently. Nicholson's ideas are unwelcome to <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span>, but some executives are more open to what evolutionary psychology says. However, these executives still believe that there is a <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> that will make employees act according to the company's practices. According to Nicholson, these senior executives are engaging in <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span>, and we should not try to change <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span> but instead we should change our business structures.\n                    </p>\n                </div>\n                 <div id=\"word-options\">\n                    <div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A business leaders</div>\n                    <div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B MBA graduates</div>\n                    <div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C promotion structures</div>\n                    <div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D reward strategy</div>\n                    <div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E magic formula</div>\n                    <div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F strategic planning</div>\n                    <div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G back-to-front thinking</div>\n                    <div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H business environments</div>\n                    <div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I human nature</div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete the summary using the list of words, A–I, below.</p>\n<div class=\"summary-text\">\n<h5>Nicholson's advice to the corporate world</h5>\n<p>\nNicholson believes that if we know why people act the way they do, we can change <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span> so employees will work more efficiently. Nicholson's ideas are unwelcome to <strong>37</strong> <span id=\"q11-target\" class=\"drop-target-summary\" data-question=\"q11\"></span>, but some executives are more open to what evolutionary psychology says. However, these executives still believe that there is a <strong>38</strong> <span id=\"q12-target\" class=\"drop-target-summary\" data-question=\"q12\"></span> that will make employees act according to the company's practices. According to Nicholson, these senior executives are engaging in <strong>39</strong> <span id=\"q13-target\" class=\"drop-target-summary\" data-question=\"q13\"></span>, and we should not try to change <strong>40</strong> <span id=\"q14-target\" class=\"drop-target-summary\" data-question=\"q14\"></span> but instead we should change our business structures.\n</p>\n</div>\n<div id=\"word-options\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A business leaders</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B MBA graduates</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C promotion structures</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D reward strategy</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E magic formula</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F strategic planning</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G back-to-front thinking</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H business environments</div>\n<div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I human nature</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
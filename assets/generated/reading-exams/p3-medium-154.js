@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Decisions, decisions!</h3>\n            <h4>Research explores when we can make a vital decision quickly and when we need to proceed more deliberately</h4>\n            \n            <p>A widely recognised legend tells us that in Gordium (in what is now Turkey) in the fourth century BC an oxcart was roped to a pole with a complex knot. It was said that the first person to untie it would become the king of Asia. Unfortunately, a the knot proved impossible to untie. The story continues that when confronted with this problem, rather than deliberating on how to untie the Gordian knot, Alexander, the famous ruler of the Greeks in the ancient world, simply took out his sword and cut it in two – then went on to conquer Asia. Ever since, the notion of a \"Gordian solution\" has referred to the attractiveness of a simple answer to an otherwise intractable problem.</p>\n            <p>Among researchers in the psychology of decision making, however, such solutions have traditionally held little appeal. In particular, the “conflict model” of decision making proposed by psychologists Irving Janis and Leon Mann in their 1977 book Decision Making argued that a complex decision-making process is essential for guarding individuals and groups from the peril of \"group-think”. Decisions made without thoroughly canvassing, surveying, weighing, examining and re-examining relevant information and options would be sub-optimal and often disastrous. One foreign-affairs decision made by a well-known US political leader in the 1960s is typically held up as an example of the perils of inadequate thought, whereas his successful handling of a later crisis is cited as an example of the advantages of careful deliberation. However, examination of these historical events by Peter Suedfield, a psychologist at the University of British Columbia, and Roderick Kramer, a psychologist at the Stanford Graduate School of Business, found little difference in the two decision-making processes; both crises required and received complex consideration by the political administration, but later only the second one was deemed to be effective.</p>\n            <p>In general, however, organisational and political science offer little evidence that complex decisions fare better than simpler ones. In fact, a growing body of work suggests that in many situations simple “snap” decisions will be routinely superior to more complex ones – an idea that gained widespread public appeal with Malcolm Gladwell's best-selling book Blink (2005).</p>\n            <p>An article by Ap Dijksterhuis of the University of Amsterdam and his colleagues, “On Making the Right Choice: the Deliberation-without-attention Effect”, runs very much in the spirit of Gladwell's influential text. Its core argument is that to be effective, conscious (deliberative) decision making requires cognitive resources. Because increasingly complex decisions place increasing strain on those resources, the quality of our decisions declines as their complexity increases. In short, complex decisions overrun our cognitive powers. On the other hand, unconscious decision making (what the authors refer to as “deliberation without attention”) requires no cognitive resources, so task complexity does not degrade effectiveness. The seemingly counter-intuitive conclusion is that although conscious thought enhances simple decisions, the opposite holds true for more complex decisions.</p>\n            <p>Dijksterhuis reports four simple but elegant studies supporting this argument. In one, participants assessed the quality of four hypothetical cars by considering either four attributes (a simple task) or twelve attributes (a complex task). Among participants who considered four attributes, those who were allowed to engage in undistracted deliberative thought did better at discriminating between the best and worst cars. Those who were distracted and thus unable to deliberate had to rely on their unconscious thinking and did less well. The opposite pattern emerged when people considered twelve criteria. In this case, conscious deliberation led to inferior discrimination and poor decisions.</p>\n            <p>In another study, Dijksterhuis surveyed people shopping for clothes (“simple” products) and furniture (\"complex” products). Compared with those who said they had deliberated long and hard, shoppers who bought with little conscious deliberation felt less happy with their simple clothing purchases but happier with the complex furniture purchases. Deliberation without attention actually produced better results as the decisions became more complex.</p>\n            <p>From there, however, the researchers take a big leap. They write: There is no reason to assume that the deliberation-without-attention effect does not generalise to other types of choices – political, managerial or otherwise. In such cases, it should benefit the individual to think consciously about simple matters and to delegate thinking about more complicated matters to the unconscious.</p>\n            <p>This radical inference contradicts standard political and managerial theory but doubtless comforts those in politics and management who always find the simple solution to the complex problem an attractive proposition. Indeed, one suspects many of our political leaders already embrace this wisdom.</p>\n            <p>Still it is here, in the realms of society and its governance, that the more problematic implications of deliberation without attention begin to surface. Variables that can be neatly circumscribed in decisions about shopping lose clarity in a world of group dynamics, social interaction, history and politics. Two pertinent questions arise. First, what counts as a complex decision? And second, what counts as a good outcome?</p>\n            <p>As social psychologist Kurt Lewin (1890-1947) noted, a “good” decision that nobody respects is actually bad. His classic studies of decision making showed that participating in deliberative processes makes people more likely to abide by the results. The issue here is that when political decision makers make mistakes, it is their politics, or the relation between their politics and our own, rather than psychology which is at fault.</p>\n            <p>Gladwell's book and Dijksterhuis's paper are invaluable in pointing out the limitations of the conventional wisdom that decision quality rises with decision-making complexity. But this work still tempts us to believe that decision making is simply a matter of psychology, rather than also a question of politics, ideology and group membership. Avoiding social considerations in a search for general appeal can take us away from enlightenment rather than toward it.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Decisions, decisions!</h3>\n<h4>Research explores when we can make a vital decision quickly and when we need to proceed more deliberately</h4>\n<p>A widely recognised legend tells us that in Gordium (in what is now Turkey) in the fourth century BC an oxcart was roped to a pole with a complex knot. It was said that the first person to untie it would become the king of Asia. Unfortunately, a the knot proved impossible to untie. The story continues that when confronted with this problem, rather than deliberating on how to untie the Gordian knot, Alexander, the famous ruler of the Greeks in the ancient world, simply took out his sword and cut it in two – then went on to conquer Asia. Ever since, the notion of a \"Gordian solution\" has referred to the attractiveness of a simple answer to an otherwise intractable problem.</p>\n<p>Among researchers in the psychology of decision making, however, such solutions have traditionally held little appeal. In particular, the “conflict model” of decision making proposed by psychologists Irving Janis and Leon Mann in their 1977 book Decision Making argued that a complex decision-making process is essential for guarding individuals and groups from the peril of \"group-think”. Decisions made without thoroughly canvassing, surveying, weighing, examining and re-examining relevant information and options would be sub-optimal and often disastrous. One foreign-affairs decision made by a well-known US political leader in the 1960s is typically held up as an example of the perils of inadequate thought, whereas his successful handling of a later crisis is cited as an example of the advantages of careful deliberation. However, examination of these historical events by Peter Suedfield, a psychologist at the University of British Columbia, and Roderick Kramer, a psychologist at the Stanford Graduate School of Business, found little difference in the two decision-making processes; both crises required and received complex consideration by the political administration, but later only the second one was deemed to be effective.</p>\n<p>In general, however, organisational and political science offer little evidence that complex decisions fare better than simpler ones. In fact, a growing body of work suggests that in many situations simple “snap” decisions will be routinely superior to more complex ones – an idea that gained widespread public appeal with Malcolm Gladwell's best-selling book Blink (2005).</p>\n<p>An article by Ap Dijksterhuis of the University of Amsterdam and his colleagues, “On Making the Right Choice: the Deliberation-without-attention Effect”, runs very much in the spirit of Gladwell's influential text. Its core argument is that to be effective, conscious (deliberative) decision making requires cognitive resources. Because increasingly complex decisions place increasing strain on those resources, the quality of our decisions declines as their complexity increases. In short, complex decisions overrun our cognitive powers. On the other hand, unconscious decision making (what the authors refer to as “deliberation without attention”) requires no cognitive resources, so task complexity does not degrade effectiveness. The seemingly counter-intuitive conclusion is that although conscious thought enhances simple decisions, the opposite holds true for more complex decisions.</p>\n<p>Dijksterhuis reports four simple but elegant studies supporting this argument. In one, participants assessed the quality of four hypothetical cars by considering either four attributes (a simple task) or twelve attributes (a complex task). Among participants who considered four attributes, those who were allowed to engage in undistracted deliberative thought did better at discriminating between the best and worst cars. Those who were distracted and thus unable to deliberate had to rely on their unconscious thinking and did less well. The opposite pattern emerged when people considered twelve criteria. In this case, conscious deliberation led to inferior discrimination and poor decisions.</p>\n<p>In another study, Dijksterhuis surveyed people shopping for clothes (“simple” products) and furniture (\"complex” products). Compared with those who said they had deliberated long and hard, shoppers who bought with little conscious deliberation felt less happy with their simple clothing purchases but happier with the complex furniture purchases. Deliberation without attention actually produced better results as the decisions became more complex.</p>\n<p>From there, however, the researchers take a big leap. They write: There is no reason to assume that the deliberation-without-attention effect does not generalise to other types of choices – political, managerial or otherwise. In such cases, it should benefit the individual to think consciously about simple matters and to delegate thinking about more complicated matters to the unconscious.</p>\n<p>This radical inference contradicts standard political and managerial theory but doubtless comforts those in politics and management who always find the simple solution to the complex problem an attractive proposition. Indeed, one suspects many of our political leaders already embrace this wisdom.</p>\n<p>Still it is here, in the realms of society and its governance, that the more problematic implications of deliberation without attention begin to surface. Variables that can be neatly circumscribed in decisions about shopping lose clarity in a world of group dynamics, social interaction, history and politics. Two pertinent questions arise. First, what counts as a complex decision? And second, what counts as a good outcome?</p>\n<p>As social psychologist Kurt Lewin (1890-1947) noted, a “good” decision that nobody respects is actually bad. His classic studies of decision making showed that participating in deliberative processes makes people more likely to abide by the results. The issue here is that when political decision makers make mistakes, it is their politics, or the relation between their politics and our own, rather than psychology which is at fault.</p>\n<p>Gladwell's book and Dijksterhuis's paper are invaluable in pointing out the limitations of the conventional wisdom that decision quality rises with decision-making complexity. But this work still tempts us to believe that decision making is simply a matter of psychology, rather than also a question of politics, ideology and group membership. Avoiding social considerations in a search for general appeal can take us away from enlightenment rather than toward it.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 27–31</h4>\n                <p>Choose the correct letter, A, B, C or D.</p>\n                \n                <div class=\"question-item\">\n                    <p><strong>27</strong> The legend of the Gordian knot is used to illustrate the idea that</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"A\"> A anyone can solve a difficult problem.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"B\"> B difficult problems can have easy solutions.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"C\"> C the solution to any problem requires a lot of thought.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"D\"> D people who can solve complex problems make good leaders.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> The 'conflict model' of decision making proposed by Janis and Mann requires that</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"A\"> A opposing political parties be involved.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"B\"> B all important facts be considered.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"C\"> C people be encouraged to have different ideas.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"D\"> D previous similar situations be thoroughly examined.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> According to recent thinking reinforced by Malcolm Gladwell, the best decisions</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"A\"> A involve consultation.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"B\"> B involve complex thought.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"C\"> C are made very quickly.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"D\"> D are the most attractive option.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> Dijksterhuis and his colleagues claim in their article that</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"A\"> A our cognitive resources improve as tasks become more complex.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"B\"> B conscious decision making is negatively affected by task complexity.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"C\"> C unconscious decision making is a popular approach.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"D\"> D deliberation without attention defines the way we make decisions.</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>31</strong> Dijksterhuis's car study found that, in simple tasks, participants</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"A\"> A were involved in lengthy discussions.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"B\"> B found it impossible to make decisions quickly.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"C\"> C were unable to differentiate between the options.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"D\"> D could make a better choice when allowed to concentrate.</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter, A, B, C or D.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> The legend of the Gordian knot is used to illustrate the idea that</p>\n<div class=\"radio-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A anyone can solve a difficult problem.</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B difficult problems can have easy solutions.</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C the solution to any problem requires a lot of thought.</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D people who can solve complex problems make good leaders.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> The 'conflict model' of decision making proposed by Janis and Mann requires that</p>\n<div class=\"radio-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A opposing political parties be involved.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B all important facts be considered.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C people be encouraged to have different ideas.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D previous similar situations be thoroughly examined.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> According to recent thinking reinforced by Malcolm Gladwell, the best decisions</p>\n<div class=\"radio-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A involve consultation.</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B involve complex thought.</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C are made very quickly.</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D are the most attractive option.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> Dijksterhuis and his colleagues claim in their article that</p>\n<div class=\"radio-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A our cognitive resources improve as tasks become more complex.</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B conscious decision making is negatively affected by task complexity.</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C unconscious decision making is a popular approach.</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D deliberation without attention defines the way we make decisions.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> Dijksterhuis's car study found that, in simple tasks, participants</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"> A were involved in lengthy discussions.</label> <label><input name=\"q5\" type=\"radio\" value=\"B\"> B found it impossible to make decisions quickly.</label> <label><input name=\"q5\" type=\"radio\" value=\"C\"> C were unable to differentiate between the options.</label> <label><input name=\"q5\" type=\"radio\" value=\"D\"> D could make a better choice when allowed to concentrate.</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions 27–40</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n                <h4>Questions 32–35</h4>\n                <p>Complete the summary below using the list of words, A–I, below.</p>\n                <div class=\"summary-text\">\n                    <h5>Dijksterhuis's shopping study and its conclusions</h5>\n                    <p>\n                    Using clothing and furniture as examples of different types of purchases, Dijksterhuis questioned shoppers on their satisfaction with what they had bought. People who spent \n                    <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> \n                    time buying simple clothing items were more satisfied than those who had not. However, when buying furniture, shoppers made \n                    <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> \n                    purchasing decisions if they didn't think too hard. From this, the researchers concluded that in other choices, perhaps more important than shopping, \n                    <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> \n                    decisions are best made by the unconscious. The writer comments that Dijksterhuis's finding is apparently \n                    <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span> \n                    but nonetheless true.\n                    </p>\n                </div>\n                <div id=\"word-options\">\n                    <div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A more</div>\n                    <div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B counterintuitive</div>\n                    <div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C simple</div>\n                    <div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D better</div>\n                    <div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E conscious</div>\n                    <div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F obvious</div>\n                    <div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G complex</div>\n                    <div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H less</div>\n                    <div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I worse</div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Complete the summary below using the list of words, A–I, below.</p>\n<div class=\"summary-text\">\n<h5>Dijksterhuis's shopping study and its conclusions</h5>\n<p>\nUsing clothing and furniture as examples of different types of purchases, Dijksterhuis questioned shoppers on their satisfaction with what they had bought. People who spent <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> time buying simple clothing items were more satisfied than those who had not. However, when buying furniture, shoppers made <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> purchasing decisions if they didn't think too hard. From this, the researchers concluded that in other choices, perhaps more important than shopping, <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> decisions are best made by the unconscious. The writer comments that Dijksterhuis's finding is apparently <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span> but nonetheless true.\n</p>\n</div>\n<div id=\"word-options\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-key=\"A\">A more</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-key=\"B\">B counterintuitive</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-key=\"C\">C simple</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-key=\"D\">D better</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-key=\"E\">E conscious</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-key=\"F\">F obvious</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-key=\"G\">G complex</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-key=\"H\">H less</div>\n<div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-key=\"I\">I worse</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n                <h4>Questions 36–40</h4>\n                <p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n                <p>In boxes 36–40 on your answer sheet, write</p>\n                <ul>\n                    <li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                \n                <div class=\"question-item\">\n                    <p><strong>36</strong> Dijksterhuis's findings agree with existing political and management theories.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>37</strong> Some political leaders seem to use deliberation without attention when making complex decisions.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>38</strong> All political decisions are complex ones.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>39</strong> We judge political errors according to our own political beliefs.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>40</strong> Social considerations must be taken into account for any examination of decision making to prove useful.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3?</p>\n<p>In boxes 36–40 on your answer sheet, write</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the views of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the views of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>36</strong> Dijksterhuis's findings agree with existing political and management theories.</p>\n<div class=\"radio-options\">\n<label><input name=\"q10\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q10\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q10\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>37</strong> Some political leaders seem to use deliberation without attention when making complex decisions.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> All political decisions are complex ones.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> We judge political errors according to our own political beliefs.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> Social considerations must be taken into account for any examination of decision making to prove useful.</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -13,14 +13,14 @@
     "pdfFilename": "71. P3 - Jean Piaget (1896–1980) 让·皮亚杰【次】.pdf",
     "legacyPath": "睡着过项目组/2. 所有文章(11.20)[192篇]/71. P3 - Jean Piaget (1896–1980) 让·皮亚杰【次】/",
     "legacyFilename": "71. P3 - Jean Piaget (1896–1980) 让·皮亚杰【次】.html",
-    "questionIntroHtml": "<h2>Questions</h2>\n\n        <div class=\"question-group\" id=\"q1-31-section\">\n          <h3>Questions 27–31</h3>\n          <p style=\"margin-bottom: 12px;\">Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n          <div class=\"question-item\">\n              <p><strong>27</strong> In the second paragraph, the writer mentions the example of modern anthropology to illustrate</p>\n              <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"A\"> A the universality of Piaget's insights into the workings of the mind.</label>\n                <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"B\"> B the similarity between children's thought-processing in different cultures.</label>\n                <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"C\"> C how Piaget's work represents a crucial turning-point in our approach to education.</label>\n                <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"D\"> D how Piaget's work has aided our understanding of humankind's evolution from primitive origins.</label>\n              </div>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>28</strong> According to the writer, what point is illustrated by the dialogue about the wind?</p>\n              <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"A\"> A The factual accuracy of what children say is of minor significance.</label>\n                <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"B\"> B Children want to learn about scientific principles.</label>\n                <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"C\"> C Children's reasoning processes can be amusing to adults.</label>\n                <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"D\"> D Children often pretend that they know the answers to questions.</label>\n              </div>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>29</strong> Piaget believed in the importance of</p>\n              <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"A\"> A preventing children from making false assumptions.</label>\n                <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"B\"> B giving children honest feedback on their hypotheses.</label>\n                <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"C\"> C showing children how to formulate their own ideas about the world.</label>\n                <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"D\"> D maintaining children's confidence in their ability to interpret the world.</label>\n              </div>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>30</strong> What does the writer suggest in the seventh paragraph?</p>\n              <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"A\"> A Children's sense of their surroundings changes as they get older.</label>\n                <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"B\"> B Children are able to grasp certain complex ideas as well as adults are.</label>\n                <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"C\"> C Even apparently irrational ideas can be worthy of interest.</label>\n                <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"D\"> D Sometimes the simplest explanations are the best.</label>\n              </div>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>31</strong> The writer's main purpose is to</p>\n              <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"A\"> A outline Piaget's contribution to a range of scientific fields.</label>\n                <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"B\"> B summarise how education has benefited from Piaget's findings.</label>\n                <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"C\"> C discuss Piaget's role in the development of 20th-century psychology.</label>\n                <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"D\"> D express doubts about a number of Piaget's theories.</label>\n              </div>\n          </div>\n        </div>\n\n        <div class=\"question-group\" id=\"q6-36-section\">\n          <h3>Questions 32–36</h3>\n          <p style=\"margin-bottom: 12px;\">Complete the summary using the list of words below. Drag a word from the list and drop it into the correct blank.</p>\n          <div class=\"summary-text\">\n            <p>\n              Piaget maintained that children's mental processes were far more <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> than they might appear. He encouraged the view that a child was not a 'blank slate' waiting to be filled with information, but rather a systematic builder of knowledge who regularly tries out his or her own <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> about the world. Piaget's impact on the area of <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> could well outlast that of more celebrated pioneers of this discipline. Despite doubts cast over his ideas by the current view associating knowledge exclusively with the <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span>, the effects of his work are still strong today. His principles are still widely used in the professional development of <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span>.\n            </p>\n          </div>\n          <div id=\"word-options\">\n            <div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"correct\">A correct</div>\n            <div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"theories\">B theories</div>\n            <div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"brain\">C brain</div>\n            <div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"simple\">D simple</div>\n            <div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"teachers\">E teachers</div>\n            <div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"psychology\">F psychology</div>\n            <div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"logical\">G logical</div>\n            <div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"thought\">H thought</div>\n            <div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-word=\"philosophers\">I philosophers</div>\n          </div>\n        </div>\n\n        <div class=\"question-group\" id=\"q11-40-section\">\n            <h3>Questions 37–40</h3>\n            <p>Do the following statements agree with the claims of the writer? Write <strong>YES</strong>, <strong>NO</strong>, or <strong>NOT GIVEN</strong>.</p>\n            <div class=\"question-item\">\n                <p><strong>37</strong> Piaget's early work in Paris involved innovative research techniques.</p>\n                <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                  <label style=\"margin:0;\"><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label>\n                  <label style=\"margin:0;\"><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label>\n                  <label style=\"margin:0;\"><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div class=\"question-item\">\n                <p><strong>38</strong> Piaget gave clear guidelines as to how adults should give information to children.</p>\n                <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                  <label style=\"margin:0;\"><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label>\n                  <label style=\"margin:0;\"><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label>\n                  <label style=\"margin:0;\"><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div class=\"question-item\">\n                <p><strong>39</strong> Piaget made a significant contribution to the field of epistemology.</p>\n                <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                  <label style=\"margin:0;\"><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label>\n                  <label style=\"margin:0;\"><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label>\n                  <label style=\"margin:0;\"><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div class=\"question-item\">\n                <p><strong>40</strong> We still have much to learn about the nature of knowledge.</p>\n                <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                  <label style=\"margin:0;\"><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label>\n                  <label style=\"margin:0;\"><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label>\n                  <label style=\"margin:0;\"><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n        </div>\n        "
+    "questionIntroHtml": "<h2>Questions</h2>\n<div class=\"question-group\" id=\"q1-31-section\">\n<h3>Questions 27–31</h3>\n<p style=\"margin-bottom: 12px;\">Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> In the second paragraph, the writer mentions the example of modern anthropology to illustrate</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"A\"> A the universality of Piaget's insights into the workings of the mind.</label> <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"B\"> B the similarity between children's thought-processing in different cultures.</label> <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"C\"> C how Piaget's work represents a crucial turning-point in our approach to education.</label> <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"D\"> D how Piaget's work has aided our understanding of humankind's evolution from primitive origins.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> According to the writer, what point is illustrated by the dialogue about the wind?</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"A\"> A The factual accuracy of what children say is of minor significance.</label> <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"B\"> B Children want to learn about scientific principles.</label> <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"C\"> C Children's reasoning processes can be amusing to adults.</label> <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"D\"> D Children often pretend that they know the answers to questions.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Piaget believed in the importance of</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"A\"> A preventing children from making false assumptions.</label> <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"B\"> B giving children honest feedback on their hypotheses.</label> <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"C\"> C showing children how to formulate their own ideas about the world.</label> <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"D\"> D maintaining children's confidence in their ability to interpret the world.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What does the writer suggest in the seventh paragraph?</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"A\"> A Children's sense of their surroundings changes as they get older.</label> <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"B\"> B Children are able to grasp certain complex ideas as well as adults are.</label> <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"C\"> C Even apparently irrational ideas can be worthy of interest.</label> <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"D\"> D Sometimes the simplest explanations are the best.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> The writer's main purpose is to</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"A\"> A outline Piaget's contribution to a range of scientific fields.</label> <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"B\"> B summarise how education has benefited from Piaget's findings.</label> <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"C\"> C discuss Piaget's role in the development of 20th-century psychology.</label> <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"D\"> D express doubts about a number of Piaget's theories.</label>\n</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q6-36-section\">\n<h3>Questions 32–36</h3>\n<p style=\"margin-bottom: 12px;\">Complete the summary using the list of words below. Drag a word from the list and drop it into the correct blank.</p>\n<div class=\"summary-text\">\n<p>\nPiaget maintained that children's mental processes were far more <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> than they might appear. He encouraged the view that a child was not a 'blank slate' waiting to be filled with information, but rather a systematic builder of knowledge who regularly tries out his or her own <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> about the world. Piaget's impact on the area of <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> could well outlast that of more celebrated pioneers of this discipline. Despite doubts cast over his ideas by the current view associating knowledge exclusively with the <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span>, the effects of his work are still strong today. His principles are still widely used in the professional development of <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span>.\n</p>\n</div>\n<div id=\"word-options\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"correct\">A correct</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"theories\">B theories</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"brain\">C brain</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"simple\">D simple</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"teachers\">E teachers</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"psychology\">F psychology</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"logical\">G logical</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"thought\">H thought</div>\n<div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-word=\"philosophers\">I philosophers</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q11-40-section\">\n<h3>Questions 37–40</h3>\n<p>Do the following statements agree with the claims of the writer? Write <strong>YES</strong>, <strong>NO</strong>, or <strong>NOT GIVEN</strong>.</p>\n<div class=\"question-item\">\n<p><strong>37</strong> Piaget's early work in Paris involved innovative research techniques.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label> <label style=\"margin:0;\"><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label> <label style=\"margin:0;\"><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> Piaget gave clear guidelines as to how adults should give information to children.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label style=\"margin:0;\"><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label style=\"margin:0;\"><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> Piaget made a significant contribution to the field of epistemology.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label style=\"margin:0;\"><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label style=\"margin:0;\"><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> We still have much to learn about the nature of knowledge.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label style=\"margin:0;\"><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label style=\"margin:0;\"><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
   },
   "passage": {
     "blocks": [
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n        <p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n        <h3>Jean Piaget (1896–1980)</h3>\n        <p><i>Seymour Papert looks at the work of the pioneering Swiss philosopher and psychologist</i></p>\n        <div id=\"passage-text\">\n            <p>Jean Piaget spent much of his professional life listening to children, watching children and poring over reports of researchers around the world who were doing the same. He found, to put it most succinctly, that children don't think like grown-ups. After thousands of interactions with young people often barely old enough to talk, Piaget began to suspect that behind their cute and seemingly irrational utterances were thought processes that had their own kind of order and their own special logic. Einstein called it \"a discovery so simple that only a genius could have thought of it.\"</p>\n            <p>Although not an educational reformer, Piaget championed a way of thinking about children that provided the foundation for today's education-reform movements. It was a shift comparable to the way modern anthropology displaced stories of primitive tribes being 'noble savages' and 'cannibals'. One might say that Piaget was the first to take children's thinking seriously.</p>\n            <p>He has been revered by generations of teachers inspired by the belief that children are not empty vessels to be filled with knowledge (as traditional pedagogical theory had it) but active builders of knowledge-little scientists who are constantly creating and testing their own hypotheses about the world. And though he may not be as famous as Sigmund Freud or even B. F. Skinner, his influence on psychology may be longer lasting.</p>\n            <p>In 1920, while doing research in a child-psychology laboratory in Paris, Piaget noticed that children of the same age made similar errors on intelligence tests. Fascinated by their reasoning processes, he began to suspect that the key to human knowledge might be discovered by observing how the child's mind develops. On his return to Switzerland he began watching children play, scrupulously recording their words and actions as their minds raced to find reasons for why things are the way they are.</p>\n            <p>In one of his most famous experiments, Piaget asked children, 'What makes the wind?' A typical dialogue would be:<br>Piaget: What makes the wind?<br>Julia: The trees.<br>Piaget: How do you know?<br>Julia: I saw them waving their arms.<br>Piaget: How does that make the wind?<br>Julia: (waving her hand in front of his face) Like this. Only they are bigger. And there are lots of trees.</p>\n            <p>Piaget recognised that five-year-old Julia's beliefs, while not correct by any adult criterion, are not 'incorrect' either. They are entirely sensible and coherent within the framework of the child's way of knowing. Classifying them as 'true' or 'false' misses the point and shows a lack of respect for the child. What Piaget was after was a theory that the wind dialogue demonstrated coherence, ingenuity and the practice of a kind of explanatory principle (in this case by referring to body actions) that stands young children in very good stead when they don't know enough or don't have enough skill to handle the kind of explanation that grown-ups prefer.</p>\n            <p>Piaget was not an educator and never laid down rules about how to intervene in such situations. But his work strongly suggests that the automatic reaction of putting the child right may well be counter-productive. If their theories are always greeted by 'Nice try, but this is how it really is...' they might give up after a while on making theories. As Piaget put it, 'children have real understanding only of that which they invent themselves, and each time that we try to teach them something too quickly, we keep them from inventing it themselves.'</p>\n            <p>Disciples of Piaget have a tolerance for indeed a fascination with-children's primitive laws of physics: that things disappear when they are out of sight; that the moon and the sun follow you around; that big things float and small things sink. Einstein was intrigued by Piaget's findings, especially by the idea that seven-year-olds insist that going faster can take more time-perhaps because this, like Einstein's own theories of relativity, runs so contrary to common sense.</p>\n            <p>Although every teacher in training still memorises Piaget's successive stages of childhood development, the greater part of Piaget's work is less well known, perhaps because schools of education regard it as 'too deep' for teachers. Piaget never thought of himself as a child psychologist. His real interest was epistemology-the theory of knowledge-which, like physics, was considered a branch of philosophy until Piaget came along and made it a science.</p>\n            <p>Through epistemology, Piaget explored multiple ways of knowing. He acknowledged them and examined them non-judgementally, yet with a philosopher's analytic rigour. Since Piaget, the territory has been widely colonised by those who write about women's ways of knowing, Afrocentric ways of knowing, even the computer's ways of knowing. Indeed, artificial intelligence and the information-processing model of the mind owe more to Piaget than its proponents may realise.</p>\n            <p>The core of Piaget is his belief that looking carefully at how knowledge develops in children will elucidate the nature of knowledge in general. Whether this has in fact led to deeper understanding remains, like everything about Piaget, controversial. In the past decade, Piaget has been vigorously challenged by the current fashion of viewing knowledge as an intrinsic property of the brain. Ingenious experiments have demonstrated that newborn infants already have some of the knowledge that Piaget believed children constructed. But for those, like me, who still see Piaget as the giant in the field of cognitive theory, the difference between what the baby brings and what the adult has is so immense that the new discoveries do not significantly reduce the gap, but only increase the mystery.</p>\n        </div>\n      </div>\n\n      <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>Jean Piaget (1896–1980)</h3>\n<p><i>Seymour Papert looks at the work of the pioneering Swiss philosopher and psychologist</i></p>\n<div id=\"passage-text\">\n<p>Jean Piaget spent much of his professional life listening to children, watching children and poring over reports of researchers around the world who were doing the same. He found, to put it most succinctly, that children don't think like grown-ups. After thousands of interactions with young people often barely old enough to talk, Piaget began to suspect that behind their cute and seemingly irrational utterances were thought processes that had their own kind of order and their own special logic. Einstein called it \"a discovery so simple that only a genius could have thought of it.\"</p>\n<p>Although not an educational reformer, Piaget championed a way of thinking about children that provided the foundation for today's education-reform movements. It was a shift comparable to the way modern anthropology displaced stories of primitive tribes being 'noble savages' and 'cannibals'. One might say that Piaget was the first to take children's thinking seriously.</p>\n<p>He has been revered by generations of teachers inspired by the belief that children are not empty vessels to be filled with knowledge (as traditional pedagogical theory had it) but active builders of knowledge-little scientists who are constantly creating and testing their own hypotheses about the world. And though he may not be as famous as Sigmund Freud or even B. F. Skinner, his influence on psychology may be longer lasting.</p>\n<p>In 1920, while doing research in a child-psychology laboratory in Paris, Piaget noticed that children of the same age made similar errors on intelligence tests. Fascinated by their reasoning processes, he began to suspect that the key to human knowledge might be discovered by observing how the child's mind develops. On his return to Switzerland he began watching children play, scrupulously recording their words and actions as their minds raced to find reasons for why things are the way they are.</p>\n<p>In one of his most famous experiments, Piaget asked children, 'What makes the wind?' A typical dialogue would be:<br>Piaget: What makes the wind?<br>Julia: The trees.<br>Piaget: How do you know?<br>Julia: I saw them waving their arms.<br>Piaget: How does that make the wind?<br>Julia: (waving her hand in front of his face) Like this. Only they are bigger. And there are lots of trees.</p>\n<p>Piaget recognised that five-year-old Julia's beliefs, while not correct by any adult criterion, are not 'incorrect' either. They are entirely sensible and coherent within the framework of the child's way of knowing. Classifying them as 'true' or 'false' misses the point and shows a lack of respect for the child. What Piaget was after was a theory that the wind dialogue demonstrated coherence, ingenuity and the practice of a kind of explanatory principle (in this case by referring to body actions) that stands young children in very good stead when they don't know enough or don't have enough skill to handle the kind of explanation that grown-ups prefer.</p>\n<p>Piaget was not an educator and never laid down rules about how to intervene in such situations. But his work strongly suggests that the automatic reaction of putting the child right may well be counter-productive. If their theories are always greeted by 'Nice try, but this is how it really is...' they might give up after a while on making theories. As Piaget put it, 'children have real understanding only of that which they invent themselves, and each time that we try to teach them something too quickly, we keep them from inventing it themselves.'</p>\n<p>Disciples of Piaget have a tolerance for indeed a fascination with-children's primitive laws of physics: that things disappear when they are out of sight; that the moon and the sun follow you around; that big things float and small things sink. Einstein was intrigued by Piaget's findings, especially by the idea that seven-year-olds insist that going faster can take more time-perhaps because this, like Einstein's own theories of relativity, runs so contrary to common sense.</p>\n<p>Although every teacher in training still memorises Piaget's successive stages of childhood development, the greater part of Piaget's work is less well known, perhaps because schools of education regard it as 'too deep' for teachers. Piaget never thought of himself as a child psychologist. His real interest was epistemology-the theory of knowledge-which, like physics, was considered a branch of philosophy until Piaget came along and made it a science.</p>\n<p>Through epistemology, Piaget explored multiple ways of knowing. He acknowledged them and examined them non-judgementally, yet with a philosopher's analytic rigour. Since Piaget, the territory has been widely colonised by those who write about women's ways of knowing, Afrocentric ways of knowing, even the computer's ways of knowing. Indeed, artificial intelligence and the information-processing model of the mind owe more to Piaget than its proponents may realise.</p>\n<p>The core of Piaget is his belief that looking carefully at how knowledge develops in children will elucidate the nature of knowledge in general. Whether this has in fact led to deeper understanding remains, like everything about Piaget, controversial. In the past decade, Piaget has been vigorously challenged by the current fashion of viewing knowledge as an intrinsic property of the brain. Ingenious experiments have demonstrated that newborn infants already have some of the knowledge that Piaget believed children constructed. But for those, like me, who still see Piaget as the giant in the field of cognitive theory, the difference between what the baby brings and what the adult has is so immense that the new discoveries do not significantly reduce the gap, but only increase the mystery.</p>\n</div>\n</div>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -44,7 +44,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<h2>Questions</h2>\n\n        <div class=\"question-group\" id=\"q1-31-section\">\n          <h3>Questions 27–31</h3>\n          <p style=\"margin-bottom: 12px;\">Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n          <div class=\"question-item\">\n              <p><strong>27</strong> In the second paragraph, the writer mentions the example of modern anthropology to illustrate</p>\n              <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"A\"> A the universality of Piaget's insights into the workings of the mind.</label>\n                <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"B\"> B the similarity between children's thought-processing in different cultures.</label>\n                <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"C\"> C how Piaget's work represents a crucial turning-point in our approach to education.</label>\n                <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"D\"> D how Piaget's work has aided our understanding of humankind's evolution from primitive origins.</label>\n              </div>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>28</strong> According to the writer, what point is illustrated by the dialogue about the wind?</p>\n              <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"A\"> A The factual accuracy of what children say is of minor significance.</label>\n                <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"B\"> B Children want to learn about scientific principles.</label>\n                <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"C\"> C Children's reasoning processes can be amusing to adults.</label>\n                <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"D\"> D Children often pretend that they know the answers to questions.</label>\n              </div>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>29</strong> Piaget believed in the importance of</p>\n              <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"A\"> A preventing children from making false assumptions.</label>\n                <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"B\"> B giving children honest feedback on their hypotheses.</label>\n                <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"C\"> C showing children how to formulate their own ideas about the world.</label>\n                <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"D\"> D maintaining children's confidence in their ability to interpret the world.</label>\n              </div>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>30</strong> What does the writer suggest in the seventh paragraph?</p>\n              <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"A\"> A Children's sense of their surroundings changes as they get older.</label>\n                <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"B\"> B Children are able to grasp certain complex ideas as well as adults are.</label>\n                <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"C\"> C Even apparently irrational ideas can be worthy of interest.</label>\n                <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"D\"> D Sometimes the simplest explanations are the best.</label>\n              </div>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>31</strong> The writer's main purpose is to</p>\n              <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"A\"> A outline Piaget's contribution to a range of scientific fields.</label>\n                <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"B\"> B summarise how education has benefited from Piaget's findings.</label>\n                <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"C\"> C discuss Piaget's role in the development of 20th-century psychology.</label>\n                <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"D\"> D express doubts about a number of Piaget's theories.</label>\n              </div>\n          </div>\n        </div>\n\n        <div class=\"question-group\" id=\"q6-36-section\">\n          <h3>Questions 32–36</h3>\n          <p style=\"margin-bottom: 12px;\">Complete the summary using the list of words below. Drag a word from the list and drop it into the correct blank.</p>\n          <div class=\"summary-text\">\n            <p>\n              Piaget maintained that children's mental processes were far more <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> than they might appear. He encouraged the view that a child was not a 'blank slate' waiting to be filled with information, but rather a systematic builder of knowledge who regularly tries out his or her own <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> about the world. Piaget's impact on the area of <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> could well outlast that of more celebrated pioneers of this discipline. Despite doubts cast over his ideas by the current view associating knowledge exclusively with the <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span>, the effects of his work are still strong today. His principles are still widely used in the professional development of <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span>.\n            </p>\n          </div>\n          <div id=\"word-options\">\n            <div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"correct\">A correct</div>\n            <div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"theories\">B theories</div>\n            <div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"brain\">C brain</div>\n            <div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"simple\">D simple</div>\n            <div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"teachers\">E teachers</div>\n            <div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"psychology\">F psychology</div>\n            <div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"logical\">G logical</div>\n            <div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"thought\">H thought</div>\n            <div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-word=\"philosophers\">I philosophers</div>\n          </div>\n        </div>\n\n        <div class=\"question-group\" id=\"q11-40-section\">\n            <h3>Questions 37–40</h3>\n            <p>Do the following statements agree with the claims of the writer? Write <strong>YES</strong>, <strong>NO</strong>, or <strong>NOT GIVEN</strong>.</p>\n            <div class=\"question-item\">\n                <p><strong>37</strong> Piaget's early work in Paris involved innovative research techniques.</p>\n                <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                  <label style=\"margin:0;\"><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label>\n                  <label style=\"margin:0;\"><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label>\n                  <label style=\"margin:0;\"><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div class=\"question-item\">\n                <p><strong>38</strong> Piaget gave clear guidelines as to how adults should give information to children.</p>\n                <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                  <label style=\"margin:0;\"><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label>\n                  <label style=\"margin:0;\"><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label>\n                  <label style=\"margin:0;\"><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div class=\"question-item\">\n                <p><strong>39</strong> Piaget made a significant contribution to the field of epistemology.</p>\n                <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                  <label style=\"margin:0;\"><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label>\n                  <label style=\"margin:0;\"><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label>\n                  <label style=\"margin:0;\"><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div class=\"question-item\">\n                <p><strong>40</strong> We still have much to learn about the nature of knowledge.</p>\n                <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                  <label style=\"margin:0;\"><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label>\n                  <label style=\"margin:0;\"><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label>\n                  <label style=\"margin:0;\"><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n        </div>\n        "
+      "bodyHtml": "<h2>Questions</h2>\n<div class=\"question-group\" id=\"q1-31-section\">\n<h3>Questions 27–31</h3>\n<p style=\"margin-bottom: 12px;\">Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> In the second paragraph, the writer mentions the example of modern anthropology to illustrate</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"A\"> A the universality of Piaget's insights into the workings of the mind.</label> <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"B\"> B the similarity between children's thought-processing in different cultures.</label> <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"C\"> C how Piaget's work represents a crucial turning-point in our approach to education.</label> <label style=\"margin:0;\"><input name=\"q1\" type=\"radio\" value=\"D\"> D how Piaget's work has aided our understanding of humankind's evolution from primitive origins.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> According to the writer, what point is illustrated by the dialogue about the wind?</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"A\"> A The factual accuracy of what children say is of minor significance.</label> <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"B\"> B Children want to learn about scientific principles.</label> <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"C\"> C Children's reasoning processes can be amusing to adults.</label> <label style=\"margin:0;\"><input name=\"q2\" type=\"radio\" value=\"D\"> D Children often pretend that they know the answers to questions.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Piaget believed in the importance of</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"A\"> A preventing children from making false assumptions.</label> <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"B\"> B giving children honest feedback on their hypotheses.</label> <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"C\"> C showing children how to formulate their own ideas about the world.</label> <label style=\"margin:0;\"><input name=\"q3\" type=\"radio\" value=\"D\"> D maintaining children's confidence in their ability to interpret the world.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What does the writer suggest in the seventh paragraph?</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"A\"> A Children's sense of their surroundings changes as they get older.</label> <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"B\"> B Children are able to grasp certain complex ideas as well as adults are.</label> <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"C\"> C Even apparently irrational ideas can be worthy of interest.</label> <label style=\"margin:0;\"><input name=\"q4\" type=\"radio\" value=\"D\"> D Sometimes the simplest explanations are the best.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> The writer's main purpose is to</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"A\"> A outline Piaget's contribution to a range of scientific fields.</label> <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"B\"> B summarise how education has benefited from Piaget's findings.</label> <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"C\"> C discuss Piaget's role in the development of 20th-century psychology.</label> <label style=\"margin:0;\"><input name=\"q5\" type=\"radio\" value=\"D\"> D express doubts about a number of Piaget's theories.</label>\n</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q6-36-section\">\n<h3>Questions 32–36</h3>\n<p style=\"margin-bottom: 12px;\">Complete the summary using the list of words below. Drag a word from the list and drop it into the correct blank.</p>\n<div class=\"summary-text\">\n<p>\nPiaget maintained that children's mental processes were far more <span id=\"q6-target\" class=\"drop-target-summary\" data-question=\"q6\"></span> than they might appear. He encouraged the view that a child was not a 'blank slate' waiting to be filled with information, but rather a systematic builder of knowledge who regularly tries out his or her own <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> about the world. Piaget's impact on the area of <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> could well outlast that of more celebrated pioneers of this discipline. Despite doubts cast over his ideas by the current view associating knowledge exclusively with the <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span>, the effects of his work are still strong today. His principles are still widely used in the professional development of <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span>.\n</p>\n</div>\n<div id=\"word-options\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"correct\">A correct</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"theories\">B theories</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"brain\">C brain</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"simple\">D simple</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"teachers\">E teachers</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"psychology\">F psychology</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"logical\">G logical</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"thought\">H thought</div>\n<div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-word=\"philosophers\">I philosophers</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q11-40-section\">\n<h3>Questions 37–40</h3>\n<p>Do the following statements agree with the claims of the writer? Write <strong>YES</strong>, <strong>NO</strong>, or <strong>NOT GIVEN</strong>.</p>\n<div class=\"question-item\">\n<p><strong>37</strong> Piaget's early work in Paris involved innovative research techniques.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label> <label style=\"margin:0;\"><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label> <label style=\"margin:0;\"><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> Piaget gave clear guidelines as to how adults should give information to children.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label style=\"margin:0;\"><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label style=\"margin:0;\"><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> Piaget made a significant contribution to the field of epistemology.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label style=\"margin:0;\"><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label style=\"margin:0;\"><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> We still have much to learn about the nature of knowledge.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label style=\"margin:0;\"><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label style=\"margin:0;\"><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label style=\"margin:0;\"><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3.</p>\n            \n            <h3>The Analysis of Fear</h3>\n            <h4>Researchers are investigating the processes in the brain that give rise to fear in animals. The results may lead to new ways to treat human anxiety.</h4>\n            \n            <p>Over the years, the majority of people acquire a range of skills for coping with frightening situations. They will attempt to placate a vexed teacher or boss and will shout and run when chased by a hostile stranger. But some individuals become overwhelmed in circumstances others would consider only minimally stressful: fear of ridicule might cause them to shake uncontrollably when called on to speak in a group, or terror of strangers might lead them to hide at home, unable to work or shop for groceries. Why do certain people fall prey to excessive fear?</p>\n            <p>Ned H. Kalin and Steven E. Shelton at the University of Wisconsin-Madison are addressing this problem by identifying specific brain processes that regulate fear and its associated behaviors. Despite the availability of non-invasive computer-imaging techniques, such information is still extremely difficult to obtain in humans. Hence, they have turned their attention to another primate, the rhesus monkey. These animals undergo many of the same physiological and psychological developmental stages that humans do, but in a more compressed time span. As we gain more insight into the nature and operation of neural circuits that modulate fear in monkeys, it should be possible to pinpoint the brain processes that cause inordinate anxiety in people, and to devise new therapies to counteract it. Effective interventions would be particularly valuable if they were applied at an early age, as growing evidence suggests overly fearful youngsters are at high risk of later emotional distress.</p>\n            <p>When they began their studies two decades ago, Kalin and Shelton knew that they would first have to find cues that elicit fear and identify behaviors that reflect different types of anxiety. With such information in hand, they could then proceed to determine the age at which monkeys begin to match defensive behaviors selectively to specific cues. Finally, by determining the parts of the brain that reach maturity during the same time span, they could gain clues to the regions that underlie the regulation of fear and fear-related behavior.</p>\n            <p>The experiments were carried out at the University of Wisconsin-Madison. Kalin and Shelton discerned varied behaviors by exposing monkeys between six and 12 months old to three related situations. In the alone condition, an animal was separated from its mother and left by itself in a cage for ten minutes. In the no-eye-contact condition, a person stood motionless outside the cage and avoided looking at the solitary infant. In the stare condition, a person was again present and motionless but, assuming a neutral expression, peered directly at the animal. These positions are no more frightening than those that primates encounter frequently in the wild, or those that human infants meet whenever they are left at a day-care centre.</p>\n            <p>In the alone condition, most monkeys became very active and emitted frequent gentle “coo” calls made with pursed lips. More than 40 years ago it was deduced that when an infant monkey is separated from its mother, it yearns to regain the closeness and security provided by nearness to the parent. These responses help to draw the mother's attention. In contrast, in the more frightening no-eye-contact situation, the monkeys reduced their activity greatly and sometimes froze for extended periods of time. When an infant spots a potential predator, its goal shifts from attracting the mother to becoming inconspicuous. Inhibiting motion and freezing are common attempts to achieve this in many species. If the infant perceives that it has been detected, its aim shifts to warding off an attack. So the stare condition evoked a third set of responses. The monkeys made several hostile gestures: barking (forcing air from the abdomen through the vocal cords to emit a harsh, growl-like sound) and staring back. Sometimes the animals mixed the threatening displays with submissive ones, such as fear grimaces, which look something like wary grins, or grinding of teeth.</p>\n            <p>Having identified three categories of defensive behaviours, Kalin and Shelton set about determining when infant monkeys first begin to apply them effectively. Several lines of work had led them to surmise that the ability to make such choices emerges when an infant is around two months old. To establish the critical period of development, they examined four groups of infant monkeys ranging in age up to 12 weeks old. The babies were separated from their mothers, left to acclimatise to a cage, and then exposed to the alone, no-eye-contact and stare conditions. All sessions were videotaped for analysis. They found that the infants in the youngest group (no more than two weeks old) engaged in defensive behaviours, but they lacked some motor control and seemed to act randomly, as if they had not noticed the human beings that were present. Babies in the two intermediate-age groups had good motor control, but their actions seemed unrelated to the test condition. Only animals in the oldest group (nine- to 12-week-old) conducted themselves differently in each situation, and their reactions were both appropriate and identical to those of mature monkeys. This finding meant motor control was not the prime determinant of selective responding and that nine to 12 weeks is the critical age for the appearance of a monkey's ability to adaptively modulate its defensive activity to meet changing demands.</p>\n\n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3.</p>\n<h3>The Analysis of Fear</h3>\n<h4>Researchers are investigating the processes in the brain that give rise to fear in animals. The results may lead to new ways to treat human anxiety.</h4>\n<p>Over the years, the majority of people acquire a range of skills for coping with frightening situations. They will attempt to placate a vexed teacher or boss and will shout and run when chased by a hostile stranger. But some individuals become overwhelmed in circumstances others would consider only minimally stressful: fear of ridicule might cause them to shake uncontrollably when called on to speak in a group, or terror of strangers might lead them to hide at home, unable to work or shop for groceries. Why do certain people fall prey to excessive fear?</p>\n<p>Ned H. Kalin and Steven E. Shelton at the University of Wisconsin-Madison are addressing this problem by identifying specific brain processes that regulate fear and its associated behaviors. Despite the availability of non-invasive computer-imaging techniques, such information is still extremely difficult to obtain in humans. Hence, they have turned their attention to another primate, the rhesus monkey. These animals undergo many of the same physiological and psychological developmental stages that humans do, but in a more compressed time span. As we gain more insight into the nature and operation of neural circuits that modulate fear in monkeys, it should be possible to pinpoint the brain processes that cause inordinate anxiety in people, and to devise new therapies to counteract it. Effective interventions would be particularly valuable if they were applied at an early age, as growing evidence suggests overly fearful youngsters are at high risk of later emotional distress.</p>\n<p>When they began their studies two decades ago, Kalin and Shelton knew that they would first have to find cues that elicit fear and identify behaviors that reflect different types of anxiety. With such information in hand, they could then proceed to determine the age at which monkeys begin to match defensive behaviors selectively to specific cues. Finally, by determining the parts of the brain that reach maturity during the same time span, they could gain clues to the regions that underlie the regulation of fear and fear-related behavior.</p>\n<p>The experiments were carried out at the University of Wisconsin-Madison. Kalin and Shelton discerned varied behaviors by exposing monkeys between six and 12 months old to three related situations. In the alone condition, an animal was separated from its mother and left by itself in a cage for ten minutes. In the no-eye-contact condition, a person stood motionless outside the cage and avoided looking at the solitary infant. In the stare condition, a person was again present and motionless but, assuming a neutral expression, peered directly at the animal. These positions are no more frightening than those that primates encounter frequently in the wild, or those that human infants meet whenever they are left at a day-care centre.</p>\n<p>In the alone condition, most monkeys became very active and emitted frequent gentle “coo” calls made with pursed lips. More than 40 years ago it was deduced that when an infant monkey is separated from its mother, it yearns to regain the closeness and security provided by nearness to the parent. These responses help to draw the mother's attention. In contrast, in the more frightening no-eye-contact situation, the monkeys reduced their activity greatly and sometimes froze for extended periods of time. When an infant spots a potential predator, its goal shifts from attracting the mother to becoming inconspicuous. Inhibiting motion and freezing are common attempts to achieve this in many species. If the infant perceives that it has been detected, its aim shifts to warding off an attack. So the stare condition evoked a third set of responses. The monkeys made several hostile gestures: barking (forcing air from the abdomen through the vocal cords to emit a harsh, growl-like sound) and staring back. Sometimes the animals mixed the threatening displays with submissive ones, such as fear grimaces, which look something like wary grins, or grinding of teeth.</p>\n<p>Having identified three categories of defensive behaviours, Kalin and Shelton set about determining when infant monkeys first begin to apply them effectively. Several lines of work had led them to surmise that the ability to make such choices emerges when an infant is around two months old. To establish the critical period of development, they examined four groups of infant monkeys ranging in age up to 12 weeks old. The babies were separated from their mothers, left to acclimatise to a cage, and then exposed to the alone, no-eye-contact and stare conditions. All sessions were videotaped for analysis. They found that the infants in the youngest group (no more than two weeks old) engaged in defensive behaviours, but they lacked some motor control and seemed to act randomly, as if they had not noticed the human beings that were present. Babies in the two intermediate-age groups had good motor control, but their actions seemed unrelated to the test condition. Only animals in the oldest group (nine- to 12-week-old) conducted themselves differently in each situation, and their reactions were both appropriate and identical to those of mature monkeys. This finding meant motor control was not the prime determinant of selective responding and that nine to 12 weeks is the critical age for the appearance of a monkey's ability to adaptively modulate its defensive activity to meet changing demands.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -34,7 +34,7 @@
         "q3",
         "q4"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n                <h4>Questions 27–30</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>27</strong> In the first paragraph, the writer points out that</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A fear and stress are different feelings.</label></li>\n                        <li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B most humans develop strategies for dealing with fear.</label></li>\n                        <li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C business situations cause more fear than others.</label></li>\n                        <li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D some people never experience fear.</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> When discussing the use of rhesus monkeys as experimental subjects, the writer notes that</p>\n                    <ul class=\"mcq-options\">\n                        <li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A they react more quickly to fear than humans.</label></li>\n                        <li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B they are more influenced by fear than humans.</label></li>\n                        <li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C their mental growth resembles that of humans.</label></li>\n                        <li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D their brains work more slowly than those of humans.</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> Which of the following did Kalin and Shelton outline as the second stage in their research project?</p>\n                     <ul class=\"mcq-options\">\n                        <li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A the identification of expressions of anxiety in monkeys</label></li>\n                        <li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B the identification of situations that arouse stress in monkeys</label></li>\n                        <li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C an analysis of brain development in monkeys</label></li>\n                        <li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D the study of reactions to fear in monkeys of different ages</label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>30</strong> In the fourth paragraph, the writer notes that the three related situations</p>\n                     <ul class=\"mcq-options\">\n                        <li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A reflect common experiences for infant humans and monkeys.</label></li>\n                        <li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B highlight the similarities between monkey and human infant care.</label></li>\n                        <li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C were predicted to cause monkeys more distress than human infants.</label></li>\n                        <li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D were graded in terms of their potential effect on young monkeys.</label></li>\n                    </ul>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-anchor\">\n<h4>Questions 27–30</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> In the first paragraph, the writer points out that</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A fear and stress are different feelings.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B most humans develop strategies for dealing with fear.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C business situations cause more fear than others.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D some people never experience fear.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> When discussing the use of rhesus monkeys as experimental subjects, the writer notes that</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A they react more quickly to fear than humans.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B they are more influenced by fear than humans.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C their mental growth resembles that of humans.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D their brains work more slowly than those of humans.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Which of the following did Kalin and Shelton outline as the second stage in their research project?</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A the identification of expressions of anxiety in monkeys</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B the identification of situations that arouse stress in monkeys</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C an analysis of brain development in monkeys</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D the study of reactions to fear in monkeys of different ages</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> In the fourth paragraph, the writer notes that the three related situations</p>\n<ul class=\"mcq-options\">\n<li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A reflect common experiences for infant humans and monkeys.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B highlight the similarities between monkey and human infant care.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C were predicted to cause monkeys more distress than human infants.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D were graded in terms of their potential effect on young monkeys.</label></li>\n</ul>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n                <h4>Questions 31–35</h4>\n                <p>Look at the following responses of monkeys and the list of conditions below.</p>\n                <p>Match each response with the correct condition, <strong>A, B</strong> or <strong>C</strong>.</p>\n                <p><em>NB You may use any letter more than once.</em></p>\n                <div style=\"padding:10px; border:1px solid var(--line); border-radius:8px; margin-top:12px; background: var(--bg);\">\n                    <strong>List of Conditions</strong><br>\n                    <strong>A</strong> the alone condition<br>\n                    <strong>B</strong> the no-eye-contact condition<br>\n                    <strong>C</strong> the stare condition\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>31</strong> aggressive facial expressions</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"A\"> A</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"B\"> B</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"C\"> C</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>32</strong> prolonged stillness</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"A\"> A</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"B\"> B</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"C\"> C</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> a combination of contradictory signals</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"A\"> A</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"B\"> B</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"C\"> C</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>34</strong> appeals for maternal protection</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"A\"> A</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"B\"> B</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"C\"> C</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>35</strong> the production of soft sounds</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"A\"> A</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"B\"> B</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"C\"> C</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q5-6-7-8-9-anchor\">\n<h4>Questions 31–35</h4>\n<p>Look at the following responses of monkeys and the list of conditions below.</p>\n<p>Match each response with the correct condition, <strong>A, B</strong> or <strong>C</strong>.</p>\n<p><em>NB You may use any letter more than once.</em></p>\n<div style=\"padding:10px; border:1px solid var(--line); border-radius:8px; margin-top:12px; background: var(--bg);\">\n<strong>List of Conditions</strong><br>\n<strong>A</strong> the alone condition<br>\n<strong>B</strong> the no-eye-contact condition<br>\n<strong>C</strong> the stare condition\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> aggressive facial expressions</p>\n<div class=\"radio-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q5\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q5\" type=\"radio\" value=\"C\"> C</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> prolonged stillness</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q6\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q6\" type=\"radio\" value=\"C\"> C</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> a combination of contradictory signals</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q7\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q7\" type=\"radio\" value=\"C\"> C</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> appeals for maternal protection</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q8\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q8\" type=\"radio\" value=\"C\"> C</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> the production of soft sounds</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"> A</label> <label><input name=\"q9\" type=\"radio\" value=\"B\"> B</label> <label><input name=\"q9\" type=\"radio\" value=\"C\"> C</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n                 <h4>Questions 36–40</h4>\n                <p>Complete the summary below.</p>\n                <p>Choose <strong>NO MORE THAN THREE WORDS AND/OR A NUMBER</strong> from the passage for each answer.</p>\n                <div class=\"summary-completion\">\n                    <p>Once they had identified three types of defensive behaviour, Kalin and Shelton grouped the monkeys according to their <input type=\"text\" id=\"q36_input\" name=\"q10\">, in order to discover precisely when they were able to respond appropriately to different fear-related cues. They videotaped their results and found that monkeys as young as <input type=\"text\" id=\"q37_input\" name=\"q11\"> reacted to the cues but in a haphazard fashion. The researchers noted that they seemed to be unaware of the <input type=\"text\" id=\"q38_input\" name=\"q12\"> who were around them. Despite demonstrating <input type=\"text\" id=\"q39_input\" name=\"q13\">, the monkeys in the middle groups failed to react in ways corresponding to the experimental situation. The oldest group, however, reacted in the same way as <input type=\"text\" id=\"q40_input\" name=\"q14\">, and the researchers concluded that monkeys are capable of selective responding between nine and 12 weeks old.</p>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN THREE WORDS AND/OR A NUMBER</strong> from the passage for each answer.</p>\n<div class=\"summary-completion\">\n<p>Once they had identified three types of defensive behaviour, Kalin and Shelton grouped the monkeys according to their <input type=\"text\" id=\"q36_input\" name=\"q10\">, in order to discover precisely when they were able to respond appropriately to different fear-related cues. They videotaped their results and found that monkeys as young as <input type=\"text\" id=\"q37_input\" name=\"q11\"> reacted to the cues but in a haphazard fashion. The researchers noted that they seemed to be unaware of the <input type=\"text\" id=\"q38_input\" name=\"q12\"> who were around them. Despite demonstrating <input type=\"text\" id=\"q39_input\" name=\"q13\">, the monkeys in the middle groups failed to react in ways corresponding to the experimental situation. The oldest group, however, reacted in the same way as <input type=\"text\" id=\"q40_input\" name=\"q14\">, and the researchers concluded that monkeys are capable of selective responding between nine and 12 weeks old.</p>\n</div>\n</div>"
     }
   ],
   "answerKey": {
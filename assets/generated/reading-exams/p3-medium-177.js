@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>The Art of Deception</h3>\n            <h5>Do tiny changes of facial expression show whether someone is telling lies?</h5>\n            \n            <p>Forty years ago, the research psychologist Dr Paul Ekman was addressing a group of young psychiatrists in training when he was asked a question, the answer to which has kept him busy ever since. Suppose the group wanted to know whether a particular patient who swears they are telling the truth really is. They look and sound sincere. So here is the question: is there any way you can be sure they are telling the truth? Ekman did not know the answer then, but he wanted to find out.</p>\n            <p>As part of his research, he had already filmed a series of 12-minute interviews with psychiatric patients. In a subsequent conversation, one of the patients told him that she had lied to him. So Ekman sat and looked at the film but saw nothing noteworthy. Then he slowed it down and looked again. Then he slowed it down even further. And suddenly, there, across just two frames of the film, he saw it: an intense expression of extreme anguish. It lasted less than a fifteenth of a second, but once he had spotted the first expression, he soon found three more examples in that same interview. He termed his discovery \"micro-expressions”: very rapid, intense demonstrations of emotion that the subject intended to conceal.</p>\n            <p>Over the course of the next four decades, Ekman successfully demonstrated a proposition first suggested by Charles Darwin: that the ways in which we express rage, disgust, contempt, fear, surprise, happiness and sadness are universal. The facial muscles triggered by those seven basic emotions are, he has shown, essentially standard, regardless of language and culture, from the US to Japan and Brazil to Papua New Guinea. What is more, expressions of emotion are impossible to suppress and, particularly when we are lying, micro-expressions of powerfully felt emotions will inevitably flit across our face before we get the chance to stop them.</p>\n            <p>Fortunately for liars, most people will fail to spot these fleeting signals of inner torment. Of the 15,000 Ekman has tested, only 50 people, whom he calls “naturals”, have been able to do it. But given a little more training, Ekman says, almost anyone can develop the skill. He should know: since these tests were completed in the mid-1980s and the first publication of his research, he has been called in by the FBI and CIA (among countless more law-enforcement and other agencies around the world), not just to solve cases, but to teach them how to use his technique for themselves. He has held workshops for defence and prosecution lawyers, health professionals, even jealous spouses, all of them wanting to know exactly when someone is not being 100 percent candid.</p>\n            <p>Most recently, Ekman's research has resulted in a new television series about the exploits of the fictional Dr Cal Lightman, a scientist who studies involuntary body language to discover not only if you are lying, but why you might have been motivated to do so. According to the publicity blurb, Lightman is a human lie detector, even more accurate than a polygraph test. Ekman concedes he was sceptical when the producer first approached him with the idea of turning his life's work into a TV series, and initially would have stopped the project if he could. In particular, he was fearful that the show would exaggerate the effectiveness of his techniques and create the quite inaccurate impression among audiences that criminals could no longer hope to get away with lying. In the worst-case scenario, he was concerned about unfair convictions—that one day someone not properly trained in his techniques might be sitting on a jury and wrongly find someone guilty of a crime simply on the basis of a television programme.</p>\n            <p>In the end, though, he was won over because the series is unusual in several respects. It is the first time, as far as Ekman is aware, that a commercial TV drama has been based on the work of just one scientist. That scientist is also deeply involved in the project, talking through plot ideas and checking five successive drafts of each script to ensure details are correct. He was also impressed with the producer's manifestly serious and well-intentioned reasons for making the programme. Now that the first series has been completed, he believes probably 80–90 per cent of the show is based on fact and that's good enough for what it is. After all, it is a drama, not a documentary.</p>\n            <p>Ekman, incidentally, professes to have been a terrible liar ever since he was a small boy and observes that the ability to detect a lie and the ability to lie successfully are completely unrelated. He has been asked by people running for high office if he could teach them to become more credible with the public but has always refused to use his skills in that way on ethical grounds. He also insists that there are various kinds of lies. A “true” lie can be identified by having two essential characteristics: there must be a deliberate intent to mislead and there must be no notification that this is what is occurring. This means that an actor or a poker player isn't a true liar. They are supposed to deceive you—it's part of the game-and the same is true of flattery. He prefers to focus on the kinds of lies where the liar would be in grave trouble if they were found out, and where the target would feel properly aggrieved if they knew.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>The Art of Deception</h3>\n<h5>Do tiny changes of facial expression show whether someone is telling lies?</h5>\n<p>Forty years ago, the research psychologist Dr Paul Ekman was addressing a group of young psychiatrists in training when he was asked a question, the answer to which has kept him busy ever since. Suppose the group wanted to know whether a particular patient who swears they are telling the truth really is. They look and sound sincere. So here is the question: is there any way you can be sure they are telling the truth? Ekman did not know the answer then, but he wanted to find out.</p>\n<p>As part of his research, he had already filmed a series of 12-minute interviews with psychiatric patients. In a subsequent conversation, one of the patients told him that she had lied to him. So Ekman sat and looked at the film but saw nothing noteworthy. Then he slowed it down and looked again. Then he slowed it down even further. And suddenly, there, across just two frames of the film, he saw it: an intense expression of extreme anguish. It lasted less than a fifteenth of a second, but once he had spotted the first expression, he soon found three more examples in that same interview. He termed his discovery \"micro-expressions”: very rapid, intense demonstrations of emotion that the subject intended to conceal.</p>\n<p>Over the course of the next four decades, Ekman successfully demonstrated a proposition first suggested by Charles Darwin: that the ways in which we express rage, disgust, contempt, fear, surprise, happiness and sadness are universal. The facial muscles triggered by those seven basic emotions are, he has shown, essentially standard, regardless of language and culture, from the US to Japan and Brazil to Papua New Guinea. What is more, expressions of emotion are impossible to suppress and, particularly when we are lying, micro-expressions of powerfully felt emotions will inevitably flit across our face before we get the chance to stop them.</p>\n<p>Fortunately for liars, most people will fail to spot these fleeting signals of inner torment. Of the 15,000 Ekman has tested, only 50 people, whom he calls “naturals”, have been able to do it. But given a little more training, Ekman says, almost anyone can develop the skill. He should know: since these tests were completed in the mid-1980s and the first publication of his research, he has been called in by the FBI and CIA (among countless more law-enforcement and other agencies around the world), not just to solve cases, but to teach them how to use his technique for themselves. He has held workshops for defence and prosecution lawyers, health professionals, even jealous spouses, all of them wanting to know exactly when someone is not being 100 percent candid.</p>\n<p>Most recently, Ekman's research has resulted in a new television series about the exploits of the fictional Dr Cal Lightman, a scientist who studies involuntary body language to discover not only if you are lying, but why you might have been motivated to do so. According to the publicity blurb, Lightman is a human lie detector, even more accurate than a polygraph test. Ekman concedes he was sceptical when the producer first approached him with the idea of turning his life's work into a TV series, and initially would have stopped the project if he could. In particular, he was fearful that the show would exaggerate the effectiveness of his techniques and create the quite inaccurate impression among audiences that criminals could no longer hope to get away with lying. In the worst-case scenario, he was concerned about unfair convictions—that one day someone not properly trained in his techniques might be sitting on a jury and wrongly find someone guilty of a crime simply on the basis of a television programme.</p>\n<p>In the end, though, he was won over because the series is unusual in several respects. It is the first time, as far as Ekman is aware, that a commercial TV drama has been based on the work of just one scientist. That scientist is also deeply involved in the project, talking through plot ideas and checking five successive drafts of each script to ensure details are correct. He was also impressed with the producer's manifestly serious and well-intentioned reasons for making the programme. Now that the first series has been completed, he believes probably 80–90 per cent of the show is based on fact and that's good enough for what it is. After all, it is a drama, not a documentary.</p>\n<p>Ekman, incidentally, professes to have been a terrible liar ever since he was a small boy and observes that the ability to detect a lie and the ability to lie successfully are completely unrelated. He has been asked by people running for high office if he could teach them to become more credible with the public but has always refused to use his skills in that way on ethical grounds. He also insists that there are various kinds of lies. A “true” lie can be identified by having two essential characteristics: there must be a deliberate intent to mislead and there must be no notification that this is what is occurring. This means that an actor or a poker player isn't a true liar. They are supposed to deceive you—it's part of the game-and the same is true of flattery. He prefers to focus on the kinds of lies where the liar would be in grave trouble if they were found out, and where the target would feel properly aggrieved if they knew.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 27–31</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>27</strong> According to the writer, Ekman became interested in lying after a question from his</p>\n                    <div class=\"mcq-options\">\n                        <label><input name=\"q1\" type=\"radio\" value=\"A\"> A peers.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"B\"> B patients.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"C\"> C students.</label>\n                        <label><input name=\"q1\" type=\"radio\" value=\"D\"> D teachers.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>28</strong> The writer refers to the 12-minute interviews in order to</p>\n                    <div class=\"mcq-options\">\n                        <label><input name=\"q2\" type=\"radio\" value=\"A\"> A illustrate how frequently patients lie.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"B\"> B describe the origins of Ekman's theories.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"C\"> C compare Ekman's research to previous studies.</label>\n                        <label><input name=\"q2\" type=\"radio\" value=\"D\"> D show how patients' behaviour is affected by filming.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>29</strong> What is the writer's point in the third paragraph?</p>\n                    <div class=\"mcq-options\">\n                        <label><input name=\"q3\" type=\"radio\" value=\"A\"> A Micro-expressions are common to all people.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"B\"> B Recent research has refuted an old idea.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"C\"> C With practice we can learn to control our micro-expressions.</label>\n                        <label><input name=\"q3\" type=\"radio\" value=\"D\"> D Human society is too complex to allow for generalisations.</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>30</strong> What are we told about Ekman's conclusions from his tests?</p>\n                    <div class=\"mcq-options\">\n                        <label><input name=\"q4\" type=\"radio\" value=\"A\"> A It's natural for people to lie.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"B\"> B Few untrained people can detect lying.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"C\"> C Most liars suffer from periods of depression.</label>\n                        <label><input name=\"q4\" type=\"radio\" value=\"D\"> D All of his subjects were trained to identify micro-expressions.</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>31</strong> What point does the writer make about Ekman's techniques in the fourth paragraph?</p>\n                    <div class=\"mcq-options\">\n                        <label><input name=\"q5\" type=\"radio\" value=\"A\"> A They take a decade to teach.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"B\"> B They have been in great demand.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"C\"> C They have aroused the suspicions of some agencies.</label>\n                        <label><input name=\"q5\" type=\"radio\" value=\"D\"> D They can be used by a limited range of occupations.</label>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> According to the writer, Ekman became interested in lying after a question from his</p>\n<div class=\"mcq-options\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A peers.</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B patients.</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C students.</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D teachers.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> The writer refers to the 12-minute interviews in order to</p>\n<div class=\"mcq-options\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A illustrate how frequently patients lie.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B describe the origins of Ekman's theories.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C compare Ekman's research to previous studies.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D show how patients' behaviour is affected by filming.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> What is the writer's point in the third paragraph?</p>\n<div class=\"mcq-options\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A Micro-expressions are common to all people.</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B Recent research has refuted an old idea.</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C With practice we can learn to control our micro-expressions.</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D Human society is too complex to allow for generalisations.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What are we told about Ekman's conclusions from his tests?</p>\n<div class=\"mcq-options\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A It's natural for people to lie.</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B Few untrained people can detect lying.</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C Most liars suffer from periods of depression.</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D All of his subjects were trained to identify micro-expressions.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> What point does the writer make about Ekman's techniques in the fourth paragraph?</p>\n<div class=\"mcq-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"> A They take a decade to teach.</label> <label><input name=\"q5\" type=\"radio\" value=\"B\"> B They have been in great demand.</label> <label><input name=\"q5\" type=\"radio\" value=\"C\"> C They have aroused the suspicions of some agencies.</label> <label><input name=\"q5\" type=\"radio\" value=\"D\"> D They can be used by a limited range of occupations.</label>\n</div>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -48,7 +48,7 @@
         "q9",
         "q10"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-10-anchor\">\n                <h4>Questions 32–36</h4>\n                <p>Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n                <div class=\"summary-completion\">\n                    <h5>The television series based on Ekman's work</h5>\n                    <p>A new TV series based on Ekman's work features a hero named Lightman, who detects lies. Initially, Ekman was unenthusiastic about the TV project because he feared the possibility of encouraging viewers' <strong>32</strong> <input type=\"text\" id=\"q32_input\" maxlength=\"1\" name=\"q6\">. For example, he was worried that one day the programme could result in <strong>33</strong> <input type=\"text\" id=\"q33_input\" maxlength=\"1\" name=\"q7\"> not being carried out. Ultimately, though, he has given the show his blessing because he is not aware of any other comparable programme based on a single person's <strong>34</strong> <input type=\"text\" id=\"q34_input\" maxlength=\"1\" name=\"q8\">. The <strong>35</strong> <input type=\"text\" id=\"q35_input\" maxlength=\"1\" name=\"q9\"> of the show's producer have been another pleasant surprise considering the genre of the programme. Ekman is happy with the show's overall <strong>36</strong> <input type=\"text\" id=\"q36_input\" maxlength=\"1\" name=\"q10\">.</p>\n                </div>\n                <div class=\"word-list\">\n                    <ul>\n                        <li><strong>A</strong> consequences</li>\n                        <li><strong>B</strong> crimes</li>\n                        <li><strong>C</strong> false beliefs</li>\n                        <li><strong>D</strong> motives</li>\n                        <li><strong>E</strong> justice</li>\n                        <li><strong>F</strong> accuracy</li>\n                        <li><strong>G</strong> acting</li>\n                        <li><strong>H</strong> research</li>\n                        <li><strong>I</strong> ratings</li>\n                    </ul>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-10-anchor\">\n<h4>Questions 32–36</h4>\n<p>Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n<div class=\"summary-completion\">\n<h5>The television series based on Ekman's work</h5>\n<p>A new TV series based on Ekman's work features a hero named Lightman, who detects lies. Initially, Ekman was unenthusiastic about the TV project because he feared the possibility of encouraging viewers' <strong>32</strong> <input type=\"text\" id=\"q32_input\" maxlength=\"1\" name=\"q6\">. For example, he was worried that one day the programme could result in <strong>33</strong> <input type=\"text\" id=\"q33_input\" maxlength=\"1\" name=\"q7\"> not being carried out. Ultimately, though, he has given the show his blessing because he is not aware of any other comparable programme based on a single person's <strong>34</strong> <input type=\"text\" id=\"q34_input\" maxlength=\"1\" name=\"q8\">. The <strong>35</strong> <input type=\"text\" id=\"q35_input\" maxlength=\"1\" name=\"q9\"> of the show's producer have been another pleasant surprise considering the genre of the programme. Ekman is happy with the show's overall <strong>36</strong> <input type=\"text\" id=\"q36_input\" maxlength=\"1\" name=\"q10\">.</p>\n</div>\n<div class=\"word-list\">\n<ul>\n<li><strong>A</strong> consequences</li>\n<li><strong>B</strong> crimes</li>\n<li><strong>C</strong> false beliefs</li>\n<li><strong>D</strong> motives</li>\n<li><strong>E</strong> justice</li>\n<li><strong>F</strong> accuracy</li>\n<li><strong>G</strong> acting</li>\n<li><strong>H</strong> research</li>\n<li><strong>I</strong> ratings</li>\n</ul>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n                 <h4>Questions 37–40</h4>\n                <p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n                 <p>In boxes 37–40 on your answer sheet, write</p>\n                 <ul>\n                    <li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n                    <li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n                    <li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n                </ul>\n                <div class=\"question-item\">\n                    <p><strong>37</strong> Ekman regrets the lies he told as a child.</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>38</strong> People who are good at lying tend to be good at detecting lies.</p>\n                     <div class=\"radio-options\">\n                        <label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>39</strong> Ekman has worked with poker players to help them lie more convincingly.</p>\n                     <div class=\"radio-options\">\n                        <label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>40</strong> Ekman is more interested in the types of lies with serious consequences.</p>\n                     <div class=\"radio-options\">\n                        <label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label>\n                        <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q11-12-13-14-anchor\">\n<h4>Questions 37–40</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<p>In boxes 37–40 on your answer sheet, write</p>\n<ul>\n<li><strong>YES</strong> if the statement agrees with the claims of the writer</li>\n<li><strong>NO</strong> if the statement contradicts the claims of the writer</li>\n<li><strong>NOT GIVEN</strong> if it is impossible to say what the writer thinks about this</li>\n</ul>\n<div class=\"question-item\">\n<p><strong>37</strong> Ekman regrets the lies he told as a child.</p>\n<div class=\"radio-options\">\n<label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> People who are good at lying tend to be good at detecting lies.</p>\n<div class=\"radio-options\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> Ekman has worked with poker players to help them lie more convincingly.</p>\n<div class=\"radio-options\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> Ekman is more interested in the types of lies with serious consequences.</p>\n<div class=\"radio-options\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
     }
   ],
   "answerKey": {
@@ -13,14 +13,14 @@
     "pdfFilename": "87. P3 - The Exploration of Mars 火星探索【次】.pdf",
     "legacyPath": "睡着过项目组/2. 所有文章(11.20)[192篇]/87. P3 - The Exploration of Mars 火星探索【次】/",
     "legacyFilename": "87. P3 - The Exploration of Mars 火星探索【次】.html",
-    "questionIntroHtml": "<h3>Questions</h3>\n            \n            <div class=\"question-group\" id=\"q1-32-section\">\n                <h4>Questions 27–32</h4>\n                <p>The reading passage has eight paragraphs, <strong>A–H</strong>.</p>\n                <p>Which paragraph contains the following information?</p>\n                <p><em>Write the correct letter, <strong>A–H</strong>, in the boxes on your answer sheet.</em></p>\n                <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                        <thead>\n                            <tr>\n                                <th></th>\n                                <th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>27</strong> Martian evidence found on Earth</td>\n                                <td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>28</strong> Mars and Earth may share the same origin of life</td>\n                                <td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>29</strong> Detailed depiction of large-scale agricultural constructions</td>\n                               <td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>30</strong> A project that aims to detect life under conditions similar to those on Mars</td>\n                                <td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>31</strong> Mars has undergone drastic climatic transformation</td>\n                                <td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>32</strong> Scientific attempts to locate liquid water on Mars</td>\n                                <td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td><td><input type=\"radio\" name=\"q6\" value=\"H\"></td>\n                            </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>\n            \n            <div class=\"question-group\" id=\"q7-36-section\">\n                <h4>Questions 33–36</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> How did Percival Lowell describe Mars in this passage?</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q7\" value=\"A\"><span>A Arizona provides the perfect location for observation.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q7\" value=\"B\"><span>B The canals of Mars are wider than those on Earth.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q7\" value=\"C\"><span>C There are clear traces of water and agriculture similar to Earth's.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q7\" value=\"D\"><span>D Active, mobile Martian creatures were seen through telescopes.</span></label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>34</strong> How did people change their view of Mars from the 19th century onwards?</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q8\" value=\"A\"><span>A They experienced a real Martian attack.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q8\" value=\"B\"><span>B They absorbed new ideas through literary works.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q8\" value=\"C\"><span>C They learned new concepts by listening to a famous radio programme.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q8\" value=\"D\"><span>D They attended public lectures given by well-known writers.</span></label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>35</strong> According to the probes sent in the 1960s, which statement about Mars is correct?</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q9\" value=\"A\"><span>A Its landscape is full of rocks and rivers.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q9\" value=\"B\"><span>B It appeared far less dynamic than Earth.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q9\" value=\"C\"><span>C It contained exactly the same substances as the Moon.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q9\" value=\"D\"><span>D Images differed completely from those taken by later probes.</span></label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>36</strong> What is the implication of the project using the technology called SOLID in the Atacama Desert?</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q10\" value=\"A\"><span>A It could be employed to explore organisms under Martian-like conditions.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q10\" value=\"B\"><span>B This technology could not be used to identify life in environments similar to Mars.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q10\" value=\"C\"><span>C The Atacama Desert is the only place on Earth that suits such organisms.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q10\" value=\"D\"><span>D Life has not yet been found anywhere in the Atacama Desert.</span></label></li>\n                    </ul>\n                </div>\n            </div>\n\n            <div class=\"question-group\" id=\"q11-40-section\">\n                <h4>Questions 37–40</h4>\n                <p>Do the following statements agree with the information given in Reading Passage 3?</p>\n                <p>In boxes 37–40 on your answer sheet, write</p>\n                <p style=\"padding-left: 20px;\">\n                    <strong>TRUE</strong> if the statement agrees with the information<br>\n                    <strong>FALSE</strong> if the statement contradicts the information<br>\n                    <strong>NOT GIVEN</strong> if there is no information on this\n                </p>\n\n                <div class=\"question-item\">\n                    <p><strong>37</strong> According to <i>The War of the Worlds</i>, Martian technology surpassed that of humans in every field at the time.</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q11\" value=\"TRUE\"><span>TRUE</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q11\" value=\"FALSE\"><span>FALSE</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q11\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>38</strong> The evidence supplied by the Viking probes has never been challenged.</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q12\" value=\"TRUE\"><span>TRUE</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q12\" value=\"FALSE\"><span>FALSE</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q12\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>39</strong> Analysis of a meteorite from Mars discovered a substance associated with certain germs.</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q13\" value=\"TRUE\"><span>TRUE</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q13\" value=\"FALSE\"><span>FALSE</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q13\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>40</strong> According to Víctor Parro, their project will be sent to Mars once DNA-based life has been identified on Earth.</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q14\" value=\"TRUE\"><span>TRUE</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q14\" value=\"FALSE\"><span>FALSE</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q14\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label></li>\n                    </ul>\n                </div>\n            </div>"
+    "questionIntroHtml": "<h3>Questions</h3>\n<div class=\"question-group\" id=\"q1-32-section\">\n<h4>Questions 27–32</h4>\n<p>The reading passage has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–H</strong>, in the boxes on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>27</strong> Martian evidence found on Earth</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>28</strong> Mars and Earth may share the same origin of life</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>29</strong> Detailed depiction of large-scale agricultural constructions</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>30</strong> A project that aims to detect life under conditions similar to those on Mars</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>31</strong> Mars has undergone drastic climatic transformation</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>32</strong> Scientific attempts to locate liquid water on Mars</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td><td><input type=\"radio\" name=\"q6\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>\n<div class=\"question-group\" id=\"q7-36-section\">\n<h4>Questions 33–36</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>33</strong> How did Percival Lowell describe Mars in this passage?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q7\" value=\"A\"><span>A Arizona provides the perfect location for observation.</span></label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"B\"><span>B The canals of Mars are wider than those on Earth.</span></label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"C\"><span>C There are clear traces of water and agriculture similar to Earth's.</span></label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"D\"><span>D Active, mobile Martian creatures were seen through telescopes.</span></label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> How did people change their view of Mars from the 19th century onwards?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q8\" value=\"A\"><span>A They experienced a real Martian attack.</span></label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"B\"><span>B They absorbed new ideas through literary works.</span></label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"C\"><span>C They learned new concepts by listening to a famous radio programme.</span></label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"D\"><span>D They attended public lectures given by well-known writers.</span></label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> According to the probes sent in the 1960s, which statement about Mars is correct?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q9\" value=\"A\"><span>A Its landscape is full of rocks and rivers.</span></label></li>\n<li><label><input type=\"radio\" name=\"q9\" value=\"B\"><span>B It appeared far less dynamic than Earth.</span></label></li>\n<li><label><input type=\"radio\" name=\"q9\" value=\"C\"><span>C It contained exactly the same substances as the Moon.</span></label></li>\n<li><label><input type=\"radio\" name=\"q9\" value=\"D\"><span>D Images differed completely from those taken by later probes.</span></label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> What is the implication of the project using the technology called SOLID in the Atacama Desert?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q10\" value=\"A\"><span>A It could be employed to explore organisms under Martian-like conditions.</span></label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"B\"><span>B This technology could not be used to identify life in environments similar to Mars.</span></label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"C\"><span>C The Atacama Desert is the only place on Earth that suits such organisms.</span></label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"D\"><span>D Life has not yet been found anywhere in the Atacama Desert.</span></label></li>\n</ul>\n</div>\n</div>\n<div class=\"question-group\" id=\"q11-40-section\">\n<h4>Questions 37–40</h4>\n<p>Do the following statements agree with the information given in Reading Passage 3?</p>\n<p>In boxes 37–40 on your answer sheet, write</p>\n<p style=\"padding-left: 20px;\">\n<strong>TRUE</strong> if the statement agrees with the information<br>\n<strong>FALSE</strong> if the statement contradicts the information<br>\n<strong>NOT GIVEN</strong> if there is no information on this\n</p>\n<div class=\"question-item\">\n<p><strong>37</strong> According to <i>The War of the Worlds</i>, Martian technology surpassed that of humans in every field at the time.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q11\" value=\"TRUE\"><span>TRUE</span></label></li>\n<li><label><input type=\"radio\" name=\"q11\" value=\"FALSE\"><span>FALSE</span></label></li>\n<li><label><input type=\"radio\" name=\"q11\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> The evidence supplied by the Viking probes has never been challenged.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q12\" value=\"TRUE\"><span>TRUE</span></label></li>\n<li><label><input type=\"radio\" name=\"q12\" value=\"FALSE\"><span>FALSE</span></label></li>\n<li><label><input type=\"radio\" name=\"q12\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> Analysis of a meteorite from Mars discovered a substance associated with certain germs.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q13\" value=\"TRUE\"><span>TRUE</span></label></li>\n<li><label><input type=\"radio\" name=\"q13\" value=\"FALSE\"><span>FALSE</span></label></li>\n<li><label><input type=\"radio\" name=\"q13\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> According to Víctor Parro, their project will be sent to Mars once DNA-based life has been identified on Earth.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q14\" value=\"TRUE\"><span>TRUE</span></label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"FALSE\"><span>FALSE</span></label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label></li>\n</ul>\n</div>\n</div>"
   },
   "passage": {
     "blocks": [
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>The Exploration of Mars</h3>\n            \n            <p><strong>A</strong> In 1877, Giovanni Schiaparelli, an Italian astronomer, made drawings and maps of the Martian surface that suggested strange features. The images from telescopes at that time were not as sharp as today's. Schiaparelli said he could see a network of lines, or <i>canali</i>. In 1894, an American astronomer, Percival Lowell, made a series of observations of Mars from his own observatory at Flagstaff, Arizona, U.S.A. Lowell was convinced a great network of canals had been dug to irrigate crops for the Martian race. He suggested that each canal had fertile vegetation on either side, making them noticeable from Earth. Drawings and globes he made show a network of canals and oases all over the planet.</p>\n            <p><strong>B</strong> The idea that there was intelligent life on Mars gained strength in the late 19th century. In 1898, H. G. Wells wrote the science-fiction classic <i>The War of the Worlds</i> about an invading force of Martians who try to conquer Earth. They use highly advanced technology (advanced for 1898) to crush human resistance. In 1917, Edgar Rice Burroughs wrote the first in a series of 11 novels about Mars. Strange beings and rampaging Martian monsters gripped the public's imagination. A radio broadcast by Orson Welles on Halloween night in 1938 of <i>The War of the Worlds</i> caused widespread panic across America; people ran into the streets in their pyjamas—millions believed the dramatic reports of a Martian invasion.</p>\n            <p><strong>C</strong> Probes are very important to our understanding of other planets. Much of our recent knowledge comes from these robotic missions into space. The first images sent back from Mars came from Mariner 4 in July 1965. They showed a cratered and barren landscape, more like the surface of our Moon than Earth. In 1969, Mariners 6 and 7 were launched and took 200 photographs of Mars's southern hemisphere and pole on fly-by missions, but these revealed little more information. In 1971, Mariner 9 became the first spacecraft to orbit the planet, circling every 12 hours. In 1975, the U.S.A. sent two Viking probes, each with an orbiter and a lander. The landers had sampler arms to scoop up Martian rocks and carried out experiments to try to find signs of life. Although no life was found, they sent back the first colour pictures of the planet's surface and atmosphere from pivoting cameras.</p>\n            <p><strong>D</strong> A Martian meteorite found on Earth raised fresh doubts about the above analysis. Meteorite ALH 84001 was discovered in December 1984 in Antarctica by members of the ANSMET project. The sample was ejected from Mars about 17 million years ago and spent 11,000 years in, or on, Antarctic ice sheets. NASA's compositional analysis revealed a kind of magnetite that on Earth is only found in association with certain micro-organisms. Some structures resemble the mineralised casts of terrestrial bacteria and their appendages, fibrils or by-products occurring in the rims of carbonate globules and pre-terrestrial aqueous-alteration regions. The size and shape of the objects are consistent with Earthly fossilised nanobacteria, but the very existence of nanobacteria is still controversial.</p>\n            <p><strong>E</strong> In 1965, the Mariner 4 probe discovered that Mars had no global magnetic field to protect the planet from potentially life-threatening cosmic and solar radiation; observations made in the late 1990s by Mars Global Surveyor confirmed this discovery. Scientists speculate that the lack of magnetic shielding helped the solar wind blow away much of Mars's atmosphere over several billion years. After mapping cosmic-radiation levels at various depths on Mars, researchers concluded that any life within the first several metres of the planet's surface would be killed by lethal doses of radiation. In 2007 it was calculated that DNA and RNA damage would limit life on Mars to depths greater than 7.5 metres below the surface. Therefore, the best places to look for life may be subsurface environments that have not yet been studied. The disappearance of the magnetic field may have played a significant role in Martian climate change. According to scientists' evaluation, Mars's climate gradually transitioned from warm and wet to cold and dry after the magnetic field vanished.</p>\n            <p><strong>F</strong> NASA's recent missions have focused on another question: whether Mars had lakes or oceans of liquid water on its surface in the ancient past. Scientists have found hematite, a mineral that forms only in the presence of water. Thus, the 2004 Mars Exploration Rovers were designed not to look for present or past life, but for evidence of ancient liquid water. Because of Mars's current low atmospheric pressure and temperature, liquid water cannot persist at the surface except, briefly, at the lowest shaded elevations. In March 2004, NASA announced that its rover Opportunity had discovered evidence that Mars was once a wet planet. This raised hopes that evidence of past life might still be found. Later the Mars Express orbiter detected huge reserves of water-ice at Mars's south pole in January 2004.</p>\n            <p><strong>G</strong> Researchers from the Center for Astrobiology (Spain) and the Catholic University of the North in Chile have found an oasis of micro-organisms two metres below the surface of the Atacama Desert. SOLID, a life-detection instrument, could be used in environments similar to Martian sub-soil. “We have named it a <i>microbial oasis</i> because we found micro-organisms developing in a habitat rich in rock salt and other highly hygroscopic compounds that absorb water,” explained Víctor Parro of the Center for Astrobiology. “If similar microbes, or their remains, exist on Mars under comparable conditions, we could detect them with instruments like SOLID,\" Parro added.</p>\n            <p><strong>H</strong> Even more intriguing is an alternative scenario proposed by the Spanish scientists. If samples on Mars were found to use DNA—as Earthly life does—it would be extremely unlikely that such a specialised, complex molecule could have evolved independently on two planets. This would indicate a common origin for Martian and Earth life. Life based on DNA might have appeared first on Mars and then spread to Earth, where it evolved into the myriad plants and creatures alive today. If that proved true, we would face a startling conclusion: we are all Martians. If not, we must continue the search for other signs of life.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>The Exploration of Mars</h3>\n<p><strong>A</strong> In 1877, Giovanni Schiaparelli, an Italian astronomer, made drawings and maps of the Martian surface that suggested strange features. The images from telescopes at that time were not as sharp as today's. Schiaparelli said he could see a network of lines, or <i>canali</i>. In 1894, an American astronomer, Percival Lowell, made a series of observations of Mars from his own observatory at Flagstaff, Arizona, U.S.A. Lowell was convinced a great network of canals had been dug to irrigate crops for the Martian race. He suggested that each canal had fertile vegetation on either side, making them noticeable from Earth. Drawings and globes he made show a network of canals and oases all over the planet.</p>\n<p><strong>B</strong> The idea that there was intelligent life on Mars gained strength in the late 19th century. In 1898, H. G. Wells wrote the science-fiction classic <i>The War of the Worlds</i> about an invading force of Martians who try to conquer Earth. They use highly advanced technology (advanced for 1898) to crush human resistance. In 1917, Edgar Rice Burroughs wrote the first in a series of 11 novels about Mars. Strange beings and rampaging Martian monsters gripped the public's imagination. A radio broadcast by Orson Welles on Halloween night in 1938 of <i>The War of the Worlds</i> caused widespread panic across America; people ran into the streets in their pyjamas—millions believed the dramatic reports of a Martian invasion.</p>\n<p><strong>C</strong> Probes are very important to our understanding of other planets. Much of our recent knowledge comes from these robotic missions into space. The first images sent back from Mars came from Mariner 4 in July 1965. They showed a cratered and barren landscape, more like the surface of our Moon than Earth. In 1969, Mariners 6 and 7 were launched and took 200 photographs of Mars's southern hemisphere and pole on fly-by missions, but these revealed little more information. In 1971, Mariner 9 became the first spacecraft to orbit the planet, circling every 12 hours. In 1975, the U.S.A. sent two Viking probes, each with an orbiter and a lander. The landers had sampler arms to scoop up Martian rocks and carried out experiments to try to find signs of life. Although no life was found, they sent back the first colour pictures of the planet's surface and atmosphere from pivoting cameras.</p>\n<p><strong>D</strong> A Martian meteorite found on Earth raised fresh doubts about the above analysis. Meteorite ALH 84001 was discovered in December 1984 in Antarctica by members of the ANSMET project. The sample was ejected from Mars about 17 million years ago and spent 11,000 years in, or on, Antarctic ice sheets. NASA's compositional analysis revealed a kind of magnetite that on Earth is only found in association with certain micro-organisms. Some structures resemble the mineralised casts of terrestrial bacteria and their appendages, fibrils or by-products occurring in the rims of carbonate globules and pre-terrestrial aqueous-alteration regions. The size and shape of the objects are consistent with Earthly fossilised nanobacteria, but the very existence of nanobacteria is still controversial.</p>\n<p><strong>E</strong> In 1965, the Mariner 4 probe discovered that Mars had no global magnetic field to protect the planet from potentially life-threatening cosmic and solar radiation; observations made in the late 1990s by Mars Global Surveyor confirmed this discovery. Scientists speculate that the lack of magnetic shielding helped the solar wind blow away much of Mars's atmosphere over several billion years. After mapping cosmic-radiation levels at various depths on Mars, researchers concluded that any life within the first several metres of the planet's surface would be killed by lethal doses of radiation. In 2007 it was calculated that DNA and RNA damage would limit life on Mars to depths greater than 7.5 metres below the surface. Therefore, the best places to look for life may be subsurface environments that have not yet been studied. The disappearance of the magnetic field may have played a significant role in Martian climate change. According to scientists' evaluation, Mars's climate gradually transitioned from warm and wet to cold and dry after the magnetic field vanished.</p>\n<p><strong>F</strong> NASA's recent missions have focused on another question: whether Mars had lakes or oceans of liquid water on its surface in the ancient past. Scientists have found hematite, a mineral that forms only in the presence of water. Thus, the 2004 Mars Exploration Rovers were designed not to look for present or past life, but for evidence of ancient liquid water. Because of Mars's current low atmospheric pressure and temperature, liquid water cannot persist at the surface except, briefly, at the lowest shaded elevations. In March 2004, NASA announced that its rover Opportunity had discovered evidence that Mars was once a wet planet. This raised hopes that evidence of past life might still be found. Later the Mars Express orbiter detected huge reserves of water-ice at Mars's south pole in January 2004.</p>\n<p><strong>G</strong> Researchers from the Center for Astrobiology (Spain) and the Catholic University of the North in Chile have found an oasis of micro-organisms two metres below the surface of the Atacama Desert. SOLID, a life-detection instrument, could be used in environments similar to Martian sub-soil. “We have named it a <i>microbial oasis</i> because we found micro-organisms developing in a habitat rich in rock salt and other highly hygroscopic compounds that absorb water,” explained Víctor Parro of the Center for Astrobiology. “If similar microbes, or their remains, exist on Mars under comparable conditions, we could detect them with instruments like SOLID,\" Parro added.</p>\n<p><strong>H</strong> Even more intriguing is an alternative scenario proposed by the Spanish scientists. If samples on Mars were found to use DNA—as Earthly life does—it would be extremely unlikely that such a specialised, complex molecule could have evolved independently on two planets. This would indicate a common origin for Martian and Earth life. Life based on DNA might have appeared first on Mars and then spread to Earth, where it evolved into the myriad plants and creatures alive today. If that proved true, we would face a startling conclusion: we are all Martians. If not, we must continue the search for other signs of life.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -44,7 +44,7 @@
         "q13",
         "q14"
       ],
-      "leadHtml": "<h3>Questions</h3>\n            \n            <div class=\"question-group\" id=\"q1-32-section\">\n                <h4>Questions 27–32</h4>\n                <p>The reading passage has eight paragraphs, <strong>A–H</strong>.</p>\n                <p>Which paragraph contains the following information?</p>\n                <p><em>Write the correct letter, <strong>A–H</strong>, in the boxes on your answer sheet.</em></p>\n                <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                        <thead>\n                            <tr>\n                                <th></th>\n                                <th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>27</strong> Martian evidence found on Earth</td>\n                                <td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>28</strong> Mars and Earth may share the same origin of life</td>\n                                <td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>29</strong> Detailed depiction of large-scale agricultural constructions</td>\n                               <td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>30</strong> A project that aims to detect life under conditions similar to those on Mars</td>\n                                <td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>31</strong> Mars has undergone drastic climatic transformation</td>\n                                <td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>32</strong> Scientific attempts to locate liquid water on Mars</td>\n                                <td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td><td><input type=\"radio\" name=\"q6\" value=\"H\"></td>\n                            </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>\n            \n            <div class=\"question-group\" id=\"q7-36-section\">\n                <h4>Questions 33–36</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> How did Percival Lowell describe Mars in this passage?</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q7\" value=\"A\"><span>A Arizona provides the perfect location for observation.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q7\" value=\"B\"><span>B The canals of Mars are wider than those on Earth.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q7\" value=\"C\"><span>C There are clear traces of water and agriculture similar to Earth's.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q7\" value=\"D\"><span>D Active, mobile Martian creatures were seen through telescopes.</span></label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>34</strong> How did people change their view of Mars from the 19th century onwards?</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q8\" value=\"A\"><span>A They experienced a real Martian attack.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q8\" value=\"B\"><span>B They absorbed new ideas through literary works.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q8\" value=\"C\"><span>C They learned new concepts by listening to a famous radio programme.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q8\" value=\"D\"><span>D They attended public lectures given by well-known writers.</span></label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>35</strong> According to the probes sent in the 1960s, which statement about Mars is correct?</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q9\" value=\"A\"><span>A Its landscape is full of rocks and rivers.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q9\" value=\"B\"><span>B It appeared far less dynamic than Earth.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q9\" value=\"C\"><span>C It contained exactly the same substances as the Moon.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q9\" value=\"D\"><span>D Images differed completely from those taken by later probes.</span></label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>36</strong> What is the implication of the project using the technology called SOLID in the Atacama Desert?</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q10\" value=\"A\"><span>A It could be employed to explore organisms under Martian-like conditions.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q10\" value=\"B\"><span>B This technology could not be used to identify life in environments similar to Mars.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q10\" value=\"C\"><span>C The Atacama Desert is the only place on Earth that suits such organisms.</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q10\" value=\"D\"><span>D Life has not yet been found anywhere in the Atacama Desert.</span></label></li>\n                    </ul>\n                </div>\n            </div>\n\n            <div class=\"question-group\" id=\"q11-40-section\">\n                <h4>Questions 37–40</h4>\n                <p>Do the following statements agree with the information given in Reading Passage 3?</p>\n                <p>In boxes 37–40 on your answer sheet, write</p>\n                <p style=\"padding-left: 20px;\">\n                    <strong>TRUE</strong> if the statement agrees with the information<br>\n                    <strong>FALSE</strong> if the statement contradicts the information<br>\n                    <strong>NOT GIVEN</strong> if there is no information on this\n                </p>\n\n                <div class=\"question-item\">\n                    <p><strong>37</strong> According to <i>The War of the Worlds</i>, Martian technology surpassed that of humans in every field at the time.</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q11\" value=\"TRUE\"><span>TRUE</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q11\" value=\"FALSE\"><span>FALSE</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q11\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>38</strong> The evidence supplied by the Viking probes has never been challenged.</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q12\" value=\"TRUE\"><span>TRUE</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q12\" value=\"FALSE\"><span>FALSE</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q12\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>39</strong> Analysis of a meteorite from Mars discovered a substance associated with certain germs.</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q13\" value=\"TRUE\"><span>TRUE</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q13\" value=\"FALSE\"><span>FALSE</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q13\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label></li>\n                    </ul>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>40</strong> According to Víctor Parro, their project will be sent to Mars once DNA-based life has been identified on Earth.</p>\n                    <ul class=\"options-list\">\n                        <li><label><input type=\"radio\" name=\"q14\" value=\"TRUE\"><span>TRUE</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q14\" value=\"FALSE\"><span>FALSE</span></label></li>\n                        <li><label><input type=\"radio\" name=\"q14\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label></li>\n                    </ul>\n                </div>\n            </div>",
+      "leadHtml": "<h3>Questions</h3>\n<div class=\"question-group\" id=\"q1-32-section\">\n<h4>Questions 27–32</h4>\n<p>The reading passage has eight paragraphs, <strong>A–H</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–H</strong>, in the boxes on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th><th>H</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>27</strong> Martian evidence found on Earth</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td><td><input type=\"radio\" name=\"q1\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>28</strong> Mars and Earth may share the same origin of life</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td><td><input type=\"radio\" name=\"q2\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>29</strong> Detailed depiction of large-scale agricultural constructions</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td><td><input type=\"radio\" name=\"q3\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>30</strong> A project that aims to detect life under conditions similar to those on Mars</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td><td><input type=\"radio\" name=\"q4\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>31</strong> Mars has undergone drastic climatic transformation</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td><td><input type=\"radio\" name=\"q5\" value=\"H\"></td>\n</tr>\n<tr>\n<td><strong>32</strong> Scientific attempts to locate liquid water on Mars</td>\n<td><input type=\"radio\" name=\"q6\" value=\"A\"></td><td><input type=\"radio\" name=\"q6\" value=\"B\"></td><td><input type=\"radio\" name=\"q6\" value=\"C\"></td><td><input type=\"radio\" name=\"q6\" value=\"D\"></td><td><input type=\"radio\" name=\"q6\" value=\"E\"></td><td><input type=\"radio\" name=\"q6\" value=\"F\"></td><td><input type=\"radio\" name=\"q6\" value=\"G\"></td><td><input type=\"radio\" name=\"q6\" value=\"H\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>\n<div class=\"question-group\" id=\"q7-36-section\">\n<h4>Questions 33–36</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>33</strong> How did Percival Lowell describe Mars in this passage?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q7\" value=\"A\"><span>A Arizona provides the perfect location for observation.</span></label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"B\"><span>B The canals of Mars are wider than those on Earth.</span></label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"C\"><span>C There are clear traces of water and agriculture similar to Earth's.</span></label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"D\"><span>D Active, mobile Martian creatures were seen through telescopes.</span></label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> How did people change their view of Mars from the 19th century onwards?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q8\" value=\"A\"><span>A They experienced a real Martian attack.</span></label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"B\"><span>B They absorbed new ideas through literary works.</span></label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"C\"><span>C They learned new concepts by listening to a famous radio programme.</span></label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"D\"><span>D They attended public lectures given by well-known writers.</span></label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> According to the probes sent in the 1960s, which statement about Mars is correct?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q9\" value=\"A\"><span>A Its landscape is full of rocks and rivers.</span></label></li>\n<li><label><input type=\"radio\" name=\"q9\" value=\"B\"><span>B It appeared far less dynamic than Earth.</span></label></li>\n<li><label><input type=\"radio\" name=\"q9\" value=\"C\"><span>C It contained exactly the same substances as the Moon.</span></label></li>\n<li><label><input type=\"radio\" name=\"q9\" value=\"D\"><span>D Images differed completely from those taken by later probes.</span></label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>36</strong> What is the implication of the project using the technology called SOLID in the Atacama Desert?</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q10\" value=\"A\"><span>A It could be employed to explore organisms under Martian-like conditions.</span></label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"B\"><span>B This technology could not be used to identify life in environments similar to Mars.</span></label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"C\"><span>C The Atacama Desert is the only place on Earth that suits such organisms.</span></label></li>\n<li><label><input type=\"radio\" name=\"q10\" value=\"D\"><span>D Life has not yet been found anywhere in the Atacama Desert.</span></label></li>\n</ul>\n</div>\n</div>\n<div class=\"question-group\" id=\"q11-40-section\">\n<h4>Questions 37–40</h4>\n<p>Do the following statements agree with the information given in Reading Passage 3?</p>\n<p>In boxes 37–40 on your answer sheet, write</p>\n<p style=\"padding-left: 20px;\">\n<strong>TRUE</strong> if the statement agrees with the information<br>\n<strong>FALSE</strong> if the statement contradicts the information<br>\n<strong>NOT GIVEN</strong> if there is no information on this\n</p>\n<div class=\"question-item\">\n<p><strong>37</strong> According to <i>The War of the Worlds</i>, Martian technology surpassed that of humans in every field at the time.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q11\" value=\"TRUE\"><span>TRUE</span></label></li>\n<li><label><input type=\"radio\" name=\"q11\" value=\"FALSE\"><span>FALSE</span></label></li>\n<li><label><input type=\"radio\" name=\"q11\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> The evidence supplied by the Viking probes has never been challenged.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q12\" value=\"TRUE\"><span>TRUE</span></label></li>\n<li><label><input type=\"radio\" name=\"q12\" value=\"FALSE\"><span>FALSE</span></label></li>\n<li><label><input type=\"radio\" name=\"q12\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> Analysis of a meteorite from Mars discovered a substance associated with certain germs.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q13\" value=\"TRUE\"><span>TRUE</span></label></li>\n<li><label><input type=\"radio\" name=\"q13\" value=\"FALSE\"><span>FALSE</span></label></li>\n<li><label><input type=\"radio\" name=\"q13\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> According to Víctor Parro, their project will be sent to Mars once DNA-based life has been identified on Earth.</p>\n<ul class=\"options-list\">\n<li><label><input type=\"radio\" name=\"q14\" value=\"TRUE\"><span>TRUE</span></label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"FALSE\"><span>FALSE</span></label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"NOT GIVEN\"><span>NOT GIVEN</span></label></li>\n</ul>\n</div>\n</div>",
       "bodyHtml": ""
     }
   ],
@@ -20,7 +20,7 @@
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n            <p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n            \n            <h3>Unlocking the mystery of dreams</h3>\n            <p>Dreams have captivated thinkers since ancient times, but their mystery is now closer than ever to resolution, thanks to new technology that allows scientists to watch the sleeping brain at work.</p>\n            \n            <p><strong>A</strong> Thousands of years ago, dreams were seen as messages from the gods, and in many cultures, they are still considered prophetic, foretelling things to come. In ancient Greece, sick people slept at the temples of Asclepius, the god of medicine, in order to receive healing dreams. Modern dream science really begins at the end of the 19th century with Sigmund Freud, who theorized that dreams were the expression of unconscious desires often from childhood. He believed that exploring these hidden emotions through analysis could help cure mental illness. After Freud, the most important event in dream science was the discovery in the early 1950s of a phase of sleep characterized by intense brain activity and rapid eye movement (REM).</p>\n            <p><strong>B</strong> Adult humans spend about a quarter of their sleep time in REM, much of it dreaming. People awakened in the midst of REM sleep reported vivid dreams, which led researchers to conclude that most dreaming took place during REM. Using a machine called the electroencephalograph (EEG), researchers were able to see that brain activity during REM resembled that of the brain when the body is awake. The mystery of REM sleep is that even though it may not be essential, it is universal – at least in mammals and even birds. Some researchers think REM may have evolved for physiological reasons. “One thing that's unique about mammals and birds is that they regulate body temperature,” says neuroscientist Jerry Siegel, director of UCLA's Center for Sleep Research. “There's no good evidence that any cold-blooded animal has REM sleep.\" REM sleep heats up the brain and non-REM cools it off, Siegel says, and that could mean that the changing sleep cycles allow the brain to repair itself. “It seems likely that REM sleep is filling a basic physiological function and that dreams are a kind of a side effect, or by-product of this.”</p>\n            <p><strong>C</strong> There is great disagreement about the psychological function of dreams and researchers have come up with some differing theories. On one side are scientists like Harvard's Allan Hobson, who believes that dreams are essentially random. In the 1970s, Hobson and his colleague Robert McCarley proposed what they called the “activation-synthesis hypothesis,” which describes how dreams are formed by nerve signals sent out during REM sleep from a small area at the base of the brain called the pons. These signals, the researchers said, activate the images that we call dreams. That raised questions about dream research. If dreams are insignificant night-time images created by the brain, what is the point of studying them?</p>\n            <p><strong>D</strong> But more recently, new theories have made some scientists take dreams more seriously. In 1997, Mark Solms of the University of Cape Town in South Africa found that there was more than one mechanism in the brain for activating dreams. Since then, Solms has argued that medical diagnostic equipment like functional magnetic resonance imaging (fMRI) and positron emission tomography (PET) that helps researchers watch dreaming brains might actually lend new support to Freud's ideas because the parts of the brain that are most active during dreaming control emotion. Further research has supported Solms's findings. Scientists using PET and fMRI technology to watch the dreaming brain have found that one of the most active areas during REM is the limbic system, which controls our emotions.</p>\n            <p><strong>E</strong> Much less active during REM sleep is the prefrontal cortex, which is associated with logical thinking. That could explain why dreams in REM sleep often lack a coherent story line. Some researchers have also found that people dream in non-REM sleep as well, although those dreams generally are less vivid. Another active part of the brain in REM sleep is the anterior cingulate cortex, which detects differences or inconsistencies. Eric Nofzinger, director of the Sleep Neuroimaging Program at the University of Pittsburgh Medical Center, thinks that could be why people often solve tricky problems in their dreams.</p>\n            <p><strong>F</strong> Deirdre Barrett, assistant professor at Harvard Medical School, would agree. In her book \"The Committee of Sleep,” she describes how painters like Jasper Johns and Salvador Dali found inspiration in their dreams. In her own research on problem solving through dreams, Barrett has found that even ordinary people can solve simple problems in their lives (like how to fit old furniture into a new apartment) if they focus on the dilemma before they fall asleep. There is also evidence that dreaming helps certain kinds of learning. Some researchers have found that dreaming about physical tasks, like a gymnast's floor routine, enhances performance.</p>\n            <p><strong>G</strong> Whatever the function of dreams at night, they clearly can play a role in therapy during the day. The University of Maryland's Clara Hill, who has studied the use of dreams in therapy, says that dreams are a “back door” into a patient's thinking. “Dreams reveal stuff about you that you didn't know was there,” she says. The therapists she trains to work with patients' dreams use dream imagery to uncover hidden emotions and feelings. Rosalind Cartwright from the university medical center in Chicago has been studying depression in divorced men and women, and she is finding that \"good dreamers,\" people who have vivid dreams with strong story lines, are less likely to remain depressed. She thinks that dreaming helps diffuse powerful emotions. \"Dreaming is a mental-health activity,” she says.</p>\n            \n            <div class=\"empty-space\"></div>\n        </section>\n        \n        <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>Unlocking the mystery of dreams</h3>\n<p>Dreams have captivated thinkers since ancient times, but their mystery is now closer than ever to resolution, thanks to new technology that allows scientists to watch the sleeping brain at work.</p>\n<p><strong>A</strong> Thousands of years ago, dreams were seen as messages from the gods, and in many cultures, they are still considered prophetic, foretelling things to come. In ancient Greece, sick people slept at the temples of Asclepius, the god of medicine, in order to receive healing dreams. Modern dream science really begins at the end of the 19th century with Sigmund Freud, who theorized that dreams were the expression of unconscious desires often from childhood. He believed that exploring these hidden emotions through analysis could help cure mental illness. After Freud, the most important event in dream science was the discovery in the early 1950s of a phase of sleep characterized by intense brain activity and rapid eye movement (REM).</p>\n<p><strong>B</strong> Adult humans spend about a quarter of their sleep time in REM, much of it dreaming. People awakened in the midst of REM sleep reported vivid dreams, which led researchers to conclude that most dreaming took place during REM. Using a machine called the electroencephalograph (EEG), researchers were able to see that brain activity during REM resembled that of the brain when the body is awake. The mystery of REM sleep is that even though it may not be essential, it is universal – at least in mammals and even birds. Some researchers think REM may have evolved for physiological reasons. “One thing that's unique about mammals and birds is that they regulate body temperature,” says neuroscientist Jerry Siegel, director of UCLA's Center for Sleep Research. “There's no good evidence that any cold-blooded animal has REM sleep.\" REM sleep heats up the brain and non-REM cools it off, Siegel says, and that could mean that the changing sleep cycles allow the brain to repair itself. “It seems likely that REM sleep is filling a basic physiological function and that dreams are a kind of a side effect, or by-product of this.”</p>\n<p><strong>C</strong> There is great disagreement about the psychological function of dreams and researchers have come up with some differing theories. On one side are scientists like Harvard's Allan Hobson, who believes that dreams are essentially random. In the 1970s, Hobson and his colleague Robert McCarley proposed what they called the “activation-synthesis hypothesis,” which describes how dreams are formed by nerve signals sent out during REM sleep from a small area at the base of the brain called the pons. These signals, the researchers said, activate the images that we call dreams. That raised questions about dream research. If dreams are insignificant night-time images created by the brain, what is the point of studying them?</p>\n<p><strong>D</strong> But more recently, new theories have made some scientists take dreams more seriously. In 1997, Mark Solms of the University of Cape Town in South Africa found that there was more than one mechanism in the brain for activating dreams. Since then, Solms has argued that medical diagnostic equipment like functional magnetic resonance imaging (fMRI) and positron emission tomography (PET) that helps researchers watch dreaming brains might actually lend new support to Freud's ideas because the parts of the brain that are most active during dreaming control emotion. Further research has supported Solms's findings. Scientists using PET and fMRI technology to watch the dreaming brain have found that one of the most active areas during REM is the limbic system, which controls our emotions.</p>\n<p><strong>E</strong> Much less active during REM sleep is the prefrontal cortex, which is associated with logical thinking. That could explain why dreams in REM sleep often lack a coherent story line. Some researchers have also found that people dream in non-REM sleep as well, although those dreams generally are less vivid. Another active part of the brain in REM sleep is the anterior cingulate cortex, which detects differences or inconsistencies. Eric Nofzinger, director of the Sleep Neuroimaging Program at the University of Pittsburgh Medical Center, thinks that could be why people often solve tricky problems in their dreams.</p>\n<p><strong>F</strong> Deirdre Barrett, assistant professor at Harvard Medical School, would agree. In her book \"The Committee of Sleep,” she describes how painters like Jasper Johns and Salvador Dali found inspiration in their dreams. In her own research on problem solving through dreams, Barrett has found that even ordinary people can solve simple problems in their lives (like how to fit old furniture into a new apartment) if they focus on the dilemma before they fall asleep. There is also evidence that dreaming helps certain kinds of learning. Some researchers have found that dreaming about physical tasks, like a gymnast's floor routine, enhances performance.</p>\n<p><strong>G</strong> Whatever the function of dreams at night, they clearly can play a role in therapy during the day. The University of Maryland's Clara Hill, who has studied the use of dreams in therapy, says that dreams are a “back door” into a patient's thinking. “Dreams reveal stuff about you that you didn't know was there,” she says. The therapists she trains to work with patients' dreams use dream imagery to uncover hidden emotions and feelings. Rosalind Cartwright from the university medical center in Chicago has been studying depression in divorced men and women, and she is finding that \"good dreamers,\" people who have vivid dreams with strong story lines, are less likely to remain depressed. She thinks that dreaming helps diffuse powerful emotions. \"Dreaming is a mental-health activity,” she says.</p>\n<div class=\"empty-space\"></div>\n</section>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -35,7 +35,7 @@
         "q4",
         "q5"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n                <h4>Questions 27–31</h4>\n                <p>Reading Passage 3 has seven paragraphs, <strong>A–G</strong>.</p>\n                <p>Which paragraph contains the following information?</p>\n                <p><em>Write the correct letter, <strong>A–G</strong>, in boxes 27–31 on your answer sheet.</em></p>\n                <div style=\"overflow-x: auto;\">\n                    <table class=\"matching-table\">\n                        <thead>\n                            <tr>\n                                <th></th>\n                                <th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th>\n                            </tr>\n                        </thead>\n                        <tbody>\n                            <tr>\n                                <td><strong>27</strong> a reference to the significance of dreams on artists' work</td>\n                                <td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>28</strong> a concern about the usefulness of dream research</td>\n                                <td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>29</strong> the types of living creatures that have REM sleep</td>\n                                <td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td>\n                            </tr>\n                            <tr>\n                                <td><strong>30</strong> research results linking dreams to psychological well-being</td>\n                                <td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td>\n                            </tr>\n                             <tr>\n                                <td><strong>31</strong> an account of how modern research tools have strengthened Freud's theory</td>\n                                <td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td>\n                            </tr>\n                        </tbody>\n                    </table>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q1-2-3-4-5-anchor\">\n<h4>Questions 27–31</h4>\n<p>Reading Passage 3 has seven paragraphs, <strong>A–G</strong>.</p>\n<p>Which paragraph contains the following information?</p>\n<p><em>Write the correct letter, <strong>A–G</strong>, in boxes 27–31 on your answer sheet.</em></p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th></th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th><th>G</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>27</strong> a reference to the significance of dreams on artists' work</td>\n<td><input type=\"radio\" name=\"q1\" value=\"A\"></td><td><input type=\"radio\" name=\"q1\" value=\"B\"></td><td><input type=\"radio\" name=\"q1\" value=\"C\"></td><td><input type=\"radio\" name=\"q1\" value=\"D\"></td><td><input type=\"radio\" name=\"q1\" value=\"E\"></td><td><input type=\"radio\" name=\"q1\" value=\"F\"></td><td><input type=\"radio\" name=\"q1\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>28</strong> a concern about the usefulness of dream research</td>\n<td><input type=\"radio\" name=\"q2\" value=\"A\"></td><td><input type=\"radio\" name=\"q2\" value=\"B\"></td><td><input type=\"radio\" name=\"q2\" value=\"C\"></td><td><input type=\"radio\" name=\"q2\" value=\"D\"></td><td><input type=\"radio\" name=\"q2\" value=\"E\"></td><td><input type=\"radio\" name=\"q2\" value=\"F\"></td><td><input type=\"radio\" name=\"q2\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>29</strong> the types of living creatures that have REM sleep</td>\n<td><input type=\"radio\" name=\"q3\" value=\"A\"></td><td><input type=\"radio\" name=\"q3\" value=\"B\"></td><td><input type=\"radio\" name=\"q3\" value=\"C\"></td><td><input type=\"radio\" name=\"q3\" value=\"D\"></td><td><input type=\"radio\" name=\"q3\" value=\"E\"></td><td><input type=\"radio\" name=\"q3\" value=\"F\"></td><td><input type=\"radio\" name=\"q3\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>30</strong> research results linking dreams to psychological well-being</td>\n<td><input type=\"radio\" name=\"q4\" value=\"A\"></td><td><input type=\"radio\" name=\"q4\" value=\"B\"></td><td><input type=\"radio\" name=\"q4\" value=\"C\"></td><td><input type=\"radio\" name=\"q4\" value=\"D\"></td><td><input type=\"radio\" name=\"q4\" value=\"E\"></td><td><input type=\"radio\" name=\"q4\" value=\"F\"></td><td><input type=\"radio\" name=\"q4\" value=\"G\"></td>\n</tr>\n<tr>\n<td><strong>31</strong> an account of how modern research tools have strengthened Freud's theory</td>\n<td><input type=\"radio\" name=\"q5\" value=\"A\"></td><td><input type=\"radio\" name=\"q5\" value=\"B\"></td><td><input type=\"radio\" name=\"q5\" value=\"C\"></td><td><input type=\"radio\" name=\"q5\" value=\"D\"></td><td><input type=\"radio\" name=\"q5\" value=\"E\"></td><td><input type=\"radio\" name=\"q5\" value=\"F\"></td><td><input type=\"radio\" name=\"q5\" value=\"G\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n</div>",
       "leadHtml": "<h3>Questions</h3>"
     },
     {
@@ -47,7 +47,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n                <h4>Questions 32–35</h4>\n                <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n                <p><em>Write the correct letter in boxes 32–35 on your answer sheet.</em></p>\n                <div class=\"question-item\">\n                    <p><strong>32</strong> In ancient times, people thought that dreams</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q6\" type=\"radio\" value=\"A\"> A sent messages to the gods.</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"B\"> B helped resolve conflict.</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"C\"> C were a sign of physical illness.</label>\n                        <label><input name=\"q6\" type=\"radio\" value=\"D\"> D predicted future events.</label>\n                    </div>\n                </div>\n                <div class=\"question-item\">\n                    <p><strong>33</strong> According to the passage, which of the following happens during REM sleep?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q7\" type=\"radio\" value=\"A\"> A People rarely dream.</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"B\"> B People's dreams become confused.</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"C\"> C The temperature of the brain increases.</label>\n                        <label><input name=\"q7\" type=\"radio\" value=\"D\"> D The brain behaves differently than when you are awake.</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>34</strong> What explanation is suggested in paragraph E for lack of a clear narrative in dreams?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q8\" type=\"radio\" value=\"A\"> A Some dreams occur in non-REM sleep.</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"B\"> B Some dreams are generated in different areas of the brain.</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"C\"> C The part of the brain in control of reasoning is less involved.</label>\n                        <label><input name=\"q8\" type=\"radio\" value=\"D\"> D The part of the brain responsible for feelings is more involved.</label>\n                    </div>\n                </div>\n                 <div class=\"question-item\">\n                    <p><strong>35</strong> According to the passage, which area of the brain helps people find solutions to difficult situations through their dreams?</p>\n                    <div class=\"radio-options\">\n                        <label><input name=\"q9\" type=\"radio\" value=\"A\"> A the anterior cingulate cortex</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"B\"> B the pons</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"C\"> C the limbic system</label>\n                        <label><input name=\"q9\" type=\"radio\" value=\"D\"> D the prefrontal cortex</label>\n                    </div>\n                </div>\n            </div>"
+      "bodyHtml": "<div class=\"group\" id=\"q6-7-8-9-anchor\">\n<h4>Questions 32–35</h4>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<p><em>Write the correct letter in boxes 32–35 on your answer sheet.</em></p>\n<div class=\"question-item\">\n<p><strong>32</strong> In ancient times, people thought that dreams</p>\n<div class=\"radio-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"A\"> A sent messages to the gods.</label> <label><input name=\"q6\" type=\"radio\" value=\"B\"> B helped resolve conflict.</label> <label><input name=\"q6\" type=\"radio\" value=\"C\"> C were a sign of physical illness.</label> <label><input name=\"q6\" type=\"radio\" value=\"D\"> D predicted future events.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> According to the passage, which of the following happens during REM sleep?</p>\n<div class=\"radio-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"A\"> A People rarely dream.</label> <label><input name=\"q7\" type=\"radio\" value=\"B\"> B People's dreams become confused.</label> <label><input name=\"q7\" type=\"radio\" value=\"C\"> C The temperature of the brain increases.</label> <label><input name=\"q7\" type=\"radio\" value=\"D\"> D The brain behaves differently than when you are awake.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> What explanation is suggested in paragraph E for lack of a clear narrative in dreams?</p>\n<div class=\"radio-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"A\"> A Some dreams occur in non-REM sleep.</label> <label><input name=\"q8\" type=\"radio\" value=\"B\"> B Some dreams are generated in different areas of the brain.</label> <label><input name=\"q8\" type=\"radio\" value=\"C\"> C The part of the brain in control of reasoning is less involved.</label> <label><input name=\"q8\" type=\"radio\" value=\"D\"> D The part of the brain responsible for feelings is more involved.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> According to the passage, which area of the brain helps people find solutions to difficult situations through their dreams?</p>\n<div class=\"radio-options\">\n<label><input name=\"q9\" type=\"radio\" value=\"A\"> A the anterior cingulate cortex</label> <label><input name=\"q9\" type=\"radio\" value=\"B\"> B the pons</label> <label><input name=\"q9\" type=\"radio\" value=\"C\"> C the limbic system</label> <label><input name=\"q9\" type=\"radio\" value=\"D\"> D the prefrontal cortex</label>\n</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -59,7 +59,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n                 <h4>Questions 36–40</h4>\n                <p>Look at the following statements (Questions 36–40) and the list of people below.</p>\n                <p>Match each statement with the correct person or people, <strong>A–G</strong>.</p>\n                <p><em>Write the correct letter, <strong>A–G</strong>, in boxes 36–40 on your answer sheet.</em></p>\n\n                <div class=\"match-question-item\">\n                    <p><strong>36</strong> Technology shows there is a link between dreams and the areas of the brain that deal with feelings.</p>\n                    <div class=\"match-dropzone\" data-question=\"q10\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>37</strong> Dreams are meaningless pictures created by the brain.</p>\n                    <div class=\"match-dropzone\" data-question=\"q11\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                     <p><strong>38</strong> Dreaming is a method of calming strong feelings.</p>\n                    <div class=\"match-dropzone\" data-question=\"q12\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                     <p><strong>39</strong> Our dreams can show us unexpected things about ourselves.</p>\n                    <div class=\"match-dropzone\" data-question=\"q13\"></div>\n                </div>\n                <div class=\"match-question-item\">\n                    <p><strong>40</strong> Dreams may be a result of maintaining an essential body function.</p>\n                    <div class=\"match-dropzone\" data-question=\"q14\"></div>\n                </div>\n\n                <div class=\"options-pool\" id=\"people-options-pool\">\n                    <strong>List of People</strong>\n                    <div class=\"pool-items\">\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Jerry Siegel</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Allan Hobson and Robert McCarley</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Mark Solms</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Eric Nofzinger</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Deirdre Barrett</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F Clara Hill</div>\n                        <div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G Rosalind Cartwright</div>\n                    </div>\n                </div>\n            </div>",
+      "bodyHtml": "<div class=\"group\" id=\"q10-11-12-13-14-anchor\">\n<h4>Questions 36–40</h4>\n<p>Look at the following statements (Questions 36–40) and the list of people below.</p>\n<p>Match each statement with the correct person or people, <strong>A–G</strong>.</p>\n<p><em>Write the correct letter, <strong>A–G</strong>, in boxes 36–40 on your answer sheet.</em></p>\n<div class=\"match-question-item\">\n<p><strong>36</strong> Technology shows there is a link between dreams and the areas of the brain that deal with feelings.</p>\n<div class=\"match-dropzone\" data-question=\"q10\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>37</strong> Dreams are meaningless pictures created by the brain.</p>\n<div class=\"match-dropzone\" data-question=\"q11\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>38</strong> Dreaming is a method of calming strong feelings.</p>\n<div class=\"match-dropzone\" data-question=\"q12\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>39</strong> Our dreams can show us unexpected things about ourselves.</p>\n<div class=\"match-dropzone\" data-question=\"q13\"></div>\n</div>\n<div class=\"match-question-item\">\n<p><strong>40</strong> Dreams may be a result of maintaining an essential body function.</p>\n<div class=\"match-dropzone\" data-question=\"q14\"></div>\n</div>\n<div class=\"options-pool\" id=\"people-options-pool\">\n<strong>List of People</strong>\n<div class=\"pool-items\">\n<div class=\"drag-item\" draggable=\"true\" data-option=\"A\">A Jerry Siegel</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"B\">B Allan Hobson and Robert McCarley</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"C\">C Mark Solms</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"D\">D Eric Nofzinger</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"E\">E Deirdre Barrett</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"F\">F Clara Hill</div>\n<div class=\"drag-item\" draggable=\"true\" data-option=\"G\">G Rosalind Cartwright</div>\n</div>\n</div>\n</div>",
       "allowOptionReuse": false
     }
   ],
@@ -13,14 +13,14 @@
     "pdfFilename": "90. P3 - The hazards of multitasking 多任务处理【次】.pdf",
     "legacyPath": "睡着过项目组/2. 所有文章(11.20)[192篇]/90. P3 - The hazards of multitasking 多任务处理【次】/",
     "legacyFilename": "90. P3 - The hazards of multitasking 多任务处理【次】.html",
-    "questionIntroHtml": "<div class=\"question-group\" id=\"q1-31-section\">\n          <h3>Questions 27 – 31</h3>\n          <p>Look at the following theories (Questions 27–31) and the list of people below.</p>\n          <p>Match each theory with the correct person or people, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n          <p><em>Write the correct letter, <strong>A, B, C</strong> or <strong>D</strong>, in the boxes.</em></p>\n          <div class=\"question-item matching-item\">\n            <input name=\"q1\" type=\"text\" id=\"q27_input\" maxlength=\"1\">\n            <p><strong>27</strong> Less attention will be paid to each task when more than one task is attempted at the same time.</p>\n          </div>\n          <div class=\"question-item matching-item\">\n            <input name=\"q2\" type=\"text\" id=\"q28_input\" maxlength=\"1\">\n            <p><strong>28</strong> Repeated changes of task mean that the brain will take a while to adjust.</p>\n          </div>\n          <div class=\"question-item matching-item\">\n            <input name=\"q3\" type=\"text\" id=\"q29_input\" maxlength=\"1\">\n            <p><strong>29</strong> Using the skills required for one task may make performing another one more difficult.</p>\n          </div>\n          <div class=\"question-item matching-item\">\n            <input name=\"q4\" type=\"text\" id=\"q30_input\" maxlength=\"1\">\n            <p><strong>30</strong> When multitasking, the brain can only focus on single tasks for very short periods.</p>\n          </div>\n          <div class=\"question-item matching-item\">\n            <input name=\"q5\" type=\"text\" id=\"q31_input\" maxlength=\"1\">\n            <p><strong>31</strong> Multitasking can lead to a medical problem.</p>\n          </div>\n          <div style=\"margin-top: 16px; padding: 10px; border: 1px solid var(--line); border-radius: 6px;\">\n            <strong>List of People</strong>\n            <ul class=\"options-list\">\n                <li data-letter=\"A\">John Ridley Stroop</li>\n                <li data-letter=\"B\">Ernst Pöppel</li>\n                <li data-letter=\"C\">David E. Meyer</li>\n                <li data-letter=\"D\">Edward Hallowell & John Ratey</li>\n            </ul>\n          </div>\n        </div>\n\n        <div class=\"question-group\" id=\"q6-34-section\">\n          <h3>Questions 32 – 34</h3>\n          <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n          <div class=\"question-item\">\n            <p><strong>32</strong> What is suggested about the worker in the opening paragraph?</p>\n            <ul class=\"radio-options-list\">\n              <li><label><input type=\"radio\" name=\"q6\" value=\"A\"> A Anxiety deprived him of sleep the previous night.</label></li>\n              <li><label><input type=\"radio\" name=\"q6\" value=\"B\"> B He feels overwhelmed by his workload.</label></li>\n              <li><label><input type=\"radio\" name=\"q6\" value=\"C\"> C His manager has expressed disapproval.</label></li>\n              <li><label><input type=\"radio\" name=\"q6\" value=\"D\"> D He finds his work dull and uninteresting.</label></li>\n            </ul>\n          </div>\n          <div class=\"question-item\">\n            <p><strong>33</strong> Drivers and air-traffic controllers are mentioned in the passage because they</p>\n            <ul class=\"radio-options-list\">\n              <li><label><input type=\"radio\" name=\"q7\" value=\"A\"> A need to perform several tasks at once.</label></li>\n              <li><label><input type=\"radio\" name=\"q7\" value=\"B\"> B are unable to maintain concentration.</label></li>\n              <li><label><input type=\"radio\" name=\"q7\" value=\"C\"> C use their time efficiently.</label></li>\n              <li><label><input type=\"radio\" name=\"q7\" value=\"D\"> D cannot afford to make mistakes.</label></li>\n            </ul>\n          </div>\n          <div class=\"question-item\">\n            <p><strong>34</strong> In John Ridley Stroop's experiment, participants found it difficult to</p>\n            <ul class=\"radio-options-list\">\n              <li><label><input type=\"radio\" name=\"q8\" value=\"A\"> A tell one colour from another.</label></li>\n              <li><label><input type=\"radio\" name=\"q8\" value=\"B\"> B match up pairs of similar colours.</label></li>\n              <li><label><input type=\"radio\" name=\"q8\" value=\"C\"> C read out the name of one colour printed in another colour.</label></li>\n              <li><label><input type=\"radio\" name=\"q8\" value=\"D\"> D decide what colour looks appropriate for a particular word.</label></li>\n            </ul>\n          </div>\n        </div>\n\n        <div class=\"question-group\" id=\"q9-39-section\">\n          <h3>Questions 35 – 39</h3>\n          <p>Complete the summary below.</p>\n          <p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n          <div class=\"summary-text\">\n            <h4>Multitasking and its effects on the brain</h4>\n            <p>The stressful nature of multitasking has been shown to affect parts of the brain. The area most affected is the prefrontal cortex, which is found to the rear of the <strong>35</strong> <input name=\"q9\" type=\"text\" id=\"q35_input\">. It is the part of the brain which judges tasks, then puts them in order of importance and allocates <strong>36</strong> <input name=\"q10\" type=\"text\" id=\"q36_input\">; it also enables a worker to resume a task which has been put to one side.</p>\n            <p>A second area, the hippocampus, may also be affected by the stress of multitasking. If any <strong>37</strong> <input name=\"q11\" type=\"text\" id=\"q37_input\"> in the hippocampus are affected, people may have problems with storing <strong>38</strong> <input name=\"q12\" type=\"text\" id=\"q38_input\"> as well as learning <strong>39</strong> <input name=\"q13\" type=\"text\" id=\"q39_input\">.</p>\n          </div>\n        </div>\n\n        <div class=\"question-group\" id=\"q14-section\">\n          <h3>Question 40</h3>\n          <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n          <div class=\"question-item\">\n            <p><strong>40</strong> The main aim of this passage is to</p>\n            <ul class=\"radio-options-list\">\n              <li><label><input type=\"radio\" name=\"q14\" value=\"A\"> A describe areas where multitasking is useful.</label></li>\n              <li><label><input type=\"radio\" name=\"q14\" value=\"B\"> B challenge widely held opinions on multitasking.</label></li>\n              <li><label><input type=\"radio\" name=\"q14\" value=\"C\"> C show the physical damage that multitasking can cause.</label></li>\n              <li><label><input type=\"radio\" name=\"q14\" value=\"D\"> D call for better psychological experiments on multitasking.</label></li>\n            </ul>\n          </div>\n        </div>"
+    "questionIntroHtml": "<div class=\"question-group\" id=\"q1-31-section\">\n<h3>Questions 27 – 31</h3>\n<p>Look at the following theories (Questions 27–31) and the list of people below.</p>\n<p>Match each theory with the correct person or people, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<p><em>Write the correct letter, <strong>A, B, C</strong> or <strong>D</strong>, in the boxes.</em></p>\n<div class=\"question-item matching-item\">\n<input name=\"q1\" type=\"text\" id=\"q27_input\" maxlength=\"1\">\n<p><strong>27</strong> Less attention will be paid to each task when more than one task is attempted at the same time.</p>\n</div>\n<div class=\"question-item matching-item\">\n<input name=\"q2\" type=\"text\" id=\"q28_input\" maxlength=\"1\">\n<p><strong>28</strong> Repeated changes of task mean that the brain will take a while to adjust.</p>\n</div>\n<div class=\"question-item matching-item\">\n<input name=\"q3\" type=\"text\" id=\"q29_input\" maxlength=\"1\">\n<p><strong>29</strong> Using the skills required for one task may make performing another one more difficult.</p>\n</div>\n<div class=\"question-item matching-item\">\n<input name=\"q4\" type=\"text\" id=\"q30_input\" maxlength=\"1\">\n<p><strong>30</strong> When multitasking, the brain can only focus on single tasks for very short periods.</p>\n</div>\n<div class=\"question-item matching-item\">\n<input name=\"q5\" type=\"text\" id=\"q31_input\" maxlength=\"1\">\n<p><strong>31</strong> Multitasking can lead to a medical problem.</p>\n</div>\n<div style=\"margin-top: 16px; padding: 10px; border: 1px solid var(--line); border-radius: 6px;\">\n<strong>List of People</strong>\n<ul class=\"options-list\">\n<li data-letter=\"A\">John Ridley Stroop</li>\n<li data-letter=\"B\">Ernst Pöppel</li>\n<li data-letter=\"C\">David E. Meyer</li>\n<li data-letter=\"D\">Edward Hallowell & John Ratey</li>\n</ul>\n</div>\n</div>\n<div class=\"question-group\" id=\"q6-34-section\">\n<h3>Questions 32 – 34</h3>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>32</strong> What is suggested about the worker in the opening paragraph?</p>\n<ul class=\"radio-options-list\">\n<li><label><input type=\"radio\" name=\"q6\" value=\"A\"> A Anxiety deprived him of sleep the previous night.</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"B\"> B He feels overwhelmed by his workload.</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"C\"> C His manager has expressed disapproval.</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"D\"> D He finds his work dull and uninteresting.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Drivers and air-traffic controllers are mentioned in the passage because they</p>\n<ul class=\"radio-options-list\">\n<li><label><input type=\"radio\" name=\"q7\" value=\"A\"> A need to perform several tasks at once.</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"B\"> B are unable to maintain concentration.</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"C\"> C use their time efficiently.</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"D\"> D cannot afford to make mistakes.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> In John Ridley Stroop's experiment, participants found it difficult to</p>\n<ul class=\"radio-options-list\">\n<li><label><input type=\"radio\" name=\"q8\" value=\"A\"> A tell one colour from another.</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"B\"> B match up pairs of similar colours.</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"C\"> C read out the name of one colour printed in another colour.</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"D\"> D decide what colour looks appropriate for a particular word.</label></li>\n</ul>\n</div>\n</div>\n<div class=\"question-group\" id=\"q9-39-section\">\n<h3>Questions 35 – 39</h3>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-text\">\n<h4>Multitasking and its effects on the brain</h4>\n<p>The stressful nature of multitasking has been shown to affect parts of the brain. The area most affected is the prefrontal cortex, which is found to the rear of the <strong>35</strong> <input name=\"q9\" type=\"text\" id=\"q35_input\">. It is the part of the brain which judges tasks, then puts them in order of importance and allocates <strong>36</strong> <input name=\"q10\" type=\"text\" id=\"q36_input\">; it also enables a worker to resume a task which has been put to one side.</p>\n<p>A second area, the hippocampus, may also be affected by the stress of multitasking. If any <strong>37</strong> <input name=\"q11\" type=\"text\" id=\"q37_input\"> in the hippocampus are affected, people may have problems with storing <strong>38</strong> <input name=\"q12\" type=\"text\" id=\"q38_input\"> as well as learning <strong>39</strong> <input name=\"q13\" type=\"text\" id=\"q39_input\">.</p>\n</div>\n</div>\n<div class=\"question-group\" id=\"q14-section\">\n<h3>Question 40</h3>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>40</strong> The main aim of this passage is to</p>\n<ul class=\"radio-options-list\">\n<li><label><input type=\"radio\" name=\"q14\" value=\"A\"> A describe areas where multitasking is useful.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"B\"> B challenge widely held opinions on multitasking.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"C\"> C show the physical damage that multitasking can cause.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"D\"> D call for better psychological experiments on multitasking.</label></li>\n</ul>\n</div>\n</div>"
   },
   "passage": {
     "blocks": [
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n        <p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n        <h3>The hazards of multitasking</h3>\n        <h4>Doing more than one thing at once – is it always a good idea?</h4>\n        <p>You arrive at the office, review your to-do list and start to feel a headache coming on. You resolve to tackle the items as quickly as possible. While you return calls, you sort e-mail and other letters. You begin keying in slides for tomorrow's presentation. Then your manager comes in wanting an immediate update on sales figures. You have just opened the spreadsheet when a very important customer calls. With the receiver held between your shoulder and your ear, you continue adding up the sales totals until, 15 minutes later, you finally manage, politely, to get rid of the client. You've been multitasking again.</p>\n        <p>You may believe that anyone who wants to get ahead today should master the art of multitasking. However, a recent study by the Families and Work Institute in New York City has found that 45 per cent of US workers believe that they are asked or expected to work on too many tasks at once. Managers may be surprised to learn that they are actually wasting their workers' time. As it turns out, the human brain cannot really master the computer's art of crunching data in the background while moving between process windows. Instead, a growing number of studies show that trying to juggle jobs rather than completing them sequentially can take longer and leave workers with a reduced ability to perform each task. In addition, the stress associated with multitasking may contribute to short-term memory difficulties. The combination results in inefficiency, careless thinking and mistakes – not to mention the possible dangers of divided attention for drivers, air-traffic controllers and others who handle machinery.</p>\n        <p>How can a time-management strategy that has become part of the common wisdom actually be so wrong? Exploring that question requires a closer look at an area of consciousness research that examines how the brain focuses attention. One of the modern foundations of current knowledge of multitasking was laid in 1935, when the American psychologist John Ridley Stroop reported that processing information from one task could cause interference with another. Stroop noticed that when study participants were asked to name the colour of a word – such as 'green' – printed in a different colour – red, for example - they experienced difficulty saying the name of the colour. This phenomenon is thought to occur when two tasks get tangled: the brain must suppress one that has been learned so well that it has become automatic (reading) to attend to a second task that requires concentration (naming the colour).</p>\n        <p>During the past couple of decades, psychologists have probed more deeply into the nature and limitations of multitasking. Psychologist and brain-researcher Ernst Pöppel, of the Ludwig-Maximilian University in Munich, believes that it is impossible to carry out two or three different tasks simultaneously with the same degree of concentration. He says that seemingly simultaneous awareness and processing of information actually take place in 'three-second windows'.</p>\n        <p>In these three-second segments, the brain takes in, as a block, all the data about the environment streaming in from the sensory systems; subsequent events are processed in the next window. So a person can concentrate on a conversation for three seconds, then for three seconds on a crying child, and three seconds on a computer screen. While one subject at a time occupies the foreground of consciousness, the others stay in the background until they, in turn, are given access to the central processor.</p>\n        <p>Another experiment by psychologist David E. Meyer, of the University of Michigan, quantified just how much time we can lose when we shuttle between tasks. The researchers asked test participants to write a report and check their e-mail at the same time. Those individuals who constantly jumped back and forth between the two tasks took about one and a half times as long to finish as those who completed one job before turning to the other. Each switchover from one task to another meant re-thinking and thus involved additional neural resources. In effect, the brain needs time to shut off the rules for one task and to turn on the rules for another. ‘Multitasking saves time only when it is a matter of relaxed, routine tasks,’ Meyer says. It also takes the brain longer to adapt when switching rapidly back to an interrupted task rather than waiting longer before switching back.</p>\n        <p>By its nature multitasking is stressful, and the area in the brain most involved with multitasking is also most affected by the resulting stress. Located behind the forehead, the prefrontal cortex – which neuroscientists call the ‘executive' part of the brain – helps us to assess tasks, prioritise them and assign mental resources. It also 'marks' the spot at which a task has been interrupted, so that we can return to it later. This stress can also affect brain cells in another region, the hippocampus, which is important for forming new memories; damage in that area also makes it difficult for a person to acquire new skills.</p>\n        <p>Psychiatrists Edward Hallowell and John Ratey, of Harvard University, say that multitasking can bring about a brain condition that causes sufferers to constantly seek new information while having difficulties concentrating on its content. All in all, it may be wise to let the e-mail wait while you work on your presentation. You will save time and perform each task better.</p>\n        <div class=\"empty-space\"></div>\n      </div>\n\n      <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>The hazards of multitasking</h3>\n<h4>Doing more than one thing at once – is it always a good idea?</h4>\n<p>You arrive at the office, review your to-do list and start to feel a headache coming on. You resolve to tackle the items as quickly as possible. While you return calls, you sort e-mail and other letters. You begin keying in slides for tomorrow's presentation. Then your manager comes in wanting an immediate update on sales figures. You have just opened the spreadsheet when a very important customer calls. With the receiver held between your shoulder and your ear, you continue adding up the sales totals until, 15 minutes later, you finally manage, politely, to get rid of the client. You've been multitasking again.</p>\n<p>You may believe that anyone who wants to get ahead today should master the art of multitasking. However, a recent study by the Families and Work Institute in New York City has found that 45 per cent of US workers believe that they are asked or expected to work on too many tasks at once. Managers may be surprised to learn that they are actually wasting their workers' time. As it turns out, the human brain cannot really master the computer's art of crunching data in the background while moving between process windows. Instead, a growing number of studies show that trying to juggle jobs rather than completing them sequentially can take longer and leave workers with a reduced ability to perform each task. In addition, the stress associated with multitasking may contribute to short-term memory difficulties. The combination results in inefficiency, careless thinking and mistakes – not to mention the possible dangers of divided attention for drivers, air-traffic controllers and others who handle machinery.</p>\n<p>How can a time-management strategy that has become part of the common wisdom actually be so wrong? Exploring that question requires a closer look at an area of consciousness research that examines how the brain focuses attention. One of the modern foundations of current knowledge of multitasking was laid in 1935, when the American psychologist John Ridley Stroop reported that processing information from one task could cause interference with another. Stroop noticed that when study participants were asked to name the colour of a word – such as 'green' – printed in a different colour – red, for example - they experienced difficulty saying the name of the colour. This phenomenon is thought to occur when two tasks get tangled: the brain must suppress one that has been learned so well that it has become automatic (reading) to attend to a second task that requires concentration (naming the colour).</p>\n<p>During the past couple of decades, psychologists have probed more deeply into the nature and limitations of multitasking. Psychologist and brain-researcher Ernst Pöppel, of the Ludwig-Maximilian University in Munich, believes that it is impossible to carry out two or three different tasks simultaneously with the same degree of concentration. He says that seemingly simultaneous awareness and processing of information actually take place in 'three-second windows'.</p>\n<p>In these three-second segments, the brain takes in, as a block, all the data about the environment streaming in from the sensory systems; subsequent events are processed in the next window. So a person can concentrate on a conversation for three seconds, then for three seconds on a crying child, and three seconds on a computer screen. While one subject at a time occupies the foreground of consciousness, the others stay in the background until they, in turn, are given access to the central processor.</p>\n<p>Another experiment by psychologist David E. Meyer, of the University of Michigan, quantified just how much time we can lose when we shuttle between tasks. The researchers asked test participants to write a report and check their e-mail at the same time. Those individuals who constantly jumped back and forth between the two tasks took about one and a half times as long to finish as those who completed one job before turning to the other. Each switchover from one task to another meant re-thinking and thus involved additional neural resources. In effect, the brain needs time to shut off the rules for one task and to turn on the rules for another. ‘Multitasking saves time only when it is a matter of relaxed, routine tasks,’ Meyer says. It also takes the brain longer to adapt when switching rapidly back to an interrupted task rather than waiting longer before switching back.</p>\n<p>By its nature multitasking is stressful, and the area in the brain most involved with multitasking is also most affected by the resulting stress. Located behind the forehead, the prefrontal cortex – which neuroscientists call the ‘executive' part of the brain – helps us to assess tasks, prioritise them and assign mental resources. It also 'marks' the spot at which a task has been interrupted, so that we can return to it later. This stress can also affect brain cells in another region, the hippocampus, which is important for forming new memories; damage in that area also makes it difficult for a person to acquire new skills.</p>\n<p>Psychiatrists Edward Hallowell and John Ratey, of Harvard University, say that multitasking can bring about a brain condition that causes sufferers to constantly seek new information while having difficulties concentrating on its content. All in all, it may be wise to let the e-mail wait while you work on your presentation. You will save time and perform each task better.</p>\n<div class=\"empty-space\"></div>\n</div>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -44,7 +44,7 @@
         "q13",
         "q14"
       ],
-      "leadHtml": "<div class=\"question-group\" id=\"q1-31-section\">\n          <h3>Questions 27 – 31</h3>\n          <p>Look at the following theories (Questions 27–31) and the list of people below.</p>\n          <p>Match each theory with the correct person or people, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n          <p><em>Write the correct letter, <strong>A, B, C</strong> or <strong>D</strong>, in the boxes.</em></p>\n          <div class=\"question-item matching-item\">\n            <input name=\"q1\" type=\"text\" id=\"q27_input\" maxlength=\"1\">\n            <p><strong>27</strong> Less attention will be paid to each task when more than one task is attempted at the same time.</p>\n          </div>\n          <div class=\"question-item matching-item\">\n            <input name=\"q2\" type=\"text\" id=\"q28_input\" maxlength=\"1\">\n            <p><strong>28</strong> Repeated changes of task mean that the brain will take a while to adjust.</p>\n          </div>\n          <div class=\"question-item matching-item\">\n            <input name=\"q3\" type=\"text\" id=\"q29_input\" maxlength=\"1\">\n            <p><strong>29</strong> Using the skills required for one task may make performing another one more difficult.</p>\n          </div>\n          <div class=\"question-item matching-item\">\n            <input name=\"q4\" type=\"text\" id=\"q30_input\" maxlength=\"1\">\n            <p><strong>30</strong> When multitasking, the brain can only focus on single tasks for very short periods.</p>\n          </div>\n          <div class=\"question-item matching-item\">\n            <input name=\"q5\" type=\"text\" id=\"q31_input\" maxlength=\"1\">\n            <p><strong>31</strong> Multitasking can lead to a medical problem.</p>\n          </div>\n          <div style=\"margin-top: 16px; padding: 10px; border: 1px solid var(--line); border-radius: 6px;\">\n            <strong>List of People</strong>\n            <ul class=\"options-list\">\n                <li data-letter=\"A\">John Ridley Stroop</li>\n                <li data-letter=\"B\">Ernst Pöppel</li>\n                <li data-letter=\"C\">David E. Meyer</li>\n                <li data-letter=\"D\">Edward Hallowell & John Ratey</li>\n            </ul>\n          </div>\n        </div>\n\n        <div class=\"question-group\" id=\"q6-34-section\">\n          <h3>Questions 32 – 34</h3>\n          <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n          <div class=\"question-item\">\n            <p><strong>32</strong> What is suggested about the worker in the opening paragraph?</p>\n            <ul class=\"radio-options-list\">\n              <li><label><input type=\"radio\" name=\"q6\" value=\"A\"> A Anxiety deprived him of sleep the previous night.</label></li>\n              <li><label><input type=\"radio\" name=\"q6\" value=\"B\"> B He feels overwhelmed by his workload.</label></li>\n              <li><label><input type=\"radio\" name=\"q6\" value=\"C\"> C His manager has expressed disapproval.</label></li>\n              <li><label><input type=\"radio\" name=\"q6\" value=\"D\"> D He finds his work dull and uninteresting.</label></li>\n            </ul>\n          </div>\n          <div class=\"question-item\">\n            <p><strong>33</strong> Drivers and air-traffic controllers are mentioned in the passage because they</p>\n            <ul class=\"radio-options-list\">\n              <li><label><input type=\"radio\" name=\"q7\" value=\"A\"> A need to perform several tasks at once.</label></li>\n              <li><label><input type=\"radio\" name=\"q7\" value=\"B\"> B are unable to maintain concentration.</label></li>\n              <li><label><input type=\"radio\" name=\"q7\" value=\"C\"> C use their time efficiently.</label></li>\n              <li><label><input type=\"radio\" name=\"q7\" value=\"D\"> D cannot afford to make mistakes.</label></li>\n            </ul>\n          </div>\n          <div class=\"question-item\">\n            <p><strong>34</strong> In John Ridley Stroop's experiment, participants found it difficult to</p>\n            <ul class=\"radio-options-list\">\n              <li><label><input type=\"radio\" name=\"q8\" value=\"A\"> A tell one colour from another.</label></li>\n              <li><label><input type=\"radio\" name=\"q8\" value=\"B\"> B match up pairs of similar colours.</label></li>\n              <li><label><input type=\"radio\" name=\"q8\" value=\"C\"> C read out the name of one colour printed in another colour.</label></li>\n              <li><label><input type=\"radio\" name=\"q8\" value=\"D\"> D decide what colour looks appropriate for a particular word.</label></li>\n            </ul>\n          </div>\n        </div>\n\n        <div class=\"question-group\" id=\"q9-39-section\">\n          <h3>Questions 35 – 39</h3>\n          <p>Complete the summary below.</p>\n          <p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n          <div class=\"summary-text\">\n            <h4>Multitasking and its effects on the brain</h4>\n            <p>The stressful nature of multitasking has been shown to affect parts of the brain. The area most affected is the prefrontal cortex, which is found to the rear of the <strong>35</strong> <input name=\"q9\" type=\"text\" id=\"q35_input\">. It is the part of the brain which judges tasks, then puts them in order of importance and allocates <strong>36</strong> <input name=\"q10\" type=\"text\" id=\"q36_input\">; it also enables a worker to resume a task which has been put to one side.</p>\n            <p>A second area, the hippocampus, may also be affected by the stress of multitasking. If any <strong>37</strong> <input name=\"q11\" type=\"text\" id=\"q37_input\"> in the hippocampus are affected, people may have problems with storing <strong>38</strong> <input name=\"q12\" type=\"text\" id=\"q38_input\"> as well as learning <strong>39</strong> <input name=\"q13\" type=\"text\" id=\"q39_input\">.</p>\n          </div>\n        </div>\n\n        <div class=\"question-group\" id=\"q14-section\">\n          <h3>Question 40</h3>\n          <p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n          <div class=\"question-item\">\n            <p><strong>40</strong> The main aim of this passage is to</p>\n            <ul class=\"radio-options-list\">\n              <li><label><input type=\"radio\" name=\"q14\" value=\"A\"> A describe areas where multitasking is useful.</label></li>\n              <li><label><input type=\"radio\" name=\"q14\" value=\"B\"> B challenge widely held opinions on multitasking.</label></li>\n              <li><label><input type=\"radio\" name=\"q14\" value=\"C\"> C show the physical damage that multitasking can cause.</label></li>\n              <li><label><input type=\"radio\" name=\"q14\" value=\"D\"> D call for better psychological experiments on multitasking.</label></li>\n            </ul>\n          </div>\n        </div>",
+      "leadHtml": "<div class=\"question-group\" id=\"q1-31-section\">\n<h3>Questions 27 – 31</h3>\n<p>Look at the following theories (Questions 27–31) and the list of people below.</p>\n<p>Match each theory with the correct person or people, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<p><em>Write the correct letter, <strong>A, B, C</strong> or <strong>D</strong>, in the boxes.</em></p>\n<div class=\"question-item matching-item\">\n<input name=\"q1\" type=\"text\" id=\"q27_input\" maxlength=\"1\">\n<p><strong>27</strong> Less attention will be paid to each task when more than one task is attempted at the same time.</p>\n</div>\n<div class=\"question-item matching-item\">\n<input name=\"q2\" type=\"text\" id=\"q28_input\" maxlength=\"1\">\n<p><strong>28</strong> Repeated changes of task mean that the brain will take a while to adjust.</p>\n</div>\n<div class=\"question-item matching-item\">\n<input name=\"q3\" type=\"text\" id=\"q29_input\" maxlength=\"1\">\n<p><strong>29</strong> Using the skills required for one task may make performing another one more difficult.</p>\n</div>\n<div class=\"question-item matching-item\">\n<input name=\"q4\" type=\"text\" id=\"q30_input\" maxlength=\"1\">\n<p><strong>30</strong> When multitasking, the brain can only focus on single tasks for very short periods.</p>\n</div>\n<div class=\"question-item matching-item\">\n<input name=\"q5\" type=\"text\" id=\"q31_input\" maxlength=\"1\">\n<p><strong>31</strong> Multitasking can lead to a medical problem.</p>\n</div>\n<div style=\"margin-top: 16px; padding: 10px; border: 1px solid var(--line); border-radius: 6px;\">\n<strong>List of People</strong>\n<ul class=\"options-list\">\n<li data-letter=\"A\">John Ridley Stroop</li>\n<li data-letter=\"B\">Ernst Pöppel</li>\n<li data-letter=\"C\">David E. Meyer</li>\n<li data-letter=\"D\">Edward Hallowell & John Ratey</li>\n</ul>\n</div>\n</div>\n<div class=\"question-group\" id=\"q6-34-section\">\n<h3>Questions 32 – 34</h3>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>32</strong> What is suggested about the worker in the opening paragraph?</p>\n<ul class=\"radio-options-list\">\n<li><label><input type=\"radio\" name=\"q6\" value=\"A\"> A Anxiety deprived him of sleep the previous night.</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"B\"> B He feels overwhelmed by his workload.</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"C\"> C His manager has expressed disapproval.</label></li>\n<li><label><input type=\"radio\" name=\"q6\" value=\"D\"> D He finds his work dull and uninteresting.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> Drivers and air-traffic controllers are mentioned in the passage because they</p>\n<ul class=\"radio-options-list\">\n<li><label><input type=\"radio\" name=\"q7\" value=\"A\"> A need to perform several tasks at once.</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"B\"> B are unable to maintain concentration.</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"C\"> C use their time efficiently.</label></li>\n<li><label><input type=\"radio\" name=\"q7\" value=\"D\"> D cannot afford to make mistakes.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> In John Ridley Stroop's experiment, participants found it difficult to</p>\n<ul class=\"radio-options-list\">\n<li><label><input type=\"radio\" name=\"q8\" value=\"A\"> A tell one colour from another.</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"B\"> B match up pairs of similar colours.</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"C\"> C read out the name of one colour printed in another colour.</label></li>\n<li><label><input type=\"radio\" name=\"q8\" value=\"D\"> D decide what colour looks appropriate for a particular word.</label></li>\n</ul>\n</div>\n</div>\n<div class=\"question-group\" id=\"q9-39-section\">\n<h3>Questions 35 – 39</h3>\n<p>Complete the summary below.</p>\n<p>Choose <strong>NO MORE THAN TWO WORDS</strong> from the passage for each answer.</p>\n<div class=\"summary-text\">\n<h4>Multitasking and its effects on the brain</h4>\n<p>The stressful nature of multitasking has been shown to affect parts of the brain. The area most affected is the prefrontal cortex, which is found to the rear of the <strong>35</strong> <input name=\"q9\" type=\"text\" id=\"q35_input\">. It is the part of the brain which judges tasks, then puts them in order of importance and allocates <strong>36</strong> <input name=\"q10\" type=\"text\" id=\"q36_input\">; it also enables a worker to resume a task which has been put to one side.</p>\n<p>A second area, the hippocampus, may also be affected by the stress of multitasking. If any <strong>37</strong> <input name=\"q11\" type=\"text\" id=\"q37_input\"> in the hippocampus are affected, people may have problems with storing <strong>38</strong> <input name=\"q12\" type=\"text\" id=\"q38_input\"> as well as learning <strong>39</strong> <input name=\"q13\" type=\"text\" id=\"q39_input\">.</p>\n</div>\n</div>\n<div class=\"question-group\" id=\"q14-section\">\n<h3>Question 40</h3>\n<p>Choose the correct letter, <strong>A, B, C</strong> or <strong>D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>40</strong> The main aim of this passage is to</p>\n<ul class=\"radio-options-list\">\n<li><label><input type=\"radio\" name=\"q14\" value=\"A\"> A describe areas where multitasking is useful.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"B\"> B challenge widely held opinions on multitasking.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"C\"> C show the physical damage that multitasking can cause.</label></li>\n<li><label><input type=\"radio\" name=\"q14\" value=\"D\"> D call for better psychological experiments on multitasking.</label></li>\n</ul>\n</div>\n</div>",
       "bodyHtml": ""
     }
   ],
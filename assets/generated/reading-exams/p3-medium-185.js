@@ -13,14 +13,14 @@
     "pdfFilename": "92. P3 - The Pirahã people of Brazil  巴西皮拉罕部落语言【次】.pdf",
     "legacyPath": "睡着过项目组/2. 所有文章(11.20)[192篇]/92. P3 - The Pirahã people of Brazil  巴西皮拉罕部落语言【次】/",
     "legacyFilename": "92. P3 - The Pirahã people of Brazil  巴西皮拉罕部落语言【次】.html",
-    "questionIntroHtml": "<h2>Questions</h2>\n\n        <div class=\"question-group\" id=\"q1-32-section\">\n          <h3>Questions 27–32</h3>\n          <p style=\"margin-bottom: 12px;\">Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n          <div class=\"question-item\">\n              <p><strong>27</strong> What are we told about Daniel Everett in the first paragraph?</p>\n              <div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n                <label><input name=\"q1\" type=\"radio\" value=\"A\"> A He has lived among the Pirahã since 1977.</label>\n                <label><input name=\"q1\" type=\"radio\" value=\"B\"> B It took him seven years to learn the Pirahã language.</label>\n                <label><input name=\"q1\" type=\"radio\" value=\"C\"> C No one would publish his research for three decades.</label>\n                <label><input name=\"q1\" type=\"radio\" value=\"D\"> D Studying the Pirahã language is the focus of his work.</label>\n              </div>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>28</strong> Which of the following is the best summary of the second paragraph?</p>\n              <div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n                <label><input name=\"q2\" type=\"radio\" value=\"A\"> A Humans are the only species to be linguistically creative.</label>\n                <label><input name=\"q2\" type=\"radio\" value=\"B\"> B Humans, bees, birds and whales share a characteristic.</label>\n                <label><input name=\"q2\" type=\"radio\" value=\"C\"> C Human language is not fully understood by scientists.</label>\n                <label><input name=\"q2\" type=\"radio\" value=\"D\"> D Humans are the only species to use syntax.</label>\n              </div>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>29</strong> Why does the writer refer to subordinate clauses?</p>\n              <div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n                <label><input name=\"q3\" type=\"radio\" value=\"A\"> A to criticise the general approach of linguistics</label>\n                <label><input name=\"q3\" type=\"radio\" value=\"B\"> B to compare two features of the Pirahã language</label>\n                <label><input name=\"q3\" type=\"radio\" value=\"C\"> C to explain why the Pirahã language is difficult to learn</label>\n                <label><input name=\"q3\" type=\"radio\" value=\"D\"> D to exemplify an unusual feature of the Pirahã language</label>\n              </div>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>30</strong> What point does the writer make about the work of Whorf?</p>\n              <div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n                <label><input name=\"q4\" type=\"radio\" value=\"A\"> A He thought that numbers were common to all human languages.</label>\n                <label><input name=\"q4\" type=\"radio\" value=\"B\"> B His theory might be supported by Everett's research.</label>\n                <label><input name=\"q4\" type=\"radio\" value=\"C\"> C His research enabled him to find a new life among the Pirahã.</label>\n                <label><input name=\"q4\" type=\"radio\" value=\"D\"> D He predicted that people like the Pirahã would never be found.</label>\n              </div>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>31</strong> The writer refers to the Warlpiri people in order to</p>\n              <div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n                <label><input name=\"q5\" type=\"radio\" value=\"A\"> A suggest that the Pirahã be taught to count in English.</label>\n                <label><input name=\"q5\" type=\"radio\" value=\"B\"> B show how tribal peoples learn a foreign language.</label>\n                <label><input name=\"q5\" type=\"radio\" value=\"C\"> C compare counting in English and Portuguese.</label>\n                <label><input name=\"q5\" type=\"radio\" value=\"D\"> D illustrate the uniqueness of the Pirahã.</label>\n              </div>\n          </div>\n           <div class=\"question-item\">\n              <p><strong>32</strong> What is Everett's point about the Pirahã's intellectual capacities?</p>\n              <div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n                <label><input name=\"q6\" type=\"radio\" value=\"A\"> A Pirahã students have not graduated from universities.</label>\n                <label><input name=\"q6\" type=\"radio\" value=\"B\"> B He does not want people to criticise their intelligence.</label>\n                <label><input name=\"q6\" type=\"radio\" value=\"C\"> C Their isolation makes it difficult to evaluate their intelligence.</label>\n                <label><input name=\"q6\" type=\"radio\" value=\"D\"> D He believes their language is more complex than their neighbours'.</label>\n              </div>\n          </div>\n        </div>\n\n        <div class=\"question-group\" id=\"q7-36-section\">\n          <h3>Questions 33–36</h3>\n          <p style=\"margin-bottom: 12px;\">Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n          <div class=\"summary-text\">\n            <h4>Everett's explanation</h4>\n            <p>\n              Everett believes that a group's language is a product of their <strong>33</strong> <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> and thus language is infinitely varied. During the time he spent living among them, he observed that the Pirahã only place value on the <strong>34</strong> <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> and have no <strong>35</strong> <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span> to describe completed events. Similarly, the types of names they use reflect the fact that they do not celebrate <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span>.\n            </p>\n          </div>\n          <div id=\"word-options\">\n            <div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"present\">A present</div>\n            <div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"past\">B past</div>\n            <div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"time\">C time</div>\n            <div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"future\">D future</div>\n            <div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"culture\">E culture</div>\n            <div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"grammar\">F grammar</div>\n            <div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"art\">G art</div>\n            <div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"individuality\">H individuality</div>\n            <div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-word=\"children\">I children</div>\n          </div>\n        </div>\n\n        <div class=\"question-group\" id=\"q11-40-section\">\n            <h3>Questions 37–40</h3>\n            <p>Do the following statements agree with the views of the writer in Reading Passage 3? Write <strong>YES</strong>, <strong>NO</strong>, or <strong>NOT GIVEN</strong>.</p>\n            <div class=\"question-item\">\n                <p><strong>37</strong> Everett was surprised by the way his research was greeted.</p>\n                <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                  <label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label>\n                  <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label>\n                  <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div class=\"question-item\">\n                <p><strong>38</strong> Chomsky has been critical of Everett's research methodology.</p>\n                <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                  <label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label>\n                  <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label>\n                  <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div class=\"question-item\">\n                <p><strong>39</strong> If 'recursion' as a universal concept is disproved, Chomsky's ideas about language would be wrong.</p>\n                <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                  <label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label>\n                  <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label>\n                  <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div class=\"question-item\">\n                <p><strong>40</strong> The Pirahã will benefit from their new-found status among academics.</p>\n                <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                  <label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label>\n                  <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label>\n                  <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n        </div>"
+    "questionIntroHtml": "<h2>Questions</h2>\n<div class=\"question-group\" id=\"q1-32-section\">\n<h3>Questions 27–32</h3>\n<p style=\"margin-bottom: 12px;\">Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> What are we told about Daniel Everett in the first paragraph?</p>\n<div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A He has lived among the Pirahã since 1977.</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B It took him seven years to learn the Pirahã language.</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C No one would publish his research for three decades.</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D Studying the Pirahã language is the focus of his work.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Which of the following is the best summary of the second paragraph?</p>\n<div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A Humans are the only species to be linguistically creative.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B Humans, bees, birds and whales share a characteristic.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C Human language is not fully understood by scientists.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D Humans are the only species to use syntax.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Why does the writer refer to subordinate clauses?</p>\n<div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A to criticise the general approach of linguistics</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B to compare two features of the Pirahã language</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C to explain why the Pirahã language is difficult to learn</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D to exemplify an unusual feature of the Pirahã language</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What point does the writer make about the work of Whorf?</p>\n<div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A He thought that numbers were common to all human languages.</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B His theory might be supported by Everett's research.</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C His research enabled him to find a new life among the Pirahã.</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D He predicted that people like the Pirahã would never be found.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> The writer refers to the Warlpiri people in order to</p>\n<div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"> A suggest that the Pirahã be taught to count in English.</label> <label><input name=\"q5\" type=\"radio\" value=\"B\"> B show how tribal peoples learn a foreign language.</label> <label><input name=\"q5\" type=\"radio\" value=\"C\"> C compare counting in English and Portuguese.</label> <label><input name=\"q5\" type=\"radio\" value=\"D\"> D illustrate the uniqueness of the Pirahã.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> What is Everett's point about the Pirahã's intellectual capacities?</p>\n<div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q6\" type=\"radio\" value=\"A\"> A Pirahã students have not graduated from universities.</label> <label><input name=\"q6\" type=\"radio\" value=\"B\"> B He does not want people to criticise their intelligence.</label> <label><input name=\"q6\" type=\"radio\" value=\"C\"> C Their isolation makes it difficult to evaluate their intelligence.</label> <label><input name=\"q6\" type=\"radio\" value=\"D\"> D He believes their language is more complex than their neighbours'.</label>\n</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q7-36-section\">\n<h3>Questions 33–36</h3>\n<p style=\"margin-bottom: 12px;\">Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n<div class=\"summary-text\">\n<h4>Everett's explanation</h4>\n<p>\nEverett believes that a group's language is a product of their <strong>33</strong> <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> and thus language is infinitely varied. During the time he spent living among them, he observed that the Pirahã only place value on the <strong>34</strong> <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> and have no <strong>35</strong> <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span> to describe completed events. Similarly, the types of names they use reflect the fact that they do not celebrate <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span>.\n</p>\n</div>\n<div id=\"word-options\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"present\">A present</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"past\">B past</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"time\">C time</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"future\">D future</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"culture\">E culture</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"grammar\">F grammar</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"art\">G art</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"individuality\">H individuality</div>\n<div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-word=\"children\">I children</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q11-40-section\">\n<h3>Questions 37–40</h3>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3? Write <strong>YES</strong>, <strong>NO</strong>, or <strong>NOT GIVEN</strong>.</p>\n<div class=\"question-item\">\n<p><strong>37</strong> Everett was surprised by the way his research was greeted.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> Chomsky has been critical of Everett's research methodology.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> If 'recursion' as a universal concept is disproved, Chomsky's ideas about language would be wrong.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> The Pirahã will benefit from their new-found status among academics.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>"
   },
   "passage": {
     "blocks": [
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n        <p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n        <h3>The Pirahã people of Brazil</h3>\n        <p><i>The Pirahã language has stirred up debate among experts</i></p>\n        <div id=\"passage-text\">\n            <p>The Pirahã tribe live deep in Brazil's Amazon forest, and their language is hotly debated by linguists. Since 1977, the ethnologist Daniel Everett has spent a total of seven years living with the Pirahã and has committed his career to studying their puzzling speech. Indeed, he was uncertain for so long about what he was actually hearing while living among the Pirahã that he waited nearly three decades before publishing his findings.</p>\n            <p>The debate over the Pirahã language goes right to the core of the riddle regarding how Homo sapiens managed to develop vocal communication. Although bees dance, birds sing and whales even sing with syntax, human language is unique, if only for the reason that it enables humans to piece together never-before-constructed thoughts, and be infinitely imaginative - think of Shakespeare's plays or Einstein's theory of relativity.</p>\n            <p>Linguistics generally focuses on what features all human languages have in common, but the Pirahã language departs from what some academics have long maintained are essential and inalienable features of all human languages. Most of all, it may be unique for not employing subordinate clauses. Instead of saying, ‘When I have finished eating, I will speak to you,' the Pirahã say, 'I finish eating, I speak with you.' Equally perplexing, the Pirahã appear not to use numbers. During the time he spent with them, Everett never heard words like 'all', 'every' and 'more'. There is one word, ‘hoi', that comes close to the numeral 1, but it can also mean 'small'. And they were never observed to count without language, on their fingers for example, in order to determine important tasks in village life like how many pieces of meat to grill.</p>\n            <p>Everett's findings among the Pirahã have brought new life to a controversial theory by the linguist Benjamin Whorf, who suggested that people are only capable of constructing thoughts for which they possess actual words. Or to put it another way, because they have no words for numbers, they cannot even begin to understand the concept of numbers or arithmetic.</p>\n            <p>The Warlpiri language - spoken by a group of Australian Aborigines - like that of the Pirahã, features only the most rudimentary system of counting. However, the Warlpiri people had no difficulty counting farther than three in a foreign language, in this case English, but when Everett attempted to teach the Pirahã how to count in Portuguese, like other Brazilians, not a single person could count to 10.</p>\n            <p>Everett is at pains to point out that the Pirahã are not unintelligent, for their thinking is not any slower than that of the average university student. And although they reside in a remote part of the forest, they do not live in complete genetic isolation, but mix with people from the surrounding populations and share similar intellectual capacities with their neighbours whose languages do contain numbers.</p>\n            <p>Eventually, after some 30 years of research, Everett has come up with a surprising explanation for the peculiarities of the Pirahã language. Language, he believes, is created by a people's way of life, their belief system and values. In this way, variety in human language is almost limitless, a function of the human capacity to live in different ways, such as in the forest. What Everett's research has revealed is that the central tenet of the Pirahã culture is to live in the here and now. The only thing of importance that is worth communicating to others is what is being experienced at that very moment, though this can often be described with great care and detail. In consequence, the language has no means to conjugate verbs in order to describe ‘yesterday' or 'last week' or 'when I was a child'. Their very literal view of the world curtails abstract thought, and many features taken for granted among other peoples are absent among the Pirahã, such as a creation myth, storytelling and painting. One manifestation of their beliefs is that by tradition the names they give their children are not particularly imaginative. Often they are named after other members of the tribe with whom they share similar character traits. Standing out or being different is not encouraged by the Pirahã, and this is reflected in their perhaps colourless choice of names.</p>\n            <p>Everett anticipated that these findings would be controversial and the reaction came as expected. Until this point, many linguists had defended the theories of Noam Chomsky, according to which all human languages have a universal grammar. What exactly makes up this universal grammar is the subject of debate, but at its heart is the concept of 'recursion', which is defined as replication of a structure within its single parts. Without it, humans would not be able to view separate thoughts as subordinate parts of a complex whole. And, most pertinent to Everett's work, there would not be subordinate clauses, which are responsible for translating the concept of recursion into grammar. But if the Pirahã do not form subordinate clauses, then recursion cannot explain the uniqueness of human language, and this would negate Chomsky's theories.</p>\n            <p>The logical way forward now would be to try to prove that the Pirahã can think in a recursive fashion. The only problem is, nobody can confirm or deny Everett's observations since no other researcher can speak Pirahã as well as he does. Despite this, several researchers - including two of Chomsky's colleagues - will soon travel to Brazil to check his claims. My concern is that soon the Pirahã will simply become one more scientific oddity with every aspect of their lives being exploited and analysed.</p>\n            <div class=\"empty-space\"></div>\n        </div>\n      </div>\n\n      <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27-40, which are based on Reading Passage 3 below.</p>\n<h3>The Pirahã people of Brazil</h3>\n<p><i>The Pirahã language has stirred up debate among experts</i></p>\n<div id=\"passage-text\">\n<p>The Pirahã tribe live deep in Brazil's Amazon forest, and their language is hotly debated by linguists. Since 1977, the ethnologist Daniel Everett has spent a total of seven years living with the Pirahã and has committed his career to studying their puzzling speech. Indeed, he was uncertain for so long about what he was actually hearing while living among the Pirahã that he waited nearly three decades before publishing his findings.</p>\n<p>The debate over the Pirahã language goes right to the core of the riddle regarding how Homo sapiens managed to develop vocal communication. Although bees dance, birds sing and whales even sing with syntax, human language is unique, if only for the reason that it enables humans to piece together never-before-constructed thoughts, and be infinitely imaginative - think of Shakespeare's plays or Einstein's theory of relativity.</p>\n<p>Linguistics generally focuses on what features all human languages have in common, but the Pirahã language departs from what some academics have long maintained are essential and inalienable features of all human languages. Most of all, it may be unique for not employing subordinate clauses. Instead of saying, ‘When I have finished eating, I will speak to you,' the Pirahã say, 'I finish eating, I speak with you.' Equally perplexing, the Pirahã appear not to use numbers. During the time he spent with them, Everett never heard words like 'all', 'every' and 'more'. There is one word, ‘hoi', that comes close to the numeral 1, but it can also mean 'small'. And they were never observed to count without language, on their fingers for example, in order to determine important tasks in village life like how many pieces of meat to grill.</p>\n<p>Everett's findings among the Pirahã have brought new life to a controversial theory by the linguist Benjamin Whorf, who suggested that people are only capable of constructing thoughts for which they possess actual words. Or to put it another way, because they have no words for numbers, they cannot even begin to understand the concept of numbers or arithmetic.</p>\n<p>The Warlpiri language - spoken by a group of Australian Aborigines - like that of the Pirahã, features only the most rudimentary system of counting. However, the Warlpiri people had no difficulty counting farther than three in a foreign language, in this case English, but when Everett attempted to teach the Pirahã how to count in Portuguese, like other Brazilians, not a single person could count to 10.</p>\n<p>Everett is at pains to point out that the Pirahã are not unintelligent, for their thinking is not any slower than that of the average university student. And although they reside in a remote part of the forest, they do not live in complete genetic isolation, but mix with people from the surrounding populations and share similar intellectual capacities with their neighbours whose languages do contain numbers.</p>\n<p>Eventually, after some 30 years of research, Everett has come up with a surprising explanation for the peculiarities of the Pirahã language. Language, he believes, is created by a people's way of life, their belief system and values. In this way, variety in human language is almost limitless, a function of the human capacity to live in different ways, such as in the forest. What Everett's research has revealed is that the central tenet of the Pirahã culture is to live in the here and now. The only thing of importance that is worth communicating to others is what is being experienced at that very moment, though this can often be described with great care and detail. In consequence, the language has no means to conjugate verbs in order to describe ‘yesterday' or 'last week' or 'when I was a child'. Their very literal view of the world curtails abstract thought, and many features taken for granted among other peoples are absent among the Pirahã, such as a creation myth, storytelling and painting. One manifestation of their beliefs is that by tradition the names they give their children are not particularly imaginative. Often they are named after other members of the tribe with whom they share similar character traits. Standing out or being different is not encouraged by the Pirahã, and this is reflected in their perhaps colourless choice of names.</p>\n<p>Everett anticipated that these findings would be controversial and the reaction came as expected. Until this point, many linguists had defended the theories of Noam Chomsky, according to which all human languages have a universal grammar. What exactly makes up this universal grammar is the subject of debate, but at its heart is the concept of 'recursion', which is defined as replication of a structure within its single parts. Without it, humans would not be able to view separate thoughts as subordinate parts of a complex whole. And, most pertinent to Everett's work, there would not be subordinate clauses, which are responsible for translating the concept of recursion into grammar. But if the Pirahã do not form subordinate clauses, then recursion cannot explain the uniqueness of human language, and this would negate Chomsky's theories.</p>\n<p>The logical way forward now would be to try to prove that the Pirahã can think in a recursive fashion. The only problem is, nobody can confirm or deny Everett's observations since no other researcher can speak Pirahã as well as he does. Despite this, several researchers - including two of Chomsky's colleagues - will soon travel to Brazil to check his claims. My concern is that soon the Pirahã will simply become one more scientific oddity with every aspect of their lives being exploited and analysed.</p>\n<div class=\"empty-space\"></div>\n</div>\n</div>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -44,7 +44,7 @@
         "q13",
         "q14"
       ],
-      "leadHtml": "<h2>Questions</h2>\n\n        <div class=\"question-group\" id=\"q1-32-section\">\n          <h3>Questions 27–32</h3>\n          <p style=\"margin-bottom: 12px;\">Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n          <div class=\"question-item\">\n              <p><strong>27</strong> What are we told about Daniel Everett in the first paragraph?</p>\n              <div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n                <label><input name=\"q1\" type=\"radio\" value=\"A\"> A He has lived among the Pirahã since 1977.</label>\n                <label><input name=\"q1\" type=\"radio\" value=\"B\"> B It took him seven years to learn the Pirahã language.</label>\n                <label><input name=\"q1\" type=\"radio\" value=\"C\"> C No one would publish his research for three decades.</label>\n                <label><input name=\"q1\" type=\"radio\" value=\"D\"> D Studying the Pirahã language is the focus of his work.</label>\n              </div>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>28</strong> Which of the following is the best summary of the second paragraph?</p>\n              <div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n                <label><input name=\"q2\" type=\"radio\" value=\"A\"> A Humans are the only species to be linguistically creative.</label>\n                <label><input name=\"q2\" type=\"radio\" value=\"B\"> B Humans, bees, birds and whales share a characteristic.</label>\n                <label><input name=\"q2\" type=\"radio\" value=\"C\"> C Human language is not fully understood by scientists.</label>\n                <label><input name=\"q2\" type=\"radio\" value=\"D\"> D Humans are the only species to use syntax.</label>\n              </div>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>29</strong> Why does the writer refer to subordinate clauses?</p>\n              <div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n                <label><input name=\"q3\" type=\"radio\" value=\"A\"> A to criticise the general approach of linguistics</label>\n                <label><input name=\"q3\" type=\"radio\" value=\"B\"> B to compare two features of the Pirahã language</label>\n                <label><input name=\"q3\" type=\"radio\" value=\"C\"> C to explain why the Pirahã language is difficult to learn</label>\n                <label><input name=\"q3\" type=\"radio\" value=\"D\"> D to exemplify an unusual feature of the Pirahã language</label>\n              </div>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>30</strong> What point does the writer make about the work of Whorf?</p>\n              <div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n                <label><input name=\"q4\" type=\"radio\" value=\"A\"> A He thought that numbers were common to all human languages.</label>\n                <label><input name=\"q4\" type=\"radio\" value=\"B\"> B His theory might be supported by Everett's research.</label>\n                <label><input name=\"q4\" type=\"radio\" value=\"C\"> C His research enabled him to find a new life among the Pirahã.</label>\n                <label><input name=\"q4\" type=\"radio\" value=\"D\"> D He predicted that people like the Pirahã would never be found.</label>\n              </div>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>31</strong> The writer refers to the Warlpiri people in order to</p>\n              <div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n                <label><input name=\"q5\" type=\"radio\" value=\"A\"> A suggest that the Pirahã be taught to count in English.</label>\n                <label><input name=\"q5\" type=\"radio\" value=\"B\"> B show how tribal peoples learn a foreign language.</label>\n                <label><input name=\"q5\" type=\"radio\" value=\"C\"> C compare counting in English and Portuguese.</label>\n                <label><input name=\"q5\" type=\"radio\" value=\"D\"> D illustrate the uniqueness of the Pirahã.</label>\n              </div>\n          </div>\n           <div class=\"question-item\">\n              <p><strong>32</strong> What is Everett's point about the Pirahã's intellectual capacities?</p>\n              <div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n                <label><input name=\"q6\" type=\"radio\" value=\"A\"> A Pirahã students have not graduated from universities.</label>\n                <label><input name=\"q6\" type=\"radio\" value=\"B\"> B He does not want people to criticise their intelligence.</label>\n                <label><input name=\"q6\" type=\"radio\" value=\"C\"> C Their isolation makes it difficult to evaluate their intelligence.</label>\n                <label><input name=\"q6\" type=\"radio\" value=\"D\"> D He believes their language is more complex than their neighbours'.</label>\n              </div>\n          </div>\n        </div>\n\n        <div class=\"question-group\" id=\"q7-36-section\">\n          <h3>Questions 33–36</h3>\n          <p style=\"margin-bottom: 12px;\">Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n          <div class=\"summary-text\">\n            <h4>Everett's explanation</h4>\n            <p>\n              Everett believes that a group's language is a product of their <strong>33</strong> <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> and thus language is infinitely varied. During the time he spent living among them, he observed that the Pirahã only place value on the <strong>34</strong> <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> and have no <strong>35</strong> <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span> to describe completed events. Similarly, the types of names they use reflect the fact that they do not celebrate <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span>.\n            </p>\n          </div>\n          <div id=\"word-options\">\n            <div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"present\">A present</div>\n            <div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"past\">B past</div>\n            <div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"time\">C time</div>\n            <div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"future\">D future</div>\n            <div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"culture\">E culture</div>\n            <div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"grammar\">F grammar</div>\n            <div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"art\">G art</div>\n            <div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"individuality\">H individuality</div>\n            <div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-word=\"children\">I children</div>\n          </div>\n        </div>\n\n        <div class=\"question-group\" id=\"q11-40-section\">\n            <h3>Questions 37–40</h3>\n            <p>Do the following statements agree with the views of the writer in Reading Passage 3? Write <strong>YES</strong>, <strong>NO</strong>, or <strong>NOT GIVEN</strong>.</p>\n            <div class=\"question-item\">\n                <p><strong>37</strong> Everett was surprised by the way his research was greeted.</p>\n                <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                  <label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label>\n                  <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label>\n                  <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div class=\"question-item\">\n                <p><strong>38</strong> Chomsky has been critical of Everett's research methodology.</p>\n                <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                  <label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label>\n                  <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label>\n                  <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div class=\"question-item\">\n                <p><strong>39</strong> If 'recursion' as a universal concept is disproved, Chomsky's ideas about language would be wrong.</p>\n                <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                  <label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label>\n                  <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label>\n                  <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div class=\"question-item\">\n                <p><strong>40</strong> The Pirahã will benefit from their new-found status among academics.</p>\n                <div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n                  <label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label>\n                  <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label>\n                  <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n        </div>",
+      "leadHtml": "<h2>Questions</h2>\n<div class=\"question-group\" id=\"q1-32-section\">\n<h3>Questions 27–32</h3>\n<p style=\"margin-bottom: 12px;\">Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>27</strong> What are we told about Daniel Everett in the first paragraph?</p>\n<div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q1\" type=\"radio\" value=\"A\"> A He has lived among the Pirahã since 1977.</label> <label><input name=\"q1\" type=\"radio\" value=\"B\"> B It took him seven years to learn the Pirahã language.</label> <label><input name=\"q1\" type=\"radio\" value=\"C\"> C No one would publish his research for three decades.</label> <label><input name=\"q1\" type=\"radio\" value=\"D\"> D Studying the Pirahã language is the focus of his work.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>28</strong> Which of the following is the best summary of the second paragraph?</p>\n<div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q2\" type=\"radio\" value=\"A\"> A Humans are the only species to be linguistically creative.</label> <label><input name=\"q2\" type=\"radio\" value=\"B\"> B Humans, bees, birds and whales share a characteristic.</label> <label><input name=\"q2\" type=\"radio\" value=\"C\"> C Human language is not fully understood by scientists.</label> <label><input name=\"q2\" type=\"radio\" value=\"D\"> D Humans are the only species to use syntax.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> Why does the writer refer to subordinate clauses?</p>\n<div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q3\" type=\"radio\" value=\"A\"> A to criticise the general approach of linguistics</label> <label><input name=\"q3\" type=\"radio\" value=\"B\"> B to compare two features of the Pirahã language</label> <label><input name=\"q3\" type=\"radio\" value=\"C\"> C to explain why the Pirahã language is difficult to learn</label> <label><input name=\"q3\" type=\"radio\" value=\"D\"> D to exemplify an unusual feature of the Pirahã language</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What point does the writer make about the work of Whorf?</p>\n<div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q4\" type=\"radio\" value=\"A\"> A He thought that numbers were common to all human languages.</label> <label><input name=\"q4\" type=\"radio\" value=\"B\"> B His theory might be supported by Everett's research.</label> <label><input name=\"q4\" type=\"radio\" value=\"C\"> C His research enabled him to find a new life among the Pirahã.</label> <label><input name=\"q4\" type=\"radio\" value=\"D\"> D He predicted that people like the Pirahã would never be found.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> The writer refers to the Warlpiri people in order to</p>\n<div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q5\" type=\"radio\" value=\"A\"> A suggest that the Pirahã be taught to count in English.</label> <label><input name=\"q5\" type=\"radio\" value=\"B\"> B show how tribal peoples learn a foreign language.</label> <label><input name=\"q5\" type=\"radio\" value=\"C\"> C compare counting in English and Portuguese.</label> <label><input name=\"q5\" type=\"radio\" value=\"D\"> D illustrate the uniqueness of the Pirahã.</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>32</strong> What is Everett's point about the Pirahã's intellectual capacities?</p>\n<div style=\"display:flex; flex-direction: column; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q6\" type=\"radio\" value=\"A\"> A Pirahã students have not graduated from universities.</label> <label><input name=\"q6\" type=\"radio\" value=\"B\"> B He does not want people to criticise their intelligence.</label> <label><input name=\"q6\" type=\"radio\" value=\"C\"> C Their isolation makes it difficult to evaluate their intelligence.</label> <label><input name=\"q6\" type=\"radio\" value=\"D\"> D He believes their language is more complex than their neighbours'.</label>\n</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q7-36-section\">\n<h3>Questions 33–36</h3>\n<p style=\"margin-bottom: 12px;\">Complete the summary using the list of words, <strong>A–I</strong>, below.</p>\n<div class=\"summary-text\">\n<h4>Everett's explanation</h4>\n<p>\nEverett believes that a group's language is a product of their <strong>33</strong> <span id=\"q7-target\" class=\"drop-target-summary\" data-question=\"q7\"></span> and thus language is infinitely varied. During the time he spent living among them, he observed that the Pirahã only place value on the <strong>34</strong> <span id=\"q8-target\" class=\"drop-target-summary\" data-question=\"q8\"></span> and have no <strong>35</strong> <span id=\"q9-target\" class=\"drop-target-summary\" data-question=\"q9\"></span> to describe completed events. Similarly, the types of names they use reflect the fact that they do not celebrate <strong>36</strong> <span id=\"q10-target\" class=\"drop-target-summary\" data-question=\"q10\"></span>.\n</p>\n</div>\n<div id=\"word-options\">\n<div id=\"word-A\" class=\"draggable-word\" draggable=\"true\" data-word=\"present\">A present</div>\n<div id=\"word-B\" class=\"draggable-word\" draggable=\"true\" data-word=\"past\">B past</div>\n<div id=\"word-C\" class=\"draggable-word\" draggable=\"true\" data-word=\"time\">C time</div>\n<div id=\"word-D\" class=\"draggable-word\" draggable=\"true\" data-word=\"future\">D future</div>\n<div id=\"word-E\" class=\"draggable-word\" draggable=\"true\" data-word=\"culture\">E culture</div>\n<div id=\"word-F\" class=\"draggable-word\" draggable=\"true\" data-word=\"grammar\">F grammar</div>\n<div id=\"word-G\" class=\"draggable-word\" draggable=\"true\" data-word=\"art\">G art</div>\n<div id=\"word-H\" class=\"draggable-word\" draggable=\"true\" data-word=\"individuality\">H individuality</div>\n<div id=\"word-I\" class=\"draggable-word\" draggable=\"true\" data-word=\"children\">I children</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q11-40-section\">\n<h3>Questions 37–40</h3>\n<p>Do the following statements agree with the views of the writer in Reading Passage 3? Write <strong>YES</strong>, <strong>NO</strong>, or <strong>NOT GIVEN</strong>.</p>\n<div class=\"question-item\">\n<p><strong>37</strong> Everett was surprised by the way his research was greeted.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q11\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q11\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q11\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>38</strong> Chomsky has been critical of Everett's research methodology.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q12\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q12\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q12\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>39</strong> If 'recursion' as a universal concept is disproved, Chomsky's ideas about language would be wrong.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q13\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q13\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q13\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>40</strong> The Pirahã will benefit from their new-found status among academics.</p>\n<div style=\"display:flex; flex-wrap:wrap; gap:10px; margin:10px 0 4px 0;\">\n<label><input name=\"q14\" type=\"radio\" value=\"YES\"> YES</label> <label><input name=\"q14\" type=\"radio\" value=\"NO\"> NO</label> <label><input name=\"q14\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>",
       "bodyHtml": ""
     }
   ],
@@ -13,14 +13,14 @@
     "pdfFilename": "98. P3 - Video Games’ Unexpected Benefits to the Human Brain 电子游戏的好处【次】.pdf",
     "legacyPath": "睡着过项目组/2. 所有文章(11.20)[192篇]/98. P3 - Video Games’ Unexpected Benefits to the Human Brain 电子游戏的好处【次】/",
     "legacyFilename": "98. P3 - Video Games’ Unexpected Benefits to the Human Brain 电子游戏的好处【次】.html",
-    "questionIntroHtml": "<h2>Questions</h2>\n\n        <div class=\"question-group\" id=\"q2-31-section\">\n          <h3>Questions 28–31</h3>\n          <p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n          <div class=\"question-item\">\n              <p><strong>28</strong> What is the main purpose of paragraph A?</p>\n              <ul class=\"options-list\">\n                <li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A Introduction of Professor James Paul Gee.</label></li>\n                <li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B Introduction of the video game Pajama Sam.</label></li>\n                <li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C Introduction of types of video games.</label></li>\n                <li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D Introduction of the background of this passage.</label></li>\n              </ul>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>29</strong> What does the author want to express in the second paragraph?</p>\n               <ul class=\"options-list\">\n                <li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A Video games are widely considered harmful for children's brains.</label></li>\n                <li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B Most violent video games are the direct cause of juvenile delinquency.</label></li>\n                <li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C Even though there is a certain proportion of violence in most video games, scientists and psychologists see their benefits to children's intellectual abilities.</label></li>\n                <li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D Many parents regard video games as time-wasters that rot children's brains.</label></li>\n              </ul>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>30</strong> What is correctly mentioned in paragraph D?</p>\n               <ul class=\"options-list\">\n                <li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A Some schools use video games to teach students abstract and high-level thinking.</label></li>\n                <li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B Video games improve brain ability in various aspects.</label></li>\n                <li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C Some surgeons have better skills because they play more video games.</label></li>\n                <li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D Skilful fighter pilots in this generation love to play video games.</label></li>\n              </ul>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>31</strong> What is the finding of the experiment the three researchers conducted in the last paragraph?</p>\n               <ul class=\"options-list\">\n                <li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A Gamers have to make the best use of limited resources.</label></li>\n                <li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B Gamers with better math skills will win in the end.</label></li>\n                <li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C Strategy-game players have better ability to make quick decisions.</label></li>\n                <li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D Video games help increase the speed of players' reactions effectively.</label></li>\n              </ul>\n          </div>\n        </div>\n\n        <div class=\"question-group\" id=\"q6-35-section\">\n            <h3>Questions 32–35</h3>\n            <p>Do the following statements agree with the information given in Reading Passage 3? Write <strong>TRUE</strong>, <strong>FALSE</strong>, or <strong>NOT GIVEN</strong>.</p>\n            <div class=\"question-item\">\n                <p><strong>32</strong> Most video games are popular because of their violent content.</p>\n                <div class=\"matching-options\">\n                  <label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                  <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                  <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div class=\"question-item\">\n                <p><strong>33</strong> It would be a good idea for schools to apply video games in their classrooms.</p>\n                <div class=\"matching-options\">\n                  <label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                  <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                  <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div class=\"question-item\">\n                <p><strong>34</strong> Those people who are addicted to video games have lots of dopamine in their brains.</p>\n                <div class=\"matching-options\">\n                  <label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                  <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                  <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div class=\"question-item\">\n                <p><strong>35</strong> The action-game players minimised the percentage of mistakes in the experiment.</p>\n                <div class=\"matching-options\">\n                  <label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                  <label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                  <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n        </div>\n        \n        <div class=\"question-group\" id=\"q10-40-section\">\n          <h3>Questions 36–40</h3>\n          <p>Look at the following statements (Questions 36–40) and the list of people below. Match each statement with the correct person, <strong>A–F</strong>.</p>\n          \n          <div style=\"overflow-x: auto;\">\n            <table class=\"matching-table\">\n                <thead>\n                    <tr>\n                        <th>Statement</th>\n                        <th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th>\n                    </tr>\n                </thead>\n                <tbody>\n                    <tr>\n                        <td><strong>36</strong> Video games, like other daily-life skills, alter the brain’s physical structure.</td>\n                        <td><input name=\"q9\" type=\"radio\" value=\"A\"></td>\n                        <td><input name=\"q9\" type=\"radio\" value=\"B\"></td>\n                        <td><input name=\"q9\" type=\"radio\" value=\"C\"></td>\n                        <td><input name=\"q9\" type=\"radio\" value=\"D\"></td>\n                        <td><input name=\"q9\" type=\"radio\" value=\"E\"></td>\n                        <td><input name=\"q9\" type=\"radio\" value=\"F\"></td>\n                    </tr>\n                    <tr>\n                        <td><strong>37</strong> The brain is ready to make decisions without hesitation when players are immersed in stressful games.</td>\n                        <td><input name=\"q10\" type=\"radio\" value=\"A\"></td>\n                        <td><input name=\"q10\" type=\"radio\" value=\"B\"></td>\n                        <td><input name=\"q10\" type=\"radio\" value=\"C\"></td>\n                        <td><input name=\"q10\" type=\"radio\" value=\"D\"></td>\n                        <td><input name=\"q10\" type=\"radio\" value=\"E\"></td>\n                        <td><input name=\"q10\" type=\"radio\" value=\"F\"></td>\n                    </tr>\n                    <tr>\n                        <td><strong>38</strong> The purpose-motivated experience that video games offer plays an essential role in studying.</td>\n                        <td><input name=\"q11\" type=\"radio\" value=\"A\"></td>\n                        <td><input name=\"q11\" type=\"radio\" value=\"B\"></td>\n                        <td><input name=\"q11\" type=\"radio\" value=\"C\"></td>\n                        <td><input name=\"q11\" type=\"radio\" value=\"D\"></td>\n                        <td><input name=\"q11\" type=\"radio\" value=\"E\"></td>\n                        <td><input name=\"q11\" type=\"radio\" value=\"F\"></td>\n                    </tr>\n                    <tr>\n                        <td><strong>39</strong> Players are good at tackling immediate issues while keeping future intentions in mind.</td>\n                        <td><input name=\"q12\" type=\"radio\" value=\"A\"></td>\n                        <td><input name=\"q12\" type=\"radio\" value=\"B\"></td>\n                        <td><input name=\"q12\" type=\"radio\" value=\"C\"></td>\n                        <td><input name=\"q12\" type=\"radio\" value=\"D\"></td>\n                        <td><input name=\"q12\" type=\"radio\" value=\"E\"></td>\n                        <td><input name=\"q12\" type=\"radio\" value=\"F\"></td>\n                    </tr>\n                    <tr>\n                        <td><strong>40</strong> Video games help children broaden their horizons in many aspects and gain self-confidence.</td>\n                        <td><input name=\"q13\" type=\"radio\" value=\"A\"></td>\n                        <td><input name=\"q13\" type=\"radio\" value=\"B\"></td>\n                        <td><input name=\"q13\" type=\"radio\" value=\"C\"></td>\n                        <td><input name=\"q13\" type=\"radio\" value=\"D\"></td>\n                        <td><input name=\"q13\" type=\"radio\" value=\"E\"></td>\n                        <td><input name=\"q13\" type=\"radio\" value=\"F\"></td>\n                    </tr>\n                </tbody>\n            </table>\n          </div>\n\n          <div class=\"people-list\" style=\"margin-top: 20px;\">\n              <h5>List of people</h5>\n              <p><strong>A</strong> The writer's opinion</p>\n              <p><strong>B</strong> James Paul Gee</p>\n              <p><strong>C</strong> Shawn Green</p>\n              <p><strong>D</strong> Daphne Bavelier</p>\n              <p><strong>E</strong> Steven Johnson</p>\n              <p><strong>F</strong> Jacob Benjamin</p>\n          </div>\n        </div>"
+    "questionIntroHtml": "<h2>Questions</h2>\n<div class=\"question-group\" id=\"q2-31-section\">\n<h3>Questions 28–31</h3>\n<p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>28</strong> What is the main purpose of paragraph A?</p>\n<ul class=\"options-list\">\n<li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A Introduction of Professor James Paul Gee.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B Introduction of the video game Pajama Sam.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C Introduction of types of video games.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D Introduction of the background of this passage.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> What does the author want to express in the second paragraph?</p>\n<ul class=\"options-list\">\n<li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A Video games are widely considered harmful for children's brains.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B Most violent video games are the direct cause of juvenile delinquency.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C Even though there is a certain proportion of violence in most video games, scientists and psychologists see their benefits to children's intellectual abilities.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D Many parents regard video games as time-wasters that rot children's brains.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What is correctly mentioned in paragraph D?</p>\n<ul class=\"options-list\">\n<li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A Some schools use video games to teach students abstract and high-level thinking.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B Video games improve brain ability in various aspects.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C Some surgeons have better skills because they play more video games.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D Skilful fighter pilots in this generation love to play video games.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> What is the finding of the experiment the three researchers conducted in the last paragraph?</p>\n<ul class=\"options-list\">\n<li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A Gamers have to make the best use of limited resources.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B Gamers with better math skills will win in the end.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C Strategy-game players have better ability to make quick decisions.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D Video games help increase the speed of players' reactions effectively.</label></li>\n</ul>\n</div>\n</div>\n<div class=\"question-group\" id=\"q6-35-section\">\n<h3>Questions 32–35</h3>\n<p>Do the following statements agree with the information given in Reading Passage 3? Write <strong>TRUE</strong>, <strong>FALSE</strong>, or <strong>NOT GIVEN</strong>.</p>\n<div class=\"question-item\">\n<p><strong>32</strong> Most video games are popular because of their violent content.</p>\n<div class=\"matching-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> It would be a good idea for schools to apply video games in their classrooms.</p>\n<div class=\"matching-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Those people who are addicted to video games have lots of dopamine in their brains.</p>\n<div class=\"matching-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> The action-game players minimised the percentage of mistakes in the experiment.</p>\n<div class=\"matching-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q10-40-section\">\n<h3>Questions 36–40</h3>\n<p>Look at the following statements (Questions 36–40) and the list of people below. Match each statement with the correct person, <strong>A–F</strong>.</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th>Statement</th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>36</strong> Video games, like other daily-life skills, alter the brain’s physical structure.</td>\n<td><input name=\"q9\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>37</strong> The brain is ready to make decisions without hesitation when players are immersed in stressful games.</td>\n<td><input name=\"q10\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q10\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q10\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q10\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q10\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q10\" type=\"radio\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>38</strong> The purpose-motivated experience that video games offer plays an essential role in studying.</td>\n<td><input name=\"q11\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q11\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q11\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q11\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q11\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q11\" type=\"radio\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>39</strong> Players are good at tackling immediate issues while keeping future intentions in mind.</td>\n<td><input name=\"q12\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q12\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q12\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q12\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q12\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q12\" type=\"radio\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>40</strong> Video games help children broaden their horizons in many aspects and gain self-confidence.</td>\n<td><input name=\"q13\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q13\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q13\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q13\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q13\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q13\" type=\"radio\" value=\"F\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n<div class=\"people-list\" style=\"margin-top: 20px;\">\n<h5>List of people</h5>\n<p><strong>A</strong> The writer's opinion</p>\n<p><strong>B</strong> James Paul Gee</p>\n<p><strong>C</strong> Shawn Green</p>\n<p><strong>D</strong> Daphne Bavelier</p>\n<p><strong>E</strong> Steven Johnson</p>\n<p><strong>F</strong> Jacob Benjamin</p>\n</div>\n</div>"
   },
   "passage": {
     "blocks": [
       {
         "blockId": "passage-main",
         "kind": "html",
-        "html": "<h2>READING PASSAGE 3</h2>\n        <p>You should spend about 20 minutes on Questions 28-40, which are based on Reading Passage 3 below.</p>\n        <h3>Video Games' Unexpected Benefits to the Human Brain</h3>\n        <div id=\"passage-text\">\n            <p><strong>A</strong> James Paul Gee, professor of education at the University of Wisconsin-Madison, played his first video game years ago when his six-year-old son Sam was playing Pajama Sam: No Need to Hide When It's Dark Outside. He wanted to play the game so he could support Sam's problem-solving. Though Pajama Sam is not an “educational game”, it is replete with the types of problems psychologists study when they examine thinking and learning. When he saw how well the game held Sam's attention, he wondered what sort of beast a more mature video game might be.</p>\n            <p><strong>B</strong> Video and computer games, like many other popular, entertaining and addicting kids' activities, are looked down upon by many parents as time-wasters, and worse, parents think that these games rot the brain. Violent video games are readily blamed by the media and some experts as the reason why some youth become violent or commit extreme anti-social behaviour. Recent content analyses of video games show that as many as 89 % of games contain some violent content, and there is some form of aggressive content in 70 % of popular games. Many scientists and psychologists, like James Paul Gee, find that video games actually have many benefits – the main one being making kids smart. Video games may actually teach kids high-level thinking skills that they will need in the future.</p>\n            <p><strong>C</strong> \"Video games change your brain,” according to University of Wisconsin psychologist C. Shawn Green. Video games alter the brain's physical structure the same way as learning to read, playing the piano, or navigating with a map. Much like exercise can build muscle, the powerful combination of concentration and rewarding surges of neurotransmitters like dopamine, which strengthens neural circuits, can build the player's brain.</p>\n            <p><strong>D</strong> Video games give your child's brain a real workout. In many video games, the skills required to win involve abstract and high-level thinking. These skills are not even taught at school. Some of the mental skills trained by video games include: following instructions, problem-solving, logic, hand-eye coordination, fine-motor and spatial skills. Research also suggests that people can learn iconic, spatial, and visual attention skills from video games. There have even been studies with adults showing that experience with video games is related to better surgical skills. Jacob Benjamin, a doctor from Beth Israel Medical Center, NY, found a direct link between skill at video gaming and skill at keyhole or laparoscopic surgery. Also, a reason given by experts as to why fighter pilots of today are more skilful is that this generation's pilots were weaned on video games.</p>\n            <p><strong>F</strong> The players learn to manage resources that are limited and decide the best use of those resources, just as in real life. In strategy games, for instance, while developing a city, an unexpected surprise like an enemy might emerge. This forces the player to be flexible and quickly change tactics, sometimes almost every second of the game, giving the brain a real workout. According to researchers at the University of Rochester led by Daphne Bavelier, a cognitive scientist, games simulating stressful events such as those found in battle or action games could be a training tool for real-world situations. The study suggests that playing action video games primes the brain to make quick decisions. Video games can be used to train soldiers and surgeons, according to the study. Steven Johnson, author of Everything Bad Is Good for You: How Today's Popular Culture Is Actually Making Us Smarter, says gamers must deal with immediate problems while keeping their long-term goals on the horizon. Young gamers force themselves to read to get instructions, follow storylines of games, and glean information from the game texts.</p>\n            <p><strong>G</strong> James Paul Gee says that playing a video game is similar to working through a science problem. Like students in a laboratory, gamers must come up with a hypothesis. For example, players in some games constantly try out combinations of weapons and powers to defeat an enemy. If one does not work, they change the hypothesis and try the next one. Video games are goal-driven experiences, says Gee, which are fundamental to learning. Also, using math skills is important to win in many games that involve quantitative analysis such as managing resources. In higher levels of a game, players usually fail the first time around, but they keep on trying until they succeed and move on to the next level.</p>\n            <p><strong>H</strong> Many games are played online and involve cooperation with other online players in order to win. Video and computer games also help children gain self-confidence, and many games are based on history, city-building, and governance, and so on. Such games indirectly teach children about various aspects of life on Earth.</p>\n            <p><strong>I</strong> In an upcoming study in the journal Current Biology, authors Daphne Bavelier, Alexandre Pouget and C. Shawn Green report that video games could provide a potent training regimen for speeding up reactions in many real-life situations. The researchers tested dozens of 18- to 25-year-olds who were not ordinarily video-game players. They split the subjects: one group played 50 hours of the fast-paced action video game Unreal Tournament, and the other group played 50 hours of the slow-moving strategy game The Sims 2. After this training period, all subjects were asked to make quick decisions in several tasks designed by the researchers. The action-game players were up to 25 % faster at reaching a conclusion and answered just as many questions correctly as their strategy-game-playing peers.</p>\n            <div class=\"empty-space\"></div>\n        </div>\n      </div>\n\n      <div id=\"divider\"></div>"
+        "html": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 28-40, which are based on Reading Passage 3 below.</p>\n<h3>Video Games' Unexpected Benefits to the Human Brain</h3>\n<div id=\"passage-text\">\n<p><strong>A</strong> James Paul Gee, professor of education at the University of Wisconsin-Madison, played his first video game years ago when his six-year-old son Sam was playing Pajama Sam: No Need to Hide When It's Dark Outside. He wanted to play the game so he could support Sam's problem-solving. Though Pajama Sam is not an “educational game”, it is replete with the types of problems psychologists study when they examine thinking and learning. When he saw how well the game held Sam's attention, he wondered what sort of beast a more mature video game might be.</p>\n<p><strong>B</strong> Video and computer games, like many other popular, entertaining and addicting kids' activities, are looked down upon by many parents as time-wasters, and worse, parents think that these games rot the brain. Violent video games are readily blamed by the media and some experts as the reason why some youth become violent or commit extreme anti-social behaviour. Recent content analyses of video games show that as many as 89 % of games contain some violent content, and there is some form of aggressive content in 70 % of popular games. Many scientists and psychologists, like James Paul Gee, find that video games actually have many benefits – the main one being making kids smart. Video games may actually teach kids high-level thinking skills that they will need in the future.</p>\n<p><strong>C</strong> \"Video games change your brain,” according to University of Wisconsin psychologist C. Shawn Green. Video games alter the brain's physical structure the same way as learning to read, playing the piano, or navigating with a map. Much like exercise can build muscle, the powerful combination of concentration and rewarding surges of neurotransmitters like dopamine, which strengthens neural circuits, can build the player's brain.</p>\n<p><strong>D</strong> Video games give your child's brain a real workout. In many video games, the skills required to win involve abstract and high-level thinking. These skills are not even taught at school. Some of the mental skills trained by video games include: following instructions, problem-solving, logic, hand-eye coordination, fine-motor and spatial skills. Research also suggests that people can learn iconic, spatial, and visual attention skills from video games. There have even been studies with adults showing that experience with video games is related to better surgical skills. Jacob Benjamin, a doctor from Beth Israel Medical Center, NY, found a direct link between skill at video gaming and skill at keyhole or laparoscopic surgery. Also, a reason given by experts as to why fighter pilots of today are more skilful is that this generation's pilots were weaned on video games.</p>\n<p><strong>F</strong> The players learn to manage resources that are limited and decide the best use of those resources, just as in real life. In strategy games, for instance, while developing a city, an unexpected surprise like an enemy might emerge. This forces the player to be flexible and quickly change tactics, sometimes almost every second of the game, giving the brain a real workout. According to researchers at the University of Rochester led by Daphne Bavelier, a cognitive scientist, games simulating stressful events such as those found in battle or action games could be a training tool for real-world situations. The study suggests that playing action video games primes the brain to make quick decisions. Video games can be used to train soldiers and surgeons, according to the study. Steven Johnson, author of Everything Bad Is Good for You: How Today's Popular Culture Is Actually Making Us Smarter, says gamers must deal with immediate problems while keeping their long-term goals on the horizon. Young gamers force themselves to read to get instructions, follow storylines of games, and glean information from the game texts.</p>\n<p><strong>G</strong> James Paul Gee says that playing a video game is similar to working through a science problem. Like students in a laboratory, gamers must come up with a hypothesis. For example, players in some games constantly try out combinations of weapons and powers to defeat an enemy. If one does not work, they change the hypothesis and try the next one. Video games are goal-driven experiences, says Gee, which are fundamental to learning. Also, using math skills is important to win in many games that involve quantitative analysis such as managing resources. In higher levels of a game, players usually fail the first time around, but they keep on trying until they succeed and move on to the next level.</p>\n<p><strong>H</strong> Many games are played online and involve cooperation with other online players in order to win. Video and computer games also help children gain self-confidence, and many games are based on history, city-building, and governance, and so on. Such games indirectly teach children about various aspects of life on Earth.</p>\n<p><strong>I</strong> In an upcoming study in the journal Current Biology, authors Daphne Bavelier, Alexandre Pouget and C. Shawn Green report that video games could provide a potent training regimen for speeding up reactions in many real-life situations. The researchers tested dozens of 18- to 25-year-olds who were not ordinarily video-game players. They split the subjects: one group played 50 hours of the fast-paced action video game Unreal Tournament, and the other group played 50 hours of the slow-moving strategy game The Sims 2. After this training period, all subjects were asked to make quick decisions in several tasks designed by the researchers. The action-game players were up to 25 % faster at reaching a conclusion and answered just as many questions correctly as their strategy-game-playing peers.</p>\n<div class=\"empty-space\"></div>\n</div>\n</div>\n<div id=\"divider\"></div>"
       }
     ]
   },
@@ -43,7 +43,7 @@
         "q12",
         "q13"
       ],
-      "leadHtml": "<h2>Questions</h2>\n\n        <div class=\"question-group\" id=\"q2-31-section\">\n          <h3>Questions 28–31</h3>\n          <p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n          <div class=\"question-item\">\n              <p><strong>28</strong> What is the main purpose of paragraph A?</p>\n              <ul class=\"options-list\">\n                <li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A Introduction of Professor James Paul Gee.</label></li>\n                <li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B Introduction of the video game Pajama Sam.</label></li>\n                <li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C Introduction of types of video games.</label></li>\n                <li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D Introduction of the background of this passage.</label></li>\n              </ul>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>29</strong> What does the author want to express in the second paragraph?</p>\n               <ul class=\"options-list\">\n                <li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A Video games are widely considered harmful for children's brains.</label></li>\n                <li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B Most violent video games are the direct cause of juvenile delinquency.</label></li>\n                <li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C Even though there is a certain proportion of violence in most video games, scientists and psychologists see their benefits to children's intellectual abilities.</label></li>\n                <li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D Many parents regard video games as time-wasters that rot children's brains.</label></li>\n              </ul>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>30</strong> What is correctly mentioned in paragraph D?</p>\n               <ul class=\"options-list\">\n                <li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A Some schools use video games to teach students abstract and high-level thinking.</label></li>\n                <li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B Video games improve brain ability in various aspects.</label></li>\n                <li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C Some surgeons have better skills because they play more video games.</label></li>\n                <li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D Skilful fighter pilots in this generation love to play video games.</label></li>\n              </ul>\n          </div>\n          <div class=\"question-item\">\n              <p><strong>31</strong> What is the finding of the experiment the three researchers conducted in the last paragraph?</p>\n               <ul class=\"options-list\">\n                <li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A Gamers have to make the best use of limited resources.</label></li>\n                <li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B Gamers with better math skills will win in the end.</label></li>\n                <li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C Strategy-game players have better ability to make quick decisions.</label></li>\n                <li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D Video games help increase the speed of players' reactions effectively.</label></li>\n              </ul>\n          </div>\n        </div>\n\n        <div class=\"question-group\" id=\"q6-35-section\">\n            <h3>Questions 32–35</h3>\n            <p>Do the following statements agree with the information given in Reading Passage 3? Write <strong>TRUE</strong>, <strong>FALSE</strong>, or <strong>NOT GIVEN</strong>.</p>\n            <div class=\"question-item\">\n                <p><strong>32</strong> Most video games are popular because of their violent content.</p>\n                <div class=\"matching-options\">\n                  <label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                  <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                  <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div class=\"question-item\">\n                <p><strong>33</strong> It would be a good idea for schools to apply video games in their classrooms.</p>\n                <div class=\"matching-options\">\n                  <label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                  <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                  <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div class=\"question-item\">\n                <p><strong>34</strong> Those people who are addicted to video games have lots of dopamine in their brains.</p>\n                <div class=\"matching-options\">\n                  <label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                  <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                  <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n            <div class=\"question-item\">\n                <p><strong>35</strong> The action-game players minimised the percentage of mistakes in the experiment.</p>\n                <div class=\"matching-options\">\n                  <label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label>\n                  <label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label>\n                  <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n                </div>\n            </div>\n        </div>\n        \n        <div class=\"question-group\" id=\"q10-40-section\">\n          <h3>Questions 36–40</h3>\n          <p>Look at the following statements (Questions 36–40) and the list of people below. Match each statement with the correct person, <strong>A–F</strong>.</p>\n          \n          <div style=\"overflow-x: auto;\">\n            <table class=\"matching-table\">\n                <thead>\n                    <tr>\n                        <th>Statement</th>\n                        <th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th>\n                    </tr>\n                </thead>\n                <tbody>\n                    <tr>\n                        <td><strong>36</strong> Video games, like other daily-life skills, alter the brain’s physical structure.</td>\n                        <td><input name=\"q9\" type=\"radio\" value=\"A\"></td>\n                        <td><input name=\"q9\" type=\"radio\" value=\"B\"></td>\n                        <td><input name=\"q9\" type=\"radio\" value=\"C\"></td>\n                        <td><input name=\"q9\" type=\"radio\" value=\"D\"></td>\n                        <td><input name=\"q9\" type=\"radio\" value=\"E\"></td>\n                        <td><input name=\"q9\" type=\"radio\" value=\"F\"></td>\n                    </tr>\n                    <tr>\n                        <td><strong>37</strong> The brain is ready to make decisions without hesitation when players are immersed in stressful games.</td>\n                        <td><input name=\"q10\" type=\"radio\" value=\"A\"></td>\n                        <td><input name=\"q10\" type=\"radio\" value=\"B\"></td>\n                        <td><input name=\"q10\" type=\"radio\" value=\"C\"></td>\n                        <td><input name=\"q10\" type=\"radio\" value=\"D\"></td>\n                        <td><input name=\"q10\" type=\"radio\" value=\"E\"></td>\n                        <td><input name=\"q10\" type=\"radio\" value=\"F\"></td>\n                    </tr>\n                    <tr>\n                        <td><strong>38</strong> The purpose-motivated experience that video games offer plays an essential role in studying.</td>\n                        <td><input name=\"q11\" type=\"radio\" value=\"A\"></td>\n                        <td><input name=\"q11\" type=\"radio\" value=\"B\"></td>\n                        <td><input name=\"q11\" type=\"radio\" value=\"C\"></td>\n                        <td><input name=\"q11\" type=\"radio\" value=\"D\"></td>\n                        <td><input name=\"q11\" type=\"radio\" value=\"E\"></td>\n                        <td><input name=\"q11\" type=\"radio\" value=\"F\"></td>\n                    </tr>\n                    <tr>\n                        <td><strong>39</strong> Players are good at tackling immediate issues while keeping future intentions in mind.</td>\n                        <td><input name=\"q12\" type=\"radio\" value=\"A\"></td>\n                        <td><input name=\"q12\" type=\"radio\" value=\"B\"></td>\n                        <td><input name=\"q12\" type=\"radio\" value=\"C\"></td>\n                        <td><input name=\"q12\" type=\"radio\" value=\"D\"></td>\n                        <td><input name=\"q12\" type=\"radio\" value=\"E\"></td>\n                        <td><input name=\"q12\" type=\"radio\" value=\"F\"></td>\n                    </tr>\n                    <tr>\n                        <td><strong>40</strong> Video games help children broaden their horizons in many aspects and gain self-confidence.</td>\n                        <td><input name=\"q13\" type=\"radio\" value=\"A\"></td>\n                        <td><input name=\"q13\" type=\"radio\" value=\"B\"></td>\n                        <td><input name=\"q13\" type=\"radio\" value=\"C\"></td>\n                        <td><input name=\"q13\" type=\"radio\" value=\"D\"></td>\n                        <td><input name=\"q13\" type=\"radio\" value=\"E\"></td>\n                        <td><input name=\"q13\" type=\"radio\" value=\"F\"></td>\n                    </tr>\n                </tbody>\n            </table>\n          </div>\n\n          <div class=\"people-list\" style=\"margin-top: 20px;\">\n              <h5>List of people</h5>\n              <p><strong>A</strong> The writer's opinion</p>\n              <p><strong>B</strong> James Paul Gee</p>\n              <p><strong>C</strong> Shawn Green</p>\n              <p><strong>D</strong> Daphne Bavelier</p>\n              <p><strong>E</strong> Steven Johnson</p>\n              <p><strong>F</strong> Jacob Benjamin</p>\n          </div>\n        </div>",
+      "leadHtml": "<h2>Questions</h2>\n<div class=\"question-group\" id=\"q2-31-section\">\n<h3>Questions 28–31</h3>\n<p>Choose the correct letter, <strong>A, B, C or D</strong>.</p>\n<div class=\"question-item\">\n<p><strong>28</strong> What is the main purpose of paragraph A?</p>\n<ul class=\"options-list\">\n<li><label><input name=\"q1\" type=\"radio\" value=\"A\"> A Introduction of Professor James Paul Gee.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"B\"> B Introduction of the video game Pajama Sam.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"C\"> C Introduction of types of video games.</label></li>\n<li><label><input name=\"q1\" type=\"radio\" value=\"D\"> D Introduction of the background of this passage.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>29</strong> What does the author want to express in the second paragraph?</p>\n<ul class=\"options-list\">\n<li><label><input name=\"q2\" type=\"radio\" value=\"A\"> A Video games are widely considered harmful for children's brains.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"B\"> B Most violent video games are the direct cause of juvenile delinquency.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"C\"> C Even though there is a certain proportion of violence in most video games, scientists and psychologists see their benefits to children's intellectual abilities.</label></li>\n<li><label><input name=\"q2\" type=\"radio\" value=\"D\"> D Many parents regard video games as time-wasters that rot children's brains.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>30</strong> What is correctly mentioned in paragraph D?</p>\n<ul class=\"options-list\">\n<li><label><input name=\"q3\" type=\"radio\" value=\"A\"> A Some schools use video games to teach students abstract and high-level thinking.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"B\"> B Video games improve brain ability in various aspects.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"C\"> C Some surgeons have better skills because they play more video games.</label></li>\n<li><label><input name=\"q3\" type=\"radio\" value=\"D\"> D Skilful fighter pilots in this generation love to play video games.</label></li>\n</ul>\n</div>\n<div class=\"question-item\">\n<p><strong>31</strong> What is the finding of the experiment the three researchers conducted in the last paragraph?</p>\n<ul class=\"options-list\">\n<li><label><input name=\"q4\" type=\"radio\" value=\"A\"> A Gamers have to make the best use of limited resources.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"B\"> B Gamers with better math skills will win in the end.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"C\"> C Strategy-game players have better ability to make quick decisions.</label></li>\n<li><label><input name=\"q4\" type=\"radio\" value=\"D\"> D Video games help increase the speed of players' reactions effectively.</label></li>\n</ul>\n</div>\n</div>\n<div class=\"question-group\" id=\"q6-35-section\">\n<h3>Questions 32–35</h3>\n<p>Do the following statements agree with the information given in Reading Passage 3? Write <strong>TRUE</strong>, <strong>FALSE</strong>, or <strong>NOT GIVEN</strong>.</p>\n<div class=\"question-item\">\n<p><strong>32</strong> Most video games are popular because of their violent content.</p>\n<div class=\"matching-options\">\n<label><input name=\"q5\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q5\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q5\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>33</strong> It would be a good idea for schools to apply video games in their classrooms.</p>\n<div class=\"matching-options\">\n<label><input name=\"q6\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q6\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q6\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>34</strong> Those people who are addicted to video games have lots of dopamine in their brains.</p>\n<div class=\"matching-options\">\n<label><input name=\"q7\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q7\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q7\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n<div class=\"question-item\">\n<p><strong>35</strong> The action-game players minimised the percentage of mistakes in the experiment.</p>\n<div class=\"matching-options\">\n<label><input name=\"q8\" type=\"radio\" value=\"TRUE\"> TRUE</label> <label><input name=\"q8\" type=\"radio\" value=\"FALSE\"> FALSE</label> <label><input name=\"q8\" type=\"radio\" value=\"NOT GIVEN\"> NOT GIVEN</label>\n</div>\n</div>\n</div>\n<div class=\"question-group\" id=\"q10-40-section\">\n<h3>Questions 36–40</h3>\n<p>Look at the following statements (Questions 36–40) and the list of people below. Match each statement with the correct person, <strong>A–F</strong>.</p>\n<div style=\"overflow-x: auto;\">\n<table class=\"matching-table\">\n<thead>\n<tr>\n<th>Statement</th>\n<th>A</th><th>B</th><th>C</th><th>D</th><th>E</th><th>F</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n<td><strong>36</strong> Video games, like other daily-life skills, alter the brain’s physical structure.</td>\n<td><input name=\"q9\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q9\" type=\"radio\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>37</strong> The brain is ready to make decisions without hesitation when players are immersed in stressful games.</td>\n<td><input name=\"q10\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q10\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q10\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q10\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q10\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q10\" type=\"radio\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>38</strong> The purpose-motivated experience that video games offer plays an essential role in studying.</td>\n<td><input name=\"q11\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q11\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q11\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q11\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q11\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q11\" type=\"radio\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>39</strong> Players are good at tackling immediate issues while keeping future intentions in mind.</td>\n<td><input name=\"q12\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q12\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q12\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q12\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q12\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q12\" type=\"radio\" value=\"F\"></td>\n</tr>\n<tr>\n<td><strong>40</strong> Video games help children broaden their horizons in many aspects and gain self-confidence.</td>\n<td><input name=\"q13\" type=\"radio\" value=\"A\"></td>\n<td><input name=\"q13\" type=\"radio\" value=\"B\"></td>\n<td><input name=\"q13\" type=\"radio\" value=\"C\"></td>\n<td><input name=\"q13\" type=\"radio\" value=\"D\"></td>\n<td><input name=\"q13\" type=\"radio\" value=\"E\"></td>\n<td><input name=\"q13\" type=\"radio\" value=\"F\"></td>\n</tr>\n</tbody>\n</table>\n</div>\n<div class=\"people-list\" style=\"margin-top: 20px;\">\n<h5>List of people</h5>\n<p><strong>A</strong> The writer's opinion</p>\n<p><strong>B</strong> James Paul Gee</p>\n<p><strong>C</strong> Shawn Green</p>\n<p><strong>D</strong> Daphne Bavelier</p>\n<p><strong>E</strong> Steven Johnson</p>\n<p><strong>F</strong> Jacob Benjamin</p>\n</div>\n</div>",
       "bodyHtml": ""
     }
   ],
@@ -11,7 +11,7 @@
       {
         "blockId": "passage-main",
         "kind": "text",
-        "bodyHtml": "<h2>READING PASSAGE 3</h2>\n    <p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n    \n    <h3>Australia's Megafauna Controversy</h3>\n    <p><em>Just how long did humans live side by side with megafauna in Australia? Barry Brook, Richard Gillespie and Paul Martin dispute previous claims of a lengthy coexistence.</em></p>\n  \n    <p>Over the past 50 millennia, Australia has witnessed the extinction of many species of large animals, including a rhinoceros-sized wombat and goannas the size of crocodiles. Debate about the possible cause of these extinctions has continued for more than 150 years, and one of the crucial questions raised is how long humans and megafauna coexisted in Australia. We need to know the overlap of time to make an informed choice between the two main theories regarding the causes of these extinctions. If humans and megafauna coexisted for a protracted period, then climate change is the more likely cause. However, if the megafauna became extinct shortly after the arrival of humans, then humans are the likely culprits.</p>\n    <p>The archaeological site at Cuddie Springs in eastern Australia appears to be well preserved. This dusty claypan holds within its sediments a rich cache of flaked stone and seed-grinding tools, and side by side with these clear signals of human culture are the bones of a dozen or more species of megafauna. Drs Judith Field and Stephen Wroe of the University of Sydney, who excavated the site, claim that it provides unequivocal evidence of a long overlap of humans and megafauna, and conclude that aridity leading up to the last Ice Age brought about their eventual demise. In the long-standing explanation of this site, artefacts such as stone tools and extinct animal remains were deposited over many thousands of years in an ephemeral lake – a body of water existing for a relatively short time – and remained in place and undisturbed until the present day.</p>\n    <p>There is no disputing the close association of bones and stones at Cuddie Springs, as both are found 1 to 1.7 metres below the modern surface. The dating of these layers is accurate: ages for the sediments were obtained through radiocarbon dating of charcoal fragments and luminescence dating of sand grains from the same levels (revealing when a sample was last exposed to sunlight). Intriguingly, some of the stone tools show surface features indicating their use for processing plants, and a few even have well-preserved blood and hair residues suggesting they were used in butchering animals.</p>\n    <p>But is the case proposed by Field and Wroe clear-cut? We carried out a reanalysis of the scientific data from Cuddie Springs that brings into question their conclusions. The amount of anthropological evidence found at the site is remarkable: we estimate there are more than 3 tonnes of charcoal and more than 300 tonnes of stone buried there. Field and Wroe estimate that there are approximately 20 million artefacts. This plethora of tools is hard to reconcile with a site that was only available for occupation when the lake was dry. Furthermore, no cultural features such as oven pits have been discovered. If the sediment layers have remained undisturbed since being laid down, as Field and Wroe contend, then the ages of those sediments should increase with depth. However, our analysis revealed a number of inconsistencies.</p>\n    <p>First, the charcoal samples are all roughly 36,000 years old. Second, sand in the two upper levels is considerably younger than charcoal from the same levels. Third, Field and Wroe say that the tools and seed-grinding stones used for plant and animal processing are ancient, yet they are very similar to implements found elsewhere that were in use only a few thousand years ago. Also of interest is the fact that a deep drill core made a mere 60 metres from the site recovered no stone artefacts or fossil bones whatsoever. These points suggest strongly that the sediments have been moved about and some of the old charcoal has been re-deposited in younger layers. Indeed, one sample of cow bone found 1 metre below the surface came from sediments where charcoal dated at 6,000 and 23,000 years old is mixed with 17,000-year-old sand. The megafauna bones themselves have not yet been dated, although new technological developments make this a possibility in the near future.</p>\n    <p>We propose that the archaeologists have actually been sampling the debris carried by ancient flood channels beneath the site, including charcoal transported from bushfires that intermittently occurred within the catchment. Flood events more likely explain the accumulation of megafauna remains, and could have mixed old bones with fresh deposits. European graziers also disturbed the site in 1876 by constructing a well to provide water for their cattle. Given the expense of well-digging, we speculate that the graziers made sure it was protected from the damage caused by cattle hooves by lining the surface with small stones collected from further afield, including prehistoric quarries. This idea is consistent with the thin layer of stones spread over a large area, with cattle occasionally breaking through the gravel surface and forcing the stone and even cattle bones deeper into the waterlogged soil.</p>\n    <p>The lack of conclusive evidence that humans and megafauna coexisted for a lengthy period casts doubt on Field and Wroe's assertion that climate change was responsible for the extinction of Australia's megafauna. However, we do not suggest that newly arrived, well-armed hunters systematically slaughtered all the large beasts they encountered. Recent studies based on the biology of modern-day large mammals, combined with observations of people who still practise a traditional hunter-gatherer lifestyle, reveal an unexpected paradox and suggest a further possible explanation as to what happened. Using a mathematical model, it was found that a group of 10 people killing only one juvenile Diprotodon each year would be sufficient to bring about the extinction of that species within 1,000 years. This suggests that here, as in other parts of the world, the arrival of humans in lands previously inhabited only by animals created a volatile combination in which large animals fared badly.</p>\n    \n    <p>&nbsp;</p> <!-- Final padding -->\n  </section>\n\n  <!-- Draggable Divider -->\n  <div id=\"divider\" title=\"Drag to resize\"></div>\n\n  <!-- Right Pane: Questions and Controls -->"
+        "bodyHtml": "<h2>READING PASSAGE 3</h2>\n<p>You should spend about 20 minutes on Questions 27–40, which are based on Reading Passage 3 below.</p>\n<h3>Australia's Megafauna Controversy</h3>\n<p><em>Just how long did humans live side by side with megafauna in Australia? Barry Brook, Richard Gillespie and Paul Martin dispute previous claims of a lengthy coexistence.</em></p>\n<p>Over the past 50 millennia, Australia has witnessed the extinction of many species of large animals, including a rhinoceros-sized wombat and goannas the size of crocodiles. Debate about the possible cause of these extinctions has continued for more than 150 years, and one of the crucial questions raised is how long humans and megafauna coexisted in Australia. We need to know the overlap of time to make an informed choice between the two main theories regarding the causes of these extinctions. If humans and megafauna coexisted for a protracted period, then climate change is the more likely cause. However, if the megafauna became extinct shortly after the arrival of humans, then humans are the likely culprits.</p>\n<p>The archaeological site at Cuddie Springs in eastern Australia appears to be well preserved. This dusty claypan holds within its sediments a rich cache of flaked stone and seed-grinding tools, and side by side with these clear signals of human culture are the bones of a dozen or more species of megafauna. Drs Judith Field and Stephen Wroe of the University of Sydney, who excavated the site, claim that it provides unequivocal evidence of a long overlap of humans and megafauna, and conclude that aridity leading up to the last Ice Age brought about their eventual demise. In the long-standing explanation of this site, artefacts such as stone tools and extinct animal remains were deposited over many thousands of years in an ephemeral lake – a body of water existing for a relatively short time – and remained in place and undisturbed until the present day.</p>\n<p>There is no disputing the close association of bones and stones at Cuddie Springs, as both are found 1 to 1.7 metres below the modern surface. The dating of these layers is accurate: ages for the sediments were obtained through radiocarbon dating of charcoal fragments and luminescence dating of sand grains from the same levels (revealing when a sample was last exposed to sunlight). Intriguingly, some of the stone tools show surface features indicating their use for processing plants, and a few even have well-preserved blood and hair residues suggesting they were used in butchering animals.</p>\n<p>But is the case proposed by Field and Wroe clear-cut? We carried out a reanalysis of the scientific data from Cuddie Springs that brings into question their conclusions. The amount of anthropological evidence found at the site is remarkable: we estimate there are more than 3 tonnes of charcoal and more than 300 tonnes of stone buried there. Field and Wroe estimate that there are approximately 20 million artefacts. This plethora of tools is hard to reconcile with a site that was only available for occupation when the lake was dry. Furthermore, no cultural features such as oven pits have been discovered. If the sediment layers have remained undisturbed since being laid down, as Field and Wroe contend, then the ages of those sediments should increase with depth. However, our analysis revealed a number of inconsistencies.</p>\n<p>First, the charcoal samples are all roughly 36,000 years old. Second, sand in the two upper levels is considerably younger than charcoal from the same levels. Third, Field and Wroe say that the tools and seed-grinding stones used for plant and animal processing are ancient, yet they are very similar to implements found elsewhere that were in use only a few thousand years ago. Also of interest is the fact that a deep drill core made a mere 60 metres from the site recovered no stone artefacts or fossil bones whatsoever. These points suggest strongly that the sediments have been moved about and some of the old charcoal has been re-deposited in younger layers. Indeed, one sample of cow bone found 1 metre below the surface came from sediments where charcoal dated at 6,000 and 23,000 years old is mixed with 17,000-year-old sand. The megafauna bones themselves have not yet been dated, although new technological developments make this a possibility in the near future.</p>\n<p>We propose that the archaeologists have actually been sampling the debris carried by ancient flood channels beneath the site, including charcoal transported from bushfires that intermittently occurred within the catchment. Flood events more likely explain the accumulation of megafauna remains, and could have mixed old bones with fresh deposits. European graziers also disturbed the site in 1876 by constructing a well to provide water for their cattle. Given the expense of well-digging, we speculate that the graziers made sure it was protected from the damage caused by cattle hooves by lining the surface with small stones collected from further afield, including prehistoric quarries. This idea is consistent with the thin layer of stones spread over a large area, with cattle occasionally breaking through the gravel surface and forcing the stone and even cattle bones deeper into the waterlogged soil.</p>\n<p>The lack of conclusive evidence that humans and megafauna coexisted for a lengthy period casts doubt on Field and Wroe's assertion that climate change was responsible for the extinction of Australia's megafauna. However, we do not suggest that newly arrived, well-armed hunters systematically slaughtered all the large beasts they encountered. Recent studies based on the biology of modern-day large mammals, combined with observations of people who still practise a traditional hunter-gatherer lifestyle, reveal an unexpected paradox and suggest a further possible explanation as to what happened. Using a mathematical model, it was found that a group of 10 people killing only one juvenile Diprotodon each year would be sufficient to bring about the extinction of that species within 1,000 years. This suggests that here, as in other parts of the world, the arrival of humans in lands previously inhabited only by animals created a volatile combination in which large animals fared badly.</p>\n<p>&nbsp;</p>\n</section>\n<div id=\"divider\" title=\"Drag to resize\"></div>"
       }
     ]
   },
@@ -25,7 +25,7 @@
         "q3",
         "q4"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <a id=\"q1-anchor\"></a>\n      <h4>Questions 27–30</h4>\n      <p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n      <div class=\"q-block\"><p><strong>27</strong> Field and Wroe argue that findings at the Cuddie Springs site show that people lived in this area at the same time as megafauna.</p><div class=\"options\"><label><input type=\"radio\" name=\"q1\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q1\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q1\" value=\"not given\"> NOT GIVEN</label></div></div>\n      <div class=\"q-block\"><p><strong>28</strong> Field and Wroe believe it is likely that smaller megafauna species survived the last Ice Age.</p><div class=\"options\"><label><input type=\"radio\" name=\"q2\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q2\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q2\" value=\"not given\"> NOT GIVEN</label></div></div>\n      <div class=\"q-block\"><p><strong>29</strong> The writers believe that the dating of earth up to 1.7 m below the present surface at Cuddie Springs is unreliable.</p><div class=\"options\"><label><input type=\"radio\" name=\"q3\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q3\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q3\" value=\"not given\"> NOT GIVEN</label></div></div>\n      <div class=\"q-block\"><p><strong>30</strong> Some artefacts found at Cuddie Springs were preserved well enough to reveal their function.</p><div class=\"options\"><label><input type=\"radio\" name=\"q4\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q4\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q4\" value=\"not given\"> NOT GIVEN</label></div></div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<a id=\"q1-anchor\"></a>\n<h4>Questions 27–30</h4>\n<p>Do the following statements agree with the claims of the writer in Reading Passage 3?</p>\n<div class=\"q-block\"><p><strong>27</strong> Field and Wroe argue that findings at the Cuddie Springs site show that people lived in this area at the same time as megafauna.</p><div class=\"options\"><label><input type=\"radio\" name=\"q1\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q1\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q1\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>28</strong> Field and Wroe believe it is likely that smaller megafauna species survived the last Ice Age.</p><div class=\"options\"><label><input type=\"radio\" name=\"q2\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q2\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q2\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>29</strong> The writers believe that the dating of earth up to 1.7 m below the present surface at Cuddie Springs is unreliable.</p><div class=\"options\"><label><input type=\"radio\" name=\"q3\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q3\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q3\" value=\"not given\"> NOT GIVEN</label></div></div>\n<div class=\"q-block\"><p><strong>30</strong> Some artefacts found at Cuddie Springs were preserved well enough to reveal their function.</p><div class=\"options\"><label><input type=\"radio\" name=\"q4\" value=\"yes\"> YES</label><label><input type=\"radio\" name=\"q4\" value=\"no\"> NO</label><label><input type=\"radio\" name=\"q4\" value=\"not given\"> NOT GIVEN</label></div></div>\n</div>"
     },
     {
       "groupId": "group-2",
@@ -37,7 +37,7 @@
         "q8",
         "q9"
       ],
-      "bodyHtml": "<div class=\"group\">\n      <a id=\"q5-anchor\"></a>\n      <h4>Questions 31–35</h4>\n      <p>Complete the summary using the list of words, A–I, below.</p>\n      <h5>The writers' arguments against Field and Wroe's analysis of the scientific data from Cuddie Springs</h5>\n      <p>One objection to Field and Wroe's interpretation is the large quantity of charcoal, <strong>31</strong> <span class=\"dropzone match-dropzone\" data-target=\"q5\" data-question=\"q5\"></span> and artefacts found at Cuddie Springs. Such large numbers of artefacts would be impossible if the area had been covered with <strong>32</strong> <span class=\"dropzone match-dropzone\" data-target=\"q6\" data-question=\"q6\"></span> for a period. There is also a complete lack of man-made structures, for instance those used for <strong>33</strong> <span class=\"dropzone match-dropzone\" data-target=\"q7\" data-question=\"q7\"></span>.</p>\n      <p>Other evidence that casts doubt on Field and Wroe's claim is the fact that while some material in the highest levels of sediment is 36,000 years old, the <strong>34</strong> <span class=\"dropzone match-dropzone\" data-target=\"q8\" data-question=\"q8\"></span> in the same levels is much more recent. The tools used to process plants and animals may also be newer than Field and Wroe believe. Further evidence against human occupation of the area is the absence of tools and <strong>35</strong> <span class=\"dropzone match-dropzone\" data-target=\"q9\" data-question=\"q9\"></span> just a short distance away.</p>\n      <div class=\"option-pool\" id=\"pool-summary\">\n        <div class=\"card\" draggable=\"true\" data-value=\"A\"><strong>A</strong> seeds</div><div class=\"card\" draggable=\"true\" data-value=\"B\"><strong>B</strong> stone</div><div class=\"card\" draggable=\"true\" data-value=\"C\"><strong>C</strong> sand</div><div class=\"card\" draggable=\"true\" data-value=\"D\"><strong>D</strong> cooking</div><div class=\"card\" draggable=\"true\" data-value=\"E\"><strong>E</strong> deep drill core</div><div class=\"card\" draggable=\"true\" data-value=\"F\"><strong>F</strong> water</div><div class=\"card\" draggable=\"true\" data-value=\"G\"><strong>G</strong> fossil bones</div><div class=\"card\" draggable=\"true\" data-value=\"H\"><strong>H</strong> sediment</div><div class=\"card\" draggable=\"true\" data-value=\"I\"><strong>I</strong> storage</div>\n      </div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<a id=\"q5-anchor\"></a>\n<h4>Questions 31–35</h4>\n<p>Complete the summary using the list of words, A–I, below.</p>\n<h5>The writers' arguments against Field and Wroe's analysis of the scientific data from Cuddie Springs</h5>\n<p>One objection to Field and Wroe's interpretation is the large quantity of charcoal, <strong>31</strong> <span class=\"dropzone match-dropzone\" data-target=\"q5\" data-question=\"q5\"></span> and artefacts found at Cuddie Springs. Such large numbers of artefacts would be impossible if the area had been covered with <strong>32</strong> <span class=\"dropzone match-dropzone\" data-target=\"q6\" data-question=\"q6\"></span> for a period. There is also a complete lack of man-made structures, for instance those used for <strong>33</strong> <span class=\"dropzone match-dropzone\" data-target=\"q7\" data-question=\"q7\"></span>.</p>\n<p>Other evidence that casts doubt on Field and Wroe's claim is the fact that while some material in the highest levels of sediment is 36,000 years old, the <strong>34</strong> <span class=\"dropzone match-dropzone\" data-target=\"q8\" data-question=\"q8\"></span> in the same levels is much more recent. The tools used to process plants and animals may also be newer than Field and Wroe believe. Further evidence against human occupation of the area is the absence of tools and <strong>35</strong> <span class=\"dropzone match-dropzone\" data-target=\"q9\" data-question=\"q9\"></span> just a short distance away.</p>\n<div class=\"option-pool\" id=\"pool-summary\">\n<div class=\"card\" draggable=\"true\" data-value=\"A\"><strong>A</strong> seeds</div><div class=\"card\" draggable=\"true\" data-value=\"B\"><strong>B</strong> stone</div><div class=\"card\" draggable=\"true\" data-value=\"C\"><strong>C</strong> sand</div><div class=\"card\" draggable=\"true\" data-value=\"D\"><strong>D</strong> cooking</div><div class=\"card\" draggable=\"true\" data-value=\"E\"><strong>E</strong> deep drill core</div><div class=\"card\" draggable=\"true\" data-value=\"F\"><strong>F</strong> water</div><div class=\"card\" draggable=\"true\" data-value=\"G\"><strong>G</strong> fossil bones</div><div class=\"card\" draggable=\"true\" data-value=\"H\"><strong>H</strong> sediment</div><div class=\"card\" draggable=\"true\" data-value=\"I\"><strong>I</strong> storage</div>\n</div>\n</div>"
     },
     {
       "groupId": "group-3",
@@ -49,7 +49,7 @@
         "q13",
         "q14"
       ],
-      "bodyHtml": "<div class=\"group\">\n        <a id=\"q10-anchor\"></a>\n        <h4>Questions 36–40</h4>\n        <p>Choose the correct letter, A, B, C or D.</p>\n        <div class=\"q-block\"><p><strong>36</strong> What conclusions did the writers reach about the inconsistencies in the data from Cuddie Springs?</p><div class=\"options\"><label><input type=\"radio\" name=\"q10\" value=\"A\"> A The different layers of sediment have been mixed over time.</label><label><input type=\"radio\" name=\"q10\" value=\"B\"> B The sand evidence is unhelpful and should be disregarded.</label><label><input type=\"radio\" name=\"q10\" value=\"C\"> C The area needs to be re-examined when technology improves.</label><label><input type=\"radio\" name=\"q10\" value=\"D\"> D The charcoal found in the area cannot be dated.</label></div></div>\n        <div class=\"q-block\"><p><strong>37</strong> According to the writers, what impact could a natural phenomenon have had on this site?</p><div class=\"options\"><label><input type=\"radio\" name=\"q11\" value=\"A\"> A Floods could have caused the death of the megafauna.</label><label><input type=\"radio\" name=\"q11\" value=\"B\"> B Floods could have disturbed the archaeological evidence.</label><label><input type=\"radio\" name=\"q11\" value=\"C\"> C Bushfires could have prevented humans from settling in the area for any length of time.</label><label><input type=\"radio\" name=\"q11\" value=\"D\"> D Bushfires could have destroyed much of the evidence left by megafauna and humans.</label></div></div>\n        <div class=\"q-block\"><p><strong>38</strong> What did the writers speculate about the people who lived at this site in 1876?</p><div class=\"options\"><label><input type=\"radio\" name=\"q12\" value=\"A\"> A They bred cattle whose bones could have been confused with megafauna.</label><label><input type=\"radio\" name=\"q12\" value=\"B\"> B They found that the soil was too waterlogged for farming.</label><label><input type=\"radio\" name=\"q12\" value=\"C\"> C They allowed cattle to move around freely at the site.</label><label><input type=\"radio\" name=\"q12\" value=\"D\"> D They brought stones there from another area.</label></div></div>\n        <div class=\"q-block\"><p><strong>39</strong> In the final paragraph, what suggestion do the writers make about Australia's megafauna?</p><div class=\"options\"><label><input type=\"radio\" name=\"q13\" value=\"A\"> A A rapid change in climate may have been responsible for the extinction of the megafauna.</label><label><input type=\"radio\" name=\"q13\" value=\"B\"> B Megafauna could have died out as a result of small numbers being killed year after year.</label><label><input type=\"radio\" name=\"q13\" value=\"C\"> C The population of humans at that time was probably insufficient to cause the extinction of the megafauna.</label><label><input type=\"radio\" name=\"q13\" value=\"D\"> D The extinction of ancient animals should not be compared to that of modern-day species.</label></div></div>\n        <div class=\"q-block\"><p><strong>40</strong> Which of the following best represents the writers' criticism of Field and Wroe?</p><div class=\"options\"><label><input type=\"radio\" name=\"q14\" value=\"A\"> A Their methods were not well thought out.</label><label><input type=\"radio\" name=\"q14\" value=\"B\"> B The excavations did not go deep enough.</label><label><input type=\"radio\" name=\"q14\" value=\"C\"> C Their technology failed to obtain precise data.</label><label><input type=\"radio\" name=\"q14\" value=\"D\"> D Their conclusions were based on inconsistent data.</label></div></div>\n    </div>"
+      "bodyHtml": "<div class=\"group\">\n<a id=\"q10-anchor\"></a>\n<h4>Questions 36–40</h4>\n<p>Choose the correct letter, A, B, C or D.</p>\n<div class=\"q-block\"><p><strong>36</strong> What conclusions did the writers reach about the inconsistencies in the data from Cuddie Springs?</p><div class=\"options\"><label><input type=\"radio\" name=\"q10\" value=\"A\"> A The different layers of sediment have been mixed over time.</label><label><input type=\"radio\" name=\"q10\" value=\"B\"> B The sand evidence is unhelpful and should be disregarded.</label><label><input type=\"radio\" name=\"q10\" value=\"C\"> C The area needs to be re-examined when technology improves.</label><label><input type=\"radio\" name=\"q10\" value=\"D\"> D The charcoal found in the area cannot be dated.</label></div></div>\n<div class=\"q-block\"><p><strong>37</strong> According to the writers, what impact could a natural phenomenon have had on this site?</p><div class=\"options\"><label><input type=\"radio\" name=\"q11\" value=\"A\"> A Floods could have caused the death of the megafauna.</label><label><input type=\"radio\" name=\"q11\" value=\"B\"> B Floods could have disturbed the archaeological evidence.</label><label><input type=\"radio\" name=\"q11\" value=\"C\"> C Bushfires could have prevented humans from settling in the area for any length of time.</label><label><input type=\"radio\" name=\"q11\" value=\"D\"> D Bushfires could have destroyed much of the evidence left by megafauna and humans.</label></div></div>\n<div class=\"q-block\"><p><strong>38</strong> What did the writers speculate about the people who lived at this site in 1876?</p><div class=\"options\"><label><input type=\"radio\" name=\"q12\" value=\"A\"> A They bred cattle whose bones could have been confused with megafauna.</label><label><input type=\"radio\" name=\"q12\" value=\"B\"> B They found that the soil was too waterlogged for farming.</label><label><input type=\"radio\" name=\"q12\" value=\"C\"> C They allowed cattle to move around freely at the site.</label><label><input type=\"radio\" name=\"q12\" value=\"D\"> D They brought stones there from another area.</label></div></div>\n<div class=\"q-block\"><p><strong>39</strong> In the final paragraph, what suggestion do the writers make about Australia's megafauna?</p><div class=\"options\"><label><input type=\"radio\" name=\"q13\" value=\"A\"> A A rapid change in climate may have been responsible for the extinction of the megafauna.</label><label><input type=\"radio\" name=\"q13\" value=\"B\"> B Megafauna could have died out as a result of small numbers being killed year after year.</label><label><input type=\"radio\" name=\"q13\" value=\"C\"> C The population of humans at that time was probably insufficient to cause the extinction of the megafauna.</label><label><input type=\"radio\" name=\"q13\" value=\"D\"> D The extinction of ancient animals should not be compared to that of modern-day species.</label></div></div>\n<div class=\"q-block\"><p><strong>40</strong> Which of the following best represents the writers' criticism of Field and Wroe?</p><div class=\"options\"><label><input type=\"radio\" name=\"q14\" value=\"A\"> A Their methods were not well thought out.</label><label><input type=\"radio\" name=\"q14\" value=\"B\"> B The excavations did not go deep enough.</label><label><input type=\"radio\" name=\"q14\" value=\"C\"> C Their technology failed to obtain precise data.</label><label><input type=\"radio\" name=\"q14\" value=\"D\"> D Their conclusions were based on inconsistent data.</label></div></div>\n</div>"
     }
   ],
   "answerKey": {
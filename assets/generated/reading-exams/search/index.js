@@ -0,0 +1,14582 @@
+(function registerReadingExamSearchIndex(global) {
+  'use strict';
+  global.__READING_EXAM_SEARCH_INDEX__ = {
+    "version": 1,
+    "k1": 1.2,
+    "b": 0.75,
+    "ids": ["p1-high-01","p1-low-02","p3-high-03","p3-high-04","p1-high-05","p2-low-06","p3-low-07","p2-low-08","p2-high-09","p2-medium-10","p1-low-11","p3-low-12","p1-low-13","p2-high-14","p3-high-15","p2-high-16","p2-high-17","p3-medium-18","p2-high-19","p1-medium-20","p2-high-21","p3-medium-22","p2-high-23","p1-high-24","p2-high-25","p1-high-27","p3-low-28","p1-medium-29","p1-low-30","p1-high-31","p3-high-32","p1-medium-33","p1-low-34","p1-low-35","p3-low-36","p2-low-37","p3-low-38","p2-low-39","p1-low-40","p2-low-41","p3-low-42","p3-low-43","p3-low-44","p1-low-45","p1-low-46","p1-low-47","p1-low-48","p2-low-49","p2-low-50","p2-low-51","p1-low-52","p1-low-53","p3-low-54","p3-low-55","p3-low-56","p1-medium-57","p2-medium-58","p3-low-59","p1-medium-60","p1-low-61","p2-low-62","p1-medium-63","p2-low-64","p2-low-65","p3-medium-66","p1-low-67","p1-low-68","p1-low-69","p1-low-70","p3-low-71","p1-low-72","p2-low-73","p3-low-74","p2-low-75","p3-low-76","p2-low-77","p3-low-78","p1-high-79","p1-low-80","p1-low-81","p1-high-82","p3-low-83","p1-low-84","p3-low-85","p2-medium-86","p2-low-87","p3-low-88","p3-high-89","p1-high-90","p2-high-91","p1-high-92","p2-medium-93","p2-low-94","p3-low-95","p2-low-96","p3-low-97","p3-low-98","p1-low-99","p3-low-100","p1-high-101","p2-low-102","p2-low-103","p2-low-104","p1-high-105","p1-low-106","p1-low-107","p1-low-108","p1-low-109","p1-high-110","p1-low-111","p1-low-112","p1-low-113","p1-low-114","p1-medium-115","p1-low-116","p1-medium-117","p1-high-118","p1-medium-119","p2-high-120","p2-medium-121","p2-low-122","p2-high-123","p2-high-124","p2-low-125","p2-medium-126","p1-low-127","p2-high-128","p2-medium-129","p2-high-130","p2-high-131","p2-low-132","p2-high-133","p2-high-134","p2-low-135","p2-high-136","p2-high-137","p1-low-138","p2-high-139","p2-low-140","p2-high-141","p2-low-142","p2-low-143","p2-medium-144","p2-high-145","p2-medium-146","p2-low-147","p2-low-148","p1-low-149","p3-high-150","p3-low-151","p3-medium-152","p3-low-153","p3-medium-154","p3-medium-155","p3-high-156","p3-high-157","p3-low-158","p3-high-159","p1-low-160","p3-high-161","p3-medium-162","p3-low-163","p3-high-164","p3-low-165","p3-low-166","p3-high-167","p3-medium-168","p3-medium-169","p3-high-170","p1-high-171","p3-low-172","p3-high-173","p3-high-174","p3-low-175","p3-medium-176","p3-medium-177","p3-high-178","p3-medium-179","p3-high-180","p3-high-181","p1-medium-182","p3-medium-183","p3-high-184","p3-medium-185","p3-low-186","p3-low-187","p3-medium-188","p3-high-189","p3-low-190","p3-medium-191","p3-high-192","p1-high-200","p1-high-211","p1-high-216","p1-high-194","p2-low-222","p1-low-223","p2-high-201","p2-medium-217","p2-high-192","p2-medium-209","p2-medium-213","p2-low-051","p2-medium-058","p3-high-204","p3-high-206","p3-high-212","p3-high-218","p3-low-219","p3-low-999","p3-medium-197","p3-low-198","p3-low-078","p1-high-227","p2-high-225","p3-high-228","p1-high-229","p1-high-230","p1-high-231","p2-high-232","p2-high-233","p2-high-234","p3-high-221","p2-high-235","p2-high-236","p3-high-229","p2-high-239"],
+    "lengths": [540,641,551,582,615,618,545,692,575,671,478,530,510,682,661,865,853,596,853,507,749,717,605,1211,730,882,580,661,529,651,511,580,550,605,860,571,583,745,556,699,576,553,613,537,581,533,642,787,556,681,593,533,605,580,604,554,671,535,608,652,544,598,629,768,596,553,566,495,639,548,675,563,542,578,336,693,545,638,555,552,550,842,621,546,650,594,709,507,597,714,586,1023,675,533,578,560,590,578,534,631,828,496,1019,529,580,497,766,570,590,564,600,567,478,654,547,535,523,565,756,561,538,590,870,595,483,542,577,616,778,795,603,718,548,458,681,780,596,747,597,591,820,600,811,819,674,666,740,547,548,554,542,615,630,607,747,672,586,664,629,598,573,557,615,620,844,665,570,796,554,575,554,536,563,460,559,878,548,651,556,862,576,562,594,565,722,624,586,554,569,657,705,559,512,514,618,629,553,558,557,1022,758,570,609,568,517,572,531,844,544,466,634,555,817,487,526,492,619,566,538,590,813,768,942,599,527,570,580],
+    "avgLength": 624.39,
+    "terms": [
+      ["00",196,2,12,2],
+      ["000",0,2,15,1,1,1,3,1,3,1,1,1,2,1,2,10,1,5,3,1,1,1,1,2,5,5,2,8,3,1,2,1,1,1,1,7,3,2,1,1,16,2,8,5,1,1,1,2,3,1,10,1,1,1,4,2,2,1,2,1,1,1,5,2,5,4,7,2,1,4,4,2,1,1,2,2,3,1,1,2,1,2,2,1,1,3,2,1,3,5,3,1,1,1,2,3,1,1,2,4,3,1,1,2,7,3,6,1,1,1,1,3,1,1,1,2,2,1,2,1,3,1,2,1,2,1,8,2,1,1,2,1,5,1,1,3,1,1,4,1,1,5,1,1,3,1,4,5,2,1,8,1,3,2,3,2],
+      ["006",44,1],
+      ["056",44,1],
+      ["10",4,1,1,1,13,1,1,1,3,1,1,8,1,1,1,5,2,1,1,2,3,1,4,2,3,1,5,3,2,1,1,1,3,4,2,1,7,1,3,2,5,1,1,1,1,1,11,1,1,1,2,1,3,1,5,1,2,1,7,1,4,1,1,1,2,4,1,1,1,1,1,1,1,3,3,1,5,2,16,1,2,1,14,1,8,1,4,1,1,2,1,1,1,1,4,1,14,1,8,1,1,1,1,1,1,1,4,3,3,1,9,1,6,1,2,1,7,1],
+      ["100",0,1,4,1,11,1,3,2,2,1,2,1,3,1,2,1,1,1,7,1,1,1,8,1,3,1,5,1,12,1,5,1,6,1,35,2,12,2,7,1,9,1,4,1,3,1,2,1,1,1,17,1,2,1,4,1,4,1,7,1,3,1,3,1,3,1,1,1,9,1,1,1,1,1,9,1,11,1,3,2],
+      ["1000",71,1],
+      ["101",193,1],
+      ["1015",77,1],
+      ["1018",81,3],
+      ["102",44,1],
+      ["1025",85,3,1,3],
+      ["105",1,1,106,1],
+      ["1050",107,2],
+      ["1066",194,1],
+      ["1070",77,1],
+      ["11",4,1,1,1,18,7,2,4,2,1,1,1,3,1,9,2,5,1,1,2,3,2,1,1,1,1,7,1,3,1,5,1,1,1,1,1,7,4,5,1,2,1,8,1,12,1,1,1,1,1,2,4,3,1,1,1,3,1,4,1,2,1,3,1,4,1,5,1,2,1,3,1,22,1,11,1,8,2,7,1,7,1,1,1,2,1,5,1,17,1,2,1],
+      ["1100",1,1],
+      ["1115",102,3,97,3],
+      ["1150",190,1,21,1],
+      ["117",87,1],
+      ["117ad",87,1],
+      ["119",31,1,57,1],
+      ["11m",137,1],
+      ["12",4,1,18,2,1,7,2,4,2,1,1,1,3,2,7,1,2,2,3,1,1,1,1,1,1,1,4,1,1,1,7,1,3,1,5,1,1,1,1,1,11,1,1,1,2,1,6,1,2,1,1,1,8,1,4,1,1,1,2,4,3,1,1,1,3,2,2,2,4,1,7,1,7,1,3,1,3,1,5,2,3,1,6,1,5,1,9,1,2,1,5,4,1,1,2,1,7,1,7,2,1,1,2,1,18,1,6,1],
+      ["120",44,1,85,1],
+      ["1200",211,1],
+      ["1250",110,1],
+      ["1279",107,1],
+      ["128",1,1],
+      ["129",149,1],
+      ["12th",41,1,66,1,6,1],
+      ["13",4,1,18,1,1,7,2,4,2,1,1,1,3,1,7,1,5,1,1,1,1,1,1,1,3,1,1,1,1,1,7,1,3,1,5,1,1,1,1,1,14,1,8,1,1,1,8,1,4,1,1,1,2,4,1,1,2,1,1,1,3,1,2,1,21,1,17,1,5,1,11,1,23,1,2,1,22,1,2,1],
+      ["130",223,1],
+      ["1300",1,1,8,2,20,1,61,1,20,1,77,1,24,1],
+      ["132",156,1],
+      ["1331",194,2],
+      ["1349",194,1],
+      ["137",10,1],
+      ["138ad",87,1],
+      ["1398",211,1],
+      ["13th",46,1,31,1,48,1,65,1],
+      ["14",37,1,2,1,1,2,5,1,4,3,4,1,9,1,13,3,47,1,8,1,3,1,4,4,7,3,5,2,4,1,40,1,27,4,5,1,1,2],
+      ["140",119,1,106,1],
+      ["1400",7,1,204,1],
+      ["1440",211,1],
+      ["1490",180,1],
+      ["1492",158,1],
+      ["14th",38,1,8,1,172,1],
+      ["15",5,1,33,1,5,1,6,5,13,2,6,1,7,4,17,2,13,2,1,1,4,1,4,1,4,2,4,1,1,1,3,1,1,1,3,2,3,1,4,4,2,1,2,1,3,4,5,1,4,1,22,1,1,1,3,1,2,1,1,1,11,1,5,1,3,1,15,1,4,4,6,2],
+      ["150",7,1,16,1,4,1,1,1,12,1,10,1,84,1,4,1,6,1,6,1,5,1,14,1,17,1,9,1,7,1,8,1],
+      ["1500",22,1,196,1],
+      ["1512",64,1],
+      ["1518",211,1],
+      ["1532",99,1],
+      ["1544",116,1],
+      ["1550",158,1],
+      ["1560",218,1],
+      ["1565",218,1],
+      ["1569",64,1],
+      ["1570",99,1],
+      ["1573",116,1],
+      ["1582",211,1],
+      ["1588",116,1],
+      ["1594",64,1],
+      ["1595",192,1],
+      ["15th",0,1,22,1,82,1,3,1,16,1],
+      ["16",0,1,6,1,14,1,15,1,4,1,10,3,13,2,13,3,1,1,23,1,23,1,8,2,3,1,4,4,7,3,7,1,11,1,58,4,6,1],
+      ["160",33,1,57,1,43,1],
+      ["1600",9,1,79,1,19,1],
+      ["1602",111,1],
+      ["1603",116,1],
+      ["1606",88,1],
+      ["1618",0,1],
+      ["1635",0,1],
+      ["1642",192,1],
+      ["165",43,1],
+      ["1652",88,1],
+      ["1657",0,1],
+      ["1660",0,1,31,2],
+      ["1662",99,1,119,1],
+      ["1667",39,1],
+      ["1675",0,1],
+      ["1680",0,1,111,1],
+      ["1684",39,1],
+      ["1697",157,1],
+      ["1699",0,1],
+      ["16th",0,2,38,1,1,1,7,1,15,1,3,1,52,1,16,2,60,1,2,1,17,1,7,2,1,1],
+      ["17",18,1,31,1,13,2,7,1,6,2,5,1,38,1,4,1,8,2,2,1,1,1,4,4,7,2,7,1,2,1,24,1,31,1,2,1,10,4],
+      ["170",190,1,5,1],
+      ["1700",1,1,8,4,52,1,38,2,118,1],
+      ["1708",0,1],
+      ["173",37,1],
+      ["1735",23,1],
+      ["1747",23,1],
+      ["175",95,1,8,1],
+      ["1750",194,2],
+      ["1752",217,1],
+      ["1769",187,1,5,1],
+      ["1770",194,1],
+      ["1771",99,1],
+      ["1773",111,2],
+      ["1774",99,1],
+      ["1777",1,1],
+      ["1780",99,1],
+      ["1781",208,1],
+      ["1783",125,1],
+      ["1784",88,1],
+      ["1785",145,1,58,1],
+      ["1786",149,1],
+      ["1789",218,1],
+      ["1793",101,1],
+      ["1795",99,1],
+      ["1799",111,1],
+      ["17th",29,1,9,1,1,3,2,1,5,1,47,2,11,1,12,1,16,1,60,1,2,1,17,1,7,1],
+      ["18",0,1,5,1,11,4,2,4,5,1,2,1,6,1,19,1,11,1,1,1,13,2,16,6,11,5,17,1,3,1,2,1,6,2,2,2,1,1,4,1,2,1,4,4,1,2,45,1,9,1,1,5,24,1],
+      ["180",133,1],
+      ["1800",1,1,28,1,37,1,33,2,18,1,6,1,9,1,73,2,18,1],
+      ["1801",111,1],
+      ["1804",111,1],
+      ["1806",192,2],
+      ["1807",113,1],
+      ["1808",111,1],
+      ["1809",109,1],
+      ["1812",61,1,96,1,37,2],
+      ["1816",111,1],
+      ["1817",132,1],
+      ["1818",23,8,190,4],
+      ["1819",111,1,38,1],
+      ["1820",23,8,90,1,106,1],
+      ["1822",149,1],
+      ["1823",23,1,88,1],
+      ["1824",61,1],
+      ["1825",111,1,2,1],
+      ["1826",180,1],
+      ["1829",39,1,72,1],
+      ["183",44,1],
+      ["1830",23,1,73,1],
+      ["1834",23,1,43,1,22,2],
+      ["1838",84,1],
+      ["1839",23,8,61,1],
+      ["1840",29,1,37,1,44,2],
+      ["1841",99,1,14,1],
+      ["1845",149,1],
+      ["1847",149,1],
+      ["185",225,1],
+      ["1850",29,4,37,2,128,2],
+      ["1851",23,1,43,1,59,1,20,1,58,1,20,1],
+      ["1852",66,1],
+      ["1855",61,2,5,1],
+      ["1857",23,1],
+      ["1859",109,1,99,1],
+      ["1860",19,1,10,3,30,1,7,1,13,1,9,1,2,1,48,1,64,1,16,1],
+      ["1862",90,1],
+      ["1863",19,1],
+      ["1866",105,1,103,1],
+      ["1869",113,1],
+      ["186m",188,1],
+      ["1871",208,1],
+      ["1874",23,1,200,1],
+      ["1875",84,1,52,1],
+      ["1876",141,1,46,1,23,1],
+      ["1877",177,1],
+      ["1880",29,1,67,1,17,1,6,1,22,1],
+      ["1881",96,1],
+      ["1882",84,1],
+      ["1884",28,1,62,1,51,1],
+      ["1887",7,1,102,1],
+      ["1888",4,1,19,8,65,1,48,1,15,1],
+      ["1890",23,1,96,1,22,1,11,1],
+      ["1891",16,1,18,1,77,1],
+      ["1893",4,2,132,1],
+      ["1894",33,1,144,1],
+      ["1895",23,1,87,1],
+      ["1896",19,1,141,4,28,1],
+      ["1898",4,1,92,1,40,1,1,1,40,2],
+      ["1899",4,1],
+      ["18th",11,1,18,1,27,1,55,2,29,1,3,1,51,1,25,3],
+      ["19",16,4,2,4,44,1,13,2,16,6,9,4,2,5,20,1,7,1,3,2,1,1,9,1,1,4,3,4,53,5],
+      ["190",50,1,101,1],
+      ["1900",9,1,20,1,17,2,31,1,13,2,18,1,14,1,72,1],
+      ["1901",90,1,55,1,26,1,17,1,15,1],
+      ["1902",4,1,101,1],
+      ["1903",4,2],
+      ["1904",136,1,1,1],
+      ["1905",50,1,55,1],
+      ["1906",4,2],
+      ["1907",16,5,3,1],
+      ["1907usacan",19,2],
+      ["1908",16,1,126,1,69,1],
+      ["1909",45,1],
+      ["1910",11,1,79,1,82,1],
+      ["1911",4,1],
+      ["1912",36,1,122,1,32,1],
+      ["1915",4,1,132,2,1,1],
+      ["1917",177,1],
+      ["1918",4,4],
+      ["1919",136,1],
+      ["1920",4,1,5,1,27,2,3,1,2,1,5,2,15,1,2,4,46,2,23,1,4,1,1,1,23,1,11,1],
+      ["1921",190,1],
+      ["1923",3,1,1,2],
+      ["1924",4,1,41,1],
+      ["1925",136,1],
+      ["1926",128,2,65,1],
+      ["1928",191,1],
+      ["1930",9,1,10,3,9,1,1,1,7,3,54,2,18,1,1,1,11,1,12,1,5,1,56,1],
+      ["1932",42,1,94,1],
+      ["1935",181,1,12,1],
+      ["1936",46,1,98,3],
+      ["1937",19,1],
+      ["1938",64,1,80,1,33,1],
+      ["1939",36,2,25,1,75,2],
+      ["1940",29,2,88,1,19,1,1,1,56,1],
+      ["1943",36,1,144,1],
+      ["1944",19,1,65,1,106,1],
+      ["1945",36,1,48,1,53,1],
+      ["1947",28,1,124,1],
+      ["1948",5,1,64,1,28,1],
+      ["1949",36,1],
+      ["1950",9,1,8,1,2,1,9,1,1,2,7,2,60,1,16,1,24,1,1,1,6,1,80,1],
+      ["1951",42,1],
+      ["1952",84,1,13,1,88,1],
+      ["1953",42,1,94,1],
+      ["1954",57,1],
+      ["1955",188,1],
+      ["1956",44,1,124,1,16,1],
+      ["1958",128,4],
+      ["1959",44,1],
+      ["1960",3,1,25,1,1,1,7,2,5,4,3,1,16,1,15,1,21,1,13,1,8,1,1,2,10,2,3,2,6,2,15,1,16,1,1,1,9,1,4,1,41,1],
+      ["1961",36,1,48,1],
+      ["1962",42,1,95,2],
+      ["1963",44,1,81,1,11,1],
+      ["1964",127,1,1,2],
+      ["1965",168,1,9,2],
+      ["1966",44,2],
+      ["1967",148,2,75,1],
+      ["1968",28,1,142,3],
+      ["1969",153,1,24,1],
+      ["1970",15,1,2,1,24,1,19,1,9,1,8,1,4,2,1,1,15,1,21,1,14,1,3,1,26,1,17,2,4,1],
+      ["1971",143,1,34,1],
+      ["1972",125,1],
+      ["1973",44,2,53,1,90,2,21,1],
+      ["1974",64,1,33,1,18,1,13,1,95,1],
+      ["1975",177,1,1,1],
+      ["1976",26,1,16,1],
+      ["1977",26,1,126,1,31,1],
+      ["1978",81,1],
+      ["1979",26,1,19,1,147,1,31,1],
+      ["1980",3,1,13,6,8,1,24,1,1,1,6,1,55,1,12,1,10,1,2,4,4,1,2,1,3,1,17,4,15,1,12,1,15,1,19,2],
+      ["1981",144,1,79,1],
+      ["1982",141,1],
+      ["1983",28,1,121,1,29,1,17,1,26,1],
+      ["1984",26,1,29,1,37,1,33,1,52,1],
+      ["1985",180,1,43,1],
+      ["1987",157,1],
+      ["1988",148,1],
+      ["1989",45,1,77,1,57,1],
+      ["1990",9,1,17,2,7,1,6,1,45,1,30,1,10,1,8,1,45,1,10,1,1,1,20,1,18,2],
+      ["1991",148,1,14,1,20,1,41,1],
+      ["1993",26,1,153,3,3,1],
+      ["1994",26,1,113,1,15,1,25,2],
+      ["1995",148,1,24,1,15,1],
+      ["1996",22,1,28,1,7,1,88,1,58,1],
+      ["1997",5,1,10,1,2,1,9,2,127,1,26,1],
+      ["1998",111,1],
+      ["1999",44,1,31,1,47,1,57,3],
+      ["19th",1,1,3,1,7,1,6,1,2,1,10,1,9,1,1,2,2,2,4,1,1,4,15,2,6,1,4,1,7,1,12,2,3,1,3,1,7,1,6,2,3,3,1,1,10,1,2,1,12,1,3,5,17,2,9,1,11,1,16,2,1,1,6,1,5,1,3,1,3,1,8,2,4,1],
+      ["1m",137,1],
+      ["1st",51,1,118,2],
+      ["20",2,1,12,1,2,4,2,4,6,1,16,1,22,1,6,2,7,3,1,1,6,1,8,1,1,6,4,2,5,4,2,5,1,1,8,1,5,1,1,2,1,1,1,1,3,1,1,1,2,1,1,1,1,1,5,1,1,1,2,1,3,1,5,4,2,1,1,4,1,1,6,1,1,1,3,1,8,1,8,1,6,1,17,2,3,5,1,3,2,1,8,1,6,1,4,1,1,2],
+      ["200",0,2,25,1,2,1,12,1,5,1,13,1,9,1,4,1,7,1,20,1,7,1,6,1,28,1,1,1,38,1,3,1,4,1,8,1,4,1,6,1,3,4,13,1,6,1],
+      ["2000",27,1,2,1,17,1,105,1,35,1,19,1,3,1,13,1],
+      ["2001",26,1,13,1,44,1,107,1,5,1,11,1],
+      ["2002",26,2,92,1,5,1,31,4,52,1],
+      ["2003",20,1,6,1,27,1,39,1,59,1,19,2,36,1,19,1],
+      ["2004",20,2,10,1,3,1,24,1,13,1,10,1,2,1,29,1,6,1,6,1,54,3,13,1],
+      ["2005",20,1,124,1,8,1],
+      ["2006",15,1,29,1,19,4,21,1,20,1,52,1,65,1],
+      ["2007",16,1,28,1,24,1,14,1,1,1,94,1,11,1],
+      ["2008",16,1,76,1,36,2,23,1,65,1],
+      ["2009",24,1,47,1,11,1],
+      ["2010",115,1,110,1],
+      ["2011",31,1,32,1,21,1],
+      ["2012",24,1],
+      ["2014",63,1],
+      ["202",25,9],
+      ["2025",117,1],
+      ["2030",135,1],
+      ["2050",69,1,33,1,31,1,66,1],
+      ["206",77,1,11,1],
+      ["20th",1,1,15,5,20,1,28,1,32,2,7,1,6,2,3,1,5,1,7,1,1,1,4,1,8,1,3,6,17,1,8,1,1,1,22,1,5,2,12,1,3,1,3,1,12,2],
+      ["21",16,4,2,4,15,1,58,6,9,4,2,6,20,2,10,2,8,4,3,4,2,2,1,4,7,1,46,6,1,3,21,2],
+      ["210",157,1],
+      ["211",23,1],
+      ["214",25,2],
+      ["218",77,1],
+      ["21st",59,1,2,1,50,1,71,1,37,1],
+      ["22",13,3,2,5,5,3,17,2,6,1,4,3,3,1,41,6,9,4,2,5,20,2,15,1,3,4,5,2,1,4,7,1,31,1,11,1,4,5,1,3,21,2],
+      ["220",77,1,11,1],
+      ["222",77,1],
+      ["23",13,3,2,5,5,3,17,2,10,3,44,6,1,1,37,4,10,1,1,4,2,4,22,1,46,1,9,1,2,2],
+      ["230",1,1,24,1,52,1,143,1],
+      ["232",33,1,146,1],
+      ["235",6,1],
+      ["2372",29,1],
+      ["24",5,3,4,3,4,3,2,5,5,3,4,3,13,3,2,2,8,3,9,3,7,3,21,3,5,3,3,2,2,1,10,1,12,2,2,3,1,3,9,3,1,4,2,3,2,1,1,3,1,3,5,4,2,4,2,1,20,2,20,1,1,1,12,1,1,1,21,1],
+      ["240",190,1],
+      ["2400",107,1],
+      ["248",196,1],
+      ["25",5,3,4,3,1,1,3,2,2,5,5,2,4,3,3,1,6,1,4,3,2,2,5,1,3,2,9,3,7,3,21,3,5,3,1,1,2,2,14,2,12,3,1,2,9,3,1,4,2,3,3,3,1,3,3,1,4,4,1,1,5,1,5,1,32,1,1,1,3,2,8,1,3,1,2,1,17,1],
+      ["250",47,1,63,2,12,1,63,1],
+      ["2500",46,1],
+      ["256",107,1],
+      ["25m",137,1],
+      ["26",5,3,2,4,2,3,4,2,2,5,5,2,4,3,13,3,2,1,5,1,3,2,9,3,7,3,21,3,5,3,3,1,5,1,21,3,1,2,9,3,1,4,2,3,3,3,1,3,7,4,11,1,44,1,22,1],
+      ["27",7,4,13,1,4,1,2,1,54,1,75,1,43,1,9,4,12,2],
+      ["270",14,1,155,2],
+      ["2737",88,1],
+      ["27bc",87,1],
+      ["28",7,4,19,1,1,1,78,1,1,1,12,1,15,1,10,1,12,1,24,1,28,4],
+      ["280",47,1],
+      ["289",102,1,31,1,66,1],
+      ["29",7,4,19,1,1,1,76,1,29,1,4,1,19,1,29,1,23,4],
+      ["296",192,1],
+      ["2m",10,1],
+      ["2nd",51,1,118,3],
+      ["30",22,2,2,6,2,1,1,2,2,1,2,1,2,1,4,1,2,1,4,1,4,1,15,1,3,1,12,1,5,1,3,1,1,4,10,1,7,1,7,2,6,1,6,1,3,1,4,1,16,1,4,1,4,1,2,1,11,1,13,1,4,1,1,2,12,1,7,1,4,4,9,1],
+      ["300",0,1,46,1,31,1,30,1,44,1,59,1],
+      ["302",133,1],
+      ["305",196,1],
+      ["30cm",59,1],
+      ["30s",41,1,68,1],
+      ["31",26,1,16,2,44,4,69,1,8,1,21,2,11,1],
+      ["32",14,2,1,1,11,1,1,1,15,6,10,1,34,4,24,1,44,3,1,1,20,5,9,3,38,5],
+      ["33",14,2,28,3,10,1,29,4,2,1,3,4,68,3,1,1,20,5,4,1,5,3,1,1,37,5],
+      ["330",31,1],
+      ["34",14,1,28,3,39,4,73,3,21,5,4,1,5,3,1,1,37,5],
+      ["35",15,1,7,1,20,3,22,1,17,4,22,1,25,1,15,1,10,1,1,2,11,1,10,5,4,4,6,1,5,1,32,5],
+      ["350",33,1],
+      ["36",36,1,6,1,22,1,17,4,24,1,49,2,10,5,11,5,4,3,6,1,5,2,20,1,12,5],
+      ["360",159,1],
+      ["363",26,1],
+      ["365",15,1],
+      ["37",21,3,43,2,46,1,38,1,6,2,10,6,1,1,14,3,5,1,1,1,5,2],
+      ["38",21,3,13,3,8,1,16,1,6,2,12,1,72,4,6,2,1,3,9,5,1,3,14,3,6,1,5,1],
+      ["380",77,1,93,1],
+      ["39",21,3,13,3,30,1,91,3,9,5,1,3,14,2,6,1,5,1],
+      ["3m",137,1],
+      ["3rd",31,2,76,1,62,3],
+      ["40",5,1,9,1,7,1,1,1,2,2,3,1,6,1,1,3,8,1,5,1,16,4,1,2,2,1,16,1,24,5,9,1,4,1,9,1,1,1,14,1,12,3,2,1,7,5,1,3,1,1,8,1,2,1,3,1,13,1,24,1,9,1],
+      ["400",9,1,7,1,17,1,38,1,22,1,30,1,7,1,6,1,9,1,9,1,5,1,36,1,8,1],
+      ["401",114,1],
+      ["408",190,1],
+      ["41",47,1,40,1],
+      ["42",141,1],
+      ["420",134,1],
+      ["43",169,2],
+      ["44",91,1,15,1,66,1],
+      ["45",20,1,12,1,15,2,15,1,31,1,29,1,8,1,12,1,19,1,20,1,11,1,6,2,2,1],
+      ["450",122,1,7,5],
+      ["46",111,1],
+      ["47",165,1],
+      ["476",219,1],
+      ["48",20,1,98,1],
+      ["49",106,1,3,1],
+      ["4th",67,1],
+      ["50",6,1,1,1,14,1,1,2,5,2,1,1,11,1,1,1,28,1,7,1,1,1,1,1,13,1,6,1,4,1,8,1,2,2,7,1,1,1,4,2,6,1,1,1,4,1,5,1,1,1,20,1,6,1,8,1,2,1,3,1,8,2,2,1,1,2,12,1,1,1,8,1,4,1,6,1],
+      ["500",15,1,12,1,1,1,11,1,1,2,4,1,2,2,15,1,3,1,13,1,33,1,9,1,3,1,16,1,4,1,16,1,8,1,1,1,2,1,3,1,16,1,14,1,10,1,5,1],
+      ["505",45,1],
+      ["509",219,1],
+      ["509bc",87,1],
+      ["50th",128,1],
+      ["51",83,1,62,1,58,1],
+      ["52",91,1,2,1,25,1],
+      ["525",166,1],
+      ["53",77,1],
+      ["54",87,1],
+      ["54ad",87,1],
+      ["55",102,1,16,1,30,4,28,1,18,1,5,1],
+      ["550",77,1],
+      ["56",109,1,55,1,33,1,3,1],
+      ["560",45,1],
+      ["563",196,1],
+      ["58",186,1,12,1],
+      ["588",44,1],
+      ["5th",51,1,16,1],
+      ["60",10,1,10,1,42,1,1,1,19,3,20,1,9,1,6,1,5,1,14,1,3,1,5,1,32,2,9,1,5,1,5,1,4,1,10,1,1,1,11,1],
+      ["600",29,1,6,1,15,1,8,1,80,1,64,1],
+      ["60s",33,1,136,1],
+      ["616",77,1],
+      ["618",88,1,19,1],
+      ["62",148,1],
+      ["63",111,1,68,1],
+      ["64",36,1,89,1,71,1],
+      ["65",25,1,20,1,73,1],
+      ["654",179,1],
+      ["670",47,1],
+      ["672",36,1],
+      ["68",3,1,130,1,54,1],
+      ["68ad",87,1],
+      ["6th",51,1],
+      ["70",3,1,4,1,28,1,1,1,14,1,2,1,1,1,22,1,4,1,16,1,23,1,1,1,14,1,33,1,6,1,4,2,4,1,9,1,1,1,6,1],
+      ["700",35,1,17,1,6,1,4,1,40,1,42,1,55,1],
+      ["73",169,1],
+      ["75",44,1,23,1,28,1,8,1,7,1,7,1,52,1],
+      ["751",107,1],
+      ["76",47,1],
+      ["770",180,1],
+      ["78",136,1],
+      ["79ad",87,1],
+      ["7th",51,1],
+      ["80",6,1,14,1,5,1,8,1,19,1,42,1,14,1,2,1,9,1,18,1,29,1,9,1,12,1],
+      ["800",28,1,24,1,10,1,61,1,7,1,15,1,37,1,5,3,5,1,11,1],
+      ["80s",182,1],
+      ["83",176,1],
+      ["84001",177,1],
+      ["85",176,1],
+      ["88",136,1],
+      ["880",149,1],
+      ["89",179,1,10,1],
+      ["90",5,1,1,1,89,1,30,1,5,1,32,1,13,1],
+      ["900",90,1],
+      ["906",88,1],
+      ["907",77,1,30,1],
+      ["90s",182,1],
+      ["92",125,1,44,1],
+      ["920",206,1],
+      ["93",148,1,21,1,15,1],
+      ["94",43,1],
+      ["95",78,1],
+      ["950",62,1],
+      ["96",62,1,57,1],
+      ["960",107,1],
+      ["98",87,1,136,1],
+      ["99",62,1],
+      ["aacc",122,1],
+      ["aaker",63,1],
+      ["aaron",59,1],
+      ["abandon",113,1,96,1],
+      ["abandoned",1,1,15,1,68,1,56,1,3,1,8,1,6,1,12,2],
+      ["abandoning",49,1],
+      ["abdomen",89,1,30,1,55,1],
+      ["aberdeen",66,1,155,3],
+      ["abhor",34,1],
+      ["abide",152,1],
+      ["ability",2,2,4,11,2,1,1,1,4,2,1,3,22,2,11,3,5,4,2,3,1,1,1,1,1,1,4,1,2,1,2,1,3,1,1,1,2,1,5,1,2,1,3,1,2,1,6,1,7,1,4,6,4,1,2,1,11,1,5,1,3,1,2,2,3,2,13,3,7,1,4,4,1,1,1,1,2,1,1,2,4,2,4,3,4,1,1,1,2,2,1,2,1,2,5,1,1,1,2,1,2,5,5,1,6,5,7,6,4,1,4,3,4,1,6,1,4,1],
+      ["able",3,1,4,1,2,1,3,2,4,1,1,1,1,1,2,1,2,1,3,1,5,4,2,1,4,1,2,3,4,1,1,1,10,1,3,1,2,1,10,1,5,1,4,1,1,1,2,4,1,1,3,1,5,3,4,3,2,1,5,1,1,1,3,1,1,1,4,1,2,1,2,1,6,1,7,2,1,2,3,2,1,1,6,1,4,1,2,4,2,1,1,1,15,2,1,1,3,2,1,2,1,1,1,2,2,1,3,1,2,1,4,1,1,2,3,1,1,1,1,1,1,1,4,2,1,1,7,2,2,1,3,1,1,2,8,1,11,1,1,1,1,1,1,3],
+      ["abnormal",73,1,18,1,113,1,16,1],
+      ["abnormality",73,1],
+      ["aboard",1,1,98,1,39,1,64,1],
+      ["abolished",72,1,4,1],
+      ["aboriginal",95,1,41,11,69,3],
+      ["aborigine",183,1],
+      ["about",0,2,2,4,1,5,3,6,1,4,1,1,1,10,2,3,1,4,2,1,1,2,1,1,1,6,1,2,2,1,1,6,1,1,1,1,2,3,2,4,5,1,1,5,1,5,2,1,1,1,1,1,1,2,1,1,2,3,1,1,2,3,4,3,1,1,2,1,1,1,1,3,1,1,1,2,1,3,1,1,1,3,1,6,3,1,3,2,1,1,1,1,2,2,1,1,1,4,2,1,1,4,1,1,1,1,1,4,1,1,1,4,1,4,1,2,3,7,2,1,1,1,2,2,1,3,1,1,1,2,1,1,1,2,2,1,1,5,2,3,1,2,1,2,2,2,2,3,1,1,2,2,1,3,1,4,3,1,2,2,1,2,1,6,1,7,3,1,1,2,1,2,1,1,1,2,1,1,1,5,3,1,2,2,1,3,2,1,2,1,5,5,1,8,1,3,1,3,1,1,1,4,1,2,1,2,1,1,1,3,3,3,1,1,1,2,2,1,1,5,1,2,2,1,1,3,1,3,1,5,1,2,1,2,1,1,4,1,1,1,1,7,1,2,1,4,1,3,1,4,1,3,1,3,1,3,1,1,2,1,1,1,1,5,2,1,1,3,1,1,1,4,2,1,2,5,2,1,1,2,1,2,1,2,1,1,1,3,2,2,1,1,1,1,1,4,1,1,1,4,1,4,1,2,1,2,1,1,1,1,1,3,1,1,2,3,1,3,2,1,2,1,2,4],
+      ["above",1,1,12,1,2,1,6,2,4,1,2,2,42,1,12,1,3,1,50,1,7,1,1,1,5,2,17,1,6,1,1,1,6,1,11,1],
+      ["abraham",218,1],
+      ["abroad",141,1,30,1,23,1],
+      ["abrupt",52,1,12,1],
+      ["abruptly",16,1,29,1,63,1],
+      ["absence",1,2,19,3,21,1,3,1,1,1,39,1,8,1,26,3],
+      ["absent",10,1,6,1,4,1,111,1,12,1,40,1,23,1],
+      ["absolute",2,2,186,1,19,1],
+      ["absolutely",142,1,40,1],
+      ["absorb",59,1,9,1,22,1,24,1,29,1,34,1,3,1,21,1],
+      ["absorbed",89,1,91,1,38,1],
+      ["absorbing",68,1],
+      ["absorption",140,1,40,1],
+      ["abstract",45,1,22,2,79,2,2,1,19,1,16,1,6,1,23,1],
+      ["abstracted",167,1,45,1],
+      ["abstracting",86,1],
+      ["abstraction",67,1],
+      ["abstruse",163,1],
+      ["absurd",41,1,107,1],
+      ["absurdity",162,1,9,1],
+      ["absurdly",171,1],
+      ["abundance",25,1,2,1,72,1,2,1,35,1,2,1,11,1,18,1,35,1,10,1,11,1],
+      ["abundant",21,1,4,2,71,1,11,1,3,2,9,1,2,2,73,1],
+      ["abundantly",83,1],
+      ["acacia",216,1],
+      ["academic",16,4,12,2,2,2,11,1,8,1,21,1,4,2,4,1,23,1,10,1,13,1,4,2,20,1,5,2,3,1,27,1,3,1,4,1,18,1],
+      ["academically",49,2,79,1],
+      ["academy",23,1,7,1,175,8],
+      ["accelerate",74,1,50,1],
+      ["accelerated",164,1],
+      ["acceleration",52,2,80,1,29,10],
+      ["accept",37,1,94,1,6,1,8,1,8,1,10,1,8,1,16,2,16,1,6,1,4,1,8,1],
+      ["acceptable",15,1,58,2,19,1],
+      ["acceptance",93,1,6,1,18,1],
+      ["accepted",16,1,24,1,2,1,44,1,14,1,5,1,19,1,32,1,2,1,6,1,14,1,16,1,13,1,1,1,5,2,5,1],
+      ["accepting",33,1,176,1],
+      ["access",6,1,32,1,32,3,31,1,12,1,16,1,33,1,8,1,11,1,5,1,4,1,1,1,23,1],
+      ["accessed",206,1],
+      ["accessible",74,1,24,1,7,1,7,1,1,1,4,1,34,1,20,1,9,1,8,1,26,1],
+      ["accident",22,1,1,1,30,2,6,1,35,1,19,1,9,3,7,1,12,1,50,1,29,1],
+      ["accidental",18,4,173,1],
+      ["accidentally",21,1,17,1,15,1,35,1,81,1],
+      ["acclaim",2,1],
+      ["acclimatise",174,1],
+      ["accommodate",54,1,38,1],
+      ["accommodating",170,1],
+      ["accommodation",34,1,84,4],
+      ["accompanied",9,1,45,1,24,1,43,1,4,1,42,1,1,1,17,1,5,1,22,1,5,1],
+      ["accompany",146,1,65,1],
+      ["accompanying",75,1],
+      ["accomplish",56,1],
+      ["accomplished",2,1,1,3,1,1,33,1,14,1,5,1,39,1,16,1,15,1,14,1,2,1],
+      ["accomplishing",126,1,13,1],
+      ["accomplishment",6,2,15,1,90,1,29,1,28,1],
+      ["accord",153,1,12,1],
+      ["accordance",0,1,44,1,153,1],
+      ["according",0,2,5,3,3,3,6,2,2,5,2,1,2,1,4,1,1,4,1,1,1,2,3,2,2,1,1,1,1,1,9,1,5,3,3,1,2,6,2,1,1,1,1,1,1,3,2,1,2,1,2,1,3,1,1,1,2,3,1,1,1,1,5,1,2,2,2,1,2,3,3,5,1,1,1,1,5,1,1,1,1,1,5,2,2,2,2,2,3,1,4,1,3,2,1,1,4,1,7,2,2,2,1,5,4,1,1,1,3,1,1,2,4,1,8,1,1,1,5,2,1,1,1,1,1,2,2,1,6,1,6,1,2,1,1,1,1,1,1,2,5,1,2,1,1,1,3,3,1,1,5,2,1,1,2,1,1,2,1,1,1,2,1,2,2,1,5,2,3,1,1,2,8,2,4,1],
+      ["accordingly",86,1,7,1,24,1,39,1,12,1,25,1],
+      ["account",20,3,3,15,3,1,13,2,1,1,9,1,3,1,1,1,23,1,1,1,9,3,7,1,9,2,5,1,5,1,2,1,8,1,6,1,1,1,11,1,4,1,6,1,7,1,35,1,7,2,7,2,3,1,14,1],
+      ["accountant",162,1],
+      ["accounted",20,1,2,1],
+      ["accounting",49,1,18,1,142,1,7,1],
+      ["accredited",116,1],
+      ["accrue",47,1],
+      ["accruing",187,1],
+      ["accumulate",153,1,34,1],
+      ["accumulated",26,1,15,1,31,1,51,1,4,1,38,1,31,1],
+      ["accumulating",33,1],
+      ["accumulation",26,1,75,1,109,1],
+      ["accumulative",103,1],
+      ["accuracy",64,1,22,2,121,1,8,1],
+      ["accurate",30,1,26,1,15,1,4,1,3,1,15,1,28,1,5,1,22,1,8,1,10,2,5,1,4,1,21,1,14,1],
+      ["accurately",30,1,116,1,30,1,4,1,27,1],
+      ["accusation",15,1,156,1,13,3],
+      ["accused",157,1,14,1],
+      ["accusing",151,1],
+      ["accustomed",5,1,63,1,62,2,85,1],
+      ["achieve",2,2,6,1,1,1,2,1,1,2,23,1,2,1,10,3,5,1,11,1,10,1,4,1,5,1,17,1,47,5,17,1,11,1,21,1,2,1,1,1,22,1,2,1],
+      ["achieved",2,2,4,2,6,1,21,1,4,1,15,1,4,1,17,1,38,1,1,1,1,1,6,1,3,1,26,1,8,1,8,2,30,1,13,1],
+      ["achievement",2,2,7,1,21,1,6,1,13,2,62,1,28,1,14,5,9,1,1,1],
+      ["achieving",172,1,42,1],
+      ["achille",153,1],
+      ["acid",19,1,8,1,34,2,73,1],
+      ["acid3",19,2],
+      ["acidity",51,1],
+      ["acknowledge",11,1,84,1,7,1,16,1,18,1,14,1,49,1,7,1,7,1,12,1],
+      ["acknowledged",2,1,6,1,152,1,33,1,15,1],
+      ["acknowledging",128,1,80,1],
+      ["acknowledgment",205,1],
+      ["acoustic",44,1,136,1,41,1],
+      ["acoustically",180,1],
+      ["acquaintance",85,1],
+      ["acquaintanceship",104,1],
+      ["acquire",2,2,4,1,41,1,61,1,23,1,43,1,7,1,26,1],
+      ["acquired",94,1,6,1,25,1,11,1,31,1,45,1,2,1,8,1],
+      ["acquiring",46,1,28,1,51,1,100,1],
+      ["acquisition",2,1,55,1],
+      ["acre",50,1,40,3,15,1,79,1],
+      ["acrilan",19,1],
+      ["acrimonious",111,1],
+      ["across",0,1,14,1,7,2,2,1,2,3,2,1,4,2,2,2,2,2,11,1,3,2,2,1,4,3,4,1,3,1,4,1,1,1,23,3,1,1,5,1,3,1,2,1,3,2,6,1,3,1,1,2,7,1,2,4,4,1,1,1,5,1,1,1,4,1,2,1,1,1,1,1,2,1,5,1,4,1,6,1,3,1,1,1,2,2,2,1,1,1,7,2,1,1,1,1,3,1,6,3,6,1,4,3,5,1,1,1,10,1,6,1,5,5,3,1],
+      ["acrylic",140,1],
+      ["act",3,1,9,1,3,2,10,1,6,1,5,3,1,1,1,1,6,1,12,1,3,2,22,1,1,1,3,2,4,1,1,2,8,1,2,2,3,1,1,1,21,1,2,1,15,4,14,1,3,1,15,1,8,1,13,1,5,1,9,1,8,2,3,1,4,1],
+      ["acted",171,1],
+      ["acting",98,1,51,1,60,2,15,1],
+      ["action",3,3,17,1,28,2,9,9,3,1,9,1,24,1,13,1,10,1,6,1,7,1,12,1,19,2,14,1,15,4,20,2],
+      ["activate",3,1,4,2,10,1,1,1,65,1,17,1,85,1],
+      ["activated",18,1,39,1],
+      ["activating",17,1],
+      ["activation",17,1],
+      ["active",17,4,20,3,2,1,13,1,4,3,1,5,6,3,9,1,9,5,13,1,6,1,10,2,10,1,2,1,18,1,20,1,14,1,13,1,17,1,7,1,9,1,4,1],
+      ["actively",4,1,33,1,17,1],
+      ["activity",3,1,8,5,6,3,1,3,5,1,3,2,10,1,1,10,2,3,4,1,6,2,6,5,16,1,10,13,5,1,1,1,5,3,2,3,1,1,5,5,24,3,2,1,17,1,4,1,19,1,8,2,2,1,8,2,1,7,4,1,8,7,3,1,4,2,4,1,3,2,2,1,2,1,5,1,2,6,2,3],
+      ["actor",9,1,3,12,3,2,15,3,115,1,30,1,28,1,16,2],
+      ["actual",7,1,11,1,13,2,5,1,45,1,2,1,62,1,3,1,13,1,22,1,20,1,8,1,6,1],
+      ["actually",15,1,2,1,1,1,4,1,6,1,2,1,4,1,8,4,1,2,6,1,1,1,1,1,1,1,2,2,3,1,8,1,2,1,4,1,6,1,1,1,2,1,1,1,8,1,3,1,4,1,2,1,4,5,2,1,2,1,10,1,2,2,5,1,2,1,1,2,8,1,1,1,3,1,4,1,1,1,2,1,5,2,1,1,1,2,3,2,4,1,2,1,4,1,16,3,2,1,1,1,5,3,10,5,3,1,1,1,1,1,3,1,3,1,5,2,5,1],
+      ["acumen",127,1],
+      ["acupuncture",220,1],
+      ["acute",27,1,76,1,50,1],
+      ["acutely",71,1],
+      ["ad",1,1,8,2,37,2,31,7,10,1,1,2,19,5,3,1,59,13,27,1,23,2],
+      ["adalberto",179,1],
+      ["adam",120,1,91,1],
+      ["adapt",13,1,1,1,59,1,16,1,31,1,61,1,45,1],
+      ["adaptability",168,1],
+      ["adaptable",89,1,54,1],
+      ["adaptation",14,1,45,3,109,1,48,1],
+      ["adapted",1,1,9,3,2,1,3,1,24,1,1,1,14,1,5,1,8,1,36,1,10,1,37,1,7,1,66,1,1,1,2,1],
+      ["adapting",54,1,1,1,31,1,49,7,5,1,28,1,2,1,6,1],
+      ["adaption",138,1],
+      ["adaptive",204,1,18,1],
+      ["adaptively",174,1],
+      ["add",14,1,24,1,5,1,9,1,10,1,8,1,50,1,2,1,9,1,3,3,8,2,64,1,17,1],
+      ["addax",10,1],
+      ["added",29,1,17,2,5,1,20,1,1,1,5,1,1,1,5,1,1,1,4,1,29,1,3,1,5,1,4,2,3,1,7,1,30,1,7,1,1,1,16,1,8,1,4,1,13,1],
+      ["addicting",189,1],
+      ["addiction",33,1,187,1],
+      ["adding",0,1,19,1,40,2,2,2,97,1,23,1,10,1,26,1],
+      ["addition",3,1,9,1,1,1,9,1,7,1,3,1,1,1,1,2,10,1,4,1,4,1,2,2,1,2,5,1,2,1,13,1,3,1,9,1,8,1,3,1,13,1,6,2,5,1,1,1,14,1,3,2,1,2,7,1,6,1,12,1,10,1,2,1,3,1,35,1,1,1],
+      ["additional",4,1,17,1,1,1,11,1,21,1,1,1,11,1,30,1,14,1,9,1,5,1,4,1,38,2,3,1,1,1,11,1],
+      ["additionally",74,1],
+      ["additive",38,1],
+      ["address",2,1,47,1,4,1,17,1,52,1,2,1],
+      ["addresse",4,1],
+      ["addressed",118,1,90,1,18,1],
+      ["addressing",26,1,148,1,1,1,49,1],
+      ["adelaide",24,1,112,3],
+      ["adept",14,1,78,1,29,1],
+      ["adequacy",3,1],
+      ["adequate",87,1,26,1],
+      ["adequately",53,1,109,1],
+      ["adhering",8,1],
+      ["adhesive",224,1],
+      ["adjacent",84,1],
+      ["adjective",38,3],
+      ["adjust",76,1,6,1,58,1],
+      ["adjustable",80,2],
+      ["adjusted",92,2],
+      ["adjusting",89,3,39,1],
+      ["adjustment",94,1,8,1,97,1],
+      ["administer",72,1],
+      ["administered",137,1,32,1],
+      ["administering",200,1],
+      ["administration",80,1,67,1,5,1,9,1],
+      ["administrative",33,1,22,1,46,1,3,1],
+      ["administrator",11,1,25,2,19,1,65,1,2,1,31,1],
+      ["adminius",169,1],
+      ["admirable",30,1],
+      ["admiration",4,1],
+      ["admire",31,1,184,1],
+      ["admired",9,1,6,1,29,1,22,1,70,1,79,1],
+      ["admirer",31,1],
+      ["admission",55,1],
+      ["admit",60,1,35,1,7,1,10,1,38,2,49,1],
+      ["admitted",42,3,11,1],
+      ["admittedly",171,1],
+      ["adolescent",186,1,39,1],
+      ["adopt",53,1,19,1,50,1,32,1,53,1,15,1],
+      ["adopted",1,1,51,1,2,1,8,1,2,3,12,1,26,1,35,1,12,1,23,1,23,2,4,1,15,1,4,1],
+      ["adopting",13,1,76,1],
+      ["adoption",41,1,161,1],
+      ["adornment",47,1],
+      ["adrenaline",20,1,17,1,16,1,10,1,95,1],
+      ["adroit",170,1],
+      ["adult",17,1,12,1,3,2,5,1,25,2,14,1,16,1,2,2,16,1,1,1,4,1,6,1,5,1,1,2,3,3,1,1,18,1,5,1,3,2,3,2,16,4,6,1,7,1,4,2,13,7,1,1,4,13,5,2,9,3],
+      ["adulteration",88,2],
+      ["adulthood",14,1,10,1,68,1],
+      ["advance",7,5,2,1,4,1,7,1,49,1,23,1,12,1,18,1,18,1,30,1,20,3,8,1],
+      ["advanced",0,1,14,2,7,1,25,1,23,1,87,1,21,2,9,1,12,1,25,1],
+      ["advancement",28,1,13,1,44,1,65,1],
+      ["advancing",40,1,84,1,41,1],
+      ["advantage",1,1,7,2,6,1,17,1,17,1,4,1,7,1,2,3,4,1,8,1,1,1,23,1,20,1,14,1,2,1,2,2,7,1,1,2,4,1,2,1,3,1,1,2,9,1,4,1,10,2,9,1,9,1,3,1,4,1,16,1,4,2,1,11,2,1],
+      ["advantageous",92,1,109,1,21,1,3,1],
+      ["advent",5,1,45,1,11,1,35,1,8,1,36,1],
+      ["adventure",105,1,66,4,11,2],
+      ["advertise",47,1,33,1],
+      ["advertisement",104,1,10,8,12,1,20,1],
+      ["advertiser",114,8],
+      ["advertising",20,1,50,1,6,1,38,11,32,1,20,1,54,1],
+      ["advice",20,1,35,1,27,1,32,1,36,1],
+      ["advisability",13,1],
+      ["advisable",172,1],
+      ["advise",114,1],
+      ["advised",4,1,37,1,156,1],
+      ["advisory",220,1],
+      ["advocate",11,1,11,1,49,1,3,3,46,1,14,1],
+      ["advocating",133,1],
+      ["aerial",130,2,84,1],
+      ["aeronautic",161,1],
+      ["aeroplane",87,1],
+      ["aesthetic",26,1,20,1,17,1,2,1,16,1,5,1,50,1,19,1],
+      ["afar",115,1],
+      ["affair",1,1,127,1,24,1],
+      ["affect",6,1,2,1,7,1,22,1,2,1,13,1,2,1,3,1,1,1,18,1,14,1,8,1,2,1,37,1,18,1,1,1,2,1,7,1,16,1,15,1,13,1],
+      ["affected",22,1,20,1,24,1,24,1,4,1,9,1,14,1,18,1,2,1,44,1,1,1,25,1,7,1],
+      ["affecting",26,1,61,1,118,1],
+      ["affection",182,1,16,1,13,2],
+      ["affiliation",155,1],
+      ["affinity",167,1,20,1,25,1],
+      ["afflicted",69,1],
+      ["affluence",101,1],
+      ["affluent",32,1,38,1,31,1,17,2,35,1],
+      ["afford",39,1,31,1,3,1,15,1,4,2,7,1],
+      ["affordable",88,1,9,2,31,1,28,1],
+      ["affording",191,1],
+      ["afghan",46,1],
+      ["afield",34,1,6,1,170,1],
+      ["afloat",52,2],
+      ["aforementioned",208,1],
+      ["afraid",92,1,109,1],
+      ["africa",5,1,5,2,7,1,8,1,22,4,4,1,15,2,10,2,3,1,22,1,6,2,8,1,2,1,13,1,7,1,7,1,3,1,11,1,7,1,2,1,6,3,28,2,11,1,4,1,6,7],
+      ["african",4,1,1,1,5,1,15,1,51,1,45,1,9,1,24,1,47,1],
+      ["africana",65,1],
+      ["afrocentric",160,1],
+      ["after",2,1,2,3,2,1,6,1,2,1,2,1,1,1,2,3,1,1,2,3,5,3,2,5,2,2,2,1,1,1,1,1,4,3,3,1,1,2,1,2,1,2,4,3,1,1,1,1,5,1,3,2,2,2,1,3,1,1,3,1,2,1,2,1,1,2,2,3,4,3,1,2,1,1,3,1,2,2,1,1,2,1,1,2,1,3,1,1,1,2,1,3,1,1,1,1,3,1,2,2,2,1,1,1,1,1,1,1,1,3,1,2,1,1,4,2,1,1,1,1,1,3,1,1,1,1,2,1,1,3,1,1,1,2,2,2,1,1,4,1,2,2,2,2,4,2,1,1,1,2,1,3,1,4,1,1,2,2,1,2,1,2,1,1,3,1,2,3,2,3,2,1,1,1,1,1,3,3,1,1,2,3,2,2,2,1,1,1,1,6,2,1,1,1,1,1,2,1,1,2,1,2,2,3,4,2,2,2,3,1,1,1,1,2,1,1,1,1,1,1,1,2,4,2,1,1,1,6,2,2,1,2,1,1,6,1,1,1,1,1,4,1,2,3,1,1,1,1,1,1,1,5,3,1],
+      ["afternoon",43,2,15,1,134,1,8,1],
+      ["afterward",12,1,6,1,74,1,19,1,3,2,9,1,77,1],
+      ["again",1,1,1,2,2,1,3,1,7,1,5,1,4,1,19,1,3,1,4,1,9,1,1,2,7,1,11,1,15,2,22,1,5,1,4,1,1,1,1,1,7,2,4,1,2,1,8,1,2,1,6,1,5,1,6,2,6,1,3,1,1,1,6,1,6,2,7,1,2,1,1,1,3,3,2,1,2,1,12,1,4,1,3,2],
+      ["against",2,1,3,2,2,1,1,1,12,1,1,3,4,1,7,1,2,1,7,2,1,1,5,1,5,1,7,1,2,1,4,1,1,2,2,2,1,1,1,1,17,1,2,2,1,1,3,1,1,1,1,1,4,3,2,1,12,1,8,1,16,1,1,2,2,1,2,1,5,1,6,1,2,1,10,1,6,3,5,1,6,1,13,4,7,2,5,1,4,1,2,1,2,2,1,1,8,4],
+      ["agatha",109,1],
+      ["age",2,3,7,2,2,1,5,1,5,3,3,5,3,4,2,4,2,2,19,1,4,1,17,1,1,1,1,1,1,1,1,1,3,1,1,1,3,2,5,1,6,1,2,1,9,2,1,1,3,2,1,3,1,1,1,3,4,1,5,1,3,1,2,1,5,1,6,2,4,1,3,1,5,1,1,1,1,3,10,1,2,1,4,6,1,1,4,1,3,5,2,5,11,2,3,2,2,6,2,1,4,1,6,1,2,1,1,1,3,3,1,3,1,1,3,1,1,1,7,1,2,1,1,1],
+      ["aged",49,1,33,2,24,1,70,1,8,1],
+      ["ageing",24,6,58,2],
+      ["agency",16,1,4,1,13,1,2,1,5,1,13,2,6,1,97,1,8,1,11,1,15,1,11,2,18,2],
+      ["agenda",109,1,13,1],
+      ["agent",71,1,54,1,57,1,5,1,6,3],
+      ["aggregation",48,1],
+      ["aggressive",138,1,41,1,10,1,13,1,12,1,10,1],
+      ["aggressively",90,1,20,1,44,1],
+      ["aggrieved",175,1],
+      ["agile",10,1],
+      ["aging",24,1],
+      ["ago",0,2,17,1,5,2,3,7,2,8,5,2,1,1,4,1,1,1,2,9,3,1,2,3,1,1,1,4,3,1,1,1,7,2,3,1,2,1,1,1,3,1,2,1,3,1,3,7,2,1,2,2,1,1,2,1,11,1,2,1,1,2,3,2,1,1,5,1,10,1,6,1,13,1,4,1,5,2,1,10,1,2,2,1,7,1,2,1,2,1,5,1,4,1,1,2,4,1,2,2,1,1,2,1,2,1,3,2,3,2,2,1,2,1,1,1,6,1,4,1,2,1,1,2,4,1,3,1,1,1,1,1,8,1,2,7,1,2,2,2,1,1],
+      ["agonising",147,1],
+      ["agree",16,1,1,1,7,3,25,2,11,1,7,1,8,2,58,1,5,1,12,1,11,1,8,1,33,1,2,1,1,1,16,2,5,1],
+      ["agreeable",161,1],
+      ["agreed",42,4,16,1,39,1,20,1,7,1,4,1],
+      ["agreement",24,3,7,1,5,1,24,2,31,1,65,1],
+      ["agri",201,1],
+      ["agricola",169,1],
+      ["agricultural",33,1,32,1,31,1,3,1,2,3,1,2,31,2,5,1,9,2,52,2,2,1,1,1,22,1],
+      ["agriculturally",201,1],
+      ["agriculture",5,1,28,2,5,1,9,1,12,1,2,3,9,2,9,1,20,1,2,1,1,7,22,1,9,4,6,4,4,1,56,7,2,3,20,2,2,1,1,2],
+      ["agroforestry",201,1],
+      ["agronomist",16,1,185,1],
+      ["ahead",31,1,63,1,19,2,8,1,10,1,8,1,6,1,36,1,11,4,2,2,9,1,6,2],
+      ["ahuja",101,1],
+      ["ai",107,2],
+      ["aid",21,1,17,1,12,1,1,2,10,1,21,1,13,1,6,1,4,1,54,1,3,1,5,1,6,1,12,1,27,1,2,1],
+      ["aide",153,1],
+      ["aided",21,1,23,1,150,1],
+      ["aiding",221,1],
+      ["aim",6,1,1,5,6,4,19,2,3,1,18,2,13,1,4,1,12,1,4,5,25,1,35,4,4,1,13,1,11,1,4,1,10,1,7,1,18,1],
+      ["aimed",49,1,4,1,29,1,1,1,36,1,3,1,35,1,7,1,24,1],
+      ["aimee",47,1],
+      ["aiming",153,1],
+      ["aimless",80,1],
+      ["aimlessly",48,1],
+      ["air",5,8,4,1,6,1,6,5,31,1,7,1,6,1,26,1,21,1,1,2,7,3,1,4,3,2,1,2,4,1,3,1,2,1,3,7,3,1,14,1,5,2,2,1,3,1,1,1,8,4,1,1,6,2,1,1,14,10,18,2,2,1,5,2,1,1],
+      ["airbag",131,1],
+      ["airbed",23,1],
+      ["airborne",65,1,4,2,122,5,23,1,7,1],
+      ["aircraft",191,2,6,1],
+      ["airline",97,1],
+      ["airtight",195,1],
+      ["airway",3,4,217,1],
+      ["aisukurimu",54,2],
+      ["aisukurimuzu",54,1],
+      ["akin",185,1],
+      ["akoya",108,1],
+      ["akron",119,1],
+      ["al",3,1],
+      ["alabama",48,1,11,1,88,1],
+      ["alaca",46,1],
+      ["alan",7,1,21,1,32,1,37,1],
+      ["alarm",59,2,35,2,20,1],
+      ["alarmed",10,1,67,1,105,1],
+      ["alaska",95,1,35,1],
+      ["alaskan",95,1],
+      ["albany",106,2],
+      ["albatross",1,2,129,2],
+      ["albeit",133,1,31,1,41,1],
+      ["albert",145,1,3,1,3,2,36,1,16,1],
+      ["alberto",137,1],
+      ["alchemy",116,1,74,1],
+      ["alcohol",53,1],
+      ["alden",64,1],
+      ["aldous",4,1],
+      ["aldrete",219,2],
+      ["alejandro",143,1],
+      ["alert",103,1,3,3,60,1,16,1,39,1],
+      ["alerted",33,1,190,1],
+      ["alerting",221,1],
+      ["alertness",103,1,3,4],
+      ["alex",82,1,77,1],
+      ["alexander",59,1,34,1,59,1,59,1],
+      ["alexandre",189,1],
+      ["alexi",0,1],
+      ["alfred",188,1],
+      ["algae",48,1,76,1],
+      ["alger",165,1],
+      ["algorithm",167,1,45,1],
+      ["alh",177,1],
+      ["alien",139,3],
+      ["alienated",186,1],
+      ["align",116,1,18,1],
+      ["aligned",101,2,15,1],
+      ["aligning",219,1],
+      ["alike",53,2,67,1,50,1],
+      ["alison",176,1,32,1],
+      ["alive",15,1,79,1,1,1,55,1,27,1,39,1],
+      ["all",0,3,2,3,3,1,3,3,1,2,1,4,1,2,1,1,1,3,1,5,1,6,1,1,3,1,3,4,1,2,1,2,2,2,2,1,2,2,2,1,1,3,1,2,1,1,1,1,2,2,1,1,1,2,1,2,1,4,1,3,1,2,1,1,1,1,1,3,2,5,2,1,1,5,1,1,1,2,1,1,2,1,1,4,1,3,1,1,1,3,1,2,2,3,1,1,3,6,2,1,2,2,1,3,1,1,1,1,1,1,1,1,1,2,4,1,1,1,1,1,1,2,1,8,1,2,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,3,2,3,1,1,3,4,1,4,2,2,1,3,4,2,1,2,1,2,2,2,1,3,1,2,1,4,1,4,1,1,1,2,1,1,1,2,1,5,1,2,3,4,1,3,1,4,2,1,1,3,1,2,1,2,1,2,1,1,1,1,1,1,2,3,1,4,1,2,1,1,2,3,1,1,1,3,2,4,1,2,4,3,2,1,1,3,1,1,1,1,1,2,2,1,1,1,1,4,1,1,1,1,1,1,1,12,1,3,2,2,1,4,1,3,1,1,1,1,1,2,1,1,1,2,1,3,1,3,1,1,1,3,1,1,1,5,1,2,1,4,1,1,1,1,1,3,1,1,1,2,1,2,4,1,1,1,1,5,2,4,1,5,1,1,2,1,1,2,1,2,1,4,1,6,1,2,1,2,1,2,1,1,1,12,1,1,1,1,1,3,1,3,1,4,1,1,1,1,1,2,1,3,2,1,2,5],
+      ["allan",17,1,92,1],
+      ["allegation",171,1],
+      ["allegedly",144,1],
+      ["allegory",157,1],
+      ["allelopathic",224,4],
+      ["allelopathy",224,6],
+      ["allen",138,2,64,2],
+      ["allergic",178,1],
+      ["alleviate",120,1,4,1],
+      ["alli",82,2],
+      ["allison",102,1,97,1],
+      ["allocate",36,1],
+      ["allocated",11,1,80,1],
+      ["allocating",20,1],
+      ["allocation",184,1],
+      ["allow",3,1,4,5,6,1,1,2,3,2,6,1,23,1,6,1,1,1,4,1,1,1,1,1,1,1,2,1,3,1,14,1,7,1,9,2,18,1,8,1,5,1,7,2,2,1,4,1,3,4,1,1,2,1,12,1,7,1,2,1,29,1,2,1,6,1,13,1,3,1,1,1,2,1],
+      ["allowance",162,1],
+      ["allowed",0,1,1,1,6,1,2,1,3,2,12,2,16,1,11,2,8,1,2,1,12,1,4,1,8,1,7,4,4,4,3,1,16,1,35,1,2,1,4,1,12,1,2,1,9,1,5,1,21,1,11,1,4,1],
+      ["allowing",9,1,11,1,2,1,7,1,4,1,2,1,3,1,3,1,6,1,3,1,19,1,20,1,12,1,6,1,12,1,16,1,2,1,41,1,7,1,20,1,1,1,10,1],
+      ["alloy",107,1],
+      ["allure",108,1],
+      ["alluring",151,1],
+      ["allusion",86,1],
+      ["ally",82,1],
+      ["almanac",111,1],
+      ["almost",0,1,6,2,4,1,4,1,1,1,5,1,5,1,1,1,8,1,9,2,3,2,3,1,1,1,2,1,5,1,1,1,8,1,1,2,2,1,4,1,10,2,2,1,3,1,1,1,1,2,3,3,2,1,2,1,4,1,2,1,5,3,1,1,1,2,1,1,6,3,3,1,4,1,1,1,2,1,4,1,5,1,5,1,4,1,6,1,3,2,2,1,1,3,4,1,1,1,1,1,3,1,5,1,4,1,3,1,1,1,1,1,3,1,1,1,5,1,12,1,2,1,3,1,2,1,1,1,7,2,7,3,3,1],
+      ["aloft",159,1],
+      ["alone",3,1,12,1,27,1,8,1,8,1,2,1,16,1,9,1,37,1,3,1,9,2,9,1,8,1,4,1,6,1,1,1,9,1,1,1,1,1,1,3,8,1,10,1,21,1,6,1],
+      ["along",4,1,6,2,4,1,4,1,4,1,5,1,6,1,9,3,10,2,7,2,1,1,4,1,7,1,3,1,3,2,7,1,14,1,3,1,2,1,3,1,1,1,1,2,2,1,5,1,8,1,1,2,1,1,7,1,9,1,3,1,3,1,4,1,3,1,2,1,2,1,1,1,1,1,8,1,4,1,7,1,1,2,24,1],
+      ["alongside",45,1,35,2,7,1,69,1,14,1,12,1,2,1,38,1],
+      ["alp",35,3,134,1],
+      ["alpe",21,1],
+      ["alpha",57,1,24,2],
+      ["alphabet",67,1,44,1,79,1],
+      ["alpine",16,1,114,1,19,1,66,1],
+      ["already",13,1,8,1,27,1,10,2,6,1,1,2,1,1,1,1,2,1,19,1,5,2,13,1,6,1,5,1,7,1,9,4,9,1,9,1,1,1,2,1,5,1,1,1,1,1,1,1,1,1,1,1,11,1,4,1,5,1,1,1,2,2,3,1,3,2,8,1,6,2,1,1,17,1,1,4],
+      ["alroy",75,4],
+      ["also",1,2,2,3,1,4,2,1,1,3,1,4,1,7,1,2,1,2,1,2,1,4,1,2,1,7,1,8,1,2,1,6,2,2,1,2,1,3,1,2,1,3,2,3,1,1,1,3,3,1,1,2,1,1,1,2,1,1,1,2,2,3,1,1,2,2,1,1,1,5,1,1,2,2,1,2,1,1,1,3,1,1,1,3,1,1,1,1,1,2,1,1,1,3,1,3,1,7,1,3,1,1,1,1,1,2,1,1,1,2,1,2,2,1,3,3,1,2,1,1,1,1,1,1,1,2,1,2,1,2,1,1,1,5,1,2,1,3,1,1,1,4,1,2,2,1,1,3,1,2,1,3,1,1,1,3,1,1,1,3,1,2,1,1,1,5,1,1,1,1,2,3,1,2,1,11,1,3,1,4,1,2,1,3,1,1,1,5,1,1,1,1,1,2,1,1,1,1,1,1,1,5,1,6,1,2,1,3,1,1,1,2,1,2,1,2,1,1,1,1,1,2,1,2,1,6,1,1,1,2,5,1,1,5,1,1,1,1,3,10,1,1,1,9,1,9,2,2,1,3,1,1,1,1,1,2,1,1,1,7,1,1,1,4,1,6,1,3,1,1,1,1,1,2,1,2,2,3,1,2,2,3,1,1,1,3,1,4,3,4,1,2,1,1,1,4,2,3,1,2,2,3,1,8,1,5,1,5,1,2,1,1,1,5,1,1,1,1,1,2,1,1,1,4,2,4,1,1,1,1,1,3,1,2,1,1,2,1,1,11,1,1,1,3,2,2,1,2,1,1,1,3,1,5,3,2,1,1,1,4,2,2,1,3,1,2,2,2,1,1,1,9,1,6,1,1,2,3,1,2,1,4],
+      ["altar",123,1],
+      ["alter",20,1,19,1,42,1,8,1,10,1,37,1,29,4,24,1],
+      ["alteration",44,1,125,3,8,1],
+      ["altered",6,2,8,1,13,1,3,1,16,1,32,2,65,1,25,1,36,1,2,1,16,1],
+      ["altering",37,1,67,1],
+      ["alternate",48,1],
+      ["alternative",5,1,3,1,21,1,4,2,8,1,14,1,1,1,16,3,1,1,3,1,28,1,15,1,4,1,1,1,4,1,1,2,4,1,22,2,15,1,7,1,31,1,13,1],
+      ["alternatively",25,1,6,1,75,4,36,1,25,1,45,1,9,1],
+      ["although",2,1,1,1,1,1,6,3,1,1,1,1,2,1,2,4,1,1,1,1,1,1,5,4,1,1,4,3,1,1,2,1,1,1,1,2,5,1,2,1,1,4,2,2,1,1,1,1,1,2,2,1,3,1,1,2,1,1,6,2,1,2,4,2,2,1,4,1,2,2,2,2,1,3,2,1,1,1,3,1,1,1,1,1,1,1,1,1,2,1,1,1,9,1,4,5,1,2,4,1,1,1,1,2,1,1,3,2,1,1,3,1,11,1,7,1,1,1,3,1,1,1,1,1,1,2,3,1,1,1,1,2,2,1,2,2,1,1,4,1,4,2,1,1,3,1,1,1,1,1,2,2,4,1,1,1,3,1,1,1,2,2,3,1,1,2,1,1,2,1,1,1,6,1,1,1,1,1,1,1,3,5,11,1,4,2,3,1,1,1,1,1,1,4],
+      ["altitude",121,1,28,1],
+      ["altogether",20,1,82,1,6,1,5,1,10,1,8,1,6,1,20,1,42,1,8,1,6,1],
+      ["aluminium",165,1],
+      ["aluminum",129,3],
+      ["alumna",22,1],
+      ["alumni",28,1],
+      ["alway",0,1,9,1,6,1,5,1,1,1,4,1,6,1,7,1,2,2,2,1,12,1,4,1,4,1,14,1,6,1,4,1,2,2,2,2,3,1,2,2,5,1,4,1,5,2,7,2,2,1,2,1,6,1,5,4,3,1,7,1,1,1,2,1,1,1,1,2,6,1,2,1,6,1,2,1,1,1,4,2,4,1,1,1,3,1,3,1,1,1,2,1,1,3,9,1,16,1,2,2,2,2,1,2,1,1,1,2,1,1,8,1,2,1],
+      ["alwitt",70,1],
+      ["alzheimer",7,1],
+      ["am",33,1,171,1,2,1,16,3],
+      ["amassing",41,1],
+      ["amateur",9,1,14,1,167,1],
+      ["amazed",50,1,9,1,50,1,18,1],
+      ["amazing",48,1,9,1,60,1,22,1],
+      ["amazon",50,1,91,1,38,4,4,1],
+      ["amazonia",179,1],
+      ["amazonian",89,1,90,2],
+      ["ambar",125,1],
+      ["ambassador",77,1],
+      ["amber",116,2,9,6],
+      ["ambergri",125,25],
+      ["ambiguity",148,1,14,1],
+      ["ambition",8,1,73,1,24,1,8,1,74,1],
+      ["ambitious",31,1,80,1,2,1,55,1,20,1],
+      ["ambivalent",72,1],
+      ["ambushe",69,1],
+      ["amenably",149,1],
+      ["amended",44,1,101,1,58,1],
+      ["amenemhat",123,1],
+      ["amenity",84,1,34,1],
+      ["america",10,3,4,1,8,2,1,10,2,1,7,1,6,2,2,6,1,1,5,1,4,3,9,1,5,3,1,1,10,1,5,1,19,1,2,1,3,1,5,1,3,2,4,1,5,1,18,1,2,2,2,1,1,1,5,1,7,1,2,4,4,1,1,1,14,1,9,1,2,1,5,1,8,2,19,1,3,6],
+      ["american",6,1,9,1,8,3,2,1,4,2,3,2,4,3,4,1,4,1,1,2,5,4,11,1,3,2,2,10,4,1,2,1,2,2,1,3,5,1,8,1,2,9,4,2,1,1,1,1,1,1,7,1,5,3,3,1,7,1,2,1,1,1,3,1,7,1,8,1,1,1,2,2,2,1,2,2,15,1,2,1,1,1,3,1,3,1,1,2,1,1,4,1,1,1,3,1,9,2,3,1,10,1,14,3,6,1,2,1],
+      ["amid",66,1],
+      ["amiss",208,1],
+      ["ammianus",77,1],
+      ["ammonia",164,1],
+      ["among",0,1,12,1,2,3,2,3,5,3,2,1,4,1,7,1,1,1,4,1,5,1,2,1,1,4,1,1,2,1,2,1,4,1,9,2,3,1,7,1,8,1,2,2,3,3,3,1,1,1,3,1,3,1,2,1,1,1,2,1,3,1,2,1,1,2,3,1,3,1,6,2,2,2,4,1,14,1,3,1,1,1,2,1,5,2,2,1,1,2,2,2,2,1,11,1,1,1,4,2,8,5,1,1,2,1,1,1,3,1,2,1,8,1,3,1,3,1,1,1,6,1,6,1,6,1],
+      ["amongst",4,1,19,1,13,1,3,2,7,1,8,1],
+      ["amory",195,1],
+      ["amount",0,1,1,1,1,1,18,4,16,2,12,1,3,2,14,1,5,1,5,1,4,1,17,1,1,1,11,1,9,1,11,1,1,4,5,2,10,1,1,1,11,2,22,1,1,4,6,1,11,1,5,3,2,1,4,1,3,1,6,1,2,2,2,1,5,1],
+      ["amphibian",141,1,52,1],
+      ["amphitheater",50,1],
+      ["ample",14,1,62,1,16,1,11,1,5,1],
+      ["amplify",172,1],
+      ["amplifying",219,1],
+      ["amsterdam",39,1,113,1],
+      ["amurca",51,4],
+      ["amuse",146,1],
+      ["amusement",63,1,69,4,29,2],
+      ["amusia",204,12],
+      ["amusic",204,11],
+      ["amygdala",57,1,14,1,129,1],
+      ["anaemia",105,1],
+      ["analgesic",120,1],
+      ["analogue",167,1,45,1],
+      ["analogy",48,1,68,1],
+      ["analyse",3,1,19,1,14,1,3,1,36,1,78,1,13,2,23,1,12,1],
+      ["analysed",139,1,14,1,14,1,16,1,18,1,11,1],
+      ["analysing",14,1,35,1,43,1,22,1,66,1,10,1],
+      ["analysis",17,1,7,1,3,1,9,1,4,1,15,1,14,1,11,2,11,7,9,1,15,1,13,3,1,3,16,6,4,1,7,1,10,1,8,5,3,2,1,3,11,1,1,1,2,1,9,1,2,2,7,1,12,2],
+      ["analyst",55,1,98,1],
+      ["analytic",160,1],
+      ["analytical",137,1],
+      ["analyze",36,1,27,1],
+      ["analyzed",79,1,99,1,20,1],
+      ["analyzing",90,1],
+      ["anasazi",90,2],
+      ["anatomical",71,1,7,1,32,1,77,1],
+      ["anatomist",71,1,7,1],
+      ["anatomy",11,1,70,1,73,1,33,1],
+      ["ancestor",5,1,5,2,11,1,1,1,21,1,2,1,2,3,14,2,54,2,17,1,15,1,8,3,3,1,10,2,17,1,23,3,14,6,1,1],
+      ["ancestral",121,1,29,1],
+      ["anchor",123,1,19,1],
+      ["anchoring",124,1],
+      ["anchovy",48,2],
+      ["ancient",0,1,3,1,6,7,6,1,2,2,4,2,8,3,2,1,1,1,3,1,3,1,1,1,7,5,1,7,3,5,1,7,6,2,4,1,8,4,10,1,4,1,4,6,7,1,1,1,3,2,9,3,1,1,2,2,5,1,1,4,4,1,3,7,2,1,4,3,7,2,8,1,8,1,6,3,10,1,9,2,10,1,1,2,7,1,15,2,1,1,3,1,4,2,1,3],
+      ["ancillary",170,1],
+      ["ande",22,2,28,2],
+      ["ander",2,1,4,1],
+      ["anderson",1,1,23,12,12,3],
+      ["andrea",18,1],
+      ["andrew",34,2,72,1,5,1,57,1,41,1],
+      ["andronicus",145,1,58,1],
+      ["andy",146,1],
+      ["anecdote",101,1,78,1],
+      ["anew",64,1,79,1],
+      ["angel",171,1],
+      ["angele",35,2,66,1,94,1],
+      ["angelo",148,1],
+      ["anger",60,1,12,1,81,1],
+      ["angle",69,1,28,1,49,1,13,1,9,1],
+      ["angled",1,1],
+      ["anglia",101,1,93,5],
+      ["anglo",66,1],
+      ["angry",60,2,84,1],
+      ["anguish",175,1],
+      ["angus",69,1],
+      ["anhalter",84,1],
+      ["animal",3,2,2,1,4,1,1,5,4,3,3,1,4,5,3,4,1,3,2,3,5,6,5,1,1,2,2,1,5,4,2,3,1,1,3,2,1,1,4,3,2,1,1,5,2,2,2,1,2,4,2,1,1,2,3,2,4,9,3,2,7,3,4,6,1,1,1,1,1,4,4,1,2,2,1,1,3,8,1,1,2,2,1,4,1,2,8,1,4,1,2,1,1,2,1,1,4,6,8,9,1,1,2,5,3,2,3,12,3,2,3,1,4,7,1,1,2,1,1,3,6,2,3,6,7,6,5,1,1,1,5,3,8,1,6,8,3,5,8,6,2,6,1,1,3,4,1,1,5,35,1,2,1,5],
+      ["animate",93,1],
+      ["anjana",101,1],
+      ["ankle",115,1,101,1],
+      ["ann",63,1],
+      ["anne",182,1],
+      ["annette",102,1,97,1,26,1],
+      ["anniversary",20,1,108,1],
+      ["announced",28,1,3,1,13,1,14,1,119,1,11,1],
+      ["annoyance",54,1,59,1],
+      ["annoyed",208,1],
+      ["annoying",225,1],
+      ["annual",4,1,29,1,2,1,30,1,10,1,26,1,24,1,3,1,2,1,49,1,9,3,7,1,29,1],
+      ["annually",75,1,13,1,14,1,15,2,16,1,18,1,48,1],
+      ["anointing",51,1],
+      ["anomaly",25,1,103,2],
+      ["anonymous",23,1],
+      ["anonymously",140,1],
+      ["another",2,1,1,1,3,1,1,1,7,2,1,1,2,1,1,1,2,1,1,1,2,1,4,1,1,2,4,1,1,4,3,2,3,1,1,1,1,2,2,1,2,2,3,1,2,2,3,1,1,1,2,1,1,2,1,1,1,1,1,1,2,1,1,1,4,1,1,1,3,1,3,1,2,1,4,2,1,2,2,1,2,1,1,3,2,2,1,5,2,9,1,4,1,1,4,1,3,2,2,2,1,1,1,1,2,5,2,1,3,2,1,1,1,3,5,2,1,1,1,2,1,1,3,1,2,1,1,1,2,1,2,2,1,2,3,1,2,4,3,1,1,2,1,1,1,2,1,1,1,1,2,1,4,1,1,1,1,1,1,1,4,1,4,2,1,2,5,1,1,1,3,1,2,1,1,5,1,1,1,1,1,1,1,1,2,5,1,1,1,1,1,1,3,1,3,1,6,1,2,1,1,2,4,1,1,1,3,10,1,1,3,1,3,2,1,1,3,1,2,1,2,3,2,2,1,3,1,1],
+      ["ansel",70,1],
+      ["ansmet",177,1],
+      ["answer",1,1,11,1,30,11,11,1,42,2,3,1,4,1,4,2,9,1,11,1,2,1,11,1,6,1,7,1,1,1,2,1,7,1,1,1,2,1,5,2,2,1,3,2,5,2,2,1,3,1,2,1,6,1,6,1,4,1,3,1,5,1,2,3,12,1],
+      ["answered",123,1,42,1,24,1,22,1],
+      ["answering",123,1,3,1],
+      ["ant",5,1,51,14,9,4,70,2,4,35,20,8],
+      ["antarctic",91,7,86,1],
+      ["antarctica",91,8,74,1,12,1,5,1],
+      ["antelope",10,7,80,1],
+      ["antennae",65,2],
+      ["anterior",17,1],
+      ["anthe",68,1],
+      ["anthology",157,1],
+      ["anthony",48,1,44,1,17,1],
+      ["anthropological",101,1,35,1,74,1],
+      ["anthropologist",40,3,7,1,100,2,3,1,42,1,16,1,14,1],
+      ["anthropology",72,1,43,1,45,1,62,1],
+      ["anti",15,1,18,1,8,1,113,2,35,1,25,1],
+      ["antibacterial",65,2],
+      ["antibiotic",7,1,95,1,37,3,60,1],
+      ["anticipate",122,1,18,1],
+      ["anticipated",85,1,98,1],
+      ["anticipating",118,1],
+      ["anticipation",18,1],
+      ["antilocapridae",10,2],
+      ["antilopinae",10,1],
+      ["antimony",218,1],
+      ["antiquity",34,3,31,1,22,2,63,1],
+      ["antiseptic",65,1,86,1],
+      ["antithesis",32,1],
+      ["antoinette",99,1],
+      ["antonio",23,1,23,2],
+      ["anu",62,2],
+      ["anxiety",39,1,53,4,65,1,15,1,2,3],
+      ["anxious",12,1,27,1,3,1,50,6],
+      ["any",1,1,1,1,2,1,2,1,1,2,5,1,1,1,1,1,3,1,1,1,2,5,2,1,1,1,1,1,1,3,4,1,5,3,3,1,1,2,2,1,2,1,5,3,2,1,1,1,9,1,3,4,3,1,3,1,3,2,1,3,1,1,2,2,3,2,1,1,4,1,3,2,1,2,1,1,2,1,4,1,1,2,1,1,1,2,1,1,1,2,1,1,6,3,3,1,1,1,2,1,2,1,4,1,1,1,2,3,1,5,2,1,1,1,1,1,2,1,2,1,1,3,4,1,1,1,2,1,1,1,1,1,1,3,3,2,2,2,1,2,1,1,5,1,4,2,3,1,2,2,4,2,1,3,1,2,2,1,1,1,1,1,1,1,2,6,2,1,1,2,1,1,3,4,1,1,2,5,1,1,1,1,1,1,6,1,1,2,1,2,1,1,4,1,1,1,2,7,2,3,1,1,1,2,1,2,2,1,1,3,2,4,1,1,3,1,2,2,2,1,2,1],
+      ["anybody",19,1],
+      ["anymore",200,1,21,1],
+      ["anyone",6,1,27,1,9,1,10,1,10,1,37,1,12,1,12,1,19,1,4,1,24,1,5,1,6,1,9,1,23,1],
+      ["anything",2,2,7,1,6,1,34,2,5,1,4,1,2,1,6,1,6,1,22,1,5,1,9,1,6,2,37,1,14,1,7,1,7,1,29,1,9,1,4,1],
+      ["anytime",148,1],
+      ["anyway",130,1],
+      ["anywhere",2,1,32,1,9,1,19,1,18,1,66,1,49,1,27,1],
+      ["ap",2,4,150,1],
+      ["apart",14,1,5,1,25,1,15,1,12,1,4,1,1,1,11,1,9,1,4,1,5,1,4,2,6,1,8,2,23,4,21,1,1,1,2,1,14,1,1,1,15,1,4,1,8,1,2,1],
+      ["apartment",17,1,101,2,51,2],
+      ["ape",98,1,17,2,93,1],
+      ["aphid",221,1],
+      ["aphrodisiac",108,1,17,1],
+      ["apnea",94,1,126,4],
+      ["apollo",13,1],
+      ["apparatus",164,1,53,1],
+      ["apparent",13,1,10,1,18,1,8,3,5,1,32,1,11,1,16,1,2,2,2,1,4,1,46,2,4,1,17,1,24,2,14,1],
+      ["apparently",3,1,22,3,53,1,8,1,53,1,12,1,5,1,22,1],
+      ["appeal",26,1,2,3,6,3,13,2,7,1,28,1,18,1,42,1,3,1,3,1,1,1,3,3,1,1,47,1,3,1,3,2],
+      ["appealing",98,1,50,1,67,1],
+      ["appear",1,2,2,2,1,1,9,1,1,1,4,1,2,2,3,2,2,2,1,1,3,1,5,1,5,1,6,1,1,1,2,4,2,1,5,1,5,1,5,1,3,1,2,1,13,1,2,2,6,1,1,1,18,1,3,1,2,1,15,1,4,3,7,1,7,1,1,1,12,1,1,1,2,2,5,1,3,1,4,2,6,1,1,1,9,1,1,1,8,1,3,1,4,1,1,1,1,1,1,1,2,1,1,1,8,3,2,1],
+      ["appearance",1,1,8,1,1,2,12,1,8,2,59,1,2,1,2,1,25,1,3,1,29,1,7,1,17,1,8,1,10,1,23,2],
+      ["appeared",4,1,12,4,4,1,5,1,11,2,10,3,18,1,13,1,32,2,2,1,3,1,63,1,5,1,8,3,2,1,13,1,16,3,1,2],
+      ["appearing",64,1],
+      ["appease",54,1],
+      ["appeasement",60,1],
+      ["appendage",91,1,63,1,23,1],
+      ["appert",61,4],
+      ["appetite",172,1,15,1],
+      ["applaud",219,1],
+      ["applauder",219,2],
+      ["applause",219,22],
+      ["apple",22,1,43,1,159,2],
+      ["application",7,1,12,2,11,1,8,1,42,2,40,2,39,1,67,2],
+      ["applied",8,1,18,1,25,2,3,1,7,1,1,2,36,2,3,1,43,1,1,1,11,1,18,1,4,1,1,1,22,1,2,1,11,3,7,1,5,1],
+      ["apply",11,1,4,1,41,2,6,1,10,1,10,2,20,1,12,1,5,4,3,2,4,1,20,1,28,1,25,1,2,1,13,1,1,1],
+      ["applying",53,2,164,1,4,1],
+      ["appoint",73,1],
+      ["appointed",44,1,67,2,5,1],
+      ["appointing",53,1],
+      ["appointment",8,1,12,1,96,1],
+      ["appraisal",171,1],
+      ["appreciate",98,1,32,1,37,2,13,1,32,2,14,2],
+      ["appreciated",4,1,107,1,32,1,51,1],
+      ["appreciation",7,1,2,2,210,1,7,1],
+      ["apprehensive",156,1],
+      ["apprentice",95,1],
+      ["apprenticeship",163,1],
+      ["approach",4,1,3,1,1,8,2,1,1,1,1,1,1,1,13,1,2,1,7,1,2,1,17,3,6,2,2,1,2,1,1,1,5,1,3,1,1,1,15,3,10,1,3,3,14,2,2,3,13,1,6,1,3,1,10,1,3,1,9,1,1,1,5,1,5,1,26,3,7,1,8,1],
+      ["approache",2,1,6,4,18,1,9,1,19,1,100,2,12,1,40,1],
+      ["approached",85,1,90,1,22,1],
+      ["approaching",24,1,86,1,32,1],
+      ["appropriate",1,1,7,1,46,1,1,1,18,1,20,1,41,1,40,1,12,1,9,1,3,1,3,1,18,1],
+      ["approval",99,1,120,2],
+      ["approve",151,1,6,1],
+      ["approvingly",149,1],
+      ["approximate",198,1],
+      ["approximately",9,1,28,1,7,1,29,1,4,1,17,1,9,1,5,1,33,1,27,1,1,2,9,1,14,1,18,1],
+      ["apricot",65,1],
+      ["april",97,1],
+      ["apt",41,2,7,1,167,1],
+      ["aptitude",6,1,124,1,90,1],
+      ["aptly",66,1],
+      ["aquaculture",124,1],
+      ["aquatic",5,2,136,2,18,1,28,1],
+      ["aqueous",177,1],
+      ["arab",107,1,18,1,70,1],
+      ["arabia",87,1],
+      ["arabic",162,1],
+      ["arable",194,1],
+      ["arachnid",119,1],
+      ["aramid",119,1],
+      ["arbitrary",208,1],
+      ["arc",23,1,34,1],
+      ["archaeobotanist",158,1],
+      ["archaeological",21,2,1,1,9,1,9,4,6,2,1,1,4,1,24,2,12,1,36,1,24,1,22,3,39,2,2,1,4,1,8,1],
+      ["archaeologist",1,2,20,1,6,1,4,2,15,2,1,1,3,4,1,1,49,1,15,1,8,3,24,2,22,2,3,1,20,1,16,2,2,1],
+      ["archaeology",41,1],
+      ["archaism",86,1],
+      ["arched",83,1],
+      ["archery",211,1],
+      ["archimedia",151,1],
+      ["architect",5,4,29,3,1,1,9,6,6,1,13,3,55,3,2,3,31,9,19,1],
+      ["architectural",31,1,3,5,10,2,19,2,88,1,22,1,22,2],
+      ["architecturally",118,1],
+      ["architecture",0,1,7,1,7,1,17,1,3,4,10,1,19,4,57,1,50,1,3,1,22,2],
+      ["archive",95,1,33,1],
+      ["archway",113,3],
+      ["arctic",10,2,11,1,27,1,13,1,60,2,28,5],
+      ["ardent",102,1,97,1],
+      ["arduous",149,1],
+      ["area",2,1,1,1,8,2,2,1,1,2,3,2,1,3,3,2,5,1,3,1,4,1,2,1,1,1,1,3,1,1,2,1,1,1,4,2,1,1,1,1,1,1,1,1,1,4,1,1,1,2,1,1,4,1,3,2,1,1,1,1,1,1,1,1,2,1,4,2,1,2,2,1,5,4,1,6,2,4,3,14,1,1,5,1,6,2,1,1,3,1,5,1,3,1,2,2,2,3,3,1,2,1,1,2,2,1,1,1,3,9,2,1,1,2,3,6,1,1,2,2,2,5,1,1,1,3,1,4,3,3,2,12,1,3,9,2,1,1,2,2,3,2,6,2,3,1,1,2,1,3,2,2,4,1,3,2,1,1,1,3,3,1,1,1,1,1,5,11,3,3,1,1,1,1,1,1,4,2,1,4,2,1,1,1,3,1,2,1,3,1,1,4,4,2,5,3,3,2],
+      ["areal",64,3],
+      ["aren",37,1,32,1,2,2,7,2,15,1,38,1,7,1,19,1,4,1,4,2,26,1,6,1,5,1,17,1,1,1],
+      ["arena",6,1,156,1,57,2],
+      ["argentina",40,1,77,1,24,1,52,1],
+      ["arguably",41,1,6,1,45,1,17,1,11,1],
+      ["argue",7,1,1,1,6,1,2,1,2,1,2,1,17,1,3,1,7,5,13,3,3,3,11,1,7,1,9,1,4,3,1,1,9,1,7,1,1,1,16,1,1,1,2,1,3,1,3,1,11,1,5,2,1,1,4,1,20,2,1,1,29,1],
+      ["argued",0,1,8,4,9,1,38,1,20,1,11,1,10,2,27,1,18,1,11,1,15,2,11,1,9,1,8,1,11,1,1,1,4,1,1,2],
+      ["arguing",211,1],
+      ["argument",6,1,9,2,9,1,29,1,2,1,46,1,1,1,10,1,26,1,14,2,3,1,17,1,6,2,12,1,3,1,6,1,3,1,11,1],
+      ["argyri",8,4],
+      ["arid",10,1,40,1,29,1,11,1,34,4,14,1,27,2,8,1,29,1],
+      ["aridity",210,1],
+      ["ariel",221,4],
+      ["arise",70,1,57,1,19,1,6,1,57,1],
+      ["arisen",14,1],
+      ["arising",64,1,58,1],
+      ["aristocracy",41,1],
+      ["aristocrat",213,1],
+      ["aristocratic",188,1],
+      ["arithmetic",183,1],
+      ["arizona",47,1,28,1,10,1,5,2,87,1],
+      ["ark",32,4],
+      ["arkin",198,3],
+      ["arm",3,1,80,1,8,1,69,1,5,1,12,1,21,1],
+      ["armada",116,1],
+      ["armchair",168,2],
+      ["armed",19,1,29,1,109,1,53,1,7,3],
+      ["armor",52,1],
+      ["army",23,1,44,1,16,1,26,2,2,1,22,1,14,2,18,1,4,1,48,2],
+      ["arnica",16,2],
+      ["arnim",4,1],
+      ["arnold",4,1,147,1],
+      ["aroma",71,1,7,1],
+      ["aromatic",16,1,107,1,2,2],
+      ["aronson",42,1],
+      ["arose",45,1,72,1,67,1,38,2],
+      ["around",0,1,1,1,5,1,1,1,2,1,1,1,3,1,2,1,1,2,5,3,1,1,4,1,1,1,2,1,1,1,1,3,2,1,1,2,4,1,1,2,1,9,3,1,1,1,2,3,1,2,1,2,2,1,1,1,1,1,5,1,1,2,3,2,7,1,1,1,2,1,2,1,1,1,1,4,2,3,1,1,2,1,4,5,5,1,6,1,2,1,4,1,2,3,1,1,1,1,2,1,1,1,1,1,6,3,1,3,1,3,1,1,3,1,1,1,1,2,6,1,3,3,2,3,1,1,1,1,1,1,1,1,3,3,1,2,2,3,5,1,1,2,8,2,2,2,1,2,2,1,2,1,3,1,1,6,1,1,2,1,1,1,1,1,1,1,4,1,6,1,2,2,2,1,6,1,1,1,5,1,1,1,3,1,9,1,3,1,1,3,1,2,2,3,4,1,1,1],
+      ["arousal",63,1,18,1],
+      ["arouse",153,1],
+      ["arrange",105,1],
+      ["arranged",21,1,15,1,64,1,36,1],
+      ["arrangement",21,1,9,1,16,1,4,1,2,1],
+      ["arranging",163,1],
+      ["array",11,1,34,1,50,1,58,1,2,1,21,1],
+      ["arrival",10,1,13,1,38,2,14,2,24,1,4,1,12,1,3,1,3,1,23,2,48,1,2,1,16,2],
+      ["arrive",13,3,33,1,20,1,7,1,48,2,9,1,36,2,15,1,45,1],
+      ["arrived",0,1,27,2,8,1,9,1,2,1,10,1,10,2,11,1,13,1,9,1,4,1,7,1,41,1,36,4,1,1,4,2,4,1,14,1,9,1],
+      ["arriving",1,1,120,1,5,1],
+      ["arrow",211,1],
+      ["arroyo",40,1],
+      ["arsenal",48,1],
+      ["arsenic",193,2],
+      ["art",0,2,5,1,1,1,3,3,2,3,3,1,6,1,14,12,7,1,3,4,3,2,8,2,7,1,1,1,14,1,16,1,12,1,2,1,29,14,10,29,5,5,16,2,3,8,1,1,4,4,6,2,1,1,6,1,10,2,7,23,7,2,2,1,1,11,2,1,5,2],
+      ["artefact",1,2,39,5,1,3,10,1,72,2,87,3],
+      ["artful",55,1],
+      ["arthriti",53,1],
+      ["arthropod",45,1],
+      ["arthur",72,1,1,1,36,1,86,1],
+      ["article",51,1,29,1,6,1,11,1,14,1,15,1,26,1,15,1,41,1,1,1,3,1],
+      ["articulate",74,1],
+      ["articulated",207,2],
+      ["artifact",198,1],
+      ["artificial",1,1,4,1,8,1,22,1,4,1,17,1,104,1,5,1,6,1,19,5,1,1,7,1,2,1],
+      ["artificially",30,1,64,1],
+      ["artiodactyl",10,1],
+      ["artist",2,1,4,1,3,2,2,3,23,1,47,1,19,2,5,2,2,1,29,6,10,11,5,2,15,1,14,1,25,6,10,12,3,2],
+      ["artistic",0,1,34,1,33,1,19,1,102,1,17,2],
+      ["artistry",29,1],
+      ["artwork",34,4,102,5,15,1,19,1,35,1],
+      ["ary",211,2],
+      ["asbesto",122,1],
+      ["ascend",44,1],
+      ["ascent",132,1],
+      ["asch",42,8],
+      ["aschenputtel",157,1],
+      ["asclepius",17,1],
+      ["ash",21,8,8,1,100,11],
+      ["ashore",125,1,67,1],
+      ["asia",0,1,46,1,19,2,22,1,30,1,16,1,8,1,11,2,10,1,6,1,54,1],
+      ["asian",10,1,85,1,3,1,9,1,11,1,6,1,14,1,32,1,32,1,18,1],
+      ["aside",71,1,1,1,6,1,114,1],
+      ["ask",6,1,48,1,15,1,4,1,3,1,4,1,1,1,12,1,25,1,10,3,6,1,10,1,2,1,9,1,32,1,3,1,16,1,20,2],
+      ["asked",3,3,8,1,1,3,3,1,3,1,8,1,10,2,6,8,18,1,21,1,1,1,10,2,6,3,8,1,8,2,34,2,8,1,1,1,3,1,1,1,2,1,8,1,1,1,3,2,4,1,2,3,3,1,5,1],
+      ["asking",18,4,6,1,2,1,120,1,17,1,1,1,42,2,7,1],
+      ["asl",74,5],
+      ["asleep",17,1,168,1,35,3],
+      ["aspect",0,1,5,1,1,1,2,1,3,4,1,1,3,2,7,1,10,1,11,1,6,1,3,1,29,1,4,1,1,5,12,1,6,1,5,1,3,1,6,5,4,1,24,2,2,1,2,1,1,1,3,1,13,1,3,2,1,1,7,2,5,1,4,2,2,1,9,2,6,1,2,1,6,1,12,2,1,1],
+      ["aspiration",11,1,38,1,63,1,10,3,40,1,8,1],
+      ["aspro",72,1],
+      ["assam",88,1],
+      ["assault",69,1],
+      ["assemblage",45,1],
+      ["assembled",140,1,50,1],
+      ["assembling",73,1,50,1],
+      ["assembly",140,2,29,1,49,1],
+      ["assert",26,1,45,1,4,1,3,1,75,1],
+      ["asserted",178,1],
+      ["asserting",162,1,6,1],
+      ["assertion",138,1,54,1,10,1,8,1],
+      ["assertive",225,1],
+      ["assess",11,1,7,1,8,1,10,1,86,2,34,1,10,1,15,1,28,1,10,1],
+      ["assessed",6,1,36,1,50,2,56,1,4,1,3,1],
+      ["assessing",44,1,26,1,149,1],
+      ["assessment",6,2,43,3,26,1,93,1,3,2,7,2,18,1,13,1],
+      ["asset",14,1,19,1,95,10,38,1,28,1],
+      ["assign",26,1,155,1],
+      ["assigned",2,1,129,1,22,3],
+      ["assignment",105,1,26,2,22,1],
+      ["assimilate",2,1],
+      ["assimilation",2,1,205,3],
+      ["assist",44,1,26,1,12,2,9,6,65,2,42,2,3,2,23,1],
+      ["assistance",6,1,56,1,1,1,37,4,21,1],
+      ["assistant",17,1,36,1,53,1,70,1],
+      ["assisted",63,1],
+      ["assisting",105,1,93,1],
+      ["associate",26,1,11,4,19,1,22,1,4,2,53,2,9,1,53,1,1,1,7,1,18,1],
+      ["associated",2,1,1,3,14,1,1,1,6,3,8,2,5,1,3,1,14,1,2,1,26,1,10,1,1,1,6,1,1,1,3,1,6,1,16,1,6,1,8,1,8,3,3,1,24,1,2,1,5,1,23,1,1,1,3,1,11,1,1,1,5,1],
+      ["associating",143,1],
+      ["association",0,1,16,1,23,1,1,1,1,1,29,4,1,1,11,1,40,1,55,1,11,1,6,1,14,1,2,1,12,1],
+      ["associative",149,1],
+      ["assortment",68,1],
+      ["assume",6,1,2,2,14,1,66,1,1,1,13,1,50,1,20,1,27,1,7,1],
+      ["assumed",30,1,11,1,4,1,9,1,10,1,4,1,8,1,23,1,32,1,47,1,7,2,23,1,9,1],
+      ["assuming",75,1,99,1],
+      ["assumption",2,1,4,1,2,4,113,1,29,1,13,1],
+      ["assurance",16,1,57,1],
+      ["assuredly",170,1],
+      ["astelia",1,1],
+      ["asteroid",25,7,117,40,22,20],
+      ["astonished",182,1],
+      ["astonishing",45,1,43,1,33,1,37,1,14,1,20,1],
+      ["astonishingly",57,1,32,1],
+      ["astounding",48,1,82,1],
+      ["astoundingly",139,1],
+      ["astrium",201,1],
+      ["astrobiology",177,2],
+      ["astrological",190,1],
+      ["astronaut",13,3,50,1,79,6,75,3],
+      ["astronomer",142,1,35,2,3,1],
+      ["astronomical",116,1],
+      ["astronomy",64,1],
+      ["astrophysic",30,1],
+      ["astute",219,1],
+      ["atacama",177,1],
+      ["ate",27,1,18,1,58,1,46,1,9,1,21,2,5,1,9,2],
+      ["athanasius",111,1],
+      ["athen",57,1],
+      ["athena",51,1],
+      ["athlete",2,1,7,4,48,5,106,1],
+      ["athletic",9,1,179,1],
+      ["athletically",211,1],
+      ["atkin",76,6],
+      ["atla",45,1,19,6],
+      ["atlanta",14,1,162,1],
+      ["atlantic",48,1,18,1,30,1,25,1,20,1,8,1],
+      ["atmosphere",44,1,40,1,45,1,22,2,8,1,5,5,13,2,3,3,8,1,17,1,21,1],
+      ["atmospheric",90,1,1,1,86,1],
+      ["atom",19,2,61,1,146,5],
+      ["atomic",226,1],
+      ["atop",50,2],
+      ["atrium",63,1,57,1,31,1],
+      ["atsushi",106,1],
+      ["attach",1,1,70,1,26,1,35,1],
+      ["attached",5,1,13,1,8,2,23,1,19,1,23,6,35,1,6,3,32,5,52,1],
+      ["attachment",26,11,28,1,76,1],
+      ["attack",20,1,32,1,9,1,4,3,24,3,5,1,16,1,19,1,25,1,20,1,50,1],
+      ["attacked",19,1,41,1,29,1,14,1],
+      ["attacking",15,5],
+      ["attain",73,1,58,2],
+      ["attained",87,1,86,1],
+      ["attempt",4,1,19,8,16,1,19,1,6,1,17,1,5,4,1,1,8,1,5,1,4,1,1,1,2,1,6,1,7,1,18,1,8,1,2,1,7,1,7,1,8,1,4,2,23,1,3,3,2,1,2,1,10,2,4,1],
+      ["attempted",8,2,28,1,73,1,44,1,11,1,19,1],
+      ["attempting",55,1,90,1,17,1,41,1],
+      ["attend",181,1],
+      ["attendance",170,1],
+      ["attended",4,1,88,1,19,1,25,1,40,1],
+      ["attention",7,1,2,3,2,1,7,1,16,1,2,1,1,2,10,1,1,1,2,1,5,1,3,1,2,1,10,4,2,1,6,1,8,4,3,3,5,1,20,11,12,2,9,1,6,1,4,1,1,5,3,1,3,5,7,1,3,1,4,1,6,2,2,2,7,2,1,1,7,2,1,2,1,1,4,1,2,9,6,1,3,2,2,1,1,1,9,1,1,1,3,2,3,2],
+      ["attentional",114,6],
+      ["attentive",11,1],
+      ["attentiveness",36,2],
+      ["attine",139,16],
+      ["attitude",6,1,7,2,23,1,3,2,18,1,7,1,8,1,10,3,13,1,21,2,15,3,17,2,14,1,43,1,4,1],
+      ["attract",14,1,12,1,2,1,27,1,4,1,6,4,26,1,23,2,2,5,6,1,29,1,2,1,5,1,5,1,16,1,11,1],
+      ["attracted",28,1,3,1,13,1,6,1,8,1,7,1,5,1,12,1,34,1,25,1,4,1,1,1,33,1,11,1,13,1],
+      ["attracting",84,1,48,1,31,1,11,1,44,1,7,1],
+      ["attraction",31,1,24,1,26,1,35,1,14,1,1,1,1,2,17,1,12,2,9,1],
+      ["attractive",9,1,38,3,11,1,76,1,7,1,11,1,1,1,2,4,69,2],
+      ["attractiveness",53,1,99,1],
+      ["attributable",101,1],
+      ["attribute",14,1,12,1,13,1,113,3,3,1,13,1,56,2],
+      ["attributed",27,1,26,1,37,1,75,1,2,1,45,1],
+      ["attuned",106,1],
+      ["auckland",28,7,9,1,81,3,33,6,41,1],
+      ["auction",156,5],
+      ["audience",9,3,3,1,97,1,5,1,23,1,9,2,5,2,6,1,13,1,5,1,13,2,17,1,14,6],
+      ["audition",12,5],
+      ["auditory",83,1,17,1,54,2,13,2,9,3,28,3,8,2],
+      ["audubon",223,2],
+      ["august",58,1,55,1,54,1,45,1],
+      ["auguste",109,1],
+      ["augustus",129,1,16,1,58,1],
+      ["aura",64,1,8,1],
+      ["aural",18,1,190,1],
+      ["aurelian",31,1,188,1],
+      ["auroch",10,1],
+      ["australia",4,1,12,1,8,1,4,1,5,3,11,7,4,1,1,2,6,3,6,1,8,4,20,7,6,1,13,4,9,4,18,2,1,6,2,16,6,3,21,1,1,1,4,1,21,9,1,1,1,15,4,1,1,1,4,16,3,7,5,9,11,1,1,1,2,5],
+      ["australian",5,1,15,1,13,3,1,1,10,1,5,1,6,1,7,1,7,2,20,2,38,1,8,2,1,9,2,2,6,1,22,1,4,1,13,1,8,6,2,4,9,2,3,18],
+      ["austria",35,2],
+      ["authentic",169,1,36,1],
+      ["authenticity",144,1],
+      ["author",9,1,9,1,2,1,17,1,6,1,6,1,10,1,4,1,18,1,2,1,3,1,15,1,4,3,4,4,36,8,3,1,3,1,1,1,14,1,5,1,1,1,10,1,3,1,3,1,1,2,1,4,6,1,5,1,2,8,5,1,3,1],
+      ["authored",92,1,19,1,27,1,41,1,23,1],
+      ["authoritarian",8,1,28,1],
+      ["authoritarianism",36,1],
+      ["authoritative",54,1,62,1,72,1],
+      ["authoritatively",111,1],
+      ["authority",0,1,8,2,28,1,5,1,12,1,37,1,19,1,2,1,1,1,16,1,16,1,3,1,31,1,42,1,5,1],
+      ["authorship",145,1,45,1,13,1],
+      ["autism",106,3],
+      ["autistic",83,1,23,3],
+      ["auto",53,1,41,1],
+      ["autobiographical",96,1],
+      ["automated",13,1,60,1,24,1,43,1],
+      ["automatic",13,3,47,1,13,1,21,1,66,1,21,1,25,1],
+      ["automatically",3,1,94,1,76,1,28,1],
+      ["automation",140,2],
+      ["automobile",75,1],
+      ["autonomation",73,4],
+      ["autonomous",156,1,42,1],
+      ["autonomy",20,2],
+      ["autopilot",57,1,41,1],
+      ["autumn",4,1,117,1,9,1,81,2],
+      ["availability",5,1,4,1,5,1,56,1,27,1,77,1,20,1,20,1],
+      ["available",0,1,1,2,2,1,3,1,15,2,1,2,6,1,4,1,6,1,2,1,6,2,1,1,3,1,3,1,3,1,6,6,8,1,6,3,11,1,9,2,15,1,10,1,1,1,6,2,15,1,10,1,3,1,10,1,2,1,12,2,10,1,1,1,2,1,5,1,2,1,1,1,9,1,16,2],
+      ["avalanche",165,2],
+      ["avenche",196,2],
+      ["avenue",168,1,2,1],
+      ["average",0,1,1,1,2,2,6,1,11,6,4,3,9,2,9,1,1,2,6,1,17,1,10,1,16,1,6,1,3,1,5,2,16,1,4,1,14,1,4,1,9,2,10,3,15,1,1,1,1,1,3,1,10,1,3,1,17,1],
+      ["averaged",151,1],
+      ["averagely",81,1],
+      ["averaging",80,1,99,2],
+      ["aversion",215,1],
+      ["avian",167,1,45,1],
+      ["avoid",5,1,1,1,8,1,17,1,17,1,17,1,15,1,8,1,30,2,2,1,4,1,9,1,52,1,15,2,9,1,5,2],
+      ["avoidance",21,1],
+      ["avoided",36,1,18,1,31,1,11,1,32,1,30,2,16,1],
+      ["avoiding",52,1,21,1,79,1,7,1,41,5,9,1,7,1],
+      ["avon",145,1,58,1],
+      ["await",123,1],
+      ["awaited",109,1],
+      ["awake",17,1,22,2,4,1,63,1,79,1,35,2],
+      ["awakened",17,1],
+      ["awakening",188,1],
+      ["award",30,2,54,1,104,5,7,1],
+      ["awarded",30,1,63,1,91,1,4,1],
+      ["aware",27,1,35,1,6,1,2,1,1,1,7,3,15,1,5,1,8,4,21,1,12,1,36,6,9,1,2,1,5,1,9,3,8,1,11,1,1,1],
+      ["awareness",41,1,29,1,4,1,7,2,5,1,12,2,23,1,6,1,54,1,4,1,41,1],
+      ["away",1,1,4,1,15,3,1,2,6,1,4,1,1,1,1,1,2,5,1,1,5,1,6,1,2,1,1,1,1,1,9,2,2,1,2,1,4,1,21,1,1,1,6,1,2,3,5,4,2,1,2,1,5,2,3,2,15,1,1,4,3,2,2,1,2,1,5,2,3,1,5,1,1,1,2,1,5,1,6,1,5,1,3,1,2,1,2,1,3,2,2,1,4,1,5,1,4,2,1,1,6,1,9,1,4,3,1,2,6,5],
+      ["awe",63,3,20,6,37,1],
+      ["awed",63,1],
+      ["awesome",9,1],
+      ["awful",53,1,140,1],
+      ["awkward",85,1,22,1],
+      ["axe",21,1,140,1],
+      ["axi",161,1],
+      ["axial",164,1],
+      ["azore",66,1],
+      ["aztec",23,2,67,2],
+      ["b612",142,1],
+      ["baby",27,1,2,1,29,1,16,7,9,2,14,2,13,1,4,1,29,1,17,1,7,5,7,2,11,1,26,3,1,5],
+      ["babylonian",46,1,21,1],
+      ["bach",6,1],
+      ["bachman",223,1],
+      ["back",0,2,3,1,1,1,6,1,2,1,3,1,2,1,1,1,3,1,1,4,1,1,1,1,1,4,2,1,2,2,1,1,1,1,1,1,3,2,3,1,1,1,3,2,1,1,3,1,1,2,2,1,2,1,1,4,4,3,5,2,5,4,1,1,1,1,3,1,5,1,2,1,2,1,1,1,1,1,1,2,5,2,4,1,1,2,5,3,2,1,5,1,5,1,3,2,2,1,6,1,2,2,4,1,1,1,2,2,2,2,2,1,8,2,2,2,1,1,4,2,1,1,1,1,3,2,2,2,2,1,1,2,2,2,3,2,1,3,5,1,1,2,1,1,2,1,3,2,2,2,2,3,1,1,3,1,2,1,5,1,5,1,1,1,5,1,8,1,8,2,7,1],
+      ["backbone",144,1],
+      ["backdrop",89,1],
+      ["backed",130,1],
+      ["backfire",114,1],
+      ["background",11,2,23,1,2,1,8,1,24,3,12,1,1,1,5,1,1,1,11,1,20,1,32,1,3,1,2,1,26,2],
+      ["backlash",118,1],
+      ["backward",22,1,76,1,58,1,60,1],
+      ["backwater",35,1],
+      ["backyard",22,1,113,4],
+      ["bacon",145,4,45,4,13,4],
+      ["bacteria",7,1,12,1,26,1,7,1,9,1,4,2,3,1,34,1,17,1,45,2,13,1,22,1],
+      ["bacterial",32,1,33,1],
+      ["bacterium",62,1,77,2],
+      ["bacuri",179,1],
+      ["bad",6,1,9,1,8,7,14,1,5,1,12,2,5,1,12,1,7,1,25,1,9,1,19,1,6,1,1,1,14,1,10,1,1,2,9,3,17,1,9,1,4,1,2,1],
+      ["badly",95,1,71,1,35,1,9,1],
+      ["baekeland",19,2],
+      ["baffle",76,1],
+      ["baffled",109,1],
+      ["bag",19,1,31,3,1,2,56,1,35,1],
+      ["baghdad",107,1],
+      ["bagnold",165,2],
+      ["bahama",158,1],
+      ["bahnhof",84,3],
+      ["bahrain",108,5],
+      ["bailey",185,1],
+      ["bain",34,2],
+      ["baine",123,2],
+      ["bait",127,1,11,1,64,1],
+      ["baited",138,1,64,1],
+      ["baiting",138,4,64,4],
+      ["bake",62,1,133,1],
+      ["baked",62,1,3,1,135,1],
+      ["bakelite",19,2],
+      ["baker",4,1,45,1],
+      ["baking",62,1,9,1],
+      ["bala",30,1],
+      ["balance",11,3,4,1,5,1,4,1,13,1,12,1,6,1,83,1,6,1,58,1],
+      ["balanced",11,2,46,1,10,1,104,1],
+      ["balbag",176,1],
+      ["balcony",118,1],
+      ["baldwin",172,1,49,2],
+      ["balfour",171,1],
+      ["ball",19,1,4,1,34,1,35,2,39,2,18,1,35,4,27,1,6,2,1,2],
+      ["ballet",44,1,102,1,15,1],
+      ["balloon",23,1],
+      ["ballooned",182,1],
+      ["baltic",125,1],
+      ["bamboo",77,1,30,2],
+      ["ban",125,2,1,1,82,2],
+      ["banana",87,1],
+      ["band",11,1,12,1,52,1,25,1,47,7,47,1,7,3],
+      ["banded",89,1],
+      ["bandicoot",135,1],
+      ["banding",89,1],
+      ["bandol",4,1],
+      ["bane",138,1,64,1],
+      ["bang",45,1],
+      ["bangor",114,1],
+      ["banished",168,1],
+      ["bank",4,1,80,1,23,1,6,3,12,1,9,1,58,1,4,1],
+      ["banker",4,1,124,1],
+      ["banknote",107,1],
+      ["bankrupt",113,1],
+      ["bankruptcy",4,1,29,1],
+      ["bankrupted",122,1],
+      ["banned",108,1,18,1,82,1],
+      ["banner",77,2,37,1],
+      ["banteng",10,1],
+      ["bar",97,19],
+      ["barbado",193,1],
+      ["barbara",70,1,5,1,84,1],
+      ["barbarian",87,2],
+      ["barbary",10,1],
+      ["barbecue",118,1],
+      ["barbed",90,1],
+      ["barcelona",156,1],
+      ["barchan",165,6],
+      ["barclay",211,1],
+      ["bard",123,5],
+      ["barely",75,1,69,1,6,1,10,1,5,1,48,1],
+      ["bargaining",156,3],
+      ["bark",107,2,20,1,10,1],
+      ["barking",174,1],
+      ["barley",221,1],
+      ["barnacle",45,1],
+      ["barometric",121,1],
+      ["baron",112,2],
+      ["barr",36,1],
+      ["barracuda",52,1],
+      ["barrage",63,1],
+      ["barrel",213,3],
+      ["barren",90,2,34,3,40,1,13,1],
+      ["barrett",14,5,3,2],
+      ["barricaded",35,1],
+      ["barrier",33,1,43,2,53,1,33,3,6,1,30,2,16,2,10,1],
+      ["barry",169,1,41,1],
+      ["barter",47,1],
+      ["base",5,2,8,1,4,1,14,1,7,1,6,2,19,4,17,1,4,3,33,1,15,1,6,1,4,2,2,1,3,2,55,1,22,1],
+      ["based",2,2,2,1,3,1,1,3,3,1,5,3,4,1,2,1,2,1,2,4,7,1,3,2,1,1,3,1,2,1,8,1,3,1,1,1,8,1,2,1,5,1,6,3,1,1,10,1,7,1,2,1,2,3,1,1,9,2,10,1,1,1,2,2,1,1,4,1,2,1,1,3,5,2,1,1,8,3,5,2,1,1,2,1,5,1,1,3,2,1,5,1,3,1,1,1,1,1,5,1,2,12,2,1,2,2,7,1,3,1,1,2,2,1,9,2,3,1,6,1,2,1,2,1,4,1,3,1,5,1],
+      ["basel",205,1],
+      ["baseline",40,1],
+      ["basic",2,1,15,1,14,1,16,1,5,1,1,2,7,2,2,1,20,1,1,1,12,1,2,1,2,1,1,2,20,1,11,1,1,1,2,3,11,1,3,1,5,1,2,1,4,1,3,1,5,1,8,1,5,1,10,2,1,1,12,1,1,1,5,1,3,1,7,1],
+      ["basically",7,1,53,1],
+      ["basin",51,1,18,1,154,1],
+      ["basing",145,1,58,1],
+      ["basis",8,1,11,1,2,1,5,1,21,2,6,1,4,1,23,1,37,1,33,1,8,1,4,1,13,1,3,1,6,1,38,1],
+      ["bask",110,1],
+      ["basket",91,2,16,1,29,1],
+      ["basketball",6,2,178,1],
+      ["basking",225,1],
+      ["basse",21,1],
+      ["bat",105,1],
+      ["batata",99,1],
+      ["bate",89,1],
+      ["batesian",89,2],
+      ["bath",87,1,82,1],
+      ["bathhouse",169,1],
+      ["bathing",51,1,103,1],
+      ["bathroom",98,1,20,1],
+      ["bathyscaphe",7,1],
+      ["battering",5,1],
+      ["battery",145,1,4,1,46,1,8,1,23,1],
+      ["battista",137,1],
+      ["battle",0,1,69,1,8,1,6,1,24,1,14,1,28,1,40,1],
+      ["battlefield",137,1],
+      ["baume",21,1],
+      ["baumeister",200,7],
+      ["bavelier",189,2],
+      ["bay",129,1,53,1],
+      ["bc",29,2,17,1,5,3,10,1,16,6,11,2,19,3,16,2,6,1,23,1,42,2,25,3],
+      ["bce",38,3,29,1],
+      ["bdnf",92,1],
+      ["beach",48,1,70,1,7,1,31,2,49,1,6,1],
+      ["beache",19,1],
+      ["bead",47,11,61,3,17,1],
+      ["beak",125,3,2,1,8,1],
+      ["beaker",7,1],
+      ["beam",66,1],
+      ["bean",42,1,8,1,171,6],
+      ["beanstalk",157,1],
+      ["bear",23,1,4,46,48,1,47,1,27,1,41,1],
+      ["bearing",28,1,36,3,13,1,46,1,41,1,62,1],
+      ["beast",25,2,2,1,48,1,82,1,10,1,22,1,21,1,2,1,1,2],
+      ["beat",18,1,48,1,25,1,68,1],
+      ["beating",22,1,29,1,1,1,14,1,3,1],
+      ["beatle",115,1],
+      ["beatrix",105,7],
+      ["beauchamp",4,2],
+      ["beautiful",47,1,35,1,9,1,28,2,38,1,48,1,10,1],
+      ["beautifully",46,2,91,1],
+      ["beauty",34,1,17,1,12,1,73,2,5,1,5,1,11,2,1,1,57,5],
+      ["beaver",75,1],
+      ["became",0,5,1,2,3,4,4,1,1,3,3,1,4,1,2,1,4,3,1,3,2,1,2,1,1,2,1,4,2,1,7,1,1,4,2,1,4,2,1,5,1,1,2,1,2,2,3,2,2,1,2,1,3,1,2,1,1,3,3,5,10,6,2,2,2,7,1,1,2,2,4,6,4,2,4,1,1,5,8,1,2,3,2,3,1,1,3,2,2,2,1,1,1,1,11,3,7,1,1,3,2,1,6,1,8,1,5,1,1,1,3,1,8,1,2,1,3,1,3,1,7,3,6,1,3,1,1,1,1,1,5,2,2,1,6,1,2,1,3,1,3,1,2,1,1,10,2,1,1,7,1,2],
+      ["because",0,1,2,1,1,2,3,2,2,1,7,6,1,9,1,1,1,2,2,3,1,6,1,2,2,1,1,15,1,2,2,2,1,3,1,5,2,1,1,1,1,4,2,3,1,8,1,1,1,1,1,3,2,1,1,2,2,2,2,2,1,1,1,4,1,2,1,1,1,1,1,1,3,1,1,2,1,1,1,2,2,2,1,1,1,1,2,2,1,3,1,2,1,2,2,1,2,3,1,2,2,2,1,3,4,1,1,2,3,1,4,1,1,1,1,1,2,1,1,2,1,1,1,2,1,1,1,1,3,4,1,2,1,6,2,1,1,2,1,1,1,1,1,1,1,1,1,1,2,5,1,4,2,3,1,3,2,1,1,3,1,2,1,2,2,1,2,2,1,1,1,3,1,6,1,4,2,4,1,2,6,2,1,2,1,3,1,4,1,1,1,2,1,5,2,5,1,1,2,3,1,2,2,1,1,3,2,2,2,2,1,1,2,2,3,1,3,2,2,1,3,1,2,1,2,11,1,1,1,2,1,4,1,2,1,1,2,1,1,1,1,1,2,1,4,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,1,1,2,2,2,3,1,4,1,1,1,2,2,2,4,4,1,1,1,3,1,2,1,2,1,3,1,1,1,2,1,1,1,5,1,1,1,1,1,3],
+      ["become",2,3,2,2,1,1,1,2,1,5,1,1,1,7,2,1,4,2,10,3,1,3,3,2,1,1,5,1,2,2,1,1,4,3,1,1,1,1,2,1,2,4,2,1,1,1,4,2,1,1,1,2,4,1,1,1,1,1,1,1,1,1,1,1,2,1,7,1,1,2,2,1,9,1,1,1,4,2,7,2,5,2,3,1,6,2,8,1,1,3,2,2,1,1,1,1,2,1,5,1,3,1,3,1,1,5,3,1,6,1,2,1,1,1,3,2,1,2,1,1,1,1,3,1,2,3,3,1,4,2,1,1,2,1,1,1,1,1,3,1,2,1,1,2,2,1,2,2,1,3,1,2,1,1,1,1,4,2,5,1,2,1,1,1,3,1,2,1,1,1,2,1,2,1,2,1,1,2,1,2,1,3,3,4,3,1,3,1,1,2],
+      ["becoming",2,1,2,1,4,1,5,1,2,2,19,1,1,1,1,1,3,1,17,1,11,1,3,1,1,1,7,1,14,1,8,1,4,1,5,1,3,2,5,1,1,1,10,1,5,1,16,1,12,1,1,1,10,1,2,1,14,1,6,2,4,1,11,1,13,2,2,1,2,1],
+      ["bed",21,1,18,4,4,1,2,4,53,1,86,1,1,1,35,1],
+      ["bedding",21,1],
+      ["bedouin",79,1],
+      ["bedrock",69,1],
+      ["bedroom",157,1],
+      ["bedside",72,1],
+      ["bee",56,12,9,1,32,1,86,1],
+      ["beehive",38,1],
+      ["beetle",103,1,90,4],
+      ["before",0,1,2,1,5,2,4,1,2,3,4,1,2,1,6,1,2,1,3,1,1,1,3,1,4,1,1,3,1,1,3,1,2,1,2,2,2,2,1,1,6,1,8,2,1,1,1,2,1,1,1,1,6,3,3,4,7,1,4,2,2,1,4,2,1,2,1,5,9,1,3,1,5,2,2,1,2,1,3,1,1,2,1,1,3,1,2,1,3,1,7,2,2,1,5,1,9,1,1,2,8,2,2,1,4,1,2,1,3,1,2,1,1,1,5,2,2,2,1,1,1,1,5,1,1,1,1,4,1,1,2,1,1,1,2,1,6,1,1,1,3,1,3,1,2,1,5,1,1,2,4,1,2,1,1,1],
+      ["beforehand",220,1],
+      ["beg",190,1],
+      ["began",0,5,1,1,2,2,1,2,5,5,3,1,7,1,3,2,1,7,1,1,1,2,2,4,1,1,2,1,1,1,1,2,1,1,3,3,2,3,1,4,5,2,1,1,1,2,1,1,3,1,1,1,10,2,5,1,1,1,1,3,3,1,6,2,1,1,1,1,8,1,1,2,4,1,7,6,6,1,2,2,5,1,1,3,1,1,1,1,1,1,2,2,10,1,4,1,3,1,1,2,2,1,5,1,1,2,12,1,1,1,1,1,2,3,4,1,4,1,4,1,2,1,5,1,11,1,4,3,6,1,1,1,1,1,6,1,5,1,2,1,2,1,1,1,3,1,1,5,1,2],
+      ["begged",221,1],
+      ["begin",17,1,8,1,7,1,24,1,3,1,1,1,6,1,22,1,3,1,3,2,5,2,20,1,5,1,7,1,6,1,6,2,9,1,14,1,7,1,1,2,2,2,4,1,1,1,2,1,1,1,23,1,15,1],
+      ["beginning",4,1,5,4,2,1,11,1,4,1,3,1,7,1,4,1,6,1,7,2,6,1,14,1,14,2,1,1,15,1,1,1,1,1,8,2,4,1,6,1,9,2,8,1,3,1,7,1,20,1,2,1,12,2,1,1,15,1,16,1],
+      ["begun",1,1,13,1,27,1,13,1,20,1,35,1,60,1,13,1,19,1],
+      ["behalf",23,1],
+      ["behave",59,1,1,1,8,1,17,1,4,1,3,1,58,2,48,1,27,1],
+      ["behaving",98,1],
+      ["behavior",36,3,24,2,3,1,111,5,24,4,11,1,7,3],
+      ["behavioral",98,1,122,1,1,1],
+      ["behaviorally",216,1],
+      ["behaviour",3,3,3,1,8,1,1,2,22,6,5,2,14,1,2,1,13,1,7,1,4,1,7,2,9,1,8,4,8,2,4,4,3,1,6,6,3,7,19,1,1,8,4,3,1,2,1,2,7,1,8,1,3,2,5,1,3,1,2,2,1,1,4,1,19,1,14,1,3,1],
+      ["behavioural",3,1,5,2,46,1,96,1,75,1],
+      ["behind",28,1,3,1,17,1,8,1,9,1,14,2,3,1,6,1,25,1,10,2,8,1,23,1,6,1,12,1,9,1,7,1,8,2,9,1],
+      ["behistun",67,1],
+      ["behold",119,1],
+      ["beinecke",190,1],
+      ["being",0,2,1,1,1,1,1,3,2,1,1,1,1,1,2,2,2,1,1,1,1,4,3,2,3,1,1,2,3,1,3,1,1,2,1,2,1,1,4,2,1,3,1,2,1,2,1,5,1,2,2,1,1,1,5,1,2,3,1,1,1,1,2,1,1,1,1,3,1,1,1,1,1,3,1,3,1,1,1,2,1,1,1,2,1,1,1,2,1,1,1,1,3,1,3,1,3,1,1,4,1,1,1,1,2,3,1,2,2,1,1,2,1,1,6,2,1,4,1,2,2,1,1,1,3,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,2,1,2,1,6,1,1,1,1,3,2,1,3,2,1,3,1,1,1,2,3,1,1,2,3,1,4,1,4,2,1,4,4,3,1,1,2,2,1,1,1,2,1,1,1,1,1,3,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,6,2,1,6,3,1,3,1,2,2,1,1,1,1,1,3,1,1,2,1,1,1,2,2,1,1,1,1,1,1,2,1,2,2,2,1,2,1,2,2,1,2,1,1,1,2,1,2,3,1,1,1,1,2,1,2,2,2,1,1,3,1,1,1,2,1,1],
+      ["bekoff",92,1],
+      ["belgian",19,1],
+      ["belgium",4,1,52,1,43,1,35,1,52,1,8,1],
+      ["belief",6,1,5,1,17,1,13,1,1,4,12,1,21,1,3,1,28,1,3,4,7,2,21,5,3,1,1,1,9,1,1,1,9,3,12,1,11,2,30,1],
+      ["believe",11,1,3,1,3,1,1,4,2,4,4,3,1,4,4,1,5,1,3,4,2,1,1,1,5,1,2,2,1,1,1,1,5,1,3,1,1,2,1,1,1,1,12,1,2,2,3,1,3,1,2,1,3,1,9,2,1,1,1,1,3,1,1,1,18,1,8,1,5,2,4,1,3,1,1,1,4,1,1,1,1,1,3,2,2,2,2,1,6,1,1,1,2,1,3,4,2,1,9,1,1,2,5,3,2,1,2,2,5,1,7,3,4,1,1,1,1,1,5,4,7,1,6,2,1,2,1,1,2,2,1,1],
+      ["believed",4,1,4,3,1,1,1,1,7,1,20,1,8,1,5,1,1,2,15,1,8,1,3,3,9,1,8,1,3,1,6,1,3,1,5,1,5,3,9,2,3,1,8,1,9,1,13,1,2,1,4,1,5,1,8,1,8,1,2,2,3,4,2,3,4,1,4,1,3,1,1,2,9,1,5,1,6,1],
+      ["believer",128,2],
+      ["believing",5,1,88,1,45,1,24,1,25,1,15,1],
+      ["bell",158,1,22,1],
+      ["bella",4,1],
+      ["bellbird",187,1],
+      ["bellingham",18,1],
+      ["bellini",170,1],
+      ["belly",52,1],
+      ["belnap",90,1],
+      ["belong",8,1,2,2,4,2,96,1,55,1,19,1,39,1],
+      ["belonged",46,1,29,1,117,1,26,1],
+      ["belonging",84,1,1,1,6,1,78,1],
+      ["beloved",105,1,100,1,14,1],
+      ["below",30,1,1,1,13,1,1,1,7,1,13,1,3,1,23,1,22,1,4,1,2,1,6,1,13,1,15,1,20,1,4,2,5,1,20,1,8,3,6,1,1,1],
+      ["belt",23,1,108,1,1,1,17,1,13,1],
+      ["bely",223,1],
+      ["ben",221,3],
+      ["benche",84,4],
+      ["bend",35,1,24,1,157,1],
+      ["beneath",3,1,31,3,15,1,19,1,1,4,19,1,3,1,22,2,97,1,6,1,5,2,3,1],
+      ["benedetti",72,2],
+      ["beneficial",8,1,15,2,1,4,29,1,36,1,7,1,3,1,10,1,11,1,2,1,54,1,2,1],
+      ["benefit",0,1,8,1,3,1,3,1,10,1,2,1,2,2,2,1,7,1,10,3,6,1,2,2,4,3,6,1,7,1,2,2,2,2,7,3,2,1,4,2,3,1,3,1,2,1,3,1,1,1,1,1,18,1,1,1,1,2,6,1,3,1,4,1,3,1,5,2,3,8,6,1,1,3,5,1,18,7,2,9,2,1,5,1,1,1,1,1,2,5,6,2,4,1,3,1,7,1,12,1,4,1],
+      ["benefited",96,2,26,1,99,1,1,5],
+      ["benevolence",41,1],
+      ["benign",21,1,27,1],
+      ["benjamin",183,1,6,1],
+      ["benn",33,1],
+      ["bennelong",44,1],
+      ["benson",49,1],
+      ["bent",46,1],
+      ["benyus",5,4],
+      ["bequeathed",188,1],
+      ["bergen",47,1],
+      ["berkeley",95,1,14,1,20,1],
+      ["berlin",35,1,49,9],
+      ["bernacotti",218,2],
+      ["bernard",97,2,54,1],
+      ["bernhard",157,1],
+      ["berowra",136,2],
+      ["berry",22,1],
+      ["bert",57,1],
+      ["berth",91,3],
+      ["bertram",105,1],
+      ["bertrand",4,1],
+      ["berwick",33,1],
+      ["beside",22,1,18,1,17,1,68,1,13,3,16,2,25,2,23,3,5,1],
+      ["besieged",144,1],
+      ["best",1,1,1,1,2,1,2,6,2,2,6,1,5,1,1,2,8,1,4,3,1,1,4,1,3,1,4,1,3,1,3,1,2,1,2,2,1,1,1,5,1,1,2,1,3,2,1,1,6,1,3,1,1,1,1,1,2,1,10,6,10,2,2,3,2,1,2,2,3,1,3,1,1,1,3,1,10,3,5,1,2,1,2,4,7,1,1,1,11,1,2,2,1,1,3,2,6,1,1,8,3,1,5,1,1,1,5,1,3,1,4,1,4,2,1,1,10,2,1,2,2,1,7,2,6,1,1,1,3,1],
+      ["bestowed",107,1],
+      ["bestseller",188,1],
+      ["bet",66,1],
+      ["beth",83,1,106,1],
+      ["betray",157,1],
+      ["bettelheim",157,2],
+      ["better",5,2,1,1,1,2,4,3,2,1,2,1,9,3,2,1,4,1,3,1,2,1,2,5,2,1,3,1,1,1,3,1,3,3,2,1,2,1,3,1,1,2,1,1,6,1,2,1,5,1,1,4,6,1,5,1,2,3,7,1,4,1,4,4,1,1,1,1,7,1,3,1,2,1,3,1,4,1,1,1,5,1,1,1,1,5,2,1,3,4,9,4,1,2,2,1,3,1,3,3,3,1,8,2,3,4,5,1,1,2,6,1,1,2,2,1,3,2,1,1,4,1,8,2,2,1,1,2,1,1,5,4,3,1,8,1,2,1,1,2,2,5,3,2,1,5],
+      ["betty",55,1],
+      ["between",0,2,1,1,1,1,1,3,1,2,3,2,1,1,3,1,2,4,1,3,1,1,5,1,4,3,1,2,1,2,1,2,2,1,2,1,2,2,3,5,3,2,4,2,4,1,2,2,1,1,4,7,2,1,2,1,2,5,3,2,1,1,2,3,4,1,1,3,2,1,3,1,2,3,2,2,1,7,3,5,1,2,1,3,1,4,1,1,2,1,2,2,1,1,3,2,2,1,1,2,1,7,1,2,4,1,3,1,2,1,1,1,5,1,3,1,1,3,1,1,1,5,2,1,1,1,1,2,1,1,1,3,3,2,6,6,1,1,5,2,1,1,1,1,1,9,1,2,3,1,2,2,1,1,2,1,1,1,2,1,2,1,2,2,1,1,1,1,1,2,2,5,1,1,6,1,2,5,2,4,1,1,1,2,1,4,1,1,2,2,1,1,1,2,3,1,7,1,1,4,1,4,4,1,1,1,1,5,3,2,1,1,2,1,1,1,1,5,1,1,3,1,3,1,1,1,1,2,1,6,1,1,1,1],
+      ["beverage",0,2,200,1],
+      ["bewildering",192,1],
+      ["beyond",18,1,23,1,6,1,10,1,24,2,18,1,2,1,5,1,2,1,14,1,5,1,6,1,4,1,2,1,7,2,2,1,3,1,8,1,2,1,10,1,2,1,3,1,6,1,15,1,1,1,24,1],
+      ["bia",41,1,130,1,13,1,16,1,15,1],
+      ["biannual",32,1],
+      ["biase",41,1],
+      ["biased",117,1],
+      ["bible",179,1,11,1],
+      ["bickerton",208,3],
+      ["bid",69,1,87,2,67,1],
+      ["bidder",156,2],
+      ["biennale",205,1],
+      ["big",16,1,4,1,5,4,8,2,4,1,6,1,16,1,4,1,8,1,9,1,4,1,10,1,4,1,3,1,1,1,12,1,1,1,3,1,10,2,9,1,15,1,4,1,4,1,3,1,16,1,5,1,11,1,1,1,3,1,22,1],
+      ["bigger",7,1,7,1,8,1,2,1,35,1,56,2,45,1,5,1,19,1,1,1,15,1,22,1,3,2],
+      ["biggest",69,1,12,1,3,1,6,1,10,1,1,1,16,1,18,1,10,1,18,1,17,1,15,2,8,1],
+      ["bighorn",10,1],
+      ["bight",138,1,64,1],
+      ["bilbao",34,8],
+      ["bilingual",54,12,41,1,91,5,21,1],
+      ["bilingually",54,1],
+      ["bill",15,1,18,3,48,1,22,1,39,1,53,2,29,1],
+      ["billboard",114,1],
+      ["billiard",19,1],
+      ["billing",158,1],
+      ["billion",35,2,2,1,20,1,8,2,6,1,25,1,1,2,5,2,12,1,3,2,12,1,4,2,1,2,1,1,7,1,13,1,1,1,8,4,2,1,11,1,22,2,21,1],
+      ["billowing",44,1],
+      ["billy",225,1],
+      ["bin",135,1],
+      ["bind",129,1],
+      ["binding",15,1,38,1],
+      ["bingen",27,2,41,1],
+      ["bio",120,1],
+      ["biochemistry",20,1],
+      ["biodegradable",19,1,103,1],
+      ["biodiversity",32,4,16,2,85,1,5,1,3,1,61,1],
+      ["biofuel",122,1],
+      ["biographer",171,1],
+      ["biographical",111,1],
+      ["biography",27,1,84,5,60,1],
+      ["biolog",143,1],
+      ["biological",5,1,9,3,86,1,20,1,30,1,23,1,12,2,2,1,6,8,7,1,13,1],
+      ["biologically",167,1,5,1,40,1],
+      ["biologist",5,1,9,1,13,1,32,1,33,1,35,1,8,2,3,1,1,3,5,1,6,1,23,1,29,1],
+      ["biology",7,1,7,1,140,1,5,1,8,2,22,1,21,1,2,2,1,1,3,1],
+      ["biomass",201,1],
+      ["biomedical",83,1],
+      ["biomedicine",119,1],
+      ["biomimetic",5,2,154,1],
+      ["biomimicry",5,7],
+      ["biophilia",120,1],
+      ["biophilic",120,14],
+      ["biorobotic",159,5],
+      ["bipedal",115,1],
+      ["bipolar",81,1],
+      ["birch",21,1],
+      ["birche",84,1],
+      ["bird",17,2,33,1,6,1,33,1,14,14,18,27,6,19,3,33,5,10,9,2,2,1,12,5,9,1,16,1,2,1,2,1,6,2,19,1,1,2],
+      ["birdseye",61,2],
+      ["birdsong",167,1,45,1],
+      ["birmingham",145,1,45,1,13,1],
+      ["birth",58,1,16,1,33,1,9,1,27,1,28,1,14,1,31,1,9,1],
+      ["birthday",20,1],
+      ["biscuit",200,1],
+      ["bison",10,2,11,1,69,2,125,1],
+      ["bisque",29,8],
+      ["bit",7,1,31,1,13,2,8,1,13,1,9,1,15,1,2,1,1,1,5,1,10,1,1,1,1,1],
+      ["bite",110,1,25,1,2,1,30,1,44,1,1,1,4,1],
+      ["biting",108,1,11,1],
+      ["bitten",224,1],
+      ["bitter",51,1,10,1,133,1],
+      ["bitterly",164,1],
+      ["bizarre",45,2,46,1,99,1],
+      ["bj",172,1],
+      ["black",38,2,9,1,1,1,5,1,6,1,9,2,21,4,8,1,10,1,1,2,17,2,2,1,3,1,5,1,1,1,5,2,12,1,3,2,7,1,6,1,25,1,23,2,6,22],
+      ["blackberry",38,1],
+      ["blacked",161,1],
+      ["blackening",191,1],
+      ["blacking",208,1],
+      ["blackledge",119,1],
+      ["blackness",217,1],
+      ["blackout",141,1],
+      ["bladder",52,2,7,4,152,1],
+      ["bladderwort",59,1],
+      ["blame",27,1,16,1,10,1,22,4,15,1,3,1],
+      ["blamed",43,1,94,1,52,1],
+      ["blaming",36,1],
+      ["bland",63,2,95,1],
+      ["blandness",149,1],
+      ["blank",5,6,2,12,2,6,4,8,1,2,1,20,1,12,2,12,1,2,1,8,1,6,1,1,1,42,1,6,1,18,9,6,3,8,2,2,3,8,5,8,2,6,7,6,6,4,1,8,1,2,11,10,6,15,3,6,2,12,3,6,2,30,1,2,8,12,2,20,4,12,12,6,1,2,3,2,6,6,1,12,1,4,1,6,1,2,2,6,1,6,2,12,3,12,2,12,1,12,1,8,1,2,1,12,4,1,4,10,1,6,9,20,1,6,10,20,4,8,5,8,6,2,1,2,8,20,1,6,7,12,13,12,1,4,1,20,4,2],
+      ["blasted",79,1],
+      ["blasting",79,2,135,1],
+      ["blatantly",42,1],
+      ["bleached",38,1],
+      ["blemishe",89,1],
+      ["blend",19,1,36,1,13,1,19,1,2,1,90,1,37,1],
+      ["blended",38,1,119,1],
+      ["blending",89,1],
+      ["blessing",175,5],
+      ["blew",88,1,2,1,61,1],
+      ["blind",58,1,14,1,4,1,17,3,21,1,30,1,10,1],
+      ["blindly",56,1],
+      ["blindness",58,3],
+      ["blink",25,1,9,1,80,3,38,1],
+      ["bliss",4,2],
+      ["blister",53,1],
+      ["blistering",173,1],
+      ["block",5,4,40,1,18,5,5,1,4,2,9,1,1,1,11,1,25,1,2,1,12,1,35,1,12,1,2,1,14,1,17,1,3,1],
+      ["blockbuster",55,25,115,2],
+      ["blocked",53,1,19,1,149,2],
+      ["blocking",141,1],
+      ["blog",9,1,25,1],
+      ["blombo",47,6],
+      ["blood",37,1,15,1,8,1,12,1,8,1,25,1,1,2,4,1,27,1,35,1,1,1,37,1,6,4],
+      ["blooded",17,1,196,1],
+      ["bloom",48,1,91,1],
+      ["blossom",65,1,34,1],
+      ["blossomed",105,1],
+      ["blow",27,1,97,1,53,1],
+      ["blowing",165,2],
+      ["blown",21,1,100,1,27,1,17,1,52,1],
+      ["blue",4,2,34,2,30,4,4,2,17,1,46,1,1,1,13,1,23,1,8,2],
+      ["blueprint",218,1],
+      ["bluestriped",89,4],
+      ["bluma",18,1],
+      ["blur",86,1],
+      ["blurb",175,1],
+      ["bmw",47,1],
+      ["board",13,1,2,1,18,2,33,1,26,1,7,1,5,1,7,1,25,1,6,1,11,1,15,1],
+      ["boarding",105,1],
+      ["boast",21,1,99,1,7,1],
+      ["boasted",213,1],
+      ["boat",123,6,13,2,5,3,26,1,1,1,11,1,33,1],
+      ["bocheren",27,6],
+      ["bodied",45,2,30,1],
+      ["bodily",57,1],
+      ["bodman",118,1],
+      ["body",3,1,2,4,2,1,10,2,3,1,3,1,6,1,8,1,2,2,6,3,1,4,5,1,1,9,2,1,2,1,1,1,3,1,1,1,2,1,5,3,4,3,11,2,6,2,2,1,3,2,4,3,18,1,3,2,3,1,3,1,6,2,5,2,1,1,2,2,1,3,2,4,6,1,2,1,1,1,1,1,2,1,6,1,1,3,5,1,7,1,2,1,1,1,9,2,3,1,12,1,10,1,1,2,5,1,4,2,3,1,3,4],
+      ["bog",59,3],
+      ["boil",0,1,79,3],
+      ["boiled",0,1,51,1,37,1,21,1,40,1],
+      ["boiling",0,1,61,1],
+      ["boisterous",0,1],
+      ["bold",170,1,49,1],
+      ["bolen",80,2],
+      ["bolivia",43,1,58,1,57,1],
+      ["bologna",28,1],
+      ["bombarded",166,1],
+      ["bonaparte",217,1],
+      ["bond",85,1,113,2,24,1,3,1],
+      ["bondi",205,1],
+      ["bonding",19,2,35,1,31,1,21,1,56,1,10,1,26,2],
+      ["bone",1,6,20,3,4,2,2,11,2,1,11,3,5,1,2,1,3,2,25,2,14,1,5,1,13,1,3,2,5,3,6,1,33,3,18,2,20,5,18,7],
+      ["bongo",10,1],
+      ["bonne",21,1],
+      ["bonobo",98,1],
+      ["bonus",25,1,30,1],
+      ["bony",10,1],
+      ["book",0,2,4,1,1,2,10,1,1,1,1,1,8,2,3,1,11,2,6,1,2,1,2,1,4,2,6,1,24,1,5,1,13,2,4,8,2,2,2,2,2,6,1,2,14,1,5,1,5,1,1,2,12,5,1,2,2,3,5,2,10,1,4,2,1,1,6,1,1,16,3,8,6,3,2,5,16,10,2,6,1,1,3,1,11,1],
+      ["booker",188,5],
+      ["bookshelve",157,1],
+      ["boom",48,1,51,1,29,1,4,2,11,1],
+      ["booming",94,1,71,1],
+      ["boost",49,1,6,1,13,1,8,1,5,1,14,1,38,1,43,1,25,1,19,1],
+      ["boosted",163,1],
+      ["boosting",55,1],
+      ["boot",23,3,118,1,8,2],
+      ["booth",170,1],
+      ["border",124,1,68,1,31,1],
+      ["bordering",51,1],
+      ["bore",123,1],
+      ["bored",63,1,43,1],
+      ["boredom",63,1,43,1,43,1],
+      ["boring",63,6,10,1,9,1],
+      ["born",4,3,2,1,6,1,34,1,1,5,11,1,4,1,2,2,12,1,5,1,2,1,4,1,6,2,7,1,5,1,6,1,5,1,7,1,13,1,8,1,1,1,5,1,13,1,34,1,6,1,1,1,1,1,20,1],
+      ["borough",70,1],
+      ["borrow",15,1],
+      ["borrowdale",217,5,1,6],
+      ["borrowed",54,2,41,1,34,1,78,2],
+      ["borrowing",205,1],
+      ["boss",174,1],
+      ["bosse",225,1],
+      ["boston",94,1,7,1,22,1],
+      ["botanic",32,1,73,1,30,1],
+      ["botanical",99,1,42,1,80,1],
+      ["botanist",22,1,1,1,102,1,16,1],
+      ["both",0,1,1,1,2,1,1,1,2,1,2,1,3,1,3,1,4,1,1,1,5,4,3,1,1,1,1,1,1,2,1,1,1,1,2,3,2,1,1,3,1,3,1,1,1,1,1,1,2,1,1,1,8,1,2,2,1,3,1,1,1,1,6,1,2,1,1,1,4,1,1,1,3,2,4,1,2,1,2,1,1,1,2,1,2,1,6,2,1,1,2,1,2,1,3,1,1,1,3,1,1,1,4,2,9,1,1,1,1,1,1,3,1,1,2,2,1,1,2,1,2,1,1,1,5,1,3,1,1,1,3,1,2,1,5,1,1,2,1,1,1,1,1,4,1,1,1,1,2,1,9,1,3,1,2,1,1,1,1,1,2,1,2,2,2,1,4,3,1,2,1,4,1,2,1,1,3,1,1,1,2,1,1,1,2,2,2,1,2,1,2,1,5,2,2,1,2,1,2,1,2,2,1,1,5,1],
+      ["bother",104,1,57,1],
+      ["bottle",19,3,23,1,19,1,53,2,20,2],
+      ["bottom",15,1,6,1,27,1,1,1,6,2,24,2,34,1,19,4,24,1,24,1,8,1],
+      ["bought",53,1,13,1,2,1,8,1,29,1,8,1,39,1,38,1,21,1],
+      ["boulder",196,1],
+      ["boulevard",84,1,28,1],
+      ["bound",5,1,102,1,71,1,37,1],
+      ["boundary",25,4,93,2,6,1,60,1,21,1],
+      ["boundless",154,1],
+      ["bourgeoi",157,1],
+      ["bournemouth",169,1],
+      ["bout",3,1],
+      ["bovid",10,17],
+      ["bovinae",10,2],
+      ["bow",52,1,83,1,76,1],
+      ["bowel",125,1],
+      ["bowerbird",135,1],
+      ["bowl",46,4],
+      ["box",15,1,38,3,67,1],
+      ["boxe",53,1,17,1,53,1,28,1,44,1],
+      ["boxy",63,1],
+      ["boy",36,1,13,21,15,1,85,2,8,1,18,1,7,1,2,14,4,1,23,3],
+      ["boyd",23,1],
+      ["brac",149,1],
+      ["brace",23,1],
+      ["braced",46,5],
+      ["bracey",118,1],
+      ["brackish",226,1],
+      ["brad",58,2],
+      ["bradford",93,2,101,1],
+      ["bradley",148,1],
+      ["braille",53,1],
+      ["brain",2,8,1,2,4,11,10,13,1,17,2,2,4,1,13,26,10,1,1,1,9,7,1,4,13,8,1,1,6,11,3,35,2,10,9,2,1,7,1,9,4,4,2,13,6,3,3,1,5,7,1,3,5,1,6,6,1,4,4,1,19,4,4,1,4,1,1,4,1,1,3,1,4,1,5,1,2,4,2,10,5,11,4,15,4,11,8,13,3,14,4,11,4,3,4,1,4,2,4,5,2,1],
+      ["braincase",115,1],
+      ["brainpower",115,1],
+      ["brainstem",176,1],
+      ["branch",57,1,34,1,9,1,60,1,56,1],
+      ["branche",1,1,34,1,20,1,60,1,12,1],
+      ["brand",16,1,60,13,6,5,32,6,8,1,12,1,6,2,26,1,4,1],
+      ["branded",193,1],
+      ["brandenburg",201,1],
+      ["branding",72,1,10,1,69,1],
+      ["brass",176,1],
+      ["braving",91,1],
+      ["brazil",23,1,94,1,41,1,17,1,4,1,4,6],
+      ["brazilian",179,2,4,1],
+      ["bread",67,1,3,1,1,1,28,2],
+      ["breadth",1,1,68,1],
+      ["break",21,1,27,1,13,3,1,1,17,1,11,1,11,1,47,1,25,1,17,1,11,3],
+      ["breakaway",56,1],
+      ["breaker",190,2],
+      ["breakfast",91,1],
+      ["breaking",119,1,18,1,53,4,20,1],
+      ["breakthrough",46,1,18,1,73,1,85,1],
+      ["breakwater",129,3],
+      ["breath",3,1,30,1,75,1],
+      ["breathable",164,1,9,1],
+      ["breathe",15,1,149,1],
+      ["breathed",106,1,107,2],
+      ["breathing",3,2,173,1,9,1,12,1,23,2],
+      ["bred",22,1,88,1,39,1,8,1],
+      ["breed",32,1,3,1,86,2,6,1,36,1,31,1],
+      ["breeder",22,2,10,1,33,1,62,1,97,1],
+      ["breeding",14,1,8,4,43,1,31,1,7,1,2,1,5,1,14,1,3,2,8,1,19,1,69,2],
+      ["breeze",89,1,106,2],
+      ["brenda",176,1],
+      ["brendan",63,1],
+      ["brewed",88,1],
+      ["brewing",71,1],
+      ["brian",33,1,16,1],
+      ["bric",149,1],
+      ["brick",31,1,87,1,2,1,3,2,72,5,31,1],
+      ["brickwork",50,1],
+      ["bridge",80,1,4,2,27,1,2,3,16,1,67,1,18,1,9,1],
+      ["brief",0,4,16,1,37,1,8,4,27,1,79,1,45,1],
+      ["briefer",115,1],
+      ["briefly",4,1,115,1,58,1,3,1],
+      ["brigham",94,1],
+      ["bright",29,1,5,1,4,1,30,1,9,1,59,1,75,1],
+      ["brightest",112,1],
+      ["brightness",38,1],
+      ["brill",4,1],
+      ["brilliance",145,1,58,1],
+      ["brilliant",64,1,45,3,3,1,33,1,5,1,53,1,1,1],
+      ["brilliantly",149,1],
+      ["brine",79,9],
+      ["bring",5,1,1,1,3,3,2,3,14,1,7,1,9,1,6,3,7,1,3,1,2,1,3,2,4,1,4,1,10,1,7,2,1,2,7,1,8,1,3,1,18,1,3,1,4,1,8,1,3,6,1,1,1,1,5,1,1,1,7,1,3,1,3,1,4,1,9,1,5,1,1,1,8,2,1,4,10,1,4,2,5,2,2,1,10,1],
+      ["bringing",28,1,2,1,60,1,1,1,32,1,19,4,22,1,44,1,11,1],
+      ["brink",156,1],
+      ["bristol",56,4,25,1],
+      ["britain",19,1,4,2,5,1,36,1,2,7,1,1,21,3,2,1,19,4,3,1,1,3,3,1,18,1,11,1,2,1,22,2,19,1,6,2,9,1,2,4,2,2,4,1],
+      ["britaingraphite",217,1],
+      ["britannica",111,3],
+      ["british",3,1,1,1,10,1,1,1,8,1,18,1,13,1,6,1,6,9,1,1,21,3,5,1,12,1,4,9,2,1,5,2,36,1,4,2,6,1,3,1,4,2,4,1,14,1,1,2,6,5,11,7,3,1,9,3],
+      ["brito",179,2],
+      ["briton",76,1,12,1,106,1],
+      ["brittle",125,1],
+      ["brixton",76,2],
+      ["broached",208,1],
+      ["broad",11,2,25,1,10,1,6,2,3,1,16,1,7,1,3,1,36,1,5,1,54,1,15,1,1,1,6,1,23,4],
+      ["broadacre",69,1],
+      ["broadcast",9,1,157,1,11,1],
+      ["broaden",11,1],
+      ["broader",34,1,20,1,1,1,19,1,46,1,14,1,17,1,54,1,1,1],
+      ["broadly",83,1,18,1,108,1,5,1],
+      ["broca",71,2,7,2],
+      ["brocklesby",111,2],
+      ["brody",225,1],
+      ["broke",5,1,80,1,28,1,31,1],
+      ["broken",18,1,9,1,4,1,4,1,3,1,12,1,73,1,19,1,14,1,60,1],
+      ["bronze",31,1,76,1,87,1],
+      ["brooch",211,1],
+      ["brook",71,1,139,1],
+      ["brooklyn",70,12],
+      ["brophy",142,3],
+      ["brother",4,1,27,1,23,4,51,2,5,4,47,6,54,1,14,7],
+      ["brought",0,2,4,1,17,1,1,1,3,1,9,1,4,1,6,1,2,1,1,1,19,1,9,3,12,1,1,2,2,1,1,2,3,1,7,1,6,1,3,1,14,1,7,1,1,1,10,1,2,3,11,1,8,1,20,1,4,2,3,1,2,1,1,2,1,1,6,1,10,1,5,1],
+      ["brown",0,1,38,1,45,1,6,2,14,1],
+      ["brownish",38,1],
+      ["browsing",10,1],
+      ["bruise",16,1],
+      ["brundtland",122,1],
+      ["brunel",113,12],
+      ["bruno",157,1],
+      ["brush",59,1,103,1,52,1],
+      ["brushe",59,1],
+      ["brushing",59,1,132,3,23,1],
+      ["brussel",56,1,5,1],
+      ["brutal",205,1],
+      ["bryan",61,1],
+      ["bubble",90,1,82,1,10,2],
+      ["bubonic",194,1],
+      ["buck",179,1],
+      ["bucket",71,1],
+      ["bucknell",18,1],
+      ["bud",158,1],
+      ["buddhism",0,1],
+      ["buddhist",0,2,37,1,40,1,11,1],
+      ["budget",41,1,21,1,56,1,33,1,2,1,3,1,6,1],
+      ["buffalo",10,2],
+      ["buffer",33,1],
+      ["bug",56,1,3,1],
+      ["bugatti",47,1],
+      ["bugo",176,2],
+      ["build",1,1,4,1,8,2,15,1,6,1,1,1,9,1,6,1,9,4,7,1,4,1,3,1,39,1,1,2,16,1,3,1,3,1,7,1,14,1,11,1,15,1,7,2,6,1,5,1,1,2,11,1,14,1],
+      ["builder",31,2,19,1,73,4,37,1,35,1],
+      ["building",1,1,4,5,23,2,3,3,3,7,1,2,9,6,1,1,5,3,1,2,4,2,6,1,2,17,6,1,4,1,7,2,2,1,3,1,10,1,5,1,4,2,1,1,13,8,2,10,3,4,6,3,3,2,14,1,1,1,4,12,13,1,1,1,2,1,2,6,1,4,3,4,16,1,6,12,14,1,3,1,2,1,3,1],
+      ["built",10,1,11,4,5,1,2,2,3,2,2,2,2,1,6,1,9,2,13,4,3,3,2,1,10,1,6,2,13,1,1,1,15,3,3,1,2,4,1,2,1,6,9,2,3,3,2,1,1,1,8,1,16,2,10,7,3,1,1,1,20,1,2,2,16,1,3,1],
+      ["buitrera",40,1],
+      ["bulb",43,1],
+      ["bulk",107,1],
+      ["bulky",13,1],
+      ["bull",97,1,75,2,44,7],
+      ["bullet",119,1],
+      ["bullrush",118,1],
+      ["bullying",149,1],
+      ["bumpy",132,1],
+      ["buoyancy",52,3],
+      ["burdened",182,1],
+      ["bureau",166,1],
+      ["bureaucracy",8,4,3,1,136,1],
+      ["bureaucratic",8,8,33,1,106,1,4,1],
+      ["burgess",16,2,29,14],
+      ["burial",31,2,161,1],
+      ["buried",25,1,6,1,9,1,5,2,24,2,18,1,9,1,12,1,102,1],
+      ["burn",27,1,35,2,21,2,51,4],
+      ["burned",70,1,57,1,2,4,28,1,56,1],
+      ["burning",62,1,17,1,50,2,5,5,75,1],
+      ["burnt",136,1,7,1,26,2],
+      ["burrough",49,1,128,1],
+      ["burrow",110,4,113,2],
+      ["burst",9,1,18,1,27,1,85,1,61,1],
+      ["burt",178,1],
+      ["bury",165,1],
+      ["burying",1,1,133,1,31,1],
+      ["bus",182,1,2,1],
+      ["bush",0,1,50,1,86,1,8,1],
+      ["bushfire",127,1,83,1],
+      ["bushland",135,5],
+      ["busied",105,1],
+      ["busier",81,5],
+      ["busiest",44,1,69,1],
+      ["busily",188,1],
+      ["business",16,1,4,6,8,1,5,2,44,1,3,4,2,2,4,4,2,1,8,1,1,2,7,41,3,1,15,13,6,2,6,1,6,1,6,4,4,7,2,1,4,2,6,2,4,2,22,2,21,3,17,1],
+      ["businesse",179,1],
+      ["businessman",31,1,105,1],
+      ["businessmen",113,1],
+      ["businesspeople",104,2],
+      ["bust",128,1],
+      ["bustling",76,1],
+      ["busy",20,6,29,1,87,1,36,2,3,1],
+      ["butchering",210,1],
+      ["butler",34,1],
+      ["butter",99,1],
+      ["butterfly",45,1,7,2,37,1,46,1],
+      ["button",3,1,1,2,1,1,68,1,127,1],
+      ["buttonhole",99,1],
+      ["buy",16,1,17,1,5,1,29,1,3,1,10,2,5,1,20,1,9,3,20,1,12,1,20,1,6,1,43,1],
+      ["buyer",67,1,55,1,40,2,4,2,34,1],
+      ["buying",16,1,14,1,17,1,29,1,6,1,52,1,77,1],
+      ["buzz",63,1],
+      ["byrne",58,1],
+      ["bystander",96,1],
+      ["byzantine",77,2],
+      ["byzantium",77,1],
+      ["cabbage",1,1,106,1],
+      ["cabin",91,1,93,6],
+      ["cabinet",109,1],
+      ["cable",180,1],
+      ["caboclo",179,10],
+      ["cacao",143,4],
+      ["cache",210,1],
+      ["cacophony",63,1],
+      ["cactus",158,1,35,2],
+      ["cadre",198,1],
+      ["caesar",87,1],
+      ["caf",85,1],
+      ["cafe",170,1],
+      ["caffeine",43,1,142,1],
+      ["cage",174,3],
+      ["cairo",46,1,61,1,26,1],
+      ["caius",31,1],
+      ["cal",175,1],
+      ["calcium",129,3,36,1],
+      ["calculate",35,1,20,1,21,2,17,1,75,1],
+      ["calculated",30,1,47,2,76,1,24,1,2,1,16,1,1,1,13,1],
+      ["calculating",201,1],
+      ["calculation",40,1,35,3,84,1,2,1,7,1,41,1],
+      ["caledonian",127,2],
+      ["calendar",188,1,23,1],
+      ["calf",14,3,124,1,64,1,14,1],
+      ["calibrate",121,1],
+      ["calibre",163,1],
+      ["california",22,1,21,1,4,1,11,1,2,3,10,1,5,1,6,1,12,1,2,2,6,1,28,1,13,1,3,1,8,4,23,1,9,1,10,3,1,1,2,1,5,1],
+      ["call",14,7,3,1,1,1,1,1,3,1,12,1,8,1,5,1,10,2,17,1,7,1,1,1,3,1,3,1,6,1,1,1,3,1,4,1,1,3,15,2,8,1,2,2,6,1,20,8,4,1,5,1,2,1,9,1,1,1,5,3,1,3,18,1,10,1,2,1,6,1,2,1,3,1,4,1],
+      ["called",2,1,2,2,1,1,3,4,2,1,6,1,1,3,2,4,4,3,2,5,1,1,4,1,2,2,2,1,2,4,1,1,1,1,1,1,1,2,5,1,1,1,2,1,1,2,2,2,5,3,1,1,9,1,7,1,4,1,2,2,4,1,5,1,1,1,2,1,3,1,2,2,3,1,8,1,1,1,2,2,4,1,1,1,2,1,8,1,1,2,1,1,9,1,3,2,5,1,1,2,4,1,4,2,6,1,1,1,1,1,11,1,1,1,1,1,1,1,4,1,1,1,7,2,3,1,2,2,1,1,1,1,2,1,1,1,3,1,1,2,3,1,3,1,10,2,4,2,2,1],
+      ["calling",64,1,5,1,35,1,11,1,31,1,8,1,3,1,6,2,44,1,8,1],
+      ["calm",64,2,28,1,76,1],
+      ["calmer",66,1],
+      ["calmness",149,1],
+      ["caloric",24,1],
+      ["calorie",24,20,52,2,124,1],
+      ["calory",24,9,52,1,26,1,97,1],
+      ["caltech",142,2],
+      ["calve",14,1,88,1,36,5,16,1,45,1,3,5,14,3],
+      ["calvin",140,1],
+      ["cambou",119,2],
+      ["cambrian",45,1],
+      ["cambridge",7,2,21,1,52,1,3,1,28,2,5,1,109,1],
+      ["came",1,1,35,1,2,2,1,1,6,2,3,1,11,2,2,1,16,1,5,1,1,1,5,1,2,3,6,1,1,3,4,2,1,1,6,2,5,1,2,2,3,1,5,3,2,1,12,1,12,1,2,1,5,1,1,1,2,1,1,1,7,1,10,1,6,1,4,2,1,2,4,2,2,1,1,1,1,1,3,1,11,1,2,1,3,1,2,1,2,1,3,5],
+      ["camel",0,1,75,1,4,1],
+      ["camellia",88,1],
+      ["camera",91,3,23,1,45,3,18,1,37,1],
+      ["cameraman",91,1],
+      ["cameron",139,1],
+      ["camouflage",89,9,127,1],
+      ["camouflaged",89,5,82,1],
+      ["camouflaging",89,1],
+      ["camp",133,1,14,1,37,2],
+      ["campaign",28,11,21,1,33,1,13,1,42,1,29,1],
+      ["campaigner",15,1],
+      ["camphor",19,1],
+      ["camping",26,1,158,1],
+      ["campo",60,1],
+      ["campsite",115,1,69,1],
+      ["campus",58,1],
+      ["camra",60,1],
+      ["can",61,3],
+      ["canada",11,1,44,1,8,1,37,1,20,1,7,1,59,1,15,1,22,2],
+      ["canadian",45,3,16,1,35,1,8,1],
+      ["canal",50,1,34,1,4,1,66,1,23,3],
+      ["canali",177,1],
+      ["cancel",207,1],
+      ["cancer",83,1],
+      ["candid",64,1,111,1],
+      ["candidate",28,1],
+      ["candle",39,3],
+      ["candlelight",113,2],
+      ["cane",33,18,160,32],
+      ["canned",61,1,30,1],
+      ["cannibal",160,1],
+      ["canning",61,6],
+      ["cannon",217,2,1,2],
+      ["cannot",3,2,6,1,2,1,3,1,5,1,6,2,15,1,7,1,2,1,4,1,1,1,4,1,10,1,2,1,6,1,7,1,15,1,16,1,5,2,3,1,5,1,2,1,11,1,23,1,5,1,2,3,7,1,3,1,1,1,2,2,8,1,4,1,2,1,7,1,3,2,1,1,8,1,4,1,2,2,3,1],
+      ["canoe",168,13],
+      ["canopy",143,1,8,3],
+      ["canton",66,1],
+      ["canvassing",152,1],
+      ["canyon",91,6,105,2],
+      ["cap",164,9,20,1],
+      ["capability",7,1,9,1,111,1,15,2,26,1,29,1],
+      ["capable",13,1,44,1,27,1,7,1,12,1,18,1,9,1,3,1,5,1,16,1,29,1,3,1,10,1,1,1,5,1,15,1,4,1],
+      ["capacity",7,1,32,1,39,1,39,1,29,1,3,1,5,1,5,1,7,1,10,1,4,1,2,1,1,2,14,1,9,1,2,2],
+      ["cape",17,1,49,2],
+      ["capim",179,6],
+      ["capital",0,1,34,1,16,1,5,1,22,1,70,2,68,1],
+      ["capitalize",62,1],
+      ["caprinae",10,2],
+      ["capsaicin",158,16],
+      ["capsicum",158,1],
+      ["capsule",72,1,70,1],
+      ["captain",66,2,22,1,3,1,34,1,6,1,61,2],
+      ["captivated",17,1,165,1],
+      ["captive",24,1,120,1,79,3],
+      ["captivity",110,1,9,1,104,1],
+      ["capture",1,2,4,1,21,1,4,1,5,1,24,1,32,1,43,1,8,6,4,1,11,1,2,1,5,1,56,1,6,2],
+      ["captured",49,1,58,1,35,1,30,1],
+      ["capturing",97,1,45,2,31,1],
+      ["capuchin",143,10],
+      ["car",23,9,11,1,13,1,13,1,13,6,14,1,7,2,2,1,35,1,1,5,12,1,8,2,7,1,2,5,36,1,1,1,2,2],
+      ["caral",50,22],
+      ["carat",104,1],
+      ["caravan",0,2,107,1],
+      ["caravel",64,1],
+      ["carbohydrate",5,1,14,1,207,1],
+      ["carbon",5,2,22,1,13,1,12,1,7,1,47,1,6,1,17,11,35,7,31,1,1,1,22,1,8,1],
+      ["carbonate",177,1],
+      ["carcass",223,1],
+      ["carcasse",10,1,80,1,35,1,97,1],
+      ["card",42,2,53,1,9,38,7,1],
+      ["cardano",190,1],
+      ["cardiac",7,1],
+      ["cardiovascular",3,1,213,3],
+      ["care",7,1,4,1,5,1,4,1,1,1,33,1,5,1,13,1,3,1,11,1,24,1,12,3,29,1,23,1,8,1,1,1,8,3,18,1,5,1,2,1,10,1],
+      ["career",6,3,68,1,11,1,20,1,4,1,2,4,25,1,9,2,4,1,1,1,13,1,19,1,1,1,14,1,6,2],
+      ["careful",54,1,32,1,16,1,1,1,13,1,6,1,30,1,9,1,21,1,14,1,3,1],
+      ["carefully",1,1,49,1,3,1,7,1,53,1,1,1,5,1,41,1,1,1,12,1,27,1,14,1,1,1,6,1],
+      ["caregiver",186,1],
+      ["carel",221,1],
+      ["careless",181,1],
+      ["carelessly",72,1],
+      ["caretaking",198,1],
+      ["cargo",66,4,57,1],
+      ["cargoe",113,1],
+      ["caribbean",139,1,54,1],
+      ["caring",20,1],
+      ["carlo",32,1],
+      ["carlton",138,3,64,3],
+      ["carnivore",222,1],
+      ["carnivorous",59,20,51,1,34,4,79,1],
+      ["carol",6,1],
+      ["carolina",20,1,51,1,52,2],
+      ["carother",19,1],
+      ["carpet",141,1,53,1],
+      ["carrara",31,1],
+      ["carried",8,1,50,1,2,1,5,1,5,1,2,1,9,5,19,2,1,1,29,1,7,6,3,1,7,1,1,2,10,1,4,1,11,1,1,1,1,5,1,1,1,1,2,1,14,1,14,2,3,2,4,1,9,1,1,2],
+      ["carry",10,1,2,1,20,1,8,1,13,1,6,1,4,3,3,1,3,1,1,1,8,1,12,1,1,1,10,1,2,1,24,1,17,1,37,1,10,1,16,1,7,1],
+      ["carrying",33,1,26,1,7,1,57,1,19,1,72,1],
+      ["carsten",37,1],
+      ["cart",113,1,19,2],
+      ["cartographer",64,4],
+      ["cartographic",64,4],
+      ["cartography",64,2],
+      ["cartwheel",161,1],
+      ["cartwright",17,1,208,1],
+      ["carve",54,1,119,1],
+      ["carved",27,1,19,2,1,1,20,1,47,1,9,3,95,1],
+      ["carving",1,1,8,1,37,2,1,1,76,2],
+      ["caryocar",179,1],
+      ["case",2,1,3,1,2,1,6,8,2,5,6,1,1,2,2,1,2,1,6,2,2,3,1,1,3,1,3,1,1,3,3,1,8,1,1,2,4,2,4,1,3,1,3,2,3,2,1,1,1,1,5,1,4,6,4,1,3,1,1,1,3,4,1,1,1,1,9,1,2,4,2,1,13,1,9,2,11,3,3,4,1,1,7,2,8,1,6,1,1,1,1,1,3,2,4,2,1,1,7,1,8,1,5,1,7,1,7,1,2,1,1,9,1,3,2,1,8,1,2,1],
+      ["cash",200,1],
+      ["cashier",97,1],
+      ["casing",217,1],
+      ["cast",12,2,7,1,10,1,11,1,14,1,46,1,67,1,10,1,5,1,28,1,1,1,1,1,13,1],
+      ["castilla",23,2],
+      ["casting",12,1,45,1,133,1],
+      ["castle",157,1,50,1,4,1],
+      ["casual",205,1],
+      ["casually",104,1],
+      ["cat",92,3,11,1,3,1,29,1,3,9,29,1,15,1,20,9,10,1,2,1,8,1,1,1],
+      ["cataglyphi",159,2],
+      ["catalhoyuk",147,1],
+      ["catalog",32,1],
+      ["catalogue",95,1,32,1,74,1],
+      ["catalogued",85,1,105,1],
+      ["catalyst",108,1,85,1],
+      ["catastrophic",33,1,163,1,13,1],
+      ["catch",1,3,34,1,24,1,44,1,8,1,16,1,11,2,3,1,1,1,7,1,30,1,7,1,9,1,7,2,20,1],
+      ["catche",114,1],
+      ["catching",1,4,48,1,10,1,44,1,15,1,70,1,13,1],
+      ["catchment",35,1,175,1],
+      ["cate",221,1],
+      ["categorically",109,1,59,1],
+      ["categorisation",6,1],
+      ["categorise",41,1],
+      ["categorised",54,1,18,1,6,1],
+      ["categorization",36,1],
+      ["categorizing",147,5,70,1],
+      ["category",15,1,11,2,12,1,3,1,67,1,18,1,21,2,6,1,21,1,14,1,25,1],
+      ["cater",55,1,21,1,42,1],
+      ["caterpillar",89,3,14,1],
+      ["cathedral",27,1,17,1,2,1],
+      ["catherine",135,1,32,1,45,2],
+      ["catholic",177,1],
+      ["cattle",10,3,69,1,9,1,2,8,12,1,36,9,5,4,56,1,3,9,8,4,13,1],
+      ["catuarus",169,2],
+      ["caught",27,1,39,1,4,1,51,1,9,2,49,2,3,1,25,1],
+      ["cause",2,2,11,1,6,1,1,1,2,1,6,1,5,1,6,1,3,1,1,1,2,1,3,1,1,1,7,1,1,1,1,2,3,3,8,1,4,1,2,3,1,1,3,1,12,1,3,1,5,1,3,5,2,1,2,2,4,1,6,1,5,1,1,2,2,3,2,1,3,1,6,3,6,1,8,1,9,1,7,3,7,1,1,1,1,2,4,1,2,1,1,2,7,1,8,4,3,5,1,4,1,1,3,1,3,11,3,3,10,1,4,1],
+      ["caused",3,1,17,2,13,1,6,1,1,1,5,1,3,2,9,1,1,3,6,1,25,1,2,7,5,1,6,5,1,1,10,1,3,1,4,1,4,1,18,1,12,1,4,1,1,1,6,1,12,1,14,1,3,1,2,7,3,5,1,1,4,1,3,2,3,1],
+      ["causing",3,1,2,1,14,1,29,2,3,1,6,1,2,3,31,1,4,1,43,1,2,1,27,1,54,1,1,2],
+      ["caution",16,1,145,1],
+      ["cautioned",198,1],
+      ["cautious",70,1,58,1,17,1,58,1],
+      ["cautiously",221,1],
+      ["cave",21,18,6,41,11,2,2,2,7,3,30,1,43,1,3,9,61,5,31,1],
+      ["caved",153,1],
+      ["cavity",62,1,41,1,5,1,46,2,19,1],
+      ["cbt",220,3],
+      ["ccd",159,1],
+      ["cd",165,1,61,1],
+      ["cdc",94,1],
+      ["ceased",67,1,10,1,7,1,30,1,71,1],
+      ["cecil",109,1],
+      ["cedar",123,1,61,1,33,1,1,1],
+      ["cedarwood",46,1],
+      ["ceibo",40,1],
+      ["ceiling",27,1,17,1,77,1],
+      ["celeber",9,1],
+      ["celebrate",28,1,2,1,2,1,9,1,16,1,48,1,7,1,43,1,27,1],
+      ["celebrated",38,1,62,1,111,1],
+      ["celebrating",7,1,139,1],
+      ["celebration",41,1,16,1],
+      ["celebrity",9,30,148,1],
+      ["celia",49,1],
+      ["cell",7,29,30,1,8,2,12,4,2,6,2,1,7,2,21,1,5,1,6,1,58,1,23,1,4,1,5,2,36,1],
+      ["cellar",173,1],
+      ["cellist",4,1],
+      ["cello",4,2,42,1],
+      ["cellphone",126,5],
+      ["celluloid",19,4,10,4],
+      ["cellulose",19,1,42,1,112,1],
+      ["celsius",61,1,68,5,35,1,53,1],
+      ["cement",31,2,98,29],
+      ["cemented",9,1],
+      ["cent",5,2,1,4,1,1,20,1,6,1,9,1,16,2,4,1,13,1,2,1,8,2,3,2,2,1,12,1,12,1,10,1,1,1,8,2,42,1,5,1,1,1,3,1,3,1,8,3,4,1],
+      ["centenary",28,1],
+      ["center",17,3,5,1,5,1,11,3,5,1,7,4,9,1,1,1,10,1,9,1,3,1,1,5,11,2,1,1,2,1,11,1,12,3,8,4,14,2,35,2,12,1,9,2,22,3],
+      ["centimetre",67,1,36,1,7,1],
+      ["centipede",45,1],
+      ["central",15,1,6,2,2,7,12,1,8,1,3,1,8,1,16,1,3,1,11,1,1,1,4,1,8,1,2,1,10,1,3,1,6,1,13,1,8,1,4,2,4,1,2,1,9,1,11,1,4,1,8,1,2,1,5,1,35,1],
+      ["centralised",163,1],
+      ["centrality",84,1],
+      ["centrally",120,1],
+      ["centre",28,1,1,1,4,2,4,1,2,1,1,1,4,2,7,1,20,1,7,1,2,1,1,1,6,1,1,1,19,1,5,3,1,2,1,1,2,1,4,1,2,1,2,1,9,1,1,1,3,1,1,1,9,7,25,1,2,1,5,1,1,1,5,1,6,1,5,1,4,1,1,2,1,1,3,1,13,1],
+      ["centred",36,1],
+      ["centredness",184,2],
+      ["centrepiece",34,1],
+      ["century",0,3,1,1,3,1,5,1,2,1,3,1,2,6,1,1,2,2,3,1,1,4,5,2,1,3,2,4,1,1,1,1,1,1,1,1,1,2,2,5,1,6,2,3,4,3,1,10,5,3,5,1,3,1,2,5,3,2,2,2,1,4,2,1,2,1,2,2,4,6,1,1,3,2,3,1,3,3,1,7,1,1,1,3,3,3,2,1,1,4,2,1,2,2,3,2,1,2,3,3,2,3,2,3,1,4,1,2,3,1,1,1,6,2,1,2,1,2,2,1,1,1,1,1,3,2,3,1,2,7,2,1,1,12,1,1,2,2,2,1,6,1,1,1,5,4,6,1,2,1,1,1,1,1,1,1,1,6,1,2,7,1,3,1,2,1,3,1,1,1,2,1,2,2,2,3,1,4,1,16,2,6,4,1,3,1,2,2,2,1,1,2,3,4,1,1,1,3,4,2,1,3,1,9,4,2],
+      ["ceo",37,1,45,1],
+      ["cephalophinae",10,2],
+      ["ceramic",44,1,6,1,12,2],
+      ["cereal",201,1],
+      ["cerebral",83,1,11,1],
+      ["cerebrovascular",83,1],
+      ["ceremonial",147,2,22,1],
+      ["ceremony",0,3,30,2,74,1,101,1,14,1,3,1],
+      ["certain",2,1,4,1,3,1,1,1,7,1,1,1,1,1,2,3,1,1,1,1,3,2,12,1,4,1,5,1,3,2,1,1,2,1,3,2,1,1,3,4,3,2,4,1,4,2,5,1,1,2,1,2,1,3,2,1,5,3,14,4,21,1,5,1,4,1,7,5,5,1,5,1,1,1,2,1,1,2,4,1,1,2,2,1,9,1,1,1,2,1,4,1,3,1,2,2,1,2,5,1,6,1,1,1,6,1,8,1,1,6,5,1,12,1],
+      ["certainly",6,1,6,1,2,1,7,3,16,1,2,1,7,1,11,1,14,1,12,1,5,1,2,1,3,1,27,1,21,1,6,1,15,1,2,1,6,1,12,1,3,1,5,1,6,1,5,1,3,1,1,1,2,1,8,1,4,1],
+      ["certainty",21,1,27,1,3,1,141,1,15,1],
+      ["certificate",49,1],
+      ["certified",213,1],
+      ["cessation",185,1],
+      ["cestius",31,22],
+      ["cetacean",14,3],
+      ["cgi",30,11],
+      ["ch",29,2,59,1],
+      ["chain",8,1,71,1,18,2,6,1,19,1,2,1,8,4,24,1],
+      ["chair",83,1,99,1,9,1],
+      ["chairman",4,1,29,1,101,1,75,1],
+      ["chalk",151,1,64,1],
+      ["chalky",173,1],
+      ["challenge",5,2,3,1,8,1,17,1,1,1,1,1,6,1,12,1,5,1,8,1,16,1,17,1,14,1,4,1,5,1,5,3,15,1,4,1,5,1,8,2,3,1,2,3,6,1,8,1,8,1,5,3,6,1,9,1,10,2],
+      ["challenged",20,1,140,1,6,1,2,2,22,1,2,1],
+      ["challenger",66,2,112,1],
+      ["challenging",13,1,5,1,2,2,14,1,46,1,14,1,33,1,37,1,26,1,1,1,1,1,34,1],
+      ["chamber",27,2,4,2,21,1,40,2,47,2,15,1],
+      ["chambered",216,1],
+      ["chameleon",89,3],
+      ["chamoi",10,1],
+      ["chamomile",72,1],
+      ["champion",93,1],
+      ["championed",160,1],
+      ["chance",9,3,76,1,46,1,7,1,4,1,8,1,1,1,5,1,7,1,12,1,3,1,14,1,4,2,6,1,7,1],
+      ["chancellor",28,3],
+      ["chandler",109,2],
+      ["chanel",140,1],
+      ["change",3,1,3,2,1,1,2,1,2,2,2,3,1,5,2,1,3,1,1,1,5,1,2,3,7,1,1,1,2,3,2,2,1,1,1,1,1,3,2,2,2,1,2,4,4,2,3,1,1,3,3,1,1,1,1,4,2,2,6,6,2,1,3,1,1,1,1,1,4,1,2,1,5,3,2,2,5,1,4,2,1,1,1,2,3,1,1,1,5,1,2,1,4,2,3,1,3,2,1,1,4,1,5,1,2,1,1,1,4,1,2,9,1,2,3,4,3,1,1,1,2,1,3,1,2,1,1,2,5,1,2,3,1,1,2,1,2,1,2,1,2,1,1,1,2,1,1,1,1,1,1,1,1,1,1,4,9,3,3,1,2,2,4,1,2,1,1,2,1,1,2,1,3,44,2,4,1,2,9,1,2,1,1,2,4,1],
+      ["changeable",14,2],
+      ["changed",4,1,3,1,8,1,12,1,1,1,1,1,5,1,12,1,9,1,49,1,3,1,8,1,1,1,10,1,9,1,1,1,4,4,10,2,21,1,8,1,6,1,2,1,18,1,2,1,10,1,2,2,4,1,2,1],
+      ["changing",5,1,3,1,1,1,8,1,3,1,19,1,9,1,9,1,58,2,9,1,11,1,4,1,28,1,6,1,1,1,6,1,27,1,5,1,3,1,1,1,10,1],
+      ["channel",35,1,22,1,9,1,3,4,30,1,49,1,7,1,11,2,14,4,16,1,14,1,11,3],
+      ["channelled",69,1],
+      ["chant",219,1],
+      ["chao",36,1,59,1,66,1],
+      ["chaotic",161,2],
+      ["chapel",28,1],
+      ["chapman",99,1],
+      ["chapter",125,1,24,1,59,1],
+      ["character",12,1,17,1,1,4,47,1,32,2,3,1,32,1,38,1,1,1,7,2,15,1,3,1,1,1],
+      ["characterisation",182,1],
+      ["characterise",15,1],
+      ["characterised",8,2,33,1,44,1,6,6,27,3],
+      ["characteristic",6,2,7,1,19,1,9,1,12,1,3,1,1,2,8,1,16,1,3,1,25,1,16,1,11,1,9,4,2,1,4,1,24,1,19,1,9,2,4,3,6,1,4,1,8,1],
+      ["characteristically",109,1,38,1],
+      ["characterize",209,1],
+      ["characterized",17,1,64,1,13,1,84,1],
+      ["charcoal",210,7],
+      ["charge",55,1,4,5,57,2],
+      ["charged",75,1],
+      ["charismatic",4,1],
+      ["charitable",28,1,173,1],
+      ["charity",62,1,33,1],
+      ["charlatan",171,1],
+      ["charle",0,1,23,3,22,2,14,1,2,1,2,1,8,1,79,4,3,1,14,1,8,1,12,1,21,2,4,2,8,1],
+      ["charlotte",157,1,35,1],
+      ["charming",0,1],
+      ["charred",21,1],
+      ["chart",18,1,26,1,105,1,56,1],
+      ["chartar",46,2],
+      ["charter",153,1],
+      ["charting",3,1],
+      ["chase",37,1,66,1],
+      ["chased",103,2,71,1,37,1],
+      ["chasm",186,1],
+      ["chaste",157,1],
+      ["chat",85,3,41,1],
+      ["chauvet",27,2],
+      ["cheap",1,1,96,1,20,1,1,1,41,1,5,1,9,1,21,1,20,1],
+      ["cheaper",76,1,20,1,1,1,31,1,65,1,8,1],
+      ["cheapest",76,2,102,1],
+      ["cheaply",29,1,113,1,75,1],
+      ["cheat",98,1],
+      ["cheating",58,1,126,1],
+      ["check",7,1,18,1,23,2,22,1,10,1,15,1,3,1,14,1,14,1,55,1,2,1,1,1,13,1],
+      ["checking",56,1,17,1,24,2,29,1,49,1],
+      ["checkout",97,3],
+      ["cheek",10,1],
+      ["cheer",146,1,73,1],
+      ["cheerless",85,1],
+      ["cheese",99,1],
+      ["cheesecake",167,1,45,1],
+      ["chef",32,1,165,2],
+      ["chemical",19,3,8,2,6,2,5,1,21,1,2,5,4,1,6,1,7,1,1,2,11,2,12,5,15,1,12,4,6,1,2,2,2,1,19,2,35,2,6,5,15,5,7,3,3,17],
+      ["chemically",19,1,53,1,47,1,105,1],
+      ["chemist",19,4,123,1,16,1],
+      ["chemistry",38,1,21,1,57,1,72,1,29,1],
+      ["chen",100,13],
+      ["cheney",89,4],
+      ["chenoweth",26,1],
+      ["cheque",122,1],
+      ["cherished",29,1,79,1],
+      ["cherry",22,1,43,1],
+      ["cheryl",123,1],
+      ["chess",2,3],
+      ["chest",0,1],
+      ["chesterton",109,1,62,1],
+      ["chetelat",22,2],
+      ["chew",135,1],
+      ["chewed",23,1,90,1,60,1],
+      ["chewing",61,2,18,1,18,1,100,1],
+      ["chiara",94,1],
+      ["chicago",17,1,53,2,6,1,9,1,13,1,30,5,48,1,9,1],
+      ["chichester",169,2],
+      ["chick",89,1,14,3,24,4],
+      ["chicken",102,8,65,1,32,8,13,1],
+      ["chief",34,1,10,1,8,1,17,1,14,1,19,1,2,1,6,1,3,1,11,1,23,5,46,1,6,1,20,2],
+      ["chiefdom",147,6],
+      ["chiefly",1,1,145,2],
+      ["chieftain",169,1],
+      ["child",2,1,18,2,9,1,7,3,17,7,1,4,20,1,18,1,2,1,17,1,20,3,29,6,1,1,17,1,3,1,2,1,6,1,17,2,5,6,4,2,10,6,1,2],
+      ["childbirth",99,1],
+      ["childcare",198,1],
+      ["childhood",4,1,13,1,25,1,29,1,5,1,2,1,27,1,10,1,3,1,42,1,16,3,22,2,13,6,5,2],
+      ["childish",4,1],
+      ["children",2,3,7,1,11,2,9,2,7,8,1,2,2,1,2,1,8,1,4,2,1,18,20,7,2,4,7,3,9,11,3,4,4,1,5,1,1,8,1,2,5,1,1,1,3,1,16,2,22,2,2,1,2,8,3,14,10,1,6,2,2,2,4,4,1,1,2,1,1,23,1,1,2,2,9,11,8,29,1,1,1,1,3,22,14,11,1,1],
+      ["chile",40,1,77,1,60,1],
+      ["chili",158,21,63,3],
+      ["chill",83,1],
+      ["chilling",61,1],
+      ["chillz",114,1],
+      ["chily",158,25],
+      ["chimney",173,1,22,1],
+      ["chimpanzee",5,1,93,1,8,1,9,2,12,2,40,2,45,2],
+      ["chin",91,1],
+      ["china",0,4,29,6,9,1,28,8,11,5,11,12,2,1,17,6,1,3,9,1,19,1,4,2,18,1,47,1,12,1,6,1],
+      ["chinchihuapi",40,1],
+      ["chinese",0,2,66,1,11,9,2,1,9,1,16,1,3,3,29,6,26,1,42,1],
+      ["ching",88,1],
+      ["chip",209,2,5,1],
+      ["chiropractor",11,1],
+      ["chisato",54,1],
+      ["chisel",61,1],
+      ["chitarra",46,3],
+      ["chitchat",85,1],
+      ["chloride",19,1,60,1],
+      ["chlorine",19,1,60,1],
+      ["chlorophyll",201,3],
+      ["chlorpromazine",72,1],
+      ["chocolate",0,1],
+      ["choice",18,4,14,1,2,1,7,1,12,2,1,1,2,2,7,2,8,1,5,3,11,1,36,1,6,1,6,1,10,2,7,2,4,1,10,1,8,1,5,1,4,1,17,8,5,1,5,1],
+      ["choir",11,1],
+      ["cholera",96,1],
+      ["cholula",143,1],
+      ["chomsky",183,3],
+      ["choose",30,1,26,2,7,1,11,1,2,1,11,1,2,1,6,1,35,1,58,1,12,2,14,1,11,2],
+      ["choosing",56,1,74,1,67,1,8,1],
+      ["chopped",107,1],
+      ["chord",100,5],
+      ["chore",18,1],
+      ["chorus",211,1],
+      ["choruse",188,1],
+      ["chose",12,2,116,2,15,1,52,1,16,1,2,2],
+      ["chosen",11,1,15,2,30,1,1,1,30,1,13,4,22,1,26,1,50,1],
+      ["chough",127,11],
+      ["chri",8,1,107,1,23,1,64,1],
+      ["christchurch",49,1],
+      ["christian",46,1,10,1,101,1],
+      ["christiansen",208,1],
+      ["christie",109,1],
+      ["christma",207,1],
+      ["christopher",22,1,25,1,98,1,13,1,6,1,16,1,23,1],
+      ["chromatic",167,2,45,2],
+      ["chronic",70,1,28,1,93,1],
+      ["chronically",94,1],
+      ["chronicler",99,1,97,2],
+      ["chronology",64,1],
+      ["chu",99,2],
+      ["chunk",79,1,36,1,14,1,5,1],
+      ["church",77,1,134,1],
+      ["churche",46,1,165,1],
+      ["churcher",55,1],
+      ["churchill",190,3],
+      ["churn",73,1],
+      ["churned",29,1],
+      ["cia",175,1],
+      ["cicero",15,1,204,1],
+      ["cid",109,1],
+      ["cigarette",209,1],
+      ["cincinnati",70,1],
+      ["cinderella",157,2],
+      ["cinema",25,1,16,1],
+      ["cinematographic",30,1],
+      ["cinematography",30,1],
+      ["cingulate",17,1],
+      ["cipher",190,1],
+      ["circadian",39,1,4,1],
+      ["circle",1,1,20,2,53,1,45,1,5,1,14,1,12,1,5,1,33,1,14,1],
+      ["circling",177,1],
+      ["circuit",34,1,140,1,15,1,25,1],
+      ["circuitry",83,1,17,1],
+      ["circular",50,1,47,1,64,1],
+      ["circulating",5,1,221,1],
+      ["circulation",151,1,19,1,46,1],
+      ["circumference",64,1],
+      ["circumnavigation",64,1],
+      ["circumscribed",152,1],
+      ["circumstance",8,1,37,1,41,2,23,1,27,1,26,1,12,1,18,1,22,1],
+      ["circus",188,1],
+      ["cirelli",94,1],
+      ["cis",86,1],
+      ["cite",37,1,64,1,95,1,13,1],
+      ["cited",18,1,132,1,2,1,26,1],
+      ["citing",101,1],
+      ["citizen",9,1,6,1,55,5,116,1,27,1,6,2],
+      ["citizenship",122,2],
+      ["citrus",71,1],
+      ["city",15,1,13,1,3,5,3,10,1,11,4,6,4,1,7,6,13,6,7,10,5,2,5,1,2,1,2,2,3,7,9,10,3,1,2,2,11,25,1,1,5,1,1,1,5,1,7,1,2,1,1,1,1,33,12,3,22,1,1,1,2,1,9,1,5,1,3,2,2,6,4,2,1,4,5,1,12,3,6,1],
+      ["cityscape",63,1],
+      ["civic",111,1],
+      ["civil",15,6,14,1,48,1,52,1],
+      ["civilisation",5,1,41,2,1,2,4,1,36,1,62,1],
+      ["civilization",9,4,56,1,25,2,9,1,30,1],
+      ["clad",44,1,107,1],
+      ["claim",8,1,12,9,1,2,1,1,38,2,26,1,4,1,12,1,1,1,14,1,11,1,5,1,11,1,1,1,1,4,9,2,11,1,6,1,6,4,5,1,5,2,2,3,7,1,2,1,4,1,7,2],
+      ["claimant",145,1,58,1],
+      ["claimed",1,1,33,1,2,1,92,1,9,1,7,1,27,1,7,1,6,1,6,1,23,2],
+      ["claiming",16,1,131,1,11,1,55,1],
+      ["clair",16,2],
+      ["claire",225,1],
+      ["clam",108,1],
+      ["clamoured",163,1],
+      ["clap",219,5],
+      ["clapped",219,1],
+      ["clapping",219,5],
+      ["claque",219,4],
+      ["claqueur",219,1],
+      ["clara",17,1,139,1],
+      ["clare",12,1],
+      ["claremont",145,1,58,1],
+      ["clarence",61,1],
+      ["clarified",209,1],
+      ["clarify",26,1],
+      ["clarifying",209,1],
+      ["clarity",15,1,49,1,88,1],
+      ["clark",180,1],
+      ["clashe",216,1],
+      ["class",2,3,2,1,6,1,18,1,13,1,3,1,5,1,39,1,17,1,48,14,10,1,27,1,17,2,12,1],
+      ["classe",36,3,2,1,1,1,10,2,28,2,10,2,1,1,11,3,10,3,3,1,8,1,27,2,6,13,10,1,13,1,31,1],
+      ["classed",71,1,7,1],
+      ["classic",2,1,5,2,75,1,6,1,4,1,17,2,43,1,19,1,6,1,1,1,19,1,12,1,11,1],
+      ["classical",3,1,3,1,2,10,22,2,16,1,65,1,71,1,6,2],
+      ["classification",97,1,116,2,6,1],
+      ["classified",29,1,95,1,17,2,6,2,18,2,22,1,26,1,3,1,7,1],
+      ["classify",45,1,168,1],
+      ["classifying",6,1,120,1,34,1],
+      ["classroom",36,6,86,1,31,2,9,1,1,8,35,5,8,1,11,1],
+      ["clatter",96,1],
+      ["claudian",169,1],
+      ["claudio",185,1],
+      ["claudius",87,1,82,3],
+      ["clause",183,3],
+      ["claw",45,2,3,1,94,1],
+      ["claxton",81,2],
+      ["clay",27,1,2,6,18,2,15,10,5,7,46,1,16,5,40,1,26,7,22,2,1,7],
+      ["claypan",210,1],
+      ["clean",62,7,9,1,68,1,75,1],
+      ["cleaned",31,1,58,1,3,1,126,1],
+      ["cleaner",71,1,18,7,7,2,33,1,30,1],
+      ["cleaning",38,1,51,1,33,1,19,1,43,1,30,2],
+      ["cleanliness",98,1],
+      ["clear",2,1,4,2,2,1,4,1,2,2,5,1,5,1,16,1,8,1,1,2,7,1,2,1,7,1,6,1,3,1,2,2,2,1,3,1,1,1,1,2,4,1,3,1,7,1,5,5,7,1,2,1,2,1,1,1,1,1,3,1,3,1,1,1,2,3,1,1,2,1,7,1,3,1,8,1,1,4,1,1,2,1,1,1,4,1,9,1,7,1,8,1,1,1,6,1,1,1,4,2,3,2,5,1,1,5,4,1,6,2,1,2,1,1,3,1,6,1,1,1,4,1],
+      ["clearance",84,1],
+      ["cleared",25,4,6,1,65,1,14,1,33,1],
+      ["clearer",26,1,159,1],
+      ["clearest",182,1],
+      ["clearing",50,1,73,1],
+      ["clearly",0,1,8,1,6,1,3,1,6,1,3,2,1,1,19,1,1,1,3,1,3,1,6,1,6,1,4,1,13,1,1,1,1,1,20,1,11,1,8,1,7,1,9,1,9,3,3,1,11,2,8,1,15,1,1,1,2,1,10,1,28,1],
+      ["clement",37,2],
+      ["clench",3,1],
+      ["clenched",3,4],
+      ["clerical",86,1],
+      ["clerk",67,1],
+      ["clete",220,1],
+      ["cleveland",83,1],
+      ["clever",103,1,53,2,12,1,51,1],
+      ["click",14,1],
+      ["clicking",70,1],
+      ["client",5,1,15,3,60,3,24,1,52,5,10,1,15,1,44,1],
+      ["cliff",10,1,60,1,20,1,33,2],
+      ["clifford",138,2,64,2],
+      ["climate",8,1,13,1,6,2,9,3,12,3,27,5,4,1,17,1,3,1,2,12,1,1,19,1,11,1,1,1,1,1,7,1,3,4,20,7,9,1,4,2,3,3,19,1,11,2,3,1,13,1],
+      ["climatic",25,1,51,1,25,1,29,1,65,1],
+      ["climatologist",180,1],
+      ["climbed",132,1],
+      ["climber",31,2,133,1],
+      ["climbing",141,1,23,1,51,1],
+      ["clime",121,1],
+      ["cling",150,1],
+      ["clinic",120,1,71,2,29,2],
+      ["clinical",11,2,5,1,147,1,62,1],
+      ["clinician",226,1],
+      ["clip",63,1,29,1,14,4],
+      ["clipped",66,1],
+      ["clipper",66,13,22,3],
+      ["cloak",30,1],
+      ["cloakroom",170,1],
+      ["clock",39,2,12,1,40,1,2,1,1,2],
+      ["clogged",188,1],
+      ["clone",139,1],
+      ["close",3,1,1,1,10,2,16,1,3,2,7,1,19,2,11,1,7,1,6,1,2,1,19,1,2,4,7,1,2,1,6,1,21,2,17,2,10,2,10,1,4,1,5,2,9,1,7,1,6,1,6,1,2,1,2,1,1,1,1,3,3,1],
+      ["closed",3,3,32,1,27,1,17,1,24,1,10,2,42,1,6,1,45,1,8,1],
+      ["closely",2,1,17,1,3,1,7,1,1,1,4,1,20,1,1,1,1,1,12,1,37,1,35,1,7,1,19,1,1,1,40,1,5,1],
+      ["closeness",60,1,24,1,1,3,89,1,51,1],
+      ["closer",13,1,4,1,11,1,13,1,25,1,14,1,9,1,24,1,6,1,13,1,10,2,6,5,7,1,1,1,3,1,22,1,11,1,4,1],
+      ["closest",22,1,84,1,85,1],
+      ["closing",3,1,56,1,162,3],
+      ["closure",53,1],
+      ["cloth",23,1,6,3,38,2,40,1,12,4,21,1,7,1,47,14],
+      ["clothe",29,1,1,1,17,1,11,1,82,11,12,1,5,1,50,1],
+      ["clothesline",29,1],
+      ["clothespin",29,1],
+      ["clothing",19,1,4,1,6,1,2,1,7,1,4,1,9,1,7,1,19,2,21,1,4,1,38,11,1,1,11,1,47,1,15,2],
+      ["cloud",90,3,49,1],
+      ["clove",65,2],
+      ["cloven",10,1],
+      ["clown",182,1],
+      ["club",41,1,122,1,25,1],
+      ["clue",27,1,23,1,19,1,24,1,34,1,28,1,18,1,1,1,16,1,26,1,3,1,3,1],
+      ["clueless",82,1],
+      ["clump",103,1,51,1],
+      ["clumsy",1,1],
+      ["cluster",47,2],
+      ["clustered",136,1],
+      ["cm",10,1,11,1,24,1,148,1,5,1,23,1],
+      ["co",4,1,20,1,9,2,3,1,7,1,6,1,6,1,37,1,13,1,14,2,9,1,10,1,4,2,13,2,17,1,7,1,11,1,11,1,1,1,18,1,1,1,4,1],
+      ["coach",6,1,14,1],
+      ["coache",6,1,14,1,111,1,32,1],
+      ["coaching",20,1,143,2],
+      ["coagulated",23,1],
+      ["coal",79,2,17,2,3,1,14,1,16,1,3,2,62,1],
+      ["coarse",157,1],
+      ["coast",14,1,14,1,22,5,39,3,21,3,13,2,2,1,4,1,1,1,8,1,3,1,3,1,5,1,38,1,15,1],
+      ["coastal",48,1,75,2,6,3,36,1],
+      ["coaster",63,1,69,22],
+      ["coasting",132,2],
+      ["coastline",108,1,41,1],
+      ["coat",108,1,36,3,14,1,58,1,8,1],
+      ["coated",52,1,113,1],
+      ["coating",98,1,10,2,57,1,49,2],
+      ["coatprovide",216,1],
+      ["cobble",21,1],
+      ["cobbler",64,1],
+      ["cobblestone",96,1],
+      ["cobot",13,2],
+      ["cochineal",38,2],
+      ["cochrane",83,2],
+      ["cockroach",159,3],
+      ["cockroache",56,4,79,1,24,2],
+      ["cocktail",162,1,52,1],
+      ["coco",140,1],
+      ["cocoa",33,1,17,1],
+      ["code",64,1,33,25,8,3,6,1,7,1,72,7,29,1],
+      ["coded",63,1,34,1,104,1,18,1],
+      ["codify",64,1],
+      ["coding",71,1,148,1],
+      ["coelacanth",144,1],
+      ["coexist",73,1,106,1,8,1],
+      ["coexisted",210,3],
+      ["coexistence",210,1],
+      ["cofa",205,1],
+      ["coffee",0,1,39,2,22,1,1,4,9,1,11,1,3,2,2,1,1,2,55,1],
+      ["cogidubnus",169,2],
+      ["cognition",18,2,80,1],
+      ["cognitive",2,1,16,2,35,1,10,1,8,1,3,1,4,1,8,1,8,1,12,1,46,3,3,1,5,1,2,1,5,1,9,7,13,1,8,1,1,1,14,1,8,1],
+      ["cognitively",63,1],
+      ["cohen",219,1],
+      ["coherence",160,1],
+      ["coherent",17,1,143,1],
+      ["cohesion",92,1],
+      ["cohort",30,1],
+      ["coiled",123,1],
+      ["coin",34,2,153,1],
+      ["coincide",35,1,122,1],
+      ["coincided",75,2],
+      ["coincidence",87,1],
+      ["coincidentally",65,1],
+      ["coined",111,1,5,1,84,1],
+      ["colchester",116,1],
+      ["cold",17,1,6,1,28,2,40,1,9,1,1,2,20,2,19,1,11,1,12,2,1,3,9,1,4,1,18,5],
+      ["coldest",173,1],
+      ["cole",165,1,44,2],
+      ["coli",62,2],
+      ["colin",63,1,18,5],
+      ["collaborated",5,1],
+      ["collaboration",12,1,1,4,70,1,17,4,45,1,58,1],
+      ["collaborative",12,5,1,1],
+      ["colladon",180,1],
+      ["collapse",41,1,72,1,4,1,39,1,40,7],
+      ["collapsed",96,1,32,1],
+      ["collapsing",90,1,23,1],
+      ["collar",19,1,73,3],
+      ["collated",127,1],
+      ["colleague",7,1,10,1,1,1,2,1,2,1,3,3,2,2,3,3,12,7,3,1,2,1,1,3,8,2,2,2,10,1,2,1,1,2,1,1,21,1,2,1,5,5,4,1,2,2,8,1,12,1,9,1,13,2,4,1,2,1,5,1,6,2,2,1,9,1,3,2,4,1,4,1,5,1,20,1,9,1],
+      ["collect",135,1,12,1,16,1],
+      ["collected",1,2,1,1,1,1,13,1,19,1,44,2,12,1,17,1,2,1,9,3,9,1,1,1,5,1,45,1,5,1,17,1,9,1],
+      ["collectible",29,1],
+      ["collecting",43,1,76,1,17,1,43,1],
+      ["collection",4,1,30,1,6,1,15,3,9,1,6,1,14,1,24,1,32,1,7,1,9,1,1,7,12,1,1,6,9,1,8,1],
+      ["collective",12,1,17,1,27,6],
+      ["collectively",56,1,19,1,65,1,48,1,21,1],
+      ["collector",1,1,28,1,74,1,56,1],
+      ["college",4,5,33,1,12,2,9,2,12,1,15,1,31,1,4,1,2,4,23,1,18,2,9,1,7,1,11,1,13,1,2,1,8,1],
+      ["collide",165,1,6,1],
+      ["colliding",91,1],
+      ["collin",83,1,95,1],
+      ["colling",5,1],
+      ["cologne",95,1],
+      ["colombia",95,1,106,1],
+      ["colonel",4,1],
+      ["colonial",205,2],
+      ["colonisation",13,1,122,2],
+      ["colonise",141,1],
+      ["colonised",141,1,19,1],
+      ["colonising",192,1],
+      ["colonnade",44,1,125,1],
+      ["colonnaded",169,1],
+      ["colonoscopy",83,1],
+      ["colony",45,1,11,2,117,1,32,3,18,4],
+      ["color",22,1,16,17,27,1,139,1,12,1],
+      ["colorado",83,1,7,5],
+      ["colored",22,1,28,1,47,1,98,1,10,1],
+      ["colorfastness",38,1],
+      ["colorful",70,1],
+      ["colour",29,2,18,2,6,2,15,5,4,1,5,1,12,4,2,1,2,1,12,1,3,2,3,2,14,1,11,3,4,1,6,1,9,3,14,1,8,1,4,4,19,1,1,1,17,2,4,1],
+      ["colouration",89,5],
+      ["coloured",44,1,3,1,40,1,6,2,14,1,12,1,17,1,21,1,12,1,25,1,21,1],
+      ["colourful",87,1],
+      ["colourless",183,1],
+      ["colum",53,1],
+      ["columbia",14,1,11,1,35,1,73,1,19,1],
+      ["columbus",22,1,1,1,93,1,42,2],
+      ["column",151,3],
+      ["columnist",172,1],
+      ["colvocoresse",64,1],
+      ["coma",94,1],
+      ["comb",141,1],
+      ["combat",48,1,53,1,36,2,77,1],
+      ["combed",144,1],
+      ["comber",125,1],
+      ["combination",46,1,34,1,4,1,9,1,4,1,3,2,15,1,30,1,9,3,11,1,2,2,14,1,7,1,1,2,14,1,7,1,2,2,2,1],
+      ["combine",20,2,27,1,5,1,21,1,14,1,14,1,28,4,26,1,40,1,29,1],
+      ["combined",52,1,3,1,6,1,47,1,21,1,7,2,62,1,9,1,1,1,2,1,12,1],
+      ["combining",61,1,22,1,37,1,4,1,102,2],
+      ["combustion",96,1,38,1],
+      ["come",2,2,1,1,3,1,1,1,4,4,6,2,1,1,2,3,1,1,1,1,2,1,3,1,1,1,3,2,1,1,1,2,1,1,1,2,3,1,2,2,3,1,3,1,1,2,1,1,1,1,1,1,2,1,1,1,2,1,2,1,3,1,3,1,2,1,4,1,1,1,2,2,2,1,1,2,5,3,1,1,1,2,7,1,1,1,2,1,2,1,5,1,1,1,2,2,4,2,2,2,6,1,3,1,2,2,2,1,1,1,2,1,1,1,2,3,2,4,1,1,1,4,3,1,5,1,1,1,5,1,4,1,1,1,3,2,2,1,1,1,1,2,4,2,2,2,1,1,1,1,1,1,1,1,1,1,2,2,3,1,4,1,2,1,2,1,1,2,1,2,3,3,3,1,1,1,2,2,3,1,2,1,2,2,2,1,2,1,2,1,1,1,1,1,2,1,3,1,3,1,1,1,4,1,1,1,1,2],
+      ["comeback",48,1],
+      ["comedian",15,1],
+      ["comedy",12,1,170,1,18,1],
+      ["comet",25,1,117,2],
+      ["comfort",80,1,55,1,17,1,9,1,8,1],
+      ["comfortable",41,1,41,2,23,1,15,1,6,1,56,2,27,1],
+      ["comfortably",82,1,123,1],
+      ["comforter",157,1],
+      ["comical",188,1],
+      ["comically",127,1],
+      ["coming",24,1,11,2,5,1,15,1,34,1,19,1,11,1,8,1,1,1,4,1,21,1,8,1,1,1,3,1,5,1,11,1,7,1,34,1],
+      ["command",8,1,182,1,2,1],
+      ["commanding",162,1],
+      ["commemorated",187,1],
+      ["commemorating",169,1],
+      ["commence",151,1],
+      ["commenced",64,1,131,1],
+      ["commendable",170,1],
+      ["commended",8,1],
+      ["comment",1,1,10,1,4,1,18,1,49,1,3,1,9,1,26,1,26,1,4,1,32,1],
+      ["commentator",55,1,49,1,62,1,5,1],
+      ["commented",11,1,187,1],
+      ["commenting",53,1,166,1],
+      ["commerce",47,1,4,1,4,1,40,1,67,1],
+      ["commercial",1,2,12,2,2,2,7,2,1,8,9,1,6,1,23,1,1,2,25,1,1,1,24,4,2,1,5,1,6,2,18,1,23,1,9,1,4,1,9,1,13,1,5,1,11,1],
+      ["commercially",9,1,20,1,36,1,133,1,13,1],
+      ["commissaire",219,1],
+      ["commission",156,1],
+      ["commissioned",1,1,48,1,4,1,135,1],
+      ["commit",8,1,12,1,72,1,97,1],
+      ["commitment",20,2,102,1,14,1,26,1,2,1],
+      ["committed",162,2,20,1,1,1],
+      ["committee",17,1,80,3,54,1,37,1],
+      ["committing",20,1],
+      ["commodity",51,1,26,1,117,1],
+      ["commodore",149,1],
+      ["common",0,1,3,1,2,1,4,4,1,1,10,1,9,1,5,1,2,1,2,1,1,2,2,1,2,2,10,1,5,1,3,2,1,1,3,2,2,1,1,1,9,2,2,1,4,1,4,1,5,2,1,1,1,1,1,1,2,1,5,1,1,2,1,2,3,1,1,1,2,2,12,1,2,2,1,1,1,3,5,1,6,4,1,1,5,1,4,1,2,1,11,1,4,1,3,1,4,1,1,1,2,1,3,1,4,1,1,1,1,1,1,3,7,1,2,1,6,1,3,1,5,1,5,1,1,1,6,2,2,1,1,1,2,1,1,1],
+      ["commonest",72,1],
+      ["commonly",5,1,14,1,6,3,7,1,4,1,8,1,14,1,4,1,6,1,38,1,1,1,22,1,64,1,5,1,15,1],
+      ["commonplace",39,1,48,1,40,1],
+      ["communal",98,1,29,2],
+      ["commune",120,2],
+      ["communicate",14,1,40,1,14,1,6,2,9,2,9,2,8,1,3,1,45,3,6,4,8,1,5,1,19,1,18,1,2,1,6,1,9,1],
+      ["communicating",14,1,40,2,2,1,70,1,28,1,29,1,36,1],
+      ["communication",8,1,5,2,2,1,39,2,14,1,6,3,9,2,4,1,5,1,8,1,48,13,6,9,2,1,6,3,5,1,1,1,4,1,11,1,3,1,22,2,4,1,7,1,2,8],
+      ["communicative",11,2,43,1,94,1,6,2],
+      ["community",16,2,10,2,2,2,5,1,2,1,6,1,14,2,7,4,8,1,4,1,1,1,9,1,11,3,23,7,2,1,2,5,1,1,2,1,2,1,12,1,2,1,2,1,7,3,28,2,1,4,7,3,5,8,5,1,13,2,4,1,8,1,3,3],
+      ["commute",43,1,20,1],
+      ["commuter",63,3,22,1,29,2],
+      ["compact",136,1,58,1],
+      ["companion",4,1,3,1,49,1,36,1,63,1],
+      ["company",6,1,9,2,1,2,3,1,1,2,11,2,1,1,12,4,9,2,13,4,7,3,7,10,2,2,6,6,2,3,14,7,1,1,8,3,1,3,5,1,3,24,6,4,4,1,8,2,10,1,6,1,6,17,4,2,5,1,8,3,22,3,8,1,5,1,2,1,1,1,3,4,3,1],
+      ["comparable",22,1,73,1,65,1,15,5,2,1,43,1],
+      ["comparatively",98,1,10,1,35,1],
+      ["compare",24,1,46,1,3,1,57,1,29,1],
+      ["compared",5,3,2,1,11,1,4,1,2,2,8,1,5,3,34,1,2,1,5,1,5,1,5,1,4,2,2,1,3,1,1,1,20,1,1,1,8,1,16,1,5,1,4,1,1,1,6,1,5,1,12,1,21,1,28,1],
+      ["comparing",18,1,53,1,7,1,17,1,53,1,11,1,45,1,22,2],
+      ["comparison",22,1,4,1,45,1,22,1,6,1,29,3,8,1,9,1,1,1,23,1,2,1,32,1,2,1,14,1],
+      ["compartment",22,1],
+      ["compass",64,3,52,3,5,2,38,1],
+      ["compasse",116,1],
+      ["compassion",122,1,93,1],
+      ["compatriot",76,1],
+      ["compelled",146,1],
+      ["compelling",68,1,65,1,22,1,16,1],
+      ["compensate",3,1,4,1,1,1,120,1],
+      ["compensating",221,1],
+      ["compensation",20,4],
+      ["compete",25,1,9,1,21,1,21,1,62,1,3,2,38,1,5,1,9,1,9,1,4,1,16,1,1,1,1,1,1,1],
+      ["competed",28,1,29,1,9,1],
+      ["competence",11,2,25,1,126,1,42,1],
+      ["competent",92,1,17,1,97,1],
+      ["competing",57,1,9,1,48,1,39,1,3,1,69,1],
+      ["competition",19,1,6,1,2,1,15,1,2,2,3,1,1,2,18,4,4,1,18,1,3,1,20,1,6,2,10,1,4,2,7,1,3,1,43,1,4,2,14,1,20,1,2,1],
+      ["competitive",49,1,6,1,11,1,51,3,5,2,40,1,4,1,18,3,4,1],
+      ["competitively",131,1],
+      ["competitor",25,1,39,1,2,1,56,2,34,2,10,1,43,1,13,1,2,1],
+      ["compiled",168,1,33,1],
+      ["compiling",128,3],
+      ["complain",118,1,20,1,28,1,36,1,18,1],
+      ["complained",32,1,50,1,31,1,102,1],
+      ["complaint",72,1],
+      ["complementary",72,1],
+      ["complemented",1,1,22,1],
+      ["complete",0,2,13,1,3,1,15,1,5,1,8,2,20,1,2,2,6,1,6,1,6,1,3,1,10,1,18,1,1,1,5,1,5,1,2,1,17,1,8,1,4,1,25,1,1,1,14,1,6,1,6,1],
+      ["completed",18,1,13,3,13,2,16,1,35,1,18,1,56,1,1,1,5,2,6,1],
+      ["completely",1,1,12,1,3,1,3,1,7,1,42,1,5,1,7,1,1,1,53,1,4,1,6,2,2,1,5,1,8,2,2,1,3,1,11,1,25,2,2,1,15,1,8,1],
+      ["completing",111,1,52,1,18,1],
+      ["completion",3,2,41,1,118,1],
+      ["complex",3,1,2,2,2,2,3,1,1,1,2,2,13,3,2,1,7,1,9,1,1,4,2,3,3,1,4,1,2,1,11,2,7,1,4,1,8,2,3,2,15,1,9,1,1,1,18,1,3,1,1,1,11,1,1,1,4,14,6,2,1,3,2,1,2,1,2,1,8,2,4,1,5,1,1,1,5,1,2,1,7,2,9,2,2,2,8,1,6,1,3,1],
+      ["complexity",13,1,37,1,13,1,18,1,5,1,7,1,5,1,13,1,17,1,24,3,10,1,30,1,30,1],
+      ["compliance",42,1,11,1,27,1],
+      ["complicate",154,1],
+      ["complicated",65,1,15,2,12,1,9,1,36,1,15,1,2,1,50,1,1,1,4,1],
+      ["complicating",95,1],
+      ["complication",108,1,12,1],
+      ["complying",42,1],
+      ["component",1,1,1,1,1,2,24,1,3,1,4,1,7,1,19,1,2,1,11,2,4,1,40,1,59,1,30,1,20,2],
+      ["composed",2,2,42,1,74,1,29,1,61,2],
+      ["composer",2,1,4,1,94,2,46,3,25,1],
+      ["composing",83,1],
+      ["composite",1,1],
+      ["composition",6,1,23,4,47,1,14,1,14,1],
+      ["compositional",177,1,31,1],
+      ["composting",122,1,12,1],
+      ["compound",19,1,42,1,4,15,14,1,45,1,1,1,3,1,1,1,48,1,44,1],
+      ["compounded",11,1,110,1],
+      ["comprehend",80,1],
+      ["comprehended",178,1],
+      ["comprehensive",134,1],
+      ["compressed",149,1,25,1],
+      ["compressing",26,1],
+      ["comprise",10,1],
+      ["comprised",108,1,61,1,25,1,28,1],
+      ["comprising",117,1,22,1],
+      ["compromise",73,1],
+      ["compromised",145,1,40,1,18,1],
+      ["compromising",13,1,109,1],
+      ["compulsion",149,1],
+      ["compulsive",121,1],
+      ["compulsory",178,2],
+      ["computation",198,1],
+      ["computer",6,1,7,2,2,1,15,7,14,1,12,1,19,4,23,1,6,1,22,3,2,1,12,5,5,3,1,1,10,5,3,3,1,1,6,1,2,1,5,1,1,1,7,2,8,2,1,1,1,1,5,1,7,3,3,1,2,1],
+      ["computerised",145,1,81,1],
+      ["computerized",30,5,53,1,120,1],
+      ["computing",121,1,7,1],
+      ["conan",109,2],
+      ["concave",59,1,25,1,9,1],
+      ["conceal",175,1],
+      ["concealed",190,1],
+      ["concede",80,1,48,1,47,1],
+      ["conceded",182,1],
+      ["conceivable",145,1,22,1,36,1,9,1],
+      ["conceivably",142,1],
+      ["conceived",40,2,79,1,89,1],
+      ["concentrate",12,1,25,1,44,1,45,4,10,1,36,1,9,1],
+      ["concentrated",25,1,4,1,7,1,45,1,45,1,38,1,22,1,38,1],
+      ["concentrating",172,1,9,1],
+      ["concentration",21,2,34,1,10,1,14,2,17,1,30,1,32,1,14,2,6,2,3,2,5,1,3,1],
+      ["concentric",108,1],
+      ["concept",0,1,11,1,15,1,6,3,4,1,6,1,25,1,6,3,24,1,23,2,14,1,2,1,11,1,12,1,19,1,1,1,4,3,3,3,4,1,14,1,14,1,7,1],
+      ["conception",146,1],
+      ["conceptual",41,1],
+      ["concern",6,1,9,1,19,2,15,1,4,2,23,1,19,1,4,1,46,1,3,1,35,1,4,1,1,1,15,1,2,1,3,3,16,1,2,3],
+      ["concerned",8,1,7,11,26,3,12,1,39,1,6,1,8,1,12,3,9,1,1,1,5,1,1,2,24,1,1,2,16,1,7,1,14,1,11,1],
+      ["concerning",0,1,23,1,17,1,47,1,11,1,13,1,44,1,23,1],
+      ["concert",2,1,9,1,33,1,175,1],
+      ["concerted",49,1],
+      ["concerto",146,1],
+      ["concession",156,1],
+      ["conch",123,1],
+      ["concisely",114,1],
+      ["conclude",17,1,5,2,49,1,87,1,27,1,25,1],
+      ["concluded",16,1,2,4,18,1,14,1,6,4,7,1,15,1,5,1,13,1,18,1,34,1,20,1,4,1,5,1,13,3,8,1,2,1],
+      ["conclusion",24,1,12,1,4,1,20,1,12,1,13,1,29,1,34,1,4,1,1,1,24,1,5,1,7,1,1,1,20,1],
+      ["conclusive",2,1,121,1,87,1,10,1],
+      ["conclusively",125,1,97,1],
+      ["concrete",20,1,24,4,23,1,15,1,2,3,12,1,33,39,6,3,22,1,35,1,3,1],
+      ["concreted",35,1],
+      ["concreting",35,1],
+      ["concurrently",197,1],
+      ["condamine",23,3],
+      ["condemn",215,1],
+      ["condensation",79,2],
+      ["condescending",205,1],
+      ["condescension",41,1],
+      ["condition",5,2,3,1,1,1,1,1,1,2,2,1,3,1,3,1,2,4,13,2,5,2,4,1,2,1,3,2,3,2,1,1,6,5,1,1,2,1,5,1,7,1,7,1,14,1,8,1,3,1,2,1,6,2,4,1,3,1,2,2,9,1,2,1,4,1,1,1,2,1,24,1,4,1,5,1,1,7,3,1,4,1,3,1,3,1,5,1,3,1,4,1,3,1,2,2,17,3,5,1],
+      ["conditioned",5,1],
+      ["conditioner",173,1],
+      ["conditioning",5,2,31,1,159,7],
+      ["condolence",155,1],
+      ["condorcet",56,2],
+      ["conducive",121,1],
+      ["conduct",91,1,51,1],
+      ["conductance",63,2],
+      ["conducted",1,1,13,1,23,1,2,1,3,1,1,1,20,2,19,2,34,1,46,2,6,3,6,1,6,1,4,1,2,1,1,1,13,1],
+      ["conducting",31,1,113,1,52,1],
+      ["conductivity",69,1],
+      ["cone",54,1],
+      ["coney",132,1],
+      ["confer",140,1,69,1],
+      ["conference",96,1,8,1,55,3],
+      ["confess",94,1,115,1],
+      ["confidence",172,1,17,1],
+      ["confident",22,1,20,2,108,1],
+      ["confidential",156,1],
+      ["confidently",13,1,12,1],
+      ["configuration",200,1],
+      ["configured",132,1],
+      ["confine",87,1],
+      ["confined",20,1,48,1,9,1,33,1,25,1,87,1],
+      ["confining",142,1],
+      ["confirm",22,1,2,1,16,1,27,1,1,1,8,1,92,2,15,1,40,1],
+      ["confirmed",0,1,40,1,28,1,53,1,30,1,3,1,8,1,14,1,1,1,23,1],
+      ["confirming",37,1,19,1,69,1],
+      ["conflict",15,1,9,1,40,1,17,1,43,1,9,1,10,1,9,1,4,1,28,5,10,2,31,1],
+      ["conflicting",24,1,12,2,122,1,12,1,36,1],
+      ["conform",42,5],
+      ["conformed",42,2],
+      ["conformity",42,13],
+      ["confounded",201,1],
+      ["confounding",206,1],
+      ["confront",209,1],
+      ["confronted",89,1,63,1],
+      ["confronting",34,1,14,1,109,1,5,1],
+      ["confuse",63,1],
+      ["confused",93,3],
+      ["confusing",63,3,7,1],
+      ["confusion",53,1,10,1,24,1,6,1,32,2,76,1],
+      ["congenital",204,1],
+      ["congested",131,1],
+      ["congestion",96,1],
+      ["congregated",211,1],
+      ["congressman",213,1],
+      ["coniferous",117,1],
+      ["conjugate",183,1],
+      ["connect",16,1,90,1,14,1,26,1,75,2],
+      ["connected",1,1,56,1,14,2,7,2,7,1,47,1,35,1,13,1,5,1,27,1],
+      ["connecting",37,2,48,3,21,1,17,1,96,1],
+      ["connection",3,1,34,1,17,1,6,2,7,1,18,1,8,1,7,1,4,2,16,1,2,1,15,4,14,1,16,2,15,1,18,1,5,1,1,1,6,2,8,1,2,9],
+      ["connectionaround",222,5],
+      ["connective",61,1],
+      ["connell",154,13],
+      ["connotation",8,1,78,1],
+      ["conquer",152,1,25,1],
+      ["conqueror",194,1],
+      ["conquest",31,1,56,3,50,4,32,3],
+      ["conquistador",99,1],
+      ["conrad",171,1],
+      ["conscious",18,1,8,1,13,1,18,1,21,1,74,4,10,1,38,2,25,1],
+      ["consciously",152,1],
+      ["consciousness",13,1,5,1,21,1,18,1,124,2,4,1],
+      ["consecutive",20,1,19,1],
+      ["consedine",37,3],
+      ["consensus",56,2,88,1,49,1],
+      ["consequence",6,1,27,1,43,1,6,1,6,1,1,1,4,1,27,1,2,2,5,1,10,1,13,1,15,1,3,1,3,1,12,1,3,2,7,1,4,1,1,2,2,3,1,1,21,2],
+      ["consequently",39,2,13,1,2,1,22,1,66,1,44,1,5,1,16,1,7,1],
+      ["conservation",16,1,68,1,11,1,8,1,7,2,33,2,44,5],
+      ["conservationist",110,1,34,1,7,2],
+      ["conservatism",171,1],
+      ["conservative",34,1,84,1,87,1],
+      ["conserve",84,1,21,1,90,1,5,4],
+      ["conserved",200,1],
+      ["conserver",185,1],
+      ["conserving",84,1,37,1,58,1],
+      ["consider",22,1,17,2,3,1,12,1,17,1,7,1,5,1,3,4,2,1,18,1,1,1,7,1,7,1,1,2,5,1,7,1,9,1,5,1,9,1,1,1,4,2,10,1,2,1,4,2,22,3,5,1,1,1],
+      ["considerable",10,1,5,1,8,1,5,2,14,1,23,1,10,1,11,1,10,1,6,6,19,1,2,1,26,1,6,1,1,1,6,1,30,1,7,6,15,1,6,4],
+      ["considerably",39,1,15,1,87,1,12,1,35,1,22,1],
+      ["consideration",35,1,18,1,29,1,4,1,34,1,32,2,18,1,12,2,27,1,6,1,10,1],
+      ["considered",6,2,9,1,2,1,7,2,14,1,1,2,3,1,55,1,2,1,4,1,3,1,1,1,1,1,10,1,7,1,2,1,14,1,11,2,2,1,2,1,4,1,7,1,1,2,2,1,2,1,6,1,6,3,20,2,2,1,6,1,2,2,7,1,1,1],
+      ["considering",33,1,96,4,23,1,18,1,5,5,47,1],
+      ["consignment",88,1,25,1],
+      ["consist",44,1,21,1,8,1,6,1,35,1,18,1,15,1,19,1,41,1],
+      ["consisted",0,1,28,1,39,1,14,4,18,1,6,1,8,1,19,1,32,1,5,1,15,1,24,1],
+      ["consistency",54,2,7,1,3,1,10,1,13,1],
+      ["consistent",2,1,6,1,56,1,8,1,105,1,13,2,20,1],
+      ["consistently",47,1,7,1,28,2,32,1,27,1],
+      ["consisting",10,1,41,1,28,1,48,1,14,1],
+      ["consolation",57,1],
+      ["console",42,1],
+      ["consolidate",2,1,147,1],
+      ["consolidated",4,1],
+      ["consolidation",2,1,93,1,90,1,35,1],
+      ["consonant",176,2],
+      ["consortium",97,1,59,1],
+      ["conspicuous",89,2],
+      ["constant",22,4,30,1,11,1,1,3,31,1,18,2,7,1,1,1,13,1,39,2],
+      ["constantinople",77,2],
+      ["constantly",10,1,10,1,5,1,29,1,38,1,2,1,11,1,4,2,3,1,14,1,6,1,17,1,10,1,1,1,21,2,8,1],
+      ["constituency",122,1],
+      ["constitute",14,1,112,1,22,1,25,1],
+      ["constituted",36,1],
+      ["constrained",155,1,53,1],
+      ["constraint",5,1,87,1,30,1],
+      ["construct",123,1],
+      ["constructed",21,2,8,1,1,1,1,1,15,1,18,2,58,1,11,1,27,1,7,1,2,4,4,1,10,1,7,1,22,1],
+      ["constructing",117,1,12,1,54,1,27,1],
+      ["construction",1,2,12,1,18,3,13,3,1,1,1,1,17,1,16,1,7,1,25,1,1,1,1,1,4,2,3,1,9,3,40,1,1,1,25,2,31,1],
+      ["consult",159,1,23,1],
+      ["consultancy",20,1,94,1],
+      ["consultant",15,1,38,1,98,1,5,1],
+      ["consultation",72,1],
+      ["consulted",144,1,48,1],
+      ["consulting",70,1,86,3,6,1],
+      ["consume",15,1,44,1,2,2,15,1,63,1,3,1,74,1],
+      ["consumed",16,4,53,1,7,1,23,1,3,6,15,1,25,4,57,6],
+      ["consumer",16,2,16,1,15,3,6,2,13,1,4,1,6,1,6,7,20,5,12,7,3,1,5,3,9,1,3,5,6,3,59,5,27,2],
+      ["consumerism",42,1,5,2,87,4],
+      ["consumerist",134,1],
+      ["consuming",103,1],
+      ["consumption",0,2,76,2,3,1,20,1,3,1,10,1,5,1,5,1,57,1,20,1,7,1],
+      ["cont",217,1],
+      ["contact",4,1,10,2,33,1,12,1,13,2,11,1,5,1,16,5,1,1,7,1,8,1,5,1,22,1,21,1,6,3,10,2,7,1,18,1,5,1,7,2,1,1],
+      ["contacted",192,1],
+      ["contagion",3,2],
+      ["contagious",85,1,21,10],
+      ["contagiously",106,1],
+      ["contain",6,1,4,1,4,2,7,1,5,1,19,2,1,1,1,1,3,1,2,1,12,1,3,1,1,1,7,1,45,3,8,1,1,4,5,1,5,1,15,1,4,3,18,1,3,1,4,1,6,1,1,1,3,1,3,1,4,1,24,2,2,1],
+      ["contained",25,1,6,1,8,1,30,1,8,1,13,1,2,1,24,1,2,1,5,1,28,2,6,1,12,3,1,1,3,1],
+      ["container",19,2,23,2,8,1,3,1,8,2,1,1,5,5,15,1,6,1,52,1],
+      ["containing",19,1,19,2,12,1,11,1,8,1,10,1,43,1,68,1],
+      ["contaminated",113,1],
+      ["contamination",226,1],
+      ["contemporary",34,1,7,1,23,1,22,1,19,1,8,1,7,1,17,1,8,2,6,1,19,1,1,1,16,1,1,1,15,2,2,1,2,1,4,1,2,1],
+      ["contempt",175,1],
+      ["contend",40,1,11,1,99,1,60,1],
+      ["contender",111,1,34,1,58,1],
+      ["content",24,1,7,1,6,1,12,1,2,1,1,1,9,2,8,1,16,1,1,4,4,1,4,1,19,1,6,1,3,1,7,2,11,1,17,2,24,1,8,3,1,1,11,2],
+      ["contentedly",52,1],
+      ["contention",128,1],
+      ["contentious",185,1,3,1,18,1],
+      ["contentment",37,1],
+      ["contest",188,1,25,1],
+      ["context",6,1,28,1,19,1,5,1,2,1,16,1,10,1,10,1,26,1,26,2,14,3,24,1,19,1,1,2],
+      ["continent",27,1,13,3,6,1,29,2,16,1,8,1,17,1,19,1,1,1,2,1,63,1,1,1,21,2],
+      ["continental",25,6,15,1,48,2,106,1],
+      ["continual",145,1,58,1],
+      ["continually",40,1,15,1,77,1,34,2],
+      ["continuation",84,1,140,1],
+      ["continue",1,1,8,2,2,1,1,1,1,1,3,1,16,1,8,1,5,1,10,2,4,1,17,1,15,7,11,1,1,1,1,1,13,1,4,1,7,1,6,1,1,1,13,1,2,2,2,1,5,1,11,1,9,1,1,1,2,1,1,1,5,1,1,1,3,2,1,1,8,1,6,1,8,1,4,1,3,1],
+      ["continued",0,1,1,1,8,1,7,1,8,1,6,1,15,1,21,2,3,1,8,4,19,1,11,1,3,1,22,2,4,2,12,1,42,1,4,1,16,1,8,2],
+      ["continuing",24,1,52,1,52,1,16,1,18,1,7,1],
+      ["continuity",222,1],
+      ["continuous",73,1,70,1,8,1,22,1],
+      ["continuously",22,1,59,1],
+      ["continuum",167,1,37,2,2,1,6,1],
+      ["contract",52,1,110,1],
+      ["contracted",137,2,86,1],
+      ["contractor",140,1,55,1,19,1],
+      ["contradict",42,1,72,1,38,1],
+      ["contradictory",36,1],
+      ["contrary",44,1,19,1,33,1,44,1,1,1,5,1,9,1,5,1,4,1,4,1,11,1,42,1],
+      ["contrast",6,1,2,1,7,1,11,1,8,1,18,1,1,1,9,1,1,1,10,2,14,1,31,1,9,1,9,1,9,1,3,1,5,1,10,1,3,1,1,1,7,1,21,1,3,1,5,1,5,1,4,1,5,1],
+      ["contrasting",63,3,62,1],
+      ["contribute",12,1,62,1,16,1,4,1,8,1,20,2,2,1,52,1,4,1,1,1,18,1,15,1,6,1],
+      ["contributed",1,1,33,1,10,1,4,1,36,1,27,3,27,1,64,1,6,1],
+      ["contributing",4,1,118,1],
+      ["contribution",2,1,29,1,24,1,36,1,4,1,10,1,11,1,1,1,29,1,22,1,27,1,13,1],
+      ["contributor",8,1,88,1],
+      ["control",8,1,5,2,4,2,1,2,2,3,1,1,3,15,11,2,17,1,4,1,8,1,8,3,1,3,17,1,4,1,4,1,10,1,10,1,16,1,4,4,1,3,1,1,2,1,17,2,14,1,1,3,2,2,17,12,5,1,2,7,2,4,15,1,3,1,1,1,3,1],
+      ["controlled",3,1,2,1,8,1,39,1,36,1,29,1,23,1,21,1],
+      ["controller",166,1,15,1],
+      ["controlling",2,1,6,1,70,1,94,1],
+      ["controversial",16,1,59,1,43,1,42,1,17,1,6,2,7,1,21,1,2,1],
+      ["controversially",91,1,122,1],
+      ["controversy",0,1,49,1,96,4,33,5,25,3,7,4],
+      ["conundrum",121,1,28,1,21,1],
+      ["convenience",5,1,65,1,26,1],
+      ["convenient",13,1,113,1],
+      ["conventional",5,2,11,1,43,1,13,1,42,1,14,1,5,1,19,1,40,1,13,1],
+      ["converged",84,1],
+      ["convergence",55,1,111,1],
+      ["conversation",54,1,31,14,12,2,7,1,51,2,20,1,1,2,5,1,1,2,40,1],
+      ["conversational",186,1],
+      ["converse",14,1],
+      ["conversely",56,1,169,1],
+      ["convert",5,2,114,1,107,1],
+      ["converted",102,1,20,1,10,1,67,1],
+      ["convertible",47,1],
+      ["converting",64,2,20,1,48,1],
+      ["convex",59,1,34,2],
+      ["convey",85,1,1,2,62,1,14,1,60,1],
+      ["conveyed",58,1,28,5],
+      ["conveyor",132,1],
+      ["conviction",26,1,149,1],
+      ["convince",3,1,51,2,18,1],
+      ["convinced",47,1,3,1,8,1,17,1,22,1,15,1,24,1,2,2,6,1,33,1,13,1,12,2,18,1,5,1],
+      ["convincing",30,1,10,1,2,1,30,1,17,2,53,1,2,1,24,1,8,1,45,1],
+      ["convincingly",89,1,48,1],
+      ["conway",45,1],
+      ["coo",174,1],
+      ["cook",1,1,26,1,34,1,30,1,8,1,1,5,10,3,15,1,13,1,54,1,5,1,5,1],
+      ["cooked",61,5],
+      ["cookery",32,1],
+      ["cooking",21,1,30,1,10,4,63,1,60,1],
+      ["cool",5,3,12,1,74,1,15,3,6,1,9,1,52,1,22,1],
+      ["cooled",144,1],
+      ["cooler",21,1,80,1,9,1],
+      ["cooling",5,8,38,1,98,1,54,1],
+      ["coolness",195,1],
+      ["cooper",28,2],
+      ["cooperate",13,1],
+      ["cooperation",97,1,66,1,26,1],
+      ["cooperative",127,1],
+      ["coordinate",221,1],
+      ["coordinated",83,1],
+      ["coordinating",52,1,31,1,114,1],
+      ["coordination",8,1,73,1,81,1,14,1,13,1],
+      ["cop",109,1],
+      ["copaiba",179,1],
+      ["cope",5,1,44,1,21,1,20,1,6,1,24,1,11,3,4,1,26,1,34,2,14,1],
+      ["copernican",116,1],
+      ["copied",61,1,6,1],
+      ["coping",174,1,23,1],
+      ["copper",193,2],
+      ["coppi",137,1],
+      ["copy",37,1,30,1,38,2,22,1,22,1,8,1,22,1,9,1,19,1,7,1],
+      ["copying",57,1,5,1],
+      ["copyright",201,1],
+      ["coral",52,1,16,2],
+      ["corbusier",120,1],
+      ["cord",46,1,45,1,83,1],
+      ["cordless",126,1],
+      ["core",10,1,60,1,9,1,3,1,26,1,8,1,36,1,8,1,23,1,26,1,1,1,7,1,1,2],
+      ["corioli",161,1],
+      ["cork",85,1],
+      ["corn",32,8,126,1,63,1],
+      ["corneal",93,1],
+      ["cornell",22,1,136,1,22,1],
+      ["corner",84,1,47,1,24,1,14,2],
+      ["cornish",95,1],
+      ["corporate",122,7,28,3,20,2],
+      ["corporation",104,1,18,4,11,1,28,1,48,1],
+      ["correct",13,1,24,2,10,1,7,1,2,2,17,1,20,1,18,1,19,1,30,1,15,1,34,1,13,1],
+      ["corrected",54,1],
+      ["correcting",54,1,92,4],
+      ["correction",49,1],
+      ["correctly",2,1,128,2,38,1,12,1,7,1,2,1],
+      ["correlate",2,1,4,1],
+      ["correlation",36,1,27,1],
+      ["correspond",41,1,40,4],
+      ["corresponded",167,1,45,1],
+      ["correspondence",60,1,44,1,45,1],
+      ["corresponding",37,1,23,1,51,1,38,1],
+      ["correspondingly",75,1],
+      ["corridor",31,1],
+      ["corroborated",196,1],
+      ["corrupted",0,1],
+      ["cortex",17,2,20,1,20,6,26,1,11,3,32,4,55,1,16,4,7,3],
+      ["cortical",81,1],
+      ["cortice",197,1],
+      ["cosmic",64,1,113,2],
+      ["cosmide",150,2],
+      ["cosmography",64,3],
+      ["cosmonaut",13,2],
+      ["cosmopolitan",118,1],
+      ["cost",13,2,7,3,9,1,3,1,1,4,8,1,3,4,11,6,4,1,7,1,7,6,3,4,6,1,8,1,6,1,1,2,5,3,10,1,1,1,4,1,1,2,4,2,6,1,5,2,1,2,6,1,26,2,12,2,17,1,4,3,2,1,8,1,5,1,5,2,1,1,4,1],
+      ["costa",143,1],
+      ["costing",220,1],
+      ["costlier",112,1],
+      ["costly",13,2,20,1,6,1,26,1,43,2,17,1,76,1],
+      ["costume",12,1,77,1,51,1],
+      ["cottage",0,1,87,1],
+      ["cotton",19,1,10,2,9,3,12,2,57,1,11,1,22,1,18,1,36,1],
+      ["coue",223,1],
+      ["cough",3,1,50,1],
+      ["couldn",37,1,21,1,4,2,10,1,58,1,21,1,10,1,21,1,8,2,10,1],
+      ["council",34,2,88,1,29,2,63,1],
+      ["counsel",213,1],
+      ["count",6,1,18,1,17,1,111,2,9,1,22,3],
+      ["counted",106,1],
+      ["counter",53,1,78,1,7,1,14,1,8,1,42,1],
+      ["counteract",94,1,80,1],
+      ["counterpart",41,1,6,1,57,1,5,1,20,1,2,1,22,1,38,1,34,1],
+      ["counterproductive",222,1],
+      ["countess",4,1],
+      ["counting",50,1,133,2,2,1,15,1],
+      ["countless",79,1,26,1,3,1,29,1,38,1,7,1,8,1],
+      ["country",0,3,15,1,1,6,3,1,9,1,4,1,1,1,2,1,3,1,2,1,3,1,6,1,6,1,7,2,4,1,3,1,7,4,1,2,9,1,1,2,1,3,4,1,4,1,5,12,1,6,1,1,1,1,5,2,3,2,5,7,7,3,5,2,1,1,2,1,1,1,1,2,2,1,1,8,1,1,2,4,1,3,15,1,3,1,3,1,1,3,3,1,6,1,14,2,1,3,5,4,1,1,1,5,1,5,1,1,3,6,2,4,1,1,15,1],
+      ["countryside",31,1,7,1,58,2,9,1],
+      ["county",70,1,148,2],
+      ["couple",12,2,1,1,71,1,21,1,10,1,21,1,3,1,42,1,24,1,13,1],
+      ["coupled",219,1],
+      ["course",2,1,1,1,4,1,4,3,1,1,3,1,1,1,5,1,4,1,3,2,11,1,21,1,4,2,8,1,10,1,3,1,1,2,3,1,4,1,6,2,3,1,9,1,1,1,9,1,11,1,2,1,8,1,6,1,8,1,6,2,1,3,1,1,1,2,3,1,7,1,7,1,2,1,8,1,1,1,1,1,1,1,4,1,8,1,7,1,11,1],
+      ["court",0,3,15,1,8,1,16,1,38,1,11,1,22,1,6,1,35,1,62,8],
+      ["courtesy",119,1,20,1],
+      ["courtyard",169,1,26,1],
+      ["cousin",4,2,48,1],
+      ["cover",11,1,14,1,4,1,15,1,6,1,20,1,6,1,14,1,34,3,39,1,1,1,16,1],
+      ["coverage",64,1],
+      ["covered",10,1,15,4,2,1,4,1,13,1,2,1,4,1,34,1,2,1,5,1,12,1,10,1,7,1,12,1,5,1,1,1,5,1,6,1,16,4,14,1,23,1],
+      ["covering",21,2,14,1,9,2,31,1,19,1,30,1,41,1,8,1],
+      ["cow",62,9,28,1,12,6,90,1,7,6,11,1],
+      ["crab",45,1],
+      ["crack",22,1,40,1,65,1],
+      ["cracked",105,1],
+      ["cracking",22,1,89,1],
+      ["cradle",134,5],
+      ["craft",5,1,42,1,26,6,74,4,12,2,4,1],
+      ["crafting",1,1],
+      ["craftsmanship",123,1,48,1],
+      ["craftsmen",44,1,6,2,167,1],
+      ["craig",39,1],
+      ["crammed",104,1,45,1],
+      ["cramming",114,1],
+      ["cramped",113,1,44,1],
+      ["cranfield",134,4],
+      ["cranial",154,1],
+      ["cranium",192,1],
+      ["crash",132,1],
+      ["crashe",94,1],
+      ["crashed",196,1],
+      ["crassus",77,1],
+      ["crate",141,1],
+      ["crater",25,9],
+      ["cratered",177,1],
+      ["craving",100,1],
+      ["crawling",151,1],
+      ["craze",0,1,42,2],
+      ["crazy",45,1],
+      ["cream",44,1,10,2,54,1,48,1],
+      ["create",2,1,4,1,1,1,1,1,3,1,1,2,3,1,7,1,2,1,2,1,3,1,1,1,3,1,2,1,3,1,6,1,1,1,1,1,7,1,1,3,1,1,6,2,10,1,15,4,5,1,1,1,3,1,3,1,2,1,2,1,18,1,2,4,2,1,7,1,4,3,1,1,1,1,3,1,5,1,5,2,9,1,2,1,3,4,3,1,3,1,1,1,1,3,1,1,2,1,1,1,14,1,9,1,1,1,3,1,3,1,2,1,4,1,13,1,1,2],
+      ["created",0,1,5,1,1,1,6,1,5,1,2,1,3,1,1,8,3,1,3,1,1,1,5,1,1,1,6,1,3,1,6,1,1,2,1,2,1,1,1,1,22,1,3,1,3,1,4,1,1,1,2,2,5,1,1,2,9,1,2,1,1,2,1,2,1,1,8,3,4,1,12,1,2,1,12,1,19,2,16,1,7,2,6,1,14,1,2,2,9,2],
+      ["creating",12,1,17,3,1,1,5,1,12,1,1,1,4,1,3,3,4,1,1,1,10,1,12,1,6,1,16,1,18,1,6,1,23,2,9,1,1,1,4,1,7,1,15,1,9,1,10,1,8,1,12,1],
+      ["creation",0,1,9,1,10,1,4,7,6,2,55,1,15,1,9,1,20,1,8,1,10,2,32,1,5,1,4,1],
+      ["creative",0,1,38,1,43,32,11,3,2,1,18,1,8,1,33,1,4,1],
+      ["creatively",54,1,27,1],
+      ["creativity",54,1,27,18,11,1,58,1,22,2],
+      ["creator",70,1,80,1,32,1],
+      ["creature",5,1,9,2,11,1,2,1,18,7,3,2,4,2,7,2,16,1,14,9,2,14,19,1,3,1,8,1,3,1,1,2,16,1,36,1,3,2,5,1,28,1,9,1,1,2],
+      ["credibility",148,1],
+      ["credible",145,1,30,1,28,1],
+      ["credit",6,1,41,1,25,1,2,1,37,1,11,1,31,1,17,1],
+      ["credited",158,1,61,1],
+      ["cree",33,1],
+      ["creed",55,1],
+      ["creek",33,3,7,1],
+      ["creep",165,2],
+      ["crescent",52,1,113,1],
+      ["crest",110,1,55,1],
+      ["crested",123,1],
+      ["cretaceous",25,2],
+      ["crete",38,1,13,1],
+      ["crevasse",149,1],
+      ["crew",50,1,16,4,25,1,41,1,12,1,48,1],
+      ["cricket",118,1,93,1],
+      ["cried",145,1,53,1,5,1],
+      ["crier",219,1],
+      ["crime",88,1,21,2,9,2,57,1,13,3,26,1],
+      ["criminal",2,1,86,1,21,2,66,1],
+      ["crise",60,1,92,1],
+      ["crisis",128,1,5,2,19,1,57,1,16,1],
+      ["crisp",128,1],
+      ["criteria",36,1,64,1,52,1,26,1],
+      ["criterion",160,1],
+      ["critic",8,1,52,1,15,4,43,3,30,1,19,1,4,3,34,2,7,1,9,1],
+      ["critical",4,1,37,1,2,1,26,1,11,1,2,1,10,1,13,1,24,1,4,1,30,1,8,3,3,2,5,1,25,1,5,2],
+      ["criticise",153,1],
+      ["criticised",8,2],
+      ["criticising",15,5],
+      ["criticism",8,2,8,4,21,1,7,1,31,1,53,1,77,1],
+      ["criticize",148,1],
+      ["croatia",21,1,14,1],
+      ["crocodile",115,1,78,1,17,1],
+      ["crocus",38,1],
+      ["croft",109,1],
+      ["crook",187,3],
+      ["crooke",28,1],
+      ["crop",22,4,1,1,10,2,17,2,1,2,14,2,4,1,7,1,20,3,3,4,2,4,1,7,22,4,9,4,6,2,4,2,22,1,12,1,17,1,5,7,2,7,10,1,10,1,2,1,1,7],
+      ["cropped",10,1],
+      ["cross",0,1,50,1,2,1,55,1,52,1,8,1,4,1,27,1,14,1],
+      ["crossbreeding",65,1],
+      ["crosse",144,1,21,1],
+      ["crossed",84,1,6,1,133,1],
+      ["crossing",22,1,91,1,38,4],
+      ["crouch",171,1],
+      ["crow",127,3],
+      ["crowd",42,1,13,4,57,1,107,8],
+      ["crowded",99,1,73,1],
+      ["crown",70,1],
+      ["crowned",64,1],
+      ["crsp",128,16],
+      ["crucial",12,2,2,1,12,1,6,1,20,1,4,1,1,1,23,1,6,1,7,1,8,1,19,1,9,1,2,1,6,1,6,1,4,1,29,1,4,1,7,1,18,1,5,1,1,1],
+      ["crucially",92,1,1,1,63,1,9,1,23,1],
+      ["crude",23,4,4,1,60,1],
+      ["cruel",157,1],
+      ["cruelty",157,1],
+      ["cruising",52,3],
+      ["crumbled",123,1],
+      ["crunching",145,1,36,1,22,1],
+      ["crush",158,1,19,1,38,1],
+      ["crushed",51,1,28,1,38,1,101,2],
+      ["crushing",79,2,82,1],
+      ["crust",25,6,65,5],
+      ["crustacean",91,1,33,1],
+      ["crutchfield",42,1],
+      ["crux",213,1],
+      ["cry",47,1,47,1,9,2,48,1,49,1,22,1],
+      ["crying",181,1,30,1],
+      ["cryptanalytic",190,1],
+      ["crystal",61,1,7,3,4,2,7,1,37,1,21,1,12,1],
+      ["crystallised",41,1],
+      ["crystallized",79,1],
+      ["csr",122,7],
+      ["ctor",177,1],
+      ["cube",151,1],
+      ["cubic",35,1,44,1,38,1,79,1],
+      ["cuckoo",121,2],
+      ["cuddie",210,4],
+      ["cue",5,2,116,1,27,2,26,2,24,1,6,2],
+      ["cued",83,1],
+      ["cueva",40,1],
+      ["cuff",19,1,53,1],
+      ["cul",118,1],
+      ["culminated",116,1],
+      ["culminating",185,1,20,1],
+      ["culprit",103,1,107,1,4,1],
+      ["cultivate",16,1,83,1,40,1,55,1],
+      ["cultivated",22,2,16,1,35,1,26,1,34,1,25,1],
+      ["cultivating",139,1,19,1],
+      ["cultivation",23,1,28,1,26,1,11,1,11,3,25,2,15,1,82,1],
+      ["cultural",0,1,1,2,13,1,18,1,2,6,7,2,2,1,1,1,2,1,8,1,6,1,14,1,12,3,26,1,6,1,27,2,6,3,11,1,8,1,16,1,17,1,7,1],
+      ["culturally",172,1,14,1,18,1],
+      ["culture",0,1,3,1,5,1,1,4,2,1,3,14,2,1,1,1,30,2,4,1,4,1,5,1,23,1,12,2,4,1,8,1,13,1,29,1,1,1,7,3,10,3,3,2,1,1,4,1,8,1,3,3,3,1,16,1,1,1,4,1,1,1,1,3,7,1,3,1,3,1],
+      ["cultured",108,10],
+      ["cumberland",218,4],
+      ["cumbersome",113,1],
+      ["cummin",186,1],
+      ["cuneiform",67,17],
+      ["cunliffe",169,3],
+      ["cup",85,1,22,1,54,1],
+      ["cupboard",5,1],
+      ["curated",205,1],
+      ["curator",55,1,89,1,26,1],
+      ["curb",35,1],
+      ["curbing",69,1],
+      ["cure",17,1,30,1,1,1,60,1],
+      ["curing",47,1,52,1],
+      ["curiosity",27,2,61,1,94,1],
+      ["curious",34,1,11,1,40,4,16,1,6,1,73,1,5,1,30,1],
+      ["currant",22,1],
+      ["currawong",135,1],
+      ["currency",65,1,12,2],
+      ["current",5,2,4,2,15,1,1,3,3,2,9,2,9,1,2,1,4,1,1,3,16,1,11,1,11,1,29,2,25,2,14,2,1,1,6,1,11,1,2,1,2,1,7,1,1,1,6,1,10,2,4,1,15,1,2,1],
+      ["currently",11,1,13,1,10,1,12,1,7,1,2,1,31,1,16,1,20,1,11,1,12,1,19,1,2,1,33,1,4,1,3,1,10,1,4,1,4,1,2,1],
+      ["curricula",16,1,106,1],
+      ["curricular",153,1],
+      ["curriculum",11,1,38,1,73,1,41,1,43,1],
+      ["currie",139,6],
+      ["curse",48,1],
+      ["curtail",183,1],
+      ["curvature",151,1],
+      ["curve",10,2,36,2,6,1],
+      ["curved",44,1,152,1],
+      ["curving",151,1,14,2],
+      ["custom",38,1,49,1,1,1],
+      ["customary",6,1],
+      ["customer",32,2,23,2,18,2,7,7,2,10,15,3,25,3,34,1,5,1,1,2,4,8,15,1,19,3],
+      ["customised",73,1,83,1],
+      ["cut",4,1,1,1,19,5,3,2,6,2,2,1,5,1,3,1,22,1,14,1,4,1,7,1,12,6,5,1,7,1,3,1,6,1,1,2,9,1,1,1,6,2,3,1,9,1,2,1,41,1,4,6,8,1,3,1,8,3,2,1,2,1],
+      ["cute",160,1],
+      ["cutter",139,13],
+      ["cutthroat",141,1],
+      ["cutting",7,1,17,1,27,1,11,1,17,1,17,1,6,5,22,1,5,1,10,1,1,2,36,1,16,1,7,5,22,1],
+      ["cuttlefish",89,2],
+      ["cycle",17,1,26,1,58,1,7,1,20,1,6,1,3,1,3,1,22,1,1,1,48,1],
+      ["cyclist",137,1],
+      ["cylinder",67,1,12,10],
+      ["cylindrical",62,1],
+      ["cynic",151,1],
+      ["cynicism",144,1],
+      ["czar",0,1],
+      ["czeisler",220,1],
+      ["da",176,1,4,3],
+      ["dabbler",190,1],
+      ["dacia",87,1],
+      ["daddy",15,1,210,1],
+      ["daggertooth",91,1],
+      ["dahl",145,1,58,1],
+      ["daily",6,1,3,1,32,1,2,2,11,1,9,1,10,1,12,1,2,5,34,1,5,1,29,1,7,1,2,1,27,1],
+      ["dairy",70,1,26,1,6,9,97,9,1,1],
+      ["daisy",224,1],
+      ["dakota",223,2],
+      ["dale",167,1,45,2],
+      ["dalhousie",11,2],
+      ["dali",17,1],
+      ["dalla",95,1],
+      ["dam",35,1],
+      ["damage",3,1,4,2,15,1,11,1,2,1,26,2,6,1,23,1,6,1,6,2,10,1,19,1,3,1,7,1,20,1,8,1,4,1,4,1,4,1,4,1,6,1,8,2,5,3,6,1,4,2],
+      ["damaged",185,1,7,1,1,1,27,1,1,4],
+      ["damaging",33,1,6,1,12,1,71,1,19,2,73,1],
+      ["damascus",107,1],
+      ["damp",137,2],
+      ["damsel",157,1],
+      ["dan",83,1,59,1],
+      ["dance",56,4,44,1,11,1,35,3,11,1,15,1,1,1,10,1,15,1],
+      ["danced",71,1,7,1],
+      ["dancer",161,1],
+      ["dancing",84,1,62,1],
+      ["danger",35,1,24,1,32,1,15,1,7,1,8,2,57,1,3,1,28,2],
+      ["dangerous",21,3,9,1,17,1,18,1,24,3,25,1,28,1,23,1,49,1],
+      ["dangerously",67,1],
+      ["daniel",58,1,16,3,109,1,23,1],
+      ["danjo",54,1],
+      ["danube",27,2,120,1],
+      ["daphne",189,2],
+      ["dare",213,1],
+      ["darius",67,1],
+      ["dark",9,1,10,1,15,2,5,1,4,1,25,2,15,1,7,1,1,2,12,1,5,1,12,1,1,1,64,1,4,1,25,1,2,1,2,1,2,1],
+      ["darkened",39,1],
+      ["darker",217,1],
+      ["darkness",52,1,16,1],
+      ["darmstadt",190,1],
+      ["dart",89,1],
+      ["dartmouth",120,1],
+      ["darwin",59,2,2,1,89,4,25,1,12,1,17,1,4,2],
+      ["darwinian",150,1],
+      ["darwinism",150,1],
+      ["dashe",97,1],
+      ["dashiell",109,1],
+      ["dashing",182,1],
+      ["data",24,6,19,1,6,1,9,1,5,1,1,1,4,1,1,1,1,4,6,4,5,2,1,1,1,1,10,1,2,4,2,1,4,1,27,14,12,1,2,5,3,1,8,4,1,1,2,1,3,1,4,1,3,2,2,1,11,1,2,2,3,1,17,9,2,1,7,1,9,1,1,1],
+      ["database",128,3,39,1,34,1,11,1],
+      ["date",13,1,8,1,14,1,1,1,2,1,2,3,4,1,3,2,4,1,10,1,1,1,10,1,4,1,1,1,10,1,1,1,19,1,6,1,9,1,6,3,12,1,5,2,24,1,3,1,10,1,5,1,8,1,8,2,5,1,3,1,2,1],
+      ["dated",25,1,15,2,7,1,63,1,100,2,12,1],
+      ["dating",23,1,2,4,2,1,2,2,9,1,2,1,7,1,3,1,11,1,16,1,11,1,12,1,23,1,28,1,41,2,4,1,9,1,5,3],
+      ["datura",224,1],
+      ["daughter",4,2,52,1,80,1,21,1,25,1],
+      ["daunting",111,1,31,1],
+      ["daurat",219,2],
+      ["davi",195,2],
+      ["david",34,9,17,1,25,1,36,1,8,1,6,1,10,1,8,1,4,1,19,2,1,1,13,1,1,1,15,2,1,1,8,1,6,3,9,1],
+      ["davidson",37,2],
+      ["dawn",52,1],
+      ["day",0,1,5,1,1,1,1,5,4,1,6,1,1,2,2,1,4,1,2,1,5,2,4,1,4,1,3,2,1,7,3,3,3,1,2,1,1,2,5,1,1,2,3,2,2,1,1,1,2,1,1,1,3,1,2,3,1,1,4,1,3,1,1,1,4,3,2,3,2,3,2,2,1,3,4,2,1,1,1,1,1,1,2,2,2,6,1,1,6,1,4,1,1,2,3,1,5,1,1,1,2,3,2,1,2,2,1,1,8,1,3,1,2,1,5,1,6,1,1,1,1,1,2,2,2,2,6,1,2,1,2,1,2,1,1,1,1,6,3,1,6,4,1,1,2,1,5,1,2,2,4,1,2,8,5,1,5,2,2,1,1,1,3,2,2,1,4,1],
+      ["daylight",91,1,3,1],
+      ["daytime",68,1,105,1],
+      ["dc",70,1,88,1,5,1],
+      ["ddt",137,2],
+      ["de",3,1,2,2,9,1,9,3,33,1,40,1,3,1,19,1,25,1,2,1,58,1,5,6],
+      ["deaconess",83,1],
+      ["deactivation",65,1],
+      ["dead",10,1,38,1,31,1,4,1,6,1,68,1,35,1,14,1,17,1],
+      ["deadly",62,1,7,1,6,2,62,1,2,1,57,1,13,1],
+      ["deaf",74,4,130,5],
+      ["deafening",96,1],
+      ["deafness",204,1],
+      ["deal",4,1,4,1,7,1,1,4,2,4,15,1,8,2,17,1,24,1,20,1,2,1,14,1,6,1,10,1,7,1,15,1,10,1,23,1,10,1,5,1,4,1,1,1,2,1,9,4,5,1],
+      ["dealer",1,1,189,1],
+      ["dealership",200,1],
+      ["dealing",15,5,5,1,6,1,43,1,23,1,12,1,30,2,17,1,11,1,29,1,23,1],
+      ["dealt",34,3,112,1,2,1],
+      ["dean",6,1,122,1],
+      ["death",4,3,5,1,2,1,20,1,3,1,17,1,8,1,5,1,5,1,6,1,20,2,10,3,2,1,7,1,1,1,1,1,20,1,1,2,2,1,6,1,26,3,11,1,6,1,4,1,2,1,9,1],
+      ["debatable",153,1],
+      ["debate",0,1,13,1,3,1,24,3,1,1,8,1,4,1,2,1,19,1,9,1,16,1,16,1,8,1,15,4,7,1,4,1,2,1,17,1,10,2,5,3,19,4,1,1,5,2,2,1,1,1,2,2],
+      ["debated",86,1,71,1,26,1,4,2],
+      ["debilitation",6,1],
+      ["debit",47,1],
+      ["debri",47,1,100,1,49,1,14,1],
+      ["debt",113,1],
+      ["decade",6,1,21,1,1,2,2,1,2,1,3,1,1,2,5,1,2,1,2,1,1,1,3,1,15,1,5,3,3,1,2,1,1,1,2,1,7,3,5,1,8,1,13,1,3,1,4,1,6,1,6,1,3,1,4,1,1,2,2,1,3,1,1,2,1,1,5,1,7,1,3,1,1,1,4,1,1,1,2,1,1,1,6,1,1,1,1,1,3,1,2,1,2,1,4,1,18,1,3,1,4,1,9,1,2,2,3,1],
+      ["decay",19,1,42,1,117,4,13,4,18,1],
+      ["deceitful",127,1],
+      ["deceive",50,1,125,1],
+      ["december",123,1,54,1,36,1],
+      ["decentralised",150,1],
+      ["deception",127,2,48,4],
+      ["deceptively",127,1],
+      ["decide",7,1,5,1,9,1,21,1,56,1,6,1,26,2,26,1,20,1,13,1,20,1,4,2],
+      ["decided",4,1,8,4,20,1,36,1,1,1,7,1,6,1,5,1,1,1,14,1,9,1,2,1,5,1,18,1,1,1,8,1,16,1,18,2,20,1,4,1,10,1,1,1,5,1],
+      ["decidedly",193,1],
+      ["deciding",9,1,3,1,82,1],
+      ["decimated",101,1],
+      ["decipherable",190,1],
+      ["decision",3,1,3,1,2,7,4,2,21,1,23,32,15,2,7,2,16,1,15,1,22,1,20,1,1,35,1,1,3,2,10,5,12,1,11,2,4,1,7,41,9,7],
+      ["decisive",48,1],
+      ["deck",91,2],
+      ["declaiming",188,1],
+      ["declaration",178,1],
+      ["declare",59,1],
+      ["declared",137,1,34,1,33,1,19,2],
+      ["declaring",44,1],
+      ["decline",27,1,49,1,27,1,6,1,1,1,22,2,1,1,2,2,3,1,3,1,3,1,8,1,24,2,11,1,15,1,12,1],
+      ["declined",39,1,37,1,53,3,12,1,53,2],
+      ["declining",19,1,1,1,97,1,27,1,43,1,14,1],
+      ["deco",63,1],
+      ["decoded",67,1],
+      ["decoding",190,1],
+      ["decomposed",1,1],
+      ["decomposition",45,1],
+      ["deconstruction",22,1],
+      ["decontamination",84,1],
+      ["decorate",38,1,108,1],
+      ["decorating",151,1],
+      ["decoration",77,1,74,1],
+      ["decorative",1,2,135,1,4,1,6,1],
+      ["decrease",8,1,57,1,75,1,45,1,15,1,24,1],
+      ["decreased",60,1,39,1,45,3,54,1],
+      ["decreasing",153,1],
+      ["dedicate",126,1],
+      ["dedicated",12,1,42,1,12,1,5,1,71,2,7,1,20,1],
+      ["dedication",4,1,11,1],
+      ["deduced",111,1,63,1],
+      ["deductive",116,1],
+      ["deed",225,1],
+      ["deemed",85,1,67,1],
+      ["deep",3,1,7,2,3,2,8,1,1,1,16,1,14,1,7,1,9,4,1,2,7,1,3,1,12,3,3,2,2,1,4,1,8,1,19,1,7,1,5,1,3,1,12,1,6,1,11,1,9,3,2,1,1,1,2,2,5,1,20,1,10,1,2,1],
+      ["deepen",149,1],
+      ["deeper",24,1,42,1,2,1,40,1,5,1,16,1,31,1,26,1,24,1],
+      ["deepest",188,1,8,1],
+      ["deeply",167,1,4,1,4,1,6,1,31,1,8,1],
+      ["deer",50,1,40,1],
+      ["defaced",214,1],
+      ["default",200,1],
+      ["defeat",69,1,31,1,89,1],
+      ["defeated",116,1,21,1],
+      ["defeating",69,1],
+      ["defect",22,1,36,1,15,3,89,1],
+      ["defective",22,2],
+      ["defence",21,1,48,1,20,1,53,3,33,1,1,1,37,2,5,1,6,1],
+      ["defenceless",224,1],
+      ["defend",110,1,2,1,112,1],
+      ["defended",183,1],
+      ["defense",61,1,29,1,18,1,113,2],
+      ["defensive",22,1,43,2,109,4,50,1,1,1],
+      ["deference",41,1,59,1],
+      ["defiance",54,1],
+      ["deficiency",204,2],
+      ["deficit",94,1,110,3],
+      ["define",11,1,35,1],
+      ["defined",2,1,46,1,39,1,63,2,33,1,31,1],
+      ["defining",32,1,83,1,34,1],
+      ["definite",106,1,35,1],
+      ["definitely",24,1,10,1,66,4,121,1],
+      ["definition",42,1,4,1,45,1,31,1,104,1],
+      ["definitional",206,1],
+      ["definitive",0,1,137,1,7,1,64,1],
+      ["deflect",147,1],
+      ["deforia",83,1],
+      ["defy",190,1],
+      ["degradation",15,1,109,1,9,1],
+      ["degrade",152,1],
+      ["degraded",135,1],
+      ["degree",12,1,11,1,4,1,2,1,7,1,19,1,3,1,3,1,1,3,18,2,49,5,1,4,5,1,15,1,8,1,3,1,2,1,1,4,9,1,8,1,36,1,2,1],
+      ["deguti",58,2],
+      ["dehydrating",99,1],
+      ["dehydration",121,1],
+      ["deir",77,1],
+      ["deirdre",17,1],
+      ["deity",9,1],
+      ["delayed",137,1],
+      ["delaying",24,1],
+      ["delegate",96,2,56,1,7,3],
+      ["delete",220,1],
+      ["delft",71,1],
+      ["deliberate",6,1,146,1,23,1],
+      ["deliberated",152,1],
+      ["deliberately",18,1,9,1,125,1],
+      ["deliberating",152,1],
+      ["deliberation",152,8],
+      ["deliberative",152,3],
+      ["delicate",107,1],
+      ["delicious",200,1],
+      ["delight",59,1,17,1,36,1,13,1,90,1],
+      ["delighted",66,1,70,1],
+      ["delightfully",182,1],
+      ["delineate",69,1],
+      ["deliver",44,1,52,1,18,1,26,1,11,1,21,1,16,1,38,2],
+      ["delivered",72,1,39,1,44,1,2,1,35,1,24,1],
+      ["delivering",15,1,151,1,60,1],
+      ["delivery",80,1,40,1,42,1,64,1],
+      ["delta",35,1,161,5],
+      ["deluded",162,1],
+      ["delusion",98,1],
+      ["delusional",98,1],
+      ["demand",1,1,4,1,11,1,22,1,2,1,2,1,6,1,6,1,7,1,12,1,4,1,9,1,10,1,6,6,5,1,6,1,4,2,5,1,6,1,1,1,5,2,6,2,9,1,4,1,5,1,8,1,8,1,18,1,3,2,2,2,2,6,21,1],
+      ["demanded",155,1],
+      ["demanding",20,2,24,1,5,1,55,1,10,1,10,1,38,1,1,1,44,1],
+      ["dement",220,1],
+      ["demise",27,1,48,1,28,1,84,1,23,1],
+      ["democracy",36,1],
+      ["democratic",36,1,20,1,75,1],
+      ["demolished",169,1,27,1],
+      ["demonstrate",41,1,6,3,67,1,13,1,9,1,6,1,7,1,9,1,7,1,2,1,20,1,10,1,8,1,7,1],
+      ["demonstrated",1,1,2,1,15,4,34,1,7,1,22,4,19,4,16,1,21,1,23,2,15,1,5,1,10,3,8,2,2,2,21,1],
+      ["demonstrating",6,1,26,1,15,1,7,1,141,1,24,1],
+      ["demonstration",3,1,172,1],
+      ["demotic",111,1],
+      ["denial",209,1],
+      ["denigrate",168,1],
+      ["denmark",29,1,15,1,90,1],
+      ["denni",68,1],
+      ["denote",100,1],
+      ["dense",21,1,27,1,4,1,32,1,26,1,10,1,21,1,55,1,22,1],
+      ["densely",48,1,136,1],
+      ["denser",52,1,72,1],
+      ["density",52,3,44,1,14,2,8,2,104,1,1,1],
+      ["dental",191,12],
+      ["dentist",191,18],
+      ["denture",191,2],
+      ["denver",75,1],
+      ["deny",95,1,18,1,5,1,65,1,26,1],
+      ["denying",205,1],
+      ["depart",56,1,71,1,56,1,41,1],
+      ["department",70,2,33,2,6,1,1,1,18,1,11,1,1,1,13,1,2,1,32,1,9,1],
+      ["departure",130,1,29,1,13,1],
+      ["depaul",60,1,10,1],
+      ["depend",6,2,42,1,8,2,12,1,7,1,5,1,1,1,5,1,3,1,4,2,9,1,6,1,9,1,26,1,4,1,52,1,19,1,4,5],
+      ["depended",32,1,84,1,34,1],
+      ["dependence",54,1,85,1],
+      ["dependent",5,1,3,1,1,3,19,1,37,1,103,1,20,1,23,1],
+      ["depending",23,7,3,1,16,1,24,1,50,1,12,1,50,1],
+      ["depersonalised",8,1],
+      ["depict",23,1,126,1],
+      ["depicted",25,1,4,1,69,1,11,2,14,1,13,1,86,1],
+      ["depicting",29,1],
+      ["depiction",64,1],
+      ["depleted",201,1],
+      ["depletion",96,1,104,5],
+      ["deplored",157,1],
+      ["deployed",133,1,93,1],
+      ["deposit",21,1,26,1,32,3,29,1,88,6,14,1,8,2],
+      ["deposited",40,1,68,1,57,1,31,1,14,2],
+      ["depositing",121,1],
+      ["deposition",90,1],
+      ["depress",3,1],
+      ["depressed",17,1],
+      ["depression",17,1,3,1,74,1,38,1,23,1],
+      ["deprivation",220,1],
+      ["deprived",92,1,2,2,91,2],
+      ["depth",5,1,29,1,6,1,12,2,16,4,1,3,11,1,3,1,8,13,2,1,32,2,46,1,6,2,3,1,30,1],
+      ["der",22,1,31,2,27,4,115,1,6,1],
+      ["derek",208,1],
+      ["dereliction",113,1],
+      ["derision",93,1],
+      ["derive",57,1,50,1,15,1,45,2,23,1,22,2,2,1],
+      ["derived",3,1,5,1,1,1,56,1,31,1,19,1,9,1,76,1,1,1],
+      ["deriving",218,1],
+      ["derwent",34,1],
+      ["desai",188,1],
+      ["desalination",226,1],
+      ["descend",68,1],
+      ["descendant",14,1,124,1,56,1,8,1,5,1],
+      ["descended",132,1,7,1],
+      ["descent",132,3,15,2,61,1],
+      ["describe",10,1,2,1,5,2,6,1,3,3,8,1,2,1,3,1,17,1,7,1,9,1,1,1,14,1,9,1,15,1,28,1,7,2,3,1,1,1,8,1,9,1,16,1,14,1,12,1,2,1,1,1,5,1,2,1,5,1],
+      ["described",1,1,7,1,3,1,5,1,26,1,3,1,2,1,4,1,3,1,4,1,6,2,1,1,2,1,26,1,1,1,3,1,1,1,13,1,5,1,2,1,7,1,4,1,15,1,39,1,5,1,8,2,20,1,5,1],
+      ["describing",80,1,17,1,52,1,47,1],
+      ["description",23,2,3,1,8,2,21,1,9,1,6,1,17,1,17,1,44,1,9,1,14,1,35,2,1,1,16,2],
+      ["descriptive",95,1],
+      ["desert",10,2,25,1,13,1,2,1,20,11,9,1,10,1,1,3,8,1,11,1,14,2,1,12,35,2,6,8,12,1,18,1,28,1,1,1],
+      ["desertification",124,10,9,1],
+      ["deserve",7,1,2,1,107,1,21,1,71,1],
+      ["deservedly",168,1],
+      ["design",1,9,4,5,3,11,3,1,1,2,1,1,10,1,6,1,15,11,2,2,7,24,10,7,10,2,7,1,2,3,15,1,21,3,2,15,1,1,8,1,5,1,2,2,4,5,10,1,1,1,5,2,3,2,2,1,9,2,3,2,21,1,1,4,20,1,3,1],
+      ["designate",13,1,204,1],
+      ["designating",53,1,90,1],
+      ["designed",1,2,4,4,3,2,3,1,2,1,5,1,2,1,11,1,3,1,19,1,10,3,1,1,2,1,2,1,14,1,32,1,6,2,6,1,3,1,11,1,3,1,10,1,1,1,5,1,2,1,8,1,1,1,7,1,2,1,10,1,6,4,19,1,7,1],
+      ["designer",12,1,30,1,8,1,3,6,60,1,5,1,14,1,8,4,16,1,5,5],
+      ["designing",5,1,29,4,100,1,27,1,5,1],
+      ["desirable",22,1,25,3,16,1,35,1,43,1,43,1],
+      ["desire",17,1,24,1,2,1,4,5,30,1,15,1,20,1,37,1,23,1,37,1],
+      ["desired",171,1,7,1,46,1],
+      ["desk",15,1,66,1],
+      ["desolate",123,1,15,1,26,1,38,1],
+      ["desperate",100,1],
+      ["desperately",114,1],
+      ["despised",135,1],
+      ["despite",10,1,2,1,2,3,1,1,1,1,3,1,1,1,3,1,7,1,3,1,2,1,5,1,1,1,2,1,5,1,10,1,6,1,5,1,6,1,1,1,1,1,1,1,15,1,2,1,14,2,2,2,2,1,1,1,4,1,8,1,11,2,3,5,1,1,3,2,1,1,4,1,1,1,1,1,2,1,2,1,2,1,4,1,6,1,6,1,1,1,8,2,1,1,8,1,1,2,2,2,4,1,5,1,1,1,4,1,4,1,4,1,5,2,4,1],
+      ["despommier",133,3],
+      ["dessert",87,1],
+      ["destabilised",196,1],
+      ["destination",13,1,72,1,36,2,9,1,34,1,41,1],
+      ["destined",101,1],
+      ["destiny",157,1],
+      ["destroy",6,1,13,1,82,1,57,1,35,1],
+      ["destroyed",67,1,23,1,79,1,25,1],
+      ["destroyer",75,1],
+      ["destroying",61,1,51,1,29,1],
+      ["destruction",88,1,106,1],
+      ["destructive",35,1,89,1,17,1,32,1],
+      ["detachable",19,1],
+      ["detached",118,1,93,1],
+      ["detail",30,3,11,1,12,1,7,1,10,2,1,1,7,2,26,4,1,1,6,1,19,1,21,1,22,1,2,1,8,1,3,1,29,2],
+      ["detailed",40,2,30,2,1,1,5,1,2,1,45,1,48,2,2,1,5,1,4,1,14,1,5,1,23,1],
+      ["detect",14,1,3,1,48,3,4,1,2,2,7,1,43,1,33,6,4,1,1,1,16,6,2,1],
+      ["detectable",158,1],
+      ["detected",24,1,19,1,36,1,76,1,19,1,3,1,3,2],
+      ["detecting",37,1,6,1,147,1,14,1],
+      ["detection",65,1,4,3,108,1],
+      ["detective",109,25],
+      ["detector",175,1],
+      ["deter",65,1,93,2,66,1],
+      ["deteriorate",197,1],
+      ["deteriorated",198,1],
+      ["deteriorating",82,1,36,1,15,1,5,1,64,1],
+      ["deterioration",3,1,19,1,169,1,1,1,17,1,5,1],
+      ["determinant",174,1],
+      ["determination",41,1,50,1,59,1,75,1],
+      ["determine",24,4,24,1,12,1,7,1,2,2,10,1,16,1,6,1,2,1,5,2,27,1,5,1,34,1,9,1,13,1,8,1,14,1,6,1,1,1],
+      ["determined",16,1,12,1,47,2,6,1,24,1,5,1,13,1,24,1,1,1,6,2,2,1,5,2,10,1,19,1,2,1],
+      ["determining",8,1,96,1,70,2,6,1,45,1],
+      ["deterrent",52,1,165,1,7,1],
+      ["deterring",65,1,93,1],
+      ["detractor",16,1],
+      ["detriment",52,1],
+      ["detrimental",76,1,128,1],
+      ["detroit",70,1,88,1],
+      ["devalue",148,1],
+      ["devastate",139,1],
+      ["devastated",48,1,57,1],
+      ["devastating",143,1,30,1,50,1],
+      ["devastation",194,1],
+      ["develop",7,1,8,1,1,2,10,1,12,1,6,2,14,1,12,1,3,1,1,1,8,1,7,3,3,1,5,1,8,1,7,1,3,1,7,1,11,1,1,1,8,1,3,1,11,1,3,1,1,2,6,1,9,1,3,1,5,1,1,2,2,6,5,1,6,1,1,1,5,1,2,1,1,1,10,1,6,5],
+      ["developed",4,2,4,1,3,1,1,1,7,5,4,7,6,2,2,1,7,1,1,1,1,1,6,1,5,1,10,1,1,1,5,5,6,1,6,3,1,1,1,1,2,1,5,1,9,1,8,1,1,1,1,2,3,2,2,2,1,1,2,1,1,1,1,1,1,2,2,1,2,1,6,3,2,1,4,2,1,1,1,2,4,1,5,1,2,2,9,1,2,1,3,1,1,2,2,1,2,1,4,1,8,1,2,1,5,1,8,1,1,3,1,1,3,1,3,1,2,1,6,1,8,3,4,1,3,1,1,1,1,2],
+      ["developer",26,1,125,1],
+      ["developing",3,1,4,5,1,1,3,1,4,2,1,1,12,1,9,1,25,6,14,2,1,1,3,1,14,1,7,1,11,1,12,2,7,1,2,1,31,1,13,1,8,1,1,1,3,1,6,4,3,1,13,1,11,1,2,1],
+      ["development",0,1,2,2,4,2,1,1,2,3,1,1,5,1,4,4,9,1,7,2,1,2,1,1,1,1,6,1,2,2,1,3,5,1,9,3,4,1,2,5,2,1,5,1,2,2,1,4,3,4,4,1,8,3,4,3,13,1,3,1,5,3,1,3,4,4,10,1,2,1,1,2,3,1,2,6,1,1,4,1,4,1,10,1,1,1,2,1,1,1,1,2,9,1,1,1,2,1,9,2,1,4,8,1,4,2,3,1,1,1,1,1,5,1,2,1,5,1,4,4,3,3,2,2],
+      ["developmental",3,1,55,4,2,1,114,1],
+      ["developmentally",106,1,119,1],
+      ["deviate",130,1],
+      ["deviation",207,1],
+      ["device",13,3,5,1,11,1,5,1,9,3,7,1,3,1,7,1,2,1,1,1,1,1,8,1,1,1,6,1,1,1,2,2,3,1,9,2,3,1,16,1,13,1,28,1,18,2,18,1,7,1,22,1,1,1],
+      ["devil",99,1,45,1,13,1],
+      ["devise",72,1,7,1,80,1,12,1,3,1],
+      ["devised",32,1,32,1,65,1,16,1,1,1,38,1,6,1,13,1],
+      ["devising",28,1,16,1],
+      ["devoid",124,1,63,1],
+      ["devoted",71,2,7,2,27,1,35,1,27,1,23,1,18,1,4,1,3,1],
+      ["devotion",205,1,10,1],
+      ["devoured",111,1],
+      ["dexterity",82,1],
+      ["dhmc",120,2],
+      ["di",32,1,45,1],
+      ["diabete",24,1],
+      ["diabetic",53,1],
+      ["diagnose",80,2],
+      ["diagnosed",4,1,54,1,48,1],
+      ["diagnostic",17,1,203,1,6,2],
+      ["diagonal",63,1,4,1],
+      ["dial",70,1],
+      ["dialect",14,12,81,1,112,3],
+      ["dialectism",86,1],
+      ["dialog",60,1],
+      ["dialogue",160,2,59,2],
+      ["diameter",226,1],
+      ["diamond",79,1,22,2,14,1],
+      ["diary",18,6,8,1,13,1,66,2],
+      ["diatonic",204,1],
+      ["dice",15,1],
+      ["dichotomy",63,1],
+      ["dick",125,3],
+      ["dickson",133,1],
+      ["dictate",69,1,71,1],
+      ["dictatorial",56,1],
+      ["dictatorship",36,1],
+      ["dictionary",64,1,31,1,116,2],
+      ["didactic",206,1],
+      ["didn",1,1,4,1,12,1,1,1,21,1,19,1,10,1,14,2,15,1,21,1,11,1,22,1,3,2,4,1,7,1,20,1,11,1,4,1,5,1],
+      ["die",27,1,10,1,38,1,16,1,4,1,13,1,27,1,2,1,21,1,27,2],
+      ["died",27,1,37,2,3,1,48,2,1,1,20,1,1,1,7,5,49,3,1,1,17,1,12,1],
+      ["diet",16,1,8,12,46,1,9,1,3,2,17,1,3,12,1,1,12,5,28,5,4,1,32,1,20,12,1,2],
+      ["dieter",135,1,65,1],
+      ["dietetic",70,1],
+      ["dietician",70,1],
+      ["differ",2,1,5,1,42,1,21,1,58,1,1,1,1,1,14,1,9,1,23,1,2,1,12,1,14,1,12,1],
+      ["differed",24,1],
+      ["difference",8,1,2,1,4,2,3,1,1,1,13,1,18,8,7,1,2,1,4,1,7,1,2,1,1,2,9,1,3,1,2,1,1,1,5,1,8,1,2,1,4,1,2,1,2,1,11,1,10,2,16,3,5,1,1,1,2,2,1,1,4,1,5,3,13,3,6,1,13,2,2,1,5,6],
+      ["different",2,1,3,3,1,1,1,5,3,1,2,7,2,6,2,2,2,2,1,3,4,1,1,4,2,2,1,3,2,2,1,1,1,1,1,1,2,3,1,1,1,6,1,4,3,2,1,2,1,2,1,1,3,1,3,1,5,1,4,2,3,1,1,1,5,1,1,2,1,2,2,3,4,3,1,1,2,4,3,3,3,4,2,3,1,1,6,1,5,1,2,1,4,1,2,1,1,1,1,1,5,1,5,2,1,1,4,1,3,5,1,2,1,1,1,1,1,3,8,1,1,2,6,9,1,1,1,3,1,2,3,1,2,2,1,1,5,6,5,1,1,4,1,1,1,2,1,2,6,1,2,1,4,2,1,2,1,1,1,2,1,3,1,2,1,1,7,2,2,1,2,1,3,1,2,1,1,5,2,1,2,2,2,1,2,1,1,2,1,2,1,1,1,2,2,1,1,1,2,5,2,1,1,1,2,3],
+      ["differentiate",225,1],
+      ["differentiated",1,1],
+      ["differently",18,5,6,1,6,1,38,1,106,1,24,1,8,1,19,2],
+      ["differing",17,1,46,1,96,1],
+      ["difficult",1,2,2,1,3,1,2,1,3,1,2,3,3,4,12,1,5,1,7,1,5,2,3,1,5,2,2,1,10,1,8,1,18,1,5,1,6,1,3,1,1,1,13,2,9,3,2,1,4,1,6,2,2,1,8,1,1,1,3,1,2,1,18,1,7,1,10,1,6,1,1,1,1,1,1,3,9,2,5,1,2,1,5,1,4,1,1,1],
+      ["difficulty",26,1,4,2,9,1,4,1,5,1,10,1,8,1,15,1,19,1,6,1,14,1,22,1,9,1,2,1,28,3,2,1,8,2,9,3,4,1,11,1],
+      ["diffuse",17,1],
+      ["dig",40,1,10,1,63,3],
+      ["digest",59,1,55,1,25,1],
+      ["digested",113,1,103,1],
+      ["digestible",61,1,112,1],
+      ["digesting",59,1,66,2],
+      ["digestion",34,1,124,2],
+      ["digestive",125,1,12,1,2,1,34,1],
+      ["digging",35,1,10,1,68,1,2,1,20,1,75,1],
+      ["digital",30,2,65,2,9,3,40,1,57,1,5,1,13,1],
+      ["digitally",173,1],
+      ["dignify",41,1],
+      ["dignitary",77,1,102,1],
+      ["dignity",41,2],
+      ["dijksterhui",152,4],
+      ["dilemma",17,1],
+      ["dilettante",111,2],
+      ["diluted",71,1,7,1,80,1],
+      ["dim",34,1,74,1],
+      ["dimension",7,2,115,2,40,1,3,3,2,1,45,1],
+      ["dimensional",30,3,34,2,5,1,29,2,11,1,64,1],
+      ["diminished",188,1,36,1],
+      ["diminishing",162,1],
+      ["dingo",138,7,64,7],
+      ["dingoe",138,22,55,1,9,22],
+      ["dining",5,1,179,2],
+      ["dinner",28,1,70,1,6,1,42,1,73,1],
+      ["dinosaur",25,22,85,1,34,1,43,1],
+      ["dionysus",188,1],
+      ["dioxide",5,2,47,1,54,1,23,10,35,6,31,1,31,2],
+      ["diphtheria",96,1],
+      ["dipped",108,1,110,1],
+      ["diprotodon",210,1],
+      ["direct",9,1,2,1,2,1,22,1,1,1,2,1,2,1,7,1,9,3,1,1,15,2,27,1,4,1,12,1,7,2,10,1,5,1,25,1,5,1,5,1,17,1,7,1,15,3,1,1,10,1],
+      ["directed",41,1,53,1,62,1,49,1,6,1],
+      ["directing",11,1,140,1],
+      ["direction",1,1,35,1,32,1,1,2,16,1,12,1,24,3,2,1,7,7,4,3,4,1,21,1,6,1,3,1,12,1,8,1,7,1,3,1,4,1,23,1],
+      ["directional",165,1],
+      ["directly",1,1,12,1,1,1,4,4,16,1,5,1,8,1,1,1,4,1,1,1,4,1,2,1,2,1,14,1,19,1,17,1,30,1,14,1,12,2,7,1,34,1,4,2,7,1],
+      ["director",12,1,5,2,11,1,6,1,9,1,12,2,15,1,13,2,21,1,10,1,6,1,8,1,16,1,1,1,34,1,24,1,2,1,15,3],
+      ["dirt",31,1,65,1],
+      ["dirty",112,1,1,1,104,1],
+      ["disability",204,3],
+      ["disabled",100,2],
+      ["disadvantage",8,2,11,1,185,1,20,1],
+      ["disaffection",15,2],
+      ["disagree",24,1,36,1,52,1,32,1,34,1,7,1],
+      ["disagreed",213,1],
+      ["disagreeing",37,1],
+      ["disagreement",16,1,1,1,23,1,44,1],
+      ["disallow",80,1],
+      ["disappear",16,1,9,2,7,2,1,1,6,2,18,1,38,2,33,1,10,1,1,1,5,1,16,1,3,1,21,1,2,1,1,1,15,1,5,1],
+      ["disappearance",75,4,15,1,12,1,75,1,22,1],
+      ["disappeared",14,1,7,1,6,1,4,2,37,2,4,1,3,2,63,1,64,1,21,1],
+      ["disappearing",32,1,9,1,18,1],
+      ["disappointing",36,1,83,1],
+      ["disappointment",36,1],
+      ["disapproved",105,1],
+      ["disassembled",123,1],
+      ["disaster",33,1,69,1,10,2,27,1,60,1,24,1],
+      ["disastrous",102,1,50,1,18,1,29,1],
+      ["disastrously",113,1],
+      ["discarded",1,1,50,1,116,1,45,1],
+      ["discern",176,1],
+      ["discerned",174,1],
+      ["discerning",32,1],
+      ["discharged",224,1],
+      ["disciple",160,1],
+      ["disciplinary",41,1,165,1],
+      ["discipline",11,2,30,1,40,1,5,1,9,2,55,1,18,1,32,1,11,1],
+      ["disciplined",140,1],
+      ["disclose",69,1,87,1],
+      ["discoloration",178,1],
+      ["discoloured",192,1],
+      ["discomforting",93,1],
+      ["discontented",4,1],
+      ["discontinued",28,1],
+      ["discount",20,1],
+      ["discounting",153,1],
+      ["discourage",39,1,26,1,17,1,76,1,56,1],
+      ["discouraging",186,1],
+      ["discover",22,1,1,1,13,1,11,1,11,1,3,1,52,1,48,1,14,1,4,1,13,1,8,1,4,1],
+      ["discovered",19,1,2,1,2,5,13,1,1,1,1,1,2,2,2,1,3,2,5,2,7,2,10,3,1,1,3,1,6,3,2,1,4,1,7,1,1,1,16,1,7,1,2,1,7,2,4,1,1,1,7,1,4,2,10,1,2,1,9,1,7,1,5,1,5,3,3,1,5,2,5,1,20,1,2,1,5,2,1,1],
+      ["discovering",41,1,65,1,22,1],
+      ["discovery",3,1,4,1,10,1,10,2,14,1,4,4,2,3,11,1,3,3,3,1,1,1,3,4,19,1,4,8,9,2,8,1,7,1,1,1,7,3,2,1,2,1,12,1,5,1,5,6,11,2,9,1,6,1,2,1,8,1,2,1,5,1,23,1,8,1],
+      ["discredited",221,1],
+      ["discreet",104,1],
+      ["discrepancy",49,1],
+      ["discriminate",204,2],
+      ["discriminating",152,1,14,1,38,1],
+      ["discrimination",152,1,52,1],
+      ["discuss",23,1,163,1,36,1],
+      ["discussed",11,1,156,1,45,1],
+      ["discussion",11,2,1,2,20,1,4,2,4,1,44,1,12,1,8,1,11,1,35,1,13,1,15,1,30,3],
+      ["disdain",4,1],
+      ["disease",7,7,2,1,2,1,11,3,2,10,8,2,30,1,8,2,5,4,14,1,5,1,7,3,4,1,2,1,1,2,4,1,25,22,2,2,19,1,33,2,29,1,3,1],
+      ["diseased",226,1],
+      ["disenchantment",41,2],
+      ["disengaged",63,1],
+      ["disguise",89,4],
+      ["disguised",89,1],
+      ["disgust",146,2,29,1],
+      ["disgusted",114,1],
+      ["dish",7,14],
+      ["dishe",7,13,25,1],
+      ["disillusioned",151,1],
+      ["disintegrate",19,1],
+      ["disintegrated",25,1],
+      ["disk",52,1],
+      ["dislike",100,1,14,3,35,1,66,2],
+      ["disliked",26,1,57,1,22,2],
+      ["disliking",148,1,67,1],
+      ["dismantled",169,1],
+      ["dismayed",32,1],
+      ["dismisse",150,1],
+      ["dismissing",163,1],
+      ["disney",161,1],
+      ["disorder",43,2,29,1,9,2,2,2,11,2,12,2,98,4,16,1],
+      ["disorientation",63,1],
+      ["disparate",12,1,179,1],
+      ["disparity",49,1,21,1,83,1],
+      ["dispatched",149,1],
+      ["dispel",43,4],
+      ["dispensed",53,1],
+      ["disperse",158,1],
+      ["dispersed",40,1,115,1,3,1,65,1],
+      ["dispersing",35,1,108,1],
+      ["dispersion",40,1],
+      ["dispiriting",73,1],
+      ["displaced",96,1,34,1,3,1,27,1],
+      ["display",13,1,34,1,6,1,7,2,10,1,16,4,33,1,32,1,4,1,19,1,24,1,18,1,9,1],
+      ["displayed",23,1,37,1,46,1,78,1,32,1],
+      ["displaying",155,1],
+      ["disposal",112,1,22,6,28,1],
+      ["dispose",134,1],
+      ["disposing",134,1],
+      ["dispute",54,1,6,1,51,1,45,1,32,1,19,1,2,1,1,1,3,1],
+      ["disputed",211,1],
+      ["disputing",210,1],
+      ["disregard",209,1],
+      ["disregarded",187,1],
+      ["disrepair",151,1],
+      ["disrupted",126,1],
+      ["disrupting",224,1],
+      ["disruption",73,1],
+      ["disruptive",225,1],
+      ["dissatisfaction",15,1],
+      ["dissatisfied",4,1],
+      ["dissection",150,1],
+      ["dissemination",101,1],
+      ["dissented",42,1],
+      ["dissimilar",87,1],
+      ["dissipation",140,1],
+      ["dissolve",15,1,12,1,32,1],
+      ["dissolved",19,1,4,8],
+      ["dissolving",19,1,195,1],
+      ["distance",52,3,6,1,7,1,26,1,6,1,1,1,13,1,10,1,9,1,2,1,8,1,14,4,5,1,5,6,4,2,12,3,36,2,5,1,3,1],
+      ["distant",0,1,13,1,87,1,64,1],
+      ["distaste",99,3],
+      ["distemper",223,1],
+      ["distinct",14,1,12,1,13,2,12,1,6,1,26,1,11,1,31,1,19,1,41,1,5,1],
+      ["distinction",14,1,12,1,28,1,23,1,9,2,60,1,32,1,9,1,22,1],
+      ["distinctive",14,1,15,1,3,2,52,1,10,2,9,1,7,1,55,1,49,1],
+      ["distinctiveness",205,1],
+      ["distinctly",127,1],
+      ["distinguish",46,1,22,1,33,1,9,1,70,1,6,1,18,3],
+      ["distinguishability",53,1],
+      ["distinguished",1,1,3,2,6,1,1,1],
+      ["distinguishing",122,1,64,1,21,1],
+      ["distortion",64,1],
+      ["distract",146,2,25,1],
+      ["distracted",114,1,38,1],
+      ["distraction",43,1,83,6],
+      ["distress",37,1,137,1,47,1],
+      ["distressed",92,2,34,1],
+      ["distribute",7,1,140,1,19,2],
+      ["distributed",8,1,119,1,38,1,54,1],
+      ["distribution",27,1,41,1,1,1,30,1,38,1,3,1,13,1,66,1,3,1],
+      ["district",105,2,7,1,82,1,23,2,1,1],
+      ["distrust",150,1],
+      ["disturb",172,1],
+      ["disturbance",33,1,146,1,3,1],
+      ["disturbed",20,1,69,1,5,1,49,1,67,1],
+      ["disturbing",41,1,48,3],
+      ["disused",41,1],
+      ["dithyramb",188,1],
+      ["dive",68,4,57,1],
+      ["diver",5,1,63,2,40,1],
+      ["divergence",162,1],
+      ["diverse",10,2,12,1,18,1,5,1,104,1,1,1,36,2],
+      ["diversification",33,1],
+      ["diversified",45,1],
+      ["diversity",10,2,1,1,11,4,36,1,81,1,2,1,21,1,24,3],
+      ["diverted",50,2,46,1,41,1],
+      ["diverting",35,1],
+      ["divide",7,2,5,1,208,1],
+      ["divided",2,1,37,2,12,1,33,2,1,1,38,1,16,1,28,1,9,1,5,1,3,2,17,1,11,1,2,1],
+      ["dividing",25,1,101,2],
+      ["division",8,1,67,2,8,1,103,1],
+      ["divorce",104,1],
+      ["divorced",17,1],
+      ["dizzying",161,1],
+      ["dna",14,1,13,3,32,1,16,1,64,1,38,3,20,1,28,1],
+      ["dock",66,1,47,2],
+      ["docked",123,1],
+      ["docking",211,1],
+      ["doctor",0,1,16,6,23,1,33,3,8,1,29,1,7,1,21,2,26,1,26,1,2,4,6,2,23,5],
+      ["doctoral",154,4,42,1],
+      ["document",11,1,4,1,92,1],
+      ["documentary",41,1,50,3,84,1],
+      ["documentation",16,1],
+      ["documented",43,1,27,1,24,1,1,2,42,1,42,1,8,1],
+      ["dodd",71,1],
+      ["doer",109,1],
+      ["doesn",6,1,10,1,17,1,30,1,5,1,3,1,7,1,3,1,8,2,25,2,17,1,7,2,13,1,7,1,3,1,18,1,5,1,18,2,2,1],
+      ["dog",71,2,4,1,3,1,21,1,7,1,20,1,9,1,9,5,11,1,24,1,3,1,10,1,1,1,29,2,1,9],
+      ["dogmatically",8,1],
+      ["doing",9,1,3,2,6,2,2,2,4,1,9,1,16,2,5,1,4,1,23,1,1,2,16,1,2,1,2,1,11,1,5,2,4,1,4,3,5,1,15,1,3,2,1,1,10,2,2,1,1,1,9,1,4,1,5,1,3,1,13,2,2,1,2,1,18,1],
+      ["doll",29,69,169,1,13,1],
+      ["dollar",33,1,2,1,8,1,5,1,7,1,42,2,35,1,8,1,2,1,9,1,28,1,38,1],
+      ["dollmaker",29,4],
+      ["dollmaking",29,2],
+      ["dolphin",14,1,38,1,4,1,42,2,71,1],
+      ["doma",36,1],
+      ["domain",0,1,6,1,81,1],
+      ["domestic",10,3,9,1,43,1,43,1,4,1,8,3,13,1,17,1,19,1,56,1,1,3],
+      ["domesticate",222,1],
+      ["domesticated",22,1,10,1,47,1,22,1,38,1,19,1,64,1],
+      ["domestication",22,1,29,1,104,1,67,7],
+      ["dominance",61,1,39,2,41,1,21,1,54,1],
+      ["dominant",25,3,16,1,5,1,2,6,33,1,14,1,44,1,77,1],
+      ["dominate",131,1,16,1],
+      ["dominated",1,1,40,1,7,4,8,1,4,2,8,1,5,1,23,1,7,1,12,1,9,1,12,1,2,1,56,1,8,1,6,1],
+      ["domination",8,1,28,1],
+      ["dominative",36,2],
+      ["domitian",169,2],
+      ["don",5,1,2,2,7,2,4,1,2,1,4,1,9,1,10,1,4,1,8,2,3,3,12,2,1,1,1,2,8,1,3,1,6,1,3,1,2,2,1,1,3,1,6,1,10,1,12,1,2,1,1,1,2,1,3,2,1,1,3,2,6,1,13,1,3,3,3,1,2,2,2,5,5,2,19,1,6,1,5,2,10,5,7,1,1,8],
+      ["donald",115,1],
+      ["donation",28,3,94,1],
+      ["done",5,1,28,1,2,1,2,1,5,1,5,1,1,1,32,2,5,1,3,1,9,2,9,2,6,1,4,1,17,1,4,1,5,2,21,1,7,1,2,1,1,1,5,1,26,1,11,1,1,1,4,1,1,1],
+      ["donkin",61,1],
+      ["donley",70,1],
+      ["donna",82,1],
+      ["donor",28,1],
+      ["doodling",111,1],
+      ["doomed",151,1,41,1],
+      ["door",17,1,38,3,8,1,11,1,52,1,53,1,3,2,6,1,26,1],
+      ["doorstep",192,1],
+      ["dopamine",189,1],
+      ["doped",226,1],
+      ["doran",168,2],
+      ["dorothea",157,1],
+      ["dorsal",52,2],
+      ["dosage",53,2],
+      ["dose",137,1,40,1,24,2],
+      ["dot",70,2,27,2],
+      ["doter",46,1],
+      ["douady",165,7],
+      ["double",20,2,32,1,50,1,49,1,8,1,36,1,4,1],
+      ["doubled",15,1,17,1,45,1,22,1,23,1,21,1],
+      ["doubling",96,1],
+      ["doubly",104,1],
+      ["doubt",13,1,12,1,15,1,7,1,7,1,4,1,44,1,16,1,5,1,10,1,17,1,27,1,1,2,12,1,9,1,11,1,11,1,1,1],
+      ["doubtful",1,1],
+      ["doubtless",152,1,30,1,5,1],
+      ["douche",201,1],
+      ["doug",22,1,11,2],
+      ["dougla",8,1,8,1,17,3,14,1],
+      ["dove",4,1],
+      ["down",10,1,2,1,6,1,3,1,1,1,13,4,2,1,1,1,8,1,2,1,3,2,1,2,4,1,3,1,2,3,1,1,4,1,2,2,3,1,1,1,2,1,4,1,6,1,3,1,3,2,1,1,6,1,5,6,1,1,2,1,8,2,5,1,3,1,3,2,2,2,6,7,7,1,1,1,2,1,2,2,2,1,2,1,5,1,1,1,3,1,3,1,1,1,1,1,3,3,4,2,4,1,2,2,7,2,3,2,3,1,1,1,3,1,4,2,1,1,1,3,1,6,2,1,6,1,3,1,7,3,3,1],
+      ["downfall",109,1],
+      ["downplayed",178,1],
+      ["downpour",201,1],
+      ["downside",102,1,97,1],
+      ["downstream",35,2,144,1],
+      ["downward",91,1,60,1,25,1],
+      ["downwind",90,1],
+      ["doyle",109,2],
+      ["dozen",5,1,6,1,16,1,31,1,9,1,8,1,20,1,2,1,22,1,25,1,14,1,14,1,17,1,21,1,9,1],
+      ["dr",7,7,11,9,7,6,8,1,13,1,2,3,1,2,5,1,2,2,13,1,5,3,9,2,6,4,5,4,4,2,2,10,1,1,5,1,3,1,16,1,10,1,9,1,1,2,11,3,3,3,6,1,4,1,2,2,1,1,1,1,2,2,10,1,5,4,2,7,11,2,1,1,12,2,7,1,2,1],
+      ["draft",175,1],
+      ["drafting",15,1],
+      ["drag",52,5,80,1],
+      ["dragged",144,1],
+      ["dragging",161,1],
+      ["dragon",25,1,2,1,155,1],
+      ["dragonfly",159,1],
+      ["drain",19,1,16,7],
+      ["drainage",35,1,34,2,66,6],
+      ["drained",35,1,16,1,86,1],
+      ["draining",35,1,102,1,63,1],
+      ["drama",12,6,45,1,114,1,4,2,38,1],
+      ["dramatic",5,1,17,1,4,1,35,1,14,1,2,1,6,1,5,1,2,2,3,1,3,1,3,1,1,1,26,1,15,1,36,1,5,1,40,1],
+      ["dramatically",0,1,5,1,19,1,3,1,21,1,8,1,21,1,4,1,38,1,14,1,2,1,3,1,3,1,38,1,8,1,7,1,8,1,21,2],
+      ["dramatist",145,3,1,4,57,3],
+      ["drank",0,1,88,1,112,1],
+      ["drastic",96,1,48,2,48,1],
+      ["drastically",197,1,26,1],
+      ["drava",35,1],
+      ["draw",31,1,24,3,5,1,10,2,11,1,11,1,48,1,6,5,27,1,1,1,34,1,10,1],
+      ["drawback",0,1,19,1,142,1],
+      ["drawing",49,1,5,1,13,1,19,1,3,3,10,1,6,3,37,1,17,2,14,1,4,2,13,5,25,4,2,1,1,2,5,1],
+      ["drawn",5,1,9,1,17,1,8,1,3,1,9,1,35,1,19,1,4,1,4,1,1,1,26,1,17,1,7,1,51,1],
+      ["dream",17,33,22,1,18,1,37,1,50,1,13,1,28,2],
+      ["dreamed",144,1],
+      ["dreamer",17,1],
+      ["dreaming",17,9,64,6,13,1,55,1,36,3],
+      ["dreamtime",136,1],
+      ["dresdner",84,1],
+      ["dressed",18,1,11,1,69,1],
+      ["dressmaker",140,1],
+      ["drew",50,1,4,1,82,1,79,1],
+      ["drexel",97,2],
+      ["dried",0,1,16,1,34,3,1,1,28,1,9,1,3,1,16,1,16,1,13,1,15,1,60,1,7,3],
+      ["drier",90,1,34,1],
+      ["drift",5,1,20,5,23,1],
+      ["drifting",52,1,116,3,46,1],
+      ["drill",79,2,52,1,60,1,19,1],
+      ["drilled",79,1],
+      ["drink",0,3,15,1,23,1,24,1,4,1,22,9,49,1,41,3,22,2,16,1],
+      ["drinker",0,1,88,2],
+      ["drinking",0,1,62,1,7,1,19,3,66,1,24,1,13,1],
+      ["drip",113,1],
+      ["drive",28,2,19,1,28,1,8,1,29,2,12,1,9,1,1,1,27,1,12,2,21,2,28,1],
+      ["driven",15,5,60,1,44,1,26,1,44,1,14,1],
+      ["driver",85,1,50,1,46,1,16,4,23,1],
+      ["driveway",35,1],
+      ["driving",5,1,18,1,47,1,45,1,24,2,20,1,38,2],
+      ["drizzle",180,1],
+      ["drop",14,1,29,1,6,1,22,1,7,1,1,1,10,1,13,1,24,1,1,1,11,2,15,5,46,1,3,2],
+      ["droplet",62,1],
+      ["dropped",6,1,53,1,22,1,11,1,26,1,15,1,46,2,28,1],
+      ["dropping",100,1,27,1],
+      ["drosera",59,2],
+      ["drought",5,1,85,1,34,1,14,1,5,1,59,1,19,1,3,1],
+      ["drove",75,2,37,1],
+      ["drown",128,1],
+      ["drowning",166,1],
+      ["drowsiness",106,1],
+      ["drowsy",103,1,3,1],
+      ["drs",18,1,192,1],
+      ["drug",16,2,37,7,19,2,8,1,2,1,1,2,11,1,8,1,35,3,48,1,14,1,27,1],
+      ["drunk",0,2,87,1],
+      ["dry",27,1,8,1,12,1,4,1,11,2,25,1,2,1,1,2,1,1,16,1,17,5,19,2,21,2,9,1,4,1,33,1,4,1,3,1],
+      ["drying",1,1,60,2,1,1,45,1,111,1],
+      ["dryly",172,1],
+      ["ds",212,3],
+      ["du",19,1,2,1,95,1],
+      ["dual",195,1],
+      ["dubbed",86,1],
+      ["dubbing",86,4],
+      ["dubious",40,1,138,1],
+      ["duchaine",58,4],
+      ["duck",127,2],
+      ["ductile",119,1],
+      ["due",0,1,12,2,8,6,5,3,1,1,6,2,16,1,5,1,2,1,3,1,7,1,5,1,6,1,3,1,9,1,15,1,3,1,9,1,6,1,5,1,9,1,3,1,2,4,21,1,18,1,5,1,1,1,17,1,14,1],
+      ["dug",113,2,12,1,52,1],
+      ["duiker",10,2],
+      ["duke",20,1,123,1,24,1,45,1],
+      ["dummy",72,2],
+      ["dumping",134,2],
+      ["dune",165,29],
+      ["dunesong",165,1],
+      ["dunhuang",77,1],
+      ["dunlop",23,3],
+      ["dunn",85,1],
+      ["dupin",109,2],
+      ["duplicating",0,1],
+      ["duplication",206,1],
+      ["durability",23,1,95,1,11,1],
+      ["durable",29,2,100,2],
+      ["durand",61,3],
+      ["duration",3,4,10,1,8,1,45,1],
+      ["durer",215,3],
+      ["during",1,1,3,1,5,2,2,1,1,2,2,1,3,7,1,2,1,1,2,2,2,8,2,1,6,2,5,1,3,3,2,1,1,1,1,2,1,1,7,3,6,2,1,3,2,2,1,1,5,2,2,2,3,1,6,3,1,1,1,2,2,4,2,1,1,1,1,2,3,1,1,1,1,1,2,1,2,2,2,1,1,1,2,1,4,3,4,5,2,1,1,1,7,2,2,1,2,2,4,1,5,1,5,1,1,1,5,1,2,1,6,1,2,1,2,1,1,1,3,2,12,1,2,1,3,1,5,1,2,1,2,1,1,5,1,14,1,1,10,1,1,1,3,1,5,1,3,2,1,1,7,1,1,2,1,1,1,2,4,2,1,1],
+      ["dusk",43,1,60,1],
+      ["dust",25,1,65,18,34,2],
+      ["dusty",90,3,61,2,59,1,3,1],
+      ["dutch",0,3,35,2,43,2,10,2,56,1,12,1,5,1,25,1,6,1,3,1],
+      ["dutchman",0,1],
+      ["duty",8,1,83,1,58,1],
+      ["dux",197,1],
+      ["dvd",226,1],
+      ["dweck",6,2],
+      ["dweller",10,1,53,1,19,1,7,1,23,1,23,3,12,1,44,1],
+      ["dwelling",50,1,70,1,27,1,46,1],
+      ["dwindling",138,1,64,1],
+      ["dye",38,30,9,1],
+      ["dyed",38,4],
+      ["dyeing",38,8,102,1,54,1],
+      ["dyer",38,1],
+      ["dyestuff",38,2],
+      ["dying",95,1,76,1],
+      ["dyke",35,2],
+      ["dynamic",2,1,10,2,44,2,71,1,25,1,30,1],
+      ["dynamite",79,1,109,1],
+      ["dynasty",77,2,11,2,19,5],
+      ["dysfunctional",150,1],
+      ["each",8,1,3,1,1,6,2,5,1,1,1,2,4,1,5,1,1,1,8,2,2,1,3,3,5,2,3,1,1,1,1,2,2,1,1,2,2,3,2,1,6,1,1,3,3,4,1,3,1,1,2,1,1,1,1,2,1,1,2,1,2,1,1,1,1,1,1,2,1,1,1,1,2,1,1,2,1,2,4,1,2,1,2,2,1,1,1,2,1,2,1,1,2,1,4,3,1,1,1,2,12,1,1,2,2,1,1,4,1,1,4,2,4,4,2,1,5,1,6,1,1,1,2,2,3,1,5,1,1,3,2,1,1,1,1,1,2,2,1,1,1,2,1,5,1,1,1,3,1,1,5,1,1,1,1,1,1,2,1,2,1,1,3,3,3,5,2,1,7,1,4,1,1,1,3,3,1,1,1,1,3,1,2,1,2,1,1,3,1,3,2,1,2,4,2,1,1,1,2,9,3,1,1,2],
+      ["ead",201,1],
+      ["eager",12,1,151,1,29,1],
+      ["eagle",184,8,38,1],
+      ["ear",3,1,151,4,18,1,8,1,1,1,40,1],
+      ["earache",158,1],
+      ["eared",179,1],
+      ["earl",126,1],
+      ["earlier",0,3,15,1,3,1,13,3,5,1,4,3,6,1,20,2,6,1,43,1,12,1,9,2,1,1,12,1,8,2,50,2],
+      ["earliest",16,1,20,1,4,2,5,1,1,4,15,1,16,1,2,2,9,1,40,1,14,1,3,1,45,1,13,1,2,1],
+      ["early",0,2,1,4,1,2,1,2,3,1,2,7,1,1,3,2,3,1,1,1,1,1,4,1,1,1,1,10,1,1,3,1,2,1,4,1,6,3,1,3,4,2,2,1,1,2,2,1,1,1,1,6,3,1,4,1,3,3,5,1,8,4,3,1,4,2,1,1,5,1,8,1,1,2,1,1,2,2,1,1,5,2,1,5,1,1,1,2,3,1,1,1,1,1,1,2,1,7,1,1,1,2,1,1,4,1,6,1,3,1,1,2,4,5,9,2,2,6,2,1,1,1,1,2,4,1,2,1,1,2,8,2,2,1,1,3,5,1,2,2,4,1,4,1,6,1,3,3,3,1,2,1,3,1,2,2,2,2,6,1,2,1,3,1,1,1,1,1,1,1,3,2,1,2,1,1,1,1],
+      ["earn",66,1,6,1,4,1,73,1,14,2,3,1],
+      ["earned",44,1,22,1,65,1],
+      ["earner",117,2],
+      ["earnest",36,1],
+      ["earning",117,1],
+      ["earth",13,6,12,12,7,1,6,1,7,1,5,1,12,1,7,1,8,1,10,1,26,2,3,10,3,1,1,1,1,1,6,1,6,1,1,1,1,1,7,24,22,9,4,1,5,3,4,7,3,2,9,1,6,1,20,1,1,1,10,1],
+      ["earthbound",193,1],
+      ["earthly",177,2],
+      ["earthquake",117,1,79,4],
+      ["earthy",157,1],
+      ["earworm",18,31],
+      ["ease",5,1,90,1,1,1,27,1,9,2,40,1,28,1,7,1,10,1,1,1],
+      ["easier",8,1,7,1,4,1,30,1,2,1,7,1,16,1,6,1,2,1,15,1,2,1,19,3,5,1,4,1,15,4,14,1,7,1,41,1,10,1,2,1],
+      ["easiest",63,1,26,1,89,1],
+      ["easily",16,1,9,4,6,1,11,1,23,1,2,1,1,1,26,2,5,2,6,1,1,1,8,1,3,1,12,1,12,2,1,1,13,1,15,1,10,1,15,1,5,1,1,1,3,1,9,1,5,1],
+      ["east",21,1,4,1,2,1,35,2,1,2,2,1,1,5,11,1,2,1,5,7,3,1,1,6,2,1,11,4,12,2,2,1,2,1,13,4,11,2,8,1,2,2,6,1,5,1,7,4,25,5,1,1],
+      ["eastern",21,1,4,1,8,1,5,1,13,1,26,1,2,1,8,1,12,1,2,1,9,2,13,1,12,1,6,2,12,1,41,1,16,1],
+      ["easton",49,1],
+      ["eastward",223,1],
+      ["easy",0,1,3,1,16,1,2,1,3,1,1,1,27,2,3,1,2,1,1,1,17,1,7,2,4,1,11,1,4,1,12,1,6,1,13,1,10,1,7,1,12,1,3,1,6,1,16,1,5,1,18,2,6,1,1,1,6,1,3,1],
+      ["eat",10,1,6,1,8,2,35,3,2,3,9,1,6,3,13,1,5,1,5,2,3,4,8,1,5,1,1,1,11,2,8,1,3,1,5,3,6,1,9,4,35,3,6,4,1,1,2,1,20,2],
+      ["eaten",0,1,32,2,19,1,14,1,74,1,54,1,23,1],
+      ["eater",139,1,4,3,79,1],
+      ["eating",24,5,3,1,5,2,27,3,2,1,4,1,5,1,6,1,15,2,1,1,7,1,3,4,13,2,20,1,3,1,5,4,1,1,14,3,24,1,1,2,2,1,8,2,4,1,2,4,3,1,19,3,1,1],
+      ["eavesdrop",222,1],
+      ["eavesdropped",85,1],
+      ["eccentric",34,1,7,1,68,1,63,1],
+      ["eccentricity",146,1],
+      ["echo",14,1,27,1,110,1,16,1,45,1],
+      ["echoe",103,1],
+      ["echoed",28,1],
+      ["eclipsed",69,1],
+      ["eco",33,1,63,4,44,1],
+      ["ecological",14,1,11,1,65,1,30,2,7,1,6,1,5,2,3,2,46,1,15,2,7,1],
+      ["ecologically",96,1],
+      ["ecologist",68,1,22,1,12,1,33,2,8,1,15,1,41,1,22,3],
+      ["ecology",135,1,8,1,11,1,25,1],
+      ["economic",8,1,15,2,10,5,14,1,1,1,1,2,6,1,1,1,7,1,2,1,4,1,26,1,6,7,11,1,6,1,6,3,5,1,5,1,3,2,3,1,7,2,9,2,6,1,1,1,16,1,7,1,7,1],
+      ["economically",33,1,56,1,12,1,119,1],
+      ["economist",49,1,21,1,6,3,20,1,5,2,1,1,26,10,71,1],
+      ["economy",33,1,14,1,8,1,18,1,4,1,24,2,11,1,5,2,23,1,7,1,19,2,6,2,35,1],
+      ["ecosystem",16,1,29,1,3,9,72,1,4,2,17,9,3,1,35,1,43,1,1,1],
+      ["ecotourism",143,1],
+      ["ed",96,1],
+      ["edgar",109,1,68,1,15,2],
+      ["edge",7,1,18,1,8,2,1,1,28,1,4,1,9,1,9,2,19,1,32,1,8,1,22,1,7,1,1,1,28,2,18,1],
+      ["edged",21,1],
+      ["edible",5,1,11,1,34,1,11,2,28,1,13,1,53,1,44,1],
+      ["edict",0,1],
+      ["edinburgh",111,1],
+      ["edited",145,1,58,1],
+      ["editing",4,1,60,1,30,1],
+      ["edition",4,1,153,2,22,1,3,1],
+      ["editor",4,3],
+      ["editorial",64,1,35,1,58,1],
+      ["educate",11,1,180,1],
+      ["educated",105,1,48,1],
+      ["education",11,7,25,1,13,7,25,1,35,1,2,1,11,3,15,1,16,4,7,2,3,2,13,2,10,6,3,1,2,1,7,1,8,2],
+      ["educational",11,3,38,2,6,1,34,1,3,1,39,1,29,1,3,1,23,5,3,1,2,1,7,1,8,1,3,1,2,2],
+      ["educationally",186,1],
+      ["educator",11,1,63,2,79,1,7,1,26,3],
+      ["edward",112,1,14,1,24,1,31,1,13,1,3,1],
+      ["edwardian",151,1],
+      ["edwin",168,1],
+      ["eeg",17,1,77,3,126,2],
+      ["eel",52,1,37,1],
+      ["eeo",40,1],
+      ["eero",44,1],
+      ["effect",5,3,9,1,2,1,1,1,1,1,2,3,1,1,1,1,2,2,1,1,3,1,2,2,3,3,1,8,2,6,1,2,4,2,7,1,8,1,1,1,6,1,1,1,7,1,1,9,4,3,2,1,1,1,1,1,6,1,4,1,4,1,2,1,3,1,1,3,1,5,1,1,4,1,8,1,8,3,15,2,3,1,1,1,7,1,4,2,1,2,2,4,1,1,2,2,3,5,2,1,1,2,3,1,3,1,1,2,5,3,2,1,3,1,5,1,7,1,3,4,3,1,1,3,7,4,5,1,1,1,7,8,4,5,1,1],
+      ["effect5",72,3],
+      ["effective",1,1,11,2,8,2,4,1,13,1,13,1,3,1,3,3,5,1,1,2,10,3,2,1,24,1,6,1,8,2,10,1,25,1,3,1,2,2,10,1,12,1,23,1,23,1,4,1,2,1],
+      ["effectively",8,1,60,1,13,1,25,1,56,1,8,1,4,1,12,1,9,1,2,1,29,4],
+      ["effectiveness",8,1,28,4,97,1,17,1,2,1,23,1,51,1],
+      ["efficacy",1,1],
+      ["efficiency",36,1,3,1,4,1,9,1,54,1,16,1,4,2,2,1,21,1,48,1],
+      ["efficient",5,1,3,2,31,1,17,1,11,1,35,2,10,1,6,1,4,1,4,4,2,4,1,1,3,1,38,2,3,1,3,1,19,1,4,2],
+      ["efficiently",1,1,4,1,3,1,5,1,43,4,22,1,37,1,6,1,5,1,24,1,76,1],
+      ["effort",0,1,4,1,2,1,16,1,11,1,3,1,16,2,17,1,4,1,9,1,13,1,9,1,4,1,5,1,7,1,11,5,7,1,5,1,5,1,8,1,6,1,1,1,3,1,24,1,10,1,2,1,5,6,1,1,15,1],
+      ["effortful",188,1],
+      ["egalitarian",47,1],
+      ["egg",32,2,16,1,17,4,12,2,25,11,1,2,7,6,5,1,6,1,46,1,26,1,6,11,13,1],
+      ["eggshell",29,1],
+      ["ego",200,5],
+      ["egypt",31,5,15,1,4,1,1,1,17,2,43,3,12,12],
+      ["egyptian",29,2,2,3,15,2,31,1,21,1,9,3,1,2,3,3,12,7,95,1],
+      ["egyptologist",123,2],
+      ["eight",2,1,2,1,29,1,6,9,4,1,1,1,2,2,53,1,6,1,18,1,13,1,7,1,8,1,22,1],
+      ["eighteen",34,1],
+      ["eighteenth",66,1,22,2,98,1,21,1],
+      ["eighth",88,1,15,1,91,1],
+      ["eighty",117,1],
+      ["eiji",73,1],
+      ["einkorn",101,1],
+      ["einstein",145,1,15,3,23,1,20,1],
+      ["eisen",55,1],
+      ["either",23,7,8,1,7,1,3,1,1,1,1,1,2,1,2,1,6,1,1,1,2,1,2,1,5,1,8,1,7,1,7,1,4,1,3,2,1,1,5,1,1,1,10,1,3,1,11,1,15,1,2,1,3,4,4,1,5,1,8,1,3,1,2,1,4,1,8,1,8,1,3,1,7,1,2,1,3,2,2,1,4,1,8,1,5,1,1,1,5,1],
+      ["ejected",177,1],
+      ["ekirch",39,7],
+      ["ekman",60,10,115,25],
+      ["el",40,1,37,1,103,1],
+      ["elaborate",1,1,21,1,35,1,32,1,9,1,38,1,20,1,1,1,62,1],
+      ["elaboration",26,1,55,1],
+      ["elamite",67,1],
+      ["eland",10,1],
+      ["elastic",119,1],
+      ["elastica",23,2],
+      ["elasticity",23,2],
+      ["elbow",115,1],
+      ["elder",51,1,160,4,5,2],
+      ["elderly",82,1,13,1],
+      ["elected",111,1],
+      ["election",116,1],
+      ["elective",11,1],
+      ["electric",33,1,13,1,13,3,20,1,15,1,22,1,6,1],
+      ["electrical",19,1,40,1,1,1,9,1,25,2,22,2,10,1,50,1,18,1,26,1],
+      ["electrically",57,1],
+      ["electricity",37,1,6,1,44,1,29,5,6,2,73,3],
+      ["electrode",81,1],
+      ["electroencephalogram",94,1],
+      ["electroencephalograph",17,1,203,1],
+      ["electromagnetic",69,4,132,1],
+      ["electronic",13,1,29,1,40,1,22,2,30,1,20,1,14,1,58,2],
+      ["electronically",100,1],
+      ["electrophysiological",57,1],
+      ["elegance",158,1],
+      ["elegant",10,1,88,1,54,1,6,1,9,1,3,1,18,1,24,1],
+      ["elegiac",111,1],
+      ["element",8,1,3,1,1,1,14,1,1,1,25,1,2,1,9,4,6,1,8,1,7,1,7,1,4,2,2,1,7,1,16,3,11,1,5,1,4,1,10,2,14,1,6,1,14,2,23,1,11,2,2,1,6,1],
+      ["elemental",50,1],
+      ["elementary",54,1,33,1,89,1],
+      ["elephant",75,1,18,1,5,2,56,35,61,2],
+      ["elevated",0,1,9,1,32,1,53,1],
+      ["elevation",41,1,114,1,22,1],
+      ["elevator",155,4],
+      ["elgar",89,1],
+      ["elicit",60,1,54,1,39,1,21,1],
+      ["elicited",146,2],
+      ["eliminate",138,1,55,1,7,1,2,1],
+      ["eliminated",22,1,5,1,46,1,2,1,27,2,97,2],
+      ["elimination",133,1],
+      ["elite",50,1,5,1,56,1,86,1],
+      ["elitist",55,1],
+      ["eliza",111,1],
+      ["elizabeth",4,1,81,1,31,2,66,1],
+      ["elizabethan",145,1,58,1],
+      ["ellard",63,6],
+      ["ellenbogen",94,2],
+      ["ellery",109,1],
+      ["elliott",145,3,58,3,20,1],
+      ["ellison",59,1],
+      ["ellsey",83,4],
+      ["elm",16,2],
+      ["elman",147,2],
+      ["elongated",52,1,113,1],
+      ["else",9,1,30,1,3,1,9,1,4,1,2,1,1,1,9,1,9,1,19,1,11,1,8,1,9,1,3,1,19,2,1,3,22,1,5,1,6,1,3,1,6,1,7,1,8,2,4,1,1,1,14,1],
+      ["elsewhere",62,1,29,1,5,1,25,1,14,1,16,1,2,1,11,1,23,1,5,1,13,1,2,1,3,1],
+      ["elsner",20,3],
+      ["elucidate",160,1],
+      ["eluded",81,1],
+      ["elusive",47,1,97,1,36,1,18,1,25,1],
+      ["email",70,1,56,2,40,1,31,1],
+      ["embankment",35,1],
+      ["embark",205,1],
+      ["embarrass",144,1],
+      ["embassy",0,1],
+      ["embedded",27,1,30,1,18,1,11,1,28,1,11,1,14,1,12,1,36,1],
+      ["embellished",0,1],
+      ["emblem",41,1],
+      ["embodied",57,1,7,1,106,1],
+      ["embody",32,1],
+      ["embrace",6,1,67,1,18,1,61,1],
+      ["embraced",64,1,35,1,58,1],
+      ["embracing",205,1],
+      ["embroidered",72,1],
+      ["embryo",15,1],
+      ["emerge",26,1,10,1,11,1,43,1,10,1,10,1,49,1,15,1,15,1],
+      ["emerged",9,1,3,2,2,2,10,1,15,1,2,2,9,1,15,1,10,1,9,1,15,1,14,1,27,1,12,1,9,1,60,1,1,1],
+      ["emergence",9,1,5,1,22,1,25,1],
+      ["emergency",41,1,53,1,39,2,64,1],
+      ["emergent",54,1,154,1],
+      ["emerging",2,1,28,1,18,1,21,2,102,1,17,1],
+      ["emeritus",196,1],
+      ["emigrated",194,1],
+      ["emile",109,1],
+      ["eminent",116,3,62,1,15,1],
+      ["eminently",41,1,52,1],
+      ["emission",17,1,48,2,3,1,61,2,4,1,1,1,61,2],
+      ["emit",65,4,3,1,96,1,10,1],
+      ["emitted",69,1,33,1,27,4,45,1,25,1],
+      ["emitting",164,1],
+      ["emma",185,1],
+      ["emory",14,1,162,1],
+      ["emotion",17,5,1,1,8,1,31,1,1,1,2,23,11,4,3,2,4,4,4,2,18,1,6,1,8,2,32,1,2,3,2,4,5,2,1,1,19,4,23,1,6,1,4,2],
+      ["emotional",26,1,10,2,18,2,6,1,3,2,8,3,7,2,4,2,4,2,6,2,8,3,4,2,2,3,8,2,6,2,22,1,8,2,5,7,12,1,7,1,12,1,20,1,2,2,4,1],
+      ["emotionality",100,1],
+      ["emotionally",82,1,3,1,21,2,61,1,45,1,13,1],
+      ["emotionless",11,1],
+      ["empathetic",11,1],
+      ["empathy",41,1,33,1,32,6],
+      ["emperor",0,4,23,1,8,1,33,1,13,6,10,1,1,1,19,1,5,1,17,1,40,2,25,1,25,1],
+      ["emphasis",2,1,4,1,5,5,9,1,8,1,8,1,73,1,58,1,3,2,2,1,40,1],
+      ["emphasise",11,2,38,1,5,3,32,2,5,1,31,1,25,1,3,1],
+      ["emphasised",73,1,78,1,16,1,45,1],
+      ["emphasising",10,1,76,1,84,1],
+      ["emphasize",74,1,24,1],
+      ["emphasized",56,3],
+      ["empire",39,1,12,1,16,1,10,1,2,1,8,2,12,1,9,1,21,3,40,1,50,1],
+      ["empirical",75,1,53,3],
+      ["empiricist",128,1],
+      ["employ",37,1,31,1,94,1],
+      ["employed",5,1,18,1,3,2,5,2,2,1,3,1,31,1,12,1,8,1,33,1,36,1,12,2],
+      ["employee",6,1,2,3,7,1,5,1,43,7,10,2,24,1,7,1,18,3,4,2],
+      ["employer",6,1,9,1,34,1],
+      ["employing",117,1,1,1,65,1],
+      ["employment",51,1,143,1],
+      ["empty",35,1,47,1,52,1,26,1,40,1],
+      ["emptying",132,1],
+      ["emulate",167,2,45,2],
+      ["emulation",153,1,61,1],
+      ["en",48,1,73,1],
+      ["enable",7,1,3,1,47,1,2,1,1,1,2,1,7,1,23,1,29,1,33,1,12,1,17,1,2,1,21,1,2,1],
+      ["enabled",7,1,37,1,6,1,30,1,13,1,32,1,16,1,32,1,6,1,1,1],
+      ["enabling",14,1,55,2,61,1,29,2,67,1],
+      ["encased",218,1],
+      ["encasement",218,1],
+      ["enclosed",118,1,99,1],
+      ["enclosing",21,1,151,1],
+      ["enclosure",10,1],
+      ["encoding",176,1],
+      ["encompass",47,1],
+      ["encompasse",140,1],
+      ["encompassed",111,1],
+      ["encounter",0,1,7,1,4,1,15,1,15,1,22,2,2,1,6,2,7,2,11,1,85,1,31,1,1,1],
+      ["encountered",21,1,78,1,59,1,52,1],
+      ["encountering",13,1],
+      ["encourage",7,1,4,1,1,1,21,1,2,1,37,1,18,1,2,1,6,1,1,2,36,1,10,1,21,1,37,1,8,1,3,1],
+      ["encouraged",8,2,3,2,30,1,35,1,9,1,3,1,11,1,12,1,6,1,66,1,11,2,17,1],
+      ["encouragement",72,1,149,1],
+      ["encouraging",55,1,93,1,27,5],
+      ["encroach",69,1,19,1],
+      ["encryption",190,1],
+      ["encyclopaedia",111,4,71,1,31,1],
+      ["end",1,3,2,2,2,2,12,1,2,1,6,3,1,1,6,1,1,1,3,1,2,1,1,2,6,3,1,2,3,1,3,2,3,1,7,1,3,1,1,1,7,1,11,1,3,1,1,4,1,1,2,1,3,1,2,1,7,1,1,1,1,1,3,1,3,1,2,1,3,1,1,1,2,1,3,1,9,4,3,2,3,2,1,1,6,2,2,3,4,1,3,2,3,1,6,2,1,1,3,2,2,1,3,1,4,1,4,1,5,4,10,3,3,1,3,1,2,1,2,1,2,1,1,1,6,1,6,3,4,1],
+      ["endangered",10,1,6,1,16,2,63,2,46,1,3,2,13,1,59,1,7,1],
+      ["endeared",135,1],
+      ["endearing",109,2],
+      ["endeavour",6,1,131,1,3,1,10,1,12,1],
+      ["ended",12,1,31,1,48,1,17,1,26,1,25,1,11,1],
+      ["ending",154,4],
+      ["endless",18,1,109,1,34,1],
+      ["endopleura",179,1],
+      ["endorphin",72,3],
+      ["endorsement",33,1],
+      ["endow",198,1],
+      ["endowed",2,1,20,1,61,1,11,1,55,1],
+      ["endurance",149,1,62,1],
+      ["endure",48,1,113,1],
+      ["endured",129,1],
+      ["enduring",35,1,20,1,46,1,28,1,16,1,12,1,31,2,15,1,22,1],
+      ["enemy",68,1,9,1,47,1,30,1,35,2,35,1],
+      ["energetic",163,1],
+      ["energetically",127,1,80,1],
+      ["energise",156,1],
+      ["energized",18,1],
+      ["energizing",63,1],
+      ["energy",5,6,23,1,15,1,9,2,7,3,2,4,11,3,21,1,3,1,3,1,13,1,9,1,1,2,10,7,2,2,9,1,8,1,6,1,7,6,4,1,2,2,3,3,12,1,10,8,5,8,7,1,19,2],
+      ["enforce",147,1,16,1],
+      ["enforced",124,1],
+      ["enforcement",175,1],
+      ["engage",15,2,19,1,7,1,33,1,77,1,1,1,4,1,14,2],
+      ["engaged",20,1,24,1,36,1,25,1,69,1,30,1,16,1],
+      ["engagement",149,1,21,2],
+      ["engaging",37,2,114,1,64,1],
+      ["engel",128,2],
+      ["engine",23,1,90,1,19,2,9,1,23,1,36,1,6,1],
+      ["engineer",5,1,18,1,5,1,7,7,9,1,9,1,56,1,4,2,16,2,7,1,6,8,17,1,3,1,11,1],
+      ["engineered",35,1,82,1,3,1,64,1],
+      ["engineering",5,1,23,2,45,1,7,1,26,3,23,1,5,1,8,1,31,1,22,1,14,1],
+      ["england",0,2,4,4,25,4,32,1,28,1,7,1,3,4,6,2,1,1,1,1,4,1,25,2,33,1,25,9,3,1,14,6,6,3,1,4,6,1],
+      ["english",3,1,20,1,6,1,25,7,10,1,2,1,1,1,28,1,4,4,6,1,40,1,4,1,4,1,4,1,5,5,9,4,12,1,3,1,4,1,4,4,9,1,2,1,1,1,1,5,4,2,7,2],
+      ["englishman",61,1,55,1],
+      ["englishmen",61,1],
+      ["engraving",136,1],
+      ["engulfing",165,1],
+      ["enhance",6,1,11,1,48,1,35,1,4,1,37,1,11,1,24,1,22,1,23,1],
+      ["enhanced",98,1,2,1,106,1],
+      ["enhancing",0,1,224,1],
+      ["enjoy",0,1,7,1,1,1,1,1,50,1,25,3,1,1,2,1,44,1,15,1,15,2,21,1,33,1,3,1],
+      ["enjoyable",11,1,15,1,32,1,13,1,87,2],
+      ["enjoyed",21,1,66,1,18,1,79,1],
+      ["enjoying",146,1],
+      ["enjoyment",32,1,129,1],
+      ["enlarge",22,1],
+      ["enlarged",41,1],
+      ["enlightened",143,1],
+      ["enlightenment",152,1],
+      ["enliven",122,1],
+      ["enormous",19,1,13,1,32,1,2,1,7,1,29,1,10,1,36,1,3,1,3,1,10,12,14,1,2,1,7,1,9,1,3,1,19,1,4,1,2,1],
+      ["enormously",31,1,114,1,58,1],
+      ["enough",4,1,1,1,1,1,3,1,15,1,3,1,7,1,5,1,10,2,6,1,4,6,1,1,2,1,6,1,2,1,1,1,1,1,1,1,3,1,4,1,7,1,1,2,1,1,5,3,8,1,3,1,1,1,2,1,5,3,4,1,2,1,4,2,3,1,1,1,1,1,1,1,9,1,4,2,7,1,1,1,8,2,2,3,3,1,1,9,1,1,8,1,2,1,19,1,5,1,3,1,5,1,9,2],
+      ["enquiry",86,1],
+      ["enraging",225,1],
+      ["enrich",11,1,122,1,13,1],
+      ["enriching",198,1],
+      ["enrol",105,1],
+      ["enrolled",92,1,44,1],
+      ["enrolment",122,1],
+      ["ens",165,2],
+      ["ensemble",11,1],
+      ["ensuing",69,1,69,1,64,1],
+      ["ensure",8,1,11,1,13,1,10,1,2,1,10,1,11,1,5,1,4,1,12,1,11,1,6,1,15,5,2,1,8,1,3,1,22,2,10,3,12,1,12,1,8,1,29,2],
+      ["ensured",128,1],
+      ["ensuring",32,1,57,1,2,1,29,1,31,1,2,1,10,1,10,1],
+      ["entangled",116,1],
+      ["enter",4,1,27,1,18,1,10,1,4,1,7,1,4,1,5,1,56,1,50,1,11,1,30,1],
+      ["entered",42,1,42,1,23,2,50,1,9,1,5,1,48,2],
+      ["entering",5,1,6,1,69,1,71,1,2,1,3,1],
+      ["enterprise",13,3,7,1,12,1,81,1,27,5],
+      ["entertain",146,2],
+      ["entertained",18,1],
+      ["entertainer",113,1,44,1],
+      ["entertaining",189,1],
+      ["entertainment",114,1,56,1],
+      ["enthusiasm",41,2,25,2,22,2,39,1],
+      ["enthusiast",22,1],
+      ["enthusiastic",22,1,50,2,147,1,2,1],
+      ["enthusiastically",172,1],
+      ["entice",34,1,31,1],
+      ["entire",26,1,4,1,15,1,15,1,10,1,6,1,40,1,4,1,8,1,3,1,2,1,8,2,7,2,1,1,14,1,1,1,1,1,15,1,2,1,43,1],
+      ["entirely",9,4,21,1,9,1,6,1,41,1,2,1,11,1,13,1,1,1,9,1,38,1,4,1,3,1,12,1,33,1],
+      ["entitle",62,1],
+      ["entitled",90,1,9,1,32,1],
+      ["entomologist",89,1,70,1,34,2],
+      ["entomopter",159,1],
+      ["entrance",23,1,21,1,79,1,36,1,10,1,1,2],
+      ["entrenched",18,1],
+      ["entrepreneur",31,1],
+      ["entrepreneurial",170,1],
+      ["entropy",190,1],
+      ["entrusted",13,2,143,1],
+      ["entry",34,1,10,3,67,5],
+      ["envelop",139,1],
+      ["envelope",67,1,40,1],
+      ["enveloped",64,1],
+      ["environment",13,1,1,4,2,1,6,1,11,2,2,1,5,1,3,1,6,1,1,2,2,1,2,1,7,1,2,1,11,1,15,1,1,1,1,1,1,1,9,1,1,11,10,2,3,1,2,1,3,8,2,1,2,1,2,1,1,2,2,5,5,6,1,6,3,1,11,1,1,2,1,1,4,1,9,2,3,3,6,4,4,2,2,2,2,1,1,1,4,1,1,1,6,3,2,4,3,1,1,11,3,1,5,1,2,2,3,3,8,1,4,1,2,1],
+      ["environmental",2,1,3,1,3,1,25,4,10,1,4,1,12,1,21,1,16,1,6,5,8,1,10,2,9,1,4,1,1,2,5,1,2,1,18,1,20,1,20,5,2,1,3,1,5,1,15,2],
+      ["environmentalism",32,1],
+      ["environmentalist",33,1],
+      ["environmentally",33,1,69,2,20,3,18,1,33,1,26,2],
+      ["envisioned",182,1],
+      ["enzyme",59,3],
+      ["ephemeral",210,1],
+      ["epic",57,1],
+      ["epidemic",65,1,36,2,36,6,83,1],
+      ["epidermi",224,1],
+      ["epigram",87,1],
+      ["epilepsy",108,1],
+      ["episode",185,1],
+      ["epistemology",160,2],
+      ["epitome",151,1],
+      ["epley",85,1,13,2],
+      ["epoch",75,1],
+      ["equal",1,1,5,1,6,1,34,1,1,1,9,1,7,1,15,1,23,1,10,1,8,1,3,2,14,1,44,1,4,3,13,1,19,1],
+      ["equalled",194,1],
+      ["equally",3,2,12,1,4,1,40,1,26,1,19,1,16,1,1,1,5,1,20,1,21,1,16,1,29,1],
+      ["equation",167,1,45,1],
+      ["equator",23,1,22,1,19,1],
+      ["equidistant",116,1],
+      ["equilibrium",63,1,78,1,15,1],
+      ["equipment",7,1,10,1,11,2,31,1,2,1,7,1,23,1,6,3,26,1,18,1,18,1,7,1,25,3,3,1],
+      ["equipped",11,1,2,1,65,1,12,1,7,1,23,1,1,1,1,1,79,1,16,2],
+      ["equity",128,1],
+      ["equivalence",86,5],
+      ["equivalent",9,1,38,1,5,1,9,1,5,1,6,1,13,1,1,1,69,1,1,1,13,1,19,1],
+      ["era",9,1,2,1,18,1,37,1,22,1,11,1,27,1,40,2,22,1],
+      ["eradicate",110,1,27,1],
+      ["eradicated",223,1],
+      ["eradication",137,1,50,1],
+      ["erased",35,1],
+      ["eraser",23,1],
+      ["erebus",149,1],
+      ["erect",10,1],
+      ["erected",64,1,87,1,18,2],
+      ["erectus",115,2],
+      ["eric",17,1,136,1],
+      ["ericsson",2,1,4,1],
+      ["erik",27,1],
+      ["ernst",72,1,58,1,51,1],
+      ["eroded",25,1],
+      ["erosion",21,1,12,1,57,1,6,1,6,1,22,2,9,1,63,1,3,1],
+      ["err",161,1],
+      ["erratically",127,1],
+      ["error",2,1,4,1,22,1,25,1,40,1,1,1,18,1,19,1,29,1,33,1],
+      ["erupt",69,1],
+      ["eruption",25,1,62,1],
+      ["es150",46,1],
+      ["escalating",133,1],
+      ["escalator",44,1,19,1],
+      ["escape",52,1,7,1,65,1,11,1,35,1,53,1],
+      ["escaped",137,1,7,1,48,1],
+      ["escapist",171,1],
+      ["eschewed",109,1],
+      ["escorted",92,1,78,1],
+      ["escovopsis",139,10],
+      ["esoteric",190,1],
+      ["especially",13,1,13,1,15,1,1,1,6,1,1,1,3,2,19,3,6,1,1,2,8,2,8,1,8,5,2,1,2,1,2,1,1,1,2,1,6,1,2,1,1,1,1,1,3,2,1,1,5,1,21,1,3,3,2,3,4,1,1,1,6,1,11,1,1,1,7,1,9,1,4,5,1,1,4,1,2,1,6,1,7,3],
+      ["espousal",182,1],
+      ["essay",111,2],
+      ["essence",50,1,75,1],
+      ["essential",1,1,2,1,10,1,4,1,7,1,23,1,8,1,2,1,1,1,33,1,3,2,10,2,18,3,9,1,15,1,1,1,3,1,2,1,2,3,1,3,8,1,4,1,8,1,8,1,2,2,22,1,2,1,3,1],
+      ["essentially",17,1,17,1,12,1,52,1,7,1,3,2,13,1,2,1,4,1,35,1,13,1,39,1,4,1,8,1],
+      ["essex",116,1],
+      ["establish",13,1,15,1,8,1,5,1,7,1,55,1,1,1,43,1,27,1,13,1,5,1,6,1,2,2],
+      ["establishe",56,1],
+      ["established",28,1,3,1,3,1,7,1,20,1,5,1,3,1,8,2,4,1,3,1,4,4,9,1,13,1,7,1,6,1,10,1,8,1,2,1,4,1,8,1,14,1,9,2,8,1,1,2,4,2],
+      ["establishing",104,1,8,1,24,1,14,1,3,1,25,1,1,1,9,1],
+      ["establishment",16,1,25,1,64,1],
+      ["estaci",143,1],
+      ["estate",26,1,45,1,70,1,31,1],
+      ["esteem",41,1,1,1,5,1,178,1],
+      ["esther",22,1],
+      ["estimate",42,6,2,2,31,2,16,1,23,1,28,1,14,1,10,1,44,2,9,1,1,1],
+      ["estimated",43,1,53,1,6,1,5,1,3,1,27,1,19,1,16,2,21,1,3,2,3,1],
+      ["estrada",143,3],
+      ["estuary",66,1,75,1],
+      ["et",3,1,216,1],
+      ["etc",95,1],
+      ["eternal",104,1],
+      ["ethanol",19,1,14,1],
+      ["ethic",11,3,1,1],
+      ["ethical",11,1,148,1,16,1],
+      ["ethiopia",115,1],
+      ["ethnic",49,1,46,1,127,1],
+      ["ethnobotanist",179,1],
+      ["ethnographic",82,1,4,1],
+      ["ethnologist",183,1],
+      ["ethnomusicologist",208,1],
+      ["ethology",3,1],
+      ["ethyl",71,1],
+      ["ethylene",19,2],
+      ["etienne",197,1],
+      ["etosha",154,1],
+      ["eu",134,1],
+      ["eucalypt",224,1],
+      ["eugene",128,1],
+      ["euphrate",77,1],
+      ["eurasia",10,1,91,2],
+      ["euro",31,1],
+      ["europe",0,4,2,1,2,1,5,2,1,2,6,1,5,3,6,7,2,1,6,3,1,1,2,6,1,4,1,1,1,1,3,1,2,3,18,1,1,1,12,1,9,1,1,3,1,3,8,1,3,2,2,2,6,6,4,1,10,2,13,3,2,1,4,1,1,1,6,1,10,3,1,1,14,1,14,2,2,1,6,1,1,1,6,1,12,1,5,2,4,1,1,1],
+      ["european",0,1,1,7,9,1,6,5,5,2,2,9,4,1,11,1,8,1,3,2,16,1,12,1,9,1,2,1,2,2,11,1,2,1,1,1,3,1,3,1,1,1,6,1,1,1,3,1,4,1,5,1,4,1,1,1,3,2,6,1,5,1,2,1,7,1,4,1,7,1,18,3,3,1,2,5,10,2,3,1,5,1,7,1,1,1,5,3],
+      ["eustachian",3,1],
+      ["eutrophication",48,2],
+      ["evacuated",35,1],
+      ["evade",135,1],
+      ["evaluate",6,2,2,1,52,1,23,1,73,1,6,1,4,1],
+      ["evaluated",221,1],
+      ["evaluation",177,1,1,1,14,1],
+      ["evaluative",206,1],
+      ["evaporate",65,2],
+      ["evaporation",79,5,94,1],
+      ["evaporative",5,1],
+      ["evaporator",79,1],
+      ["even",0,1,1,1,1,1,3,1,1,4,3,2,1,1,3,1,1,2,1,1,2,3,1,2,1,1,2,1,1,1,3,1,1,2,2,1,3,1,1,1,2,1,1,1,4,1,1,2,1,3,1,1,1,1,2,1,2,6,1,1,1,3,2,1,2,1,1,4,2,3,1,2,1,3,1,2,1,1,2,1,1,1,2,1,1,4,2,1,3,2,1,2,2,4,1,1,1,3,1,3,1,2,1,2,1,1,1,1,1,1,1,1,2,1,1,1,1,2,1,1,1,1,1,3,1,2,1,2,1,3,1,1,1,3,2,1,1,1,1,4,1,3,1,1,1,3,1,1,1,2,1,2,1,1,1,1,3,1,1,1,2,2,2,1,1,2,3,2,2,1,1,2,3,1,1,3,4,4,1,2,3,2,1,1,2,1,1,1,2,1,1,2,1,1,1,1,1,1,1,4,1,4,2,1,1,2,2,2,2,1,1,2,1,1,2,2,1,2,1,1,1,2,1,2,1,2,1,1,1,1,1,4,1,1,1,3,3,2,1,3,1,1,1,1,2,3,1,2,1,1,5,1,1,2,1,1,1,1,1,2,1,1,2,2,1,2,1,1,1,2,4,2,1,2,2,3,1,5,1,2,1,1,1,4,3,3,1,2,1,3,1,4,1,2,1,1,1,3,3,1,1,2,1,1,3,1,1,1,1,4,1,2,2,4,1,1],
+      ["evening",16,1,4,1,19,1,107,1,54,1],
+      ["evenness",108,1],
+      ["event",17,1,5,1,4,2,4,1,7,2,4,2,23,1,2,1,15,1,36,1,25,2,9,1,1,1,4,3,25,1,3,2,5,1,4,1,3,5,14,1,4,1],
+      ["eventual",74,1,136,1,12,1],
+      ["eventually",0,1,1,2,1,1,2,1,34,1,7,1,11,1,5,1,3,1,3,3,3,1,5,4,2,3,3,1,17,1,8,3,3,1,1,1,1,1,3,1,3,1,9,1,1,1,6,1,11,1,6,1,15,2,1,1,18,1,1,4,3,1,13,1,17,1,4,1,2,1],
+      ["ever",1,1,7,2,5,1,1,1,3,1,1,1,6,1,11,1,6,1,1,1,3,1,3,1,4,1,6,1,9,1,11,1,3,1,6,1,3,1,6,1,3,1,1,1,4,2,3,1,5,1,1,1,1,1,1,2,8,2,3,1,2,1,3,3,2,1,4,1,13,1,2,1,2,1,3,1,4,1,1,1,2,1,3,1,1,1,5,2,2,2,7,1,3,1,7,1,2,1,12,2,6,1,13,1],
+      ["everett",183,10],
+      ["evermore",102,1,97,1],
+      ["every",0,1,6,1,1,2,5,2,3,5,5,1,4,1,2,1,4,1,1,1,2,1,4,1,5,1,6,1,1,2,1,1,3,1,4,1,6,1,2,1,2,1,9,1,6,1,3,2,6,1,3,2,1,1,1,1,1,2,1,2,4,1,2,2,1,1,7,2,2,1,4,1,1,1,3,2,1,1,3,2,5,5,1,1,2,2,3,2,3,1,2,1,1,2,8,1,6,1,1,1,2,1,2,1,1,1,2,1,1,1,11,1,1,1,1,1,4,2,6,1,2,1,4,3,3,1,1,1,5,2,10,1,1,1,2,4],
+      ["everybody",25,1,112,1,13,1],
+      ["everyday",0,1,19,1,1,1,6,1,15,3,17,2,9,1,4,1,16,2,4,1,9,1,7,1,33,1,27,1,3,1,2,1,25,1,1,1,14,1,14,1],
+      ["everyone",8,1,3,2,1,5,21,1,9,1,13,1,3,1,4,1,11,1,2,1,1,1,9,1,6,1,6,1,5,2,16,1,13,2,2,1,23,1,34,1,9,2,6,1,1,2,2,1,1,2,6,1],
+      ["everything",5,1,11,1,16,1,13,1,2,1,13,1,13,1,2,1,10,1,11,1,8,1,7,6,49,1,19,1,9,1,1,1,2,2],
+      ["everywhere",21,1,12,1,43,1,14,1,38,2,28,1,11,1,38,1,4,1,3,1],
+      ["evidence",2,1,4,2,5,1,3,1,2,5,1,2,4,5,1,1,1,1,2,1,2,2,12,4,1,12,1,1,2,2,4,3,3,7,1,1,7,2,2,1,8,1,7,1,1,3,1,1,6,1,4,1,3,3,10,1,2,5,4,1,2,1,2,1,1,1,4,2,6,2,1,1,1,1,5,1,3,1,8,1,5,1,3,2,2,1,3,1,1,2,11,1,3,2,5,2,2,1,2,1,1,3,1,4,7,2,2,2,3,1,2,3,1,1,3,4,3,5,8,2,1,2,1,3,1,3,1,2,1,2,4,1,6,1,4,1],
+      ["evident",2,1,6,1,3,1,12,1,100,1,25,1,57,1,3,1,3,1,9,1],
+      ["evidently",21,1,118,1,69,1,12,4],
+      ["evil",59,1,50,1,48,2],
+      ["evoke",71,1,7,1,128,1],
+      ["evoked",174,1],
+      ["evoker",71,1,7,1],
+      ["evolution",1,1,21,4,23,3,7,1,7,1,1,1,7,1,16,2,11,1,12,1,9,1,5,1,7,1,7,1,5,2,11,1,5,2,3,1,6,1,21,2,1,1,19,1,3,4,14,4],
+      ["evolutionarily",120,1,101,1],
+      ["evolutionary",27,1,25,1,7,1,19,1,14,1,3,1,5,1,15,1,6,1,18,2,11,18,5,3,12,3,18,1,19,1,4,1,4,3,9,1,1,2],
+      ["evolve",9,1,4,1,9,1,100,1,28,1,1,1,14,1,2,1,45,1],
+      ["evolved",9,1,5,2,3,1,29,1,1,1,13,2,5,1,2,1,22,2,1,1,25,1,5,1,1,3,6,2,28,3,3,2,9,1,5,2,1,1,4,2,8,2,23,1,4,1,7,1,4,1],
+      ["evolving",21,1,12,1,34,1,55,2],
+      ["ewing",180,1],
+      ["exacerbating",153,1],
+      ["exact",25,1,5,1,45,1,11,1,3,1,8,1,7,1,19,2,45,1,39,4,19,2],
+      ["exactly",4,1,3,1,27,1,2,1,1,1,8,1,6,1,5,1,6,1,1,1,2,1,3,1,4,2,1,2,25,2,20,1,23,1,5,1,8,1,14,1,7,1,8,1,1,1,11,1,6,1,6,2,6,1,13,1],
+      ["exactness",148,1],
+      ["exaggerate",175,1],
+      ["exaggerated",25,1,143,1,10,1],
+      ["exaggerating",207,1],
+      ["exaggeration",149,1],
+      ["exam",49,2,45,1],
+      ["examination",49,6,43,1,56,4,4,1,6,1,10,1,10,1,31,1],
+      ["examine",15,1,28,1,2,1,9,1,6,1,15,1,7,1,3,1,54,1,23,1,19,1,5,1,3,1],
+      ["examined",36,1,9,1,12,1,33,1,23,1,47,1,14,1,18,2],
+      ["examining",7,1,23,1,24,1,37,1,22,1,10,1,16,1,13,2,49,1,7,1],
+      ["example",2,1,1,3,2,1,2,1,1,1,3,2,2,3,1,1,1,6,1,3,4,2,1,2,2,14,1,1,1,8,1,4,2,1,1,1,3,4,1,1,1,1,1,1,1,1,1,2,1,1,1,2,3,1,2,2,1,2,1,3,3,1,2,1,2,5,1,4,2,2,1,2,1,2,2,2,4,2,1,4,2,5,1,3,3,1,1,1,1,3,2,2,3,2,4,1,2,1,1,2,1,4,1,2,3,1,3,3,1,1,1,1,3,1,1,1,1,2,1,3,1,7,2,1,2,4,4,1,4,2,6,4,2,2,2,1,2,1,1,5,3,3,3,1,1,3,1,3,4,2,1,1,1,4,4,1,1,10,1,1,1,1,4,2,4,1,2,1,3,2,2,3,1,1,2,1,1,2,2,1,1,1,1,3,4,6,3,3,1,1,1,1,1,1,2,1,3,1,1,2,1,2,1,1,1,2,1,1,2,2,2,2,4,7,1,1,1,1,2,1,2,1,1,1,1,5,4,3,1,2,2,1,1,1,1,1,4,1,1,1,1,2,2,4,1,1,1,3],
+      ["excavate",31,1],
+      ["excavated",50,1,17,1,102,2,41,1],
+      ["excavating",27,1,23,1],
+      ["excavation",31,1,9,1,10,5,37,1,82,1],
+      ["excavator",21,1],
+      ["exceed",69,1,51,1,1,1,12,1,33,1,13,1],
+      ["exceeded",113,1],
+      ["exceeding",24,1,202,1],
+      ["excel",49,1,156,1],
+      ["excelled",111,1,114,1],
+      ["excellence",49,1,114,1],
+      ["excellent",3,1,8,1,5,1,51,1,32,1,14,1,4,1,5,1,40,1,18,1,15,1,21,1],
+      ["except",68,1,13,4,44,1,37,1,15,1],
+      ["exception",45,1,23,1,33,1,22,1,30,1,42,1,13,1],
+      ["exceptional",2,1,4,2,22,1,13,1,177,1],
+      ["exceptionally",21,1,50,1,22,1,36,1,12,1],
+      ["excess",79,1],
+      ["excessive",82,1,31,1,11,1,18,1,28,1,4,1],
+      ["excessively",8,1,193,1],
+      ["exchange",47,2,3,1,17,1,15,1,3,7,9,1,10,2,13,1,11,2,19,1,9,1,65,2],
+      ["exchanging",47,1,57,3],
+      ["excise",88,1],
+      ["excite",63,1],
+      ["excited",9,2,41,1,123,1],
+      ["excitement",0,1,9,1,14,1,32,1,8,2,24,1,74,1],
+      ["exciting",11,1,44,1,36,1,36,1,15,1,17,1,2,2,27,3,21,1],
+      ["exclamation",149,1],
+      ["exclude",41,1],
+      ["excluded",49,1,129,1],
+      ["exclusion",11,1,128,1],
+      ["exclusive",47,1,109,1,51,1],
+      ["exclusively",10,1,4,1,40,1,19,1,4,1,10,1,21,1,19,1,14,1,21,1,44,1],
+      ["excreted",113,1],
+      ["excursion",26,1],
+      ["excuse",112,1],
+      ["execute",56,3],
+      ["executed",169,1],
+      ["executing",34,1,108,1],
+      ["execution",171,1],
+      ["executive",20,4,14,1,48,4,20,1,2,2,10,1,36,1,16,2,15,1,18,1,10,1],
+      ["exemplary",11,1],
+      ["exempt",178,1],
+      ["exercise",12,1,86,1,29,1,43,1,15,1,4,1,31,1],
+      ["exercising",157,1],
+      ["exert",106,1],
+      ["exerting",200,1],
+      ["exertion",132,1],
+      ["exhalation",3,4],
+      ["exhaust",222,1],
+      ["exhausted",90,1,23,1,104,1],
+      ["exhausting",55,1],
+      ["exhaustion",220,1],
+      ["exhaustive",179,1],
+      ["exhibit",98,1,56,1,31,1,12,1,8,1],
+      ["exhibited",130,1],
+      ["exhibition",11,1,12,1,11,1,19,1,2,14,81,4,5,1,10,1,19,6,35,14],
+      ["exist",2,1,23,8,1,1,5,1,7,1,16,1,8,1,6,1,7,1,23,1,11,1,35,1,1,1,1,3,3,1,18,1,3,1,7,1,26,1,1,1,2,1,3,1,2,1,1,1,5,1,3,1],
+      ["existed",8,1,14,1,23,1,1,1,31,1,67,1,5,1,5,2,15,1,49,2],
+      ["existence",2,1,4,1,28,1,11,1,5,1,1,1,13,1,8,1,12,1,3,1,4,6,9,1,9,1,37,1,8,2,23,1,7,2,1,2,5,1,25,1,8,2],
+      ["existent",141,1],
+      ["existing",21,1,13,1,6,1,10,1,6,1,12,1,5,1,11,2,16,1,20,3,8,1,25,2,8,1,25,1,21,1,3,1,16,3],
+      ["exit",170,1],
+      ["exotic",0,1,38,1,21,1,14,1,26,1,24,2,12,2,1,1,5,1,52,1],
+      ["expand",48,1,72,1,12,1,9,1,1,1],
+      ["expanded",9,3,10,1,15,3,1,1,24,1,21,1,37,1,7,1,4,1,42,2,24,2,29,1],
+      ["expanding",36,1,65,1,14,1,7,1,6,1],
+      ["expanse",40,1,90,1,40,1,25,1],
+      ["expansion",84,1,12,1,3,1,89,1,6,2,28,1],
+      ["expatriate",76,1],
+      ["expect",26,2,33,1,10,1,6,1,7,1,3,1,8,1,12,1,13,1,10,1,4,1,22,1,7,1,1,1,26,1],
+      ["expectancy",137,1],
+      ["expectation",20,2,8,1,27,1,31,1,76,1,4,1,27,1,26,1,7,1],
+      ["expected",31,1,2,1,28,1,7,1,17,1,1,1,27,1,18,1,2,1,1,1,19,1,1,2,27,1,2,1,7,1,3,1,7,1,1,1,3,2],
+      ["expedition",91,9,32,3,21,1,5,4,43,2],
+      ["expel",173,1],
+      ["expended",61,2],
+      ["expending",52,1,148,1],
+      ["expenditure",55,1,113,1],
+      ["expense",48,1,11,1,14,1,13,1,36,1,19,1,1,1,65,1,3,1],
+      ["expensive",0,1,5,1,11,2,4,1,9,1,6,1,7,1,20,2,3,1,8,1,3,2,12,1,8,1,1,1,10,2,1,2,19,1,13,1,16,1,6,1,2,1,27,1,2,1,27,1],
+      ["expensively",156,1,45,1],
+      ["experience",2,2,5,1,1,1,3,3,2,1,1,1,4,1,2,3,6,4,8,3,7,1,8,1,4,1,4,1,5,1,1,2,17,4,5,2,7,2,2,1,29,1,8,1,15,3,4,1,11,2,2,1,4,1,17,1,1,2,4,2,2,2,1,1,8,4,5,1,1,3,6,1,8,1,5,3],
+      ["experienced",60,1,8,1,7,2,17,2,1,2,3,1,8,1,20,1,2,1,6,1,31,1,5,1,13,1,2,1,3,1,8,1,27,1],
+      ["experiencing",37,1,23,1,33,1],
+      ["experiential",63,1],
+      ["experiment",11,1,7,2,4,1,2,1,13,4,8,1,11,5,3,2,1,1,3,2,2,3,20,1,7,2,1,1,1,1,4,1,8,1,1,1,9,3,3,1,2,1,5,2,4,2,7,3,9,1,2,6,5,1,1,2,1,1,5,2,1,1,7,1,6,1,3,1,1,2,2,1,1,1,3,2,1,1,15,4,21,3],
+      ["experimental",7,1,13,1,22,1,30,1,11,1],
+      ["experimentation",116,1,102,1],
+      ["experimented",29,1],
+      ["experimenter",42,1,50,2,92,2],
+      ["experimenting",56,1],
+      ["expert",2,13,12,1,1,5,5,4,26,1,2,1,9,1,9,1,1,1,3,1,5,1,7,5,10,1,2,1,1,1,9,1,15,2,7,1,5,2,2,1,4,5,7,1,1,4,5,1,9,1,2,3,11,1,4,1,2,2,5,1,6,2,1,3,8,1,5,3,10,1],
+      ["expertise",2,3,9,1,5,1,106,1,46,1,20,1,2,1,11,1,12,1],
+      ["expertly",123,1],
+      ["explain",7,1,10,1,5,1,4,1,2,1,6,3,3,1,2,1,3,1,1,1,5,1,12,1,3,1,8,1,4,6,1,1,2,1,3,1,6,2,2,4,2,1,1,2,6,2,2,1,4,1,7,1,3,1,4,1,6,1,7,1,3,1,9,2,2,1,1,1,9,1,1,1,2,1,4,1,3,1,8,2,6,1,4,1,2,1,7,1,4,1,4,1,3,1,4,3,2,1,1,1,6,1,4,1,2,1],
+      ["explained",31,1,9,1,13,1,10,1,56,1,1,1,39,1,18,1],
+      ["explaining",57,1,7,1,86,1],
+      ["explanation",24,2,1,1,2,2,10,1,2,1,2,1,8,1,19,2,7,4,41,1,5,2,6,1,4,1,29,1,2,1,5,3,16,1,9,1,18,2,2,3,9,2],
+      ["explanatory",160,1],
+      ["explicit",12,1,110,1,25,1],
+      ["explicitly",82,1,34,1,72,1],
+      ["exploded",22,1],
+      ["exploding",94,1],
+      ["exploit",9,1,3,1,50,1,57,1,2,1,6,1,1,1,27,1,20,1],
+      ["exploitation",23,8,99,1,57,1],
+      ["exploited",22,1,161,1],
+      ["exploiting",155,1],
+      ["exploration",13,3,56,1,37,1,36,4,7,2,28,5,5,1],
+      ["exploratory",130,2],
+      ["explore",18,1,16,1,14,1,82,1,22,1,2,1,5,1,12,1,14,1,21,1],
+      ["explored",1,1,11,1,1,4,8,1,2,1,13,1,59,1,65,1,20,1],
+      ["explorer",1,4,116,1,32,2,16,1,22,4,5,2,31,1],
+      ["exploring",12,1,1,7,4,1,16,1,65,1,48,1,35,1,25,1],
+      ["explosion",45,1,3,1,76,1,17,1,1,1,38,1],
+      ["explosive",79,1,140,1],
+      ["export",16,2,80,1,21,11,77,6],
+      ["exported",117,1],
+      ["exporter",117,1,77,2],
+      ["exporting",162,1,32,2],
+      ["expose",109,1],
+      ["exposed",18,1,27,1,20,1,9,1,5,1,11,1,2,2,11,1,21,1,1,1,26,1,23,1,36,1,11,1,3,1],
+      ["exposing",18,1,5,1,151,1],
+      ["exposition",111,1],
+      ["exposure",9,3,21,2,8,1,1,1,5,1,11,1,19,2,39,1,1,2,29,1,15,1,46,1],
+      ["express",4,1,7,1,49,1,14,1,2,1,70,1,11,1,14,1,4,1,2,1,27,1],
+      ["expresse",60,1],
+      ["expressed",67,1,4,1,34,1,35,1,38,1,9,1,32,1],
+      ["expressing",26,1,8,1,40,1,9,1,63,3,2,1,28,1,32,1],
+      ["expression",0,1,17,1,37,1,3,1,3,29,5,1,9,1,12,2,60,2,2,1,7,1,15,1,1,1,3,1,1,6,23,1,17,5,4,1],
+      ["expressionism",205,1],
+      ["extant",223,1],
+      ["extend",24,3,17,2,6,1,3,1,72,1,11,1,72,1,20,1],
+      ["extended",26,1,13,2,34,1,2,1,26,1,66,1,7,1,38,1,9,1,2,1],
+      ["extending",186,1,33,1],
+      ["extension",3,1,18,1,3,1,127,3,70,1],
+      ["extensive",8,1,6,1,68,1,2,1,33,1,7,1,24,1,21,1,4,1,21,1],
+      ["extensively",34,1,2,1,103,1,15,2,15,1,17,1],
+      ["extent",4,2,5,1,33,3,26,1,3,2,4,1,6,1,3,1,5,1,5,1,42,1,5,1,14,1,23,1,8,1,11,1,26,1],
+      ["exterior",31,1,13,3,126,1],
+      ["exterminating",187,1],
+      ["extermination",137,1,86,1],
+      ["external",8,1,11,1,9,1,25,2,45,1,12,1,36,1,3,1,2,1,11,2,11,1,48,1],
+      ["extinct",10,1,15,1,2,1,18,1,30,2,28,1,7,2,41,1,36,2,23,2,13,2],
+      ["extinction",27,6,18,2,30,10,20,2,30,1,13,1,6,3,43,3,15,1,8,5],
+      ["extinguished",68,1],
+      ["extol",55,1],
+      ["extra",14,1,6,1,39,3,33,1,10,1,13,1,2,1,11,1,3,1,22,1,31,1,7,2,8,1,23,5],
+      ["extract",16,1,35,1,28,1,40,2,8,1,31,1,63,2],
+      ["extracted",23,1,15,1,41,1,40,1,6,1,54,1],
+      ["extracting",121,1,6,1],
+      ["extraction",23,1,73,1,130,1],
+      ["extraordinarily",119,1],
+      ["extraordinary",3,1,20,1,55,1,13,1,20,1,25,1,1,1,8,1,10,1,6,1,24,1,11,1,1,1,6,1,13,1],
+      ["extrapolated",40,1],
+      ["extravagance",167,1,45,1],
+      ["extreme",10,2,19,1,20,1,42,2,2,1,6,1,42,1,23,1,6,1,2,1,3,1,14,1,15,1,5,1],
+      ["extremely",20,1,36,1,3,1,2,1,1,1,3,2,42,1,12,2,18,4,4,1,28,1,2,1,3,1,3,1,39,2,2,1],
+      ["extremity",40,1,24,3,116,1],
+      ["extrovert",172,1],
+      ["extroverted",85,1],
+      ["eye",3,2,4,3,10,1,3,1,5,1,17,1,3,1,3,1,10,3,9,1,1,6,9,1,5,1,1,2,6,2,4,6,1,3,3,1,1,3,5,4,1,1,2,1,2,1,3,3,7,1,12,1,24,1,5,5,2,1,13,3,6,1,2,1,3,1,3,1,1,1,8,1,1,1,22,3,1,1,5,1],
+      ["eyed",68,1,44,1],
+      ["eyesight",42,1,63,1],
+      ["fable",157,1],
+      ["fabric",19,1,10,1,1,9,8,11,39,2,35,1,7,1,21,9,54,3,6,2],
+      ["fabricated",61,1],
+      ["fabrizio",72,1],
+      ["fabulous",45,1,32,1],
+      ["facade",63,3],
+      ["face",8,1,13,1,4,1,11,2,22,21,2,7,12,1,6,1,13,1,2,2,5,12,2,2,4,2,8,2,1,1,4,1,4,2,1,1,5,1,7,1,10,2,4,1,2,2,1,2,9,1,5,3,10,1,2,1,2,1,12,1,7,1,11,1,7,1,6,1],
+      ["faced",9,1,7,1,5,1,18,1,25,1,18,1,17,1,14,1,30,1,81,1],
+      ["faceted",91,1,57,1],
+      ["facial",3,1,51,1,3,1,1,1,2,23,14,1,74,3,27,2,23,1,17,1],
+      ["facilitate",26,1,144,1,6,1],
+      ["facilitator",170,1,15,1],
+      ["facility",36,1,1,1,50,1,33,1,2,2,11,1,1,2,6,1,51,2],
+      ["facing",21,1,48,1,9,1,4,1,2,1],
+      ["fact",2,1,13,5,1,1,2,4,1,1,2,2,2,1,1,1,2,1,2,1,2,1,7,2,4,3,1,1,1,1,7,1,1,2,1,1,1,1,4,1,1,1,2,1,1,1,1,1,4,1,1,1,3,2,1,1,1,1,3,1,1,1,2,1,2,1,3,1,1,1,1,1,2,1,4,7,2,1,1,2,1,1,2,1,1,1,9,1,1,3,1,1,9,1,3,1,1,1,2,1,2,2,2,1,2,1,1,3,7,1,2,4,2,5,1,1,1,1,1,1,1,3,5,1,1,1,5,1,1,1,1,1,1,1,1,1,3,2,1,1,1,2,1,1,3,1,2,1,3,1,1,1,2,2,1,1,6,1,1,2,2,2,2,1,12,1,1,1,1,1,2,1,1,2,2,1,1,1,2,1,3,1,2,2,3,4,4,1,1,1],
+      ["factor",2,4,12,2,4,1,14,1,2,3,2,2,17,1,5,2,11,1,6,1,3,1,7,1,2,1,8,1,6,4,7,1,2,1,4,1,3,1,7,1,6,1,13,1,2,1,8,1,19,1,6,1,1,1,1,1,24,1,2,1,1,4,7,1,10,1],
+      ["factory",13,1,5,1,5,1,6,1,4,1,5,1,3,2,3,1,18,1,11,4,24,1,15,1,22,1,6,1,6,1,18,3,54,1],
+      ["factual",2,1,34,1],
+      ["facult",99,1],
+      ["faculty",11,2,52,1,59,2],
+      ["fade",29,1,82,1],
+      ["faded",9,1,67,1,21,1],
+      ["fahrenheit",27,1,2,1],
+      ["fail",31,1,18,1,33,4,12,1,18,1,2,2,14,1,2,1,21,1,11,2,1,1,12,1,14,1,11,3],
+      ["failed",4,1,31,1,31,1,29,1,2,1,2,1,10,1,4,1,1,2,8,1,15,4,16,1,10,1,24,1,3,1,7,1,11,1],
+      ["failing",82,1,11,1,12,1,8,1,21,1,15,1],
+      ["failure",4,1,46,1,5,2,27,1,14,1,3,1,14,1,11,2,7,3,6,1,56,1,8,1,6,1],
+      ["faint",68,1],
+      ["fainting",216,1],
+      ["fair",72,1,16,1,60,1,13,2],
+      ["faire",36,1],
+      ["fairground",132,1],
+      ["fairly",46,1,4,1,68,1,26,1,18,1],
+      ["fairy",135,1,22,12],
+      ["faith",72,1,116,1],
+      ["faithful",86,1,62,1,67,1],
+      ["faithfully",116,1],
+      ["fake",1,1,46,1],
+      ["falcon",102,1,97,1],
+      ["fale",118,1],
+      ["fall",17,1,2,1,16,1,8,1,16,2,20,1,5,1,5,1,5,1,8,1,6,1,1,4,15,2,4,1,21,1,8,2,1,1,7,1,6,1,3,1,11,1,13,1,1,1,21,2,3,1],
+      ["fallen",25,1,7,1,107,1,10,1,30,1,11,1,2,1,24,1],
+      ["falling",35,1,4,1,56,1,5,2,31,1,65,1,23,1],
+      ["fallingwater",120,1],
+      ["false",8,1,47,1,4,2,1,1,28,1,72,1],
+      ["fama",128,2],
+      ["fame",9,17,55,1,93,1],
+      ["famed",98,1,21,1,71,1,4,1],
+      ["familiar",18,1,8,2,2,1,2,1,8,1,18,1,2,2,14,1,6,1,1,1,8,1,38,1,5,1,37,2,4,1,17,1,16,1,8,2,13,1],
+      ["familiarity",18,1,8,2,196,1],
+      ["family",2,1,2,4,6,6,4,5,1,1,5,2,2,2,4,1,2,2,1,1,3,1,19,1,3,5,4,2,19,1,13,1,9,2,6,1,6,1,5,1,20,1,3,2,11,1,3,1,2,1,2,1,14,2,8,2,2,1,5,1,6,1,3,1,29,2,1,13],
+      ["famine",96,1,3,1,102,1],
+      ["famous",5,1,4,4,6,1,7,1,10,1,2,1,6,1,2,1,4,1,42,1,1,1,15,1,5,1,12,1,19,1,5,1,1,1,1,1,5,1,8,2,8,1,16,2,2,1,17,1,2,1,10,1],
+      ["famously",157,1],
+      ["fan",5,1,40,1,1,4,11,4,34,1],
+      ["fangblenny",89,14],
+      ["fantail",103,1],
+      ["fantastic",9,1,62,1],
+      ["fantastical",182,1],
+      ["fantasy",157,1,25,1],
+      ["far",0,1,2,1,5,1,3,1,3,3,1,1,4,1,2,1,1,2,3,1,2,1,4,2,3,1,1,1,1,1,5,1,1,2,2,1,4,1,4,1,1,1,5,1,1,1,10,3,1,1,2,1,2,2,2,6,2,1,1,1,4,1,8,1,2,1,1,1,1,1,1,2,1,1,2,1,1,1,3,5,6,1,4,1,3,1,3,1,2,2,1,1,1,1,3,3,5,2,1,1,11,1,3,4,3,1,1,1,2,1,2,1,1,1,2,1,2,1,3,2,3,1,3,1,1,1,1,1,4,1,2,1,4,2,1,3,5,2,1,1,2,2,2,1,1,1,4,1,1,1,1,1,1,1,1,5,4,4,1,2,8,1,1,1,3,1,2,1,1,1,1,1,4,1],
+      ["farce",157,1],
+      ["fare",55,1,97,1,5,1],
+      ["fared",210,1],
+      ["farm",33,5,18,2,18,1,21,1,6,2,9,3,17,1,11,9,6,2,4,1,30,1,19,2,9,1,22,1],
+      ["farmer",22,1,4,1,6,3,1,5,17,3,1,1,18,3,8,1,19,2,3,4,3,1,20,1,16,1,5,2,4,2,32,1,14,5,1,2,5,1,2,7,1,1,15,1,1,1],
+      ["farming",22,1,11,1,14,2,14,1,35,1,6,14,22,1,9,14,10,2,1,2,3,1,25,1,27,14,2,2,17,1,6,1],
+      ["farmland",69,1,55,1,19,1,58,3],
+      ["farther",143,1,40,1,33,1],
+      ["fascinated",40,1,19,1,38,1,1,1,48,2,14,1,20,1],
+      ["fascinating",7,1,2,1,34,1,48,6,41,1,7,4,12,1,3,2,28,1,10,1,12,1],
+      ["fascination",47,1,102,1,11,1,30,1],
+      ["fashion",6,1,25,1,11,1,18,1,26,1,30,1,11,1,13,20,20,1,7,1,4,1,12,1,21,1,3,5,5,1,7,1],
+      ["fashionable",0,1,39,2,16,1,33,1,53,1,66,1,19,1],
+      ["fashioned",91,1,37,1,89,1],
+      ["fast",3,1,7,1,10,3,4,1,8,8,20,2,14,2,4,1,18,1,16,1,10,1,3,1,4,1,14,1,3,1,11,1,10,1,6,1,15,1,8,1,1,1,5,2,8,1,9,1,5,2],
+      ["fastened",132,1],
+      ["fastener",123,1,17,1],
+      ["faster",22,1,11,1,12,1,11,1,1,1,9,3,17,2,7,1,11,1,25,1,6,1,11,1,15,1,2,1,20,1,9,1,28,1],
+      ["fastest",20,1,32,1,124,1],
+      ["fat",7,1,52,1,11,1,32,1,97,1,1,1,22,1],
+      ["fatal",94,1,99,1],
+      ["fatally",151,1,11,1],
+      ["fate",25,1],
+      ["father",0,1,2,2,2,4,10,2,1,1,19,1,20,1,27,1,30,1,5,1,20,1,21,1],
+      ["fatigue",94,1,12,1,94,13],
+      ["fatter",135,1],
+      ["fattovich",123,4],
+      ["fatty",7,1,147,1],
+      ["fault",28,1,41,1,76,1,7,1,30,1,14,1,7,1,12,1],
+      ["fauna",45,2,58,1,41,1,43,1,6,2],
+      ["fausto",137,1],
+      ["favor",38,1,140,2,43,1],
+      ["favorable",52,1],
+      ["favored",221,1],
+      ["favorite",22,2,61,1,133,1],
+      ["favour",1,2,4,1,5,1,19,1,18,1,7,1,15,1,2,1,7,1,6,1,14,1,14,1,2,1,21,4,36,1,16,1],
+      ["favourable",4,1,62,1,35,1,20,1],
+      ["favoured",8,1,13,1,2,1,18,1,35,1,11,1,92,1],
+      ["favouring",135,1],
+      ["favourite",9,3,67,4,9,1,3,1,37,1,2,1,39,1,59,1],
+      ["favouritism",8,2],
+      ["fay",116,1],
+      ["fayol",8,2],
+      ["fbi",175,1],
+      ["fear",11,1,16,1,10,1,4,1,30,2,5,1,2,1,21,1,32,2,20,2,6,1,17,13,1,1,41,1],
+      ["feared",39,1,9,1,123,1,4,5,19,1],
+      ["fearful",174,1,1,1,50,1],
+      ["fearfully",209,1],
+      ["fearsome",91,1],
+      ["feasibility",142,2],
+      ["feasible",142,2,48,1],
+      ["feast",127,1],
+      ["feat",139,1],
+      ["feather",1,3,37,1,65,1,24,1],
+      ["feathered",103,1],
+      ["feature",3,2,7,1,1,1,7,1,3,4,7,1,3,1,3,1,11,1,2,3,1,1,5,2,5,1,3,1,2,1,6,1,1,1,12,1,1,1,3,2,14,3,10,1,4,1,1,1,5,2,1,1,3,1,6,1,15,4,1,1,1,1,20,1,3,1,3,1,2,5,2,1,5,1,1,4,17,1,3,1,5,1,2,2,2,1,2,1,2,1,8,2],
+      ["featured",16,1,66,1,54,2,64,1,5,1,18,1],
+      ["featureless",159,1],
+      ["featuring",109,1],
+      ["february",144,1],
+      ["fed",24,6,27,1,51,1,41,1,56,1,23,1,1,1],
+      ["federal",55,1,35,1,66,1],
+      ["fee",55,1,158,2],
+      ["feeble",22,1],
+      ["feed",7,2,3,1,14,1,28,1,7,1,40,2,3,1,19,1,6,1,6,4,6,2,34,1,26,1,17,1,7,1],
+      ["feedback",3,1,79,1,81,3],
+      ["feeder",143,1],
+      ["feeding",7,1,3,2,2,1,33,1,3,4,4,1,29,1,8,1,21,1,20,2,3,1,21,1,2,1,60,1,8,1],
+      ["feel",3,2,1,1,18,1,4,1,4,2,6,1,3,1,3,3,1,1,10,1,1,1,3,2,3,1,22,1,1,1,2,1,16,1,3,1,2,2,8,1,8,1,4,2,2,1,4,1,14,2,4,1,6,1,5,1,9,1,2,3,3,1,6,1,6,1,28,1,5,1,5,1],
+      ["feeling",4,3,4,1,4,2,5,1,3,2,6,2,8,2,3,2,5,4,15,3,3,3,3,1,19,1,1,1,2,3,16,1,5,1,9,1,16,2,17,3,13,2,6,1,3,1,12,1,24,1,6,1,3,1,4,1],
+      ["feet",27,1,4,1,4,1,65,1,15,1,4,1,20,1,15,2,15,1,47,1],
+      ["feign",219,1],
+      ["fel",27,1],
+      ["fell",0,2,1,1,22,1,6,1,11,1,10,1,46,1,17,1,10,1,14,1,2,1,14,1,43,1,2,1,25,1],
+      ["felled",102,1,97,1],
+      ["fellow",4,2,54,2,11,1,42,2,38,1,2,1,3,1],
+      ["fellowship",28,1],
+      ["felony",92,1],
+      ["felt",12,3,25,1,26,2,15,1,4,1,3,2,11,1,3,1,32,1,8,1,13,1,18,1,5,1,13,1,17,1,10,1,6,1],
+      ["female",10,1,4,4,10,1,25,1,18,1,35,1,1,2,6,2,1,4,5,1,4,1,19,1,5,1,5,3,6,3,38,2,7,1,3,1,14,3],
+      ["femina",188,1],
+      ["fence",118,1,20,4,34,1,30,4,12,1],
+      ["fend",22,1,43,1,50,1],
+      ["fended",200,1],
+      ["fender",34,2],
+      ["fenhann",134,1],
+      ["fennel",221,2],
+      ["fense",112,1],
+      ["feral",138,1,64,1],
+      ["fermentation",61,1],
+      ["fern",25,5],
+      ["fernando",37,4,142,1],
+      ["ferocious",144,1,73,1,5,1],
+      ["ferret",223,31],
+      ["fertile",109,1,24,1,2,1,3,1,17,1,22,1,25,1],
+      ["fertiliser",51,1,45,1,105,5],
+      ["fertilising",143,1],
+      ["fertility",135,1],
+      ["fertilizer",48,3,11,2],
+      ["festival",57,1,154,2],
+      ["fetch",96,1],
+      ["fetched",93,1],
+      ["fetvi",192,2],
+      ["fever",101,1,36,1],
+      ["few",5,1,4,1,5,1,4,2,2,1,3,14,1,1,1,2,4,1,2,1,7,1,1,3,4,1,4,1,6,1,1,1,4,2,5,2,1,1,1,1,1,2,4,1,1,1,2,1,9,1,1,1,5,2,2,4,1,3,1,2,1,1,1,1,2,1,1,1,1,1,1,2,5,1,5,4,1,3,1,2,2,1,3,1,1,1,1,1,2,1,1,1,2,2,8,1,1,1,3,1,2,1,1,1,2,1,7,1,1,1,5,2,4,1,4,1,2,2,1,2,3,1,1,1,1,1,2,1,8,1,1,2,2,1,4,1,1,1,3,1,1,1,2,1,7,1,2,1,5,1,2,1,1,2,2,1,3,2,1,1,4,1,1,1,3,1,2,2],
+      ["fewer",21,1,3,6,3,1,2,1,38,1,4,1,2,1,3,1,2,1,3,1,2,1,18,1,1,1,18,3,9,1,1,1,9,1,8,1,52,1,16,1,10,1],
+      ["fianc",96,1],
+      ["fiber",30,3,8,4,12,2],
+      ["fibre",19,4,58,2,30,3,6,1,6,2,21,5,39,2],
+      ["fibreboard",117,1],
+      ["fibril",177,1],
+      ["fibrous",1,1],
+      ["fiction",4,1,22,1,83,7,55,2,13,1,5,4,6,4,29,1,9,1],
+      ["fictional",82,1,27,1,66,1,31,1],
+      ["fictitious",123,1],
+      ["fidelity",162,1],
+      ["field",6,1,5,1,2,1,17,1,5,1,2,1,4,1,9,2,10,1,2,1,7,1,3,1,8,2,4,1,2,1,1,1,8,2,4,4,3,1,9,1,10,1,3,1,7,1,9,1,2,1,11,1,6,1,1,1,1,1,1,1,6,1,9,3,2,1,5,1,4,1,3,1,2,2,6,1,2,7,3,1,2,1,2,1,2,6,11,1,5,1],
+      ["fierce",87,1,4,1],
+      ["fiercely",105,1,82,1],
+      ["fiery",158,1],
+      ["fifteen",12,1,57,1,15,1,137,1],
+      ["fifteenth",175,1,19,2],
+      ["fifth",35,1,45,1,83,1,4,1,27,1,18,1],
+      ["fifty",0,1,75,3,89,1,5,1,13,1,38,1],
+      ["fig",143,2],
+      ["fight",7,1,26,2,36,1,18,1,50,1,47,1,31,1,1,1],
+      ["fighter",189,1],
+      ["fighting",33,1,77,1,46,1],
+      ["figure",6,1,3,9,11,1,9,1,2,1,2,1,3,1,5,1,2,1,16,1,16,3,26,1,3,1,29,1,7,1,17,1,21,1,3,1,9,1,23,1,2,1,10,1],
+      ["figured",59,1,106,1,35,1],
+      ["figurine",47,1],
+      ["filament",119,3],
+      ["file",100,1],
+      ["fill",35,1,6,1,7,1,16,1,2,1,13,1,52,1,7,1,30,1,34,1],
+      ["filled",50,1,2,1,7,2,4,3,16,2,12,1,1,1,21,1,22,1,15,1,10,1,49,1],
+      ["filling",17,1,156,1,38,1],
+      ["film",9,2,10,2,11,3,56,5,5,1,6,1,17,1,26,1,9,1,22,1,4,2,9,3],
+      ["filmed",30,1,61,1,84,1],
+      ["filmmaker",30,1],
+      ["filmmaking",30,4],
+      ["filter",0,1,62,18,6,3,66,1],
+      ["filtered",79,1],
+      ["filtering",62,1,89,1],
+      ["filtration",62,1,58,1],
+      ["fin",5,2,40,1,7,9,16,1,145,1],
+      ["final",4,1,8,4,1,2,14,1,45,1,3,3,16,1,30,1,16,1,34,2,7,1,6,4,10,1,29,1],
+      ["finally",0,1,6,1,2,1,4,2,28,1,2,1,5,2,1,1,19,1,12,1,11,1,15,1,2,2,2,1,4,2,4,1,1,3,5,1,31,3,8,2,3,1,1,1,2,2,6,1,7,1,17,1,8,1,1,4,16,2],
+      ["finance",128,2],
+      ["financial",15,5,13,2,27,1,54,1,19,9,51,1,21,1],
+      ["financially",15,1,47,1],
+      ["financing",194,1],
+      ["finback",180,1],
+      ["finch",127,1],
+      ["finche",127,1],
+      ["find",7,1,1,1,1,1,3,1,6,1,3,3,3,1,1,1,2,1,4,1,1,2,1,2,4,1,1,1,4,1,3,2,1,1,1,1,8,1,1,5,4,1,3,4,5,2,2,6,3,1,1,1,3,2,5,2,7,1,4,1,5,1,2,1,2,2,1,1,1,1,2,2,1,1,1,1,2,1,1,1,1,1,1,1,2,1,6,2,1,1,1,1,1,1,4,4,1,1,1,3,13,1,3,4,1,1,2,2,3,1,2,1,1,1,2,1,2,1,1,1,8,1,6,1,1,2,2,1,2,1,9,1,1,1,1,2,2,2,3,1,3,1,1,2,5,1,2,1,1,3,8,1,1,1,2,2,4,6,2,1,1,1],
+      ["finding",8,1,9,2,7,4,1,1,11,2,1,4,2,1,1,1,3,3,2,1,2,1,3,2,2,1,4,1,15,1,1,1,3,1,3,2,12,1,1,6,9,4,15,1,1,1,13,1,1,1,9,1,9,3,3,1,2,3,1,3,1,3,5,1,1,1,5,1,2,3,5,2,1,1,2,1,3,1,3,1,1,3,1,1,2,2,1,2,9,2,1,3,7,1,18,1,3,1,1,1],
+      ["findlen",111,1],
+      ["fine",30,1,4,1,15,1,9,1,4,1,62,1,1,1,5,1,33,1,26,1,5,1,11,1,13,1,4,1],
+      ["finely",59,1,12,1,7,1,29,1,14,1],
+      ["fineness",108,1,86,1,23,1],
+      ["finer",62,1,62,1],
+      ["finger",1,1,61,2,95,1,19,1,7,1,36,1],
+      ["fingerprint",145,4,12,1,46,4],
+      ["finish",51,1,19,1,43,1,13,1,55,1,2,1],
+      ["finished",31,1,31,1,2,1,16,1,4,1,33,1,2,1,21,2,42,1,1,1],
+      ["finishing",4,1,122,1,14,1],
+      ["finite",200,1],
+      ["finland",101,1,62,2],
+      ["finn",153,1],
+      ["finnigan",5,8],
+      ["fire",1,1,20,26,22,1,14,1,5,4,5,1,12,1,48,1,13,1,18,1,11,1,10,3],
+      ["fired",29,1,33,1,101,1],
+      ["fireproof",19,1],
+      ["firewood",124,1],
+      ["firework",171,1,11,1],
+      ["firing",29,3,8,1,13,1,12,2,102,1,53,1],
+      ["firm",6,1,5,1,43,1,16,1,16,1,19,1,17,2,16,1,2,1,16,4,5,1,1,2,39,2,1,1],
+      ["firmer",194,1],
+      ["firmly",5,1,9,1,74,1,26,1,73,1,5,1,25,1],
+      ["first",0,6,1,1,1,3,2,6,2,2,1,2,1,2,1,2,3,1,6,1,1,5,1,1,1,1,1,1,1,7,1,1,1,9,1,1,2,4,1,6,5,1,2,3,1,1,1,2,1,8,1,1,2,3,2,4,1,2,1,5,1,2,1,1,1,1,1,1,1,1,5,2,1,1,1,2,1,2,2,2,3,3,2,6,1,4,1,1,1,1,2,3,2,1,1,1,1,1,1,1,1,3,1,3,1,3,1,1,1,5,1,1,1,1,2,1,2,3,1,8,1,2,1,1,1,2,1,2,1,3,1,4,1,1,1,1,1,4,1,1,1,2,1,2,1,3,3,1,1,3,2,4,2,1,2,1,2,2,3,3,2,1,2,1,3,1,1,1,2,1,1,1,1,2,1,1,1,4,2,4,1,1,1,2,2,6,1,2,3,2,1,1,2,3,1,1,3,1,1,5,1,5,2,1,1,2,1,3,1,5,1,1,1,2,1,2,1,3,2,1,2,1,1,1,1,3,1,2,1,1,1,4,1,1,1,6,1,4,1,1,1,1,2,2,1,6,1,2,1,6,1,1,1,1,1,1,2,1,2,7,2,1,1,2,1,4,1,2,1,3,2,3,1,1,1,1,4,2,2,1,1,1,4,2,3,1,2,1,2,4,2,1,1,2,1,2,1,3,1,3,1,1,1,2,1,3,1,4,1,2,2,2,1,1],
+      ["firstborn",225,3],
+      ["firstly",73,1,133,1,1,4],
+      ["fish",1,19,13,1,10,1,24,15,2,2,2,2,9,1,7,27,21,10,2,15,15,1,2,1,13,1,3,1,3,1,14,3,3,1,43,2,26,10,10,1],
+      ["fishbourne",169,15],
+      ["fishe",52,12],
+      ["fisher",82,2,46,3,6,4],
+      ["fishermen",1,2,47,1,2,4],
+      ["fishery",91,1,42,1],
+      ["fishing",1,5,47,1,2,3,11,1,16,2,31,1,33,1],
+      ["fit",8,1,7,1,2,1,11,1,43,1,7,1,4,1,2,1,55,1,23,1,55,1],
+      ["fitness",43,2,4,4,174,1],
+      ["fitted",46,1,27,1,18,1],
+      ["fitter",135,1],
+      ["fitting",116,1,1,1,6,1,59,1,9,1],
+      ["five",10,1,8,1,7,2,9,1,2,1,1,1,8,1,1,1,12,2,1,1,3,1,1,2,4,2,2,1,1,1,18,1,2,1,1,1,10,3,2,1,9,1,5,1,5,3,1,2,12,1,9,1,7,1,2,1,7,1,4,1,11,1,4,1,1,1,2,1,5,1,1,1,6,1,2,1,2,2,3,2],
+      ["fix",55,1,40,1,67,1],
+      ["fixate",18,1],
+      ["fixative",38,1],
+      ["fixed",3,3,3,5,8,2,24,2,19,1,30,1,2,1,5,1,37,1,9,1,19,2,9,1,50,1],
+      ["fixing",125,1],
+      ["fjmt",151,1],
+      ["flagella",52,1],
+      ["flagstaff",177,1],
+      ["flake",40,1],
+      ["flaked",210,1],
+      ["flammability",29,1],
+      ["flander",194,2],
+      ["flap",59,2],
+      ["flapping",159,1],
+      ["flash",89,1],
+      ["flashing",114,1],
+      ["flat",5,1,24,1,17,2,6,1,7,1,10,1,38,1,5,1,8,1,37,1,57,1],
+      ["flattened",64,1],
+      ["flatter",41,1],
+      ["flattered",41,1],
+      ["flattering",207,1],
+      ["flattery",175,1],
+      ["flavor",22,3,10,1,29,2],
+      ["flavorful",22,1],
+      ["flavour",86,1,21,1],
+      ["flaw",23,1,97,1,35,1,35,1,3,1,29,1],
+      ["flawed",6,1,142,1,14,1,46,1],
+      ["flax",1,4,106,1],
+      ["flea",59,1],
+      ["fleck",40,1],
+      ["fled",77,1],
+      ["flee",113,1,8,1,6,1,27,1],
+      ["fleeson",85,1],
+      ["fleet",123,1,26,1,19,2],
+      ["fleeting",175,1,17,1],
+      ["flemish",194,2,21,1],
+      ["flesh",27,1,24,2,8,3],
+      ["flexe",3,1],
+      ["flexibility",54,1,38,1,65,1,6,1,23,1],
+      ["flexible",73,2,21,1,21,1,3,1,8,1,17,4,46,1,16,1],
+      ["flexner",11,2],
+      ["flight",10,1,102,1,9,3,9,4,12,2,17,1,56,1,2,1],
+      ["flinder",198,1],
+      ["flinging",161,1],
+      ["flint",21,1,6,2],
+      ["flip",59,2],
+      ["flipping",165,1],
+      ["flit",175,1],
+      ["float",7,1,116,1,37,1],
+      ["floating",52,1,39,1,34,1,11,1,5,1],
+      ["flock",76,1,26,1,10,1,12,1,70,1,5,1],
+      ["flocked",113,1],
+      ["flood",21,1,14,13,5,1,47,1,25,1,80,3,4,3,13,1,1,2],
+      ["flooded",10,1,49,1,4,1,50,1,105,1],
+      ["flooding",35,3,5,1,47,1],
+      ["floodlight",27,1],
+      ["floodlighting",214,1],
+      ["floodplain",64,1],
+      ["floodwater",35,5],
+      ["floor",5,1,12,1,4,2,4,2,2,3,24,1,40,2,17,1,13,1,18,1,12,5,18,4,26,1,3,1],
+      ["floorboard",195,1],
+      ["flooring",118,1],
+      ["flora",136,1,8,1],
+      ["floral",65,1,90,2],
+      ["florida",2,1,4,1,66,1,72,1,32,1],
+      ["florist",136,1],
+      ["flossing",191,1],
+      ["flotation",50,1],
+      ["flourish",25,1],
+      ["flourished",50,1,59,2,26,1],
+      ["flow",12,1,23,4,2,1,15,1,20,1,1,4,85,1,7,1,11,1,20,1],
+      ["flower",16,1,6,1,16,1,27,7,34,1,6,1,31,5,19,38,24,1],
+      ["flowering",47,1,4,1,84,1,20,1,2,1,22,1],
+      ["flown",130,1],
+      ["flu",209,2],
+      ["fluctuate",200,1],
+      ["fluctuation",73,1,2,1,42,1,4,1,11,1],
+      ["fluency",176,1],
+      ["fluent",54,1,32,1,9,1,67,1],
+      ["fluently",149,1],
+      ["fluid",5,2,54,2,49,1,118,1],
+      ["fluoresce",68,1],
+      ["fluorescence",68,14],
+      ["fluorescent",68,4],
+      ["fluorescing",68,1],
+      ["fluoridate",178,1,13,1],
+      ["fluoridated",178,1,13,3],
+      ["fluoridation",178,25],
+      ["fluoride",178,7,13,1],
+      ["fluorine",178,2],
+      ["flurry",167,1,45,1],
+      ["flute",46,1,65,1,61,1],
+      ["fly",5,1,40,1,14,2,21,1,16,2,7,2,26,5,1,3,8,1,21,1,18,1,14,1,2,1,9,1],
+      ["flyer",159,1],
+      ["flying",103,1,18,1,9,1,2,1,27,3,4,1,28,1,2,1],
+      ["flynn",62,7],
+      ["flypaper",59,1],
+      ["flytrap",59,6],
+      ["fmri",17,2],
+      ["foam",19,1,10,1],
+      ["focus",7,1,4,1,4,5,2,1,3,1,8,1,8,1,5,2,22,1,15,1,3,1,1,3,4,1,1,2,17,1,2,2,10,1,2,1,8,6,19,1,1,1,8,1,13,1,5,1,3,1,4,1,1,1,11,1,12,1,3,1,3,1,3,1,10,1],
+      ["focuse",7,1,71,1,33,1,34,1,34,2,2,1,2,1,20,1],
+      ["focused",5,1,13,4,23,2,13,1,18,1,10,1,44,1,44,1,7,1,17,1,3,1,7,1,17,2],
+      ["focusing",12,1,14,1,22,1,78,1,17,1,4,1,48,1],
+      ["fodder",99,1],
+      ["foe",69,1],
+      ["foer",131,1],
+      ["foetus",3,1],
+      ["fogassi",57,3],
+      ["foghorn",165,1],
+      ["foil",53,1],
+      ["fold",59,1,84,1,4,1],
+      ["folded",107,1,6,1],
+      ["foliage",10,1,79,1,31,1,15,1],
+      ["folio",190,1],
+      ["folk",41,2,5,1,63,1,82,1],
+      ["folklorist",157,1],
+      ["folktale",157,1],
+      ["follow",3,1,23,1,21,1,8,1,1,1,26,1,4,1,13,1,5,1,10,1,10,1,14,1,22,1,3,1,2,1,11,1,11,1,2,1,13,1,9,1,3,1],
+      ["followed",10,1,9,1,1,1,8,1,8,2,3,1,17,1,23,1,7,1,1,1,5,1,7,1,33,2,11,1,6,1,19,1,2,1,12,1,13,1,16,1,10,1,2,1,2,1],
+      ["following",16,4,13,1,3,1,4,1,3,1,2,1,3,1,1,2,1,1,7,1,1,2,10,1,2,1,3,1,15,1,9,1,4,1,13,1,1,1,10,1,11,1,8,1,3,1,12,1,14,2,10,1,10,1,1,1,3,1,14,1,12,1],
+      ["folly",112,1],
+      ["fond",108,1],
+      ["foochow",66,1],
+      ["food",0,1,1,4,4,1,2,1,2,1,1,1,3,1,1,2,1,2,1,5,3,2,3,1,2,2,3,2,5,42,1,2,1,1,3,1,1,1,7,3,2,2,3,4,2,2,9,37,2,3,2,3,3,1,2,25,6,22,3,2,6,1,6,2,1,1,2,2,2,4,1,1,2,6,1,1,2,4,1,4,1,1,6,1,4,2,1,5,6,6,1,7,3,1,2,7,6,7,1,2,1,2,3,2,3,4,2,2,4,2,2,1,6,2,3,5,1,1,10,1,4,1,11,1,1,1,8,1,6,4,1,4,1,1,1,2,14,1,6,11,1,2,1,2,2,5],
+      ["foodstuff",147,1],
+      ["fooled",5,1],
+      ["foolish",166,1],
+      ["foot",21,1,19,1,4,1,6,1,63,1,6,2,23,1,7,1],
+      ["football",6,1,44,1,89,1,52,1,20,1],
+      ["footballer",6,1],
+      ["footed",223,22],
+      ["foothold",48,1],
+      ["footnote",157,1],
+      ["footpath",37,1,47,2],
+      ["footprint",25,7,87,1,17,1],
+      ["footrest",84,1],
+      ["forage",76,1,59,2,8,1,16,1],
+      ["forager",135,1],
+      ["foraging",65,1,50,1,12,3],
+      ["forbade",51,1],
+      ["forbidden",31,1,85,1],
+      ["force",9,1,10,1,4,1,12,1,4,1,1,1,19,1,11,1,2,3,15,1,16,1,13,2,3,2,5,1,5,1,3,1,7,1,3,1,6,1,13,4,3,5,2,1,11,1,12,2,18,2,10,2,3,1,2,1],
+      ["forced",44,1,19,1,39,1,3,1,32,1,12,1,8,1,7,1,35,1,14,1,9,1],
+      ["forcefield",225,1],
+      ["forceful",104,1],
+      ["forcing",112,1,15,1,47,1,26,1,10,1],
+      ["ford",73,1,22,1],
+      ["forearm",72,1],
+      ["forebrain",127,3],
+      ["forecast",13,1,47,1,90,1,6,1,37,1,8,3],
+      ["forecaster",140,1],
+      ["forecasting",121,1],
+      ["forecourt",44,2,107,1],
+      ["forefront",7,1,20,1,44,1,7,1],
+      ["foreground",181,1],
+      ["forehead",106,1,75,1],
+      ["foreign",74,1,3,1,3,1,59,1,13,1,10,3,21,1,24,1],
+      ["foreigner",179,1],
+      ["forelimb",27,1],
+      ["foremost",108,1,62,1],
+      ["forensic",192,2],
+      ["foreseen",157,1],
+      ["foreshore",136,1],
+      ["foresight",170,1],
+      ["forest",0,1,5,1,5,2,6,1,10,1,7,1,15,1,2,1,2,1,32,1,1,1,11,3,6,2,1,3,14,6,7,1,9,1,6,3,4,13,8,1,6,1,22,12,4,3,16,2,24,1],
+      ["forestall",33,1],
+      ["forestry",33,1,84,6,16,1],
+      ["foretelling",17,1],
+      ["forethought",153,1],
+      ["forever",32,1,20,1,71,1,45,1],
+      ["foreword",179,1],
+      ["forged",1,1,187,1,37,1],
+      ["forgery",1,1],
+      ["forget",163,1,7,1,50,1],
+      ["forgiveness",155,1],
+      ["forgo",5,1,173,1],
+      ["forgotten",9,1,26,1,46,1,50,1],
+      ["form",0,2,1,1,2,2,2,1,5,1,2,1,4,1,3,4,2,3,5,2,1,1,3,1,4,1,3,1,8,3,1,4,1,1,2,1,2,2,1,4,2,3,3,1,1,1,4,1,5,2,5,1,2,1,2,1,1,1,2,3,7,1,1,2,2,1,1,1,1,1,5,1,1,1,3,1,1,1,1,5,2,2,4,1,1,1,1,1,3,1,1,1,3,1,3,1,5,1,2,1,16,1,3,2,1,1,2,1,1,1,14,2,1,3,1,1,10,1,1,1,6,1,2,1,2,1,1,1,1,1,1,1,3,5,2,1,1,1,2,1,1,5,2,1,10,1,3,3,1,1,1,1,1,1,1,4,1,2,6,1,1,1],
+      ["formal",8,2,28,1,36,1,32,1,7,1,20,2,16,1,20,1,2,1,9,1,4,2,6,1,18,1,6,1],
+      ["formaldehyde",19,1],
+      ["formality",86,1],
+      ["formalized",61,1,158,1],
+      ["formally",44,1,53,1,34,2,36,1,45,1],
+      ["format",95,1,31,1],
+      ["formation",123,1,16,1,3,1,23,1],
+      ["formative",205,1,20,1],
+      ["formatted",201,1],
+      ["formed",17,1,2,1,6,2,20,2,14,1,10,1,6,1,9,1,14,1,2,1,8,1,16,4,1,1,4,1,8,1,36,1,11,1,4,1,8,2,15,1,6,1],
+      ["former",22,1,6,2,7,1,14,1,13,1,1,1,10,1,9,1,2,1,34,1,7,1,17,1,29,1,22,1,12,2,4,1,11,1],
+      ["formerly",80,1,4,2],
+      ["formidable",52,1],
+      ["forming",44,1,26,1,95,1,16,1],
+      ["formula",33,1,115,3,2,1,51,1],
+      ["formulate",161,1,1,1],
+      ["fort",83,1],
+      ["forth",0,1,69,1,6,1,64,1,42,1,16,1,3,1,19,1],
+      ["forthcoming",168,1],
+      ["fortitude",64,1],
+      ["fortress",195,1],
+      ["fortunate",87,2,92,1],
+      ["fortunately",63,1,100,1,2,1,10,1],
+      ["fortune",28,1,59,1,14,2,21,1,8,1,38,1,51,1,6,1],
+      ["forty",111,1,59,1,5,1,36,1],
+      ["forum",87,1,83,1,36,1],
+      ["forward",5,1,6,1,23,1,18,1,23,3,5,1,4,1,29,1,2,1,3,1,36,1,2,1,5,1,22,1,33,1],
+      ["fossil",5,2,20,2,20,13,50,1,15,2,23,1,75,2,2,1,12,1,4,1],
+      ["fossilised",115,1,10,1,52,1],
+      ["foster",39,2,24,4,29,1,28,1,1,1],
+      ["fostering",41,1,51,1],
+      ["fought",149,1,2,1,74,1],
+      ["foul",51,1,74,1,33,1],
+      ["found",0,1,2,3,3,1,3,1,2,1,2,2,5,6,1,5,1,3,3,2,1,1,2,8,2,8,1,1,1,2,2,3,5,2,1,3,1,5,1,3,1,3,2,7,1,3,2,1,1,3,1,1,2,1,1,8,1,2,5,3,1,1,3,1,1,1,1,3,1,3,1,1,3,1,1,1,2,3,1,7,1,1,4,1,1,1,1,6,3,2,1,1,1,3,2,1,1,1,2,1,1,3,1,3,1,1,2,3,1,2,1,1,3,3,2,2,1,3,3,1,1,2,1,2,2,1,2,3,1,1,2,2,1,3,1,4,1,1,1,1,6,5,1,1,1,5,1,6,2,1,1,3,1,1,5,2,1,4,2,2,1,1,2,1,3,3,1,2,3,3,4,1,1,4,1,1,1,2,3,5,1,1,1,1,1,1,1,2,1,2,2,1,1,1,1,2,1,1,1,5,2,1,2,2,1,1,1,2,1,4,1,8,1,1,1,2,1,1,1,1,1,1,3,2,2,1,2,2,1,3,2,2,1,1,3,3,1,2,3,2,2,2,1,2,1,2,1,1,3,1,2,5,1,1,1,2,1,1,1,2,2,2,1,2,1,3,2,2,1,1,1,2,1,1,1,4,1,4],
+      ["foundation",28,1,3,1,6,4,3,1,10,1,21,1,7,1,9,1,8,2,21,1,6,1,6,1,9,2,5,1,8,1,10,1,21,1,5,1],
+      ["foundational",74,1],
+      ["founded",18,1,77,1,48,1,45,2,6,1],
+      ["founder",31,1,3,2,48,1,60,1,78,1],
+      ["founding",28,1,52,1,83,1],
+      ["foundry",217,1],
+      ["four",2,1,4,1,2,1,10,1,2,1,2,1,3,1,6,1,1,1,1,1,2,1,4,2,5,1,2,3,4,1,4,1,3,1,4,1,1,1,7,1,9,2,6,2,1,1,6,1,1,1,2,3,1,1,9,1,2,1,1,1,2,1,8,2,2,2,3,1,8,1,1,1,2,1,2,1,1,1,3,2,3,1,1,1,1,1,3,3,5,4,10,1,7,1,5,1,1,1,1,1,3,1,3,1,3,1,2,1,5,1,2,1,6,1,1,1,7,1,8,2,4,1,3,1,2,1],
+      ["fourteen",33,1,59,1,27,1,57,1],
+      ["fourteenth",194,3],
+      ["fourth",33,1,6,1,113,1,1,1,43,1],
+      ["fox",21,1,117,4,6,1,58,4],
+      ["foxe",135,1,3,4,64,4],
+      ["foyer",44,2,142,1],
+      ["fraction",187,1],
+      ["fragile",201,1],
+      ["fragility",13,1],
+      ["fragment",18,1,9,1,4,1,16,1,76,1,26,1,43,1,14,1,4,1],
+      ["fragmented",178,1],
+      ["fragrance",65,4,60,1],
+      ["fragrant",65,1,60,1],
+      ["frame",63,1,21,1,23,1,6,2,23,1,18,1,7,1,5,1,9,1],
+      ["framework",84,1,3,1,60,1,13,1,46,3,7,1],
+      ["framing",117,1],
+      ["fran",14,1,9,1],
+      ["franc",219,1],
+      ["franca",162,3],
+      ["france",0,3,4,2,17,2,6,1,2,2,9,1,58,1,3,2,33,3,4,1,29,2,23,1,5,1,1,2,7,2,18,1],
+      ["franci",3,1,142,1,58,1],
+      ["frank",34,1,7,1,15,2,64,1,17,2,59,1],
+      ["frankfurt",157,1],
+      ["franklin",131,1,18,19],
+      ["frantically",127,1],
+      ["franz",125,1],
+      ["fraud",72,1],
+      ["fraught",164,1],
+      ["fred",91,1,24,1],
+      ["frederick",8,1,91,3,6,1,48,1],
+      ["fredrick",201,1],
+      ["free",5,1,26,1,25,1,26,1,4,1,2,1,4,5,2,1,8,9,8,4,8,1,19,3,2,2,1,1,1,1,6,1,16,1,7,1,17,1,4,1,6,1,2,9,2,1,22,1],
+      ["freedom",131,1,74,1],
+      ["freeing",87,1],
+      ["freelance",53,1],
+      ["freely",0,1,7,1,3,1,30,1,22,1,4,2,26,2,13,1,56,2,29,1],
+      ["freeman",109,1],
+      ["freewriting",12,1],
+      ["freeze",27,1,74,2,20,1,33,1],
+      ["freezer",61,1],
+      ["freezing",61,5,93,2,19,1,1,1],
+      ["freight",132,1,8,1],
+      ["french",4,1,19,4,6,4,10,1,17,1,1,1,10,1,7,1,22,1,8,1,5,2,3,2,4,1,3,1,6,1,7,2,14,1,11,2,29,1,2,1,5,2,1,1,3,1,4,1,4,1,3,1,3,1,6,1,2,1],
+      ["frenchman",61,1,52,1],
+      ["frenzied",20,1,188,1],
+      ["frenzy",185,1],
+      ["frequency",3,1,34,1,28,1,62,1,14,1,4,4,9,10,7,3,4,2,2,2,13,4,10,2,13,2,9,2],
+      ["frequent",35,1,13,1,54,5,11,1,5,1,56,1,25,5],
+      ["frequented",9,1],
+      ["frequently",4,1,14,5,4,1,3,1,3,1,8,1,6,1,28,1,13,1,7,1,2,1,25,1,3,1,4,1,2,1,5,1,5,1,1,1,11,1,18,1,8,1,12,1,6,1,6,1,8,1,2,1],
+      ["frescoe",31,3],
+      ["fresh",16,1,4,1,20,1,21,3,8,1,1,5,21,1,14,1,13,1,2,1,7,1,12,1,7,1,27,1,4,1,11,1,22,1],
+      ["fresher",66,2],
+      ["freshly",61,1,139,1],
+      ["freshwater",52,1,56,1,85,1],
+      ["fresneau",23,2],
+      ["fretted",46,1],
+      ["freud",17,3,76,1,67,1],
+      ["friction",19,1,28,1,5,2],
+      ["fridge",223,1],
+      ["fridlund",60,7],
+      ["friedman",142,1,48,9],
+      ["friedrich",46,1],
+      ["friend",0,1,4,1,28,1,26,2,6,1,32,1,1,2,12,1,17,1,8,1,2,1,12,1,2,1,5,1,2,1,14,2,5,1,8,1,14,5,21,1,6,2],
+      ["friendly",53,1,1,1,16,1,2,2,20,1,4,1,26,2,18,1,3,1,27,1,3,1],
+      ["friendship",184,2,32,1,6,1],
+      ["frightening",91,6,83,3],
+      ["frill",118,1],
+      ["fringe",103,1],
+      ["frippery",167,1,45,1],
+      ["fro",159,1],
+      ["frog",59,1,46,1,49,1,3,1],
+      ["froggatt",193,2],
+      ["frogmouth",89,2],
+      ["frond",195,1],
+      ["front",6,1,25,1,21,1,3,1,11,1,27,1,5,1,15,1,37,1,4,1,6,1,3,1,6,1,57,1],
+      ["frontal",18,2,179,1],
+      ["fronted",151,1],
+      ["frontier",13,2],
+      ["frost",5,1,96,3],
+      ["frosty",101,1],
+      ["frown",60,1],
+      ["froze",101,1,73,1],
+      ["frozen",61,4,30,1,58,1,15,1],
+      ["fruit",16,1,6,9,16,1,13,3,10,1,4,2,5,1,27,2,18,1,20,1,8,6,12,5,3,6,21,20,32,1],
+      ["fruiting",143,1,36,2],
+      ["fruitless",145,1,58,1],
+      ["frustrating",74,1,39,1],
+      ["frustration",74,1,88,1],
+      ["fry",104,1],
+      ["frying",19,1],
+      ["fuel",5,2,28,1,28,1,1,7,34,1,21,1,7,1,5,1,4,1,9,2,22,1,9,1,22,1,18,1,13,2],
+      ["fulfil",41,1,79,1],
+      ["fulfilled",13,1,72,1,20,1],
+      ["fulfilling",6,2,5,1],
+      ["full",7,1,2,1,1,1,8,2,5,1,2,1,6,1,14,1,7,1,2,1,9,1,1,3,10,1,6,1,4,1,2,1,6,1,12,2,4,1,1,2,3,1,2,1,1,2,8,2,5,2,2,1,2,1,9,1,7,1,1,1,2,1,2,1,9,1,16,1,9,1,1,1,10,1,3,1,8,3,6,1,7,1,3,1],
+      ["fulling",194,3],
+      ["fully",11,2,2,1,13,1,27,1,14,1,6,1,22,2,8,1,12,1,15,1,4,1,28,1,20,1,31,1,13,2],
+      ["fume",134,1],
+      ["fumihide",198,1],
+      ["fun",92,1,40,1,29,9,15,1],
+      ["function",1,3,2,3,14,3,7,1,39,1,2,2,3,2,16,1,9,1,1,1,12,1,14,2,13,1,13,1,1,1,4,1,3,1,1,1,15,1,3,2,3,3,4,1,2,1,1,1,2,4,10,1,13,1,3,1,9,1,1,1,3,2],
+      ["functional",7,1,10,1,38,1,2,1,25,1,2,1,34,3,28,1,16,3],
+      ["functionally",78,1],
+      ["functioning",83,1,3,1,34,1,77,1],
+      ["fund",4,1,1,1,23,6,27,1,32,1,26,1,24,1,33,1,18,1],
+      ["fundamental",30,1,10,1,12,1,88,1,5,1,5,1,20,1,19,1,14,1,10,1,9,1],
+      ["fundamentalist",188,1],
+      ["fundamentally",78,1,89,2,41,1,4,2],
+      ["funded",28,1,3,1,38,1,21,1],
+      ["funding",16,1,39,2,15,1,15,1,28,1,15,1,23,1,69,5],
+      ["funfair",161,4],
+      ["fungal",32,1,126,1,63,1],
+      ["fungi",105,2,34,3,82,2],
+      ["fungus",139,12,19,1,15,4],
+      ["funny",182,1],
+      ["fur",29,1,87,1,28,1,38,1,34,1,7,1],
+      ["furnish",0,1],
+      ["furnishing",82,1,35,1],
+      ["furniture",17,1,6,1,64,1,30,2,35,2],
+      ["further",6,1,3,4,7,1,1,1,1,4,3,1,2,1,9,1,2,1,3,1,3,2,3,1,3,1,1,1,15,1,3,1,26,6,1,1,4,1,11,1,6,1,1,1,1,1,1,1,1,1,1,3,3,3,4,1,5,1,1,1,6,1,5,5,2,1,2,1,8,1,5,1,2,1,2,1,3,1,2,2,1,1,1,1,1,1,4,1,1,1,2,1,9,1,13,1,4,1,2,1,1,1,1,1,1,1,1,2,7,1,5,2],
+      ["furthermore",3,1,23,1,22,1,5,1,2,1,20,1,27,1,19,1,12,1,31,2,4,1,2,1,3,1,17,1,8,1,1,1,7,1,3,1,1,1,12,1],
+      ["furthest",35,1],
+      ["fused",115,1],
+      ["fusion",136,1,69,1],
+      ["futile",121,1],
+      ["future",12,1,1,2,7,2,8,5,4,1,1,1,4,1,7,1,1,1,15,1,3,1,1,1,6,1,10,2,9,1,3,1,10,1,4,1,11,4,5,1,12,1,8,2,8,1,4,1,1,1,1,2,3,1,7,2,7,2,14,7,1,1,1,1,6,1,4,1,2,1,8,1,1,1,13,1,1,2],
+      ["futurist",166,1],
+      ["futuristic",120,1],
+      ["gable",182,1],
+      ["gaboriau",109,1],
+      ["gabriel",190,2],
+      ["gadget",82,2],
+      ["gaelic",95,1],
+      ["gagliano",221,4],
+      ["gaia",134,1],
+      ["gain",4,1,8,1,3,1,9,1,12,1,5,1,7,1,35,1,6,1,33,1,6,1,3,3,15,4,7,3,10,1,3,1,8,2,2,1,10,1,3,1,18,1,2,6],
+      ["gained",4,1,5,1,38,3,1,1,13,1,38,1,21,1,15,1,13,1,4,1,18,1,7,1,48,1],
+      ["gaining",0,1,108,1,101,1],
+      ["gait",83,2,32,1],
+      ["gal",20,1,107,1],
+      ["gale",168,1],
+      ["galileo",116,2],
+      ["gallagher",70,1],
+      ["gallery",34,17,21,1,30,1,51,2,15,16,18,1,1,6],
+      ["gallese",57,3],
+      ["gallop",10,1,205,1],
+      ["galloping",215,1],
+      ["gallup",106,1],
+      ["galsworthy",171,1],
+      ["game",9,2,6,1,5,1,1,1,2,1,14,1,5,1,15,2,35,2,19,1,20,20,15,1,10,16,19,1,4,9,5,9,1,1,4,48,17,6,5,6],
+      ["gamer",189,3],
+      ["gaming",189,1,17,1],
+      ["gandhi",15,1],
+      ["gang",88,1,21,1],
+      ["ganien",3,1],
+      ["gap",1,1,40,1,8,8,27,1,20,1,57,1,7,1,2,1,1,1,13,1],
+      ["gape",3,1],
+      ["gaping",3,5],
+      ["garbage",135,2],
+      ["garden",0,1,32,1,3,2,35,1,14,1,15,2,6,1,13,5,17,6,4,10,2,2,16,1,12,2,24,2,28,3],
+      ["gardener",22,2,171,1],
+      ["gardening",7,1,132,1],
+      ["garkovich",26,1],
+      ["garlic",116,2],
+      ["garment",19,1,10,1,1,3,47,1,63,7,86,1],
+      ["garnett",102,2,97,2],
+      ["garrard",168,3],
+      ["gary",95,1],
+      ["gas",19,1,33,2,10,1,19,1,30,1,18,2,35,2],
+      ["gase",52,1,50,6,31,1,31,4,9,1,22,1,4,6,2,1,25,1],
+      ["gastaut",57,1],
+      ["gate",27,1,187,1],
+      ["gather",57,1,13,2,10,1,55,3,19,1,12,1],
+      ["gathered",30,1,24,1,25,1,17,1,70,3,45,1],
+      ["gatherer",43,7,4,1,14,2,89,1,60,1,1,1],
+      ["gathering",5,1,31,1,25,1,7,1,59,1,20,1,19,1,53,1,3,1],
+      ["gauge",26,1,154,1,39,1],
+      ["gauging",219,1],
+      ["gaur",10,1],
+      ["gave",9,1,12,1,1,1,1,7,5,2,8,1,2,1,4,8,4,1,4,3,19,1,11,1,4,1,1,1,19,1,8,1,1,1,15,1,8,1,19,1,13,1,16,2,10,1,6,1,11,1,4,1,2,1,3,4,2,5],
+      ["gawasis",123,7],
+      ["gaynor",80,4],
+      ["gaze",68,1,46,1,37,1,47,1],
+      ["gazelle",10,2],
+      ["gazing",114,1],
+      ["ge",122,3],
+      ["gear",1,1,80,1,1,1,50,2,29,1],
+      ["gearbox",200,1],
+      ["geared",101,1,61,1],
+      ["gearshift",200,1],
+      ["gecko",89,5],
+      ["gee",189,4],
+      ["gehry",34,6],
+      ["geisha",0,1],
+      ["gem",108,2],
+      ["gender",24,1,25,11,56,1,50,1,37,1,33,1],
+      ["gene",22,18,10,2,26,1,13,2,18,1,30,1,31,1,47,1,25,1,3,1],
+      ["genera",139,1],
+      ["general",2,1,1,1,1,1,11,2,1,2,9,1,11,1,3,1,16,1,3,2,7,1,8,1,4,1,4,1,1,1,2,1,7,1,9,1,8,1,13,1,1,1,16,1,1,1,1,4,8,1,2,1,2,2,7,1,1,1,7,2,9,1,8,1,4,1,14,1,5,1,1,1,4,2,2,1,10,1],
+      ["generalisation",146,1],
+      ["generalise",152,1],
+      ["generalised",3,1],
+      ["generalist",52,1],
+      ["generally",3,1,7,3,6,1,1,1,19,1,1,1,7,1,7,1,3,1,9,1,2,1,7,1,21,1,6,1,3,1,4,2,2,1,4,2,5,1,5,2,2,1,1,1,5,1,8,2,2,4,7,5,6,2,2,2,9,1,3,2,3,1,13,1,1,1,1,1,8,1,6,1,3,2,4,1,3,1,3,2,4,1,2,1,6,2],
+      ["generate",33,1,43,1,9,1,39,1,10,1,33,1,3,1,3,1,12,1,5,1,4,1,1,1,17,1],
+      ["generated",30,1,3,2,23,1,116,1,24,1],
+      ["generating",28,1,44,1,45,2,17,1,8,1,16,1],
+      ["generation",7,1,7,1,8,1,5,2,1,1,4,1,1,2,32,1,11,1,8,1,3,4,2,2,16,1,7,1,10,1,5,1,7,3,9,1,7,1,10,1,1,1,26,1,2,1,16,3,2,1,8,1],
+      ["generational",14,1],
+      ["generator",5,2],
+      ["generic",63,1,9,1],
+      ["generically",29,2],
+      ["generous",28,1,13,1,10,1,21,1,110,1],
+      ["genetic",2,4,3,1,9,1,8,3,5,1,5,1,15,1,11,1,7,2,13,1,21,1,11,2,9,1,20,1,11,1,33,1,42,2],
+      ["genetically",130,1],
+      ["geneticist",22,1],
+      ["geneva",180,1,16,13],
+      ["genius",6,1,58,1,45,1,2,2,2,1,32,3,14,1,1,1,11,3,32,3],
+      ["genome",22,1],
+      ["genre",109,2,66,5,13,1,17,2],
+      ["gentle",174,1],
+      ["gentlemen",109,1,16,1],
+      ["gently",114,1],
+      ["gentry",207,1],
+      ["genuine",85,2,13,1,84,1,8,4],
+      ["genus",223,1],
+      ["geochemist",90,1],
+      ["geoffrey",211,1],
+      ["geographer",64,1,6,1,98,1],
+      ["geographic",43,1,179,1],
+      ["geographical",48,1,2,1,14,3,11,1,21,1,98,1],
+      ["geography",64,2,115,1],
+      ["geological",25,2,65,1,102,1],
+      ["geologist",69,1,60,1,89,1],
+      ["geology",196,2],
+      ["geometry",200,1],
+      ["geomorphologist",165,1],
+      ["geophysic",154,4],
+      ["geopolitical",133,1],
+      ["geopolitically",123,1],
+      ["george",5,1,66,1,14,1,12,1,14,1],
+      ["georgia",198,1],
+      ["georgie",118,1],
+      ["geoscience",196,1],
+      ["gerald",211,1],
+      ["gerard",64,1],
+      ["germ",22,1,79,1],
+      ["german",7,1,22,3,17,1,12,1,9,1,17,2,9,1,2,1,30,1,11,1,9,1,4,1,8,2,4,2,25,1,14,1,1,1,2,1,2,1,2,1,8,1,2,1,1,1],
+      ["germanic",196,1],
+      ["germany",4,1,15,1,2,1,6,2,2,3,29,1,10,2,27,1,20,1,19,1,10,1,5,1,8,5,33,1,28,1],
+      ["germinate",158,1,66,1],
+      ["germination",158,1,66,1],
+      ["gestation",75,1],
+      ["gesture",60,2,14,1,88,1,12,1,41,1,4,1],
+      ["get",2,2,4,1,3,1,9,3,2,1,2,2,9,1,2,1,2,1,2,1,1,1,5,4,4,1,9,1,2,1,1,1,3,1,4,1,4,1,2,3,1,1,7,1,2,2,1,2,2,2,4,4,2,1,1,3,1,1,1,1,1,1,6,4,1,3,3,1,4,1,3,2,2,4,1,1,3,1,1,1,2,1,7,1,3,6,1,1,2,1,7,1,1,3,2,1,2,3,17,1,12,2,1,2,3,1,2,3,4,2,3,1,1,1,2,1,8,3,10,1,4,1,3,1,2,1,2,4,2,1,1,1,2,1],
+      ["getting",18,2,4,1,15,2,2,1,3,1,1,1,12,1,11,1,19,1,6,1,27,1,10,1,6,1,8,1,17,1,2,1,3,1,3,1,12,1,13,1,20,1,8,1],
+      ["ghetto",118,1],
+      ["ghim",64,1],
+      ["ghrelin",94,1],
+      ["giacomo",57,1],
+      ["giant",5,1,70,3,1,1,6,1,34,1,7,1,2,2,29,1,3,1,3,1,1,1,4,1,8,1,20,2,3,1,20,1],
+      ["gibson",46,2],
+      ["gift",0,1,28,7,9,1,14,1,26,1,11,1,19,1,12,1,11,1,15,1,10,6,48,1],
+      ["gifted",71,1,34,1],
+      ["gigantic",63,1,16,1,86,1],
+      ["gigantism",91,2],
+      ["giggle",198,1],
+      ["gilbert",109,1,7,12],
+      ["gile",165,1],
+      ["gillespie",210,1],
+      ["gillian",85,1],
+      ["gilly",28,3],
+      ["gimmicky",104,1],
+      ["ginian",3,1],
+      ["ginseng",72,1],
+      ["giovanni",137,1,40,1],
+      ["giraffe",10,1,206,34],
+      ["girl",4,1,25,3,20,14,5,2,82,1,21,1,54,1],
+      ["girolamo",190,1],
+      ["gisela",89,1],
+      ["giulio",220,1],
+      ["give",3,1,4,2,1,1,3,1,2,3,1,1,2,1,4,1,6,2,2,1,10,1,2,1,2,3,6,1,5,1,1,1,3,1,4,1,6,2,1,4,1,1,2,1,3,1,4,1,4,1,4,4,1,1,8,1,7,1,2,3,1,1,7,1,9,1,7,1,1,1,8,1,6,2,2,1,2,1,3,1,4,1,1,2,1,2,3,2,1,1,3,1,8,1,3,1,2,1,3,3,1,1,3,1,6,1,8,1,1,1,1,1,4,1,2,1,2,1,2,2,2,1,3,1,1,1,4,1],
+      ["given",0,1,2,1,11,1,9,1,2,3,2,1,2,2,1,1,9,1,2,1,1,1,1,4,9,1,4,1,7,1,20,1,12,1,4,1,2,5,2,5,3,1,1,2,11,1,5,1,1,1,5,1,3,1,6,1,1,1,6,1,3,1,1,1,2,1,5,1,2,1,9,1,3,1,6,6,6,1,3,1,3,1,2,1,10,5,3,1,5,2,3,1,1,1,5,1,4,8],
+      ["giving",8,1,4,1,6,1,10,3,9,1,5,3,7,1,1,1,3,1,2,2,16,1,11,2,2,1,18,1,17,2,12,2,58,1,10,1,12,1,2,1,3,1],
+      ["glacial",40,2],
+      ["glacier",40,1,50,2],
+      ["gladiator",9,1],
+      ["gladwell",152,3,53,5],
+      ["glaeser",96,1,16,8],
+      ["glamorous",170,1],
+      ["glamorously",170,1],
+      ["glanced",114,1],
+      ["gland",65,1,7,1,47,1],
+      ["glander",143,4],
+      ["glandular",224,1],
+      ["glare",53,1],
+      ["glass",7,7,12,1,20,1,5,1,17,1,2,4,28,1,7,3,10,1,5,1,38,4,58,1],
+      ["glasse",114,1],
+      ["glaxosmithkline",82,1],
+      ["glaze",165,3],
+      ["glazed",29,1,166,1],
+      ["glean",189,1],
+      ["gleisdreieck",84,5],
+      ["glimpse",111,1],
+      ["global",3,1,2,1,4,1,7,1,16,3,2,1,6,1,40,1,2,1,8,1,5,1,7,1,2,1,8,1,16,1,5,1,7,2,22,1,2,1,6,2,7,2,3,3,15,1,4,1,2,1,8,1,13,1],
+      ["globalisation",104,1,58,1],
+      ["globalised",140,1],
+      ["globalization",32,5],
+      ["globally",16,1,101,1,78,1],
+      ["globe",22,1,1,1,25,1,16,4,76,1,1,1,30,1,6,1,3,1],
+      ["globule",177,1],
+      ["gloom",68,1],
+      ["gloria",126,1],
+      ["gloriously",182,1],
+      ["glossy",19,1],
+      ["glow",68,2,23,1,6,1,11,1,5,1,75,1],
+      ["glucose",200,9],
+      ["glue",172,1,42,1,10,1],
+      ["glued",217,1,1,2],
+      ["gmp",16,1],
+      ["gnat",207,1],
+      ["gnaw",207,1],
+      ["gns",192,3],
+      ["go",4,1,11,1,1,1,19,1,7,5,1,1,12,1,1,3,14,1,3,1,8,1,10,1,1,1,5,1,15,1,1,1,4,1,1,1,3,3,3,1,4,1,3,1,2,1,5,1,1,1,1,1,2,2,2,1,2,1,4,1,9,1,2,5,2,1,1,1,6,1,1,1,13,2,18,1,3,2,4,2,4,1,2,1,1,1,4,1,3,1],
+      ["goal",3,1,3,5,2,2,21,1,28,1,13,1,3,1,11,1,18,1,16,1,2,1,2,1,9,1,3,2,12,2,10,1,1,1,2,1,2,1,2,1,11,1,10,3,5,2,9,3,1,1],
+      ["goanna",193,1,17,1],
+      ["goat",10,2,57,2,12,1,23,1,17,1,80,1],
+      ["gobi",90,1],
+      ["goby",68,3],
+      ["god",9,2,8,2,50,1,36,2,20,1,46,1,19,1],
+      ["goddard",142,1],
+      ["goddess",31,1,20,1],
+      ["goddesse",29,1],
+      ["godley",119,4],
+      ["goe",2,1,19,1,3,1,6,1,9,1,2,1,3,1,12,2,4,1,19,1,27,1,25,1,19,1,32,1,1,1,2,2,22,1,4,1,2,4,5,1,7,1],
+      ["goer",34,1,44,1],
+      ["goethe",186,1],
+      ["goin",26,1],
+      ["going",15,1,1,1,4,1,14,2,3,2,2,1,4,2,12,1,14,1,11,2,2,1,3,1,7,1,10,1,16,2,3,1,13,1,4,2,4,1,12,1,5,1,1,1,1,2,4,1,3,1,2,1,12,1,2,2,14,1,1,1,1,2,2,2,2,1,1,1,20,1,1,1],
+      ["gold",51,1,18,1,8,1,22,2,5,1,4,1,11,1,6,1,26,1,18,1,13,1],
+      ["golden",22,1,87,3,10,8,11,1,5,2,19,1],
+      ["goldsmith",18,7],
+      ["golf",20,1,37,1],
+      ["golfer",57,3],
+      ["golfing",57,1],
+      ["goncourt",188,1],
+      ["gone",27,1,8,1,55,1,6,1,5,1,12,1,10,2,14,1,7,1,9,1,6,1,11,1],
+      ["good",6,3,1,1,3,1,3,1,2,1,1,3,1,2,2,4,2,3,1,1,1,3,2,2,2,2,1,3,5,3,1,2,1,1,1,3,1,2,1,2,1,2,2,1,2,1,4,13,1,1,1,2,2,1,2,1,2,1,1,1,2,1,1,2,2,2,1,1,1,1,1,1,1,1,1,3,4,1,1,3,1,1,1,4,3,1,2,3,2,1,2,6,3,1,2,1,1,1,1,1,6,1,1,4,1,1,3,4,2,3,1,2,1,3,3,1,4,1,1,2,1,1,1,1,3,1,4,1,1,3,1,1,5,1,1,3,1,1,1,1,3,2,1,3,3,1,4,4,4,5,1,1,5,2,1,1,7,1,2,4,1,3,3,1,1,1,1,1,4,2,2,1,1,1,3,2,1,1,2,1,6,1,2,1,2,2,3,1,4,1,1,3,1,2,1,1,1,1,3,1,2,1,4,1,1,1,3,3,2,1,2,1,1,1,2,1,3,2,1,2],
+      ["goodall",127,1],
+      ["goodbye",219,1],
+      ["goodchild",70,2],
+      ["goodfellow",28,1],
+      ["goodwill",122,1],
+      ["goodyear",23,1],
+      ["google",70,1,136,1],
+      ["goose",157,1],
+      ["goral",10,1],
+      ["gordian",152,2],
+      ["gordium",152,1],
+      ["gordon",190,2],
+      ["gorge",69,1],
+      ["gorilla",98,1],
+      ["gossip",9,1],
+      ["got",6,1,6,1,25,1,2,1,61,4,32,1,3,1,1,1,2,1,17,1,6,1,31,1,3,1,5,1,2,1,6,1,11,2,6,1],
+      ["gotelli",59,2],
+      ["gotten",221,1],
+      ["gottfried",2,1,81,1,93,1],
+      ["gottlob",218,1],
+      ["gould",45,1],
+      ["govern",15,2,68,1,73,1],
+      ["governance",152,1,37,1],
+      ["governed",23,1,64,1,60,1],
+      ["governess",105,1],
+      ["governing",93,1,8,1],
+      ["government",15,1,1,2,4,1,11,1,2,1,11,1,9,1,2,1,4,1,2,1,8,2,1,2,18,1,9,1,2,2,2,1,6,2,5,1,1,1,5,2,4,7,11,1,1,1,3,1,6,1,1,1,3,1,9,2,7,1,3,1,27,2,8,3,10,1,6,2,1,2,2,1],
+      ["governmental",166,1,43,1],
+      ["governor",77,1,92,1,13,1],
+      ["gps",70,1],
+      ["grab",114,1,28,1,21,1,53,1],
+      ["grabbed",45,1],
+      ["grabbing",47,1,67,1],
+      ["graceful",0,1,10,1,206,1],
+      ["grade",49,1,28,1,42,1,34,6,10,1,54,2],
+      ["graded",147,1],
+      ["grading",217,1],
+      ["gradual",90,1,13,1,85,1],
+      ["gradually",19,1,27,2,4,1,16,1,1,1,10,1,7,1,4,1,5,1,6,3,6,1,2,1,3,1,5,1,1,1,6,1,18,1,9,1,8,1,7,1,13,1],
+      ["graduate",28,1,30,1,39,1,53,1,2,1,11,7],
+      ["graduating",116,1],
+      ["graduation",122,1],
+      ["graffio",214,1],
+      ["graffiti",214,30],
+      ["graffitist",214,3],
+      ["graft",93,1],
+      ["graham",48,2,27,2,16,1,27,1,53,1],
+      ["grain",24,1,27,1,26,1,25,6,56,2,7,22,4,1,4,1,26,6,11,1],
+      ["grained",49,1],
+      ["gram",103,1,7,1,9,1],
+      ["grammar",57,1,17,1,21,2,21,1,67,3,25,2,12,1],
+      ["grammarian",207,1],
+      ["grammatical",208,1,14,1],
+      ["grand",44,1,125,1,15,2],
+      ["grandchildren",182,1,25,1],
+      ["grandfather",111,1],
+      ["grandpa",128,1],
+      ["grandparent",104,1,82,1],
+      ["granite",44,1],
+      ["grant",188,1,6,1],
+      ["granted",11,2,9,1,90,1,2,1,56,1,15,1,8,1,35,2],
+      ["granular",165,1],
+      ["grape",211,1],
+      ["graphic",30,2],
+      ["graphite",217,19,1,20],
+      ["graphitewa",218,1],
+      ["grapho",218,1],
+      ["grasp",54,1,42,1,71,1,45,1,4,1],
+      ["grasping",45,1,12,1],
+      ["grass",5,1,5,2,40,1,40,2,12,1,25,3,8,1,64,1,24,1,1,2],
+      ["grasse",115,2,9,2],
+      ["grassi",137,2],
+      ["grassland",5,1,5,4,80,1,31,1,102,2],
+      ["grassroot",188,1],
+      ["grassy",135,1],
+      ["grateful",215,1],
+      ["gratitude",31,1,6,1],
+      ["grave",29,2,92,1,13,1,41,1],
+      ["gravel",35,1,49,1,126,1],
+      ["graveyard",114,1],
+      ["gravitated",211,1],
+      ["gravitational",142,1,22,1],
+      ["gravity",116,1,16,3,10,1,19,1,56,3],
+      ["gray",18,1,198,1],
+      ["graze",124,1],
+      ["grazed",102,1,22,1,75,1],
+      ["grazer",90,1],
+      ["grazier",138,6,64,6,8,2],
+      ["grazing",10,1,80,3,12,6,25,1,16,1,56,6,17,1,7,1,1,1],
+      ["great",4,1,2,1,4,1,3,1,2,2,1,1,1,1,2,1,4,1,2,1,6,1,2,2,1,1,7,4,9,1,2,2,5,2,2,1,2,2,3,2,2,2,14,1,2,2,5,3,1,1,2,1,1,12,2,1,5,2,1,1,8,1,2,2,2,1,2,1,3,5,6,1,2,2,1,2,1,1,3,1,1,2,2,2,1,1,5,1,3,2,1,1,2,1,5,1,8,2,6,1,3,1,1,1,2,2,1,3,1,2,6,1,3,3,2,2,1,1,5,2,2,1,3,1,3,1,1,1,1,1,4,1,2,2,1,1,2,2,1,1,4,1,3,4,1,1,3,1,4,2,2,1],
+      ["greater",1,1,1,2,4,1,3,1,6,2,5,1,12,1,3,1,1,1,10,1,2,1,1,1,3,1,7,1,2,1,2,1,8,1,5,1,2,1,1,1,6,1,2,1,1,1,7,1,1,1,14,1,8,1,1,1,3,1,6,1,2,1,2,1,8,1,1,1,19,1,2,1,4,2,5,2,6,1,31,1,6,1,2,1,6,1,2,1],
+      ["greatest",19,1,42,1,3,1,17,4,15,1,26,1,31,1,14,1,1,1,3,1,5,2,18,2,18,1,4,1],
+      ["greatly",9,1,1,1,3,1,10,7,7,1,36,1,17,1,13,1,3,1,9,1,3,1,17,1,2,1,12,1,5,1,19,1,4,1,4,1,4,1,13,1,10,1],
+      ["greatness",2,1,4,1,182,1],
+      ["greco",219,2],
+      ["greece",9,1,8,1,12,1,22,1,137,1],
+      ["greed",15,5],
+      ["greedy",195,1],
+      ["greek",15,1,24,1,12,4,6,2,41,1,9,1,4,4,5,2,36,1,36,2,23,1,3,1,4,2],
+      ["green",5,1,33,1,28,1,2,3,4,1,12,1,18,1,9,1,9,1,15,1,1,1,22,1,21,1,2,1,1,1,7,2,6,1,4,1,2,1],
+      ["greene",171,1],
+      ["greener",102,1,97,1],
+      ["greengrocer",70,1],
+      ["greenhouse",102,6,22,1,5,2,4,2,31,7,31,1,4,6,2,1,25,1],
+      ["greenstone",1,1],
+      ["greenwich",76,1],
+      ["greer",71,1],
+      ["greet",37,1,21,1,46,1],
+      ["greeted",160,1,10,1],
+      ["greeting",60,1,159,2],
+      ["greg",219,1],
+      ["gregg",39,1],
+      ["gregory",93,1,103,5],
+      ["greider",26,1],
+      ["gretchen",70,1],
+      ["gretel",157,2],
+      ["grew",2,1,2,1,21,1,2,1,2,1,2,1,7,2,7,1,5,1,16,1,2,1,7,1,1,1,16,1,4,2,22,1,13,1,5,1,22,1],
+      ["grey",38,1,56,1,9,2,22,2,16,2,35,1,42,2],
+      ["greyish",125,1],
+      ["grid",64,2,131,2],
+      ["grief",216,1],
+      ["grieving",155,1],
+      ["grill",79,1,104,1],
+      ["grille",190,2],
+      ["grimace",174,1],
+      ["grimm",37,2,120,22],
+      ["grin",174,1],
+      ["grind",32,1,126,1],
+      ["grinding",99,1,24,1,51,1,36,2,8,1],
+      ["grinned",83,1],
+      ["grip",82,2,50,1,31,1,58,1],
+      ["gripped",177,1],
+      ["grit",214,1],
+      ["grizzly",27,1],
+      ["gro",122,1],
+      ["groan",14,1],
+      ["grocery",22,3,48,2,27,2,77,1],
+      ["grodnertal",29,1],
+      ["groom",85,1],
+      ["grooming",85,1],
+      ["groove",1,2,217,1],
+      ["groper",1,1],
+      ["gross",166,1],
+      ["grotte",21,1],
+      ["ground",10,2,11,2,13,3,1,1,12,1,3,1,5,1,7,3,7,2,6,1,5,1,4,3,5,3,7,1,3,1,9,2,2,1,3,1,2,1,6,2,3,2,9,1,6,1,6,1,9,6,7,2,8,1,1,1,5,1,3,1,15,1,10,1,13,1,2,1,4,1,1,1],
+      ["grounded",163,1],
+      ["groundwater",69,2,157,1],
+      ["groundwork",153,1],
+      ["group",2,2,3,1,3,4,2,5,1,1,1,3,2,14,2,1,4,1,4,10,1,8,3,1,1,1,1,1,2,1,4,5,1,1,2,1,3,15,1,1,2,4,2,1,1,1,1,2,4,2,3,4,1,1,1,1,5,1,4,1,1,2,1,1,1,5,1,3,7,2,2,1,2,2,2,1,1,3,7,6,3,2,3,1,8,10,7,1,2,2,4,1,1,2,6,1,1,6,3,2,9,3,2,1,2,1,4,5,2,2,1,1,1,2,1,4,1,1,9,1,6,1,4,1,2,5,1,2,1,4,3,1,4,1,1,46,2,2,2,1,1,2,11,1,7,13,3,1,6,2,3,1,1,2,2,6],
+      ["grouped",147,1],
+      ["grouping",147,1],
+      ["grove",51,1,158,3],
+      ["grow",1,1,6,16,15,1,1,3,9,1,1,1,4,1,1,1,10,1,11,3,6,1,15,1,11,7,5,1,3,1,2,1,1,1,5,2,12,1,3,1,3,1,3,1,7,1,3,2,1,1,4,2,22,1,34,1,3,2,9,1,5,1,8,1,1,1],
+      ["grower",33,7,32,2,136,1],
+      ["growing",9,3,1,1,6,2,4,2,2,2,5,2,1,1,2,1,3,4,2,1,2,1,4,1,7,1,11,1,4,1,7,1,12,1,6,1,3,1,10,2,1,1,15,2,4,1,10,1,2,5,2,4,1,1,3,2,1,1,3,3,2,1,7,1,3,1,7,1,8,1,4,1,2,1,5,1,18,1,2,5,2,1,2,1,11,1,5,2,4,1],
+      ["growl",174,1],
+      ["grown",1,1,4,1,15,1,2,1,3,4,4,1,2,1,3,1,16,3,1,1,11,1,14,2,20,1,3,2,16,2,2,1,4,1,6,1,7,1,5,3,18,1,1,1,2,2,41,3,20,2,3,1],
+      ["growth",7,1,14,1,6,1,34,2,4,1,23,1,4,1,2,1,2,2,5,1,1,1,10,1,5,1,5,1,2,1,4,1,6,4,1,3,4,3,1,1,3,1,51,1,5,1,2,1,15,1,5,1,3,3,2,1],
+      ["grub",127,2],
+      ["gruesome",157,1],
+      ["grunt",14,1],
+      ["gruter",58,6],
+      ["guanacaste",143,1],
+      ["guanine",68,1],
+      ["guarantee",11,1,5,1,17,1,101,1,19,1,8,1,1,1,26,1,6,1],
+      ["guaranteed",13,1,19,1,96,1,3,1],
+      ["guard",27,1,24,1,5,1,29,1,14,1,11,1,107,1],
+      ["guarded",29,1,61,1,128,1],
+      ["guardian",103,1],
+      ["guarding",99,1,53,1],
+      ["guarnieri",31,1],
+      ["gucci",47,1],
+      ["guelph",120,1],
+      ["guess",42,3,60,1,46,2,14,1,37,1],
+      ["guessed",42,1,173,1],
+      ["guest",0,1],
+      ["guggenheim",34,13,29,1],
+      ["guiana",23,1],
+      ["guide",44,1,27,1,11,1,31,1,9,1,4,1,4,1,71,1,4,1,1,1],
+      ["guided",8,1,132,2,23,1],
+      ["guideline",53,2,44,1,21,1],
+      ["guiding",131,1,19,1],
+      ["guild",194,1],
+      ["guilt",188,1],
+      ["guilty",175,1,38,1],
+      ["guinea",175,1],
+      ["guitar",46,21],
+      ["gulf",35,1,13,1,39,1,16,1,5,4],
+      ["gull",130,2],
+      ["gum",97,1,94,2],
+      ["gun",101,1],
+      ["gunther",187,5],
+      ["gurdon",7,1],
+      ["gurion",221,3],
+      ["gut",46,1,180,1],
+      ["gutenberg",107,1,83,1],
+      ["gutter",19,1],
+      ["guy",15,1,32,1,23,1,11,1,115,1,5,1],
+      ["guzzling",5,1],
+      ["gymnast",17,1],
+      ["gypsum",173,1],
+      ["haberl",102,1,97,1],
+      ["haberman",97,2],
+      ["habit",5,1,5,1,33,2,5,1,28,3,24,1,9,1,10,1,7,1,10,1,64,1,7,2,8,1,7,2],
+      ["habitable",164,1],
+      ["habitat",10,2,4,1,7,1,2,1,17,2,19,2,16,3,14,1,14,2,7,1,11,1,14,3,6,4,1,1,1,7,21,1,9,1,4,1,39,2,7,1],
+      ["habitation",47,1],
+      ["habitual",86,1],
+      ["habitually",39,2],
+      ["hacienda",143,2],
+      ["hade",206,1],
+      ["hadn",42,1,107,1],
+      ["hadrian",87,2],
+      ["hadza",43,2,104,1],
+      ["haemoglobin",110,1],
+      ["hagen",162,1],
+      ["hagerty",192,2],
+      ["hague",0,1],
+      ["hair",10,2,19,4,1,1,28,1,1,4,18,2,22,1,111,1,6,1,5,1,3,2,2,3],
+      ["hairstyle",58,1],
+      ["hairy",224,1],
+      ["half",3,1,3,1,30,2,21,1,4,1,1,1,2,1,8,1,1,4,7,1,8,1,3,1,1,3,1,1,1,3,1,1,2,1,1,2,4,2,2,1,8,2,2,1,14,1,1,1,6,1,4,1,23,1,2,1,1,1,2,1,2,1,3,1,1,1,8,1,1,1,12,1,1,1,4,2,5,2,5,1,3,1,1,1,3,2,4,1,4,1],
+      ["halfpenny",211,1],
+      ["halifax",194,1],
+      ["halite",79,1],
+      ["hall",44,2,17,1,36,1,72,1,1,2,14,3],
+      ["halloween",177,1],
+      ["hallowell",126,1,55,1,16,1],
+      ["halloy",56,2],
+      ["hallucigenia",45,3],
+      ["halpern",18,4],
+      ["halt",48,1],
+      ["haltbrekken",134,1],
+      ["halted",16,1,46,1],
+      ["halve",76,1,141,1,1,2],
+      ["hamid",188,1],
+      ["hammer",61,2,66,1,27,1],
+      ["hammett",109,2],
+      ["hampered",192,1],
+      ["hampshire",120,1],
+      ["han",77,2,3,1,8,1,7,1,12,1,37,2],
+      ["hanchet",91,1],
+      ["hancock",23,3],
+      ["hand",2,2,1,1,4,1,14,1,2,1,1,1,14,1,13,1,4,1,2,1,3,1,10,1,3,1,1,1,12,1,6,1,6,1,6,1,4,1,11,2,4,1,13,1,7,1,2,1,7,1,5,1,3,1,3,3,7,1,1,1,3,1,2,1,13,1,1,1,7,2,1,2,5,1,10,1,3,1,1,1,2,3,3,1,2,1,1,1],
+      ["handbag",47,1],
+      ["handed",37,1,94,1,24,2,64,1,1,1],
+      ["handedly",121,1],
+      ["handful",22,1,40,3,8,1,131,1],
+      ["handheld",197,1],
+      ["handing",53,1,51,1],
+      ["handkerchief",219,1],
+      ["handle",19,1,17,1,17,1,28,1,39,1,11,1,28,1,1,1,19,1,2,1,28,1,2,1,6,1],
+      ["handled",53,1],
+      ["handler",119,1],
+      ["handling",152,1],
+      ["handmade",140,5],
+      ["handsome",157,2],
+      ["handwriting",67,1,137,1],
+      ["handy",217,1],
+      ["hanging",29,1,62,1],
+      ["hangout",131,1],
+      ["hanna",176,3],
+      ["hansel",157,2],
+      ["hanson",37,8],
+      ["hanushek",153,3],
+      ["happen",6,1,1,1,6,1,1,1,1,1,3,2,2,1,5,1,9,1,3,1,5,1,11,1,5,1,5,1,8,1,2,1,5,2,15,1,5,1,4,1,22,1,6,1,11,1,13,1,7,1,4,1,2,1,4,1,15,1,13,1,1,1,12,1],
+      ["happened",7,1,18,2,10,1,7,1,16,1,8,1,2,1,3,1,36,1,78,1,11,2,14,1],
+      ["happening",7,1,219,1],
+      ["happier",37,1,26,1,22,5,67,1,20,1],
+      ["happiest",4,1,59,1,22,1],
+      ["happily",34,1,101,1,22,1],
+      ["happiness",37,13,48,1,72,1,18,1],
+      ["happy",37,8,26,2,22,1,8,1,7,2,5,1,6,1,41,1,23,5],
+      ["har",46,2],
+      ["harakeke",1,1],
+      ["harbor",129,5],
+      ["harbour",44,3,66,1,13,1,13,2,3,1],
+      ["harbourside",136,1],
+      ["hard",19,1,2,3,6,1,2,1,4,1,4,1,4,1,6,1,2,1,2,2,10,1,7,1,1,1,6,1,15,2,1,1,8,1,3,1,5,1,2,1,4,1,6,1,4,1,2,1,6,2,5,1,16,1,1,1,4,1,4,1,18,1,17,1,3,1,11,1,4,1,2,1,2,1,2,1,5,2],
+      ["hardback",190,1],
+      ["harden",125,1,100,1],
+      ["hardened",1,1,44,1,6,1],
+      ["harder",11,2,10,2,40,1,9,1,8,1,20,1,6,1,10,1,86,1,17,1,1,1],
+      ["hardest",12,1,21,1],
+      ["hardier",221,1],
+      ["hardiness",22,1],
+      ["hardly",36,1,2,1,34,1,3,1,35,1,3,1,6,1,60,1,26,1],
+      ["hardness",217,1],
+      ["hardship",41,1,184,1],
+      ["hardwired",155,1],
+      ["hardwiring",37,1],
+      ["hardwood",117,1,16,1],
+      ["hardworking",145,1,58,1],
+      ["hardy",171,2],
+      ["hare",215,1],
+      ["harlem",122,1],
+      ["harlequin",89,1],
+      ["harm",22,1,60,1,20,5,20,1,11,1,6,1,39,2,21,5,16,1,5,1],
+      ["harmed",178,1],
+      ["harmful",6,1,10,1,83,2,3,5,18,1,14,1,59,1,6,5,15,1,6,4,6,2],
+      ["harming",92,1,27,1],
+      ["harmless",89,1],
+      ["harmoniously",36,1],
+      ["harmoniousness",167,1,45,1],
+      ["harmonization",162,1],
+      ["harmony",42,1,42,1,83,1,45,1],
+      ["harness",5,1,153,1],
+      ["harnesse",120,1],
+      ["harnessing",224,1],
+      ["harold",4,1,8,1],
+      ["harp",46,8],
+      ["harry",44,1,162,1],
+      ["harsh",27,1,32,1,62,1,52,1,1,1,51,1],
+      ["harsher",225,1],
+      ["harshest",121,1],
+      ["harvard",2,1,15,2,11,1,30,1,1,1,13,1,8,1,73,1,14,2,9,1,5,1,31,2,8,2],
+      ["harvest",33,1,28,1,5,2,30,1,3,1,18,1,22,1,62,2,23,1],
+      ["harvested",1,1,15,1,35,2,173,1],
+      ["harvesting",16,1,43,1,92,1,28,2,45,1],
+      ["hasn",70,1,64,1,4,1,64,1],
+      ["hassenpflug",157,1],
+      ["hat",30,1,152,1],
+      ["hatch",103,1],
+      ["hatched",77,1,19,1,7,1],
+      ["hatching",32,1,33,1,38,1],
+      ["hatchling",89,1,21,3],
+      ["hate",112,1,113,1],
+      ["hatred",156,1],
+      ["hauraki",103,1],
+      ["hauser",167,1,45,2],
+      ["haussmann",112,2],
+      ["havel",201,1],
+      ["haven",2,1,16,1,19,1,33,1,14,1,30,1,35,1,27,1],
+      ["having",4,1,6,1,5,1,3,1,2,3,13,1,9,1,2,1,2,1,2,1,2,1,6,3,2,1,8,1,12,1,2,1,1,2,9,1,1,1,2,2,3,1,5,1,3,2,1,1,12,1,5,1,8,1,4,1,11,1,10,2,1,2,3,1,15,1,1,1,1,1,5,1,1,1,2,1,8,2,5,1,1,1,5,1,1,3,21,4],
+      ["hawaii",130,1,63,2],
+      ["hawaiian",46,1],
+      ["hawk",89,1],
+      ["hawkesbury",136,1],
+      ["hay",96,1],
+      ["hayashi",100,1],
+      ["haywood",26,2],
+      ["hazard",113,1,27,1,41,4],
+      ["hazardous",161,1,17,1],
+      ["hb",217,2],
+      ["head",3,2,2,1,13,9,6,1,3,1,2,6,20,1,3,1,1,1,12,1,3,1,1,1,7,1,4,1,1,4,1,1,7,1,1,1,4,1,8,1,1,1,16,1,7,1,5,1,7,2,18,1,3,1,2,2,2,1,17,1,2,1,17,1,2,2,1,2,14,5],
+      ["headache",72,1,41,1,48,1,20,1],
+      ["headed",4,1,93,1,33,1,14,1],
+      ["headgear",131,1],
+      ["heading",113,1,2,1,16,1,25,1],
+      ["headline",97,1,91,1],
+      ["headmaster",49,1],
+      ["headphone",172,18],
+      ["headquarter",80,3,121,1],
+      ["headset",172,2],
+      ["heal",72,3,11,2],
+      ["healed",11,1],
+      ["healer",11,1],
+      ["healing",11,2,6,1,55,2,26,1,122,1],
+      ["health",11,11,5,2,1,1,3,1,4,4,13,1,4,1,2,2,8,1,18,1,1,3,2,1,4,1,16,1,4,1,4,1,1,1,19,3,2,4,15,1,22,1,16,1,3,2,13,8,6,1,4,1,10,1,9,1,6,1],
+      ["healthcare",120,3,106,1],
+      ["healthier",23,1,1,2,19,2,20,1,83,1],
+      ["healthy",22,1,2,2,24,1,22,4,13,1,16,1,11,1,10,1,2,4,15,3,4,1,5,1,30,1,2,1,7,1],
+      ["heap",165,1],
+      ["hear",2,1,16,6,75,1,33,1,28,1,11,1,2,1,5,1,8,2,32,1],
+      ["heard",15,1,3,6,70,1,15,1,46,1,33,1,1,1],
+      ["hearing",18,3,53,1,3,3,4,2,22,2,3,1,3,2,70,2,7,1,21,4,2,1,3,1],
+      ["hearst",63,6],
+      ["heart",20,1,4,1,19,1,4,1,13,1,3,1,21,1,10,1,3,1,4,1,7,1,1,2,3,1,10,1,27,1,9,1,14,1,10,4,1,1,5,1,28,1,3,1],
+      ["hearted",41,1],
+      ["hearth",21,1],
+      ["heartless",157,1],
+      ["heat",17,1,2,3,2,2,2,1,38,1,1,2,17,2,33,1,7,1,2,1,8,10,5,1,1,1,5,1,18,9,6,3,9,1,7,3,15,4],
+      ["heatbottle",19,1],
+      ["heated",61,1,18,4,25,1,11,1,103,1],
+      ["heath",22,2],
+      ["heathen",99,1],
+      ["heatherton",200,3],
+      ["heating",0,1,112,1,12,1,45,1,26,2],
+      ["heaven",103,1,39,1],
+      ["heavenly",116,1],
+      ["heavily",18,1,16,1,31,1,13,1,39,1,20,1,1,1,3,1,52,1,9,1],
+      ["heavy",18,1,13,1,4,1,26,1,27,1,8,2,3,1,8,1,6,1,21,1,30,2,1,1,36,1],
+      ["hectare",69,3,15,2,18,1,8,5,23,1,66,1,2,2],
+      ["heeh",70,3],
+      ["heel",161,1],
+      ["heeled",101,1],
+      ["hefty",142,2],
+      ["height",10,1,11,1,10,2,12,1,27,1,14,1,25,1,3,1,39,1,22,1,23,2,20,1],
+      ["heightened",60,1],
+      ["heilbronn",24,3],
+      ["heinz",157,1],
+      ["heir",77,1,105,1],
+      ["heirloom",22,16],
+      ["held",6,1,6,1,19,1,24,1,1,1,37,1,1,1,12,2,16,1,1,1,5,1,9,4,13,1,2,2,23,1,6,1,8,1,3,1,24,2,7,1,1,1],
+      ["helen",81,1],
+      ["helicopter",133,1],
+      ["heliogabalus",77,1],
+      ["helmholtz",93,2],
+      ["helmsmen",116,1],
+      ["helmut",102,1,97,1],
+      ["help",2,1,5,5,5,1,3,3,1,4,1,4,3,2,2,1,2,3,2,4,4,1,1,1,4,1,6,1,2,1,1,1,8,1,1,1,3,1,2,1,1,1,3,2,1,1,3,1,3,2,1,3,2,1,6,1,3,3,1,2,1,3,2,1,2,1,5,2,2,1,3,1,1,1,1,1,1,1,1,1,4,1,1,6,6,1,6,1,2,1,2,1,2,2,3,5,5,1,2,1,8,2,4,5,4,1,4,1,2,2,2,1,5,1,3,1,3,1,1,1,4,1,2,1,3,1,2,1,1,1,2,2,5,1,4,1,2,1,2,1,3,2,1,3,5,2,3,2,5,1,1,1,1,3,2,1,2,3,6,2],
+      ["helped",7,1,5,1,1,1,15,1,3,1,2,1,12,1,8,1,11,1,23,1,5,1,3,1,6,1,6,1,16,1,12,1,7,2,35,1,21,1,19,2],
+      ["helper",127,1],
+      ["helpful",26,1,20,1,16,1,8,2,4,1,8,2,144,1],
+      ["helping",7,1,6,1,18,1,1,1,19,1,17,1,1,1,13,1,23,1,28,1,10,1,1,1,19,1,9,1,28,1,1,1,24,2],
+      ["helpless",6,1],
+      ["helplessly",168,1],
+      ["hematite",177,1],
+      ["hemisphere",117,2,4,2,55,1,1,1,46,1],
+      ["hemispherical",123,1],
+      ["hemp",107,3,33,1],
+      ["hence",23,1,11,1,113,2,9,1,18,1,4,2],
+      ["henderson",225,1],
+      ["hendrik",71,1],
+      ["henri",8,1,193,1],
+      ["henry",28,2,39,1,6,1,16,1,23,1,33,1,58,1,8,2],
+      ["henshilwood",47,1],
+      ["herald",34,1],
+      ["heralded",103,1],
+      ["herb",16,7],
+      ["herbal",16,23],
+      ["herbalism",16,2],
+      ["herbalist",16,6,72,1],
+      ["herbicide",224,5],
+      ["herbivore",65,5,156,2],
+      ["herbivorous",10,2,51,1,4,2,156,2],
+      ["herculaneum",87,1],
+      ["herd",10,1,57,1,23,4,16,1,18,2,23,1,7,4],
+      ["herded",222,1],
+      ["here",2,1,4,1,1,1,4,1,16,1,4,1,2,1,1,1,34,1,4,3,17,1,15,1,39,1,3,1,5,1,1,2,18,1,5,1,8,1,5,1,16,1,5,1,1,1,5,1],
+      ["hereditary",137,1],
+      ["heredity",130,1],
+      ["herein",40,1,130,1],
+      ["heritage",1,1,30,1,1,4,1,1,11,2,11,1,29,2,24,1,43,3,16,1,27,1,18,1],
+      ["herman",125,1],
+      ["hermann",93,1],
+      ["hero",171,1,4,5,7,2],
+      ["heroe",9,2,33,1,115,1],
+      ["heroic",9,1,6,1,153,2],
+      ["herrera",23,1],
+      ["herring",130,1],
+      ["herself",4,1,77,1,24,4,10,1,21,1,46,3],
+      ["hertfordshire",197,1],
+      ["herv",27,2],
+      ["hesitate",89,2],
+      ["hey",106,1],
+      ["hi",162,1],
+      ["hibernate",27,1],
+      ["hibernated",27,1],
+      ["hibernating",27,1],
+      ["hidden",17,2,14,1,38,2,2,1,6,2,9,1,32,1,5,1,4,1],
+      ["hide",38,1,9,1,42,1,85,1,15,1,28,1],
+      ["hiding",89,1],
+      ["hierarchical",8,1,39,1],
+      ["hierarchy",8,1,42,1,37,1,47,1,13,1,3,1],
+      ["hieroglyph",111,3],
+      ["high",0,1,2,1,2,3,1,1,1,1,4,1,6,1,4,5,1,1,3,1,1,1,3,1,1,1,1,1,1,1,1,1,3,3,2,1,3,2,2,1,2,1,3,1,2,12,1,1,1,1,3,1,1,1,7,1,1,3,2,2,4,1,1,1,3,3,3,1,1,3,2,1,1,2,1,2,7,3,2,1,1,4,6,1,2,3,4,1,5,1,4,2,1,1,5,2,1,1,1,1,2,1,1,2,2,1,7,1,4,1,2,1,2,5,1,1,2,4,6,3,1,2,3,1,4,1,1,1,1,1,3,1,1,4,3,1,5,2,2,1,1,1,1,1,3,1,4,1,2,1,1,1,3,1,1,2,3,2,2,1,1,1,2,5,4,1,1,1,5,1,2,3,5,1,2,2,1,2,3,4],
+      ["highbrow",151,1],
+      ["higher",6,2,3,3,11,3,1,1,7,1,9,1,6,1,6,4,3,1,18,2,13,1,9,2,2,1,2,1,10,1,3,1,4,1,4,1,1,3,1,1,8,1,1,1,4,3,7,1,8,1,7,4,7,1,11,1,8,1,9,1,2,1,13,1,2,1,12,1,2,1],
+      ["highest",2,1,36,1,39,1,53,3,8,1,13,1,25,1,26,1,7,1,8,1],
+      ["highet",28,1],
+      ["highlight",6,1,47,1,80,1,11,1,26,1,50,4],
+      ["highlighted",28,1,25,1,125,1],
+      ["highlighter",68,1],
+      ["highlighting",28,1,40,1,94,1],
+      ["highly",0,1,3,2,2,1,2,1,3,2,4,1,6,1,2,1,2,1,5,1,9,1,7,1,28,2,4,1,4,1,1,1,7,2,2,6,7,1,11,1,12,1,4,3,2,1,3,2,3,1,7,4,1,1,4,1,8,1,9,1,2,1,3,1,4,1,5,1,1,2,8,3,8,1,10,1,9,1,12,1],
+      ["highway",143,1],
+      ["hill",17,1,115,8,4,1,2,3,44,3,12,2,2,1,6,3],
+      ["hilly",218,1],
+      ["him",3,1,10,1,20,1,3,1,1,1,17,1,3,1,1,5,4,1,18,2,2,2,7,1,4,1,8,1,8,2,2,1,1,2,1,1,3,1,23,1,9,1,1,5,19,1,1,1,2,6,4,4,13,1,5,1,22,1,4,1,6,1],
+      ["himself",0,1,20,1,14,2,49,1,10,1,16,1,3,1,34,1,2,1,12,1,30,1,23,1],
+      ["hindbrain",127,1],
+      ["hinder",76,1],
+      ["hindered",163,1],
+      ["hindquarter",144,1],
+      ["hindsight",41,1,147,1],
+      ["hinge",165,1],
+      ["hint",40,1,31,1,1,2,27,1,91,2,15,1],
+      ["hinted",99,1],
+      ["hinton",95,1],
+      ["hippocampus",181,1],
+      ["hippotraginae",10,1],
+      ["hire",170,1,49,1],
+      ["hired",6,1,213,1],
+      ["hiring",34,1,21,3,164,1],
+      ["hispanic",153,1],
+      ["historian",39,2,2,4,26,1,10,2,10,2,12,1,12,1,26,1,31,1,1,1,27,1,15,2,8,1],
+      ["historic",39,1,24,1,1,1,41,1,91,1,18,1,9,1],
+      ["historical",39,3,2,5,10,1,42,1,3,1,5,1,36,1,12,2,3,1,62,1,11,1],
+      ["historically",21,1,17,1,70,1,32,1],
+      ["history",0,4,1,1,10,3,4,2,1,1,12,2,1,1,4,1,6,1,2,20,5,4,3,1,2,4,10,4,9,1,5,1,9,1,3,3,1,5,9,5,2,1,3,1,3,2,3,3,7,1,4,1,4,1,5,1,4,2,2,1,3,3,1,1,1,1,3,4,10,1,1,1,10,1,7,1,2,1,10,1,6,1,1,1,3,2,2,5,5,1,3,1,2,1,1,2,3,1,5,1,1,1,3,6,1,5,1,1,4,1,3,1],
+      ["hit",18,2,7,2,9,1,23,2,44,1,23,1,7,1,30,1,1,1,5,1,29,1,16,1],
+      ["hitchcock",120,1],
+      ["ho",107,1],
+      ["hoad",182,1],
+      ["hoarding",215,1],
+      ["hoax",190,3],
+      ["hoaxe",144,1],
+      ["hoaxer",190,1],
+      ["hobart",34,18,110,4],
+      ["hobson",17,2],
+      ["hochuli",135,3],
+      ["hode",58,2],
+      ["hofmann",38,1],
+      ["hohle",27,1],
+      ["hoi",183,1],
+      ["hokuto",133,2],
+      ["hold",12,1,15,2,6,1,4,1,8,1,2,2,15,1,17,1,3,1,2,1,16,1,5,1,3,1,2,1,2,1,17,1,4,1,10,1,9,1,11,1,1,2,9,1,37,1,7,1],
+      ["holdaway",187,2],
+      ["holding",33,1,11,1,3,1,10,1,3,1,38,1,16,1,16,1],
+      ["hole",1,1,18,1,6,13,10,1,10,2,2,1,32,2,1,1,23,1,20,1,20,1,36,1,42,3,2,1],
+      ["holiday",32,1,2,1,14,1,33,1,4,2,29,1,70,1],
+      ["holistic",208,1],
+      ["holland",0,5,39,1,32,1,17,1],
+      ["hollander",63,1],
+      ["hollow",77,1,2,1,14,4,10,1,18,1],
+      ["hollowed",217,1],
+      ["hollowing",218,1],
+      ["hollywood",15,1],
+      ["holme",109,5],
+      ["holstein",64,1],
+      ["home",4,1,5,1,12,2,2,1,3,3,2,1,6,2,4,2,1,3,5,1,10,4,2,8,1,1,1,1,3,1,5,2,1,1,3,2,6,2,6,2,5,1,1,3,2,1,7,1,2,2,4,1,2,4,5,1,8,1,12,3,4,1,1,1,1,3,2,1,2,1,3,3,3,2,4,2,3,1,2,2,3,1,16,1,8,3,2,3,2,4,4,1,2,2,2,1,1,8,1,1,6,1,5,1,2,1,6,1,7,1,1,1,2,3],
+      ["homeland",41,1],
+      ["homeless",37,1,19,1],
+      ["homeostasis",173,1],
+      ["homeostatic",173,1],
+      ["homeowner",135,1],
+      ["homer",51,1,6,1],
+      ["homesick",184,1],
+      ["homestead",90,1,57,1],
+      ["homeware",82,1],
+      ["homework",126,1],
+      ["homing",130,7],
+      ["homo",115,2,68,1,25,1],
+      ["hone",163,1],
+      ["honed",185,1],
+      ["honest",64,1,149,1],
+      ["honestly",205,1],
+      ["honesty",209,1],
+      ["honey",38,1,110,1],
+      ["honeybee",65,2],
+      ["honored",206,1],
+      ["honorific",54,1],
+      ["honour",49,1,67,1,55,1,17,1],
+      ["hood",157,2],
+      ["hoof",216,1],
+      ["hook",1,38,4,1,13,1,109,1],
+      ["hooked",127,1],
+      ["hooting",167,1,45,1],
+      ["hoove",10,2,80,2,120,1],
+      ["hope",11,2,26,1,29,2,4,2,5,1,27,1,10,2,31,1,3,1,27,1,2,1,2,1,8,1,3,1,10,1,1,1,17,1,6,1,4,1],
+      ["hoped",30,1,73,1,56,1,12,1,2,1],
+      ["hopefully",80,1],
+      ["hopelessly",121,1],
+      ["hoping",119,1],
+      ["hopkin",81,1,13,1],
+      ["horizon",23,1,145,1,21,1,32,1],
+      ["horizontal",40,1,4,1,8,1,15,1,12,1,34,1],
+      ["horizontally",180,1],
+      ["horman",211,1],
+      ["hormone",37,5,57,2,8,1,97,1],
+      ["horn",10,5],
+      ["horne",185,3],
+      ["horny",10,1],
+      ["horribly",114,1],
+      ["horrify",112,1],
+      ["horror",188,1],
+      ["horse",21,1,58,1,17,5,17,2,102,3],
+      ["horseman",111,1],
+      ["horseshoe",1,1],
+      ["horticultural",141,1],
+      ["horvath",168,3],
+      ["hose",23,1],
+      ["hospital",15,1,38,2,30,2,11,1,3,1,14,1,9,5,13,1,58,1,1,1,5,1],
+      ["hospitalized",83,1],
+      ["host",44,1,59,1,7,1,29,1,47,2,4,2],
+      ["hosted",205,1],
+      ["hostel",71,1],
+      ["hostesse",0,1],
+      ["hostile",45,1,16,1,30,1,32,1,1,1,49,1,1,2],
+      ["hostility",42,1,95,1],
+      ["hot",14,1,5,1,32,2,16,1,2,1,10,1,50,1,28,1,1,6,37,1,29,1],
+      ["hotel",15,1,40,1],
+      ["hothouse",225,1],
+      ["hotly",157,1,26,1],
+      ["hotter",137,1,58,1],
+      ["hottest",158,1,15,1],
+      ["hour",2,5,4,1,4,1,10,5,5,1,9,1,1,1,4,17,4,8,12,1,6,1,1,3,10,1,1,1,8,1,4,1,5,1,1,2,1,1,2,4,5,1,6,1,11,1,9,1,1,1,20,1,3,1,13,1,2,3,13,1,2,1,5,1,1,1,4,2,2,1,4,1,3,3,16,1,6,1],
+      ["house",0,1,4,1,31,1,4,3,2,1,3,14,9,3,2,1,4,1,12,1,11,1,5,1,1,2,7,1,1,1,16,2,5,3,1,5,2,2,16,1,11,4,3,2,7,1,12,3,26,6,28,1,2,1],
+      ["housed",119,1],
+      ["household",2,1,39,1,35,2,6,1,14,1,22,1,39,2,9,1,13,3,46,1],
+      ["housewife",126,2],
+      ["housing",15,6,12,1,69,1,22,12,77,2],
+      ["hover",159,2],
+      ["howe",167,2,45,3],
+      ["howell",69,3],
+      ["however",0,2,1,2,1,1,3,2,3,2,3,1,1,1,1,3,1,1,1,7,1,7,4,1,2,2,1,8,1,2,1,3,1,5,2,1,1,1,1,2,2,1,1,4,1,2,1,1,1,1,1,2,3,7,2,4,1,2,1,2,2,2,1,1,2,1,2,1,1,1,1,1,2,2,2,1,1,2,1,2,1,1,1,1,2,1,2,1,1,1,1,1,1,2,1,1,1,1,3,1,2,5,1,3,1,2,3,1,1,5,1,2,1,1,1,1,1,3,1,6,3,2,4,2,1,3,1,2,2,1,5,6,1,1,1,1,1,2,1,3,2,1,3,4,2,2,2,1,1,4,1,3,1,2,3,1,1,2,1,1,1,1,1,1,1,4,1,3,1,2,1,3,1,3,1,5,3,3,1,4,1,2,1,2,2,2,1,1,1,1,1,2,1,1,1,4,1,1,2,2,1,1,3,1,1,4,1,2,1,1,1,4,1,3,2,1,1,1,2,2,1,4,2,3,1,3,1,1,2,1,1,2,2,1,1,2,4,1,2,1,2,1,1,1,2,1,2,3,1,4,1,1,1,3,2,2,2,2,1,2,3,1,1,1,1,1,1,6,1,2,1,2,2,1,1,4,1,1,1,3,1,3,1,2,2,3,1,1,2,1,1,2,3,1,1,2,2,1,1,2,1,6,1,2,1,1,1,1,1,1],
+      ["howl",167,1,45,1],
+      ["howland",83,1],
+      ["howler",143,28],
+      ["hub",29,1,5,1,53,1],
+      ["hubble",13,1],
+      ["huch",7,2],
+      ["huddersfield",194,1],
+      ["hug",155,1],
+      ["huge",9,2,5,1,2,1,3,1,6,1,9,3,1,2,5,1,2,1,6,1,2,1,2,1,3,1,20,2,3,1,10,1,3,1,6,1,2,1,8,1,5,1,5,1,4,1,14,1,3,2,5,1,10,1,1,1,7,1,3,1,6,1,7,1,18,1,7,2,24,1],
+      ["hugely",97,1,12,1,5,1,20,1,3,1,33,1,50,1,2,1],
+      ["hugging",198,2],
+      ["huhu",103,1],
+      ["hull",62,1,4,1,57,1],
+      ["human",1,1,4,1,2,3,1,4,3,5,2,29,1,1,3,1,4,1,1,1,2,2,2,1,1,11,3,2,4,2,3,5,2,6,1,16,3,3,4,7,1,2,2,1,3,1,1,1,1,1,1,3,1,4,1,2,1,2,1,2,1,5,2,2,2,5,6,5,2,3,1,1,1,10,1,1,2,8,1,2,4,2,1,1,1,1,2,1,6,1,1,2,1,3,3,5,1,1,1,1,2,2,2,1,2,8,5,1,3,1,1,16,5,6,2,3,2,1,2,3,1,2,6,1,1,1,1,1,2,1,2,2,1,1,1,1,2,2,3,2,4,7,4,2,1,7,1,2,2,2,2,1,1,2,3,5,3,10,1,1,5,1,1,5,1,1,2,1,4,1,1,1,1,9,2,1,2,3,1,1,1,4,1,1,2,3,1,1,5,9,1,2,5,3,4,8,2,9,2,10,1,4,3,2,6,36,3,1,1,4],
+      ["humane",122,1],
+      ["humanistic",11,1],
+      ["humanitarian",133,2],
+      ["humanity",11,18,4,1,6,1,20,1,32,1,69,1,43,1],
+      ["humankind",13,5,10,1,6,1,50,1,41,1],
+      ["humanoid",198,1],
+      ["humber",120,1],
+      ["humble",22,4,42,1,93,1],
+      ["humbler",54,1,152,1],
+      ["humbling",5,1],
+      ["humid",43,1],
+      ["humidity",124,1],
+      ["humour",162,2],
+      ["humpback",14,3],
+      ["hundred",7,1,4,1,11,1,5,4,3,1,2,1,3,1,2,1,8,1,5,1,2,1,8,1,1,1,8,1,4,1,5,1,12,1,15,1,2,1,2,1,1,2,2,1,11,2,2,1,2,1,12,1,10,1,8,1,7,3,1,1,22,1,4,1,2,1,1,2,1,1,20,1],
+      ["hundredth",27,1,32,1],
+      ["hung",73,1,45,1,33,1],
+      ["hunger",37,1,46,1,11,1,55,1,39,1,13,1],
+      ["hungry",27,1,38,1,31,1,31,2,30,1,25,1,41,1],
+      ["hunt",27,1,25,1,7,1,44,2,35,1,64,1,21,2],
+      ["hunted",75,1,104,3],
+      ["hunter",26,1,17,7,4,2,14,2,14,1,28,1,47,1,29,1,31,2,12,5],
+      ["hunting",5,1,22,1,20,1,28,6,4,1,12,6,24,1,10,2,22,1,75,7],
+      ["hurdle",209,2],
+      ["hurried",192,1],
+      ["hurry",66,2],
+      ["hurt",172,1,42,1],
+      ["husband",4,1,54,1,47,1,6,1,25,1],
+      ["hut",40,1],
+      ["hutt",192,1],
+      ["huxley",4,1],
+      ["huyuk",46,1],
+      ["hyacinth",141,3],
+      ["hyatt",19,1],
+      ["hybrid",22,1,10,2],
+      ["hyde",171,3],
+      ["hydrate",129,2],
+      ["hydrated",129,1],
+      ["hydrochloric",27,1,107,1],
+      ["hydrodynamic",5,1],
+      ["hydrogen",19,1,123,1],
+      ["hydrophone",180,2],
+      ["hyena",27,1,127,1,68,6],
+      ["hygiene",191,4,29,1],
+      ["hygienic",0,1],
+      ["hygroscopic",177,1],
+      ["hyman",18,2],
+      ["hymn",112,1],
+      ["hype",226,1],
+      ["hyperscore",83,1],
+      ["hyperspectral",159,2],
+      ["hypodermic",224,1],
+      ["hypothese",3,1,72,1,36,1,44,1,5,1],
+      ["hypothesis",17,1,40,1,71,2,40,1,19,1,2,2,1,1,31,1],
+      ["hypothesise",185,1],
+      ["hypothesised",21,1,90,1],
+      ["hypothesized",45,1],
+      ["hypothetical",40,1,23,1,19,2,45,1,25,1],
+      ["ian",221,1],
+      ["ibex",10,1],
+      ["ibi",135,2],
+      ["ibm",97,1],
+      ["ica",95,1],
+      ["ice",2,1,19,4,6,3,27,2,7,1,18,2,12,3,23,1,18,4,17,7,7,1,8,9,13,2,33,1,13,2],
+      ["iceberg",91,1],
+      ["icehouse",61,1],
+      ["ichnotaxa",25,4],
+      ["icon",26,1,161,1],
+      ["iconic",189,1],
+      ["id",114,1],
+      ["ida",4,1],
+      ["idea",5,1,1,1,5,1,1,3,1,1,1,2,1,1,1,1,1,1,1,1,5,1,1,2,1,2,1,1,9,1,2,1,2,3,1,2,4,1,10,1,2,1,1,1,1,1,2,1,1,2,1,2,2,1,2,1,1,2,4,1,3,3,1,1,3,1,2,1,1,3,1,6,5,2,5,1,1,1,4,5,4,1,3,1,1,1,1,1,1,1,5,2,1,1,2,2,4,1,1,1,8,2,1,1,2,2,1,2,4,1,1,8,2,1,3,2,3,2,1,2,1,1,2,1,1,5,1,1,1,1,1,1,2,4,1,2,4,1,1,1,2,1,4,4,3,1,1,2,4,2,1,1,1,1,2,1,2,1,5,1,2,1,5,1,2,2,1,1,7,2,1,1,1,2,1,1,1,1,1,4,2,1,2,4,9,2,1,3,4,1],
+      ["ideal",1,1,7,1,6,1,5,1,2,1,8,1,13,1,4,1,2,1,4,1,1,1,84,1,13,1,4,1,34,1,7,4,23,1],
+      ["idealised",41,1],
+      ["ideally",134,1],
+      ["identical",1,1,56,1,4,1,3,1,4,1,4,1,4,1,17,1,81,1],
+      ["identifiable",2,1,4,1],
+      ["identification",2,1,23,1,17,1],
+      ["identified",1,1,5,2,44,1,6,1,2,1,10,1,8,1,8,1,14,1,32,1,15,4,29,1,1,1,28,2,5,1,10,1,6,1],
+      ["identify",2,1,4,2,8,1,7,1,5,1,1,1,10,1,5,1,14,1,2,1,11,1,1,1,8,1,2,1,1,1,3,1,16,2,22,1,19,1,4,2,12,1,9,1,8,1,5,1,25,2,10,1,3,1,1,1],
+      ["identifying",6,3,25,1,66,1,25,1,23,1,29,1,12,1,17,1],
+      ["identity",32,1,86,1,49,1,2,1,17,2,4,1,2,1,20,1,13,1],
+      ["ideology",55,1,97,1],
+      ["idiomatic",86,1],
+      ["idiosyncrasy",205,1],
+      ["idly",18,1],
+      ["ignited",66,1],
+      ["ignorant",171,1,11,1],
+      ["ignore",85,1,9,1,20,2,12,1,36,1,47,1],
+      ["ignored",0,1,16,5,23,1,20,1,27,1,93,3],
+      ["ignoring",6,1,52,1,120,1],
+      ["ii",0,1,3,1,16,1,4,1,117,1,71,1],
+      ["iii",3,1,109,1,11,1,71,1],
+      ["ill",4,2,37,1,49,1,30,1,28,1,40,1,9,1,12,1],
+      ["illegal",88,1],
+      ["illegality",62,1],
+      ["illegitimate",41,1],
+      ["illiterate",15,1,164,1],
+      ["illness",17,1,64,1,90,1],
+      ["illnesse",43,1,29,1,22,1,97,2],
+      ["illuminate",27,1,36,1,151,1],
+      ["illuminating",113,1,7,1,67,1],
+      ["illusion",5,1,13,1,75,1,68,1,27,1],
+      ["illusionist",89,1],
+      ["illusory",122,1],
+      ["illustrate",55,1,21,1,13,2,12,1,85,2],
+      ["illustrated",42,1,4,1,9,2,91,1,36,1],
+      ["illustration",105,4,52,1,22,1,11,1],
+      ["illustrator",105,1],
+      ["image",13,1,4,2,1,1,8,4,1,1,3,1,27,1,6,1,4,1,4,1,11,1,8,1,8,8,2,1,6,1,8,4,8,1,22,1,15,4,11,1,3,1,4,2,23,1,22,1],
+      ["imagery",17,1,13,1,51,1,120,1,4,1],
+      ["imaginable",142,1],
+      ["imaginary",37,1],
+      ["imagination",92,1,52,1,33,1,10,1,1,1],
+      ["imaginative",11,1,56,1,25,2,90,1,1,2,23,1],
+      ["imaginatively",211,1],
+      ["imagine",1,1,17,4,36,1,21,1,3,1,20,1,4,1,29,1,15,1,19,1,7,1,27,1],
+      ["imagined",42,2,83,1,57,1],
+      ["imaging",17,1,1,1,12,2,63,1,81,1,23,1,29,2],
+      ["imagining",18,1,39,1,3,1,82,1,45,1],
+      ["imbalance",11,1],
+      ["imitate",89,1,3,1,75,2,40,5,5,2],
+      ["imitated",207,8],
+      ["imitating",89,1],
+      ["imitation",14,1,75,1,19,5,1,1,50,1,8,1,40,2,5,1],
+      ["imitator",188,1],
+      ["immediate",20,1,6,1,8,1,16,1,8,1,16,1,60,1,21,1,7,1,19,1,1,1,7,1,11,3],
+      ["immediately",0,1,23,1,8,1,30,1,31,1,1,1,4,1,16,1,2,2,3,1,12,2,7,1,7,1,27,1,7,1,4,1,3,1,7,1,8,1],
+      ["immense",22,1,28,2,37,1,50,2,23,1,28,1],
+      ["immersed",79,1,50,1,89,1],
+      ["immersion",198,1],
+      ["immigrant",46,1,31,1,40,1,1,2,89,1],
+      ["immobilising",96,1],
+      ["immortal",9,1],
+      ["immune",83,1,66,1,47,1,24,1],
+      ["imogen",12,1],
+      ["impact",9,2,7,1,9,5,9,2,3,1,7,1,10,1,1,1,8,3,2,1,9,1,16,2,6,2,3,5,1,1,2,2,14,1,4,3,2,5,11,1,1,1,2,1,1,2,4,8,1,1,9,2,4,1,15,1,6,2,12,1,10,1,1,2,15,3],
+      ["impacted",61,1],
+      ["impaired",53,2,53,1,70,1,21,1],
+      ["impairment",93,1,7,1,104,4],
+      ["impart",14,1,149,2],
+      ["impartial",188,1],
+      ["impassive",69,1],
+      ["impeccably",137,1],
+      ["impede",92,1,128,1],
+      ["imperative",84,1,86,1],
+      ["imperfect",207,1],
+      ["imperial",64,1,13,1,10,1,1,1,81,1],
+      ["impermeable",135,1,16,1],
+      ["impersonal",8,1,55,1,22,1],
+      ["impersonate",89,3],
+      ["impersonation",89,1],
+      ["impervious",23,1],
+      ["impetus",41,1,47,1,82,1],
+      ["implanted",108,2],
+      ["implausible",93,1,99,1],
+      ["implement",210,1],
+      ["implementation",49,1,7,4],
+      ["implemented",186,1],
+      ["implication",6,1,20,1,13,1,1,1,36,1,58,1,18,1,7,1,19,1,28,1,7,1],
+      ["implicitly",41,1,172,1],
+      ["imply",6,1,33,1,1,1,2,1,18,1,9,1,3,1,41,1,18,1,17,1,6,1,31,1,21,1],
+      ["import",23,2,43,1,22,3],
+      ["importance",0,1,14,1,1,4,8,1,5,1,9,1,7,1,12,1,21,1,1,1,8,1,3,1,1,1,2,4,7,1,4,1,1,4,4,1,8,1,8,1,23,1,1,2,2,1,12,2,4,1,5,1,12,1,5,1,3,1,31,1],
+      ["important",1,1,7,1,1,2,1,1,1,3,1,1,1,1,1,1,1,1,2,1,5,1,1,2,3,3,4,2,2,1,1,1,1,1,2,2,1,1,1,1,1,1,3,2,1,1,7,1,2,3,1,1,1,1,2,2,7,1,1,1,1,3,2,4,1,2,8,2,1,2,2,1,1,1,2,1,4,1,2,1,4,1,1,2,1,1,1,1,4,3,2,1,3,3,2,1,1,2,8,1,3,2,3,1,1,1,14,1,4,1,2,1,1,1,2,1,1,1,1,1,1,2,1,1,6,1,8,3,3,2,2,1,4,2,5,1,1,2,3,2,1,2,1,1,4,1,2,1,2,2,2,1,4,1,1,2,2,1,3,1,1,1,1,3,1,3,1,1,1,2,1,1,2,1,3,3,1,1,1,1,2,1,2,2,1,1,1,1,1,1,3,2],
+      ["importantly",6,2,37,1,40,1,1,1,28,1,7,1,1,1,50,1,18,1,33,1],
+      ["importation",0,1],
+      ["imported",0,1,1,1,15,1,7,1,15,3,9,1,29,1,12,1,29,1,15,1,6,1,3,1,61,1,9,1],
+      ["importing",88,2,46,1],
+      ["imposed",8,1,104,1,10,2,3,1,15,1,68,1],
+      ["imposing",112,1],
+      ["imposition",125,1],
+      ["impossibility",58,1],
+      ["impossible",1,1,2,1,54,1,29,1,2,1,5,1,18,1,37,1,4,1,6,1,17,1,6,1,6,1,5,1],
+      ["impoverished",101,1,23,1],
+      ["impractical",113,1],
+      ["imprecision",6,1],
+      ["impress",67,1,5,1,116,2],
+      ["impressed",30,1,9,1,8,1,46,1,48,1,34,1],
+      ["impressing",176,1],
+      ["impression",13,1,32,1,9,1,13,1,47,1,36,1,1,1,24,1,9,2],
+      ["impressionist",170,1],
+      ["impressive",27,1,4,1,58,1,2,2,20,1,34,2,11,1,14,1,3,1,25,2,5,2],
+      ["imprisoned",64,1,128,1],
+      ["improbable",185,1,2,1],
+      ["improve",8,1,5,1,10,7,10,1,2,1,18,1,5,1,5,1,20,1,17,1,1,1,19,1,2,3,16,1,12,1,1,1,2,1,10,4,3,1,6,1,13,1,6,1,10,1,1,1,24,1],
+      ["improved",1,1,7,1,15,1,7,1,9,1,7,1,7,1,12,1,28,1,11,1,13,1,6,1,43,1,4,1,28,3,8,1,20,1],
+      ["improvement",15,1,18,2,6,1,33,1,11,1,13,2,5,2,20,1,1,3,10,1,21,1,2,1,8,1,13,2,24,1,26,1],
+      ["improving",53,5,43,1,1,1,4,1,4,1,7,1,41,1,10,2,37,1,1,2,23,1,2,1],
+      ["improvised",162,1],
+      ["impulse",5,1,55,1,12,1,22,1,106,2],
+      ["impulsively",200,1],
+      ["impure",51,1,162,1],
+      ["impurity",218,2],
+      ["inability",204,1,16,1],
+      ["inaccurate",16,1,15,1,144,1],
+      ["inactive",63,2,18,4],
+      ["inadequacy",8,1,163,1],
+      ["inadequate",152,1],
+      ["inadvertently",22,1],
+      ["inalienable",183,1],
+      ["inappropriate",56,1],
+      ["inaudibly",206,1],
+      ["inborn",2,1,37,1],
+      ["inbred",22,1],
+      ["inbreeding",14,1,130,1],
+      ["inca",99,4],
+      ["incan",99,1],
+      ["incapable",68,1],
+      ["incense",123,1],
+      ["incentive",90,1,22,1,17,1],
+      ["inception",134,1],
+      ["incestuous",157,1],
+      ["inch",91,1],
+      ["inche",45,1,68,1],
+      ["incidence",191,2,23,2],
+      ["incident",214,3],
+      ["incidental",122,1],
+      ["incidentally",175,1],
+      ["incineration",134,7],
+      ["incinerator",134,1],
+      ["incisor",10,2],
+      ["inclination",155,1],
+      ["inclined",37,1,61,1,58,1],
+      ["include",8,1,2,3,6,2,6,1,10,1,1,1,11,1,1,2,6,1,2,2,8,1,3,1,1,1,20,1,6,6,12,1,2,1,2,1,8,1,1,1,1,1,7,1,4,1,7,3,5,1,1,1,1,4,1,1,2,1,1,1,4,1,11,1,17,1,6,1,5,1,2,2,10,1,2,1,3,1,1,4,7,2,10,1],
+      ["included",19,1,9,1,1,2,7,4,17,1,8,1,5,1,11,1,20,1,10,1,29,1,33,2,13,1,2,2,16,1,5,1],
+      ["including",3,1,1,1,6,1,1,1,8,1,4,1,1,1,2,1,2,1,12,1,4,1,2,1,2,2,2,1,1,2,9,1,2,1,2,2,1,1,12,1,1,1,7,1,3,1,2,1,1,8,6,1,4,2,1,5,1,2,8,1,4,1,5,1,1,1,8,1,11,2,4,1,3,2,7,1,4,1,5,1,1,1,1,2,1,1,3,2,2,1,5,1,4,1,3,1,3,1,5,2,7,1,1,5,1,1,10,3,1,1,10,1,3,1],
+      ["inclusion",44,1,47,1],
+      ["inclusive",74,1],
+      ["income",32,1,38,2,6,1,25,1,1,1,7,1,8,1,1,2,6,1,29,1,13,1,25,1,8,1],
+      ["incoming",68,1,3,1,7,1,3,1],
+      ["incomparable",108,1,21,1],
+      ["incomplete",169,1,23,1],
+      ["inconceivable",21,1],
+      ["inconsistency",17,1,193,1],
+      ["inconsistent",1,1],
+      ["inconspicuous",89,1,85,1],
+      ["incontrovertible",178,1],
+      ["inconvenient",60,1],
+      ["incorporate",14,1,30,1,76,1],
+      ["incorporated",19,1,11,1,99,1,7,2,22,1],
+      ["incorporating",19,1,132,1,18,2],
+      ["incorporation",54,1],
+      ["incorrect",160,1],
+      ["incorrectly",215,1],
+      ["incorruptibility",109,1],
+      ["increase",2,3,7,2,2,1,2,5,7,1,2,1,2,4,1,3,1,1,11,1,10,4,1,3,8,1,8,1,5,1,5,1,3,2,5,1,3,1,4,1,5,1,2,2,6,1,4,5,13,1,7,1,9,1,3,2,2,1,3,1,9,1,6,1,2,1,1,2,1,1,2,1,2,2,18,3,1,1,8,2,1,1,5,1,2,2,1,2,8,1,6,1,6,1,4,2],
+      ["increased",0,2,2,1,5,4,1,1,5,1,6,1,4,7,1,1,1,1,3,1,8,1,1,1,8,1,1,4,9,1,5,1,1,1,5,1,11,1,4,1,7,1,9,1,15,1,5,1,3,2,6,1,8,3,7,1,2,1,23,1,4,1,24,2,4,2,9,1,14,1,3,1,1,1],
+      ["increasing",11,1,25,1,12,1,7,3,32,1,12,1,8,1,6,1,4,2,16,1,1,1,18,1,10,1,8,1,16,1,2,1,18,1,18,1,1,1],
+      ["increasingly",11,1,2,1,7,1,6,1,4,1,9,1,8,1,26,1,2,1,9,1,16,1,9,1,19,1,8,1,3,1,1,1,3,1,7,1,2,1,4,1,10,1,34,3,5,1,9,1,3,1,5,1,2,1,2,1],
+      ["incredible",59,1,56,1,43,1,6,5],
+      ["incredibly",89,1],
+      ["incubate",81,1,22,1,7,1],
+      ["incubation",110,1],
+      ["indeed",24,1,1,1,1,1,31,1,3,1,3,1,5,1,15,1,15,1,23,1,12,1,19,1,1,2,1,1,1,1,5,2,8,2,15,1,2,1,16,1,7,2,2,1,1,1,2,1,2,3],
+      ["indefatigable",64,1],
+      ["indefinable",45,1],
+      ["indefinitely",52,1],
+      ["independence",8,2,7,1,41,1,116,3],
+      ["independent",5,1,3,1,97,1,9,1,8,1,82,1,9,1,7,1],
+      ["independently",177,1,20,1],
+      ["indestructibility",19,1],
+      ["india",38,2,28,2,10,4,1,1,10,1,1,7,10,1,3,1,1,1,6,4,3,1,1,1,46,2,41,1],
+      ["indiaman",66,1],
+      ["indiamen",66,3],
+      ["indian",10,1,5,1,8,1,23,2,20,1,10,1,23,1,26,1,33,1],
+      ["indiana",101,1],
+      ["indicate",1,1,2,1,15,1,2,1,1,1,6,2,10,1,8,1,1,1,1,1,1,1,2,3,6,1,1,1,3,1,7,1,1,1,3,1,2,1,4,1,8,1,13,1,1,1,5,1,6,1,5,1,8,1,31,2,1,3,15,1,7,1,29,1,2,2,8,1,2,1,6,1],
+      ["indicated",50,1,10,1,7,1,25,1,8,4,122,1],
+      ["indicating",43,1,3,1,62,1,47,1,18,1,28,1,3,1,6,1],
+      ["indication",25,3,14,1,29,1,79,1,74,1],
+      ["indicator",25,1,103,2,52,1,21,1],
+      ["indifference",144,1],
+      ["indigenous",23,1,72,1,22,2,18,1,8,1,8,1,36,1,18,1],
+      ["indigo",38,2],
+      ["indirect",65,1,102,1,45,1],
+      ["indirectly",39,1,150,1,16,1,15,1],
+      ["indiscriminate",108,1,106,1],
+      ["individual",2,2,4,3,1,1,1,2,1,2,2,2,1,2,3,5,5,4,6,1,2,2,2,1,11,2,4,1,2,2,9,4,1,1,13,1,18,2,1,1,4,1,5,2,8,4,4,3,8,1,1,1,2,1,4,1,1,1,1,1,4,3,9,1,1,1,4,1,3,1,4,2,4,1,9,3,2,1,7,1,4,1,3,1,17,1,5,1,5,1,4,1,9,1,1,1,1,1],
+      ["individualised",24,1],
+      ["individualism",205,1],
+      ["individualistic",26,1],
+      ["individually",69,1,37,1,53,1,47,1,3,1,5,1],
+      ["indo",111,1],
+      ["indonesia",25,3,83,1],
+      ["indonesian",25,1],
+      ["indoor",77,1],
+      ["induce",155,1,66,2],
+      ["induced",72,1,61,1,22,1,66,1],
+      ["inducing",200,1],
+      ["induction",170,1],
+      ["indulgence",34,1,7,1],
+      ["indulgent",211,1],
+      ["indulging",200,1],
+      ["industrial",5,1,3,1,5,1,10,9,16,1,2,2,2,3,19,1,15,1,7,1,10,1,5,2,13,2,6,1,6,1,13,1,3,1,1,1,9,1,16,2,28,1,32,1],
+      ["industrialised",43,1,58,1],
+      ["industrialized",43,1,152,1],
+      ["industrially",32,1],
+      ["industry",1,1,8,3,7,2,3,2,4,8,6,1,4,7,1,4,7,1,3,1,2,1,2,1,5,3,2,2,6,1,16,5,2,1,11,1,9,1,8,2,1,3,6,1,3,14,2,1,3,1,7,1,2,1,1,2,7,1,1,13,2,1,13,1,7,1,2,1,15,1,14,1,1,13,15,1,2,1,6,1,1,1,6,1],
+      ["indy",180,1],
+      ["inedible",61,1,41,1,97,1],
+      ["ineffective",69,1],
+      ["ineffectiveness",65,1],
+      ["inefficiency",181,1],
+      ["inefficient",59,1,6,1,47,2],
+      ["inequality",87,1,22,1],
+      ["inertia",132,2],
+      ["inescapable",104,1],
+      ["inevitability",3,1],
+      ["inevitable",86,4,23,1,3,1,93,1],
+      ["inevitably",47,1,62,1,48,1,5,1,9,1,4,1,3,1,12,1,17,1],
+      ["inexact",86,1],
+      ["inexpensive",62,1,45,1,33,1,54,1,7,1],
+      ["inexperienced",131,1],
+      ["inexplicable",83,1],
+      ["inextricably",223,1],
+      ["infancy",211,1,6,1],
+      ["infant",57,1,17,1,9,1,16,1,44,1,17,1,7,1,7,9,19,1,19,1],
+      ["infected",65,1,74,1],
+      ["infection",22,2,115,1,2,1,19,2,33,2,29,1],
+      ["infectious",106,1,76,1],
+      ["inference",93,2,59,1],
+      ["inferior",95,1,57,1],
+      ["infestation",48,1,145,1,28,1],
+      ["infested",112,1,1,1,22,1,86,1],
+      ["infiltrate",135,1,84,1],
+      ["infiltrated",56,1],
+      ["infiltration",207,1],
+      ["infinite",157,1,25,1,40,1],
+      ["infinitely",183,1],
+      ["infirmity",82,1],
+      ["inflection",100,2],
+      ["inflexible",52,1],
+      ["inflicted",157,1],
+      ["influence",1,1,1,1,13,1,7,1,19,1,1,1,1,1,26,1,2,1,1,1,2,1,4,1,36,1,10,1,6,1,4,3,14,1,1,1,6,2,1,2,4,1,11,3,9,1,25,1,2,5,2,1,6,1],
+      ["influenced",6,1,65,1,7,1,50,1,8,1,9,2,22,1,4,1,16,1,16,1,9,1],
+      ["influencing",43,1,17,2,69,1],
+      ["influential",71,2,7,1,62,1,12,1,5,1,14,1,8,1,29,2,17,1],
+      ["influx",22,1,1,1],
+      ["inform",11,1,75,1,73,1],
+      ["informal",8,1,4,1,119,1],
+      ["information",0,1,2,2,7,1,5,3,7,1,7,1,3,1,1,1,4,1,17,5,3,4,2,2,2,1,3,1,4,3,3,2,10,1,1,1,1,1,3,1,1,5,7,1,1,1,3,1,1,1,3,1,1,5,9,1,1,1,2,4,8,1,4,3,1,1,1,5,9,1,11,1,4,1,1,1,3,3,3,1,1,1,6,41,2,1,2,1,3,1,1,2,2,2,1,1,2,2,1,1,1,3,4,1,1,1,3,1,1,1,9,5,2,4,7,1,11,1,2,1,1,1,4,1],
+      ["informative",3,1,97,4],
+      ["informed",9,3,71,1,130,1],
+      ["informing",173,1],
+      ["infoterra",201,2],
+      ["infrared",195,1],
+      ["infrasonic",154,1],
+      ["infrasound",154,1],
+      ["infrastructure",13,1,71,1,12,1,21,2],
+      ["infrequent",117,1,74,2],
+      ["infringement",178,1],
+      ["infuriate",213,1],
+      ["infused",0,1],
+      ["infusing",188,1],
+      ["infusion",88,1],
+      ["ingall",96,1],
+      ["ingenious",62,1,47,1,7,1,5,1,39,1],
+      ["ingenuity",160,1,4,1],
+      ["ingested",103,1],
+      ["inglorious",125,1],
+      ["ingrained",51,1],
+      ["ingredient",29,1,33,1,10,1,50,1,7,1,29,1,59,1],
+      ["inhabit",26,1,84,1,14,1,11,1],
+      ["inhabitant",16,1,11,1,69,1,27,1,14,1,50,1],
+      ["inhabited",75,3,34,1,63,1,38,1],
+      ["inhalation",3,4],
+      ["inhale",3,1,161,1,56,1],
+      ["inherent",6,1,41,1,81,1,43,1,33,1,4,1],
+      ["inherently",60,1,36,1,26,1],
+      ["inherit",197,1],
+      ["inheritance",105,1,77,1,6,1],
+      ["inherited",14,2,11,1,33,1,72,1,20,2,44,1],
+      ["inhibit",54,1,167,1,3,1],
+      ["inhibiting",139,1,35,1],
+      ["inhibition",81,1],
+      ["initial",12,2,1,3,13,1,2,1,11,1,1,1,13,1,9,1,13,1,30,1,6,1,21,1,1,1,9,1,17,1,12,1],
+      ["initially",12,1,12,1,3,1,13,1,40,1,4,1,6,1,3,1,25,1,14,1,9,1,4,1,4,1,8,1,1,1,6,1,11,6,17,2,2,1,4,1,5,1,14,1,1,1],
+      ["initiate",37,3,55,1,63,1],
+      ["initiated",34,1,51,1],
+      ["initiating",104,1,20,1],
+      ["initiative",16,1,17,1,89,4,31,1,9,1,1,1,28,1,15,1,5,1],
+      ["inject",53,1,29,1],
+      ["injected",53,1],
+      ["injecting",162,1],
+      ["injector",53,1],
+      ["injured",65,1,156,1],
+      ["injuring",65,1],
+      ["injury",20,3,38,1,41,1,11,1,21,1,60,1],
+      ["injustice",146,5],
+      ["ink",97,2,10,1,65,1,42,1],
+      ["inkling",121,1],
+      ["inland",35,1,90,1,10,1,89,1],
+      ["inn",0,2],
+      ["innate",2,1,4,1,41,2,47,1,27,1,9,1,20,1,47,1,7,1],
+      ["inner",60,1,10,1,38,1,4,2,23,2,19,2,21,1,49,1],
+      ["innkeeper",0,1,157,1],
+      ["innocent",216,1],
+      ["innovation",5,1,21,1,12,1,8,1,7,3,2,1,18,4,9,1,22,1,8,1,5,1,5,2,5,1,13,2,21,1,9,1],
+      ["innovative",1,1,22,1,21,1,29,1,54,1,5,1,1,1,37,1,12,1],
+      ["inordinate",174,1],
+      ["input",12,1,2,1,20,1,14,1,100,1,18,1,31,1],
+      ["inquiry",36,2,5,2,137,1],
+      ["insanity",195,1],
+      ["inscribed",67,2,56,1],
+      ["inscription",31,1,36,2,56,2,46,2],
+      ["insect",5,1,5,1,28,1,13,2,5,17,3,6,2,1,4,9,24,3,12,1,34,4,2,2,2,1,2,3,13,1,5,10,14,4,20,2,27,1,1,4,3,3],
+      ["insecticide",224,1],
+      ["insectivorous",59,1],
+      ["insecurity",41,1,61,1,97,1],
+      ["inserm",197,1],
+      ["insert",22,1],
+      ["inserted",22,1,24,1,73,1,38,1,61,2],
+      ["inside",7,1,8,1,3,5,3,1,9,2,1,3,19,1,7,6,1,1,1,5,4,4,4,2,3,1,7,1,1,1,1,1,5,1,14,1,21,2,1,1,3,2,2,1,8,1,10,4,3,1,3,1,2,2,4,1,15,1,3,1,23,1,21,1,1,1],
+      ["insider",26,1],
+      ["insidious",165,1],
+      ["insight",12,1,12,1,17,1,27,1,13,1,1,1,18,1,9,1,4,1,14,1,15,1,32,1,16,2,8,1,8,1,2,1,8,1],
+      ["insightful",12,1,82,1],
+      ["insigni",179,1],
+      ["insignificant",17,1],
+      ["insist",101,1,43,1,1,1,15,1,2,1,1,1,12,1,28,1,10,1],
+      ["insisted",105,2,40,1,58,1,2,1],
+      ["insomnia",39,1,55,1,126,18],
+      ["insomniac",220,3],
+      ["inspected",213,1],
+      ["inspecting",98,1],
+      ["inspection",118,1,95,2],
+      ["inspector",109,1,104,1],
+      ["inspiration",4,1,1,1,12,1,14,1,10,1,3,1,37,5,48,1,7,1,4,1,19,3,23,1],
+      ["inspire",173,1],
+      ["inspired",5,4,18,1,8,1,44,1,41,1,20,1,23,4,1,1,66,1],
+      ["inspiring",63,1],
+      ["instability",75,1],
+      ["install",97,1,98,1],
+      ["installation",129,1,36,1,30,1],
+      ["installed",68,1,101,1],
+      ["instance",6,1,41,1,7,1,4,1,20,1,2,1,2,1,1,1,9,2,2,1,2,1,6,1,6,1,8,1,7,1,7,1,1,1,10,1,1,1,4,1,7,1,5,1,3,2,5,1,18,3,5,1,4,1,6,1,10,2,11,1],
+      ["instant",34,1,54,1,82,1,18,1,26,1],
+      ["instantly",0,1,89,1,25,1,15,1,87,1],
+      ["instead",1,1,4,1,3,1,10,1,2,1,12,1,11,1,3,1,3,1,17,1,1,1,1,2,2,1,4,1,1,1,1,1,20,1,5,1,1,5,3,1,2,1,5,1,1,2,2,1,7,1,4,2,1,1,2,1,2,1,1,1,4,1,2,1,4,1,5,1,2,1,5,1,1,1,1,2,2,1,23,1,2,1,5,1,6,1,5,5,1,3,2,1,17,2,3,1],
+      ["instinct",49,1,33,1,48,1,74,1],
+      ["instinctive",3,1,44,1,29,1,54,1],
+      ["instinctively",215,1],
+      ["instinctual",106,1],
+      ["institute",5,1,2,2,17,1,3,1,31,1,13,1,12,1,8,1,6,1,18,1,7,1,4,1,16,1,3,1,11,1,23,1,2,1,11,1,5,1,1,2,5,1,17,1],
+      ["institution",7,1,9,4,12,1,27,3,40,1,2,1,4,5,3,1,7,2,11,1,6,1,19,1,2,1,2,1,7,1,5,1,7,4,18,1,18,1,3,1],
+      ["institutional",41,1,83,1],
+      ["institutionalized",219,2],
+      ["instruct",159,1],
+      ["instructed",85,4,7,1,34,1,72,1],
+      ["instruction",2,1,11,1,36,1,4,1,21,1,12,1,21,1,24,3,9,2,36,1,13,2,9,1,27,1],
+      ["instructional",163,1],
+      ["instructive",209,1],
+      ["instrument",7,2,8,2,8,1,23,17,4,1,17,1,4,1,6,2,3,1,20,1,21,1,25,2,21,1,1,2,8,15,1,2,3,3,32,1,6,1],
+      ["instrumental",34,1,77,1,35,2,34,1,42,1],
+      ["instrumentation",168,1],
+      ["insubstantial",147,1],
+      ["insufficient",59,1,48,1,101,3,12,8],
+      ["insulated",195,1],
+      ["insulating",19,1],
+      ["insulation",19,2,43,1,133,2],
+      ["insulator",19,3,176,1],
+      ["insurance",20,5,79,1,102,2],
+      ["insurer",20,1],
+      ["intact",83,1,138,1],
+      ["intake",24,1,52,3,44,1,58,1,42,1],
+      ["intangible",47,1,20,1,84,1],
+      ["integral",34,1,88,1,15,1],
+      ["integrate",84,1,34,1,2,1,39,1],
+      ["integrated",34,1,22,1,8,1,53,1,3,1],
+      ["integrating",84,1],
+      ["integration",36,1,5,1,28,1,117,1],
+      ["integrative",36,2],
+      ["integrator",159,1],
+      ["integrity",44,1],
+      ["intel",209,3],
+      ["intellectual",86,1,41,1,49,1,7,1,3,1,4,1,18,1,14,1],
+      ["intellectually",114,1],
+      ["intelligence",6,2,7,1,23,3,45,1,46,2,33,2,6,2,1,1,31,2,3,1,3,1,8,1],
+      ["intelligent",13,1,68,1,13,1,4,1,29,8,50,1],
+      ["intended",1,2,10,1,13,1,2,1,2,1,25,1,11,3,4,1,11,2,7,1,18,1,9,2,27,1,8,1,27,1,9,1,4,1,13,1,17,1],
+      ["intense",17,1,9,1,58,1,6,1,65,4,8,1,12,2,10,1,40,1],
+      ["intensification",118,1],
+      ["intensified",34,1,5,1],
+      ["intensify",161,1],
+      ["intensity",3,1,27,1,35,1,18,1,53,1,4,1],
+      ["intensive",83,1,19,2,16,1,1,1,14,1,7,1,22,1,37,2,24,1],
+      ["intent",157,1,18,1],
+      ["intention",26,1,5,1,35,1,61,1,35,1],
+      ["intentional",58,1],
+      ["intentionally",141,1,7,1],
+      ["intentioned",175,1],
+      ["inter",3,1,179,1],
+      ["interact",16,1,49,1,101,1,6,1,26,1,21,1,2,1,4,1],
+      ["interacting",92,1],
+      ["interaction",14,1,22,4,11,1,7,2,6,4,5,1,9,1,11,3,50,1,3,1,14,1,3,1,5,1,10,1,6,1,22,9,4,1,5,1,14,1,1,2,2,1,1,1],
+      ["interactive",63,1,88,1,68,1],
+      ["intercept",69,1],
+      ["interdependence",56,1,66,2],
+      ["interdependent",146,4],
+      ["interest",0,1,4,2,5,2,2,2,4,6,1,2,7,9,8,1,5,3,2,2,3,1,22,1,18,1,19,1,5,1,3,1,5,1,3,1,1,1,14,1,1,1,4,2,4,1,6,1,5,1,2,1,3,2,1,1,3,1,5,1,3,2,2,1,1,1,8,1,7,1,2,1,10,3,8,1,2,1,2,1,1,1],
+      ["interested",4,1,12,4,21,1,13,1,4,1,9,1,27,1,15,1,6,1,3,1,2,1,3,1,10,1,7,1,6,1,1,1,14,1,11,1,37,3,1,1,10,1],
+      ["interesting",6,1,6,1,22,1,57,1,95,1,18,1,9,1,7,1,1,2,5,1],
+      ["interestingly",18,4,36,1,27,4,46,1,12,1,26,1,11,1,9,1,32,1],
+      ["interface",154,1],
+      ["interfere",116,1,4,1,78,1],
+      ["interference",128,1,53,1],
+      ["interior",30,1,4,1,10,3,74,3,2,1,31,1,49,1],
+      ["interlocking",59,1],
+      ["intermediate",73,1,101,1,46,1],
+      ["intermittently",210,1],
+      ["internal",8,1,22,2,46,3,46,1,37,1,2,1,5,1,7,2],
+      ["internalization",42,1],
+      ["internalize",57,1],
+      ["internalized",42,1],
+      ["internally",60,1,62,1],
+      ["international",9,3,7,2,12,1,4,1,2,1,10,1,5,2,17,1,16,1,1,1,3,4,5,2,4,1,1,1,4,1,4,2,13,1,12,2,11,4,1,2,1,1,17,1,3,3,8,2,18,1,6,1,2,1,5,1,24,1],
+      ["internationally",37,1,7,1,73,2,23,1],
+      ["internet",9,1,6,1,15,1,13,1,27,4,30,1,4,1,10,1,48,2,44,2],
+      ["interpersonal",54,1,94,1],
+      ["interplant",221,1],
+      ["interplay",7,1],
+      ["interpret",93,1,5,2,2,1],
+      ["interpretation",12,2,29,1,107,1,7,3,2,1,21,2,12,1,25,1],
+      ["interpreted",12,1,9,1,5,1,122,1,21,1,37,1],
+      ["interpreter",43,1,119,6],
+      ["interpreting",74,1,12,1],
+      ["interrelationship",122,1],
+      ["interrupt",126,2],
+      ["interrupted",18,1,21,1,87,1,55,2],
+      ["intersect",122,1],
+      ["intersected",84,1],
+      ["intersection",31,2,39,1,14,1,113,1],
+      ["interspersed",114,1],
+      ["interval",3,1,15,1,7,1,69,1,73,1,37,1,8,1],
+      ["intervene",160,1],
+      ["intervention",13,2,11,1,25,1,35,1,49,1,41,1],
+      ["interview",26,2,17,1,39,2,1,1,92,2,45,1],
+      ["interviewed",42,1,56,1,53,1],
+      ["interwar",109,1],
+      ["intestine",125,1],
+      ["intimacy",60,1,165,1],
+      ["intimate",85,2,8,1,62,1,70,1],
+      ["intimately",9,1,62,1,7,1,130,1],
+      ["intimidated",151,1],
+      ["intolerable",113,1],
+      ["intolerant",73,1],
+      ["intonation",83,1,121,1],
+      ["intoxicating",57,1],
+      ["intractable",152,1],
+      ["intrathecally",53,1],
+      ["intravenously",53,1],
+      ["intrepid",91,1],
+      ["intricate",47,1,5,1,11,1,110,1,46,1],
+      ["intricately",167,1,45,1],
+      ["intrigued",0,1,68,1,51,1,41,1,7,1,45,1],
+      ["intriguing",34,1,13,1,74,1,18,1,38,1,40,1],
+      ["intriguingly",210,1],
+      ["intrinsic",41,1,119,1,11,1],
+      ["introduce",69,1,42,1,30,1,15,1,14,2,23,1,20,1],
+      ["introduced",0,1,1,1,28,2,3,1,14,3,10,1,5,1,6,1,5,1,3,3,3,2,2,1,3,1,4,1,1,1,2,1,2,1,11,1,4,1,2,1,1,1,1,1,21,1,3,1,2,2,1,3,3,5,39,1,7,4,6,3,5,2,4,3,5,4,7,1],
+      ["introducing",78,1,41,1,44,1,30,1,5,1],
+      ["introduction",75,1,2,1,26,1,7,2,1,1,30,4,29,1,17,1,6,3],
+      ["introductory",148,1],
+      ["introspection",149,1],
+      ["introvert",172,1],
+      ["introverted",85,1],
+      ["intrude",91,1],
+      ["intrusion",40,1],
+      ["intrusive",18,1,96,1],
+      ["intuitive",152,1],
+      ["intuitively",81,1,74,1],
+      ["inuit",61,1],
+      ["invade",87,1,56,1],
+      ["invaded",107,1,3,2,31,1,53,1],
+      ["invader",141,2],
+      ["invading",65,1,59,1,17,1,36,1],
+      ["invaluable",152,1,21,1,41,1,3,1,2,1],
+      ["invariably",14,3,95,1,53,1],
+      ["invariant",3,1],
+      ["invasion",16,1,32,1,29,1,13,3,79,2,8,1,17,1],
+      ["invasive",141,17,33,1],
+      ["invent",74,1,39,1,14,1,33,1,51,1,6,2],
+      ["invented",7,1,6,1,6,1,4,9,34,1,4,1,18,1,25,2,3,3,32,1,51,1,27,1],
+      ["inventing",104,1,56,1],
+      ["invention",7,1,16,1,18,1,20,2,1,2,35,1,8,1,2,1,5,1,14,1,1,2,13,4,5,2,27,1,22,1],
+      ["inventiveness",59,1],
+      ["inventor",19,1,153,1,16,1],
+      ["inventory",73,2,24,1],
+      ["invertebrate",103,1,7,3,25,3],
+      ["invest",6,2,22,1,19,1,81,1,81,1],
+      ["invested",137,1,25,1],
+      ["investigate",2,1,16,1,19,1,3,1,45,1,2,1,13,1,24,1,21,3,9,1,11,1,8,1,30,2,8,1],
+      ["investigated",34,1,9,1,73,1,39,1],
+      ["investigating",90,1,10,2,17,1,12,1,13,1,2,1,1,1,29,1,29,1],
+      ["investigation",34,1,2,1,17,1,22,1,10,1,24,1,7,1,26,1,26,3,12,1,12,1],
+      ["investigator",36,3,117,1,15,1,12,2],
+      ["investing",28,5,100,2],
+      ["investment",20,1,53,1,7,1,10,1,7,2,2,1,18,2,5,1,6,19,5,1,9,1],
+      ["investor",128,7],
+      ["invisible",30,1,38,1,18,1,3,1,83,1,23,1],
+      ["invitation",155,1],
+      ["invite",142,1],
+      ["invited",179,1],
+      ["inviting",205,1],
+      ["involuntarily",106,1],
+      ["involuntary",18,1,157,1],
+      ["involve",3,2,10,2,13,1,11,1,16,1,2,1,5,1,12,1,1,1,2,1,7,2,1,1,29,1,9,2,1,1,5,1,4,1,3,1,8,1,11,2,10,1,22,2,4,3,1,1,10,1,14,1,10,1],
+      ["involved",0,1,2,4,7,1,3,1,3,1,3,1,22,1,1,1,1,1,9,1,2,1,1,1,3,2,4,1,10,1,1,2,8,2,6,2,7,1,4,1,3,1,3,1,15,1,1,1,22,1,1,1,6,2,1,1,2,1,2,1,2,1,1,1,13,1,6,1,3,2,2,1,1,2,3,3,6,1,2,1,13,1,1,1,3,1,4,1,4,1,1,1,3,1,1,1,4,1],
+      ["involvement",11,1,59,1],
+      ["involving",15,1,47,1,20,1,18,5,37,1,63,1,6,1,15,2],
+      ["inward",46,2,126,2,23,1],
+      ["ipek",85,1],
+      ["ipod",204,1],
+      ["iq",81,4],
+      ["iqs",176,2],
+      ["ira",18,1],
+      ["iran",51,1,10,1,6,1,40,1,11,1],
+      ["iraq",46,1,21,1],
+      ["ireland",83,1,2,1,14,1,10,1],
+      ["iridium",25,2],
+      ["irish",99,5],
+      ["irishman",23,1],
+      ["iron",38,1,41,1,34,3,3,3,41,1,8,1],
+      ["ironic",25,1],
+      ["ironically",45,1,63,1],
+      ["irony",22,1],
+      ["iroquoi",32,3],
+      ["irrational",94,1,66,1,18,1,22,1,9,1],
+      ["irrationality",178,1],
+      ["irrationally",209,1],
+      ["irregular",18,1,3,1,47,1,40,1,93,1],
+      ["irrelevant",33,1,182,1],
+      ["irreplaceable",32,2],
+      ["irrepressible",23,1],
+      ["irresistibility",100,1],
+      ["irresistible",47,1,104,1,31,1],
+      ["irrespective",2,1],
+      ["irreversible",76,1],
+      ["irrigate",35,1,15,1,46,1,81,1],
+      ["irrigation",35,1,66,1,1,1,18,1,79,1],
+      ["irritable",94,1],
+      ["irritant",108,8,116,2],
+      ["irritate",125,1],
+      ["irritated",182,1],
+      ["irritation",224,1],
+      ["irving",152,1],
+      ["isaac",93,1],
+      ["isabelle",204,1],
+      ["isla",16,1],
+      ["islamic",107,1],
+      ["island",10,1,9,1,6,5,9,1,15,2,2,1,37,1,15,4,5,1,2,27,15,1,2,1,3,2,2,1,12,4,24,8,3,2,16,11,5,2],
+      ["islander",1,1,117,1,50,1],
+      ["isn",6,1,31,2,12,1,5,1,9,1,8,1,3,1,4,1,2,1,3,1,2,1,7,1,3,1,6,1,28,1,2,3,2,1,1,2,8,1,2,1,5,1,7,1,11,1,8,1,7,1,15,1,15,1],
+      ["isola",4,1],
+      ["isolate",214,1],
+      ["isolated",4,1,18,1,25,1,9,1,31,1,5,3,23,1,32,1,3,1,29,1,12,1,16,1],
+      ["isolation",43,1,41,1,12,1,2,1,78,1,7,1,41,1],
+      ["isotope",27,2],
+      ["israel",71,1,12,1,106,1,32,5],
+      ["issue",2,2,13,2,1,1,4,1,6,1,15,2,8,3,4,2,5,2,12,2,12,1,20,1,2,1,18,1,15,1,8,1,1,4,2,2,4,1,9,1,5,1,1,4,11,3,4,1,4,1,13,1,7,2,2,1,3,1,1,4,1,1,7,4,6,2],
+      ["issued",99,2,124,1],
+      ["issuing",157,1],
+      ["istanbul",77,1],
+      ["italian",22,1,9,2,1,1,25,1,80,5,20,1,20,1,13,1,24,1,3,2,1,1],
+      ["italic",64,1],
+      ["italy",4,1,27,2,7,1,8,1,15,1,16,1,46,1,6,1,8,13,3,1,29,2,21,1],
+      ["item",1,1,18,3,7,1,2,1,2,2,12,2,5,4,15,1,4,1,7,1,4,1,20,1,10,1,1,1,32,2,3,1,38,1,10,1,31,1,4,1],
+      ["itself",7,1,2,1,4,1,4,1,8,1,6,3,5,1,1,1,2,1,2,2,2,1,15,1,1,1,8,1,5,2,8,1,1,2,3,1,1,1,2,2,2,4,4,1,5,1,11,1,3,1,1,1,3,2,1,1,8,2,2,2,19,2,5,1,8,1,7,1,1,2,2,1,1,3,3,1,1,1,2,1,11,1,6,1,3,1,16,2,7,1,2,1],
+      ["iv",211,1],
+      ["ivanhoe",171,1],
+      ["ivory",1,1,18,1,10,1],
+      ["izon",80,19],
+      ["jaak",92,1],
+      ["jack",157,2,64,1],
+      ["jackson",129,2],
+      ["jacob",39,2,19,3,61,1,38,2,32,1],
+      ["jacque",208,1,9,1],
+      ["jalapeno",158,1],
+      ["jam",38,1,75,1],
+      ["jamaica",193,1],
+      ["jame",16,5,7,1,37,1,35,2,14,1,7,1,2,1,7,1,13,1,51,3,13,1,21,1],
+      ["jamie",114,1],
+      ["jamison",81,1],
+      ["jan",20,1],
+      ["jane",114,1,13,1],
+      ["janet",104,4],
+      ["jani",152,1],
+      ["janine",5,1],
+      ["jano",223,1],
+      ["january",44,1,22,1,62,1,49,1,46,1],
+      ["japan",0,4,73,1,4,1,11,1,12,1,8,3,9,1,16,1,11,1,14,1,17,1,34,1],
+      ["japanese",0,2,29,1,2,2,23,17,34,2,16,1],
+      ["jar",23,1,100,1],
+      ["jared",101,1],
+      ["jason",90,1],
+      ["jasper",17,1],
+      ["java",88,2],
+      ["javier",198,1],
+      ["jaw",1,1,2,6,112,2,29,1],
+      ["jawbone",192,1],
+      ["jay",45,1],
+      ["jayne",90,1],
+      ["jazz",46,1],
+      ["jealous",175,1],
+      ["jean",93,1,67,5,48,1,11,1],
+      ["jeff",99,1,81,1],
+      ["jefferson",75,1],
+      ["jeffrey",6,1,64,1,24,1],
+      ["jekyll",171,3],
+      ["jellyfish",48,39,93,4],
+      ["jenness",42,6],
+      ["jennifer",63,1,95,1,18,1],
+      ["jeremijenko",133,1],
+      ["jeremy",153,1],
+      ["jerked",124,1],
+      ["jerome",43,1],
+      ["jerry",15,1,2,1],
+      ["jersey",29,1,125,1,1,1],
+      ["jessica",47,1],
+      ["jesuit",190,1],
+      ["jet",64,1,52,2,38,1],
+      ["jeweler",108,1],
+      ["jewellery",47,2,3,1],
+      ["jewelry",108,2],
+      ["jim",128,4,57,1],
+      ["joan",134,1],
+      ["joanna",205,1],
+      ["joao",179,1],
+      ["job",6,3,14,7,11,1,15,1,3,3,10,1,21,1,5,4,19,1,9,1,9,1,4,3,30,1,7,2,9,2,9,2,28,2],
+      ["jock",11,1],
+      ["joergen",134,1],
+      ["johanna",37,3],
+      ["johanne",107,1],
+      ["johanson",115,7],
+      ["john",4,1,12,1,1,1,1,1,1,1,1,1,3,1,5,1,33,1,14,1,6,2,12,1,1,1,22,1,7,1,12,1,7,1,7,2,1,1,16,1,15,2,27,1,3,1,9,1,3,2,1,1],
+      ["johnson",138,4,51,1,13,4,19,2],
+      ["join",163,2],
+      ["joined",19,1,4,1,109,1,8,1,9,1,4,1,31,1],
+      ["joining",84,1,47,1],
+      ["joint",16,2,8,1,5,1,155,1],
+      ["joke",15,1,131,2,73,1],
+      ["jolokia",158,2],
+      ["jolt",63,1],
+      ["jonah",172,1],
+      ["jonathan",200,1],
+      ["jone",104,1],
+      ["jordan",6,1,45,1,30,1,114,1],
+      ["jose",56,1],
+      ["joseph",58,2,2,1,51,1,9,1,5,1,17,1,29,1],
+      ["josh",167,1,45,2],
+      ["joshua",158,1],
+      ["journal",4,4,14,1,2,1,19,1,62,1,26,1,1,1,39,2,1,1,14,1,7,1,7,1,16,2],
+      ["journalist",15,1,16,2,1,1,77,1,73,1],
+      ["journey",0,1,23,3,11,1,18,1,9,1,5,3,18,3,1,1,5,1,23,1,1,1,7,4,2,1,7,2,19,2,1,1,18,1],
+      ["journeyed",159,1],
+      ["journeying",4,1],
+      ["jouvet",185,2],
+      ["joy",60,1,23,1],
+      ["joyce",100,1,54,1],
+      ["joyous",182,1],
+      ["juan",23,1,67,2],
+      ["jubilation",66,1],
+      ["judd",213,7],
+      ["judge",6,1,9,1,29,2,54,1,23,1,50,1,17,2,18,1],
+      ["judged",15,1,71,4,120,1,7,1],
+      ["judgement",6,1,92,1,90,1,37,2],
+      ["judgementally",160,1],
+      ["judging",21,1,23,1],
+      ["judgment",42,1],
+      ["judi",37,1],
+      ["judicial",109,1],
+      ["judith",210,1],
+      ["juggernaut",153,1],
+      ["juggle",81,1,89,1,11,1,16,2],
+      ["juggling",171,1,26,1],
+      ["juicier",22,1],
+      ["juicy",97,2],
+      ["julia",160,4],
+      ["juliana",85,1],
+      ["julie",24,1],
+      ["julius",7,1],
+      ["july",167,2,10,1,35,2],
+      ["jumbled",196,1],
+      ["jump",60,1,34,1,55,1,48,1,24,1],
+      ["jumped",181,1,13,1],
+      ["june",66,1,31,1,22,1],
+      ["jung",201,1],
+      ["jungle",96,1,39,2],
+      ["junior",15,1,167,1],
+      ["juniper",218,2],
+      ["junk",53,1],
+      ["jupiter",13,1],
+      ["jura",27,1],
+      ["jurassic",25,5],
+      ["jurgen",95,1],
+      ["juror",56,1],
+      ["jury",56,3,119,1,13,2,25,2],
+      ["just",2,1,1,1,2,1,1,1,1,1,5,1,1,1,1,1,1,4,3,1,2,4,1,2,1,2,1,3,2,3,2,1,3,1,4,9,3,1,2,1,3,1,5,1,2,2,1,1,3,1,1,1,3,4,1,5,4,1,1,1,2,1,1,1,1,2,2,1,2,2,1,3,1,5,1,1,2,1,2,2,2,1,1,5,1,1,1,1,1,1,1,1,4,3,2,2,2,2,5,1,2,2,1,1,3,3,2,1,3,1,1,2,4,1,2,1,1,1,1,1,2,1,1,1,4,1,5,1,5,1,1,1,1,1,1,2,1,1,2,1,1,1,4,2,4,2,1,4,2,1,2,1,3,3,1,1,4,1,1,4,1,1,1,2,1,2,5,3,3,3,1,2,3,2,1,2,1,2,1,2,3,1,2,3,1,1,1,2,6,2,3,1,3,1,1,2,2,2,1,1,1,1,4,1,1,1,1,2,3,3,1,1,4,1,2,1,3,1,1,1],
+      ["justice",28,1,81,1],
+      ["justification",146,1],
+      ["justified",178,1,28,1],
+      ["justify",122,1,20,1,4,1],
+      ["justin",63,1],
+      ["jute",1,1],
+      ["juvenal",87,1],
+      ["juvenile",130,1,80,1],
+      ["kaleidoscope",92,1],
+      ["kalin",174,4],
+      ["kammer",29,1],
+      ["kampung",195,3],
+      ["kangaroo",138,2,16,1,48,2],
+      ["kansa",72,1],
+      ["kansai",100,1],
+      ["kaplan",89,1],
+      ["karban",221,4],
+      ["karel",53,1],
+      ["karen",33,1,37,1,19,4],
+      ["karori",4,1],
+      ["karrow",64,1],
+      ["kasha",46,1],
+      ["kashdan",85,1],
+      ["kassel",157,1],
+      ["katabatic",91,2],
+      ["kate",47,1,28,1,29,1,41,1,58,1],
+      ["katelin",34,1],
+      ["katherine",4,8],
+      ["kathleen",63,1,20,1,109,1,13,1],
+      ["kathryn",123,1],
+      ["katrina",196,1],
+      ["katsalidi",34,2],
+      ["kauri",117,2,34,6],
+      ["kavita",30,1],
+      ["kay",81,1],
+      ["keat",171,1],
+      ["keele",190,1],
+      ["keen",16,1,38,1,4,1,14,1,74,1,33,1],
+      ["keenly",170,1],
+      ["keep",7,1,11,1,15,1,2,2,2,1,10,2,1,1,6,1,1,1,4,1,2,2,7,2,5,1,3,1,13,1,3,1,2,1,1,2,7,3,3,1,13,1,3,1,1,1,9,3,3,2,4,4,1,3,4,1,1,1,6,1,3,1,4,2,3,1,1,1,9,2,2,1,7,3,10,1,6,1,4,3,3,4,9,1,4,1,1,4,4,2],
+      ["keeper",223,1],
+      ["keeping",35,4,12,1,1,1,3,1,1,1,25,1,15,1,14,1,55,5,15,2,3,1,10,1,2,1,31,1],
+      ["keith",6,1,103,1,88,1],
+      ["kelman",42,2],
+      ["kelp",52,1],
+      ["ken",143,1],
+      ["kenya",154,2,47,1],
+      ["kept",1,1,11,1,16,1,11,1,11,1,14,1,3,1,25,1,10,1,26,1,3,1,6,1,2,1,10,1,12,1,14,1,7,1,2,1,1,1,5,1,5,2,4,1,24,1],
+      ["keswick",217,1,1,1],
+      ["kevlar",119,5],
+      ["kew",105,1],
+      ["key",20,1,34,1,23,1,4,1,5,4,15,1,3,1,6,1,7,3,1,1,13,3,2,1,3,1,9,3,3,1,2,2,3,1,6,2,1,1,4,1,3,1,6,1,7,1,10,3,4,1,3,2,4,1,2,2,1,1,2,1,6,1,9,2,2,1],
+      ["keyboard",208,1],
+      ["keyhole",189,1],
+      ["keying",181,1],
+      ["kg",23,2],
+      ["kicked",96,1],
+      ["kicking",216,1],
+      ["kid",33,1,59,10,14,2,12,1,71,3],
+      ["kidnapped",4,2],
+      ["kiekie",1,1],
+      ["kill",10,1,65,5,26,1,1,1,36,2,61,1,3,2,22,1],
+      ["killed",25,2,40,1,10,1,35,1,15,1,13,1,39,1,19,1,6,1,14,1],
+      ["killer",14,11],
+      ["killing",69,1,34,1,107,1],
+      ["kiln",29,1,33,4,155,1,1,1],
+      ["kilo",193,1],
+      ["kilogram",96,1,29,1,17,1,37,2,12,1,25,1,6,1],
+      ["kilogramme",179,3],
+      ["kilometer",50,2,29,1,5,1],
+      ["kilometre",0,1,25,1,10,3,5,2,7,1,49,2,27,1,7,4,8,1,4,1,7,2,19,1,12,4,11,1,5,3,6,1],
+      ["kilowatt",195,1],
+      ["kimberley",138,1,64,1],
+      ["kin",147,1,74,1],
+      ["kind",3,1,6,1,3,1,5,2,2,1,11,1,1,1,3,1,4,1,1,1,2,2,1,1,18,1,3,2,2,2,2,1,3,2,2,1,4,1,2,1,3,1,3,3,2,3,9,1,2,1,5,2,4,1,7,1,8,1,1,1,4,1,3,2,2,4,8,1,2,1,4,1,1,4,7,1,1,4,6,3,6,2,1,1,4,1,1,1,1,2,2,2,2,1,1,1,2,1,8,2,3,2,1,1,7,2,1,1,3,1,2,2,1,4,1,2,5,1,1,1,3,1,3,5,6,1],
+      ["kindergarten",36,1,68,1,49,3,33,1],
+      ["kinetic",132,2],
+      ["king",0,1,51,1,16,1,10,1,39,1,7,1,2,1,22,1,4,2,1,1,5,1,12,2,25,3,17,3],
+      ["kingdom",71,1,35,1,17,1,21,1],
+      ["kinship",41,1],
+      ["kiore",187,6],
+      ["kiran",188,1],
+      ["kirby",208,1],
+      ["kircher",111,1],
+      ["kisse",155,1],
+      ["kitchen",82,2,36,1,54,1],
+      ["kite",127,2],
+      ["kitten",144,1],
+      ["klein",140,1],
+      ["kleine",94,1],
+      ["kleinlogel",159,1],
+      ["kleinman",72,1],
+      ["kleitman",185,1],
+      ["km",10,1,42,1,80,1,6,1,21,1,43,1],
+      ["knaap",22,1],
+      ["knee",115,1],
+      ["knew",34,1,30,2,23,1,6,1,18,5,5,1,58,1,1,1,4,1,1,1,4,1],
+      ["knife",19,1,203,5],
+      ["knight",110,1],
+      ["knighted",116,1],
+      ["knit",207,1],
+      ["knive",140,1],
+      ["knob",200,1],
+      ["knocked",25,1],
+      ["knocking",179,1],
+      ["knot",152,3],
+      ["know",1,1,1,5,5,1,2,3,3,1,5,1,1,1,2,3,1,1,4,1,6,2,14,1,2,1,5,1,6,5,2,2,7,1,5,1,4,1,4,1,1,2,2,1,3,1,2,1,3,1,2,2,2,1,3,2,2,1,2,1,9,2,3,1,1,1,3,3,3,2,5,1,2,2,3,1,1,1,3,1,2,1,7,2,2,1,2,1,2,1,4,1,1,1,1,1,1,1,2,1,1,2,1,1,6,2,3,1,5,4,4,2,3,1,3,2,1,3,10,1,3,1,1,3,10,1,1,2,1,2,3,1,2,2,3,6,5,1],
+      ["knowing",111,1,39,1,10,5,26,1,33,1,3,1],
+      ["knowledge",6,1,1,5,4,3,3,2,1,3,32,1,7,1,3,1,12,1,3,2,2,1,3,1,4,2,5,2,7,4,2,1,16,1,5,2,6,1,28,2,10,8,3,2,7,1,7,1,1,6,1,1,2,1,5,2,1,2,3,2,5,1,3,1,9,1,1,1,5,2,3,1,5,2,1,2],
+      ["knowledgeable",9,1],
+      ["known",0,1,1,1,2,2,1,2,5,1,5,2,4,2,1,2,1,1,2,2,1,2,2,5,4,1,1,1,1,1,2,1,3,1,1,1,1,1,2,1,2,1,2,1,1,2,1,6,4,2,3,2,1,1,1,1,1,1,2,1,4,1,2,1,2,1,1,2,3,1,2,1,3,2,1,1,3,5,3,1,2,1,6,1,5,1,2,1,3,2,6,2,1,3,1,2,1,2,1,1,1,1,3,1,1,2,1,3,4,1,3,3,2,2,2,1,3,1,3,1,1,1,1,2,1,1,2,1,1,5,1,1,1,1,1,1,2,1,1,2,2,1,5,1,2,4,1,1,3,2,2,1,4,1,1,3,3,1,1,3,2,2,8,3,1,2,5,1,5,3,2,2,2,3,2,1,6,1,1,2,4,9,4,2,5,2,1,2,1,2,1,1,2,6,2,2,1,2,2,2],
+      ["knox",182,2],
+      ["koechlin",197,2],
+      ["koelmeyer",192,3],
+      ["kolberg",99,1],
+      ["kolkata",133,1],
+      ["komodo",25,4],
+      ["korea",77,1,40,1],
+      ["koromiko",16,1],
+      ["koslofsky",39,1],
+      ["krait",89,1],
+      ["kramer",152,1],
+      ["krapina",21,1],
+      ["kraus",176,3],
+      ["krauss",95,2],
+      ["kremer",196,1],
+      ["kreuzberg",84,3],
+      ["kristoffer",80,1],
+      ["kudzu",141,2],
+      ["kuhn",178,3],
+      ["kulahci",85,1],
+      ["kurt",152,1],
+      ["kushida",220,1],
+      ["la",23,1,89,1,31,8],
+      ["lab",7,1,11,1,45,1,5,1,40,1,11,2,48,1,33,2,12,1],
+      ["label",15,1,11,1,34,1,37,2,43,2],
+      ["labeled",92,1],
+      ["labelled",36,1,6,1,131,1],
+      ["labor",97,1],
+      ["laboratory",5,1,2,2,4,2,2,1,15,1,9,4,21,1,5,1,1,1,19,1,2,1,6,1,9,1,35,1,8,1,15,1,2,1,7,2,1,1,21,1,3,1,9,1,8,1,3,2],
+      ["laborer",50,1],
+      ["laborious",51,1,56,1],
+      ["labour",8,1,17,1,16,1,46,1,12,1,41,2,54,1,21,1],
+      ["labourer",55,1],
+      ["labyrinth",34,1,187,1],
+      ["laced",138,1,64,1],
+      ["lack",1,1,5,1,2,1,8,2,1,1,17,3,6,2,3,2,5,1,22,1,5,2,1,1,9,2,2,1,5,2,2,1,3,1,9,1,5,1,2,1,26,1,8,2,1,1,12,1,2,1,4,1,10,1,1,1,27,3,4,1,2,1,10,4,5,1],
+      ["lacked",112,1,59,1,3,1,16,1,18,1],
+      ["lacking",13,1,55,1,93,1],
+      ["lacquer",136,1],
+      ["lad",157,1],
+      ["ladder",132,1,53,1,12,1],
+      ["laden",139,1],
+      ["lady",111,1,14,1],
+      ["lafond",201,1],
+      ["lagging",88,1],
+      ["lagoon",123,4],
+      ["laid",10,1,11,1,29,1,40,2,20,1,6,1,44,1,21,1,17,1,12,1,7,1],
+      ["lain",69,1],
+      ["lair",144,1],
+      ["laissez",36,1],
+      ["lake",21,1,4,3,10,1,44,2,11,2,15,1,10,1,12,1,14,4,36,1,3,1,4,1,12,15,14,2,7,2],
+      ["lakeside",196,1],
+      ["lamb",61,1],
+      ["lamontagne",20,1],
+      ["lamp",39,2,74,1,100,1],
+      ["lampada",211,1],
+      ["lan",187,1],
+      ["lancashire",194,2],
+      ["lancaster",7,7],
+      ["lance",14,2],
+      ["land",21,1,4,1,1,1,2,1,5,1,2,1,5,1,5,1,6,2,1,1,12,1,5,2,1,1,14,1,5,1,1,6,6,4,2,1,4,11,16,1,4,1,1,2,1,10,5,1,3,1,1,5,4,2,1,1,5,2,11,3,3,1,1,1,7,1,6,1,8,2,14,2,1,1,5,11,2,3,1,1,8,1,13,2],
+      ["landcare",69,1],
+      ["landed",207,1],
+      ["lander",177,2],
+      ["landfall",192,1],
+      ["landfill",134,6,1,1],
+      ["landform",69,1,55,1],
+      ["landholding",99,1],
+      ["landing",13,1,211,2],
+      ["landini",190,2],
+      ["landlocked",196,1],
+      ["landmark",111,1,19,1,29,6,46,1],
+      ["landmass",121,1],
+      ["landowner",138,1,3,1,61,1],
+      ["landscape",26,3,7,1,1,3,1,1,15,1,19,8,1,1,20,4,15,2,15,1,4,1,9,1,2,1,1,2,2,1,5,1,6,1,2,1,8,2,18,1,25,1,3,18,18,1],
+      ["landslide",196,1],
+      ["landwehr",84,1],
+      ["lane",83,1],
+      ["langley",142,1],
+      ["langsamkeit",149,1],
+      ["language",3,1,6,1,45,31,3,1,4,1,6,7,7,13,3,1,4,1,2,1,3,23,1,1,5,2,3,38,2,1,7,1,7,2,16,1,21,5,1,3,13,35,5,17,1,1,3,2,1,1,3,2,7,2,1,17,3,33,4,11,14,7,3,24,1,31,4,17,10,4],
+      ["languid",149,1],
+      ["lap",126,1],
+      ["lapakko",148,1],
+      ["laparoscopic",189,1],
+      ["lapse",139,1],
+      ["laptop",126,1],
+      ["lar",134,1],
+      ["larder",222,1],
+      ["large",1,1,4,1,5,2,1,1,1,1,1,1,1,1,5,1,2,2,4,7,9,1,1,1,1,1,5,1,1,1,2,5,4,1,2,3,1,1,4,3,1,1,4,1,3,3,3,1,1,1,8,12,1,2,2,1,1,1,5,6,3,1,3,1,1,7,5,2,7,2,1,1,2,1,2,2,4,1,5,1,2,1,4,1,1,1,1,1,2,1,2,1,2,1,4,5,2,1,1,3,1,2,3,4,1,3,1,3,1,1,2,1,7,2,5,1,5,2,1,1,4,4,1,2,9,1,8,1,6,3,1,1,1,1,1,3,1,1,5,3,1,1,1,1,3,6,3,5,6,3,1,1],
+      ["largely",0,1,9,1,7,5,12,1,5,1,2,1,1,1,3,1,2,1,7,1,2,1,22,1,1,1,17,1,6,1,14,1,6,1,1,1,8,2,16,2,4,1,13,1,5,1,16,1,1,1,14,1,2,1,7,1,13,1],
+      ["larger",1,2,1,2,8,1,11,1,25,1,4,1,3,1,8,1,5,1,1,1,2,1,10,1,1,1,9,1,14,1,5,3,2,2,2,1,11,1,3,1,10,1,4,1,2,2,5,1,3,1,3,2,1,1,18,1,4,1,30,1,2,1],
+      ["largest",16,1,9,1,2,1,1,1,7,2,9,1,6,1,1,1,8,1,23,1,22,1,4,1,2,1,3,1,4,1,8,1,13,1,2,1,2,1,11,1,16,1,1,1,21,1,10,1,1,1],
+      ["larvae",193,5],
+      ["las",40,1],
+      ["laser",97,1,43,1,86,2],
+      ["lashed",1,1],
+      ["lashing",1,1],
+      ["lashlie",49,1],
+      ["last",21,2,2,1,4,1,8,2,5,1,2,1,1,1,24,1,3,2,6,1,1,2,6,1,4,1,1,1,4,1,10,1,9,5,3,1,3,1,6,1,6,4,5,1,3,1,1,1,1,1,3,1,2,4,10,1,4,1,7,1,5,1,9,1,1,1,3,1,9,1,6,1,1,1,3,1,3,1,3,1,2,2,4,1,2,1,4,1,3,2],
+      ["lasted",0,1,21,3,8,1,37,1,89,1,20,1,33,1],
+      ["lasting",9,1,56,1,2,1,9,1,53,2,20,1,8,1,3,1,66,1],
+      ["lastly",113,1,58,1],
+      ["late",1,1,3,1,5,1,15,1,5,1,10,1,1,3,4,1,1,1,1,1,14,1,6,1,1,1,2,1,8,1,10,1,1,2,8,1,3,2,11,1,2,1,3,1,3,1,19,4,3,1,4,1,3,1,2,1,17,2,3,2,8,2,5,1,14,1,4,1,17,1,4,2,2,1],
+      ["lately",5,1,148,1],
+      ["latent",81,1],
+      ["later",0,1,1,1,1,1,2,5,5,1,3,2,6,1,4,1,1,8,8,1,3,1,2,1,2,1,1,1,6,2,1,1,3,1,2,2,10,2,17,1,1,1,3,1,5,1,2,1,3,4,1,1,12,2,4,2,2,2,2,1,2,6,1,4,11,1,1,1,2,2,6,2,1,1,12,2,3,2,1,1,5,1,3,1,7,1,1,2,2,1,1,1,2,1,2,3,1,1,4,2,6,1,1,1,2,1,4,1,4,2,2,3,7,1,4,1,6,2,1,1,3,1,1,1,3,4],
+      ["latest",9,1,5,1,10,2,3,1,5,1,2,1,44,1,5,1,21,1,2,1,55,1,6,1,1,1,44,1],
+      ["latex",23,4],
+      ["latham",144,1],
+      ["latin",9,1,29,2,29,1,20,2,24,2,60,1,40,2,6,1,1,1],
+      ["latitude",64,4,27,1,10,3,20,1,9,2,19,1],
+      ["latter",4,1,6,1,53,1,10,1,1,1,8,1,6,1,59,1,24,1,13,1,2,1,8,1,13,1,1,1,12,1],
+      ["latterly",41,1],
+      ["lattice",173,1],
+      ["lauer",157,1],
+      ["laugh",146,1,73,1],
+      ["laughed",78,1],
+      ["laugher",219,1],
+      ["laughing",103,3,3,1,40,2],
+      ["laughter",200,1],
+      ["launceston",34,1],
+      ["launch",16,1,16,1,96,1,14,1],
+      ["launched",28,2,4,1,3,1,31,1,4,2,12,1,46,3,49,1],
+      ["launching",132,1,10,1,24,1],
+      ["laundry",126,1,14,1],
+      ["laura",96,2],
+      ["laureate",128,1],
+      ["lauren",18,1],
+      ["laurer",97,1],
+      ["lavishly",15,1],
+      ["law",11,1,4,23,1,1,15,1,20,1,36,1,3,1,11,1,21,1,6,1,9,1,10,1,9,1,1,2,3,1,15,1,22,2,10,3,6,2],
+      ["lawmaker",219,1],
+      ["lawn",118,1,17,1],
+      ["lawrence",4,1,124,1],
+      ["lawyer",15,34,89,1,71,1,38,3,6,1],
+      ["lay",103,1,7,1,3,1,41,1,14,1,26,1,23,1],
+      ["layer",25,1,6,2,9,1,54,1,14,3,12,1,20,1,9,1,47,2,14,4,16,1],
+      ["layered",137,1],
+      ["laying",65,2,6,1,7,1,91,1],
+      ["layout",132,1,38,1],
+      ["laysan",130,1],
+      ["lazaret",21,3],
+      ["lazy",134,2,73,1],
+      ["lb",88,2],
+      ["le",120,1],
+      ["leach",102,1,97,1],
+      ["leachman",91,2],
+      ["lead",2,1,4,2,12,2,4,1,4,1,3,1,15,1,1,1,2,1,1,1,5,3,3,2,14,1,6,1,3,1,12,1,8,1,5,1,7,1,1,1,6,3,2,1,41,1,13,2,13,1,4,1,3,1,1,1,1,1,10,1,2,1,5,1,1,1,1,1,2,6,1,2,2,1,1,1,1,1,1,1,2,1],
+      ["leader",37,1,19,1,14,1,21,1,13,1,4,1,11,1,3,1,25,1,3,1,2,2,10,1,47,1,10,4,6,1],
+      ["leadership",134,1,91,1],
+      ["leading",1,1,6,4,21,1,13,1,36,1,2,1,9,1,14,1,2,1,15,1,18,1,4,3,4,1,17,1,8,1,6,1,8,1,6,2,9,1,4,1,7,1],
+      ["leaf",59,9,30,3,50,15,4,3,78,2,3,3],
+      ["leaflet",53,2],
+      ["leafy",155,1],
+      ["league",131,3,60,1,34,1],
+      ["leaking",64,1,152,1],
+      ["lean",24,1,49,13,23,1],
+      ["leaner",24,1],
+      ["leanne",95,1],
+      ["leap",137,1,15,1,30,1],
+      ["learn",2,2,11,1,1,1,1,1,21,1,1,2,8,1,9,2,3,1,10,1,7,2,4,1,2,1,3,1,9,1,1,2,38,9,10,1,7,1,1,1,7,1,7,3,1,1,4,1,12,1,1,1,5,2,2,1,1,2,17,1,1,2,1,1,7,1,4,2,4,1,2,1],
+      ["learned",18,1,71,1,10,1,6,1,1,1,5,2,47,1,13,2,5,1,4,1,1,1,7,2,5,1],
+      ["learner",163,1],
+      ["learning",2,2,4,2,5,3,3,2,3,1,11,1,8,1,1,1,12,1,5,5,3,1,17,3,18,4,24,1,13,4,19,1,15,2,13,8,10,3,3,3,6,1,9,1,9,1,9,1],
+      ["learnt",5,2,9,3,22,1,9,1,31,1,59,1,20,1,67,1],
+      ["least",2,1,4,1,7,1,1,2,2,2,1,1,13,1,1,1,1,1,14,1,1,2,1,1,3,2,1,1,6,1,9,1,5,2,9,2,4,1,9,1,1,1,2,1,3,1,2,1,7,1,1,2,2,1,3,1,12,1,1,2,11,2,2,1,1,2,3,2,4,1,6,1,3,2,6,1,3,2,9,2,3,3,3,1,10,1,4,1,3,1,4,2,3,1,3,2,2,1,1,2,1,1,1,2,8,1,1,2,1,1,1,1],
+      ["leather",23,1,6,1,22,1,51,1,47,1,50,1,14,1],
+      ["leatherware",147,1],
+      ["leathery",127,1],
+      ["leave",0,2,10,1,8,1,7,2,8,3,5,1,3,1,6,1,12,6,3,1,3,2,5,1,5,1,4,1,9,4,1,1,11,1,27,1,4,2,3,1,5,5,4,10,7,1,8,1,1,2,4,1,9,1,1,1,8,1,1,1,8,1,6,1,4,1,14,2,1,1,1,3,5,3,1,1,2,3,2,1],
+      ["leaven",170,1],
+      ["leaver",145,1,58,1],
+      ["leaving",56,2,6,1,4,1,45,1,9,1,4,1,19,1,71,1,11,1],
+      ["lebanon",123,1],
+      ["lechwe",10,1],
+      ["lecoq",109,1],
+      ["lecture",11,1,25,1,75,2],
+      ["lecturer",28,2,26,1,8,1,42,1,92,1,17,1,12,1],
+      ["led",0,1,7,4,2,1,5,1,3,1,6,1,4,1,2,1,1,1,6,1,2,1,4,1,2,2,3,4,4,1,5,1,5,3,2,1,12,3,5,1,8,1,12,4,6,1,3,1,4,2,6,1,6,1,4,1,11,5,9,1,3,1,5,1,2,1,1,1,8,1,3,1,3,1,15,1,1,1,4,3,19,1,7,1,1,1,1,6,1,2],
+      ["leda",150,1],
+      ["lee",82,1,56,1,64,1],
+      ["leech",45,1],
+      ["leed",70,1,36,2,88,1],
+      ["left",2,1,10,1,6,1,4,1,3,2,2,1,4,1,6,1,4,1,1,1,2,1,5,1,7,1,2,1,8,1,2,1,2,1,5,1,4,2,4,1,1,1,1,1,14,1,6,1,10,2,7,1,2,2,5,1,9,1,5,1,1,1,2,1,11,1,2,1,11,1,4,3,2,1,8,1,3,1,5,1,2,1,2,1,1,1,5,1,14,1,1,2],
+      ["leftover",102,2,97,2],
+      ["leg",27,1,18,1,16,1,33,1,32,1,18,1,10,1,5,4,56,1,1,3,7,1],
+      ["legacy",129,1,42,1,16,1,26,1],
+      ["legal",15,4,1,1,70,1,2,2,22,1,103,1],
+      ["legalised",8,1],
+      ["legally",15,1,38,1,9,1,4,1,74,1],
+      ["legend",0,2,31,1,57,1,64,1,13,1,6,1],
+      ["legged",10,1,125,1],
+      ["legible",123,1],
+      ["legion",77,1],
+      ["legislation",53,2,88,1,21,1],
+      ["legislative",15,1],
+      ["legislature",15,1],
+      ["legitimate",112,1,19,1,47,1,26,1],
+      ["legitimised",11,1],
+      ["lehman",126,2],
+      ["lehrer",172,1],
+      ["leiden",221,1],
+      ["leidy",111,1],
+      ["leidyi",48,1],
+      ["leigh",28,1],
+      ["leipzig",115,1],
+      ["leishman",135,6],
+      ["leisure",84,3,8,1],
+      ["leisurely",32,1,100,1],
+      ["lemonade",200,2],
+      ["lemur",85,1],
+      ["len",58,1,1,1,52,1,85,1],
+      ["lend",17,1,55,1],
+      ["lending",172,1],
+      ["length",1,2,33,1,5,1,1,1,2,5,10,2,17,1,8,1,14,6,12,1,7,1,9,1,6,1,7,1,13,3,22,1,18,1,18,3,9,1,4,3,3,1,4,1],
+      ["lengthy",2,1,51,1,75,1,82,2],
+      ["lennard",14,5],
+      ["lense",7,1],
+      ["lent",9,2],
+      ["leo",19,1],
+      ["leon",152,1],
+      ["leonard",111,1],
+      ["leonardo",31,1,26,1,123,2],
+      ["leonardoxa",65,1],
+      ["leonie",24,1],
+      ["lesley",83,1],
+      ["less",2,1,1,1,3,1,5,1,2,2,4,3,1,2,2,8,1,1,1,2,2,9,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,2,2,1,2,4,3,1,1,1,1,1,1,3,1,1,4,1,4,1,2,1,1,3,6,1,2,2,3,1,5,1,1,1,1,1,1,1,5,1,2,5,2,1,2,2,2,2,1,1,4,3,1,1,1,3,4,2,1,1,3,13,4,1,2,1,1,1,3,3,4,1,1,2,2,1,5,1,2,1,3,16,2,2,3,2,2,2,1,1,6,2,1,1,1,1,1,1,2,1,2,1,1,1,1,2,4,3,2,1,2,1,2,1,1,1,7,2,5,1,4,2,1,2,4,1,1,1,1,3,5,1,6,2,1,1,1,13,1,1,1,6,2,1,2,2,1,1,1,4,2,1,4,1,1,1,1,3,4,1,3,1,3,2,1,1],
+      ["lessen",92,1,10,1,36,1,61,1,3,1],
+      ["lesser",68,1,62,1],
+      ["lesson",4,1,32,1,56,1,6,1,7,2,31,1,12,2,9,1,6,3,13,3,17,1,13,1,2,1],
+      ["let",54,1,5,1,1,1,2,1,10,1,17,1,13,1,16,2,18,1,25,1,2,4,18,1,11,1,3,1,4,1,18,1],
+      ["lethal",96,1,81,1],
+      ["letter",4,1,60,1,3,1,19,5,1,1,10,1,17,3,31,3,27,2,9,1,22,1,14,1],
+      ["lettering",53,1,11,1],
+      ["letting",57,1,50,1,57,1,56,1],
+      ["levav",200,3],
+      ["levee",35,1],
+      ["level",0,3,2,3,3,1,1,1,2,7,1,1,11,1,1,1,2,2,2,1,3,1,3,1,3,1,3,2,3,1,2,2,1,1,1,1,5,4,1,2,2,1,1,1,1,1,1,1,2,1,2,1,3,1,1,3,2,2,2,1,5,1,1,1,7,1,1,1,1,1,2,2,2,4,5,1,1,7,1,1,7,1,6,2,3,1,1,1,7,1,1,1,9,1,2,4,3,2,1,3,1,2,3,1,2,1,2,4,2,5,8,4,2,2,8,1,1,1,2,1,2,1,5,1,1,1,1,1,3,1,1,1,1,1,6,1,1,1,1,1,3,4,8,1,3,1,1,1,8,2,1,3,10,1],
+      ["lever",1,1],
+      ["leverage",50,1,106,1,53,1],
+      ["levin",94,1],
+      ["lewi",120,2,48,3,38,4],
+      ["lewin",36,1,116,1],
+      ["lewisburg",18,1],
+      ["ley",195,1],
+      ["liable",122,1],
+      ["liaise",80,1],
+      ["liaison",33,1],
+      ["liar",175,4],
+      ["liberate",187,1],
+      ["liberated",5,1],
+      ["liberating",83,1],
+      ["liberty",15,6],
+      ["librarian",97,1,85,1],
+      ["librarianship",206,1],
+      ["library",15,1,13,2,67,1,2,1,71,1,14,1,8,2,23,1],
+      ["licence",122,1,34,5],
+      ["licensing",16,1],
+      ["licinius",77,1],
+      ["lid",7,1,46,2],
+      ["lie",5,1,19,1,10,1,6,1,9,1,19,2,1,2,4,1,28,1,22,1,16,1,7,2,3,1,10,1,7,1,4,2,5,12,4,1,6,1,3,1,8,1,8,1,5,1,6,1],
+      ["lied",175,1],
+      ["lieutenant",149,1],
+      ["life",0,1,4,5,1,1,6,3,3,1,1,2,3,1,2,1,1,2,2,1,3,1,4,1,2,2,1,5,4,2,2,1,2,1,2,1,1,1,1,6,2,1,1,1,4,2,6,5,5,1,1,2,1,2,2,2,1,2,10,1,3,1,4,1,1,1,1,11,4,4,1,1,2,2,2,1,1,1,3,1,4,1,1,10,4,2,1,1,1,4,1,2,9,1,2,1,3,2,8,2,1,9,1,3,1,3,1,1,3,1,1,1,1,4,1,1,2,1,1,2,3,2,7,1,3,1,4,9,3,1,4,6,1,1,3,1,1,3,1,14,5,2,1,3,6,3,8,2,1,1,4,1,7,1,2,3,1,1,2,1,2,1,6,1,1,2,1,1,1,1,1,2],
+      ["lifeless",164,1],
+      ["lifelike",29,1,1,1],
+      ["lifeline",129,1],
+      ["lifelong",4,1,132,1,14,1,20,1,12,1,43,1],
+      ["lifespan",24,7,86,1],
+      ["lifest",209,1],
+      ["lifestyle",4,1,29,1,87,1,51,1,39,1,12,2],
+      ["lifetime",33,2,61,1,50,1,13,1,33,1],
+      ["lift",44,1,88,1,27,1],
+      ["lifted",37,1,76,1,11,1],
+      ["lifting",30,1,19,1,83,1],
+      ["light",4,1,1,1,13,1,3,1,6,1,2,1,1,5,4,1,5,4,4,6,14,1,2,1,3,1,1,4,5,12,2,1,3,1,20,1,4,2,3,1,3,2,4,1,4,1,1,1,9,1,23,1,7,1,8,4,8,1,3,1,3,1,5,1,2,3,2,1,3,1,7,1,3,1,6,2,4,1,6,2,1,1,4,3,8,1],
+      ["lighter",1,2,12,1,182,1],
+      ["lighting",34,1,5,3,72,1,2,2],
+      ["lightly",201,1],
+      ["lightman",175,7],
+      ["lightweight",61,1,58,2,2,1],
+      ["like",1,2,1,2,1,1,2,2,2,3,1,2,1,1,3,1,2,1,1,1,2,5,1,1,1,2,2,1,1,3,1,1,2,1,2,1,1,1,1,2,1,4,3,2,1,2,2,1,2,1,1,2,3,2,1,1,1,2,1,2,1,2,4,1,1,1,4,1,2,1,1,1,1,4,1,1,2,2,1,3,4,7,1,1,1,1,1,3,1,1,1,3,2,2,1,1,1,2,2,1,2,2,2,5,1,1,2,2,4,2,1,1,1,9,1,1,1,1,1,3,1,2,1,2,1,1,1,1,2,5,2,1,2,1,2,1,3,1,1,1,1,1,1,3,1,1,1,3,1,3,1,3,4,1,1,1,2,1,3,2,1,1,4,3,1,3,2,1,1,1,3,2,1,2,1,8,2,1,1,1,1,3,1,1,1,1,1,1,1,1,2,2,1,1,3,1,1,2,2,4,1,2,1,3,1,6,1,2,2,1,1,3,1,3,2,7,4,2,1,2,1,1,1,2,3,2,2,1,1,1,2,3,1,4,1,2,1,1,2,2,1,3,1,6,1,1,3,1,2,2,1,2,1,1,1,5,1,1,1,2,2,2,1,1,1,2,1,2,1,1,1,5,5,7,2,1,1,9,1,2,1,1,2,1,2,3,1,3,3,1],
+      ["liked",12,1,9,1,3,1,2,1,10,1,122,1,55,1,12,1],
+      ["likelier",98,1],
+      ["likelihood",93,1,13,1,103,1],
+      ["likely",1,1,5,1,5,1,6,2,1,4,4,1,1,1,4,1,12,1,9,1,6,1,1,2,1,2,3,1,1,1,3,3,5,1,4,1,3,1,6,1,4,1,3,1,3,1,1,1,3,1,3,2,4,1,1,1,1,1,2,2,2,2,2,1,4,2,1,1,2,1,6,1,1,1,2,2,1,2,11,1,7,1,7,1,3,1,1,1,5,1,1,2,2,1,4,1,4,1,6,3,7,1,2,1,4,2,1,1,5,2,2,1,1,1,2,1,1,1,1,1,3,2,3,3,7,1,3,1,5,1],
+      ["liken",18,1],
+      ["likened",34,1,82,1,35,1],
+      ["likeness",27,1,14,1],
+      ["likert",8,4],
+      ["likewise",101,1,70,1,38,1],
+      ["liking",76,1,72,1,67,1],
+      ["lilianne",71,1],
+      ["lille",39,1],
+      ["lima",50,1,171,2],
+      ["limb",3,1,26,1,69,1],
+      ["limbic",17,1,54,1],
+      ["lime",129,2],
+      ["limestone",21,1,6,1,102,1],
+      ["limit",5,1,49,1,15,1,21,1,5,1,18,1,4,1,21,1,10,1,1,1,12,4,2,1,1,1,13,1,11,1,3,1,10,1,1,1,4,1],
+      ["limitation",1,1,7,1,140,2,4,1,29,1,16,1],
+      ["limited",1,1,3,1,5,1,6,1,1,1,16,1,1,1,40,1,1,1,8,1,2,1,38,1,2,1,17,3,2,1,8,1,17,1,8,1,2,1,11,1,2,1,7,3,10,6,13,1],
+      ["limiting",137,1],
+      ["limitless",89,1,45,1,49,1,43,1],
+      ["linda",60,1,10,1,88,1],
+      ["line",1,5,5,1,4,1,7,2,6,1,8,1,10,1,1,6,13,3,9,4,3,3,1,1,5,4,11,10,3,1,1,1,9,3,2,1,16,2,10,1,6,1,9,1,5,1,4,1,1,2,4,1,2,1,9,1,9,1,3,1,11,1,4,1,11,1,8,1,4,1],
+      ["lineage",110,1,37,3],
+      ["linear",97,1,21,1,47,2],
+      ["lined",113,1],
+      ["linen",29,2,78,1],
+      ["ling",1,1],
+      ["linger",34,1,171,1],
+      ["lingua",162,3],
+      ["linguist",67,2,28,4,73,1,15,3,25,3],
+      ["linguistic",54,2,32,4,9,5,16,1,51,1,9,1,11,1,1,1,3,3,4,1,14,1,3,4,1,1],
+      ["linguistically",186,1],
+      ["linguistique",208,3],
+      ["lining",121,1,89,1,7,1,1,1],
+      ["link",3,1,10,3,23,1,11,1,7,1,6,3,11,3,7,3,3,2,11,1,6,1,2,2,23,1,14,2,12,1,18,1,18,1,4,1,23,1,7,1,3,3],
+      ["linkage",3,1],
+      ["linked",0,1,2,1,46,1,15,1,7,1,1,1,7,1,22,2,6,1,8,1,7,1,13,3,38,1,6,1,13,1,17,1,14,1,1,1],
+      ["linking",3,1,68,1,7,1],
+      ["linnaean",213,2],
+      ["linwood",49,1],
+      ["lion",27,2,127,1,28,2,34,3,6,6],
+      ["lip",3,1,7,1,48,1,16,2,12,1,88,1,33,1,9,1],
+      ["lipped",89,1,65,1],
+      ["lippitt",36,1],
+      ["liquid",0,1,7,1,16,1,15,2,13,6,11,1,16,1,41,6,6,4,52,3],
+      ["list",11,1,1,1,8,1,13,1,11,1,11,1,1,3,14,1,13,1,2,1,19,1,53,1,24,1,38,1],
+      ["listed",63,1,83,1,60,1,10,1,7,1],
+      ["listen",18,1,65,2,17,2,26,1,20,1,2,1,24,3,8,3,17,1],
+      ["listened",18,4,74,2,39,1,17,1,34,1],
+      ["listener",172,1],
+      ["listening",18,1,65,2,17,13,26,5,28,4,3,1,3,1,12,2,8,4,5,1,19,1,15,1],
+      ["lister",136,1],
+      ["listing",33,1],
+      ["lit",1,1,20,1,18,1,29,1,58,1,66,1],
+      ["liter",62,1],
+      ["literacy",49,3,25,1,98,1,7,2,7,4],
+      ["literal",86,2,97,1],
+      ["literally",127,1],
+      ["literary",4,1,82,2,59,5,26,1,11,1,6,12,15,4,3,4,5,1],
+      ["literate",157,1],
+      ["literati",107,1],
+      ["literature",11,3,3,1,22,1,3,2,16,1,32,1,59,2,2,1,9,1,14,1,17,3,18,19,10,1],
+      ["litter",21,1,163,1],
+      ["littered",19,1],
+      ["little",2,1,2,1,3,1,2,2,6,5,1,4,3,1,1,1,4,1,1,1,2,1,8,1,1,2,2,1,1,2,4,2,1,1,1,1,1,1,1,1,3,1,1,1,1,1,7,1,1,1,10,1,8,1,3,1,4,1,1,1,2,1,2,2,5,2,2,1,2,2,3,2,2,2,1,1,1,1,5,1,2,1,8,1,6,2,3,1,1,1,4,2,1,1,1,1,1,1,3,1,4,1,3,1,2,1,2,4,1,1,1,1,3,2,3,1,3,1,3,1,2,1,7,1,2,1,2,2,6,2,2,1,1,2,2,2,2,1,1,1,2,1,4,2,3,1,1,1,2,1,4,1,2,1,5,1,4,1,2,1,3,1],
+      ["live",1,1,4,1,4,6,1,1,1,2,2,1,1,6,3,1,1,1,6,6,14,1,3,1,11,1,2,1,2,2,7,3,4,1,1,1,2,1,1,1,1,1,4,1,9,1,2,1,2,1,2,3,5,2,2,2,7,2,5,4,2,3,1,1,1,1,4,1,2,2,7,2,8,2,3,1,1,1,4,4,4,2,3,2,7,1,6,1,1,1,3,2,4,1,1,1,1,1,6,1,4,5,4,1,4,1,2,1,2,1,1,1,1,1,5,1,6,3,2,1,2,2,4,1,6,1,1,3,2,1],
+      ["lived",4,1,17,3,3,3,3,1,16,1,2,2,30,1,1,1,3,1,8,3,18,1,5,2,1,1,25,1,33,2,2,1,22,1,26,1,3,1,1,1],
+      ["livelihood",124,2,14,1,64,1],
+      ["liveliness",87,1],
+      ["lively",4,1,59,2],
+      ["liver",7,8],
+      ["liverpool",96,1],
+      ["livestock",51,1,39,2,9,1,3,14,22,3,14,3,61,14,3,3,21,1],
+      ["living",5,1,5,1,3,1,2,2,6,1,3,4,2,1,2,1,4,1,2,1,9,1,2,1,5,1,4,1,2,2,3,1,10,1,1,2,2,2,16,1,1,1,2,6,5,3,6,1,8,3,10,1,1,1,1,1,2,1,3,1,8,2,1,2,15,1,4,1,9,1,1,5,6,1,2,2,6,1,4,2,7,1,1,4,1,2,3,2,1,1,3,1,8,1,6,2,9,1,1,1],
+      ["livingston",91,5],
+      ["lizard",25,4,64,1,21,2,77,2,6,1],
+      ["ll",20,4,50,1,2,1,30,1,59,1,24,1,14,1],
+      ["lloyd",120,1],
+      ["lo",119,1],
+      ["load",18,1,48,1,66,1],
+      ["loaded",66,2,77,1],
+      ["loan",55,1,58,1],
+      ["loathe",215,1],
+      ["lobby",82,1,88,1],
+      ["lobe",45,1,152,1,7,3],
+      ["local",15,1,1,3,5,1,2,1,2,1,1,2,2,2,4,3,2,2,4,1,7,1,10,4,7,1,8,6,6,5,8,2,2,1,5,1,25,1,1,2,5,2,2,1,5,1,7,1,5,2,2,5,4,2,6,1,4,1,5,1,3,1,4,3,10,4,3,1,13,2,22,4,1,1],
+      ["localised",81,1,113,1],
+      ["locality",131,1],
+      ["localized",65,1],
+      ["locally",22,1,28,1,26,1,4,1,134,1],
+      ["locate",69,1,9,1,88,1],
+      ["located",13,1,8,1,7,1,3,2,9,2,16,1,14,2,26,1,19,1,5,1,61,1,3,1,20,1,2,1,3,1],
+      ["locating",14,1,190,1],
+      ["location",26,1,6,1,2,1,9,1,25,1,2,1,8,1,10,1,1,1,7,3,12,2,27,1,6,2,14,5,4,1,32,1,3,1,10,1,14,1,5,1],
+      ["locator",201,1],
+      ["lock",190,1],
+      ["locke",93,1],
+      ["lockley",94,1],
+      ["locule",22,1],
+      ["lode",142,1],
+      ["lodestone",116,4],
+      ["lofty",57,1],
+      ["log",117,3,42,1],
+      ["logger",179,5],
+      ["logging",179,7],
+      ["logic",116,1,44,1,29,1],
+      ["logical",3,1,10,2,4,1,20,1,146,1,23,1],
+      ["logically",204,1],
+      ["logistic",96,1],
+      ["london",4,4,14,1,17,2,4,1,17,1,2,1,8,2,6,1,4,1,12,1,8,2,9,2,1,2,3,1,2,4,2,7,2,1,1,1,9,1,8,1,12,1,5,1,21,1,32,1,2,9,6,2,8,1],
+      ["londoner",76,1],
+      ["lone",145,1,58,1],
+      ["lonely",225,1],
+      ["long",1,2,1,2,1,1,2,2,3,1,1,1,1,4,3,1,2,1,1,1,3,1,1,1,1,1,3,1,3,4,1,1,5,1,1,1,1,1,2,1,2,1,4,2,1,1,1,2,1,3,1,1,3,1,1,1,1,2,4,1,1,1,2,1,1,2,3,3,2,2,2,2,1,1,5,1,1,1,2,2,1,1,2,1,1,1,1,1,2,1,1,1,1,1,3,1,1,1,2,1,1,1,4,2,1,1,2,1,1,2,1,1,2,2,1,1,1,1,2,1,1,2,2,1,2,1,1,2,1,1,2,1,3,2,2,3,2,1,5,2,2,1,1,3,1,4,2,2,1,2,2,1,6,3,1,1,1,2,2,1,2,1,1,2,2,1,1,1,1,5,1,1,1,1,2,1,4,1,1,1,1,1,1,3,1,1,1,5,1,2,1,1,3,1,6,1,2,6,1,1,2,2,2,2,4,1,2,1,1,1,1,1,1,3,2,3,2,4,2,3,1,1,2,2,1,2,3,2,3,4,1,1,1,5,1,1,2,3,1,2,2,3,1,1,1,2,2,2,1,1,2,1,1,1],
+      ["longer",1,1,2,1,1,2,4,1,3,1,4,1,9,10,1,4,4,1,2,1,3,2,9,1,2,1,3,1,7,2,1,1,10,1,2,1,7,1,1,3,18,1,1,1,14,1,6,1,7,1,1,1,2,1,4,3,1,1,1,1,1,1,4,1,11,1,9,1,2,1,2,1,1,1,14,1,3,1,3,3,4,1,1,1,1,2,8,1,2,1,4,1,3,1,3,1,6,1,3,1,3,4,6,1,1,1],
+      ["longest",91,1,47,1,38,1,26,1],
+      ["longevity",24,1,202,1],
+      ["longing",157,1],
+      ["longitude",64,3,47,1],
+      ["longtime",76,1],
+      ["look",3,1,3,1,1,3,12,1,2,1,4,1,5,5,1,1,3,1,8,1,1,1,1,1,3,1,3,1,3,3,2,1,5,2,3,2,5,1,1,1,1,1,3,1,3,1,6,1,3,1,6,7,2,2,4,1,1,2,2,1,4,1,4,2,1,1,2,1,3,2,4,8,16,3,8,2,3,1,3,2,8,1,3,2,1,1,4,1,10,1,1,1,2,2,2,1,1,1,1,1,7,2,2,2,5,1,1,1,4,1,3,1,12,4,1,1,4,1,2,1,1,2],
+      ["looked",5,2,18,2,6,1,1,1,12,2,2,1,1,2,4,1,5,1,2,4,2,2,9,5,1,1,14,4,7,1,16,1,8,1,2,1,5,1,25,1,6,1,24,2,14,1,16,1,9,1,1,1],
+      ["looking",1,1,5,1,6,1,6,1,1,1,6,1,3,1,5,2,10,1,6,1,6,1,3,1,11,1,1,1,1,1,7,1,2,2,1,4,6,5,4,8,2,1,5,1,2,2,4,3,6,1,4,1,6,1,35,3,3,1,2,1,14,1,8,1,2,1,6,1,1,1,4,2,9,1,1,1,6,1,5,1,6,2,1,1],
+      ["looming",5,1],
+      ["loop",5,1,8,1,5,2,82,1,32,1,29,2],
+      ["loose",146,1],
+      ["loosely",6,1,4,1],
+      ["loosen",138,1,64,1],
+      ["lopsided",57,1],
+      ["lorie",128,10],
+      ["los",35,2,5,3,61,1,42,1,52,1],
+      ["lose",29,1,19,2,47,1,17,1,12,1,7,1,7,1,11,1,3,1,4,1,20,1,5,1,5,2,8,1,1,1,7,1,5,1,18,1],
+      ["loser",131,3],
+      ["losing",33,1,5,1,88,1,5,1,67,1,11,1,7,1,3,1],
+      ["loss",1,1,6,1,4,1,9,1,13,1,26,1,6,1,10,3,7,1,4,1,4,1,1,6,3,2,1,1,8,1,25,1,34,1,11,1,3,1,3,1,1,1,6,2,2,1,21,2,11,1,4,1],
+      ["losse",48,1,17,1,56,1,88,1],
+      ["lost",0,1,22,1,10,1,3,1,3,1,3,1,22,1,3,1,11,1,10,1,3,1,18,1,13,2,24,1,20,1,3,1,2,1,14,5,4,1,2,2,4,1,3,1,6,1,10,1,6,1],
+      ["lot",6,3,1,2,8,5,1,2,9,1,10,2,18,1,1,1,5,2,4,1,3,1,5,1,10,5,1,1,1,1,8,1,2,1,11,2,22,1,2,2,1,1,2,1,3,1,8,2,17,1,1,1,4,5,8,1,4,1,3,1,12,1,18,1,10,2,7,2],
+      ["loud",118,1,47,2,7,1,49,1],
+      ["louder",46,1,56,1,97,1],
+      ["loudly",219,1],
+      ["loudspeaker",165,1],
+      ["loughborough",173,1,12,1],
+      ["loui",99,1,29,2,14,1,29,8],
+      ["lovable",41,1,184,1],
+      ["love",28,1,14,1,54,2,32,1,8,1,6,1,15,2,10,1,45,1,3,1,10,1],
+      ["loved",29,1,56,1,49,1],
+      ["lover",12,1,145,1],
+      ["lovett",224,1],
+      ["lovin",195,1],
+      ["loving",99,1,116,1,7,1,3,1],
+      ["low",18,1,2,1,4,1,9,1,15,2,11,2,11,2,5,1,10,1,1,4,32,3,10,4,7,2,5,2,13,3,1,3,7,1,4,2,12,1,3,2,11,1,4,3,1,1,4,4,9,1,14,1],
+      ["lowe",53,1],
+      ["lowell",177,2],
+      ["lower",5,1,1,1,2,5,2,1,3,1,22,1,3,1,5,2,5,2,13,1,2,2,7,2,3,1,26,2,4,1,19,1,1,1,2,1,3,1,1,1,10,6,4,1,24,2,5,1,19,1,1,2,15,1,5,2,1,1,3,2,6,1],
+      ["lowered",153,1,38,1],
+      ["lowering",59,1,47,1],
+      ["lowest",40,1,37,1,25,1,49,1,25,1,1,1,22,1],
+      ["loxodrome",64,1],
+      ["loyal",76,1],
+      ["loyalty",76,6,93,1],
+      ["ltd",31,1],
+      ["lu",88,1],
+      ["lubricate",52,1],
+      ["luck",85,1],
+      ["luckily",105,1],
+      ["lucky",30,1,42,1],
+      ["lucrative",128,1,28,1],
+      ["lucullus",169,5],
+      ["lucy",115,21],
+      ["ludovic",7,1],
+      ["ludwig",181,1],
+      ["luggage",97,1],
+      ["luke",34,1],
+      ["lullaby",83,1],
+      ["luminescence",210,1],
+      ["lump",25,1,100,4],
+      ["lumped",145,1,58,1],
+      ["lun",107,2],
+      ["lunch",20,2,177,1],
+      ["lundy",118,1],
+      ["lung",84,1,37,1],
+      ["lunge",52,1],
+      ["lurching",163,1],
+      ["lure",158,1,21,1],
+      ["lured",55,1],
+      ["luria",93,2],
+      ["luring",170,1],
+      ["lurk",3,1,49,1],
+      ["luster",108,3],
+      ["lustrous",107,1,1,3],
+      ["luxury",1,1,37,1,39,1,10,1,75,1],
+      ["lye",27,1],
+      ["lying",39,2,74,1,62,3,21,1],
+      ["lyle",136,1],
+      ["lynch",20,1,108,1],
+      ["lyndiana",218,1],
+      ["lyric",172,2],
+      ["maasai",79,1],
+      ["macfarlane",7,2],
+      ["machine",13,6,4,1,1,1,5,9,50,4,6,2,1,2,14,1,19,5,6,4,1,1,12,1,8,1,16,1,3,3,2,2,30,1,4,1,3,2],
+      ["machinery",73,1,10,1,57,2,41,1,13,5],
+      ["mackay",33,1],
+      ["mackelvie",151,2],
+      ["mackerel",52,2],
+      ["mackintosh",23,2],
+      ["maclaurin",28,1],
+      ["macphee",75,3],
+      ["macquarie",135,4,1,1],
+      ["macrosmatic",71,1,7,1],
+      ["mad",81,1,101,1],
+      ["madagascar",119,3],
+      ["made",0,2,1,7,1,1,2,1,1,1,1,2,1,1,1,1,1,1,2,1,1,3,1,1,1,1,1,1,1,4,1,1,2,6,2,2,2,14,2,1,1,1,1,2,1,2,1,21,1,4,1,1,3,1,2,2,1,1,1,3,4,2,2,2,1,1,1,5,1,2,1,1,2,5,1,1,3,1,2,3,2,1,3,2,1,5,1,4,1,1,1,2,2,3,1,1,1,1,1,2,2,1,1,1,2,1,2,1,2,1,1,1,1,6,1,1,3,1,1,2,1,1,1,1,3,8,1,2,4,2,1,2,1,3,1,1,5,1,2,1,1,10,1,1,4,3,1,5,1,2,1,3,3,1,1,4,3,1,1,1,2,1,1,1,1,1,1,1,1,5,1,2,2,2,2,1,1,1,1,1,1,3,2,1,1,2,4,1,1,2,2,2,4,1,1,2,1,2,1,3,3,1,1,1,1,1,1,2,2,1,1,1,2,4,3,4,4,3,2,2,2,1,1,4,1,1,1,2,5,3,1,1,3,2,2,1,3,1,1,1,1,4,2,1,3,2,5,2,3,3,1,1,1,2,1,2,4,1,2,2,1,3,4,1,1,1],
+      ["madeline",7,5],
+      ["madison",174,2,15,1],
+      ["madly",114,1],
+      ["magasin",114,1],
+      ["magazine",4,3,93,1,17,1,109,1],
+      ["magic",34,1,38,1,26,1,52,1,7,1],
+      ["magical",148,1,23,1],
+      ["magician",182,1],
+      ["magnet",34,1,82,7,26,1],
+      ["magnetic",17,1,52,3,47,8,5,1,7,4,49,4,49,1],
+      ["magnetised",116,1],
+      ["magnetism",116,13],
+      ["magnetite",177,1],
+      ["magnetomotive",116,1],
+      ["magnificence",87,1],
+      ["magnificent",27,1,93,1,17,1,34,1,44,1],
+      ["magnifying",113,1],
+      ["magnitude",76,1,86,1],
+      ["mahatma",15,1],
+      ["mahy",182,21],
+      ["mail",83,1,43,2,36,2,19,3],
+      ["main",1,1,9,1,17,1,2,1,4,1,5,1,6,3,13,2,6,1,14,1,7,1,3,2,7,1,7,1,6,2,1,1,6,1,18,1,6,1,9,1,9,1,13,1,9,1,8,1,3,1,13,1,8,1,10,2,2,1,1,1],
+      ["maine",81,1],
+      ["mainland",34,1,17,1,59,3,28,1,6,4,43,6,15,1],
+      ["mainly",4,1,6,2,11,1,6,1,40,1,1,1,22,1,13,2,6,1,12,1,3,1,23,2,77,1],
+      ["mainstay",170,1,15,1],
+      ["mainstream",186,2],
+      ["maintain",8,1,1,1,13,1,10,1,10,1,10,2,9,1,14,1,1,1,9,1,19,1,2,1,24,1,11,1,9,2,7,1,8,1,7,1,26,2,11,1,10,1],
+      ["maintained",6,1,8,1,30,1,11,1,72,1,4,1,52,1,5,1],
+      ["maintaining",1,1,22,1,32,1,31,1,38,1,20,1],
+      ["maintenance",33,1,6,1],
+      ["maize",50,1],
+      ["majesty",123,1],
+      ["major",8,4,12,1,3,1,6,2,1,1,4,3,4,1,1,1,1,1,1,4,3,1,1,1,6,1,4,1,3,1,2,1,1,1,4,1,4,1,3,1,1,1,2,1,2,1,6,1,3,1,6,1,2,1,2,1,1,1,3,5,2,1,11,2,3,1,1,3,5,2,2,1,11,1,1,1,10,1,1,2,4,1,2,1,17,1,8,2,1,1,1,1,10,1,1,1,3,1,2,2,3,1,9,2,1,1,2,1,9,1,2,1,2,2,2,1],
+      ["majority",10,1,6,2,15,1,11,3,14,1,2,1,3,1,10,1,7,1,10,1,7,4,45,2,1,1,33,1,12,6,8,1,3,1,7,1],
+      ["make",1,3,1,5,3,2,3,2,1,3,2,1,2,1,2,3,3,2,1,4,1,3,2,2,1,3,1,4,2,1,3,3,1,2,1,2,2,1,4,1,1,1,1,1,2,1,1,3,5,1,1,1,1,1,1,2,2,1,1,1,1,2,1,4,1,5,1,3,2,3,1,1,1,1,1,2,1,1,2,2,1,1,3,1,1,2,1,1,1,3,1,1,2,1,3,3,2,1,1,1,1,2,1,1,1,3,1,2,1,3,2,1,1,5,1,1,1,1,1,2,1,2,1,2,3,1,1,2,4,2,2,1,1,2,2,4,5,2,1,1,1,1,1,1,2,1,2,4,2,2,1,2,1,2,3,1,1,2,2,5,1,4,1,4,1,2,5,6,3,1,2,1,1,1,3,4,1,1,1,2,1,2,1,2,1,1,1,3,1,2,1,1,2,5,1,1,1,3,2,3,1,1,1,1,1,3,2,2,1,3,1,2,4,1,1,3,2,1,4,1,1,1,2,1,2,1,2,1,1,1,3,2,1,1,1,1,1,1,2,1,1,1,3,1,1,2,1,13,1,2,3,2,1,3,1,1,1,1,1,1,1,2,1,2,2,2,1,1,1,1,1,3,1,2,1,5,1,2,1,1,3,1,1,1,2,2,1,3],
+      ["makeover",34,1,117,1],
+      ["maker",34,2,12,2,18,4,6,3,3,1,9,1,26,1,44,1,1,1,13,1,20,1,14,1],
+      ["makeup",43,1],
+      ["maki",118,1],
+      ["making",0,1,1,4,7,6,3,1,4,5,4,2,2,1,3,1,10,1,3,4,1,2,3,2,4,1,1,1,1,1,4,2,4,1,1,10,3,1,4,1,3,1,5,2,2,1,1,1,4,2,4,1,7,1,3,1,2,1,1,1,12,1,3,1,8,3,4,1,3,2,2,2,2,8,7,1,4,2,6,1,2,1,4,11,4,2,4,1,1,1,3,1,1,1,1,1,1,3,1,1,2,1,1,1,1,1,3,1,2,1,3,1,2,1,7,2,1,2,4,1,6,8,9,3,2,2,1,3,2,1,4,2,1,1,3,1,1,1,2,1,1,2],
+      ["makoare",151,1],
+      ["malaria",137,31],
+      ["malarial",137,2],
+      ["malariologist",137,1],
+      ["malaysia",195,2],
+      ["malaysian",195,1],
+      ["malcolm",16,1,136,1],
+      ["male",10,1,4,4,13,1,22,1,53,1,1,1,7,5,15,1,29,4,45,1,17,3],
+      ["malfunction",13,1],
+      ["mall",47,1,67,1],
+      ["malleable",1,1,5,1,17,1,126,1],
+      ["mallorca",108,1],
+      ["malnourished",76,1],
+      ["malnutrition",51,1,82,1],
+      ["malodorously",23,1],
+      ["mammal",10,1,4,1,3,2,31,1,23,6,4,12,3,7,22,1,25,1,2,1,8,2,3,3,3,1,3,1,10,1,31,2,2,2,15,3,8,1,3,1,3,1,4,1,2,1,1,3],
+      ["mammalian",110,2,28,1,49,1,15,1,11,1],
+      ["mammoth",21,1,6,2,48,6],
+      ["man",10,1,9,2,2,1,20,1,20,1,3,3,5,1,15,1,9,1,18,8,1,1,1,2,2,1,4,1,19,1,11,2,1,1,5,2,4,1,12,1,11,1,6,3,14,1,6,2,14,2,2,1,1,1,1,2],
+      ["mana",151,1],
+      ["manage",5,1,6,1,69,2,58,2,1,1,23,1,1,1,3,4,7,1,8,1,8,1,13,2],
+      ["manageable",20,1,189,1,11,1],
+      ["managed",6,2,2,1,35,1,32,1,28,2,28,1,18,1,16,2,6,1,12,1],
+      ["management",8,5,12,1,35,3,55,1,8,1,10,4,10,1,11,2,1,1,2,1,10,3,19,1,6,1,14,1,1,1,7,1],
+      ["manager",8,10,41,2,1,1,5,1,25,1,11,1,13,2,14,3,4,1,12,1,4,2,12,2,13,1,3,9,15,2,21,2],
+      ["managerial",8,1,144,2],
+      ["managing",6,1,144,1,39,1,12,1],
+      ["manatuto",62,1],
+      ["manchester",96,1],
+      ["mandarin",77,1],
+      ["maneuverability",52,2],
+      ["maneval",70,1],
+      ["manganese",165,1,61,1],
+      ["mangueira",179,1],
+      ["manhattan",63,2],
+      ["mania",0,1],
+      ["manicouagan",25,2],
+      ["manicured",135,1],
+      ["manifestation",41,1,142,1],
+      ["manifestly",175,1],
+      ["manifesto",149,1],
+      ["manipulate",1,1,93,1,72,1,53,2,7,1],
+      ["manipulated",184,1],
+      ["manipulating",56,1,33,1,5,1,73,1,33,1,12,1],
+      ["manipulation",65,3,154,1],
+      ["mankind",142,1],
+      ["manmade",77,1],
+      ["mann",152,1],
+      ["manned",142,1,22,1],
+      ["manner",0,1,1,1,4,1,25,1,2,1,40,2,13,1,1,1,23,1,5,1,22,1,21,1,15,1,26,1],
+      ["manoeuvre",3,1],
+      ["manorbier",211,1],
+      ["mansfield",4,32],
+      ["manti",159,2],
+      ["mantled",143,1],
+      ["manual",49,1,1,1,23,1,13,1,63,1,8,1],
+      ["manufacture",19,3,10,1,18,1,14,1,68,4,2,1,9,1,54,1,23,1,1,3,8,1],
+      ["manufactured",19,1,4,1,6,2,15,1,58,1,38,2,48,1,11,1,1,1,11,1,7,2],
+      ["manufacturer",1,1,15,1,7,1,6,2,9,1,4,1,4,1,27,1,24,2,22,1,21,3,54,2,23,1,1,2,2,1],
+      ["manufacturing",16,1,13,2,9,1,24,1,11,5,4,1,30,3,10,2,12,1,11,6,32,1,1,1,21,6],
+      ["manuka",16,1],
+      ["manure",62,14,34,6],
+      ["manured",90,1],
+      ["manuscript",46,1,5,1,26,1,113,31,21,1],
+      ["many",1,2,2,3,7,1,1,3,2,7,1,7,1,10,1,6,1,1,1,1,1,2,1,2,1,2,1,2,1,1,1,2,1,1,1,3,1,1,1,2,1,3,1,2,1,1,1,1,1,1,1,1,1,1,1,3,2,2,1,4,1,3,1,2,1,4,1,2,2,2,1,6,1,2,1,1,1,2,1,2,1,2,1,4,1,4,1,1,1,2,2,1,2,3,1,3,1,1,1,2,1,2,2,6,1,2,2,2,2,1,1,1,1,2,2,1,2,4,1,1,1,2,2,1,1,1,2,1,2,2,1,2,2,2,1,4,1,1,1,8,1,1,3,3,1,2,6,8,2,1,1,6,1,3,2,2,1,1,1,9,1,5,1,2,1,1,1,1,3,1,1,2,1,1,1,3,1,2,1,2,1,1,1,3,3,4,1,1,1,1,1,2,1,5,1,2,1,2,1,3,1,4,1,4,2,1,2,6,1,2,1,2,1,1,1,6,2,6,1,2,1,2,3,2,1,2,1,1,1,1,2,3,1,4,1,2,1,1,3,3,2,4,2,2,1,1,1,3,1,2,1,1,1,2,1,1,2,2,4,2,1,1,1,1,1,1,1,2,1,3,3,1,1,2,1,1,1,11,1,4,1,5,2,2,1,1,1,2,1,1,1,2,2,8,1,3,1,1,1,1,3,1,1,3,2,3,1,3,1,2,1,1,1,1,1,1,1,1,1,1,4,4,1,2,1,1,1,2,2,4,1,6,1,7],
+      ["maori",1,23,3,2,12,6,171,1,5,1],
+      ["map",57,1,7,33,6,17,51,1,38,1,14,1,3,1,1,1,3,2,9,1,12,3],
+      ["maple",84,1,137,2],
+      ["mapmaking",64,1],
+      ["mappable",64,1],
+      ["mapped",70,1],
+      ["mapping",64,2,5,1,1,4,107,1,19,1],
+      ["mar",13,7,51,1,95,1,5,26,13,25],
+      ["marathon",97,1],
+      ["marauding",99,1],
+      ["marble",31,3],
+      ["marc",92,1,21,1,21,1,33,1,45,2],
+      ["marcellinus",77,1],
+      ["march",25,1,152,1,24,1,10,1],
+      ["marche",172,2],
+      ["marching",100,1],
+      ["marco",125,2,17,1],
+      ["marcus",77,1],
+      ["margaret",101,1,35,12,46,5],
+      ["margin",59,1,65,1],
+      ["marginal",102,2,97,2],
+      ["mari",70,1],
+      ["marie",99,1,30,1,28,2],
+      ["marilyn",74,1],
+      ["marina",179,1],
+      ["marine",5,1,9,1,7,1,7,1,17,1,3,3,4,2,16,1,3,1,7,1,45,1,2,1,11,1,5,1],
+      ["mariner",64,2,113,4],
+      ["mario",170,1],
+      ["maritime",21,1,23,1,79,1],
+      ["marius",196,2],
+      ["mark",17,1,4,1,2,1,4,1,13,1,27,6,14,1,8,1,9,1,17,2,11,1,8,1,4,1,11,1,10,1,13,1,9,1,21,1,5,2,7,3,3,4,2,1],
+      ["marked",10,1,18,1,53,1,26,1,2,1,14,1,1,1,7,1,6,1,47,2,1,1],
+      ["marker",22,1,109,1],
+      ["market",16,2,16,2,23,2,4,1,4,3,7,1,6,3,1,2,5,4,26,2,4,1,5,6,5,1,6,8,12,1,16,2,10,1,13,1,3,1,6,1,5,1,12,1,8,1],
+      ["marketable",140,1],
+      ["marketed",117,1],
+      ["marketer",114,1,52,2,34,1],
+      ["marketing",53,1,17,1,10,3,2,5,35,3,34,1,15,24,40,2],
+      ["marketplace",55,1,21,1,90,1,22,1],
+      ["marking",68,7,21,2,125,1,4,2],
+      ["markus",145,1,58,1],
+      ["markwell",26,2],
+      ["marlborough",110,1],
+      ["marlowe",145,3,58,3],
+      ["marmite",76,1],
+      ["marriage",99,1,12,1,36,1],
+      ["married",111,1,25,1],
+      ["marry",4,1],
+      ["marschner",30,6],
+      ["marshalling",64,1],
+      ["marshe",35,2],
+      ["marshland",137,1],
+      ["marsupial",144,1],
+      ["martial",87,1],
+      ["martian",64,1,95,1,5,2,13,11],
+      ["martin",34,2,12,1,3,1,26,4,60,1,50,1,25,1],
+      ["martina",58,4],
+      ["martindale",81,9],
+      ["martyn",89,1],
+      ["marvel",113,1,26,1,47,1],
+      ["marvellous",182,1],
+      ["mary",91,1],
+      ["maryland",17,1,7,1],
+      ["mash",133,1],
+      ["mashing",99,1,8,1],
+      ["mask",2,1,66,1,25,4],
+      ["mason",85,1],
+      ["masquerade",41,1],
+      ["mass",1,1,8,4,14,1,4,1,2,3,11,1,5,2,28,10,2,3,6,1,17,1,9,2,12,2,21,5,23,1,2,1,14,1,17,1,20,1,1,1],
+      ["massachusett",80,1,46,1,53,1],
+      ["massage",20,1],
+      ["masse",41,2,7,1,18,1,13,1,42,1],
+      ["massed",168,1],
+      ["massive",5,1,22,1,9,1,12,2,49,2,40,1,4,1,13,1,62,1],
+      ["massively",10,1,35,1],
+      ["mast",66,1,22,1],
+      ["master",2,2,16,1,39,1,21,1,2,4,15,1,6,8,56,2,6,1,8,1,10,2,13,2,3,1,14,1],
+      ["mastered",20,1,57,1,120,1,11,1],
+      ["masterfully",1,1],
+      ["mastering",54,1],
+      ["masterly",137,1],
+      ["masterpiece",145,1,25,1,33,1],
+      ["mastery",2,2,151,1,10,1],
+      ["masticated",23,1],
+      ["masticator",23,1],
+      ["mat",107,1],
+      ["matau",1,3],
+      ["match",18,1,24,1,20,1,27,2,9,1,20,2,13,4,43,1],
+      ["matche",89,1],
+      ["matched",10,1,15,3,63,1,20,1,76,1],
+      ["matching",57,1],
+      ["mate",14,2,38,1,58,1,11,1,33,1,50,1],
+      ["material",1,11,4,1,5,1,9,9,2,1,2,4,3,1,3,7,1,1,8,1,2,1,7,3,14,1,1,12,17,2,7,2,1,1,3,1,17,6,4,2,5,1,1,1,2,1,3,1,1,3,1,1,1,2,3,1,1,5,5,2,8,2,9,1,2,1,4,1,11,1,5,1,22,4,1,2,10,1,11,2,8,1,1,3],
+      ["materialistic",63,1],
+      ["materiality",34,1],
+      ["maternal",14,1,97,1],
+      ["math",49,1,77,1,41,1,22,1,23,1],
+      ["mathematic",2,1,28,1,26,1,55,1,42,1,56,1],
+      ["mathematical",146,1,21,2,43,1,2,2],
+      ["mathematician",2,1,21,2,122,2,45,1,13,2],
+      ["matisoff",95,2],
+      ["matriarch",14,1],
+      ["matrix",206,1],
+      ["matter",1,1,17,1,16,1,1,1,6,3,1,1,7,1,11,1,12,1,7,1,1,1,14,1,1,1,3,1,13,1,11,1,8,2,1,1,11,1,6,1,4,3,1,5,1,1,2,1,5,1,1,1,1,2,3,1,1,1,9,1,5,1,1,1,2,1,2,1,10,1,1,1,3,1,12,1,3,1,2,1,2,2,7,1],
+      ["matthew",100,1,45,1,58,1],
+      ["matthia",85,1],
+      ["mattison",24,5],
+      ["mature",22,1,27,1,35,3,24,2,66,1,15,1],
+      ["matured",34,1,81,1],
+      ["maturing",34,1,109,1],
+      ["maturity",110,1,64,1,31,1],
+      ["maurice",180,1],
+      ["mauve",38,1],
+      ["mawle",53,2],
+      ["max",8,1,19,1,64,1,24,1],
+      ["maximal",120,1],
+      ["maximally",24,1],
+      ["maximilian",181,1],
+      ["maximise",5,1,113,1,2,1,104,1],
+      ["maximised",186,1],
+      ["maximum",24,1,38,2,11,1,37,1,22,1,24,1,5,2],
+      ["maxwell",111,1],
+      ["mayan",23,1,135,1],
+      ["maybe",15,1,43,1,5,1,27,1,10,1,26,3,22,2,11,1,14,1,9,1,3,1,31,1],
+      ["mayor",33,1,17,2],
+      ["mazanek",142,1],
+      ["maze",34,1,172,1],
+      ["mba",150,1],
+      ["mccarley",17,1],
+      ["mcclure",178,1],
+      ["mccluskey",145,1,58,1],
+      ["mccutcheon",28,1],
+      ["mcdermott",167,1,45,2],
+      ["mcgill",100,1,27,1],
+      ["mcgregor",8,5],
+      ["mcintyre",104,2],
+      ["mckay",164,3],
+      ["mckechnie",138,3,64,3],
+      ["mckenna",145,1,58,1],
+      ["mcmillan",101,1],
+      ["mcpherson",136,2],
+      ["me",4,1,26,1,4,1,3,1,46,1,10,1,19,1,16,1,11,1,5,1,10,1,6,1,19,1,26,2,1,1,3,1,4,1,7,1,2,1],
+      ["mead",38,1],
+      ["meadow",84,4,98,1,41,1],
+      ["meagre",109,1],
+      ["meal",32,1,27,1,32,1,93,3,13,1,25,1],
+      ["mean",2,2,4,2,1,1,2,1,1,1,7,1,3,3,2,1,8,2,5,3,2,1,2,1,15,2,1,2,3,2,4,1,5,1,4,1,2,2,3,3,7,1,1,1,6,2,1,1,7,1,3,1,1,7,2,1,7,1,3,3,4,3,3,1,3,1,2,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,2,1,4,2,1,1,5,1,2,2,4,1,1,1,1,1,2,1,5,3,1,1,3,1,7,1,2,1,1,1,7,2,11,1,5,7,5,2,2,1,2,1,1,1,2,2,3,1,1,1,2,1,2,1],
+      ["meandering",35,1],
+      ["meaning",3,1,6,2,17,12,8,1,5,2,15,4,13,1,17,1,2,4,4,1,1,1,3,1,8,1,13,1,8,1,5,1,20,4,14,1,5,1,9,1,2,1,12,5,1,1,8,1,5,1,4,3,4,1,2,1,4,1,1,1,3,1],
+      ["meaningful",37,1,17,1,31,2,37,1,97,1],
+      ["meaningless",85,1],
+      ["meant",4,1,5,7,3,1,26,1,12,1,6,3,5,1,5,3,1,2,29,1,1,2,4,1,12,1,16,4,20,1,25,1,7,1,36,1,2,1,6,1],
+      ["meantime",30,1,86,1],
+      ["meanwhile",1,1,12,1,22,1,10,1,19,1,7,2,13,1,1,1,78,1,42,1,16,3],
+      ["measurable",55,1,67,1,24,4],
+      ["measure",6,2,4,1,1,1,12,1,13,1,27,2,6,2,11,1,7,1,7,2,30,1,16,2,1,1,14,1,3,1,20,1,1,1,1,1,10,1,19,2,5,6,6,1,6,2],
+      ["measured",36,1,26,1,1,2,28,1,3,1,20,1,47,1,15,1,4,1],
+      ["measurement",6,1,74,2,100,5],
+      ["measuring",60,2,7,1,36,1,56,1,21,1,21,1,20,1],
+      ["meat",21,1,38,3,2,1,4,1,14,2,17,1,3,2,3,33,13,3,23,1,6,1,39,1,16,33,3,1,20,10,1,1],
+      ["mechanic",35,1],
+      ["mechanical",173,1,25,5,16,3],
+      ["mechanisation",51,1,143,1],
+      ["mechanism",7,1,10,1,56,2,19,1,16,1,24,1,2,2,33,1,18,1,22,1,2,1,3,1,9,2],
+      ["mechanistic",72,1],
+      ["mechanization",194,1],
+      ["mechanize",194,1],
+      ["media",7,1,2,3,34,1,83,1,2,1,13,1,25,1,22,1,1,1,17,2,8,3],
+      ["mediaeval",46,1],
+      ["mediate",156,1],
+      ["mediation",156,3],
+      ["mediator",156,2,69,1],
+      ["medical",7,4,4,14,5,6,1,4,6,1,5,1,2,1,9,4,4,1,15,1,14,3,8,1,3,2,11,1,17,3,9,1,11,1,6,1,21,1,5,1,26,1,2,3,6,1,23,6],
+      ["medication",53,2,125,1,42,1],
+      ["medicinal",16,6,109,1,33,1,21,3],
+      ["medicine",7,1,4,1,5,23,1,1,20,1,1,1,15,6,19,2,26,1,13,1,5,1,3,1,18,1,2,1,49,1,32,3],
+      ["medieval",38,1,119,1,31,1,2,2,21,8],
+      ["medina",77,1],
+      ["mediocre",96,1,13,1,42,1],
+      ["meditation",0,1,20,2,17,1],
+      ["mediterranean",38,3,13,3],
+      ["medium",7,2,45,1,15,1,19,1,11,1,6,1,4,1,32,1,32,1,9,1],
+      ["medley",149,1],
+      ["meet",5,1,68,1,27,1,2,1,2,2,10,1,8,2,16,1,2,1,10,1,16,1,8,2,21,1,4,1,3,1],
+      ["meeteetse",223,1],
+      ["meeting",11,1,64,1,7,1,22,4,17,1,1,1,4,2],
+      ["megafauna",75,3,135,14],
+      ["megafaunal",75,1],
+      ["megan",216,1],
+      ["mehl",85,1],
+      ["mehrabian",148,7],
+      ["meinig",26,1],
+      ["meir",185,1],
+      ["melancholy",103,1],
+      ["melanie",63,1],
+      ["melbourne",20,1,69,1,47,1,34,1],
+      ["melodic",18,2,65,1],
+      ["melody",100,1,46,1,21,2,37,7,3,1,5,2],
+      ["melt",1,1,131,1,32,2],
+      ["melted",29,1,189,1],
+      ["melting",79,1,40,1,45,5,53,1],
+      ["melville",125,3],
+      ["member",8,4,4,1,2,4,8,1,10,1,13,1,6,1,5,2,12,1,15,1,2,1,13,1,8,10,3,1,1,1,17,2,2,1,7,1,3,1,8,2,7,1,9,1,4,1,3,1,7,1,1,2,5,1,1,3,11,1,6,1,6,1,5,1,1,1],
+      ["membership",55,1,97,1],
+      ["membrane",59,2,21,1,78,1,7,1],
+      ["memoir",149,1],
+      ["memorabilia",41,1],
+      ["memorably",109,1],
+      ["memorise",160,1],
+      ["memorised",58,1],
+      ["memorization",220,1],
+      ["memorized",57,1],
+      ["memorizing",168,1],
+      ["memory",2,2,2,1,14,2,53,8,7,8,15,11,1,2,10,1,10,1,16,2,25,1,4,1,12,1,5,5,5,2,4,2,7,1,17,1,6,2,5,1],
+      ["men",17,1,4,1,10,1,6,2,20,1,9,1,5,1,7,1,10,1,5,1,13,1,3,1,2,1,2,4,36,3,6,2,13,3,20,1,9,2,14,1],
+      ["menace",69,1],
+      ["mendana",192,2],
+      ["mendelssohn",205,4],
+      ["mendenhall",145,5,58,5],
+      ["menial",86,1],
+      ["mental",14,1,3,2,3,2,17,1,6,1,4,1,16,1,18,1,2,1,11,1,4,1,8,1,21,1,23,1,31,1,8,1,11,4,6,1],
+      ["mentality",55,1,63,1],
+      ["mention",58,1,3,1,11,1,16,1,35,1,58,1,27,1,3,1],
+      ["mentioned",0,2,18,1,22,1,57,1,126,1],
+      ["menton",4,1],
+      ["mentor",122,1],
+      ["menu",32,1],
+      ["meow",167,1,45,1],
+      ["mercaptan",71,1],
+      ["mercator",64,29],
+      ["merchandise",42,1,24,2],
+      ["merchant",28,1,18,1,20,4,22,2,35,1,65,1,25,2],
+      ["mercury",34,2,100,1],
+      ["mercy",188,1],
+      ["mere",10,1,11,1,56,1,6,1,7,1,10,1,6,1,3,1,36,1,22,1,4,1,32,1,7,1,2,1],
+      ["merely",2,1,43,1,9,1,31,1,61,1,61,1,10,1,4,1],
+      ["meridian",23,1,49,1],
+      ["merit",3,1,5,1,28,1,13,1,93,1],
+      ["meritxell",7,1],
+      ["merker",172,1],
+      ["merriam",145,1,58,1],
+      ["merrill",128,1],
+      ["merrytotter",211,1],
+      ["mersa",123,7],
+      ["meshing",205,1],
+      ["mesopotamia",46,1,31,1],
+      ["mesopotamian",46,1],
+      ["mess",184,1,12,1],
+      ["message",17,1,37,1,55,1,5,3,20,2,14,7,14,1,4,1,24,1,7,1,9,1,2,3,11,1,2,3],
+      ["messenger",103,1],
+      ["messier",63,1,125,1],
+      ["messy",63,2,104,1,39,1,6,1,5,1],
+      ["mestral",5,2],
+      ["met",4,2,19,1,7,1,10,1,6,1,58,1,18,1,14,1,1,1,18,1],
+      ["metabolic",185,2],
+      ["metal",1,7,26,1,7,1,4,1,19,1,4,1,18,2,5,1,14,2,9,1,9,2,7,1,11,1,6,1,2,1,69,1,6,1,1,1],
+      ["metamorphose",145,1,58,1],
+      ["metaphor",145,2,4,1,54,1],
+      ["metaphorically",158,1],
+      ["meteorite",25,1,152,2],
+      ["meteoroid",142,2],
+      ["meteorologist",91,1],
+      ["meter",50,2,2,1,86,1,64,1,14,2],
+      ["methane",164,1],
+      ["method",7,2,4,1,9,1,6,3,1,2,1,1,2,1,3,1,2,1,2,2,3,1,12,2,2,1,7,9,3,2,9,5,4,2,2,3,9,1,8,1,1,2,5,1,5,1,1,1,2,1,1,1,2,1,3,1,13,1,1,1,1,1,3,1,2,1,9,4,4,1,10,2,3,1,1,1,1,8,2,1,2,2,10,2,12,2,3,1,1,1,1,1,4,1,2,1,2,4,11,6,1,1,2,1,1,2,1,1,5,1,2,1],
+      ["methodically",130,1],
+      ["methodological",26,1,122,1,30,1],
+      ["methodology",3,1,33,1,112,1,20,1],
+      ["methyl",65,2],
+      ["metre",5,2,16,2,14,1,9,5,13,1,11,3,1,5,15,2,7,2,5,2,21,1,6,4,2,2,7,1,10,3,23,4,8,2,4,3,3,1,12,1,3,1,1,5,5,1,9,3],
+      ["metric",172,1],
+      ["metro",31,1],
+      ["metronome",83,1],
+      ["metropoli",50,1,89,1],
+      ["mexican",23,1],
+      ["mexico",10,1,12,1,1,2,12,1,9,1,4,1,27,2,6,1,9,2,11,2,38,1,4,2,15,1,65,2],
+      ["meyer",126,2,55,2],
+      ["mg",159,1],
+      ["miasma",137,1],
+      ["mice",24,2,79,1,55,2],
+      ["michael",6,1,40,1,24,1,13,1,11,1,1,1,23,1,16,1,38,1],
+      ["michel",185,1],
+      ["michele",70,1],
+      ["michelle",135,4],
+      ["michelson",159,2],
+      ["michiel",68,14],
+      ["michigan",79,1,13,1,3,1,31,1,27,1,28,1],
+      ["mick",5,4],
+      ["micro",124,1,13,1,38,2,2,3,48,1],
+      ["microbe",75,1,83,1,19,1],
+      ["microbial",177,1],
+      ["microbiologist",7,1],
+      ["microcosm",33,1],
+      ["micromanaging",151,1],
+      ["microphone",180,1],
+      ["microscope",5,1,2,2,132,1,51,1],
+      ["microscopic",52,1,89,1,80,1,5,3],
+      ["microsmatic",71,1,7,1],
+      ["microsoft",122,6],
+      ["mid",3,2,13,5,13,1,9,1,5,1,3,2,11,1,27,1,6,1,13,1,7,1,13,1,9,1,8,1,25,1,3,1,7,1,1,1,29,2,18,1],
+      ["middle",3,1,1,1,23,1,4,2,8,1,7,1,5,1,2,1,1,1,1,1,22,2,2,2,5,4,3,1,1,1,13,2,2,1,2,1,4,2,3,1,6,1,7,1,4,1,1,1,3,1,7,4,16,1,1,1,5,1,7,1,21,1,5,1,1,1,11,2,4,3,14,1],
+      ["middleton",4,1],
+      ["midst",17,1,208,1],
+      ["midtown",63,1],
+      ["midway",130,1],
+      ["midwest",96,1],
+      ["migrant",40,1,36,4,45,2,9,1],
+      ["migrate",21,1,35,1,65,6],
+      ["migrated",109,1,59,2],
+      ["migrating",52,1,24,1],
+      ["migration",40,6,16,2,39,1,26,7,9,5,37,1,1,3,44,1],
+      ["migratory",130,2,14,1],
+      ["mike",33,1,60,2],
+      ["milan",219,1],
+      ["mild",158,4,56,1],
+      ["mildish",21,1],
+      ["mile",27,1,30,1,33,1,2,1,20,1,1,1,8,1,22,1,21,2,4,1,1,2],
+      ["milestone",64,1],
+      ["milgrom",156,3],
+      ["milieu",87,1],
+      ["military",23,1,41,1,65,1,27,1,3,1,2,1,8,1,42,2],
+      ["milk",0,1,74,1,5,1,23,6,97,6,1,1],
+      ["milkshake",200,1],
+      ["mill",23,1,10,8,8,1,3,1,63,2,87,2],
+      ["millennia",21,1,25,1,44,1,48,1,64,1,8,1,8,1],
+      ["miller",126,3],
+      ["millie",105,1],
+      ["milligram",178,1],
+      ["millimetre",173,1],
+      ["milling",51,2],
+      ["million",20,1,2,1,3,14,3,4,3,1,2,3,2,2,8,1,1,3,1,3,3,1,4,1,10,4,7,3,10,1,1,1,2,1,6,2,2,4,4,2,2,1,1,2,2,1,1,1,2,5,8,1,2,2,3,4,2,2,2,3,2,1,1,3,6,1,6,1,4,3,1,3,3,3,2,5,5,1,2,1,7,1,8,1,11,2,1,1,7,3,2,1,6,1,2,1,1,1,3,5,3,3,8,1,7,1,3,2,2,7,1,2,1,1],
+      ["millionaire",34,1],
+      ["mimesis",57,1],
+      ["mimic",89,2],
+      ["mimicked",120,1,6,1],
+      ["mimicking",43,1,121,1,52,1],
+      ["mimicry",89,3],
+      ["mind",4,1,7,1,1,2,6,12,14,1,2,3,3,3,5,1,15,4,6,1,9,2,8,1,1,1,1,2,18,1,1,1,10,1,5,1,4,1,5,1,6,1,2,1,13,1,4,5,7,1,1,1,1,1,1,3,1,1,2,1,4,1,3,1,1,1,1,2,4,1,12,2,9,1,11,1,1,1,2,1,1,1,3,2,7,1,4,1],
+      ["minded",81,1,98,1],
+      ["mindfulness",37,3],
+      ["mine",23,1,56,1,34,2,19,1,10,1,31,1,9,1,35,2,1,1],
+      ["mined",142,2],
+      ["miner",99,1,14,6,22,2],
+      ["mineral",69,1,18,1,27,1,2,1,9,1,40,1,8,1,4,1,24,1,17,3],
+      ["mineralised",177,1],
+      ["mineralogist",125,1],
+      ["minerva",169,1],
+      ["mingle",14,1,98,1],
+      ["mini",7,1,158,1],
+      ["miniature",104,1,35,1,85,1],
+      ["minimal",33,1,19,2,18,1,20,1,61,1,12,1,16,1,1,1],
+      ["minimally",174,1],
+      ["minimise",66,1,54,1],
+      ["minimising",224,1],
+      ["minimize",214,2],
+      ["minimizing",52,1],
+      ["minimum",94,1,7,1,17,1,4,1,12,1,15,1,13,1],
+      ["mining",69,1,10,3,34,1,15,1],
+      ["minister",44,1,44,1,21,1,13,1,57,1,15,1],
+      ["ministering",171,1],
+      ["ministry",49,4,42,1,42,1],
+      ["minnesota",80,1,77,1,59,1],
+      ["minor",100,5],
+      ["minority",54,1,2,1,39,4,58,1,33,2],
+      ["minus",222,1],
+      ["minuscule",134,1,19,1,56,1],
+      ["minute",13,1,2,1,3,1,25,1,14,1,5,2,1,1,29,3,14,1,15,1,5,3,5,1,33,2,1,1,7,2,2,1,1,1,6,1,3,1,1,1,11,1,2,1,23,1,5,1],
+      ["minutely",171,1],
+      ["miracle",5,1,59,1,73,1,26,1],
+      ["miraculous",9,1,74,1],
+      ["miraculously",12,1,211,1],
+      ["mirror",57,11,1,1,13,1,27,27,9,1,2,1,48,1,7,3],
+      ["mirrored",34,1,64,1],
+      ["mirroring",57,2],
+      ["mis",166,3],
+      ["misapprehension",20,1],
+      ["misappropriating",151,1],
+      ["misconception",45,1,26,1,16,1,64,1,37,1],
+      ["misdated",25,2],
+      ["misfortune",15,7],
+      ["misinterpret",209,1],
+      ["mislead",175,1],
+      ["misleading",45,1,26,1,7,1],
+      ["misled",208,1],
+      ["misread",53,1],
+      ["miss",4,1,88,1,1,1,37,3,32,1],
+      ["misse",20,1,94,1,46,1],
+      ["misshapen",99,1,9,1],
+      ["missing",20,1,62,1,69,1,41,1],
+      ["mission",13,4,110,1,19,11,22,1,13,3],
+      ["missionary",88,1,31,1,49,1],
+      ["missiroli",137,1],
+      ["mississippi",35,1],
+      ["missouri",223,1],
+      ["mist",214,1],
+      ["mistake",6,2,106,1,6,1,34,1,29,1,1,1,15,1],
+      ["mistaken",45,1,118,1,45,1],
+      ["mistaking",93,1],
+      ["mistresse",157,1],
+      ["misunderstanding",124,1,24,1,14,1],
+      ["misunderstood",72,1],
+      ["misused",99,1],
+      ["mitchill",213,9],
+      ["mitigate",200,1],
+      ["mix",54,4,8,1,55,1,1,3,11,2,33,1,21,1,18,2,17,1],
+      ["mixe",63,3],
+      ["mixed",5,1,13,1,43,1,113,1,4,1,22,1,10,2,8,1],
+      ["mixing",23,1,31,2,53,1,110,1],
+      ["mixture",29,5,22,1,11,2,16,1,8,1,21,1,22,1,36,3,52,1,1,6],
+      ["mm",1,2,28,1,23,1],
+      ["mnc",162,1],
+      ["mnemiopsis",48,1],
+      ["moat",170,1],
+      ["mob",103,1],
+      ["mobile",44,1,38,1,39,1,6,1,6,2,14,2,44,1,6,1],
+      ["mobilise",41,1,28,1],
+      ["mobilising",72,1],
+      ["mobility",69,1,117,1],
+      ["moby",125,3],
+      ["mocked",171,1],
+      ["mockery",149,1],
+      ["mode",32,1,20,1,48,3,23,1],
+      ["model",5,2,2,1,1,6,21,1,1,5,10,3,6,1,10,3,13,1,6,2,34,1,24,1,19,1,4,6,4,1,2,1,6,1,2,1,3,2,22,1,1,1,14,1,15,1],
+      ["modeling",30,1],
+      ["modelled",5,1],
+      ["modeller",156,1],
+      ["modelling",156,3],
+      ["moderate",9,1,42,1],
+      ["moderately",172,1],
+      ["modern",1,1,4,1,3,1,1,2,3,1,5,1,5,2,3,4,2,4,1,3,1,2,10,1,1,1,3,6,1,1,1,1,1,4,1,6,14,1,2,4,1,5,1,1,8,1,3,1,1,1,10,1,7,1,2,5,6,5,5,1,5,2,3,3,1,4,4,2,3,2,3,1,3,12,3,1,5,2,3,1,1,1,4,1,5,4,10,1,6,1,1,1,1,2,1,1,1,1,1,1,1,2,8,1,1,1,7,2,2,1,3,1,2,6,3,1,1,5,4,1,4,2,1,3,2,2,1,2,1,1,6,2],
+      ["modernisation",41,1],
+      ["modernising",41,1],
+      ["modernism",195,1,10,1],
+      ["modernist",4,1,167,1,24,1],
+      ["modernity",149,1],
+      ["modest",75,1,47,1,94,1],
+      ["modestly",157,1],
+      ["modification",22,1,24,1,161,2],
+      ["modified",10,1,133,1,64,1,11,1],
+      ["modify",165,1,44,1],
+      ["modifying",127,1,3,1],
+      ["modular",133,1],
+      ["modulate",174,2],
+      ["modulating",72,1],
+      ["mohsin",188,1],
+      ["moist",112,1],
+      ["moisture",51,1,89,1,33,2,28,1],
+      ["moisturise",51,1],
+      ["mold",129,1],
+      ["moldova",21,1],
+      ["mole",154,2],
+      ["molecular",7,2,15,1,97,1,107,1],
+      ["molecule",19,2,52,1,9,1,49,1,30,1,18,1,49,1],
+      ["mollusc",21,1,26,1],
+      ["mollusk",108,1],
+      ["moment",14,1,16,2,5,1,18,1,4,1,6,1,18,1,25,1,22,1,3,1,7,1,24,1,10,1,11,1,5,1,9,1,3,1,2,1],
+      ["momentary",219,1],
+      ["momentum",36,1,19,1,65,1],
+      ["mona",34,39],
+      ["monarch",9,1],
+      ["monastery",0,1,88,1,123,1],
+      ["monday",94,2],
+      ["monetary",8,1,55,1],
+      ["money",15,5,13,5,5,1,5,1,1,1,8,1,2,1,6,3,11,2,22,1,2,1,17,2,1,1,3,1,2,2,5,2,4,1,12,1,8,1,2,1,12,1,6,1,1,1,9,1,12,1,4,1,29,1],
+      ["moneyed",101,1],
+      ["monica",221,1],
+      ["monitor",18,4,36,1,27,4,39,1,2,1,58,1],
+      ["monitored",24,1,76,1,101,1],
+      ["monitoring",103,1,77,1,21,1],
+      ["monk",37,1,40,2,11,1,102,2],
+      ["monkey",24,29,33,2,69,1,17,42,24,1,7,12,38,1,10,2],
+      ["monocultural",139,1],
+      ["monoculture",48,2,91,1,2,1],
+      ["monocyclic",91,1],
+      ["monolithic",63,1],
+      ["monopolising",77,1],
+      ["monopoly",66,2,11,1,11,5,130,1],
+      ["monsieur",109,1],
+      ["monster",25,1,152,1],
+      ["mont",146,1],
+      ["montana",90,1],
+      ["monte",40,1],
+      ["monteiro",129,9],
+      ["montezuma",23,1],
+      ["montgomery",37,8,26,3,119,2],
+      ["month",0,1,20,2,4,1,2,1,5,2,2,2,6,1,19,1,1,1,11,2,4,1,7,1,3,1,5,1,5,1,3,1,4,2,4,1,7,1,4,1,12,1,8,1,6,2,9,1,11,1,3,1,9,2,2,2,3,1,1,1,5,1,5,1,1,1,7,4,13,1,9,1],
+      ["monthly",73,1],
+      ["montparnasse",112,1],
+      ["montreal",83,2,17,5,104,1],
+      ["monty",48,1],
+      ["monument",31,4,10,1,88,1,18,1],
+      ["monumental",44,1,6,1,119,1],
+      ["monumentally",24,1],
+      ["mood",18,5,25,1,17,1,11,1,10,3,74,5,2,1,15,1,32,2],
+      ["moody",34,1,60,1],
+      ["moon",13,2,39,1,64,1,44,1,13,1,4,1,3,2],
+      ["mooney",144,5],
+      ["moor",107,1],
+      ["moral",87,1,15,1,44,1,25,3,11,1,17,1],
+      ["morale",122,1],
+      ["mordant",38,2],
+      ["moreira",179,2],
+      ["moreover",13,1,2,1,6,1,35,1,56,1,25,1,43,1,15,1,6,1,3,1,3,2,9,1],
+      ["morepork",103,21],
+      ["morgan",145,1,58,1],
+      ["morning",34,1,29,1,30,1,5,1,17,2,3,1,8,1,56,1],
+      ["morocco",45,2],
+      ["morphine",72,2],
+      ["morri",45,1],
+      ["morrison",36,1],
+      ["morse",97,2],
+      ["mortality",99,1,4,1],
+      ["mortar",107,1,62,1],
+      ["morten",208,1],
+      ["mosaic",169,3],
+      ["moscow",0,1],
+      ["mose",46,2,3,1],
+      ["mosman",136,1],
+      ["mosquito",137,2,47,1],
+      ["mosquitoe",101,2,36,3],
+      ["mosse",38,1],
+      ["mossman",33,7],
+      ["mosteller",153,1],
+      ["mostly",21,1,4,1,19,1,26,1,9,2,2,4,7,1,2,1,1,1,3,1,1,1,4,1,3,1,3,1,6,1,4,1,9,1,33,1,6,1,1,1,3,1,26,1,2,1,1,1,3,1,13,1,4,1],
+      ["motel",182,1],
+      ["moth",89,1,14,1,90,1],
+      ["mother",14,3,8,1,7,1,5,1,20,5,32,1,11,1,11,1,3,1,16,1,9,1,6,1,15,3,10,2,7,5,8,1,4,16,6,1,15,1,5,2,3,1,1,5,9,1],
+      ["motherhood",54,1],
+      ["motif",157,1],
+      ["motion",5,1,47,5,5,1,34,1,41,1,42,1,18,1],
+      ["motionless",89,2,85,2],
+      ["motivate",8,1,106,1],
+      ["motivated",8,1,29,1,29,1,15,1,46,1,48,1],
+      ["motivation",2,1,4,2,2,1,57,1,18,1,62,1,11,2,47,1],
+      ["motor",2,1,1,3,15,1,5,8,34,5,16,1,1,1,13,1,13,3,32,1,42,3,2,2,13,1],
+      ["motoring",149,1],
+      ["motuora",103,2],
+      ["mould",29,2,36,1,42,1,32,2,11,1,45,1,16,1,6,1,1,1],
+      ["moulded",19,1,10,1],
+      ["moulding",117,1,10,1],
+      ["moulted",127,1],
+      ["mound",5,2,45,3,12,1,111,18],
+      ["moundville",147,1],
+      ["mount",69,1,18,1,79,1],
+      ["mountain",10,3,35,4,5,1,17,1,2,1,21,4,26,1,8,1,8,4,32,1],
+      ["mountainous",99,1],
+      ["mountainside",132,1],
+      ["mounted",97,1,25,1,22,1],
+      ["mounting",55,1,14,1,52,1,88,1],
+      ["mourn",95,1],
+      ["mournful",100,1],
+      ["mouse",7,1,209,1],
+      ["mouth",3,4,18,1,24,1,53,1,8,2,7,1,12,1,2,1,6,1,43,1,12,1,3,1,5,2,20,1],
+      ["mouthcan",216,1],
+      ["mouthguard",191,2],
+      ["mouthing",182,1],
+      ["movable",29,1,78,1],
+      ["move",3,1,2,1,8,1,3,2,11,2,14,1,4,1,3,1,4,2,11,1,6,2,11,1,1,2,1,1,1,1,6,2,3,1,6,1,2,1,1,1,13,1,7,1,3,2,8,4,3,1,7,1,12,1,5,2,5,1,1,6,8,1,11,1,5,1,9,1,9,1,8,1,7,1,2,1],
+      ["moved",4,3,5,1,18,1,5,1,7,1,8,1,26,1,3,1,14,2,4,1,11,1,6,1,1,1,3,1,3,1,5,1,9,1,4,1,7,1,10,1,19,1,32,1,6,1,5,1],
+      ["movellan",198,3],
+      ["movement",2,2,1,2,1,1,13,1,1,1,2,1,10,1,2,1,4,1,5,1,11,9,4,1,1,6,2,1,10,3,14,2,3,1,3,1,5,3,3,1,3,3,1,1,14,1,5,1,8,1,3,2,3,1,8,4,17,1,1,1,5,1,6,1,14,1,3,1,19,2,13,2],
+      ["mover",149,1],
+      ["movie",15,1,131,1,54,1,6,1],
+      ["moviemaking",30,1],
+      ["moving",5,2,10,1,3,1,16,1,14,1,4,2,4,1,1,1,39,2,25,1,19,1,2,2,1,1,4,1,18,2,1,1,6,1,9,1,7,1,1,1,7,1,19,1,7,5],
+      ["movy",25,1,72,1],
+      ["mow",118,1],
+      ["mozart",2,6,165,1,45,1],
+      ["mph",47,1],
+      ["mr",28,1,65,2,25,1,53,2],
+      ["mrc",7,2],
+      ["mri",37,1],
+      ["mrs",118,1],
+      ["ms",158,1,32,1],
+      ["mu",57,3],
+      ["much",2,4,1,2,1,1,2,2,5,1,1,1,1,1,1,1,1,3,2,2,1,1,2,5,1,2,2,2,1,3,1,1,4,1,1,1,1,1,2,1,1,2,1,1,1,1,3,2,2,1,2,3,3,2,1,2,2,4,2,2,1,2,1,2,2,1,5,2,1,1,5,5,2,1,1,1,1,2,1,1,1,1,1,2,2,1,1,1,2,1,1,1,3,1,3,1,1,2,1,1,1,2,2,1,1,1,1,2,1,1,1,1,1,1,1,2,2,3,2,1,2,2,2,1,1,1,1,3,1,1,1,4,1,3,2,1,1,2,2,1,1,2,3,1,2,2,1,1,2,1,2,2,3,3,1,1,1,1,2,2,1,1,1,1,4,2,2,1,2,1,1,2,5,1,2,2,1,1,1,1,1,1,2,3,1,1,1,2,1,1,2,1,1,2,2,2,2,1,5,3,3,1,4,2,1,1,1,4,1,1,1,1,3,2,1,1,1,2,2,2,1,1,2,1,3,1,1,3,1,1,1,1,2,2,2,1,1,2,2,2,1,2,1,1,1,1,1,2,1,1,2,3,3,1,1,3,4,2,2,2,5,1],
+      ["mucus",38,2],
+      ["mud",21,1,4,4,20,1,6,1,39,1,33,2,50,1,22,1],
+      ["muddling",162,1],
+      ["muddy",64,1,32,1,17,2],
+      ["mudflat",121,1],
+      ["muhammad",195,1],
+      ["mujica",71,1],
+      ["muka",1,1],
+      ["mulberry",107,3],
+      ["mule",132,3],
+      ["multi",14,1,8,1,19,1,23,1,9,1,6,1,12,1,6,1,10,1,11,1,19,1,11,1,7,1,42,16],
+      ["multibillion",140,1],
+      ["multidisciplinary",173,1],
+      ["multilingualism",54,1,41,1,67,3],
+      ["multimedia",95,1],
+      ["multinational",104,1,58,6],
+      ["multiple",26,2,18,1,40,1,14,1,28,1,6,1,7,1,12,1,9,1,36,1,1,1,17,1],
+      ["multiplication",73,1],
+      ["multiplicity",45,1],
+      ["multiplied",48,1,21,1],
+      ["multiplier",33,1],
+      ["multiply",7,1],
+      ["multitasker",126,2],
+      ["multitasking",126,9,55,13],
+      ["multitude",53,1],
+      ["multitudinous",64,1],
+      ["mum",54,1],
+      ["mumbai",112,1],
+      ["mummy",77,1,148,1],
+      ["mundane",182,1],
+      ["munich",29,1,152,1],
+      ["municipal",112,1,22,2,17,1],
+      ["munster",58,1],
+      ["murray",11,1,58,2],
+      ["murry",4,7],
+      ["muscle",3,1,49,1,7,1,30,1,5,1,6,1,72,1,3,1,14,1,11,1,16,3,4,3],
+      ["muscular",3,1],
+      ["museology",55,1],
+      ["museum",1,1,33,17,12,2,9,17,8,1,12,2,9,2,5,1,2,1,6,1,8,1,7,1,3,1,4,1,16,2,9,1,7,1,18,2,1,15,1,1,16,1,5,1,3,1,23,1],
+      ["musgrove",23,1],
+      ["mushara",154,2],
+      ["mushroom",133,4,6,3],
+      ["music",2,4,4,4,5,1,7,27,28,2,4,1,10,1,11,1,7,1,5,35,9,1,8,35,26,5,20,11,20,1,1,39,5,15,4,6,9,1,12,1,7,12,4,14,4,39,7,1],
+      ["musical",2,11,16,2,5,1,27,1,27,2,16,1,7,2,67,5,5,1,4,9,28,10,4,1,4,5],
+      ["musically",100,1],
+      ["musician",2,2,2,1,2,1,94,4,76,3],
+      ["musicologist",167,1,45,1],
+      ["musicophilia",83,1],
+      ["musk",10,1],
+      ["mussel",108,3],
+      ["mustela",223,2],
+      ["musty",171,1],
+      ["mutant",22,1],
+      ["mutation",22,2],
+      ["mutual",139,1],
+      ["mutually",156,1],
+      ["my",11,2,4,1,11,1,4,1,3,1,1,3,20,5,26,1,13,1,5,3,3,1,14,1,3,1,26,1,4,2,1,1,8,1,22,3,3,3,1,1,5,1,10,1,2,1,5,2,3,2,1,1,11,1,1,1,1,2],
+      ["myanmar",108,1],
+      ["mycology",105,1],
+      ["mynah",187,1],
+      ["myriad",177,1],
+      ["myron",128,1],
+      ["mysterious",27,1,45,1,51,1,88,1,14,1],
+      ["mystery",17,6,1,1,27,2,26,1,4,1,8,1,15,1,3,1,20,1,4,1,35,1,7,1,18,2,5,2,22,1,10,1],
+      ["mystical",154,1],
+      ["mysticism",72,1,44,1],
+      ["mystified",3,1,100,1],
+      ["mystique",148,1],
+      ["myth",9,1,13,1,9,1,8,4,15,2,17,1,7,1,85,1,20,1,34,1],
+      ["mythical",149,1,48,1],
+      ["naarding",144,5],
+      ["nacl",79,1],
+      ["nadolny",149,8],
+      ["naga",158,2],
+      ["nail",1,1,115,1],
+      ["nairobi",201,1],
+      ["naisbitt",166,2],
+      ["naked",67,1,113,1],
+      ["naloxone",72,2],
+      ["name",4,3,6,1,13,1,5,1,10,2,6,1,2,3,7,2,13,1,4,2,8,1,1,1,1,2,2,2,2,1,11,1,4,1,4,1,12,1,3,1,5,1,8,1,9,1,4,1,1,1,26,1,10,2,2,2,1,1,11,1,8,1,5,1,5,1,4,1,1,1],
+      ["named",18,1,4,1,1,1,8,1,17,1,10,1,6,1,2,1,26,1,11,1,4,1,9,3,41,1,15,1,3,5,2,1,6,1,10,1,5,1,15,1,5,1],
+      ["namely",146,1],
+      ["namibia",43,1,111,1,19,1],
+      ["naming",64,1,112,1,5,1],
+      ["nano",226,1],
+      ["nanobacteria",177,2],
+      ["nanofiltration",226,1],
+      ["nanometre",226,2],
+      ["nanoparticle",226,7],
+      ["nanoporous",226,1],
+      ["nanoscience",80,1,146,1],
+      ["nanotechnology",226,16],
+      ["nanotechnologyin",226,2],
+      ["nap",43,6,51,1,126,1],
+      ["napkin",107,1],
+      ["naple",129,1],
+      ["napoleon",112,1,45,1,60,1],
+      ["napoleonic",111,1],
+      ["napping",43,2],
+      ["narcolepsy",220,1],
+      ["narcotic",83,1],
+      ["narragansett",32,1],
+      ["narrated",109,1],
+      ["narrative",149,1,8,2,11,1,3,1],
+      ["narrow",3,1,19,1,9,1,2,1,8,1,5,1,6,1,10,1,4,1,7,1,94,1,3,1,18,1,17,1,7,1],
+      ["narrowed",196,1],
+      ["narrower",66,1],
+      ["narrowly",63,1,10,1,23,1],
+      ["nasa",142,5,19,2,3,1,13,3],
+      ["nasal",3,2,51,1,17,1,87,1],
+      ["nasty",157,1,56,1],
+      ["natalie",133,1],
+      ["nathan",37,1],
+      ["nathaniel",172,1,13,1],
+      ["nation",33,1,2,1,22,1,31,1,3,1,8,2,2,7,1,1,14,1,18,1,1,1,2,1,49,2,8,1,2,1,3,1,6,1,4,1,8,1],
+      ["national",20,1,4,2,8,1,2,1,1,1,6,1,8,2,4,1,2,1,7,1,8,1,18,1,2,2,1,2,6,2,8,1,6,1,6,2,18,1,1,2,4,1,3,2,1,1,7,1,12,1,7,2,2,1,14,2,1,1,7,1,1,2,14,1,9,1],
+      ["nationalism",162,1],
+      ["nationality",76,1,81,1],
+      ["nationally",118,1],
+      ["native",1,2,3,2,12,5,7,2,9,1,6,1,10,1,2,1,4,1,21,1,13,1,2,1,5,2,8,7,7,1,25,20,1,3,2,5,3,15,2,3,1,1,18,1,17,1,7,1,1,1,6,2,1,1,8,5,5,2,9,1,7,1,1,1],
+      ["natural",1,1,5,1,6,1,4,3,3,2,3,1,15,3,1,9,1,2,1,2,3,2,4,3,1,1,4,1,9,1,1,1,1,1,5,1,1,1,3,2,3,1,2,1,2,2,5,1,2,1,3,1,7,1,9,2,3,11,3,3,4,1,2,1,2,3,1,3,2,4,1,1,1,2,1,2,1,1,5,1,4,2,1,2,4,2,10,1,14,2,3,3,8,1,5,1,7,1,3,1,2,1,20,3,1,4,1,1,1,1,3,1,2,1,2,1,1,1,1,8,2,1],
+      ["naturalism",136,1],
+      ["naturalist",51,1,8,1,30,2,38,1,60,1,36,1],
+      ["naturally",6,1,20,1,4,1,8,1,1,1,8,1,38,1,14,1,6,1,3,2,40,1,2,1,57,1],
+      ["naturalness",86,1],
+      ["nature",5,7,7,2,14,1,10,1,2,1,7,1,10,1,2,1,5,2,7,1,6,1,3,1,6,2,1,1,1,1,1,1,2,1,2,1,5,2,10,4,6,2,4,1,4,11,6,1,2,1,11,1,4,1,3,1,2,1,2,3,4,1,4,2,1,1,1,1,4,1,3,3,7,1,5,3,1,1,1,2,6,1,8,2,1,1,10,1,1,1,1,1,3,1,1,3,1,1,2,2,6,1],
+      ["nauseous",161,1],
+      ["nautical",111,1,57,1],
+      ["naval",44,1,128,1,45,1],
+      ["navigate",70,1,89,6],
+      ["navigated",168,1],
+      ["navigating",123,1,36,1,30,1],
+      ["navigation",35,1,29,1,57,2,9,1,29,1,9,7],
+      ["navigational",13,1,51,1,95,3],
+      ["navigator",168,7],
+      ["navy",0,2,149,2,23,2,8,1,37,1],
+      ["nb",125,1],
+      ["ncea",49,5],
+      ["neanderthal",21,9,6,3,73,1,108,2],
+      ["neanderthaler",21,6],
+      ["near",8,1,13,2,6,2,4,1,12,1,2,1,5,1,2,2,16,2,1,1,8,3,2,3,5,1,6,1,6,1,12,1,2,1,5,1,1,1,6,1,7,1,7,1,3,1,3,3,8,1,15,1,31,2,2,1,12,1,6,1,1,1,7,1],
+      ["nearby",0,1,40,1,10,1,18,1,31,1,16,1,8,1,12,1,8,3,26,2,23,1,4,1,15,1,6,1,4,2],
+      ["neared",184,2],
+      ["nearer",35,1],
+      ["nearest",194,1],
+      ["nearly",1,1,5,1,18,1,7,1,1,2,1,1,11,1,6,3,2,1,11,1,24,1,7,1,2,1,8,1,5,1,7,1,6,3,4,2,2,1,8,1,26,1,10,1,11,1,1,2,10,1,26,1],
+      ["nearness",174,1],
+      ["neatly",84,1,68,1],
+      ["neberg",84,2],
+      ["necessarily",40,1,16,1,2,1,5,1,9,1,3,1,12,1,4,1,7,2,16,1,17,1,10,1,5,1,7,1,25,1,37,1],
+      ["necessary",1,2,2,1,7,1,6,2,14,1,18,1,1,1,24,1,2,1,4,1,3,1,2,1,10,1,10,1,6,1,11,1,3,1,7,1,6,1,10,1,17,1,3,2,3,1,6,1,2,1,6,1,1,1,16,1,6,4,5,2,1,1,11,1],
+      ["necessity",13,1,43,3,61,1,6,1,4,1,24,1,16,1,3,1,42,1],
+      ["neck",46,5,64,1,106,10],
+      ["neckabout",216,1],
+      ["necked",46,1],
+      ["necklace",50,1,58,1],
+      ["nectocari",45,1],
+      ["ned",174,1],
+      ["need",2,1,1,1,2,1,2,1,1,2,1,1,2,4,2,2,1,1,1,1,1,1,10,2,6,1,3,1,4,1,2,3,6,2,1,2,4,3,1,1,1,1,1,1,3,1,1,1,1,1,2,6,3,1,4,2,1,1,3,1,1,1,1,1,3,1,1,1,1,2,1,3,1,3,1,2,1,1,2,8,8,4,2,1,1,1,5,2,2,1,2,7,8,4,1,1,2,1,1,1,2,5,2,14,5,2,1,1,1,4,2,3,3,6,1,1,3,2,3,1,1,1,1,6,2,1,1,9,2,1,4,1,1,1,2,1,6,1,1,1,1,3,1,1,2,7,1,1,3,6,3,2,6,1,2,1,1,1,3,2,1,1,3,2,2,7,4,5,2,1,1,1,1,2,3,2,1,1,1,1,2,2,2,1,1,1,1,1,2,1,3,1,1,1,3,1,1,2,1,1,1,1,4,1],
+      ["needed",1,1,4,1,1,1,3,1,4,1,2,1,6,6,9,1,4,3,1,1,15,2,12,1,2,1,1,1,1,2,1,1,2,1,16,1,9,1,2,1,3,1,2,1,5,1,7,1,5,1,5,1,1,1,3,1,1,3,1,5,2,1,2,2,9,4,11,1,9,2,1,2,3,2,25,1,4,1,14,1,2,1,10,1,1,6],
+      ["needing",129,4],
+      ["needle",224,1],
+      ["needless",184,1],
+      ["needlessly",188,1],
+      ["needn",89,1],
+      ["neff",90,5],
+      ["negate",168,1,15,1],
+      ["negative",8,2,12,1,21,1,40,1,1,1,14,1,2,1,18,1,4,1,21,1,7,1,13,1,17,1,8,1,39,1],
+      ["negatively",82,1],
+      ["negev",221,1],
+      ["neglect",8,2,1,1,27,1,127,1,45,1],
+      ["neglected",72,1,48,1,37,1,14,2,37,1],
+      ["negligibly",206,1],
+      ["negotiated",178,1],
+      ["negotiating",54,1,102,1],
+      ["negotiation",54,1,102,7,6,3],
+      ["negotiator",156,1],
+      ["neighbor",221,4],
+      ["neighborhood",63,1,7,6,116,2,28,1],
+      ["neighboring",221,3],
+      ["neighbour",54,1,10,1,32,1,3,1,19,1,47,1,14,1,4,1,42,1],
+      ["neighbourhood",84,2,34,1],
+      ["neighbouring",47,1,160,1,17,1],
+      ["neighbourliness",118,1],
+      ["neil",16,6,4,2,49,2,49,1],
+      ["neither",24,1,26,1,28,1,21,1,49,1,8,1,8,1,3,1,17,1,4,1,4,1,20,1],
+      ["nelson",187,1],
+      ["neoclassical",8,5],
+      ["neoclassicist",8,2],
+      ["neocortex",204,1],
+      ["neolithic",147,1],
+      ["neon",89,1],
+      ["neotropic",139,1],
+      ["neptune",169,1],
+      ["nero",87,1],
+      ["nerve",17,1,137,4,4,1,58,1],
+      ["nervesslower",216,1],
+      ["nervous",49,1,127,1,45,1],
+      ["nest",4,1,52,12,9,1,38,3,4,1,3,2,11,2,6,1,3,5,5,2,4,4,20,6,14,3],
+      ["nester",103,1],
+      ["nesting",56,1,47,2,27,2,63,1],
+      ["net",1,1,47,1,2,7,41,1,53,1,40,1,23,1],
+      ["netherland",71,2,24,1,4,1,35,1,87,1],
+      ["netted",170,1],
+      ["nettle",224,2],
+      ["network",5,1,13,1,12,1,2,1,6,1,14,1,5,1,12,1,12,4,7,1,14,1,11,1,22,6,15,1,1,1,26,3,22,1,22,4,2,1],
+      ["neural",2,3,55,3,14,1,7,1,3,1,2,1,17,1,58,1,16,1,7,1,4,1,4,1,8,1,1,1],
+      ["neurally",2,1],
+      ["neurobiology",71,1,133,1],
+      ["neurochemical",72,1,113,1],
+      ["neuroimaging",17,1],
+      ["neurological",18,1,65,1],
+      ["neurologist",3,2,80,1,10,1,83,1],
+      ["neuron",7,13,30,1,20,12,35,1,34,2,32,1],
+      ["neurophysiology",154,4],
+      ["neuropsychologist",37,1,139,1],
+      ["neuropsychology",204,1],
+      ["neuroscience",3,1,36,1,128,5,33,1,12,5],
+      ["neuroscientist",17,1,1,1,19,1,20,1,1,1,5,1,29,2,2,1,82,1,5,1,16,2],
+      ["neurotransmitter",189,1],
+      ["neutral",34,1,18,1,96,2,8,1,18,1],
+      ["neutralise",116,1,27,1],
+      ["neutrality",148,1],
+      ["nevada",196,1],
+      ["never",5,2,2,1,3,1,1,1,4,1,4,1,1,1,1,2,1,1,1,1,8,1,13,2,13,1,1,2,6,1,2,1,5,1,11,1,10,1,9,1,3,1,1,1,4,2,1,1,6,1,3,1,2,1,2,1,1,1,1,1,1,3,1,1,3,1,4,1,10,1,5,1,5,1,1,1,5,2,1,3,1,1,1,1,3,1,7,1,3,1,2,1,5,3,2,2,2,1,3,1,4,1,3,1,9,1,1,2,8,1,2,1,2,1,4,1],
+      ["nevertheless",40,1,1,1,20,1,5,1,12,1,27,1,16,1,4,1,2,1,6,1,6,2,1,1,6,1,4,1,4,1,46,1,5,1,4,1,9,1,3,1],
+      ["new",0,2,1,7,3,11,2,1,1,4,2,2,1,1,2,1,1,1,2,3,1,13,1,4,1,1,1,1,1,1,2,5,1,9,2,1,1,1,1,1,1,11,1,3,1,2,2,2,1,2,1,9,1,8,2,3,1,1,3,6,2,1,1,3,1,1,2,3,2,20,4,2,1,1,1,4,1,11,2,1,1,2,2,1,1,6,1,7,1,2,2,2,2,1,1,3,1,4,1,2,1,1,1,1,2,3,1,5,2,1,2,5,1,4,1,5,2,5,4,2,1,1,1,2,1,3,1,3,1,1,1,1,2,4,1,3,3,4,3,11,1,4,2,1,1,1,3,13,2,4,1,2,1,1,1,1,1,1,1,9,1,14,1,1,1,2,3,1,1,3,2,3,1,3,1,2,4,3,1,5,1,2,2,1,1,1,2,3,1,2,1,6,2,1,1,3,1,1,5,2,1,14,2,2,1,1,1,1,2,1,1,1,1,3,1,1,1,1,2,4,3,8,1,1,1,1,2,5,2,1,1,1,1,2,1,7,1,1,5,4,1,11,1,1,1,1,1,2,2,6,3,1,2,8,1,3,1,3,1,3,6,5,2,1,1,1,1,2,1,2,1,2,3,1,1,1,1,1,1,9,1,4,1,1,1,6,2,1,3,1,1,2,1,1,1,1,1,1,1,9],
+      ["newbold",190,4],
+      ["newbolt",211,2],
+      ["newborn",138,1,22,1,42,1],
+      ["newcomer",27,1,1,1,187,1],
+      ["newer",38,1],
+      ["newest",112,1],
+      ["newfound",9,1,217,1],
+      ["newly",19,1,4,1,8,2,53,1,33,1,40,1,6,1,7,1,17,1,1,1,21,1,1,1,7,1],
+      ["newspaper",4,1,5,2,7,5,172,2],
+      ["newton",93,1],
+      ["next",6,1,1,1,2,1,3,2,2,2,4,2,5,7,2,1,6,2,3,1,5,1,18,1,3,1,2,1,3,1,5,1,3,2,6,1,12,1,14,2,5,1,1,1,7,1,5,1,4,1,4,1,1,1,2,1,6,1,15,1,6,1,1,1,1,1,3,1,9,1,6,1,3,5,5,2,5,1,4,1,2,2,18,2,3,1,1,1],
+      ["nextstage",82,2],
+      ["ngo",122,1],
+      ["ngv",170,8],
+      ["ni",180,1],
+      ["nia",24,10],
+      ["nice",21,1,4,1,135,1],
+      ["nicely",25,1],
+      ["nicer",63,1],
+      ["niche",30,1,125,1],
+      ["nichola",59,1,26,1,10,1,3,1,21,1,20,1,72,1],
+      ["nicholson",150,9],
+      ["nick",144,1],
+      ["nico",68,1],
+      ["nicola",56,1,5,2,126,1,30,1],
+      ["nigel",56,1,94,1],
+      ["nigeria",39,1],
+      ["night",12,1,5,2,3,1,19,14,4,2,10,1,15,1,3,1,18,1,5,4,9,2,7,2,3,1,2,1,6,5,23,1,23,1,6,1,4,1,35,1],
+      ["nightclub",71,1,7,1],
+      ["nightlife",39,1],
+      ["nightly",52,1],
+      ["nightshade",22,1,77,1],
+      ["nigripe",223,1],
+      ["nil",68,1,104,1],
+      ["nila",149,1],
+      ["nile",123,1],
+      ["nilgai",10,1],
+      ["nina",176,1],
+      ["nine",44,1,6,1,30,1,34,1,16,1,3,1,15,1,26,2,2,2,40,1],
+      ["nineteenth",23,2,43,1,18,1,5,1,48,4,57,1,19,2],
+      ["nip",89,1],
+      ["nitrate",201,1],
+      ["nitrogen",27,1,21,1,11,4,43,1,62,2,35,1,2,1,20,3],
+      ["nm",226,3],
+      ["noam",183,1],
+      ["nobel",128,1,60,4],
+      ["nobility",77,1],
+      ["noble",77,1,31,1,52,1],
+      ["nobody",45,1,2,1,87,2,12,4,3,1,3,1,18,1,13,1,14,1,19,1,6,1],
+      ["nofzinger",17,1],
+      ["noise",94,1,71,2,54,1],
+      ["noisy",74,1,22,1,39,2],
+      ["nomad",124,2],
+      ["nomadic",147,1],
+      ["non",8,1,2,1,2,1,5,2,1,1,1,1,16,1,20,1,19,1,8,1,2,1,10,2,1,1,2,1,1,1,5,2,3,2,5,1,16,1,8,13,6,1,7,10,8,1,4,1,8,1,6,1,2,2,2,1,1,2,5,1,1,1,2,1,4,1,13,1,2,1,7,1,9,5],
+      ["nondescript",34,1],
+      ["none",33,1,10,1,19,1,11,1,2,1,14,1,2,1,11,1,43,2,12,1,11,1,4,1,1,1,3,1,3,1,8,1,3,1,9,1,4,2,17,1],
+      ["nonetheless",37,1,58,1,2,1,34,1,17,1],
+      ["nonhuman",98,1],
+      ["nonprofit",83,1],
+      ["nonscientist",178,1],
+      ["nonsense",171,1,19,2],
+      ["nonstandard",92,1],
+      ["nonstop",94,1],
+      ["nor",3,1,5,1,11,1,34,1,16,1,9,1,21,1,21,1,18,1,7,1,8,1,10,1,1,1,24,1,14,1,1,1,12,1],
+      ["norm",36,1,6,2,4,1,138,1],
+      ["normal",3,4,17,1,4,2,10,1,14,1,13,1,10,1,7,1,24,1,23,1,5,2,21,1,3,1,45,1,5,2,12,1],
+      ["normale",165,1],
+      ["normalised",86,1],
+      ["normality",204,1],
+      ["normally",3,1,22,1,7,1,2,1,3,1,17,1,1,1,3,1,27,1,5,1,3,1,14,1,2,1,17,1,4,2,20,1,21,1,53,1],
+      ["norman",63,4,34,1,3,1,5,2,89,1],
+      ["north",10,3,4,1,6,1,5,1,7,2,1,1,2,1,5,3,1,1,9,1,1,1,8,1,5,2,2,1,5,1,4,3,2,1,7,5,3,1,3,2,5,1,1,1,5,1,3,1,3,2,3,4,6,2,5,3,9,3,11,2,8,1,20,5,8,1,1,1,8,1,6,1,1,2,1,1,23,1,1,1,5,5],
+      ["northeastern",80,1],
+      ["northern",31,1,8,1,25,4,31,1,1,1,3,1,6,1,4,1,2,1,6,1,4,2,20,1,2,1,26,1,26,1,1,1,27,2],
+      ["northland",110,1],
+      ["northwest",61,1,77,2,5,1,6,1,53,2],
+      ["northwestern",176,1],
+      ["norway",47,1,87,4],
+      ["norwegian",122,1],
+      ["nose",3,9,55,1,7,1,6,7,7,4,15,1,13,1],
+      ["nosed",135,1],
+      ["nostalgia",41,1],
+      ["nostalgic",41,1,22,1],
+      ["nostril",3,1,95,1],
+      ["notable",30,1,1,1,60,6,71,1,46,1,16,1],
+      ["notably",145,1,58,1],
+      ["notation",172,1],
+      ["note",2,1,16,1,6,1,2,4,20,2,7,1,4,1,6,1,11,1,19,1,7,3,1,1,10,1,44,1,1,1,3,1,8,3,15,1,18,1,4,1,2,1,3,2,3,3,7,1],
+      ["notebook",26,1],
+      ["noted",3,1,2,1,4,1,14,1,3,2,17,1,16,1,16,1,17,1,7,2,32,1,21,1,15,1,20,1,19,1,6,1],
+      ["noteworthy",153,1,22,1],
+      ["nothing",15,1,4,1,5,1,9,1,29,1,1,1,4,1,5,1,5,1,4,1,2,1,2,4,2,2,8,2,14,1,3,1,4,1,18,1,12,5,3,1,19,1,7,1,4,1,13,1,8,1,8,1,5,1,2,1,2,1],
+      ["notice",31,2,6,1,67,1,10,1,50,1,40,1],
+      ["noticeable",92,2,8,4,77,1],
+      ["noticed",5,2,44,3,19,1,25,1,20,1,24,1,17,2,6,1,14,1,7,1,3,1,1,1,7,1],
+      ["noticing",89,1],
+      ["notification",175,1],
+      ["notified",214,1],
+      ["noting",179,1],
+      ["notion",9,1,5,1,10,1,17,1,2,4,31,1,19,2,1,1,4,1,2,1,7,1,15,1,28,1,2,1,15,2,31,1,2,2,5,1,6,1,1,2,11,1],
+      ["notoriety",34,1],
+      ["notoriously",63,1,81,1,1,1,58,1],
+      ["nottingham",63,1],
+      ["noun",54,1],
+      ["nourished",133,1],
+      ["novel",4,1,10,1,57,1,7,1,3,1,2,1,13,1,13,2,11,1,5,1,24,3,12,1,6,1,4,1,6,1,5,2,6,2,18,1,6,1],
+      ["novelist",4,2,145,1,22,2],
+      ["novelty",26,1,6,1,9,1,22,1,36,1,52,1],
+      ["november",115,1,1,1],
+      ["novice",57,2,106,2],
+      ["novoplansky",221,6],
+      ["now",1,1,4,1,1,1,1,1,2,2,2,1,1,1,1,2,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,4,2,1,3,2,1,1,1,2,1,2,1,1,1,6,1,3,1,4,1,1,2,1,2,5,5,2,1,1,1,1,1,1,1,1,2,1,4,1,1,1,2,1,7,1,1,2,1,1,2,4,1,1,1,1,2,1,2,1,2,1,3,1,1,1,1,2,2,2,4,1,2,5,2,2,1,3,3,2,1,3,3,1,1,1,2,1,1,2,1,1,3,1,2,5,1,1,8,1,2,1,1,1,3,1,1,1,2,1,1,2,2,2,3,4,1,1,1,1,1,2,2,1,3,1,2,2,1,2,2,1,1,1,2,1,1,1,1,1,2,1,1,1,1,1,2,1,3,1,4,1,1,2,4,1,2,3,3,1,4,1,3,4,1,2,1,1,1,4,3,1,2,1,3,2,1,2,1,1,1,4,2,1,3,1,2,2,1,1,1,1,1,1,1,1,1,2,9,4,1,2,1,1,1,1,1,1,2,2,3,4],
+      ["nowaday",47,2,2,1,30,1,29,2,7,1,7,1,4,1,91,1,2,1],
+      ["nowhere",14,1,11,1,148,1,25,1,24,1],
+      ["nrem",94,4,91,14],
+      ["nsw",205,1],
+      ["ntfp",179,4],
+      ["nubia",31,1],
+      ["nuclear",192,1],
+      ["nucleated",108,1],
+      ["nucleus",108,2],
+      ["number",2,2,2,1,2,1,3,5,1,3,3,1,2,2,1,5,4,3,8,2,2,1,5,1,1,5,1,1,3,2,2,3,1,1,1,1,2,1,2,3,7,2,5,2,4,1,2,1,1,3,6,3,2,1,1,1,6,2,1,1,1,1,5,1,1,1,1,6,3,1,1,1,1,1,1,2,5,5,1,4,3,1,4,1,3,1,1,1,7,2,3,1,1,1,2,1,1,2,5,1,2,3,2,1,1,3,3,3,2,2,1,7,1,1,2,1,1,3,3,1,2,1,4,1,2,1,3,1,4,1,1,1,2,2,2,1,5,1,2,1,2,1,1,1,2,4,1,1,3,1,1,1,5,1,6,5,2,1,1,3,1,1,3,1,4,1,2,1,4,2,1,1,1,1,2,8,1,1,1,1,1,2],
+      ["numeral",183,1],
+      ["numerical",148,1,8,1],
+      ["numerous",10,1,18,1,8,2,2,1,53,2,20,1,9,1,2,1,40,1,8,1,10,1,17,1],
+      ["nung",0,1,88,2],
+      ["nuremberg",218,1],
+      ["nurse",11,1,4,1,105,1,71,2],
+      ["nursery",84,1,4,1,69,1],
+      ["nurture",186,1],
+      ["nuth",142,1],
+      ["nutrient",24,1,9,1,57,1,18,1,27,1,8,1,58,1,23,1],
+      ["nutrition",16,1],
+      ["nutritional",48,1,28,2],
+      ["nutritionally",99,1],
+      ["nutritious",143,1,83,1],
+      ["ny",189,1],
+      ["nylon",19,2,100,1,21,1],
+      ["nystuen",180,2],
+      ["nz",187,1],
+      ["nzamh",16,2],
+      ["nzel",27,2],
+      ["oak",84,1],
+      ["oakwood",59,1],
+      ["oamaru",49,1],
+      ["oar",168,1],
+      ["oase",124,1,53,1],
+      ["oasis",177,2],
+      ["oat",96,1,128,1],
+      ["obelisk",31,1],
+      ["oberlin",120,2],
+      ["obesity",43,1,51,1],
+      ["obey",157,1],
+      ["object",1,1,22,7,4,1,5,1,15,1,10,1,1,2,4,1,9,2,6,1,1,2,14,8,1,1,5,2,8,1,5,1,5,1,18,1,8,4,4,1,10,1,11,1,2,1,7,1,1,1,10,1,24,1,1,1,2,1,8,6],
+      ["objected",118,1,39,1],
+      ["objection",151,1],
+      ["objective",8,3,26,3,29,1,10,4,73,1,76,1],
+      ["objectively",98,1,80,1],
+      ["obligation",54,1,93,1,41,1],
+      ["obligatory",85,1],
+      ["obliged",213,1],
+      ["oblique",64,1],
+      ["oblivious",209,1],
+      ["obscured",171,1],
+      ["obscurity",111,1,102,1],
+      ["observance",211,1],
+      ["observation",14,2,12,1,10,5,46,1,34,1,9,1,38,1,3,1,11,2,6,1,15,1,12,1,6,1],
+      ["observatory",177,1],
+      ["observe",3,2,21,1,104,1,3,1,17,1,6,1,21,1,5,1,20,1],
+      ["observed",3,1,11,2,4,1,4,1,35,2,2,1,2,1,28,1,24,1,13,1,1,1,1,1,26,1,1,1,13,1,12,1,3,1,7,1,7,1,1,1,2,1,11,1],
+      ["observer",3,1,54,2,3,1,107,1,1,1,16,1,28,1],
+      ["observing",5,1,7,1,24,1,32,1,92,1],
+      ["obsessed",9,1,95,1],
+      ["obsession",9,1,38,1,97,1,44,1,27,1],
+      ["obsessive",81,1,63,1],
+      ["obsolete",16,1],
+      ["obstacle",40,1,91,1,11,1,17,2,55,2],
+      ["obstruct",120,1],
+      ["obstruction",96,1],
+      ["obtain",13,1,108,1,2,1,17,1,16,1,18,1,4,1],
+      ["obtained",19,1,13,1,30,1,8,1,7,1,2,3,5,1,53,2,64,1,9,1],
+      ["obtaining",79,1,87,1,2,1,12,1],
+      ["obvious",14,2,2,1,5,1,19,1,13,1,20,1,3,1,3,1,10,1,1,1,6,1,2,1,1,1,14,1,2,1,7,1,16,1,7,1,1,4,15,1,6,2,18,1,11,1,6,1,1,1,9,2,1,2,2,1,6,1,2,1],
+      ["obviously",24,1,18,1,17,1],
+      ["occasion",4,1,81,1,28,1,23,1,82,1],
+      ["occasional",103,1],
+      ["occasionally",66,1,1,1,3,1,71,1,20,1,48,1,1,1,13,1],
+      ["occupant",21,3,6,1,64,1],
+      ["occupation",4,1,21,1,15,8,65,1,42,1,50,1,13,1],
+      ["occupational",50,1],
+      ["occupied",64,1,29,1,3,1,34,1,17,2,2,1,6,1],
+      ["occupy",143,1,38,1,1,1,43,1],
+      ["occur",3,1,2,1,6,1,3,1,4,3,29,1,9,1,4,4,16,1,3,1,3,1,8,1,5,1,11,1,1,1,14,1,1,1,2,4,8,1,24,1,5,1,20,1,3,1,1,3,2,1,9,1,8,2,3,2,7,1,7,1,2,1,1,1],
+      ["occurred",25,3,18,4,8,1,45,1,3,1,10,1,29,1,46,3,3,1,9,1,2,1,4,1,6,1,2,1],
+      ["occurrence",18,4,108,1],
+      ["occurring",38,1,137,1,2,1,8,1,29,1],
+      ["ocean",5,4,9,5,1,1,10,7,20,1,3,11,2,1,2,2,14,1,2,2,11,4,10,1,2,1,17,1,13,1,2,1,2,2,5,1,11,1,8,1,10,1,9,6,9,1,3,18,16,1],
+      ["oceanographer",91,1,89,1],
+      ["ochre",38,4,9,4],
+      ["octave",167,1,45,1],
+      ["october",4,1,71,1,28,1,16,1,73,1],
+      ["odd",1,3,23,1,110,1,27,1,11,1,15,1,3,1,19,1,14,1],
+      ["odder",165,1],
+      ["oddity",183,1],
+      ["oddly",1,1,66,1,5,1],
+      ["odontocete",125,1],
+      ["odor",65,1,27,1],
+      ["odour",71,2,7,2,77,2],
+      ["odourless",125,1],
+      ["odyssey",116,1],
+      ["oecd",163,2],
+      ["off",5,1,4,1,1,1,7,1,2,1,1,7,2,1,11,4,2,4,8,1,4,6,1,2,3,1,4,1,1,1,3,1,1,1,5,1,1,4,2,2,2,1,2,1,3,1,4,1,2,1,8,4,1,1,1,2,5,1,1,1,11,1,2,3,1,1,2,2,6,1,2,2,2,1,3,1,4,2,9,3,3,1,2,2,5,1,2,3,2,1,1,1,7,1,2,1,2,2,5,2,4,1,5,2,1,1,1,1,15,1,4,1,4,1,3,2,2,2,4,2,1,2,6,1],
+      ["offence",217,1],
+      ["offended",157,1],
+      ["offer",14,1,10,1,1,1,8,1,26,1,4,1,9,1,3,1,1,1,4,1,2,1,5,1,8,1,20,1,27,1,10,1,3,1,1,1,14,1,18,1,3,2,10,1,21,1,2,1,2,1],
+      ["offered",19,1,2,2,8,1,4,1,13,1,9,1,8,1,61,1,4,3,9,1,21,1,61,1],
+      ["offering",16,4,7,1,59,1,80,1,29,2],
+      ["office",5,4,10,1,13,1,35,1,17,3,40,1,6,3,7,1,13,1,4,1,20,1,2,4,3,1,6,1,36,1],
+      ["officer",33,1,34,1,24,1,18,2,26,1,82,1,2,1],
+      ["official",31,2,35,1,4,4,37,1,2,1,22,2,16,2,66,1,6,2,1,4,3,1],
+      ["officially",77,1,22,1,38,1,86,1],
+      ["offset",52,1,70,1],
+      ["offshore",110,1,77,3,18,1],
+      ["offspring",14,2,88,1,19,1,78,1],
+      ["often",1,1,1,1,1,1,1,1,5,3,1,2,1,2,6,3,1,6,1,1,1,1,1,2,1,1,3,2,4,4,3,1,2,1,1,1,4,2,2,1,1,1,1,4,3,2,1,1,2,1,2,2,7,1,1,1,1,1,1,3,1,1,1,2,4,3,3,3,1,3,1,3,2,2,2,2,2,1,3,1,4,1,1,4,3,1,1,1,3,2,1,3,1,1,1,1,2,2,1,1,1,2,3,1,1,1,4,3,1,2,1,2,4,2,6,1,1,1,1,1,2,3,1,1,2,3,3,1,1,1,4,1,1,1,1,6,1,1,1,1,1,2,1,1,3,1,2,2,1,5,1,1,2,1,1,1,1,1,3,1,1,1,1,1,1,1,2,1,2,1,1,1,3,2,1,1,3,1,1,3,8,3,3,2,1,2,3,1,4,1,1,1,1,1,3,3,2,1,3,1,1,2,1,1,2,1,1,1,1,6,1,3,2,1,2,1,1,1,2,3,1,3,1,1,4,1],
+      ["oh",72,1,76,1],
+      ["ohio",22,1,75,1,23,1],
+      ["ohno",73,1],
+      ["oil",24,1,15,1,12,19,28,1,28,1,1,2,57,1,14,1,16,1,18,10,13,1],
+      ["ointment",51,1],
+      ["ois",23,1],
+      ["oklahoma",184,1],
+      ["old",1,1,2,1,2,1,5,1,5,1,1,2,1,1,7,1,1,4,2,2,4,1,1,1,2,8,1,1,3,1,8,2,1,2,2,2,1,2,4,2,2,2,2,1,3,2,2,4,1,1,3,1,15,4,2,1,5,1,8,1,3,1,7,2,2,1,1,2,5,4,3,3,2,1,3,1,3,1,2,1,3,2,2,1,3,1,2,1,5,2,2,1,6,6,6,2,3,3,6,1,2,1,4,1,2,5,2,1,13,2,3,2,3,1,3,1,4,1,1,1,7,5,3,2,2,1,2,1,2,1,6,1],
+      ["older",4,1,14,1,6,1,4,1,1,1,1,1,10,2,7,1,3,1,3,1,8,1,5,1,49,1,16,2,5,1,14,1,3,1,1,1,30,1,3,1,5,2,2,1,20,1,2,2,9,3],
+      ["oldest",27,1,1,1,18,1,1,1,3,2,95,1,29,1,17,1,12,1],
+      ["oleaceae",51,1],
+      ["olfaction",71,2],
+      ["olfactory",71,4,7,1],
+      ["olive",51,27,6,1],
+      ["oliver",83,1],
+      ["olsen",25,8],
+      ["olympic",9,1,48,5,14,1,117,1],
+      ["omit",207,1],
+      ["omnivorous",135,1],
+      ["onboard",91,2],
+      ["once",1,2,2,2,3,1,1,2,4,1,3,1,5,1,1,1,2,1,5,2,4,1,2,1,2,2,4,1,2,1,2,1,4,1,1,4,2,1,1,1,4,1,1,2,4,1,6,1,2,3,1,1,1,1,1,1,2,1,2,2,2,2,1,1,1,1,5,3,6,1,1,6,3,1,1,1,1,1,7,2,1,1,4,2,2,1,4,1,2,1,2,1,1,1,2,1,4,3,4,1,2,2,7,2,2,1,2,1,1,3,1,1,12,1,1,1,1,1,11,2,4,1,2,1,2,1,4,2,1,1,3,1,1,1,1,2,4,2,4,1,2,2,4,1,1,2,5,1,1,1,1,1,5,2,1,1,4,1,1,1,2,5,1,1,1,1],
+      ["one",0,2,1,2,1,1,1,3,1,1,1,2,1,4,1,2,1,1,2,1,1,2,1,5,1,6,1,9,2,5,1,4,1,2,1,1,2,3,1,5,1,3,1,1,1,5,2,4,2,3,1,1,1,7,1,1,1,4,1,3,1,5,1,3,1,8,1,1,1,2,1,1,1,3,1,5,1,1,1,2,1,5,1,1,1,3,1,3,2,1,1,1,1,1,1,4,1,9,1,1,1,4,1,4,1,6,1,3,1,6,1,4,1,2,1,4,1,5,1,2,2,1,1,7,1,4,1,1,1,4,1,4,1,1,1,1,1,3,1,1,1,2,1,8,1,1,1,3,1,4,1,2,1,1,1,2,1,2,1,2,1,3,1,2,1,2,1,1,1,9,1,4,1,1,1,3,1,1,1,3,1,1,3,5,1,5,1,3,1,2,1,7,1,3,1,3,1,1,1,5,1,2,1,2,1,1,1,3,1,2,1,2,1,2,1,1,1,1,1,6,1,4,1,6,1,3,1,1,1,6,1,2,1,4,1,9,1,3,1,5,1,4,1,7,1,8,1,3,1,1,1,1,1,2,1,1,1,2,1,7,1,3,1,2,1,5,1,5,1,3,1,6,1,3,1,3,1,6,1,4,1,1,1,2,1,1,1,6,1,2,1,2,1,1,1,3,2,4,1,4,1,2,1,4,1,5,1,6,1,10,1,4,1,5,1,1,1,2,1,4,1,3,1,5,1,3,1,1,1,1,1,8,1,2,2,3,1,2,1,1,1,9,1,4,1,3,1,6,1,2,1,3,1,2,1,3,1,4,1,3,2,1,1,2,1,1,1,3,2,4,1,2,1,3,1,6,1,1,1,7,1,3,1,5,1,2,1,3,1,15,1,5,1,3,1,3,1,3,1,1,1,3,1,2,1,2,1,2,1,1,1,1,1,1,1,1,1,8,1,1,1,4,1,4,1,7,1,3],
+      ["ongoing",70,1,10,1,63,1,26,1],
+      ["online",30,2,7,1,33,7,30,1,56,1,33,2],
+      ["only",0,1,2,2,1,1,1,2,2,2,3,1,2,1,1,2,1,5,1,3,1,2,5,3,1,2,1,5,1,1,1,1,1,2,1,1,1,1,2,2,1,1,1,3,1,1,2,1,1,1,2,2,1,1,3,2,1,1,1,3,5,1,1,1,1,1,2,3,1,2,2,2,1,3,1,3,1,3,1,1,1,4,2,1,1,1,3,1,2,3,1,2,1,1,1,2,1,1,1,3,1,2,1,1,1,2,2,3,2,2,1,2,1,2,1,1,1,1,1,2,1,1,1,2,2,6,1,2,1,6,2,2,1,1,1,1,1,2,3,3,1,1,2,3,1,3,1,2,1,1,1,5,1,1,1,4,2,5,3,7,1,1,1,1,1,2,1,4,1,1,1,3,1,2,1,1,1,3,1,1,2,1,1,3,1,4,3,4,1,3,1,2,1,2,1,2,1,3,2,1,1,1,3,1,1,1,1,2,1,5,2,1,2,4,1,1,2,2,1,1,1,1,1,2,1,2,2,1,1,1,1,1,1,4,1,2,1,1,1,2,1,1,1,3,1,1,1,2,2,1,4,1,1,2,1,2,1,1,1,2,2,3,1,2,1,1,2,5,1,1,1,3,1,1,1,3,1,3,3,1,2,2,2,1,2,2,1,2,1,3,1,3,2,1,2,2,3,1,1,1,1,2,1,4,1,1,1,2,1,1,1,1,1,4,2,1,3,5,3,3,1,1,1,2,1,2],
+      ["onset",2,1,1,1,21,1,97,1],
+      ["onslow",49,1],
+      ["onstage",12,1],
+      ["ontario",120,1],
+      ["onto",23,1,12,1,22,1,10,1,46,1,7,1,4,1,4,3,4,1,6,1,11,1,16,1,2,1,25,2,4,1,6,1,10,1,12,1],
+      ["onward",15,1,190,1,6,1],
+      ["oosten",156,1],
+      ["opabinia",45,1],
+      ["opaque",30,2],
+      ["open",3,3,7,1,11,6,17,1,1,1,20,2,1,1,1,1,2,1,7,1,2,1,4,1,3,1,2,2,4,1,4,1,1,1,5,1,8,1,20,1,1,1,3,1,4,1,7,1,5,1,8,1,19,1,2,1,16,2,7,1,7,1,11,1,2,1,5,2,1,1,2,2],
+      ["opened",3,1,25,1,6,2,27,2,5,1,7,1,1,1,3,1,3,1,4,1,48,1,38,2,11,1],
+      ["opener",61,2],
+      ["opening",21,1,11,1,2,1,10,3,28,1,4,3,12,1,18,1,4,1,5,1,1,1,33,1,39,1,38,1],
+      ["openly",72,1],
+      ["openness",34,1,84,4],
+      ["openstreetmap",70,1],
+      ["opera",44,15,175,1],
+      ["operate",13,1,42,2,67,2,25,1,9,1,3,1,3,1],
+      ["operated",147,1],
+      ["operating",55,1,7,1,55,1,5,1,11,2],
+      ["operation",13,3,19,1,4,1,52,1,5,3,20,1,19,1,42,1],
+      ["operative",87,1,33,1,22,1,59,1,24,1],
+      ["operator",13,1,188,1,13,1],
+      ["opiate",72,1],
+      ["opinion",42,1,18,1,22,1,29,1,5,1,11,1,17,1,7,1,21,1,14,1,27,2,6,1],
+      ["opol",54,8],
+      ["opponent",118,1,38,4,22,3,15,1],
+      ["opportune",172,1],
+      ["opportunist",25,1],
+      ["opportunity",6,1,3,1,5,1,2,1,11,1,9,1,17,1,2,1,19,1,1,1,9,1,1,1,32,1,5,3,2,1,35,1,18,1,8,2,3,1,17,1,21,1],
+      ["oppose",178,1],
+      ["opposed",72,1,42,1,80,1],
+      ["opposing",16,1,171,1],
+      ["opposite",26,1,10,2,49,2,19,1,9,1,29,1,10,2,3,1],
+      ["opposition",41,1,137,2,16,1],
+      ["opted",42,2,60,1,97,1],
+      ["optic",111,2],
+      ["optimal",63,1,43,1,46,1,49,1],
+      ["optimise",118,1],
+      ["optimism",37,1,107,1],
+      ["optimist",164,1,45,1],
+      ["optimistic",70,1,86,1,53,1],
+      ["optimized",5,1],
+      ["optimum",173,1,22,1],
+      ["opting",221,1],
+      ["option",3,1,18,1,12,1,37,2,6,2,49,1,7,1,2,2,18,1,4,1,6,1,8,1,30,1],
+      ["optional",185,1],
+      ["oral",3,1,69,1,85,4,34,5],
+      ["orange",71,1,7,1],
+      ["orangutan",98,1,17,1],
+      ["orator",219,1],
+      ["orb",64,1,55,2,16,2],
+      ["orbit",13,1,103,3,26,4,35,1],
+      ["orbiter",177,2],
+      ["orbiting",13,3,103,1,85,1],
+      ["orchard",65,1],
+      ["orchestra",44,1],
+      ["order",7,2,1,2,4,1,1,3,3,1,1,1,5,1,6,1,2,1,1,3,4,1,1,2,5,1,1,1,2,1,2,1,5,1,5,3,1,2,2,1,6,1,8,2,9,1,2,2,6,1,1,1,1,1,3,1,4,1,2,2,26,1,2,1,8,2,3,1,2,2,4,2,11,1,1,1,2,1,1,1,3,2,1,1,1,1,1,1,1,1,14,1,1,2,1,1,1,1,1,1,2,1,1,1,4,1,7,4,7,1,4,2,1,1,1,3,5,1,2,1,5,1],
+      ["ordered",31,1,9,1,158,1],
+      ["orderly",178,1],
+      ["ordinarily",107,1,82,1,11,1],
+      ["ordinary",9,1,8,1,5,1,4,1,15,4,17,1,1,1,2,1,7,2,2,1,7,1,8,1,31,1,24,1,1,1,4,2,18,1,9,1,23,2,2,1,3,1,3,2],
+      ["ordinator",33,1],
+      ["ordnance",64,1,153,1],
+      ["ore",1,1],
+      ["organ",30,1,35,1,6,1,7,2,16,1,16,1,49,1,26,2,22,1],
+      ["organic",22,1,40,6,3,1,43,1,14,1,74,1,25,1],
+      ["organisation",6,6,2,17,7,1,1,1,4,2,17,1,32,1,4,1,31,1,1,1,17,1,11,1,7,1,1,1,1,1,5,1,3,1,6,2,7,1,3,5,4,1,21,2,5,1],
+      ["organisational",8,14,142,3,2,1],
+      ["organise",142,1,5,1,20,1,45,1],
+      ["organised",12,1,35,2,34,1,1,1,6,1,7,1,89,1,13,1,16,1],
+      ["organiser",142,1,42,2],
+      ["organising",118,1],
+      ["organism",5,2,19,1,21,1,7,3,10,1,27,1,12,1,26,1,10,1,2,4,2,2,14,1,10,1,8,2,4,3,36,1],
+      ["organization",32,6,23,3,28,1,50,1,76,2],
+      ["organizational",148,1],
+      ["organize",83,1],
+      ["organized",75,2,9,1,47,3],
+      ["ori",103,2,15,1,33,5],
+      ["orient",108,1,49,1,2,2],
+      ["oriental",0,1],
+      ["orientale",123,1],
+      ["orientate",130,3],
+      ["orientated",57,1],
+      ["orientation",45,1,85,7],
+      ["oriented",16,1,36,1,40,1,114,1],
+      ["origin",22,1,1,1,11,1,6,1,1,1,5,1,1,1,12,2,29,1,19,4,2,1,16,6,30,1,2,1,1,1,14,1,5,1,5,1,10,1,16,15,5,1,6,5,3,3,3,1],
+      ["original",0,1,4,1,12,1,2,1,4,1,6,1,1,1,1,1,1,2,3,1,10,2,6,1,6,2,11,1,19,3,3,1,8,1,32,1,3,1,1,1,4,1,11,1,9,2,12,2,1,1,12,2,19,1,6,1,16,1],
+      ["originality",120,1,16,1,31,1,45,1],
+      ["originally",13,1,3,4,15,1,10,1,4,1,19,1,1,1,21,1,22,1,3,1,14,1,7,1,5,1,7,3,6,1,48,1,19,2],
+      ["originate",2,1,139,1,14,3],
+      ["originated",38,1,29,1,32,1,38,1,3,4,17,1,1,1,34,2],
+      ["originating",195,1],
+      ["orlean",141,1],
+      ["orlon",19,1],
+      ["orme",211,1],
+      ["ornament",125,1],
+      ["ornamental",65,1],
+      ["ornithologist",127,2,8,1],
+      ["orr",120,2],
+      ["orson",177,1],
+      ["orthodox",72,1],
+      ["orville",46,1],
+      ["oryx",10,1],
+      ["osaka",100,1],
+      ["oscar",4,1,26,3,141,1],
+      ["oscillating",52,1],
+      ["ospedaletti",4,1],
+      ["ostia",87,1],
+      ["ostler",95,1],
+      ["otago",28,1],
+      ["other",0,2,1,4,1,6,1,4,1,6,1,2,2,1,1,3,1,1,1,5,1,2,1,6,1,3,1,8,1,3,1,2,2,5,1,4,1,7,1,4,1,2,1,9,1,1,1,5,1,2,2,2,1,2,2,2,2,1,1,3,1,1,1,2,1,4,1,2,2,5,1,1,1,4,1,2,1,2,1,2,1,1,1,11,1,6,1,5,2,2,1,3,1,1,1,4,1,7,1,9,1,1,1,6,1,7,1,8,1,2,1,3,1,3,2,5,1,2,1,2,1,5,2,2,1,7,2,5,1,3,1,3,1,1,1,1,1,7,1,2,1,4,1,1,1,1,1,1,2,14,1,3,1,1,1,3,1,9,1,2,1,4,1,5,1,2,1,5,1,5,1,1,1,2,1,9,2,5,1,3,1,5,1,4,1,3,2,11,1,2,1,2,2,7,1,3,1,2,2,2,1,1,1,2,1,2,1,2,1,1,1,3,1,3,1,6,1,2,1,4,1,2,1,1,1,8,1,7,1,1,1,1,1,1,1,1,2,2,2,1,1,1,1,1,1,4,1,6,1,4,1,1,1,13,1,4,1,6,1,5,1,6,1,2,2,4,2,2,1,3,1,5,1,4,1,4,1,1,1,4,1,3,2,3,1,2,1,1,1,2,1,3,1,1,1,1,1,2,2,3,1,3,1,5,2,1,1,6,1,1,1,3,1,1,1,2,1,1,1,4,1,4,1,5,1,18,1,4,1,3,1,1,1,2,1,3,1,6,1,3,3,2,1,1,1,2,1,3,1,2,1,5,1,2,1,2,1,1,1,4,1,1,2,4,1,8,1,3,1,1,1,1,1,2,1,1,1,2,1,2,1,2,1,7,1,3,1,1,1,1,1,3,1,13,1,12,1,1,1,7,1,6,1,2],
+      ["otherwise",3,1,15,1,4,1,19,1,19,1,3,1,5,1,2,1,2,1,23,2,6,1,1,1,13,1,10,1,27,2,4,1,2,1,20,1,21,1,16,1],
+      ["ought",6,1,20,1,152,1,44,1],
+      ["ounce",27,1,92,1],
+      ["our",115,2,6,1,9,1,37,1,45,1],
+      ["ourselve",5,2,36,3,18,1,28,1,11,1,22,1,6,1,46,1,15,1],
+      ["out",1,2,1,3,3,3,1,2,1,1,1,1,1,1,2,1,1,1,2,2,2,1,1,1,1,1,1,1,1,4,1,2,1,2,1,2,1,3,1,1,2,1,1,1,1,2,2,1,1,1,1,2,2,2,1,1,1,1,1,1,1,2,3,2,1,1,2,4,1,2,1,1,2,2,1,2,1,2,3,1,1,3,1,2,1,1,1,5,1,6,1,1,2,1,1,1,2,1,1,1,1,1,1,5,1,2,1,7,1,1,1,1,1,1,2,4,3,3,2,1,1,5,1,2,1,1,2,1,2,1,2,2,2,4,1,2,1,3,3,1,1,2,1,3,2,4,1,2,1,7,1,3,1,5,1,1,1,4,1,2,2,1,4,1,1,3,2,1,2,1,1,1,2,1,1,1,1,2,3,1,1,1,1,6,1,1,1,2,1,2,2,1,1,5,1,1,3,3,2,1,2,2,2,6,1,1,1,1,1,1,1,2,1,1,1,2,1,3,1,2,1,5,1,1,1,1,1,3,1,1,2,1,1,1,1,3,3,1,1,3,1,2,2,1,3,1,1,2,1,2,1,1,1,7,1,5,1,1,2,2,1,1,1,2,1,3,1,2,2,1,3,5,1,1,1,5,2,2,3,2,2,1,1,1,1,7,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,2,1,1,2,1,4,4,1,1,1,1,1,4,1,2,1,5,1,2,1,2,3,1,1,1],
+      ["outback",191,3],
+      ["outbreak",48,2,21,2,6,1,21,1,40,1],
+      ["outcome",34,1,3,1,12,3,16,1,5,1,2,1,13,2,4,1,42,3,20,1,1,1,2,1,2,1,3,1,13,1,6,1,6,1,3,1,22,1],
+      ["outcompete",59,1],
+      ["outcrop",45,1],
+      ["outcry",153,1],
+      ["outdated",74,1,48,1],
+      ["outdoor",44,1,97,1],
+      ["outer",10,1,84,1,86,1],
+      ["outgoing",85,1],
+      ["outlasted",169,1],
+      ["outlet",97,2,43,2],
+      ["outline",95,1,3,2],
+      ["outlined",42,1,56,1],
+      ["outlining",56,1],
+      ["outlive",116,1],
+      ["outlook",109,1],
+      ["outlying",50,1],
+      ["outperform",56,1,72,1],
+      ["outperforming",49,1,104,1],
+      ["outpost",13,1],
+      ["output",6,1,9,1,119,1,6,1,31,1,23,1,26,1],
+      ["outside",0,1,14,2,17,1,4,1,9,1,10,1,3,1,1,1,1,1,1,1,2,1,1,1,4,1,10,1,10,1,1,2,10,1,7,1,2,1,16,2,1,1,1,1,1,2,4,1,11,2,10,2,22,4,1,1,15,1,6,3,9,1,2,1,3,1,7,1,2,1,1,1],
+      ["outsider",162,1],
+      ["outskirt",112,1],
+      ["outsmart",156,1],
+      ["outsold",188,1],
+      ["outsource",173,1],
+      ["outstanding",30,1,14,2,33,1,69,1],
+      ["outstretched",215,1],
+      ["outward",172,1],
+      ["outwardly",95,1],
+      ["outweigh",178,1],
+      ["outwit",157,1],
+      ["oval",98,1,37,1],
+      ["oven",62,1,37,1,111,1],
+      ["over",0,3,1,1,1,1,1,1,3,1,2,1,1,1,1,1,1,1,1,1,2,1,1,1,3,1,1,3,1,4,1,1,1,1,1,9,3,3,1,1,1,2,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,2,4,1,1,3,1,4,1,2,2,1,1,4,1,1,1,3,1,1,1,2,6,2,1,1,1,2,2,1,1,1,3,1,1,2,1,2,1,2,4,1,1,1,1,1,1,2,2,1,5,3,2,1,4,1,1,1,4,1,1,3,1,1,5,1,3,3,5,1,2,1,2,1,1,2,2,1,1,4,2,1,1,3,1,4,1,3,2,2,3,4,1,1,1,4,1,1,2,2,1,3,1,4,1,2,2,4,1,1,3,2,1,2,2,3,2,2,4,1,2,4,1,5,2,2,1,1,1,1,1,3,1,1,1,2,1,5,2,1,1,3,1,1,1,2,3,2,1,1,3,1,1,2,2,2,2,2,1,5,2,2,1,1,1,2,1,2,3,3,2,1,1,1,1,1,1,2,1,1,1,2,3,5,1,1,3,4,1,3,2,3,2,8,2,1,1,3,2,2,2,1,2,3,1,3,1,1,1,1,1,1,1,1,1,5,1,1,1,1,1,2],
+      ["overall",36,1,7,1,6,1,11,1,23,1,2,2,25,1,12,1,4,1,9,1,35,1,2,2,3,5,23,1,21,1],
+      ["overawed",171,1],
+      ["overbearing",151,1],
+      ["overcast",120,1],
+      ["overcome",12,1,40,1,10,2,14,1,23,1,28,2,70,1],
+      ["overcoming",1,1,52,1,46,1],
+      ["overcrowding",41,1],
+      ["overeating",24,1],
+      ["overemphasise",8,1],
+      ["overestimated",170,1],
+      ["overfishing",48,4,60,1],
+      ["overflow",135,1],
+      ["overfly",121,1],
+      ["overgrazing",90,1],
+      ["overheard",85,1,12,1],
+      ["overhearing",184,1],
+      ["overkill",75,2,126,1],
+      ["overlaid",169,1],
+      ["overland",123,2,26,1],
+      ["overlap",64,1,146,2],
+      ["overlapping",64,1,124,1],
+      ["overload",63,1,51,1],
+      ["overloaded",35,1],
+      ["overloading",59,1],
+      ["overlook",8,1,76,1,132,1],
+      ["overlooked",25,1,151,1,2,1],
+      ["overlooking",217,1],
+      ["overly",1,1,126,1,4,1,43,1],
+      ["overman",71,1],
+      ["overnight",88,1,132,1],
+      ["overpopulation",138,1,64,1],
+      ["overpowering",96,1],
+      ["overproduce",94,1],
+      ["overran",25,1],
+      ["overreact",204,1],
+      ["override",94,1],
+      ["overriding",101,1],
+      ["overrun",44,1,108,1,5,1],
+      ["oversea",28,1,52,1,37,2,19,1],
+      ["overshadowed",194,1],
+      ["oversimplify",8,1],
+      ["overspending",118,1],
+      ["overstate",91,1],
+      ["overstated",171,1],
+      ["overtaken",61,1,133,1],
+      ["overthrown",211,1],
+      ["overtone",162,1],
+      ["overview",46,1],
+      ["overweight",24,1,19,1],
+      ["overwhelmed",11,1,160,1,3,1,22,1],
+      ["overwhelming",26,1,122,1,40,1,5,1],
+      ["overwhelmingly",98,1],
+      ["owe",160,1],
+      ["owing",7,1,155,1],
+      ["owl",103,10],
+      ["own",12,1,2,6,2,1,1,1,3,2,17,1,1,2,3,2,1,4,4,1,3,1,3,1,2,3,1,1,2,1,1,1,6,3,2,1,5,1,1,2,2,1,2,1,1,1,3,1,1,1,1,1,3,1,1,1,1,1,1,2,7,2,2,1,7,1,1,3,3,1,2,1,6,1,5,2,1,1,5,2,5,1,4,2,2,1,2,1,2,1,4,3,3,1,3,1,4,1,1,1,3,4,1,1,3,1,1,2,2,2,1,1,3,3,1,2,5,1,5,1,2,2,1,2,10,1,1,1,6,1,3,3,1,1,5,3,1,2,1,1,1,1,1,1,1,2,3,1,2,1,1,1,2,1,1,3],
+      ["owned",90,2,28,2,22,1,7,1,21,1,50,1],
+      ["owner",66,1,16,1,7,1,24,1,4,1,26,2,26,3,45,2,9,1],
+      ["ownership",12,1,35,3,15,1],
+      ["owning",47,2],
+      ["oxcart",152,1],
+      ["oxen",10,1],
+      ["oxford",4,1,24,1,7,1,4,1,25,1,36,5,23,1,42,1,4,1,57,1],
+      ["oxide",38,1],
+      ["oxo",82,2],
+      ["oxygen",5,1,8,1,35,4,4,1,39,1,15,2,36,1,22,6,52,1,4,1],
+      ["oxygenated",91,6],
+      ["oyster",108,7],
+      ["oz",119,1],
+      ["p2",199,3],
+      ["p3",212,3],
+      ["pa",156,3],
+      ["pace",134,4,15,1],
+      ["paced",114,1,75,1],
+      ["pachyderm",154,1],
+      ["pacific",49,2,1,2,40,1,20,1,8,2,7,1,5,3,19,1,19,13,2,1,1,1,9,1,7,1,5,2],
+      ["pacifica",143,8],
+      ["pacified",87,1],
+      ["pack",53,2,44,2,9,2,32,1,6,1,5,2,53,1],
+      ["package",53,1,169,1,4,1],
+      ["packaged",70,1,96,1],
+      ["packaging",19,1,15,1,19,12],
+      ["packed",118,1,11,1,4,1,7,1,5,1,58,1],
+      ["packrat",158,1],
+      ["pad",154,1],
+      ["padding",107,1],
+      ["paddle",168,2],
+      ["page",15,2,99,1,36,1,32,1,8,3,18,1],
+      ["pago",127,1],
+      ["paid",4,2,16,1,16,1,41,1,36,2,34,1,9,1,3,1,47,1],
+      ["pain",16,1,56,8,1,1,10,4,15,1,63,1,22,1],
+      ["painful",135,1],
+      ["painkiller",72,1],
+      ["paint",38,1,157,1,19,2,1,1,11,1],
+      ["painted",27,2,2,1,117,1,49,1,20,1,3,2],
+      ["painter",17,1,10,1,109,1,79,4],
+      ["painting",23,1,4,1,2,1,2,1,7,1,7,1,1,1,1,2,4,1,26,1,8,1,51,6,10,2,5,1,16,1,16,1,22,3,7,1,3,6],
+      ["pair",4,1,8,5,8,1,26,1,38,1,17,1,2,1,11,1,5,1,8,1,98,1],
+      ["pairing",12,2,77,1],
+      ["pajama",189,2],
+      ["pakeha",1,1],
+      ["palace",77,1,92,33,42,1],
+      ["palaeoanthropologist",115,1],
+      ["palaeolithic",147,1],
+      ["palaeontologist",111,1],
+      ["palatable",224,1],
+      ["pale",93,1,18,1,77,1,30,1],
+      ["paleobiologist",27,1],
+      ["paleontologist",45,5],
+      ["paleontology",75,1,121,1],
+      ["palette",200,1],
+      ["palm",67,1,128,1,24,1],
+      ["palmer",165,1],
+      ["palsy",83,1],
+      ["pamphlet",99,1],
+      ["pan",19,1,60,2,64,1,16,1],
+      ["panchtar",46,1],
+      ["pandanus",127,1],
+      ["panel",44,1,15,1,58,1,41,1,30,1,7,2],
+      ["panelling",44,1],
+      ["panic",77,1,100,1],
+      ["panicked",96,1],
+      ["panksepp",92,1],
+      ["panoramic",159,2],
+      ["pantheon",129,1],
+      ["panther",144,1],
+      ["papa",1,1],
+      ["papaya",65,1],
+      ["paper",29,1,1,1,4,1,5,1,5,1,5,1,18,3,9,1,1,1,15,2,7,1,3,1,2,2,3,26,4,3,5,2,1,2,8,1,3,2,12,1,12,1,15,1,5,1,7,1,11,1,9,1,13,1,5,2,8,1],
+      ["papermaker",107,2],
+      ["papermaking",107,6],
+      ["papert",160,1],
+      ["paperwork",66,1],
+      ["papier",29,2],
+      ["papua",175,1],
+      ["papyrus",67,1,40,5],
+      ["par",83,1,96,1],
+      ["para",23,2],
+      ["parachute",19,1],
+      ["paradise",25,1],
+      ["paradox",188,1,2,1,20,1],
+      ["paradoxical",72,1],
+      ["paradoxically",96,1],
+      ["paragomina",179,2],
+      ["paragraph",0,8,9,7,4,6,2,6,41,6,17,7,11,6,1,6,10,8,6,7,15,7,2,7,1,6,2,7,6,7,1,7,7,6,26,6,4,7,8,7],
+      ["parallel",47,1,39,2,23,1,55,1,5,1,49,1],
+      ["paralysed",3,3],
+      ["paralysis",98,1],
+      ["paralyzed",83,1,137,1],
+      ["paramount",55,1],
+      ["paranoid",209,1],
+      ["paraphrasing",86,1],
+      ["parasite",65,1,24,1,50,6],
+      ["parasitic",139,1,54,1],
+      ["parched",90,1],
+      ["parchment",67,1,40,5],
+      ["pared",162,1],
+      ["parent",34,2,5,1,3,1,7,1,4,1,1,11,4,1,16,3,9,1,6,1,15,1,1,3,16,2,10,1,22,2,4,4,17,1,2,1,6,1,2,2,2,4,3,2,8,1,9,1,1,1,4,2,14,8],
+      ["parental",110,1,11,1,90,1,14,3],
+      ["parenting",131,1,94,1],
+      ["pari",4,3,19,1,16,1,60,1,13,4,24,2,24,1,13,2,20,1,4,1,11,3,11,1],
+      ["parisian",112,1],
+      ["park",26,2,8,1,1,1,28,1,21,8,6,1,13,1,15,18,13,1,1,5,3,3,8,2,1,1,7,6,10,1,23,1],
+      ["parking",35,2,49,1],
+      ["parkinson",7,1],
+      ["parkland",151,3],
+      ["parliament",15,3,1,2,201,1],
+      ["parodi",71,1],
+      ["parro",177,2],
+      ["parsed",167,1,45,1],
+      ["part",0,3,1,1,2,2,1,2,3,1,3,1,1,1,1,6,2,4,1,2,1,1,1,2,1,2,5,1,2,1,1,1,2,3,1,1,1,1,2,3,1,1,4,2,1,2,1,1,1,1,2,1,3,3,3,1,1,2,1,2,4,3,1,2,2,1,1,1,2,1,3,1,1,1,1,4,3,4,1,1,2,1,1,4,1,3,2,1,1,2,1,1,3,2,1,2,1,3,1,2,2,1,3,1,1,1,1,2,1,1,2,1,1,1,4,1,2,1,2,3,1,1,1,2,2,4,2,1,1,1,1,1,3,2,2,2,2,1,1,2,3,1,6,2,3,2,5,1,2,7,1,2,2,1,1,1,1,1,4,1,1,1,1,1,2,1,1,1,3,1,1,2,3,2,1,1,1,1,1,1,7,2,1,3,2,1,2,2,1,1,1,2,1,1,2,4,3,2,1,1,1,3,1,2,3,1,4,2,1,1,2,2,2,3,3,3,2,1,1,2,2,1,1,1,1,2,1,2,2,1,1,1,1,1,6,1,1,1,1,3,1,1,1,1,3,1,2,2],
+      ["partaking",55,1],
+      ["partial",56,1,57,1,27,1],
+      ["partially",76,1,7,1,46,1],
+      ["participant",18,3,8,3,28,1,9,1,19,2,3,5,12,1,1,2,2,8,6,1,20,1,26,2,1,1,2,2,26,2,3,1],
+      ["participated",26,1,28,1,10,1,84,1],
+      ["participating",13,1,139,1,24,1,43,1],
+      ["participation",8,3,41,1,17,1,56,1,9,1],
+      ["particle",65,1,14,2,1,4,44,3,56,3,34,1,12,3],
+      ["particleboard",117,1],
+      ["particular",0,1,8,1,1,2,10,1,13,2,2,1,4,1,4,1,10,2,1,2,4,1,1,1,4,1,5,2,1,3,1,2,6,1,1,2,1,1,1,2,2,1,1,2,1,1,6,1,1,1,9,1,4,5,6,1,14,2,7,1,2,2,4,1,4,1,5,1,1,4,2,1,1,1,1,1,3,1,3,5,4,1,2,1,1,1,3,1,2,1,8,2,11,2,2,1,3,1,2,1,6,5,7,2,1,1,4,1,1,1,7,1,3,1],
+      ["particularly",4,1,4,1,1,1,4,1,3,1,6,1,1,1,4,1,22,1,5,2,9,1,3,1,13,1,2,1,2,1,3,1,2,1,6,1,14,1,6,2,2,1,11,2,2,1,2,1,2,2,4,4,2,2,4,1,7,2,7,2,4,2,13,1,1,1,7,1,1,1,4,1,4,2,1,1,2,1,11,1,9,1,3,1,1,1,1,1,5,1,1,2],
+      ["partied",78,1],
+      ["partly",12,1,23,2,1,4,16,1,14,2,24,1,29,1,4,1,17,4,19,1,42,1,10,2],
+      ["partner",82,1,80,1,42,1],
+      ["partnered",63,1],
+      ["partnership",80,1,42,1],
+      ["party",78,1,40,1,26,1,12,2,6,3,16,1,8,1],
+      ["pass",49,2,13,2,1,1,26,1,9,1,63,1,31,1],
+      ["passage",35,1,17,1,10,1,7,1,21,1,23,1,36,1,37,1,10,1,12,1,12,1],
+      ["passageway",113,1,110,1],
+      ["passe",33,1,2,1,44,1,56,3],
+      ["passed",14,2,1,1,1,1,6,1,16,1,41,1,11,2,8,1,7,1,80,1,16,1,20,1],
+      ["passenger",13,1,78,1,6,1,16,1,19,2,29,1],
+      ["passer",63,3,151,1],
+      ["passing",25,1,6,1,2,1,16,1,1,1,13,1,11,1,15,1,2,6,79,1,9,1,8,1,8,1],
+      ["passion",41,1],
+      ["passionate",122,1,15,1],
+      ["passionately",99,1],
+      ["passionless",63,1],
+      ["passive",8,1,106,1,6,1,65,1],
+      ["passport",161,1],
+      ["past",5,1,2,1,6,2,1,2,8,1,2,1,3,1,1,1,1,1,4,1,8,6,17,1,1,1,4,3,3,1,2,1,1,3,1,1,6,1,4,1,10,2,2,1,1,3,2,1,6,1,17,1,10,1,10,1,9,1,6,1,7,1,1,1,1,1,15,3,4,1,5,1,1,7,7,1,2,1,5,1,1,1,8,1,5,1,1,1,3,1,2,1,1,1],
+      ["paste",173,1],
+      ["pasture",90,2,34,1,19,1,51,1,30,4],
+      ["pat",222,1],
+      ["patagonia",40,9],
+      ["patagonian",40,3],
+      ["patch",10,1,117,1,12,1,4,1],
+      ["patche",21,1,48,1,66,1,66,1,15,1],
+      ["patched",30,1],
+      ["patent",62,2],
+      ["patented",23,1,9,1,6,1,59,1],
+      ["paternity",14,1],
+      ["path",35,1,49,3,19,1,56,1,6,2,15,3],
+      ["pathogen",62,4],
+      ["pathological",125,1],
+      ["pathologist",192,1],
+      ["pathway",37,4,18,1,166,1],
+      ["patience",131,2,18,1,66,2],
+      ["patient",7,1,4,2,3,1,3,2,36,15,5,1,5,1,9,4,11,6,15,1,2,4,9,1,11,3,6,1,49,3,16,6,29,5],
+      ["patricia",179,2],
+      ["patriotic",157,1],
+      ["patron",0,1,44,2,107,2,37,2,31,1],
+      ["patronage",188,1],
+      ["patronised",64,1],
+      ["pattern",3,3,11,2,4,1,3,1,6,2,12,9,4,3,4,2,16,1,3,1,10,2,1,1,2,1,2,3,8,1,5,1,1,1,2,3,2,3,1,1,10,1,16,1,2,1,2,1,6,1,2,1,1,1,6,3,2,2,3,1,2,1,4,1,9,1,2,2,12,1,1,1,10,1,7,1,4,3,1,1,1,1,3,2,6,2,2,1,2,1,4,2],
+      ["patterned",63,3,92,2,61,1],
+      ["paul",25,1,24,1,11,1,11,1,4,4,3,1,3,1,8,1,30,1,37,1,2,1,17,1,10,1,4,3,8,1,13,1],
+      ["paula",111,1],
+      ["paulo",129,1],
+      ["pauper",64,1],
+      ["pause",34,1,138,1],
+      ["paused",0,1],
+      ["pausing",172,1],
+      ["paved",35,1],
+      ["pavement",96,1,55,1],
+      ["paving",35,1,12,1,148,1],
+      ["paw",27,2],
+      ["pay",18,1,13,1,6,2,18,1,17,1,4,1,1,1,1,1,3,1,4,1,1,2,11,1,7,1,30,1,5,1,8,2,9,1,7,1,28,1,6,2,12,2,4,2,9,1,2,1],
+      ["paying",126,1,37,1,7,1,27,2,3,2],
+      ["payment",20,4,13,1,3,1,8,1,33,2,36,1],
+      ["payoff",200,1],
+      ["pea",211,1,10,3],
+      ["peace",42,1,107,1,39,1],
+      ["peaceable",64,1],
+      ["peaceful",103,1],
+      ["peach",65,1],
+      ["peak",35,1,48,1,34,1,18,1,59,1],
+      ["peaked",90,1],
+      ["pear",22,1,24,1,147,2],
+      ["pearce",5,9],
+      ["pearl",4,2,104,65],
+      ["pearling",108,1],
+      ["peasant",87,3,12,3,38,1,20,1,22,2],
+      ["peasantry",99,1],
+      ["peat",40,1],
+      ["peck",130,1],
+      ["pectoral",52,2],
+      ["peculiar",57,1,92,1,6,1],
+      ["peculiarity",145,1,38,1,20,1,2,1],
+      ["peculiarly",182,1],
+      ["pedagogical",148,1,12,1,3,1],
+      ["pedagogy",148,1,15,1],
+      ["pedestrian",63,1,21,3],
+      ["peek",91,1],
+      ["peer",20,1,22,1,22,1,10,1,18,2,27,4,30,1,4,1,10,1,21,1,2,1,3,1,4,1,5,1,15,1],
+      ["peered",174,1],
+      ["peg",29,2],
+      ["pellegrini",92,4],
+      ["pelt",21,1],
+      ["pelvi",115,1],
+      ["pelvic",52,1],
+      ["pemberton",144,1],
+      ["pen",4,1,38,1,25,1,78,1,58,1,14,3,6,2],
+      ["pencil",23,1,29,1,165,25,1,22],
+      ["pendulum",11,1,38,1,122,1],
+      ["penetrate",30,1,38,2,112,1],
+      ["penetrated",207,1],
+      ["penetrating",180,1],
+      ["penetration",21,1,141,1],
+      ["peninsula",141,1],
+      ["penned",145,1,58,1],
+      ["penniless",101,1],
+      ["pennsylvania",120,1,12,1,58,1],
+      ["penny",113,1],
+      ["people",0,1,2,9,1,3,1,3,2,15,1,2,1,3,1,11,2,1,1,2,1,4,2,21,1,5,1,6,1,9,2,12,1,4,2,3,2,1,1,3,1,1,3,3,1,2,1,3,1,1,1,3,1,1,1,1,1,4,1,6,1,14,2,6,1,14,1,2,1,2,1,1,1,1,1,9,2,1,1,3,3,2,1,1,1,2,1,4,1,2,1,10,2,11,1,4,1,2,1,10,2,1,4,1,1,4,1,2,4,6,1,10,1,2,1,2,1,2,1,2,1,12,1,8,1,6,1,3,1,11,1,2,4,1,1,6,2,2,1,3,1,4,1,2,2,8,1,3,1,7,2,8,1,1,1,4,2,10,4,1,4,4,3,1,1,2,1,1,1,4,3,2,1,3,2,12,1,3,1,1,3,2,2,2,1,2,1,1,1,1,1,8,1,1,1,4,1,4,1,2,3,2,2,9,1,5,1,2,2,13,1,5,1,3,3,4,1,4,2,5,2,1,1,8,2,2,3,1,2,3,1,2,3,14,2,3,1,3,1,1,1,1,1,2,1,8,4,9,1,1,1,3,1,1,1,1,1,2,1,1,2,11,1,1,1,1,1,2,1,3,1,3,1,9,1,2,1,8,1,15,2,1,2,11,2,1,1,3,2,7,1,2,1,1,3,1,1,4,2,3,2,9,1,3,2,8,3,1],
+      ["peopled",40,1],
+      ["peopling",40,4],
+      ["pepper",158,14],
+      ["peppered",182,1],
+      ["peppermint",71,1,7,1],
+      ["per",0,1,5,2,1,4,1,1,3,1,17,1,1,1,4,1,1,1,9,1,16,2,4,1,3,1,1,1,5,1,4,1,2,1,8,2,3,2,14,1,7,1,1,3,2,1,1,2,1,1,10,1,1,1,8,2,1,1,19,1,11,1,3,1,8,1,3,2,2,1,1,1,3,1,7,1,4,4,4,1,2,2,11,1],
+      ["perceive",65,1,6,1,7,1,15,2,1,1,62,1,11,1,6,1,1,1,10,1,22,2,6,1],
+      ["perceived",6,1,50,1,26,1,127,1],
+      ["percent",22,1,21,4,9,1,8,1,7,1,3,1,6,1,18,2,23,4,2,1,7,2,3,6,10,2,2,2,2,2,29,1,3,1,3,1,19,1,19,2,4,1],
+      ["percentage",49,1,50,1,31,3,18,1,14,1,3,1,13,1],
+      ["perceptible",25,1],
+      ["perception",2,1,24,3,28,1,39,16,5,1,23,1,45,1,40,3,3,1,15,1],
+      ["perceptive",209,1],
+      ["perceptively",206,1],
+      ["perceptual",176,1],
+      ["perch",127,1],
+      ["perched",27,1],
+      ["percival",177,1],
+      ["percussion",46,1],
+      ["peretz",204,3],
+      ["perfect",0,1,73,1,7,1,6,1,22,1,3,2,19,1,23,1,42,1],
+      ["perfected",57,1,50,1,38,1,58,1],
+      ["perfection",30,1,22,1,145,1],
+      ["perfectly",3,1,54,2,11,1,5,1,43,1,53,1,44,1],
+      ["perform",3,2,5,1,4,1,1,2,42,1,1,1,1,1,1,1,7,1,22,1,21,1,13,1,37,1,1,3,4,1,18,2,16,4,3,1,4,1,20,1],
+      ["performance",2,2,4,18,2,1,3,1,1,3,1,3,4,1,18,1,9,4,5,4,17,1,62,1,3,1,15,1,7,1,6,1,4,1,3,1,2,1,2,1,2,2,25,3,22,6],
+      ["performed",2,1,1,3,3,1,7,4,58,1,1,1,6,1,2,1,41,1,7,4,92,1],
+      ["performer",6,6,213,3],
+      ["performing",44,4,13,1,8,1,33,1,16,1,8,1,41,1,25,1],
+      ["perfume",65,2,60,2,30,1],
+      ["perfumer",71,1,7,1],
+      ["perfumery",125,1],
+      ["perhap",1,1,2,1,8,1,1,1,1,1,1,1,2,1,3,1,7,1,1,2,7,1,5,3,2,4,2,1,12,2,4,1,8,1,6,2,2,1,6,3,2,1,5,1,2,1,1,1,1,1,1,3,3,1,4,1,1,1,13,1,2,1,11,1,7,1,5,1,3,1,3,1,1,1,1,1,7,1,2,1,4,2,8,1,2,1,6,1,6,1,1,1,4,2,1,1,4,2,4,1,7,1,2,2,2,2,1,1,1,1,2,1,4,2,10,1],
+      ["peril",152,2],
+      ["perimeter",50,1],
+      ["period",0,2,2,1,2,2,5,3,7,1,2,1,2,1,5,6,1,2,2,1,3,1,5,1,1,1,2,6,1,1,3,1,2,4,6,1,8,1,3,1,13,4,2,2,15,2,2,1,2,1,9,1,2,1,2,1,5,1,3,1,4,1,1,1,2,1,1,1,3,2,8,3,4,1,3,4,1,1,3,1,6,1,14,1,2,1,5,2,5,1,6,5,4,1,2,1,3,1,2,2,2,2,7,1,2,4,2,2,1,2,1,1,1,1,8,1,2,1,1,1],
+      ["periodic",178,1],
+      ["periodically",85,1,62,1,12,1,59,1],
+      ["periphery",205,1],
+      ["perishable",96,1],
+      ["perished",149,1],
+      ["perkin",38,2],
+      ["perli",94,1],
+      ["permanent",13,1,12,1,3,1,27,1,35,1,57,3,23,5,17,1,32,1],
+      ["permanently",137,1,10,1,47,1],
+      ["permeate",120,1],
+      ["permeated",15,1],
+      ["permeating",48,1],
+      ["permission",70,1,21,1,31,1],
+      ["permit",52,1,34,1,45,1,40,1,15,1,8,1],
+      ["permitted",21,1],
+      ["permitting",8,1],
+      ["pernicious",105,1],
+      ["perpetuating",222,1],
+      ["perplexing",183,1,7,1],
+      ["perrault",157,1],
+      ["perry",158,2],
+      ["persecuted",194,1],
+      ["persecution",64,1],
+      ["persevered",105,1],
+      ["persia",77,1],
+      ["persian",46,2,21,2,10,1,31,4],
+      ["persist",39,1,96,1,8,1,6,1,4,1,24,1,30,2],
+      ["persisted",153,1],
+      ["persistent",163,1],
+      ["person",2,1,4,1,3,5,2,5,1,1,1,1,2,2,5,1,4,1,6,1,1,1,11,4,10,1,6,3,2,2,7,1,4,1,5,2,2,1,3,3,2,2,8,2,13,3,2,1,7,1,2,1,11,6,5,1,2,1,12,1,2,1,5,1,2,2,3,1,12,1,4,1,1,2,1,5,1,1,5,2,2,1,3,1,14,4,3,1,1,1,3,1,6,1,1,1,5,2,1,2,5,2],
+      ["personal",9,2,2,1,4,1,11,2,62,1,7,2,3,2,13,2,1,1,4,2,10,1,23,1,14,1,9,4,33,2,4,1],
+      ["personality",20,1,16,4,45,4,90,1,54,2],
+      ["personalized",9,1,189,1],
+      ["personally",0,1,111,1],
+      ["personnel",153,1,9,1],
+      ["perspective",8,2,5,1,27,1,1,1,37,1,56,2,14,1,11,1,28,1],
+      ["persuade",56,1,15,1,24,1,51,1],
+      ["persuaded",42,1,57,1,39,1,41,1,21,1,2,1],
+      ["persuasion",162,1],
+      ["persuasive",89,1,119,1],
+      ["pertinent",6,1,146,1,31,1],
+      ["peru",23,1,27,3,49,1,59,1,34,1],
+      ["peruvian",50,1],
+      ["pervasive",214,1],
+      ["pessimistic",193,1,16,1],
+      ["pest",51,1,50,2,34,1,3,3,35,1,14,1,6,15,9,3],
+      ["pesticide",51,1,52,1,90,1,8,2,25,1],
+      ["pet",17,2,124,1,57,1,11,1,13,2],
+      ["petalomyrmex",65,1],
+      ["peter",45,1,16,2,44,3,47,1,43,1],
+      ["peterson",81,2],
+      ["petitioned",16,1],
+      ["petri",7,19],
+      ["petrified",151,1],
+      ["petrini",32,1],
+      ["petrochemical",5,1],
+      ["petrol",96,4,16,1],
+      ["petroleum",96,1,29,1],
+      ["petty",118,1],
+      ["pfeffer",6,1],
+      ["phane",165,1],
+      ["pharaoh",123,1],
+      ["pharmaceutical",16,3,37,3,27,1,14,1,23,1,22,1,17,1],
+      ["pharmacist",16,1,37,3],
+      ["pharmacological",51,1],
+      ["pharmacy",16,1,37,1],
+      ["phase",7,1,5,1,5,1,64,12,13,2,75,1,2,1,13,2],
+      ["phd",134,1,87,1],
+      ["phenol",19,1],
+      ["phenomena",26,2],
+      ["phenomenal",42,1,79,1],
+      ["phenomenon",25,2,1,2,8,1,2,1,3,1,8,4,2,2,6,4,2,1,34,1,33,2,2,1,15,1,7,1,17,1,15,1,1,1,19,1,14,1,7,1],
+      ["phil",16,1],
+      ["philadelphia",97,1,4,2],
+      ["philanthropic",28,1],
+      ["philanthropist",28,3],
+      ["philanthropy",28,3,94,1],
+      ["philippe",211,1],
+      ["philippine",108,1,87,1],
+      ["phillip",33,1,36,2,12,1],
+      ["philosopher",15,1,36,2,5,1,37,1,23,1,29,1,15,2,26,1,17,1,5,1],
+      ["philosophical",98,1],
+      ["philosophy",0,1,82,2,29,3,5,2,2,1,16,1,4,1,7,1,15,1,8,1,22,2,12,1,1,1],
+      ["philson",28,1],
+      ["phobia",157,1],
+      ["phone",20,1,43,1,7,1,12,1,44,2,2,1,69,2],
+      ["phosphorus",48,1,11,2,162,3],
+      ["photo",26,7,34,1,22,1,66,3,3,1],
+      ["photograph",26,4,4,1,27,1,41,2,32,2,14,1,29,1,4,1,37,1],
+      ["photographed",68,1],
+      ["photographic",19,1,11,1,114,1,20,1],
+      ["photographing",26,1,63,1],
+      ["photography",26,3,189,1],
+      ["photoreceptor",159,1],
+      ["photosynthesis",5,3,54,2,105,1],
+      ["photosynthetic",164,2],
+      ["phrase",18,1,93,2,34,3,1,1,2,1,42,1,13,1,22,1],
+      ["phrasing",86,1],
+      ["phylax",65,1],
+      ["physic",116,2,44,2,28,1],
+      ["physical",14,1,3,1,3,3,23,3,4,3,5,1,5,1,6,2,9,2,11,1,4,1,7,1,4,1,2,1,4,1,16,2,35,1,12,1,1,1,17,1,4,1,11,1,12,1,2,1,8,5,2,2],
+      ["physically",37,1,55,1,14,1,110,1,8,1],
+      ["physician",11,1,53,1,8,1,39,4,5,3,9,1,43,1,45,1],
+      ["physicist",93,1,52,2,20,1,38,2],
+      ["physiological",17,2,43,1,108,1,6,1,46,1,1,1],
+      ["physiologically",63,1],
+      ["physiologist",57,1,2,1,99,1,10,1],
+      ["physiology",72,1,144,1],
+      ["phytoplankton",52,1],
+      ["piaget",160,31],
+      ["pianist",2,1,165,1,37,1,8,1],
+      ["piano",37,1,109,1,21,1,9,2,13,1,23,1],
+      ["piazza",32,1],
+      ["pick",68,1,10,3,4,1,13,1,3,1,16,1,10,1,2,1,1,1,3,2,33,1,23,1,4,1],
+      ["picked",38,1,28,1,16,1,51,1,43,1,16,1],
+      ["picking",14,1,37,1,28,1,35,1,86,1],
+      ["pickup",46,1],
+      ["picture",2,1,19,1,3,1,2,3,22,1,1,1,20,2,18,3,11,2,39,1,9,3,11,1,16,1,4,1,1,1,1,1,3,2,18,2,6,2,5,1,4,7,7,1],
+      ["picturesque",41,1,46,1],
+      ["pidgin",162,1],
+      ["piece",7,1,8,1,6,1,2,1,2,1,2,1,2,1,1,3,6,1,11,1,20,2,12,3,1,2,11,1,7,1,3,1,7,2,5,1,2,1,1,1,3,2,2,1,4,1,2,1,1,1,9,1,1,2,2,1,18,1,14,1,11,2,1,1,11,1,7,2,3,1,13,1,1,1],
+      ["pieced",148,1,32,1],
+      ["piecemeal",64,1],
+      ["pier",44,1],
+      ["pierced",87,1],
+      ["piercing",48,1,55,1],
+      ["pierre",71,1,7,1],
+      ["pig",211,1],
+      ["pigeon",130,2],
+      ["pigment",38,1,9,1,21,5],
+      ["pike",52,1],
+      ["pil",53,3],
+      ["pile",21,4,41,1,34,1,8,1,19,1,9,1,33,1,35,1],
+      ["piled",165,1],
+      ["pill",72,2,10,1,12,1,126,5],
+      ["pillar",79,2],
+      ["pilot",37,1,84,1,32,1,8,4,28,2,8,2],
+      ["pin",159,1],
+      ["pincer",33,1],
+      ["pinch",3,1],
+      ["pine",103,1,14,3],
+      ["pink",72,1,36,1,64,1],
+      ["pinker",167,1,45,2],
+      ["pinnacle",87,1,101,1],
+      ["pinner",102,1,97,1],
+      ["pinpoint",18,1,51,2,54,1,22,1,29,1,29,1],
+      ["pinpointed",129,1,72,1],
+      ["pinter",12,2],
+      ["pioneer",37,1,63,1,16,1,69,1,15,1,1,1,22,1],
+      ["pioneered",60,1,6,1,7,1,95,1],
+      ["pioneering",36,1,28,1,29,1,67,1,25,1],
+      ["pipe",19,1,16,1,44,1,46,1,16,1],
+      ["piped",135,1],
+      ["pipeline",180,1],
+      ["piping",19,1],
+      ["piquia",179,3],
+      ["pirah",183,24],
+      ["piramide",31,1,19,2],
+      ["pirate",182,1],
+      ["piri",225,3],
+      ["pirouette",161,1],
+      ["pit",35,1,175,1],
+      ["pitch",2,2,16,1,65,1,17,5,104,1],
+      ["pitche",204,2],
+      ["pitched",103,1],
+      ["pitcher",59,5],
+      ["pitching",184,1],
+      ["pitfall",26,1],
+      ["pitt",88,1],
+      ["pittance",179,1],
+      ["pitted",87,1],
+      ["pittsburgh",17,1,203,1],
+      ["pivotal",60,2],
+      ["pivoting",177,1],
+      ["placate",174,1],
+      ["place",7,1,1,1,5,4,4,1,1,1,3,1,2,1,2,1,1,25,1,2,1,1,2,1,1,1,3,1,1,1,1,1,2,1,2,2,7,1,1,1,2,2,2,2,2,1,2,1,3,1,3,2,1,2,4,1,3,1,11,5,3,1,7,1,2,1,1,1,1,3,10,1,2,1,1,1,1,1,1,1,8,2,2,1,1,2,2,1,1,3,3,2,2,1,1,4,1,1,3,3,4,1,6,2,5,1,1,2,2,1,2,1,1,1,3,1,5,2,1,2,6,2,7,1,3,2,1,1,1,2,3,1,3,1,8,2,1,1,5,1,2,1,1,1,2,3,2,1,1,1,3,3,1,1,1,1,1,2,1,1,3,1,2,1,1,1],
+      ["placebo",72,15],
+      ["placed",24,1,3,1,2,1,13,3,5,1,4,1,16,1,14,4,22,1,3,1,19,1,5,1,26,2,22,2,2,2,12,1,22,1],
+      ["placeless",157,1],
+      ["placement",31,1,83,1],
+      ["placing",31,1,13,1,104,1,23,1,47,1],
+      ["pladdy",176,3],
+      ["plague",64,1,130,1],
+      ["plagued",208,1],
+      ["plain",35,8,55,1,6,1,22,1,28,1,4,1,1,1,62,1,3,1,7,2],
+      ["plan",18,1,6,1,4,1,5,1,1,1,1,3,9,1,14,1,4,1,7,1,1,1,48,2,10,1,14,8,22,1,5,1,3,1,21,1,4,1],
+      ["planck",27,1,88,1],
+      ["plane",64,1,57,1,17,2,53,1,11,2],
+      ["planet",5,1,8,8,1,1,11,1,39,1,38,2,14,2,4,1,4,2,5,1,4,1,9,7,22,29,13,8,3,1,19,2,14,1],
+      ["planetary",13,1,129,4],
+      ["plank",113,1,10,2,95,5],
+      ["plankton",48,1,4,3,39,1],
+      ["planned",4,1,8,1,68,1,4,1,26,1,3,1,56,1],
+      ["planner",50,1,13,1],
+      ["planning",15,1,54,1,1,1,3,1,14,1,9,1,16,2,64,1,41,1],
+      ["plant",1,2,4,5,11,17,3,1,2,1,1,5,1,5,2,1,2,2,4,1,1,11,6,4,12,1,1,2,8,38,2,6,4,27,4,1,10,1,9,1,11,8,4,2,4,4,13,1,4,1,10,3,1,16,4,1,2,14,2,4,4,1,8,8,3,8,6,3,5,1,8,1,2,4,11,1,3,5,8,2,9,2,11,61,1,1,1,1,1,35],
+      ["plantation",48,1,69,3,26,2,50,4],
+      ["planted",33,1,51,1,15,1,42,1,2,1,52,1,26,3],
+      ["planthopper",154,3],
+      ["planting",69,1,30,1,18,1],
+      ["planum",2,3],
+      ["plaster",29,1,43,1,97,1,4,2],
+      ["plastic",7,1,12,19,10,3,1,1,38,1,12,1,24,1,10,1,11,1,86,1,15,1],
+      ["plate",32,1,29,1,36,1,16,3],
+      ["plateau",27,1,13,1],
+      ["plateaux",21,1],
+      ["plated",52,1],
+      ["platform",44,3,117,1],
+      ["plato",51,1],
+      ["platonia",179,1],
+      ["platz",84,2],
+      ["plaudite",219,1],
+      ["plausible",75,1,115,1],
+      ["plausibly",169,1],
+      ["play",12,6,2,1,1,3,2,1,1,3,11,1,8,1,10,1,5,1,2,1,11,1,3,1,6,1,11,1,5,1,1,1,1,30,12,1,7,1,7,1,2,1,10,3,1,4,3,1,11,10,1,2,1,1,1,1,12,1,1,1,6,1,9,1,4,1,2,2,1,1,6,1,5,1,3,1,6,10,4,2,1,1,3,17,1,1,7,2,2,2,4,2],
+      ["played",4,1,10,1,9,2,16,1,4,1,3,1,4,1,33,1,9,7,8,6,15,1,2,1,1,2,13,5,36,1,9,2,1,1,12,4,22,3,1,1],
+      ["player",2,3,129,19,25,3,19,1,14,8,2,1,15,2,20,1],
+      ["playful",52,1,40,4,19,1],
+      ["playfulness",146,1],
+      ["playground",26,1],
+      ["playing",2,1,2,1,11,1,3,2,18,1,21,1,23,1,12,3,12,1,27,7,13,1,9,1,1,2,18,1,4,3,9,1,4,5,2,1,15,1,5,3,14,1],
+      ["playmate",92,1,115,1],
+      ["plaything",29,1,169,1],
+      ["playwright",145,1,58,1],
+      ["plaza",50,2],
+      ["plea",179,1],
+      ["pleading",97,1],
+      ["pleasant",37,1,26,1,2,1,6,1,7,1,7,1,33,3,32,1,25,5],
+      ["pleasantly",34,1,91,2],
+      ["please",98,1,50,1,9,1],
+      ["pleasing",225,1],
+      ["pleasurable",100,1],
+      ["pleasure",32,3,23,2,30,1,3,1,12,1,82,1,3,1,5,1,10,2,6,1,9,1],
+      ["plectrum",46,1],
+      ["pleistocene",75,2],
+      ["plentiful",14,1,107,1,90,1],
+      ["plenty",45,1,13,1,57,1,28,1,23,1],
+      ["plethora",210,1],
+      ["pleureur",219,1],
+      ["pliant",23,1,126,1],
+      ["pliny",51,1,36,1],
+      ["plodding",109,1],
+      ["ploeg",70,1],
+      ["plopped",63,1],
+      ["plot",26,1,43,1,40,1,66,1,7,1],
+      ["plotted",87,1],
+      ["plotting",171,1],
+      ["plough",66,1],
+      ["ploughing",102,1,97,1],
+      ["ploughman",211,1],
+      ["plourde",47,3],
+      ["plover",103,1,27,1],
+      ["pluck",216,1],
+      ["plucked",167,1,45,1],
+      ["plugging",35,1],
+      ["plum",22,1],
+      ["plumbago",217,2,1,1],
+      ["plumbing",15,1],
+      ["plummeted",33,1,30,1],
+      ["plumridge",20,4],
+      ["plundered",99,1],
+      ["plunge",220,1],
+      ["plunged",68,1,128,1],
+      ["plural",54,3,1,1],
+      ["plus",46,1,36,1,35,1,105,1],
+      ["pluspoint",53,1],
+      ["plying",66,1],
+      ["plywood",117,1],
+      ["pm",118,1],
+      ["pneumatic",23,1],
+      ["pocket",135,1],
+      ["pod",14,7,129,2],
+      ["poe",109,1],
+      ["poem",4,1,178,1,29,1],
+      ["poet",51,1,6,1,55,1,59,1,40,1,8,1],
+      ["poetical",188,1],
+      ["poetry",4,1,7,1,134,1,58,1],
+      ["pohutukawa",151,1],
+      ["point",1,7,1,1,4,2,1,1,5,1,5,1,3,1,1,2,1,1,2,2,3,1,3,1,1,1,3,1,4,1,1,1,2,1,3,2,5,1,9,1,2,3,1,2,2,1,5,1,4,1,3,3,1,1,8,2,2,1,3,1,8,1,3,1,2,1,10,1,2,1,2,1,3,1,2,2,9,4,3,1,1,5,4,1,4,1,2,1,2,3,2,1,2,2,3,1,4,2,1,1,1,1,1,1,6,1,6,1,6,1,1,1,1,1,2,1,1,2,1,3,1,1,1,1,13,1,3,1,2,1,1,1,1,2,2,1,1,1,1,1,3,1,3,1,1,1,2,1,1,1,1,1],
+      ["pointed",1,1,10,1,36,1,20,1,34,1,47,1,24,1,45,1,4,1],
+      ["pointing",152,1,59,1],
+      ["pointless",144,1],
+      ["poison",103,2,35,1,55,3,9,1,22,2],
+      ["poisoned",138,1,64,1,21,1],
+      ["poisoner",139,1],
+      ["poisoning",53,1,84,1,1,1,64,1],
+      ["poisonous",139,1,4,2,50,1],
+      ["poker",175,1],
+      ["poking",1,1],
+      ["polar",64,1,27,2,30,1,28,1,15,4],
+      ["polarised",121,1,38,4],
+      ["polariser",159,1],
+      ["polarity",116,4],
+      ["pole",48,1,68,6,1,1,2,1,33,1,25,2],
+      ["polecat",223,4],
+      ["police",94,1,15,1,83,1,22,1],
+      ["policing",54,1],
+      ["policy",49,1,5,1,9,1,7,2,64,2,15,1,4,3,10,2,23,3,15,1,8,1,5,1],
+      ["polish",207,1],
+      ["polished",46,1,52,1],
+      ["polite",0,1,54,2,165,1],
+      ["politely",181,1],
+      ["politeness",100,1,125,1],
+      ["politic",4,1,28,1,114,1,6,5],
+      ["political",9,1,32,1,68,1,3,1,5,1,7,1,3,2,2,1,22,1,1,7,4,3,30,1,8,1,15,1],
+      ["politician",9,1,6,1,16,1,148,1],
+      ["poll",219,1],
+      ["pollen",65,1],
+      ["pollinated",65,1],
+      ["pollination",65,1],
+      ["pollinator",65,5],
+      ["polluted",141,1],
+      ["polluting",5,1,91,1],
+      ["pollution",31,1,20,1,8,1,43,6,6,1,5,1,86,6],
+      ["polo",125,2],
+      ["polyester",140,1],
+      ["polygraph",175,1],
+      ["polymer",19,3],
+      ["polymerization",19,1],
+      ["polymerize",19,1],
+      ["polynesian",1,1,102,1,7,1,77,2],
+      ["polypropylene",19,1],
+      ["polysomnogram",220,2],
+      ["polystyrene",19,2],
+      ["polystyrene1930sgermanyresemble",19,1],
+      ["polytechnic",16,1],
+      ["polytetrafluoroethylene",19,1],
+      ["polythene",19,1],
+      ["polythene1930s4",19,1],
+      ["polyurethane",19,1],
+      ["polyurethanegermanyusually",19,1],
+      ["polyvinyl",19,1],
+      ["pomodoro",22,1],
+      ["pompeii",87,1],
+      ["pon",17,1],
+      ["pond",35,1,77,1],
+      ["ponsat",156,3],
+      ["pont",19,1],
+      ["pool",35,1,36,1,7,1,1,3,43,2],
+      ["poole",154,1],
+      ["pooled",83,1],
+      ["poor",6,1,36,1,1,1,10,1,6,1,5,1,7,1,11,1,3,1,11,1,5,2,1,1,7,1,1,1,2,2,1,1,18,1,2,1,19,1,1,1,9,1,1,1,16,2,12,1,8,1,5,1],
+      ["poorer",23,1,73,1,6,1,45,1,6,1,46,1],
+      ["poorest",87,1,12,1,3,1,77,1,20,1],
+      ["poorly",153,1],
+      ["pop",18,1,23,1,131,1],
+      ["popcorn",85,1],
+      ["poplar",221,1],
+      ["popper",53,1],
+      ["poppet",211,1],
+      ["popping",132,1],
+      ["populace",99,1],
+      ["popular",0,2,9,3,4,1,3,1,2,1,5,2,6,4,2,2,3,1,4,2,1,1,2,3,2,4,3,1,27,1,15,1,12,1,5,1,1,1,1,1,1,1,1,2,16,1,3,1,4,2,5,5,3,1,1,1,7,1,7,1,3,1,12,2,12,1,7,3,17,1,8,1,3,1,3,1,3,1],
+      ["popularist",55,1],
+      ["popularity",16,2,13,1,9,1,16,1,7,1,5,1,65,2,26,1,25,1,2,1],
+      ["popularized",45,1],
+      ["populated",39,1,9,1,87,1,12,1],
+      ["populating",90,1],
+      ["population",14,2,1,1,1,1,11,4,1,1,4,1,8,1,3,2,5,5,13,1,14,4,21,2,3,3,3,1,1,2,7,5,2,2,5,1,1,1,6,3,1,1,2,1,6,3,2,2,2,1,1,4,3,2,2,2,1,3,3,1,11,1,6,1,4,1,10,2,5,1,3,1,1,4,7,1,2,1,1,1,2,1,3,4,14,1,7,4,3,1],
+      ["populous",9,1],
+      ["porcelain",29,3],
+      ["pore",59,1,162,5],
+      ["poring",105,1,55,1],
+      ["porous",35,3,27,2],
+      ["port",66,2,47,1,23,1],
+      ["portable",0,1,191,1],
+      ["portion",18,2,86,1,9,1,3,1,32,1,44,1],
+      ["portland",129,23],
+      ["portrait",9,1],
+      ["portray",209,1,6,1],
+      ["portrayed",4,2,25,1,105,1,37,1],
+      ["portugal",0,1,107,1],
+      ["portuguese",0,2,88,3,70,1,25,1,9,1],
+      ["pose",89,1,102,1],
+      ["posed",40,1,101,1,1,1,28,1,39,1],
+      ["posing",63,1],
+      ["posited",40,1],
+      ["position",6,1,9,1,1,1,11,1,1,1,1,1,1,1,43,1,7,1,2,1,9,1,10,1,11,1,9,3,1,1,8,2,1,6,13,1,12,2,3,1,2,1,7,1,6,1,6,1,17,1,8,1,2,2,18,1],
+      ["positioned",122,1],
+      ["positioning",7,1,108,1,86,1],
+      ["positive",3,1,17,2,17,7,16,1,2,1,27,1,3,3,11,1,2,1,16,1,2,1,4,1,11,4,17,1,7,2,6,1,15,1,2,1,8,1,39,3],
+      ["positively",120,1,35,1],
+      ["positron",17,1],
+      ["possess",22,1,35,1,1,1,14,1,6,1,9,1,21,2,22,1,18,1,35,1,14,2],
+      ["possessed",6,1,15,1,33,1,62,1,33,1],
+      ["possessing",221,1],
+      ["possession",10,1,19,1,18,1,16,1,67,1,19,1,41,1],
+      ["possibility",7,4,18,1,8,1,1,1,11,1,13,1,2,1,1,1,25,1,3,1,2,1,29,1,16,1,6,1,33,5,7,1,28,1,4,1,8,5,4,2],
+      ["possible",0,1,1,1,1,2,5,1,1,1,1,1,4,1,3,1,7,1,1,1,1,5,2,1,2,1,1,2,1,2,12,1,5,2,1,1,2,1,15,2,3,1,1,1,3,1,1,1,3,1,3,1,2,1,2,1,1,1,1,2,5,2,3,1,1,1,1,1,1,1,2,1,1,1,3,1,5,1,17,2,5,1,1,1,6,1,1,1,1,1,1,1,1,1,1,1,3,4,5,1,6,1,1,1,4,1,1,1,2,4,10,1,4,2,1,2,2,2,4,1,2,1,3,3,8,1,2,1,2,1,1,2,1,1,3,6,2,1,1,2,4,4,2,1,6,1],
+      ["possibly",12,1,20,1,10,1,5,1,25,1,5,1,23,1,3,1,3,1,3,1,6,3,10,1,30,1,3,1,11,1,3,1,13,1,38,1,1,1,2,1],
+      ["possum",103,1],
+      ["post",16,1,24,1,1,1,39,1,8,1,29,1,3,1,11,1,18,1,1,1,4,4,12,1],
+      ["posted",23,1,28,1],
+      ["poster",215,1],
+      ["postglacial",21,1],
+      ["posture",60,2,14,1,142,1,6,1],
+      ["posturing",110,1],
+      ["postwar",19,1],
+      ["pot",50,2,12,5,14,1],
+      ["potato",22,1,77,31,40,1,85,1],
+      ["potatoe",50,1,37,1,12,12,59,1],
+      ["potent",139,1,50,1],
+      ["potential",6,2,2,1,8,1,2,1,5,8,3,2,2,1,5,1,8,1,12,1,9,2,7,1,14,1,6,2,10,2,4,1,13,1,4,1,11,1,1,4,10,2,1,1,12,3,1,1,6,1,4,1,4,1,4,1,5,1,19,1,3,2,8,1,8,2,2,1,3,1,2,1],
+      ["potentially",24,1,13,1,26,1,22,1,14,1,23,1,6,1,5,1,9,1,34,1,1,1,21,1,16,2,12,2],
+      ["potsdamer",84,3],
+      ["potted",65,1],
+      ["potter",62,3,43,20,101,1],
+      ["pottery",29,1,33,1,61,1,13,1,11,1,11,1],
+      ["pouch",144,1],
+      ["pouget",189,1],
+      ["pound",0,1,27,1,5,1,34,1,22,1,21,1,10,1],
+      ["pounded",107,2],
+      ["pour",29,1,96,1],
+      ["poured",51,1,28,1],
+      ["pouring",113,1],
+      ["poverty",41,1,23,1,37,1,8,1,3,2,41,1],
+      ["powder",27,2,81,1,110,5],
+      ["powdered",217,1,1,1],
+      ["power",5,1,3,3,17,1,8,1,15,1,11,2,10,1,2,5,1,4,11,3,11,1,2,4,4,4,12,1,4,1,4,1,1,2,7,1,2,1,2,2,2,1,5,2,2,1,1,5,3,1,2,2,5,1,3,4,1,1,6,1,11,1,9,2,7,1,5,4,1,3,3,1,5,1,4,1,10,1,2,1,3,1,4,1],
+      ["powered",39,1,57,1,23,1,45,1],
+      ["powerful",3,1,6,1,8,1,10,1,11,1,14,1,12,1,2,1,5,1,1,1,2,1,9,1,4,1,27,1,15,1,13,1,2,1,7,1,3,1,1,1,10,1,24,1,5,1,30,1,1,3],
+      ["powerfully",175,1],
+      ["pozzuoli",129,1],
+      ["ppel",181,1],
+      ["pr",86,1],
+      ["practical",53,1,14,1,6,1,1,1,12,1,11,1,5,1,5,1,12,1,1,1,6,1,8,1,12,4,4,1,9,1,32,2,8,1,18,1],
+      ["practically",106,1],
+      ["practice",2,8,4,1,5,2,5,4,4,1,2,1,10,2,9,1,13,1,22,1,2,1,5,1,16,1,3,1,2,2,7,1,11,1,2,1,7,2,2,2,5,1,4,5,1,1,1,2,7,1,9,1,3,2,5,1,10,1,8,2,1,1,6,1,5,1,1,1,3,1,17,2,1,1],
+      ["practiced",108,1],
+      ["practise",2,1,137,1,71,1],
+      ["practised",2,4,3,1,11,1,89,1],
+      ["practising",176,1],
+      ["practitioner",16,1,56,3,14,1,80,2,39,1],
+      ["pragmatic",86,1,79,1],
+      ["prairie",223,7],
+      ["prairy",96,1],
+      ["praise",93,1,19,1,76,1,31,3],
+      ["praising",219,1],
+      ["pre",1,1,1,1,28,1,11,1,2,1,7,1,4,1,16,1,14,1,9,1,69,1,14,1,1,1,19,1,26,1],
+      ["precast",44,2],
+      ["precaution",0,1],
+      ["precede",73,1],
+      ["preceded",84,1,9,1],
+      ["precedence",209,1],
+      ["preceding",73,3,96,1],
+      ["precious",13,1,14,1,39,1,11,1,14,1,32,1,28,2,66,1],
+      ["precipitated",168,1],
+      ["precipitation",124,3],
+      ["precise",10,1,50,1,20,1,7,1,2,1,76,1,3,1,3,1,19,1,11,1,16,1],
+      ["precisely",14,1,11,1,1,1,34,1,12,1,12,1,1,1,15,1,55,1,16,1,38,1],
+      ["precision",1,1,1,1,4,1,46,1,17,1,9,1,70,1,23,1,30,3],
+      ["preconceived",198,1],
+      ["precursor",208,3],
+      ["predated",116,1],
+      ["predating",214,1],
+      ["predation",48,2,4,1,37,1,14,2,35,1,64,1],
+      ["predator",10,1,17,1,13,1,12,2,13,1,24,13,2,1,12,3,7,5,11,1,14,1,3,4,12,1,4,6,4,1,16,1,13,1,15,4,14,1,4,1,1,1,1,18,1,1,1,1],
+      ["predatory",21,1,70,1,96,1,6,1,29,1],
+      ["predecessor",29,1,12,1,23,1,99,1],
+      ["predetermined",92,1,48,1],
+      ["predict",24,1,45,3,87,1],
+      ["predictability",128,1,33,1],
+      ["predictable",128,1,54,1,4,1,12,1],
+      ["predicted",8,1,5,1,56,1,13,1,3,1,49,4,21,1,4,1],
+      ["predicting",60,1,9,1,87,1],
+      ["prediction",75,1,20,2,60,1,1,1,53,1],
+      ["predictor",6,2,14,1,166,1],
+      ["predilection",108,1],
+      ["predisposition",76,1,24,1,6,1,44,1],
+      ["predominance",222,1],
+      ["predominant",127,1,8,1,12,1,73,1],
+      ["predominantly",36,1,11,1,21,1,40,1],
+      ["predominate",138,1,64,1],
+      ["preen",127,2],
+      ["preening",127,1],
+      ["preface",87,1],
+      ["prefer",29,1,62,1,4,1,40,3,15,2,10,1,15,1,34,1,5,1,1,1],
+      ["preference",0,1,39,1,37,2,22,1,4,1,53,3,12,4,4,1,13,2,15,1,13,4,3,1],
+      ["preferred",27,1,6,1,3,1,49,1,22,1,48,1,70,1],
+      ["preferring",1,1],
+      ["prefiguring",41,1],
+      ["prefix",46,1],
+      ["prefrontal",17,1,20,1,57,1,32,1,55,1,16,5],
+      ["prehistorian",40,1],
+      ["prehistoric",21,1,134,3,55,1,12,1],
+      ["prehistory",47,1,108,1],
+      ["prejudice",71,1,28,1,10,1,42,1,20,2,17,1],
+      ["prejudiced",215,1],
+      ["preliminary",24,1,13,1,28,1],
+      ["prelude",4,1],
+      ["premature",83,1],
+      ["premier",9,1,35,1],
+      ["premise",120,1,43,1],
+      ["premium",66,1,62,1,96,1],
+      ["premotor",57,6],
+      ["preoccupation",182,1],
+      ["preparation",21,1,11,1,6,1,120,2,4,1,52,1,12,1],
+      ["prepare",0,1,13,1,40,1,46,1,8,1,56,2],
+      ["prepared",13,1,19,1,33,1,34,1,8,1,27,1,22,1,7,1,23,1,32,1,7,1],
+      ["preparing",60,1,103,1],
+      ["prerequisite",162,1,44,1],
+      ["presaging",121,1],
+      ["preschool",49,1,43,4],
+      ["prescribed",36,1,165,1],
+      ["prescription",16,1,37,1,85,1,63,1,1,1,12,1,6,1],
+      ["presence",5,1,2,1,6,3,27,2,29,1,32,1,54,3,14,1,8,1,13,1,1,1,1,1,29,2],
+      ["present",3,1,10,1,13,1,14,1,1,2,1,1,4,1,7,1,5,2,3,1,4,1,2,1,1,1,1,1,1,1,3,1,5,1,8,1,6,1,1,7,1,1,6,1,8,1,1,1,8,1,5,2,9,1,10,3,5,1,1,1,17,1,2,1,1,1,1,1,6,2,3,1,11,1,3,1,3,1,11,1,4,2,1,2,2,1],
+      ["presentation",0,1,11,1,19,1,98,1,27,1,26,2],
+      ["presented",0,1,30,1,23,1,23,1,8,1,27,2,3,1,11,1,1,1,29,3,4,1,20,1],
+      ["presenting",170,1],
+      ["presently",112,1],
+      ["preservation",21,1,40,3,4,1,38,1,9,1,104,1],
+      ["preserve",13,1,8,1,6,1,5,1,15,1,14,1,27,1,6,1,1,1,4,1,8,1,1,1,4,1,31,1,4,1,11,1,11,1,19,1,38,1],
+      ["preserved",32,1,13,3,16,2,54,3,54,1,41,2,5,1],
+      ["preserving",32,3,8,1,21,4,18,1,7,1],
+      ["presided",33,1],
+      ["president",16,1,4,1,11,1,51,1,15,2,19,1,18,1],
+      ["press",34,1,18,1,55,1,47,1,34,1],
+      ["presse",146,1],
+      ["pressed",46,1,5,2,12,1,50,2,27,1],
+      ["pressing",69,1,38,1],
+      ["pressure",19,1,1,1,9,1,13,4,17,2,1,1,5,1,7,2,3,1,4,1,34,1,2,1,6,2,3,1,9,1,16,1,2,1,3,1,18,1,5,1,3,1],
+      ["prestige",47,8,100,2,16,1,44,7],
+      ["prestigious",44,1,67,1,29,1],
+      ["preston",136,18],
+      ["presumably",2,1,19,1,166,1],
+      ["presumed",40,1],
+      ["pretend",92,1],
+      ["pretending",171,1],
+      ["pretest",85,3,9,3],
+      ["prettier",98,1],
+      ["prettily",171,1],
+      ["prettiness",98,1],
+      ["pretty",48,1,50,1,117,1],
+      ["prevailing",6,1,159,1,3,1],
+      ["prevalence",76,2,94,1],
+      ["prevalent",94,1],
+      ["prevent",7,4,26,1,5,1,4,1,6,1,12,1,13,1,40,2,5,4,6,1,2,1,5,1,7,1,2,1,16,1,2,1,15,1,18,1,11,1,7,3,5,1,2,1,2,1],
+      ["preventative",16,1,175,2],
+      ["prevented",4,1,31,1,24,1],
+      ["preventing",35,1,30,1,31,1,38,1,24,1,21,1],
+      ["prevention",3,1,45,1,5,1,41,1,99,1],
+      ["preventive",214,1],
+      ["previous",23,1,7,1,2,1,10,1,5,1,2,1,31,1,20,4,13,1,38,1,4,1,12,1,2,1,16,1,25,1,2,1],
+      ["previously",4,1,8,1,12,1,4,1,5,1,11,1,2,1,4,1,16,1,11,1,13,1,2,1,15,1,21,3,21,1,6,1,55,1],
+      ["prey",14,1,13,1,32,2,30,2,2,1,12,6,7,1,15,1,2,1,11,7,3,1,33,1,28,7,20,1,1,4],
+      ["preying",141,1,81,1],
+      ["price",0,1,20,3,12,1,1,3,29,1,1,1,7,1,2,1,4,3,1,2,3,2,1,1,7,3,8,1,3,1,13,3,16,9,7,2,4,1,1,1,60,1,19,1],
+      ["priceless",51,1],
+      ["pricing",156,2],
+      ["prickly",193,2],
+      ["pride",41,1,81,1],
+      ["priest",0,1,50,1,97,1,64,1],
+      ["primarily",15,1,11,1,3,1,26,1,12,2,29,1,3,3,13,1,56,1,19,1,7,1,19,1],
+      ["primary",54,1,19,1,1,1,50,1,29,1,2,1,3,1,5,1,16,1,7,1,18,1,22,1],
+      ["primate",24,6,33,1,14,1,7,1,65,3,31,2],
+      ["primatologist",143,1],
+      ["prime",88,1,8,1,26,1,24,1,28,1,15,1],
+      ["primed",143,1],
+      ["primeval",83,1],
+      ["primitive",22,1,5,1,2,2,9,1,45,1,16,1,14,1,2,1,24,1,16,3,5,2,25,1],
+      ["prince",64,1,105,1],
+      ["princely",109,1],
+      ["principal",49,1,28,2,34,1,1,1,5,1,77,1],
+      ["principle",5,1,3,2,11,1,25,2,9,2,9,1,2,2,18,2,7,1,8,1,3,1,31,1,16,1,13,1,35,1,12,1],
+      ["print",25,3,2,2,26,1,44,1,8,2,31,12,43,1,9,1,18,3],
+      ["printed",64,1,6,1,27,1,10,2,74,1],
+      ["printer",97,1],
+      ["printing",97,1,10,3,33,1],
+      ["printmaking",136,2],
+      ["prior",36,1,63,1,17,1,19,1,1,1,4,1,18,1,35,1],
+      ["prioritise",181,1],
+      ["priority",20,1,46,1,28,1,24,1,4,1,48,1,44,1],
+      ["prison",49,1,34,1,109,1,25,1],
+      ["pristine",40,1,23,1,45,1],
+      ["privacy",172,3],
+      ["private",42,2,11,1,15,1,2,2,10,1,25,1,4,4,4,1,5,1,18,2,6,1,2,1,25,2,3,2,10,2,35,1],
+      ["privately",28,1,90,1],
+      ["privilege",41,1],
+      ["privileged",87,1,126,1],
+      ["privileging",153,1],
+      ["prize",4,1,15,1,9,1,21,1,82,1,40,1,13,1,4,16,34,1],
+      ["prized",38,1,87,1,54,1],
+      ["pro",63,1,36,1],
+      ["probability",20,1,36,1,37,1,69,1],
+      ["probable",40,1,74,1,73,1],
+      ["probably",5,1,11,1,6,2,3,3,1,1,3,1,2,1,3,2,3,1,5,2,4,1,4,1,15,1,3,1,9,1,15,1,7,1,9,2,7,1,6,2,2,3,5,1,3,1,22,1,5,1,9,1,8,1,9,1,1,2,2,2,8,1,2,1,9,1,1,1,5,1,6,1,5,2,2,1],
+      ["probe",13,2,56,1,58,1,15,1,3,1,32,3,26,1],
+      ["probed",145,1,36,1,22,1],
+      ["probing",121,1],
+      ["problem",2,1,1,1,2,1,3,1,5,1,2,7,1,2,1,3,3,3,2,1,1,7,5,1,3,1,2,2,1,1,1,1,4,2,2,1,1,1,1,1,5,1,1,2,4,2,3,1,2,4,4,4,3,2,4,3,1,2,2,1,1,2,9,4,1,1,1,1,2,1,2,1,4,2,2,4,1,1,1,3,1,3,2,1,1,3,1,1,12,3,5,4,4,4,2,1,1,2,1,2,1,1,2,1,4,1,1,10,1,3,2,1,1,2,3,1,3,1,2,1,5,1,1,3,2,1,1,3,1,1,2,1,1,1,2,3,2,1,2,1,1,2,5,2,1,2,2,1,4,1,5,1,1,2,2,2,3,5,2,3,2,5,5,1,2,1,2,2,2,2,1,1,3,1,6,7,6,8,5,1,1,3],
+      ["problematic",54,1,40,1,58,1],
+      ["probosci",45,2],
+      ["procedure",72,1,1,1,6,2,4,1,26,1,57,1,25,1],
+      ["proceed",105,1,47,1,15,1,7,1,38,1],
+      ["process",5,1,7,2,1,1,3,1,7,10,1,3,4,1,6,1,4,1,2,2,2,1,9,5,2,2,1,1,2,3,4,1,2,3,7,1,2,1,2,10,5,2,1,4,1,4,1,3,1,1,1,3,1,1,2,1,8,1,2,1,8,1,3,2,1,2,7,1,3,1,4,2,6,1,6,2,6,3,3,1,9,1,4,1,8,5,1,1,1,2,2,1,5,1,5,1,3,1,6,1,7,2,6,2,6,1,1,1,11,1,3,1],
+      ["processe",18,1,7,1,11,2,1,3,5,1,14,1,37,2,9,1,12,1,6,1,4,1,16,3,12,2,8,2,6,1,8,3,4,1,16,2,5,1,7,1,18,1,2,1],
+      ["processed",24,1,14,1,40,1,1,1,4,1,34,1,49,1,10,1,5,1],
+      ["processing",18,1,33,1,20,1,7,1,16,1,3,1,17,1,3,2,8,1,1,2,1,1,32,1,1,1,6,1,6,1,8,1,1,2,5,2,18,2,6,2,16,1],
+      ["procession",188,1],
+      ["processor",58,1,123,1],
+      ["proctor",136,1],
+      ["procurement",122,1],
+      ["prodding",163,1],
+      ["prodigy",111,1,93,1],
+      ["produce",1,1,2,1,4,3,6,1,2,1,4,1,3,3,1,1,2,4,8,2,5,3,7,1,6,1,11,2,1,1,7,1,3,2,6,1,7,1,8,1,5,1,1,1,2,1,4,1,1,1,1,2,1,1,1,2,9,4,3,1,11,1,1,2,6,2,3,2,8,1,6,1,1,2,5,1,1,4,1,1,1,1,2,1,26,2,5,1,8,4,10,1,7,1],
+      ["produced",1,1,3,1,1,3,1,2,9,1,1,2,3,3,3,1,1,8,6,4,3,1,4,2,2,1,2,1,4,1,2,2,5,2,10,2,3,3,1,1,7,1,1,1,4,1,2,1,2,5,11,1,4,1,3,1,9,2,9,1,2,1,6,1,3,1,1,4,3,1,2,2,2,2,4,7,3,1,9,1,1,1,2,1,3,1,6,3,3,1,4,1,8,1,11,1,4,1,6,1,1,1,11,1,9,2,3,1],
+      ["producer",3,1,9,1,4,1,2,1,14,1,19,1,22,5,4,2,19,1,21,1,16,1,7,1,35,7],
+      ["producing",12,1,10,1,8,1,2,1,20,1,10,2,1,1,3,1,10,1,26,3,6,1,11,1,1,2,5,1,4,1,10,1,7,1,9,3,43,1,1,3],
+      ["product",5,1,9,1,1,1,1,2,1,1,2,3,3,1,1,7,9,2,15,1,4,1,2,2,8,2,9,2,3,5,7,4,2,18,14,1,1,4,1,1,4,9,7,1,5,6,3,12,4,1,1,5,3,4,4,1,5,4,6,2,7,1,1,1,4,2,3,2,11,5,1,2,5,1,5,1,2,2,3,1,5,1,4,1,3,1,5,9,2,1,7,1,4,2,10,1,2,2,2,8],
+      ["production",7,4,5,3,1,1,6,1,4,1,6,2,3,2,1,2,5,2,12,1,1,1,10,1,12,27,4,12,2,1,1,1,16,2,4,1,2,8,5,2,10,2,2,1,10,1,3,1,1,4,6,1,1,9,16,1,9,3,29,4,5,8,8,1,10,1,1,2,8,2],
+      ["productive",22,1,47,1,53,2,16,1,22,1,12,1,29,1,1,1],
+      ["productivity",22,1,79,1,21,2,11,1,39,3,29,4,19,1],
+      ["professe",175,1],
+      ["profession",11,6,5,1,21,1,69,1,34,1,11,2,12,5,34,1],
+      ["professional",4,2,5,3,2,15,4,2,23,1,3,1,32,1,13,1,5,1,18,1,11,1,2,1,4,1,19,1,15,1,2,1,7,1,6,1,1,1,27,1,16,2],
+      ["professionally",4,1],
+      ["professor",6,3,1,1,4,1,6,1,20,5,2,1,24,2,6,1,3,1,17,2,5,1,1,1,2,2,1,1,2,3,26,1,3,1,4,1,2,2,9,1,1,1,11,1,3,3,10,1,7,1,9,2,4,1,1,1,6,1,1,3,1,1,5,1,2,1,6,1,8,1,3,1,2,1],
+      ["professorship",111,1],
+      ["proficient",52,1],
+      ["profile",22,1,33,1,14,1,92,1,27,1],
+      ["profit",55,2,7,1,21,1,4,1,3,1,76,2,25,1],
+      ["profitability",149,1],
+      ["profitable",79,1,33,1,21,1,23,1,10,1],
+      ["profound",41,1,19,1,95,2,16,1,37,1,1,1],
+      ["profoundly",135,1,80,1],
+      ["profusion",87,1],
+      ["prognosis",3,1],
+      ["program",17,1,1,1,15,1,87,1,18,1,48,4,16,1,4,1],
+      ["programme",3,3,6,3,2,5,2,1,3,1,21,1,58,2,27,5,12,1,3,1,5,1,11,1,9,2,8,1,5,17,1,1,41,1,6,4],
+      ["programmed",14,1,49,1,57,1,20,1],
+      ["programmer",9,1],
+      ["programming",6,1,134,1],
+      ["progress",11,1,26,4,1,1,19,1,8,1,5,1,25,1,2,1,7,1,5,1,4,1,7,1,48,1,1,1,17,1,1,1,21,5],
+      ["progresse",3,1,119,1,78,3],
+      ["progressing",151,1,11,1,43,1],
+      ["progression",112,1,110,1],
+      ["progressively",15,1,25,1,12,1,12,1,60,1,17,1,57,1],
+      ["prohibited",104,1,21,1,6,1],
+      ["prohibiting",31,1],
+      ["prohibitive",53,1],
+      ["prohibitively",16,1],
+      ["project",12,13,10,1,6,1,4,4,2,1,3,1,7,2,6,1,3,1,2,2,7,1,2,1,6,7,10,1,1,1,3,2,11,1,10,1,8,1,5,14,1,3,16,1,7,1,1,1,8,4,2,2,17,2,5,7,2,1,18,3,28,1],
+      ["projected",20,1,113,1],
+      ["projection",64,9],
+      ["prokofiev",171,1],
+      ["proliferate",7,1,41,1],
+      ["proliferated",7,1],
+      ["proliferation",41,1],
+      ["prolong",95,1,124,1],
+      ["prolonged",37,1],
+      ["prominence",148,1,22,1,44,1,12,1],
+      ["prominent",3,1,1,1,23,1,17,1,9,1,15,1,45,1,23,2,69,1,8,1],
+      ["prominently",200,1,14,1],
+      ["promise",13,1,7,2,2,1,24,1,16,4,38,1,57,1,48,1],
+      ["promised",32,1,3,1,78,1,106,1],
+      ["promising",164,1,24,1,5,1,30,1],
+      ["promote",16,1,55,1,3,1,10,1,1,1,7,1,12,1,2,1,14,1,14,1,44,1,8,2,39,1],
+      ["promoted",32,1,19,1,106,1,38,1,11,1,5,1,14,1],
+      ["promoting",179,1,16,1],
+      ["promotion",8,1,114,2],
+      ["promotional",55,1],
+      ["prompt",60,1,26,1],
+      ["prompted",0,1,136,1,52,1],
+      ["prompting",21,1,93,1],
+      ["prone",6,1,16,1,71,1,108,1,24,1],
+      ["pronghorn",10,3],
+      ["pronoun",95,2],
+      ["pronounced",4,1,50,1,28,1,46,1,19,1,60,4],
+      ["pronunciation",54,2,153,18],
+      ["proof",37,2,16,1,19,1,47,1,18,1,7,1,64,1,13,1],
+      ["proofread",201,1],
+      ["prop",219,1],
+      ["propagated",139,1],
+      ["propel",132,1,32,6],
+      ["propelled",52,1,116,1,28,1],
+      ["propensity",2,1,27,1,169,1],
+      ["proper",148,1,15,1,8,1,17,1,25,1],
+      ["properly",1,1,52,1,73,1,8,1,41,2,7,1],
+      ["property",3,1,12,1,4,1,4,1,17,1,1,1,11,1,5,1,5,2,39,1,11,3,4,1,2,3,1,2,3,1,3,1,11,1,4,1,20,1,7,1,34,1,11,1,2,1,8,2,4,1],
+      ["prophecy",6,2],
+      ["prophetic",17,1],
+      ["proponent",75,1,85,1,18,1],
+      ["proportion",20,3,26,1,18,1,6,1,1,1,7,1,26,1,36,1,78,1],
+      ["proportional",3,1],
+      ["proportionally",154,1,62,1],
+      ["proposal",84,1,1,1,12,1,19,1,37,1,61,1],
+      ["propose",48,1,106,3,1,1,1,1,12,1,28,1,14,1,12,1],
+      ["proposed",13,1,4,1,8,1,15,1,35,3,11,1,47,1,12,1,7,1,12,1,4,2,1,1,8,1,10,1,5,1,11,1,7,1],
+      ["proposition",122,4,28,1,2,1,23,1],
+      ["proprietary",97,1],
+      ["proprietor",84,1],
+      ["propulsion",64,1],
+      ["prose",4,1,167,1,17,1],
+      ["prosecution",175,1,39,1],
+      ["prosopagnosia",58,7],
+      ["prosopagnosic",58,8],
+      ["prospect",69,1,55,1],
+      ["prospector",79,1],
+      ["prosper",188,1],
+      ["prosperity",179,1,15,1],
+      ["prosperous",87,2],
+      ["protagonist",41,1],
+      ["protect",13,1,8,3,11,1,3,3,16,2,10,1,4,1,24,1,1,1,9,1,6,1,8,1,9,3,2,1,5,1,2,1,3,3,4,1,5,2,11,1,4,2,11,1,8,1,2,1,16,1,7,1,12,1,7,1,3,1],
+      ["protected",16,1,17,1,11,1,46,2,53,2,12,1,18,1,37,1],
+      ["protecting",35,1,52,1,55,1,53,1,19,1,12,1],
+      ["protection",21,1,12,1,20,1,36,1,10,1,8,1,3,1,15,1,10,1,5,1,3,1,48,1,23,2,10,2],
+      ["protectionist",140,1],
+      ["protective",35,1,96,1,12,1,14,1,57,2],
+      ["protein",59,1,9,1,24,2,10,1,17,4,80,1,2,1,25,1],
+      ["protest",44,1,150,1],
+      ["protestant",194,1],
+      ["proto",144,1,64,5],
+      ["prototype",80,2,40,1],
+      ["protracted",210,1],
+      ["proud",66,1,21,1,23,1,105,1],
+      ["prouder",216,1],
+      ["proudly",23,1,74,1],
+      ["prove",32,1,5,1,41,1,22,1,4,1,2,4,14,1,33,1,1,2,11,3,3,1,15,1,2,1,5,1,2,1],
+      ["proved",13,1,5,4,19,2,8,1,1,1,1,1,11,1,7,1,2,1,15,1,10,1,1,1,7,4,3,1,8,1,1,1,1,2,12,1,27,1,19,1,6,1,2,1,1,1,10,1,3,1,22,1,3,1,4,1],
+      ["proven",24,1,44,1,60,1,7,3,35,1,21,1,7,1],
+      ["proverb",127,1],
+      ["provide",3,2,8,1,3,2,10,2,2,1,6,1,9,1,2,1,6,1,4,2,2,3,3,1,2,1,9,1,1,1,10,2,2,1,4,2,20,1,2,1,9,1,3,2,1,1,6,2,1,1,1,1,3,1,3,1,3,1,4,6,5,1,8,1,2,1,2,1,3,1,2,2,2,2,7,2,3,1,3,1,6,2,4,1,2,4,3,1,2,1,5,2,1,1,3,1,1,2,2,1,2,2,4,2,2,1,5,1,1,1,2,2,1,1,1,2],
+      ["provided",0,1,1,2,14,1,6,1,4,1,2,1,17,1,3,2,20,1,1,1,16,3,9,1,6,1,2,2,9,1,8,1,10,1,6,3,2,1,3,1,14,1,7,1,8,1,2,1,4,1,18,1,8,2],
+      ["provider",85,1,81,1,35,1],
+      ["providing",13,1,42,2,26,1,18,1,12,1,6,1,11,1,13,1,22,1,16,1,7,2,1,1,4,1,20,2,11,2,4,1],
+      ["province",143,1,58,1],
+      ["provincial",4,1],
+      ["provine",3,7],
+      ["proving",22,1,12,1,19,1,41,1,62,1,9,1,36,1],
+      ["provision",86,1,5,1,71,1,11,1],
+      ["provisionally",145,1,58,1],
+      ["provoke",16,1,88,1,42,1,3,1],
+      ["provoking",139,1],
+      ["proximity",85,1,136,1],
+      ["prudence",136,1],
+      ["prussia",99,1],
+      ["pseudonym",4,1,141,2,58,2],
+      ["psyche",187,1],
+      ["psychiatric",175,1],
+      ["psychiatrist",37,2,2,1,42,1,94,1,6,1,16,1],
+      ["psychoanalyst",93,1,64,1],
+      ["psychological",8,1,9,1,3,1,17,1,69,1,14,1,35,1,19,1,21,1,14,1,11,1],
+      ["psychologically",120,1],
+      ["psychologist",6,1,12,4,2,1,17,1,2,1,21,3,3,1,18,3,2,1,2,2,7,2,6,1,2,2,6,1,8,1,36,1,2,4,3,4,5,2,15,1,6,4,8,3,11,1,4,1,4,1,12,1,5,1],
+      ["psychology",2,1,4,2,14,2,40,1,39,1,1,1,6,3,8,1,6,1,6,1,22,1,2,18,2,3,3,1,5,2,11,1,26,1,28,1],
+      ["ptfe",19,1],
+      ["public",0,1,13,1,2,4,5,1,8,2,6,4,1,1,4,1,2,1,1,1,2,1,11,4,29,1,3,2,35,1,9,1,4,1,1,3,11,1,1,1,1,1,2,3,1,1,1,1,4,2,4,2,9,7,1,1,1,3,3,1,2,1,1,3,4,2,6,2,5,1,20,3,6,1],
+      ["publication",4,3,19,1,144,1,8,1,4,1,3,1,30,1],
+      ["publicise",188,1],
+      ["publicity",12,1,16,1,96,1,51,1],
+      ["publish",24,1,56,1,48,1,35,1,25,1],
+      ["published",4,7,1,1,11,1,2,2,5,1,1,1,15,1,62,1,4,3,4,1,16,1,3,1,17,2,3,1,1,2,1,1,7,1,10,1,1,2,11,1,8,3,3,2,6,2,7,2,5,2,4,1,8,1],
+      ["publisher",105,1,52,1,44,1],
+      ["publishing",4,1,5,4,23,1,151,1,7,1],
+      ["puddle",21,1],
+      ["pueblo",147,1],
+      ["puerto",193,1],
+      ["puffed",216,1],
+      ["puffer",52,1],
+      ["pukus",10,1],
+      ["pulitzer",188,1],
+      ["pull",89,1,3,1,24,1,5,1,6,1,5,2,21,1,11,1],
+      ["pulled",5,1,108,1,19,2],
+      ["pulling",198,1],
+      ["pulp",107,2,10,3,56,1],
+      ["pulped",29,1],
+      ["pulverised",124,1],
+      ["pump",18,1,41,3,13,1,41,4,45,1,58,1],
+      ["pumped",19,1,40,1,12,1,7,1,86,1,52,1],
+      ["pun",86,1],
+      ["punch",35,1],
+      ["punchy",18,1],
+      ["punctiliousness",149,1],
+      ["punctuated",162,1],
+      ["punctured",90,1],
+      ["punish",109,1],
+      ["punishable",51,1,166,1],
+      ["punishing",182,1],
+      ["punishment",157,1],
+      ["punitive",88,1],
+      ["punt",123,7],
+      ["pupil",36,5,13,1,9,1,95,3,10,10,23,4],
+      ["puppet",211,1],
+      ["purchase",30,1,11,1,35,2,6,1,40,1,30,2,49,2],
+      ["purchased",122,1,14,1],
+      ["purchasing",140,1],
+      ["purdue",101,1],
+      ["pure",51,1,4,1,54,1,7,1,23,4,78,1,1,1],
+      ["purely",15,5,46,1],
+      ["purer",79,2],
+      ["purification",31,1,89,1,106,1],
+      ["purify",120,1,106,1],
+      ["purity",0,2,218,1],
+      ["purple",38,2,61,1,73,1],
+      ["purpose",1,1,5,1,5,1,10,3,2,1,8,1,16,1,4,1,2,1,1,1,4,1,2,4,4,1,1,1,3,1,5,1,1,1,5,3,5,1,2,1,18,1,3,2,10,1,2,1,12,1,1,2,14,6,18,1,8,2,1,1,38,1,7,1,2,2],
+      ["purposefully",166,1],
+      ["pursed",174,1],
+      ["pursue",74,1,15,1,22,1,11,1,32,1],
+      ["pursued",125,1,55,1],
+      ["pursuing",156,1,6,1,47,1],
+      ["pursuit",125,2,9,1],
+      ["purve",167,2,45,3],
+      ["push",92,1,15,1,35,1,14,1],
+      ["pushe",73,1,92,1],
+      ["pushed",45,1,14,1,12,1,4,1,3,1,35,2,43,2,5,1,27,1],
+      ["pushing",16,1,31,1,2,1,102,1,17,1,30,1],
+      ["put",7,1,4,1,4,3,1,1,11,1,2,1,4,1,9,1,9,1,5,1,5,1,1,1,5,1,8,4,2,1,3,1,1,1,3,1,8,2,4,1,6,1,1,1,1,1,16,1,3,2,5,3,1,1,4,1,10,1,5,1,8,1,4,2,1,2,1,1,1,1,3,2,1,2,16,1,1,1,1,1,6,1,8,1,1,1,8,1,4,2,6,1,4,1,1,1],
+      ["putorius",223,1],
+      ["putra",195,1],
+      ["putting",67,1,33,1,9,1,9,1,15,1,18,2,3,2,6,1,3,1,2,1],
+      ["puzzle",101,1,8,2,81,2,10,1,22,1],
+      ["puzzled",144,1],
+      ["puzzling",121,1,29,1,11,1,22,1],
+      ["pvc",19,2],
+      ["pvci",19,1],
+      ["pyjama",177,1],
+      ["pyramid",31,37,19,8,97,1],
+      ["pyrethrin",224,1],
+      ["pyrethrum",224,1],
+      ["pythagora",167,2,45,3],
+      ["q1",0,1,49,2,13,1,13,2,41,1,21,3,7,2,63,3,13,3,6,1],
+      ["q10",13,2,2,4,5,2,3,6,2,3,12,1,10,2,34,3,10,5,15,3,23,3,11,3,2,3,12,1,10,4,11,4,4,2,11,1,31,1,1,4],
+      ["q11",5,2,4,2,4,2,2,4,5,2,1,2,2,6,1,2,1,3,12,2,2,1,8,2,9,2,7,2,1,1,20,2,5,2,3,1,14,3,12,2,10,2,1,3,2,2,3,2,1,2,5,3,2,3,12,1,10,4,15,2,11,1,1,1],
+      ["q12",5,2,4,2,4,1,2,4,5,1,1,2,2,6,1,2,1,3,9,2,3,2,2,1,8,1,9,2,7,2,1,1,20,2,5,2,3,1,14,3,12,2,1,1,9,2,1,3,2,2,3,2,1,2,7,3,13,2,9,4,1,2,14,1,12,1],
+      ["q13",5,2,2,3,2,2,4,1,2,4,5,1,1,2,2,6,1,2,1,3,9,2,3,2,10,1,9,2,7,2,21,2,5,2,17,3,12,2,1,1,9,2,1,3,2,2,3,2,1,2,7,3,13,2,9,4,1,2,14,1],
+      ["q14",7,3,2,1,4,1,21,2,5,1,8,1,9,1,17,1,11,1,1,1,16,1,17,1,3,1,6,1,1,1,7,1,7,1,13,2,9,4,1,2],
+      ["q15",7,3,2,1,4,1,26,1,8,1,9,1,17,1,11,1,1,1,16,1,17,1,3,1,6,1,1,1,7,1,7,1],
+      ["q16",7,3,2,1,4,1,26,1,8,1,9,1,17,1,11,1,1,1,16,1,17,1,3,1,6,1,1,1,7,1,7,1],
+      ["q17",9,1,4,1,26,1,8,1,9,1,17,1,11,1,1,1,16,1,17,1,3,1,6,1,1,1,7,1,7,1],
+      ["q18",9,1,4,1,26,1,8,1,9,1,17,1,11,1,1,1,16,1,17,1,3,1,6,1,1,1,7,1,7,1],
+      ["q19",9,1,4,1,43,1,17,1,11,1,1,1,16,1,17,1,3,1,6,1,1,1,7,1],
+      ["q2",0,1,19,1,30,2,13,1,13,2,41,1,14,1,7,3,7,2,63,3,13,3,6,1],
+      ["q20",9,1,64,1,28,1,17,1,3,1,6,1,1,1],
+      ["q27",21,1,74,1,66,1,4,1,8,1],
+      ["q28",21,1,74,1,66,1,4,1,8,1],
+      ["q29",21,1,74,1,66,1,4,1,8,1],
+      ["q3",0,1,19,1,30,2,13,1,13,2,41,1,14,1,7,3,7,2,63,3,13,3],
+      ["q30",21,1,74,1,66,1,4,1,8,1],
+      ["q31",21,1,74,1,66,1,4,1,8,1],
+      ["q32",95,1,66,1,4,1,8,1],
+      ["q33",95,1,70,1,8,1],
+      ["q4",0,1,62,1,13,1,11,3,30,1,14,1,7,3,7,1,40,1,23,3,13,3],
+      ["q5",0,1,16,3,2,3,24,1,33,1,11,3,5,5,11,4,14,1,14,1,2,1,11,3,1,1,10,2,30,1,15,4],
+      ["q6",0,1,14,1,2,3,2,3,24,1,33,1,11,3,5,5,9,3,2,4,14,1,16,1,11,3,3,3,8,2,21,4,9,2,15,4,23,4],
+      ["q7",0,1,14,1,2,3,2,3,5,6,2,2,17,2,33,1,6,3,5,3,5,5,9,3,2,4,14,1,27,3,3,3,8,2,21,4,9,2,15,4,1,2,21,1,1,4],
+      ["q8",0,1,16,3,2,3,5,6,2,2,17,2,39,6,10,5,9,3,2,4,20,1,18,3,3,3,2,1,1,3,8,1,21,4,9,2,15,4,1,2,21,1,1,4],
+      ["q9",13,2,2,4,5,2,3,6,2,2,12,1,5,2,5,2,34,3,10,5,9,3,2,4,20,1,18,3,5,1,1,3,8,1,21,4,4,2,20,4,1,2,21,1,1,4],
+      ["qnano",80,10],
+      ["qrio",198,8],
+      ["qualification",49,1,96,1,3,1,55,1],
+      ["qualified",16,1,147,1,7,1,43,1],
+      ["qualify",14,1,149,1],
+      ["quality",6,2,5,2,4,1,5,1,3,3,3,3,2,1,5,2,1,1,4,1,9,1,2,1,24,2,3,1,1,1,4,1,7,1,10,1,10,3,5,1,5,2,1,1,1,1,20,1,9,1,3,3,1,1,4,1,6,2,3,1,1,1,4,1,20,1,3,1,4,1,2,1,1,1,7,1,3,1,1,1,5,1,1,2,6,1,2,1],
+      ["quantified",181,1],
+      ["quantitative",189,1],
+      ["quantity",1,1,28,1,3,2,10,1,7,1,13,1,11,4,5,1,24,5,15,2,8,1,9,1,65,5,2,1,23,2,2,1],
+      ["quarried",44,1],
+      ["quarry",47,1,3,1,2,1,158,1],
+      ["quarrying",79,1],
+      ["quarter",14,1,3,1,33,1,40,1,40,1,12,1,21,2,1,1,1,1,29,1],
+      ["quarterback",6,1],
+      ["quashed",45,1],
+      ["quebec",25,1],
+      ["queen",0,1,4,5,30,1,12,1,10,3,52,1,1,1,7,2,31,1],
+      ["queensland",33,4,15,1,41,6,49,3,59,1,5,3],
+      ["quest",5,1,17,1,14,1,93,1,18,1,35,1,6,1],
+      ["question",6,3,5,1,1,2,2,1,1,5,1,1,1,1,7,2,1,2,1,7,7,1,1,2,2,2,1,1,3,2,3,3,11,1,3,1,3,1,3,1,12,4,3,1,2,1,6,1,7,1,2,1,3,5,2,1,2,2,4,1,7,1,2,2,3,1,3,1,1,7,1,2,4,1,1,2,5,6,12,3,1,1,3,1,3,2,2,1,1,8,2,1,6,2,1,1,1,1,2,2,4,1,1,1,3,2,2,1,3,2,1,1,1,2,5,2,2,1,1,1,2,1,5,1,2,2,4,3,1,1,1,1,1,3,2,1,2,2,1,1,1,2,1,3,8,1,2,1,3,2],
+      ["questionable",145,1,58,1],
+      ["questioned",116,1,54,1,8,2,43,1],
+      ["questioning",41,2,3,1,65,1,5,1],
+      ["questionnaire",18,1],
+      ["quick",90,1,14,1,58,1,2,1,15,1,1,1,9,2,11,1,14,1],
+      ["quicker",98,1],
+      ["quickly",1,2,8,1,3,1,10,1,3,1,2,1,8,2,2,1,8,1,1,2,1,1,9,6,3,1,3,1,1,1,12,2,2,1,2,1,22,3,6,1,6,1,2,1,3,1,12,2,4,3,4,1,1,1,13,1,6,1,2,1,5,1,1,2,10,1,5,1,5,2,3,1,1,1,4,1,4,1,2,1,1,2,1,1,12,1,2,2,1,2,4,1,4,1],
+      ["quickness",59,1],
+      ["quiet",57,1,24,2,10,1,81,1],
+      ["quieter",20,1],
+      ["quinine",137,6],
+      ["quinn",91,3,68,3],
+      ["quirky",3,1],
+      ["quite",2,1,3,1,9,1,4,4,3,2,5,1,3,1,2,2,6,1,2,4,2,1,2,1,26,1,7,1,1,1,7,1,2,1,7,2,7,1,6,1,5,1,7,2,7,1,2,1,18,1,13,1,10,2,4,1,3,1,3,1,2,1,2,1,3,1,1,1,6,1,4,1,5,1,2,1,5,1,1,1,6,3,4,1,5,1,1,1],
+      ["quo",209,1],
+      ["quota",140,1],
+      ["quotation",149,1],
+      ["quote",146,1],
+      ["quoted",148,2],
+      ["quotient",106,1],
+      ["quoting",37,1],
+      ["rabbit",105,4,30,1,3,7,55,1,9,7],
+      ["race",57,1,9,8,22,2,10,1,66,1,4,1,9,1,5,1,10,1],
+      ["raced",66,1,22,1,72,1,36,1],
+      ["racing",66,1],
+      ["rack",170,1],
+      ["racking",188,1],
+      ["radar",69,1,52,1,29,1],
+      ["radiata",117,1],
+      ["radiate",172,1],
+      ["radiating",97,1],
+      ["radiation",69,1,21,1,50,1,24,3,13,3,18,1,6,3],
+      ["radical",33,1,119,1,19,1,1,1,22,1],
+      ["radically",5,3,41,2],
+      ["radio",9,5,9,1,96,1,42,1,16,1,5,1,29,1],
+      ["radiocarbon",40,2,10,1,142,2,18,1],
+      ["radiography",30,1],
+      ["radiology",30,1],
+      ["radiometric",69,2],
+      ["radius",44,1],
+      ["rag",29,7,78,5],
+      ["rage",175,1],
+      ["rail",84,1,6,1,6,1,22,1],
+      ["railing",214,1],
+      ["railroad",90,1],
+      ["railway",23,1,22,1,39,12,3,1,9,3,13,1,4,2,19,2,33,1],
+      ["rain",35,5,89,1,11,1,8,1,3,1,34,3,29,1],
+      ["raincoat",23,1],
+      ["raindrop",59,2],
+      ["rainfall",35,1,89,1,11,1,45,5],
+      ["rainforest",33,1,17,1,15,1,114,1],
+      ["rainwater",35,1],
+      ["rainy",119,1],
+      ["raise",32,2,2,1,59,1,26,1,3,1,11,1,22,3,8,2,1,3,52,1],
+      ["raised",17,1,11,3,27,2,29,1,14,1,25,1,40,2,14,2,18,1,11,1,4,1,15,1,1,1],
+      ["raising",28,4,4,1,68,1,5,1,1,1,4,1,12,1,2,2,19,1,11,1,10,1,20,1,1,1],
+      ["rajasthan",98,1],
+      ["rake",127,1],
+      ["ralph",165,1],
+      ["ramification",34,1],
+      ["ramp",123,1,38,1],
+      ["rampaging",177,1],
+      ["rampant",137,1],
+      ["ramping",161,1],
+      ["ran",5,1,7,1,37,1,48,1,21,1,31,1,28,1,19,1],
+      ["ranch",90,1,48,1,5,2,59,1,21,1],
+      ["ranche",90,1],
+      ["rancher",223,2],
+      ["ranching",143,1,80,1],
+      ["randolph",144,1],
+      ["random",17,1,1,1,18,1,56,1,75,1,23,2,17,3,5,1],
+      ["randomisation",153,1],
+      ["randomly",92,1,36,1,25,2,12,1,9,1],
+      ["rang",126,1],
+      ["range",3,1,7,1,2,1,2,1,2,2,3,2,7,1,2,1,10,1,10,1,1,1,3,1,9,1,4,1,3,1,5,1,2,3,2,1,1,1,2,2,2,1,2,3,2,1,4,1,4,1,1,1,2,1,5,1,7,1,1,2,5,1,3,1,10,2,12,3,1,3,2,2,4,1,4,1,3,1,7,1,1,1,6,1,6,1,10,1,7,1,3,1,1,1,1,1,2,2,1,1,6,1,1,1,8,1,7,1,2,2,1,1,2,1],
+      ["ranging",64,1,20,1,90,1,6,1,25,1,14,1],
+      ["rank",147,1,60,1],
+      ["ranking",47,1,100,2],
+      ["rapid",3,1,14,1,23,1,12,1,9,1,22,1,11,2,10,1,37,1,2,4,19,1,8,1,5,1,10,1,35,1],
+      ["rapideye",201,2],
+      ["rapidity",52,1,134,1],
+      ["rapidly",0,1,2,1,2,1,11,1,4,1,6,1,1,1,22,1,4,1,7,1,18,1,10,1,1,1,2,1,5,1,12,1,5,1,5,2,4,1,12,1,2,3,27,1,19,1,9,1,6,1,18,1],
+      ["rapture",167,1,45,1],
+      ["rapunzel",157,1],
+      ["rare",10,1,15,2,3,1,4,3,11,2,50,2,2,2,13,1,11,1,6,1,16,1,46,2,10,1,25,1],
+      ["rarely",3,1,4,1,59,1,37,1,2,1,26,1,6,1,10,1,6,1,10,1,1,1,52,1,6,1],
+      ["rarer",94,1],
+      ["rarest",108,1,79,1,36,1],
+      ["rarity",32,1],
+      ["rasmussen",16,5],
+      ["rat",92,17,8,1,3,2,7,7,25,3,19,2,4,1,29,12,29,1,4,1],
+      ["rate",1,1,4,1,35,1,5,1,3,1,1,2,3,2,8,1,3,1,6,1,1,1,19,1,1,2,5,2,5,1,9,1,8,1,1,1,2,2,2,1,6,1,10,2,5,4,10,3,8,3,1,1,2,2,8,1,6,1,2,1,4,1,1,2,5,1,1,1,11,2],
+      ["rated",71,1,14,1,73,1,26,1],
+      ["ratey",181,1],
+      ["rather",1,1,4,1,1,1,1,1,1,1,1,3,2,1,2,1,2,6,3,1,3,1,1,1,4,1,3,1,1,1,4,2,7,3,1,1,4,1,2,1,1,2,4,4,2,2,1,1,1,1,3,2,2,1,1,1,2,1,2,1,3,1,1,2,1,1,3,2,3,2,2,1,1,1,4,1,2,1,1,1,3,1,6,1,3,1,2,1,2,2,2,1,3,1,4,1,3,2,4,1,1,1,3,1,10,1,6,1,1,1,3,3,8,4,4,2,3,1,2,1,2,1,1,1,1,1,1,1,4,1,1,1,1,1,6,2,3,2,1,1,2,1,3,1,3,2,5,1,4,1,6,2,3,2,1,1,4,1,2,2,4,1,5,1,2,1],
+      ["rating",2,1,156,1,26,1],
+      ["ratio",61,1,28,1,64,3,14,2,45,2],
+      ["ration",99,1],
+      ["rational",8,1,63,1,7,1,15,1,57,1,6,1,6,1,38,1,9,1],
+      ["rationality",3,1,5,1,101,2,41,1,28,2],
+      ["rattle",211,1],
+      ["rattler",184,2],
+      ["ravaged",201,1],
+      ["ravine",91,1],
+      ["raw",24,1,37,3,56,1,5,1,35,1,10,1,27,4,18,1,5,1,9,1],
+      ["rawhide",46,1],
+      ["rawlinson",67,4],
+      ["ray",30,2,78,2,83,1,4,1,31,1],
+      ["raymond",41,1,68,1,5,10],
+      ["rayner",114,2],
+      ["re",5,1,2,1,16,1,7,1,7,1,7,1,1,1,14,2,4,1,9,1,10,1,3,1,6,2,1,2,10,1,8,1,4,3,1,1,4,2,15,1,1,2,7,1,1,1,5,1,2,1,2,1,2,1,13,1,2,2,3,1,1,1,8,1,1,1,3,1,1,1,6,1,5,3,2,1,1,1,5,1,5,1,2,1,4,1,3,1,1,2],
+      ["reach",6,1,3,1,15,3,1,1,31,1,6,2,17,1,13,1,16,2,2,1,11,1,2,1,4,1,3,1,9,1,3,1,15,1,1,1,6,1,7,1,2,1,1,1,13,1,29,1],
+      ["reache",50,1,2,1,78,1,6,1],
+      ["reached",1,1,32,1,3,1,4,2,16,1,12,1,9,2,32,1,23,1,31,1,24,1,5,3,2,1],
+      ["reaching",0,1,37,2,47,1,26,1,28,1,51,1,13,1],
+      ["react",19,1,1,1,39,1,36,1,19,1,7,1,25,1,52,1,23,1],
+      ["reacted",78,1,51,1,71,1],
+      ["reacting",13,1,46,1,157,1],
+      ["reaction",12,1,25,1,24,1,22,1,2,1,19,1,2,4,18,1,5,2,13,1,4,3,3,1,9,1,2,1,2,1,9,1,3,1,4,1,1,1,4,1,6,1,15,1,11,1,1,1,3,2],
+      ["reactivate",223,1],
+      ["read",9,5,3,1,3,3,24,1,14,2,14,1,7,1,8,1,4,1,11,1,8,1,6,1,15,1,20,1,11,2,22,1,3,3,7,2,17,8],
+      ["readable",97,1,15,1],
+      ["reader",4,1,63,1,21,1,23,2,39,1,7,1,14,1,11,4,6,2,18,8],
+      ["readily",6,1,15,1,29,1,4,1,8,1,24,1,42,1,38,1,23,1,5,1,12,1,2,1,6,1,1,1],
+      ["readiness",185,1],
+      ["reading",9,3,3,1,37,2,4,2,21,2,7,1,20,1,5,1,3,1,5,1,5,1,7,5,2,1,25,1,4,2,24,1,1,1,6,1,4,1,4,1,1,1,4,2,5,10,2,1,11,1],
+      ["ready",86,1,12,1,8,1,59,1,36,1],
+      ["real",1,1,22,3,3,1,4,2,12,1,11,1,2,2,1,1,1,1,1,1,2,1,1,1,22,1,8,2,7,1,4,1,6,1,1,2,3,1,1,1,2,1,11,1,4,1,5,1,8,1,2,1,3,1,7,1,5,2,3,2,4,1,4,1,1,1,10,1,2,1,5,5,1,1,7,2,2,1,1,1,3,1,2,1,7,1,3,1,1,1,1,1,7,1],
+      ["realisation",13,1,74,1],
+      ["realise",7,1,6,1,15,1,7,1,9,1,14,1,8,1,5,1,2,1,18,1,23,1,46,1,1,1,6,2,20,1,14,1,11,2,11,1],
+      ["realised",5,1,6,1,17,1,45,1,7,1,8,1,17,1,8,1,1,1,1,1,64,1,1,1,7,1,5,2,25,2,1,1],
+      ["realising",71,1,10,1],
+      ["realism",171,1],
+      ["realist",182,1],
+      ["realistic",29,3,1,3,10,1,62,1,7,1,53,2,37,1],
+      ["realistically",25,1,5,1],
+      ["reality",8,1,1,5,77,1,11,1,1,1,28,1,7,1,20,1,11,1,7,2,19,1,23,1,2,1],
+      ["realize",99,1,32,1,75,1,9,1,5,1,2,1],
+      ["realized",222,5],
+      ["realizing",222,1],
+      ["really",2,1,7,1,8,1,5,1,2,1,2,1,4,1,12,1,7,1,6,1,4,1,1,1,6,1,3,1,3,2,6,1,3,1,1,1,9,2,2,1,9,1,13,1,6,1,5,2,5,2,3,1,11,1,9,1,6,1,1,2,4,1,3,1,7,1,4,1,2,1,17,1,1,1,4,1,2,2,2,1,6,1,2,2,1,1,3,1,1,3],
+      ["realm",0,1,152,1,2,1,67,1],
+      ["reanalysis",210,1],
+      ["reap",178,1],
+      ["reappear",165,1],
+      ["rear",155,1],
+      ["rearing",14,1],
+      ["rearrange",119,1],
+      ["rearranging",142,1],
+      ["reason",2,1,1,1,12,5,1,1,1,1,4,1,1,1,3,4,18,1,2,1,9,1,8,1,3,2,13,1,4,1,3,1,6,6,3,1,1,1,5,1,1,1,1,2,10,3,2,2,1,1,3,1,1,1,5,1,2,1,5,1,8,1,11,1,2,1,1,1,5,1,2,1,6,1,1,1,8,1,8,1,6,2,10,2,6,2,1,1,1,1,1,4,1,1,3,1,1,1,1,3,1,5,1,1,4,3,2,2],
+      ["reasonable",142,1,37,3],
+      ["reasonably",6,1,75,1,98,1],
+      ["reasoned",59,2],
+      ["reasoning",13,1,103,1,44,1],
+      ["reassess",20,1,151,1],
+      ["reassesse",78,1],
+      ["reassurance",60,1,12,1],
+      ["reassuring",72,3],
+      ["rebellious",225,1],
+      ["reborn",143,1,45,1],
+      ["rebranding",170,5],
+      ["rebuffed",215,1],
+      ["rebuilt",118,1],
+      ["rebuked",193,1],
+      ["rebuttal",2,1],
+      ["recalcitrant",127,1],
+      ["recall",18,1,18,1,22,1,39,1,4,1,17,2,54,1,7,1,21,1,11,1,10,1],
+      ["recalled",12,1,102,1,5,1],
+      ["recapture",82,1,48,1],
+      ["recaptured",130,1],
+      ["recast",157,1],
+      ["receded",39,1],
+      ["receipt",67,1,50,1],
+      ["receive",7,1,10,1,16,1,35,1,2,1,25,1,13,1,2,1,21,1,10,1,13,2,1,1,4,1,4,2,28,1],
+      ["received",0,1,2,1,2,1,26,1,2,1,22,1,3,1,13,1,18,1,11,1,6,1,15,1,28,1,4,1,1,1,2,1,17,1,4,2,3,1,42,1],
+      ["receiver",180,2,1,1],
+      ["receiving",55,1,99,2,1,2],
+      ["recent",1,1,4,1,4,3,2,1,4,2,3,1,2,1,8,1,9,1,4,1,2,2,5,1,2,1,3,1,1,1,7,1,4,1,3,2,2,1,1,2,1,2,2,1,1,1,1,2,2,1,9,1,4,1,2,1,11,1,2,1,4,1,1,1,4,2,2,1,3,1,9,1,4,1,1,1,5,1,16,1,4,2,2,2,1,1,1,1,4,1,2,1,8,2,1,1,2,1,1,1,4,1,2,1,2,1,2,1,1,1,6,1,3,1,3,1,6,1,1,1,1,1,2,1,2,3,7,1,1,1,2,2],
+      ["recently",1,1,2,1,12,1,1,1,1,1,1,1,4,1,13,2,5,2,5,1,13,2,6,1,6,2,1,1,23,1,17,1,11,1,5,3,10,1,8,1,17,1,5,1,4,1,4,1,1,1,4,1,2,2,3,2,2,2,1,1,5,1,7,1,3,1,1,1,7,1,1,1,4,1,4,1],
+      ["receptacle",23,1],
+      ["reception",157,1,12,1],
+      ["receptive",186,1],
+      ["receptor",71,4,7,4,33,1,48,2],
+      ["recharge",35,1],
+      ["recipe",29,1,26,1,17,2,10,1,17,1,30,1],
+      ["recipient",86,1],
+      ["reciprocally",159,1],
+      ["reciprocity",47,1],
+      ["recited",182,1],
+      ["reckon",201,1],
+      ["recluse",211,1],
+      ["recognisable",25,1,130,1],
+      ["recognise",11,2,5,1,12,1,9,1,3,1,1,1,17,10,20,1,13,1,22,1,9,1,14,1,9,1,14,2,3,1,4,3,1,2,20,1,16,1,9,2,9,1,4,1],
+      ["recognised",1,1,10,1,4,1,1,5,21,1,3,1,24,1,29,1,12,1,10,1,2,1,28,1,7,1,8,1,58,1],
+      ["recognising",14,1,27,1,17,5,87,1,14,1,26,1,18,1],
+      ["recognition",11,1,47,3,10,1,6,1,24,2,19,2,28,3,22,1,3,1,33,1,1,1,8,1,8,1],
+      ["recognize",2,1,30,1,40,1,2,1,24,1,10,1,96,2],
+      ["recognized",30,1,2,1,6,1,27,1,27,1,2,2,129,1],
+      ["recognizing",58,2,151,1],
+      ["recollect",58,1],
+      ["recolonized",138,1,64,1],
+      ["recombine",81,1],
+      ["recommenced",4,1],
+      ["recommend",48,1,52,1,100,1],
+      ["recommendation",24,1,75,1,21,1],
+      ["recommended",43,1,10,1,19,1,22,1,5,1,93,1,9,2],
+      ["reconcile",84,1,126,1],
+      ["reconciling",64,1],
+      ["reconsider",105,1,22,1],
+      ["reconstituting",218,1],
+      ["reconstruct",69,1,18,1,8,1,3,1],
+      ["reconstructed",151,1,18,1],
+      ["reconstruction",123,1],
+      ["record",3,1,15,5,3,1,1,2,3,3,5,1,3,1,6,1,2,1,2,1,2,2,6,1,4,1,6,1,6,1,3,1,5,1,2,1,4,1,4,1,2,1,3,1,5,1,2,1,17,1,17,1,22,1,3,1,10,1,2,1,1,1,22,1,2,1,3,1,15,1,9,1,2,2,1,1],
+      ["recorded",6,1,12,1,5,1,5,1,2,1,7,1,6,2,20,1,40,1,5,2,22,1,18,2,6,1,26,1,7,1,5,2,8,1,15,1],
+      ["recording",18,6,7,1,12,1,58,1,19,1,34,1,6,1,6,1,5,1,4,1,53,1],
+      ["recounting",149,1],
+      ["recover",83,1,18,1,23,1,1,1,60,1],
+      ["recovered",90,1,104,1,16,1],
+      ["recovering",55,1],
+      ["recovery",3,1,80,1,51,1,51,2,2,1],
+      ["recreate",1,1,108,1,64,1],
+      ["recreated",30,1],
+      ["recreating",30,1],
+      ["recreation",26,2],
+      ["recreational",26,2,13,1,172,1],
+      ["recruit",6,1,12,1,10,1],
+      ["recruited",28,1,125,1,53,1],
+      ["recruiting",56,1,66,1],
+      ["recruitment",6,1,89,1],
+      ["rectangle",104,1,19,1],
+      ["rectangular",67,1,102,1],
+      ["recuperate",185,1],
+      ["recurrence",124,1],
+      ["recurring",214,2],
+      ["recursion",183,3],
+      ["recursive",183,1],
+      ["recyclable",134,1],
+      ["recycle",19,1],
+      ["recycled",25,1,82,1,88,1],
+      ["recycling",23,7,111,7,39,1],
+      ["red",38,1,9,2,21,36,4,1,19,1,20,1,12,2,13,2,2,1,3,1,16,3,24,1,14,1,6,2,1,1],
+      ["redating",169,1],
+      ["reddish",38,1],
+      ["redefine",9,1,111,1,53,1],
+      ["redesign",151,1],
+      ["redesigned",151,1,19,1],
+      ["redevelop",34,1],
+      ["redeveloped",170,1],
+      ["redevelopment",84,1,85,1,1,1],
+      ["redfield",81,1],
+      ["rediscovered",31,1,164,1],
+      ["redistribute",147,1],
+      ["redistribution",147,1],
+      ["reduce",15,1,22,1,15,3,4,1,9,1,9,1,9,3,14,1,25,2,4,1,7,1,1,1,8,4,11,1,2,1,3,1,2,1,12,2,12,1,6,1,1,1,4,1,5,3,5,1,1,1,1,1,7,2,10,2,2,2],
+      ["reduced",10,1,17,1,62,1,7,1,25,1,8,4,4,1,5,1,15,2,21,1,4,1,3,1,19,1,2,1,5,4,9,1,7,1],
+      ["reducing",48,1,85,1,1,1,19,2,5,1,20,1],
+      ["reduction",18,4,55,1,19,2,10,2,42,2,9,5,25,2,7,1,14,2,17,1],
+      ["redundant",78,1,1,1,141,1],
+      ["reed",50,3,57,1,60,1,45,1],
+      ["reef",33,3,19,1,16,6,21,1],
+      ["reengineered",35,1],
+      ["refer",2,1,22,1,5,3,13,1,16,1,9,1,5,2,17,1,35,1,1,1,27,1,32,1,7,1,13,1,4,1],
+      ["referee",131,1],
+      ["reference",12,1,27,3,10,1,72,1,27,1,3,1,18,1],
+      ["referred",25,1,19,1,17,1,6,1,29,1,7,1,33,1,16,1,55,4,6,1,5,1],
+      ["referring",5,1,77,1,60,1,18,1],
+      ["refine",51,1,6,1],
+      ["refined",65,1,42,1,18,1,60,1],
+      ["refinement",87,1],
+      ["refining",157,1],
+      ["reflect",1,1,26,1,3,1,4,1,21,1,5,1,8,1,18,1,29,1,3,1,9,1,37,1,2,1,4,1,2,1,2,1,6,1,15,1,2,1,8,1],
+      ["reflected",18,4,12,2,11,3,57,2,17,1,13,1,8,1,21,1,23,1,3,1,18,2],
+      ["reflecting",0,1,34,1,52,1,136,1],
+      ["reflection",98,2,20,1,54,2,36,1],
+      ["reflective",98,2],
+      ["reflex",3,1,86,1],
+      ["reflooding",35,1],
+      ["refocuse",11,1],
+      ["reform",99,1,54,1,7,1],
+      ["reformer",160,1],
+      ["reframing",170,1],
+      ["refresher",162,1],
+      ["refreshing",0,1],
+      ["refreshment",155,1],
+      ["refueling",200,1],
+      ["refuge",21,1,89,1,84,1],
+      ["refugee",124,1,9,1],
+      ["refurbished",151,1],
+      ["refurbishment",151,1],
+      ["refusal",137,2],
+      ["refused",99,1,38,1,20,1,18,1,38,1],
+      ["refusing",54,1,162,1],
+      ["regain",174,1],
+      ["regale",125,1],
+      ["regard",34,1,7,1,45,1,6,1,28,1,40,1,9,1,2,1,17,1,25,1,1,1],
+      ["regarded",9,1,22,1,20,1,36,1,9,1,3,4,48,1,1,1,14,1,49,1,2,1],
+      ["regarding",40,1,55,1,23,1,30,1,7,1,28,1,22,1,3,1,2,1,3,1],
+      ["regardless",42,1,66,1,1,1,5,1,17,3,4,1,28,1,4,1,8,1,1,1,36,1,1,1],
+      ["regenerate",7,1,30,1,47,1,35,1],
+      ["regenerating",143,2],
+      ["regeneration",7,1,77,5],
+      ["regenerative",7,1],
+      ["regime",36,1],
+      ["regimen",189,1],
+      ["region",0,1,2,2,19,3,2,2,6,1,2,1,2,1,13,1,2,1,2,2,7,1,7,3,5,1,2,1,5,4,2,1,1,1,11,1,2,1,1,1,3,3,3,2,1,1,1,1,14,1,6,2,2,1,1,1,9,1,4,5,1,1,1,1,2,1,1,1,2,1,3,1,26,1,1,1,2,2,1,1,3,1,1,1,4,2,8,1,4,1,5,1,20,1,1,2],
+      ["regional",64,1,54,1,4,1,15,1,10,1,4,1,27,1,13,2],
+      ["register",114,1,86,1],
+      ["registered",70,1,10,1,120,1],
+      ["registering",62,1],
+      ["regolith",69,1],
+      ["regrown",89,1],
+      ["regular",11,1,3,1,7,1,4,1,30,4,18,1,2,1,9,3,6,1,4,2,20,1,39,7,32,1,6,3,10,1,6,1],
+      ["regularity",207,5],
+      ["regularly",28,1,7,1,22,1,12,1,10,1,15,1,1,1,41,1,2,1,3,2,14,1,7,1,26,1,13,1,1,1],
+      ["regulate",16,1,1,1,20,1,2,2,13,1,13,1,53,3,47,1,2,1,4,1,2,1,1,1,37,1,1,1],
+      ["regulated",140,1,61,1,10,1],
+      ["regulating",20,1,17,1,136,1],
+      ["regulation",8,1,8,3,96,1,19,1,43,1],
+      ["regulator",201,1],
+      ["regulatory",53,1,64,1,5,1,18,1],
+      ["regurgitate",10,1],
+      ["rehabilitation",136,1],
+      ["rehearsal",12,7],
+      ["rehovot",71,1],
+      ["reid",209,1],
+      ["reign",87,3,82,1],
+      ["reindeer",21,1,58,1],
+      ["reinforce",122,1,54,1],
+      ["reinforced",5,1,118,1,28,1],
+      ["reinhardt",29,1],
+      ["reinier",156,1],
+      ["reinstated",44,2],
+      ["reinterpret",225,1],
+      ["reinterpretation",178,1],
+      ["reintroduced",223,1],
+      ["reintroduction",223,2],
+      ["reinvent",104,1],
+      ["reinventing",150,1,69,1],
+      ["reinvention",34,1],
+      ["reinvigorate",112,1],
+      ["reject",8,1,6,1,81,1,76,1,7,1,37,1],
+      ["rejected",25,1,19,1,12,1,37,1,12,1,3,1],
+      ["rejection",54,1],
+      ["relate",26,1,11,2,15,1,20,1,10,1,17,1,1,1,72,1,36,2,16,1],
+      ["related",11,1,7,4,1,1,1,1,2,1,2,2,10,1,9,1,11,1,2,1,12,1,2,3,21,1,5,1,10,2,5,1,8,1,1,1,4,1,23,2,27,2,15,1,25,1,7,1,1,1],
+      ["relating",15,5,25,1,38,1,128,1],
+      ["relation",3,1,5,1,7,1,5,1,8,1,27,1,22,1,9,1,36,1,30,1,46,1,26,1],
+      ["relationship",8,1,3,1,1,1,1,1,2,1,11,1,1,2,7,1,2,4,18,1,6,1,20,1,1,1,4,1,4,1,5,1,10,4,1,1,6,1,5,1,4,1,7,1,16,1,2,2,1,4,1,1,1,1,3,1,14,1,2,1,15,2,21,1,2,2,4,1,2,1,1,1,8,5,1,1,1,1,3,5],
+      ["relative",7,2,3,1,12,2,6,1,24,1,6,3,13,1,7,1,17,1,5,1,6,1,9,1,12,1,1,1,5,1,14,1,12,1,9,1,22,1,32,1],
+      ["relatively",10,1,4,1,6,1,3,1,4,1,10,1,3,2,4,1,8,1,24,2,6,1,1,1,3,4,3,1,14,1,14,1,1,1,9,2,6,1,2,1,5,1,3,4,1,1,4,1,13,1,6,1,20,1,14,1,9,1,1,1,1,1],
+      ["relativity",145,1,15,1,23,1,20,1],
+      ["relax",52,1,32,3,88,1],
+      ["relaxation",81,5,7,1,84,1,48,1],
+      ["relaxe",172,1],
+      ["relaxed",12,1,27,1,53,1,39,1,15,2,35,1],
+      ["relaxing",112,1,26,1,64,1],
+      ["release",25,1,40,1,62,1,2,1,1,2,34,1,29,1,2,1,26,1],
+      ["released",37,2,28,1,37,5,17,2,11,14,2,1,9,1,23,1,29,1,6,5,22,3,3,3],
+      ["releasing",137,1,84,2],
+      ["relented",105,1],
+      ["relentless",6,1,31,1,102,1],
+      ["relevance",137,1,76,2],
+      ["relevant",75,1,53,1,24,1,26,1,27,1],
+      ["reliability",36,1,39,3,70,1,58,1],
+      ["reliable",40,2,16,1,4,1,6,1,9,1,80,1,4,1],
+      ["reliably",6,1],
+      ["reliance",116,1,46,3],
+      ["reliant",136,1],
+      ["relic",46,1,96,1],
+      ["relied",15,1,1,1,17,1,23,3,40,1,49,1,23,1,3,1,32,1],
+      ["relief",16,1,4,1,15,1,37,2],
+      ["relieve",20,2],
+      ["relieved",72,1],
+      ["religion",98,1,96,1],
+      ["religious",9,2,18,1,2,1,3,1,19,1,13,1,93,2,14,1,40,2,8,1],
+      ["relish",135,1],
+      ["relocated",110,1],
+      ["relocating",156,1],
+      ["relocation",156,1],
+      ["relph",26,1],
+      ["reluctance",162,1],
+      ["reluctant",85,1,22,1,81,1],
+      ["rely",15,1,5,1,28,1,5,1,7,1,5,1,5,1,1,2,2,1,5,1,2,1,16,1,1,1,27,1,6,2,10,1,8,2,4,1,10,2,4,1,32,1,3,1,7,1,8,1,10,1],
+      ["relying",20,1,53,1,89,1,1,1,63,1],
+      ["rem",17,17,77,6,91,18,35,3],
+      ["remain",2,1,5,1,6,1,1,1,3,1,4,2,6,1,4,2,3,3,4,1,2,3,5,2,5,5,2,1,5,1,11,1,4,1,1,1,1,1,1,4,9,1,3,1,8,1,3,1,3,1,4,1,3,1,5,1,2,2,2,1,4,3,1,1,1,2,17,1,4,1,1,1,9,1,3,1,3,1,2,2,7,2,8,1,3,1,5,2,3,2,4,3,4,1,5,1,2,1,5,1,1,1,1,2,3,1,4,2,3,2,1,1,1,1,3,1],
+      ["remained",0,1,1,1,3,1,12,1,7,7,23,1,20,1,1,1,10,1,5,1,6,1,9,1,2,1,4,1,2,2,8,1,24,2,6,1,10,1,43,1,14,2,9,1],
+      ["remaining",6,2,27,1,10,1,8,1,5,1,40,1,3,1,26,1,10,1,9,1,4,1,20,1,55,2],
+      ["remanufacturing",117,1],
+      ["remarkable",45,1,7,2,13,1,1,1,25,6,2,1,16,1,2,1,10,1,2,2,12,1,2,1,2,1,20,2,5,1,46,1,3,1,4,1],
+      ["remarkably",36,1,4,1,16,1,34,1,20,1,38,1,3,1,4,1,13,1,11,1,1,1,5,1,32,1,3,1,1,1],
+      ["remarked",1,1,210,1],
+      ["rembrandt",215,2],
+      ["remedy",16,2],
+      ["remember",18,1,53,1,77,1,37,1,28,1,2,1,5,1],
+      ["remembered",131,3,54,1],
+      ["remembering",15,1,3,1,10,1,54,1,11,1],
+      ["remind",82,1,22,1,63,1,42,1,3,1,3,1],
+      ["reminded",82,2,100,1,33,1],
+      ["reminder",3,1,31,1,50,1,12,1,8,1,92,1],
+      ["reminding",106,1],
+      ["remnant",50,1,73,2,12,1],
+      ["remodelled",82,1],
+      ["remote",21,1,17,1,5,1,53,1,46,1,1,1,16,1,9,1,11,1,4,1,8,9,1,1],
+      ["remotest",19,1],
+      ["removable",29,1,185,1],
+      ["removal",214,4],
+      ["remove",31,1,17,1,4,1,1,1,9,2,17,3,13,1,4,1,27,1,18,1,46,1,27,4,4,1,8,1],
+      ["removed",31,1,17,1,20,1,42,1,14,1,14,1,33,1,16,1,15,1],
+      ["removing",53,1,26,1,48,1,37,1,50,1],
+      ["remunerated",15,1],
+      ["remus",31,1],
+      ["ren",190,1],
+      ["renaissance",7,1,2,1,159,1],
+      ["renamed",218,1],
+      ["rendered",69,1],
+      ["rendering",30,1,185,1],
+      ["rendition",14,1],
+      ["renewable",5,1,112,1,5,1,73,1],
+      ["renewed",10,1,31,1,127,1],
+      ["reno",196,1],
+      ["renovated",31,1,120,1,18,1],
+      ["renovation",31,1,120,3,19,1],
+      ["renowned",2,1,69,1,17,1,37,1,2,1,63,1,18,1,5,1,10,1],
+      ["rensis",8,1],
+      ["rental",118,1,52,1],
+      ["reopen",59,1],
+      ["reopened",170,1],
+      ["reopening",151,1],
+      ["reorganisation",78,1],
+      ["reorienting",5,1],
+      ["repair",13,1,4,1,152,1,16,3],
+      ["repairman",172,1],
+      ["repay",113,1,58,1],
+      ["repeat",18,1,110,1,37,1],
+      ["repeated",19,1,48,1,8,1,4,1,85,1,29,1,2,1],
+      ["repeatedly",5,1,14,1,57,1,70,1,26,1,44,1],
+      ["repeating",18,1,100,1,62,1],
+      ["repel",65,1,51,1],
+      ["repelled",146,1],
+      ["repellent",65,1],
+      ["repentant",112,1],
+      ["repercussion",156,1],
+      ["repertoire",14,1,40,7,113,1,31,1,14,1],
+      ["repetition",18,2,118,1],
+      ["repetitive",94,1,37,1],
+      ["rephrased",54,1],
+      ["replace",19,1,36,1,18,1,29,1,27,2,9,1,3,1,9,1,35,1,2,1,8,1,4,1,3,1,5,1,12,1],
+      ["replaceable",107,1],
+      ["replaced",0,1,1,2,18,1,10,1,17,1,2,1,11,1,2,2,11,1,5,1,2,1,30,1,20,1,3,1,8,1,29,1,18,2,5,1,27,1],
+      ["replacement",129,1,64,1,14,1],
+      ["replacing",13,2,6,1,58,1,48,1,16,1],
+      ["replanted",169,1],
+      ["replay",154,1],
+      ["replete",189,1],
+      ["replica",1,1,118,1],
+      ["replicate",119,2,46,1,56,1],
+      ["replicated",128,1],
+      ["replicating",119,1],
+      ["replication",183,1],
+      ["replied",15,1,84,1,29,1],
+      ["reply",149,1],
+      ["report",3,1,8,1,1,4,4,1,2,3,2,2,25,1,2,1,2,1,34,1,44,1,1,1,13,1,8,1,3,1,7,1,1,1,3,1,9,1,5,1,2,1,2,1,8,1,1,1,14,1,19,1],
+      ["reported",17,1,5,1,12,1,8,1,7,1,7,2,2,4,19,1,8,4,42,1,1,2,12,1,4,2,37,1,7,1,26,1,7,2],
+      ["reporter",4,2,168,1],
+      ["represent",8,1,16,1,2,6,21,1,17,1,3,1,3,1,15,1,8,1,9,1,16,1,28,2,5,1,6,1,13,1,17,1,12,1,6,1,10,1],
+      ["representation",2,1,24,1,3,1,17,1,11,2,10,1,7,1,24,1],
+      ["representational",47,1],
+      ["representative",80,2,30,1],
+      ["represented",10,1,16,1,23,1,11,2,4,1,3,1,17,1,15,1,17,1,51,1,3,1,42,1,1,1],
+      ["representing",43,1,79,1,24,1,3,1,66,1],
+      ["reprocess",185,1],
+      ["reproduce",5,1,36,2,56,1,30,1,11,1,3,1,24,1,2,1,35,1,5,1,5,1],
+      ["reproduced",97,1,22,1],
+      ["reproducing",7,1],
+      ["reproduction",41,1,20,1,82,1,24,1,45,1],
+      ["reproductive",110,2,44,1],
+      ["reptile",25,3,85,6,75,2,2,2,33,1],
+      ["reptilian",185,1],
+      ["republic",87,1,132,2],
+      ["reputation",4,1,29,1,1,1,10,1,27,1,7,1,57,1,22,1,37,1],
+      ["request",97,1,82,1,44,1],
+      ["requesting",91,1],
+      ["require",2,3,13,5,1,1,22,2,11,1,2,1,2,1,2,3,2,1,18,1,6,2,4,1,1,3,6,1,5,1,5,1,4,5,1,1,14,1,1,2,2,1,7,1,3,1,8,2,10,2,10,1,1,1,1,1,8,1,4,1,5,2,10,1,3,1,3,2,2,1,19,1,3,1],
+      ["required",0,1,2,1,11,1,7,1,16,1,2,1,2,1,12,1,3,2,7,1,2,1,2,1,4,1,16,1,10,1,3,1,3,1,5,2,6,1,5,1,2,1,7,1,2,1,3,1,8,1,4,1,2,1,6,1,12,6,4,1,16,1,3,1,2,1,10,1,23,6],
+      ["requirement",13,1,39,1,10,2,56,1,2,1,1,1,10,1,91,1],
+      ["requiring",93,1,37,1,65,1,5,1,13,1],
+      ["requisite",73,1],
+      ["reschedule",20,1],
+      ["research",2,2,1,2,3,3,1,2,1,1,3,1,2,5,1,1,2,3,1,4,1,6,2,3,4,6,1,1,1,9,1,2,1,1,2,2,6,11,1,5,2,3,2,1,1,2,1,2,6,1,1,1,4,1,4,1,2,1,2,1,1,1,5,1,2,3,1,2,1,2,4,1,2,4,2,5,1,4,1,6,1,3,3,1,5,7,1,2,1,1,1,1,1,1,2,1,1,1,2,7,1,1,1,1,3,1,1,2,8,5,2,2,3,1,3,1,5,1,1,5,1,1,1,1,5,2,3,1,1,2,3,1,3,1,2,1,1,4,2,2,2,1,2,2,1,2,4,1,1,1,1,1,4,3,1,2,1,2,1,7,1,1,3,2,3,4,1,1,3,7,1,1,1,1,1,1,1,2,1,2,1,2,1,6,1,2,2,1,1,3,6,1,1,4,2,1,1,2,1,1,1,1,1,1,1,4,4,2,1,2,3,2,2,1,2,1,4,6,1,7,1,1,1,1,1,1,1,3],
+      ["researche",24,1],
+      ["researched",219,1],
+      ["researcher",3,1,2,1,3,2,9,8,1,9,4,1,2,5,2,2,4,2,6,1,5,2,2,5,2,2,2,6,9,2,2,4,5,3,5,1,1,1,1,6,1,3,3,1,4,2,2,1,1,1,2,4,2,4,7,6,2,1,1,3,2,1,1,2,2,5,6,5,13,2,7,1,2,1,1,2,5,4,8,1,3,3,3,2,4,2,1,2,1,3,1,1,3,1,2,1,5,1,2,1,1,2,1,1,4,1,1,1,3,2,2,3,1,4,1,2,2,2,2,1,4,3,1,1,6,5,1,2,1,5,2,5,3,3,1,1,8,1,4,6,4,3,1,2],
+      ["researching",92,1],
+      ["reseller",166,1],
+      ["resemblance",99,1],
+      ["resemble",7,4,22,1,60,3,21,1,67,1,47,1],
+      ["resembled",8,1,9,1,12,1,38,1,72,1,59,1],
+      ["resembling",45,1,22,1,12,1,10,1],
+      ["reservation",31,1,169,1],
+      ["reserve",35,1,50,1,25,1,44,1,23,1],
+      ["reserved",77,1,8,1,20,1,3,1],
+      ["reservoir",132,1],
+      ["reshaped",19,3],
+      ["reside",47,1,61,1,27,1,48,1],
+      ["residence",11,1,15,1,15,1,106,1,22,2],
+      ["resident",14,8,12,3,5,2,3,1,10,1,3,1,16,1,7,4,6,1,8,1,12,1,6,1,16,3,17,1,58,1,6,1],
+      ["residential",50,1,85,1,12,1],
+      ["residing",96,1,31,1],
+      ["residual",224,1],
+      ["residue",51,1,66,1,93,1],
+      ["resignation",44,1],
+      ["resilience",20,1,111,4],
+      ["resilient",217,1],
+      ["resin",123,1,2,1],
+      ["resist",14,1,100,1,36,1,13,1,37,2],
+      ["resistance",49,1,3,2,23,1,37,1,27,1,1,1,37,1,14,1,30,2],
+      ["resistant",19,3,3,3,10,1,21,2,8,1,6,1,35,1,17,1,80,1,22,1],
+      ["resisted",200,1],
+      ["resolution",1,1,16,1,113,1,60,1],
+      ["resolve",98,1,24,1,23,1,4,1,32,1,22,1],
+      ["resolved",32,1,34,1,59,1,57,1],
+      ["resolving",156,1],
+      ["resonance",17,1,144,2,65,1],
+      ["resonate",57,1],
+      ["resonating",154,1],
+      ["resonator",46,1],
+      ["resort",87,1,47,1],
+      ["resounding",132,1,79,1],
+      ["resource",6,1,16,1,6,1,10,1,12,1,3,1,2,3,18,1,8,2,6,1,9,1,12,1,4,1,5,1,4,2,1,2,2,1,3,1,1,1,5,1,8,1,1,8,2,1,8,3,1,1,9,2,10,1,9,2,5,2,3,3,20,1,12,1,3,1,2,1],
+      ["respect",14,1,1,1,28,1,4,1,26,2,13,1,9,1,10,1,13,1,13,3,18,1,3,1,8,1,12,1,3,1,15,1,21,1],
+      ["respected",16,1,134,1,36,1,6,1],
+      ["respecting",99,1],
+      ["respective",184,1,33,1],
+      ["respectively",4,1,104,1],
+      ["respiratory",3,2,118,1,52,1],
+      ["respond",5,1,54,1,4,3,20,1,17,1,11,1,3,1,6,1,5,1,3,1,2,1,9,1,15,5,1,1,7,1,4,1,1,1,6,1,33,3,6,1,9,2],
+      ["responded",106,1,48,1,22,2,45,2],
+      ["respondent",26,2,16,1],
+      ["responding",126,1,20,1,28,1,12,1,20,1],
+      ["response",3,5,4,2,2,3,3,1,2,1,4,1,19,1,5,4,17,1,4,2,2,1,6,1,1,1,6,1,4,1,1,1,2,1,7,1,3,1,5,1,20,1,1,1,4,1,8,1,5,1,8,4,2,1,1,1,6,5,7,1,12,2,24,1,2,1,2,1,4,3,3,1,12,4],
+      ["responsibility",8,4,4,1,110,5,9,1,78,2],
+      ["responsible",2,1,56,1,17,1,18,1,9,5,22,1,3,1,10,4,3,1,43,1,12,2,2,1,2,5,2,1,3,1,6,1,4,1,6,4],
+      ["rest",0,1,2,1,2,1,2,1,6,1,3,1,1,1,5,1,10,1,4,2,2,1,2,1,4,1,11,1,4,1,8,1,6,1,4,1,5,1,12,1,1,1,1,1,1,1,9,1,1,1,12,1,3,1,6,1,1,1,2,1,2,1,14,1,19,1,20,2,6,1,4,1,5,1,4,1],
+      ["restaurant",0,1,24,1,8,2,23,1,8,2],
+      ["rested",39,1,161,1],
+      ["restful",185,1],
+      ["resting",37,2,148,1,7,1],
+      ["restless",94,1],
+      ["restoration",31,3,4,1,6,1,79,1],
+      ["restore",22,1,98,1,31,1,37,1],
+      ["restored",31,1,3,1,1,1,52,1,113,1],
+      ["restorer",41,1],
+      ["restrained",119,1],
+      ["restricted",24,12,16,1,151,1,10,1,23,1],
+      ["restricting",16,1,8,1,12,1],
+      ["restriction",24,8,88,1,10,2,39,1],
+      ["restrictive",38,1],
+      ["result",0,2,2,3,4,2,1,4,1,1,5,1,1,2,1,1,3,2,1,1,3,3,2,3,1,2,1,1,4,1,1,1,4,2,1,3,1,4,3,2,2,3,4,1,1,2,1,2,1,7,2,2,2,1,4,1,1,3,4,1,3,1,1,1,7,3,2,2,1,1,1,1,2,1,1,3,1,1,4,1,1,2,2,1,4,2,4,1,2,1,2,1,1,2,4,1,1,2,7,1,5,1,1,1,2,1,1,4,5,1,1,4,2,3,1,7,6,4,3,4,5,5,7,2,1,2,1,3,1,1,1,2,2,1,5,1,1,5,1,1,1,1,4,1,4,1,1,5,4,2,1,2,1,1,5,2,2,1,2,2,1,3,1,3,3,1,3,1,2,1,3,5,2,1,2,1,2,1,4,1,1,2,3,1,4,6,2,1,2,1,1,1],
+      ["resulted",4,2,5,3,2,1,17,1,2,1,17,2,8,2,6,1,4,1,10,1,13,1,19,1,21,1,12,1,35,1,9,2,10,2],
+      ["resulting",8,1,15,1,10,1,15,1,3,1,15,1,10,1,12,1,6,1,4,1,8,4,2,2,11,1,10,1,12,1,26,1,14,1,1,1,30,1],
+      ["resurrecting",168,1],
+      ["resuscitated",22,1],
+      ["retail",42,1,21,1,19,2,15,2,43,2],
+      ["retailer",55,1,27,1,15,2,37,1,6,1],
+      ["retailing",30,1],
+      ["retain",6,1,4,1,18,1,29,1,19,1,43,1,6,1,38,1,3,1,20,2],
+      ["retained",151,1],
+      ["retainer",147,2],
+      ["retaining",38,1,12,1,115,1,53,1],
+      ["retarding",158,1],
+      ["retention",122,1,18,1],
+      ["rethink",76,1,6,1],
+      ["retina",98,1,13,1],
+      ["retired",109,1,84,1],
+      ["retouched",98,1],
+      ["retrain",97,1],
+      ["retrained",83,1],
+      ["retreat",40,1,115,1],
+      ["retreated",112,1],
+      ["retrieval",41,1,101,1],
+      ["retrieve",127,1,89,1],
+      ["return",0,1,33,1,2,1,2,1,19,1,19,1,35,1,11,1,7,5,2,5,3,1,10,4,10,1,2,1,4,2,1,1,6,1,2,1,11,1,2,2,3,1,36,1,3,4],
+      ["returned",4,2,14,1,26,1,20,1,66,1,6,1,1,1,6,1,10,1,2,1,68,1],
+      ["returning",0,1,34,1,14,1,70,3,3,2,15,3,30,1],
+      ["reusable",82,1],
+      ["reuse",35,1,92,1,7,1,25,1],
+      ["reusing",134,1],
+      ["reveal",14,2,3,1,37,1,5,1,10,2,6,1,18,1,15,1,28,1,9,1,1,1,2,1,5,1,3,1,11,1,6,1,15,1,13,1,2,1,7,1,1,1,1,1],
+      ["revealed",18,4,27,1,8,1,16,1,3,1,4,1,15,2,1,2,53,2,9,1,23,2,6,1,7,1,10,1,3,2,7,1,11,1],
+      ["revealing",39,1,30,1,12,1,12,1,117,1],
+      ["revelation",100,1,54,1],
+      ["reveller",71,1],
+      ["revenue",20,1,35,3,92,1,32,1,15,1],
+      ["reverberate",94,1],
+      ["revered",9,1,6,1,145,1,11,1],
+      ["reverence",219,1],
+      ["reverend",223,1],
+      ["reversal",64,1],
+      ["reverse",18,1,55,1,26,1,52,1,49,1],
+      ["reversed",110,1,77,1,13,2],
+      ["revert",96,1],
+      ["review",4,2,4,1,12,1,22,1,21,1,20,2,28,1,1,1,25,1,12,4,18,1,14,1,3,1,28,1],
+      ["reviewing",20,2,185,1],
+      ["revise",15,1],
+      ["revised",13,1],
+      ["revitalisation",1,1,94,1],
+      ["revitalised",112,1,20,1],
+      ["revival",171,1,23,1],
+      ["revived",16,2,179,1],
+      ["reviving",35,1],
+      ["revolution",5,1,2,1,16,8,16,1,2,1,23,1,30,1,2,4,1,1,2,1,13,1,28,1,6,2,8,2,24,1,16,1],
+      ["revolutionary",46,1,53,1,17,1,90,1,7,1],
+      ["revolutionise",163,2],
+      ["revolutionising",133,1],
+      ["revolutionized",96,1],
+      ["revolve",40,1,81,1,29,2],
+      ["revolving",161,1],
+      ["reward",8,1,7,1,34,1,16,1,12,2,6,1,9,1,8,1,9,1,21,1,1,1,16,1,8,1,45,1,19,1],
+      ["rewarded",66,1,122,1,27,1,8,1],
+      ["rewarding",7,1,5,1,18,1,125,1,33,1,1,1],
+      ["rewrite",182,1],
+      ["rex",109,1],
+      ["rfd",191,13],
+      ["rhesus",24,3,150,1],
+      ["rhetoric",87,1],
+      ["rhetorical",149,1,13,1],
+      ["rheumatologist",72,1],
+      ["rhine",35,3],
+      ["rhino",27,1],
+      ["rhinocero",210,1],
+      ["rhone",196,4],
+      ["rhumb",64,4],
+      ["rhyme",182,1],
+      ["rhythm",4,2,14,4,25,2,29,1,9,1,5,1,14,8,46,1,3,2,55,1,15,1],
+      ["rhythmic",83,1,17,1,119,1],
+      ["rhythmically",83,1],
+      ["rib",44,1,2,1],
+      ["rica",143,1],
+      ["rice",61,1,1,2,115,1],
+      ["rich",29,1,9,2,10,2,2,1,27,2,16,2,8,5,7,2,2,1,1,1,24,1,1,1,6,1,11,1,10,2,14,1,24,1,9,1,1,1,14,1],
+      ["richard",7,1,30,1,16,1,13,1,27,1,18,1,2,1,21,4,1,1,52,1,9,2,14,1,1,1,10,2],
+      ["richardson",48,7],
+      ["riche",87,1],
+      ["richer",101,1,11,1],
+      ["richest",99,1],
+      ["richly",98,1,117,1],
+      ["rick",37,1],
+      ["rico",193,1],
+      ["rid",31,1,4,1,54,3,45,1,47,1,37,1],
+      ["riddle",64,1,119,1],
+      ["riddled",27,1,127,1],
+      ["ride",63,1,69,8,29,13,21,1],
+      ["rider",132,1],
+      ["ridge",207,1],
+      ["ridged",165,1],
+      ["ridicule",144,1,30,1],
+      ["ridiculed",93,1],
+      ["riding",157,2],
+      ["ridley",181,1],
+      ["rieur",219,1],
+      ["rieure",165,1],
+      ["rift",25,2],
+      ["right",0,1,4,1,11,1,3,1,1,1,4,1,1,1,17,1,1,1,1,2,5,1,14,1,6,1,1,1,3,2,1,1,1,1,7,2,2,1,3,2,9,1,2,3,4,1,7,1,9,1,4,1,1,1,8,1,4,1,10,1,7,1,1,1,7,1,1,1,1,1,1,1,1,1,3,3,1,1,3,1,2,1,4,1,2,1,5,1,3,1,4,1,1,1,6,1,7,2,1,1,4,1,3,1,3,1,5,1,1,1],
+      ["righted",49,1],
+      ["rightly",206,1,7,1],
+      ["rigid",8,1,11,3,4,1],
+      ["rigidity",73,1],
+      ["rigidly",5,1,3,1,46,1],
+      ["rigord",21,2],
+      ["rigorous",100,1,28,1,35,2],
+      ["rigour",160,1,10,1],
+      ["rim",159,1,18,1],
+      ["ring",21,1,47,1,40,1,18,1,43,1],
+      ["ringbarked",16,1],
+      ["ringing",211,1],
+      ["ringtone",18,1],
+      ["rinsed",51,1],
+      ["rio",179,6],
+      ["rioter",194,1],
+      ["ripe",155,1],
+      ["ripened",22,1],
+      ["ripening",158,1],
+      ["ripped",184,1],
+      ["ripple",176,1],
+      ["rise",3,1,6,5,14,1,2,1,10,1,3,1,10,1,2,4,5,1,6,1,2,1,9,1,4,1,30,1,3,5,3,1,6,1,10,1,5,1,19,1,7,1,4,1,10,1,1,1,11,2,12,1,8,1,4,1,8,1,2,1,4,2,1,1],
+      ["risen",0,1,23,1,2,1,51,1,90,1],
+      ["rising",21,1,11,1,68,2,58,1,37,1],
+      ["risk",11,1,9,1,38,1,12,1,12,1,12,2,9,1,10,1,8,2,1,3,6,7,9,1,2,1,2,1,1,1,20,1,12,1,4,2,28,2,3,24],
+      ["risking",96,1,113,2],
+      ["ritual",23,1,8,1,20,2,53,4,22,1,21,1],
+      ["ritzmann",159,3],
+      ["rival",66,3,10,1,46,1,34,1,60,1,1,1,2,1],
+      ["rivalry",28,1,38,1],
+      ["river",21,2,6,2,7,1,1,14,15,2,16,2,3,4,8,1,30,1,6,8,11,1,12,1,5,2,38,1,8,2,5,5,4,4,27,1],
+      ["riverbank",35,1],
+      ["riverbed",35,1,78,1],
+      ["rizzolatti",57,3],
+      ["rn",44,1,128,1],
+      ["rna",177,1],
+      ["road",15,1,20,1,12,1,6,1,24,4,2,2,17,3,48,1,5,1,8,1,34,1,6,1,23,1],
+      ["roadway",135,1],
+      ["roam",138,1,32,1,32,1],
+      ["roamed",90,1,48,1,6,1,58,1],
+      ["roast",32,1],
+      ["rob",49,1,22,1,108,1,11,1],
+      ["robber",31,2,151,1,2,5],
+      ["robby",198,3],
+      ["robe",77,1],
+      ["robert",3,1,14,1,16,1,31,1,19,1,17,2,28,1,10,1,7,2,14,1,5,1,7,8,31,1,1,2,17,1],
+      ["robin",103,1,32,1],
+      ["robinson",89,4,22,6],
+      ["robot",13,26,43,2,86,2,17,11,39,32],
+      ["robotic",13,2,43,1,86,1,17,1,18,1,21,1],
+      ["robotically",142,1],
+      ["roboticist",198,1],
+      ["robust",16,1,40,1,28,1,92,1,38,1],
+      ["rochester",189,1],
+      ["rock",21,1,4,5,2,1,6,1,7,1,7,1,3,1,17,3,2,2,10,8,24,1,20,1,4,1,2,1,7,1,6,1,23,1,8,1,4,2,7,1,8,1,4,2,20,1],
+      ["rockefeller",137,2],
+      ["rocket",164,7],
+      ["rocketing",86,1],
+      ["rockfall",196,3],
+      ["rocky",10,1,24,1,11,3,45,1,67,1],
+      ["rod",217,1,1,1],
+      ["rode",90,1],
+      ["rodent",51,1,52,1,32,1,23,5,65,1],
+      ["roderick",152,1],
+      ["rodolfo",123,1],
+      ["rodwell",154,13],
+      ["roger",22,1,17,1,10,1,110,1,31,1],
+      ["role",3,1,8,1,1,2,3,1,2,1,3,1,3,1,20,1,4,1,3,1,2,1,1,1,12,1,3,1,4,1,2,1,6,3,5,1,5,1,1,2,1,1,1,1,11,1,13,1,3,1,2,1,9,3,3,1,5,2,5,1,3,1,1,1,10,4,12,1,7,1,3,1,6,5,1,1,10,1,10,4,1,1,5,1,7,1,1,2,3,1,1,4],
+      ["rolfe",36,2],
+      ["roll",161,1],
+      ["rolled",107,1,117,2],
+      ["rolleke",157,2],
+      ["roller",23,1,40,1,69,16],
+      ["rollicking",182,1],
+      ["rolling",94,1],
+      ["roman",9,2,6,1,16,6,20,4,26,4,2,1,8,9,42,34,40,20,25,2,20,1,4,1,1,9],
+      ["romance",182,1],
+      ["romania",27,1],
+      ["romantic",112,1,56,1,3,1,34,1],
+      ["romany",16,1],
+      ["rome",9,1,20,1,2,10,1,1,45,1,10,9,42,1,8,1,32,1,50,1],
+      ["romulus",31,1],
+      ["ronald",198,2],
+      ["roof",35,3,9,4,35,2,34,1,38,1,44,4],
+      ["rooftop",35,1],
+      ["room",39,1,11,1,29,1,6,1,7,1,6,2,1,2,7,3,12,1,3,1,10,1,6,1,30,1,2,3,1,1,2,1,10,1,15,1,15,1,8,1],
+      ["roost",103,2],
+      ["root",9,1,7,1,13,1,10,1,26,1,38,2,6,1,13,1,35,1,1,1,35,2,27,1,1,4,1,1],
+      ["rooted",167,3,45,3],
+      ["rope",123,1,61,1,33,1],
+      ["roped",152,1],
+      ["rosa",143,3],
+      ["rosalind",17,1],
+      ["rose",136,1,8,1,20,1,4,1],
+      ["rosen",167,1,45,2],
+      ["rosenfeld",195,1],
+      ["rosetta",111,1],
+      ["ross",75,1,16,3],
+      ["rostker",36,2],
+      ["rostovtzeff",87,1],
+      ["rot",22,1,167,1],
+      ["rotate",161,1],
+      ["rotated",93,1,68,1],
+      ["rotating",1,1,78,1,82,1],
+      ["rotation",161,1,3,1],
+      ["rotational",161,1],
+      ["rothenhausler",201,1],
+      ["rotten",113,1],
+      ["rough",34,1,52,1,5,1,68,1,36,1,29,1],
+      ["roughed",215,1],
+      ["roughly",0,1,2,1,31,1,4,1,38,1,10,1,17,1,6,1,54,1,22,1,15,1,11,1,6,1],
+      ["round",1,1,11,3,9,1,21,1,24,3,27,1,30,1,27,1,6,1,9,2,30,1,16,1],
+      ["rounded",52,2,32,1,81,1],
+      ["rounder",191,1],
+      ["roundest",21,1],
+      ["rouse",83,1],
+      ["rousseau",208,2],
+      ["route",26,1,30,1,9,1,23,2,13,1,12,1,8,1,2,1,7,2,19,1,13,1,1,1,43,1,20,1],
+      ["routine",17,1,70,1,72,1,22,1,6,1],
+      ["routinely",37,1,39,1,9,1,19,1,23,1,25,1],
+      ["rover",177,2],
+      ["row",200,3,21,6],
+      ["rowe",134,1],
+      ["roy",45,2,114,1,11,1,30,1],
+      ["royal",0,1,10,1,24,1,54,1,11,3,6,1,6,3,5,1,9,1,10,1,56,1,14,6,12,1],
+      ["royalty",51,1,58,1],
+      ["rozalyn",24,1],
+      ["ruamahanga",192,6],
+      ["rub",89,1],
+      ["rubbed",116,1],
+      ["rubber",19,3,4,91,6,3,63,1],
+      ["rubbing",47,1,69,2],
+      ["rubbish",84,1,18,1,32,5,65,1],
+      ["rubble",50,1],
+      ["ruben",215,2],
+      ["rubinstein",109,1],
+      ["rudd",63,1],
+      ["rudimentary",1,1,106,1,76,1],
+      ["ruediger",159,1],
+      ["rugby",191,1,34,2],
+      ["rugg",190,7],
+      ["rugged",136,1,23,1],
+      ["ruin",46,1,41,2],
+      ["ruined",108,1],
+      ["rule",8,3,7,3,20,1,10,1,15,1,26,1,6,2,20,1,2,1,4,1,4,1,34,1,1,1,3,1,2,1,10,1,6,1,3,2,10,1,14,1,3,1,14,1],
+      ["ruled",123,1,21,1],
+      ["ruler",0,1,9,1,42,1,36,1,60,2,5,1],
+      ["ruling",0,1,9,1,60,1,78,1],
+      ["rumble",154,1],
+      ["ruminant",10,2],
+      ["rump",10,1],
+      ["rumpelstiltskin",157,1],
+      ["run",3,3,18,1,12,4,4,1,11,1,9,3,3,1,3,1,6,1,1,2,10,1,4,1,3,1,4,1,18,1,9,1,4,2,4,1,2,1,3,1,21,1,4,2,3,2,1,1,13,1,1,1,5,1,21,1,6,1,3,1,5,1,2,1],
+      ["runco",81,1],
+      ["runner",57,3,40,1],
+      ["running",10,1,10,2,7,1,20,1,1,1,9,1,2,1,20,1,25,1,28,1,12,1,10,1,12,1,1,1,8,1,19,2,13,1,5,1,4,1],
+      ["rupee",76,1],
+      ["rupert",173,1],
+      ["rupturing",224,2],
+      ["rural",87,1,15,1,3,1,15,1,17,6,42,3,12,2,8,1,19,1],
+      ["ruru",103,3],
+      ["rush",85,1,3,1,63,1,58,1],
+      ["rushe",59,1],
+      ["russell",4,1,35,1,21,3,15,1,94,2],
+      ["russia",0,1,21,1,97,1,14,1,91,1],
+      ["russian",0,1,21,1,72,1,39,1,10,1,4,1,25,1,46,2],
+      ["rustic",157,3],
+      ["rusty",142,1],
+      ["rutger",155,5],
+      ["ruth",50,1],
+      ["ruthlessly",125,1],
+      ["ryden",26,1],
+      ["saarinen",44,1],
+      ["sac",59,1,59,1,106,5],
+      ["sack",83,1],
+      ["sacred",51,1],
+      ["sacrifice",66,1,60,1],
+      ["sacrificed",65,1],
+      ["sad",100,2,87,1,13,1],
+      ["sadness",60,1,11,1,1,1,103,1],
+      ["safe",16,1,11,1,5,1,20,1,10,2,14,1,13,1,21,2,11,1,1,2,28,1,11,2,11,1],
+      ["safeguard",8,1],
+      ["safeguarding",84,1],
+      ["safely",62,1,59,2,17,1,21,1,9,1,5,1,29,1],
+      ["safer",16,1,37,1,60,1,59,1,21,1,27,1],
+      ["safety",13,2,22,1,17,1,1,10,30,1,6,2,26,1,7,2,28,1,11,1,59,1,6,2],
+      ["saffron",38,2],
+      ["sage",153,3],
+      ["sagebrush",221,5],
+      ["sahabot",159,1],
+      ["sahara",159,1],
+      ["saharan",76,1,97,3,43,1],
+      ["said",6,1,5,1,6,1,3,1,14,1,7,2,1,2,1,1,2,1,1,1,3,1,2,2,2,2,5,1,5,4,7,1,8,1,5,3,2,1,1,1,7,1,5,1,8,1,1,1,2,1,10,4,7,1,2,1,1,2,5,1,5,1,5,2,8,2,10,1,8,3,1,1,1,1,5,1,2,1,3,2,2,1,2,1,2,1,6,1,4,8,18,2,1,1,3,1],
+      ["sail",44,1,22,2,22,1,80,3],
+      ["sailed",66,1,102,1,24,1],
+      ["sailing",44,1,22,1,25,1,22,1,4,1,51,4],
+      ["sailor",64,1,2,2,22,1,28,2,7,1,15,1,11,1,53,1],
+      ["sainte",146,1],
+      ["sake",146,3],
+      ["salary",9,1,19,1,135,1],
+      ["sale",41,1,12,1,17,1,1,1,9,7,2,1,97,5,2,2,7,2,12,1,1,1],
+      ["salesman",145,1,58,1],
+      ["salespeople",85,1],
+      ["salesperson",162,1],
+      ["salicylate",65,2],
+      ["saline",69,1,3,2],
+      ["salinity",69,7,111,1],
+      ["salivate",3,1],
+      ["sallustius",169,2],
+      ["sally",165,1],
+      ["salt",38,1,13,2,10,1,8,18,10,48,80,1,18,1],
+      ["saltwater",108,1,21,1],
+      ["salty",79,2],
+      ["salvador",17,1],
+      ["sam",189,5,3,1],
+      ["samarkand",107,2],
+      ["samarkander",107,1],
+      ["same",2,2,2,1,1,1,1,1,6,3,2,8,1,11,3,2,1,3,1,3,2,1,1,1,1,3,2,1,1,1,2,1,1,2,2,1,1,1,1,1,1,1,1,1,1,3,2,2,1,2,1,2,1,1,4,2,1,5,5,2,1,1,1,1,3,3,1,2,3,1,1,2,4,1,10,3,2,2,2,1,1,1,1,1,2,2,1,1,1,1,3,3,3,2,3,1,3,3,2,1,4,1,2,3,1,1,1,2,2,1,4,1,4,1,1,1,3,2,3,1,1,4,4,1,1,3,2,1,5,1,3,2,1,1,1,2,2,1,1,2,2,2,1,1,5,1,4,2,2,2,1,1,1,1,1,3,1,2,1,1,2,3,1,1,2,1,1,3,3,2,1,2,3,1,1,1,1,1,1,2,7,1,1,1,7,1,1,3,5,1,1,1,1,1,2,1,1,2,2,1,1,2,1,2,1,3,1,1,1,1,2,3,1,1,1,3,1,1,2,2,3,1,1,2,1,3],
+      ["samoa",171,4],
+      ["sample",36,1,14,1,29,1,9,1,3,1,22,1,16,3,16,1,3,1,3,1,4,1,10,1,12,2,15,1,4,1,4,1,1,2,2,1,7,3],
+      ["sampler",91,1,86,1],
+      ["sampling",143,1,67,1],
+      ["sampson",213,6],
+      ["samuel",28,1,185,3],
+      ["san",43,2,47,2,57,1],
+      ["sanatorium",4,1],
+      ["sanctuary",110,1,77,1],
+      ["sand",50,1,40,1,18,1,5,1,10,2,1,1,8,1,33,15,8,1,19,1,18,3,1,1],
+      ["sandra",16,1,151,1,45,2],
+      ["sandstrom",85,1],
+      ["sandy",165,1],
+      ["sang",83,1],
+      ["sanskrit",46,1],
+      ["santa",70,1,5,1,68,3],
+      ["sap",35,1],
+      ["sapien",183,1,25,1],
+      ["sapling",1,1],
+      ["sarah",95,1],
+      ["saskatchewan",201,1],
+      ["sasse",95,1],
+      ["sat",18,1,157,1,7,1,2,1],
+      ["satellite",64,1,60,1,77,13],
+      ["satire",87,1],
+      ["satisfaction",8,2,55,1,65,1,38,1],
+      ["satisfactorily",30,1,3,1,54,1],
+      ["satisfactory",69,1],
+      ["satisfied",18,1,48,1,154,1],
+      ["satisfy",4,1,153,1],
+      ["satisfying",7,1,1,2,55,1],
+      ["saturday",182,1],
+      ["savage",160,1],
+      ["savanna",154,1],
+      ["savannah",115,1,35,1],
+      ["save",26,1,2,1,41,1,12,1,21,2,10,1,14,1,38,1,17,2,18,2,10,1,14,2],
+      ["saved",33,1,62,1,1,1,29,1,12,1],
+      ["saver",18,1,14,1,168,1],
+      ["saving",59,1,35,1,1,6,2,1,47,1,12,2],
+      ["saw",5,1,19,1,7,1,6,1,5,1,16,1,8,1,2,2,1,1,10,1,8,1,12,1,6,2,4,2,4,2,2,1,1,1,23,1,5,1,16,1,15,2,14,1,3,1,2,1,17,1,8,2],
+      ["sawn",117,2,101,1],
+      ["saxon",194,1],
+      ["saxophone",92,1],
+      ["say",2,1,3,6,2,8,7,4,1,6,1,3,1,5,1,6,2,9,2,1,2,4,1,1,2,3,1,2,2,2,3,5,2,1,2,9,2,3,8,1,1,2,1,4,2,1,2,1,5,3,1,1,1,8,2,2,6,3,1,1,1,7,1,3,1,2,3,3,5,2,1,4,4,2,4,3,1,3,1,8,1,6,2,1,1,2,1,1,1,1,1,1,2,7,1,3,1,4,10,3,2,7,1,5,3,4,5,4,6,2,4,3,1,9,1,7,3,4,4,7,1,1,1,7,1,3,1,4,3,1,5,1,2,2,1,2,1,3,1,1,1,1,1,1,2,1,1,2,1,4,2,8,5,1,1,1,2,1,1,5,3,8,2,3,2,1,1,1,1,1,1,1,3,3,1,6,2,1,3,2,1,7,1,5,2,4,1,1,1,3,1,4,1,3,2,4,3,1,2,1,2,8,3,1,4,2,1,1,1,3,4,2],
+      ["saying",20,1,14,1,20,1,6,1,12,2,30,1,1,1,3,1,20,1,12,1,10,3,33,1,2,1,16,1,3,1,19,1,4,1],
+      ["saz",46,1],
+      ["scaffolding",31,1,120,1],
+      ["scale",33,1,1,2,4,1,12,1,2,1,3,1,9,1,4,1,16,1,6,1,7,1,2,1,9,2,11,1,4,2,10,1,14,2,4,1,7,2,1,1,8,4,6,1,7,1,24,2,3,5,2,1,3,4,2,1,12,3],
+      ["scaled",140,1,19,1],
+      ["scalp",81,1],
+      ["scan",2,1,35,4,34,1,7,1,5,1,17,1,59,1,26,1,15,1,4,1],
+      ["scandal",9,2],
+      ["scandinavian",117,1],
+      ["scanned",97,1,76,1],
+      ["scanner",97,2,69,1],
+      ["scanning",97,4,88,1,12,1],
+      ["scant",40,1,32,1,48,1,87,2],
+      ["scar",91,1],
+      ["scarab",103,1],
+      ["scarce",62,1,34,1,25,1,17,1,34,1,30,1],
+      ["scarcely",99,1,51,1],
+      ["scarcer",216,1],
+      ["scarcity",96,1],
+      ["scared",39,1],
+      ["scarlet",109,1,27,1],
+      ["scatter",30,1,38,1,91,1,21,1,21,1],
+      ["scattered",30,1,60,1,45,1,45,1],
+      ["scattering",30,1,150,1],
+      ["scavenge",52,1],
+      ["scavenging",135,1],
+      ["scenario",40,1,35,1,27,1,53,1,20,1,2,1,20,2,2,1],
+      ["scene",23,1,11,1,44,1,20,1,16,1,9,1,26,1,66,2,7,1],
+      ["scenic",132,2],
+      ["scent",65,8,6,4,7,5,47,1],
+      ["scented",65,4,6,1],
+      ["sceptic",128,1,36,1,49,1],
+      ["sceptical",53,1,19,1,103,1],
+      ["sch",84,2,46,2],
+      ["schedule",31,1,13,1,29,1,21,1,37,1,51,1],
+      ["scheduling",20,1],
+      ["scheme",16,1,19,1,30,1,32,1,116,1],
+      ["schiaparelli",177,2],
+      ["schifferstein",71,1],
+      ["schizophrenia",7,1,76,1],
+      ["schlaug",2,1,81,2,93,2],
+      ["scholar",4,1,7,1,29,2,15,1,9,1,47,2,16,1,18,4,2,1,10,2,1,1,32,4,13,4,3,1,13,1],
+      ["scholarly",0,1,41,1,14,1,102,1,49,1],
+      ["scholarship",28,2,142,1],
+      ["schole",128,2],
+      ["school",4,3,2,1,5,7,4,3,1,1,1,1,3,1,8,3,8,2,1,1,5,1,7,21,5,1,2,1,2,1,4,1,12,2,31,1,6,1,5,1,6,5,6,1,8,4,9,1,5,1,2,1,1,11,7,1,3,8,8,1,2,1,3,1,6,1,4,14,3,1,14,1,4,1,13,5,5,3],
+      ["schooling",4,1,45,1,104,1],
+      ["schroeder",85,1],
+      ["schultz",221,2],
+      ["schwartz",167,8,45,9],
+      ["schwediawer",125,2],
+      ["schweickart",142,1],
+      ["schweickert",196,2],
+      ["science",3,1,8,6,2,1,4,2,6,1,5,1,2,4,7,1,2,1,17,1,6,1,1,1,8,1,1,1,3,1,5,3,11,2,2,3,5,1,2,2,6,1,5,1,5,3,6,1,11,1,15,1,1,1,3,1,7,2,1,1,3,1,1,1,13,1,1,4,1,2,6,5,3,2,1,1,1,1,2,1,3,1,3,2,11,2,17,6],
+      ["scientific",5,1,2,8,6,1,2,5,1,2,14,1,7,1,26,1,1,1,11,1,4,1,1,3,1,1,5,7,1,1,18,2,4,2,6,1,1,2,6,1,3,1,2,1,1,1,13,1,1,1,2,1,1,2,9,1,24,14,1,2,4,1,4,1,5,1,11,2,6,1,1,1,3,6,3,1,4,1],
+      ["scientifically",37,1,105,1,71,1],
+      ["scientist",0,2,5,1,2,4,1,1,6,1,1,1,2,4,1,2,4,1,1,1,2,5,5,5,7,8,1,2,1,1,4,3,2,1,3,2,9,1,2,1,2,1,1,1,7,6,3,1,8,2,3,1,2,1,4,1,1,1,1,5,2,1,1,3,1,1,2,1,1,1,1,1,1,2,2,1,1,1,3,2,5,2,4,1,1,2,3,4,6,1,8,3,1,1,1,3,6,1,1,3,1,1,11,5,1,1,3,1,2,1,4,2,1,2,1,1,1,2,5,2,1,1,2,3,2,4,1,5,1,2,1,6,5,2,2,1,2,2,3,1,1,3,3,2,1,1,2,1,9,1,4,2,9,1,2,2,3,3],
+      ["scissor",127,1],
+      ["scoop",177,1],
+      ["scope",50,1,3,1,34,1,61,1],
+      ["score",37,1,69,1,47,2,23,1,8,6],
+      ["scoreboard",184,1],
+      ["scored",106,2,70,1],
+      ["scorn",125,1],
+      ["scorpion",154,1],
+      ["scorpionfish",68,1],
+      ["scotland",23,1,86,2,62,3,23,2,27,3],
+      ["scotlandplant",221,2],
+      ["scott",171,4],
+      ["scottish",95,1,41,1,35,2],
+      ["scoured",25,1,66,1],
+      ["scourge",137,1],
+      ["scouring",194,1],
+      ["scout",56,1],
+      ["scoville",158,3],
+      ["scowl",60,3],
+      ["scrabble",92,1],
+      ["scramble",159,1,13,1],
+      ["scraped",27,1,20,1,32,1,4,1,109,1],
+      ["scratch",179,1],
+      ["scratche",115,1],
+      ["scratched",214,1],
+      ["scratching",154,1,60,1],
+      ["scream",161,1],
+      ["screen",9,1,9,1,46,1,15,1,3,1,32,1,8,1,29,1,30,1],
+      ["screening",170,1],
+      ["screwdriver",92,1],
+      ["script",12,3,74,1,25,3,64,1,15,1],
+      ["scroll",107,1],
+      ["scrub",10,1],
+      ["scrubbing",134,1],
+      ["scrubland",138,1,64,1],
+      ["scrupulous",86,1],
+      ["scrupulously",139,1,21,1],
+      ["scrutinise",41,1],
+      ["scrutinize",98,1],
+      ["scrutinizing",30,1],
+      ["scrutiny",36,1,4,1],
+      ["scull",52,1],
+      ["sculpture",63,4,83,1,5,1,16,1,45,1,3,1],
+      ["se",167,1,45,1],
+      ["sea",21,1,14,5,9,1,4,2,2,1,1,1,1,1,11,1,3,3,2,6,1,4,9,1,1,1,9,1,1,1,2,10,17,2,5,1,10,5,2,5,4,1,4,1,8,2,5,1,3,1,18,1,1,3,14,1,13,1,17,1,1,1],
+      ["seabed",35,1,56,7],
+      ["seabird",1,4,47,1,62,2],
+      ["seabrook",18,1],
+      ["seafaring",116,1,7,3],
+      ["seafront",205,1],
+      ["seagoing",123,1],
+      ["seahorse",68,1],
+      ["seal",99,1],
+      ["sealed",61,1,16,1,46,1],
+      ["sealer",1,1],
+      ["seam",217,1],
+      ["seamen",46,1],
+      ["search",30,1,7,1,28,1,3,1,21,1,10,1,1,1,3,1,12,1,29,1,5,1,3,1,3,3,6,1,16,1,9,1,6,1,14,1,9,1,7,1,1,1],
+      ["searche",144,1],
+      ["searched",50,1,6,1,48,1,40,1,73,1],
+      ["searching",79,1,44,1,21,1,52,1],
+      ["searchlight",144,1],
+      ["seascape",205,1],
+      ["season",14,1,13,1,69,1,7,1,7,1,4,1,5,1,2,2,9,1,1,1,4,1,3,1,5,1,6,1,31,1,21,1,1,1],
+      ["seasonal",90,1],
+      ["seasonality",61,1],
+      ["seasonally",121,1,26,2],
+      ["seasoned",170,1],
+      ["seat",131,1],
+      ["seated",134,1],
+      ["seawater",52,1,16,1,3,1,7,1,1,2,12,1,38,6,51,2],
+      ["seaweed",5,1,16,1,58,1],
+      ["sec",26,6],
+      ["second",3,3,3,1,2,2,4,2,1,1,7,1,4,1,11,1,2,1,2,5,1,1,2,1,15,2,1,2,1,2,4,2,10,1,2,2,2,2,3,1,1,4,12,1,1,2,4,1,3,1,7,1,4,1,2,2,16,2,2,2,9,1,7,1,3,1,1,2,2,1,1,1,6,2,3,1,6,1,5,1,3,2,1,1,2,6,3,4,2,1,1,1,2,1,1,1,17,2,1,1,2,1,8,1,2,1],
+      ["secondary",49,2,9,1,3,1,53,1,41,1,31,1],
+      ["secondly",36,1,19,1,18,1,89,1,45,4],
+      ["secrecy",77,1],
+      ["secret",37,1,22,1,10,1,8,1,14,1,14,1,2,1,22,1,27,2,7,1,54,1,1,1],
+      ["secretary",111,1],
+      ["secrete",108,1],
+      ["secreting",59,1],
+      ["secretion",125,1],
+      ["secretly",2,1,75,1,91,1],
+      ["section",0,1,21,5,14,1,4,5,5,1,3,5,17,1,24,1,36,2,18,5,7,1,18,5,50,3,4,1],
+      ["sectional",52,1],
+      ["sector",28,1,25,1,2,1,25,1,37,2,5,1,18,1,55,1],
+      ["secure",28,1,99,1],
+      ["securely",1,1,39,3],
+      ["security",85,1,43,4,46,1,48,1],
+      ["sedative",83,1],
+      ["sediment",25,1,8,1,36,2,21,2,25,1,81,12,14,6],
+      ["sedimentation",21,1,69,1],
+      ["see",5,1,1,1,1,10,4,3,2,1,4,1,1,1,4,1,2,1,4,1,5,1,1,1,6,1,2,3,2,1,4,2,5,1,1,1,1,3,1,1,1,1,1,3,5,1,4,1,1,2,1,2,1,2,2,1,8,2,6,1,3,2,2,1,2,11,4,1,1,3,2,1,2,1,4,1,5,2,2,2,1,2,4,2,3,2,6,1,1,1,4,1,1,1,1,1,4,3,5,1,6,1,1,1,4,1,2,1,3,1,1,1,3,1,3,1,1,1,3,1,1,1,6,1,1,1,1,1,5,2,2,2,4,1,2,1,1,1,6,1,1,2,2,3,3,1,1,2,3,1,2,1,1,1,2,1,1,6,1,3,3,2,2,1,1,1,4,1],
+      ["seed",0,1,5,2,45,2,1,1,88,1,4,1,15,10,43,1,9,2,14,3],
+      ["seedless",51,1],
+      ["seedling",221,1,3,1],
+      ["seeing",6,2,35,2,27,2,24,1,1,7,14,1,14,1,23,1,51,1],
+      ["seek",8,1,44,2,2,1,33,1,34,1,25,1,17,1,18,1,19,3,16,1],
+      ["seeker",27,1,117,1],
+      ["seeking",20,2,8,1,9,1,15,1,60,1,29,1,6,1,10,1,4,1,64,1],
+      ["seem",2,2,3,1,4,1,4,1,1,1,2,1,1,1,4,2,1,1,3,2,7,1,1,1,2,2,4,3,1,1,2,2,5,1,5,1,5,3,1,1,5,1,5,1,7,3,5,1,2,1,1,2,2,2,5,1,1,6,2,2,1,2,1,3,1,1,11,2,1,1,6,1,1,3,3,2,3,1,2,1,5,1,4,1,2,2,7,1,1,3,1,1,1,1,1,1,2,1,1,3,7,1,2,1,1,2,3,3,6,1,4,3,7,1,6,1,1,1,1,1,4,1,13,1,1,3,1,1,2,2,5,1,8,2,1,3],
+      ["seemed",9,1,15,1,12,1,18,2,4,1,13,1,7,1,9,1,3,1,10,4,5,1,4,1,6,1,13,1,11,1,29,1,2,1,4,2,10,1,4,1,17,1,8,2,12,1],
+      ["seeming",22,1],
+      ["seemingly",9,1,62,1,5,1,2,1,43,1,6,1,25,1,8,1,1,1,2,1,18,1,11,1],
+      ["seen",0,1,13,1,1,1,3,1,8,1,2,1,1,1,2,1,4,5,12,2,1,2,2,1,9,1,4,1,6,3,1,1,12,1,8,2,4,2,10,1,6,1,5,2,1,1,3,1,9,1,1,1,9,1,7,1,20,1,4,1,10,1,7,2,2,2,18,2,2,2,12,1,2,1,2,1],
+      ["seep",135,1],
+      ["segment",83,1,11,1,73,1,14,1,31,1],
+      ["segmented",39,1],
+      ["seidler",44,1],
+      ["seinfeld",15,1],
+      ["seismic",61,1,93,6,42,1],
+      ["seize",15,1],
+      ["seldom",109,1,73,1,16,2],
+      ["select",54,1,68,1,8,2,18,1,42,1,32,1],
+      ["selected",6,1,6,1,10,1,4,1,6,2,32,1,42,1,49,1,15,1,9,1,25,1,1,1,2,1],
+      ["selecting",3,1,97,1,73,1],
+      ["selection",22,1,33,1,34,1,38,1,23,1,17,1,38,2,7,1,9,1],
+      ["selective",115,1,59,1],
+      ["selectively",174,1],
+      ["self",6,2,2,1,26,1,2,1,1,1,4,2,1,1,10,1,29,1,17,10,28,4,1,1,21,1,1,2,1,1,12,1,11,2,11,2,2,1,3,1,11,5,8,2,3,1,14,2],
+      ["selfish",157,1],
+      ["sell",32,1,10,1,24,1,4,1,12,1,23,1,17,1,12,1,23,1,22,2],
+      ["seller",16,1,97,1,43,3,10,1],
+      ["selling",32,1,35,1,13,2,8,1,17,1,35,1,12,1,14,2,13,4,22,2],
+      ["semantic",86,1],
+      ["semantically",208,1],
+      ["semester",80,1],
+      ["semi",24,1,6,1,43,1,23,1,22,1,6,2,41,1,46,1,12,1],
+      ["semiconductor",226,1],
+      ["seminal",179,1],
+      ["seminar",167,1,45,1],
+      ["send",132,2,2,1,8,2,12,3,37,1,28,1,1,1,1,2],
+      ["sender",221,1],
+      ["sending",13,2,93,1,36,1,12,1,1,1],
+      ["senior",14,1,6,3,62,1,52,1,13,1],
+      ["senju",106,2],
+      ["sensation",3,2,158,1,29,1,34,1],
+      ["sensational",41,1,172,1],
+      ["sense",8,2,1,1,6,1,6,1,5,4,1,1,6,1,1,1,7,2,1,1,3,1,9,1,4,1,2,2,11,4,7,11,3,1,4,1,1,2,5,1,2,4,5,1,20,3,2,3,8,1,17,1,5,1,4,4,1,1,2,1,3,1,6,1,1,1,3,2,6,1,3,3,3,1,2,1,6,1,13,1,1,1,1,2,6,1,1,1,1,1,3,1,6,1,3,1],
+      ["sensible",153,1,7,1,40,1],
+      ["sensitive",11,1,26,1,2,1,20,1,6,1,3,1,3,2,1,1,6,1,5,1,3,1,17,1,51,1,26,1,8,1,13,1],
+      ["sensitivity",71,2],
+      ["sensor",63,1,63,2,32,1,1,1],
+      ["sensory",71,1,7,1,20,1,23,1,60,1,4,1,36,1],
+      ["sent",4,1,13,1,14,1,32,1,1,1,41,1,17,1,14,1,19,1,22,3,15,1,6,1],
+      ["sentence",57,1,18,1,73,1,19,1,45,1],
+      ["sentiment",87,1],
+      ["separate",14,1,15,1,20,1,2,4,22,1,6,1,14,2,45,1,2,1,9,1,10,1,24,1,1,1,18,1,3,1,13,1],
+      ["separated",51,1,33,1,3,1,68,1,19,3,42,1],
+      ["separately",35,1,38,1,67,1,78,1],
+      ["separating",172,1],
+      ["separation",172,2,29,1],
+      ["september",66,2,2,1,16,1],
+      ["sequence",18,1,34,1,109,1,35,1,9,2],
+      ["sequentially",173,1,8,1],
+      ["serious",4,1,3,1,44,1,18,1,7,2,26,1,7,1,1,1,12,1,6,1,9,1,4,1,10,1,10,1,4,1,10,1,4,1,9,2,5,2,6,1,14,1,1,1,5,1,1,9],
+      ["seriously",4,1,7,1,6,1,16,1,7,1,9,1,111,1,48,1],
+      ["seriousness",171,1],
+      ["serrated",127,1],
+      ["servant",0,1,77,1,11,2,21,1],
+      ["serve",41,2,13,2,14,1,14,1,24,2,5,1,10,1,25,6,8,1,18,1,1,2,9,1,32,1,2,1],
+      ["served",50,1,57,1,9,1,35,1,6,1,13,1,1,1,14,1,3,1,7,1,26,1],
+      ["server",85,1],
+      ["service",0,1,5,1,10,2,40,1,15,1,7,1,8,2,9,1,3,1,13,1,3,1,21,1,13,3,8,1,7,1,4,3,6,1,15,1,4,7,10,1,18,1,4,1],
+      ["servicemen",136,1],
+      ["servicing",117,1],
+      ["serving",1,1,156,1,49,1],
+      ["sery",11,1,1,1,2,1,10,1,2,1,5,1,13,2,1,2,5,1,2,1,15,1,12,1,2,4,9,1,8,1,7,1,8,1,1,1,9,1,9,1,5,1,18,1,4,1,9,1,1,1,1,1,5,10,2,2,18,1,3,1],
+      ["session",2,1,10,1,60,1,102,1,24,4],
+      ["set",0,1,2,1,2,2,1,2,1,1,2,2,3,1,1,4,1,4,1,4,5,1,3,1,2,6,1,1,7,2,2,3,2,1,2,1,4,1,2,3,1,1,4,1,10,1,1,1,2,2,4,3,4,1,3,1,4,1,3,1,2,1,2,3,2,1,5,1,1,2,5,4,3,1,1,2,4,1,1,1,3,1,2,1,2,1,9,2,9,1,1,1,4,1,1,1,3,1,1,1,8,2,5,2,2,1,1,1,2,1,4,1,1,1,1,1,2,1,1,2,2,2,1,1,2,1,1,2,6,1,2,1,2,4,6,1,6,1,4,1,6,1,1,1,5,1,1,1,4,1,9,1],
+      ["setar",46,2],
+      ["setback",6,1,107,1,81,1],
+      ["setting",19,2,5,1,2,10,8,2,10,1,10,1,5,1,4,1,18,1,14,1,3,1,20,1,1,2,2,2,42,1,5,1,14,1,10,1,3,1,3,1],
+      ["settle",51,3,136,1,7,1],
+      ["settled",1,1,15,4,23,1,22,1,55,1,7,1,1,1,12,1,11,1],
+      ["settlement",38,1,2,6,70,1,6,1,1,1,7,1,11,1,12,5,4,1,17,1,24,1,31,1],
+      ["settler",1,1,89,4,6,1,7,1,7,1,28,2,49,1,7,1,8,2,3,1],
+      ["settling",200,1],
+      ["setup",92,1,129,1],
+      ["seven",14,1,6,1,33,1,5,1,3,1,2,1,25,1,6,1,3,1,2,1,30,5,1,1,13,2,14,1,3,1,4,1,11,1,8,1,1,1,41,1],
+      ["seventeenth",28,1,38,1,21,1,107,1,13,1],
+      ["seventh",196,1],
+      ["seventy",92,1],
+      ["sevepi",201,2],
+      ["several",0,1,2,2,2,1,6,1,2,1,1,1,1,1,2,1,2,1,4,1,2,1,2,2,9,2,1,1,1,2,1,1,8,2,5,1,2,2,8,1,3,1,3,1,1,2,1,1,3,2,3,1,4,1,4,1,3,2,3,1,2,1,2,1,2,1,2,1,8,2,2,1,1,1,5,2,2,1,2,1,2,1,3,1,1,1,2,1,1,1,3,1,6,3,1,2,3,1,1,1,2,1,6,1,1,2,2,1,4,2,4,1,5,1,1,2,6,1,3,2,1,1,1,1,1,2,6,1,4,1,2,1,7,3,1,1,3,3,4,1,3,4,1,1,10,1,3,1,5,1],
+      ["severe",5,1,30,1,8,1,5,1,10,1,38,1,18,1,10,2],
+      ["severely",124,1,84,1],
+      ["sewage",48,2],
+      ["sewing",140,2],
+      ["sewn",98,1,9,1],
+      ["sex",49,1,34,1,15,1,12,1],
+      ["sexe",49,1,61,1,87,1],
+      ["seymour",160,1],
+      ["shabbier",50,1,68,1],
+      ["shade",44,1,3,1,96,3,52,1,21,1,3,1,3,1],
+      ["shaded",177,1],
+      ["shadow",41,1,11,1,41,1,132,1],
+      ["shady",50,12],
+      ["shake",174,1],
+      ["shaken",33,1],
+      ["shakespeare",145,27,26,1,12,1,7,1,13,26],
+      ["shale",45,15],
+      ["shall",40,1],
+      ["shallow",7,1,14,1,31,1,27,1,15,1,16,1,3,1],
+      ["shang",107,1],
+      ["shanghai",163,1,42,1],
+      ["shank",1,2],
+      ["shanley",179,19],
+      ["shape",1,2,9,1,5,1,6,1,1,4,9,1,6,2,7,1,1,1,1,3,5,1,1,4,2,1,5,1,3,2,3,1,16,1,8,1,4,2,14,1,1,1,3,1,4,1,25,1,6,1,4,1,5,1,10,4,2,1,10,1,9,1,5,1,3,1,2,1,9,1,7,1,4,1,6,1],
+      ["shaped",1,2,21,1,15,1,7,1,2,1,6,3,2,1,5,1,8,1,17,1,20,1,31,1,30,1,2,2,45,2,6,2,4,2],
+      ["shaping",111,1],
+      ["share",3,3,5,1,1,1,5,4,4,1,8,1,13,1,9,1,5,1,3,1,1,2,3,1,1,1,1,1,18,1,3,1,8,1,9,1,4,1,3,1,3,2,18,15,12,1,16,1,6,1,10,1,11,2,36,1],
+      ["shared",8,1,1,1,16,1,1,1,1,1,68,1,27,2,23,2,17,1,5,1,36,2,8,1,1,1,1,1,9,1],
+      ["shareholder",33,1],
+      ["sharing",14,1,22,1,38,1,83,1,65,1,3,1],
+      ["shark",1,1,4,2,47,1,92,1,38,1],
+      ["sharp",48,1,55,1,15,1,7,1,43,5,9,1,21,1,24,1],
+      ["sharpen",26,1],
+      ["sharper",217,1],
+      ["shattered",5,1,118,1],
+      ["shaun",205,1],
+      ["shaw",171,1],
+      ["shawn",189,2],
+      ["sheath",10,1],
+      ["shed",10,1,17,1,57,2,104,1,4,1,24,1],
+      ["shedding",91,1],
+      ["sheen",68,1],
+      ["sheep",10,3,57,1,12,1,11,2,12,7,3,1,2,1,31,3,6,1,41,1,7,1,2,4,5,7,3,3,15,2,1,1,4,2],
+      ["sheer",94,1,34,1,54,1,8,1],
+      ["sheet",107,2,70,1],
+      ["shelf",22,1,92,1,19,1],
+      ["shell",1,2,20,1,17,1,6,7,1,1,1,1,1,3,3,1,58,3,15,1,4,1],
+      ["shellfish",38,1,12,1,77,1],
+      ["shelter",5,1,16,1,6,1,13,1,16,1,67,2],
+      ["sheltered",123,1],
+      ["shelton",174,4],
+      ["shelve",134,3],
+      ["shen",0,1,88,2],
+      ["shep",223,1],
+      ["sherif",184,4],
+      ["sherlock",109,1],
+      ["sherman",158,1],
+      ["shield",113,2,59,1],
+      ["shielding",177,1],
+      ["shift",36,1,3,1,15,1,26,1,18,1,44,1,18,1,10,1,4,2,4,1,10,1,21,1],
+      ["shifted",54,2,26,1,50,1],
+      ["shifting",39,1,15,1,88,1],
+      ["shiller",128,2],
+      ["shimmering",34,1],
+      ["shining",18,1],
+      ["shiny",217,1],
+      ["ship",1,1,34,1,9,1,4,1,4,1,9,1,3,2,2,16,22,3,3,5,8,1,12,1,2,1,3,3,7,9,18,1,8,2,31,3,7,2,5,2],
+      ["shipbuilding",44,1],
+      ["shipman",222,1],
+      ["shipment",66,1,74,1],
+      ["shipowner",66,1],
+      ["shipped",38,1,50,1,52,1,1,1],
+      ["shipping",38,1,58,1,21,1,12,2,11,1],
+      ["shipworm",123,1],
+      ["shipwreck",192,1],
+      ["shipyard",217,1],
+      ["shire",33,3],
+      ["shirt",184,1],
+      ["shock",33,1,2,1,180,1],
+      ["shocked",95,1,62,1],
+      ["shoe",23,2,28,1,106,1],
+      ["shoot",216,1],
+      ["shop",0,1,25,1,22,1,8,1,27,1,3,1,55,4,26,1,4,1,4,1],
+      ["shopkeeping",55,1],
+      ["shopper",30,1,84,1,38,1],
+      ["shopping",47,1,12,1,23,1,32,1,38,2,48,1],
+      ["shore",110,1,11,1,4,2,55,1,12,1,3,1],
+      ["shoreline",196,3],
+      ["short",3,2,1,4,5,1,11,1,1,1,7,1,6,1,9,1,2,1,7,1,7,1,24,1,2,1,21,1,3,1,5,3,7,1,1,1,4,3,2,1,5,1,1,1,3,4,15,1,15,1,4,1,10,1,4,1,22,1,3,1,2,1,7,1,4,1],
+      ["shortage",9,1,18,1,72,1,23,1,2,1,9,1,9,1,11,1,9,1,59,1],
+      ["shortcoming",178,1],
+      ["shortcut",94,1,106,1,22,1],
+      ["shortened",27,1,118,1,58,1],
+      ["shortening",126,1],
+      ["shorter",65,1,32,1,23,1],
+      ["shortfall",76,1],
+      ["shorthand",190,1],
+      ["shortlist",188,1],
+      ["shortly",31,1,46,1,7,1,4,1,4,1,7,1,12,1,58,1,41,1,8,1],
+      ["shostakovich",171,1],
+      ["shot",90,1,41,1,1,1,6,1,64,1,7,2,2,1,13,1],
+      ["shoulder",10,2,17,1,154,1,11,1,1,1],
+      ["shouldn",16,1,96,1],
+      ["shout",174,1,45,2],
+      ["shove",97,1],
+      ["show",3,1,3,3,3,3,2,1,1,4,2,1,2,1,2,3,2,6,4,1,1,2,5,1,2,2,5,3,2,2,4,1,2,1,1,1,1,1,2,1,5,2,2,1,2,1,10,2,2,1,1,2,5,4,2,1,3,1,2,1,7,1,2,1,1,1,5,1,2,1,1,1,3,1,2,6,8,1,1,1,8,1,3,2,1,1,2,1,1,2,1,1,4,1,2,1,10,2,3,1,3,1,2,1,1,1,1,1,3,1,5,1,2,2,3,2,5,18,1,3,1,1,1,1,3,1,4,1,4,1,8,3,3,1,4,3,1,2,2,1,3,1,2,2,1,1,1,1,1,1,1,2,1,1,2,2,2,1,1,2,3,1,1,1],
+      ["showcasing",34,3],
+      ["showed",2,1,2,1,12,4,2,2,6,1,13,1,5,1,7,1,5,1,5,1,4,2,9,1,9,2,4,1,12,1,7,1,2,2,8,1,8,1,3,1,4,1,1,2,22,1,2,2,22,2,1,1,1,1,1,1,11,2,8,1,17,1,5,1,1,2],
+      ["shower",201,1],
+      ["showering",18,1],
+      ["showing",10,1,10,1,2,1,5,1,10,2,10,4,35,1,14,1,32,1,8,1,40,1,13,1,7,1,8,1,5,1,14,1,1,1],
+      ["shown",2,1,1,1,3,1,7,1,5,1,5,1,4,2,1,1,2,1,10,1,6,1,9,1,1,1,2,1,4,1,2,1,1,1,6,1,3,1,2,1,2,1,5,1,11,1,4,1,2,2,6,4,8,1,7,1,6,1,3,3,5,1,8,1,5,1,5,1,6,1,2,1,11,1,3,1,3,1,6,1,1,3,15,1,4,1,3,2,7,1,6,1],
+      ["showy",155,1],
+      ["shrank",25,1],
+      ["shred",139,1],
+      ["shredded",139,1],
+      ["shrewder",171,1],
+      ["shrimp",48,1,111,2],
+      ["shrink",98,1],
+      ["shrinking",75,1,15,1,104,1],
+      ["shrunk",114,1],
+      ["shu",158,1],
+      ["shub",46,1],
+      ["shunned",16,1],
+      ["shus",158,2],
+      ["shut",59,2,34,3,88,1,4,1,28,1],
+      ["shutting",220,1],
+      ["shuttle",181,1],
+      ["shuttled",142,1],
+      ["shy",91,1,14,1,52,1],
+      ["siberia",223,1],
+      ["siberian",223,2],
+      ["sibling",54,1,132,1,39,16],
+      ["sick",17,1,96,1,12,1],
+      ["side",3,1,8,1,6,2,11,1,3,1,15,2,6,4,11,1,17,1,3,3,1,3,9,1,12,1,21,1,1,1,4,2,6,1,19,3,5,1,4,3,12,1,5,1,5,1,10,2,7,1,6,4,12,2],
+      ["sideway",52,2],
+      ["siegel",17,2,26,3,142,1],
+      ["sifting",139,1],
+      ["sigh",37,1],
+      ["sight",63,3,15,1,15,6,32,1,2,1,27,1,6,1,8,1,48,1],
+      ["sighted",0,1,157,1],
+      ["sighting",141,1,3,8],
+      ["sigmund",17,1,143,1],
+      ["sign",20,2,7,1,4,1,22,1,14,9,7,18,21,1,11,1,6,2,9,1,2,1,14,2,8,1,9,1,1,6,11,1,6,1,5,2,5,1,8,2,11,1,2,1,6,1,2,1,5,1,4,1],
+      ["signage",53,1],
+      ["signal",10,1,1,1,6,2,30,1,10,1,3,1,8,5,14,1,1,2,6,1,11,2,6,5,48,5,1,1,20,1,5,1,30,1,6,1,4,1,1,6],
+      ["signaler",60,1],
+      ["signaling",219,1,2,3],
+      ["signalled",9,3,47,1,114,1],
+      ["signalling",104,1],
+      ["signature",75,1,130,1],
+      ["signed",31,1,43,1,12,2],
+      ["significance",27,1,14,1,2,1,2,1,51,1,55,2,20,1,35,1,8,1],
+      ["significant",1,1,2,1,12,1,1,1,7,1,5,2,8,2,13,1,9,1,6,1,6,1,5,2,3,1,9,1,3,1,2,1,2,2,2,2,3,1,3,6,4,1,2,1,7,1,4,1,3,3,8,1,4,1,2,1,4,1,13,3,2,1,21,2,1,1,1,1,1,1,7,4,1,1,12,6,5,1,4,2,9,2,5,2],
+      ["significantly",71,1,7,1,3,1,17,1,31,1,9,1,22,1,16,1,16,1,10,1,2,1,2,1],
+      ["signified",103,1],
+      ["signing",74,2],
+      ["sil",95,1],
+      ["silence",85,1,87,2,47,1],
+      ["silent",41,1,16,1,30,1],
+      ["silently",103,1,23,1],
+      ["silicate",129,2],
+      ["silicon",129,1,36,1],
+      ["silk",19,2,19,5,8,1,31,58,30,1,12,34,21,1],
+      ["silken",77,1],
+      ["silkily",149,1],
+      ["silking",119,2],
+      ["silkworm",77,3,42,1],
+      ["silva",179,1],
+      ["silver",53,1,44,4,2,1,9,1,13,1,97,1],
+      ["silvery",68,1],
+      ["sim",189,1],
+      ["similar",2,1,3,1,5,1,3,1,2,5,3,4,3,1,2,1,1,1,1,2,10,1,1,2,1,3,3,2,3,2,3,1,1,2,10,1,4,1,6,1,1,2,8,1,4,1,5,1,7,1,1,1,2,1,4,1,1,1,1,2,1,1,8,1,16,1,1,1,5,1,7,2,6,1,8,1,7,1,4,3,1,3,2,2,1,1,9,2,2,1,4,2,4,1,2,1,7,1,2,1,1,1,1,2,3,1,5,1,1,1,1,1,1,1,1,2,9,4,2,3,1,1],
+      ["similarity",48,1,134,1],
+      ["similarly",6,1,12,1,23,1,17,1,64,2,24,1,7,1,8,1,10,1,15,1,1,1,7,1,6,1,25,1],
+      ["simine",85,1],
+      ["simon",45,1,50,1,24,1,15,2,74,1],
+      ["simonio",218,1],
+      ["simonton",6,1],
+      ["simple",3,1,4,2,3,1,7,1,12,3,6,1,6,1,1,1,3,1,4,1,13,3,11,1,1,1,6,1,1,1,1,2,4,1,14,1,2,1,4,4,6,1,1,1,1,3,1,1,6,1,5,1,16,2,10,9,1,1,3,1,4,1,3,1,3,1,1,1,32,1,1,1,12,1,1,2],
+      ["simpler",13,1,6,1,133,1,15,1,45,1],
+      ["simplest",162,1],
+      ["simplicity",0,2,7,1,47,1,33,1,11,1,59,1],
+      ["simplification",13,1],
+      ["simplistic",109,1],
+      ["simply",2,1,7,1,3,1,6,1,2,2,2,1,17,1,3,1,7,1,1,1,1,1,1,1,1,1,1,1,2,1,4,1,10,1,9,1,1,1,4,1,5,2,1,1,4,1,4,1,6,2,4,1,1,1,3,1,2,1,17,1,1,2,2,1,4,1,2,1,5,4,1,1,2,2,4,2,14,1,9,1,4,1,1,1,3,1,2,1,1,1,4,1,7,1,3,1,2,1,1,4,1,1,3,1,1,1,6,1,1,1,2,1,2,1],
+      ["simpson",196,4],
+      ["simulate",30,2],
+      ["simulated",108,1],
+      ["simulating",13,1,176,1],
+      ["simulation",75,1,81,1,12,1,28,1],
+      ["simultaneous",98,1,64,1,6,1,13,1,16,1],
+      ["simultaneously",26,1,28,1,2,1,17,1,8,1,45,4,33,1,2,1,7,1,4,1,4,1,4,1,1,1,16,2],
+      ["since",5,1,5,1,2,2,1,1,1,1,3,2,4,1,7,1,3,1,2,1,2,1,4,1,2,1,3,2,4,1,7,1,5,2,5,1,1,1,1,1,1,1,3,1,4,1,3,1,2,1,1,1,1,1,5,1,3,2,3,1,3,2,3,1,7,2,4,2,2,1,1,1,2,1,8,1,1,1,1,1,2,2,1,1,3,1,1,1,2,1,1,2,1,2,1,1,3,1,2,1,2,2,4,2,1,1,1,1,2,1,8,1,1,2,6,1,1,1,3,1,4,3,3,1,2,1,3,2,4,3,4,2,3,1,11,1,1,1,4,1,2,1,10,2],
+      ["sincere",64,1,80,1,31,1],
+      ["sincerity",215,1],
+      ["sinensis",88,1],
+      ["sing",2,1,12,1,151,5,18,2,21,3],
+      ["singapore",101,1,62,1,3,1],
+      ["singer",46,1,173,1],
+      ["singing",14,1,4,1,65,2,82,2,23,1,16,1,15,1],
+      ["single",3,1,3,2,10,1,6,1,1,1,3,1,4,1,6,1,1,1,3,1,2,1,1,1,3,2,2,1,1,1,7,1,1,1,1,1,1,1,14,1,5,2,8,1,11,1,8,1,2,1,12,1,2,1,5,3,7,1,2,1,4,3,7,1,2,1,3,1,4,1,2,1,5,2,1,1,2,1,1,1,2,1,7,5,3,1,5,2,2,1,7,1,5,1,7,1,3,1,9,1,10,2],
+      ["singled",188,1],
+      ["singular",54,2,10,1,62,1],
+      ["singularity",182,1],
+      ["sink",15,1,37,2,108,1],
+      ["sinus",154,1],
+      ["sir",3,1,25,1,81,1,36,1,4,1,22,1,32,1,8,1],
+      ["sister",4,2,50,1,51,1,31,1,21,1,68,6],
+      ["sit",33,1,9,1,50,1,34,1,20,1,8,1,7,1,37,1],
+      ["sitar",46,1],
+      ["sitatunga",10,1],
+      ["site",13,1,8,10,4,1,1,1,1,1,4,2,9,16,4,1,3,2,3,2,1,1,5,12,6,1,1,3,7,3,9,1,5,6,16,1,15,1,3,2,3,1,2,1,4,1,2,1,7,1,11,7,4,1,4,3,14,7,37,1,4,8,4,5],
+      ["sited",21,1],
+      ["sitting",12,1,22,1,3,1,43,1,3,1,5,1,1,1,38,1,36,1,12,1,9,1],
+      ["situated",44,1,1,1,35,1,4,4],
+      ["situation",8,2,5,1,22,1,2,1,5,4,6,1,1,3,4,1,3,1,4,2,16,1,5,1,4,2,7,1,3,1,1,1,8,1,2,4,7,1,13,1,11,1,3,4,11,1,1,1,3,1,5,1,14,4,4,1,6,4,5,2,12,1,6,1,7,1],
+      ["siviy",92,2],
+      ["six",3,1,9,5,2,1,6,1,3,1,2,1,17,1,1,1,3,2,7,1,1,1,15,1,5,1,6,1,4,1,10,1,11,1,26,1,5,1,5,1,1,1,15,1,2,2,3,1,2,1,10,1,2,1,3,1,10,1,22,1,5,1,4,1],
+      ["sixpence",66,1],
+      ["sixteen",84,1],
+      ["sixteenth",87,2,1,2,106,1,23,2],
+      ["sixth",23,2,12,2,42,1,119,3],
+      ["sixthcentury",196,1],
+      ["sixty",144,1],
+      ["size",1,1,1,2,8,3,11,5,1,5,3,10,21,1,1,1,3,1,3,2,3,2,5,1,1,1,3,1,10,1,4,1,1,1,4,1,6,2,1,1,5,1,2,6,4,1,5,1,1,3,2,1,5,2,2,1,1,1,1,1,7,1,1,2,12,3,1,8,2,1,2,2,3,1,6,14,8,1,4,1,2,1,2,1,4,1,4,1,5,1,8,2,1,1,8,1,9,1,2,1,2,1,4,1,6,1,4,1],
+      ["sizeable",44,1,90,1],
+      ["sized",67,1,4,1,4,1,58,1,2,1,8,1,1,1,9,1,37,1,3,1,5,1,12,1],
+      ["skamt",207,2],
+      ["skateboard",84,1],
+      ["skateboarding",205,2],
+      ["skater",2,1],
+      ["skeleton",21,1,4,3,2,1,68,1,20,6,77,1],
+      ["skeptical",204,1],
+      ["skepticism",221,1],
+      ["sketch",93,1,2,1],
+      ["sketched",105,1],
+      ["sketching",105,1],
+      ["ski",90,1],
+      ["skier",93,1],
+      ["skiing",93,1],
+      ["skilful",189,1],
+      ["skilfully",211,1],
+      ["skill",1,1,1,3,4,2,5,4,4,2,21,1,11,3,2,2,4,2,1,2,1,2,2,3,1,2,13,2,3,4,4,2,2,2,1,3,5,1,3,1,3,3,19,1,10,1,2,1,7,2,1,1,14,1,14,1,1,1,2,1,1,1,5,1,3,2,1,1,2,1,1,2,1,2,3,2,2,1,4,2,1,6,3,10,5,2,4,1,5,1,3,2,5,2,4,2,7,5],
+      ["skilled",0,1,2,1,71,4,4,1,15,1,31,1,17,1,54,1],
+      ["skin",7,1,14,2,1,1,7,1,1,14,21,1,12,2,5,1,39,5,51,1,46,1,11,1,1,2,1,1,7,2,2,1],
+      ["skinner",160,1],
+      ["skip",156,1],
+      ["skipjack",52,1],
+      ["skull",27,4,83,1,5,2,35,1,4,1,38,19],
+      ["sky",103,1,12,1,6,2],
+      ["skyscraper",63,1,70,6],
+      ["slab",27,1,57,1],
+      ["slam",216,1],
+      ["slamming",164,1],
+      ["slashed",88,1],
+      ["slashing",33,1],
+      ["slaughtered",210,1],
+      ["sled",132,3],
+      ["sleek",63,1,25,1],
+      ["sleeker",66,1],
+      ["sleep",17,16,3,3,19,33,4,23,38,1,2,1,11,40,9,1,3,1,40,1,21,1,18,55,27,1,8,49],
+      ["sleeper",43,1,177,3],
+      ["sleepiness",220,1],
+      ["sleeping",17,1,22,4,4,4,51,2,63,2,28,1,35,7],
+      ["sleeplessness",43,1,177,1],
+      ["sleepy",103,1,3,1,114,2],
+      ["slender",1,2,65,1,25,1],
+      ["slept",17,1,22,4,181,1],
+      ["slew",132,1],
+      ["slice",69,1,104,1,12,1],
+      ["sliced",167,1,45,1],
+      ["slide",132,8,49,1],
+      ["slight",100,1,18,1,43,1,17,1],
+      ["slighter",10,1],
+      ["slightly",18,1,102,1,7,1,17,1,10,4,19,1,44,1],
+      ["slim",223,1],
+      ["slime",52,1],
+      ["slipped",28,1,67,1],
+      ["slippery",16,1,84,1,82,1],
+      ["sloan",73,1],
+      ["slope",69,1,46,1,17,1,64,1],
+      ["sloping",144,1],
+      ["slot",79,1],
+      ["sloth",75,1],
+      ["slovenia",35,1],
+      ["slow",3,1,21,1,3,1,5,24,3,1,17,1,9,1,4,2,1,2,18,3,9,1,18,1,27,1,11,4,7,1,33,1,13,1],
+      ["slowed",56,1,119,2],
+      ["slower",183,1],
+      ["slowing",124,1,2,1,32,1,38,1],
+      ["slowly",0,1,40,1,11,1,8,1,1,1,6,1,18,1,15,1,2,1,13,1,24,1,21,1,5,1,29,1,2,1,7,1],
+      ["slowness",149,12],
+      ["slum",112,1],
+      ["slurry",79,2],
+      ["smacked",219,1],
+      ["small",10,2,4,1,2,1,1,1,2,2,1,2,1,3,1,2,3,2,5,2,4,1,2,1,1,1,9,2,2,3,2,1,1,1,1,1,1,1,3,1,3,1,3,1,1,1,2,2,2,2,2,2,1,1,1,2,7,2,1,2,1,9,2,1,1,1,1,1,1,8,3,1,3,6,3,1,1,1,1,1,3,1,2,3,2,2,2,2,3,2,5,1,2,2,1,2,1,3,1,1,1,1,2,2,6,2,7,1,1,8,2,1,1,3,4,2,1,6,2,1,2,1,1,1,2,2,1,1,2,6,1,3,5,2,1,1,1,3,2,1,2,1,7,1,3,1,3,2,5,1,4,2,4,2,5,1,6,3,1,1,6,1,1,1,4,1,2,1,1,1,1,1,3,1,1,1,1,3,1,1,2,4],
+      ["smaller",13,1,1,1,5,1,9,1,4,1,18,1,11,1,9,1,5,1,4,1,24,1,26,1,4,1,5,1,1,1,3,2,11,2,3,1,13,1,4,2,29,1,2,3,1,1,3,1,17,1],
+      ["smallest",87,1,78,1,61,2],
+      ["smallness",13,1],
+      ["smart",66,1,4,1,58,1,35,1,26,1,16,1],
+      ["smarter",92,2,84,1,13,1],
+      ["smartest",13,1,114,1],
+      ["smartphone",104,1,22,3],
+      ["smear",217,1],
+      ["smell",65,1,6,25,7,33,15,1,6,1,17,1,55,1],
+      ["smelling",51,1,20,1,7,1,14,2,33,1,29,1],
+      ["smelt",23,7],
+      ["smet",96,1],
+      ["smile",60,3,95,1,6,1],
+      ["smiling",37,1],
+      ["smit",91,1],
+      ["smithsonian",97,1,61,1],
+      ["smoke",112,1,101,1],
+      ["smoked",23,1],
+      ["smoker",209,1],
+      ["smoking",61,2,148,1],
+      ["smooth",52,1,5,1,50,1,14,1,92,1,4,1],
+      ["smoothest",21,1],
+      ["smoothly",213,1,5,1],
+      ["smoothness",108,1],
+      ["smouldering",127,1],
+      ["smuggle",88,1],
+      ["smuggled",88,1,130,1],
+      ["smuggling",88,2],
+      ["snack",70,1,130,2],
+      ["snail",76,1],
+      ["snake",52,1,37,3,52,1,81,1],
+      ["snap",59,2,42,1,20,1,31,1,67,1],
+      ["snapped",59,1],
+      ["snapshot",98,1,61,1,29,2],
+      ["snatched",99,1],
+      ["snatching",36,1],
+      ["sneak",69,1,20,1],
+      ["sneaked",99,1],
+      ["sneeze",3,3],
+      ["snipe",144,1],
+      ["snow",21,1,58,2,11,4,6,2,53,1,8,3],
+      ["snowden",137,6],
+      ["snowed",81,1],
+      ["snowfield",90,1],
+      ["snowmelt",90,2],
+      ["soak",27,1,8,1],
+      ["soar",112,1,61,5],
+      ["soccer",92,1,39,40],
+      ["social",10,1,1,1,3,3,1,3,11,1,6,1,1,1,1,1,2,2,3,1,2,19,1,1,5,2,9,2,4,8,3,1,1,1,5,1,1,1,2,1,2,2,7,3,3,2,1,5,1,2,1,1,5,5,3,1,3,2,2,1,2,1,2,2,1,1,1,4,3,1,9,4,4,16,5,2,10,1,9,1,1,2,1,1,2,1,1,1,1,3,3,1,7,1,8,1,2,3,4,1,2,8,11,1,6,1,3,6,1,1,1,2,7,5,2,2,2,2,3,2,2,1,6,2,3,2],
+      ["sociality",98,1],
+      ["socialization",198,1],
+      ["socialize",198,1],
+      ["socialized",92,2],
+      ["socializing",63,1],
+      ["socially",15,1,41,1,36,2,35,1,51,1,20,1,22,1],
+      ["societal",122,1],
+      ["societe",208,3],
+      ["society",0,4,9,1,4,1,1,3,2,1,12,1,10,1,1,1,4,5,4,6,3,2,11,2,6,1,8,1,2,1,11,1,11,1,3,1,7,4,2,4,5,1,4,1,2,12,2,1,1,2,9,1,2,1,1,1,2,1,3,1,4,5,1,15,5,1,5,1,2,1,10,2,1,1,10,1,6,4,2,1,10,1,1,1,8,1,1,1,1,1,2,3],
+      ["socio",49,2,69,1,37,1],
+      ["sociobiology",150,1],
+      ["socioeconomic",34,1],
+      ["sociolinguistic",86,1],
+      ["sociological",131,1,47,2],
+      ["sociologist",8,1,170,2],
+      ["sociology",178,1],
+      ["sock",184,1],
+      ["socotra",125,1],
+      ["sodium",79,1],
+      ["soft",11,1,8,1,4,7,4,1,3,1,5,1,2,1,8,4,14,1,48,1,10,1,8,1,47,1,22,3,2,1,21,1,1,2,2,1],
+      ["softball",118,1],
+      ["soften",51,1],
+      ["softened",19,5,88,2],
+      ["softening",79,1,78,1,1,1],
+      ["softer",54,1,104,1,59,1,3,1],
+      ["software",70,1,86,16],
+      ["softwood",107,1,10,2],
+      ["soil",33,4,26,1,10,4,10,1,11,10,6,5,3,1,2,1,12,1,11,3,1,1,8,2,2,4,8,1,34,1,16,2,8,6,9,1,11,2],
+      ["solanaceae",224,2],
+      ["solar",13,1,46,1,5,1,15,2,11,1,30,1,22,4,22,1,13,2,18,5,31,1],
+      ["sold",22,1,10,1,1,1,33,1,4,1,10,1,10,1,6,1,1,1,20,1,23,2,9,1,8,1,22,2,14,1,20,1],
+      ["soldier",31,1,46,1,22,1,90,1,22,1],
+      ["sole",10,1,100,1,35,1,58,1,20,1],
+      ["solely",27,1,7,1,39,1,68,1,13,1,24,1],
+      ["solid",23,1,21,1,4,1,3,1,62,1,4,1,2,4,15,1,19,1,12,1,8,1,4,2,9,1,34,1],
+      ["solidify",4,1,19,1],
+      ["solidly",182,1],
+      ["solipsism",206,1],
+      ["solitary",10,2,102,1,26,1,36,1,28,1],
+      ["solitude",85,1],
+      ["solm",17,3],
+      ["solomon",192,1],
+      ["soluble",23,1],
+      ["solution",19,1,8,1,11,1,6,1,5,1,4,1,9,1,2,1,5,3,1,1,2,1,9,1,1,1,14,1,1,1,2,1,3,1,6,1,14,1,5,2,11,1,14,3,6,1,4,1,1,1,3,2,29,1,4,1,3,1,24,4],
+      ["solvable",131,1],
+      ["solve",17,2,18,1,23,1,6,1,1,1,44,1,13,1,4,1,8,1,8,1,14,1,3,1,13,1,3,1,11,1],
+      ["solved",34,1,28,1,32,1],
+      ["solvent",23,1,191,1],
+      ["solving",8,1,9,1,75,1,2,1,33,1,7,4,15,1,35,2,5,2,1,1],
+      ["some",0,1,1,2,1,4,1,1,1,1,2,1,1,1,1,2,1,3,1,3,1,1,1,1,2,1,1,12,1,8,1,5,1,3,2,5,1,7,1,1,1,8,1,1,1,5,1,2,1,1,1,3,1,3,1,2,1,4,1,5,1,2,2,1,1,3,1,7,1,4,1,1,1,4,2,3,1,5,1,1,1,1,2,5,2,4,2,2,1,1,1,4,2,4,1,2,2,8,1,3,1,1,1,2,1,1,1,5,1,1,1,5,2,2,1,4,2,1,2,2,2,3,1,5,1,3,1,2,1,1,1,1,2,3,1,1,1,3,1,2,1,2,1,4,2,2,1,3,1,1,1,2,1,1,1,2,1,2,1,8,1,1,1,1,2,1,1,8,1,1,1,4,1,1,1,2,1,3,1,10,1,1,1,1,1,1,1,5,1,3,1,1,2,2,1,2,3,8,1,2,1,1,1,3,2,4,1,5,1,5,1,1,1,2,1,3,1,2,1,3,1,5,1,2,1,2,2,3,1,3,1,2,1,2,1,1,1,3,1,2,1,1,1,2,1,2,1,6,1,9,1,4,1,1,2,1,3,5,2,1,1,1,1,2,1,4,1,2,1,1,1,2,2,2,1,4,1,3,1,3,1,6,1,3,1,3,1,1,1,2,1,4,1,4,1,2,3,1,1,5,1,2,1,3,2,2,1,2,1,1,2,2,1,2,1,4,1,6,1,7,1,6,1,1,1,3,2,1,1,1,1,2,1,1,1,4,1,1,2,2,1,6,1,2,1,3,1,3,1,10,2,5,1,2,2,6,1,1,1,4,1,5,1,1,1,1,1,2,2,4,1,4,3,3,1,1,1,5],
+      ["somebody",100,1],
+      ["someday",142,1],
+      ["somehow",100,1,1,1,70,1,45,1],
+      ["someone",2,2,4,1,3,1,4,1,2,2,12,1,28,1,2,1,1,1,2,1,3,1,9,1,14,4,14,1,4,2,2,2,5,1,4,1,11,2,8,1,10,1,1,2,1,1,2,1,1,1,9,1,17,4,28,2,3,1],
+      ["someplace",133,1],
+      ["somerset",111,1],
+      ["something",2,3,2,1,3,2,5,1,3,2,4,1,1,2,5,5,6,1,1,1,2,1,3,1,5,1,1,1,2,1,4,1,5,1,3,2,3,1,2,2,5,2,1,2,4,1,1,1,3,1,2,2,2,1,2,1,3,1,2,1,1,1,1,1,2,6,1,1,1,2,1,1,6,3,1,1,13,2,13,1,15,4,2,3,1,1,1,8,3,1,2,2,3,1,3,1,3,1,1,2,1,1,1,1,1,1,1,1,2,1,3,1,4,1,2,2,2,2,1,2,3,1,3,1,2,1,1,2,2,1,2,1,4,1,1,1,1,1,2,1,3,1,1,1,1,2,2,1,1,2,1,2,3,1,1,2,2,2,7,1],
+      ["sometime",1,2,7,2,1,1,4,2,2,8,5,1,1,1,1,1,7,1,10,1,3,1,3,2,9,1,6,1,6,1,3,2,1,1,10,1,2,1,3,1,1,1,10,2,7,1,3,1,1,1,6,1,5,1,3,1,3,1,22,4,11,1,11,1,3,1,3,2,2,1,6,1,7,1,2,1,9,1,6,1,1,1,2,1,8,1,2,1,1,1,4,1],
+      ["somewhat",40,1,3,1,24,1,21,1,31,1,86,1],
+      ["somewhere",69,1,95,1,24,1],
+      ["son",15,1,49,1,81,1,24,1,20,1,14,1,12,1],
+      ["song",14,5,4,21,23,1,42,2,24,1,8,1,31,1,19,3,1,1,1,3,5,3,7,1,25,1,8,3],
+      ["sonic",18,1],
+      ["sonja",159,1],
+      ["sony",198,1],
+      ["soon",13,1,1,1,5,1,6,1,2,1,7,1,3,1,1,1,1,2,6,1,1,1,10,2,3,1,2,1,1,1,11,1,4,1,2,1,1,3,7,1,1,2,19,1,6,1,11,1,3,1,1,1,2,1,1,1,1,2,26,1,17,1,4,1,1,1,3,2,5,1,2,2,17,2,11,1,3,1,1,1,1,2],
+      ["sooner",36,1,92,1],
+      ["soothe",83,5],
+      ["sophisticated",29,1,30,2,2,1,4,1,17,1,10,1,6,1,2,1,21,1,6,1,3,1,9,1,6,1,5,1,19,1,34,1,1,1,2,1,15,2],
+      ["sophistication",162,1,33,1,24,1],
+      ["sorely",208,1],
+      ["soriano",205,2],
+      ["sorrow",83,1],
+      ["sorry",58,4],
+      ["sort",6,1,9,1,1,1,5,2,4,2,15,1,39,1,2,1,1,2,9,1,13,1,9,1,5,1,14,3,27,1,9,1,11,1,2,1,8,1,1,2,8,1,3,1,3,2],
+      ["sorting",2,1,154,1],
+      ["sosus",180,5],
+      ["sought",27,1,1,1,1,1,7,2,28,1,13,1,13,1,10,1,6,1,3,1,2,2,19,1,5,1,37,1,22,1,19,1],
+      ["soul",116,1,4,1],
+      ["sound",14,2,21,1,18,1,25,1,4,1,1,2,3,1,8,1,6,8,2,1,1,1,3,1,4,1,44,10,10,1,1,11,2,17,5,4,2,1,1,1,5,21,19,1,5,1,3,13,5,17,9,1],
+      ["soundboard",46,1],
+      ["soundbox",46,2],
+      ["sounding",100,1,51,1,45,1],
+      ["soundscape",167,1,45,1],
+      ["soundtrack",97,1,49,1],
+      ["soup",149,1],
+      ["source",1,2,14,1,1,1,10,1,1,1,1,1,4,1,6,4,17,1,1,1,6,1,2,1,4,1,2,1,8,1,1,4,7,14,4,1,2,1,8,1,7,2,10,1,8,1,1,1,6,1,4,2,3,1,1,2,1,1,1,4,3,1,2,1,4,1,4,3,7,3,6,2,5,1,6,1,1,1,15,1,6,1,2,1,4,1,4,1,6,1,1,1,4,7],
+      ["sourcing",122,2],
+      ["south",4,1,13,1,4,2,1,1,1,9,11,1,6,7,4,1,3,1,1,1,2,5,15,1,1,1,9,1,1,1,8,5,15,1,2,1,7,2,8,1,1,2,4,1,2,2,7,4,6,2,2,1,1,1,2,3,2,1,1,4,14,1,4,1,7,2,2,1,5,1,1,1,15,1,1,3,5,1,3,1,1,1,15,1,6,4],
+      ["southeast",10,1,59,1,69,1,30,1,34,1],
+      ["southern",31,1,9,2,24,3,3,1,17,1,7,1,16,1,6,1,4,1,4,1,26,2,11,1,14,1,4,1,1,1,17,1,29,1],
+      ["southernmost",66,2],
+      ["southward",40,1],
+      ["southwest",90,4,48,1,9,1,55,1],
+      ["southwestern",27,1],
+      ["souvenir",113,1],
+      ["soviet",18,1],
+      ["sowing",164,1],
+      ["space",13,25,2,1,12,1,7,1,7,1,3,1,10,2,1,1,8,2,1,2,9,1,11,1,3,1,5,1,4,1,7,1,11,1,4,1,2,2,3,1,8,2,4,1,3,1,3,1,1,25,1,1,8,6,4,1,2,1,4,1,3,4,6,1,2,5,5,1,3,1,10,1,1,1,4,1,7,1,3,1,12,3],
+      ["spacecraft",142,2,22,1,13,1],
+      ["spaced",79,1,36,1,110,1],
+      ["spaceship",13,1,129,1],
+      ["spacious",80,1],
+      ["spagna",32,1],
+      ["spain",22,2,5,1,7,1,4,1,8,2,5,1,13,1,35,1,8,1,1,1,48,1,2,2,19,1],
+      ["span",69,1,57,2,2,1,5,1,41,2],
+      ["spaniard",99,1],
+      ["spanish",23,1,23,1,21,1,7,1,25,3,17,1,40,1,6,1,15,1,15,2],
+      ["spanning",5,1,4,1,111,1,1,1,15,1,4,1,40,1,2,1],
+      ["spark",94,1,74,1],
+      ["sparked",100,1,113,1],
+      ["sparkle",98,1],
+      ["sparse",133,1],
+      ["sparsely",155,1],
+      ["spatial",81,1,95,1,13,2],
+      ["spatially",170,1],
+      ["spawn",91,6],
+      ["spawning",91,1],
+      ["speak",41,1,13,2,41,4,25,1,6,1,22,1,1,2,18,5,7,1,9,3,21,1,3,3,5,5,8,1],
+      ["speaker",95,6,53,2,1,1,13,1,24,1,18,1,3,1,12,1],
+      ["speaking",36,1,18,1,4,1,27,4,10,1,7,1,46,1,5,1,4,1,1,1,4,1,5,1,19,2,13,1,13,1],
+      ["spear",27,1,195,5],
+      ["special",7,4,22,1,1,1,1,2,13,1,15,1,1,1,3,1,2,1,3,1,6,1,9,1,3,2,9,1,2,1,10,3,12,1,3,1,31,2,7,1,4,1,1,1,2,3,11,1,4,1,9,2,5,1,1,2,15,3,7,1],
+      ["specialisation",8,1,3,1,136,1],
+      ["specialise",0,1,20,1,56,1,20,1,95,1],
+      ["specialised",58,1,10,1,8,1,13,1,4,1,35,2,11,1,3,1,17,1,3,1,1,1,14,1,14,1,3,4],
+      ["specialising",80,1,34,1],
+      ["specialist",35,1,40,1,6,2,14,1,42,1,10,3,45,1,22,1],
+      ["speciality",81,1],
+      ["specialization",50,1,2,1,9,1],
+      ["specialize",52,2],
+      ["specialized",52,1],
+      ["specializing",82,1,137,1],
+      ["specially",7,1,14,1,86,1,26,1,57,2],
+      ["specific",1,1,10,1,1,1,14,1,6,2,22,1,4,2,2,2,10,2,2,1,3,1,6,1,5,1,7,1,23,1,4,1,4,1,17,1,2,1,4,1,1,1,7,1,1,2,1,1,6,1,4,1,7,2,2,1,4,1,24,2,4,1,4,1],
+      ["specifically",13,1,15,1,37,1,3,1,14,1,20,5,21,1,43,1,1,1,32,5,6,1,7,1],
+      ["specification",79,1,61,1],
+      ["specified",5,1,3,1,78,1],
+      ["specify",122,1],
+      ["specifying",140,1],
+      ["specimen",45,3,58,2,32,1,9,1,43,1,36,2],
+      ["speck",27,1],
+      ["speckled",103,1],
+      ["spectacle",87,1,25,1,76,1],
+      ["spectacular",25,1,9,1,10,1,11,1,36,1,79,2,22,1,13,1],
+      ["spectator",57,3],
+      ["spectral",190,1],
+      ["spectre",5,1],
+      ["spectrometer",27,1],
+      ["spectrum",41,1,42,1,23,2,50,2,45,1],
+      ["speculate",40,1,8,1,2,1,51,3,76,1,5,1,28,1],
+      ["speculated",3,1,78,1,35,2,80,1],
+      ["speculative",90,1],
+      ["speculator",90,1],
+      ["specy",1,2,6,1,3,9,4,2,8,3,2,1,1,2,2,3,5,5,6,1,7,1,2,1,1,11,4,2,4,1,3,4,6,1,3,6,1,1,6,9,9,1,5,9,2,12,7,3,5,2,5,1,2,5,5,3,2,3,4,3,4,1,1,1,1,2,3,2,5,6,1,1,2,1,1,2,2,31,2,10,1,6,14,2,9,1,5,1,2,1,5,6,8,9,6,2,8,1,1,1,6,1,2,3,2,1,4,1,5,1,1,7,1,5,1,3],
+      ["sped",66,1],
+      ["speech",11,1,63,4,9,4,12,1,5,1,49,1,18,12,9,1,7,1,21,2,3,16,5,12],
+      ["speed",10,1,3,3,22,1,16,1,1,4,14,1,4,1,27,1,27,1,8,1,8,1,1,1,8,4,9,1,3,2,3,1,1,1,3,1,8,1,4,3,14,1,22,1],
+      ["speediest",165,1],
+      ["speeding",189,1],
+      ["spelaeus",27,1],
+      ["spell",182,1],
+      ["spelling",182,1,25,1],
+      ["spend",4,2,2,1,8,1,3,1,13,1,3,1,6,1,4,1,4,1,5,1,6,1,10,1,13,1,16,2,7,1,1,1,16,1,21,4,4,1,1,1,1,1,15,1,3,1,6,1,13,1,1,1,2,1,7,1,3,1,24,1,3,1],
+      ["spending",34,2,5,1,19,1,61,1,2,1,102,1],
+      ["spent",4,2,2,1,8,1,1,5,18,1,1,1,1,4,8,1,11,1,4,1,1,1,2,1,13,1,2,1,11,1,2,1,8,1,4,1,4,1,9,1,1,1,4,1,4,2,5,1,1,1,31,1,13,1,3,1,1,1,6,2,1,1,1,1,1,1,30,1,1,1,1,1,2,1,2,5,2,1],
+      ["sperm",125,9],
+      ["sphenodontia",110,1],
+      ["sphere",41,1,3,1,20,1,44,1,39,1,66,1],
+      ["spherical",64,2,52,1],
+      ["spice",65,3,60,1],
+      ["spicing",158,1],
+      ["spicy",158,3],
+      ["spider",103,1,16,34,16,2,8,12,11,1],
+      ["spike",25,2],
+      ["spill",196,1],
+      ["spilled",108,1],
+      ["spilling",216,1],
+      ["spin",55,1,64,2,7,1,35,3],
+      ["spine",45,3,8,1,6,1,51,1,106,1],
+      ["spinifex",224,3],
+      ["spinneret",119,1],
+      ["spinning",1,1,118,1,21,1,21,1,33,1],
+      ["spiral",47,1,129,1,49,1],
+      ["spirit",41,1,25,2,18,1,19,1,49,1,10,1,3,1,46,1],
+      ["spiritual",9,1,94,2,44,1,4,1],
+      ["spirituality",219,1],
+      ["spit",171,1],
+      ["spite",77,2,22,1,2,1,29,1,1,1],
+      ["splash",1,1],
+      ["splayed",10,1],
+      ["splendid",182,1],
+      ["splice",168,1],
+      ["split",10,1,4,1,8,2,53,1,17,1,9,1,29,1,26,1,15,1,2,1,16,1,8,1],
+      ["splutter",25,1],
+      ["spoil",61,1,154,1],
+      ["spoilage",65,1,93,1],
+      ["spoiled",122,1],
+      ["spoke",85,1],
+      ["spoken",74,2,9,1,3,2,9,2,16,1,37,2,20,1,15,1,25,1,5,1],
+      ["spokesman",5,1,128,1,1,1],
+      ["spokesperson",70,1],
+      ["sponsorship",88,1,82,1],
+      ["spontaneous",106,4,25,1,24,1,64,1],
+      ["spontaneously",106,1],
+      ["spoor",115,1],
+      ["spore",25,1,114,1],
+      ["sport",2,1,4,3,9,1,5,2,37,7,16,1,11,4,3,1,2,1,3,1,7,1,5,1,27,2,4,1,28,1,25,1,3,3,18,1,2,1,14,1],
+      ["sporting",184,2,4,2],
+      ["sportsman",223,1],
+      ["sportswear",140,1],
+      ["spot",14,1,4,1,3,1,18,1,29,1,1,1,20,1,14,1,5,1,7,1,15,1,7,1,1,1,18,1,18,1,1,1,6,1,17,1,4,1,14,1,4,1],
+      ["spotlight",131,1,41,1],
+      ["spotted",68,1,23,1,24,1,60,1],
+      ["spotting",82,1,16,1,46,1],
+      ["spouse",104,1,71,1,50,1],
+      ["sprang",31,1],
+      ["sprawl",75,1,37,1],
+      ["spray",214,2],
+      ["sprayed",137,1],
+      ["spraying",65,2],
+      ["spread",0,3,9,1,5,1,8,1,1,1,4,1,19,1,5,3,14,1,4,1,1,1,5,1,1,1,1,1,11,2,9,1,4,1,1,1,5,1,5,1,25,7,1,1,2,4,1,3,3,3,12,1,2,2,8,1,11,1,16,1,6,1,3,1,5,1,3,1,8,1,1,2,7,1],
+      ["spreading",23,1,135,2,35,1,14,1],
+      ["spreadsheet",181,1],
+      ["sprenger",68,1],
+      ["spring",59,1,11,1,26,1,10,1,4,1,11,1,6,1,8,1,32,1,43,4,1,1,1,1],
+      ["springbok",10,1],
+      ["springtime",90,1],
+      ["sprinkling",90,1],
+      ["sprint",57,1],
+      ["sprinter",57,1],
+      ["sprinting",57,1],
+      ["sprout",61,1],
+      ["spruce",107,1],
+      ["spun",77,1],
+      ["spurred",222,1],
+      ["square",21,1,6,1,8,1,72,1,31,1,10,1,21,1,26,1,6,1,1,1],
+      ["squash",50,3],
+      ["squeak",14,1,75,1],
+      ["squeaking",89,1],
+      ["squeeze",55,1],
+      ["squeezed",33,1,17,1],
+      ["squid",125,3],
+      ["squirrel",141,3,82,1],
+      ["squirt",193,1],
+      ["squishy",25,1],
+      ["ssimo",179,1],
+      ["st",16,1,95,1,5,1,49,1],
+      ["stabilise",23,1],
+      ["stability",129,1,67,1,22,1,7,1],
+      ["stabilizing",79,1],
+      ["stable",14,3,13,1,21,1,73,1,8,1,9,1,64,1,19,1],
+      ["stacked",123,1],
+      ["staff",6,1,9,5,5,1,8,1,27,1,30,1,12,1,53,1,41,1,18,1],
+      ["stag",151,1],
+      ["stage",12,3,6,1,30,1,3,1,4,2,12,1,6,1,8,3,3,1,4,1,6,7,46,3,20,1,1,1,1,2,2,1,5,1,5,1,4,1,4,1,3,2,1,1,32,1,6,1],
+      ["staged",12,1],
+      ["staggering",192,1],
+      ["staging",55,1],
+      ["stain",38,1,102,1],
+      ["stair",132,1],
+      ["staircase",44,1,6,2],
+      ["stairway",84,1],
+      ["stake",80,1,42,1,35,1,56,1],
+      ["stakeholder",122,1],
+      ["stale",113,1],
+      ["stalked",45,1],
+      ["stall",156,1],
+      ["stamina",200,1],
+      ["stamp",167,1,45,1],
+      ["stamped",67,2,37,1],
+      ["stand",5,1,5,2,22,1,10,1,13,1,30,1,68,1,2,1,5,1,22,1,16,1,18,1,1,2,2,1],
+      ["standard",3,1,3,3,9,2,1,1,8,4,6,1,16,1,7,2,9,1,2,3,9,3,13,1,10,2,1,1,20,1,1,1,4,6,9,1,9,1,1,1,11,1,9,1,2,3,5,1,7,1,3,1,10,2,2,1,5,2,20,1,2,1],
+      ["standardisation",140,4],
+      ["standardise",24,1],
+      ["standardised",73,2,22,1,27,1],
+      ["standardization",97,1],
+      ["standardize",97,1],
+      ["standardized",36,1,38,1,23,1,122,1],
+      ["standing",31,1,48,1,19,1,2,1,18,2,29,2,20,1,5,1,6,1,2,1,3,1,27,1,2,1,4,1,3,1],
+      ["stanford",6,1,24,2,33,1,89,1,1,1,1,4,2,1,64,3],
+      ["staple",99,3,39,1,64,1],
+      ["star",6,10,3,2,48,1,34,2,25,3,5,1,32,8,15,1,45,1,12,1],
+      ["starch",19,1],
+      ["stare",98,1,76,3],
+      ["stareater",91,1],
+      ["starfish",91,2],
+      ["staring",57,1,117,1],
+      ["starkly",190,1],
+      ["starling",130,1,57,1],
+      ["start",2,1,1,3,11,1,4,1,5,1,11,1,8,1,5,2,1,1,6,1,2,1,14,1,14,1,4,1,7,2,8,1,4,1,5,1,2,1,3,1,7,1,3,1,1,1,2,1,2,2,7,1,3,2,20,1,1,2,2,1,14,1,2,1,7,1,12,1,14,1,3,1,2,1,6,1],
+      ["started",2,1,1,1,2,1,7,1,4,4,8,2,1,1,4,1,10,1,5,1,2,1,1,1,10,1,4,2,19,1,35,1,4,2,13,1,4,1,5,1,13,1,11,1,19,2,4,1,3,1,9,1,5,1,11,1,1,1,4,1,4,3],
+      ["starter",97,1],
+      ["starting",2,1,17,1,10,1,5,1,21,1,7,1,7,1,13,1,6,1,2,1,1,1,9,1,4,1,11,1,15,1,46,1,10,1],
+      ["startled",3,1,74,1,12,1],
+      ["startling",177,1],
+      ["starvation",24,1,72,2,59,1],
+      ["starve",121,1,18,1],
+      ["starving",99,1],
+      ["state",2,1,1,1,3,1,4,1,10,2,2,1,2,2,4,1,1,3,4,1,1,4,1,1,1,2,9,1,2,1,1,3,1,1,6,1,5,1,3,2,1,2,1,1,5,1,1,4,1,1,1,1,3,2,1,1,4,6,2,2,1,1,1,4,5,1,3,1,1,1,1,1,1,1,4,4,1,1,5,2,8,2,2,1,1,1,1,6,4,1,2,2,8,1,5,1,1,1,1,1,1,1,1,3,2,1,1,1,3,4,6,3,2,2,1,1,1,1,9,1,1,2,2,1,3,1,7,1,5,1,1,4,8,1,2,1,1,1,2,2,2,1,2,1,10,2,1,1,10,1],
+      ["statecraft",41,1],
+      ["stated",42,1,24,1,16,1,90,1],
+      ["stately",188,2],
+      ["statement",86,1,92,1],
+      ["static",116,1,49,1],
+      ["station",13,1,18,1,46,1,7,2,5,1,49,1,4,1,60,1,24,1],
+      ["stationary",5,2,137,1],
+      ["stationed",99,1],
+      ["statistic",20,3,29,1,21,1,32,1,64,2,33,1,21,4],
+      ["statistical",128,1],
+      ["statistically",48,1,105,1],
+      ["statue",9,1,22,1,184,1],
+      ["status",9,5,7,1,25,2,1,1,5,9,2,2,37,2,9,1,9,1,23,1,1,1,19,2,3,1,17,1,17,2,25,1,3,1],
+      ["statutory",15,1],
+      ["stay",13,3,1,1,1,1,5,3,14,3,3,1,2,1,10,1,3,1,3,2,5,1,8,1,2,1,19,1,5,1,2,1,7,1,1,1,2,6,14,1,1,1,18,1,15,1,2,1,3,1,4,1,10,1,8,1,28,1,11,2],
+      ["stayed",39,1,3,1,151,1,28,1],
+      ["staying",4,1,30,1,9,1,39,1,23,1,111,1,1,1],
+      ["stead",160,1],
+      ["steadily",98,2,19,1,81,1],
+      ["steady",26,1,26,2,72,1,83,1],
+      ["steal",217,1],
+      ["stealing",99,1],
+      ["stealthily",69,1],
+      ["steam",23,1,56,4,8,1,26,1,19,1,62,1],
+      ["steamship",88,1,8,1],
+      ["stedman",26,1],
+      ["steel",27,1,19,2,17,4,38,1,16,1,2,2,13,1,19,1],
+      ["steep",31,1,101,1,21,1,42,1],
+      ["steeply",20,1],
+      ["steer",159,2,9,2],
+      ["steiner",81,1],
+      ["stellar",163,1],
+      ["stem",7,3,32,1,9,1,17,1,84,1,5,3,1,1,46,1,3,1],
+      ["stemgent",80,1],
+      ["stemmed",153,1],
+      ["stemming",194,1],
+      ["sten",149,2],
+      ["stench",96,1],
+      ["stencilling",136,1],
+      ["stengel",161,8],
+      ["step",12,1,20,1,12,1,3,1,6,1,29,1,13,1,2,1,1,3,5,1,12,1,19,1,5,1,10,1,2,2,10,1,21,1,4,1,2,1,16,2,10,2,4,1,2,2],
+      ["stephen",45,1,47,1,18,3,41,1,5,1,16,1,38,1],
+      ["stepmother",157,3],
+      ["steppe",21,2],
+      ["stepped",192,1],
+      ["stepping",134,1],
+      ["stereotype",35,1,63,1,84,1],
+      ["stereotyped",3,1,46,1],
+      ["sterilised",69,1],
+      ["stern",2,1],
+      ["steve",30,1,19,1],
+      ["steven",22,1,14,3,58,1,73,1,1,1,6,1,15,1,23,2],
+      ["stevenson",171,27],
+      ["stewart",18,8,130,1],
+      ["stick",5,1,9,2,4,1,1,1,2,1,25,1,5,1,6,1,20,1,12,2,25,1,13,2,44,1,47,14,7,1],
+      ["stickgold",220,1],
+      ["stickiness",52,1],
+      ["sticking",7,1,47,1,18,1,21,1],
+      ["sticky",23,1,36,3],
+      ["stiff",5,1,57,1,65,1,90,1],
+      ["stifle",3,1],
+      ["stifling",156,1],
+      ["still",0,2,1,1,1,1,1,1,4,1,3,1,3,1,1,1,2,5,1,1,5,1,1,1,2,5,2,1,2,1,1,1,3,1,2,1,3,1,2,1,5,2,1,1,3,1,1,3,1,3,6,1,1,1,3,3,3,1,1,1,3,2,1,2,1,1,2,4,3,1,1,2,3,2,2,1,4,1,3,3,1,1,1,1,1,1,2,2,2,2,7,1,1,1,1,2,3,1,1,2,2,3,5,1,3,3,2,1,1,1,2,1,1,1,1,1,2,1,1,4,2,1,3,1,1,1,2,2,1,1,1,2,3,1,1,1,2,2,1,1,1,1,1,1,3,4,1,1,1,2,2,4,6,2,1,1,1,1,2,1,3,1,1,1,3,2,1,2,2,1,2,1,1,2,5,1,3,1,2,2,1,2,2,2,9,1,3,2,1,1,1,1,1,1,1,1,3,1,1,1,2,1,1,1,4,4,1,2,1,1,1,2,1,2,2,2,2,1],
+      ["stilt",195,1],
+      ["stimulant",72,1,113,1],
+      ["stimulate",37,1,16,1,6,1,25,1,8,1,42,1,12,1,12,1,18,1,12,1],
+      ["stimulated",71,1,7,1,10,1,5,1,7,1,3,1],
+      ["stimulating",158,1],
+      ["stimulation",20,1,156,1],
+      ["stimuli",37,10,34,2,7,1,3,1,45,1,59,1],
+      ["stimulus",3,1],
+      ["stinging",48,1],
+      ["stipulation",128,1],
+      ["stirred",151,1,32,1],
+      ["stoat",103,2],
+      ["stock",5,1,103,2,1,1,13,1,6,3,2,1],
+      ["stocked",16,1,118,2],
+      ["stocking",19,1],
+      ["stockpiling",50,1],
+      ["stomach",10,1,49,1,35,1,27,1,37,1,42,1,16,1],
+      ["stone",1,2,8,1,12,6,6,2,13,1,6,3,1,1,3,1,1,1,16,1,8,1,14,1,1,1,17,2,4,2,4,3,5,1,3,4,6,1,21,3,8,1,9,1,2,1,23,1,3,2,15,10,2,1,10,1],
+      ["stonehenge",147,1],
+      ["stoneware",44,1],
+      ["stony",71,1],
+      ["stood",31,2,35,1,1,1,107,1,39,1],
+      ["stooge",42,3],
+      ["stop",7,1,44,1,7,1,15,1,25,1,4,4,3,1,7,1,1,1,6,1,7,2,25,2,8,1,6,1,10,1,5,1,17,2,2,4,10,1,2,2,3,2,6,1],
+      ["stopped",0,1,16,1,28,2,22,1,22,1,69,1,18,1,10,1,8,1],
+      ["stopping",63,1,10,1,55,1],
+      ["storage",51,2,48,2,24,1,72,1],
+      ["store",22,3,13,2,22,1,2,1,6,1,2,1,2,2,1,13,3,1,9,8,12,1,3,4,25,4,5,1,13,1,10,1,9,3,7,2,3,1,16,1,15,1,26,1],
+      ["stored",19,1,31,1,19,2,30,1,51,1,9,1,65,1],
+      ["storekeeper",70,1],
+      ["storey",63,3,70,3],
+      ["storing",166,1],
+      ["stork",130,2],
+      ["storm",35,1,31,1,58,2,11,2,70,3,12,1],
+      ["stornaway",66,1],
+      ["story",0,1,4,10,2,1,11,2,8,1,19,1,19,2,1,1,16,1,1,15,7,2,4,2,4,1,3,1,4,4,2,1,3,1,1,18,27,1,16,1,5,10,3,1,11,7,1,1,7,1,3,6,4,2,9,1,3,1,8,2,11,1,6,1,2,1],
+      ["storyline",81,1,108,1],
+      ["storyteller",157,1,41,1],
+      ["storytelling",183,1],
+      ["stout",1,1,108,1],
+      ["stoykov",20,3],
+      ["straight",64,1,51,1,2,1,15,1,12,1,52,1],
+      ["straighten",64,1],
+      ["straightened",46,1,18,2],
+      ["straightening",64,1],
+      ["straightforward",102,1,7,1,5,1,71,1,14,1],
+      ["strain",139,2,13,1,48,4],
+      ["strait",110,3],
+      ["stramonium",224,1],
+      ["strand",59,1,60,1,12,1],
+      ["strange",14,1,15,1,3,1,27,1,9,1,23,7,2,4,21,1,2,1,19,1,8,1,1,1,14,1,9,1,4,2,6,2,13,1,18,1,4,1,9,1],
+      ["strangely",106,1],
+      ["stranger",1,1,84,4,9,1,4,1,59,1,8,1,9,2],
+      ["strapped",83,1],
+      ["strategic",28,1,94,1,40,1,4,1],
+      ["strategically",54,1],
+      ["strategy",22,1,10,1,2,1,20,1,4,1,1,1,6,1,17,1,13,1,22,2,5,2,13,1,2,3,13,1,9,1,3,9,16,1,3,1,8,3,8,2,3,1,14,1,5,1,2,1],
+      ["stratford",145,1,58,1],
+      ["stratification",147,1],
+      ["stratified",147,1,60,1],
+      ["strauss",216,3],
+      ["straw",62,2,45,1],
+      ["strayer",197,5],
+      ["stream",5,1,16,1,19,1,74,1,27,1,2,1,45,1,6,2],
+      ["streaming",181,1],
+      ["streamlined",5,1,11,1,36,1],
+      ["street",31,1,6,1,2,7,5,1,19,1,33,2,13,1,2,1,7,1,13,19,4,4,5,1,11,1,26,1],
+      ["strength",1,1,8,1,10,1,16,1,2,1,10,3,6,2,23,1,11,1,14,1,18,2,49,2,4,1,5,1,16,1,32,1],
+      ["strengthen",74,1,48,1,67,1],
+      ["strengthened",72,1,43,1,85,1],
+      ["strengthening",37,1,9,1],
+      ["stress",16,1,4,30,19,1,32,1,49,2,30,1,31,3,35,1,8,1],
+      ["stresse",28,1,46,1,27,1,60,1,29,1],
+      ["stressed",20,1,8,1,20,1,44,1,129,1],
+      ["stressful",51,1,104,1,19,1,7,1,8,1],
+      ["stressor",20,1],
+      ["stretch",3,2,11,1,105,1,4,1,41,1,15,1],
+      ["stretche",135,1],
+      ["stretched",19,1,88,1],
+      ["stretching",3,2,135,1,64,1],
+      ["strict",31,1,23,1,64,1],
+      ["stricter",161,1],
+      ["strictly",8,1,79,1,53,1],
+      ["stride",57,1],
+      ["strike",7,1,18,6,6,1,63,1,48,1,14,1,15,1],
+      ["striking",14,1,38,1,11,3,10,1,18,1,39,1,6,1,29,1,14,1,8,1,32,1,3,1],
+      ["strikingly",81,1],
+      ["string",11,1,35,17,31,2,14,6,76,3,45,3,6,1],
+      ["stringed",46,12],
+      ["stringer",115,1],
+      ["strip",23,1,84,2,36,1],
+      ["stripe",144,1],
+      ["striped",89,8,55,2],
+      ["stripped",16,1,74,1,61,1],
+      ["strive",6,1,147,1],
+      ["striving",157,1],
+      ["stroke",3,1,25,1,24,1,5,1,26,5,29,1],
+      ["strong",1,1,3,1,1,1,7,2,5,1,10,1,12,1,11,1,2,1,7,1,1,1,3,1,2,1,1,1,5,2,1,1,4,2,2,3,3,1,1,1,3,1,6,1,1,1,8,2,4,1,14,1,1,1,2,1,1,1,8,1,12,1,7,1,1,1,5,2,3,1,7,2,5,1,1,1,14,1,1,1,19,2,1,2,10,1,6,1,1,1],
+      ["stronger",2,2,28,1,7,2,6,1,3,1,25,2,3,1,4,2,7,1,44,2,24,1,5,1,28,1,21,1,18,1],
+      ["strongest",12,1,14,1,2,1,40,1,44,1,93,1],
+      ["strongly",37,1,123,1,5,1,21,2,1,1,13,1,10,1],
+      ["stroop",181,2],
+      ["struck",5,1,96,1,116,1,6,1],
+      ["structural",86,1,67,1,23,1],
+      ["structure",2,3,3,2,2,1,1,7,2,1,8,2,1,1,2,5,4,1,5,2,14,3,2,1,4,2,5,1,6,1,1,1,9,1,15,2,5,2,28,1,1,2,1,1,3,1,5,8,21,1,19,1,4,4,4,1,6,1,6,1,1,1,5,3,2,1,17,2,2,1,5,2,3,1,2,4],
+      ["structured",47,1,45,1,70,1],
+      ["struggle",33,1,15,1,21,1,18,1,48,1,6,1,79,1],
+      ["struggling",48,1,105,1],
+      ["strung",19,1,189,1],
+      ["strut",21,1],
+      ["stu",91,1],
+      ["stuart",28,1,21,1,69,1,20,1,64,1],
+      ["stubborn",76,1,61,1],
+      ["stubbornly",14,1],
+      ["stubby",52,1],
+      ["stuck",3,2,15,2,41,1,56,1,4,1,65,2],
+      ["student",2,3,1,1,1,2,3,1,4,6,1,2,6,1,4,1,1,1,5,2,10,1,11,1,9,4,5,1,8,1,1,1,2,2,8,1,3,2,12,1,9,9,14,1,2,2,14,1,17,17,10,1,9,1,11,1,3,1,3,1,7,1,8,1,1,1,8,1,7,1],
+      ["studentship",11,1],
+      ["studied",17,1,7,1,12,2,1,1,2,1,1,1,3,1,13,2,2,1,9,1,1,1,8,1,2,1,9,1,6,1,18,1,5,1,10,2,4,1,6,1,3,1,14,1,15,1,8,4,1,1,24,1,15,1,4,1,5,1],
+      ["studio",30,1,187,1],
+      ["study",1,1,1,8,1,5,4,8,2,4,2,2,7,8,2,1,2,1,2,13,1,1,1,1,1,3,9,5,1,4,1,1,1,1,3,7,1,10,1,1,4,1,5,2,1,4,1,1,1,9,1,1,1,2,1,2,1,4,3,1,5,1,2,2,1,6,1,1,2,1,2,2,2,7,2,1,1,8,1,2,1,5,2,6,2,3,1,1,1,3,2,1,1,11,3,1,3,3,2,14,1,1,3,1,1,1,1,5,3,1,2,1,3,1,1,3,1,1,4,4,1,1,1,1,4,1,1,1,1,2,2,2,3,2,2,1,1,3,1,2,1,3,4,2,1,2,2,1,2,1,1,15,2,2,2,3,1,5,1,3,1,7,4,1,3,4,1,3,2,1,1,1,1,2,3,1,1,1,1,1,1,1,1,1,1,1,1,7,2,7,1,8,1,2,1,3,3,8,1,1,1,2,3,5,1,1,6,4,1,3,1,9,2,1,1,1,1,3,1,1,1,3,2,10,1,1,1,1,2,1,2,2,3,2,1,2,4,5,1,3,3,1,1,4],
+      ["studying",2,1,1,1,3,1,11,2,1,1,9,1,10,1,37,1,7,1,1,1,5,1,2,1,8,1,31,2,15,3,13,1,9,2,1,1,10,1,7,1,14,1,1,2,3,1,7,1,13,2],
+      ["stuff",17,1,178,1,18,1,8,1],
+      ["stuffed",45,1],
+      ["stumbling",215,1],
+      ["stump",29,1,60,1],
+      ["stun",103,1],
+      ["stunning",120,1,34,1],
+      ["stupefied",109,1],
+      ["stupid",123,1],
+      ["sturgess",82,1],
+      ["sturm",180,1],
+      ["stutter",100,1],
+      ["style",31,1,5,5,16,2,1,1,2,1,8,4,54,1,14,1,14,4,12,1,14,1,11,1,6,1,7,1,5,1,3,4,2,2,2,4,12,1],
+      ["stylised",1,1],
+      ["stylish",34,1],
+      ["stylistic",86,2,59,1],
+      ["stylometric",145,8,58,4],
+      ["stylometry",145,4,58,4],
+      ["stylus",67,1],
+      ["sub",10,6,11,1,55,1,25,1,49,1,2,1,7,1,14,3,4,1,39,1],
+      ["subcommittee",97,1],
+      ["subconscious",18,1,64,1],
+      ["subconsciously",207,1],
+      ["subdivided",169,1],
+      ["subgenus",223,1],
+      ["subject",3,3,2,1,11,4,2,2,8,1,8,1,2,2,3,1,2,4,1,20,1,2,6,4,9,3,14,2,2,1,3,1,1,1,6,1,2,1,1,3,4,1,7,1,1,2,7,2,3,1,2,2,1,1,2,1,12,2,10,3,7,1,4,1,1,7,1,1,1,1,3,2,2,3,6,2,1,1,1,1,12,1,1,2,5,1,2,1,3,1,3,2,2,1,9,1,7,1,1,2,3,1,2,1,2,3,11,1],
+      ["subjected",50,1,1,1,20,1,7,1,6,1,77,1,60,1],
+      ["subjecting",94,1],
+      ["subjective",20,1,6,1],
+      ["subliminal",206,1],
+      ["submerged",129,1,51,1],
+      ["submissive",174,1],
+      ["submitted",144,1],
+      ["subordinate",8,8,158,1,17,4],
+      ["subscribed",137,1],
+      ["subscriber",100,1,66,1],
+      ["subsequent",10,1,15,1,46,1,2,1,54,1,38,1,6,1,4,1,6,1,20,1],
+      ["subsequently",4,1,32,1,5,1,70,1,109,1],
+      ["subset",29,1],
+      ["subsidiary",147,1,54,1],
+      ["subsidize",55,1],
+      ["subsidy",4,1,159,1],
+      ["subsist",102,1,97,1],
+      ["subsistence",47,1,49,1,83,2],
+      ["substance",23,11,15,2,13,1,4,2,10,1,3,1,4,1,6,2,1,1,20,1,9,1,5,2,3,1,9,6,9,1,9,2,58,1,16,4,1,1,6,2],
+      ["substantial",33,1,3,1,72,1,3,1,31,1,27,1,9,2,4,1,27,1],
+      ["substantially",120,1,8,1,60,1],
+      ["substantive",38,2,47,3],
+      ["substitute",19,2,98,1,45,1,26,1],
+      ["substituted",115,1],
+      ["substitution",13,1,194,1],
+      ["subsumed",64,1],
+      ["subsurface",30,1,39,2,108,1],
+      ["subterranean",5,1,29,1,35,1],
+      ["subtitle",111,1],
+      ["subtle",30,1,22,1,19,2,10,1,19,1,14,1,31,1,58,1,18,1,3,1],
+      ["subtler",163,1],
+      ["subtlety",170,1],
+      ["subtly",98,1],
+      ["subtropical",48,1,59,1],
+      ["suburb",4,1,108,5,6,3,18,1],
+      ["suburban",70,1,65,1,32,1,45,1],
+      ["suburbanite",112,2],
+      ["subversive",41,1],
+      ["subvert",56,1],
+      ["succeed",111,1,19,1,16,1,40,1,3,1,1,1],
+      ["succeeded",54,1,10,1,18,1,13,1],
+      ["succeeding",28,1],
+      ["success",23,1,5,1,2,1,6,1,10,1,4,1,2,2,4,1,9,1,9,1,6,2,2,2,4,1,3,1,16,1,7,1,5,1,5,1,6,1,4,1,8,1,11,1,5,1,6,1,17,2,14,1,29,2],
+      ["successe",69,1],
+      ["successful",0,1,12,1,15,1,1,2,4,1,2,3,13,4,2,1,14,1,23,1,3,1,9,1,6,2,1,1,4,1,7,1,3,1,3,2,5,1,3,2,5,3,2,3,13,1,1,1,1,1,41,2,5,1,6,1,1,1,1,1,8,3,8,6,1,1],
+      ["successfully",30,1,18,1,8,4,2,2,8,1,85,1,8,2,12,1,4,2,47,1],
+      ["succession",161,1],
+      ["successive",160,1,15,1],
+      ["succinctly",160,1],
+      ["succinite",125,1],
+      ["succumbing",179,1],
+      ["such",0,1,1,4,1,2,2,3,1,1,1,1,2,1,1,1,1,4,1,3,1,3,1,4,1,2,1,3,1,1,2,1,1,6,1,4,1,1,1,3,1,3,2,2,1,1,1,1,1,1,1,4,5,1,2,5,1,4,1,1,1,1,1,1,1,1,2,1,2,4,1,6,1,6,2,3,1,4,2,4,1,5,1,1,2,2,2,1,1,2,1,4,1,2,1,2,1,2,2,5,1,2,1,1,2,3,1,3,1,3,4,1,1,2,2,2,1,4,2,1,1,1,1,3,2,1,1,5,1,2,1,1,1,2,1,1,1,6,1,2,1,2,1,1,1,1,1,1,2,1,2,4,1,4,1,1,1,3,1,2,1,1,2,3,1,1,1,3,1,1,1,2,1,1,1,3,3,2,1,3,3,1,1,2,1,1,1,1,1,4,1,3,1,4,1,2,1,5,1,1,1,2,1,2,1,1,1,2,1,2,1,7,4,2,1,5,1,2,1,4,1,3,2,6,1,13,1,3,1,2,4,2,1,2,1,3,1,5,1,5,1,2,1,1,1,1,1,1,2,4,1,1,3,3,2,4,3,1,2,1,1,4,2,1,1,1,1,2,1,1,2,1,1,1,1,2,1,3,1,1,1,2,1,4,2,3,1,3,1,5,1,3,1,1,1,1,1,3,2,2,2,1,1,1,1,4,2,3,1,3,1,2,1,1,1,4,2,1,1,2,1,2,3,3,1,2,1,1,4,3,1,1,1,12,1,1,1,5,1,4,1,2],
+      ["suck",59,1,9,1,15,1],
+      ["suckled",213,1],
+      ["sucrose",24,1],
+      ["sudan",31,1,92,1],
+      ["sudden",14,1,11,4,20,1,31,1,14,2,25,1,77,1,4,1],
+      ["suddenly",9,1,18,1,15,1,14,1,28,1,4,1,5,1,24,1,11,1,33,1,14,1],
+      ["suedfield",152,1],
+      ["suetonius",169,1],
+      ["suez",88,1],
+      ["suffer",22,1,37,1,17,1,18,1,32,1,35,1],
+      ["suffered",24,4,19,1,53,1,7,1,10,1,30,1],
+      ["sufferer",53,1,5,1,123,1,39,1],
+      ["suffering",11,2,9,1,4,1,17,1,10,1,98,1,66,1],
+      ["suffice",86,1],
+      ["sufficient",3,1,39,1,20,1,11,1,2,1,54,1,44,1,37,1],
+      ["sufficiently",56,1,16,1,46,1,38,1],
+      ["suffocating",173,1],
+      ["suffragette",4,1],
+      ["sugar",22,1,2,1,9,13,125,1,35,12,7,3,21,3],
+      ["sugarcane",33,1],
+      ["sugarless",200,1],
+      ["sugary",173,1,27,1],
+      ["suggest",2,1,4,1,2,1,13,4,3,2,1,2,1,2,5,1,8,3,4,1,2,2,5,2,4,1,2,1,12,2,2,1,1,1,3,2,1,5,1,1,2,1,3,2,2,1,2,1,5,2,1,1,1,3,1,1,1,2,4,1,2,2,15,3,8,1,3,1,4,1,3,2,1,5,4,2,7,2,3,1,4,1,2,1,1,4,5,1,1,1,1,1,1,1,4,1,2,2,5,1,11,1,1,1,3,2,7,1,6,2,1,2,1,1,4,1,2,4,2,1,5,1,3,1,2,1],
+      ["suggested",1,1,12,1,30,2,10,1,18,3,7,3,11,1,26,2,11,1,8,1,5,1,3,1,3,1,10,3,4,1,5,1,2,1,3,2,6,1,1,1,1,2,3,1,3,1,1,2,6,1,2,2,11,1,1,1,3,6,13,1,1,1],
+      ["suggestibility",106,2],
+      ["suggesting",1,1,1,1,35,1,10,1,7,1,4,1,10,1,15,1,2,1,7,2,14,1,9,1,11,1,42,1,29,1,13,1,11,1],
+      ["suggestion",205,1],
+      ["suggestive",25,1],
+      ["suit",157,1,38,1,5,1],
+      ["suitability",117,1],
+      ["suitable",13,1,6,2,7,1,30,2,16,1,7,1,17,1,6,1,1,1,2,1,2,1,10,1,4,1,3,1,11,1,20,3,9,1,9,1,18,1,8,1,15,2],
+      ["suitably",16,1,81,1],
+      ["suite",69,1,100,2],
+      ["suited",79,1,20,2,18,1,32,1],
+      ["suitor",105,1],
+      ["sulphur",23,1,195,1],
+      ["sum",66,1,85,1,37,1,23,1],
+      ["sumer",67,1],
+      ["sumeria",172,1],
+      ["sumerian",46,1,21,4],
+      ["summarised",187,1],
+      ["summarized",3,1,33,1],
+      ["summed",16,1,39,1,63,1],
+      ["summer",0,1,11,1,10,2,22,2,48,1,19,1,74,1,11,1,16,1],
+      ["summerhouse",111,1],
+      ["summery",182,1],
+      ["summit",132,1],
+      ["sun",5,1,30,1,8,1,16,1,3,1,17,1,28,1,3,1,6,2,5,3,21,5,17,1,1,1,4,2,28,1,3,1,6,1,25,1],
+      ["sunday",115,1],
+      ["sundew",59,3],
+      ["sunflower",224,1],
+      ["sunk",44,1,35,1],
+      ["sunlight",19,1,19,2,5,1,9,1,7,1,61,1,39,1,51,1],
+      ["sunlit",121,1],
+      ["sunny",84,1,36,1,1,1],
+      ["sunrise",43,1],
+      ["sunscreen",226,2],
+      ["sunset",39,1,4,1],
+      ["sunshine",21,2,38,1,25,3],
+      ["sup",165,1],
+      ["supe",50,2],
+      ["super",109,1,50,2,14,1,22,1,2,9,23,1],
+      ["superb",34,1,101,1],
+      ["superbly",223,1],
+      ["superficial",72,1,91,1],
+      ["superfluous",73,1],
+      ["superhuman",9,1],
+      ["superimposing",73,1],
+      ["superintendency",31,1],
+      ["superintendent",111,1],
+      ["superior",1,1,17,1,4,1,14,1,11,1,54,1,20,1,8,1,23,1,14,1,18,1,13,1,21,1],
+      ["superiority",36,1,11,3,124,1,48,1],
+      ["supermarket",16,1,54,4,27,3,37,2,32,1,34,2],
+      ["supernatural",182,2],
+      ["supernormal",72,1],
+      ["superseded",170,1,24,1],
+      ["superstar",109,1],
+      ["superstition",116,1],
+      ["supervision",77,1],
+      ["supervisor",41,1],
+      ["supplant",170,1],
+      ["supplanted",125,1],
+      ["supplement",16,1,63,1],
+      ["supplementary",18,1],
+      ["supplemented",99,1,63,1],
+      ["supplied",32,1,53,1,23,1,9,1],
+      ["supply",5,1,9,1,5,1,2,2,3,1,21,1,5,1,15,1,8,1,14,1,9,1,7,1,4,1,7,1,9,1,4,1,6,1,1,1,21,1,11,1,12,2,6,1,7,4,3,2,1,1,23,1,3,2,1,1],
+      ["supplying",101,1,100,1],
+      ["support",0,1,4,1,3,4,9,6,1,1,10,2,1,3,4,1,2,1,6,1,8,1,7,1,13,1,7,5,1,1,3,1,3,2,10,1,14,1,4,3,14,1,4,2,3,1,3,2,5,1,3,1,1,1,3,2,1,1,7,1,10,1,12,1,2,1,8,1,3,1,1,1,1,2,2,1,29,1],
+      ["supported",17,1,4,1,23,2,69,1,4,1,20,1,14,1,18,1,25,1,2,1],
+      ["supporter",33,1,101,1,16,1,28,1],
+      ["supporting",60,1,57,1,33,1,2,1,30,1,4,1],
+      ["supportive",82,1,71,1],
+      ["suppose",175,1],
+      ["supposed",58,1,80,1,37,1,27,1],
+      ["supposedly",144,1,46,1],
+      ["suppress",43,1,132,1,6,1,19,1],
+      ["suppressing",139,1,18,1],
+      ["suppression",59,1,165,1],
+      ["supremacy",188,1],
+      ["supreme",0,1,9,1],
+      ["sure",55,2,3,1,10,2,38,1,38,1,1,1,16,1,14,1,3,1,6,2,8,1,11,1,7,1,5,1,4,1],
+      ["surely",25,1,15,1,62,1,84,1,13,1,16,1],
+      ["surf",82,1],
+      ["surface",13,3,8,2,4,1,5,1,4,3,1,1,12,1,4,2,1,4,15,2,1,2,1,5,13,1,2,1,7,2,7,1,9,1,1,1,13,1,4,2,2,1,5,3,7,1,5,1,5,1,3,1,12,5,13,8,3,4,2,1,12,1,16,6,4,10,7,2,3,1,2,1],
+      ["surfer",82,1],
+      ["surfing",52,1,62,1],
+      ["surge",35,1,154,1,7,1,12,1],
+      ["surgeon",1,1,71,1,117,1,24,1],
+      ["surgery",120,1,69,1],
+      ["surgical",133,1,56,1],
+      ["surgically",108,1],
+      ["surmise",174,1],
+      ["surmised",50,1],
+      ["surpass",6,1,3,1,185,1],
+      ["surplus",55,2,41,1,51,1],
+      ["surprise",6,1,19,1,8,1,16,1,9,1,14,1,28,2,2,1,62,1,11,6,14,1,10,1,20,1],
+      ["surprised",34,1,93,1,38,1,2,1,14,1,17,1,2,1,12,1,4,2],
+      ["surprising",12,2,9,1,4,1,8,1,3,1,21,1,14,3,1,1,6,2,3,1,3,1,6,1,10,1,15,1,31,1,37,1,4,1,14,1,4,2,20,1],
+      ["surprisingly",25,1,4,1,1,1,15,1,36,2,17,1,5,1,56,1,62,1],
+      ["surrey",102,1,97,1],
+      ["surrogate",187,1],
+      ["surround",62,1,89,1],
+      ["surrounded",31,1,32,1,27,1,24,1,22,1,15,1,18,1],
+      ["surrounding",0,1,63,1,4,1,17,1,3,1,2,4,17,4,6,1,6,1,2,1,6,1,9,1,8,1,2,1,6,1,8,2,6,1,5,1,2,1,11,1,5,1,15,1,2,1,11,1],
+      ["surveillance",97,1,83,1,21,1,13,1],
+      ["survey",18,3,8,1,10,1,22,2,6,1,5,2,1,3,2,1,10,2,8,1,5,1,9,2,40,1,7,2,11,2,10,2],
+      ["surveyed",152,1],
+      ["surveying",70,1,45,1,34,1,3,1],
+      ["surveyor",177,1],
+      ["survival",14,1,7,2,14,1,13,1,13,1,34,1,8,1,19,1,13,2,9,1,10,1,1,5,6,1,3,1,21,1,19,1,20,2],
+      ["survive",5,1,5,1,19,1,2,1,14,1,3,1,3,1,8,2,30,1,1,1,13,3,7,1,1,1,24,1,8,12,1,1,19,1,46,1],
+      ["survived",21,3,4,1,6,2,15,1,18,1,26,1,13,1,5,1,2,2,3,1,16,1,58,1,29,1,1,1],
+      ["surviving",95,1,15,1,25,4,9,1],
+      ["survivor",10,1,54,1,39,4],
+      ["susanne",27,1],
+      ["susceptible",106,1,18,1,30,1],
+      ["suspect",59,1,9,2,26,1,58,1,8,2,16,1,14,1,7,1,24,1],
+      ["suspected",53,1,15,1,90,1,32,1],
+      ["suspended",46,1,46,1],
+      ["suspicion",68,1,31,2,91,1],
+      ["suspicious",88,1,9,1,2,1,38,1,8,1,34,1,7,1,17,1],
+      ["sussex",169,3,3,1],
+      ["sussman",63,1],
+      ["sustain",3,1,93,1,48,1,4,1],
+      ["sustainability",5,1,112,1],
+      ["sustainable",33,1,51,1,12,1,24,1,2,1,7,1,11,1,9,1,15,1],
+      ["sustained",20,1,17,1,13,1,2,1,2,1,1,1,56,1,10,2,17,1,23,1,37,1,4,1,4,1],
+      ["sustaining",162,1],
+      ["sustenance",99,1],
+      ["sutton",178,3],
+      ["swabian",27,1],
+      ["swallowed",25,1,28,1,72,1],
+      ["swam",211,1,2,1],
+      ["swamp",59,1,78,1,14,1],
+      ["swampy",10,1],
+      ["swan",157,1],
+      ["swap",104,1],
+      ["swapped",104,1],
+      ["swapping",104,1],
+      ["swarm",56,2,103,1],
+      ["swath",72,1,104,1],
+      ["sway",89,1],
+      ["swayed",213,1],
+      ["swayne",53,3],
+      ["swear",175,1],
+      ["sweden",44,1,90,1,61,1],
+      ["sweep",91,1,79,1],
+      ["sweeping",126,1],
+      ["sweet",33,4,17,1,49,1,56,1,3,1,42,2],
+      ["sweetener",200,3],
+      ["sweeter",22,1],
+      ["swelling",193,1],
+      ["swept",0,2,72,1,49,1,16,1],
+      ["swift",48,1,4,1,4,1,74,2],
+      ["swiftest",121,1],
+      ["swiftly",134,1],
+      ["swim",52,5,7,1,9,1,23,1],
+      ["swimmer",52,1],
+      ["swimming",10,1,25,1,17,4,26,1],
+      ["swing",11,1,9,1,37,2,2,1,25,4,48,1,29,2,10,1],
+      ["swinging",211,1],
+      ["swish",52,1],
+      ["swiss",160,1,36,2],
+      ["switch",14,1,34,1,33,1,14,1,7,1,95,2,2,1],
+      ["switche",19,1],
+      ["switched",80,1,12,1,10,1,97,1],
+      ["switching",3,1,51,1,72,1,55,2],
+      ["switchover",181,1],
+      ["switzerland",159,1,1,1,20,1,16,2],
+      ["sword",152,1],
+      ["swordfish",52,1],
+      ["swung",49,1],
+      ["sydney",5,1,29,1,10,17,49,1,42,15,1,10,69,2,5,1],
+      ["syllable",176,1,31,1],
+      ["symbiosis",139,1],
+      ["symbol",1,1,43,1,3,1,20,4,69,1,31,1,23,3,22,1],
+      ["symbolic",26,2,21,1,27,1,29,1],
+      ["symbolically",67,1],
+      ["symbolise",1,1],
+      ["symbolism",190,1],
+      ["symbolized",157,1],
+      ["syme",23,1],
+      ["symmetry",25,1,130,2],
+      ["sympathetic",4,1,68,1],
+      ["sympathetically",37,1],
+      ["sympathy",37,1,4,1,19,1,16,1],
+      ["symphony",2,2,42,1,102,1,73,1],
+      ["symposium",128,2],
+      ["symptom",11,1,69,1],
+      ["synaesthesia",93,1],
+      ["synapse",37,3,183,1],
+      ["synaptic",37,2],
+      ["synchronisation",86,1,79,1],
+      ["synchronised",167,1,45,1],
+      ["synchrony",165,1],
+      ["syndrome",94,3],
+      ["synergistic",224,1],
+      ["syntax",167,1,16,1,29,1],
+      ["synthesis",17,1,64,2],
+      ["synthesised",176,1],
+      ["synthetic",19,1,19,7,81,1,6,1,15,2,84,3],
+      ["syria",51,1,26,1],
+      ["syringe",224,2],
+      ["system",3,1,2,10,3,4,5,3,1,1,1,1,1,1,1,1,11,1,2,1,5,1,12,1,1,1,1,4,6,1,2,3,2,1,1,1,4,2,1,3,2,3,2,1,1,1,1,1,2,11,1,1,4,1,5,2,1,1,4,1,6,1,1,2,1,1,1,6,1,1,3,1,1,2,4,5,3,3,3,1,1,1,1,1,6,4,1,3,4,1,3,1,2,1,2,1,1,2,2,3,4,1,1,5,2,4,1,1,2,2,2,3,3,1,7,1,2,2,2,1,2,1,1,2,2,3,1,3,6,2,3,1,4,2,1,1,2,2,5,1,2,4,5,2,4,2,2,1,7,3,4,3,1,2,1,5,2,2,1,2,2,1,1,1,1,2,2,1],
+      ["systematic",36,1,28,1,4,1,48,1,6,1,8,1,20,1,13,1,5,3,39,1,7,1],
+      ["systematically",40,1,129,1,41,1],
+      ["systemextra",216,1],
+      ["systemic",20,1],
+      ["tabasco",143,1],
+      ["table",42,1,61,1,1,1,53,1,33,1],
+      ["tableland",89,1],
+      ["tablet",53,1,14,3,40,1,4,1,67,1],
+      ["tacit",122,1],
+      ["tacitus",169,1],
+      ["tack",213,1],
+      ["tackle",69,1,55,1,57,1,9,1],
+      ["tackling",100,1,37,1,88,1],
+      ["tactic",179,1,10,1],
+      ["tactical",131,1,31,1],
+      ["tag",80,1,69,1,65,1],
+      ["tagged",97,1],
+      ["tahiti",108,1],
+      ["tahoe",196,2],
+      ["tahr",10,1],
+      ["taiichi",73,1],
+      ["tail",5,2,40,2,7,4,37,4,14,2,7,1,11,1,23,2,19,1],
+      ["tailor",140,1,60,2],
+      ["taiwanese",172,1],
+      ["take",1,1,1,3,2,1,1,1,3,1,3,3,1,2,3,1,1,1,1,1,3,7,1,4,5,3,4,1,1,1,1,2,2,1,1,1,2,2,3,2,2,1,1,1,2,1,1,1,2,1,2,1,3,1,2,1,4,1,3,2,1,3,3,1,1,1,2,2,3,3,4,1,3,1,2,4,5,1,8,2,3,1,5,2,1,1,1,1,1,1,3,3,1,1,2,1,1,1,2,2,1,1,6,1,1,1,2,1,4,1,2,3,1,1,2,1,1,1,3,1,7,1,3,1,2,1,1,2,2,2,2,1,6,2,1,4,3,5,1,2,1,1,2,1,2,1,1,2,5,1,2,1,3,4,3,1,1,1,1,2,2,1,3,1,3,1,3,2,2,2,5,1,2,1,1,2,2,3,2,1,3,2,2,1,10,2],
+      ["takefumi",100,1],
+      ["taken",5,1,1,1,7,1,3,1,2,1,1,1,1,1,3,1,3,5,4,1,3,2,7,1,9,1,2,1,1,3,1,1,3,1,8,2,1,1,17,1,4,2,4,1,1,1,2,1,5,1,2,1,7,1,5,1,1,1,8,1,2,1,6,1,1,1,11,1,1,1,2,2,5,2,1,1,11,1,12,1,10,1,1,1,4,1,4,1,1,1,3,1,11,1,7,2,4,1],
+      ["takeover",25,1,23,1],
+      ["taking",7,1,19,1,6,2,4,1,1,1,12,2,3,1,2,1,1,3,4,1,7,1,27,1,7,1,3,1,11,2,9,1,32,1,4,1,5,5,12,1,12,1,5,1,16,4,7,1,3,1,2,1],
+      ["tala",107,1],
+      ["talbot",118,18],
+      ["tale",83,1,6,1,16,2,52,26,25,2,8,1,6,1],
+      ["talent",2,6,4,11,3,3,2,1,36,1,64,1,38,1,18,1,4,1,41,1],
+      ["talented",163,1],
+      ["talk",36,2,49,12,10,1,5,1,19,1,7,2,5,1,3,1,13,1,9,1,1,1,3,1,22,2,29,1,10,4],
+      ["talked",85,1,43,1],
+      ["talking",2,1,4,1,14,1,8,1,91,1,56,1,22,2,9,1,7,1],
+      ["tall",50,1,16,1,22,1,29,1,18,1,8,1,22,1,8,1,22,1,21,1],
+      ["taller",132,1],
+      ["tallest",216,1],
+      ["tally",6,2,41,1,54,1],
+      ["talon",103,1],
+      ["tan",38,1],
+      ["tanaka",198,6],
+      ["tanbur",46,6],
+      ["tang",77,2,11,1,19,2],
+      ["tangaroa",91,3],
+      ["tangible",49,1],
+      ["tangled",181,1],
+      ["tank",51,1,28,1],
+      ["tanksley",22,8],
+      ["tanning",213,1],
+      ["tantardini",142,1],
+      ["tanzania",43,1,4,1,100,1],
+      ["tap",18,1,17,1,65,2],
+      ["tape",128,4],
+      ["tapered",52,1,99,1],
+      ["tapping",18,1,5,1,60,1,114,1,7,1],
+      ["tar",46,2],
+      ["tara",102,1,97,1],
+      ["target",1,1,17,1,10,1,37,2,17,1,4,12,3,1,25,1,25,1,3,4,33,1,48,1,3,1],
+      ["targeted",117,1,89,1,18,1],
+      ["targeting",28,1,125,1],
+      ["tariff",140,1],
+      ["task",2,1,2,1,4,2,5,3,4,1,1,10,8,1,10,1,14,1,5,1,3,1,3,1,10,1,7,1,7,1,1,4,1,1,17,1,10,1,12,16,18,1,1,1,7,3,7,1,22,15,2,1,1,2,5,1,1,1,7,13,3,2,3,1,17,1],
+      ["tasked",197,1],
+      ["tasker",197,10],
+      ["tasking",197,13],
+      ["tasman",192,1],
+      ["tasmania",34,22,110,5],
+      ["tasmanian",34,2,104,1,6,9,58,1],
+      ["taste",22,2,6,1,4,6,15,3,14,2,32,1,6,1,51,1,8,1,57,2],
+      ["tasted",200,1],
+      ["tasteless",200,2],
+      ["taster",158,1],
+      ["tastier",22,2],
+      ["tasting",51,1,107,1],
+      ["taught",28,1,8,3,5,1,51,1,3,1,20,4,16,1,5,1,27,3,22,1,4,1],
+      ["tauredunum",196,2],
+      ["tawny",89,1],
+      ["tax",88,1,40,1,9,1],
+      ["taxation",88,5],
+      ["taxe",61,1,16,1,70,2,47,2],
+      ["taxed",211,1],
+      ["taxing",80,1,32,1],
+      ["taxpayer",142,1],
+      ["taylor",8,2,20,2,62,1],
+      ["tchaikovsky",146,1],
+      ["te",1,1],
+      ["tea",0,43,62,2,4,17,6,1,4,1,12,41,19,2,11,1,43,1],
+      ["teach",11,2,4,1,80,1,41,1,6,1,4,1,14,1,3,11,12,2,8,1,6,2,17,1],
+      ["teache",32,1,51,1,137,1],
+      ["teacher",2,3,34,22,13,2,31,1,12,3,5,1,56,13,4,1,3,3,3,39,11,1,24,2,8,2],
+      ["teaching",11,2,3,1,22,12,117,1,10,7,23,2,20,1],
+      ["teacup",209,1],
+      ["team",6,2,1,9,5,5,12,2,1,1,5,1,1,1,14,1,5,4,3,4,5,3,15,1,9,2,1,2,2,3,6,2,4,1,18,1,2,1,3,4,2,1,3,1,4,2,2,4,2,5,1,1,3,1,5,1,9,2,5,1,1,3,4,3,6,1,3,1,1,2,4,3,6,2,5,2,6,2,2,1,4,1,1,1,3,2,11,1,10,4],
+      ["tear",3,1,51,1,18,1,47,1,100,1],
+      ["tease",24,1,76,1],
+      ["tech",35,1,4,1,41,1,11,1,49,1,10,1,59,1,8,1],
+      ["technical",30,1,25,1,10,1,4,1,17,1,19,1,6,2,20,1,39,1,56,1],
+      ["technically",120,1,22,1],
+      ["technician",80,1,140,1],
+      ["technique",6,1,5,1,1,1,14,1,4,1,6,2,1,1,7,1,6,1,1,1,11,1,3,1,4,1,8,1,3,1,2,2,7,3,10,1,14,1,19,1,4,2,3,1,6,2,18,2,5,5,6,1,1,3,5,1,5,1,11,1,5,1,2,2,6,1,5,1,3,2,1,1,8,2],
+      ["techno",150,1],
+      ["technological",8,1,1,1,2,2,109,1,12,1,8,1,27,1,43,1,2,1],
+      ["technologically",0,1],
+      ["technologist",5,1],
+      ["technology",1,3,4,2,2,6,4,1,2,1,2,1,2,2,4,4,9,1,7,1,1,1,24,4,7,3,1,1,1,1,9,2,4,2,12,2,1,5,4,2,3,1,3,3,6,1,7,1,2,2,2,2,2,3,8,1,6,1,2,2,5,1,12,3,5,1,2,5,2,1,4,2,1,1,4,1,18,2,3,1,3,4,8,1,17,1],
+      ["tectonic",25,1],
+      ["ted",133,1,1,1],
+      ["tedious",41,1,89,1],
+      ["teenage",49,1,133,1],
+      ["teenager",37,1,5,1,89,1,36,1,45,1],
+      ["teeth",3,5,7,2,17,1,21,1,42,1,1,1,19,1,5,2,59,1,4,4,13,5,16,1],
+      ["teflon",19,1],
+      ["tele",13,1],
+      ["telecommunication",166,1],
+      ["telephone",119,1,25,1],
+      ["telephoned",128,3],
+      ["telescope",13,1,164,1,3,1],
+      ["television",9,14,48,1,49,1,8,3,26,1,4,1,12,1,19,2,39,1],
+      ["tell",7,1,18,1,2,1,33,1,5,1,7,1,4,1,13,1,2,2,1,1,1,2,7,1,8,1,1,1,14,1,26,2,3,1,14,1,1,1,12,3,7,3,4,1,2,1,8,1,4,1,7,2,1,1],
+      ["telling",9,1,6,1,43,1,6,1,7,1,21,1,47,1,36,3,11,1,12,1,7,1,10,1],
+      ["telltale",100,1,37,1,8,1,58,1],
+      ["tempe",47,1],
+      ["temperament",209,1,16,1],
+      ["temperate",48,1,53,1,20,1,4,1,39,6],
+      ["temperature",5,2,12,1,6,7,6,1,14,1,5,1,14,2,29,6,10,1,5,1,7,1,8,1,3,1,5,5,3,2,26,1,6,10,9,2,4,1,1,1,2,7,5,1,10,2,25,1],
+      ["template",140,4,30,1],
+      ["temple",17,1,106,1,24,1,22,1,1,1],
+      ["tempo",18,2],
+      ["temporal",18,1,186,4],
+      ["temporale",2,1],
+      ["temporary",49,1,10,1,51,1,12,1,6,1,3,1,20,1,19,2,37,1],
+      ["tempory",207,1],
+      ["tempt",152,1],
+      ["temptation",200,4],
+      ["tempted",156,1,67,1],
+      ["tempting",94,1],
+      ["ten",2,4,4,2,10,1,5,1,12,1,1,1,3,1,9,1,18,1,5,2,8,1,3,1,15,2,2,1,9,1,8,1,3,1,5,1,8,1,4,2,8,1,22,7,1,1,9,1,2,3,8,1,3,1,34,1,5,1],
+      ["tenacity",30,1],
+      ["tenancy",118,2],
+      ["tenant",4,1,114,1,29,1],
+      ["tend",6,1,12,2,3,1,4,1,1,1,9,1,6,1,8,3,7,1,5,1,7,2,2,1,4,1,7,1,10,1,15,1,2,1,2,1,4,2,10,1,26,1,15,1,5,1,1,1,5,1,3,1,18,1,1,1,9,2,2,2,13,1,3,1],
+      ["tended",28,1,1,2,9,1,1,1,4,1,85,1,21,1,22,1],
+      ["tendency",3,1,3,1,20,2,17,1,107,1,42,1,13,1],
+      ["tenet",183,1],
+      ["tennessee",153,1],
+      ["tenni",211,1],
+      ["tense",154,1],
+      ["tensile",119,2],
+      ["tension",46,1,49,1,38,1,92,1],
+      ["tent",21,4,163,1],
+      ["tentacle",45,3,3,1,11,3],
+      ["tenth",226,1],
+      ["tenuous",40,1],
+      ["tenure",209,1],
+      ["term",3,1,1,1,2,1,4,1,6,1,8,4,5,2,3,1,4,1,5,2,1,1,6,2,2,1,5,1,9,2,8,1,4,2,5,1,5,1,2,1,7,1,1,1,11,1,4,2,17,1,6,2,6,1,3,2,7,1,12,1,2,1,7,1,10,1,3,2,5,1,9,4,2,2,1,1,5,3,8,1,4,1,2,2],
+      ["termed",9,1,153,1,4,1,9,1],
+      ["terminology",95,1],
+      ["termite",5,9,168,16],
+      ["terrace",84,1],
+      ["terraced",50,1],
+      ["terraforming",164,11],
+      ["terrain",75,1,84,4],
+      ["terrestrial",177,2],
+      ["terrible",25,1,112,2,11,1,27,1],
+      ["terrifically",108,1],
+      ["terrifying",93,1,44,1],
+      ["territorial",10,1,100,1],
+      ["territory",27,1,60,1,16,1,27,3,8,1,9,1,13,1,9,1,13,1,20,1,20,1],
+      ["terror",149,1,25,1],
+      ["terylene",19,1],
+      ["test",3,1,11,2,4,1,9,1,8,1,5,2,2,3,7,1,9,4,4,1,1,1,8,1,5,1,2,1,2,1,1,2,16,2,1,2,2,1,5,1,1,2,13,1,2,1,1,1,23,1,2,1,6,2,3,1,2,1,2,1,2,1,6,1,2,1,2,2,2,1,1,2,5,2,1,1,22,1,10,1,7,1],
+      ["testament",76,1],
+      ["tested",3,1,15,1,17,1,18,1,5,3,4,1,23,1,13,1,65,1,3,1,9,1,1,1,13,1,11,1,20,2],
+      ["testified",84,1],
+      ["testify",21,1,171,1],
+      ["testifying",99,1],
+      ["testimony",213,3],
+      ["testing",36,1,4,1,13,1,28,1,72,1,7,1,1,1,32,1,3,1],
+      ["teutonic",157,1],
+      ["tewksbury",158,6],
+      ["text",12,1,39,1,2,1,33,18,25,1,15,1,19,4,3,1,4,1,5,1,9,1,22,1,1,1,1,8,7,1,6,4,3,2],
+      ["textbook",11,1,128,1,9,3,63,1],
+      ["textile",50,1,27,2,42,9,21,3],
+      ["texture",30,1,31,1,28,2,51,1,15,1,2,1],
+      ["textured",63,1],
+      ["tf",82,12],
+      ["thame",35,1,31,1,47,12],
+      ["thank",17,1,5,1,9,2,13,1,61,1,53,1,9,1,12,1,33,1],
+      ["thankfully",168,1],
+      ["thanksgiving",32,1],
+      ["thaut",83,1],
+      ["thaw",121,1],
+      ["thea",53,2,83,1],
+      ["theatre",12,2,32,3,67,1,34,1,1,2,57,1],
+      ["theft",218,1],
+      ["theme",12,1,29,2,77,1,64,1,23,4],
+      ["themselve",2,1,1,3,2,1,3,1,3,1,9,1,5,1,17,1,10,1,1,1,1,1,2,3,2,1,2,1,1,1,4,1,3,1,3,1,2,1,2,1,2,1,5,1,3,1,4,2,8,1,1,4,3,1,3,1,2,2,1,1,6,1,5,1,6,1,1,1,6,1,10,2,5,4,11,2,2,1,1,2,3,1,5,1,2,4,4,1,1,1,4,1,5,2,5,1,1,1,5,1,5,2,5,1,1,1,1,2,3,1,1,2,4,1,1,1,3,1,5,2,1,3],
+      ["theology",11,1],
+      ["theorem",56,1],
+      ["theoretical",86,1],
+      ["theoretically",133,1],
+      ["theorised",111,1],
+      ["theorist",8,1,86,1,62,2],
+      ["theorized",17,1,33,1],
+      ["theory",2,2,3,1,3,8,9,2,1,2,7,3,2,1,10,4,4,1,9,1,6,1,1,1,3,4,8,1,7,12,1,3,19,1,11,9,22,1,5,1,4,7,8,1,5,3,2,1,3,2,1,13,1,1,1,1,2,7,1,1,2,2,4,2,1,2,1,3,9,1,2,1,2,1,1,4,4,1,16,1,5,3,2,1,2,2,8,2],
+      ["theranostic",226,1],
+      ["therapeutic",3,1,154,1],
+      ["therapist",11,1,6,1,66,1],
+      ["therapy",17,2,3,2,52,1,2,1,9,10,15,1,76,1,46,1,6,1],
+      ["thereafter",92,1,11,1,84,1,31,1],
+      ["thereby",15,1,50,1,47,1,15,1,16,1,3,1,54,1,7,1,19,1],
+      ["therefore",6,2,3,1,9,1,5,1,2,2,1,1,4,1,1,1,5,1,7,1,8,2,4,2,6,1,24,1,1,1,4,1,7,1,7,1,2,1,27,1,22,1,9,2,8,1,5,1,1,1,7,1,23,1,5,1,2,1,3,2,7,1],
+      ["thermal",195,1],
+      ["thermoplastic",19,2],
+      ["thermoset",19,1],
+      ["thesis",25,1,154,1,32,1],
+      ["thick",10,1,21,1,30,1,30,2,13,1,40,1,29,1,15,1,8,2,4,1,16,1],
+      ["thicken",149,1],
+      ["thicker",107,1,110,1],
+      ["thickness",62,2,164,1],
+      ["thieve",39,1,60,1],
+      ["thin",29,1,38,1,23,1,17,1,1,1,51,2,5,1,24,1,8,1,14,1,4,1,3,2,1,2],
+      ["thing",0,2,1,1,6,3,2,1,2,1,1,1,2,1,3,2,3,2,1,3,4,3,1,2,5,1,3,1,1,1,2,1,2,1,2,1,4,1,2,2,4,1,2,1,3,1,1,1,3,1,7,1,5,1,3,1,1,1,2,1,2,1,1,1,1,1,3,1,1,1,3,1,3,2,1,3,1,1,2,1,3,1,1,1,2,1,2,3,1,1,8,1,8,1,2,2,3,2,9,1,11,11,3,4,5,1,1,1,5,4,4,1,1,2,2,1,3,1,1,1,1,4,9,1,2,1,1,2,1,1,2,1,4,1,1,1,3,1,2,6,1,3,1,1,5,1,1,2,2,1,4,1,1,1,1,3,2,5,11,1],
+      ["think",3,1,2,2,1,2,6,2,5,3,4,1,2,1,1,2,15,1,8,1,1,1,1,2,6,1,2,1,1,1,2,1,5,1,6,1,7,1,2,5,1,2,2,1,6,1,2,1,1,1,1,1,2,2,1,1,2,3,3,1,1,1,4,1,8,2,11,1,1,2,12,1,6,1,1,1,1,1,4,1,2,2,2,1,4,1,2,1,1,1,2,1,8,1,1,1,6,1,5,2,1,1,5,1,4,1,3,1,1,3,2,1,1,1,2,1,1,1,2,1,1,2,9,1,4,1,1,1,1,2],
+      ["thinker",17,1],
+      ["thinking",16,1,1,2,20,1,44,4,2,1,9,1,5,1,4,1,17,1,10,1,10,1,6,1,5,1,1,2,2,2,7,1,1,2,16,1,2,1,3,2,2,1,3,1,3,3,1,1,12,1,3,1,8,1,2,1],
+      ["third",1,1,24,1,27,1,4,1,14,1,5,1,17,1,2,1,2,1,12,1,9,1,9,1,2,1,1,1,1,2,3,1,4,1,3,1,1,1,12,2,2,1,1,2,6,1,2,2,3,1,7,1,4,1,16,1,6,1,8,1,2,1,2,1,4,1,6,1],
+      ["thirdly",25,4,48,1,133,1],
+      ["thirst",83,1],
+      ["thirteen",0,1,91,1,1,1],
+      ["thirteenth",194,1],
+      ["thirty",2,1,167,1],
+      ["thoma",23,1,16,1,19,2,12,1,41,5,15,1,19,2,58,2,8,1],
+      ["thomason",95,1],
+      ["thompson",47,1,71,2],
+      ["thoreau",112,1],
+      ["thorn",216,1,8,2],
+      ["thorough",86,1,106,1,5,1],
+      ["thoroughly",77,1,12,1,63,1,18,1,37,1],
+      ["though",0,1,15,1,2,1,4,5,10,2,8,1,3,1,1,1,1,1,3,1,3,1,7,2,1,2,2,1,12,2,4,2,2,1,8,1,2,2,3,2,2,3,6,2,3,2,1,1,2,1,1,1,4,1,5,1,1,2,4,2,5,2,1,2,5,1,7,1,4,1,1,1,3,2,8,1,4,1,2,1,2,2,6,1,2,1,1,1,4,6,3,2,1,1,3,2,1,1,1,1,3,1,1,1,1,1,1,2,9,2,3,1,5,1,1,1,1,2,5,1,2,1,1,2,3,1],
+      ["thought",12,2,6,2,2,1,1,2,1,1,3,1,5,1,1,1,2,1,5,1,5,1,2,2,1,1,1,3,3,1,9,1,1,1,1,1,7,1,3,2,5,1,2,1,1,1,3,1,5,1,6,2,2,1,4,1,2,2,5,1,6,1,1,1,2,1,1,1,6,1,1,1,4,1,12,1,2,1,1,1,2,3,2,1,1,1,2,2,3,3,8,3,1,1,6,1,11,1,2,1,1,1,1,2,1,4,1,4,3,1,17,1,7,2,1,1,6,1,5,2],
+      ["thoughtful",182,1,13,1],
+      ["thousand",2,3,12,1,1,1,2,1,6,1,2,1,4,1,5,4,1,1,11,1,1,1,3,1,17,1,6,1,4,1,1,1,1,1,18,1,1,1,1,1,1,1,12,1,1,2,6,1,2,1,9,1,2,1,5,2,2,1,8,1,13,1,4,4,4,1,12,2,7,1,20,1,3,2,1,1,11,1],
+      ["thread",19,1,28,1,30,2,42,1,75,1],
+      ["threat",32,1,45,1,26,1,36,1,2,6,1,5,9,1,71,1,2,2],
+      ["threaten",59,1,82,1,1,1,44,1],
+      ["threatened",56,2,54,1,28,1,13,1,42,1,8,1,1,1],
+      ["threatening",94,1,80,1,3,1],
+      ["three",1,1,2,2,4,6,5,4,2,2,6,2,3,1,2,6,3,1,2,2,4,1,2,1,2,1,4,3,1,2,1,2,2,3,3,1,1,1,2,4,1,2,4,1,4,1,2,1,4,2,1,1,5,2,2,3,4,1,1,2,4,1,1,1,5,1,2,2,2,2,1,1,1,4,2,1,1,1,1,1,3,1,1,1,4,1,3,3,4,1,7,1,1,1,4,1,1,1,2,3,3,1,5,2,1,1,2,1,1,1,6,7,3,2,2,2,1,1,5,1,2,1,1,2,1,1,1,2,9,3,1,2,1,1,1,1,2,1,1,4,2,6,2,2,1,2,2,1,6,1,2,2,3,2,1,1,3,1,1,2,4,1,7,1,7,1,2,1,1,2,3,1],
+      ["threshing",99,1],
+      ["threshold",65,1,86,6,7,1,68,1],
+      ["thrill",63,2,37,1,61,3,27,1],
+      ["thrilled",9,1],
+      ["thriller",188,1],
+      ["thrilling",57,1,6,2,49,1],
+      ["thrive",20,2,28,1,6,1,49,1,29,1,3,2,8,2,20,1,10,2,14,1,30,1],
+      ["thrived",149,1,74,1],
+      ["thriving",32,1,16,1,2,1,54,1,59,1,55,1],
+      ["throat",171,1,49,2],
+      ["thrombosis",80,3],
+      ["throne",77,1],
+      ["through",0,1,1,2,2,7,2,3,2,1,2,1,4,4,2,1,1,1,1,2,2,1,1,3,2,1,4,2,1,3,1,1,1,4,1,3,1,1,2,1,1,1,1,1,5,1,1,1,2,1,1,2,2,1,1,2,5,6,1,2,2,3,3,1,4,5,1,2,1,1,1,1,1,2,2,1,1,1,6,3,3,2,1,4,1,1,5,1,3,1,4,2,1,3,2,1,1,1,1,1,5,1,2,2,1,1,1,1,1,1,2,1,2,1,2,4,1,1,4,2,4,2,1,3,1,1,4,1,3,2,1,1,1,1,1,1,1,2,2,2,1,2,1,1,1,2,5,1,4,1,1,1,1,1,2,2,1,5,1,1,4,1,1,1,1,1,1,3,1,3,1,1,2,1,1,1,1,1,2,2,1,1,2,1,1,1,1,1,1,1,2,2,2,2,2,2,3,2,1,4,3,1,1,1,2,1,3,3,4,1,1,3,2,2,1,1,1,2,1,4,1,2,2,1,2,2,2,1,3,1,1,1,3,3,2,1,1,1,1,2,1,1],
+      ["throughout",0,4,1,1,8,1,1,1,4,1,8,1,5,1,4,1,2,1,7,1,4,1,7,1,3,1,1,1,7,1,4,1,7,2,4,1,2,1,1,1,10,1,4,1,3,1,2,1,4,1,2,1,3,1,1,1,2,2,13,1,7,1,1,1,4,1,2,1,5,1,1,3,1,1,3,1,2,2,3,1,4,2,1,1,5,1,3,1,13,1,7,1,1,2,6,1,2,1,3,1,2,1,2,1,1,1,13,1,2,1,4,1,1,3,1,1],
+      ["throw",14,1,90,1,30,1,27,1,17,1,4,1],
+      ["throwaway",134,1],
+      ["throwing",15,1,136,1],
+      ["thrown",51,1,1,1,143,1],
+      ["thrust",5,1,47,1],
+      ["thumb",219,1],
+      ["thunderstorm",124,1,56,1,37,1],
+      ["thus",25,3,16,1,2,1,3,1,2,1,2,1,5,2,1,1,4,1,5,1,2,1,8,1,21,1,2,1,7,1,1,1,2,1,8,1,8,1,6,1,18,1,4,1,2,1,1,1,22,1,2,3,1,1,1,1,6,3,19,2,13,1],
+      ["thylacine",144,22],
+      ["ti",1,1,106,1],
+      ["tibal",82,4],
+      ["tiberius",169,2],
+      ["tibetan",77,1],
+      ["ticket",170,1,49,1],
+      ["ticking",144,1],
+      ["tidal",5,1],
+      ["tide",5,1,27,1,37,1,42,1,14,1],
+      ["tidy",118,2,16,1,50,1],
+      ["tie",204,1,1,1],
+      ["tied",1,1,93,1,11,1,35,1],
+      ["tiedeman",36,1],
+      ["tiger",138,1,6,12,58,1],
+      ["tight",112,1,49,1],
+      ["tighten",162,1],
+      ["tighter",16,1,90,4],
+      ["tightly",118,1,43,1,63,1],
+      ["tilburg",76,1],
+      ["tile",44,5],
+      ["tilt",3,1,161,1],
+      ["tilted",161,1],
+      ["tilting",3,1],
+      ["tim",5,1,129,1],
+      ["timber",21,1,96,6,6,2,28,2,18,1,10,5],
+      ["time",0,2,1,3,1,2,2,7,2,2,3,4,2,2,2,3,2,9,1,5,1,3,1,2,2,13,1,5,2,2,2,1,2,1,1,3,1,1,1,3,1,4,1,4,2,3,1,2,1,1,1,1,2,9,1,3,1,2,1,5,1,3,1,1,1,2,1,3,1,4,2,2,1,1,1,3,1,2,1,1,1,2,3,1,1,1,2,5,1,2,2,3,1,2,2,5,1,1,2,4,2,1,1,4,1,8,1,1,2,1,2,1,1,1,1,3,5,1,2,10,1,3,1,3,1,2,1,2,1,2,1,1,1,3,1,1,1,1,1,3,1,1,1,3,2,1,2,1,1,2,1,5,1,4,1,2,2,1,1,2,1,1,2,2,1,4,1,3,6,3,1,4,1,1,2,7,1,11,1,1,1,2,1,2,1,4,1,2,1,2,1,3,1,1,2,3,1,5,1,1,1,1,3,4,1,2,1,1,1,1,1,1,1,1,1,1,1,4,2,2,2,1,2,3,2,4,1,1,1,1,1,2,2,4,1,5,1,1,1,2,1,3,2,3,2,4,1,1,1,1,2,3,1,1,1,2,1,1,2,4,1,4,1,9,1,3,1,1,1,5,1,3,1,7,1,1,1,1,1,2,2,1,1,6,1,1,1,2,1,1,1,1,1,5,1,4,2,2,1,1,1,1,1,1,1,1,1,1,2,8,1,1,1,1,1,2,1,2,3,1,1,1,1,2,1,4,1,2,1,3,3,6,1,1,2,1,1,2],
+      ["timeless",104,1,53,1,14,1],
+      ["timely",135,1,31,1],
+      ["timid",188,1],
+      ["timing",94,1,32,1,50,1],
+      ["timor",62,2],
+      ["tinier",159,1],
+      ["tiny",22,1,5,1,20,1,5,4,7,2,4,1,17,2,17,1,13,1,13,1,4,1,15,1,17,3,9,1,7,1,12,1,28,1,6,2,3,1],
+      ["tip",10,2,30,1,26,2,18,1,42,1,81,1],
+      ["tipped",79,1],
+      ["tired",37,1,69,1,94,3],
+      ["tiredness",106,1],
+      ["tissue",2,1,35,1,22,1,2,1,14,1,8,1,44,1,89,2,4,1],
+      ["titanium",226,1],
+      ["titi",110,1,77,1],
+      ["title",54,1,3,1,7,2,40,1,7,1,7,1,18,1,14,1],
+      ["titled",64,1],
+      ["titus",145,1,58,1],
+      ["toad",193,28],
+      ["tobacco",158,1,63,1],
+      ["tobin",192,4],
+      ["today",1,3,5,1,1,1,1,1,1,2,2,1,2,1,2,3,1,3,3,1,1,1,2,2,3,2,2,1,2,3,2,3,4,1,3,1,1,3,1,1,1,1,2,2,2,1,1,2,1,3,3,2,1,1,6,1,2,1,2,1,3,1,3,2,12,1,8,1,1,1,2,1,4,1,2,1,1,1,5,2,2,2,3,1,1,1,1,1,5,2,1,1,2,1,1,1,1,1,1,2,2,1,2,1,4,1,3,2,1,1,1,2,1,1,1,1,5,7,1,1,1,1,3,2,2,1,1,1,2,1,1,1,5,1,1,1,1,1,2,1,2,1,2,2,4,2,3,2,1,1,5,2,4,1,6,3,1,2,1,2,3,1,1,1,2,1,1,2,3,2,4,2,2,1,1,4,2,2,1,1,2,1,2,3,2,1,2,2,1,2,1,2,2,1,2,1,2,1,1,3],
+      ["todaygraphite",218,1],
+      ["todd",85,1,34,1,81,1],
+      ["toddler",198,8],
+      ["toe",154,1],
+      ["toga",219,1],
+      ["together",1,1,2,1,1,1,6,1,8,1,1,2,5,1,3,1,1,1,2,2,1,1,10,1,3,1,2,1,7,1,4,2,2,1,5,1,4,1,1,1,8,1,14,1,6,1,1,1,2,1,2,1,5,1,9,1,2,1,1,1,4,2,5,1,1,3,4,1,2,1,1,2,4,1,5,1,2,1,1,1,2,1,4,1,12,1,2,1,4,2,4,1,3,1,1,1,3,1,1,3,3,1,8,1,2,1,1,1,1,1,4,1,2,1,3,2,3,1,5,1,1,1,1,3,1,2],
+      ["toilet",35,1,85,1],
+      ["token",67,11],
+      ["tokyo",133,1],
+      ["told",6,1,1,2,15,1,5,1,4,1,6,2,45,1,3,2,7,2,63,1,20,1,7,1,2,3,12,2,15,1,2,1,7,1],
+      ["toldo",40,3],
+      ["tolerance",10,1,87,1,63,1,1,1],
+      ["tolerate",51,1,62,1,8,1,22,4,44,1],
+      ["tolerated",15,1],
+      ["toll",63,2,50,1,34,1],
+      ["toltec",23,1],
+      ["tom",5,1,28,2],
+      ["tomato",22,21,202,2],
+      ["tomatoe",22,9],
+      ["tomb",29,2,2,8,15,2,42,1],
+      ["tomographic",30,1],
+      ["tomography",17,1,13,3,196,1],
+      ["tomorrow",20,1,102,1,59,1,28,1,13,1],
+      ["ton",66,1,63,1,35,2],
+      ["tonal",204,2],
+      ["tone",36,1,10,2,14,1,23,3,65,4,6,1,1,1,10,1,2,2,37,4,8,2],
+      ["tongarewa",1,1],
+      ["tongue",86,1,9,3,63,1,4,1,20,2,4,16,21,2,9,1,8,1],
+      ["tonne",16,1,17,5,69,4,31,1,1,2,31,1,34,4,11,2],
+      ["tononi",220,1],
+      ["tony",20,1,17,2,25,1],
+      ["too",13,1,3,1,2,1,2,4,6,1,3,1,1,1,9,1,2,1,5,1,15,1,1,2,1,1,4,1,1,1,2,1,1,1,1,1,1,1,2,1,2,1,11,1,1,1,4,1,2,1,2,1,4,1,1,1,5,1,2,1,1,1,3,1,2,1,1,1,4,1,4,1,3,1,3,1,1,1,2,1,1,3,1,1,7,1,1,1,2,4,2,1,2,3,4,2,1,3,6,2,1,1,2,1,3,1,3,1,1,2,1,1,2,1,8,1,1,1,4,1,1,1,8,1,4,1,2,2,2,4,1,1,1,1,1,1,3,1,5,1,1,1,4,2,1,1,5,1],
+      ["tooby",150,2],
+      ["took",0,1,4,1,5,2,3,2,5,1,5,1,2,1,4,1,2,1,1,1,4,1,4,1,1,1,3,1,1,2,2,2,12,1,1,1,1,1,7,2,5,1,4,1,6,1,2,2,1,1,6,1,10,2,8,1,4,1,12,1,1,1,8,1,2,2,2,1,13,2,1,1,5,2,1,1,10,1,9,1,1,1,3,1,11,1,1,1,1,1,2,1,6,1,3,1,4,1,2,2,2,1,2,1,2,2],
+      ["tool",1,2,11,1,9,2,6,3,20,2,12,1,1,1,1,1,3,1,1,1,2,1,3,1,3,2,1,1,6,3,2,2,16,1,15,2,2,6,12,12,16,1,4,1,19,2,23,1,1,1,20,5,7,1,3,1,2,3],
+      ["toolkit",127,1],
+      ["tooth",47,1,131,4,13,6],
+      ["toothbrushe",191,1],
+      ["toothed",125,1],
+      ["toothpaste",191,2],
+      ["top",6,1,9,1,3,2,4,1,24,5,3,3,1,1,5,1,7,1,1,1,39,1,1,1,5,1,24,6,6,1,17,1,6,1,1,2,1,3,2,2,8,1,17,1,2,1,3,1,2,1,2,1,2,1,1,1,9,1,6,1,1,2],
+      ["topic",2,1,14,1,25,1,44,2,11,1,4,1,67,1,1,1,40,1,4,1,1,1,9,1],
+      ["topsoil",124,3],
+      ["torche",23,1],
+      ["tordesilla",23,1],
+      ["torment",175,1],
+      ["torn",104,1],
+      ["toronto",81,1,58,1,28,1,19,1,26,1],
+      ["torpedo",52,1],
+      ["torquemada",23,1],
+      ["torrance",81,1],
+      ["torre",46,3],
+      ["torrent",182,1],
+      ["torso",83,1],
+      ["tortoise",46,1],
+      ["total",8,1,12,3,12,1,4,1,33,1,13,1,28,2,7,1,7,1,1,1,12,1,3,1,11,1,11,2,8,1,11,1,2,1,15,1],
+      ["totalitarian",36,1],
+      ["totality",41,1],
+      ["totally",2,1,55,1,9,1,2,1,59,1,16,1,12,1,29,1,33,1],
+      ["totter",211,1],
+      ["touch",93,3,7,1,20,1,70,1,8,3,15,1,4,1,7,1,1,1],
+      ["touche",41,1,183,1],
+      ["touched",217,1],
+      ["tough",33,1,2,1,26,3,29,1,19,1,19,1,56,2,41,1],
+      ["tougher",184,4],
+      ["toughness",119,1],
+      ["toulouse",201,1],
+      ["tour",26,1,5,2,101,1,64,3],
+      ["touring",55,1],
+      ["tourism",33,1,1,4,21,1,35,1,34,1],
+      ["tourist",1,1,25,4,5,4,3,3,21,1,8,1,69,2,12,1],
+      ["tournament",57,1,127,12,5,1],
+      ["toward",1,1,10,1,2,5,13,2,10,3,5,1,7,1,1,1,4,1,6,1,9,1,5,1,1,1,13,1,10,1,1,1,3,1,5,1,10,1,1,1,6,1,14,1,5,2,6,1,4,1,7,1,5,6,6,1,1,1,1,1,12,1,4,2,8,1,2,3,7,1,3,1],
+      ["towed",66,1],
+      ["towel",92,1],
+      ["tower",63,10,110,1,22,5],
+      ["town",17,1,16,4,2,1,4,2,19,1,22,1,7,3,9,1,3,1,46,1,12,1,22,1,12,1,3,3,9,1,8,1,6,1,1,1],
+      ["townhouse",118,1],
+      ["townsman",87,2],
+      ["toxic",61,2,4,1,24,1,45,1,24,1,35,1,31,1,2,1],
+      ["toxicity",193,1],
+      ["toxin",65,1,69,1,9,3],
+      ["toy",19,1,10,2,7,1,6,2,12,1,38,1,12,1,94,1,8,1,5,8,15,1],
+      ["toyoda",73,1],
+      ["toyota",73,2],
+      ["trace",2,2,48,1,52,1,56,1,41,1,18,1],
+      ["traced",68,1],
+      ["tracing",41,1,93,1],
+      ["track",16,1,9,2,16,1,6,1,1,1,4,1,15,1,9,1,6,1,2,1,13,1,25,1,10,7,24,1,24,3,11,1,25,1],
+      ["tracked",156,1,24,1],
+      ["tracking",121,1],
+      ["tract",124,1,13,1,30,1,12,1,9,1,24,1],
+      ["trade",0,2,32,1,10,1,5,11,3,2,1,1,4,1,4,1,7,4,10,8,1,5,3,1,8,6,19,1,16,1,2,1,15,2,39,2,15,5,15,1],
+      ["traded",1,1,15,1,22,1,9,1,3,2,16,2,62,1],
+      ["trader",0,1,66,1,22,1],
+      ["trading",38,1,12,2,16,3,11,1,11,2,13,2,6,1,1,1,71,1,13,1],
+      ["tradition",1,1,15,1,87,1,1,1,13,1,3,1,16,1,21,3,14,1,11,1,1,1,22,3,14,1],
+      ["traditional",1,6,4,1,3,2,3,1,5,2,6,1,7,1,3,2,2,1,7,1,7,1,17,1,11,1,6,1,15,1,11,1,8,1,2,1,2,1,4,2,2,1,6,1,1,1,3,2,9,2,5,2,10,1,8,6,10,2,17,7,3,1,5,2,7,1,3,1,13,1],
+      ["traditionally",16,1,19,1,16,1,27,1,49,1,13,1,5,1,7,1,15,1,45,1],
+      ["trafalgar",149,1],
+      ["traffic",31,1,22,1,17,1,12,1,14,2,17,1,18,1,50,1,16,1,23,4],
+      ["tragedy",12,1,41,1,118,1],
+      ["tragically",105,1],
+      ["tragicomic",12,1],
+      ["trail",222,3],
+      ["train",17,1,20,1,21,2,20,1,2,1,4,4,1,2,11,1,17,1,19,10,57,1,34,1],
+      ["trained",2,1,35,3,21,1,12,1,60,1,6,1,22,1,17,1,1,1,13,1],
+      ["trainee",163,2],
+      ["trainer",163,1],
+      ["training",2,2,4,1,5,1,28,1,19,4,22,2,3,1,17,1,11,1,19,1,18,1,5,1,7,1,2,9,1,3,4,1,8,2,1,8,13,3,23,1,8,1],
+      ["trait",2,1,18,1,2,1,10,1,83,1,12,2,8,1,8,1,2,1,4,1,8,1,1,1,25,1,7,1,10,1,3,1,1,1,18,1],
+      ["trajan",87,2],
+      ["trampled",124,1],
+      ["trance",167,1,45,1],
+      ["tranquility",57,1],
+      ["tranquilliser",72,2],
+      ["transaction",67,1,21,1,74,2,4,1,53,1],
+      ["transcending",83,1],
+      ["transfer",56,1,124,1,6,3,4,1],
+      ["transferred",128,1,13,1],
+      ["transferring",86,1],
+      ["transform",28,1,57,1,19,1,3,1,49,1,26,1],
+      ["transformation",22,1,12,2,75,1,3,2],
+      ["transformational",7,1],
+      ["transformative",28,1],
+      ["transformed",34,5,107,1,49,1,19,1,14,1],
+      ["transforming",63,1,22,1,34,1],
+      ["transient",14,5,12,1],
+      ["transition",96,1,13,1],
+      ["transitioned",177,1],
+      ["translate",7,1,60,1,6,1,60,1],
+      ["translated",67,1,19,1,63,1],
+      ["translating",86,5,25,1,72,1],
+      ["translation",86,29,54,1,10,1,7,1,5,1],
+      ["translator",86,12,76,2],
+      ["translucency",30,1],
+      ["translucent",30,2],
+      ["transmission",60,2,148,1],
+      ["transmitted",154,1,11,1],
+      ["transmitter",103,1],
+      ["transmitting",72,1,82,1,26,2],
+      ["transmutation",116,1],
+      ["transparent",30,1,49,1,46,1,101,1],
+      ["transport",55,1,1,1,10,1,5,1,31,1,1,1,4,1,84,1,8,1],
+      ["transportable",133,1],
+      ["transportation",96,5,45,1,54,2],
+      ["transported",61,1,18,1,17,1,34,1,11,1,69,1],
+      ["transporting",130,1,2,1],
+      ["trap",59,2,10,1,96,1,30,1,30,1],
+      ["trapped",62,1,53,1,34,1,15,1,15,1,44,2],
+      ["trapping",47,1,12,1],
+      ["trash",135,1],
+      ["travel",13,1,1,1,1,2,6,1,5,1,2,1,16,2,3,1,5,1,7,1,4,1,5,1,16,1,5,1,15,1,7,1,4,1,21,1,6,4,7,1,15,2,1,1,15,6,3,1,1,1,7,1,25,2,6,1],
+      ["traveled",43,1,20,1,91,1,14,1],
+      ["traveler",50,1,118,1],
+      ["traveling",43,1,9,1],
+      ["travelled",77,2,11,1,25,1,3,1,20,2,23,1,21,1,4,1],
+      ["traveller",23,7,23,1,79,1,32,1,8,1],
+      ["travelling",40,2,15,1,25,1,41,1,21,4,38,1,11,1],
+      ["traverse",159,1],
+      ["trawl",91,1],
+      ["trawling",100,1],
+      ["treasure",90,1,9,1,9,1,27,1,22,1,14,1],
+      ["treasured",44,1,64,1],
+      ["treat",11,1,5,1,27,1,49,2,7,1,21,1,24,1,18,1,12,1,34,1],
+      ["treated",7,1,2,1,70,1,14,1,29,2,12,1,33,1,31,3,14,1,8,2,5,1],
+      ["treating",20,1,65,1,13,1,60,1,33,1,29,2],
+      ["treatment",11,1,8,1,5,1,48,8,65,1,54,3,16,1,7,3,6,1],
+      ["treaty",0,1],
+      ["tree",1,2,15,2,7,1,8,1,2,1,2,1,13,1,3,10,14,3,4,1,15,4,4,3,7,1,5,1,2,5,1,2,4,1,8,6,2,2,1,1,2,2,4,2,1,1,2,1,8,3,2,1,6,10,8,1,9,2,19,21,16,2,4,5,17,2,1,2,4,2,3,2],
+      ["treeless",40,1],
+      ["trehub",167,3,45,4],
+      ["tremendous",38,1,74,1,8,1,39,1,39,1,17,1],
+      ["trend",9,1,4,1,16,1,14,1,12,1,15,1,12,1,6,1,7,1,15,1,24,1,28,1,45,1],
+      ["trendy",82,1,106,1],
+      ["trevisa",211,1],
+      ["trevithick",113,2],
+      ["trial",16,1,8,4,18,3,11,1,59,1,19,1,45,1,37,8,1,2],
+      ["triangle",67,1,17,1,34,1,17,1],
+      ["triangular",27,1,36,4,4,1,17,1],
+      ["triassic",25,4],
+      ["tribal",182,1],
+      ["tribe",5,1,34,1,4,1,96,1,8,4,3,1,10,1,7,1,16,2,29,1],
+      ["tribesman",167,1,45,1],
+      ["tribespeople",43,8],
+      ["tributary",179,1],
+      ["tribute",23,1],
+      ["trichome",224,5],
+      ["trick",63,1,26,1,2,2,7,1,121,1],
+      ["trickery",89,1],
+      ["tricky",6,1,11,1,63,1,76,1,5,1],
+      ["tried",5,1,3,1,22,1,5,1,1,1,1,1,15,1,13,1,40,3,14,1,7,1,12,1,25,1,2,1,3,1,27,1,5,2,2,1,9,1,11,1],
+      ["trigger",3,1,57,1,11,1,1,1,6,1,2,1,2,1,2,1,16,2,50,1,8,1],
+      ["triggered",13,1,55,1,26,1,6,2,29,1,46,1],
+      ["triggering",81,1],
+      ["trilingual",186,1],
+      ["trillion",37,1,143,1],
+      ["trinkaus",27,1],
+      ["trip",0,1,23,1,3,2,8,1,27,1,5,1,25,1,32,1,45,1],
+      ["tripped",45,1],
+      ["tripping",216,1],
+      ["triumph",109,1,3,5,1,1,36,1,7,1,1,1],
+      ["triumphant",23,1],
+      ["triumphed",64,1],
+      ["trivial",85,1],
+      ["tropic",48,1,53,1,20,1,22,1],
+      ["tropical",10,1,23,1,15,3,17,2,3,1,33,4,24,1,14,2,2,1,2,1,58,1],
+      ["trotting",171,1],
+      ["trouble",5,1,28,4,6,1,4,1,15,5,10,1,17,1,21,1,69,1,7,2,15,1,18,1,10,1],
+      ["troubled",43,1,21,1,54,1],
+      ["trouser",5,1],
+      ["trout",141,2,46,2],
+      ["trowell",4,2],
+      ["truck",85,1,11,2,88,4],
+      ["trucked",122,1],
+      ["trudged",96,1],
+      ["true",2,3,4,1,12,1,5,1,5,1,6,1,3,1,13,1,10,1,4,1,8,1,13,1,10,1,12,1,14,2,4,1,11,1,11,1,5,1,3,1,2,1,3,1,1,1,10,1,4,3,2,1,2,1,3,2,6,1,9,1,9,1,1,2,1,1,6,1,1,3,4,1,1,2,2,1,3,2],
+      ["truly",81,1,13,1,18,1,14,2,14,4,18,1,24,1,4,1,1,1,1,1],
+      ["trunk",117,1,10,1,27,3,70,1],
+      ["trunkfish",52,1],
+      ["trust",7,1,21,1,25,1,51,1,1,1,95,1,1,1],
+      ["trusted",156,1],
+      ["trusting",81,1],
+      ["truth",15,1,73,1,5,1,5,1,50,1,23,1,4,2,22,1],
+      ["truthful",215,1],
+      ["try",5,1,21,1,16,1,1,1,6,1,4,1,2,1,14,1,3,1,10,1,5,1,1,1,1,1,3,1,1,1,1,1,1,1,9,1,1,1,9,1,14,1,3,1,13,1,4,1,2,1,3,1,7,2,1,1,16,2,6,1,6,2,2,1,6,1,3,1,9,1,7,1],
+      ["trying",30,1,5,1,19,1,5,1,1,1,13,1,8,1,11,1,4,1,3,1,4,1,32,3,15,1,1,1,2,1,12,1,16,1,8,1,3,1,24,1],
+      ["ts",107,2],
+      ["tsimane",43,2],
+      ["tsunami",196,11],
+      ["tsusho",31,1],
+      ["ttingen",111,1],
+      ["tuan",26,1],
+      ["tuatara",110,33,77,24],
+      ["tube",3,1,24,1,32,1,20,2,101,2],
+      ["tuber",99,4],
+      ["tuberculosis",4,1],
+      ["tubular",132,1],
+      ["tuft",101,1],
+      ["tug",66,1,118,2],
+      ["tui",187,1],
+      ["tumble",165,1],
+      ["tumbling",161,2,4,1],
+      ["tuna",52,2],
+      ["tundra",10,2,11,1],
+      ["tune",18,2,149,4,37,1,8,4],
+      ["tuned",46,1,22,1,3,1,7,1,43,1,74,1],
+      ["tunguska",142,1],
+      ["tunic",77,1],
+      ["tunicate",91,7],
+      ["tunnel",31,1,28,2,20,1,34,24,19,1,41,3,50,1],
+      ["tunnelled",113,1],
+      ["tunnelling",113,7],
+      ["turbulence",52,2],
+      ["turbulent",52,1],
+      ["turin",72,1],
+      ["turkestan",46,1],
+      ["turkey",32,10,14,1,89,1,12,1,5,1],
+      ["turkish",46,1],
+      ["turmoil",63,1,1,1],
+      ["turn",5,1,7,1,1,2,10,9,3,1,7,1,4,1,3,1,3,1,13,1,1,1,1,1,2,1,1,2,8,2,4,1,7,1,6,1,2,1,3,1,6,1,1,1,2,1,9,1,3,1,7,2,1,1,4,1,4,1,3,2,1,2,1,1,2,3,3,1,1,1,10,1,7,1,3,2,3,1,2,2,1,1,1,1,1,1,9,1,4,1,1,3,10,1,1,1,10,1,6,1,4,1,3,3,2,1,5,1,3,5],
+      ["turned",0,1,1,3,24,2,3,1,13,1,4,2,5,1,22,2,14,1,1,1,10,1,5,1,1,2,2,1,4,2,3,2,1,1,11,1,8,1,3,1,14,1,12,2,3,1,4,1,3,1,3,1,5,1,5,1,15,1,14,1,4,1],
+      ["turner",33,1,172,1],
+      ["turning",5,1,28,1,2,2,13,1,4,1,8,1,24,1,28,1,7,1,26,1,16,1,14,1,6,1,22,1,22,1],
+      ["turnip",61,1],
+      ["turtle",115,1,26,1],
+      ["tusk",27,1],
+      ["tutor",122,1,76,2],
+      ["tuxtla",143,1],
+      ["tv",9,2,48,4,69,2,20,1,20,1,9,12],
+      ["tweed",194,1],
+      ["twelfth",28,1,166,1],
+      ["twelve",46,2,106,2],
+      ["twentieth",34,1,39,1,14,1,64,1,17,1,12,1],
+      ["twenty",34,2,50,1,13,1,8,1,1,1,43,1,4,1,17,2],
+      ["twice",2,1,27,1,2,1,54,1,7,1,5,1,4,1,60,1,1,1,42,1,3,1],
+      ["twig",127,2],
+      ["twin",31,1,49,1],
+      ["twirl",21,1],
+      ["twist",109,1,10,1,13,1,50,1,38,1],
+      ["twisted",132,1],
+      ["twister",182,1],
+      ["twisting",52,1],
+      ["two",0,1,2,3,2,4,2,1,1,2,1,2,2,1,1,1,1,2,1,2,1,3,5,1,1,2,1,1,1,2,2,13,6,2,1,3,1,2,1,1,2,1,1,2,2,4,1,4,5,1,2,2,2,1,5,1,1,4,2,1,1,3,1,2,2,2,1,3,1,1,2,3,2,2,3,1,1,2,1,2,2,2,1,1,1,1,1,1,1,2,1,1,1,2,1,1,1,7,1,1,1,2,1,4,1,1,2,2,5,1,1,2,1,4,1,1,1,1,1,3,1,1,3,3,2,3,1,1,4,1,1,1,1,4,1,2,1,1,1,1,3,2,1,1,2,1,2,1,2,2,2,3,1,4,2,1,2,3,1,1,4,1,1,1,2,3,1,3,3,2,1,2,1,1,4,1,1,2,2,2,1,3,1,1,1,4,2,3,5,1,2,1,1,1,1,2,2,2,1,1,1,2,2,1,3,4,1,2,1,1,1,3,2,4,1,2,1,3,1,1,1,1,1,7,1,2,1,3,1,2,1,1,4,1,2,2,1,1,1,1,1,7,1,1,4,3,2,1,1,1,2,1,1,1,2,2,1,1,1,2,1,1,1,2,2,1,1,2,1,2,2,1,1,1,1,1,1,2,1,3,1,1,1,1],
+      ["tylenol",72,1],
+      ["type",7,1,1,2,1,4,4,1,6,1,1,1,2,1,3,1,1,1,3,2,2,1,1,1,10,1,7,1,3,2,1,1,12,1,2,2,4,3,5,1,2,3,1,1,1,1,1,3,1,2,3,2,1,2,3,1,8,2,3,6,4,1,3,2,1,1,1,1,1,1,7,2,11,1,2,8,1,1,7,1,2,1,1,1,3,1,3,5,5,1,2,1,2,1,9,1,3,1,6,1,2,1,4,2,5,3,2,1,2,1,2,1,2,1,1,2,8,1,6,1,9,1,1,2,1,1,4,1,3,1],
+      ["typescript",53,1],
+      ["typewriter",126,1],
+      ["typhoid",96,1],
+      ["typical",3,1,17,1,11,2,11,1,72,1,6,1,27,1,8,1,3,1,2,1,12,1,6,1,17,1],
+      ["typicality",146,1],
+      ["typically",10,2,8,1,8,1,11,1,48,1,15,1,28,1,3,1,9,2,7,2,5,1,21,1,17,1,5,1,2,1,1,1,22,1,6,1],
+      ["typing",20,1],
+      ["tyre",23,3,118,1],
+      ["tyrian",38,2],
+      ["ubiquitous",214,1],
+      ["uchi",179,1],
+      ["ucl",58,2],
+      ["ucla",17,1,131,1],
+      ["ugly",63,1,36,1],
+      ["uk",4,1,3,1,8,2,3,1,17,1,4,1,14,2,1,1,1,4,1,1,7,1,7,1,32,1,2,2,10,2,3,1,16,1,1,3,7,1,31,1,18,1,9,1],
+      ["ukraine",118,1],
+      ["ultimate",0,1,162,1,10,1,1,1,27,1,22,1],
+      ["ultimately",22,1,2,1,71,1,27,2,7,1,11,1,1,1,1,1,31,1,2,5,17,1,21,1,1,2],
+      ["ultrasound",3,1,223,1],
+      ["ultraviolet",97,2,43,1],
+      ["umbrella",209,1],
+      ["un",133,1,1,1],
+      ["unable",32,1,12,1,14,3,12,1,6,1,11,1,6,1,3,1,53,1,3,1,10,1,12,1,30,3,3,4,17,1],
+      ["unacceptable",127,1],
+      ["unanimous",12,1],
+      ["unanimously",97,1,33,1],
+      ["unanswered",190,1],
+      ["unassuming",182,1],
+      ["unattended",209,1],
+      ["unattractive",24,1,39,1],
+      ["unauthorized",214,1],
+      ["unavailable",201,1],
+      ["unavoidable",75,1],
+      ["unaware",155,1],
+      ["unbelievable",57,1],
+      ["unbranched",10,1],
+      ["unbroken",39,2,183,1],
+      ["unburned",127,1],
+      ["uncertain",110,1,35,1,3,1,35,1,4,1],
+      ["uncertainty",178,1],
+      ["unchallenged",144,1],
+      ["unchanged",46,3,141,1,7,1,2,1],
+      ["unchanging",32,1,57,1],
+      ["unchecked",135,1,2,1],
+      ["unchewed",97,1],
+      ["uncivilized",157,1],
+      ["uncle",105,1],
+      ["unclean",137,4],
+      ["unclear",0,1,56,1,27,1,6,1,29,1,36,1,36,1,18,1],
+      ["unco",142,1],
+      ["uncomfortable",60,1,96,1],
+      ["uncommon",58,1,134,1],
+      ["uncommunicative",221,1],
+      ["uncomplaining",149,1],
+      ["uncomplicated",153,1],
+      ["unconfident",37,1],
+      ["unconnected",12,1],
+      ["unconscious",3,1,14,1,76,3,38,1,21,3,5,1,28,1],
+      ["unconsciously",3,1],
+      ["unconsciousness",157,1],
+      ["uncontrollable",35,1],
+      ["uncontrollably",161,1,13,1],
+      ["uncontrolled",124,1],
+      ["uncooked",61,1],
+      ["uncover",17,1,9,1,56,1,18,1],
+      ["uncovered",22,1,60,1,33,1,8,2,4,1,2,1,10,1,30,1,28,2],
+      ["uncovering",190,1],
+      ["uncreative",81,1],
+      ["undamaged",3,1,117,1,76,1],
+      ["undemocratic",151,1],
+      ["under",5,2,8,2,3,2,3,2,1,1,1,3,2,1,5,1,1,1,11,1,15,1,2,1,2,1,10,1,8,1,4,1,1,1,3,1,3,1,9,1,5,1,5,1,5,1,1,7,10,1,4,1,5,1,1,1,5,1,1,3,1,1,3,1,8,1,6,1,7,1,5,1,8,1,2,7,1,3,4,2,3,1,3,1,2,1,4,1,3,1,3,1,5,2,18,1],
+      ["underachievement",49,1],
+      ["undercover",106,1],
+      ["undercutting",77,1,2,1],
+      ["underdog",157,1],
+      ["underestimated",86,1,55,1],
+      ["undergo",174,1,33,1],
+      ["undergoe",108,1],
+      ["undergoing",83,1],
+      ["undergone",133,1],
+      ["undergraduate",85,1,37,1,26,1,72,1],
+      ["underground",1,1,15,1,18,2,1,3,26,1,8,3,10,6,5,2,26,2,3,4,26,2,34,1,20,1,30,3],
+      ["undergrowth",84,1],
+      ["underinvestment",209,1],
+      ["underlie",174,1],
+      ["underline",93,1,24,1],
+      ["underlined",36,1],
+      ["underlying",106,1,61,1,18,1,5,2,11,1,4,1,7,1,10,1],
+      ["undermine",153,1],
+      ["undermined",16,1,77,1],
+      ["underneath",41,1,176,1],
+      ["undernutrition",76,1],
+      ["underpass",84,1],
+      ["underperforming",33,1,89,1],
+      ["underpinning",34,1],
+      ["understand",7,2,4,2,3,1,8,1,4,1,4,1,2,1,5,7,8,1,9,2,3,2,2,1,4,2,6,1,3,1,2,1,6,1,2,1,12,1,10,2,1,1,1,1,6,1,4,1,6,1,6,1,7,3,8,1,7,2,1,1,11,1,3,1,2,2,12,1,4,1,3,2,1,1,11,2,2,1,8,2,1,2,3,2,3,3,1,2,4,1,2,1],
+      ["understandable",7,1,155,1],
+      ["understanding",7,2,4,3,4,2,9,3,6,1,10,1,8,1,26,1,12,5,7,1,22,1,7,3,7,1,7,1,3,1,2,1,7,1,12,2,13,1,3,1,1,1,1,1,1,1,1,3,6,1,4,1,3,1,8,1,5,5,1,1,1,3,8,5,3,1,3,2,3,1],
+      ["understated",104,1],
+      ["understood",23,1,7,1,10,1,8,1,11,1,5,1,5,1,28,1,19,1,5,1,1,1,7,1,32,1,6,1,18,1,27,1,1,1],
+      ["undertake",97,1,100,1],
+      ["undertaken",23,1,1,3,18,1,8,1,43,1,111,1],
+      ["undertaking",142,2,22,1],
+      ["undertook",50,1,14,1,93,1],
+      ["undertreatment",220,1],
+      ["undervalued",86,1],
+      ["underwater",52,4,7,1,66,1,4,3,51,2,16,1],
+      ["underway",69,1,126,1,28,1],
+      ["underwent",31,1,110,1,78,1,3,1],
+      ["underworld",109,1],
+      ["undeterred",32,1],
+      ["undigested",10,1],
+      ["undistracted",152,1],
+      ["undisturbed",143,1,67,2],
+      ["undoing",151,1],
+      ["undomesticated",147,1],
+      ["undoubtedly",15,1,121,1,70,1,1,1],
+      ["undulate",52,1],
+      ["undulation",52,3],
+      ["unearthed",27,1,23,1],
+      ["unearthing",45,1],
+      ["uneducated",95,1,50,1,58,1],
+      ["unending",87,1],
+      ["unenhanced",98,1],
+      ["unenthusiastic",175,5],
+      ["unenviable",144,1],
+      ["unequivocal",40,1,170,1],
+      ["unethical",94,1],
+      ["unexpected",68,1,1,1,23,1,2,1,15,1,15,1,10,4,27,1,7,1,14,1,7,5,21,1],
+      ["unexpectedly",156,1],
+      ["unexplained",6,1,63,1],
+      ["unfair",175,1],
+      ["unfairly",122,2],
+      ["unfairness",109,1],
+      ["unfamiliar",18,1,40,1,30,1,33,1,9,2,24,1],
+      ["unfamiliarity",26,1],
+      ["unfilled",122,1],
+      ["unfinished",18,1],
+      ["unfit",99,1],
+      ["unfocused",220,1],
+      ["unfold",156,1],
+      ["unforeseen",88,1,73,2],
+      ["unforgettable",100,1],
+      ["unforgiving",129,1],
+      ["unfortunate",186,1],
+      ["unfortunately",30,1,18,1,11,2,5,1,1,1,20,1,23,1,11,1,2,1,20,2,11,1,4,1,39,1,19,1,6,4],
+      ["unfulfilled",144,1],
+      ["unfulfilling",3,1,206,1],
+      ["unglazed",29,1],
+      ["ungracious",103,1],
+      ["unhappiest",85,2],
+      ["unhappy",54,1,26,1],
+      ["unhealthy",122,1,15,1],
+      ["unification",84,1],
+      ["unified",41,1,65,1],
+      ["uniform",75,1,29,1,14,4,30,1,15,1,2,1,20,2],
+      ["uniformly",101,1,100,1],
+      ["unifying",41,1],
+      ["unimportance",71,1,7,1],
+      ["unimportant",60,1,119,1],
+      ["uninformed",26,1],
+      ["uninhibited",34,1],
+      ["unintelligent",109,1,74,1,3,1],
+      ["unintelligible",67,1,20,1],
+      ["unintentional",225,1],
+      ["unintentionally",37,1],
+      ["uninterrupted",45,1,28,1,150,1],
+      ["unintimidating",170,1],
+      ["uninvited",214,1],
+      ["union",28,1,58,1,67,1,10,2,16,7],
+      ["unique",1,1,13,3,3,1,12,1,3,1,17,3,5,1,9,1,8,1,7,1,17,1,9,1,6,1,7,1,2,5,3,1,1,1,20,1,12,1,13,1,5,1,3,1,6,1,1,2,42,2],
+      ["uniquely",83,1,32,1,89,1,4,1],
+      ["uniqueness",127,1,56,1],
+      ["unit",0,1,19,1,34,1,20,4,4,1,21,1,8,4,10,1,17,2,3,1,14,1,8,1,3,1,5,1,42,1],
+      ["unite",151,1],
+      ["united",10,1,14,2,5,2,7,2,9,1,20,1,5,1,1,4,2,1,12,4,5,1,4,1,7,1,1,1,15,1,5,1,2,1,8,1,3,1,4,1,1,1,1,3,3,1,9,1,3,1,1,1,9,1,29,1,1,1,3,1],
+      ["unity",13,1],
+      ["universal",15,1,2,1,47,1,18,1,13,2,2,1,7,2,2,1,49,1,2,1,10,2,8,1,8,2,21,1,3,1,1,2,3,1,1,2,10,1],
+      ["universally",15,2,47,1,72,1],
+      ["universe",87,1,29,1,90,1,3,1],
+      ["university",0,1,2,1,3,1,1,1,6,5,2,2,3,4,1,3,2,3,2,3,2,2,1,1,2,2,1,25,2,1,7,2,2,2,4,1,2,1,2,3,1,2,1,1,7,5,2,3,1,3,1,5,2,1,1,3,5,1,2,3,1,6,1,3,3,2,1,2,4,3,1,6,2,3,2,5,4,3,1,1,1,1,3,1,1,4,3,1,2,3,1,4,1,1,4,6,5,1,3,1,5,1,1,1,3,4,3,1,1,1,1,8,1,1,4,2,1,4,1,6,3,1,1,1,4,1,1,1,1,2,7,2,1,3,1,4,1,1,1,2,1,1,1,2,5,1,2,1,2,2,2,2,3,1,1,1,1,2,2,4,1,1,3,1,1,3,2,1,2,3,2,1,1,1,1,3,1,5,5,2,1,4,1,3,1,1,1,1,3,1,1,2,1,1,1,2,5,1,2,2,4,1,4,3,1,8,3,1,1,1,1,1],
+      ["unjustified",16,1],
+      ["unknown",0,1,72,1,18,1,21,1,10,1,28,1,5,3,5,1,9,1,12,1,2,1,8,1,6,1,21,1],
+      ["unlearned",130,1],
+      ["unleash",223,1],
+      ["unleashed",138,1,64,1],
+      ["unless",3,1,55,1,11,1,9,1,36,2,24,1,8,1,16,2,35,1,5,1,5,1,8,1],
+      ["unlike",3,2,7,2,10,1,3,1,8,1,3,3,5,2,20,1,3,1,28,1,18,1,3,1,4,1,4,1,4,1,8,3,1,1,7,1,4,5,2,1,8,1,5,1,27,1,18,1,3,1],
+      ["unlikely",43,1,32,1,7,1,95,1,8,1,7,1],
+      ["unlit",39,1],
+      ["unloaded",113,1],
+      ["unlocked",111,1],
+      ["unlocking",17,4,139,1,11,1,45,1],
+      ["unloved",225,1],
+      ["unlucky",59,1],
+      ["unmanned",13,1,129,1],
+      ["unmarried",157,1],
+      ["unmeasured",220,1],
+      ["unnecessary",73,1,147,1],
+      ["unobtrusive",214,1],
+      ["unoccupied",18,1],
+      ["unofficial",109,1],
+      ["unopened",97,1],
+      ["unplanned",193,1],
+      ["unpleasant",71,1,7,1,80,1,3,1,63,1],
+      ["unpopular",4,1,29,1],
+      ["unprecedented",170,1],
+      ["unpredictability",182,1],
+      ["unpredictable",154,1,7,1,18,1],
+      ["unpredictably",18,1],
+      ["unprepared",155,1],
+      ["unprepossessing",190,1],
+      ["unproblematic",178,1],
+      ["unpublished",4,2,14,1],
+      ["unquestionably",178,1],
+      ["unreal",189,1],
+      ["unrealistic",3,1,17,1],
+      ["unreasonable",112,1,37,1],
+      ["unrecognisable",111,2],
+      ["unrelated",50,1,45,1,79,1,1,1],
+      ["unrelenting",91,1],
+      ["unreliable",97,1,16,1,25,1,18,1,46,1,8,1],
+      ["unrest",194,1],
+      ["unrested",43,1],
+      ["unrestricted",112,1],
+      ["unrivalled",29,1,128,1],
+      ["unsafe",118,1],
+      ["unsatisfactory",70,1],
+      ["unscientific",82,1],
+      ["unsettling",93,1],
+      ["unskilled",73,1,95,1],
+      ["unspecified",3,1],
+      ["unstated",109,1],
+      ["unstudied",141,1],
+      ["unsuccessful",16,1,89,1,4,1],
+      ["unsuitable",64,1,22,1,78,1],
+      ["unsung",78,4],
+      ["unsure",90,1],
+      ["unsurpassed",64,1],
+      ["unsuspecting",89,1,135,1],
+      ["unsustainable",96,1,21,1],
+      ["unsystematically",40,1],
+      ["untapped",6,1],
+      ["untie",152,3],
+      ["until",2,1,5,1,2,1,5,1,9,2,4,1,2,3,2,1,4,1,3,1,1,1,5,1,2,2,4,1,2,1,6,2,3,4,7,1,1,1,1,1,1,1,6,1,10,1,3,4,7,1,1,1,1,2,2,1,2,3,2,1,2,1,1,1,1,1,1,2,6,2,1,2,10,1,3,1,7,4,3,4,4,4,2,1,11,1,1,1,2,1,4,1,1,2,3,2,1,2,1,1,1,1,9,3,1,2,1,2,1,1,2,1,2,3,2,1,4,2,3,1,14,1,6,1,2,1,5,1],
+      ["untouched",112,1],
+      ["untrained",37,1,11,1,52,1,8,1],
+      ["untreated",217,1],
+      ["untrue",42,2],
+      ["unusual",2,1,12,1,20,1,11,5,40,1,6,7,30,1,25,1,3,1,19,1,7,1,17,1,4,2],
+      ["unusually",25,1,3,1,43,1,7,1,13,1,14,1,54,1,57,1],
+      ["unveiled",128,1],
+      ["unviable",89,1],
+      ["unwanted",79,1],
+      ["unwary",165,1],
+      ["unwelcoming",170,1],
+      ["unwilling",73,1],
+      ["unwittingly",121,1,22,1],
+      ["up",2,2,1,1,1,3,1,2,5,1,2,1,1,4,1,2,1,1,1,2,1,2,3,1,1,5,2,1,1,3,1,7,1,2,1,2,2,1,1,3,1,1,2,3,1,3,1,3,3,1,1,4,2,2,1,1,1,5,1,1,1,3,1,1,1,1,1,1,1,3,2,1,1,2,1,1,2,1,2,1,1,1,1,4,1,1,1,1,1,6,1,4,1,3,2,4,2,2,1,1,1,3,1,1,1,1,1,1,3,6,2,1,1,1,1,1,1,7,1,2,2,1,1,2,2,1,3,2,1,2,1,3,1,1,1,2,1,2,2,2,1,1,1,1,1,2,1,1,1,1,1,2,1,1,4,2,1,1,1,2,1,2,1,1,1,2,1,3,1,3,3,3,1,2,3,1,1,2,1,1,1,5,1,3,1,4,1,2,2,2,1,2,1,14,1,3,1,2,1,1,2,5,2,1,1,5,2,2,3,1,1,1,1,2,2,3,2,5,1,1,2,3,1,1,1,3,1,2,3,1,1,3,1,1,1,4,1,2,1,4,1,1,1,2,3,1,2,1,1,1,1,1,2,6,1,1,1,1,3,1,1,3,1,3,1,2,2,2,2,2,1,3,1,1,1,2,1,1,3,3,3,1,1,1,1,3,1,2,2,1,2,1,2,1,3,1,1,4,1,2,3,1,1,2,1,1,3,1,1,1,1,1,2,1,1,3,1,2],
+      ["upbeat",18,1,82,1],
+      ["upc",97,2],
+      ["upcoming",189,1],
+      ["update",156,1,3,1,22,1],
+      ["updated",23,1,178,1],
+      ["upgrade",13,1,105,1],
+      ["upgrading",118,1,45,1],
+      ["upheaval",64,1,9,1,109,1],
+      ["upheld",109,1,28,4],
+      ["upholstery",226,1],
+      ["upland",35,1],
+      ["upon",15,1,19,3,3,1,26,1,14,1,21,1,10,1,17,2,12,1,8,1,22,1,22,1,14,1,8,1,1,1],
+      ["upper",8,2,2,2,29,1,19,1,30,1,11,2,24,2,13,1,23,1,21,1,27,1,3,1,12,1,1,1],
+      ["uppermost",21,1],
+      ["upright",115,6],
+      ["uprooted",217,1],
+      ["ups",18,1,142,2],
+      ["upset",112,1],
+      ["upsetting",141,1],
+      ["upshot",167,1,45,1],
+      ["upside",87,1],
+      ["uptempo",18,1],
+      ["upward",207,1],
+      ["urban",31,1,4,2,4,1,11,3,13,5,7,3,5,1,9,7,12,4,3,1,13,3,6,1,13,1,2,1,2,6,12,1,25,2,7,1,16,1],
+      ["urbanisation",47,1,86,1],
+      ["urbanite",112,2],
+      ["urge",34,1,42,1,75,1,49,1],
+      ["urged",39,1,120,1],
+      ["urgent",209,1],
+      ["urn",31,1],
+      ["ursus",27,1],
+      ["us",2,1,1,1,2,2,2,1,4,2,1,4,1,1,2,4,4,1,7,2,2,1,7,1,2,1,2,1,1,1,1,1,1,4,1,1,4,3,1,1,9,6,1,1,2,3,1,1,1,1,1,2,2,1,2,1,3,4,1,3,2,1,1,1,2,1,2,3,2,6,1,1,1,1,1,2,2,2,2,2,3,4,2,3,1,2,1,6,1,1,1,1,1,1,1,1,1,1,1,4,2,6,7,2,3,1,2,3,1,5,3,2,2,2,7,1,1,1,2,1,1,1,1,1,1,1,1,1,3,3,5,2,4,2,1,2,3,2,2,4,2,2,1,3,2,2,1,4,3,1,2,4,4,4,3,1,2,3,1,2,2,1,5,1,1,2,3,1,1,2,3,1,1,1,6,3,2,3,1,2,1,6,2,1,6,2,1,1,1,2,2,2,1,4,3,13,4,1,1,5,2,1,1,3,2,1,1,1],
+      ["usa",16,1,2,2,1,3,11,2,2,1,23,4,9,1,19,1,14,1,1,1,25,2,7,1,1,1,10,1,2,1,4,1,25,1,44,1,4,4,3,1],
+      ["usage",171,1],
+      ["usalast",220,4],
+      ["use",0,1,1,1,1,1,3,5,2,2,1,1,4,2,2,1,2,10,1,2,2,1,2,3,2,11,3,4,4,6,2,1,3,3,2,3,1,4,3,1,3,1,3,6,4,3,1,1,1,2,1,9,2,3,1,1,2,3,1,1,2,3,1,1,1,4,1,1,1,1,1,1,1,4,1,3,1,1,3,5,1,4,2,1,1,5,2,2,1,1,1,1,1,4,1,1,1,4,2,2,3,2,2,1,1,4,3,3,2,2,2,4,3,7,1,2,1,2,3,1,1,1,3,1,2,1,4,3,2,2,2,2,1,1,1,3,1,1,1,1,1,1,1,5,1,1,1,1,1,3,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,2,2,1,3,2,1,4,1,3,1,3,1,1,1,1,1,1,3,2,1,1,1,2,2,3,1,4,3,1,1,1,1,2,2,3,1,2,1,2,1,1,2,1,1,4,1,2,2,2,2,2,1,1,1,3,1,1,3,1,3,3,3,1,2,3,1,1,1,3,1,1,1,3,4,7,1,2,1,2,2,2,3,1,1,1,1,1,2,2,2,2,3,1,1,1,1,8,1,5,3,2,3,4,2,10],
+      ["useable",82,1,135,1],
+      ["used",1,8,2,1,1,2,1,5,1,2,1,1,3,1,2,2,1,5,2,1,1,1,3,4,2,2,2,12,3,3,2,1,1,6,1,1,1,2,2,4,3,1,1,1,1,11,1,2,1,1,3,1,1,1,1,2,1,1,1,3,3,4,1,7,2,2,1,3,2,2,1,1,2,1,2,4,1,3,1,1,1,2,1,5,1,1,1,10,1,2,1,2,2,1,1,1,5,7,1,1,1,12,1,1,1,6,1,1,2,2,1,1,1,2,1,1,5,1,1,1,2,1,2,3,1,1,1,3,1,2,2,7,1,1,3,4,1,7,1,1,5,3,1,1,1,3,1,1,1,3,2,3,1,1,2,3,1,1,1,3,1,3,1,2,1,2,2,8,2,1,1,1,1,1,1,1,2,2,1,1,1,2,1,1,2,1,1,10,1,1,2,4,1,2,2,4,3,2,3,4,1,1,1,1,2,3,4,1,2,2,2,2,2,2,4,1,5,1,2,7,1,2,4,2,2,1,1,1,2,1,1,4,1,2,2,3,1,2,2,1,2,1,1,7,2,1,1,2,1,2,2,1,5,2,1,1,2,2,1,2,2,1,1,3,1,4,1,3,4,1,1,2],
+      ["useful",6,1,7,1,6,1,30,1,2,1,3,1,6,1,10,1,30,1,4,1,1,1,1,1,3,1,19,1,13,1,1,1,4,4,1,1,9,1,10,2,7,1,6,1,6,1,16,1,5,1,11,1,1,1],
+      ["usefulness",19,1,17,1,66,1,11,1,15,1,18,4,34,1,19,1,19,1],
+      ["useless",83,1,80,1],
+      ["user",53,2,17,2,12,3,31,1,4,1,49,1,32,1,22,1],
+      ["ushered",88,1],
+      ["using",1,3,2,2,1,1,3,4,1,1,5,1,4,2,1,4,5,9,3,1,3,4,1,3,3,1,3,1,1,2,1,1,1,2,6,1,1,1,7,2,1,4,2,1,1,1,2,1,3,4,7,1,1,1,2,1,1,1,2,1,4,3,1,3,1,2,1,2,1,2,5,1,1,4,2,1,1,1,5,3,2,1,1,2,2,1,1,1,1,1,12,1,2,1,1,1,3,1,5,5,2,5,2,1,3,1,2,2,3,1,3,1,1,1,2,4,10,2,1,4,3,5,5,2,3,1,1,3,1,1,7,1,4,5,4,1,5,1,1,3,7,1,2,1,2,1,2,2,5,1,2,1,2,1,2,3,2,1,1,1,1,3,8,5],
+      ["usk",211,1],
+      ["usual",85,1,38,1,7,1,56,1,11,1],
+      ["usually",1,1,4,3,5,2,1,1,7,1,18,1,2,1,5,3,5,1,3,1,2,1,1,2,12,1,13,1,6,1,4,1,1,1,12,1,1,1,5,4,2,2,4,1,16,1,9,1,4,1,6,1,4,2,2,3,3,1,21,2,3,1,7,1,10,1,2,1,5,2,1,1,2,1,5,4,6,1,2,1],
+      ["utah",90,1,82,1,25,1],
+      ["uterus",185,1],
+      ["utilisation",122,1],
+      ["utilise",35,1,85,1],
+      ["utilised",51,1,73,1],
+      ["utilising",121,1],
+      ["utilitarian",7,1,207,1],
+      ["utilitarianism",47,1],
+      ["utility",26,1,14,1,116,1],
+      ["utilized",79,1],
+      ["utopian",102,1,55,1,42,1],
+      ["utrecht",71,1],
+      ["utterance",160,1,7,2,41,1,4,2],
+      ["utterly",93,1],
+      ["utzon",44,12],
+      ["uxi",179,4],
+      ["vacated",33,1],
+      ["vaccine",101,1],
+      ["vacuum",59,1,20,1,101,1],
+      ["vagary",23,1],
+      ["vald",141,1],
+      ["valenza",145,3,58,3],
+      ["valete",219,1],
+      ["valiantly",216,1],
+      ["valid",42,1,7,1,25,1,131,1,1,1],
+      ["validate",6,1],
+      ["validity",26,1,122,1],
+      ["valley",21,2,4,2,10,2,15,2,19,1,8,1,70,1],
+      ["vallier",7,3],
+      ["valuable",11,1,4,1,1,1,5,1,16,1,10,1,9,1,9,1,17,1,10,1,12,1,4,2,9,2,5,1,3,1,18,1,3,1,22,1,6,1,2,1,3,1,8,1,3,1,27,2,4,1,5,1],
+      ["valuation",179,1],
+      ["value",0,1,11,2,5,4,12,2,4,1,4,1,1,1,3,1,1,1,1,2,5,4,16,1,1,1,1,1,9,1,3,2,4,1,5,4,9,1,13,2,6,2,3,5,5,8,3,1,3,1,3,1,3,4,9,1,1,2,11,1,1,2,1,2,4,1,5,4,12,9,1,2,4,1,2,1,3,5,6,1,11,1,1,2,7,1,4,1,1,1],
+      ["valued",38,2,13,1,4,1,70,1,25,1,6,1,48,1],
+      ["valueless",166,1],
+      ["van",22,1,23,2,8,2,27,4,76,1,39,1],
+      ["vandal",27,1],
+      ["vandalism",118,1,96,1],
+      ["vanessa",20,1],
+      ["vanish",25,1,70,1],
+      ["vanishe",95,1],
+      ["vanished",25,1,16,1,4,2,98,1,1,1,33,1],
+      ["vantage",21,1],
+      ["vapor",65,1],
+      ["variability",23,1,46,1],
+      ["variable",3,1,2,2,3,2,3,1,25,1,50,1,66,1],
+      ["variance",49,1],
+      ["variant",3,3],
+      ["variation",3,1,3,1,8,1,32,1,17,1,5,1,26,1,34,1,2,1,1,1,34,1,8,1,27,1,1,1,3,2,3,2],
+      ["varied",12,1,4,1,114,1,44,1,8,1,27,1,10,1],
+      ["variety",10,1,2,1,1,1,5,1,1,1,3,9,4,1,3,1,3,6,4,1,2,1,9,1,1,1,3,1,1,1,1,1,8,2,2,1,2,1,8,2,1,1,8,1,19,1,2,1,14,1,1,2,8,1,9,4,4,3,2,1,2,1,12,2,3,1,9,2,1,2,5,1,10,1,1,1,27,1,1,2,2,1,2,1,1,1],
+      ["various",1,1,3,1,2,1,4,3,1,1,1,1,6,1,4,1,1,7,6,1,7,1,4,2,7,1,3,1,1,2,3,1,6,1,4,1,5,1,8,1,7,4,2,1,1,1,4,2,6,1,20,1,1,3,18,1,4,1,6,4,3,1,6,2,20,1,2,1,7,3,5,1,8,1,4,2,6,3,13,1],
+      ["variously",64,1],
+      ["varnished",218,1],
+      ["vary",2,1,4,1,1,4,3,1,10,1,13,1,9,1,37,1,4,1,21,1,22,1,4,1,4,1,11,1,2,1,6,1,33,2,17,1,12,1],
+      ["varying",14,2,9,1,62,1,26,1,47,1,59,1],
+      ["vase",31,1,34,1,71,1],
+      ["vast",9,1,2,1,3,1,1,1,25,1,26,1,9,1,12,1,1,1,2,1,5,1,7,5,10,1,9,1,1,1,6,1,2,1,6,1,4,1,1,1,3,1,7,1,3,1,13,1,1,1,2,1,3,1,7,2,8,1,11,5,5,1,8,1,11,1],
+      ["vastly",97,1,15,1,55,1,45,1],
+      ["vat",51,1],
+      ["vaulted",27,1],
+      ["vazire",85,1],
+      ["ve",5,3,1,1,6,1,2,1,19,1,1,1,9,1,39,2,52,1,1,2,19,1,27,1,24,2],
+      ["vegan",102,2,97,2],
+      ["vegetable",16,1,9,1,36,1,1,1,3,1,5,1,29,3,34,1],
+      ["vegetarian",102,5,97,5],
+      ["vegetation",27,1,4,1,53,1,12,1,28,4,15,1,38,1,24,1,23,1],
+      ["vehicle",13,1,100,1,9,1,22,1,4,1,11,2,42,1],
+      ["vein",53,1,36,1,127,1],
+      ["velcro",5,1],
+      ["vellum",190,1],
+      ["veneer",3,1,162,2,49,1],
+      ["venetian",125,1],
+      ["vengeance",137,1],
+      ["venice",205,1],
+      ["venom",193,1],
+      ["venomous",48,1],
+      ["vent",195,1],
+      ["ventilation",113,1,82,2],
+      ["ventral",52,2],
+      ["venture",34,1,115,1,43,1],
+      ["ventured",182,1],
+      ["venturing",135,1],
+      ["venue",44,3],
+      ["venus",13,1,46,5],
+      ["vep",26,4],
+      ["ver",70,1,109,1],
+      ["vera",81,1],
+      ["veracruz",22,1,121,1],
+      ["verb",3,1,180,1],
+      ["verbal",36,1,38,2,11,1,63,21,24,1,4,3,30,1],
+      ["verbally",74,1],
+      ["verde",40,1],
+      ["verica",169,1],
+      ["vermin",75,1],
+      ["vermont",59,1],
+      ["versa",46,1,68,1,14,1],
+      ["versatile",15,1,37,1,102,1],
+      ["versatility",23,1,94,1],
+      ["verse",111,1,77,1],
+      ["version",12,1,2,1,32,2,51,1,7,1,46,1,7,1,38,1,3,1],
+      ["versus",12,1,73,1,43,3,42,2],
+      ["vertebra",27,1],
+      ["vertebrae",115,1,101,2],
+      ["vertebrate",75,1,79,1],
+      ["vertical",8,1,59,1,12,1,54,11,28,1,34,1,21,1],
+      ["vertically",52,1,68,1],
+      ["vervet",222,1],
+      ["very",0,3,1,2,1,2,2,1,1,1,5,1,1,1,1,4,2,3,1,2,1,1,3,3,3,1,2,2,2,1,2,2,1,3,1,3,2,2,2,1,1,1,1,1,3,2,1,1,1,2,2,3,3,1,2,2,1,1,2,1,5,1,2,1,1,1,1,1,2,1,3,1,1,1,2,2,2,3,1,1,1,1,1,3,1,1,1,1,1,2,1,2,1,1,2,6,1,2,1,4,2,1,6,1,1,13,2,2,7,6,2,1,1,1,1,1,2,1,1,2,1,1,1,1,3,1,1,1,2,2,1,2,2,1,1,1,2,1,1,1,1,1,3,1,4,1,1,1,1,1,2,1,1,3,1,1,2,1,2,1,1,1,2,1,3,2,1,1,3,2,1,1,1,1,1,1,2,3,1,2,1,1,1,1,1,1,1,1,1,1,1,2,2,1,1,3,2,1,4,1,3,1,1,1,2,2,3,2,1,1,1,2,1,2,3,1,5,3,1,2,1,1,3,1,1,1,1,1,1,1,3,1,3,2,2,4,2,3,1,1,1,2,1,1,3,1,1,2,1,2,4,2,1,1,2,1,2,6],
+      ["vessel",51,1,1,1,14,1,6,1,45,1,6,2,35,1,2,1,8,1,5,1,19,1],
+      ["vest",97,1,22,1],
+      ["vested",38,1],
+      ["vesuvius",87,1],
+      ["vexed",174,1],
+      ["veyron",47,1],
+      ["vi",145,1,58,1],
+      ["via",3,1,76,1,9,1,4,1,78,1,51,2,5,2],
+      ["viable",9,1,66,1,13,1,36,1],
+      ["vibrant",111,1,25,1],
+      ["vibrate",57,1],
+      ["vibrating",124,1,41,2],
+      ["vibration",154,12],
+      ["vibrational",154,1],
+      ["vice",20,1,8,1,18,1,68,1,14,1],
+      ["viceroy",64,1],
+      ["vicinity",13,1,27,1,16,1,140,1],
+      ["viciously",164,1],
+      ["victim",137,1,7,1,46,1],
+      ["victoire",146,1],
+      ["victor",9,1,179,1],
+      ["victoria",31,1,3,1,102,1,34,2,17,1],
+      ["victorian",145,1,58,1],
+      ["victory",57,2,131,2,25,1],
+      ["video",37,3,69,3,83,28,11,1,5,2],
+      ["videotaped",174,1,24,1],
+      ["viehmann",157,2],
+      ["vienna",64,1,155,1],
+      ["vietnam",140,1],
+      ["view",8,1,3,1,2,1,3,1,8,1,2,1,4,1,9,1,2,2,1,3,7,1,11,2,26,1,6,1,7,1,5,1,8,1,5,1,1,2,2,1,7,2,9,2,9,2,23,1,4,4,6,2,1,2,4,2,2,1,1,1,1,1,3,1,3,2,8,1,2,2,5,1,3,1,5,1],
+      ["viewed",0,1,40,1,66,1,37,1,14,1,29,1,2,1],
+      ["viewer",114,1,52,1,9,5,30,1],
+      ["viewing",14,1,48,1,89,1,9,1,6,1],
+      ["vigorous",110,1,75,1],
+      ["vigorously",160,1,47,1],
+      ["vigour",157,1],
+      ["viking",177,1],
+      ["villa",4,1,165,1],
+      ["village",76,1,1,1,70,4,18,1,4,1,14,1,11,2,1,3,20,1,2,1],
+      ["villager",179,1],
+      ["villain",157,1],
+      ["villosum",179,1],
+      ["vinci",180,3],
+      ["vindicate",15,1],
+      ["vine",22,1,194,1],
+      ["vineyard",99,1],
+      ["vinyl",29,2],
+      ["violence",109,2,48,1],
+      ["violent",35,1,110,1,44,3,7,1,7,1,14,1],
+      ["violently",211,1],
+      ["violet",111,1],
+      ["violin",2,2],
+      ["virgin",122,1],
+      ["virginia",39,1],
+      ["virtual",30,1,4,1,29,1,25,1,10,2,28,1,24,1],
+      ["virtually",15,1,24,1,18,1,7,1,19,1,5,1,6,1,25,1,21,1,27,1,20,1,25,1,11,1],
+      ["virtue",32,1,23,1,57,1],
+      ["virtuous",32,4,125,1,6,1],
+      ["visceral",83,1],
+      ["viscosity",52,1],
+      ["viscous",52,1],
+      ["visibility",68,1,16,1],
+      ["visible",44,1,29,1,35,1,13,2,30,1,18,1,46,1],
+      ["visibly",92,1],
+      ["vision",34,2,10,1,20,1,7,1,7,2,4,1,11,1,40,1,10,1,6,1,10,2,9,2,2,2,12,1,23,1],
+      ["visionary",187,1],
+      ["visit",26,2,8,2,22,1,9,1,39,1,32,1,21,1,15,1,12,2,7,5,1,1],
+      ["visited",44,1,26,1,35,1,31,2,1,1,18,1,27,1,2,1,3,1,13,1],
+      ["visiting",0,1,34,1,21,1,115,1],
+      ["visitor",26,7,5,2,3,5,21,4,29,1,1,2,20,1,8,1,7,1,21,1,10,1,19,6,35,1],
+      ["visual",26,1,4,1,14,1,2,1,7,1,4,1,1,1,5,1,4,1,16,1,10,1,21,1,12,1,4,2,10,1,6,4,5,1,4,1,12,3,22,1,17,1,6,3],
+      ["visualise",93,1],
+      ["visualization",206,1],
+      ["visualizer",206,1],
+      ["visually",53,2,102,1],
+      ["visuo",176,1],
+      ["vitai",211,1],
+      ["vital",7,1,7,1,1,1,33,1,4,1,1,1,9,1,9,1,3,1,4,2,3,1,11,1,12,1,16,1,32,1,12,1,1,3],
+      ["vitality",162,1],
+      ["vitruvius",129,1],
+      ["vittorio",57,1],
+      ["vivid",17,3,70,1,6,1,113,1],
+      ["vividness",93,1],
+      ["voc",221,5],
+      ["vocabulary",14,1,43,1,38,1,127,1,3,1],
+      ["vocal",85,2,63,2,19,1,7,1,9,1,25,1,4,1],
+      ["voh",63,1],
+      ["voice",12,1,42,2,6,2,35,1,31,1,22,6,17,1,2,1,17,1,20,1,8,1],
+      ["volatile",65,11,145,1,11,2],
+      ["volcanic",25,1,104,6],
+      ["volkov",59,3],
+      ["volkswagen",95,1,67,2],
+      ["volume",4,1,31,1,11,3,18,2,9,2,55,1,1,1,47,1,43,1],
+      ["voluntary",178,2,42,1],
+      ["volunteer",18,13,52,3,11,12,4,3,15,3,6,1,8,1,8,1,15,1,24,1,8,1],
+      ["volunteered",32,1],
+      ["vomited",125,1],
+      ["vomiting",125,1],
+      ["von",4,1,34,1,55,2],
+      ["voorn",80,4],
+      ["vote",4,1,8,1,166,1],
+      ["voyage",1,1,12,1,78,3,32,3,2,1,17,1,26,4],
+      ["voyaging",168,8],
+      ["voynich",190,19],
+      ["voynichese",190,1],
+      ["vry",3,1],
+      ["vs",128,1],
+      ["vulcanisation",23,2],
+      ["vulnerability",24,1,104,1],
+      ["vulnerable",27,1,29,1,9,1,10,1,28,1,21,1,13,1,2,1,15,1,8,1,18,1,20,2,14,1,2,1],
+      ["waal",14,1],
+      ["waarde",53,2],
+      ["wad",217,1],
+      ["wade",52,1,87,1],
+      ["wafting",71,1],
+      ["wage",77,1,63,2],
+      ["wagging",157,1],
+      ["waggle",56,3],
+      ["wagon",96,2,127,1],
+      ["waist",52,1],
+      ["waisted",46,1],
+      ["wait",61,1,45,1,21,1,4,2,49,1,1,1,30,1],
+      ["waitaki",49,1],
+      ["waited",149,1,34,1],
+      ["waiting",53,1,32,1,21,2,44,1,31,1],
+      ["wake",39,2,4,1,42,1,9,2,126,1],
+      ["wakefield",194,1],
+      ["wakefulness",185,5,35,1],
+      ["waking",39,4,4,2,71,1,106,1],
+      ["walcott",45,3],
+      ["walden",112,1],
+      ["wale",44,1,55,1,15,1,22,1,57,1,14,1,4,1],
+      ["walk",10,1,53,3,18,1,2,1,27,1,5,1,3,1,43,1,11,1,7,1,13,1,6,1,3,1],
+      ["walked",58,1,55,1,2,2,17,1,19,1,6,1,65,1],
+      ["walker",63,2,52,1,44,1],
+      ["walking",2,1,3,1,13,1,19,1,40,1,6,1,17,1,15,4,82,2,16,1,9,1],
+      ["wall",21,1,2,1,4,2,4,2,4,1,3,1,6,2,6,2,1,1,10,1,1,1,22,2,3,1,24,1,2,2,5,4,2,4,3,3,3,1,25,2,17,3,1,2,1,1,25,1,1,2,19,1],
+      ["wallaby",138,1,64,1],
+      ["wallace",19,1,74,1],
+      ["walled",61,1],
+      ["wallin",172,1],
+      ["walsh",34,13],
+      ["walshe",3,1],
+      ["walter",102,1,59,1,10,1,22,1,6,1],
+      ["waltzer",161,4],
+      ["want",5,1,2,2,4,2,5,1,17,1,2,1,2,1,5,4,5,1,7,1,1,1,3,1,4,1,1,1,7,1,2,1,20,1,10,3,12,3,9,1,15,1,4,3,4,1,4,1,1,1,10,1,11,1,6,1,1,1,2,1,18,3,3,1,3,3,10,1],
+      ["wanted",1,1,4,1,7,4,18,1,32,1,20,1,2,1,1,1,3,1,4,1,34,1,2,2,47,2,4,3,5,1,5,1,16,4,6,1,4,1],
+      ["wanting",18,1,127,1,30,1,6,1,22,1],
+      ["war",9,2,10,1,10,2,2,1,10,1,23,1,5,1,4,2,26,1,8,1,17,1,12,1,1,5,1,1,2,1,9,1,7,2,16,1,5,2,7,2,10,2,8,1,9,1,13,4],
+      ["warble",154,1],
+      ["warbler",103,1],
+      ["ward",68,1,55,3,22,1,58,1],
+      ["warding",174,1],
+      ["warehouse",51,1,12,1,10,1,11,1,56,1],
+      ["warfare",187,1],
+      ["warhol",146,1],
+      ["wariness",76,1],
+      ["warlord",0,1],
+      ["warlpiri",183,2],
+      ["warm",23,1,14,1,11,1,24,3,34,1,15,1,13,1,3,1,40,1,36,1],
+      ["warmed",105,1,20,1],
+      ["warmer",70,1,40,1,22,1,3,1],
+      ["warming",5,1,38,1,47,1,74,1,31,1],
+      ["warmth",21,1,66,1,138,1],
+      ["warn",20,1,17,1,23,1,9,1,85,1],
+      ["warne",105,5],
+      ["warning",60,1,93,1,1,7,28,1,39,1],
+      ["warped",34,1],
+      ["warrant",86,1,119,1],
+      ["warren",111,1],
+      ["warrenbayne",69,1],
+      ["warring",156,1],
+      ["warrior",69,1,142,1],
+      ["warwick",71,1],
+      ["wary",174,1],
+      ["washe",135,1],
+      ["washed",125,2,67,1],
+      ["washing",29,1,9,3,80,1,76,1],
+      ["washington",10,1,8,1,52,1,27,1,61,2,5,1],
+      ["wasn",58,3,19,1,14,1,11,1,90,2,7,1,23,5],
+      ["wasp",107,1,52,3,34,1],
+      ["waste",23,1,10,1,6,1,9,1,3,2,33,1,1,1,17,1,10,1,10,1,7,1,5,25,7,1,3,1,29,2,13,1,13,1,22,1],
+      ["wasteful",148,1],
+      ["waster",189,1],
+      ["wastewater",120,2],
+      ["wasting",181,1],
+      ["watch",17,3,1,1,39,5,69,1,20,1,13,1],
+      ["watched",57,2,2,1,141,1],
+      ["watching",21,1,36,7,49,3,8,2,12,1,1,2,16,1,17,2,24,1,4,1],
+      ["water",0,4,5,4,5,2,3,1,1,2,5,3,2,1,2,1,3,1,7,2,2,18,13,4,2,1,1,5,1,7,7,6,2,2,1,16,1,4,4,1,1,1,1,3,2,1,8,9,9,2,1,1,1,1,1,9,5,3,11,4,1,4,5,3,1,1,6,1,1,1,1,1,1,2,1,1,3,1,2,1,6,6,2,1,4,5,1,1,1,2,6,1,9,1,6,8,5,1,8,6,1,8,2,9,4,1,6,1,1,4,3,5,2,2,5,1,9,2,4,3,2,1,2,1,3,1,3,2,2,6],
+      ["waterbuck",10,1],
+      ["watercolour",31,1,184,1],
+      ["waterfall",63,1],
+      ["waterlogged",35,1,175,1],
+      ["waterloo",63,1],
+      ["waterproof",19,1,4,1],
+      ["waterproofing",23,2],
+      ["waterway",33,2,69,1,5,1,80,1,12,1],
+      ["watery",121,1],
+      ["watson",109,3],
+      ["watt",192,2],
+      ["watter",33,1],
+      ["wave",5,6,13,1,22,1,1,1,11,3,2,1,23,1,4,3,13,1,17,1,12,1,6,2,21,1,15,3,2,1,13,3,16,3,16,1,7,1,1,1],
+      ["wavelength",57,1,11,5,112,1,21,1],
+      ["waving",160,2,59,1],
+      ["wax",29,9,10,1,100,1,79,1],
+      ["waxed",132,1],
+      ["waxy",125,3],
+      ["way",1,1,3,3,1,2,1,4,1,2,1,1,1,1,3,5,1,9,1,3,1,6,1,1,2,1,2,1,1,2,1,1,1,1,1,4,1,3,1,1,1,1,1,2,2,6,1,1,1,3,1,5,3,1,1,4,1,1,1,1,1,1,1,3,1,2,1,1,1,1,1,1,1,1,1,3,1,1,6,5,1,2,1,4,2,1,1,3,2,2,3,1,1,3,1,1,1,2,2,1,1,4,1,1,2,1,3,2,1,1,1,3,1,1,2,2,1,1,1,3,1,1,2,1,1,1,2,3,1,1,2,2,1,1,3,1,2,2,2,1,2,10,2,6,1,1,1,1,1,1,1,2,1,1,3,2,1,1,1,1,1,1,1,1,2,1,3,3,1,1,1,2,1,4,1,1,1,3,1,2,2,2,1,4,2,2,1,2,1,5,1,1,3,1,3,2,2,2,2,1,1,4,1,1,2,2,1,3,1,1,6,2,2,5,1,8,1,4,4,1,1,3,1,5,1,1,2,3,1,1,1,1,1,1,1,1,1,3,1,2,2,4,1,1,1,3,2,2,1,5,1,1,1,1,1,4,3,1,5,1,4,2,1,10,3,1,1,1,1,2,3,5,4,5,1,5,2,1,1,2,2,2,1,1,1,6,1,2,1,4,1,2,2,3,1,2,1,3],
+      ["weak",60,1,23,1,30,1],
+      ["weaken",205,1],
+      ["weakened",48,1,145,1,7,1],
+      ["weaker",30,1,112,5],
+      ["weakness",100,1],
+      ["weaknesse",87,1],
+      ["wealth",22,1,65,1,14,2,21,1,46,1,4,1,22,1,13,1],
+      ["wealthier",96,1],
+      ["wealthy",0,1,28,2,1,1,10,1,48,1,1,1,13,1,35,1,2,1,3,1,61,1],
+      ["weaned",189,1],
+      ["weapon",7,1,41,1,21,2,41,1,28,1,2,1,44,1,5,1,13,1],
+      ["weaponry",217,1],
+      ["wear",47,1,4,1,26,1,5,1,26,1,11,1,53,3,42,2],
+      ["wearer",108,1,64,1],
+      ["wearing",47,1,30,1,95,3],
+      ["weather",5,1,16,1,2,1,4,1,10,1,14,2,15,2,19,2,16,1,19,1,1,6,59,1,21,4,10,1,6,1],
+      ["weathered",69,1],
+      ["weathering",225,1],
+      ["weaver",77,1,58,1,59,4],
+      ["weaving",77,1,42,1,17,1,4,2,54,1],
+      ["web",58,1,6,1,1,1,49,1,27,1],
+      ["webb",159,1],
+      ["weber",8,6],
+      ["website",70,1,56,1,36,2,28,1],
+      ["wedding",105,1,95,1],
+      ["weed",16,1,119,8,4,1,85,5],
+      ["week",2,2,18,3,14,1,5,1,20,1,9,1,21,1,5,1,3,2,7,1,15,1,4,1,15,1,28,1,8,4,2,1,7,1,1,4,8,1,10,1],
+      ["weekend",20,1,61,1],
+      ["weekly",20,1],
+      ["weepu",225,1],
+      ["wehner",159,3],
+      ["wehr",39,3],
+      ["weigh",18,1,92,1,9,2,6,1,39,1,1,1,14,1,12,1,2,1,7,1],
+      ["weighed",24,2,3,1,152,1],
+      ["weighing",27,1,125,1,7,1,20,1],
+      ["weight",12,1,29,1,36,1,5,2,1,1,20,1,5,1,17,1,15,1,21,1,4,1,31,1],
+      ["weighted",11,1],
+      ["weightlessness",13,1,148,1],
+      ["weightlifting",100,1],
+      ["weird",190,1,31,1],
+      ["weirdest",45,1],
+      ["weirdness",190,1],
+      ["weizmann",71,1],
+      ["weka",103,1],
+      ["welcome",13,1,150,1,5,1],
+      ["welcomed",89,3,2,1,43,1,23,1,22,1,15,1],
+      ["welcoming",31,1,139,1],
+      ["welfare",102,1,97,1],
+      ["well",2,1,1,4,1,2,5,1,1,2,2,2,3,6,1,2,1,1,2,1,1,1,4,1,3,1,1,1,1,1,2,2,1,1,1,1,4,4,2,2,1,1,5,1,1,1,3,2,1,1,3,1,2,1,1,4,2,5,2,1,2,2,1,2,2,1,5,1,1,1,1,3,2,1,1,1,2,2,1,1,1,2,1,2,4,4,1,2,1,3,1,1,3,1,1,2,2,1,1,2,3,1,2,2,1,1,1,2,1,5,1,2,1,1,2,2,2,1,1,2,1,1,2,1,1,1,1,1,2,1,1,3,3,3,1,2,1,3,2,1,2,4,1,1,1,5,1,2,1,2,1,1,3,1,3,1,2,1,1,5,3,2,1,1,3,1,3,1,2,2,1,1,1,1,1,2,2,1,1,2,2,2,2,2,1,2,2,1,1,4,4,1,5,1,1,2,1,1,2,3,1,1,1,1,1,1,1,1,1,1,1,1,1,2,3,1,2,2,4,2,4,5,5,1,2,1,2,1,2,5,1,1,6,2,2,2,2,1,4,2,1,2],
+      ["wellcome",7,1],
+      ["welle",177,1],
+      ["wellington",4,3,45,1,61,1,41,1,36,1,5,2],
+      ["welsh",207,3],
+      ["welter",206,1],
+      ["went",4,1,7,1,8,1,19,1,1,2,6,3,21,1,19,1,5,1,11,1,1,1,14,1,2,1,34,1,9,1,23,2,4,1,4,1,7,1],
+      ["weren",18,1,9,1,4,1,92,2,42,1,7,1],
+      ["werner",218,1],
+      ["wesley",19,1],
+      ["wessex",147,1],
+      ["west",10,1,4,1,7,3,29,1,27,3,7,3,4,1,2,11,9,1,2,1,6,1,18,1,5,5,6,1,8,1,5,1,2,1,18,2,11,1,14,3,23,1,1,1],
+      ["westerly",121,1],
+      ["western",6,1,3,4,9,1,3,1,18,1,49,1,32,1,9,1,9,1,3,1,38,1,23,1,2,1,15,1,2,1,2,1],
+      ["westward",51,1,26,1,30,1],
+      ["wet",67,1,110,2],
+      ["wetland",35,1,85,1,15,2],
+      ["whale",14,29,49,1,62,21,42,1,13,11,3,1,29,1,1,15],
+      ["whaler",1,1,124,1,88,1],
+      ["whaling",125,2],
+      ["whatever",17,1,38,1,3,1,8,1,2,1,13,2,4,1,6,1,1,1,10,1,12,2,26,1,6,2,7,1,4,1,1,1,4,1,37,1],
+      ["whatsoever",210,1],
+      ["wheat",99,1,2,1,100,1,23,1],
+      ["wheel",96,1,5,1,31,1,27,1,38,1],
+      ["wheelchair",83,1],
+      ["wheg",159,2],
+      ["whenever",57,1,117,1,35,1],
+      ["wherea",1,1,20,1,1,1,2,1,5,1,1,1,2,1,2,1,7,1,11,1,16,1,23,1,8,1,1,1,6,1,2,1,1,1,16,2,1,1,4,1,4,1,18,1,7,1,19,1,18,1,1,2,10,1,7,1],
+      ["whereabout",56,1],
+      ["whereby",92,1,41,1,29,1,49,1,15,1],
+      ["wherever",6,1,26,1,30,1,62,2,83,1,7,1,8,1],
+      ["whether",0,1,3,2,3,3,3,1,3,1,3,2,3,1,6,3,13,2,6,1,11,2,1,1,3,3,2,1,3,3,7,1,2,1,2,1,11,1,1,1,1,1,1,1,1,1,5,1,4,1,1,1,1,1,1,1,7,1,2,1,4,3,1,1,1,1,6,2,3,1,1,2,3,1,2,1,3,2,1,2,5,1,5,1,1,1,1,2,12,2,1,1,3,1,4,1,5,1,3,2,2,1,1,1,1,3,16,1,1,1,1,1,1,3,6,1,2,2,3,1,3,1,1,2,3,1,3,1,2,1,4,1,1,1],
+      ["whichever",214,1],
+      ["while",0,2,5,1,1,3,2,1,1,3,1,4,3,1,3,1,2,4,1,1,1,5,3,2,1,2,3,1,4,1,2,1,1,4,1,2,1,1,1,2,2,2,1,2,8,1,3,1,1,2,2,2,1,2,1,1,2,2,3,1,1,2,1,2,1,2,1,1,1,1,2,1,3,2,2,1,1,2,4,1,2,1,1,6,1,1,3,1,1,5,2,2,1,2,1,3,2,1,1,1,3,3,3,1,1,8,1,1,1,1,2,2,1,1,1,4,3,1,1,2,3,1,2,1,4,1,1,2,1,1,1,2,1,1,1,1,1,1,1,6,1,1,4,1,2,1,1,1,1,1,1,1,2,1,3,2,2,2,1,2,4,1,3,4,7,2,1,4,1,3,1,3,1,1,3,2,1,1,1,3,1,3,1,1,9,1,3,5,1,1,1,1,2,3,2,1,2,2,1,1,1,1,1,1,3,1,2,6,1,1,1,1,1,4,2,1,2,3,1,2,1,1,1,1,1,1,4,3,4,1,1,1,2,1,1,2,3,1,2,2,1,1],
+      ["whilst",47,2,55,1,97,1],
+      ["whim",8,1],
+      ["whimper",45,1],
+      ["whine",14,1],
+      ["whisk",34,1],
+      ["whistle",14,1,205,1],
+      ["white",10,1,17,1,4,2,1,3,4,1,2,1,6,1,9,1,16,1,8,1,12,3,8,1,6,1,5,1,6,1,13,2,8,2,1,1,3,1,4,1,8,2,3,1,3,3,6,1,6,1,4,1,9,1,13,2,10,1],
+      ["whitish",139,1,53,1],
+      ["whoever",66,1,103,1],
+      ["whole",7,1,3,1,2,2,4,1,8,1,4,2,7,2,1,1,13,1,8,1,2,1,4,3,5,1,5,1,2,1,7,1,2,2,2,1,10,1,6,1,7,1,13,4,6,1,1,1,5,1,3,2,2,1,8,1,14,1,4,1,18,1,4,1,1,1,2,1,2,1,7,1,8,2,10,1,1,1,6,1],
+      ["wholegrain",70,1],
+      ["wholesale",179,1],
+      ["wholesaler",97,1],
+      ["wholly",109,1],
+      ["whorf",183,1],
+      ["whose",15,1,9,3,4,1,2,1,38,1,3,1,1,1,4,1,7,2,4,1,3,3,11,1,5,1,5,1,11,1,17,1,5,1,1,1,2,1,10,1,2,1,19,1,1,2,4,1,5,2,2,1,3,1,10,1,5,1,7,1,2,1,4,1],
+      ["wick",138,1,64,1],
+      ["wide",1,1,2,1,7,1,18,1,16,4,5,1,1,1,3,1,8,2,1,1,2,1,10,1,6,1,2,1,2,1,6,1,28,1,12,1,8,1,2,2,1,1,1,1,13,1,21,1,12,1,8,1,6,1,3,1,6,1,7,1],
+      ["widely",2,1,4,1,8,2,1,1,1,1,3,1,14,1,13,1,15,1,1,1,15,1,2,1,18,1,10,1,8,1,9,1,1,1,13,1,3,1,3,3,4,1,4,1,6,1,2,1,6,1,2,1,18,1,16,1,23,1,1,1],
+      ["widen",166,1],
+      ["widening",153,1],
+      ["wider",26,1,1,1,6,1,5,1,57,1,29,1,38,1],
+      ["widespread",36,1,5,1,35,1,1,1,11,1,8,1,2,1,1,2,4,1,7,1,21,1,6,5,11,1,4,1,2,1,3,1,5,1,15,1,17,2,24,1,2,1,1,1],
+      ["widest",44,1],
+      ["widow",157,1],
+      ["width",62,1,2,3,27,6],
+      ["wife",33,1,44,1,59,1],
+      ["wig",29,1],
+      ["wigg",165,1],
+      ["wilbur",158,1],
+      ["wild",10,2,6,1,6,4,10,1,6,1,19,1,39,1,3,1,4,1,16,1,6,1,7,1,4,1,2,1,1,1,2,1,2,2,4,1,10,1,1,2,16,1,5,3,1,1,2,1,10,1,1,1,9,1,14,5,5,1,1,1,1,2],
+      ["wilde",4,1,167,1],
+      ["wilder",96,1,92,1],
+      ["wilderness",26,1,86,1,32,1,10,1],
+      ["wildfire",59,1],
+      ["wildlife",105,1,5,2,25,3,6,5,3,1,10,1,25,1,8,1,36,1],
+      ["wildly",75,1],
+      ["wilfrid",190,1],
+      ["wilhelm",38,1,119,2],
+      ["will",109,1],
+      ["william",1,1,27,1,13,1,23,1,7,1,14,1,3,1,13,1,8,1,7,5,20,3,9,1,45,5,13,1,8,1,2,1,6,1,1,1],
+      ["willing",5,1,71,1,14,1,2,1,63,1,1,1,32,1,21,2],
+      ["willingly",8,1],
+      ["willingness",211,1,13,1],
+      ["willpower",200,6],
+      ["wilson",150,1,1,1],
+      ["win",131,1,25,1,32,1,1,3,1,1,23,1],
+      ["wind",21,2,23,1,22,1,24,2,1,3,30,2,1,1,2,5,19,1,17,4,5,7,3,4,5,1,3,1,1,1,11,1,7,5],
+      ["windbreak",143,1],
+      ["winding",35,1,97,1],
+      ["window",63,1,28,2,4,1,25,1,41,1,20,3,1,1,13,3],
+      ["windowless",170,1],
+      ["windstorm",124,1],
+      ["windy",121,1],
+      ["wine",0,1,34,1,91,1],
+      ["wing",151,2,8,4,10,8],
+      ["winged",31,1,96,2],
+      ["winkelman",220,1],
+      ["winner",57,1,74,2,4,1,53,3],
+      ["winning",49,1,17,1,18,1,100,1],
+      ["winter",4,1,17,2,6,1,8,1,8,2,53,2,5,1,2,1,18,2,9,1,65,1],
+      ["wintering",121,1,9,2],
+      ["wipe",83,1],
+      ["wiped",75,3,28,1],
+      ["wire",90,1,37,1,87,1],
+      ["wired",37,1,46,1],
+      ["wisconsin",24,9,13,1,116,1,21,2,15,2,31,1],
+      ["wisdom",54,1,18,1,43,1,37,2,26,1,3,1],
+      ["wise",170,1,11,1],
+      ["wisely",139,1,24,1],
+      ["wiser",150,1],
+      ["wisest",200,1],
+      ["wish",11,2,1,1,175,1,27,1],
+      ["wishe",99,1,112,1,4,1],
+      ["wished",24,2],
+      ["wishful",176,1,14,1],
+      ["wishing",47,3,133,1],
+      ["witche",99,1,58,3],
+      ["withall",36,3],
+      ["withdraw",44,1,29,2,121,1],
+      ["withdrawn",73,1],
+      ["withheld",156,1],
+      ["withhold",166,1],
+      ["within",5,1,4,1,1,1,4,1,2,2,2,1,3,1,4,3,1,2,2,2,2,1,1,4,3,1,2,2,6,1,7,4,3,1,9,1,1,1,13,1,2,2,7,1,2,2,1,2,4,1,4,1,23,6,1,1,1,1,4,1,3,1,3,2,1,2,5,1,3,1,3,2,2,1,1,1,1,1,5,1,3,2,1,1,5,1,13,1,4,1,6,1,1,3,1,1,1,4,2,1,8,1,7,1,2,2,1,1,4,3,4,1,6,1,1,2,2,1],
+      ["without",2,1,1,1,2,2,1,2,1,1,5,1,1,4,2,1,4,1,2,6,17,4,13,1,1,1,4,1,4,1,2,2,4,2,2,1,3,1,1,1,5,1,9,1,1,1,2,3,1,1,2,4,2,2,5,1,13,1,2,1,4,1,1,2,2,2,1,2,5,1,1,1,3,2,3,1,3,1,2,1,1,1,1,1,2,4,3,3,2,1,1,1,3,6,4,2,3,1,7,1,1,1,1,1,2,1,3,1,6,1,4,2,2,1,1,1,5,1,9,1,8,2,4,1,1,2,3,1,3,1,1,1],
+      ["withstand",29,1,3,1,6,1],
+      ["withstood",170,1],
+      ["witness",23,1,64,1,126,1],
+      ["witnessed",75,1,45,1,5,1,85,1,6,1],
+      ["wobble",116,2],
+      ["woke",39,3,4,1],
+      ["wolf",21,1,117,1,29,1,35,1,10,1,10,1],
+      ["wolve",10,1,147,1,65,2],
+      ["woman",37,1,155,1],
+      ["wombat",210,1],
+      ["women",4,1,13,1,71,1,6,1,11,1,1,1,3,1,31,1,15,4,5,1,32,2,5,4],
+      ["won",4,1,3,1,12,1,3,1,22,1,18,1,20,1,23,1,26,1,8,1,22,2,3,1,8,1,3,1,9,8,2,1,8,1,1,1,5,1,9,1,4,1],
+      ["wonder",34,1,78,1,32,1,12,1,31,1],
+      ["wondered",114,1,75,1],
+      ["wonderful",45,2,78,1,34,1,25,1,34,1],
+      ["wonderfully",170,1],
+      ["wong",75,1],
+      ["woo",155,1],
+      ["wood",1,4,11,1,17,6,11,1,4,1,18,1,17,1,28,1,6,4,4,20,1,1,2,1,12,1,11,1,30,1,6,1,16,1,22,1,1,5],
+      ["wooded",184,1],
+      ["wooden",1,2,28,4,11,1,6,1,46,1,21,1,4,1,6,1,6,1,3,4,9,1,76,1,1,2],
+      ["woodland",97,3,46,1],
+      ["woodpecker",127,2],
+      ["wool",19,1,19,2,64,1,38,1,54,19,5,1],
+      ["woollen",194,5],
+      ["woolly",10,1,17,1],
+      ["word",8,1,1,4,3,2,1,1,2,1,1,1,6,1,3,1,15,1,5,1,1,1,1,1,1,1,1,1,5,4,1,2,3,1,1,1,1,4,3,3,4,4,5,1,1,2,1,2,6,1,3,1,2,1,1,4,9,1,1,1,2,1,1,1,8,1,9,1,4,1,5,1,1,3,11,1,8,7,1,1,1,1,1,11,1,1,11,1,7,1,4,1,2,1,5,1,3,1,1,2,1,4,5,3,2,5,10,1,3,5,1,1,2,1,1,9,1,3,4,1,2,1,1,2,2,2,1,1],
+      ["wore",63,1,1,1,13,3,22,1,41,4,25,1],
+      ["work",2,2,2,9,1,1,1,2,1,2,1,7,1,1,3,3,1,3,2,15,2,2,3,12,2,2,4,1,4,2,1,2,2,2,1,3,2,5,1,3,4,1,2,1,1,2,1,1,4,2,1,1,1,1,1,1,1,1,2,1,3,3,2,2,1,1,2,3,1,3,3,1,2,2,1,2,1,1,1,5,1,1,3,1,2,1,2,1,1,8,1,1,3,3,1,5,1,2,2,4,2,2,1,2,2,1,3,1,1,2,2,3,4,2,1,3,1,1,2,1,1,3,2,4,1,1,1,4,1,5,2,2,4,1,3,2,3,3,2,1,1,1,2,1,5,3,1,1,2,1,1,2,5,12,1,8,1,1,3,7,1,2,1,2,2,4,2,1,1,3,2,2,1,3,1,1,1,4,3,1,3,1,1,1,1,1,1,5,1,8,2,2,1,7,1,3,3,3,2,3,1,1,1,1,1,3,3,1,1,2,1,1,1,2,1,1,3,1,1,3,1,1,1,2,1,1,3,1,2,12,1,1,1,3,1,2,1,2,4,1,3,2,1,9,1,1,5,1,4,2,1,2],
+      ["workable",97,1],
+      ["workaholic",157,1],
+      ["worked",2,1,10,2,4,1,3,1,14,1,1,1,11,1,8,1,17,1,8,1,3,4,16,2,8,1,8,1,3,1,2,3,1,2,17,1,9,1,16,1,4,1,1,1,13,1,21,1],
+      ["worker",8,2,5,1,7,7,13,1,8,1,4,1,5,2,6,2,7,1,10,4,12,1,14,1,20,2,3,3,4,1,11,2,2,2,8,1,25,2,7,3,2,3],
+      ["workforce",33,1,43,1,25,1,21,1,18,1],
+      ["workhorse",96,4],
+      ["working",5,1,8,3,5,1,1,1,1,1,4,2,6,3,2,1,1,2,8,1,8,1,9,1,4,1,2,1,24,1,7,1,4,1,1,1,5,1,4,2,4,2,5,1,4,3,6,3,6,1,2,1,6,1,1,1,3,1,4,3,3,1,10,1,1,1,12,1,4,1,2,2,7,1,1,1,2,1,3,1,5,1,1,1,12,1],
+      ["workload",20,4],
+      ["workmen",169,1],
+      ["workout",157,1,32,2],
+      ["workplace",6,1,14,1,6,1,11,1,85,2,4,3,24,4,70,1,5,1],
+      ["workshop",12,1,65,1,65,3,33,1],
+      ["world",1,2,1,2,1,1,2,1,2,5,1,1,1,3,1,2,5,2,1,3,3,2,3,3,1,1,2,2,2,1,1,2,1,1,1,4,1,1,1,2,1,1,2,1,3,1,1,2,2,1,2,2,1,5,1,1,1,2,2,2,2,1,1,2,2,1,4,2,1,1,1,1,3,4,1,1,1,11,3,2,1,1,1,1,2,1,2,6,1,1,1,1,1,1,1,4,1,1,2,2,7,2,6,5,1,1,1,5,1,4,1,3,1,2,2,1,2,12,1,1,1,7,1,2,2,3,1,3,1,2,3,3,1,3,1,2,3,2,2,1,1,1,1,1,1,2,2,1,1,2,1,1,2,1,1,3,2,3,1,2,1,3,1,3,1,2,1,2,2,1,1,4,1,5,1,2,2,1,3,9,2,1,2,6,1,1,1,2,1,1,4,1,1,3,1,1,1,2,3,1,1,1,1,4,2,6,3,1,2,2,1,2,2,1,2,2,5,3,1,1,2,1,3,2,1,1,1,2,1,2,4,5,4,12,2,1,1,1,2,1,1,5,1,1,1,1,2,1,1,1,2,6,1,3,1,1,1,1,2,4,1,2,1,3,5,1,1,1,1,4],
+      ["worldwide",16,1,22,1,10,1,7,1,9,1,1,1,14,1,35,1,5,1,6,1,12,1,14,1,37,1],
+      ["worm",18,1,59,3,14,1,22,2],
+      ["worn",38,1,39,2,15,1,22,1],
+      ["worried",33,1,16,4,43,1,19,1,6,1,14,1,44,5,41,1],
+      ["worry",37,1,2,1,89,2,58,2,29,1],
+      ["worrying",94,1,57,1],
+      ["worse",35,3,4,1,26,1,6,1,5,1,2,1,10,1,8,1,28,1,27,1,38,1,15,2],
+      ["worship",27,1],
+      ["worst",20,1,1,1,14,1,78,1,9,1,30,1,11,2,12,1],
+      ["worstead",194,1],
+      ["worsted",194,4],
+      ["wort",16,1],
+      ["worth",15,1,32,5,3,1,38,1,11,2,9,2,17,1,30,1,24,2,4,1,3,1],
+      ["worthless",99,1],
+      ["worthwhile",206,1],
+      ["worthy",122,1,31,1,17,1],
+      ["worzel",180,1],
+      ["wouldn",20,1,48,1,14,1,20,1,65,1,32,1,13,1,10,1],
+      ["wound",132,1,26,1,62,1],
+      ["woven",19,1,31,2,1,1,26,1,30,2,87,1,12,1],
+      ["wow",34,2],
+      ["wrap",64,1],
+      ["wrapped",107,1,110,1,1,1],
+      ["wrapping",107,2],
+      ["wrasse",89,9],
+      ["wray",208,3],
+      ["wren",135,1],
+      ["wriggle",89,1],
+      ["wriggling",89,1],
+      ["wright",120,1],
+      ["wrinkly",215,1],
+      ["wrist",18,1],
+      ["write",0,1,2,1,2,1,1,1,6,1,1,1,27,1,2,1,8,1,62,2,15,1,22,1,2,1,2,1,8,1,19,1,2,1,25,2,11,2,1,2],
+      ["writer",4,11,4,3,17,4,9,1,2,1,31,1,20,1,1,1,21,5,3,1,13,1,6,1,14,9,3,2,1,2,19,2,1,1,2,11,1,1,10,8,6,4,2,1,13,3,5,3,1,1,2,1],
+      ["writing",4,3,11,5,16,1,3,1,7,1,4,1,4,2,12,2,6,6,19,1,15,1,4,3,2,5,2,1,13,1,23,5,8,1,4,1,10,2,5,1,10,4,6,2,15,3,9,2,2,1,3,3,1,2],
+      ["written",0,1,9,1,13,1,14,1,10,1,3,1,37,3,19,1,2,3,4,1,26,1,8,2,1,2,16,1,10,1,7,1,7,1,4,2,13,2,3,1],
+      ["wroe",210,6],
+      ["wrong",6,1,16,1,20,4,18,1,6,1,32,1,14,1,1,1,1,1,4,1,16,1,8,1,5,1,3,1,16,1,2,1,13,1,12,1,7,1,8,1,7,5],
+      ["wrongly",175,1],
+      ["wrote",2,1,2,3,1,1,3,1,26,1,5,1,2,1,2,1,16,1,5,1,24,1,17,2,40,5,27,3,5,2,2,1,17,1,7,5],
+      ["wu",77,1],
+      ["wyoming",141,1,82,1],
+      ["xavier",125,1],
+      ["xvi",99,1],
+      ["yaara",71,1],
+      ["yacht",168,1],
+      ["yachtsman",168,1],
+      ["yagi",31,5],
+      ["yak",10,1],
+      ["yale",28,1,17,1,26,1,5,1,52,1,62,2],
+      ["yamanoko",133,1],
+      ["yamashita",26,2],
+      ["yaniv",80,2],
+      ["yank",116,1],
+      ["yard",109,3],
+      ["yarn",119,1],
+      ["yawn",3,37,103,13],
+      ["yawned",106,5],
+      ["yawning",3,22,103,44],
+      ["year",0,3,1,1,1,2,2,4,1,1,1,1,3,1,5,5,1,3,1,10,1,1,1,2,1,1,1,1,1,1,1,4,1,18,1,1,1,16,1,1,1,10,1,2,1,1,1,4,1,1,1,4,1,5,1,6,1,1,1,1,1,1,1,2,1,4,1,11,3,2,1,3,1,4,1,4,1,6,1,1,1,7,1,5,1,3,1,1,1,1,1,2,4,4,3,3,2,1,1,2,2,2,1,4,1,1,1,2,1,2,3,1,1,1,1,9,1,4,1,3,1,1,1,2,1,2,2,4,1,1,2,2,3,1,2,1,1,2,2,3,1,2,1,2,2,3,1,1,1,3,1,4,1,1,1,2,1,1,2,6,2,1,1,4,1,1,1,6,1,2,1,2,1,1,1,1,1,6,1,1,1,4,2,4,1,1,2,3,1,6,4,1,1,2,1,5,1,3,1,2,1,3,1,1,1,6,1,2,1,4,1,3,1,4,1,8,1,1,1,1,1,2,1,7,1,8,1,3,2,1,2,3,1,1,1,2,2,4,1,2,1,1,2,2,1,3,2,2,2,4,1,4,1,10,1,2,2,2,1,2,1,3,1,3,1,1,1,2,2,2,1,1,1,8,1,3,1,1,1,4,1,1,2,4,1,2,2,4,1,3,1,6,1,3,1,3,1,3,1,2,1,6,1,1,1,2,1,4,1,3,3,2,2,2,1,4,1,3,2,5,2,1,1,1,2,8,1,1,1,2,2,1,2,4,4,9,1,1,1,8,1,3,2,3,1,1],
+      ["yearn",174,1],
+      ["yeast",24,1,52,1],
+      ["yell",219,1],
+      ["yellow",22,1,16,4,34,1,5,1,12,1,12,1,2,1,22,1,10,1],
+      ["yellowstone",141,1],
+      ["yes",72,1,98,1,12,1],
+      ["yeshurun",71,2],
+      ["yesterday",62,1,121,1],
+      ["yet",2,2,1,1,2,1,7,1,11,1,7,1,6,1,1,1,3,1,9,1,4,1,3,1,3,2,1,1,4,2,4,1,1,2,1,2,1,2,1,1,3,1,2,1,1,1,3,1,1,1,4,1,2,2,2,2,1,1,2,1,1,1,1,1,3,1,2,2,7,1,3,1,1,1,5,1,3,4,1,1,1,2,3,2,1,1,4,1,8,2,2,1,9,1,3,2,4,1,1,1,4,1,1,1,1,1,4,1,1,1,3,3,7,1,1,1,2,2,5,1,3,2,2,4,8,1,2,2,8,1,2,2,2,1,3,2,5,1,1,1,1,1],
+      ["yield",8,1,19,1,20,1,52,2,20,1,14,2,20,1,2,1,4,1,7,1,10,1,3,4,22,4,20,1,5,1],
+      ["yielded",18,1,20,1,120,1,21,1],
+      ["yielding",42,1,57,1],
+      ["yorckstrasse",84,1],
+      ["york",63,2,7,2,1,1,4,1,1,1,20,3,8,1,2,1,6,2,7,1,9,1,4,1,1,2,20,1,14,1,14,1,24,1,7,1,1,6],
+      ["yorker",63,1,150,1],
+      ["yorkshire",194,5],
+      ["young",16,1,12,2,4,1,5,2,4,1,1,1,6,1,4,1,4,1,9,2,6,1,3,2,1,1,3,1,4,1,10,1,3,1,8,1,7,1,1,27,4,1,6,2,5,1,1,4,4,2,4,1,9,1,5,2,1,1,1,3,3,1,3,2,3,2,3,1,5,1,7,1,7,1,4,1,3,1,2,2,1,1,1,1,12,1,1,1,2,1,5,1,2,1,1,5,5,1,4,1],
+      ["younger",4,1,14,1,11,1,1,1,58,1,7,1,36,1,7,1,5,1,29,1,22,1,8,1,8,2,6,2,9,3],
+      ["youngest",105,1,69,1,51,1],
+      ["youngster",92,1,29,1,10,1,43,1],
+      ["yourself",7,1,91,1,14,1,64,1,14,1],
+      ["youth",131,17,58,1],
+      ["yowl",167,1,45,1],
+      ["yu",88,1],
+      ["yukon",75,1],
+      ["yuzo",31,3],
+      ["zandbergen",190,2],
+      ["zanne",146,1],
+      ["zatorre",83,1,17,4],
+      ["zauberman",20,1],
+      ["zborowski",89,2],
+      ["zealand",1,4,3,11,12,9,12,3,9,1,12,15,31,3,11,1,12,8,7,10,7,8,1,5,26,1,7,4,15,2,16,8,5,5,5,6],
+      ["zealander",28,1,21,3,138,1,5,1],
+      ["zeigarnik",18,2],
+      ["zelinsky",159,2],
+      ["zen",0,2],
+      ["zero",62,1,39,1,33,2,24,1,59,3],
+      ["zhou",107,1],
+      ["zimbabwe",5,1],
+      ["zinc",218,1],
+      ["zipe",157,1],
+      ["zipper",5,1],
+      ["zone",48,1,28,1,4,1,4,2,49,1,4,2,64,3],
+      ["zoning",156,1],
+      ["zoo",32,1,61,1,51,4,72,1],
+      ["zoological",10,1,91,1,86,1],
+      ["zoologist",91,1,46,1,7,1],
+      ["zoology",144,2],
+      ["zooplankton",52,1],
+      ["zubrin",164,3],
+      ["zyz",201,1],
+      ["下",52,3],
+      ["与",24,3,2,3,171,3,18,3],
+      ["世",93,3,118,3],
+      ["丘",165,3,8,3],
+      ["业",33,3,44,3,40,3,5,3,18,3,54,3,7,3],
+      ["丝",77,3,42,3],
+      ["中",18,3,30,3,163,3],
+      ["为",127,3,57,3],
+      ["义",15,3,70,3,61,3],
+      ["之",116,3,36,3,3,3,24,3,35,3],
+      ["乐",2,3,16,6,65,3,17,3,61,3,6,3,9,3,28,3,8,3],
+      ["习",54,3],
+      ["书",179,3],
+      ["争",178,3],
+      ["亚",34,3,6,3,96,3,9,3,15,3,43,3],
+      ["交",47,3,49,3,58,3,67,3],
+      ["产",33,3,40,3,4,3,40,3,23,3,54,3],
+      ["亲",120,3],
+      ["人",9,3,2,3,2,3,8,3,19,3,21,3,98,3,39,3],
+      ["今",34,3],
+      ["从",42,3],
+      ["他",46,3,117,3],
+      ["代",76,3,90,3],
+      ["们",163,3],
+      ["价",76,3,112,3],
+      ["任",122,3,4,3,55,3,16,3],
+      ["仿",5,3],
+      ["企",122,3],
+      ["伏",190,3],
+      ["众",42,3],
+      ["优",48,3],
+      ["会",41,3,81,3,25,3],
+      ["伪",89,3],
+      ["伯",45,3],
+      ["估",78,3],
+      ["位",130,3],
+      ["低",78,3],
+      ["体",184,3],
+      ["何",37,3,126,3],
+      ["作",4,3,16,3,85,3,66,3,11,3],
+      ["使",172,3],
+      ["侦",109,3],
+      ["侵",141,3],
+      ["信",166,3],
+      ["候",101,3],
+      ["值",188,3],
+      ["做",212,3],
+      ["偶",29,3],
+      ["儿",206,3],
+      ["兄",225,3],
+      ["光",68,3],
+      ["克",118,3,31,3,2,3],
+      ["兔",105,3],
+      ["入",141,3],
+      ["八",39,3],
+      ["公",82,3,2,3,78,3],
+      ["兰",4,3,12,3,33,3,54,3,7,3,7,3,1,3,31,3,2,3,20,3,11,3,5,3,5,3],
+      ["兴",109,3],
+      ["养",7,3],
+      ["兽",210,3],
+      ["农",201,3],
+      ["决",56,3,96,3,48,3],
+      ["净",62,3],
+      ["凝",129,3],
+      ["出",212,3],
+      ["分",128,3,19,3],
+      ["切",139,3],
+      ["利",1,3,111,3,24,3,1,3],
+      ["别",49,3],
+      ["制",33,3,31,3],
+      ["剂",72,3],
+      ["剧",12,3,32,3],
+      ["力",20,3,51,3,29,3,14,3,16,3,25,6],
+      ["务",126,3,55,3,16,3],
+      ["动",10,3,22,3,20,3,83,3,30,3,57,3],
+      ["劳",200,3],
+      ["势",48,3],
+      ["包",53,3],
+      ["化",14,3,8,3,47,3,46,3,35,3,14,3,14,3],
+      ["区",118,3],
+      ["医",11,3,180,3],
+      ["南",91,3],
+      ["博",34,3,21,3,101,3,14,3],
+      ["卡",50,3],
+      ["卫",201,3],
+      ["印",25,3,1,3],
+      ["危",95,3],
+      ["历",38,3,8,3,5,3,10,3,18,3,9,3,9,3,61,3,36,3,23,3,1,3,1,3],
+      ["压",20,3],
+      ["原",220,3],
+      ["及",123,3],
+      ["友",198,3],
+      ["双",54,3],
+      ["发",19,3,49,3,9,3,72,3],
+      ["变",29,3,178,3],
+      ["古",34,3,16,3,37,3,36,3],
+      ["史",0,3,19,3,10,3,9,3,3,3,5,3,5,3,10,3,18,3,9,3,9,3,61,3,36,3,23,3,1,3,1,3],
+      ["叶",0,3,88,3,51,3],
+      ["司",82,3,80,3],
+      ["吃",102,3,97,3],
+      ["吉",45,3,1,3],
+      ["名",9,3,95,3],
+      ["否",102,3,97,3],
+      ["吸",114,3],
+      ["告",12,3,102,3],
+      ["员",6,3],
+      ["味",65,3],
+      ["呵",3,3],
+      ["命",96,3],
+      ["品",53,3,23,3,94,3],
+      ["哈",106,3],
+      ["响",99,3,2,3,40,3,84,3],
+      ["哥",40,3],
+      ["啸",196,3],
+      ["嗅",71,3,7,3],
+      ["器",62,3,97,3,17,3,22,3],
+      ["回",128,3,15,3],
+      ["因",124,3,96,3],
+      ["园",84,3],
+      ["困",214,3],
+      ["国",74,3,16,3,72,3,32,3],
+      ["图",64,3,154,3],
+      ["土",62,3,7,3,30,3,30,3],
+      ["地",64,3,5,3,95,3],
+      ["场",161,3],
+      ["圾",134,3],
+      ["垃",134,3],
+      ["型",62,3],
+      ["埃",90,3,33,3],
+      ["城",50,3,20,3,42,3,23,3],
+      ["培",7,3],
+      ["堂",153,3],
+      ["塑",19,3,151,3],
+      ["塔",31,3,3,3,6,3],
+      ["境",57,3],
+      ["士",113,3,32,3,58,3],
+      ["声",219,3],
+      ["处",126,3,8,3,42,3,5,3,8,3,8,3],
+      ["多",126,3,55,3,16,3],
+      ["大",12,3,121,3,3,3,1,3,17,3,43,3],
+      ["天",2,3,131,3],
+      ["太",13,3,155,3],
+      ["失",204,3,16,3],
+      ["头",103,3,28,3,61,3],
+      ["奇",93,3],
+      ["契",190,3],
+      ["奖",188,3],
+      ["奥",118,3,33,3],
+      ["女",182,3],
+      ["好",176,3,13,3],
+      ["如",37,3,126,3],
+      ["妹",225,3],
+      ["姐",225,3],
+      ["子",98,3,76,3,15,3,9,3],
+      ["字",31,3,36,3],
+      ["存",21,3],
+      ["学",5,3,6,3,1,3,18,3,6,3,18,3,26,3,36,3,34,3,11,3,2,3,13,3,9,3,3,3,18,3],
+      ["孩",198,3],
+      ["安",21,3,51,3],
+      ["定",130,3],
+      ["实",174,3,5,3,5,3],
+      ["宫",169,3],
+      ["家",4,3,101,3,31,3,35,3,11,3,33,3],
+      ["富",149,3],
+      ["察",91,3],
+      ["对",101,3],
+      ["寻",81,3],
+      ["寿",24,3],
+      ["小",39,3,70,3,33,3],
+      ["尔",50,3],
+      ["尘",90,3],
+      ["尚",140,3],
+      ["尼",21,3,13,3,6,3,4,3,146,3],
+      ["居",195,3],
+      ["展",19,3,58,3,128,3],
+      ["山",132,3,52,3],
+      ["岩",45,3],
+      ["工",6,3,14,3],
+      ["巨",210,3],
+      ["差",49,3],
+      ["巴",40,3,143,3],
+      ["市",70,3,42,3,23,3],
+      ["帆",66,3],
+      ["师",64,3],
+      ["常",87,3],
+      ["平",168,3],
+      ["幸",37,3],
+      ["广",114,3],
+      ["应",72,3,30,3,33,3,64,3],
+      ["建",63,3],
+      ["异",49,3,44,3],
+      ["弈",156,3],
+      ["引",114,3],
+      ["弟",225,3],
+      ["归",143,3],
+      ["形",67,3,30,3],
+      ["影",30,3,69,3,2,3,40,3,84,3],
+      ["彼",105,3],
+      ["律",15,3],
+      ["得",37,3,68,3],
+      ["徙",40,3,81,3],
+      ["微",80,3],
+      ["德",21,3],
+      ["心",18,3,24,3,15,3,93,3],
+      ["忠",76,3],
+      ["性",49,3,43,3,12,3],
+      ["恐",25,3,149,3],
+      ["息",166,3],
+      ["悉",44,3],
+      ["情",60,3],
+      ["惧",174,3],
+      ["想",195,3],
+      ["愈",83,3],
+      ["意",15,3,70,3,52,3,9,3],
+      ["感",81,3],
+      ["慢",32,3,117,3],
+      ["慧",127,3],
+      ["慰",72,3],
+      ["戏",12,3,177,3,22,3],
+      ["成",49,3,75,3],
+      ["所",195,3],
+      ["手",74,3,116,3],
+      ["打",3,3,103,3],
+      ["托",111,3],
+      ["找",81,3],
+      ["技",21,3,205,3],
+      ["投",28,3],
+      ["报",12,3,116,3],
+      ["拉",50,3,133,3],
+      ["拯",95,3],
+      ["捕",142,3],
+      ["据",128,3],
+      ["掌",219,3],
+      ["探",13,3,96,3,68,3,3,3],
+      ["控",35,3],
+      ["摩",133,3],
+      ["改",84,3,34,3,46,3],
+      ["效",72,3],
+      ["救",95,3],
+      ["教",36,3,127,6,23,3],
+      ["数",128,3],
+      ["文",11,3,3,3,53,3,121,3,18,3],
+      ["料",19,3,19,3],
+      ["斯",34,3,11,3,66,3],
+      ["新",4,3,12,3,33,3,13,3,41,3,7,3,7,3,65,3,5,3,5,3],
+      ["方",9,3],
+      ["无",63,3,104,3],
+      ["日",87,3],
+      ["时",39,3,101,3,26,3],
+      ["昆",56,3,103,3],
+      ["明",6,3],
+      ["易",47,3],
+      ["星",6,3,136,3,22,3,13,3,24,3],
+      ["是",102,3,97,3],
+      ["晤",113,3],
+      ["景",26,3,179,3],
+      ["智",127,3],
+      ["朋",198,3],
+      ["木",117,3],
+      ["未",28,3],
+      ["本",47,3,59,3],
+      ["术",34,3,52,3,21,3,29,3,10,3,5,3,24,3,40,6],
+      ["机",13,3,146,3,13,3,26,3],
+      ["材",117,3],
+      ["条",97,3],
+      ["来",28,3,184,3],
+      ["杨",111,3],
+      ["杰",160,3],
+      ["极",91,3],
+      ["析",17,3,111,3],
+      ["林",84,3,65,3,8,3],
+      ["果",179,3],
+      ["柏",84,3],
+      ["染",38,3],
+      ["格",36,3,121,3,14,3],
+      ["梦",17,3],
+      ["植",59,3,6,3,68,3,88,3],
+      ["椒",158,3],
+      ["楔",67,3],
+      ["楼",133,3],
+      ["榄",51,3],
+      ["模",153,3],
+      ["橄",51,3],
+      ["橡",23,3],
+      ["欠",3,3,103,3],
+      ["欺",175,3],
+      ["款",55,3],
+      ["歌",44,3],
+      ["殿",169,3],
+      ["母",48,3,138,3],
+      ["比",145,3,58,3],
+      ["毛",1,3,193,3],
+      ["气",101,3],
+      ["氟",178,3],
+      ["水",35,3,13,3,4,3,10,3,116,3],
+      ["沙",124,3,41,3],
+      ["河",113,3],
+      ["油",51,3,162,3],
+      ["治",137,3],
+      ["泊",196,3],
+      ["法",15,3],
+      ["泥",62,3],
+      ["泰",113,3],
+      ["洋",48,3,120,3,12,3],
+      ["洞",27,3,157,3],
+      ["洪",35,3],
+      ["洲",33,3,56,3,49,3,53,3,2,3,9,6,3,3],
+      ["流",154,3,11,3,53,3,3,3],
+      ["测",180,3],
+      ["济",101,3],
+      ["海",18,3,30,3,20,3,100,3,12,3,16,3],
+      ["涂",214,3],
+      ["涎",125,3],
+      ["深",68,3],
+      ["混",129,3],
+      ["游",161,3,28,3,22,3],
+      ["湖",196,3],
+      ["源",107,3,101,3],
+      ["演",22,3,185,3],
+      ["漠",70,3,54,3],
+      ["澳",33,3,56,3,47,3,2,3,53,3,2,3,9,6,3,3],
+      ["濒",95,3],
+      ["火",164,3,13,3],
+      ["灭",27,3,48,3,135,3],
+      ["灵",18,3,63,3],
+      ["然",120,3],
+      ["熊",27,3],
+      ["爆",55,3],
+      ["父",116,3],
+      ["片",104,3],
+      ["版",218,3],
+      ["牌",76,3,94,3],
+      ["牙",191,3],
+      ["牛",10,3],
+      ["物",10,3,24,3,14,3,7,3,4,3,2,3,4,3,3,3,2,3,19,3,46,3,6,3,29,3,51,3,1,3],
+      ["特",21,3],
+      ["犬",138,3,64,3],
+      ["犸",75,3],
+      ["狗",202,3],
+      ["狼",144,3],
+      ["猛",75,3],
+      ["猫",103,3],
+      ["猴",143,3,31,3],
+      ["玩",29,3,63,3],
+      ["现",55,3,94,3],
+      ["珍",108,3],
+      ["珠",108,3],
+      ["球",131,3,33,3],
+      ["理",42,3,22,3,62,3,8,3,16,3,31,3,14,3,2,3],
+      ["生",5,3,16,3,47,3,5,3,16,3,127,3],
+      ["用",172,3],
+      ["电",30,3,86,3,73,3],
+      ["界",93,3],
+      ["略",162,3],
+      ["番",22,3],
+      ["疗",83,3],
+      ["疟",137,3],
+      ["疲",200,3],
+      ["疾",137,3],
+      ["症",58,3,146,3],
+      ["白",173,3],
+      ["的",15,3,2,3,1,3,1,3,2,3,1,3,5,3,2,3,9,3,2,3,6,3,1,3,1,3,1,3,2,3,10,3,4,3,6,3,4,3,1,3,2,3,1,3,6,3,1,3,1,3,1,3,4,3,1,3,1,6,2,3,1,3,2,3,1,3,1,3,3,3,2,3,3,3,3,3,2,3,16,3,11,3,5,3,3,3,6,3,3,3,17,3,1,3,9,3,3,3,1,3,5,3,4,3,9,3,1,3,3,3,1,3,5,3,1,3,1,3,1,3,5,3],
+      ["皮",160,3,23,3],
+      ["皿",7,3],
+      ["益",73,3],
+      ["盐",69,3,10,3],
+      ["目",12,3,82,3,73,3],
+      ["盲",58,3],
+      ["眠",39,3,4,3,51,3,91,3,35,3],
+      ["睡",39,3,4,3,51,3,91,3],
+      ["石",115,3],
+      ["码",97,3],
+      ["研",36,3,7,3,25,3,30,3,50,3,48,3],
+      ["碱",69,3],
+      ["磁",116,3],
+      ["社",41,3,77,3,4,3,25,3],
+      ["福",37,3],
+      ["种",48,3,85,3,8,3],
+      ["科",10,3,20,3,50,3,81,3,24,3,41,3],
+      ["程",218,3],
+      ["稿",190,3],
+      ["究",36,3,7,3,25,3,30,3,50,3,48,3],
+      ["空",13,3],
+      ["竞",66,3],
+      ["童",157,3,49,3],
+      ["笔",81,3,4,3,1,3,16,3,97,3,18,3,1,3],
+      ["筑",63,3],
+      ["策",56,3,96,3,10,3,38,3],
+      ["简",0,3],
+      ["米",226,3],
+      ["类",40,3,21,3,60,3,6,3,3,3,17,3],
+      ["精",73,3],
+      ["糖",33,3],
+      ["素",102,3,97,3],
+      ["索",13,3,164,3],
+      ["纪",211,3],
+      ["纳",226,3],
+      ["纸",81,3,4,3,1,3,16,3,5,3,92,3],
+      ["组",8,3,24,3],
+      ["织",8,3,24,3],
+      ["经",101,3],
+      ["结",222,3],
+      ["绝",27,3,48,3,135,3],
+      ["绩",49,3],
+      ["绸",77,3],
+      ["罕",183,3],
+      ["罗",31,3,56,3,42,3,40,3],
+      ["羊",194,3],
+      ["美",74,3,16,3,61,3],
+      ["群",143,3,41,3],
+      ["翻",86,3],
+      ["考",49,3,42,3],
+      ["耍",92,3],
+      ["耳",172,3],
+      ["聊",63,3,22,3],
+      ["联",222,3],
+      ["育",186,3],
+      ["胜",112,3],
+      ["胶",23,3],
+      ["能",47,3,83,3],
+      ["脑",18,3,179,3],
+      ["脚",25,3],
+      ["脸",58,3],
+      ["自",120,3],
+      ["航",168,3],
+      ["船",66,3,57,3],
+      ["艺",21,3,13,3,52,3,50,3,10,3,29,3,40,6],
+      ["节",24,3],
+      ["花",155,6],
+      ["苏",171,3],
+      ["英",194,3],
+      ["茄",22,3],
+      ["茶",0,3,88,3],
+      ["草",16,3],
+      ["荒",70,3],
+      ["药",16,3,37,3],
+      ["莎",145,3,58,3],
+      ["获",37,3,105,3],
+      ["营",166,3],
+      ["落",43,3,140,3],
+      ["虫",56,3,3,3,100,3],
+      ["蚁",139,3,34,3],
+      ["蛛",119,3],
+      ["蜍",193,3],
+      ["蜘",119,3],
+      ["蜥",110,3,77,3],
+      ["蜴",110,3,77,3],
+      ["蟾",193,3],
+      ["行",127,3,15,3,42,3,7,3],
+      ["街",131,3],
+      ["表",60,3,88,3],
+      ["衰",109,3],
+      ["袋",144,3],
+      ["被",78,3],
+      ["装",53,3,36,3],
+      ["西",4,3,5,3,7,3,33,3,41,3,13,3,7,3,5,3,2,3,65,3,1,3,4,3,5,3],
+      ["要",92,3,12,3],
+      ["观",57,3,23,3],
+      ["规",153,3],
+      ["视",93,3],
+      ["觉",71,3,7,3,15,3],
+      ["解",17,3],
+      ["言",95,3,53,3,14,3,5,3,16,3,25,3,4,3],
+      ["计",8,3,45,3,67,3,41,3],
+      ["让",160,3],
+      ["议",178,3],
+      ["记",26,3],
+      ["论",156,3],
+      ["设",8,3,45,3,67,3,41,3],
+      ["译",86,3],
+      ["试",49,3],
+      ["诚",76,3],
+      ["话",157,3],
+      ["该",102,3,97,3],
+      ["语",54,3,20,3,21,3,53,3,14,3,5,3,16,3,3,3,21,3,1,3,4,3],
+      ["说",109,3],
+      ["课",153,3],
+      ["豆",99,3],
+      ["象",55,3,20,3,79,3],
+      ["责",122,3],
+      ["质",106,3],
+      ["资",28,3],
+      ["赋",2,3],
+      ["赛",57,3],
+      ["起",107,3,101,3],
+      ["足",131,3,92,3],
+      ["跨",162,3],
+      ["车",132,3],
+      ["辣",158,3],
+      ["达",148,3],
+      ["迁",29,3,11,3,81,3],
+      ["过",132,3],
+      ["运",32,3,20,3],
+      ["进",150,3],
+      ["适",135,3],
+      ["通",96,3],
+      ["速",66,3],
+      ["造",84,3,23,3,11,3,5,3,41,3],
+      ["道",65,3,48,3],
+      ["部",43,3,17,3,30,3,93,3],
+      ["重",92,3,12,3,66,3],
+      ["野",138,3,64,6,14,3],
+      ["量",71,3,29,3,55,3],
+      ["金",31,3],
+      ["钩",1,3],
+      ["铅",217,3,1,3],
+      ["销",166,3],
+      ["镜",98,3],
+      ["长",24,3,192,3],
+      ["闲",85,3],
+      ["间",152,3],
+      ["防",35,3,102,3],
+      ["院",44,3],
+      ["隧",113,3],
+      ["露",115,3],
+      ["面",60,3],
+      ["革",96,3],
+      ["音",2,3,16,6,65,3,17,3,67,3,40,3,5,3],
+      ["页",45,3],
+      ["项",12,3,176,3],
+      ["颈",216,3],
+      ["题",167,3],
+      ["风",26,3,10,3,169,3],
+      ["飞",191,3],
+      ["食",24,3,8,3,27,3,2,3,9,3],
+      ["馆",34,3,21,3,96,3,19,3],
+      ["香",125,3],
+      ["马",31,3,3,3,53,3,24,3,18,3,40,3],
+      ["验",174,3,10,3],
+      ["骗",175,3],
+      ["骨",192,3],
+      ["鱼",1,3,13,3,199,3],
+      ["鲜",155,3],
+      ["鲸",14,3,199,3],
+      ["鸟",121,3,6,3,3,3],
+      ["鸦",214,3],
+      ["鹰",103,3],
+      ["鹿",216,3],
+      ["黑",223,3],
+      ["鼬",223,3],
+      ["龙",25,3,100,3]
+    ]
+  };
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,2675 @@
+(function registerReadingVocabCoverage(global) {
+  'use strict';
+  global.__READING_VOCAB_COVERAGE__ = {
+    "version": 1,
+    "wordlist": "ielts_core",
+    "wordlistSize": 3608,
+    "ids": ["p1-high-01","p1-low-02","p3-high-03","p3-high-04","p1-high-05","p2-low-06","p3-low-07","p2-low-08","p2-high-09","p2-medium-10","p1-low-11","p3-low-12","p1-low-13","p2-high-14","p3-high-15","p2-high-16","p2-high-17","p3-medium-18","p2-high-19","p1-medium-20","p2-high-21","p3-medium-22","p2-high-23","p1-high-24","p2-high-25","p1-high-27","p3-low-28","p1-medium-29","p1-low-30","p1-high-31","p3-high-32","p1-medium-33","p1-low-34","p1-low-35","p3-low-36","p2-low-37","p3-low-38","p2-low-39","p1-low-40","p2-low-41","p3-low-42","p3-low-43","p3-low-44","p1-low-45","p1-low-46","p1-low-47","p1-low-48","p2-low-49","p2-low-50","p2-low-51","p1-low-52","p1-low-53","p3-low-54","p3-low-55","p3-low-56","p1-medium-57","p2-medium-58","p3-low-59","p1-medium-60","p1-low-61","p2-low-62","p1-medium-63","p2-low-64","p2-low-65","p3-medium-66","p1-low-67","p1-low-68","p1-low-69","p1-low-70","p3-low-71","p1-low-72","p2-low-73","p3-low-74","p2-low-75","p3-low-76","p2-low-77","p3-low-78","p1-high-79","p1-low-80","p1-low-81","p1-high-82","p3-low-83","p1-low-84","p3-low-85","p2-medium-86","p2-low-87","p3-low-88","p3-high-89","p1-high-90","p2-high-91","p1-high-92","p2-medium-93","p2-low-94","p3-low-95","p2-low-96","p3-low-97","p3-low-98","p1-low-99","p3-low-100","p1-high-101","p2-low-102","p2-low-103","p2-low-104","p1-high-105","p1-low-106","p1-low-107","p1-low-108","p1-low-109","p1-high-110","p1-low-111","p1-low-112","p1-low-113","p1-low-114","p1-medium-115","p1-low-116","p1-medium-117","p1-high-118","p1-medium-119","p2-high-120","p2-medium-121","p2-low-122","p2-high-123","p2-high-124","p2-low-125","p2-medium-126","p1-low-127","p2-high-128","p2-medium-129","p2-high-130","p2-high-131","p2-low-132","p2-high-133","p2-high-134","p2-low-135","p2-high-136","p2-high-137","p1-low-138","p2-high-139","p2-low-140","p2-high-141","p2-low-142","p2-low-143","p2-medium-144","p2-high-145","p2-medium-146","p2-low-147","p2-low-148","p1-low-149","p3-high-150","p3-low-151","p3-medium-152","p3-low-153","p3-medium-154","p3-medium-155","p3-high-156","p3-high-157","p3-low-158","p3-high-159","p1-low-160","p3-high-161","p3-medium-162","p3-low-163","p3-high-164","p3-low-165","p3-low-166","p3-high-167","p3-medium-168","p3-medium-169","p3-high-170","p1-high-171","p3-low-172","p3-high-173","p3-high-174","p3-low-175","p3-medium-176","p3-medium-177","p3-high-178","p3-medium-179","p3-high-180","p3-high-181","p1-medium-182","p3-medium-183","p3-high-184","p3-medium-185","p3-low-186","p3-low-187","p3-medium-188","p3-high-189","p3-low-190","p3-medium-191","p3-high-192","p1-high-200","p1-high-211","p1-high-216","p1-high-194","p2-low-222","p1-low-223","p2-high-201","p2-medium-217","p2-high-192","p2-medium-209","p2-medium-213","p2-low-051","p2-medium-058","p3-high-204","p3-high-206","p3-high-212","p3-high-218","p3-low-219","p3-low-999","p3-medium-197","p3-low-198","p3-low-078","p1-high-227","p2-high-225","p3-high-228","p1-high-229","p1-high-230","p1-high-231","p2-high-232","p2-high-233","p2-high-234","p3-high-221","p2-high-235","p2-high-236","p3-high-229","p2-high-239"],
+    "coverage": {"tokenCount":[837,983,953,958,870,846,919,904,881,788,753,927,828,878,892,880,898,924,916,750,895,922,916,860,925,913,921,880,824,889,880,836,911,955,980,895,874,917,830,896,898,952,910,733,848,801,908,925,862,875,863,769,915,941,992,884,866,889,928,981,889,815,931,924,856,900,844,757,937,867,940,941,900,926,496,747,886,891,863,819,865,919,938,845,802,950,907,898,1004,910,863,875,951,923,934,911,939,869,934,995,964,758,935,819,844,755,876,862,963,826,781,904,775,1049,919,821,868,840,927,699,820,940,1177,888,779,888,988,983,960,898,917,933,840,625,914,865,857,883,923,916,887,961,952,935,902,892,959,905,843,899,898,954,975,915,757,855,915,1016,888,948,941,927,955,968,985,893,900,1316,910,833,919,896,931,776,906,931,876,1013,921,1257,930,905,936,933,920,897,919,883,907,930,975,801,775,799,885,972,832,792,868,935,965,886,923,892,905,939,891,1110,906,789,974,871,1306,815,880,908,908,853,804,936,929,903,927,935,907,914,819],"coreTokenCount":[95,220,106,143,59,125,163,124,218,119,107,179,102,131,134,102,154,91,107,125,137,103,153,116,139,99,177,96,130,126,125,90,128,92,136,82,137,99,100,112,153,153,109,84,167,110,133,146,142,103,110,93,143,175,133,163,102,99,88,128,146,103,153,145,122,174,76,106,118,155,147,145,154,164,70,133,150,99,155,138,93,125,148,116,119,134,168,109,86,139,109,106,115,107,118,119,132,167,122,130,131,109,109,104,103,78,92,88,177,129,122,132,100,149,131,80,129,148,133,89,173,156,235,109,146,110,107,129,145,170,127,103,109,122,135,117,112,141,112,124,183,212,134,119,103,108,110,141,142,106,123,174,171,141,101,161,152,110,114,144,96,124,177,138,127,93,118,173,157,101,155,104,119,115,155,114,117,165,161,131,131,116,122,108,94,97,136,136,122,106,135,114,98,101,117,154,123,97,112,109,137,159,112,109,114,128,134,123,134,111,171,76,168,100,162,62,101,109,119,101,96,143,139,129,167,100,122],"coreWordCount":[78,126,78,94,51,101,102,71,112,71,79,103,68,101,96,79,117,66,82,73,90,81,101,94,76,66,124,80,89,75,89,75,85,73,97,74,103,76,76,83,98,123,66,66,105,73,72,109,100,75,83,67,106,111,97,112,84,79,72,88,79,77,80,102,99,119,59,75,89,99,99,85,113,106,61,98,96,81,87,93,74,79,109,88,96,84,111,97,72,87,85,86,82,79,95,90,110,105,99,104,95,79,82,68,82,66,70,63,83,85,85,95,85,102,86,63,82,102,97,63,128,119,168,83,107,89,73,106,106,89,80,86,72,88,92,81,89,110,83,93,125,107,90,94,86,80,81,99,100,95,101,124,115,101,78,117,111,94,87,105,79,91,137,97,80,75,95,122,103,77,115,87,90,97,118,96,85,123,114,93,94,95,109,86,70,70,86,102,96,80,102,67,73,62,83,95,77,75,80,82,99,110,83,81,77,88,89,84,89,95,106,65,121,80,109,55,86,79,81,81,86,102,103,93,108,87,99]},
+    "words": [
+      ["abandon",1,1,15,1,33,1,35,1,29,1,27,1,3,1,8,1,6,1,12,2,40,1],
+      ["abide",152,1],
+      ["ability",2,2,4,11,2,1,1,1,4,2,1,3,22,2,11,3,5,3,2,3,1,1,1,1,1,1,6,1,2,1,4,1,2,1,5,1,2,1,3,1,2,1,6,1,7,1,4,2,6,1,11,1,5,1,3,1,2,2,3,2,13,3,7,1,4,2,1,1,1,1,2,1,1,2,4,2,4,3,4,1,1,1,2,2,1,2,1,2,5,1,1,1,2,1,2,5,5,1,6,4,7,6,4,1,4,3,4,1,6,1,4,1],
+      ["abolish",72,1,4,1],
+      ["absent",10,1,6,1,4,1,111,1,12,1,40,1,23,1],
+      ["absolute",2,2,186,1,19,1],
+      ["absorb",59,1,9,2,21,1,1,1,24,1,29,1,34,1,3,2,21,1,17,1],
+      ["abstract",45,1,22,2,19,1,60,2,2,1,19,2,16,1,6,1,23,2],
+      ["abstraction",67,1],
+      ["absurd",41,1,107,1],
+      ["abundance",25,1,2,1,72,1,2,1,35,1,2,1,11,1,18,1,35,1,10,1,11,1],
+      ["academic",28,2,2,2,11,1,8,1,21,1,4,2,4,1,23,1,10,1,13,1,4,2,20,1,5,2,3,1,27,1,3,1,4,1,18,1],
+      ["accelerate",74,1,50,1,40,1],
+      ["acceptable",15,1,58,2,19,1],
+      ["access",6,1,32,1,32,3,31,1,12,1,16,1,33,1,8,1,11,1,5,1,4,1,1,1,15,1,8,1],
+      ["accessible",74,1,24,1,7,1,7,1,1,1,4,1,34,1,20,1,9,1,8,1,26,1],
+      ["acclaim",2,1],
+      ["acclimatise",174,1],
+      ["accommodation",34,1,84,1],
+      ["accompany",9,1,45,1,21,1,3,1,43,1,4,1,21,1,21,1,1,1,17,1,5,1,21,1,1,1,5,1],
+      ["accomplish",2,1,1,3,1,1,33,1,14,1,5,2,39,1,16,1,15,2,13,1,1,1,2,1],
+      ["account",20,1,2,1,1,1,3,1,13,2,1,1,9,2,3,1,1,1,14,1,9,1,1,1,9,3,7,1,9,2,5,1,5,1,2,1,8,1,6,1,1,1,11,1,4,1,6,1,7,1,35,1,7,2,7,2,3,2,7,1,7,1],
+      ["accountant",162,1],
+      ["accredit",116,1],
+      ["accumulate",26,1,7,1,8,1,31,1,51,1,4,1,26,1,12,1,22,1,9,1],
+      ["accuracy",64,1,22,2,121,1,8,1],
+      ["accurate",30,1,26,1,15,1,4,1,3,1,15,1,28,1,5,1,22,1,8,1,10,2,5,1,4,1,21,1,14,1],
+      ["accustom",5,1,63,1,147,1],
+      ["achievement",2,2,7,1,21,1,6,1,13,2,62,1,28,1,14,5,9,1,1,1],
+      ["acid",19,1,8,1,34,1,73,1],
+      ["acknowledge",2,1,6,1,3,1,84,1,7,1,16,1,10,1,8,1,14,1,10,1,33,1,6,1,7,1,2,2,5,1,12,1],
+      ["acoustic",44,1,136,1,41,1],
+      ["acquaintance",85,1],
+      ["acquire",2,2,4,1,40,1,1,1,27,1,20,1,6,1,8,1,17,2,6,1,5,1,31,1,7,1,7,1,26,1,5,1,2,1,8,1,3,1],
+      ["acquisition",2,1,55,1],
+      ["activate",3,1,4,2,10,2,1,2,39,1,26,1,17,1,85,1],
+      ["actual",7,1,11,1,13,2,5,1,45,1,2,1,62,1,3,1,13,1,22,1,20,1,8,1,6,1],
+      ["acumen",127,1],
+      ["acupuncture",220,1],
+      ["acute",27,1,76,1,50,1],
+      ["adapt",1,1,9,3,2,1,1,1,1,1,1,1,24,1,1,1,14,2,1,1,4,1,8,1,6,1,13,1,3,1,14,1,10,1,7,1,15,1,5,1,10,1,7,1,11,1,2,1,6,1,5,1,42,1,1,1,2,2],
+      ["adaptation",14,1,45,3,109,1,48,1],
+      ["addict",189,1],
+      ["addiction",33,1,187,1],
+      ["addition",3,1,9,1,1,1,9,1,7,1,3,1,1,1,1,2,10,1,4,1,4,1,2,2,1,2,5,1,2,1,13,1,3,1,9,1,8,1,3,1,13,1,6,2,5,1,1,1,14,1,3,2,1,2,7,1,6,1,12,1,10,1,2,1,3,1,35,1,1,1],
+      ["additional",4,1,17,1,1,1,11,1,21,1,1,1,41,1,14,1,9,1,5,1,4,1,38,2,3,1,1,1,11,1],
+      ["address",2,1,2,1,22,1,23,1,4,1,17,1,48,1,4,1,2,1,50,1,1,1,33,1,16,1,2,1],
+      ["adequate",87,1,26,1],
+      ["adhere",8,1],
+      ["adjacent",84,1],
+      ["adjust",76,1,6,1,10,2,36,1,12,1],
+      ["administer",72,1,65,1,32,1,31,1],
+      ["administration",80,1,67,1,5,1,9,1],
+      ["administrative",33,1,22,1,46,1,3,1],
+      ["administrator",11,1,25,2,19,1,65,1,2,1,31,1],
+      ["admission",55,1],
+      ["admit",53,1,7,1,35,1,7,1,10,1,38,2,49,1],
+      ["adolescent",186,1,39,1],
+      ["adopt",1,1,12,1,39,1,1,1,1,1,8,1,2,3,8,1,4,1,13,1,13,1,20,1,15,1,12,1,5,1,18,1,23,2,4,1,8,1,7,1,4,1,4,1],
+      ["advance",7,2,2,1,4,1,7,1,20,1,29,1,23,1,12,1,18,1,2,1,16,1,25,1,5,1,20,1,8,1],
+      ["advanced",0,1,14,2,7,1,25,1,23,1,87,1,21,2,9,1,12,1,25,1],
+      ["advantage",1,1,7,2,6,1,17,1,17,1,4,1,7,1,2,2,4,1,8,1,1,1,23,1,20,1,14,1,2,1,2,2,7,1,1,2,4,1,2,1,3,1,1,2,9,1,4,1,10,2,18,1,3,1,4,1,16,1,4,2,1,1,2,1],
+      ["advantageous",92,1,109,1,21,1,3,1],
+      ["advent",5,1,45,1,11,1,35,1,8,1,36,1],
+      ["adventure",105,1,66,4,11,2],
+      ["advertise",20,1,27,1,23,1,6,1,4,1,34,9,32,1,20,1,54,1],
+      ["advertisement",104,1,10,8,12,1,20,1],
+      ["advice",20,1,35,1,27,1,32,1,36,1],
+      ["advisable",172,1],
+      ["advocate",11,1,11,1,49,1,3,3,46,1,13,1,1,1],
+      ["aeronautics",161,1],
+      ["aeroplane",87,1],
+      ["aesthetic",26,1,20,1,17,1,2,1,16,1,5,1,50,1,19,1],
+      ["affect",6,1,2,1,7,1,7,1,4,1,11,1,2,1,3,1,10,1,2,1,3,1,19,1,11,1,7,1,4,1,2,1,3,1,14,1,18,1,2,2,18,1,1,1,2,1,7,1,16,2,1,1,14,1,9,1,2,1,2,1,5,1],
+      ["afflict",69,1],
+      ["affluent",32,1,38,1,31,1,17,2,35,1],
+      ["afford",39,1,31,1,3,1,15,1,4,2,7,1,92,1],
+      ["afield",34,1,6,1,170,1],
+      ["agency",16,1,4,1,13,1,2,1,5,1,13,2,6,1,97,1,8,1,11,1,15,1,11,2,18,2],
+      ["agenda",109,1,13,1],
+      ["aggressive",138,1,41,1,10,1,13,1,12,1,10,1],
+      ["agile",10,1],
+      ["agriculture",5,1,28,2,5,1,9,1,12,1,2,3,9,2,9,1,20,1,2,1,1,2,22,1,9,4,6,4,4,1,56,2,2,3,20,2,2,1,1,2],
+      ["airtight",195,1],
+      ["alarm",10,1,49,2,18,1,17,2,20,1,68,1],
+      ["albeit",133,1,31,1,41,1],
+      ["alcohol",53,1],
+      ["alert",33,1,70,1,3,3,60,1,16,1,39,2,2,1],
+      ["alienate",186,1],
+      ["allergic",178,1],
+      ["alleviate",120,1,4,1],
+      ["allocate",11,1,9,1,16,1,55,1],
+      ["allowance",162,1],
+      ["allure",108,1,43,1],
+      ["alter",6,2,8,1,6,1,7,1,3,1,7,1,2,1,7,1,32,1,3,1,8,1,10,1,5,1,32,1,7,1,22,1,3,1,21,1,15,1,2,1,16,1],
+      ["alternate",48,1],
+      ["alternative",5,1,3,1,21,1,4,2,8,1,14,1,1,1,16,3,1,1,3,1,28,1,15,1,4,1,1,1,4,1,1,2,4,1,22,2,15,1,7,1,31,1,13,1],
+      ["altitude",121,1,28,1],
+      ["aluminium",165,1],
+      ["amass",41,1],
+      ["amateur",9,1,14,1,167,1],
+      ["amaze",48,1,2,1,7,1,2,1,50,1,8,1,10,1,12,1],
+      ["ambassador",77,1],
+      ["ambiguity",148,1,14,1],
+      ["ambition",8,1,73,1,24,1,8,1,74,1],
+      ["ambitious",31,1,80,1,2,1,55,1,20,1],
+      ["amount",0,1,1,1,1,1,18,1,16,2,12,1,3,2,14,1,5,1,5,1,4,1,17,1,1,1,11,1,9,1,11,1,6,2,10,1,1,1,11,2,22,1,1,1,17,1,5,3,2,1,4,1,3,1,6,1,2,2,2,1,5,1],
+      ["amplify",172,1,47,1],
+      ["analogy",48,1,68,1],
+      ["analyse",3,1,11,1,25,1,10,1,65,1,25,1,14,2,13,2,1,1,13,1,3,1,7,1,11,1,11,1],
+      ["analysis",17,1,5,1,2,1,3,1,9,2,4,1,15,1,14,1,6,1,5,2,11,1,9,1,28,3,1,3,16,2,4,1,7,1,10,1,8,2,3,2,1,3,11,2,1,1,2,1,9,2,2,2,7,1,12,2],
+      ["anatomy",11,1,70,1,73,1,33,1],
+      ["ancestral",121,1,29,1],
+      ["anchor",123,1,1,1,18,1],
+      ["ancient",0,1,3,1,6,7,6,1,2,2,4,2,8,3,2,1,1,1,3,1,3,1,1,1,7,5,1,4,3,2,1,6,6,2,4,1,8,4,10,1,4,1,4,3,7,1,1,1,3,2,9,3,1,1,2,2,5,1,1,4,4,1,3,4,2,1,4,3,7,2,8,1,8,1,6,3,10,1,9,2,10,1,1,2,7,1,15,2,1,1,3,1,4,2,1,3],
+      ["anecdote",101,1,78,1],
+      ["angle",1,1,68,1,28,1,49,1,13,1,9,1],
+      ["animate",93,1],
+      ["announce",28,1,3,1,13,1,14,1,119,1,11,1],
+      ["annoy",208,1,17,1],
+      ["annual",4,1,29,1,2,1,30,1,10,1,26,1,24,1,3,1,2,1,49,1,9,3,7,1,29,1],
+      ["anthropologist",40,3,7,1,100,2,3,1,42,1,16,1,14,1],
+      ["antibiotic",7,1,95,1,37,3,60,1],
+      ["anticipate",85,1,33,1,4,1,18,1,43,1],
+      ["anticipation",18,1],
+      ["antiquity",34,3,31,1,22,2,63,1],
+      ["antiseptic",65,1,86,1],
+      ["anxious",12,1,27,1,3,1,50,6],
+      ["apart",14,1,5,1,25,1,15,1,12,1,4,1,1,1,11,1,9,1,4,1,5,1,4,2,6,1,8,2,44,1,1,1,2,1,14,1,1,1,15,1,4,1,8,1,2,1],
+      ["ape",98,1,17,2,93,1],
+      ["apparatus",164,1,53,1],
+      ["apparent",13,1,10,1,18,1,13,1,32,1,11,1,16,1,2,2,2,1,4,1,46,2,4,1,17,1,24,2,14,1],
+      ["apparently",3,1,75,1,8,1,53,1,12,1,5,1,22,1],
+      ["appeal",26,1,2,2,26,1,28,1,16,1,2,1,42,1,3,1,3,2,1,1,3,3,1,1,47,1,3,1,3,2,9,1],
+      ["appear",1,2,2,2,1,1,9,1,1,1,4,1,2,3,3,2,2,3,1,1,8,1,2,2,3,1,6,1,1,4,2,4,2,1,5,1,5,1,4,2,1,1,3,1,2,1,7,1,6,1,2,2,6,1,1,1,17,2,1,1,1,1,2,1,1,1,16,1,4,3,7,1,7,1,1,1,12,1,1,1,2,2,5,1,3,1,4,2,1,1,5,2,1,1,7,2,2,2,1,1,8,1,3,1,1,1,3,1,1,1,1,1,1,1,2,1,1,1,7,1,1,5,2,1],
+      ["appearance",1,1,8,1,1,2,12,1,8,2,59,1,2,1,2,1,25,1,3,1,29,1,7,1,17,1,8,1,10,1,23,2],
+      ["appetite",172,1,15,1],
+      ["applaud",219,1],
+      ["application",7,1,12,2,11,1,8,1,42,2,40,2,39,1,67,2],
+      ["apply",8,1,3,1,4,1,11,1,25,2,2,2,1,1,2,2,5,1,1,3,10,1,10,2,16,2,3,1,1,1,12,1,5,2,3,2,4,1,18,1,1,1,1,1,10,1,18,2,4,1,1,1,20,1,2,2,2,1,11,4,1,1,2,1,4,2,5,1],
+      ["appoint",44,1,9,1,20,1,38,2,5,1],
+      ["appointment",8,1,12,1,96,1],
+      ["appraisal",171,1],
+      ["appreciate",4,1,94,1,13,1,19,1,13,1,24,2,13,1,14,1,18,2],
+      ["approach",2,1,2,1,3,1,1,9,2,1,1,1,1,1,1,1,11,1,2,2,2,1,7,2,2,1,17,4,6,2,2,1,2,1,1,1,5,1,3,1,1,1,11,1,14,1,3,3,8,1,6,2,2,3,13,1,6,1,3,1,2,1,8,1,3,1,9,1,1,1,3,1,2,1,5,1,2,1,22,1,2,3,7,2,8,1],
+      ["appropriate",1,1,7,1,46,1,1,1,18,1,20,1,41,1,40,1,12,1,9,1,3,1,3,1],
+      ["approval",99,1,120,1],
+      ["approve",151,1,6,1],
+      ["approximate",198,1],
+      ["approximately",9,1,28,1,7,1,29,1,4,1,17,1,14,1,33,1,27,1,1,1,9,1,14,1,18,1],
+      ["apt",41,2,7,1,167,1],
+      ["aptitude",6,1,124,1,90,1],
+      ["arable",194,1],
+      ["architect",5,1,30,1,9,6,6,1,13,3,55,3,2,3,31,9,19,1],
+      ["architecture",0,1,7,1,7,1,20,4,10,1,19,4,57,1,50,1,3,1,22,2],
+      ["archive",95,1,33,1],
+      ["argue",0,1,7,1,1,5,6,1,2,1,1,1,1,1,2,1,17,1,3,1,7,2,8,1,5,3,3,3,11,1,1,1,6,1,5,1,8,3,1,1,1,2,8,1,7,1,1,1,11,1,5,1,1,1,2,1,3,1,3,1,4,1,7,1,4,1,1,2,1,1,4,1,9,2,11,3,1,1,8,1,8,1,11,1,1,1,1,1,3,2,1,2],
+      ["argument",6,1,9,2,9,1,29,1,2,1,46,1,1,1,10,1,26,1,14,2,3,1,17,1,6,2,15,1,6,1,3,1,11,1],
+      ["aridity",210,1],
+      ["arithmetic",183,1],
+      ["arousal",63,1,18,1],
+      ["arrange",21,1,15,1,64,1,5,1,31,1,27,1],
+      ["arrangement",21,1,9,1,16,1,4,1,2,1],
+      ["array",11,1,34,1,50,1,58,1,2,1,21,1],
+      ["artefact",1,2,39,5,1,3,10,1,72,2,87,3],
+      ["arthritis",53,1],
+      ["artificial",1,1,4,1,8,1,22,1,4,1,17,1,104,1,5,1,6,1,19,3,1,1,7,1,2,1],
+      ["ascend",44,1],
+      ["ash",21,5,8,1,100,11],
+      ["aspect",0,1,5,1,1,1,2,1,3,4,1,1,3,2,7,1,10,1,11,1,6,1,3,1,29,1,4,1,1,1,12,1,11,1,3,1,6,2,4,1,24,2,2,1,2,1,1,1,3,1,13,1,3,2,1,1,7,2,5,1,4,2,2,1,9,2,6,1,2,1,6,1,12,2,1,1],
+      ["aspiration",11,1,38,1,63,1,10,1,40,1,8,1],
+      ["assault",69,1],
+      ["assemble",73,1,50,1,17,1,50,1],
+      ["assert",26,1,45,1,4,1,3,1,75,1,9,1,6,1,10,1],
+      ["assess",6,1,5,1,7,1,8,1,10,1,6,1,2,1,26,1,22,2,30,2,26,1,4,1,3,1,1,1,10,1,15,1,28,1,10,2],
+      ["assessment",6,2,69,1,93,1,3,2,7,2,18,1,13,1],
+      ["asset",14,1,19,1,95,4,38,1,28,1],
+      ["assign",2,1,24,1,105,1,22,3,28,1],
+      ["assignment",105,1,26,2,22,1],
+      ["assimilate",2,1],
+      ["assimilation",2,1,205,3],
+      ["assist",44,1,19,1,7,1,12,2,74,2,42,3,3,2,23,1],
+      ["assistance",6,1,56,1,1,1,58,1],
+      ["assistant",17,1,36,1,53,1,70,1],
+      ["associate",2,1,1,3,14,1,1,1,8,1,6,2,5,3,3,1,14,1,2,2,22,1,4,2,10,1,1,1,6,1,1,1,3,1,6,1,16,1,6,1,4,2,4,1,4,1,1,1,3,3,3,1,24,1,2,1,5,1,16,1,1,1,6,1,1,2,3,1,11,1,1,1,3,1,2,1],
+      ["association",0,1,16,1,23,1,1,1,1,1,29,4,12,1,40,1,55,1,11,1,6,1,14,1,2,1,12,1],
+      ["assume",6,1,2,2,14,1,8,1,11,1,4,1,9,1,10,1,4,1,7,1,1,1,12,1,1,1,10,1,3,1,29,1,21,1,20,1,2,1,4,1,7,2,14,1,7,1,2,1,9,1],
+      ["assumption",2,1,4,1,2,4,113,1,29,1,13,1],
+      ["assurance",16,1,57,1],
+      ["astonish",45,1,43,1,33,1,37,1,14,1,10,1,10,1],
+      ["astound",48,1,82,1],
+      ["astronaut",13,3,50,1,79,2,75,3],
+      ["astronomy",64,1],
+      ["athlete",2,1,7,4,48,5,106,1],
+      ["atmosphere",44,1,40,1,45,1,22,2,8,1,5,5,13,2,3,3,8,1,17,1,21,1],
+      ["atmospheric",90,1,1,1,86,1],
+      ["atomic",226,1],
+      ["attach",1,1,4,1,13,1,8,2,23,1,19,1,3,1,26,1,29,1,6,2,84,1],
+      ["attack",19,1,1,1,32,1,8,1,1,1,4,3,24,4,5,1,35,1,25,1,20,1,50,1],
+      ["attain",73,1,14,1,44,2,42,1],
+      ["attempt",4,1,4,2,15,1,13,1,3,1,16,1,3,1,23,1,6,1,8,1,5,1,4,1,1,1,2,1,2,1,4,1,7,1,18,1,7,1,1,1,2,1,5,1,2,1,7,2,2,1,6,1,4,2,9,1,14,1,5,1,1,1,1,1,10,2,4,1],
+      ["attend",4,1,88,1,19,1,25,1,40,1,5,1],
+      ["attendance",170,1],
+      ["attention",7,1,4,1,7,1,16,1,2,1,1,2,10,1,1,1,2,1,5,1,3,1,2,1,10,4,2,1,6,1,8,4,8,1,20,8,12,2,9,1,6,1,4,1,1,1,3,1,3,5,7,1,3,1,4,1,6,2,2,2,7,2,1,1,7,2,1,2,1,1,4,1,2,9,6,1,3,2,2,1,1,1,9,1,1,1,3,2,3,2],
+      ["attentive",11,1],
+      ["attitude",6,1,30,1,3,2,18,1,7,1,8,1,10,2,13,1,21,2,32,2,14,1,43,1,4,1],
+      ["attract",14,1,12,1,2,2,3,1,13,1,6,1,5,1,3,1,1,1,6,5,5,1,12,1,2,1,7,1,23,2,2,6,6,1,10,1,9,1,4,1,1,1,5,1,2,1,5,1,5,2,11,1,5,2,11,2,13,1,15,1,7,1],
+      ["attraction",55,1,26,1,35,1,14,1,1,1,1,2,17,1,12,2,9,1],
+      ["attractive",9,1,49,1,76,1,7,1,11,1,1,1,2,1,69,2],
+      ["attribute",14,1,12,1,1,1,12,1,14,1,37,1,62,3,3,1,10,1,2,1,1,1,44,1,12,2],
+      ["audition",12,5],
+      ["authentic",169,1,36,1],
+      ["authority",0,1,8,2,28,1,5,1,12,1,37,1,19,1,2,1,1,1,16,1,16,1,3,1,31,1,42,1,5,1],
+      ["automatically",3,1,94,1,76,1,28,1],
+      ["autonomy",20,2],
+      ["availability",5,1,4,1,5,1,56,1,104,1,40,1],
+      ["available",0,1,1,2,2,1,3,1,15,2,1,2,6,1,4,1,6,1,2,1,6,1,1,1,3,1,3,1,3,1,6,6,8,1,6,3,11,1,9,2,15,1,10,1,1,1,6,2,15,1,10,1,3,1,10,1,2,1,12,2,10,1,1,1,2,1,5,1,2,1,1,1,9,1,16,1],
+      ["avalanche",165,2],
+      ["avenue",168,1,2,1],
+      ["average",0,1,1,1,2,2,6,1,11,3,4,3,9,2,9,1,1,2,6,1,17,1,10,1,4,1,12,1,6,1,3,1,5,2,16,1,4,1,14,1,4,1,7,1,2,2,10,3,15,1,1,3,1,1,3,1,10,1,3,1,17,1],
+      ["avoid",5,1,1,1,8,1,17,1,5,1,12,1,4,1,2,1,11,1,8,1,7,1,5,1,3,1,8,1,22,2,2,1,4,1,4,1,5,1,19,1,6,1,1,1,15,1,11,1,15,4,9,2,5,2,2,1],
+      ["award",30,3,54,1,9,1,91,1,4,6,7,1],
+      ["aware",27,1,35,1,6,1,2,1,1,1,7,3,15,1,5,1,29,1,12,1,36,1,9,1,2,1,5,1,17,1,11,1,1,1],
+      ["awful",53,1,140,1],
+      ["backbone",144,1],
+      ["background",11,2,23,1,2,1,8,1,24,2,13,1,5,1,1,1,11,1,20,1,32,1,3,1,2,1,26,2],
+      ["bacterial",32,1,33,1],
+      ["baffle",76,1,33,1],
+      ["balance",11,5,4,1,5,1,4,1,13,1,12,1,6,1,2,1,10,1,71,1,6,1,27,1,31,1],
+      ["balcony",118,1],
+      ["bamboo",77,1,30,2],
+      ["band",11,1,12,1,52,1,14,1,11,1,47,7,47,1,7,3],
+      ["bankrupt",113,1,9,1],
+      ["bankruptcy",4,1,29,1],
+      ["banner",77,2,37,1],
+      ["bar",97,16],
+      ["barbecue",118,1],
+      ["barely",75,1,69,1,6,1,10,1,5,1,48,1],
+      ["bargain",156,3],
+      ["bark",107,2,20,1,10,1,37,1],
+      ["baron",112,2],
+      ["barrage",63,1],
+      ["barrel",213,3],
+      ["barren",90,2,34,3,40,1,13,1],
+      ["barrier",33,1,43,2,53,1,33,3,6,1,30,2,16,2,10,1],
+      ["basis",8,1,11,1,2,1,5,1,27,1,4,1,23,1,37,1,33,1,8,1,4,1,13,1,3,1,6,1,38,1],
+      ["battery",145,1,4,1,46,1,8,1,23,1],
+      ["bay",129,1,53,1],
+      ["bead",47,7,61,3,17,1],
+      ["beam",66,1],
+      ["beehive",38,1],
+      ["beforehand",220,1],
+      ["behalf",23,1],
+      ["behave",59,1,1,1,8,1,17,1,4,1,3,1,6,1,52,2,48,1,27,1],
+      ["belief",6,1,5,1,17,1,13,1,1,4,12,1,21,1,3,1,28,1,3,4,7,2,21,1,3,1,1,1,9,1,1,1,9,3,12,1,11,2,30,1],
+      ["belt",23,1,108,1,1,1,17,1,13,1],
+      ["beneath",3,1,46,1,19,1,1,4,19,1,3,1,22,2,97,1,6,1,8,1],
+      ["beneficial",8,1,15,2,1,1,29,1,36,1,7,1,3,1,10,1,11,1,2,1,54,1,2,1],
+      ["benefit",0,1,8,1,3,1,3,1,10,1,2,1,2,2,2,1,7,1,10,3,6,1,2,2,4,3,6,1,7,1,2,2,2,2,7,3,2,1,4,2,3,1,3,1,1,2,1,1,3,1,1,1,1,1,18,1,1,1,1,3,6,1,3,1,4,1,3,1,5,2,9,1,1,3,5,1,18,4,2,9,2,1,5,1,1,1,1,1,2,2,6,2,4,1,3,1,7,1,12,2,4,1],
+      ["bent",46,1],
+      ["besides",22,1,35,1,68,1,13,3,64,3,5,1],
+      ["bet",66,1],
+      ["betray",157,1],
+      ["beverage",0,2,200,1],
+      ["bewilder",192,1],
+      ["beyond",18,1,23,1,6,1,10,1,24,2,18,1,2,1,5,1,2,1,14,1,5,1,6,1,4,1,2,1,7,2,2,1,3,1,8,1,2,1,10,1,2,1,3,1,6,1,15,1,1,1,24,1],
+      ["biased",117,1],
+      ["bid",69,1,87,2,67,1],
+      ["bilingual",54,9,41,1,91,5,21,1],
+      ["bin",135,1],
+      ["bind",15,1,38,1,76,1],
+      ["biodiversity",32,4,16,2,85,1,5,1,3,1,61,1],
+      ["biography",27,1,84,5,60,1],
+      ["biological",5,1,9,3,86,1,20,1,30,1,23,1,12,1,2,1,6,8,7,1,13,1],
+      ["bit",7,1,31,1,13,3,8,1,2,1,11,1,9,1,15,1,2,1,1,1,5,1,4,1,6,1,1,1,1,1,3,1,18,1,30,1,27,1,18,1],
+      ["bizarre",45,2,46,1,99,1],
+      ["blame",27,1,9,1,7,2,10,1,22,1,18,1,44,1,52,1],
+      ["blank",22,1,41,2,87,1],
+      ["blast",79,2,135,1],
+      ["blend",19,1,19,1,17,1,13,1,19,1,2,2,68,1,22,1,37,1],
+      ["block",5,1,40,1,8,1,10,5,5,1,4,3,9,1,1,1,11,1,25,1,2,1,12,1,9,1,26,1,12,1,2,1,14,1,17,1,3,1,6,2],
+      ["bloom",48,1,91,1],
+      ["blueprint",218,1],
+      ["board",13,1,2,1,18,2,33,1,26,1,7,1,5,1,1,1,6,1,25,1,6,1,11,1,15,1],
+      ["boast",21,1,99,1,7,1,86,1],
+      ["bold",170,1,49,1],
+      ["bonus",25,1,30,1],
+      ["booming",94,1,71,1],
+      ["boost",49,1,6,2,13,1,8,1,5,1,14,1,38,1,30,1,13,1,25,1,19,1],
+      ["boot",23,3,118,1,8,2],
+      ["booth",170,1],
+      ["border",51,1,73,1,68,1,31,1],
+      ["bore",63,4,10,1,9,1,24,1,17,1],
+      ["bother",104,1,57,1],
+      ["boulder",196,1],
+      ["bound",5,1,102,1,71,1,37,1],
+      ["boundary",25,4,93,2,6,1,60,1,21,1],
+      ["bow",52,1,83,1,76,1],
+      ["branch",1,1,34,1,20,1,2,1,34,1,9,1,15,1,12,1,33,1,56,1],
+      ["brand",16,1,56,1,4,10,6,6,32,6,8,1,12,1,6,2,11,1,15,1,4,1,23,1],
+      ["brass",176,1],
+      ["breakthrough",46,1,18,1,73,1,85,1],
+      ["breakwater",129,3],
+      ["breed",14,1,8,6,10,1,3,1,30,1,31,1,7,1,2,1,5,2,11,2,3,1,3,3,8,1,14,1,5,1,3,1,6,1,31,1,29,2],
+      ["breeze",89,1,106,2],
+      ["brew",71,1,17,1],
+      ["brief",0,1,16,1,37,1,8,1,27,1,27,1,52,1,45,1],
+      ["briefly",4,1,115,1,58,1,3,1],
+      ["brilliant",64,1,45,3,3,1,33,1,5,1,53,1,1,1],
+      ["brittle",125,1],
+      ["browse",10,1],
+      ["brutal",205,1],
+      ["bubble",90,1,82,1,10,2],
+      ["bucket",71,1],
+      ["bud",158,1],
+      ["budget",41,1,21,1,56,1,33,1,2,1,3,1,6,1],
+      ["buffalo",10,2],
+      ["bulb",43,1],
+      ["bulk",107,1],
+      ["bullet",119,1],
+      ["bully",149,1],
+      ["bureau",166,1],
+      ["bureaucracy",8,4,3,1,136,1],
+      ["burrow",110,3,113,2],
+      ["burst",9,1,18,1,27,1,85,1,61,1],
+      ["bury",1,1,24,1,15,1,5,2,24,2,18,1,9,1,12,1,26,1,31,2,45,1],
+      ["cable",180,1],
+      ["calcium",129,3,36,1],
+      ["calculate",30,1,5,1,20,1,21,2,1,2,16,1,60,1,15,1,9,1,2,1,16,1,1,1,5,1,8,1],
+      ["calendar",188,1,23,1],
+      ["calf",14,2,124,1,64,1,14,1],
+      ["calibrate",121,1],
+      ["calibre",163,1],
+      ["calm",64,2,2,1,26,1,76,1],
+      ["calorie",24,20,52,3,26,1,97,1,1,1],
+      ["camel",0,1,75,1,4,1],
+      ["camouflage",89,12,82,1,45,1],
+      ["campaign",15,1,13,9,21,1,33,1,13,1,42,1,29,1],
+      ["campus",58,1],
+      ["cancel",207,1],
+      ["candidate",28,1],
+      ["cannon",217,2,1,1],
+      ["canoe",168,13],
+      ["cap",164,4,20,1],
+      ["capable",13,1,44,1,27,1,7,1,12,1,18,1,9,1,3,1,5,1,16,1,29,1,3,1,10,1,1,1,5,1,15,1,4,1],
+      ["capacity",7,1,32,1,39,1,39,1,29,1,3,1,5,1,5,1,7,1,10,1,4,1,2,1,1,2,14,1,9,1,2,2],
+      ["capsule",72,1,70,1],
+      ["captive",24,1,120,1,79,3],
+      ["captivity",110,1,9,1,104,1],
+      ["capture",1,2,4,1,21,1,4,1,5,1,14,1,42,1,6,1,10,1,27,1,8,5,4,1,11,1,2,1,5,1,8,1,1,1,47,1,6,2],
+      ["cardiovascular",3,1,213,2],
+      ["career",6,3,68,1,11,1,24,1,2,4,25,1,9,2,4,1,1,1,13,1,19,1,1,1,20,2],
+      ["carry",8,1,2,1,2,1,20,1,1,1,7,1,13,1,5,1,1,2,1,1,5,1,1,2,3,1,1,2,2,1,6,1,3,1,9,1,1,1,9,2,1,2,2,1,20,1,4,1,3,1,7,2,3,1,2,1,2,1,3,1,1,2,10,1,4,1,11,1,1,1,2,1,1,1,2,1,2,1,12,1,14,3,3,2,4,3,9,1,1,2],
+      ["carve",27,1,19,3,1,2,7,1,13,1,47,1,9,3,50,1,45,1],
+      ["cash",200,1],
+      ["cast",12,3,7,1,10,1,11,1,14,1,3,1,43,1,67,1,10,1,5,1,8,1,20,1,1,1,1,1,13,1],
+      ["casual",205,1],
+      ["catalogue",85,1,10,1,32,1,63,1,11,1],
+      ["catastrophic",33,1,163,1,13,1],
+      ["category",15,1,11,2,12,1,3,1,67,1,18,1,21,2,6,1,21,1,14,1,25,1],
+      ["cater",55,1,21,1,42,1],
+      ["caution",16,1,145,1,37,1],
+      ["cautious",70,1,58,1,17,1,58,1],
+      ["cease",67,1,10,1,7,1,30,1,71,1],
+      ["celebrate",7,1,21,1,2,1,2,1,6,1,3,1,16,1,43,1,5,1,7,1,34,1,9,1,27,1,29,1],
+      ["celebrity",9,21,148,1],
+      ["cell",7,25,30,1,8,2,12,4,2,4,2,1,7,2,21,1,5,1,6,1,58,1,23,1,4,1,5,1,36,1],
+      ["ceramic",44,1,6,1,12,2],
+      ["cereal",201,1],
+      ["ceremony",0,3,30,2,74,1,101,1,14,1,3,1],
+      ["certificate",49,1],
+      ["certify",213,1],
+      ["chain",8,1,71,1,18,2,6,1,19,1,2,1,8,4,24,1],
+      ["challenge",5,2,3,1,5,1,3,1,2,1,2,3,13,1,1,2,1,1,6,1,12,1,5,1,8,3,14,1,2,1,12,1,5,1,14,1,4,1,5,1,5,4,15,1,4,1,5,1,8,2,1,1,2,1,2,4,2,1,2,2,2,1,8,1,8,1,4,2,1,4,1,2,5,1,9,1,10,2,10,1],
+      ["chamber",27,2,4,2,21,1,40,2,47,2,15,1,62,1],
+      ["champion",93,1,67,1],
+      ["chancellor",28,3],
+      ["channel",35,1,22,1,9,1,3,5,30,1,49,1,7,1,11,2,14,4,16,1,14,1,11,3],
+      ["chaos",36,1,59,1,66,1],
+      ["chapel",28,1],
+      ["character",12,1,17,1,1,4,47,1,32,2,3,1,32,1,38,1,1,1,7,2,15,1,3,1,1,1],
+      ["characteristic",6,2,7,1,19,1,9,1,12,1,3,1,1,2,8,1,16,1,3,1,25,1,16,1,11,1,9,2,2,1,4,1,24,1,19,1,9,2,4,3,6,1,12,1],
+      ["charcoal",210,7],
+      ["charge",55,1,4,4,16,1,41,2],
+      ["charity",62,1,33,1],
+      ["chart",3,1,15,1,26,1,105,1,56,1],
+      ["charter",153,1],
+      ["chase",37,1,66,2,71,1,37,1],
+      ["cheat",58,1,40,1,86,1],
+      ["check",7,1,18,1,23,2,8,1,14,1,3,1,7,1,15,1,2,2,1,1,14,1,14,2,49,1,6,1,2,1,1,1,13,1],
+      ["chef",32,1,165,1],
+      ["chemical",19,3,8,2,6,2,5,1,21,1,2,5,4,1,6,1,7,1,1,2,11,1,27,1,12,4,6,1,2,2,2,1,19,1,35,2,21,5,7,3,3,17],
+      ["cherry",22,1,43,1],
+      ["chest",0,1],
+      ["chew",23,1,38,2,18,1,18,1,16,1,22,1,38,1,24,1],
+      ["chief",34,1,10,1,8,1,17,1,14,1,19,1,2,1,6,1,3,1,11,1,23,5,46,1,6,1,20,2],
+      ["chill",61,1,22,1],
+      ["chip",209,2,5,1],
+      ["chorus",188,1,23,1],
+      ["chronic",70,1,28,1,93,1],
+      ["chunk",79,1,36,1,14,1,5,1],
+      ["churn",29,1,44,1],
+      ["cinematography",30,1],
+      ["circle",1,1,20,2,53,1,45,1,5,1,14,1,12,1,5,1,22,1,11,1,14,1],
+      ["circulation",151,1,19,1,46,1],
+      ["circumscribe",152,1],
+      ["circumstance",8,1,37,1,41,2,23,1,27,1,26,1,12,1,18,1,22,1],
+      ["circus",188,1],
+      ["cite",18,1,19,1,64,2,49,1,2,1,26,1,18,1,13,1],
+      ["civil",15,1,14,1,48,1,52,1],
+      ["civilization",9,4,56,1,25,2,9,1,30,1],
+      ["claim",1,1,7,1,8,1,4,3,1,2,1,1,12,1,2,1,24,2,26,1,4,1,12,1,1,1,14,1,11,2,5,1,4,1,7,2,1,1,2,1,8,2,3,1,8,1,5,1,1,1,6,5,5,1,1,1,4,2,2,3,7,1,2,1,4,1,7,2,3,3],
+      ["clarify",26,1,183,2],
+      ["clarity",15,1,49,1,88,1],
+      ["clash",216,1],
+      ["classical",3,1,3,1,2,10,22,2,16,1,65,1,71,1,6,2],
+      ["classification",97,1,116,2,6,1],
+      ["classify",6,1,39,1,79,1,2,1,15,2,6,2,13,1,5,2,22,1,26,2,3,1,7,1],
+      ["clay",27,1,2,6,18,2,15,10,5,6,46,1,16,1,40,1,26,7,22,2,1,6],
+      ["clench",3,5],
+      ["clerk",67,1],
+      ["client",5,1,15,3,60,3,24,1,52,5,10,1,15,1,44,1],
+      ["climate",8,1,13,1,6,2,9,3,12,3,27,5,4,1,17,1,3,1,2,8,1,1,19,1,11,1,1,1,1,1,7,1,3,1,20,2,9,1,4,2,3,3,19,1,11,2,3,1,13,1],
+      ["climatic",25,1,51,1,25,1,29,1,65,1],
+      ["clinic",120,1,71,2,29,2],
+      ["clinical",11,2,5,1,147,1,62,1],
+      ["clip",63,1,3,7,22,1,4,1,14,4],
+      ["cloakroom",170,1],
+      ["clue",27,1,23,1,19,1,24,1,34,1,28,1,18,1,1,1,16,1,26,1,3,1,3,1],
+      ["clumsy",1,1],
+      ["cluster",47,2,89,1],
+      ["coach",6,2,14,3,111,1,32,3],
+      ["coarse",157,1],
+      ["code",63,1,1,1,7,1,26,21,8,2,6,1,7,1,72,5,11,1,18,3],
+      ["coexist",73,1,106,1,8,1,23,3],
+      ["cognition",18,2,80,1],
+      ["coherent",17,1,143,1],
+      ["cohesion",92,1],
+      ["coincide",35,1,40,2,82,1],
+      ["collaboration",12,1,1,1,70,1,62,1,58,1],
+      ["collapse",41,1,49,1,6,1,17,2,4,1,11,1,28,1,40,7],
+      ["collate",127,1],
+      ["collect",1,2,1,1,1,1,13,1,19,1,8,1,36,2,12,1,17,1,2,1,9,4,9,1,1,1,5,1,1,1,12,1,16,1,16,2,5,1,17,1,9,1],
+      ["collection",4,1,30,1,6,1,15,3,9,1,6,1,14,1,24,1,32,1,7,1,9,1,1,7,12,1,1,6,9,1,8,1],
+      ["colony",45,1,11,2,117,1,32,3,18,4],
+      ["column",151,3],
+      ["comb",141,1,3,1],
+      ["combat",48,1,53,1,36,2,77,1],
+      ["combination",46,1,34,1,4,1,9,1,4,1,3,2,15,1,30,1,20,1,2,2,14,1,7,1,1,2,14,1,7,1,2,2,2,1],
+      ["combine",20,2,27,1,5,2,3,1,6,1,12,1,10,1,4,1,14,1,7,1,12,1,4,1,5,1,7,2,19,1,40,1,3,1,9,1,1,1,2,1,12,1,2,1],
+      ["combustion",96,1,38,1],
+      ["comedy",12,1,170,1,18,1],
+      ["comet",25,1,117,2],
+      ["commence",64,1,87,1,44,1],
+      ["comment",1,1,10,2,4,1,18,1,20,1,29,1,3,1,9,1,26,1,26,1,4,1,32,1,16,1,21,1],
+      ["commerce",47,1,4,1,4,1,40,1,67,1],
+      ["commercial",1,2,14,2,7,2,1,1,9,1,6,1,23,1,1,2,25,1,1,1,24,3,2,1,5,1,6,2,18,1,23,1,9,1,4,1,9,1,13,1,5,1,11,1],
+      ["commission",1,1,48,1,4,1,103,1,32,1],
+      ["commit",8,1,12,2,72,1,70,2,20,1,1,1,6,1],
+      ["commitment",20,2,102,1,14,1,26,1,2,1],
+      ["committee",17,1,80,3,54,1,37,1],
+      ["commodity",51,1,26,1,117,1],
+      ["community",16,2,10,2,2,2,5,1,2,1,6,1,14,2,7,4,8,1,4,1,1,1,9,1,11,3,23,4,2,1,2,5,1,1,2,1,2,1,12,1,2,1,2,1,7,3,28,2,1,4,7,3,5,8,5,1,13,2,4,1,8,1,3,3],
+      ["commute",43,1,20,1],
+      ["compact",136,1,58,1],
+      ["companion",4,1,3,1,49,1,36,1,63,1],
+      ["comparable",22,1,73,1,65,1,17,1,43,1],
+      ["comparatively",98,1,10,1,35,1],
+      ["compare",7,1,11,2,4,1,2,3,8,1,38,1,1,2,2,2,5,2,5,1,5,1,4,2,2,1,1,1,2,1,1,1,20,1,1,1,8,1,3,1,13,1,5,2,4,1,1,1,6,3,5,1,12,1,21,1,7,1,21,1],
+      ["comparison",22,1,4,1,45,1,22,1,6,1,37,1,9,1,1,1,25,1,32,1,2,1],
+      ["compass",64,2,52,4,5,2,38,1],
+      ["compatriot",76,1],
+      ["compel",68,1,65,1,13,1,9,1,16,1],
+      ["compensate",3,1,4,1,1,1,120,1,93,1],
+      ["compensation",20,1],
+      ["compete",25,1,3,1,6,1,21,1,2,2,9,1,10,1,38,1,24,1,3,2,12,1,3,1,23,1,14,1,9,1,4,1,16,1,1,1,1,1,1,2],
+      ["competent",92,1,17,1,97,1],
+      ["competition",19,1,6,1,17,1,2,2,3,1,1,2,18,2,4,1,18,1,3,1,20,1,6,2,10,1,4,2,7,1,3,1,43,1,4,2,14,1,20,1,2,1],
+      ["compile",168,1,33,1],
+      ["complain",32,1,50,1,31,1,5,1,20,1,28,1,36,1,13,1,5,1],
+      ["complaint",72,1],
+      ["complementary",72,1],
+      ["complete",0,2,13,1,3,1,2,1,13,3,5,1,8,4,16,1,4,1,2,1,6,1,6,1,6,1,3,1,8,1,2,1,14,1,2,1,2,1,1,1,5,1,5,1,2,1,17,1,8,1,4,1,6,1,6,1,1,1,5,2,6,2,1,1,1,1,14,1,6,1,6,1],
+      ["complex",3,1,2,2,2,2,3,1,1,1,2,2,13,3,2,1,7,1,9,1,1,3,2,1,3,1,4,1,2,1,11,2,7,1,4,1,8,2,3,2,15,1,9,1,1,1,18,1,3,1,1,1,11,1,1,1,4,14,6,2,1,3,2,1,2,1,2,1,8,2,4,1,5,1,1,1,5,1,2,1,7,2,9,2,2,2,8,1,6,1,3,1],
+      ["complexity",13,1,37,1,13,1,18,1,5,1,7,1,5,1,13,1,17,1,24,3,10,1,30,1,30,1],
+      ["complicate",95,1,59,1],
+      ["complicated",65,1,15,2,12,1,9,1,36,1,15,1,2,1,50,1,1,1,4,1],
+      ["comply",42,1],
+      ["component",1,1,1,1,1,2,24,1,3,1,4,1,7,1,19,1,2,1,11,2,4,1,40,1,59,1,30,1,20,1],
+      ["compose",2,2,42,1,39,1,35,1,28,2,1,1,61,2],
+      ["composition",6,1,23,3,47,1,14,1,14,1],
+      ["compound",11,1,8,1,42,1,4,15,14,1,42,1,3,1,1,1,3,1,1,1,48,1,44,1],
+      ["comprehensive",134,1],
+      ["compress",26,1,123,1,25,1],
+      ["comprise",10,1,98,1,9,1,22,1,30,1,25,1,28,1],
+      ["compromise",13,1,60,1,49,1,23,1,40,1,18,1],
+      ["compulsory",178,2],
+      ["computerize",30,5,53,1,120,1],
+      ["conceal",175,1,15,1],
+      ["concede",80,1,48,1,47,1,7,1],
+      ["conceive",40,2,79,1,89,1],
+      ["concentrate",12,1,13,1,4,1,7,1,1,1,44,2,45,2,10,1,28,1,8,2,9,2,5,1,38,1],
+      ["concentration",21,2,34,1,10,1,14,2,17,1,30,1,32,1,14,2,6,2,3,2,5,1,3,1],
+      ["concept",0,1,11,1,15,1,6,3,4,1,6,1,25,1,6,3,24,1,23,2,14,1,2,1,11,1,12,1,19,1,1,1,4,3,3,3,4,1,14,1,14,1,7,1],
+      ["conception",146,1],
+      ["conceptual",41,1],
+      ["concern",0,1,6,1,2,1,7,2,8,1,11,1,6,1,1,3,8,1,4,3,23,1,11,1,5,1,3,1,3,2,1,1,7,1,5,1,16,1,1,1,5,1,1,2,11,1,3,1,7,1,3,1,1,2,16,1,3,1,4,1,1,1,4,1,1,1,8,1,7,1,2,1,2,1,1,3,16,1,2,2],
+      ["concert",2,1,9,1,33,1,5,1,170,1],
+      ["concession",156,1],
+      ["conclude",16,1,1,1,5,2,14,1,14,1,6,1,7,1,8,1,7,1,5,1,13,1,18,1,34,1,10,1,10,1,4,1,5,1,8,1,5,1,8,1,2,1,10,1],
+      ["conclusion",24,1,12,1,4,1,20,1,12,1,13,1,29,1,34,1,4,1,1,1,24,1,5,1,7,1,21,1],
+      ["concrete",20,1,15,2,9,4,23,1,15,1,2,3,12,1,33,27,6,3,22,1,35,1,3,1],
+      ["condemn",215,1],
+      ["condensation",79,1],
+      ["condition",5,5,3,1,1,1,1,1,1,2,2,1,3,1,3,1,2,1,13,2,2,1,3,2,4,1,2,1,3,2,3,2,1,1,6,5,1,1,2,1,5,1,7,1,7,1,14,1,8,1,3,1,2,1,6,2,4,1,3,1,2,2,9,1,2,1,4,1,1,1,2,1,24,1,4,1,5,1,1,7,3,1,4,1,3,1,3,1,5,1,3,8,4,1,3,1,2,2,17,1,5,1],
+      ["conditioner",173,1],
+      ["conduct",1,1,30,1,6,1,2,1,4,1,20,2,19,2,9,1,25,1,26,1,2,1,18,2,6,3,6,1,6,1,4,1,2,1,1,1,9,1,4,1],
+      ["conference",96,1,8,1,55,3],
+      ["confidence",172,1,17,1],
+      ["configuration",200,1],
+      ["confine",20,1,48,1,9,1,10,1,23,1,25,1,7,1,80,1],
+      ["confirm",0,1,22,1,2,1,13,1,3,2,16,1,11,1,1,2,8,1,45,1,4,1,26,1,3,1,8,1,6,2,8,1,1,1,6,1,17,1,23,1],
+      ["conflict",15,1,9,2,12,2,28,1,17,1,43,1,9,1,10,1,9,1,4,1,2,1,12,1,14,2,10,2,12,1,19,1],
+      ["conform",42,4],
+      ["conformity",42,10],
+      ["confront",34,1,14,1,41,1,63,1,5,1,5,1,47,1],
+      ["confuse",63,1,7,1,23,3],
+      ["confusion",53,1,10,1,24,1,6,1,32,2],
+      ["congested",131,1],
+      ["congestion",96,1],
+      ["connect",1,1,15,1,21,2,20,1,14,2,7,2,7,4,21,2,14,1,3,1,9,1,14,1,21,1,13,1,5,1,27,1,7,1],
+      ["connection",3,1,34,1,17,1,6,2,7,1,18,1,8,1,7,1,4,2,16,1,2,1,29,1,16,2,15,1,18,1,5,1,1,1,6,2,8,1,2,6],
+      ["conquer",152,1,25,1],
+      ["conquest",31,1,56,3,50,1,32,3],
+      ["conscious",18,1,8,1,13,1,18,1,21,1,74,4,10,1,38,2,25,1],
+      ["consecutive",20,1,19,1],
+      ["consensus",56,2,88,1,49,1],
+      ["consequence",6,1,27,1,43,1,6,1,6,1,1,1,4,1,27,1,2,2,5,1,10,1,13,1,15,1,3,1,3,1,12,1,3,2,7,1,4,1,1,2,3,1,21,2],
+      ["consequently",39,1,13,1,2,1,22,1,66,1,44,1,5,1,16,1,7,1],
+      ["conservation",16,1,68,1,11,1,8,1,7,2,33,2,44,5],
+      ["conservative",34,1,84,1,87,1],
+      ["conserve",84,2,21,1,16,1,58,1,6,1,10,1,5,2],
+      ["considerable",10,1,5,1,8,1,5,2,14,1,23,1,10,1,11,1,10,1,6,1,19,1,2,1,26,1,6,1,1,1,6,1,30,1,7,1,15,1],
+      ["consideration",35,1,18,1,29,1,4,1,34,1,32,2,18,1,12,2,27,1,6,1,10,1],
+      ["consignment",88,1,25,1],
+      ["consist",0,1,10,1,18,1,16,1,7,1,14,1,2,1,6,1,6,2,20,1,6,1,8,1,1,1,13,1,5,2,9,1,6,1,17,1,2,1,3,1,15,1,23,1,1,1],
+      ["consistent",2,1,6,1,56,1,8,1,105,1,13,2,20,1],
+      ["consolation",57,1],
+      ["consolidation",2,1,93,1,90,1,35,1],
+      ["consortium",97,1,59,1],
+      ["constant",22,1,30,1,11,1,1,2,31,1,18,2,7,1,1,1,13,1,39,2],
+      ["constantly",10,1,10,1,5,1,29,1,38,1,2,1,11,1,4,2,3,1,14,1,6,1,17,1,10,1,1,1,21,2,8,1],
+      ["constitute",14,1,22,1,90,1,22,1,25,1],
+      ["constrain",155,1,53,1],
+      ["construct",21,2,8,1,1,1,1,1,15,1,18,2,53,1,5,1,1,1,6,1,4,1,27,1,7,1,2,3,4,1,10,2,7,1,20,1,2,1],
+      ["construction",1,2,12,1,18,2,13,3,1,1,1,1,17,1,16,1,7,1,25,1,1,1,1,1,4,2,3,1,9,3,40,1,1,1,25,2,31,1],
+      ["consult",70,1,74,1,12,3,3,1,3,1,20,1,10,1],
+      ["consultant",15,1,38,1,98,1,5,1],
+      ["consumer",16,2,16,1,15,3,6,2,13,1,4,1,6,1,6,6,32,7,3,1,5,1,9,1,3,2,6,3,86,1],
+      ["consumption",0,2,76,2,3,1,20,1,3,1,10,1,5,1,5,1,57,1,20,1,7,1],
+      ["contact",4,1,43,1,12,1,13,2,11,1,5,1,16,4,1,1,7,1,8,1,27,1,21,1,6,3,10,2,7,1,1,1,17,1,5,1,7,2,1,1],
+      ["contain",6,1,4,1,9,1,2,1,4,1,1,1,5,1,7,2,1,1,6,2,1,1,1,1,3,2,2,1,1,1,8,1,1,1,2,1,3,4,1,1,1,2,6,1,4,1,3,1,10,1,24,1,2,1,2,3,2,1,1,1,5,1,1,4,5,1,5,1,12,2,3,1,3,1,1,2,11,2,1,1,3,1,3,1,3,1,4,1,6,1,1,2,3,1,3,1,4,1,24,2,2,1],
+      ["contaminate",113,1],
+      ["contemporary",34,1,7,1,23,1,22,1,19,1,8,1,7,1,17,1,8,2,6,1,19,1,1,1,16,1,1,1,15,2,2,1,2,1,4,1,2,1],
+      ["contempt",175,1],
+      ["content",24,1,7,1,6,1,12,1,2,1,1,1,9,2,8,1,16,1,1,4,8,1,25,1,3,1,7,2,11,1,17,2,24,1,8,3,1,1,11,2],
+      ["context",6,1,28,1,19,1,5,1,2,1,16,1,10,1,10,1,26,1,26,2,14,3,24,1,19,1,1,2],
+      ["continent",27,1,13,3,6,1,29,2,16,1,8,1,17,1,19,1,1,1,2,1,63,1,1,1,21,2],
+      ["continental",25,2,15,1,48,2,106,1],
+      ["continually",40,1,15,1,77,1,34,2],
+      ["continuity",222,1],
+      ["continuous",73,1,70,1,8,1,22,1],
+      ["contract",52,1,85,2,25,1,61,1],
+      ["contradict",42,1,72,1,38,1],
+      ["contrary",44,1,19,1,33,1,44,1,1,1,5,1,9,1,5,1,4,1,4,1,11,1,42,1],
+      ["contrast",6,1,2,1,7,1,11,1,8,1,18,1,1,1,9,1,1,1,10,2,14,1,31,1,7,1,2,1,9,1,9,1,3,1,5,1,10,1,3,1,1,1,7,1,21,1,3,1,5,1,5,1,4,1,5,1],
+      ["contribute",1,1,3,1,8,1,32,1,4,1,26,1,10,1,6,1,4,1,8,1,9,3,11,3,2,1,14,1,38,1,4,1,1,1,18,1,3,1,6,1,6,1,6,1],
+      ["controversial",16,1,59,1,43,1,42,1,17,1,6,2,7,1,21,1,2,1],
+      ["controversy",0,1,49,1,96,3,33,2,25,3,7,1],
+      ["convenience",5,1,65,1,26,1],
+      ["convenient",13,1,113,1],
+      ["conventional",5,2,11,1,43,1,13,1,42,1,14,1,5,1,19,1,40,1,13,1],
+      ["conversation",54,1,31,14,12,2,7,1,51,2,20,1,1,2,5,1,1,2,40,1],
+      ["converse",14,1],
+      ["conversely",56,1,169,1],
+      ["convert",5,2,59,2,20,1,18,1,17,1,3,1,10,2,67,1,27,1],
+      ["convey",58,1,27,1,1,3,62,1,14,1,60,1],
+      ["conviction",26,1,149,1],
+      ["convince",3,1,27,1,10,1,2,1,5,1,3,1,4,2,4,1,14,2,3,1,14,2,8,1,15,1,24,1,2,2,4,1,2,2,24,1,8,1,1,1,13,1,12,2,18,1,1,1,4,1],
+      ["cookery",32,1],
+      ["cooperate",13,1],
+      ["cooperation",97,1,66,1,26,1],
+      ["cooperative",127,1],
+      ["coordinate",52,1,31,2,114,1,24,1],
+      ["cope",5,1,44,1,41,1,6,1,24,1,15,1,26,1,13,1,21,2,2,1,12,1],
+      ["coral",52,1,16,2],
+      ["cord",46,1,45,1,83,1],
+      ["core",10,1,60,1,9,1,3,1,26,1,8,1,36,1,8,1,23,1,26,1,1,1,7,1,1,2],
+      ["cork",85,1],
+      ["corporate",122,4,28,3,20,2],
+      ["correlation",36,1,27,1],
+      ["correspond",37,1,4,1,19,1,51,1,38,1,18,1,45,1],
+      ["correspondence",60,1,44,1,45,1],
+      ["corridor",31,1],
+      ["corrupt",0,1],
+      ["cosmic",64,1,113,2],
+      ["cosmopolitan",118,1],
+      ["costume",12,1,77,1,51,1],
+      ["council",34,1,88,1,29,2,63,1],
+      ["counsel",213,1],
+      ["counter",53,1,78,1,7,1,14,1,8,1,42,1],
+      ["counterpart",41,1,6,1,57,1,5,1,20,1,2,1,22,1,38,1,34,1],
+      ["counterproductive",222,1],
+      ["county",70,1,148,2],
+      ["couple",12,2,1,1,71,1,21,1,10,1,21,1,3,1,42,1,24,1,13,1,1,1],
+      ["course",2,1,1,1,4,1,4,3,1,1,3,1,1,1,5,1,4,1,3,2,11,1,21,1,4,1,8,1,10,1,3,1,1,2,3,1,4,1,6,2,3,1,9,1,1,1,9,1,11,1,2,1,8,1,6,1,8,1,6,2,1,3,1,1,1,2,3,1,7,1,7,1,2,1,8,1,1,1,1,1,1,1,4,1,8,1,7,1,11,1],
+      ["cover",10,1,1,1,10,1,4,1,2,1,2,1,2,1,4,1,9,3,2,1,4,2,20,1,5,1,1,1,8,1,2,1,4,1,1,1,3,1,9,1,10,1,7,1,4,4,8,1,5,1,1,1,5,1,6,1,14,1,1,1,1,2,8,1,6,1,1,1,22,1],
+      ["coverage",64,1],
+      ["crack",22,2,40,1,43,1,6,1,16,1],
+      ["craft",1,1,4,1,42,1,26,6,74,4,12,2,4,1],
+      ["crash",94,1,38,1,64,1],
+      ["crater",25,5,152,1],
+      ["crawl",151,1],
+      ["create",0,1,2,1,3,1,1,2,1,1,1,1,3,1,1,4,3,1,2,1,2,1,3,2,1,1,1,1,2,2,3,5,1,3,3,1,2,3,1,1,2,1,4,1,2,1,1,2,1,1,1,1,1,1,4,3,1,3,1,4,1,5,4,1,1,1,1,2,9,1,7,1,5,1,1,1,4,1,1,2,2,2,1,1,1,1,3,2,1,2,2,1,2,1,2,1,2,1,1,1,2,1,1,2,1,1,1,1,10,1,2,6,2,1,4,1,3,1,3,1,2,2,1,1,3,1,5,1,3,1,2,2,1,2,8,1,1,1,1,2,3,4,1,1,2,3,3,1,1,1,1,4,1,1,2,1,1,1,7,1,4,1,3,3,6,2,3,1,1,1,3,1,3,2,2,1,2,1,2,3,2,1,11,1,1,1],
+      ["creation",0,1,9,1,10,1,10,2,55,1,15,1,9,1,20,1,8,1,10,2,32,1,5,1,4,1],
+      ["creative",0,1,38,1,43,24,11,3,2,1,18,1,8,1,33,1,4,1],
+      ["credibility",148,1],
+      ["credible",145,1,30,1,28,1],
+      ["credit",6,1,41,1,25,1,2,1,37,1,11,1,31,1,5,1,12,1,49,1],
+      ["creep",165,2],
+      ["crescent",52,1,113,1],
+      ["crew",50,1,16,3,25,1,41,1,12,1,48,1],
+      ["cricket",118,1,93,1],
+      ["crime",88,1,21,2,9,2,57,1,13,3,26,1],
+      ["criminal",2,1,86,1,21,2,66,1],
+      ["crisis",60,1,68,1,5,2,19,2,57,1,16,1],
+      ["crisp",128,1],
+      ["criterion",36,1,64,1,52,1,8,1,18,1],
+      ["critic",8,1,52,1,15,1,73,1,19,1,4,3,34,2,7,1,9,1],
+      ["critical",4,1,37,1,2,1,26,1,11,1,2,1,10,1,13,1,24,1,34,1,8,3,3,2,5,1,25,1,5,2],
+      ["criticise",8,2,145,1],
+      ["crocodile",115,1,78,1,17,1],
+      ["crowded",99,1,73,1],
+      ["crown",64,1,6,1],
+      ["crucial",12,2,2,1,12,1,6,1,20,1,4,1,1,1,23,1,6,1,7,1,8,1,19,1,9,1,2,1,6,1,6,1,4,1,29,1,4,1,7,1,18,1,5,1,1,1],
+      ["crude",23,3,4,1,60,1],
+      ["cruel",157,1],
+      ["cruise",52,3],
+      ["crush",51,1,28,1,38,1,41,1,19,1,38,1,3,1],
+      ["crushing",79,1,82,1],
+      ["crust",25,2,65,5],
+      ["crystallize",79,1],
+      ["cube",151,1],
+      ["cue",5,2,116,1,27,2,26,2,24,1,6,2],
+      ["culminate",116,1,69,1,20,1],
+      ["cultivate",16,1,6,2,16,1,35,1,26,2,34,1,6,2,19,2,36,1],
+      ["cultivation",23,1,28,1,26,1,11,1,11,3,25,2,15,1,82,1],
+      ["cultural",0,1,1,2,13,1,18,1,2,6,7,2,2,1,1,1,2,1,8,1,6,1,14,1,12,3,26,1,6,1,27,1,6,3,11,1,8,1,16,1,17,1,7,1],
+      ["curb",35,1,34,1],
+      ["curiosity",27,2,61,1,94,1],
+      ["curious",34,1,11,1,40,4,16,1,6,1,73,1,5,1,30,1],
+      ["currency",65,1,12,2],
+      ["current",5,2,4,2,15,1,4,2,18,1,2,1,4,1,1,3,16,1,11,1,11,1,29,2,39,2,1,1,6,1,11,1,2,1,2,1,7,1,1,1,6,1,10,2,4,1,15,1,2,1],
+      ["currently",11,1,13,1,10,1,12,1,7,1,2,1,31,1,16,1,20,1,11,1,12,1,19,1,2,1,33,1,4,1,3,1,10,1,4,1,4,1,2,1],
+      ["curriculum",11,1,38,1,73,1,41,1,43,1],
+      ["curtail",183,1],
+      ["cylinder",67,1,12,7],
+      ["dairy",70,1,26,1,6,4,97,4,1,1],
+      ["damage",3,1,4,2,26,2,2,1,4,1,22,2,6,1,23,1,6,1,6,2,20,1,9,1,3,1,7,3,20,1,8,1,4,1,4,1,4,1,4,2,6,1,1,1,1,1,6,2,5,3,6,1,4,3,6,1,1,4],
+      ["damp",137,2],
+      ["dash",97,1,85,1],
+      ["data",24,3,19,1,6,1,9,1,5,1,1,1,4,1,1,1,1,4,6,4,5,2,1,1,1,1,10,1,2,4,2,1,4,1,27,11,12,1,2,1,3,1,8,4,1,1,2,1,3,1,4,1,3,2,2,1,11,1,2,2,3,1,17,9,2,1,7,1,9,1,1,1],
+      ["database",128,3,39,1,34,1,11,1],
+      ["daunt",111,1,31,1],
+      ["dealer",1,1,189,1],
+      ["dean",6,1,122,1],
+      ["debate",0,1,13,1,3,1,24,3,1,1,8,1,4,1,2,1,19,1,9,1,3,1,13,1,16,1,8,1,15,1,7,1,4,1,2,1,6,1,11,1,10,2,5,4,4,2,15,1,1,1,5,2,2,1,1,1,2,2],
+      ["debris",47,1,100,1,49,1,14,1],
+      ["decade",6,1,21,1,1,2,2,1,2,1,3,1,1,2,5,1,2,1,2,1,1,1,3,1,15,1,5,3,3,1,2,1,1,1,2,1,7,3,5,1,8,1,13,1,3,1,4,1,6,1,6,1,3,1,5,2,2,1,3,1,1,2,1,1,5,1,7,1,3,1,1,1,4,1,1,1,2,1,1,1,6,1,1,1,1,1,3,1,2,1,2,1,4,1,18,1,3,1,4,1,9,1,2,2,3,1],
+      ["decay",19,1,42,1,117,4,13,4,18,1],
+      ["deceive",50,1,125,1],
+      ["deception",127,2,48,1],
+      ["decisive",48,1],
+      ["declaration",178,1],
+      ["declare",44,1,15,1,78,1,34,1,33,1,19,2],
+      ["decline",19,1,1,1,7,1,12,1,37,2,27,1,6,1,1,1,7,1,12,3,3,2,1,1,2,2,3,1,3,2,3,2,8,1,24,2,11,2,7,2,7,1,1,1,12,1],
+      ["decompose",1,1],
+      ["decorate",38,1,108,1,5,1],
+      ["decoration",77,1,74,1],
+      ["decrease",8,1,52,1,5,1,34,1,41,1,13,1,32,1,13,1,2,1,24,1],
+      ["dedicate",12,1,42,1,12,1,5,1,55,1,16,2,7,1,20,1],
+      ["deduce",111,1,63,1],
+      ["deem",85,1,67,1],
+      ["defeat",69,2,31,1,16,1,21,1,52,1],
+      ["defect",22,1,51,3,89,1],
+      ["defence",21,1,48,1,20,1,53,3,33,1,1,1,37,2,5,1,6,1],
+      ["deficiency",204,2],
+      ["deficit",94,1,110,3],
+      ["define",2,1,9,1,21,1,14,1,2,1,39,1,28,1,34,1,1,2,33,1,31,1],
+      ["definite",106,1,35,1],
+      ["definition",42,1,4,1,45,1,31,1,104,1],
+      ["deflect",147,1],
+      ["degrade",135,1,17,1],
+      ["delay",24,1,113,1],
+      ["delegate",96,2,56,1,7,3],
+      ["deliberate",6,1,146,3,23,1],
+      ["delicate",107,1],
+      ["deliver",15,1,29,1,28,1,24,1,15,1,3,1,26,1,11,1,4,1,2,1,9,1,6,1,16,1,4,1,24,1,10,3],
+      ["delivery",80,1,40,1,42,1,64,1],
+      ["delta",35,1,161,4],
+      ["demand",1,1,4,1,11,1,4,2,18,1,2,1,2,1,2,1,4,1,1,1,5,1,7,1,12,1,4,1,9,1,10,1,6,1,2,1,3,1,6,1,1,1,3,2,5,1,2,1,4,1,1,1,5,2,6,2,9,1,4,1,2,1,3,1,4,1,1,1,3,1,8,1,18,1,3,2,2,2,2,1,8,1,13,1],
+      ["democratic",36,1,20,1,75,1],
+      ["demolish",169,1,27,1],
+      ["demonstrate",1,1,2,1,3,1,26,1,9,1,6,1,5,1,2,1,60,1,2,1,11,1,9,1,1,1,5,1,7,1,9,1,2,2,5,1,2,1,8,1,5,1,7,1,3,1,5,1,2,1,1,2,2,2,5,1,7,1,7,1,2,1],
+      ["demonstration",3,1,172,1],
+      ["denote",100,1],
+      ["dense",21,1,27,1,4,2,32,1,26,1,10,1,4,1,17,1,77,1],
+      ["density",52,3,44,1,14,1,8,2,104,1,1,1],
+      ["deny",95,1,18,1,5,1,65,1,22,1,4,1],
+      ["depart",56,1,71,1,56,1,41,1],
+      ["departure",130,1,29,1,13,1],
+      ["depend",6,2,20,1,6,1,10,1,6,1,8,2,10,1,9,1,5,1,1,1,5,1,3,1,4,2,9,1,6,1,8,2,1,1,11,1,15,1,4,1,3,1,28,1,21,1,19,1],
+      ["depict",23,1,2,1,4,2,69,1,11,2,14,1,13,1,13,1,73,1],
+      ["deplete",201,1],
+      ["depletion",96,1,104,5],
+      ["deploy",133,1,93,1],
+      ["deposit",21,1,19,1,7,1,32,3,29,2,13,1,44,1,31,7,14,3,8,2],
+      ["depress",3,1,14,1],
+      ["depression",17,1,3,1,74,1,38,1,23,1],
+      ["deprive",94,2,91,2],
+      ["derive",3,1,5,1,1,1,48,1,8,1,31,1,11,1,8,1,7,1,2,1,43,2,23,1,10,1,1,1,11,2,2,1,4,1],
+      ["descend",68,1,71,1],
+      ["describe",1,1,7,1,2,1,1,1,1,1,4,1,1,2,6,1,3,3,8,1,2,1,3,1,3,1,3,1,2,1,4,1,3,1,2,1,2,1,5,1,1,2,1,1,2,1,5,1,1,1,7,1,7,1,6,1,1,1,2,1,1,2,1,1,13,2,5,1,2,1,7,1,4,1,10,1,5,1,2,2,3,2,1,1,8,1,9,1,16,2,5,1,8,2,1,1,12,1,2,1,1,1,4,1,1,1,2,1,2,1,3,1],
+      ["desert",10,2,25,1,13,1,2,1,20,7,9,1,10,1,1,3,8,1,11,1,14,2,1,9,35,2,6,8,12,1,18,1,28,1,1,1],
+      ["deserve",7,1,2,1,107,1,21,1,71,1],
+      ["design",1,11,4,4,3,10,3,2,1,3,1,2,5,1,2,1,3,1,6,1,2,1,3,2,10,11,2,2,7,27,10,7,3,1,2,1,5,2,7,1,2,4,15,1,16,1,1,1,4,4,2,14,1,1,5,1,3,2,5,2,2,2,4,7,3,1,7,1,1,1,2,1,1,1,2,2,3,3,2,4,5,1,3,1,1,3,3,2,4,1,2,1,10,1,5,1,1,8,19,1,1,1,3,1,3,1],
+      ["desirable",22,1,41,1,35,1,43,1,43,1],
+      ["desire",17,1,24,1,2,1,34,1,15,1,20,1,37,1,22,1,1,1,6,1,31,1,15,1],
+      ["desperate",100,1],
+      ["despite",10,1,2,1,2,1,1,1,1,1,3,1,1,1,3,1,7,1,3,1,2,1,5,1,1,1,2,1,5,1,10,1,6,1,5,1,6,1,1,1,1,1,1,1,15,1,2,1,14,2,2,2,2,1,1,1,4,1,8,1,11,2,3,1,1,1,3,2,1,1,4,1,1,1,1,1,2,1,2,1,2,1,4,1,6,1,6,1,1,1,8,2,1,1,8,1,1,2,2,2,4,1,5,1,1,1,4,1,4,1,4,1,5,2,4,1],
+      ["destination",13,1,72,1,36,2,9,1,34,1,41,1],
+      ["destiny",157,1],
+      ["destruction",88,1,106,1],
+      ["destructive",35,1,89,1,17,1,32,1],
+      ["detach",118,1,93,1],
+      ["detail",30,3,10,2,1,1,12,1,7,1,10,3,1,2,5,1,2,3,26,4,1,1,6,1,12,1,7,1,21,1,20,2,2,2,2,1,3,1,4,1,1,1,3,1,10,1,5,1,14,2,9,1],
+      ["detect",14,1,3,1,7,1,13,1,6,1,22,3,4,1,2,2,8,1,42,1,33,4,1,1,3,1,1,1,15,1,1,1,2,2,3,2,10,1,14,1],
+      ["detective",109,21],
+      ["deter",65,2,93,3,66,1],
+      ["deteriorate",82,1,36,1,15,1,5,1,59,1,1,1,4,1],
+      ["deterioration",3,1,188,1,1,1,17,1,5,1],
+      ["determine",8,1,8,1,8,1,4,1,20,1,12,1,7,1,2,2,6,2,4,1,2,1,14,1,6,1,2,1,1,1,1,1,3,2,2,1,13,1,12,1,5,1,7,1,1,1,8,1,5,2,10,1,3,3,6,1,3,1,7,1,2,1,4,1,8,1,14,1,6,1,1,2],
+      ["detrimental",76,1,128,1],
+      ["devalue",148,1],
+      ["devastate",48,1,57,1,34,1],
+      ["devastating",143,1,30,1,50,1],
+      ["develop",3,1,1,2,3,2,1,2,3,2,1,1,3,3,1,3,3,5,7,1,2,1,1,2,2,1,6,1,1,2,1,1,1,1,4,2,2,1,5,1,7,1,4,7,5,4,6,2,1,1,2,2,1,1,2,3,1,1,1,1,1,1,1,1,5,1,1,3,3,1,2,1,3,2,4,1,4,2,1,1,1,2,3,2,2,3,1,1,2,1,1,1,1,1,1,2,2,1,2,2,2,2,6,1,1,1,2,2,1,3,1,1,1,2,4,1,2,1,3,2,2,2,9,2,2,1,1,1,1,2,1,1,1,2,2,2,2,2,4,1,5,1,2,1,1,2,2,1,3,1,1,2,1,2,1,7,3,1,2,1,2,1,1,2,1,5,2,1,1,3,3,1,2,2,2,1,1,1,3,1,2,1,6,3,4,1,1,1,2,2,1,1,1,1],
+      ["device",13,3,5,1,11,1,5,1,9,2,7,1,3,1,7,1,2,1,1,1,1,1,8,1,1,1,6,1,1,1,2,2,3,1,9,2,3,1,16,1,13,1,28,1,18,2,18,1,7,1,22,1,1,1],
+      ["devise",28,1,4,1,12,1,20,1,8,1,7,1,50,1,16,1,1,1,13,1,12,1,3,1,10,1,6,1,13,1],
+      ["devote",71,2,7,2,27,1,35,1,27,1,23,1,18,1,4,1,3,1],
+      ["diagnose",4,1,54,1,22,1,26,1],
+      ["dialect",14,9,81,1,112,3],
+      ["diameter",226,1],
+      ["differ",2,1,5,1,10,1,7,1,25,1,14,1,7,1,58,1,1,1,1,1,14,1,9,1,6,1,17,1,2,1,12,1,14,1,12,1],
+      ["differentiate",1,1,224,1],
+      ["diffuse",17,1],
+      ["digest",59,2,54,1,1,1,11,1,14,1,77,1],
+      ["digestive",125,1,12,1,2,1,34,1],
+      ["digital",30,2,65,2,9,3,40,1,57,1,5,1,13,1],
+      ["dimension",7,2,115,2,40,1,5,1,45,1],
+      ["dimensional",30,3,34,2,5,1,29,2,11,1,64,1],
+      ["diminish",162,1,26,1,36,1],
+      ["dioxide",5,2,47,1,54,1,23,2,35,6,31,1,31,2],
+      ["direction",1,1,35,1,32,1,1,2,16,1,12,1,24,3,2,1,7,7,8,1,21,1,6,1,3,1,12,1,8,1,7,1,3,1,4,1,23,1],
+      ["disable",100,2],
+      ["disadvantage",8,2,11,1,185,1,20,1],
+      ["disagree",24,1,13,1,23,1,52,1,32,1,34,1,7,1,28,1],
+      ["disappointing",36,1],
+      ["disapprove",105,1],
+      ["disastrous",102,1,50,1,18,1,29,1],
+      ["discard",1,1,50,1,116,1,45,1],
+      ["discerning",32,1],
+      ["discharge",224,1],
+      ["discipline",11,2,30,1,40,1,5,1,9,2,45,1,10,1,18,1,32,1,11,1],
+      ["disclose",69,1,87,1],
+      ["discontinue",28,1],
+      ["discount",20,1,133,1],
+      ["discourage",39,1,26,1,17,1,76,1,28,1,28,1],
+      ["discover",19,1,2,1,1,1,1,5,13,2,1,1,1,1,2,2,1,1,1,1,3,2,2,1,3,2,7,2,1,1,3,1,6,3,1,1,3,1,6,3,2,1,4,1,7,1,1,1,15,1,1,1,6,1,1,1,2,1,7,2,4,1,1,2,7,1,4,2,10,1,2,1,9,1,1,1,6,1,5,1,3,1,2,3,2,1,1,1,5,2,5,1,2,1,8,1,4,1,6,1,2,1,5,2,1,1],
+      ["discovery",3,1,4,1,10,1,10,2,14,1,4,3,2,3,11,1,3,3,3,1,1,1,3,1,19,1,4,2,9,2,8,1,7,1,1,1,7,3,2,1,2,1,12,1,5,1,5,3,11,2,9,1,6,1,2,1,8,1,2,1,5,1,23,1,8,1],
+      ["discredit",221,1],
+      ["discrepancy",49,1],
+      ["discriminate",152,1,14,1,38,3],
+      ["disdain",4,1],
+      ["disenchantment",41,2],
+      ["disillusion",151,1],
+      ["disintegrate",19,1,6,1],
+      ["dismantle",169,1],
+      ["dismiss",150,1,13,1],
+      ["disorder",43,2,29,1,9,2,2,2,11,2,12,2,98,4,16,1],
+      ["dispense",53,1],
+      ["dispiriting",73,1],
+      ["displace",96,1,34,1,3,1,27,1],
+      ["display",13,1,10,1,24,1,6,1,7,3,10,1,36,1,13,1,32,1,4,2,19,1,10,1,14,1,18,2,9,1],
+      ["disposal",112,1,22,3,28,1],
+      ["dispute",54,1,6,1,51,1,45,1,32,1,19,1,2,1,1,2,1,1,2,1],
+      ["disregard",187,1,22,1],
+      ["disrupt",126,1,98,1],
+      ["disruption",73,1],
+      ["disruptive",225,1],
+      ["dissemination",101,1],
+      ["dissolve",15,1,4,2,4,1,4,1,32,1,155,1],
+      ["distance",52,2,6,1,7,1,26,1,6,1,1,1,13,1,10,1,9,1,2,1,8,1,14,2,5,1,5,1,4,2,12,3,36,2,5,1,3,1],
+      ["distinct",14,1,12,1,13,2,12,1,6,1,26,1,11,1,31,1,19,1,41,1,5,1],
+      ["distinctive",14,1,15,1,3,2,52,1,10,2,9,1,7,1,55,1,49,1],
+      ["distinguish",1,1,3,1,6,1,1,1,35,1,22,1,33,1,9,1,12,1,58,1,6,2,18,3,3,1],
+      ["distortion",64,1],
+      ["distract",114,1,32,2,6,1,19,1],
+      ["distraction",43,1,83,6],
+      ["distribute",7,1,1,1,119,1,20,1,18,1,1,2,53,1],
+      ["distribution",27,1,41,1,1,1,30,1,38,1,3,1,13,1,66,1,3,1],
+      ["district",105,2,7,1,82,1,23,2,1,1],
+      ["disturb",20,1,21,1,48,1,5,1,49,1,29,1,38,1],
+      ["disturbance",33,1,146,1,3,1],
+      ["diverse",10,2,12,1,18,1,5,1,104,1,1,1,36,2],
+      ["diversify",45,1],
+      ["diversity",10,2,1,1,11,4,36,1,81,1,2,1,21,1,24,3],
+      ["divert",35,1,15,1,46,1,41,1],
+      ["divide",2,1,5,2,5,1,13,1,14,2,12,1,33,2,1,1,38,1,3,2,13,1,28,1,9,1,5,1,3,2,17,1,11,1,2,1,6,1],
+      ["division",8,1,75,1,103,1],
+      ["dizzy",161,1],
+      ["dock",66,1,47,2,10,1,88,1],
+      ["doctoral",154,1,42,1],
+      ["document",11,1,4,1,28,1,27,1,24,1,1,2,12,1,30,1,42,1,8,1],
+      ["documentation",16,1],
+      ["dolphin",14,1,38,1,4,1,42,2,71,1],
+      ["domestic",10,3,9,1,43,1,43,1,4,1,8,3,13,1,17,1,19,1,56,1,1,3],
+      ["domesticate",22,1,10,1,47,1,22,1,38,1,19,1,64,2],
+      ["dominant",41,1,5,1,2,3,33,1,14,1,44,1,77,1],
+      ["dominate",1,1,40,1,7,4,8,1,4,2,8,1,5,1,23,1,7,1,12,1,9,1,7,1,5,1,2,1,9,1,47,1,8,1,6,1],
+      ["domination",8,1,28,1],
+      ["donation",28,2,94,1],
+      ["doom",151,1,41,1],
+      ["dose",137,1,40,1,24,2],
+      ["dot",46,1,24,2,27,2],
+      ["downpour",201,1],
+      ["draft",15,1,160,1],
+      ["drainage",35,1,34,2],
+      ["dramatic",5,1,17,1,4,1,35,1,14,1,2,1,6,1,5,1,2,2,3,1,3,1,3,1,1,1,26,1,15,1,36,1,5,1,40,1],
+      ["drawback",0,1,19,1,142,1],
+      ["drill",79,3,52,1,60,1,19,1],
+      ["droplet",62,1],
+      ["drought",5,1,85,1,34,1,14,1,5,1,59,1,19,1,3,1],
+      ["dubious",40,1,138,1],
+      ["due",0,1,12,2,14,1,6,2,16,1,5,1,2,1,3,1,7,1,5,1,6,1,12,1,15,1,3,1,9,1,6,1,5,1,9,1,3,1,23,1,18,1,5,1,1,1,17,1,14,1],
+      ["dump",134,2],
+      ["duplicate",0,1],
+      ["durable",29,2,100,2],
+      ["duration",3,4,10,1,8,1,45,1],
+      ["dusk",43,1,60,1],
+      ["dwell",120,1,73,1],
+      ["dweller",10,1,53,1,19,1,7,1,23,1,35,1,44,1],
+      ["dwindle",138,1,64,1],
+      ["dynamic",2,1,10,2,44,2,71,1,25,1,30,1],
+      ["earthquake",117,1,79,4],
+      ["easy-going",225,1],
+      ["eccentric",34,1,7,1,68,1,63,1],
+      ["ecological",14,1,11,1,65,1,30,2,7,1,6,1,5,2,3,2,46,1,15,2,7,1],
+      ["ecology",135,1,8,1,11,1,25,1],
+      ["economic",8,1,15,2,10,5,14,1,1,1,1,2,6,1,1,1,7,1,2,1,4,1,26,1,6,4,11,1,6,1,6,3,5,1,5,1,3,2,3,1,7,2,9,2,6,1,1,1,16,1,7,1,7,1],
+      ["ecosystem",16,1,29,1,3,9,72,1,4,2,17,9,3,1,35,1,43,1,1,1],
+      ["edible",5,1,11,1,34,1,11,1,28,1,13,1,53,1,44,1],
+      ["effect",14,1,2,1,1,1,1,1,2,3,1,1,1,1,2,2,1,1,3,1,2,2,3,3,1,4,2,3,1,2,4,2,7,1,8,1,1,1,6,1,1,1,7,1,1,9,4,3,3,1,1,1,6,1,4,1,4,1,2,1,3,1,1,3,1,2,1,1,4,1,8,1,8,3,15,2,3,1,1,1,7,1,4,2,1,2,2,4,1,1,2,2,3,5,2,1,1,2,3,1,3,1,1,2,5,3,2,1,3,1,5,1,7,1,3,1,3,1,1,3,12,1,1,1,11,5,1,1],
+      ["effective",1,1,11,1,12,1,13,1,13,1,3,1,8,1,1,2,10,3,2,1,24,1,6,1,8,2,10,1,25,1,3,1,2,2,10,1,12,1,23,1,23,1,4,1,2,1],
+      ["efficiency",36,1,3,1,4,1,9,1,54,1,16,1,4,2,2,1,21,1,48,1],
+      ["efficient",5,1,3,2,31,1,17,1,11,1,35,2,10,1,6,1,4,1,4,4,2,4,1,1,3,1,38,2,3,1,3,1,19,1,4,2],
+      ["effort",0,1,4,1,2,1,16,1,11,1,3,1,16,2,17,1,4,1,9,1,13,1,9,1,4,1,5,1,7,1,11,2,7,1,5,1,5,1,8,1,6,1,1,1,3,1,24,1,10,1,2,1,5,2,1,1,15,1],
+      ["eject",177,1],
+      ["elaborate",1,1,21,1,35,1,32,1,9,1,38,1,20,1,1,1,62,1],
+      ["elaboration",26,1,55,1],
+      ["elastic",119,1],
+      ["elbow",115,1],
+      ["electrical",19,1,40,1,1,1,9,1,25,2,22,2,10,1,50,1,18,1,26,1],
+      ["electronic",13,1,29,1,40,1,22,2,30,1,20,1,14,1,58,1],
+      ["element",8,1,3,1,1,1,14,1,1,1,25,1,2,1,9,1,6,1,8,1,7,1,7,1,4,2,2,1,7,1,16,3,11,1,5,1,4,1,10,2,14,1,6,1,37,1,11,2,2,1,6,1],
+      ["elevate",0,1,9,1,32,1,53,1],
+      ["eliminate",22,1,5,1,46,1,2,1,27,2,36,1,55,1,6,2,1,1,2,1],
+      ["elite",50,1,5,1,56,1,86,1],
+      ["elucidate",160,1],
+      ["elusive",47,1,97,1,36,1,18,1,25,1],
+      ["embankment",35,1],
+      ["embark",205,1],
+      ["embassy",0,1],
+      ["embed",27,1,30,1,18,1,11,1,28,1,11,1,14,1,12,1,36,1],
+      ["embody",32,1,25,1,7,1,106,1],
+      ["embrace",6,1,58,1,9,1,18,1,8,1,53,1,5,1,48,1],
+      ["embryo",15,1],
+      ["emerge",2,1,7,1,3,2,12,1,2,1,4,1,6,1,3,1,2,2,6,1,1,1,2,1,15,1,4,2,6,1,9,1,6,1,9,1,1,1,10,1,3,1,27,1,12,1,7,1,2,1,10,1,3,1,14,1,1,1,32,1,1,1],
+      ["emergency",41,1,53,1,39,2,64,1],
+      ["emeritus",196,1],
+      ["eminent",116,3,62,1,15,1],
+      ["emission",17,1,48,2,3,1,61,2,4,1,1,1,61,2],
+      ["emit",65,4,3,1,1,1,33,1,62,2,10,2,25,1],
+      ["emotion",17,5,1,1,8,1,31,1,1,1,2,23,11,4,3,2,4,4,4,2,18,1,6,1,8,2,32,1,2,3,2,4,5,2,1,1,19,4,23,1,6,1,4,2],
+      ["emotional",26,1,10,2,18,2,6,1,3,2,8,3,7,2,4,2,4,2,6,2,8,3,4,2,2,3,8,2,6,2,22,1,8,2,5,7,12,1,7,1,12,1,20,1,2,2,4,1],
+      ["emperor",0,4,23,1,8,1,33,1,13,5,10,1,1,1,19,1,5,1,17,1,40,2,25,1,25,1],
+      ["emphasis",2,1,4,1,4,1,1,5,9,1,8,1,8,1,18,2,19,1,13,3,5,1,18,1,13,1,28,1,1,1,16,2,3,3,2,1,40,2],
+      ["emphasize",74,1,24,1],
+      ["empire",39,1,12,1,16,1,10,1,2,1,8,2,12,1,9,1,21,3,40,1,50,1],
+      ["empirical",75,1,53,3],
+      ["employ",5,1,10,1,8,1,3,2,5,2,2,1,3,1,1,1,30,1,1,1,11,1,8,1,30,1,1,1,2,1,36,1,6,1,6,2,15,1],
+      ["emulate",167,2,45,2],
+      ["enable",7,2,3,1,4,1,30,1,6,1,7,1,2,1,1,1,2,1,7,3,23,1,1,1,28,1,4,1,5,1,11,1,13,1,5,2,7,1,7,1,6,1,1,1,3,1,2,1,21,1,2,1,18,1],
+      ["encase",218,1],
+      ["enclose",21,1,97,1,54,1,45,1],
+      ["enclosure",10,1],
+      ["encode",176,1],
+      ["encompass",47,1,64,1,29,1],
+      ["encounter",0,1,7,1,4,1,2,1,8,1,5,1,15,1,22,2,2,1,6,2,7,2,11,1,10,1,59,1,16,1,31,1,1,1,4,1],
+      ["encourage",7,1,1,2,3,3,1,1,21,1,2,1,6,1,14,1,17,1,4,1,9,1,3,1,2,1,2,1,6,1,1,3,12,1,6,1,18,1,10,1,3,1,18,1,17,1,11,2,9,1,8,2,3,1],
+      ["encroach",69,1,19,1],
+      ["endanger",10,1,6,1,16,2,63,2,46,1,3,2,13,1,59,1,7,1],
+      ["endeavour",6,1,131,1,3,1,10,1,12,1],
+      ["endure",35,1,13,1,7,1,46,1,28,2,16,1,12,1,4,1,27,2,15,1,22,1],
+      ["energetic",163,1],
+      ["enforce",124,1,23,1,16,1],
+      ["engage",15,2,5,1,14,1,3,2,4,1,3,1,30,1,6,1,25,1,46,2,1,1,4,1,14,2,4,1,30,1,11,1,5,1],
+      ["enhance",0,1,6,1,11,1,48,1,33,1,2,2,4,1,37,1,11,1,24,1,22,1,8,1,15,1,3,1],
+      ["enjoyable",11,1,15,1,32,1,13,1,87,2],
+      ["enlarge",22,1,19,1],
+      ["enlighten",143,1],
+      ["enormous",19,1,13,1,32,1,2,1,7,1,29,1,10,1,36,1,3,1,3,1,10,2,14,1,2,1,7,1,9,1,3,1,19,1,4,1,2,1],
+      ["enquiry",86,1],
+      ["enrich",11,1,122,1,13,1,52,1],
+      ["enroll",92,1,44,1],
+      ["enrolment",122,1],
+      ["ensue",69,1,69,1,64,1],
+      ["ensure",8,1,11,1,13,2,10,1,2,1,10,1,11,1,5,1,4,1,12,1,3,1,2,1,6,1,6,1,15,2,2,2,8,2,3,1,20,1,2,3,10,4,10,1,2,1,12,1,8,1,29,2],
+      ["enterprise",13,1,7,1,12,1,81,1,27,1],
+      ["entertain",18,1,128,2,43,1],
+      ["entertainment",114,1,56,1],
+      ["enthusiasm",41,2,25,1,22,2,39,1],
+      ["enthusiastic",22,1,50,2,147,1,2,1],
+      ["entice",34,1,31,1],
+      ["entire",26,1,4,1,15,1,15,1,10,1,6,1,40,1,4,1,8,1,3,1,2,1,8,2,7,2,1,1,14,1,1,1,1,1,15,1,2,1,43,1],
+      ["entitle",62,1,28,1,9,1,32,1],
+      ["entrepreneur",31,1],
+      ["entrepreneurial",170,1],
+      ["entrust",13,2,143,1],
+      ["environment",13,1,1,4,2,1,6,1,11,2,2,1,5,1,3,1,6,1,1,2,2,1,2,1,7,1,2,1,11,1,15,1,2,1,1,1,9,1,1,1,10,1,3,1,2,1,3,8,2,1,2,1,2,1,1,2,2,1,5,3,1,6,3,1,11,1,1,2,1,1,4,1,9,2,3,3,6,4,4,2,2,2,2,1,1,1,4,1,1,1,6,3,2,4,3,1,1,1,3,1,5,1,2,2,3,3,8,1,4,1,2,1],
+      ["epidemic",65,1,36,2,36,2,83,1],
+      ["equal",1,1,5,1,6,1,34,1,1,1,9,1,7,1,15,1,23,1,10,1,8,1,3,2,14,1,44,1,4,3,10,1,3,1],
+      ["equation",167,1,45,1],
+      ["equator",23,1,22,1,19,1],
+      ["equip",11,1,2,1,65,1,12,1,7,1,23,1,1,1,1,1,79,1,16,2],
+      ["equipment",7,1,10,1,11,2,31,1,9,1,23,1,6,3,26,1,18,1,18,1,7,1,25,1,3,1],
+      ["equity",128,1],
+      ["equivalent",9,1,38,1,5,1,9,1,5,1,6,1,13,1,1,1,69,1,1,1,13,1,19,1],
+      ["era",9,1,2,1,18,1,37,1,22,1,11,1,27,1,40,2,22,1],
+      ["erode",25,1],
+      ["erosion",21,1,12,1,57,1,6,1,6,1,22,2,9,1,63,1,3,1],
+      ["eruption",25,1,62,1],
+      ["escalate",133,1],
+      ["escalator",44,1,19,1],
+      ["essay",111,2],
+      ["essence",50,1,75,1],
+      ["essential",1,1,2,1,10,1,4,1,7,1,23,1,8,1,2,1,1,1,33,1,3,2,10,1,18,3,9,1,15,1,1,1,3,1,2,1,2,1,9,1,4,1,8,1,8,1,2,2,22,1,2,1,3,1],
+      ["establish",13,1,15,2,3,1,3,1,2,1,5,2,7,1,8,1,5,1,8,1,8,2,4,1,3,1,4,4,9,1,6,1,1,1,6,1,2,1,5,1,6,1,10,1,3,1,5,1,2,1,4,2,3,1,3,1,2,1,14,1,5,1,4,3,1,1,7,1,1,3,1,1,3,2,7,1,2,2],
+      ["estate",26,1,45,1,70,1,31,1],
+      ["esteem",47,1],
+      ["estimate",42,4,1,1,1,2,31,2,16,1,5,1,6,1,5,1,3,1,4,1,23,1,5,1,14,2,10,1,6,2,21,1,3,2,3,1,11,2,9,1,1,1],
+      ["estuary",66,1,75,1],
+      ["eternal",104,1],
+      ["ethical",11,1,148,1,16,1],
+      ["evacuate",35,1],
+      ["evaluate",6,2,2,1,52,1,23,1,73,1,6,1,4,1,55,1],
+      ["evaluation",177,1,1,1,14,1],
+      ["evaporate",65,2],
+      ["event",17,1,5,1,4,2,4,1,7,2,4,2,23,1,2,1,15,1,36,1,25,2,9,1,1,1,4,3,25,1,3,2,5,1,4,1,3,5,14,1,4,1],
+      ["evidence",2,1,4,2,5,1,3,1,2,1,1,2,4,2,1,1,1,1,4,2,12,2,1,12,1,1,2,2,4,3,3,6,1,1,7,2,2,1,8,1,7,1,1,3,1,1,6,1,4,1,3,3,10,1,6,1,2,1,2,1,1,1,4,2,6,2,1,1,1,1,5,1,3,1,8,1,5,1,3,2,2,1,3,1,1,2,11,1,3,2,5,2,2,1,2,1,1,3,1,4,7,2,2,2,3,1,2,2,1,1,3,4,11,2,1,2,1,3,1,3,1,2,1,2,4,1,6,1,4,1],
+      ["evoke",71,1,7,1,96,1,32,1],
+      ["evolution",1,1,21,1,23,3,7,1,7,1,1,1,7,1,16,2,11,1,12,1,9,1,5,1,7,1,7,1,5,2,11,1,5,2,3,1,6,1,21,2,1,1,19,1,3,4,14,4],
+      ["evolve",9,2,4,1,1,2,3,1,4,1,1,1,11,1,13,1,1,1,13,2,5,1,2,2,22,2,1,1,25,1,5,1,1,3,1,3,5,2,23,1,1,1,4,3,3,2,7,1,2,2,5,2,1,1,4,2,8,2,23,1,4,2,7,1,4,1],
+      ["exacerbate",153,1],
+      ["exact",30,1,45,1,11,1,3,1,8,1,7,1,19,2,45,1],
+      ["exaggerate",168,1,7,1,3,1,29,1],
+      ["examine",7,1,8,1,15,1,6,1,7,1,2,2,9,2,3,1,3,1,15,1,7,1,3,1,6,1,22,2,10,1,16,2,13,2,8,1,2,1,12,1,7,1,5,1,3,1,3,2,9,1,7,1],
+      ["excavate",27,1,4,1,19,2,17,1,102,2,41,1],
+      ["excavation",31,1,9,1,10,4,37,1,82,1],
+      ["exceed",24,1,45,1,44,1,7,1,1,1,12,1,33,1,13,1,47,1],
+      ["excellent",3,1,8,1,5,1,51,1,32,1,14,1,4,1,5,1,40,1,18,1,15,1,21,1],
+      ["except",68,1,57,1,37,1,15,1],
+      ["exceptional",2,1,4,2,22,1,13,1,177,1],
+      ["excess",79,1],
+      ["excessive",82,1,31,1,11,1,18,1,28,1,4,1],
+      ["exchange",47,3,3,1,17,1,15,1,3,7,9,1,10,5,13,1,11,2,19,1,9,1,65,2],
+      ["excitement",0,1,9,1,14,1,32,1,8,2,24,1,74,1],
+      ["exclude",41,1,8,1,129,1],
+      ["exclusive",47,1,109,1,51,1],
+      ["exclusively",10,1,44,1,19,1,4,1,10,1,21,1,19,1,14,1,21,1,44,1],
+      ["excursion",26,1],
+      ["execute",34,1,108,1,27,1],
+      ["execution",171,1],
+      ["exhaust",55,1,35,1,23,1,104,1,5,1],
+      ["exhaustion",220,1],
+      ["exhaustive",179,1],
+      ["exhibit",98,1,32,1,24,1,31,1,12,1,8,1],
+      ["exhibition",11,1,12,1,11,1,19,1,2,14,81,4,5,1,10,1,19,6,35,14],
+      ["exist",2,1,6,1,13,1,1,1,4,1,5,1,3,1,4,1,2,1,5,1,1,1,4,1,4,1,2,1,6,1,6,2,5,1,2,1,2,1,7,2,14,1,2,1,9,1,11,3,8,1,16,2,1,1,1,3,3,2,4,2,8,1,6,1,2,1,1,1,7,1,9,1,17,1,1,1,2,1,1,1,2,1,1,1,1,1,1,1,5,1,1,2,2,1,6,2],
+      ["existence",2,1,4,1,28,1,11,1,6,1,13,1,8,1,12,1,3,1,13,1,9,1,37,1,31,1,7,2,1,2,5,1,25,1,8,2],
+      ["exotic",0,1,38,1,21,1,14,1,26,1,24,2,12,2,1,1,5,1,52,1],
+      ["expand",19,1,16,1,1,1,12,1,11,1,21,1,35,1,2,1,3,1,2,1,2,1,4,2,4,1,9,1,1,1,28,2,24,2,29,1],
+      ["expansion",84,1,12,1,3,1,89,1,6,2,28,1],
+      ["expectancy",137,1],
+      ["expectation",20,2,8,1,27,1,31,1,76,1,4,1,27,1,26,1,7,1],
+      ["expedition",91,3,32,3,21,1,5,4,43,1],
+      ["expel",173,1],
+      ["expense",48,1,11,1,14,1,13,1,36,1,19,1,1,1,65,1,3,1],
+      ["explode",22,1,72,1],
+      ["exploit",9,1,3,1,10,1,40,1,57,1,2,1,6,1,1,1,27,2,20,1,8,1],
+      ["exploitation",23,1,99,1,57,1],
+      ["exploratory",130,2],
+      ["explore",1,1,11,2,1,2,4,1,1,1,3,1,2,1,10,1,1,1,2,1,12,1,47,1,3,1,32,1,16,1,6,1,2,1,5,1,1,1,11,1,9,1,1,1,4,1,21,2],
+      ["explorer",1,4,116,1,32,2,16,1,22,4,5,2,31,1],
+      ["explosive",79,1,140,1],
+      ["export",16,2,80,1,21,12,45,1,32,10],
+      ["expose",18,2,5,1,22,1,20,1,9,1,5,1,11,1,2,2,17,1,15,1,1,1,26,1,23,2,36,1,11,1,3,1],
+      ["exposure",30,2,8,1,1,1,5,1,11,1,19,2,39,1,1,2,29,1,15,1,46,1],
+      ["express",4,1,7,1,15,1,34,2,7,1,4,1,3,2,2,1,7,1,22,1,35,1,6,4,2,1,9,1,14,1,4,1,1,1,1,1,1,1,9,1,17,1,4,1,11,1],
+      ["extend",24,3,2,1,13,2,2,2,6,1,3,1,23,1,2,1,26,1,21,1,11,1,34,1,7,1,12,1,19,1,7,1,7,1,2,1,2,1,2,1],
+      ["extension",3,1,18,1,3,1,127,3,70,1],
+      ["extensive",8,1,6,1,68,1,2,1,33,1,7,1,24,1,21,1,4,1,21,1],
+      ["extent",4,2,5,1,59,1,3,2,4,1,6,1,3,1,5,1,5,1,42,1,5,1,14,1,23,1,8,1,11,1,26,1],
+      ["exterior",31,1,13,3,126,1],
+      ["external",8,1,20,1,25,2,45,1,12,1,36,1,3,1,2,1,11,2,11,1,48,1],
+      ["extinct",10,1,15,1,2,1,18,1,30,2,28,1,7,2,41,1,36,2,23,2,13,2],
+      ["extinction",27,3,18,2,30,7,20,2,30,1,13,1,6,3,43,3,15,1,8,5],
+      ["extinguish",68,1],
+      ["extol",55,1],
+      ["extra",14,1,6,1,39,3,33,1,10,1,13,1,2,1,11,1,3,1,22,1,38,2,8,1],
+      ["extract",16,1,22,1,13,1,28,2,40,3,2,1,4,1,2,2,31,1,21,1],
+      ["extraordinary",3,1,20,1,55,1,13,1,20,1,25,1,1,1,8,1,10,1,6,1,24,1,11,1,1,1,6,1,13,1],
+      ["extravagance",167,1,45,1],
+      ["extreme",10,2,19,1,20,1,42,2,2,1,6,1,42,1,23,1,6,1,2,1,3,1,14,1,15,1,5,1],
+      ["extremely",20,1,36,1,3,1,2,1,1,1,3,2,42,1,12,2,22,1,28,1,2,1,3,1,3,1,39,2,2,1],
+      ["extrovert",85,1,87,1],
+      ["eyesight",42,1,63,1],
+      ["fabulous",45,1,32,1],
+      ["facade",63,3],
+      ["facial",3,1,51,1,3,1,3,20,14,1,74,3,27,2,23,1,17,1],
+      ["facilitate",26,1,144,1,6,1],
+      ["facility",36,1,1,1,50,1,33,1,2,2,12,2,6,1,51,2],
+      ["factual",2,1,34,1],
+      ["faculty",11,2,52,1,59,2],
+      ["fade",9,1,20,1,47,1,21,1,14,1],
+      ["fair",72,1,16,1,60,1,13,2],
+      ["fairly",46,1,4,1,68,1,26,1,18,1],
+      ["faith",72,1,116,1],
+      ["fake",1,1,46,1],
+      ["fantastic",9,1,62,1],
+      ["fantasy",157,1,25,1],
+      ["fare",55,1,97,1,5,1,53,1],
+      ["fascinate",40,1,19,1,38,1,1,1,48,2,14,1,20,1],
+      ["fascinating",7,1,2,1,34,1,89,1,7,1,12,1,3,2,28,1,10,1,12,1],
+      ["fashion",6,1,25,1,11,1,18,1,26,1,5,1,25,1,11,1,1,1,12,13,20,1,7,1,4,1,12,1,21,1,3,5,5,1,5,1,2,1],
+      ["fasten",132,1],
+      ["fatal",94,1,99,1],
+      ["fate",25,1],
+      ["fatigue",94,1,12,1,94,7],
+      ["fault",28,1,41,1,76,1,7,1,30,1,14,1,7,1,12,1],
+      ["fauna",45,2,58,1,41,1,43,1,6,2],
+      ["favour",1,2,4,1,3,1,2,1,11,1,2,1,6,1,12,1,6,1,7,1,15,1,2,1,5,1,2,1,6,1,3,1,11,1,14,1,2,1,21,2,36,1,8,1,8,1],
+      ["favourite",76,4,9,1,3,1,37,1,2,1,39,1,59,1],
+      ["feasible",142,2,48,1],
+      ["feather",1,3,37,1,65,2,24,1],
+      ["feature",3,2,7,1,1,1,5,1,2,1,3,1,7,1,3,1,3,1,11,1,3,1,5,2,8,1,2,1,6,1,1,1,12,2,1,1,3,2,14,3,9,1,1,1,4,1,1,1,5,2,1,1,3,1,6,1,6,2,9,1,1,1,1,1,20,1,3,1,3,1,4,1,5,1,1,4,17,2,3,1,2,1,3,1,2,2,2,1,2,1,2,1,7,1,1,2],
+      ["federal",55,1,35,1,66,1],
+      ["feeble",22,1],
+      ["feed",7,3,3,3,2,1,12,7,21,1,3,4,3,1,1,2,7,1,22,1,8,1,10,2,3,2,8,1,11,1,6,1,3,1,3,5,6,2,4,1,11,1,2,1,17,1,26,2,17,2,6,1,1,2,1,1],
+      ["feedback",3,1,79,1,81,3],
+      ["female",10,1,4,4,10,1,25,1,18,1,35,1,1,2,6,2,1,4,5,1,4,1,19,1,5,1,5,3,6,1,38,2,7,1,3,1,14,3],
+      ["fertile",109,1,24,1,2,1,3,1,17,1,22,1,25,1],
+      ["fertilise",51,1,45,1,47,1,58,3],
+      ["fibre",19,4,58,2,30,3,6,1,6,2,21,5,39,2],
+      ["fiction",4,1,22,1,83,6,55,2,13,1,5,4,6,4,29,1,9,1],
+      ["fierce",87,1,4,1],
+      ["figure",6,1,3,6,11,1,9,1,2,1,2,1,3,1,5,1,2,1,16,2,42,1,3,1,29,1,7,1,17,1,8,1,13,1,3,1,9,1,10,1,13,1,2,1,10,1],
+      ["filter",0,1,62,15,6,3,11,1,55,1,17,1],
+      ["finance",128,2,66,1],
+      ["fingerprint",145,4,12,1,46,4],
+      ["finite",200,1],
+      ["firm",6,1,5,1,43,1,16,1,16,1,19,1,17,2,16,1,2,1,16,4,5,1,1,2,32,1,7,2,1,1],
+      ["fitness",43,1,4,1,174,1],
+      ["fitting",116,1,1,1,6,1,59,1],
+      ["flap",59,2,100,1],
+      ["flash",89,1,25,1],
+      ["flat",5,1,24,1,12,1,5,2,6,1,7,1,10,1,38,1,5,1,8,1,37,1,57,1],
+      ["flavour",86,1,21,1],
+      ["flaw",6,1,17,1,97,1,28,1,7,1,7,1,31,1,15,1,14,1],
+      ["flee",113,1,8,1,6,1,27,1],
+      ["fleet",123,1,26,1,19,2,7,1,17,1],
+      ["flexibility",54,1,38,1,65,1,6,1,23,1],
+      ["flexible",73,2,21,1,21,1,3,1,8,1,63,1,16,1],
+      ["flight",10,1,102,1,9,3,9,4,12,2,17,1,56,1,2,1],
+      ["flint",21,1,6,2],
+      ["flip",59,2,106,1],
+      ["flora",136,1,8,1],
+      ["floral",65,1,90,2],
+      ["flourish",25,1,25,1,59,2,26,1],
+      ["fluctuate",200,1],
+      ["fluctuation",73,1,2,1,42,1,4,1,11,1],
+      ["fluency",176,1],
+      ["foam",19,1,10,1],
+      ["focus",5,1,2,2,4,1,6,1,3,1,6,1,2,1,8,1,5,4,7,1,6,1,9,1,9,1,6,2,3,1,1,4,4,1,1,2,17,1,2,2,5,1,5,1,2,1,8,8,17,1,2,2,1,1,1,1,7,1,13,1,3,1,2,1,3,1,2,1,2,1,1,1,1,1,2,1,8,1,3,1,1,1,2,1,6,2,1,1,2,1,3,1,3,1,10,1],
+      ["foetus",3,1],
+      ["foil",53,1],
+      ["fold",59,1,48,1,6,1,30,1,4,1],
+      ["force",9,1,10,1,4,1,12,1,4,1,1,1,4,1,15,1,4,1,7,1,2,3,15,1,15,1,1,1,2,1,7,1,4,2,3,2,5,1,3,1,2,1,3,1,5,1,2,1,3,1,6,1,1,1,8,1,4,4,3,1,2,1,8,1,3,1,12,2,10,1,1,1,7,2,3,1,3,1,4,2,3,1,2,2],
+      ["forecast",13,1,47,1,61,1,29,1,6,1,37,1,8,3],
+      ["foremost",108,1,62,1],
+      ["forgo",5,1,173,1],
+      ["form",0,2,1,1,2,2,2,1,5,1,2,1,4,1,1,1,2,5,6,2,1,2,1,1,3,1,4,1,3,1,7,1,1,3,1,4,1,1,2,1,2,2,1,4,2,3,3,1,1,1,1,1,3,1,5,2,2,1,1,1,2,1,2,1,1,1,1,1,1,1,2,3,5,1,2,1,1,2,2,1,1,1,1,1,5,1,1,1,1,1,2,2,1,1,3,2,4,2,1,1,1,1,3,1,1,1,3,1,3,1,4,1,1,1,2,1,2,1,8,1,6,1,3,2,1,1,2,1,1,1,14,2,1,3,1,1,7,1,3,1,1,1,4,1,2,1,1,1,1,1,2,1,1,2,1,1,1,1,3,5,2,1,1,3,2,1,3,1,10,2,3,3,1,1,1,1,1,2,1,3,1,2,6,1,1,1],
+      ["formal",8,2,28,1,36,1,32,1,7,1,20,2,16,1,20,1,2,1,9,1,4,2,6,1,18,1,6,1],
+      ["formality",86,1],
+      ["format",95,1,31,1,75,1],
+      ["former",22,1,6,2,7,1,14,1,13,1,1,1,10,1,9,1,2,1,34,1,7,1,17,1,29,1,22,1,12,2,4,1,11,1],
+      ["formidable",52,1],
+      ["formula",33,1,115,3,2,1,51,1],
+      ["formulate",161,1,1,1],
+      ["forth",0,1,69,1,6,1,64,1,42,1,16,1,3,1,19,1],
+      ["forthcoming",168,1],
+      ["forum",87,1,83,1,36,1],
+      ["fossil",5,2,20,2,20,9,50,1,15,2,23,1,75,2,2,1,12,1,4,1],
+      ["foster",39,2,2,1,22,1,29,2,28,1,1,1],
+      ["foul",51,1,74,1,33,1],
+      ["foundation",28,1,3,1,6,4,3,1,10,1,21,1,7,1,9,1,8,2,21,1,6,1,6,1,9,2,5,1,8,1,10,1,21,1,5,1],
+      ["fraction",187,1],
+      ["fragile",201,1],
+      ["fragment",18,1,9,1,4,1,16,1,76,1,26,1,29,1,14,1,14,1,4,1],
+      ["fragrance",65,4,60,1],
+      ["frame",63,1,21,1,23,1,6,2,4,1,19,1,18,1,7,1,5,1,9,1],
+      ["frank",34,1,7,1,15,2,64,1,17,2,59,1],
+      ["fraud",72,1],
+      ["fraught",164,1],
+      ["freight",132,1,8,1],
+      ["frequency",3,1,34,1,28,1,62,1,14,1,4,2,9,4,7,3,4,1,2,2,13,4,10,2,13,2,9,2],
+      ["frequent",9,1,26,1,13,1,65,1,5,1,56,1],
+      ["friction",19,1,28,1,5,2],
+      ["front-line",6,1],
+      ["frontier",13,2],
+      ["frown",60,1],
+      ["frustrating",74,1,39,1],
+      ["frustration",74,1,88,1],
+      ["fuel",5,2,28,1,28,1,1,6,34,1,21,1,7,1,5,1,4,1,9,2,22,1,9,1,22,1,18,1,13,2],
+      ["fulfil",6,2,5,1,2,1,28,1,44,1,20,1,15,1],
+      ["fumes",134,1],
+      ["function",1,3,2,3,14,3,7,1,39,1,2,2,3,2,15,1,1,1,2,1,7,1,1,1,12,1,14,3,13,1,13,1,1,1,4,1,3,1,1,1,15,1,3,2,3,3,4,1,2,1,1,1,2,4,10,1,2,1,11,1,3,1,9,1,1,1,3,2],
+      ["fund",4,1,1,1,11,1,12,7,27,3,14,1,1,1,15,1,2,1,3,1,23,2,15,1,9,1,14,1,19,1,18,1,32,1],
+      ["fundamental",30,1,10,1,12,1,88,1,5,1,5,1,20,1,19,1,14,1,10,1,9,1],
+      ["furnish",0,1,82,1],
+      ["furniture",17,1,6,1,64,1,30,2,35,2],
+      ["fuse",115,1],
+      ["fusion",136,1,69,1],
+      ["futile",121,1],
+      ["gadget",82,2],
+      ["gallery",34,11,21,1,30,1,51,2,15,16,18,1,1,6],
+      ["gallop",10,1,205,2],
+      ["gang",88,1,21,1],
+      ["gather",5,1,25,1,6,1,7,2,11,1,3,1,4,2,7,1,2,2,10,1,16,1,31,1,20,1,3,1,4,1,12,5,44,1,1,1,8,1,3,1],
+      ["gauge",26,1,154,1,39,2],
+      ["gear",1,1,80,1,1,1,19,1,31,2,29,1,1,1],
+      ["gender",24,1,25,5,56,1,50,1,37,1,33,1],
+      ["gene",22,18,10,2,26,1,13,2,18,1,30,1,31,1,72,1,3,1],
+      ["general",2,1,1,1,1,1,11,2,1,2,9,1,11,1,3,1,16,1,3,2,7,1,8,1,4,1,4,1,1,1,2,1,7,1,9,1,8,1,13,1,1,1,16,1,1,1,9,1,2,1,2,2,7,1,1,1,7,2,9,1,8,1,4,1,14,1,5,1,1,1,4,2,2,1,10,1],
+      ["generalise",3,1,149,1],
+      ["generate",28,1,2,1,3,3,23,1,16,1,4,1,9,1,32,2,7,1,10,2,8,1,16,1,9,1,3,1,2,1,1,1,12,1,5,1,4,1,1,1,1,1,16,1],
+      ["generic",63,1,9,1],
+      ["generous",28,1,13,1,10,1,21,1,110,1],
+      ["genetic",2,4,3,1,9,1,8,3,5,1,5,1,15,1,11,1,7,2,13,1,21,1,11,2,29,1,11,1,33,1,42,2],
+      ["genuine",85,2,13,1,84,1,8,2],
+      ["geographical",48,1,2,1,14,3,11,1,21,1,98,1],
+      ["geological",25,2,65,1,102,1],
+      ["geology",196,2],
+      ["geometry",200,1],
+      ["germ",22,1,79,1],
+      ["germinate",158,1,66,1],
+      ["gesture",60,2,14,1,88,1,12,1,41,1,4,1],
+      ["gigantic",63,1,16,1,86,1],
+      ["given",0,1,2,1,11,1,9,1,2,3,2,1,2,2,10,1,2,1,1,1,1,2,13,1,7,1,20,1,12,1,4,1,2,1,5,1,1,2,11,1,5,1,1,1,5,1,3,1,6,1,1,1,6,1,3,1,1,1,2,1,5,1,2,1,9,1,3,1,6,1,6,1,3,1,3,1,2,1,13,1,5,2,3,1,1,1,5,1],
+      ["glacial",40,2],
+      ["glacier",40,1,50,2],
+      ["gland",65,1,7,1,47,1,24,4],
+      ["glimpse",111,1],
+      ["global",3,1,2,1,4,1,7,1,16,3,2,1,6,1,40,1,2,1,8,1,5,1,7,1,2,1,8,1,16,1,5,1,7,2,22,1,2,1,6,2,7,2,3,3,15,1,4,1,2,1,8,1,13,1],
+      ["glossy",19,1],
+      ["glue",172,1,42,1,3,1,1,2,6,1],
+      ["goal",3,1,3,5,2,2,21,1,28,1,16,1,11,1,18,1,16,1,2,1,2,1,9,1,3,2,12,2,10,1,1,1,2,1,2,1,2,1,11,1,10,3,5,2,9,3,1,1],
+      ["goodwill",122,1],
+      ["gorge",69,1],
+      ["gorilla",98,1],
+      ["govern",15,2,8,1,60,1,4,1,6,1,8,1,46,1,9,1],
+      ["grab",45,1,2,1,67,2,28,1,21,1,53,1],
+      ["graduate",58,1,39,1,19,1,34,1,2,1,11,7],
+      ["grand",44,1,125,1,15,1],
+      ["granite",44,1],
+      ["grant",11,2,9,1,90,1,2,1,56,1,15,1,5,1,3,1,3,1,32,2],
+      ["graphic",30,2],
+      ["grasp",45,1,9,1,3,1,39,1,71,1,45,1,4,1],
+      ["grassy",135,1],
+      ["grateful",215,1],
+      ["gravel",35,1,49,1,126,1],
+      ["gravity",116,1,16,3,10,1,19,1,56,3],
+      ["greatly",9,1,1,1,3,1,17,1,36,1,17,1,13,1,3,1,9,1,3,1,17,1,2,1,12,1,5,1,19,1,4,1,4,1,4,1,13,1,10,1],
+      ["grid",64,2,131,2],
+      ["grieve",155,1],
+      ["grill",79,1,104,1],
+      ["grin",83,1,91,1],
+      ["grind",32,1,67,1,24,1,35,1,16,1,36,2,8,1],
+      ["grip",82,2,50,1,31,1,14,1,44,1],
+      ["groan",14,1],
+      ["grocery",22,3,48,1,27,2,77,1],
+      ["grope",1,1],
+      ["gross",166,1],
+      ["grove",51,1,158,3],
+      ["guarantee",11,1,2,1,3,1,16,1,1,1,95,1,3,1,3,1,19,1,8,1,1,1,26,1,6,1],
+      ["guideline",53,2,44,1,21,1],
+      ["guilty",175,1,38,1],
+      ["guinea",175,1],
+      ["guzzle",5,1],
+      ["habitable",164,1],
+      ["habitat",10,2,4,1,7,1,2,1,17,2,19,2,16,1,14,1,14,2,7,1,11,1,14,3,6,4,1,1,1,3,21,1,9,1,4,1,39,2,7,1],
+      ["habitual",86,1],
+      ["hall",44,2,17,1,36,1,72,1,1,2,14,1],
+      ["halt",16,1,32,1,14,1],
+      ["halve",76,1],
+      ["hamper",192,1],
+      ["handle",19,1,17,1,17,2,28,1,39,1,11,1,21,1,7,1,1,1,19,1,2,1,28,1,2,1,6,1],
+      ["handy",217,1],
+      ["hang",29,1,44,1,18,1,27,1,33,1],
+      ["harbour",44,3,66,1,13,1,13,2,3,1],
+      ["harmony",42,1,42,1,83,1,45,1],
+      ["harness",5,1,115,1,38,1,66,1],
+      ["harsh",27,1,32,1,62,2,52,1,1,1,51,2],
+      ["hatch",32,1,33,1,12,1,19,1,7,3],
+      ["hawk",89,1],
+      ["hazard",113,1,27,1,41,1],
+      ["hazardous",161,1,17,1],
+      ["headline",97,1,91,1],
+      ["headmaster",49,1],
+      ["headquarters",80,2,121,1],
+      ["heal",11,1,61,3,11,2],
+      ["healing",11,2,6,1,55,2,26,1,122,1],
+      ["heap",165,1],
+      ["heartless",157,1],
+      ["hectare",69,3,15,2,18,1,8,4,23,1,66,1,2,2],
+      ["height",10,1,11,1,10,1,12,1,27,1,14,1,25,1,3,1,39,1,22,1,23,2,20,1],
+      ["heighten",60,1],
+      ["heir",77,1,105,1],
+      ["helicopter",133,1],
+      ["hemisphere",117,2,4,2,55,1,1,1,46,1],
+      ["hence",23,1,11,1,113,2,9,1,18,1,4,2],
+      ["herbal",16,12],
+      ["herbivore",65,5,156,2],
+      ["hereditary",137,1],
+      ["heritage",1,1,30,1,1,4,1,1,11,2,11,1,29,2,24,1,43,3,16,1,27,1,18,1],
+      ["hesitate",89,2],
+      ["hide",17,2,14,1,7,1,9,1,22,2,2,1,6,1,9,1,3,2,29,1,5,1,4,1,47,1,15,1,28,1],
+      ["hierarchy",8,1,42,1,37,1,47,1,13,1,3,1],
+      ["high-tech",35,1,45,1,11,1,49,1,10,1,59,1,8,1],
+      ["highlight",6,1,22,2,25,2,15,2,65,1,11,1,18,1,8,1,8,1],
+      ["highway",143,1],
+      ["hinder",76,1,87,1],
+      ["hinge",165,1],
+      ["hire",6,1,28,1,21,3,115,1,49,3],
+      ["historian",39,2,2,4,26,1,10,2,10,2,12,1,12,1,26,1,31,1,1,1,27,1,15,2,8,1],
+      ["historic",39,1,24,1,1,1,41,1,91,1,18,1,9,1],
+      ["holistic",208,1],
+      ["hollow",77,1,2,1,14,4,10,1,18,1,96,1,1,1],
+      ["homesick",184,1],
+      ["honour",49,1,67,1,55,1,17,1],
+      ["hook",1,35,4,1,13,1,109,2],
+      ["horizon",23,1,145,1,21,1,32,1],
+      ["horizontal",40,1,4,1,8,1,15,1,12,1,34,1],
+      ["horrify",112,1],
+      ["horror",188,1],
+      ["hose",23,1],
+      ["host",44,1,59,1,7,1,29,1,47,2,4,2,15,1],
+      ["hostel",71,1],
+      ["hostile",45,1,16,1,30,1,32,1,1,1,49,1,1,2],
+      ["hostility",42,1,95,1],
+      ["household",2,1,39,1,35,2,6,1,14,1,22,1,39,2,9,1,13,3,46,1],
+      ["hover",159,2],
+      ["however",0,2,1,2,1,1,3,2,3,2,3,1,1,1,1,1,1,1,1,2,1,3,4,1,2,2,1,1,1,2,1,3,1,5,2,1,1,1,1,2,2,1,1,4,1,2,1,1,1,1,1,2,3,7,2,4,1,2,1,2,2,2,1,1,2,1,2,1,1,1,1,1,2,2,2,1,1,2,1,2,1,1,1,1,2,1,2,1,1,1,1,1,1,2,1,1,1,1,3,1,2,3,1,3,1,2,3,1,1,1,1,2,1,1,1,1,1,3,1,2,3,2,4,2,1,3,1,2,2,1,5,1,1,1,1,1,1,2,1,3,2,1,3,4,2,2,2,1,1,4,1,3,1,2,3,1,1,2,1,1,1,1,1,1,1,4,1,3,1,2,1,3,1,2,1,2,3,3,1,1,1,2,1,2,2,2,1,1,1,1,1,2,1,1,1,1,1,1,2,2,1,1,3,1,1,4,1,2,1,1,1,1,1,3,2,1,1,1,2,2,1,4,2,3,1,3,1,1,2,1,1,2,2,1,1,2,4,1,2,1,2,1,1,1,2,1,2,3,1,4,1,1,1,3,2,2,2,2,1,2,3,1,1,1,1,1,1,1,1,2,1,2,2,1,1,4,1,1,1,3,1,3,1,2,2,3,1,1,2,1,1,2,3,1,1,2,2,1,1,2,1,1,1,2,1,1,1,1,1,1],
+      ["hug",155,1,43,2],
+      ["humane",122,1],
+      ["humanistic",11,1],
+      ["humanity",11,15,4,1,6,1,20,1,32,1,69,1,43,1],
+      ["humble",5,1,17,1,32,1,10,1,93,1,49,1],
+      ["humid",43,1],
+      ["humidity",124,1],
+      ["humour",162,2],
+      ["hurdle",209,2],
+      ["hybrid",22,1,10,2],
+      ["hypothesis",3,1,14,1,4,1,36,1,18,1,36,2,17,2,27,1,5,1,8,1,17,1,2,1,2,2,1,1,31,1],
+      ["hypothetical",40,1,23,1,19,2,45,1,25,1],
+      ["ideal",1,1,7,1,6,1,5,1,2,1,8,1,13,1,4,1,2,1,4,1,1,1,84,1,13,1,4,1,34,1,7,1,23,1],
+      ["identical",1,1,56,1,4,1,3,1,4,1,4,1,4,1,17,1,81,1],
+      ["identifiable",2,1,4,1],
+      ["identification",2,1,40,1],
+      ["identify",1,1,1,1,4,7,8,1,7,1,5,1,1,1,4,1,6,1,5,1,8,1,6,2,2,2,10,1,1,1,1,1,6,1,2,1,2,1,1,1,3,2,13,1,1,1,2,2,22,2,8,1,11,1,4,3,12,1,9,1,8,3,1,1,4,1,7,1,17,3,1,2,4,1,6,1,3,1,1,2,6,1],
+      ["identity",32,1,86,1,49,1,19,2,4,1,2,1,20,1,13,1],
+      ["ignorant",171,1,11,1],
+      ["ignore",0,1,6,1,10,1,23,1,19,1,1,1,26,1,1,1,8,1,20,2,12,1,36,1,16,1,1,1,30,1],
+      ["illegal",88,1],
+      ["illuminate",27,1,36,1,50,1,7,1,67,1,27,1],
+      ["illusion",5,1,13,1,75,1,68,1,27,1],
+      ["illustrate",46,1,9,3,21,1,13,2,12,1,45,1,36,1,4,2],
+      ["illustration",105,3,52,1,22,1,11,1],
+      ["image",13,1,4,3,1,2,8,1,1,1,3,3,27,1,6,1,4,1,4,1,19,1,3,1,5,8,2,1,6,1,8,4,8,1,22,1,15,4,11,1,3,1,1,1,3,2,20,1,3,1,22,1,4,2],
+      ["imagination",92,1,52,1,33,1,10,1,1,1],
+      ["imaginative",11,1,56,1,25,2,90,1,1,2,23,1],
+      ["imagine",1,1,17,1,24,2,12,1,3,1,3,1,15,1,3,1,20,1,4,1,23,1,6,1,11,1,4,1,19,1,7,1,10,1,5,1,12,1],
+      ["imitate",89,2,3,1,75,2,40,5,5,2],
+      ["imitation",14,1,75,1,19,5,1,1,50,1,8,1,40,2,5,1],
+      ["immediately",0,1,23,1,38,1,31,1,1,1,4,1,16,1,2,2,3,1,12,2,7,1,7,1,27,1,7,1,4,1,3,1,7,1,8,1],
+      ["immense",22,1,28,2,37,1,50,2,23,1,28,1],
+      ["immigrant",46,1,31,1,40,1,1,2,89,1],
+      ["immune",83,1,66,1,47,1,24,1],
+      ["impact",9,2,7,1,9,5,9,2,3,1,7,1,10,1,1,1,6,1,4,1,9,1,16,2,6,2,3,2,1,1,2,2,14,1,4,3,2,5,11,1,1,1,2,1,1,2,4,5,1,1,9,2,4,1,15,1,6,2,12,1,10,1,1,2,15,3],
+      ["impair",53,2,53,1,70,1,21,1],
+      ["impart",14,1,149,2],
+      ["impede",92,1,128,1],
+      ["impetus",41,1,47,1,82,1],
+      ["implement",186,1,24,1],
+      ["implication",6,1,20,1,13,1,1,1,36,1,58,1,18,1,7,1,19,1,28,1,7,1],
+      ["impose",8,1,104,2,13,1,15,1,68,1],
+      ["impossible",1,1,2,1,54,1,29,1,2,1,5,1,18,1,37,1,4,1,6,1,17,1,6,1,6,1,5,1],
+      ["impoverished",101,1,23,1],
+      ["impress",30,1,9,1,8,1,20,1,5,1,21,1,48,1,34,1,1,1,12,2],
+      ["impression",13,1,32,1,9,1,13,1,47,1,36,1,1,1,24,1],
+      ["impressive",27,1,4,1,58,1,2,2,20,1,34,2,11,1,14,1,3,1,25,2,5,2],
+      ["improve",1,1,7,2,5,1,10,1,7,1,3,1,2,1,11,1,7,4,5,1,5,1,2,1,18,1,10,1,3,1,1,1,3,1,1,2,4,1,12,1,3,1,2,3,1,1,15,1,12,1,1,1,2,2,10,6,3,2,4,1,2,1,19,1,7,3,2,1,1,3,1,1,4,1,18,1,2,3],
+      ["improvement",15,1,18,2,6,1,33,1,11,1,13,2,5,2,20,1,1,1,10,1,21,1,2,1,8,1,13,2,24,1,26,1],
+      ["impulse",5,1,55,1,12,1,22,1,106,2],
+      ["inactive",63,2],
+      ["inadequate",152,1],
+      ["inalienable",183,1],
+      ["inborn",2,1,37,1],
+      ["incentive",90,1,22,1,17,1],
+      ["incident",214,3],
+      ["inclination",155,1],
+      ["include",3,1,1,1,4,1,2,4,1,1,5,2,3,2,3,1,1,1,1,1,2,1,2,2,1,2,3,1,1,1,3,4,4,1,4,2,1,2,3,2,2,1,1,3,2,3,7,1,1,1,1,1,2,2,1,2,1,1,11,1,1,1,7,2,3,1,2,1,1,2,6,2,4,2,2,3,2,1,2,2,4,1,4,2,1,1,1,1,3,1,1,1,3,1,4,1,1,1,7,1,4,3,1,1,2,1,1,1,1,1,1,1,1,2,3,1,4,1,4,1,3,1,2,1,1,1,1,2,1,1,3,4,2,1,5,1,2,1,2,1,2,1,1,1,1,2,2,1,3,1,2,3,7,1,2,2,1,1,2,1,2,1,1,1,4,3,1,1,3,2,7,1,3,2],
+      ["inclusive",74,1],
+      ["incoming",68,1,3,1,7,1,3,1],
+      ["incorporate",14,1,5,2,11,1,14,1,76,1,9,1,7,1,15,1,7,1,11,2],
+      ["incredible",59,1,56,1,43,1],
+      ["independence",8,2,7,1,41,1,116,3],
+      ["independent",5,1,3,1,97,1,9,1,8,1,82,1,9,1,7,1],
+      ["indicate",1,1,2,1,15,1,2,1,1,1,16,1,6,1,2,1,1,2,1,1,1,1,2,3,6,1,1,1,3,2,7,1,1,1,3,1,2,1,4,1,8,1,13,1,1,1,9,1,2,1,5,1,8,1,32,1,15,1,3,1,4,1,24,1,3,1,2,1,2,2,2,1,6,1,6,1,2,1],
+      ["indication",25,3,14,1,29,1,79,1,74,1],
+      ["indigenous",23,1,72,1,22,2,18,1,8,1,8,1,36,1,18,1],
+      ["individual",2,2,4,3,1,1,1,2,1,2,2,2,1,2,8,4,6,1,2,2,2,1,11,2,4,1,2,2,9,1,1,1,13,1,18,2,1,1,4,1,5,2,12,3,8,1,1,1,2,1,4,1,1,1,1,1,4,3,9,1,1,1,4,1,3,1,4,2,4,1,11,1,7,1,4,1,3,1,17,1,5,1,5,1,4,1,9,1,1,1,1,1],
+      ["induce",72,1,61,1,22,2,45,1,21,3],
+      ["induction",170,1],
+      ["indulge",200,1],
+      ["industrialise",101,1],
+      ["inescapable",104,1],
+      ["inevitable",109,1,3,1,93,1],
+      ["infection",22,2,115,1,2,1,19,1,33,2,29,1],
+      ["inference",93,2,59,1],
+      ["inferior",95,1,57,1],
+      ["infiltrate",56,1,79,1,84,1],
+      ["infirmity",82,1],
+      ["inflict",157,1],
+      ["influence",1,1,1,1,4,1,9,1,7,1,19,1,1,1,1,1,17,2,9,1,2,2,1,1,2,1,4,2,36,1,10,1,4,1,1,1,1,1,6,1,9,1,3,1,1,1,6,2,1,2,4,1,7,1,4,4,9,1,7,1,16,1,2,1,2,5,2,1,3,1,3,1],
+      ["influential",71,2,7,1,62,1,12,1,5,1,14,1,8,1,29,2,17,1],
+      ["inform",11,1,69,1,6,1,73,1,14,1,37,1],
+      ["infrastructure",13,1,71,1,12,1,21,2],
+      ["ingenuity",160,1,4,1],
+      ["ingredient",29,1,33,1,10,1,50,1,7,1,29,1,59,1],
+      ["inhabitant",16,1,11,1,69,1,27,1,14,1,50,1],
+      ["inhale",3,1,161,1,56,1],
+      ["inherent",6,1,41,1,81,1,43,1,33,1,4,1],
+      ["inheritance",105,1,77,1,6,1],
+      ["inhibit",54,1,85,1,35,1,47,1,3,1],
+      ["initial",12,2,14,1,2,1,11,1,1,1,13,1,9,1,13,1,30,1,6,1,21,1,1,1,9,1,17,1,12,1],
+      ["initiate",34,1,51,1,7,1,12,1,20,1,31,1],
+      ["initiative",16,1,17,1,89,4,31,1,9,1,1,1,28,1,15,1,5,1],
+      ["inject",53,2,29,1,80,1],
+      ["inland",35,1,90,1,10,1,89,1],
+      ["innocent",216,1],
+      ["innovation",5,1,21,1,12,1,8,1,7,3,2,1,18,1,9,1,30,1,5,1,5,2,5,1,13,2,21,1,9,1],
+      ["innovative",1,1,22,1,21,1,29,1,54,1,5,1,1,1,37,1,12,1],
+      ["input",12,1,2,1,20,1,14,1,100,1,18,1,31,1],
+      ["inscribe",67,2,56,1],
+      ["insert",22,2,24,1,73,1,38,1,61,2],
+      ["insidious",165,1],
+      ["insight",12,1,12,1,17,1,27,1,13,1,1,1,18,1,9,1,4,1,14,1,15,1,32,1,16,2,8,1,8,1,2,1,8,1],
+      ["insignificant",17,1],
+      ["insist",101,1,4,2,39,1,1,2,15,1,2,1,1,1,12,1,28,2,2,1,8,1],
+      ["inspect",98,1,115,1],
+      ["inspiration",4,1,1,1,12,1,14,1,10,1,3,1,37,2,48,1,7,1,4,1,19,3,23,1],
+      ["inspire",5,4,26,1,44,1,41,1,43,1,1,1,13,1,53,1],
+      ["inspiring",63,1],
+      ["install",68,1,29,1,72,1,26,1],
+      ["instinct",49,1,33,1,48,1,74,1],
+      ["instinctual",106,1],
+      ["institute",5,1,2,2,17,1,3,1,31,1,13,1,12,1,8,1,6,1,18,1,7,1,4,1,16,1,3,1,11,1,23,1,2,1,11,1,5,1,1,2,5,1,17,1],
+      ["institution",7,1,21,1,27,3,40,1,2,1,4,5,3,1,7,2,11,1,6,1,19,1,2,1,2,1,7,1,5,1,7,4,18,1,18,1,3,1],
+      ["instruct",85,4,7,1,34,1,33,1,39,1],
+      ["instrument",7,2,8,2,8,1,23,16,4,1,17,1,4,1,6,1,3,1,20,1,21,1,25,2,21,1,1,2,8,12,1,2,3,3,32,1,6,1],
+      ["instrumental",34,1,77,1,35,2,34,1,42,1],
+      ["insufficient",59,1,48,1,101,3],
+      ["insulate",19,1,176,1],
+      ["insulation",19,1,43,1,133,2],
+      ["insurance",20,2,79,1,102,2],
+      ["intact",83,1,138,1],
+      ["intake",24,1,52,3,44,1,58,1,42,1],
+      ["integral",34,1,88,1,15,1],
+      ["integrate",34,1,22,1,8,1,20,2,33,1,1,1,2,2,39,1],
+      ["intellectual",86,1,41,1,49,1,7,1,3,1,4,1,18,1,14,1],
+      ["intelligence",6,2,7,1,23,3,45,1,46,2,33,2,6,2,1,1,31,2,3,1,3,1,8,1],
+      ["intelligent",13,1,68,1,13,1,4,1,29,5,50,1],
+      ["intend",1,2,10,1,13,1,2,1,2,1,25,1,11,1,4,1,11,2,7,1,18,1,9,2,27,1,8,1,27,1,9,1,4,1,13,1,17,1],
+      ["intense",17,1,9,1,58,1,6,1,65,1,8,1,12,2,10,1,40,1],
+      ["intensify",34,1,5,1,122,1],
+      ["intensity",3,1,27,1,35,1,18,1,53,1,4,1],
+      ["intensive",83,1,19,2,16,1,1,1,14,1,7,1,22,1,37,2,24,1],
+      ["intent",157,1,18,1],
+      ["intention",26,1,5,1,35,1,61,1,35,1,13,1],
+      ["interact",16,1,49,1,27,1,74,1,6,1,26,1,21,1,2,1,4,1],
+      ["interest",0,1,4,2,2,1,3,2,2,2,1,1,3,1,1,2,7,1,8,1,3,1,2,3,1,1,1,2,3,1,9,1,4,1,9,2,18,1,9,1,1,1,9,1,5,2,3,1,3,1,2,1,1,1,2,2,1,1,12,1,2,1,1,1,4,2,4,1,2,1,1,1,3,1,5,1,2,1,3,2,1,2,3,1,5,1,3,3,2,1,1,1,8,1,7,2,2,1,10,3,6,1,1,3,1,2,2,1,2,1,1,1,2,1,3,1,4,1,6,1],
+      ["interface",154,1],
+      ["interfere",116,1,4,1,78,1],
+      ["interior",30,1,4,1,10,3,76,1,31,1,49,1],
+      ["intermediate",73,1,101,1,46,1],
+      ["internal",8,1,22,2,46,3,46,1,37,1,2,1,5,1,7,2],
+      ["interplay",7,1],
+      ["interpret",12,1,9,1,5,1,48,1,12,1,7,1,5,2,2,1,48,1,14,4,7,1,37,1],
+      ["interpretation",12,2,29,1,107,1,9,1,21,2,12,1,25,1],
+      ["interrelationship",122,1],
+      ["interrupt",18,1,21,1,87,3,55,2],
+      ["intersection",31,2,39,1,14,1,113,1],
+      ["interval",3,1,15,1,7,1,69,1,73,1,37,1,8,1],
+      ["intervene",160,1],
+      ["intervention",13,2,11,1,25,1,35,1,49,1,41,1],
+      ["interview",26,2,16,1,1,1,39,1,1,1,15,1,53,1,24,2,45,1],
+      ["intestine",125,1],
+      ["intimate",85,2,8,1,62,1,70,1],
+      ["intrigue",0,1,34,1,13,1,21,1,51,1,2,1,18,1,21,1,7,1,10,1,35,1,5,1],
+      ["intrinsic",41,1,119,1,11,1],
+      ["introduce",0,1,1,1,28,2,3,1,14,2,10,1,11,1,2,1,3,1,3,1,3,1,2,1,3,1,4,1,1,1,2,1,2,1,15,1,2,1,2,2,21,1,3,1,2,2,1,3,3,6,15,1,7,1,7,2,10,1,7,4,6,5,5,3,4,3,11,1,1,1],
+      ["introduction",75,1,2,1,26,1,7,2,1,1,30,4,29,1,17,1,6,3],
+      ["introspection",149,1],
+      ["introvert",85,1,87,1],
+      ["intrusion",40,1],
+      ["invade",65,1,22,1,20,1,3,2,14,1,17,2,2,1,34,1,17,1],
+      ["invader",141,2],
+      ["invaluable",152,1,21,1,41,1,3,1,2,1],
+      ["invasion",16,1,32,1,29,1,13,3,79,2,8,1,17,1],
+      ["invasive",141,14,33,1],
+      ["inventory",73,2,24,1],
+      ["invest",6,2,22,2,19,1,81,3,9,1,25,1,47,1],
+      ["investigate",2,1,16,1,16,1,3,1,3,1,3,1,42,1,2,1,3,1,10,3,16,1,1,1,7,1,5,1,13,1,2,1,1,3,9,1,1,1,10,1,8,1,1,1,29,3,8,1],
+      ["invisible",30,1,38,1,18,1,3,1,83,1,23,1],
+      ["involve",0,1,2,4,1,2,6,1,3,1,1,2,2,2,3,1,8,1,11,1,3,1,1,1,1,1,9,1,2,2,1,1,1,1,2,2,3,1,1,1,1,1,9,1,1,3,1,1,2,1,5,2,2,3,1,1,3,2,7,1,4,1,3,2,3,1,9,1,6,1,1,1,2,2,1,1,5,1,4,1,3,1,3,1,4,1,1,2,6,2,1,1,2,1,2,3,2,1,1,1,7,1,6,1,6,1,3,2,2,1,1,2,3,3,1,2,4,3,1,1,10,2,5,1,1,2,3,1,4,1,1,1,4,1,3,1,1,1,2,1,2,1],
+      ["iron",38,1,41,1,34,3,3,3,41,1,8,1],
+      ["irony",22,1],
+      ["irrational",94,1,66,1,18,1,22,1,9,1],
+      ["irrelevant",33,1,182,1],
+      ["irresistible",47,1,104,1,31,1],
+      ["irrigation",35,1,66,1,1,1,18,1,79,1],
+      ["irritable",94,1],
+      ["irritate",125,1,57,1],
+      ["irritation",224,1],
+      ["isolate",214,1],
+      ["isolated",4,1,18,1,25,1,9,1,31,1,5,3,23,1,32,1,3,1,29,1,12,1,16,1],
+      ["issue",2,2,13,2,1,1,4,1,6,1,15,2,8,3,4,2,5,2,12,2,12,1,17,2,3,1,2,1,18,1,15,1,11,2,4,1,5,1,4,1,5,1,1,4,11,3,4,1,4,1,13,1,7,2,2,1,3,1,1,4,1,1,10,1,3,2],
+      ["item",1,1,18,3,7,1,2,1,2,2,12,2,5,2,15,1,4,1,7,1,24,1,10,1,1,1,32,2,3,1,38,1,10,1,31,1,4,1],
+      ["jaw",1,1,2,6,112,2,29,1],
+      ["jealous",175,1],
+      ["jerk",124,1],
+      ["joint",16,2,8,1,5,1,155,1],
+      ["journal",4,4,14,1,2,1,19,1,62,1,26,1,1,1,39,2,1,1,14,1,7,1,7,1,16,2],
+      ["journalist",15,1,16,2,1,1,77,1,73,1],
+      ["judgment",42,1],
+      ["jumble",196,1],
+      ["jungle",96,1,39,2],
+      ["justice",28,1,81,1],
+      ["justify",122,1,20,1,4,1,32,1,28,1],
+      ["juvenile",130,1,80,1],
+      ["keen",16,1,38,1,4,1,14,1,74,1,33,1],
+      ["kindergarten",36,1,68,1,49,3,33,1],
+      ["kit",127,1],
+      ["knob",200,1],
+      ["label",15,1,11,1,10,1,6,1,18,1,32,1,5,2,43,2,33,1],
+      ["laboratory",5,1,2,2,4,2,2,1,15,1,9,1,21,1,5,1,1,1,19,1,2,1,6,1,9,1,35,1,8,1,15,1,2,1,7,2,1,1,21,1,3,1,9,1,8,1,3,2],
+      ["labour",8,1,17,1,16,1,46,1,12,1,41,2,54,1,21,1],
+      ["lack",1,1,5,1,2,1,5,1,3,2,1,1,23,2,3,2,5,1,20,1,2,1,6,1,9,2,2,1,5,2,2,1,12,1,5,1,1,1,1,1,26,1,8,2,1,1,12,1,1,1,1,1,4,1,5,1,3,1,2,1,1,1,27,3,4,2,2,1,15,1],
+      ["lag",88,1],
+      ["landfill",134,6,1,1],
+      ["landmark",111,1,19,1,29,6,46,1],
+      ["landscape",26,3,7,1,1,3,1,1,15,1,19,8,1,1,20,4,15,2,15,1,4,1,9,1,2,1,1,2,2,1,5,1,6,1,2,1,8,2,18,1,25,1,3,15,18,1],
+      ["lane",83,1],
+      ["large-scale",55,1,29,1,39,1,84,1],
+      ["laser",97,1,43,1,86,1],
+      ["latent",81,1],
+      ["latitude",64,3,27,1,10,3,20,1,9,2,19,1],
+      ["launch",16,1,12,2,4,2,3,1,31,1,4,2,12,1,46,1,4,1,10,2,24,1,11,1],
+      ["laundry",126,1,14,1],
+      ["layer",25,1,6,2,9,1,54,1,14,3,12,1,17,1,3,1,9,1,47,2,14,4,16,1],
+      ["layout",132,1,38,1],
+      ["lead",0,1,1,1,1,1,4,2,3,1,5,1,3,1,1,2,5,1,3,1,1,1,1,1,1,2,1,1,6,1,1,1,4,1,1,1,2,3,1,1,2,2,1,1,5,3,3,3,5,3,2,1,7,2,5,1,1,1,1,1,2,2,1,1,8,2,3,2,8,1,3,1,2,2,2,1,3,1,2,1,1,1,1,1,6,3,1,1,5,1,4,1,8,1,3,1,1,3,4,1,4,1,3,2,5,1,2,1,1,1,1,1,1,2,6,1,2,1,1,1,3,3,2,1,8,1,3,1,2,1,1,3,1,1,3,4,1,1,1,1,3,1,4,1,3,1,2,1,2,1,3,2,1,1,1,1,2,6,1,2,2,2,1,2,1,2,1,3,2,2],
+      ["leadership",134,1,91,1],
+      ["leaflet",53,2],
+      ["leak",64,1,152,1],
+      ["leap",137,1,15,1,30,1],
+      ["leather",23,1,6,1,22,1,51,1,47,1,50,1,14,1],
+      ["lecture",11,1,17,1,8,1,18,1,8,1,42,1,7,2,85,1,17,1,12,1],
+      ["legacy",129,1,42,1,16,1,26,1],
+      ["legal",15,4,1,1,70,1,2,2,22,1,103,1],
+      ["legislation",53,2,88,1,21,1],
+      ["legislative",15,1],
+      ["legitimate",112,1,19,1,47,1,26,1],
+      ["leisure",92,1],
+      ["lens",7,1,51,1,1,1,52,1,85,1],
+      ["lethal",96,1,81,1],
+      ["level",0,3,2,3,3,1,1,1,2,7,1,1,11,1,1,1,2,2,2,1,3,1,3,1,3,1,3,2,3,1,2,2,1,1,1,1,5,4,1,2,2,1,1,1,1,1,1,1,2,1,2,1,3,1,1,3,2,2,2,1,5,1,1,1,7,1,1,1,3,2,2,4,5,1,1,4,1,1,7,1,6,2,3,1,1,1,7,1,1,1,9,1,5,2,1,3,1,2,3,1,2,1,2,4,2,1,8,4,2,2,8,1,1,1,2,1,2,1,5,1,1,1,1,1,3,1,1,1,1,1,6,1,1,1,1,1,3,4,8,1,3,1,1,1,8,2,1,3,10,1],
+      ["lever",1,1],
+      ["liaise",80,1],
+      ["liberty",15,1],
+      ["license",16,1],
+      ["likelihood",93,1,13,1,103,1],
+      ["limb",3,1,26,1,69,1],
+      ["lime",129,2],
+      ["limestone",21,1,6,1,102,1],
+      ["limitation",1,1,7,1,140,2,4,1,29,1,16,1],
+      ["limited",1,1,3,1,5,1,6,1,1,1,16,1,1,1,40,1,1,1,10,1,38,1,2,1,17,3,2,1,8,1,17,1,8,1,2,1,11,1,2,1,7,3,10,6,13,1],
+      ["linen",29,1,78,1],
+      ["linger",34,1,171,1],
+      ["linguistic",54,2,32,4,9,5,16,1,51,1,9,1,11,1,1,1,3,3,4,1,14,1,3,1,1,1],
+      ["link",0,1,2,1,1,2,10,3,23,1,11,1,1,1,6,1,6,3,3,1,7,1,1,5,7,5,3,2,17,1,2,4,6,1,8,1,7,1,2,1,14,2,12,1,18,1,5,1,6,1,7,1,4,1,2,1,17,1,4,1,7,1,3,4,1,1],
+      ["literacy",49,3,25,1,98,1,7,2,7,4],
+      ["literal",86,2,97,1],
+      ["literate",157,1],
+      ["literature",11,3,3,1,22,1,3,2,16,1,32,1,59,2,2,1,9,1,14,1,17,3,18,16,10,1],
+      ["litter",19,1,2,1,163,1],
+      ["livelihood",124,2,14,1,64,1],
+      ["liver",7,8],
+      ["livestock",51,1,39,2,9,1,3,9,22,3,14,3,61,9,3,3,21,1],
+      ["load",18,1,48,3,66,1,11,1],
+      ["loan",55,1,58,1],
+      ["lobby",82,1,88,1],
+      ["locality",131,1],
+      ["locate",13,1,1,1,7,1,10,2,9,2,16,1,13,1,1,2,8,1,18,1,24,1,46,1,15,1,3,1,20,2,2,1,3,1],
+      ["location",26,1,6,1,2,1,9,1,25,1,2,1,8,1,10,1,1,1,7,3,12,2,27,1,6,2,14,2,4,1,32,1,3,1,10,1,14,1,5,1],
+      ["log",117,3,42,1,20,7],
+      ["logic",116,1,44,1,29,1],
+      ["long-term",24,1,52,1,58,1,9,1,19,1,2,1,25,1,9,4,2,1,20,1],
+      ["longitude",64,2,47,1],
+      ["loop",5,1,8,1,5,2,82,1,32,1,29,2],
+      ["loose",146,1],
+      ["lower",5,1,1,1,2,5,2,1,3,1,22,1,3,1,5,2,5,2,11,1,2,1,2,2,7,2,3,1,26,2,4,1,3,1,16,1,1,1,2,1,3,1,1,1,10,6,4,1,10,1,14,2,5,1,19,2,1,2,15,1,5,2,1,1,3,2,6,1],
+      ["loyalty",76,3,93,1],
+      ["luggage",97,1],
+      ["luxury",1,1,37,1,39,1,10,1,75,1],
+      ["machinery",73,1,10,1,57,2,41,1,13,3],
+      ["magic",34,1,38,1,26,1,52,1,7,1],
+      ["magnet",34,1,82,7,26,1],
+      ["magnetic",17,1,52,3,47,8,5,1,7,1,49,4,49,1],
+      ["magnificent",27,1,93,1,17,1,34,1,44,1],
+      ["magnify",113,1],
+      ["magnitude",76,1,86,1],
+      ["mainly",4,1,6,2,11,1,6,1,63,1,13,2,18,1,3,1,23,2,77,1],
+      ["mainstream",186,2],
+      ["maintain",1,1,5,1,2,1,1,1,5,1,8,1,1,1,9,1,10,1,2,1,8,1,3,2,6,1,14,1,1,1,9,1,1,1,18,1,2,1,18,1,3,1,3,1,1,1,10,1,3,1,6,2,7,1,8,1,7,1,11,1,5,1,10,2,11,1,10,1],
+      ["maintenance",33,1,6,1],
+      ["major",8,4,12,1,3,1,6,2,1,1,8,1,1,1,1,1,1,4,3,1,1,1,6,1,4,1,3,1,2,1,1,1,4,1,4,1,3,1,1,1,2,1,2,1,6,1,3,1,6,1,2,1,2,1,1,1,3,5,2,1,11,2,3,1,1,3,5,2,2,1,11,1,1,1,10,1,1,2,4,1,2,1,17,1,8,2,1,1,1,1,10,1,1,1,3,1,2,2,3,1,9,2,1,1,2,1,9,1,2,1,2,2,2,1],
+      ["majority",10,1,6,2,15,1,11,2,14,1,2,1,3,1,10,1,7,1,10,1,7,4,45,2,1,1,33,1,12,6,11,1,7,1],
+      ["mall",47,1,67,1],
+      ["malleable",1,1,5,1,17,1,126,1],
+      ["mammal",10,1,4,1,3,2,31,1,23,6,4,5,3,6,22,1,25,1,2,1,8,2,3,3,3,1,3,1,10,1,31,2,2,2,15,3,8,1,3,1,3,1,4,1,2,1,1,3],
+      ["management",8,5,12,1,35,3,55,1,8,1,10,1,10,1,11,2,1,1,2,1,10,3,19,1,6,1,14,1,1,1,7,1],
+      ["managerial",8,1,144,2],
+      ["mandarin",77,1],
+      ["manipulate",1,1,55,1,33,1,5,2,72,1,1,1,17,1,16,1,12,1,7,2,7,1],
+      ["manoeuvre",3,1],
+      ["mantle",143,1],
+      ["manual",49,1,1,1,23,1,13,1,63,1,8,1],
+      ["manufacture",16,1,3,3,4,1,6,5,9,1,6,1,3,1,14,1,1,1,11,5,4,1,25,1,5,3,10,2,12,1,2,1,9,5,32,1,1,1,15,1,6,6,5,1,1,1,11,1,6,1,1,3,8,1],
+      ["manufacturer",1,1,15,1,7,1,6,2,9,1,4,1,4,1,27,1,24,2,43,3,54,2,23,1,1,2,2,1],
+      ["marble",31,2],
+      ["margin",59,1,65,1],
+      ["maritime",21,1,23,1,79,1],
+      ["marker",22,1,109,1],
+      ["marketplace",55,1,21,1,90,1,22,1],
+      ["marsh",35,2],
+      ["marsupial",144,1],
+      ["marvellous",182,1],
+      ["mass",1,1,8,1,14,1,4,1,2,3,11,1,1,2,4,2,21,1,7,10,6,1,2,1,17,1,9,2,12,2,2,1,19,1,23,1,2,1,3,1,11,1,17,1,20,1,1,1],
+      ["massive",5,1,22,1,9,1,12,2,49,2,40,1,4,1,13,1,62,1],
+      ["mastery",2,2,151,1,10,1],
+      ["match",10,1,8,1,7,3,17,1,15,1,5,1,26,1,1,3,9,1,10,1,10,2,13,1,43,1,10,1],
+      ["mate",14,2,38,1,58,1,11,1,33,1,50,1],
+      ["material",1,11,4,1,5,1,9,9,2,1,2,4,3,1,3,7,1,1,8,1,2,1,7,3,14,1,1,12,17,1,7,2,1,1,3,1,17,6,4,2,5,1,1,1,5,1,1,3,1,1,1,2,3,1,1,5,5,2,8,2,9,1,2,1,4,1,11,1,5,1,22,4,1,2,10,1,11,2,8,1,1,3],
+      ["materialistic",63,1],
+      ["maternal",14,1,97,1],
+      ["mature",22,1,12,2,15,1,59,2,7,1,28,1,31,1,15,1],
+      ["maturity",110,1,64,1,31,1],
+      ["maximise",5,1,113,1,2,1,66,1,38,1],
+      ["maximum",24,1,49,1,37,1,22,1,24,1,5,2],
+      ["meadow",84,4,98,1,41,1],
+      ["meagre",109,1],
+      ["meaningful",37,1,17,1,31,2,37,1],
+      ["meantime",30,1,86,1],
+      ["meanwhile",1,1,12,1,22,1,10,1,19,1,7,2,13,1,1,1,78,1,42,1,16,1],
+      ["mechanic",35,1],
+      ["mechanical",173,1,25,2,16,3],
+      ["mechanism",7,1,10,1,56,2,19,1,16,1,24,1,2,2,33,1,18,1,22,1,2,1,3,1,9,2],
+      ["medical",11,14,5,6,1,4,6,1,5,1,2,1,9,4,4,1,15,1,14,3,8,1,3,2,11,1,17,3,9,1,11,1,6,1,21,1,5,1,26,1,2,3,6,1,23,2],
+      ["medication",53,2,125,1,42,1],
+      ["medieval",38,1,119,1,31,1,2,2,21,5],
+      ["mediocre",96,1,13,1,42,1],
+      ["mediterranean",38,2,13,3],
+      ["medium",7,3,36,1,9,1,15,1,19,1,11,1,6,1,4,1,19,1,2,1,11,1,2,1,25,1,5,1,9,1,8,1,1,1,17,2,8,3],
+      ["melt",1,1,28,1,50,1,40,1,13,1,32,2,53,1,1,1],
+      ["membership",55,1,97,1],
+      ["memorise",58,1,102,1],
+      ["menace",69,1],
+      ["mental",14,1,3,2,3,2,17,1,6,1,4,1,16,1,18,1,2,1,11,1,4,1,8,1,21,1,23,1,31,1,8,1,11,4,6,1],
+      ["mention",0,2,18,1,22,1,21,1,11,1,16,1,9,1,26,1,58,1,27,1,3,1,12,1],
+      ["mentor",122,1],
+      ["mercury",34,1,100,1],
+      ["mere",10,1,11,1,56,1,6,1,7,1,10,1,6,1,3,1,36,1,22,1,4,1,32,1,7,1,2,1],
+      ["merely",2,1,43,1,9,1,31,1,61,1,61,1,10,1,4,1],
+      ["mess",184,1,12,1],
+      ["metaphor",145,1,4,1,54,1],
+      ["methane",164,1],
+      ["metro",31,1],
+      ["microcosm",33,1],
+      ["microscope",5,1,2,2,132,1,51,1],
+      ["midst",17,1,208,1],
+      ["migrant",40,1,36,4,45,2,9,1],
+      ["migrate",21,1,31,1,4,1,20,1,33,1,12,6,47,2],
+      ["migration",40,6,16,2,39,1,26,4,9,5,37,1,1,3,44,1],
+      ["migratory",130,2,14,1],
+      ["mild",158,4,56,1],
+      ["milestone",64,1],
+      ["military",23,1,41,1,65,1,27,1,3,1,2,1,8,1,42,2],
+      ["mineral",69,1,18,1,27,1,2,1,9,1,40,1,8,1,4,1,24,1,17,3],
+      ["mingle",14,1,98,1],
+      ["minimal",33,1,19,2,18,1,20,1,61,1,12,1,16,1,1,1],
+      ["minimise",66,1,54,1,104,1],
+      ["minimum",94,1,7,1,17,1,4,1,12,1,15,1,13,1],
+      ["minister",44,1,44,1,21,1,13,1,49,1,8,1,15,1],
+      ["ministry",49,4,42,1,42,1],
+      ["minority",54,1,2,1,39,4,58,1,33,2],
+      ["miracle",5,1,59,1,73,1,26,1],
+      ["misconception",45,1,26,1,16,1,64,1,37,1],
+      ["mission",13,4,110,1,19,7,22,1,13,3],
+      ["mixture",29,4,22,1,11,2,16,1,8,1,21,1,22,1,88,1,1,5],
+      ["mock",171,1],
+      ["moderate",9,1,42,1],
+      ["moderately",172,1],
+      ["modernism",195,1,10,1],
+      ["modification",22,1,185,2],
+      ["modify",10,1,117,1,3,1,13,1,22,1,42,1,2,1,9,1],
+      ["moist",112,1],
+      ["molecule",19,2,52,1,9,1,49,1,30,1,18,1,49,1],
+      ["momentum",36,1,19,1,65,1],
+      ["monitor",24,1,30,1,46,1,3,1,17,1,2,1,58,2,21,2],
+      ["monopoly",66,2,11,1,11,5,130,1],
+      ["monster",25,1,152,1],
+      ["monumental",44,1,6,1,119,1],
+      ["mood",18,1,25,1,17,1,11,1,10,3,74,5,2,1,15,1,32,2],
+      ["moral",87,1,15,1,44,1,25,3,11,1,17,1],
+      ["mortality",99,1,4,1],
+      ["mosquito",101,2,36,5,47,1],
+      ["moss",38,1],
+      ["motion",5,1,47,5,5,1,34,1,41,1,42,1,18,1],
+      ["motivate",8,2,29,1,44,1,33,1,13,1,48,1],
+      ["mould",19,1,10,2,36,1,42,1,20,1,12,2,11,1,45,1,16,1,6,1,1,1],
+      ["mount",55,1,14,2,18,1,10,1,24,1,1,1,22,1,22,1,43,1],
+      ["mountainous",99,1],
+      ["muddle",162,1],
+      ["multinational",104,1,58,3],
+      ["multiple",26,2,18,1,40,1,14,1,28,1,6,1,7,1,12,1,9,1,36,1,1,1,17,1],
+      ["multiply",7,1,26,1,15,1,21,1],
+      ["mundane",182,1],
+      ["municipal",112,1,22,2,17,1],
+      ["muscle",3,1,49,1,7,1,30,1,5,1,6,1,72,1,3,1,14,1,11,1,16,3,4,3],
+      ["mushroom",133,4,6,3],
+      ["mutual",139,1],
+      ["mysterious",27,1,45,1,51,1,88,1,14,1],
+      ["naked",67,1,113,1],
+      ["nasty",157,1,56,1],
+      ["nationality",76,1,81,1],
+      ["native",1,2,3,2,12,1,7,2,9,1,6,1,10,1,2,1,4,1,21,1,13,1,2,1,5,2,8,7,7,1,25,5,1,3,2,5,3,15,2,3,1,1,18,1,17,1,7,1,1,1,6,2,1,1,8,5,5,2,9,1,7,1,1,1],
+      ["natural",1,1,5,1,6,1,4,3,3,2,3,1,16,9,1,2,1,2,3,2,4,1,1,1,4,1,9,1,1,1,1,1,5,1,1,1,3,2,3,1,2,1,2,2,5,1,2,1,3,1,7,1,9,1,3,11,3,3,4,1,2,1,2,3,1,3,2,4,1,1,1,2,1,2,1,1,5,1,4,2,1,2,4,2,10,1,14,2,3,3,8,1,5,1,7,1,3,1,2,1,20,3,1,4,1,1,1,1,3,1,2,1,2,1,1,1,1,8,2,1],
+      ["naturally",6,1,20,1,4,1,8,1,1,1,8,1,38,1,14,1,6,1,3,2,40,1,2,1,57,1],
+      ["navigation",35,1,29,1,57,2,9,1,29,1,9,4],
+      ["necessarily",40,1,16,1,2,1,5,1,9,1,3,1,12,1,4,1,7,2,16,1,17,1,10,1,5,1,7,1,25,1,37,1],
+      ["necessity",13,1,104,1,6,1,4,1,24,1,16,1,3,1,42,1],
+      ["negative",8,2,12,1,21,1,40,1,1,1,14,1,2,1,18,1,4,1,21,1,7,1,13,1,17,1,8,1,39,1],
+      ["neglect",8,2,1,1,27,1,36,1,48,1,37,1,6,1,8,2,37,2],
+      ["negotiate",54,1,102,1,22,1],
+      ["neoclassical",8,5],
+      ["nerve",17,1,137,1,4,1,58,1],
+      ["neutral",34,1,18,1,96,2,8,1,18,1],
+      ["nevertheless",40,1,1,1,20,1,5,1,12,1,27,1,16,1,4,1,2,1,6,1,6,2,1,1,6,1,4,1,4,1,46,1,5,1,4,1,9,1,3,1],
+      ["normal",3,4,17,1,4,2,10,1,14,1,13,1,10,1,7,1,24,1,23,1,5,2,21,1,3,1,45,1,5,2],
+      ["notable",30,1,1,1,131,1,46,1,16,1],
+      ["noticeable",177,1],
+      ["notify",214,1],
+      ["notion",9,1,5,1,10,1,17,1,2,1,31,1,19,2,1,1,4,1,2,1,7,1,15,1,28,1,2,1,15,2,31,1,2,2,5,1,6,1,1,2,11,1],
+      ["notoriety",34,1],
+      ["nourish",133,1],
+      ["novice",57,2,106,2],
+      ["nuclear",192,1],
+      ["numerous",10,1,18,1,8,2,2,1,53,2,20,1,9,1,2,1,40,1,8,1,10,1,17,1],
+      ["nursery",84,1,4,1,69,1],
+      ["nurture",186,1],
+      ["nutrient",24,1,9,1,57,1,18,1,27,1,8,1,58,1,23,1],
+      ["nutrition",16,1],
+      ["nutritional",48,1,28,2],
+      ["nutritious",143,1,83,1],
+      ["oak",84,1],
+      ["object",1,1,26,1,5,1,15,1,10,1,1,1,4,1,9,2,7,2,14,6,1,1,5,2,8,1,5,1,5,1,2,1,16,1,8,4,4,1,10,1,1,1,10,1,2,1,7,1,1,1,10,1,24,1,1,1,2,1,8,1],
+      ["objection",151,1],
+      ["objective",8,3,55,1,10,4,73,1,76,1],
+      ["obligation",54,1,93,1,41,1],
+      ["obscurity",111,1,102,1],
+      ["observation",14,2,12,1,10,5,46,1,34,1,9,1,38,1,3,1,11,2,6,1,15,1,12,1,6,1],
+      ["observe",3,3,2,1,7,1,6,1,4,1,2,1,12,1,21,4,2,1,2,1,7,1,21,1,24,1,13,1,1,1,1,2,3,1,17,1,6,2,1,1,5,1,8,1,7,1,5,2,3,1,7,1,7,1,1,1,2,2,11,1],
+      ["obsession",9,1,38,1,97,1,44,1,27,1],
+      ["obstacle",40,1,91,1,11,1,17,2,55,2],
+      ["obstruct",120,1],
+      ["obtain",13,1,6,1,13,1,30,1,8,1,7,1,2,4,5,1,37,1,2,1,14,2,3,1,16,1,10,1,2,1,6,1,4,1,2,1,21,1,9,1],
+      ["occasion",4,1,81,1,28,1,23,1,82,1],
+      ["occasional",103,1],
+      ["occasionally",67,1,3,1,71,1,20,1,48,1,1,1,13,1],
+      ["occupation",4,1,36,8,65,1,42,1,50,1,13,1],
+      ["occupy",64,1,29,1,3,1,34,1,13,1,4,2,2,1,6,1,26,1,1,1,43,1],
+      ["occur",3,1,2,1,6,1,3,1,4,3,20,1,5,3,4,1,4,1,5,1,4,4,16,1,3,1,11,1,5,1,1,1,3,1,7,1,1,1,2,1,12,1,1,1,2,4,8,1,6,1,18,1,5,1,14,1,2,1,4,1,3,1,1,4,2,2,9,1,2,1,4,1,2,2,3,2,1,1,2,1,4,2,7,1,2,1,1,1],
+      ["odd",1,3,23,1,110,1,27,1,4,1,7,1,15,1,3,1,19,1,14,1],
+      ["odour",71,2,7,2,77,2],
+      ["offend",157,1],
+      ["offset",52,1,70,1],
+      ["offspring",14,2,88,1,19,1,78,1],
+      ["ongoing",70,1,10,1,63,1,26,1],
+      ["onwards",15,1,196,1],
+      ["opaque",30,2],
+      ["operate",13,1,42,3,7,1,55,1,5,3,11,2,14,2,9,1,3,1,3,1],
+      ["opponent",118,1,38,4,22,3,15,1],
+      ["opportunity",6,1,3,1,5,1,2,1,20,1,17,1,2,1,19,1,1,1,9,1,1,1,32,1,5,3,2,1,35,1,18,1,8,2,3,1,17,1,21,1],
+      ["oppose",16,1,56,1,42,1,64,1,9,1,7,1],
+      ["opposite",26,1,10,2,49,2,19,1,9,1,29,1,10,2,3,1],
+      ["optic",111,2],
+      ["optimism",37,1,107,1],
+      ["optimistic",70,1,86,1,53,1],
+      ["optimum",173,1,22,1],
+      ["option",3,1,18,1,12,1,37,2,6,2,56,1,2,2,18,1,4,1,6,1,8,1,30,1],
+      ["optional",185,1],
+      ["orbit",13,1,103,4,26,4,35,3,24,1],
+      ["orchestra",44,1],
+      ["organ",30,1,35,1,6,1,7,1,16,1,16,1,49,1,26,2,22,1],
+      ["organic",22,1,40,6,3,1,43,1,14,1,74,1,25,1],
+      ["organism",5,2,19,1,21,1,7,3,10,1,27,1,12,1,26,1,10,1,2,4,2,2,14,1,10,1,8,2,4,3,36,1],
+      ["organize",83,1,1,1,47,3],
+      ["orientate",57,1,73,1],
+      ["orientation",45,1,85,4],
+      ["origin",22,1,1,1,11,1,6,1,1,1,5,1,1,1,12,2,29,1,19,1,2,1,16,6,30,1,2,1,1,1,14,1,5,1,5,1,10,1,16,12,5,1,6,2,3,3,3,1],
+      ["original",0,1,16,1,2,1,4,1,6,1,2,1,4,1,10,2,6,1,6,2,11,1,19,3,3,1,8,1,32,1,3,1,1,1,4,1,11,1,9,2,12,2,1,1,12,2,19,1,6,1,16,1],
+      ["originate",2,1,36,1,29,1,32,1,38,1,4,1,16,1,1,1,34,2,3,1],
+      ["ornament",125,1],
+      ["ornamental",65,1],
+      ["orthodox",72,1],
+      ["otherwise",3,1,15,1,4,1,19,1,19,1,3,1,5,1,2,1,2,1,23,2,6,1,1,1,13,1,10,1,27,2,4,1,2,1,20,1,21,1,16,1],
+      ["ounce",27,1,92,1],
+      ["outcome",34,1,3,1,28,1,5,1,2,1,13,2,4,1,62,1,1,1,2,1,2,1,3,1,13,1,6,1,6,1,3,1,22,1],
+      ["outline",42,1,14,1,39,1,3,3],
+      ["outlook",109,1],
+      ["outpost",13,1],
+      ["output",6,1,9,1,119,1,6,1,31,1,23,1,26,1],
+      ["outward",172,1],
+      ["outweigh",178,1],
+      ["overall",36,1,7,1,6,1,11,1,23,1,2,2,25,1,12,1,4,1,9,1,35,1,2,2,26,1,21,1],
+      ["overcome",1,1,11,1,40,1,1,1,9,2,14,1,23,2,28,2,70,1],
+      ["overestimate",170,1],
+      ["overgraze",90,1],
+      ["overlap",64,1,146,2],
+      ["overlapping",64,1,124,1],
+      ["overseas",28,1,52,1,37,2,19,1],
+      ["overshadow",194,1],
+      ["overview",46,1],
+      ["overweight",24,1,19,1],
+      ["overwhelm",11,1,15,1,122,1,23,1,3,1,14,1,5,1,3,1],
+      ["owe",160,1],
+      ["owl",103,10],
+      ["oxide",38,1],
+      ["oxygen",5,1,8,1,35,4,4,1,39,1,15,2,36,1,22,6,52,1,4,1],
+      ["pack",53,2,44,2,9,2,12,1,11,1,4,1,5,1,2,1,4,1,1,1,4,2,53,1,1,1],
+      ["pad",107,1,47,1],
+      ["pamphlet",99,1],
+      ["panic",77,1,100,1],
+      ["parallel",47,1,39,2,23,1,55,1,5,1,49,1],
+      ["paralysis",98,1],
+      ["paramount",55,1],
+      ["parental",110,1,11,1,90,1,14,3],
+      ["parliament",15,3,1,2,201,1],
+      ["partial",56,1,57,1,27,1],
+      ["participant",18,3,8,3,28,1,9,1,19,2,3,5,13,2,8,1,20,1,26,2,1,1,2,2,26,2,3,1],
+      ["participate",13,1,13,1,28,1,10,1,84,1,4,1,24,1,43,1],
+      ["participation",8,3,41,1,17,1,56,1,9,1],
+      ["particle",65,1,14,1,1,4,44,3,56,3,34,1,12,1],
+      ["particular",0,1,8,1,1,2,10,1,13,2,2,1,4,1,4,1,10,2,1,2,4,1,1,1,4,1,5,2,1,3,1,2,6,1,1,2,1,1,1,2,2,1,1,2,1,1,6,1,1,1,9,1,10,1,14,2,7,1,2,2,4,1,4,1,5,1,3,1,1,1,1,1,3,1,3,2,4,1,2,1,1,1,3,1,2,1,8,2,11,2,2,1,3,1,2,1,13,2,1,1,4,1,1,1,10,1],
+      ["particularly",4,1,4,1,1,1,4,1,3,1,6,1,1,1,4,1,22,1,5,2,9,1,16,1,2,1,2,1,3,1,2,1,6,1,14,1,6,2,2,1,11,2,2,1,2,1,2,2,6,2,4,1,7,2,7,2,4,2,13,1,1,1,7,1,1,1,4,1,4,2,1,1,2,1,11,1,9,1,3,1,1,1,1,1,5,1,1,2],
+      ["passionate",122,1,15,1],
+      ["passport",161,1],
+      ["pasture",90,2,34,1,19,1,51,1,30,4],
+      ["patent",23,1,9,1,6,1,24,2,35,1],
+      ["pathway",37,4,18,1,166,1],
+      ["patriotic",157,1],
+      ["patronage",188,1],
+      ["pattern",3,3,11,1,4,1,3,1,6,2,12,6,4,2,4,2,16,1,3,1,10,2,1,1,2,1,2,3,8,1,5,1,1,1,2,3,2,3,1,1,10,1,16,1,2,1,2,1,6,1,2,1,1,1,6,1,2,2,3,1,2,1,3,2,1,1,9,1,2,2,12,1,1,1,10,1,7,1,4,3,1,1,1,1,3,2,6,2,2,1,2,2,4,2],
+      ["pavement",96,1,55,1],
+      ["payment",20,1,13,1,3,1,8,1,69,1],
+      ["pearl",4,1,104,63],
+      ["pedestrian",63,1],
+      ["penetration",21,1,141,1],
+      ["pepper",158,11,24,1],
+      ["perceive",6,1,50,1,9,1,6,1,7,1,4,1,11,2,1,1,62,1,11,1,6,1,1,1,10,1,22,2,3,1,3,1],
+      ["percentage",49,1,50,1,31,3,18,1,14,1,3,1,13,1],
+      ["perception",2,1,24,3,28,1,39,16,5,1,23,1,45,1,40,3,3,1,15,1],
+      ["perform",2,1,1,5,3,2,2,1,4,1,1,6,31,3,11,1,1,1,1,2,1,1,7,2,6,1,1,1,6,1,2,1,7,1,11,1,10,1,6,1,7,2,1,1,6,1,30,1,1,3,4,2,18,2,7,1,9,4,3,1,4,1,16,1,4,1],
+      ["performance",2,2,4,18,2,1,3,1,1,3,1,3,4,1,18,1,9,4,5,4,79,1,3,1,15,1,7,1,6,1,4,1,3,1,2,1,2,1,2,2,25,3,22,6],
+      ["perimeter",50,1],
+      ["periphery",205,1],
+      ["permanent",13,1,12,1,3,1,27,1,35,1,57,3,23,5,17,1,32,1],
+      ["permeate",15,1,33,1,72,1],
+      ["permission",70,1,21,1,31,1],
+      ["perpetuate",222,1],
+      ["perplex",183,1,7,1],
+      ["persist",39,1,96,1,8,1,6,1,4,2,24,1,30,2],
+      ["personal",9,2,2,1,4,1,11,2,62,1,7,2,3,2,13,2,5,2,10,1,23,1,14,1,9,4,33,2,4,1],
+      ["personality",20,1,16,4,45,4,90,1,54,2],
+      ["personalize",9,1,189,1],
+      ["personnel",153,1,9,1],
+      ["perspective",8,2,5,1,27,1,1,1,37,1,56,2,14,1,11,1,28,1],
+      ["persuade",42,1,14,1,15,1,24,1,4,1,39,1,8,1,33,1,21,1,2,1],
+      ["pervasive",214,1],
+      ["pest",51,1,50,2,34,1,3,3,35,1,14,1,6,13,9,3],
+      ["pesticide",51,1,52,1,90,1,8,2,25,1],
+      ["petrol",96,1,16,1],
+      ["petroleum",96,1,29,1],
+      ["phenomenon",25,2,1,4,8,1,2,1,3,1,8,1,2,2,6,1,2,1,34,1,33,2,2,1,15,1,7,1,17,1,15,1,1,1,19,1,14,1,7,1],
+      ["philosophy",0,1,82,2,29,3,5,2,2,1,16,1,4,1,7,1,15,1,8,1,22,2,12,1,1,1],
+      ["photography",26,3,189,1],
+      ["physical",14,1,3,1,3,1,23,3,9,1,5,1,6,2,9,2,11,1,4,1,7,1,4,1,2,1,4,1,16,2,35,1,12,1,1,1,17,1,4,1,11,1,12,1,2,1,10,2],
+      ["physician",11,1,53,1,8,1,39,4,5,3,9,1,43,1,45,1],
+      ["picturesque",41,1,46,1],
+      ["pilot",37,1,84,1,32,1,8,4,28,2,8,1],
+      ["pine",103,1,14,3],
+      ["pirate",182,1],
+      ["pitch",2,2,16,1,41,4,24,1,17,5,3,1,81,1,20,3],
+      ["plaster",29,1,43,1,97,1,4,2],
+      ["plastic",7,1,12,16,10,2,1,1,38,1,12,1,24,1,10,1,11,1,86,1,15,1],
+      ["plateau",27,1,13,1],
+      ["platform",44,3,117,1],
+      ["plausible",75,1,115,1],
+      ["plot",26,1,43,1,18,1,22,1,62,1,4,1,7,1],
+      ["plough",66,1,36,1,97,1],
+      ["plus",46,1,36,1,35,1,105,1],
+      ["point",1,8,1,1,4,2,1,1,4,1,1,1,5,1,3,1,1,2,1,1,2,2,3,1,3,1,1,1,7,1,1,1,2,1,3,2,3,1,2,1,9,1,2,3,1,2,2,1,4,1,1,1,4,1,3,3,1,1,8,2,2,1,3,1,8,1,3,1,1,1,1,1,10,1,2,1,2,1,3,1,2,2,9,4,3,1,1,2,4,1,4,1,2,1,2,3,2,2,2,2,2,1,1,1,4,2,1,1,1,1,1,1,6,1,6,2,6,1,1,1,1,1,2,1,1,2,1,2,1,1,1,1,13,1,3,1,2,1,1,1,1,2,2,1,1,1,1,1,1,1,2,1,3,1,1,2,2,1,1,1,1,2],
+      ["poison",53,1,50,2,34,1,1,3,1,1,54,3,9,3,21,1,1,2],
+      ["poisonous",139,1,4,2,50,1],
+      ["polish",46,1,52,1,109,1],
+      ["poll",219,1],
+      ["pollinate",65,1],
+      ["pollution",31,1,20,1,8,1,43,1,6,1,91,1],
+      ["populace",99,1],
+      ["popularity",16,2,13,1,9,1,16,1,7,1,5,1,65,2,26,1,25,1,2,1],
+      ["popularize",45,1],
+      ["populate",39,1,9,1,42,1,45,1,12,1],
+      ["portable",0,1,191,1],
+      ["portion",18,2,86,1,9,1,3,1,32,1,44,1],
+      ["position",6,1,1,1,8,1,1,1,12,1,2,1,43,1,7,1,2,1,9,1,10,1,11,1,3,1,6,3,1,2,8,2,1,6,13,1,12,2,3,1,2,1,7,1,6,1,6,1,17,1,4,1,4,1,2,2,18,1],
+      ["positive",3,1,17,2,17,2,16,1,2,1,27,1,3,3,11,1,2,1,16,1,2,1,4,1,11,1,17,1,7,2,6,1,15,1,2,1,8,1,39,3],
+      ["possess",6,1,15,1,1,1,32,1,3,1,1,1,14,1,6,1,9,1,21,2,8,1,14,1,18,1,1,1,34,1,14,1,24,1],
+      ["possession",10,1,19,1,18,1,16,1,67,1,19,1,41,1],
+      ["posture",60,2,14,1,36,1,106,1,6,1],
+      ["potential",6,2,2,1,8,1,2,1,5,1,3,2,2,1,5,1,8,1,12,1,9,2,7,1,14,1,6,2,10,2,4,1,13,1,4,1,11,1,1,4,10,2,1,1,13,1,6,1,4,1,4,1,4,1,5,1,19,1,3,2,8,1,8,2,2,1,3,1,2,1],
+      ["pour",29,1,22,1,28,1,34,1,12,1],
+      ["poverty",41,1,23,1,37,1,8,1,3,2,41,1],
+      ["practical",53,1,14,1,6,1,1,1,12,1,11,1,5,1,5,1,12,1,1,1,6,1,8,1,16,1,9,1,32,2,8,1,18,1],
+      ["practically",106,1],
+      ["pragmatic",86,1,79,1],
+      ["precede",73,4,11,1,9,1,76,1],
+      ["precipitation",124,3],
+      ["precise",10,1,50,1,20,1,7,1,2,1,76,1,3,1,3,1,19,1,11,1,16,1],
+      ["precision",1,1,1,1,4,1,46,1,17,1,9,1,70,1,23,1,30,3],
+      ["predator",10,1,17,1,13,1,12,2,13,1,24,10,2,1,12,3,7,5,11,1,14,1,3,4,12,1,4,4,4,1,16,1,13,1,15,4,14,1,4,1,1,1,1,3,1,1,1,1],
+      ["predatory",21,1,70,1,96,1,6,1,29,1],
+      ["predict",8,1,5,1,11,1,36,1,9,5,13,1,3,1,49,1,21,1,1,2,3,1],
+      ["predictable",128,1,54,1,4,1,12,1],
+      ["prediction",75,1,20,2,60,1,1,1,53,1],
+      ["predominant",127,1,8,1,12,1,73,1],
+      ["predominantly",36,1,11,1,21,1,40,1],
+      ["predominate",138,1,64,1],
+      ["preface",87,1],
+      ["preference",0,1,39,1,37,2,22,1,4,1,53,3,12,4,4,1,13,2,15,1,13,4,3,1],
+      ["preliminary",24,1,13,1,28,1],
+      ["premier",9,1,35,1],
+      ["premise",120,1,43,1],
+      ["premium",66,1,62,1,96,1],
+      ["preparation",21,1,11,1,6,1,120,2,4,1,52,1,12,1],
+      ["prepare",0,1,13,2,19,1,21,1,7,1,5,1,34,2,8,2,27,1,22,1,7,4,23,1,32,1,7,1],
+      ["prerequisite",162,1,44,1],
+      ["prescribe",36,1,165,1],
+      ["prescription",16,1,37,1,85,1,63,1,1,1,12,1,6,1],
+      ["presence",5,1,2,1,6,3,27,2,29,1,32,1,68,1,8,1,14,1,30,2],
+      ["presentation",0,1,11,1,19,1,98,1,27,1,26,2],
+      ["preserve",13,1,8,1,6,1,5,5,8,1,5,3,2,1,14,6,18,1,7,1,2,1,6,1,1,1,4,1,8,1,1,1,4,1,3,3,28,1,4,1,11,1,11,2,19,1,22,2,5,1,11,1],
+      ["president",16,1,4,1,11,1,51,1,15,2,19,1,18,1],
+      ["pressure",19,1,1,1,9,1,13,4,17,2,1,1,5,1,7,2,3,1,4,1,34,1,2,1,6,2,3,1,9,1,16,1,2,1,3,1,18,1,5,1,3,1],
+      ["presumably",2,1,19,1,166,1],
+      ["pretend",92,1,79,1],
+      ["prevail",6,1,159,1,3,1],
+      ["prevalence",76,2,94,1],
+      ["prevalent",94,1],
+      ["preventative",16,1,175,2],
+      ["previous",23,1,7,1,2,1,10,1,5,1,2,1,31,1,33,1,38,1,4,1,12,1,2,1,16,1,25,1,2,1],
+      ["prey",14,1,13,1,32,2,30,2,2,1,12,4,7,1,15,1,2,1,11,7,3,2,33,1,28,7,20,2,1,4],
+      ["primarily",15,1,11,1,3,1,26,1,12,2,29,1,3,3,13,1,56,1,19,1,7,1,19,1],
+      ["primary",54,1,19,1,1,1,50,1,29,1,2,1,3,1,5,1,16,1,7,1,18,1,22,1],
+      ["prime",88,1,8,1,26,1,21,1,3,1,28,1,15,1],
+      ["primitive",22,1,5,1,2,2,9,1,45,1,16,1,14,1,2,1,24,1,21,2,25,1],
+      ["principal",49,1,28,2,34,1,1,1,5,1,77,1],
+      ["principle",5,1,3,2,11,1,25,2,9,2,9,1,2,2,18,2,7,1,8,1,3,1,31,1,16,1,13,1,35,1,12,1],
+      ["prior",36,1,63,1,17,1,19,1,1,1,4,1,18,1,35,1],
+      ["priority",20,1,46,1,28,1,24,1,4,1,48,1,44,1],
+      ["privacy",172,3],
+      ["private",42,2,11,1,15,1,2,2,10,1,25,1,4,4,4,1,5,1,18,2,6,1,2,1,25,2,3,2,10,2,35,1],
+      ["privilege",41,1,46,1,66,1,60,1],
+      ["probability",20,1,36,1,37,1,69,1],
+      ["probable",40,1,74,1,73,1],
+      ["probe",13,2,56,1,52,1,6,1,15,1,3,2,32,3,4,1,22,2],
+      ["procedure",72,1,1,1,6,2,4,1,26,1,57,1,25,1],
+      ["proceed",105,1,47,1,15,1,7,1,38,1],
+      ["process",5,1,7,2,1,1,3,1,2,2,5,2,1,1,1,1,3,1,6,1,2,2,2,2,2,2,2,2,9,5,2,2,1,1,2,4,4,1,2,3,7,1,2,2,2,10,5,4,1,3,1,4,1,3,1,1,1,4,1,1,2,1,7,2,1,2,2,1,1,1,5,1,2,1,3,2,1,2,6,2,1,1,2,3,1,1,2,1,2,2,2,1,1,1,1,2,1,1,1,1,6,2,6,6,3,1,9,3,4,1,3,1,1,3,4,5,1,1,1,4,2,1,4,1,1,1,1,3,2,1,2,2,2,1,1,4,5,2,1,1,7,4,5,1,1,2,4,2,2,2,1,1,3,2,8,1,3,1,3,1,2,2],
+      ["procession",188,1],
+      ["processor",58,1,123,1],
+      ["productive",22,1,47,1,53,2,16,1,22,1,12,1,29,1,1,1],
+      ["productivity",22,1,79,1,32,1,39,3,29,4,19,1],
+      ["profession",11,6,5,1,21,1,69,1,34,1,11,2,12,5],
+      ["professional",4,1,5,3,2,12,4,2,23,1,3,1,32,1,13,1,5,1,18,1,11,1,2,1,4,1,19,1,15,1,2,1,7,1,6,1,1,1,27,1,16,2],
+      ["profile",22,1,33,1,14,1,92,1,27,1],
+      ["profit",55,2,7,1,21,1,4,1,3,1,76,2,25,1],
+      ["profitable",79,1,33,1,21,1,23,1,10,1],
+      ["profound",41,1,19,1,95,2,16,1,37,1,1,1],
+      ["prohibit",31,1,73,1,21,1,6,1],
+      ["prohibitive",53,1],
+      ["project",12,9,8,1,2,1,6,1,4,4,2,1,3,1,7,2,6,1,3,1,2,2,7,1,2,1,6,6,10,1,1,1,3,2,11,1,10,1,8,1,5,8,1,3,14,1,2,1,7,1,1,1,8,4,2,2,17,2,5,2,2,1,18,3,28,1],
+      ["prolonged",37,1],
+      ["prominence",148,1,22,1,44,1,12,1],
+      ["prominent",3,1,1,1,40,1,9,1,15,1,45,1,23,2,69,1,8,1],
+      ["promise",13,1,7,2,2,1,10,1,3,1,11,1,16,1,38,1,13,1,44,1,48,1,14,1],
+      ["promising",164,1,24,1,5,1,30,1],
+      ["promote",16,1,16,1,19,1,20,1,3,1,10,1,1,1,7,1,12,1,2,1,14,1,14,1,23,1,21,1,1,1,7,2,9,2,11,1,5,1,14,1],
+      ["promotion",8,1],
+      ["proof",53,1,19,1,47,1,18,1,7,1,64,1,13,1],
+      ["propagate",139,1],
+      ["propel",52,1,80,1,32,1,4,1,28,1],
+      ["property",3,1,12,1,4,1,4,1,17,1,1,1,11,1,5,1,5,2,39,1,11,3,4,1,2,3,1,2,3,1,3,1,11,1,4,1,20,1,7,1,34,1,11,1,2,1,8,2,4,1],
+      ["proportion",46,1,18,1,6,1,1,1,7,1,26,1,36,1,78,1],
+      ["proposal",84,1,1,1,12,1,19,1,37,1,61,1],
+      ["propose",13,1,4,1,8,1,15,1,8,1,38,1,47,1,12,1,7,1,3,1,1,1,8,1,4,3,1,1,8,1,10,1,5,1,4,1,7,1,7,2,12,1],
+      ["prosper",188,1],
+      ["prosperous",87,2],
+      ["prototype",80,1,40,1],
+      ["provided",0,1,1,2,14,1,6,1,4,1,19,1,23,1,1,1,25,1,6,1,2,2,9,1,8,1,10,1,8,1,3,1,14,1,7,1,8,1,2,1,4,1,18,1,8,2],
+      ["provision",86,1,5,1,71,1,11,1],
+      ["proximity",85,1,136,1],
+      ["psychiatric",175,1],
+      ["publicity",12,1,16,1,96,1,51,1],
+      ["pulverise",124,1],
+      ["pump",18,1,1,1,40,3,12,1,1,1,6,1,35,4,45,1,6,1,52,2],
+      ["punch",35,1],
+      ["purchase",30,1,11,1,35,2,6,1,40,2,14,1,4,1,12,2,49,2],
+      ["purify",120,1,106,1],
+      ["purpose",1,1,5,1,5,1,12,1,8,1,16,1,4,1,2,1,1,1,4,1,2,1,5,1,8,1,1,1,5,3,5,1,2,1,18,1,3,2,10,1,14,1,1,2,14,2,18,1,8,2,1,1,38,1,7,1,2,2],
+      ["pursuit",125,2,9,1],
+      ["qualification",49,1,96,1,3,1,55,1],
+      ["quantity",1,1,28,1,3,2,10,1,7,1,13,1,11,4,44,2,8,1,9,1,67,1,23,2,2,1],
+      ["questionnaire",18,1],
+      ["quota",140,1],
+      ["quote",37,1,109,1,2,2],
+      ["radiate",97,1,75,1],
+      ["radius",44,1],
+      ["rampant",137,1],
+      ["random",17,1,1,1,18,1,56,1,75,1,23,2,17,3,5,1],
+      ["range",3,1,7,1,2,1,2,1,2,2,3,2,7,1,2,1,10,1,10,1,1,1,3,1,9,1,3,1,1,1,3,1,5,1,2,3,2,1,1,1,2,2,2,1,2,1,2,1,4,1,4,1,1,1,2,1,5,1,7,1,1,2,5,1,3,1,10,2,12,3,1,3,2,2,4,1,4,1,3,1,7,1,1,1,6,1,6,2,6,1,11,1,3,1,1,1,1,1,2,2,1,1,6,2,1,1,8,1,5,1,2,1,2,2,1,1,2,1],
+      ["rank",47,1,100,3,60,1],
+      ["rarity",32,1],
+      ["ratio",61,1,28,1,64,3,14,2,45,2],
+      ["ration",99,1],
+      ["realistic",29,1,1,3,10,1,62,1,7,1,53,2,37,1],
+      ["realm",0,1,152,1,2,1,67,1],
+      ["rear",14,1,141,1],
+      ["reasonable",142,1],
+      ["recalcitrant",127,1],
+      ["recapture",82,1,48,2],
+      ["receipt",67,1,50,1],
+      ["receiver",180,2,1,1],
+      ["reception",157,1,12,1],
+      ["recipe",29,1,26,1,17,2,10,1,17,1,30,1],
+      ["recipient",86,1],
+      ["reckon",201,1],
+      ["recognition",11,1,47,3,10,1,6,1,24,2,19,2,28,1,22,1,3,1,33,1,1,1,8,1,8,1],
+      ["recognize",2,1,28,1,2,2,6,1,20,1,7,1,7,1,2,1,18,1,2,2,4,1,10,1,96,2,5,1,14,1],
+      ["recommend",43,1,5,1,5,1,19,1,22,1,5,1,1,1,100,1,1,2],
+      ["recommendation",24,1,75,1,21,1],
+      ["reconstruction",123,1],
+      ["recover",55,1,28,1,7,1,11,1,23,1,1,1,60,1,9,1,16,1],
+      ["recreate",1,1,29,2,79,1,64,1],
+      ["recreation",26,2],
+      ["recreational",26,2,185,1],
+      ["recruit",6,1,12,1,10,2,28,1,66,1,31,1,53,1],
+      ["rectangle",104,1,19,1],
+      ["rectangular",67,1,102,1],
+      ["recycle",19,1,6,1,82,1,27,7,39,1,22,1],
+      ["redevelopment",84,1,85,1,1,1],
+      ["reduce",10,1,5,1,22,1,11,1,4,3,4,1,9,1,9,1,9,3,6,1,7,1,1,1,24,1,5,1,7,3,1,2,4,1,15,5,2,1,3,1,2,1,12,2,2,1,4,2,3,1,3,1,6,1,1,1,4,1,5,1,2,1,3,1,1,1,1,1,7,2,2,1,7,1,1,2,2,2],
+      ["redundant",78,1,1,1,141,1],
+      ["refer",2,1,3,1,19,1,1,1,4,3,13,1,2,1,14,1,3,1,6,2,5,2,10,1,7,1,7,1,7,1,21,1,1,1,17,1,10,2,8,1,24,1,7,1,13,1,4,1,5,1,5,1],
+      ["referee",131,1],
+      ["reference",12,1,27,3,10,1,72,1,27,1,3,1,18,1],
+      ["refinement",87,1],
+      ["refresh",0,1],
+      ["refresher",162,1],
+      ["refreshment",155,1],
+      ["refusal",137,2],
+      ["regarding",40,1,55,1,23,1,30,1,7,1,28,1,22,1,3,1,2,1,3,1],
+      ["regardless",42,1,66,1,1,1,5,1,21,1,28,1,4,1,8,1,1,1,36,1,1,1],
+      ["region",0,1,2,2,19,3,2,1,6,1,2,1,2,1,13,1,2,1,2,2,7,1,7,3,5,1,2,1,5,4,2,1,1,1,13,1,1,1,3,3,3,2,1,1,1,1,14,1,6,2,2,1,1,1,9,1,4,1,1,1,1,1,2,1,1,1,2,1,3,1,26,1,1,1,2,2,1,1,3,1,1,1,4,2,8,1,4,1,5,1,20,1,1,2],
+      ["regional",64,1,54,1,4,1,15,1,10,1,4,1,27,1,13,2],
+      ["register",62,1,8,1,10,1,34,1,86,2],
+      ["regularity",207,1],
+      ["regulate",16,1,1,1,3,1,17,2,2,2,13,1,13,1,75,1,25,1,2,1,4,1,2,2,1,1,27,1,10,2,1,1],
+      ["regurgitate",10,1],
+      ["reinforce",5,1,117,1,1,1,28,1,25,1],
+      ["reinvigorate",112,1],
+      ["reject",8,1,36,1,12,1,37,1,2,1,10,1,3,1,63,1,7,1,37,1],
+      ["relate",11,1,8,1,1,1,2,1,2,2,2,1,8,1,6,1,3,1,9,1,2,1,2,1,12,1,2,3,2,1,6,1,4,1,9,1,5,1,3,1,1,1,6,2,5,1,8,1,1,1,4,1,23,2,25,1,2,2,15,1,17,1,2,2,6,1,7,1,1,1,2,1],
+      ["relation",3,1,5,1,7,1,5,1,8,1,27,1,22,1,9,1,36,1,30,1,46,1,26,1],
+      ["relative",7,2,3,1,12,2,6,1,24,1,6,3,13,1,7,1,17,1,5,1,6,1,9,1,12,1,1,1,5,1,14,1,12,1,9,1,22,1,32,1],
+      ["relax",12,1,27,1,13,1,40,1,20,1,19,1,7,1,8,2,26,2,9,1,21,1],
+      ["release",25,1,12,2,28,2,54,2,8,1,2,1,1,11,2,1,5,1,4,1,23,2,29,2,2,1,26,6,3,3],
+      ["relentless",6,1,31,1,102,1],
+      ["relevance",137,1,76,2],
+      ["relevant",75,1,53,1,24,1,26,1,27,1],
+      ["reliable",40,2,16,1,4,1,6,1,9,1,80,1,4,1],
+      ["reliance",116,1,46,3],
+      ["relief",16,1,4,1,15,1,37,2],
+      ["relieve",72,1],
+      ["religion",98,1,96,1],
+      ["relocate",110,1,46,1],
+      ["reluctant",85,1,22,1,81,1],
+      ["rely",15,2,1,1,4,2,13,1,15,1,5,1,7,1,5,1,5,1,1,2,2,2,5,1,18,2,1,1,27,1,6,1,10,1,5,1,3,2,4,1,10,3,1,1,3,1,2,1,3,1,27,1,3,1,2,1,5,1,8,1],
+      ["remain",0,1,1,1,1,1,2,1,2,2,1,1,6,1,1,1,2,1,1,1,4,2,6,1,4,2,2,1,5,1,2,3,3,1,2,2,1,1,4,4,1,1,1,1,4,1,1,1,9,1,1,1,1,1,4,1,1,1,1,1,1,4,2,1,5,1,2,1,3,1,1,1,7,1,1,1,1,1,1,1,1,2,2,1,2,1,2,3,3,1,5,2,2,2,2,1,4,3,1,1,1,2,2,1,10,1,2,2,3,1,3,1,1,2,1,1,3,1,5,1,1,1,3,1,3,1,2,2,6,1,1,2,8,1,3,1,5,2,3,2,4,3,4,1,5,1,2,1,5,1,1,1,1,4,3,1,4,2,2,1,1,2,1,1,1,1,1,2,2,1],
+      ["remark",1,1,210,1],
+      ["remarkable",45,1,7,2,13,1,28,1,16,1,2,1,10,1,2,2,12,1,2,1,2,1,20,2,5,1,46,1,3,1,4,1],
+      ["remedy",16,2],
+      ["remind",3,1,31,1,48,3,2,1,12,1,8,2,2,1,61,1,15,1,14,1,13,1,3,1,3,2],
+      ["remote",19,1,2,1,17,1,5,1,53,1,46,1,1,1,16,1,9,1,11,1,4,1,8,9,1,1],
+      ["removal",214,4],
+      ["remove",31,2,17,2,4,1,1,2,9,2,6,1,11,3,13,1,4,1,14,1,13,1,1,1,3,1,11,1,3,1,23,1,7,1,16,2,15,1,12,5,4,1,8,1],
+      ["renaissance",7,1,2,1,159,1],
+      ["render",30,1,39,1,146,1],
+      ["rendition",14,1],
+      ["renew",10,1,31,1,127,1],
+      ["renewable",5,1,112,1,5,1,73,1],
+      ["rental",118,1,52,1],
+      ["reorient",5,1],
+      ["repay",171,1],
+      ["repel",65,1,51,1,30,1],
+      ["repertoire",14,1,40,7,113,1,31,1,14,1],
+      ["replace",0,1,1,2,12,2,6,3,10,1,17,1,2,1,7,1,4,1,2,1,11,1,1,1,4,1,2,1,23,1,7,1,16,1,4,3,3,1,6,1,2,1,1,2,9,1,19,1,18,3,5,1,3,1,4,1,3,1,5,1,12,2],
+      ["replicate",119,1,9,1,37,1,56,1],
+      ["represent",8,1,2,1,14,1,2,7,17,1,4,1,2,1,11,2,4,1,3,2,3,1,14,1,1,1,8,1,6,1,3,1,14,1,2,1,4,1,24,3,3,1,2,1,6,1,10,1,3,2,17,1,12,1,6,1,7,1,1,1,2,2],
+      ["representative",80,2,30,1],
+      ["reproduce",5,1,2,1,34,2,56,2,22,1,8,1,11,1,3,1,24,1,2,1,35,1,5,1,5,1],
+      ["reptile",25,3,85,5,75,2,2,2,33,1],
+      ["reputation",4,1,29,1,1,1,10,1,27,1,7,1,57,1,22,1,37,1],
+      ["request",91,1,6,1,82,1,44,1],
+      ["require",0,1,2,4,11,1,3,1,4,1,16,1,2,3,2,1,9,1,2,1,1,1,1,1,2,5,2,1,5,1,2,1,2,1,4,1,5,1,6,2,4,1,1,4,6,1,1,1,3,1,1,1,2,1,3,2,4,1,1,3,6,1,5,1,2,1,1,1,3,1,3,1,2,1,1,1,1,1,1,1,2,1,6,1,2,2,2,1,2,1,6,3,10,1,1,1,1,2,4,1,4,1,4,1,5,2,3,1,3,1,2,1,2,1,3,1,1,1,2,2,2,2,1,1,13,1,5,1,3,1,1,1],
+      ["requirement",13,1,39,1,10,2,56,1,2,1,1,1,10,1,91,1],
+      ["requisite",73,1],
+      ["resemble",8,1,9,1,12,2,38,2,12,1,10,1,21,1,29,1,38,1,21,1,26,1],
+      ["reservation",31,1,169,1],
+      ["reserve",35,1,50,1,25,1,44,1,23,1],
+      ["reserved",77,1,8,1,20,1,3,1],
+      ["residence",11,1,15,1,15,1,106,1,22,2],
+      ["resident",14,6,12,3,5,1,13,1,3,1,16,1,7,4,6,1,8,1,12,1,6,1,16,3,17,1,58,1,6,1],
+      ["residential",50,1,85,1,12,1],
+      ["resilience",20,1,111,1],
+      ["resist",14,1,100,1,36,1,13,1,37,3],
+      ["resistance",49,1,3,2,23,1,37,1,27,1,1,1,37,1,14,1,30,2],
+      ["resistant",19,1,3,3,10,1,21,2,8,1,6,1,35,1,17,1,80,1,22,1],
+      ["resolve",32,1,34,1,32,1,24,1,3,1,20,1,4,1,7,1,25,1,1,1,21,1],
+      ["resort",87,1,47,1],
+      ["resource",6,1,16,1,6,1,10,1,12,1,3,1,2,3,18,1,8,2,6,1,9,1,12,1,9,1,4,2,1,2,2,1,3,1,1,1,5,1,8,1,3,1,8,3,1,1,9,2,10,1,9,2,5,2,3,3,20,1,12,1,3,1,2,1],
+      ["respect",14,1,1,1,1,1,27,1,4,1,26,2,13,1,9,1,4,1,6,1,13,1,31,1,1,1,2,1,8,1,12,1,3,1,11,1,4,1,2,1,19,1],
+      ["respond",5,1,58,3,20,1,17,1,6,1,5,1,3,1,6,1,5,1,1,1,2,1,2,1,9,1,7,1,8,3,1,1,7,1,4,1,1,1,6,1,1,1,2,2,10,1,20,4,6,1],
+      ["respondent",26,2,16,1],
+      ["response",3,5,4,2,5,1,2,1,4,1,19,1,5,1,17,1,4,2,2,1,6,1,1,1,6,1,4,1,1,1,2,1,7,1,3,1,5,1,20,1,1,1,4,1,8,1,5,1,8,4,2,1,1,1,6,2,7,1,12,2,24,1,2,1,2,1,4,3,3,1,12,4],
+      ["responsibility",8,4,4,1,110,2,9,1,78,2],
+      ["responsible",2,1,56,1,17,1,18,1,31,1,3,1,13,1,43,1,12,2,2,1,4,1,3,1,6,1,4,1],
+      ["restore",22,1,9,1,3,1,1,1,52,1,33,1,31,1,37,1,12,1],
+      ["restrain",119,1],
+      ["restrict",16,1,8,7,12,1,4,1,161,1,23,1],
+      ["restriction",24,8,88,1,49,1],
+      ["retail",42,1,21,1,19,2,15,2,43,2],
+      ["retailer",55,1,27,1,15,2,37,1,6,1],
+      ["retailing",30,1],
+      ["retain",6,1,4,1,18,1,10,1,12,1,7,1,19,1,43,1,6,1,26,1,12,1,2,1,1,1,20,2,32,1],
+      ["retire",109,1,84,1],
+      ["reveal",14,2,3,1,22,1,6,1,8,1,1,1,5,1,10,4,3,1,3,1,1,1,5,1,10,2,1,2,1,2,15,1,28,1,9,3,1,1,2,1,5,1,1,1,2,1,11,1,6,1,4,2,6,1,5,1,2,1,10,1,1,1,2,3,7,3,1,1,1,1,9,1],
+      ["revelation",100,1,54,1],
+      ["revenue",20,1,35,3,92,1,32,1,15,1],
+      ["reverse",18,1,55,1,26,1,11,1,41,1,36,1,13,3],
+      ["review",4,2,4,1,12,1,22,1,21,1,20,2,28,1,1,1,25,1,12,1,18,1,14,1,3,1,21,1,7,1],
+      ["revise",13,1,2,1],
+      ["revival",171,1,23,1],
+      ["revive",16,2,19,1,160,1],
+      ["revolution",5,1,2,1,16,1,16,1,2,1,23,1,30,1,2,1,1,1,2,1,13,1,28,1,6,2,8,2,24,1,16,1],
+      ["revolve",40,1,81,1,29,2,11,1],
+      ["reward",7,1,1,1,4,1,3,1,15,1,19,1,16,1,1,1,11,1,6,1,17,1,9,1,21,1,1,1,16,1,8,2,33,2,1,1,11,1,15,1,4,1,4,1],
+      ["rigid",8,1,11,2,4,1],
+      ["rigorous",100,1,28,1,35,2],
+      ["rim",159,1,18,1],
+      ["ripe",155,1],
+      ["ritual",23,1,8,1,20,2,53,3,22,1,21,1],
+      ["rival",66,3,10,1,46,1,34,1,60,1,1,1,2,1],
+      ["roam",90,1,48,2,6,1,26,1,32,2],
+      ["roast",32,1],
+      ["robotic",13,2,43,1,86,1,17,1,18,1,21,1],
+      ["robust",16,1,40,1,28,1,92,1,38,1],
+      ["roller",23,1,40,1,69,11],
+      ["romance",182,1],
+      ["rot",22,1,167,1],
+      ["rotate",1,1,78,1,14,1,68,3],
+      ["route",26,1,30,1,9,1,23,2,13,1,12,1,8,1,2,1,7,2,19,1,13,1,1,1,43,1,20,1],
+      ["routine",17,1,70,1,72,1,22,1,6,1],
+      ["rudimentary",1,1,106,1,76,1],
+      ["rural",87,1,15,1,3,1,15,1,17,2,42,3,12,2,8,1,19,1],
+      ["sack",83,1],
+      ["sacrifice",65,1,1,1,60,1],
+      ["saline",69,1,3,2],
+      ["salinity",69,4,111,1],
+      ["sample",36,1,14,1,29,1,9,1,3,1,22,1,16,3,14,1,2,1,3,1,3,1,4,1,10,1,12,3,15,1,4,1,4,1,1,2,2,1,7,4],
+      ["sanctuary",110,1,77,1],
+      ["scale",33,1,1,2,4,1,12,1,2,1,12,1,4,1,22,1,7,1,2,1,9,2,11,1,4,1,10,1,7,1,7,2,4,1,7,2,1,2,8,4,6,1,7,1,24,2,5,1,3,4,2,1,12,1],
+      ["scan",2,1,35,2,34,1,7,1,5,1,14,6,3,1,59,1,14,1,12,2,12,1,3,1,4,1],
+      ["scandal",9,2],
+      ["scarce",62,1,34,1,25,1,17,1,34,1,30,1,14,1],
+      ["scare",39,1],
+      ["scatter",30,3,38,1,22,1,45,1,24,1,21,3,21,1],
+      ["scent",65,9,6,5,7,5,47,1],
+      ["sceptical",53,1,19,1,103,1],
+      ["schedule",20,1,11,1,13,1,29,1,21,1,37,1,51,1],
+      ["scheme",16,1,19,1,30,1,32,1,116,1],
+      ["scholar",4,1,7,1,29,2,15,1,9,1,47,2,16,1,18,4,2,1,10,2,1,1,32,4,13,4,3,1,13,1],
+      ["scholarship",28,2,142,1],
+      ["scope",50,1,3,1,34,1,61,1],
+      ["score",37,1,69,3,47,2,23,2,8,4],
+      ["scour",25,1,66,1,103,1],
+      ["scout",56,1],
+      ["scrap",27,1,20,1,32,1,4,1,109,1],
+      ["scratch",115,1,39,1,25,1,35,2],
+      ["scream",161,1],
+      ["screen",9,1,9,1,46,1,15,1,3,1,32,1,8,1,29,1,19,1,11,1],
+      ["scrub",10,1,124,1],
+      ["scrupulous",86,1],
+      ["scrutiny",36,1,4,1],
+      ["sculpture",63,1,83,1,5,1,16,1,45,1,3,1],
+      ["seal",61,1,16,1,22,1,24,1],
+      ["seam",217,1],
+      ["secondary",49,2,9,1,3,1,53,1,41,1,31,1],
+      ["section",0,1,21,5,14,1,4,5,5,1,3,5,17,1,24,1,36,2,18,5,7,1,18,5,50,3,4,1],
+      ["sector",28,1,25,1,2,1,25,1,37,2,5,1,18,1,55,1],
+      ["secure",28,1,99,1],
+      ["security",85,1,43,1,46,1,48,1],
+      ["sediment",25,1,8,1,36,2,21,2,25,1,81,12,14,6],
+      ["seek",8,1,19,1,1,1,1,1,7,2,1,1,15,3,2,1,10,1,13,1,10,1,3,1,10,1,6,1,3,1,2,2,1,1,9,1,9,1,5,1,6,1,5,1,1,1,10,1,4,1,2,1,9,1,9,1,13,1,19,1,3,1,9,1],
+      ["seep",135,1],
+      ["segment",39,1,44,1,11,1,73,1,14,1,31,1],
+      ["select",3,1,3,1,16,1,4,1,6,2,22,1,10,1,36,1,6,1,16,1,26,1,7,1,15,1,3,1,6,1,25,1,1,1,2,1,15,1],
+      ["self-esteem",41,1,1,1,183,1],
+      ["semantic",86,1],
+      ["semester",80,1],
+      ["seminar",167,1,45,1],
+      ["senior",14,1,6,3,62,1,52,1,13,1],
+      ["sensation",3,2,158,1,29,1,34,1],
+      ["sensational",41,1,172,1],
+      ["sensible",153,1,7,1,40,1],
+      ["sensitive",11,1,26,1,2,1,20,1,6,1,3,1,3,2,1,1,6,1,5,1,3,1,17,1,51,1,26,1,8,1,13,1],
+      ["sensory",71,1,7,1,20,1,23,1,60,1,4,1,36,1],
+      ["separate",14,1,35,1,2,4,22,1,11,1,3,1,6,2,45,1,2,1,9,1,6,1,4,1,13,1,2,3,9,1,1,1,18,1,3,1,11,1,2,1],
+      ["sequence",18,1,34,1,109,1,35,1,9,2],
+      ["series",11,1,1,1,2,1,10,1,2,1,5,1,13,2,1,2,5,1,2,1,15,1,12,1,11,1,8,1,7,1,8,1,1,1,9,1,9,1,5,1,18,1,4,1,9,1,1,1,1,1,5,5,2,2,18,1,3,1],
+      ["service",0,1,5,1,10,2,40,1,15,1,7,1,8,2,9,1,3,1,13,1,3,1,4,1,17,1,13,3,8,1,7,1,4,3,6,1,15,1,4,6,10,1,18,1,4,1],
+      ["session",2,1,10,1,60,1,102,1,24,4],
+      ["setting",24,1,2,10,8,2,10,1,10,1,5,1,4,1,18,1,14,1,3,1,20,1,3,2,42,1,5,1,14,1,10,1,3,1,3,1],
+      ["settle",1,1,38,1,12,2,10,1,55,1,7,1,1,1,12,1,11,1,40,1,7,1,6,1],
+      ["severe",5,1,30,1,8,1,5,1,10,1,38,1,18,1,10,2],
+      ["shade",44,1,3,1,96,3,34,1,18,1,21,1,3,1,3,1],
+      ["shallow",7,1,14,1,31,1,27,1,15,1,16,1],
+      ["shareholder",33,1],
+      ["shark",1,1,4,2,47,1,92,1,38,1],
+      ["sharpen",26,1],
+      ["shatter",5,1,118,1],
+      ["sheer",94,1,34,1,54,1,8,1],
+      ["shell",1,2,20,1,17,1,6,7,1,1,1,1,1,3,3,1,58,3,15,1,4,1],
+      ["shelter",5,1,16,1,6,1,13,1,16,1,67,3],
+      ["shift",36,1,3,2,15,4,26,2,18,1,32,1,12,2,18,1,10,1,4,2,4,1,10,1,21,1],
+      ["shin",18,1],
+      ["shipment",66,1,74,1],
+      ["shore",110,1,11,1,4,2,55,1,12,1,3,1],
+      ["short-term",128,1,6,1,47,1],
+      ["shortage",9,1,18,1,72,1,23,1,2,1,18,1,11,1,9,1,59,1],
+      ["shorthand",190,1],
+      ["shrewd",171,1],
+      ["shrink",75,1,15,1,8,1,96,1],
+      ["shuttle",142,1,39,1],
+      ["sift",139,1],
+      ["signal",10,1,1,1,6,2,30,1,9,1,1,1,3,1,8,5,14,1,1,2,6,1,11,2,4,1,2,1,48,5,1,1,15,1,5,1,5,1,30,1,6,1,3,1,1,1,1,7],
+      ["signature",75,1,130,1],
+      ["significance",27,1,14,1,2,1,2,1,51,1,55,2,20,1,35,1,8,1],
+      ["significant",1,1,2,1,12,1,1,1,7,1,5,2,8,2,13,1,9,1,6,1,6,1,8,1,9,1,3,1,4,2,2,2,3,1,3,1,4,1,2,1,7,1,4,1,3,3,8,1,4,1,2,1,4,1,13,3,2,1,21,2,1,1,1,1,1,1,7,1,1,1,12,1,5,1,4,2,9,2,5,2],
+      ["silicon",129,1,36,1],
+      ["similarly",6,1,12,1,23,1,17,1,88,1,7,1,8,1,10,1,15,1,1,1,7,1,6,1,25,1],
+      ["simplicity",0,2,7,1,47,1,33,1,11,1,59,1],
+      ["simplistic",109,1],
+      ["simulate",13,1,17,2,78,1,81,1],
+      ["simulation",75,1,81,1,12,1,28,1],
+      ["simultaneous",98,1,64,1,6,1,13,1,16,1],
+      ["simultaneously",26,1,28,1,2,1,17,1,8,1,45,4,33,1,2,1,7,1,4,1,4,1,4,1,1,1,16,1],
+      ["sincere",64,1,80,1,31,1],
+      ["situated",44,1,1,1,35,1,4,1],
+      ["sizeable",44,1,90,1],
+      ["sketch",93,1,2,1,10,2],
+      ["skip",156,1],
+      ["skull",27,4,83,1,5,2,35,1,4,1,38,14],
+      ["skyscraper",63,1,70,3],
+      ["slash",33,1,55,1],
+      ["sleek",63,1,3,1,22,1],
+      ["slender",1,2,65,1,25,1],
+      ["slice",69,1,98,1,6,1,12,1,27,1],
+      ["slide",132,5,49,1],
+      ["slight",10,1,90,1,18,1,43,1,17,1],
+      ["slim",223,1],
+      ["slip",28,1,67,1],
+      ["slippery",16,1,84,1,82,1],
+      ["slope",69,1,46,1,17,1,12,1,52,1],
+      ["slum",112,1],
+      ["slurry",79,2],
+      ["smart",13,1,53,1,4,1,22,2,35,1,1,1,35,1,13,1,13,2,16,1],
+      ["smear",217,1],
+      ["smell",51,1,14,1,6,22,7,30,15,1,6,1,17,1,9,1,29,1,17,1],
+      ["smooth",21,1,31,1,5,1,50,1,14,1,92,1,4,1],
+      ["snack",70,1,130,2],
+      ["snap",59,3,42,1,20,1,31,1,67,1],
+      ["soak",27,1,8,1],
+      ["sociology",178,1],
+      ["solar",13,1,46,1,5,1,15,2,11,1,30,1,22,4,22,1,13,2,18,5,31,1],
+      ["sole",10,1,100,1,35,1,58,1,20,1],
+      ["solidify",4,1,19,1],
+      ["soluble",23,1],
+      ["solution",19,1,8,1,11,1,6,1,5,1,4,1,9,1,2,1,5,3,1,1,2,1,9,1,1,1,14,1,1,1,2,1,3,1,6,1,14,1,5,2,11,1,14,3,6,1,4,1,1,1,3,2,29,1,4,1,3,1,24,4],
+      ["solve",8,1,9,3,17,1,1,1,23,1,4,1,2,1,1,1,27,1,2,2,15,1,13,1,4,1,1,1,7,2,8,1,7,1,7,1,3,1,13,1,3,1,9,2,2,1,3,2,1,1],
+      ["sophisticated",29,1,30,2,2,1,4,1,17,1,10,1,6,1,2,1,21,1,6,1,12,1,6,1,5,1,19,1,34,1,1,1,2,1,15,2],
+      ["sorrow",83,1],
+      ["source",1,2,14,1,1,1,10,1,1,1,1,1,4,1,6,4,17,1,1,1,6,1,2,1,4,1,2,1,8,1,1,4,7,10,4,1,2,1,8,1,7,2,10,1,5,2,3,1,1,1,6,1,4,1,3,1,1,2,1,1,4,1,2,1,4,1,11,3,6,2,5,1,6,1,1,1,15,1,6,1,2,1,4,1,4,1,6,1,1,1,4,2],
+      ["souvenir",113,1],
+      ["spacecraft",142,2,22,1,13,1],
+      ["spacious",80,1],
+      ["span",5,1,4,1,60,1,51,1,1,1,5,2,2,1,5,1,3,1,4,1,34,2,6,1,2,1],
+      ["spark",94,1,6,1,68,1,45,1],
+      ["specialise",0,1,20,1,38,1,10,1,8,2,4,1,9,1,4,1,3,1,18,1,14,2,11,1,3,1,17,1,3,1,1,1,14,1,14,2,3,2],
+      ["specialist",35,1,40,1,6,2,14,1,42,1,10,3,45,1,22,1],
+      ["species",1,2,6,1,3,9,4,2,8,3,2,1,1,1,2,3,5,5,6,1,7,1,2,1,1,8,4,2,4,1,3,4,6,1,3,6,1,1,6,6,9,1,5,6,2,6,7,3,5,2,5,1,2,5,5,3,2,3,4,3,4,1,1,1,1,2,3,2,5,6,1,1,2,1,1,2,2,28,2,2,1,6,14,2,9,1,5,1,2,1,5,6,8,9,6,2,8,1,1,1,6,1,2,3,2,1,4,1,5,1,1,7,1,5,1,3],
+      ["specific",1,1,10,1,1,1,14,1,6,2,22,1,4,2,2,2,10,2,2,1,3,1,6,1,5,1,7,1,23,1,4,1,4,1,17,1,2,1,4,1,1,1,7,1,1,2,1,1,6,1,4,1,7,2,2,1,4,1,24,2,4,1,4,1],
+      ["specification",79,1,61,1],
+      ["specify",5,1,3,1,78,1,36,1,18,1],
+      ["specimen",45,3,58,2,32,1,9,1,43,1,36,2],
+      ["spectacular",25,1,9,1,10,1,11,1,36,1,79,2,22,1,13,1],
+      ["spectator",57,3],
+      ["spectrum",41,1,42,1,23,2,50,2,45,1],
+      ["speculate",3,1,37,1,8,1,2,1,31,1,20,3,15,2,61,1,5,1,14,1,14,1],
+      ["sphere",41,1,3,1,20,1,44,1,39,1,66,1],
+      ["spice",65,3,60,1,33,1],
+      ["spill",108,1,88,1],
+      ["spin",1,1,44,2,10,1,4,1,51,1,9,1,7,1,14,1,21,4,33,1],
+      ["spine",53,1,163,1],
+      ["spiral",47,1,129,1,49,1],
+      ["spiritual",9,1,94,2,44,1,4,1],
+      ["spit",171,1],
+      ["spite",77,2,22,1,31,1,1,1],
+      ["splash",1,1],
+      ["splendid",182,1],
+      ["split",10,1,4,1,8,2,53,1,17,1,9,1,29,1,26,1,15,1,2,1,16,1,8,1],
+      ["spoil",61,1,61,1,93,1],
+      ["spoilage",65,1,93,1],
+      ["spot",14,1,4,1,3,1,47,2,1,1,13,1,7,1,2,1,7,1,5,1,5,1,7,2,15,1,7,1,1,1,6,1,12,1,18,1,1,2,6,1,17,1,4,1,14,1,4,1],
+      ["spouse",104,1,71,1,50,1],
+      ["sprawl",75,1,37,1],
+      ["spray",65,2,72,1,77,2],
+      ["spring",59,1,11,1,26,1,10,1,4,1,11,1,6,1,8,1,32,1,43,3,1,1,1,1],
+      ["spur",222,1],
+      ["squash",50,2],
+      ["squeeze",33,1,17,1,5,1],
+      ["stabilise",23,1],
+      ["stable",14,3,13,1,21,1,73,1,8,1,9,1,64,1,19,1],
+      ["stack",123,1],
+      ["staff",6,1,14,1,8,1,27,1,30,1,12,1,53,1,41,1,18,1],
+      ["stage",12,4,6,1,30,1,3,1,4,3,12,1,6,1,8,3,3,1,4,1,6,7,46,3,20,1,1,1,1,2,2,1,5,1,5,1,4,1,4,1,3,2,1,1,32,1,6,1],
+      ["stain",38,1,102,1],
+      ["staircase",50,2],
+      ["stake",80,1,42,1,35,1,56,1],
+      ["stale",113,1],
+      ["stall",156,1],
+      ["stamp",67,2,37,1,63,1,45,1],
+      ["standard",3,1,3,3,9,2,1,1,8,4,6,1,16,1,7,2,9,1,2,3,9,3,13,1,10,2,1,1,20,1,1,1,4,4,9,1,9,1,1,1,11,1,9,1,2,3,5,1,7,1,3,1,10,2,2,1,5,2,20,1,2,1],
+      ["stare",57,1,41,1,76,4],
+      ["starve",99,1,22,1,18,1],
+      ["statement",86,1,92,1],
+      ["static",116,1,49,1],
+      ["stationary",5,2,137,1],
+      ["statistically",48,1,105,1],
+      ["statistics",49,1,21,1,32,1,64,2,33,1],
+      ["statue",9,1,22,1,184,1],
+      ["status",9,2,7,1,25,2,1,1,5,1,2,2,37,2,9,1,9,1,23,1,1,1,19,2,3,1,17,1,17,2,25,1,3,1],
+      ["steady",26,1,26,2,72,1,83,1],
+      ["steam",23,1,56,4,8,1,26,1,19,1,62,1],
+      ["steep",31,1,101,1,21,1,42,1],
+      ["steer",159,2,9,2],
+      ["stem",7,3,32,1,9,1,17,1,84,1,4,1,1,1,1,1,39,1,7,1,3,1],
+      ["stick",5,1,2,1,7,2,4,1,1,1,2,1,25,1,5,1,3,1,3,1,15,1,5,1,12,2,4,1,21,1,13,2,44,1,47,10,7,1],
+      ["sticky",23,1,36,3],
+      ["stiff",5,1,57,1,65,1,90,1],
+      ["stimulate",37,1,16,1,6,1,12,1,7,1,6,1,4,1,4,1,1,1,7,1,3,1,31,1,12,1,12,2,18,1,12,1],
+      ["stimulus",3,1,34,2,34,2,7,1,3,1,45,1,59,1],
+      ["stir",151,1,32,1],
+      ["stock",5,1,11,1,92,2,1,1,13,1,6,3,2,1,4,2],
+      ["stockpile",50,1],
+      ["storey",133,3],
+      ["storyline",81,1,108,1],
+      ["stout",1,1,108,1],
+      ["strain",139,2,13,1,48,1],
+      ["strand",59,1,60,1,12,1],
+      ["strap",83,1],
+      ["strategy",22,1,10,1,2,1,20,1,4,1,1,1,6,1,17,1,13,1,22,2,5,2,13,1,2,3,13,1,9,1,3,6,16,1,3,1,8,3,8,2,3,1,14,1,5,1,2,1],
+      ["straw",62,2,45,1],
+      ["stream",5,1,16,1,19,1,74,1,27,1,2,1,38,1,7,1,6,2],
+      ["strengthen",37,1,9,1,26,1,2,1,41,1,7,1,67,1,11,1],
+      ["stress",16,1,4,17,8,2,11,1,9,1,23,1,3,1,18,1,9,1,19,2,30,1,11,1,20,3,9,1,26,1,5,1,3,1],
+      ["stretch",3,4,11,1,5,1,88,1,12,1,4,1,12,1,3,1,26,1,15,1,23,1],
+      ["strike",5,1,2,1,18,2,6,1,63,1,7,1,41,1,14,1,15,1,46,1,6,1],
+      ["striking",14,1,38,1,21,1,18,1,39,1,6,1,29,1,14,1,8,1,32,1,3,1],
+      ["string",11,1,35,28,31,1,38,1,52,3,45,3,6,1],
+      ["strip",16,1,7,1,66,2,1,1,17,2,36,1,1,3,7,1],
+      ["stroke",3,1,25,1,24,1,5,1,26,5,29,1],
+      ["structure",2,3,3,2,2,1,1,7,2,1,8,2,1,1,2,2,4,1,5,2,14,3,2,1,1,1,3,2,5,1,6,1,1,1,9,1,15,2,5,2,1,1,27,1,1,2,1,1,3,1,5,8,21,1,12,1,11,4,4,1,6,1,6,1,1,1,5,3,2,1,17,2,2,1,8,1,2,2],
+      ["studio",30,1,187,1],
+      ["stuff",17,1,28,1,150,1,18,1,8,1],
+      ["stylish",34,1],
+      ["subject",3,3,2,1,13,2,8,1,8,1,2,2,3,1,2,4,1,11,1,2,6,4,1,1,1,1,7,2,13,1,1,2,2,1,3,1,1,2,6,2,2,1,1,3,4,1,3,1,4,1,1,2,7,2,3,1,2,2,1,1,2,1,12,2,10,3,7,1,4,1,1,7,1,1,1,1,3,2,2,3,6,3,1,1,1,1,12,1,1,2,5,1,2,1,3,1,3,2,2,1,9,1,7,1,1,2,3,1,2,1,2,3,6,1,5,1],
+      ["subjective",20,1,6,1],
+      ["subliminal",206,1],
+      ["submerge",129,1,51,1],
+      ["submit",144,1],
+      ["subordinate",8,8,158,1,17,4],
+      ["subscribe",137,1,29,1],
+      ["subsequent",10,1,15,1,46,1,2,1,54,1,38,1,6,1,4,1,6,1,20,1],
+      ["subsidiary",147,1,54,1],
+      ["subsidy",4,1,159,1],
+      ["substance",23,4,15,2,13,1,4,2,10,1,3,1,4,1,6,1,1,1,20,1,9,1,5,2,3,1,9,6,9,1,9,2,58,1,16,4,1,1,6,2],
+      ["substantial",33,1,3,1,72,1,3,1,31,1,27,1,9,2,4,1,27,1],
+      ["substitute",19,2,98,1,45,1,26,1],
+      ["substitution",13,1,194,1],
+      ["subtle",30,1,22,1,19,2,10,1,19,1,14,1,31,1,18,1,40,1,18,1,3,1],
+      ["subtropical",48,1,59,1],
+      ["suburb",4,1,108,5,6,3,18,1],
+      ["succeed",28,1,26,1,10,1,18,1,13,1,16,1,19,1,16,1,40,1,3,1,1,1],
+      ["succession",161,1],
+      ["successive",160,1,15,1],
+      ["succumb",179,1],
+      ["suffer",11,2,9,1,2,1,2,2,17,1,10,1,8,1,17,1,18,1,2,1,7,1,23,1,17,1,6,1,12,1,54,1],
+      ["suffice",86,1],
+      ["sufficient",3,1,39,1,20,1,11,1,2,1,54,1,44,1,37,1],
+      ["suggest",1,2,1,2,4,1,2,1,5,1,8,1,3,2,1,2,1,2,11,1,2,3,4,3,2,2,2,1,3,1,3,1,1,2,2,1,2,1,10,3,3,4,3,2,1,1,1,1,2,4,3,2,2,2,2,2,4,1,1,2,1,1,1,5,1,1,1,2,4,1,2,2,6,1,9,5,8,1,3,3,4,1,3,2,1,3,4,2,1,1,3,1,3,3,3,1,4,1,2,1,1,4,4,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,4,5,1,1,1,1,1,1,2,3,1,3,1,1,2,1,1,1,1,3,2,1,1,2,1,4,1,1,1,5,2,1,3,1,2,3,2,1,1,2,5,2,1,5,1,3,2,1,2,1,1],
+      ["suitable",13,1,6,2,7,1,30,2,16,1,7,1,17,1,6,1,1,1,2,1,2,1,10,1,4,1,3,1,11,1,29,1,9,1,18,1,8,1,15,2],
+      ["suitably",16,1,81,1],
+      ["summarise",187,1],
+      ["summit",132,1],
+      ["superb",34,1,101,1],
+      ["superficial",72,1,91,1],
+      ["superior",1,1,17,1,4,1,14,1,11,1,54,1,20,1,8,1,23,1,14,1,18,1,13,1,21,1],
+      ["supersede",170,1,24,1],
+      ["supervision",77,1],
+      ["supervisor",41,1],
+      ["supplement",16,1,63,1,20,1,63,1],
+      ["supplementary",18,1],
+      ["supply",5,1,9,1,5,1,2,2,3,1,8,1,13,1,5,1,15,1,8,1,12,1,2,1,9,1,5,1,2,1,4,1,1,1,6,1,3,1,6,1,4,1,6,1,1,1,21,1,11,1,12,2,6,1,7,4,3,2,1,1,6,1,17,1,4,1],
+      ["supportive",153,1],
+      ["suppose",58,1,80,1,37,2,27,1],
+      ["suppress",43,1,96,1,18,1,18,1,6,1,19,1],
+      ["suppression",59,1,165,1],
+      ["surf",52,1,30,1,32,1],
+      ["surface",21,2,4,1,5,1,4,3,1,1,12,1,4,1,1,4,15,2,1,2,1,5,13,1,2,1,7,2,7,1,9,1,1,1,13,1,4,2,2,1,12,1,5,1,5,1,3,1,12,5,13,8,3,4,2,1,12,1,16,5,4,10,10,1,2,1],
+      ["surge",35,1,154,1,7,1,12,1],
+      ["surgeon",1,1,71,1,117,1,24,1],
+      ["surgery",120,1,69,1],
+      ["surpass",6,1,3,1,185,1],
+      ["surround",0,1,31,1,31,1,1,1,4,1,17,1,6,1,22,1,2,1,4,1,2,1,15,1,1,1,7,1,2,1,6,2,8,1,6,1,5,1,13,1,5,1,15,1,2,1,11,1],
+      ["surroundings",63,1,24,1,2,4,37,1,25,1,8,1,13,1],
+      ["surveillance",97,1,83,1,21,1,13,1],
+      ["survey",18,3,8,1,10,1,22,2,6,1,5,2,1,4,2,1,10,2,8,1,5,1,9,1,11,1,29,1,5,1,2,2,1,2,10,2,10,2],
+      ["survive",5,1,5,1,19,1,2,2,14,1,1,1,2,1,3,1,8,2,5,1,25,1,1,2,5,1,8,4,5,1,2,4,1,1,2,1,16,1,6,2,8,4,1,2,19,1,24,1,22,1,7,1,1,1],
+      ["susceptible",106,1,18,1,30,1],
+      ["suspect",53,1,6,1,9,3,26,1,58,1,6,1,2,2,16,1,14,2,7,1,24,1],
+      ["suspend",46,1,46,1],
+      ["sustain",3,1,17,1,17,1,13,1,2,1,2,1,1,1,41,1,15,1,10,2,17,1,6,1,4,1,13,1,1,1,36,1,4,1,4,1],
+      ["sustainable",33,1,51,1,12,1,24,1,2,1,7,1,11,1,9,1,15,1],
+      ["swallow",25,1,28,1,72,1],
+      ["swamp",59,1,78,1,14,1],
+      ["swap",104,2],
+      ["swear",175,1],
+      ["swift",48,1,4,1,4,1,65,1,9,2],
+      ["swing",11,1,9,1,37,2,2,1,25,1,48,1,29,2,10,1,40,1],
+      ["switch",3,1,11,1,5,1,29,1,6,1,26,1,1,1,11,1,3,1,7,2,24,1,55,2,16,2,2,2],
+      ["symbol",1,1,43,1,3,1,20,4,69,1,31,1,23,2,22,1],
+      ["symbolism",190,1],
+      ["sympathetic",4,1,68,1],
+      ["sympathy",37,1,4,1,19,1,16,1],
+      ["symphony",2,2,42,1,102,1,73,1],
+      ["symptom",11,1,69,1],
+      ["synchronise",167,1,45,1],
+      ["synthesis",17,1,64,2,95,1],
+      ["synthetic",19,1,19,6,81,1,6,1,15,2,84,3],
+      ["systematic",36,1,28,1,4,1,48,1,6,1,8,1,20,1,13,1,5,3,39,1,7,1],
+      ["tablet",53,1,14,3,40,1,4,1,67,1],
+      ["tackle",69,1,31,1,24,1,13,1,44,1,9,1,35,1],
+      ["tag",80,1,17,1,52,1,65,1],
+      ["tan",38,1,175,1],
+      ["tap",18,2,5,1,12,1,48,1,17,2,97,1,7,1],
+      ["target",1,1,17,1,10,2,37,2,17,1,4,8,3,1,25,1,3,1,22,1,3,4,11,1,22,1,31,1,17,1,1,1,2,1],
+      ["tariff",140,1],
+      ["tease",24,1,76,1],
+      ["technical",30,1,25,1,10,1,4,1,17,1,19,1,6,2,20,1,39,1,56,1],
+      ["technician",80,1,140,1],
+      ["technique",6,1,5,1,15,1,4,1,6,2,1,1,7,1,6,1,1,1,11,1,3,1,4,1,8,1,3,1,2,2,7,3,10,1,14,1,19,1,4,2,3,1,6,2,18,2,5,5,6,1,1,3,5,1,5,1,11,1,5,1,2,2,6,1,5,1,3,2,1,1,8,2],
+      ["tedious",41,1,89,1],
+      ["telescope",13,1,164,1,3,1],
+      ["temporary",49,1,10,1,51,1,12,1,6,1,3,1,20,1,19,2,37,1],
+      ["tempt",94,1,58,1,4,1,67,1],
+      ["tenant",4,1,114,1,29,1],
+      ["tend",6,1,12,2,3,1,4,1,1,1,2,1,7,1,3,1,3,1,2,1,6,3,7,1,5,1,7,2,2,1,4,1,7,1,10,1,15,1,2,1,2,1,4,2,10,1,4,1,21,1,1,1,15,1,5,1,1,2,5,1,3,1,18,1,1,1,9,2,2,2,13,1,3,1],
+      ["tendency",3,1,3,1,20,2,17,1,107,1,42,1,13,1],
+      ["tense",154,1],
+      ["tensile",119,2],
+      ["terminology",95,1],
+      ["terrace",50,1,34,1],
+      ["terrain",75,1,84,4],
+      ["terrestrial",177,2],
+      ["terrify",93,1,44,1],
+      ["territory",27,1,60,1,16,1,27,2,8,1,9,1,13,1,9,1,13,1,20,1,20,1],
+      ["textile",50,1,27,2,42,6,21,3],
+      ["texture",30,1,31,1,2,1,26,2,51,1,15,1,2,1],
+      ["theoretical",86,1],
+      ["theory",2,2,3,1,3,8,9,2,1,2,7,2,2,1,10,2,4,1,9,1,6,1,1,1,3,4,8,1,7,3,1,3,19,1,11,1,22,1,5,1,4,3,8,1,5,3,2,1,3,2,1,10,1,1,1,1,2,7,1,1,2,2,4,2,1,2,1,3,9,1,2,1,2,1,1,4,4,1,16,1,5,3,2,1,2,2,8,2],
+      ["therapy",17,2,55,1,2,1,9,10,15,1,76,1,46,1,6,1],
+      ["thereby",15,1,50,1,47,1,15,1,16,1,3,1,54,1,7,1,19,1],
+      ["therefore",6,2,3,1,9,1,5,1,2,2,1,1,4,1,1,1,5,1,7,1,8,2,4,2,6,1,24,1,1,1,4,1,7,1,7,1,2,1,27,1,22,1,9,2,8,1,5,1,1,1,7,1,23,1,5,1,2,1,3,2,7,1],
+      ["thermal",195,1],
+      ["thesis",25,1,154,1,32,1],
+      ["thoughtful",182,1,13,1],
+      ["threaten",56,2,3,1,35,1,16,1,28,1,3,1,1,1,9,1,23,1,3,1,9,1,7,1,8,1,1,1],
+      ["threshold",65,1,86,3,7,1,68,1],
+      ["thrill",9,1,48,1,6,4,37,1,12,1,49,3,27,1],
+      ["thrive",20,2,12,1,16,2,2,1,4,1,49,1,1,1,28,1,3,2,8,2,6,1,14,2,10,2,14,1,30,1,1,1,5,1],
+      ["throughout",0,4,1,1,8,1,1,1,4,1,8,1,5,1,4,1,2,1,7,1,4,1,7,1,3,1,1,1,7,1,4,1,7,2,4,1,2,1,1,1,10,1,4,1,3,1,2,1,4,1,2,1,3,1,1,1,2,2,13,1,7,1,1,1,4,1,2,1,5,1,2,1,3,1,2,2,3,1,4,2,1,1,5,1,3,1,13,1,7,1,1,2,6,1,2,1,3,1,2,1,2,1,1,1,13,1,2,1,4,1,1,3,1,1],
+      ["tighten",162,1],
+      ["tilt",3,2,158,1,3,1],
+      ["timber",21,1,96,6,6,2,28,2,18,1,10,5],
+      ["timid",188,1],
+      ["tolerate",15,1,36,1,62,1,8,1,66,1],
+      ["topsoil",124,3],
+      ["torment",175,1],
+      ["torrent",182,1],
+      ["tortoise",46,1],
+      ["tough",33,1,2,1,26,3,29,1,19,1,19,1,56,3,41,1],
+      ["toxic",61,2,4,1,24,1,45,1,24,1,35,1,31,1,2,1],
+      ["toxin",65,1,69,1,9,3],
+      ["trace",2,2,39,1,9,1,18,1,34,1,32,1,24,1,41,1,18,1],
+      ["track",16,1,9,2,16,1,6,1,1,1,4,1,15,1,9,1,6,1,2,1,13,1,24,1,1,1,10,7,24,2,24,4,11,1,25,1],
+      ["tradition",1,1,15,1,87,1,1,1,13,1,3,1,16,1,21,3,14,1,11,1,1,1,22,3,14,1],
+      ["traditional",1,6,4,1,3,2,3,1,5,2,6,1,7,1,3,2,2,1,7,1,7,1,17,1,11,1,6,1,15,1,11,1,8,1,2,1,2,1,4,2,2,1,6,1,1,1,3,2,9,2,5,2,10,1,8,6,10,2,17,7,3,1,5,2,7,1,3,1,13,1],
+      ["tranquility",57,1],
+      ["transaction",67,1,21,1,74,2,4,1,53,1],
+      ["transcend",83,1],
+      ["transfer",56,1,30,1,42,1,13,1,39,1,6,3,4,1],
+      ["transform",28,1,6,2,29,1,22,2,19,1,3,1,12,1,22,1,15,1,26,1,8,1,19,1,14,1],
+      ["transient",14,5,12,1],
+      ["transition",96,1,13,1,68,1],
+      ["translate",7,1,60,2,6,1,13,3,25,1,22,1,16,1,34,1],
+      ["transmit",72,1,82,2,26,2],
+      ["transparent",30,1,49,1,46,1,101,1],
+      ["transport",55,1,1,1,5,1,5,1,5,1,8,1,17,1,6,1,5,1,23,2,11,1,50,1,8,1,11,1],
+      ["transportation",96,5,45,1,54,2],
+      ["trap",59,3,3,1,7,1,46,1,34,1,15,1,1,1,14,1,16,1,28,2,2,1],
+      ["treatment",11,1,8,1,5,1,48,8,65,1,54,3,16,1,7,3,6,1],
+      ["tremendous",38,1,74,1,8,1,39,1,39,1,17,1],
+      ["trend",9,1,4,1,16,1,14,1,12,1,15,1,12,1,6,1,7,1,15,1,24,1,28,1,45,1],
+      ["trial",16,1,8,4,18,3,11,1,59,1,19,1,45,1,37,8,1,2],
+      ["triangle",67,1,17,1,34,1,17,1],
+      ["tribal",182,1],
+      ["tribute",23,1],
+      ["trick",63,1,26,1,2,2,7,1,121,1],
+      ["trigger",3,1,10,1,47,1,8,1,3,1,1,1,6,1,2,1,1,1,1,1,2,1,10,1,6,4,29,1,21,1,8,1,17,1],
+      ["triumphant",23,1],
+      ["trivial",85,1],
+      ["tropical",10,1,23,1,15,3,17,2,3,1,33,3,24,1,14,2,2,1,2,1,58,1],
+      ["trunk",117,1,10,1,27,3,70,1],
+      ["tube",3,1,24,1,32,1,20,1,20,3,81,2],
+      ["tug",66,1,118,2],
+      ["tune",18,2,28,1,22,1,3,1,7,1,43,1,46,4,28,1,9,1,8,4],
+      ["tunnel",31,1,28,1,20,1,34,26,19,1,41,3,50,1],
+      ["tutor",122,1,76,2],
+      ["twist",52,1,57,1,10,1,13,2,50,2,38,1],
+      ["typical",3,1,17,1,11,2,83,1,6,1,27,1,8,1,3,1,2,1,12,1,6,1,17,1],
+      ["ultimate",0,1,162,1,10,1,1,1,27,1,22,1],
+      ["ultimately",22,1,2,1,71,1,27,2,7,1,11,1,1,1,1,1,31,1,19,1,21,1,1,2],
+      ["unanimous",12,1],
+      ["unaware",155,1],
+      ["uncertainty",178,1],
+      ["underestimate",86,1,55,1],
+      ["undergraduate",85,1,37,1,26,1,72,1],
+      ["underground",1,1,15,1,18,2,1,3,26,1,8,3,10,5,5,2,26,2,3,4,26,2,34,1,20,1,30,3],
+      ["underline",36,1,57,1,24,1],
+      ["underlying",106,1,61,1,18,1,5,2,11,1,4,1,7,1,10,1],
+      ["undermine",16,1,77,1,60,1],
+      ["underneath",41,1,176,1],
+      ["underpin",34,1],
+      ["understandable",7,1,155,1],
+      ["understanding",7,2,4,3,4,2,15,1,10,1,8,1,26,1,12,2,7,1,22,1,7,1,7,1,7,1,3,1,2,1,7,1,12,2,13,1,3,1,1,1,1,1,1,1,1,3,6,1,4,1,3,1,8,1,5,5,1,1,1,3,8,2,6,2,3,1],
+      ["undertake",97,1,45,2,22,1],
+      ["undoubtedly",15,1,121,1,70,1,1,1],
+      ["unexpected",68,1,1,1,23,1,2,1,15,1,15,1,10,1,27,1,7,1,14,1,7,2,21,1],
+      ["unfortunately",30,1,18,1,11,2,5,1,1,1,20,1,23,1,11,1,2,1,20,2,11,1,4,1,39,1,19,1],
+      ["uniform",75,1,29,1,14,1,30,1,15,1,2,1,20,1],
+      ["union",28,1,58,1,67,1,10,2,16,7],
+      ["unique",1,1,13,1,3,1,12,1,3,1,22,1,9,1,8,1,7,1,17,1,9,1,6,1,7,1,2,2,3,1,1,1,20,1,12,1,13,1,5,1,3,1,6,1,1,2,42,2],
+      ["universe",87,1,29,1,90,1,3,1],
+      ["unload",113,1],
+      ["unobtrusive",214,1],
+      ["unrealistic",3,1,17,1],
+      ["unveil",128,1],
+      ["upgrade",13,1,105,2,45,1],
+      ["upper",8,2,2,2,29,1,19,1,30,1,11,2,24,2,13,1,23,1,21,1,27,1,3,1,12,1,1,1],
+      ["upset",112,1,29,1],
+      ["urban",31,1,4,2,15,3,13,5,7,3,5,1,9,4,12,4,3,1,13,2,6,1,13,1,2,1,2,6,12,1,25,2,7,1,16,1],
+      ["urge",34,1,5,1,37,1,75,1,8,1,41,1],
+      ["urgent",209,1],
+      ["utilise",35,1,16,1,69,1,1,1,3,1],
+      ["utility",26,1,14,1,116,1],
+      ["utterance",160,1,7,2,41,1,4,2],
+      ["vacuum",59,1,20,1,101,1],
+      ["valid",42,1,7,1,25,1,131,1,1,1],
+      ["valuable",11,1,4,1,1,1,5,1,16,1,10,1,9,1,9,1,17,1,10,1,12,1,4,2,9,2,5,1,3,1,18,1,3,1,22,1,6,1,2,1,3,1,8,1,3,1,27,2,4,1,5,1],
+      ["van",22,1,23,2,8,2,27,4,76,1,39,1],
+      ["vanish",25,2,16,1,4,2,50,2,48,1,1,1,33,1],
+      ["variability",23,1,46,1],
+      ["variant",3,3],
+      ["variation",3,1,3,1,8,1,32,1,17,1,31,1,34,1,2,1,1,1,34,1,8,1,27,1,1,1,3,2,3,2],
+      ["variety",10,1,3,1,5,1,1,1,3,9,4,1,3,1,3,6,4,1,2,1,9,1,1,1,3,1,1,1,1,1,8,2,2,1,2,1,8,2,1,1,8,1,19,1,2,1,14,1,1,2,8,1,9,1,4,3,2,1,2,1,12,2,3,1,9,2,1,2,5,1,10,1,1,1,27,1,1,2,2,1,2,1,1,1],
+      ["various",1,1,3,1,2,1,4,3,1,1,1,1,6,1,4,1,7,1,7,1,4,2,7,1,3,1,1,2,3,1,6,1,9,1,8,1,7,1,2,1,1,1,4,2,6,1,20,1,19,1,4,1,9,1,6,2,20,1,2,1,12,1,8,1,4,2,6,3,13,1],
+      ["vary",2,1,4,1,4,1,2,1,4,1,4,1,3,1,10,1,9,1,37,1,4,1,2,1,19,1,7,1,15,1,4,2,4,1,11,1,2,1,6,1,5,1,16,1,8,1,4,2,17,1,6,1,6,1,2,1,2,1],
+      ["vast",9,1,2,1,3,1,1,1,25,1,26,1,9,1,12,1,1,1,2,1,5,1,17,1,9,1,1,1,6,1,2,1,6,1,4,1,1,1,3,1,7,1,3,1,13,1,1,1,2,1,3,1,7,2,8,1,16,1,8,1,11,1],
+      ["vegetarian",102,5,97,5],
+      ["vegetation",31,1,53,1,12,1,28,4,15,1,38,1,24,1,23,1],
+      ["venomous",48,1],
+      ["ventilation",113,1,82,2],
+      ["venture",34,1,101,1,14,1,33,1,10,1],
+      ["venue",44,3],
+      ["verbal",36,1,38,2,11,1,63,15,24,1,4,3,30,1],
+      ["versatile",15,1,37,1,102,1],
+      ["version",12,1,2,1,32,1,51,1,7,1,46,1,7,1,38,1,3,1],
+      ["versus",12,1,73,1,85,2],
+      ["vertebrate",75,1,79,1],
+      ["vertical",8,1,59,1,12,1,54,10,28,1,34,1,21,1],
+      ["vessel",51,1,1,1,14,1,6,1,45,1,6,2,35,1,2,1,8,1,5,1,19,1],
+      ["vested",38,1],
+      ["viable",9,1,66,1,13,1,36,1],
+      ["vibrant",111,1,25,1],
+      ["vibrate",57,1,67,1,41,1],
+      ["victim",137,1,7,1,46,1],
+      ["vigorous",110,1,75,1],
+      ["violence",109,2,48,1],
+      ["violent",35,1,110,1,44,3,7,1,7,1,14,1],
+      ["virtually",15,1,24,1,18,1,7,1,19,1,5,1,6,1,25,1,21,1,27,1,20,1,25,1,11,1],
+      ["virtue",32,1,23,1,57,1],
+      ["virtuous",32,4,125,1,6,1],
+      ["viscous",52,1],
+      ["visible",73,1,35,1,13,2,30,1,18,1,46,1],
+      ["vision",34,2,10,1,20,1,7,1,7,2,4,1,11,1,40,1,10,1,6,1,10,2,9,2,2,2,12,1,23,1],
+      ["visual",26,1,4,1,14,1,2,1,7,1,4,1,1,1,5,1,4,1,16,1,10,1,21,1,12,1,4,2,10,1,11,1,4,1,12,3,22,1,17,1,6,3],
+      ["vital",7,1,7,1,1,1,33,1,4,1,1,1,9,1,9,1,3,1,4,2,3,1,11,1,12,1,16,1,32,1,12,1],
+      ["vitality",162,1],
+      ["vivid",17,3,70,1,6,1,113,1],
+      ["volume",4,1,31,1,11,3,18,2,9,2,55,1,1,1,47,1,43,1],
+      ["voluntary",178,2,42,1],
+      ["volunteer",18,5,14,1,38,3,15,3,15,3,6,1,8,1,8,1,15,1,24,1,8,1],
+      ["vomit",125,2],
+      ["voyage",1,1,12,1,78,3,32,3,2,1,17,1,26,9],
+      ["vulnerable",27,1,29,1,9,1,10,1,28,1,21,1,13,1,2,1,15,1,8,1,18,1,20,2,14,1,2,1],
+      ["wage",140,2],
+      ["wagon",96,2,127,1],
+      ["waist",46,1,6,1],
+      ["warrant",86,1,119,1],
+      ["waterproof",19,1,4,3],
+      ["wax",29,9,10,1,93,1,7,1,79,1],
+      ["weaken",48,1,145,1,7,1,5,1],
+      ["weakness",87,1,13,1],
+      ["wealthy",0,1,28,2,1,1,10,1,48,1,1,1,8,1,5,1,35,1,2,1,3,1,61,1],
+      ["wean",189,1],
+      ["weapon",7,1,41,1,21,2,41,1,28,1,2,1,44,1,5,1,13,1],
+      ["weed",16,1,119,2,4,1,85,5],
+      ["weigh",18,1,6,2,3,2,83,1,9,2,6,1,27,1,7,1,5,1,1,1,14,3,12,1,2,1,7,1],
+      ["welfare",102,1,97,1],
+      ["well-being",37,3,26,1,22,1,6,1,29,1],
+      ["whaling",125,2],
+      ["wheelchair",83,1],
+      ["whereas",1,1,20,1,1,1,2,1,5,1,1,1,2,1,2,1,7,1,11,1,16,1,23,1,8,1,1,1,6,1,2,1,1,1,16,2,1,1,4,1,4,1,18,1,7,1,19,1,18,1,1,2,10,1,7,1],
+      ["whistle",14,1,205,1],
+      ["widespread",36,1,5,1,35,1,1,1,11,1,8,1,2,1,1,2,4,1,7,1,21,1,6,1,11,1,4,1,2,1,3,1,5,1,15,1,17,2,24,1,2,1,1,1],
+      ["wildlife",105,1,5,2,25,3,6,5,3,1,10,1,25,1,8,1,36,1],
+      ["willing",5,1,71,1,14,1,2,1,63,1,1,1,32,1,21,2],
+      ["wire",37,1,46,1,7,1,37,1,87,1],
+      ["withdraw",44,1,29,3,121,1],
+      ["withstand",29,1,3,1,6,1],
+      ["witness",23,1,52,1,12,1,33,1,5,1,85,1,3,1,3,1],
+      ["wonder",34,1,78,1,2,1,30,1,12,1,31,1,2,1],
+      ["workaholic",157,1],
+      ["workforce",33,1,43,1,25,1,21,1,18,1],
+      ["worm",18,1,59,3,14,1,22,2],
+      ["worthwhile",206,1],
+      ["worthy",122,1,31,1,17,1],
+      ["wrap",64,1,43,3,111,1],
+      ["yield",8,1,10,1,9,1,11,1,4,1,5,1,52,3,20,1,14,2,20,1,2,1,3,1,1,1,7,1,10,1,3,2,22,4,20,1,5,1],
+      ["zone",48,1,28,1,4,1,4,2,49,1,4,2,19,1,45,3],
+      ["zoological",10,1,91,1,86,1]
+    ]
+  };
+})(typeof window !== "undefined" ? window : globalThis);
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Build the offline full-text search index of the reading library.
+
+Usage:
+    python assets/scripts/build_reading_exam_search_index.py [--check]
+
+Post-processing stage for ``assets/generated/reading-exams``; run it after the
+Node generator.  Every exam in the manifest is indexed with three fields:
+
+- ``title``: the manifest title (English and Chinese), counted ``TITLE_WEIGHT`` times
+- ``passage``: ``extract_reading_exam_context.passage_text``
+- ``questions``: question prompts from ``extract_questions_from_group``
+
+so the index follows the same HTML stripping rules as the explanation
+contexts.  The result is written to ``search/index.js`` as
+``global.__READING_EXAM_SEARCH_INDEX__``::
+
+    {
+      "version": 1,
+      "k1": 1.2, "b": 0.75,
+      "ids": ["p1-high-01", ...],
+      "lengths": [1034, ...],
+      "avgLength": 987.4,
+      "terms": [
+        ["abandon", 3, 1, 41, 2],
+        ...
+      ]
+    }
+
+Each ``terms`` row is a term followed by its postings as ``(docGap, tf)``
+pairs: document numbers index ``ids`` and are stored as the gap to the
+previous posting of the same term.  Rows are sorted by term so the browser can
+binary-search prefixes.  ``lengths`` and ``avgLength`` are the BM25 document
+length statistics.  Tokenisation must stay in sync with
+``tokenizeReadingSearchText`` in ``js/app/browseController.js``: NFKC,
+lower case, ASCII letter/digit runs and single CJK characters, English stop
+words dropped, plural ``-s``/``-ies`` folded.  ``--check`` writes nothing and
+exits 1 when the index is out of date.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import unicodedata
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+# Shared helpers under developer/tests/py are imported by module name.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "developer" / "tests" / "py"))
+
+import extract_reading_exam_context as extract_helper
+import reading_bundle_loader as bundle_loader
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+READING_DATA_DIR = REPO_ROOT / "assets" / "generated" / "reading-exams"
+SEARCH_INDEX_RELATIVE = Path("search") / "index.js"
+READING_MANIFEST_MARKERS = ("global.__READING_EXAM_MANIFEST__ =", "const manifest =")
+SEARCH_INDEX_GLOBAL = "__READING_EXAM_SEARCH_INDEX__"
+INDEX_VERSION = 1
+BM25_K1 = 1.2
+BM25_B = 0.75
+TITLE_WEIGHT = 3
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+|[一-鿿]")
+STOP_WORDS = frozenset("""
+a an and are as at be been but by can could did do does for from had has have he her his how i if in into is it
+its may might more most must no not of on or our she should so than that the their them then there these they
+this those to was we were what when where which who whom why will with would you your
+""".split())
+
+
+def fold_plural(token: str) -> str:
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us", "sis")):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Index terms of ``text``; single Latin letters and stop words are dropped."""
+    tokens = []
+    for token in _TOKEN_RE.findall(unicodedata.normalize("NFKC", text or "").lower()):
+        if token.isascii() and (len(token) < 2 or token in STOP_WORDS):
+            continue
+        tokens.append(fold_plural(token) if token.isascii() and not token.isdigit() else token)
+    return tokens
+
+
+def exam_fields(title: str, payload: Dict) -> Dict[str, str]:
+    prompts = [
+        item["prompt"]
+        for group in payload.get("questionGroups") or []
+        for item in extract_helper.extract_questions_from_group(group)
+    ]
+    return {
+        "title": title or (payload.get("meta") or {}).get("title") or "",
+        "passage": extract_helper.passage_text(payload),
+        "questions": "\n".join(prompts),
+    }
+
+
+def term_frequencies(fields: Dict[str, str]) -> Counter:
+    counts: Counter = Counter()
+    for name, text in fields.items():
+        weight = TITLE_WEIGHT if name == "title" else 1
+        for token in tokenize(text):
+            counts[token] += weight
+    return counts
+
+
+def build_search_index(exam_dir: Path) -> Dict:
+    manifest = bundle_loader.load_assignment(exam_dir / "manifest.js", READING_MANIFEST_MARKERS)
+    ids: List[str] = []
+    lengths: List[int] = []
+    postings: Dict[str, List[int]] = {}
+    last_doc: Dict[str, int] = {}
+    for exam_id, entry in manifest.items():
+        script = (entry or {}).get("script")
+        if not script:
+            continue
+        data_key = entry.get("dataKey") or exam_id
+        payload = bundle_loader.load_register_payload(exam_dir / script, register_key=data_key)
+        counts = term_frequencies(exam_fields(entry.get("title"), payload))
+        doc = len(ids)
+        ids.append(exam_id)
+        lengths.append(sum(counts.values()))
+        for term in sorted(counts):
+            postings.setdefault(term, []).extend((doc - last_doc.get(term, 0), counts[term]))
+            last_doc[term] = doc
+    return {
+        "version": INDEX_VERSION,
+        "k1": BM25_K1,
+        "b": BM25_B,
+        "ids": ids,
+        "lengths": lengths,
+        "avgLength": round(sum(lengths) / len(lengths), 2) if lengths else 0,
+        "terms": [[term, *postings[term]] for term in sorted(postings)],
+    }
+
+
+def decode_postings(row: Iterable) -> List[List[int]]:
+    """``(doc, tf)`` pairs of one ``terms`` row; the inverse of the delta encoding."""
+    values = list(row)[1:]
+    pairs = []
+    doc = 0
+    for index in range(0, len(values), 2):
+        doc += values[index]
+        pairs.append([doc, values[index + 1]])
+    return pairs
+
+
+def render_search_index(index: Dict) -> str:
+    """Index script; one term row per line so regenerated indexes diff cleanly."""
+    head = {key: value for key, value in index.items() if key != "terms"}
+    header = ",\n".join(
+        f"    {json.dumps(key)}: {json.dumps(value, ensure_ascii=False, separators=(',', ':'))}"
+        for key, value in head.items()
+    )
+    rows = ",\n".join(
+        f"      {json.dumps(row, ensure_ascii=False, separators=(',', ':'))}" for row in index["terms"]
+    )
+    return "\n".join([
+        "(function registerReadingExamSearchIndex(global) {",
+        "  'use strict';",
+        f"  global.{SEARCH_INDEX_GLOBAL} = {{",
+        header + ",",
+        '    "terms": [',
+        rows,
+        "    ]",
+        "  };",
+        '})(typeof window !== "undefined" ? window : globalThis);',
+        "",
+    ])
+
+
+def sync_search_index(exam_dir: Path, write: bool = True) -> Dict:
+    """Rebuild ``search/index.js``; return ``{"changed", "index", "bytes"}``."""
+    index = build_search_index(exam_dir)
+    text = render_search_index(index)
+    path = exam_dir / SEARCH_INDEX_RELATIVE
+    changed = not path.exists() or path.read_text(encoding="utf-8") != text
+    if write and changed:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return {"changed": changed, "index": index, "bytes": len(text.encode("utf-8"))}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the full-text search index of the reading library")
+    parser.add_argument("--exam-dir", type=Path, default=READING_DATA_DIR, help="directory of exam bundles and manifest.js")
+    parser.add_argument("--check", action="store_true", help="report without writing; exit 1 if the index is out of date")
+    args = parser.parse_args()
+
+    try:
+        result = sync_search_index(args.exam_dir, write=not args.check)
+    except bundle_loader.BundleParseError as exc:
+        print(f"Search index build failed: {exc}", file=sys.stderr)
+        return 1
+    index = result["index"]
+    postings = sum((len(row) - 1) // 2 for row in index["terms"])
+    state = ("out of date" if args.check else "written") if result["changed"] else "unchanged"
+    print(
+        f"Search index: {len(index['ids'])} exams, {len(index['terms'])} terms, {postings} postings, "
+        f"{result['bytes']} bytes; {args.exam_dir / SEARCH_INDEX_RELATIVE} {state}"
+    )
+    return 1 if args.check and result["changed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Embed a per-exam summary table in the reading manifest.
+
+Usage:
+    python assets/scripts/build_reading_exam_summary.py [--check]
+
+Post-processing stage for ``assets/generated/reading-exams``; run it after the
+Node generator.  For every exam bundle in the manifest it records:
+
+- ``questionCount``: entries of ``questionOrder`` (or distinct group questionIds)
+- ``kindMask``: question group kinds as a bitmask over ``kinds``
+- ``wordCount``: words of the passage text, without the exam instructions
+- ``answerCount``: entries of ``answerKey``
+
+The table is stored column-wise so the browse list can filter and sort
+without loading any exam bundle::
+
+    const READING_EXAM_SUMMARY = {
+      "ids": ["p1-high-01", ...],
+      "kinds": ["matching", ...],
+      "columns": {"questionCount": [13, ...], "kindMask": [6, ...], ...}
+    };
+
+and published as ``global.__READING_EXAM_SUMMARY__``.  Passage text comes from
+``extract_reading_exam_context.passage_text`` so word counts follow the same
+stripping rules as the explanation contexts.  ``--check`` writes nothing and
+exits 1 when the table is out of date.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+# Shared helpers under developer/tests/py are imported by module name.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "developer" / "tests" / "py"))
+
+import extract_reading_exam_context as extract_helper
+import reading_bundle_loader as bundle_loader
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+READING_DATA_DIR = REPO_ROOT / "assets" / "generated" / "reading-exams"
+READING_MANIFEST_MARKERS = ("global.__READING_EXAM_MANIFEST__ =", "const manifest =")
+SUMMARY_CONSTANT = "READING_EXAM_SUMMARY"
+SUMMARY_GLOBAL = "__READING_EXAM_SUMMARY__"
+SUMMARY_COLUMNS = ("questionCount", "kindMask", "wordCount", "answerCount")
+
+_WORD_RE = re.compile(r"[A-Za-z0-9]+(?:['’-][A-Za-z0-9]+)*")
+
+
+def count_words(text: str) -> int:
+    return len(_WORD_RE.findall(text))
+
+
+def summarize_exam(payload: Dict) -> Dict:
+    groups = payload.get("questionGroups") or []
+    question_ids = payload.get("questionOrder") or list(dict.fromkeys(
+        question_id for group in groups for question_id in group.get("questionIds") or []
+    ))
+    return {
+        "questionCount": len(question_ids),
+        "kinds": sorted({group["kind"] for group in groups if group.get("kind")}),
+        "wordCount": count_words(extract_helper.passage_text(payload)),
+        "answerCount": len(payload.get("answerKey") or {}),
+    }
+
+
+def build_summary_table(exam_dir: Path) -> Dict:
+    manifest = bundle_loader.load_assignment(exam_dir / "manifest.js", READING_MANIFEST_MARKERS)
+    rows: Dict[str, Dict] = {}
+    for exam_id, entry in manifest.items():
+        script = (entry or {}).get("script")
+        if not script:
+            continue
+        data_key = entry.get("dataKey") or exam_id
+        payload = bundle_loader.load_register_payload(exam_dir / script, register_key=data_key)
+        rows[exam_id] = summarize_exam(payload)
+
+    kinds = sorted({kind for row in rows.values() for kind in row["kinds"]})
+    if len(kinds) > 31:
+        raise ValueError(f"too many question kinds for a 31-bit mask: {len(kinds)}")
+    bit = {kind: 1 << index for index, kind in enumerate(kinds)}
+    columns: Dict[str, List[int]] = {name: [] for name in SUMMARY_COLUMNS}
+    for row in rows.values():
+        columns["questionCount"].append(row["questionCount"])
+        columns["kindMask"].append(sum(bit[kind] for kind in row["kinds"]))
+        columns["wordCount"].append(row["wordCount"])
+        columns["answerCount"].append(row["answerCount"])
+    return {"ids": list(rows), "kinds": kinds, "columns": columns}
+
+
+def render_summary_table(table: Dict) -> str:
+    """JSON literal for the manifest; one line per column."""
+    columns = ",\n".join(
+        f"      {json.dumps(name)}: {json.dumps(values)}" for name, values in table["columns"].items()
+    )
+    return "\n".join([
+        "{",
+        f'    "ids": {json.dumps(table["ids"], ensure_ascii=False)},',
+        f'    "kinds": {json.dumps(table["kinds"])},',
+        '    "columns": {',
+        columns,
+        "    }",
+        "  }",
+    ])
+
+
+def sync_summary(exam_dir: Path, write: bool = True) -> Dict:
+    """Update the summary table in ``manifest.js``; return ``{"changed", "table"}``."""
+    table = build_summary_table(exam_dir)
+    manifest_path = exam_dir / "manifest.js"
+    text = manifest_path.read_text(encoding="utf-8")
+    updated = bundle_loader.upsert_manifest_constant(text, SUMMARY_CONSTANT, render_summary_table(table), SUMMARY_GLOBAL)
+    changed = updated != text
+    if write and changed:
+        manifest_path.write_text(updated, encoding="utf-8")
+    return {"changed": changed, "table": table}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Embed per-exam summary columns in the reading manifest")
+    parser.add_argument("--exam-dir", type=Path, default=READING_DATA_DIR, help="directory of exam bundles and manifest.js")
+    parser.add_argument("--check", action="store_true", help="report without writing; exit 1 if the table is out of date")
+    args = parser.parse_args()
+
+    try:
+        result = sync_summary(args.exam_dir, write=not args.check)
+    except bundle_loader.BundleParseError as exc:
+        print(f"Summary build failed: {exc}", file=sys.stderr)
+        return 1
+    table = result["table"]
+    words = table["columns"]["wordCount"]
+    state = ("out of date" if args.check else "updated") if result["changed"] else "unchanged"
+    print(
+        f"Exam summary: {len(table['ids'])} exams, {len(table['kinds'])} question kinds, "
+        f"passage words {min(words, default=0)}-{max(words, default=0)}; manifest table {state}"
+    )
+    return 1 if args.check and result["changed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
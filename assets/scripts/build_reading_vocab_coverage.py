@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""Join the IELTS core wordlist with the reading passages ahead of time.
+
+Usage:
+    python assets/scripts/build_reading_vocab_coverage.py [--check]
+
+Post-processing stage for ``assets/generated/reading-exams``; run it after the
+Node generator.  Every passage (``extract_reading_exam_context.passage_text``)
+is tokenised and lemmatised once against ``assets/wordlists/ielts_core.json``
+and the result is written to ``vocab/ielts_core.coverage.js`` as
+``global.__READING_VOCAB_COVERAGE__``::
+
+    {
+      "version": 1,
+      "wordlist": "ielts_core",
+      "wordlistSize": 3610,
+      "ids": ["p1-high-01", ...],
+      "coverage": {"tokenCount": [812, ...], "coreTokenCount": [233, ...], "coreWordCount": [141, ...]},
+      "words": [
+        ["abandon", 3, 1, 41, 2],
+        ...
+      ]
+    }
+
+``coverage`` holds one column per statistic with a row per exam: passage
+tokens, tokens whose lemma is a core word and distinct core words.  ``words``
+is the inverted index: a core word followed by ``(examGap, count)`` pairs,
+exam numbers indexing ``ids`` and stored as the gap to the previous exam of
+the same word.  Rows are sorted by word; core words that no passage uses are
+left out.
+
+Lemmatisation is dictionary-driven: a token that is a core word is kept, an
+irregular form maps through ``IRREGULAR_FORMS``, otherwise the usual
+inflection suffixes are stripped and the first candidate that is a core word
+wins.  Hyphenated compounds count as one token when the compound is a core
+word and as their parts otherwise.  Entries with spaces are skipped.
+``--check`` writes nothing and exits 1 when the asset is out of date.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Set
+
+# Shared helpers under developer/tests/py are imported by module name.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "developer" / "tests" / "py"))
+
+import extract_reading_exam_context as extract_helper
+import reading_bundle_loader as bundle_loader
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+READING_DATA_DIR = REPO_ROOT / "assets" / "generated" / "reading-exams"
+WORDLIST_PATH = REPO_ROOT / "assets" / "wordlists" / "ielts_core.json"
+COVERAGE_RELATIVE = Path("vocab") / "ielts_core.coverage.js"
+READING_MANIFEST_MARKERS = ("global.__READING_EXAM_MANIFEST__ =", "const manifest =")
+COVERAGE_GLOBAL = "__READING_VOCAB_COVERAGE__"
+COVERAGE_VERSION = 1
+COVERAGE_COLUMNS = ("tokenCount", "coreTokenCount", "coreWordCount")
+
+_WORD_RE = re.compile(r"[a-z]+(?:['’-][a-z]+)*")
+_POSSESSIVE_RE = re.compile(r"['’]s$")
+
+IRREGULAR_FORMS = {
+    "am": "be", "is": "be", "are": "be", "was": "be", "were": "be", "been": "be", "being": "be",
+    "has": "have", "had": "have", "does": "do", "did": "do", "done": "do",
+    "went": "go", "gone": "go", "came": "come", "became": "become", "began": "begin", "begun": "begin",
+    "brought": "bring", "bought": "buy", "built": "build", "caught": "catch", "chose": "choose",
+    "chosen": "choose", "drew": "draw", "drawn": "draw", "drove": "drive", "driven": "drive",
+    "ate": "eat", "eaten": "eat", "fell": "fall", "fallen": "fall", "felt": "feel", "fought": "fight",
+    "found": "find", "flew": "fly", "flown": "fly", "forgot": "forget", "forgotten": "forget",
+    "froze": "freeze", "frozen": "freeze", "gave": "give", "given": "give", "grew": "grow",
+    "grown": "grow", "held": "hold", "kept": "keep", "knew": "know", "known": "know", "laid": "lay",
+    "led": "lead", "lent": "lend", "lay": "lie", "lain": "lie", "lost": "lose", "made": "make",
+    "meant": "mean", "met": "meet", "paid": "pay", "ran": "run", "rose": "rise", "risen": "rise",
+    "said": "say", "saw": "see", "seen": "see", "sold": "sell", "sent": "send", "shook": "shake",
+    "shaken": "shake", "shot": "shoot", "sang": "sing", "sung": "sing", "sat": "sit", "slept": "sleep",
+    "spoke": "speak", "spoken": "speak", "spent": "spend", "stood": "stand", "stole": "steal",
+    "stolen": "steal", "struck": "strike", "swam": "swim", "swum": "swim", "took": "take",
+    "taken": "take", "taught": "teach", "thought": "think", "threw": "throw", "thrown": "throw",
+    "understood": "understand", "woke": "wake", "woken": "wake", "wore": "wear", "worn": "wear",
+    "won": "win", "wrote": "write", "written": "write", "sought": "seek", "fed": "feed", "bred": "breed",
+    "bore": "bear", "borne": "bear", "born": "bear", "dealt": "deal", "dug": "dig", "hid": "hide",
+    "hidden": "hide", "hung": "hang", "spread": "spread", "withdrew": "withdraw", "withdrawn": "withdraw",
+    "children": "child", "men": "man", "women": "woman", "people": "person", "feet": "foot",
+    "teeth": "tooth", "geese": "goose", "mice": "mouse", "lives": "life", "wives": "wife",
+    "knives": "knife", "leaves": "leaf", "halves": "half", "selves": "self", "shelves": "shelf",
+    "wolves": "wolf", "analyses": "analysis", "crises": "crisis", "hypotheses": "hypothesis",
+    "phenomena": "phenomenon", "criteria": "criterion", "data": "datum", "media": "medium",
+    "bacteria": "bacterium", "fungi": "fungus", "nuclei": "nucleus", "stimuli": "stimulus",
+    "better": "good", "best": "good", "worse": "bad", "worst": "bad", "less": "little",
+    "least": "little", "further": "far", "furthest": "far", "farther": "far", "farthest": "far",
+}
+
+
+def load_wordlist(path: Path) -> List[str]:
+    """Lower-cased single-token headwords in wordlist order, without duplicates."""
+    entries = json.loads(path.read_text(encoding="utf-8"))
+    words: Dict[str, None] = {}
+    for entry in entries if isinstance(entries, list) else []:
+        word = str((entry or {}).get("word") or "").strip().lower()
+        if word and " " not in word and _WORD_RE.fullmatch(word):
+            words.setdefault(word, None)
+    return list(words)
+
+
+def _suffix_candidates(token: str) -> Iterable[str]:
+    def undouble(stem: str) -> Iterable[str]:
+        yield stem
+        yield stem + "e"
+        if len(stem) > 2 and stem[-1] == stem[-2]:
+            yield stem[:-1]
+
+    if token.endswith("ies") and len(token) > 4:
+        yield token[:-3] + "y"
+    if token.endswith("es") and len(token) > 3:
+        yield token[:-2]
+    if token.endswith("s") and not token.endswith("ss") and len(token) > 3:
+        yield token[:-1]
+    if token.endswith("ied") and len(token) > 4:
+        yield token[:-3] + "y"
+    if token.endswith("ed") and len(token) > 4:
+        yield from undouble(token[:-2])
+    if token.endswith("ing") and len(token) > 5:
+        yield from undouble(token[:-3])
+    if token.endswith("ier") and len(token) > 4:
+        yield token[:-3] + "y"
+    if token.endswith("iest") and len(token) > 5:
+        yield token[:-4] + "y"
+    if token.endswith("er") and len(token) > 4:
+        yield from undouble(token[:-2])
+    if token.endswith("est") and len(token) > 5:
+        yield from undouble(token[:-3])
+
+
+def lemmatize(token: str, vocabulary: Set[str]) -> str:
+    """Core-word lemma of ``token``; the token itself when no core word matches."""
+    if token in vocabulary:
+        return token
+    if token in IRREGULAR_FORMS:
+        irregular = IRREGULAR_FORMS[token]
+        return irregular if irregular in vocabulary else token
+    for candidate in _suffix_candidates(token):
+        if candidate in vocabulary:
+            return candidate
+    return token
+
+
+def tokenize(text: str, vocabulary: Set[str]) -> List[str]:
+    """Passage word tokens; compounds split unless the compound is a core word."""
+    tokens: List[str] = []
+    for raw in _WORD_RE.findall((text or "").lower()):
+        word = _POSSESSIVE_RE.sub("", raw).replace("’", "'")
+        if "-" in word and word not in vocabulary:
+            tokens.extend(part for part in word.split("-") if part)
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def passage_lemmas(text: str, vocabulary: Set[str]) -> Counter:
+    return Counter(lemmatize(token, vocabulary) for token in tokenize(text, vocabulary))
+
+
+def build_coverage(exam_dir: Path, wordlist_path: Path) -> Dict:
+    words = load_wordlist(wordlist_path)
+    vocabulary = set(words)
+    manifest = bundle_loader.load_assignment(exam_dir / "manifest.js", READING_MANIFEST_MARKERS)
+    ids: List[str] = []
+    columns: Dict[str, List[int]] = {name: [] for name in COVERAGE_COLUMNS}
+    postings: Dict[str, List[int]] = {}
+    last_exam: Dict[str, int] = {}
+    for exam_id, entry in manifest.items():
+        script = (entry or {}).get("script")
+        if not script:
+            continue
+        data_key = entry.get("dataKey") or exam_id
+        payload = bundle_loader.load_register_payload(exam_dir / script, register_key=data_key)
+        lemmas = passage_lemmas(extract_helper.passage_text(payload), vocabulary)
+        core = {lemma: count for lemma, count in lemmas.items() if lemma in vocabulary}
+        exam = len(ids)
+        ids.append(exam_id)
+        columns["tokenCount"].append(sum(lemmas.values()))
+        columns["coreTokenCount"].append(sum(core.values()))
+        columns["coreWordCount"].append(len(core))
+        for lemma in sorted(core):
+            postings.setdefault(lemma, []).extend((exam - last_exam.get(lemma, 0), core[lemma]))
+            last_exam[lemma] = exam
+    return {
+        "version": COVERAGE_VERSION,
+        "wordlist": wordlist_path.stem,
+        "wordlistSize": len(words),
+        "ids": ids,
+        "coverage": columns,
+        "words": [[word, *postings[word]] for word in sorted(postings)],
+    }
+
+
+def render_coverage(coverage: Dict) -> str:
+    """Coverage script; one word row per line so regenerated assets diff cleanly."""
+    head = {key: value for key, value in coverage.items() if key != "words"}
+    header = ",\n".join(
+        f"    {json.dumps(key)}: {json.dumps(value, ensure_ascii=False, separators=(',', ':'))}"
+        for key, value in head.items()
+    )
+    rows = ",\n".join(
+        f"      {json.dumps(row, ensure_ascii=False, separators=(',', ':'))}" for row in coverage["words"]
+    )
+    return "\n".join([
+        "(function registerReadingVocabCoverage(global) {",
+        "  'use strict';",
+        f"  global.{COVERAGE_GLOBAL} = {{",
+        header + ",",
+        '    "words": [',
+        rows,
+        "    ]",
+        "  };",
+        '})(typeof window !== "undefined" ? window : globalThis);',
+        "",
+    ])
+
+
+def sync_coverage(exam_dir: Path, wordlist_path: Path = WORDLIST_PATH, write: bool = True) -> Dict:
+    """Rebuild ``vocab/ielts_core.coverage.js``; return ``{"changed", "coverage", "bytes"}``."""
+    coverage = build_coverage(exam_dir, wordlist_path)
+    text = render_coverage(coverage)
+    path = exam_dir / COVERAGE_RELATIVE
+    changed = not path.exists() or path.read_text(encoding="utf-8") != text
+    if write and changed:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return {"changed": changed, "coverage": coverage, "bytes": len(text.encode("utf-8"))}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Precompute IELTS core vocabulary coverage of the reading passages")
+    parser.add_argument("--exam-dir", type=Path, default=READING_DATA_DIR, help="directory of exam bundles and manifest.js")
+    parser.add_argument("--wordlist", type=Path, default=WORDLIST_PATH, help="wordlist JSON (list of {word, ...})")
+    parser.add_argument("--check", action="store_true", help="report without writing; exit 1 if the asset is out of date")
+    args = parser.parse_args()
+
+    try:
+        result = sync_coverage(args.exam_dir, args.wordlist, write=not args.check)
+    except bundle_loader.BundleParseError as exc:
+        print(f"Vocabulary coverage build failed: {exc}", file=sys.stderr)
+        return 1
+    coverage = result["coverage"]
+    columns = coverage["coverage"]
+    tokens = sum(columns["tokenCount"])
+    ratio = f"{sum(columns['coreTokenCount']) / tokens:.1%}" if tokens else "n/a"
+    state = ("out of date" if args.check else "written") if result["changed"] else "unchanged"
+    print(
+        f"Vocabulary coverage: {len(coverage['ids'])} exams, {len(coverage['words'])}/{coverage['wordlistSize']} "
+        f"core words used, {ratio} of passage tokens, {result['bytes']} bytes; "
+        f"{args.exam_dir / COVERAGE_RELATIVE} {state}"
+    )
+    return 1 if args.check and result["changed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
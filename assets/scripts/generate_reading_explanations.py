@@ -1,19 +1,56 @@
 #!/usr/bin/env python3
-"""Generate per-exam reading explanation bundles from markdown source docs."""
+"""Generate per-exam reading explanation bundles from markdown source docs.
+
+Usage:
+    python assets/scripts/generate_reading_explanations.py [--incremental] [--jobs N] [--compact]
+
+``--incremental`` keeps a build state file with hashes of the source docs, the
+reading manifest entries and this generator.  Unchanged docs are not
+re-parsed, bundles are only rewritten when their bytes change and stale
+bundles are removed individually, so unchanged files keep their mtimes.
+
+Exams whose titles have no exact normalized match fall back to a trigram
+fuzzy matcher (``--match-threshold``).  Accepted, ambiguous and unmatched
+titles are written to a title match report for review.
+
+``--jobs N`` parses articles of all changed docs on a process pool; the output
+is byte-identical to the serial run.
+
+``--compact`` writes payloads without indentation or optional whitespace; the
+``register(dataKey, payload)`` call the runtime registry expects is unchanged.
+Every build writes a size report comparing each bundle's bytes on disk before
+and after the build.
+"""
 
 from __future__ import annotations
 
+import argparse
+import hashlib
+import heapq
 import json
 import re
-from dataclasses import dataclass
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Shared helpers under developer/tests/py are imported by module name.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "developer" / "tests" / "py"))
+
+import reading_bundle_loader as bundle_loader
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 DATA_DIR = REPO_ROOT / "data"
 READING_MANIFEST_PATH = REPO_ROOT / "assets" / "generated" / "reading-exams" / "manifest.js"
 READING_DATA_DIR = REPO_ROOT / "assets" / "generated" / "reading-exams"
 OUTPUT_DIR = REPO_ROOT / "assets" / "generated" / "reading-explanations"
+BUILD_STATE_PATH = REPO_ROOT / "developer" / "tests" / "reports" / "reading-explanations-build-state.json"
+BUILD_STATE_VERSION = 1
+TITLE_MATCH_REPORT_PATH = REPO_ROOT / "developer" / "tests" / "reports" / "reading-explanations-title-matches.json"
+SIZE_REPORT_PATH = REPO_ROOT / "developer" / "tests" / "reports" / "reading-explanations-size-report.json"
+# manifest.js declares a local object before assigning it to the global; accept both forms.
+READING_MANIFEST_MARKERS = ("global.__READING_EXAM_MANIFEST__ =", "const manifest =")
 
 DOC_PRIORITY = {
     "P3 解析+1202高频_副本.md": 30,
@@ -26,6 +63,13 @@ DOC_PRIORITY = {
 MANUAL_ALIAS_BY_EXAM_ID: Dict[str, str] = {
 }
 
+# Fuzzy title matching: Jaccard similarity over title trigrams.  A candidate is
+# accepted when it clears the threshold and beats the runner-up by the margin;
+# otherwise the exam is reported as ambiguous or unmatched.
+FUZZY_MATCH_THRESHOLD = 0.6
+FUZZY_MATCH_MARGIN = 0.1
+FUZZY_MATCH_TOP_K = 5
+
 SPLIT_KINDS = {
     "single_choice",
     "multi_choice",
@@ -54,11 +98,36 @@ class ParsedArticle:
     question_sections: List[Dict]
 
 
+@dataclass
+class MarkdownLine:
+    """One source line classified once and shared by both parser passes."""
+
+    text: str
+    cleaned: str
+    paragraph_label: Optional[str] = None
+    paragraph_text: Optional[str] = None
+    is_section_title: bool = False
+    question_number: Optional[int] = None
+
+
+LIST_PREFIX_RE = re.compile(r"^\s*[-•]\s*")
+BOLD_RE = re.compile(r"\*\*(.*?)\*\*")
+INLINE_CODE_RE = re.compile(r"`([^`]+)`")
+PARAGRAPH_NAME = r"(?:Paragraph\s+[A-Z0-9]+|第[一二三四五六七八九十0-9]+段)"
+INLINE_PARAGRAPH_RE = re.compile(rf"^[-•]\s*\*\*({PARAGRAPH_NAME}.*?)\*\*[:：]\s*(.+)$", re.I)
+PARAGRAPH_LABEL_RE = re.compile(rf"^\*\*({PARAGRAPH_NAME}.*?)\*\*$", re.I)
+SECTION_TITLE_RE = re.compile(r"^\*{0,2}\d+[\.、]\s*.*(Questions?|题)", re.I)
+QUESTION_NUMBER_CN_RE = re.compile(r"题目\s*(\d+)")
+QUESTION_NUMBER_EN_RE = re.compile(r"Question\s*(\d+)", re.I)
+
+
 def clean_markdown_text(text: str) -> str:
     text = text.replace("\\.", ".")
-    text = re.sub(r"^\s*[-•]\s*", "", text)
-    text = re.sub(r"\*\*(.*?)\*\*", r"\1", text)
-    text = re.sub(r"`([^`]+)`", r"\1", text)
+    text = LIST_PREFIX_RE.sub("", text)
+    if "**" in text:
+        text = BOLD_RE.sub(r"\1", text)
+    if "`" in text:
+        text = INLINE_CODE_RE.sub(r"\1", text)
     text = text.strip()
     return text
 
@@ -77,27 +146,24 @@ def normalize_title(value: str) -> str:
 
 
 def parse_js_manifest_object(js_text: str) -> Dict:
-    marker = "global.__READING_EXAM_MANIFEST__ ="
-    marker_index = js_text.find(marker)
-    if marker_index < 0:
-        raise RuntimeError("Manifest assignment marker missing")
-    start = js_text.find("{", marker_index)
-    end = js_text.rfind("};")
-    if start < 0 or end < 0 or end <= start:
+    try:
+        payload = bundle_loader.parse_assignment_text(js_text, READING_MANIFEST_MARKERS)
+    except bundle_loader.BundleParseError as exc:
+        raise RuntimeError(f"Invalid manifest.js object: {exc}") from exc
+    if not isinstance(payload, dict):
         raise RuntimeError("Invalid manifest.js object range")
-    payload = js_text[start:end + 1]
-    return json.loads(payload)
+    return payload
 
 
 def extract_pdf_title(script_path: Path) -> Optional[str]:
+    # meta.pdfFilename sits in the bundle header, so only the first chunk is read.
     try:
-        text = script_path.read_text(encoding="utf-8")
-    except Exception:
+        fields = bundle_loader.extract_register_fields(script_path, {"pdfFilename": ("meta", "pdfFilename")})
+    except (OSError, UnicodeDecodeError, bundle_loader.BundleParseError):
         return None
-    match = re.search(r'"pdfFilename"\s*:\s*"([^"]+)"', text)
-    if not match:
+    raw = fields.get("pdfFilename")
+    if not isinstance(raw, str) or not raw:
         return None
-    raw = match.group(1)
     raw = re.sub(r"\.pdf$", "", raw, flags=re.I)
     raw = re.sub(r"^\d+\.?\s*", "", raw)
     raw = re.sub(r"^P[123]\s*-\s*", "", raw, flags=re.I)
@@ -105,11 +171,16 @@ def extract_pdf_title(script_path: Path) -> Optional[str]:
 
 
 def load_reading_manifest() -> Dict[str, ReadingManifestEntry]:
-    text = READING_MANIFEST_PATH.read_text(encoding="utf-8")
-    obj = parse_js_manifest_object(text)
+    try:
+        obj = bundle_loader.load_assignment(READING_MANIFEST_PATH, READING_MANIFEST_MARKERS)
+    except bundle_loader.BundleParseError as exc:
+        raise RuntimeError(f"Invalid manifest.js object: {exc}") from exc
     entries: Dict[str, ReadingManifestEntry] = {}
     for key, value in obj.items():
-        script_name = value.get("script", "").replace("./", "")
+        if not value.get("script"):
+            # pdf-only entries have no exam bundle to explain.
+            continue
+        script_name = value["script"].replace("./", "")
         script_path = READING_DATA_DIR / script_name
         entries[key] = ReadingManifestEntry(
             exam_id=value["examId"],
@@ -162,91 +233,107 @@ def choose_section_mode(section_title: str) -> str:
 
 
 def parse_question_number(line: str) -> Optional[int]:
-    match = re.search(r"题目\s*(\d+)", line)
+    match = QUESTION_NUMBER_CN_RE.search(line)
     if match:
         return int(match.group(1))
-    match = re.search(r"Question\s*(\d+)", line, re.I)
+    match = QUESTION_NUMBER_EN_RE.search(line)
     if match:
         return int(match.group(1))
     return None
 
 
-def collect_paragraph_notes(lines: List[str]) -> Tuple[str, List[Dict[str, str]]]:
+def tokenize_lines(lines: List[str]) -> List[MarkdownLine]:
+    """Classify every line of an article chunk in a single pass.
+
+    Cheap prefix/substring checks gate each precompiled pattern, and the
+    cleaned text is computed once per line instead of once per use.
+    """
+    tokens: List[MarkdownLine] = []
+    for raw in lines:
+        text = raw.strip().replace("\\.", ".")
+        if not text:
+            tokens.append(MarkdownLine(text="", cleaned=""))
+            continue
+        token = MarkdownLine(text=text, cleaned=clean_markdown_text(text))
+        head = text[0]
+        if head in "-•":
+            match = INLINE_PARAGRAPH_RE.match(text)
+            if match:
+                token.paragraph_label = match.group(1)
+                token.paragraph_text = match.group(2)
+        elif head == "*":
+            match = PARAGRAPH_LABEL_RE.match(text)
+            if match:
+                token.paragraph_label = match.group(1)
+        if head == "*" or head.isdigit():
+            token.is_section_title = SECTION_TITLE_RE.match(text) is not None
+        token.question_number = parse_question_number(text)
+        tokens.append(token)
+    return tokens
+
+
+def join_cleaned(tokens: List[MarkdownLine]) -> str:
+    return "\n".join(token.cleaned for token in tokens if token.cleaned).strip()
+
+
+def collect_paragraph_notes(
+    lines: List[str],
+    tokens: Optional[List[MarkdownLine]] = None,
+) -> Tuple[str, List[Dict[str, str]]]:
+    if tokens is None:
+        tokens = tokenize_lines(lines)
+
     note_type = "段落讲解"
-    for line in lines:
-        if "段落翻译" in line:
+    for token in tokens:
+        if "段落翻译" in token.text:
             note_type = "翻译"
             break
-        if "Brief Summary" in line:
+        if "Brief Summary" in token.text:
             note_type = "总结"
             break
 
     notes: List[Dict[str, str]] = []
     current_label = ""
-    current_lines: List[str] = []
+    current_lines: List[MarkdownLine] = []
 
     def flush_current() -> None:
         nonlocal current_label, current_lines
-        content = "\n".join(clean_markdown_text(x) for x in current_lines if clean_markdown_text(x)).strip()
+        content = join_cleaned(current_lines)
         if content:
             label = clean_markdown_text(current_label) if current_label else f"段落 {len(notes) + 1}"
             notes.append({"label": label, "text": content})
         current_label = ""
         current_lines = []
 
-    inline_patterns = [
-        r"^[-•]\s*\*\*(Paragraph\s+[A-Z0-9]+.*?)\*\*[:：]\s*(.+)$",
-        r"^[-•]\s*\*\*(第[一二三四五六七八九十0-9]+段.*?)\*\*[:：]\s*(.+)$",
-    ]
-
-    label_patterns = [
-        r"^\*\*(Paragraph\s+[A-Z0-9]+.*?)\*\*$",
-        r"^\*\*(第[一二三四五六七八九十0-9]+段.*?)\*\*$",
-    ]
-
-    for raw in lines:
-        line = raw.strip().replace("\\.", ".")
-        cleaned_line = clean_markdown_text(line)
-        if not line:
+    for token in tokens:
+        if not token.text:
             continue
-        if "二、题目解析" in cleaned_line:
+        if "二、题目解析" in token.cleaned:
             break
 
-        matched_inline = False
-        for pattern in inline_patterns:
-            inline_match = re.match(pattern, line, re.I)
-            if inline_match:
-                flush_current()
-                label = inline_match.group(1)
-                text = inline_match.group(2)
-                notes.append({"label": clean_markdown_text(label), "text": clean_markdown_text(text)})
-                matched_inline = True
-                break
-        if matched_inline:
-            continue
-
-        matched_label = False
-        for pattern in label_patterns:
-            label_match = re.match(pattern, line, re.I)
-            if label_match:
-                flush_current()
-                current_label = label_match.group(1)
-                matched_label = True
-                break
-        if matched_label:
+        if token.paragraph_label is not None:
+            flush_current()
+            if token.paragraph_text is not None:
+                notes.append({
+                    "label": clean_markdown_text(token.paragraph_label),
+                    "text": clean_markdown_text(token.paragraph_text),
+                })
+            else:
+                current_label = token.paragraph_label
             continue
 
         # Ignore section headers and pure list prefixes.
-        if cleaned_line.startswith("一、"):
+        if token.cleaned.startswith("一、"):
             continue
-        if cleaned_line == "目录":
+        if token.cleaned == "目录":
             continue
 
-        current_lines.append(line)
+        current_lines.append(token)
 
     flush_current()
 
     if not notes:
+        # The fallback cleans raw lines (single unescape), unlike the tokens above.
         fallback_lines = []
         for raw in lines:
             line = clean_markdown_text(raw)
@@ -261,17 +348,23 @@ def collect_paragraph_notes(lines: List[str]) -> Tuple[str, List[Dict[str, str]]
     return note_type, notes
 
 
-def parse_question_sections(lines: List[str]) -> List[Dict]:
+def parse_question_sections(
+    lines: List[str],
+    tokens: Optional[List[MarkdownLine]] = None,
+) -> List[Dict]:
+    if tokens is None:
+        tokens = tokenize_lines(lines)
+
     # Keep only parse section after question analysis heading.
     start = None
-    for idx, raw in enumerate(lines):
-        if "题目解析" in raw:
+    for idx, token in enumerate(tokens):
+        if "题目解析" in token.text:
             start = idx
             break
     if start is None:
         return []
 
-    working = lines[start + 1 :]
+    working = tokens[start + 1 :]
     sections: List[Dict] = []
     current_section: Optional[Dict] = None
     current_question: Optional[Dict] = None
@@ -281,7 +374,7 @@ def parse_question_sections(lines: List[str]) -> List[Dict]:
         if not current_question or not current_section:
             current_question = None
             return
-        text = "\n".join(clean_markdown_text(x) for x in current_question.get("lines", []) if clean_markdown_text(x)).strip()
+        text = join_cleaned(current_question.get("lines", []))
         if text:
             current_section.setdefault("items", []).append(
                 {
@@ -296,24 +389,23 @@ def parse_question_sections(lines: List[str]) -> List[Dict]:
         if not current_section:
             return
         finalize_question()
-        body_text = "\n".join(clean_markdown_text(x) for x in current_section.get("bodyLines", []) if clean_markdown_text(x)).strip()
+        body_text = join_cleaned(current_section.get("bodyLines", []))
         current_section["text"] = body_text
         current_section.pop("bodyLines", None)
         if current_section.get("items") or current_section.get("text"):
             sections.append(current_section)
         current_section = None
 
-    for raw in working:
-        line = raw.strip().replace("\\.", ".")
-        if not line:
+    for token in working:
+        if not token.text:
             continue
 
         # Section title line examples:
         # **1. 单选题（Questions 27–31：Choose A–D）**
         # 1. 判断题（Questions 31–35：YES/NO/NOT GIVEN）
-        if re.match(r"^\*{0,2}\d+[\.、]\s*.*(Questions?|题)", line, re.I):
+        if token.is_section_title:
             finalize_section()
-            title_text = clean_markdown_text(line)
+            title_text = token.cleaned
             q_range = parse_question_range(title_text)
             current_section = {
                 "sectionTitle": title_text,
@@ -325,7 +417,7 @@ def parse_question_sections(lines: List[str]) -> List[Dict]:
                 current_section["questionRange"] = {"start": q_range[0], "end": q_range[1]}
             continue
 
-        q_number = parse_question_number(line)
+        q_number = token.question_number
         if q_number is not None:
             if not current_section:
                 current_section = {
@@ -337,7 +429,7 @@ def parse_question_sections(lines: List[str]) -> List[Dict]:
             finalize_question()
             current_question = {
                 "questionNumber": q_number,
-                "lines": [line],
+                "lines": [token],
             }
             if "questionRange" not in current_section:
                 current_section["questionRange"] = {"start": q_number, "end": q_number}
@@ -347,10 +439,10 @@ def parse_question_sections(lines: List[str]) -> List[Dict]:
             continue
 
         if current_question is not None:
-            current_question["lines"].append(line)
+            current_question["lines"].append(token)
 
         if current_section is not None:
-            current_section["bodyLines"].append(line)
+            current_section["bodyLines"].append(token)
 
     finalize_section()
 
@@ -364,10 +456,7 @@ def parse_question_sections(lines: List[str]) -> List[Dict]:
     return sections
 
 
-def parse_articles_from_doc(path: Path) -> List[ParsedArticle]:
-    text = path.read_text(encoding="utf-8")
-    lines = text.splitlines()
-
+def split_article_spans(lines: List[str]) -> List[Tuple[str, int, int]]:
     article_spans: List[Tuple[str, int, int]] = []
     current_title: Optional[str] = None
     current_start: Optional[int] = None
@@ -382,28 +471,132 @@ def parse_articles_from_doc(path: Path) -> List[ParsedArticle]:
 
     if current_title is not None and current_start is not None:
         article_spans.append((current_title, current_start, len(lines)))
+    return article_spans
+
+
+def parse_article_chunk(doc_name: str, title: str, chunk: List[str]) -> Optional[ParsedArticle]:
+    tokens = tokenize_lines(chunk)
+    note_type, passage_notes = collect_paragraph_notes(chunk, tokens)
+    question_sections = parse_question_sections(chunk, tokens)
+    if not passage_notes and not question_sections:
+        return None
+    return ParsedArticle(
+        doc_name=doc_name,
+        title=title,
+        normalized_title=normalize_title(title),
+        note_type=note_type,
+        passage_notes=passage_notes,
+        question_sections=question_sections,
+    )
+
 
+def _parse_article_task(task: Tuple[str, str, List[str]]) -> Optional[ParsedArticle]:
+    return parse_article_chunk(*task)
+
+
+def parse_articles_from_doc(path: Path) -> List[ParsedArticle]:
+    lines = path.read_text(encoding="utf-8").splitlines()
     results: List[ParsedArticle] = []
-    for title, start, end in article_spans:
-        chunk = lines[start:end]
-        note_type, passage_notes = collect_paragraph_notes(chunk)
-        question_sections = parse_question_sections(chunk)
-        if not passage_notes and not question_sections:
-            continue
-        results.append(
-            ParsedArticle(
-                doc_name=path.name,
-                title=title,
-                normalized_title=normalize_title(title),
-                note_type=note_type,
-                passage_notes=passage_notes,
-                question_sections=question_sections,
-            )
-        )
+    for title, start, end in split_article_spans(lines):
+        article = parse_article_chunk(path.name, title, lines[start:end])
+        if article is not None:
+            results.append(article)
+    return results
 
+
+def parse_docs(doc_paths: List[Path], jobs: int = 1) -> Dict[Path, List[ParsedArticle]]:
+    """Parse docs into articles, fanning individual articles out over ``jobs`` processes.
+
+    Tasks are submitted in (doc, article) order and ``executor.map`` preserves
+    that order, so the result matches the serial parse exactly.
+    """
+    if jobs <= 1 or not doc_paths:
+        return {path: parse_articles_from_doc(path) for path in doc_paths}
+
+    tasks: List[Tuple[str, str, List[str]]] = []
+    owners: List[Path] = []
+    for path in doc_paths:
+        lines = path.read_text(encoding="utf-8").splitlines()
+        for title, start, end in split_article_spans(lines):
+            tasks.append((path.name, title, lines[start:end]))
+            owners.append(path)
+
+    results: Dict[Path, List[ParsedArticle]] = {path: [] for path in doc_paths}
+    chunksize = max(1, len(tasks) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for owner, article in zip(owners, executor.map(_parse_article_task, tasks, chunksize=chunksize)):
+            if article is not None:
+                results[owner].append(article)
     return results
 
 
+def title_trigrams(normalized: str) -> Set[str]:
+    padded = f"^{normalized}$"
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+class TitleTrigramIndex:
+    """Inverted trigram index over normalized article titles."""
+
+    def __init__(self, normalized_titles: Iterable[str]) -> None:
+        self.titles: List[str] = sorted({title for title in normalized_titles if title})
+        self.sizes: List[int] = []
+        self.postings: Dict[str, List[int]] = {}
+        for title_id, title in enumerate(self.titles):
+            grams = title_trigrams(title)
+            self.sizes.append(len(grams))
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(title_id)
+
+    def search(self, normalized: str, k: int = FUZZY_MATCH_TOP_K) -> List[Tuple[str, float]]:
+        """Return up to ``k`` ``(title, jaccard)`` pairs, best first."""
+        if not normalized:
+            return []
+        grams = title_trigrams(normalized)
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for title_id in self.postings.get(gram, ()):
+                shared[title_id] = shared.get(title_id, 0) + 1
+        scored = (
+            (count / (len(grams) + self.sizes[title_id] - count), self.titles[title_id])
+            for title_id, count in shared.items()
+        )
+        best = heapq.nsmallest(k, scored, key=lambda item: (-item[0], item[1]))
+        return [(title, score) for score, title in best]
+
+
+@dataclass
+class TitleMatch:
+    status: str  # exact | fuzzy | ambiguous | unmatched
+    normalized_title: Optional[str] = None
+    score: float = 0.0
+    candidates: Optional[List[Tuple[str, float]]] = None
+
+
+def match_title(
+    title_variants: List[str],
+    by_norm_title: Dict[str, List[ParsedArticle]],
+    index: TitleTrigramIndex,
+    threshold: float = FUZZY_MATCH_THRESHOLD,
+    margin: float = FUZZY_MATCH_MARGIN,
+) -> TitleMatch:
+    normalized_variants = [normalize_title(title) for title in title_variants]
+    for normalized in normalized_variants:
+        if normalized and normalized in by_norm_title:
+            return TitleMatch("exact", normalized, 1.0)
+
+    best_by_title: Dict[str, float] = {}
+    for normalized in normalized_variants:
+        for title, score in index.search(normalized):
+            best_by_title[title] = max(score, best_by_title.get(title, 0.0))
+    candidates = sorted(best_by_title.items(), key=lambda item: (-item[1], item[0]))[:FUZZY_MATCH_TOP_K]
+    if not candidates or candidates[0][1] < threshold:
+        return TitleMatch("unmatched", candidates=candidates)
+    if len(candidates) > 1 and candidates[0][1] - candidates[1][1] < margin:
+        return TitleMatch("ambiguous", candidates=candidates)
+    return TitleMatch("fuzzy", candidates[0][0], candidates[0][1], candidates)
+
+
 def select_best_article(candidates: List[ParsedArticle], exam_id: str) -> ParsedArticle:
     override_title = MANUAL_ALIAS_BY_EXAM_ID.get(exam_id)
     if override_title:
@@ -421,8 +614,8 @@ def select_best_article(candidates: List[ParsedArticle], exam_id: str) -> Parsed
     return sorted(candidates, key=score, reverse=True)[0]
 
 
-def build_payload(entry: ReadingManifestEntry, article: ParsedArticle) -> Dict:
-    return {
+def build_payload(entry: ReadingManifestEntry, article: ParsedArticle, match_score: Optional[float] = None) -> Dict:
+    payload = {
         "schemaVersion": "ReadingExplanationV1",
         "examId": entry.exam_id,
         "meta": {
@@ -436,77 +629,203 @@ def build_payload(entry: ReadingManifestEntry, article: ParsedArticle) -> Dict:
         "passageNotes": article.passage_notes,
         "questionExplanations": article.question_sections,
     }
+    if match_score is not None:
+        payload["meta"]["matchScore"] = round(match_score, 3)
+    return payload
 
 
-def write_explanation_module(path: Path, data_key: str, payload: Dict) -> None:
-    content = (
+def dump_payload(payload, compact: bool = False) -> str:
+    if compact:
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(payload, ensure_ascii=False, indent=2)
+
+
+def render_explanation_module(data_key: str, payload: Dict, compact: bool = False) -> str:
+    return (
         "(function registerReadingExplanationData(global) {\n"
         "  'use strict';\n"
         "  if (!global.__READING_EXPLANATION_DATA__ || typeof global.__READING_EXPLANATION_DATA__.register !== \"function\") {\n"
         "    throw new Error(\"reading_explanation_registry_missing\");\n"
         "  }\n"
         f"  global.__READING_EXPLANATION_DATA__.register({json.dumps(data_key, ensure_ascii=False)}, "
-        f"{json.dumps(payload, ensure_ascii=False, indent=2)}\n"
+        f"{dump_payload(payload, compact)}\n"
         "  );\n"
         "})(typeof window !== \"undefined\" ? window : globalThis);\n"
     )
-    path.write_text(content, encoding="utf-8")
 
 
-def write_explanation_manifest(path: Path, manifest: Dict[str, Dict]) -> None:
-    content = (
+def write_explanation_module(path: Path, data_key: str, payload: Dict, compact: bool = False) -> None:
+    path.write_text(render_explanation_module(data_key, payload, compact), encoding="utf-8")
+
+
+def render_explanation_manifest(manifest: Dict[str, Dict], compact: bool = False) -> str:
+    return (
         "(function registerReadingExplanationManifest(global) {\n"
         "  'use strict';\n"
         "  global.__READING_EXPLANATION_MANIFEST__ = "
-        f"{json.dumps(manifest, ensure_ascii=False, indent=2)};\n"
+        f"{dump_payload(manifest, compact)};\n"
         "})(typeof window !== \"undefined\" ? window : globalThis);\n"
     )
-    path.write_text(content, encoding="utf-8")
 
 
-def main() -> int:
-    reading_manifest = load_reading_manifest()
+def write_explanation_manifest(path: Path, manifest: Dict[str, Dict], compact: bool = False) -> None:
+    path.write_text(render_explanation_manifest(manifest, compact), encoding="utf-8")
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write ``content`` only when it differs from the file's bytes; returns True if written."""
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+def bundle_sizes(directory: Path) -> Dict[str, int]:
+    return {path.name: path.stat().st_size for path in directory.glob("*.js")}
+
+
+def build_size_report(before: Dict[str, int], outputs: Dict[str, str], compact: bool) -> Dict:
+    """Compare bundle bytes on disk before a build with the bytes it writes."""
+    files = []
+    for file_name in sorted(set(before) | set(outputs)):
+        after = len(outputs[file_name].encode("utf-8")) if file_name in outputs else 0
+        files.append({
+            "file": file_name,
+            "beforeBytes": before.get(file_name, 0),
+            "afterBytes": after,
+            "deltaBytes": after - before.get(file_name, 0),
+        })
+    before_total = sum(before.values())
+    after_total = sum(item["afterBytes"] for item in files)
+    return {
+        "format": "compact" if compact else "indented",
+        "summary": {
+            "files": len(outputs),
+            "beforeBytes": before_total,
+            "afterBytes": after_total,
+            "deltaBytes": after_total - before_total,
+            "ratio": round(after_total / before_total, 4) if before_total else None,
+        },
+        "files": sorted(files, key=lambda item: (item["deltaBytes"], item["file"])),
+    }
+
+
+def write_size_report(path: Path, report: Dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    summary = report["summary"]
+    change = f"{summary['deltaBytes'] / summary['beforeBytes']:+.1%}" if summary["beforeBytes"] else "new"
+    print(
+        f"Bundle size ({report['format']}): {summary['beforeBytes']} -> {summary['afterBytes']} bytes "
+        f"({change}, report: {path})"
+    )
+
+
+def load_build_state(path: Path) -> Dict:
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(state, dict) or state.get("version") != BUILD_STATE_VERSION:
+        return {}
+    return state
+
+
+def manifest_entries_hash(reading_manifest: Dict[str, ReadingManifestEntry]) -> str:
+    entries = [asdict(reading_manifest[key]) for key in sorted(reading_manifest)]
+    return sha256_bytes(json.dumps(entries, ensure_ascii=False, sort_keys=True).encode("utf-8"))
+
+
+def load_articles(
+    doc_paths: List[Path],
+    cached_docs: Dict[str, Dict],
+    jobs: int = 1,
+) -> Tuple[List[ParsedArticle], Dict[str, Dict], int]:
+    """Parse source docs, reusing cached articles for docs whose hash is unchanged."""
+    digests = {md_path: sha256_bytes(md_path.read_bytes()) for md_path in doc_paths}
+    changed = [
+        md_path for md_path in doc_paths
+        if (cached_docs.get(md_path.name) or {}).get("sha256") != digests[md_path]
+    ]
+    parsed = parse_docs(changed, jobs)
 
     articles: List[ParsedArticle] = []
-    for md_path in sorted(DATA_DIR.glob("*.md")):
-        articles.extend(parse_articles_from_doc(md_path))
+    docs_state: Dict[str, Dict] = {}
+    for md_path in doc_paths:
+        if md_path in parsed:
+            doc_articles = parsed[md_path]
+        else:
+            doc_articles = [ParsedArticle(**item) for item in cached_docs[md_path.name].get("articles") or []]
+        articles.extend(doc_articles)
+        docs_state[md_path.name] = {
+            "sha256": digests[md_path],
+            "articles": [asdict(article) for article in doc_articles],
+        }
+    return articles, docs_state, len(changed)
 
+
+def build_outputs(
+    reading_manifest: Dict[str, ReadingManifestEntry],
+    articles: List[ParsedArticle],
+    match_threshold: float = FUZZY_MATCH_THRESHOLD,
+    compact: bool = False,
+) -> Tuple[Dict[str, str], int, Dict]:
+    """Return ``{file name: module text}`` for every bundle plus the manifest, the match count and the title match report."""
     by_norm_title: Dict[str, List[ParsedArticle]] = {}
     for article in articles:
         by_norm_title.setdefault(article.normalized_title, []).append(article)
+    title_index = TitleTrigramIndex(by_norm_title)
 
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    for old_file in OUTPUT_DIR.glob("*.js"):
-        old_file.unlink()
-
+    outputs: Dict[str, str] = {}
     output_manifest: Dict[str, Dict] = {}
     matched_count = 0
+    match_report: Dict = {
+        "threshold": match_threshold,
+        "margin": FUZZY_MATCH_MARGIN,
+        "summary": {"exact": 0, "fuzzy": 0, "ambiguous": 0, "unmatched": 0},
+        "fuzzy": [],
+        "ambiguous": [],
+        "unmatched": [],
+    }
 
     for exam_id, entry in sorted(reading_manifest.items()):
-        candidates: List[ParsedArticle] = []
         title_variants = [entry.title]
         if entry.pdf_title:
             title_variants.append(entry.pdf_title)
 
-        for title in title_variants:
-            normalized = normalize_title(title)
-            if normalized and normalized in by_norm_title:
-                candidates.extend(by_norm_title[normalized])
-
-        if not candidates:
+        match = match_title(title_variants, by_norm_title, title_index, match_threshold)
+        match_report["summary"][match.status] += 1
+        if match.status != "exact":
+            match_report[match.status].append({
+                "examId": exam_id,
+                "title": entry.title,
+                "pdfTitle": entry.pdf_title,
+                "candidates": [
+                    {"normalizedTitle": title, "score": round(score, 3)}
+                    for title, score in match.candidates or []
+                ],
+            })
+        if match.normalized_title is None:
             continue
 
         dedup: Dict[Tuple[str, str], ParsedArticle] = {}
-        for item in candidates:
+        for item in by_norm_title[match.normalized_title]:
             dedup[(item.doc_name, item.title)] = item
         candidates = list(dedup.values())
 
         selected = select_best_article(candidates, exam_id)
-        payload = build_payload(entry, selected)
+        payload = build_payload(entry, selected, match.score if match.status == "fuzzy" else None)
 
         script_name = f"{entry.data_key}.js"
-        output_path = OUTPUT_DIR / script_name
-        write_explanation_module(output_path, entry.data_key, payload)
+        outputs[script_name] = render_explanation_module(entry.data_key, payload, compact)
         output_manifest[entry.data_key] = {
             "examId": entry.exam_id,
             "dataKey": entry.data_key,
@@ -517,12 +836,183 @@ def main() -> int:
         }
         matched_count += 1
 
-    write_explanation_manifest(OUTPUT_DIR / "manifest.js", output_manifest)
+    outputs["manifest.js"] = render_explanation_manifest(output_manifest, compact)
+    return outputs, matched_count, match_report
+
+
+def write_title_match_report(path: Path, match_report: Dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(match_report, ensure_ascii=False, indent=2), encoding="utf-8")
+    summary = match_report["summary"]
+    print(
+        f"Title matches: {summary['exact']} exact, {summary['fuzzy']} fuzzy, "
+        f"{summary['ambiguous']} ambiguous, {summary['unmatched']} unmatched (report: {path})"
+    )
+
+
+def run_full_build(
+    jobs: int = 1,
+    match_threshold: float = FUZZY_MATCH_THRESHOLD,
+    report_path: Path = TITLE_MATCH_REPORT_PATH,
+    compact: bool = False,
+    size_report_path: Path = SIZE_REPORT_PATH,
+) -> int:
+    reading_manifest = load_reading_manifest()
+
+    doc_paths = sorted(DATA_DIR.glob("*.md"))
+    parsed = parse_docs(doc_paths, jobs)
+    articles: List[ParsedArticle] = [article for md_path in doc_paths for article in parsed[md_path]]
+
+    outputs, matched_count, match_report = build_outputs(reading_manifest, articles, match_threshold, compact)
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    size_before = bundle_sizes(OUTPUT_DIR)
+    for old_file in OUTPUT_DIR.glob("*.js"):
+        old_file.unlink()
+    for file_name, content in outputs.items():
+        (OUTPUT_DIR / file_name).write_text(content, encoding="utf-8")
+    write_title_match_report(report_path, match_report)
+    write_size_report(size_report_path, build_size_report(size_before, outputs, compact))
+
+    print(f"Generated reading explanations: {matched_count} / {len(reading_manifest)} exams")
+    print(f"Output directory: {OUTPUT_DIR}")
+    return 0
+
+
+def run_incremental_build(
+    state_path: Path = BUILD_STATE_PATH,
+    jobs: int = 1,
+    match_threshold: float = FUZZY_MATCH_THRESHOLD,
+    report_path: Path = TITLE_MATCH_REPORT_PATH,
+    compact: bool = False,
+    size_report_path: Path = SIZE_REPORT_PATH,
+) -> int:
+    state = load_build_state(state_path)
+    generator_hash = sha256_bytes(Path(__file__).read_bytes())
+    # A changed generator may parse or render differently, so nothing cached can be trusted.
+    if state.get("generatorHash") != generator_hash:
+        state = {}
+
+    reading_manifest = load_reading_manifest()
+    manifest_hash = manifest_entries_hash(reading_manifest)
+    doc_paths = sorted(DATA_DIR.glob("*.md"))
+    articles, docs_state, parsed_count = load_articles(doc_paths, state.get("docs") or {}, jobs)
+
+    recorded_outputs: Dict[str, str] = state.get("outputs") or {}
+    up_to_date = (
+        bool(state)
+        and parsed_count == 0
+        and set(docs_state) == set(state.get("docs") or {})
+        and state.get("manifestHash") == manifest_hash
+        and state.get("matchThreshold") == match_threshold
+        and state.get("compact", False) == compact
+        and all(
+            (OUTPUT_DIR / file_name).exists() and sha256_bytes((OUTPUT_DIR / file_name).read_bytes()) == digest
+            for file_name, digest in recorded_outputs.items()
+        )
+    )
+    if up_to_date:
+        print(f"Reading explanations up to date: {len(recorded_outputs) - 1} bundles")
+        return 0
+
+    outputs, matched_count, match_report = build_outputs(reading_manifest, articles, match_threshold, compact)
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    size_before = bundle_sizes(OUTPUT_DIR)
+    written = 0
+    for file_name, content in outputs.items():
+        if write_if_changed(OUTPUT_DIR / file_name, content):
+            written += 1
+    removed = 0
+    for stale_file in OUTPUT_DIR.glob("*.js"):
+        if stale_file.name not in outputs:
+            stale_file.unlink()
+            removed += 1
+
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(
+        json.dumps(
+            {
+                "version": BUILD_STATE_VERSION,
+                "generatorHash": generator_hash,
+                "manifestHash": manifest_hash,
+                "matchThreshold": match_threshold,
+                "compact": compact,
+                "docs": docs_state,
+                "outputs": {
+                    file_name: sha256_bytes(content.encode("utf-8"))
+                    for file_name, content in sorted(outputs.items())
+                },
+            },
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+    write_title_match_report(report_path, match_report)
+    write_size_report(size_report_path, build_size_report(size_before, outputs, compact))
 
     print(f"Generated reading explanations: {matched_count} / {len(reading_manifest)} exams")
+    print(
+        f"Incremental build: parsed {parsed_count} / {len(doc_paths)} docs, "
+        f"wrote {written} / {len(outputs)} files, removed {removed} stale files"
+    )
     print(f"Output directory: {OUTPUT_DIR}")
     return 0
 
 
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate reading explanation bundles from markdown docs")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="reuse the build state: re-parse changed docs only and rewrite only changed bundles",
+    )
+    parser.add_argument(
+        "--state",
+        type=Path,
+        default=BUILD_STATE_PATH,
+        help="build state file used by --incremental",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="worker processes for markdown parsing (default 1 = serial)",
+    )
+    parser.add_argument(
+        "--match-threshold",
+        type=float,
+        default=FUZZY_MATCH_THRESHOLD,
+        help=f"minimum trigram similarity for fuzzy title matches (default {FUZZY_MATCH_THRESHOLD}; 1 = exact only)",
+    )
+    parser.add_argument(
+        "--match-report",
+        type=Path,
+        default=TITLE_MATCH_REPORT_PATH,
+        help="where to write the fuzzy/ambiguous/unmatched title report",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="write payloads without indentation (same register() contract, smaller bundles)",
+    )
+    parser.add_argument(
+        "--size-report",
+        type=Path,
+        default=SIZE_REPORT_PATH,
+        help="where to write the before/after bundle size report",
+    )
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be >= 1")
+    if not 0 < args.match_threshold <= 1:
+        parser.error("--match-threshold must be in (0, 1]")
+    if args.incremental:
+        return run_incremental_build(
+            args.state, args.jobs, args.match_threshold, args.match_report, args.compact, args.size_report
+        )
+    return run_full_build(args.jobs, args.match_threshold, args.match_report, args.compact, args.size_report)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
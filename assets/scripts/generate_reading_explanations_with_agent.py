@@ -6,19 +6,52 @@ Workflow
    scaffold a response template for a translator agent.
 2. Translator agent edits the scaffolded response JSON.
 3. `render`: validate the agent response and emit the final explanation JS.
+   `render-all` does the same for every response in `<work-dir>/responses`
+   concurrently and writes one aggregated issue report (including bundle
+   bytes before and after).  `--compact` drops payload indentation while
+   keeping the `register(examId, payload)` call unchanged.
+   `watch` polls `responses/` while editing and re-validates only the files
+   whose mtime or size changed, printing which issues appeared or went away.
+
+`dispatch` replaces step 2 with an HTTP call: every request packet is POSTed to
+a translator-agent endpoint (at most `--concurrency` in flight, retried with
+exponential backoff on network errors, 429 and 5xx), the returned JSON is
+saved to `responses/` and validated at once.  Per-exam checkpoints under
+`<work-dir>/dispatch-state` let an interrupted batch resume where it stopped.
+`developer/tests/py/reading_agent_stub_server.py` replays canned responses
+for offline runs.
 
 The translator agent hook lives in the generated JSON request/template files.
+
+Exam contexts are cached under `<work-dir>/context-cache`, keyed by the
+sha256 of the exam JS and of the extraction code (the helper plus the bundle
+loader and corpus modules it imports), so unchanged exams are not
+re-extracted between `prepare` and `render` runs.
 """
 
 from __future__ import annotations
 
 import argparse
-import importlib.util
+import asyncio
+import fnmatch
+import hashlib
+import http.client
+import importlib
 import json
 import os
+import random
 import re
+import sys
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+# Shared helpers under developer/tests/py are imported by module name.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "developer" / "tests" / "py"))
 
 
 SCRIPT_REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -26,6 +59,18 @@ ROOT = Path(os.environ.get("READING_EXPLANATION_REPO_ROOT") or SCRIPT_REPO_ROOT)
 EXPLANATION_DIR = ROOT / "assets" / "generated" / "reading-explanations"
 DEFAULT_WORK_DIR = ROOT / "developer" / "tests" / "artifacts" / "reading-explanation-agent"
 HELPER_PATH = SCRIPT_REPO_ROOT / "developer" / "tests" / "py" / "extract_reading_exam_context.py"
+# build_context 依赖的全部源码；任一文件变化都会让缓存的上下文失效
+EXTRACTOR_SOURCE_PATHS = (
+    HELPER_PATH,
+    HELPER_PATH.with_name("reading_bundle_loader.py"),
+    HELPER_PATH.with_name("reading_corpus_db.py"),
+)
+CONTEXT_CACHE_DIRNAME = "context-cache"
+RENDER_REPORT_NAME = "render-report.json"
+DISPATCH_STATE_DIRNAME = "dispatch-state"
+DISPATCH_REPORT_NAME = "dispatch-report.json"
+DISPATCH_ENDPOINT_ENV = "READING_AGENT_ENDPOINT"
+RETRYABLE_HTTP_STATUS = frozenset({408, 429, 500, 502, 503, 504})
 
 PLACEHOLDER_PATTERNS: Tuple[str, ...] = (
     "根据具体题目分析",
@@ -63,12 +108,86 @@ KIND_LABELS = {
 
 
 def load_extract_helper():
-    spec = importlib.util.spec_from_file_location("extract_reading_exam_context", HELPER_PATH)
-    if spec is None or spec.loader is None:
-        raise RuntimeError(f"无法加载 helper: {HELPER_PATH}")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+    return importlib.import_module("extract_reading_exam_context")
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def extractor_sha256() -> str:
+    hasher = hashlib.sha256()
+    for path in EXTRACTOR_SOURCE_PATHS:
+        hasher.update(path.read_bytes())
+    return hasher.hexdigest()
+
+
+class ContextCache:
+    """Exam contexts persisted per exam, keyed by exam-file and extractor hashes.
+
+    Entries live in ``<cache_dir>/<examId>.json`` and are reused while both
+    the exam bundle and every file in ``EXTRACTOR_SOURCE_PATHS`` are
+    byte-identical; anything else falls through to ``helper.build_context``.  Hits are also kept in
+    memory for the lifetime of the object.
+    """
+
+    def __init__(self, cache_dir: Optional[Path], helper=None) -> None:
+        self.cache_dir = cache_dir
+        self.helper = helper or load_extract_helper()
+        self.extractor_hash = extractor_sha256()
+        self.hits = 0
+        self.misses = 0
+        self._memory: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
+    def exam_path(self, exam_id: str) -> Path:
+        return Path(self.helper.EXAM_DIR) / f"{exam_id}.js"
+
+    def get(self, exam_id: str) -> Dict[str, Any]:
+        try:
+            source_hash = sha256_bytes(self.exam_path(exam_id).read_bytes())
+        except OSError:
+            # 源文件缺失：交给 helper 给出原有的报错
+            self.misses += 1
+            return self.helper.build_context(exam_id)
+
+        remembered = self._memory.get(exam_id)
+        if remembered is not None and remembered[0] == source_hash:
+            self.hits += 1
+            return remembered[1]
+
+        entry_path = self.cache_dir / f"{exam_id}.json" if self.cache_dir else None
+        if entry_path is not None and entry_path.exists():
+            try:
+                entry = json.loads(entry_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                entry = {}
+            if (
+                entry.get("sourceSha256") == source_hash
+                and entry.get("extractorSha256") == self.extractor_hash
+                and isinstance(entry.get("context"), dict)
+            ):
+                self.hits += 1
+                self._memory[exam_id] = (source_hash, entry["context"])
+                return entry["context"]
+
+        self.misses += 1
+        context = self.helper.build_context(exam_id)
+        self._memory[exam_id] = (source_hash, context)
+        if entry_path is not None:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps({
+                "examId": exam_id,
+                "sourceSha256": source_hash,
+                "extractorSha256": self.extractor_hash,
+                "context": context,
+            }, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, entry_path)
+        return context
+
+
+def context_cache_dir(work_dir: Path, enabled: bool = True) -> Optional[Path]:
+    return work_dir / CONTEXT_CACHE_DIRNAME if enabled else None
 
 
 def normalize_whitespace(value: str) -> str:
@@ -201,7 +320,12 @@ def build_request_payload(context: Dict[str, Any], template: Dict[str, Any], res
     }
 
 
-def write_explanation_module(path: Path, data_key: str, payload: Dict[str, Any]) -> None:
+def write_explanation_module(path: Path, data_key: str, payload: Dict[str, Any], compact: bool = False) -> int:
+    """Write the bundle and return its size in bytes; ``compact`` drops indentation only."""
+    if compact:
+        payload_text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    else:
+        payload_text = json.dumps(payload, ensure_ascii=False, indent=2)
     content = (
         "(function registerReadingExplanationData(global) {\n"
         "  'use strict';\n"
@@ -209,29 +333,54 @@ def write_explanation_module(path: Path, data_key: str, payload: Dict[str, Any])
         "    throw new Error(\"reading_explanation_registry_missing\");\n"
         "  }\n"
         f"  global.__READING_EXPLANATION_DATA__.register({json.dumps(data_key, ensure_ascii=False)}, "
-        f"{json.dumps(payload, ensure_ascii=False, indent=2)}\n"
+        f"{payload_text}\n"
         "  );\n"
         "})(typeof window !== \"undefined\" ? window : globalThis);\n"
     )
-    path.write_text(content, encoding="utf-8")
+    data = content.encode("utf-8")
+    path.write_bytes(data)
+    return len(data)
 
 
 def validate_response(context: Dict[str, Any], response: Dict[str, Any]) -> List[str]:
+    """Return the issues of an agent response; wrongly shaped parts are issues too, never exceptions."""
+    if not isinstance(response, dict):
+        return ["响应不是 JSON 对象"]
     issues: List[str] = []
     if response.get("examId") != context["examId"]:
         issues.append(f"examId 不匹配: {response.get('examId')} != {context['examId']}")
 
     answer_key = context.get("answerKey") or {}
     seen_ids = set()
-    for section in response.get("questionExplanations") or []:
+    sections = response.get("questionExplanations") or []
+    if not isinstance(sections, list):
+        issues.append("questionExplanations 不是数组")
+        sections = []
+    for section_index, section in enumerate(sections):
+        if not isinstance(section, dict):
+            issues.append(f"questionExplanations[{section_index}] 不是对象")
+            continue
         section_text = section.get("text", "") or ""
+        if not isinstance(section_text, str):
+            issues.append(f"questionExplanations[{section_index}].text 不是字符串")
+            section_text = ""
         for placeholder in PLACEHOLDER_PATTERNS:
             if placeholder in section_text:
                 issues.append(f"section.text 含占位词: {placeholder}")
-        for item in section.get("items") or []:
+        items = section.get("items") or []
+        if not isinstance(items, list):
+            issues.append(f"questionExplanations[{section_index}].items 不是数组")
+            items = []
+        for item_index, item in enumerate(items):
+            if not isinstance(item, dict):
+                issues.append(f"questionExplanations[{section_index}].items[{item_index}] 不是对象")
+                continue
             qid = str(item.get("questionId") or "")
             seen_ids.add(qid)
             text = item.get("text", "") or ""
+            if not isinstance(text, str):
+                issues.append(f"{qid}: text 不是字符串")
+                continue
             for placeholder in PLACEHOLDER_PATTERNS:
                 if placeholder in text:
                     issues.append(f"{qid}: 含占位词: {placeholder}")
@@ -249,21 +398,24 @@ def validate_response(context: Dict[str, Any], response: Dict[str, Any]) -> List
     if missing_ids:
         issues.append(f"缺少题目: {', '.join(missing_ids)}")
 
-    if not response.get("passageNotes"):
+    passage_notes = response.get("passageNotes")
+    if not passage_notes:
         issues.append("passageNotes 为空")
+    elif not isinstance(passage_notes, list):
+        issues.append("passageNotes 不是数组")
     return issues
 
 
 def command_prepare(args: argparse.Namespace) -> int:
-    helper = load_extract_helper()
     work_dir = Path(args.work_dir)
+    contexts = ContextCache(context_cache_dir(work_dir, not args.no_cache))
     request_dir = work_dir / "requests"
     response_dir = work_dir / "responses"
     request_dir.mkdir(parents=True, exist_ok=True)
     response_dir.mkdir(parents=True, exist_ok=True)
 
     for exam_id in args.exam_ids:
-        context = helper.build_context(exam_id)
+        context = contexts.get(exam_id)
         template = build_template(context)
         response_path = response_dir / f"{exam_id}.json"
         request_path = request_dir / f"{exam_id}.json"
@@ -279,8 +431,8 @@ def command_prepare(args: argparse.Namespace) -> int:
 
 
 def command_render(args: argparse.Namespace) -> int:
-    helper = load_extract_helper()
-    context = helper.build_context(args.exam_id)
+    contexts = ContextCache(context_cache_dir(Path(args.work_dir), not args.no_cache))
+    context = contexts.get(args.exam_id)
     response_path = Path(args.response)
     response = json.loads(response_path.read_text(encoding="utf-8"))
     issues = validate_response(context, response)
@@ -294,15 +446,455 @@ def command_render(args: argparse.Namespace) -> int:
 
     output_path = Path(args.output) if args.output else EXPLANATION_DIR / f"{args.exam_id}.js"
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    write_explanation_module(output_path, args.exam_id, response)
+    before_bytes = output_path.stat().st_size if output_path.exists() else 0
+    after_bytes = write_explanation_module(output_path, args.exam_id, response, args.compact)
     print(json.dumps({
         "examId": args.exam_id,
         "ok": True,
         "output": str(output_path),
+        "beforeBytes": before_bytes,
+        "afterBytes": after_bytes,
     }, ensure_ascii=False, indent=2))
     return 0
 
 
+def select_json_files(directory: Path, patterns: Optional[List[str]]) -> List[Path]:
+    return sorted(
+        path for path in directory.glob("*.json")
+        if any(fnmatch.fnmatchcase(path.stem, pattern) for pattern in (patterns or ["*"]))
+    )
+
+
+_worker_contexts: Optional[ContextCache] = None
+
+
+def _init_render_worker(cache_dir: Optional[str]) -> None:
+    global _worker_contexts
+    _worker_contexts = ContextCache(Path(cache_dir) if cache_dir else None)
+
+
+def validate_response_file(contexts: ContextCache, exam_id: str, response_path: Path) -> Tuple[Any, List[str]]:
+    """Return ``(response, issues)``; never raises.
+
+    Unreadable files, failing context extraction and errors inside
+    ``validate_response`` all become issues, so ``watch`` keeps running while
+    a response is half-edited.
+    """
+    try:
+        response = json.loads(response_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        return None, [f"响应 JSON 无法读取: {exc}"]
+    try:
+        context = contexts.get(exam_id)
+    except Exception as exc:
+        return response, [f"无法提取试卷上下文: {exc}"]
+    if not isinstance(response, dict):
+        return response, ["响应不是 JSON 对象"]
+    try:
+        return response, validate_response(context, response)
+    except Exception as exc:
+        return response, [f"响应无法校验: {type(exc).__name__}: {exc}"]
+
+
+def render_one(
+    contexts: ContextCache,
+    exam_id: str,
+    response_path: Path,
+    output_dir: Path,
+    compact: bool = False,
+) -> Dict[str, Any]:
+    """Validate one response and write its bundle when clean; never raises."""
+    result: Dict[str, Any] = {"examId": exam_id, "response": str(response_path)}
+    try:
+        response, issues = validate_response_file(contexts, exam_id, response_path)
+        if issues:
+            result.update(ok=False, issues=issues)
+            return result
+        output_path = output_dir / f"{exam_id}.js"
+        before_bytes = output_path.stat().st_size if output_path.exists() else 0
+        after_bytes = write_explanation_module(output_path, exam_id, response, compact)
+    except Exception as exc:
+        # 单个响应的任何异常都只记为该响应的问题，不能中断整批 render-all（含进程池）
+        result.update(ok=False, issues=[f"渲染失败: {type(exc).__name__}: {exc}"])
+        return result
+    result.update(ok=True, output=str(output_path), beforeBytes=before_bytes, afterBytes=after_bytes)
+    return result
+
+
+def _render_task(task: Tuple[str, str, str, bool]) -> Dict[str, Any]:
+    exam_id, response_path, output_dir, compact = task
+    return render_one(_worker_contexts, exam_id, Path(response_path), Path(output_dir), compact)
+
+
+def render_all(
+    response_paths: List[Path],
+    output_dir: Path,
+    cache_dir: Optional[Path],
+    jobs: int = 1,
+    compact: bool = False,
+) -> List[Dict[str, Any]]:
+    """Render every response, on a process pool when ``jobs > 1``; order follows the input."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    tasks = [(path.stem, str(path), str(output_dir), compact) for path in response_paths]
+    if jobs <= 1 or len(tasks) <= 1:
+        contexts = ContextCache(cache_dir)
+        return [render_one(contexts, exam_id, Path(path), output_dir, compact) for exam_id, path, _, _ in tasks]
+    chunksize = max(1, len(tasks) // (jobs * 4))
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_render_worker,
+        initargs=(str(cache_dir) if cache_dir else None,),
+    ) as executor:
+        return list(executor.map(_render_task, tasks, chunksize=chunksize))
+
+
+def command_render_all(args: argparse.Namespace) -> int:
+    work_dir = Path(args.work_dir)
+    response_dir = work_dir / "responses"
+    response_paths = select_json_files(response_dir, args.glob)
+    if not response_paths:
+        print(f"[reading-explanation-agent] 没有可渲染的响应: {response_dir}")
+        return 1
+
+    output_dir = Path(args.output_dir) if args.output_dir else EXPLANATION_DIR
+    results = render_all(
+        response_paths,
+        output_dir,
+        context_cache_dir(work_dir, not args.no_cache),
+        jobs=max(1, args.jobs),
+        compact=args.compact,
+    )
+    failed = [result for result in results if not result["ok"]]
+    rendered = [result for result in results if result["ok"]]
+    report = {
+        "responseDir": str(response_dir),
+        "outputDir": str(output_dir),
+        "format": "compact" if args.compact else "indented",
+        "summary": {
+            "responses": len(results),
+            "rendered": len(rendered),
+            "failed": len(failed),
+            "issues": sum(len(result["issues"]) for result in failed),
+            "beforeBytes": sum(result["beforeBytes"] for result in rendered),
+            "afterBytes": sum(result["afterBytes"] for result in rendered),
+        },
+        "failures": failed,
+        "rendered": [
+            {"examId": result["examId"], "beforeBytes": result["beforeBytes"], "afterBytes": result["afterBytes"]}
+            for result in rendered
+        ],
+    }
+    report_path = Path(args.report) if args.report else work_dir / RENDER_REPORT_NAME
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    for result in failed:
+        print(f"[reading-explanation-agent] {result['examId']}: {len(result['issues'])} 个问题")
+        for issue in result["issues"][:10]:
+            print(f"  - {issue}")
+    print(json.dumps({**report["summary"], "report": str(report_path)}, ensure_ascii=False))
+    return 1 if failed else 0
+
+
+def diff_issues(old: List[str], new: List[str]) -> Tuple[List[str], List[str]]:
+    """Return ``(added, resolved)`` between two issue lists, counting duplicates."""
+    old_counts, new_counts = Counter(old), Counter(new)
+    added = list((new_counts - old_counts).elements())
+    resolved = list((old_counts - new_counts).elements())
+    return added, resolved
+
+
+class ResponseWatcher:
+    """Poll a responses directory and re-validate files whose stat changed.
+
+    Contexts stay warm in the shared ``ContextCache`` between polls, so a
+    re-check costs one JSON load plus ``validate_response``.
+    """
+
+    def __init__(self, response_dir: Path, contexts: ContextCache, patterns: Optional[List[str]] = None) -> None:
+        self.response_dir = response_dir
+        self.contexts = contexts
+        self.patterns = patterns or ["*"]
+        self.signatures: Dict[str, Tuple[int, int]] = {}
+        self.issues: Dict[str, List[str]] = {}
+
+    def scan(self) -> Dict[str, Tuple[Path, Tuple[int, int]]]:
+        found: Dict[str, Tuple[Path, Tuple[int, int]]] = {}
+        try:
+            entries = list(os.scandir(self.response_dir))
+        except FileNotFoundError:
+            return found
+        for entry in entries:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            exam_id = entry.name[: -len(".json")]
+            if not any(fnmatch.fnmatchcase(exam_id, pattern) for pattern in self.patterns):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            found[exam_id] = (Path(entry.path), (stat.st_mtime_ns, stat.st_size))
+        return found
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """Re-validate new or modified responses; return one event per changed exam."""
+        events: List[Dict[str, Any]] = []
+        found = self.scan()
+        for exam_id in sorted(set(self.signatures) - set(found)):
+            del self.signatures[exam_id]
+            events.append({"examId": exam_id, "event": "removed", "issues": [], "added": [], "resolved": self.issues.pop(exam_id, [])})
+
+        for exam_id in sorted(found):
+            path, signature = found[exam_id]
+            if self.signatures.get(exam_id) == signature:
+                continue
+            started = time.perf_counter()
+            _, issues = validate_response_file(self.contexts, exam_id, path)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            event = "changed" if exam_id in self.signatures else "added"
+            previous = self.issues.get(exam_id, [])
+            self.signatures[exam_id] = signature
+            self.issues[exam_id] = issues
+            added, resolved = diff_issues(previous, issues)
+            events.append({
+                "examId": exam_id,
+                "event": event,
+                "issues": issues,
+                "added": added,
+                "resolved": resolved,
+                "elapsedMs": round(elapsed_ms, 2),
+            })
+        return events
+
+
+def format_watch_event(event: Dict[str, Any]) -> List[str]:
+    exam_id = event["examId"]
+    if event["event"] == "removed":
+        return [f"[watch] {exam_id}: 已删除"]
+    status = "通过" if not event["issues"] else f"{len(event['issues'])} 个问题"
+    lines = [
+        f"[watch] {exam_id}: {status} (+{len(event['added'])} -{len(event['resolved'])}, {event['elapsedMs']:.1f} ms)"
+    ]
+    if event["event"] == "added":
+        lines.extend(f"  ! {issue}" for issue in event["issues"])
+    else:
+        lines.extend(f"  + {issue}" for issue in event["added"])
+        lines.extend(f"  - {issue}" for issue in event["resolved"])
+    return lines
+
+
+def command_watch(args: argparse.Namespace) -> int:
+    work_dir = Path(args.work_dir)
+    response_dir = work_dir / "responses"
+    contexts = ContextCache(context_cache_dir(work_dir, not args.no_cache))
+    watcher = ResponseWatcher(response_dir, contexts, args.glob)
+    print(f"[watch] 监视 {response_dir}（每 {args.interval}s 轮询，Ctrl+C 退出）", flush=True)
+    try:
+        while True:
+            for event in watcher.poll():
+                print("\n".join(format_watch_event(event)), flush=True)
+            if args.once:
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+    failing = sum(1 for issues in watcher.issues.values() if issues)
+    print(f"[watch] {len(watcher.issues)} 个响应，{failing} 个仍有问题", flush=True)
+    return 1 if failing else 0
+
+
+def post_json(endpoint: str, body: bytes, headers: Dict[str, str], timeout: float) -> Tuple[int, bytes]:
+    request = urllib.request.Request(endpoint, data=body, method="POST", headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.read()
+
+
+def _write_json_atomic(path: Path, payload: Any, indent: Optional[int] = None) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=indent), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+class Dispatcher:
+    """Send request packets to the translator endpoint and validate what comes back.
+
+    Blocking HTTP calls run on a thread pool sized to ``concurrency``; an
+    ``asyncio.Semaphore`` of the same size caps how many exams are in flight.
+    Each finished exam writes ``<state_dir>/<examId>.json``; exams whose
+    checkpoint is ``ok`` for the same request bytes are skipped on the next run.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        work_dir: Path,
+        *,
+        concurrency: int = 4,
+        retries: int = 3,
+        backoff: float = 1.0,
+        timeout: float = 120.0,
+        headers: Optional[Dict[str, str]] = None,
+        force: bool = False,
+    ) -> None:
+        self.endpoint = endpoint
+        self.response_dir = work_dir / "responses"
+        self.state_dir = work_dir / DISPATCH_STATE_DIRNAME
+        self.concurrency = max(1, concurrency)
+        self.retries = max(0, retries)
+        self.backoff = max(0.0, backoff)
+        self.timeout = timeout
+        self.headers = {"Content-Type": "application/json; charset=utf-8", **(headers or {})}
+        self.force = force
+
+    def load_checkpoint(self, exam_id: str) -> Dict[str, Any]:
+        try:
+            return json.loads((self.state_dir / f"{exam_id}.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    async def dispatch_one(self, request_path: Path, executor: ThreadPoolExecutor) -> Dict[str, Any]:
+        exam_id = request_path.stem
+        body = request_path.read_bytes()
+        request_hash = sha256_bytes(body)
+        previous = self.load_checkpoint(exam_id)
+        if not self.force and previous.get("status") == "ok" and previous.get("requestSha256") == request_hash:
+            return {**previous, "skipped": True}
+
+        result: Dict[str, Any] = {"examId": exam_id, "requestSha256": request_hash, "attempts": 0}
+        try:
+            packet = json.loads(body.decode("utf-8"))
+            context = packet["examContext"]
+        except (ValueError, KeyError, TypeError) as exc:
+            result.update(status="failed", error=f"请求包无法解析: {exc}")
+            _write_json_atomic(self.state_dir / f"{exam_id}.json", result, indent=2)
+            return result
+
+        loop = asyncio.get_running_loop()
+        response: Any = None
+        error = ""
+        for attempt in range(self.retries + 1):
+            result["attempts"] = attempt + 1
+            retryable = True
+            try:
+                status, payload = await loop.run_in_executor(
+                    executor, post_json, self.endpoint, body, self.headers, self.timeout
+                )
+            except (urllib.error.URLError, http.client.HTTPException, OSError) as exc:
+                # HTTPException 覆盖 IncompleteRead、RemoteDisconnected 等连接中途断开的情况
+                error = f"请求失败: {type(exc).__name__}: {exc}"
+            else:
+                if status == 200:
+                    try:
+                        response = json.loads(payload.decode("utf-8"))
+                        break
+                    except ValueError as exc:
+                        error = f"响应不是合法 JSON: {exc}"
+                else:
+                    error = f"HTTP {status}: {payload[:200].decode('utf-8', 'replace')}"
+                    retryable = status in RETRYABLE_HTTP_STATUS
+            if not retryable or attempt == self.retries:
+                break
+            # 指数退避 + 少量抖动，避免同时重试的请求再次撞在一起
+            await asyncio.sleep(self.backoff * (2 ** attempt) * (1 + random.random() * 0.25))
+
+        if response is None:
+            result.update(status="failed", error=error)
+        else:
+            response_path = self.response_dir / f"{exam_id}.json"
+            try:
+                _write_json_atomic(response_path, response, indent=2)
+                issues = validate_response(context, response)
+            except Exception as exc:
+                result.update(status="failed", error=f"响应无法保存或校验: {type(exc).__name__}: {exc}")
+            else:
+                result.update(status="invalid" if issues else "ok", response=str(response_path), issues=issues)
+        _write_json_atomic(self.state_dir / f"{exam_id}.json", result, indent=2)
+        return result
+
+    async def dispatch_all(self, request_paths: List[Path]) -> List[Dict[str, Any]]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(path: Path, executor: ThreadPoolExecutor) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    result = await self.dispatch_one(path, executor)
+                except Exception as exc:
+                    # 兜底：单个试卷的意外异常不能让 gather 丢掉其余在途试卷和最终报告
+                    result = {"examId": path.stem, "attempts": 0, "status": "failed", "error": f"{type(exc).__name__}: {exc}"}
+                    try:
+                        _write_json_atomic(self.state_dir / f"{path.stem}.json", result, indent=2)
+                    except OSError:
+                        pass
+            if not result.get("skipped"):
+                print(f"[reading-explanation-agent] {result['examId']}: {result['status']} (attempts={result['attempts']})", flush=True)
+            return result
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="reading-agent-dispatch") as executor:
+            return list(await asyncio.gather(*(bounded(path, executor) for path in request_paths)))
+
+
+def command_dispatch(args: argparse.Namespace) -> int:
+    endpoint = args.endpoint or os.environ.get(DISPATCH_ENDPOINT_ENV)
+    if not endpoint:
+        print(f"[reading-explanation-agent] 缺少 --endpoint（或环境变量 {DISPATCH_ENDPOINT_ENV}）")
+        return 2
+
+    work_dir = Path(args.work_dir)
+    request_dir = work_dir / "requests"
+    if args.exam_ids:
+        request_paths = [request_dir / f"{exam_id}.json" for exam_id in args.exam_ids]
+        missing = [path.stem for path in request_paths if not path.exists()]
+        if missing:
+            print(f"[reading-explanation-agent] 缺少请求包，请先运行 prepare: {', '.join(missing)}")
+            return 1
+    else:
+        request_paths = select_json_files(request_dir, args.glob)
+    if not request_paths:
+        print(f"[reading-explanation-agent] 没有可发送的请求包: {request_dir}")
+        return 1
+
+    headers = {}
+    token = os.environ.get(args.token_env) if args.token_env else None
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    dispatcher = Dispatcher(
+        endpoint,
+        work_dir,
+        concurrency=args.concurrency,
+        retries=args.retries,
+        backoff=args.backoff,
+        timeout=args.timeout,
+        headers=headers,
+        force=args.force,
+    )
+    results = asyncio.run(dispatcher.dispatch_all(request_paths))
+
+    counts = {status: 0 for status in ("ok", "invalid", "failed", "skipped")}
+    for result in results:
+        counts["skipped" if result.get("skipped") else result["status"]] += 1
+    report = {
+        "endpoint": endpoint,
+        "summary": {"requests": len(results), **counts},
+        "invalid": [
+            {"examId": result["examId"], "issues": result["issues"]}
+            for result in results if result["status"] == "invalid" and not result.get("skipped")
+        ],
+        "failed": [
+            {"examId": result["examId"], "attempts": result["attempts"], "error": result["error"]}
+            for result in results if result["status"] == "failed"
+        ],
+    }
+    report_path = Path(args.report) if args.report else work_dir / DISPATCH_REPORT_NAME
+    _write_json_atomic(report_path, report, indent=2)
+    print(json.dumps({**report["summary"], "report": str(report_path)}, ensure_ascii=False))
+    return 1 if counts["invalid"] or counts["failed"] else 0
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Agent-assisted reading explanation generator")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -311,14 +903,73 @@ def build_parser() -> argparse.ArgumentParser:
     prepare_parser.add_argument("exam_ids", nargs="+", help="exam ids such as p1-low-80")
     prepare_parser.add_argument("--work-dir", default=str(DEFAULT_WORK_DIR))
     prepare_parser.add_argument("--write-template", action="store_true", help="also write editable response templates")
+    prepare_parser.add_argument("--no-cache", action="store_true", help="always re-extract exam contexts")
     prepare_parser.set_defaults(func=command_prepare)
 
     render_parser = subparsers.add_parser("render", help="render final explanation JS from agent response")
     render_parser.add_argument("exam_id", help="exam id such as p1-low-80")
     render_parser.add_argument("--response", required=True, help="agent response JSON path")
     render_parser.add_argument("--output", help="output JS path, defaults to reading-explanations/<examId>.js")
+    render_parser.add_argument("--work-dir", default=str(DEFAULT_WORK_DIR), help="work dir holding the context cache")
+    render_parser.add_argument("--no-cache", action="store_true", help="always re-extract the exam context")
+    render_parser.add_argument("--compact", action="store_true", help="write the payload without indentation")
     render_parser.set_defaults(func=command_render)
 
+    render_all_parser = subparsers.add_parser(
+        "render-all", help="validate and render every response in <work-dir>/responses"
+    )
+    render_all_parser.add_argument("--work-dir", default=str(DEFAULT_WORK_DIR))
+    render_all_parser.add_argument(
+        "--glob",
+        action="append",
+        metavar="PATTERN",
+        help="only render exam ids matching a shell pattern such as 'p2-*' (repeatable)",
+    )
+    render_all_parser.add_argument("--output-dir", help="output directory, defaults to reading-explanations/")
+    render_all_parser.add_argument("--report", help=f"aggregated issue report path, defaults to <work-dir>/{RENDER_REPORT_NAME}")
+    render_all_parser.add_argument("--jobs", type=int, default=1, help="worker processes (default 1 = serial)")
+    render_all_parser.add_argument("--no-cache", action="store_true", help="always re-extract exam contexts")
+    render_all_parser.add_argument("--compact", action="store_true", help="write payloads without indentation")
+    render_all_parser.set_defaults(func=command_render_all)
+
+    dispatch_parser = subparsers.add_parser(
+        "dispatch", help="send request packets to a translator-agent endpoint and validate the responses"
+    )
+    dispatch_parser.add_argument("exam_ids", nargs="*", help="exam ids to send (default: every request packet)")
+    dispatch_parser.add_argument("--work-dir", default=str(DEFAULT_WORK_DIR))
+    dispatch_parser.add_argument("--endpoint", help=f"agent URL accepting POSTed request packets (env {DISPATCH_ENDPOINT_ENV})")
+    dispatch_parser.add_argument(
+        "--glob",
+        action="append",
+        metavar="PATTERN",
+        help="only send exam ids matching a shell pattern such as 'p2-*' (repeatable)",
+    )
+    dispatch_parser.add_argument("--concurrency", type=int, default=4, help="requests in flight at once (default 4)")
+    dispatch_parser.add_argument("--retries", type=int, default=3, help="retries after the first attempt (default 3)")
+    dispatch_parser.add_argument("--backoff", type=float, default=1.0, help="base backoff seconds, doubled per retry")
+    dispatch_parser.add_argument("--timeout", type=float, default=120.0, help="per-request timeout in seconds")
+    dispatch_parser.add_argument(
+        "--token-env",
+        default="READING_AGENT_TOKEN",
+        help="environment variable holding a bearer token (default READING_AGENT_TOKEN)",
+    )
+    dispatch_parser.add_argument("--force", action="store_true", help="resend exams already checkpointed as ok")
+    dispatch_parser.add_argument("--report", help=f"dispatch report path, defaults to <work-dir>/{DISPATCH_REPORT_NAME}")
+    dispatch_parser.set_defaults(func=command_dispatch)
+
+    watch_parser = subparsers.add_parser("watch", help="re-validate responses as they are saved")
+    watch_parser.add_argument("--work-dir", default=str(DEFAULT_WORK_DIR))
+    watch_parser.add_argument(
+        "--glob",
+        action="append",
+        metavar="PATTERN",
+        help="only watch exam ids matching a shell pattern such as 'p2-*' (repeatable)",
+    )
+    watch_parser.add_argument("--interval", type=float, default=0.5, help="poll interval in seconds (default 0.5)")
+    watch_parser.add_argument("--once", action="store_true", help="validate the current state once and exit")
+    watch_parser.add_argument("--no-cache", action="store_true", help="do not read or write the on-disk context cache")
+    watch_parser.set_defaults(func=command_watch)
+
     return parser
 
 
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""Collapse insignificant whitespace in the HTML fields of reading exam bundles.
+
+Usage:
+    python assets/scripts/minify_reading_exam_html.py [--glob PATTERN] [--check]
+
+Post-processing stage for ``assets/generated/reading-exams/*.js``; run it
+after ``developer/tests/tools/reading-json/generate_reading_assets.node.js``
+has regenerated the bundles.  The
+``html``, ``bodyHtml``, ``leadHtml`` and ``questionIntroHtml`` strings still
+carry the indentation of the legacy HTML pages.  Each of them is rewritten
+with whitespace runs collapsed to one space, whitespace next to block-level
+tags dropped and comments removed.  ``<pre>``, ``<textarea>``, ``<script>``
+and ``<style>`` contents are kept verbatim, and a space between inline
+elements (``</label> <label>``, text around ``<span>`` drop targets) stays.
+
+Only the string literals of those fields change; the rest of the bundle,
+including the ``register(dataKey, payload)`` wrapper, is kept byte-for-byte.
+Every rewritten bundle is parsed again and compared with the expected payload
+before it is written.  Running the stage twice changes nothing.
+
+``--check`` reports what would change without writing and exits 1 when any
+bundle is not minified, so CI can catch a regenerated but unprocessed tree.
+A per-exam report of bytes saved is written to ``--report``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Shared helpers under developer/tests/py are imported by module name.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "developer" / "tests" / "py"))
+
+import reading_bundle_loader as bundle_loader
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+READING_DATA_DIR = REPO_ROOT / "assets" / "generated" / "reading-exams"
+REPORT_PATH = REPO_ROOT / "developer" / "tests" / "reports" / "reading-exam-html-minify-report.json"
+
+HTML_FIELDS = ("html", "bodyHtml", "leadHtml", "questionIntroHtml")
+
+# Whitespace next to these tags never renders, so it can be dropped entirely.
+BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "body", "br", "caption", "col", "colgroup",
+    "dd", "details", "div", "dl", "dt", "fieldset", "figcaption", "figure", "footer", "form",
+    "h1", "h2", "h3", "h4", "h5", "h6", "head", "header", "hr", "html", "legend", "li", "main",
+    "nav", "ol", "optgroup", "option", "p", "pre", "section", "select", "summary", "table",
+    "tbody", "td", "tfoot", "th", "thead", "tr", "ul",
+})
+# Contents of these elements are copied verbatim.
+RAW_TEXT_TAGS = frozenset({"pre", "textarea", "script", "style"})
+
+_TOKEN_RE = re.compile(r"<!--.*?-->|<[^<>]+>|[^<]+|<", re.S)
+_TAG_NAME_RE = re.compile(r"<\s*(/?)\s*([A-Za-z][A-Za-z0-9-]*)")
+# HTML whitespace only: a non-breaking space is content and must survive.
+_HTML_SPACE_CHARS = " \t\n\r\f"
+_HTML_SPACE_RE = re.compile(r"[ \t\n\r\f]+")
+_STRING_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+_QUOTED_KEYS = frozenset(json.dumps(field) for field in HTML_FIELDS)
+_KEY_GAP_RE = re.compile(r"\s*:\s*")
+
+
+def _tag_info(token: str) -> Tuple[bool, str]:
+    match = _TAG_NAME_RE.match(token)
+    if not match:
+        return False, ""
+    return match.group(1) == "/", match.group(2).lower()
+
+
+def _is_block_boundary(token: Optional[str]) -> bool:
+    """True at the start/end of the fragment and next to block-level tags."""
+    if token is None:
+        return True
+    if not token.startswith("<") or token.startswith("<!--"):
+        return False
+    return _tag_info(token)[1] in BLOCK_TAGS
+
+
+def _boundary_space(space: str, previous: Optional[str], following: Optional[str]) -> str:
+    """Collapse a whitespace run that sits between ``previous`` and ``following``.
+
+    Between inline content the run becomes one space.  Next to a block-level
+    tag it does not render; a newline is still kept when the run had one, so
+    text-based readers (context extraction, ``textContent`` matching) do not
+    glue words of adjacent blocks together.  At the fragment edges it goes.
+    """
+    if not space:
+        return ""
+    if previous is None or following is None:
+        return ""
+    if _is_block_boundary(previous) or _is_block_boundary(following):
+        return "\n" if "\n" in space else ""
+    return " "
+
+
+def minify_html(html: str) -> str:
+    """Drop comments and whitespace that does not render; keep raw-text elements as-is."""
+    tokens: List[str] = []
+    for token in _TOKEN_RE.findall(html):
+        if token.startswith("<!--") and not token.startswith("<!--[if"):
+            continue
+        if tokens and not token.startswith("<") and not tokens[-1].startswith("<"):
+            # text on both sides of a dropped comment is one run
+            tokens[-1] += token
+        else:
+            tokens.append(token)
+    out: List[str] = []
+    raw_tag = ""
+    previous: Optional[str] = None
+    for index, token in enumerate(tokens):
+        if raw_tag:
+            out.append(token)
+            is_close, name = _tag_info(token) if token.startswith("<") else (False, "")
+            if is_close and name == raw_tag:
+                raw_tag = ""
+                previous = token
+            continue
+        if token.startswith("<"):
+            out.append(token)
+            previous = token
+            is_close, name = _tag_info(token)
+            if not is_close and name in RAW_TEXT_TAGS and not token.rstrip().endswith("/>"):
+                raw_tag = name
+            continue
+        following = tokens[index + 1] if index + 1 < len(tokens) else None
+        core = token.strip(_HTML_SPACE_CHARS)
+        if not core:
+            text = _boundary_space(token, previous, following)
+        else:
+            leading = token[: len(token) - len(token.lstrip(_HTML_SPACE_CHARS))]
+            trailing = token[len(token.rstrip(_HTML_SPACE_CHARS)):]
+            text = (
+                _boundary_space(leading, previous, core)
+                + _HTML_SPACE_RE.sub(" ", core)
+                + _boundary_space(trailing, core, following)
+            )
+        if text:
+            out.append(text)
+            previous = token
+    return "".join(out)
+
+
+def minify_payload(value):
+    """Return a copy of ``value`` with every HTML field minified."""
+    if isinstance(value, dict):
+        return {
+            key: minify_html(item) if key in HTML_FIELDS and isinstance(item, str) else minify_payload(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [minify_payload(item) for item in value]
+    return value
+
+
+def minify_bundle_text(text: str) -> Tuple[str, Dict[str, int]]:
+    """Rewrite the HTML string literals of one bundle; return ``(text, stats)``.
+
+    Hand-written bundles whose payload is a JS object literal (bare keys,
+    single quotes, string concatenation) are left untouched.
+    """
+    _, payload, start, end = bundle_loader.locate_register_payload(text)
+    stats = {"fields": 0, "changedFields": 0, "jsObjectLiteral": False}
+    try:
+        json.loads(text[start:end])
+    except json.JSONDecodeError:
+        stats["jsObjectLiteral"] = True
+        return text, stats
+    pieces: List[str] = [text[:start]]
+    cursor = start
+    previous: Optional[re.Match] = None
+    for match in _STRING_RE.finditer(text, start, end):
+        gap = text[cursor:match.start()]
+        if previous is not None and previous.group(0) in _QUOTED_KEYS and _KEY_GAP_RE.fullmatch(gap):
+            value = json.loads(match.group(0))
+            minified = minify_html(value)
+            stats["fields"] += 1
+            pieces.append(gap)
+            if minified != value:
+                stats["changedFields"] += 1
+                pieces.append(json.dumps(minified, ensure_ascii=False))
+            else:
+                pieces.append(match.group(0))
+        else:
+            pieces.append(text[cursor:match.end()])
+        cursor = match.end()
+        previous = match
+    pieces.append(text[cursor:])
+    rewritten = "".join(pieces)
+    if rewritten != text:
+        _, check, _, _ = bundle_loader.locate_register_payload(rewritten)
+        if check != minify_payload(payload):
+            raise bundle_loader.BundleParseError("minified_payload_mismatch")
+    return rewritten, stats
+
+
+def select_bundles(directory: Path, patterns: Iterable[str]) -> List[Path]:
+    patterns = list(patterns)
+    paths = sorted(path for path in directory.glob("*.js") if path.name != "manifest.js")
+    if patterns:
+        paths = [path for path in paths if any(fnmatch.fnmatchcase(path.stem, pattern) for pattern in patterns)]
+    return paths
+
+
+def minify_bundles(paths: Iterable[Path], write: bool = True) -> Dict:
+    """Minify each bundle in place (unless ``write`` is false) and build the size report."""
+    exams = []
+    errors = []
+    skipped = []
+    for path in paths:
+        text = path.read_text(encoding="utf-8")
+        try:
+            rewritten, stats = minify_bundle_text(text)
+        except bundle_loader.BundleParseError as exc:
+            errors.append({"file": path.name, "error": str(exc)})
+            continue
+        if stats["jsObjectLiteral"]:
+            skipped.append({"file": path.name, "reason": "js_object_literal"})
+            continue
+        before = len(text.encode("utf-8"))
+        after = len(rewritten.encode("utf-8"))
+        if write and rewritten != text:
+            path.write_text(rewritten, encoding="utf-8")
+        exams.append({
+            "examId": path.stem,
+            "fields": stats["fields"],
+            "changedFields": stats["changedFields"],
+            "changed": rewritten != text,
+            "beforeBytes": before,
+            "afterBytes": after,
+            "savedBytes": before - after,
+        })
+    before_total = sum(item["beforeBytes"] for item in exams)
+    after_total = sum(item["afterBytes"] for item in exams)
+    return {
+        "summary": {
+            "bundles": len(exams),
+            "changedBundles": sum(1 for item in exams if item["changed"]),
+            "beforeBytes": before_total,
+            "afterBytes": after_total,
+            "savedBytes": before_total - after_total,
+            "skipped": len(skipped),
+            "errors": len(errors),
+        },
+        "exams": exams,
+        "skipped": skipped,
+        "errors": errors,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Minify the HTML fields of generated reading exam bundles")
+    parser.add_argument("--exam-dir", type=Path, default=READING_DATA_DIR, help="directory of exam bundles")
+    parser.add_argument(
+        "--glob",
+        action="append",
+        default=[],
+        help="only process exam ids matching this pattern (repeatable)",
+    )
+    parser.add_argument("--check", action="store_true", help="report without writing; exit 1 if any bundle would change")
+    parser.add_argument("--report", type=Path, default=REPORT_PATH, help="per-exam bytes saved report")
+    args = parser.parse_args()
+
+    paths = select_bundles(args.exam_dir, args.glob)
+    report = minify_bundles(paths, write=not args.check)
+    args.report.parent.mkdir(parents=True, exist_ok=True)
+    args.report.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    summary = report["summary"]
+    for item in report["skipped"]:
+        print(f"Left as-is {item['file']}: {item['reason']}")
+    for error in report["errors"]:
+        print(f"Skipped {error['file']}: {error['error']}", file=sys.stderr)
+    change = f"{-summary['savedBytes'] / summary['beforeBytes']:+.1%}" if summary["beforeBytes"] else "n/a"
+    verb = "would change" if args.check else "changed"
+    print(
+        f"HTML minify: {summary['changedBundles']}/{summary['bundles']} bundles {verb}, "
+        f"{summary['beforeBytes']} -> {summary['afterBytes']} bytes ({change}, report: {args.report})"
+    )
+    if summary["errors"]:
+        return 1
+    if args.check and summary["changedBundles"]:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Split reading exam bundles into independently loadable chunks.
+
+Usage:
+    python assets/scripts/split_reading_exam_chunks.py [--check]
+
+Post-processing stage for ``assets/generated/reading-exams``; run it after the
+Node generator and ``minify_reading_exam_html.py``.  Every ``<examId>.js``
+bundle stays as it is (the practice page still loads the whole exam) and is
+additionally written as four chunks under ``chunks/``:
+
+- ``<dataKey>.meta.js``: schemaVersion, examId, meta, sourceRefs, audit
+- ``<dataKey>.passage.js``: passage
+- ``<dataKey>.questions.js``: questionGroups, questionOrder, questionDisplayMap
+- ``<dataKey>.answers.js``: answerKey
+
+Top-level fields not listed above go to the meta chunk, so merging the four
+parts always gives back the original payload.  Each chunk calls
+``__READING_EXAM_DATA__.registerPart(dataKey, part, payload)``.
+
+``chunks/index.js`` publishes the chunk index (``global.__READING_EXAM_CHUNKS__``)
+with the chunk directory, the fields of each part and the byte size of every
+chunk.  It is a separate script rather than part of ``manifest.js``, which is
+embedded in the startup bundle: ``readingExamRegistry.js`` loads the index the
+first time a single part is requested.  Chunks of exams that are no longer in
+the manifest are removed.  ``--check`` writes nothing and exits 1 when the
+chunks or the index are out of date.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Shared helpers under developer/tests/py are imported by module name.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "developer" / "tests" / "py"))
+
+import reading_bundle_loader as bundle_loader
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+READING_DATA_DIR = REPO_ROOT / "assets" / "generated" / "reading-exams"
+CHUNK_DIRNAME = "chunks"
+CHUNK_INDEX_NAME = "index.js"
+REPORT_PATH = REPO_ROOT / "developer" / "tests" / "reports" / "reading-exam-chunks-report.json"
+READING_MANIFEST_MARKERS = ("global.__READING_EXAM_MANIFEST__ =", "const manifest =")
+CHUNK_INDEX_GLOBAL = "__READING_EXAM_CHUNKS__"
+
+PART_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "meta": ("schemaVersion", "examId", "meta", "sourceRefs", "audit"),
+    "passage": ("passage",),
+    "questions": ("questionGroups", "questionOrder", "questionDisplayMap"),
+    "answers": ("answerKey",),
+}
+FALLBACK_PART = "meta"
+
+
+def split_payload(payload: Dict) -> Dict[str, Dict]:
+    """Distribute the top-level fields of one exam payload over the chunk parts."""
+    part_by_field = {field: part for part, fields in PART_FIELDS.items() for field in fields}
+    parts: Dict[str, Dict] = {part: {} for part in PART_FIELDS}
+    for key, value in payload.items():
+        parts[part_by_field.get(key, FALLBACK_PART)][key] = value
+    return parts
+
+
+def chunk_file_name(data_key: str, part: str) -> str:
+    return f"{data_key}.{part}.js"
+
+
+def render_chunk(data_key: str, part: str, body: Dict) -> str:
+    payload = json.dumps(body, ensure_ascii=False, separators=(",", ":"))
+    return "\n".join([
+        "(function registerReadingExamPart(global) {",
+        "  'use strict';",
+        '  if (!global.__READING_EXAM_DATA__ || typeof global.__READING_EXAM_DATA__.registerPart !== "function") {',
+        '    throw new Error("reading_exam_registry_missing");',
+        "  }",
+        f"  global.__READING_EXAM_DATA__.registerPart({json.dumps(data_key)}, {json.dumps(part)}, {payload});",
+        '})(typeof window !== "undefined" ? window : globalThis);',
+        "",
+    ])
+
+
+def render_chunk_index(sizes: Dict[str, List[int]]) -> str:
+    """Index script; one exam per line so regenerated indexes diff cleanly."""
+    parts = ",\n".join(
+        f"      {json.dumps(part)}: {json.dumps(list(fields))}" for part, fields in PART_FIELDS.items()
+    )
+    exams = ",\n".join(
+        f"      {json.dumps(data_key, ensure_ascii=False)}: {json.dumps(values)}" for data_key, values in sizes.items()
+    )
+    return "\n".join([
+        "(function registerReadingExamChunkIndex(global) {",
+        "  'use strict';",
+        f"  global.{CHUNK_INDEX_GLOBAL} = {{",
+        f'    "base": "./{CHUNK_DIRNAME}/",',
+        '    "parts": {',
+        parts,
+        "    },",
+        '    "bytes": {',
+        exams,
+        "    }",
+        "  };",
+        '})(typeof window !== "undefined" ? window : globalThis);',
+        "",
+    ])
+
+
+def build_chunks(exam_dir: Path) -> Tuple[Dict[str, str], Dict[str, List[int]], List[Dict]]:
+    """Return ``(chunk texts by file name, chunk sizes by dataKey, per-exam report rows)``."""
+    manifest = bundle_loader.load_assignment(exam_dir / "manifest.js", READING_MANIFEST_MARKERS)
+    files: Dict[str, str] = {}
+    sizes: Dict[str, List[int]] = {}
+    rows: List[Dict] = []
+    for exam_id, entry in manifest.items():
+        script = (entry or {}).get("script")
+        data_key = (entry or {}).get("dataKey") or exam_id
+        if not script or data_key in sizes:
+            continue
+        bundle_path = exam_dir / script
+        payload = bundle_loader.load_register_payload(bundle_path, register_key=data_key)
+        parts = split_payload(payload)
+        merged: Dict = {}
+        for body in parts.values():
+            merged.update(body)
+        if merged != payload:
+            raise bundle_loader.BundleParseError(f"chunk_split_lossy:{bundle_path.name}")
+        part_sizes = []
+        for part, body in parts.items():
+            text = render_chunk(data_key, part, body)
+            files[chunk_file_name(data_key, part)] = text
+            part_sizes.append(len(text.encode("utf-8")))
+        sizes[data_key] = part_sizes
+        rows.append({
+            "examId": exam_id,
+            "dataKey": data_key,
+            "bundleBytes": bundle_path.stat().st_size,
+            "chunkBytes": dict(zip(PART_FIELDS, part_sizes)),
+        })
+    return files, sizes, rows
+
+
+def sync_chunks(exam_dir: Path, write: bool = True) -> Dict:
+    """Bring ``chunks/`` and ``chunks/index.js`` up to date; return the report."""
+    chunk_dir = exam_dir / CHUNK_DIRNAME
+    files, sizes, rows = build_chunks(exam_dir)
+
+    changed: List[str] = []
+    for name, text in files.items():
+        path = chunk_dir / name
+        if not path.exists() or path.read_text(encoding="utf-8") != text:
+            changed.append(name)
+    part_suffixes = tuple(f".{part}.js" for part in PART_FIELDS)
+    stale = sorted(
+        path.name for path in chunk_dir.glob("*.js")
+        if path.name.endswith(part_suffixes) and path.name not in files
+    ) if chunk_dir.exists() else []
+
+    index_path = chunk_dir / CHUNK_INDEX_NAME
+    index_text = render_chunk_index(sizes)
+    index_changed = not index_path.exists() or index_path.read_text(encoding="utf-8") != index_text
+
+    if write:
+        chunk_dir.mkdir(parents=True, exist_ok=True)
+        for name in changed:
+            (chunk_dir / name).write_text(files[name], encoding="utf-8")
+        for name in stale:
+            (chunk_dir / name).unlink()
+        if index_changed:
+            index_path.write_text(index_text, encoding="utf-8")
+
+    bundle_total = sum(row["bundleBytes"] for row in rows)
+    part_totals = {part: sum(row["chunkBytes"][part] for row in rows) for part in PART_FIELDS}
+    return {
+        "summary": {
+            "exams": len(rows),
+            "chunks": len(files),
+            "changedChunks": len(changed),
+            "staleChunks": len(stale),
+            "indexChanged": index_changed,
+            "indexBytes": len(index_text.encode("utf-8")),
+            "bundleBytes": bundle_total,
+            "chunkBytes": part_totals,
+        },
+        "changed": changed,
+        "stale": stale,
+        "exams": rows,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Split generated reading exam bundles into loadable chunks")
+    parser.add_argument("--exam-dir", type=Path, default=READING_DATA_DIR, help="directory of exam bundles and manifest.js")
+    parser.add_argument("--check", action="store_true", help="report without writing; exit 1 if anything is out of date")
+    parser.add_argument("--report", type=Path, default=REPORT_PATH, help="per-exam chunk size report")
+    args = parser.parse_args()
+
+    try:
+        report = sync_chunks(args.exam_dir, write=not args.check)
+    except bundle_loader.BundleParseError as exc:
+        print(f"Chunk split failed: {exc}", file=sys.stderr)
+        return 1
+    args.report.parent.mkdir(parents=True, exist_ok=True)
+    args.report.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    summary = report["summary"]
+    parts = ", ".join(f"{part} {size}" for part, size in summary["chunkBytes"].items())
+    verb = "out of date" if args.check else "written"
+    print(
+        f"Exam chunks: {summary['exams']} exams, {summary['changedChunks']}/{summary['chunks']} chunks {verb}, "
+        f"{summary['staleChunks']} stale, index {'changed' if summary['indexChanged'] else 'unchanged'}"
+    )
+    print(f"Chunk bytes: {parts} (bundles {summary['bundleBytes']}; report: {args.report})")
+    if args.check and (summary["changedChunks"] or summary["staleChunks"] or summary["indexChanged"]):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
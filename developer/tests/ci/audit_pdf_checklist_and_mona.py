@@ -6,8 +6,14 @@ from __future__ import annotations
 import json
 import re
 import subprocess
+import sys
 from pathlib import Path
 
+# developer/tests/py 下的共享 helper 按模块名导入
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "py"))
+
+import reading_bundle_loader as bundle_loader
+
 
 ROOT = Path(__file__).resolve().parents[3]
 CHECKLIST = ROOT / "checklist.md"
@@ -49,12 +55,10 @@ BANNED_PATTERNS = [
 
 
 def load_json_from_register_js(path: Path, register_key: str) -> dict:
-    text = path.read_text(encoding="utf-8")
-    pattern = rf'register\("{re.escape(register_key)}",\s*(\{{.*\}})\s*\);'
-    match = re.search(pattern, text, flags=re.S)
-    if not match:
-        raise ValueError(f"unable_to_parse_register_payload:{path.name}")
-    return json.loads(match.group(1))
+    try:
+        return bundle_loader.load_register_payload(path, register_key)
+    except bundle_loader.BundleParseError as exc:
+        raise ValueError(f"unable_to_parse_register_payload:{path.name}") from exc
 
 
 def parse_checklist_rows(text: str):
@@ -309,13 +313,17 @@ def main() -> int:
     }
 
     # Plastic pdf-sync guard (repo-internal consistency)
-    plastic_exam = load_json_from_register_js(PLASTIC_EXAM, "p1-medium-20")
+    plastic_refs = bundle_loader.extract_register_fields(
+        PLASTIC_EXAM,
+        {"pdfFilename": ("meta", "pdfFilename"), "shuiPdf": ("sourceRefs", "shuiPdf")},
+        "p1-medium-20",
+    )
     plastic_checks = {
         "pdf_filename_updated": "116. P1 - The Development of Plastics 塑料的发展史【次】.pdf" in str(
-            plastic_exam.get("meta", {}).get("pdfFilename", "")
+            plastic_refs.get("pdfFilename", "")
         ),
         "source_ref_present": "116. P1 - The Development of Plastics 塑料的发展史【次】.pdf" in str(
-            plastic_exam.get("sourceRefs", {}).get("shuiPdf", "")
+            plastic_refs.get("shuiPdf", "")
         ),
     }
 
@@ -4,68 +4,273 @@
 Checks:
 1) Duplicate entries by (type=reading, category, normalized title)
 2) PDF source path consistency for entries that define pdfFilename
+3) Near-duplicate passages/questions: MinHash signatures over word shingles,
+   LSH banding for candidate pairs, clusters of pairs whose estimated Jaccard
+   similarity reaches NEAR_DUPLICATE_THRESHOLD
 """
 
 from __future__ import annotations
 
+import hashlib
+import html
+import itertools
 import json
 import re
+import struct
+import sys
 from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# developer/tests/py 下的共享 helper 按模块名导入
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "py"))
+
+import reading_corpus_db as corpus_db
 
 
 ROOT = Path(__file__).resolve().parents[3]
-READING_DIR = ROOT / "assets" / "generated" / "reading-exams"
 REPORT_PATH = ROOT / "developer" / "tests" / "e2e" / "reports" / "reading-data-integrity-report.json"
 ALLOWLIST_PATH = ROOT / "developer" / "tests" / "ci" / "reading-duplicate-allowlist.json"
 
+SHINGLE_SIZE = 5
+MINHASH_PERMUTATIONS = 128
+LSH_BANDS = 32
+LSH_ROWS = MINHASH_PERMUTATIONS // LSH_BANDS
+NEAR_DUPLICATE_THRESHOLD = 0.5
+# 参数变化时 scheme 随之变化，旧签名自然失效
+MINHASH_SCHEME = f"oph-blake2b-w{SHINGLE_SIZE}-p{MINHASH_PERMUTATIONS}"
+_SIGNATURE_STRUCT = struct.Struct(f"<{MINHASH_PERMUTATIONS}Q")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
 
 def norm_text(value: str) -> str:
     return re.sub(r"\s+", " ", re.sub(r"[^\w\u4e00-\u9fa5]+", " ", value.lower())).strip()
 
 
-def extract_field(pattern: str, text: str) -> str:
-    match = re.search(pattern, text, flags=re.MULTILINE)
-    return match.group(1).strip() if match else ""
+def word_shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    words = norm_text(html.unescape(_HTML_TAG_RE.sub(" ", text))).split()
+    if not words:
+        return set()
+    if len(words) <= size:
+        return {" ".join(words)}
+    return {" ".join(words[index:index + size]) for index in range(len(words) - size + 1)}
 
 
-def main() -> int:
-    allowlist_keys = set()
-    if ALLOWLIST_PATH.exists():
+def minhash_signature(shingles: Iterable[str]) -> Optional[Tuple[int, ...]]:
+    """One-permutation MinHash: hash each shingle once and keep the minimum per bin.
+
+    Empty bins borrow the value of the next non-empty bin (rotation
+    densification), so every signature has MINHASH_PERMUTATIONS comparable slots.
+    """
+    bins: List[Optional[int]] = [None] * MINHASH_PERMUTATIONS
+    for shingle in shingles:
+        value = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+        slot, rest = value % MINHASH_PERMUTATIONS, value // MINHASH_PERMUTATIONS
+        current = bins[slot]
+        if current is None or rest < current:
+            bins[slot] = rest
+    filled = [index for index, value in enumerate(bins) if value is not None]
+    if not filled:
+        return None
+    signature: List[int] = []
+    for index, value in enumerate(bins):
+        offset = 0
+        while value is None:
+            offset += 1
+            value = bins[(index + offset) % MINHASH_PERMUTATIONS]
+            if value is not None:
+                value += offset << 57
+        signature.append(value)
+    return tuple(signature)
+
+
+def estimate_jaccard(left: Sequence[int], right: Sequence[int]) -> float:
+    return sum(1 for a, b in zip(left, right) if a == b) / MINHASH_PERMUTATIONS
+
+
+def lsh_candidate_pairs(signatures: Dict[str, Sequence[int]]) -> Set[Tuple[str, str]]:
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[str]] = {}
+    for exam_id, signature in signatures.items():
+        for band in range(LSH_BANDS):
+            start = band * LSH_ROWS
+            buckets.setdefault((band, tuple(signature[start:start + LSH_ROWS])), []).append(exam_id)
+    pairs: Set[Tuple[str, str]] = set()
+    for members in buckets.values():
+        if len(members) > 1:
+            pairs.update(itertools.combinations(sorted(members), 2))
+    return pairs
+
+
+def cluster_pairs(pairs: Iterable[Tuple[str, str]]) -> List[List[str]]:
+    parent: Dict[str, str] = {}
+
+    def find(item: str) -> str:
+        parent.setdefault(item, item)
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    for left, right in pairs:
+        root_left, root_right = find(left), find(right)
+        if root_left != root_right:
+            parent[max(root_left, root_right)] = min(root_left, root_right)
+    groups: Dict[str, List[str]] = {}
+    for item in parent:
+        groups.setdefault(find(item), []).append(item)
+    return sorted(sorted(members) for members in groups.values())
+
+
+def load_exam_signatures(conn) -> Tuple[Dict[str, Tuple[int, ...]], Dict[str, int]]:
+    """Return ``{examId: signature}``, reusing signatures cached for unchanged exam hashes."""
+    stats = {"cached": 0, "computed": 0, "empty": 0}
+    cached = {
+        row[0]: (row[1], row[2])
+        for row in conn.execute(
+            "SELECT path, sha256, signature FROM exam_signatures WHERE scheme = ?", (MINHASH_SCHEME,)
+        )
+    }
+    exams = conn.execute(
+        """
+        SELECT source_files.path, source_files.sha256, exams.exam_id
+        FROM source_files JOIN exams ON exams.path = source_files.path
+        ORDER BY source_files.path
+        """
+    ).fetchall()
+
+    signatures: Dict[str, Tuple[int, ...]] = {}
+    fresh_rows = []
+    for path, digest, exam_id in exams:
+        hit = cached.get(path)
+        if hit and hit[0] == digest:
+            signatures[exam_id] = _SIGNATURE_STRUCT.unpack(hit[1])
+            stats["cached"] += 1
+            continue
+        texts = [row[0] for row in conn.execute(
+            "SELECT html FROM passages WHERE path = ? ORDER BY position", (path,)
+        )]
+        texts += [row[0] for row in conn.execute(
+            "SELECT body_html FROM question_groups WHERE path = ? ORDER BY position", (path,)
+        )]
+        signature = minhash_signature(word_shingles(" ".join(texts)))
+        if signature is None:
+            stats["empty"] += 1
+            continue
+        signatures[exam_id] = signature
+        fresh_rows.append((path, MINHASH_SCHEME, digest, _SIGNATURE_STRUCT.pack(*signature)))
+        stats["computed"] += 1
+
+    if fresh_rows:
+        conn.execute("BEGIN IMMEDIATE")
         try:
-            allowlist_payload = json.loads(ALLOWLIST_PATH.read_text(encoding="utf-8"))
-            allowlist_keys = {
-                str(key).strip().lower()
-                for key in (allowlist_payload.get("allowedDuplicateKeys") or [])
-                if str(key).strip()
-            }
-        except Exception:
-            allowlist_keys = set()
-
-    files = sorted(READING_DIR.glob("p*-*.js"))
+            conn.executemany("INSERT OR REPLACE INTO exam_signatures VALUES (?, ?, ?, ?)", fresh_rows)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+    return signatures, stats
+
+
+def find_near_duplicates(signatures: Dict[str, Sequence[int]]) -> List[Dict]:
+    scored_pairs = []
+    for left, right in sorted(lsh_candidate_pairs(signatures)):
+        similarity = estimate_jaccard(signatures[left], signatures[right])
+        if similarity >= NEAR_DUPLICATE_THRESHOLD:
+            scored_pairs.append((left, right, similarity))
+    clusters = []
+    for members in cluster_pairs((left, right) for left, right, _ in scored_pairs):
+        member_set = set(members)
+        clusters.append({
+            "examIds": members,
+            "pairs": [
+                {"examIds": [left, right], "jaccardEstimate": round(similarity, 3)}
+                for left, right, similarity in scored_pairs
+                if left in member_set
+            ],
+        })
+    return clusters
+
+
+def load_allowlist(path: Path) -> Tuple[Set[str], List[Set[str]]]:
+    """Return the allowed duplicate keys and near-duplicate exam groups; unreadable files allow nothing."""
+    if not path.exists():
+        return set(), []
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        keys = {
+            str(key).strip().lower()
+            for key in (payload.get("allowedDuplicateKeys") or [])
+            if str(key).strip()
+        }
+        groups = [
+            {str(exam_id).strip() for exam_id in group}
+            for group in (payload.get("allowedNearDuplicateGroups") or [])
+            if isinstance(group, list)
+        ]
+    except Exception:
+        return set(), []
+    return keys, groups
+
+
+def split_near_duplicates(
+    clusters: Iterable[Dict],
+    key_by_exam_id: Dict[str, str],
+    allowlist_keys: Set[str],
+    allowlist_groups: Sequence[Set[str]],
+) -> Tuple[List[Dict], List[Dict]]:
+    """Split clusters into (allowlisted, blocking).
+
+    A cluster is allowed when all members share one allowlisted duplicate key
+    or when it fits entirely inside one allowedNearDuplicateGroups entry.
+    """
+    allowlisted: List[Dict] = []
+    blocking: List[Dict] = []
+    for cluster in clusters:
+        members = set(cluster["examIds"])
+        member_keys = {key_by_exam_id.get(exam_id, "").strip().lower() for exam_id in members}
+        allowed = (
+            (len(member_keys) == 1 and member_keys <= allowlist_keys)
+            or any(members <= group for group in allowlist_groups)
+        )
+        (allowlisted if allowed else blocking).append(cluster)
+    return allowlisted, blocking
+
+
+def main() -> int:
+    allowlist_keys, allowlist_groups = load_allowlist(ALLOWLIST_PATH)
+
+    conn = corpus_db.connect(ROOT)
+    rows = conn.execute(
+        """
+        SELECT source_files.path, exams.exam_id, exams.title, exams.category, exams.pdf_filename, exams.shui_pdf
+        FROM source_files
+        LEFT JOIN exams ON exams.path = source_files.path
+        WHERE source_files.kind = 'exam'
+        ORDER BY source_files.path
+        """
+    ).fetchall()
+    signatures, signature_stats = load_exam_signatures(conn)
+    conn.close()
+
     duplicates = {}
     missing_pdf_ref = []
     malformed_pdf_ref = []
 
     seen = {}
-    for path in files:
-        content = path.read_text(encoding="utf-8")
-        exam_id = extract_field(r'"examId":\s*"([^"]+)"', content)
-        title = extract_field(r'"title":\s*"([^"]+)"', content)
-        category = extract_field(r'"category":\s*"([^"]+)"', content)
-        pdf_filename = extract_field(r'"pdfFilename":\s*"([^"]*)"', content)
-        shui_pdf = extract_field(r'"shuiPdf":\s*"([^"]*)"', content)
-
-        key = f"{norm_text(category)}::{norm_text(title)}"
+    key_by_exam_id = {}
+    for path, exam_id, title, category, pdf_filename, shui_pdf in rows:
+        fallback_id = Path(path).stem
+        key = f"{norm_text(category or '')}::{norm_text(title or '')}"
+        key_by_exam_id[exam_id or fallback_id] = key
         if key in seen:
-            duplicates.setdefault(key, []).append(exam_id or path.stem)
+            duplicates.setdefault(key, []).append(exam_id or fallback_id)
         else:
-            seen[key] = exam_id or path.stem
+            seen[key] = exam_id or fallback_id
 
         if pdf_filename:
             if not shui_pdf:
-                missing_pdf_ref.append(exam_id or path.stem)
+                missing_pdf_ref.append(exam_id or fallback_id)
             elif not shui_pdf.endswith(".pdf"):
-                malformed_pdf_ref.append({"examId": exam_id or path.stem, "shuiPdf": shui_pdf})
+                malformed_pdf_ref.append({"examId": exam_id or fallback_id, "shuiPdf": shui_pdf})
 
     duplicate_entries = []
     duplicate_allowlisted = []
@@ -82,21 +287,32 @@ def main() -> int:
         else:
             duplicate_blocking.append(entry)
 
+    near_duplicate_allowlisted, near_duplicate_blocking = split_near_duplicates(
+        find_near_duplicates(signatures), key_by_exam_id, allowlist_keys, allowlist_groups
+    )
+
     report = {
-        "scannedFiles": len(files),
+        "scannedFiles": len(rows),
         "duplicateEntries": duplicate_entries,
         "allowlistedDuplicates": duplicate_allowlisted,
         "blockingDuplicates": duplicate_blocking,
         "missingPdfRef": missing_pdf_ref,
         "malformedPdfRef": malformed_pdf_ref,
+        "nearDuplicates": {
+            "scheme": MINHASH_SCHEME,
+            "threshold": NEAR_DUPLICATE_THRESHOLD,
+            "signatures": signature_stats,
+            "allowlistedClusters": near_duplicate_allowlisted,
+            "blockingClusters": near_duplicate_blocking,
+        },
     }
     REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
     REPORT_PATH.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
 
-    fatal_issue = bool(missing_pdf_ref or malformed_pdf_ref or duplicate_blocking)
+    fatal_issue = bool(missing_pdf_ref or malformed_pdf_ref or duplicate_blocking or near_duplicate_blocking)
     if fatal_issue:
         print("[reading-data-integrity] fatal issues found")
-    elif duplicate_entries:
+    elif duplicate_entries or near_duplicate_allowlisted:
         print("[reading-data-integrity] pass_with_duplicate_warnings")
     else:
         print("[reading-data-integrity] pass")
@@ -18,6 +18,12 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+# developer/tests/py 下的共享 helper 按模块名导入
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "py"))
+
+import reading_bundle_loader as bundle_loader
+import reading_corpus_db as corpus_db
+
 
 ROOT = Path(os.environ.get("READING_EXPLANATION_REPO_ROOT") or Path(__file__).resolve().parents[3])
 EXPLANATION_DIR = ROOT / "assets" / "generated" / "reading-explanations"
@@ -42,11 +48,11 @@ JUDGEMENT_EQUIVALENTS = {
 
 
 def extract_registered_payload(path: Path) -> Dict[str, Any] | None:
-    text = path.read_text(encoding="utf-8")
-    match = re.search(r'register\("[^"]+",\s*(\{[\s\S]*\})\s*\)\s*;?\s*\}', text)
-    if not match:
+    try:
+        payload = bundle_loader.load_register_payload(path)
+    except bundle_loader.BundleParseError:
         return None
-    return json.loads(match.group(1))
+    return payload if isinstance(payload, dict) else None
 
 
 def normalize_whitespace(value: str) -> str:
@@ -149,6 +155,23 @@ def collect_explanation_files(scope: str) -> List[Path]:
     )
 
 
+def load_exam_answer_key(conn, exam_path: Path) -> Tuple[str, Dict[str, Any]]:
+    """Return ``(status, answerKey)`` for an exam bundle; status is ok, missing or unparsable."""
+    rel_path = exam_path.relative_to(ROOT).as_posix()
+    row = conn.execute("SELECT parse_error FROM source_files WHERE path = ?", (rel_path,)).fetchone()
+    if row is None:
+        return "missing", {}
+    if row[0] is not None:
+        return "unparsable", {}
+    answer_key = {
+        question_id: json.loads(answer)
+        for question_id, answer in conn.execute(
+            "SELECT question_id, answer FROM answer_keys WHERE path = ?", (rel_path,)
+        )
+    }
+    return "ok", answer_key
+
+
 def main(argv: List[str]) -> int:
     scope = "all"
     if "--scope" in argv:
@@ -160,6 +183,7 @@ def main(argv: List[str]) -> int:
         scope = "all"
 
     explanation_files = collect_explanation_files(scope)
+    conn = corpus_db.connect(ROOT)
 
     report: Dict[str, Any] = {
         "scannedFiles": len(explanation_files),
@@ -178,7 +202,7 @@ def main(argv: List[str]) -> int:
 
     for explanation_path in explanation_files:
         file_issues: List[str] = []
-        explanation_payload = extract_registered_payload(explanation_path)
+        explanation_payload = corpus_db.load_payload(conn, explanation_path.relative_to(ROOT).as_posix())
         if explanation_payload is None:
             report["summary"]["parseFailures"] += 1
             blocking_files.append({
@@ -190,8 +214,16 @@ def main(argv: List[str]) -> int:
 
         exam_id = str(explanation_payload.get("examId") or explanation_path.stem)
         exam_path = EXAM_DIR / f"{exam_id}.js"
-        exam_payload = extract_registered_payload(exam_path) if exam_path.exists() else None
-        if exam_payload is None:
+        exam_status, answer_key = load_exam_answer_key(conn, exam_path)
+        if exam_status == "unparsable":
+            report["summary"]["parseFailures"] += 1
+            blocking_files.append({
+                "examId": exam_id,
+                "file": str(exam_path.relative_to(ROOT)),
+                "issues": ["无法解析 reading-exam register payload"],
+            })
+            continue
+        if exam_status == "missing":
             report["summary"]["missingExamFiles"] += 1
             blocking_files.append({
                 "examId": exam_id,
@@ -205,7 +237,6 @@ def main(argv: List[str]) -> int:
             report["summary"]["nonPdfSourceDocs"] += 1
             file_issues.append(f"sourceDoc 不是 PDF: {source_doc}")
 
-        answer_key = exam_payload.get("answerKey") if isinstance(exam_payload.get("answerKey"), dict) else {}
         for section in explanation_payload.get("questionExplanations") or []:
             section_text = section.get("text", "") or ""
             for placeholder in PLACEHOLDER_PATTERNS:
@@ -253,6 +284,7 @@ def main(argv: List[str]) -> int:
                 "issueCount": len(file_issues),
             })
 
+    conn.close()
     report["scope"] = scope
     report["blockingFiles"] = blocking_files
     REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,107 @@
+#!/usr/bin/env node
+/**
+ * 常驻 Node 测试宿主（供 run_static_suite.py 使用）
+ *
+ * 启动方式：node node_test_host.node.js
+ *
+ * 协议：stdin/stdout 每行一个 JSON。
+ *   请求：{"id": 1, "file": "/abs/path/foo.test.js", "env": {...}}
+ *   响应：{"id": 1, "exitCode": 0, "stdout": "...", "stderr": "...", "durationMs": 12}
+ *
+ * 每个测试模块都在独立的 worker_thread 中执行：拥有自己的 V8 isolate、事件循环、
+ * 全局对象和模块缓存，与直接运行 `node foo.test.js` 的语义一致——
+ *   - 事件循环中仍有定时器、文件/压缩等异步 I/O 时不会提前判定结束；
+ *   - 未捕获异常与未处理的 rejection 只会结束所属的 worker，不会串到下一个测试；
+ *   - process.exit() 立即终止该测试，之后的输出不会被采集。
+ * 宿主进程只付出一次 Node 启动开销，测试之间不共享任何状态。
+ */
+
+import path from 'path';
+import readline from 'readline';
+import util from 'util';
+import { Worker } from 'worker_threads';
+
+const writeProtocol = process.stdout.write.bind(process.stdout);
+// 宿主自身的日志不能混入协议通道
+console.log = (...args) => process.stderr.write(`${util.format(...args)}\n`);
+console.info = console.log;
+
+let activeWorker = null;
+
+function collectStream(stream) {
+    let text = '';
+    stream.setEncoding('utf8');
+    stream.on('data', (chunk) => {
+        text += chunk;
+    });
+    return new Promise((resolve) => {
+        stream.once('end', () => resolve(text));
+        stream.once('close', () => resolve(text));
+    });
+}
+
+function formatError(error) {
+    return error && error.stack ? error.stack : util.inspect(error);
+}
+
+async function runTest(file, env) {
+    let worker;
+    try {
+        worker = new Worker(file, {
+            argv: [],
+            execArgv: [],
+            env,
+            stdout: true,
+            stderr: true
+        });
+    } catch (error) {
+        return { exitCode: 1, stdout: '', stderr: `${formatError(error)}\n` };
+    }
+    activeWorker = worker;
+    let uncaught = '';
+    // 未捕获异常以 error 事件交给宿主，worker 随后以退出码 1 结束
+    worker.on('error', (error) => {
+        uncaught += `${formatError(error)}\n`;
+    });
+    const exited = new Promise((resolve) => worker.once('exit', resolve));
+    const [exitCode, stdout, stderr] = await Promise.all([
+        exited,
+        collectStream(worker.stdout),
+        collectStream(worker.stderr)
+    ]);
+    activeWorker = null;
+    return {
+        exitCode: Number(exitCode) || 0,
+        stdout,
+        stderr: stderr + uncaught
+    };
+}
+
+async function main() {
+    const lines = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+    // stdin 关闭（套件结束或超时后被关闭）时终止仍在运行的测试，宿主随之退出
+    lines.once('close', () => {
+        if (activeWorker) {
+            activeWorker.terminate();
+        }
+    });
+    writeProtocol(`${JSON.stringify({ ready: true, pid: process.pid })}\n`);
+    for await (const line of lines) {
+        if (!line.trim()) {
+            continue;
+        }
+        let request;
+        try {
+            request = JSON.parse(line);
+        } catch (error) {
+            writeProtocol(`${JSON.stringify({ id: null, error: `invalid_request:${error.message}` })}\n`);
+            continue;
+        }
+        const started = Date.now();
+        const env = request.env && typeof request.env === 'object' ? request.env : { ...process.env };
+        const result = await runTest(path.resolve(String(request.file || '')), env);
+        writeProtocol(`${JSON.stringify({ id: request.id, ...result, durationMs: Date.now() - started })}\n`);
+    }
+}
+
+main();
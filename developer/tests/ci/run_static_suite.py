@@ -7,19 +7,69 @@ invoked locally or inside CI before changes are merged.
 """
 from __future__ import annotations
 
+import argparse
+import hashlib
 import json
 import os
+import queue
 import re
 import subprocess
 import sys
+import threading
 import zipfile
-from difflib import SequenceMatcher
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from html.parser import HTMLParser
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# developer/tests/py 下的共享 helper 按模块名导入
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "py"))
+
+import reading_bundle_loader as bundle_loader
+import reading_corpus_db as corpus_db
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_CHECK_TIMEOUT = 120
+NODE_TEST_HOST = REPO_ROOT / "developer" / "tests" / "ci" / "node_test_host.node.js"
+NODE_TEST_HOST_START_TIMEOUT = 30
+# 子进程检查多为等待 node/浏览器的 I/O，并发数参考 ThreadPoolExecutor 的默认取值
+DEFAULT_CHECK_JOBS = min(8, (os.cpu_count() or 1) + 4)
+STATIC_CHECK_CACHE_PATH = REPO_ROOT / "developer" / "tests" / "reports" / "static-check-cache.json"
+STATIC_CHECK_CACHE_VERSION = 1
+# 阅读题目/解析标题相似度：字符 bigram 的 Dice 系数。
+# 阈值取 0.5：现有题库中 SequenceMatcher 低于原阈值 0.45 的错配标题，Dice 最高约 0.48，
+# 0.5 保证这些标题仍被拒绝；同 examId 的标题对 Dice 最低约 0.73，不受影响。
+READING_TITLE_NGRAM_SIZE = 2
+READING_TITLE_SIMILARITY_THRESHOLD = 0.5
+READING_ORPHAN_MATCH_LIMIT = 3
+E2E_REPORT_DIR = REPO_ROOT / "developer" / "tests" / "e2e" / "reports"
+# 子进程检查声明的输入（相对仓库根目录的 glob），用于结果缓存的内容哈希
+_FRONTEND_INPUTS = (
+    "index.html",
+    "js/**/*.js",
+    "css/**/*.css",
+    "scripts/*.mjs",
+)
+_NODE_TEST_INPUTS = _FRONTEND_INPUTS + (
+    "assets/wordlists/*.js",
+    "assets/generated/reading-exams/*.html",
+    "developer/tests/js/**/*.js",
+)
+_BROWSER_TEST_INPUTS = _FRONTEND_INPUTS + (
+    "assets/data/*",
+    "assets/wordlists/*.js",
+    "assets/generated/**/*",
+    "developer/tests/e2e/*.py",
+    "developer/tests/tools/**/*.js",
+)
+_GENERATED_READING_INPUTS = (
+    "assets/generated/reading-exams/*",
+    "assets/generated/reading-explanations/*",
+    "developer/tests/py/reading_*.py",
+)
 os.environ.setdefault("PYTHONIOENCODING", "utf-8")
 
 
@@ -1094,22 +1144,17 @@ def _check_json_path_map(path: Path) -> Tuple[bool, str]:
 
 def _extract_registered_payload(path: Path) -> Optional[dict]:
     try:
-        text = path.read_text(encoding="utf-8")
-    except Exception:
-        return None
-
-    match = re.search(
-        r"register\(\s*['\"]([^'\"]+)['\"]\s*,\s*(\{[\s\S]*\})\s*\)\s*;",
-        text,
-        re.MULTILINE,
-    )
-    if not match:
+        payload = bundle_loader.load_register_payload(path)
+    except OSError:
         return None
-
-    try:
-        payload = json.loads(match.group(2))
-    except json.JSONDecodeError:
-        payload = _extract_registered_payload_from_js_object(match.group(2))
+    except bundle_loader.BundleParseError:
+        # 少数旧包是 JS 对象字面量而非 JSON，退回按字段抽取
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        match = bundle_loader.REGISTER_CALL_RE.search(text)
+        payload = _extract_registered_payload_from_js_object(text[match.end():]) if match else None
     return payload if isinstance(payload, dict) else None
 
 
@@ -1148,6 +1193,94 @@ def _normalize_title_for_similarity(title: str) -> str:
     return lowered.strip()
 
 
+def _title_ngrams(normalized_title: str) -> frozenset:
+    if not normalized_title:
+        return frozenset()
+    padded = f" {normalized_title} "
+    size = READING_TITLE_NGRAM_SIZE
+    return frozenset(padded[index:index + size] for index in range(len(padded) - size + 1))
+
+
+def _dice_similarity(left: frozenset, right: frozenset) -> float:
+    if not left or not right:
+        return 0.0
+    return 2 * len(left & right) / (len(left) + len(right))
+
+
+class _TitleFeatureTable:
+    """阅读题目标题的 n-gram 特征表。
+
+    每个标题只归一化、切分一次；n-gram 倒排表让“某个标题最像哪些题目”
+    只需遍历共享 n-gram 的候选，而不是逐对比较全部题目。
+    """
+
+    def __init__(self, titles: Dict[str, str]) -> None:
+        self.features: Dict[str, frozenset] = {}
+        self.postings: Dict[str, List[str]] = {}
+        for exam_id, title in titles.items():
+            normalized = _normalize_title_for_similarity(title)
+            if not normalized:
+                continue
+            grams = _title_ngrams(normalized)
+            self.features[exam_id] = grams
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(exam_id)
+
+    def similarity(self, exam_id: str, grams: frozenset) -> float:
+        return _dice_similarity(self.features.get(exam_id, frozenset()), grams)
+
+    def best_matches(self, grams: frozenset, limit: int = READING_ORPHAN_MATCH_LIMIT) -> List[Tuple[str, float]]:
+        shared: Dict[str, int] = {}
+        for gram in grams:
+            for exam_id in self.postings.get(gram, ()):
+                shared[exam_id] = shared.get(exam_id, 0) + 1
+        scored = [
+            (exam_id, 2 * count / (len(grams) + len(self.features[exam_id])))
+            for exam_id, count in shared.items()
+        ]
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:limit]
+
+
+def _payload_title(payload: dict) -> str:
+    meta = payload.get("meta") if isinstance(payload.get("meta"), dict) else {}
+    return str(meta.get("title") or "")
+
+
+def _title_mismatch(
+    title_table: _TitleFeatureTable,
+    exam_payloads: Dict[str, dict],
+    exam_id: str,
+    explanation: dict,
+) -> Optional[dict]:
+    explanation_title = _payload_title(explanation)
+    explanation_grams = _title_ngrams(_normalize_title_for_similarity(explanation_title))
+    exam = exam_payloads.get(exam_id)
+    if not exam:
+        return {
+            "examId": exam_id,
+            "reason": "explanation_orphan",
+            "detail": "存在解析，但找不到同 examId 的阅读题目",
+            "bestMatches": [
+                {"examId": candidate_id, "title": _payload_title(exam_payloads[candidate_id]), "similarity": round(score, 3)}
+                for candidate_id, score in title_table.best_matches(explanation_grams)
+            ],
+        }
+
+    similarity = title_table.similarity(exam_id, explanation_grams)
+    if explanation_grams and exam_id in title_table.features and similarity < READING_TITLE_SIMILARITY_THRESHOLD:
+        return {
+            "examId": exam_id,
+            "reason": "title_similarity_low",
+            "detail": {
+                "examTitle": _payload_title(exam),
+                "explanationTitle": explanation_title,
+                "similarity": round(similarity, 3),
+            },
+        }
+    return None
+
+
 def _extract_exam_question_range(exam_payload: dict) -> Optional[Tuple[int, int]]:
     display_map = exam_payload.get("questionDisplayMap")
     if isinstance(display_map, dict):
@@ -1205,21 +1338,17 @@ def _check_reading_explanation_alignment() -> Tuple[bool, dict]:
     manifest_missing_scripts: List[str] = []
     manifest_unregistered_scripts: List[str] = []
 
-    for exam_file in sorted(exams_dir.glob("*.js")):
-        payload = _extract_registered_payload(exam_file)
-        if not payload:
-            continue
-        exam_id = str(payload.get("examId") or "").strip()
-        if exam_id:
-            exam_payloads[exam_id] = payload
-
-    for explanation_file in sorted(explanations_dir.glob("*.js")):
-        payload = _extract_registered_payload(explanation_file)
-        if not payload:
-            continue
-        exam_id = str(payload.get("examId") or "").strip()
-        if exam_id:
-            explanation_payloads[exam_id] = payload
+    conn = corpus_db.connect(REPO_ROOT)
+    for kind, target in (("exam", exam_payloads), ("explanation", explanation_payloads)):
+        for rel_path, payload in corpus_db.iter_payloads(conn, kind):
+            if payload is None:
+                payload = _extract_registered_payload(REPO_ROOT / rel_path)
+            if not payload:
+                continue
+            exam_id = str(payload.get("examId") or "").strip()
+            if exam_id:
+                target[exam_id] = payload
+    conn.close()
 
     manifest_path = explanations_dir / "manifest.js"
     try:
@@ -1251,35 +1380,16 @@ def _check_reading_explanation_alignment() -> Tuple[bool, dict]:
 
     missing_explanations = sorted([exam_id for exam_id in exam_payloads.keys() if exam_id not in explanation_payloads])
     mismatches: List[dict] = []
+    title_table = _TitleFeatureTable({exam_id: _payload_title(exam) for exam_id, exam in exam_payloads.items()})
 
     for exam_id, explanation in explanation_payloads.items():
+        title_mismatch = _title_mismatch(title_table, exam_payloads, exam_id, explanation)
+        if title_mismatch:
+            mismatches.append(title_mismatch)
         exam = exam_payloads.get(exam_id)
         if not exam:
-            mismatches.append({
-                "examId": exam_id,
-                "reason": "explanation_orphan",
-                "detail": "存在解析，但找不到同 examId 的阅读题目",
-            })
             continue
 
-        exam_meta = exam.get("meta") if isinstance(exam.get("meta"), dict) else {}
-        explanation_meta = explanation.get("meta") if isinstance(explanation.get("meta"), dict) else {}
-        exam_title = str(exam_meta.get("title") or "")
-        explanation_title = str(explanation_meta.get("title") or "")
-        normalized_exam_title = _normalize_title_for_similarity(exam_title)
-        normalized_explanation_title = _normalize_title_for_similarity(explanation_title)
-        similarity = SequenceMatcher(None, normalized_exam_title, normalized_explanation_title).ratio()
-        if normalized_exam_title and normalized_explanation_title and similarity < 0.45:
-            mismatches.append({
-                "examId": exam_id,
-                "reason": "title_similarity_low",
-                "detail": {
-                    "examTitle": exam_title,
-                    "explanationTitle": explanation_title,
-                    "similarity": round(similarity, 3),
-                },
-            })
-
         exam_range = _extract_exam_question_range(exam)
         explanation_range = _extract_explanation_question_range(explanation)
         if exam_range and explanation_range:
@@ -1348,11 +1458,17 @@ def _run_json_subprocess(
         output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
         return False, f"执行失败: {output_text.strip()}"
 
+    return _parse_process_output(completed.stdout or "", completed.stderr or "", parse_mode)
+
+
+def _parse_process_output(stdout: str, stderr: str, parse_mode: str) -> Tuple[bool, Any]:
+    if parse_mode == "text":
+        return True, stdout.strip()
     if parse_mode == "last-line":
-        output_lines = [line.strip() for line in (completed.stdout or "").splitlines() if line.strip()]
+        output_lines = [line.strip() for line in stdout.splitlines() if line.strip()]
         parse_target = output_lines[-1] if output_lines else ""
     else:
-        parse_target = (completed.stdout or "").strip() or (completed.stderr or "").strip()
+        parse_target = stdout.strip() or stderr.strip()
 
     try:
         payload = json.loads(parse_target or "{}")
@@ -1361,7 +1477,506 @@ def _run_json_subprocess(
     return True, payload
 
 
-def run_checks() -> Tuple[List[dict], bool]:
+class _NodeTestHostError(RuntimeError):
+    pass
+
+
+class _NodeTestHost:
+    """Long-lived ``node_test_host.node.js`` process speaking a JSON line protocol.
+
+    Each request runs one test module in its own ``worker_thread`` and waits
+    for that worker to exit, so exit codes, pending I/O and late errors behave
+    as under plain ``node`` while Node startup is paid once per host instead of
+    once per test.
+    """
+
+    def __init__(self) -> None:
+        self._process: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._next_id = 0
+
+    def _start(self) -> None:
+        self._process = subprocess.Popen(
+            ["node", str(NODE_TEST_HOST)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            cwd=str(REPO_ROOT),
+        )
+        self._lines = queue.Queue()
+        threading.Thread(target=self._pump, args=(self._process, self._lines), daemon=True).start()
+        handshake = self._read_line(NODE_TEST_HOST_START_TIMEOUT)
+        if not handshake.get("ready"):
+            raise _NodeTestHostError(f"node 测试宿主握手失败: {handshake}")
+
+    @staticmethod
+    def _pump(process: subprocess.Popen, lines: "queue.Queue[Optional[str]]") -> None:
+        assert process.stdout is not None
+        for line in process.stdout:
+            lines.put(line)
+        lines.put(None)
+
+    def _read_line(self, timeout: float) -> dict:
+        try:
+            line = self._lines.get(timeout=timeout)
+        except queue.Empty:
+            self.close()
+            raise subprocess.TimeoutExpired("node_test_host", timeout)
+        if line is None:
+            self.close()
+            raise _NodeTestHostError("node 测试宿主意外退出")
+        return json.loads(line)
+
+    def run(self, script: Path, timeout: int, env: Optional[Dict[str, str]] = None) -> Tuple[int, str, str]:
+        if self._process is None or self._process.poll() is not None:
+            self._start()
+        assert self._process is not None and self._process.stdin is not None
+        self._next_id += 1
+        request = {"id": self._next_id, "file": str(script), "env": dict(env if env is not None else os.environ)}
+        self._process.stdin.write(json.dumps(request, ensure_ascii=False) + "\n")
+        self._process.stdin.flush()
+        # 超时后宿主会被关闭，下一个测试自动重启新宿主
+        response = self._read_line(timeout)
+        return int(response.get("exitCode") or 0), str(response.get("stdout") or ""), str(response.get("stderr") or "")
+
+    def close(self) -> None:
+        process, self._process = self._process, None
+        if process is None:
+            return
+        if process.stdin is not None:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def _run_node_host_check(host: _NodeTestHost, check: "_SubprocessCheck") -> Tuple[bool, Any]:
+    try:
+        returncode, stdout, stderr = host.run(check.script, check.timeout, env=check.env)
+    except subprocess.TimeoutExpired:
+        return False, f"执行超时（{check.timeout}秒）"
+    if returncode != 0:
+        output_text = stdout + stderr + str(subprocess.CalledProcessError(returncode, list(check.command)))
+        return False, f"执行失败: {output_text.strip()}"
+    return _parse_process_output(stdout, stderr, check.parse_mode)
+
+
+def _evaluate_status_payload(payload: Any) -> Tuple[bool, Any]:
+    if not isinstance(payload, dict):
+        return False, payload
+    return payload.get("status") == "pass", payload.get("detail", payload)
+
+
+def _evaluate_passthrough(payload: Any) -> Tuple[bool, Any]:
+    return True, payload
+
+
+def _evaluate_exit_code(output: Any, *, default_detail: str = "已执行", fixed_detail: str = "") -> Tuple[bool, Any]:
+    if fixed_detail:
+        return True, fixed_detail
+    return True, output or default_detail
+
+
+def _evaluate_integration_payload(payload: Any) -> Tuple[bool, Any]:
+    if not isinstance(payload, dict):
+        return False, payload
+    return payload.get("status") == "pass", {
+        "passed": payload.get("passed", 0),
+        "total": payload.get("total", 0),
+        "detail": payload.get("detail", ""),
+    }
+
+
+def _evaluate_reading_audit_report(output: Any) -> Tuple[bool, Any]:
+    reading_report_path = REPO_ROOT / "developer" / "tests" / "e2e" / "reports" / "reading-question-audit-quick.json"
+    if not reading_report_path.exists():
+        return False, f"缺少报告文件，输出: {output}"
+    try:
+        payload = json.loads(reading_report_path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as parse_error:
+        return False, f"报告解析失败: {parse_error}"
+    summary = payload.get("summary", {}) if isinstance(payload, dict) else {}
+    return summary.get("exitCode") == 0, {
+        "staticAudited": summary.get("staticAudited", 0),
+        "staticFailed": summary.get("staticFailed", 0),
+        "uiAudited": summary.get("uiAudited", 0),
+        "uiFailed": summary.get("uiFailed", 0),
+        "report": "developer/tests/e2e/reports/reading-question-audit-quick.json",
+    }
+
+
+def _evaluate_checklist_payload(payload: Any) -> Tuple[bool, Any]:
+    checklist_payload = payload if isinstance(payload, dict) else {}
+    passed = (
+        not checklist_payload.get("summaryMismatches")
+        and not checklist_payload.get("claimMismatches")
+        and not checklist_payload.get("freshnessMismatches")
+    )
+    return passed, checklist_payload
+
+
+@dataclass(frozen=True)
+class _SubprocessCheck:
+    """A self-contained check that runs one script in a child process.
+
+    Checks are independent of each other unless listed in ``depends_on``, so
+    the scheduler may run them concurrently; results are always reported in
+    declaration order.
+
+    ``inputs`` lists repo-relative globs the check reads besides its own
+    script; a passing result is reused while those files are unchanged and
+    every path in ``outputs`` still exists.  Checks without inputs always run.
+    """
+
+    name: str
+    script: Path
+    command: Tuple[str, ...]
+    timeout: int = DEFAULT_CHECK_TIMEOUT
+    parse_mode: str = "stdout"
+    env: Optional[Dict[str, str]] = None
+    evaluate: Callable[[Any], Tuple[bool, Any]] = _evaluate_status_payload
+    depends_on: Tuple[str, ...] = ()
+    skip_reason: str = ""
+    node_host: bool = False
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[Path, ...] = ()
+
+
+def _node_check(name: str, script: Path, **kwargs: Any) -> _SubprocessCheck:
+    kwargs.setdefault("node_host", True)
+    kwargs.setdefault("inputs", _NODE_TEST_INPUTS)
+    return _SubprocessCheck(name=name, script=script, command=("node", str(script)), **kwargs)
+
+
+def _python_check(name: str, script: Path, *args: str, **kwargs: Any) -> _SubprocessCheck:
+    return _SubprocessCheck(name=name, script=script, command=(sys.executable, str(script), *args), **kwargs)
+
+
+def _declare_subprocess_checks() -> List[_SubprocessCheck]:
+    js_tests = REPO_ROOT / "developer" / "tests" / "js"
+    e2e_tests = REPO_ROOT / "developer" / "tests" / "e2e"
+    ci_tests = REPO_ROOT / "developer" / "tests" / "ci"
+
+    checks: List[_SubprocessCheck] = [
+        _node_check(
+            "AnswerSanitizer 单元测试",
+            js_tests / "answerSanitizer.test.js",
+            parse_mode="text",
+            evaluate=_evaluate_exit_code,
+        ),
+        _node_check("套题模式首篇衔接测试", js_tests / "suiteModeFlow.test.js"),
+        _node_check("套题模式状态机回归测试", js_tests / "suiteModeRegression.test.js"),
+        _python_check(
+            "模拟模式 NB 拖拽回灌回归测试",
+            e2e_tests / "simulation_nb_drag_regression.py",
+            timeout=240,
+            inputs=_BROWSER_TEST_INPUTS,
+        ),
+        _python_check(
+            "模拟模式切题回灌回归测试",
+            e2e_tests / "simulation_roundtrip_restore_regression.py",
+            timeout=360,
+            inputs=_BROWSER_TEST_INPUTS,
+        ),
+        _python_check(
+            "统一阅读提交只读高亮回归测试",
+            e2e_tests / "unified_submit_readonly_regression.py",
+            timeout=240,
+            inputs=_BROWSER_TEST_INPUTS,
+        ),
+        _node_check("统一阅读锁定与退出静态回归测试", js_tests / "unifiedReadingLockRegression.test.js"),
+        _node_check("套题模式内联注入测试", js_tests / "suiteInlineFallback.test.js"),
+        _node_check("全量题库记录匹配测试", js_tests / "fullLibraryRecordMatching.test.js"),
+        _node_check("PracticeCore 单元测试", js_tests / "practiceCore.test.js"),
+        _node_check("PracticeRecorder 单元测试", js_tests / "practiceRecorder.test.js"),
+        _node_check("Practice 自定义卡片守卫", js_tests / "practiceCustomCard.test.js"),
+        _node_check(
+            "VocabStore 错词释义补全测试",
+            js_tests / "vocabStore.test.js",
+            inputs=_NODE_TEST_INPUTS + (
+                "assets/generated/reading-exams/manifest.js",
+                "assets/generated/reading-exams/vocab/*.js",
+            ),
+        ),
+        _node_check("ResourceCore 单元测试", js_tests / "resourceCore.test.js"),
+        _node_check("LibraryDiscovery 动态题库识别测试", js_tests / "libraryDiscovery.test.js", timeout=30),
+        _node_check("LibraryManager 导入配置隔离测试", js_tests / "libraryManagerImportConfig.test.js", timeout=30),
+        _node_check(
+            "BrowseController 听力入口可用性测试",
+            js_tests / "browseController.test.js",
+            timeout=30,
+            parse_mode="text",
+            evaluate=partial(_evaluate_exit_code, fixed_detail="BrowseController 测试通过"),
+        ),
+        _node_check("BrowsePreferences 历史记录锚点测试", js_tests / "browsePreferencesRecords.test.js", timeout=30),
+        _node_check("OverviewStats 自定义听力入口测试", js_tests / "overviewStats.test.js", timeout=30),
+        _node_check("按需入口回归测试", js_tests / "onDemandEntrypoints.test.js"),
+        _node_check("服务门面回归测试", js_tests / "serviceFacade.test.js"),
+        _node_check(
+            "ExamFilterService 回归测试",
+            js_tests / "examFilterService.test.js",
+            inputs=_NODE_TEST_INPUTS + ("assets/generated/reading-exams/manifest.js",),
+        ),
+        _node_check("PracticeCore 静态守卫", js_tests / "practiceCore.guard.test.js"),
+        _node_check("练习记录持久化删除链路测试", js_tests / "practiceRecordPersistence.test.js"),
+        _node_check("阅读高亮本地词典测试", js_tests / "dictionaryService.test.js", timeout=30),
+        _node_check(
+            "阅读题目分块注册表测试",
+            js_tests / "readingExamRegistry.test.js",
+            inputs=_NODE_TEST_INPUTS + ("assets/generated/reading-exams/**/*.js",),
+        ),
+        _node_check(
+            "阅读题库全文检索测试",
+            js_tests / "readingExamSearch.test.js",
+            inputs=_NODE_TEST_INPUTS + ("assets/generated/reading-exams/search/*.js",),
+        ),
+        _node_check("PracticeCore app.state 同步测试", js_tests / "practiceCoreAppStateSync.test.js"),
+    ]
+
+    # Integration tests
+    deprecated_reading_source_dir = REPO_ROOT / "developer" / "reading-exams"
+    integration_tests = [
+        ("Reading migration snapshot integration test", js_tests / "integration" / "readingMigrationSnapshot.test.js"),
+        ("多套题提交流程集成测试", js_tests / "integration" / "multiSuiteSubmission.test.js"),
+        ("拼写错误收集流程集成测试", js_tests / "integration" / "spellingErrorCollection.test.js"),
+        ("词表切换流程集成测试", js_tests / "integration" / "vocabListSwitching.test.js"),
+        ("Vocab session view flow integration test", js_tests / "integration" / "vocabSessionView.test.js"),
+    ]
+    for test_name, test_path in integration_tests:
+        skip_reason = ""
+        if test_name == "Reading migration snapshot integration test" and not deprecated_reading_source_dir.exists():
+            skip_reason = "显式跳过：developer/reading-exams 目录已废弃，迁移快照用例不再执行"
+        checks.append(_node_check(
+            test_name,
+            test_path,
+            timeout=30,
+            evaluate=_evaluate_integration_payload,
+            skip_reason=skip_reason,
+        ))
+
+    checklist_env = os.environ.copy()
+    checklist_env["CHECKLIST_IGNORE_RUN_STATIC_CLAIM"] = "1"
+    checks.extend([
+        _python_check(
+            "Reading 逐题自动排查（quick）",
+            e2e_tests / "reading_question_audit.py",
+            "--mode",
+            "quick",
+            timeout=480,
+            parse_mode="text",
+            evaluate=_evaluate_reading_audit_report,
+            inputs=_BROWSER_TEST_INPUTS,
+        ),
+        _python_check(
+            "PDF 对账与回归审计",
+            ci_tests / "audit_pdf_checklist_and_mona.py",
+            timeout=120,
+            evaluate=_evaluate_passthrough,
+            inputs=_FRONTEND_INPUTS + _GENERATED_READING_INPUTS + (
+                "checklist.md",
+                "developer/tests/ci/pdf_executable_issues.json",
+                "developer/tests/e2e/reports/suite-practice-flow-report.json",
+            ),
+            outputs=(E2E_REPORT_DIR / "pdf-checklist-audit-report.json",),
+        ),
+        _python_check(
+            "Reading 数据完整性校验",
+            ci_tests / "check_reading_data_integrity.py",
+            timeout=30,
+            parse_mode="last-line",
+            evaluate=_evaluate_passthrough,
+            inputs=_GENERATED_READING_INPUTS + ("developer/tests/ci/reading-duplicate-allowlist.json",),
+            outputs=(E2E_REPORT_DIR / "reading-data-integrity-report.json",),
+        ),
+        # 对账脚本读取 PDF 审计与完整性校验写出的报告，必须等二者完成；
+        # 它还读取本次运行才写出的 static-ci-report.json，因此不声明输入、不走缓存
+        _python_check(
+            "Checklist 对账一致性校验",
+            ci_tests / "check_checklist_consistency.py",
+            timeout=30,
+            env=checklist_env,
+            evaluate=_evaluate_checklist_payload,
+            depends_on=("PDF 对账与回归审计", "Reading 数据完整性校验"),
+        ),
+    ])
+    return checks
+
+
+def _run_subprocess_check(check: _SubprocessCheck, host: Optional[_NodeTestHost] = None) -> Tuple[bool, Any]:
+    if check.skip_reason:
+        return True, check.skip_reason
+    if not check.script.exists():
+        return False, "测试脚本缺失"
+    if host is not None and check.node_host:
+        try:
+            ok, payload = _run_node_host_check(host, check)
+        except (_NodeTestHostError, OSError, json.JSONDecodeError):
+            # 宿主不可用（例如 node 版本过旧无法启动）时退回独立子进程
+            host.close()
+        else:
+            return check.evaluate(payload) if ok else (False, payload)
+    ok, payload = _run_json_subprocess(
+        list(check.command),
+        check.timeout,
+        env=check.env,
+        parse_mode=check.parse_mode,
+    )
+    if not ok:
+        return False, payload
+    return check.evaluate(payload)
+
+
+class _StaticCheckCache:
+    """Passing results of scheduled checks keyed by a content hash of their inputs.
+
+    The key covers the check's script, its declared input files, its command
+    line and this suite module itself, so editing an evaluator also
+    invalidates every cached result.  Checks that run in the node test host
+    also hash ``node_test_host.node.js``.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.hits = 0
+        self._entries = self._load()
+        self._digests: Dict[Path, str] = {}
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != STATIC_CHECK_CACHE_VERSION:
+            return {}
+        entries = payload.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def _file_digest(self, path: Path) -> str:
+        digest = self._digests.get(path)
+        if digest is None:
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            self._digests[path] = digest
+        return digest
+
+    def key_for(self, check: _SubprocessCheck) -> Optional[str]:
+        if not check.inputs or check.skip_reason or not check.script.exists():
+            return None
+        files = {check.script.resolve(), Path(__file__).resolve()}
+        if check.node_host:
+            files.add(NODE_TEST_HOST.resolve())
+        for pattern in check.inputs:
+            files.update(path.resolve() for path in REPO_ROOT.glob(pattern) if path.is_file())
+
+        hasher = hashlib.sha256()
+        header = [STATIC_CHECK_CACHE_VERSION, list(check.command[1:]), check.parse_mode]
+        hasher.update(json.dumps(header, ensure_ascii=False).encode("utf-8"))
+        for path in sorted(files):
+            try:
+                relative = path.relative_to(REPO_ROOT).as_posix()
+            except ValueError:
+                relative = path.as_posix()
+            hasher.update(f"\n{relative}\0{self._file_digest(path)}".encode("utf-8"))
+        return hasher.hexdigest()
+
+    def lookup(self, check: _SubprocessCheck, key: Optional[str]) -> Optional[Tuple[bool, Any]]:
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(check.name)
+            if not isinstance(entry, dict) or entry.get("key") != key:
+                return None
+            if not all(path.exists() for path in check.outputs):
+                return None
+            self.hits += 1
+            return True, entry.get("detail")
+
+    def store(self, check: _SubprocessCheck, key: Optional[str], passed: bool, detail: Any) -> None:
+        if key is None:
+            return
+        with self._lock:
+            # 失败结果可能来自超时或环境问题，不缓存，下次照常重跑
+            if passed:
+                self._entries[check.name] = {"key": key, "detail": detail}
+            else:
+                self._entries.pop(check.name, None)
+
+    def save(self, check_names: List[str]) -> None:
+        entries = {name: self._entries[name] for name in check_names if name in self._entries}
+        payload = {"version": STATIC_CHECK_CACHE_VERSION, "entries": entries}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def _run_scheduled_checks(
+    checks: List[_SubprocessCheck],
+    jobs: int,
+    *,
+    use_node_host: bool = True,
+    cache: Optional[_StaticCheckCache] = None,
+) -> Tuple[List[dict], bool]:
+    """Run independent checks on a worker pool and reassemble them in declaration order."""
+    futures: Dict[str, Future] = {}
+    cache_keys = {check.name: cache.key_for(check) for check in checks} if cache is not None else {}
+    hosts: List[_NodeTestHost] = []
+    hosts_lock = threading.Lock()
+    worker_state = threading.local()
+
+    def _worker_host() -> Optional[_NodeTestHost]:
+        if not use_node_host:
+            return None
+        host = getattr(worker_state, "host", None)
+        if host is None:
+            host = _NodeTestHost()
+            worker_state.host = host
+            with hosts_lock:
+                hosts.append(host)
+        return host
+
+    def _run_after_dependencies(check: _SubprocessCheck) -> Tuple[bool, Any]:
+        # Dependencies are always declared (and therefore queued) earlier, so
+        # waiting here cannot starve the pool.
+        for dependency in check.depends_on:
+            futures[dependency].result()
+        if cache is None:
+            return _run_subprocess_check(check, _worker_host() if check.node_host else None)
+        cache_key = cache_keys.get(check.name)
+        cached = cache.lookup(check, cache_key)
+        if cached is not None:
+            return cached
+        passed, detail = _run_subprocess_check(check, _worker_host() if check.node_host else None)
+        cache.store(check, cache_key, passed, detail)
+        return passed, detail
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            for check in checks:
+                futures[check.name] = executor.submit(_run_after_dependencies, check)
+            outcomes = [futures[check.name].result() for check in checks]
+    finally:
+        for host in hosts:
+            host.close()
+
+    if cache is not None:
+        cache.save([check.name for check in checks])
+        print(f"结果缓存命中 {cache.hits}/{len(checks)} 项检查", file=sys.stderr)
+
+    results = [_format_result(check.name, passed, detail) for check, (passed, detail) in zip(checks, outcomes)]
+    return results, all(passed for passed, _ in outcomes)
+
+
+def run_checks(
+    jobs: int = DEFAULT_CHECK_JOBS,
+    use_node_host: bool = True,
+    use_cache: bool = True,
+) -> Tuple[List[dict], bool]:
     results: List[dict] = []
     all_passed = True
 
@@ -1751,872 +2366,14 @@ def run_checks() -> Tuple[List[dict], bool]:
             results.append(_format_result("Mixin 方法契约覆盖", coverage_passed, coverage_detail))
             all_passed &= coverage_passed
 
-    sanitizer_test = REPO_ROOT / "developer" / "tests" / "js" / "answerSanitizer.test.js"
-    if sanitizer_test.exists():
-        try:
-            completed_sanitizer = subprocess.run(
-                ["node", str(sanitizer_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                encoding="utf-8"
-            )
-        except subprocess.CalledProcessError as exc:
-            sanitizer_passed = False
-            sanitizer_detail = f"执行失败: {((exc.stdout or '') + (exc.stderr or '') + str(exc)).strip()}"
-        else:
-            sanitizer_passed = True
-            sanitizer_detail = (completed_sanitizer.stdout or "").strip() or "已执行"
-        results.append(_format_result("AnswerSanitizer 单元测试", sanitizer_passed, sanitizer_detail))
-        all_passed &= sanitizer_passed
-    else:
-        results.append(_format_result("AnswerSanitizer 单元测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    suite_flow_test = REPO_ROOT / "developer" / "tests" / "js" / "suiteModeFlow.test.js"
-    if suite_flow_test.exists():
-        try:
-            completed = subprocess.run(
-                ["node", str(suite_flow_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                encoding="utf-8"
-            )
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            result_detail = f"执行失败: {output_text.strip()}"
-            suite_passed = False
-        else:
-            raw_output = (completed.stdout or "").strip() or (completed.stderr or "").strip()
-            try:
-                payload = json.loads(raw_output or "{}")
-            except json.JSONDecodeError as parse_error:
-                suite_passed = False
-                result_detail = f"输出解析失败: {parse_error}"
-            else:
-                suite_passed = payload.get("status") == "pass"
-                result_detail = payload.get("detail", payload)
-        results.append(_format_result("套题模式首篇衔接测试", suite_passed, result_detail))
-        all_passed &= suite_passed
-    else:
-        results.append(_format_result("套题模式首篇衔接测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    suite_regression_test = REPO_ROOT / "developer" / "tests" / "js" / "suiteModeRegression.test.js"
-    if suite_regression_test.exists():
-        try:
-            completed_suite_regression = subprocess.run(
-                ["node", str(suite_regression_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                encoding="utf-8"
-            )
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            suite_regression_passed = False
-            suite_regression_detail = f"执行失败: {output_text.strip()}"
-        else:
-            raw_suite_regression = (completed_suite_regression.stdout or "").strip() or (completed_suite_regression.stderr or "").strip()
-            try:
-                suite_regression_payload = json.loads(raw_suite_regression or "{}")
-            except json.JSONDecodeError as parse_error:
-                suite_regression_passed = False
-                suite_regression_detail = f"输出解析失败: {parse_error}"
-            else:
-                suite_regression_passed = suite_regression_payload.get("status") == "pass"
-                suite_regression_detail = suite_regression_payload.get("detail", suite_regression_payload)
-        results.append(_format_result("套题模式状态机回归测试", suite_regression_passed, suite_regression_detail))
-        all_passed &= suite_regression_passed
-    else:
-        results.append(_format_result("套题模式状态机回归测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    simulation_nb_drag_test = REPO_ROOT / "developer" / "tests" / "e2e" / "simulation_nb_drag_regression.py"
-    if simulation_nb_drag_test.exists():
-        try:
-            completed_sim_nb_drag = subprocess.run(
-                [sys.executable, str(simulation_nb_drag_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                timeout=240,
-                encoding="utf-8"
-            )
-        except subprocess.TimeoutExpired:
-            sim_nb_drag_passed = False
-            sim_nb_drag_detail = "执行超时（240秒）"
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            sim_nb_drag_passed = False
-            sim_nb_drag_detail = f"执行失败: {output_text.strip()}"
-        else:
-            raw_sim_nb_drag = (completed_sim_nb_drag.stdout or "").strip() or (completed_sim_nb_drag.stderr or "").strip()
-            try:
-                sim_nb_drag_payload = json.loads(raw_sim_nb_drag or "{}")
-            except json.JSONDecodeError as parse_error:
-                sim_nb_drag_passed = False
-                sim_nb_drag_detail = f"输出解析失败: {parse_error}"
-            else:
-                sim_nb_drag_passed = sim_nb_drag_payload.get("status") == "pass"
-                sim_nb_drag_detail = sim_nb_drag_payload.get("detail", sim_nb_drag_payload)
-        results.append(_format_result("模拟模式 NB 拖拽回灌回归测试", sim_nb_drag_passed, sim_nb_drag_detail))
-        all_passed &= sim_nb_drag_passed
-    else:
-        results.append(_format_result("模拟模式 NB 拖拽回灌回归测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    simulation_roundtrip_restore_test = REPO_ROOT / "developer" / "tests" / "e2e" / "simulation_roundtrip_restore_regression.py"
-    if simulation_roundtrip_restore_test.exists():
-        try:
-            completed_sim_roundtrip_restore = subprocess.run(
-                [sys.executable, str(simulation_roundtrip_restore_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                timeout=360,
-                encoding="utf-8"
-            )
-        except subprocess.TimeoutExpired:
-            sim_roundtrip_restore_passed = False
-            sim_roundtrip_restore_detail = "执行超时（360秒）"
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            sim_roundtrip_restore_passed = False
-            sim_roundtrip_restore_detail = f"执行失败: {output_text.strip()}"
-        else:
-            raw_sim_roundtrip_restore = (completed_sim_roundtrip_restore.stdout or "").strip() or (completed_sim_roundtrip_restore.stderr or "").strip()
-            try:
-                sim_roundtrip_restore_payload = json.loads(raw_sim_roundtrip_restore or "{}")
-            except json.JSONDecodeError as parse_error:
-                sim_roundtrip_restore_passed = False
-                sim_roundtrip_restore_detail = f"输出解析失败: {parse_error}"
-            else:
-                sim_roundtrip_restore_passed = sim_roundtrip_restore_payload.get("status") == "pass"
-                sim_roundtrip_restore_detail = sim_roundtrip_restore_payload.get("detail", sim_roundtrip_restore_payload)
-        results.append(_format_result("模拟模式切题回灌回归测试", sim_roundtrip_restore_passed, sim_roundtrip_restore_detail))
-        all_passed &= sim_roundtrip_restore_passed
-    else:
-        results.append(_format_result("模拟模式切题回灌回归测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    unified_submit_readonly_test = REPO_ROOT / "developer" / "tests" / "e2e" / "unified_submit_readonly_regression.py"
-    if unified_submit_readonly_test.exists():
-        try:
-            completed_unified_submit = subprocess.run(
-                [sys.executable, str(unified_submit_readonly_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                timeout=240,
-                encoding="utf-8"
-            )
-        except subprocess.TimeoutExpired:
-            unified_submit_passed = False
-            unified_submit_detail = "执行超时（240秒）"
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            unified_submit_passed = False
-            unified_submit_detail = f"执行失败: {output_text.strip()}"
-        else:
-            raw_unified_submit = (completed_unified_submit.stdout or "").strip() or (completed_unified_submit.stderr or "").strip()
-            try:
-                unified_submit_payload = json.loads(raw_unified_submit or "{}")
-            except json.JSONDecodeError as parse_error:
-                unified_submit_passed = False
-                unified_submit_detail = f"输出解析失败: {parse_error}"
-            else:
-                unified_submit_passed = unified_submit_payload.get("status") == "pass"
-                unified_submit_detail = unified_submit_payload.get("detail", unified_submit_payload)
-        results.append(_format_result("统一阅读提交只读高亮回归测试", unified_submit_passed, unified_submit_detail))
-        all_passed &= unified_submit_passed
-    else:
-        results.append(_format_result("统一阅读提交只读高亮回归测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    unified_lock_regression_test = REPO_ROOT / "developer" / "tests" / "js" / "unifiedReadingLockRegression.test.js"
-    if unified_lock_regression_test.exists():
-        try:
-            completed_unified_lock = subprocess.run(
-                ["node", str(unified_lock_regression_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                encoding="utf-8"
-            )
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            unified_lock_passed = False
-            unified_lock_detail = f"执行失败: {output_text.strip()}"
-        else:
-            raw_unified_lock = (completed_unified_lock.stdout or "").strip() or (completed_unified_lock.stderr or "").strip()
-            try:
-                unified_lock_payload = json.loads(raw_unified_lock or "{}")
-            except json.JSONDecodeError as parse_error:
-                unified_lock_passed = False
-                unified_lock_detail = f"输出解析失败: {parse_error}"
-            else:
-                unified_lock_passed = unified_lock_payload.get("status") == "pass"
-                unified_lock_detail = unified_lock_payload.get("detail", unified_lock_payload)
-        results.append(_format_result("统一阅读锁定与退出静态回归测试", unified_lock_passed, unified_lock_detail))
-        all_passed &= unified_lock_passed
-    else:
-        results.append(_format_result("统一阅读锁定与退出静态回归测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    inline_fallback_test = REPO_ROOT / "developer" / "tests" / "js" / "suiteInlineFallback.test.js"
-    if inline_fallback_test.exists():
-        try:
-            completed_inline = subprocess.run(
-                ["node", str(inline_fallback_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                encoding="utf-8"
-            )
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            inline_passed = False
-            inline_detail = f"执行失败: {output_text.strip()}"
-        else:
-            raw_inline_output = (completed_inline.stdout or "").strip() or (completed_inline.stderr or "").strip()
-            try:
-                inline_payload = json.loads(raw_inline_output or "{}")
-            except json.JSONDecodeError as parse_error:
-                inline_passed = False
-                inline_detail = f"输出解析失败: {parse_error}"
-            else:
-                inline_passed = inline_payload.get("status") == "pass"
-                inline_detail = inline_payload.get("detail", inline_payload)
-        results.append(_format_result("套题模式内联注入测试", inline_passed, inline_detail))
-        all_passed &= inline_passed
-    else:
-        results.append(_format_result("套题模式内联注入测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    # Full library record matching test
-    full_library_test = REPO_ROOT / "developer" / "tests" / "js" / "fullLibraryRecordMatching.test.js"
-    if full_library_test.exists():
-        try:
-            completed_full_lib = subprocess.run(
-                ["node", str(full_library_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                encoding="utf-8"
-            )
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            full_lib_passed = False
-            full_lib_detail = f"执行失败: {output_text.strip()}"
-        else:
-            raw_full_lib_output = (completed_full_lib.stdout or "").strip() or (completed_full_lib.stderr or "").strip()
-            try:
-                full_lib_payload = json.loads(raw_full_lib_output or "{}")
-            except json.JSONDecodeError as parse_error:
-                full_lib_passed = False
-                full_lib_detail = f"输出解析失败: {parse_error}"
-            else:
-                full_lib_passed = full_lib_payload.get("status") == "pass"
-                full_lib_detail = full_lib_payload.get("detail", full_lib_payload)
-        results.append(_format_result("全量题库记录匹配测试", full_lib_passed, full_lib_detail))
-        all_passed &= full_lib_passed
-    else:
-        results.append(_format_result("全量题库记录匹配测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    practice_core_test = REPO_ROOT / "developer" / "tests" / "js" / "practiceCore.test.js"
-    if practice_core_test.exists():
-        try:
-            completed_practice_core = subprocess.run(
-                ["node", str(practice_core_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                encoding="utf-8"
-            )
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            practice_core_passed = False
-            practice_core_detail = f"执行失败: {output_text.strip()}"
-        else:
-            raw_practice_core_output = (completed_practice_core.stdout or "").strip() or (completed_practice_core.stderr or "").strip()
-            try:
-                practice_core_payload = json.loads(raw_practice_core_output or "{}")
-            except json.JSONDecodeError as parse_error:
-                practice_core_passed = False
-                practice_core_detail = f"输出解析失败: {parse_error}"
-            else:
-                practice_core_passed = practice_core_payload.get("status") == "pass"
-                practice_core_detail = practice_core_payload.get("detail", practice_core_payload)
-        results.append(_format_result("PracticeCore 单元测试", practice_core_passed, practice_core_detail))
-        all_passed &= practice_core_passed
-    else:
-        results.append(_format_result("PracticeCore 单元测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    practice_recorder_test = REPO_ROOT / "developer" / "tests" / "js" / "practiceRecorder.test.js"
-    if practice_recorder_test.exists():
-        try:
-            completed_practice_recorder = subprocess.run(
-                ["node", str(practice_recorder_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                encoding="utf-8"
-            )
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            practice_recorder_passed = False
-            practice_recorder_detail = f"执行失败: {output_text.strip()}"
-        else:
-            raw_practice_recorder_output = (completed_practice_recorder.stdout or "").strip() or (completed_practice_recorder.stderr or "").strip()
-            try:
-                practice_recorder_payload = json.loads(raw_practice_recorder_output or "{}")
-            except json.JSONDecodeError as parse_error:
-                practice_recorder_passed = False
-                practice_recorder_detail = f"输出解析失败: {parse_error}"
-            else:
-                practice_recorder_passed = practice_recorder_payload.get("status") == "pass"
-                practice_recorder_detail = practice_recorder_payload.get("detail", practice_recorder_payload)
-        results.append(_format_result("PracticeRecorder 单元测试", practice_recorder_passed, practice_recorder_detail))
-        all_passed &= practice_recorder_passed
-    else:
-        results.append(_format_result("PracticeRecorder 单元测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    practice_custom_card_test = REPO_ROOT / "developer" / "tests" / "js" / "practiceCustomCard.test.js"
-    if practice_custom_card_test.exists():
-        try:
-            completed_practice_custom_card = subprocess.run(
-                ["node", str(practice_custom_card_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                encoding="utf-8"
-            )
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            practice_custom_card_passed = False
-            practice_custom_card_detail = f"执行失败: {output_text.strip()}"
-        else:
-            raw_practice_custom_card_output = (completed_practice_custom_card.stdout or "").strip() or (completed_practice_custom_card.stderr or "").strip()
-            try:
-                practice_custom_card_payload = json.loads(raw_practice_custom_card_output or "{}")
-            except json.JSONDecodeError as parse_error:
-                practice_custom_card_passed = False
-                practice_custom_card_detail = f"输出解析失败: {parse_error}"
-            else:
-                practice_custom_card_passed = practice_custom_card_payload.get("status") == "pass"
-                practice_custom_card_detail = practice_custom_card_payload.get("detail", practice_custom_card_payload)
-        results.append(_format_result("Practice 自定义卡片守卫", practice_custom_card_passed, practice_custom_card_detail))
-        all_passed &= practice_custom_card_passed
-    else:
-        results.append(_format_result("Practice 自定义卡片守卫", False, "测试脚本缺失"))
-        all_passed = False
-
-    vocab_store_test = REPO_ROOT / "developer" / "tests" / "js" / "vocabStore.test.js"
-    if vocab_store_test.exists():
-        try:
-            completed_vocab_store = subprocess.run(
-                ["node", str(vocab_store_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                encoding="utf-8"
-            )
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            vocab_store_passed = False
-            vocab_store_detail = f"执行失败: {output_text.strip()}"
-        else:
-            raw_vocab_store_output = (completed_vocab_store.stdout or "").strip() or (completed_vocab_store.stderr or "").strip()
-            try:
-                vocab_store_payload = json.loads(raw_vocab_store_output or "{}")
-            except json.JSONDecodeError as parse_error:
-                vocab_store_passed = False
-                vocab_store_detail = f"输出解析失败: {parse_error}"
-            else:
-                vocab_store_passed = vocab_store_payload.get("status") == "pass"
-                vocab_store_detail = vocab_store_payload.get("detail", vocab_store_payload)
-        results.append(_format_result("VocabStore 错词释义补全测试", vocab_store_passed, vocab_store_detail))
-        all_passed &= vocab_store_passed
-    else:
-        results.append(_format_result("VocabStore 错词释义补全测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    resource_core_test = REPO_ROOT / "developer" / "tests" / "js" / "resourceCore.test.js"
-    if resource_core_test.exists():
-        try:
-            completed_resource_core = subprocess.run(
-                ["node", str(resource_core_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                encoding="utf-8"
-            )
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            resource_core_passed = False
-            resource_core_detail = f"执行失败: {output_text.strip()}"
-        else:
-            raw_resource_core_output = (completed_resource_core.stdout or "").strip() or (completed_resource_core.stderr or "").strip()
-            try:
-                resource_core_payload = json.loads(raw_resource_core_output or "{}")
-            except json.JSONDecodeError as parse_error:
-                resource_core_passed = False
-                resource_core_detail = f"输出解析失败: {parse_error}"
-            else:
-                resource_core_passed = resource_core_payload.get("status") == "pass"
-                resource_core_detail = resource_core_payload.get("detail", resource_core_payload)
-        results.append(_format_result("ResourceCore 单元测试", resource_core_passed, resource_core_detail))
-        all_passed &= resource_core_passed
-    else:
-        results.append(_format_result("ResourceCore 单元测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    library_discovery_test = REPO_ROOT / "developer" / "tests" / "js" / "libraryDiscovery.test.js"
-    if library_discovery_test.exists():
-        library_discovery_passed, library_discovery_detail = _run_json_subprocess(
-            ["node", str(library_discovery_test)],
-            timeout=30,
-        )
-        if library_discovery_passed:
-            library_discovery_passed = library_discovery_detail.get("status") == "pass"
-            library_discovery_detail = library_discovery_detail.get("detail", library_discovery_detail)
-        results.append(_format_result("LibraryDiscovery 动态题库识别测试", library_discovery_passed, library_discovery_detail))
-        all_passed &= library_discovery_passed
-    else:
-        results.append(_format_result("LibraryDiscovery 动态题库识别测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    library_manager_import_test = REPO_ROOT / "developer" / "tests" / "js" / "libraryManagerImportConfig.test.js"
-    if library_manager_import_test.exists():
-        library_manager_import_passed, library_manager_import_detail = _run_json_subprocess(
-            ["node", str(library_manager_import_test)],
-            timeout=30,
-        )
-        if library_manager_import_passed:
-            library_manager_import_passed = library_manager_import_detail.get("status") == "pass"
-            library_manager_import_detail = library_manager_import_detail.get("detail", library_manager_import_detail)
-        results.append(_format_result("LibraryManager 导入配置隔离测试", library_manager_import_passed, library_manager_import_detail))
-        all_passed &= library_manager_import_passed
-    else:
-        results.append(_format_result("LibraryManager 导入配置隔离测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    browse_controller_test = REPO_ROOT / "developer" / "tests" / "js" / "browseController.test.js"
-    if browse_controller_test.exists():
-        try:
-            subprocess.run(
-                ["node", str(browse_controller_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                encoding="utf-8",
-            )
-            browse_controller_passed = True
-            browse_controller_detail = "BrowseController 测试通过"
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            browse_controller_passed = False
-            browse_controller_detail = f"执行失败: {output_text.strip()}"
-        results.append(_format_result("BrowseController 听力入口可用性测试", browse_controller_passed, browse_controller_detail))
-        all_passed &= browse_controller_passed
-    else:
-        results.append(_format_result("BrowseController 听力入口可用性测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    browse_preferences_records_test = REPO_ROOT / "developer" / "tests" / "js" / "browsePreferencesRecords.test.js"
-    if browse_preferences_records_test.exists():
-        browse_preferences_records_passed, browse_preferences_records_detail = _run_json_subprocess(
-            ["node", str(browse_preferences_records_test)],
-            timeout=30,
-        )
-        if browse_preferences_records_passed:
-            browse_preferences_records_passed = browse_preferences_records_detail.get("status") == "pass"
-            browse_preferences_records_detail = browse_preferences_records_detail.get("detail", browse_preferences_records_detail)
-        results.append(_format_result("BrowsePreferences 历史记录锚点测试", browse_preferences_records_passed, browse_preferences_records_detail))
-        all_passed &= browse_preferences_records_passed
-    else:
-        results.append(_format_result("BrowsePreferences 历史记录锚点测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    overview_stats_test = REPO_ROOT / "developer" / "tests" / "js" / "overviewStats.test.js"
-    if overview_stats_test.exists():
-        overview_stats_passed, overview_stats_detail = _run_json_subprocess(
-            ["node", str(overview_stats_test)],
-            timeout=30,
-        )
-        if overview_stats_passed:
-            overview_stats_passed = overview_stats_detail.get("status") == "pass"
-            overview_stats_detail = overview_stats_detail.get("detail", overview_stats_detail)
-        results.append(_format_result("OverviewStats 自定义听力入口测试", overview_stats_passed, overview_stats_detail))
-        all_passed &= overview_stats_passed
-    else:
-        results.append(_format_result("OverviewStats 自定义听力入口测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    on_demand_entry_test = REPO_ROOT / "developer" / "tests" / "js" / "onDemandEntrypoints.test.js"
-    if on_demand_entry_test.exists():
-        try:
-            completed_on_demand = subprocess.run(
-                ["node", str(on_demand_entry_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                encoding="utf-8"
-            )
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            on_demand_passed = False
-            on_demand_detail = f"执行失败: {output_text.strip()}"
-        else:
-            raw_on_demand_output = (completed_on_demand.stdout or "").strip() or (completed_on_demand.stderr or "").strip()
-            try:
-                on_demand_payload = json.loads(raw_on_demand_output or "{}")
-            except json.JSONDecodeError as parse_error:
-                on_demand_passed = False
-                on_demand_detail = f"输出解析失败: {parse_error}"
-            else:
-                on_demand_passed = on_demand_payload.get("status") == "pass"
-                on_demand_detail = on_demand_payload.get("detail", on_demand_payload)
-        results.append(_format_result("按需入口回归测试", on_demand_passed, on_demand_detail))
-        all_passed &= on_demand_passed
-    else:
-        results.append(_format_result("按需入口回归测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    service_facade_test = REPO_ROOT / "developer" / "tests" / "js" / "serviceFacade.test.js"
-    if service_facade_test.exists():
-        try:
-            completed_service_facade = subprocess.run(
-                ["node", str(service_facade_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                encoding="utf-8"
-            )
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            service_facade_passed = False
-            service_facade_detail = f"执行失败: {output_text.strip()}"
-        else:
-            raw_service_facade_output = (completed_service_facade.stdout or "").strip() or (completed_service_facade.stderr or "").strip()
-            try:
-                service_facade_payload = json.loads(raw_service_facade_output or "{}")
-            except json.JSONDecodeError as parse_error:
-                service_facade_passed = False
-                service_facade_detail = f"输出解析失败: {parse_error}"
-            else:
-                service_facade_passed = service_facade_payload.get("status") == "pass"
-                service_facade_detail = service_facade_payload.get("detail", service_facade_payload)
-        results.append(_format_result("服务门面回归测试", service_facade_passed, service_facade_detail))
-        all_passed &= service_facade_passed
-    else:
-        results.append(_format_result("服务门面回归测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    exam_filter_service_test = REPO_ROOT / "developer" / "tests" / "js" / "examFilterService.test.js"
-    if exam_filter_service_test.exists():
-        try:
-            completed_exam_filter_service = subprocess.run(
-                ["node", str(exam_filter_service_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                encoding="utf-8"
-            )
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            exam_filter_service_passed = False
-            exam_filter_service_detail = f"执行失败: {output_text.strip()}"
-        else:
-            raw_exam_filter_service_output = (completed_exam_filter_service.stdout or "").strip() or (completed_exam_filter_service.stderr or "").strip()
-            try:
-                exam_filter_service_payload = json.loads(raw_exam_filter_service_output or "{}")
-            except json.JSONDecodeError as parse_error:
-                exam_filter_service_passed = False
-                exam_filter_service_detail = f"输出解析失败: {parse_error}"
-            else:
-                exam_filter_service_passed = exam_filter_service_payload.get("status") == "pass"
-                exam_filter_service_detail = exam_filter_service_payload.get("detail", exam_filter_service_payload)
-        results.append(_format_result("ExamFilterService 回归测试", exam_filter_service_passed, exam_filter_service_detail))
-        all_passed &= exam_filter_service_passed
-    else:
-        results.append(_format_result("ExamFilterService 回归测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    practice_core_guard_test = REPO_ROOT / "developer" / "tests" / "js" / "practiceCore.guard.test.js"
-    if practice_core_guard_test.exists():
-        try:
-            completed_practice_core_guard = subprocess.run(
-                ["node", str(practice_core_guard_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                encoding="utf-8"
-            )
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            practice_core_guard_passed = False
-            practice_core_guard_detail = f"执行失败: {output_text.strip()}"
-        else:
-            raw_guard_output = (completed_practice_core_guard.stdout or "").strip() or (completed_practice_core_guard.stderr or "").strip()
-            try:
-                practice_core_guard_payload = json.loads(raw_guard_output or "{}")
-            except json.JSONDecodeError as parse_error:
-                practice_core_guard_passed = False
-                practice_core_guard_detail = f"输出解析失败: {parse_error}"
-            else:
-                practice_core_guard_passed = practice_core_guard_payload.get("status") == "pass"
-                practice_core_guard_detail = practice_core_guard_payload.get("detail", practice_core_guard_payload)
-        results.append(_format_result("PracticeCore 静态守卫", practice_core_guard_passed, practice_core_guard_detail))
-        all_passed &= practice_core_guard_passed
-    else:
-        results.append(_format_result("PracticeCore 静态守卫", False, "测试脚本缺失"))
-        all_passed = False
-
-    practice_record_persistence_test = REPO_ROOT / "developer" / "tests" / "js" / "practiceRecordPersistence.test.js"
-    if practice_record_persistence_test.exists():
-        try:
-            completed_practice_record_persistence = subprocess.run(
-                ["node", str(practice_record_persistence_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                encoding="utf-8"
-            )
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            practice_record_persistence_passed = False
-            practice_record_persistence_detail = f"执行失败: {output_text.strip()}"
-        else:
-            raw_persistence_output = (completed_practice_record_persistence.stdout or "").strip() or (completed_practice_record_persistence.stderr or "").strip()
-            try:
-                practice_record_persistence_payload = json.loads(raw_persistence_output or "{}")
-            except json.JSONDecodeError as parse_error:
-                practice_record_persistence_passed = False
-                practice_record_persistence_detail = f"输出解析失败: {parse_error}"
-            else:
-                practice_record_persistence_passed = practice_record_persistence_payload.get("status") == "pass"
-                practice_record_persistence_detail = practice_record_persistence_payload.get("detail", practice_record_persistence_payload)
-        results.append(_format_result("练习记录持久化删除链路测试", practice_record_persistence_passed, practice_record_persistence_detail))
-        all_passed &= practice_record_persistence_passed
-    else:
-        results.append(_format_result("练习记录持久化删除链路测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    dictionary_service_test = REPO_ROOT / "developer" / "tests" / "js" / "dictionaryService.test.js"
-    if dictionary_service_test.exists():
-        dictionary_test_passed, dictionary_test_payload = _run_json_subprocess(
-            ["node", str(dictionary_service_test)],
-            timeout=30,
-        )
-        if dictionary_test_passed and isinstance(dictionary_test_payload, dict):
-            test_passed = dictionary_test_payload.get("status") == "pass"
-            test_detail = dictionary_test_payload.get("detail", dictionary_test_payload)
-        else:
-            test_passed = False
-            test_detail = dictionary_test_payload
-        results.append(_format_result("阅读高亮本地词典测试", test_passed, test_detail))
-        all_passed &= test_passed
-    else:
-        results.append(_format_result("阅读高亮本地词典测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    practice_core_app_state_sync_test = REPO_ROOT / "developer" / "tests" / "js" / "practiceCoreAppStateSync.test.js"
-    if practice_core_app_state_sync_test.exists():
-        try:
-            completed_practice_core_app_state_sync = subprocess.run(
-                ["node", str(practice_core_app_state_sync_test)],
-                check=True,
-                capture_output=True,
-                text=True,
-                encoding="utf-8"
-            )
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            practice_core_app_state_sync_passed = False
-            practice_core_app_state_sync_detail = f"执行失败: {output_text.strip()}"
-        else:
-            raw_app_state_output = (completed_practice_core_app_state_sync.stdout or "").strip() or (completed_practice_core_app_state_sync.stderr or "").strip()
-            try:
-                practice_core_app_state_sync_payload = json.loads(raw_app_state_output or "{}")
-            except json.JSONDecodeError as parse_error:
-                practice_core_app_state_sync_passed = False
-                practice_core_app_state_sync_detail = f"输出解析失败: {parse_error}"
-            else:
-                practice_core_app_state_sync_passed = practice_core_app_state_sync_payload.get("status") == "pass"
-                practice_core_app_state_sync_detail = practice_core_app_state_sync_payload.get("detail", practice_core_app_state_sync_payload)
-        results.append(_format_result("PracticeCore app.state 同步测试", practice_core_app_state_sync_passed, practice_core_app_state_sync_detail))
-        all_passed &= practice_core_app_state_sync_passed
-    else:
-        results.append(_format_result("PracticeCore app.state 同步测试", False, "测试脚本缺失"))
-        all_passed = False
-
-    # Integration tests
-    deprecated_reading_source_dir = REPO_ROOT / "developer" / "reading-exams"
-    integration_tests = [
-        ("Reading migration snapshot integration test", REPO_ROOT / "developer" / "tests" / "js" / "integration" / "readingMigrationSnapshot.test.js"),
-        ("多套题提交流程集成测试", REPO_ROOT / "developer" / "tests" / "js" / "integration" / "multiSuiteSubmission.test.js"),
-        ("拼写错误收集流程集成测试", REPO_ROOT / "developer" / "tests" / "js" / "integration" / "spellingErrorCollection.test.js"),
-        ("词表切换流程集成测试", REPO_ROOT / "developer" / "tests" / "js" / "integration" / "vocabListSwitching.test.js"),
-        ("Vocab session view flow integration test", REPO_ROOT / "developer" / "tests" / "js" / "integration" / "vocabSessionView.test.js"),
-    ]
-
-    for test_name, test_path in integration_tests:
-        if test_name == "Reading migration snapshot integration test" and not deprecated_reading_source_dir.exists():
-            results.append(
-                _format_result(
-                    test_name,
-                    True,
-                    "显式跳过：developer/reading-exams 目录已废弃，迁移快照用例不再执行",
-                )
-            )
-            continue
-
-        if test_path.exists():
-            try:
-                completed_integration = subprocess.run(
-                    ["node", str(test_path)],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                    encoding="utf-8"
-                )
-            except subprocess.TimeoutExpired:
-                integration_passed = False
-                integration_detail = "执行超时（30秒）"
-            except subprocess.CalledProcessError as exc:
-                output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-                integration_passed = False
-                integration_detail = f"执行失败: {output_text.strip()}"
-            else:
-                raw_integration_output = (completed_integration.stdout or "").strip() or (completed_integration.stderr or "").strip()
-                try:
-                    integration_payload = json.loads(raw_integration_output or "{}")
-                except json.JSONDecodeError as parse_error:
-                    integration_passed = False
-                    integration_detail = f"输出解析失败: {parse_error}"
-                else:
-                    integration_passed = integration_payload.get("status") == "pass"
-                    passed_count = integration_payload.get("passed", 0)
-                    total_count = integration_payload.get("total", 0)
-                    integration_detail = {
-                        "passed": passed_count,
-                        "total": total_count,
-                        "detail": integration_payload.get("detail", "")
-                    }
-            results.append(_format_result(test_name, integration_passed, integration_detail))
-            all_passed &= integration_passed
-        else:
-            results.append(_format_result(test_name, False, "测试脚本缺失"))
-            all_passed = False
-
-    reading_question_audit_script = REPO_ROOT / "developer" / "tests" / "e2e" / "reading_question_audit.py"
-    if reading_question_audit_script.exists():
-        try:
-            completed_reading_audit = subprocess.run(
-                [sys.executable, str(reading_question_audit_script), "--mode", "quick"],
-                check=True,
-                capture_output=True,
-                text=True,
-                timeout=480,
-                encoding="utf-8"
-            )
-        except subprocess.TimeoutExpired:
-            reading_audit_passed = False
-            reading_audit_detail = "执行超时（480秒）"
-        except subprocess.CalledProcessError as exc:
-            output_text = (exc.stdout or "") + (exc.stderr or "") + str(exc)
-            reading_audit_passed = False
-            reading_audit_detail = f"执行失败: {output_text.strip()}"
-        else:
-            output_text = (completed_reading_audit.stdout or "").strip() or (completed_reading_audit.stderr or "").strip()
-            reading_report_path = REPO_ROOT / "developer" / "tests" / "e2e" / "reports" / "reading-question-audit-quick.json"
-            if reading_report_path.exists():
-                try:
-                    payload = json.loads(reading_report_path.read_text(encoding="utf-8"))
-                except json.JSONDecodeError as parse_error:
-                    reading_audit_passed = False
-                    reading_audit_detail = f"报告解析失败: {parse_error}"
-                else:
-                    summary = payload.get("summary", {}) if isinstance(payload, dict) else {}
-                    reading_audit_passed = summary.get("exitCode") == 0
-                    reading_audit_detail = {
-                        "staticAudited": summary.get("staticAudited", 0),
-                        "staticFailed": summary.get("staticFailed", 0),
-                        "uiAudited": summary.get("uiAudited", 0),
-                        "uiFailed": summary.get("uiFailed", 0),
-                        "report": "developer/tests/e2e/reports/reading-question-audit-quick.json",
-                    }
-            else:
-                reading_audit_passed = False
-                reading_audit_detail = f"缺少报告文件，输出: {output_text}"
-
-        results.append(_format_result("Reading 逐题自动排查（quick）", reading_audit_passed, reading_audit_detail))
-        all_passed &= reading_audit_passed
-    else:
-        results.append(_format_result("Reading 逐题自动排查（quick）", False, "测试脚本缺失"))
-        all_passed = False
-
-    pdf_audit_script = REPO_ROOT / "developer" / "tests" / "ci" / "audit_pdf_checklist_and_mona.py"
-    if pdf_audit_script.exists():
-        pdf_audit_passed, pdf_audit_detail = _run_json_subprocess(
-            [sys.executable, str(pdf_audit_script)],
-            timeout=120,
-        )
-
-        results.append(_format_result("PDF 对账与回归审计", pdf_audit_passed, pdf_audit_detail))
-        all_passed &= pdf_audit_passed
-    else:
-        results.append(_format_result("PDF 对账与回归审计", False, "测试脚本缺失"))
-        all_passed = False
-
-    reading_integrity_script = REPO_ROOT / "developer" / "tests" / "ci" / "check_reading_data_integrity.py"
-    if reading_integrity_script.exists():
-        reading_integrity_passed, reading_integrity_detail = _run_json_subprocess(
-            [sys.executable, str(reading_integrity_script)],
-            timeout=30,
-            parse_mode="last-line",
-        )
-
-        results.append(_format_result("Reading 数据完整性校验", reading_integrity_passed, reading_integrity_detail))
-        all_passed &= reading_integrity_passed
-    else:
-        results.append(_format_result("Reading 数据完整性校验", False, "测试脚本缺失"))
-        all_passed = False
-
-    checklist_consistency_script = REPO_ROOT / "developer" / "tests" / "ci" / "check_checklist_consistency.py"
-    if checklist_consistency_script.exists():
-        checklist_env = os.environ.copy()
-        checklist_env["CHECKLIST_IGNORE_RUN_STATIC_CLAIM"] = "1"
-        checklist_consistency_ok, checklist_payload_or_error = _run_json_subprocess(
-            [sys.executable, str(checklist_consistency_script)],
-            timeout=30,
-            env=checklist_env,
-        )
-        if not checklist_consistency_ok:
-            checklist_consistency_passed = False
-            checklist_consistency_detail = checklist_payload_or_error
-        else:
-            checklist_payload = checklist_payload_or_error if isinstance(checklist_payload_or_error, dict) else {}
-            checklist_consistency_passed = (
-                not checklist_payload.get("summaryMismatches")
-                and not checklist_payload.get("claimMismatches")
-                and not checklist_payload.get("freshnessMismatches")
-            )
-            checklist_consistency_detail = checklist_payload
-
-        results.append(_format_result("Checklist 对账一致性校验", checklist_consistency_passed, checklist_consistency_detail))
-        all_passed &= checklist_consistency_passed
-    else:
-        results.append(_format_result("Checklist 对账一致性校验", False, "测试脚本缺失"))
-        all_passed = False
+    scheduled_results, scheduled_passed = _run_scheduled_checks(
+        _declare_subprocess_checks(),
+        jobs,
+        use_node_host=use_node_host,
+        cache=_StaticCheckCache(STATIC_CHECK_CACHE_PATH) if use_cache else None,
+    )
+    results.extend(scheduled_results)
+    all_passed &= scheduled_passed
 
     return results, all_passed
 
@@ -2626,7 +2383,30 @@ def main() -> int:
         import io
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
-    results, all_passed = run_checks()
+    parser = argparse.ArgumentParser(description="IELTS 静态测试套件")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_CHECK_JOBS,
+        help=f"子进程检查的并发数，1 为串行（默认 {DEFAULT_CHECK_JOBS}）",
+    )
+    parser.add_argument(
+        "--no-node-host",
+        action="store_true",
+        help="每个 node 测试单独起进程，不使用常驻测试宿主",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="忽略结果缓存，强制重跑全部子进程检查",
+    )
+    args = parser.parse_args()
+
+    results, all_passed = run_checks(
+        jobs=args.jobs,
+        use_node_host=not args.no_node_host,
+        use_cache=not args.no_cache,
+    )
 
     report = {
         "generatedAt": datetime.now(timezone.utc).isoformat(),
@@ -2634,9 +2414,8 @@ def main() -> int:
         "results": results,
     }
 
-    report_dir = REPO_ROOT / "developer" / "tests" / "e2e" / "reports"
-    report_dir.mkdir(parents=True, exist_ok=True)
-    report_path = report_dir / "static-ci-report.json"
+    E2E_REPORT_DIR.mkdir(parents=True, exist_ok=True)
+    report_path = E2E_REPORT_DIR / "static-ci-report.json"
     report_text = json.dumps(report, ensure_ascii=False, indent=2)
     report_path.write_text(report_text + "\n", encoding="utf-8")
 
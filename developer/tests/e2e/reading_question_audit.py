@@ -168,6 +168,42 @@ def _load_dataset(exam_id: str) -> Dict[str, Any]:
     return payload
 
 
+def _load_all_datasets() -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+    """一次 node 进程批量导出全部题目（NDJSON 逐行解析），返回 (datasets, 单题错误)。"""
+    datasets: Dict[str, Dict[str, Any]] = {}
+    errors: Dict[str, str] = {}
+    cmd = ["node", str(NODE_EXPORTER), "--all"]
+    process = subprocess.Popen(
+        cmd,
+        cwd=str(REPO_ROOT),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    assert process.stdout is not None
+    for raw_line in process.stdout:
+        line = raw_line.strip()
+        if not line:
+            continue
+        try:
+            payload = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise RuntimeError(f"command_output_not_json: {' '.join(cmd)} :: {exc}") from exc
+        exam_id = str(payload.get("examId") or "") if isinstance(payload, dict) else ""
+        if not exam_id:
+            continue
+        if payload.get("error"):
+            errors[exam_id] = str(payload["error"])
+        else:
+            datasets[exam_id] = payload
+    stderr = process.stderr.read() if process.stderr is not None else ""
+    if process.wait() != 0:
+        raise RuntimeError(f"command_failed: {' '.join(cmd)} :: {stderr.strip()}")
+    return datasets, errors
+
+
 def _extract_html_fragments(dataset: Dict[str, Any]) -> List[Tuple[str, str]]:
     fragments: List[Tuple[str, str]] = []
     intro = dataset.get("metaQuestionIntroHtml")
@@ -898,6 +934,49 @@ async def _audit_single_exam_ui(
     return result
 
 
+async def _new_audit_context(browser: Browser):
+    context = await browser.new_context(ignore_https_errors=True)
+    # 先打开 index 验证 file:// 环境初始化（与既有 E2E 一致）
+    bootstrap_page = await context.new_page()
+    await bootstrap_page.goto(INDEX_URL, wait_until="load")
+    await bootstrap_page.close()
+    return context
+
+
+def _ui_worker_failure(exam_id: str, exc: BaseException) -> Dict[str, Any]:
+    return {
+        "examId": exam_id,
+        "status": "fail",
+        "error": f"ui_worker_failed:{type(exc).__name__}:{exc}",
+        "failureType": "worker_error",
+        "durationSec": 0.0,
+    }
+
+
+async def _ui_worker(
+    browser: Browser,
+    queue: "asyncio.Queue[Tuple[int, str, Dict[str, Any]]]",
+    slots: List[Optional[Dict[str, Any]]],
+    total: int,
+) -> None:
+    """每个 worker 独占一个 context，避免并发页面共享 localStorage 互相污染。"""
+    context = await _new_audit_context(browser)
+    try:
+        while True:
+            try:
+                position, exam_id, dataset = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            log_step(f"UI审计 {position + 1}/{total}: {exam_id}")
+            try:
+                slots[position] = await _audit_single_exam_ui(context, exam_id, dataset, SCREENSHOT_DIR)
+            except Exception as exc:
+                # 单题的意外异常只记为该题失败，worker 继续处理队列
+                slots[position] = _ui_worker_failure(exam_id, exc)
+    finally:
+        await context.close()
+
+
 def _make_markdown_report(report: Dict[str, Any]) -> str:
     summary = report.get("summary", {})
     static_failures = report.get("staticFailures", [])
@@ -907,6 +986,7 @@ def _make_markdown_report(report: Dict[str, Any]) -> str:
         "# Reading Question Audit",
         "",
         f"- Mode: `{report.get('mode', '')}`",
+        f"- Concurrency: `{report.get('concurrency', 1)}`",
         f"- Generated: `{report.get('generatedAt', '')}`",
         f"- Static audited: `{summary.get('staticAudited', 0)}`",
         f"- Static passed: `{summary.get('staticPassed', 0)}`",
@@ -917,6 +997,7 @@ def _make_markdown_report(report: Dict[str, Any]) -> str:
         f"- Static pass rate: `{summary.get('staticPassRate', 0)}%`",
         f"- UI pass rate: `{summary.get('uiPassRate', 0)}%`",
         f"- UI average duration: `{summary.get('uiAverageDurationSec', 0)}s`",
+        f"- UI wall clock: `{summary.get('uiWallClockSec', 0)}s`",
         f"- Exit code: `{summary.get('exitCode', '')}`",
         "",
     ]
@@ -952,7 +1033,7 @@ def _make_markdown_report(report: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-async def run_audit(mode: str) -> int:
+async def run_audit(mode: str, concurrency: int = 1) -> int:
     REPORT_DIR.mkdir(parents=True, exist_ok=True)
     SCREENSHOT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -969,10 +1050,21 @@ async def run_audit(mode: str) -> int:
     static_results: List[Dict[str, Any]] = []
 
     log_step("阶段A: 静态结构审计开始")
+    batch_errors: Dict[str, str] = {}
+    try:
+        datasets, batch_errors = _load_all_datasets()
+        log_step(f"批量导出题目数据: {len(datasets)} 成功, {len(batch_errors)} 失败")
+    except Exception as exc:
+        log_step(f"批量导出失败，回退逐题导出: {exc}", "WARNING")
+
     for index, exam_id in enumerate(all_exam_ids, start=1):
         try:
-            dataset = _load_dataset(exam_id)
-            datasets[exam_id] = dataset
+            if exam_id in batch_errors:
+                raise RuntimeError(batch_errors[exam_id])
+            dataset = datasets.get(exam_id)
+            if dataset is None:
+                dataset = _load_dataset(exam_id)
+                datasets[exam_id] = dataset
             script_rel = str(dataset.get("script") or entries_by_exam[exam_id].get("script") or "")
             script_path = GENERATED_READING_DIR / script_rel.replace("./", "")
             if not script_path.exists():
@@ -1005,54 +1097,66 @@ async def run_audit(mode: str) -> int:
 
     log_step(f"阶段A完成: 失败 {len(static_failures)} / {len(all_exam_ids)}", "SUCCESS" if not static_failures else "WARNING")
 
-    log_step("阶段B: UI真值回放审计开始")
+    log_step(f"阶段B: UI真值回放审计开始（并发 {concurrency}）")
     ui_results: List[Dict[str, Any]] = []
     ui_failures: List[Dict[str, Any]] = []
     flaky_candidates: List[Dict[str, Any]] = []
 
+    # 结果按 ui_exam_ids 的位置回填，保证并发执行时报告顺序稳定
+    ui_slots: List[Optional[Dict[str, Any]]] = [None] * len(ui_exam_ids)
+    queue: "asyncio.Queue[Tuple[int, str, Dict[str, Any]]]" = asyncio.Queue()
+    for position, exam_id in enumerate(ui_exam_ids):
+        dataset = datasets.get(exam_id)
+        if not dataset:
+            try:
+                dataset = _load_dataset(exam_id)
+                datasets[exam_id] = dataset
+            except Exception as exc:
+                ui_slots[position] = {
+                    "examId": exam_id,
+                    "status": "fail",
+                    "error": f"dataset_load_failed:{exc}",
+                    "failureType": "dataset_load_failed",
+                    "durationSec": 0.0,
+                }
+                continue
+        queue.put_nowait((position, exam_id, dataset))
+
+    ui_started = datetime.now()
     async with async_playwright() as playwright_obj:
         browser = await _launch_browser(playwright_obj)
-        context = await browser.new_context(ignore_https_errors=True)
-        # 先打开 index 验证 file:// 环境初始化（与既有 E2E 一致）
-        bootstrap_page = await context.new_page()
-        await bootstrap_page.goto(INDEX_URL, wait_until="load")
-        await bootstrap_page.close()
-
-        for index, exam_id in enumerate(ui_exam_ids, start=1):
-            dataset = datasets.get(exam_id)
-            if not dataset:
-                try:
-                    dataset = _load_dataset(exam_id)
-                    datasets[exam_id] = dataset
-                except Exception as exc:
-                    fail_result = {
-                        "examId": exam_id,
-                        "status": "fail",
-                        "error": f"dataset_load_failed:{exc}",
-                        "failureType": "dataset_load_failed",
-                        "durationSec": 0.0,
-                    }
-                    ui_results.append(fail_result)
-                    ui_failures.append(fail_result)
-                    continue
-
-            log_step(f"UI审计 {index}/{len(ui_exam_ids)}: {exam_id}")
-            result = await _audit_single_exam_ui(context, exam_id, dataset, SCREENSHOT_DIR)
-            ui_results.append(result)
-            if result.get("status") != "pass":
-                ui_failures.append(result)
-                if result.get("failureType") in {"timeout", "playwright_error"}:
-                    flaky_candidates.append({
-                        "examId": exam_id,
-                        "error": result.get("error", ""),
-                        "failureType": result.get("failureType", ""),
-                    })
-
-        await context.close()
-        await browser.close()
+        try:
+            worker_count = max(1, min(concurrency, queue.qsize()))
+            worker_outcomes = await asyncio.gather(*[
+                _ui_worker(browser, queue, ui_slots, len(ui_exam_ids))
+                for _ in range(worker_count)
+            ], return_exceptions=True)
+        finally:
+            await browser.close()
+    ui_wall_clock_sec = round((datetime.now() - ui_started).total_seconds(), 3)
+
+    worker_errors = [outcome for outcome in worker_outcomes if isinstance(outcome, BaseException)]
+    for error in worker_errors:
+        log_step(f"UI审计 worker 异常退出: {type(error).__name__}: {error}", "ERROR")
+    # worker 异常退出（例如 context 创建失败）时未处理的题目同样记为失败，不能被当作通过
+    lost_error: BaseException = worker_errors[0] if worker_errors else RuntimeError("no result recorded")
+    for position, result in enumerate(ui_slots):
+        if result is None:
+            ui_slots[position] = _ui_worker_failure(ui_exam_ids[position], lost_error)
+
+    for result in ui_slots:
+        ui_results.append(result)
+        if result.get("status") != "pass":
+            ui_failures.append(result)
+            if result.get("failureType") in {"timeout", "playwright_error"}:
+                flaky_candidates.append({
+                    "examId": result.get("examId", ""),
+                    "error": result.get("error", ""),
+                    "failureType": result.get("failureType", ""),
+                })
 
     static_passed = len(all_exam_ids) - len(static_failures)
-    ui_passed = len(ui_exam_ids) - len(ui_failures)
+    ui_passed = sum(1 for result in ui_results if result.get("status") == "pass")
     static_pass_rate = round((static_passed / len(all_exam_ids)) * 100, 2) if all_exam_ids else 0.0
     ui_pass_rate = round((ui_passed / len(ui_exam_ids)) * 100, 2) if ui_exam_ids else 0.0
     ui_total_duration_sec = round(sum(float(item.get("durationSec", 0.0) or 0.0) for item in ui_results), 3)
@@ -1081,6 +1185,7 @@ async def run_audit(mode: str) -> int:
     report: Dict[str, Any] = {
         "generatedAt": _now_iso(),
         "mode": mode,
+        "concurrency": concurrency,
         "summary": {
             "staticAudited": len(all_exam_ids),
             "staticPassed": static_passed,
@@ -1092,6 +1197,7 @@ async def run_audit(mode: str) -> int:
             "uiPassRate": ui_pass_rate,
             "uiTotalDurationSec": ui_total_duration_sec,
             "uiAverageDurationSec": ui_average_duration_sec,
+            "uiWallClockSec": ui_wall_clock_sec,
             "staticIssueDistribution": dict(static_issue_distribution),
             "uiFailureDistribution": dict(ui_failure_distribution),
             "uiAssertionDistribution": dict(ui_assertion_distribution),
@@ -1126,10 +1232,18 @@ def main() -> int:
         default="quick",
         help="quick: PR/本地快速；full: 全量",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="阶段B 并发页面数（每个页面独立 context），默认 1 即串行",
+    )
     args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency 必须 >= 1")
 
     try:
-        return asyncio.run(run_audit(args.mode))
+        return asyncio.run(run_audit(args.mode, args.concurrency))
     except Exception:
         traceback.print_exc()
         return EXIT_ERROR
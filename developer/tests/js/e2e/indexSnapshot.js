@@ -321,6 +321,12 @@ window.__APP_INDEX_HTML_SNAPSHOT__ = `<!doctype html>
                                 <option value="difficulty-desc">
                                     难度高→低
                                 </option>
+                                <option value="length-desc">
+                                    篇幅长→短
+                                </option>
+                                <option value="length-asc">
+                                    篇幅短→长
+                                </option>
                             </select>
                             <div class="browse-sort-icon">
                                 <svg
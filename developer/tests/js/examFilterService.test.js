@@ -41,8 +41,8 @@ function isForwardOnlySource(source) {
     return functionCount <= 1 && (directAliasPattern.test(code) || objectAssignAliasPattern.test(code));
 }
 
-function createHarness() {
-    const windowStub = {};
+function createHarness(globals = {}) {
+    const windowStub = Object.assign({}, globals);
     const silentConsole = { log() {}, warn() {}, error() {}, info() {} };
     const sandbox = { window: windowStub, console: silentConsole };
     sandbox.globalThis = sandbox.window;
@@ -164,6 +164,51 @@ function testDifficultySort(service) {
     assert.strictEqual(result[result.length - 1].id, 'freq-b', '缺少 difficultyScore 的题目应排在最后');
 }
 
+function createSummaryTable() {
+    return {
+        ids: ['p1-09', 'r1-other', 'p2', 'freq-a'],
+        kinds: ['matching', 'single_choice', 'true_false_not_given'],
+        columns: {
+            questionCount: [13, 13, 14, 13],
+            kindMask: [5, 2, 1, 4],
+            wordCount: [900, 700, 1100, 800],
+            answerCount: [13, 13, 14, 13]
+        }
+    };
+}
+
+function testSummaryLengthSortAndKindFilter() {
+    const service = createHarness({ __READING_EXAM_SUMMARY__: createSummaryTable() });
+    const summary = service.getExamSummary('p1-09');
+    assert.deepStrictEqual(JSON.parse(JSON.stringify(summary)), {
+        questionCount: 13,
+        kinds: ['matching', 'true_false_not_given'],
+        wordCount: 900,
+        answerCount: 13
+    });
+    assert.strictEqual(service.getExamSummary('l1'), null, '没有摘要的题目应返回 null');
+
+    const longest = service.filterExams(createExams(), { activeCategory: 'all', activeExamType: 'all', sortMode: 'length-desc' });
+    assert.strictEqual(longest.slice(0, 4).map((exam) => exam.id).join(','), 'p2,p1-09,freq-a,r1-other', '篇幅降序应按摘要词数排序');
+    assert(longest.slice(4).every((exam) => service.getExamSummary(exam.id) === null), '缺少摘要的题目应排在最后');
+    const shortest = service.filterExams(createExams(), { activeCategory: 'all', activeExamType: 'reading', sortMode: 'length-asc' });
+    assert.strictEqual(shortest[0].id, 'r1-other', '篇幅升序应把词数最少的题目放在最前');
+
+    const tfng = service.filterExams(createExams(), { activeCategory: 'all', activeExamType: 'all', questionKind: 'true_false_not_given' });
+    assert.strictEqual(tfng.map((exam) => exam.id).sort().join(','), 'freq-a,p1-09', '题型筛选应按摘要题型命中');
+
+    const manifestHarness = createHarness();
+    const manifestContext = vm.createContext({ window: null, console });
+    manifestContext.window = manifestContext;
+    loadScript('assets/generated/reading-exams/manifest.js', manifestContext);
+    const table = manifestContext.__READING_EXAM_SUMMARY__;
+    assert(table && Array.isArray(table.ids) && table.ids.length > 0, 'manifest.js 应发布摘要表');
+    Object.keys(table.columns).forEach((name) => {
+        assert.strictEqual(table.columns[name].length, table.ids.length, `摘要列 ${name} 长度应与 ids 一致`);
+    });
+    assert.strictEqual(manifestHarness.getExamSummary(table.ids[0]), null, '未加载 manifest 时不应有摘要');
+}
+
 function testLoadExamListBindsBrowseControls() {
     const harness = createExamActionsHarness();
     assert(harness.window.ExamActions, 'ExamActions 应该挂到 window');
@@ -200,6 +245,7 @@ function main() {
     testFallbackCategoryInFrequencyMode(service);
     testFrequencySort(service);
     testDifficultySort(service);
+    testSummaryLengthSortAndKindFilter();
     testLoadExamListBindsBrowseControls();
     testInvalidInput(service);
     testExamFilterHostIsNotForwardOnlyStub();
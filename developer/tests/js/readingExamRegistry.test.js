@@ -0,0 +1,141 @@
+#!/usr/bin/env node
+'use strict';
+
+import assert from 'assert';
+import fs from 'fs';
+import path from 'path';
+import vm from 'vm';
+import { fileURLToPath } from 'url';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = path.dirname(__filename);
+const repoRoot = path.resolve(__dirname, '../../..');
+const examDir = 'assets/generated/reading-exams';
+
+function loadScript(relativePath, context) {
+    const source = fs.readFileSync(path.join(repoRoot, relativePath), 'utf8');
+    vm.runInContext(source, context, { filename: relativePath });
+}
+
+function createContext() {
+    const context = { console, window: null, globalThis: null };
+    context.window = context;
+    context.globalThis = context;
+    return vm.createContext(context);
+}
+
+function createPageContext(loaded) {
+    const context = createContext();
+    loadScript('js/runtime/readingExamRegistry.js', context);
+    loadScript(`${examDir}/manifest.js`, context);
+    context.__READING_EXAM_DATA__.configureChunks({
+        baseUrl: `${examDir}/`,
+        loadScript(url) {
+            loaded.push(url);
+            return new Promise((resolve) => setTimeout(() => {
+                loadScript(path.normalize(url), context);
+                resolve(true);
+            }, 0));
+        }
+    });
+    return context;
+}
+
+function plain(value) {
+    // vm 上下文里的对象原型不同，比较前转成当前上下文的普通对象
+    return JSON.parse(JSON.stringify(value));
+}
+
+function loadFullPayload(examId) {
+    const context = createContext();
+    loadScript('js/runtime/readingExamRegistry.js', context);
+    loadScript(`${examDir}/${examId}.js`, context);
+    return plain(context.__READING_EXAM_DATA__.get(examId));
+}
+
+async function main() {
+    const loaded = [];
+    const context = createPageContext(loaded);
+    const registry = context.__READING_EXAM_DATA__;
+    const manifest = context.__READING_EXAM_MANIFEST__;
+    assert.strictEqual(context.__READING_EXAM_CHUNKS__, undefined, '分块索引不应随 manifest.js 启动加载');
+    const withScript = Object.keys(manifest).filter((id) => manifest[id].script);
+
+    const examId = withScript[0];
+    const full = loadFullPayload(examId);
+
+    // 只取答案：先加载一次分块索引，再只加载 answers 分块，并发请求共用同一次加载
+    const [answers, again] = await Promise.all([
+        registry.loadPart(examId, 'answers'),
+        registry.loadPart(examId, 'answers')
+    ]);
+    assert.deepStrictEqual(loaded, [`${examDir}/chunks/index.js`, `${examDir}/./chunks/${examId}.answers.js`]);
+    const chunks = context.__READING_EXAM_CHUNKS__;
+    assert.deepStrictEqual(Object.keys(chunks.parts), ['meta', 'passage', 'questions', 'answers']);
+    assert.deepStrictEqual(Object.keys(chunks.bytes).sort(), withScript.map((id) => manifest[id].dataKey).sort());
+    assert.deepStrictEqual(plain(answers), { answerKey: full.answerKey });
+    assert.deepStrictEqual(plain(again), plain(answers));
+    assert.strictEqual(registry.has(examId), false, '缺少分块时不应视为完整题目');
+    assert.strictEqual(registry.get(examId), null);
+
+    // 补齐其余分块后拼回完整题目
+    const merged = await registry.loadParts(examId);
+    assert.strictEqual(loaded.length, 5);
+    assert.deepStrictEqual(plain(merged), full);
+    assert.strictEqual(registry.has(examId), true);
+    assert.deepStrictEqual(plain(registry.get(examId)), full);
+    assert(registry.keys().includes(examId));
+
+    // 整包注册的题目直接按字段切出分块，不再加载脚本
+    const otherId = withScript[1];
+    registry.register(otherId, loadFullPayload(otherId));
+    const questions = await registry.loadPart(otherId, 'questions');
+    assert.strictEqual(loaded.length, 5);
+    assert.deepStrictEqual(plain(Object.keys(questions)), plain(chunks.parts.questions));
+    assert(Array.isArray(questions.questionGroups));
+    assert.strictEqual(questions.answerKey, undefined);
+
+    await assert.rejects(registry.loadPart('p9-missing-000', 'passage'), /reading_exam_chunk_missing/);
+
+    let failures = 0;
+    registry.configureChunks({
+        loadScript() {
+            failures += 1;
+            return Promise.reject(new Error('offline'));
+        }
+    });
+    const thirdId = withScript[2];
+    await assert.rejects(registry.loadPart(thirdId, 'meta'), /offline/);
+    await assert.rejects(registry.loadPart(thirdId, 'meta'), /offline/);
+    assert.strictEqual(failures, 2, '加载失败后应允许重试');
+
+    // 分块索引加载失败同样可以重试
+    const offline = [];
+    const fresh = createPageContext(offline).__READING_EXAM_DATA__;
+    fresh.configureChunks({
+        loadScript(url) {
+            offline.push(url);
+            return Promise.reject(new Error('offline'));
+        }
+    });
+    await assert.rejects(fresh.loadPart(examId, 'answers'), /offline/);
+    await assert.rejects(fresh.loadChunkIndex(), /offline/);
+    assert.deepStrictEqual(offline, [`${examDir}/chunks/index.js`, `${examDir}/chunks/index.js`]);
+
+    process.stdout.write(JSON.stringify({
+        status: 'pass',
+        detail: {
+            examId,
+            chunkedExams: Object.keys(chunks.bytes).length,
+            answerChunkBytes: chunks.bytes[examId][3]
+        }
+    }));
+}
+
+main().catch((error) => {
+    process.stdout.write(JSON.stringify({
+        status: 'fail',
+        detail: error && error.stack ? error.stack : String(error)
+    }));
+    process.exitCode = 1;
+});
@@ -0,0 +1,162 @@
+#!/usr/bin/env node
+'use strict';
+
+import assert from 'assert';
+import fs from 'fs';
+import path from 'path';
+import vm from 'vm';
+import { fileURLToPath } from 'url';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = path.dirname(__filename);
+const repoRoot = path.resolve(__dirname, '../../..');
+const searchIndexScript = 'assets/generated/reading-exams/search/index.js';
+
+function loadScript(relativePath, context) {
+    const source = fs.readFileSync(path.join(repoRoot, relativePath), 'utf8');
+    vm.runInContext(source, context, { filename: relativePath });
+}
+
+function createContext(groups) {
+    const context = {
+        console: { log() { }, warn() { }, error: console.error },
+        setTimeout,
+        document: { getElementById: () => null },
+        AppLazyLoader: {
+            ensureGroup(name) {
+                groups.push(name);
+                return new Promise((resolve) => setTimeout(() => {
+                    loadScript(searchIndexScript, context);
+                    resolve();
+                }, 0));
+            }
+        }
+    };
+    context.window = context;
+    context.globalThis = context;
+    vm.createContext(context);
+    loadScript('js/app/browseController.js', context);
+    return context;
+}
+
+function ids(hits) {
+    return hits.map((hit) => hit.id).join(',');
+}
+
+function extractFunction(source, name) {
+    const match = source.match(new RegExp(`\\nfunction ${name}\\s*\\([^)]*\\)\\s*\\{[\\s\\S]*?\\n\\}\\n`));
+    assert(match, `main.js 应保留 ${name}`);
+    return match[0];
+}
+
+// main.js 的 getReadingFullTextScores：索引加载完成后按去空白的查询判断是否重新搜索
+async function testMainRerunsSearchAfterIndexLoads() {
+    const source = fs.readFileSync(path.join(repoRoot, 'js/main.js'), 'utf8').replace(/\r\n/g, '\n');
+    const input = { value: '  tea history ' };
+    const searches = [];
+    const reruns = [];
+    let ready = false;
+    const context = {
+        String,
+        Map,
+        document: {
+            getElementById: (id) => (id === 'exam-search-input' ? input : null),
+            querySelector: () => null
+        },
+        performSearch: (query) => reruns.push(query),
+        window: {}
+    };
+    context.window.ReadingExamSearch = {
+        isReady: () => ready,
+        ensureIndex: () => {
+            ready = true;
+            return Promise.resolve(true);
+        },
+        search: (query) => {
+            searches.push(query);
+            return [{ id: 'p1', score: 2 }];
+        }
+    };
+    vm.createContext(context);
+    vm.runInContext(
+        extractFunction(source, 'getBrowseSearchQuery') + extractFunction(source, 'getReadingFullTextScores'),
+        context
+    );
+
+    // refreshBrowseResults 传入去空白后的查询，输入框里仍带首尾空格
+    assert.strictEqual(context.getReadingFullTextScores('tea history'), null);
+    await new Promise((resolve) => setTimeout(resolve, 0));
+    assert.deepStrictEqual(reruns, ['tea history'], '索引加载后应按去空白的查询重新搜索');
+
+    const scores = context.getReadingFullTextScores('tea history');
+    assert.strictEqual(scores.get('p1'), 2);
+    assert.strictEqual(searches[0], '  tea history ', '同一输入应按输入框原文检索，末词前缀规则保持一致');
+
+    input.value = 'bees';
+    context.getReadingFullTextScores('bee');
+    assert.strictEqual(searches[1], 'bee', '输入已变化时使用调用方传入的查询');
+}
+
+async function main() {
+    const groups = [];
+    const context = createContext(groups);
+    const search = context.ReadingExamSearch;
+
+    // 与 build_reading_exam_search_index.py 的 tokenize 保持一致（Python 测试使用同一组样例）
+    assert.strictEqual(
+        search.tokenize("The Kiwi's Studies of ＴＥＡ, 1990s bees 茶叶 a I").join('|'),
+        'kiwi|study|tea|1990|bee|茶|叶'
+    );
+
+    assert.strictEqual(search.isReady(), false);
+    assert.strictEqual(search.search('tea'), null, '索引未加载时应返回 null');
+    const [ready, again] = await Promise.all([search.ensureIndex(), search.ensureIndex()]);
+    assert.strictEqual(ready && again, true);
+    assert.strictEqual(groups.join(','), 'reading-search-index', '并发调用只加载一次索引组');
+
+    const index = context.__READING_EXAM_SEARCH_INDEX__;
+    const terms = index.terms.map((row) => row[0]);
+    assert.deepStrictEqual(terms.slice().sort(), terms, '词项应按字典序排列');
+
+    const tea = search.search('tea');
+    assert(tea.length > 0);
+    assert.strictEqual(tea[0].id, 'p1-high-01', '标题命中的茶叶简史应排第一');
+    assert.strictEqual(ids(search.search('茶叶')).split(',')[0], 'p1-high-01');
+    for (let i = 1; i < tea.length; i += 1) {
+        assert(tea[i - 1].score >= tea[i].score, '结果应按得分降序');
+    }
+
+    // 多词查询要求全部命中
+    const teaHistory = search.search('tea history ');
+    const teaIds = new Set(tea.map((hit) => hit.id));
+    const historyIds = new Set(search.search('history ').map((hit) => hit.id));
+    assert(teaHistory.length > 0);
+    assert(teaHistory.every((hit) => teaIds.has(hit.id) && historyIds.has(hit.id)));
+
+    // 最后一个词按前缀匹配，结尾有空格时按完整词匹配
+    const prefixHits = search.search('histor');
+    assert(prefixHits.length >= historyIds.size);
+    assert.strictEqual(search.search('histor ').length, 0);
+    assert.strictEqual(search.search('the of'), null, '只有停用词时应返回 null');
+    assert.strictEqual(search.search('tea', { limit: 3 }).length, 3);
+
+    await testMainRerunsSearchAfterIndexLoads();
+
+    process.stdout.write(JSON.stringify({
+        status: 'pass',
+        detail: {
+            exams: index.ids.length,
+            terms: terms.length,
+            teaHits: tea.length,
+            teaHistoryHits: teaHistory.length
+        }
+    }));
+}
+
+main().catch((error) => {
+    process.stdout.write(JSON.stringify({
+        status: 'fail',
+        detail: error && error.stack ? error.stack : String(error)
+    }));
+    process.exitCode = 1;
+});
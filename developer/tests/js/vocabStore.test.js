@@ -27,7 +27,7 @@ function createLocalStorage(seed = {}) {
     };
 }
 
-function loadVocabStore({ embeddedWords, storageSeed }) {
+function createVocabSandbox({ embeddedWords, storageSeed, windowExtras = {} }) {
     const quietConsole = {
         log() {},
         warn() {},
@@ -39,7 +39,8 @@ function loadVocabStore({ embeddedWords, storageSeed }) {
         __EMBEDDED_WORDLISTS__: {
             ielts_core: embeddedWords || []
         },
-        location: { protocol: 'file:' }
+        location: { protocol: 'file:' },
+        ...windowExtras
     };
     const sandbox = {
         window: windowStub,
@@ -62,7 +63,18 @@ function loadVocabStore({ embeddedWords, storageSeed }) {
     const context = vm.createContext(sandbox);
     const source = fs.readFileSync(path.join(repoRoot, 'js/core/vocabStore.js'), 'utf8');
     vm.runInContext(source, context, { filename: 'js/core/vocabStore.js' });
-    return sandbox.window.VocabStore;
+    return {
+        store: sandbox.window.VocabStore,
+        window: sandbox.window,
+        loadScript(relativePath) {
+            const script = fs.readFileSync(path.join(repoRoot, relativePath), 'utf8');
+            vm.runInContext(script, context, { filename: relativePath });
+        }
+    };
+}
+
+function loadVocabStore(options) {
+    return createVocabSandbox(options).store;
 }
 
 async function testSpellingErrorUsesEmbeddedLexiconMeaning() {
@@ -201,6 +213,58 @@ async function testSpellingErrorMetadataSurvivesStudyUpdates() {
     assert.strictEqual(updated.canonicalAnswer, 'green garden');
 }
 
+async function testReadingCoveragePicksPassagesForDueWords() {
+    const coverageScript = 'assets/generated/reading-exams/vocab/ielts_core.coverage.js';
+    const groups = [];
+    const sandbox = createVocabSandbox({
+        embeddedWords: [],
+        windowExtras: {
+            AppLazyLoader: {
+                ensureGroup(name) {
+                    groups.push(name);
+                    return new Promise((resolve) => setTimeout(() => {
+                        sandbox.loadScript(coverageScript);
+                        resolve();
+                    }, 0));
+                }
+            }
+        }
+    });
+    const vocabStore = sandbox.store;
+    assert.strictEqual(vocabStore.getReadingExamsForWord('emperor'), null, '索引未加载时应返回 null');
+    assert.strictEqual(vocabStore.pickReadingPassages(['emperor']), null);
+
+    const [ready, again] = await Promise.all([vocabStore.ensureReadingCoverage(), vocabStore.ensureReadingCoverage()]);
+    assert.strictEqual(ready && again, true);
+    assert.strictEqual(groups.join(','), 'reading-vocab-coverage', '并发调用只加载一次覆盖索引');
+    sandbox.loadScript('assets/generated/reading-exams/manifest.js');
+
+    const coverage = sandbox.window.__READING_VOCAB_COVERAGE__;
+    const row = coverage.words.find((entry) => entry[0] === 'tradition');
+    assert(row, 'tradition 应出现在阅读文章中');
+    const exams = vocabStore.getReadingExamsForWord({ word: 'Tradition' });
+    assert.strictEqual(exams.length, (row.length - 1) / 2);
+    assert.strictEqual(exams.reduce((sum, exam) => sum + exam.count, 0),
+        row.filter((value, index) => index > 0 && index % 2 === 0).reduce((sum, value) => sum + value, 0));
+    for (let i = 1; i < exams.length; i += 1) {
+        assert(exams[i - 1].count >= exams[i].count, '出处应按出现次数降序');
+    }
+    assert.notStrictEqual(exams[0].title, exams[0].examId, '应从阅读清单取标题');
+    assert.deepStrictEqual(Array.from(vocabStore.getReadingExamsForWord('zzzz-not-a-word')), []);
+
+    const due = [{ word: 'tradition' }, { word: 'emperor' }, 'lack', 'Tradition', 'zzzz'];
+    const picks = vocabStore.pickReadingPassages(due);
+    assert(picks.length > 0 && picks.length <= 5);
+    picks.forEach((pick, index) => {
+        assert(pick.words.every((word) => ['tradition', 'emperor', 'lack'].includes(word)));
+        assert(pick.coreRatio > 0 && pick.coreRatio < 1);
+        if (index > 0) {
+            assert(picks[index - 1].words.length >= pick.words.length, '覆盖词数多的文章应排前');
+        }
+    });
+    assert.strictEqual(vocabStore.pickReadingPassages(due, { limit: 2 }).length, 2);
+}
+
 async function main() {
     const results = [];
     try {
@@ -212,6 +276,8 @@ async function main() {
         results.push({ name: '错词保留已补全释义和元数据', status: 'pass' });
         await testSpellingErrorMetadataSurvivesStudyUpdates();
         results.push({ name: '背诵更新保留错词业务元数据', status: 'pass' });
+        await testReadingCoveragePicksPassagesForDueWords();
+        results.push({ name: '阅读词汇覆盖索引挑选练习文章', status: 'pass' });
         console.log(JSON.stringify({
             status: 'pass',
             detail: `${results.length}/${results.length} 测试通过`,
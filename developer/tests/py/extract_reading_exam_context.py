@@ -3,49 +3,161 @@
 
 This is a helper for rebuilding broken reading-explanations files from the
 actual exam source instead of unreliable markdown summaries.
+
+Usage:
+    python developer/tests/py/extract_reading_exam_context.py p1-high-171 [...]
+    python developer/tests/py/extract_reading_exam_context.py --all [--compact] [--jobs N]
+    python developer/tests/py/extract_reading_exam_context.py --glob 'p3-*' --ndjson
+
+Explicit exam ids print one indented JSON document.  ``--all``/``--glob``
+(or ``--ndjson``) stream one context per line instead, flushed as each exam is
+built, so callers can pipe the whole library without buffering it.
 """
 
 from __future__ import annotations
 
 import argparse
+import fnmatch
 import html
 import json
 import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import reading_bundle_loader as bundle_loader
+import reading_corpus_db as corpus_db
 
 
 ROOT = Path(os.environ.get("READING_EXPLANATION_REPO_ROOT") or Path(__file__).resolve().parents[3])
 EXAM_DIR = ROOT / "assets" / "generated" / "reading-exams"
+_corpus_conn = None
+_corpus_refresh = True
+
+
+def load_exam_payload(exam_id: str) -> Dict[str, Any]:
+    """Fetch an exam payload from the corpus database, refreshed once per process."""
+    global _corpus_conn
+    if _corpus_conn is None:
+        _corpus_conn = corpus_db.connect(ROOT, refresh=_corpus_refresh)
+    payload = corpus_db.load_payload(_corpus_conn, f"assets/generated/reading-exams/{exam_id}.js")
+    if payload is None:
+        # 不在库中（文件缺失或无法解析）时直接读取，沿用原有的报错信息
+        return extract_registered_payload(EXAM_DIR / f"{exam_id}.js")
+    return payload
 
 
 def extract_registered_payload(path: Path) -> Dict[str, Any]:
-    text = path.read_text(encoding="utf-8")
-    match = re.search(r'register\("[^"]+",\s*(\{[\s\S]*\})\s*\)\s*;?\s*\}', text)
-    if not match:
+    try:
+        payload = bundle_loader.load_register_payload(path)
+    except bundle_loader.BundleParseError as exc:
+        raise ValueError(f"无法解析 register payload: {path}") from exc
+    if not isinstance(payload, dict):
         raise ValueError(f"无法解析 register payload: {path}")
-    return json.loads(match.group(1))
+    return payload
+
+
+# Tags and text are split exactly where the old regex passes split them: a tag
+# is ``<`` up to the next ``>``.
+_HTML_TOKEN_RE = re.compile(r"<[^>]+>|[^<]+|<")
+_BREAK_TAG_RE = re.compile(r"<br\s*/?>", re.I)
+_QUESTION_ITEM_TAG_RE = re.compile(r'<div class="question-item" id="(q\d+)-anchor">', re.I)
+_INPUT_NAME_RE = re.compile(r'<input[^>]*name="(q\d+)"[^>]*>', re.I)
+_NUMBER_PREFIX_RE = re.compile(r"\s*\d+\.\s*")
+_BLANK_MARKER_RE = re.compile(r"(\d+)\s+\[BLANK:(q\d+)\]")
+_LOOSE_QUESTION_RE = re.compile(r"(\d+)\.\s*([^\n]+)")
+_MULTI_NEWLINE_RE = re.compile(r"\n{2,}")
+
+
+def _finish_text(parts: List[str]) -> str:
+    text = html.unescape("".join(parts)).replace("\r", "")
+    return _MULTI_NEWLINE_RE.sub("\n", text).strip()
+
 
+class ExamHtmlWalk:
+    """One traversal over passage or question-group HTML.
 
-def strip_html(raw: str) -> str:
-    text = raw or ""
-    text = re.sub(r"<br\s*/?>", "\n", text, flags=re.I)
-    text = re.sub(r"</p>", "\n", text, flags=re.I)
-    text = re.sub(r"</li>", "\n", text, flags=re.I)
-    text = re.sub(r"<[^>]+>", "", text)
-    text = html.unescape(text)
-    text = re.sub(r"\r", "", text)
-    text = re.sub(r"\n{2,}", "\n", text)
-    return text.strip()
+    Collects, in document order:
+    - ``paragraphs``: text of every bare ``<p>...</p>`` (up to the first ``</p>``)
+    - ``question_items``: ``(questionId, prompt)`` for each
+      ``<div class="question-item" id="qN-anchor">`` followed by a ``<p>`` that
+      opens with ``N.``
+    - the whole text, with (``marked_parts``) and without (``plain_parts``)
+      ``[BLANK:qN]`` markers for ``<input name="qN">``
+
+    Text keeps the previous strip_html rules: ``<br>``, ``</p>`` and ``</li>``
+    become newlines, other tags are dropped, entities are unescaped afterwards.
+    """
+
+    def __init__(self, html_text: str) -> None:
+        self.paragraphs: List[str] = []
+        self.question_items: List[Tuple[str, str]] = []
+        self.plain_parts: List[str] = []
+        self.marked_parts: List[str] = []
+        self.has_blanks = False
+
+        paragraph: Optional[List[str]] = None
+        pending_question: Optional[str] = None
+        prompt: Optional[List[str]] = None
+        prompt_candidate = False
+
+        for token in _HTML_TOKEN_RE.findall(html_text or ""):
+            if token[0] != "<" or len(token) == 1:
+                self.plain_parts.append(token)
+                self.marked_parts.append(token)
+                if paragraph is not None:
+                    paragraph.append(token)
+                if prompt is not None:
+                    prompt.append(token)
+                elif prompt_candidate:
+                    # the prompt paragraph must open with its number, before any markup
+                    number = _NUMBER_PREFIX_RE.match(token)
+                    if number:
+                        prompt = [token[number.end():]]
+                prompt_candidate = False
+                continue
+
+            prompt_candidate = False
+            lowered = token.lower()
+            if lowered == "</p>":
+                self.plain_parts.append("\n")
+                self.marked_parts.append("\n")
+                if paragraph is not None:
+                    self.paragraphs.append(_finish_text(paragraph))
+                    paragraph = None
+                if prompt is not None:
+                    self.question_items.append((pending_question, _finish_text(prompt)))
+                    prompt = None
+                    pending_question = None
+            elif lowered == "<p>":
+                if paragraph is None:
+                    paragraph = []
+                if pending_question is not None and prompt is None:
+                    prompt_candidate = True
+            elif lowered == "</li>" or _BREAK_TAG_RE.fullmatch(token):
+                self.plain_parts.append("\n")
+                self.marked_parts.append("\n")
+                if paragraph is not None:
+                    paragraph.append("\n")
+                if prompt is not None:
+                    prompt.append("\n")
+            elif lowered.startswith("<div"):
+                question_match = _QUESTION_ITEM_TAG_RE.fullmatch(token)
+                if question_match and pending_question is None:
+                    pending_question = question_match.group(1)
+            elif lowered.startswith("<input"):
+                input_match = _INPUT_NAME_RE.match(token)
+                if input_match:
+                    self.marked_parts.append(f" [BLANK:{input_match.group(1)}] ")
+                    self.has_blanks = True
 
 
 def extract_passage_paragraphs(html_text: str) -> List[Dict[str, str]]:
-    paragraphs = re.findall(r"<p>([\s\S]*?)</p>", html_text, flags=re.I)
     results: List[Dict[str, str]] = []
     body_index = 0
-    for paragraph in paragraphs:
-        plain = strip_html(paragraph)
+    for plain in ExamHtmlWalk(html_text).paragraphs:
         if not plain:
             continue
         if plain.startswith("You should spend about"):
@@ -59,36 +171,24 @@ def extract_passage_paragraphs(html_text: str) -> List[Dict[str, str]]:
 
 
 def extract_questions_from_group(group: Dict[str, Any]) -> List[Dict[str, Any]]:
-    body_html = group.get("bodyHtml", "") or ""
+    walker = ExamHtmlWalk(group.get("bodyHtml", "") or "")
     question_ids = set(group.get("questionIds") or [])
 
     # Standard question-item blocks.
-    items: List[Dict[str, Any]] = []
-    for question_id, prompt in re.findall(
-        r'<div class="question-item" id="(q\d+)-anchor">[\s\S]*?<p>\s*\d+\.\s*([\s\S]*?)</p>',
-        body_html,
-        flags=re.I,
-    ):
-        items.append({
-            "questionId": question_id,
-            "prompt": strip_html(prompt),
-        })
+    items: List[Dict[str, Any]] = [
+        {"questionId": question_id, "prompt": prompt}
+        for question_id, prompt in walker.question_items
+    ]
 
     # Gap-fill style inputs embedded in prose.
     if not items and question_ids:
-        def replacer(match: re.Match[str]) -> str:
-            qid = match.group(1)
-            return f" [BLANK:{qid}] "
-
-        marked = re.sub(
-            r'<input[^>]*name="(q\d+)"[^>]*>',
-            replacer,
-            body_html,
-            flags=re.I,
-        )
-        plain = strip_html(marked)
+        plain = _finish_text(walker.marked_parts)
+        first_blank: Dict[str, re.Match[str]] = {}
+        if walker.has_blanks:
+            for match in _BLANK_MARKER_RE.finditer(plain):
+                first_blank.setdefault(match.group(2), match)
         for question_id in sorted(question_ids, key=lambda value: int(value[1:])):
-            match = re.search(rf"(\d+)\s+\[BLANK:{question_id}\]", plain)
+            match = first_blank.get(question_id)
             if not match:
                 continue
             number = int(match.group(1))
@@ -104,7 +204,7 @@ def extract_questions_from_group(group: Dict[str, Any]) -> List[Dict[str, Any]]:
 
     # Fallback for very loose summary/matching blocks.
     if not items:
-        for number, prompt in re.findall(r'(\d+)\.\s*([^\n]+)', strip_html(body_html)):
+        for number, prompt in _LOOSE_QUESTION_RE.findall(_finish_text(walker.plain_parts)):
             qid = f"q{number}"
             if qid not in question_ids:
                 continue
@@ -121,11 +221,24 @@ def extract_questions_from_group(group: Dict[str, Any]) -> List[Dict[str, Any]]:
     return sorted(items, key=lambda item: item["questionNumber"])
 
 
+_INSTRUCTION_LINE_RE = re.compile(r"^(?:READING PASSAGE \d+|You should spend about\b.*)$", re.I)
+
+
+def passage_html(payload: Dict[str, Any]) -> str:
+    """Passage HTML of all blocks; ``kind: "text"`` blocks keep it in ``bodyHtml``."""
+    blocks = (payload.get("passage") or {}).get("blocks") or []
+    return "\n".join(block.get("html") or block.get("bodyHtml") or "" for block in blocks)
+
+
+def passage_text(payload: Dict[str, Any]) -> str:
+    """Plain passage text, one line per block element, without the exam instructions."""
+    text = _finish_text(ExamHtmlWalk(passage_html(payload)).plain_parts)
+    return "\n".join(line for line in text.split("\n") if not _INSTRUCTION_LINE_RE.match(line.strip()))
+
+
 def build_context(exam_id: str) -> Dict[str, Any]:
-    path = EXAM_DIR / f"{exam_id}.js"
-    payload = extract_registered_payload(path)
-    passage_blocks = payload.get("passage", {}).get("blocks") or []
-    passage_html = "\n".join(block.get("html", "") for block in passage_blocks)
+    payload = load_exam_payload(exam_id)
+    passage_html_text = passage_html(payload)
 
     groups = []
     for group in payload.get("questionGroups") or []:
@@ -141,19 +254,108 @@ def build_context(exam_id: str) -> Dict[str, Any]:
         "category": payload.get("meta", {}).get("category"),
         "pdfFilename": payload.get("meta", {}).get("pdfFilename"),
         "answerKey": payload.get("answerKey") or {},
-        "passageParagraphs": extract_passage_paragraphs(passage_html),
+        "passageParagraphs": extract_passage_paragraphs(passage_html_text),
         "questionGroups": groups,
     }
 
 
+def list_exam_ids() -> List[str]:
+    return sorted(path.stem for path in EXAM_DIR.glob("*.js") if path.name != "manifest.js")
+
+
+def select_exam_ids(exam_ids: Iterable[str], patterns: Iterable[str], include_all: bool) -> List[str]:
+    """Merge explicit ids with ``--glob``/``--all`` selections, keeping first-seen order."""
+    selected = list(exam_ids)
+    patterns = list(patterns)
+    if include_all or patterns:
+        for exam_id in list_exam_ids():
+            if include_all or any(fnmatch.fnmatchcase(exam_id, pattern) for pattern in patterns):
+                selected.append(exam_id)
+    return list(dict.fromkeys(selected))
+
+
+def _render_context_line(task: Tuple[str, bool]) -> Tuple[str, Optional[str], Optional[str]]:
+    exam_id, compact = task
+    try:
+        context = build_context(exam_id)
+    except Exception as exc:  # 单个试卷失败不应中断整个流
+        return exam_id, None, str(exc)
+    separators = (",", ":") if compact else None
+    return exam_id, json.dumps(context, ensure_ascii=False, separators=separators), None
+
+
+def _init_worker() -> None:
+    # 父进程已刷新过语料库，worker 只读
+    global _corpus_conn, _corpus_refresh
+    _corpus_conn = None
+    _corpus_refresh = False
+
+
+def iter_context_lines(
+    exam_ids: List[str], *, compact: bool = False, jobs: int = 1
+) -> Iterator[Tuple[str, Optional[str], Optional[str]]]:
+    """Yield ``(examId, ndjsonLine, error)`` in input order, one exam at a time."""
+    tasks = [(exam_id, compact) for exam_id in exam_ids]
+    if jobs <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield _render_context_line(task)
+        return
+
+    global _corpus_conn
+    corpus_db.connect(ROOT).close()
+    if _corpus_conn is not None:
+        _corpus_conn.close()
+        _corpus_conn = None
+    chunksize = max(1, min(8, len(tasks) // (jobs * 4)))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as executor:
+        yield from executor.map(_render_context_line, tasks, chunksize=chunksize)
+
+
+def stream_contexts(exam_ids: List[str], out, *, compact: bool = False, jobs: int = 1) -> int:
+    failures = 0
+    for exam_id, line, error in iter_context_lines(exam_ids, compact=compact, jobs=jobs):
+        if line is None:
+            failures += 1
+            print(f"[extract-context] 跳过 {exam_id}: {error}", file=sys.stderr)
+            continue
+        out.write(line)
+        out.write("\n")
+        out.flush()
+    return failures
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
-    parser.add_argument("exam_ids", nargs="+", help="exam ids such as p1-high-171")
+    parser.add_argument("exam_ids", nargs="*", help="exam ids such as p1-high-171")
+    parser.add_argument("--all", action="store_true", help="select every exam bundle")
+    parser.add_argument(
+        "--glob",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="select exam ids matching a shell pattern such as 'p3-*' (repeatable)",
+    )
+    parser.add_argument("--ndjson", action="store_true", help="stream one JSON context per line (implied by --all/--glob)")
+    parser.add_argument("--compact", action="store_true", help="drop optional whitespace from NDJSON lines")
+    parser.add_argument("--jobs", type=int, default=1, help="worker processes for building contexts (default 1 = serial)")
     args = parser.parse_args()
 
-    data = [build_context(exam_id) for exam_id in args.exam_ids]
-    print(json.dumps(data if len(data) > 1 else data[0], ensure_ascii=False, indent=2))
-    return 0
+    exam_ids = select_exam_ids(args.exam_ids, args.glob, args.all)
+    if not exam_ids:
+        parser.error("no exam selected: pass exam ids, --glob or --all")
+
+    if not (args.ndjson or args.compact or args.all or args.glob):
+        data = [build_context(exam_id) for exam_id in exam_ids]
+        print(json.dumps(data if len(data) > 1 else data[0], ensure_ascii=False, indent=2))
+        return 0
+
+    try:
+        failures = stream_contexts(exam_ids, sys.stdout, compact=args.compact, jobs=max(1, args.jobs))
+    except BrokenPipeError:
+        # 下游（如 head）提前关闭管道时安静退出，避免解释器退出时再次 flush 报错
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    return 1 if failures else 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Local stand-in for the translator agent endpoint used by `dispatch`.
+
+Accepts the request packets written by
+``generate_reading_explanations_with_agent.py prepare`` (POST, JSON body) and
+replays ``<canned-dir>/<examId>.json`` as the agent response.  Exams without a
+canned file get the packet's ``responseTemplate`` back (or 404 with
+``--missing 404``), so hundreds of exams can be pushed through the pipeline
+offline.  ``--fail-first N`` answers the first N calls per exam with 503 and
+``--latency`` adds a fixed delay, to exercise retries and the concurrency cap.
+
+Usage:
+    python developer/tests/py/reading_agent_stub_server.py --canned-dir DIR [--port 8765]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional, Tuple
+
+
+class StubAgentServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        canned_dir: Optional[Path],
+        *,
+        latency: float = 0.0,
+        fail_first: int = 0,
+        missing: str = "template",
+    ) -> None:
+        super().__init__(address, StubAgentHandler)
+        self.canned_dir = canned_dir
+        self.latency = latency
+        self.fail_first = fail_first
+        self.missing = missing
+        self.calls: Counter = Counter()
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/translate"
+
+
+class StubAgentHandler(BaseHTTPRequestHandler):
+    server: StubAgentServer
+
+    def log_message(self, format, *args):  # noqa: A003 - keep signature for HTTP handler
+        pass
+
+    def send_json(self, status: int, payload) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            packet = json.loads(self.rfile.read(length).decode("utf-8"))
+            exam_id = str(packet["examContext"]["examId"])
+        except (ValueError, KeyError, TypeError):
+            self.send_json(400, {"error": "invalid request packet"})
+            return
+
+        with self.server.lock:
+            self.server.calls[exam_id] += 1
+            call_number = self.server.calls[exam_id]
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        if call_number <= self.server.fail_first:
+            self.send_json(503, {"error": "injected failure", "examId": exam_id, "call": call_number})
+            return
+
+        canned_path = self.server.canned_dir / f"{exam_id}.json" if self.server.canned_dir else None
+        if canned_path is not None and canned_path.exists():
+            body = canned_path.read_bytes()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif self.server.missing == "template" and isinstance(packet.get("responseTemplate"), dict):
+            self.send_json(200, packet["responseTemplate"])
+        else:
+            self.send_json(404, {"error": "no canned response", "examId": exam_id})
+
+
+def start_stub_server(
+    canned_dir: Optional[Path],
+    *,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    latency: float = 0.0,
+    fail_first: int = 0,
+    missing: str = "template",
+) -> StubAgentServer:
+    """Start the stub on a background thread; call ``shutdown()`` and ``server_close()`` when done."""
+    server = StubAgentServer((host, port), canned_dir, latency=latency, fail_first=fail_first, missing=missing)
+    threading.Thread(target=server.serve_forever, name="reading-agent-stub", daemon=True).start()
+    return server
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay canned translator-agent responses over HTTP")
+    parser.add_argument("--canned-dir", help="directory of <examId>.json responses to replay")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds to wait before answering")
+    parser.add_argument("--fail-first", type=int, default=0, help="answer the first N calls per exam with 503")
+    parser.add_argument(
+        "--missing",
+        choices=("template", "404"),
+        default="template",
+        help="exams without a canned response: echo responseTemplate (default) or return 404",
+    )
+    args = parser.parse_args()
+
+    server = StubAgentServer(
+        (args.host, args.port),
+        Path(args.canned_dir) if args.canned_dir else None,
+        latency=args.latency,
+        fail_first=args.fail_first,
+        missing=args.missing,
+    )
+    print(f"[reading-agent-stub] listening on {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""Shared loader for generated reading bundles.
+
+Every generated reading asset wraps one JSON document in JavaScript:
+exam/explanation bundles call ``register("<id>", {...})`` and the manifests
+assign an object literal to a global.  This module locates the start of that
+document with a short anchored pattern and decodes it with
+``json.JSONDecoder.raw_decode``, so no regex ever has to scan to the end of a
+multi-megabyte file.  The few bundles written as plain JavaScript object
+literals (unquoted keys, single quotes, trailing commas) are normalised to
+JSON before decoding.
+
+Parsed payloads are cached for the lifetime of the process, keyed by
+``(path, mtime_ns, size)``.  Cached objects are shared between callers and
+must be treated as read-only.
+
+Callers that only need a few scalar fields (``extract_register_fields``) do
+not decode the payload at all: the file is read in chunks, strings that are
+not wanted are skipped without being kept in memory, and reading stops as
+soon as every requested field has been seen.  Anything the streaming scanner
+does not understand falls back to the full decode.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+
+REGISTER_CALL_RE = re.compile(r"""register\(\s*(['"])([^'"]+)\1\s*,\s*""")
+_JS_IDENTIFIER_RE = re.compile(r"[A-Za-z_$][\w$]*")
+_JS_KEY_SUFFIX_RE = re.compile(r"\s*:")
+_DECODER = json.JSONDecoder()
+_STREAM_CHUNK_SIZE = 64 * 1024
+_SPACE_RE = re.compile(r"\s*")
+_STRING_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+_STRING_BODY_RE = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.S)
+_SCALAR_RE = re.compile(r'[^\s{}\[\]:,"]+')
+_SKIP_RE = re.compile(r'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*', re.S)
+
+FieldPaths = Mapping[str, Tuple[str, ...]]
+EXAM_SUMMARY_FIELDS: FieldPaths = {
+    "examId": ("examId",),
+    "title": ("meta", "title"),
+    "category": ("meta", "category"),
+    "pdfFilename": ("meta", "pdfFilename"),
+    "shuiPdf": ("sourceRefs", "shuiPdf"),
+}
+
+_CacheKey = Tuple[str, str, int, int]
+_cache: Dict[_CacheKey, Any] = {}
+_cache_lock = threading.Lock()
+
+
+class BundleParseError(ValueError):
+    """Raised when a generated bundle does not contain a decodable JSON payload."""
+
+
+class _StreamGiveUp(Exception):
+    """The streaming scanner met input it does not handle; use the full decode instead."""
+
+
+def _js_object_literal_to_json(text: str, start: int) -> Tuple[str, int]:
+    """Rewrite the object literal starting at ``text[start]`` as JSON text.
+
+    Returns the JSON text and the index just past the literal's closing brace.
+
+    Only the subset emitted by code formatters is supported: identifier keys,
+    single- or double-quoted strings and trailing commas.  Anything else is
+    left as-is and surfaces as a decode error.
+    """
+    out: list = []
+    depth = 0
+    index = start
+    length = len(text)
+    while index < length:
+        char = text[index]
+        if char in "\"'":
+            end = index + 1
+            chunk: list = []
+            while end < length and text[end] != char:
+                if text[end] == "\\" and end + 1 < length:
+                    escaped = text[end + 1]
+                    chunk.append("'" if escaped == "'" else "\\" + escaped)
+                    end += 2
+                    continue
+                chunk.append('\\"' if text[end] == '"' else text[end])
+                end += 1
+            out.append('"' + "".join(chunk) + '"')
+            index = end + 1
+            continue
+        if char in "{[":
+            depth += 1
+        elif char in "}]":
+            while out and out[-1].isspace():
+                out.pop()
+            if out and out[-1] == ",":
+                out.pop()
+            depth -= 1
+            if depth == 0:
+                out.append(char)
+                return "".join(out), index + 1
+        elif char == "/" and text.startswith(("//", "/*"), index):
+            raise BundleParseError("js_comment_unsupported")
+        else:
+            identifier = _JS_IDENTIFIER_RE.match(text, index) if char.isalpha() or char in "_$" else None
+            if identifier:
+                word = identifier.group(0)
+                is_key = _JS_KEY_SUFFIX_RE.match(text, identifier.end()) is not None
+                out.append(f'"{word}"' if is_key else word)
+                index = identifier.end()
+                continue
+        out.append(char)
+        index += 1
+    raise BundleParseError("js_object_unterminated")
+
+
+def locate_register_payload(text: str) -> Tuple[str, Any, int, int]:
+    """Return ``(register_key, payload, start, end)``; ``text[start:end]`` is the payload literal.
+
+    Post-processing stages use the span to rewrite the payload while keeping
+    the surrounding wrapper byte-for-byte.
+    """
+    match = REGISTER_CALL_RE.search(text)
+    if not match:
+        raise BundleParseError("register_call_missing")
+    try:
+        payload, end = _DECODER.raw_decode(text, match.end())
+    except json.JSONDecodeError as exc:
+        if not text.startswith("{", match.end()):
+            raise BundleParseError(f"register_payload_not_json:{exc}") from exc
+        try:
+            literal_json, end = _js_object_literal_to_json(text, match.end())
+            payload = json.loads(literal_json)
+        except json.JSONDecodeError as literal_exc:
+            raise BundleParseError(f"register_payload_not_json:{literal_exc}") from literal_exc
+    return match.group(2), payload, match.end(), end
+
+
+def parse_register_text(text: str) -> Tuple[str, Any]:
+    """Return ``(register_key, payload)`` for the first ``register(...)`` call in ``text``."""
+    key, payload, _, _ = locate_register_payload(text)
+    return key, payload
+
+
+def parse_assignment_text(text: str, markers: Sequence[str]) -> Any:
+    """Decode the JSON literal that follows the first marker present in ``text``.
+
+    ``markers`` are tried in order, e.g. ``("global.__READING_EXAM_MANIFEST__ =",
+    "const manifest =")`` for manifests that assign through a local variable.
+    """
+    for marker in markers:
+        marker_index = text.find(marker)
+        if marker_index < 0:
+            continue
+        start = marker_index + len(marker)
+        while start < len(text) and text[start].isspace():
+            start += 1
+        if start >= len(text) or text[start] not in "{[":
+            continue
+        try:
+            payload, _ = _DECODER.raw_decode(text, start)
+        except json.JSONDecodeError as exc:
+            raise BundleParseError(f"assignment_not_json:{marker}:{exc}") from exc
+        return payload
+    raise BundleParseError(f"assignment_marker_missing:{' | '.join(markers)}")
+
+
+_MANIFEST_DECLARATION = "const manifest ="
+_MANIFEST_GLOBAL_ASSIGNMENT = "  global.__READING_EXAM_MANIFEST__ = manifest;\n"
+
+
+def upsert_manifest_constant(text: str, name: str, literal: str, global_name: str) -> str:
+    """Set ``const <name> = <literal>;`` in a manifest script and publish it as ``global.<global_name>``.
+
+    ``literal`` must be JSON.  An existing declaration is replaced in place;
+    otherwise it is added right after the ``manifest`` object, and the global
+    assignment right after ``global.__READING_EXAM_MANIFEST__``.  Running it
+    again with the same literal returns ``text`` unchanged.
+    """
+    declaration = f"  const {name} = "
+    index = text.find(declaration)
+    if index >= 0:
+        start = index + len(declaration)
+        try:
+            _, end = _DECODER.raw_decode(text, start)
+        except json.JSONDecodeError as exc:
+            raise BundleParseError(f"manifest_constant_not_json:{name}:{exc}") from exc
+        text = text[:start] + literal + text[end:]
+    else:
+        index = text.find(_MANIFEST_DECLARATION)
+        if index < 0:
+            raise BundleParseError("manifest_declaration_missing")
+        start = _SPACE_RE.match(text, index + len(_MANIFEST_DECLARATION)).end()
+        try:
+            _, end = _DECODER.raw_decode(text, start)
+        except json.JSONDecodeError as exc:
+            raise BundleParseError(f"manifest_not_json:{exc}") from exc
+        if not text.startswith(";", end):
+            raise BundleParseError("manifest_declaration_unterminated")
+        text = f"{text[:end + 1]}\n{declaration}{literal};{text[end + 1:]}"
+
+    assignment = f"  global.{global_name} = {name};\n"
+    if assignment not in text:
+        if _MANIFEST_GLOBAL_ASSIGNMENT not in text:
+            raise BundleParseError("manifest_global_assignment_missing")
+        text = text.replace(_MANIFEST_GLOBAL_ASSIGNMENT, _MANIFEST_GLOBAL_ASSIGNMENT + assignment, 1)
+    return text
+
+
+def _cache_key(kind: str, path: Path) -> _CacheKey:
+    resolved = path.resolve()
+    stat = resolved.stat()
+    return kind, str(resolved), stat.st_mtime_ns, stat.st_size
+
+
+def _load_cached(kind: str, path: Path, parse) -> Any:
+    key = _cache_key(kind, path)
+    with _cache_lock:
+        if key in _cache:
+            return _cache[key]
+    value = parse(path.read_text(encoding="utf-8"))
+    with _cache_lock:
+        _cache[key] = value
+    return value
+
+
+def load_register_payload(path: Path, register_key: Optional[str] = None) -> Any:
+    """Load the payload registered by ``path``, optionally asserting its key."""
+    try:
+        key, payload = _load_cached("register", path, parse_register_text)
+    except BundleParseError as exc:
+        raise BundleParseError(f"{exc}:{path.name}") from exc
+    if register_key is not None and key != register_key:
+        raise BundleParseError(f"register_key_mismatch:{path.name}:{key}")
+    return payload
+
+
+def load_assignment(path: Path, markers: Sequence[str]) -> Any:
+    """Load the JSON literal assigned after one of ``markers`` in ``path``."""
+    try:
+        return _load_cached(
+            "assignment:" + "\0".join(markers),
+            path,
+            lambda text: parse_assignment_text(text, markers),
+        )
+    except BundleParseError as exc:
+        raise BundleParseError(f"{exc}:{path.name}") from exc
+
+
+def _stream_register_fields(handle, fields: FieldPaths, chunk_size: int) -> Tuple[str, Dict[str, Any]]:
+    wanted = {tuple(path): name for name, path in fields.items()}
+    prefixes = {tuple(path[:depth]) for path in wanted for depth in range(len(path))}
+    found: Dict[str, Any] = {}
+    buffer = ""
+    pos = 0
+
+    def fill() -> None:
+        nonlocal buffer, pos
+        chunk = handle.read(chunk_size)
+        if not chunk:
+            raise _StreamGiveUp("unexpected_eof")
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+    def skip_string() -> None:
+        # pos is on the opening quote; drop the body chunk by chunk, keeping a trailing backslash
+        nonlocal pos
+        pos += 1
+        while True:
+            end = _STRING_BODY_RE.match(buffer, pos).end()
+            if end < len(buffer) and buffer[end] == '"':
+                pos = end + 1
+                return
+            pos = end
+            fill()
+
+    def skip_container() -> None:
+        # subtrees that cannot hold a wanted field are skipped bracket to bracket
+        nonlocal pos
+        depth = 0
+        while True:
+            pos = _SKIP_RE.match(buffer, pos).end()
+            if pos >= len(buffer):
+                fill()
+                continue
+            char = buffer[pos]
+            if char == '"':
+                skip_string()
+                continue
+            pos += 1
+            depth += 1 if char in "{[" else -1
+            if depth == 0:
+                return
+
+    def current_path() -> Optional[Tuple[str, ...]]:
+        if all(item[0] == "obj" for item in stack):
+            return tuple(item[1] for item in stack)
+        return None
+
+    while True:
+        match = REGISTER_CALL_RE.search(buffer)
+        if match and match.end() < len(buffer):
+            break
+        # the call sits in the module preamble; keep only a short tail while searching
+        buffer, pos = buffer[-256:], 0
+        fill()
+    register_key = match.group(2)
+    pos = match.end()
+
+    # frame: [kind ("obj"|"arr"), current key, expected token]
+    stack: List[List[Any]] = []
+    while True:
+        pos = _SPACE_RE.match(buffer, pos).end()
+        if pos >= len(buffer):
+            fill()
+            continue
+        char = buffer[pos]
+        frame = stack[-1] if stack else None
+        if frame is None and char != "{":
+            raise _StreamGiveUp("payload_not_object")
+
+        if char in "{[":
+            if frame is not None and frame[2] != "value":
+                raise _StreamGiveUp("unexpected_container")
+            if frame is not None and current_path() not in prefixes:
+                skip_container()
+                frame[2] = "comma"
+                continue
+            stack.append(["obj", None, "key"] if char == "{" else ["arr", None, "value"])
+            pos += 1
+        elif char in "}]":
+            if frame is None or (char == "}") != (frame[0] == "obj"):
+                raise _StreamGiveUp("unbalanced")
+            stack.pop()
+            pos += 1
+            if not stack:
+                return register_key, found
+            stack[-1][2] = "comma"
+        elif char == ":":
+            if frame[2] != "colon":
+                raise _StreamGiveUp("unexpected_colon")
+            frame[2] = "value"
+            pos += 1
+        elif char == ",":
+            if frame[2] != "comma":
+                raise _StreamGiveUp("unexpected_comma")
+            frame[2] = "key" if frame[0] == "obj" else "value"
+            pos += 1
+        elif char == '"':
+            is_key = frame[0] == "obj" and frame[2] == "key"
+            if not is_key and frame[2] != "value":
+                raise _StreamGiveUp("unexpected_string")
+            path = None if is_key else current_path()
+            if is_key or path in wanted:
+                string_match = _STRING_RE.match(buffer, pos)
+                if not string_match:
+                    fill()
+                    continue
+                try:
+                    value = json.loads(string_match.group(0))
+                except json.JSONDecodeError as exc:
+                    raise _StreamGiveUp("bad_string") from exc
+                pos = string_match.end()
+                if is_key:
+                    frame[1] = value
+                    frame[2] = "colon"
+                    continue
+                found[wanted[path]] = value
+                if len(found) == len(wanted):
+                    return register_key, found
+            else:
+                skip_string()
+            frame[2] = "comma"
+        else:
+            scalar = _SCALAR_RE.match(buffer, pos)
+            if scalar is None:
+                raise _StreamGiveUp("unexpected_char")
+            if scalar.end() == len(buffer):
+                fill()
+                continue
+            if frame[2] != "value":
+                # unquoted object keys: a JavaScript literal rather than JSON
+                raise _StreamGiveUp("unquoted_key")
+            try:
+                value = json.loads(scalar.group(0))
+            except json.JSONDecodeError as exc:
+                raise _StreamGiveUp("unexpected_scalar") from exc
+            path = current_path()
+            if path in wanted:
+                found[wanted[path]] = value
+                if len(found) == len(wanted):
+                    return register_key, found
+            pos = scalar.end()
+            frame[2] = "comma"
+
+
+def _pick_fields(payload: Any, fields: FieldPaths) -> Dict[str, Any]:
+    picked: Dict[str, Any] = {}
+    for name, path in fields.items():
+        node = payload
+        for part in path:
+            if not isinstance(node, dict) or part not in node:
+                break
+            node = node[part]
+        else:
+            if not isinstance(node, (dict, list)):
+                picked[name] = node
+    return picked
+
+
+def extract_register_fields(
+    path: Path,
+    fields: FieldPaths = EXAM_SUMMARY_FIELDS,
+    register_key: Optional[str] = None,
+    *,
+    chunk_size: int = _STREAM_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """Return ``{name: value}`` for the scalar ``fields`` (name -> key path) of a register bundle.
+
+    Fields absent from the payload are omitted.  Reading stops once all fields
+    are found; an already cached full payload is used directly.
+    """
+    with _cache_lock:
+        cached = _cache_key("register", path) in _cache
+    if not cached:
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                found_key, picked = _stream_register_fields(handle, fields, chunk_size)
+        except _StreamGiveUp:
+            pass
+        else:
+            if register_key is not None and found_key != register_key:
+                raise BundleParseError(f"register_key_mismatch:{path.name}:{found_key}")
+            return picked
+    return _pick_fields(load_register_payload(path, register_key), fields)
+
+
+def clear_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""SQLite corpus of the generated reading exam and explanation bundles.
+
+CI checkers used to rescan ``assets/generated/reading-exams/*.js`` and
+``reading-explanations/*.js`` independently.  This module parses every bundle
+once into ``developer/tests/reports/reading-corpus.sqlite3`` and refreshes it
+incrementally: a file is re-parsed only when its sha256 changes, and rows of
+deleted files are dropped.  Editing ``reading_bundle_loader.py`` or this
+module changes the parser fingerprint and re-parses every bundle, so payloads
+and ``parse_error`` rows from an older parser never survive.  Checkers then
+query the tables below.
+
+Tables (``path`` is repo-relative and ties every row to its source file):
+
+- ``source_files``: path, kind (exam|explanation), sha256, mtime_ns, size,
+  exam_id, parse_error
+- ``exams``: one row per exam bundle with the meta fields and the full payload
+- ``question_groups``, ``passages``, ``answer_keys``: exploded exam content
+- ``explanations``: one row per explanation bundle with the full payload
+- ``exam_signatures``: derived per-exam fingerprints (e.g. MinHash) cached by
+  checkers, keyed by path + scheme and tagged with the source sha256
+- ``corpus_meta``: key/value pairs, currently the parser fingerprint
+
+Usage:
+    python developer/tests/py/reading_corpus_db.py [--rebuild]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import reading_bundle_loader as bundle_loader
+
+
+ROOT = Path(os.environ.get("READING_EXPLANATION_REPO_ROOT") or Path(__file__).resolve().parents[3])
+BUNDLE_LOADER_PATH = Path(__file__).resolve().parent / "reading_bundle_loader.py"
+CORPUS_SCHEMA_VERSION = 3
+PARSER_SOURCES = (BUNDLE_LOADER_PATH, Path(__file__).resolve())
+SOURCE_GLOBS = (
+    ("exam", "assets/generated/reading-exams/*.js"),
+    ("explanation", "assets/generated/reading-explanations/*.js"),
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS source_files (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    exam_id TEXT,
+    parse_error TEXT
+);
+CREATE TABLE IF NOT EXISTS exams (
+    path TEXT PRIMARY KEY REFERENCES source_files(path) ON DELETE CASCADE,
+    exam_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    category TEXT NOT NULL,
+    frequency TEXT NOT NULL,
+    pdf_filename TEXT NOT NULL,
+    shui_pdf TEXT NOT NULL,
+    question_order TEXT NOT NULL,
+    question_display_map TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS exams_exam_id ON exams(exam_id);
+CREATE TABLE IF NOT EXISTS question_groups (
+    path TEXT NOT NULL REFERENCES source_files(path) ON DELETE CASCADE,
+    exam_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    group_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    question_ids TEXT NOT NULL,
+    body_html TEXT NOT NULL,
+    PRIMARY KEY (path, position)
+);
+CREATE TABLE IF NOT EXISTS passages (
+    path TEXT NOT NULL REFERENCES source_files(path) ON DELETE CASCADE,
+    exam_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    block_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    html TEXT NOT NULL,
+    PRIMARY KEY (path, position)
+);
+CREATE TABLE IF NOT EXISTS answer_keys (
+    path TEXT NOT NULL REFERENCES source_files(path) ON DELETE CASCADE,
+    exam_id TEXT NOT NULL,
+    question_id TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    PRIMARY KEY (path, question_id)
+);
+CREATE INDEX IF NOT EXISTS answer_keys_exam_id ON answer_keys(exam_id);
+CREATE TABLE IF NOT EXISTS explanations (
+    path TEXT PRIMARY KEY REFERENCES source_files(path) ON DELETE CASCADE,
+    exam_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    category TEXT NOT NULL,
+    source_doc TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS explanations_exam_id ON explanations(exam_id);
+CREATE TABLE IF NOT EXISTS exam_signatures (
+    path TEXT NOT NULL REFERENCES source_files(path) ON DELETE CASCADE,
+    scheme TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    signature BLOB NOT NULL,
+    PRIMARY KEY (path, scheme)
+);
+CREATE TABLE IF NOT EXISTS corpus_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def default_db_path(root: Path = ROOT) -> Path:
+    return root / "developer" / "tests" / "reports" / "reading-corpus.sqlite3"
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _text(value: Any) -> str:
+    return str(value).strip() if value is not None else ""
+
+
+def parser_fingerprint() -> str:
+    """Hash of the code that turns bundles into rows; stored rows are only valid for the same value."""
+    hasher = hashlib.sha256()
+    for path in PARSER_SOURCES:
+        hasher.update(path.read_bytes())
+    return hasher.hexdigest()
+
+
+def _schema_state(conn: sqlite3.Connection) -> Tuple[int, Optional[str]]:
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    has_meta = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'corpus_meta'"
+    ).fetchone()
+    if not has_meta:
+        return version, None
+    row = conn.execute("SELECT value FROM corpus_meta WHERE key = 'parser'").fetchone()
+    return version, row[0] if row else None
+
+
+def _prepare_schema(conn: sqlite3.Connection) -> None:
+    fingerprint = parser_fingerprint()
+    if _schema_state(conn) == (CORPUS_SCHEMA_VERSION, fingerprint):
+        return
+    # 与 refresh_corpus 相同：并行启动的检查脚本中只有一个负责删表重建，其余等待后看到新表
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        version, stored = _schema_state(conn)
+        if version != CORPUS_SCHEMA_VERSION:
+            tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+            for table in tables:
+                conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+            conn.execute(f"PRAGMA user_version = {CORPUS_SCHEMA_VERSION}")
+            stored = None
+        # executescript 会先提交当前事务，这里逐条执行以留在同一事务内
+        for statement in SCHEMA.split(";"):
+            if statement.strip():
+                conn.execute(statement)
+        if stored != fingerprint:
+            # 解析代码变了：清空全部来源行（级联删除派生表），下次刷新时全部重新解析
+            conn.execute("DELETE FROM source_files")
+            conn.execute(
+                "INSERT OR REPLACE INTO corpus_meta VALUES ('parser', ?)",
+                (fingerprint,),
+            )
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def _scan_sources(root: Path) -> Dict[str, Tuple[str, Path]]:
+    sources: Dict[str, Tuple[str, Path]] = {}
+    for kind, pattern in SOURCE_GLOBS:
+        for path in sorted(root.glob(pattern)):
+            if path.name == "manifest.js" or not path.is_file():
+                continue
+            sources[path.relative_to(root).as_posix()] = (kind, path)
+    return sources
+
+
+def _insert_exam(conn: sqlite3.Connection, rel_path: str, payload: Dict[str, Any]) -> str:
+    meta = payload.get("meta") if isinstance(payload.get("meta"), dict) else {}
+    source_refs = payload.get("sourceRefs") if isinstance(payload.get("sourceRefs"), dict) else {}
+    exam_id = _text(payload.get("examId")) or Path(rel_path).stem
+    conn.execute(
+        "INSERT INTO exams VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            rel_path,
+            exam_id,
+            _text(meta.get("title")),
+            _text(meta.get("category")),
+            _text(meta.get("frequency")),
+            _text(meta.get("pdfFilename")),
+            _text(source_refs.get("shuiPdf")),
+            _dumps(payload.get("questionOrder") or []),
+            _dumps(payload.get("questionDisplayMap") or {}),
+            _dumps(payload),
+        ),
+    )
+    groups = payload.get("questionGroups") or []
+    conn.executemany(
+        "INSERT INTO question_groups VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [
+            (
+                rel_path,
+                exam_id,
+                position,
+                _text(group.get("groupId")),
+                _text(group.get("kind")),
+                _dumps(group.get("questionIds") or []),
+                str(group.get("bodyHtml") or ""),
+            )
+            for position, group in enumerate(groups)
+            if isinstance(group, dict)
+        ],
+    )
+    blocks = ((payload.get("passage") or {}).get("blocks")) or []
+    conn.executemany(
+        "INSERT INTO passages VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (
+                rel_path,
+                exam_id,
+                position,
+                _text(block.get("blockId")),
+                _text(block.get("kind")),
+                str(block.get("html") or ""),
+            )
+            for position, block in enumerate(blocks)
+            if isinstance(block, dict)
+        ],
+    )
+    answer_key = payload.get("answerKey") if isinstance(payload.get("answerKey"), dict) else {}
+    conn.executemany(
+        "INSERT INTO answer_keys VALUES (?, ?, ?, ?)",
+        [(rel_path, exam_id, str(question_id), _dumps(answer)) for question_id, answer in answer_key.items()],
+    )
+    return exam_id
+
+
+def _insert_explanation(conn: sqlite3.Connection, rel_path: str, payload: Dict[str, Any]) -> str:
+    meta = payload.get("meta") if isinstance(payload.get("meta"), dict) else {}
+    exam_id = _text(payload.get("examId")) or Path(rel_path).stem
+    conn.execute(
+        "INSERT INTO explanations VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            rel_path,
+            exam_id,
+            _text(meta.get("title")),
+            _text(meta.get("category")),
+            _text(meta.get("sourceDoc")),
+            _dumps(payload),
+        ),
+    )
+    return exam_id
+
+
+def refresh_corpus(conn: sqlite3.Connection, root: Path = ROOT) -> Dict[str, int]:
+    """Bring the database in line with the bundles on disk.
+
+    Files whose size and mtime are unchanged are skipped without hashing; the
+    rest are hashed and only re-parsed when the hash differs.
+    """
+    stats = {"scanned": 0, "parsed": 0, "unchanged": 0, "removed": 0, "parseErrors": 0}
+    sources = _scan_sources(root)
+    # 多个检查脚本可能并行刷新；IMMEDIATE 事务保证只有一个写者，后到者看到的是已刷新的表
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        known = {
+            row[0]: (row[1], row[2], row[3])
+            for row in conn.execute("SELECT path, sha256, mtime_ns, size FROM source_files")
+        }
+        for rel_path in set(known) - set(sources):
+            conn.execute("DELETE FROM source_files WHERE path = ?", (rel_path,))
+            stats["removed"] += 1
+
+        for rel_path, (kind, path) in sources.items():
+            stats["scanned"] += 1
+            stat = path.stat()
+            previous = known.get(rel_path)
+            if previous and previous[1] == stat.st_mtime_ns and previous[2] == stat.st_size:
+                stats["unchanged"] += 1
+                continue
+            raw = path.read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+            if previous and previous[0] == digest:
+                conn.execute(
+                    "UPDATE source_files SET mtime_ns = ?, size = ? WHERE path = ?",
+                    (stat.st_mtime_ns, stat.st_size, rel_path),
+                )
+                stats["unchanged"] += 1
+                continue
+
+            conn.execute("DELETE FROM source_files WHERE path = ?", (rel_path,))
+            conn.execute(
+                "INSERT INTO source_files VALUES (?, ?, ?, ?, ?, NULL, NULL)",
+                (rel_path, kind, digest, stat.st_mtime_ns, stat.st_size),
+            )
+            try:
+                _, payload = bundle_loader.parse_register_text(raw.decode("utf-8"))
+                if not isinstance(payload, dict):
+                    raise bundle_loader.BundleParseError("register_payload_not_object")
+            except (bundle_loader.BundleParseError, UnicodeDecodeError) as exc:
+                conn.execute("UPDATE source_files SET parse_error = ? WHERE path = ?", (str(exc), rel_path))
+                stats["parseErrors"] += 1
+                continue
+            insert = _insert_exam if kind == "exam" else _insert_explanation
+            exam_id = insert(conn, rel_path, payload)
+            conn.execute("UPDATE source_files SET exam_id = ? WHERE path = ?", (exam_id, rel_path))
+            stats["parsed"] += 1
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return stats
+
+
+def connect(
+    root: Path = ROOT,
+    db_path: Optional[Path] = None,
+    *,
+    refresh: bool = True,
+) -> sqlite3.Connection:
+    """Open (creating if needed) the corpus database and refresh it by default."""
+    path = db_path or default_db_path(root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=60, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    _prepare_schema(conn)
+    if refresh:
+        refresh_corpus(conn, root)
+    return conn
+
+
+def relative_key(path: Path, root: Path = ROOT) -> str:
+    return path.resolve().relative_to(root.resolve()).as_posix()
+
+
+def load_payload(conn: sqlite3.Connection, rel_path: str) -> Optional[Dict[str, Any]]:
+    """Return the decoded payload stored for a bundle, or None if missing/unparsable."""
+    row = conn.execute(
+        "SELECT payload FROM exams WHERE path = ? UNION ALL SELECT payload FROM explanations WHERE path = ?",
+        (rel_path, rel_path),
+    ).fetchone()
+    return json.loads(row[0]) if row else None
+
+
+def iter_payloads(conn: sqlite3.Connection, kind: str) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+    """Yield ``(path, payload)`` for every bundle of ``kind`` in path order; payload is None on parse errors."""
+    table = "exams" if kind == "exam" else "explanations"
+    query = (
+        f"SELECT source_files.path, {table}.payload FROM source_files "
+        f"LEFT JOIN {table} ON {table}.path = source_files.path "
+        "WHERE source_files.kind = ? ORDER BY source_files.path"
+    )
+    for row in conn.execute(query, (kind,)):
+        yield row[0], (json.loads(row[1]) if row[1] is not None else None)
+
+
+def parse_errors(conn: sqlite3.Connection) -> List[Dict[str, str]]:
+    return [
+        {"path": row[0], "kind": row[1], "error": row[2]}
+        for row in conn.execute(
+            "SELECT path, kind, parse_error FROM source_files WHERE parse_error IS NOT NULL ORDER BY path"
+        )
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build or refresh the reading corpus SQLite database")
+    parser.add_argument("--db", type=Path, default=None, help="database path (default: developer/tests/reports/)")
+    parser.add_argument("--rebuild", action="store_true", help="drop the existing database before refreshing")
+    args = parser.parse_args()
+
+    db_path = args.db or default_db_path(ROOT)
+    if args.rebuild and db_path.exists():
+        db_path.unlink()
+    conn = connect(ROOT, db_path, refresh=False)
+    stats = refresh_corpus(conn, ROOT)
+    stats["parseErrorFiles"] = [item["path"] for item in parse_errors(conn)]
+    conn.close()
+    print(json.dumps(stats, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
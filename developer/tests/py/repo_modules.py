@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Load repository scripts that are not importable packages.
+
+`developer/tests/py` helpers import each other by name; entry points elsewhere
+(`assets/scripts`, `developer/tests/ci`) put this directory on `sys.path` once
+and import them the same way.  `load_repo_module` covers the remaining case of
+loading a standalone script (for example a builder under `assets/scripts`) by
+path, registered in `sys.modules` under `name` so repeated loads share one
+module object.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Union
+
+
+def load_repo_module(name: str, path: Union[str, Path]) -> ModuleType:
+    module = sys.modules.get(name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(name, path)
+        if spec is None or spec.loader is None:
+            raise RuntimeError(f"无法加载模块: {path}")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(name, None)
+            raise
+    return module
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from repo_modules import load_repo_module
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SCRIPT_PATH = REPO_ROOT / "assets" / "scripts" / "build_reading_exam_search_index.py"
+
+
+def load_index_builder():
+    return load_repo_module("build_reading_exam_search_index", SCRIPT_PATH)
+
+
+def write_exam_dir(root: Path, payloads) -> None:
+    manifest = {
+        exam_id: {"examId": exam_id, "dataKey": exam_id, "script": f"./{exam_id}.js", "title": title}
+        for exam_id, (title, _) in payloads.items()
+    }
+    manifest["p9-pdf-only"] = {"examId": "p9-pdf-only", "dataKey": None, "script": None}
+    (root / "manifest.js").write_text(
+        "(function registerReadingExamManifest(global) {\n"
+        "  'use strict';\n"
+        f"  const manifest = {json.dumps(manifest, indent=2)};\n"
+        "\n"
+        "  global.__READING_EXAM_MANIFEST__ = manifest;\n"
+        "})(typeof window !== \"undefined\" ? window : globalThis);\n",
+        encoding="utf-8",
+    )
+    for exam_id, (_, payload) in payloads.items():
+        (root / f"{exam_id}.js").write_text(
+            f"global.__READING_EXAM_DATA__.register({json.dumps(exam_id)}, {json.dumps(payload, indent=2)});\n",
+            encoding="utf-8",
+        )
+
+
+def exam(passage: str, prompt: str):
+    return {
+        "passage": {"blocks": [{"kind": "paragraph", "html": f"<h4>READING PASSAGE 1</h4>\n<p>{passage}</p>"}]},
+        "questionGroups": [{
+            "kind": "true_false_not_given",
+            "questionIds": ["q1"],
+            "bodyHtml": f'<div class="question-item" id="q1-anchor"><p>1. {prompt}</p></div>',
+        }],
+    }
+
+
+class SearchIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.builder = load_index_builder()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        write_exam_dir(self.root, {
+            "p1-tea": ("A Brief History of Tea 茶叶简史", exam("Tea leaves were traded.", "Tea came from China.")),
+            "p2-bees": ("Bees", exam("Honey bees visit flowers.", "Flowers need bees.")),
+            "p3-kiwi": ("Kiwi", exam("The kiwi cannot fly.", "Kiwis drink tea.")),
+        })
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_tokenize_matches_browser_tokenizer_sample(self) -> None:
+        # same sample as developer/tests/js/readingExamSearch.test.js
+        tokens = self.builder.tokenize("The Kiwi's Studies of ＴＥＡ, 1990s bees 茶叶 a I")
+        self.assertEqual(tokens, ["kiwi", "study", "tea", "1990", "bee", "茶", "叶"])
+
+    def test_postings_are_delta_encoded_with_weighted_title(self) -> None:
+        index = self.builder.build_search_index(self.root)
+        self.assertEqual(index["ids"], ["p1-tea", "p2-bees", "p3-kiwi"])
+        rows = {row[0]: row for row in index["terms"]}
+        self.assertEqual([row[0] for row in index["terms"]], sorted(rows))
+        self.assertEqual(rows["tea"], ["tea", 0, 5, 2, 1])
+        self.assertEqual(self.builder.decode_postings(rows["tea"]), [[0, 5], [2, 1]])
+        self.assertEqual(self.builder.decode_postings(rows["bee"]), [[1, 5]])
+        self.assertNotIn("reading", rows, "exam instructions are not indexed")
+        self.assertEqual(self.builder.decode_postings(rows["kiwi"]), [[2, 5]])
+        self.assertIn("茶", rows)
+        self.assertEqual(index["avgLength"], round(sum(index["lengths"]) / 3, 2))
+
+    def test_sync_writes_script_then_is_a_no_op(self) -> None:
+        result = self.builder.sync_search_index(self.root)
+        self.assertTrue(result["changed"])
+        text = (self.root / "search" / "index.js").read_text(encoding="utf-8")
+        self.assertIn("global.__READING_EXAM_SEARCH_INDEX__ = {", text)
+        self.assertIn('      ["tea",0,5,2,1],', text)
+        self.assertFalse(self.builder.sync_search_index(self.root, write=False)["changed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
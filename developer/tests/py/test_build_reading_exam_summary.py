@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from repo_modules import load_repo_module
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SCRIPT_PATH = REPO_ROOT / "assets" / "scripts" / "build_reading_exam_summary.py"
+
+
+def load_summary_builder():
+    return load_repo_module("build_reading_exam_summary", SCRIPT_PATH)
+
+
+def write_exam_dir(root: Path, payloads) -> None:
+    manifest = {
+        exam_id: {"examId": exam_id, "dataKey": exam_id, "script": f"./{exam_id}.js"} for exam_id in payloads
+    }
+    manifest["p9-pdf-only"] = {"examId": "p9-pdf-only", "dataKey": None, "script": None}
+    (root / "manifest.js").write_text(
+        "(function registerReadingExamManifest(global) {\n"
+        "  'use strict';\n"
+        f"  const manifest = {json.dumps(manifest, indent=2)};\n"
+        "\n"
+        "  global.__READING_EXAM_MANIFEST__ = manifest;\n"
+        "})(typeof window !== \"undefined\" ? window : globalThis);\n",
+        encoding="utf-8",
+    )
+    for exam_id, payload in payloads.items():
+        (root / f"{exam_id}.js").write_text(
+            f"global.__READING_EXAM_DATA__.register({json.dumps(exam_id)}, {json.dumps(payload, indent=2)});\n",
+            encoding="utf-8",
+        )
+
+
+class ExamSummaryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.builder = load_summary_builder()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.payloads = {
+            "p1-demo": {
+                "examId": "p1-demo",
+                "passage": {"blocks": [{"kind": "paragraph", "html": "<p>Kiwi birds can't fly.</p><p>Well-known fact.</p>"}]},
+                "questionGroups": [
+                    {"kind": "true_false_not_given", "questionIds": ["q1", "q2"]},
+                    {"kind": "sentence_completion", "questionIds": ["q3"]},
+                ],
+                "questionOrder": ["q1", "q2", "q3"],
+                "answerKey": {"q1": "TRUE", "q2": "FALSE", "q3": "wings"},
+            },
+            "p2-demo": {
+                "examId": "p2-demo",
+                "passage": {"blocks": [{"kind": "text", "bodyHtml": "<div>One two three</div>"}]},
+                "questionGroups": [{"kind": "matching_headings", "questionIds": ["q1", "q2"]}],
+                "answerKey": {"q1": "i"},
+            },
+        }
+        write_exam_dir(self.root, self.payloads)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_summary_rows_cover_counts_kinds_and_words(self) -> None:
+        row = self.builder.summarize_exam(self.payloads["p1-demo"])
+        self.assertEqual(row["questionCount"], 3)
+        self.assertEqual(row["kinds"], ["sentence_completion", "true_false_not_given"])
+        self.assertEqual(row["wordCount"], 6)
+        self.assertEqual(row["answerCount"], 3)
+
+        fallback = self.builder.summarize_exam(self.payloads["p2-demo"])
+        self.assertEqual((fallback["questionCount"], fallback["wordCount"]), (2, 3))
+
+    def test_sync_writes_columns_to_manifest_then_is_a_no_op(self) -> None:
+        result = self.builder.sync_summary(self.root)
+        self.assertTrue(result["changed"])
+        manifest_text = (self.root / "manifest.js").read_text(encoding="utf-8")
+        table = self.builder.bundle_loader.parse_assignment_text(manifest_text, ("const READING_EXAM_SUMMARY =",))
+        self.assertEqual(table["ids"], ["p1-demo", "p2-demo"])
+        self.assertEqual(table["kinds"], ["matching_headings", "sentence_completion", "true_false_not_given"])
+        self.assertEqual(table["columns"]["kindMask"], [6, 1])
+        self.assertEqual(table["columns"]["answerCount"], [3, 1])
+        self.assertIn("global.__READING_EXAM_SUMMARY__ = READING_EXAM_SUMMARY;", manifest_text)
+
+        self.assertFalse(self.builder.sync_summary(self.root, write=False)["changed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
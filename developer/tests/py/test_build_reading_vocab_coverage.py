@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from repo_modules import load_repo_module
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SCRIPT_PATH = REPO_ROOT / "assets" / "scripts" / "build_reading_vocab_coverage.py"
+
+
+def load_coverage_builder():
+    return load_repo_module("build_reading_vocab_coverage", SCRIPT_PATH)
+
+
+def write_exam_dir(root: Path, passages) -> None:
+    manifest = {
+        exam_id: {"examId": exam_id, "dataKey": exam_id, "script": f"./{exam_id}.js"} for exam_id in passages
+    }
+    manifest["p9-pdf-only"] = {"examId": "p9-pdf-only", "dataKey": None, "script": None}
+    (root / "manifest.js").write_text(
+        "(function registerReadingExamManifest(global) {\n"
+        "  'use strict';\n"
+        f"  const manifest = {json.dumps(manifest, indent=2)};\n"
+        "\n"
+        "  global.__READING_EXAM_MANIFEST__ = manifest;\n"
+        "})(typeof window !== \"undefined\" ? window : globalThis);\n",
+        encoding="utf-8",
+    )
+    for exam_id, text in passages.items():
+        payload = {"passage": {"blocks": [{"kind": "paragraph", "html": f"<p>{text}</p>"}]}}
+        (root / f"{exam_id}.js").write_text(
+            f"global.__READING_EXAM_DATA__.register({json.dumps(exam_id)}, {json.dumps(payload, indent=2)});\n",
+            encoding="utf-8",
+        )
+
+
+class VocabCoverageTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.builder = load_coverage_builder()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.wordlist = self.root / "ielts_core.json"
+        self.wordlist.write_text(json.dumps([
+            {"word": "Emperor", "meaning": "n. 皇帝", "freq": 1},
+            {"word": "carry", "meaning": "v. 携带"},
+            {"word": "well-being", "meaning": "n. 幸福"},
+            {"word": "seek", "meaning": "v. 寻求"},
+            {"word": "hope", "meaning": "v. 希望"},
+            {"word": "in accordance with", "meaning": "依照"},
+            {"word": "emperor", "meaning": "duplicate"},
+        ]), encoding="utf-8")
+        write_exam_dir(self.root, {
+            "p1-demo": "The emperor's servants carried tea. Emperors sought well-being.",
+            "p2-demo": "Farmers hoped for rain; the hoping never stopped.",
+        })
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_lemmas_resolve_against_the_wordlist(self) -> None:
+        words = self.builder.load_wordlist(self.wordlist)
+        self.assertEqual(words, ["emperor", "carry", "well-being", "seek", "hope"])
+        vocabulary = set(words)
+        lemmas = [self.builder.lemmatize(token, vocabulary) for token in ("carried", "emperors", "sought", "hoping", "better")]
+        self.assertEqual(lemmas, ["carry", "emperor", "seek", "hope", "better"])
+        self.assertEqual(
+            self.builder.tokenize("Tea-drinking well-being", vocabulary),
+            ["tea", "drinking", "well-being"],
+        )
+
+    def test_coverage_columns_and_delta_encoded_word_index(self) -> None:
+        coverage = self.builder.build_coverage(self.root, self.wordlist)
+        self.assertEqual(coverage["ids"], ["p1-demo", "p2-demo"])
+        self.assertEqual(coverage["wordlistSize"], 5)
+        self.assertEqual(coverage["coverage"]["tokenCount"], [8, 8])
+        self.assertEqual(coverage["coverage"]["coreTokenCount"], [5, 2])
+        self.assertEqual(coverage["coverage"]["coreWordCount"], [4, 1])
+        rows = {row[0]: row for row in coverage["words"]}
+        self.assertEqual(list(rows), ["carry", "emperor", "hope", "seek", "well-being"])
+        self.assertEqual(rows["emperor"], ["emperor", 0, 2])
+        self.assertEqual(rows["hope"], ["hope", 1, 2])
+
+    def test_sync_writes_script_then_is_a_no_op(self) -> None:
+        result = self.builder.sync_coverage(self.root, self.wordlist)
+        self.assertTrue(result["changed"])
+        text = (self.root / "vocab" / "ielts_core.coverage.js").read_text(encoding="utf-8")
+        self.assertIn("global.__READING_VOCAB_COVERAGE__ = {", text)
+        self.assertIn('      ["hope",1,2]', text)
+        self.assertFalse(self.builder.sync_coverage(self.root, self.wordlist, write=False)["changed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from repo_modules import load_repo_module
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SCRIPT_PATH = REPO_ROOT / "developer" / "tests" / "ci" / "check_reading_data_integrity.py"
+
+
+def load_integrity_check():
+    return load_repo_module("check_reading_data_integrity", SCRIPT_PATH)
+
+
+def make_passage(seed: int, length: int = 240) -> str:
+    rng = random.Random(seed)
+    vocabulary = [f"word{index}" for index in range(400)]
+    return " ".join(rng.choice(vocabulary) for _ in range(length))
+
+
+def reword(text: str, positions) -> str:
+    words = text.split()
+    for position in positions:
+        words[position] = f"edited{position}"
+    return " ".join(words)
+
+
+class NearDuplicateDetectionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.check = load_integrity_check()
+        self.original = make_passage(1)
+        self.texts = {
+            "p1-original": self.original,
+            # 三处改词：约 15 个 shingle 不同，真实 Jaccard ≈ 0.88
+            "p1-reworded": reword(self.original, (40, 120, 200)),
+            "p2-unrelated": make_passage(2),
+            "p3-unrelated": make_passage(3),
+        }
+        self.signatures = {
+            exam_id: self.check.minhash_signature(self.check.word_shingles(text))
+            for exam_id, text in self.texts.items()
+        }
+
+    def test_signature_estimates_jaccard(self) -> None:
+        left = self.check.word_shingles(self.texts["p1-original"])
+        right = self.check.word_shingles(self.texts["p1-reworded"])
+        exact = len(left & right) / len(left | right)
+        estimate = self.check.estimate_jaccard(self.signatures["p1-original"], self.signatures["p1-reworded"])
+        self.assertAlmostEqual(estimate, exact, delta=0.1)
+        self.assertIsNone(self.check.minhash_signature([]))
+
+    def test_near_identical_pair_is_candidate_and_cluster(self) -> None:
+        pairs = self.check.lsh_candidate_pairs(self.signatures)
+        self.assertIn(("p1-original", "p1-reworded"), pairs)
+
+        clusters = self.check.find_near_duplicates(self.signatures)
+        self.assertEqual([cluster["examIds"] for cluster in clusters], [["p1-original", "p1-reworded"]])
+        pair = clusters[0]["pairs"][0]
+        self.assertEqual(pair["examIds"], ["p1-original", "p1-reworded"])
+        self.assertGreaterEqual(pair["jaccardEstimate"], self.check.NEAR_DUPLICATE_THRESHOLD)
+
+    def test_unrelated_passages_are_not_paired(self) -> None:
+        pairs = self.check.lsh_candidate_pairs(self.signatures)
+        unrelated = {"p2-unrelated", "p3-unrelated"}
+        self.assertFalse([pair for pair in pairs if unrelated & set(pair)])
+        self.assertLess(
+            self.check.estimate_jaccard(self.signatures["p2-unrelated"], self.signatures["p3-unrelated"]),
+            self.check.NEAR_DUPLICATE_THRESHOLD,
+        )
+
+    def test_cluster_pairs_merges_transitively(self) -> None:
+        clusters = self.check.cluster_pairs([("c", "d"), ("a", "b"), ("x", "y"), ("b", "c")])
+        self.assertEqual(clusters, [["a", "b", "c", "d"], ["x", "y"]])
+        self.assertEqual(self.check.cluster_pairs([]), [])
+
+
+class NearDuplicateAllowlistTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.check = load_integrity_check()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.allowlist_path = Path(self.tmp.name) / "allowlist.json"
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_allowlisted_group_is_suppressed_and_others_reported(self) -> None:
+        self.allowlist_path.write_text(
+            json.dumps({
+                "allowedDuplicateKeys": ["P2::Same Title "],
+                "allowedNearDuplicateGroups": [["p1-a", "p1-b", "p1-c"]],
+            }),
+            encoding="utf-8",
+        )
+        keys, groups = self.check.load_allowlist(self.allowlist_path)
+        self.assertEqual((keys, groups), ({"p2::same title"}, [{"p1-a", "p1-b", "p1-c"}]))
+
+        clusters = [
+            {"examIds": ["p1-a", "p1-b"], "pairs": []},
+            {"examIds": ["p1-a", "p1-z"], "pairs": []},
+            {"examIds": ["p2-x", "p2-y"], "pairs": []},
+            {"examIds": ["p3-x", "p3-y"], "pairs": []},
+        ]
+        key_by_exam_id = {
+            "p2-x": "p2::same title",
+            "p2-y": "p2::same title",
+            "p3-x": "p3::first title",
+            "p3-y": "p3::second title",
+        }
+        allowlisted, blocking = self.check.split_near_duplicates(clusters, key_by_exam_id, keys, groups)
+        self.assertEqual(
+            [cluster["examIds"] for cluster in allowlisted],
+            [["p1-a", "p1-b"], ["p2-x", "p2-y"]],
+        )
+        # 只有部分成员在允许组里的簇仍然要报出来
+        self.assertEqual(
+            [cluster["examIds"] for cluster in blocking],
+            [["p1-a", "p1-z"], ["p3-x", "p3-y"]],
+        )
+
+    def test_missing_or_invalid_allowlist_allows_nothing(self) -> None:
+        self.assertEqual(self.check.load_allowlist(self.allowlist_path), (set(), []))
+        self.allowlist_path.write_text("{not json", encoding="utf-8")
+        self.assertEqual(self.check.load_allowlist(self.allowlist_path), (set(), []))
+
+
+if __name__ == "__main__":
+    unittest.main()
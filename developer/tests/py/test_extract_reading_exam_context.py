@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import io
+import json
+import unittest
+from pathlib import Path
+
+from repo_modules import load_repo_module
+
+
+HELPER_PATH = Path(__file__).resolve().parent / "extract_reading_exam_context.py"
+# 由改写前的正则实现（strip_html + 逐题 re.search）对同一批考试生成
+WALK_FIXTURE_PATH = Path(__file__).resolve().parents[1] / "fixtures" / "reading-exam-html-walk-contexts.json"
+
+
+def load_helper():
+    return load_repo_module("extract_reading_exam_context", HELPER_PATH)
+
+
+class ContextStreamingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.helper = load_helper()
+        self.exam_ids = self.helper.list_exam_ids()
+        if len(self.exam_ids) < 3:
+            self.skipTest("reading exam bundles are not available")
+
+    def test_selectors_merge_in_first_seen_order(self) -> None:
+        first, second = self.exam_ids[0], self.exam_ids[1]
+        selected = self.helper.select_exam_ids([second], [first, second], False)
+        self.assertEqual(selected, [second, first])
+        self.assertEqual(self.helper.select_exam_ids([], [], True), self.exam_ids)
+        self.assertEqual(self.helper.select_exam_ids([], ["no-such-*"], False), [])
+
+    def test_stream_writes_one_context_per_line(self) -> None:
+        exam_ids = self.exam_ids[:3]
+        for compact in (False, True):
+            with self.subTest(compact=compact):
+                out = io.StringIO()
+                failures = self.helper.stream_contexts(exam_ids, out, compact=compact)
+                self.assertEqual(failures, 0)
+                lines = out.getvalue().splitlines()
+                self.assertEqual(len(lines), len(exam_ids))
+                if compact:
+                    self.assertNotIn('", "', lines[0][:200])
+                for exam_id, line in zip(exam_ids, lines):
+                    self.assertEqual(json.loads(line), self.helper.build_context(exam_id))
+
+    def test_parallel_stream_matches_serial(self) -> None:
+        exam_ids = self.exam_ids[:6]
+        serial, parallel = io.StringIO(), io.StringIO()
+        self.helper.stream_contexts(exam_ids, serial)
+        self.helper.stream_contexts(exam_ids, parallel, jobs=2)
+        self.assertEqual(parallel.getvalue(), serial.getvalue())
+
+    def test_missing_exam_is_reported_and_skipped(self) -> None:
+        out = io.StringIO()
+        failures = self.helper.stream_contexts(["p9-missing-000", self.exam_ids[0]], out)
+        self.assertEqual(failures, 1)
+        self.assertEqual(json.loads(out.getvalue())["examId"], self.exam_ids[0])
+
+
+class ExamHtmlWalkFixtureTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.helper = load_helper()
+        self.cases = json.loads(WALK_FIXTURE_PATH.read_text(encoding="utf-8"))
+        missing = [case["examId"] for case in self.cases if case["examId"] not in self.helper.list_exam_ids()]
+        if missing:
+            self.skipTest(f"reading exam bundles are not available: {missing}")
+
+    def test_contexts_match_fixture(self) -> None:
+        for case in self.cases:
+            with self.subTest(exam_id=case["examId"]):
+                context = self.helper.build_context(case["examId"])
+                self.assertEqual(context["passageParagraphs"], case["passageParagraphs"])
+                self.assertEqual(context["questionGroups"], case["questionGroups"])
+
+    def test_fixture_covers_each_extraction_path(self) -> None:
+        covered = set()
+        for case in self.cases:
+            payload = self.helper.load_exam_payload(case["examId"])
+            blocks = payload["passage"]["blocks"]
+            questions = [question for group in case["questionGroups"] for question in group["questions"]]
+            if "passage-bodyHtml-fallback" in case["covers"]:
+                self.assertTrue(any(not block.get("html") and block.get("bodyHtml") for block in blocks))
+                self.assertTrue(case["passageParagraphs"])
+            if "gap-fill" in case["covers"]:
+                self.assertTrue(any("______" in question["prompt"] for question in questions))
+            walks = [
+                (self.helper.ExamHtmlWalk(group.get("bodyHtml") or ""), expected["questions"])
+                for group, expected in zip(payload["questionGroups"], case["questionGroups"])
+            ]
+            if "question-items" in case["covers"]:
+                self.assertTrue(any(walk.question_items for walk, _ in walks))
+            if "loose-fallback" in case["covers"]:
+                self.assertTrue(any(
+                    group_questions
+                    and not walk.question_items
+                    and not any("______" in question["prompt"] for question in group_questions)
+                    for walk, group_questions in walks
+                ))
+            markup = self.helper.passage_html(payload) + "".join(
+                group.get("bodyHtml") or "" for group in payload["questionGroups"]
+            )
+            if "line-breaks" in case["covers"]:
+                self.assertRegex(markup, r"(?i)<br\s*/?>")
+            if "list-items" in case["covers"]:
+                self.assertIn("</li>", markup.lower())
+            covered.update(case["covers"])
+        self.assertEqual(
+            covered,
+            {"question-items", "gap-fill", "loose-fallback", "passage-bodyHtml-fallback", "line-breaks", "list-items"},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from repo_modules import load_repo_module
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SCRIPT_PATH = REPO_ROOT / "assets" / "scripts" / "minify_reading_exam_html.py"
+
+
+def load_minifier():
+    return load_repo_module("minify_reading_exam_html", SCRIPT_PATH)
+
+
+WRAPPER = (
+    "(function registerReadingExamData(global) {{\n"
+    "  global.__READING_EXAM_DATA__.register(\"{key}\", {body});\n"
+    "}})(typeof window !== \"undefined\" ? window : globalThis);\n"
+)
+
+
+class MinifyHtmlTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.minifier = load_minifier()
+
+    def test_block_whitespace_and_comments_are_dropped(self) -> None:
+        html = "\n    <h2>Title</h2>\n    <!-- Draggable Divider -->\n    <p>One\n        two  three</p>\n"
+        self.assertEqual(self.minifier.minify_html(html), "<h2>Title</h2>\n<p>One two three</p>")
+
+    def test_inline_spacing_and_nbsp_survive(self) -> None:
+        html = (
+            '<p>people in <span class="drop-target-summary"></span> used</p>'
+            '<div><label><input type="radio"> A</label>\n      <label><input type="radio"> B</label></div>'
+            "<p>&nbsp; x</p>"
+        )
+        self.assertEqual(
+            self.minifier.minify_html(html),
+            '<p>people in <span class="drop-target-summary"></span> used</p>'
+            '<div><label><input type="radio"> A</label> <label><input type="radio"> B</label></div>'
+            "<p>&nbsp; x</p>",
+        )
+
+    def test_preformatted_content_is_kept(self) -> None:
+        html = "<div>\n  <pre>  a\n    b  </pre>\n  <textarea>\n x </textarea></div>"
+        self.assertEqual(self.minifier.minify_html(html), "<div>\n<pre>  a\n    b  </pre>\n<textarea>\n x </textarea></div>")
+
+    def test_minify_is_idempotent(self) -> None:
+        html = "<section>\n<p>a</p>\n\n<!-- c -->\n\n<div> b <em>c</em> </div>\n</section>"
+        once = self.minifier.minify_html(html)
+        self.assertEqual(self.minifier.minify_html(once), once)
+
+
+class MinifyBundleTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.minifier = load_minifier()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def write_bundle(self, key: str, body: str) -> Path:
+        path = self.root / f"{key}.js"
+        path.write_text(WRAPPER.format(key=key, body=body), encoding="utf-8")
+        return path
+
+    def test_only_html_fields_are_rewritten(self) -> None:
+        payload = {
+            "examId": "p1-demo",
+            "meta": {"title": "  Spaced   title  "},
+            "passage": {"blocks": [{"type": "html", "html": "\n  <p>Text</p>\n  <p>More</p>\n"}]},
+            "questionGroups": [{"leadHtml": "<h3>Q</h3>", "bodyHtml": "<div>\n  <p>1. Prompt</p>\n</div>"}],
+        }
+        path = self.write_bundle("p1-demo", json.dumps(payload, ensure_ascii=False, indent=2))
+        original = path.read_text(encoding="utf-8")
+
+        report = self.minifier.minify_bundles([path])
+        rewritten = path.read_text(encoding="utf-8")
+        self.assertTrue(rewritten.startswith(original[: original.index("{\n")]))
+        self.assertTrue(rewritten.endswith(original[original.rindex("}"):]))
+        _, decoded = self.minifier.bundle_loader.parse_register_text(rewritten)
+        self.assertEqual(decoded, self.minifier.minify_payload(payload))
+        self.assertEqual(decoded["meta"]["title"], "  Spaced   title  ")
+        self.assertEqual(decoded["passage"]["blocks"][0]["html"], "<p>Text</p>\n<p>More</p>")
+        (exam,) = report["exams"]
+        self.assertEqual((exam["fields"], exam["changedFields"]), (3, 2))
+        self.assertEqual(exam["savedBytes"], len(original.encode("utf-8")) - len(rewritten.encode("utf-8")))
+
+        again = self.minifier.minify_bundles([path], write=False)
+        self.assertEqual(again["summary"]["changedBundles"], 0)
+
+    def test_js_object_literal_bundles_are_left_alone(self) -> None:
+        path = self.write_bundle("p3-demo", "{ examId: 'p3-demo', passage: { blocks: [{ html: '<p>a</p>\\n  <p>b</p>' }] }, }")
+        original = path.read_text(encoding="utf-8")
+        report = self.minifier.minify_bundles([path])
+        self.assertEqual(path.read_text(encoding="utf-8"), original)
+        self.assertEqual(report["skipped"], [{"file": "p3-demo.js", "reason": "js_object_literal"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from repo_modules import load_repo_module
+
+
+SUITE_PATH = Path(__file__).resolve().parents[1] / "ci" / "run_static_suite.py"
+
+
+def load_static_suite():
+    return load_repo_module("run_static_suite", SUITE_PATH)
+
+
+@unittest.skipUnless(shutil.which("node"), "node is not installed")
+class NodeTestHostIsolationTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.suite = load_static_suite()
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.host = self.suite._NodeTestHost()
+
+    def tearDown(self) -> None:
+        self.host.close()
+        self.tmp.cleanup()
+
+    def write_test(self, name: str, source: str) -> Path:
+        path = self.root / name
+        path.write_text(source, encoding="utf-8")
+        return path
+
+    def test_failure_in_pending_io_fails_the_test(self) -> None:
+        late = self.write_test(
+            "late.test.mjs",
+            "import fs from 'fs';\n"
+            "import zlib from 'zlib';\n"
+            "fs.promises.readFile(new URL(import.meta.url)).then(() => {\n"
+            "    zlib.gzip('payload', () => { throw new Error('late failure'); });\n"
+            "});\n",
+        )
+        clean = self.write_test("clean.test.mjs", "process.stdout.write('{\"status\":\"pass\"}');\n")
+
+        exit_code, stdout, stderr = self.host.run(late, 30)
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(stdout, "")
+        self.assertIn("late failure", stderr)
+
+        # the late error stays with its own test instead of leaking into the next one
+        exit_code, stdout, stderr = self.host.run(clean, 30)
+        self.assertEqual((exit_code, stdout, stderr), (0, '{"status":"pass"}', ""))
+
+    def test_output_after_exit_is_not_captured(self) -> None:
+        path = self.write_test(
+            "exit.test.mjs",
+            "process.stdout.write('{\"status\":\"fail\"}');\n"
+            "process.exit(1);\n"
+            "process.stdout.write('{\"status\":\"pass\"}');\n",
+        )
+        exit_code, stdout, _ = self.host.run(path, 30)
+        self.assertEqual((exit_code, stdout), (1, '{"status":"fail"}'))
+
+    def test_node_globals_and_env_are_available(self) -> None:
+        path = self.write_test(
+            "globals.test.mjs",
+            "const names = ['crypto', 'fetch', 'Blob', 'EventTarget'].filter((name) => typeof globalThis[name] === 'undefined');\n"
+            "process.stdout.write(JSON.stringify({ missing: names, flag: process.env.HOST_TEST_FLAG }));\n",
+        )
+        exit_code, stdout, _ = self.host.run(path, 30, env={"HOST_TEST_FLAG": "on"})
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(stdout, '{"missing":[],"flag":"on"}')
+
+
+class StaticCheckCacheKeyTest(unittest.TestCase):
+    def test_host_script_is_part_of_node_host_keys(self) -> None:
+        suite = load_static_suite()
+        with tempfile.TemporaryDirectory() as tmp:
+            check = suite._node_check("host key", SUITE_PATH, inputs=("developer/package.json",))
+            plain = suite._python_check("plain key", SUITE_PATH, inputs=("developer/package.json",))
+            original = suite._StaticCheckCache(Path(tmp) / "cache.json")
+            edited = suite._StaticCheckCache(Path(tmp) / "cache.json")
+            edited._digests[suite.NODE_TEST_HOST.resolve()] = "edited host"
+
+            self.assertNotEqual(original.key_for(check), edited.key_for(check))
+            self.assertEqual(original.key_for(plain), edited.key_for(plain))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from repo_modules import load_repo_module
+
+
+LOADER_PATH = Path(__file__).resolve().parent / "reading_bundle_loader.py"
+
+
+def load_bundle_loader():
+    return load_repo_module("reading_bundle_loader", LOADER_PATH)
+
+
+class StreamingFieldExtractionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.loader = load_bundle_loader()
+        self.loader.clear_cache()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self) -> None:
+        self.loader.clear_cache()
+        self.tmp.cleanup()
+
+    def write_bundle(self, name: str, body: str) -> Path:
+        path = self.root / name
+        path.write_text(
+            "(function registerReadingExamData(global) {\n"
+            f"  global.__READING_EXAM_DATA__.register(\"{path.stem}\", {body});\n"
+            "})(typeof window !== \"undefined\" ? window : globalThis);\n",
+            encoding="utf-8",
+        )
+        return path
+
+    def test_fields_match_full_decode_across_chunk_sizes(self) -> None:
+        payload = {
+            "examId": "p1-demo",
+            "meta": {"title": "Demo \"quoted\" 标题", "category": "P1", "pdfFilename": "1. P1 - Demo.pdf"},
+            "passage": {"blocks": [{"html": "<p>" + "text with \\ backslash and \"quotes\" { [ " * 200 + "</p>"}]},
+            "questionGroups": [{"meta": {"title": "nested title must be ignored"}}],
+            "sourceRefs": {"shuiPdf": "dir/1. P1 - Demo.pdf"},
+        }
+        path = self.write_bundle("p1-demo.js", json.dumps(payload, ensure_ascii=False, indent=2))
+        expected = {
+            "examId": "p1-demo",
+            "title": "Demo \"quoted\" 标题",
+            "category": "P1",
+            "pdfFilename": "1. P1 - Demo.pdf",
+            "shuiPdf": "dir/1. P1 - Demo.pdf",
+        }
+        for chunk_size in (1, 3, 7, 64, 4096):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self.loader.extract_register_fields(path, chunk_size=chunk_size), expected)
+                self.loader.clear_cache()
+
+    def test_missing_fields_are_omitted(self) -> None:
+        path = self.write_bundle("p2-demo.js", json.dumps({"examId": "p2-demo", "meta": {"title": "Only title"}}))
+        self.assertEqual(
+            self.loader.extract_register_fields(path),
+            {"examId": "p2-demo", "title": "Only title"},
+        )
+
+    def test_js_object_literal_falls_back_to_full_decode(self) -> None:
+        path = self.write_bundle(
+            "p3-demo.js",
+            '{ examId: "p3-demo", meta: { title: "Literal", pdfFilename: "3. P3 - Literal.pdf", }, }',
+        )
+        self.assertEqual(
+            self.loader.extract_register_fields(path, {"pdfFilename": ("meta", "pdfFilename")}),
+            {"pdfFilename": "3. P3 - Literal.pdf"},
+        )
+
+    def test_register_key_mismatch_is_reported(self) -> None:
+        path = self.write_bundle("p1-other.js", json.dumps({"examId": "p1-other"}))
+        with self.assertRaises(self.loader.BundleParseError):
+            self.loader.extract_register_fields(path, register_key="p1-expected")
+
+
+
+class ManifestConstantTest(unittest.TestCase):
+    MANIFEST = (
+        "(function registerReadingExamManifest(global) {\n"
+        "  'use strict';\n"
+        "  const manifest = {\n    \"p1-demo\": {\"script\": \"./p1-demo.js\"}\n  };\n"
+        "\n"
+        "  global.__READING_EXAM_MANIFEST__ = manifest;\n"
+        "})(typeof window !== \"undefined\" ? window : globalThis);\n"
+    )
+
+    def setUp(self) -> None:
+        self.loader = load_bundle_loader()
+
+    def test_constant_is_added_then_replaced_in_place(self) -> None:
+        first = self.loader.upsert_manifest_constant(self.MANIFEST, "DEMO_TABLE", '{"a": [1]}', "__DEMO_TABLE__")
+        self.assertIn('  };\n  const DEMO_TABLE = {"a": [1]};\n', first)
+        self.assertIn(
+            "  global.__READING_EXAM_MANIFEST__ = manifest;\n  global.__DEMO_TABLE__ = DEMO_TABLE;\n",
+            first,
+        )
+        self.assertEqual(
+            self.loader.parse_assignment_text(first, ("const manifest =",)),
+            {"p1-demo": {"script": "./p1-demo.js"}},
+        )
+        self.assertEqual(self.loader.parse_assignment_text(first, ("const DEMO_TABLE =",)), {"a": [1]})
+        self.assertEqual(
+            self.loader.upsert_manifest_constant(first, "DEMO_TABLE", '{"a": [1]}', "__DEMO_TABLE__"),
+            first,
+        )
+        second = self.loader.upsert_manifest_constant(first, "DEMO_TABLE", '{"a": [2]}', "__DEMO_TABLE__")
+        self.assertEqual(second, first.replace('{"a": [1]}', '{"a": [2]}'))
+
+    def test_manifest_without_global_assignment_is_rejected(self) -> None:
+        broken = self.MANIFEST.replace("  global.__READING_EXAM_MANIFEST__ = manifest;\n", "")
+        with self.assertRaises(self.loader.BundleParseError):
+            self.loader.upsert_manifest_constant(broken, "DEMO_TABLE", "{}", "__DEMO_TABLE__")
+
+
+if __name__ == "__main__":
+    unittest.main()
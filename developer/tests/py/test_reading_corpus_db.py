@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from repo_modules import load_repo_module
+
+
+CORPUS_DB_PATH = Path(__file__).resolve().parent / "reading_corpus_db.py"
+
+
+def load_corpus_db():
+    return load_repo_module("reading_corpus_db", CORPUS_DB_PATH)
+
+
+class CorpusParserFingerprintTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.corpus = load_corpus_db()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.db_path = self.root / "corpus.sqlite3"
+        exam_dir = self.root / "assets" / "generated" / "reading-exams"
+        exam_dir.mkdir(parents=True)
+        (exam_dir / "p1-test-01.js").write_text(
+            "(function registerReadingExamData(global) {\n"
+            '  global.__READING_EXAM_DATA__.register("p1-test-01", '
+            '{"examId": "p1-test-01", "meta": {"title": "Tea"}, "answerKey": {"q1": "A"}});\n'
+            "})(window);\n",
+            encoding="utf-8",
+        )
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def connect(self):
+        return self.corpus.connect(self.root, self.db_path)
+
+    def test_unchanged_parser_reuses_rows(self) -> None:
+        self.connect().close()
+        conn = self.connect()
+        try:
+            stats = self.corpus.refresh_corpus(conn, self.root)
+        finally:
+            conn.close()
+        self.assertEqual((stats["parsed"], stats["unchanged"]), (0, 1))
+
+    def test_parser_change_reparses_error_rows(self) -> None:
+        loader = self.corpus.bundle_loader
+        with mock.patch.object(loader, "parse_register_text", side_effect=loader.BundleParseError("old parser")):
+            self.connect().close()
+        conn = self.connect()
+        try:
+            error = conn.execute("SELECT parse_error FROM source_files").fetchone()[0]
+        finally:
+            conn.close()
+        self.assertEqual(error, "old parser", "same parser must not re-parse an unchanged file")
+
+        with mock.patch.object(self.corpus, "parser_fingerprint", return_value="fixed parser"):
+            conn = self.connect()
+        try:
+            row = conn.execute("SELECT parse_error, exam_id FROM source_files").fetchone()
+            answers = conn.execute("SELECT question_id FROM answer_keys").fetchall()
+        finally:
+            conn.close()
+        self.assertEqual((row[0], row[1]), (None, "p1-test-01"))
+        self.assertEqual([answer[0] for answer in answers], ["q1"])
+
+    def test_schema_version_change_rebuilds_tables(self) -> None:
+        conn = self.connect()
+        conn.execute("PRAGMA user_version = 1")
+        conn.execute("CREATE TABLE stale_table (value TEXT)")
+        conn.close()
+
+        conn = self.connect()
+        try:
+            tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            parsed = conn.execute("SELECT COUNT(*) FROM exams").fetchone()[0]
+        finally:
+            conn.close()
+        self.assertNotIn("stale_table", tables)
+        self.assertEqual(version, self.corpus.CORPUS_SCHEMA_VERSION)
+        self.assertEqual(parsed, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import asyncio
+import http.client
+import json
+import os
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from repo_modules import load_repo_module
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SCRIPT_PATH = REPO_ROOT / "assets" / "scripts" / "generate_reading_explanations_with_agent.py"
+STUB_SERVER_PATH = Path(__file__).resolve().parent / "reading_agent_stub_server.py"
+
+
+def load_agent():
+    return load_repo_module("generate_reading_explanations_with_agent", SCRIPT_PATH)
+
+
+def load_stub_server():
+    return load_repo_module("reading_agent_stub_server", STUB_SERVER_PATH)
+
+
+class ContextCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.agent = load_agent()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.exam_dir = self.root / "exams"
+        self.exam_dir.mkdir()
+        self.builds = []
+
+        def build_context(exam_id):
+            self.builds.append(exam_id)
+            return {"examId": exam_id, "source": (self.exam_dir / f"{exam_id}.js").read_text(encoding="utf-8")}
+
+        self.helper = types.SimpleNamespace(EXAM_DIR=self.exam_dir, build_context=build_context)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def cache(self):
+        return self.agent.ContextCache(self.root / "cache", helper=self.helper)
+
+    def test_unchanged_exam_is_served_from_disk(self) -> None:
+        (self.exam_dir / "p1-demo.js").write_text("v1", encoding="utf-8")
+        first = self.cache().get("p1-demo")
+        second_cache = self.cache()
+        self.assertEqual(second_cache.get("p1-demo"), first)
+        self.assertEqual(self.builds, ["p1-demo"])
+        self.assertEqual((second_cache.hits, second_cache.misses), (1, 0))
+
+    def test_changed_exam_is_rebuilt(self) -> None:
+        exam_path = self.exam_dir / "p1-demo.js"
+        exam_path.write_text("v1", encoding="utf-8")
+        cache = self.cache()
+        cache.get("p1-demo")
+        exam_path.write_text("v2", encoding="utf-8")
+        self.assertEqual(cache.get("p1-demo")["source"], "v2")
+        self.assertEqual(self.cache().get("p1-demo")["source"], "v2")
+        self.assertEqual(self.builds, ["p1-demo", "p1-demo"])
+
+    def test_changed_extractor_invalidates_entries(self) -> None:
+        (self.exam_dir / "p1-demo.js").write_text("v1", encoding="utf-8")
+        self.cache().get("p1-demo")
+        stale = self.cache()
+        stale.extractor_hash = "0" * 64
+        stale.get("p1-demo")
+        self.assertEqual(self.builds, ["p1-demo", "p1-demo"])
+
+    def test_changed_bundle_loader_invalidates_entries(self) -> None:
+        (self.exam_dir / "p1-demo.js").write_text("v1", encoding="utf-8")
+        sources = []
+        for name in ("extract_reading_exam_context.py", "reading_bundle_loader.py", "reading_corpus_db.py"):
+            path = self.root / name
+            path.write_text("v1", encoding="utf-8")
+            sources.append(path)
+        with mock.patch.object(self.agent, "EXTRACTOR_SOURCE_PATHS", tuple(sources)):
+            self.cache().get("p1-demo")
+            self.cache().get("p1-demo")
+            sources[1].write_text("v2", encoding="utf-8")
+            self.cache().get("p1-demo")
+        self.assertEqual(self.builds, ["p1-demo", "p1-demo"])
+
+
+class ResponseWatcherTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.agent = load_agent()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "exams").mkdir()
+        (self.root / "exams" / "p1-demo.js").write_text("exam", encoding="utf-8")
+        self.response_dir = self.root / "responses"
+        self.response_dir.mkdir()
+        self.builds = []
+
+        def build_context(exam_id):
+            self.builds.append(exam_id)
+            return {"examId": exam_id, "answerKey": {"q1": "TRUE"}}
+
+        helper = types.SimpleNamespace(EXAM_DIR=self.root / "exams", build_context=build_context)
+        contexts = self.agent.ContextCache(None, helper=helper)
+        self.watcher = self.agent.ResponseWatcher(self.response_dir, contexts)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def write_response(self, answer: str, notes: bool = True, bump: int = 0) -> None:
+        path = self.response_dir / "p1-demo.json"
+        path.write_text(json.dumps({
+            "examId": "p1-demo",
+            "passageNotes": [{"label": "A", "text": "译文"}] if notes else [],
+            "questionExplanations": [{
+                "text": "",
+                "items": [{"questionId": "q1", "text": f"题目：x\n题目翻译：y\n答案：{answer}\n解析：z"}],
+            }],
+        }, ensure_ascii=False), encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump * 1_000_000_000))
+
+    def test_only_changed_files_are_revalidated(self) -> None:
+        self.write_response("FALSE")
+        first = self.watcher.poll()
+        self.assertEqual([event["event"] for event in first], ["added"])
+        self.assertEqual(len(first[0]["issues"]), 1)
+        self.assertEqual(self.watcher.poll(), [])
+
+        self.write_response("TRUE", notes=False, bump=1)
+        (changed,) = self.watcher.poll()
+        self.assertEqual(changed["event"], "changed")
+        self.assertEqual(changed["added"], ["passageNotes 为空"])
+        self.assertEqual(len(changed["resolved"]), 1)
+        self.assertIn("答案与 answerKey 不一致", changed["resolved"][0])
+        self.assertEqual(self.builds, ["p1-demo"])
+
+        (self.response_dir / "p1-demo.json").unlink()
+        (removed,) = self.watcher.poll()
+        self.assertEqual(removed["event"], "removed")
+        self.assertEqual(removed["resolved"], ["passageNotes 为空"])
+        self.assertEqual(self.watcher.issues, {})
+
+    def test_mid_edit_shapes_are_reported_and_watching_continues(self) -> None:
+        path = self.response_dir / "p1-demo.json"
+        edits = [
+            {"examId": "p1-demo", "passageNotes": [{"label": "A", "text": "译文"}], "questionExplanations": ["草稿"]},
+            {"examId": "p1-demo", "passageNotes": [{"label": "A", "text": "译文"}],
+             "questionExplanations": [{"text": "", "items": [{"questionId": "q1", "text": 1}]}]},
+        ]
+        for bump, edit in enumerate(edits):
+            path.write_text(json.dumps(edit, ensure_ascii=False), encoding="utf-8")
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump * 1_000_000_000))
+            (event,) = self.watcher.poll()
+            self.assertTrue(event["issues"])
+        self.assertIn("q1: text 不是字符串", self.watcher.issues["p1-demo"])
+
+        self.write_response("TRUE", bump=2)
+        (fixed,) = self.watcher.poll()
+        self.assertEqual(fixed["issues"], [])
+        self.assertIn("q1: text 不是字符串", fixed["resolved"])
+
+    def test_validator_errors_become_issues(self) -> None:
+        self.write_response("TRUE")
+        with mock.patch.object(self.agent, "validate_response", side_effect=KeyError("examId")):
+            (event,) = self.watcher.poll()
+        self.assertEqual(len(event["issues"]), 1)
+        self.assertIn("响应无法校验: KeyError", event["issues"][0])
+
+        self.write_response("TRUE", bump=1)
+        (event,) = self.watcher.poll()
+        self.assertEqual(event["issues"], [])
+
+    def test_diff_issues_counts_duplicates(self) -> None:
+        added, resolved = self.agent.diff_issues(["a", "a", "b"], ["a", "c"])
+        self.assertEqual(added, ["c"])
+        self.assertEqual(sorted(resolved), ["a", "b"])
+
+
+class RenderAllTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.agent = load_agent()
+        self.helper = self.agent.load_extract_helper()
+        self.exam_ids = self.helper.list_exam_ids()[:4]
+        if len(self.exam_ids) < 4:
+            self.skipTest("reading exam bundles are not available")
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.responses = self.root / "responses"
+        self.responses.mkdir()
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_results_follow_input_order_and_collect_issues(self) -> None:
+        paths = []
+        for exam_id in self.exam_ids[:3]:
+            template = self.agent.build_template(self.helper.build_context(exam_id))
+            path = self.responses / f"{exam_id}.json"
+            path.write_text(json.dumps(template, ensure_ascii=False), encoding="utf-8")
+            paths.append(path)
+        broken = self.responses / f"{self.exam_ids[3]}.json"
+        broken.write_text("{not json", encoding="utf-8")
+        paths.append(broken)
+
+        serial = self.agent.render_all(paths, self.root / "out-serial", self.root / "cache")
+        parallel = self.agent.render_all(paths, self.root / "out-parallel", self.root / "cache", jobs=2)
+
+        self.assertEqual([result["examId"] for result in serial], self.exam_ids)
+        self.assertEqual(
+            [(result["ok"], result.get("issues")) for result in serial],
+            [(result["ok"], result.get("issues")) for result in parallel],
+        )
+        self.assertFalse(serial[3]["ok"])
+        self.assertIn("响应 JSON 无法读取", serial[3]["issues"][0])
+        for result in serial:
+            if result["ok"]:
+                name = f"{result['examId']}.js"
+                self.assertEqual(
+                    (self.root / "out-serial" / name).read_bytes(),
+                    (self.root / "out-parallel" / name).read_bytes(),
+                )
+
+    def test_compact_bundles_keep_the_register_payload(self) -> None:
+        loader = sys.modules["reading_bundle_loader"]
+        for exam_id in self.helper.list_exam_ids():
+            context = self.helper.build_context(exam_id)
+            template = self.agent.build_template(context)
+            if not self.agent.validate_response(context, template):
+                break
+        else:
+            self.skipTest("no exam whose scaffolded template validates")
+        path = self.responses / f"{exam_id}.json"
+        path.write_text(json.dumps(template, ensure_ascii=False), encoding="utf-8")
+        (indented,) = self.agent.render_all([path], self.root / "out", None)
+        (compact,) = self.agent.render_all([path], self.root / "out", None, compact=True)
+        self.assertTrue(compact["ok"])
+        self.assertEqual(compact["beforeBytes"], indented["afterBytes"])
+        self.assertLess(compact["afterBytes"], indented["afterBytes"])
+        key, payload = loader.parse_register_text((self.root / "out" / f"{exam_id}.js").read_text(encoding="utf-8"))
+        self.assertEqual(key, exam_id)
+        self.assertEqual(payload, json.loads(path.read_text(encoding="utf-8")))
+
+    def test_wrongly_shaped_response_becomes_an_issue(self) -> None:
+        paths = []
+        for exam_id in self.exam_ids[:2]:
+            template = self.agent.build_template(self.helper.build_context(exam_id))
+            path = self.responses / f"{exam_id}.json"
+            path.write_text(json.dumps(template, ensure_ascii=False), encoding="utf-8")
+            paths.append(path)
+        paths[0].write_text(json.dumps({
+            "examId": self.exam_ids[0],
+            "passageNotes": [{"label": "A", "text": "译文"}],
+            "questionExplanations": ["只写了一段文字"],
+        }, ensure_ascii=False), encoding="utf-8")
+
+        for jobs in (1, 2):
+            results = self.agent.render_all(paths, self.root / f"out-{jobs}", None, jobs=jobs)
+            self.assertEqual([result["examId"] for result in results], self.exam_ids[:2])
+            self.assertFalse(results[0]["ok"])
+            self.assertTrue(results[0]["issues"])
+            self.assertFalse((self.root / f"out-{jobs}" / f"{self.exam_ids[0]}.js").exists())
+            self.assertIn("issues" if not results[1]["ok"] else "afterBytes", results[1])
+
+
+class DispatchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.agent = load_agent()
+        self.helper = self.agent.load_extract_helper()
+        self.exam_ids = self.helper.list_exam_ids()[:3]
+        if len(self.exam_ids) < 3:
+            self.skipTest("reading exam bundles are not available")
+        self.tmp = tempfile.TemporaryDirectory()
+        self.work_dir = Path(self.tmp.name) / "work"
+        self.canned_dir = Path(self.tmp.name) / "canned"
+        self.canned_dir.mkdir()
+        request_dir = self.work_dir / "requests"
+        request_dir.mkdir(parents=True)
+        self.request_paths = []
+        for exam_id in self.exam_ids:
+            context = self.helper.build_context(exam_id)
+            template = self.agent.build_template(context)
+            packet = self.agent.build_request_payload(context, template, self.work_dir / "responses" / f"{exam_id}.json")
+            path = request_dir / f"{exam_id}.json"
+            path.write_text(json.dumps(packet, ensure_ascii=False), encoding="utf-8")
+            self.request_paths.append(path)
+        # 第一份回放 examId 错误的响应，其余回放模板
+        broken = self.agent.build_template(self.helper.build_context(self.exam_ids[0]))
+        broken["examId"] = "p0-wrong"
+        (self.canned_dir / f"{self.exam_ids[0]}.json").write_text(json.dumps(broken), encoding="utf-8")
+        self.server = load_stub_server().start_stub_server(self.canned_dir, fail_first=1)
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def dispatcher(self, **kwargs):
+        return self.agent.Dispatcher(self.server.url, self.work_dir, concurrency=2, backoff=0.0, **kwargs)
+
+    def test_retries_validate_and_checkpoint(self) -> None:
+        results = asyncio.run(self.dispatcher().dispatch_all(self.request_paths))
+        self.assertEqual([result["examId"] for result in results], self.exam_ids)
+        self.assertTrue(all(result["attempts"] == 2 for result in results))
+        self.assertEqual(results[0]["status"], "invalid")
+        self.assertTrue(any("examId 不匹配" in issue for issue in results[0]["issues"]))
+        for result in results:
+            self.assertTrue((self.work_dir / "responses" / f"{result['examId']}.json").exists())
+            checkpoint = json.loads((self.work_dir / "dispatch-state" / f"{result['examId']}.json").read_text(encoding="utf-8"))
+            self.assertEqual(checkpoint["status"], result["status"])
+
+        again = asyncio.run(self.dispatcher().dispatch_all(self.request_paths))
+        expected_skips = [result["status"] == "ok" for result in results]
+        self.assertEqual([bool(result.get("skipped")) for result in again], expected_skips)
+        self.assertEqual(self.server.calls[self.exam_ids[0]], 3)
+
+    def test_client_errors_are_not_retried(self) -> None:
+        self.server.fail_first = 0
+        self.server.missing = "404"
+        (self.canned_dir / f"{self.exam_ids[0]}.json").unlink()
+        results = asyncio.run(self.dispatcher(retries=3).dispatch_all(self.request_paths[:1]))
+        self.assertEqual(results[0]["status"], "failed")
+        self.assertEqual(results[0]["attempts"], 1)
+        self.assertIn("HTTP 404", results[0]["error"])
+
+    def test_wrongly_shaped_responses_are_invalid_not_fatal(self) -> None:
+        self.server.fail_first = 0
+        shapes = [
+            {"examId": self.exam_ids[0], "passageNotes": "译文", "questionExplanations": ["只写了一段文字"]},
+            {"examId": self.exam_ids[1], "passageNotes": [{"label": "A", "text": "译文"}],
+             "questionExplanations": [{"text": 3, "items": [{"questionId": "q1", "text": 42}, "q2"]}]},
+        ]
+        for exam_id, shape in zip(self.exam_ids, shapes):
+            (self.canned_dir / f"{exam_id}.json").write_text(json.dumps(shape, ensure_ascii=False), encoding="utf-8")
+
+        results = asyncio.run(self.dispatcher().dispatch_all(self.request_paths))
+        self.assertEqual([result["status"] for result in results[:2]], ["invalid", "invalid"])
+        self.assertIn("questionExplanations[0] 不是对象", results[0]["issues"])
+        self.assertIn("passageNotes 不是数组", results[0]["issues"])
+        self.assertIn("questionExplanations[0].text 不是字符串", results[1]["issues"])
+        self.assertIn("q1: text 不是字符串", results[1]["issues"])
+        self.assertIn("questionExplanations[0].items[1] 不是对象", results[1]["issues"])
+        self.assertNotEqual(results[2]["status"], "failed")
+        for result in results:
+            self.assertTrue((self.work_dir / "dispatch-state" / f"{result['examId']}.json").exists())
+
+    def test_truncated_responses_are_retried(self) -> None:
+        self.server.fail_first = 0
+        real_post_json = self.agent.post_json
+        calls = []
+
+        def flaky_post_json(*args, **kwargs):
+            calls.append(args[0])
+            if len(calls) == 1:
+                raise http.client.IncompleteRead(b"{", 10)
+            return real_post_json(*args, **kwargs)
+
+        with mock.patch.object(self.agent, "post_json", flaky_post_json):
+            (result,) = asyncio.run(self.dispatcher(retries=1).dispatch_all(self.request_paths[1:2]))
+        self.assertEqual(result["attempts"], 2)
+        self.assertIn(result["status"], ("ok", "invalid"))
+
+    def test_unexpected_errors_fail_only_their_exam(self) -> None:
+        self.server.fail_first = 0
+        real_validate = self.agent.validate_response
+
+        def validate(context, response):
+            if context["examId"] == self.exam_ids[0]:
+                raise RuntimeError("validator bug")
+            return real_validate(context, response)
+
+        with mock.patch.object(self.agent, "validate_response", validate):
+            results = asyncio.run(self.dispatcher().dispatch_all(self.request_paths))
+        self.assertEqual(results[0]["status"], "failed")
+        self.assertIn("validator bug", results[0]["error"])
+        self.assertEqual([result["examId"] for result in results], self.exam_ids)
+        self.assertTrue(all(result["status"] != "failed" for result in results[1:]))
+
+
+if __name__ == "__main__":
+    unittest.main()
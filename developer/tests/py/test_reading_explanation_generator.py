@@ -1,16 +1,48 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import contextlib
+import io
 import json
 import os
 import subprocess
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
+
+from repo_modules import load_repo_module
 
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
 SCRIPT_PATH = REPO_ROOT / "assets" / "scripts" / "generate_reading_explanations_with_agent.py"
+MARKDOWN_GENERATOR_PATH = REPO_ROOT / "assets" / "scripts" / "generate_reading_explanations.py"
+
+TEA_DOC = """1\\. P1 - Tea History
+一、段落讲解
+- **Paragraph A**: Tea came from China.
+**Paragraph B**
+Traders carried tea west.
+二、题目解析
+**1. 判断题（Questions 1–2：TRUE/FALSE/NOT GIVEN）**
+题目1 TRUE: the passage says so.
+题目2 FALSE: it contradicts paragraph B.
+"""
+
+BEE_DOC = """1\\. P2 - Bee Colonies
+- **Paragraph A**: Bees live in colonies.
+二、题目解析
+Question 3 answer is C.
+2\\. P3 - Glacier Retreat
+- **Paragraph A**: Glaciers are shrinking.
+二、题目解析
+Question 14 answer is NOT GIVEN.
+"""
+
+
+def load_markdown_generator():
+    # registered under its own name so process-pool workers can unpickle its tasks and results
+    return load_repo_module("generate_reading_explanations", MARKDOWN_GENERATOR_PATH)
 
 
 def wrap_register(bundle_name: str, payload: dict) -> str:
@@ -154,5 +186,185 @@ class ReadingExplanationGeneratorTest(unittest.TestCase):
         self.assertIn("答案与 answerKey 不一致", completed.stdout)
 
 
+class MarkdownExplanationBuildTest(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self) -> None:
+        self.generator = load_markdown_generator()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.data_dir = self.root / "data"
+        self.exam_dir = self.root / "assets" / "generated" / "reading-exams"
+        self.output_dir = self.root / "assets" / "generated" / "reading-explanations"
+        self.reports = self.root / "reports"
+        self.data_dir.mkdir()
+        self.exam_dir.mkdir(parents=True)
+        (self.data_dir / "tea.md").write_text(TEA_DOC, encoding="utf-8")
+        (self.data_dir / "bee.md").write_text(BEE_DOC, encoding="utf-8")
+        self.write_manifest({
+            "p1-tea": ("Tea History", "P1"),
+            "p2-bee": ("Bee Colonies", "P2"),
+            "p3-glacier": ("Glacier Retreat", "P3"),
+        })
+        for name, value in (
+            ("DATA_DIR", self.data_dir),
+            ("READING_MANIFEST_PATH", self.exam_dir / "manifest.js"),
+            ("READING_DATA_DIR", self.exam_dir),
+            ("OUTPUT_DIR", self.output_dir),
+        ):
+            patcher = mock.patch.object(self.generator, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def write_manifest(self, exams: dict) -> None:
+        manifest = {
+            exam_id: {
+                "examId": exam_id,
+                "dataKey": exam_id,
+                "script": f"./{exam_id}.js",
+                "title": title,
+                "category": category,
+            }
+            for exam_id, (title, category) in exams.items()
+        }
+        (self.exam_dir / "manifest.js").write_text(
+            f"global.__READING_EXAM_MANIFEST__ = {json.dumps(manifest, ensure_ascii=False)};\n",
+            encoding="utf-8",
+        )
+
+    def build(self):
+        """Run one incremental build; return (parsed doc names, written file names)."""
+        generator = self.generator
+        parsed: list = []
+        written: list = []
+
+        def parse_docs(doc_paths, jobs=1):
+            parsed.extend(path.name for path in doc_paths)
+            return real_parse_docs(doc_paths, jobs)
+
+        def write_if_changed(path, content):
+            changed = real_write_if_changed(path, content)
+            if changed:
+                written.append(path.name)
+            return changed
+
+        real_parse_docs = generator.parse_docs
+        real_write_if_changed = generator.write_if_changed
+        with mock.patch.object(generator, "parse_docs", parse_docs), \
+                mock.patch.object(generator, "write_if_changed", write_if_changed), \
+                contextlib.redirect_stdout(io.StringIO()):
+            code = generator.run_incremental_build(
+                self.reports / "state.json",
+                1,
+                generator.FUZZY_MATCH_THRESHOLD,
+                self.reports / "title-matches.json",
+                False,
+                self.reports / "size.json",
+            )
+        self.assertEqual(code, 0)
+        return sorted(parsed), sorted(written)
+
+    def test_unchanged_inputs_write_nothing(self) -> None:
+        self.assertEqual(
+            self.build(),
+            (["bee.md", "tea.md"], ["manifest.js", "p1-tea.js", "p2-bee.js", "p3-glacier.js"]),
+        )
+        mtimes = {path.name: path.stat().st_mtime_ns for path in self.output_dir.glob("*.js")}
+
+        self.assertEqual(self.build(), ([], []))
+        self.assertEqual({path.name: path.stat().st_mtime_ns for path in self.output_dir.glob("*.js")}, mtimes)
+
+    def test_doc_edit_rewrites_only_its_bundles(self) -> None:
+        self.build()
+        (self.data_dir / "bee.md").write_text(BEE_DOC.replace("shrinking", "retreating"), encoding="utf-8")
+
+        self.assertEqual(self.build(), (["bee.md"], ["p3-glacier.js"]))
+        self.assertIn("retreating", (self.output_dir / "p3-glacier.js").read_text(encoding="utf-8"))
+
+    def test_manifest_change_rebuilds_outputs_from_cached_articles(self) -> None:
+        self.build()
+        self.write_manifest({
+            "p1-tea": ("Tea History", "P1"),
+            "p2-bee": ("Bee Colonies", "P2"),
+        })
+
+        self.assertEqual(self.build(), ([], ["manifest.js"]))
+        self.assertEqual(sorted(path.name for path in self.output_dir.glob("*.js")), ["manifest.js", "p1-tea.js", "p2-bee.js"])
+
+    def test_generator_change_reparses_every_doc(self) -> None:
+        self.build()
+        state_path = self.reports / "state.json"
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+        state["generatorHash"] = "previous generator"
+        state_path.write_text(json.dumps(state), encoding="utf-8")
+        (self.output_dir / "p1-tea.js").unlink()
+
+        self.assertEqual(self.build(), (["bee.md", "tea.md"], ["p1-tea.js"]))
+
+    def test_parallel_parse_matches_serial(self) -> None:
+        doc_paths = sorted(self.data_dir.glob("*.md"))
+        serial = self.generator.parse_docs(doc_paths, 1)
+        parallel = self.generator.parse_docs(doc_paths, 2)
+        self.assertEqual(parallel, serial)
+        self.assertEqual([len(serial[path]) for path in doc_paths], [2, 1])
+
+
+class MarkdownLineClassifierTest(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self) -> None:
+        self.generator = load_markdown_generator()
+
+    def test_lines_are_classified_once(self) -> None:
+        tokens = self.generator.tokenize_lines([
+            "- **Paragraph A**: Tea came from China.",
+            "**第二段**",
+            "**1. 判断题（Questions 1–2：TRUE/FALSE/NOT GIVEN）**",
+            "题目1 TRUE: the passage says so.",
+            "   ",
+            "Plain \\. text",
+        ])
+        self.assertEqual(
+            [
+                (token.paragraph_label, token.paragraph_text, token.is_section_title, token.question_number)
+                for token in tokens
+            ],
+            [
+                ("Paragraph A", "Tea came from China.", False, None),
+                ("第二段", None, False, None),
+                (None, None, True, None),
+                (None, None, False, 1),
+                (None, None, False, None),
+                (None, None, False, None),
+            ],
+        )
+        self.assertEqual(tokens[4].text, "")
+        self.assertEqual(tokens[5].text, "Plain . text")
+
+    def test_article_chunk_parses_notes_and_questions(self) -> None:
+        lines = TEA_DOC.splitlines()
+        article = self.generator.parse_article_chunk("tea.md", "Tea History", lines[1:])
+        self.assertEqual(
+            article.passage_notes,
+            [
+                {"label": "Paragraph A", "text": "Tea came from China."},
+                {"label": "Paragraph B", "text": "Traders carried tea west."},
+            ],
+        )
+        [section] = article.question_sections
+        self.assertEqual(section["mode"], "per_question")
+        self.assertEqual(section["questionRange"], {"start": 1, "end": 2})
+        self.assertEqual(
+            [(item["questionId"], item["text"]) for item in section["items"]],
+            [
+                ("q1", "题目1 TRUE: the passage says so."),
+                ("q2", "题目2 FALSE: it contradicts paragraph B."),
+            ],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+
+from repo_modules import load_repo_module
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SCRIPT_PATH = REPO_ROOT / "assets" / "scripts" / "generate_reading_explanations.py"
+
+
+def load_generator():
+    return load_repo_module("generate_reading_explanations", SCRIPT_PATH)
+
+
+class ReadingTitleMatcherTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.generator = load_generator()
+        titles = [
+            "The Dingo Debate 澳洲野犬",
+            "Music Language We All Speak 音乐语言",
+            "The History of Tea 茶叶的历史",
+            "The History of the Guitar 吉他的历史",
+        ]
+        self.by_norm_title = {self.generator.normalize_title(title): [] for title in titles}
+        self.index = self.generator.TitleTrigramIndex(self.by_norm_title)
+
+    def match(self, *titles: str, threshold: float = 0.6):
+        return self.generator.match_title(list(titles), self.by_norm_title, self.index, threshold)
+
+    def test_search_ranks_closest_title_first(self) -> None:
+        results = self.index.search(self.generator.normalize_title("The dingo debate 澳洲野犬_澳洲野狗"), k=2)
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0][0], "thedingodebate澳洲野犬")
+        self.assertGreater(results[0][1], results[1][1])
+
+    def test_exact_match_wins_over_fuzzy(self) -> None:
+        match = self.match("The History of Tea 茶叶的历史（修正）")
+        self.assertEqual(match.status, "exact")
+        self.assertEqual(match.normalized_title, "thehistoryoftea茶叶的历史")
+
+    def test_fuzzy_match_above_threshold(self) -> None:
+        match = self.match("P3 - Music Language We All Speak 音乐语言")
+        self.assertEqual(match.status, "fuzzy")
+        self.assertEqual(match.normalized_title, "musiclanguageweallspeak音乐语言")
+        self.assertGreaterEqual(match.score, 0.6)
+
+    def test_close_runners_up_are_ambiguous(self) -> None:
+        match = self.match("The History of Te 吉他的历史")
+        self.assertEqual(match.status, "ambiguous")
+        self.assertIsNone(match.normalized_title)
+        self.assertGreaterEqual(len(match.candidates), 2)
+
+    def test_low_similarity_is_unmatched(self) -> None:
+        match = self.match("The Whale Goes to Court 鲸鱼油")
+        self.assertEqual(match.status, "unmatched")
+        self.assertIsNone(match.normalized_title)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from repo_modules import load_repo_module
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SCRIPT_PATH = REPO_ROOT / "assets" / "scripts" / "split_reading_exam_chunks.py"
+
+
+def load_splitter():
+    return load_repo_module("split_reading_exam_chunks", SCRIPT_PATH)
+
+
+def write_exam_dir(root: Path, payloads) -> None:
+    manifest = {
+        exam_id: {"examId": exam_id, "dataKey": exam_id, "script": f"./{exam_id}.js"} for exam_id in payloads
+    }
+    manifest["p9-pdf-only"] = {"examId": "p9-pdf-only", "dataKey": None, "script": None}
+    (root / "manifest.js").write_text(
+        "(function registerReadingExamManifest(global) {\n"
+        "  'use strict';\n"
+        f"  const manifest = {json.dumps(manifest, indent=2)};\n"
+        "\n"
+        "  global.__READING_EXAM_MANIFEST__ = manifest;\n"
+        "})(typeof window !== \"undefined\" ? window : globalThis);\n",
+        encoding="utf-8",
+    )
+    for exam_id, payload in payloads.items():
+        (root / f"{exam_id}.js").write_text(
+            f"global.__READING_EXAM_DATA__.register({json.dumps(exam_id)}, {json.dumps(payload, indent=2)});\n",
+            encoding="utf-8",
+        )
+
+
+class SplitChunksTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.splitter = load_splitter()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.payloads = {
+            exam_id: {
+                "schemaVersion": "ReadingExamSourceV1",
+                "examId": exam_id,
+                "meta": {"title": exam_id},
+                "passage": {"blocks": [{"html": "<p>text</p>"}]},
+                "questionGroups": [{"groupId": "group-1", "questionIds": ["q1"]}],
+                "questionOrder": ["q1"],
+                "answerKey": {"q1": "TRUE"},
+                "extra": {"kept": True},
+            }
+            for exam_id in ("p1-demo", "p2-demo")
+        }
+        write_exam_dir(self.root, self.payloads)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_split_is_lossless_and_unknown_fields_go_to_meta(self) -> None:
+        parts = self.splitter.split_payload(self.payloads["p1-demo"])
+        self.assertEqual(list(parts), ["meta", "passage", "questions", "answers"])
+        self.assertEqual(parts["answers"], {"answerKey": {"q1": "TRUE"}})
+        self.assertEqual(parts["meta"]["extra"], {"kept": True})
+        self.assertNotIn("questionDisplayMap", parts["questions"])
+
+    def test_sync_writes_chunks_and_index_then_is_a_no_op(self) -> None:
+        manifest_before = (self.root / "manifest.js").read_text(encoding="utf-8")
+        report = self.splitter.sync_chunks(self.root)
+        self.assertEqual(report["summary"]["chunks"], 8)
+        self.assertTrue(report["summary"]["indexChanged"])
+        chunk = (self.root / "chunks" / "p1-demo.answers.js").read_text(encoding="utf-8")
+        self.assertIn('registerPart("p1-demo", "answers", {"answerKey":{"q1":"TRUE"}});', chunk)
+
+        index_text = (self.root / "chunks" / "index.js").read_text(encoding="utf-8")
+        index = self.splitter.bundle_loader.parse_assignment_text(index_text, ("global.__READING_EXAM_CHUNKS__ =",))
+        self.assertEqual(list(index["bytes"]), ["p1-demo", "p2-demo"])
+        self.assertEqual(
+            index["bytes"]["p2-demo"],
+            [(self.root / "chunks" / f"p2-demo.{part}.js").stat().st_size for part in index["parts"]],
+        )
+        # 索引单独成文件，manifest.js 随启动包加载，不能变大
+        self.assertEqual((self.root / "manifest.js").read_text(encoding="utf-8"), manifest_before)
+
+        again = self.splitter.sync_chunks(self.root, write=False)
+        self.assertEqual((again["summary"]["changedChunks"], again["summary"]["indexChanged"]), (0, False))
+
+    def test_chunks_of_removed_exams_are_deleted(self) -> None:
+        self.splitter.sync_chunks(self.root)
+        del self.payloads["p2-demo"]
+        (self.root / "p2-demo.js").unlink()
+        write_exam_dir(self.root, self.payloads)
+        report = self.splitter.sync_chunks(self.root)
+        self.assertEqual(len(report["stale"]), 4)
+        self.assertFalse(any(path.name.startswith("p2-demo.") for path in (self.root / "chunks").iterdir()))
+
+
+if __name__ == "__main__":
+    unittest.main()
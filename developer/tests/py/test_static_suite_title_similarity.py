@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import unittest
+from difflib import SequenceMatcher
+from pathlib import Path
+from unittest import mock
+
+from repo_modules import load_repo_module
+
+
+SUITE_PATH = Path(__file__).resolve().parents[1] / "ci" / "run_static_suite.py"
+# 改用 bigram Dice 之前的判定：SequenceMatcher.ratio() < 0.45 视为标题不匹配
+LEGACY_THRESHOLD = 0.45
+
+# 题库中真实存在的 examId 对应标题对（题目标题, 解析标题），两种算法都必须放行
+CORPUS_MATCHED_TITLES = (
+    ("1025纸笔Speaking of Nothing [Pretest] 闲聊的意义", "Speaking of Nothing 闲聊的意义"),
+    ("[Pretest] Why Do We Need Sleep 睡眠的目的", "Why Do We Need Sleep 睡眠的目的"),
+    ("Who Wrote Shakespeare's Plays 莎士比亚", "Who Wrote Shakespeare's Plays 莎士比亚次"),
+    ("Australia's Cane Toad Problem 澳洲蟾蜍高", "Australia's Cane Toad Problem 澳洲蟾蜍"),
+)
+
+# 题库中互相错配时 Dice 最高的一组标题；SequenceMatcher 都判为不匹配，Dice 也必须拒绝
+CORPUS_MISMATCHED_TITLES = (
+    ("War of the Plants", "The Analysis of Fear 猴子恐惧实验"),
+    ("The origin and development of applause 掌声的历史", "An important language development 楔形文字"),
+    ("Australian artist Margaret Preston 澳大利亚艺术家", "On art and artists 艺术与艺术家"),
+    ("The history of the British wool industry 英国羊毛产业的历史", "A Brief History of Tea 茶叶简史"),
+)
+
+
+def load_static_suite():
+    return load_repo_module("run_static_suite", SUITE_PATH)
+
+
+def payload(exam_id: str, title: str) -> dict:
+    return {"examId": exam_id, "meta": {"title": title}}
+
+
+class TitleSimilarityTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.suite = load_static_suite()
+
+    def grams(self, title: str) -> frozenset:
+        return self.suite._title_ngrams(self.suite._normalize_title_for_similarity(title))
+
+    def dice(self, left: str, right: str) -> float:
+        return self.suite._dice_similarity(self.grams(left), self.grams(right))
+
+    def mismatch(self, exam_title: str, explanation_title: str):
+        exams = {"p1-a": payload("p1-a", exam_title)}
+        table = self.suite._TitleFeatureTable({"p1-a": exam_title})
+        return self.suite._title_mismatch(table, exams, "p1-a", payload("p1-a", explanation_title))
+
+    def test_bigrams_are_padded_and_normalised(self) -> None:
+        self.assertEqual(self.grams("Tea!"), frozenset({" t", "te", "ea", "a "}))
+        self.assertEqual(self.grams("  "), frozenset())
+
+    def test_dice_similarity(self) -> None:
+        self.assertEqual(self.dice("Tea", "tea"), 1.0)
+        # {" t","te","ea","a "} 与 {" t","te","ee","e "} 共享 2 个：2*2/(4+4)
+        self.assertEqual(self.dice("tea", "tee"), 0.5)
+        self.assertEqual(self.dice("tea", "box"), 0.0)
+        self.assertEqual(self.dice("tea", ""), 0.0)
+
+    def test_threshold_edges(self) -> None:
+        threshold = self.suite.READING_TITLE_SIMILARITY_THRESHOLD
+        # 恰好等于阈值的标题对放行
+        self.assertEqual(self.dice("tea", "tee"), threshold)
+        self.assertIsNone(self.mismatch("tea", "tee"))
+
+        # 共享 2/4 与 2/5 个 bigram：4/9 低于阈值
+        self.assertLess(self.dice("tea", "texy"), threshold)
+        mismatch = self.mismatch("tea", "texy")
+        self.assertEqual(mismatch["reason"], "title_similarity_low")
+        self.assertEqual(mismatch["detail"], {"examTitle": "tea", "explanationTitle": "texy", "similarity": 0.444})
+
+        with mock.patch.object(self.suite, "READING_TITLE_SIMILARITY_THRESHOLD", self.dice("tea", "texy")):
+            self.assertIsNone(self.mismatch("tea", "texy"))
+
+    def test_empty_titles_are_not_compared(self) -> None:
+        self.assertIsNone(self.mismatch("", "Tea History"))
+        self.assertIsNone(self.mismatch("Tea History", "???"))
+
+    def test_corpus_titles_keep_legacy_verdicts(self) -> None:
+        def legacy_rejects(left: str, right: str) -> bool:
+            normalize = self.suite._normalize_title_for_similarity
+            return SequenceMatcher(None, normalize(left), normalize(right)).ratio() < LEGACY_THRESHOLD
+
+        for exam_title, explanation_title in CORPUS_MATCHED_TITLES:
+            with self.subTest(exam_title=exam_title):
+                self.assertFalse(legacy_rejects(exam_title, explanation_title))
+                self.assertIsNone(self.mismatch(exam_title, explanation_title))
+        for exam_title, explanation_title in CORPUS_MISMATCHED_TITLES:
+            with self.subTest(exam_title=exam_title):
+                self.assertTrue(legacy_rejects(exam_title, explanation_title))
+                self.assertEqual(self.mismatch(exam_title, explanation_title)["reason"], "title_similarity_low")
+
+
+class OrphanBestMatchesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.suite = load_static_suite()
+        titles = {
+            "p1-tea": "A Brief History of Tea",
+            "p1-tea-2": "The History of Tea",
+            "p2-wool": "The History of the British Wool Industry",
+            "p3-bees": "Bee Colonies",
+            "p3-empty": "",
+        }
+        self.exams = {exam_id: payload(exam_id, title) for exam_id, title in titles.items()}
+        self.table = self.suite._TitleFeatureTable(titles)
+
+    def orphan_grams(self) -> frozenset:
+        return self.suite._title_ngrams(self.suite._normalize_title_for_similarity("History of Tea"))
+
+    def test_orphan_reports_ranked_best_matches(self) -> None:
+        mismatch = self.suite._title_mismatch(
+            self.table, self.exams, "p9-orphan", payload("p9-orphan", "History of Tea")
+        )
+        self.assertEqual(mismatch["reason"], "explanation_orphan")
+        best = mismatch["bestMatches"]
+        self.assertEqual(len(best), self.suite.READING_ORPHAN_MATCH_LIMIT)
+        self.assertEqual([entry["examId"] for entry in best], ["p1-tea-2", "p1-tea", "p2-wool"])
+        self.assertEqual(best[0]["title"], "The History of Tea")
+        scores = [entry["similarity"] for entry in best]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertEqual(best[0]["similarity"], round(self.table.similarity("p1-tea-2", self.orphan_grams()), 3))
+
+    def test_best_matches_only_scans_shared_bigrams(self) -> None:
+        self.assertEqual(self.table.best_matches(self.suite._title_ngrams("zzz")), [])
+        self.assertNotIn("p3-empty", self.table.features)
+        # 与逐个计算 Dice 的结果一致
+        grams = self.orphan_grams()
+        expected = sorted(
+            ((exam_id, self.table.similarity(exam_id, grams)) for exam_id in self.table.features),
+            key=lambda item: (-item[1], item[0]),
+        )
+        expected = [item for item in expected if item[1] > 0]
+        self.assertEqual(self.table.best_matches(grams, limit=10), expected)
+
+    def test_orphan_without_title_has_no_matches(self) -> None:
+        mismatch = self.suite._title_mismatch(self.table, self.exams, "p9-orphan", payload("p9-orphan", ""))
+        self.assertEqual(mismatch["bestMatches"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
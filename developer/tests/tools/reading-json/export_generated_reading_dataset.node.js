@@ -21,13 +21,17 @@ function readText(filePath) {
 }
 
 function parseArgs(argv) {
-  const args = { examId: '', list: false };
+  const args = { examId: '', list: false, all: false };
   for (let i = 2; i < argv.length; i += 1) {
     const token = argv[i];
     if (token === '--list') {
       args.list = true;
       continue;
     }
+    if (token === '--all') {
+      args.all = true;
+      continue;
+    }
     if (token === '--exam-id') {
       args.examId = (argv[i + 1] || '').trim();
       i += 1;
@@ -78,22 +82,57 @@ function loadManifest(context) {
 
 function loadDataset(context, registry, manifestEntry) {
   if (!manifestEntry || !manifestEntry.script || !manifestEntry.dataKey) {
-    fail('manifest_entry_invalid');
+    throw new Error('manifest_entry_invalid');
   }
   const scriptPath = path.join(GENERATED_ROOT, String(manifestEntry.script).replace(/^\.\//, ''));
   if (!fs.existsSync(scriptPath)) {
-    fail(`reading_dataset_script_missing:${manifestEntry.script}`);
+    throw new Error(`reading_dataset_script_missing:${manifestEntry.script}`);
   }
   if (!registry.has(manifestEntry.dataKey)) {
     vm.runInContext(readText(scriptPath), context, { filename: scriptPath });
   }
   const dataset = registry.get(manifestEntry.dataKey);
   if (!dataset || typeof dataset !== 'object') {
-    fail(`reading_dataset_missing:${manifestEntry.dataKey}`);
+    throw new Error(`reading_dataset_missing:${manifestEntry.dataKey}`);
   }
   return dataset;
 }
 
+function buildPayload(dataset, entry, examId) {
+  return {
+    examId: dataset.examId || entry.examId || examId,
+    questionOrder: Array.isArray(dataset.questionOrder) ? dataset.questionOrder : [],
+    answerKey: dataset.answerKey && typeof dataset.answerKey === 'object' ? dataset.answerKey : {},
+    questionGroups: Array.isArray(dataset.questionGroups) ? dataset.questionGroups : [],
+    questionDisplayMap: dataset.questionDisplayMap && typeof dataset.questionDisplayMap === 'object'
+      ? dataset.questionDisplayMap
+      : {},
+    meta: dataset.meta && typeof dataset.meta === 'object' ? dataset.meta : {},
+    metaQuestionIntroHtml: dataset.meta && typeof dataset.meta.questionIntroHtml === 'string'
+      ? dataset.meta.questionIntroHtml
+      : '',
+    script: entry.script
+  };
+}
+
+// 批量模式：一次进程逐行输出全部题目（NDJSON），单题失败只输出 error 行，不中断整批
+function streamAllDatasets(context, registry, manifest) {
+  for (const entry of buildEntryList(manifest)) {
+    const manifestEntry = pickManifestEntry(manifest, entry.examId);
+    let line;
+    try {
+      const dataset = loadDataset(context, registry, manifestEntry);
+      line = buildPayload(dataset, manifestEntry, entry.examId);
+    } catch (error) {
+      line = {
+        examId: entry.examId,
+        error: error && error.message ? error.message : String(error)
+      };
+    }
+    process.stdout.write(`${JSON.stringify(line)}\n`);
+  }
+}
+
 function buildEntryList(manifest) {
   return Object.values(manifest)
     .map((entry) => ({
@@ -134,6 +173,11 @@ function main() {
     return;
   }
 
+  if (args.all) {
+    streamAllDatasets(context, registry, manifest);
+    return;
+  }
+
   if (!args.examId) {
     fail('missing_required_arg:--exam-id');
   }
@@ -143,21 +187,13 @@ function main() {
     fail(`reading_manifest_entry_not_found:${args.examId}`);
   }
 
-  const dataset = loadDataset(context, registry, entry);
-  const payload = {
-    examId: dataset.examId || entry.examId || args.examId,
-    questionOrder: Array.isArray(dataset.questionOrder) ? dataset.questionOrder : [],
-    answerKey: dataset.answerKey && typeof dataset.answerKey === 'object' ? dataset.answerKey : {},
-    questionGroups: Array.isArray(dataset.questionGroups) ? dataset.questionGroups : [],
-    questionDisplayMap: dataset.questionDisplayMap && typeof dataset.questionDisplayMap === 'object'
-      ? dataset.questionDisplayMap
-      : {},
-    meta: dataset.meta && typeof dataset.meta === 'object' ? dataset.meta : {},
-    metaQuestionIntroHtml: dataset.meta && typeof dataset.meta.questionIntroHtml === 'string'
-      ? dataset.meta.questionIntroHtml
-      : '',
-    script: entry.script
-  };
+  let dataset;
+  try {
+    dataset = loadDataset(context, registry, entry);
+  } catch (error) {
+    fail(error && error.message ? error.message : String(error));
+  }
+  const payload = buildPayload(dataset, entry, args.examId);
 
   process.stdout.write(`${JSON.stringify(payload)}\n`);
 }
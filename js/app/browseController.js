@@ -109,6 +109,197 @@
             || String(global.__browseMemorizeFilterMode || '') === 'reading-memorize';
     }
 
+    // ============================================================================
+    // 阅读题库全文检索
+    // ============================================================================
+
+    /**
+     * 全文索引由 assets/scripts/build_reading_exam_search_index.py 生成，
+     * 通过 AppLazyLoader 的 reading-search-index 组按需加载。
+     * 分词规则必须与生成脚本的 tokenize 保持一致。
+     */
+    const READING_SEARCH_INDEX_GROUP = 'reading-search-index';
+    const READING_SEARCH_INDEX_VERSION = 1;
+    const READING_SEARCH_PREFIX_LIMIT = 64;
+    const READING_SEARCH_PREFIX_WEIGHT = 0.5;
+    const READING_SEARCH_TOKEN_RE = /[a-z0-9]+|[一-鿿]/g;
+    const READING_SEARCH_STOP_WORDS = new Set((
+        'a an and are as at be been but by can could did do does for from had has have he her his how i if in into is it '
+        + 'its may might more most must no not of on or our she should so than that the their them then there these they '
+        + 'this those to was we were what when where which who whom why will with would you your'
+    ).split(' '));
+
+    let readingSearchCache = null;
+    let readingSearchIndexLoad = null;
+
+    function foldReadingSearchPlural(token) {
+        if (token.length > 4 && token.endsWith('ies')) {
+            return token.slice(0, -3) + 'y';
+        }
+        if (token.length > 3 && token.endsWith('s') && !/(?:ss|us|sis)$/.test(token)) {
+            return token.slice(0, -1);
+        }
+        return token;
+    }
+
+    function tokenizeReadingSearchText(text) {
+        const raw = String(text || '').normalize('NFKC').toLowerCase().match(READING_SEARCH_TOKEN_RE) || [];
+        const tokens = [];
+        raw.forEach((token) => {
+            const latin = /^[a-z0-9]+$/.test(token);
+            if (latin && (token.length < 2 || READING_SEARCH_STOP_WORDS.has(token))) {
+                return;
+            }
+            tokens.push(latin && !/^\d+$/.test(token) ? foldReadingSearchPlural(token) : token);
+        });
+        return tokens;
+    }
+
+    function getReadingSearchIndex() {
+        const source = global.__READING_EXAM_SEARCH_INDEX__;
+        if (!source || source.version !== READING_SEARCH_INDEX_VERSION
+            || !Array.isArray(source.ids) || !Array.isArray(source.terms)) {
+            return null;
+        }
+        if (!readingSearchCache || readingSearchCache.source !== source) {
+            readingSearchCache = {
+                source,
+                terms: source.terms.map((row) => String(row[0])),
+                postings: new Map()
+            };
+        }
+        return readingSearchCache;
+    }
+
+    function lowerBoundTerm(terms, value) {
+        let low = 0;
+        let high = terms.length;
+        while (low < high) {
+            const mid = (low + high) >>> 1;
+            if (terms[mid] < value) {
+                low = mid + 1;
+            } else {
+                high = mid;
+            }
+        }
+        return low;
+    }
+
+    function findReadingSearchRows(index, token, prefix) {
+        const start = lowerBoundTerm(index.terms, token);
+        if (!prefix) {
+            return index.terms[start] === token ? [start] : [];
+        }
+        const rows = [];
+        for (let row = start; row < index.terms.length && rows.length < READING_SEARCH_PREFIX_LIMIT; row += 1) {
+            if (!index.terms[row].startsWith(token)) {
+                break;
+            }
+            rows.push(row);
+        }
+        return rows;
+    }
+
+    function decodeReadingSearchPostings(index, rowIndex) {
+        if (!index.postings.has(rowIndex)) {
+            const row = index.source.terms[rowIndex];
+            const docs = [];
+            const freqs = [];
+            let doc = 0;
+            for (let i = 1; i + 1 < row.length; i += 2) {
+                doc += row[i];
+                docs.push(doc);
+                freqs.push(row[i + 1]);
+            }
+            index.postings.set(rowIndex, { docs, freqs });
+        }
+        return index.postings.get(rowIndex);
+    }
+
+    function scoreReadingSearchToken(index, token, rows) {
+        const source = index.source;
+        const total = source.ids.length;
+        const k1 = Number(source.k1) || 1.2;
+        const b = Number.isFinite(Number(source.b)) ? Number(source.b) : 0.75;
+        const avgLength = Number(source.avgLength) || 1;
+        const scores = new Map();
+        rows.forEach((rowIndex) => {
+            const { docs, freqs } = decodeReadingSearchPostings(index, rowIndex);
+            // 前缀展开出的其他词降权，完整词命中优先
+            const weight = index.terms[rowIndex] === token ? 1 : READING_SEARCH_PREFIX_WEIGHT;
+            const idf = weight * Math.log(1 + (total - docs.length + 0.5) / (docs.length + 0.5));
+            docs.forEach((doc, i) => {
+                const norm = 1 - b + b * (Number(source.lengths[doc]) || avgLength) / avgLength;
+                const score = idf * freqs[i] * (k1 + 1) / (freqs[i] + k1 * norm);
+                // 前缀展开的多个词只取最高分，避免短前缀压过完整词
+                if (score > (scores.get(doc) || 0)) {
+                    scores.set(doc, score);
+                }
+            });
+        });
+        return scores;
+    }
+
+    /**
+     * 在已加载的全文索引中检索，所有查询词都要命中（最后一个词按前缀匹配）。
+     * @returns {Array<{id: string, score: number}>|null} 索引未加载或查询无有效词时返回 null
+     */
+    function searchReadingLibrary(query, options = {}) {
+        const index = getReadingSearchIndex();
+        const tokens = tokenizeReadingSearchText(query);
+        if (!index || !tokens.length) {
+            return null;
+        }
+        const prefixLast = options.prefix !== false && !/\s$/.test(String(query));
+        let combined = null;
+        tokens.forEach((token, position) => {
+            if (combined && combined.size === 0) {
+                return;
+            }
+            const rows = findReadingSearchRows(index, token, prefixLast && position === tokens.length - 1);
+            const scores = scoreReadingSearchToken(index, token, rows);
+            if (!combined) {
+                combined = scores;
+                return;
+            }
+            const next = new Map();
+            combined.forEach((score, doc) => {
+                if (scores.has(doc)) {
+                    next.set(doc, score + scores.get(doc));
+                }
+            });
+            combined = next;
+        });
+        const limit = Number(options.limit) > 0 ? Number(options.limit) : Infinity;
+        return Array.from(combined, ([doc, score]) => ({ id: index.source.ids[doc], score }))
+            .sort((a, b) => b.score - a.score || (a.id < b.id ? -1 : 1))
+            .slice(0, limit);
+    }
+
+    function ensureReadingSearchIndex() {
+        if (getReadingSearchIndex()) {
+            return Promise.resolve(true);
+        }
+        if (!readingSearchIndexLoad) {
+            const loader = global.AppLazyLoader;
+            if (!loader || typeof loader.ensureGroup !== 'function') {
+                return Promise.resolve(false);
+            }
+            readingSearchIndexLoad = Promise.resolve()
+                .then(() => loader.ensureGroup(READING_SEARCH_INDEX_GROUP))
+                .then(() => !!getReadingSearchIndex())
+                .catch((error) => {
+                    console.warn('[BrowseController] 全文索引加载失败:', error && error.message ? error.message : error);
+                    return false;
+                })
+                .then((ready) => {
+                    readingSearchIndexLoad = null;
+                    return ready;
+                });
+        }
+        return readingSearchIndexLoad;
+    }
+
     // ============================================================================
     // BrowseController 类
     // ============================================================================
@@ -574,6 +765,14 @@
 
     global.BrowseController = BrowseController;
     global.BROWSE_MODES = BROWSE_MODES;
+    global.ReadingExamSearch = {
+        tokenize: tokenizeReadingSearchText,
+        search: searchReadingLibrary,
+        ensureIndex: ensureReadingSearchIndex,
+        isReady() {
+            return !!getReadingSearchIndex();
+        }
+    };
     global.refreshListeningAvailabilityUI = function refreshListeningAvailabilityUI(index) {
         const listeningAvailable = Array.isArray(index)
             ? hasListeningEntries(index)
@@ -70,6 +70,66 @@
         return Number.isFinite(score) ? score : Number.NEGATIVE_INFINITY;
     }
 
+    // 题目摘要表（manifest.js 生成的列式数组）：按篇幅排序、按题型筛选都不必加载题目数据
+    let examSummaryIndex = { table: null, rows: null };
+
+    function getExamSummaryTable() {
+        const table = global.__READING_EXAM_SUMMARY__;
+        if (!table || !Array.isArray(table.ids) || !table.columns || typeof table.columns !== 'object') {
+            return null;
+        }
+        if (examSummaryIndex.table !== table) {
+            const rows = new Map();
+            table.ids.forEach((id, index) => rows.set(String(id), index));
+            examSummaryIndex = { table, rows };
+        }
+        return table;
+    }
+
+    function readSummaryColumn(table, name, index) {
+        const column = table.columns[name];
+        const value = Array.isArray(column) ? Number(column[index]) : NaN;
+        return Number.isFinite(value) ? value : null;
+    }
+
+    function getExamSummary(examId) {
+        const table = getExamSummaryTable();
+        const index = table && examId != null ? examSummaryIndex.rows.get(String(examId)) : undefined;
+        if (index === undefined) {
+            return null;
+        }
+        const mask = readSummaryColumn(table, 'kindMask', index) || 0;
+        const kinds = Array.isArray(table.kinds) ? table.kinds : [];
+        return {
+            questionCount: readSummaryColumn(table, 'questionCount', index),
+            kinds: kinds.filter((kind, bit) => (mask & (1 << bit)) !== 0),
+            wordCount: readSummaryColumn(table, 'wordCount', index),
+            answerCount: readSummaryColumn(table, 'answerCount', index)
+        };
+    }
+
+    function resolveWordCount(exam) {
+        const summary = getExamSummary(exam && exam.id);
+        return summary && summary.wordCount != null ? summary.wordCount : null;
+    }
+
+    function normalizeQuestionKindFilter(value) {
+        const raw = String(value || '').trim();
+        return raw && raw.toLowerCase() !== 'all' ? raw : 'all';
+    }
+
+    function applyBrowseQuestionKindFilter(exams, questionKind) {
+        const list = Array.isArray(exams) ? exams.slice() : [];
+        const kind = normalizeQuestionKindFilter(questionKind || global.__browseQuestionKindFilter);
+        if (kind === 'all' || !getExamSummaryTable()) {
+            return list;
+        }
+        return list.filter((exam) => {
+            const summary = getExamSummary(exam && exam.id);
+            return !!summary && summary.kinds.includes(kind);
+        });
+    }
+
     function compareByCategoryThenTitle(a, b) {
         const categoryA = String(a && a.category || '');
         const categoryB = String(b && b.category || '');
@@ -129,6 +189,20 @@
                 return compareByCategoryThenTitle(a, b);
             });
         }
+        if (mode === 'length-desc' || mode === 'length-asc') {
+            const direction = mode === 'length-desc' ? -1 : 1;
+            return list.sort((a, b) => {
+                const wordsA = resolveWordCount(a);
+                const wordsB = resolveWordCount(b);
+                if (wordsA !== wordsB) {
+                    // 没有摘要的题目（听力、PDF）始终排在最后
+                    if (wordsA == null) return 1;
+                    if (wordsB == null) return -1;
+                    return (wordsA - wordsB) * direction;
+                }
+                return compareByCategoryThenTitle(a, b);
+            });
+        }
         if (mode !== 'frequency-desc') {
             return list;
         }
@@ -141,10 +215,11 @@
         });
     }
 
-    function applyBrowsePostFilters(exams, sortMode, frequencyFilter) {
+    function applyBrowsePostFilters(exams, sortMode, frequencyFilter, questionKind) {
         const deduplicated = deduplicateExams(exams);
         const frequencyFiltered = applyBrowseFrequencyFilter(deduplicated, frequencyFilter);
-        return applyExamSort(frequencyFiltered, sortMode);
+        const kindFiltered = applyBrowseQuestionKindFilter(frequencyFiltered, questionKind);
+        return applyExamSort(kindFiltered, sortMode);
     }
 
     function hasListeningEntries(exams) {
@@ -191,6 +266,9 @@
         const frequencyFilter = normalizeBrowseFrequencyFilter(
             safeState.frequencyFilter || safeState.browseFrequencyFilter || global.__browseFrequencyFilter || 'all'
         );
+        const questionKind = normalizeQuestionKindFilter(
+            safeState.questionKind || safeState.browseQuestionKindFilter || global.__browseQuestionKindFilter || 'all'
+        );
         const isFrequencyMode = filterMode !== 'default';
         const basePathFilter = isFrequencyMode
             && typeof safeState.basePathFilter === 'string'
@@ -236,7 +314,7 @@
             }
         }
 
-        return applyBrowsePostFilters(list, sortMode, frequencyFilter);
+        return applyBrowsePostFilters(list, sortMode, frequencyFilter, questionKind);
     }
 
     function formatFrequencyLabel(frequency) {
@@ -1409,7 +1487,8 @@
     // ============================================================================
 
     global.ExamFilterService = Object.assign({}, global.ExamFilterService || {}, {
-        filterExams: filterExamsWithLegacyFallback
+        filterExams: filterExamsWithLegacyFallback,
+        getExamSummary
     });
     global.ExamListView = Object.assign({}, global.ExamListView || {}, {
         render: renderExamListView,
@@ -1441,7 +1520,9 @@
         applyExamSort,
         applyBrowsePostFilters,
         applyBrowseFrequencyFilter,
+        applyBrowseQuestionKindFilter,
         normalizeBrowseFrequencyFilter,
+        getExamSummary,
         launchReadingMemorizeExam,
         isReadingMemorizeBrowseMode,
         isReadingMemorizeExam
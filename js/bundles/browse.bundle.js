@@ -3656,6 +3656,66 @@
         return Number.isFinite(score) ? score : Number.NEGATIVE_INFINITY;
     }
 
+    // 题目摘要表（manifest.js 生成的列式数组）：按篇幅排序、按题型筛选都不必加载题目数据
+    let examSummaryIndex = { table: null, rows: null };
+
+    function getExamSummaryTable() {
+        const table = global.__READING_EXAM_SUMMARY__;
+        if (!table || !Array.isArray(table.ids) || !table.columns || typeof table.columns !== 'object') {
+            return null;
+        }
+        if (examSummaryIndex.table !== table) {
+            const rows = new Map();
+            table.ids.forEach((id, index) => rows.set(String(id), index));
+            examSummaryIndex = { table, rows };
+        }
+        return table;
+    }
+
+    function readSummaryColumn(table, name, index) {
+        const column = table.columns[name];
+        const value = Array.isArray(column) ? Number(column[index]) : NaN;
+        return Number.isFinite(value) ? value : null;
+    }
+
+    function getExamSummary(examId) {
+        const table = getExamSummaryTable();
+        const index = table && examId != null ? examSummaryIndex.rows.get(String(examId)) : undefined;
+        if (index === undefined) {
+            return null;
+        }
+        const mask = readSummaryColumn(table, 'kindMask', index) || 0;
+        const kinds = Array.isArray(table.kinds) ? table.kinds : [];
+        return {
+            questionCount: readSummaryColumn(table, 'questionCount', index),
+            kinds: kinds.filter((kind, bit) => (mask & (1 << bit)) !== 0),
+            wordCount: readSummaryColumn(table, 'wordCount', index),
+            answerCount: readSummaryColumn(table, 'answerCount', index)
+        };
+    }
+
+    function resolveWordCount(exam) {
+        const summary = getExamSummary(exam && exam.id);
+        return summary && summary.wordCount != null ? summary.wordCount : null;
+    }
+
+    function normalizeQuestionKindFilter(value) {
+        const raw = String(value || '').trim();
+        return raw && raw.toLowerCase() !== 'all' ? raw : 'all';
+    }
+
+    function applyBrowseQuestionKindFilter(exams, questionKind) {
+        const list = Array.isArray(exams) ? exams.slice() : [];
+        const kind = normalizeQuestionKindFilter(questionKind || global.__browseQuestionKindFilter);
+        if (kind === 'all' || !getExamSummaryTable()) {
+            return list;
+        }
+        return list.filter((exam) => {
+            const summary = getExamSummary(exam && exam.id);
+            return !!summary && summary.kinds.includes(kind);
+        });
+    }
+
     function compareByCategoryThenTitle(a, b) {
         const categoryA = String(a && a.category || '');
         const categoryB = String(b && b.category || '');
@@ -3715,6 +3775,20 @@
                 return compareByCategoryThenTitle(a, b);
             });
         }
+        if (mode === 'length-desc' || mode === 'length-asc') {
+            const direction = mode === 'length-desc' ? -1 : 1;
+            return list.sort((a, b) => {
+                const wordsA = resolveWordCount(a);
+                const wordsB = resolveWordCount(b);
+                if (wordsA !== wordsB) {
+                    // 没有摘要的题目（听力、PDF）始终排在最后
+                    if (wordsA == null) return 1;
+                    if (wordsB == null) return -1;
+                    return (wordsA - wordsB) * direction;
+                }
+                return compareByCategoryThenTitle(a, b);
+            });
+        }
         if (mode !== 'frequency-desc') {
             return list;
         }
@@ -3727,10 +3801,11 @@
         });
     }
 
-    function applyBrowsePostFilters(exams, sortMode, frequencyFilter) {
+    function applyBrowsePostFilters(exams, sortMode, frequencyFilter, questionKind) {
         const deduplicated = deduplicateExams(exams);
         const frequencyFiltered = applyBrowseFrequencyFilter(deduplicated, frequencyFilter);
-        return applyExamSort(frequencyFiltered, sortMode);
+        const kindFiltered = applyBrowseQuestionKindFilter(frequencyFiltered, questionKind);
+        return applyExamSort(kindFiltered, sortMode);
     }
 
     function hasListeningEntries(exams) {
@@ -3777,6 +3852,9 @@
         const frequencyFilter = normalizeBrowseFrequencyFilter(
             safeState.frequencyFilter || safeState.browseFrequencyFilter || global.__browseFrequencyFilter || 'all'
         );
+        const questionKind = normalizeQuestionKindFilter(
+            safeState.questionKind || safeState.browseQuestionKindFilter || global.__browseQuestionKindFilter || 'all'
+        );
         const isFrequencyMode = filterMode !== 'default';
         const basePathFilter = isFrequencyMode
             && typeof safeState.basePathFilter === 'string'
@@ -3822,7 +3900,7 @@
             }
         }
 
-        return applyBrowsePostFilters(list, sortMode, frequencyFilter);
+        return applyBrowsePostFilters(list, sortMode, frequencyFilter, questionKind);
     }
 
     function formatFrequencyLabel(frequency) {
@@ -4995,7 +5073,8 @@
     // ============================================================================
 
     global.ExamFilterService = Object.assign({}, global.ExamFilterService || {}, {
-        filterExams: filterExamsWithLegacyFallback
+        filterExams: filterExamsWithLegacyFallback,
+        getExamSummary
     });
     global.ExamListView = Object.assign({}, global.ExamListView || {}, {
         render: renderExamListView,
@@ -5027,7 +5106,9 @@
         applyExamSort,
         applyBrowsePostFilters,
         applyBrowseFrequencyFilter,
+        applyBrowseQuestionKindFilter,
         normalizeBrowseFrequencyFilter,
+        getExamSummary,
         launchReadingMemorizeExam,
         isReadingMemorizeBrowseMode,
         isReadingMemorizeExam
@@ -11166,6 +11247,197 @@
             || String(global.__browseMemorizeFilterMode || '') === 'reading-memorize';
     }
 
+    // ============================================================================
+    // 阅读题库全文检索
+    // ============================================================================
+
+    /**
+     * 全文索引由 assets/scripts/build_reading_exam_search_index.py 生成，
+     * 通过 AppLazyLoader 的 reading-search-index 组按需加载。
+     * 分词规则必须与生成脚本的 tokenize 保持一致。
+     */
+    const READING_SEARCH_INDEX_GROUP = 'reading-search-index';
+    const READING_SEARCH_INDEX_VERSION = 1;
+    const READING_SEARCH_PREFIX_LIMIT = 64;
+    const READING_SEARCH_PREFIX_WEIGHT = 0.5;
+    const READING_SEARCH_TOKEN_RE = /[a-z0-9]+|[一-鿿]/g;
+    const READING_SEARCH_STOP_WORDS = new Set((
+        'a an and are as at be been but by can could did do does for from had has have he her his how i if in into is it '
+        + 'its may might more most must no not of on or our she should so than that the their them then there these they '
+        + 'this those to was we were what when where which who whom why will with would you your'
+    ).split(' '));
+
+    let readingSearchCache = null;
+    let readingSearchIndexLoad = null;
+
+    function foldReadingSearchPlural(token) {
+        if (token.length > 4 && token.endsWith('ies')) {
+            return token.slice(0, -3) + 'y';
+        }
+        if (token.length > 3 && token.endsWith('s') && !/(?:ss|us|sis)$/.test(token)) {
+            return token.slice(0, -1);
+        }
+        return token;
+    }
+
+    function tokenizeReadingSearchText(text) {
+        const raw = String(text || '').normalize('NFKC').toLowerCase().match(READING_SEARCH_TOKEN_RE) || [];
+        const tokens = [];
+        raw.forEach((token) => {
+            const latin = /^[a-z0-9]+$/.test(token);
+            if (latin && (token.length < 2 || READING_SEARCH_STOP_WORDS.has(token))) {
+                return;
+            }
+            tokens.push(latin && !/^\d+$/.test(token) ? foldReadingSearchPlural(token) : token);
+        });
+        return tokens;
+    }
+
+    function getReadingSearchIndex() {
+        const source = global.__READING_EXAM_SEARCH_INDEX__;
+        if (!source || source.version !== READING_SEARCH_INDEX_VERSION
+            || !Array.isArray(source.ids) || !Array.isArray(source.terms)) {
+            return null;
+        }
+        if (!readingSearchCache || readingSearchCache.source !== source) {
+            readingSearchCache = {
+                source,
+                terms: source.terms.map((row) => String(row[0])),
+                postings: new Map()
+            };
+        }
+        return readingSearchCache;
+    }
+
+    function lowerBoundTerm(terms, value) {
+        let low = 0;
+        let high = terms.length;
+        while (low < high) {
+            const mid = (low + high) >>> 1;
+            if (terms[mid] < value) {
+                low = mid + 1;
+            } else {
+                high = mid;
+            }
+        }
+        return low;
+    }
+
+    function findReadingSearchRows(index, token, prefix) {
+        const start = lowerBoundTerm(index.terms, token);
+        if (!prefix) {
+            return index.terms[start] === token ? [start] : [];
+        }
+        const rows = [];
+        for (let row = start; row < index.terms.length && rows.length < READING_SEARCH_PREFIX_LIMIT; row += 1) {
+            if (!index.terms[row].startsWith(token)) {
+                break;
+            }
+            rows.push(row);
+        }
+        return rows;
+    }
+
+    function decodeReadingSearchPostings(index, rowIndex) {
+        if (!index.postings.has(rowIndex)) {
+            const row = index.source.terms[rowIndex];
+            const docs = [];
+            const freqs = [];
+            let doc = 0;
+            for (let i = 1; i + 1 < row.length; i += 2) {
+                doc += row[i];
+                docs.push(doc);
+                freqs.push(row[i + 1]);
+            }
+            index.postings.set(rowIndex, { docs, freqs });
+        }
+        return index.postings.get(rowIndex);
+    }
+
+    function scoreReadingSearchToken(index, token, rows) {
+        const source = index.source;
+        const total = source.ids.length;
+        const k1 = Number(source.k1) || 1.2;
+        const b = Number.isFinite(Number(source.b)) ? Number(source.b) : 0.75;
+        const avgLength = Number(source.avgLength) || 1;
+        const scores = new Map();
+        rows.forEach((rowIndex) => {
+            const { docs, freqs } = decodeReadingSearchPostings(index, rowIndex);
+            // 前缀展开出的其他词降权，完整词命中优先
+            const weight = index.terms[rowIndex] === token ? 1 : READING_SEARCH_PREFIX_WEIGHT;
+            const idf = weight * Math.log(1 + (total - docs.length + 0.5) / (docs.length + 0.5));
+            docs.forEach((doc, i) => {
+                const norm = 1 - b + b * (Number(source.lengths[doc]) || avgLength) / avgLength;
+                const score = idf * freqs[i] * (k1 + 1) / (freqs[i] + k1 * norm);
+                // 前缀展开的多个词只取最高分，避免短前缀压过完整词
+                if (score > (scores.get(doc) || 0)) {
+                    scores.set(doc, score);
+                }
+            });
+        });
+        return scores;
+    }
+
+    /**
+     * 在已加载的全文索引中检索，所有查询词都要命中（最后一个词按前缀匹配）。
+     * @returns {Array<{id: string, score: number}>|null} 索引未加载或查询无有效词时返回 null
+     */
+    function searchReadingLibrary(query, options = {}) {
+        const index = getReadingSearchIndex();
+        const tokens = tokenizeReadingSearchText(query);
+        if (!index || !tokens.length) {
+            return null;
+        }
+        const prefixLast = options.prefix !== false && !/\s$/.test(String(query));
+        let combined = null;
+        tokens.forEach((token, position) => {
+            if (combined && combined.size === 0) {
+                return;
+            }
+            const rows = findReadingSearchRows(index, token, prefixLast && position === tokens.length - 1);
+            const scores = scoreReadingSearchToken(index, token, rows);
+            if (!combined) {
+                combined = scores;
+                return;
+            }
+            const next = new Map();
+            combined.forEach((score, doc) => {
+                if (scores.has(doc)) {
+                    next.set(doc, score + scores.get(doc));
+                }
+            });
+            combined = next;
+        });
+        const limit = Number(options.limit) > 0 ? Number(options.limit) : Infinity;
+        return Array.from(combined, ([doc, score]) => ({ id: index.source.ids[doc], score }))
+            .sort((a, b) => b.score - a.score || (a.id < b.id ? -1 : 1))
+            .slice(0, limit);
+    }
+
+    function ensureReadingSearchIndex() {
+        if (getReadingSearchIndex()) {
+            return Promise.resolve(true);
+        }
+        if (!readingSearchIndexLoad) {
+            const loader = global.AppLazyLoader;
+            if (!loader || typeof loader.ensureGroup !== 'function') {
+                return Promise.resolve(false);
+            }
+            readingSearchIndexLoad = Promise.resolve()
+                .then(() => loader.ensureGroup(READING_SEARCH_INDEX_GROUP))
+                .then(() => !!getReadingSearchIndex())
+                .catch((error) => {
+                    console.warn('[BrowseController] 全文索引加载失败:', error && error.message ? error.message : error);
+                    return false;
+                })
+                .then((ready) => {
+                    readingSearchIndexLoad = null;
+                    return ready;
+                });
+        }
+        return readingSearchIndexLoad;
+    }
+
     // ============================================================================
     // BrowseController 类
     // ============================================================================
@@ -11631,6 +11903,14 @@
 
     global.BrowseController = BrowseController;
     global.BROWSE_MODES = BROWSE_MODES;
+    global.ReadingExamSearch = {
+        tokenize: tokenizeReadingSearchText,
+        search: searchReadingLibrary,
+        ensureIndex: ensureReadingSearchIndex,
+        isReady() {
+            return !!getReadingSearchIndex();
+        }
+    };
     global.refreshListeningAvailabilityUI = function refreshListeningAvailabilityUI(index) {
         const listeningAvailable = Array.isArray(index)
             ? hasListeningEntries(index)
@@ -16938,7 +17218,7 @@ function setupBrowseSortControl() {
     }
     const normalizeSortMode = (value) => {
         const mode = String(value || 'default').trim().toLowerCase();
-        return mode === 'frequency-desc' || mode === 'difficulty-desc' ? mode : 'default';
+        return ['frequency-desc', 'difficulty-desc', 'length-desc', 'length-asc'].includes(mode) ? mode : 'default';
     };
     let savedMode = String(window.__browseSortMode || '').trim().toLowerCase();
     if (!savedMode) {
@@ -17794,7 +18074,11 @@ function performSearch(query) {
     console.log('[Search] 执行搜索，查询词:', normalizedQuery);
     const searchBase = getBrowseFilteredExamBase();
     console.log('[Search] 当前筛选后索引数量:', searchBase.length);
+    const fullTextScores = getReadingFullTextScores(query);
     const searchResults = searchBase.filter(exam => {
+        if (fullTextScores && fullTextScores.has(exam.id)) {
+            return true;
+        }
         if (exam.searchText) {
             return exam.searchText.includes(normalizedQuery);
         }
@@ -17802,11 +18086,38 @@ function performSearch(query) {
         return (exam.title && exam.title.toLowerCase().includes(normalizedQuery)) ||
             (exam.category && exam.category.toLowerCase().includes(normalizedQuery));
     });
+    if (fullTextScores && fullTextScores.size) {
+        // 全文命中按 BM25 得分排前，其余保持原顺序（Array.prototype.sort 为稳定排序）
+        searchResults.sort((a, b) => (fullTextScores.get(b.id) || 0) - (fullTextScores.get(a.id) || 0));
+    }
 
     console.log('[Search] 搜索结果数量:', searchResults.length);
     displayExams(searchResults);
 }
 
+function getReadingFullTextScores(query) {
+    const search = window.ReadingExamSearch;
+    if (!search || typeof search.search !== 'function') {
+        return null;
+    }
+    const trimmedQuery = String(query || '').trim();
+    if (!search.isReady()) {
+        // 首次搜索时按需加载全文索引，加载完成后若查询未变则重新搜索（refreshBrowseResults 传入的是去空白后的查询）
+        search.ensureIndex().then((ready) => {
+            const currentQuery = getBrowseSearchQuery();
+            if (ready && currentQuery && currentQuery === trimmedQuery) {
+                performSearch(currentQuery);
+            }
+        });
+        return null;
+    }
+    // 末词是否按前缀匹配取决于输入框里是否以空格结尾，所以同一输入无论从哪条路径进来都按原始输入检索
+    const input = document.getElementById('exam-search-input') || document.querySelector('.search-input');
+    const rawInput = input && typeof input.value === 'string' ? input.value : '';
+    const hits = search.search(rawInput.trim() === trimmedQuery ? rawInput : query);
+    return hits ? new Map(hits.map((hit) => [hit.id, hit.score])) : null;
+}
+
 async function toggleBulkDelete() {
     const nextMode = !getBulkDeleteModeState();
     setBulkDeleteModeState(nextMode);
@@ -782,6 +782,8 @@
     const DEFAULT_LIST_ID = 'default';
     const DEFAULT_LEXICON_URL = 'assets/wordlists/ielts_core.json';
     const SPELLING_ERROR_LIST_IDS = new Set(['spelling-errors-p1', 'spelling-errors-p4', 'spelling-errors-master']);
+    const READING_COVERAGE_GROUP = 'reading-vocab-coverage';
+    const READING_COVERAGE_VERSION = 1;
 
     const state = {
         repositories: null,
@@ -801,6 +803,9 @@
         listCache: new Map()
     };
 
+    let readingCoverageCache = null;
+    let readingCoverageLoad = null;
+
     function emitReady(value) {
         if (state.ready) {
             return;
@@ -1731,6 +1736,137 @@
         return normalized;
     }
 
+    // 阅读词汇覆盖索引：assets/scripts/build_reading_vocab_coverage.py 预先把
+    // IELTS 核心词表与阅读文章做词形还原后的关联，运行时无需再扫描文章内容。
+    function getReadingCoverage() {
+        const source = window.__READING_VOCAB_COVERAGE__;
+        if (!source || source.version !== READING_COVERAGE_VERSION
+            || !Array.isArray(source.ids) || !Array.isArray(source.words)) {
+            return null;
+        }
+        if (!readingCoverageCache || readingCoverageCache.source !== source) {
+            const rows = new Map();
+            source.words.forEach((row, index) => rows.set(String(row[0]), index));
+            readingCoverageCache = { source, rows, postings: new Map() };
+        }
+        return readingCoverageCache;
+    }
+
+    function decodeCoveragePostings(coverage, rowIndex) {
+        if (!coverage.postings.has(rowIndex)) {
+            const row = coverage.source.words[rowIndex];
+            const exams = [];
+            let exam = 0;
+            for (let i = 1; i + 1 < row.length; i += 2) {
+                exam += row[i];
+                exams.push({ exam, count: row[i + 1] });
+            }
+            coverage.postings.set(rowIndex, exams);
+        }
+        return coverage.postings.get(rowIndex);
+    }
+
+    function readCoverageColumn(coverage, name, exam) {
+        const column = coverage.source.coverage && coverage.source.coverage[name];
+        const value = Array.isArray(column) ? Number(column[exam]) : NaN;
+        return Number.isFinite(value) ? value : 0;
+    }
+
+    function getReadingExamTitle(examId) {
+        const manifest = window.__READING_EXAM_MANIFEST__;
+        const entry = manifest && manifest[examId];
+        return entry && entry.title ? String(entry.title) : examId;
+    }
+
+    function ensureReadingCoverage() {
+        if (getReadingCoverage()) {
+            return Promise.resolve(true);
+        }
+        if (!readingCoverageLoad) {
+            const loader = window.AppLazyLoader;
+            if (!loader || typeof loader.ensureGroup !== 'function') {
+                return Promise.resolve(false);
+            }
+            readingCoverageLoad = Promise.resolve()
+                .then(() => loader.ensureGroup(READING_COVERAGE_GROUP))
+                .then(() => !!getReadingCoverage())
+                .catch((error) => {
+                    console.warn('[VocabStore] 阅读词汇覆盖索引加载失败:', error && error.message ? error.message : error);
+                    return false;
+                })
+                .then((ready) => {
+                    readingCoverageLoad = null;
+                    return ready;
+                });
+        }
+        return readingCoverageLoad;
+    }
+
+    /**
+     * 收录某个单词的阅读文章，按出现次数降序。
+     * @returns {Array<{examId: string, title: string, count: number}>|null} 索引未加载时返回 null
+     */
+    function getReadingExamsForWord(word) {
+        const coverage = getReadingCoverage();
+        if (!coverage) {
+            return null;
+        }
+        const rowIndex = coverage.rows.get(normalizeLexiconLookupKey(word && typeof word === 'object' ? word.word : word));
+        if (rowIndex === undefined) {
+            return [];
+        }
+        return decodeCoveragePostings(coverage, rowIndex)
+            .map(({ exam, count }) => {
+                const examId = coverage.source.ids[exam];
+                return { examId, title: getReadingExamTitle(examId), count };
+            })
+            .sort((a, b) => b.count - a.count);
+    }
+
+    /**
+     * 为一组单词（通常是到期复习词）挑选练习文章：覆盖的不同单词越多越靠前，
+     * 其次按文章核心词密度排序。
+     * @returns {Array<{examId, title, words, hits, coreRatio}>|null} 索引未加载时返回 null
+     */
+    function pickReadingPassages(words, options = {}) {
+        const coverage = getReadingCoverage();
+        if (!coverage) {
+            return null;
+        }
+        const matches = new Map();
+        const seen = new Set();
+        (Array.isArray(words) ? words : []).forEach((word) => {
+            const key = normalizeLexiconLookupKey(word && typeof word === 'object' ? word.word : word);
+            const rowIndex = coverage.rows.get(key);
+            if (!key || seen.has(key) || rowIndex === undefined) {
+                return;
+            }
+            seen.add(key);
+            decodeCoveragePostings(coverage, rowIndex).forEach(({ exam, count }) => {
+                if (!matches.has(exam)) {
+                    matches.set(exam, { words: [], hits: 0 });
+                }
+                const match = matches.get(exam);
+                match.words.push(key);
+                match.hits += count;
+            });
+        });
+        const limit = Number(options.limit) > 0 ? Number(options.limit) : 5;
+        return Array.from(matches, ([exam, match]) => {
+            const tokens = readCoverageColumn(coverage, 'tokenCount', exam);
+            const examId = coverage.source.ids[exam];
+            return {
+                examId,
+                title: getReadingExamTitle(examId),
+                words: match.words,
+                hits: match.hits,
+                coreRatio: tokens ? readCoverageColumn(coverage, 'coreTokenCount', exam) / tokens : 0
+            };
+        })
+            .sort((a, b) => b.words.length - a.words.length || b.coreRatio - a.coreRatio || b.hits - a.hits)
+            .slice(0, limit);
+    }
+
     async function init() {
         ensureReadyPromise();
         connectToProviders();
@@ -1757,6 +1893,9 @@
         getAvailableLists,
         getActiveListId,
         upsertReadingHighlightWord,
+        ensureReadingCoverage,
+        getReadingExamsForWord,
+        pickReadingPassages,
         get VOCAB_LISTS() {
             return VOCAB_LISTS;
         },
@@ -2609,6 +2748,10 @@
                                     <h3>例句</h3>
                                     <p data-field="example" class="vocab-side-panel__example">暂无例句</p>
                                 </section>
+                                <section class="vocab-side-panel__section">
+                                    <h3>阅读出处</h3>
+                                    <p data-field="passages" class="vocab-side-panel__passages">—</p>
+                                </section>
                                 <section class="vocab-side-panel__section vocab-side-panel__meta">
                                     <h3>来源与标签</h3>
                                     <p data-field="meta">内置 IELTS 核心词表</p>
@@ -3295,10 +3438,52 @@
             hideDueBanner();
             return;
         }
-        state.elements.dueText.textContent = `你有 ${count} 个待复习，建议先复习。`;
+        const passage = pickDuePassage();
+        state.elements.dueText.textContent = passage
+            ? `你有 ${count} 个待复习，建议先复习。推荐阅读《${passage.title}》，覆盖其中 ${passage.words.length} 个词。`
+            : `你有 ${count} 个待复习，建议先复习。`;
         state.elements.dueBanner.removeAttribute('hidden');
     }
 
+    function pickDuePassage() {
+        const store = state.store;
+        if (!store || typeof store.pickReadingPassages !== 'function') {
+            return null;
+        }
+        const picks = store.pickReadingPassages(store.getDueWords(new Date()), { limit: 1 });
+        return picks && picks.length ? picks[0] : null;
+    }
+
+    function describeWordPassages(word) {
+        const store = state.store;
+        if (!store || typeof store.getReadingExamsForWord !== 'function') {
+            return '—';
+        }
+        const exams = store.getReadingExamsForWord(word);
+        if (!exams) {
+            return '阅读索引加载中…';
+        }
+        if (!exams.length) {
+            return '题库阅读文章中未出现';
+        }
+        const titles = exams.slice(0, 3).map((exam) => `《${exam.title}》`).join('、');
+        return exams.length > 3 ? `${titles} 等 ${exams.length} 篇` : titles;
+    }
+
+    function loadReadingCoverage() {
+        const store = state.store;
+        if (!store || typeof store.ensureReadingCoverage !== 'function') {
+            return;
+        }
+        store.ensureReadingCoverage().then((ready) => {
+            if (!ready) {
+                return;
+            }
+            showDueBanner(state.session.duePending);
+            updateSidePanelContent(state.session.currentWord);
+        });
+    }
+
     function setSidePanelExpanded(expanded) {
         if (!state.elements.sidePanel) {
             return;
@@ -3476,12 +3661,16 @@
         const meaning = state.elements.sideBody.querySelector('[data-field="meaning"]');
         const example = state.elements.sideBody.querySelector('[data-field="example"]');
         const meta = state.elements.sideBody.querySelector('[data-field="meta"]');
+        const passages = state.elements.sideBody.querySelector('[data-field="passages"]');
         const noteInput = state.elements.sideBody.querySelector('[data-field="note"]');
         const noteStatus = state.elements.sideBody.querySelector('[data-field="note-status"]');
         if (!word) {
             meaning.textContent = '—';
             example.textContent = '暂无词条';
             meta.textContent = '无可用信息';
+            if (passages) {
+                passages.textContent = '—';
+            }
             if (noteInput) {
                 noteInput.value = '';
             }
@@ -3493,6 +3682,9 @@
         meaning.textContent = word.meaning || '—';
         example.textContent = word.example || '暂无例句';
         meta.textContent = word.source || '内置 IELTS 核心词表';
+        if (passages) {
+            passages.textContent = describeWordPassages(word);
+        }
         if (noteInput) {
             noteInput.value = word.note || '';
         }
@@ -4379,6 +4571,7 @@
         ensureListSwitcher();
         prepareSessionQueue();
         showDueBanner(state.session.duePending);
+        loadReadingCoverage();
         if (state.session.stage === 'empty') {
             render();
             return;
@@ -720,12 +720,22 @@
     var READING_EXAM_MANIFEST_SCRIPT = 'assets/generated/reading-exams/manifest.js';
     var LISTENING_EXAM_MANIFEST_SCRIPT = 'assets/generated/listening-exams/manifest.js';
     var LISTENING_EXAM_INDEX_SCRIPT = 'assets/generated/listening-exams/listening-index.compat.js';
+    var READING_SEARCH_INDEX_SCRIPT = 'assets/generated/reading-exams/search/index.js';
+    var READING_VOCAB_COVERAGE_SCRIPT = 'assets/generated/reading-exams/vocab/ielts_core.coverage.js';
 
     function registerDefaultManifest() {
         manifest['exam-data'] = [
             READING_EXAM_MANIFEST_SCRIPT
         ];
 
+        manifest['reading-search-index'] = [
+            READING_SEARCH_INDEX_SCRIPT
+        ];
+
+        manifest['reading-vocab-coverage'] = [
+            READING_VOCAB_COVERAGE_SCRIPT
+        ];
+
         manifest['state-core'] = [
             // Provided by js/bundles/core-foundation.bundle.js.
         ];
@@ -763,6 +773,8 @@
 
         dependencies['state-core'] = [];
         dependencies['exam-data'] = [];
+        dependencies['reading-search-index'] = [];
+        dependencies['reading-vocab-coverage'] = [];
         dependencies['practice-suite'] = ['state-core'];
         dependencies['browse-runtime'] = ['state-core'];
         dependencies['browse-view'] = ['state-core'];
@@ -237,6 +237,10 @@
                                     <h3>例句</h3>
                                     <p data-field="example" class="vocab-side-panel__example">暂无例句</p>
                                 </section>
+                                <section class="vocab-side-panel__section">
+                                    <h3>阅读出处</h3>
+                                    <p data-field="passages" class="vocab-side-panel__passages">—</p>
+                                </section>
                                 <section class="vocab-side-panel__section vocab-side-panel__meta">
                                     <h3>来源与标签</h3>
                                     <p data-field="meta">内置 IELTS 核心词表</p>
@@ -923,10 +927,52 @@
             hideDueBanner();
             return;
         }
-        state.elements.dueText.textContent = `你有 ${count} 个待复习，建议先复习。`;
+        const passage = pickDuePassage();
+        state.elements.dueText.textContent = passage
+            ? `你有 ${count} 个待复习，建议先复习。推荐阅读《${passage.title}》，覆盖其中 ${passage.words.length} 个词。`
+            : `你有 ${count} 个待复习，建议先复习。`;
         state.elements.dueBanner.removeAttribute('hidden');
     }
 
+    function pickDuePassage() {
+        const store = state.store;
+        if (!store || typeof store.pickReadingPassages !== 'function') {
+            return null;
+        }
+        const picks = store.pickReadingPassages(store.getDueWords(new Date()), { limit: 1 });
+        return picks && picks.length ? picks[0] : null;
+    }
+
+    function describeWordPassages(word) {
+        const store = state.store;
+        if (!store || typeof store.getReadingExamsForWord !== 'function') {
+            return '—';
+        }
+        const exams = store.getReadingExamsForWord(word);
+        if (!exams) {
+            return '阅读索引加载中…';
+        }
+        if (!exams.length) {
+            return '题库阅读文章中未出现';
+        }
+        const titles = exams.slice(0, 3).map((exam) => `《${exam.title}》`).join('、');
+        return exams.length > 3 ? `${titles} 等 ${exams.length} 篇` : titles;
+    }
+
+    function loadReadingCoverage() {
+        const store = state.store;
+        if (!store || typeof store.ensureReadingCoverage !== 'function') {
+            return;
+        }
+        store.ensureReadingCoverage().then((ready) => {
+            if (!ready) {
+                return;
+            }
+            showDueBanner(state.session.duePending);
+            updateSidePanelContent(state.session.currentWord);
+        });
+    }
+
     function setSidePanelExpanded(expanded) {
         if (!state.elements.sidePanel) {
             return;
@@ -1104,12 +1150,16 @@
         const meaning = state.elements.sideBody.querySelector('[data-field="meaning"]');
         const example = state.elements.sideBody.querySelector('[data-field="example"]');
         const meta = state.elements.sideBody.querySelector('[data-field="meta"]');
+        const passages = state.elements.sideBody.querySelector('[data-field="passages"]');
         const noteInput = state.elements.sideBody.querySelector('[data-field="note"]');
         const noteStatus = state.elements.sideBody.querySelector('[data-field="note-status"]');
         if (!word) {
             meaning.textContent = '—';
             example.textContent = '暂无词条';
             meta.textContent = '无可用信息';
+            if (passages) {
+                passages.textContent = '—';
+            }
             if (noteInput) {
                 noteInput.value = '';
             }
@@ -1121,6 +1171,9 @@
         meaning.textContent = word.meaning || '—';
         example.textContent = word.example || '暂无例句';
         meta.textContent = word.source || '内置 IELTS 核心词表';
+        if (passages) {
+            passages.textContent = describeWordPassages(word);
+        }
         if (noteInput) {
             noteInput.value = word.note || '';
         }
@@ -2007,6 +2060,7 @@
         ensureListSwitcher();
         prepareSessionQueue();
         showDueBanner(state.session.duePending);
+        loadReadingCoverage();
         if (state.session.stage === 'empty') {
             render();
             return;
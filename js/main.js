@@ -2276,7 +2276,7 @@ function setupBrowseSortControl() {
     }
     const normalizeSortMode = (value) => {
         const mode = String(value || 'default').trim().toLowerCase();
-        return mode === 'frequency-desc' || mode === 'difficulty-desc' ? mode : 'default';
+        return ['frequency-desc', 'difficulty-desc', 'length-desc', 'length-asc'].includes(mode) ? mode : 'default';
     };
     let savedMode = String(window.__browseSortMode || '').trim().toLowerCase();
     if (!savedMode) {
@@ -3132,7 +3132,11 @@ function performSearch(query) {
     console.log('[Search] 执行搜索，查询词:', normalizedQuery);
     const searchBase = getBrowseFilteredExamBase();
     console.log('[Search] 当前筛选后索引数量:', searchBase.length);
+    const fullTextScores = getReadingFullTextScores(query);
     const searchResults = searchBase.filter(exam => {
+        if (fullTextScores && fullTextScores.has(exam.id)) {
+            return true;
+        }
         if (exam.searchText) {
             return exam.searchText.includes(normalizedQuery);
         }
@@ -3140,11 +3144,38 @@ function performSearch(query) {
         return (exam.title && exam.title.toLowerCase().includes(normalizedQuery)) ||
             (exam.category && exam.category.toLowerCase().includes(normalizedQuery));
     });
+    if (fullTextScores && fullTextScores.size) {
+        // 全文命中按 BM25 得分排前，其余保持原顺序（Array.prototype.sort 为稳定排序）
+        searchResults.sort((a, b) => (fullTextScores.get(b.id) || 0) - (fullTextScores.get(a.id) || 0));
+    }
 
     console.log('[Search] 搜索结果数量:', searchResults.length);
     displayExams(searchResults);
 }
 
+function getReadingFullTextScores(query) {
+    const search = window.ReadingExamSearch;
+    if (!search || typeof search.search !== 'function') {
+        return null;
+    }
+    const trimmedQuery = String(query || '').trim();
+    if (!search.isReady()) {
+        // 首次搜索时按需加载全文索引，加载完成后若查询未变则重新搜索（refreshBrowseResults 传入的是去空白后的查询）
+        search.ensureIndex().then((ready) => {
+            const currentQuery = getBrowseSearchQuery();
+            if (ready && currentQuery && currentQuery === trimmedQuery) {
+                performSearch(currentQuery);
+            }
+        });
+        return null;
+    }
+    // 末词是否按前缀匹配取决于输入框里是否以空格结尾，所以同一输入无论从哪条路径进来都按原始输入检索
+    const input = document.getElementById('exam-search-input') || document.querySelector('.search-input');
+    const rawInput = input && typeof input.value === 'string' ? input.value : '';
+    const hits = search.search(rawInput.trim() === trimmedQuery ? rawInput : query);
+    return hits ? new Map(hits.map((hit) => [hit.id, hit.score])) : null;
+}
+
 async function toggleBulkDelete() {
     const nextMode = !getBulkDeleteModeState();
     setBulkDeleteModeState(nextMode);
@@ -2,6 +2,12 @@
     'use strict';
 
     const store = new Map();
+    const partStore = new Map();
+    const partLoads = new Map();
+    const CHUNK_INDEX_SCRIPT = 'chunks/index.js';
+    let indexLoad = null;
+    let scriptLoader = null;
+    let baseUrl = '';
 
     function deepClone(value) {
         if (value == null) {
@@ -10,6 +16,81 @@
         return JSON.parse(JSON.stringify(value));
     }
 
+    function getChunkIndex() {
+        const index = global.__READING_EXAM_CHUNKS__;
+        return index && typeof index === 'object' && index.parts ? index : null;
+    }
+
+    function ensureChunkIndex() {
+        const index = getChunkIndex();
+        if (index) {
+            return Promise.resolve(index);
+        }
+        if (!indexLoad) {
+            const url = `${baseUrl}${CHUNK_INDEX_SCRIPT}`;
+            indexLoad = Promise.resolve()
+                .then(() => (scriptLoader || defaultScriptLoader)(url))
+                .then(() => {
+                    const loaded = getChunkIndex();
+                    if (!loaded) {
+                        throw new Error('reading_exam_chunk_index_missing');
+                    }
+                    return loaded;
+                })
+                .catch((error) => {
+                    indexLoad = null;
+                    throw error;
+                });
+        }
+        return indexLoad;
+    }
+
+    function listParts() {
+        const index = getChunkIndex();
+        return index ? Object.keys(index.parts) : [];
+    }
+
+    function pickFields(payload, part) {
+        const index = getChunkIndex();
+        const fields = index && Array.isArray(index.parts[part]) ? index.parts[part] : null;
+        if (!fields) {
+            return null;
+        }
+        const picked = {};
+        fields.forEach((field) => {
+            if (Object.prototype.hasOwnProperty.call(payload, field)) {
+                picked[field] = payload[field];
+            }
+        });
+        return picked;
+    }
+
+    function hasAllParts(key) {
+        const parts = partStore.get(key);
+        const names = listParts();
+        return !!parts && names.length > 0 && names.every((name) => parts.has(name));
+    }
+
+    function assemble(key) {
+        const parts = partStore.get(key);
+        return listParts().reduce((payload, name) => Object.assign(payload, parts.get(name)), {});
+    }
+
+    function defaultScriptLoader(url) {
+        const doc = global.document;
+        if (!doc || typeof doc.createElement !== 'function') {
+            return Promise.reject(new Error('reading_exam_script_loader_missing'));
+        }
+        return new Promise((resolve, reject) => {
+            const script = doc.createElement('script');
+            script.src = url;
+            script.async = true;
+            script.onload = () => resolve(true);
+            script.onerror = () => reject(new Error(`reading_exam_script_failed:${url}`));
+            (doc.head || doc.documentElement).appendChild(script);
+        });
+    }
+
     const api = {
         register(id, payload) {
             if (!id || !payload || typeof payload !== 'object') {
@@ -17,20 +98,122 @@
             }
             store.set(String(id), deepClone(payload));
         },
+        registerPart(id, part, payload) {
+            if (!id || !part || !payload || typeof payload !== 'object') {
+                throw new Error('reading_exam_part_invalid');
+            }
+            const key = String(id);
+            if (!partStore.has(key)) {
+                partStore.set(key, new Map());
+            }
+            partStore.get(key).set(String(part), deepClone(payload));
+        },
         get(id) {
             if (!id) {
                 return null;
             }
-            return store.has(String(id)) ? deepClone(store.get(String(id))) : null;
+            const key = String(id);
+            if (store.has(key)) {
+                return deepClone(store.get(key));
+            }
+            return hasAllParts(key) ? deepClone(assemble(key)) : null;
+        },
+        getPart(id, part) {
+            if (!id || !part) {
+                return null;
+            }
+            const key = String(id);
+            const parts = partStore.get(key);
+            if (parts && parts.has(String(part))) {
+                return deepClone(parts.get(String(part)));
+            }
+            return store.has(key) ? deepClone(pickFields(store.get(key), String(part))) : null;
         },
         has(id) {
-            return !!id && store.has(String(id));
+            return !!id && (store.has(String(id)) || hasAllParts(String(id)));
+        },
+        hasPart(id, part) {
+            if (!id || !part) {
+                return false;
+            }
+            const key = String(id);
+            const parts = partStore.get(key);
+            if (parts && parts.has(String(part))) {
+                return true;
+            }
+            return store.has(key) && listParts().includes(String(part));
+        },
+        getChunkUrl(id, part) {
+            const index = getChunkIndex();
+            if (!id || !index || !index.bytes || !index.bytes[String(id)] || !Array.isArray(index.parts[part])) {
+                return null;
+            }
+            return `${baseUrl}${index.base || ''}${String(id)}.${part}.js`;
+        },
+        loadPart(id, part) {
+            if (api.hasPart(id, part)) {
+                return Promise.resolve(api.getPart(id, part));
+            }
+            // 分块索引不随 manifest 进入启动包，第一次按分块取数时再加载
+            return ensureChunkIndex().then(() => {
+                if (api.hasPart(id, part)) {
+                    return api.getPart(id, part);
+                }
+                const url = api.getChunkUrl(id, part);
+                if (!url) {
+                    throw new Error(`reading_exam_chunk_missing:${id}:${part}`);
+                }
+                if (!partLoads.has(url)) {
+                    const load = Promise.resolve()
+                        .then(() => (scriptLoader || defaultScriptLoader)(url))
+                        .catch((error) => {
+                            partLoads.delete(url);
+                            throw error;
+                        });
+                    partLoads.set(url, load);
+                }
+                return partLoads.get(url).then(() => {
+                    const payload = api.getPart(id, part);
+                    if (!payload) {
+                        throw new Error(`reading_exam_part_missing:${id}:${part}`);
+                    }
+                    return payload;
+                });
+            });
+        },
+        loadParts(id, parts) {
+            return ensureChunkIndex().then(() => {
+                const names = Array.isArray(parts) && parts.length ? parts : listParts();
+                return Promise.all(names.map((name) => api.loadPart(id, name))).then((payloads) => {
+                    return names.reduce((result, name, index) => Object.assign(result, payloads[index]), {});
+                });
+            });
+        },
+        loadChunkIndex() {
+            return ensureChunkIndex();
+        },
+        configureChunks(options = {}) {
+            if (Object.prototype.hasOwnProperty.call(options, 'baseUrl')) {
+                baseUrl = options.baseUrl ? String(options.baseUrl) : '';
+            }
+            if (Object.prototype.hasOwnProperty.call(options, 'loadScript')) {
+                scriptLoader = typeof options.loadScript === 'function' ? options.loadScript : null;
+            }
         },
         keys() {
-            return Array.from(store.keys());
+            const keys = new Set(store.keys());
+            partStore.forEach((parts, key) => {
+                if (hasAllParts(key)) {
+                    keys.add(key);
+                }
+            });
+            return Array.from(keys);
         },
         clear() {
             store.clear();
+            partStore.clear();
+            partLoads.clear();
+            indexLoad = null;
         }
     };
 